@@ -2,6 +2,7 @@ from urllib.parse import quote
 
 import pulumi_kubernetes as k8s
 import pulumi_postgresql as pg
+from infra_helpers.helm import cached_chart
 from infra_helpers.postgres import PostgresStack
 
 import pulumi
@@ -76,7 +77,7 @@ coder_namespace = k8s.core.v1.Namespace(
 )
 
 postgres = PostgresStack(postgres_stack)
-pg_host = postgres.rw_service_fqdn
+pg_host = postgres.service_fqdn(config.get("postgres_pool_mode"))
 pg_port = postgres.port.apply(lambda p: int(p) if p else 5432)
 pg_username = postgres.username
 pg_password = postgres.password
@@ -219,12 +220,9 @@ if (
 
 coder_chart = k8s.helm.v4.Chart(
     "coder",
-    chart="coder",
+    chart=cached_chart("coder", coder_chart_version, "https://helm.coder.com/v2"),
     version=coder_chart_version,
     namespace=coder_namespace.metadata.name,
-    repository_opts=k8s.helm.v4.RepositoryOptsArgs(
-        repo="https://helm.coder.com/v2",
-    ),
     values=chart_values,
     opts=pulumi.ResourceOptions(depends_on=dependencies),
 )
@@ -1,7 +1,10 @@
 import pulumi_kubernetes as k8s
+from infra_helpers.helm import cached_chart
 
 import pulumi
 
+CHART_VERSION = "0.12.0"
+
 
 def ensure_namespace(name: str):
     return k8s.core.v1.Namespace(
@@ -125,12 +128,11 @@ db_secret = k8s.core.v1.Secret(
 
 immich = k8s.helm.v4.Chart(
     "immich",
-    chart="immich",
-    version="0.12.0",
-    namespace=immich_namespace.metadata.name,
-    repository_opts=k8s.helm.v4.RepositoryOptsArgs(
-        repo="https://immich-app.github.io/immich-charts",
+    chart=cached_chart(
+        "immich", CHART_VERSION, "https://immich-app.github.io/immich-charts"
     ),
+    version=CHART_VERSION,
+    namespace=immich_namespace.metadata.name,
     values={
         "controllers": {
             "main": {
@@ -2,7 +2,9 @@ import base64
 
 import pulumi_kubernetes as k8s
 import pulumi_random as random
+from infra_helpers.helm import cached_chart
 from infra_helpers.postgres import PostgresStack, create_database_owner
+from infra_helpers.stacks import ClickHouseStack, RustfsStack
 
 import pulumi
 
@@ -32,6 +34,7 @@ clickhouse_stack_ref = config.get("clickhouse_stack_ref") or "kzh/clickhouse/mx"
 clickhouse_namespace = config.get("clickhouse_namespace") or "clickhouse"
 clickhouse_service = config.get("clickhouse_service") or "clickhouse"
 clickhouse_database = config.get("clickhouse_database") or APP_NAME
+clickhouse_user = config.get("clickhouse_user") or APP_NAME
 clickhouse_http_port = config.get_int("clickhouse_http_port") or 8123
 clickhouse_native_port = config.get_int("clickhouse_native_port") or 9000
 clickhouse_client_image = (
@@ -78,16 +81,12 @@ def secret_data(value: pulumi.Input[object]) -> pulumi.Output[str]:
 
 
 postgres = PostgresStack(postgres_stack_ref)
-clickhouse_stack = pulumi.StackReference(clickhouse_stack_ref)
-rustfs_stack = pulumi.StackReference(rustfs_stack_ref)
+clickhouse_stack = ClickHouseStack(clickhouse_stack_ref)
+rustfs_stack = RustfsStack(rustfs_stack_ref)
 
-postgres_host = postgres.rw_service_fqdn
+postgres_host = postgres.service_fqdn(config.get("postgresPoolMode"))
 postgres_port = postgres.port.apply(lambda p: int(p) if p else 5432)
-rustfs_s3_endpoint_url = pulumi.Output.format(
-    "http://{0}.{1}.svc.cluster.local:9000",
-    rustfs_stack.require_output("s3_hostname"),
-    rustfs_stack.require_output("namespace"),
-)
+rustfs_s3_endpoint_url = rustfs_stack.s3_endpoint_url
 
 langfuse_salt = random.RandomBytes("langfuse-salt", length=32)
 encryption_key = random.RandomBytes("langfuse-encryption-key", length=32)
@@ -181,9 +180,7 @@ clickhouse_secret = k8s.core.v1.Secret(
     ),
     type="Opaque",
     data={
-        "password": secret_data(
-            clickhouse_stack.require_output("clickhouseAdminPassword")
-        ),
+        "password": secret_data(clickhouse_stack.password(clickhouse_user)),
     },
     opts=pulumi.ResourceOptions(depends_on=[namespace]),
 )
@@ -197,8 +194,8 @@ s3_secret = k8s.core.v1.Secret(
     ),
     type="Opaque",
     data={
-        "access-key-id": secret_data(rustfs_stack.require_output("access_key")),
-        "secret-access-key": secret_data(rustfs_stack.require_output("secret_key")),
+        "access-key-id": secret_data(rustfs_stack.access_key),
+        "secret-access-key": secret_data(rustfs_stack.secret_key),
     },
     opts=pulumi.ResourceOptions(depends_on=[namespace]),
 )
@@ -246,9 +243,7 @@ clickhouse-client \
                             ),
                             k8s.core.v1.EnvVarArgs(
                                 name="CLICKHOUSE_USER",
-                                value=clickhouse_stack.require_output(
-                                    "clickhouseAdminUsername"
-                                ),
+                                value=clickhouse_stack.username(clickhouse_user),
                             ),
                             k8s.core.v1.EnvVarArgs(
                                 name="CLICKHOUSE_DATABASE",
@@ -442,7 +437,7 @@ chart_values: dict[str, object] = {
         "nativePort": clickhouse_native_port,
         "database": clickhouse_database,
         "auth": {
-            "username": clickhouse_stack.require_output("clickhouseAdminUsername"),
+            "username": clickhouse_stack.username(clickhouse_user),
             "existingSecret": clickhouse_secret.metadata.name,
             "existingSecretKey": "password",
         },
@@ -471,13 +466,10 @@ chart_values: dict[str, object] = {
 
 release = k8s.helm.v3.Release(
     "langfuse",
-    chart=CHART,
+    chart=cached_chart(CHART, chart_version, CHART_REPOSITORY),
     name=APP_NAME,
     namespace=namespace.metadata.name,
     version=chart_version,
-    repository_opts=k8s.helm.v3.RepositoryOptsArgs(
-        repo=CHART_REPOSITORY,
-    ),
     values=chart_values,
     timeout=900,
     wait_for_jobs=True,
@@ -1,9 +1,12 @@
+import json
 from pathlib import Path
 
 import pulumi_kubernetes as k8s
 import pulumi_random as random
 from infra_helpers.grafana import dashboard_config_maps
 from infra_helpers.k8s import secret_env_var, stable_task_id
+from infra_helpers.stacks import RustfsStack
+from pulumi_monitoring_crds.monitoring.v1 import PodMonitor
 from pulumi_mysql_operator_crds.mysql.v2 import (
     InnoDBCluster,
     InnoDBClusterSpecArgs,
@@ -14,11 +17,141 @@ import pulumi
 
 config = pulumi.Config()
 
+CACHE_BACKENDS: dict[str, dict[str, object]] = {
+    "none": {},
+    "memcached": {
+        "image": "memcached:1.6.39-alpine",
+        "exporterImage": "quay.io/prometheus/memcached-exporter:v0.15.3",
+        "port": 11211,
+        "metricsPort": 9150,
+        "evictionPolicies": ("lru", "noeviction"),
+    },
+    "redis": {
+        "image": "redis:8.2.1-alpine",
+        "exporterImage": "oliver006/redis_exporter:v1.74.0",
+        "port": 6379,
+        "metricsPort": 9121,
+        "evictionPolicies": (
+            "allkeys-lru",
+            "allkeys-lfu",
+            "allkeys-random",
+            "volatile-lru",
+            "volatile-lfu",
+            "volatile-random",
+            "volatile-ttl",
+            "noeviction",
+        ),
+    },
+}
+
+WEB_AUTOSCALING_DEFAULTS = {
+    "enabled": False,
+    "minReplicas": 2,
+    "maxReplicas": 6,
+    "targetCpuUtilization": 70,
+    "targetRequestLatencyMs": 500,
+}
+
 
 def php_string(value: object) -> str:
     return str(value).replace("\\", "\\\\").replace("'", "\\'")
 
 
+def render_cache_settings(cache_backend: str, cache_server: str) -> str:
+    # APCu from the official image stays the local-server (L1) tier whatever the
+    # backend: MessageCache checks it before the shared cache.
+    if cache_backend == "memcached":
+        return f"""$wgMainCacheType = CACHE_MEMCACHED;
+$wgParserCacheType = CACHE_MEMCACHED;
+$wgMessageCacheType = CACHE_MEMCACHED;
+$wgSessionCacheType = CACHE_DB;
+$wgMemCachedServers = [ '{php_string(cache_server)}' ];
+$wgMemCachedPersistent = true;"""
+    if cache_backend == "redis":
+        return f"""$wgObjectCaches['redis'] = [
+    'class' => 'RedisBagOStuff',
+    'servers' => [ '{php_string(cache_server)}' ],
+    'persistent' => true,
+];
+$wgMainCacheType = 'redis';
+$wgParserCacheType = 'redis';
+$wgMessageCacheType = 'redis';
+$wgSessionCacheType = CACHE_DB;
+$wgMemCachedServers = [];"""
+    return """$wgMainCacheType = CACHE_NONE;
+$wgParserCacheType = CACHE_NONE;
+$wgSessionCacheType = CACHE_DB;
+$wgMemCachedServers = [];"""
+
+
+def render_job_queue_settings(excluded_types: list[str]) -> str:
+    # Jobs run only in the mediawiki-jobrunner Deployment, never at the end of
+    # a web request.
+    settings = "$wgJobRunRate = 0;"
+    if excluded_types:
+        types = ", ".join(f"'{php_string(job_type)}'" for job_type in excluded_types)
+        settings += f"""
+$wgJobTypesExcludedFromDefaultQueue = array_merge(
+    $wgJobTypesExcludedFromDefaultQueue,
+    [ {types} ]
+);"""
+    return settings
+
+
+def uploads_bucket_policy(bucket: str) -> str:
+    # Extension:AWS keeps every zone of the local repo in one bucket: public
+    # files under their hash directories, old versions under archive/, then
+    # thumb/, deleted/ and temp/. Browsers only need the public and thumb zones.
+    public_prefixes = [*"0123456789abcdef", "archive", "thumb"]
+    return json.dumps(
+        {
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Effect": "Allow",
+                    "Principal": {"AWS": ["*"]},
+                    "Action": ["s3:GetObject"],
+                    "Resource": [
+                        f"arn:aws:s3:::{bucket}/{prefix}/*"
+                        for prefix in public_prefixes
+                    ],
+                }
+            ],
+        },
+        indent=2,
+    )
+
+
+def render_upload_settings(values: list[object]) -> str:
+    (
+        uploads_backend,
+        s3_endpoint,
+        bucket,
+        bucket_domain,
+        access_key,
+        secret_key,
+    ) = values
+
+    settings = "$wgEnableUploads = true;"
+    if uploads_backend != "s3":
+        return settings
+    # Extension:AWS must be installed in the image; the official image lacks it.
+    return f"""{settings}
+wfLoadExtension( 'AWS' );
+$wgAWSCredentials = [
+    'key' => '{php_string(access_key)}',
+    'secret' => '{php_string(secret_key)}',
+    'token' => false,
+];
+$wgAWSRegion = 'us-east-1';
+$wgAWSBucketName = '{php_string(bucket)}';
+$wgAWSBucketDomain = '{php_string(bucket_domain)}';
+$wgAWSRepoHashLevels = '2';
+$wgAWSRepoDeletedHashLevels = '3';
+$wgFileBackends['s3']['endpoint'] = '{php_string(s3_endpoint)}';
+$wgFileBackends['s3']['use_path_style_endpoint'] = true;"""
+
+
 def render_local_settings(values: list[object]) -> str:
     (
         wiki_name,
@@ -32,6 +165,10 @@ def render_local_settings(values: list[object]) -> str:
         db_prefix,
         secret_key,
         upgrade_key,
+        cache_backend,
+        cache_server,
+        job_runner_excluded_types,
+        upload_settings,
     ) = values
 
     return f"""<?php
@@ -57,15 +194,14 @@ $wgDBpassword = '{php_string(db_password)}';
 $wgDBprefix = '{php_string(db_prefix)}';
 $wgDBTableOptions = 'ENGINE=InnoDB, DEFAULT CHARSET=binary';
 
-$wgEnableUploads = true;
+{upload_settings}
 $wgUseInstantCommons = false;
 $wgShellLocale = 'C.UTF-8';
 $wgLanguageCode = '{php_string(language)}';
 
-$wgMainCacheType = CACHE_NONE;
-$wgParserCacheType = CACHE_NONE;
-$wgSessionCacheType = CACHE_DB;
-$wgMemCachedServers = [];
+{render_cache_settings(str(cache_backend), str(cache_server))}
+
+{render_job_queue_settings(list(job_runner_excluded_types))}
 
 $wgSecretKey = '{php_string(secret_key)}';
 $wgAuthenticationTokenVersion = '1';
@@ -102,6 +238,60 @@ mysql_root_password_length = config.get_int("mysqlRootPasswordLength") or 32
 db_password_length = config.get_int("dbPasswordLength") or 32
 admin_password_length = config.get_int("adminPasswordLength") or 32
 secret_key_length = config.get_int("secretKeyLength") or 64
+cache_backend = config.get("cacheBackend") or "none"
+if cache_backend not in CACHE_BACKENDS:
+    raise ValueError(
+        f"cacheBackend must be one of {', '.join(CACHE_BACKENDS)}, got {cache_backend}"
+    )
+cache_memory_mb = config.get_int("cacheMemoryMb") or 256
+cache_eviction_policy = config.get("cacheEvictionPolicy") or (
+    "allkeys-lru" if cache_backend == "redis" else "lru"
+)
+cache_defaults = CACHE_BACKENDS[cache_backend]
+if cache_defaults and cache_eviction_policy not in cache_defaults["evictionPolicies"]:
+    raise ValueError(
+        f"cacheEvictionPolicy {cache_eviction_policy} is not supported by "
+        f"{cache_backend}"
+    )
+cache_image = config.get("cacheImage") or cache_defaults.get("image")
+cache_exporter_image = config.get("cacheExporterImage") or cache_defaults.get(
+    "exporterImage"
+)
+monitoring_release_label = config.get("monitoringReleaseLabel", "kube-prometheus-stack")
+job_runner_concurrency = config.get_int("jobRunnerConcurrency") or 2
+job_runner_types = config.get_object("jobRunnerTypes") or []
+job_runner_excluded_types = config.get_object("jobRunnerExcludedTypes") or []
+job_runner_max_jobs = config.get_int("jobRunnerMaxJobs") or 100
+job_runner_max_time_seconds = config.get_int("jobRunnerMaxTimeSeconds") or 60
+job_runner_php_memory_limit = config.get("jobRunnerPhpMemoryLimit") or "256M"
+job_runner_idle_seconds = config.get_int("jobRunnerIdleSeconds") or 5
+job_runner_resources = config.get_object("jobRunnerResources") or {
+    "requests": {"cpu": "100m", "memory": "256Mi"},
+    "limits": {"cpu": "1", "memory": "768Mi"},
+}
+job_queue_metrics_interval_seconds = (
+    config.get_int("jobQueueMetricsIntervalSeconds") or 30
+)
+job_queue_metrics_port = 9181
+uploads_backend = config.get("uploadsBackend") or "pvc"
+if uploads_backend not in ("pvc", "s3"):
+    raise ValueError(f"uploadsBackend must be pvc or s3, got {uploads_backend}")
+rustfs_stack_ref = config.get("rustfsStack") or "kzh/rustfs/mx"
+uploads_bucket = config.get("uploadsBucket") or "mediawiki"
+web_replicas = config.get_int("webReplicas") or 1
+web_autoscaling = {
+    **WEB_AUTOSCALING_DEFAULTS,
+    **(config.get_object("webAutoscaling") or {}),
+}
+if uploads_backend == "pvc" and (web_replicas > 1 or web_autoscaling["enabled"]):
+    raise ValueError(
+        "webReplicas above 1 and webAutoscaling need uploadsBackend s3: the "
+        "mediawiki-images volume is ReadWriteOnce"
+    )
+apache_exporter_image = (
+    config.get("apacheExporterImage") or "quay.io/prometheus/apache-exporter:v1.0.9"
+)
+apache_exporter_port = 9117
 local_settings_revision = "20260504-1"
 db_init_revision = "20260522-1"
 install_revision = "20260504-1"
@@ -419,6 +609,281 @@ SQL
     ),
 )
 
+cache_labels = {
+    "app": "mediawiki-cache",
+    "component": "cache",
+}
+cache_host = ""
+cache_server = ""
+cache_dependencies: list[pulumi.Resource] = []
+if cache_defaults:
+    cache_port = cache_defaults["port"]
+    cache_metrics_port = cache_defaults["metricsPort"]
+    cache_host = f"mediawiki-cache.{namespace_name}.svc.cluster.local"
+    cache_server = f"{cache_host}:{cache_port}"
+    if cache_backend == "memcached":
+        cache_args = ["-m", str(cache_memory_mb), "-I", "4m", "-c", "4096"]
+        if cache_eviction_policy == "noeviction":
+            cache_args.append("-M")
+        exporter_args = [f"--memcached.address=localhost:{cache_port}"]
+        exporter_env = []
+    else:
+        cache_args = [
+            "redis-server",
+            "--maxmemory",
+            f"{cache_memory_mb}mb",
+            "--maxmemory-policy",
+            cache_eviction_policy,
+            "--save",
+            "",
+            "--appendonly",
+            "no",
+        ]
+        exporter_args = []
+        exporter_env = [
+            k8s.core.v1.EnvVarArgs(
+                name="REDIS_ADDR", value=f"redis://localhost:{cache_port}"
+            ),
+        ]
+
+    # The cache process needs headroom over its item memory for connection
+    # buffers and allocator overhead before the kubelet OOM-kills it.
+    cache_memory_limit = f"{cache_memory_mb + cache_memory_mb // 4 + 64}Mi"
+
+    mediawiki_cache_deployment = k8s.apps.v1.Deployment(
+        "mediawiki-cache-deployment",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="mediawiki-cache",
+            namespace=namespace_name,
+            labels=cache_labels,
+        ),
+        spec=k8s.apps.v1.DeploymentSpecArgs(
+            replicas=1,
+            selector=k8s.meta.v1.LabelSelectorArgs(
+                match_labels=cache_labels,
+            ),
+            template=k8s.core.v1.PodTemplateSpecArgs(
+                metadata=k8s.meta.v1.ObjectMetaArgs(
+                    labels=cache_labels,
+                ),
+                spec=k8s.core.v1.PodSpecArgs(
+                    containers=[
+                        k8s.core.v1.ContainerArgs(
+                            name=cache_backend,
+                            image=cache_image,
+                            image_pull_policy="IfNotPresent",
+                            args=cache_args,
+                            ports=[
+                                k8s.core.v1.ContainerPortArgs(
+                                    name="cache",
+                                    container_port=cache_port,
+                                ),
+                            ],
+                            readiness_probe=k8s.core.v1.ProbeArgs(
+                                tcp_socket=k8s.core.v1.TCPSocketActionArgs(
+                                    port="cache",
+                                ),
+                                period_seconds=10,
+                            ),
+                            resources=k8s.core.v1.ResourceRequirementsArgs(
+                                requests={
+                                    "cpu": "50m",
+                                    "memory": f"{cache_memory_mb}Mi",
+                                },
+                                limits={
+                                    "cpu": "500m",
+                                    "memory": cache_memory_limit,
+                                },
+                            ),
+                        ),
+                        k8s.core.v1.ContainerArgs(
+                            name="exporter",
+                            image=cache_exporter_image,
+                            image_pull_policy="IfNotPresent",
+                            args=exporter_args or None,
+                            env=exporter_env or None,
+                            ports=[
+                                k8s.core.v1.ContainerPortArgs(
+                                    name="metrics",
+                                    container_port=cache_metrics_port,
+                                ),
+                            ],
+                            resources=k8s.core.v1.ResourceRequirementsArgs(
+                                requests={
+                                    "cpu": "10m",
+                                    "memory": "32Mi",
+                                },
+                                limits={
+                                    "cpu": "100m",
+                                    "memory": "64Mi",
+                                },
+                            ),
+                        ),
+                    ],
+                ),
+            ),
+        ),
+        opts=pulumi.ResourceOptions(depends_on=[mediawiki_namespace]),
+    )
+
+    mediawiki_cache_service = k8s.core.v1.Service(
+        "mediawiki-cache-service",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="mediawiki-cache",
+            namespace=namespace_name,
+            labels=cache_labels,
+        ),
+        spec=k8s.core.v1.ServiceSpecArgs(
+            type="ClusterIP",
+            selector=cache_labels,
+            ports=[
+                k8s.core.v1.ServicePortArgs(
+                    name="cache",
+                    port=cache_port,
+                    target_port="cache",
+                ),
+            ],
+        ),
+        opts=pulumi.ResourceOptions(depends_on=[mediawiki_cache_deployment]),
+    )
+    cache_dependencies.append(mediawiki_cache_service)
+
+    PodMonitor(
+        "mediawiki-cache-podmonitor",
+        metadata={
+            "name": "mediawiki-cache",
+            "namespace": namespace_name,
+            "labels": {
+                "release": monitoring_release_label,
+            },
+        },
+        spec={
+            "selector": {
+                "matchLabels": cache_labels,
+            },
+            "podMetricsEndpoints": [
+                {
+                    "port": "metrics",
+                    "path": "/metrics",
+                    "interval": "30s",
+                },
+            ],
+        },
+        opts=pulumi.ResourceOptions(depends_on=[mediawiki_cache_deployment]),
+    )
+
+uploads_s3_endpoint = ""
+uploads_bucket_domain = ""
+uploads_access_key = ""
+uploads_secret_key = ""
+uploads_dependencies: list[pulumi.Resource] = []
+if uploads_backend == "s3":
+    rustfs_stack = RustfsStack(rustfs_stack_ref)
+    uploads_s3_endpoint = rustfs_stack.s3_endpoint_url
+    uploads_bucket_domain = config.require("uploadsBucketDomain")
+    uploads_access_key = rustfs_stack.access_key
+    uploads_secret_key = rustfs_stack.secret_key
+
+    uploads_s3_credentials = k8s.core.v1.Secret(
+        "mediawiki-uploads-s3-credentials",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="mediawiki-uploads-s3",
+            namespace=namespace_name,
+            labels=labels,
+        ),
+        type="Opaque",
+        string_data={
+            "S3_ACCESS_KEY": uploads_access_key,
+            "S3_SECRET_KEY": uploads_secret_key,
+        },
+        opts=pulumi.ResourceOptions(depends_on=[mediawiki_namespace]),
+    )
+
+    uploads_bucket_job = k8s.batch.v1.Job(
+        "mediawiki-uploads-bucket",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="mediawiki-uploads-bucket",
+            namespace=namespace_name,
+            labels={
+                **labels,
+                "component": "uploads-bucket",
+            },
+            annotations={
+                "pulumi.com/waitFor": "jsonpath={.status.succeeded}=1",
+            },
+        ),
+        spec=k8s.batch.v1.JobSpecArgs(
+            backoff_limit=4,
+            ttl_seconds_after_finished=86400,
+            template=k8s.core.v1.PodTemplateSpecArgs(
+                metadata=k8s.meta.v1.ObjectMetaArgs(
+                    labels={
+                        **labels,
+                        "component": "uploads-bucket",
+                    },
+                ),
+                spec=k8s.core.v1.PodSpecArgs(
+                    restart_policy="OnFailure",
+                    containers=[
+                        k8s.core.v1.ContainerArgs(
+                            name="create-uploads-bucket",
+                            image="quay.io/minio/mc:latest",
+                            command=["sh", "-ceu"],
+                            # Browsers fetch files straight from the bucket, so
+                            # public files and thumbnails need anonymous read.
+                            args=[
+                                """
+mc alias set rustfs "$S3_ENDPOINT_URL" "$S3_ACCESS_KEY" "$S3_SECRET_KEY"
+mc mb --ignore-existing "rustfs/$S3_BUCKET"
+printf '%s' "$BUCKET_POLICY" > /tmp/bucket-policy.json
+mc anonymous set-json /tmp/bucket-policy.json "rustfs/$S3_BUCKET"
+""".strip(),
+                            ],
+                            env=[
+                                k8s.core.v1.EnvVarArgs(
+                                    name="S3_ENDPOINT_URL",
+                                    value=uploads_s3_endpoint,
+                                ),
+                                k8s.core.v1.EnvVarArgs(
+                                    name="S3_BUCKET",
+                                    value=uploads_bucket,
+                                ),
+                                k8s.core.v1.EnvVarArgs(
+                                    name="BUCKET_POLICY",
+                                    value=uploads_bucket_policy(uploads_bucket),
+                                ),
+                                secret_env_var(
+                                    name="S3_ACCESS_KEY",
+                                    secret_name=uploads_s3_credentials.metadata.name,
+                                    key="S3_ACCESS_KEY",
+                                ),
+                                secret_env_var(
+                                    name="S3_SECRET_KEY",
+                                    secret_name=uploads_s3_credentials.metadata.name,
+                                    key="S3_SECRET_KEY",
+                                ),
+                            ],
+                        ),
+                    ],
+                ),
+            ),
+        ),
+        opts=pulumi.ResourceOptions(
+            depends_on=[uploads_s3_credentials],
+            delete_before_replace=True,
+        ),
+    )
+    uploads_dependencies.append(uploads_bucket_job)
+
+upload_settings = pulumi.Output.all(
+    uploads_backend,
+    uploads_s3_endpoint,
+    uploads_bucket,
+    uploads_bucket_domain,
+    uploads_access_key,
+    uploads_secret_key,
+).apply(render_upload_settings)
+
 local_settings_php = pulumi.Output.all(
     wiki_name,
     mediawiki_url,
@@ -431,6 +896,10 @@ local_settings_php = pulumi.Output.all(
     db_prefix,
     mediawiki_secret_key.result,
     mediawiki_upgrade_key.result,
+    cache_backend,
+    cache_server,
+    job_runner_excluded_types,
+    upload_settings,
 ).apply(render_local_settings)
 
 local_settings_task_id = pulumi.Output.all(
@@ -901,6 +1370,26 @@ mediawiki_images_pvc = k8s.core.v1.PersistentVolumeClaim(
     opts=pulumi.ResourceOptions(depends_on=[mediawiki_namespace]),
 )
 
+# With S3 uploads the PVC stays (unmounted) so switching modes never deletes
+# files that have not been copied to the bucket yet.
+images_volume_mounts: list[k8s.core.v1.VolumeMountArgs] = []
+images_volumes: list[k8s.core.v1.VolumeArgs] = []
+if uploads_backend == "pvc":
+    images_volume_mounts.append(
+        k8s.core.v1.VolumeMountArgs(
+            name="images",
+            mount_path="/var/www/html/images",
+        )
+    )
+    images_volumes.append(
+        k8s.core.v1.VolumeArgs(
+            name="images",
+            persistent_volume_claim=k8s.core.v1.PersistentVolumeClaimVolumeSourceArgs(
+                claim_name=mediawiki_images_pvc.metadata.name,
+            ),
+        )
+    )
+
 mediawiki_deployment = k8s.apps.v1.Deployment(
     "mediawiki-deployment",
     metadata=k8s.meta.v1.ObjectMetaArgs(
@@ -909,7 +1398,8 @@ mediawiki_deployment = k8s.apps.v1.Deployment(
         labels=labels,
     ),
     spec=k8s.apps.v1.DeploymentSpecArgs(
-        replicas=1,
+        # The HorizontalPodAutoscaler owns the replica count when enabled.
+        replicas=None if web_autoscaling["enabled"] else web_replicas,
         selector=k8s.meta.v1.LabelSelectorArgs(
             match_labels=labels,
         ),
@@ -971,11 +1461,35 @@ mediawiki_deployment = k8s.apps.v1.Deployment(
                                 sub_path="LocalSettings.php",
                                 read_only=True,
                             ),
-                            k8s.core.v1.VolumeMountArgs(
-                                name="images",
-                                mount_path="/var/www/html/images",
+                            *images_volume_mounts,
+                        ],
+                    ),
+                    # mod_status is enabled in the image's Apache and only
+                    # answers local requests.
+                    k8s.core.v1.ContainerArgs(
+                        name="apache-exporter",
+                        image=apache_exporter_image,
+                        image_pull_policy="IfNotPresent",
+                        args=[
+                            "--scrape_uri=http://localhost/server-status?auto",
+                            f"--telemetry.address=:{apache_exporter_port}",
+                        ],
+                        ports=[
+                            k8s.core.v1.ContainerPortArgs(
+                                name="metrics",
+                                container_port=apache_exporter_port,
                             ),
                         ],
+                        resources=k8s.core.v1.ResourceRequirementsArgs(
+                            requests={
+                                "cpu": "10m",
+                                "memory": "16Mi",
+                            },
+                            limits={
+                                "cpu": "100m",
+                                "memory": "64Mi",
+                            },
+                        ),
                     ),
                 ],
                 volumes=[
@@ -985,18 +1499,18 @@ mediawiki_deployment = k8s.apps.v1.Deployment(
                             secret_name=mediawiki_local_settings.metadata.name,
                         ),
                     ),
-                    k8s.core.v1.VolumeArgs(
-                        name="images",
-                        persistent_volume_claim=k8s.core.v1.PersistentVolumeClaimVolumeSourceArgs(
-                            claim_name=mediawiki_images_pvc.metadata.name,
-                        ),
-                    ),
+                    *images_volumes,
                 ],
             ),
         ),
     ),
     opts=pulumi.ResourceOptions(
-        depends_on=[mediawiki_db_compat_job, mediawiki_images_pvc],
+        depends_on=[
+            mediawiki_db_compat_job,
+            mediawiki_images_pvc,
+            *cache_dependencies,
+            *uploads_dependencies,
+        ],
         delete_before_replace=True,
     ),
 )
@@ -1022,6 +1536,120 @@ mediawiki_service = k8s.core.v1.Service(
     opts=pulumi.ResourceOptions(depends_on=[mediawiki_deployment]),
 )
 
+mediawiki_web_podmonitor = PodMonitor(
+    "mediawiki-web-podmonitor",
+    metadata={
+        "name": "mediawiki-web",
+        "namespace": namespace_name,
+        "labels": {
+            "release": monitoring_release_label,
+        },
+    },
+    spec={
+        "selector": {
+            "matchLabels": web_labels,
+        },
+        "podMetricsEndpoints": [
+            {
+                "port": "metrics",
+                "path": "/metrics",
+                "interval": "30s",
+            },
+        ],
+    },
+    opts=pulumi.ResourceOptions(depends_on=[mediawiki_deployment]),
+)
+
+if web_autoscaling["enabled"]:
+    # The monitoring stack's Prometheus Adapter serves hpa_* series on the
+    # external metrics API.
+    request_latency_metric = "hpa_mediawiki_request_duration_seconds"
+    mediawiki_autoscaling_rules = k8s.apiextensions.CustomResource(
+        "mediawiki-autoscaling-rules",
+        api_version="monitoring.coreos.com/v1",
+        kind="PrometheusRule",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="mediawiki-autoscaling",
+            namespace=namespace_name,
+            labels={
+                **labels,
+                "release": monitoring_release_label,
+            },
+        ),
+        spec={
+            "groups": [
+                {
+                    "name": "mediawiki-autoscaling",
+                    "rules": [
+                        {
+                            "record": request_latency_metric,
+                            "expr": (
+                                "sum by (namespace) (rate(apache_duration_ms_total"
+                                f'{{namespace="{namespace_name}"}}[2m])) / sum by '
+                                "(namespace) (rate(apache_accesses_total"
+                                f'{{namespace="{namespace_name}"}}[2m])) / 1000'
+                            ),
+                        },
+                    ],
+                },
+            ],
+        },
+        opts=pulumi.ResourceOptions(depends_on=[mediawiki_web_podmonitor]),
+    )
+
+    k8s.autoscaling.v2.HorizontalPodAutoscaler(
+        "mediawiki-hpa",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="mediawiki",
+            namespace=namespace_name,
+            labels=labels,
+        ),
+        spec=k8s.autoscaling.v2.HorizontalPodAutoscalerSpecArgs(
+            scale_target_ref=k8s.autoscaling.v2.CrossVersionObjectReferenceArgs(
+                api_version="apps/v1",
+                kind="Deployment",
+                name=mediawiki_deployment.metadata.name,
+            ),
+            min_replicas=int(web_autoscaling["minReplicas"]),
+            max_replicas=int(web_autoscaling["maxReplicas"]),
+            metrics=[
+                k8s.autoscaling.v2.MetricSpecArgs(
+                    type="Resource",
+                    resource=k8s.autoscaling.v2.ResourceMetricSourceArgs(
+                        name="cpu",
+                        target=k8s.autoscaling.v2.MetricTargetArgs(
+                            type="Utilization",
+                            average_utilization=int(
+                                web_autoscaling["targetCpuUtilization"]
+                            ),
+                        ),
+                    ),
+                ),
+                k8s.autoscaling.v2.MetricSpecArgs(
+                    type="External",
+                    external=k8s.autoscaling.v2.ExternalMetricSourceArgs(
+                        metric=k8s.autoscaling.v2.MetricIdentifierArgs(
+                            name=request_latency_metric,
+                        ),
+                        target=k8s.autoscaling.v2.MetricTargetArgs(
+                            type="Value",
+                            # Milli-units of seconds, so 500m is 500 ms.
+                            value=f"{int(web_autoscaling['targetRequestLatencyMs'])}m",
+                        ),
+                    ),
+                ),
+            ],
+            behavior=k8s.autoscaling.v2.HorizontalPodAutoscalerBehaviorArgs(
+                scale_down=k8s.autoscaling.v2.HPAScalingRulesArgs(
+                    stabilization_window_seconds=300,
+                ),
+            ),
+        ),
+        opts=pulumi.ResourceOptions(
+            depends_on=[mediawiki_deployment, mediawiki_autoscaling_rules]
+        ),
+    )
+
 mediawiki_ingress = k8s.networking.v1.Ingress(
     "mediawiki-ingress",
     metadata=k8s.meta.v1.ObjectMetaArgs(
@@ -1061,6 +1689,290 @@ mediawiki_ingress = k8s.networking.v1.Ingress(
     opts=pulumi.ResourceOptions(depends_on=[mediawiki_service]),
 )
 
+job_runner_labels = {
+    "app": "mediawiki-jobrunner",
+    "component": "jobrunner",
+}
+
+# Upload jobs write to the images volume, which the web pod already holds.
+job_runner_affinity = None
+if uploads_backend == "pvc":
+    job_runner_affinity = k8s.core.v1.AffinityArgs(
+        pod_affinity=k8s.core.v1.PodAffinityArgs(
+            required_during_scheduling_ignored_during_execution=[
+                k8s.core.v1.PodAffinityTermArgs(
+                    label_selector=k8s.meta.v1.LabelSelectorArgs(
+                        match_labels=web_labels,
+                    ),
+                    topology_key="kubernetes.io/hostname",
+                ),
+            ],
+        ),
+    )
+
+mediawiki_job_runner_deployment = k8s.apps.v1.Deployment(
+    "mediawiki-jobrunner-deployment",
+    metadata=k8s.meta.v1.ObjectMetaArgs(
+        name="mediawiki-jobrunner",
+        namespace=namespace_name,
+        labels=job_runner_labels,
+    ),
+    spec=k8s.apps.v1.DeploymentSpecArgs(
+        # Concurrency comes from worker loops inside the pod, which keeps one
+        # runner next to the ReadWriteOnce images volume in pvc mode.
+        replicas=1,
+        strategy=k8s.apps.v1.DeploymentStrategyArgs(type="Recreate"),
+        selector=k8s.meta.v1.LabelSelectorArgs(
+            match_labels=job_runner_labels,
+        ),
+        template=k8s.core.v1.PodTemplateSpecArgs(
+            metadata=k8s.meta.v1.ObjectMetaArgs(
+                labels=job_runner_labels,
+                annotations={
+                    "mediawiki.k8s.kevin/local-settings-task-id": local_settings_task_id,
+                },
+            ),
+            spec=k8s.core.v1.PodSpecArgs(
+                security_context=k8s.core.v1.PodSecurityContextArgs(
+                    fs_group=33,
+                    fs_group_change_policy="OnRootMismatch",
+                ),
+                affinity=job_runner_affinity,
+                # A worker finishes its current batch, bounded by --maxtime,
+                # before the pod exits.
+                termination_grace_period_seconds=job_runner_max_time_seconds + 30,
+                containers=[
+                    k8s.core.v1.ContainerArgs(
+                        name="jobrunner",
+                        image=mediawiki_image,
+                        image_pull_policy="IfNotPresent",
+                        working_dir="/var/www/html",
+                        env=[
+                            k8s.core.v1.EnvVarArgs(
+                                name="JOB_RUNNER_CONCURRENCY",
+                                value=str(job_runner_concurrency),
+                            ),
+                            k8s.core.v1.EnvVarArgs(
+                                name="JOB_RUNNER_TYPES",
+                                value=" ".join(job_runner_types),
+                            ),
+                            k8s.core.v1.EnvVarArgs(
+                                name="JOB_RUNNER_MAX_JOBS",
+                                value=str(job_runner_max_jobs),
+                            ),
+                            k8s.core.v1.EnvVarArgs(
+                                name="JOB_RUNNER_MAX_TIME",
+                                value=str(job_runner_max_time_seconds),
+                            ),
+                            k8s.core.v1.EnvVarArgs(
+                                name="JOB_RUNNER_MEMORY_LIMIT",
+                                value=job_runner_php_memory_limit,
+                            ),
+                            k8s.core.v1.EnvVarArgs(
+                                name="JOB_RUNNER_IDLE_SECONDS",
+                                value=str(job_runner_idle_seconds),
+                            ),
+                        ],
+                        command=["sh", "-c"],
+                        args=[
+                            """
+set -u
+
+stop_file=/tmp/jobrunner-stop
+rm -f "${stop_file}"
+
+run_batch() {
+    output="$(php maintenance/run.php runJobs \\
+        --maxjobs "${JOB_RUNNER_MAX_JOBS}" \\
+        --maxtime "${JOB_RUNNER_MAX_TIME}" \\
+        --memory-limit "${JOB_RUNNER_MEMORY_LIMIT}" \\
+        --result json \\
+        "$@")" || {
+        echo "runJobs $* failed: ${output}" >&2
+        return 1
+    }
+    # An empty batch reports none-ready or none-possible; anything else means
+    # more jobs may be waiting.
+    ! printf '%s' "${output}" | grep -Eq '"reached": *"none-'
+}
+
+worker() {
+    while [ ! -e "${stop_file}" ]; do
+        busy=0
+        if [ -n "${JOB_RUNNER_TYPES}" ]; then
+            for job_type in ${JOB_RUNNER_TYPES}; do
+                run_batch --type "${job_type}" && busy=1
+            done
+        else
+            run_batch && busy=1
+        fi
+        if [ "${busy}" = 0 ]; then
+            sleep "${JOB_RUNNER_IDLE_SECONDS}"
+        fi
+    done
+}
+
+trap 'touch "${stop_file}"' TERM INT
+
+worker_index=0
+while [ "${worker_index}" -lt "${JOB_RUNNER_CONCURRENCY}" ]; do
+    worker &
+    worker_index=$((worker_index + 1))
+done
+
+echo "started ${JOB_RUNNER_CONCURRENCY} job runner workers"
+# wait returns early when the trap fires; wait again for in-flight batches.
+wait
+wait
+""".strip()
+                        ],
+                        resources=job_runner_resources,
+                        volume_mounts=[
+                            k8s.core.v1.VolumeMountArgs(
+                                name="local-settings",
+                                mount_path="/var/www/html/LocalSettings.php",
+                                sub_path="LocalSettings.php",
+                                read_only=True,
+                            ),
+                            *images_volume_mounts,
+                        ],
+                    ),
+                    k8s.core.v1.ContainerArgs(
+                        name="queue-metrics",
+                        image=mediawiki_image,
+                        image_pull_policy="IfNotPresent",
+                        working_dir="/var/www/html",
+                        env=[
+                            k8s.core.v1.EnvVarArgs(
+                                name="QUEUE_METRICS_INTERVAL",
+                                value=str(job_queue_metrics_interval_seconds),
+                            ),
+                            k8s.core.v1.EnvVarArgs(
+                                name="QUEUE_METRICS_PORT",
+                                value=str(job_queue_metrics_port),
+                            ),
+                        ],
+                        command=["sh", "-c"],
+                        args=[
+                            """
+set -u
+
+metrics_dir=/tmp/queue-metrics
+mkdir -p "${metrics_dir}"
+cat > "${metrics_dir}/router.php" <<'PHP'
+<?php
+$path = '/tmp/queue-metrics/metrics';
+if ( !is_readable( $path ) ) {
+    http_response_code( 503 );
+    return true;
+}
+header( 'Content-Type: text/plain; version=0.0.4; charset=utf-8' );
+readfile( $path );
+return true;
+PHP
+
+# showJobs --group prints one line per non-empty queue:
+#   refreshLinks: 12 queued; 3 claimed (2 active, 1 abandoned); 0 delayed
+collect() {
+    php maintenance/run.php showJobs --group > "${metrics_dir}/showjobs" || return 1
+    awk -v now="$(date +%s)" '
+BEGIN {
+    print "# HELP mediawiki_job_queue_jobs Jobs in the MediaWiki job queue by type and state."
+    print "# TYPE mediawiki_job_queue_jobs gauge"
+}
+/^[^:]+: [0-9]+ queued/ {
+    type = substr($0, 1, index($0, ":") - 1)
+    split(substr($0, index($0, ":") + 2), count, /[^0-9]+/)
+    printf "mediawiki_job_queue_jobs{type=\\"%s\\",state=\\"queued\\"} %d\\n", type, count[1]
+    printf "mediawiki_job_queue_jobs{type=\\"%s\\",state=\\"active\\"} %d\\n", type, count[3]
+    printf "mediawiki_job_queue_jobs{type=\\"%s\\",state=\\"abandoned\\"} %d\\n", type, count[4]
+    printf "mediawiki_job_queue_jobs{type=\\"%s\\",state=\\"delayed\\"} %d\\n", type, count[5]
+}
+END {
+    print "# HELP mediawiki_job_queue_last_success_timestamp_seconds Last successful queue scan."
+    print "# TYPE mediawiki_job_queue_last_success_timestamp_seconds gauge"
+    print "mediawiki_job_queue_last_success_timestamp_seconds " now
+}
+' "${metrics_dir}/showjobs" > "${metrics_dir}/metrics.tmp" &&
+        mv "${metrics_dir}/metrics.tmp" "${metrics_dir}/metrics"
+}
+
+while true; do
+    collect || echo "showJobs failed; keeping the previous queue metrics" >&2
+    sleep "${QUEUE_METRICS_INTERVAL}"
+done &
+
+exec php -S "0.0.0.0:${QUEUE_METRICS_PORT}" "${metrics_dir}/router.php"
+""".strip()
+                        ],
+                        ports=[
+                            k8s.core.v1.ContainerPortArgs(
+                                name="metrics",
+                                container_port=job_queue_metrics_port,
+                            ),
+                        ],
+                        resources=k8s.core.v1.ResourceRequirementsArgs(
+                            requests={
+                                "cpu": "10m",
+                                "memory": "64Mi",
+                            },
+                            limits={
+                                "cpu": "200m",
+                                "memory": "256Mi",
+                            },
+                        ),
+                        volume_mounts=[
+                            k8s.core.v1.VolumeMountArgs(
+                                name="local-settings",
+                                mount_path="/var/www/html/LocalSettings.php",
+                                sub_path="LocalSettings.php",
+                                read_only=True,
+                            ),
+                        ],
+                    ),
+                ],
+                volumes=[
+                    k8s.core.v1.VolumeArgs(
+                        name="local-settings",
+                        secret=k8s.core.v1.SecretVolumeSourceArgs(
+                            secret_name=mediawiki_local_settings.metadata.name,
+                        ),
+                    ),
+                    *images_volumes,
+                ],
+            ),
+        ),
+    ),
+    opts=pulumi.ResourceOptions(
+        depends_on=[mediawiki_deployment],
+        delete_before_replace=True,
+    ),
+)
+
+mediawiki_job_runner_podmonitor = PodMonitor(
+    "mediawiki-jobrunner-podmonitor",
+    metadata={
+        "name": "mediawiki-jobrunner",
+        "namespace": namespace_name,
+        "labels": {
+            "release": monitoring_release_label,
+        },
+    },
+    spec={
+        "selector": {
+            "matchLabels": job_runner_labels,
+        },
+        "podMetricsEndpoints": [
+            {
+                "port": "metrics",
+                "path": "/metrics",
+                "interval": "30s",
+            },
+        ],
+    },
+    opts=pulumi.ResourceOptions(depends_on=[mediawiki_job_runner_deployment]),
+)
+
 dashboard_config_maps(
     name_prefix="mediawiki-dashboard",
     namespace=namespace_name,
@@ -1078,6 +1990,11 @@ pulumi.export("mysqlStack", mysql_stack_ref or "")
 pulumi.export("mysqlClusterName", active_mysql_cluster_name)
 pulumi.export("mysqlHost", mysql_service_host)
 pulumi.export("mysqlPort", 3306)
+pulumi.export("cacheBackend", cache_backend)
+pulumi.export("cacheHost", cache_host)
+pulumi.export("jobRunnerConcurrency", job_runner_concurrency)
+pulumi.export("uploadsBackend", uploads_backend)
+pulumi.export("uploadsBucket", uploads_bucket if uploads_backend == "s3" else "")
 pulumi.export("localSettingsSecretName", mediawiki_local_settings.metadata.name)
 pulumi.export("adminUser", admin_user)
 pulumi.export("adminPassword", mediawiki_admin_password.result)
@@ -2,10 +2,13 @@ from pathlib import Path
 
 import pulumi_kubernetes as k8s
 from infra_helpers.grafana import dashboard_config_maps
+from infra_helpers.helm import cached_chart
 from pulumi_monitoring_crds.monitoring.v1 import ServiceMonitor
 
 import pulumi
 
+CHART_VERSION = "0.0.23"
+
 config = pulumi.Config()
 cf_tunnel_namespace_name = config.get("namespace", "cloudflare-tunnel")
 monitoring_release_label = config.get("monitoringReleaseLabel", "kube-prometheus-stack")
@@ -24,13 +27,12 @@ cf_tunnel_namespace = k8s.core.v1.Namespace(
 
 cloudflare_tunnel_chart = k8s.helm.v3.Release(
     "cloudflare-tunnel",
-    chart="cloudflare-tunnel-ingress-controller",
+    chart=cached_chart(
+        "cloudflare-tunnel-ingress-controller", CHART_VERSION, "https://helm.strrl.dev"
+    ),
     name="cloudflare-tunnel-b6e117c1",
-    version="0.0.23",
+    version=CHART_VERSION,
     namespace=cf_tunnel_namespace.metadata.name,
-    repository_opts=k8s.helm.v3.RepositoryOptsArgs(
-        repo="https://helm.strrl.dev",
-    ),
     values={
         "cloudflare": {
             "apiToken": config.require_secret("cloudflareTunnelApiToken"),
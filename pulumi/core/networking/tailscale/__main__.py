@@ -2,6 +2,7 @@ from pathlib import Path
 
 import pulumi_kubernetes as k8s
 from infra_helpers.grafana import dashboard_config_maps
+from infra_helpers.helm import cached_chart
 from pulumi_monitoring_crds.monitoring.v1 import ServiceMonitor
 from pulumi_tailscale_crds.tailscale.v1alpha1 import ProxyClass
 
@@ -25,13 +26,12 @@ tailscale_namespace = k8s.core.v1.Namespace(
 
 tailscale_operator = k8s.helm.v3.Release(
     "tailscale-operator",
-    chart="tailscale-operator",
+    chart=cached_chart(
+        "tailscale-operator", chart_version, "https://pkgs.tailscale.com/helmcharts"
+    ),
     namespace=tailscale_namespace_name,
     version=chart_version,
     replace=True,
-    repository_opts=k8s.helm.v3.RepositoryOptsArgs(
-        repo="https://pkgs.tailscale.com/helmcharts",
-    ),
     values={
         "oauth": {
             "clientId": config.require("TS_CLIENT_ID"),
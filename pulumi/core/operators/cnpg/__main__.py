@@ -1,7 +1,10 @@
 import pulumi_kubernetes as k8s
+from infra_helpers.helm import cached_chart
 
 import pulumi
 
+CHART_VERSION = "0.28.2"
+
 config = pulumi.Config()
 cnpg_namespace_name = config.get("namespace", "cloudnative-pg")
 monitoring_release_label = config.get("monitoringReleaseLabel", "kube-prometheus-stack")
@@ -16,12 +19,11 @@ cnpg_namespace = k8s.core.v1.Namespace(
 
 cloudnative_pg = k8s.helm.v4.Chart(
     "cloudnative-pg",
-    chart="cloudnative-pg",
-    namespace=cnpg_namespace.metadata.name,
-    repository_opts=k8s.helm.v4.RepositoryOptsArgs(
-        repo="https://cloudnative-pg.github.io/charts",
+    chart=cached_chart(
+        "cloudnative-pg", CHART_VERSION, "https://cloudnative-pg.github.io/charts"
     ),
-    version="0.28.2",
+    namespace=cnpg_namespace.metadata.name,
+    version=CHART_VERSION,
     values={
         "monitoring": {
             "podMonitorEnabled": True,
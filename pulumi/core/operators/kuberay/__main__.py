@@ -2,6 +2,7 @@ from pathlib import Path
 
 import pulumi_kubernetes as k8s
 from infra_helpers.grafana import dashboard_config_maps
+from infra_helpers.helm import cached_chart
 from pulumi_kuberay_crds.ray.v1 import RayCluster
 from pulumi_monitoring_crds.monitoring.v1 import PodMonitor
 
@@ -59,11 +60,10 @@ kuberay_namespace = k8s.core.v1.Namespace(
 
 kuberay_operator = k8s.helm.v4.Chart(
     "kuberay-operator",
-    chart="kuberay-operator",
-    namespace=kuberay_namespace.metadata.name,
-    repository_opts=k8s.helm.v4.RepositoryOptsArgs(
-        repo="https://ray-project.github.io/kuberay-helm",
+    chart=cached_chart(
+        "kuberay-operator", chart_version, "https://ray-project.github.io/kuberay-helm"
     ),
+    namespace=kuberay_namespace.metadata.name,
     version=chart_version,
     values={
         "metrics": {
@@ -1,4 +1,5 @@
 import pulumi_kubernetes as k8s
+from infra_helpers.helm import cached_chart
 
 import pulumi
 
@@ -21,13 +22,12 @@ mysql_operator_namespace = k8s.core.v1.Namespace(
 
 mysql_operator = k8s.helm.v3.Release(
     "mysql-operator",
-    chart="mysql-operator",
+    chart=cached_chart(
+        "mysql-operator", chart_version, "https://mysql.github.io/mysql-operator/"
+    ),
     name=release_name,
     namespace=namespace_name,
     version=chart_version,
-    repository_opts=k8s.helm.v3.RepositoryOptsArgs(
-        repo="https://mysql.github.io/mysql-operator/",
-    ),
     values={
         "envs": {
             "k8sClusterDomain": k8s_cluster_domain,
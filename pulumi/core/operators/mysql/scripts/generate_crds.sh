@@ -62,6 +62,7 @@ crd2pulumi \
 
 perl -0pi -e 's/"pulumi>=3\.[0-9]+\.0,<4\.0\.0"/"pulumi>=3.239.0,<4.0.0"/g; s/"pulumi-kubernetes(?:==|>=)4\.[0-9]+\.0(?:,<5\.0\.0)?"/"pulumi-kubernetes>=4.31.0,<5.0.0"/g' "$OUT_DIR/pyproject.toml"
 find "$OUT_DIR" -name '*.py' -exec perl -0pi -e 's/[ \t]+$//mg; s/\n+\z/\n/' {} +
+python3 "$REPO_ROOT/scripts/split_crd_package.py" "$OUT_DIR"
 printf '%s\n' \
     '# MySQL Operator CRDs' \
     '' \
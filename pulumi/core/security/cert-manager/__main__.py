@@ -1,7 +1,10 @@
 import pulumi_kubernetes as k8s
+from infra_helpers.helm import cached_chart
 
 import pulumi
 
+CHART_VERSION = "v1.20.2"
+
 config = pulumi.Config()
 cert_manager_namespace = k8s.core.v1.Namespace(
     "namespace",
@@ -12,12 +15,9 @@ cert_manager_namespace = k8s.core.v1.Namespace(
 
 cert_manager_chart = k8s.helm.v3.Release(
     "chart",
-    chart="cert-manager",
+    chart=cached_chart("cert-manager", CHART_VERSION, "https://charts.jetstack.io"),
     namespace=cert_manager_namespace.metadata.name,
-    repository_opts=k8s.helm.v3.RepositoryOptsArgs(
-        repo="https://charts.jetstack.io",
-    ),
-    version="v1.20.2",
+    version=CHART_VERSION,
     values={
         "crds": {
             "enabled": True,
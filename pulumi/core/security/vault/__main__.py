@@ -2,9 +2,11 @@ import base64
 
 import pulumi_kubernetes as k8s
 import pulumi_tls as tls
+from infra_helpers.helm import cached_chart
 
 import pulumi
 
+CHART_VERSION = "0.32.0"
 RESOURCE_NAME = "vault"
 NAMESPACE = "vault"
 SKIP_AWAIT_ANNOTATION = {
@@ -116,13 +118,12 @@ def setup_tls(namespace_resource: pulumi.Resource) -> k8s.core.v1.Secret:
 def new_vault_chart(secret: pulumi.Resource) -> k8s.helm.v4.Chart:
     return k8s.helm.v4.Chart(
         RESOURCE_NAME,
-        chart="vault",
+        chart=cached_chart(
+            "vault", CHART_VERSION, "https://helm.releases.hashicorp.com"
+        ),
         resource_prefix="",
         namespace=NAMESPACE,
-        repository_opts=k8s.helm.v4.RepositoryOptsArgs(
-            repo="https://helm.releases.hashicorp.com",
-        ),
-        version="0.32.0",
+        version=CHART_VERSION,
         values={
             "global": {
                 "tlsDisable": False,
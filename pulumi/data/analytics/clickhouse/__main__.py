@@ -2,10 +2,90 @@ import hashlib
 
 import pulumi_kubernetes as k8s
 import pulumi_random as random
+from infra_helpers.helm import cached_chart
+from infra_helpers.k8s import secret_env_var
+from infra_helpers.stacks import RustfsStack
 from pulumi_clickhouse_operator_crds.clickhouse.v1 import ClickHouseInstallation
 
 import pulumi
 
+GIB = 1024 * 1024 * 1024
+USER_CREDENTIALS_SECRET_NAME = "clickhouse-user-credentials"
+GRAFANA_USER = "grafana"
+# One settings profile per workload. Memory limits stay under the 1536Mi pod
+# limit; the default profile still applies to anything without a user here.
+PROFILE_DEFAULTS: dict[str, dict[str, object]] = {
+    "default": {
+        "max_threads": 2,
+        "max_memory_usage": GIB,
+    },
+    "admin": {
+        "max_threads": 4,
+        "max_memory_usage": GIB,
+        "max_execution_time": 0,
+    },
+    # Many small inserts from the Langfuse worker are batched server-side.
+    # The same user serves the web UI, the API and migrations, so reads keep
+    # the default budget and have no execution time limit.
+    "langfuse": {
+        "max_threads": 2,
+        "max_memory_usage": GIB,
+        "async_insert": 1,
+        "wait_for_async_insert": 1,
+        "async_insert_busy_timeout_ms": 1000,
+        "async_insert_max_data_size": 10 * 1024 * 1024,
+        "use_query_cache": 0,
+    },
+    # Analytical scans from Trino and dashboards; repeated reads hit the cache.
+    # Queries on system tables or with now()-style functions would otherwise
+    # throw, and these users issue both for metadata and benchmarks.
+    "trino_reader": {
+        "max_threads": 4,
+        "max_memory_usage": GIB,
+        "max_execution_time": 600,
+        "use_query_cache": 1,
+        "query_cache_ttl": 300,
+        "query_cache_min_query_duration": 500,
+        "query_cache_system_table_handling": "ignore",
+        "query_cache_nondeterministic_function_handling": "ignore",
+    },
+}
+# Consumer users, each bound to a profile. Consumer stacks read their
+# credentials from the clickhouseUsers output by these names.
+USER_DEFAULTS: dict[str, dict[str, object]] = {
+    "langfuse": {
+        "profile": "langfuse",
+        "grants": ["GRANT ALL ON langfuse.*"],
+    },
+    "trino": {
+        "profile": "trino_reader",
+        "grants": ["GRANT SELECT, SHOW ON *.*", "GRANT ALL ON benchmarks.*"],
+    },
+    "grafana": {
+        "profile": "trino_reader",
+        "grants": ["GRANT SELECT, SHOW ON *.*"],
+    },
+    # Writes Kafka benchmark results next to the Trino ones.
+    "kafka": {
+        "profile": "default",
+        "grants": ["GRANT ALL ON benchmarks.*"],
+    },
+}
+
+COLD_STORAGE_SECRET_NAME = "clickhouse-cold-storage"
+# Parts start on the local PVC (volume default) and move to RustFS (volume
+# cold), read through a local cache disk, by TTL rule or when the PVC runs short.
+# The first volume keeps the default policy's name and disk, which ClickHouse
+# requires before MODIFY SETTING storage_policy switches an existing table.
+TIERED_STORAGE_DEFAULTS = {
+    "enabled": False,
+    "policy": "tiered",
+    "bucket": "clickhouse-cold",
+    "cacheSizeGb": 10,
+    "moveFactor": 0.1,
+    "ttlMoves": [],
+}
+
 config = pulumi.Config()
 namespace_name = config.get("namespace", "clickhouse")
 operator_chart_version = config.get("operatorChartVersion", "0.27.0")
@@ -15,10 +95,37 @@ clickhouse_admin_username = config.get("adminUsername", "admin")
 clickhouse_admin_password_length = config.get_int("adminPasswordLength") or 32
 monitoring_release_label = config.get("monitoringReleaseLabel", "kube-prometheus-stack")
 grafana_dashboard_label = config.get("grafanaDashboardLabel", "1")
+grafana_namespace = config.get("grafanaNamespace", "monitoring")
+grafana_datasource_label = config.get("grafanaDatasourceLabel", "1")
 clickhouse_admin_networks = config.get_object(
     "adminNetworks",
     ["0.0.0.0/0", "::/0"],
 )
+clickhouse_user_networks = config.get_object("userNetworks", clickhouse_admin_networks)
+profile_overrides = config.get_object("profiles") or {}
+clickhouse_profiles = {
+    name: {**PROFILE_DEFAULTS.get(name, {}), **profile_overrides.get(name, {})}
+    for name in {*PROFILE_DEFAULTS, *profile_overrides}
+}
+clickhouse_users = config.get_object("users") or USER_DEFAULTS
+if GRAFANA_USER not in clickhouse_users:
+    raise ValueError(
+        f"clickhouse:users needs {GRAFANA_USER} for the Grafana datasource"
+    )
+for user_name, user in clickhouse_users.items():
+    if user_name == clickhouse_admin_username:
+        raise ValueError(f"clickhouse:users must not redefine {user_name}")
+    if user["profile"] not in clickhouse_profiles:
+        raise ValueError(
+            f"clickhouse user {user_name} has no profile {user['profile']}"
+        )
+rustfs_stack_ref = config.get("rustfsStack", "kzh/rustfs/mx")
+tiered_storage = {
+    **TIERED_STORAGE_DEFAULTS,
+    **(config.get_object("tieredStorage") or {}),
+}
+if tiered_storage["ttlMoves"] and not tiered_storage["enabled"]:
+    raise ValueError("clickhouse:tieredStorage ttlMoves need tieredStorage enabled")
 clickhouse_image = config.get(
     "clickhouseImage",
     "clickhouse/clickhouse-server:26.4.2.10",
@@ -29,6 +136,10 @@ clickhouse_hostname = config.get("hostname", "clickhouse")
 tailscale_domain = config.get("tailscaleDomain", "tail1c114.ts.net")
 clickhouse_host = f"{clickhouse_hostname}.{tailscale_domain}"
 clickhouse_port = 9000
+clickhouse_http_port = 8123
+# In-cluster name of the clickhouse Service below, for consumers in other
+# namespaces that should not go through Tailscale.
+clickhouse_service_fqdn = f"clickhouse.{namespace_name}.svc.cluster.local"
 
 clickhouse_namespace = k8s.core.v1.Namespace(
     "clickhouse-namespace",
@@ -49,9 +160,24 @@ clickhouse_admin_password_resource = random.RandomPassword(
     min_numeric=1,
 )
 clickhouse_admin_password = clickhouse_admin_password_resource.result
-clickhouse_admin_password_task_id = clickhouse_admin_password.apply(
-    lambda password: hashlib.sha256(password.encode("utf-8")).hexdigest()[:16]
-)
+
+
+def credentials_task_id(passwords: list[str]) -> str:
+    """A non-secret value that changes whenever any ClickHouse password does."""
+    return hashlib.sha256("\0".join(passwords).encode("utf-8")).hexdigest()[:16]
+
+
+clickhouse_user_passwords = {
+    user_name: random.RandomPassword(
+        f"clickhouse-{user_name}-password",
+        length=32,
+        special=False,
+    ).result
+    for user_name in sorted(clickhouse_users)
+}
+clickhouse_admin_password_task_id = pulumi.Output.all(
+    clickhouse_admin_password, *clickhouse_user_passwords.values()
+).apply(credentials_task_id)
 
 clickhouse_admin_credentials = k8s.core.v1.Secret(
     "clickhouse-admin-credentials",
@@ -66,15 +192,194 @@ clickhouse_admin_credentials = k8s.core.v1.Secret(
     opts=pulumi.ResourceOptions(depends_on=[clickhouse_namespace]),
 )
 
+clickhouse_user_credentials = k8s.core.v1.Secret(
+    "clickhouse-user-credentials",
+    metadata=k8s.meta.v1.ObjectMetaArgs(
+        name=USER_CREDENTIALS_SECRET_NAME,
+        namespace=namespace_name,
+    ),
+    type="Opaque",
+    string_data=clickhouse_user_passwords,
+    opts=pulumi.ResourceOptions(depends_on=[clickhouse_namespace]),
+)
+
+
+def render_storage_configuration(endpoint: str) -> str:
+    policy = tiered_storage["policy"]
+    cache_bytes = int(tiered_storage["cacheSizeGb"]) * GIB
+    return f"""
+<clickhouse>
+  <storage_configuration>
+    <disks>
+      <rustfs>
+        <type>s3</type>
+        <endpoint>{endpoint}/{tiered_storage["bucket"]}/data/</endpoint>
+        <access_key_id from_env="CLICKHOUSE_COLD_ACCESS_KEY"/>
+        <secret_access_key from_env="CLICKHOUSE_COLD_SECRET_KEY"/>
+        <region>us-east-1</region>
+        <metadata_path>/var/lib/clickhouse/disks/rustfs/</metadata_path>
+      </rustfs>
+      <rustfs_cache>
+        <type>cache</type>
+        <disk>rustfs</disk>
+        <path>/var/lib/clickhouse/disks/rustfs_cache/</path>
+        <max_size>{cache_bytes}</max_size>
+        <cache_on_write_operations>1</cache_on_write_operations>
+      </rustfs_cache>
+    </disks>
+    <policies>
+      <{policy}>
+        <volumes>
+          <default>
+            <disk>default</disk>
+          </default>
+          <cold>
+            <disk>rustfs_cache</disk>
+            <prefer_not_to_merge>true</prefer_not_to_merge>
+          </cold>
+        </volumes>
+        <move_factor>{tiered_storage["moveFactor"]}</move_factor>
+      </{policy}>
+    </policies>
+  </storage_configuration>
+</clickhouse>
+""".lstrip()
+
+
+def render_ttl_moves() -> str:
+    """ALTER statements that move each configured table to the tiered policy."""
+    policy = tiered_storage["policy"]
+    return "\n".join(
+        f"ALTER TABLE {move['table']} MODIFY SETTING storage_policy = '{policy}';\n"
+        f"ALTER TABLE {move['table']} MODIFY TTL {move['ttl']} TO VOLUME 'cold';"
+        for move in tiered_storage["ttlMoves"]
+    )
+
+
+def profile_settings() -> dict[str, str]:
+    return {
+        f"{name}/{setting}": str(value)
+        for name, settings in sorted(clickhouse_profiles.items())
+        for setting, value in settings.items()
+    }
+
+
+def user_settings() -> dict[str, object]:
+    settings: dict[str, object] = {}
+    for user_name, user in sorted(clickhouse_users.items()):
+        settings.update(
+            {
+                f"{user_name}/profile": user["profile"],
+                f"{user_name}/quota": "default",
+                f"{user_name}/networks/ip": clickhouse_user_networks,
+                f"{user_name}/k8s_secret_password": (
+                    f"{USER_CREDENTIALS_SECRET_NAME}/{user_name}"
+                ),
+                f"{user_name}/grants/query": user["grants"],
+            }
+        )
+    return settings
+
+
+cold_storage_dependencies: list[pulumi.Resource] = []
+cold_storage_env: list[dict[str, object]] = []
+configuration_files: dict[str, pulumi.Input[str]] = {}
+if tiered_storage["enabled"]:
+    rustfs_stack = RustfsStack(rustfs_stack_ref)
+    cold_storage_credentials = k8s.core.v1.Secret(
+        "clickhouse-cold-storage",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name=COLD_STORAGE_SECRET_NAME,
+            namespace=namespace_name,
+        ),
+        type="Opaque",
+        string_data={
+            "access-key": rustfs_stack.access_key,
+            "secret-key": rustfs_stack.secret_key,
+        },
+        opts=pulumi.ResourceOptions(depends_on=[clickhouse_namespace]),
+    )
+
+    cold_storage_bucket = k8s.batch.v1.Job(
+        "clickhouse-cold-storage-bucket",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="clickhouse-cold-storage-bucket",
+            namespace=namespace_name,
+            annotations={
+                "pulumi.com/waitFor": "jsonpath={.status.succeeded}=1",
+            },
+        ),
+        spec=k8s.batch.v1.JobSpecArgs(
+            backoff_limit=4,
+            ttl_seconds_after_finished=86400,
+            template=k8s.core.v1.PodTemplateSpecArgs(
+                spec=k8s.core.v1.PodSpecArgs(
+                    restart_policy="OnFailure",
+                    containers=[
+                        k8s.core.v1.ContainerArgs(
+                            name="create-bucket",
+                            image="quay.io/minio/mc:latest",
+                            command=["sh", "-ceu"],
+                            args=[
+                                """
+mc alias set rustfs "$S3_ENDPOINT_URL" "$S3_ACCESS_KEY" "$S3_SECRET_KEY"
+mc mb --ignore-existing "rustfs/$S3_BUCKET"
+""".strip(),
+                            ],
+                            env=[
+                                k8s.core.v1.EnvVarArgs(
+                                    name="S3_ENDPOINT_URL",
+                                    value=rustfs_stack.s3_endpoint_url,
+                                ),
+                                k8s.core.v1.EnvVarArgs(
+                                    name="S3_BUCKET",
+                                    value=tiered_storage["bucket"],
+                                ),
+                                secret_env_var(
+                                    "S3_ACCESS_KEY",
+                                    COLD_STORAGE_SECRET_NAME,
+                                    "access-key",
+                                ),
+                                secret_env_var(
+                                    "S3_SECRET_KEY",
+                                    COLD_STORAGE_SECRET_NAME,
+                                    "secret-key",
+                                ),
+                            ],
+                        )
+                    ],
+                ),
+            ),
+        ),
+        opts=pulumi.ResourceOptions(
+            depends_on=[cold_storage_credentials],
+            delete_before_replace=True,
+        ),
+    )
+    cold_storage_dependencies = [cold_storage_credentials, cold_storage_bucket]
+    cold_storage_env = [
+        {
+            "name": f"CLICKHOUSE_COLD_{key.upper().replace('-', '_')}",
+            "valueFrom": {
+                "secretKeyRef": {"name": COLD_STORAGE_SECRET_NAME, "key": key},
+            },
+        }
+        for key in ("access-key", "secret-key")
+    ]
+    configuration_files["config.d/storage.xml"] = rustfs_stack.s3_endpoint_url.apply(
+        render_storage_configuration
+    )
+
 clickhouse_operator = k8s.helm.v3.Release(
     "clickhouse-operator",
-    chart="altinity-clickhouse-operator",
+    chart=cached_chart(
+        "altinity-clickhouse-operator",
+        operator_chart_version,
+        "https://docs.altinity.com/clickhouse-operator",
+    ),
     name="chop",
     namespace=namespace_name,
     version=operator_chart_version,
-    repository_opts=k8s.helm.v3.RepositoryOptsArgs(
-        repo="https://docs.altinity.com/clickhouse-operator",
-    ),
     values={
         # Keep the operator footprint minimal for this single-node deployment.
         "metrics": {
@@ -127,12 +432,11 @@ clickhouse_installation = ClickHouseInstallation(
     spec={
         "taskID": clickhouse_admin_password_task_id,
         "configuration": {
-            "profiles": {
-                "default/max_memory_usage": "1073741824",
-                "default/max_threads": "2",
-            },
+            **({"files": configuration_files} if configuration_files else {}),
+            "profiles": profile_settings(),
             "users": {
-                f"{clickhouse_admin_username}/profile": "default",
+                **user_settings(),
+                f"{clickhouse_admin_username}/profile": "admin",
                 f"{clickhouse_admin_username}/quota": "default",
                 f"{clickhouse_admin_username}/networks/ip": clickhouse_admin_networks,
                 f"{clickhouse_admin_username}/k8s_secret_password": "clickhouse-admin-credentials/password",
@@ -163,6 +467,11 @@ clickhouse_installation = ClickHouseInstallation(
                             {
                                 "name": "clickhouse",
                                 "image": clickhouse_image,
+                                **(
+                                    {"env": cold_storage_env}
+                                    if cold_storage_env
+                                    else {}
+                                ),
                                 "resources": {
                                     "requests": {
                                         "cpu": "250m",
@@ -195,7 +504,12 @@ clickhouse_installation = ClickHouseInstallation(
         },
     },
     opts=pulumi.ResourceOptions(
-        depends_on=[clickhouse_operator, clickhouse_admin_credentials]
+        depends_on=[
+            clickhouse_operator,
+            clickhouse_admin_credentials,
+            clickhouse_user_credentials,
+            *cold_storage_dependencies,
+        ]
     ),
 )
 
@@ -220,22 +534,132 @@ clickhouse_tailscale_service = k8s.core.v1.Service(
         ports=[
             k8s.core.v1.ServicePortArgs(
                 name="tcp",
-                port=9000,
-                target_port=9000,
+                port=clickhouse_port,
+                target_port=clickhouse_port,
             ),
             k8s.core.v1.ServicePortArgs(
                 name="http",
-                port=8123,
-                target_port=8123,
+                port=clickhouse_http_port,
+                target_port=clickhouse_http_port,
             ),
         ],
     ),
     opts=pulumi.ResourceOptions(depends_on=[clickhouse_installation]),
 )
 
+if tiered_storage["ttlMoves"]:
+    k8s.batch.v1.Job(
+        "clickhouse-ttl-moves",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="clickhouse-ttl-moves",
+            namespace=namespace_name,
+            annotations={
+                "pulumi.com/waitFor": "jsonpath={.status.succeeded}=1",
+            },
+        ),
+        spec=k8s.batch.v1.JobSpecArgs(
+            backoff_limit=10,
+            ttl_seconds_after_finished=86400,
+            template=k8s.core.v1.PodTemplateSpecArgs(
+                spec=k8s.core.v1.PodSpecArgs(
+                    restart_policy="OnFailure",
+                    containers=[
+                        k8s.core.v1.ContainerArgs(
+                            name="ttl-moves",
+                            image=clickhouse_image,
+                            command=["sh", "-ceu"],
+                            args=[
+                                f"""
+clickhouse-client \\
+  --host "{clickhouse_service_fqdn}" \\
+  --user "$CLICKHOUSE_USER" \\
+  --password "$CLICKHOUSE_PASSWORD" \\
+  --multiquery <<'SQL'
+{render_ttl_moves()}
+SQL
+""".strip(),
+                            ],
+                            env=[
+                                k8s.core.v1.EnvVarArgs(
+                                    name="CLICKHOUSE_USER",
+                                    value=clickhouse_admin_username,
+                                ),
+                                secret_env_var(
+                                    "CLICKHOUSE_PASSWORD",
+                                    "clickhouse-admin-credentials",
+                                    "password",
+                                ),
+                            ],
+                        )
+                    ],
+                ),
+            ),
+        ),
+        opts=pulumi.ResourceOptions(
+            depends_on=[clickhouse_tailscale_service],
+            delete_before_replace=True,
+        ),
+    )
+
+# Picked up by the Grafana datasource sidecar, so dashboards can query ClickHouse
+# tables such as the Trino benchmark results by the datasource name ClickHouse.
+clickhouse_grafana_datasource = k8s.core.v1.Secret(
+    "clickhouse-grafana-datasource",
+    metadata=k8s.meta.v1.ObjectMetaArgs(
+        name="clickhouse-grafana-datasource",
+        namespace=grafana_namespace,
+        labels={
+            "grafana_datasource": grafana_datasource_label,
+        },
+    ),
+    type="Opaque",
+    string_data={
+        "clickhouse.yaml": pulumi.Output.format(
+            """
+apiVersion: 1
+datasources:
+  - name: ClickHouse
+    uid: clickhouse
+    type: grafana-clickhouse-datasource
+    jsonData:
+      host: {0}
+      port: {3}
+      protocol: native
+      username: {1}
+    secureJsonData:
+      password: "{2}"
+""".lstrip(),
+            clickhouse_service_fqdn,
+            GRAFANA_USER,
+            clickhouse_user_passwords[GRAFANA_USER],
+            clickhouse_port,
+        ),
+    },
+    opts=pulumi.ResourceOptions(depends_on=[clickhouse_tailscale_service]),
+)
+
 pulumi.export("clickhouseHost", clickhouse_host)
 pulumi.export("clickhousePort", clickhouse_port)
+pulumi.export("clickhouseServiceFqdn", clickhouse_service_fqdn)
+pulumi.export("clickhouseHttpPort", clickhouse_http_port)
 pulumi.export("clickhouseAdminUsername", clickhouse_admin_username)
 pulumi.export(
     "clickhouseAdminPassword", pulumi.Output.secret(clickhouse_admin_password)
 )
+pulumi.export(
+    "clickhouseUsers",
+    pulumi.Output.secret(
+        {
+            user_name: {
+                "username": user_name,
+                "password": clickhouse_user_passwords[user_name],
+                "profile": user["profile"],
+            }
+            for user_name, user in clickhouse_users.items()
+        }
+    ),
+)
+pulumi.export(
+    "clickhouseStoragePolicy",
+    tiered_storage["policy"] if tiered_storage["enabled"] else "default",
+)
@@ -4,6 +4,12 @@ import pulumi_kubernetes as k8s
 import pulumi_postgresql as pg
 import pulumi_random as random
 from infra_helpers.postgres import PostgresStack
+from infra_helpers.stacks import (
+    ClickHouseStack,
+    RustfsStack,
+    StackOutputs,
+    TrinoStack,
+)
 
 import pulumi
 
@@ -57,14 +63,14 @@ labels = {
 }
 
 postgres = PostgresStack(postgres_stack_ref)
-trino_stack = pulumi.StackReference(trino_stack_ref)
-clickhouse_stack = pulumi.StackReference(clickhouse_stack_ref)
-rustfs_stack = pulumi.StackReference(rustfs_stack_ref)
-spark_stack = pulumi.StackReference(spark_stack_ref)
-kafka_stack = pulumi.StackReference(kafka_stack_ref)
-mlflow_stack = pulumi.StackReference(mlflow_stack_ref)
-
-postgres_service_host = postgres.rw_service_fqdn
+trino_stack = TrinoStack(trino_stack_ref)
+clickhouse_stack = ClickHouseStack(clickhouse_stack_ref)
+rustfs_stack = RustfsStack(rustfs_stack_ref)
+spark_stack = StackOutputs(spark_stack_ref)
+kafka_stack = StackOutputs(kafka_stack_ref)
+mlflow_stack = StackOutputs(mlflow_stack_ref)
+
+postgres_service_host = postgres.service_fqdn(config.get("postgresPoolMode"))
 postgres_port = postgres.port.apply(lambda p: int(p) if p else 5432)
 
 admin_provider = postgres.admin_provider(
@@ -152,40 +158,30 @@ for database_name in postgres_databases:
         [database_grant, schema_grant, table_grant, sequence_grant]
     )
 
-trino_host = pulumi.Output.format(
-    "{0}.{1}.svc.cluster.local",
-    trino_stack.require_output("service_name"),
-    trino_stack.require_output("namespace"),
-)
+trino_host = trino_stack.service_host
 trino_uri = pulumi.Output.format("http://{0}:8080", trino_host)
 trino_sqlalchemy_uri = pulumi.Output.format(
     "trino://marimo@{0}:8080/tpch/tiny",
     trino_host,
 )
-trino_catalogs = trino_stack.require_output("catalogs").apply(
-    lambda catalogs: ",".join(catalogs)
-)
+trino_catalogs = trino_stack.catalogs.apply(lambda catalogs: ",".join(catalogs))
 
 clickhouse_http_url = "http://clickhouse.clickhouse.svc.cluster.local:8123"
 spark_remote = pulumi.Output.format(
     "sc://{0}.{1}.svc.cluster.local:15002",
-    spark_stack.require_output("spark_connect_hostname"),
-    spark_stack.require_output("namespace"),
+    spark_stack.require("spark_connect_hostname"),
+    spark_stack.namespace,
 )
 spark_ui_url = "http://spark-connect-ui.spark.svc.cluster.local:4040"
-rustfs_endpoint_url = pulumi.Output.format(
-    "http://{0}.{1}.svc.cluster.local:9000",
-    rustfs_stack.require_output("s3_hostname"),
-    rustfs_stack.require_output("namespace"),
-)
+rustfs_endpoint_url = rustfs_stack.s3_endpoint_url
 kafka_bootstrap_servers = pulumi.Output.format(
     "{0}-kafka-bootstrap.{1}.svc.cluster.local:9092",
-    kafka_stack.require_output("clusterName"),
-    kafka_stack.require_output("namespace"),
+    kafka_stack.require("clusterName"),
+    kafka_stack.namespace,
 )
 mlflow_tracking_uri = pulumi.Output.format(
     "http://mlflow.{0}.svc.cluster.local",
-    mlflow_stack.require_output("namespace"),
+    mlflow_stack.namespace,
 )
 
 namespace = k8s.core.v1.Namespace(
@@ -261,12 +257,10 @@ secrets = k8s.core.v1.Secret(
     string_data={
         "MARIMO_TOKEN_PASSWORD": token_password.result,
         "POSTGRES_PASSWORD": postgres_reader_password.result,
-        "CLICKHOUSE_USER": clickhouse_stack.require_output("clickhouseAdminUsername"),
-        "CLICKHOUSE_PASSWORD": clickhouse_stack.require_output(
-            "clickhouseAdminPassword"
-        ),
-        "AWS_ACCESS_KEY_ID": rustfs_stack.require_output("access_key"),
-        "AWS_SECRET_ACCESS_KEY": rustfs_stack.require_output("secret_key"),
+        "CLICKHOUSE_USER": clickhouse_stack.admin_username,
+        "CLICKHOUSE_PASSWORD": clickhouse_stack.admin_password,
+        "AWS_ACCESS_KEY_ID": rustfs_stack.access_key,
+        "AWS_SECRET_ACCESS_KEY": rustfs_stack.secret_key,
     },
     type="Opaque",
     opts=pulumi.ResourceOptions(
@@ -589,7 +583,7 @@ pulumi.export("token", pulumi.Output.secret(token_password.result))
 pulumi.export("image", IMAGE)
 pulumi.export("marimo_version", APP_VERSION)
 pulumi.export("trino_uri", trino_uri)
-pulumi.export("trino_catalogs", trino_stack.require_output("catalogs"))
+pulumi.export("trino_catalogs", trino_stack.catalogs)
 pulumi.export("spark_remote", spark_remote)
 pulumi.export("mlflow_tracking_uri", mlflow_tracking_uri)
 pulumi.export("kafka_bootstrap_servers", kafka_bootstrap_servers)
@@ -1,6 +1,8 @@
 import pulumi_kubernetes as k8s
 import pulumi_random as random
+from infra_helpers.helm import cached_chart
 from infra_helpers.postgres import PostgresStack, create_database_owner
+from infra_helpers.stacks import RustfsStack
 
 import pulumi
 
@@ -36,14 +38,10 @@ labels = {
 }
 
 postgres = PostgresStack(postgres_stack_ref)
-rustfs_stack = pulumi.StackReference(rustfs_stack_ref)
+rustfs_stack = RustfsStack(rustfs_stack_ref)
 
-postgres_service_host = postgres.rw_service_fqdn
-rustfs_s3_endpoint_url = pulumi.Output.format(
-    "http://{0}.{1}.svc.cluster.local:9000",
-    rustfs_stack.require_output("s3_hostname"),
-    rustfs_stack.require_output("namespace"),
-)
+postgres_service_host = postgres.service_fqdn(config.get("postgresPoolMode"))
+rustfs_s3_endpoint_url = rustfs_stack.s3_endpoint_url
 
 db_password = random.RandomPassword(
     "mlflow-db-password",
@@ -117,8 +115,8 @@ s3_secret = k8s.core.v1.Secret(
         labels=labels,
     ),
     string_data={
-        "AWS_ACCESS_KEY_ID": rustfs_stack.require_output("access_key"),
-        "AWS_SECRET_ACCESS_KEY": rustfs_stack.require_output("secret_key"),
+        "AWS_ACCESS_KEY_ID": rustfs_stack.access_key,
+        "AWS_SECRET_ACCESS_KEY": rustfs_stack.secret_key,
     },
     type="Opaque",
     opts=pulumi.ResourceOptions(depends_on=[namespace]),
@@ -229,12 +227,11 @@ except ClientError as exc:
 
 mlflow_chart = k8s.helm.v4.Chart(
     "mlflow",
-    chart="mlflow",
+    chart=cached_chart(
+        "mlflow", CHART_VERSION, "https://community-charts.github.io/helm-charts"
+    ),
     namespace=namespace.metadata.name,
     version=CHART_VERSION,
-    repository_opts=k8s.helm.v4.RepositoryOptsArgs(
-        repo="https://community-charts.github.io/helm-charts",
-    ),
     values={
         "fullnameOverride": "mlflow",
         "postgresql": {
@@ -2,6 +2,7 @@ from pathlib import Path
 
 import pulumi_kubernetes as k8s
 from infra_helpers.grafana import dashboard_config_maps
+from infra_helpers.helm import cached_chart
 
 import pulumi
 
@@ -50,7 +51,9 @@ slinky_namespace = k8s.core.v1.Namespace(
 
 slurm_operator_crds = k8s.helm.v3.Release(
     "slurm-operator-crds",
-    chart="oci://ghcr.io/slinkyproject/charts/slurm-operator-crds",
+    chart=cached_chart(
+        "oci://ghcr.io/slinkyproject/charts/slurm-operator-crds", chart_version
+    ),
     namespace=slinky_namespace.metadata.name,
     version=chart_version,
     opts=pulumi.ResourceOptions(depends_on=[slinky_namespace]),
@@ -58,7 +61,9 @@ slurm_operator_crds = k8s.helm.v3.Release(
 
 slurm_operator = k8s.helm.v3.Release(
     "slurm-operator",
-    chart="oci://ghcr.io/slinkyproject/charts/slurm-operator",
+    chart=cached_chart(
+        "oci://ghcr.io/slinkyproject/charts/slurm-operator", chart_version
+    ),
     namespace=slinky_namespace.metadata.name,
     version=chart_version,
     values={
@@ -76,7 +81,7 @@ slurm_namespace = k8s.core.v1.Namespace(
 
 slurm_cluster = k8s.helm.v3.Release(
     "slurm",
-    chart="oci://ghcr.io/slinkyproject/charts/slurm",
+    chart=cached_chart("oci://ghcr.io/slinkyproject/charts/slurm", chart_version),
     namespace=slurm_namespace.metadata.name,
     version=chart_version,
     values={
@@ -3,6 +3,10 @@ from pathlib import Path
 
 import pulumi_kubernetes as k8s
 from infra_helpers.grafana import dashboard_config_maps
+from infra_helpers.helm import cached_chart
+from infra_helpers.k8s import stable_task_id
+from infra_helpers.postgres import PostgresStack
+from infra_helpers.stacks import RustfsStack, TrinoStack
 from pulumi_spark_operator_crds.sparkoperator.v1alpha1 import SparkConnect
 
 import pulumi
@@ -21,6 +25,9 @@ ICEBERG_CATALOG_NAME = "trino_iceberg"
 SPARK_ICEBERG_CREDENTIALS_SECRET_NAME = "spark-iceberg-credentials"
 ICEBERG_WAREHOUSE_MOUNT_PATH = "/var/lib/spark/warehouse"
 LEGACY_LOCAL_ICEBERG_WAREHOUSE_URI = f"file://{ICEBERG_WAREHOUSE_MOUNT_PATH}"
+# Tables moved off the legacy PVC keep their relative paths under this prefix
+# of the shared warehouse, clear of anything Trino has written.
+MIGRATED_WAREHOUSE_DIRECTORY = "legacy-spark"
 DEFAULT_SPARK_IMAGE = (
     "ghcr.io/kzh/spark:"
     f"{SPARK_VERSION}-iceberg{ICEBERG_VERSION}-lakehouse-java{SPARK_JAVA_VERSION}"
@@ -34,7 +41,14 @@ ui_hostname = config.get("ui_hostname") or "spark"
 spark_image = config.get("image") or DEFAULT_SPARK_IMAGE
 warehouse_storage_size = config.get("warehouse_storage_size") or "20Gi"
 warehouse_storage_class = config.get("warehouse_storage_class") or "local-path"
+migrate_legacy_warehouse = config.get_bool("migrate_legacy_warehouse")
+if migrate_legacy_warehouse is None:
+    migrate_legacy_warehouse = True
+executor_instances = config.get_int("executor_instances") or 2
+executor_cores = config.get_int("executor_cores") or 1
+executor_memory = config.get("executor_memory") or "512m"
 postgres_stack_ref = config.get("postgresStack") or "kzh/postgresql/mx"
+postgres_pool_mode = config.get("postgresPoolMode")
 rustfs_stack_ref = config.get("rustfsStack") or "kzh/rustfs/mx"
 trino_stack_ref = config.get("trinoStack") or "kzh/trino/mx"
 trino_namespace = config.get("trinoNamespace") or "trino"
@@ -61,19 +75,15 @@ connect_server_selector = {
     "sparkoperator.k8s.io/launched-by-spark-operator": "true",
 }
 
-postgres_stack = pulumi.StackReference(postgres_stack_ref)
-rustfs_stack = pulumi.StackReference(rustfs_stack_ref)
-trino_stack = pulumi.StackReference(trino_stack_ref)
+postgres_stack = PostgresStack(postgres_stack_ref)
+rustfs_stack = RustfsStack(rustfs_stack_ref)
+trino_stack = TrinoStack(trino_stack_ref)
 
-postgres_service_host = postgres_stack.require_output("rw_service_fqdn")
-rustfs_s3_endpoint_url = pulumi.Output.format(
-    "http://{0}.{1}.svc.cluster.local:9000",
-    rustfs_stack.require_output("s3_hostname"),
-    rustfs_stack.require_output("namespace"),
-)
-iceberg_database = trino_stack.require_output("iceberg_database")
-iceberg_warehouse = trino_stack.require_output("iceberg_warehouse")
-iceberg_jdbc_catalog_name = trino_stack.require_output("iceberg_jdbc_catalog_name")
+postgres_service_host = postgres_stack.service_fqdn(postgres_pool_mode)
+rustfs_s3_endpoint_url = rustfs_stack.s3_endpoint_url
+iceberg_database = trino_stack.iceberg_database
+iceberg_warehouse = trino_stack.iceberg_warehouse
+iceberg_jdbc_catalog_name = trino_stack.iceberg_jdbc_catalog_name
 
 spark_namespace = k8s.core.v1.Namespace(
     "spark-namespace",
@@ -86,11 +96,10 @@ spark_namespace = k8s.core.v1.Namespace(
 spark_operator = k8s.helm.v4.Chart(
     "spark",
     namespace=spark_namespace.metadata.name,
-    chart="spark-operator",
-    version=CHART_VERSION,
-    repository_opts=k8s.helm.v4.RepositoryOptsArgs(
-        repo="https://kubeflow.github.io/spark-operator",
+    chart=cached_chart(
+        "spark-operator", CHART_VERSION, "https://kubeflow.github.io/spark-operator"
     ),
+    version=CHART_VERSION,
     values={
         "fullnameOverride": "spark-operator",
         "controller": {
@@ -210,16 +219,6 @@ spark_iceberg_credentials = k8s.core.v1.Secret(
     ),
 )
 
-warehouse_volume = {
-    "name": "spark-warehouse",
-    "persistentVolumeClaim": {
-        "claimName": spark_warehouse.metadata.name,
-    },
-}
-warehouse_volume_mount = {
-    "name": "spark-warehouse",
-    "mountPath": ICEBERG_WAREHOUSE_MOUNT_PATH,
-}
 spark_defaults_volume = {
     "name": "spark-defaults",
     "secret": {
@@ -331,17 +330,14 @@ spark_connect = SparkConnect(
                 },
                 "spec": {
                     "serviceAccount": "spark-operator-spark",
-                    "volumes": [warehouse_volume, spark_defaults_volume],
+                    "volumes": [spark_defaults_volume],
                     "containers": [
                         {
                             "name": "spark-kubernetes-driver",
                             "image": spark_image,
                             "imagePullPolicy": "IfNotPresent",
                             "env": iceberg_secret_env,
-                            "volumeMounts": [
-                                warehouse_volume_mount,
-                                spark_defaults_volume_mount,
-                            ],
+                            "volumeMounts": [spark_defaults_volume_mount],
                         }
                     ],
                     "securityContext": {
@@ -359,10 +355,12 @@ spark_connect = SparkConnect(
                 },
             },
         },
+        # Executors only talk to RustFS and the JDBC catalog, so they are free
+        # to land on any node.
         "executor": {
-            "instances": 1,
-            "cores": 1,
-            "memory": "512m",
+            "instances": executor_instances,
+            "cores": executor_cores,
+            "memory": executor_memory,
             "template": {
                 "metadata": {
                     "labels": {
@@ -377,10 +375,8 @@ spark_connect = SparkConnect(
                             "image": spark_image,
                             "imagePullPolicy": "IfNotPresent",
                             "env": iceberg_secret_env,
-                            "volumeMounts": [warehouse_volume_mount],
                         }
                     ],
-                    "volumes": [warehouse_volume],
                     "securityContext": {
                         "allowPrivilegeEscalation": False,
                         "capabilities": {
@@ -398,12 +394,363 @@ spark_connect = SparkConnect(
         },
     },
     opts=pulumi.ResourceOptions(
-        depends_on=[spark_operator, spark_warehouse, spark_iceberg_credentials],
+        depends_on=[spark_operator, spark_iceberg_credentials],
         delete_before_replace=True,
         replace_on_changes=["spec"],
     ),
 )
 
+if migrate_legacy_warehouse:
+    migration_files = k8s.core.v1.ConfigMap(
+        "spark-warehouse-migration",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="spark-warehouse-migration",
+            namespace=spark_namespace.metadata.name,
+            labels={
+                "app": connect_name,
+            },
+        ),
+        data={
+            "migrate_warehouse.py": """
+import json
+import os
+import sys
+import urllib.parse
+
+from pyspark.errors import AnalysisException
+from pyspark.sql import SparkSession
+
+CATALOG = os.environ["ICEBERG_CATALOG"]
+LEGACY_CATALOG = "legacy"
+LEGACY_PATH = os.environ["LEGACY_WAREHOUSE_PATH"].rstrip("/")
+TARGET_PREFIX = os.environ["MIGRATED_WAREHOUSE_PREFIX"].rstrip("/")
+WORK = "/work"
+PLAN = f"{WORK}/plan.json"
+COPIES = f"{WORK}/copies.tsv"
+# Lives on the PVC so a retried pod still finds tables dropped from the shared
+# catalog but not yet registered again.
+PENDING = f"{LEGACY_PATH}/.migration-pending.json"
+
+
+def tables(spark, catalog):
+    for namespace, *_ in spark.sql(f"SHOW NAMESPACES IN {catalog}").collect():
+        for row in spark.sql(f"SHOW TABLES IN {catalog}.`{namespace}`").collect():
+            yield f"{namespace}.{row.tableName}"
+
+
+def location(spark, table):
+    try:
+        rows = spark.sql(f"DESCRIBE TABLE EXTENDED {table}").collect()
+    except AnalysisException as error:
+        print(f"skip {table}: {error}", flush=True)
+        return None
+    return next(row.data_type for row in rows if row.col_name == "Location")
+
+
+def pending_tables(spark):
+    if not os.path.exists(PENDING):
+        return []
+    with open(PENDING, encoding="utf-8") as handle:
+        migrations = json.load(handle)
+    return [
+        {**migration, "source": "pending"}
+        for migration in migrations
+        if not spark.catalog.tableExists(f"{CATALOG}.{migration['table']}")
+    ]
+
+
+def legacy_tables(spark, seen):
+    # Tables the shared catalog still reads from the PVC, then tables only the
+    # old Spark-only setup knew about, as a Hadoop catalog over the same path.
+    for table in tables(spark, CATALOG):
+        path = location(spark, f"{CATALOG}.{table}")
+        if path and path.startswith("file:"):
+            seen.add(urllib.parse.urlparse(path).path.rstrip("/"))
+            yield "catalog", CATALOG, table, path
+    for table in tables(spark, LEGACY_CATALOG):
+        # Shared catalog tables also show up here, but their metadata files
+        # are not named vN.metadata.json, so the Hadoop catalog cannot load
+        # them. Skip them by directory before loading anything.
+        if f"{LEGACY_PATH}/{table.replace('.', '/')}" in seen:
+            continue
+        if spark.catalog.tableExists(f"{CATALOG}.{table}"):
+            print(f"skip {LEGACY_CATALOG}.{table}: {CATALOG}.{table} exists")
+            continue
+        path = location(spark, f"{LEGACY_CATALOG}.{table}")
+        if path:
+            yield "directory", LEGACY_CATALOG, table, path
+
+
+def plan(spark):
+    # Their files were copied by the run that dropped them.
+    migrations = pending_tables(spark)
+    copies = []
+    seen = {migration["path"] for migration in migrations}
+    for migration in migrations:
+        print(f"{CATALOG}.{migration['table']}: pending registration", flush=True)
+    for source, catalog, table, path in legacy_tables(spark, seen):
+        if LEGACY_PATH not in path:
+            print(f"skip {catalog}.{table}: {path} is outside {LEGACY_PATH}")
+            continue
+        source_prefix = path[: path.index(LEGACY_PATH) + len(LEGACY_PATH)]
+        # Rewritten metadata is staged next to the plan, off the PVC.
+        result = spark.sql(f'''
+CALL {catalog}.system.rewrite_table_path(
+    table => '{table}',
+    source_prefix => '{source_prefix}',
+    target_prefix => '{TARGET_PREFIX}',
+    staging_location => 'file://{WORK}/staging/{table}/'
+)
+''').collect()[0]
+        file_list = urllib.parse.urlparse(result.file_list_location).path
+        with open(file_list, encoding="utf-8") as handle:
+            pairs = [line.strip().split(",", 1) for line in handle if line.strip()]
+        latest = f"/{result.latest_version}"
+        metadata_file = next(target for _, target in pairs if target.endswith(latest))
+        copies.extend(
+            (urllib.parse.urlparse(source_file).path, target.removeprefix("s3://"))
+            for source_file, target in pairs
+        )
+        migrations.append(
+            {
+                "source": source,
+                "table": table,
+                "path": urllib.parse.urlparse(path).path.rstrip("/"),
+                "metadata_file": metadata_file,
+            }
+        )
+        print(f"{catalog}.{table}: {len(pairs)} files to {metadata_file}", flush=True)
+
+    with open(COPIES, "w", encoding="utf-8") as handle:
+        handle.writelines(f"{source}\\t{target}\\n" for source, target in copies)
+    with open(PLAN, "w", encoding="utf-8") as handle:
+        json.dump(migrations, handle, indent=2)
+    print(f"{len(migrations)} tables, {len(copies)} files to copy", flush=True)
+
+
+def register(spark):
+    with open(PLAN, encoding="utf-8") as handle:
+        migrations = json.load(handle)
+    if not migrations:
+        print("0 tables registered", flush=True)
+        return
+    # Recorded before the first DROP, removed after the last register.
+    with open(PENDING, "w", encoding="utf-8") as handle:
+        json.dump(migrations, handle, indent=2)
+    for migration in migrations:
+        table = migration["table"]
+        # Dropping without PURGE only removes the catalog row; the PVC copy
+        # stays until the legacy PVC is deleted.
+        if migration["source"] == "catalog":
+            spark.sql(f"DROP TABLE IF EXISTS {CATALOG}.{table}")
+        elif spark.catalog.tableExists(f"{CATALOG}.{table}"):
+            print(f"skip {CATALOG}.{table}: already registered", flush=True)
+            continue
+        else:
+            namespace = table.rsplit(".", 1)[0]
+            spark.sql(f"CREATE NAMESPACE IF NOT EXISTS {CATALOG}.{namespace}")
+        spark.sql(f'''
+CALL {CATALOG}.system.register_table(
+    table => '{table}',
+    metadata_file => '{migration["metadata_file"]}'
+)
+''')
+        print(f"{CATALOG}.{table} -> {migration['metadata_file']}", flush=True)
+    os.remove(PENDING)
+    print(f"{len(migrations)} tables registered", flush=True)
+
+
+def main(step):
+    spark = SparkSession.builder.appName(f"warehouse-migration-{step}").getOrCreate()
+    try:
+        {"plan": plan, "register": register}[step](spark)
+    finally:
+        spark.stop()
+    return 0
+
+
+sys.exit(main(sys.argv[1]))
+""".lstrip(),
+        },
+        opts=pulumi.ResourceOptions(depends_on=[spark_namespace]),
+    )
+
+    spark_submit = [
+        "/opt/spark/bin/spark-submit",
+        "--master",
+        "local[2]",
+        # The shared catalog reads file:// tables here, not just s3://.
+        "--conf",
+        (
+            f"spark.sql.catalog.{iceberg_catalog_name}.io-impl="
+            "org.apache.iceberg.io.ResolvingFileIO"
+        ),
+        "--conf",
+        "spark.sql.catalog.legacy=org.apache.iceberg.spark.SparkCatalog",
+        "--conf",
+        "spark.sql.catalog.legacy.type=hadoop",
+        "--conf",
+        f"spark.sql.catalog.legacy.warehouse={LEGACY_LOCAL_ICEBERG_WAREHOUSE_URI}",
+        "/opt/migration/migrate_warehouse.py",
+    ]
+    migration_env = [
+        k8s.core.v1.EnvVarArgs(name="ICEBERG_CATALOG", value=iceberg_catalog_name),
+        k8s.core.v1.EnvVarArgs(
+            name="LEGACY_WAREHOUSE_PATH", value=ICEBERG_WAREHOUSE_MOUNT_PATH
+        ),
+        k8s.core.v1.EnvVarArgs(
+            name="MIGRATED_WAREHOUSE_PREFIX",
+            value=pulumi.Output.format(
+                "{0}/{1}", iceberg_warehouse, MIGRATED_WAREHOUSE_DIRECTORY
+            ),
+        ),
+        *iceberg_secret_env,
+    ]
+    migration_mounts = [
+        k8s.core.v1.VolumeMountArgs(
+            name="spark-warehouse", mount_path=ICEBERG_WAREHOUSE_MOUNT_PATH
+        ),
+        k8s.core.v1.VolumeMountArgs(name="work", mount_path="/work"),
+    ]
+    spark_migration_mounts = [
+        *migration_mounts,
+        k8s.core.v1.VolumeMountArgs(name="migration", mount_path="/opt/migration"),
+        k8s.core.v1.VolumeMountArgs(
+            name="spark-defaults",
+            mount_path="/opt/spark/conf/spark-defaults.conf",
+            sub_path="spark-defaults.conf",
+            read_only=True,
+        ),
+    ]
+    spark_migration_security_context = k8s.core.v1.SecurityContextArgs(
+        allow_privilege_escalation=False,
+        capabilities=k8s.core.v1.CapabilitiesArgs(drop=["ALL"]),
+        run_as_group=185,
+        run_as_non_root=True,
+        run_as_user=185,
+        seccomp_profile=k8s.core.v1.SeccompProfileArgs(type="RuntimeDefault"),
+    )
+    spark_migration_resources = k8s.core.v1.ResourceRequirementsArgs(
+        requests={"cpu": "500m", "memory": "1536Mi"},
+        limits={"cpu": "2", "memory": "2Gi"},
+    )
+
+    # plan rewrites each legacy table's metadata for the S3 prefix, copy moves
+    # the files to RustFS, and register points the shared catalog at them.
+    # Every step is a no-op once no table reads from file:// any more.
+    k8s.batch.v1.Job(
+        "spark-warehouse-migration",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="spark-warehouse-migration",
+            namespace=spark_namespace.metadata.name,
+            labels={
+                "app": connect_name,
+            },
+            annotations={
+                "pulumi.com/waitFor": "jsonpath={.status.succeeded}=1",
+            },
+        ),
+        spec=k8s.batch.v1.JobSpecArgs(
+            backoff_limit=2,
+            ttl_seconds_after_finished=86400,
+            template=k8s.core.v1.PodTemplateSpecArgs(
+                metadata=k8s.meta.v1.ObjectMetaArgs(
+                    annotations={
+                        "spark.k8s.kevin/task-id": pulumi.Output.all(
+                            migration_files.data, iceberg_warehouse
+                        ).apply(stable_task_id),
+                    },
+                ),
+                spec=k8s.core.v1.PodSpecArgs(
+                    restart_policy="Never",
+                    init_containers=[
+                        k8s.core.v1.ContainerArgs(
+                            name="plan",
+                            image=spark_image,
+                            image_pull_policy="IfNotPresent",
+                            command=[*spark_submit, "plan"],
+                            env=migration_env,
+                            volume_mounts=spark_migration_mounts,
+                            resources=spark_migration_resources,
+                            security_context=spark_migration_security_context,
+                        ),
+                        k8s.core.v1.ContainerArgs(
+                            name="copy",
+                            image="quay.io/minio/mc:latest",
+                            command=["sh", "-ceu"],
+                            args=[
+                                """
+mc alias set rustfs "$S3_ENDPOINT_URL" "$AWS_ACCESS_KEY_ID" "$AWS_SECRET_ACCESS_KEY"
+tab="$(printf '\\t')"
+while IFS="$tab" read -r source target; do
+  mc cp --quiet "$source" "rustfs/$target"
+done < /work/copies.tsv
+echo "copied $(wc -l < /work/copies.tsv) files"
+""".strip(),
+                            ],
+                            env=[
+                                k8s.core.v1.EnvVarArgs(
+                                    name="S3_ENDPOINT_URL",
+                                    value=rustfs_s3_endpoint_url,
+                                ),
+                                *iceberg_secret_env,
+                            ],
+                            volume_mounts=migration_mounts,
+                        ),
+                    ],
+                    containers=[
+                        k8s.core.v1.ContainerArgs(
+                            name="register",
+                            image=spark_image,
+                            image_pull_policy="IfNotPresent",
+                            command=[*spark_submit, "register"],
+                            env=migration_env,
+                            volume_mounts=spark_migration_mounts,
+                            resources=spark_migration_resources,
+                            security_context=spark_migration_security_context,
+                        )
+                    ],
+                    volumes=[
+                        k8s.core.v1.VolumeArgs(
+                            name="spark-warehouse",
+                            persistent_volume_claim=k8s.core.v1.PersistentVolumeClaimVolumeSourceArgs(
+                                claim_name=spark_warehouse.metadata.name,
+                            ),
+                        ),
+                        k8s.core.v1.VolumeArgs(
+                            name="work",
+                            empty_dir=k8s.core.v1.EmptyDirVolumeSourceArgs(),
+                        ),
+                        k8s.core.v1.VolumeArgs(
+                            name="migration",
+                            config_map=k8s.core.v1.ConfigMapVolumeSourceArgs(
+                                name=migration_files.metadata.name,
+                            ),
+                        ),
+                        k8s.core.v1.VolumeArgs(
+                            name="spark-defaults",
+                            secret=k8s.core.v1.SecretVolumeSourceArgs(
+                                secret_name=spark_iceberg_credentials.metadata.name,
+                                items=[
+                                    k8s.core.v1.KeyToPathArgs(
+                                        key="spark-defaults.conf",
+                                        path="spark-defaults.conf",
+                                    )
+                                ],
+                            ),
+                        ),
+                    ],
+                ),
+            ),
+        ),
+        # After the Connect server has let go of the ReadWriteOnce PVC.
+        opts=pulumi.ResourceOptions(
+            depends_on=[spark_connect, migration_files, spark_warehouse],
+            delete_before_replace=True,
+            custom_timeouts=pulumi.CustomTimeouts(create="60m"),
+        ),
+    )
+
 spark_connect_endpoint_service = k8s.core.v1.Service(
     "spark-connect-endpoint-service",
     metadata=k8s.meta.v1.ObjectMetaArgs(
@@ -523,3 +870,8 @@ pulumi.export("iceberg_warehouse", iceberg_warehouse)
 pulumi.export("iceberg_s3_endpoint", rustfs_s3_endpoint_url)
 pulumi.export("iceberg_credentials_secret", spark_iceberg_credentials.metadata.name)
 pulumi.export("legacy_local_iceberg_warehouse", LEGACY_LOCAL_ICEBERG_WAREHOUSE_URI)
+pulumi.export(
+    "migrated_iceberg_warehouse",
+    pulumi.Output.format("{0}/{1}", iceberg_warehouse, MIGRATED_WAREHOUSE_DIRECTORY),
+)
+pulumi.export("executor_instances", executor_instances)
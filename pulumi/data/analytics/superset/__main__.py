@@ -1,9 +1,12 @@
 import pulumi_kubernetes as k8s
 import pulumi_random as random
+from infra_helpers.helm import cached_chart
 from infra_helpers.postgres import PostgresStack, create_database_owner
+from infra_helpers.stacks import TrinoStack
 
 import pulumi
 
+CHART_VERSION = "0.15.5"
 APP_NAME = "superset"
 POSTGRES_PASSWORD_SECRET_NAME = "superset-postgres"
 
@@ -16,14 +19,10 @@ database_user = config.get("databaseUser") or APP_NAME
 storage_class_name = config.get("storageClassName") or "local-path"
 redis_storage_size = config.get("redisStorageSize") or "2Gi"
 
-trino_stack = pulumi.StackReference(trino_stack_ref)
+trino_stack = TrinoStack(trino_stack_ref)
 postgres = PostgresStack(postgres_stack_ref)
 
-trino_host = pulumi.Output.format(
-    "{0}.{1}.svc.cluster.local",
-    trino_stack.require_output("service_name"),
-    trino_stack.require_output("namespace"),
-)
+trino_host = trino_stack.service_host
 trino_sqlalchemy_uri = pulumi.Output.format(
     "trino://superset@{0}:8080/tpch/tiny",
     trino_host,
@@ -85,7 +84,7 @@ def trino_catalog_datasource_specs(catalogs: object) -> str:
     return "\n".join(specs)
 
 
-trino_catalogs = trino_stack.require_output("catalogs")
+trino_catalogs = trino_stack.catalogs
 trino_datasource_specs = trino_catalogs.apply(trino_catalog_datasource_specs)
 trino_datasource_names = trino_catalogs.apply(
     lambda catalogs: (
@@ -98,7 +97,7 @@ trino_datasource_names = trino_catalogs.apply(
         else []
     )
 )
-postgres_service_host = postgres.rw_service_fqdn
+postgres_service_host = postgres.service_fqdn(config.get("postgresPoolMode"))
 database_password = random.RandomPassword(
     "superset-database-password",
     length=32,
@@ -195,11 +194,8 @@ done
 superset_chart = k8s.helm.v3.Release(
     "chart",
     namespace=superset_namespace.metadata.name,
-    chart="superset",
-    repository_opts=k8s.helm.v3.RepositoryOptsArgs(
-        repo="https://apache.github.io/superset"
-    ),
-    version="0.15.5",
+    chart=cached_chart("superset", CHART_VERSION, "https://apache.github.io/superset"),
+    version=CHART_VERSION,
     cleanup_on_fail=True,
     force_update=True,
     timeout=900,
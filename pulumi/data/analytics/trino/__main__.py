@@ -1,10 +1,16 @@
+import json
+import urllib.parse
+from collections.abc import Iterable
 from pathlib import Path
 
 import pulumi_kubernetes as k8s
 import pulumi_postgresql as pg
 import pulumi_random as random
 from infra_helpers.grafana import dashboard_config_maps
+from infra_helpers.helm import cached_chart
+from infra_helpers.k8s import secret_env_var, stable_task_id
 from infra_helpers.postgres import PostgresStack, create_database_owner
+from infra_helpers.stacks import ClickHouseStack, RustfsStack
 
 import pulumi
 
@@ -14,21 +20,317 @@ AWS_DEFAULT_REGION = "us-east-1"
 POSTGRES_READER_USER = "trino_reader"
 TRINO_CREDENTIALS_SECRET_NAME = "trino-catalog-credentials"
 ICEBERG_WAREHOUSE_PREFIX = "warehouse"
+FS_CACHE_DIRECTORY = "/var/cache/trino/fs"
+SPILL_DIRECTORY = "/var/lib/trino/spill"
 POSTGRES_SCHEMA = "public"
+# Named groups match on source or user regexes, in order. Everything else lands
+# in adhoc, which gives each user a subgroup of their own.
+RESOURCE_GROUP_DEFAULTS = {
+    "enabled": False,
+    "maxRunning": 8,
+    "maxQueued": 200,
+    "groups": {
+        "superset": {
+            "source": "(?i).*superset.*",
+            "memoryShare": "40%",
+            "maxRunning": 4,
+            "maxQueued": 100,
+            "weight": 4,
+        },
+        # The Marimo stack connects as trino://marimo@... without a source.
+        "marimo": {
+            "user": "marimo",
+            "memoryShare": "30%",
+            "maxRunning": 2,
+            "maxQueued": 20,
+            "weight": 2,
+        },
+    },
+    "adhoc": {
+        "memoryShare": "30%",
+        "maxRunning": 2,
+        "maxQueued": 50,
+        "weight": 1,
+        "perUserMemoryShare": "50%",
+        "perUserMaxRunning": 1,
+        "perUserMaxQueued": 5,
+    },
+}
+RESOURCE_GROUP_KEYS = (
+    "source",
+    "user",
+    "memoryShare",
+    "maxRunning",
+    "maxQueued",
+    "weight",
+)
+RESOURCE_GROUP_REQUIRED_KEYS = ("memoryShare", "maxRunning", "maxQueued")
+WORKER_AUTOSCALING_DEFAULTS = {
+    "enabled": False,
+    "minReplicas": 1,
+    "maxReplicas": 4,
+    "targetQueriesPerWorker": 4,
+    "targetQueuedQueriesPerWorker": 2,
+    "scaleDownStabilizationSeconds": 600,
+    "shutdownGracePeriodSeconds": 300,
+}
+BENCHMARK_DEFAULTS = {
+    "enabled": False,
+    "schedule": "0 4 * * *",
+    "scaleFactor": "sf1",
+    "queries": None,
+    "repetitions": 3,
+    "timeoutSeconds": 3600,
+    "clickhouseDatabase": "benchmarks",
+    "clickhouseTable": "trino_query_runs",
+}
+# The tpch connector uses simplified column names (orderkey, not l_orderkey);
+# tpcds keeps the specification's names. Queries run unqualified against the
+# <suite>.<scaleFactor> schema.
+BENCHMARK_QUERIES = {
+    "tpch/q01": """
+SELECT returnflag, linestatus, sum(quantity) AS sum_qty,
+       sum(extendedprice) AS sum_base_price,
+       sum(extendedprice * (1 - discount)) AS sum_disc_price,
+       sum(extendedprice * (1 - discount) * (1 + tax)) AS sum_charge,
+       avg(quantity) AS avg_qty, avg(extendedprice) AS avg_price,
+       avg(discount) AS avg_disc, count(*) AS count_order
+FROM lineitem
+WHERE shipdate <= DATE '1998-12-01' - INTERVAL '90' DAY
+GROUP BY returnflag, linestatus
+ORDER BY returnflag, linestatus
+""",
+    "tpch/q03": """
+SELECT l.orderkey, sum(l.extendedprice * (1 - l.discount)) AS revenue,
+       o.orderdate, o.shippriority
+FROM customer c
+JOIN orders o ON c.custkey = o.custkey
+JOIN lineitem l ON l.orderkey = o.orderkey
+WHERE c.mktsegment = 'BUILDING'
+  AND o.orderdate < DATE '1995-03-15'
+  AND l.shipdate > DATE '1995-03-15'
+GROUP BY l.orderkey, o.orderdate, o.shippriority
+ORDER BY revenue DESC, o.orderdate
+LIMIT 10
+""",
+    "tpch/q05": """
+SELECT n.name, sum(l.extendedprice * (1 - l.discount)) AS revenue
+FROM customer c
+JOIN orders o ON c.custkey = o.custkey
+JOIN lineitem l ON l.orderkey = o.orderkey
+JOIN supplier s ON l.suppkey = s.suppkey AND c.nationkey = s.nationkey
+JOIN nation n ON s.nationkey = n.nationkey
+JOIN region r ON n.regionkey = r.regionkey
+WHERE r.name = 'ASIA'
+  AND o.orderdate >= DATE '1994-01-01'
+  AND o.orderdate < DATE '1995-01-01'
+GROUP BY n.name
+ORDER BY revenue DESC
+""",
+    "tpch/q06": """
+SELECT sum(extendedprice * discount) AS revenue
+FROM lineitem
+WHERE shipdate >= DATE '1994-01-01'
+  AND shipdate < DATE '1995-01-01'
+  AND discount BETWEEN 0.05 AND 0.07
+  AND quantity < 24
+""",
+    "tpch/q10": """
+SELECT c.custkey, c.name, sum(l.extendedprice * (1 - l.discount)) AS revenue,
+       c.acctbal, n.name AS nation, c.address, c.phone, c.comment
+FROM customer c
+JOIN orders o ON c.custkey = o.custkey
+JOIN lineitem l ON l.orderkey = o.orderkey
+JOIN nation n ON c.nationkey = n.nationkey
+WHERE o.orderdate >= DATE '1993-10-01'
+  AND o.orderdate < DATE '1994-01-01'
+  AND l.returnflag = 'R'
+GROUP BY c.custkey, c.name, c.acctbal, c.phone, n.name, c.address, c.comment
+ORDER BY revenue DESC
+LIMIT 20
+""",
+    "tpch/q12": """
+SELECT l.shipmode,
+       sum(CASE WHEN o.orderpriority IN ('1-URGENT', '2-HIGH') THEN 1 ELSE 0 END)
+           AS high_line_count,
+       sum(CASE WHEN o.orderpriority NOT IN ('1-URGENT', '2-HIGH') THEN 1 ELSE 0 END)
+           AS low_line_count
+FROM orders o
+JOIN lineitem l ON o.orderkey = l.orderkey
+WHERE l.shipmode IN ('MAIL', 'SHIP')
+  AND l.commitdate < l.receiptdate
+  AND l.shipdate < l.commitdate
+  AND l.receiptdate >= DATE '1994-01-01'
+  AND l.receiptdate < DATE '1995-01-01'
+GROUP BY l.shipmode
+ORDER BY l.shipmode
+""",
+    "tpch/q14": """
+SELECT 100.00 * sum(CASE WHEN p.type LIKE 'PROMO%'
+                         THEN l.extendedprice * (1 - l.discount) ELSE 0 END)
+       / sum(l.extendedprice * (1 - l.discount)) AS promo_revenue
+FROM lineitem l
+JOIN part p ON l.partkey = p.partkey
+WHERE l.shipdate >= DATE '1995-09-01'
+  AND l.shipdate < DATE '1995-10-01'
+""",
+    "tpch/q18": """
+SELECT c.name, c.custkey, o.orderkey, o.orderdate, o.totalprice,
+       sum(l.quantity) AS quantity
+FROM customer c
+JOIN orders o ON c.custkey = o.custkey
+JOIN lineitem l ON o.orderkey = l.orderkey
+WHERE o.orderkey IN (
+    SELECT orderkey FROM lineitem GROUP BY orderkey HAVING sum(quantity) > 300
+)
+GROUP BY c.name, c.custkey, o.orderkey, o.orderdate, o.totalprice
+ORDER BY o.totalprice DESC, o.orderdate
+LIMIT 100
+""",
+    "tpcds/q03": """
+SELECT dt.d_year, item.i_brand_id AS brand_id, item.i_brand AS brand,
+       sum(ss_ext_sales_price) AS sum_agg
+FROM date_dim dt
+JOIN store_sales ON dt.d_date_sk = store_sales.ss_sold_date_sk
+JOIN item ON store_sales.ss_item_sk = item.i_item_sk
+WHERE item.i_manufact_id = 128 AND dt.d_moy = 11
+GROUP BY dt.d_year, item.i_brand, item.i_brand_id
+ORDER BY dt.d_year, sum_agg DESC, brand_id
+LIMIT 100
+""",
+    "tpcds/q07": """
+SELECT i_item_id, avg(ss_quantity) AS agg1, avg(ss_list_price) AS agg2,
+       avg(ss_coupon_amt) AS agg3, avg(ss_sales_price) AS agg4
+FROM store_sales
+JOIN customer_demographics ON ss_cdemo_sk = cd_demo_sk
+JOIN date_dim ON ss_sold_date_sk = d_date_sk
+JOIN item ON ss_item_sk = i_item_sk
+JOIN promotion ON ss_promo_sk = p_promo_sk
+WHERE cd_gender = 'M'
+  AND cd_marital_status = 'S'
+  AND cd_education_status = 'College'
+  AND (p_channel_email = 'N' OR p_channel_event = 'N')
+  AND d_year = 2000
+GROUP BY i_item_id
+ORDER BY i_item_id
+LIMIT 100
+""",
+    "tpcds/q42": """
+SELECT dt.d_year, item.i_category_id, item.i_category,
+       sum(ss_ext_sales_price) AS sales
+FROM date_dim dt
+JOIN store_sales ON dt.d_date_sk = store_sales.ss_sold_date_sk
+JOIN item ON store_sales.ss_item_sk = item.i_item_sk
+WHERE item.i_manager_id = 1 AND dt.d_moy = 11 AND dt.d_year = 2000
+GROUP BY dt.d_year, item.i_category_id, item.i_category
+ORDER BY sales DESC, dt.d_year, item.i_category_id, item.i_category
+LIMIT 100
+""",
+    "tpcds/q52": """
+SELECT dt.d_year, item.i_brand_id AS brand_id, item.i_brand AS brand,
+       sum(ss_ext_sales_price) AS ext_price
+FROM date_dim dt
+JOIN store_sales ON dt.d_date_sk = store_sales.ss_sold_date_sk
+JOIN item ON store_sales.ss_item_sk = item.i_item_sk
+WHERE item.i_manager_id = 1 AND dt.d_moy = 11 AND dt.d_year = 2000
+GROUP BY dt.d_year, item.i_brand, item.i_brand_id
+ORDER BY dt.d_year, ext_price DESC, brand_id
+LIMIT 100
+""",
+    "tpcds/q55": """
+SELECT i_brand_id AS brand_id, i_brand AS brand,
+       sum(ss_ext_sales_price) AS ext_price
+FROM date_dim
+JOIN store_sales ON d_date_sk = ss_sold_date_sk
+JOIN item ON ss_item_sk = i_item_sk
+WHERE i_manager_id = 28 AND d_moy = 11 AND d_year = 1999
+GROUP BY i_brand, i_brand_id
+ORDER BY ext_price DESC, i_brand_id
+LIMIT 100
+""",
+    "tpcds/q96": """
+SELECT count(*)
+FROM store_sales
+JOIN household_demographics ON ss_hdemo_sk = hd_demo_sk
+JOIN time_dim ON ss_sold_time_sk = t_time_sk
+JOIN store ON ss_store_sk = s_store_sk
+WHERE t_hour = 20 AND t_minute >= 30 AND hd_dep_count = 7
+  AND s_store_name = 'ese'
+""",
+}
+# compression is what ClickHouse applies to HTTP responses; the JDBC driver
+# decompresses them. pushdown entries are Trino JDBC connector properties.
+CLICKHOUSE_CATALOG_DEFAULTS = {
+    "database": "default",
+    "compression": "lz4",
+    "maxOpenConnections": 16,
+    "pushdown": {
+        "aggregation-pushdown.enabled": True,
+        "topn-pushdown.enabled": True,
+        "complex-expression-pushdown.enabled": True,
+        "domain-compaction-threshold": 256,
+    },
+}
+CLICKHOUSE_COMPRESSIONS = ("none", "lz4", "zstd")
+TRANSPORT_BENCHMARK_DEFAULTS = {
+    "enabled": False,
+    "compressions": list(CLICKHOUSE_COMPRESSIONS),
+    "rows": 5_000_000,
+    "repetitions": 3,
+    "clickhouseDatabase": "benchmarks",
+    "syntheticTable": "trino_transport_synthetic",
+    "clickhouseTable": "trino_transport_runs",
+}
 TRINO_SELECTOR = {
     "app.kubernetes.io/component": "coordinator",
     "app.kubernetes.io/instance": "trino",
     "app.kubernetes.io/name": "trino",
 }
 
+
+def check_keys(setting: str, values: dict[str, object], allowed: Iterable[str]) -> None:
+    unknown = sorted(set(values) - set(allowed))
+    if unknown:
+        raise ValueError(f"trino:{setting} has unknown keys: {', '.join(unknown)}")
+
+
 config = pulumi.Config()
 
 namespace_name = config.get("namespace", "trino")
 hostname = config.get("hostname", "trino")
 postgres_stack_ref = config.get("postgresStack", "kzh/postgresql/mx")
 clickhouse_stack_ref = config.get("clickhouseStack", "kzh/clickhouse/mx")
+clickhouse_user = config.get("clickhouseUser", "trino")
+clickhouse_catalog_settings = {
+    **CLICKHOUSE_CATALOG_DEFAULTS,
+    **(config.get_object("clickhouseCatalog") or {}),
+}
+clickhouse_catalog_settings["pushdown"] = {
+    **CLICKHOUSE_CATALOG_DEFAULTS["pushdown"],
+    **clickhouse_catalog_settings["pushdown"],
+}
+transport_benchmark = {
+    **TRANSPORT_BENCHMARK_DEFAULTS,
+    **(config.get_object("transportBenchmark") or {}),
+}
+for compression in [
+    clickhouse_catalog_settings["compression"],
+    *(transport_benchmark["compressions"] if transport_benchmark["enabled"] else []),
+]:
+    if compression not in CLICKHOUSE_COMPRESSIONS:
+        raise ValueError(
+            f"trino: unknown ClickHouse compression {compression}, "
+            f"expected one of {', '.join(CLICKHOUSE_COMPRESSIONS)}"
+        )
 rustfs_stack_ref = config.get("rustfsStack", "kzh/rustfs/mx")
 monitoring_release_label = config.get("monitoringReleaseLabel", "kube-prometheus-stack")
+workers = config.get_int("workers") or 1
+worker_autoscaling = {
+    **WORKER_AUTOSCALING_DEFAULTS,
+    **(config.get_object("workerAutoscaling") or {}),
+}
+check_keys("workerAutoscaling", worker_autoscaling, WORKER_AUTOSCALING_DEFAULTS)
+worker_shutdown_grace_period = int(worker_autoscaling["shutdownGracePeriodSeconds"])
 postgres_databases = config.get_object(
     "postgresDatabases",
     [
@@ -45,14 +347,71 @@ postgres_databases = config.get_object(
         "temporal_visibility",
     ],
 )
+# Point the read-only pg_* catalogs at the CNPG replicas behind the ro service.
+postgres_read_replicas = config.get_bool("postgresReadReplicas") or False
 iceberg_database_name = config.get("icebergDatabaseName", "trino_iceberg")
 iceberg_database_user = config.get("icebergDatabaseUser", "trino_iceberg")
 iceberg_catalog_name = config.get("icebergCatalogName", "trino_iceberg")
 iceberg_bucket = config.get("icebergBucket", "trino-iceberg")
 iceberg_warehouse = f"s3://{iceberg_bucket}/{ICEBERG_WAREHOUSE_PREFIX}"
+# Keep Iceberg objects read from RustFS on a node-local volume. Pages past
+# fsCacheTtl or beyond fsCacheMaxSizeGb are evicted least recently used first.
+fs_cache_enabled = config.get_bool("fsCacheEnabled") or False
+fs_cache_volume_size_gb = config.get_int("fsCacheVolumeSizeGb") or 20
+fs_cache_max_size_gb = config.get_int("fsCacheMaxSizeGb") or (
+    fs_cache_volume_size_gb * 9 // 10
+)
+fs_cache_ttl = config.get("fsCacheTtl", "7d")
+fs_cache_page_size = config.get("fsCachePageSize", "1MB")
+fs_cache_storage_class = config.get("fsCacheStorageClass", "local-path")
+if fs_cache_max_size_gb > fs_cache_volume_size_gb:
+    raise ValueError("trino:fsCacheMaxSizeGb must fit in trino:fsCacheVolumeSizeGb")
+benchmark = {**BENCHMARK_DEFAULTS, **(config.get_object("benchmark") or {})}
+benchmark_queries = benchmark["queries"] or list(BENCHMARK_QUERIES)
+unknown_benchmark_queries = sorted(set(benchmark_queries) - set(BENCHMARK_QUERIES))
+if unknown_benchmark_queries:
+    raise ValueError(
+        "trino:benchmark queries are not defined: "
+        + ", ".join(unknown_benchmark_queries)
+    )
+# Let joins, aggregations and sorts spill to a worker-local scratch volume
+# instead of failing once they outgrow maxMemoryPerNode.
+spill_enabled = config.get_bool("spillEnabled") or False
+spill_volume_size_gb = config.get_int("spillVolumeSizeGb") or 20
+spill_max_per_node_gb = config.get_int("spillMaxPerNodeGb") or (
+    spill_volume_size_gb * 9 // 10
+)
+spill_query_max_per_node_gb = config.get_int("spillQueryMaxPerNodeGb") or (
+    spill_max_per_node_gb // 2
+)
+spill_storage_class = config.get("spillStorageClass", "local-path")
+if spill_max_per_node_gb > spill_volume_size_gb:
+    raise ValueError("trino:spillMaxPerNodeGb must fit in trino:spillVolumeSizeGb")
+resource_groups = {
+    **RESOURCE_GROUP_DEFAULTS,
+    **(config.get_object("resourceGroups") or {}),
+}
+# groups replaces the default set, so each group must be complete; adhoc only
+# overrides the keys it names.
+resource_groups["adhoc"] = {
+    **RESOURCE_GROUP_DEFAULTS["adhoc"],
+    **resource_groups["adhoc"],
+}
+check_keys("resourceGroups", resource_groups, RESOURCE_GROUP_DEFAULTS)
+check_keys(
+    "resourceGroups.adhoc", resource_groups["adhoc"], RESOURCE_GROUP_DEFAULTS["adhoc"]
+)
+for name, group in resource_groups["groups"].items():
+    check_keys(f"resourceGroups.groups.{name}", group, RESOURCE_GROUP_KEYS)
+    missing = [key for key in RESOURCE_GROUP_REQUIRED_KEYS if key not in group]
+    if missing:
+        raise ValueError(
+            f"trino:resourceGroups group {name} needs {', '.join(missing)}"
+        )
 dashboards_dir = Path(__file__).resolve().parent / "dashboards"
 dashboard_files = [
     "trino-overview.json",
+    "trino-benchmarks.json",
 ]
 
 labels = {
@@ -62,14 +421,16 @@ labels = {
 
 
 postgres_stack = PostgresStack(postgres_stack_ref)
-clickhouse_stack = pulumi.StackReference(clickhouse_stack_ref)
-rustfs_stack = pulumi.StackReference(rustfs_stack_ref)
-
-postgres_service_host = postgres_stack.rw_service_fqdn
-rustfs_s3_endpoint_url = pulumi.Output.format(
-    "http://{0}.{1}.svc.cluster.local:9000",
-    rustfs_stack.require_output("s3_hostname"),
-    rustfs_stack.require_output("namespace"),
+clickhouse_stack = ClickHouseStack(clickhouse_stack_ref)
+rustfs_stack = RustfsStack(rustfs_stack_ref)
+
+postgres_service_host = postgres_stack.service_fqdn(config.get("postgresPoolMode"))
+rustfs_s3_endpoint_url = rustfs_stack.s3_endpoint_url
+clickhouse_http_url = pulumi.Output.concat(
+    "http://",
+    clickhouse_stack.service_fqdn,
+    ":",
+    clickhouse_stack.http_port.apply(str),
 )
 
 namespace = k8s.core.v1.Namespace(
@@ -185,16 +546,12 @@ catalog_credentials = k8s.core.v1.Secret(
     string_data={
         "TRINO_POSTGRES_USER": postgres_reader_role.name,
         "TRINO_POSTGRES_PASSWORD": postgres_reader_password.result,
-        "TRINO_CLICKHOUSE_USER": clickhouse_stack.require_output(
-            "clickhouseAdminUsername"
-        ),
-        "TRINO_CLICKHOUSE_PASSWORD": clickhouse_stack.require_output(
-            "clickhouseAdminPassword"
-        ),
+        "TRINO_CLICKHOUSE_USER": clickhouse_stack.username(clickhouse_user),
+        "TRINO_CLICKHOUSE_PASSWORD": clickhouse_stack.password(clickhouse_user),
         "TRINO_ICEBERG_JDBC_USER": iceberg_role.name,
         "TRINO_ICEBERG_JDBC_PASSWORD": iceberg_database_password.result,
-        "TRINO_S3_ACCESS_KEY": rustfs_stack.require_output("access_key"),
-        "TRINO_S3_SECRET_KEY": rustfs_stack.require_output("secret_key"),
+        "TRINO_S3_ACCESS_KEY": rustfs_stack.access_key,
+        "TRINO_S3_SECRET_KEY": rustfs_stack.secret_key,
     },
     opts=pulumi.ResourceOptions(
         depends_on=[
@@ -362,11 +719,16 @@ mc mb --ignore-existing "rustfs/$S3_BUCKET"
 )
 
 
-def postgres_catalog(database_name: str) -> pulumi.Output[str]:
+def postgres_catalog(
+    database_name: str, *, read_only: bool = False
+) -> pulumi.Output[str]:
+    host = postgres_service_host
+    if read_only and postgres_read_replicas:
+        host = postgres_stack.replica_service_fqdn
     return pulumi.Output.concat(
         "connector.name=postgresql\n",
         "connection-url=jdbc:postgresql://",
-        postgres_service_host,
+        host,
         ":5432/",
         database_name,
         "\n",
@@ -375,6 +737,34 @@ def postgres_catalog(database_name: str) -> pulumi.Output[str]:
     )
 
 
+def clickhouse_catalog(compression: str) -> pulumi.Output[str]:
+    """ClickHouse connector over HTTP, with `compression` on server responses."""
+    options = {
+        "compress": int(compression != "none"),
+        **(
+            {"compress_algorithm": compression.upper()} if compression != "none" else {}
+        ),
+        "max_open_connections": int(clickhouse_catalog_settings["maxOpenConnections"]),
+    }
+    pushdown = "".join(
+        f"{key}={str(value).lower() if isinstance(value, bool) else value}\n"
+        for key, value in clickhouse_catalog_settings["pushdown"].items()
+    )
+    return pulumi.Output.concat(
+        "connector.name=clickhouse\n",
+        "connection-url=jdbc:clickhouse:",
+        clickhouse_http_url,
+        "/",
+        clickhouse_catalog_settings["database"],
+        "?",
+        urllib.parse.urlencode(options),
+        "\n",
+        "connection-user=${ENV:TRINO_CLICKHOUSE_USER}\n",
+        "connection-password=${ENV:TRINO_CLICKHOUSE_PASSWORD}\n",
+        pushdown,
+    )
+
+
 def delete_before_replace_rendered_config(
     args: pulumi.ResourceTransformArgs,
 ) -> pulumi.ResourceTransformResult | None:
@@ -392,16 +782,165 @@ def delete_before_replace_rendered_config(
     return pulumi.ResourceTransformResult(props=args.props, opts=opts)
 
 
+def leave_worker_replicas_to_hpa(
+    args: pulumi.ResourceTransformArgs,
+) -> pulumi.ResourceTransformResult | None:
+    if args.type_ != "kubernetes:apps/v1:Deployment" or not isinstance(
+        args.props, dict
+    ):
+        return None
+    if (args.props.get("metadata") or {}).get("name") != "trino-worker":
+        return None
+
+    spec = {
+        key: value
+        for key, value in (args.props.get("spec") or {}).items()
+        if key != "replicas"
+    }
+    return pulumi.ResourceTransformResult(
+        props={**args.props, "spec": spec}, opts=args.opts
+    )
+
+
+def fs_cache_properties() -> str:
+    if not fs_cache_enabled:
+        return ""
+    return (
+        "fs.cache.enabled=true\n"
+        f"fs.cache.directories={FS_CACHE_DIRECTORY}\n"
+        f"fs.cache.max-sizes={fs_cache_max_size_gb}GB\n"
+        f"fs.cache.ttl={fs_cache_ttl}\n"
+        f"fs.cache.page-size={fs_cache_page_size}\n"
+    )
+
+
+def spill_properties() -> list[str]:
+    if not spill_enabled:
+        return []
+    return [
+        "spill-enabled=true",
+        f"spiller-spill-path={SPILL_DIRECTORY}",
+        f"max-spill-per-node={spill_max_per_node_gb}GB",
+        f"query-max-spill-per-node={spill_query_max_per_node_gb}GB",
+    ]
+
+
+def ephemeral_volume(name: str, size_gb: int, storage_class: str) -> dict[str, object]:
+    """A generic ephemeral volume: a PVC created and deleted with its pod."""
+    return {
+        "name": name,
+        "ephemeral": {
+            "volumeClaimTemplate": {
+                "metadata": {"labels": labels},
+                "spec": {
+                    "accessModes": ["ReadWriteOnce"],
+                    "storageClassName": storage_class,
+                    "resources": {
+                        "requests": {
+                            "storage": f"{size_gb}Gi",
+                        },
+                    },
+                },
+            },
+        },
+    }
+
+
+def node_volumes(component: str) -> dict[str, list[dict[str, object]]]:
+    """Chart values for the node-local cache and spill volumes of `component`."""
+    volumes: list[dict[str, object]] = []
+    mounts: list[dict[str, object]] = []
+    if fs_cache_enabled:
+        volumes.append(
+            ephemeral_volume(
+                "fs-cache", fs_cache_volume_size_gb, fs_cache_storage_class
+            )
+        )
+        mounts.append({"name": "fs-cache", "mountPath": FS_CACHE_DIRECTORY})
+    if spill_enabled:
+        if component == "worker":
+            volumes.append(
+                ephemeral_volume("spill", spill_volume_size_gb, spill_storage_class)
+            )
+        else:
+            # The coordinator runs no tasks, but every node checks the spill path.
+            volumes.append({"name": "spill", "emptyDir": {"sizeLimit": "1Gi"}})
+        mounts.append({"name": "spill", "mountPath": SPILL_DIRECTORY})
+    if not volumes:
+        return {}
+    return {"additionalVolumes": volumes, "additionalVolumeMounts": mounts}
+
+
+def resource_group(
+    name: str, settings: dict[str, object], memory_share: str
+) -> dict[str, object]:
+    return {
+        "name": name,
+        "softMemoryLimit": memory_share,
+        "hardConcurrencyLimit": settings["maxRunning"],
+        "maxQueued": settings["maxQueued"],
+        "schedulingWeight": settings.get("weight", 1),
+    }
+
+
+def render_resource_groups(settings: dict[str, object]) -> str:
+    """Trino file-based resource groups: named groups first, then per-user adhoc."""
+    groups: dict[str, dict[str, object]] = settings["groups"]
+    adhoc: dict[str, object] = settings["adhoc"]
+    if "adhoc" in groups:
+        raise ValueError("trino:resourceGroups groups must not be named adhoc")
+
+    sub_groups = [
+        resource_group(name, group, group["memoryShare"])
+        for name, group in groups.items()
+    ]
+    sub_groups.append(
+        {
+            **resource_group("adhoc", adhoc, adhoc["memoryShare"]),
+            "subGroups": [
+                {
+                    "name": "${USER}",
+                    "softMemoryLimit": adhoc["perUserMemoryShare"],
+                    "hardConcurrencyLimit": adhoc["perUserMaxRunning"],
+                    "maxQueued": adhoc["perUserMaxQueued"],
+                }
+            ],
+        }
+    )
+
+    selectors: list[dict[str, str]] = []
+    for name, group in groups.items():
+        selector = {
+            key: group[key] for key in ("source", "user") if group.get(key) is not None
+        }
+        if not selector:
+            raise ValueError(f"trino:resourceGroups group {name} needs source or user")
+        selectors.append({**selector, "group": f"global.{name}"})
+    selectors.append({"group": "global.adhoc.${USER}"})
+
+    return json.dumps(
+        {
+            "rootGroups": [
+                {
+                    "name": "global",
+                    "softMemoryLimit": "100%",
+                    "hardConcurrencyLimit": settings["maxRunning"],
+                    "maxQueued": settings["maxQueued"],
+                    "schedulingPolicy": "weighted",
+                    "subGroups": sub_groups,
+                }
+            ],
+            "selectors": selectors,
+        },
+        indent=2,
+    )
+
+
 catalogs: dict[str, pulumi.Input[str]] = {
     "tpch": "connector.name=tpch\ntpch.splits-per-node=4\n",
     "tpcds": "connector.name=tpcds\ntpcds.splits-per-node=4\n",
     "memory": "connector.name=memory\nmemory.max-data-per-node=128MB\n",
-    "clickhouse": (
-        "connector.name=clickhouse\n"
-        "connection-url=jdbc:clickhouse:http://clickhouse.clickhouse.svc.cluster.local:8123/default?compress=0\n"
-        "connection-user=${ENV:TRINO_CLICKHOUSE_USER}\n"
-        "connection-password=${ENV:TRINO_CLICKHOUSE_PASSWORD}\n"
-    ),
+    "clickhouse": clickhouse_catalog(clickhouse_catalog_settings["compression"]),
     "iceberg": pulumi.Output.concat(
         "connector.name=iceberg\n",
         "iceberg.catalog.type=jdbc\n",
@@ -429,24 +968,29 @@ catalogs: dict[str, pulumi.Input[str]] = {
         "s3.path-style-access=true\n",
         "s3.aws-access-key=${ENV:TRINO_S3_ACCESS_KEY}\n",
         "s3.aws-secret-key=${ENV:TRINO_S3_SECRET_KEY}\n",
+        fs_cache_properties(),
     ),
 }
 
 for database_name in postgres_databases:
-    catalogs[f"pg_{database_name}"] = postgres_catalog(database_name)
+    catalogs[f"pg_{database_name}"] = postgres_catalog(database_name, read_only=True)
+
+# One catalog per compression under test, otherwise identical to clickhouse.
+if transport_benchmark["enabled"]:
+    for compression in transport_benchmark["compressions"]:
+        catalogs[f"clickhouse_transport_{compression}"] = clickhouse_catalog(
+            compression
+        )
 
 trino_chart = k8s.helm.v4.Chart(
     "trino",
-    chart="trino",
+    chart=cached_chart("trino", CHART_VERSION, "https://trinodb.github.io/charts"),
     namespace=namespace.metadata.name,
     version=CHART_VERSION,
-    repository_opts=k8s.helm.v4.RepositoryOptsArgs(
-        repo="https://trinodb.github.io/charts",
-    ),
     values={
         "fullnameOverride": "trino",
         "server": {
-            "workers": 1,
+            "workers": workers,
             "config": {
                 "query": {
                     "maxMemory": "1GB",
@@ -472,6 +1016,7 @@ trino_chart = k8s.helm.v4.Chart(
                     "memory": "1536Mi",
                 },
             },
+            **node_volumes("coordinator"),
         },
         "worker": {
             "jvm": {
@@ -492,12 +1037,31 @@ trino_chart = k8s.helm.v4.Chart(
                     "memory": "1536Mi",
                 },
             },
+            **node_volumes("worker"),
+            # Scale-down sends workers SHUTTING_DOWN first, so running tasks
+            # finish before the pod exits. The chart requires the pod's
+            # termination grace period to cover the drain twice over.
+            "gracefulShutdown": {
+                "enabled": bool(worker_autoscaling["enabled"]),
+                "gracePeriodSeconds": worker_shutdown_grace_period,
+            },
+            **(
+                {"terminationGracePeriodSeconds": 2 * worker_shutdown_grace_period}
+                if worker_autoscaling["enabled"]
+                else {}
+            ),
         },
         "service": {
             "type": "ClusterIP",
             "port": 8080,
         },
         "catalogs": catalogs,
+        "additionalConfigProperties": spill_properties(),
+        "resourceGroups": (
+            {"resourceGroupsConfig": render_resource_groups(resource_groups)}
+            if resource_groups["enabled"]
+            else {}
+        ),
         "envFrom": [
             {
                 "secretRef": {
@@ -530,6 +1094,11 @@ ssl: false
 lowercaseOutputName: false
 lowercaseOutputLabelNames: false
 rules:
+  - pattern: 'trino\\.filesystem\\.alluxio<type=AlluxioCacheStats, (?:name|catalog)=([^,>]+)><>(CacheReads|ExternalReads)\\.AllTime\\.(Count|Total)'
+    name: trino_filesystem_cache_$2_$3
+    type: COUNTER
+    labels:
+      catalog: "$1"
   - pattern: '.*'
 """.lstrip(),
             },
@@ -561,7 +1130,10 @@ rules:
             iceberg_bucket_job,
             *postgres_reader_grants,
         ],
-        transforms=[delete_before_replace_rendered_config],
+        transforms=[
+            delete_before_replace_rendered_config,
+            *([leave_worker_replicas_to_hpa] if worker_autoscaling["enabled"] else []),
+        ],
     ),
 )
 
@@ -591,6 +1163,708 @@ trino_tailscale_service = k8s.core.v1.Service(
     opts=pulumi.ResourceOptions(depends_on=[trino_chart]),
 )
 
+if benchmark["enabled"]:
+    benchmark_files = k8s.core.v1.ConfigMap(
+        "trino-benchmark",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="trino-benchmark",
+            namespace=namespace.metadata.name,
+            labels=labels,
+        ),
+        data={
+            "queries.json": json.dumps(
+                {name: BENCHMARK_QUERIES[name].strip() for name in benchmark_queries},
+                indent=2,
+            ),
+            "benchmark.py": """
+import json
+import os
+import sys
+import time
+import urllib.parse
+import urllib.request
+import uuid
+from datetime import UTC, datetime
+
+TRINO_URL = os.environ["TRINO_URL"]
+CLICKHOUSE_URL = os.environ["CLICKHOUSE_URL"]
+TABLE = f"{os.environ['CLICKHOUSE_DATABASE']}.{os.environ['CLICKHOUSE_TABLE']}"
+SCALE_FACTOR = os.environ["SCALE_FACTOR"]
+REPETITIONS = int(os.environ["REPETITIONS"])
+
+
+def trino(sql, catalog, schema):
+    headers = {
+        "X-Trino-User": "benchmark",
+        "X-Trino-Source": "trino-benchmark",
+        "X-Trino-Catalog": catalog,
+        "X-Trino-Schema": schema,
+    }
+    request = urllib.request.Request(
+        f"{TRINO_URL}/v1/statement", data=sql.encode(), headers=headers
+    )
+    rows = []
+    while True:
+        with urllib.request.urlopen(request, timeout=300) as response:
+            result = json.load(response)
+        rows.extend(result.get("data") or [])
+        if "nextUri" not in result:
+            return result, rows
+        request = urllib.request.Request(result["nextUri"], headers=headers)
+
+
+def clickhouse(query, body=b""):
+    url = f"{CLICKHOUSE_URL}/?{urllib.parse.urlencode({'query': query})}"
+    request = urllib.request.Request(
+        url,
+        data=body,
+        headers={
+            "X-ClickHouse-User": os.environ["CLICKHOUSE_USER"],
+            "X-ClickHouse-Key": os.environ["CLICKHOUSE_PASSWORD"],
+        },
+    )
+    with urllib.request.urlopen(request, timeout=60) as response:
+        return response.read()
+
+
+def main():
+    with open("/etc/trino-benchmark/queries.json", encoding="utf-8") as handle:
+        queries = json.load(handle)
+
+    clickhouse(f"CREATE DATABASE IF NOT EXISTS {os.environ['CLICKHOUSE_DATABASE']}")
+    clickhouse(f'''
+CREATE TABLE IF NOT EXISTS {TABLE} (
+    run_id UUID,
+    started_at DateTime64(3, 'UTC'),
+    trino_version LowCardinality(String),
+    chart_version LowCardinality(String),
+    suite LowCardinality(String),
+    query LowCardinality(String),
+    scale_factor LowCardinality(String),
+    repetition UInt16,
+    workers UInt16,
+    state LowCardinality(String),
+    error String,
+    elapsed_ms UInt64,
+    queued_ms UInt64,
+    cpu_ms UInt64,
+    wall_ms UInt64,
+    peak_memory_bytes UInt64,
+    spilled_bytes UInt64,
+    processed_rows UInt64,
+    processed_bytes UInt64
+)
+ENGINE = MergeTree
+ORDER BY (suite, query, scale_factor, started_at)
+''')
+
+    _, nodes = trino(
+        "SELECT count(*) FROM nodes WHERE NOT coordinator AND state = 'active'",
+        "system",
+        "runtime",
+    )
+    run_id = str(uuid.uuid4())
+    records = []
+    failures = 0
+    for name, sql in queries.items():
+        suite = name.split("/", 1)[0]
+        for repetition in range(1, REPETITIONS + 1):
+            started_at = datetime.now(UTC)
+            result, _ = trino(sql, suite, SCALE_FACTOR)
+            stats = result.get("stats") or {}
+            error = (result.get("error") or {}).get("message", "")
+            failures += bool(error)
+            records.append({
+                "run_id": run_id,
+                "started_at": started_at.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+                "trino_version": os.environ["TRINO_VERSION"],
+                "chart_version": os.environ["CHART_VERSION"],
+                "suite": suite,
+                "query": name,
+                "scale_factor": SCALE_FACTOR,
+                "repetition": repetition,
+                "workers": nodes[0][0],
+                "state": stats.get("state", "UNKNOWN"),
+                "error": error,
+                "elapsed_ms": stats.get("elapsedTimeMillis", 0),
+                "queued_ms": stats.get("queuedTimeMillis", 0),
+                "cpu_ms": stats.get("cpuTimeMillis", 0),
+                "wall_ms": stats.get("wallTimeMillis", 0),
+                "peak_memory_bytes": stats.get("peakMemoryBytes", 0),
+                "spilled_bytes": stats.get("spilledBytes", 0),
+                "processed_rows": stats.get("processedRows", 0),
+                "processed_bytes": stats.get("processedBytes", 0),
+            })
+            print(
+                f"{name} #{repetition}: {records[-1]['state']} "
+                f"{records[-1]['elapsed_ms']} ms {error}",
+                flush=True,
+            )
+            time.sleep(1)
+
+    clickhouse(
+        f"INSERT INTO {TABLE} FORMAT JSONEachRow",
+        "\\n".join(json.dumps(record) for record in records).encode(),
+    )
+    print(f"run {run_id}: {len(records)} rows, {failures} failed", flush=True)
+    return 1 if failures else 0
+
+
+sys.exit(main())
+""".lstrip(),
+        },
+        opts=pulumi.ResourceOptions(depends_on=[namespace]),
+    )
+
+    k8s.batch.v1.CronJob(
+        "trino-benchmark",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="trino-benchmark",
+            namespace=namespace.metadata.name,
+            labels=labels,
+        ),
+        spec=k8s.batch.v1.CronJobSpecArgs(
+            schedule=benchmark["schedule"],
+            concurrency_policy="Forbid",
+            successful_jobs_history_limit=3,
+            failed_jobs_history_limit=3,
+            job_template=k8s.batch.v1.JobTemplateSpecArgs(
+                spec=k8s.batch.v1.JobSpecArgs(
+                    backoff_limit=0,
+                    active_deadline_seconds=int(benchmark["timeoutSeconds"]),
+                    ttl_seconds_after_finished=86400,
+                    template=k8s.core.v1.PodTemplateSpecArgs(
+                        metadata=k8s.meta.v1.ObjectMetaArgs(labels=labels),
+                        spec=k8s.core.v1.PodSpecArgs(
+                            restart_policy="Never",
+                            containers=[
+                                k8s.core.v1.ContainerArgs(
+                                    name="benchmark",
+                                    image="docker.io/library/python:3.13-alpine",
+                                    command=[
+                                        "python",
+                                        "/etc/trino-benchmark/benchmark.py",
+                                    ],
+                                    env=[
+                                        k8s.core.v1.EnvVarArgs(
+                                            name="TRINO_URL",
+                                            value=f"http://trino.{namespace_name}.svc.cluster.local:8080",
+                                        ),
+                                        k8s.core.v1.EnvVarArgs(
+                                            name="TRINO_VERSION",
+                                            value=TRINO_VERSION,
+                                        ),
+                                        k8s.core.v1.EnvVarArgs(
+                                            name="CHART_VERSION",
+                                            value=CHART_VERSION,
+                                        ),
+                                        k8s.core.v1.EnvVarArgs(
+                                            name="SCALE_FACTOR",
+                                            value=str(benchmark["scaleFactor"]),
+                                        ),
+                                        k8s.core.v1.EnvVarArgs(
+                                            name="REPETITIONS",
+                                            value=str(int(benchmark["repetitions"])),
+                                        ),
+                                        k8s.core.v1.EnvVarArgs(
+                                            name="CLICKHOUSE_URL",
+                                            value=clickhouse_http_url,
+                                        ),
+                                        k8s.core.v1.EnvVarArgs(
+                                            name="CLICKHOUSE_DATABASE",
+                                            value=benchmark["clickhouseDatabase"],
+                                        ),
+                                        k8s.core.v1.EnvVarArgs(
+                                            name="CLICKHOUSE_TABLE",
+                                            value=benchmark["clickhouseTable"],
+                                        ),
+                                        k8s.core.v1.EnvVarArgs(
+                                            name="CLICKHOUSE_USER",
+                                            value_from=k8s.core.v1.EnvVarSourceArgs(
+                                                secret_key_ref=k8s.core.v1.SecretKeySelectorArgs(
+                                                    name=TRINO_CREDENTIALS_SECRET_NAME,
+                                                    key="TRINO_CLICKHOUSE_USER",
+                                                ),
+                                            ),
+                                        ),
+                                        k8s.core.v1.EnvVarArgs(
+                                            name="CLICKHOUSE_PASSWORD",
+                                            value_from=k8s.core.v1.EnvVarSourceArgs(
+                                                secret_key_ref=k8s.core.v1.SecretKeySelectorArgs(
+                                                    name=TRINO_CREDENTIALS_SECRET_NAME,
+                                                    key="TRINO_CLICKHOUSE_PASSWORD",
+                                                ),
+                                            ),
+                                        ),
+                                    ],
+                                    volume_mounts=[
+                                        k8s.core.v1.VolumeMountArgs(
+                                            name="benchmark",
+                                            mount_path="/etc/trino-benchmark",
+                                            read_only=True,
+                                        )
+                                    ],
+                                    resources=k8s.core.v1.ResourceRequirementsArgs(
+                                        requests={"cpu": "10m", "memory": "64Mi"},
+                                        limits={"cpu": "200m", "memory": "256Mi"},
+                                    ),
+                                )
+                            ],
+                            volumes=[
+                                k8s.core.v1.VolumeArgs(
+                                    name="benchmark",
+                                    config_map=k8s.core.v1.ConfigMapVolumeSourceArgs(
+                                        name=benchmark_files.metadata.name,
+                                    ),
+                                )
+                            ],
+                        ),
+                    ),
+                ),
+            ),
+        ),
+        opts=pulumi.ResourceOptions(
+            depends_on=[trino_chart, catalog_credentials, benchmark_files]
+        ),
+    )
+
+if transport_benchmark["enabled"]:
+    transport_benchmark_files = k8s.core.v1.ConfigMap(
+        "trino-transport-benchmark",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="trino-transport-benchmark",
+            namespace=namespace.metadata.name,
+            labels=labels,
+        ),
+        data={
+            "transport_benchmark.py": """
+import json
+import os
+import statistics
+import sys
+import time
+import urllib.parse
+import urllib.request
+import uuid
+from datetime import UTC, datetime
+
+TRINO_URL = os.environ["TRINO_URL"]
+CLICKHOUSE_URL = os.environ["CLICKHOUSE_URL"]
+DATABASE = os.environ["CLICKHOUSE_DATABASE"]
+SYNTHETIC_TABLE = os.environ["SYNTHETIC_TABLE"]
+SOURCE = f"{DATABASE}.{SYNTHETIC_TABLE}"
+RESULTS = f"{DATABASE}.{os.environ['CLICKHOUSE_TABLE']}"
+ROWS = int(os.environ["ROWS"])
+REPETITIONS = int(os.environ["REPETITIONS"])
+COMPRESSIONS = os.environ["COMPRESSIONS"].split(",")
+# checksum() has no ClickHouse equivalent, so scan ships every row to Trino.
+# aggregate is pushed down and ships one row per category.
+QUERIES = {
+    "scan": (
+        "SELECT count(*), checksum(id), checksum(category), checksum(amount), "
+        f"checksum(payload), checksum(created_at) FROM {SYNTHETIC_TABLE}"
+    ),
+    "aggregate": (
+        "SELECT category, count(*), sum(amount) "
+        f"FROM {SYNTHETIC_TABLE} GROUP BY category"
+    ),
+}
+
+
+def trino(sql, catalog, schema):
+    headers = {
+        "X-Trino-User": "benchmark",
+        "X-Trino-Source": "trino-transport-benchmark",
+        "X-Trino-Catalog": catalog,
+        "X-Trino-Schema": schema,
+    }
+    request = urllib.request.Request(
+        f"{TRINO_URL}/v1/statement", data=sql.encode(), headers=headers
+    )
+    while True:
+        with urllib.request.urlopen(request, timeout=300) as response:
+            result = json.load(response)
+        if "nextUri" not in result:
+            return result
+        request = urllib.request.Request(result["nextUri"], headers=headers)
+
+
+def clickhouse(query, body=b""):
+    url = f"{CLICKHOUSE_URL}/?{urllib.parse.urlencode({'query': query})}"
+    request = urllib.request.Request(
+        url,
+        data=body,
+        headers={
+            "X-ClickHouse-User": os.environ["CLICKHOUSE_USER"],
+            "X-ClickHouse-Key": os.environ["CLICKHOUSE_PASSWORD"],
+        },
+    )
+    with urllib.request.urlopen(request, timeout=600) as response:
+        return response.read().decode().strip()
+
+
+def prepare():
+    clickhouse(f"CREATE DATABASE IF NOT EXISTS {DATABASE}")
+    clickhouse(f'''
+CREATE TABLE IF NOT EXISTS {SOURCE} (
+    id UInt64,
+    category LowCardinality(String),
+    amount Float64,
+    payload String,
+    created_at DateTime
+)
+ENGINE = MergeTree
+ORDER BY id
+''')
+    if int(clickhouse(f"SELECT count() FROM {SOURCE}")) != ROWS:
+        clickhouse(f"TRUNCATE TABLE {SOURCE}")
+        clickhouse(f'''
+INSERT INTO {SOURCE}
+SELECT
+    number,
+    concat('category-', toString(number % 64)),
+    (number * 7919 % 100000) / 100,
+    concat(hex(cityHash64(number % 100000)), repeat('x', number % 48)),
+    toDateTime('2026-01-01 00:00:00') + number
+FROM system.numbers
+LIMIT {ROWS}
+''')
+    clickhouse(f'''
+CREATE TABLE IF NOT EXISTS {RESULTS} (
+    run_id UUID,
+    started_at DateTime64(3, 'UTC'),
+    trino_version LowCardinality(String),
+    compression LowCardinality(String),
+    query LowCardinality(String),
+    rows UInt64,
+    repetition UInt16,
+    state LowCardinality(String),
+    error String,
+    elapsed_ms UInt64,
+    clickhouse_queries UInt32,
+    network_send_bytes UInt64,
+    result_bytes UInt64,
+    result_rows UInt64
+)
+ENGINE = MergeTree
+ORDER BY (query, compression, started_at)
+''')
+
+
+# What ClickHouse sent for the synthetic table between two server timestamps.
+def transferred(since, until):
+    row = clickhouse(f'''
+SELECT
+    count() AS clickhouse_queries,
+    sum(ProfileEvents['NetworkSendBytes']) AS network_send_bytes,
+    sum(result_bytes) AS result_bytes,
+    sum(result_rows) AS result_rows
+FROM system.query_log
+WHERE event_date >= toDate('{since}')
+  AND event_time_microseconds BETWEEN '{since}' AND '{until}'
+  AND type = 'QueryFinish'
+  AND user = currentUser()
+  AND position(query, '{SYNTHETIC_TABLE}') > 0
+FORMAT JSONEachRow
+''')
+    return {key: int(value) for key, value in json.loads(row).items()}
+
+
+def main():
+    prepare()
+    run_id = str(uuid.uuid4())
+    records = []
+    windows = []
+    failures = 0
+    for compression in COMPRESSIONS:
+        catalog = f"clickhouse_transport_{compression}"
+        for name, sql in QUERIES.items():
+            for repetition in range(1, REPETITIONS + 1):
+                started_at = datetime.now(UTC)
+                since = clickhouse("SELECT now64(6)")
+                result = trino(sql, catalog, DATABASE)
+                until = clickhouse("SELECT now64(6)")
+                stats = result.get("stats") or {}
+                error = (result.get("error") or {}).get("message", "")
+                failures += bool(error)
+                windows.append((since, until))
+                records.append({
+                    "run_id": run_id,
+                    "started_at": started_at.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+                    "trino_version": os.environ["TRINO_VERSION"],
+                    "compression": compression,
+                    "query": name,
+                    "rows": ROWS,
+                    "repetition": repetition,
+                    "state": stats.get("state", "UNKNOWN"),
+                    "error": error,
+                    "elapsed_ms": stats.get("elapsedTimeMillis", 0),
+                })
+                print(
+                    f"{compression} {name} #{repetition}: "
+                    f"{records[-1]['state']} {records[-1]['elapsed_ms']} ms {error}",
+                    flush=True,
+                )
+
+    # query_log is flushed every few seconds; wait until it has caught up
+    # with the last run before reading the windows back.
+    deadline = time.monotonic() + 120
+    while not int(
+        clickhouse(
+            "SELECT count() FROM system.query_log "
+            f"WHERE event_time_microseconds > '{windows[-1][1]}'"
+        )
+    ):
+        if time.monotonic() > deadline:
+            print("system.query_log did not catch up", flush=True)
+            return 1
+        time.sleep(5)
+    for record, (since, until) in zip(records, windows):
+        record.update(transferred(since, until))
+
+    clickhouse(
+        f"INSERT INTO {RESULTS} FORMAT JSONEachRow",
+        "\\n".join(json.dumps(record) for record in records).encode(),
+    )
+
+    print(f"{'compression':<12} {'query':<10} {'median ms':>10} {'sent bytes':>14}")
+    for compression in COMPRESSIONS:
+        for name in QUERIES:
+            runs = [
+                record
+                for record in records
+                if record["compression"] == compression and record["query"] == name
+            ]
+            elapsed = statistics.median(run["elapsed_ms"] for run in runs)
+            sent = statistics.median(run["network_send_bytes"] for run in runs)
+            print(f"{compression:<12} {name:<10} {elapsed:>10.0f} {sent:>14.0f}")
+    print(f"run {run_id}: {len(records)} rows, {failures} failed", flush=True)
+    return 1 if failures else 0
+
+
+sys.exit(main())
+""".lstrip(),
+        },
+        opts=pulumi.ResourceOptions(depends_on=[namespace]),
+    )
+
+    # Runs once per change to the script, its settings or the catalogs it
+    # compares; skipAwait keeps `pulumi up` from waiting on the whole run.
+    transport_benchmark_task_id = pulumi.Output.all(
+        *(
+            catalogs[f"clickhouse_transport_{compression}"]
+            for compression in transport_benchmark["compressions"]
+        ),
+        transport_benchmark_files.data,
+        json.dumps(transport_benchmark, sort_keys=True),
+    ).apply(stable_task_id)
+
+    k8s.batch.v1.Job(
+        "trino-transport-benchmark",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="trino-transport-benchmark",
+            namespace=namespace.metadata.name,
+            labels=labels,
+            annotations={
+                "pulumi.com/skipAwait": "true",
+                "trino.k8s.kevin/task-id": transport_benchmark_task_id,
+            },
+        ),
+        spec=k8s.batch.v1.JobSpecArgs(
+            backoff_limit=0,
+            active_deadline_seconds=3600,
+            ttl_seconds_after_finished=7 * 86400,
+            template=k8s.core.v1.PodTemplateSpecArgs(
+                metadata=k8s.meta.v1.ObjectMetaArgs(
+                    labels=labels,
+                    annotations={
+                        "trino.k8s.kevin/task-id": transport_benchmark_task_id
+                    },
+                ),
+                spec=k8s.core.v1.PodSpecArgs(
+                    restart_policy="Never",
+                    containers=[
+                        k8s.core.v1.ContainerArgs(
+                            name="benchmark",
+                            image="docker.io/library/python:3.13-alpine",
+                            command=[
+                                "python",
+                                "/etc/trino-transport-benchmark/transport_benchmark.py",
+                            ],
+                            env=[
+                                k8s.core.v1.EnvVarArgs(
+                                    name="TRINO_URL",
+                                    value=f"http://trino.{namespace_name}.svc.cluster.local:8080",
+                                ),
+                                k8s.core.v1.EnvVarArgs(
+                                    name="TRINO_VERSION",
+                                    value=TRINO_VERSION,
+                                ),
+                                k8s.core.v1.EnvVarArgs(
+                                    name="COMPRESSIONS",
+                                    value=",".join(transport_benchmark["compressions"]),
+                                ),
+                                k8s.core.v1.EnvVarArgs(
+                                    name="ROWS",
+                                    value=str(int(transport_benchmark["rows"])),
+                                ),
+                                k8s.core.v1.EnvVarArgs(
+                                    name="REPETITIONS",
+                                    value=str(int(transport_benchmark["repetitions"])),
+                                ),
+                                k8s.core.v1.EnvVarArgs(
+                                    name="CLICKHOUSE_URL",
+                                    value=clickhouse_http_url,
+                                ),
+                                k8s.core.v1.EnvVarArgs(
+                                    name="CLICKHOUSE_DATABASE",
+                                    value=transport_benchmark["clickhouseDatabase"],
+                                ),
+                                k8s.core.v1.EnvVarArgs(
+                                    name="SYNTHETIC_TABLE",
+                                    value=transport_benchmark["syntheticTable"],
+                                ),
+                                k8s.core.v1.EnvVarArgs(
+                                    name="CLICKHOUSE_TABLE",
+                                    value=transport_benchmark["clickhouseTable"],
+                                ),
+                                secret_env_var(
+                                    "CLICKHOUSE_USER",
+                                    TRINO_CREDENTIALS_SECRET_NAME,
+                                    "TRINO_CLICKHOUSE_USER",
+                                ),
+                                secret_env_var(
+                                    "CLICKHOUSE_PASSWORD",
+                                    TRINO_CREDENTIALS_SECRET_NAME,
+                                    "TRINO_CLICKHOUSE_PASSWORD",
+                                ),
+                            ],
+                            volume_mounts=[
+                                k8s.core.v1.VolumeMountArgs(
+                                    name="benchmark",
+                                    mount_path="/etc/trino-transport-benchmark",
+                                    read_only=True,
+                                )
+                            ],
+                            resources=k8s.core.v1.ResourceRequirementsArgs(
+                                requests={"cpu": "10m", "memory": "64Mi"},
+                                limits={"cpu": "200m", "memory": "256Mi"},
+                            ),
+                        )
+                    ],
+                    volumes=[
+                        k8s.core.v1.VolumeArgs(
+                            name="benchmark",
+                            config_map=k8s.core.v1.ConfigMapVolumeSourceArgs(
+                                name=transport_benchmark_files.metadata.name,
+                            ),
+                        )
+                    ],
+                ),
+            ),
+        ),
+        opts=pulumi.ResourceOptions(
+            depends_on=[trino_chart, catalog_credentials, transport_benchmark_files],
+            delete_before_replace=True,
+        ),
+    )
+
+if worker_autoscaling["enabled"]:
+    # prometheus-adapter in the monitoring stack serves hpa_* series as
+    # external metrics; see docs/stacks/ops/monitoring.md.
+    query_demand_metric = "hpa_trino_query_demand"
+    queued_queries_metric = "hpa_trino_queued_queries"
+    running_queries = f'sum by (namespace) (trino_execution_QueryManager_RunningQueries{{namespace="{namespace_name}"}})'
+    queued_queries = f'sum by (namespace) (trino_execution_QueryManager_QueuedQueries{{namespace="{namespace_name}"}})'
+    trino_autoscaling_rules = k8s.apiextensions.CustomResource(
+        "trino-autoscaling-rules",
+        api_version="monitoring.coreos.com/v1",
+        kind="PrometheusRule",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="trino-autoscaling",
+            namespace=namespace.metadata.name,
+            labels={
+                **labels,
+                "release": monitoring_release_label,
+            },
+        ),
+        spec={
+            "groups": [
+                {
+                    "name": "trino-autoscaling",
+                    "rules": [
+                        {
+                            "record": query_demand_metric,
+                            "expr": f"{running_queries} + {queued_queries}",
+                        },
+                        {
+                            "record": queued_queries_metric,
+                            "expr": queued_queries,
+                        },
+                    ],
+                },
+            ],
+        },
+        opts=pulumi.ResourceOptions(depends_on=[namespace]),
+    )
+
+    def query_metric(
+        name: str, per_worker: object
+    ) -> k8s.autoscaling.v2.MetricSpecArgs:
+        return k8s.autoscaling.v2.MetricSpecArgs(
+            type="External",
+            external=k8s.autoscaling.v2.ExternalMetricSourceArgs(
+                metric=k8s.autoscaling.v2.MetricIdentifierArgs(name=name),
+                target=k8s.autoscaling.v2.MetricTargetArgs(
+                    type="AverageValue",
+                    average_value=str(int(per_worker)),
+                ),
+            ),
+        )
+
+    k8s.autoscaling.v2.HorizontalPodAutoscaler(
+        "trino-worker-hpa",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="trino-worker",
+            namespace=namespace.metadata.name,
+            labels=labels,
+        ),
+        spec=k8s.autoscaling.v2.HorizontalPodAutoscalerSpecArgs(
+            scale_target_ref=k8s.autoscaling.v2.CrossVersionObjectReferenceArgs(
+                api_version="apps/v1",
+                kind="Deployment",
+                name="trino-worker",
+            ),
+            min_replicas=int(worker_autoscaling["minReplicas"]),
+            max_replicas=int(worker_autoscaling["maxReplicas"]),
+            metrics=[
+                query_metric(
+                    query_demand_metric, worker_autoscaling["targetQueriesPerWorker"]
+                ),
+                query_metric(
+                    queued_queries_metric,
+                    worker_autoscaling["targetQueuedQueriesPerWorker"],
+                ),
+            ],
+            behavior=k8s.autoscaling.v2.HorizontalPodAutoscalerBehaviorArgs(
+                scale_down=k8s.autoscaling.v2.HPAScalingRulesArgs(
+                    stabilization_window_seconds=int(
+                        worker_autoscaling["scaleDownStabilizationSeconds"]
+                    ),
+                    # Drain one worker at a time.
+                    policies=[
+                        k8s.autoscaling.v2.HPAScalingPolicyArgs(
+                            type="Pods",
+                            value=1,
+                            period_seconds=worker_shutdown_grace_period,
+                        )
+                    ],
+                ),
+            ),
+        ),
+        opts=pulumi.ResourceOptions(depends_on=[trino_chart, trino_autoscaling_rules]),
+    )
+
 dashboard_config_maps(
     name_prefix="trino-dashboard",
     namespace=namespace.metadata.name,
@@ -620,4 +1894,9 @@ pulumi.export("iceberg_jdbc_catalog_name", iceberg_catalog_name)
 pulumi.export("iceberg_database", iceberg_database.name)
 pulumi.export("iceberg_bucket", iceberg_bucket)
 pulumi.export("iceberg_warehouse", iceberg_warehouse)
+pulumi.export("fs_cache_enabled", fs_cache_enabled)
+pulumi.export("spill_enabled", spill_enabled)
+pulumi.export("benchmark_enabled", benchmark["enabled"])
+pulumi.export("worker_autoscaling_enabled", worker_autoscaling["enabled"])
+pulumi.export("resource_groups_enabled", resource_groups["enabled"])
 pulumi.export("credentials_secret", catalog_credentials.metadata.name)
@@ -1,7 +1,10 @@
 import pulumi_kubernetes as k8s
+from infra_helpers.helm import cached_chart
 
 import pulumi
 
+CHART_VERSION = "20.0.5"
+
 config = pulumi.Config()
 cockroach_namespace = k8s.core.v1.Namespace(
     "cockroach-namespace",
@@ -23,12 +26,9 @@ cockroach_resources = {
 
 cockroach_chart = k8s.helm.v4.Chart(
     "cockroachdb",
-    chart="cockroachdb",
-    repository_opts=k8s.helm.v4.RepositoryOptsArgs(
-        repo="https://charts.cockroachdb.com",
-    ),
+    chart=cached_chart("cockroachdb", CHART_VERSION, "https://charts.cockroachdb.com"),
     namespace=cockroach_namespace.metadata.name,
-    version="20.0.5",
+    version=CHART_VERSION,
     values={
         "image": {"repository": "cockroachdb/cockroach", "tag": "v26.1.4"},
         "conf": {
@@ -92,7 +92,9 @@ namespace = k8s.core.v1.Namespace(
 )
 
 postgres = PostgresStack(postgres_stack_ref)
-postgres_service_host = configured_postgres_service_host or postgres.rw_service_fqdn
+postgres_service_host = configured_postgres_service_host or postgres.service_fqdn(
+    config.get("postgresPoolMode")
+)
 postgres_port = postgres.port.apply(lambda value: int(value) if value else 5432)
 
 postgres_db_password = random.RandomPassword(
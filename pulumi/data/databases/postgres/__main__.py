@@ -3,10 +3,31 @@ from typing import Any
 
 import pulumi_kubernetes as k8s
 import pulumi_postgresql as pg
+from infra_helpers.helm import cached_chart
 from pulumi_monitoring_crds.monitoring.v1 import PodMonitor
 
 import pulumi
 
+CHART_VERSION = "0.6.1"
+# PgBouncer settings per pool mode; `poolers` config overrides them per mode.
+POOLER_DEFAULTS: dict[str, dict[str, Any]] = {
+    "transaction": {
+        "instances": 2,
+        "parameters": {
+            "default_pool_size": "20",
+            "max_client_conn": "1000",
+            "max_prepared_statements": "200",
+        },
+    },
+    "session": {
+        "instances": 1,
+        "parameters": {
+            "default_pool_size": "10",
+            "max_client_conn": "200",
+        },
+    },
+}
+
 config = pulumi.Config()
 
 ns_value = config.get(
@@ -14,6 +35,8 @@ ns_value = config.get(
 )  # plain string to avoid Output warnings
 monitoring_release_label = config.get("monitoringReleaseLabel", "kube-prometheus-stack")
 cnpg_cluster_name = config.get("clusterName", "postgresql-cluster")
+# One primary plus `instances - 1` streaming replicas behind the ro service.
+instances = config.get_int("instances") or 1
 
 # Manage the Namespace with a stable Pulumi name to avoid replacement
 postgres_namespace = k8s.core.v1.Namespace(
@@ -29,12 +52,43 @@ pulumi.export("cnpg_cluster_name", cnpg_cluster_name)
 pulumi.export("monitoring_release_label", monitoring_release_label)
 rw_service_name = f"{cnpg_cluster_name}-rw"
 rw_service_fqdn = f"{rw_service_name}.{ns_value}.svc.cluster.local"
+ro_service_name = f"{cnpg_cluster_name}-ro"
+ro_service_fqdn = f"{ro_service_name}.{ns_value}.svc.cluster.local"
 ca_secret_name = f"{cnpg_cluster_name}-ca"
 
 pulumi.export("rw_service_name", rw_service_name)
 pulumi.export("rw_service_fqdn", rw_service_fqdn)
+pulumi.export("instances", instances)
+pulumi.export("ro_service_name", ro_service_name)
+pulumi.export("ro_service_fqdn", ro_service_fqdn)
 pulumi.export("ca_secret_name", ca_secret_name)
 
+configured_poolers = config.get_object("poolers") or {}
+poolers: dict[str, dict[str, Any]] = {}
+for pool_mode, defaults in POOLER_DEFAULTS.items():
+    overrides = configured_poolers.get(pool_mode) or {}
+    if overrides.get("enabled", True) is False:
+        continue
+    poolers[pool_mode] = {
+        "name": f"{cnpg_cluster_name}-pooler-{pool_mode}",
+        "instances": int(overrides.get("instances", defaults["instances"])),
+        "parameters": {
+            key: str(value)
+            for key, value in {
+                **defaults["parameters"],
+                **(overrides.get("parameters") or {}),
+            }.items()
+        },
+    }
+
+pulumi.export(
+    "pooler_fqdns",
+    {
+        pool_mode: f"{pooler['name']}.{ns_value}.svc.cluster.local"
+        for pool_mode, pooler in poolers.items()
+    },
+)
+
 
 def add_wait_annotation(
     args: pulumi.ResourceTransformationArgs,
@@ -59,22 +113,28 @@ def add_wait_annotation(
 
 pg_chart = k8s.helm.v4.Chart(
     "postgresql",
-    chart="cluster",
-    namespace=ns_value,
-    repository_opts=k8s.helm.v4.RepositoryOptsArgs(
-        repo="https://cloudnative-pg.github.io/charts",
+    chart=cached_chart(
+        "cluster", CHART_VERSION, "https://cloudnative-pg.github.io/charts"
     ),
-    version="0.6.1",
+    namespace=ns_value,
+    version=CHART_VERSION,
     values={
         "version": {
             "postgresql": "18",
         },
         "cluster": {
-            "instances": 1,
+            "instances": instances,
             "imageName": "tensorchord/cloudnative-vectorchord:18.3-1.1.1",
             "imagePullPolicy": "IfNotPresent",
             "postgresql": {
                 "shared_preload_libraries": ["vchord.so"],
+                # Keep long replica reads from being cancelled by vacuum on
+                # the primary; only meaningful once replicas exist.
+                **(
+                    {"parameters": {"hot_standby_feedback": "on"}}
+                    if instances > 1
+                    else {}
+                ),
             },
             "bootstrap": {
                 "initdb": {
@@ -82,7 +142,7 @@ pg_chart = k8s.helm.v4.Chart(
                 },
             },
             "services": {
-                "disabledDefaultServices": ["r", "ro"],
+                "disabledDefaultServices": ["r"],
                 "additional": [
                     {
                         "selectorType": "rw",
@@ -159,6 +219,61 @@ cluster_podmonitor = PodMonitor(
     opts=pulumi.ResourceOptions(depends_on=[pg_chart]),
 )
 
+# PgBouncer in front of the read-write service. CNPG names each pooler's
+# Service after the Pooler and handles auth through its own auth_query role.
+pooler_resources = [
+    k8s.apiextensions.CustomResource(
+        f"pooler-{pool_mode}",
+        api_version="postgresql.cnpg.io/v1",
+        kind="Pooler",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name=pooler["name"],
+            namespace=ns_value,
+        ),
+        spec={
+            "cluster": {"name": cnpg_cluster_name},
+            "instances": pooler["instances"],
+            "type": "rw",
+            "pgbouncer": {
+                "poolMode": pool_mode,
+                "parameters": pooler["parameters"],
+            },
+        },
+        opts=pulumi.ResourceOptions(depends_on=[pg_chart]),
+    )
+    for pool_mode, pooler in poolers.items()
+]
+
+if pooler_resources:
+    PodMonitor(
+        "postgresql-pooler-podmonitor",
+        metadata={
+            "name": "postgresql-pooler",
+            "namespace": ns_value,
+            "labels": {
+                "release": monitoring_release_label,
+            },
+        },
+        spec={
+            "namespaceSelector": {
+                "matchNames": [ns_value],
+            },
+            "selector": {
+                "matchExpressions": [
+                    {"key": "cnpg.io/poolerName", "operator": "Exists"},
+                ],
+            },
+            "podMetricsEndpoints": [
+                {
+                    "port": "metrics",
+                    "path": "/metrics",
+                    "interval": "30s",
+                }
+            ],
+        },
+        opts=pulumi.ResourceOptions(depends_on=pooler_resources),
+    )
+
 secret_id = f"{ns_value}/postgresql-cluster-superuser"
 
 pg_secret = k8s.core.v1.Secret.get(
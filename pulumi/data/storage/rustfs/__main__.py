@@ -1,5 +1,6 @@
 import pulumi_kubernetes as k8s
 import pulumi_random as random
+from infra_helpers.helm import cached_chart
 
 import pulumi
 
@@ -37,12 +38,9 @@ namespace = k8s.core.v1.Namespace(
 
 rustfs_chart = k8s.helm.v4.Chart(
     "rustfs",
-    chart="rustfs",
+    chart=cached_chart("rustfs", CHART_VERSION, "https://charts.rustfs.com"),
     namespace=namespace.metadata.name,
     version=CHART_VERSION,
-    repository_opts=k8s.helm.v4.RepositoryOptsArgs(
-        repo="https://charts.rustfs.com",
-    ),
     values={
         "fullnameOverride": "rustfs",
         "commonLabels": labels,
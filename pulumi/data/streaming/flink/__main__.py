@@ -2,6 +2,7 @@ from pathlib import Path
 
 import pulumi_kubernetes as k8s
 from infra_helpers.grafana import dashboard_config_maps
+from infra_helpers.helm import cached_chart
 from pulumi_monitoring_crds.monitoring.v1 import PodMonitor
 
 import pulumi
@@ -48,12 +49,13 @@ flink_namespace = k8s.core.v1.Namespace(
 
 flink_operator = k8s.helm.v3.Release(
     "flink-kubernetes-operator",
-    chart="flink-kubernetes-operator",
+    chart=cached_chart(
+        "flink-kubernetes-operator",
+        operator_chart_version,
+        "https://downloads.apache.org/flink/flink-kubernetes-operator-1.14.0/",
+    ),
     name="flink-kubernetes-operator",
     namespace=flink_namespace.metadata.name,
-    repository_opts=k8s.helm.v3.RepositoryOptsArgs(
-        repo="https://downloads.apache.org/flink/flink-kubernetes-operator-1.14.0/",
-    ),
     version=operator_chart_version,
     values={
         "webhook": {
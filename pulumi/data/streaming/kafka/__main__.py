@@ -1,11 +1,85 @@
+import json
+import re
 from pathlib import Path
 
 import pulumi_kubernetes as k8s
 from infra_helpers.grafana import dashboard_config_maps
+from infra_helpers.helm import cached_chart
+from infra_helpers.k8s import secret_env_var, stable_task_id
+from infra_helpers.postgres import PostgresStack
+from infra_helpers.stacks import ClickHouseStack, RustfsStack, TrinoStack
 from pulumi_monitoring_crds.monitoring.v1 import PodMonitor
 
 import pulumi
 
+TIERED_STORAGE_SECRET_NAME = "kafka-tiered-storage"
+TIERED_STORAGE_PLUGIN_DIRECTORY = "/opt/kafka/plugins/tiered-storage"
+# Closed segments of topics with remote.storage.enable are copied to RustFS by
+# the Aiven remote storage manager, which is not in the Strimzi image. The PVC
+# keeps local.retention.ms of each partition; retention.ms covers both tiers.
+TIERED_STORAGE_DEFAULTS = {
+    "enabled": False,
+    "image": None,
+    "bucket": "kafka-tiered-storage",
+    "keyPrefix": None,
+    "chunkSizeBytes": 4 * 1024 * 1024,
+    "topicConfig": {
+        "remote.storage.enable": "true",
+        "local.retention.ms": str(6 * 60 * 60 * 1000),
+        "retention.ms": str(30 * 24 * 60 * 60 * 1000),
+        "segment.bytes": str(128 * 1024 * 1024),
+    },
+}
+BENCHMARK_SECRET_NAME = "kafka-benchmark-clickhouse"
+# One producer run and one consumer run against a dedicated topic; the records
+# are then read back in full by a fresh consumer group.
+BENCHMARK_DEFAULTS = {
+    "enabled": False,
+    "topic": "kafka-benchmark",
+    "partitions": 3,
+    "records": 1_000_000,
+    "recordSize": 1024,
+    "throughput": -1,
+    "batchSize": 64 * 1024,
+    "lingerMs": 5,
+    "compression": "lz4",
+    "acks": "all",
+    "image": None,
+    "clickhouseDatabase": "benchmarks",
+    "clickhouseTable": "kafka_perf_runs",
+}
+
+# Cruise Control moves partitions onto brokers added to the node pool and off
+# brokers about to be removed. The full rebalance covers topics that grew.
+CRUISE_CONTROL_DEFAULTS = {
+    "enabled": None,
+    "autoApprove": False,
+    "concurrentPartitionMovementsPerBroker": 5,
+    "replicationThrottleBytesPerSec": 50 * 1024 * 1024,
+}
+# Topics Strimzi's Cruise Control creates for its metrics and samples.
+CRUISE_CONTROL_TOPICS = (
+    "strimzi.cruisecontrol.metrics",
+    "strimzi.cruisecontrol.modeltrainingsamples",
+    "strimzi.cruisecontrol.partitionmetricsamples",
+)
+ICEBERG_SINK_SECRET_NAME = "kafka-iceberg-sink"
+ICEBERG_SINK_PLUGIN_DIRECTORY = "/opt/kafka/plugins/iceberg"
+AWS_DEFAULT_REGION = "us-east-1"
+# The Iceberg sink buffers records per table and commits data files on the
+# commit interval, so the interval and target file size decide file sizes.
+ICEBERG_SINK_DEFAULTS = {
+    "enabled": False,
+    "image": None,
+    "replicas": 1,
+    "namespace": "kafka",
+    "commitIntervalMs": 5 * 60 * 1000,
+    "commitTimeoutMs": 60 * 1000,
+    "targetFileSizeBytes": 128 * 1024 * 1024,
+    "compressionCodec": "zstd",
+    "tables": [],
+}
+
 config = pulumi.Config()
 
 namespace_name = config.get("namespace", "kafka")
@@ -17,13 +91,56 @@ storage_size = config.get("storageSize", "20Gi")
 delete_claim = config.get_bool("deleteClaim")
 if delete_claim is None:
     delete_claim = False
+broker_replicas = config.get_int("brokerReplicas")
+if broker_replicas is None:
+    broker_replicas = 1
+if broker_replicas < 1:
+    raise ValueError("kafka:brokerReplicas must be at least 1")
+# Internal and new topics get up to three copies. Topics created while the
+# cluster was smaller keep their old replica count until kafka-internal-topics
+# reassigns them, so min.insync.replicas stays at 1 until it is raised here.
+replication_factor = min(broker_replicas, 3)
+min_insync_replicas = config.get_int("minInsyncReplicas")
+if min_insync_replicas is None:
+    min_insync_replicas = 1
+# Nothing here knows the previous broker count, so the two steps of a
+# scale-up (brokers first, then min ISR) are left to the operator.
+if not 1 <= min_insync_replicas <= max(replication_factor - 1, 1):
+    raise ValueError(
+        "kafka:minInsyncReplicas must be between 1 and "
+        f"{max(replication_factor - 1, 1)} for {broker_replicas} brokers; raise "
+        "it only after a pulumi up with the new kafka:brokerReplicas has "
+        "replicated the internal topics"
+    )
 topic_name = config.get("topicName", "homelab-smoke")
 topic_partitions = config.get_int("topicPartitions")
 if topic_partitions is None:
     topic_partitions = 1
 topic_replicas = config.get_int("topicReplicas")
 if topic_replicas is None:
-    topic_replicas = 1
+    topic_replicas = replication_factor
+topic_config = config.get_object("topicConfig") or {}
+topics = config.get_object("topics") or []
+cruise_control = {
+    **CRUISE_CONTROL_DEFAULTS,
+    **(config.get_object("cruiseControl") or {}),
+}
+if cruise_control["enabled"] is None:
+    cruise_control["enabled"] = broker_replicas > 1
+rustfs_stack_ref = config.get("rustfsStack", "kzh/rustfs/mx")
+tiered_storage = {
+    **TIERED_STORAGE_DEFAULTS,
+    **(config.get_object("tieredStorage") or {}),
+}
+tiered_storage["topicConfig"] = {
+    **TIERED_STORAGE_DEFAULTS["topicConfig"],
+    **tiered_storage["topicConfig"],
+}
+if tiered_storage["enabled"] and not tiered_storage["image"]:
+    raise ValueError(
+        "kafka:tieredStorage needs an image with the tiered storage plugin in "
+        f"{TIERED_STORAGE_PLUGIN_DIRECTORY}; see docs/stacks/data/streaming/kafka.md"
+    )
 tailnet_enabled = config.get_bool("tailnetEnabled")
 if tailnet_enabled is None:
     tailnet_enabled = True
@@ -37,6 +154,39 @@ tailnet_advertised_broker_host = config.get(
     "tailnetAdvertisedBrokerHost",
     tailnet_broker_hostname,
 )
+# Node ids in the main pool run from 0; brokers past the first take the
+# default hostname pattern.
+tailnet_brokers = {
+    0: (tailnet_broker_hostname, tailnet_advertised_broker_host),
+    **{
+        broker: (f"{cluster_name}-{broker}", f"{cluster_name}-{broker}")
+        for broker in range(1, broker_replicas)
+    },
+}
+clickhouse_stack_ref = config.get("clickhouseStack", "kzh/clickhouse/mx")
+clickhouse_user = config.get("clickhouseUser", "kafka")
+benchmark = {**BENCHMARK_DEFAULTS, **(config.get_object("benchmark") or {})}
+# The perf tools ship with the broker image of the same Strimzi and Kafka version.
+benchmark_image = (
+    benchmark["image"]
+    or f"quay.io/strimzi/kafka:{operator_chart_version}-kafka-{kafka_version}"
+)
+iceberg_sink = {
+    **ICEBERG_SINK_DEFAULTS,
+    **(config.get_object("icebergSink") or {}),
+}
+if iceberg_sink["enabled"] and not iceberg_sink["image"]:
+    raise ValueError(
+        "kafka:icebergSink needs a Kafka Connect image with the Iceberg sink in "
+        f"{ICEBERG_SINK_PLUGIN_DIRECTORY}; see docs/stacks/data/streaming/kafka.md"
+    )
+postgres_stack_ref = config.get("postgresStack", "kzh/postgresql/mx")
+postgres_pool_mode = config.get("postgresPoolMode")
+trino_stack_ref = config.get("trinoStack", "kzh/trino/mx")
+trino_namespace = config.get("trinoNamespace", "trino")
+trino_credentials_secret_name = config.get(
+    "trinoCredentialsSecretName", "trino-catalog-credentials"
+)
 monitoring_release_label = config.get("monitoringReleaseLabel", "kube-prometheus-stack")
 dashboards_dir = Path(__file__).resolve().parent / "dashboards"
 dashboard_files = [
@@ -79,13 +229,14 @@ if tailnet_enabled:
                 },
                 "brokers": [
                     {
-                        "broker": 0,
-                        "advertisedHost": tailnet_advertised_broker_host,
+                        "broker": broker,
+                        "advertisedHost": advertised_host,
                         "advertisedPort": tailnet_port,
                         "annotations": {
-                            "tailscale.com/hostname": tailnet_broker_hostname,
+                            "tailscale.com/hostname": hostname,
                         },
                     }
+                    for broker, (hostname, advertised_host) in tailnet_brokers.items()
                 ],
             },
         }
@@ -110,10 +261,13 @@ kafka_metrics = k8s.core.v1.ConfigMap(
         "kafka-metrics-config.yml": """
 lowercaseOutputName: true
 rules:
-  - pattern: 'kafka.server<type=BrokerTopicMetrics, name=(MessagesInPerSec|BytesInPerSec|BytesOutPerSec)><>Count'
+  - pattern: 'kafka.server<type=BrokerTopicMetrics, name=(MessagesInPerSec|BytesInPerSec|BytesOutPerSec|RemoteCopyBytesPerSec|RemoteFetchBytesPerSec)><>Count'
     name: kafka_server_brokertopicmetrics_$1_total
     type: COUNTER
-  - pattern: 'kafka.server<type=ReplicaManager, name=(UnderReplicatedPartitions|UnderMinIsrPartitionCount)><>Value'
+  - pattern: 'kafka.server<type=BrokerTopicMetrics, name=(RemoteCopyLagBytes|RemoteLogSizeBytes)><>Value'
+    name: kafka_server_brokertopicmetrics_$1
+    type: GAUGE
+  - pattern: 'kafka.server<type=ReplicaManager, name=(UnderReplicatedPartitions|UnderMinIsrPartitionCount|PartitionCount|LeaderCount)><>Value'
     name: kafka_server_replicamanager_$1
     type: GAUGE
   - pattern: 'kafka.controller<type=KafkaController, name=ActiveControllerCount><>Value'
@@ -126,12 +280,11 @@ rules:
 
 strimzi_operator = k8s.helm.v3.Release(
     "strimzi",
-    chart="strimzi-kafka-operator",
+    chart=cached_chart(
+        "strimzi-kafka-operator", operator_chart_version, "https://strimzi.io/charts/"
+    ),
     name="strimzi",
     namespace=kafka_namespace.metadata.name,
-    repository_opts=k8s.helm.v3.RepositoryOptsArgs(
-        repo="https://strimzi.io/charts/",
-    ),
     version=operator_chart_version,
     values={
         "watchNamespaces": [namespace_name],
@@ -149,6 +302,199 @@ strimzi_operator = k8s.helm.v3.Release(
     opts=pulumi.ResourceOptions(depends_on=[kafka_namespace]),
 )
 
+
+def tiered_storage_config(endpoint: str) -> dict[str, object]:
+    """Strimzi tieredStorage for the Aiven S3 backend, pointed at RustFS."""
+    return {
+        "type": "custom",
+        "remoteStorageManager": {
+            "className": "io.aiven.kafka.tieredstorage.RemoteStorageManager",
+            "classPath": f"{TIERED_STORAGE_PLUGIN_DIRECTORY}/*",
+            "config": {
+                "storage.backend.class": (
+                    "io.aiven.kafka.tieredstorage.storage.s3.S3Storage"
+                ),
+                "storage.s3.endpoint.url": endpoint,
+                "storage.s3.bucket.name": tiered_storage["bucket"],
+                "storage.s3.region": "us-east-1",
+                "storage.s3.path.style.access.enabled": "true",
+                "key.prefix": tiered_storage["keyPrefix"] or f"{cluster_name}/",
+                "chunk.size": str(int(tiered_storage["chunkSizeBytes"])),
+            },
+        },
+    }
+
+
+tiered_storage_dependencies: list[pulumi.Resource] = []
+tiered_storage_spec: dict[str, object] = {}
+tiered_storage_config_overrides: dict[str, object] = {}
+if tiered_storage["enabled"]:
+    rustfs_stack = RustfsStack(rustfs_stack_ref)
+    tiered_storage_credentials = k8s.core.v1.Secret(
+        "kafka-tiered-storage",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name=TIERED_STORAGE_SECRET_NAME,
+            namespace=kafka_namespace.metadata.name,
+            labels=labels,
+        ),
+        type="Opaque",
+        string_data={
+            "access-key": rustfs_stack.access_key,
+            "secret-key": rustfs_stack.secret_key,
+        },
+        opts=pulumi.ResourceOptions(depends_on=[kafka_namespace]),
+    )
+
+    tiered_storage_bucket = k8s.batch.v1.Job(
+        "kafka-tiered-storage-bucket",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="kafka-tiered-storage-bucket",
+            namespace=kafka_namespace.metadata.name,
+            labels=labels,
+            annotations={
+                "pulumi.com/waitFor": "jsonpath={.status.succeeded}=1",
+            },
+        ),
+        spec=k8s.batch.v1.JobSpecArgs(
+            backoff_limit=4,
+            ttl_seconds_after_finished=86400,
+            template=k8s.core.v1.PodTemplateSpecArgs(
+                spec=k8s.core.v1.PodSpecArgs(
+                    restart_policy="OnFailure",
+                    containers=[
+                        k8s.core.v1.ContainerArgs(
+                            name="create-bucket",
+                            image="quay.io/minio/mc:latest",
+                            command=["sh", "-ceu"],
+                            args=[
+                                """
+mc alias set rustfs "$S3_ENDPOINT_URL" "$S3_ACCESS_KEY" "$S3_SECRET_KEY"
+mc mb --ignore-existing "rustfs/$S3_BUCKET"
+""".strip(),
+                            ],
+                            env=[
+                                k8s.core.v1.EnvVarArgs(
+                                    name="S3_ENDPOINT_URL",
+                                    value=rustfs_stack.s3_endpoint_url,
+                                ),
+                                k8s.core.v1.EnvVarArgs(
+                                    name="S3_BUCKET",
+                                    value=tiered_storage["bucket"],
+                                ),
+                                secret_env_var(
+                                    "S3_ACCESS_KEY",
+                                    TIERED_STORAGE_SECRET_NAME,
+                                    "access-key",
+                                ),
+                                secret_env_var(
+                                    "S3_SECRET_KEY",
+                                    TIERED_STORAGE_SECRET_NAME,
+                                    "secret-key",
+                                ),
+                            ],
+                        )
+                    ],
+                ),
+            ),
+        ),
+        opts=pulumi.ResourceOptions(
+            depends_on=[tiered_storage_credentials],
+            delete_before_replace=True,
+        ),
+    )
+    tiered_storage_dependencies = [tiered_storage_credentials, tiered_storage_bucket]
+    tiered_storage_spec = {
+        "image": tiered_storage["image"],
+        "tieredStorage": rustfs_stack.s3_endpoint_url.apply(tiered_storage_config),
+        # The S3 backend falls back to the AWS SDK default credential chain.
+        "template": {
+            "kafkaContainer": {
+                "env": [
+                    {
+                        "name": name,
+                        "valueFrom": {
+                            "secretKeyRef": {
+                                "name": TIERED_STORAGE_SECRET_NAME,
+                                "key": key,
+                            },
+                        },
+                    }
+                    for name, key in (
+                        ("AWS_ACCESS_KEY_ID", "access-key"),
+                        ("AWS_SECRET_ACCESS_KEY", "secret-key"),
+                    )
+                ],
+            },
+        },
+    }
+    # The remote log metadata topic defaults to three replicas.
+    tiered_storage_config_overrides = {
+        "rlmm.config.remote.log.metadata.topic.replication.factor": (
+            replication_factor
+        ),
+    }
+
+REBALANCE_TEMPLATE_NAME = f"{cluster_name}-rebalance-template"
+cruise_control_spec: dict[str, object] = {}
+cruise_control_config_overrides: dict[str, object] = {}
+if cruise_control["enabled"]:
+    cruise_control_spec = {
+        "cruiseControl": {
+            "resources": {
+                "requests": {
+                    "cpu": "100m",
+                    "memory": "512Mi",
+                },
+                "limits": {
+                    "cpu": "500m",
+                    "memory": "768Mi",
+                },
+            },
+            "jvmOptions": {
+                "-Xms": "256m",
+                "-Xmx": "512m",
+            },
+            # Scaling the node pool up or down runs a rebalance from the
+            # template before new brokers take traffic or old ones go away.
+            "autoRebalance": [
+                {"mode": mode, "template": {"name": REBALANCE_TEMPLATE_NAME}}
+                for mode in ("add-brokers", "remove-brokers")
+            ],
+        },
+    }
+    cruise_control_config_overrides = {
+        "cruise.control.metrics.topic.replication.factor": replication_factor,
+        "cruise.control.metrics.topic.min.insync.replicas": min_insync_replicas,
+    }
+
+node_pool_template: dict[str, object] = {}
+if broker_replicas > 1:
+    # Spread brokers over nodes where there is room; local-path volumes pin
+    # each broker to the node it first lands on.
+    node_pool_template = {
+        "template": {
+            "pod": {
+                "affinity": {
+                    "podAntiAffinity": {
+                        "preferredDuringSchedulingIgnoredDuringExecution": [
+                            {
+                                "weight": 100,
+                                "podAffinityTerm": {
+                                    "topologyKey": "kubernetes.io/hostname",
+                                    "labelSelector": {
+                                        "matchLabels": {
+                                            "strimzi.io/name": f"{cluster_name}-kafka",
+                                        },
+                                    },
+                                },
+                            }
+                        ],
+                    },
+                },
+            },
+        },
+    }
+
 kafka_node_pool = k8s.apiextensions.CustomResource(
     "kafka-node-pool",
     api_version="kafka.strimzi.io/v1",
@@ -161,7 +507,7 @@ kafka_node_pool = k8s.apiextensions.CustomResource(
         },
     },
     spec={
-        "replicas": 1,
+        "replicas": broker_replicas,
         "roles": ["controller", "broker"],
         "resources": {
             "requests": {
@@ -184,6 +530,7 @@ kafka_node_pool = k8s.apiextensions.CustomResource(
             "deleteClaim": delete_claim,
             "kraftMetadata": "shared",
         },
+        **node_pool_template,
     },
     opts=pulumi.ResourceOptions(depends_on=[strimzi_operator]),
 )
@@ -200,6 +547,7 @@ kafka_cluster = k8s.apiextensions.CustomResource(
     spec={
         "kafka": {
             "version": kafka_version,
+            **tiered_storage_spec,
             "listeners": kafka_listeners,
             "metricsConfig": {
                 "type": "jmxPrometheusExporter",
@@ -212,13 +560,16 @@ kafka_cluster = k8s.apiextensions.CustomResource(
             },
             "config": {
                 "auto.create.topics.enable": "false",
-                "default.replication.factor": 1,
-                "min.insync.replicas": 1,
-                "offsets.topic.replication.factor": 1,
-                "transaction.state.log.min.isr": 1,
-                "transaction.state.log.replication.factor": 1,
+                "default.replication.factor": replication_factor,
+                "min.insync.replicas": min_insync_replicas,
+                "offsets.topic.replication.factor": replication_factor,
+                "transaction.state.log.min.isr": min_insync_replicas,
+                "transaction.state.log.replication.factor": replication_factor,
+                **tiered_storage_config_overrides,
+                **cruise_control_config_overrides,
             },
         },
+        **cruise_control_spec,
         "entityOperator": {
             "topicOperator": {
                 "resources": {
@@ -246,9 +597,15 @@ kafka_cluster = k8s.apiextensions.CustomResource(
             },
         },
     },
-    opts=pulumi.ResourceOptions(depends_on=[kafka_node_pool, kafka_metrics]),
+    opts=pulumi.ResourceOptions(
+        depends_on=[kafka_node_pool, kafka_metrics, *tiered_storage_dependencies]
+    ),
 )
 
+smoke_topic_config = {
+    **(tiered_storage["topicConfig"] if tiered_storage["enabled"] else {}),
+    **topic_config,
+}
 smoke_topic = k8s.apiextensions.CustomResource(
     "kafka-smoke-topic",
     api_version="kafka.strimzi.io/v1",
@@ -263,10 +620,893 @@ smoke_topic = k8s.apiextensions.CustomResource(
     spec={
         "partitions": topic_partitions,
         "replicas": topic_replicas,
+        **({"config": smoke_topic_config} if smoke_topic_config else {}),
     },
     opts=pulumi.ResourceOptions(depends_on=[kafka_cluster]),
 )
 
+
+def topic_resource_name(name: str) -> str:
+    """Kubernetes name for a Kafka topic; dots and underscores become dashes."""
+    return re.sub(r"[^a-z0-9-]+", "-", name.lower()).strip("-")
+
+
+# kafka:topics entries are {name, partitions, replicas, config, tieredStorage}.
+# Tiered topics start from tieredStorage.topicConfig when tiering is enabled.
+managed_topics: dict[str, k8s.apiextensions.CustomResource] = {}
+reserved_topics = {topic_name, *([benchmark["topic"]] if benchmark["enabled"] else [])}
+for topic in topics:
+    name = topic["name"]
+    resource_name = topic_resource_name(name)
+    if resource_name in managed_topics or name in reserved_topics:
+        raise ValueError(f"kafka:topics must not repeat {name}")
+    partitions = int(topic.get("partitions", 1))
+    replicas = int(topic.get("replicas", replication_factor))
+    if partitions < 1 or not 1 <= replicas <= broker_replicas:
+        raise ValueError(
+            f"kafka:topics {name} needs at least one partition and 1 to "
+            f"{broker_replicas} replicas"
+        )
+    managed_topic_config = {
+        **(
+            tiered_storage["topicConfig"]
+            if tiered_storage["enabled"] and topic.get("tieredStorage", True)
+            else {}
+        ),
+        **(topic.get("config") or {}),
+    }
+    managed_topics[resource_name] = k8s.apiextensions.CustomResource(
+        f"kafka-topic-{resource_name}",
+        api_version="kafka.strimzi.io/v1",
+        kind="KafkaTopic",
+        metadata={
+            "name": resource_name,
+            "namespace": namespace_name,
+            "labels": {
+                "strimzi.io/cluster": cluster_name,
+            },
+        },
+        spec={
+            **({"topicName": name} if name != resource_name else {}),
+            "partitions": partitions,
+            "replicas": replicas,
+            **({"config": managed_topic_config} if managed_topic_config else {}),
+        },
+        opts=pulumi.ResourceOptions(depends_on=[kafka_cluster]),
+    )
+
+if cruise_control["enabled"]:
+    rebalance_spec = {
+        "concurrentPartitionMovementsPerBroker": int(
+            cruise_control["concurrentPartitionMovementsPerBroker"]
+        ),
+        "replicationThrottle": int(cruise_control["replicationThrottleBytesPerSec"]),
+    }
+    rebalance_template = k8s.apiextensions.CustomResource(
+        "kafka-rebalance-template",
+        api_version="kafka.strimzi.io/v1",
+        kind="KafkaRebalance",
+        metadata={
+            "name": REBALANCE_TEMPLATE_NAME,
+            "namespace": namespace_name,
+            "labels": {
+                "strimzi.io/cluster": cluster_name,
+            },
+            "annotations": {
+                "strimzi.io/rebalance-template": "true",
+            },
+        },
+        spec=rebalance_spec,
+        opts=pulumi.ResourceOptions(depends_on=[kafka_cluster]),
+    )
+
+    # A standing full rebalance: Cruise Control keeps a proposal for it, and
+    # `strimzi.io/rebalance=refresh` / `approve` annotations drive it.
+    kafka_rebalance = k8s.apiextensions.CustomResource(
+        "kafka-rebalance",
+        api_version="kafka.strimzi.io/v1",
+        kind="KafkaRebalance",
+        metadata={
+            "name": f"{cluster_name}-rebalance",
+            "namespace": namespace_name,
+            "labels": {
+                "strimzi.io/cluster": cluster_name,
+            },
+            **(
+                {"annotations": {"strimzi.io/rebalance-auto-approval": "true"}}
+                if cruise_control["autoApprove"]
+                else {}
+            ),
+        },
+        spec={
+            "mode": "full",
+            **rebalance_spec,
+        },
+        opts=pulumi.ResourceOptions(depends_on=[kafka_cluster]),
+    )
+
+iceberg_connectors: dict[str, k8s.apiextensions.CustomResource] = {}
+if iceberg_sink["enabled"]:
+    rustfs_stack = RustfsStack(rustfs_stack_ref)
+    trino_stack = TrinoStack(trino_stack_ref)
+    postgres_service_host = PostgresStack(postgres_stack_ref).service_fqdn(
+        postgres_pool_mode
+    )
+    trino_credentials = k8s.core.v1.Secret.get(
+        "trino-catalog-credentials",
+        f"{trino_namespace}/{trino_credentials_secret_name}",
+    )
+
+    # Same JDBC role and RustFS keys as Trino; data values stay base64.
+    iceberg_sink_credentials = k8s.core.v1.Secret(
+        "kafka-iceberg-sink",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name=ICEBERG_SINK_SECRET_NAME,
+            namespace=kafka_namespace.metadata.name,
+            labels=labels,
+        ),
+        type="Opaque",
+        data=pulumi.Output.secret(
+            trino_credentials.data.apply(
+                lambda data: {
+                    "jdbc-user": data["TRINO_ICEBERG_JDBC_USER"],
+                    "jdbc-password": data["TRINO_ICEBERG_JDBC_PASSWORD"],
+                    "access-key": data["TRINO_S3_ACCESS_KEY"],
+                    "secret-key": data["TRINO_S3_SECRET_KEY"],
+                }
+            )
+        ),
+        opts=pulumi.ResourceOptions(depends_on=[kafka_namespace, trino_credentials]),
+    )
+
+    # Connectors share one control topic for their commit coordination.
+    iceberg_control_topic = k8s.apiextensions.CustomResource(
+        "kafka-iceberg-control-topic",
+        api_version="kafka.strimzi.io/v1",
+        kind="KafkaTopic",
+        metadata={
+            "name": "control-iceberg",
+            "namespace": namespace_name,
+            "labels": {
+                "strimzi.io/cluster": cluster_name,
+            },
+        },
+        spec={
+            "partitions": 1,
+            "replicas": replication_factor,
+        },
+        opts=pulumi.ResourceOptions(depends_on=[kafka_cluster]),
+    )
+
+    iceberg_connect = k8s.apiextensions.CustomResource(
+        "kafka-iceberg-connect",
+        api_version="kafka.strimzi.io/v1",
+        kind="KafkaConnect",
+        metadata={
+            "name": "iceberg",
+            "namespace": namespace_name,
+            "labels": labels,
+            "annotations": {
+                "strimzi.io/use-connector-resources": "true",
+            },
+        },
+        spec={
+            "version": kafka_version,
+            "replicas": int(iceberg_sink["replicas"]),
+            "image": iceberg_sink["image"],
+            "bootstrapServers": f"{cluster_name}-kafka-bootstrap:9092",
+            "groupId": "iceberg-connect",
+            "offsetStorageTopic": "iceberg-connect-offsets",
+            "configStorageTopic": "iceberg-connect-configs",
+            "statusStorageTopic": "iceberg-connect-status",
+            "config": {
+                "config.storage.replication.factor": replication_factor,
+                "offset.storage.replication.factor": replication_factor,
+                "status.storage.replication.factor": replication_factor,
+                "key.converter": "org.apache.kafka.connect.storage.StringConverter",
+                "value.converter": "org.apache.kafka.connect.json.JsonConverter",
+                "value.converter.schemas.enable": "false",
+            },
+            "resources": {
+                "requests": {
+                    "cpu": "250m",
+                    "memory": "1Gi",
+                },
+                "limits": {
+                    "cpu": "2",
+                    "memory": "2Gi",
+                },
+            },
+            "jvmOptions": {
+                "-Xms": "512m",
+                "-Xmx": "1536m",
+            },
+            # S3FileIO reads the RustFS keys through the AWS default chain.
+            "template": {
+                "connectContainer": {
+                    "env": [
+                        {
+                            "name": name,
+                            "valueFrom": {
+                                "secretKeyRef": {
+                                    "name": ICEBERG_SINK_SECRET_NAME,
+                                    "key": key,
+                                },
+                            },
+                        }
+                        for name, key in (
+                            ("ICEBERG_JDBC_USER", "jdbc-user"),
+                            ("ICEBERG_JDBC_PASSWORD", "jdbc-password"),
+                            ("AWS_ACCESS_KEY_ID", "access-key"),
+                            ("AWS_SECRET_ACCESS_KEY", "secret-key"),
+                        )
+                    ]
+                    + [
+                        {"name": "AWS_REGION", "value": AWS_DEFAULT_REGION},
+                    ],
+                },
+            },
+        },
+        opts=pulumi.ResourceOptions(
+            depends_on=[kafka_cluster, iceberg_sink_credentials, iceberg_control_topic]
+        ),
+    )
+
+    write_properties = {
+        "write.format.default": "parquet",
+        "write.target-file-size-bytes": str(int(iceberg_sink["targetFileSizeBytes"])),
+        "write.parquet.compression-codec": iceberg_sink["compressionCodec"],
+    }
+    # kafka:icebergSink tables entries are {topic, table, partitionBy, tasksMax,
+    # config}; a table without a namespace lands in icebergSink.namespace.
+    for sink_table in iceberg_sink["tables"]:
+        table = sink_table.get("table") or topic_resource_name(
+            sink_table["topic"]
+        ).replace("-", "_")
+        if "." not in table:
+            table = f"{iceberg_sink['namespace']}.{table}"
+        connector_name = f"iceberg-{topic_resource_name(table)}"
+        if connector_name in iceberg_connectors:
+            raise ValueError(f"kafka:icebergSink tables must not repeat {table}")
+        iceberg_connectors[connector_name] = k8s.apiextensions.CustomResource(
+            f"kafka-connector-{connector_name}",
+            api_version="kafka.strimzi.io/v1",
+            kind="KafkaConnector",
+            metadata={
+                "name": connector_name,
+                "namespace": namespace_name,
+                "labels": {
+                    "strimzi.io/cluster": "iceberg",
+                },
+            },
+            spec={
+                "class": "org.apache.iceberg.connect.IcebergSinkConnector",
+                "tasksMax": int(sink_table.get("tasksMax", 1)),
+                "config": {
+                    "topics": sink_table["topic"],
+                    "iceberg.tables": table,
+                    "iceberg.tables.auto-create-enabled": "true",
+                    "iceberg.tables.evolve-schema-enabled": "true",
+                    **(
+                        {
+                            "iceberg.tables.default-partition-by": ",".join(
+                                sink_table["partitionBy"]
+                            )
+                        }
+                        if sink_table.get("partitionBy")
+                        else {}
+                    ),
+                    "iceberg.control.topic": "control-iceberg",
+                    "iceberg.control.commit.interval-ms": str(
+                        int(iceberg_sink["commitIntervalMs"])
+                    ),
+                    "iceberg.control.commit.timeout-ms": str(
+                        int(iceberg_sink["commitTimeoutMs"])
+                    ),
+                    **{
+                        f"iceberg.tables.auto-create-props.{key}": value
+                        for key, value in write_properties.items()
+                    },
+                    **{
+                        f"iceberg.tables.write-props.{key}": value
+                        for key, value in write_properties.items()
+                    },
+                    # The JDBC catalog name is what makes these Trino's tables.
+                    "iceberg.catalog": trino_stack.iceberg_jdbc_catalog_name,
+                    "iceberg.catalog.catalog-impl": (
+                        "org.apache.iceberg.jdbc.JdbcCatalog"
+                    ),
+                    "iceberg.catalog.uri": pulumi.Output.format(
+                        "jdbc:postgresql://{0}:5432/{1}",
+                        postgres_service_host,
+                        trino_stack.iceberg_database,
+                    ),
+                    "iceberg.catalog.jdbc.user": "${strimzienv:ICEBERG_JDBC_USER}",
+                    "iceberg.catalog.jdbc.password": (
+                        "${strimzienv:ICEBERG_JDBC_PASSWORD}"
+                    ),
+                    "iceberg.catalog.warehouse": trino_stack.iceberg_warehouse,
+                    "iceberg.catalog.io-impl": "org.apache.iceberg.aws.s3.S3FileIO",
+                    "iceberg.catalog.s3.endpoint": rustfs_stack.s3_endpoint_url,
+                    "iceberg.catalog.s3.path-style-access": "true",
+                    "iceberg.catalog.client.region": AWS_DEFAULT_REGION,
+                    **(sink_table.get("config") or {}),
+                },
+            },
+            opts=pulumi.ResourceOptions(depends_on=[iceberg_connect]),
+        )
+
+# Topic replication factors only apply when a topic is created, so internal
+# topics made by a single broker stay at one replica after a scale-up. This
+# Job adds replicas to them before kafka:minInsyncReplicas is raised.
+if broker_replicas > 1:
+    internal_topic_names = [
+        *(CRUISE_CONTROL_TOPICS if cruise_control["enabled"] else ()),
+        *(
+            (
+                "iceberg-connect-offsets",
+                "iceberg-connect-configs",
+                "iceberg-connect-status",
+            )
+            if iceberg_sink["enabled"]
+            else ()
+        ),
+    ]
+    internal_topics_files = k8s.core.v1.ConfigMap(
+        "kafka-internal-topics",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="kafka-internal-topics",
+            namespace=kafka_namespace.metadata.name,
+            labels=labels,
+        ),
+        data={
+            "plan.py": """
+import json
+import os
+import re
+
+PARTITION = re.compile(r"Topic: (\\S+)\\s+Partition: (\\d+)\\s.*?Replicas: ([\\d,]+)")
+
+
+def read(path):
+    with open(path, encoding="utf-8") as file:
+        return file.read()
+
+
+def main():
+    extra_topics = set(filter(None, os.environ["TOPICS"].split(",")))
+    brokers = sorted({int(i) for i in re.findall(r"\\(id: (\\d+)", read("/work/brokers.txt"))})
+    target = min(int(os.environ["REPLICATION_FACTOR"]), len(brokers))
+    partitions = []
+    for topic, partition, replicas in PARTITION.findall(read("/work/describe.txt")):
+        if not topic.startswith("__") and topic not in extra_topics:
+            continue
+        replicas = [int(replica) for replica in replicas.split(",")]
+        if len(replicas) >= target:
+            continue
+        # Start from a different broker per partition to spread the copies.
+        start = int(partition) % len(brokers)
+        for broker in brokers[start:] + brokers[:start]:
+            if len(replicas) >= target:
+                break
+            if broker not in replicas:
+                replicas.append(broker)
+        partitions.append(
+            {"topic": topic, "partition": int(partition), "replicas": replicas}
+        )
+    if partitions:
+        with open("/work/reassignment.json", "w", encoding="utf-8") as file:
+            json.dump({"version": 1, "partitions": partitions}, file)
+    print(f"{len(partitions)} partitions below {target} replicas")
+
+
+if __name__ == "__main__":
+    main()
+""".lstrip(),
+        },
+        opts=pulumi.ResourceOptions(depends_on=[kafka_namespace]),
+    )
+
+    internal_topics_env = [
+        k8s.core.v1.EnvVarArgs(
+            name="BOOTSTRAP_SERVERS",
+            value=f"{cluster_name}-kafka-bootstrap:9092",
+        ),
+        k8s.core.v1.EnvVarArgs(name="BROKER_REPLICAS", value=str(broker_replicas)),
+        k8s.core.v1.EnvVarArgs(
+            name="REPLICATION_FACTOR", value=str(replication_factor)
+        ),
+        k8s.core.v1.EnvVarArgs(name="TOPICS", value=",".join(internal_topic_names)),
+        k8s.core.v1.EnvVarArgs(
+            name="THROTTLE",
+            value=str(int(cruise_control["replicationThrottleBytesPerSec"])),
+        ),
+        k8s.core.v1.EnvVarArgs(name="KAFKA_HEAP_OPTS", value="-Xms128m -Xmx256m"),
+    ]
+    internal_topics_resources = k8s.core.v1.ResourceRequirementsArgs(
+        requests={"cpu": "100m", "memory": "256Mi"},
+        limits={"cpu": "500m", "memory": "512Mi"},
+    )
+    internal_topics_work = k8s.core.v1.VolumeMountArgs(
+        name="work",
+        mount_path="/work",
+    )
+    # Rerun whenever the broker count or the plan changes.
+    internal_topics_task_id = pulumi.Output.all(
+        internal_topics_files.data,
+        broker_replicas,
+        replication_factor,
+        internal_topic_names,
+    ).apply(stable_task_id)
+
+    k8s.batch.v1.Job(
+        "kafka-internal-topics",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="kafka-internal-topics",
+            namespace=kafka_namespace.metadata.name,
+            labels=labels,
+            annotations={
+                "pulumi.com/waitFor": "jsonpath={.status.succeeded}=1",
+                "kafka.k8s.kevin/task-id": internal_topics_task_id,
+            },
+        ),
+        spec=k8s.batch.v1.JobSpecArgs(
+            backoff_limit=4,
+            active_deadline_seconds=3600,
+            ttl_seconds_after_finished=86400,
+            template=k8s.core.v1.PodTemplateSpecArgs(
+                metadata=k8s.meta.v1.ObjectMetaArgs(
+                    labels=labels,
+                    annotations={"kafka.k8s.kevin/task-id": internal_topics_task_id},
+                ),
+                spec=k8s.core.v1.PodSpecArgs(
+                    restart_policy="OnFailure",
+                    init_containers=[
+                        # The Kafka resource is not awaited, so wait here for
+                        # the new brokers to join before planning.
+                        k8s.core.v1.ContainerArgs(
+                            name="describe",
+                            image=benchmark_image,
+                            command=["sh", "-ceu"],
+                            args=[
+                                """
+until /opt/kafka/bin/kafka-broker-api-versions.sh \\
+    --bootstrap-server "$BOOTSTRAP_SERVERS" > /work/brokers.txt \\
+  && [ "$(grep -c '(id: ' /work/brokers.txt)" -ge "$BROKER_REPLICAS" ]; do
+  echo "waiting for $BROKER_REPLICAS brokers"
+  sleep 10
+done
+/opt/kafka/bin/kafka-topics.sh \\
+  --bootstrap-server "$BOOTSTRAP_SERVERS" \\
+  --describe \\
+  > /work/describe.txt
+""".strip(),
+                            ],
+                            env=internal_topics_env,
+                            volume_mounts=[internal_topics_work],
+                            resources=internal_topics_resources,
+                        ),
+                        k8s.core.v1.ContainerArgs(
+                            name="plan",
+                            image="docker.io/library/python:3.13-alpine",
+                            command=["python", "/etc/kafka-internal-topics/plan.py"],
+                            env=internal_topics_env,
+                            volume_mounts=[
+                                internal_topics_work,
+                                k8s.core.v1.VolumeMountArgs(
+                                    name="internal-topics",
+                                    mount_path="/etc/kafka-internal-topics",
+                                    read_only=True,
+                                ),
+                            ],
+                            resources=k8s.core.v1.ResourceRequirementsArgs(
+                                requests={"cpu": "10m", "memory": "32Mi"},
+                                limits={"cpu": "100m", "memory": "128Mi"},
+                            ),
+                        ),
+                    ],
+                    containers=[
+                        # --verify also clears the throttle once every move
+                        # has finished.
+                        k8s.core.v1.ContainerArgs(
+                            name="reassign",
+                            image=benchmark_image,
+                            command=["sh", "-ceu"],
+                            args=[
+                                """
+if [ ! -s /work/reassignment.json ]; then
+  echo "internal topics already have enough replicas"
+  exit 0
+fi
+cat /work/reassignment.json
+/opt/kafka/bin/kafka-reassign-partitions.sh \\
+  --bootstrap-server "$BOOTSTRAP_SERVERS" \\
+  --reassignment-json-file /work/reassignment.json \\
+  --throttle "$THROTTLE" \\
+  --execute
+while /opt/kafka/bin/kafka-reassign-partitions.sh \\
+    --bootstrap-server "$BOOTSTRAP_SERVERS" \\
+    --reassignment-json-file /work/reassignment.json \\
+    --verify | tee /work/verify.txt | grep -q 'in progress'; do
+  sleep 15
+done
+cat /work/verify.txt
+""".strip(),
+                            ],
+                            env=internal_topics_env,
+                            volume_mounts=[internal_topics_work],
+                            resources=internal_topics_resources,
+                        )
+                    ],
+                    volumes=[
+                        k8s.core.v1.VolumeArgs(
+                            name="work",
+                            empty_dir=k8s.core.v1.EmptyDirVolumeSourceArgs(),
+                        ),
+                        k8s.core.v1.VolumeArgs(
+                            name="internal-topics",
+                            config_map=k8s.core.v1.ConfigMapVolumeSourceArgs(
+                                name=internal_topics_files.metadata.name,
+                            ),
+                        ),
+                    ],
+                ),
+            ),
+        ),
+        opts=pulumi.ResourceOptions(
+            depends_on=[kafka_cluster, internal_topics_files]
+            + ([iceberg_connect] if iceberg_sink["enabled"] else []),
+            delete_before_replace=True,
+            custom_timeouts=pulumi.CustomTimeouts(create="60m"),
+        ),
+    )
+
+if benchmark["enabled"]:
+    clickhouse_stack = ClickHouseStack(clickhouse_stack_ref)
+    benchmark_topic = k8s.apiextensions.CustomResource(
+        "kafka-benchmark-topic",
+        api_version="kafka.strimzi.io/v1",
+        kind="KafkaTopic",
+        metadata={
+            "name": benchmark["topic"],
+            "namespace": namespace_name,
+            "labels": {
+                "strimzi.io/cluster": cluster_name,
+            },
+        },
+        spec={
+            "partitions": int(benchmark["partitions"]),
+            "replicas": replication_factor,
+            # Benchmark records are only needed for the length of a run.
+            "config": {
+                "retention.ms": str(60 * 60 * 1000),
+            },
+        },
+        opts=pulumi.ResourceOptions(depends_on=[kafka_cluster]),
+    )
+
+    benchmark_credentials = k8s.core.v1.Secret(
+        "kafka-benchmark-clickhouse",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name=BENCHMARK_SECRET_NAME,
+            namespace=kafka_namespace.metadata.name,
+            labels=labels,
+        ),
+        type="Opaque",
+        string_data={
+            "username": clickhouse_stack.username(clickhouse_user),
+            "password": clickhouse_stack.password(clickhouse_user),
+        },
+        opts=pulumi.ResourceOptions(depends_on=[kafka_namespace]),
+    )
+
+    benchmark_files = k8s.core.v1.ConfigMap(
+        "kafka-benchmark",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="kafka-benchmark",
+            namespace=kafka_namespace.metadata.name,
+            labels=labels,
+        ),
+        data={
+            "publish.py": """
+import json
+import os
+import re
+import sys
+import urllib.parse
+import urllib.request
+import uuid
+
+CLICKHOUSE_URL = os.environ["CLICKHOUSE_URL"]
+TABLE = f"{os.environ['CLICKHOUSE_DATABASE']}.{os.environ['CLICKHOUSE_TABLE']}"
+# The producer prints a running line every few seconds and a final one that
+# adds the latency percentiles.
+PRODUCER_SUMMARY = re.compile(
+    r"(?P<records>\\d+) records sent, (?P<records_per_sec>[\\d.]+) records/sec "
+    r"\\((?P<mb_per_sec>[\\d.]+) MB/sec\\), (?P<avg_latency_ms>[\\d.]+) ms avg latency, "
+    r"(?P<max_latency_ms>[\\d.]+) ms max latency, (?P<p50_ms>\\d+) ms 50th, "
+    r"(?P<p95_ms>\\d+) ms 95th, (?P<p99_ms>\\d+) ms 99th, (?P<p999_ms>\\d+) ms 99.9th"
+)
+
+
+def clickhouse(query, body=b""):
+    url = f"{CLICKHOUSE_URL}/?{urllib.parse.urlencode({'query': query})}"
+    request = urllib.request.Request(
+        url,
+        data=body,
+        headers={
+            "X-ClickHouse-User": os.environ["CLICKHOUSE_USER"],
+            "X-ClickHouse-Key": os.environ["CLICKHOUSE_PASSWORD"],
+        },
+    )
+    with urllib.request.urlopen(request, timeout=60) as response:
+        return response.read()
+
+
+def producer_results(path):
+    with open(path, encoding="utf-8") as handle:
+        matches = list(PRODUCER_SUMMARY.finditer(handle.read()))
+    if not matches:
+        raise SystemExit(f"no producer summary in {path}")
+    return {key: float(value) for key, value in matches[-1].groupdict().items()}
+
+
+def consumer_results(path):
+    with open(path, encoding="utf-8") as handle:
+        lines = [line.strip() for line in handle if line.strip()]
+    for index, line in enumerate(lines[:-1]):
+        if line.startswith("start.time"):
+            header = [column.strip() for column in line.split(",")]
+            values = [value.strip() for value in lines[index + 1].split(",")]
+            return dict(zip(header, values))
+    raise SystemExit(f"no consumer summary in {path}")
+
+
+def main():
+    producer = producer_results("/results/producer.txt")
+    consumer = consumer_results("/results/consumer.txt")
+    with open("/results/started_at", encoding="utf-8") as handle:
+        started_at = handle.read().strip()
+    record = {
+        "run_id": str(uuid.uuid4()),
+        "started_at": started_at,
+        "kafka_version": os.environ["KAFKA_VERSION"],
+        "topic": os.environ["TOPIC"],
+        "partitions": int(os.environ["PARTITIONS"]),
+        "records": int(producer["records"]),
+        "record_size": int(os.environ["RECORD_SIZE"]),
+        "batch_size": int(os.environ["BATCH_SIZE"]),
+        "linger_ms": int(os.environ["LINGER_MS"]),
+        "compression": os.environ["COMPRESSION"],
+        "acks": os.environ["ACKS"],
+        "producer_records_per_sec": producer["records_per_sec"],
+        "producer_mb_per_sec": producer["mb_per_sec"],
+        "producer_avg_latency_ms": producer["avg_latency_ms"],
+        "producer_p50_ms": producer["p50_ms"],
+        "producer_p99_ms": producer["p99_ms"],
+        "producer_max_latency_ms": producer["max_latency_ms"],
+        "consumer_records_per_sec": float(consumer["nMsg.sec"]),
+        "consumer_mb_per_sec": float(consumer["MB.sec"]),
+        "consumer_fetch_mb_per_sec": float(consumer["fetch.MB.sec"]),
+    }
+
+    clickhouse(f"CREATE DATABASE IF NOT EXISTS {os.environ['CLICKHOUSE_DATABASE']}")
+    clickhouse(f'''
+CREATE TABLE IF NOT EXISTS {TABLE} (
+    run_id UUID,
+    started_at DateTime('UTC'),
+    kafka_version LowCardinality(String),
+    topic LowCardinality(String),
+    partitions UInt16,
+    records UInt64,
+    record_size UInt32,
+    batch_size UInt32,
+    linger_ms UInt32,
+    compression LowCardinality(String),
+    acks LowCardinality(String),
+    producer_records_per_sec Float64,
+    producer_mb_per_sec Float64,
+    producer_avg_latency_ms Float64,
+    producer_p50_ms Float64,
+    producer_p99_ms Float64,
+    producer_max_latency_ms Float64,
+    consumer_records_per_sec Float64,
+    consumer_mb_per_sec Float64,
+    consumer_fetch_mb_per_sec Float64
+)
+ENGINE = MergeTree
+ORDER BY (compression, acks, started_at)
+''')
+    clickhouse(f"INSERT INTO {TABLE} FORMAT JSONEachRow", json.dumps(record).encode())
+    print(json.dumps(record, indent=2), flush=True)
+    return 0
+
+
+sys.exit(main())
+""".lstrip(),
+        },
+        opts=pulumi.ResourceOptions(depends_on=[kafka_namespace]),
+    )
+
+    benchmark_env = [
+        k8s.core.v1.EnvVarArgs(
+            name="BOOTSTRAP_SERVERS",
+            value=f"{cluster_name}-kafka-bootstrap:9092",
+        ),
+        k8s.core.v1.EnvVarArgs(name="KAFKA_VERSION", value=kafka_version),
+        k8s.core.v1.EnvVarArgs(name="TOPIC", value=benchmark["topic"]),
+        k8s.core.v1.EnvVarArgs(
+            name="PARTITIONS", value=str(int(benchmark["partitions"]))
+        ),
+        k8s.core.v1.EnvVarArgs(name="RECORDS", value=str(int(benchmark["records"]))),
+        k8s.core.v1.EnvVarArgs(
+            name="RECORD_SIZE", value=str(int(benchmark["recordSize"]))
+        ),
+        k8s.core.v1.EnvVarArgs(
+            name="THROUGHPUT", value=str(int(benchmark["throughput"]))
+        ),
+        k8s.core.v1.EnvVarArgs(
+            name="BATCH_SIZE", value=str(int(benchmark["batchSize"]))
+        ),
+        k8s.core.v1.EnvVarArgs(name="LINGER_MS", value=str(int(benchmark["lingerMs"]))),
+        k8s.core.v1.EnvVarArgs(name="COMPRESSION", value=benchmark["compression"]),
+        k8s.core.v1.EnvVarArgs(name="ACKS", value=str(benchmark["acks"])),
+        k8s.core.v1.EnvVarArgs(name="KAFKA_HEAP_OPTS", value="-Xms256m -Xmx512m"),
+    ]
+    perf_test_resources = k8s.core.v1.ResourceRequirementsArgs(
+        requests={"cpu": "250m", "memory": "512Mi"},
+        limits={"cpu": "1", "memory": "768Mi"},
+    )
+    benchmark_results = k8s.core.v1.VolumeMountArgs(
+        name="results",
+        mount_path="/results",
+    )
+    # Rerun whenever the settings or the script change; skipAwait keeps
+    # `pulumi up` from waiting for the run.
+    benchmark_task_id = pulumi.Output.all(
+        benchmark_files.data,
+        json.dumps(benchmark, sort_keys=True),
+        kafka_version,
+    ).apply(stable_task_id)
+
+    k8s.batch.v1.Job(
+        "kafka-benchmark",
+        metadata=k8s.meta.v1.ObjectMetaArgs(
+            name="kafka-benchmark",
+            namespace=kafka_namespace.metadata.name,
+            labels=labels,
+            annotations={
+                "pulumi.com/skipAwait": "true",
+                "kafka.k8s.kevin/task-id": benchmark_task_id,
+            },
+        ),
+        spec=k8s.batch.v1.JobSpecArgs(
+            backoff_limit=0,
+            active_deadline_seconds=1800,
+            ttl_seconds_after_finished=7 * 86400,
+            template=k8s.core.v1.PodTemplateSpecArgs(
+                metadata=k8s.meta.v1.ObjectMetaArgs(
+                    labels=labels,
+                    annotations={"kafka.k8s.kevin/task-id": benchmark_task_id},
+                ),
+                spec=k8s.core.v1.PodSpecArgs(
+                    restart_policy="Never",
+                    init_containers=[
+                        k8s.core.v1.ContainerArgs(
+                            name="producer",
+                            image=benchmark_image,
+                            command=["sh", "-ceu"],
+                            args=[
+                                """
+date -u '+%Y-%m-%d %H:%M:%S' > /results/started_at
+/opt/kafka/bin/kafka-producer-perf-test.sh \\
+  --topic "$TOPIC" \\
+  --num-records "$RECORDS" \\
+  --record-size "$RECORD_SIZE" \\
+  --throughput "$THROUGHPUT" \\
+  --producer-props \\
+    bootstrap.servers="$BOOTSTRAP_SERVERS" \\
+    acks="$ACKS" \\
+    batch.size="$BATCH_SIZE" \\
+    linger.ms="$LINGER_MS" \\
+    compression.type="$COMPRESSION" \\
+  > /results/producer.txt
+cat /results/producer.txt
+""".strip(),
+                            ],
+                            env=benchmark_env,
+                            volume_mounts=[benchmark_results],
+                            resources=perf_test_resources,
+                        ),
+                        k8s.core.v1.ContainerArgs(
+                            name="consumer",
+                            image=benchmark_image,
+                            command=["sh", "-ceu"],
+                            args=[
+                                """
+/opt/kafka/bin/kafka-consumer-perf-test.sh \\
+  --bootstrap-server "$BOOTSTRAP_SERVERS" \\
+  --topic "$TOPIC" \\
+  --messages "$RECORDS" \\
+  --group "kafka-benchmark-$(date +%s)" \\
+  --timeout 60000 \\
+  > /results/consumer.txt
+cat /results/consumer.txt
+""".strip(),
+                            ],
+                            env=benchmark_env,
+                            volume_mounts=[benchmark_results],
+                            resources=perf_test_resources,
+                        ),
+                    ],
+                    containers=[
+                        k8s.core.v1.ContainerArgs(
+                            name="publish",
+                            image="docker.io/library/python:3.13-alpine",
+                            command=["python", "/etc/kafka-benchmark/publish.py"],
+                            env=[
+                                *benchmark_env,
+                                k8s.core.v1.EnvVarArgs(
+                                    name="CLICKHOUSE_URL",
+                                    value=pulumi.Output.concat(
+                                        "http://",
+                                        clickhouse_stack.service_fqdn,
+                                        ":",
+                                        clickhouse_stack.http_port.apply(str),
+                                    ),
+                                ),
+                                k8s.core.v1.EnvVarArgs(
+                                    name="CLICKHOUSE_DATABASE",
+                                    value=benchmark["clickhouseDatabase"],
+                                ),
+                                k8s.core.v1.EnvVarArgs(
+                                    name="CLICKHOUSE_TABLE",
+                                    value=benchmark["clickhouseTable"],
+                                ),
+                                secret_env_var(
+                                    "CLICKHOUSE_USER", BENCHMARK_SECRET_NAME, "username"
+                                ),
+                                secret_env_var(
+                                    "CLICKHOUSE_PASSWORD",
+                                    BENCHMARK_SECRET_NAME,
+                                    "password",
+                                ),
+                            ],
+                            volume_mounts=[
+                                benchmark_results,
+                                k8s.core.v1.VolumeMountArgs(
+                                    name="benchmark",
+                                    mount_path="/etc/kafka-benchmark",
+                                    read_only=True,
+                                ),
+                            ],
+                            resources=k8s.core.v1.ResourceRequirementsArgs(
+                                requests={"cpu": "10m", "memory": "32Mi"},
+                                limits={"cpu": "100m", "memory": "128Mi"},
+                            ),
+                        )
+                    ],
+                    volumes=[
+                        k8s.core.v1.VolumeArgs(
+                            name="results",
+                            empty_dir=k8s.core.v1.EmptyDirVolumeSourceArgs(),
+                        ),
+                        k8s.core.v1.VolumeArgs(
+                            name="benchmark",
+                            config_map=k8s.core.v1.ConfigMapVolumeSourceArgs(
+                                name=benchmark_files.metadata.name,
+                            ),
+                        ),
+                    ],
+                ),
+            ),
+        ),
+        opts=pulumi.ResourceOptions(
+            depends_on=[benchmark_topic, benchmark_credentials, benchmark_files],
+            delete_before_replace=True,
+        ),
+    )
+
 strimzi_operator_podmonitor = PodMonitor(
     "strimzi-operator-podmonitor",
     metadata={
@@ -341,7 +1581,19 @@ pulumi.export("tailnetEnabled", tailnet_enabled)
 pulumi.export("tailnetBootstrapServers", f"{tailnet_bootstrap_hostname}:{tailnet_port}")
 pulumi.export("tailnetBroker", f"{tailnet_advertised_broker_host}:{tailnet_port}")
 pulumi.export("nodePool", kafka_node_pool.metadata["name"])
+pulumi.export("brokerReplicas", broker_replicas)
+pulumi.export("replicationFactor", replication_factor)
+pulumi.export("minInsyncReplicas", min_insync_replicas)
+pulumi.export("cruiseControlEnabled", cruise_control["enabled"])
+pulumi.export("topics", [topic["name"] for topic in topics])
+pulumi.export("icebergSinkEnabled", iceberg_sink["enabled"])
+pulumi.export("icebergSinkConnectors", list(iceberg_connectors))
 pulumi.export("storageClassName", storage_class_name)
 pulumi.export("storageSize", storage_size)
 pulumi.export("deleteClaim", delete_claim)
 pulumi.export("smokeTopic", smoke_topic.metadata["name"])
+pulumi.export("tieredStorageEnabled", tiered_storage["enabled"])
+pulumi.export(
+    "tieredStorageBucket",
+    tiered_storage["bucket"] if tiered_storage["enabled"] else None,
+)
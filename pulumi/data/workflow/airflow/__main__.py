@@ -3,6 +3,7 @@ from pathlib import Path
 import pulumi_kubernetes as k8s
 import pulumi_random as random
 from infra_helpers.grafana import dashboard_config_maps
+from infra_helpers.helm import cached_chart
 from infra_helpers.postgres import PostgresStack, create_database_owner
 from pulumi_monitoring_crds.monitoring.v1 import ServiceMonitor
 
@@ -31,7 +32,7 @@ labels = {
 }
 
 postgres = PostgresStack(postgres_stack_ref)
-postgres_service_host = postgres.rw_service_fqdn
+postgres_service_host = postgres.service_fqdn(config.get("postgresPoolMode"))
 
 database_password = random.RandomPassword(
     "airflow-database-password",
@@ -125,12 +126,9 @@ homelab_smoke()
 
 airflow_chart = k8s.helm.v3.Release(
     "airflow",
-    chart="airflow",
+    chart=cached_chart("airflow", chart_version, "https://airflow.apache.org"),
     name="airflow",
     namespace=namespace.metadata.name,
-    repository_opts=k8s.helm.v3.RepositoryOptsArgs(
-        repo="https://airflow.apache.org",
-    ),
     version=chart_version,
     timeout=900,
     wait_for_jobs=True,
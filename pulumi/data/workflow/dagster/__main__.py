@@ -3,6 +3,7 @@ from pathlib import Path
 import pulumi_kubernetes as k8s
 import pulumi_random as random
 from infra_helpers.grafana import dashboard_config_maps
+from infra_helpers.helm import cached_chart
 from infra_helpers.postgres import PostgresStack, create_database_owner
 
 import pulumi
@@ -32,7 +33,7 @@ labels = {
 }
 
 postgres = PostgresStack(postgres_stack_ref)
-postgres_service_host = postgres.rw_service_fqdn
+postgres_service_host = postgres.service_fqdn(config.get("postgresPoolMode"))
 
 database_password = random.RandomPassword(
     "dagster-database-password",
@@ -98,11 +99,8 @@ defs = Definitions(assets=[homelab_smoke])
 
 dagster_chart = k8s.helm.v4.Chart(
     "dagster",
-    chart="dagster",
+    chart=cached_chart("dagster", chart_version, "https://dagster-io.github.io/helm"),
     namespace=namespace_name,
-    repository_opts=k8s.helm.v4.RepositoryOptsArgs(
-        repo="https://dagster-io.github.io/helm",
-    ),
     version=chart_version,
     values={
         "fullnameOverride": "dagster",
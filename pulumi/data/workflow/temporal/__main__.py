@@ -1,7 +1,10 @@
 import pulumi_kubernetes as k8s
+from infra_helpers.helm import cached_chart
 
 import pulumi
 
+CHART_VERSION = "1.2.0"
+
 config = pulumi.Config()
 pgref = pulumi.StackReference(config.require("postgres_stack"))
 pg_host = pgref.require_output("rw_service_fqdn")
@@ -53,11 +56,10 @@ db_secret = k8s.core.v1.Secret(
 
 temporal_chart = k8s.helm.v4.Chart(
     "temporal",
-    chart="temporal",
-    repository_opts=k8s.helm.v4.RepositoryOptsArgs(
-        repo="https://temporalio.github.io/helm-charts",
+    chart=cached_chart(
+        "temporal", CHART_VERSION, "https://temporalio.github.io/helm-charts"
     ),
-    version="1.2.0",
+    version=CHART_VERSION,
     namespace=temporal_namespace.metadata.name,
     values={
         "server": {
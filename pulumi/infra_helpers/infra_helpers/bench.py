@@ -0,0 +1,252 @@
+"""Benchmark Pulumi program evaluation under mocks.
+
+`record` captures a project's stack config and the outputs of the stacks it
+references. `run` replays one project from that recording and reports import
+time, evaluation time, registered resources, time spent in `Output.apply`
+callbacks, and peak RSS. `all` runs every project in its own environment,
+writes one JSON report, and can fail on regressions against a baseline report.
+
+    python -m infra_helpers.bench record pulumi/apps/mediawiki --stack mx
+    python -m infra_helpers.bench all --stack mx --baseline /tmp/before.json
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+HELPERS_ROOT = Path(__file__).resolve().parent.parent
+PULUMI_ROOT = HELPERS_ROOT.parent
+# Same layout as mocks.recording_path; mocks imports pulumi, which the `all`
+# runner does not have.
+RECORDING_DIR = ".pulumi-mocks"
+REGRESSION_METRICS = (
+    "import_ms",
+    "evaluate_ms",
+    "apply_ms",
+    "resources",
+    "peak_rss_mib",
+)
+
+
+def discover_projects(stack: str) -> tuple[list[Path], list[Path]]:
+    """Split every Pulumi project into recorded and unrecorded for `stack`."""
+    recorded: list[Path] = []
+    unrecorded: list[Path] = []
+    for path in sorted(PULUMI_ROOT.rglob("Pulumi.yaml")):
+        if ".venv" in path.parts:
+            continue
+        if (path.parent / RECORDING_DIR / f"{stack}.json").is_file():
+            recorded.append(path.parent)
+        else:
+            unrecorded.append(path.parent)
+    return recorded, unrecorded
+
+
+def peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def record(project_dir: Path, stack: str) -> Path:
+    from infra_helpers import mocks
+
+    recording = mocks.record_config(project_dir, stack)
+    run, _ = mocks.run_program(
+        project_dir,
+        recording,
+        fetch_outputs=lambda name: mocks.fetch_stack_outputs(project_dir, name),
+    )
+    if run.error:
+        raise SystemExit(f"{project_dir}: {run.error}")
+
+    path = mocks.recording_path(project_dir, stack)
+    recording.save(path)
+    return path
+
+
+def run_one(project_dir: Path, stack: str) -> dict[str, Any]:
+    from infra_helpers import mocks
+
+    run, _ = mocks.run_program(project_dir, mocks.load_recording(project_dir, stack))
+    types: dict[str, int] = {}
+    for registered in run.resources:
+        types[registered.type] = types.get(registered.type, 0) + 1
+    return {
+        "import_ms": round(run.import_seconds * 1000, 1),
+        "evaluate_ms": round(run.evaluate_seconds * 1000, 1),
+        "apply_ms": round(run.apply_seconds * 1000, 1),
+        "apply_calls": run.apply_calls,
+        "resources": len(run.resources),
+        "resource_types": dict(sorted(types.items())),
+        "peak_rss_mib": peak_rss_mib(),
+        "error": run.error,
+    }
+
+
+def run_isolated(project_dir: Path, stack: str) -> dict[str, Any]:
+    """Run one project in its own uv environment so RSS and imports are its own."""
+    with tempfile.NamedTemporaryFile(suffix=".json") as output:
+        started = time.perf_counter()
+        proc = subprocess.run(
+            [
+                "uv",
+                "run",
+                "--quiet",
+                "--with-editable",
+                str(HELPERS_ROOT),
+                "python",
+                "-m",
+                "infra_helpers.bench",
+                "run",
+                ".",
+                "--stack",
+                stack,
+                "--output",
+                output.name,
+            ],
+            cwd=project_dir,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        wall = time.perf_counter() - started
+        raw = Path(output.name).read_text(encoding="utf-8")
+
+    if not raw:
+        tail = (proc.stderr or proc.stdout).strip().splitlines()[-5:]
+        return {"error": "\n".join(tail) or f"exit {proc.returncode}"}
+    result = json.loads(raw)
+    result["wall_ms"] = round(wall * 1000, 1)
+    return result
+
+
+def compare(
+    report: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    regressions: list[str] = []
+    for project, result in report["projects"].items():
+        before = baseline.get("projects", {}).get(project)
+        if not before or result.get("error") or before.get("error"):
+            continue
+        for metric in REGRESSION_METRICS:
+            old, new = before.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            if new > old * (1 + threshold):
+                regressions.append(
+                    f"{project}: {metric} {old} -> {new} (+{(new / old - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def print_report(report: dict[str, Any]) -> None:
+    rows = report["projects"]
+    width = max((len(project) for project in rows), default=7)
+    print(
+        f"{'PROJECT'.ljust(width)}  {'IMPORT ms':>9}  {'EVAL ms':>9}  "
+        f"{'APPLY ms':>9}  {'RES':>5}  {'RSS MiB':>8}"
+    )
+    for project, result in rows.items():
+        if result.get("error"):
+            print(f"{project.ljust(width)}  error: {result['error'].splitlines()[-1]}")
+            continue
+        print(
+            f"{project.ljust(width)}  {result['import_ms']:>9}  "
+            f"{result['evaluate_ms']:>9}  {result['apply_ms']:>9}  "
+            f"{result['resources']:>5}  {result['peak_rss_mib']:>8}"
+        )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser(
+        "record", help="record config and stack outputs"
+    )
+    record_parser.add_argument("projects", nargs="+", type=Path)
+    record_parser.add_argument("--stack", default="mx")
+
+    run_parser = commands.add_parser("run", help="benchmark one recorded project")
+    run_parser.add_argument("project", type=Path)
+    run_parser.add_argument("--stack", default="mx")
+    run_parser.add_argument("--output", type=Path)
+
+    all_parser = commands.add_parser("all", help="benchmark every recorded project")
+    all_parser.add_argument("projects", nargs="*", type=Path)
+    all_parser.add_argument("--stack", default="mx")
+    all_parser.add_argument("--output", type=Path)
+    all_parser.add_argument("--baseline", type=Path)
+    all_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="relative increase that counts as a regression (default: 0.25)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    if args.command == "record":
+        for project_dir in args.projects:
+            print(f"recorded {record(project_dir, args.stack)}")
+        return 0
+
+    if args.command == "run":
+        result = run_one(args.project, args.stack)
+        text = json.dumps(result, indent=2) + "\n"
+        if args.output:
+            args.output.write_text(text, encoding="utf-8")
+        else:
+            print(text, end="")
+        return 1 if result.get("error") else 0
+
+    if args.projects:
+        projects = [path.resolve() for path in args.projects]
+    else:
+        projects, unrecorded = discover_projects(args.stack)
+        for project_dir in unrecorded:
+            rel = project_dir.relative_to(PULUMI_ROOT).as_posix()
+            print(f"skipping {rel}: no {args.stack} recording", file=sys.stderr)
+    report: dict[str, Any] = {
+        "stack": args.stack,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "projects": {},
+    }
+    for project_dir in projects:
+        rel = project_dir.relative_to(PULUMI_ROOT).as_posix()
+        print(f"benchmarking {rel}", file=sys.stderr)
+        report["projects"][rel] = run_isolated(project_dir, args.stack)
+
+    output = args.output or Path(
+        f"/tmp/pulumi-{args.stack}-bench-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print_report(report)
+    print(f"\nreport: {output}")
+
+    failed = any(result.get("error") for result in report["projects"].values())
+    if args.baseline:
+        regressions = compare(
+            report,
+            json.loads(args.baseline.read_text(encoding="utf-8")),
+            args.threshold,
+        )
+        for line in regressions:
+            print(f"regression: {line}")
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,69 @@
+"""Grafana dashboard ConfigMaps for the kube-prometheus-stack sidecar.
+
+Dashboards are minified, one ConfigMap per dashboard by default. Passing a
+byte budget below the 1 MiB object limit packs them into as few ConfigMaps as
+fit instead. The size report shows what each dashboard costs:
+
+    python -m infra_helpers.grafana pulumi/core/operators/kuberay/dashboards
+"""
+
+import argparse
+import json
+import sys
 from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
 from pathlib import Path
 
 import pulumi_kubernetes as k8s
 
 import pulumi
 
+CONFIG_MAP_LIMIT_BYTES = 1024 * 1024
+# Headroom for metadata and managedFields, which count toward the same limit.
+DEFAULT_SHARD_BYTES = 900 * 1024
+
+
+@dataclass(frozen=True)
+class Dashboard:
+    file: str
+    value: str
+    source_bytes: int
+
+    @property
+    def stored_bytes(self) -> int:
+        return len(self.file) + len(self.value.encode())
+
 
 def default_dashboard_name(dashboard_file: str) -> str:
     return dashboard_file.removesuffix(".json")
 
 
+def load_dashboard(path: Path) -> Dashboard:
+    source = path.read_bytes()
+    minified = json.dumps(json.loads(source), separators=(",", ":"), ensure_ascii=False)
+    return Dashboard(path.name, minified, len(source))
+
+
+def pack_dashboards(
+    dashboards: Iterable[Dashboard], shard_bytes: int
+) -> list[list[Dashboard]]:
+    """Fill shards in order, so appending a dashboard never moves earlier ones."""
+    shards: list[list[Dashboard]] = [[]]
+    used = 0
+    for dashboard in dashboards:
+        if dashboard.stored_bytes > shard_bytes:
+            raise ValueError(
+                f"{dashboard.file} needs {dashboard.stored_bytes} bytes, over the "
+                f"{shard_bytes}-byte ConfigMap budget"
+            )
+        if shards[-1] and used + dashboard.stored_bytes > shard_bytes:
+            shards.append([])
+            used = 0
+        shards[-1].append(dashboard)
+        used += dashboard.stored_bytes
+    return shards if shards[0] else []
+
+
 def dashboard_config_maps(
     *,
     name_prefix: str,
@@ -19,30 +73,83 @@ def dashboard_config_maps(
     labels: Mapping[str, str] | None = None,
     opts: pulumi.ResourceOptions | None = None,
     dashboard_name: Callable[[str], str] = default_dashboard_name,
+    shard_bytes: int | None = None,
 ) -> list[k8s.core.v1.ConfigMap]:
-    config_maps: list[k8s.core.v1.ConfigMap] = []
+    """Create ConfigMaps holding minified dashboards.
+
+    Every dashboard gets its own `<name_prefix>-<dashboard_name(file)>`
+    ConfigMap. With `shard_bytes` set, dashboards are packed into
+    `<name_prefix>-0`, `<name_prefix>-1`, ... up to `shard_bytes` each instead.
+    """
+    if shard_bytes is not None and shard_bytes > CONFIG_MAP_LIMIT_BYTES:
+        raise ValueError(f"shard_bytes must not exceed {CONFIG_MAP_LIMIT_BYTES}")
+
     config_map_labels = {
         "grafana_dashboard": "1",
         **(labels or {}),
     }
+    dashboards = [
+        load_dashboard(dashboards_dir / dashboard_file)
+        for dashboard_file in dashboard_files
+    ]
+    if shard_bytes is None:
+        groups = {
+            f"{name_prefix}-{dashboard_name(dashboard.file)}": [dashboard]
+            for dashboard in dashboards
+        }
+    else:
+        groups = {
+            f"{name_prefix}-{index}": shard
+            for index, shard in enumerate(pack_dashboards(dashboards, shard_bytes))
+        }
 
-    for dashboard_file in dashboard_files:
-        name = dashboard_name(dashboard_file)
+    config_maps: list[k8s.core.v1.ConfigMap] = []
+    for name, group in groups.items():
         config_maps.append(
             k8s.core.v1.ConfigMap(
-                f"{name_prefix}-{name}",
+                name,
                 metadata=k8s.meta.v1.ObjectMetaArgs(
-                    name=f"{name_prefix}-{name}",
+                    name=name,
                     namespace=namespace,
                     labels=config_map_labels,
                 ),
-                data={
-                    dashboard_file: (dashboards_dir / dashboard_file).read_text(
-                        encoding="utf-8"
-                    ),
-                },
+                data={item.file: item.value for item in group},
                 opts=opts,
             )
         )
 
     return config_maps
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("dashboards_dir", type=Path)
+    parser.add_argument("files", nargs="*", help="default: every *.json file")
+    parser.add_argument("--shard-bytes", type=int, default=DEFAULT_SHARD_BYTES)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    files = args.files or sorted(
+        path.name for path in args.dashboards_dir.glob("*.json")
+    )
+    dashboards = [load_dashboard(args.dashboards_dir / file) for file in files]
+    shards = pack_dashboards(dashboards, args.shard_bytes)
+
+    width = max((len(dashboard.file) for dashboard in dashboards), default=9)
+    print(f"{'DASHBOARD'.ljust(width)}  {'SOURCE':>9}  {'STORED':>9}  SHARD")
+    for index, shard in enumerate(shards):
+        for dashboard in shard:
+            print(
+                f"{dashboard.file.ljust(width)}  {dashboard.source_bytes:>9}  "
+                f"{dashboard.stored_bytes:>9}  {index}"
+            )
+    for index, shard in enumerate(shards):
+        used = sum(dashboard.stored_bytes for dashboard in shard)
+        print(f"shard {index}: {len(shard)} dashboards, {used} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""Content-addressed cache for the Helm charts used by repo programs.
+
+`cached_chart()` returns a path to a packaged chart for a (repo, chart, version)
+triple, downloading it on the first request. Chart archives are stored once per
+SHA-256 digest under `blobs/sha256/`, and `refs/` maps each triple to its
+digest, so previews read a local `.tgz` instead of resolving the repository
+index and downloading the archive again.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import urllib.error
+import urllib.parse
+import urllib.request
+from pathlib import Path
+
+CACHE_ENV = "INFRA_HELM_CACHE"
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[3] / ".cache" / "helm"
+
+OCI_MANIFEST_TYPES = (
+    "application/vnd.oci.image.manifest.v1+json",
+    "application/vnd.docker.distribution.manifest.v2+json",
+)
+HELM_CHART_LAYER = "application/vnd.cncf.helm.chart.content.v1.tar+gzip"
+BEARER_PARAM = re.compile(r'(\w+)="([^"]*)"')
+
+
+def cache_dir() -> Path:
+    override = os.environ.get(CACHE_ENV)
+    return Path(override) if override else DEFAULT_CACHE_DIR
+
+
+def _ref_path(chart: str, version: str, repo: str | None) -> Path:
+    repo = repo.rstrip("/") if repo else ""
+    key = hashlib.sha256(f"{repo}\0{chart}\0{version}".encode()).hexdigest()
+    return cache_dir() / "refs" / f"{key}.json"
+
+
+def _blob_path(digest: str) -> Path:
+    return cache_dir() / "blobs" / "sha256" / f"{digest}.tgz"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as handle:
+        handle.write(data)
+    os.replace(handle.name, path)
+
+
+def lookup(chart: str, version: str, repo: str | None = None) -> Path | None:
+    ref = _ref_path(chart, version, repo)
+    if not ref.is_file():
+        return None
+    blob = _blob_path(json.loads(ref.read_text(encoding="utf-8"))["digest"])
+    return blob if blob.is_file() else None
+
+
+def _get(request: urllib.request.Request) -> bytes:
+    with urllib.request.urlopen(request, timeout=60) as response:
+        return response.read()
+
+
+def _download_from_repo(repo: str, chart: str, version: str) -> tuple[bytes, str]:
+    import yaml
+
+    base = repo.rstrip("/") + "/"
+    index = yaml.safe_load(_get(urllib.request.Request(base + "index.yaml")))
+    for entry in (index.get("entries") or {}).get(chart, []):
+        if str(entry.get("version")) == version:
+            url = urllib.parse.urljoin(base, entry["urls"][0])
+            return _get(urllib.request.Request(url)), entry.get("digest", "")
+    raise LookupError(f"{repo} has no {chart} {version}")
+
+
+def _oci_get(url: str, accept: str, token: str | None = None) -> tuple[bytes, str]:
+    request = urllib.request.Request(url, headers={"Accept": accept})
+    if token:
+        # Blob downloads redirect to signed storage URLs that reject extra auth.
+        request.add_unredirected_header("Authorization", f"Bearer {token}")
+    try:
+        return _get(request), ""
+    except urllib.error.HTTPError as exc:
+        challenge = exc.headers.get("WWW-Authenticate", "")
+        if exc.code != 401 or token or not challenge.startswith("Bearer "):
+            raise
+    params = dict(BEARER_PARAM.findall(challenge))
+    realm = params.pop("realm")
+    body = json.loads(
+        _get(urllib.request.Request(f"{realm}?{urllib.parse.urlencode(params)}"))
+    )
+    return b"", body.get("token") or body.get("access_token", "")
+
+
+def _oci_fetch(url: str, accept: str, token: str | None) -> tuple[bytes, str | None]:
+    data, new_token = _oci_get(url, accept, token)
+    if new_token:
+        data, _ = _oci_get(url, accept, new_token)
+        return data, new_token
+    return data, token
+
+
+def _download_from_oci(chart: str, version: str) -> tuple[bytes, str]:
+    host, _, name = chart.removeprefix("oci://").partition("/")
+    registry = f"https://{host}/v2/{name}"
+    raw, token = _oci_fetch(
+        f"{registry}/manifests/{version}", ",".join(OCI_MANIFEST_TYPES), None
+    )
+    manifest = json.loads(raw)
+    layer = next(
+        layer for layer in manifest["layers"] if layer["mediaType"] == HELM_CHART_LAYER
+    )
+    data, _ = _oci_fetch(f"{registry}/blobs/{layer['digest']}", "*/*", token)
+    return data, layer["digest"].removeprefix("sha256:")
+
+
+def fetch(chart: str, version: str, repo: str | None = None) -> Path:
+    """Download one chart archive into the cache and return its blob path."""
+    if chart.startswith("oci://"):
+        data, expected = _download_from_oci(chart, version)
+    elif repo:
+        data, expected = _download_from_repo(repo, chart, version)
+    else:
+        raise ValueError(f"{chart} needs a repository URL or an oci:// reference")
+
+    digest = hashlib.sha256(data).hexdigest()
+    if expected and expected != digest:
+        raise ValueError(f"{chart} {version}: digest {digest} != published {expected}")
+
+    blob = _blob_path(digest)
+    if not blob.is_file():
+        _write_atomic(blob, data)
+    ref = {"repo": repo, "chart": chart, "version": version, "digest": digest}
+    _write_atomic(
+        _ref_path(chart, version, repo),
+        (json.dumps(ref, indent=2, sort_keys=True) + "\n").encode(),
+    )
+    return blob
+
+
+def cached_chart(chart: str, version: str, repo: str | None = None) -> str:
+    """Return a local packaged-chart path for `chart` at `version`.
+
+    The path is relative to the program directory, so it is the same in every
+    checkout and Pulumi state does not pick up machine-specific paths.
+    """
+    blob = lookup(chart, version, repo) or fetch(chart, version, repo)
+    return os.path.relpath(blob, Path.cwd())
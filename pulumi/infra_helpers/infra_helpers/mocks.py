@@ -0,0 +1,363 @@
+"""Run a repo Pulumi program in-process under Pulumi mocks.
+
+The program sees a recorded stack config and recorded `StackReference` outputs
+instead of the Pulumi service, and every resource registration is captured so
+callers can count, time, or render the resulting graph without a cluster.
+"""
+
+import hashlib
+import json
+import os
+import runpy
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from google.protobuf import json_format
+from pulumi.runtime import mocks as pulumi_mocks
+from pulumi.runtime import rpc
+
+import pulumi
+
+RECORDING_DIR = ".pulumi-mocks"
+SECRET_PLACEHOLDER = "[secret]"
+UNKNOWN = "[unknown]"
+STACK_REFERENCE_TYPE = "pulumi:pulumi:StackReference"
+
+
+@dataclass
+class Recording:
+    project: str
+    stack: str
+    config: dict[str, str] = field(default_factory=dict)
+    secret_keys: list[str] = field(default_factory=list)
+    stack_outputs: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> "Recording":
+        return cls(**json.loads(path.read_text(encoding="utf-8")))
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(asdict(self), indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+
+
+@dataclass
+class RegisteredResource:
+    type: str
+    name: str
+    urn: str
+    parent: str
+    custom: bool
+    read: bool
+    inputs: dict[str, Any]
+    dependencies: list[str]
+    property_dependencies: dict[str, list[str]]
+    provider: str
+
+
+@dataclass
+class ProgramRun:
+    project: str
+    stack: str
+    resources: list[RegisteredResource] = field(default_factory=list)
+    import_seconds: float = 0.0
+    evaluate_seconds: float = 0.0
+    apply_seconds: float = 0.0
+    apply_calls: int = 0
+    error: str | None = None
+
+
+def project_name(project_dir: Path) -> str:
+    for line in (project_dir / "Pulumi.yaml").read_text(encoding="utf-8").splitlines():
+        if line.startswith("name:"):
+            return line.partition(":")[2].strip().strip("'\"")
+    return project_dir.name
+
+
+def recording_path(project_dir: Path, stack: str) -> Path:
+    return project_dir / RECORDING_DIR / f"{stack}.json"
+
+
+def _pulumi_json(args: list[str], cwd: Path) -> Any:
+    proc = subprocess.run(
+        ["pulumi", *args, "--json"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout or "null")
+
+
+def record_config(project_dir: Path, stack: str) -> Recording:
+    """Record stack config from the Pulumi CLI without decrypting secrets."""
+    recording = Recording(project=project_name(project_dir), stack=stack)
+    entries = _pulumi_json(["config", "--stack", stack], project_dir) or {}
+    for key, entry in entries.items():
+        if entry.get("secret"):
+            recording.config[key] = SECRET_PLACEHOLDER
+            recording.secret_keys.append(key)
+        elif "value" in entry:
+            recording.config[key] = entry["value"]
+    return recording
+
+
+def recording_from_stack_file(project_dir: Path, stack: str) -> Recording:
+    """Build a recording from `Pulumi.<stack>.yaml` when none was recorded.
+
+    Referenced stack outputs stay unknown, as in a preview of a fresh stack.
+    """
+    import yaml
+
+    recording = Recording(project=project_name(project_dir), stack=stack)
+    stack_file = project_dir / f"Pulumi.{stack}.yaml"
+    if not stack_file.is_file():
+        return recording
+    document = yaml.safe_load(stack_file.read_text(encoding="utf-8")) or {}
+    for key, value in (document.get("config") or {}).items():
+        if isinstance(value, dict) and set(value) == {"secure"}:
+            recording.config[key] = SECRET_PLACEHOLDER
+            recording.secret_keys.append(key)
+        elif isinstance(value, dict | list):
+            recording.config[key] = json.dumps(value)
+        elif isinstance(value, bool):
+            recording.config[key] = "true" if value else "false"
+        else:
+            recording.config[key] = str(value)
+    return recording
+
+
+def load_recording(project_dir: Path, stack: str) -> Recording:
+    path = recording_path(project_dir, stack)
+    if path.is_file():
+        return Recording.load(path)
+    return recording_from_stack_file(project_dir, stack)
+
+
+def fetch_stack_outputs(project_dir: Path, stack_name: str) -> dict[str, Any]:
+    # Without --show-secrets the CLI prints secret outputs as "[secret]".
+    return _pulumi_json(["stack", "output", "--stack", stack_name], project_dir) or {}
+
+
+class ProgramMocks(pulumi.runtime.Mocks):
+    def __init__(
+        self,
+        stack_outputs: dict[str, dict[str, Any]],
+        fetch_outputs: Callable[[str], dict[str, Any]] | None = None,
+    ):
+        self.stack_outputs = stack_outputs
+        self.fetch_outputs = fetch_outputs
+
+    def new_resource(
+        self, args: pulumi.runtime.MockResourceArgs
+    ) -> tuple[str | None, dict]:
+        if args.typ == STACK_REFERENCE_TYPE:
+            return self._stack_reference(args)
+        resource_id = args.resource_id or f"{args.name}-id"
+        return resource_id, dict(args.inputs)
+
+    def call(self, args: pulumi.runtime.MockCallArgs) -> tuple[dict, None]:
+        return {}, None
+
+    def _stack_reference(
+        self, args: pulumi.runtime.MockResourceArgs
+    ) -> tuple[str, dict]:
+        stack_name = args.inputs.get("name") or args.name
+        outputs = self.stack_outputs.get(stack_name)
+        if outputs is None and self.fetch_outputs is not None:
+            outputs = self.fetch_outputs(stack_name)
+            self.stack_outputs[stack_name] = outputs
+        if outputs is None:
+            # Leave outputs unset so previews treat them as unknown.
+            return stack_name, {"name": stack_name}
+        secret_names = [
+            key for key, value in outputs.items() if value == SECRET_PLACEHOLDER
+        ]
+        return stack_name, {
+            "name": stack_name,
+            "outputs": outputs,
+            "secretOutputNames": secret_names,
+        }
+
+
+class RecordingMonitor(pulumi_mocks.MockMonitor):
+    def __init__(self, mocks: pulumi.runtime.Mocks, project: str, stack: str):
+        super().__init__(mocks)
+        self.project = project
+        self.stack = stack
+        self.registrations: list[RegisteredResource] = []
+
+    def make_urn(self, parent: str, type_: str, name: str) -> str:
+        # Registrations run on executor threads, which do not see the
+        # context-local project and stack that set_mocks configured.
+        if parent:
+            type_ = parent.split("::")[2].rsplit("$", maxsplit=1)[-1] + "$" + type_
+        return f"urn:pulumi:{self.stack}::{self.project}::{type_}::{name}"
+
+    def RegisterResource(self, request):
+        response = super().RegisterResource(request)
+        if request.type != "pulumi:pulumi:Stack":
+            self._record(request, response.urn, read=False)
+        return response
+
+    def ReadResource(self, request):
+        response = super().ReadResource(request)
+        self._record(request, response.urn, read=True)
+        return response
+
+    def _record(self, request, urn: str, *, read: bool) -> None:
+        properties = request.properties if read else request.object
+        self.registrations.append(
+            RegisteredResource(
+                type=request.type,
+                name=request.name,
+                urn=urn,
+                parent=request.parent,
+                custom=True if read else bool(request.custom),
+                read=read,
+                inputs=canonical_properties(properties),
+                dependencies=[] if read else sorted(set(request.dependencies)),
+                property_dependencies=(
+                    {}
+                    if read
+                    else {
+                        key: sorted(set(value.urns))
+                        for key, value in request.propertyDependencies.items()
+                    }
+                ),
+                provider=_provider_urn(request.provider),
+            )
+        )
+
+
+def canonical_properties(properties) -> dict[str, Any]:
+    """Convert a registration's property struct into stable, secret-free JSON."""
+    return _canonical(json_format.MessageToDict(properties))
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, dict):
+        sig = value.get(rpc._special_sig_key)
+        if sig == rpc._special_secret_sig:
+            return SECRET_PLACEHOLDER
+        if sig == rpc._special_resource_sig:
+            return value.get("urn")
+        if sig in (rpc._special_asset_sig, rpc._special_archive_sig):
+            if "text" in value:
+                digest = hashlib.sha256(value["text"].encode()).hexdigest()
+                return {"text_sha256": digest}
+            return {
+                key: _canonical(item)
+                for key, item in sorted(value.items())
+                if key != rpc._special_sig_key
+            }
+        if sig == rpc._special_output_value_sig:
+            if value.get("secret"):
+                return SECRET_PLACEHOLDER
+            return _canonical(value["value"]) if "value" in value else UNKNOWN
+        return {key: _canonical(item) for key, item in sorted(value.items())}
+    if isinstance(value, list):
+        return [_canonical(item) for item in value]
+    if value == rpc.UNKNOWN:
+        return UNKNOWN
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _provider_urn(reference: str) -> str:
+    # Provider references are "<urn>::<id>"; mock ids carry no information.
+    return reference.rpartition("::")[0] if reference else ""
+
+
+@contextmanager
+def timed_applies(run: ProgramRun) -> Generator[None]:
+    original_apply = pulumi.Output.apply
+
+    def apply(self, func, run_with_unknowns: bool = False):
+        def timed(value):
+            started = time.perf_counter()
+            try:
+                return func(value)
+            finally:
+                run.apply_seconds += time.perf_counter() - started
+                run.apply_calls += 1
+
+        return original_apply(self, timed, run_with_unknowns)
+
+    pulumi.Output.apply = apply
+    try:
+        yield
+    finally:
+        pulumi.Output.apply = original_apply
+
+
+def _import_header(main: Path) -> str:
+    # Only the leading import block, so program evaluation is timed separately.
+    import ast
+
+    tree = ast.parse(main.read_text(encoding="utf-8"))
+    imports = [
+        node for node in tree.body if isinstance(node, ast.Import | ast.ImportFrom)
+    ]
+    return "\n".join(ast.unparse(node) for node in imports)
+
+
+def run_program(
+    project_dir: Path,
+    recording: Recording,
+    *,
+    preview: bool = True,
+    fetch_outputs: Callable[[str], dict[str, Any]] | None = None,
+) -> tuple[ProgramRun, RecordingMonitor]:
+    project_dir = project_dir.resolve()
+    main = project_dir / "__main__.py"
+    run = ProgramRun(project=recording.project, stack=recording.stack)
+
+    mocks = ProgramMocks(recording.stack_outputs, fetch_outputs)
+    monitor = RecordingMonitor(mocks, recording.project, recording.stack)
+    pulumi.runtime.set_all_config(dict(recording.config), list(recording.secret_keys))
+    pulumi.runtime.set_mocks(
+        mocks,
+        project=recording.project,
+        stack=recording.stack,
+        preview=preview,
+        monitor=monitor,
+    )
+
+    # Programs read dashboards and manifests relative to their own directory.
+    previous_cwd = os.getcwd()
+    os.chdir(project_dir)
+    sys.path.insert(0, str(project_dir))
+    try:
+        started = time.perf_counter()
+        exec(compile(_import_header(main), str(main), "exec"), {})
+        run.import_seconds = time.perf_counter() - started
+
+        @pulumi.runtime.test
+        def evaluate() -> None:
+            runpy.run_path(str(main), run_name="__main__")
+
+        started = time.perf_counter()
+        try:
+            with timed_applies(run):
+                evaluate()
+        finally:
+            run.evaluate_seconds = time.perf_counter() - started
+    except Exception as exc:  # noqa: BLE001 - report any program failure
+        run.error = f"{type(exc).__name__}: {exc}"
+    finally:
+        sys.path.remove(str(project_dir))
+        os.chdir(previous_cwd)
+
+    run.resources = list(monitor.registrations)
+    return run, monitor
@@ -1,8 +1,11 @@
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
 
 import pulumi_postgresql as pg
 
 import pulumi
+from infra_helpers.stacks import StackOutputs
 
 
 def _first_present(values: list[object]) -> object:
@@ -10,32 +13,70 @@ def _first_present(values: list[object]) -> object:
     return primary or fallback
 
 
-class PostgresStack:
-    def __init__(self, stack_ref: str):
-        self.ref = pulumi.StackReference(stack_ref)
-
-    @property
+class PostgresStack(StackOutputs):
+    @cached_property
     def admin_host(self) -> pulumi.Output[str]:
         return pulumi.Output.all(
-            self.ref.require_output("ts_hostname"),
-            self.ref.require_output("host"),
+            self.require("ts_hostname"),
+            self.require("host"),
         ).apply(_first_present)
 
-    @property
+    @cached_property
     def rw_service_fqdn(self) -> pulumi.Output[str]:
-        return self.ref.require_output("rw_service_fqdn")
-
-    @property
+        return self.require("rw_service_fqdn")
+
+    @cached_property
+    def ro_service_fqdn(self) -> pulumi.Output[str]:
+        return self.require("ro_service_fqdn")
+
+    @cached_property
+    def instances(self) -> pulumi.Output[int]:
+        return self.require("instances").apply(int)
+
+    @cached_property
+    def replica_service_fqdn(self) -> pulumi.Output[str]:
+        """Read-only endpoint, only when replicas sit behind the ro service."""
+
+        def select(values: list[Any]) -> str:
+            instances, fqdn = values
+            if instances < 2:
+                raise ValueError(
+                    f"{self.stack_name} runs one instance, so its ro service has "
+                    "no endpoints"
+                )
+            return fqdn
+
+        return pulumi.Output.all(self.instances, self.ro_service_fqdn).apply(select)
+
+    @cached_property
+    def pooler_fqdns(self) -> pulumi.Output[dict[str, str]]:
+        return self.require("pooler_fqdns")
+
+    def pooler_fqdn(self, pool_mode: str) -> pulumi.Output[str]:
+        def select(fqdns: dict[str, str]) -> str:
+            if pool_mode not in fqdns:
+                raise ValueError(f"{self.stack_name} has no {pool_mode} pooler")
+            return fqdns[pool_mode]
+
+        return self.pooler_fqdns.apply(select)
+
+    def service_fqdn(self, pool_mode: str | None = None) -> pulumi.Output[str]:
+        """Read-write endpoint, through the PgBouncer pooler for `pool_mode`."""
+        if pool_mode is None:
+            return self.rw_service_fqdn
+        return self.pooler_fqdn(pool_mode)
+
+    @cached_property
     def port(self) -> pulumi.Output[int]:
-        return self.ref.require_output("port")
+        return self.require("port")
 
-    @property
+    @cached_property
     def username(self) -> pulumi.Output[str]:
-        return self.ref.require_output("username")
+        return self.require("username")
 
-    @property
+    @cached_property
     def password(self) -> pulumi.Output[str]:
-        return self.ref.require_output("password")
+        return self.require("password")
 
     def admin_provider(
         self,
@@ -48,7 +89,7 @@ class PostgresStack:
     ) -> pg.Provider:
         return pg.Provider(
             resource_name,
-            host=host if host is not None else self.ref.require_output("ts_hostname"),
+            host=host if host is not None else self.require("ts_hostname"),
             port=port,
             username=self.username,
             password=self.password,
@@ -0,0 +1,136 @@
+"""Render a Pulumi program's resource graph offline and diff it.
+
+The program runs under `infra_helpers.mocks`, so no cluster or backend is
+contacted, and charts come from the `infra_helpers.helm` cache. The graph is written as canonical JSON: resources
+sorted by URN, inputs with sorted keys, secrets and unknown values replaced by
+placeholders, and explicit plus implicit dependencies.
+
+    python -m infra_helpers.snapshot update pulumi/apps/mediawiki
+    python -m infra_helpers.snapshot check pulumi/apps/mediawiki
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+SNAPSHOT_DIR = "snapshots"
+
+
+def snapshot_path(project_dir: Path, stack: str) -> Path:
+    return project_dir / SNAPSHOT_DIR / f"{stack}.json"
+
+
+def render(project_dir: Path, stack: str) -> dict[str, Any]:
+    from infra_helpers import mocks
+
+    recording = mocks.load_recording(project_dir, stack)
+    run, _ = mocks.run_program(project_dir, recording)
+    if run.error:
+        raise SystemExit(f"{project_dir}: {run.error}")
+
+    inputs = json.dumps(asdict(recording), sort_keys=True).encode()
+    resources = []
+    for registered in sorted(run.resources, key=lambda item: item.urn):
+        resource = asdict(registered)
+        resource["parent"] = resource["parent"] or None
+        resource["provider"] = resource["provider"] or None
+        resources.append(resource)
+    return {
+        "project": recording.project,
+        "stack": stack,
+        "inputs_sha256": hashlib.sha256(inputs).hexdigest(),
+        "resources": resources,
+    }
+
+
+def dumps(graph: dict[str, Any]) -> str:
+    return json.dumps(graph, indent=2, sort_keys=True) + "\n"
+
+
+def _flatten(value: Any, path: str = "") -> dict[str, Any]:
+    if isinstance(value, dict) and value:
+        flat: dict[str, Any] = {}
+        for key, item in value.items():
+            flat.update(_flatten(item, f"{path}.{key}" if path else key))
+        return flat
+    if isinstance(value, list) and value:
+        flat = {}
+        for index, item in enumerate(value):
+            flat.update(_flatten(item, f"{path}[{index}]"))
+        return flat
+    return {path: value}
+
+
+def diff(before: dict[str, Any], after: dict[str, Any]) -> list[str]:
+    old = {resource["urn"]: resource for resource in before.get("resources", [])}
+    new = {resource["urn"]: resource for resource in after.get("resources", [])}
+    lines: list[str] = []
+    if before.get("inputs_sha256") != after.get("inputs_sha256"):
+        lines.append("! config or recorded stack outputs differ from the snapshot")
+
+    for urn in sorted(old.keys() | new.keys()):
+        if urn not in new:
+            lines.append(f"- {urn}")
+            continue
+        if urn not in old:
+            lines.append(f"+ {urn}")
+            continue
+        before_flat = _flatten({k: v for k, v in old[urn].items() if k != "urn"})
+        after_flat = _flatten({k: v for k, v in new[urn].items() if k != "urn"})
+        changes = [
+            f"    {path}: {json.dumps(before_flat.get(path))} -> "
+            f"{json.dumps(after_flat.get(path))}"
+            for path in sorted(before_flat.keys() | after_flat.keys())
+            if before_flat.get(path) != after_flat.get(path)
+        ]
+        if changes:
+            lines.append(f"~ {urn}")
+            lines.extend(changes)
+    return lines
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["render", "update", "check"])
+    parser.add_argument("project", type=Path)
+    parser.add_argument("--stack", default="mx")
+    parser.add_argument("--output", type=Path, help="render: write here")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    project_dir = args.project.resolve()
+    graph = render(project_dir, args.stack)
+    path = snapshot_path(project_dir, args.stack)
+
+    if args.command == "render":
+        if args.output:
+            args.output.write_text(dumps(graph), encoding="utf-8")
+        else:
+            sys.stdout.write(dumps(graph))
+        return 0
+
+    if args.command == "update":
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(dumps(graph), encoding="utf-8")
+        print(f"wrote {path} ({len(graph['resources'])} resources)")
+        return 0
+
+    if not path.is_file():
+        print(f"no snapshot at {path}; run the update command first")
+        return 1
+    changes = diff(json.loads(path.read_text(encoding="utf-8")), graph)
+    if not changes:
+        print(f"{args.project}: graph matches {path.name}")
+        return 0
+    print("\n".join(changes))
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
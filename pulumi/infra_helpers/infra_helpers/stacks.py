@@ -0,0 +1,132 @@
+from functools import cached_property
+from typing import Any
+
+import pulumi
+
+# One StackReference and one Output per requested key for each stack name in
+# a program, however many helpers ask for them.
+_references: dict[str, pulumi.StackReference] = {}
+_outputs: dict[tuple[str, str], pulumi.Output[Any]] = {}
+
+
+def stack_reference(name: str) -> pulumi.StackReference:
+    reference = _references.get(name)
+    if reference is None:
+        reference = _references[name] = pulumi.StackReference(name)
+    return reference
+
+
+def require_output(stack_name: str, key: str) -> pulumi.Output[Any]:
+    output = _outputs.get((stack_name, key))
+    if output is None:
+        output = _outputs[(stack_name, key)] = stack_reference(
+            stack_name
+        ).require_output(key)
+    return output
+
+
+def cluster_service_host(
+    service_name: pulumi.Input[str], namespace: pulumi.Input[str]
+) -> pulumi.Output[str]:
+    return pulumi.Output.format("{0}.{1}.svc.cluster.local", service_name, namespace)
+
+
+class StackOutputs:
+    def __init__(self, stack_name: str):
+        self.stack_name = stack_name
+        self.ref = stack_reference(stack_name)
+
+    def require(self, key: str) -> pulumi.Output[Any]:
+        return require_output(self.stack_name, key)
+
+    @cached_property
+    def namespace(self) -> pulumi.Output[str]:
+        return self.require("namespace")
+
+
+class RustfsStack(StackOutputs):
+    @cached_property
+    def s3_endpoint_url(self) -> pulumi.Output[str]:
+        return pulumi.Output.format(
+            "http://{0}:9000",
+            cluster_service_host(self.require("s3_hostname"), self.namespace),
+        )
+
+    @cached_property
+    def access_key(self) -> pulumi.Output[str]:
+        return self.require("access_key")
+
+    @cached_property
+    def secret_key(self) -> pulumi.Output[str]:
+        return self.require("secret_key")
+
+
+class ClickHouseStack(StackOutputs):
+    @cached_property
+    def host(self) -> pulumi.Output[str]:
+        return self.require("clickhouseHost")
+
+    @cached_property
+    def port(self) -> pulumi.Output[int]:
+        return self.require("clickhousePort")
+
+    @cached_property
+    def service_fqdn(self) -> pulumi.Output[str]:
+        return self.require("clickhouseServiceFqdn")
+
+    @cached_property
+    def http_port(self) -> pulumi.Output[int]:
+        # Numeric stack outputs come back as floats.
+        return self.require("clickhouseHttpPort").apply(int)
+
+    @cached_property
+    def admin_username(self) -> pulumi.Output[str]:
+        return self.require("clickhouseAdminUsername")
+
+    @cached_property
+    def admin_password(self) -> pulumi.Output[str]:
+        return self.require("clickhouseAdminPassword")
+
+    @cached_property
+    def users(self) -> pulumi.Output[dict[str, dict[str, str]]]:
+        return self.require("clickhouseUsers")
+
+    def user(self, name: str) -> pulumi.Output[dict[str, str]]:
+        """Credentials and profile of the consumer user `name`."""
+
+        def select(users: dict[str, dict[str, str]]) -> dict[str, str]:
+            if name not in users:
+                raise ValueError(f"{self.stack_name} has no ClickHouse user {name}")
+            return users[name]
+
+        return self.users.apply(select)
+
+    def username(self, name: str) -> pulumi.Output[str]:
+        return self.user(name).apply(lambda user: user["username"])
+
+    def password(self, name: str) -> pulumi.Output[str]:
+        return pulumi.Output.secret(
+            self.user(name).apply(lambda user: user["password"])
+        )
+
+
+class TrinoStack(StackOutputs):
+    @cached_property
+    def service_host(self) -> pulumi.Output[str]:
+        return cluster_service_host(self.require("service_name"), self.namespace)
+
+    @cached_property
+    def catalogs(self) -> pulumi.Output[list[str]]:
+        return self.require("catalogs")
+
+    @cached_property
+    def iceberg_database(self) -> pulumi.Output[str]:
+        return self.require("iceberg_database")
+
+    @cached_property
+    def iceberg_warehouse(self) -> pulumi.Output[str]:
+        return self.require("iceberg_warehouse")
+
+    @cached_property
+    def iceberg_jdbc_catalog_name(self) -> pulumi.Output[str]:
+        return self.require("iceberg_jdbc_catalog_name")
@@ -15,7 +15,7 @@ else:
 from ... import _utilities
 from . import outputs
 from ... import meta as _meta
-from ._inputs import *
+from . import _inputs
 
 __all__ = ['ClickHouseInstallationInitArgs', 'ClickHouseInstallation']
 
@@ -25,7 +25,7 @@ class ClickHouseInstallationInitArgs:
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']] = None,
-                 spec: pulumi.Input[Optional['ClickHouseInstallationSpecArgs']] = None):
+                 spec: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecArgs']] = None):
         """
         The set of arguments for constructing a ClickHouseInstallation resource.
 
@@ -80,11 +80,11 @@ class ClickHouseInstallationInitArgs:
 
     @_builtins.property
     @pulumi.getter
-    def spec(self) -> pulumi.Input[Optional['ClickHouseInstallationSpecArgs']]:
+    def spec(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecArgs']]:
         return pulumi.get(self, "spec")
 
     @spec.setter
-    def spec(self, value: pulumi.Input[Optional['ClickHouseInstallationSpecArgs']]):
+    def spec(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecArgs']]):
         pulumi.set(self, "spec", value)
 
 
@@ -97,7 +97,7 @@ class ClickHouseInstallation(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaArgs', '_meta.v1.ObjectMetaArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['ClickHouseInstallationSpecArgs', 'ClickHouseInstallationSpecArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.ClickHouseInstallationSpecArgs', '_inputs.ClickHouseInstallationSpecArgsDict']]] = None,
                  __props__=None):
         """
         define a set of Kubernetes resources (StatefulSet, PVC, Service, ConfigMap) which describe behavior one or more clusters
@@ -137,7 +137,7 @@ class ClickHouseInstallation(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaArgs', '_meta.v1.ObjectMetaArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['ClickHouseInstallationSpecArgs', 'ClickHouseInstallationSpecArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.ClickHouseInstallationSpecArgs', '_inputs.ClickHouseInstallationSpecArgsDict']]] = None,
                  __props__=None):
         opts = pulumi.ResourceOptions.merge(_utilities.get_resource_opts_defaults(), opts)
         if not isinstance(opts, pulumi.ResourceOptions):
@@ -15,7 +15,7 @@ else:
 from ... import _utilities
 from . import outputs
 from ... import meta as _meta
-from ._inputs import *
+from . import _inputs
 
 __all__ = ['ClickHouseInstallationPatchArgs', 'ClickHouseInstallationPatch']
 
@@ -25,7 +25,7 @@ class ClickHouseInstallationPatchArgs:
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional['_meta.v1.ObjectMetaPatchArgs']] = None,
-                 spec: pulumi.Input[Optional['ClickHouseInstallationSpecPatchArgs']] = None):
+                 spec: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecPatchArgs']] = None):
         """
         The set of arguments for constructing a ClickHouseInstallationPatch resource.
 
@@ -80,11 +80,11 @@ class ClickHouseInstallationPatchArgs:
 
     @_builtins.property
     @pulumi.getter
-    def spec(self) -> pulumi.Input[Optional['ClickHouseInstallationSpecPatchArgs']]:
+    def spec(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecPatchArgs']]:
         return pulumi.get(self, "spec")
 
     @spec.setter
-    def spec(self, value: pulumi.Input[Optional['ClickHouseInstallationSpecPatchArgs']]):
+    def spec(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecPatchArgs']]):
         pulumi.set(self, "spec", value)
 
 
@@ -97,7 +97,7 @@ class ClickHouseInstallationPatch(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaPatchArgs', '_meta.v1.ObjectMetaPatchArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['ClickHouseInstallationSpecPatchArgs', 'ClickHouseInstallationSpecPatchArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.ClickHouseInstallationSpecPatchArgs', '_inputs.ClickHouseInstallationSpecPatchArgsDict']]] = None,
                  __props__=None):
         """
         Patch resources are used to modify existing Kubernetes resources by using
@@ -149,7 +149,7 @@ class ClickHouseInstallationPatch(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaPatchArgs', '_meta.v1.ObjectMetaPatchArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['ClickHouseInstallationSpecPatchArgs', 'ClickHouseInstallationSpecPatchArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.ClickHouseInstallationSpecPatchArgs', '_inputs.ClickHouseInstallationSpecPatchArgsDict']]] = None,
                  __props__=None):
         opts = pulumi.ResourceOptions.merge(_utilities.get_resource_opts_defaults(), opts)
         if not isinstance(opts, pulumi.ResourceOptions):
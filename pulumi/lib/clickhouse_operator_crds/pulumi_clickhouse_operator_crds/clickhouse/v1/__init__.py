@@ -3,11 +3,644 @@
 # *** Do not edit by hand unless you're certain you know what you are doing! ***
 
 import builtins as _builtins
-from ... import _utilities
+import importlib
 import typing
-# Export this package's modules as members:
-from .ClickHouseInstallation import *
-from .ClickHouseInstallationList import *
-from .ClickHouseInstallationPatch import *
-from ._inputs import *
-from . import outputs
+from ... import _utilities
+
+__all__ = [
+    'ClickHouseInstallationInitArgs',
+    'ClickHouseInstallation',
+    'ClickHouseInstallationListArgs',
+    'ClickHouseInstallationList',
+    'ClickHouseInstallationPatchArgs',
+    'ClickHouseInstallationPatch',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutArgs',
+    'ClickHouseInstallationSpecConfigurationClustersPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcilePatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcilePatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimeArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimeArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersSecretPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersSecretArgs',
+    'ClickHouseInstallationSpecConfigurationClustersTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersTemplatesArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperArgs',
+    'ClickHouseInstallationSpecConfigurationClustersArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersArgs',
+    'ClickHouseInstallationSpecConfigurationPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationPatchArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperKeeperPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationZookeeperKeeperPatchArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperKeeperArgsDict',
+    'ClickHouseInstallationSpecConfigurationZookeeperKeeperArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperNodesPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationZookeeperNodesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperNodesArgsDict',
+    'ClickHouseInstallationSpecConfigurationZookeeperNodesArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationZookeeperPatchArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperArgsDict',
+    'ClickHouseInstallationSpecConfigurationZookeeperArgs',
+    'ClickHouseInstallationSpecConfigurationArgsDict',
+    'ClickHouseInstallationSpecConfigurationArgs',
+    'ClickHouseInstallationSpecDefaultsDistributedDDLPatchArgsDict',
+    'ClickHouseInstallationSpecDefaultsDistributedDDLPatchArgs',
+    'ClickHouseInstallationSpecDefaultsDistributedDDLArgsDict',
+    'ClickHouseInstallationSpecDefaultsDistributedDDLArgs',
+    'ClickHouseInstallationSpecDefaultsPatchArgsDict',
+    'ClickHouseInstallationSpecDefaultsPatchArgs',
+    'ClickHouseInstallationSpecDefaultsStorageManagementPatchArgsDict',
+    'ClickHouseInstallationSpecDefaultsStorageManagementPatchArgs',
+    'ClickHouseInstallationSpecDefaultsStorageManagementArgsDict',
+    'ClickHouseInstallationSpecDefaultsStorageManagementArgs',
+    'ClickHouseInstallationSpecDefaultsTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecDefaultsTemplatesPatchArgs',
+    'ClickHouseInstallationSpecDefaultsTemplatesArgsDict',
+    'ClickHouseInstallationSpecDefaultsTemplatesArgs',
+    'ClickHouseInstallationSpecDefaultsArgsDict',
+    'ClickHouseInstallationSpecDefaultsArgs',
+    'ClickHouseInstallationSpecPatchArgsDict',
+    'ClickHouseInstallationSpecPatchArgs',
+    'ClickHouseInstallationSpecReconcileCleanupPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileCleanupPatchArgs',
+    'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatchArgs',
+    'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsArgsDict',
+    'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsArgs',
+    'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatchArgs',
+    'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsArgsDict',
+    'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsArgs',
+    'ClickHouseInstallationSpecReconcileCleanupArgsDict',
+    'ClickHouseInstallationSpecReconcileCleanupArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostHttpPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostHttpArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostHttpArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostShellPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostShellArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostShellArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostSqlPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostSqlArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostSqlArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreHttpPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreHttpArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreHttpArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPrePatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPrePatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreShellPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreShellArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreShellArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreSqlPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreSqlArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreSqlArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksArgs',
+    'ClickHouseInstallationSpecReconcileClusterPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterArgs',
+    'ClickHouseInstallationSpecReconcileHostDropPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostDropPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostDropReplicasPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostDropReplicasPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostDropReplicasArgsDict',
+    'ClickHouseInstallationSpecReconcileHostDropReplicasArgs',
+    'ClickHouseInstallationSpecReconcileHostDropArgsDict',
+    'ClickHouseInstallationSpecReconcileHostDropArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostHttpPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostHttpArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPostHttpArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPostPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostShellPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostShellArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPostShellArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostSqlPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostSqlArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPostSqlArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPostArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreHttpPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreHttpArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPreHttpArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPrePatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPrePatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreShellPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreShellArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPreShellArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreSqlPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreSqlArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPreSqlArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPreArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksArgs',
+    'ClickHouseInstallationSpecReconcileHostPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostWaitPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitProbesPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostWaitProbesPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitProbesArgsDict',
+    'ClickHouseInstallationSpecReconcileHostWaitProbesArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitReplicasPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostWaitReplicasPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitReplicasArgsDict',
+    'ClickHouseInstallationSpecReconcileHostWaitReplicasArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitArgsDict',
+    'ClickHouseInstallationSpecReconcileHostWaitArgs',
+    'ClickHouseInstallationSpecReconcileHostArgsDict',
+    'ClickHouseInstallationSpecReconcileHostArgs',
+    'ClickHouseInstallationSpecReconcileMacrosPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsFilesArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsFilesArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsUsersArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsUsersArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsArgs',
+    'ClickHouseInstallationSpecReconcileMacrosArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosArgs',
+    'ClickHouseInstallationSpecReconcilePatchArgsDict',
+    'ClickHouseInstallationSpecReconcilePatchArgs',
+    'ClickHouseInstallationSpecReconcileRuntimePatchArgsDict',
+    'ClickHouseInstallationSpecReconcileRuntimePatchArgs',
+    'ClickHouseInstallationSpecReconcileRuntimeArgsDict',
+    'ClickHouseInstallationSpecReconcileRuntimeArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetCreatePatchArgsDict',
+    'ClickHouseInstallationSpecReconcileStatefulSetCreatePatchArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetCreateArgsDict',
+    'ClickHouseInstallationSpecReconcileStatefulSetCreateArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileStatefulSetPatchArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetRecreatePatchArgsDict',
+    'ClickHouseInstallationSpecReconcileStatefulSetRecreatePatchArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetRecreateArgsDict',
+    'ClickHouseInstallationSpecReconcileStatefulSetRecreateArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetUpdatePatchArgsDict',
+    'ClickHouseInstallationSpecReconcileStatefulSetUpdatePatchArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetUpdateArgsDict',
+    'ClickHouseInstallationSpecReconcileStatefulSetUpdateArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetArgsDict',
+    'ClickHouseInstallationSpecReconcileStatefulSetArgs',
+    'ClickHouseInstallationSpecReconcileArgsDict',
+    'ClickHouseInstallationSpecReconcileArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingCleanupPatchArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatchArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsArgsDict',
+    'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatchArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsArgsDict',
+    'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupArgsDict',
+    'ClickHouseInstallationSpecReconcilingCleanupArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostShellPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostShellArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostShellArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPrePatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPrePatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreShellPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreShellArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreShellArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksArgs',
+    'ClickHouseInstallationSpecReconcilingClusterPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterArgs',
+    'ClickHouseInstallationSpecReconcilingHostDropPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostDropPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostDropReplicasPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostDropReplicasPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostDropReplicasArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostDropReplicasArgs',
+    'ClickHouseInstallationSpecReconcilingHostDropArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostDropArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostHttpPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostHttpArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostHttpArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostShellPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostShellArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostShellArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostSqlPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostSqlArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostSqlArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreHttpPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreHttpArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreHttpArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPrePatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPrePatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreShellPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreShellArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreShellArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreSqlPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreSqlArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreSqlArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksArgs',
+    'ClickHouseInstallationSpecReconcilingHostPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostWaitPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitProbesPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostWaitProbesPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitProbesArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostWaitProbesArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitReplicasPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostWaitReplicasPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitReplicasArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostWaitReplicasArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostWaitArgs',
+    'ClickHouseInstallationSpecReconcilingHostArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosArgs',
+    'ClickHouseInstallationSpecReconcilingPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingPatchArgs',
+    'ClickHouseInstallationSpecReconcilingRuntimePatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingRuntimePatchArgs',
+    'ClickHouseInstallationSpecReconcilingRuntimeArgsDict',
+    'ClickHouseInstallationSpecReconcilingRuntimeArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetCreatePatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingStatefulSetCreatePatchArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetCreateArgsDict',
+    'ClickHouseInstallationSpecReconcilingStatefulSetCreateArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingStatefulSetPatchArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatchArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetRecreateArgsDict',
+    'ClickHouseInstallationSpecReconcilingStatefulSetRecreateArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatchArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetUpdateArgsDict',
+    'ClickHouseInstallationSpecReconcilingStatefulSetUpdateArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetArgsDict',
+    'ClickHouseInstallationSpecReconcilingStatefulSetArgs',
+    'ClickHouseInstallationSpecReconcilingArgsDict',
+    'ClickHouseInstallationSpecReconcilingArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatchArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionArgsDict',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatchArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesArgsDict',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecArgsDict',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesArgsDict',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatchArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionArgsDict',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesZonePatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesZonePatchArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesZoneArgsDict',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesZoneArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesArgsDict',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesServiceTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesServiceTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesServiceTemplatesArgsDict',
+    'ClickHouseInstallationSpecTemplatesServiceTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgsDict',
+    'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesArgsDict',
+    'ClickHouseInstallationSpecTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatingPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatingPatchArgs',
+    'ClickHouseInstallationSpecTemplatingArgsDict',
+    'ClickHouseInstallationSpecTemplatingArgs',
+    'ClickHouseInstallationSpecUseTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecUseTemplatesPatchArgs',
+    'ClickHouseInstallationSpecUseTemplatesArgsDict',
+    'ClickHouseInstallationSpecUseTemplatesArgs',
+    'ClickHouseInstallationSpecArgsDict',
+    'ClickHouseInstallationSpecArgs',
+    'ClickHouseInstallationStatusArgsDict',
+    'ClickHouseInstallationStatusArgs',
+    'ClickHouseInstallationArgsDict',
+    'ClickHouseInstallationArgs',
+    'outputs',
+]
+
+# Resource classes live in same-named modules; everything else is an input type.
+_RESOURCE_MODULES = {
+    'ClickHouseInstallationInitArgs': 'ClickHouseInstallation',
+    'ClickHouseInstallation': 'ClickHouseInstallation',
+    'ClickHouseInstallationListArgs': 'ClickHouseInstallationList',
+    'ClickHouseInstallationList': 'ClickHouseInstallationList',
+    'ClickHouseInstallationPatchArgs': 'ClickHouseInstallationPatch',
+    'ClickHouseInstallationPatch': 'ClickHouseInstallationPatch',
+}
+
+if typing.TYPE_CHECKING:
+    from .ClickHouseInstallation import *
+    from .ClickHouseInstallationList import *
+    from .ClickHouseInstallationPatch import *
+    from ._inputs import *
+    from . import outputs
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in ("_inputs", "outputs"):
+        return importlib.import_module(f"{__name__}.{name}")
+    module_name = _RESOURCE_MODULES.get(name)
+    if module_name is not None:
+        module = importlib.import_module(f"{__name__}.{module_name}")
+    else:
+        module = importlib.import_module(f"{__name__}._inputs")
+        if name not in module.__all__:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
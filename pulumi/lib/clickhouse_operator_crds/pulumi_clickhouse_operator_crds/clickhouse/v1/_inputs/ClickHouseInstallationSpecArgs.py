@@ -0,0 +1,302 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecArgsDict', 'ClickHouseInstallationSpecArgs']
+
+class ClickHouseInstallationSpecArgsDict(TypedDict):
+    """
+    Specification of the desired behavior of one or more ClickHouse clusters
+    More info: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md
+    """
+    configuration: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationArgs']]]
+    defaults: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecDefaultsArgs']]]
+    namespace_domain_pattern: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Custom domain pattern which will be used for DNS names of `Service` or `Pod`.
+    Typical use scenario - custom cluster domain in Kubernetes cluster
+    Example: %s.svc.my.test
+    """
+    reconcile: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileArgs']]]
+    reconciling: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingArgs']]]
+    restart: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    In case 'RollingUpdate' specified, the operator will always restart ClickHouse pods during reconcile.
+    This options is used in rare cases when force restart is required and is typically removed after the use in order to avoid unneeded restarts.
+    """
+    stop: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Allows to stop all ClickHouse clusters defined in a CHI.
+    Works as the following:
+     - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
+     - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
+    """
+    suspend: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Suspend reconciliation of resources managed by a ClickHouse Installation.
+    Works as the following:
+     - When `suspend` is `true` operator stops reconciling all resources.
+     - When `suspend` is `false` or not set, operator reconciles all resources.
+    """
+    task_id: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Allows to define custom taskID for CHI update and watch status of this update execution.
+    Displayed in all .status.taskID* fields.
+    By default (if not filled) every update of CHI manifest will generate random taskID
+    """
+    templates: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecTemplatesArgs']]]
+    templating: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecTemplatingArgs']]]
+    troubleshoot: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Allows to troubleshoot Pods during CrashLoopBack state.
+    This may happen when wrong configuration applied, in this case `clickhouse-server` wouldn't start.
+    Command within ClickHouse container is modified with `sleep` in order to avoid quick restarts
+    and give time to troubleshoot via CLI.
+    Liveness and Readiness probes are disabled as well.
+    """
+    use_templates: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecUseTemplatesArgs']]]]]
+    """
+    list of `ClickHouseInstallationTemplate` (chit) resource names which will merge with current `CHI`
+    manifest during render Kubernetes resources to create related ClickHouse clusters"
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecArgs:
+    def __init__(__self__, *,
+                 configuration: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationArgs']] = None,
+                 defaults: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecDefaultsArgs']] = None,
+                 namespace_domain_pattern: pulumi.Input[Optional[_builtins.str]] = None,
+                 reconcile: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileArgs']] = None,
+                 reconciling: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingArgs']] = None,
+                 restart: pulumi.Input[Optional[_builtins.str]] = None,
+                 stop: pulumi.Input[Optional[_builtins.str]] = None,
+                 suspend: pulumi.Input[Optional[_builtins.str]] = None,
+                 task_id: pulumi.Input[Optional[_builtins.str]] = None,
+                 templates: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecTemplatesArgs']] = None,
+                 templating: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecTemplatingArgs']] = None,
+                 troubleshoot: pulumi.Input[Optional[_builtins.str]] = None,
+                 use_templates: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecUseTemplatesArgs']]]] = None):
+        """
+        Specification of the desired behavior of one or more ClickHouse clusters
+        More info: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md
+
+
+        :param pulumi.Input[_builtins.str] namespace_domain_pattern: Custom domain pattern which will be used for DNS names of `Service` or `Pod`.
+               Typical use scenario - custom cluster domain in Kubernetes cluster
+               Example: %s.svc.my.test
+        :param pulumi.Input[_builtins.str] restart: In case 'RollingUpdate' specified, the operator will always restart ClickHouse pods during reconcile.
+               This options is used in rare cases when force restart is required and is typically removed after the use in order to avoid unneeded restarts.
+        :param pulumi.Input[_builtins.str] stop: Allows to stop all ClickHouse clusters defined in a CHI.
+               Works as the following:
+                - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
+                - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
+        :param pulumi.Input[_builtins.str] suspend: Suspend reconciliation of resources managed by a ClickHouse Installation.
+               Works as the following:
+                - When `suspend` is `true` operator stops reconciling all resources.
+                - When `suspend` is `false` or not set, operator reconciles all resources.
+        :param pulumi.Input[_builtins.str] task_id: Allows to define custom taskID for CHI update and watch status of this update execution.
+               Displayed in all .status.taskID* fields.
+               By default (if not filled) every update of CHI manifest will generate random taskID
+        :param pulumi.Input[_builtins.str] troubleshoot: Allows to troubleshoot Pods during CrashLoopBack state.
+               This may happen when wrong configuration applied, in this case `clickhouse-server` wouldn't start.
+               Command within ClickHouse container is modified with `sleep` in order to avoid quick restarts
+               and give time to troubleshoot via CLI.
+               Liveness and Readiness probes are disabled as well.
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecUseTemplatesArgs']]] use_templates: list of `ClickHouseInstallationTemplate` (chit) resource names which will merge with current `CHI`
+               manifest during render Kubernetes resources to create related ClickHouse clusters"
+        """
+        if configuration is not None:
+            pulumi.set(__self__, "configuration", configuration)
+        if defaults is not None:
+            pulumi.set(__self__, "defaults", defaults)
+        if namespace_domain_pattern is not None:
+            pulumi.set(__self__, "namespace_domain_pattern", namespace_domain_pattern)
+        if reconcile is not None:
+            pulumi.set(__self__, "reconcile", reconcile)
+        if reconciling is not None:
+            pulumi.set(__self__, "reconciling", reconciling)
+        if restart is not None:
+            pulumi.set(__self__, "restart", restart)
+        if stop is not None:
+            pulumi.set(__self__, "stop", stop)
+        if suspend is not None:
+            pulumi.set(__self__, "suspend", suspend)
+        if task_id is not None:
+            pulumi.set(__self__, "task_id", task_id)
+        if templates is not None:
+            pulumi.set(__self__, "templates", templates)
+        if templating is not None:
+            pulumi.set(__self__, "templating", templating)
+        if troubleshoot is not None:
+            pulumi.set(__self__, "troubleshoot", troubleshoot)
+        if use_templates is not None:
+            pulumi.set(__self__, "use_templates", use_templates)
+
+    @_builtins.property
+    @pulumi.getter
+    def configuration(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationArgs']]:
+        return pulumi.get(self, "configuration")
+
+    @configuration.setter
+    def configuration(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationArgs']]):
+        pulumi.set(self, "configuration", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def defaults(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecDefaultsArgs']]:
+        return pulumi.get(self, "defaults")
+
+    @defaults.setter
+    def defaults(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecDefaultsArgs']]):
+        pulumi.set(self, "defaults", value)
+
+    @_builtins.property
+    @pulumi.getter(name="namespaceDomainPattern")
+    def namespace_domain_pattern(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Custom domain pattern which will be used for DNS names of `Service` or `Pod`.
+        Typical use scenario - custom cluster domain in Kubernetes cluster
+        Example: %s.svc.my.test
+        """
+        return pulumi.get(self, "namespace_domain_pattern")
+
+    @namespace_domain_pattern.setter
+    def namespace_domain_pattern(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "namespace_domain_pattern", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def reconcile(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileArgs']]:
+        return pulumi.get(self, "reconcile")
+
+    @reconcile.setter
+    def reconcile(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileArgs']]):
+        pulumi.set(self, "reconcile", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def reconciling(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingArgs']]:
+        return pulumi.get(self, "reconciling")
+
+    @reconciling.setter
+    def reconciling(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingArgs']]):
+        pulumi.set(self, "reconciling", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def restart(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        In case 'RollingUpdate' specified, the operator will always restart ClickHouse pods during reconcile.
+        This options is used in rare cases when force restart is required and is typically removed after the use in order to avoid unneeded restarts.
+        """
+        return pulumi.get(self, "restart")
+
+    @restart.setter
+    def restart(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "restart", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def stop(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Allows to stop all ClickHouse clusters defined in a CHI.
+        Works as the following:
+         - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
+         - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
+        """
+        return pulumi.get(self, "stop")
+
+    @stop.setter
+    def stop(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "stop", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def suspend(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Suspend reconciliation of resources managed by a ClickHouse Installation.
+        Works as the following:
+         - When `suspend` is `true` operator stops reconciling all resources.
+         - When `suspend` is `false` or not set, operator reconciles all resources.
+        """
+        return pulumi.get(self, "suspend")
+
+    @suspend.setter
+    def suspend(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "suspend", value)
+
+    @_builtins.property
+    @pulumi.getter(name="taskID")
+    def task_id(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Allows to define custom taskID for CHI update and watch status of this update execution.
+        Displayed in all .status.taskID* fields.
+        By default (if not filled) every update of CHI manifest will generate random taskID
+        """
+        return pulumi.get(self, "task_id")
+
+    @task_id.setter
+    def task_id(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "task_id", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def templates(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecTemplatesArgs']]:
+        return pulumi.get(self, "templates")
+
+    @templates.setter
+    def templates(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecTemplatesArgs']]):
+        pulumi.set(self, "templates", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def templating(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecTemplatingArgs']]:
+        return pulumi.get(self, "templating")
+
+    @templating.setter
+    def templating(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecTemplatingArgs']]):
+        pulumi.set(self, "templating", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def troubleshoot(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Allows to troubleshoot Pods during CrashLoopBack state.
+        This may happen when wrong configuration applied, in this case `clickhouse-server` wouldn't start.
+        Command within ClickHouse container is modified with `sleep` in order to avoid quick restarts
+        and give time to troubleshoot via CLI.
+        Liveness and Readiness probes are disabled as well.
+        """
+        return pulumi.get(self, "troubleshoot")
+
+    @troubleshoot.setter
+    def troubleshoot(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "troubleshoot", value)
+
+    @_builtins.property
+    @pulumi.getter(name="useTemplates")
+    def use_templates(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecUseTemplatesArgs']]]]:
+        """
+        list of `ClickHouseInstallationTemplate` (chit) resource names which will merge with current `CHI`
+        manifest during render Kubernetes resources to create related ClickHouse clusters"
+        """
+        return pulumi.get(self, "use_templates")
+
+    @use_templates.setter
+    def use_templates(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecUseTemplatesArgs']]]]):
+        pulumi.set(self, "use_templates", value)
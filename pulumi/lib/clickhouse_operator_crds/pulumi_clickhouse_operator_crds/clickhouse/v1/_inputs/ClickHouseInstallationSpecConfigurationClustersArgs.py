@@ -0,0 +1,276 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersArgsDict', 'ClickHouseInstallationSpecConfigurationClustersArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersArgsDict(TypedDict):
+    files: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    optional, allows define content of any setting file inside each `Pod` on current cluster during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+    override top-level `chi.spec.configuration.files`
+    """
+    insecure: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, open insecure ports for cluster, defaults to "yes"
+    """
+    layout: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutArgs']]]
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    cluster name, used to identify set of servers and wide used during generate names of related Kubernetes resources
+    """
+    pdb_managed: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Specifies whether the Pod Disruption Budget (PDB) should be managed.
+    During the next installation, if PDB management is enabled, the operator will
+    attempt to retrieve any existing PDB. If none is found, it will create a new one
+    and initiate a reconciliation loop. If PDB management is disabled, the existing PDB
+    will remain intact, and the reconciliation loop will not be executed. By default,
+    PDB management is enabled.
+    """
+    pdb_max_unavailable: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Pod eviction is allowed if at most "pdbMaxUnavailable" pods are unavailable after the eviction,
+    i.e. even in absence of the evicted pod. For example, one can prevent all voluntary evictions
+    by specifying 0. This is a mutually exclusive setting with "minAvailable".
+    """
+    reconcile: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileArgs']]]
+    schema_policy: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersSchemaPolicyArgs']]]
+    secret: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersSecretArgs']]]
+    secure: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, open secure ports for cluster
+    """
+    settings: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` only in one cluster during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
+    override top-level `chi.spec.configuration.settings`
+    More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+    """
+    templates: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersTemplatesArgs']]]
+    zookeeper: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersZookeeperArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersArgs:
+    def __init__(__self__, *,
+                 files: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 insecure: pulumi.Input[Optional[_builtins.str]] = None,
+                 layout: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutArgs']] = None,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 pdb_managed: pulumi.Input[Optional[_builtins.str]] = None,
+                 pdb_max_unavailable: pulumi.Input[Optional[_builtins.int]] = None,
+                 reconcile: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileArgs']] = None,
+                 schema_policy: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersSchemaPolicyArgs']] = None,
+                 secret: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersSecretArgs']] = None,
+                 secure: pulumi.Input[Optional[_builtins.str]] = None,
+                 settings: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 templates: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersTemplatesArgs']] = None,
+                 zookeeper: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersZookeeperArgs']] = None):
+        """
+        :param pulumi.Input[Mapping[str, Any]] files: optional, allows define content of any setting file inside each `Pod` on current cluster during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+               override top-level `chi.spec.configuration.files`
+        :param pulumi.Input[_builtins.str] insecure: optional, open insecure ports for cluster, defaults to "yes"
+        :param pulumi.Input[_builtins.str] name: cluster name, used to identify set of servers and wide used during generate names of related Kubernetes resources
+        :param pulumi.Input[_builtins.str] pdb_managed: Specifies whether the Pod Disruption Budget (PDB) should be managed.
+               During the next installation, if PDB management is enabled, the operator will
+               attempt to retrieve any existing PDB. If none is found, it will create a new one
+               and initiate a reconciliation loop. If PDB management is disabled, the existing PDB
+               will remain intact, and the reconciliation loop will not be executed. By default,
+               PDB management is enabled.
+        :param pulumi.Input[_builtins.int] pdb_max_unavailable: Pod eviction is allowed if at most "pdbMaxUnavailable" pods are unavailable after the eviction,
+               i.e. even in absence of the evicted pod. For example, one can prevent all voluntary evictions
+               by specifying 0. This is a mutually exclusive setting with "minAvailable".
+        :param pulumi.Input[_builtins.str] secure: optional, open secure ports for cluster
+        :param pulumi.Input[Mapping[str, Any]] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` only in one cluster during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
+               override top-level `chi.spec.configuration.settings`
+               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        """
+        if files is not None:
+            pulumi.set(__self__, "files", files)
+        if insecure is not None:
+            pulumi.set(__self__, "insecure", insecure)
+        if layout is not None:
+            pulumi.set(__self__, "layout", layout)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if pdb_managed is not None:
+            pulumi.set(__self__, "pdb_managed", pdb_managed)
+        if pdb_max_unavailable is not None:
+            pulumi.set(__self__, "pdb_max_unavailable", pdb_max_unavailable)
+        if reconcile is not None:
+            pulumi.set(__self__, "reconcile", reconcile)
+        if schema_policy is not None:
+            pulumi.set(__self__, "schema_policy", schema_policy)
+        if secret is not None:
+            pulumi.set(__self__, "secret", secret)
+        if secure is not None:
+            pulumi.set(__self__, "secure", secure)
+        if settings is not None:
+            pulumi.set(__self__, "settings", settings)
+        if templates is not None:
+            pulumi.set(__self__, "templates", templates)
+        if zookeeper is not None:
+            pulumi.set(__self__, "zookeeper", zookeeper)
+
+    @_builtins.property
+    @pulumi.getter
+    def files(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        optional, allows define content of any setting file inside each `Pod` on current cluster during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+        override top-level `chi.spec.configuration.files`
+        """
+        return pulumi.get(self, "files")
+
+    @files.setter
+    def files(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "files", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def insecure(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, open insecure ports for cluster, defaults to "yes"
+        """
+        return pulumi.get(self, "insecure")
+
+    @insecure.setter
+    def insecure(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "insecure", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def layout(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutArgs']]:
+        return pulumi.get(self, "layout")
+
+    @layout.setter
+    def layout(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutArgs']]):
+        pulumi.set(self, "layout", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        cluster name, used to identify set of servers and wide used during generate names of related Kubernetes resources
+        """
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="pdbManaged")
+    def pdb_managed(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Specifies whether the Pod Disruption Budget (PDB) should be managed.
+        During the next installation, if PDB management is enabled, the operator will
+        attempt to retrieve any existing PDB. If none is found, it will create a new one
+        and initiate a reconciliation loop. If PDB management is disabled, the existing PDB
+        will remain intact, and the reconciliation loop will not be executed. By default,
+        PDB management is enabled.
+        """
+        return pulumi.get(self, "pdb_managed")
+
+    @pdb_managed.setter
+    def pdb_managed(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "pdb_managed", value)
+
+    @_builtins.property
+    @pulumi.getter(name="pdbMaxUnavailable")
+    def pdb_max_unavailable(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Pod eviction is allowed if at most "pdbMaxUnavailable" pods are unavailable after the eviction,
+        i.e. even in absence of the evicted pod. For example, one can prevent all voluntary evictions
+        by specifying 0. This is a mutually exclusive setting with "minAvailable".
+        """
+        return pulumi.get(self, "pdb_max_unavailable")
+
+    @pdb_max_unavailable.setter
+    def pdb_max_unavailable(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "pdb_max_unavailable", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def reconcile(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileArgs']]:
+        return pulumi.get(self, "reconcile")
+
+    @reconcile.setter
+    def reconcile(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileArgs']]):
+        pulumi.set(self, "reconcile", value)
+
+    @_builtins.property
+    @pulumi.getter(name="schemaPolicy")
+    def schema_policy(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersSchemaPolicyArgs']]:
+        return pulumi.get(self, "schema_policy")
+
+    @schema_policy.setter
+    def schema_policy(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersSchemaPolicyArgs']]):
+        pulumi.set(self, "schema_policy", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def secret(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersSecretArgs']]:
+        return pulumi.get(self, "secret")
+
+    @secret.setter
+    def secret(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersSecretArgs']]):
+        pulumi.set(self, "secret", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def secure(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, open secure ports for cluster
+        """
+        return pulumi.get(self, "secure")
+
+    @secure.setter
+    def secure(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "secure", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def settings(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` only in one cluster during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
+        override top-level `chi.spec.configuration.settings`
+        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        """
+        return pulumi.get(self, "settings")
+
+    @settings.setter
+    def settings(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "settings", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def templates(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersTemplatesArgs']]:
+        return pulumi.get(self, "templates")
+
+    @templates.setter
+    def templates(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersTemplatesArgs']]):
+        pulumi.set(self, "templates", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def zookeeper(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersZookeeperArgs']]:
+        return pulumi.get(self, "zookeeper")
+
+    @zookeeper.setter
+    def zookeeper(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersZookeeperArgs']]):
+        pulumi.set(self, "zookeeper", value)
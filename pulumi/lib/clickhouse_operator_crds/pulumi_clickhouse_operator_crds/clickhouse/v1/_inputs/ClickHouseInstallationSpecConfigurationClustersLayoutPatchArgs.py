@@ -0,0 +1,134 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersLayoutPatchArgsDict', 'ClickHouseInstallationSpecConfigurationClustersLayoutPatchArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersLayoutPatchArgsDict(TypedDict):
+    """
+    describe current cluster layout, how much shards in cluster, how much replica in shard
+    allows override settings on each shard and replica separatelly
+    """
+    replicas: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatchArgs']]]]]
+    """
+    optional, allows override top-level `chi.spec.configuration` and cluster-level `chi.spec.configuration.clusters` configuration for each replica and each shard relates to selected replica, use it only if you fully understand what you do
+    """
+    replicas_count: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    how much replicas in each shards for current cluster will run in Kubernetes,
+    each replica is a separate `StatefulSet` which contains only one `Pod` with `clickhouse-server` instance,
+    every shard contains 1 replica by default"
+    """
+    shards: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgs']]]]]
+    """
+    optional, allows override top-level `chi.spec.configuration`, cluster-level
+    `chi.spec.configuration.clusters` settings for each shard separately,
+    use it only if you fully understand what you do"
+    """
+    shards_count: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    how much shards for current ClickHouse cluster will run in Kubernetes,
+    each shard contains shared-nothing part of data and contains set of replicas,
+    cluster contains 1 shard by default"
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersLayoutPatchArgs:
+    def __init__(__self__, *,
+                 replicas: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatchArgs']]]] = None,
+                 replicas_count: pulumi.Input[Optional[_builtins.int]] = None,
+                 shards: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgs']]]] = None,
+                 shards_count: pulumi.Input[Optional[_builtins.int]] = None):
+        """
+        describe current cluster layout, how much shards in cluster, how much replica in shard
+        allows override settings on each shard and replica separatelly
+
+
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatchArgs']]] replicas: optional, allows override top-level `chi.spec.configuration` and cluster-level `chi.spec.configuration.clusters` configuration for each replica and each shard relates to selected replica, use it only if you fully understand what you do
+        :param pulumi.Input[_builtins.int] replicas_count: how much replicas in each shards for current cluster will run in Kubernetes,
+               each replica is a separate `StatefulSet` which contains only one `Pod` with `clickhouse-server` instance,
+               every shard contains 1 replica by default"
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgs']]] shards: optional, allows override top-level `chi.spec.configuration`, cluster-level
+               `chi.spec.configuration.clusters` settings for each shard separately,
+               use it only if you fully understand what you do"
+        :param pulumi.Input[_builtins.int] shards_count: how much shards for current ClickHouse cluster will run in Kubernetes,
+               each shard contains shared-nothing part of data and contains set of replicas,
+               cluster contains 1 shard by default"
+        """
+        if replicas is not None:
+            pulumi.set(__self__, "replicas", replicas)
+        if replicas_count is not None:
+            pulumi.set(__self__, "replicas_count", replicas_count)
+        if shards is not None:
+            pulumi.set(__self__, "shards", shards)
+        if shards_count is not None:
+            pulumi.set(__self__, "shards_count", shards_count)
+
+    @_builtins.property
+    @pulumi.getter
+    def replicas(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatchArgs']]]]:
+        """
+        optional, allows override top-level `chi.spec.configuration` and cluster-level `chi.spec.configuration.clusters` configuration for each replica and each shard relates to selected replica, use it only if you fully understand what you do
+        """
+        return pulumi.get(self, "replicas")
+
+    @replicas.setter
+    def replicas(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatchArgs']]]]):
+        pulumi.set(self, "replicas", value)
+
+    @_builtins.property
+    @pulumi.getter(name="replicasCount")
+    def replicas_count(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        how much replicas in each shards for current cluster will run in Kubernetes,
+        each replica is a separate `StatefulSet` which contains only one `Pod` with `clickhouse-server` instance,
+        every shard contains 1 replica by default"
+        """
+        return pulumi.get(self, "replicas_count")
+
+    @replicas_count.setter
+    def replicas_count(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "replicas_count", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def shards(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgs']]]]:
+        """
+        optional, allows override top-level `chi.spec.configuration`, cluster-level
+        `chi.spec.configuration.clusters` settings for each shard separately,
+        use it only if you fully understand what you do"
+        """
+        return pulumi.get(self, "shards")
+
+    @shards.setter
+    def shards(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgs']]]]):
+        pulumi.set(self, "shards", value)
+
+    @_builtins.property
+    @pulumi.getter(name="shardsCount")
+    def shards_count(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        how much shards for current ClickHouse cluster will run in Kubernetes,
+        each shard contains shared-nothing part of data and contains set of replicas,
+        cluster contains 1 shard by default"
+        """
+        return pulumi.get(self, "shards_count")
+
+    @shards_count.setter
+    def shards_count(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "shards_count", value)
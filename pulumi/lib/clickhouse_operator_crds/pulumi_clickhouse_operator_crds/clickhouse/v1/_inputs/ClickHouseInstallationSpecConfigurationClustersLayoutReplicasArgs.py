@@ -0,0 +1,150 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersLayoutReplicasArgsDict', 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersLayoutReplicasArgsDict(TypedDict):
+    files: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    optional, allows define content of any setting file inside each `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+    override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
+    """
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, by default replica name is generated, but you can override it and setup custom name
+    """
+    settings: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
+    override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and will ignore if shard-level `chi.spec.configuration.clusters.layout.shards` present
+    More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+    """
+    shards: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsArgs']]]]]
+    """
+    optional, list of shards related to current replica, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
+    """
+    shards_count: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    optional, count of shards related to current replica, you can override each shard behavior on low-level `chi.spec.configuration.clusters.layout.replicas.shards`
+    """
+    templates: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersLayoutReplicasArgs:
+    def __init__(__self__, *,
+                 files: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 settings: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 shards: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsArgs']]]] = None,
+                 shards_count: pulumi.Input[Optional[_builtins.int]] = None,
+                 templates: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesArgs']] = None):
+        """
+        :param pulumi.Input[Mapping[str, Any]] files: optional, allows define content of any setting file inside each `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+               override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
+        :param pulumi.Input[_builtins.str] name: optional, by default replica name is generated, but you can override it and setup custom name
+        :param pulumi.Input[Mapping[str, Any]] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
+               override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and will ignore if shard-level `chi.spec.configuration.clusters.layout.shards` present
+               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsArgs']]] shards: optional, list of shards related to current replica, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
+        :param pulumi.Input[_builtins.int] shards_count: optional, count of shards related to current replica, you can override each shard behavior on low-level `chi.spec.configuration.clusters.layout.replicas.shards`
+        """
+        if files is not None:
+            pulumi.set(__self__, "files", files)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if settings is not None:
+            pulumi.set(__self__, "settings", settings)
+        if shards is not None:
+            pulumi.set(__self__, "shards", shards)
+        if shards_count is not None:
+            pulumi.set(__self__, "shards_count", shards_count)
+        if templates is not None:
+            pulumi.set(__self__, "templates", templates)
+
+    @_builtins.property
+    @pulumi.getter
+    def files(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        optional, allows define content of any setting file inside each `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+        override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
+        """
+        return pulumi.get(self, "files")
+
+    @files.setter
+    def files(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "files", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, by default replica name is generated, but you can override it and setup custom name
+        """
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def settings(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
+        override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and will ignore if shard-level `chi.spec.configuration.clusters.layout.shards` present
+        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        """
+        return pulumi.get(self, "settings")
+
+    @settings.setter
+    def settings(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "settings", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def shards(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsArgs']]]]:
+        """
+        optional, list of shards related to current replica, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
+        """
+        return pulumi.get(self, "shards")
+
+    @shards.setter
+    def shards(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsArgs']]]]):
+        pulumi.set(self, "shards", value)
+
+    @_builtins.property
+    @pulumi.getter(name="shardsCount")
+    def shards_count(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        optional, count of shards related to current replica, you can override each shard behavior on low-level `chi.spec.configuration.clusters.layout.replicas.shards`
+        """
+        return pulumi.get(self, "shards_count")
+
+    @shards_count.setter
+    def shards_count(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "shards_count", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def templates(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesArgs']]:
+        return pulumi.get(self, "templates")
+
+    @templates.setter
+    def templates(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesArgs']]):
+        pulumi.set(self, "templates", value)
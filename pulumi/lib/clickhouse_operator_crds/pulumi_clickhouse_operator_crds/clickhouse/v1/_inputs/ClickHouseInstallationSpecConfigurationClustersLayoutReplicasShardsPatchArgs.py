@@ -0,0 +1,245 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatchArgsDict', 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatchArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatchArgsDict(TypedDict):
+    files: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    optional, allows define content of any setting file inside each `Pod` only in one shard related to current replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+    override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
+    """
+    http_port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    optional, setup `Pod.spec.containers.ports` with name `http` for selected shard, override `chi.spec.templates.hostTemplates.spec.httpPort`
+    allows connect to `clickhouse-server` via HTTP protocol via kubernetes `Service`
+    """
+    https_port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    insecure: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, open insecure ports for cluster, defaults to "yes"
+    """
+    interserver_http_port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    optional, setup `Pod.spec.containers.ports` with name `interserver` for selected shard, override `chi.spec.templates.hostTemplates.spec.interserverHTTPPort`
+    allows connect between replicas inside same shard during fetch replicated data parts HTTP protocol
+    """
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, by default shard name is generated, but you can override it and setup custom name
+    """
+    secure: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, open secure ports
+    """
+    settings: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one shard related to current replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
+    override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and replica-level `chi.spec.configuration.clusters.layout.replicas.settings`
+    More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+    """
+    tcp_port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    optional, setup `Pod.spec.containers.ports` with name `tcp` for selected shard, override `chi.spec.templates.hostTemplates.spec.tcpPort`
+    allows connect to `clickhouse-server` via TCP Native protocol via kubernetes `Service`
+    """
+    templates: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatchArgs']]]
+    tls_port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatchArgs:
+    def __init__(__self__, *,
+                 files: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 http_port: pulumi.Input[Optional[_builtins.int]] = None,
+                 https_port: pulumi.Input[Optional[_builtins.int]] = None,
+                 insecure: pulumi.Input[Optional[_builtins.str]] = None,
+                 interserver_http_port: pulumi.Input[Optional[_builtins.int]] = None,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 secure: pulumi.Input[Optional[_builtins.str]] = None,
+                 settings: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 tcp_port: pulumi.Input[Optional[_builtins.int]] = None,
+                 templates: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatchArgs']] = None,
+                 tls_port: pulumi.Input[Optional[_builtins.int]] = None):
+        """
+        :param pulumi.Input[Mapping[str, Any]] files: optional, allows define content of any setting file inside each `Pod` only in one shard related to current replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+               override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
+        :param pulumi.Input[_builtins.int] http_port: optional, setup `Pod.spec.containers.ports` with name `http` for selected shard, override `chi.spec.templates.hostTemplates.spec.httpPort`
+               allows connect to `clickhouse-server` via HTTP protocol via kubernetes `Service`
+        :param pulumi.Input[_builtins.str] insecure: optional, open insecure ports for cluster, defaults to "yes"
+        :param pulumi.Input[_builtins.int] interserver_http_port: optional, setup `Pod.spec.containers.ports` with name `interserver` for selected shard, override `chi.spec.templates.hostTemplates.spec.interserverHTTPPort`
+               allows connect between replicas inside same shard during fetch replicated data parts HTTP protocol
+        :param pulumi.Input[_builtins.str] name: optional, by default shard name is generated, but you can override it and setup custom name
+        :param pulumi.Input[_builtins.str] secure: optional, open secure ports
+        :param pulumi.Input[Mapping[str, Any]] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one shard related to current replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
+               override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and replica-level `chi.spec.configuration.clusters.layout.replicas.settings`
+               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        :param pulumi.Input[_builtins.int] tcp_port: optional, setup `Pod.spec.containers.ports` with name `tcp` for selected shard, override `chi.spec.templates.hostTemplates.spec.tcpPort`
+               allows connect to `clickhouse-server` via TCP Native protocol via kubernetes `Service`
+        """
+        if files is not None:
+            pulumi.set(__self__, "files", files)
+        if http_port is not None:
+            pulumi.set(__self__, "http_port", http_port)
+        if https_port is not None:
+            pulumi.set(__self__, "https_port", https_port)
+        if insecure is not None:
+            pulumi.set(__self__, "insecure", insecure)
+        if interserver_http_port is not None:
+            pulumi.set(__self__, "interserver_http_port", interserver_http_port)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if secure is not None:
+            pulumi.set(__self__, "secure", secure)
+        if settings is not None:
+            pulumi.set(__self__, "settings", settings)
+        if tcp_port is not None:
+            pulumi.set(__self__, "tcp_port", tcp_port)
+        if templates is not None:
+            pulumi.set(__self__, "templates", templates)
+        if tls_port is not None:
+            pulumi.set(__self__, "tls_port", tls_port)
+
+    @_builtins.property
+    @pulumi.getter
+    def files(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        optional, allows define content of any setting file inside each `Pod` only in one shard related to current replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+        override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
+        """
+        return pulumi.get(self, "files")
+
+    @files.setter
+    def files(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "files", value)
+
+    @_builtins.property
+    @pulumi.getter(name="httpPort")
+    def http_port(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        optional, setup `Pod.spec.containers.ports` with name `http` for selected shard, override `chi.spec.templates.hostTemplates.spec.httpPort`
+        allows connect to `clickhouse-server` via HTTP protocol via kubernetes `Service`
+        """
+        return pulumi.get(self, "http_port")
+
+    @http_port.setter
+    def http_port(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "http_port", value)
+
+    @_builtins.property
+    @pulumi.getter(name="httpsPort")
+    def https_port(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "https_port")
+
+    @https_port.setter
+    def https_port(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "https_port", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def insecure(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, open insecure ports for cluster, defaults to "yes"
+        """
+        return pulumi.get(self, "insecure")
+
+    @insecure.setter
+    def insecure(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "insecure", value)
+
+    @_builtins.property
+    @pulumi.getter(name="interserverHTTPPort")
+    def interserver_http_port(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        optional, setup `Pod.spec.containers.ports` with name `interserver` for selected shard, override `chi.spec.templates.hostTemplates.spec.interserverHTTPPort`
+        allows connect between replicas inside same shard during fetch replicated data parts HTTP protocol
+        """
+        return pulumi.get(self, "interserver_http_port")
+
+    @interserver_http_port.setter
+    def interserver_http_port(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "interserver_http_port", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, by default shard name is generated, but you can override it and setup custom name
+        """
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def secure(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, open secure ports
+        """
+        return pulumi.get(self, "secure")
+
+    @secure.setter
+    def secure(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "secure", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def settings(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one shard related to current replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
+        override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and replica-level `chi.spec.configuration.clusters.layout.replicas.settings`
+        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        """
+        return pulumi.get(self, "settings")
+
+    @settings.setter
+    def settings(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "settings", value)
+
+    @_builtins.property
+    @pulumi.getter(name="tcpPort")
+    def tcp_port(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        optional, setup `Pod.spec.containers.ports` with name `tcp` for selected shard, override `chi.spec.templates.hostTemplates.spec.tcpPort`
+        allows connect to `clickhouse-server` via TCP Native protocol via kubernetes `Service`
+        """
+        return pulumi.get(self, "tcp_port")
+
+    @tcp_port.setter
+    def tcp_port(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "tcp_port", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def templates(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatchArgs']]:
+        return pulumi.get(self, "templates")
+
+    @templates.setter
+    def templates(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatchArgs']]):
+        pulumi.set(self, "templates", value)
+
+    @_builtins.property
+    @pulumi.getter(name="tlsPort")
+    def tls_port(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "tls_port")
+
+    @tls_port.setter
+    def tls_port(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "tls_port", value)
@@ -0,0 +1,236 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesArgsDict', 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesArgsDict(TypedDict):
+    """
+    optional, configuration of the templates names which will use for generate Kubernetes resources according to selected replica
+    override top-level `chi.spec.configuration.templates`, cluster-level `chi.spec.configuration.clusters.templates`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates`
+    """
+    cluster_service_template: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
+    """
+    data_volume_claim_template: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
+    """
+    host_template: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
+    """
+    log_volume_claim_template: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
+    """
+    pod_template: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
+    """
+    replica_service_template: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
+    """
+    service_template: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
+    """
+    service_templates: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
+    """
+    shard_service_template: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
+    """
+    volume_claim_template: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesArgs:
+    def __init__(__self__, *,
+                 cluster_service_template: pulumi.Input[Optional[_builtins.str]] = None,
+                 data_volume_claim_template: pulumi.Input[Optional[_builtins.str]] = None,
+                 host_template: pulumi.Input[Optional[_builtins.str]] = None,
+                 log_volume_claim_template: pulumi.Input[Optional[_builtins.str]] = None,
+                 pod_template: pulumi.Input[Optional[_builtins.str]] = None,
+                 replica_service_template: pulumi.Input[Optional[_builtins.str]] = None,
+                 service_template: pulumi.Input[Optional[_builtins.str]] = None,
+                 service_templates: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 shard_service_template: pulumi.Input[Optional[_builtins.str]] = None,
+                 volume_claim_template: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        optional, configuration of the templates names which will use for generate Kubernetes resources according to selected replica
+        override top-level `chi.spec.configuration.templates`, cluster-level `chi.spec.configuration.clusters.templates`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates`
+
+
+        :param pulumi.Input[_builtins.str] cluster_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
+        :param pulumi.Input[_builtins.str] data_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
+        :param pulumi.Input[_builtins.str] host_template: optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
+        :param pulumi.Input[_builtins.str] log_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
+        :param pulumi.Input[_builtins.str] pod_template: optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
+        :param pulumi.Input[_builtins.str] replica_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
+        :param pulumi.Input[_builtins.str] service_template: optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] service_templates: optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
+        :param pulumi.Input[_builtins.str] shard_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
+        :param pulumi.Input[_builtins.str] volume_claim_template: optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
+        """
+        if cluster_service_template is not None:
+            pulumi.set(__self__, "cluster_service_template", cluster_service_template)
+        if data_volume_claim_template is not None:
+            pulumi.set(__self__, "data_volume_claim_template", data_volume_claim_template)
+        if host_template is not None:
+            pulumi.set(__self__, "host_template", host_template)
+        if log_volume_claim_template is not None:
+            pulumi.set(__self__, "log_volume_claim_template", log_volume_claim_template)
+        if pod_template is not None:
+            pulumi.set(__self__, "pod_template", pod_template)
+        if replica_service_template is not None:
+            pulumi.set(__self__, "replica_service_template", replica_service_template)
+        if service_template is not None:
+            pulumi.set(__self__, "service_template", service_template)
+        if service_templates is not None:
+            pulumi.set(__self__, "service_templates", service_templates)
+        if shard_service_template is not None:
+            pulumi.set(__self__, "shard_service_template", shard_service_template)
+        if volume_claim_template is not None:
+            pulumi.set(__self__, "volume_claim_template", volume_claim_template)
+
+    @_builtins.property
+    @pulumi.getter(name="clusterServiceTemplate")
+    def cluster_service_template(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
+        """
+        return pulumi.get(self, "cluster_service_template")
+
+    @cluster_service_template.setter
+    def cluster_service_template(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "cluster_service_template", value)
+
+    @_builtins.property
+    @pulumi.getter(name="dataVolumeClaimTemplate")
+    def data_volume_claim_template(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
+        """
+        return pulumi.get(self, "data_volume_claim_template")
+
+    @data_volume_claim_template.setter
+    def data_volume_claim_template(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "data_volume_claim_template", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostTemplate")
+    def host_template(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
+        """
+        return pulumi.get(self, "host_template")
+
+    @host_template.setter
+    def host_template(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "host_template", value)
+
+    @_builtins.property
+    @pulumi.getter(name="logVolumeClaimTemplate")
+    def log_volume_claim_template(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
+        """
+        return pulumi.get(self, "log_volume_claim_template")
+
+    @log_volume_claim_template.setter
+    def log_volume_claim_template(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "log_volume_claim_template", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podTemplate")
+    def pod_template(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
+        """
+        return pulumi.get(self, "pod_template")
+
+    @pod_template.setter
+    def pod_template(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "pod_template", value)
+
+    @_builtins.property
+    @pulumi.getter(name="replicaServiceTemplate")
+    def replica_service_template(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
+        """
+        return pulumi.get(self, "replica_service_template")
+
+    @replica_service_template.setter
+    def replica_service_template(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "replica_service_template", value)
+
+    @_builtins.property
+    @pulumi.getter(name="serviceTemplate")
+    def service_template(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
+        """
+        return pulumi.get(self, "service_template")
+
+    @service_template.setter
+    def service_template(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "service_template", value)
+
+    @_builtins.property
+    @pulumi.getter(name="serviceTemplates")
+    def service_templates(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
+        """
+        return pulumi.get(self, "service_templates")
+
+    @service_templates.setter
+    def service_templates(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "service_templates", value)
+
+    @_builtins.property
+    @pulumi.getter(name="shardServiceTemplate")
+    def shard_service_template(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
+        """
+        return pulumi.get(self, "shard_service_template")
+
+    @shard_service_template.setter
+    def shard_service_template(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "shard_service_template", value)
+
+    @_builtins.property
+    @pulumi.getter(name="volumeClaimTemplate")
+    def volume_claim_template(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
+        """
+        return pulumi.get(self, "volume_claim_template")
+
+    @volume_claim_template.setter
+    def volume_claim_template(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "volume_claim_template", value)
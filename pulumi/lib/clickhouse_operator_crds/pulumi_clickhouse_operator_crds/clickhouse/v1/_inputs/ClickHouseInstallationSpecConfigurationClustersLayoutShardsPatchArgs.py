@@ -0,0 +1,231 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgsDict', 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgsDict(TypedDict):
+    definition_type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    DEPRECATED - to be removed soon
+    """
+    files: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    optional, allows define content of any setting file inside each `Pod` only in one shard during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+    override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`
+    """
+    internal_replication: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, `true` by default when `chi.spec.configuration.clusters[].layout.ReplicaCount` > 1 and 0 otherwise
+    allows setup <internal_replication> setting which will use during insert into tables with `Distributed` engine for insert only in one live replica and other replicas will download inserted data during replication,
+    will apply in <remote_servers> inside ConfigMap which will mount in /etc/clickhouse-server/config.d/chop-generated-remote_servers.xml
+    More details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
+    """
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, by default shard name is generated, but you can override it and setup custom name
+    """
+    replicas: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatchArgs']]]]]
+    """
+    optional, allows override behavior for selected replicas from cluster-level `chi.spec.configuration.clusters` and shard-level `chi.spec.configuration.clusters.layout.shards`
+    """
+    replicas_count: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    optional, how much replicas in selected shard for selected ClickHouse cluster will run in Kubernetes, each replica is a separate `StatefulSet` which contains only one `Pod` with `clickhouse-server` instance,
+    shard contains 1 replica by default
+    override cluster-level `chi.spec.configuration.clusters.layout.replicasCount`
+    """
+    settings: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` only in one shard during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
+    override top-level `chi.spec.configuration.settings` and cluster-level `chi.spec.configuration.clusters.settings`
+    More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+    """
+    templates: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatchArgs']]]
+    weight: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    optional, 1 by default, allows setup shard <weight> setting which will use during insert into tables with `Distributed` engine,
+    will apply in <remote_servers> inside ConfigMap which will mount in /etc/clickhouse-server/config.d/chop-generated-remote_servers.xml
+    More details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgs:
+    def __init__(__self__, *,
+                 definition_type: pulumi.Input[Optional[_builtins.str]] = None,
+                 files: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 internal_replication: pulumi.Input[Optional[_builtins.str]] = None,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 replicas: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatchArgs']]]] = None,
+                 replicas_count: pulumi.Input[Optional[_builtins.int]] = None,
+                 settings: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 templates: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatchArgs']] = None,
+                 weight: pulumi.Input[Optional[_builtins.int]] = None):
+        """
+        :param pulumi.Input[_builtins.str] definition_type: DEPRECATED - to be removed soon
+        :param pulumi.Input[Mapping[str, Any]] files: optional, allows define content of any setting file inside each `Pod` only in one shard during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+               override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`
+        :param pulumi.Input[_builtins.str] internal_replication: optional, `true` by default when `chi.spec.configuration.clusters[].layout.ReplicaCount` > 1 and 0 otherwise
+               allows setup <internal_replication> setting which will use during insert into tables with `Distributed` engine for insert only in one live replica and other replicas will download inserted data during replication,
+               will apply in <remote_servers> inside ConfigMap which will mount in /etc/clickhouse-server/config.d/chop-generated-remote_servers.xml
+               More details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
+        :param pulumi.Input[_builtins.str] name: optional, by default shard name is generated, but you can override it and setup custom name
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatchArgs']]] replicas: optional, allows override behavior for selected replicas from cluster-level `chi.spec.configuration.clusters` and shard-level `chi.spec.configuration.clusters.layout.shards`
+        :param pulumi.Input[_builtins.int] replicas_count: optional, how much replicas in selected shard for selected ClickHouse cluster will run in Kubernetes, each replica is a separate `StatefulSet` which contains only one `Pod` with `clickhouse-server` instance,
+               shard contains 1 replica by default
+               override cluster-level `chi.spec.configuration.clusters.layout.replicasCount`
+        :param pulumi.Input[Mapping[str, Any]] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` only in one shard during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
+               override top-level `chi.spec.configuration.settings` and cluster-level `chi.spec.configuration.clusters.settings`
+               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        :param pulumi.Input[_builtins.int] weight: optional, 1 by default, allows setup shard <weight> setting which will use during insert into tables with `Distributed` engine,
+               will apply in <remote_servers> inside ConfigMap which will mount in /etc/clickhouse-server/config.d/chop-generated-remote_servers.xml
+               More details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
+        """
+        if definition_type is not None:
+            pulumi.set(__self__, "definition_type", definition_type)
+        if files is not None:
+            pulumi.set(__self__, "files", files)
+        if internal_replication is not None:
+            pulumi.set(__self__, "internal_replication", internal_replication)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if replicas is not None:
+            pulumi.set(__self__, "replicas", replicas)
+        if replicas_count is not None:
+            pulumi.set(__self__, "replicas_count", replicas_count)
+        if settings is not None:
+            pulumi.set(__self__, "settings", settings)
+        if templates is not None:
+            pulumi.set(__self__, "templates", templates)
+        if weight is not None:
+            pulumi.set(__self__, "weight", weight)
+
+    @_builtins.property
+    @pulumi.getter(name="definitionType")
+    def definition_type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        DEPRECATED - to be removed soon
+        """
+        return pulumi.get(self, "definition_type")
+
+    @definition_type.setter
+    def definition_type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "definition_type", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def files(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        optional, allows define content of any setting file inside each `Pod` only in one shard during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+        override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`
+        """
+        return pulumi.get(self, "files")
+
+    @files.setter
+    def files(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "files", value)
+
+    @_builtins.property
+    @pulumi.getter(name="internalReplication")
+    def internal_replication(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, `true` by default when `chi.spec.configuration.clusters[].layout.ReplicaCount` > 1 and 0 otherwise
+        allows setup <internal_replication> setting which will use during insert into tables with `Distributed` engine for insert only in one live replica and other replicas will download inserted data during replication,
+        will apply in <remote_servers> inside ConfigMap which will mount in /etc/clickhouse-server/config.d/chop-generated-remote_servers.xml
+        More details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
+        """
+        return pulumi.get(self, "internal_replication")
+
+    @internal_replication.setter
+    def internal_replication(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "internal_replication", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, by default shard name is generated, but you can override it and setup custom name
+        """
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def replicas(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatchArgs']]]]:
+        """
+        optional, allows override behavior for selected replicas from cluster-level `chi.spec.configuration.clusters` and shard-level `chi.spec.configuration.clusters.layout.shards`
+        """
+        return pulumi.get(self, "replicas")
+
+    @replicas.setter
+    def replicas(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatchArgs']]]]):
+        pulumi.set(self, "replicas", value)
+
+    @_builtins.property
+    @pulumi.getter(name="replicasCount")
+    def replicas_count(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        optional, how much replicas in selected shard for selected ClickHouse cluster will run in Kubernetes, each replica is a separate `StatefulSet` which contains only one `Pod` with `clickhouse-server` instance,
+        shard contains 1 replica by default
+        override cluster-level `chi.spec.configuration.clusters.layout.replicasCount`
+        """
+        return pulumi.get(self, "replicas_count")
+
+    @replicas_count.setter
+    def replicas_count(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "replicas_count", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def settings(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` only in one shard during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
+        override top-level `chi.spec.configuration.settings` and cluster-level `chi.spec.configuration.clusters.settings`
+        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        """
+        return pulumi.get(self, "settings")
+
+    @settings.setter
+    def settings(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "settings", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def templates(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatchArgs']]:
+        return pulumi.get(self, "templates")
+
+    @templates.setter
+    def templates(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatchArgs']]):
+        pulumi.set(self, "templates", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def weight(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        optional, 1 by default, allows setup shard <weight> setting which will use during insert into tables with `Distributed` engine,
+        will apply in <remote_servers> inside ConfigMap which will mount in /etc/clickhouse-server/config.d/chop-generated-remote_servers.xml
+        More details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
+        """
+        return pulumi.get(self, "weight")
+
+    @weight.setter
+    def weight(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "weight", value)
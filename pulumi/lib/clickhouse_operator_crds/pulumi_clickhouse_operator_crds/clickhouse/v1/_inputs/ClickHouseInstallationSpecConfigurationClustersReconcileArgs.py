@@ -0,0 +1,71 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersReconcileArgsDict', 'ClickHouseInstallationSpecConfigurationClustersReconcileArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersReconcileArgsDict(TypedDict):
+    """
+    allow tuning reconciling process
+    """
+    hooks: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksArgs']]]
+    host: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostArgs']]]
+    runtime: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileRuntimeArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersReconcileArgs:
+    def __init__(__self__, *,
+                 hooks: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksArgs']] = None,
+                 host: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostArgs']] = None,
+                 runtime: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileRuntimeArgs']] = None):
+        """
+        allow tuning reconciling process
+        """
+        if hooks is not None:
+            pulumi.set(__self__, "hooks", hooks)
+        if host is not None:
+            pulumi.set(__self__, "host", host)
+        if runtime is not None:
+            pulumi.set(__self__, "runtime", runtime)
+
+    @_builtins.property
+    @pulumi.getter
+    def hooks(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksArgs']]:
+        return pulumi.get(self, "hooks")
+
+    @hooks.setter
+    def hooks(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksArgs']]):
+        pulumi.set(self, "hooks", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def host(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostArgs']]:
+        return pulumi.get(self, "host")
+
+    @host.setter
+    def host(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostArgs']]):
+        pulumi.set(self, "host", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def runtime(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileRuntimeArgs']]:
+        return pulumi.get(self, "runtime")
+
+    @runtime.setter
+    def runtime(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileRuntimeArgs']]):
+        pulumi.set(self, "runtime", value)
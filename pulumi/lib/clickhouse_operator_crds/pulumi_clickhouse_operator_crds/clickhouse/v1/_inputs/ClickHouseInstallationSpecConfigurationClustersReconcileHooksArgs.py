@@ -0,0 +1,73 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersReconcileHooksArgsDict', 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersReconcileHooksArgsDict(TypedDict):
+    """
+    cluster-level hooks to execute before and after cluster reconcile
+    """
+    post: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgs']]]]]
+    """
+    actions to execute after cluster reconcile
+    """
+    pre: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreArgs']]]]]
+    """
+    actions to execute before cluster reconcile
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersReconcileHooksArgs:
+    def __init__(__self__, *,
+                 post: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgs']]]] = None,
+                 pre: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreArgs']]]] = None):
+        """
+        cluster-level hooks to execute before and after cluster reconcile
+
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgs']]] post: actions to execute after cluster reconcile
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreArgs']]] pre: actions to execute before cluster reconcile
+        """
+        if post is not None:
+            pulumi.set(__self__, "post", post)
+        if pre is not None:
+            pulumi.set(__self__, "pre", pre)
+
+    @_builtins.property
+    @pulumi.getter
+    def post(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgs']]]]:
+        """
+        actions to execute after cluster reconcile
+        """
+        return pulumi.get(self, "post")
+
+    @post.setter
+    def post(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgs']]]]):
+        pulumi.set(self, "post", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def pre(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreArgs']]]]:
+        """
+        actions to execute before cluster reconcile
+        """
+        return pulumi.get(self, "pre")
+
+    @pre.setter
+    def pre(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreArgs']]]]):
+        pulumi.set(self, "pre", value)
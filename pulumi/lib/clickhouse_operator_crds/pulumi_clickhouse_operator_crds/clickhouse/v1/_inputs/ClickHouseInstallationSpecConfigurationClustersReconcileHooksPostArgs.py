@@ -0,0 +1,160 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgsDict', 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgsDict(TypedDict):
+    events: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    Cluster-scope reconcile lifecycle events. Required, non-empty.
+      Any              - wildcard match: fires on every cluster reconcile pass
+                         and the cluster delete sweep
+      ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
+                         only on the first reconcile of a brand-new cluster
+      ClusterReconcile - ongoing reconcile pass over an existing cluster (at
+                         least one host has prior state). Fires on every
+                         operator reconcile cycle the upstream gates allow,
+                         including taskID-only force-reconciles. NOT a "spec
+                         changed" signal.
+      ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
+    """
+    failure_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Controls what happens when this hook returns an error.
+    Fail (default) propagates the error; Ignore logs a warning and continues.
+    """
+    http: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpArgs']]]
+    shell: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellArgs']]]
+    sql: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlArgs']]]
+    target: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgs:
+    def __init__(__self__, *,
+                 events: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 failure_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 http: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpArgs']] = None,
+                 shell: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellArgs']] = None,
+                 sql: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlArgs']] = None,
+                 target: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] events: Cluster-scope reconcile lifecycle events. Required, non-empty.
+                 Any              - wildcard match: fires on every cluster reconcile pass
+                                    and the cluster delete sweep
+                 ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
+                                    only on the first reconcile of a brand-new cluster
+                 ClusterReconcile - ongoing reconcile pass over an existing cluster (at
+                                    least one host has prior state). Fires on every
+                                    operator reconcile cycle the upstream gates allow,
+                                    including taskID-only force-reconciles. NOT a "spec
+                                    changed" signal.
+                 ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
+        :param pulumi.Input[_builtins.str] failure_policy: Controls what happens when this hook returns an error.
+               Fail (default) propagates the error; Ignore logs a warning and continues.
+        :param pulumi.Input[_builtins.str] target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
+        """
+        if events is not None:
+            pulumi.set(__self__, "events", events)
+        if failure_policy is not None:
+            pulumi.set(__self__, "failure_policy", failure_policy)
+        if http is not None:
+            pulumi.set(__self__, "http", http)
+        if shell is not None:
+            pulumi.set(__self__, "shell", shell)
+        if sql is not None:
+            pulumi.set(__self__, "sql", sql)
+        if target is not None:
+            pulumi.set(__self__, "target", target)
+
+    @_builtins.property
+    @pulumi.getter
+    def events(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        Cluster-scope reconcile lifecycle events. Required, non-empty.
+          Any              - wildcard match: fires on every cluster reconcile pass
+                             and the cluster delete sweep
+          ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
+                             only on the first reconcile of a brand-new cluster
+          ClusterReconcile - ongoing reconcile pass over an existing cluster (at
+                             least one host has prior state). Fires on every
+                             operator reconcile cycle the upstream gates allow,
+                             including taskID-only force-reconciles. NOT a "spec
+                             changed" signal.
+          ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
+        """
+        return pulumi.get(self, "events")
+
+    @events.setter
+    def events(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "events", value)
+
+    @_builtins.property
+    @pulumi.getter(name="failurePolicy")
+    def failure_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Controls what happens when this hook returns an error.
+        Fail (default) propagates the error; Ignore logs a warning and continues.
+        """
+        return pulumi.get(self, "failure_policy")
+
+    @failure_policy.setter
+    def failure_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "failure_policy", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def http(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpArgs']]:
+        return pulumi.get(self, "http")
+
+    @http.setter
+    def http(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpArgs']]):
+        pulumi.set(self, "http", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def shell(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellArgs']]:
+        return pulumi.get(self, "shell")
+
+    @shell.setter
+    def shell(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellArgs']]):
+        pulumi.set(self, "shell", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def sql(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlArgs']]:
+        return pulumi.get(self, "sql")
+
+    @sql.setter
+    def sql(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlArgs']]):
+        pulumi.set(self, "sql", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def target(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
+        """
+        return pulumi.get(self, "target")
+
+    @target.setter
+    def target(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "target", value)
@@ -0,0 +1,79 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersReconcileHostArgsDict', 'ClickHouseInstallationSpecConfigurationClustersReconcileHostArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersReconcileHostArgsDict(TypedDict):
+    """
+    Whether the operator during reconcile procedure should wait for a ClickHouse host:
+      - to be excluded from a ClickHouse cluster
+      - to complete all running queries
+      - to be included into a ClickHouse cluster
+    respectfully before moving forward
+    """
+    drop: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostDropArgs']]]
+    hooks: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksArgs']]]
+    wait: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersReconcileHostArgs:
+    def __init__(__self__, *,
+                 drop: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostDropArgs']] = None,
+                 hooks: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksArgs']] = None,
+                 wait: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitArgs']] = None):
+        """
+        Whether the operator during reconcile procedure should wait for a ClickHouse host:
+          - to be excluded from a ClickHouse cluster
+          - to complete all running queries
+          - to be included into a ClickHouse cluster
+        respectfully before moving forward
+        """
+        if drop is not None:
+            pulumi.set(__self__, "drop", drop)
+        if hooks is not None:
+            pulumi.set(__self__, "hooks", hooks)
+        if wait is not None:
+            pulumi.set(__self__, "wait", wait)
+
+    @_builtins.property
+    @pulumi.getter
+    def drop(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostDropArgs']]:
+        return pulumi.get(self, "drop")
+
+    @drop.setter
+    def drop(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostDropArgs']]):
+        pulumi.set(self, "drop", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def hooks(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksArgs']]:
+        return pulumi.get(self, "hooks")
+
+    @hooks.setter
+    def hooks(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksArgs']]):
+        pulumi.set(self, "hooks", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def wait(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitArgs']]:
+        return pulumi.get(self, "wait")
+
+    @wait.setter
+    def wait(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitArgs']]):
+        pulumi.set(self, "wait", value)
@@ -0,0 +1,39 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatchArgsDict', 'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatchArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatchArgsDict(TypedDict):
+    replicas: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatchArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatchArgs:
+    def __init__(__self__, *,
+                 replicas: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatchArgs']] = None):
+        if replicas is not None:
+            pulumi.set(__self__, "replicas", replicas)
+
+    @_builtins.property
+    @pulumi.getter
+    def replicas(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatchArgs']]:
+        return pulumi.get(self, "replicas")
+
+    @replicas.setter
+    def replicas(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatchArgs']]):
+        pulumi.set(self, "replicas", value)
@@ -0,0 +1,94 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatchArgsDict', 'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatchArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatchArgsDict(TypedDict):
+    """
+    Whether the operator during reconcile procedure should drop replicas when replica is deleted or recreated
+    """
+    active: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Whether the operator during reconcile procedure should drop active replicas when replica is deleted or recreated
+    """
+    on_delete: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Whether the operator during reconcile procedure should drop replicas when replica is deleted
+    """
+    on_lost_volume: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Whether the operator during reconcile procedure should drop replicas when replica volume is lost
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatchArgs:
+    def __init__(__self__, *,
+                 active: pulumi.Input[Optional[_builtins.str]] = None,
+                 on_delete: pulumi.Input[Optional[_builtins.str]] = None,
+                 on_lost_volume: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        Whether the operator during reconcile procedure should drop replicas when replica is deleted or recreated
+
+
+        :param pulumi.Input[_builtins.str] active: Whether the operator during reconcile procedure should drop active replicas when replica is deleted or recreated
+        :param pulumi.Input[_builtins.str] on_delete: Whether the operator during reconcile procedure should drop replicas when replica is deleted
+        :param pulumi.Input[_builtins.str] on_lost_volume: Whether the operator during reconcile procedure should drop replicas when replica volume is lost
+        """
+        if active is not None:
+            pulumi.set(__self__, "active", active)
+        if on_delete is not None:
+            pulumi.set(__self__, "on_delete", on_delete)
+        if on_lost_volume is not None:
+            pulumi.set(__self__, "on_lost_volume", on_lost_volume)
+
+    @_builtins.property
+    @pulumi.getter
+    def active(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Whether the operator during reconcile procedure should drop active replicas when replica is deleted or recreated
+        """
+        return pulumi.get(self, "active")
+
+    @active.setter
+    def active(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "active", value)
+
+    @_builtins.property
+    @pulumi.getter(name="onDelete")
+    def on_delete(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Whether the operator during reconcile procedure should drop replicas when replica is deleted
+        """
+        return pulumi.get(self, "on_delete")
+
+    @on_delete.setter
+    def on_delete(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "on_delete", value)
+
+    @_builtins.property
+    @pulumi.getter(name="onLostVolume")
+    def on_lost_volume(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Whether the operator during reconcile procedure should drop replicas when replica volume is lost
+        """
+        return pulumi.get(self, "on_lost_volume")
+
+    @on_lost_volume.setter
+    def on_lost_volume(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "on_lost_volume", value)
@@ -0,0 +1,73 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksArgsDict', 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksArgsDict(TypedDict):
+    """
+    hooks to execute before and after host reconcile
+    """
+    post: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostArgs']]]]]
+    """
+    actions to execute after reconcile
+    """
+    pre: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreArgs']]]]]
+    """
+    actions to execute before reconcile
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksArgs:
+    def __init__(__self__, *,
+                 post: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostArgs']]]] = None,
+                 pre: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreArgs']]]] = None):
+        """
+        hooks to execute before and after host reconcile
+
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostArgs']]] post: actions to execute after reconcile
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreArgs']]] pre: actions to execute before reconcile
+        """
+        if post is not None:
+            pulumi.set(__self__, "post", post)
+        if pre is not None:
+            pulumi.set(__self__, "pre", pre)
+
+    @_builtins.property
+    @pulumi.getter
+    def post(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostArgs']]]]:
+        """
+        actions to execute after reconcile
+        """
+        return pulumi.get(self, "post")
+
+    @post.setter
+    def post(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostArgs']]]]):
+        pulumi.set(self, "post", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def pre(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreArgs']]]]:
+        """
+        actions to execute before reconcile
+        """
+        return pulumi.get(self, "pre")
+
+    @pre.setter
+    def pre(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreArgs']]]]):
+        pulumi.set(self, "pre", value)
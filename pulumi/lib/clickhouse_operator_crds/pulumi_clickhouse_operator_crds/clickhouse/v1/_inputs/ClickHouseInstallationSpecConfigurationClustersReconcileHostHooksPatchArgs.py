@@ -0,0 +1,73 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatchArgsDict', 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatchArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatchArgsDict(TypedDict):
+    """
+    hooks to execute before and after host reconcile
+    """
+    post: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatchArgs']]]]]
+    """
+    actions to execute after reconcile
+    """
+    pre: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgs']]]]]
+    """
+    actions to execute before reconcile
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatchArgs:
+    def __init__(__self__, *,
+                 post: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatchArgs']]]] = None,
+                 pre: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgs']]]] = None):
+        """
+        hooks to execute before and after host reconcile
+
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatchArgs']]] post: actions to execute after reconcile
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgs']]] pre: actions to execute before reconcile
+        """
+        if post is not None:
+            pulumi.set(__self__, "post", post)
+        if pre is not None:
+            pulumi.set(__self__, "pre", pre)
+
+    @_builtins.property
+    @pulumi.getter
+    def post(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatchArgs']]]]:
+        """
+        actions to execute after reconcile
+        """
+        return pulumi.get(self, "post")
+
+    @post.setter
+    def post(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatchArgs']]]]):
+        pulumi.set(self, "post", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def pre(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgs']]]]:
+        """
+        actions to execute before reconcile
+        """
+        return pulumi.get(self, "pre")
+
+    @pre.setter
+    def pre(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgs']]]]):
+        pulumi.set(self, "pre", value)
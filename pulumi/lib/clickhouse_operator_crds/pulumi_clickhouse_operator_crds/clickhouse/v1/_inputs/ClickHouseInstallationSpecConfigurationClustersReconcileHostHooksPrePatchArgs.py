@@ -0,0 +1,187 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgsDict', 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgsDict(TypedDict):
+    events: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
+    The hook is skipped on any reconcile whose classifier does not emit at least one
+    of the listed events. Supported values:
+      Any               - wildcard match: fires on every hook-evaluation point,
+                          including the pre-delete sweep on the dying host
+      HostCreate        - first reconcile that creates a host (no ancestor); best
+                          paired with POST hooks because PRE hooks on first creation
+                          are skipped (no live pod yet)
+      HostUpdate        - reconcile that has prior state for the host; catch-all
+                          for ongoing reconciles
+      HostStart         - host transitions from stopped to running
+      HostStop          - host is being stopped (current spec marks it stopped)
+      HostConfigRestart - in-place software restart for a configuration change
+      HostRollout       - pod-template change forces a StatefulSet rollout
+      HostShutdown      - aggregate: fires whenever the pod is going down for any
+                          reason (Stop, ConfigRestart, Rollout, or Delete)
+      HostDelete        - host is being removed from the cluster (downsize); fires
+                          on the dying host before tear-down. Always emitted
+                          alongside HostShutdown.
+    """
+    failure_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Controls what happens when this hook returns an error.
+    Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
+    Ignore: error is logged and the reconcile continues.
+    """
+    http: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatchArgs']]]
+    shell: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatchArgs']]]
+    sql: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatchArgs']]]
+    target: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgs:
+    def __init__(__self__, *,
+                 events: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 failure_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 http: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatchArgs']] = None,
+                 shell: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatchArgs']] = None,
+                 sql: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatchArgs']] = None,
+                 target: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] events: Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
+               The hook is skipped on any reconcile whose classifier does not emit at least one
+               of the listed events. Supported values:
+                 Any               - wildcard match: fires on every hook-evaluation point,
+                                     including the pre-delete sweep on the dying host
+                 HostCreate        - first reconcile that creates a host (no ancestor); best
+                                     paired with POST hooks because PRE hooks on first creation
+                                     are skipped (no live pod yet)
+                 HostUpdate        - reconcile that has prior state for the host; catch-all
+                                     for ongoing reconciles
+                 HostStart         - host transitions from stopped to running
+                 HostStop          - host is being stopped (current spec marks it stopped)
+                 HostConfigRestart - in-place software restart for a configuration change
+                 HostRollout       - pod-template change forces a StatefulSet rollout
+                 HostShutdown      - aggregate: fires whenever the pod is going down for any
+                                     reason (Stop, ConfigRestart, Rollout, or Delete)
+                 HostDelete        - host is being removed from the cluster (downsize); fires
+                                     on the dying host before tear-down. Always emitted
+                                     alongside HostShutdown.
+        :param pulumi.Input[_builtins.str] failure_policy: Controls what happens when this hook returns an error.
+               Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
+               Ignore: error is logged and the reconcile continues.
+        :param pulumi.Input[_builtins.str] target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
+        """
+        if events is not None:
+            pulumi.set(__self__, "events", events)
+        if failure_policy is not None:
+            pulumi.set(__self__, "failure_policy", failure_policy)
+        if http is not None:
+            pulumi.set(__self__, "http", http)
+        if shell is not None:
+            pulumi.set(__self__, "shell", shell)
+        if sql is not None:
+            pulumi.set(__self__, "sql", sql)
+        if target is not None:
+            pulumi.set(__self__, "target", target)
+
+    @_builtins.property
+    @pulumi.getter
+    def events(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
+        The hook is skipped on any reconcile whose classifier does not emit at least one
+        of the listed events. Supported values:
+          Any               - wildcard match: fires on every hook-evaluation point,
+                              including the pre-delete sweep on the dying host
+          HostCreate        - first reconcile that creates a host (no ancestor); best
+                              paired with POST hooks because PRE hooks on first creation
+                              are skipped (no live pod yet)
+          HostUpdate        - reconcile that has prior state for the host; catch-all
+                              for ongoing reconciles
+          HostStart         - host transitions from stopped to running
+          HostStop          - host is being stopped (current spec marks it stopped)
+          HostConfigRestart - in-place software restart for a configuration change
+          HostRollout       - pod-template change forces a StatefulSet rollout
+          HostShutdown      - aggregate: fires whenever the pod is going down for any
+                              reason (Stop, ConfigRestart, Rollout, or Delete)
+          HostDelete        - host is being removed from the cluster (downsize); fires
+                              on the dying host before tear-down. Always emitted
+                              alongside HostShutdown.
+        """
+        return pulumi.get(self, "events")
+
+    @events.setter
+    def events(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "events", value)
+
+    @_builtins.property
+    @pulumi.getter(name="failurePolicy")
+    def failure_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Controls what happens when this hook returns an error.
+        Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
+        Ignore: error is logged and the reconcile continues.
+        """
+        return pulumi.get(self, "failure_policy")
+
+    @failure_policy.setter
+    def failure_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "failure_policy", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def http(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatchArgs']]:
+        return pulumi.get(self, "http")
+
+    @http.setter
+    def http(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatchArgs']]):
+        pulumi.set(self, "http", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def shell(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatchArgs']]:
+        return pulumi.get(self, "shell")
+
+    @shell.setter
+    def shell(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatchArgs']]):
+        pulumi.set(self, "shell", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def sql(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatchArgs']]:
+        return pulumi.get(self, "sql")
+
+    @sql.setter
+    def sql(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatchArgs']]):
+        pulumi.set(self, "sql", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def target(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
+        """
+        return pulumi.get(self, "target")
+
+    @target.setter
+    def target(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "target", value)
@@ -0,0 +1,123 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitArgsDict', 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitArgsDict(TypedDict):
+    exclude: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Allows to stop all ClickHouse clusters defined in a CHI.
+    Works as the following:
+     - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
+     - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
+    """
+    include: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Whether the operator during reconcile procedure should wait for a ClickHouse host to be included into a ClickHouse cluster
+    """
+    probes: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesArgs']]]
+    queries: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Whether the operator during reconcile procedure should wait for a ClickHouse host to complete all running queries
+    """
+    replicas: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitArgs:
+    def __init__(__self__, *,
+                 exclude: pulumi.Input[Optional[_builtins.str]] = None,
+                 include: pulumi.Input[Optional[_builtins.str]] = None,
+                 probes: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesArgs']] = None,
+                 queries: pulumi.Input[Optional[_builtins.str]] = None,
+                 replicas: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasArgs']] = None):
+        """
+        :param pulumi.Input[_builtins.str] exclude: Allows to stop all ClickHouse clusters defined in a CHI.
+               Works as the following:
+                - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
+                - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
+        :param pulumi.Input[_builtins.str] include: Whether the operator during reconcile procedure should wait for a ClickHouse host to be included into a ClickHouse cluster
+        :param pulumi.Input[_builtins.str] queries: Whether the operator during reconcile procedure should wait for a ClickHouse host to complete all running queries
+        """
+        if exclude is not None:
+            pulumi.set(__self__, "exclude", exclude)
+        if include is not None:
+            pulumi.set(__self__, "include", include)
+        if probes is not None:
+            pulumi.set(__self__, "probes", probes)
+        if queries is not None:
+            pulumi.set(__self__, "queries", queries)
+        if replicas is not None:
+            pulumi.set(__self__, "replicas", replicas)
+
+    @_builtins.property
+    @pulumi.getter
+    def exclude(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Allows to stop all ClickHouse clusters defined in a CHI.
+        Works as the following:
+         - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
+         - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
+        """
+        return pulumi.get(self, "exclude")
+
+    @exclude.setter
+    def exclude(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "exclude", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def include(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Whether the operator during reconcile procedure should wait for a ClickHouse host to be included into a ClickHouse cluster
+        """
+        return pulumi.get(self, "include")
+
+    @include.setter
+    def include(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "include", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def probes(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesArgs']]:
+        return pulumi.get(self, "probes")
+
+    @probes.setter
+    def probes(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesArgs']]):
+        pulumi.set(self, "probes", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def queries(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Whether the operator during reconcile procedure should wait for a ClickHouse host to complete all running queries
+        """
+        return pulumi.get(self, "queries")
+
+    @queries.setter
+    def queries(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "queries", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def replicas(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasArgs']]:
+        return pulumi.get(self, "replicas")
+
+    @replicas.setter
+    def replicas(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasArgs']]):
+        pulumi.set(self, "replicas", value)
@@ -0,0 +1,85 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatchArgsDict', 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatchArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatchArgsDict(TypedDict):
+    """
+    What probes the operator should wait during host launch procedure
+    """
+    readiness: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Whether the operator during host launch procedure should wait for ready probe to succeed.
+    In case probe is unspecified wait is assumed to be completed successfully.
+    Default option value is to wait.
+    """
+    startup: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Whether the operator during host launch procedure should wait for startup probe to succeed.
+    In case probe is unspecified wait is assumed to be completed successfully.
+    Default option value is to do not wait.
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatchArgs:
+    def __init__(__self__, *,
+                 readiness: pulumi.Input[Optional[_builtins.str]] = None,
+                 startup: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        What probes the operator should wait during host launch procedure
+
+        :param pulumi.Input[_builtins.str] readiness: Whether the operator during host launch procedure should wait for ready probe to succeed.
+               In case probe is unspecified wait is assumed to be completed successfully.
+               Default option value is to wait.
+        :param pulumi.Input[_builtins.str] startup: Whether the operator during host launch procedure should wait for startup probe to succeed.
+               In case probe is unspecified wait is assumed to be completed successfully.
+               Default option value is to do not wait.
+        """
+        if readiness is not None:
+            pulumi.set(__self__, "readiness", readiness)
+        if startup is not None:
+            pulumi.set(__self__, "startup", startup)
+
+    @_builtins.property
+    @pulumi.getter
+    def readiness(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Whether the operator during host launch procedure should wait for ready probe to succeed.
+        In case probe is unspecified wait is assumed to be completed successfully.
+        Default option value is to wait.
+        """
+        return pulumi.get(self, "readiness")
+
+    @readiness.setter
+    def readiness(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "readiness", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def startup(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Whether the operator during host launch procedure should wait for startup probe to succeed.
+        In case probe is unspecified wait is assumed to be completed successfully.
+        Default option value is to do not wait.
+        """
+        return pulumi.get(self, "startup")
+
+    @startup.setter
+    def startup(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "startup", value)
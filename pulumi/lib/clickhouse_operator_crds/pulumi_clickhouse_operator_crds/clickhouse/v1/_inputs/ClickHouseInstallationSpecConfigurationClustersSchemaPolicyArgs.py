@@ -0,0 +1,74 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersSchemaPolicyArgsDict', 'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersSchemaPolicyArgsDict(TypedDict):
+    """
+    describes how schema is propagated within replicas and shards
+    """
+    replica: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    how schema is propagated within a replica
+    """
+    shard: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    how schema is propagated between shards
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersSchemaPolicyArgs:
+    def __init__(__self__, *,
+                 replica: pulumi.Input[Optional[_builtins.str]] = None,
+                 shard: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        describes how schema is propagated within replicas and shards
+
+
+        :param pulumi.Input[_builtins.str] replica: how schema is propagated within a replica
+        :param pulumi.Input[_builtins.str] shard: how schema is propagated between shards
+        """
+        if replica is not None:
+            pulumi.set(__self__, "replica", replica)
+        if shard is not None:
+            pulumi.set(__self__, "shard", shard)
+
+    @_builtins.property
+    @pulumi.getter
+    def replica(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        how schema is propagated within a replica
+        """
+        return pulumi.get(self, "replica")
+
+    @replica.setter
+    def replica(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "replica", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def shard(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        how schema is propagated between shards
+        """
+        return pulumi.get(self, "shard")
+
+    @shard.setter
+    def shard(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "shard", value)
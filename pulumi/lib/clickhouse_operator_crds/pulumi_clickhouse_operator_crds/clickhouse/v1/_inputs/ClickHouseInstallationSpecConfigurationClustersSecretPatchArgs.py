@@ -0,0 +1,86 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersSecretPatchArgsDict', 'ClickHouseInstallationSpecConfigurationClustersSecretPatchArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersSecretPatchArgsDict(TypedDict):
+    """
+    optional, shared secret value to secure cluster communications
+    """
+    auto: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Auto-generate shared secret value to secure cluster communications
+    """
+    value: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Cluster shared secret value in plain text
+    """
+    value_from: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatchArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersSecretPatchArgs:
+    def __init__(__self__, *,
+                 auto: pulumi.Input[Optional[_builtins.str]] = None,
+                 value: pulumi.Input[Optional[_builtins.str]] = None,
+                 value_from: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatchArgs']] = None):
+        """
+        optional, shared secret value to secure cluster communications
+
+        :param pulumi.Input[_builtins.str] auto: Auto-generate shared secret value to secure cluster communications
+        :param pulumi.Input[_builtins.str] value: Cluster shared secret value in plain text
+        """
+        if auto is not None:
+            pulumi.set(__self__, "auto", auto)
+        if value is not None:
+            pulumi.set(__self__, "value", value)
+        if value_from is not None:
+            pulumi.set(__self__, "value_from", value_from)
+
+    @_builtins.property
+    @pulumi.getter
+    def auto(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Auto-generate shared secret value to secure cluster communications
+        """
+        return pulumi.get(self, "auto")
+
+    @auto.setter
+    def auto(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "auto", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def value(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Cluster shared secret value in plain text
+        """
+        return pulumi.get(self, "value")
+
+    @value.setter
+    def value(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "value", value)
+
+    @_builtins.property
+    @pulumi.getter(name="valueFrom")
+    def value_from(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatchArgs']]:
+        return pulumi.get(self, "value_from")
+
+    @value_from.setter
+    def value_from(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatchArgs']]):
+        pulumi.set(self, "value_from", value)
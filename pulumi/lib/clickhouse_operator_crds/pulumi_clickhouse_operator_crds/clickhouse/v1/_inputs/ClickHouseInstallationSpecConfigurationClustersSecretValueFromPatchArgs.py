@@ -0,0 +1,45 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatchArgsDict', 'ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatchArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatchArgsDict(TypedDict):
+    """
+    Cluster shared secret source
+    """
+    secret_key_ref: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatchArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatchArgs:
+    def __init__(__self__, *,
+                 secret_key_ref: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatchArgs']] = None):
+        """
+        Cluster shared secret source
+        """
+        if secret_key_ref is not None:
+            pulumi.set(__self__, "secret_key_ref", secret_key_ref)
+
+    @_builtins.property
+    @pulumi.getter(name="secretKeyRef")
+    def secret_key_ref(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatchArgs']]:
+        return pulumi.get(self, "secret_key_ref")
+
+    @secret_key_ref.setter
+    def secret_key_ref(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatchArgs']]):
+        pulumi.set(self, "secret_key_ref", value)
@@ -0,0 +1,108 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersZookeeperNodesArgsDict', 'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersZookeeperNodesArgsDict(TypedDict):
+    availability_zone: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    availability zone for Zookeeper node
+    """
+    host: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    dns name or ip address for Zookeeper node
+    """
+    port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    TCP port which used to connect to Zookeeper node
+    """
+    secure: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    if a secure connection to Zookeeper is required
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersZookeeperNodesArgs:
+    def __init__(__self__, *,
+                 availability_zone: pulumi.Input[Optional[_builtins.str]] = None,
+                 host: pulumi.Input[Optional[_builtins.str]] = None,
+                 port: pulumi.Input[Optional[_builtins.int]] = None,
+                 secure: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        :param pulumi.Input[_builtins.str] availability_zone: availability zone for Zookeeper node
+        :param pulumi.Input[_builtins.str] host: dns name or ip address for Zookeeper node
+        :param pulumi.Input[_builtins.int] port: TCP port which used to connect to Zookeeper node
+        :param pulumi.Input[_builtins.str] secure: if a secure connection to Zookeeper is required
+        """
+        if availability_zone is not None:
+            pulumi.set(__self__, "availability_zone", availability_zone)
+        if host is not None:
+            pulumi.set(__self__, "host", host)
+        if port is not None:
+            pulumi.set(__self__, "port", port)
+        if secure is not None:
+            pulumi.set(__self__, "secure", secure)
+
+    @_builtins.property
+    @pulumi.getter(name="availabilityZone")
+    def availability_zone(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        availability zone for Zookeeper node
+        """
+        return pulumi.get(self, "availability_zone")
+
+    @availability_zone.setter
+    def availability_zone(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "availability_zone", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def host(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        dns name or ip address for Zookeeper node
+        """
+        return pulumi.get(self, "host")
+
+    @host.setter
+    def host(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "host", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def port(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        TCP port which used to connect to Zookeeper node
+        """
+        return pulumi.get(self, "port")
+
+    @port.setter
+    def port(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "port", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def secure(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        if a secure connection to Zookeeper is required
+        """
+        return pulumi.get(self, "secure")
+
+    @secure.setter
+    def secure(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "secure", value)
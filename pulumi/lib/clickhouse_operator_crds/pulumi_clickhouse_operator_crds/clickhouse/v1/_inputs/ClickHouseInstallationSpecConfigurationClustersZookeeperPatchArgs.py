@@ -0,0 +1,169 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersZookeeperPatchArgsDict', 'ClickHouseInstallationSpecConfigurationClustersZookeeperPatchArgs']
+
+class ClickHouseInstallationSpecConfigurationClustersZookeeperPatchArgsDict(TypedDict):
+    """
+    optional, allows configure <yandex><zookeeper>..</zookeeper></yandex> section in each `Pod` only in current ClickHouse cluster, during generate `ConfigMap` which will mounted in `/etc/clickhouse-server/config.d/`
+    override top-level `chi.spec.configuration.zookeeper` settings
+    """
+    identity: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional access credentials string with `user:password` format used when use digest authorization in Zookeeper
+    """
+    keeper: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatchArgs']]]
+    nodes: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatchArgs']]]]]
+    """
+    describe every available zookeeper cluster node for interaction
+    """
+    operation_timeout_ms: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    one operation timeout during Zookeeper transactions
+    """
+    root: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional root znode path inside zookeeper to store ClickHouse related data (replication queue or distributed DDL)
+    """
+    session_timeout_ms: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    session timeout during connect to Zookeeper
+    """
+    use_compression: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Enables compression in Keeper protocol if set to true
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationClustersZookeeperPatchArgs:
+    def __init__(__self__, *,
+                 identity: pulumi.Input[Optional[_builtins.str]] = None,
+                 keeper: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatchArgs']] = None,
+                 nodes: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatchArgs']]]] = None,
+                 operation_timeout_ms: pulumi.Input[Optional[_builtins.int]] = None,
+                 root: pulumi.Input[Optional[_builtins.str]] = None,
+                 session_timeout_ms: pulumi.Input[Optional[_builtins.int]] = None,
+                 use_compression: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        optional, allows configure <yandex><zookeeper>..</zookeeper></yandex> section in each `Pod` only in current ClickHouse cluster, during generate `ConfigMap` which will mounted in `/etc/clickhouse-server/config.d/`
+        override top-level `chi.spec.configuration.zookeeper` settings
+
+
+        :param pulumi.Input[_builtins.str] identity: optional access credentials string with `user:password` format used when use digest authorization in Zookeeper
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatchArgs']]] nodes: describe every available zookeeper cluster node for interaction
+        :param pulumi.Input[_builtins.int] operation_timeout_ms: one operation timeout during Zookeeper transactions
+        :param pulumi.Input[_builtins.str] root: optional root znode path inside zookeeper to store ClickHouse related data (replication queue or distributed DDL)
+        :param pulumi.Input[_builtins.int] session_timeout_ms: session timeout during connect to Zookeeper
+        :param pulumi.Input[_builtins.str] use_compression: Enables compression in Keeper protocol if set to true
+        """
+        if identity is not None:
+            pulumi.set(__self__, "identity", identity)
+        if keeper is not None:
+            pulumi.set(__self__, "keeper", keeper)
+        if nodes is not None:
+            pulumi.set(__self__, "nodes", nodes)
+        if operation_timeout_ms is not None:
+            pulumi.set(__self__, "operation_timeout_ms", operation_timeout_ms)
+        if root is not None:
+            pulumi.set(__self__, "root", root)
+        if session_timeout_ms is not None:
+            pulumi.set(__self__, "session_timeout_ms", session_timeout_ms)
+        if use_compression is not None:
+            pulumi.set(__self__, "use_compression", use_compression)
+
+    @_builtins.property
+    @pulumi.getter
+    def identity(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional access credentials string with `user:password` format used when use digest authorization in Zookeeper
+        """
+        return pulumi.get(self, "identity")
+
+    @identity.setter
+    def identity(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "identity", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def keeper(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatchArgs']]:
+        return pulumi.get(self, "keeper")
+
+    @keeper.setter
+    def keeper(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatchArgs']]):
+        pulumi.set(self, "keeper", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def nodes(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatchArgs']]]]:
+        """
+        describe every available zookeeper cluster node for interaction
+        """
+        return pulumi.get(self, "nodes")
+
+    @nodes.setter
+    def nodes(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatchArgs']]]]):
+        pulumi.set(self, "nodes", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def operation_timeout_ms(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        one operation timeout during Zookeeper transactions
+        """
+        return pulumi.get(self, "operation_timeout_ms")
+
+    @operation_timeout_ms.setter
+    def operation_timeout_ms(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "operation_timeout_ms", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def root(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional root znode path inside zookeeper to store ClickHouse related data (replication queue or distributed DDL)
+        """
+        return pulumi.get(self, "root")
+
+    @root.setter
+    def root(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "root", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def session_timeout_ms(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        session timeout during connect to Zookeeper
+        """
+        return pulumi.get(self, "session_timeout_ms")
+
+    @session_timeout_ms.setter
+    def session_timeout_ms(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "session_timeout_ms", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def use_compression(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Enables compression in Keeper protocol if set to true
+        """
+        return pulumi.get(self, "use_compression")
+
+    @use_compression.setter
+    def use_compression(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "use_compression", value)
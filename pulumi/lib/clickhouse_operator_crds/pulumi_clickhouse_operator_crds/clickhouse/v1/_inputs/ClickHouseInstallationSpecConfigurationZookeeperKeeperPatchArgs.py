@@ -0,0 +1,102 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecConfigurationZookeeperKeeperPatchArgsDict', 'ClickHouseInstallationSpecConfigurationZookeeperKeeperPatchArgs']
+
+class ClickHouseInstallationSpecConfigurationZookeeperKeeperPatchArgsDict(TypedDict):
+    """
+    reference to a ClickHouseKeeperInstallation (CHK) resource.
+    The operator resolves this to ZooKeeper node addresses automatically.
+    """
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    name of the ClickHouseKeeperInstallation custom resource
+    """
+    namespace: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    namespace of the CHK resource, defaults to the CHI namespace if omitted
+    """
+    service_type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    how to discover keeper endpoints:
+      replicas (default) — enumerate per-host services, one ZK node per keeper replica
+      service — use the CR-level headless service as a single ZK node entry
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecConfigurationZookeeperKeeperPatchArgs:
+    def __init__(__self__, *,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 namespace: pulumi.Input[Optional[_builtins.str]] = None,
+                 service_type: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        reference to a ClickHouseKeeperInstallation (CHK) resource.
+        The operator resolves this to ZooKeeper node addresses automatically.
+
+
+        :param pulumi.Input[_builtins.str] name: name of the ClickHouseKeeperInstallation custom resource
+        :param pulumi.Input[_builtins.str] namespace: namespace of the CHK resource, defaults to the CHI namespace if omitted
+        :param pulumi.Input[_builtins.str] service_type: how to discover keeper endpoints:
+                 replicas (default) — enumerate per-host services, one ZK node per keeper replica
+                 service — use the CR-level headless service as a single ZK node entry
+        """
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if namespace is not None:
+            pulumi.set(__self__, "namespace", namespace)
+        if service_type is not None:
+            pulumi.set(__self__, "service_type", service_type)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        name of the ClickHouseKeeperInstallation custom resource
+        """
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def namespace(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        namespace of the CHK resource, defaults to the CHI namespace if omitted
+        """
+        return pulumi.get(self, "namespace")
+
+    @namespace.setter
+    def namespace(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "namespace", value)
+
+    @_builtins.property
+    @pulumi.getter(name="serviceType")
+    def service_type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        how to discover keeper endpoints:
+          replicas (default) — enumerate per-host services, one ZK node per keeper replica
+          service — use the CR-level headless service as a single ZK node entry
+        """
+        return pulumi.get(self, "service_type")
+
+    @service_type.setter
+    def service_type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "service_type", value)
@@ -0,0 +1,56 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecDefaultsDistributedDDLArgsDict', 'ClickHouseInstallationSpecDefaultsDistributedDDLArgs']
+
+class ClickHouseInstallationSpecDefaultsDistributedDDLArgsDict(TypedDict):
+    """
+    allows change `<yandex><distributed_ddl></distributed_ddl></yandex>` settings
+    More info: https://clickhouse.tech/docs/en/operations/server-configuration-parameters/settings/#server-settings-distributed_ddl
+    """
+    profile: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Settings from this profile will be used to execute DDL queries
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecDefaultsDistributedDDLArgs:
+    def __init__(__self__, *,
+                 profile: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        allows change `<yandex><distributed_ddl></distributed_ddl></yandex>` settings
+        More info: https://clickhouse.tech/docs/en/operations/server-configuration-parameters/settings/#server-settings-distributed_ddl
+
+
+        :param pulumi.Input[_builtins.str] profile: Settings from this profile will be used to execute DDL queries
+        """
+        if profile is not None:
+            pulumi.set(__self__, "profile", profile)
+
+    @_builtins.property
+    @pulumi.getter
+    def profile(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Settings from this profile will be used to execute DDL queries
+        """
+        return pulumi.get(self, "profile")
+
+    @profile.setter
+    def profile(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "profile", value)
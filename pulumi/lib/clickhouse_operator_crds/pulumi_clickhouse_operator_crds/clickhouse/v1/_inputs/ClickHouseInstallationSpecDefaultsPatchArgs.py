@@ -0,0 +1,101 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecDefaultsPatchArgsDict', 'ClickHouseInstallationSpecDefaultsPatchArgs']
+
+class ClickHouseInstallationSpecDefaultsPatchArgsDict(TypedDict):
+    """
+    define default behavior for whole ClickHouseInstallation, some behavior can be re-define on cluster, shard and replica level
+    More info: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specdefaults
+    """
+    distributed_ddl: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecDefaultsDistributedDDLPatchArgs']]]
+    replicas_use_fqdn: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    define should replicas be specified by FQDN in `<host></host>`.
+    In case of "no" will use short hostname and clickhouse-server will use kubernetes default suffixes for DNS lookup
+    "no" by default
+    """
+    storage_management: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecDefaultsStorageManagementPatchArgs']]]
+    templates: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecDefaultsTemplatesPatchArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecDefaultsPatchArgs:
+    def __init__(__self__, *,
+                 distributed_ddl: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecDefaultsDistributedDDLPatchArgs']] = None,
+                 replicas_use_fqdn: pulumi.Input[Optional[_builtins.str]] = None,
+                 storage_management: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecDefaultsStorageManagementPatchArgs']] = None,
+                 templates: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecDefaultsTemplatesPatchArgs']] = None):
+        """
+        define default behavior for whole ClickHouseInstallation, some behavior can be re-define on cluster, shard and replica level
+        More info: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specdefaults
+
+
+        :param pulumi.Input[_builtins.str] replicas_use_fqdn: define should replicas be specified by FQDN in `<host></host>`.
+               In case of "no" will use short hostname and clickhouse-server will use kubernetes default suffixes for DNS lookup
+               "no" by default
+        """
+        if distributed_ddl is not None:
+            pulumi.set(__self__, "distributed_ddl", distributed_ddl)
+        if replicas_use_fqdn is not None:
+            pulumi.set(__self__, "replicas_use_fqdn", replicas_use_fqdn)
+        if storage_management is not None:
+            pulumi.set(__self__, "storage_management", storage_management)
+        if templates is not None:
+            pulumi.set(__self__, "templates", templates)
+
+    @_builtins.property
+    @pulumi.getter(name="distributedDDL")
+    def distributed_ddl(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecDefaultsDistributedDDLPatchArgs']]:
+        return pulumi.get(self, "distributed_ddl")
+
+    @distributed_ddl.setter
+    def distributed_ddl(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecDefaultsDistributedDDLPatchArgs']]):
+        pulumi.set(self, "distributed_ddl", value)
+
+    @_builtins.property
+    @pulumi.getter(name="replicasUseFQDN")
+    def replicas_use_fqdn(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        define should replicas be specified by FQDN in `<host></host>`.
+        In case of "no" will use short hostname and clickhouse-server will use kubernetes default suffixes for DNS lookup
+        "no" by default
+        """
+        return pulumi.get(self, "replicas_use_fqdn")
+
+    @replicas_use_fqdn.setter
+    def replicas_use_fqdn(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "replicas_use_fqdn", value)
+
+    @_builtins.property
+    @pulumi.getter(name="storageManagement")
+    def storage_management(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecDefaultsStorageManagementPatchArgs']]:
+        return pulumi.get(self, "storage_management")
+
+    @storage_management.setter
+    def storage_management(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecDefaultsStorageManagementPatchArgs']]):
+        pulumi.set(self, "storage_management", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def templates(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecDefaultsTemplatesPatchArgs']]:
+        return pulumi.get(self, "templates")
+
+    @templates.setter
+    def templates(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecDefaultsTemplatesPatchArgs']]):
+        pulumi.set(self, "templates", value)
@@ -0,0 +1,76 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecDefaultsStorageManagementArgsDict', 'ClickHouseInstallationSpecDefaultsStorageManagementArgs']
+
+class ClickHouseInstallationSpecDefaultsStorageManagementArgsDict(TypedDict):
+    """
+    default storage management options
+    """
+    provisioner: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    defines `PVC` provisioner - be it StatefulSet or the Operator
+    """
+    reclaim_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    defines behavior of `PVC` deletion.
+    `Delete` by default, if `Retain` specified then `PVC` will be kept when deleting StatefulSet
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecDefaultsStorageManagementArgs:
+    def __init__(__self__, *,
+                 provisioner: pulumi.Input[Optional[_builtins.str]] = None,
+                 reclaim_policy: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        default storage management options
+
+        :param pulumi.Input[_builtins.str] provisioner: defines `PVC` provisioner - be it StatefulSet or the Operator
+        :param pulumi.Input[_builtins.str] reclaim_policy: defines behavior of `PVC` deletion.
+               `Delete` by default, if `Retain` specified then `PVC` will be kept when deleting StatefulSet
+        """
+        if provisioner is not None:
+            pulumi.set(__self__, "provisioner", provisioner)
+        if reclaim_policy is not None:
+            pulumi.set(__self__, "reclaim_policy", reclaim_policy)
+
+    @_builtins.property
+    @pulumi.getter
+    def provisioner(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        defines `PVC` provisioner - be it StatefulSet or the Operator
+        """
+        return pulumi.get(self, "provisioner")
+
+    @provisioner.setter
+    def provisioner(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "provisioner", value)
+
+    @_builtins.property
+    @pulumi.getter(name="reclaimPolicy")
+    def reclaim_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        defines behavior of `PVC` deletion.
+        `Delete` by default, if `Retain` specified then `PVC` will be kept when deleting StatefulSet
+        """
+        return pulumi.get(self, "reclaim_policy")
+
+    @reclaim_policy.setter
+    def reclaim_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "reclaim_policy", value)
@@ -0,0 +1,169 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecReconcileArgsDict', 'ClickHouseInstallationSpecReconcileArgs']
+
+class ClickHouseInstallationSpecReconcileArgsDict(TypedDict):
+    """
+    Optional, allows tuning reconciling cycle for ClickhouseInstallation from clickhouse-operator side
+    """
+    cleanup: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileCleanupArgs']]]
+    cluster: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileClusterArgs']]]
+    config_map_propagation_timeout: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Timeout in seconds for `clickhouse-operator` to wait for modified `ConfigMap` to propagate into the `Pod`
+    More details: https://kubernetes.io/docs/concepts/configuration/configmap/#mounted-configmaps-are-updated-automatically
+    """
+    host: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileHostArgs']]]
+    macros: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosArgs']]]
+    policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    DISCUSSED TO BE DEPRECATED
+    Syntax sugar
+    Overrides all three 'reconcile.host.wait.{exclude, queries, include}' values from the operator's config
+    Possible values:
+     - wait - should wait to exclude host, complete queries and include host back into the cluster
+     - nowait - should NOT wait to exclude host, complete queries and include host back into the cluster
+    """
+    runtime: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileRuntimeArgs']]]
+    stateful_set: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileStatefulSetArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecReconcileArgs:
+    def __init__(__self__, *,
+                 cleanup: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileCleanupArgs']] = None,
+                 cluster: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileClusterArgs']] = None,
+                 config_map_propagation_timeout: pulumi.Input[Optional[_builtins.int]] = None,
+                 host: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileHostArgs']] = None,
+                 macros: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosArgs']] = None,
+                 policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 runtime: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileRuntimeArgs']] = None,
+                 stateful_set: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileStatefulSetArgs']] = None):
+        """
+        Optional, allows tuning reconciling cycle for ClickhouseInstallation from clickhouse-operator side
+
+        :param pulumi.Input[_builtins.int] config_map_propagation_timeout: Timeout in seconds for `clickhouse-operator` to wait for modified `ConfigMap` to propagate into the `Pod`
+               More details: https://kubernetes.io/docs/concepts/configuration/configmap/#mounted-configmaps-are-updated-automatically
+        :param pulumi.Input[_builtins.str] policy: DISCUSSED TO BE DEPRECATED
+               Syntax sugar
+               Overrides all three 'reconcile.host.wait.{exclude, queries, include}' values from the operator's config
+               Possible values:
+                - wait - should wait to exclude host, complete queries and include host back into the cluster
+                - nowait - should NOT wait to exclude host, complete queries and include host back into the cluster
+        """
+        if cleanup is not None:
+            pulumi.set(__self__, "cleanup", cleanup)
+        if cluster is not None:
+            pulumi.set(__self__, "cluster", cluster)
+        if config_map_propagation_timeout is not None:
+            pulumi.set(__self__, "config_map_propagation_timeout", config_map_propagation_timeout)
+        if host is not None:
+            pulumi.set(__self__, "host", host)
+        if macros is not None:
+            pulumi.set(__self__, "macros", macros)
+        if policy is not None:
+            pulumi.set(__self__, "policy", policy)
+        if runtime is not None:
+            pulumi.set(__self__, "runtime", runtime)
+        if stateful_set is not None:
+            pulumi.set(__self__, "stateful_set", stateful_set)
+
+    @_builtins.property
+    @pulumi.getter
+    def cleanup(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileCleanupArgs']]:
+        return pulumi.get(self, "cleanup")
+
+    @cleanup.setter
+    def cleanup(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileCleanupArgs']]):
+        pulumi.set(self, "cleanup", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def cluster(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileClusterArgs']]:
+        return pulumi.get(self, "cluster")
+
+    @cluster.setter
+    def cluster(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileClusterArgs']]):
+        pulumi.set(self, "cluster", value)
+
+    @_builtins.property
+    @pulumi.getter(name="configMapPropagationTimeout")
+    def config_map_propagation_timeout(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Timeout in seconds for `clickhouse-operator` to wait for modified `ConfigMap` to propagate into the `Pod`
+        More details: https://kubernetes.io/docs/concepts/configuration/configmap/#mounted-configmaps-are-updated-automatically
+        """
+        return pulumi.get(self, "config_map_propagation_timeout")
+
+    @config_map_propagation_timeout.setter
+    def config_map_propagation_timeout(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "config_map_propagation_timeout", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def host(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileHostArgs']]:
+        return pulumi.get(self, "host")
+
+    @host.setter
+    def host(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileHostArgs']]):
+        pulumi.set(self, "host", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def macros(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosArgs']]:
+        return pulumi.get(self, "macros")
+
+    @macros.setter
+    def macros(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosArgs']]):
+        pulumi.set(self, "macros", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        DISCUSSED TO BE DEPRECATED
+        Syntax sugar
+        Overrides all three 'reconcile.host.wait.{exclude, queries, include}' values from the operator's config
+        Possible values:
+         - wait - should wait to exclude host, complete queries and include host back into the cluster
+         - nowait - should NOT wait to exclude host, complete queries and include host back into the cluster
+        """
+        return pulumi.get(self, "policy")
+
+    @policy.setter
+    def policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "policy", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def runtime(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileRuntimeArgs']]:
+        return pulumi.get(self, "runtime")
+
+    @runtime.setter
+    def runtime(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileRuntimeArgs']]):
+        pulumi.set(self, "runtime", value)
+
+    @_builtins.property
+    @pulumi.getter(name="statefulSet")
+    def stateful_set(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileStatefulSetArgs']]:
+        return pulumi.get(self, "stateful_set")
+
+    @stateful_set.setter
+    def stateful_set(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileStatefulSetArgs']]):
+        pulumi.set(self, "stateful_set", value)
@@ -0,0 +1,58 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecReconcileCleanupArgsDict', 'ClickHouseInstallationSpecReconcileCleanupArgs']
+
+class ClickHouseInstallationSpecReconcileCleanupArgsDict(TypedDict):
+    """
+    Optional, defines behavior for cleanup Kubernetes resources during reconcile cycle
+    """
+    reconcile_failed_objects: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsArgs']]]
+    unknown_objects: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileCleanupUnknownObjectsArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecReconcileCleanupArgs:
+    def __init__(__self__, *,
+                 reconcile_failed_objects: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsArgs']] = None,
+                 unknown_objects: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileCleanupUnknownObjectsArgs']] = None):
+        """
+        Optional, defines behavior for cleanup Kubernetes resources during reconcile cycle
+        """
+        if reconcile_failed_objects is not None:
+            pulumi.set(__self__, "reconcile_failed_objects", reconcile_failed_objects)
+        if unknown_objects is not None:
+            pulumi.set(__self__, "unknown_objects", unknown_objects)
+
+    @_builtins.property
+    @pulumi.getter(name="reconcileFailedObjects")
+    def reconcile_failed_objects(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsArgs']]:
+        return pulumi.get(self, "reconcile_failed_objects")
+
+    @reconcile_failed_objects.setter
+    def reconcile_failed_objects(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsArgs']]):
+        pulumi.set(self, "reconcile_failed_objects", value)
+
+    @_builtins.property
+    @pulumi.getter(name="unknownObjects")
+    def unknown_objects(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileCleanupUnknownObjectsArgs']]:
+        return pulumi.get(self, "unknown_objects")
+
+    @unknown_objects.setter
+    def unknown_objects(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileCleanupUnknownObjectsArgs']]):
+        pulumi.set(self, "unknown_objects", value)
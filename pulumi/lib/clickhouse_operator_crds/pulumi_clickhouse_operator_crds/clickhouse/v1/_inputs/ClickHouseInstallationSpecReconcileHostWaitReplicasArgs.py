@@ -0,0 +1,93 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecReconcileHostWaitReplicasArgsDict', 'ClickHouseInstallationSpecReconcileHostWaitReplicasArgs']
+
+class ClickHouseInstallationSpecReconcileHostWaitReplicasArgsDict(TypedDict):
+    """
+    Whether the operator during reconcile procedure should wait for replicas to catch-up
+    """
+    all: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Whether the operator during reconcile procedure should wait for all replicas to catch-up
+    """
+    delay: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    replication max absolute delay to consider replica is not delayed
+    """
+    new: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Whether the operator during reconcile procedure should wait for new replicas to catch-up
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecReconcileHostWaitReplicasArgs:
+    def __init__(__self__, *,
+                 all: pulumi.Input[Optional[_builtins.str]] = None,
+                 delay: pulumi.Input[Optional[_builtins.int]] = None,
+                 new: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        Whether the operator during reconcile procedure should wait for replicas to catch-up
+
+        :param pulumi.Input[_builtins.str] all: Whether the operator during reconcile procedure should wait for all replicas to catch-up
+        :param pulumi.Input[_builtins.int] delay: replication max absolute delay to consider replica is not delayed
+        :param pulumi.Input[_builtins.str] new: Whether the operator during reconcile procedure should wait for new replicas to catch-up
+        """
+        if all is not None:
+            pulumi.set(__self__, "all", all)
+        if delay is not None:
+            pulumi.set(__self__, "delay", delay)
+        if new is not None:
+            pulumi.set(__self__, "new", new)
+
+    @_builtins.property
+    @pulumi.getter
+    def all(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Whether the operator during reconcile procedure should wait for all replicas to catch-up
+        """
+        return pulumi.get(self, "all")
+
+    @all.setter
+    def all(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "all", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def delay(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        replication max absolute delay to consider replica is not delayed
+        """
+        return pulumi.get(self, "delay")
+
+    @delay.setter
+    def delay(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "delay", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def new(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Whether the operator during reconcile procedure should wait for new replicas to catch-up
+        """
+        return pulumi.get(self, "new")
+
+    @new.setter
+    def new(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "new", value)
@@ -0,0 +1,45 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecReconcileMacrosPatchArgsDict', 'ClickHouseInstallationSpecReconcileMacrosPatchArgs']
+
+class ClickHouseInstallationSpecReconcileMacrosPatchArgsDict(TypedDict):
+    """
+    macros parameters
+    """
+    sections: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsPatchArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecReconcileMacrosPatchArgs:
+    def __init__(__self__, *,
+                 sections: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsPatchArgs']] = None):
+        """
+        macros parameters
+        """
+        if sections is not None:
+            pulumi.set(__self__, "sections", sections)
+
+    @_builtins.property
+    @pulumi.getter
+    def sections(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsPatchArgs']]:
+        return pulumi.get(self, "sections")
+
+    @sections.setter
+    def sections(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsPatchArgs']]):
+        pulumi.set(self, "sections", value)
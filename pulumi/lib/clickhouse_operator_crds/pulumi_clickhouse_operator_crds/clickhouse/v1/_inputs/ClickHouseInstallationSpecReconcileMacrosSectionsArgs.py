@@ -0,0 +1,97 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecReconcileMacrosSectionsArgsDict', 'ClickHouseInstallationSpecReconcileMacrosSectionsArgs']
+
+class ClickHouseInstallationSpecReconcileMacrosSectionsArgsDict(TypedDict):
+    """
+    sections behaviour for macros
+    """
+    files: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsFilesArgs']]]
+    profiles: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsProfilesArgs']]]
+    quotas: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsQuotasArgs']]]
+    settings: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsSettingsArgs']]]
+    users: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsUsersArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecReconcileMacrosSectionsArgs:
+    def __init__(__self__, *,
+                 files: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsFilesArgs']] = None,
+                 profiles: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsProfilesArgs']] = None,
+                 quotas: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsQuotasArgs']] = None,
+                 settings: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsSettingsArgs']] = None,
+                 users: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsUsersArgs']] = None):
+        """
+        sections behaviour for macros
+        """
+        if files is not None:
+            pulumi.set(__self__, "files", files)
+        if profiles is not None:
+            pulumi.set(__self__, "profiles", profiles)
+        if quotas is not None:
+            pulumi.set(__self__, "quotas", quotas)
+        if settings is not None:
+            pulumi.set(__self__, "settings", settings)
+        if users is not None:
+            pulumi.set(__self__, "users", users)
+
+    @_builtins.property
+    @pulumi.getter
+    def files(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsFilesArgs']]:
+        return pulumi.get(self, "files")
+
+    @files.setter
+    def files(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsFilesArgs']]):
+        pulumi.set(self, "files", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def profiles(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsProfilesArgs']]:
+        return pulumi.get(self, "profiles")
+
+    @profiles.setter
+    def profiles(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsProfilesArgs']]):
+        pulumi.set(self, "profiles", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def quotas(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsQuotasArgs']]:
+        return pulumi.get(self, "quotas")
+
+    @quotas.setter
+    def quotas(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsQuotasArgs']]):
+        pulumi.set(self, "quotas", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def settings(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsSettingsArgs']]:
+        return pulumi.get(self, "settings")
+
+    @settings.setter
+    def settings(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsSettingsArgs']]):
+        pulumi.set(self, "settings", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def users(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsUsersArgs']]:
+        return pulumi.get(self, "users")
+
+    @users.setter
+    def users(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsUsersArgs']]):
+        pulumi.set(self, "users", value)
@@ -0,0 +1,97 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecReconcileMacrosSectionsPatchArgsDict', 'ClickHouseInstallationSpecReconcileMacrosSectionsPatchArgs']
+
+class ClickHouseInstallationSpecReconcileMacrosSectionsPatchArgsDict(TypedDict):
+    """
+    sections behaviour for macros
+    """
+    files: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatchArgs']]]
+    profiles: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatchArgs']]]
+    quotas: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatchArgs']]]
+    settings: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatchArgs']]]
+    users: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatchArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecReconcileMacrosSectionsPatchArgs:
+    def __init__(__self__, *,
+                 files: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatchArgs']] = None,
+                 profiles: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatchArgs']] = None,
+                 quotas: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatchArgs']] = None,
+                 settings: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatchArgs']] = None,
+                 users: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatchArgs']] = None):
+        """
+        sections behaviour for macros
+        """
+        if files is not None:
+            pulumi.set(__self__, "files", files)
+        if profiles is not None:
+            pulumi.set(__self__, "profiles", profiles)
+        if quotas is not None:
+            pulumi.set(__self__, "quotas", quotas)
+        if settings is not None:
+            pulumi.set(__self__, "settings", settings)
+        if users is not None:
+            pulumi.set(__self__, "users", users)
+
+    @_builtins.property
+    @pulumi.getter
+    def files(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatchArgs']]:
+        return pulumi.get(self, "files")
+
+    @files.setter
+    def files(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatchArgs']]):
+        pulumi.set(self, "files", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def profiles(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatchArgs']]:
+        return pulumi.get(self, "profiles")
+
+    @profiles.setter
+    def profiles(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatchArgs']]):
+        pulumi.set(self, "profiles", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def quotas(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatchArgs']]:
+        return pulumi.get(self, "quotas")
+
+    @quotas.setter
+    def quotas(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatchArgs']]):
+        pulumi.set(self, "quotas", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def settings(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatchArgs']]:
+        return pulumi.get(self, "settings")
+
+    @settings.setter
+    def settings(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatchArgs']]):
+        pulumi.set(self, "settings", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def users(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatchArgs']]:
+        return pulumi.get(self, "users")
+
+    @users.setter
+    def users(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatchArgs']]):
+        pulumi.set(self, "users", value)
@@ -0,0 +1,73 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecReconcileRuntimePatchArgsDict', 'ClickHouseInstallationSpecReconcileRuntimePatchArgs']
+
+class ClickHouseInstallationSpecReconcileRuntimePatchArgsDict(TypedDict):
+    """
+    runtime parameters for clickhouse-operator process which are used during reconcile cycle
+    """
+    reconcile_shards_max_concurrency_percent: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    The maximum percentage of cluster shards that may be reconciled in parallel, 50 percent by default.
+    """
+    reconcile_shards_threads_number: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    The maximum number of cluster shards that may be reconciled in parallel, 1 by default
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecReconcileRuntimePatchArgs:
+    def __init__(__self__, *,
+                 reconcile_shards_max_concurrency_percent: pulumi.Input[Optional[_builtins.int]] = None,
+                 reconcile_shards_threads_number: pulumi.Input[Optional[_builtins.int]] = None):
+        """
+        runtime parameters for clickhouse-operator process which are used during reconcile cycle
+
+        :param pulumi.Input[_builtins.int] reconcile_shards_max_concurrency_percent: The maximum percentage of cluster shards that may be reconciled in parallel, 50 percent by default.
+        :param pulumi.Input[_builtins.int] reconcile_shards_threads_number: The maximum number of cluster shards that may be reconciled in parallel, 1 by default
+        """
+        if reconcile_shards_max_concurrency_percent is not None:
+            pulumi.set(__self__, "reconcile_shards_max_concurrency_percent", reconcile_shards_max_concurrency_percent)
+        if reconcile_shards_threads_number is not None:
+            pulumi.set(__self__, "reconcile_shards_threads_number", reconcile_shards_threads_number)
+
+    @_builtins.property
+    @pulumi.getter(name="reconcileShardsMaxConcurrencyPercent")
+    def reconcile_shards_max_concurrency_percent(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        The maximum percentage of cluster shards that may be reconciled in parallel, 50 percent by default.
+        """
+        return pulumi.get(self, "reconcile_shards_max_concurrency_percent")
+
+    @reconcile_shards_max_concurrency_percent.setter
+    def reconcile_shards_max_concurrency_percent(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "reconcile_shards_max_concurrency_percent", value)
+
+    @_builtins.property
+    @pulumi.getter(name="reconcileShardsThreadsNumber")
+    def reconcile_shards_threads_number(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        The maximum number of cluster shards that may be reconciled in parallel, 1 by default
+        """
+        return pulumi.get(self, "reconcile_shards_threads_number")
+
+    @reconcile_shards_threads_number.setter
+    def reconcile_shards_threads_number(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "reconcile_shards_threads_number", value)
@@ -0,0 +1,71 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecReconcileStatefulSetArgsDict', 'ClickHouseInstallationSpecReconcileStatefulSetArgs']
+
+class ClickHouseInstallationSpecReconcileStatefulSetArgsDict(TypedDict):
+    """
+    Optional, StatefulSet reconcile behavior tuning
+    """
+    create: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileStatefulSetCreateArgs']]]
+    recreate: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileStatefulSetRecreateArgs']]]
+    update: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileStatefulSetUpdateArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecReconcileStatefulSetArgs:
+    def __init__(__self__, *,
+                 create: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileStatefulSetCreateArgs']] = None,
+                 recreate: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileStatefulSetRecreateArgs']] = None,
+                 update: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileStatefulSetUpdateArgs']] = None):
+        """
+        Optional, StatefulSet reconcile behavior tuning
+        """
+        if create is not None:
+            pulumi.set(__self__, "create", create)
+        if recreate is not None:
+            pulumi.set(__self__, "recreate", recreate)
+        if update is not None:
+            pulumi.set(__self__, "update", update)
+
+    @_builtins.property
+    @pulumi.getter
+    def create(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileStatefulSetCreateArgs']]:
+        return pulumi.get(self, "create")
+
+    @create.setter
+    def create(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileStatefulSetCreateArgs']]):
+        pulumi.set(self, "create", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def recreate(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileStatefulSetRecreateArgs']]:
+        return pulumi.get(self, "recreate")
+
+    @recreate.setter
+    def recreate(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileStatefulSetRecreateArgs']]):
+        pulumi.set(self, "recreate", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def update(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileStatefulSetUpdateArgs']]:
+        return pulumi.get(self, "update")
+
+    @update.setter
+    def update(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcileStatefulSetUpdateArgs']]):
+        pulumi.set(self, "update", value)
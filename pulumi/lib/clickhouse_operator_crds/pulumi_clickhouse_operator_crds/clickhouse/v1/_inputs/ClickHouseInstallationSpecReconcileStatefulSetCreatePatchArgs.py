@@ -0,0 +1,65 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecReconcileStatefulSetCreatePatchArgsDict', 'ClickHouseInstallationSpecReconcileStatefulSetCreatePatchArgs']
+
+class ClickHouseInstallationSpecReconcileStatefulSetCreatePatchArgsDict(TypedDict):
+    """
+    Behavior during create StatefulSet
+    """
+    on_failure: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    What to do in case created StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
+    Possible options:
+    1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
+    2. delete - delete newly created problematic StatefulSet and follow 'abort' path afterwards.
+    3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecReconcileStatefulSetCreatePatchArgs:
+    def __init__(__self__, *,
+                 on_failure: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        Behavior during create StatefulSet
+
+        :param pulumi.Input[_builtins.str] on_failure: What to do in case created StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
+               Possible options:
+               1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
+               2. delete - delete newly created problematic StatefulSet and follow 'abort' path afterwards.
+               3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
+        """
+        if on_failure is not None:
+            pulumi.set(__self__, "on_failure", on_failure)
+
+    @_builtins.property
+    @pulumi.getter(name="onFailure")
+    def on_failure(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        What to do in case created StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
+        Possible options:
+        1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
+        2. delete - delete newly created problematic StatefulSet and follow 'abort' path afterwards.
+        3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
+        """
+        return pulumi.get(self, "on_failure")
+
+    @on_failure.setter
+    def on_failure(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "on_failure", value)
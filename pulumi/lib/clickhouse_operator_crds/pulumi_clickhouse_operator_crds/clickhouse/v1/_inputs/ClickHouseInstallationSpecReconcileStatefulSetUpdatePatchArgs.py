@@ -0,0 +1,105 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecReconcileStatefulSetUpdatePatchArgsDict', 'ClickHouseInstallationSpecReconcileStatefulSetUpdatePatchArgs']
+
+class ClickHouseInstallationSpecReconcileStatefulSetUpdatePatchArgsDict(TypedDict):
+    """
+    Behavior during update StatefulSet
+    """
+    on_failure: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    What to do in case updated StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
+    Possible options:
+    1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
+    2. rollback - delete Pod and rollback StatefulSet to previous Generation. Follow 'abort' path afterwards.
+    3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
+    """
+    poll_interval: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    How many seconds to wait between checks for StatefulSet status during update
+    """
+    timeout: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    How many seconds to wait for StatefulSet to be 'Ready' during update
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecReconcileStatefulSetUpdatePatchArgs:
+    def __init__(__self__, *,
+                 on_failure: pulumi.Input[Optional[_builtins.str]] = None,
+                 poll_interval: pulumi.Input[Optional[_builtins.int]] = None,
+                 timeout: pulumi.Input[Optional[_builtins.int]] = None):
+        """
+        Behavior during update StatefulSet
+
+        :param pulumi.Input[_builtins.str] on_failure: What to do in case updated StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
+               Possible options:
+               1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
+               2. rollback - delete Pod and rollback StatefulSet to previous Generation. Follow 'abort' path afterwards.
+               3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
+        :param pulumi.Input[_builtins.int] poll_interval: How many seconds to wait between checks for StatefulSet status during update
+        :param pulumi.Input[_builtins.int] timeout: How many seconds to wait for StatefulSet to be 'Ready' during update
+        """
+        if on_failure is not None:
+            pulumi.set(__self__, "on_failure", on_failure)
+        if poll_interval is not None:
+            pulumi.set(__self__, "poll_interval", poll_interval)
+        if timeout is not None:
+            pulumi.set(__self__, "timeout", timeout)
+
+    @_builtins.property
+    @pulumi.getter(name="onFailure")
+    def on_failure(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        What to do in case updated StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
+        Possible options:
+        1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
+        2. rollback - delete Pod and rollback StatefulSet to previous Generation. Follow 'abort' path afterwards.
+        3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
+        """
+        return pulumi.get(self, "on_failure")
+
+    @on_failure.setter
+    def on_failure(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "on_failure", value)
+
+    @_builtins.property
+    @pulumi.getter(name="pollInterval")
+    def poll_interval(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        How many seconds to wait between checks for StatefulSet status during update
+        """
+        return pulumi.get(self, "poll_interval")
+
+    @poll_interval.setter
+    def poll_interval(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "poll_interval", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def timeout(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        How many seconds to wait for StatefulSet to be 'Ready' during update
+        """
+        return pulumi.get(self, "timeout")
+
+    @timeout.setter
+    def timeout(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "timeout", value)
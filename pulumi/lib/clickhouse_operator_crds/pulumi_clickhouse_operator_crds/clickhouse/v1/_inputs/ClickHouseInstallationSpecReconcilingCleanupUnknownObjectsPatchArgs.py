@@ -0,0 +1,118 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatchArgsDict', 'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatchArgs']
+
+class ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatchArgsDict(TypedDict):
+    """
+    Describes what clickhouse-operator should do with found Kubernetes resources which should be managed by clickhouse-operator,
+    but do not have `ownerReference` to any currently managed `ClickHouseInstallation` resource.
+    Default behavior is `Delete`"
+    """
+    config_map: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Behavior policy for unknown ConfigMap, `Delete` by default
+    """
+    pvc: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Behavior policy for unknown PVC, `Delete` by default
+    """
+    service: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Behavior policy for unknown Service, `Delete` by default
+    """
+    stateful_set: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Behavior policy for unknown StatefulSet, `Delete` by default
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatchArgs:
+    def __init__(__self__, *,
+                 config_map: pulumi.Input[Optional[_builtins.str]] = None,
+                 pvc: pulumi.Input[Optional[_builtins.str]] = None,
+                 service: pulumi.Input[Optional[_builtins.str]] = None,
+                 stateful_set: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        Describes what clickhouse-operator should do with found Kubernetes resources which should be managed by clickhouse-operator,
+        but do not have `ownerReference` to any currently managed `ClickHouseInstallation` resource.
+        Default behavior is `Delete`"
+
+
+        :param pulumi.Input[_builtins.str] config_map: Behavior policy for unknown ConfigMap, `Delete` by default
+        :param pulumi.Input[_builtins.str] pvc: Behavior policy for unknown PVC, `Delete` by default
+        :param pulumi.Input[_builtins.str] service: Behavior policy for unknown Service, `Delete` by default
+        :param pulumi.Input[_builtins.str] stateful_set: Behavior policy for unknown StatefulSet, `Delete` by default
+        """
+        if config_map is not None:
+            pulumi.set(__self__, "config_map", config_map)
+        if pvc is not None:
+            pulumi.set(__self__, "pvc", pvc)
+        if service is not None:
+            pulumi.set(__self__, "service", service)
+        if stateful_set is not None:
+            pulumi.set(__self__, "stateful_set", stateful_set)
+
+    @_builtins.property
+    @pulumi.getter(name="configMap")
+    def config_map(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Behavior policy for unknown ConfigMap, `Delete` by default
+        """
+        return pulumi.get(self, "config_map")
+
+    @config_map.setter
+    def config_map(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "config_map", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def pvc(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Behavior policy for unknown PVC, `Delete` by default
+        """
+        return pulumi.get(self, "pvc")
+
+    @pvc.setter
+    def pvc(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "pvc", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def service(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Behavior policy for unknown Service, `Delete` by default
+        """
+        return pulumi.get(self, "service")
+
+    @service.setter
+    def service(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "service", value)
+
+    @_builtins.property
+    @pulumi.getter(name="statefulSet")
+    def stateful_set(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Behavior policy for unknown StatefulSet, `Delete` by default
+        """
+        return pulumi.get(self, "stateful_set")
+
+    @stateful_set.setter
+    def stateful_set(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "stateful_set", value)
@@ -0,0 +1,53 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecReconcilingClusterArgsDict', 'ClickHouseInstallationSpecReconcilingClusterArgs']
+
+class ClickHouseInstallationSpecReconcilingClusterArgsDict(TypedDict):
+    """
+    CHI-level cluster reconcile defaults inherited by every cluster's
+    spec.configuration.clusters[N].reconcile section. Use this as a single
+    place to define cluster-level hooks that should apply to all clusters
+    in this CHI; per-cluster hooks (under clusters[N].reconcile.hooks)
+    are appended to (and dedup'd against) the inherited set.
+    """
+    hooks: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingClusterHooksArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecReconcilingClusterArgs:
+    def __init__(__self__, *,
+                 hooks: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingClusterHooksArgs']] = None):
+        """
+        CHI-level cluster reconcile defaults inherited by every cluster's
+        spec.configuration.clusters[N].reconcile section. Use this as a single
+        place to define cluster-level hooks that should apply to all clusters
+        in this CHI; per-cluster hooks (under clusters[N].reconcile.hooks)
+        are appended to (and dedup'd against) the inherited set.
+        """
+        if hooks is not None:
+            pulumi.set(__self__, "hooks", hooks)
+
+    @_builtins.property
+    @pulumi.getter
+    def hooks(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingClusterHooksArgs']]:
+        return pulumi.get(self, "hooks")
+
+    @hooks.setter
+    def hooks(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingClusterHooksArgs']]):
+        pulumi.set(self, "hooks", value)
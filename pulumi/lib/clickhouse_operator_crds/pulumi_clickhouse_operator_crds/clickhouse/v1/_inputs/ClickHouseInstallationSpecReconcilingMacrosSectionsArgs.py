@@ -0,0 +1,97 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecReconcilingMacrosSectionsArgsDict', 'ClickHouseInstallationSpecReconcilingMacrosSectionsArgs']
+
+class ClickHouseInstallationSpecReconcilingMacrosSectionsArgsDict(TypedDict):
+    """
+    sections behaviour for macros
+    """
+    files: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsFilesArgs']]]
+    profiles: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesArgs']]]
+    quotas: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasArgs']]]
+    settings: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsArgs']]]
+    users: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsUsersArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecReconcilingMacrosSectionsArgs:
+    def __init__(__self__, *,
+                 files: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsFilesArgs']] = None,
+                 profiles: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesArgs']] = None,
+                 quotas: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasArgs']] = None,
+                 settings: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsArgs']] = None,
+                 users: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsUsersArgs']] = None):
+        """
+        sections behaviour for macros
+        """
+        if files is not None:
+            pulumi.set(__self__, "files", files)
+        if profiles is not None:
+            pulumi.set(__self__, "profiles", profiles)
+        if quotas is not None:
+            pulumi.set(__self__, "quotas", quotas)
+        if settings is not None:
+            pulumi.set(__self__, "settings", settings)
+        if users is not None:
+            pulumi.set(__self__, "users", users)
+
+    @_builtins.property
+    @pulumi.getter
+    def files(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsFilesArgs']]:
+        return pulumi.get(self, "files")
+
+    @files.setter
+    def files(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsFilesArgs']]):
+        pulumi.set(self, "files", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def profiles(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesArgs']]:
+        return pulumi.get(self, "profiles")
+
+    @profiles.setter
+    def profiles(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesArgs']]):
+        pulumi.set(self, "profiles", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def quotas(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasArgs']]:
+        return pulumi.get(self, "quotas")
+
+    @quotas.setter
+    def quotas(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasArgs']]):
+        pulumi.set(self, "quotas", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def settings(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsArgs']]:
+        return pulumi.get(self, "settings")
+
+    @settings.setter
+    def settings(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsArgs']]):
+        pulumi.set(self, "settings", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def users(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsUsersArgs']]:
+        return pulumi.get(self, "users")
+
+    @users.setter
+    def users(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecReconcilingMacrosSectionsUsersArgs']]):
+        pulumi.set(self, "users", value)
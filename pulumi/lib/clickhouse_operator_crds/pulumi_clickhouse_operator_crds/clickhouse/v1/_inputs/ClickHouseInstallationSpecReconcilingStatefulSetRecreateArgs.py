@@ -0,0 +1,91 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecReconcilingStatefulSetRecreateArgsDict', 'ClickHouseInstallationSpecReconcilingStatefulSetRecreateArgs']
+
+class ClickHouseInstallationSpecReconcilingStatefulSetRecreateArgsDict(TypedDict):
+    """
+    Behavior during recreate StatefulSet
+    """
+    on_data_loss: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    What to do in case operator needs to recreate StatefulSet due to PVC data loss or missing volumes.
+    Possible options:
+    1. abort - abort the process, do nothing with the problematic StatefulSet.
+    2. recreate - proceed and recreate StatefulSet.
+    """
+    on_update_failure: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    What to do in case operator needs to recreate StatefulSet due to update failure or StatefulSet not ready.
+    Possible options:
+    1. abort - abort the process, do nothing with the problematic StatefulSet.
+    2. recreate - proceed and recreate StatefulSet.
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecReconcilingStatefulSetRecreateArgs:
+    def __init__(__self__, *,
+                 on_data_loss: pulumi.Input[Optional[_builtins.str]] = None,
+                 on_update_failure: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        Behavior during recreate StatefulSet
+
+        :param pulumi.Input[_builtins.str] on_data_loss: What to do in case operator needs to recreate StatefulSet due to PVC data loss or missing volumes.
+               Possible options:
+               1. abort - abort the process, do nothing with the problematic StatefulSet.
+               2. recreate - proceed and recreate StatefulSet.
+        :param pulumi.Input[_builtins.str] on_update_failure: What to do in case operator needs to recreate StatefulSet due to update failure or StatefulSet not ready.
+               Possible options:
+               1. abort - abort the process, do nothing with the problematic StatefulSet.
+               2. recreate - proceed and recreate StatefulSet.
+        """
+        if on_data_loss is not None:
+            pulumi.set(__self__, "on_data_loss", on_data_loss)
+        if on_update_failure is not None:
+            pulumi.set(__self__, "on_update_failure", on_update_failure)
+
+    @_builtins.property
+    @pulumi.getter(name="onDataLoss")
+    def on_data_loss(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        What to do in case operator needs to recreate StatefulSet due to PVC data loss or missing volumes.
+        Possible options:
+        1. abort - abort the process, do nothing with the problematic StatefulSet.
+        2. recreate - proceed and recreate StatefulSet.
+        """
+        return pulumi.get(self, "on_data_loss")
+
+    @on_data_loss.setter
+    def on_data_loss(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "on_data_loss", value)
+
+    @_builtins.property
+    @pulumi.getter(name="onUpdateFailure")
+    def on_update_failure(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        What to do in case operator needs to recreate StatefulSet due to update failure or StatefulSet not ready.
+        Possible options:
+        1. abort - abort the process, do nothing with the problematic StatefulSet.
+        2. recreate - proceed and recreate StatefulSet.
+        """
+        return pulumi.get(self, "on_update_failure")
+
+    @on_update_failure.setter
+    def on_update_failure(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "on_update_failure", value)
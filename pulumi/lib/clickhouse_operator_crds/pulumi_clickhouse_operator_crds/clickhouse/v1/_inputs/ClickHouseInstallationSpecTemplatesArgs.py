@@ -0,0 +1,116 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecTemplatesArgsDict', 'ClickHouseInstallationSpecTemplatesArgs']
+
+class ClickHouseInstallationSpecTemplatesArgsDict(TypedDict):
+    """
+    allows define templates which will use for render Kubernetes resources like StatefulSet, ConfigMap, Service, PVC, by default, clickhouse-operator have own templates, but you can override it
+    """
+    host_templates: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesHostTemplatesArgs']]]]]
+    """
+    hostTemplate will use during apply to generate `clickhose-server` config files
+    """
+    pod_templates: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesPodTemplatesArgs']]]]]
+    """
+    podTemplate will use during render `Pod` inside `StatefulSet.spec` and allows define rendered `Pod.spec`, pod scheduling distribution and pod zone
+    More information: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatespodtemplates
+    """
+    service_templates: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesServiceTemplatesArgs']]]]]
+    """
+    allows define template for rendering `Service` which would get endpoint from Pods which scoped chi-wide, cluster-wide, shard-wide, replica-wide level
+    """
+    volume_claim_templates: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgs']]]]]
+    """
+    allows define template for rendering `PVC` kubernetes resource, which would use inside `Pod` for mount clickhouse `data`, clickhouse `logs` or something else
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecTemplatesArgs:
+    def __init__(__self__, *,
+                 host_templates: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesHostTemplatesArgs']]]] = None,
+                 pod_templates: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesPodTemplatesArgs']]]] = None,
+                 service_templates: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesServiceTemplatesArgs']]]] = None,
+                 volume_claim_templates: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgs']]]] = None):
+        """
+        allows define templates which will use for render Kubernetes resources like StatefulSet, ConfigMap, Service, PVC, by default, clickhouse-operator have own templates, but you can override it
+
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesHostTemplatesArgs']]] host_templates: hostTemplate will use during apply to generate `clickhose-server` config files
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesPodTemplatesArgs']]] pod_templates: podTemplate will use during render `Pod` inside `StatefulSet.spec` and allows define rendered `Pod.spec`, pod scheduling distribution and pod zone
+               More information: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatespodtemplates
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesServiceTemplatesArgs']]] service_templates: allows define template for rendering `Service` which would get endpoint from Pods which scoped chi-wide, cluster-wide, shard-wide, replica-wide level
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgs']]] volume_claim_templates: allows define template for rendering `PVC` kubernetes resource, which would use inside `Pod` for mount clickhouse `data`, clickhouse `logs` or something else
+        """
+        if host_templates is not None:
+            pulumi.set(__self__, "host_templates", host_templates)
+        if pod_templates is not None:
+            pulumi.set(__self__, "pod_templates", pod_templates)
+        if service_templates is not None:
+            pulumi.set(__self__, "service_templates", service_templates)
+        if volume_claim_templates is not None:
+            pulumi.set(__self__, "volume_claim_templates", volume_claim_templates)
+
+    @_builtins.property
+    @pulumi.getter(name="hostTemplates")
+    def host_templates(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesHostTemplatesArgs']]]]:
+        """
+        hostTemplate will use during apply to generate `clickhose-server` config files
+        """
+        return pulumi.get(self, "host_templates")
+
+    @host_templates.setter
+    def host_templates(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesHostTemplatesArgs']]]]):
+        pulumi.set(self, "host_templates", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podTemplates")
+    def pod_templates(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesPodTemplatesArgs']]]]:
+        """
+        podTemplate will use during render `Pod` inside `StatefulSet.spec` and allows define rendered `Pod.spec`, pod scheduling distribution and pod zone
+        More information: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatespodtemplates
+        """
+        return pulumi.get(self, "pod_templates")
+
+    @pod_templates.setter
+    def pod_templates(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesPodTemplatesArgs']]]]):
+        pulumi.set(self, "pod_templates", value)
+
+    @_builtins.property
+    @pulumi.getter(name="serviceTemplates")
+    def service_templates(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesServiceTemplatesArgs']]]]:
+        """
+        allows define template for rendering `Service` which would get endpoint from Pods which scoped chi-wide, cluster-wide, shard-wide, replica-wide level
+        """
+        return pulumi.get(self, "service_templates")
+
+    @service_templates.setter
+    def service_templates(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesServiceTemplatesArgs']]]]):
+        pulumi.set(self, "service_templates", value)
+
+    @_builtins.property
+    @pulumi.getter(name="volumeClaimTemplates")
+    def volume_claim_templates(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgs']]]]:
+        """
+        allows define template for rendering `PVC` kubernetes resource, which would use inside `Pod` for mount clickhouse `data`, clickhouse `logs` or something else
+        """
+        return pulumi.get(self, "volume_claim_templates")
+
+    @volume_claim_templates.setter
+    def volume_claim_templates(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgs']]]]):
+        pulumi.set(self, "volume_claim_templates", value)
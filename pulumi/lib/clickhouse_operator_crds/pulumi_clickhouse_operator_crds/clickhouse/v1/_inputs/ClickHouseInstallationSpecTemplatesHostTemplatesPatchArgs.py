@@ -0,0 +1,81 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecTemplatesHostTemplatesPatchArgsDict', 'ClickHouseInstallationSpecTemplatesHostTemplatesPatchArgs']
+
+class ClickHouseInstallationSpecTemplatesHostTemplatesPatchArgsDict(TypedDict):
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    template name, could use to link inside top-level `chi.spec.defaults.templates.hostTemplate`, cluster-level `chi.spec.configuration.clusters.templates.hostTemplate`, shard-level `chi.spec.configuration.clusters.layout.shards.temlates.hostTemplate`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates.hostTemplate`
+    """
+    port_distribution: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatchArgs']]]]]
+    """
+    define how will distribute numeric values of named ports in `Pod.spec.containers.ports` and clickhouse-server configs
+    """
+    spec: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatchArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecTemplatesHostTemplatesPatchArgs:
+    def __init__(__self__, *,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 port_distribution: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatchArgs']]]] = None,
+                 spec: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatchArgs']] = None):
+        """
+        :param pulumi.Input[_builtins.str] name: template name, could use to link inside top-level `chi.spec.defaults.templates.hostTemplate`, cluster-level `chi.spec.configuration.clusters.templates.hostTemplate`, shard-level `chi.spec.configuration.clusters.layout.shards.temlates.hostTemplate`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates.hostTemplate`
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatchArgs']]] port_distribution: define how will distribute numeric values of named ports in `Pod.spec.containers.ports` and clickhouse-server configs
+        """
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if port_distribution is not None:
+            pulumi.set(__self__, "port_distribution", port_distribution)
+        if spec is not None:
+            pulumi.set(__self__, "spec", spec)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        template name, could use to link inside top-level `chi.spec.defaults.templates.hostTemplate`, cluster-level `chi.spec.configuration.clusters.templates.hostTemplate`, shard-level `chi.spec.configuration.clusters.layout.shards.temlates.hostTemplate`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates.hostTemplate`
+        """
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="portDistribution")
+    def port_distribution(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatchArgs']]]]:
+        """
+        define how will distribute numeric values of named ports in `Pod.spec.containers.ports` and clickhouse-server configs
+        """
+        return pulumi.get(self, "port_distribution")
+
+    @port_distribution.setter
+    def port_distribution(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatchArgs']]]]):
+        pulumi.set(self, "port_distribution", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def spec(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatchArgs']]:
+        return pulumi.get(self, "spec")
+
+    @spec.setter
+    def spec(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatchArgs']]):
+        pulumi.set(self, "spec", value)
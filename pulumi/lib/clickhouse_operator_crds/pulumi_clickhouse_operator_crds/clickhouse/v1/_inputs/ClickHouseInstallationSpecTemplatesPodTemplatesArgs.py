@@ -0,0 +1,164 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecTemplatesPodTemplatesArgsDict', 'ClickHouseInstallationSpecTemplatesPodTemplatesArgs']
+
+class ClickHouseInstallationSpecTemplatesPodTemplatesArgsDict(TypedDict):
+    distribution: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    DEPRECATED, shortcut for `chi.spec.templates.podTemplates.spec.affinity.podAntiAffinity`
+    """
+    generate_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    allows define format for generated `Pod` name, look to https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatesservicetemplates for details about available template variables
+    """
+    metadata: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    allows pass standard object's metadata from template to Pod
+    More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+    """
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    template name, could use to link inside top-level `chi.spec.defaults.templates.podTemplate`, cluster-level `chi.spec.configuration.clusters.templates.podTemplate`, shard-level `chi.spec.configuration.clusters.layout.shards.temlates.podTemplate`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates.podTemplate`
+    """
+    pod_distribution: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionArgs']]]]]
+    """
+    define ClickHouse Pod distribution policy between Kubernetes Nodes inside Shard, Replica, Namespace, CHI, another ClickHouse cluster
+    """
+    spec: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    allows define whole Pod.spec inside StaefulSet.spec, look to https://kubernetes.io/docs/concepts/workloads/pods/#pod-templates for details
+    """
+    zone: NotRequired[pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecTemplatesPodTemplatesZoneArgs']]]
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecTemplatesPodTemplatesArgs:
+    def __init__(__self__, *,
+                 distribution: pulumi.Input[Optional[_builtins.str]] = None,
+                 generate_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 metadata: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 pod_distribution: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionArgs']]]] = None,
+                 spec: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 zone: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecTemplatesPodTemplatesZoneArgs']] = None):
+        """
+        :param pulumi.Input[_builtins.str] distribution: DEPRECATED, shortcut for `chi.spec.templates.podTemplates.spec.affinity.podAntiAffinity`
+        :param pulumi.Input[_builtins.str] generate_name: allows define format for generated `Pod` name, look to https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatesservicetemplates for details about available template variables
+        :param pulumi.Input[Mapping[str, Any]] metadata: allows pass standard object's metadata from template to Pod
+               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        :param pulumi.Input[_builtins.str] name: template name, could use to link inside top-level `chi.spec.defaults.templates.podTemplate`, cluster-level `chi.spec.configuration.clusters.templates.podTemplate`, shard-level `chi.spec.configuration.clusters.layout.shards.temlates.podTemplate`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates.podTemplate`
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionArgs']]] pod_distribution: define ClickHouse Pod distribution policy between Kubernetes Nodes inside Shard, Replica, Namespace, CHI, another ClickHouse cluster
+        :param pulumi.Input[Mapping[str, Any]] spec: allows define whole Pod.spec inside StaefulSet.spec, look to https://kubernetes.io/docs/concepts/workloads/pods/#pod-templates for details
+        """
+        if distribution is not None:
+            pulumi.set(__self__, "distribution", distribution)
+        if generate_name is not None:
+            pulumi.set(__self__, "generate_name", generate_name)
+        if metadata is not None:
+            pulumi.set(__self__, "metadata", metadata)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if pod_distribution is not None:
+            pulumi.set(__self__, "pod_distribution", pod_distribution)
+        if spec is not None:
+            pulumi.set(__self__, "spec", spec)
+        if zone is not None:
+            pulumi.set(__self__, "zone", zone)
+
+    @_builtins.property
+    @pulumi.getter
+    def distribution(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        DEPRECATED, shortcut for `chi.spec.templates.podTemplates.spec.affinity.podAntiAffinity`
+        """
+        return pulumi.get(self, "distribution")
+
+    @distribution.setter
+    def distribution(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "distribution", value)
+
+    @_builtins.property
+    @pulumi.getter(name="generateName")
+    def generate_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        allows define format for generated `Pod` name, look to https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatesservicetemplates for details about available template variables
+        """
+        return pulumi.get(self, "generate_name")
+
+    @generate_name.setter
+    def generate_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "generate_name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def metadata(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        allows pass standard object's metadata from template to Pod
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        """
+        return pulumi.get(self, "metadata")
+
+    @metadata.setter
+    def metadata(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "metadata", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        template name, could use to link inside top-level `chi.spec.defaults.templates.podTemplate`, cluster-level `chi.spec.configuration.clusters.templates.podTemplate`, shard-level `chi.spec.configuration.clusters.layout.shards.temlates.podTemplate`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates.podTemplate`
+        """
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podDistribution")
+    def pod_distribution(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionArgs']]]]:
+        """
+        define ClickHouse Pod distribution policy between Kubernetes Nodes inside Shard, Replica, Namespace, CHI, another ClickHouse cluster
+        """
+        return pulumi.get(self, "pod_distribution")
+
+    @pod_distribution.setter
+    def pod_distribution(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionArgs']]]]):
+        pulumi.set(self, "pod_distribution", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def spec(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        allows define whole Pod.spec inside StaefulSet.spec, look to https://kubernetes.io/docs/concepts/workloads/pods/#pod-templates for details
+        """
+        return pulumi.get(self, "spec")
+
+    @spec.setter
+    def spec(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "spec", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def zone(self) -> pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecTemplatesPodTemplatesZoneArgs']]:
+        return pulumi.get(self, "zone")
+
+    @zone.setter
+    def zone(self, value: pulumi.Input[Optional['_inputs.ClickHouseInstallationSpecTemplatesPodTemplatesZoneArgs']]):
+        pulumi.set(self, "zone", value)
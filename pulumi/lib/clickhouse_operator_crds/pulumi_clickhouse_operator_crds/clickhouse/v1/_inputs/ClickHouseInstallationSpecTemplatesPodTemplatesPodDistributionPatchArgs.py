@@ -0,0 +1,111 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatchArgsDict', 'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatchArgs']
+
+class ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatchArgsDict(TypedDict):
+    number: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    define, how much ClickHouse Pods could be inside selected scope with selected distribution type
+    """
+    scope: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    scope for apply each podDistribution
+    """
+    topology_key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    use for inter-pod affinity look to `pod.spec.affinity.podAntiAffinity.preferredDuringSchedulingIgnoredDuringExecution.podAffinityTerm.topologyKey`,
+    more info: https://kubernetes.io/docs/concepts/scheduling-eviction/assign-pod-node/#inter-pod-affinity-and-anti-affinity"
+    """
+    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    you can define multiple affinity policy types
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatchArgs:
+    def __init__(__self__, *,
+                 number: pulumi.Input[Optional[_builtins.int]] = None,
+                 scope: pulumi.Input[Optional[_builtins.str]] = None,
+                 topology_key: pulumi.Input[Optional[_builtins.str]] = None,
+                 type: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        :param pulumi.Input[_builtins.int] number: define, how much ClickHouse Pods could be inside selected scope with selected distribution type
+        :param pulumi.Input[_builtins.str] scope: scope for apply each podDistribution
+        :param pulumi.Input[_builtins.str] topology_key: use for inter-pod affinity look to `pod.spec.affinity.podAntiAffinity.preferredDuringSchedulingIgnoredDuringExecution.podAffinityTerm.topologyKey`,
+               more info: https://kubernetes.io/docs/concepts/scheduling-eviction/assign-pod-node/#inter-pod-affinity-and-anti-affinity"
+        :param pulumi.Input[_builtins.str] type: you can define multiple affinity policy types
+        """
+        if number is not None:
+            pulumi.set(__self__, "number", number)
+        if scope is not None:
+            pulumi.set(__self__, "scope", scope)
+        if topology_key is not None:
+            pulumi.set(__self__, "topology_key", topology_key)
+        if type is not None:
+            pulumi.set(__self__, "type", type)
+
+    @_builtins.property
+    @pulumi.getter
+    def number(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        define, how much ClickHouse Pods could be inside selected scope with selected distribution type
+        """
+        return pulumi.get(self, "number")
+
+    @number.setter
+    def number(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "number", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def scope(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        scope for apply each podDistribution
+        """
+        return pulumi.get(self, "scope")
+
+    @scope.setter
+    def scope(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "scope", value)
+
+    @_builtins.property
+    @pulumi.getter(name="topologyKey")
+    def topology_key(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        use for inter-pod affinity look to `pod.spec.affinity.podAntiAffinity.preferredDuringSchedulingIgnoredDuringExecution.podAffinityTerm.topologyKey`,
+        more info: https://kubernetes.io/docs/concepts/scheduling-eviction/assign-pod-node/#inter-pod-affinity-and-anti-affinity"
+        """
+        return pulumi.get(self, "topology_key")
+
+    @topology_key.setter
+    def topology_key(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "topology_key", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        you can define multiple affinity policy types
+        """
+        return pulumi.get(self, "type")
+
+    @type.setter
+    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "type", value)
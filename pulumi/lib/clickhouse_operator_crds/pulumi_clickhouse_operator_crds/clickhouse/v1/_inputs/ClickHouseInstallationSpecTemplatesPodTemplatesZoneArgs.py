@@ -0,0 +1,73 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecTemplatesPodTemplatesZoneArgsDict', 'ClickHouseInstallationSpecTemplatesPodTemplatesZoneArgs']
+
+class ClickHouseInstallationSpecTemplatesPodTemplatesZoneArgsDict(TypedDict):
+    """
+    allows define custom zone name and will separate ClickHouse `Pods` between nodes, shortcut for `chi.spec.templates.podTemplates.spec.affinity.podAntiAffinity`
+    """
+    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, if defined, allows select kubernetes nodes by label with `name` equal `key`
+    """
+    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    optional, if defined, allows select kubernetes nodes by label with `value` in `values`
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecTemplatesPodTemplatesZoneArgs:
+    def __init__(__self__, *,
+                 key: pulumi.Input[Optional[_builtins.str]] = None,
+                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
+        """
+        allows define custom zone name and will separate ClickHouse `Pods` between nodes, shortcut for `chi.spec.templates.podTemplates.spec.affinity.podAntiAffinity`
+
+        :param pulumi.Input[_builtins.str] key: optional, if defined, allows select kubernetes nodes by label with `name` equal `key`
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: optional, if defined, allows select kubernetes nodes by label with `value` in `values`
+        """
+        if key is not None:
+            pulumi.set(__self__, "key", key)
+        if values is not None:
+            pulumi.set(__self__, "values", values)
+
+    @_builtins.property
+    @pulumi.getter
+    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, if defined, allows select kubernetes nodes by label with `name` equal `key`
+        """
+        return pulumi.get(self, "key")
+
+    @key.setter
+    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "key", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        optional, if defined, allows select kubernetes nodes by label with `value` in `values`
+        """
+        return pulumi.get(self, "values")
+
+    @values.setter
+    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "values", value)
@@ -0,0 +1,135 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecTemplatesServiceTemplatesPatchArgsDict', 'ClickHouseInstallationSpecTemplatesServiceTemplatesPatchArgs']
+
+class ClickHouseInstallationSpecTemplatesServiceTemplatesPatchArgsDict(TypedDict):
+    generate_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    allows define format for generated `Service` name,
+    look to https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatesservicetemplates
+    for details about available template variables"
+    """
+    metadata: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    allows pass standard object's metadata from template to Service
+    Could be use for define specificly for Cloud Provider metadata which impact to behavior of service
+    More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+    """
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    template name, could use to link inside
+    chi-level `chi.spec.defaults.templates.serviceTemplate`
+    cluster-level `chi.spec.configuration.clusters.templates.clusterServiceTemplate`
+    shard-level `chi.spec.configuration.clusters.layout.shards.temlates.shardServiceTemplate`
+    replica-level `chi.spec.configuration.clusters.layout.replicas.templates.replicaServiceTemplate` or `chi.spec.configuration.clusters.layout.shards.replicas.replicaServiceTemplate`
+    """
+    spec: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    describe behavior of generated Service
+    More info: https://kubernetes.io/docs/concepts/services-networking/service/
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecTemplatesServiceTemplatesPatchArgs:
+    def __init__(__self__, *,
+                 generate_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 metadata: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 spec: pulumi.Input[Optional[Mapping[str, Any]]] = None):
+        """
+        :param pulumi.Input[_builtins.str] generate_name: allows define format for generated `Service` name,
+               look to https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatesservicetemplates
+               for details about available template variables"
+        :param pulumi.Input[Mapping[str, Any]] metadata: allows pass standard object's metadata from template to Service
+               Could be use for define specificly for Cloud Provider metadata which impact to behavior of service
+               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        :param pulumi.Input[_builtins.str] name: template name, could use to link inside
+               chi-level `chi.spec.defaults.templates.serviceTemplate`
+               cluster-level `chi.spec.configuration.clusters.templates.clusterServiceTemplate`
+               shard-level `chi.spec.configuration.clusters.layout.shards.temlates.shardServiceTemplate`
+               replica-level `chi.spec.configuration.clusters.layout.replicas.templates.replicaServiceTemplate` or `chi.spec.configuration.clusters.layout.shards.replicas.replicaServiceTemplate`
+        :param pulumi.Input[Mapping[str, Any]] spec: describe behavior of generated Service
+               More info: https://kubernetes.io/docs/concepts/services-networking/service/
+        """
+        if generate_name is not None:
+            pulumi.set(__self__, "generate_name", generate_name)
+        if metadata is not None:
+            pulumi.set(__self__, "metadata", metadata)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if spec is not None:
+            pulumi.set(__self__, "spec", spec)
+
+    @_builtins.property
+    @pulumi.getter(name="generateName")
+    def generate_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        allows define format for generated `Service` name,
+        look to https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatesservicetemplates
+        for details about available template variables"
+        """
+        return pulumi.get(self, "generate_name")
+
+    @generate_name.setter
+    def generate_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "generate_name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def metadata(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        allows pass standard object's metadata from template to Service
+        Could be use for define specificly for Cloud Provider metadata which impact to behavior of service
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        """
+        return pulumi.get(self, "metadata")
+
+    @metadata.setter
+    def metadata(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "metadata", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        template name, could use to link inside
+        chi-level `chi.spec.defaults.templates.serviceTemplate`
+        cluster-level `chi.spec.configuration.clusters.templates.clusterServiceTemplate`
+        shard-level `chi.spec.configuration.clusters.layout.shards.temlates.shardServiceTemplate`
+        replica-level `chi.spec.configuration.clusters.layout.replicas.templates.replicaServiceTemplate` or `chi.spec.configuration.clusters.layout.shards.replicas.replicaServiceTemplate`
+        """
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def spec(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        describe behavior of generated Service
+        More info: https://kubernetes.io/docs/concepts/services-networking/service/
+        """
+        return pulumi.get(self, "spec")
+
+    @spec.setter
+    def spec(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "spec", value)
@@ -0,0 +1,149 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgsDict', 'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgs']
+
+class ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgsDict(TypedDict):
+    metadata: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    allows to pass standard object's metadata from template to PVC
+    More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+    """
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    template name, could use to link inside
+    top-level `chi.spec.defaults.templates.dataVolumeClaimTemplate` or `chi.spec.defaults.templates.logVolumeClaimTemplate`,
+    cluster-level `chi.spec.configuration.clusters.templates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.templates.logVolumeClaimTemplate`,
+    shard-level `chi.spec.configuration.clusters.layout.shards.temlates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.layout.shards.temlates.logVolumeClaimTemplate`
+    replica-level `chi.spec.configuration.clusters.layout.replicas.templates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.layout.replicas.templates.logVolumeClaimTemplate`
+    """
+    provisioner: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    defines `PVC` provisioner - be it StatefulSet or the Operator
+    """
+    reclaim_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    defines behavior of `PVC` deletion.
+    `Delete` by default, if `Retain` specified then `PVC` will be kept when deleting StatefulSet
+    """
+    spec: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    allows define all aspects of `PVC` resource
+    More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes/#persistentvolumeclaims
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgs:
+    def __init__(__self__, *,
+                 metadata: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 provisioner: pulumi.Input[Optional[_builtins.str]] = None,
+                 reclaim_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 spec: pulumi.Input[Optional[Mapping[str, Any]]] = None):
+        """
+        :param pulumi.Input[Mapping[str, Any]] metadata: allows to pass standard object's metadata from template to PVC
+               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        :param pulumi.Input[_builtins.str] name: template name, could use to link inside
+               top-level `chi.spec.defaults.templates.dataVolumeClaimTemplate` or `chi.spec.defaults.templates.logVolumeClaimTemplate`,
+               cluster-level `chi.spec.configuration.clusters.templates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.templates.logVolumeClaimTemplate`,
+               shard-level `chi.spec.configuration.clusters.layout.shards.temlates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.layout.shards.temlates.logVolumeClaimTemplate`
+               replica-level `chi.spec.configuration.clusters.layout.replicas.templates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.layout.replicas.templates.logVolumeClaimTemplate`
+        :param pulumi.Input[_builtins.str] provisioner: defines `PVC` provisioner - be it StatefulSet or the Operator
+        :param pulumi.Input[_builtins.str] reclaim_policy: defines behavior of `PVC` deletion.
+               `Delete` by default, if `Retain` specified then `PVC` will be kept when deleting StatefulSet
+        :param pulumi.Input[Mapping[str, Any]] spec: allows define all aspects of `PVC` resource
+               More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes/#persistentvolumeclaims
+        """
+        if metadata is not None:
+            pulumi.set(__self__, "metadata", metadata)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if provisioner is not None:
+            pulumi.set(__self__, "provisioner", provisioner)
+        if reclaim_policy is not None:
+            pulumi.set(__self__, "reclaim_policy", reclaim_policy)
+        if spec is not None:
+            pulumi.set(__self__, "spec", spec)
+
+    @_builtins.property
+    @pulumi.getter
+    def metadata(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        allows to pass standard object's metadata from template to PVC
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        """
+        return pulumi.get(self, "metadata")
+
+    @metadata.setter
+    def metadata(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "metadata", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        template name, could use to link inside
+        top-level `chi.spec.defaults.templates.dataVolumeClaimTemplate` or `chi.spec.defaults.templates.logVolumeClaimTemplate`,
+        cluster-level `chi.spec.configuration.clusters.templates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.templates.logVolumeClaimTemplate`,
+        shard-level `chi.spec.configuration.clusters.layout.shards.temlates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.layout.shards.temlates.logVolumeClaimTemplate`
+        replica-level `chi.spec.configuration.clusters.layout.replicas.templates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.layout.replicas.templates.logVolumeClaimTemplate`
+        """
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def provisioner(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        defines `PVC` provisioner - be it StatefulSet or the Operator
+        """
+        return pulumi.get(self, "provisioner")
+
+    @provisioner.setter
+    def provisioner(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "provisioner", value)
+
+    @_builtins.property
+    @pulumi.getter(name="reclaimPolicy")
+    def reclaim_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        defines behavior of `PVC` deletion.
+        `Delete` by default, if `Retain` specified then `PVC` will be kept when deleting StatefulSet
+        """
+        return pulumi.get(self, "reclaim_policy")
+
+    @reclaim_policy.setter
+    def reclaim_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "reclaim_policy", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def spec(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        allows define all aspects of `PVC` resource
+        More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes/#persistentvolumeclaims
+        """
+        return pulumi.get(self, "spec")
+
+    @spec.setter
+    def spec(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "spec", value)
@@ -0,0 +1,82 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecTemplatingArgsDict', 'ClickHouseInstallationSpecTemplatingArgs']
+
+class ClickHouseInstallationSpecTemplatingArgsDict(TypedDict):
+    """
+    Optional, applicable inside ClickHouseInstallationTemplate only.
+    Defines current ClickHouseInstallationTemplate application options to target ClickHouseInstallation(s)."
+    """
+    chi_selector: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    Optional, defines selector for ClickHouseInstallation(s) to be templated with ClickhouseInstallationTemplate
+    """
+    policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    When defined as `auto` inside ClickhouseInstallationTemplate, this ClickhouseInstallationTemplate
+    will be auto-added into ClickHouseInstallation, selectable by `chiSelector`.
+    Default value is `manual`, meaning ClickHouseInstallation should request this ClickhouseInstallationTemplate explicitly.
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecTemplatingArgs:
+    def __init__(__self__, *,
+                 chi_selector: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 policy: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        Optional, applicable inside ClickHouseInstallationTemplate only.
+        Defines current ClickHouseInstallationTemplate application options to target ClickHouseInstallation(s)."
+
+
+        :param pulumi.Input[Mapping[str, Any]] chi_selector: Optional, defines selector for ClickHouseInstallation(s) to be templated with ClickhouseInstallationTemplate
+        :param pulumi.Input[_builtins.str] policy: When defined as `auto` inside ClickhouseInstallationTemplate, this ClickhouseInstallationTemplate
+               will be auto-added into ClickHouseInstallation, selectable by `chiSelector`.
+               Default value is `manual`, meaning ClickHouseInstallation should request this ClickhouseInstallationTemplate explicitly.
+        """
+        if chi_selector is not None:
+            pulumi.set(__self__, "chi_selector", chi_selector)
+        if policy is not None:
+            pulumi.set(__self__, "policy", policy)
+
+    @_builtins.property
+    @pulumi.getter(name="chiSelector")
+    def chi_selector(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        Optional, defines selector for ClickHouseInstallation(s) to be templated with ClickhouseInstallationTemplate
+        """
+        return pulumi.get(self, "chi_selector")
+
+    @chi_selector.setter
+    def chi_selector(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "chi_selector", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        When defined as `auto` inside ClickhouseInstallationTemplate, this ClickhouseInstallationTemplate
+        will be auto-added into ClickHouseInstallation, selectable by `chiSelector`.
+        Default value is `manual`, meaning ClickHouseInstallation should request this ClickhouseInstallationTemplate explicitly.
+        """
+        return pulumi.get(self, "policy")
+
+    @policy.setter
+    def policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "policy", value)
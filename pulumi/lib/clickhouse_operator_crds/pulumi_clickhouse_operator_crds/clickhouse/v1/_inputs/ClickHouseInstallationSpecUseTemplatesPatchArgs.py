@@ -0,0 +1,88 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationSpecUseTemplatesPatchArgsDict', 'ClickHouseInstallationSpecUseTemplatesPatchArgs']
+
+class ClickHouseInstallationSpecUseTemplatesPatchArgsDict(TypedDict):
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    name of `ClickHouseInstallationTemplate` (chit) resource
+    """
+    namespace: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Kubernetes namespace where need search `chit` resource, depending on `watchNamespaces` settings in `clickhouse-operator`
+    """
+    use_type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    optional, current strategy is only merge, and current `chi` settings have more priority than merged template `chit`
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationSpecUseTemplatesPatchArgs:
+    def __init__(__self__, *,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 namespace: pulumi.Input[Optional[_builtins.str]] = None,
+                 use_type: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        :param pulumi.Input[_builtins.str] name: name of `ClickHouseInstallationTemplate` (chit) resource
+        :param pulumi.Input[_builtins.str] namespace: Kubernetes namespace where need search `chit` resource, depending on `watchNamespaces` settings in `clickhouse-operator`
+        :param pulumi.Input[_builtins.str] use_type: optional, current strategy is only merge, and current `chi` settings have more priority than merged template `chit`
+        """
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if namespace is not None:
+            pulumi.set(__self__, "namespace", namespace)
+        if use_type is not None:
+            pulumi.set(__self__, "use_type", use_type)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        name of `ClickHouseInstallationTemplate` (chit) resource
+        """
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def namespace(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Kubernetes namespace where need search `chit` resource, depending on `watchNamespaces` settings in `clickhouse-operator`
+        """
+        return pulumi.get(self, "namespace")
+
+    @namespace.setter
+    def namespace(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "namespace", value)
+
+    @_builtins.property
+    @pulumi.getter(name="useType")
+    def use_type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        optional, current strategy is only merge, and current `chi` settings have more priority than merged template `chit`
+        """
+        return pulumi.get(self, "use_type")
+
+    @use_type.setter
+    def use_type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "use_type", value)
@@ -0,0 +1,714 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ClickHouseInstallationStatusArgsDict', 'ClickHouseInstallationStatusArgs']
+
+class ClickHouseInstallationStatusArgsDict(TypedDict):
+    """
+    Status contains many fields like a normalized configuration, clickhouse-operator version, current action and all applied action list, current taskID and all applied taskIDs and other
+    """
+    action: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Action
+    """
+    action_plan: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    Action Plan
+    """
+    actions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    Actions
+    """
+    chop_commit: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Operator git commit SHA
+    """
+    chop_date: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Operator build date
+    """
+    chop_ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    IP address of the operator's pod which managed this resource
+    """
+    chop_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Operator version
+    """
+    clusters: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Clusters count
+    """
+    endpoint: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Endpoint
+    """
+    endpoints: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    All endpoints
+    """
+    error: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Last error
+    """
+    errors: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    Errors
+    """
+    fqdns: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    Pods FQDNs
+    """
+    generation: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Generation
+    """
+    hosts: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Hosts count
+    """
+    hosts_added: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Added Hosts count
+    """
+    hosts_completed: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Completed Hosts count
+    """
+    hosts_delete: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    About to delete Hosts count
+    """
+    hosts_deleted: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Deleted Hosts count
+    """
+    hosts_unchanged: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Unchanged Hosts count
+    """
+    hosts_updated: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Updated Hosts count
+    """
+    hosts_with_replica_caught_up: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    List of hosts with replica caught up
+    """
+    hosts_with_tables_created: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    List of hosts with tables created by the operator
+    """
+    normalized: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    Normalized resource requested
+    """
+    normalized_completed: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    Normalized resource completed
+    """
+    pod_ips: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    Pod IPs
+    """
+    pods: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    Pods
+    """
+    replicas: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Replicas count
+    """
+    shards: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Shards count
+    """
+    status: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Status
+    """
+    task_id: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Current task id
+    """
+    task_ids_completed: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    Completed task ids
+    """
+    task_ids_started: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    Started task ids
+    """
+    used_templates: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    List of templates used to build this CHI
+    """
+
+
+@pulumi.input_type
+class ClickHouseInstallationStatusArgs:
+    def __init__(__self__, *,
+                 action: pulumi.Input[Optional[_builtins.str]] = None,
+                 action_plan: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 actions: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 chop_commit: pulumi.Input[Optional[_builtins.str]] = None,
+                 chop_date: pulumi.Input[Optional[_builtins.str]] = None,
+                 chop_ip: pulumi.Input[Optional[_builtins.str]] = None,
+                 chop_version: pulumi.Input[Optional[_builtins.str]] = None,
+                 clusters: pulumi.Input[Optional[_builtins.int]] = None,
+                 endpoint: pulumi.Input[Optional[_builtins.str]] = None,
+                 endpoints: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 error: pulumi.Input[Optional[_builtins.str]] = None,
+                 errors: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 fqdns: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 generation: pulumi.Input[Optional[_builtins.int]] = None,
+                 hosts: pulumi.Input[Optional[_builtins.int]] = None,
+                 hosts_added: pulumi.Input[Optional[_builtins.int]] = None,
+                 hosts_completed: pulumi.Input[Optional[_builtins.int]] = None,
+                 hosts_delete: pulumi.Input[Optional[_builtins.int]] = None,
+                 hosts_deleted: pulumi.Input[Optional[_builtins.int]] = None,
+                 hosts_unchanged: pulumi.Input[Optional[_builtins.int]] = None,
+                 hosts_updated: pulumi.Input[Optional[_builtins.int]] = None,
+                 hosts_with_replica_caught_up: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 hosts_with_tables_created: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 normalized: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 normalized_completed: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 pod_ips: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 pods: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 replicas: pulumi.Input[Optional[_builtins.int]] = None,
+                 shards: pulumi.Input[Optional[_builtins.int]] = None,
+                 status: pulumi.Input[Optional[_builtins.str]] = None,
+                 task_id: pulumi.Input[Optional[_builtins.str]] = None,
+                 task_ids_completed: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 task_ids_started: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 used_templates: pulumi.Input[Optional[Mapping[str, Any]]] = None):
+        """
+        Status contains many fields like a normalized configuration, clickhouse-operator version, current action and all applied action list, current taskID and all applied taskIDs and other
+
+
+        :param pulumi.Input[_builtins.str] action: Action
+        :param pulumi.Input[Mapping[str, Any]] action_plan: Action Plan
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] actions: Actions
+        :param pulumi.Input[_builtins.str] chop_commit: Operator git commit SHA
+        :param pulumi.Input[_builtins.str] chop_date: Operator build date
+        :param pulumi.Input[_builtins.str] chop_ip: IP address of the operator's pod which managed this resource
+        :param pulumi.Input[_builtins.str] chop_version: Operator version
+        :param pulumi.Input[_builtins.int] clusters: Clusters count
+        :param pulumi.Input[_builtins.str] endpoint: Endpoint
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] endpoints: All endpoints
+        :param pulumi.Input[_builtins.str] error: Last error
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] errors: Errors
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] fqdns: Pods FQDNs
+        :param pulumi.Input[_builtins.int] generation: Generation
+        :param pulumi.Input[_builtins.int] hosts: Hosts count
+        :param pulumi.Input[_builtins.int] hosts_added: Added Hosts count
+        :param pulumi.Input[_builtins.int] hosts_completed: Completed Hosts count
+        :param pulumi.Input[_builtins.int] hosts_delete: About to delete Hosts count
+        :param pulumi.Input[_builtins.int] hosts_deleted: Deleted Hosts count
+        :param pulumi.Input[_builtins.int] hosts_unchanged: Unchanged Hosts count
+        :param pulumi.Input[_builtins.int] hosts_updated: Updated Hosts count
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] hosts_with_replica_caught_up: List of hosts with replica caught up
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] hosts_with_tables_created: List of hosts with tables created by the operator
+        :param pulumi.Input[Mapping[str, Any]] normalized: Normalized resource requested
+        :param pulumi.Input[Mapping[str, Any]] normalized_completed: Normalized resource completed
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] pod_ips: Pod IPs
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] pods: Pods
+        :param pulumi.Input[_builtins.int] replicas: Replicas count
+        :param pulumi.Input[_builtins.int] shards: Shards count
+        :param pulumi.Input[_builtins.str] status: Status
+        :param pulumi.Input[_builtins.str] task_id: Current task id
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] task_ids_completed: Completed task ids
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] task_ids_started: Started task ids
+        :param pulumi.Input[Mapping[str, Any]] used_templates: List of templates used to build this CHI
+        """
+        if action is not None:
+            pulumi.set(__self__, "action", action)
+        if action_plan is not None:
+            pulumi.set(__self__, "action_plan", action_plan)
+        if actions is not None:
+            pulumi.set(__self__, "actions", actions)
+        if chop_commit is not None:
+            pulumi.set(__self__, "chop_commit", chop_commit)
+        if chop_date is not None:
+            pulumi.set(__self__, "chop_date", chop_date)
+        if chop_ip is not None:
+            pulumi.set(__self__, "chop_ip", chop_ip)
+        if chop_version is not None:
+            pulumi.set(__self__, "chop_version", chop_version)
+        if clusters is not None:
+            pulumi.set(__self__, "clusters", clusters)
+        if endpoint is not None:
+            pulumi.set(__self__, "endpoint", endpoint)
+        if endpoints is not None:
+            pulumi.set(__self__, "endpoints", endpoints)
+        if error is not None:
+            pulumi.set(__self__, "error", error)
+        if errors is not None:
+            pulumi.set(__self__, "errors", errors)
+        if fqdns is not None:
+            pulumi.set(__self__, "fqdns", fqdns)
+        if generation is not None:
+            pulumi.set(__self__, "generation", generation)
+        if hosts is not None:
+            pulumi.set(__self__, "hosts", hosts)
+        if hosts_added is not None:
+            pulumi.set(__self__, "hosts_added", hosts_added)
+        if hosts_completed is not None:
+            pulumi.set(__self__, "hosts_completed", hosts_completed)
+        if hosts_delete is not None:
+            pulumi.set(__self__, "hosts_delete", hosts_delete)
+        if hosts_deleted is not None:
+            pulumi.set(__self__, "hosts_deleted", hosts_deleted)
+        if hosts_unchanged is not None:
+            pulumi.set(__self__, "hosts_unchanged", hosts_unchanged)
+        if hosts_updated is not None:
+            pulumi.set(__self__, "hosts_updated", hosts_updated)
+        if hosts_with_replica_caught_up is not None:
+            pulumi.set(__self__, "hosts_with_replica_caught_up", hosts_with_replica_caught_up)
+        if hosts_with_tables_created is not None:
+            pulumi.set(__self__, "hosts_with_tables_created", hosts_with_tables_created)
+        if normalized is not None:
+            pulumi.set(__self__, "normalized", normalized)
+        if normalized_completed is not None:
+            pulumi.set(__self__, "normalized_completed", normalized_completed)
+        if pod_ips is not None:
+            pulumi.set(__self__, "pod_ips", pod_ips)
+        if pods is not None:
+            pulumi.set(__self__, "pods", pods)
+        if replicas is not None:
+            pulumi.set(__self__, "replicas", replicas)
+        if shards is not None:
+            pulumi.set(__self__, "shards", shards)
+        if status is not None:
+            pulumi.set(__self__, "status", status)
+        if task_id is not None:
+            pulumi.set(__self__, "task_id", task_id)
+        if task_ids_completed is not None:
+            pulumi.set(__self__, "task_ids_completed", task_ids_completed)
+        if task_ids_started is not None:
+            pulumi.set(__self__, "task_ids_started", task_ids_started)
+        if used_templates is not None:
+            pulumi.set(__self__, "used_templates", used_templates)
+
+    @_builtins.property
+    @pulumi.getter
+    def action(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Action
+        """
+        return pulumi.get(self, "action")
+
+    @action.setter
+    def action(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "action", value)
+
+    @_builtins.property
+    @pulumi.getter(name="actionPlan")
+    def action_plan(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        Action Plan
+        """
+        return pulumi.get(self, "action_plan")
+
+    @action_plan.setter
+    def action_plan(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "action_plan", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def actions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        Actions
+        """
+        return pulumi.get(self, "actions")
+
+    @actions.setter
+    def actions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "actions", value)
+
+    @_builtins.property
+    @pulumi.getter(name="chop-commit")
+    def chop_commit(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Operator git commit SHA
+        """
+        return pulumi.get(self, "chop_commit")
+
+    @chop_commit.setter
+    def chop_commit(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "chop_commit", value)
+
+    @_builtins.property
+    @pulumi.getter(name="chop-date")
+    def chop_date(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Operator build date
+        """
+        return pulumi.get(self, "chop_date")
+
+    @chop_date.setter
+    def chop_date(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "chop_date", value)
+
+    @_builtins.property
+    @pulumi.getter(name="chop-ip")
+    def chop_ip(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        IP address of the operator's pod which managed this resource
+        """
+        return pulumi.get(self, "chop_ip")
+
+    @chop_ip.setter
+    def chop_ip(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "chop_ip", value)
+
+    @_builtins.property
+    @pulumi.getter(name="chop-version")
+    def chop_version(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Operator version
+        """
+        return pulumi.get(self, "chop_version")
+
+    @chop_version.setter
+    def chop_version(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "chop_version", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def clusters(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Clusters count
+        """
+        return pulumi.get(self, "clusters")
+
+    @clusters.setter
+    def clusters(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "clusters", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def endpoint(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Endpoint
+        """
+        return pulumi.get(self, "endpoint")
+
+    @endpoint.setter
+    def endpoint(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "endpoint", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def endpoints(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        All endpoints
+        """
+        return pulumi.get(self, "endpoints")
+
+    @endpoints.setter
+    def endpoints(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "endpoints", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def error(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Last error
+        """
+        return pulumi.get(self, "error")
+
+    @error.setter
+    def error(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "error", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def errors(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        Errors
+        """
+        return pulumi.get(self, "errors")
+
+    @errors.setter
+    def errors(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "errors", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def fqdns(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        Pods FQDNs
+        """
+        return pulumi.get(self, "fqdns")
+
+    @fqdns.setter
+    def fqdns(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "fqdns", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def generation(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Generation
+        """
+        return pulumi.get(self, "generation")
+
+    @generation.setter
+    def generation(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "generation", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def hosts(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Hosts count
+        """
+        return pulumi.get(self, "hosts")
+
+    @hosts.setter
+    def hosts(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "hosts", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostsAdded")
+    def hosts_added(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Added Hosts count
+        """
+        return pulumi.get(self, "hosts_added")
+
+    @hosts_added.setter
+    def hosts_added(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "hosts_added", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostsCompleted")
+    def hosts_completed(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Completed Hosts count
+        """
+        return pulumi.get(self, "hosts_completed")
+
+    @hosts_completed.setter
+    def hosts_completed(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "hosts_completed", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostsDelete")
+    def hosts_delete(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        About to delete Hosts count
+        """
+        return pulumi.get(self, "hosts_delete")
+
+    @hosts_delete.setter
+    def hosts_delete(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "hosts_delete", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostsDeleted")
+    def hosts_deleted(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Deleted Hosts count
+        """
+        return pulumi.get(self, "hosts_deleted")
+
+    @hosts_deleted.setter
+    def hosts_deleted(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "hosts_deleted", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostsUnchanged")
+    def hosts_unchanged(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Unchanged Hosts count
+        """
+        return pulumi.get(self, "hosts_unchanged")
+
+    @hosts_unchanged.setter
+    def hosts_unchanged(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "hosts_unchanged", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostsUpdated")
+    def hosts_updated(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Updated Hosts count
+        """
+        return pulumi.get(self, "hosts_updated")
+
+    @hosts_updated.setter
+    def hosts_updated(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "hosts_updated", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostsWithReplicaCaughtUp")
+    def hosts_with_replica_caught_up(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        List of hosts with replica caught up
+        """
+        return pulumi.get(self, "hosts_with_replica_caught_up")
+
+    @hosts_with_replica_caught_up.setter
+    def hosts_with_replica_caught_up(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "hosts_with_replica_caught_up", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostsWithTablesCreated")
+    def hosts_with_tables_created(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        List of hosts with tables created by the operator
+        """
+        return pulumi.get(self, "hosts_with_tables_created")
+
+    @hosts_with_tables_created.setter
+    def hosts_with_tables_created(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "hosts_with_tables_created", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def normalized(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        Normalized resource requested
+        """
+        return pulumi.get(self, "normalized")
+
+    @normalized.setter
+    def normalized(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "normalized", value)
+
+    @_builtins.property
+    @pulumi.getter(name="normalizedCompleted")
+    def normalized_completed(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        Normalized resource completed
+        """
+        return pulumi.get(self, "normalized_completed")
+
+    @normalized_completed.setter
+    def normalized_completed(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "normalized_completed", value)
+
+    @_builtins.property
+    @pulumi.getter(name="pod-ips")
+    def pod_ips(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        Pod IPs
+        """
+        return pulumi.get(self, "pod_ips")
+
+    @pod_ips.setter
+    def pod_ips(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "pod_ips", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def pods(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        Pods
+        """
+        return pulumi.get(self, "pods")
+
+    @pods.setter
+    def pods(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "pods", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def replicas(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Replicas count
+        """
+        return pulumi.get(self, "replicas")
+
+    @replicas.setter
+    def replicas(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "replicas", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def shards(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Shards count
+        """
+        return pulumi.get(self, "shards")
+
+    @shards.setter
+    def shards(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "shards", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def status(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Status
+        """
+        return pulumi.get(self, "status")
+
+    @status.setter
+    def status(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "status", value)
+
+    @_builtins.property
+    @pulumi.getter(name="taskID")
+    def task_id(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Current task id
+        """
+        return pulumi.get(self, "task_id")
+
+    @task_id.setter
+    def task_id(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "task_id", value)
+
+    @_builtins.property
+    @pulumi.getter(name="taskIDsCompleted")
+    def task_ids_completed(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        Completed task ids
+        """
+        return pulumi.get(self, "task_ids_completed")
+
+    @task_ids_completed.setter
+    def task_ids_completed(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "task_ids_completed", value)
+
+    @_builtins.property
+    @pulumi.getter(name="taskIDsStarted")
+    def task_ids_started(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        Started task ids
+        """
+        return pulumi.get(self, "task_ids_started")
+
+    @task_ids_started.setter
+    def task_ids_started(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "task_ids_started", value)
+
+    @_builtins.property
+    @pulumi.getter(name="usedTemplates")
+    def used_templates(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        List of templates used to build this CHI
+        """
+        return pulumi.get(self, "used_templates")
+
+    @used_templates.setter
+    def used_templates(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "used_templates", value)
@@ -0,0 +1,1507 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import importlib
+import typing
+
+__all__ = [
+    'ClickHouseInstallationSpecConfigurationClustersLayoutPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutArgs',
+    'ClickHouseInstallationSpecConfigurationClustersPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcilePatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcilePatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimeArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimeArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersSecretPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersSecretArgs',
+    'ClickHouseInstallationSpecConfigurationClustersTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersTemplatesArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperArgs',
+    'ClickHouseInstallationSpecConfigurationClustersArgsDict',
+    'ClickHouseInstallationSpecConfigurationClustersArgs',
+    'ClickHouseInstallationSpecConfigurationPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationPatchArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperKeeperPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationZookeeperKeeperPatchArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperKeeperArgsDict',
+    'ClickHouseInstallationSpecConfigurationZookeeperKeeperArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperNodesPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationZookeeperNodesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperNodesArgsDict',
+    'ClickHouseInstallationSpecConfigurationZookeeperNodesArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperPatchArgsDict',
+    'ClickHouseInstallationSpecConfigurationZookeeperPatchArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperArgsDict',
+    'ClickHouseInstallationSpecConfigurationZookeeperArgs',
+    'ClickHouseInstallationSpecConfigurationArgsDict',
+    'ClickHouseInstallationSpecConfigurationArgs',
+    'ClickHouseInstallationSpecDefaultsDistributedDDLPatchArgsDict',
+    'ClickHouseInstallationSpecDefaultsDistributedDDLPatchArgs',
+    'ClickHouseInstallationSpecDefaultsDistributedDDLArgsDict',
+    'ClickHouseInstallationSpecDefaultsDistributedDDLArgs',
+    'ClickHouseInstallationSpecDefaultsPatchArgsDict',
+    'ClickHouseInstallationSpecDefaultsPatchArgs',
+    'ClickHouseInstallationSpecDefaultsStorageManagementPatchArgsDict',
+    'ClickHouseInstallationSpecDefaultsStorageManagementPatchArgs',
+    'ClickHouseInstallationSpecDefaultsStorageManagementArgsDict',
+    'ClickHouseInstallationSpecDefaultsStorageManagementArgs',
+    'ClickHouseInstallationSpecDefaultsTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecDefaultsTemplatesPatchArgs',
+    'ClickHouseInstallationSpecDefaultsTemplatesArgsDict',
+    'ClickHouseInstallationSpecDefaultsTemplatesArgs',
+    'ClickHouseInstallationSpecDefaultsArgsDict',
+    'ClickHouseInstallationSpecDefaultsArgs',
+    'ClickHouseInstallationSpecPatchArgsDict',
+    'ClickHouseInstallationSpecPatchArgs',
+    'ClickHouseInstallationSpecReconcileCleanupPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileCleanupPatchArgs',
+    'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatchArgs',
+    'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsArgsDict',
+    'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsArgs',
+    'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatchArgs',
+    'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsArgsDict',
+    'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsArgs',
+    'ClickHouseInstallationSpecReconcileCleanupArgsDict',
+    'ClickHouseInstallationSpecReconcileCleanupArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostHttpPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostHttpArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostHttpArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostShellPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostShellArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostShellArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostSqlPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostSqlArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostSqlArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreHttpPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreHttpArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreHttpArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPrePatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPrePatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreShellPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreShellArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreShellArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreSqlPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreSqlArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreSqlArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterHooksArgs',
+    'ClickHouseInstallationSpecReconcileClusterPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterArgsDict',
+    'ClickHouseInstallationSpecReconcileClusterArgs',
+    'ClickHouseInstallationSpecReconcileHostDropPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostDropPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostDropReplicasPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostDropReplicasPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostDropReplicasArgsDict',
+    'ClickHouseInstallationSpecReconcileHostDropReplicasArgs',
+    'ClickHouseInstallationSpecReconcileHostDropArgsDict',
+    'ClickHouseInstallationSpecReconcileHostDropArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostHttpPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostHttpArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPostHttpArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPostPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostShellPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostShellArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPostShellArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostSqlPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostSqlArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPostSqlArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPostArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreHttpPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreHttpArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPreHttpArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPrePatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPrePatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreShellPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreShellArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPreShellArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreSqlPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreSqlArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPreSqlArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksPreArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksArgsDict',
+    'ClickHouseInstallationSpecReconcileHostHooksArgs',
+    'ClickHouseInstallationSpecReconcileHostPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostWaitPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitProbesPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostWaitProbesPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitProbesArgsDict',
+    'ClickHouseInstallationSpecReconcileHostWaitProbesArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitReplicasPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileHostWaitReplicasPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitReplicasArgsDict',
+    'ClickHouseInstallationSpecReconcileHostWaitReplicasArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitArgsDict',
+    'ClickHouseInstallationSpecReconcileHostWaitArgs',
+    'ClickHouseInstallationSpecReconcileHostArgsDict',
+    'ClickHouseInstallationSpecReconcileHostArgs',
+    'ClickHouseInstallationSpecReconcileMacrosPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsFilesArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsFilesArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsUsersArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsUsersArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsArgs',
+    'ClickHouseInstallationSpecReconcileMacrosArgsDict',
+    'ClickHouseInstallationSpecReconcileMacrosArgs',
+    'ClickHouseInstallationSpecReconcilePatchArgsDict',
+    'ClickHouseInstallationSpecReconcilePatchArgs',
+    'ClickHouseInstallationSpecReconcileRuntimePatchArgsDict',
+    'ClickHouseInstallationSpecReconcileRuntimePatchArgs',
+    'ClickHouseInstallationSpecReconcileRuntimeArgsDict',
+    'ClickHouseInstallationSpecReconcileRuntimeArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetCreatePatchArgsDict',
+    'ClickHouseInstallationSpecReconcileStatefulSetCreatePatchArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetCreateArgsDict',
+    'ClickHouseInstallationSpecReconcileStatefulSetCreateArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetPatchArgsDict',
+    'ClickHouseInstallationSpecReconcileStatefulSetPatchArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetRecreatePatchArgsDict',
+    'ClickHouseInstallationSpecReconcileStatefulSetRecreatePatchArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetRecreateArgsDict',
+    'ClickHouseInstallationSpecReconcileStatefulSetRecreateArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetUpdatePatchArgsDict',
+    'ClickHouseInstallationSpecReconcileStatefulSetUpdatePatchArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetUpdateArgsDict',
+    'ClickHouseInstallationSpecReconcileStatefulSetUpdateArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetArgsDict',
+    'ClickHouseInstallationSpecReconcileStatefulSetArgs',
+    'ClickHouseInstallationSpecReconcileArgsDict',
+    'ClickHouseInstallationSpecReconcileArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingCleanupPatchArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatchArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsArgsDict',
+    'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatchArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsArgsDict',
+    'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupArgsDict',
+    'ClickHouseInstallationSpecReconcilingCleanupArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostShellPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostShellArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostShellArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPrePatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPrePatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreShellPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreShellArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreShellArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterHooksArgs',
+    'ClickHouseInstallationSpecReconcilingClusterPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterArgsDict',
+    'ClickHouseInstallationSpecReconcilingClusterArgs',
+    'ClickHouseInstallationSpecReconcilingHostDropPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostDropPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostDropReplicasPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostDropReplicasPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostDropReplicasArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostDropReplicasArgs',
+    'ClickHouseInstallationSpecReconcilingHostDropArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostDropArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostHttpPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostHttpArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostHttpArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostShellPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostShellArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostShellArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostSqlPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostSqlArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostSqlArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreHttpPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreHttpArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreHttpArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPrePatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPrePatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreShellPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreShellArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreShellArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreSqlPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreSqlArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreSqlArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostHooksArgs',
+    'ClickHouseInstallationSpecReconcilingHostPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostWaitPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitProbesPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostWaitProbesPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitProbesArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostWaitProbesArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitReplicasPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostWaitReplicasPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitReplicasArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostWaitReplicasArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostWaitArgs',
+    'ClickHouseInstallationSpecReconcilingHostArgsDict',
+    'ClickHouseInstallationSpecReconcilingHostArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosArgsDict',
+    'ClickHouseInstallationSpecReconcilingMacrosArgs',
+    'ClickHouseInstallationSpecReconcilingPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingPatchArgs',
+    'ClickHouseInstallationSpecReconcilingRuntimePatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingRuntimePatchArgs',
+    'ClickHouseInstallationSpecReconcilingRuntimeArgsDict',
+    'ClickHouseInstallationSpecReconcilingRuntimeArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetCreatePatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingStatefulSetCreatePatchArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetCreateArgsDict',
+    'ClickHouseInstallationSpecReconcilingStatefulSetCreateArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetPatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingStatefulSetPatchArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatchArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetRecreateArgsDict',
+    'ClickHouseInstallationSpecReconcilingStatefulSetRecreateArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatchArgsDict',
+    'ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatchArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetUpdateArgsDict',
+    'ClickHouseInstallationSpecReconcilingStatefulSetUpdateArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetArgsDict',
+    'ClickHouseInstallationSpecReconcilingStatefulSetArgs',
+    'ClickHouseInstallationSpecReconcilingArgsDict',
+    'ClickHouseInstallationSpecReconcilingArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatchArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionArgsDict',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatchArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesArgsDict',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecArgsDict',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesArgsDict',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatchArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionArgsDict',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesZonePatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesZonePatchArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesZoneArgsDict',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesZoneArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesArgsDict',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesServiceTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesServiceTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesServiceTemplatesArgsDict',
+    'ClickHouseInstallationSpecTemplatesServiceTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgsDict',
+    'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesArgsDict',
+    'ClickHouseInstallationSpecTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatingPatchArgsDict',
+    'ClickHouseInstallationSpecTemplatingPatchArgs',
+    'ClickHouseInstallationSpecTemplatingArgsDict',
+    'ClickHouseInstallationSpecTemplatingArgs',
+    'ClickHouseInstallationSpecUseTemplatesPatchArgsDict',
+    'ClickHouseInstallationSpecUseTemplatesPatchArgs',
+    'ClickHouseInstallationSpecUseTemplatesArgsDict',
+    'ClickHouseInstallationSpecUseTemplatesArgs',
+    'ClickHouseInstallationSpecArgsDict',
+    'ClickHouseInstallationSpecArgs',
+    'ClickHouseInstallationStatusArgsDict',
+    'ClickHouseInstallationStatusArgs',
+    'ClickHouseInstallationArgsDict',
+    'ClickHouseInstallationArgs',
+]
+
+_TYPE_MODULES = {
+    'ClickHouseInstallationSpecConfigurationClustersLayoutPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersLayoutPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersLayoutPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesArgsDict': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesArgs': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsArgsDict': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsArgs': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesArgsDict': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesArgs': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasArgsDict': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasArgs': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesArgsDict': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesArgs': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasArgsDict': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasArgs': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesArgsDict': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesArgs': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsArgsDict': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsArgs': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutArgsDict': 'ClickHouseInstallationSpecConfigurationClustersLayoutArgs',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutArgs': 'ClickHouseInstallationSpecConfigurationClustersLayoutArgs',
+    'ClickHouseInstallationSpecConfigurationClustersPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcilePatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcilePatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcilePatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcilePatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatchArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimeArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimeArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimeArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimeArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileArgsDict': 'ClickHouseInstallationSpecConfigurationClustersReconcileArgs',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileArgs': 'ClickHouseInstallationSpecConfigurationClustersReconcileArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyArgsDict': 'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyArgs': 'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersSecretPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersSecretPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefArgsDict': 'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefArgs': 'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromArgsDict': 'ClickHouseInstallationSpecConfigurationClustersSecretValueFromArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromArgs': 'ClickHouseInstallationSpecConfigurationClustersSecretValueFromArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretArgsDict': 'ClickHouseInstallationSpecConfigurationClustersSecretArgs',
+    'ClickHouseInstallationSpecConfigurationClustersSecretArgs': 'ClickHouseInstallationSpecConfigurationClustersSecretArgs',
+    'ClickHouseInstallationSpecConfigurationClustersTemplatesPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersTemplatesPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersTemplatesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersTemplatesArgsDict': 'ClickHouseInstallationSpecConfigurationClustersTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersTemplatesArgs': 'ClickHouseInstallationSpecConfigurationClustersTemplatesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperArgsDict': 'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperArgs': 'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesArgsDict': 'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesArgs': 'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperPatchArgsDict': 'ClickHouseInstallationSpecConfigurationClustersZookeeperPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperPatchArgs': 'ClickHouseInstallationSpecConfigurationClustersZookeeperPatchArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperArgsDict': 'ClickHouseInstallationSpecConfigurationClustersZookeeperArgs',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperArgs': 'ClickHouseInstallationSpecConfigurationClustersZookeeperArgs',
+    'ClickHouseInstallationSpecConfigurationClustersArgsDict': 'ClickHouseInstallationSpecConfigurationClustersArgs',
+    'ClickHouseInstallationSpecConfigurationClustersArgs': 'ClickHouseInstallationSpecConfigurationClustersArgs',
+    'ClickHouseInstallationSpecConfigurationPatchArgsDict': 'ClickHouseInstallationSpecConfigurationPatchArgs',
+    'ClickHouseInstallationSpecConfigurationPatchArgs': 'ClickHouseInstallationSpecConfigurationPatchArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperKeeperPatchArgsDict': 'ClickHouseInstallationSpecConfigurationZookeeperKeeperPatchArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperKeeperPatchArgs': 'ClickHouseInstallationSpecConfigurationZookeeperKeeperPatchArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperKeeperArgsDict': 'ClickHouseInstallationSpecConfigurationZookeeperKeeperArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperKeeperArgs': 'ClickHouseInstallationSpecConfigurationZookeeperKeeperArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperNodesPatchArgsDict': 'ClickHouseInstallationSpecConfigurationZookeeperNodesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperNodesPatchArgs': 'ClickHouseInstallationSpecConfigurationZookeeperNodesPatchArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperNodesArgsDict': 'ClickHouseInstallationSpecConfigurationZookeeperNodesArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperNodesArgs': 'ClickHouseInstallationSpecConfigurationZookeeperNodesArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperPatchArgsDict': 'ClickHouseInstallationSpecConfigurationZookeeperPatchArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperPatchArgs': 'ClickHouseInstallationSpecConfigurationZookeeperPatchArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperArgsDict': 'ClickHouseInstallationSpecConfigurationZookeeperArgs',
+    'ClickHouseInstallationSpecConfigurationZookeeperArgs': 'ClickHouseInstallationSpecConfigurationZookeeperArgs',
+    'ClickHouseInstallationSpecConfigurationArgsDict': 'ClickHouseInstallationSpecConfigurationArgs',
+    'ClickHouseInstallationSpecConfigurationArgs': 'ClickHouseInstallationSpecConfigurationArgs',
+    'ClickHouseInstallationSpecDefaultsDistributedDDLPatchArgsDict': 'ClickHouseInstallationSpecDefaultsDistributedDDLPatchArgs',
+    'ClickHouseInstallationSpecDefaultsDistributedDDLPatchArgs': 'ClickHouseInstallationSpecDefaultsDistributedDDLPatchArgs',
+    'ClickHouseInstallationSpecDefaultsDistributedDDLArgsDict': 'ClickHouseInstallationSpecDefaultsDistributedDDLArgs',
+    'ClickHouseInstallationSpecDefaultsDistributedDDLArgs': 'ClickHouseInstallationSpecDefaultsDistributedDDLArgs',
+    'ClickHouseInstallationSpecDefaultsPatchArgsDict': 'ClickHouseInstallationSpecDefaultsPatchArgs',
+    'ClickHouseInstallationSpecDefaultsPatchArgs': 'ClickHouseInstallationSpecDefaultsPatchArgs',
+    'ClickHouseInstallationSpecDefaultsStorageManagementPatchArgsDict': 'ClickHouseInstallationSpecDefaultsStorageManagementPatchArgs',
+    'ClickHouseInstallationSpecDefaultsStorageManagementPatchArgs': 'ClickHouseInstallationSpecDefaultsStorageManagementPatchArgs',
+    'ClickHouseInstallationSpecDefaultsStorageManagementArgsDict': 'ClickHouseInstallationSpecDefaultsStorageManagementArgs',
+    'ClickHouseInstallationSpecDefaultsStorageManagementArgs': 'ClickHouseInstallationSpecDefaultsStorageManagementArgs',
+    'ClickHouseInstallationSpecDefaultsTemplatesPatchArgsDict': 'ClickHouseInstallationSpecDefaultsTemplatesPatchArgs',
+    'ClickHouseInstallationSpecDefaultsTemplatesPatchArgs': 'ClickHouseInstallationSpecDefaultsTemplatesPatchArgs',
+    'ClickHouseInstallationSpecDefaultsTemplatesArgsDict': 'ClickHouseInstallationSpecDefaultsTemplatesArgs',
+    'ClickHouseInstallationSpecDefaultsTemplatesArgs': 'ClickHouseInstallationSpecDefaultsTemplatesArgs',
+    'ClickHouseInstallationSpecDefaultsArgsDict': 'ClickHouseInstallationSpecDefaultsArgs',
+    'ClickHouseInstallationSpecDefaultsArgs': 'ClickHouseInstallationSpecDefaultsArgs',
+    'ClickHouseInstallationSpecPatchArgsDict': 'ClickHouseInstallationSpecPatchArgs',
+    'ClickHouseInstallationSpecPatchArgs': 'ClickHouseInstallationSpecPatchArgs',
+    'ClickHouseInstallationSpecReconcileCleanupPatchArgsDict': 'ClickHouseInstallationSpecReconcileCleanupPatchArgs',
+    'ClickHouseInstallationSpecReconcileCleanupPatchArgs': 'ClickHouseInstallationSpecReconcileCleanupPatchArgs',
+    'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatchArgsDict': 'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatchArgs',
+    'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatchArgs': 'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatchArgs',
+    'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsArgsDict': 'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsArgs',
+    'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsArgs': 'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsArgs',
+    'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatchArgsDict': 'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatchArgs',
+    'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatchArgs': 'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatchArgs',
+    'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsArgsDict': 'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsArgs',
+    'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsArgs': 'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsArgs',
+    'ClickHouseInstallationSpecReconcileCleanupArgsDict': 'ClickHouseInstallationSpecReconcileCleanupArgs',
+    'ClickHouseInstallationSpecReconcileCleanupArgs': 'ClickHouseInstallationSpecReconcileCleanupArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPatchArgsDict': 'ClickHouseInstallationSpecReconcileClusterHooksPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPatchArgs': 'ClickHouseInstallationSpecReconcileClusterHooksPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostHttpPatchArgsDict': 'ClickHouseInstallationSpecReconcileClusterHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostHttpPatchArgs': 'ClickHouseInstallationSpecReconcileClusterHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostHttpArgsDict': 'ClickHouseInstallationSpecReconcileClusterHooksPostHttpArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostHttpArgs': 'ClickHouseInstallationSpecReconcileClusterHooksPostHttpArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostPatchArgsDict': 'ClickHouseInstallationSpecReconcileClusterHooksPostPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostPatchArgs': 'ClickHouseInstallationSpecReconcileClusterHooksPostPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostShellPatchArgsDict': 'ClickHouseInstallationSpecReconcileClusterHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostShellPatchArgs': 'ClickHouseInstallationSpecReconcileClusterHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostShellArgsDict': 'ClickHouseInstallationSpecReconcileClusterHooksPostShellArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostShellArgs': 'ClickHouseInstallationSpecReconcileClusterHooksPostShellArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostSqlPatchArgsDict': 'ClickHouseInstallationSpecReconcileClusterHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostSqlPatchArgs': 'ClickHouseInstallationSpecReconcileClusterHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostSqlArgsDict': 'ClickHouseInstallationSpecReconcileClusterHooksPostSqlArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostSqlArgs': 'ClickHouseInstallationSpecReconcileClusterHooksPostSqlArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostArgsDict': 'ClickHouseInstallationSpecReconcileClusterHooksPostArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostArgs': 'ClickHouseInstallationSpecReconcileClusterHooksPostArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreHttpPatchArgsDict': 'ClickHouseInstallationSpecReconcileClusterHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreHttpPatchArgs': 'ClickHouseInstallationSpecReconcileClusterHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreHttpArgsDict': 'ClickHouseInstallationSpecReconcileClusterHooksPreHttpArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreHttpArgs': 'ClickHouseInstallationSpecReconcileClusterHooksPreHttpArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPrePatchArgsDict': 'ClickHouseInstallationSpecReconcileClusterHooksPrePatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPrePatchArgs': 'ClickHouseInstallationSpecReconcileClusterHooksPrePatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreShellPatchArgsDict': 'ClickHouseInstallationSpecReconcileClusterHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreShellPatchArgs': 'ClickHouseInstallationSpecReconcileClusterHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreShellArgsDict': 'ClickHouseInstallationSpecReconcileClusterHooksPreShellArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreShellArgs': 'ClickHouseInstallationSpecReconcileClusterHooksPreShellArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreSqlPatchArgsDict': 'ClickHouseInstallationSpecReconcileClusterHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreSqlPatchArgs': 'ClickHouseInstallationSpecReconcileClusterHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreSqlArgsDict': 'ClickHouseInstallationSpecReconcileClusterHooksPreSqlArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreSqlArgs': 'ClickHouseInstallationSpecReconcileClusterHooksPreSqlArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreArgsDict': 'ClickHouseInstallationSpecReconcileClusterHooksPreArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreArgs': 'ClickHouseInstallationSpecReconcileClusterHooksPreArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksArgsDict': 'ClickHouseInstallationSpecReconcileClusterHooksArgs',
+    'ClickHouseInstallationSpecReconcileClusterHooksArgs': 'ClickHouseInstallationSpecReconcileClusterHooksArgs',
+    'ClickHouseInstallationSpecReconcileClusterPatchArgsDict': 'ClickHouseInstallationSpecReconcileClusterPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterPatchArgs': 'ClickHouseInstallationSpecReconcileClusterPatchArgs',
+    'ClickHouseInstallationSpecReconcileClusterArgsDict': 'ClickHouseInstallationSpecReconcileClusterArgs',
+    'ClickHouseInstallationSpecReconcileClusterArgs': 'ClickHouseInstallationSpecReconcileClusterArgs',
+    'ClickHouseInstallationSpecReconcileHostDropPatchArgsDict': 'ClickHouseInstallationSpecReconcileHostDropPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostDropPatchArgs': 'ClickHouseInstallationSpecReconcileHostDropPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostDropReplicasPatchArgsDict': 'ClickHouseInstallationSpecReconcileHostDropReplicasPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostDropReplicasPatchArgs': 'ClickHouseInstallationSpecReconcileHostDropReplicasPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostDropReplicasArgsDict': 'ClickHouseInstallationSpecReconcileHostDropReplicasArgs',
+    'ClickHouseInstallationSpecReconcileHostDropReplicasArgs': 'ClickHouseInstallationSpecReconcileHostDropReplicasArgs',
+    'ClickHouseInstallationSpecReconcileHostDropArgsDict': 'ClickHouseInstallationSpecReconcileHostDropArgs',
+    'ClickHouseInstallationSpecReconcileHostDropArgs': 'ClickHouseInstallationSpecReconcileHostDropArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPatchArgsDict': 'ClickHouseInstallationSpecReconcileHostHooksPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPatchArgs': 'ClickHouseInstallationSpecReconcileHostHooksPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostHttpPatchArgsDict': 'ClickHouseInstallationSpecReconcileHostHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostHttpPatchArgs': 'ClickHouseInstallationSpecReconcileHostHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostHttpArgsDict': 'ClickHouseInstallationSpecReconcileHostHooksPostHttpArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostHttpArgs': 'ClickHouseInstallationSpecReconcileHostHooksPostHttpArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostPatchArgsDict': 'ClickHouseInstallationSpecReconcileHostHooksPostPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostPatchArgs': 'ClickHouseInstallationSpecReconcileHostHooksPostPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostShellPatchArgsDict': 'ClickHouseInstallationSpecReconcileHostHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostShellPatchArgs': 'ClickHouseInstallationSpecReconcileHostHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostShellArgsDict': 'ClickHouseInstallationSpecReconcileHostHooksPostShellArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostShellArgs': 'ClickHouseInstallationSpecReconcileHostHooksPostShellArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostSqlPatchArgsDict': 'ClickHouseInstallationSpecReconcileHostHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostSqlPatchArgs': 'ClickHouseInstallationSpecReconcileHostHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostSqlArgsDict': 'ClickHouseInstallationSpecReconcileHostHooksPostSqlArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostSqlArgs': 'ClickHouseInstallationSpecReconcileHostHooksPostSqlArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostArgsDict': 'ClickHouseInstallationSpecReconcileHostHooksPostArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPostArgs': 'ClickHouseInstallationSpecReconcileHostHooksPostArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreHttpPatchArgsDict': 'ClickHouseInstallationSpecReconcileHostHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreHttpPatchArgs': 'ClickHouseInstallationSpecReconcileHostHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreHttpArgsDict': 'ClickHouseInstallationSpecReconcileHostHooksPreHttpArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreHttpArgs': 'ClickHouseInstallationSpecReconcileHostHooksPreHttpArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPrePatchArgsDict': 'ClickHouseInstallationSpecReconcileHostHooksPrePatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPrePatchArgs': 'ClickHouseInstallationSpecReconcileHostHooksPrePatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreShellPatchArgsDict': 'ClickHouseInstallationSpecReconcileHostHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreShellPatchArgs': 'ClickHouseInstallationSpecReconcileHostHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreShellArgsDict': 'ClickHouseInstallationSpecReconcileHostHooksPreShellArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreShellArgs': 'ClickHouseInstallationSpecReconcileHostHooksPreShellArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreSqlPatchArgsDict': 'ClickHouseInstallationSpecReconcileHostHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreSqlPatchArgs': 'ClickHouseInstallationSpecReconcileHostHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreSqlArgsDict': 'ClickHouseInstallationSpecReconcileHostHooksPreSqlArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreSqlArgs': 'ClickHouseInstallationSpecReconcileHostHooksPreSqlArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreArgsDict': 'ClickHouseInstallationSpecReconcileHostHooksPreArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksPreArgs': 'ClickHouseInstallationSpecReconcileHostHooksPreArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksArgsDict': 'ClickHouseInstallationSpecReconcileHostHooksArgs',
+    'ClickHouseInstallationSpecReconcileHostHooksArgs': 'ClickHouseInstallationSpecReconcileHostHooksArgs',
+    'ClickHouseInstallationSpecReconcileHostPatchArgsDict': 'ClickHouseInstallationSpecReconcileHostPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostPatchArgs': 'ClickHouseInstallationSpecReconcileHostPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitPatchArgsDict': 'ClickHouseInstallationSpecReconcileHostWaitPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitPatchArgs': 'ClickHouseInstallationSpecReconcileHostWaitPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitProbesPatchArgsDict': 'ClickHouseInstallationSpecReconcileHostWaitProbesPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitProbesPatchArgs': 'ClickHouseInstallationSpecReconcileHostWaitProbesPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitProbesArgsDict': 'ClickHouseInstallationSpecReconcileHostWaitProbesArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitProbesArgs': 'ClickHouseInstallationSpecReconcileHostWaitProbesArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitReplicasPatchArgsDict': 'ClickHouseInstallationSpecReconcileHostWaitReplicasPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitReplicasPatchArgs': 'ClickHouseInstallationSpecReconcileHostWaitReplicasPatchArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitReplicasArgsDict': 'ClickHouseInstallationSpecReconcileHostWaitReplicasArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitReplicasArgs': 'ClickHouseInstallationSpecReconcileHostWaitReplicasArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitArgsDict': 'ClickHouseInstallationSpecReconcileHostWaitArgs',
+    'ClickHouseInstallationSpecReconcileHostWaitArgs': 'ClickHouseInstallationSpecReconcileHostWaitArgs',
+    'ClickHouseInstallationSpecReconcileHostArgsDict': 'ClickHouseInstallationSpecReconcileHostArgs',
+    'ClickHouseInstallationSpecReconcileHostArgs': 'ClickHouseInstallationSpecReconcileHostArgs',
+    'ClickHouseInstallationSpecReconcileMacrosPatchArgsDict': 'ClickHouseInstallationSpecReconcileMacrosPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosPatchArgs': 'ClickHouseInstallationSpecReconcileMacrosPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatchArgsDict': 'ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatchArgs': 'ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsFilesArgsDict': 'ClickHouseInstallationSpecReconcileMacrosSectionsFilesArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsFilesArgs': 'ClickHouseInstallationSpecReconcileMacrosSectionsFilesArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsPatchArgsDict': 'ClickHouseInstallationSpecReconcileMacrosSectionsPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsPatchArgs': 'ClickHouseInstallationSpecReconcileMacrosSectionsPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatchArgsDict': 'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatchArgs': 'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesArgsDict': 'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesArgs': 'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatchArgsDict': 'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatchArgs': 'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasArgsDict': 'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasArgs': 'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatchArgsDict': 'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatchArgs': 'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsArgsDict': 'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsArgs': 'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatchArgsDict': 'ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatchArgs': 'ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatchArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsUsersArgsDict': 'ClickHouseInstallationSpecReconcileMacrosSectionsUsersArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsUsersArgs': 'ClickHouseInstallationSpecReconcileMacrosSectionsUsersArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsArgsDict': 'ClickHouseInstallationSpecReconcileMacrosSectionsArgs',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsArgs': 'ClickHouseInstallationSpecReconcileMacrosSectionsArgs',
+    'ClickHouseInstallationSpecReconcileMacrosArgsDict': 'ClickHouseInstallationSpecReconcileMacrosArgs',
+    'ClickHouseInstallationSpecReconcileMacrosArgs': 'ClickHouseInstallationSpecReconcileMacrosArgs',
+    'ClickHouseInstallationSpecReconcilePatchArgsDict': 'ClickHouseInstallationSpecReconcilePatchArgs',
+    'ClickHouseInstallationSpecReconcilePatchArgs': 'ClickHouseInstallationSpecReconcilePatchArgs',
+    'ClickHouseInstallationSpecReconcileRuntimePatchArgsDict': 'ClickHouseInstallationSpecReconcileRuntimePatchArgs',
+    'ClickHouseInstallationSpecReconcileRuntimePatchArgs': 'ClickHouseInstallationSpecReconcileRuntimePatchArgs',
+    'ClickHouseInstallationSpecReconcileRuntimeArgsDict': 'ClickHouseInstallationSpecReconcileRuntimeArgs',
+    'ClickHouseInstallationSpecReconcileRuntimeArgs': 'ClickHouseInstallationSpecReconcileRuntimeArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetCreatePatchArgsDict': 'ClickHouseInstallationSpecReconcileStatefulSetCreatePatchArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetCreatePatchArgs': 'ClickHouseInstallationSpecReconcileStatefulSetCreatePatchArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetCreateArgsDict': 'ClickHouseInstallationSpecReconcileStatefulSetCreateArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetCreateArgs': 'ClickHouseInstallationSpecReconcileStatefulSetCreateArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetPatchArgsDict': 'ClickHouseInstallationSpecReconcileStatefulSetPatchArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetPatchArgs': 'ClickHouseInstallationSpecReconcileStatefulSetPatchArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetRecreatePatchArgsDict': 'ClickHouseInstallationSpecReconcileStatefulSetRecreatePatchArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetRecreatePatchArgs': 'ClickHouseInstallationSpecReconcileStatefulSetRecreatePatchArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetRecreateArgsDict': 'ClickHouseInstallationSpecReconcileStatefulSetRecreateArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetRecreateArgs': 'ClickHouseInstallationSpecReconcileStatefulSetRecreateArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetUpdatePatchArgsDict': 'ClickHouseInstallationSpecReconcileStatefulSetUpdatePatchArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetUpdatePatchArgs': 'ClickHouseInstallationSpecReconcileStatefulSetUpdatePatchArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetUpdateArgsDict': 'ClickHouseInstallationSpecReconcileStatefulSetUpdateArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetUpdateArgs': 'ClickHouseInstallationSpecReconcileStatefulSetUpdateArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetArgsDict': 'ClickHouseInstallationSpecReconcileStatefulSetArgs',
+    'ClickHouseInstallationSpecReconcileStatefulSetArgs': 'ClickHouseInstallationSpecReconcileStatefulSetArgs',
+    'ClickHouseInstallationSpecReconcileArgsDict': 'ClickHouseInstallationSpecReconcileArgs',
+    'ClickHouseInstallationSpecReconcileArgs': 'ClickHouseInstallationSpecReconcileArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupPatchArgsDict': 'ClickHouseInstallationSpecReconcilingCleanupPatchArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupPatchArgs': 'ClickHouseInstallationSpecReconcilingCleanupPatchArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatchArgsDict': 'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatchArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatchArgs': 'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatchArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsArgsDict': 'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsArgs': 'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatchArgsDict': 'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatchArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatchArgs': 'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatchArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsArgsDict': 'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsArgs': 'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupArgsDict': 'ClickHouseInstallationSpecReconcilingCleanupArgs',
+    'ClickHouseInstallationSpecReconcilingCleanupArgs': 'ClickHouseInstallationSpecReconcilingCleanupArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPatchArgsDict': 'ClickHouseInstallationSpecReconcilingClusterHooksPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPatchArgs': 'ClickHouseInstallationSpecReconcilingClusterHooksPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpPatchArgsDict': 'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpPatchArgs': 'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpArgsDict': 'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpArgs': 'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostPatchArgsDict': 'ClickHouseInstallationSpecReconcilingClusterHooksPostPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostPatchArgs': 'ClickHouseInstallationSpecReconcilingClusterHooksPostPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostShellPatchArgsDict': 'ClickHouseInstallationSpecReconcilingClusterHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostShellPatchArgs': 'ClickHouseInstallationSpecReconcilingClusterHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostShellArgsDict': 'ClickHouseInstallationSpecReconcilingClusterHooksPostShellArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostShellArgs': 'ClickHouseInstallationSpecReconcilingClusterHooksPostShellArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlPatchArgsDict': 'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlPatchArgs': 'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlArgsDict': 'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlArgs': 'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostArgsDict': 'ClickHouseInstallationSpecReconcilingClusterHooksPostArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostArgs': 'ClickHouseInstallationSpecReconcilingClusterHooksPostArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpPatchArgsDict': 'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpPatchArgs': 'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpArgsDict': 'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpArgs': 'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPrePatchArgsDict': 'ClickHouseInstallationSpecReconcilingClusterHooksPrePatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPrePatchArgs': 'ClickHouseInstallationSpecReconcilingClusterHooksPrePatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreShellPatchArgsDict': 'ClickHouseInstallationSpecReconcilingClusterHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreShellPatchArgs': 'ClickHouseInstallationSpecReconcilingClusterHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreShellArgsDict': 'ClickHouseInstallationSpecReconcilingClusterHooksPreShellArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreShellArgs': 'ClickHouseInstallationSpecReconcilingClusterHooksPreShellArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlPatchArgsDict': 'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlPatchArgs': 'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlArgsDict': 'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlArgs': 'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreArgsDict': 'ClickHouseInstallationSpecReconcilingClusterHooksPreArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreArgs': 'ClickHouseInstallationSpecReconcilingClusterHooksPreArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksArgsDict': 'ClickHouseInstallationSpecReconcilingClusterHooksArgs',
+    'ClickHouseInstallationSpecReconcilingClusterHooksArgs': 'ClickHouseInstallationSpecReconcilingClusterHooksArgs',
+    'ClickHouseInstallationSpecReconcilingClusterPatchArgsDict': 'ClickHouseInstallationSpecReconcilingClusterPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterPatchArgs': 'ClickHouseInstallationSpecReconcilingClusterPatchArgs',
+    'ClickHouseInstallationSpecReconcilingClusterArgsDict': 'ClickHouseInstallationSpecReconcilingClusterArgs',
+    'ClickHouseInstallationSpecReconcilingClusterArgs': 'ClickHouseInstallationSpecReconcilingClusterArgs',
+    'ClickHouseInstallationSpecReconcilingHostDropPatchArgsDict': 'ClickHouseInstallationSpecReconcilingHostDropPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostDropPatchArgs': 'ClickHouseInstallationSpecReconcilingHostDropPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostDropReplicasPatchArgsDict': 'ClickHouseInstallationSpecReconcilingHostDropReplicasPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostDropReplicasPatchArgs': 'ClickHouseInstallationSpecReconcilingHostDropReplicasPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostDropReplicasArgsDict': 'ClickHouseInstallationSpecReconcilingHostDropReplicasArgs',
+    'ClickHouseInstallationSpecReconcilingHostDropReplicasArgs': 'ClickHouseInstallationSpecReconcilingHostDropReplicasArgs',
+    'ClickHouseInstallationSpecReconcilingHostDropArgsDict': 'ClickHouseInstallationSpecReconcilingHostDropArgs',
+    'ClickHouseInstallationSpecReconcilingHostDropArgs': 'ClickHouseInstallationSpecReconcilingHostDropArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPatchArgsDict': 'ClickHouseInstallationSpecReconcilingHostHooksPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPatchArgs': 'ClickHouseInstallationSpecReconcilingHostHooksPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostHttpPatchArgsDict': 'ClickHouseInstallationSpecReconcilingHostHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostHttpPatchArgs': 'ClickHouseInstallationSpecReconcilingHostHooksPostHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostHttpArgsDict': 'ClickHouseInstallationSpecReconcilingHostHooksPostHttpArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostHttpArgs': 'ClickHouseInstallationSpecReconcilingHostHooksPostHttpArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostPatchArgsDict': 'ClickHouseInstallationSpecReconcilingHostHooksPostPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostPatchArgs': 'ClickHouseInstallationSpecReconcilingHostHooksPostPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostShellPatchArgsDict': 'ClickHouseInstallationSpecReconcilingHostHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostShellPatchArgs': 'ClickHouseInstallationSpecReconcilingHostHooksPostShellPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostShellArgsDict': 'ClickHouseInstallationSpecReconcilingHostHooksPostShellArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostShellArgs': 'ClickHouseInstallationSpecReconcilingHostHooksPostShellArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostSqlPatchArgsDict': 'ClickHouseInstallationSpecReconcilingHostHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostSqlPatchArgs': 'ClickHouseInstallationSpecReconcilingHostHooksPostSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostSqlArgsDict': 'ClickHouseInstallationSpecReconcilingHostHooksPostSqlArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostSqlArgs': 'ClickHouseInstallationSpecReconcilingHostHooksPostSqlArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostArgsDict': 'ClickHouseInstallationSpecReconcilingHostHooksPostArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostArgs': 'ClickHouseInstallationSpecReconcilingHostHooksPostArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreHttpPatchArgsDict': 'ClickHouseInstallationSpecReconcilingHostHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreHttpPatchArgs': 'ClickHouseInstallationSpecReconcilingHostHooksPreHttpPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreHttpArgsDict': 'ClickHouseInstallationSpecReconcilingHostHooksPreHttpArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreHttpArgs': 'ClickHouseInstallationSpecReconcilingHostHooksPreHttpArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPrePatchArgsDict': 'ClickHouseInstallationSpecReconcilingHostHooksPrePatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPrePatchArgs': 'ClickHouseInstallationSpecReconcilingHostHooksPrePatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreShellPatchArgsDict': 'ClickHouseInstallationSpecReconcilingHostHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreShellPatchArgs': 'ClickHouseInstallationSpecReconcilingHostHooksPreShellPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreShellArgsDict': 'ClickHouseInstallationSpecReconcilingHostHooksPreShellArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreShellArgs': 'ClickHouseInstallationSpecReconcilingHostHooksPreShellArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreSqlPatchArgsDict': 'ClickHouseInstallationSpecReconcilingHostHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreSqlPatchArgs': 'ClickHouseInstallationSpecReconcilingHostHooksPreSqlPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreSqlArgsDict': 'ClickHouseInstallationSpecReconcilingHostHooksPreSqlArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreSqlArgs': 'ClickHouseInstallationSpecReconcilingHostHooksPreSqlArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreArgsDict': 'ClickHouseInstallationSpecReconcilingHostHooksPreArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreArgs': 'ClickHouseInstallationSpecReconcilingHostHooksPreArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksArgsDict': 'ClickHouseInstallationSpecReconcilingHostHooksArgs',
+    'ClickHouseInstallationSpecReconcilingHostHooksArgs': 'ClickHouseInstallationSpecReconcilingHostHooksArgs',
+    'ClickHouseInstallationSpecReconcilingHostPatchArgsDict': 'ClickHouseInstallationSpecReconcilingHostPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostPatchArgs': 'ClickHouseInstallationSpecReconcilingHostPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitPatchArgsDict': 'ClickHouseInstallationSpecReconcilingHostWaitPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitPatchArgs': 'ClickHouseInstallationSpecReconcilingHostWaitPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitProbesPatchArgsDict': 'ClickHouseInstallationSpecReconcilingHostWaitProbesPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitProbesPatchArgs': 'ClickHouseInstallationSpecReconcilingHostWaitProbesPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitProbesArgsDict': 'ClickHouseInstallationSpecReconcilingHostWaitProbesArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitProbesArgs': 'ClickHouseInstallationSpecReconcilingHostWaitProbesArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitReplicasPatchArgsDict': 'ClickHouseInstallationSpecReconcilingHostWaitReplicasPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitReplicasPatchArgs': 'ClickHouseInstallationSpecReconcilingHostWaitReplicasPatchArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitReplicasArgsDict': 'ClickHouseInstallationSpecReconcilingHostWaitReplicasArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitReplicasArgs': 'ClickHouseInstallationSpecReconcilingHostWaitReplicasArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitArgsDict': 'ClickHouseInstallationSpecReconcilingHostWaitArgs',
+    'ClickHouseInstallationSpecReconcilingHostWaitArgs': 'ClickHouseInstallationSpecReconcilingHostWaitArgs',
+    'ClickHouseInstallationSpecReconcilingHostArgsDict': 'ClickHouseInstallationSpecReconcilingHostArgs',
+    'ClickHouseInstallationSpecReconcilingHostArgs': 'ClickHouseInstallationSpecReconcilingHostArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosPatchArgsDict': 'ClickHouseInstallationSpecReconcilingMacrosPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosPatchArgs': 'ClickHouseInstallationSpecReconcilingMacrosPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatchArgsDict': 'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatchArgs': 'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesArgsDict': 'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesArgs': 'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsPatchArgsDict': 'ClickHouseInstallationSpecReconcilingMacrosSectionsPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsPatchArgs': 'ClickHouseInstallationSpecReconcilingMacrosSectionsPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatchArgsDict': 'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatchArgs': 'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesArgsDict': 'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesArgs': 'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatchArgsDict': 'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatchArgs': 'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasArgsDict': 'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasArgs': 'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatchArgsDict': 'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatchArgs': 'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsArgsDict': 'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsArgs': 'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatchArgsDict': 'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatchArgs': 'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatchArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersArgsDict': 'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersArgs': 'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsArgsDict': 'ClickHouseInstallationSpecReconcilingMacrosSectionsArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsArgs': 'ClickHouseInstallationSpecReconcilingMacrosSectionsArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosArgsDict': 'ClickHouseInstallationSpecReconcilingMacrosArgs',
+    'ClickHouseInstallationSpecReconcilingMacrosArgs': 'ClickHouseInstallationSpecReconcilingMacrosArgs',
+    'ClickHouseInstallationSpecReconcilingPatchArgsDict': 'ClickHouseInstallationSpecReconcilingPatchArgs',
+    'ClickHouseInstallationSpecReconcilingPatchArgs': 'ClickHouseInstallationSpecReconcilingPatchArgs',
+    'ClickHouseInstallationSpecReconcilingRuntimePatchArgsDict': 'ClickHouseInstallationSpecReconcilingRuntimePatchArgs',
+    'ClickHouseInstallationSpecReconcilingRuntimePatchArgs': 'ClickHouseInstallationSpecReconcilingRuntimePatchArgs',
+    'ClickHouseInstallationSpecReconcilingRuntimeArgsDict': 'ClickHouseInstallationSpecReconcilingRuntimeArgs',
+    'ClickHouseInstallationSpecReconcilingRuntimeArgs': 'ClickHouseInstallationSpecReconcilingRuntimeArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetCreatePatchArgsDict': 'ClickHouseInstallationSpecReconcilingStatefulSetCreatePatchArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetCreatePatchArgs': 'ClickHouseInstallationSpecReconcilingStatefulSetCreatePatchArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetCreateArgsDict': 'ClickHouseInstallationSpecReconcilingStatefulSetCreateArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetCreateArgs': 'ClickHouseInstallationSpecReconcilingStatefulSetCreateArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetPatchArgsDict': 'ClickHouseInstallationSpecReconcilingStatefulSetPatchArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetPatchArgs': 'ClickHouseInstallationSpecReconcilingStatefulSetPatchArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatchArgsDict': 'ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatchArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatchArgs': 'ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatchArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetRecreateArgsDict': 'ClickHouseInstallationSpecReconcilingStatefulSetRecreateArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetRecreateArgs': 'ClickHouseInstallationSpecReconcilingStatefulSetRecreateArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatchArgsDict': 'ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatchArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatchArgs': 'ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatchArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetUpdateArgsDict': 'ClickHouseInstallationSpecReconcilingStatefulSetUpdateArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetUpdateArgs': 'ClickHouseInstallationSpecReconcilingStatefulSetUpdateArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetArgsDict': 'ClickHouseInstallationSpecReconcilingStatefulSetArgs',
+    'ClickHouseInstallationSpecReconcilingStatefulSetArgs': 'ClickHouseInstallationSpecReconcilingStatefulSetArgs',
+    'ClickHouseInstallationSpecReconcilingArgsDict': 'ClickHouseInstallationSpecReconcilingArgs',
+    'ClickHouseInstallationSpecReconcilingArgs': 'ClickHouseInstallationSpecReconcilingArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPatchArgsDict': 'ClickHouseInstallationSpecTemplatesHostTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPatchArgs': 'ClickHouseInstallationSpecTemplatesHostTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatchArgsDict': 'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatchArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatchArgs': 'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatchArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionArgsDict': 'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionArgs': 'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatchArgsDict': 'ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatchArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatchArgs': 'ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatchArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatchArgsDict': 'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatchArgs': 'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesArgsDict': 'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesArgs': 'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecArgsDict': 'ClickHouseInstallationSpecTemplatesHostTemplatesSpecArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecArgs': 'ClickHouseInstallationSpecTemplatesHostTemplatesSpecArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesArgsDict': 'ClickHouseInstallationSpecTemplatesHostTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesArgs': 'ClickHouseInstallationSpecTemplatesHostTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesPatchArgsDict': 'ClickHouseInstallationSpecTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesPatchArgs': 'ClickHouseInstallationSpecTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPatchArgsDict': 'ClickHouseInstallationSpecTemplatesPodTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPatchArgs': 'ClickHouseInstallationSpecTemplatesPodTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatchArgsDict': 'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatchArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatchArgs': 'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatchArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionArgsDict': 'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionArgs': 'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesZonePatchArgsDict': 'ClickHouseInstallationSpecTemplatesPodTemplatesZonePatchArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesZonePatchArgs': 'ClickHouseInstallationSpecTemplatesPodTemplatesZonePatchArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesZoneArgsDict': 'ClickHouseInstallationSpecTemplatesPodTemplatesZoneArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesZoneArgs': 'ClickHouseInstallationSpecTemplatesPodTemplatesZoneArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesArgsDict': 'ClickHouseInstallationSpecTemplatesPodTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesArgs': 'ClickHouseInstallationSpecTemplatesPodTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesServiceTemplatesPatchArgsDict': 'ClickHouseInstallationSpecTemplatesServiceTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesServiceTemplatesPatchArgs': 'ClickHouseInstallationSpecTemplatesServiceTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesServiceTemplatesArgsDict': 'ClickHouseInstallationSpecTemplatesServiceTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesServiceTemplatesArgs': 'ClickHouseInstallationSpecTemplatesServiceTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatchArgsDict': 'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatchArgs': 'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatchArgs',
+    'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgsDict': 'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgs': 'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesArgsDict': 'ClickHouseInstallationSpecTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatesArgs': 'ClickHouseInstallationSpecTemplatesArgs',
+    'ClickHouseInstallationSpecTemplatingPatchArgsDict': 'ClickHouseInstallationSpecTemplatingPatchArgs',
+    'ClickHouseInstallationSpecTemplatingPatchArgs': 'ClickHouseInstallationSpecTemplatingPatchArgs',
+    'ClickHouseInstallationSpecTemplatingArgsDict': 'ClickHouseInstallationSpecTemplatingArgs',
+    'ClickHouseInstallationSpecTemplatingArgs': 'ClickHouseInstallationSpecTemplatingArgs',
+    'ClickHouseInstallationSpecUseTemplatesPatchArgsDict': 'ClickHouseInstallationSpecUseTemplatesPatchArgs',
+    'ClickHouseInstallationSpecUseTemplatesPatchArgs': 'ClickHouseInstallationSpecUseTemplatesPatchArgs',
+    'ClickHouseInstallationSpecUseTemplatesArgsDict': 'ClickHouseInstallationSpecUseTemplatesArgs',
+    'ClickHouseInstallationSpecUseTemplatesArgs': 'ClickHouseInstallationSpecUseTemplatesArgs',
+    'ClickHouseInstallationSpecArgsDict': 'ClickHouseInstallationSpecArgs',
+    'ClickHouseInstallationSpecArgs': 'ClickHouseInstallationSpecArgs',
+    'ClickHouseInstallationStatusArgsDict': 'ClickHouseInstallationStatusArgs',
+    'ClickHouseInstallationStatusArgs': 'ClickHouseInstallationStatusArgs',
+    'ClickHouseInstallationArgsDict': 'ClickHouseInstallationArgs',
+    'ClickHouseInstallationArgs': 'ClickHouseInstallationArgs',
+}
+
+if typing.TYPE_CHECKING:
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutReplicasArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutShardsArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostDropArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcilePatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileRuntimeArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersSchemaPolicyPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersSchemaPolicyArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersSecretPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersSecretValueFromArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersSecretArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersTemplatesPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersTemplatesArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersZookeeperNodesArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersZookeeperPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersZookeeperArgs import *
+    from .ClickHouseInstallationSpecConfigurationClustersArgs import *
+    from .ClickHouseInstallationSpecConfigurationPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationZookeeperKeeperPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationZookeeperKeeperArgs import *
+    from .ClickHouseInstallationSpecConfigurationZookeeperNodesPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationZookeeperNodesArgs import *
+    from .ClickHouseInstallationSpecConfigurationZookeeperPatchArgs import *
+    from .ClickHouseInstallationSpecConfigurationZookeeperArgs import *
+    from .ClickHouseInstallationSpecConfigurationArgs import *
+    from .ClickHouseInstallationSpecDefaultsDistributedDDLPatchArgs import *
+    from .ClickHouseInstallationSpecDefaultsDistributedDDLArgs import *
+    from .ClickHouseInstallationSpecDefaultsPatchArgs import *
+    from .ClickHouseInstallationSpecDefaultsStorageManagementPatchArgs import *
+    from .ClickHouseInstallationSpecDefaultsStorageManagementArgs import *
+    from .ClickHouseInstallationSpecDefaultsTemplatesPatchArgs import *
+    from .ClickHouseInstallationSpecDefaultsTemplatesArgs import *
+    from .ClickHouseInstallationSpecDefaultsArgs import *
+    from .ClickHouseInstallationSpecPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileCleanupPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsArgs import *
+    from .ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileCleanupUnknownObjectsArgs import *
+    from .ClickHouseInstallationSpecReconcileCleanupArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPostHttpPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPostHttpArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPostPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPostShellPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPostShellArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPostSqlPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPostSqlArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPostArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPreHttpPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPreHttpArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPrePatchArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPreShellPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPreShellArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPreSqlPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPreSqlArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPreArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileClusterArgs import *
+    from .ClickHouseInstallationSpecReconcileHostDropPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileHostDropReplicasPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileHostDropReplicasArgs import *
+    from .ClickHouseInstallationSpecReconcileHostDropArgs import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPostHttpPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPostHttpArgs import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPostPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPostShellPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPostShellArgs import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPostSqlPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPostSqlArgs import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPostArgs import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPreHttpPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPreHttpArgs import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPrePatchArgs import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPreShellPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPreShellArgs import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPreSqlPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPreSqlArgs import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPreArgs import *
+    from .ClickHouseInstallationSpecReconcileHostHooksArgs import *
+    from .ClickHouseInstallationSpecReconcileHostPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileHostWaitPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileHostWaitProbesPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileHostWaitProbesArgs import *
+    from .ClickHouseInstallationSpecReconcileHostWaitReplicasPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileHostWaitReplicasArgs import *
+    from .ClickHouseInstallationSpecReconcileHostWaitArgs import *
+    from .ClickHouseInstallationSpecReconcileHostArgs import *
+    from .ClickHouseInstallationSpecReconcileMacrosPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsFilesArgs import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsProfilesArgs import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsQuotasArgs import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsSettingsArgs import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsUsersArgs import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsArgs import *
+    from .ClickHouseInstallationSpecReconcileMacrosArgs import *
+    from .ClickHouseInstallationSpecReconcilePatchArgs import *
+    from .ClickHouseInstallationSpecReconcileRuntimePatchArgs import *
+    from .ClickHouseInstallationSpecReconcileRuntimeArgs import *
+    from .ClickHouseInstallationSpecReconcileStatefulSetCreatePatchArgs import *
+    from .ClickHouseInstallationSpecReconcileStatefulSetCreateArgs import *
+    from .ClickHouseInstallationSpecReconcileStatefulSetPatchArgs import *
+    from .ClickHouseInstallationSpecReconcileStatefulSetRecreatePatchArgs import *
+    from .ClickHouseInstallationSpecReconcileStatefulSetRecreateArgs import *
+    from .ClickHouseInstallationSpecReconcileStatefulSetUpdatePatchArgs import *
+    from .ClickHouseInstallationSpecReconcileStatefulSetUpdateArgs import *
+    from .ClickHouseInstallationSpecReconcileStatefulSetArgs import *
+    from .ClickHouseInstallationSpecReconcileArgs import *
+    from .ClickHouseInstallationSpecReconcilingCleanupPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsArgs import *
+    from .ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsArgs import *
+    from .ClickHouseInstallationSpecReconcilingCleanupArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPostHttpPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPostHttpArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPostPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPostShellPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPostShellArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPostSqlPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPostSqlArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPostArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPreHttpPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPreHttpArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPrePatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPreShellPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPreShellArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPreSqlPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPreSqlArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPreArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingClusterArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostDropPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostDropReplicasPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostDropReplicasArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostDropArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPostHttpPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPostHttpArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPostPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPostShellPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPostShellArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPostSqlPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPostSqlArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPostArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPreHttpPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPreHttpArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPrePatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPreShellPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPreShellArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPreSqlPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPreSqlArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPreArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostWaitPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostWaitProbesPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostWaitProbesArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostWaitReplicasPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostWaitReplicasArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostWaitArgs import *
+    from .ClickHouseInstallationSpecReconcilingHostArgs import *
+    from .ClickHouseInstallationSpecReconcilingMacrosPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsFilesArgs import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesArgs import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasArgs import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsArgs import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsUsersArgs import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsArgs import *
+    from .ClickHouseInstallationSpecReconcilingMacrosArgs import *
+    from .ClickHouseInstallationSpecReconcilingPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingRuntimePatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingRuntimeArgs import *
+    from .ClickHouseInstallationSpecReconcilingStatefulSetCreatePatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingStatefulSetCreateArgs import *
+    from .ClickHouseInstallationSpecReconcilingStatefulSetPatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingStatefulSetRecreateArgs import *
+    from .ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatchArgs import *
+    from .ClickHouseInstallationSpecReconcilingStatefulSetUpdateArgs import *
+    from .ClickHouseInstallationSpecReconcilingStatefulSetArgs import *
+    from .ClickHouseInstallationSpecReconcilingArgs import *
+    from .ClickHouseInstallationSpecTemplatesHostTemplatesPatchArgs import *
+    from .ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatchArgs import *
+    from .ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionArgs import *
+    from .ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatchArgs import *
+    from .ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatchArgs import *
+    from .ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesArgs import *
+    from .ClickHouseInstallationSpecTemplatesHostTemplatesSpecArgs import *
+    from .ClickHouseInstallationSpecTemplatesHostTemplatesArgs import *
+    from .ClickHouseInstallationSpecTemplatesPatchArgs import *
+    from .ClickHouseInstallationSpecTemplatesPodTemplatesPatchArgs import *
+    from .ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatchArgs import *
+    from .ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionArgs import *
+    from .ClickHouseInstallationSpecTemplatesPodTemplatesZonePatchArgs import *
+    from .ClickHouseInstallationSpecTemplatesPodTemplatesZoneArgs import *
+    from .ClickHouseInstallationSpecTemplatesPodTemplatesArgs import *
+    from .ClickHouseInstallationSpecTemplatesServiceTemplatesPatchArgs import *
+    from .ClickHouseInstallationSpecTemplatesServiceTemplatesArgs import *
+    from .ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatchArgs import *
+    from .ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgs import *
+    from .ClickHouseInstallationSpecTemplatesArgs import *
+    from .ClickHouseInstallationSpecTemplatingPatchArgs import *
+    from .ClickHouseInstallationSpecTemplatingArgs import *
+    from .ClickHouseInstallationSpecUseTemplatesPatchArgs import *
+    from .ClickHouseInstallationSpecUseTemplatesArgs import *
+    from .ClickHouseInstallationSpecArgs import *
+    from .ClickHouseInstallationStatusArgs import *
+    from .ClickHouseInstallationArgs import *
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _TYPE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,19221 +0,0 @@
-# coding=utf-8
-# *** WARNING: this file was generated by crd2pulumi. ***
-# *** Do not edit by hand unless you're certain you know what you are doing! ***
-
-import builtins as _builtins
-import warnings
-import sys
-import pulumi
-import pulumi.runtime
-from typing import Any, Mapping, Optional, Sequence, Union, overload
-if sys.version_info >= (3, 11):
-    from typing import NotRequired, TypedDict, TypeAlias
-else:
-    from typing_extensions import NotRequired, TypedDict, TypeAlias
-from ... import _utilities
-from . import outputs
-from ... import meta as _meta
-
-__all__ = [
-    'ClickHouseInstallation',
-    'ClickHouseInstallationSpec',
-    'ClickHouseInstallationSpecConfiguration',
-    'ClickHouseInstallationSpecConfigurationClusters',
-    'ClickHouseInstallationSpecConfigurationClustersLayout',
-    'ClickHouseInstallationSpecConfigurationClustersLayoutPatch',
-    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicas',
-    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatch',
-    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShards',
-    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatch',
-    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplates',
-    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatch',
-    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplates',
-    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatch',
-    'ClickHouseInstallationSpecConfigurationClustersLayoutShards',
-    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatch',
-    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicas',
-    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatch',
-    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplates',
-    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatch',
-    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplates',
-    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatch',
-    'ClickHouseInstallationSpecConfigurationClustersPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcile',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHooks',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPost',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttp',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShell',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSql',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPre',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttp',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShell',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSql',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHost',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDrop',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicas',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooks',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPost',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttp',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShell',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSql',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPre',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttp',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShell',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSql',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWait',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbes',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicas',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcilePatch',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileRuntime',
-    'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatch',
-    'ClickHouseInstallationSpecConfigurationClustersSchemaPolicy',
-    'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyPatch',
-    'ClickHouseInstallationSpecConfigurationClustersSecret',
-    'ClickHouseInstallationSpecConfigurationClustersSecretPatch',
-    'ClickHouseInstallationSpecConfigurationClustersSecretValueFrom',
-    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatch',
-    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRef',
-    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatch',
-    'ClickHouseInstallationSpecConfigurationClustersTemplates',
-    'ClickHouseInstallationSpecConfigurationClustersTemplatesPatch',
-    'ClickHouseInstallationSpecConfigurationClustersZookeeper',
-    'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeper',
-    'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatch',
-    'ClickHouseInstallationSpecConfigurationClustersZookeeperNodes',
-    'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatch',
-    'ClickHouseInstallationSpecConfigurationClustersZookeeperPatch',
-    'ClickHouseInstallationSpecConfigurationPatch',
-    'ClickHouseInstallationSpecConfigurationZookeeper',
-    'ClickHouseInstallationSpecConfigurationZookeeperKeeper',
-    'ClickHouseInstallationSpecConfigurationZookeeperKeeperPatch',
-    'ClickHouseInstallationSpecConfigurationZookeeperNodes',
-    'ClickHouseInstallationSpecConfigurationZookeeperNodesPatch',
-    'ClickHouseInstallationSpecConfigurationZookeeperPatch',
-    'ClickHouseInstallationSpecDefaults',
-    'ClickHouseInstallationSpecDefaultsDistributedDDL',
-    'ClickHouseInstallationSpecDefaultsDistributedDDLPatch',
-    'ClickHouseInstallationSpecDefaultsPatch',
-    'ClickHouseInstallationSpecDefaultsStorageManagement',
-    'ClickHouseInstallationSpecDefaultsStorageManagementPatch',
-    'ClickHouseInstallationSpecDefaultsTemplates',
-    'ClickHouseInstallationSpecDefaultsTemplatesPatch',
-    'ClickHouseInstallationSpecPatch',
-    'ClickHouseInstallationSpecReconcile',
-    'ClickHouseInstallationSpecReconcileCleanup',
-    'ClickHouseInstallationSpecReconcileCleanupPatch',
-    'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjects',
-    'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatch',
-    'ClickHouseInstallationSpecReconcileCleanupUnknownObjects',
-    'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatch',
-    'ClickHouseInstallationSpecReconcileCluster',
-    'ClickHouseInstallationSpecReconcileClusterHooks',
-    'ClickHouseInstallationSpecReconcileClusterHooksPatch',
-    'ClickHouseInstallationSpecReconcileClusterHooksPost',
-    'ClickHouseInstallationSpecReconcileClusterHooksPostHttp',
-    'ClickHouseInstallationSpecReconcileClusterHooksPostHttpPatch',
-    'ClickHouseInstallationSpecReconcileClusterHooksPostPatch',
-    'ClickHouseInstallationSpecReconcileClusterHooksPostShell',
-    'ClickHouseInstallationSpecReconcileClusterHooksPostShellPatch',
-    'ClickHouseInstallationSpecReconcileClusterHooksPostSql',
-    'ClickHouseInstallationSpecReconcileClusterHooksPostSqlPatch',
-    'ClickHouseInstallationSpecReconcileClusterHooksPre',
-    'ClickHouseInstallationSpecReconcileClusterHooksPreHttp',
-    'ClickHouseInstallationSpecReconcileClusterHooksPreHttpPatch',
-    'ClickHouseInstallationSpecReconcileClusterHooksPrePatch',
-    'ClickHouseInstallationSpecReconcileClusterHooksPreShell',
-    'ClickHouseInstallationSpecReconcileClusterHooksPreShellPatch',
-    'ClickHouseInstallationSpecReconcileClusterHooksPreSql',
-    'ClickHouseInstallationSpecReconcileClusterHooksPreSqlPatch',
-    'ClickHouseInstallationSpecReconcileClusterPatch',
-    'ClickHouseInstallationSpecReconcileHost',
-    'ClickHouseInstallationSpecReconcileHostDrop',
-    'ClickHouseInstallationSpecReconcileHostDropPatch',
-    'ClickHouseInstallationSpecReconcileHostDropReplicas',
-    'ClickHouseInstallationSpecReconcileHostDropReplicasPatch',
-    'ClickHouseInstallationSpecReconcileHostHooks',
-    'ClickHouseInstallationSpecReconcileHostHooksPatch',
-    'ClickHouseInstallationSpecReconcileHostHooksPost',
-    'ClickHouseInstallationSpecReconcileHostHooksPostHttp',
-    'ClickHouseInstallationSpecReconcileHostHooksPostHttpPatch',
-    'ClickHouseInstallationSpecReconcileHostHooksPostPatch',
-    'ClickHouseInstallationSpecReconcileHostHooksPostShell',
-    'ClickHouseInstallationSpecReconcileHostHooksPostShellPatch',
-    'ClickHouseInstallationSpecReconcileHostHooksPostSql',
-    'ClickHouseInstallationSpecReconcileHostHooksPostSqlPatch',
-    'ClickHouseInstallationSpecReconcileHostHooksPre',
-    'ClickHouseInstallationSpecReconcileHostHooksPreHttp',
-    'ClickHouseInstallationSpecReconcileHostHooksPreHttpPatch',
-    'ClickHouseInstallationSpecReconcileHostHooksPrePatch',
-    'ClickHouseInstallationSpecReconcileHostHooksPreShell',
-    'ClickHouseInstallationSpecReconcileHostHooksPreShellPatch',
-    'ClickHouseInstallationSpecReconcileHostHooksPreSql',
-    'ClickHouseInstallationSpecReconcileHostHooksPreSqlPatch',
-    'ClickHouseInstallationSpecReconcileHostPatch',
-    'ClickHouseInstallationSpecReconcileHostWait',
-    'ClickHouseInstallationSpecReconcileHostWaitPatch',
-    'ClickHouseInstallationSpecReconcileHostWaitProbes',
-    'ClickHouseInstallationSpecReconcileHostWaitProbesPatch',
-    'ClickHouseInstallationSpecReconcileHostWaitReplicas',
-    'ClickHouseInstallationSpecReconcileHostWaitReplicasPatch',
-    'ClickHouseInstallationSpecReconcileMacros',
-    'ClickHouseInstallationSpecReconcileMacrosPatch',
-    'ClickHouseInstallationSpecReconcileMacrosSections',
-    'ClickHouseInstallationSpecReconcileMacrosSectionsFiles',
-    'ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatch',
-    'ClickHouseInstallationSpecReconcileMacrosSectionsPatch',
-    'ClickHouseInstallationSpecReconcileMacrosSectionsProfiles',
-    'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatch',
-    'ClickHouseInstallationSpecReconcileMacrosSectionsQuotas',
-    'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatch',
-    'ClickHouseInstallationSpecReconcileMacrosSectionsSettings',
-    'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatch',
-    'ClickHouseInstallationSpecReconcileMacrosSectionsUsers',
-    'ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatch',
-    'ClickHouseInstallationSpecReconcilePatch',
-    'ClickHouseInstallationSpecReconcileRuntime',
-    'ClickHouseInstallationSpecReconcileRuntimePatch',
-    'ClickHouseInstallationSpecReconcileStatefulSet',
-    'ClickHouseInstallationSpecReconcileStatefulSetCreate',
-    'ClickHouseInstallationSpecReconcileStatefulSetCreatePatch',
-    'ClickHouseInstallationSpecReconcileStatefulSetPatch',
-    'ClickHouseInstallationSpecReconcileStatefulSetRecreate',
-    'ClickHouseInstallationSpecReconcileStatefulSetRecreatePatch',
-    'ClickHouseInstallationSpecReconcileStatefulSetUpdate',
-    'ClickHouseInstallationSpecReconcileStatefulSetUpdatePatch',
-    'ClickHouseInstallationSpecReconciling',
-    'ClickHouseInstallationSpecReconcilingCleanup',
-    'ClickHouseInstallationSpecReconcilingCleanupPatch',
-    'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjects',
-    'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatch',
-    'ClickHouseInstallationSpecReconcilingCleanupUnknownObjects',
-    'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatch',
-    'ClickHouseInstallationSpecReconcilingCluster',
-    'ClickHouseInstallationSpecReconcilingClusterHooks',
-    'ClickHouseInstallationSpecReconcilingClusterHooksPatch',
-    'ClickHouseInstallationSpecReconcilingClusterHooksPost',
-    'ClickHouseInstallationSpecReconcilingClusterHooksPostHttp',
-    'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpPatch',
-    'ClickHouseInstallationSpecReconcilingClusterHooksPostPatch',
-    'ClickHouseInstallationSpecReconcilingClusterHooksPostShell',
-    'ClickHouseInstallationSpecReconcilingClusterHooksPostShellPatch',
-    'ClickHouseInstallationSpecReconcilingClusterHooksPostSql',
-    'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlPatch',
-    'ClickHouseInstallationSpecReconcilingClusterHooksPre',
-    'ClickHouseInstallationSpecReconcilingClusterHooksPreHttp',
-    'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpPatch',
-    'ClickHouseInstallationSpecReconcilingClusterHooksPrePatch',
-    'ClickHouseInstallationSpecReconcilingClusterHooksPreShell',
-    'ClickHouseInstallationSpecReconcilingClusterHooksPreShellPatch',
-    'ClickHouseInstallationSpecReconcilingClusterHooksPreSql',
-    'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlPatch',
-    'ClickHouseInstallationSpecReconcilingClusterPatch',
-    'ClickHouseInstallationSpecReconcilingHost',
-    'ClickHouseInstallationSpecReconcilingHostDrop',
-    'ClickHouseInstallationSpecReconcilingHostDropPatch',
-    'ClickHouseInstallationSpecReconcilingHostDropReplicas',
-    'ClickHouseInstallationSpecReconcilingHostDropReplicasPatch',
-    'ClickHouseInstallationSpecReconcilingHostHooks',
-    'ClickHouseInstallationSpecReconcilingHostHooksPatch',
-    'ClickHouseInstallationSpecReconcilingHostHooksPost',
-    'ClickHouseInstallationSpecReconcilingHostHooksPostHttp',
-    'ClickHouseInstallationSpecReconcilingHostHooksPostHttpPatch',
-    'ClickHouseInstallationSpecReconcilingHostHooksPostPatch',
-    'ClickHouseInstallationSpecReconcilingHostHooksPostShell',
-    'ClickHouseInstallationSpecReconcilingHostHooksPostShellPatch',
-    'ClickHouseInstallationSpecReconcilingHostHooksPostSql',
-    'ClickHouseInstallationSpecReconcilingHostHooksPostSqlPatch',
-    'ClickHouseInstallationSpecReconcilingHostHooksPre',
-    'ClickHouseInstallationSpecReconcilingHostHooksPreHttp',
-    'ClickHouseInstallationSpecReconcilingHostHooksPreHttpPatch',
-    'ClickHouseInstallationSpecReconcilingHostHooksPrePatch',
-    'ClickHouseInstallationSpecReconcilingHostHooksPreShell',
-    'ClickHouseInstallationSpecReconcilingHostHooksPreShellPatch',
-    'ClickHouseInstallationSpecReconcilingHostHooksPreSql',
-    'ClickHouseInstallationSpecReconcilingHostHooksPreSqlPatch',
-    'ClickHouseInstallationSpecReconcilingHostPatch',
-    'ClickHouseInstallationSpecReconcilingHostWait',
-    'ClickHouseInstallationSpecReconcilingHostWaitPatch',
-    'ClickHouseInstallationSpecReconcilingHostWaitProbes',
-    'ClickHouseInstallationSpecReconcilingHostWaitProbesPatch',
-    'ClickHouseInstallationSpecReconcilingHostWaitReplicas',
-    'ClickHouseInstallationSpecReconcilingHostWaitReplicasPatch',
-    'ClickHouseInstallationSpecReconcilingMacros',
-    'ClickHouseInstallationSpecReconcilingMacrosPatch',
-    'ClickHouseInstallationSpecReconcilingMacrosSections',
-    'ClickHouseInstallationSpecReconcilingMacrosSectionsFiles',
-    'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatch',
-    'ClickHouseInstallationSpecReconcilingMacrosSectionsPatch',
-    'ClickHouseInstallationSpecReconcilingMacrosSectionsProfiles',
-    'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatch',
-    'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotas',
-    'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatch',
-    'ClickHouseInstallationSpecReconcilingMacrosSectionsSettings',
-    'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatch',
-    'ClickHouseInstallationSpecReconcilingMacrosSectionsUsers',
-    'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatch',
-    'ClickHouseInstallationSpecReconcilingPatch',
-    'ClickHouseInstallationSpecReconcilingRuntime',
-    'ClickHouseInstallationSpecReconcilingRuntimePatch',
-    'ClickHouseInstallationSpecReconcilingStatefulSet',
-    'ClickHouseInstallationSpecReconcilingStatefulSetCreate',
-    'ClickHouseInstallationSpecReconcilingStatefulSetCreatePatch',
-    'ClickHouseInstallationSpecReconcilingStatefulSetPatch',
-    'ClickHouseInstallationSpecReconcilingStatefulSetRecreate',
-    'ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatch',
-    'ClickHouseInstallationSpecReconcilingStatefulSetUpdate',
-    'ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatch',
-    'ClickHouseInstallationSpecTemplates',
-    'ClickHouseInstallationSpecTemplatesHostTemplates',
-    'ClickHouseInstallationSpecTemplatesHostTemplatesPatch',
-    'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistribution',
-    'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatch',
-    'ClickHouseInstallationSpecTemplatesHostTemplatesSpec',
-    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatch',
-    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplates',
-    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatch',
-    'ClickHouseInstallationSpecTemplatesPatch',
-    'ClickHouseInstallationSpecTemplatesPodTemplates',
-    'ClickHouseInstallationSpecTemplatesPodTemplatesPatch',
-    'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistribution',
-    'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatch',
-    'ClickHouseInstallationSpecTemplatesPodTemplatesZone',
-    'ClickHouseInstallationSpecTemplatesPodTemplatesZonePatch',
-    'ClickHouseInstallationSpecTemplatesServiceTemplates',
-    'ClickHouseInstallationSpecTemplatesServiceTemplatesPatch',
-    'ClickHouseInstallationSpecTemplatesVolumeClaimTemplates',
-    'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatch',
-    'ClickHouseInstallationSpecTemplating',
-    'ClickHouseInstallationSpecTemplatingPatch',
-    'ClickHouseInstallationSpecUseTemplates',
-    'ClickHouseInstallationSpecUseTemplatesPatch',
-    'ClickHouseInstallationStatus',
-    'ClickHouseInstallationStatusPatch',
-]
-
-@pulumi.output_type
-class ClickHouseInstallation(dict):
-    """
-    define a set of Kubernetes resources (StatefulSet, PVC, Service, ConfigMap) which describe behavior one or more clusters
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "apiVersion":
-            suggest = "api_version"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallation. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallation.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallation.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 api_version: Optional[_builtins.str] = None,
-                 kind: Optional[_builtins.str] = None,
-                 metadata: Optional['_meta.v1.outputs.ObjectMeta'] = None,
-                 spec: Optional['outputs.ClickHouseInstallationSpec'] = None,
-                 status: Optional['outputs.ClickHouseInstallationStatus'] = None):
-        """
-        define a set of Kubernetes resources (StatefulSet, PVC, Service, ConfigMap) which describe behavior one or more clusters
-
-        :param _builtins.str api_version: APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        :param _builtins.str kind: Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        :param '_meta.v1.ObjectMetaArgs' metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        if api_version is not None:
-            pulumi.set(__self__, "api_version", 'clickhouse.altinity.com/v1')
-        if kind is not None:
-            pulumi.set(__self__, "kind", 'ClickHouseInstallation')
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter(name="apiVersion")
-    def api_version(self) -> Optional[_builtins.str]:
-        """
-        APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        """
-        return pulumi.get(self, "api_version")
-
-    @_builtins.property
-    @pulumi.getter
-    def kind(self) -> Optional[_builtins.str]:
-        """
-        Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        return pulumi.get(self, "kind")
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> Optional['_meta.v1.outputs.ObjectMeta']:
-        """
-        Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        return pulumi.get(self, "metadata")
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> Optional['outputs.ClickHouseInstallationSpec']:
-        return pulumi.get(self, "spec")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional['outputs.ClickHouseInstallationStatus']:
-        return pulumi.get(self, "status")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpec(dict):
-    """
-    Specification of the desired behavior of one or more ClickHouse clusters
-    More info: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "namespaceDomainPattern":
-            suggest = "namespace_domain_pattern"
-        elif key == "taskID":
-            suggest = "task_id"
-        elif key == "useTemplates":
-            suggest = "use_templates"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpec. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpec.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpec.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 configuration: Optional['outputs.ClickHouseInstallationSpecConfiguration'] = None,
-                 defaults: Optional['outputs.ClickHouseInstallationSpecDefaults'] = None,
-                 namespace_domain_pattern: Optional[_builtins.str] = None,
-                 reconcile: Optional['outputs.ClickHouseInstallationSpecReconcile'] = None,
-                 reconciling: Optional['outputs.ClickHouseInstallationSpecReconciling'] = None,
-                 restart: Optional[_builtins.str] = None,
-                 stop: Optional[_builtins.str] = None,
-                 suspend: Optional[_builtins.str] = None,
-                 task_id: Optional[_builtins.str] = None,
-                 templates: Optional['outputs.ClickHouseInstallationSpecTemplates'] = None,
-                 templating: Optional['outputs.ClickHouseInstallationSpecTemplating'] = None,
-                 troubleshoot: Optional[_builtins.str] = None,
-                 use_templates: Optional[Sequence['outputs.ClickHouseInstallationSpecUseTemplates']] = None):
-        """
-        Specification of the desired behavior of one or more ClickHouse clusters
-        More info: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md
-
-
-        :param _builtins.str namespace_domain_pattern: Custom domain pattern which will be used for DNS names of `Service` or `Pod`.
-               Typical use scenario - custom cluster domain in Kubernetes cluster
-               Example: %s.svc.my.test
-        :param _builtins.str restart: In case 'RollingUpdate' specified, the operator will always restart ClickHouse pods during reconcile.
-               This options is used in rare cases when force restart is required and is typically removed after the use in order to avoid unneeded restarts.
-        :param _builtins.str stop: Allows to stop all ClickHouse clusters defined in a CHI.
-               Works as the following:
-                - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
-                - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
-        :param _builtins.str suspend: Suspend reconciliation of resources managed by a ClickHouse Installation.
-               Works as the following:
-                - When `suspend` is `true` operator stops reconciling all resources.
-                - When `suspend` is `false` or not set, operator reconciles all resources.
-        :param _builtins.str task_id: Allows to define custom taskID for CHI update and watch status of this update execution.
-               Displayed in all .status.taskID* fields.
-               By default (if not filled) every update of CHI manifest will generate random taskID
-        :param _builtins.str troubleshoot: Allows to troubleshoot Pods during CrashLoopBack state.
-               This may happen when wrong configuration applied, in this case `clickhouse-server` wouldn't start.
-               Command within ClickHouse container is modified with `sleep` in order to avoid quick restarts
-               and give time to troubleshoot via CLI.
-               Liveness and Readiness probes are disabled as well.
-        :param Sequence['ClickHouseInstallationSpecUseTemplatesArgs'] use_templates: list of `ClickHouseInstallationTemplate` (chit) resource names which will merge with current `CHI`
-               manifest during render Kubernetes resources to create related ClickHouse clusters"
-        """
-        if configuration is not None:
-            pulumi.set(__self__, "configuration", configuration)
-        if defaults is not None:
-            pulumi.set(__self__, "defaults", defaults)
-        if namespace_domain_pattern is not None:
-            pulumi.set(__self__, "namespace_domain_pattern", namespace_domain_pattern)
-        if reconcile is not None:
-            pulumi.set(__self__, "reconcile", reconcile)
-        if reconciling is not None:
-            pulumi.set(__self__, "reconciling", reconciling)
-        if restart is not None:
-            pulumi.set(__self__, "restart", restart)
-        if stop is not None:
-            pulumi.set(__self__, "stop", stop)
-        if suspend is not None:
-            pulumi.set(__self__, "suspend", suspend)
-        if task_id is not None:
-            pulumi.set(__self__, "task_id", task_id)
-        if templates is not None:
-            pulumi.set(__self__, "templates", templates)
-        if templating is not None:
-            pulumi.set(__self__, "templating", templating)
-        if troubleshoot is not None:
-            pulumi.set(__self__, "troubleshoot", troubleshoot)
-        if use_templates is not None:
-            pulumi.set(__self__, "use_templates", use_templates)
-
-    @_builtins.property
-    @pulumi.getter
-    def configuration(self) -> Optional['outputs.ClickHouseInstallationSpecConfiguration']:
-        return pulumi.get(self, "configuration")
-
-    @_builtins.property
-    @pulumi.getter
-    def defaults(self) -> Optional['outputs.ClickHouseInstallationSpecDefaults']:
-        return pulumi.get(self, "defaults")
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceDomainPattern")
-    def namespace_domain_pattern(self) -> Optional[_builtins.str]:
-        """
-        Custom domain pattern which will be used for DNS names of `Service` or `Pod`.
-        Typical use scenario - custom cluster domain in Kubernetes cluster
-        Example: %s.svc.my.test
-        """
-        return pulumi.get(self, "namespace_domain_pattern")
-
-    @_builtins.property
-    @pulumi.getter
-    def reconcile(self) -> Optional['outputs.ClickHouseInstallationSpecReconcile']:
-        return pulumi.get(self, "reconcile")
-
-    @_builtins.property
-    @pulumi.getter
-    def reconciling(self) -> Optional['outputs.ClickHouseInstallationSpecReconciling']:
-        return pulumi.get(self, "reconciling")
-
-    @_builtins.property
-    @pulumi.getter
-    def restart(self) -> Optional[_builtins.str]:
-        """
-        In case 'RollingUpdate' specified, the operator will always restart ClickHouse pods during reconcile.
-        This options is used in rare cases when force restart is required and is typically removed after the use in order to avoid unneeded restarts.
-        """
-        return pulumi.get(self, "restart")
-
-    @_builtins.property
-    @pulumi.getter
-    def stop(self) -> Optional[_builtins.str]:
-        """
-        Allows to stop all ClickHouse clusters defined in a CHI.
-        Works as the following:
-         - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
-         - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
-        """
-        return pulumi.get(self, "stop")
-
-    @_builtins.property
-    @pulumi.getter
-    def suspend(self) -> Optional[_builtins.str]:
-        """
-        Suspend reconciliation of resources managed by a ClickHouse Installation.
-        Works as the following:
-         - When `suspend` is `true` operator stops reconciling all resources.
-         - When `suspend` is `false` or not set, operator reconciles all resources.
-        """
-        return pulumi.get(self, "suspend")
-
-    @_builtins.property
-    @pulumi.getter(name="taskID")
-    def task_id(self) -> Optional[_builtins.str]:
-        """
-        Allows to define custom taskID for CHI update and watch status of this update execution.
-        Displayed in all .status.taskID* fields.
-        By default (if not filled) every update of CHI manifest will generate random taskID
-        """
-        return pulumi.get(self, "task_id")
-
-    @_builtins.property
-    @pulumi.getter
-    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecTemplates']:
-        return pulumi.get(self, "templates")
-
-    @_builtins.property
-    @pulumi.getter
-    def templating(self) -> Optional['outputs.ClickHouseInstallationSpecTemplating']:
-        return pulumi.get(self, "templating")
-
-    @_builtins.property
-    @pulumi.getter
-    def troubleshoot(self) -> Optional[_builtins.str]:
-        """
-        Allows to troubleshoot Pods during CrashLoopBack state.
-        This may happen when wrong configuration applied, in this case `clickhouse-server` wouldn't start.
-        Command within ClickHouse container is modified with `sleep` in order to avoid quick restarts
-        and give time to troubleshoot via CLI.
-        Liveness and Readiness probes are disabled as well.
-        """
-        return pulumi.get(self, "troubleshoot")
-
-    @_builtins.property
-    @pulumi.getter(name="useTemplates")
-    def use_templates(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecUseTemplates']]:
-        """
-        list of `ClickHouseInstallationTemplate` (chit) resource names which will merge with current `CHI`
-        manifest during render Kubernetes resources to create related ClickHouse clusters"
-        """
-        return pulumi.get(self, "use_templates")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfiguration(dict):
-    """
-    allows configure multiple aspects and behavior for `clickhouse-server` instance and also allows describe multiple `clickhouse-server` clusters inside one `chi` resource
-    """
-    def __init__(__self__, *,
-                 clusters: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClusters']] = None,
-                 files: Optional[Mapping[str, Any]] = None,
-                 profiles: Optional[Mapping[str, Any]] = None,
-                 quotas: Optional[Mapping[str, Any]] = None,
-                 settings: Optional[Mapping[str, Any]] = None,
-                 users: Optional[Mapping[str, Any]] = None,
-                 zookeeper: Optional['outputs.ClickHouseInstallationSpecConfigurationZookeeper'] = None):
-        """
-        allows configure multiple aspects and behavior for `clickhouse-server` instance and also allows describe multiple `clickhouse-server` clusters inside one `chi` resource
-
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersArgs'] clusters: describes clusters layout and allows change settings on cluster-level, shard-level and replica-level
-               every cluster is a set of StatefulSet, one StatefulSet contains only one Pod with `clickhouse-server`
-               all Pods will rendered in <remote_server> part of ClickHouse configs, mounted from ConfigMap as `/etc/clickhouse-server/config.d/chop-generated-remote_servers.xml`
-               Clusters will use for Distributed table engine, more details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
-               If `cluster` contains zookeeper settings (could be inherited from top `chi` level), when you can create *ReplicatedMergeTree tables
-        :param Mapping[str, Any] files: allows define content of any setting file inside each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-               every key in this object is the file name
-               every value in this object is the file content
-               you can use `!!binary |` and base64 for binary files, see details here https://yaml.org/type/binary.html
-               each key could contains prefix like {common}, {users}, {hosts} or config.d, users.d, conf.d, wrong prefixes will be ignored, subfolders also will be ignored
-               More details: https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-05-files-nested.yaml
-
-               any key could contains `valueFrom` with `secretKeyRef` which allow pass values from kubernetes secrets
-               secrets will mounted into pod as separate volume in /etc/clickhouse-server/secrets.d/
-               and will automatically update when update secret
-               it useful for pass SSL certificates from cert-manager or similar tool
-               look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
-        :param Mapping[str, Any] profiles: allows configure <yandex><profiles>..</profiles></yandex> section in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/users.d/`
-               you can configure any aspect of settings profile
-               More details: https://clickhouse.tech/docs/en/operations/settings/settings-profiles/
-               Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationprofiles
-        :param Mapping[str, Any] quotas: allows configure <yandex><quotas>..</quotas></yandex> section in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/users.d/`
-               you can configure any aspect of resource quotas
-               More details: https://clickhouse.tech/docs/en/operations/quotas/
-               Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationquotas
-        :param Mapping[str, Any] settings: allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
-               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-               Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationsettings
-
-               any key could contains `valueFrom` with `secretKeyRef` which allow pass password from kubernetes secrets
-               look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
-
-               secret value will pass in `pod.spec.env`, and generate with from_env=XXX in XML in /etc/clickhouse-server/config.d/chop-generated-settings.xml
-               it not allow automatically updates when updates `secret`, change spec.taskID for manually trigger reconcile cycle
-        :param Mapping[str, Any] users: allows configure <yandex><users>..</users></yandex> section in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/users.d/`
-               you can configure password hashed, authorization restrictions, database level security row filters etc.
-               More details: https://clickhouse.tech/docs/en/operations/settings/settings-users/
-               Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationusers
-
-               any key could contains `valueFrom` with `secretKeyRef` which allow pass password from kubernetes secrets
-               secret value will pass in `pod.spec.containers.evn`, and generate with from_env=XXX in XML in /etc/clickhouse-server/users.d/chop-generated-users.xml
-               it not allow automatically updates when updates `secret`, change spec.taskID for manually trigger reconcile cycle
-
-               look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
-
-               any key with prefix `k8s_secret_` shall has value with format namespace/secret/key or secret/key
-               in this case value from secret will write directly into XML tag during render *-usersd ConfigMap
-
-               any key with prefix `k8s_secret_env` shall has value with format namespace/secret/key or secret/key
-               in this case value from secret will write into environment variable and write to XML tag via from_env=XXX
-
-               look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
-        """
-        if clusters is not None:
-            pulumi.set(__self__, "clusters", clusters)
-        if files is not None:
-            pulumi.set(__self__, "files", files)
-        if profiles is not None:
-            pulumi.set(__self__, "profiles", profiles)
-        if quotas is not None:
-            pulumi.set(__self__, "quotas", quotas)
-        if settings is not None:
-            pulumi.set(__self__, "settings", settings)
-        if users is not None:
-            pulumi.set(__self__, "users", users)
-        if zookeeper is not None:
-            pulumi.set(__self__, "zookeeper", zookeeper)
-
-    @_builtins.property
-    @pulumi.getter
-    def clusters(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClusters']]:
-        """
-        describes clusters layout and allows change settings on cluster-level, shard-level and replica-level
-        every cluster is a set of StatefulSet, one StatefulSet contains only one Pod with `clickhouse-server`
-        all Pods will rendered in <remote_server> part of ClickHouse configs, mounted from ConfigMap as `/etc/clickhouse-server/config.d/chop-generated-remote_servers.xml`
-        Clusters will use for Distributed table engine, more details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
-        If `cluster` contains zookeeper settings (could be inherited from top `chi` level), when you can create *ReplicatedMergeTree tables
-        """
-        return pulumi.get(self, "clusters")
-
-    @_builtins.property
-    @pulumi.getter
-    def files(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows define content of any setting file inside each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-        every key in this object is the file name
-        every value in this object is the file content
-        you can use `!!binary |` and base64 for binary files, see details here https://yaml.org/type/binary.html
-        each key could contains prefix like {common}, {users}, {hosts} or config.d, users.d, conf.d, wrong prefixes will be ignored, subfolders also will be ignored
-        More details: https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-05-files-nested.yaml
-
-        any key could contains `valueFrom` with `secretKeyRef` which allow pass values from kubernetes secrets
-        secrets will mounted into pod as separate volume in /etc/clickhouse-server/secrets.d/
-        and will automatically update when update secret
-        it useful for pass SSL certificates from cert-manager or similar tool
-        look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
-        """
-        return pulumi.get(self, "files")
-
-    @_builtins.property
-    @pulumi.getter
-    def profiles(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows configure <yandex><profiles>..</profiles></yandex> section in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/users.d/`
-        you can configure any aspect of settings profile
-        More details: https://clickhouse.tech/docs/en/operations/settings/settings-profiles/
-        Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationprofiles
-        """
-        return pulumi.get(self, "profiles")
-
-    @_builtins.property
-    @pulumi.getter
-    def quotas(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows configure <yandex><quotas>..</quotas></yandex> section in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/users.d/`
-        you can configure any aspect of resource quotas
-        More details: https://clickhouse.tech/docs/en/operations/quotas/
-        Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationquotas
-        """
-        return pulumi.get(self, "quotas")
-
-    @_builtins.property
-    @pulumi.getter
-    def settings(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
-        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationsettings
-
-        any key could contains `valueFrom` with `secretKeyRef` which allow pass password from kubernetes secrets
-        look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
-
-        secret value will pass in `pod.spec.env`, and generate with from_env=XXX in XML in /etc/clickhouse-server/config.d/chop-generated-settings.xml
-        it not allow automatically updates when updates `secret`, change spec.taskID for manually trigger reconcile cycle
-        """
-        return pulumi.get(self, "settings")
-
-    @_builtins.property
-    @pulumi.getter
-    def users(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows configure <yandex><users>..</users></yandex> section in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/users.d/`
-        you can configure password hashed, authorization restrictions, database level security row filters etc.
-        More details: https://clickhouse.tech/docs/en/operations/settings/settings-users/
-        Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationusers
-
-        any key could contains `valueFrom` with `secretKeyRef` which allow pass password from kubernetes secrets
-        secret value will pass in `pod.spec.containers.evn`, and generate with from_env=XXX in XML in /etc/clickhouse-server/users.d/chop-generated-users.xml
-        it not allow automatically updates when updates `secret`, change spec.taskID for manually trigger reconcile cycle
-
-        look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
-
-        any key with prefix `k8s_secret_` shall has value with format namespace/secret/key or secret/key
-        in this case value from secret will write directly into XML tag during render *-usersd ConfigMap
-
-        any key with prefix `k8s_secret_env` shall has value with format namespace/secret/key or secret/key
-        in this case value from secret will write into environment variable and write to XML tag via from_env=XXX
-
-        look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
-        """
-        return pulumi.get(self, "users")
-
-    @_builtins.property
-    @pulumi.getter
-    def zookeeper(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationZookeeper']:
-        return pulumi.get(self, "zookeeper")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClusters(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "pdbManaged":
-            suggest = "pdb_managed"
-        elif key == "pdbMaxUnavailable":
-            suggest = "pdb_max_unavailable"
-        elif key == "schemaPolicy":
-            suggest = "schema_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClusters. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClusters.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClusters.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 files: Optional[Mapping[str, Any]] = None,
-                 insecure: Optional[_builtins.str] = None,
-                 layout: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayout'] = None,
-                 name: Optional[_builtins.str] = None,
-                 pdb_managed: Optional[_builtins.str] = None,
-                 pdb_max_unavailable: Optional[_builtins.int] = None,
-                 reconcile: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcile'] = None,
-                 schema_policy: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSchemaPolicy'] = None,
-                 secret: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSecret'] = None,
-                 secure: Optional[_builtins.str] = None,
-                 settings: Optional[Mapping[str, Any]] = None,
-                 templates: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersTemplates'] = None,
-                 zookeeper: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersZookeeper'] = None):
-        """
-        :param Mapping[str, Any] files: optional, allows define content of any setting file inside each `Pod` on current cluster during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-               override top-level `chi.spec.configuration.files`
-        :param _builtins.str insecure: optional, open insecure ports for cluster, defaults to "yes"
-        :param _builtins.str name: cluster name, used to identify set of servers and wide used during generate names of related Kubernetes resources
-        :param _builtins.str pdb_managed: Specifies whether the Pod Disruption Budget (PDB) should be managed.
-               During the next installation, if PDB management is enabled, the operator will
-               attempt to retrieve any existing PDB. If none is found, it will create a new one
-               and initiate a reconciliation loop. If PDB management is disabled, the existing PDB
-               will remain intact, and the reconciliation loop will not be executed. By default,
-               PDB management is enabled.
-        :param _builtins.int pdb_max_unavailable: Pod eviction is allowed if at most "pdbMaxUnavailable" pods are unavailable after the eviction,
-               i.e. even in absence of the evicted pod. For example, one can prevent all voluntary evictions
-               by specifying 0. This is a mutually exclusive setting with "minAvailable".
-        :param _builtins.str secure: optional, open secure ports for cluster
-        :param Mapping[str, Any] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` only in one cluster during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
-               override top-level `chi.spec.configuration.settings`
-               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        """
-        if files is not None:
-            pulumi.set(__self__, "files", files)
-        if insecure is not None:
-            pulumi.set(__self__, "insecure", insecure)
-        if layout is not None:
-            pulumi.set(__self__, "layout", layout)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if pdb_managed is not None:
-            pulumi.set(__self__, "pdb_managed", pdb_managed)
-        if pdb_max_unavailable is not None:
-            pulumi.set(__self__, "pdb_max_unavailable", pdb_max_unavailable)
-        if reconcile is not None:
-            pulumi.set(__self__, "reconcile", reconcile)
-        if schema_policy is not None:
-            pulumi.set(__self__, "schema_policy", schema_policy)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-        if secure is not None:
-            pulumi.set(__self__, "secure", secure)
-        if settings is not None:
-            pulumi.set(__self__, "settings", settings)
-        if templates is not None:
-            pulumi.set(__self__, "templates", templates)
-        if zookeeper is not None:
-            pulumi.set(__self__, "zookeeper", zookeeper)
-
-    @_builtins.property
-    @pulumi.getter
-    def files(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows define content of any setting file inside each `Pod` on current cluster during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-        override top-level `chi.spec.configuration.files`
-        """
-        return pulumi.get(self, "files")
-
-    @_builtins.property
-    @pulumi.getter
-    def insecure(self) -> Optional[_builtins.str]:
-        """
-        optional, open insecure ports for cluster, defaults to "yes"
-        """
-        return pulumi.get(self, "insecure")
-
-    @_builtins.property
-    @pulumi.getter
-    def layout(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayout']:
-        return pulumi.get(self, "layout")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        cluster name, used to identify set of servers and wide used during generate names of related Kubernetes resources
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter(name="pdbManaged")
-    def pdb_managed(self) -> Optional[_builtins.str]:
-        """
-        Specifies whether the Pod Disruption Budget (PDB) should be managed.
-        During the next installation, if PDB management is enabled, the operator will
-        attempt to retrieve any existing PDB. If none is found, it will create a new one
-        and initiate a reconciliation loop. If PDB management is disabled, the existing PDB
-        will remain intact, and the reconciliation loop will not be executed. By default,
-        PDB management is enabled.
-        """
-        return pulumi.get(self, "pdb_managed")
-
-    @_builtins.property
-    @pulumi.getter(name="pdbMaxUnavailable")
-    def pdb_max_unavailable(self) -> Optional[_builtins.int]:
-        """
-        Pod eviction is allowed if at most "pdbMaxUnavailable" pods are unavailable after the eviction,
-        i.e. even in absence of the evicted pod. For example, one can prevent all voluntary evictions
-        by specifying 0. This is a mutually exclusive setting with "minAvailable".
-        """
-        return pulumi.get(self, "pdb_max_unavailable")
-
-    @_builtins.property
-    @pulumi.getter
-    def reconcile(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcile']:
-        return pulumi.get(self, "reconcile")
-
-    @_builtins.property
-    @pulumi.getter(name="schemaPolicy")
-    def schema_policy(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSchemaPolicy']:
-        return pulumi.get(self, "schema_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSecret']:
-        return pulumi.get(self, "secret")
-
-    @_builtins.property
-    @pulumi.getter
-    def secure(self) -> Optional[_builtins.str]:
-        """
-        optional, open secure ports for cluster
-        """
-        return pulumi.get(self, "secure")
-
-    @_builtins.property
-    @pulumi.getter
-    def settings(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` only in one cluster during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
-        override top-level `chi.spec.configuration.settings`
-        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        """
-        return pulumi.get(self, "settings")
-
-    @_builtins.property
-    @pulumi.getter
-    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersTemplates']:
-        return pulumi.get(self, "templates")
-
-    @_builtins.property
-    @pulumi.getter
-    def zookeeper(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersZookeeper']:
-        return pulumi.get(self, "zookeeper")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersLayout(dict):
-    """
-    describe current cluster layout, how much shards in cluster, how much replica in shard
-    allows override settings on each shard and replica separatelly
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "replicasCount":
-            suggest = "replicas_count"
-        elif key == "shardsCount":
-            suggest = "shards_count"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayout. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayout.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayout.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 replicas: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicas']] = None,
-                 replicas_count: Optional[_builtins.int] = None,
-                 shards: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShards']] = None,
-                 shards_count: Optional[_builtins.int] = None):
-        """
-        describe current cluster layout, how much shards in cluster, how much replica in shard
-        allows override settings on each shard and replica separatelly
-
-
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersLayoutReplicasArgs'] replicas: optional, allows override top-level `chi.spec.configuration` and cluster-level `chi.spec.configuration.clusters` configuration for each replica and each shard relates to selected replica, use it only if you fully understand what you do
-        :param _builtins.int replicas_count: how much replicas in each shards for current cluster will run in Kubernetes,
-               each replica is a separate `StatefulSet` which contains only one `Pod` with `clickhouse-server` instance,
-               every shard contains 1 replica by default"
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersLayoutShardsArgs'] shards: optional, allows override top-level `chi.spec.configuration`, cluster-level
-               `chi.spec.configuration.clusters` settings for each shard separately,
-               use it only if you fully understand what you do"
-        :param _builtins.int shards_count: how much shards for current ClickHouse cluster will run in Kubernetes,
-               each shard contains shared-nothing part of data and contains set of replicas,
-               cluster contains 1 shard by default"
-        """
-        if replicas is not None:
-            pulumi.set(__self__, "replicas", replicas)
-        if replicas_count is not None:
-            pulumi.set(__self__, "replicas_count", replicas_count)
-        if shards is not None:
-            pulumi.set(__self__, "shards", shards)
-        if shards_count is not None:
-            pulumi.set(__self__, "shards_count", shards_count)
-
-    @_builtins.property
-    @pulumi.getter
-    def replicas(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicas']]:
-        """
-        optional, allows override top-level `chi.spec.configuration` and cluster-level `chi.spec.configuration.clusters` configuration for each replica and each shard relates to selected replica, use it only if you fully understand what you do
-        """
-        return pulumi.get(self, "replicas")
-
-    @_builtins.property
-    @pulumi.getter(name="replicasCount")
-    def replicas_count(self) -> Optional[_builtins.int]:
-        """
-        how much replicas in each shards for current cluster will run in Kubernetes,
-        each replica is a separate `StatefulSet` which contains only one `Pod` with `clickhouse-server` instance,
-        every shard contains 1 replica by default"
-        """
-        return pulumi.get(self, "replicas_count")
-
-    @_builtins.property
-    @pulumi.getter
-    def shards(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShards']]:
-        """
-        optional, allows override top-level `chi.spec.configuration`, cluster-level
-        `chi.spec.configuration.clusters` settings for each shard separately,
-        use it only if you fully understand what you do"
-        """
-        return pulumi.get(self, "shards")
-
-    @_builtins.property
-    @pulumi.getter(name="shardsCount")
-    def shards_count(self) -> Optional[_builtins.int]:
-        """
-        how much shards for current ClickHouse cluster will run in Kubernetes,
-        each shard contains shared-nothing part of data and contains set of replicas,
-        cluster contains 1 shard by default"
-        """
-        return pulumi.get(self, "shards_count")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersLayoutPatch(dict):
-    """
-    describe current cluster layout, how much shards in cluster, how much replica in shard
-    allows override settings on each shard and replica separatelly
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "replicasCount":
-            suggest = "replicas_count"
-        elif key == "shardsCount":
-            suggest = "shards_count"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 replicas: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatch']] = None,
-                 replicas_count: Optional[_builtins.int] = None,
-                 shards: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatch']] = None,
-                 shards_count: Optional[_builtins.int] = None):
-        """
-        describe current cluster layout, how much shards in cluster, how much replica in shard
-        allows override settings on each shard and replica separatelly
-
-
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatchArgs'] replicas: optional, allows override top-level `chi.spec.configuration` and cluster-level `chi.spec.configuration.clusters` configuration for each replica and each shard relates to selected replica, use it only if you fully understand what you do
-        :param _builtins.int replicas_count: how much replicas in each shards for current cluster will run in Kubernetes,
-               each replica is a separate `StatefulSet` which contains only one `Pod` with `clickhouse-server` instance,
-               every shard contains 1 replica by default"
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatchArgs'] shards: optional, allows override top-level `chi.spec.configuration`, cluster-level
-               `chi.spec.configuration.clusters` settings for each shard separately,
-               use it only if you fully understand what you do"
-        :param _builtins.int shards_count: how much shards for current ClickHouse cluster will run in Kubernetes,
-               each shard contains shared-nothing part of data and contains set of replicas,
-               cluster contains 1 shard by default"
-        """
-        if replicas is not None:
-            pulumi.set(__self__, "replicas", replicas)
-        if replicas_count is not None:
-            pulumi.set(__self__, "replicas_count", replicas_count)
-        if shards is not None:
-            pulumi.set(__self__, "shards", shards)
-        if shards_count is not None:
-            pulumi.set(__self__, "shards_count", shards_count)
-
-    @_builtins.property
-    @pulumi.getter
-    def replicas(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatch']]:
-        """
-        optional, allows override top-level `chi.spec.configuration` and cluster-level `chi.spec.configuration.clusters` configuration for each replica and each shard relates to selected replica, use it only if you fully understand what you do
-        """
-        return pulumi.get(self, "replicas")
-
-    @_builtins.property
-    @pulumi.getter(name="replicasCount")
-    def replicas_count(self) -> Optional[_builtins.int]:
-        """
-        how much replicas in each shards for current cluster will run in Kubernetes,
-        each replica is a separate `StatefulSet` which contains only one `Pod` with `clickhouse-server` instance,
-        every shard contains 1 replica by default"
-        """
-        return pulumi.get(self, "replicas_count")
-
-    @_builtins.property
-    @pulumi.getter
-    def shards(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatch']]:
-        """
-        optional, allows override top-level `chi.spec.configuration`, cluster-level
-        `chi.spec.configuration.clusters` settings for each shard separately,
-        use it only if you fully understand what you do"
-        """
-        return pulumi.get(self, "shards")
-
-    @_builtins.property
-    @pulumi.getter(name="shardsCount")
-    def shards_count(self) -> Optional[_builtins.int]:
-        """
-        how much shards for current ClickHouse cluster will run in Kubernetes,
-        each shard contains shared-nothing part of data and contains set of replicas,
-        cluster contains 1 shard by default"
-        """
-        return pulumi.get(self, "shards_count")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersLayoutReplicas(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "shardsCount":
-            suggest = "shards_count"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutReplicas. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutReplicas.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutReplicas.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 files: Optional[Mapping[str, Any]] = None,
-                 name: Optional[_builtins.str] = None,
-                 settings: Optional[Mapping[str, Any]] = None,
-                 shards: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShards']] = None,
-                 shards_count: Optional[_builtins.int] = None,
-                 templates: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplates'] = None):
-        """
-        :param Mapping[str, Any] files: optional, allows define content of any setting file inside each `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-               override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
-        :param _builtins.str name: optional, by default replica name is generated, but you can override it and setup custom name
-        :param Mapping[str, Any] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
-               override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and will ignore if shard-level `chi.spec.configuration.clusters.layout.shards` present
-               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsArgs'] shards: optional, list of shards related to current replica, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
-        :param _builtins.int shards_count: optional, count of shards related to current replica, you can override each shard behavior on low-level `chi.spec.configuration.clusters.layout.replicas.shards`
-        """
-        if files is not None:
-            pulumi.set(__self__, "files", files)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if settings is not None:
-            pulumi.set(__self__, "settings", settings)
-        if shards is not None:
-            pulumi.set(__self__, "shards", shards)
-        if shards_count is not None:
-            pulumi.set(__self__, "shards_count", shards_count)
-        if templates is not None:
-            pulumi.set(__self__, "templates", templates)
-
-    @_builtins.property
-    @pulumi.getter
-    def files(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows define content of any setting file inside each `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-        override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
-        """
-        return pulumi.get(self, "files")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        optional, by default replica name is generated, but you can override it and setup custom name
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def settings(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
-        override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and will ignore if shard-level `chi.spec.configuration.clusters.layout.shards` present
-        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        """
-        return pulumi.get(self, "settings")
-
-    @_builtins.property
-    @pulumi.getter
-    def shards(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShards']]:
-        """
-        optional, list of shards related to current replica, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
-        """
-        return pulumi.get(self, "shards")
-
-    @_builtins.property
-    @pulumi.getter(name="shardsCount")
-    def shards_count(self) -> Optional[_builtins.int]:
-        """
-        optional, count of shards related to current replica, you can override each shard behavior on low-level `chi.spec.configuration.clusters.layout.replicas.shards`
-        """
-        return pulumi.get(self, "shards_count")
-
-    @_builtins.property
-    @pulumi.getter
-    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplates']:
-        return pulumi.get(self, "templates")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "shardsCount":
-            suggest = "shards_count"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 files: Optional[Mapping[str, Any]] = None,
-                 name: Optional[_builtins.str] = None,
-                 settings: Optional[Mapping[str, Any]] = None,
-                 shards: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatch']] = None,
-                 shards_count: Optional[_builtins.int] = None,
-                 templates: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatch'] = None):
-        """
-        :param Mapping[str, Any] files: optional, allows define content of any setting file inside each `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-               override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
-        :param _builtins.str name: optional, by default replica name is generated, but you can override it and setup custom name
-        :param Mapping[str, Any] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
-               override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and will ignore if shard-level `chi.spec.configuration.clusters.layout.shards` present
-               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatchArgs'] shards: optional, list of shards related to current replica, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
-        :param _builtins.int shards_count: optional, count of shards related to current replica, you can override each shard behavior on low-level `chi.spec.configuration.clusters.layout.replicas.shards`
-        """
-        if files is not None:
-            pulumi.set(__self__, "files", files)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if settings is not None:
-            pulumi.set(__self__, "settings", settings)
-        if shards is not None:
-            pulumi.set(__self__, "shards", shards)
-        if shards_count is not None:
-            pulumi.set(__self__, "shards_count", shards_count)
-        if templates is not None:
-            pulumi.set(__self__, "templates", templates)
-
-    @_builtins.property
-    @pulumi.getter
-    def files(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows define content of any setting file inside each `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-        override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
-        """
-        return pulumi.get(self, "files")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        optional, by default replica name is generated, but you can override it and setup custom name
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def settings(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
-        override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and will ignore if shard-level `chi.spec.configuration.clusters.layout.shards` present
-        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        """
-        return pulumi.get(self, "settings")
-
-    @_builtins.property
-    @pulumi.getter
-    def shards(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatch']]:
-        """
-        optional, list of shards related to current replica, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
-        """
-        return pulumi.get(self, "shards")
-
-    @_builtins.property
-    @pulumi.getter(name="shardsCount")
-    def shards_count(self) -> Optional[_builtins.int]:
-        """
-        optional, count of shards related to current replica, you can override each shard behavior on low-level `chi.spec.configuration.clusters.layout.replicas.shards`
-        """
-        return pulumi.get(self, "shards_count")
-
-    @_builtins.property
-    @pulumi.getter
-    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatch']:
-        return pulumi.get(self, "templates")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShards(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "httpPort":
-            suggest = "http_port"
-        elif key == "httpsPort":
-            suggest = "https_port"
-        elif key == "interserverHTTPPort":
-            suggest = "interserver_http_port"
-        elif key == "tcpPort":
-            suggest = "tcp_port"
-        elif key == "tlsPort":
-            suggest = "tls_port"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShards. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShards.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShards.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 files: Optional[Mapping[str, Any]] = None,
-                 http_port: Optional[_builtins.int] = None,
-                 https_port: Optional[_builtins.int] = None,
-                 insecure: Optional[_builtins.str] = None,
-                 interserver_http_port: Optional[_builtins.int] = None,
-                 name: Optional[_builtins.str] = None,
-                 secure: Optional[_builtins.str] = None,
-                 settings: Optional[Mapping[str, Any]] = None,
-                 tcp_port: Optional[_builtins.int] = None,
-                 templates: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplates'] = None,
-                 tls_port: Optional[_builtins.int] = None):
-        """
-        :param Mapping[str, Any] files: optional, allows define content of any setting file inside each `Pod` only in one shard related to current replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-               override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
-        :param _builtins.int http_port: optional, setup `Pod.spec.containers.ports` with name `http` for selected shard, override `chi.spec.templates.hostTemplates.spec.httpPort`
-               allows connect to `clickhouse-server` via HTTP protocol via kubernetes `Service`
-        :param _builtins.str insecure: optional, open insecure ports for cluster, defaults to "yes"
-        :param _builtins.int interserver_http_port: optional, setup `Pod.spec.containers.ports` with name `interserver` for selected shard, override `chi.spec.templates.hostTemplates.spec.interserverHTTPPort`
-               allows connect between replicas inside same shard during fetch replicated data parts HTTP protocol
-        :param _builtins.str name: optional, by default shard name is generated, but you can override it and setup custom name
-        :param _builtins.str secure: optional, open secure ports
-        :param Mapping[str, Any] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one shard related to current replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
-               override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and replica-level `chi.spec.configuration.clusters.layout.replicas.settings`
-               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        :param _builtins.int tcp_port: optional, setup `Pod.spec.containers.ports` with name `tcp` for selected shard, override `chi.spec.templates.hostTemplates.spec.tcpPort`
-               allows connect to `clickhouse-server` via TCP Native protocol via kubernetes `Service`
-        """
-        if files is not None:
-            pulumi.set(__self__, "files", files)
-        if http_port is not None:
-            pulumi.set(__self__, "http_port", http_port)
-        if https_port is not None:
-            pulumi.set(__self__, "https_port", https_port)
-        if insecure is not None:
-            pulumi.set(__self__, "insecure", insecure)
-        if interserver_http_port is not None:
-            pulumi.set(__self__, "interserver_http_port", interserver_http_port)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if secure is not None:
-            pulumi.set(__self__, "secure", secure)
-        if settings is not None:
-            pulumi.set(__self__, "settings", settings)
-        if tcp_port is not None:
-            pulumi.set(__self__, "tcp_port", tcp_port)
-        if templates is not None:
-            pulumi.set(__self__, "templates", templates)
-        if tls_port is not None:
-            pulumi.set(__self__, "tls_port", tls_port)
-
-    @_builtins.property
-    @pulumi.getter
-    def files(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows define content of any setting file inside each `Pod` only in one shard related to current replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-        override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
-        """
-        return pulumi.get(self, "files")
-
-    @_builtins.property
-    @pulumi.getter(name="httpPort")
-    def http_port(self) -> Optional[_builtins.int]:
-        """
-        optional, setup `Pod.spec.containers.ports` with name `http` for selected shard, override `chi.spec.templates.hostTemplates.spec.httpPort`
-        allows connect to `clickhouse-server` via HTTP protocol via kubernetes `Service`
-        """
-        return pulumi.get(self, "http_port")
-
-    @_builtins.property
-    @pulumi.getter(name="httpsPort")
-    def https_port(self) -> Optional[_builtins.int]:
-        return pulumi.get(self, "https_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def insecure(self) -> Optional[_builtins.str]:
-        """
-        optional, open insecure ports for cluster, defaults to "yes"
-        """
-        return pulumi.get(self, "insecure")
-
-    @_builtins.property
-    @pulumi.getter(name="interserverHTTPPort")
-    def interserver_http_port(self) -> Optional[_builtins.int]:
-        """
-        optional, setup `Pod.spec.containers.ports` with name `interserver` for selected shard, override `chi.spec.templates.hostTemplates.spec.interserverHTTPPort`
-        allows connect between replicas inside same shard during fetch replicated data parts HTTP protocol
-        """
-        return pulumi.get(self, "interserver_http_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        optional, by default shard name is generated, but you can override it and setup custom name
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def secure(self) -> Optional[_builtins.str]:
-        """
-        optional, open secure ports
-        """
-        return pulumi.get(self, "secure")
-
-    @_builtins.property
-    @pulumi.getter
-    def settings(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one shard related to current replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
-        override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and replica-level `chi.spec.configuration.clusters.layout.replicas.settings`
-        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        """
-        return pulumi.get(self, "settings")
-
-    @_builtins.property
-    @pulumi.getter(name="tcpPort")
-    def tcp_port(self) -> Optional[_builtins.int]:
-        """
-        optional, setup `Pod.spec.containers.ports` with name `tcp` for selected shard, override `chi.spec.templates.hostTemplates.spec.tcpPort`
-        allows connect to `clickhouse-server` via TCP Native protocol via kubernetes `Service`
-        """
-        return pulumi.get(self, "tcp_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplates']:
-        return pulumi.get(self, "templates")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsPort")
-    def tls_port(self) -> Optional[_builtins.int]:
-        return pulumi.get(self, "tls_port")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "httpPort":
-            suggest = "http_port"
-        elif key == "httpsPort":
-            suggest = "https_port"
-        elif key == "interserverHTTPPort":
-            suggest = "interserver_http_port"
-        elif key == "tcpPort":
-            suggest = "tcp_port"
-        elif key == "tlsPort":
-            suggest = "tls_port"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 files: Optional[Mapping[str, Any]] = None,
-                 http_port: Optional[_builtins.int] = None,
-                 https_port: Optional[_builtins.int] = None,
-                 insecure: Optional[_builtins.str] = None,
-                 interserver_http_port: Optional[_builtins.int] = None,
-                 name: Optional[_builtins.str] = None,
-                 secure: Optional[_builtins.str] = None,
-                 settings: Optional[Mapping[str, Any]] = None,
-                 tcp_port: Optional[_builtins.int] = None,
-                 templates: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatch'] = None,
-                 tls_port: Optional[_builtins.int] = None):
-        """
-        :param Mapping[str, Any] files: optional, allows define content of any setting file inside each `Pod` only in one shard related to current replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-               override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
-        :param _builtins.int http_port: optional, setup `Pod.spec.containers.ports` with name `http` for selected shard, override `chi.spec.templates.hostTemplates.spec.httpPort`
-               allows connect to `clickhouse-server` via HTTP protocol via kubernetes `Service`
-        :param _builtins.str insecure: optional, open insecure ports for cluster, defaults to "yes"
-        :param _builtins.int interserver_http_port: optional, setup `Pod.spec.containers.ports` with name `interserver` for selected shard, override `chi.spec.templates.hostTemplates.spec.interserverHTTPPort`
-               allows connect between replicas inside same shard during fetch replicated data parts HTTP protocol
-        :param _builtins.str name: optional, by default shard name is generated, but you can override it and setup custom name
-        :param _builtins.str secure: optional, open secure ports
-        :param Mapping[str, Any] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one shard related to current replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
-               override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and replica-level `chi.spec.configuration.clusters.layout.replicas.settings`
-               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        :param _builtins.int tcp_port: optional, setup `Pod.spec.containers.ports` with name `tcp` for selected shard, override `chi.spec.templates.hostTemplates.spec.tcpPort`
-               allows connect to `clickhouse-server` via TCP Native protocol via kubernetes `Service`
-        """
-        if files is not None:
-            pulumi.set(__self__, "files", files)
-        if http_port is not None:
-            pulumi.set(__self__, "http_port", http_port)
-        if https_port is not None:
-            pulumi.set(__self__, "https_port", https_port)
-        if insecure is not None:
-            pulumi.set(__self__, "insecure", insecure)
-        if interserver_http_port is not None:
-            pulumi.set(__self__, "interserver_http_port", interserver_http_port)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if secure is not None:
-            pulumi.set(__self__, "secure", secure)
-        if settings is not None:
-            pulumi.set(__self__, "settings", settings)
-        if tcp_port is not None:
-            pulumi.set(__self__, "tcp_port", tcp_port)
-        if templates is not None:
-            pulumi.set(__self__, "templates", templates)
-        if tls_port is not None:
-            pulumi.set(__self__, "tls_port", tls_port)
-
-    @_builtins.property
-    @pulumi.getter
-    def files(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows define content of any setting file inside each `Pod` only in one shard related to current replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-        override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
-        """
-        return pulumi.get(self, "files")
-
-    @_builtins.property
-    @pulumi.getter(name="httpPort")
-    def http_port(self) -> Optional[_builtins.int]:
-        """
-        optional, setup `Pod.spec.containers.ports` with name `http` for selected shard, override `chi.spec.templates.hostTemplates.spec.httpPort`
-        allows connect to `clickhouse-server` via HTTP protocol via kubernetes `Service`
-        """
-        return pulumi.get(self, "http_port")
-
-    @_builtins.property
-    @pulumi.getter(name="httpsPort")
-    def https_port(self) -> Optional[_builtins.int]:
-        return pulumi.get(self, "https_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def insecure(self) -> Optional[_builtins.str]:
-        """
-        optional, open insecure ports for cluster, defaults to "yes"
-        """
-        return pulumi.get(self, "insecure")
-
-    @_builtins.property
-    @pulumi.getter(name="interserverHTTPPort")
-    def interserver_http_port(self) -> Optional[_builtins.int]:
-        """
-        optional, setup `Pod.spec.containers.ports` with name `interserver` for selected shard, override `chi.spec.templates.hostTemplates.spec.interserverHTTPPort`
-        allows connect between replicas inside same shard during fetch replicated data parts HTTP protocol
-        """
-        return pulumi.get(self, "interserver_http_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        optional, by default shard name is generated, but you can override it and setup custom name
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def secure(self) -> Optional[_builtins.str]:
-        """
-        optional, open secure ports
-        """
-        return pulumi.get(self, "secure")
-
-    @_builtins.property
-    @pulumi.getter
-    def settings(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one shard related to current replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
-        override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and replica-level `chi.spec.configuration.clusters.layout.replicas.settings`
-        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        """
-        return pulumi.get(self, "settings")
-
-    @_builtins.property
-    @pulumi.getter(name="tcpPort")
-    def tcp_port(self) -> Optional[_builtins.int]:
-        """
-        optional, setup `Pod.spec.containers.ports` with name `tcp` for selected shard, override `chi.spec.templates.hostTemplates.spec.tcpPort`
-        allows connect to `clickhouse-server` via TCP Native protocol via kubernetes `Service`
-        """
-        return pulumi.get(self, "tcp_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatch']:
-        return pulumi.get(self, "templates")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsPort")
-    def tls_port(self) -> Optional[_builtins.int]:
-        return pulumi.get(self, "tls_port")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplates(dict):
-    """
-    optional, configuration of the templates names which will use for generate Kubernetes resources according to selected replica
-    override top-level `chi.spec.configuration.templates`, cluster-level `chi.spec.configuration.clusters.templates`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates`
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clusterServiceTemplate":
-            suggest = "cluster_service_template"
-        elif key == "dataVolumeClaimTemplate":
-            suggest = "data_volume_claim_template"
-        elif key == "hostTemplate":
-            suggest = "host_template"
-        elif key == "logVolumeClaimTemplate":
-            suggest = "log_volume_claim_template"
-        elif key == "podTemplate":
-            suggest = "pod_template"
-        elif key == "replicaServiceTemplate":
-            suggest = "replica_service_template"
-        elif key == "serviceTemplate":
-            suggest = "service_template"
-        elif key == "serviceTemplates":
-            suggest = "service_templates"
-        elif key == "shardServiceTemplate":
-            suggest = "shard_service_template"
-        elif key == "volumeClaimTemplate":
-            suggest = "volume_claim_template"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplates. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplates.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplates.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cluster_service_template: Optional[_builtins.str] = None,
-                 data_volume_claim_template: Optional[_builtins.str] = None,
-                 host_template: Optional[_builtins.str] = None,
-                 log_volume_claim_template: Optional[_builtins.str] = None,
-                 pod_template: Optional[_builtins.str] = None,
-                 replica_service_template: Optional[_builtins.str] = None,
-                 service_template: Optional[_builtins.str] = None,
-                 service_templates: Optional[Sequence[_builtins.str]] = None,
-                 shard_service_template: Optional[_builtins.str] = None,
-                 volume_claim_template: Optional[_builtins.str] = None):
-        """
-        optional, configuration of the templates names which will use for generate Kubernetes resources according to selected replica
-        override top-level `chi.spec.configuration.templates`, cluster-level `chi.spec.configuration.clusters.templates`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates`
-
-
-        :param _builtins.str cluster_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str data_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str host_template: optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        :param _builtins.str log_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str pod_template: optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str replica_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str service_template: optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param Sequence[_builtins.str] service_templates: optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param _builtins.str shard_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str volume_claim_template: optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        if cluster_service_template is not None:
-            pulumi.set(__self__, "cluster_service_template", cluster_service_template)
-        if data_volume_claim_template is not None:
-            pulumi.set(__self__, "data_volume_claim_template", data_volume_claim_template)
-        if host_template is not None:
-            pulumi.set(__self__, "host_template", host_template)
-        if log_volume_claim_template is not None:
-            pulumi.set(__self__, "log_volume_claim_template", log_volume_claim_template)
-        if pod_template is not None:
-            pulumi.set(__self__, "pod_template", pod_template)
-        if replica_service_template is not None:
-            pulumi.set(__self__, "replica_service_template", replica_service_template)
-        if service_template is not None:
-            pulumi.set(__self__, "service_template", service_template)
-        if service_templates is not None:
-            pulumi.set(__self__, "service_templates", service_templates)
-        if shard_service_template is not None:
-            pulumi.set(__self__, "shard_service_template", shard_service_template)
-        if volume_claim_template is not None:
-            pulumi.set(__self__, "volume_claim_template", volume_claim_template)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterServiceTemplate")
-    def cluster_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "cluster_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="dataVolumeClaimTemplate")
-    def data_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "data_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="hostTemplate")
-    def host_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        """
-        return pulumi.get(self, "host_template")
-
-    @_builtins.property
-    @pulumi.getter(name="logVolumeClaimTemplate")
-    def log_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "log_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="podTemplate")
-    def pod_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "pod_template")
-
-    @_builtins.property
-    @pulumi.getter(name="replicaServiceTemplate")
-    def replica_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "replica_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplate")
-    def service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplates")
-    def service_templates(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="shardServiceTemplate")
-    def shard_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "shard_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="volumeClaimTemplate")
-    def volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "volume_claim_template")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatch(dict):
-    """
-    optional, configuration of the templates names which will use for generate Kubernetes resources according to selected replica
-    override top-level `chi.spec.configuration.templates`, cluster-level `chi.spec.configuration.clusters.templates`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates`
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clusterServiceTemplate":
-            suggest = "cluster_service_template"
-        elif key == "dataVolumeClaimTemplate":
-            suggest = "data_volume_claim_template"
-        elif key == "hostTemplate":
-            suggest = "host_template"
-        elif key == "logVolumeClaimTemplate":
-            suggest = "log_volume_claim_template"
-        elif key == "podTemplate":
-            suggest = "pod_template"
-        elif key == "replicaServiceTemplate":
-            suggest = "replica_service_template"
-        elif key == "serviceTemplate":
-            suggest = "service_template"
-        elif key == "serviceTemplates":
-            suggest = "service_templates"
-        elif key == "shardServiceTemplate":
-            suggest = "shard_service_template"
-        elif key == "volumeClaimTemplate":
-            suggest = "volume_claim_template"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cluster_service_template: Optional[_builtins.str] = None,
-                 data_volume_claim_template: Optional[_builtins.str] = None,
-                 host_template: Optional[_builtins.str] = None,
-                 log_volume_claim_template: Optional[_builtins.str] = None,
-                 pod_template: Optional[_builtins.str] = None,
-                 replica_service_template: Optional[_builtins.str] = None,
-                 service_template: Optional[_builtins.str] = None,
-                 service_templates: Optional[Sequence[_builtins.str]] = None,
-                 shard_service_template: Optional[_builtins.str] = None,
-                 volume_claim_template: Optional[_builtins.str] = None):
-        """
-        optional, configuration of the templates names which will use for generate Kubernetes resources according to selected replica
-        override top-level `chi.spec.configuration.templates`, cluster-level `chi.spec.configuration.clusters.templates`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates`
-
-
-        :param _builtins.str cluster_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str data_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str host_template: optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        :param _builtins.str log_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str pod_template: optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str replica_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str service_template: optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param Sequence[_builtins.str] service_templates: optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param _builtins.str shard_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str volume_claim_template: optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        if cluster_service_template is not None:
-            pulumi.set(__self__, "cluster_service_template", cluster_service_template)
-        if data_volume_claim_template is not None:
-            pulumi.set(__self__, "data_volume_claim_template", data_volume_claim_template)
-        if host_template is not None:
-            pulumi.set(__self__, "host_template", host_template)
-        if log_volume_claim_template is not None:
-            pulumi.set(__self__, "log_volume_claim_template", log_volume_claim_template)
-        if pod_template is not None:
-            pulumi.set(__self__, "pod_template", pod_template)
-        if replica_service_template is not None:
-            pulumi.set(__self__, "replica_service_template", replica_service_template)
-        if service_template is not None:
-            pulumi.set(__self__, "service_template", service_template)
-        if service_templates is not None:
-            pulumi.set(__self__, "service_templates", service_templates)
-        if shard_service_template is not None:
-            pulumi.set(__self__, "shard_service_template", shard_service_template)
-        if volume_claim_template is not None:
-            pulumi.set(__self__, "volume_claim_template", volume_claim_template)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterServiceTemplate")
-    def cluster_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "cluster_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="dataVolumeClaimTemplate")
-    def data_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "data_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="hostTemplate")
-    def host_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        """
-        return pulumi.get(self, "host_template")
-
-    @_builtins.property
-    @pulumi.getter(name="logVolumeClaimTemplate")
-    def log_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "log_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="podTemplate")
-    def pod_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "pod_template")
-
-    @_builtins.property
-    @pulumi.getter(name="replicaServiceTemplate")
-    def replica_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "replica_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplate")
-    def service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplates")
-    def service_templates(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="shardServiceTemplate")
-    def shard_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "shard_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="volumeClaimTemplate")
-    def volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "volume_claim_template")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplates(dict):
-    """
-    optional, configuration of the templates names which will use for generate Kubernetes resources according to selected replica
-    override top-level `chi.spec.configuration.templates`, cluster-level `chi.spec.configuration.clusters.templates`
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clusterServiceTemplate":
-            suggest = "cluster_service_template"
-        elif key == "dataVolumeClaimTemplate":
-            suggest = "data_volume_claim_template"
-        elif key == "hostTemplate":
-            suggest = "host_template"
-        elif key == "logVolumeClaimTemplate":
-            suggest = "log_volume_claim_template"
-        elif key == "podTemplate":
-            suggest = "pod_template"
-        elif key == "replicaServiceTemplate":
-            suggest = "replica_service_template"
-        elif key == "serviceTemplate":
-            suggest = "service_template"
-        elif key == "serviceTemplates":
-            suggest = "service_templates"
-        elif key == "shardServiceTemplate":
-            suggest = "shard_service_template"
-        elif key == "volumeClaimTemplate":
-            suggest = "volume_claim_template"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplates. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplates.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplates.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cluster_service_template: Optional[_builtins.str] = None,
-                 data_volume_claim_template: Optional[_builtins.str] = None,
-                 host_template: Optional[_builtins.str] = None,
-                 log_volume_claim_template: Optional[_builtins.str] = None,
-                 pod_template: Optional[_builtins.str] = None,
-                 replica_service_template: Optional[_builtins.str] = None,
-                 service_template: Optional[_builtins.str] = None,
-                 service_templates: Optional[Sequence[_builtins.str]] = None,
-                 shard_service_template: Optional[_builtins.str] = None,
-                 volume_claim_template: Optional[_builtins.str] = None):
-        """
-        optional, configuration of the templates names which will use for generate Kubernetes resources according to selected replica
-        override top-level `chi.spec.configuration.templates`, cluster-level `chi.spec.configuration.clusters.templates`
-
-
-        :param _builtins.str cluster_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str data_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str host_template: optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        :param _builtins.str log_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str pod_template: optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str replica_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str service_template: optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param Sequence[_builtins.str] service_templates: optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param _builtins.str shard_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str volume_claim_template: optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        if cluster_service_template is not None:
-            pulumi.set(__self__, "cluster_service_template", cluster_service_template)
-        if data_volume_claim_template is not None:
-            pulumi.set(__self__, "data_volume_claim_template", data_volume_claim_template)
-        if host_template is not None:
-            pulumi.set(__self__, "host_template", host_template)
-        if log_volume_claim_template is not None:
-            pulumi.set(__self__, "log_volume_claim_template", log_volume_claim_template)
-        if pod_template is not None:
-            pulumi.set(__self__, "pod_template", pod_template)
-        if replica_service_template is not None:
-            pulumi.set(__self__, "replica_service_template", replica_service_template)
-        if service_template is not None:
-            pulumi.set(__self__, "service_template", service_template)
-        if service_templates is not None:
-            pulumi.set(__self__, "service_templates", service_templates)
-        if shard_service_template is not None:
-            pulumi.set(__self__, "shard_service_template", shard_service_template)
-        if volume_claim_template is not None:
-            pulumi.set(__self__, "volume_claim_template", volume_claim_template)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterServiceTemplate")
-    def cluster_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "cluster_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="dataVolumeClaimTemplate")
-    def data_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "data_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="hostTemplate")
-    def host_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        """
-        return pulumi.get(self, "host_template")
-
-    @_builtins.property
-    @pulumi.getter(name="logVolumeClaimTemplate")
-    def log_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "log_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="podTemplate")
-    def pod_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "pod_template")
-
-    @_builtins.property
-    @pulumi.getter(name="replicaServiceTemplate")
-    def replica_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "replica_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplate")
-    def service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplates")
-    def service_templates(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="shardServiceTemplate")
-    def shard_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "shard_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="volumeClaimTemplate")
-    def volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "volume_claim_template")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatch(dict):
-    """
-    optional, configuration of the templates names which will use for generate Kubernetes resources according to selected replica
-    override top-level `chi.spec.configuration.templates`, cluster-level `chi.spec.configuration.clusters.templates`
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clusterServiceTemplate":
-            suggest = "cluster_service_template"
-        elif key == "dataVolumeClaimTemplate":
-            suggest = "data_volume_claim_template"
-        elif key == "hostTemplate":
-            suggest = "host_template"
-        elif key == "logVolumeClaimTemplate":
-            suggest = "log_volume_claim_template"
-        elif key == "podTemplate":
-            suggest = "pod_template"
-        elif key == "replicaServiceTemplate":
-            suggest = "replica_service_template"
-        elif key == "serviceTemplate":
-            suggest = "service_template"
-        elif key == "serviceTemplates":
-            suggest = "service_templates"
-        elif key == "shardServiceTemplate":
-            suggest = "shard_service_template"
-        elif key == "volumeClaimTemplate":
-            suggest = "volume_claim_template"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cluster_service_template: Optional[_builtins.str] = None,
-                 data_volume_claim_template: Optional[_builtins.str] = None,
-                 host_template: Optional[_builtins.str] = None,
-                 log_volume_claim_template: Optional[_builtins.str] = None,
-                 pod_template: Optional[_builtins.str] = None,
-                 replica_service_template: Optional[_builtins.str] = None,
-                 service_template: Optional[_builtins.str] = None,
-                 service_templates: Optional[Sequence[_builtins.str]] = None,
-                 shard_service_template: Optional[_builtins.str] = None,
-                 volume_claim_template: Optional[_builtins.str] = None):
-        """
-        optional, configuration of the templates names which will use for generate Kubernetes resources according to selected replica
-        override top-level `chi.spec.configuration.templates`, cluster-level `chi.spec.configuration.clusters.templates`
-
-
-        :param _builtins.str cluster_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str data_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str host_template: optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        :param _builtins.str log_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str pod_template: optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str replica_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str service_template: optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param Sequence[_builtins.str] service_templates: optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param _builtins.str shard_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str volume_claim_template: optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        if cluster_service_template is not None:
-            pulumi.set(__self__, "cluster_service_template", cluster_service_template)
-        if data_volume_claim_template is not None:
-            pulumi.set(__self__, "data_volume_claim_template", data_volume_claim_template)
-        if host_template is not None:
-            pulumi.set(__self__, "host_template", host_template)
-        if log_volume_claim_template is not None:
-            pulumi.set(__self__, "log_volume_claim_template", log_volume_claim_template)
-        if pod_template is not None:
-            pulumi.set(__self__, "pod_template", pod_template)
-        if replica_service_template is not None:
-            pulumi.set(__self__, "replica_service_template", replica_service_template)
-        if service_template is not None:
-            pulumi.set(__self__, "service_template", service_template)
-        if service_templates is not None:
-            pulumi.set(__self__, "service_templates", service_templates)
-        if shard_service_template is not None:
-            pulumi.set(__self__, "shard_service_template", shard_service_template)
-        if volume_claim_template is not None:
-            pulumi.set(__self__, "volume_claim_template", volume_claim_template)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterServiceTemplate")
-    def cluster_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "cluster_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="dataVolumeClaimTemplate")
-    def data_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "data_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="hostTemplate")
-    def host_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        """
-        return pulumi.get(self, "host_template")
-
-    @_builtins.property
-    @pulumi.getter(name="logVolumeClaimTemplate")
-    def log_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "log_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="podTemplate")
-    def pod_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "pod_template")
-
-    @_builtins.property
-    @pulumi.getter(name="replicaServiceTemplate")
-    def replica_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "replica_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplate")
-    def service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplates")
-    def service_templates(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="shardServiceTemplate")
-    def shard_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "shard_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="volumeClaimTemplate")
-    def volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "volume_claim_template")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersLayoutShards(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "definitionType":
-            suggest = "definition_type"
-        elif key == "internalReplication":
-            suggest = "internal_replication"
-        elif key == "replicasCount":
-            suggest = "replicas_count"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutShards. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutShards.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutShards.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 definition_type: Optional[_builtins.str] = None,
-                 files: Optional[Mapping[str, Any]] = None,
-                 internal_replication: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 replicas: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicas']] = None,
-                 replicas_count: Optional[_builtins.int] = None,
-                 settings: Optional[Mapping[str, Any]] = None,
-                 templates: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplates'] = None,
-                 weight: Optional[_builtins.int] = None):
-        """
-        :param _builtins.str definition_type: DEPRECATED - to be removed soon
-        :param Mapping[str, Any] files: optional, allows define content of any setting file inside each `Pod` only in one shard during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-               override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`
-        :param _builtins.str internal_replication: optional, `true` by default when `chi.spec.configuration.clusters[].layout.ReplicaCount` > 1 and 0 otherwise
-               allows setup <internal_replication> setting which will use during insert into tables with `Distributed` engine for insert only in one live replica and other replicas will download inserted data during replication,
-               will apply in <remote_servers> inside ConfigMap which will mount in /etc/clickhouse-server/config.d/chop-generated-remote_servers.xml
-               More details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
-        :param _builtins.str name: optional, by default shard name is generated, but you can override it and setup custom name
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasArgs'] replicas: optional, allows override behavior for selected replicas from cluster-level `chi.spec.configuration.clusters` and shard-level `chi.spec.configuration.clusters.layout.shards`
-        :param _builtins.int replicas_count: optional, how much replicas in selected shard for selected ClickHouse cluster will run in Kubernetes, each replica is a separate `StatefulSet` which contains only one `Pod` with `clickhouse-server` instance,
-               shard contains 1 replica by default
-               override cluster-level `chi.spec.configuration.clusters.layout.replicasCount`
-        :param Mapping[str, Any] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` only in one shard during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
-               override top-level `chi.spec.configuration.settings` and cluster-level `chi.spec.configuration.clusters.settings`
-               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        :param _builtins.int weight: optional, 1 by default, allows setup shard <weight> setting which will use during insert into tables with `Distributed` engine,
-               will apply in <remote_servers> inside ConfigMap which will mount in /etc/clickhouse-server/config.d/chop-generated-remote_servers.xml
-               More details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
-        """
-        if definition_type is not None:
-            pulumi.set(__self__, "definition_type", definition_type)
-        if files is not None:
-            pulumi.set(__self__, "files", files)
-        if internal_replication is not None:
-            pulumi.set(__self__, "internal_replication", internal_replication)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if replicas is not None:
-            pulumi.set(__self__, "replicas", replicas)
-        if replicas_count is not None:
-            pulumi.set(__self__, "replicas_count", replicas_count)
-        if settings is not None:
-            pulumi.set(__self__, "settings", settings)
-        if templates is not None:
-            pulumi.set(__self__, "templates", templates)
-        if weight is not None:
-            pulumi.set(__self__, "weight", weight)
-
-    @_builtins.property
-    @pulumi.getter(name="definitionType")
-    def definition_type(self) -> Optional[_builtins.str]:
-        """
-        DEPRECATED - to be removed soon
-        """
-        return pulumi.get(self, "definition_type")
-
-    @_builtins.property
-    @pulumi.getter
-    def files(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows define content of any setting file inside each `Pod` only in one shard during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-        override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`
-        """
-        return pulumi.get(self, "files")
-
-    @_builtins.property
-    @pulumi.getter(name="internalReplication")
-    def internal_replication(self) -> Optional[_builtins.str]:
-        """
-        optional, `true` by default when `chi.spec.configuration.clusters[].layout.ReplicaCount` > 1 and 0 otherwise
-        allows setup <internal_replication> setting which will use during insert into tables with `Distributed` engine for insert only in one live replica and other replicas will download inserted data during replication,
-        will apply in <remote_servers> inside ConfigMap which will mount in /etc/clickhouse-server/config.d/chop-generated-remote_servers.xml
-        More details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
-        """
-        return pulumi.get(self, "internal_replication")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        optional, by default shard name is generated, but you can override it and setup custom name
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def replicas(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicas']]:
-        """
-        optional, allows override behavior for selected replicas from cluster-level `chi.spec.configuration.clusters` and shard-level `chi.spec.configuration.clusters.layout.shards`
-        """
-        return pulumi.get(self, "replicas")
-
-    @_builtins.property
-    @pulumi.getter(name="replicasCount")
-    def replicas_count(self) -> Optional[_builtins.int]:
-        """
-        optional, how much replicas in selected shard for selected ClickHouse cluster will run in Kubernetes, each replica is a separate `StatefulSet` which contains only one `Pod` with `clickhouse-server` instance,
-        shard contains 1 replica by default
-        override cluster-level `chi.spec.configuration.clusters.layout.replicasCount`
-        """
-        return pulumi.get(self, "replicas_count")
-
-    @_builtins.property
-    @pulumi.getter
-    def settings(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` only in one shard during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
-        override top-level `chi.spec.configuration.settings` and cluster-level `chi.spec.configuration.clusters.settings`
-        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        """
-        return pulumi.get(self, "settings")
-
-    @_builtins.property
-    @pulumi.getter
-    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplates']:
-        return pulumi.get(self, "templates")
-
-    @_builtins.property
-    @pulumi.getter
-    def weight(self) -> Optional[_builtins.int]:
-        """
-        optional, 1 by default, allows setup shard <weight> setting which will use during insert into tables with `Distributed` engine,
-        will apply in <remote_servers> inside ConfigMap which will mount in /etc/clickhouse-server/config.d/chop-generated-remote_servers.xml
-        More details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
-        """
-        return pulumi.get(self, "weight")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "definitionType":
-            suggest = "definition_type"
-        elif key == "internalReplication":
-            suggest = "internal_replication"
-        elif key == "replicasCount":
-            suggest = "replicas_count"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 definition_type: Optional[_builtins.str] = None,
-                 files: Optional[Mapping[str, Any]] = None,
-                 internal_replication: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 replicas: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatch']] = None,
-                 replicas_count: Optional[_builtins.int] = None,
-                 settings: Optional[Mapping[str, Any]] = None,
-                 templates: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatch'] = None,
-                 weight: Optional[_builtins.int] = None):
-        """
-        :param _builtins.str definition_type: DEPRECATED - to be removed soon
-        :param Mapping[str, Any] files: optional, allows define content of any setting file inside each `Pod` only in one shard during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-               override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`
-        :param _builtins.str internal_replication: optional, `true` by default when `chi.spec.configuration.clusters[].layout.ReplicaCount` > 1 and 0 otherwise
-               allows setup <internal_replication> setting which will use during insert into tables with `Distributed` engine for insert only in one live replica and other replicas will download inserted data during replication,
-               will apply in <remote_servers> inside ConfigMap which will mount in /etc/clickhouse-server/config.d/chop-generated-remote_servers.xml
-               More details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
-        :param _builtins.str name: optional, by default shard name is generated, but you can override it and setup custom name
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatchArgs'] replicas: optional, allows override behavior for selected replicas from cluster-level `chi.spec.configuration.clusters` and shard-level `chi.spec.configuration.clusters.layout.shards`
-        :param _builtins.int replicas_count: optional, how much replicas in selected shard for selected ClickHouse cluster will run in Kubernetes, each replica is a separate `StatefulSet` which contains only one `Pod` with `clickhouse-server` instance,
-               shard contains 1 replica by default
-               override cluster-level `chi.spec.configuration.clusters.layout.replicasCount`
-        :param Mapping[str, Any] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` only in one shard during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
-               override top-level `chi.spec.configuration.settings` and cluster-level `chi.spec.configuration.clusters.settings`
-               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        :param _builtins.int weight: optional, 1 by default, allows setup shard <weight> setting which will use during insert into tables with `Distributed` engine,
-               will apply in <remote_servers> inside ConfigMap which will mount in /etc/clickhouse-server/config.d/chop-generated-remote_servers.xml
-               More details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
-        """
-        if definition_type is not None:
-            pulumi.set(__self__, "definition_type", definition_type)
-        if files is not None:
-            pulumi.set(__self__, "files", files)
-        if internal_replication is not None:
-            pulumi.set(__self__, "internal_replication", internal_replication)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if replicas is not None:
-            pulumi.set(__self__, "replicas", replicas)
-        if replicas_count is not None:
-            pulumi.set(__self__, "replicas_count", replicas_count)
-        if settings is not None:
-            pulumi.set(__self__, "settings", settings)
-        if templates is not None:
-            pulumi.set(__self__, "templates", templates)
-        if weight is not None:
-            pulumi.set(__self__, "weight", weight)
-
-    @_builtins.property
-    @pulumi.getter(name="definitionType")
-    def definition_type(self) -> Optional[_builtins.str]:
-        """
-        DEPRECATED - to be removed soon
-        """
-        return pulumi.get(self, "definition_type")
-
-    @_builtins.property
-    @pulumi.getter
-    def files(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows define content of any setting file inside each `Pod` only in one shard during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-        override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`
-        """
-        return pulumi.get(self, "files")
-
-    @_builtins.property
-    @pulumi.getter(name="internalReplication")
-    def internal_replication(self) -> Optional[_builtins.str]:
-        """
-        optional, `true` by default when `chi.spec.configuration.clusters[].layout.ReplicaCount` > 1 and 0 otherwise
-        allows setup <internal_replication> setting which will use during insert into tables with `Distributed` engine for insert only in one live replica and other replicas will download inserted data during replication,
-        will apply in <remote_servers> inside ConfigMap which will mount in /etc/clickhouse-server/config.d/chop-generated-remote_servers.xml
-        More details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
-        """
-        return pulumi.get(self, "internal_replication")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        optional, by default shard name is generated, but you can override it and setup custom name
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def replicas(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatch']]:
-        """
-        optional, allows override behavior for selected replicas from cluster-level `chi.spec.configuration.clusters` and shard-level `chi.spec.configuration.clusters.layout.shards`
-        """
-        return pulumi.get(self, "replicas")
-
-    @_builtins.property
-    @pulumi.getter(name="replicasCount")
-    def replicas_count(self) -> Optional[_builtins.int]:
-        """
-        optional, how much replicas in selected shard for selected ClickHouse cluster will run in Kubernetes, each replica is a separate `StatefulSet` which contains only one `Pod` with `clickhouse-server` instance,
-        shard contains 1 replica by default
-        override cluster-level `chi.spec.configuration.clusters.layout.replicasCount`
-        """
-        return pulumi.get(self, "replicas_count")
-
-    @_builtins.property
-    @pulumi.getter
-    def settings(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` only in one shard during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
-        override top-level `chi.spec.configuration.settings` and cluster-level `chi.spec.configuration.clusters.settings`
-        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        """
-        return pulumi.get(self, "settings")
-
-    @_builtins.property
-    @pulumi.getter
-    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatch']:
-        return pulumi.get(self, "templates")
-
-    @_builtins.property
-    @pulumi.getter
-    def weight(self) -> Optional[_builtins.int]:
-        """
-        optional, 1 by default, allows setup shard <weight> setting which will use during insert into tables with `Distributed` engine,
-        will apply in <remote_servers> inside ConfigMap which will mount in /etc/clickhouse-server/config.d/chop-generated-remote_servers.xml
-        More details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
-        """
-        return pulumi.get(self, "weight")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicas(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "httpPort":
-            suggest = "http_port"
-        elif key == "httpsPort":
-            suggest = "https_port"
-        elif key == "interserverHTTPPort":
-            suggest = "interserver_http_port"
-        elif key == "tcpPort":
-            suggest = "tcp_port"
-        elif key == "tlsPort":
-            suggest = "tls_port"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicas. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicas.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicas.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 files: Optional[Mapping[str, Any]] = None,
-                 http_port: Optional[_builtins.int] = None,
-                 https_port: Optional[_builtins.int] = None,
-                 insecure: Optional[_builtins.str] = None,
-                 interserver_http_port: Optional[_builtins.int] = None,
-                 name: Optional[_builtins.str] = None,
-                 secure: Optional[_builtins.str] = None,
-                 settings: Optional[Mapping[str, Any]] = None,
-                 tcp_port: Optional[_builtins.int] = None,
-                 templates: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplates'] = None,
-                 tls_port: Optional[_builtins.int] = None):
-        """
-        :param Mapping[str, Any] files: optional, allows define content of any setting file inside `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-               override top-level `chi.spec.configuration.files`, cluster-level `chi.spec.configuration.clusters.files` and shard-level `chi.spec.configuration.clusters.layout.shards.files`
-        :param _builtins.int http_port: optional, setup `Pod.spec.containers.ports` with name `http` for selected replica, override `chi.spec.templates.hostTemplates.spec.httpPort`
-               allows connect to `clickhouse-server` via HTTP protocol via kubernetes `Service`
-        :param _builtins.str insecure: optional, open insecure ports for cluster, defaults to "yes"
-        :param _builtins.int interserver_http_port: optional, setup `Pod.spec.containers.ports` with name `interserver` for selected replica, override `chi.spec.templates.hostTemplates.spec.interserverHTTPPort`
-               allows connect between replicas inside same shard during fetch replicated data parts HTTP protocol
-        :param _builtins.str name: optional, by default replica name is generated, but you can override it and setup custom name
-        :param _builtins.str secure: optional, open secure ports
-        :param Mapping[str, Any] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
-               override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and shard-level `chi.spec.configuration.clusters.layout.shards.settings`
-               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        :param _builtins.int tcp_port: optional, setup `Pod.spec.containers.ports` with name `tcp` for selected replica, override `chi.spec.templates.hostTemplates.spec.tcpPort`
-               allows connect to `clickhouse-server` via TCP Native protocol via kubernetes `Service`
-        """
-        if files is not None:
-            pulumi.set(__self__, "files", files)
-        if http_port is not None:
-            pulumi.set(__self__, "http_port", http_port)
-        if https_port is not None:
-            pulumi.set(__self__, "https_port", https_port)
-        if insecure is not None:
-            pulumi.set(__self__, "insecure", insecure)
-        if interserver_http_port is not None:
-            pulumi.set(__self__, "interserver_http_port", interserver_http_port)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if secure is not None:
-            pulumi.set(__self__, "secure", secure)
-        if settings is not None:
-            pulumi.set(__self__, "settings", settings)
-        if tcp_port is not None:
-            pulumi.set(__self__, "tcp_port", tcp_port)
-        if templates is not None:
-            pulumi.set(__self__, "templates", templates)
-        if tls_port is not None:
-            pulumi.set(__self__, "tls_port", tls_port)
-
-    @_builtins.property
-    @pulumi.getter
-    def files(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows define content of any setting file inside `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-        override top-level `chi.spec.configuration.files`, cluster-level `chi.spec.configuration.clusters.files` and shard-level `chi.spec.configuration.clusters.layout.shards.files`
-        """
-        return pulumi.get(self, "files")
-
-    @_builtins.property
-    @pulumi.getter(name="httpPort")
-    def http_port(self) -> Optional[_builtins.int]:
-        """
-        optional, setup `Pod.spec.containers.ports` with name `http` for selected replica, override `chi.spec.templates.hostTemplates.spec.httpPort`
-        allows connect to `clickhouse-server` via HTTP protocol via kubernetes `Service`
-        """
-        return pulumi.get(self, "http_port")
-
-    @_builtins.property
-    @pulumi.getter(name="httpsPort")
-    def https_port(self) -> Optional[_builtins.int]:
-        return pulumi.get(self, "https_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def insecure(self) -> Optional[_builtins.str]:
-        """
-        optional, open insecure ports for cluster, defaults to "yes"
-        """
-        return pulumi.get(self, "insecure")
-
-    @_builtins.property
-    @pulumi.getter(name="interserverHTTPPort")
-    def interserver_http_port(self) -> Optional[_builtins.int]:
-        """
-        optional, setup `Pod.spec.containers.ports` with name `interserver` for selected replica, override `chi.spec.templates.hostTemplates.spec.interserverHTTPPort`
-        allows connect between replicas inside same shard during fetch replicated data parts HTTP protocol
-        """
-        return pulumi.get(self, "interserver_http_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        optional, by default replica name is generated, but you can override it and setup custom name
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def secure(self) -> Optional[_builtins.str]:
-        """
-        optional, open secure ports
-        """
-        return pulumi.get(self, "secure")
-
-    @_builtins.property
-    @pulumi.getter
-    def settings(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
-        override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and shard-level `chi.spec.configuration.clusters.layout.shards.settings`
-        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        """
-        return pulumi.get(self, "settings")
-
-    @_builtins.property
-    @pulumi.getter(name="tcpPort")
-    def tcp_port(self) -> Optional[_builtins.int]:
-        """
-        optional, setup `Pod.spec.containers.ports` with name `tcp` for selected replica, override `chi.spec.templates.hostTemplates.spec.tcpPort`
-        allows connect to `clickhouse-server` via TCP Native protocol via kubernetes `Service`
-        """
-        return pulumi.get(self, "tcp_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplates']:
-        return pulumi.get(self, "templates")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsPort")
-    def tls_port(self) -> Optional[_builtins.int]:
-        return pulumi.get(self, "tls_port")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "httpPort":
-            suggest = "http_port"
-        elif key == "httpsPort":
-            suggest = "https_port"
-        elif key == "interserverHTTPPort":
-            suggest = "interserver_http_port"
-        elif key == "tcpPort":
-            suggest = "tcp_port"
-        elif key == "tlsPort":
-            suggest = "tls_port"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 files: Optional[Mapping[str, Any]] = None,
-                 http_port: Optional[_builtins.int] = None,
-                 https_port: Optional[_builtins.int] = None,
-                 insecure: Optional[_builtins.str] = None,
-                 interserver_http_port: Optional[_builtins.int] = None,
-                 name: Optional[_builtins.str] = None,
-                 secure: Optional[_builtins.str] = None,
-                 settings: Optional[Mapping[str, Any]] = None,
-                 tcp_port: Optional[_builtins.int] = None,
-                 templates: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatch'] = None,
-                 tls_port: Optional[_builtins.int] = None):
-        """
-        :param Mapping[str, Any] files: optional, allows define content of any setting file inside `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-               override top-level `chi.spec.configuration.files`, cluster-level `chi.spec.configuration.clusters.files` and shard-level `chi.spec.configuration.clusters.layout.shards.files`
-        :param _builtins.int http_port: optional, setup `Pod.spec.containers.ports` with name `http` for selected replica, override `chi.spec.templates.hostTemplates.spec.httpPort`
-               allows connect to `clickhouse-server` via HTTP protocol via kubernetes `Service`
-        :param _builtins.str insecure: optional, open insecure ports for cluster, defaults to "yes"
-        :param _builtins.int interserver_http_port: optional, setup `Pod.spec.containers.ports` with name `interserver` for selected replica, override `chi.spec.templates.hostTemplates.spec.interserverHTTPPort`
-               allows connect between replicas inside same shard during fetch replicated data parts HTTP protocol
-        :param _builtins.str name: optional, by default replica name is generated, but you can override it and setup custom name
-        :param _builtins.str secure: optional, open secure ports
-        :param Mapping[str, Any] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
-               override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and shard-level `chi.spec.configuration.clusters.layout.shards.settings`
-               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        :param _builtins.int tcp_port: optional, setup `Pod.spec.containers.ports` with name `tcp` for selected replica, override `chi.spec.templates.hostTemplates.spec.tcpPort`
-               allows connect to `clickhouse-server` via TCP Native protocol via kubernetes `Service`
-        """
-        if files is not None:
-            pulumi.set(__self__, "files", files)
-        if http_port is not None:
-            pulumi.set(__self__, "http_port", http_port)
-        if https_port is not None:
-            pulumi.set(__self__, "https_port", https_port)
-        if insecure is not None:
-            pulumi.set(__self__, "insecure", insecure)
-        if interserver_http_port is not None:
-            pulumi.set(__self__, "interserver_http_port", interserver_http_port)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if secure is not None:
-            pulumi.set(__self__, "secure", secure)
-        if settings is not None:
-            pulumi.set(__self__, "settings", settings)
-        if tcp_port is not None:
-            pulumi.set(__self__, "tcp_port", tcp_port)
-        if templates is not None:
-            pulumi.set(__self__, "templates", templates)
-        if tls_port is not None:
-            pulumi.set(__self__, "tls_port", tls_port)
-
-    @_builtins.property
-    @pulumi.getter
-    def files(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows define content of any setting file inside `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-        override top-level `chi.spec.configuration.files`, cluster-level `chi.spec.configuration.clusters.files` and shard-level `chi.spec.configuration.clusters.layout.shards.files`
-        """
-        return pulumi.get(self, "files")
-
-    @_builtins.property
-    @pulumi.getter(name="httpPort")
-    def http_port(self) -> Optional[_builtins.int]:
-        """
-        optional, setup `Pod.spec.containers.ports` with name `http` for selected replica, override `chi.spec.templates.hostTemplates.spec.httpPort`
-        allows connect to `clickhouse-server` via HTTP protocol via kubernetes `Service`
-        """
-        return pulumi.get(self, "http_port")
-
-    @_builtins.property
-    @pulumi.getter(name="httpsPort")
-    def https_port(self) -> Optional[_builtins.int]:
-        return pulumi.get(self, "https_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def insecure(self) -> Optional[_builtins.str]:
-        """
-        optional, open insecure ports for cluster, defaults to "yes"
-        """
-        return pulumi.get(self, "insecure")
-
-    @_builtins.property
-    @pulumi.getter(name="interserverHTTPPort")
-    def interserver_http_port(self) -> Optional[_builtins.int]:
-        """
-        optional, setup `Pod.spec.containers.ports` with name `interserver` for selected replica, override `chi.spec.templates.hostTemplates.spec.interserverHTTPPort`
-        allows connect between replicas inside same shard during fetch replicated data parts HTTP protocol
-        """
-        return pulumi.get(self, "interserver_http_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        optional, by default replica name is generated, but you can override it and setup custom name
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def secure(self) -> Optional[_builtins.str]:
-        """
-        optional, open secure ports
-        """
-        return pulumi.get(self, "secure")
-
-    @_builtins.property
-    @pulumi.getter
-    def settings(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
-        override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and shard-level `chi.spec.configuration.clusters.layout.shards.settings`
-        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        """
-        return pulumi.get(self, "settings")
-
-    @_builtins.property
-    @pulumi.getter(name="tcpPort")
-    def tcp_port(self) -> Optional[_builtins.int]:
-        """
-        optional, setup `Pod.spec.containers.ports` with name `tcp` for selected replica, override `chi.spec.templates.hostTemplates.spec.tcpPort`
-        allows connect to `clickhouse-server` via TCP Native protocol via kubernetes `Service`
-        """
-        return pulumi.get(self, "tcp_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatch']:
-        return pulumi.get(self, "templates")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsPort")
-    def tls_port(self) -> Optional[_builtins.int]:
-        return pulumi.get(self, "tls_port")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplates(dict):
-    """
-    optional, configuration of the templates names which will use for generate Kubernetes resources according to selected replica
-    override top-level `chi.spec.configuration.templates`, cluster-level `chi.spec.configuration.clusters.templates` and shard-level `chi.spec.configuration.clusters.layout.shards.templates`
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clusterServiceTemplate":
-            suggest = "cluster_service_template"
-        elif key == "dataVolumeClaimTemplate":
-            suggest = "data_volume_claim_template"
-        elif key == "hostTemplate":
-            suggest = "host_template"
-        elif key == "logVolumeClaimTemplate":
-            suggest = "log_volume_claim_template"
-        elif key == "podTemplate":
-            suggest = "pod_template"
-        elif key == "replicaServiceTemplate":
-            suggest = "replica_service_template"
-        elif key == "serviceTemplate":
-            suggest = "service_template"
-        elif key == "serviceTemplates":
-            suggest = "service_templates"
-        elif key == "shardServiceTemplate":
-            suggest = "shard_service_template"
-        elif key == "volumeClaimTemplate":
-            suggest = "volume_claim_template"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplates. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplates.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplates.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cluster_service_template: Optional[_builtins.str] = None,
-                 data_volume_claim_template: Optional[_builtins.str] = None,
-                 host_template: Optional[_builtins.str] = None,
-                 log_volume_claim_template: Optional[_builtins.str] = None,
-                 pod_template: Optional[_builtins.str] = None,
-                 replica_service_template: Optional[_builtins.str] = None,
-                 service_template: Optional[_builtins.str] = None,
-                 service_templates: Optional[Sequence[_builtins.str]] = None,
-                 shard_service_template: Optional[_builtins.str] = None,
-                 volume_claim_template: Optional[_builtins.str] = None):
-        """
-        optional, configuration of the templates names which will use for generate Kubernetes resources according to selected replica
-        override top-level `chi.spec.configuration.templates`, cluster-level `chi.spec.configuration.clusters.templates` and shard-level `chi.spec.configuration.clusters.layout.shards.templates`
-
-
-        :param _builtins.str cluster_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str data_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str host_template: optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        :param _builtins.str log_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str pod_template: optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str replica_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str service_template: optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param Sequence[_builtins.str] service_templates: optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param _builtins.str shard_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str volume_claim_template: optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        if cluster_service_template is not None:
-            pulumi.set(__self__, "cluster_service_template", cluster_service_template)
-        if data_volume_claim_template is not None:
-            pulumi.set(__self__, "data_volume_claim_template", data_volume_claim_template)
-        if host_template is not None:
-            pulumi.set(__self__, "host_template", host_template)
-        if log_volume_claim_template is not None:
-            pulumi.set(__self__, "log_volume_claim_template", log_volume_claim_template)
-        if pod_template is not None:
-            pulumi.set(__self__, "pod_template", pod_template)
-        if replica_service_template is not None:
-            pulumi.set(__self__, "replica_service_template", replica_service_template)
-        if service_template is not None:
-            pulumi.set(__self__, "service_template", service_template)
-        if service_templates is not None:
-            pulumi.set(__self__, "service_templates", service_templates)
-        if shard_service_template is not None:
-            pulumi.set(__self__, "shard_service_template", shard_service_template)
-        if volume_claim_template is not None:
-            pulumi.set(__self__, "volume_claim_template", volume_claim_template)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterServiceTemplate")
-    def cluster_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "cluster_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="dataVolumeClaimTemplate")
-    def data_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "data_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="hostTemplate")
-    def host_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        """
-        return pulumi.get(self, "host_template")
-
-    @_builtins.property
-    @pulumi.getter(name="logVolumeClaimTemplate")
-    def log_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "log_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="podTemplate")
-    def pod_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "pod_template")
-
-    @_builtins.property
-    @pulumi.getter(name="replicaServiceTemplate")
-    def replica_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "replica_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplate")
-    def service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplates")
-    def service_templates(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="shardServiceTemplate")
-    def shard_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "shard_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="volumeClaimTemplate")
-    def volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "volume_claim_template")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatch(dict):
-    """
-    optional, configuration of the templates names which will use for generate Kubernetes resources according to selected replica
-    override top-level `chi.spec.configuration.templates`, cluster-level `chi.spec.configuration.clusters.templates` and shard-level `chi.spec.configuration.clusters.layout.shards.templates`
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clusterServiceTemplate":
-            suggest = "cluster_service_template"
-        elif key == "dataVolumeClaimTemplate":
-            suggest = "data_volume_claim_template"
-        elif key == "hostTemplate":
-            suggest = "host_template"
-        elif key == "logVolumeClaimTemplate":
-            suggest = "log_volume_claim_template"
-        elif key == "podTemplate":
-            suggest = "pod_template"
-        elif key == "replicaServiceTemplate":
-            suggest = "replica_service_template"
-        elif key == "serviceTemplate":
-            suggest = "service_template"
-        elif key == "serviceTemplates":
-            suggest = "service_templates"
-        elif key == "shardServiceTemplate":
-            suggest = "shard_service_template"
-        elif key == "volumeClaimTemplate":
-            suggest = "volume_claim_template"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cluster_service_template: Optional[_builtins.str] = None,
-                 data_volume_claim_template: Optional[_builtins.str] = None,
-                 host_template: Optional[_builtins.str] = None,
-                 log_volume_claim_template: Optional[_builtins.str] = None,
-                 pod_template: Optional[_builtins.str] = None,
-                 replica_service_template: Optional[_builtins.str] = None,
-                 service_template: Optional[_builtins.str] = None,
-                 service_templates: Optional[Sequence[_builtins.str]] = None,
-                 shard_service_template: Optional[_builtins.str] = None,
-                 volume_claim_template: Optional[_builtins.str] = None):
-        """
-        optional, configuration of the templates names which will use for generate Kubernetes resources according to selected replica
-        override top-level `chi.spec.configuration.templates`, cluster-level `chi.spec.configuration.clusters.templates` and shard-level `chi.spec.configuration.clusters.layout.shards.templates`
-
-
-        :param _builtins.str cluster_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str data_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str host_template: optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        :param _builtins.str log_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str pod_template: optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str replica_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str service_template: optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param Sequence[_builtins.str] service_templates: optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param _builtins.str shard_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str volume_claim_template: optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        if cluster_service_template is not None:
-            pulumi.set(__self__, "cluster_service_template", cluster_service_template)
-        if data_volume_claim_template is not None:
-            pulumi.set(__self__, "data_volume_claim_template", data_volume_claim_template)
-        if host_template is not None:
-            pulumi.set(__self__, "host_template", host_template)
-        if log_volume_claim_template is not None:
-            pulumi.set(__self__, "log_volume_claim_template", log_volume_claim_template)
-        if pod_template is not None:
-            pulumi.set(__self__, "pod_template", pod_template)
-        if replica_service_template is not None:
-            pulumi.set(__self__, "replica_service_template", replica_service_template)
-        if service_template is not None:
-            pulumi.set(__self__, "service_template", service_template)
-        if service_templates is not None:
-            pulumi.set(__self__, "service_templates", service_templates)
-        if shard_service_template is not None:
-            pulumi.set(__self__, "shard_service_template", shard_service_template)
-        if volume_claim_template is not None:
-            pulumi.set(__self__, "volume_claim_template", volume_claim_template)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterServiceTemplate")
-    def cluster_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "cluster_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="dataVolumeClaimTemplate")
-    def data_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "data_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="hostTemplate")
-    def host_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        """
-        return pulumi.get(self, "host_template")
-
-    @_builtins.property
-    @pulumi.getter(name="logVolumeClaimTemplate")
-    def log_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "log_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="podTemplate")
-    def pod_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "pod_template")
-
-    @_builtins.property
-    @pulumi.getter(name="replicaServiceTemplate")
-    def replica_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "replica_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplate")
-    def service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplates")
-    def service_templates(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="shardServiceTemplate")
-    def shard_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "shard_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="volumeClaimTemplate")
-    def volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "volume_claim_template")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplates(dict):
-    """
-    optional, configuration of the templates names which will use for generate Kubernetes resources according to selected shard
-    override top-level `chi.spec.configuration.templates` and cluster-level `chi.spec.configuration.clusters.templates`
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clusterServiceTemplate":
-            suggest = "cluster_service_template"
-        elif key == "dataVolumeClaimTemplate":
-            suggest = "data_volume_claim_template"
-        elif key == "hostTemplate":
-            suggest = "host_template"
-        elif key == "logVolumeClaimTemplate":
-            suggest = "log_volume_claim_template"
-        elif key == "podTemplate":
-            suggest = "pod_template"
-        elif key == "replicaServiceTemplate":
-            suggest = "replica_service_template"
-        elif key == "serviceTemplate":
-            suggest = "service_template"
-        elif key == "serviceTemplates":
-            suggest = "service_templates"
-        elif key == "shardServiceTemplate":
-            suggest = "shard_service_template"
-        elif key == "volumeClaimTemplate":
-            suggest = "volume_claim_template"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplates. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplates.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplates.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cluster_service_template: Optional[_builtins.str] = None,
-                 data_volume_claim_template: Optional[_builtins.str] = None,
-                 host_template: Optional[_builtins.str] = None,
-                 log_volume_claim_template: Optional[_builtins.str] = None,
-                 pod_template: Optional[_builtins.str] = None,
-                 replica_service_template: Optional[_builtins.str] = None,
-                 service_template: Optional[_builtins.str] = None,
-                 service_templates: Optional[Sequence[_builtins.str]] = None,
-                 shard_service_template: Optional[_builtins.str] = None,
-                 volume_claim_template: Optional[_builtins.str] = None):
-        """
-        optional, configuration of the templates names which will use for generate Kubernetes resources according to selected shard
-        override top-level `chi.spec.configuration.templates` and cluster-level `chi.spec.configuration.clusters.templates`
-
-
-        :param _builtins.str cluster_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str data_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str host_template: optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        :param _builtins.str log_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str pod_template: optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str replica_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str service_template: optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param Sequence[_builtins.str] service_templates: optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param _builtins.str shard_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str volume_claim_template: optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        if cluster_service_template is not None:
-            pulumi.set(__self__, "cluster_service_template", cluster_service_template)
-        if data_volume_claim_template is not None:
-            pulumi.set(__self__, "data_volume_claim_template", data_volume_claim_template)
-        if host_template is not None:
-            pulumi.set(__self__, "host_template", host_template)
-        if log_volume_claim_template is not None:
-            pulumi.set(__self__, "log_volume_claim_template", log_volume_claim_template)
-        if pod_template is not None:
-            pulumi.set(__self__, "pod_template", pod_template)
-        if replica_service_template is not None:
-            pulumi.set(__self__, "replica_service_template", replica_service_template)
-        if service_template is not None:
-            pulumi.set(__self__, "service_template", service_template)
-        if service_templates is not None:
-            pulumi.set(__self__, "service_templates", service_templates)
-        if shard_service_template is not None:
-            pulumi.set(__self__, "shard_service_template", shard_service_template)
-        if volume_claim_template is not None:
-            pulumi.set(__self__, "volume_claim_template", volume_claim_template)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterServiceTemplate")
-    def cluster_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "cluster_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="dataVolumeClaimTemplate")
-    def data_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "data_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="hostTemplate")
-    def host_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        """
-        return pulumi.get(self, "host_template")
-
-    @_builtins.property
-    @pulumi.getter(name="logVolumeClaimTemplate")
-    def log_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "log_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="podTemplate")
-    def pod_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "pod_template")
-
-    @_builtins.property
-    @pulumi.getter(name="replicaServiceTemplate")
-    def replica_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "replica_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplate")
-    def service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplates")
-    def service_templates(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="shardServiceTemplate")
-    def shard_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "shard_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="volumeClaimTemplate")
-    def volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "volume_claim_template")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatch(dict):
-    """
-    optional, configuration of the templates names which will use for generate Kubernetes resources according to selected shard
-    override top-level `chi.spec.configuration.templates` and cluster-level `chi.spec.configuration.clusters.templates`
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clusterServiceTemplate":
-            suggest = "cluster_service_template"
-        elif key == "dataVolumeClaimTemplate":
-            suggest = "data_volume_claim_template"
-        elif key == "hostTemplate":
-            suggest = "host_template"
-        elif key == "logVolumeClaimTemplate":
-            suggest = "log_volume_claim_template"
-        elif key == "podTemplate":
-            suggest = "pod_template"
-        elif key == "replicaServiceTemplate":
-            suggest = "replica_service_template"
-        elif key == "serviceTemplate":
-            suggest = "service_template"
-        elif key == "serviceTemplates":
-            suggest = "service_templates"
-        elif key == "shardServiceTemplate":
-            suggest = "shard_service_template"
-        elif key == "volumeClaimTemplate":
-            suggest = "volume_claim_template"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cluster_service_template: Optional[_builtins.str] = None,
-                 data_volume_claim_template: Optional[_builtins.str] = None,
-                 host_template: Optional[_builtins.str] = None,
-                 log_volume_claim_template: Optional[_builtins.str] = None,
-                 pod_template: Optional[_builtins.str] = None,
-                 replica_service_template: Optional[_builtins.str] = None,
-                 service_template: Optional[_builtins.str] = None,
-                 service_templates: Optional[Sequence[_builtins.str]] = None,
-                 shard_service_template: Optional[_builtins.str] = None,
-                 volume_claim_template: Optional[_builtins.str] = None):
-        """
-        optional, configuration of the templates names which will use for generate Kubernetes resources according to selected shard
-        override top-level `chi.spec.configuration.templates` and cluster-level `chi.spec.configuration.clusters.templates`
-
-
-        :param _builtins.str cluster_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str data_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str host_template: optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        :param _builtins.str log_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str pod_template: optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str replica_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str service_template: optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param Sequence[_builtins.str] service_templates: optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param _builtins.str shard_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str volume_claim_template: optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        if cluster_service_template is not None:
-            pulumi.set(__self__, "cluster_service_template", cluster_service_template)
-        if data_volume_claim_template is not None:
-            pulumi.set(__self__, "data_volume_claim_template", data_volume_claim_template)
-        if host_template is not None:
-            pulumi.set(__self__, "host_template", host_template)
-        if log_volume_claim_template is not None:
-            pulumi.set(__self__, "log_volume_claim_template", log_volume_claim_template)
-        if pod_template is not None:
-            pulumi.set(__self__, "pod_template", pod_template)
-        if replica_service_template is not None:
-            pulumi.set(__self__, "replica_service_template", replica_service_template)
-        if service_template is not None:
-            pulumi.set(__self__, "service_template", service_template)
-        if service_templates is not None:
-            pulumi.set(__self__, "service_templates", service_templates)
-        if shard_service_template is not None:
-            pulumi.set(__self__, "shard_service_template", shard_service_template)
-        if volume_claim_template is not None:
-            pulumi.set(__self__, "volume_claim_template", volume_claim_template)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterServiceTemplate")
-    def cluster_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "cluster_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="dataVolumeClaimTemplate")
-    def data_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "data_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="hostTemplate")
-    def host_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        """
-        return pulumi.get(self, "host_template")
-
-    @_builtins.property
-    @pulumi.getter(name="logVolumeClaimTemplate")
-    def log_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "log_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="podTemplate")
-    def pod_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "pod_template")
-
-    @_builtins.property
-    @pulumi.getter(name="replicaServiceTemplate")
-    def replica_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "replica_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplate")
-    def service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplates")
-    def service_templates(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="shardServiceTemplate")
-    def shard_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "shard_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="volumeClaimTemplate")
-    def volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "volume_claim_template")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "pdbManaged":
-            suggest = "pdb_managed"
-        elif key == "pdbMaxUnavailable":
-            suggest = "pdb_max_unavailable"
-        elif key == "schemaPolicy":
-            suggest = "schema_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 files: Optional[Mapping[str, Any]] = None,
-                 insecure: Optional[_builtins.str] = None,
-                 layout: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutPatch'] = None,
-                 name: Optional[_builtins.str] = None,
-                 pdb_managed: Optional[_builtins.str] = None,
-                 pdb_max_unavailable: Optional[_builtins.int] = None,
-                 reconcile: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcilePatch'] = None,
-                 schema_policy: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSchemaPolicyPatch'] = None,
-                 secret: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSecretPatch'] = None,
-                 secure: Optional[_builtins.str] = None,
-                 settings: Optional[Mapping[str, Any]] = None,
-                 templates: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersTemplatesPatch'] = None,
-                 zookeeper: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersZookeeperPatch'] = None):
-        """
-        :param Mapping[str, Any] files: optional, allows define content of any setting file inside each `Pod` on current cluster during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-               override top-level `chi.spec.configuration.files`
-        :param _builtins.str insecure: optional, open insecure ports for cluster, defaults to "yes"
-        :param _builtins.str name: cluster name, used to identify set of servers and wide used during generate names of related Kubernetes resources
-        :param _builtins.str pdb_managed: Specifies whether the Pod Disruption Budget (PDB) should be managed.
-               During the next installation, if PDB management is enabled, the operator will
-               attempt to retrieve any existing PDB. If none is found, it will create a new one
-               and initiate a reconciliation loop. If PDB management is disabled, the existing PDB
-               will remain intact, and the reconciliation loop will not be executed. By default,
-               PDB management is enabled.
-        :param _builtins.int pdb_max_unavailable: Pod eviction is allowed if at most "pdbMaxUnavailable" pods are unavailable after the eviction,
-               i.e. even in absence of the evicted pod. For example, one can prevent all voluntary evictions
-               by specifying 0. This is a mutually exclusive setting with "minAvailable".
-        :param _builtins.str secure: optional, open secure ports for cluster
-        :param Mapping[str, Any] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` only in one cluster during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
-               override top-level `chi.spec.configuration.settings`
-               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        """
-        if files is not None:
-            pulumi.set(__self__, "files", files)
-        if insecure is not None:
-            pulumi.set(__self__, "insecure", insecure)
-        if layout is not None:
-            pulumi.set(__self__, "layout", layout)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if pdb_managed is not None:
-            pulumi.set(__self__, "pdb_managed", pdb_managed)
-        if pdb_max_unavailable is not None:
-            pulumi.set(__self__, "pdb_max_unavailable", pdb_max_unavailable)
-        if reconcile is not None:
-            pulumi.set(__self__, "reconcile", reconcile)
-        if schema_policy is not None:
-            pulumi.set(__self__, "schema_policy", schema_policy)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-        if secure is not None:
-            pulumi.set(__self__, "secure", secure)
-        if settings is not None:
-            pulumi.set(__self__, "settings", settings)
-        if templates is not None:
-            pulumi.set(__self__, "templates", templates)
-        if zookeeper is not None:
-            pulumi.set(__self__, "zookeeper", zookeeper)
-
-    @_builtins.property
-    @pulumi.getter
-    def files(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows define content of any setting file inside each `Pod` on current cluster during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-        override top-level `chi.spec.configuration.files`
-        """
-        return pulumi.get(self, "files")
-
-    @_builtins.property
-    @pulumi.getter
-    def insecure(self) -> Optional[_builtins.str]:
-        """
-        optional, open insecure ports for cluster, defaults to "yes"
-        """
-        return pulumi.get(self, "insecure")
-
-    @_builtins.property
-    @pulumi.getter
-    def layout(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutPatch']:
-        return pulumi.get(self, "layout")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        cluster name, used to identify set of servers and wide used during generate names of related Kubernetes resources
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter(name="pdbManaged")
-    def pdb_managed(self) -> Optional[_builtins.str]:
-        """
-        Specifies whether the Pod Disruption Budget (PDB) should be managed.
-        During the next installation, if PDB management is enabled, the operator will
-        attempt to retrieve any existing PDB. If none is found, it will create a new one
-        and initiate a reconciliation loop. If PDB management is disabled, the existing PDB
-        will remain intact, and the reconciliation loop will not be executed. By default,
-        PDB management is enabled.
-        """
-        return pulumi.get(self, "pdb_managed")
-
-    @_builtins.property
-    @pulumi.getter(name="pdbMaxUnavailable")
-    def pdb_max_unavailable(self) -> Optional[_builtins.int]:
-        """
-        Pod eviction is allowed if at most "pdbMaxUnavailable" pods are unavailable after the eviction,
-        i.e. even in absence of the evicted pod. For example, one can prevent all voluntary evictions
-        by specifying 0. This is a mutually exclusive setting with "minAvailable".
-        """
-        return pulumi.get(self, "pdb_max_unavailable")
-
-    @_builtins.property
-    @pulumi.getter
-    def reconcile(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcilePatch']:
-        return pulumi.get(self, "reconcile")
-
-    @_builtins.property
-    @pulumi.getter(name="schemaPolicy")
-    def schema_policy(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSchemaPolicyPatch']:
-        return pulumi.get(self, "schema_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSecretPatch']:
-        return pulumi.get(self, "secret")
-
-    @_builtins.property
-    @pulumi.getter
-    def secure(self) -> Optional[_builtins.str]:
-        """
-        optional, open secure ports for cluster
-        """
-        return pulumi.get(self, "secure")
-
-    @_builtins.property
-    @pulumi.getter
-    def settings(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` only in one cluster during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
-        override top-level `chi.spec.configuration.settings`
-        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        """
-        return pulumi.get(self, "settings")
-
-    @_builtins.property
-    @pulumi.getter
-    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersTemplatesPatch']:
-        return pulumi.get(self, "templates")
-
-    @_builtins.property
-    @pulumi.getter
-    def zookeeper(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersZookeeperPatch']:
-        return pulumi.get(self, "zookeeper")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcile(dict):
-    """
-    allow tuning reconciling process
-    """
-    def __init__(__self__, *,
-                 hooks: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooks'] = None,
-                 host: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHost'] = None,
-                 runtime: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileRuntime'] = None):
-        """
-        allow tuning reconciling process
-        """
-        if hooks is not None:
-            pulumi.set(__self__, "hooks", hooks)
-        if host is not None:
-            pulumi.set(__self__, "host", host)
-        if runtime is not None:
-            pulumi.set(__self__, "runtime", runtime)
-
-    @_builtins.property
-    @pulumi.getter
-    def hooks(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooks']:
-        return pulumi.get(self, "hooks")
-
-    @_builtins.property
-    @pulumi.getter
-    def host(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHost']:
-        return pulumi.get(self, "host")
-
-    @_builtins.property
-    @pulumi.getter
-    def runtime(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileRuntime']:
-        return pulumi.get(self, "runtime")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHooks(dict):
-    """
-    cluster-level hooks to execute before and after cluster reconcile
-    """
-    def __init__(__self__, *,
-                 post: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPost']] = None,
-                 pre: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPre']] = None):
-        """
-        cluster-level hooks to execute before and after cluster reconcile
-
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostArgs'] post: actions to execute after cluster reconcile
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreArgs'] pre: actions to execute before cluster reconcile
-        """
-        if post is not None:
-            pulumi.set(__self__, "post", post)
-        if pre is not None:
-            pulumi.set(__self__, "pre", pre)
-
-    @_builtins.property
-    @pulumi.getter
-    def post(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPost']]:
-        """
-        actions to execute after cluster reconcile
-        """
-        return pulumi.get(self, "post")
-
-    @_builtins.property
-    @pulumi.getter
-    def pre(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPre']]:
-        """
-        actions to execute before cluster reconcile
-        """
-        return pulumi.get(self, "pre")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatch(dict):
-    """
-    cluster-level hooks to execute before and after cluster reconcile
-    """
-    def __init__(__self__, *,
-                 post: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatch']] = None,
-                 pre: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatch']] = None):
-        """
-        cluster-level hooks to execute before and after cluster reconcile
-
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatchArgs'] post: actions to execute after cluster reconcile
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatchArgs'] pre: actions to execute before cluster reconcile
-        """
-        if post is not None:
-            pulumi.set(__self__, "post", post)
-        if pre is not None:
-            pulumi.set(__self__, "pre", pre)
-
-    @_builtins.property
-    @pulumi.getter
-    def post(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatch']]:
-        """
-        actions to execute after cluster reconcile
-        """
-        return pulumi.get(self, "post")
-
-    @_builtins.property
-    @pulumi.getter
-    def pre(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatch']]:
-        """
-        actions to execute before cluster reconcile
-        """
-        return pulumi.get(self, "pre")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPost(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersReconcileHooksPost. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHooksPost.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHooksPost.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttp'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShell'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSql'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Cluster-scope reconcile lifecycle events. Required, non-empty.
-                 Any              - wildcard match: fires on every cluster reconcile pass
-                                    and the cluster delete sweep
-                 ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                                    only on the first reconcile of a brand-new cluster
-                 ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                                    least one host has prior state). Fires on every
-                                    operator reconcile cycle the upstream gates allow,
-                                    including taskID-only force-reconciles. NOT a "spec
-                                    changed" signal.
-                 ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default) propagates the error; Ignore logs a warning and continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Cluster-scope reconcile lifecycle events. Required, non-empty.
-          Any              - wildcard match: fires on every cluster reconcile pass
-                             and the cluster delete sweep
-          ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                             only on the first reconcile of a brand-new cluster
-          ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                             least one host has prior state). Fires on every
-                             operator reconcile cycle the upstream gates allow,
-                             including taskID-only force-reconciles. NOT a "spec
-                             changed" signal.
-          ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default) propagates the error; Ignore logs a warning and continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttp']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShell']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSql']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttp(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpPatch(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpPatch'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellPatch'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlPatch'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Cluster-scope reconcile lifecycle events. Required, non-empty.
-                 Any              - wildcard match: fires on every cluster reconcile pass
-                                    and the cluster delete sweep
-                 ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                                    only on the first reconcile of a brand-new cluster
-                 ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                                    least one host has prior state). Fires on every
-                                    operator reconcile cycle the upstream gates allow,
-                                    including taskID-only force-reconciles. NOT a "spec
-                                    changed" signal.
-                 ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default) propagates the error; Ignore logs a warning and continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Cluster-scope reconcile lifecycle events. Required, non-empty.
-          Any              - wildcard match: fires on every cluster reconcile pass
-                             and the cluster delete sweep
-          ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                             only on the first reconcile of a brand-new cluster
-          ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                             least one host has prior state). Fires on every
-                             operator reconcile cycle the upstream gates allow,
-                             including taskID-only force-reconciles. NOT a "spec
-                             changed" signal.
-          ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default) propagates the error; Ignore logs a warning and continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpPatch']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellPatch']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlPatch']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShell(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellPatch(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSql(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlPatch(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPre(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersReconcileHooksPre. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHooksPre.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHooksPre.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttp'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShell'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSql'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Cluster-scope reconcile lifecycle events. Required, non-empty.
-                 Any              - wildcard match: fires on every cluster reconcile pass
-                                    and the cluster delete sweep
-                 ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                                    only on the first reconcile of a brand-new cluster
-                 ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                                    least one host has prior state). Fires on every
-                                    operator reconcile cycle the upstream gates allow,
-                                    including taskID-only force-reconciles. NOT a "spec
-                                    changed" signal.
-                 ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default) propagates the error; Ignore logs a warning and continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Cluster-scope reconcile lifecycle events. Required, non-empty.
-          Any              - wildcard match: fires on every cluster reconcile pass
-                             and the cluster delete sweep
-          ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                             only on the first reconcile of a brand-new cluster
-          ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                             least one host has prior state). Fires on every
-                             operator reconcile cycle the upstream gates allow,
-                             including taskID-only force-reconciles. NOT a "spec
-                             changed" signal.
-          ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default) propagates the error; Ignore logs a warning and continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttp']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShell']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSql']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttp(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpPatch(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpPatch'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellPatch'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlPatch'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Cluster-scope reconcile lifecycle events. Required, non-empty.
-                 Any              - wildcard match: fires on every cluster reconcile pass
-                                    and the cluster delete sweep
-                 ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                                    only on the first reconcile of a brand-new cluster
-                 ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                                    least one host has prior state). Fires on every
-                                    operator reconcile cycle the upstream gates allow,
-                                    including taskID-only force-reconciles. NOT a "spec
-                                    changed" signal.
-                 ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default) propagates the error; Ignore logs a warning and continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Cluster-scope reconcile lifecycle events. Required, non-empty.
-          Any              - wildcard match: fires on every cluster reconcile pass
-                             and the cluster delete sweep
-          ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                             only on the first reconcile of a brand-new cluster
-          ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                             least one host has prior state). Fires on every
-                             operator reconcile cycle the upstream gates allow,
-                             including taskID-only force-reconciles. NOT a "spec
-                             changed" signal.
-          ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default) propagates the error; Ignore logs a warning and continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpPatch']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellPatch']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlPatch']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShell(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellPatch(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSql(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlPatch(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHost(dict):
-    """
-    Whether the operator during reconcile procedure should wait for a ClickHouse host:
-      - to be excluded from a ClickHouse cluster
-      - to complete all running queries
-      - to be included into a ClickHouse cluster
-    respectfully before moving forward
-    """
-    def __init__(__self__, *,
-                 drop: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostDrop'] = None,
-                 hooks: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooks'] = None,
-                 wait: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWait'] = None):
-        """
-        Whether the operator during reconcile procedure should wait for a ClickHouse host:
-          - to be excluded from a ClickHouse cluster
-          - to complete all running queries
-          - to be included into a ClickHouse cluster
-        respectfully before moving forward
-        """
-        if drop is not None:
-            pulumi.set(__self__, "drop", drop)
-        if hooks is not None:
-            pulumi.set(__self__, "hooks", hooks)
-        if wait is not None:
-            pulumi.set(__self__, "wait", wait)
-
-    @_builtins.property
-    @pulumi.getter
-    def drop(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostDrop']:
-        return pulumi.get(self, "drop")
-
-    @_builtins.property
-    @pulumi.getter
-    def hooks(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooks']:
-        return pulumi.get(self, "hooks")
-
-    @_builtins.property
-    @pulumi.getter
-    def wait(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWait']:
-        return pulumi.get(self, "wait")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostDrop(dict):
-    def __init__(__self__, *,
-                 replicas: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicas'] = None):
-        if replicas is not None:
-            pulumi.set(__self__, "replicas", replicas)
-
-    @_builtins.property
-    @pulumi.getter
-    def replicas(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicas']:
-        return pulumi.get(self, "replicas")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatch(dict):
-    def __init__(__self__, *,
-                 replicas: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatch'] = None):
-        if replicas is not None:
-            pulumi.set(__self__, "replicas", replicas)
-
-    @_builtins.property
-    @pulumi.getter
-    def replicas(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatch']:
-        return pulumi.get(self, "replicas")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicas(dict):
-    """
-    Whether the operator during reconcile procedure should drop replicas when replica is deleted or recreated
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "onDelete":
-            suggest = "on_delete"
-        elif key == "onLostVolume":
-            suggest = "on_lost_volume"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicas. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicas.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicas.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 active: Optional[_builtins.str] = None,
-                 on_delete: Optional[_builtins.str] = None,
-                 on_lost_volume: Optional[_builtins.str] = None):
-        """
-        Whether the operator during reconcile procedure should drop replicas when replica is deleted or recreated
-
-
-        :param _builtins.str active: Whether the operator during reconcile procedure should drop active replicas when replica is deleted or recreated
-        :param _builtins.str on_delete: Whether the operator during reconcile procedure should drop replicas when replica is deleted
-        :param _builtins.str on_lost_volume: Whether the operator during reconcile procedure should drop replicas when replica volume is lost
-        """
-        if active is not None:
-            pulumi.set(__self__, "active", active)
-        if on_delete is not None:
-            pulumi.set(__self__, "on_delete", on_delete)
-        if on_lost_volume is not None:
-            pulumi.set(__self__, "on_lost_volume", on_lost_volume)
-
-    @_builtins.property
-    @pulumi.getter
-    def active(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should drop active replicas when replica is deleted or recreated
-        """
-        return pulumi.get(self, "active")
-
-    @_builtins.property
-    @pulumi.getter(name="onDelete")
-    def on_delete(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should drop replicas when replica is deleted
-        """
-        return pulumi.get(self, "on_delete")
-
-    @_builtins.property
-    @pulumi.getter(name="onLostVolume")
-    def on_lost_volume(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should drop replicas when replica volume is lost
-        """
-        return pulumi.get(self, "on_lost_volume")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatch(dict):
-    """
-    Whether the operator during reconcile procedure should drop replicas when replica is deleted or recreated
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "onDelete":
-            suggest = "on_delete"
-        elif key == "onLostVolume":
-            suggest = "on_lost_volume"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 active: Optional[_builtins.str] = None,
-                 on_delete: Optional[_builtins.str] = None,
-                 on_lost_volume: Optional[_builtins.str] = None):
-        """
-        Whether the operator during reconcile procedure should drop replicas when replica is deleted or recreated
-
-
-        :param _builtins.str active: Whether the operator during reconcile procedure should drop active replicas when replica is deleted or recreated
-        :param _builtins.str on_delete: Whether the operator during reconcile procedure should drop replicas when replica is deleted
-        :param _builtins.str on_lost_volume: Whether the operator during reconcile procedure should drop replicas when replica volume is lost
-        """
-        if active is not None:
-            pulumi.set(__self__, "active", active)
-        if on_delete is not None:
-            pulumi.set(__self__, "on_delete", on_delete)
-        if on_lost_volume is not None:
-            pulumi.set(__self__, "on_lost_volume", on_lost_volume)
-
-    @_builtins.property
-    @pulumi.getter
-    def active(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should drop active replicas when replica is deleted or recreated
-        """
-        return pulumi.get(self, "active")
-
-    @_builtins.property
-    @pulumi.getter(name="onDelete")
-    def on_delete(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should drop replicas when replica is deleted
-        """
-        return pulumi.get(self, "on_delete")
-
-    @_builtins.property
-    @pulumi.getter(name="onLostVolume")
-    def on_lost_volume(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should drop replicas when replica volume is lost
-        """
-        return pulumi.get(self, "on_lost_volume")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooks(dict):
-    """
-    hooks to execute before and after host reconcile
-    """
-    def __init__(__self__, *,
-                 post: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPost']] = None,
-                 pre: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPre']] = None):
-        """
-        hooks to execute before and after host reconcile
-
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostArgs'] post: actions to execute after reconcile
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreArgs'] pre: actions to execute before reconcile
-        """
-        if post is not None:
-            pulumi.set(__self__, "post", post)
-        if pre is not None:
-            pulumi.set(__self__, "pre", pre)
-
-    @_builtins.property
-    @pulumi.getter
-    def post(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPost']]:
-        """
-        actions to execute after reconcile
-        """
-        return pulumi.get(self, "post")
-
-    @_builtins.property
-    @pulumi.getter
-    def pre(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPre']]:
-        """
-        actions to execute before reconcile
-        """
-        return pulumi.get(self, "pre")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatch(dict):
-    """
-    hooks to execute before and after host reconcile
-    """
-    def __init__(__self__, *,
-                 post: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatch']] = None,
-                 pre: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatch']] = None):
-        """
-        hooks to execute before and after host reconcile
-
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatchArgs'] post: actions to execute after reconcile
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatchArgs'] pre: actions to execute before reconcile
-        """
-        if post is not None:
-            pulumi.set(__self__, "post", post)
-        if pre is not None:
-            pulumi.set(__self__, "pre", pre)
-
-    @_builtins.property
-    @pulumi.getter
-    def post(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatch']]:
-        """
-        actions to execute after reconcile
-        """
-        return pulumi.get(self, "post")
-
-    @_builtins.property
-    @pulumi.getter
-    def pre(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatch']]:
-        """
-        actions to execute before reconcile
-        """
-        return pulumi.get(self, "pre")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPost(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPost. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPost.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPost.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttp'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShell'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSql'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-               The hook is skipped on any reconcile whose classifier does not emit at least one
-               of the listed events. Supported values:
-                 Any               - wildcard match: fires on every hook-evaluation point,
-                                     including the pre-delete sweep on the dying host
-                 HostCreate        - first reconcile that creates a host (no ancestor); best
-                                     paired with POST hooks because PRE hooks on first creation
-                                     are skipped (no live pod yet)
-                 HostUpdate        - reconcile that has prior state for the host; catch-all
-                                     for ongoing reconciles
-                 HostStart         - host transitions from stopped to running
-                 HostStop          - host is being stopped (current spec marks it stopped)
-                 HostConfigRestart - in-place software restart for a configuration change
-                 HostRollout       - pod-template change forces a StatefulSet rollout
-                 HostShutdown      - aggregate: fires whenever the pod is going down for any
-                                     reason (Stop, ConfigRestart, Rollout, or Delete)
-                 HostDelete        - host is being removed from the cluster (downsize); fires
-                                     on the dying host before tear-down. Always emitted
-                                     alongside HostShutdown.
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-               Ignore: error is logged and the reconcile continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-        The hook is skipped on any reconcile whose classifier does not emit at least one
-        of the listed events. Supported values:
-          Any               - wildcard match: fires on every hook-evaluation point,
-                              including the pre-delete sweep on the dying host
-          HostCreate        - first reconcile that creates a host (no ancestor); best
-                              paired with POST hooks because PRE hooks on first creation
-                              are skipped (no live pod yet)
-          HostUpdate        - reconcile that has prior state for the host; catch-all
-                              for ongoing reconciles
-          HostStart         - host transitions from stopped to running
-          HostStop          - host is being stopped (current spec marks it stopped)
-          HostConfigRestart - in-place software restart for a configuration change
-          HostRollout       - pod-template change forces a StatefulSet rollout
-          HostShutdown      - aggregate: fires whenever the pod is going down for any
-                              reason (Stop, ConfigRestart, Rollout, or Delete)
-          HostDelete        - host is being removed from the cluster (downsize); fires
-                              on the dying host before tear-down. Always emitted
-                              alongside HostShutdown.
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-        Ignore: error is logged and the reconcile continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttp']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShell']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSql']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttp(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpPatch(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpPatch'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellPatch'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlPatch'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-               The hook is skipped on any reconcile whose classifier does not emit at least one
-               of the listed events. Supported values:
-                 Any               - wildcard match: fires on every hook-evaluation point,
-                                     including the pre-delete sweep on the dying host
-                 HostCreate        - first reconcile that creates a host (no ancestor); best
-                                     paired with POST hooks because PRE hooks on first creation
-                                     are skipped (no live pod yet)
-                 HostUpdate        - reconcile that has prior state for the host; catch-all
-                                     for ongoing reconciles
-                 HostStart         - host transitions from stopped to running
-                 HostStop          - host is being stopped (current spec marks it stopped)
-                 HostConfigRestart - in-place software restart for a configuration change
-                 HostRollout       - pod-template change forces a StatefulSet rollout
-                 HostShutdown      - aggregate: fires whenever the pod is going down for any
-                                     reason (Stop, ConfigRestart, Rollout, or Delete)
-                 HostDelete        - host is being removed from the cluster (downsize); fires
-                                     on the dying host before tear-down. Always emitted
-                                     alongside HostShutdown.
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-               Ignore: error is logged and the reconcile continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-        The hook is skipped on any reconcile whose classifier does not emit at least one
-        of the listed events. Supported values:
-          Any               - wildcard match: fires on every hook-evaluation point,
-                              including the pre-delete sweep on the dying host
-          HostCreate        - first reconcile that creates a host (no ancestor); best
-                              paired with POST hooks because PRE hooks on first creation
-                              are skipped (no live pod yet)
-          HostUpdate        - reconcile that has prior state for the host; catch-all
-                              for ongoing reconciles
-          HostStart         - host transitions from stopped to running
-          HostStop          - host is being stopped (current spec marks it stopped)
-          HostConfigRestart - in-place software restart for a configuration change
-          HostRollout       - pod-template change forces a StatefulSet rollout
-          HostShutdown      - aggregate: fires whenever the pod is going down for any
-                              reason (Stop, ConfigRestart, Rollout, or Delete)
-          HostDelete        - host is being removed from the cluster (downsize); fires
-                              on the dying host before tear-down. Always emitted
-                              alongside HostShutdown.
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-        Ignore: error is logged and the reconcile continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpPatch']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellPatch']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlPatch']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShell(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellPatch(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSql(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlPatch(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPre(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPre. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPre.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPre.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttp'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShell'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSql'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-               The hook is skipped on any reconcile whose classifier does not emit at least one
-               of the listed events. Supported values:
-                 Any               - wildcard match: fires on every hook-evaluation point,
-                                     including the pre-delete sweep on the dying host
-                 HostCreate        - first reconcile that creates a host (no ancestor); best
-                                     paired with POST hooks because PRE hooks on first creation
-                                     are skipped (no live pod yet)
-                 HostUpdate        - reconcile that has prior state for the host; catch-all
-                                     for ongoing reconciles
-                 HostStart         - host transitions from stopped to running
-                 HostStop          - host is being stopped (current spec marks it stopped)
-                 HostConfigRestart - in-place software restart for a configuration change
-                 HostRollout       - pod-template change forces a StatefulSet rollout
-                 HostShutdown      - aggregate: fires whenever the pod is going down for any
-                                     reason (Stop, ConfigRestart, Rollout, or Delete)
-                 HostDelete        - host is being removed from the cluster (downsize); fires
-                                     on the dying host before tear-down. Always emitted
-                                     alongside HostShutdown.
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-               Ignore: error is logged and the reconcile continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-        The hook is skipped on any reconcile whose classifier does not emit at least one
-        of the listed events. Supported values:
-          Any               - wildcard match: fires on every hook-evaluation point,
-                              including the pre-delete sweep on the dying host
-          HostCreate        - first reconcile that creates a host (no ancestor); best
-                              paired with POST hooks because PRE hooks on first creation
-                              are skipped (no live pod yet)
-          HostUpdate        - reconcile that has prior state for the host; catch-all
-                              for ongoing reconciles
-          HostStart         - host transitions from stopped to running
-          HostStop          - host is being stopped (current spec marks it stopped)
-          HostConfigRestart - in-place software restart for a configuration change
-          HostRollout       - pod-template change forces a StatefulSet rollout
-          HostShutdown      - aggregate: fires whenever the pod is going down for any
-                              reason (Stop, ConfigRestart, Rollout, or Delete)
-          HostDelete        - host is being removed from the cluster (downsize); fires
-                              on the dying host before tear-down. Always emitted
-                              alongside HostShutdown.
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-        Ignore: error is logged and the reconcile continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttp']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShell']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSql']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttp(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatch(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatch'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatch'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatch'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-               The hook is skipped on any reconcile whose classifier does not emit at least one
-               of the listed events. Supported values:
-                 Any               - wildcard match: fires on every hook-evaluation point,
-                                     including the pre-delete sweep on the dying host
-                 HostCreate        - first reconcile that creates a host (no ancestor); best
-                                     paired with POST hooks because PRE hooks on first creation
-                                     are skipped (no live pod yet)
-                 HostUpdate        - reconcile that has prior state for the host; catch-all
-                                     for ongoing reconciles
-                 HostStart         - host transitions from stopped to running
-                 HostStop          - host is being stopped (current spec marks it stopped)
-                 HostConfigRestart - in-place software restart for a configuration change
-                 HostRollout       - pod-template change forces a StatefulSet rollout
-                 HostShutdown      - aggregate: fires whenever the pod is going down for any
-                                     reason (Stop, ConfigRestart, Rollout, or Delete)
-                 HostDelete        - host is being removed from the cluster (downsize); fires
-                                     on the dying host before tear-down. Always emitted
-                                     alongside HostShutdown.
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-               Ignore: error is logged and the reconcile continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-        The hook is skipped on any reconcile whose classifier does not emit at least one
-        of the listed events. Supported values:
-          Any               - wildcard match: fires on every hook-evaluation point,
-                              including the pre-delete sweep on the dying host
-          HostCreate        - first reconcile that creates a host (no ancestor); best
-                              paired with POST hooks because PRE hooks on first creation
-                              are skipped (no live pod yet)
-          HostUpdate        - reconcile that has prior state for the host; catch-all
-                              for ongoing reconciles
-          HostStart         - host transitions from stopped to running
-          HostStop          - host is being stopped (current spec marks it stopped)
-          HostConfigRestart - in-place software restart for a configuration change
-          HostRollout       - pod-template change forces a StatefulSet rollout
-          HostShutdown      - aggregate: fires whenever the pod is going down for any
-                              reason (Stop, ConfigRestart, Rollout, or Delete)
-          HostDelete        - host is being removed from the cluster (downsize); fires
-                              on the dying host before tear-down. Always emitted
-                              alongside HostShutdown.
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-        Ignore: error is logged and the reconcile continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatch']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatch']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatch']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShell(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatch(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSql(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatch(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostPatch(dict):
-    """
-    Whether the operator during reconcile procedure should wait for a ClickHouse host:
-      - to be excluded from a ClickHouse cluster
-      - to complete all running queries
-      - to be included into a ClickHouse cluster
-    respectfully before moving forward
-    """
-    def __init__(__self__, *,
-                 drop: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatch'] = None,
-                 hooks: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatch'] = None,
-                 wait: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitPatch'] = None):
-        """
-        Whether the operator during reconcile procedure should wait for a ClickHouse host:
-          - to be excluded from a ClickHouse cluster
-          - to complete all running queries
-          - to be included into a ClickHouse cluster
-        respectfully before moving forward
-        """
-        if drop is not None:
-            pulumi.set(__self__, "drop", drop)
-        if hooks is not None:
-            pulumi.set(__self__, "hooks", hooks)
-        if wait is not None:
-            pulumi.set(__self__, "wait", wait)
-
-    @_builtins.property
-    @pulumi.getter
-    def drop(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatch']:
-        return pulumi.get(self, "drop")
-
-    @_builtins.property
-    @pulumi.getter
-    def hooks(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatch']:
-        return pulumi.get(self, "hooks")
-
-    @_builtins.property
-    @pulumi.getter
-    def wait(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitPatch']:
-        return pulumi.get(self, "wait")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostWait(dict):
-    def __init__(__self__, *,
-                 exclude: Optional[_builtins.str] = None,
-                 include: Optional[_builtins.str] = None,
-                 probes: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbes'] = None,
-                 queries: Optional[_builtins.str] = None,
-                 replicas: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicas'] = None):
-        """
-        :param _builtins.str exclude: Allows to stop all ClickHouse clusters defined in a CHI.
-               Works as the following:
-                - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
-                - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
-        :param _builtins.str include: Whether the operator during reconcile procedure should wait for a ClickHouse host to be included into a ClickHouse cluster
-        :param _builtins.str queries: Whether the operator during reconcile procedure should wait for a ClickHouse host to complete all running queries
-        """
-        if exclude is not None:
-            pulumi.set(__self__, "exclude", exclude)
-        if include is not None:
-            pulumi.set(__self__, "include", include)
-        if probes is not None:
-            pulumi.set(__self__, "probes", probes)
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-        if replicas is not None:
-            pulumi.set(__self__, "replicas", replicas)
-
-    @_builtins.property
-    @pulumi.getter
-    def exclude(self) -> Optional[_builtins.str]:
-        """
-        Allows to stop all ClickHouse clusters defined in a CHI.
-        Works as the following:
-         - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
-         - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
-        """
-        return pulumi.get(self, "exclude")
-
-    @_builtins.property
-    @pulumi.getter
-    def include(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for a ClickHouse host to be included into a ClickHouse cluster
-        """
-        return pulumi.get(self, "include")
-
-    @_builtins.property
-    @pulumi.getter
-    def probes(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbes']:
-        return pulumi.get(self, "probes")
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for a ClickHouse host to complete all running queries
-        """
-        return pulumi.get(self, "queries")
-
-    @_builtins.property
-    @pulumi.getter
-    def replicas(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicas']:
-        return pulumi.get(self, "replicas")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitPatch(dict):
-    def __init__(__self__, *,
-                 exclude: Optional[_builtins.str] = None,
-                 include: Optional[_builtins.str] = None,
-                 probes: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatch'] = None,
-                 queries: Optional[_builtins.str] = None,
-                 replicas: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatch'] = None):
-        """
-        :param _builtins.str exclude: Allows to stop all ClickHouse clusters defined in a CHI.
-               Works as the following:
-                - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
-                - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
-        :param _builtins.str include: Whether the operator during reconcile procedure should wait for a ClickHouse host to be included into a ClickHouse cluster
-        :param _builtins.str queries: Whether the operator during reconcile procedure should wait for a ClickHouse host to complete all running queries
-        """
-        if exclude is not None:
-            pulumi.set(__self__, "exclude", exclude)
-        if include is not None:
-            pulumi.set(__self__, "include", include)
-        if probes is not None:
-            pulumi.set(__self__, "probes", probes)
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-        if replicas is not None:
-            pulumi.set(__self__, "replicas", replicas)
-
-    @_builtins.property
-    @pulumi.getter
-    def exclude(self) -> Optional[_builtins.str]:
-        """
-        Allows to stop all ClickHouse clusters defined in a CHI.
-        Works as the following:
-         - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
-         - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
-        """
-        return pulumi.get(self, "exclude")
-
-    @_builtins.property
-    @pulumi.getter
-    def include(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for a ClickHouse host to be included into a ClickHouse cluster
-        """
-        return pulumi.get(self, "include")
-
-    @_builtins.property
-    @pulumi.getter
-    def probes(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatch']:
-        return pulumi.get(self, "probes")
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for a ClickHouse host to complete all running queries
-        """
-        return pulumi.get(self, "queries")
-
-    @_builtins.property
-    @pulumi.getter
-    def replicas(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatch']:
-        return pulumi.get(self, "replicas")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbes(dict):
-    """
-    What probes the operator should wait during host launch procedure
-    """
-    def __init__(__self__, *,
-                 readiness: Optional[_builtins.str] = None,
-                 startup: Optional[_builtins.str] = None):
-        """
-        What probes the operator should wait during host launch procedure
-
-        :param _builtins.str readiness: Whether the operator during host launch procedure should wait for ready probe to succeed.
-               In case probe is unspecified wait is assumed to be completed successfully.
-               Default option value is to wait.
-        :param _builtins.str startup: Whether the operator during host launch procedure should wait for startup probe to succeed.
-               In case probe is unspecified wait is assumed to be completed successfully.
-               Default option value is to do not wait.
-        """
-        if readiness is not None:
-            pulumi.set(__self__, "readiness", readiness)
-        if startup is not None:
-            pulumi.set(__self__, "startup", startup)
-
-    @_builtins.property
-    @pulumi.getter
-    def readiness(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during host launch procedure should wait for ready probe to succeed.
-        In case probe is unspecified wait is assumed to be completed successfully.
-        Default option value is to wait.
-        """
-        return pulumi.get(self, "readiness")
-
-    @_builtins.property
-    @pulumi.getter
-    def startup(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during host launch procedure should wait for startup probe to succeed.
-        In case probe is unspecified wait is assumed to be completed successfully.
-        Default option value is to do not wait.
-        """
-        return pulumi.get(self, "startup")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatch(dict):
-    """
-    What probes the operator should wait during host launch procedure
-    """
-    def __init__(__self__, *,
-                 readiness: Optional[_builtins.str] = None,
-                 startup: Optional[_builtins.str] = None):
-        """
-        What probes the operator should wait during host launch procedure
-
-        :param _builtins.str readiness: Whether the operator during host launch procedure should wait for ready probe to succeed.
-               In case probe is unspecified wait is assumed to be completed successfully.
-               Default option value is to wait.
-        :param _builtins.str startup: Whether the operator during host launch procedure should wait for startup probe to succeed.
-               In case probe is unspecified wait is assumed to be completed successfully.
-               Default option value is to do not wait.
-        """
-        if readiness is not None:
-            pulumi.set(__self__, "readiness", readiness)
-        if startup is not None:
-            pulumi.set(__self__, "startup", startup)
-
-    @_builtins.property
-    @pulumi.getter
-    def readiness(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during host launch procedure should wait for ready probe to succeed.
-        In case probe is unspecified wait is assumed to be completed successfully.
-        Default option value is to wait.
-        """
-        return pulumi.get(self, "readiness")
-
-    @_builtins.property
-    @pulumi.getter
-    def startup(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during host launch procedure should wait for startup probe to succeed.
-        In case probe is unspecified wait is assumed to be completed successfully.
-        Default option value is to do not wait.
-        """
-        return pulumi.get(self, "startup")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicas(dict):
-    """
-    Whether the operator during reconcile procedure should wait for replicas to catch-up
-    """
-    def __init__(__self__, *,
-                 all: Optional[_builtins.str] = None,
-                 delay: Optional[_builtins.int] = None,
-                 new: Optional[_builtins.str] = None):
-        """
-        Whether the operator during reconcile procedure should wait for replicas to catch-up
-
-        :param _builtins.str all: Whether the operator during reconcile procedure should wait for all replicas to catch-up
-        :param _builtins.int delay: replication max absolute delay to consider replica is not delayed
-        :param _builtins.str new: Whether the operator during reconcile procedure should wait for new replicas to catch-up
-        """
-        if all is not None:
-            pulumi.set(__self__, "all", all)
-        if delay is not None:
-            pulumi.set(__self__, "delay", delay)
-        if new is not None:
-            pulumi.set(__self__, "new", new)
-
-    @_builtins.property
-    @pulumi.getter
-    def all(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for all replicas to catch-up
-        """
-        return pulumi.get(self, "all")
-
-    @_builtins.property
-    @pulumi.getter
-    def delay(self) -> Optional[_builtins.int]:
-        """
-        replication max absolute delay to consider replica is not delayed
-        """
-        return pulumi.get(self, "delay")
-
-    @_builtins.property
-    @pulumi.getter
-    def new(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for new replicas to catch-up
-        """
-        return pulumi.get(self, "new")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatch(dict):
-    """
-    Whether the operator during reconcile procedure should wait for replicas to catch-up
-    """
-    def __init__(__self__, *,
-                 all: Optional[_builtins.str] = None,
-                 delay: Optional[_builtins.int] = None,
-                 new: Optional[_builtins.str] = None):
-        """
-        Whether the operator during reconcile procedure should wait for replicas to catch-up
-
-        :param _builtins.str all: Whether the operator during reconcile procedure should wait for all replicas to catch-up
-        :param _builtins.int delay: replication max absolute delay to consider replica is not delayed
-        :param _builtins.str new: Whether the operator during reconcile procedure should wait for new replicas to catch-up
-        """
-        if all is not None:
-            pulumi.set(__self__, "all", all)
-        if delay is not None:
-            pulumi.set(__self__, "delay", delay)
-        if new is not None:
-            pulumi.set(__self__, "new", new)
-
-    @_builtins.property
-    @pulumi.getter
-    def all(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for all replicas to catch-up
-        """
-        return pulumi.get(self, "all")
-
-    @_builtins.property
-    @pulumi.getter
-    def delay(self) -> Optional[_builtins.int]:
-        """
-        replication max absolute delay to consider replica is not delayed
-        """
-        return pulumi.get(self, "delay")
-
-    @_builtins.property
-    @pulumi.getter
-    def new(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for new replicas to catch-up
-        """
-        return pulumi.get(self, "new")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcilePatch(dict):
-    """
-    allow tuning reconciling process
-    """
-    def __init__(__self__, *,
-                 hooks: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatch'] = None,
-                 host: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostPatch'] = None,
-                 runtime: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatch'] = None):
-        """
-        allow tuning reconciling process
-        """
-        if hooks is not None:
-            pulumi.set(__self__, "hooks", hooks)
-        if host is not None:
-            pulumi.set(__self__, "host", host)
-        if runtime is not None:
-            pulumi.set(__self__, "runtime", runtime)
-
-    @_builtins.property
-    @pulumi.getter
-    def hooks(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatch']:
-        return pulumi.get(self, "hooks")
-
-    @_builtins.property
-    @pulumi.getter
-    def host(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostPatch']:
-        return pulumi.get(self, "host")
-
-    @_builtins.property
-    @pulumi.getter
-    def runtime(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatch']:
-        return pulumi.get(self, "runtime")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileRuntime(dict):
-    """
-    runtime parameters for clickhouse-operator process which are used during reconcile cycle
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "reconcileShardsMaxConcurrencyPercent":
-            suggest = "reconcile_shards_max_concurrency_percent"
-        elif key == "reconcileShardsThreadsNumber":
-            suggest = "reconcile_shards_threads_number"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersReconcileRuntime. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileRuntime.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileRuntime.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 reconcile_shards_max_concurrency_percent: Optional[_builtins.int] = None,
-                 reconcile_shards_threads_number: Optional[_builtins.int] = None):
-        """
-        runtime parameters for clickhouse-operator process which are used during reconcile cycle
-
-        :param _builtins.int reconcile_shards_max_concurrency_percent: The maximum percentage of cluster shards that may be reconciled in parallel, 50 percent by default.
-        :param _builtins.int reconcile_shards_threads_number: The maximum number of cluster shards that may be reconciled in parallel, 1 by default
-        """
-        if reconcile_shards_max_concurrency_percent is not None:
-            pulumi.set(__self__, "reconcile_shards_max_concurrency_percent", reconcile_shards_max_concurrency_percent)
-        if reconcile_shards_threads_number is not None:
-            pulumi.set(__self__, "reconcile_shards_threads_number", reconcile_shards_threads_number)
-
-    @_builtins.property
-    @pulumi.getter(name="reconcileShardsMaxConcurrencyPercent")
-    def reconcile_shards_max_concurrency_percent(self) -> Optional[_builtins.int]:
-        """
-        The maximum percentage of cluster shards that may be reconciled in parallel, 50 percent by default.
-        """
-        return pulumi.get(self, "reconcile_shards_max_concurrency_percent")
-
-    @_builtins.property
-    @pulumi.getter(name="reconcileShardsThreadsNumber")
-    def reconcile_shards_threads_number(self) -> Optional[_builtins.int]:
-        """
-        The maximum number of cluster shards that may be reconciled in parallel, 1 by default
-        """
-        return pulumi.get(self, "reconcile_shards_threads_number")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatch(dict):
-    """
-    runtime parameters for clickhouse-operator process which are used during reconcile cycle
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "reconcileShardsMaxConcurrencyPercent":
-            suggest = "reconcile_shards_max_concurrency_percent"
-        elif key == "reconcileShardsThreadsNumber":
-            suggest = "reconcile_shards_threads_number"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 reconcile_shards_max_concurrency_percent: Optional[_builtins.int] = None,
-                 reconcile_shards_threads_number: Optional[_builtins.int] = None):
-        """
-        runtime parameters for clickhouse-operator process which are used during reconcile cycle
-
-        :param _builtins.int reconcile_shards_max_concurrency_percent: The maximum percentage of cluster shards that may be reconciled in parallel, 50 percent by default.
-        :param _builtins.int reconcile_shards_threads_number: The maximum number of cluster shards that may be reconciled in parallel, 1 by default
-        """
-        if reconcile_shards_max_concurrency_percent is not None:
-            pulumi.set(__self__, "reconcile_shards_max_concurrency_percent", reconcile_shards_max_concurrency_percent)
-        if reconcile_shards_threads_number is not None:
-            pulumi.set(__self__, "reconcile_shards_threads_number", reconcile_shards_threads_number)
-
-    @_builtins.property
-    @pulumi.getter(name="reconcileShardsMaxConcurrencyPercent")
-    def reconcile_shards_max_concurrency_percent(self) -> Optional[_builtins.int]:
-        """
-        The maximum percentage of cluster shards that may be reconciled in parallel, 50 percent by default.
-        """
-        return pulumi.get(self, "reconcile_shards_max_concurrency_percent")
-
-    @_builtins.property
-    @pulumi.getter(name="reconcileShardsThreadsNumber")
-    def reconcile_shards_threads_number(self) -> Optional[_builtins.int]:
-        """
-        The maximum number of cluster shards that may be reconciled in parallel, 1 by default
-        """
-        return pulumi.get(self, "reconcile_shards_threads_number")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersSchemaPolicy(dict):
-    """
-    describes how schema is propagated within replicas and shards
-    """
-    def __init__(__self__, *,
-                 replica: Optional[_builtins.str] = None,
-                 shard: Optional[_builtins.str] = None):
-        """
-        describes how schema is propagated within replicas and shards
-
-
-        :param _builtins.str replica: how schema is propagated within a replica
-        :param _builtins.str shard: how schema is propagated between shards
-        """
-        if replica is not None:
-            pulumi.set(__self__, "replica", replica)
-        if shard is not None:
-            pulumi.set(__self__, "shard", shard)
-
-    @_builtins.property
-    @pulumi.getter
-    def replica(self) -> Optional[_builtins.str]:
-        """
-        how schema is propagated within a replica
-        """
-        return pulumi.get(self, "replica")
-
-    @_builtins.property
-    @pulumi.getter
-    def shard(self) -> Optional[_builtins.str]:
-        """
-        how schema is propagated between shards
-        """
-        return pulumi.get(self, "shard")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersSchemaPolicyPatch(dict):
-    """
-    describes how schema is propagated within replicas and shards
-    """
-    def __init__(__self__, *,
-                 replica: Optional[_builtins.str] = None,
-                 shard: Optional[_builtins.str] = None):
-        """
-        describes how schema is propagated within replicas and shards
-
-
-        :param _builtins.str replica: how schema is propagated within a replica
-        :param _builtins.str shard: how schema is propagated between shards
-        """
-        if replica is not None:
-            pulumi.set(__self__, "replica", replica)
-        if shard is not None:
-            pulumi.set(__self__, "shard", shard)
-
-    @_builtins.property
-    @pulumi.getter
-    def replica(self) -> Optional[_builtins.str]:
-        """
-        how schema is propagated within a replica
-        """
-        return pulumi.get(self, "replica")
-
-    @_builtins.property
-    @pulumi.getter
-    def shard(self) -> Optional[_builtins.str]:
-        """
-        how schema is propagated between shards
-        """
-        return pulumi.get(self, "shard")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersSecret(dict):
-    """
-    optional, shared secret value to secure cluster communications
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "valueFrom":
-            suggest = "value_from"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersSecret. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersSecret.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersSecret.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 auto: Optional[_builtins.str] = None,
-                 value: Optional[_builtins.str] = None,
-                 value_from: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFrom'] = None):
-        """
-        optional, shared secret value to secure cluster communications
-
-        :param _builtins.str auto: Auto-generate shared secret value to secure cluster communications
-        :param _builtins.str value: Cluster shared secret value in plain text
-        """
-        if auto is not None:
-            pulumi.set(__self__, "auto", auto)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-        if value_from is not None:
-            pulumi.set(__self__, "value_from", value_from)
-
-    @_builtins.property
-    @pulumi.getter
-    def auto(self) -> Optional[_builtins.str]:
-        """
-        Auto-generate shared secret value to secure cluster communications
-        """
-        return pulumi.get(self, "auto")
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> Optional[_builtins.str]:
-        """
-        Cluster shared secret value in plain text
-        """
-        return pulumi.get(self, "value")
-
-    @_builtins.property
-    @pulumi.getter(name="valueFrom")
-    def value_from(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFrom']:
-        return pulumi.get(self, "value_from")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersSecretPatch(dict):
-    """
-    optional, shared secret value to secure cluster communications
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "valueFrom":
-            suggest = "value_from"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersSecretPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersSecretPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersSecretPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 auto: Optional[_builtins.str] = None,
-                 value: Optional[_builtins.str] = None,
-                 value_from: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatch'] = None):
-        """
-        optional, shared secret value to secure cluster communications
-
-        :param _builtins.str auto: Auto-generate shared secret value to secure cluster communications
-        :param _builtins.str value: Cluster shared secret value in plain text
-        """
-        if auto is not None:
-            pulumi.set(__self__, "auto", auto)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-        if value_from is not None:
-            pulumi.set(__self__, "value_from", value_from)
-
-    @_builtins.property
-    @pulumi.getter
-    def auto(self) -> Optional[_builtins.str]:
-        """
-        Auto-generate shared secret value to secure cluster communications
-        """
-        return pulumi.get(self, "auto")
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> Optional[_builtins.str]:
-        """
-        Cluster shared secret value in plain text
-        """
-        return pulumi.get(self, "value")
-
-    @_builtins.property
-    @pulumi.getter(name="valueFrom")
-    def value_from(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatch']:
-        return pulumi.get(self, "value_from")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersSecretValueFrom(dict):
-    """
-    Cluster shared secret source
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "secretKeyRef":
-            suggest = "secret_key_ref"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersSecretValueFrom. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersSecretValueFrom.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersSecretValueFrom.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 secret_key_ref: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRef'] = None):
-        """
-        Cluster shared secret source
-        """
-        if secret_key_ref is not None:
-            pulumi.set(__self__, "secret_key_ref", secret_key_ref)
-
-    @_builtins.property
-    @pulumi.getter(name="secretKeyRef")
-    def secret_key_ref(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRef']:
-        return pulumi.get(self, "secret_key_ref")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatch(dict):
-    """
-    Cluster shared secret source
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "secretKeyRef":
-            suggest = "secret_key_ref"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 secret_key_ref: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatch'] = None):
-        """
-        Cluster shared secret source
-        """
-        if secret_key_ref is not None:
-            pulumi.set(__self__, "secret_key_ref", secret_key_ref)
-
-    @_builtins.property
-    @pulumi.getter(name="secretKeyRef")
-    def secret_key_ref(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatch']:
-        return pulumi.get(self, "secret_key_ref")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRef(dict):
-    """
-    Selects a key of a secret in the clickhouse installation namespace.
-    Should not be used if value is not empty.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        Selects a key of a secret in the clickhouse installation namespace.
-        Should not be used if value is not empty.
-
-
-        :param _builtins.str key: The key of the secret to select from. Must be a valid secret key.
-        :param _builtins.str name: Name of the referent. More info:
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from. Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent. More info:
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatch(dict):
-    """
-    Selects a key of a secret in the clickhouse installation namespace.
-    Should not be used if value is not empty.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        Selects a key of a secret in the clickhouse installation namespace.
-        Should not be used if value is not empty.
-
-
-        :param _builtins.str key: The key of the secret to select from. Must be a valid secret key.
-        :param _builtins.str name: Name of the referent. More info:
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from. Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent. More info:
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersTemplates(dict):
-    """
-    optional, configuration of the templates names which will use for generate Kubernetes resources according to selected cluster
-    override top-level `chi.spec.configuration.templates`
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clusterServiceTemplate":
-            suggest = "cluster_service_template"
-        elif key == "dataVolumeClaimTemplate":
-            suggest = "data_volume_claim_template"
-        elif key == "hostTemplate":
-            suggest = "host_template"
-        elif key == "logVolumeClaimTemplate":
-            suggest = "log_volume_claim_template"
-        elif key == "podTemplate":
-            suggest = "pod_template"
-        elif key == "replicaServiceTemplate":
-            suggest = "replica_service_template"
-        elif key == "serviceTemplate":
-            suggest = "service_template"
-        elif key == "serviceTemplates":
-            suggest = "service_templates"
-        elif key == "shardServiceTemplate":
-            suggest = "shard_service_template"
-        elif key == "volumeClaimTemplate":
-            suggest = "volume_claim_template"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersTemplates. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersTemplates.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersTemplates.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cluster_service_template: Optional[_builtins.str] = None,
-                 data_volume_claim_template: Optional[_builtins.str] = None,
-                 host_template: Optional[_builtins.str] = None,
-                 log_volume_claim_template: Optional[_builtins.str] = None,
-                 pod_template: Optional[_builtins.str] = None,
-                 replica_service_template: Optional[_builtins.str] = None,
-                 service_template: Optional[_builtins.str] = None,
-                 service_templates: Optional[Sequence[_builtins.str]] = None,
-                 shard_service_template: Optional[_builtins.str] = None,
-                 volume_claim_template: Optional[_builtins.str] = None):
-        """
-        optional, configuration of the templates names which will use for generate Kubernetes resources according to selected cluster
-        override top-level `chi.spec.configuration.templates`
-
-
-        :param _builtins.str cluster_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str data_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str host_template: optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        :param _builtins.str log_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str pod_template: optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str replica_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str service_template: optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param Sequence[_builtins.str] service_templates: optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param _builtins.str shard_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str volume_claim_template: optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        if cluster_service_template is not None:
-            pulumi.set(__self__, "cluster_service_template", cluster_service_template)
-        if data_volume_claim_template is not None:
-            pulumi.set(__self__, "data_volume_claim_template", data_volume_claim_template)
-        if host_template is not None:
-            pulumi.set(__self__, "host_template", host_template)
-        if log_volume_claim_template is not None:
-            pulumi.set(__self__, "log_volume_claim_template", log_volume_claim_template)
-        if pod_template is not None:
-            pulumi.set(__self__, "pod_template", pod_template)
-        if replica_service_template is not None:
-            pulumi.set(__self__, "replica_service_template", replica_service_template)
-        if service_template is not None:
-            pulumi.set(__self__, "service_template", service_template)
-        if service_templates is not None:
-            pulumi.set(__self__, "service_templates", service_templates)
-        if shard_service_template is not None:
-            pulumi.set(__self__, "shard_service_template", shard_service_template)
-        if volume_claim_template is not None:
-            pulumi.set(__self__, "volume_claim_template", volume_claim_template)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterServiceTemplate")
-    def cluster_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "cluster_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="dataVolumeClaimTemplate")
-    def data_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "data_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="hostTemplate")
-    def host_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        """
-        return pulumi.get(self, "host_template")
-
-    @_builtins.property
-    @pulumi.getter(name="logVolumeClaimTemplate")
-    def log_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "log_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="podTemplate")
-    def pod_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "pod_template")
-
-    @_builtins.property
-    @pulumi.getter(name="replicaServiceTemplate")
-    def replica_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "replica_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplate")
-    def service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplates")
-    def service_templates(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="shardServiceTemplate")
-    def shard_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "shard_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="volumeClaimTemplate")
-    def volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "volume_claim_template")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersTemplatesPatch(dict):
-    """
-    optional, configuration of the templates names which will use for generate Kubernetes resources according to selected cluster
-    override top-level `chi.spec.configuration.templates`
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clusterServiceTemplate":
-            suggest = "cluster_service_template"
-        elif key == "dataVolumeClaimTemplate":
-            suggest = "data_volume_claim_template"
-        elif key == "hostTemplate":
-            suggest = "host_template"
-        elif key == "logVolumeClaimTemplate":
-            suggest = "log_volume_claim_template"
-        elif key == "podTemplate":
-            suggest = "pod_template"
-        elif key == "replicaServiceTemplate":
-            suggest = "replica_service_template"
-        elif key == "serviceTemplate":
-            suggest = "service_template"
-        elif key == "serviceTemplates":
-            suggest = "service_templates"
-        elif key == "shardServiceTemplate":
-            suggest = "shard_service_template"
-        elif key == "volumeClaimTemplate":
-            suggest = "volume_claim_template"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersTemplatesPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersTemplatesPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersTemplatesPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cluster_service_template: Optional[_builtins.str] = None,
-                 data_volume_claim_template: Optional[_builtins.str] = None,
-                 host_template: Optional[_builtins.str] = None,
-                 log_volume_claim_template: Optional[_builtins.str] = None,
-                 pod_template: Optional[_builtins.str] = None,
-                 replica_service_template: Optional[_builtins.str] = None,
-                 service_template: Optional[_builtins.str] = None,
-                 service_templates: Optional[Sequence[_builtins.str]] = None,
-                 shard_service_template: Optional[_builtins.str] = None,
-                 volume_claim_template: Optional[_builtins.str] = None):
-        """
-        optional, configuration of the templates names which will use for generate Kubernetes resources according to selected cluster
-        override top-level `chi.spec.configuration.templates`
-
-
-        :param _builtins.str cluster_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str data_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str host_template: optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        :param _builtins.str log_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str pod_template: optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str replica_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str service_template: optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param Sequence[_builtins.str] service_templates: optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param _builtins.str shard_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str volume_claim_template: optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        if cluster_service_template is not None:
-            pulumi.set(__self__, "cluster_service_template", cluster_service_template)
-        if data_volume_claim_template is not None:
-            pulumi.set(__self__, "data_volume_claim_template", data_volume_claim_template)
-        if host_template is not None:
-            pulumi.set(__self__, "host_template", host_template)
-        if log_volume_claim_template is not None:
-            pulumi.set(__self__, "log_volume_claim_template", log_volume_claim_template)
-        if pod_template is not None:
-            pulumi.set(__self__, "pod_template", pod_template)
-        if replica_service_template is not None:
-            pulumi.set(__self__, "replica_service_template", replica_service_template)
-        if service_template is not None:
-            pulumi.set(__self__, "service_template", service_template)
-        if service_templates is not None:
-            pulumi.set(__self__, "service_templates", service_templates)
-        if shard_service_template is not None:
-            pulumi.set(__self__, "shard_service_template", shard_service_template)
-        if volume_claim_template is not None:
-            pulumi.set(__self__, "volume_claim_template", volume_claim_template)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterServiceTemplate")
-    def cluster_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "cluster_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="dataVolumeClaimTemplate")
-    def data_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "data_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="hostTemplate")
-    def host_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        """
-        return pulumi.get(self, "host_template")
-
-    @_builtins.property
-    @pulumi.getter(name="logVolumeClaimTemplate")
-    def log_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "log_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="podTemplate")
-    def pod_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "pod_template")
-
-    @_builtins.property
-    @pulumi.getter(name="replicaServiceTemplate")
-    def replica_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "replica_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplate")
-    def service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplates")
-    def service_templates(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="shardServiceTemplate")
-    def shard_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "shard_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="volumeClaimTemplate")
-    def volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "volume_claim_template")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersZookeeper(dict):
-    """
-    optional, allows configure <yandex><zookeeper>..</zookeeper></yandex> section in each `Pod` only in current ClickHouse cluster, during generate `ConfigMap` which will mounted in `/etc/clickhouse-server/config.d/`
-    override top-level `chi.spec.configuration.zookeeper` settings
-    """
-    def __init__(__self__, *,
-                 identity: Optional[_builtins.str] = None,
-                 keeper: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersZookeeperKeeper'] = None,
-                 nodes: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersZookeeperNodes']] = None,
-                 operation_timeout_ms: Optional[_builtins.int] = None,
-                 root: Optional[_builtins.str] = None,
-                 session_timeout_ms: Optional[_builtins.int] = None,
-                 use_compression: Optional[_builtins.str] = None):
-        """
-        optional, allows configure <yandex><zookeeper>..</zookeeper></yandex> section in each `Pod` only in current ClickHouse cluster, during generate `ConfigMap` which will mounted in `/etc/clickhouse-server/config.d/`
-        override top-level `chi.spec.configuration.zookeeper` settings
-
-
-        :param _builtins.str identity: optional access credentials string with `user:password` format used when use digest authorization in Zookeeper
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersZookeeperNodesArgs'] nodes: describe every available zookeeper cluster node for interaction
-        :param _builtins.int operation_timeout_ms: one operation timeout during Zookeeper transactions
-        :param _builtins.str root: optional root znode path inside zookeeper to store ClickHouse related data (replication queue or distributed DDL)
-        :param _builtins.int session_timeout_ms: session timeout during connect to Zookeeper
-        :param _builtins.str use_compression: Enables compression in Keeper protocol if set to true
-        """
-        if identity is not None:
-            pulumi.set(__self__, "identity", identity)
-        if keeper is not None:
-            pulumi.set(__self__, "keeper", keeper)
-        if nodes is not None:
-            pulumi.set(__self__, "nodes", nodes)
-        if operation_timeout_ms is not None:
-            pulumi.set(__self__, "operation_timeout_ms", operation_timeout_ms)
-        if root is not None:
-            pulumi.set(__self__, "root", root)
-        if session_timeout_ms is not None:
-            pulumi.set(__self__, "session_timeout_ms", session_timeout_ms)
-        if use_compression is not None:
-            pulumi.set(__self__, "use_compression", use_compression)
-
-    @_builtins.property
-    @pulumi.getter
-    def identity(self) -> Optional[_builtins.str]:
-        """
-        optional access credentials string with `user:password` format used when use digest authorization in Zookeeper
-        """
-        return pulumi.get(self, "identity")
-
-    @_builtins.property
-    @pulumi.getter
-    def keeper(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersZookeeperKeeper']:
-        return pulumi.get(self, "keeper")
-
-    @_builtins.property
-    @pulumi.getter
-    def nodes(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersZookeeperNodes']]:
-        """
-        describe every available zookeeper cluster node for interaction
-        """
-        return pulumi.get(self, "nodes")
-
-    @_builtins.property
-    @pulumi.getter
-    def operation_timeout_ms(self) -> Optional[_builtins.int]:
-        """
-        one operation timeout during Zookeeper transactions
-        """
-        return pulumi.get(self, "operation_timeout_ms")
-
-    @_builtins.property
-    @pulumi.getter
-    def root(self) -> Optional[_builtins.str]:
-        """
-        optional root znode path inside zookeeper to store ClickHouse related data (replication queue or distributed DDL)
-        """
-        return pulumi.get(self, "root")
-
-    @_builtins.property
-    @pulumi.getter
-    def session_timeout_ms(self) -> Optional[_builtins.int]:
-        """
-        session timeout during connect to Zookeeper
-        """
-        return pulumi.get(self, "session_timeout_ms")
-
-    @_builtins.property
-    @pulumi.getter
-    def use_compression(self) -> Optional[_builtins.str]:
-        """
-        Enables compression in Keeper protocol if set to true
-        """
-        return pulumi.get(self, "use_compression")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersZookeeperKeeper(dict):
-    """
-    reference to a ClickHouseKeeperInstallation (CHK) resource.
-    The operator resolves this to ZooKeeper node addresses automatically.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "serviceType":
-            suggest = "service_type"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersZookeeperKeeper. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersZookeeperKeeper.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersZookeeperKeeper.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 namespace: Optional[_builtins.str] = None,
-                 service_type: Optional[_builtins.str] = None):
-        """
-        reference to a ClickHouseKeeperInstallation (CHK) resource.
-        The operator resolves this to ZooKeeper node addresses automatically.
-
-
-        :param _builtins.str name: name of the ClickHouseKeeperInstallation custom resource
-        :param _builtins.str namespace: namespace of the CHK resource, defaults to the CHI namespace if omitted
-        :param _builtins.str service_type: how to discover keeper endpoints:
-                 replicas (default) — enumerate per-host services, one ZK node per keeper replica
-                 service — use the CR-level headless service as a single ZK node entry
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if namespace is not None:
-            pulumi.set(__self__, "namespace", namespace)
-        if service_type is not None:
-            pulumi.set(__self__, "service_type", service_type)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        name of the ClickHouseKeeperInstallation custom resource
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespace(self) -> Optional[_builtins.str]:
-        """
-        namespace of the CHK resource, defaults to the CHI namespace if omitted
-        """
-        return pulumi.get(self, "namespace")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceType")
-    def service_type(self) -> Optional[_builtins.str]:
-        """
-        how to discover keeper endpoints:
-          replicas (default) — enumerate per-host services, one ZK node per keeper replica
-          service — use the CR-level headless service as a single ZK node entry
-        """
-        return pulumi.get(self, "service_type")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatch(dict):
-    """
-    reference to a ClickHouseKeeperInstallation (CHK) resource.
-    The operator resolves this to ZooKeeper node addresses automatically.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "serviceType":
-            suggest = "service_type"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 namespace: Optional[_builtins.str] = None,
-                 service_type: Optional[_builtins.str] = None):
-        """
-        reference to a ClickHouseKeeperInstallation (CHK) resource.
-        The operator resolves this to ZooKeeper node addresses automatically.
-
-
-        :param _builtins.str name: name of the ClickHouseKeeperInstallation custom resource
-        :param _builtins.str namespace: namespace of the CHK resource, defaults to the CHI namespace if omitted
-        :param _builtins.str service_type: how to discover keeper endpoints:
-                 replicas (default) — enumerate per-host services, one ZK node per keeper replica
-                 service — use the CR-level headless service as a single ZK node entry
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if namespace is not None:
-            pulumi.set(__self__, "namespace", namespace)
-        if service_type is not None:
-            pulumi.set(__self__, "service_type", service_type)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        name of the ClickHouseKeeperInstallation custom resource
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespace(self) -> Optional[_builtins.str]:
-        """
-        namespace of the CHK resource, defaults to the CHI namespace if omitted
-        """
-        return pulumi.get(self, "namespace")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceType")
-    def service_type(self) -> Optional[_builtins.str]:
-        """
-        how to discover keeper endpoints:
-          replicas (default) — enumerate per-host services, one ZK node per keeper replica
-          service — use the CR-level headless service as a single ZK node entry
-        """
-        return pulumi.get(self, "service_type")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersZookeeperNodes(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "availabilityZone":
-            suggest = "availability_zone"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersZookeeperNodes. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersZookeeperNodes.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersZookeeperNodes.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 availability_zone: Optional[_builtins.str] = None,
-                 host: Optional[_builtins.str] = None,
-                 port: Optional[_builtins.int] = None,
-                 secure: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str availability_zone: availability zone for Zookeeper node
-        :param _builtins.str host: dns name or ip address for Zookeeper node
-        :param _builtins.int port: TCP port which used to connect to Zookeeper node
-        :param _builtins.str secure: if a secure connection to Zookeeper is required
-        """
-        if availability_zone is not None:
-            pulumi.set(__self__, "availability_zone", availability_zone)
-        if host is not None:
-            pulumi.set(__self__, "host", host)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if secure is not None:
-            pulumi.set(__self__, "secure", secure)
-
-    @_builtins.property
-    @pulumi.getter(name="availabilityZone")
-    def availability_zone(self) -> Optional[_builtins.str]:
-        """
-        availability zone for Zookeeper node
-        """
-        return pulumi.get(self, "availability_zone")
-
-    @_builtins.property
-    @pulumi.getter
-    def host(self) -> Optional[_builtins.str]:
-        """
-        dns name or ip address for Zookeeper node
-        """
-        return pulumi.get(self, "host")
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> Optional[_builtins.int]:
-        """
-        TCP port which used to connect to Zookeeper node
-        """
-        return pulumi.get(self, "port")
-
-    @_builtins.property
-    @pulumi.getter
-    def secure(self) -> Optional[_builtins.str]:
-        """
-        if a secure connection to Zookeeper is required
-        """
-        return pulumi.get(self, "secure")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "availabilityZone":
-            suggest = "availability_zone"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 availability_zone: Optional[_builtins.str] = None,
-                 host: Optional[_builtins.str] = None,
-                 port: Optional[_builtins.int] = None,
-                 secure: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str availability_zone: availability zone for Zookeeper node
-        :param _builtins.str host: dns name or ip address for Zookeeper node
-        :param _builtins.int port: TCP port which used to connect to Zookeeper node
-        :param _builtins.str secure: if a secure connection to Zookeeper is required
-        """
-        if availability_zone is not None:
-            pulumi.set(__self__, "availability_zone", availability_zone)
-        if host is not None:
-            pulumi.set(__self__, "host", host)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if secure is not None:
-            pulumi.set(__self__, "secure", secure)
-
-    @_builtins.property
-    @pulumi.getter(name="availabilityZone")
-    def availability_zone(self) -> Optional[_builtins.str]:
-        """
-        availability zone for Zookeeper node
-        """
-        return pulumi.get(self, "availability_zone")
-
-    @_builtins.property
-    @pulumi.getter
-    def host(self) -> Optional[_builtins.str]:
-        """
-        dns name or ip address for Zookeeper node
-        """
-        return pulumi.get(self, "host")
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> Optional[_builtins.int]:
-        """
-        TCP port which used to connect to Zookeeper node
-        """
-        return pulumi.get(self, "port")
-
-    @_builtins.property
-    @pulumi.getter
-    def secure(self) -> Optional[_builtins.str]:
-        """
-        if a secure connection to Zookeeper is required
-        """
-        return pulumi.get(self, "secure")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationClustersZookeeperPatch(dict):
-    """
-    optional, allows configure <yandex><zookeeper>..</zookeeper></yandex> section in each `Pod` only in current ClickHouse cluster, during generate `ConfigMap` which will mounted in `/etc/clickhouse-server/config.d/`
-    override top-level `chi.spec.configuration.zookeeper` settings
-    """
-    def __init__(__self__, *,
-                 identity: Optional[_builtins.str] = None,
-                 keeper: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatch'] = None,
-                 nodes: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatch']] = None,
-                 operation_timeout_ms: Optional[_builtins.int] = None,
-                 root: Optional[_builtins.str] = None,
-                 session_timeout_ms: Optional[_builtins.int] = None,
-                 use_compression: Optional[_builtins.str] = None):
-        """
-        optional, allows configure <yandex><zookeeper>..</zookeeper></yandex> section in each `Pod` only in current ClickHouse cluster, during generate `ConfigMap` which will mounted in `/etc/clickhouse-server/config.d/`
-        override top-level `chi.spec.configuration.zookeeper` settings
-
-
-        :param _builtins.str identity: optional access credentials string with `user:password` format used when use digest authorization in Zookeeper
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatchArgs'] nodes: describe every available zookeeper cluster node for interaction
-        :param _builtins.int operation_timeout_ms: one operation timeout during Zookeeper transactions
-        :param _builtins.str root: optional root znode path inside zookeeper to store ClickHouse related data (replication queue or distributed DDL)
-        :param _builtins.int session_timeout_ms: session timeout during connect to Zookeeper
-        :param _builtins.str use_compression: Enables compression in Keeper protocol if set to true
-        """
-        if identity is not None:
-            pulumi.set(__self__, "identity", identity)
-        if keeper is not None:
-            pulumi.set(__self__, "keeper", keeper)
-        if nodes is not None:
-            pulumi.set(__self__, "nodes", nodes)
-        if operation_timeout_ms is not None:
-            pulumi.set(__self__, "operation_timeout_ms", operation_timeout_ms)
-        if root is not None:
-            pulumi.set(__self__, "root", root)
-        if session_timeout_ms is not None:
-            pulumi.set(__self__, "session_timeout_ms", session_timeout_ms)
-        if use_compression is not None:
-            pulumi.set(__self__, "use_compression", use_compression)
-
-    @_builtins.property
-    @pulumi.getter
-    def identity(self) -> Optional[_builtins.str]:
-        """
-        optional access credentials string with `user:password` format used when use digest authorization in Zookeeper
-        """
-        return pulumi.get(self, "identity")
-
-    @_builtins.property
-    @pulumi.getter
-    def keeper(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatch']:
-        return pulumi.get(self, "keeper")
-
-    @_builtins.property
-    @pulumi.getter
-    def nodes(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatch']]:
-        """
-        describe every available zookeeper cluster node for interaction
-        """
-        return pulumi.get(self, "nodes")
-
-    @_builtins.property
-    @pulumi.getter
-    def operation_timeout_ms(self) -> Optional[_builtins.int]:
-        """
-        one operation timeout during Zookeeper transactions
-        """
-        return pulumi.get(self, "operation_timeout_ms")
-
-    @_builtins.property
-    @pulumi.getter
-    def root(self) -> Optional[_builtins.str]:
-        """
-        optional root znode path inside zookeeper to store ClickHouse related data (replication queue or distributed DDL)
-        """
-        return pulumi.get(self, "root")
-
-    @_builtins.property
-    @pulumi.getter
-    def session_timeout_ms(self) -> Optional[_builtins.int]:
-        """
-        session timeout during connect to Zookeeper
-        """
-        return pulumi.get(self, "session_timeout_ms")
-
-    @_builtins.property
-    @pulumi.getter
-    def use_compression(self) -> Optional[_builtins.str]:
-        """
-        Enables compression in Keeper protocol if set to true
-        """
-        return pulumi.get(self, "use_compression")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationPatch(dict):
-    """
-    allows configure multiple aspects and behavior for `clickhouse-server` instance and also allows describe multiple `clickhouse-server` clusters inside one `chi` resource
-    """
-    def __init__(__self__, *,
-                 clusters: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersPatch']] = None,
-                 files: Optional[Mapping[str, Any]] = None,
-                 profiles: Optional[Mapping[str, Any]] = None,
-                 quotas: Optional[Mapping[str, Any]] = None,
-                 settings: Optional[Mapping[str, Any]] = None,
-                 users: Optional[Mapping[str, Any]] = None,
-                 zookeeper: Optional['outputs.ClickHouseInstallationSpecConfigurationZookeeperPatch'] = None):
-        """
-        allows configure multiple aspects and behavior for `clickhouse-server` instance and also allows describe multiple `clickhouse-server` clusters inside one `chi` resource
-
-        :param Sequence['ClickHouseInstallationSpecConfigurationClustersPatchArgs'] clusters: describes clusters layout and allows change settings on cluster-level, shard-level and replica-level
-               every cluster is a set of StatefulSet, one StatefulSet contains only one Pod with `clickhouse-server`
-               all Pods will rendered in <remote_server> part of ClickHouse configs, mounted from ConfigMap as `/etc/clickhouse-server/config.d/chop-generated-remote_servers.xml`
-               Clusters will use for Distributed table engine, more details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
-               If `cluster` contains zookeeper settings (could be inherited from top `chi` level), when you can create *ReplicatedMergeTree tables
-        :param Mapping[str, Any] files: allows define content of any setting file inside each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-               every key in this object is the file name
-               every value in this object is the file content
-               you can use `!!binary |` and base64 for binary files, see details here https://yaml.org/type/binary.html
-               each key could contains prefix like {common}, {users}, {hosts} or config.d, users.d, conf.d, wrong prefixes will be ignored, subfolders also will be ignored
-               More details: https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-05-files-nested.yaml
-
-               any key could contains `valueFrom` with `secretKeyRef` which allow pass values from kubernetes secrets
-               secrets will mounted into pod as separate volume in /etc/clickhouse-server/secrets.d/
-               and will automatically update when update secret
-               it useful for pass SSL certificates from cert-manager or similar tool
-               look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
-        :param Mapping[str, Any] profiles: allows configure <yandex><profiles>..</profiles></yandex> section in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/users.d/`
-               you can configure any aspect of settings profile
-               More details: https://clickhouse.tech/docs/en/operations/settings/settings-profiles/
-               Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationprofiles
-        :param Mapping[str, Any] quotas: allows configure <yandex><quotas>..</quotas></yandex> section in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/users.d/`
-               you can configure any aspect of resource quotas
-               More details: https://clickhouse.tech/docs/en/operations/quotas/
-               Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationquotas
-        :param Mapping[str, Any] settings: allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
-               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-               Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationsettings
-
-               any key could contains `valueFrom` with `secretKeyRef` which allow pass password from kubernetes secrets
-               look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
-
-               secret value will pass in `pod.spec.env`, and generate with from_env=XXX in XML in /etc/clickhouse-server/config.d/chop-generated-settings.xml
-               it not allow automatically updates when updates `secret`, change spec.taskID for manually trigger reconcile cycle
-        :param Mapping[str, Any] users: allows configure <yandex><users>..</users></yandex> section in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/users.d/`
-               you can configure password hashed, authorization restrictions, database level security row filters etc.
-               More details: https://clickhouse.tech/docs/en/operations/settings/settings-users/
-               Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationusers
-
-               any key could contains `valueFrom` with `secretKeyRef` which allow pass password from kubernetes secrets
-               secret value will pass in `pod.spec.containers.evn`, and generate with from_env=XXX in XML in /etc/clickhouse-server/users.d/chop-generated-users.xml
-               it not allow automatically updates when updates `secret`, change spec.taskID for manually trigger reconcile cycle
-
-               look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
-
-               any key with prefix `k8s_secret_` shall has value with format namespace/secret/key or secret/key
-               in this case value from secret will write directly into XML tag during render *-usersd ConfigMap
-
-               any key with prefix `k8s_secret_env` shall has value with format namespace/secret/key or secret/key
-               in this case value from secret will write into environment variable and write to XML tag via from_env=XXX
-
-               look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
-        """
-        if clusters is not None:
-            pulumi.set(__self__, "clusters", clusters)
-        if files is not None:
-            pulumi.set(__self__, "files", files)
-        if profiles is not None:
-            pulumi.set(__self__, "profiles", profiles)
-        if quotas is not None:
-            pulumi.set(__self__, "quotas", quotas)
-        if settings is not None:
-            pulumi.set(__self__, "settings", settings)
-        if users is not None:
-            pulumi.set(__self__, "users", users)
-        if zookeeper is not None:
-            pulumi.set(__self__, "zookeeper", zookeeper)
-
-    @_builtins.property
-    @pulumi.getter
-    def clusters(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersPatch']]:
-        """
-        describes clusters layout and allows change settings on cluster-level, shard-level and replica-level
-        every cluster is a set of StatefulSet, one StatefulSet contains only one Pod with `clickhouse-server`
-        all Pods will rendered in <remote_server> part of ClickHouse configs, mounted from ConfigMap as `/etc/clickhouse-server/config.d/chop-generated-remote_servers.xml`
-        Clusters will use for Distributed table engine, more details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
-        If `cluster` contains zookeeper settings (could be inherited from top `chi` level), when you can create *ReplicatedMergeTree tables
-        """
-        return pulumi.get(self, "clusters")
-
-    @_builtins.property
-    @pulumi.getter
-    def files(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows define content of any setting file inside each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-        every key in this object is the file name
-        every value in this object is the file content
-        you can use `!!binary |` and base64 for binary files, see details here https://yaml.org/type/binary.html
-        each key could contains prefix like {common}, {users}, {hosts} or config.d, users.d, conf.d, wrong prefixes will be ignored, subfolders also will be ignored
-        More details: https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-05-files-nested.yaml
-
-        any key could contains `valueFrom` with `secretKeyRef` which allow pass values from kubernetes secrets
-        secrets will mounted into pod as separate volume in /etc/clickhouse-server/secrets.d/
-        and will automatically update when update secret
-        it useful for pass SSL certificates from cert-manager or similar tool
-        look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
-        """
-        return pulumi.get(self, "files")
-
-    @_builtins.property
-    @pulumi.getter
-    def profiles(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows configure <yandex><profiles>..</profiles></yandex> section in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/users.d/`
-        you can configure any aspect of settings profile
-        More details: https://clickhouse.tech/docs/en/operations/settings/settings-profiles/
-        Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationprofiles
-        """
-        return pulumi.get(self, "profiles")
-
-    @_builtins.property
-    @pulumi.getter
-    def quotas(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows configure <yandex><quotas>..</quotas></yandex> section in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/users.d/`
-        you can configure any aspect of resource quotas
-        More details: https://clickhouse.tech/docs/en/operations/quotas/
-        Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationquotas
-        """
-        return pulumi.get(self, "quotas")
-
-    @_builtins.property
-    @pulumi.getter
-    def settings(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
-        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationsettings
-
-        any key could contains `valueFrom` with `secretKeyRef` which allow pass password from kubernetes secrets
-        look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
-
-        secret value will pass in `pod.spec.env`, and generate with from_env=XXX in XML in /etc/clickhouse-server/config.d/chop-generated-settings.xml
-        it not allow automatically updates when updates `secret`, change spec.taskID for manually trigger reconcile cycle
-        """
-        return pulumi.get(self, "settings")
-
-    @_builtins.property
-    @pulumi.getter
-    def users(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows configure <yandex><users>..</users></yandex> section in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/users.d/`
-        you can configure password hashed, authorization restrictions, database level security row filters etc.
-        More details: https://clickhouse.tech/docs/en/operations/settings/settings-users/
-        Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationusers
-
-        any key could contains `valueFrom` with `secretKeyRef` which allow pass password from kubernetes secrets
-        secret value will pass in `pod.spec.containers.evn`, and generate with from_env=XXX in XML in /etc/clickhouse-server/users.d/chop-generated-users.xml
-        it not allow automatically updates when updates `secret`, change spec.taskID for manually trigger reconcile cycle
-
-        look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
-
-        any key with prefix `k8s_secret_` shall has value with format namespace/secret/key or secret/key
-        in this case value from secret will write directly into XML tag during render *-usersd ConfigMap
-
-        any key with prefix `k8s_secret_env` shall has value with format namespace/secret/key or secret/key
-        in this case value from secret will write into environment variable and write to XML tag via from_env=XXX
-
-        look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
-        """
-        return pulumi.get(self, "users")
-
-    @_builtins.property
-    @pulumi.getter
-    def zookeeper(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationZookeeperPatch']:
-        return pulumi.get(self, "zookeeper")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationZookeeper(dict):
-    """
-    allows configure <yandex><zookeeper>..</zookeeper></yandex> section in each `Pod` during generate `ConfigMap` which will mounted in `/etc/clickhouse-server/config.d/`
-    `clickhouse-operator` itself doesn't manage Zookeeper, please install Zookeeper separatelly look examples on https://github.com/Altinity/clickhouse-operator/tree/master/deploy/zookeeper/
-    currently, zookeeper (or clickhouse-keeper replacement) used for *ReplicatedMergeTree table engines and for `distributed_ddl`
-    More details: https://clickhouse.tech/docs/en/operations/server-configuration-parameters/settings/#server-settings_zookeeper
-    """
-    def __init__(__self__, *,
-                 identity: Optional[_builtins.str] = None,
-                 keeper: Optional['outputs.ClickHouseInstallationSpecConfigurationZookeeperKeeper'] = None,
-                 nodes: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationZookeeperNodes']] = None,
-                 operation_timeout_ms: Optional[_builtins.int] = None,
-                 root: Optional[_builtins.str] = None,
-                 session_timeout_ms: Optional[_builtins.int] = None,
-                 use_compression: Optional[_builtins.str] = None):
-        """
-        allows configure <yandex><zookeeper>..</zookeeper></yandex> section in each `Pod` during generate `ConfigMap` which will mounted in `/etc/clickhouse-server/config.d/`
-        `clickhouse-operator` itself doesn't manage Zookeeper, please install Zookeeper separatelly look examples on https://github.com/Altinity/clickhouse-operator/tree/master/deploy/zookeeper/
-        currently, zookeeper (or clickhouse-keeper replacement) used for *ReplicatedMergeTree table engines and for `distributed_ddl`
-        More details: https://clickhouse.tech/docs/en/operations/server-configuration-parameters/settings/#server-settings_zookeeper
-
-
-        :param _builtins.str identity: optional access credentials string with `user:password` format used when use digest authorization in Zookeeper
-        :param Sequence['ClickHouseInstallationSpecConfigurationZookeeperNodesArgs'] nodes: describe every available zookeeper cluster node for interaction
-        :param _builtins.int operation_timeout_ms: one operation timeout during Zookeeper transactions
-        :param _builtins.str root: optional root znode path inside zookeeper to store ClickHouse related data (replication queue or distributed DDL)
-        :param _builtins.int session_timeout_ms: session timeout during connect to Zookeeper
-        :param _builtins.str use_compression: Enables compression in Keeper protocol if set to true
-        """
-        if identity is not None:
-            pulumi.set(__self__, "identity", identity)
-        if keeper is not None:
-            pulumi.set(__self__, "keeper", keeper)
-        if nodes is not None:
-            pulumi.set(__self__, "nodes", nodes)
-        if operation_timeout_ms is not None:
-            pulumi.set(__self__, "operation_timeout_ms", operation_timeout_ms)
-        if root is not None:
-            pulumi.set(__self__, "root", root)
-        if session_timeout_ms is not None:
-            pulumi.set(__self__, "session_timeout_ms", session_timeout_ms)
-        if use_compression is not None:
-            pulumi.set(__self__, "use_compression", use_compression)
-
-    @_builtins.property
-    @pulumi.getter
-    def identity(self) -> Optional[_builtins.str]:
-        """
-        optional access credentials string with `user:password` format used when use digest authorization in Zookeeper
-        """
-        return pulumi.get(self, "identity")
-
-    @_builtins.property
-    @pulumi.getter
-    def keeper(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationZookeeperKeeper']:
-        return pulumi.get(self, "keeper")
-
-    @_builtins.property
-    @pulumi.getter
-    def nodes(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationZookeeperNodes']]:
-        """
-        describe every available zookeeper cluster node for interaction
-        """
-        return pulumi.get(self, "nodes")
-
-    @_builtins.property
-    @pulumi.getter
-    def operation_timeout_ms(self) -> Optional[_builtins.int]:
-        """
-        one operation timeout during Zookeeper transactions
-        """
-        return pulumi.get(self, "operation_timeout_ms")
-
-    @_builtins.property
-    @pulumi.getter
-    def root(self) -> Optional[_builtins.str]:
-        """
-        optional root znode path inside zookeeper to store ClickHouse related data (replication queue or distributed DDL)
-        """
-        return pulumi.get(self, "root")
-
-    @_builtins.property
-    @pulumi.getter
-    def session_timeout_ms(self) -> Optional[_builtins.int]:
-        """
-        session timeout during connect to Zookeeper
-        """
-        return pulumi.get(self, "session_timeout_ms")
-
-    @_builtins.property
-    @pulumi.getter
-    def use_compression(self) -> Optional[_builtins.str]:
-        """
-        Enables compression in Keeper protocol if set to true
-        """
-        return pulumi.get(self, "use_compression")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationZookeeperKeeper(dict):
-    """
-    reference to a ClickHouseKeeperInstallation (CHK) resource.
-    The operator resolves this to ZooKeeper node addresses automatically.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "serviceType":
-            suggest = "service_type"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationZookeeperKeeper. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationZookeeperKeeper.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationZookeeperKeeper.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 namespace: Optional[_builtins.str] = None,
-                 service_type: Optional[_builtins.str] = None):
-        """
-        reference to a ClickHouseKeeperInstallation (CHK) resource.
-        The operator resolves this to ZooKeeper node addresses automatically.
-
-
-        :param _builtins.str name: name of the ClickHouseKeeperInstallation custom resource
-        :param _builtins.str namespace: namespace of the CHK resource, defaults to the CHI namespace if omitted
-        :param _builtins.str service_type: how to discover keeper endpoints:
-                 replicas (default) — enumerate per-host services, one ZK node per keeper replica
-                 service — use the CR-level headless service as a single ZK node entry
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if namespace is not None:
-            pulumi.set(__self__, "namespace", namespace)
-        if service_type is not None:
-            pulumi.set(__self__, "service_type", service_type)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        name of the ClickHouseKeeperInstallation custom resource
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespace(self) -> Optional[_builtins.str]:
-        """
-        namespace of the CHK resource, defaults to the CHI namespace if omitted
-        """
-        return pulumi.get(self, "namespace")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceType")
-    def service_type(self) -> Optional[_builtins.str]:
-        """
-        how to discover keeper endpoints:
-          replicas (default) — enumerate per-host services, one ZK node per keeper replica
-          service — use the CR-level headless service as a single ZK node entry
-        """
-        return pulumi.get(self, "service_type")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationZookeeperKeeperPatch(dict):
-    """
-    reference to a ClickHouseKeeperInstallation (CHK) resource.
-    The operator resolves this to ZooKeeper node addresses automatically.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "serviceType":
-            suggest = "service_type"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationZookeeperKeeperPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationZookeeperKeeperPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationZookeeperKeeperPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 namespace: Optional[_builtins.str] = None,
-                 service_type: Optional[_builtins.str] = None):
-        """
-        reference to a ClickHouseKeeperInstallation (CHK) resource.
-        The operator resolves this to ZooKeeper node addresses automatically.
-
-
-        :param _builtins.str name: name of the ClickHouseKeeperInstallation custom resource
-        :param _builtins.str namespace: namespace of the CHK resource, defaults to the CHI namespace if omitted
-        :param _builtins.str service_type: how to discover keeper endpoints:
-                 replicas (default) — enumerate per-host services, one ZK node per keeper replica
-                 service — use the CR-level headless service as a single ZK node entry
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if namespace is not None:
-            pulumi.set(__self__, "namespace", namespace)
-        if service_type is not None:
-            pulumi.set(__self__, "service_type", service_type)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        name of the ClickHouseKeeperInstallation custom resource
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespace(self) -> Optional[_builtins.str]:
-        """
-        namespace of the CHK resource, defaults to the CHI namespace if omitted
-        """
-        return pulumi.get(self, "namespace")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceType")
-    def service_type(self) -> Optional[_builtins.str]:
-        """
-        how to discover keeper endpoints:
-          replicas (default) — enumerate per-host services, one ZK node per keeper replica
-          service — use the CR-level headless service as a single ZK node entry
-        """
-        return pulumi.get(self, "service_type")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationZookeeperNodes(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "availabilityZone":
-            suggest = "availability_zone"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationZookeeperNodes. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationZookeeperNodes.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationZookeeperNodes.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 availability_zone: Optional[_builtins.str] = None,
-                 host: Optional[_builtins.str] = None,
-                 port: Optional[_builtins.int] = None,
-                 secure: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str availability_zone: availability zone for Zookeeper node
-        :param _builtins.str host: dns name or ip address for Zookeeper node
-        :param _builtins.int port: TCP port which used to connect to Zookeeper node
-        :param _builtins.str secure: if a secure connection to Zookeeper is required
-        """
-        if availability_zone is not None:
-            pulumi.set(__self__, "availability_zone", availability_zone)
-        if host is not None:
-            pulumi.set(__self__, "host", host)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if secure is not None:
-            pulumi.set(__self__, "secure", secure)
-
-    @_builtins.property
-    @pulumi.getter(name="availabilityZone")
-    def availability_zone(self) -> Optional[_builtins.str]:
-        """
-        availability zone for Zookeeper node
-        """
-        return pulumi.get(self, "availability_zone")
-
-    @_builtins.property
-    @pulumi.getter
-    def host(self) -> Optional[_builtins.str]:
-        """
-        dns name or ip address for Zookeeper node
-        """
-        return pulumi.get(self, "host")
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> Optional[_builtins.int]:
-        """
-        TCP port which used to connect to Zookeeper node
-        """
-        return pulumi.get(self, "port")
-
-    @_builtins.property
-    @pulumi.getter
-    def secure(self) -> Optional[_builtins.str]:
-        """
-        if a secure connection to Zookeeper is required
-        """
-        return pulumi.get(self, "secure")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationZookeeperNodesPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "availabilityZone":
-            suggest = "availability_zone"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationZookeeperNodesPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecConfigurationZookeeperNodesPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecConfigurationZookeeperNodesPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 availability_zone: Optional[_builtins.str] = None,
-                 host: Optional[_builtins.str] = None,
-                 port: Optional[_builtins.int] = None,
-                 secure: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str availability_zone: availability zone for Zookeeper node
-        :param _builtins.str host: dns name or ip address for Zookeeper node
-        :param _builtins.int port: TCP port which used to connect to Zookeeper node
-        :param _builtins.str secure: if a secure connection to Zookeeper is required
-        """
-        if availability_zone is not None:
-            pulumi.set(__self__, "availability_zone", availability_zone)
-        if host is not None:
-            pulumi.set(__self__, "host", host)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if secure is not None:
-            pulumi.set(__self__, "secure", secure)
-
-    @_builtins.property
-    @pulumi.getter(name="availabilityZone")
-    def availability_zone(self) -> Optional[_builtins.str]:
-        """
-        availability zone for Zookeeper node
-        """
-        return pulumi.get(self, "availability_zone")
-
-    @_builtins.property
-    @pulumi.getter
-    def host(self) -> Optional[_builtins.str]:
-        """
-        dns name or ip address for Zookeeper node
-        """
-        return pulumi.get(self, "host")
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> Optional[_builtins.int]:
-        """
-        TCP port which used to connect to Zookeeper node
-        """
-        return pulumi.get(self, "port")
-
-    @_builtins.property
-    @pulumi.getter
-    def secure(self) -> Optional[_builtins.str]:
-        """
-        if a secure connection to Zookeeper is required
-        """
-        return pulumi.get(self, "secure")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecConfigurationZookeeperPatch(dict):
-    """
-    allows configure <yandex><zookeeper>..</zookeeper></yandex> section in each `Pod` during generate `ConfigMap` which will mounted in `/etc/clickhouse-server/config.d/`
-    `clickhouse-operator` itself doesn't manage Zookeeper, please install Zookeeper separatelly look examples on https://github.com/Altinity/clickhouse-operator/tree/master/deploy/zookeeper/
-    currently, zookeeper (or clickhouse-keeper replacement) used for *ReplicatedMergeTree table engines and for `distributed_ddl`
-    More details: https://clickhouse.tech/docs/en/operations/server-configuration-parameters/settings/#server-settings_zookeeper
-    """
-    def __init__(__self__, *,
-                 identity: Optional[_builtins.str] = None,
-                 keeper: Optional['outputs.ClickHouseInstallationSpecConfigurationZookeeperKeeperPatch'] = None,
-                 nodes: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationZookeeperNodesPatch']] = None,
-                 operation_timeout_ms: Optional[_builtins.int] = None,
-                 root: Optional[_builtins.str] = None,
-                 session_timeout_ms: Optional[_builtins.int] = None,
-                 use_compression: Optional[_builtins.str] = None):
-        """
-        allows configure <yandex><zookeeper>..</zookeeper></yandex> section in each `Pod` during generate `ConfigMap` which will mounted in `/etc/clickhouse-server/config.d/`
-        `clickhouse-operator` itself doesn't manage Zookeeper, please install Zookeeper separatelly look examples on https://github.com/Altinity/clickhouse-operator/tree/master/deploy/zookeeper/
-        currently, zookeeper (or clickhouse-keeper replacement) used for *ReplicatedMergeTree table engines and for `distributed_ddl`
-        More details: https://clickhouse.tech/docs/en/operations/server-configuration-parameters/settings/#server-settings_zookeeper
-
-
-        :param _builtins.str identity: optional access credentials string with `user:password` format used when use digest authorization in Zookeeper
-        :param Sequence['ClickHouseInstallationSpecConfigurationZookeeperNodesPatchArgs'] nodes: describe every available zookeeper cluster node for interaction
-        :param _builtins.int operation_timeout_ms: one operation timeout during Zookeeper transactions
-        :param _builtins.str root: optional root znode path inside zookeeper to store ClickHouse related data (replication queue or distributed DDL)
-        :param _builtins.int session_timeout_ms: session timeout during connect to Zookeeper
-        :param _builtins.str use_compression: Enables compression in Keeper protocol if set to true
-        """
-        if identity is not None:
-            pulumi.set(__self__, "identity", identity)
-        if keeper is not None:
-            pulumi.set(__self__, "keeper", keeper)
-        if nodes is not None:
-            pulumi.set(__self__, "nodes", nodes)
-        if operation_timeout_ms is not None:
-            pulumi.set(__self__, "operation_timeout_ms", operation_timeout_ms)
-        if root is not None:
-            pulumi.set(__self__, "root", root)
-        if session_timeout_ms is not None:
-            pulumi.set(__self__, "session_timeout_ms", session_timeout_ms)
-        if use_compression is not None:
-            pulumi.set(__self__, "use_compression", use_compression)
-
-    @_builtins.property
-    @pulumi.getter
-    def identity(self) -> Optional[_builtins.str]:
-        """
-        optional access credentials string with `user:password` format used when use digest authorization in Zookeeper
-        """
-        return pulumi.get(self, "identity")
-
-    @_builtins.property
-    @pulumi.getter
-    def keeper(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationZookeeperKeeperPatch']:
-        return pulumi.get(self, "keeper")
-
-    @_builtins.property
-    @pulumi.getter
-    def nodes(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationZookeeperNodesPatch']]:
-        """
-        describe every available zookeeper cluster node for interaction
-        """
-        return pulumi.get(self, "nodes")
-
-    @_builtins.property
-    @pulumi.getter
-    def operation_timeout_ms(self) -> Optional[_builtins.int]:
-        """
-        one operation timeout during Zookeeper transactions
-        """
-        return pulumi.get(self, "operation_timeout_ms")
-
-    @_builtins.property
-    @pulumi.getter
-    def root(self) -> Optional[_builtins.str]:
-        """
-        optional root znode path inside zookeeper to store ClickHouse related data (replication queue or distributed DDL)
-        """
-        return pulumi.get(self, "root")
-
-    @_builtins.property
-    @pulumi.getter
-    def session_timeout_ms(self) -> Optional[_builtins.int]:
-        """
-        session timeout during connect to Zookeeper
-        """
-        return pulumi.get(self, "session_timeout_ms")
-
-    @_builtins.property
-    @pulumi.getter
-    def use_compression(self) -> Optional[_builtins.str]:
-        """
-        Enables compression in Keeper protocol if set to true
-        """
-        return pulumi.get(self, "use_compression")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecDefaults(dict):
-    """
-    define default behavior for whole ClickHouseInstallation, some behavior can be re-define on cluster, shard and replica level
-    More info: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specdefaults
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "distributedDDL":
-            suggest = "distributed_ddl"
-        elif key == "replicasUseFQDN":
-            suggest = "replicas_use_fqdn"
-        elif key == "storageManagement":
-            suggest = "storage_management"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecDefaults. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecDefaults.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecDefaults.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 distributed_ddl: Optional['outputs.ClickHouseInstallationSpecDefaultsDistributedDDL'] = None,
-                 replicas_use_fqdn: Optional[_builtins.str] = None,
-                 storage_management: Optional['outputs.ClickHouseInstallationSpecDefaultsStorageManagement'] = None,
-                 templates: Optional['outputs.ClickHouseInstallationSpecDefaultsTemplates'] = None):
-        """
-        define default behavior for whole ClickHouseInstallation, some behavior can be re-define on cluster, shard and replica level
-        More info: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specdefaults
-
-
-        :param _builtins.str replicas_use_fqdn: define should replicas be specified by FQDN in `<host></host>`.
-               In case of "no" will use short hostname and clickhouse-server will use kubernetes default suffixes for DNS lookup
-               "no" by default
-        """
-        if distributed_ddl is not None:
-            pulumi.set(__self__, "distributed_ddl", distributed_ddl)
-        if replicas_use_fqdn is not None:
-            pulumi.set(__self__, "replicas_use_fqdn", replicas_use_fqdn)
-        if storage_management is not None:
-            pulumi.set(__self__, "storage_management", storage_management)
-        if templates is not None:
-            pulumi.set(__self__, "templates", templates)
-
-    @_builtins.property
-    @pulumi.getter(name="distributedDDL")
-    def distributed_ddl(self) -> Optional['outputs.ClickHouseInstallationSpecDefaultsDistributedDDL']:
-        return pulumi.get(self, "distributed_ddl")
-
-    @_builtins.property
-    @pulumi.getter(name="replicasUseFQDN")
-    def replicas_use_fqdn(self) -> Optional[_builtins.str]:
-        """
-        define should replicas be specified by FQDN in `<host></host>`.
-        In case of "no" will use short hostname and clickhouse-server will use kubernetes default suffixes for DNS lookup
-        "no" by default
-        """
-        return pulumi.get(self, "replicas_use_fqdn")
-
-    @_builtins.property
-    @pulumi.getter(name="storageManagement")
-    def storage_management(self) -> Optional['outputs.ClickHouseInstallationSpecDefaultsStorageManagement']:
-        return pulumi.get(self, "storage_management")
-
-    @_builtins.property
-    @pulumi.getter
-    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecDefaultsTemplates']:
-        return pulumi.get(self, "templates")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecDefaultsDistributedDDL(dict):
-    """
-    allows change `<yandex><distributed_ddl></distributed_ddl></yandex>` settings
-    More info: https://clickhouse.tech/docs/en/operations/server-configuration-parameters/settings/#server-settings-distributed_ddl
-    """
-    def __init__(__self__, *,
-                 profile: Optional[_builtins.str] = None):
-        """
-        allows change `<yandex><distributed_ddl></distributed_ddl></yandex>` settings
-        More info: https://clickhouse.tech/docs/en/operations/server-configuration-parameters/settings/#server-settings-distributed_ddl
-
-
-        :param _builtins.str profile: Settings from this profile will be used to execute DDL queries
-        """
-        if profile is not None:
-            pulumi.set(__self__, "profile", profile)
-
-    @_builtins.property
-    @pulumi.getter
-    def profile(self) -> Optional[_builtins.str]:
-        """
-        Settings from this profile will be used to execute DDL queries
-        """
-        return pulumi.get(self, "profile")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecDefaultsDistributedDDLPatch(dict):
-    """
-    allows change `<yandex><distributed_ddl></distributed_ddl></yandex>` settings
-    More info: https://clickhouse.tech/docs/en/operations/server-configuration-parameters/settings/#server-settings-distributed_ddl
-    """
-    def __init__(__self__, *,
-                 profile: Optional[_builtins.str] = None):
-        """
-        allows change `<yandex><distributed_ddl></distributed_ddl></yandex>` settings
-        More info: https://clickhouse.tech/docs/en/operations/server-configuration-parameters/settings/#server-settings-distributed_ddl
-
-
-        :param _builtins.str profile: Settings from this profile will be used to execute DDL queries
-        """
-        if profile is not None:
-            pulumi.set(__self__, "profile", profile)
-
-    @_builtins.property
-    @pulumi.getter
-    def profile(self) -> Optional[_builtins.str]:
-        """
-        Settings from this profile will be used to execute DDL queries
-        """
-        return pulumi.get(self, "profile")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecDefaultsPatch(dict):
-    """
-    define default behavior for whole ClickHouseInstallation, some behavior can be re-define on cluster, shard and replica level
-    More info: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specdefaults
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "distributedDDL":
-            suggest = "distributed_ddl"
-        elif key == "replicasUseFQDN":
-            suggest = "replicas_use_fqdn"
-        elif key == "storageManagement":
-            suggest = "storage_management"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecDefaultsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecDefaultsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecDefaultsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 distributed_ddl: Optional['outputs.ClickHouseInstallationSpecDefaultsDistributedDDLPatch'] = None,
-                 replicas_use_fqdn: Optional[_builtins.str] = None,
-                 storage_management: Optional['outputs.ClickHouseInstallationSpecDefaultsStorageManagementPatch'] = None,
-                 templates: Optional['outputs.ClickHouseInstallationSpecDefaultsTemplatesPatch'] = None):
-        """
-        define default behavior for whole ClickHouseInstallation, some behavior can be re-define on cluster, shard and replica level
-        More info: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specdefaults
-
-
-        :param _builtins.str replicas_use_fqdn: define should replicas be specified by FQDN in `<host></host>`.
-               In case of "no" will use short hostname and clickhouse-server will use kubernetes default suffixes for DNS lookup
-               "no" by default
-        """
-        if distributed_ddl is not None:
-            pulumi.set(__self__, "distributed_ddl", distributed_ddl)
-        if replicas_use_fqdn is not None:
-            pulumi.set(__self__, "replicas_use_fqdn", replicas_use_fqdn)
-        if storage_management is not None:
-            pulumi.set(__self__, "storage_management", storage_management)
-        if templates is not None:
-            pulumi.set(__self__, "templates", templates)
-
-    @_builtins.property
-    @pulumi.getter(name="distributedDDL")
-    def distributed_ddl(self) -> Optional['outputs.ClickHouseInstallationSpecDefaultsDistributedDDLPatch']:
-        return pulumi.get(self, "distributed_ddl")
-
-    @_builtins.property
-    @pulumi.getter(name="replicasUseFQDN")
-    def replicas_use_fqdn(self) -> Optional[_builtins.str]:
-        """
-        define should replicas be specified by FQDN in `<host></host>`.
-        In case of "no" will use short hostname and clickhouse-server will use kubernetes default suffixes for DNS lookup
-        "no" by default
-        """
-        return pulumi.get(self, "replicas_use_fqdn")
-
-    @_builtins.property
-    @pulumi.getter(name="storageManagement")
-    def storage_management(self) -> Optional['outputs.ClickHouseInstallationSpecDefaultsStorageManagementPatch']:
-        return pulumi.get(self, "storage_management")
-
-    @_builtins.property
-    @pulumi.getter
-    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecDefaultsTemplatesPatch']:
-        return pulumi.get(self, "templates")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecDefaultsStorageManagement(dict):
-    """
-    default storage management options
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "reclaimPolicy":
-            suggest = "reclaim_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecDefaultsStorageManagement. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecDefaultsStorageManagement.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecDefaultsStorageManagement.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 provisioner: Optional[_builtins.str] = None,
-                 reclaim_policy: Optional[_builtins.str] = None):
-        """
-        default storage management options
-
-        :param _builtins.str provisioner: defines `PVC` provisioner - be it StatefulSet or the Operator
-        :param _builtins.str reclaim_policy: defines behavior of `PVC` deletion.
-               `Delete` by default, if `Retain` specified then `PVC` will be kept when deleting StatefulSet
-        """
-        if provisioner is not None:
-            pulumi.set(__self__, "provisioner", provisioner)
-        if reclaim_policy is not None:
-            pulumi.set(__self__, "reclaim_policy", reclaim_policy)
-
-    @_builtins.property
-    @pulumi.getter
-    def provisioner(self) -> Optional[_builtins.str]:
-        """
-        defines `PVC` provisioner - be it StatefulSet or the Operator
-        """
-        return pulumi.get(self, "provisioner")
-
-    @_builtins.property
-    @pulumi.getter(name="reclaimPolicy")
-    def reclaim_policy(self) -> Optional[_builtins.str]:
-        """
-        defines behavior of `PVC` deletion.
-        `Delete` by default, if `Retain` specified then `PVC` will be kept when deleting StatefulSet
-        """
-        return pulumi.get(self, "reclaim_policy")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecDefaultsStorageManagementPatch(dict):
-    """
-    default storage management options
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "reclaimPolicy":
-            suggest = "reclaim_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecDefaultsStorageManagementPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecDefaultsStorageManagementPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecDefaultsStorageManagementPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 provisioner: Optional[_builtins.str] = None,
-                 reclaim_policy: Optional[_builtins.str] = None):
-        """
-        default storage management options
-
-        :param _builtins.str provisioner: defines `PVC` provisioner - be it StatefulSet or the Operator
-        :param _builtins.str reclaim_policy: defines behavior of `PVC` deletion.
-               `Delete` by default, if `Retain` specified then `PVC` will be kept when deleting StatefulSet
-        """
-        if provisioner is not None:
-            pulumi.set(__self__, "provisioner", provisioner)
-        if reclaim_policy is not None:
-            pulumi.set(__self__, "reclaim_policy", reclaim_policy)
-
-    @_builtins.property
-    @pulumi.getter
-    def provisioner(self) -> Optional[_builtins.str]:
-        """
-        defines `PVC` provisioner - be it StatefulSet or the Operator
-        """
-        return pulumi.get(self, "provisioner")
-
-    @_builtins.property
-    @pulumi.getter(name="reclaimPolicy")
-    def reclaim_policy(self) -> Optional[_builtins.str]:
-        """
-        defines behavior of `PVC` deletion.
-        `Delete` by default, if `Retain` specified then `PVC` will be kept when deleting StatefulSet
-        """
-        return pulumi.get(self, "reclaim_policy")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecDefaultsTemplates(dict):
-    """
-    optional, configuration of the templates names which will use for generate Kubernetes resources according to one or more ClickHouse clusters described in current ClickHouseInstallation (chi) resource
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clusterServiceTemplate":
-            suggest = "cluster_service_template"
-        elif key == "dataVolumeClaimTemplate":
-            suggest = "data_volume_claim_template"
-        elif key == "hostTemplate":
-            suggest = "host_template"
-        elif key == "logVolumeClaimTemplate":
-            suggest = "log_volume_claim_template"
-        elif key == "podTemplate":
-            suggest = "pod_template"
-        elif key == "replicaServiceTemplate":
-            suggest = "replica_service_template"
-        elif key == "serviceTemplate":
-            suggest = "service_template"
-        elif key == "serviceTemplates":
-            suggest = "service_templates"
-        elif key == "shardServiceTemplate":
-            suggest = "shard_service_template"
-        elif key == "volumeClaimTemplate":
-            suggest = "volume_claim_template"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecDefaultsTemplates. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecDefaultsTemplates.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecDefaultsTemplates.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cluster_service_template: Optional[_builtins.str] = None,
-                 data_volume_claim_template: Optional[_builtins.str] = None,
-                 host_template: Optional[_builtins.str] = None,
-                 log_volume_claim_template: Optional[_builtins.str] = None,
-                 pod_template: Optional[_builtins.str] = None,
-                 replica_service_template: Optional[_builtins.str] = None,
-                 service_template: Optional[_builtins.str] = None,
-                 service_templates: Optional[Sequence[_builtins.str]] = None,
-                 shard_service_template: Optional[_builtins.str] = None,
-                 volume_claim_template: Optional[_builtins.str] = None):
-        """
-        optional, configuration of the templates names which will use for generate Kubernetes resources according to one or more ClickHouse clusters described in current ClickHouseInstallation (chi) resource
-
-        :param _builtins.str cluster_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str data_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str host_template: optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        :param _builtins.str log_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str pod_template: optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str replica_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str service_template: optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param Sequence[_builtins.str] service_templates: optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param _builtins.str shard_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str volume_claim_template: optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        if cluster_service_template is not None:
-            pulumi.set(__self__, "cluster_service_template", cluster_service_template)
-        if data_volume_claim_template is not None:
-            pulumi.set(__self__, "data_volume_claim_template", data_volume_claim_template)
-        if host_template is not None:
-            pulumi.set(__self__, "host_template", host_template)
-        if log_volume_claim_template is not None:
-            pulumi.set(__self__, "log_volume_claim_template", log_volume_claim_template)
-        if pod_template is not None:
-            pulumi.set(__self__, "pod_template", pod_template)
-        if replica_service_template is not None:
-            pulumi.set(__self__, "replica_service_template", replica_service_template)
-        if service_template is not None:
-            pulumi.set(__self__, "service_template", service_template)
-        if service_templates is not None:
-            pulumi.set(__self__, "service_templates", service_templates)
-        if shard_service_template is not None:
-            pulumi.set(__self__, "shard_service_template", shard_service_template)
-        if volume_claim_template is not None:
-            pulumi.set(__self__, "volume_claim_template", volume_claim_template)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterServiceTemplate")
-    def cluster_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "cluster_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="dataVolumeClaimTemplate")
-    def data_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "data_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="hostTemplate")
-    def host_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        """
-        return pulumi.get(self, "host_template")
-
-    @_builtins.property
-    @pulumi.getter(name="logVolumeClaimTemplate")
-    def log_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "log_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="podTemplate")
-    def pod_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "pod_template")
-
-    @_builtins.property
-    @pulumi.getter(name="replicaServiceTemplate")
-    def replica_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "replica_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplate")
-    def service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplates")
-    def service_templates(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="shardServiceTemplate")
-    def shard_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "shard_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="volumeClaimTemplate")
-    def volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "volume_claim_template")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecDefaultsTemplatesPatch(dict):
-    """
-    optional, configuration of the templates names which will use for generate Kubernetes resources according to one or more ClickHouse clusters described in current ClickHouseInstallation (chi) resource
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clusterServiceTemplate":
-            suggest = "cluster_service_template"
-        elif key == "dataVolumeClaimTemplate":
-            suggest = "data_volume_claim_template"
-        elif key == "hostTemplate":
-            suggest = "host_template"
-        elif key == "logVolumeClaimTemplate":
-            suggest = "log_volume_claim_template"
-        elif key == "podTemplate":
-            suggest = "pod_template"
-        elif key == "replicaServiceTemplate":
-            suggest = "replica_service_template"
-        elif key == "serviceTemplate":
-            suggest = "service_template"
-        elif key == "serviceTemplates":
-            suggest = "service_templates"
-        elif key == "shardServiceTemplate":
-            suggest = "shard_service_template"
-        elif key == "volumeClaimTemplate":
-            suggest = "volume_claim_template"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecDefaultsTemplatesPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecDefaultsTemplatesPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecDefaultsTemplatesPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cluster_service_template: Optional[_builtins.str] = None,
-                 data_volume_claim_template: Optional[_builtins.str] = None,
-                 host_template: Optional[_builtins.str] = None,
-                 log_volume_claim_template: Optional[_builtins.str] = None,
-                 pod_template: Optional[_builtins.str] = None,
-                 replica_service_template: Optional[_builtins.str] = None,
-                 service_template: Optional[_builtins.str] = None,
-                 service_templates: Optional[Sequence[_builtins.str]] = None,
-                 shard_service_template: Optional[_builtins.str] = None,
-                 volume_claim_template: Optional[_builtins.str] = None):
-        """
-        optional, configuration of the templates names which will use for generate Kubernetes resources according to one or more ClickHouse clusters described in current ClickHouseInstallation (chi) resource
-
-        :param _builtins.str cluster_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str data_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str host_template: optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        :param _builtins.str log_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str pod_template: optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str replica_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str service_template: optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param Sequence[_builtins.str] service_templates: optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param _builtins.str shard_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str volume_claim_template: optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        if cluster_service_template is not None:
-            pulumi.set(__self__, "cluster_service_template", cluster_service_template)
-        if data_volume_claim_template is not None:
-            pulumi.set(__self__, "data_volume_claim_template", data_volume_claim_template)
-        if host_template is not None:
-            pulumi.set(__self__, "host_template", host_template)
-        if log_volume_claim_template is not None:
-            pulumi.set(__self__, "log_volume_claim_template", log_volume_claim_template)
-        if pod_template is not None:
-            pulumi.set(__self__, "pod_template", pod_template)
-        if replica_service_template is not None:
-            pulumi.set(__self__, "replica_service_template", replica_service_template)
-        if service_template is not None:
-            pulumi.set(__self__, "service_template", service_template)
-        if service_templates is not None:
-            pulumi.set(__self__, "service_templates", service_templates)
-        if shard_service_template is not None:
-            pulumi.set(__self__, "shard_service_template", shard_service_template)
-        if volume_claim_template is not None:
-            pulumi.set(__self__, "volume_claim_template", volume_claim_template)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterServiceTemplate")
-    def cluster_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "cluster_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="dataVolumeClaimTemplate")
-    def data_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "data_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="hostTemplate")
-    def host_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        """
-        return pulumi.get(self, "host_template")
-
-    @_builtins.property
-    @pulumi.getter(name="logVolumeClaimTemplate")
-    def log_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "log_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="podTemplate")
-    def pod_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "pod_template")
-
-    @_builtins.property
-    @pulumi.getter(name="replicaServiceTemplate")
-    def replica_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "replica_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplate")
-    def service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplates")
-    def service_templates(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="shardServiceTemplate")
-    def shard_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "shard_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="volumeClaimTemplate")
-    def volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "volume_claim_template")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecPatch(dict):
-    """
-    Specification of the desired behavior of one or more ClickHouse clusters
-    More info: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "namespaceDomainPattern":
-            suggest = "namespace_domain_pattern"
-        elif key == "taskID":
-            suggest = "task_id"
-        elif key == "useTemplates":
-            suggest = "use_templates"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 configuration: Optional['outputs.ClickHouseInstallationSpecConfigurationPatch'] = None,
-                 defaults: Optional['outputs.ClickHouseInstallationSpecDefaultsPatch'] = None,
-                 namespace_domain_pattern: Optional[_builtins.str] = None,
-                 reconcile: Optional['outputs.ClickHouseInstallationSpecReconcilePatch'] = None,
-                 reconciling: Optional['outputs.ClickHouseInstallationSpecReconcilingPatch'] = None,
-                 restart: Optional[_builtins.str] = None,
-                 stop: Optional[_builtins.str] = None,
-                 suspend: Optional[_builtins.str] = None,
-                 task_id: Optional[_builtins.str] = None,
-                 templates: Optional['outputs.ClickHouseInstallationSpecTemplatesPatch'] = None,
-                 templating: Optional['outputs.ClickHouseInstallationSpecTemplatingPatch'] = None,
-                 troubleshoot: Optional[_builtins.str] = None,
-                 use_templates: Optional[Sequence['outputs.ClickHouseInstallationSpecUseTemplatesPatch']] = None):
-        """
-        Specification of the desired behavior of one or more ClickHouse clusters
-        More info: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md
-
-
-        :param _builtins.str namespace_domain_pattern: Custom domain pattern which will be used for DNS names of `Service` or `Pod`.
-               Typical use scenario - custom cluster domain in Kubernetes cluster
-               Example: %s.svc.my.test
-        :param _builtins.str restart: In case 'RollingUpdate' specified, the operator will always restart ClickHouse pods during reconcile.
-               This options is used in rare cases when force restart is required and is typically removed after the use in order to avoid unneeded restarts.
-        :param _builtins.str stop: Allows to stop all ClickHouse clusters defined in a CHI.
-               Works as the following:
-                - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
-                - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
-        :param _builtins.str suspend: Suspend reconciliation of resources managed by a ClickHouse Installation.
-               Works as the following:
-                - When `suspend` is `true` operator stops reconciling all resources.
-                - When `suspend` is `false` or not set, operator reconciles all resources.
-        :param _builtins.str task_id: Allows to define custom taskID for CHI update and watch status of this update execution.
-               Displayed in all .status.taskID* fields.
-               By default (if not filled) every update of CHI manifest will generate random taskID
-        :param _builtins.str troubleshoot: Allows to troubleshoot Pods during CrashLoopBack state.
-               This may happen when wrong configuration applied, in this case `clickhouse-server` wouldn't start.
-               Command within ClickHouse container is modified with `sleep` in order to avoid quick restarts
-               and give time to troubleshoot via CLI.
-               Liveness and Readiness probes are disabled as well.
-        :param Sequence['ClickHouseInstallationSpecUseTemplatesPatchArgs'] use_templates: list of `ClickHouseInstallationTemplate` (chit) resource names which will merge with current `CHI`
-               manifest during render Kubernetes resources to create related ClickHouse clusters"
-        """
-        if configuration is not None:
-            pulumi.set(__self__, "configuration", configuration)
-        if defaults is not None:
-            pulumi.set(__self__, "defaults", defaults)
-        if namespace_domain_pattern is not None:
-            pulumi.set(__self__, "namespace_domain_pattern", namespace_domain_pattern)
-        if reconcile is not None:
-            pulumi.set(__self__, "reconcile", reconcile)
-        if reconciling is not None:
-            pulumi.set(__self__, "reconciling", reconciling)
-        if restart is not None:
-            pulumi.set(__self__, "restart", restart)
-        if stop is not None:
-            pulumi.set(__self__, "stop", stop)
-        if suspend is not None:
-            pulumi.set(__self__, "suspend", suspend)
-        if task_id is not None:
-            pulumi.set(__self__, "task_id", task_id)
-        if templates is not None:
-            pulumi.set(__self__, "templates", templates)
-        if templating is not None:
-            pulumi.set(__self__, "templating", templating)
-        if troubleshoot is not None:
-            pulumi.set(__self__, "troubleshoot", troubleshoot)
-        if use_templates is not None:
-            pulumi.set(__self__, "use_templates", use_templates)
-
-    @_builtins.property
-    @pulumi.getter
-    def configuration(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationPatch']:
-        return pulumi.get(self, "configuration")
-
-    @_builtins.property
-    @pulumi.getter
-    def defaults(self) -> Optional['outputs.ClickHouseInstallationSpecDefaultsPatch']:
-        return pulumi.get(self, "defaults")
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceDomainPattern")
-    def namespace_domain_pattern(self) -> Optional[_builtins.str]:
-        """
-        Custom domain pattern which will be used for DNS names of `Service` or `Pod`.
-        Typical use scenario - custom cluster domain in Kubernetes cluster
-        Example: %s.svc.my.test
-        """
-        return pulumi.get(self, "namespace_domain_pattern")
-
-    @_builtins.property
-    @pulumi.getter
-    def reconcile(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilePatch']:
-        return pulumi.get(self, "reconcile")
-
-    @_builtins.property
-    @pulumi.getter
-    def reconciling(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingPatch']:
-        return pulumi.get(self, "reconciling")
-
-    @_builtins.property
-    @pulumi.getter
-    def restart(self) -> Optional[_builtins.str]:
-        """
-        In case 'RollingUpdate' specified, the operator will always restart ClickHouse pods during reconcile.
-        This options is used in rare cases when force restart is required and is typically removed after the use in order to avoid unneeded restarts.
-        """
-        return pulumi.get(self, "restart")
-
-    @_builtins.property
-    @pulumi.getter
-    def stop(self) -> Optional[_builtins.str]:
-        """
-        Allows to stop all ClickHouse clusters defined in a CHI.
-        Works as the following:
-         - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
-         - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
-        """
-        return pulumi.get(self, "stop")
-
-    @_builtins.property
-    @pulumi.getter
-    def suspend(self) -> Optional[_builtins.str]:
-        """
-        Suspend reconciliation of resources managed by a ClickHouse Installation.
-        Works as the following:
-         - When `suspend` is `true` operator stops reconciling all resources.
-         - When `suspend` is `false` or not set, operator reconciles all resources.
-        """
-        return pulumi.get(self, "suspend")
-
-    @_builtins.property
-    @pulumi.getter(name="taskID")
-    def task_id(self) -> Optional[_builtins.str]:
-        """
-        Allows to define custom taskID for CHI update and watch status of this update execution.
-        Displayed in all .status.taskID* fields.
-        By default (if not filled) every update of CHI manifest will generate random taskID
-        """
-        return pulumi.get(self, "task_id")
-
-    @_builtins.property
-    @pulumi.getter
-    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecTemplatesPatch']:
-        return pulumi.get(self, "templates")
-
-    @_builtins.property
-    @pulumi.getter
-    def templating(self) -> Optional['outputs.ClickHouseInstallationSpecTemplatingPatch']:
-        return pulumi.get(self, "templating")
-
-    @_builtins.property
-    @pulumi.getter
-    def troubleshoot(self) -> Optional[_builtins.str]:
-        """
-        Allows to troubleshoot Pods during CrashLoopBack state.
-        This may happen when wrong configuration applied, in this case `clickhouse-server` wouldn't start.
-        Command within ClickHouse container is modified with `sleep` in order to avoid quick restarts
-        and give time to troubleshoot via CLI.
-        Liveness and Readiness probes are disabled as well.
-        """
-        return pulumi.get(self, "troubleshoot")
-
-    @_builtins.property
-    @pulumi.getter(name="useTemplates")
-    def use_templates(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecUseTemplatesPatch']]:
-        """
-        list of `ClickHouseInstallationTemplate` (chit) resource names which will merge with current `CHI`
-        manifest during render Kubernetes resources to create related ClickHouse clusters"
-        """
-        return pulumi.get(self, "use_templates")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcile(dict):
-    """
-    Optional, allows tuning reconciling cycle for ClickhouseInstallation from clickhouse-operator side
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMapPropagationTimeout":
-            suggest = "config_map_propagation_timeout"
-        elif key == "statefulSet":
-            suggest = "stateful_set"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcile. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcile.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcile.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cleanup: Optional['outputs.ClickHouseInstallationSpecReconcileCleanup'] = None,
-                 cluster: Optional['outputs.ClickHouseInstallationSpecReconcileCluster'] = None,
-                 config_map_propagation_timeout: Optional[_builtins.int] = None,
-                 host: Optional['outputs.ClickHouseInstallationSpecReconcileHost'] = None,
-                 macros: Optional['outputs.ClickHouseInstallationSpecReconcileMacros'] = None,
-                 policy: Optional[_builtins.str] = None,
-                 runtime: Optional['outputs.ClickHouseInstallationSpecReconcileRuntime'] = None,
-                 stateful_set: Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSet'] = None):
-        """
-        Optional, allows tuning reconciling cycle for ClickhouseInstallation from clickhouse-operator side
-
-        :param _builtins.int config_map_propagation_timeout: Timeout in seconds for `clickhouse-operator` to wait for modified `ConfigMap` to propagate into the `Pod`
-               More details: https://kubernetes.io/docs/concepts/configuration/configmap/#mounted-configmaps-are-updated-automatically
-        :param _builtins.str policy: DISCUSSED TO BE DEPRECATED
-               Syntax sugar
-               Overrides all three 'reconcile.host.wait.{exclude, queries, include}' values from the operator's config
-               Possible values:
-                - wait - should wait to exclude host, complete queries and include host back into the cluster
-                - nowait - should NOT wait to exclude host, complete queries and include host back into the cluster
-        """
-        if cleanup is not None:
-            pulumi.set(__self__, "cleanup", cleanup)
-        if cluster is not None:
-            pulumi.set(__self__, "cluster", cluster)
-        if config_map_propagation_timeout is not None:
-            pulumi.set(__self__, "config_map_propagation_timeout", config_map_propagation_timeout)
-        if host is not None:
-            pulumi.set(__self__, "host", host)
-        if macros is not None:
-            pulumi.set(__self__, "macros", macros)
-        if policy is not None:
-            pulumi.set(__self__, "policy", policy)
-        if runtime is not None:
-            pulumi.set(__self__, "runtime", runtime)
-        if stateful_set is not None:
-            pulumi.set(__self__, "stateful_set", stateful_set)
-
-    @_builtins.property
-    @pulumi.getter
-    def cleanup(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileCleanup']:
-        return pulumi.get(self, "cleanup")
-
-    @_builtins.property
-    @pulumi.getter
-    def cluster(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileCluster']:
-        return pulumi.get(self, "cluster")
-
-    @_builtins.property
-    @pulumi.getter(name="configMapPropagationTimeout")
-    def config_map_propagation_timeout(self) -> Optional[_builtins.int]:
-        """
-        Timeout in seconds for `clickhouse-operator` to wait for modified `ConfigMap` to propagate into the `Pod`
-        More details: https://kubernetes.io/docs/concepts/configuration/configmap/#mounted-configmaps-are-updated-automatically
-        """
-        return pulumi.get(self, "config_map_propagation_timeout")
-
-    @_builtins.property
-    @pulumi.getter
-    def host(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHost']:
-        return pulumi.get(self, "host")
-
-    @_builtins.property
-    @pulumi.getter
-    def macros(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacros']:
-        return pulumi.get(self, "macros")
-
-    @_builtins.property
-    @pulumi.getter
-    def policy(self) -> Optional[_builtins.str]:
-        """
-        DISCUSSED TO BE DEPRECATED
-        Syntax sugar
-        Overrides all three 'reconcile.host.wait.{exclude, queries, include}' values from the operator's config
-        Possible values:
-         - wait - should wait to exclude host, complete queries and include host back into the cluster
-         - nowait - should NOT wait to exclude host, complete queries and include host back into the cluster
-        """
-        return pulumi.get(self, "policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def runtime(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileRuntime']:
-        return pulumi.get(self, "runtime")
-
-    @_builtins.property
-    @pulumi.getter(name="statefulSet")
-    def stateful_set(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSet']:
-        return pulumi.get(self, "stateful_set")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileCleanup(dict):
-    """
-    Optional, defines behavior for cleanup Kubernetes resources during reconcile cycle
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "reconcileFailedObjects":
-            suggest = "reconcile_failed_objects"
-        elif key == "unknownObjects":
-            suggest = "unknown_objects"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileCleanup. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileCleanup.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileCleanup.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 reconcile_failed_objects: Optional['outputs.ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjects'] = None,
-                 unknown_objects: Optional['outputs.ClickHouseInstallationSpecReconcileCleanupUnknownObjects'] = None):
-        """
-        Optional, defines behavior for cleanup Kubernetes resources during reconcile cycle
-        """
-        if reconcile_failed_objects is not None:
-            pulumi.set(__self__, "reconcile_failed_objects", reconcile_failed_objects)
-        if unknown_objects is not None:
-            pulumi.set(__self__, "unknown_objects", unknown_objects)
-
-    @_builtins.property
-    @pulumi.getter(name="reconcileFailedObjects")
-    def reconcile_failed_objects(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjects']:
-        return pulumi.get(self, "reconcile_failed_objects")
-
-    @_builtins.property
-    @pulumi.getter(name="unknownObjects")
-    def unknown_objects(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileCleanupUnknownObjects']:
-        return pulumi.get(self, "unknown_objects")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileCleanupPatch(dict):
-    """
-    Optional, defines behavior for cleanup Kubernetes resources during reconcile cycle
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "reconcileFailedObjects":
-            suggest = "reconcile_failed_objects"
-        elif key == "unknownObjects":
-            suggest = "unknown_objects"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileCleanupPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileCleanupPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileCleanupPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 reconcile_failed_objects: Optional['outputs.ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatch'] = None,
-                 unknown_objects: Optional['outputs.ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatch'] = None):
-        """
-        Optional, defines behavior for cleanup Kubernetes resources during reconcile cycle
-        """
-        if reconcile_failed_objects is not None:
-            pulumi.set(__self__, "reconcile_failed_objects", reconcile_failed_objects)
-        if unknown_objects is not None:
-            pulumi.set(__self__, "unknown_objects", unknown_objects)
-
-    @_builtins.property
-    @pulumi.getter(name="reconcileFailedObjects")
-    def reconcile_failed_objects(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatch']:
-        return pulumi.get(self, "reconcile_failed_objects")
-
-    @_builtins.property
-    @pulumi.getter(name="unknownObjects")
-    def unknown_objects(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatch']:
-        return pulumi.get(self, "unknown_objects")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjects(dict):
-    """
-    Describes what clickhouse-operator should do with Kubernetes resources which are failed during reconcile.
-    Default behavior is `Retain`"
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-        elif key == "statefulSet":
-            suggest = "stateful_set"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjects. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjects.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjects.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional[_builtins.str] = None,
-                 pvc: Optional[_builtins.str] = None,
-                 service: Optional[_builtins.str] = None,
-                 stateful_set: Optional[_builtins.str] = None):
-        """
-        Describes what clickhouse-operator should do with Kubernetes resources which are failed during reconcile.
-        Default behavior is `Retain`"
-
-
-        :param _builtins.str config_map: Behavior policy for failed ConfigMap, `Retain` by default
-        :param _builtins.str pvc: Behavior policy for failed PVC, `Retain` by default
-        :param _builtins.str service: Behavior policy for failed Service, `Retain` by default
-        :param _builtins.str stateful_set: Behavior policy for failed StatefulSet, `Retain` by default
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if pvc is not None:
-            pulumi.set(__self__, "pvc", pvc)
-        if service is not None:
-            pulumi.set(__self__, "service", service)
-        if stateful_set is not None:
-            pulumi.set(__self__, "stateful_set", stateful_set)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for failed ConfigMap, `Retain` by default
-        """
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def pvc(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for failed PVC, `Retain` by default
-        """
-        return pulumi.get(self, "pvc")
-
-    @_builtins.property
-    @pulumi.getter
-    def service(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for failed Service, `Retain` by default
-        """
-        return pulumi.get(self, "service")
-
-    @_builtins.property
-    @pulumi.getter(name="statefulSet")
-    def stateful_set(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for failed StatefulSet, `Retain` by default
-        """
-        return pulumi.get(self, "stateful_set")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatch(dict):
-    """
-    Describes what clickhouse-operator should do with Kubernetes resources which are failed during reconcile.
-    Default behavior is `Retain`"
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-        elif key == "statefulSet":
-            suggest = "stateful_set"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional[_builtins.str] = None,
-                 pvc: Optional[_builtins.str] = None,
-                 service: Optional[_builtins.str] = None,
-                 stateful_set: Optional[_builtins.str] = None):
-        """
-        Describes what clickhouse-operator should do with Kubernetes resources which are failed during reconcile.
-        Default behavior is `Retain`"
-
-
-        :param _builtins.str config_map: Behavior policy for failed ConfigMap, `Retain` by default
-        :param _builtins.str pvc: Behavior policy for failed PVC, `Retain` by default
-        :param _builtins.str service: Behavior policy for failed Service, `Retain` by default
-        :param _builtins.str stateful_set: Behavior policy for failed StatefulSet, `Retain` by default
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if pvc is not None:
-            pulumi.set(__self__, "pvc", pvc)
-        if service is not None:
-            pulumi.set(__self__, "service", service)
-        if stateful_set is not None:
-            pulumi.set(__self__, "stateful_set", stateful_set)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for failed ConfigMap, `Retain` by default
-        """
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def pvc(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for failed PVC, `Retain` by default
-        """
-        return pulumi.get(self, "pvc")
-
-    @_builtins.property
-    @pulumi.getter
-    def service(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for failed Service, `Retain` by default
-        """
-        return pulumi.get(self, "service")
-
-    @_builtins.property
-    @pulumi.getter(name="statefulSet")
-    def stateful_set(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for failed StatefulSet, `Retain` by default
-        """
-        return pulumi.get(self, "stateful_set")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileCleanupUnknownObjects(dict):
-    """
-    Describes what clickhouse-operator should do with found Kubernetes resources which should be managed by clickhouse-operator,
-    but do not have `ownerReference` to any currently managed `ClickHouseInstallation` resource.
-    Default behavior is `Delete`"
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-        elif key == "statefulSet":
-            suggest = "stateful_set"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileCleanupUnknownObjects. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileCleanupUnknownObjects.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileCleanupUnknownObjects.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional[_builtins.str] = None,
-                 pvc: Optional[_builtins.str] = None,
-                 service: Optional[_builtins.str] = None,
-                 stateful_set: Optional[_builtins.str] = None):
-        """
-        Describes what clickhouse-operator should do with found Kubernetes resources which should be managed by clickhouse-operator,
-        but do not have `ownerReference` to any currently managed `ClickHouseInstallation` resource.
-        Default behavior is `Delete`"
-
-
-        :param _builtins.str config_map: Behavior policy for unknown ConfigMap, `Delete` by default
-        :param _builtins.str pvc: Behavior policy for unknown PVC, `Delete` by default
-        :param _builtins.str service: Behavior policy for unknown Service, `Delete` by default
-        :param _builtins.str stateful_set: Behavior policy for unknown StatefulSet, `Delete` by default
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if pvc is not None:
-            pulumi.set(__self__, "pvc", pvc)
-        if service is not None:
-            pulumi.set(__self__, "service", service)
-        if stateful_set is not None:
-            pulumi.set(__self__, "stateful_set", stateful_set)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for unknown ConfigMap, `Delete` by default
-        """
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def pvc(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for unknown PVC, `Delete` by default
-        """
-        return pulumi.get(self, "pvc")
-
-    @_builtins.property
-    @pulumi.getter
-    def service(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for unknown Service, `Delete` by default
-        """
-        return pulumi.get(self, "service")
-
-    @_builtins.property
-    @pulumi.getter(name="statefulSet")
-    def stateful_set(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for unknown StatefulSet, `Delete` by default
-        """
-        return pulumi.get(self, "stateful_set")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatch(dict):
-    """
-    Describes what clickhouse-operator should do with found Kubernetes resources which should be managed by clickhouse-operator,
-    but do not have `ownerReference` to any currently managed `ClickHouseInstallation` resource.
-    Default behavior is `Delete`"
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-        elif key == "statefulSet":
-            suggest = "stateful_set"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional[_builtins.str] = None,
-                 pvc: Optional[_builtins.str] = None,
-                 service: Optional[_builtins.str] = None,
-                 stateful_set: Optional[_builtins.str] = None):
-        """
-        Describes what clickhouse-operator should do with found Kubernetes resources which should be managed by clickhouse-operator,
-        but do not have `ownerReference` to any currently managed `ClickHouseInstallation` resource.
-        Default behavior is `Delete`"
-
-
-        :param _builtins.str config_map: Behavior policy for unknown ConfigMap, `Delete` by default
-        :param _builtins.str pvc: Behavior policy for unknown PVC, `Delete` by default
-        :param _builtins.str service: Behavior policy for unknown Service, `Delete` by default
-        :param _builtins.str stateful_set: Behavior policy for unknown StatefulSet, `Delete` by default
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if pvc is not None:
-            pulumi.set(__self__, "pvc", pvc)
-        if service is not None:
-            pulumi.set(__self__, "service", service)
-        if stateful_set is not None:
-            pulumi.set(__self__, "stateful_set", stateful_set)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for unknown ConfigMap, `Delete` by default
-        """
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def pvc(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for unknown PVC, `Delete` by default
-        """
-        return pulumi.get(self, "pvc")
-
-    @_builtins.property
-    @pulumi.getter
-    def service(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for unknown Service, `Delete` by default
-        """
-        return pulumi.get(self, "service")
-
-    @_builtins.property
-    @pulumi.getter(name="statefulSet")
-    def stateful_set(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for unknown StatefulSet, `Delete` by default
-        """
-        return pulumi.get(self, "stateful_set")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileCluster(dict):
-    """
-    CHI-level cluster reconcile defaults inherited by every cluster's
-    spec.configuration.clusters[N].reconcile section. Use this as a single
-    place to define cluster-level hooks that should apply to all clusters
-    in this CHI; per-cluster hooks (under clusters[N].reconcile.hooks)
-    are appended to (and dedup'd against) the inherited set.
-    """
-    def __init__(__self__, *,
-                 hooks: Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooks'] = None):
-        """
-        CHI-level cluster reconcile defaults inherited by every cluster's
-        spec.configuration.clusters[N].reconcile section. Use this as a single
-        place to define cluster-level hooks that should apply to all clusters
-        in this CHI; per-cluster hooks (under clusters[N].reconcile.hooks)
-        are appended to (and dedup'd against) the inherited set.
-        """
-        if hooks is not None:
-            pulumi.set(__self__, "hooks", hooks)
-
-    @_builtins.property
-    @pulumi.getter
-    def hooks(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooks']:
-        return pulumi.get(self, "hooks")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterHooks(dict):
-    """
-    cluster-level hooks inherited by every cluster
-    """
-    def __init__(__self__, *,
-                 post: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileClusterHooksPost']] = None,
-                 pre: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileClusterHooksPre']] = None):
-        """
-        cluster-level hooks inherited by every cluster
-
-        :param Sequence['ClickHouseInstallationSpecReconcileClusterHooksPostArgs'] post: actions to execute after each cluster reconcile
-        :param Sequence['ClickHouseInstallationSpecReconcileClusterHooksPreArgs'] pre: actions to execute before each cluster reconcile
-        """
-        if post is not None:
-            pulumi.set(__self__, "post", post)
-        if pre is not None:
-            pulumi.set(__self__, "pre", pre)
-
-    @_builtins.property
-    @pulumi.getter
-    def post(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileClusterHooksPost']]:
-        """
-        actions to execute after each cluster reconcile
-        """
-        return pulumi.get(self, "post")
-
-    @_builtins.property
-    @pulumi.getter
-    def pre(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileClusterHooksPre']]:
-        """
-        actions to execute before each cluster reconcile
-        """
-        return pulumi.get(self, "pre")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterHooksPatch(dict):
-    """
-    cluster-level hooks inherited by every cluster
-    """
-    def __init__(__self__, *,
-                 post: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileClusterHooksPostPatch']] = None,
-                 pre: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileClusterHooksPrePatch']] = None):
-        """
-        cluster-level hooks inherited by every cluster
-
-        :param Sequence['ClickHouseInstallationSpecReconcileClusterHooksPostPatchArgs'] post: actions to execute after each cluster reconcile
-        :param Sequence['ClickHouseInstallationSpecReconcileClusterHooksPrePatchArgs'] pre: actions to execute before each cluster reconcile
-        """
-        if post is not None:
-            pulumi.set(__self__, "post", post)
-        if pre is not None:
-            pulumi.set(__self__, "pre", pre)
-
-    @_builtins.property
-    @pulumi.getter
-    def post(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileClusterHooksPostPatch']]:
-        """
-        actions to execute after each cluster reconcile
-        """
-        return pulumi.get(self, "post")
-
-    @_builtins.property
-    @pulumi.getter
-    def pre(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileClusterHooksPrePatch']]:
-        """
-        actions to execute before each cluster reconcile
-        """
-        return pulumi.get(self, "pre")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterHooksPost(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileClusterHooksPost. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileClusterHooksPost.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileClusterHooksPost.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPostHttp'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPostShell'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPostSql'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Cluster-scope reconcile lifecycle events. Required, non-empty.
-                 Any              - wildcard match: fires on every cluster reconcile pass
-                                    and the cluster delete sweep
-                 ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                                    only on the first reconcile of a brand-new cluster
-                 ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                                    least one host has prior state). Fires on every
-                                    operator reconcile cycle the upstream gates allow,
-                                    including taskID-only force-reconciles. NOT a "spec
-                                    changed" signal.
-                 ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default) propagates the error; Ignore logs a warning and continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Cluster-scope reconcile lifecycle events. Required, non-empty.
-          Any              - wildcard match: fires on every cluster reconcile pass
-                             and the cluster delete sweep
-          ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                             only on the first reconcile of a brand-new cluster
-          ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                             least one host has prior state). Fires on every
-                             operator reconcile cycle the upstream gates allow,
-                             including taskID-only force-reconciles. NOT a "spec
-                             changed" signal.
-          ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default) propagates the error; Ignore logs a warning and continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPostHttp']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPostShell']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPostSql']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterHooksPostHttp(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterHooksPostHttpPatch(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterHooksPostPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileClusterHooksPostPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileClusterHooksPostPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileClusterHooksPostPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPostHttpPatch'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPostShellPatch'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPostSqlPatch'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Cluster-scope reconcile lifecycle events. Required, non-empty.
-                 Any              - wildcard match: fires on every cluster reconcile pass
-                                    and the cluster delete sweep
-                 ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                                    only on the first reconcile of a brand-new cluster
-                 ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                                    least one host has prior state). Fires on every
-                                    operator reconcile cycle the upstream gates allow,
-                                    including taskID-only force-reconciles. NOT a "spec
-                                    changed" signal.
-                 ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default) propagates the error; Ignore logs a warning and continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Cluster-scope reconcile lifecycle events. Required, non-empty.
-          Any              - wildcard match: fires on every cluster reconcile pass
-                             and the cluster delete sweep
-          ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                             only on the first reconcile of a brand-new cluster
-          ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                             least one host has prior state). Fires on every
-                             operator reconcile cycle the upstream gates allow,
-                             including taskID-only force-reconciles. NOT a "spec
-                             changed" signal.
-          ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default) propagates the error; Ignore logs a warning and continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPostHttpPatch']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPostShellPatch']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPostSqlPatch']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterHooksPostShell(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterHooksPostShellPatch(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterHooksPostSql(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterHooksPostSqlPatch(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterHooksPre(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileClusterHooksPre. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileClusterHooksPre.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileClusterHooksPre.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPreHttp'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPreShell'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPreSql'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Cluster-scope reconcile lifecycle events. Required, non-empty.
-                 Any              - wildcard match: fires on every cluster reconcile pass
-                                    and the cluster delete sweep
-                 ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                                    only on the first reconcile of a brand-new cluster
-                 ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                                    least one host has prior state). Fires on every
-                                    operator reconcile cycle the upstream gates allow,
-                                    including taskID-only force-reconciles. NOT a "spec
-                                    changed" signal.
-                 ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default) propagates the error; Ignore logs a warning and continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Cluster-scope reconcile lifecycle events. Required, non-empty.
-          Any              - wildcard match: fires on every cluster reconcile pass
-                             and the cluster delete sweep
-          ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                             only on the first reconcile of a brand-new cluster
-          ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                             least one host has prior state). Fires on every
-                             operator reconcile cycle the upstream gates allow,
-                             including taskID-only force-reconciles. NOT a "spec
-                             changed" signal.
-          ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default) propagates the error; Ignore logs a warning and continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPreHttp']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPreShell']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPreSql']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterHooksPreHttp(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterHooksPreHttpPatch(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterHooksPrePatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileClusterHooksPrePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileClusterHooksPrePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileClusterHooksPrePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPreHttpPatch'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPreShellPatch'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPreSqlPatch'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Cluster-scope reconcile lifecycle events. Required, non-empty.
-                 Any              - wildcard match: fires on every cluster reconcile pass
-                                    and the cluster delete sweep
-                 ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                                    only on the first reconcile of a brand-new cluster
-                 ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                                    least one host has prior state). Fires on every
-                                    operator reconcile cycle the upstream gates allow,
-                                    including taskID-only force-reconciles. NOT a "spec
-                                    changed" signal.
-                 ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default) propagates the error; Ignore logs a warning and continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Cluster-scope reconcile lifecycle events. Required, non-empty.
-          Any              - wildcard match: fires on every cluster reconcile pass
-                             and the cluster delete sweep
-          ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                             only on the first reconcile of a brand-new cluster
-          ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                             least one host has prior state). Fires on every
-                             operator reconcile cycle the upstream gates allow,
-                             including taskID-only force-reconciles. NOT a "spec
-                             changed" signal.
-          ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default) propagates the error; Ignore logs a warning and continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPreHttpPatch']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPreShellPatch']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPreSqlPatch']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterHooksPreShell(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterHooksPreShellPatch(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterHooksPreSql(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterHooksPreSqlPatch(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileClusterPatch(dict):
-    """
-    CHI-level cluster reconcile defaults inherited by every cluster's
-    spec.configuration.clusters[N].reconcile section. Use this as a single
-    place to define cluster-level hooks that should apply to all clusters
-    in this CHI; per-cluster hooks (under clusters[N].reconcile.hooks)
-    are appended to (and dedup'd against) the inherited set.
-    """
-    def __init__(__self__, *,
-                 hooks: Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPatch'] = None):
-        """
-        CHI-level cluster reconcile defaults inherited by every cluster's
-        spec.configuration.clusters[N].reconcile section. Use this as a single
-        place to define cluster-level hooks that should apply to all clusters
-        in this CHI; per-cluster hooks (under clusters[N].reconcile.hooks)
-        are appended to (and dedup'd against) the inherited set.
-        """
-        if hooks is not None:
-            pulumi.set(__self__, "hooks", hooks)
-
-    @_builtins.property
-    @pulumi.getter
-    def hooks(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileClusterHooksPatch']:
-        return pulumi.get(self, "hooks")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHost(dict):
-    """
-    Whether the operator during reconcile procedure should wait for a ClickHouse host:
-      - to be excluded from a ClickHouse cluster
-      - to complete all running queries
-      - to be included into a ClickHouse cluster
-    respectfully before moving forward
-    """
-    def __init__(__self__, *,
-                 drop: Optional['outputs.ClickHouseInstallationSpecReconcileHostDrop'] = None,
-                 hooks: Optional['outputs.ClickHouseInstallationSpecReconcileHostHooks'] = None,
-                 wait: Optional['outputs.ClickHouseInstallationSpecReconcileHostWait'] = None):
-        """
-        Whether the operator during reconcile procedure should wait for a ClickHouse host:
-          - to be excluded from a ClickHouse cluster
-          - to complete all running queries
-          - to be included into a ClickHouse cluster
-        respectfully before moving forward
-        """
-        if drop is not None:
-            pulumi.set(__self__, "drop", drop)
-        if hooks is not None:
-            pulumi.set(__self__, "hooks", hooks)
-        if wait is not None:
-            pulumi.set(__self__, "wait", wait)
-
-    @_builtins.property
-    @pulumi.getter
-    def drop(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostDrop']:
-        return pulumi.get(self, "drop")
-
-    @_builtins.property
-    @pulumi.getter
-    def hooks(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostHooks']:
-        return pulumi.get(self, "hooks")
-
-    @_builtins.property
-    @pulumi.getter
-    def wait(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostWait']:
-        return pulumi.get(self, "wait")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostDrop(dict):
-    def __init__(__self__, *,
-                 replicas: Optional['outputs.ClickHouseInstallationSpecReconcileHostDropReplicas'] = None):
-        if replicas is not None:
-            pulumi.set(__self__, "replicas", replicas)
-
-    @_builtins.property
-    @pulumi.getter
-    def replicas(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostDropReplicas']:
-        return pulumi.get(self, "replicas")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostDropPatch(dict):
-    def __init__(__self__, *,
-                 replicas: Optional['outputs.ClickHouseInstallationSpecReconcileHostDropReplicasPatch'] = None):
-        if replicas is not None:
-            pulumi.set(__self__, "replicas", replicas)
-
-    @_builtins.property
-    @pulumi.getter
-    def replicas(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostDropReplicasPatch']:
-        return pulumi.get(self, "replicas")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostDropReplicas(dict):
-    """
-    Whether the operator during reconcile procedure should drop replicas when replica is deleted or recreated
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "onDelete":
-            suggest = "on_delete"
-        elif key == "onLostVolume":
-            suggest = "on_lost_volume"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileHostDropReplicas. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileHostDropReplicas.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileHostDropReplicas.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 active: Optional[_builtins.str] = None,
-                 on_delete: Optional[_builtins.str] = None,
-                 on_lost_volume: Optional[_builtins.str] = None):
-        """
-        Whether the operator during reconcile procedure should drop replicas when replica is deleted or recreated
-
-
-        :param _builtins.str active: Whether the operator during reconcile procedure should drop active replicas when replica is deleted or recreated
-        :param _builtins.str on_delete: Whether the operator during reconcile procedure should drop replicas when replica is deleted
-        :param _builtins.str on_lost_volume: Whether the operator during reconcile procedure should drop replicas when replica volume is lost
-        """
-        if active is not None:
-            pulumi.set(__self__, "active", active)
-        if on_delete is not None:
-            pulumi.set(__self__, "on_delete", on_delete)
-        if on_lost_volume is not None:
-            pulumi.set(__self__, "on_lost_volume", on_lost_volume)
-
-    @_builtins.property
-    @pulumi.getter
-    def active(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should drop active replicas when replica is deleted or recreated
-        """
-        return pulumi.get(self, "active")
-
-    @_builtins.property
-    @pulumi.getter(name="onDelete")
-    def on_delete(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should drop replicas when replica is deleted
-        """
-        return pulumi.get(self, "on_delete")
-
-    @_builtins.property
-    @pulumi.getter(name="onLostVolume")
-    def on_lost_volume(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should drop replicas when replica volume is lost
-        """
-        return pulumi.get(self, "on_lost_volume")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostDropReplicasPatch(dict):
-    """
-    Whether the operator during reconcile procedure should drop replicas when replica is deleted or recreated
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "onDelete":
-            suggest = "on_delete"
-        elif key == "onLostVolume":
-            suggest = "on_lost_volume"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileHostDropReplicasPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileHostDropReplicasPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileHostDropReplicasPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 active: Optional[_builtins.str] = None,
-                 on_delete: Optional[_builtins.str] = None,
-                 on_lost_volume: Optional[_builtins.str] = None):
-        """
-        Whether the operator during reconcile procedure should drop replicas when replica is deleted or recreated
-
-
-        :param _builtins.str active: Whether the operator during reconcile procedure should drop active replicas when replica is deleted or recreated
-        :param _builtins.str on_delete: Whether the operator during reconcile procedure should drop replicas when replica is deleted
-        :param _builtins.str on_lost_volume: Whether the operator during reconcile procedure should drop replicas when replica volume is lost
-        """
-        if active is not None:
-            pulumi.set(__self__, "active", active)
-        if on_delete is not None:
-            pulumi.set(__self__, "on_delete", on_delete)
-        if on_lost_volume is not None:
-            pulumi.set(__self__, "on_lost_volume", on_lost_volume)
-
-    @_builtins.property
-    @pulumi.getter
-    def active(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should drop active replicas when replica is deleted or recreated
-        """
-        return pulumi.get(self, "active")
-
-    @_builtins.property
-    @pulumi.getter(name="onDelete")
-    def on_delete(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should drop replicas when replica is deleted
-        """
-        return pulumi.get(self, "on_delete")
-
-    @_builtins.property
-    @pulumi.getter(name="onLostVolume")
-    def on_lost_volume(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should drop replicas when replica volume is lost
-        """
-        return pulumi.get(self, "on_lost_volume")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostHooks(dict):
-    """
-    hooks to execute before and after host reconcile
-    """
-    def __init__(__self__, *,
-                 post: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileHostHooksPost']] = None,
-                 pre: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileHostHooksPre']] = None):
-        """
-        hooks to execute before and after host reconcile
-
-        :param Sequence['ClickHouseInstallationSpecReconcileHostHooksPostArgs'] post: actions to execute after reconcile
-        :param Sequence['ClickHouseInstallationSpecReconcileHostHooksPreArgs'] pre: actions to execute before reconcile
-        """
-        if post is not None:
-            pulumi.set(__self__, "post", post)
-        if pre is not None:
-            pulumi.set(__self__, "pre", pre)
-
-    @_builtins.property
-    @pulumi.getter
-    def post(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileHostHooksPost']]:
-        """
-        actions to execute after reconcile
-        """
-        return pulumi.get(self, "post")
-
-    @_builtins.property
-    @pulumi.getter
-    def pre(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileHostHooksPre']]:
-        """
-        actions to execute before reconcile
-        """
-        return pulumi.get(self, "pre")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostHooksPatch(dict):
-    """
-    hooks to execute before and after host reconcile
-    """
-    def __init__(__self__, *,
-                 post: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileHostHooksPostPatch']] = None,
-                 pre: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileHostHooksPrePatch']] = None):
-        """
-        hooks to execute before and after host reconcile
-
-        :param Sequence['ClickHouseInstallationSpecReconcileHostHooksPostPatchArgs'] post: actions to execute after reconcile
-        :param Sequence['ClickHouseInstallationSpecReconcileHostHooksPrePatchArgs'] pre: actions to execute before reconcile
-        """
-        if post is not None:
-            pulumi.set(__self__, "post", post)
-        if pre is not None:
-            pulumi.set(__self__, "pre", pre)
-
-    @_builtins.property
-    @pulumi.getter
-    def post(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileHostHooksPostPatch']]:
-        """
-        actions to execute after reconcile
-        """
-        return pulumi.get(self, "post")
-
-    @_builtins.property
-    @pulumi.getter
-    def pre(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileHostHooksPrePatch']]:
-        """
-        actions to execute before reconcile
-        """
-        return pulumi.get(self, "pre")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostHooksPost(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileHostHooksPost. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileHostHooksPost.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileHostHooksPost.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPostHttp'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPostShell'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPostSql'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-               The hook is skipped on any reconcile whose classifier does not emit at least one
-               of the listed events. Supported values:
-                 Any               - wildcard match: fires on every hook-evaluation point,
-                                     including the pre-delete sweep on the dying host
-                 HostCreate        - first reconcile that creates a host (no ancestor); best
-                                     paired with POST hooks because PRE hooks on first creation
-                                     are skipped (no live pod yet)
-                 HostUpdate        - reconcile that has prior state for the host; catch-all
-                                     for ongoing reconciles
-                 HostStart         - host transitions from stopped to running
-                 HostStop          - host is being stopped (current spec marks it stopped)
-                 HostConfigRestart - in-place software restart for a configuration change
-                 HostRollout       - pod-template change forces a StatefulSet rollout
-                 HostShutdown      - aggregate: fires whenever the pod is going down for any
-                                     reason (Stop, ConfigRestart, Rollout, or Delete)
-                 HostDelete        - host is being removed from the cluster (downsize); fires
-                                     on the dying host before tear-down. Always emitted
-                                     alongside HostShutdown.
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-               Ignore: error is logged and the reconcile continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-        The hook is skipped on any reconcile whose classifier does not emit at least one
-        of the listed events. Supported values:
-          Any               - wildcard match: fires on every hook-evaluation point,
-                              including the pre-delete sweep on the dying host
-          HostCreate        - first reconcile that creates a host (no ancestor); best
-                              paired with POST hooks because PRE hooks on first creation
-                              are skipped (no live pod yet)
-          HostUpdate        - reconcile that has prior state for the host; catch-all
-                              for ongoing reconciles
-          HostStart         - host transitions from stopped to running
-          HostStop          - host is being stopped (current spec marks it stopped)
-          HostConfigRestart - in-place software restart for a configuration change
-          HostRollout       - pod-template change forces a StatefulSet rollout
-          HostShutdown      - aggregate: fires whenever the pod is going down for any
-                              reason (Stop, ConfigRestart, Rollout, or Delete)
-          HostDelete        - host is being removed from the cluster (downsize); fires
-                              on the dying host before tear-down. Always emitted
-                              alongside HostShutdown.
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-        Ignore: error is logged and the reconcile continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPostHttp']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPostShell']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPostSql']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostHooksPostHttp(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostHooksPostHttpPatch(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostHooksPostPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileHostHooksPostPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileHostHooksPostPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileHostHooksPostPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPostHttpPatch'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPostShellPatch'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPostSqlPatch'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-               The hook is skipped on any reconcile whose classifier does not emit at least one
-               of the listed events. Supported values:
-                 Any               - wildcard match: fires on every hook-evaluation point,
-                                     including the pre-delete sweep on the dying host
-                 HostCreate        - first reconcile that creates a host (no ancestor); best
-                                     paired with POST hooks because PRE hooks on first creation
-                                     are skipped (no live pod yet)
-                 HostUpdate        - reconcile that has prior state for the host; catch-all
-                                     for ongoing reconciles
-                 HostStart         - host transitions from stopped to running
-                 HostStop          - host is being stopped (current spec marks it stopped)
-                 HostConfigRestart - in-place software restart for a configuration change
-                 HostRollout       - pod-template change forces a StatefulSet rollout
-                 HostShutdown      - aggregate: fires whenever the pod is going down for any
-                                     reason (Stop, ConfigRestart, Rollout, or Delete)
-                 HostDelete        - host is being removed from the cluster (downsize); fires
-                                     on the dying host before tear-down. Always emitted
-                                     alongside HostShutdown.
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-               Ignore: error is logged and the reconcile continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-        The hook is skipped on any reconcile whose classifier does not emit at least one
-        of the listed events. Supported values:
-          Any               - wildcard match: fires on every hook-evaluation point,
-                              including the pre-delete sweep on the dying host
-          HostCreate        - first reconcile that creates a host (no ancestor); best
-                              paired with POST hooks because PRE hooks on first creation
-                              are skipped (no live pod yet)
-          HostUpdate        - reconcile that has prior state for the host; catch-all
-                              for ongoing reconciles
-          HostStart         - host transitions from stopped to running
-          HostStop          - host is being stopped (current spec marks it stopped)
-          HostConfigRestart - in-place software restart for a configuration change
-          HostRollout       - pod-template change forces a StatefulSet rollout
-          HostShutdown      - aggregate: fires whenever the pod is going down for any
-                              reason (Stop, ConfigRestart, Rollout, or Delete)
-          HostDelete        - host is being removed from the cluster (downsize); fires
-                              on the dying host before tear-down. Always emitted
-                              alongside HostShutdown.
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-        Ignore: error is logged and the reconcile continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPostHttpPatch']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPostShellPatch']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPostSqlPatch']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostHooksPostShell(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostHooksPostShellPatch(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostHooksPostSql(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostHooksPostSqlPatch(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostHooksPre(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileHostHooksPre. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileHostHooksPre.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileHostHooksPre.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPreHttp'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPreShell'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPreSql'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-               The hook is skipped on any reconcile whose classifier does not emit at least one
-               of the listed events. Supported values:
-                 Any               - wildcard match: fires on every hook-evaluation point,
-                                     including the pre-delete sweep on the dying host
-                 HostCreate        - first reconcile that creates a host (no ancestor); best
-                                     paired with POST hooks because PRE hooks on first creation
-                                     are skipped (no live pod yet)
-                 HostUpdate        - reconcile that has prior state for the host; catch-all
-                                     for ongoing reconciles
-                 HostStart         - host transitions from stopped to running
-                 HostStop          - host is being stopped (current spec marks it stopped)
-                 HostConfigRestart - in-place software restart for a configuration change
-                 HostRollout       - pod-template change forces a StatefulSet rollout
-                 HostShutdown      - aggregate: fires whenever the pod is going down for any
-                                     reason (Stop, ConfigRestart, Rollout, or Delete)
-                 HostDelete        - host is being removed from the cluster (downsize); fires
-                                     on the dying host before tear-down. Always emitted
-                                     alongside HostShutdown.
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-               Ignore: error is logged and the reconcile continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-        The hook is skipped on any reconcile whose classifier does not emit at least one
-        of the listed events. Supported values:
-          Any               - wildcard match: fires on every hook-evaluation point,
-                              including the pre-delete sweep on the dying host
-          HostCreate        - first reconcile that creates a host (no ancestor); best
-                              paired with POST hooks because PRE hooks on first creation
-                              are skipped (no live pod yet)
-          HostUpdate        - reconcile that has prior state for the host; catch-all
-                              for ongoing reconciles
-          HostStart         - host transitions from stopped to running
-          HostStop          - host is being stopped (current spec marks it stopped)
-          HostConfigRestart - in-place software restart for a configuration change
-          HostRollout       - pod-template change forces a StatefulSet rollout
-          HostShutdown      - aggregate: fires whenever the pod is going down for any
-                              reason (Stop, ConfigRestart, Rollout, or Delete)
-          HostDelete        - host is being removed from the cluster (downsize); fires
-                              on the dying host before tear-down. Always emitted
-                              alongside HostShutdown.
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-        Ignore: error is logged and the reconcile continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPreHttp']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPreShell']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPreSql']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostHooksPreHttp(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostHooksPreHttpPatch(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostHooksPrePatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileHostHooksPrePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileHostHooksPrePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileHostHooksPrePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPreHttpPatch'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPreShellPatch'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPreSqlPatch'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-               The hook is skipped on any reconcile whose classifier does not emit at least one
-               of the listed events. Supported values:
-                 Any               - wildcard match: fires on every hook-evaluation point,
-                                     including the pre-delete sweep on the dying host
-                 HostCreate        - first reconcile that creates a host (no ancestor); best
-                                     paired with POST hooks because PRE hooks on first creation
-                                     are skipped (no live pod yet)
-                 HostUpdate        - reconcile that has prior state for the host; catch-all
-                                     for ongoing reconciles
-                 HostStart         - host transitions from stopped to running
-                 HostStop          - host is being stopped (current spec marks it stopped)
-                 HostConfigRestart - in-place software restart for a configuration change
-                 HostRollout       - pod-template change forces a StatefulSet rollout
-                 HostShutdown      - aggregate: fires whenever the pod is going down for any
-                                     reason (Stop, ConfigRestart, Rollout, or Delete)
-                 HostDelete        - host is being removed from the cluster (downsize); fires
-                                     on the dying host before tear-down. Always emitted
-                                     alongside HostShutdown.
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-               Ignore: error is logged and the reconcile continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-        The hook is skipped on any reconcile whose classifier does not emit at least one
-        of the listed events. Supported values:
-          Any               - wildcard match: fires on every hook-evaluation point,
-                              including the pre-delete sweep on the dying host
-          HostCreate        - first reconcile that creates a host (no ancestor); best
-                              paired with POST hooks because PRE hooks on first creation
-                              are skipped (no live pod yet)
-          HostUpdate        - reconcile that has prior state for the host; catch-all
-                              for ongoing reconciles
-          HostStart         - host transitions from stopped to running
-          HostStop          - host is being stopped (current spec marks it stopped)
-          HostConfigRestart - in-place software restart for a configuration change
-          HostRollout       - pod-template change forces a StatefulSet rollout
-          HostShutdown      - aggregate: fires whenever the pod is going down for any
-                              reason (Stop, ConfigRestart, Rollout, or Delete)
-          HostDelete        - host is being removed from the cluster (downsize); fires
-                              on the dying host before tear-down. Always emitted
-                              alongside HostShutdown.
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-        Ignore: error is logged and the reconcile continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPreHttpPatch']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPreShellPatch']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPreSqlPatch']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostHooksPreShell(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostHooksPreShellPatch(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostHooksPreSql(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostHooksPreSqlPatch(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostPatch(dict):
-    """
-    Whether the operator during reconcile procedure should wait for a ClickHouse host:
-      - to be excluded from a ClickHouse cluster
-      - to complete all running queries
-      - to be included into a ClickHouse cluster
-    respectfully before moving forward
-    """
-    def __init__(__self__, *,
-                 drop: Optional['outputs.ClickHouseInstallationSpecReconcileHostDropPatch'] = None,
-                 hooks: Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPatch'] = None,
-                 wait: Optional['outputs.ClickHouseInstallationSpecReconcileHostWaitPatch'] = None):
-        """
-        Whether the operator during reconcile procedure should wait for a ClickHouse host:
-          - to be excluded from a ClickHouse cluster
-          - to complete all running queries
-          - to be included into a ClickHouse cluster
-        respectfully before moving forward
-        """
-        if drop is not None:
-            pulumi.set(__self__, "drop", drop)
-        if hooks is not None:
-            pulumi.set(__self__, "hooks", hooks)
-        if wait is not None:
-            pulumi.set(__self__, "wait", wait)
-
-    @_builtins.property
-    @pulumi.getter
-    def drop(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostDropPatch']:
-        return pulumi.get(self, "drop")
-
-    @_builtins.property
-    @pulumi.getter
-    def hooks(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostHooksPatch']:
-        return pulumi.get(self, "hooks")
-
-    @_builtins.property
-    @pulumi.getter
-    def wait(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostWaitPatch']:
-        return pulumi.get(self, "wait")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostWait(dict):
-    def __init__(__self__, *,
-                 exclude: Optional[_builtins.str] = None,
-                 include: Optional[_builtins.str] = None,
-                 probes: Optional['outputs.ClickHouseInstallationSpecReconcileHostWaitProbes'] = None,
-                 queries: Optional[_builtins.str] = None,
-                 replicas: Optional['outputs.ClickHouseInstallationSpecReconcileHostWaitReplicas'] = None):
-        """
-        :param _builtins.str exclude: Allows to stop all ClickHouse clusters defined in a CHI.
-               Works as the following:
-                - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
-                - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
-        :param _builtins.str include: Whether the operator during reconcile procedure should wait for a ClickHouse host to be included into a ClickHouse cluster
-        :param _builtins.str queries: Whether the operator during reconcile procedure should wait for a ClickHouse host to complete all running queries
-        """
-        if exclude is not None:
-            pulumi.set(__self__, "exclude", exclude)
-        if include is not None:
-            pulumi.set(__self__, "include", include)
-        if probes is not None:
-            pulumi.set(__self__, "probes", probes)
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-        if replicas is not None:
-            pulumi.set(__self__, "replicas", replicas)
-
-    @_builtins.property
-    @pulumi.getter
-    def exclude(self) -> Optional[_builtins.str]:
-        """
-        Allows to stop all ClickHouse clusters defined in a CHI.
-        Works as the following:
-         - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
-         - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
-        """
-        return pulumi.get(self, "exclude")
-
-    @_builtins.property
-    @pulumi.getter
-    def include(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for a ClickHouse host to be included into a ClickHouse cluster
-        """
-        return pulumi.get(self, "include")
-
-    @_builtins.property
-    @pulumi.getter
-    def probes(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostWaitProbes']:
-        return pulumi.get(self, "probes")
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for a ClickHouse host to complete all running queries
-        """
-        return pulumi.get(self, "queries")
-
-    @_builtins.property
-    @pulumi.getter
-    def replicas(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostWaitReplicas']:
-        return pulumi.get(self, "replicas")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostWaitPatch(dict):
-    def __init__(__self__, *,
-                 exclude: Optional[_builtins.str] = None,
-                 include: Optional[_builtins.str] = None,
-                 probes: Optional['outputs.ClickHouseInstallationSpecReconcileHostWaitProbesPatch'] = None,
-                 queries: Optional[_builtins.str] = None,
-                 replicas: Optional['outputs.ClickHouseInstallationSpecReconcileHostWaitReplicasPatch'] = None):
-        """
-        :param _builtins.str exclude: Allows to stop all ClickHouse clusters defined in a CHI.
-               Works as the following:
-                - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
-                - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
-        :param _builtins.str include: Whether the operator during reconcile procedure should wait for a ClickHouse host to be included into a ClickHouse cluster
-        :param _builtins.str queries: Whether the operator during reconcile procedure should wait for a ClickHouse host to complete all running queries
-        """
-        if exclude is not None:
-            pulumi.set(__self__, "exclude", exclude)
-        if include is not None:
-            pulumi.set(__self__, "include", include)
-        if probes is not None:
-            pulumi.set(__self__, "probes", probes)
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-        if replicas is not None:
-            pulumi.set(__self__, "replicas", replicas)
-
-    @_builtins.property
-    @pulumi.getter
-    def exclude(self) -> Optional[_builtins.str]:
-        """
-        Allows to stop all ClickHouse clusters defined in a CHI.
-        Works as the following:
-         - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
-         - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
-        """
-        return pulumi.get(self, "exclude")
-
-    @_builtins.property
-    @pulumi.getter
-    def include(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for a ClickHouse host to be included into a ClickHouse cluster
-        """
-        return pulumi.get(self, "include")
-
-    @_builtins.property
-    @pulumi.getter
-    def probes(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostWaitProbesPatch']:
-        return pulumi.get(self, "probes")
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for a ClickHouse host to complete all running queries
-        """
-        return pulumi.get(self, "queries")
-
-    @_builtins.property
-    @pulumi.getter
-    def replicas(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostWaitReplicasPatch']:
-        return pulumi.get(self, "replicas")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostWaitProbes(dict):
-    """
-    What probes the operator should wait during host launch procedure
-    """
-    def __init__(__self__, *,
-                 readiness: Optional[_builtins.str] = None,
-                 startup: Optional[_builtins.str] = None):
-        """
-        What probes the operator should wait during host launch procedure
-
-        :param _builtins.str readiness: Whether the operator during host launch procedure should wait for ready probe to succeed.
-               In case probe is unspecified wait is assumed to be completed successfully.
-               Default option value is to wait.
-        :param _builtins.str startup: Whether the operator during host launch procedure should wait for startup probe to succeed.
-               In case probe is unspecified wait is assumed to be completed successfully.
-               Default option value is to do not wait.
-        """
-        if readiness is not None:
-            pulumi.set(__self__, "readiness", readiness)
-        if startup is not None:
-            pulumi.set(__self__, "startup", startup)
-
-    @_builtins.property
-    @pulumi.getter
-    def readiness(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during host launch procedure should wait for ready probe to succeed.
-        In case probe is unspecified wait is assumed to be completed successfully.
-        Default option value is to wait.
-        """
-        return pulumi.get(self, "readiness")
-
-    @_builtins.property
-    @pulumi.getter
-    def startup(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during host launch procedure should wait for startup probe to succeed.
-        In case probe is unspecified wait is assumed to be completed successfully.
-        Default option value is to do not wait.
-        """
-        return pulumi.get(self, "startup")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostWaitProbesPatch(dict):
-    """
-    What probes the operator should wait during host launch procedure
-    """
-    def __init__(__self__, *,
-                 readiness: Optional[_builtins.str] = None,
-                 startup: Optional[_builtins.str] = None):
-        """
-        What probes the operator should wait during host launch procedure
-
-        :param _builtins.str readiness: Whether the operator during host launch procedure should wait for ready probe to succeed.
-               In case probe is unspecified wait is assumed to be completed successfully.
-               Default option value is to wait.
-        :param _builtins.str startup: Whether the operator during host launch procedure should wait for startup probe to succeed.
-               In case probe is unspecified wait is assumed to be completed successfully.
-               Default option value is to do not wait.
-        """
-        if readiness is not None:
-            pulumi.set(__self__, "readiness", readiness)
-        if startup is not None:
-            pulumi.set(__self__, "startup", startup)
-
-    @_builtins.property
-    @pulumi.getter
-    def readiness(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during host launch procedure should wait for ready probe to succeed.
-        In case probe is unspecified wait is assumed to be completed successfully.
-        Default option value is to wait.
-        """
-        return pulumi.get(self, "readiness")
-
-    @_builtins.property
-    @pulumi.getter
-    def startup(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during host launch procedure should wait for startup probe to succeed.
-        In case probe is unspecified wait is assumed to be completed successfully.
-        Default option value is to do not wait.
-        """
-        return pulumi.get(self, "startup")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostWaitReplicas(dict):
-    """
-    Whether the operator during reconcile procedure should wait for replicas to catch-up
-    """
-    def __init__(__self__, *,
-                 all: Optional[_builtins.str] = None,
-                 delay: Optional[_builtins.int] = None,
-                 new: Optional[_builtins.str] = None):
-        """
-        Whether the operator during reconcile procedure should wait for replicas to catch-up
-
-        :param _builtins.str all: Whether the operator during reconcile procedure should wait for all replicas to catch-up
-        :param _builtins.int delay: replication max absolute delay to consider replica is not delayed
-        :param _builtins.str new: Whether the operator during reconcile procedure should wait for new replicas to catch-up
-        """
-        if all is not None:
-            pulumi.set(__self__, "all", all)
-        if delay is not None:
-            pulumi.set(__self__, "delay", delay)
-        if new is not None:
-            pulumi.set(__self__, "new", new)
-
-    @_builtins.property
-    @pulumi.getter
-    def all(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for all replicas to catch-up
-        """
-        return pulumi.get(self, "all")
-
-    @_builtins.property
-    @pulumi.getter
-    def delay(self) -> Optional[_builtins.int]:
-        """
-        replication max absolute delay to consider replica is not delayed
-        """
-        return pulumi.get(self, "delay")
-
-    @_builtins.property
-    @pulumi.getter
-    def new(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for new replicas to catch-up
-        """
-        return pulumi.get(self, "new")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileHostWaitReplicasPatch(dict):
-    """
-    Whether the operator during reconcile procedure should wait for replicas to catch-up
-    """
-    def __init__(__self__, *,
-                 all: Optional[_builtins.str] = None,
-                 delay: Optional[_builtins.int] = None,
-                 new: Optional[_builtins.str] = None):
-        """
-        Whether the operator during reconcile procedure should wait for replicas to catch-up
-
-        :param _builtins.str all: Whether the operator during reconcile procedure should wait for all replicas to catch-up
-        :param _builtins.int delay: replication max absolute delay to consider replica is not delayed
-        :param _builtins.str new: Whether the operator during reconcile procedure should wait for new replicas to catch-up
-        """
-        if all is not None:
-            pulumi.set(__self__, "all", all)
-        if delay is not None:
-            pulumi.set(__self__, "delay", delay)
-        if new is not None:
-            pulumi.set(__self__, "new", new)
-
-    @_builtins.property
-    @pulumi.getter
-    def all(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for all replicas to catch-up
-        """
-        return pulumi.get(self, "all")
-
-    @_builtins.property
-    @pulumi.getter
-    def delay(self) -> Optional[_builtins.int]:
-        """
-        replication max absolute delay to consider replica is not delayed
-        """
-        return pulumi.get(self, "delay")
-
-    @_builtins.property
-    @pulumi.getter
-    def new(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for new replicas to catch-up
-        """
-        return pulumi.get(self, "new")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileMacros(dict):
-    """
-    macros parameters
-    """
-    def __init__(__self__, *,
-                 sections: Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSections'] = None):
-        """
-        macros parameters
-        """
-        if sections is not None:
-            pulumi.set(__self__, "sections", sections)
-
-    @_builtins.property
-    @pulumi.getter
-    def sections(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSections']:
-        return pulumi.get(self, "sections")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileMacrosPatch(dict):
-    """
-    macros parameters
-    """
-    def __init__(__self__, *,
-                 sections: Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsPatch'] = None):
-        """
-        macros parameters
-        """
-        if sections is not None:
-            pulumi.set(__self__, "sections", sections)
-
-    @_builtins.property
-    @pulumi.getter
-    def sections(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsPatch']:
-        return pulumi.get(self, "sections")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileMacrosSections(dict):
-    """
-    sections behaviour for macros
-    """
-    def __init__(__self__, *,
-                 files: Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsFiles'] = None,
-                 profiles: Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsProfiles'] = None,
-                 quotas: Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsQuotas'] = None,
-                 settings: Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsSettings'] = None,
-                 users: Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsUsers'] = None):
-        """
-        sections behaviour for macros
-        """
-        if files is not None:
-            pulumi.set(__self__, "files", files)
-        if profiles is not None:
-            pulumi.set(__self__, "profiles", profiles)
-        if quotas is not None:
-            pulumi.set(__self__, "quotas", quotas)
-        if settings is not None:
-            pulumi.set(__self__, "settings", settings)
-        if users is not None:
-            pulumi.set(__self__, "users", users)
-
-    @_builtins.property
-    @pulumi.getter
-    def files(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsFiles']:
-        return pulumi.get(self, "files")
-
-    @_builtins.property
-    @pulumi.getter
-    def profiles(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsProfiles']:
-        return pulumi.get(self, "profiles")
-
-    @_builtins.property
-    @pulumi.getter
-    def quotas(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsQuotas']:
-        return pulumi.get(self, "quotas")
-
-    @_builtins.property
-    @pulumi.getter
-    def settings(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsSettings']:
-        return pulumi.get(self, "settings")
-
-    @_builtins.property
-    @pulumi.getter
-    def users(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsUsers']:
-        return pulumi.get(self, "users")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileMacrosSectionsFiles(dict):
-    """
-    sections behaviour for macros on files
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on files
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatch(dict):
-    """
-    sections behaviour for macros on files
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on files
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileMacrosSectionsPatch(dict):
-    """
-    sections behaviour for macros
-    """
-    def __init__(__self__, *,
-                 files: Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatch'] = None,
-                 profiles: Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatch'] = None,
-                 quotas: Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatch'] = None,
-                 settings: Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatch'] = None,
-                 users: Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatch'] = None):
-        """
-        sections behaviour for macros
-        """
-        if files is not None:
-            pulumi.set(__self__, "files", files)
-        if profiles is not None:
-            pulumi.set(__self__, "profiles", profiles)
-        if quotas is not None:
-            pulumi.set(__self__, "quotas", quotas)
-        if settings is not None:
-            pulumi.set(__self__, "settings", settings)
-        if users is not None:
-            pulumi.set(__self__, "users", users)
-
-    @_builtins.property
-    @pulumi.getter
-    def files(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatch']:
-        return pulumi.get(self, "files")
-
-    @_builtins.property
-    @pulumi.getter
-    def profiles(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatch']:
-        return pulumi.get(self, "profiles")
-
-    @_builtins.property
-    @pulumi.getter
-    def quotas(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatch']:
-        return pulumi.get(self, "quotas")
-
-    @_builtins.property
-    @pulumi.getter
-    def settings(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatch']:
-        return pulumi.get(self, "settings")
-
-    @_builtins.property
-    @pulumi.getter
-    def users(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatch']:
-        return pulumi.get(self, "users")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileMacrosSectionsProfiles(dict):
-    """
-    sections behaviour for macros on profiles
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on profiles
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatch(dict):
-    """
-    sections behaviour for macros on profiles
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on profiles
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileMacrosSectionsQuotas(dict):
-    """
-    sections behaviour for macros on quotas
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on quotas
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatch(dict):
-    """
-    sections behaviour for macros on quotas
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on quotas
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileMacrosSectionsSettings(dict):
-    """
-    sections behaviour for macros on settings
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on settings
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatch(dict):
-    """
-    sections behaviour for macros on settings
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on settings
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileMacrosSectionsUsers(dict):
-    """
-    sections behaviour for macros on users
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on users
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatch(dict):
-    """
-    sections behaviour for macros on users
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on users
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilePatch(dict):
-    """
-    Optional, allows tuning reconciling cycle for ClickhouseInstallation from clickhouse-operator side
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMapPropagationTimeout":
-            suggest = "config_map_propagation_timeout"
-        elif key == "statefulSet":
-            suggest = "stateful_set"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cleanup: Optional['outputs.ClickHouseInstallationSpecReconcileCleanupPatch'] = None,
-                 cluster: Optional['outputs.ClickHouseInstallationSpecReconcileClusterPatch'] = None,
-                 config_map_propagation_timeout: Optional[_builtins.int] = None,
-                 host: Optional['outputs.ClickHouseInstallationSpecReconcileHostPatch'] = None,
-                 macros: Optional['outputs.ClickHouseInstallationSpecReconcileMacrosPatch'] = None,
-                 policy: Optional[_builtins.str] = None,
-                 runtime: Optional['outputs.ClickHouseInstallationSpecReconcileRuntimePatch'] = None,
-                 stateful_set: Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetPatch'] = None):
-        """
-        Optional, allows tuning reconciling cycle for ClickhouseInstallation from clickhouse-operator side
-
-        :param _builtins.int config_map_propagation_timeout: Timeout in seconds for `clickhouse-operator` to wait for modified `ConfigMap` to propagate into the `Pod`
-               More details: https://kubernetes.io/docs/concepts/configuration/configmap/#mounted-configmaps-are-updated-automatically
-        :param _builtins.str policy: DISCUSSED TO BE DEPRECATED
-               Syntax sugar
-               Overrides all three 'reconcile.host.wait.{exclude, queries, include}' values from the operator's config
-               Possible values:
-                - wait - should wait to exclude host, complete queries and include host back into the cluster
-                - nowait - should NOT wait to exclude host, complete queries and include host back into the cluster
-        """
-        if cleanup is not None:
-            pulumi.set(__self__, "cleanup", cleanup)
-        if cluster is not None:
-            pulumi.set(__self__, "cluster", cluster)
-        if config_map_propagation_timeout is not None:
-            pulumi.set(__self__, "config_map_propagation_timeout", config_map_propagation_timeout)
-        if host is not None:
-            pulumi.set(__self__, "host", host)
-        if macros is not None:
-            pulumi.set(__self__, "macros", macros)
-        if policy is not None:
-            pulumi.set(__self__, "policy", policy)
-        if runtime is not None:
-            pulumi.set(__self__, "runtime", runtime)
-        if stateful_set is not None:
-            pulumi.set(__self__, "stateful_set", stateful_set)
-
-    @_builtins.property
-    @pulumi.getter
-    def cleanup(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileCleanupPatch']:
-        return pulumi.get(self, "cleanup")
-
-    @_builtins.property
-    @pulumi.getter
-    def cluster(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileClusterPatch']:
-        return pulumi.get(self, "cluster")
-
-    @_builtins.property
-    @pulumi.getter(name="configMapPropagationTimeout")
-    def config_map_propagation_timeout(self) -> Optional[_builtins.int]:
-        """
-        Timeout in seconds for `clickhouse-operator` to wait for modified `ConfigMap` to propagate into the `Pod`
-        More details: https://kubernetes.io/docs/concepts/configuration/configmap/#mounted-configmaps-are-updated-automatically
-        """
-        return pulumi.get(self, "config_map_propagation_timeout")
-
-    @_builtins.property
-    @pulumi.getter
-    def host(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHostPatch']:
-        return pulumi.get(self, "host")
-
-    @_builtins.property
-    @pulumi.getter
-    def macros(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacrosPatch']:
-        return pulumi.get(self, "macros")
-
-    @_builtins.property
-    @pulumi.getter
-    def policy(self) -> Optional[_builtins.str]:
-        """
-        DISCUSSED TO BE DEPRECATED
-        Syntax sugar
-        Overrides all three 'reconcile.host.wait.{exclude, queries, include}' values from the operator's config
-        Possible values:
-         - wait - should wait to exclude host, complete queries and include host back into the cluster
-         - nowait - should NOT wait to exclude host, complete queries and include host back into the cluster
-        """
-        return pulumi.get(self, "policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def runtime(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileRuntimePatch']:
-        return pulumi.get(self, "runtime")
-
-    @_builtins.property
-    @pulumi.getter(name="statefulSet")
-    def stateful_set(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetPatch']:
-        return pulumi.get(self, "stateful_set")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileRuntime(dict):
-    """
-    runtime parameters for clickhouse-operator process which are used during reconcile cycle
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "reconcileShardsMaxConcurrencyPercent":
-            suggest = "reconcile_shards_max_concurrency_percent"
-        elif key == "reconcileShardsThreadsNumber":
-            suggest = "reconcile_shards_threads_number"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileRuntime. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileRuntime.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileRuntime.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 reconcile_shards_max_concurrency_percent: Optional[_builtins.int] = None,
-                 reconcile_shards_threads_number: Optional[_builtins.int] = None):
-        """
-        runtime parameters for clickhouse-operator process which are used during reconcile cycle
-
-        :param _builtins.int reconcile_shards_max_concurrency_percent: The maximum percentage of cluster shards that may be reconciled in parallel, 50 percent by default.
-        :param _builtins.int reconcile_shards_threads_number: The maximum number of cluster shards that may be reconciled in parallel, 1 by default
-        """
-        if reconcile_shards_max_concurrency_percent is not None:
-            pulumi.set(__self__, "reconcile_shards_max_concurrency_percent", reconcile_shards_max_concurrency_percent)
-        if reconcile_shards_threads_number is not None:
-            pulumi.set(__self__, "reconcile_shards_threads_number", reconcile_shards_threads_number)
-
-    @_builtins.property
-    @pulumi.getter(name="reconcileShardsMaxConcurrencyPercent")
-    def reconcile_shards_max_concurrency_percent(self) -> Optional[_builtins.int]:
-        """
-        The maximum percentage of cluster shards that may be reconciled in parallel, 50 percent by default.
-        """
-        return pulumi.get(self, "reconcile_shards_max_concurrency_percent")
-
-    @_builtins.property
-    @pulumi.getter(name="reconcileShardsThreadsNumber")
-    def reconcile_shards_threads_number(self) -> Optional[_builtins.int]:
-        """
-        The maximum number of cluster shards that may be reconciled in parallel, 1 by default
-        """
-        return pulumi.get(self, "reconcile_shards_threads_number")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileRuntimePatch(dict):
-    """
-    runtime parameters for clickhouse-operator process which are used during reconcile cycle
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "reconcileShardsMaxConcurrencyPercent":
-            suggest = "reconcile_shards_max_concurrency_percent"
-        elif key == "reconcileShardsThreadsNumber":
-            suggest = "reconcile_shards_threads_number"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileRuntimePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileRuntimePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileRuntimePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 reconcile_shards_max_concurrency_percent: Optional[_builtins.int] = None,
-                 reconcile_shards_threads_number: Optional[_builtins.int] = None):
-        """
-        runtime parameters for clickhouse-operator process which are used during reconcile cycle
-
-        :param _builtins.int reconcile_shards_max_concurrency_percent: The maximum percentage of cluster shards that may be reconciled in parallel, 50 percent by default.
-        :param _builtins.int reconcile_shards_threads_number: The maximum number of cluster shards that may be reconciled in parallel, 1 by default
-        """
-        if reconcile_shards_max_concurrency_percent is not None:
-            pulumi.set(__self__, "reconcile_shards_max_concurrency_percent", reconcile_shards_max_concurrency_percent)
-        if reconcile_shards_threads_number is not None:
-            pulumi.set(__self__, "reconcile_shards_threads_number", reconcile_shards_threads_number)
-
-    @_builtins.property
-    @pulumi.getter(name="reconcileShardsMaxConcurrencyPercent")
-    def reconcile_shards_max_concurrency_percent(self) -> Optional[_builtins.int]:
-        """
-        The maximum percentage of cluster shards that may be reconciled in parallel, 50 percent by default.
-        """
-        return pulumi.get(self, "reconcile_shards_max_concurrency_percent")
-
-    @_builtins.property
-    @pulumi.getter(name="reconcileShardsThreadsNumber")
-    def reconcile_shards_threads_number(self) -> Optional[_builtins.int]:
-        """
-        The maximum number of cluster shards that may be reconciled in parallel, 1 by default
-        """
-        return pulumi.get(self, "reconcile_shards_threads_number")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileStatefulSet(dict):
-    """
-    Optional, StatefulSet reconcile behavior tuning
-    """
-    def __init__(__self__, *,
-                 create: Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetCreate'] = None,
-                 recreate: Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetRecreate'] = None,
-                 update: Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetUpdate'] = None):
-        """
-        Optional, StatefulSet reconcile behavior tuning
-        """
-        if create is not None:
-            pulumi.set(__self__, "create", create)
-        if recreate is not None:
-            pulumi.set(__self__, "recreate", recreate)
-        if update is not None:
-            pulumi.set(__self__, "update", update)
-
-    @_builtins.property
-    @pulumi.getter
-    def create(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetCreate']:
-        return pulumi.get(self, "create")
-
-    @_builtins.property
-    @pulumi.getter
-    def recreate(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetRecreate']:
-        return pulumi.get(self, "recreate")
-
-    @_builtins.property
-    @pulumi.getter
-    def update(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetUpdate']:
-        return pulumi.get(self, "update")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileStatefulSetCreate(dict):
-    """
-    Behavior during create StatefulSet
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "onFailure":
-            suggest = "on_failure"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileStatefulSetCreate. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileStatefulSetCreate.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileStatefulSetCreate.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 on_failure: Optional[_builtins.str] = None):
-        """
-        Behavior during create StatefulSet
-
-        :param _builtins.str on_failure: What to do in case created StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
-               Possible options:
-               1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
-               2. delete - delete newly created problematic StatefulSet and follow 'abort' path afterwards.
-               3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
-        """
-        if on_failure is not None:
-            pulumi.set(__self__, "on_failure", on_failure)
-
-    @_builtins.property
-    @pulumi.getter(name="onFailure")
-    def on_failure(self) -> Optional[_builtins.str]:
-        """
-        What to do in case created StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
-        Possible options:
-        1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
-        2. delete - delete newly created problematic StatefulSet and follow 'abort' path afterwards.
-        3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
-        """
-        return pulumi.get(self, "on_failure")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileStatefulSetCreatePatch(dict):
-    """
-    Behavior during create StatefulSet
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "onFailure":
-            suggest = "on_failure"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileStatefulSetCreatePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileStatefulSetCreatePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileStatefulSetCreatePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 on_failure: Optional[_builtins.str] = None):
-        """
-        Behavior during create StatefulSet
-
-        :param _builtins.str on_failure: What to do in case created StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
-               Possible options:
-               1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
-               2. delete - delete newly created problematic StatefulSet and follow 'abort' path afterwards.
-               3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
-        """
-        if on_failure is not None:
-            pulumi.set(__self__, "on_failure", on_failure)
-
-    @_builtins.property
-    @pulumi.getter(name="onFailure")
-    def on_failure(self) -> Optional[_builtins.str]:
-        """
-        What to do in case created StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
-        Possible options:
-        1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
-        2. delete - delete newly created problematic StatefulSet and follow 'abort' path afterwards.
-        3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
-        """
-        return pulumi.get(self, "on_failure")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileStatefulSetPatch(dict):
-    """
-    Optional, StatefulSet reconcile behavior tuning
-    """
-    def __init__(__self__, *,
-                 create: Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetCreatePatch'] = None,
-                 recreate: Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetRecreatePatch'] = None,
-                 update: Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetUpdatePatch'] = None):
-        """
-        Optional, StatefulSet reconcile behavior tuning
-        """
-        if create is not None:
-            pulumi.set(__self__, "create", create)
-        if recreate is not None:
-            pulumi.set(__self__, "recreate", recreate)
-        if update is not None:
-            pulumi.set(__self__, "update", update)
-
-    @_builtins.property
-    @pulumi.getter
-    def create(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetCreatePatch']:
-        return pulumi.get(self, "create")
-
-    @_builtins.property
-    @pulumi.getter
-    def recreate(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetRecreatePatch']:
-        return pulumi.get(self, "recreate")
-
-    @_builtins.property
-    @pulumi.getter
-    def update(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetUpdatePatch']:
-        return pulumi.get(self, "update")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileStatefulSetRecreate(dict):
-    """
-    Behavior during recreate StatefulSet
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "onDataLoss":
-            suggest = "on_data_loss"
-        elif key == "onUpdateFailure":
-            suggest = "on_update_failure"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileStatefulSetRecreate. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileStatefulSetRecreate.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileStatefulSetRecreate.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 on_data_loss: Optional[_builtins.str] = None,
-                 on_update_failure: Optional[_builtins.str] = None):
-        """
-        Behavior during recreate StatefulSet
-
-        :param _builtins.str on_data_loss: What to do in case operator needs to recreate StatefulSet due to PVC data loss or missing volumes.
-               Possible options:
-               1. abort - abort the process, do nothing with the problematic StatefulSet.
-               2. recreate - proceed and recreate StatefulSet.
-        :param _builtins.str on_update_failure: What to do in case operator needs to recreate StatefulSet due to update failure or StatefulSet not ready.
-               Possible options:
-               1. abort - abort the process, do nothing with the problematic StatefulSet.
-               2. recreate - proceed and recreate StatefulSet.
-        """
-        if on_data_loss is not None:
-            pulumi.set(__self__, "on_data_loss", on_data_loss)
-        if on_update_failure is not None:
-            pulumi.set(__self__, "on_update_failure", on_update_failure)
-
-    @_builtins.property
-    @pulumi.getter(name="onDataLoss")
-    def on_data_loss(self) -> Optional[_builtins.str]:
-        """
-        What to do in case operator needs to recreate StatefulSet due to PVC data loss or missing volumes.
-        Possible options:
-        1. abort - abort the process, do nothing with the problematic StatefulSet.
-        2. recreate - proceed and recreate StatefulSet.
-        """
-        return pulumi.get(self, "on_data_loss")
-
-    @_builtins.property
-    @pulumi.getter(name="onUpdateFailure")
-    def on_update_failure(self) -> Optional[_builtins.str]:
-        """
-        What to do in case operator needs to recreate StatefulSet due to update failure or StatefulSet not ready.
-        Possible options:
-        1. abort - abort the process, do nothing with the problematic StatefulSet.
-        2. recreate - proceed and recreate StatefulSet.
-        """
-        return pulumi.get(self, "on_update_failure")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileStatefulSetRecreatePatch(dict):
-    """
-    Behavior during recreate StatefulSet
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "onDataLoss":
-            suggest = "on_data_loss"
-        elif key == "onUpdateFailure":
-            suggest = "on_update_failure"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileStatefulSetRecreatePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileStatefulSetRecreatePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileStatefulSetRecreatePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 on_data_loss: Optional[_builtins.str] = None,
-                 on_update_failure: Optional[_builtins.str] = None):
-        """
-        Behavior during recreate StatefulSet
-
-        :param _builtins.str on_data_loss: What to do in case operator needs to recreate StatefulSet due to PVC data loss or missing volumes.
-               Possible options:
-               1. abort - abort the process, do nothing with the problematic StatefulSet.
-               2. recreate - proceed and recreate StatefulSet.
-        :param _builtins.str on_update_failure: What to do in case operator needs to recreate StatefulSet due to update failure or StatefulSet not ready.
-               Possible options:
-               1. abort - abort the process, do nothing with the problematic StatefulSet.
-               2. recreate - proceed and recreate StatefulSet.
-        """
-        if on_data_loss is not None:
-            pulumi.set(__self__, "on_data_loss", on_data_loss)
-        if on_update_failure is not None:
-            pulumi.set(__self__, "on_update_failure", on_update_failure)
-
-    @_builtins.property
-    @pulumi.getter(name="onDataLoss")
-    def on_data_loss(self) -> Optional[_builtins.str]:
-        """
-        What to do in case operator needs to recreate StatefulSet due to PVC data loss or missing volumes.
-        Possible options:
-        1. abort - abort the process, do nothing with the problematic StatefulSet.
-        2. recreate - proceed and recreate StatefulSet.
-        """
-        return pulumi.get(self, "on_data_loss")
-
-    @_builtins.property
-    @pulumi.getter(name="onUpdateFailure")
-    def on_update_failure(self) -> Optional[_builtins.str]:
-        """
-        What to do in case operator needs to recreate StatefulSet due to update failure or StatefulSet not ready.
-        Possible options:
-        1. abort - abort the process, do nothing with the problematic StatefulSet.
-        2. recreate - proceed and recreate StatefulSet.
-        """
-        return pulumi.get(self, "on_update_failure")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileStatefulSetUpdate(dict):
-    """
-    Behavior during update StatefulSet
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "onFailure":
-            suggest = "on_failure"
-        elif key == "pollInterval":
-            suggest = "poll_interval"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileStatefulSetUpdate. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileStatefulSetUpdate.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileStatefulSetUpdate.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 on_failure: Optional[_builtins.str] = None,
-                 poll_interval: Optional[_builtins.int] = None,
-                 timeout: Optional[_builtins.int] = None):
-        """
-        Behavior during update StatefulSet
-
-        :param _builtins.str on_failure: What to do in case updated StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
-               Possible options:
-               1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
-               2. rollback - delete Pod and rollback StatefulSet to previous Generation. Follow 'abort' path afterwards.
-               3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
-        :param _builtins.int poll_interval: How many seconds to wait between checks for StatefulSet status during update
-        :param _builtins.int timeout: How many seconds to wait for StatefulSet to be 'Ready' during update
-        """
-        if on_failure is not None:
-            pulumi.set(__self__, "on_failure", on_failure)
-        if poll_interval is not None:
-            pulumi.set(__self__, "poll_interval", poll_interval)
-        if timeout is not None:
-            pulumi.set(__self__, "timeout", timeout)
-
-    @_builtins.property
-    @pulumi.getter(name="onFailure")
-    def on_failure(self) -> Optional[_builtins.str]:
-        """
-        What to do in case updated StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
-        Possible options:
-        1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
-        2. rollback - delete Pod and rollback StatefulSet to previous Generation. Follow 'abort' path afterwards.
-        3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
-        """
-        return pulumi.get(self, "on_failure")
-
-    @_builtins.property
-    @pulumi.getter(name="pollInterval")
-    def poll_interval(self) -> Optional[_builtins.int]:
-        """
-        How many seconds to wait between checks for StatefulSet status during update
-        """
-        return pulumi.get(self, "poll_interval")
-
-    @_builtins.property
-    @pulumi.getter
-    def timeout(self) -> Optional[_builtins.int]:
-        """
-        How many seconds to wait for StatefulSet to be 'Ready' during update
-        """
-        return pulumi.get(self, "timeout")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcileStatefulSetUpdatePatch(dict):
-    """
-    Behavior during update StatefulSet
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "onFailure":
-            suggest = "on_failure"
-        elif key == "pollInterval":
-            suggest = "poll_interval"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileStatefulSetUpdatePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcileStatefulSetUpdatePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcileStatefulSetUpdatePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 on_failure: Optional[_builtins.str] = None,
-                 poll_interval: Optional[_builtins.int] = None,
-                 timeout: Optional[_builtins.int] = None):
-        """
-        Behavior during update StatefulSet
-
-        :param _builtins.str on_failure: What to do in case updated StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
-               Possible options:
-               1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
-               2. rollback - delete Pod and rollback StatefulSet to previous Generation. Follow 'abort' path afterwards.
-               3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
-        :param _builtins.int poll_interval: How many seconds to wait between checks for StatefulSet status during update
-        :param _builtins.int timeout: How many seconds to wait for StatefulSet to be 'Ready' during update
-        """
-        if on_failure is not None:
-            pulumi.set(__self__, "on_failure", on_failure)
-        if poll_interval is not None:
-            pulumi.set(__self__, "poll_interval", poll_interval)
-        if timeout is not None:
-            pulumi.set(__self__, "timeout", timeout)
-
-    @_builtins.property
-    @pulumi.getter(name="onFailure")
-    def on_failure(self) -> Optional[_builtins.str]:
-        """
-        What to do in case updated StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
-        Possible options:
-        1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
-        2. rollback - delete Pod and rollback StatefulSet to previous Generation. Follow 'abort' path afterwards.
-        3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
-        """
-        return pulumi.get(self, "on_failure")
-
-    @_builtins.property
-    @pulumi.getter(name="pollInterval")
-    def poll_interval(self) -> Optional[_builtins.int]:
-        """
-        How many seconds to wait between checks for StatefulSet status during update
-        """
-        return pulumi.get(self, "poll_interval")
-
-    @_builtins.property
-    @pulumi.getter
-    def timeout(self) -> Optional[_builtins.int]:
-        """
-        How many seconds to wait for StatefulSet to be 'Ready' during update
-        """
-        return pulumi.get(self, "timeout")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconciling(dict):
-    """
-    [OBSOLETED] Optional, allows tuning reconciling cycle for ClickhouseInstallation from clickhouse-operator side
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMapPropagationTimeout":
-            suggest = "config_map_propagation_timeout"
-        elif key == "statefulSet":
-            suggest = "stateful_set"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconciling. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconciling.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconciling.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cleanup: Optional['outputs.ClickHouseInstallationSpecReconcilingCleanup'] = None,
-                 cluster: Optional['outputs.ClickHouseInstallationSpecReconcilingCluster'] = None,
-                 config_map_propagation_timeout: Optional[_builtins.int] = None,
-                 host: Optional['outputs.ClickHouseInstallationSpecReconcilingHost'] = None,
-                 macros: Optional['outputs.ClickHouseInstallationSpecReconcilingMacros'] = None,
-                 policy: Optional[_builtins.str] = None,
-                 runtime: Optional['outputs.ClickHouseInstallationSpecReconcilingRuntime'] = None,
-                 stateful_set: Optional['outputs.ClickHouseInstallationSpecReconcilingStatefulSet'] = None):
-        """
-        [OBSOLETED] Optional, allows tuning reconciling cycle for ClickhouseInstallation from clickhouse-operator side
-
-        :param _builtins.int config_map_propagation_timeout: Timeout in seconds for `clickhouse-operator` to wait for modified `ConfigMap` to propagate into the `Pod`
-               More details: https://kubernetes.io/docs/concepts/configuration/configmap/#mounted-configmaps-are-updated-automatically
-        :param _builtins.str policy: DISCUSSED TO BE DEPRECATED
-               Syntax sugar
-               Overrides all three 'reconcile.host.wait.{exclude, queries, include}' values from the operator's config
-               Possible values:
-                - wait - should wait to exclude host, complete queries and include host back into the cluster
-                - nowait - should NOT wait to exclude host, complete queries and include host back into the cluster
-        """
-        if cleanup is not None:
-            pulumi.set(__self__, "cleanup", cleanup)
-        if cluster is not None:
-            pulumi.set(__self__, "cluster", cluster)
-        if config_map_propagation_timeout is not None:
-            pulumi.set(__self__, "config_map_propagation_timeout", config_map_propagation_timeout)
-        if host is not None:
-            pulumi.set(__self__, "host", host)
-        if macros is not None:
-            pulumi.set(__self__, "macros", macros)
-        if policy is not None:
-            pulumi.set(__self__, "policy", policy)
-        if runtime is not None:
-            pulumi.set(__self__, "runtime", runtime)
-        if stateful_set is not None:
-            pulumi.set(__self__, "stateful_set", stateful_set)
-
-    @_builtins.property
-    @pulumi.getter
-    def cleanup(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingCleanup']:
-        return pulumi.get(self, "cleanup")
-
-    @_builtins.property
-    @pulumi.getter
-    def cluster(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingCluster']:
-        return pulumi.get(self, "cluster")
-
-    @_builtins.property
-    @pulumi.getter(name="configMapPropagationTimeout")
-    def config_map_propagation_timeout(self) -> Optional[_builtins.int]:
-        """
-        Timeout in seconds for `clickhouse-operator` to wait for modified `ConfigMap` to propagate into the `Pod`
-        More details: https://kubernetes.io/docs/concepts/configuration/configmap/#mounted-configmaps-are-updated-automatically
-        """
-        return pulumi.get(self, "config_map_propagation_timeout")
-
-    @_builtins.property
-    @pulumi.getter
-    def host(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHost']:
-        return pulumi.get(self, "host")
-
-    @_builtins.property
-    @pulumi.getter
-    def macros(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacros']:
-        return pulumi.get(self, "macros")
-
-    @_builtins.property
-    @pulumi.getter
-    def policy(self) -> Optional[_builtins.str]:
-        """
-        DISCUSSED TO BE DEPRECATED
-        Syntax sugar
-        Overrides all three 'reconcile.host.wait.{exclude, queries, include}' values from the operator's config
-        Possible values:
-         - wait - should wait to exclude host, complete queries and include host back into the cluster
-         - nowait - should NOT wait to exclude host, complete queries and include host back into the cluster
-        """
-        return pulumi.get(self, "policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def runtime(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingRuntime']:
-        return pulumi.get(self, "runtime")
-
-    @_builtins.property
-    @pulumi.getter(name="statefulSet")
-    def stateful_set(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingStatefulSet']:
-        return pulumi.get(self, "stateful_set")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingCleanup(dict):
-    """
-    Optional, defines behavior for cleanup Kubernetes resources during reconcile cycle
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "reconcileFailedObjects":
-            suggest = "reconcile_failed_objects"
-        elif key == "unknownObjects":
-            suggest = "unknown_objects"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingCleanup. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingCleanup.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingCleanup.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 reconcile_failed_objects: Optional['outputs.ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjects'] = None,
-                 unknown_objects: Optional['outputs.ClickHouseInstallationSpecReconcilingCleanupUnknownObjects'] = None):
-        """
-        Optional, defines behavior for cleanup Kubernetes resources during reconcile cycle
-        """
-        if reconcile_failed_objects is not None:
-            pulumi.set(__self__, "reconcile_failed_objects", reconcile_failed_objects)
-        if unknown_objects is not None:
-            pulumi.set(__self__, "unknown_objects", unknown_objects)
-
-    @_builtins.property
-    @pulumi.getter(name="reconcileFailedObjects")
-    def reconcile_failed_objects(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjects']:
-        return pulumi.get(self, "reconcile_failed_objects")
-
-    @_builtins.property
-    @pulumi.getter(name="unknownObjects")
-    def unknown_objects(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingCleanupUnknownObjects']:
-        return pulumi.get(self, "unknown_objects")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingCleanupPatch(dict):
-    """
-    Optional, defines behavior for cleanup Kubernetes resources during reconcile cycle
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "reconcileFailedObjects":
-            suggest = "reconcile_failed_objects"
-        elif key == "unknownObjects":
-            suggest = "unknown_objects"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingCleanupPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingCleanupPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingCleanupPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 reconcile_failed_objects: Optional['outputs.ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatch'] = None,
-                 unknown_objects: Optional['outputs.ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatch'] = None):
-        """
-        Optional, defines behavior for cleanup Kubernetes resources during reconcile cycle
-        """
-        if reconcile_failed_objects is not None:
-            pulumi.set(__self__, "reconcile_failed_objects", reconcile_failed_objects)
-        if unknown_objects is not None:
-            pulumi.set(__self__, "unknown_objects", unknown_objects)
-
-    @_builtins.property
-    @pulumi.getter(name="reconcileFailedObjects")
-    def reconcile_failed_objects(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatch']:
-        return pulumi.get(self, "reconcile_failed_objects")
-
-    @_builtins.property
-    @pulumi.getter(name="unknownObjects")
-    def unknown_objects(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatch']:
-        return pulumi.get(self, "unknown_objects")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjects(dict):
-    """
-    Describes what clickhouse-operator should do with Kubernetes resources which are failed during reconcile.
-    Default behavior is `Retain`"
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-        elif key == "statefulSet":
-            suggest = "stateful_set"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjects. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjects.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjects.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional[_builtins.str] = None,
-                 pvc: Optional[_builtins.str] = None,
-                 service: Optional[_builtins.str] = None,
-                 stateful_set: Optional[_builtins.str] = None):
-        """
-        Describes what clickhouse-operator should do with Kubernetes resources which are failed during reconcile.
-        Default behavior is `Retain`"
-
-
-        :param _builtins.str config_map: Behavior policy for failed ConfigMap, `Retain` by default
-        :param _builtins.str pvc: Behavior policy for failed PVC, `Retain` by default
-        :param _builtins.str service: Behavior policy for failed Service, `Retain` by default
-        :param _builtins.str stateful_set: Behavior policy for failed StatefulSet, `Retain` by default
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if pvc is not None:
-            pulumi.set(__self__, "pvc", pvc)
-        if service is not None:
-            pulumi.set(__self__, "service", service)
-        if stateful_set is not None:
-            pulumi.set(__self__, "stateful_set", stateful_set)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for failed ConfigMap, `Retain` by default
-        """
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def pvc(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for failed PVC, `Retain` by default
-        """
-        return pulumi.get(self, "pvc")
-
-    @_builtins.property
-    @pulumi.getter
-    def service(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for failed Service, `Retain` by default
-        """
-        return pulumi.get(self, "service")
-
-    @_builtins.property
-    @pulumi.getter(name="statefulSet")
-    def stateful_set(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for failed StatefulSet, `Retain` by default
-        """
-        return pulumi.get(self, "stateful_set")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatch(dict):
-    """
-    Describes what clickhouse-operator should do with Kubernetes resources which are failed during reconcile.
-    Default behavior is `Retain`"
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-        elif key == "statefulSet":
-            suggest = "stateful_set"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional[_builtins.str] = None,
-                 pvc: Optional[_builtins.str] = None,
-                 service: Optional[_builtins.str] = None,
-                 stateful_set: Optional[_builtins.str] = None):
-        """
-        Describes what clickhouse-operator should do with Kubernetes resources which are failed during reconcile.
-        Default behavior is `Retain`"
-
-
-        :param _builtins.str config_map: Behavior policy for failed ConfigMap, `Retain` by default
-        :param _builtins.str pvc: Behavior policy for failed PVC, `Retain` by default
-        :param _builtins.str service: Behavior policy for failed Service, `Retain` by default
-        :param _builtins.str stateful_set: Behavior policy for failed StatefulSet, `Retain` by default
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if pvc is not None:
-            pulumi.set(__self__, "pvc", pvc)
-        if service is not None:
-            pulumi.set(__self__, "service", service)
-        if stateful_set is not None:
-            pulumi.set(__self__, "stateful_set", stateful_set)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for failed ConfigMap, `Retain` by default
-        """
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def pvc(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for failed PVC, `Retain` by default
-        """
-        return pulumi.get(self, "pvc")
-
-    @_builtins.property
-    @pulumi.getter
-    def service(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for failed Service, `Retain` by default
-        """
-        return pulumi.get(self, "service")
-
-    @_builtins.property
-    @pulumi.getter(name="statefulSet")
-    def stateful_set(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for failed StatefulSet, `Retain` by default
-        """
-        return pulumi.get(self, "stateful_set")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingCleanupUnknownObjects(dict):
-    """
-    Describes what clickhouse-operator should do with found Kubernetes resources which should be managed by clickhouse-operator,
-    but do not have `ownerReference` to any currently managed `ClickHouseInstallation` resource.
-    Default behavior is `Delete`"
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-        elif key == "statefulSet":
-            suggest = "stateful_set"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingCleanupUnknownObjects. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingCleanupUnknownObjects.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingCleanupUnknownObjects.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional[_builtins.str] = None,
-                 pvc: Optional[_builtins.str] = None,
-                 service: Optional[_builtins.str] = None,
-                 stateful_set: Optional[_builtins.str] = None):
-        """
-        Describes what clickhouse-operator should do with found Kubernetes resources which should be managed by clickhouse-operator,
-        but do not have `ownerReference` to any currently managed `ClickHouseInstallation` resource.
-        Default behavior is `Delete`"
-
-
-        :param _builtins.str config_map: Behavior policy for unknown ConfigMap, `Delete` by default
-        :param _builtins.str pvc: Behavior policy for unknown PVC, `Delete` by default
-        :param _builtins.str service: Behavior policy for unknown Service, `Delete` by default
-        :param _builtins.str stateful_set: Behavior policy for unknown StatefulSet, `Delete` by default
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if pvc is not None:
-            pulumi.set(__self__, "pvc", pvc)
-        if service is not None:
-            pulumi.set(__self__, "service", service)
-        if stateful_set is not None:
-            pulumi.set(__self__, "stateful_set", stateful_set)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for unknown ConfigMap, `Delete` by default
-        """
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def pvc(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for unknown PVC, `Delete` by default
-        """
-        return pulumi.get(self, "pvc")
-
-    @_builtins.property
-    @pulumi.getter
-    def service(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for unknown Service, `Delete` by default
-        """
-        return pulumi.get(self, "service")
-
-    @_builtins.property
-    @pulumi.getter(name="statefulSet")
-    def stateful_set(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for unknown StatefulSet, `Delete` by default
-        """
-        return pulumi.get(self, "stateful_set")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatch(dict):
-    """
-    Describes what clickhouse-operator should do with found Kubernetes resources which should be managed by clickhouse-operator,
-    but do not have `ownerReference` to any currently managed `ClickHouseInstallation` resource.
-    Default behavior is `Delete`"
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-        elif key == "statefulSet":
-            suggest = "stateful_set"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional[_builtins.str] = None,
-                 pvc: Optional[_builtins.str] = None,
-                 service: Optional[_builtins.str] = None,
-                 stateful_set: Optional[_builtins.str] = None):
-        """
-        Describes what clickhouse-operator should do with found Kubernetes resources which should be managed by clickhouse-operator,
-        but do not have `ownerReference` to any currently managed `ClickHouseInstallation` resource.
-        Default behavior is `Delete`"
-
-
-        :param _builtins.str config_map: Behavior policy for unknown ConfigMap, `Delete` by default
-        :param _builtins.str pvc: Behavior policy for unknown PVC, `Delete` by default
-        :param _builtins.str service: Behavior policy for unknown Service, `Delete` by default
-        :param _builtins.str stateful_set: Behavior policy for unknown StatefulSet, `Delete` by default
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if pvc is not None:
-            pulumi.set(__self__, "pvc", pvc)
-        if service is not None:
-            pulumi.set(__self__, "service", service)
-        if stateful_set is not None:
-            pulumi.set(__self__, "stateful_set", stateful_set)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for unknown ConfigMap, `Delete` by default
-        """
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def pvc(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for unknown PVC, `Delete` by default
-        """
-        return pulumi.get(self, "pvc")
-
-    @_builtins.property
-    @pulumi.getter
-    def service(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for unknown Service, `Delete` by default
-        """
-        return pulumi.get(self, "service")
-
-    @_builtins.property
-    @pulumi.getter(name="statefulSet")
-    def stateful_set(self) -> Optional[_builtins.str]:
-        """
-        Behavior policy for unknown StatefulSet, `Delete` by default
-        """
-        return pulumi.get(self, "stateful_set")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingCluster(dict):
-    """
-    CHI-level cluster reconcile defaults inherited by every cluster's
-    spec.configuration.clusters[N].reconcile section. Use this as a single
-    place to define cluster-level hooks that should apply to all clusters
-    in this CHI; per-cluster hooks (under clusters[N].reconcile.hooks)
-    are appended to (and dedup'd against) the inherited set.
-    """
-    def __init__(__self__, *,
-                 hooks: Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooks'] = None):
-        """
-        CHI-level cluster reconcile defaults inherited by every cluster's
-        spec.configuration.clusters[N].reconcile section. Use this as a single
-        place to define cluster-level hooks that should apply to all clusters
-        in this CHI; per-cluster hooks (under clusters[N].reconcile.hooks)
-        are appended to (and dedup'd against) the inherited set.
-        """
-        if hooks is not None:
-            pulumi.set(__self__, "hooks", hooks)
-
-    @_builtins.property
-    @pulumi.getter
-    def hooks(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooks']:
-        return pulumi.get(self, "hooks")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterHooks(dict):
-    """
-    cluster-level hooks inherited by every cluster
-    """
-    def __init__(__self__, *,
-                 post: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPost']] = None,
-                 pre: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPre']] = None):
-        """
-        cluster-level hooks inherited by every cluster
-
-        :param Sequence['ClickHouseInstallationSpecReconcilingClusterHooksPostArgs'] post: actions to execute after each cluster reconcile
-        :param Sequence['ClickHouseInstallationSpecReconcilingClusterHooksPreArgs'] pre: actions to execute before each cluster reconcile
-        """
-        if post is not None:
-            pulumi.set(__self__, "post", post)
-        if pre is not None:
-            pulumi.set(__self__, "pre", pre)
-
-    @_builtins.property
-    @pulumi.getter
-    def post(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPost']]:
-        """
-        actions to execute after each cluster reconcile
-        """
-        return pulumi.get(self, "post")
-
-    @_builtins.property
-    @pulumi.getter
-    def pre(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPre']]:
-        """
-        actions to execute before each cluster reconcile
-        """
-        return pulumi.get(self, "pre")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterHooksPatch(dict):
-    """
-    cluster-level hooks inherited by every cluster
-    """
-    def __init__(__self__, *,
-                 post: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPostPatch']] = None,
-                 pre: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPrePatch']] = None):
-        """
-        cluster-level hooks inherited by every cluster
-
-        :param Sequence['ClickHouseInstallationSpecReconcilingClusterHooksPostPatchArgs'] post: actions to execute after each cluster reconcile
-        :param Sequence['ClickHouseInstallationSpecReconcilingClusterHooksPrePatchArgs'] pre: actions to execute before each cluster reconcile
-        """
-        if post is not None:
-            pulumi.set(__self__, "post", post)
-        if pre is not None:
-            pulumi.set(__self__, "pre", pre)
-
-    @_builtins.property
-    @pulumi.getter
-    def post(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPostPatch']]:
-        """
-        actions to execute after each cluster reconcile
-        """
-        return pulumi.get(self, "post")
-
-    @_builtins.property
-    @pulumi.getter
-    def pre(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPrePatch']]:
-        """
-        actions to execute before each cluster reconcile
-        """
-        return pulumi.get(self, "pre")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterHooksPost(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingClusterHooksPost. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingClusterHooksPost.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingClusterHooksPost.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPostHttp'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPostShell'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPostSql'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Cluster-scope reconcile lifecycle events. Required, non-empty.
-                 Any              - wildcard match: fires on every cluster reconcile pass
-                                    and the cluster delete sweep
-                 ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                                    only on the first reconcile of a brand-new cluster
-                 ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                                    least one host has prior state). Fires on every
-                                    operator reconcile cycle the upstream gates allow,
-                                    including taskID-only force-reconciles. NOT a "spec
-                                    changed" signal.
-                 ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default) propagates the error; Ignore logs a warning and continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Cluster-scope reconcile lifecycle events. Required, non-empty.
-          Any              - wildcard match: fires on every cluster reconcile pass
-                             and the cluster delete sweep
-          ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                             only on the first reconcile of a brand-new cluster
-          ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                             least one host has prior state). Fires on every
-                             operator reconcile cycle the upstream gates allow,
-                             including taskID-only force-reconciles. NOT a "spec
-                             changed" signal.
-          ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default) propagates the error; Ignore logs a warning and continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPostHttp']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPostShell']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPostSql']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterHooksPostHttp(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterHooksPostHttpPatch(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterHooksPostPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingClusterHooksPostPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingClusterHooksPostPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingClusterHooksPostPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPostHttpPatch'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPostShellPatch'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPostSqlPatch'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Cluster-scope reconcile lifecycle events. Required, non-empty.
-                 Any              - wildcard match: fires on every cluster reconcile pass
-                                    and the cluster delete sweep
-                 ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                                    only on the first reconcile of a brand-new cluster
-                 ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                                    least one host has prior state). Fires on every
-                                    operator reconcile cycle the upstream gates allow,
-                                    including taskID-only force-reconciles. NOT a "spec
-                                    changed" signal.
-                 ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default) propagates the error; Ignore logs a warning and continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Cluster-scope reconcile lifecycle events. Required, non-empty.
-          Any              - wildcard match: fires on every cluster reconcile pass
-                             and the cluster delete sweep
-          ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                             only on the first reconcile of a brand-new cluster
-          ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                             least one host has prior state). Fires on every
-                             operator reconcile cycle the upstream gates allow,
-                             including taskID-only force-reconciles. NOT a "spec
-                             changed" signal.
-          ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default) propagates the error; Ignore logs a warning and continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPostHttpPatch']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPostShellPatch']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPostSqlPatch']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterHooksPostShell(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterHooksPostShellPatch(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterHooksPostSql(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterHooksPostSqlPatch(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterHooksPre(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingClusterHooksPre. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingClusterHooksPre.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingClusterHooksPre.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPreHttp'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPreShell'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPreSql'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Cluster-scope reconcile lifecycle events. Required, non-empty.
-                 Any              - wildcard match: fires on every cluster reconcile pass
-                                    and the cluster delete sweep
-                 ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                                    only on the first reconcile of a brand-new cluster
-                 ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                                    least one host has prior state). Fires on every
-                                    operator reconcile cycle the upstream gates allow,
-                                    including taskID-only force-reconciles. NOT a "spec
-                                    changed" signal.
-                 ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default) propagates the error; Ignore logs a warning and continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Cluster-scope reconcile lifecycle events. Required, non-empty.
-          Any              - wildcard match: fires on every cluster reconcile pass
-                             and the cluster delete sweep
-          ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                             only on the first reconcile of a brand-new cluster
-          ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                             least one host has prior state). Fires on every
-                             operator reconcile cycle the upstream gates allow,
-                             including taskID-only force-reconciles. NOT a "spec
-                             changed" signal.
-          ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default) propagates the error; Ignore logs a warning and continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPreHttp']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPreShell']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPreSql']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterHooksPreHttp(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterHooksPreHttpPatch(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterHooksPrePatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingClusterHooksPrePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingClusterHooksPrePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingClusterHooksPrePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPreHttpPatch'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPreShellPatch'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPreSqlPatch'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Cluster-scope reconcile lifecycle events. Required, non-empty.
-                 Any              - wildcard match: fires on every cluster reconcile pass
-                                    and the cluster delete sweep
-                 ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                                    only on the first reconcile of a brand-new cluster
-                 ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                                    least one host has prior state). Fires on every
-                                    operator reconcile cycle the upstream gates allow,
-                                    including taskID-only force-reconciles. NOT a "spec
-                                    changed" signal.
-                 ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default) propagates the error; Ignore logs a warning and continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Cluster-scope reconcile lifecycle events. Required, non-empty.
-          Any              - wildcard match: fires on every cluster reconcile pass
-                             and the cluster delete sweep
-          ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
-                             only on the first reconcile of a brand-new cluster
-          ClusterReconcile - ongoing reconcile pass over an existing cluster (at
-                             least one host has prior state). Fires on every
-                             operator reconcile cycle the upstream gates allow,
-                             including taskID-only force-reconciles. NOT a "spec
-                             changed" signal.
-          ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default) propagates the error; Ignore logs a warning and continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPreHttpPatch']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPreShellPatch']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPreSqlPatch']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterHooksPreShell(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterHooksPreShellPatch(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterHooksPreSql(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterHooksPreSqlPatch(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingClusterPatch(dict):
-    """
-    CHI-level cluster reconcile defaults inherited by every cluster's
-    spec.configuration.clusters[N].reconcile section. Use this as a single
-    place to define cluster-level hooks that should apply to all clusters
-    in this CHI; per-cluster hooks (under clusters[N].reconcile.hooks)
-    are appended to (and dedup'd against) the inherited set.
-    """
-    def __init__(__self__, *,
-                 hooks: Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPatch'] = None):
-        """
-        CHI-level cluster reconcile defaults inherited by every cluster's
-        spec.configuration.clusters[N].reconcile section. Use this as a single
-        place to define cluster-level hooks that should apply to all clusters
-        in this CHI; per-cluster hooks (under clusters[N].reconcile.hooks)
-        are appended to (and dedup'd against) the inherited set.
-        """
-        if hooks is not None:
-            pulumi.set(__self__, "hooks", hooks)
-
-    @_builtins.property
-    @pulumi.getter
-    def hooks(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingClusterHooksPatch']:
-        return pulumi.get(self, "hooks")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHost(dict):
-    """
-    Whether the operator during reconcile procedure should wait for a ClickHouse host:
-      - to be excluded from a ClickHouse cluster
-      - to complete all running queries
-      - to be included into a ClickHouse cluster
-    respectfully before moving forward
-    """
-    def __init__(__self__, *,
-                 drop: Optional['outputs.ClickHouseInstallationSpecReconcilingHostDrop'] = None,
-                 hooks: Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooks'] = None,
-                 wait: Optional['outputs.ClickHouseInstallationSpecReconcilingHostWait'] = None):
-        """
-        Whether the operator during reconcile procedure should wait for a ClickHouse host:
-          - to be excluded from a ClickHouse cluster
-          - to complete all running queries
-          - to be included into a ClickHouse cluster
-        respectfully before moving forward
-        """
-        if drop is not None:
-            pulumi.set(__self__, "drop", drop)
-        if hooks is not None:
-            pulumi.set(__self__, "hooks", hooks)
-        if wait is not None:
-            pulumi.set(__self__, "wait", wait)
-
-    @_builtins.property
-    @pulumi.getter
-    def drop(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostDrop']:
-        return pulumi.get(self, "drop")
-
-    @_builtins.property
-    @pulumi.getter
-    def hooks(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooks']:
-        return pulumi.get(self, "hooks")
-
-    @_builtins.property
-    @pulumi.getter
-    def wait(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostWait']:
-        return pulumi.get(self, "wait")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostDrop(dict):
-    def __init__(__self__, *,
-                 replicas: Optional['outputs.ClickHouseInstallationSpecReconcilingHostDropReplicas'] = None):
-        if replicas is not None:
-            pulumi.set(__self__, "replicas", replicas)
-
-    @_builtins.property
-    @pulumi.getter
-    def replicas(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostDropReplicas']:
-        return pulumi.get(self, "replicas")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostDropPatch(dict):
-    def __init__(__self__, *,
-                 replicas: Optional['outputs.ClickHouseInstallationSpecReconcilingHostDropReplicasPatch'] = None):
-        if replicas is not None:
-            pulumi.set(__self__, "replicas", replicas)
-
-    @_builtins.property
-    @pulumi.getter
-    def replicas(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostDropReplicasPatch']:
-        return pulumi.get(self, "replicas")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostDropReplicas(dict):
-    """
-    Whether the operator during reconcile procedure should drop replicas when replica is deleted or recreated
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "onDelete":
-            suggest = "on_delete"
-        elif key == "onLostVolume":
-            suggest = "on_lost_volume"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingHostDropReplicas. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingHostDropReplicas.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingHostDropReplicas.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 active: Optional[_builtins.str] = None,
-                 on_delete: Optional[_builtins.str] = None,
-                 on_lost_volume: Optional[_builtins.str] = None):
-        """
-        Whether the operator during reconcile procedure should drop replicas when replica is deleted or recreated
-
-
-        :param _builtins.str active: Whether the operator during reconcile procedure should drop active replicas when replica is deleted or recreated
-        :param _builtins.str on_delete: Whether the operator during reconcile procedure should drop replicas when replica is deleted
-        :param _builtins.str on_lost_volume: Whether the operator during reconcile procedure should drop replicas when replica volume is lost
-        """
-        if active is not None:
-            pulumi.set(__self__, "active", active)
-        if on_delete is not None:
-            pulumi.set(__self__, "on_delete", on_delete)
-        if on_lost_volume is not None:
-            pulumi.set(__self__, "on_lost_volume", on_lost_volume)
-
-    @_builtins.property
-    @pulumi.getter
-    def active(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should drop active replicas when replica is deleted or recreated
-        """
-        return pulumi.get(self, "active")
-
-    @_builtins.property
-    @pulumi.getter(name="onDelete")
-    def on_delete(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should drop replicas when replica is deleted
-        """
-        return pulumi.get(self, "on_delete")
-
-    @_builtins.property
-    @pulumi.getter(name="onLostVolume")
-    def on_lost_volume(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should drop replicas when replica volume is lost
-        """
-        return pulumi.get(self, "on_lost_volume")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostDropReplicasPatch(dict):
-    """
-    Whether the operator during reconcile procedure should drop replicas when replica is deleted or recreated
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "onDelete":
-            suggest = "on_delete"
-        elif key == "onLostVolume":
-            suggest = "on_lost_volume"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingHostDropReplicasPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingHostDropReplicasPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingHostDropReplicasPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 active: Optional[_builtins.str] = None,
-                 on_delete: Optional[_builtins.str] = None,
-                 on_lost_volume: Optional[_builtins.str] = None):
-        """
-        Whether the operator during reconcile procedure should drop replicas when replica is deleted or recreated
-
-
-        :param _builtins.str active: Whether the operator during reconcile procedure should drop active replicas when replica is deleted or recreated
-        :param _builtins.str on_delete: Whether the operator during reconcile procedure should drop replicas when replica is deleted
-        :param _builtins.str on_lost_volume: Whether the operator during reconcile procedure should drop replicas when replica volume is lost
-        """
-        if active is not None:
-            pulumi.set(__self__, "active", active)
-        if on_delete is not None:
-            pulumi.set(__self__, "on_delete", on_delete)
-        if on_lost_volume is not None:
-            pulumi.set(__self__, "on_lost_volume", on_lost_volume)
-
-    @_builtins.property
-    @pulumi.getter
-    def active(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should drop active replicas when replica is deleted or recreated
-        """
-        return pulumi.get(self, "active")
-
-    @_builtins.property
-    @pulumi.getter(name="onDelete")
-    def on_delete(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should drop replicas when replica is deleted
-        """
-        return pulumi.get(self, "on_delete")
-
-    @_builtins.property
-    @pulumi.getter(name="onLostVolume")
-    def on_lost_volume(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should drop replicas when replica volume is lost
-        """
-        return pulumi.get(self, "on_lost_volume")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostHooks(dict):
-    """
-    hooks to execute before and after host reconcile
-    """
-    def __init__(__self__, *,
-                 post: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcilingHostHooksPost']] = None,
-                 pre: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcilingHostHooksPre']] = None):
-        """
-        hooks to execute before and after host reconcile
-
-        :param Sequence['ClickHouseInstallationSpecReconcilingHostHooksPostArgs'] post: actions to execute after reconcile
-        :param Sequence['ClickHouseInstallationSpecReconcilingHostHooksPreArgs'] pre: actions to execute before reconcile
-        """
-        if post is not None:
-            pulumi.set(__self__, "post", post)
-        if pre is not None:
-            pulumi.set(__self__, "pre", pre)
-
-    @_builtins.property
-    @pulumi.getter
-    def post(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcilingHostHooksPost']]:
-        """
-        actions to execute after reconcile
-        """
-        return pulumi.get(self, "post")
-
-    @_builtins.property
-    @pulumi.getter
-    def pre(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcilingHostHooksPre']]:
-        """
-        actions to execute before reconcile
-        """
-        return pulumi.get(self, "pre")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostHooksPatch(dict):
-    """
-    hooks to execute before and after host reconcile
-    """
-    def __init__(__self__, *,
-                 post: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcilingHostHooksPostPatch']] = None,
-                 pre: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcilingHostHooksPrePatch']] = None):
-        """
-        hooks to execute before and after host reconcile
-
-        :param Sequence['ClickHouseInstallationSpecReconcilingHostHooksPostPatchArgs'] post: actions to execute after reconcile
-        :param Sequence['ClickHouseInstallationSpecReconcilingHostHooksPrePatchArgs'] pre: actions to execute before reconcile
-        """
-        if post is not None:
-            pulumi.set(__self__, "post", post)
-        if pre is not None:
-            pulumi.set(__self__, "pre", pre)
-
-    @_builtins.property
-    @pulumi.getter
-    def post(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcilingHostHooksPostPatch']]:
-        """
-        actions to execute after reconcile
-        """
-        return pulumi.get(self, "post")
-
-    @_builtins.property
-    @pulumi.getter
-    def pre(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcilingHostHooksPrePatch']]:
-        """
-        actions to execute before reconcile
-        """
-        return pulumi.get(self, "pre")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostHooksPost(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingHostHooksPost. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingHostHooksPost.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingHostHooksPost.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPostHttp'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPostShell'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPostSql'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-               The hook is skipped on any reconcile whose classifier does not emit at least one
-               of the listed events. Supported values:
-                 Any               - wildcard match: fires on every hook-evaluation point,
-                                     including the pre-delete sweep on the dying host
-                 HostCreate        - first reconcile that creates a host (no ancestor); best
-                                     paired with POST hooks because PRE hooks on first creation
-                                     are skipped (no live pod yet)
-                 HostUpdate        - reconcile that has prior state for the host; catch-all
-                                     for ongoing reconciles
-                 HostStart         - host transitions from stopped to running
-                 HostStop          - host is being stopped (current spec marks it stopped)
-                 HostConfigRestart - in-place software restart for a configuration change
-                 HostRollout       - pod-template change forces a StatefulSet rollout
-                 HostShutdown      - aggregate: fires whenever the pod is going down for any
-                                     reason (Stop, ConfigRestart, Rollout, or Delete)
-                 HostDelete        - host is being removed from the cluster (downsize); fires
-                                     on the dying host before tear-down. Always emitted
-                                     alongside HostShutdown.
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-               Ignore: error is logged and the reconcile continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-        The hook is skipped on any reconcile whose classifier does not emit at least one
-        of the listed events. Supported values:
-          Any               - wildcard match: fires on every hook-evaluation point,
-                              including the pre-delete sweep on the dying host
-          HostCreate        - first reconcile that creates a host (no ancestor); best
-                              paired with POST hooks because PRE hooks on first creation
-                              are skipped (no live pod yet)
-          HostUpdate        - reconcile that has prior state for the host; catch-all
-                              for ongoing reconciles
-          HostStart         - host transitions from stopped to running
-          HostStop          - host is being stopped (current spec marks it stopped)
-          HostConfigRestart - in-place software restart for a configuration change
-          HostRollout       - pod-template change forces a StatefulSet rollout
-          HostShutdown      - aggregate: fires whenever the pod is going down for any
-                              reason (Stop, ConfigRestart, Rollout, or Delete)
-          HostDelete        - host is being removed from the cluster (downsize); fires
-                              on the dying host before tear-down. Always emitted
-                              alongside HostShutdown.
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-        Ignore: error is logged and the reconcile continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPostHttp']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPostShell']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPostSql']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostHooksPostHttp(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostHooksPostHttpPatch(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostHooksPostPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingHostHooksPostPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingHostHooksPostPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingHostHooksPostPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPostHttpPatch'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPostShellPatch'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPostSqlPatch'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-               The hook is skipped on any reconcile whose classifier does not emit at least one
-               of the listed events. Supported values:
-                 Any               - wildcard match: fires on every hook-evaluation point,
-                                     including the pre-delete sweep on the dying host
-                 HostCreate        - first reconcile that creates a host (no ancestor); best
-                                     paired with POST hooks because PRE hooks on first creation
-                                     are skipped (no live pod yet)
-                 HostUpdate        - reconcile that has prior state for the host; catch-all
-                                     for ongoing reconciles
-                 HostStart         - host transitions from stopped to running
-                 HostStop          - host is being stopped (current spec marks it stopped)
-                 HostConfigRestart - in-place software restart for a configuration change
-                 HostRollout       - pod-template change forces a StatefulSet rollout
-                 HostShutdown      - aggregate: fires whenever the pod is going down for any
-                                     reason (Stop, ConfigRestart, Rollout, or Delete)
-                 HostDelete        - host is being removed from the cluster (downsize); fires
-                                     on the dying host before tear-down. Always emitted
-                                     alongside HostShutdown.
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-               Ignore: error is logged and the reconcile continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-        The hook is skipped on any reconcile whose classifier does not emit at least one
-        of the listed events. Supported values:
-          Any               - wildcard match: fires on every hook-evaluation point,
-                              including the pre-delete sweep on the dying host
-          HostCreate        - first reconcile that creates a host (no ancestor); best
-                              paired with POST hooks because PRE hooks on first creation
-                              are skipped (no live pod yet)
-          HostUpdate        - reconcile that has prior state for the host; catch-all
-                              for ongoing reconciles
-          HostStart         - host transitions from stopped to running
-          HostStop          - host is being stopped (current spec marks it stopped)
-          HostConfigRestart - in-place software restart for a configuration change
-          HostRollout       - pod-template change forces a StatefulSet rollout
-          HostShutdown      - aggregate: fires whenever the pod is going down for any
-                              reason (Stop, ConfigRestart, Rollout, or Delete)
-          HostDelete        - host is being removed from the cluster (downsize); fires
-                              on the dying host before tear-down. Always emitted
-                              alongside HostShutdown.
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-        Ignore: error is logged and the reconcile continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPostHttpPatch']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPostShellPatch']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPostSqlPatch']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostHooksPostShell(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostHooksPostShellPatch(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostHooksPostSql(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostHooksPostSqlPatch(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostHooksPre(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingHostHooksPre. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingHostHooksPre.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingHostHooksPre.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPreHttp'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPreShell'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPreSql'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-               The hook is skipped on any reconcile whose classifier does not emit at least one
-               of the listed events. Supported values:
-                 Any               - wildcard match: fires on every hook-evaluation point,
-                                     including the pre-delete sweep on the dying host
-                 HostCreate        - first reconcile that creates a host (no ancestor); best
-                                     paired with POST hooks because PRE hooks on first creation
-                                     are skipped (no live pod yet)
-                 HostUpdate        - reconcile that has prior state for the host; catch-all
-                                     for ongoing reconciles
-                 HostStart         - host transitions from stopped to running
-                 HostStop          - host is being stopped (current spec marks it stopped)
-                 HostConfigRestart - in-place software restart for a configuration change
-                 HostRollout       - pod-template change forces a StatefulSet rollout
-                 HostShutdown      - aggregate: fires whenever the pod is going down for any
-                                     reason (Stop, ConfigRestart, Rollout, or Delete)
-                 HostDelete        - host is being removed from the cluster (downsize); fires
-                                     on the dying host before tear-down. Always emitted
-                                     alongside HostShutdown.
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-               Ignore: error is logged and the reconcile continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-        The hook is skipped on any reconcile whose classifier does not emit at least one
-        of the listed events. Supported values:
-          Any               - wildcard match: fires on every hook-evaluation point,
-                              including the pre-delete sweep on the dying host
-          HostCreate        - first reconcile that creates a host (no ancestor); best
-                              paired with POST hooks because PRE hooks on first creation
-                              are skipped (no live pod yet)
-          HostUpdate        - reconcile that has prior state for the host; catch-all
-                              for ongoing reconciles
-          HostStart         - host transitions from stopped to running
-          HostStop          - host is being stopped (current spec marks it stopped)
-          HostConfigRestart - in-place software restart for a configuration change
-          HostRollout       - pod-template change forces a StatefulSet rollout
-          HostShutdown      - aggregate: fires whenever the pod is going down for any
-                              reason (Stop, ConfigRestart, Rollout, or Delete)
-          HostDelete        - host is being removed from the cluster (downsize); fires
-                              on the dying host before tear-down. Always emitted
-                              alongside HostShutdown.
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-        Ignore: error is logged and the reconcile continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPreHttp']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPreShell']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPreSql']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostHooksPreHttp(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostHooksPreHttpPatch(dict):
-    def __init__(__self__, *,
-                 method: Optional[_builtins.str] = None,
-                 url: Optional[_builtins.str] = None):
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if url is not None:
-            pulumi.set(__self__, "url", url)
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter
-    def url(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "url")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostHooksPrePatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "failurePolicy":
-            suggest = "failure_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingHostHooksPrePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingHostHooksPrePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingHostHooksPrePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 events: Optional[Sequence[_builtins.str]] = None,
-                 failure_policy: Optional[_builtins.str] = None,
-                 http: Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPreHttpPatch'] = None,
-                 shell: Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPreShellPatch'] = None,
-                 sql: Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPreSqlPatch'] = None,
-                 target: Optional[_builtins.str] = None):
-        """
-        :param Sequence[_builtins.str] events: Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-               The hook is skipped on any reconcile whose classifier does not emit at least one
-               of the listed events. Supported values:
-                 Any               - wildcard match: fires on every hook-evaluation point,
-                                     including the pre-delete sweep on the dying host
-                 HostCreate        - first reconcile that creates a host (no ancestor); best
-                                     paired with POST hooks because PRE hooks on first creation
-                                     are skipped (no live pod yet)
-                 HostUpdate        - reconcile that has prior state for the host; catch-all
-                                     for ongoing reconciles
-                 HostStart         - host transitions from stopped to running
-                 HostStop          - host is being stopped (current spec marks it stopped)
-                 HostConfigRestart - in-place software restart for a configuration change
-                 HostRollout       - pod-template change forces a StatefulSet rollout
-                 HostShutdown      - aggregate: fires whenever the pod is going down for any
-                                     reason (Stop, ConfigRestart, Rollout, or Delete)
-                 HostDelete        - host is being removed from the cluster (downsize); fires
-                                     on the dying host before tear-down. Always emitted
-                                     alongside HostShutdown.
-        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
-               Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-               Ignore: error is logged and the reconcile continues.
-        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        if events is not None:
-            pulumi.set(__self__, "events", events)
-        if failure_policy is not None:
-            pulumi.set(__self__, "failure_policy", failure_policy)
-        if http is not None:
-            pulumi.set(__self__, "http", http)
-        if shell is not None:
-            pulumi.set(__self__, "shell", shell)
-        if sql is not None:
-            pulumi.set(__self__, "sql", sql)
-        if target is not None:
-            pulumi.set(__self__, "target", target)
-
-    @_builtins.property
-    @pulumi.getter
-    def events(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Reconcile lifecycle events that trigger this hook. Required, must be non-empty.
-        The hook is skipped on any reconcile whose classifier does not emit at least one
-        of the listed events. Supported values:
-          Any               - wildcard match: fires on every hook-evaluation point,
-                              including the pre-delete sweep on the dying host
-          HostCreate        - first reconcile that creates a host (no ancestor); best
-                              paired with POST hooks because PRE hooks on first creation
-                              are skipped (no live pod yet)
-          HostUpdate        - reconcile that has prior state for the host; catch-all
-                              for ongoing reconciles
-          HostStart         - host transitions from stopped to running
-          HostStop          - host is being stopped (current spec marks it stopped)
-          HostConfigRestart - in-place software restart for a configuration change
-          HostRollout       - pod-template change forces a StatefulSet rollout
-          HostShutdown      - aggregate: fires whenever the pod is going down for any
-                              reason (Stop, ConfigRestart, Rollout, or Delete)
-          HostDelete        - host is being removed from the cluster (downsize); fires
-                              on the dying host before tear-down. Always emitted
-                              alongside HostShutdown.
-        """
-        return pulumi.get(self, "events")
-
-    @_builtins.property
-    @pulumi.getter(name="failurePolicy")
-    def failure_policy(self) -> Optional[_builtins.str]:
-        """
-        Controls what happens when this hook returns an error.
-        Fail (default): error propagates — pre-hook aborts reconcile / host deletion.
-        Ignore: error is logged and the reconcile continues.
-        """
-        return pulumi.get(self, "failure_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def http(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPreHttpPatch']:
-        return pulumi.get(self, "http")
-
-    @_builtins.property
-    @pulumi.getter
-    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPreShellPatch']:
-        return pulumi.get(self, "shell")
-
-    @_builtins.property
-    @pulumi.getter
-    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPreSqlPatch']:
-        return pulumi.get(self, "sql")
-
-    @_builtins.property
-    @pulumi.getter
-    def target(self) -> Optional[_builtins.str]:
-        """
-        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
-        """
-        return pulumi.get(self, "target")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostHooksPreShell(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostHooksPreShellPatch(dict):
-    def __init__(__self__, *,
-                 command: Optional[Sequence[_builtins.str]] = None,
-                 container: Optional[_builtins.str] = None):
-        if command is not None:
-            pulumi.set(__self__, "command", command)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-
-    @_builtins.property
-    @pulumi.getter
-    def command(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "command")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostHooksPreSql(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostHooksPreSqlPatch(dict):
-    def __init__(__self__, *,
-                 queries: Optional[Sequence[_builtins.str]] = None):
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "queries")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostPatch(dict):
-    """
-    Whether the operator during reconcile procedure should wait for a ClickHouse host:
-      - to be excluded from a ClickHouse cluster
-      - to complete all running queries
-      - to be included into a ClickHouse cluster
-    respectfully before moving forward
-    """
-    def __init__(__self__, *,
-                 drop: Optional['outputs.ClickHouseInstallationSpecReconcilingHostDropPatch'] = None,
-                 hooks: Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPatch'] = None,
-                 wait: Optional['outputs.ClickHouseInstallationSpecReconcilingHostWaitPatch'] = None):
-        """
-        Whether the operator during reconcile procedure should wait for a ClickHouse host:
-          - to be excluded from a ClickHouse cluster
-          - to complete all running queries
-          - to be included into a ClickHouse cluster
-        respectfully before moving forward
-        """
-        if drop is not None:
-            pulumi.set(__self__, "drop", drop)
-        if hooks is not None:
-            pulumi.set(__self__, "hooks", hooks)
-        if wait is not None:
-            pulumi.set(__self__, "wait", wait)
-
-    @_builtins.property
-    @pulumi.getter
-    def drop(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostDropPatch']:
-        return pulumi.get(self, "drop")
-
-    @_builtins.property
-    @pulumi.getter
-    def hooks(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostHooksPatch']:
-        return pulumi.get(self, "hooks")
-
-    @_builtins.property
-    @pulumi.getter
-    def wait(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostWaitPatch']:
-        return pulumi.get(self, "wait")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostWait(dict):
-    def __init__(__self__, *,
-                 exclude: Optional[_builtins.str] = None,
-                 include: Optional[_builtins.str] = None,
-                 probes: Optional['outputs.ClickHouseInstallationSpecReconcilingHostWaitProbes'] = None,
-                 queries: Optional[_builtins.str] = None,
-                 replicas: Optional['outputs.ClickHouseInstallationSpecReconcilingHostWaitReplicas'] = None):
-        """
-        :param _builtins.str exclude: Allows to stop all ClickHouse clusters defined in a CHI.
-               Works as the following:
-                - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
-                - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
-        :param _builtins.str include: Whether the operator during reconcile procedure should wait for a ClickHouse host to be included into a ClickHouse cluster
-        :param _builtins.str queries: Whether the operator during reconcile procedure should wait for a ClickHouse host to complete all running queries
-        """
-        if exclude is not None:
-            pulumi.set(__self__, "exclude", exclude)
-        if include is not None:
-            pulumi.set(__self__, "include", include)
-        if probes is not None:
-            pulumi.set(__self__, "probes", probes)
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-        if replicas is not None:
-            pulumi.set(__self__, "replicas", replicas)
-
-    @_builtins.property
-    @pulumi.getter
-    def exclude(self) -> Optional[_builtins.str]:
-        """
-        Allows to stop all ClickHouse clusters defined in a CHI.
-        Works as the following:
-         - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
-         - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
-        """
-        return pulumi.get(self, "exclude")
-
-    @_builtins.property
-    @pulumi.getter
-    def include(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for a ClickHouse host to be included into a ClickHouse cluster
-        """
-        return pulumi.get(self, "include")
-
-    @_builtins.property
-    @pulumi.getter
-    def probes(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostWaitProbes']:
-        return pulumi.get(self, "probes")
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for a ClickHouse host to complete all running queries
-        """
-        return pulumi.get(self, "queries")
-
-    @_builtins.property
-    @pulumi.getter
-    def replicas(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostWaitReplicas']:
-        return pulumi.get(self, "replicas")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostWaitPatch(dict):
-    def __init__(__self__, *,
-                 exclude: Optional[_builtins.str] = None,
-                 include: Optional[_builtins.str] = None,
-                 probes: Optional['outputs.ClickHouseInstallationSpecReconcilingHostWaitProbesPatch'] = None,
-                 queries: Optional[_builtins.str] = None,
-                 replicas: Optional['outputs.ClickHouseInstallationSpecReconcilingHostWaitReplicasPatch'] = None):
-        """
-        :param _builtins.str exclude: Allows to stop all ClickHouse clusters defined in a CHI.
-               Works as the following:
-                - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
-                - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
-        :param _builtins.str include: Whether the operator during reconcile procedure should wait for a ClickHouse host to be included into a ClickHouse cluster
-        :param _builtins.str queries: Whether the operator during reconcile procedure should wait for a ClickHouse host to complete all running queries
-        """
-        if exclude is not None:
-            pulumi.set(__self__, "exclude", exclude)
-        if include is not None:
-            pulumi.set(__self__, "include", include)
-        if probes is not None:
-            pulumi.set(__self__, "probes", probes)
-        if queries is not None:
-            pulumi.set(__self__, "queries", queries)
-        if replicas is not None:
-            pulumi.set(__self__, "replicas", replicas)
-
-    @_builtins.property
-    @pulumi.getter
-    def exclude(self) -> Optional[_builtins.str]:
-        """
-        Allows to stop all ClickHouse clusters defined in a CHI.
-        Works as the following:
-         - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
-         - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
-        """
-        return pulumi.get(self, "exclude")
-
-    @_builtins.property
-    @pulumi.getter
-    def include(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for a ClickHouse host to be included into a ClickHouse cluster
-        """
-        return pulumi.get(self, "include")
-
-    @_builtins.property
-    @pulumi.getter
-    def probes(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostWaitProbesPatch']:
-        return pulumi.get(self, "probes")
-
-    @_builtins.property
-    @pulumi.getter
-    def queries(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for a ClickHouse host to complete all running queries
-        """
-        return pulumi.get(self, "queries")
-
-    @_builtins.property
-    @pulumi.getter
-    def replicas(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostWaitReplicasPatch']:
-        return pulumi.get(self, "replicas")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostWaitProbes(dict):
-    """
-    What probes the operator should wait during host launch procedure
-    """
-    def __init__(__self__, *,
-                 readiness: Optional[_builtins.str] = None,
-                 startup: Optional[_builtins.str] = None):
-        """
-        What probes the operator should wait during host launch procedure
-
-        :param _builtins.str readiness: Whether the operator during host launch procedure should wait for ready probe to succeed.
-               In case probe is unspecified wait is assumed to be completed successfully.
-               Default option value is to wait.
-        :param _builtins.str startup: Whether the operator during host launch procedure should wait for startup probe to succeed.
-               In case probe is unspecified wait is assumed to be completed successfully.
-               Default option value is to do not wait.
-        """
-        if readiness is not None:
-            pulumi.set(__self__, "readiness", readiness)
-        if startup is not None:
-            pulumi.set(__self__, "startup", startup)
-
-    @_builtins.property
-    @pulumi.getter
-    def readiness(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during host launch procedure should wait for ready probe to succeed.
-        In case probe is unspecified wait is assumed to be completed successfully.
-        Default option value is to wait.
-        """
-        return pulumi.get(self, "readiness")
-
-    @_builtins.property
-    @pulumi.getter
-    def startup(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during host launch procedure should wait for startup probe to succeed.
-        In case probe is unspecified wait is assumed to be completed successfully.
-        Default option value is to do not wait.
-        """
-        return pulumi.get(self, "startup")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostWaitProbesPatch(dict):
-    """
-    What probes the operator should wait during host launch procedure
-    """
-    def __init__(__self__, *,
-                 readiness: Optional[_builtins.str] = None,
-                 startup: Optional[_builtins.str] = None):
-        """
-        What probes the operator should wait during host launch procedure
-
-        :param _builtins.str readiness: Whether the operator during host launch procedure should wait for ready probe to succeed.
-               In case probe is unspecified wait is assumed to be completed successfully.
-               Default option value is to wait.
-        :param _builtins.str startup: Whether the operator during host launch procedure should wait for startup probe to succeed.
-               In case probe is unspecified wait is assumed to be completed successfully.
-               Default option value is to do not wait.
-        """
-        if readiness is not None:
-            pulumi.set(__self__, "readiness", readiness)
-        if startup is not None:
-            pulumi.set(__self__, "startup", startup)
-
-    @_builtins.property
-    @pulumi.getter
-    def readiness(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during host launch procedure should wait for ready probe to succeed.
-        In case probe is unspecified wait is assumed to be completed successfully.
-        Default option value is to wait.
-        """
-        return pulumi.get(self, "readiness")
-
-    @_builtins.property
-    @pulumi.getter
-    def startup(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during host launch procedure should wait for startup probe to succeed.
-        In case probe is unspecified wait is assumed to be completed successfully.
-        Default option value is to do not wait.
-        """
-        return pulumi.get(self, "startup")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostWaitReplicas(dict):
-    """
-    Whether the operator during reconcile procedure should wait for replicas to catch-up
-    """
-    def __init__(__self__, *,
-                 all: Optional[_builtins.str] = None,
-                 delay: Optional[_builtins.int] = None,
-                 new: Optional[_builtins.str] = None):
-        """
-        Whether the operator during reconcile procedure should wait for replicas to catch-up
-
-        :param _builtins.str all: Whether the operator during reconcile procedure should wait for all replicas to catch-up
-        :param _builtins.int delay: replication max absolute delay to consider replica is not delayed
-        :param _builtins.str new: Whether the operator during reconcile procedure should wait for new replicas to catch-up
-        """
-        if all is not None:
-            pulumi.set(__self__, "all", all)
-        if delay is not None:
-            pulumi.set(__self__, "delay", delay)
-        if new is not None:
-            pulumi.set(__self__, "new", new)
-
-    @_builtins.property
-    @pulumi.getter
-    def all(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for all replicas to catch-up
-        """
-        return pulumi.get(self, "all")
-
-    @_builtins.property
-    @pulumi.getter
-    def delay(self) -> Optional[_builtins.int]:
-        """
-        replication max absolute delay to consider replica is not delayed
-        """
-        return pulumi.get(self, "delay")
-
-    @_builtins.property
-    @pulumi.getter
-    def new(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for new replicas to catch-up
-        """
-        return pulumi.get(self, "new")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingHostWaitReplicasPatch(dict):
-    """
-    Whether the operator during reconcile procedure should wait for replicas to catch-up
-    """
-    def __init__(__self__, *,
-                 all: Optional[_builtins.str] = None,
-                 delay: Optional[_builtins.int] = None,
-                 new: Optional[_builtins.str] = None):
-        """
-        Whether the operator during reconcile procedure should wait for replicas to catch-up
-
-        :param _builtins.str all: Whether the operator during reconcile procedure should wait for all replicas to catch-up
-        :param _builtins.int delay: replication max absolute delay to consider replica is not delayed
-        :param _builtins.str new: Whether the operator during reconcile procedure should wait for new replicas to catch-up
-        """
-        if all is not None:
-            pulumi.set(__self__, "all", all)
-        if delay is not None:
-            pulumi.set(__self__, "delay", delay)
-        if new is not None:
-            pulumi.set(__self__, "new", new)
-
-    @_builtins.property
-    @pulumi.getter
-    def all(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for all replicas to catch-up
-        """
-        return pulumi.get(self, "all")
-
-    @_builtins.property
-    @pulumi.getter
-    def delay(self) -> Optional[_builtins.int]:
-        """
-        replication max absolute delay to consider replica is not delayed
-        """
-        return pulumi.get(self, "delay")
-
-    @_builtins.property
-    @pulumi.getter
-    def new(self) -> Optional[_builtins.str]:
-        """
-        Whether the operator during reconcile procedure should wait for new replicas to catch-up
-        """
-        return pulumi.get(self, "new")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingMacros(dict):
-    """
-    macros parameters
-    """
-    def __init__(__self__, *,
-                 sections: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSections'] = None):
-        """
-        macros parameters
-        """
-        if sections is not None:
-            pulumi.set(__self__, "sections", sections)
-
-    @_builtins.property
-    @pulumi.getter
-    def sections(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSections']:
-        return pulumi.get(self, "sections")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingMacrosPatch(dict):
-    """
-    macros parameters
-    """
-    def __init__(__self__, *,
-                 sections: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsPatch'] = None):
-        """
-        macros parameters
-        """
-        if sections is not None:
-            pulumi.set(__self__, "sections", sections)
-
-    @_builtins.property
-    @pulumi.getter
-    def sections(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsPatch']:
-        return pulumi.get(self, "sections")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingMacrosSections(dict):
-    """
-    sections behaviour for macros
-    """
-    def __init__(__self__, *,
-                 files: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsFiles'] = None,
-                 profiles: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsProfiles'] = None,
-                 quotas: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsQuotas'] = None,
-                 settings: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsSettings'] = None,
-                 users: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsUsers'] = None):
-        """
-        sections behaviour for macros
-        """
-        if files is not None:
-            pulumi.set(__self__, "files", files)
-        if profiles is not None:
-            pulumi.set(__self__, "profiles", profiles)
-        if quotas is not None:
-            pulumi.set(__self__, "quotas", quotas)
-        if settings is not None:
-            pulumi.set(__self__, "settings", settings)
-        if users is not None:
-            pulumi.set(__self__, "users", users)
-
-    @_builtins.property
-    @pulumi.getter
-    def files(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsFiles']:
-        return pulumi.get(self, "files")
-
-    @_builtins.property
-    @pulumi.getter
-    def profiles(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsProfiles']:
-        return pulumi.get(self, "profiles")
-
-    @_builtins.property
-    @pulumi.getter
-    def quotas(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsQuotas']:
-        return pulumi.get(self, "quotas")
-
-    @_builtins.property
-    @pulumi.getter
-    def settings(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsSettings']:
-        return pulumi.get(self, "settings")
-
-    @_builtins.property
-    @pulumi.getter
-    def users(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsUsers']:
-        return pulumi.get(self, "users")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingMacrosSectionsFiles(dict):
-    """
-    sections behaviour for macros on files
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on files
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatch(dict):
-    """
-    sections behaviour for macros on files
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on files
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingMacrosSectionsPatch(dict):
-    """
-    sections behaviour for macros
-    """
-    def __init__(__self__, *,
-                 files: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatch'] = None,
-                 profiles: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatch'] = None,
-                 quotas: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatch'] = None,
-                 settings: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatch'] = None,
-                 users: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatch'] = None):
-        """
-        sections behaviour for macros
-        """
-        if files is not None:
-            pulumi.set(__self__, "files", files)
-        if profiles is not None:
-            pulumi.set(__self__, "profiles", profiles)
-        if quotas is not None:
-            pulumi.set(__self__, "quotas", quotas)
-        if settings is not None:
-            pulumi.set(__self__, "settings", settings)
-        if users is not None:
-            pulumi.set(__self__, "users", users)
-
-    @_builtins.property
-    @pulumi.getter
-    def files(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatch']:
-        return pulumi.get(self, "files")
-
-    @_builtins.property
-    @pulumi.getter
-    def profiles(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatch']:
-        return pulumi.get(self, "profiles")
-
-    @_builtins.property
-    @pulumi.getter
-    def quotas(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatch']:
-        return pulumi.get(self, "quotas")
-
-    @_builtins.property
-    @pulumi.getter
-    def settings(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatch']:
-        return pulumi.get(self, "settings")
-
-    @_builtins.property
-    @pulumi.getter
-    def users(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatch']:
-        return pulumi.get(self, "users")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingMacrosSectionsProfiles(dict):
-    """
-    sections behaviour for macros on profiles
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on profiles
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatch(dict):
-    """
-    sections behaviour for macros on profiles
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on profiles
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingMacrosSectionsQuotas(dict):
-    """
-    sections behaviour for macros on quotas
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on quotas
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatch(dict):
-    """
-    sections behaviour for macros on quotas
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on quotas
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingMacrosSectionsSettings(dict):
-    """
-    sections behaviour for macros on settings
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on settings
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatch(dict):
-    """
-    sections behaviour for macros on settings
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on settings
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingMacrosSectionsUsers(dict):
-    """
-    sections behaviour for macros on users
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on users
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatch(dict):
-    """
-    sections behaviour for macros on users
-    """
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.str] = None):
-        """
-        sections behaviour for macros on users
-
-        :param _builtins.str enabled: enabled or not
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.str]:
-        """
-        enabled or not
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingPatch(dict):
-    """
-    [OBSOLETED] Optional, allows tuning reconciling cycle for ClickhouseInstallation from clickhouse-operator side
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMapPropagationTimeout":
-            suggest = "config_map_propagation_timeout"
-        elif key == "statefulSet":
-            suggest = "stateful_set"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cleanup: Optional['outputs.ClickHouseInstallationSpecReconcilingCleanupPatch'] = None,
-                 cluster: Optional['outputs.ClickHouseInstallationSpecReconcilingClusterPatch'] = None,
-                 config_map_propagation_timeout: Optional[_builtins.int] = None,
-                 host: Optional['outputs.ClickHouseInstallationSpecReconcilingHostPatch'] = None,
-                 macros: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosPatch'] = None,
-                 policy: Optional[_builtins.str] = None,
-                 runtime: Optional['outputs.ClickHouseInstallationSpecReconcilingRuntimePatch'] = None,
-                 stateful_set: Optional['outputs.ClickHouseInstallationSpecReconcilingStatefulSetPatch'] = None):
-        """
-        [OBSOLETED] Optional, allows tuning reconciling cycle for ClickhouseInstallation from clickhouse-operator side
-
-        :param _builtins.int config_map_propagation_timeout: Timeout in seconds for `clickhouse-operator` to wait for modified `ConfigMap` to propagate into the `Pod`
-               More details: https://kubernetes.io/docs/concepts/configuration/configmap/#mounted-configmaps-are-updated-automatically
-        :param _builtins.str policy: DISCUSSED TO BE DEPRECATED
-               Syntax sugar
-               Overrides all three 'reconcile.host.wait.{exclude, queries, include}' values from the operator's config
-               Possible values:
-                - wait - should wait to exclude host, complete queries and include host back into the cluster
-                - nowait - should NOT wait to exclude host, complete queries and include host back into the cluster
-        """
-        if cleanup is not None:
-            pulumi.set(__self__, "cleanup", cleanup)
-        if cluster is not None:
-            pulumi.set(__self__, "cluster", cluster)
-        if config_map_propagation_timeout is not None:
-            pulumi.set(__self__, "config_map_propagation_timeout", config_map_propagation_timeout)
-        if host is not None:
-            pulumi.set(__self__, "host", host)
-        if macros is not None:
-            pulumi.set(__self__, "macros", macros)
-        if policy is not None:
-            pulumi.set(__self__, "policy", policy)
-        if runtime is not None:
-            pulumi.set(__self__, "runtime", runtime)
-        if stateful_set is not None:
-            pulumi.set(__self__, "stateful_set", stateful_set)
-
-    @_builtins.property
-    @pulumi.getter
-    def cleanup(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingCleanupPatch']:
-        return pulumi.get(self, "cleanup")
-
-    @_builtins.property
-    @pulumi.getter
-    def cluster(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingClusterPatch']:
-        return pulumi.get(self, "cluster")
-
-    @_builtins.property
-    @pulumi.getter(name="configMapPropagationTimeout")
-    def config_map_propagation_timeout(self) -> Optional[_builtins.int]:
-        """
-        Timeout in seconds for `clickhouse-operator` to wait for modified `ConfigMap` to propagate into the `Pod`
-        More details: https://kubernetes.io/docs/concepts/configuration/configmap/#mounted-configmaps-are-updated-automatically
-        """
-        return pulumi.get(self, "config_map_propagation_timeout")
-
-    @_builtins.property
-    @pulumi.getter
-    def host(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingHostPatch']:
-        return pulumi.get(self, "host")
-
-    @_builtins.property
-    @pulumi.getter
-    def macros(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosPatch']:
-        return pulumi.get(self, "macros")
-
-    @_builtins.property
-    @pulumi.getter
-    def policy(self) -> Optional[_builtins.str]:
-        """
-        DISCUSSED TO BE DEPRECATED
-        Syntax sugar
-        Overrides all three 'reconcile.host.wait.{exclude, queries, include}' values from the operator's config
-        Possible values:
-         - wait - should wait to exclude host, complete queries and include host back into the cluster
-         - nowait - should NOT wait to exclude host, complete queries and include host back into the cluster
-        """
-        return pulumi.get(self, "policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def runtime(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingRuntimePatch']:
-        return pulumi.get(self, "runtime")
-
-    @_builtins.property
-    @pulumi.getter(name="statefulSet")
-    def stateful_set(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingStatefulSetPatch']:
-        return pulumi.get(self, "stateful_set")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingRuntime(dict):
-    """
-    runtime parameters for clickhouse-operator process which are used during reconcile cycle
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "reconcileShardsMaxConcurrencyPercent":
-            suggest = "reconcile_shards_max_concurrency_percent"
-        elif key == "reconcileShardsThreadsNumber":
-            suggest = "reconcile_shards_threads_number"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingRuntime. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingRuntime.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingRuntime.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 reconcile_shards_max_concurrency_percent: Optional[_builtins.int] = None,
-                 reconcile_shards_threads_number: Optional[_builtins.int] = None):
-        """
-        runtime parameters for clickhouse-operator process which are used during reconcile cycle
-
-        :param _builtins.int reconcile_shards_max_concurrency_percent: The maximum percentage of cluster shards that may be reconciled in parallel, 50 percent by default.
-        :param _builtins.int reconcile_shards_threads_number: The maximum number of cluster shards that may be reconciled in parallel, 1 by default
-        """
-        if reconcile_shards_max_concurrency_percent is not None:
-            pulumi.set(__self__, "reconcile_shards_max_concurrency_percent", reconcile_shards_max_concurrency_percent)
-        if reconcile_shards_threads_number is not None:
-            pulumi.set(__self__, "reconcile_shards_threads_number", reconcile_shards_threads_number)
-
-    @_builtins.property
-    @pulumi.getter(name="reconcileShardsMaxConcurrencyPercent")
-    def reconcile_shards_max_concurrency_percent(self) -> Optional[_builtins.int]:
-        """
-        The maximum percentage of cluster shards that may be reconciled in parallel, 50 percent by default.
-        """
-        return pulumi.get(self, "reconcile_shards_max_concurrency_percent")
-
-    @_builtins.property
-    @pulumi.getter(name="reconcileShardsThreadsNumber")
-    def reconcile_shards_threads_number(self) -> Optional[_builtins.int]:
-        """
-        The maximum number of cluster shards that may be reconciled in parallel, 1 by default
-        """
-        return pulumi.get(self, "reconcile_shards_threads_number")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingRuntimePatch(dict):
-    """
-    runtime parameters for clickhouse-operator process which are used during reconcile cycle
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "reconcileShardsMaxConcurrencyPercent":
-            suggest = "reconcile_shards_max_concurrency_percent"
-        elif key == "reconcileShardsThreadsNumber":
-            suggest = "reconcile_shards_threads_number"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingRuntimePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingRuntimePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingRuntimePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 reconcile_shards_max_concurrency_percent: Optional[_builtins.int] = None,
-                 reconcile_shards_threads_number: Optional[_builtins.int] = None):
-        """
-        runtime parameters for clickhouse-operator process which are used during reconcile cycle
-
-        :param _builtins.int reconcile_shards_max_concurrency_percent: The maximum percentage of cluster shards that may be reconciled in parallel, 50 percent by default.
-        :param _builtins.int reconcile_shards_threads_number: The maximum number of cluster shards that may be reconciled in parallel, 1 by default
-        """
-        if reconcile_shards_max_concurrency_percent is not None:
-            pulumi.set(__self__, "reconcile_shards_max_concurrency_percent", reconcile_shards_max_concurrency_percent)
-        if reconcile_shards_threads_number is not None:
-            pulumi.set(__self__, "reconcile_shards_threads_number", reconcile_shards_threads_number)
-
-    @_builtins.property
-    @pulumi.getter(name="reconcileShardsMaxConcurrencyPercent")
-    def reconcile_shards_max_concurrency_percent(self) -> Optional[_builtins.int]:
-        """
-        The maximum percentage of cluster shards that may be reconciled in parallel, 50 percent by default.
-        """
-        return pulumi.get(self, "reconcile_shards_max_concurrency_percent")
-
-    @_builtins.property
-    @pulumi.getter(name="reconcileShardsThreadsNumber")
-    def reconcile_shards_threads_number(self) -> Optional[_builtins.int]:
-        """
-        The maximum number of cluster shards that may be reconciled in parallel, 1 by default
-        """
-        return pulumi.get(self, "reconcile_shards_threads_number")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingStatefulSet(dict):
-    """
-    Optional, StatefulSet reconcile behavior tuning
-    """
-    def __init__(__self__, *,
-                 create: Optional['outputs.ClickHouseInstallationSpecReconcilingStatefulSetCreate'] = None,
-                 recreate: Optional['outputs.ClickHouseInstallationSpecReconcilingStatefulSetRecreate'] = None,
-                 update: Optional['outputs.ClickHouseInstallationSpecReconcilingStatefulSetUpdate'] = None):
-        """
-        Optional, StatefulSet reconcile behavior tuning
-        """
-        if create is not None:
-            pulumi.set(__self__, "create", create)
-        if recreate is not None:
-            pulumi.set(__self__, "recreate", recreate)
-        if update is not None:
-            pulumi.set(__self__, "update", update)
-
-    @_builtins.property
-    @pulumi.getter
-    def create(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingStatefulSetCreate']:
-        return pulumi.get(self, "create")
-
-    @_builtins.property
-    @pulumi.getter
-    def recreate(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingStatefulSetRecreate']:
-        return pulumi.get(self, "recreate")
-
-    @_builtins.property
-    @pulumi.getter
-    def update(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingStatefulSetUpdate']:
-        return pulumi.get(self, "update")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingStatefulSetCreate(dict):
-    """
-    Behavior during create StatefulSet
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "onFailure":
-            suggest = "on_failure"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingStatefulSetCreate. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingStatefulSetCreate.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingStatefulSetCreate.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 on_failure: Optional[_builtins.str] = None):
-        """
-        Behavior during create StatefulSet
-
-        :param _builtins.str on_failure: What to do in case created StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
-               Possible options:
-               1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
-               2. delete - delete newly created problematic StatefulSet and follow 'abort' path afterwards.
-               3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
-        """
-        if on_failure is not None:
-            pulumi.set(__self__, "on_failure", on_failure)
-
-    @_builtins.property
-    @pulumi.getter(name="onFailure")
-    def on_failure(self) -> Optional[_builtins.str]:
-        """
-        What to do in case created StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
-        Possible options:
-        1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
-        2. delete - delete newly created problematic StatefulSet and follow 'abort' path afterwards.
-        3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
-        """
-        return pulumi.get(self, "on_failure")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingStatefulSetCreatePatch(dict):
-    """
-    Behavior during create StatefulSet
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "onFailure":
-            suggest = "on_failure"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingStatefulSetCreatePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingStatefulSetCreatePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingStatefulSetCreatePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 on_failure: Optional[_builtins.str] = None):
-        """
-        Behavior during create StatefulSet
-
-        :param _builtins.str on_failure: What to do in case created StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
-               Possible options:
-               1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
-               2. delete - delete newly created problematic StatefulSet and follow 'abort' path afterwards.
-               3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
-        """
-        if on_failure is not None:
-            pulumi.set(__self__, "on_failure", on_failure)
-
-    @_builtins.property
-    @pulumi.getter(name="onFailure")
-    def on_failure(self) -> Optional[_builtins.str]:
-        """
-        What to do in case created StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
-        Possible options:
-        1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
-        2. delete - delete newly created problematic StatefulSet and follow 'abort' path afterwards.
-        3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
-        """
-        return pulumi.get(self, "on_failure")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingStatefulSetPatch(dict):
-    """
-    Optional, StatefulSet reconcile behavior tuning
-    """
-    def __init__(__self__, *,
-                 create: Optional['outputs.ClickHouseInstallationSpecReconcilingStatefulSetCreatePatch'] = None,
-                 recreate: Optional['outputs.ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatch'] = None,
-                 update: Optional['outputs.ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatch'] = None):
-        """
-        Optional, StatefulSet reconcile behavior tuning
-        """
-        if create is not None:
-            pulumi.set(__self__, "create", create)
-        if recreate is not None:
-            pulumi.set(__self__, "recreate", recreate)
-        if update is not None:
-            pulumi.set(__self__, "update", update)
-
-    @_builtins.property
-    @pulumi.getter
-    def create(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingStatefulSetCreatePatch']:
-        return pulumi.get(self, "create")
-
-    @_builtins.property
-    @pulumi.getter
-    def recreate(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatch']:
-        return pulumi.get(self, "recreate")
-
-    @_builtins.property
-    @pulumi.getter
-    def update(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatch']:
-        return pulumi.get(self, "update")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingStatefulSetRecreate(dict):
-    """
-    Behavior during recreate StatefulSet
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "onDataLoss":
-            suggest = "on_data_loss"
-        elif key == "onUpdateFailure":
-            suggest = "on_update_failure"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingStatefulSetRecreate. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingStatefulSetRecreate.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingStatefulSetRecreate.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 on_data_loss: Optional[_builtins.str] = None,
-                 on_update_failure: Optional[_builtins.str] = None):
-        """
-        Behavior during recreate StatefulSet
-
-        :param _builtins.str on_data_loss: What to do in case operator needs to recreate StatefulSet due to PVC data loss or missing volumes.
-               Possible options:
-               1. abort - abort the process, do nothing with the problematic StatefulSet.
-               2. recreate - proceed and recreate StatefulSet.
-        :param _builtins.str on_update_failure: What to do in case operator needs to recreate StatefulSet due to update failure or StatefulSet not ready.
-               Possible options:
-               1. abort - abort the process, do nothing with the problematic StatefulSet.
-               2. recreate - proceed and recreate StatefulSet.
-        """
-        if on_data_loss is not None:
-            pulumi.set(__self__, "on_data_loss", on_data_loss)
-        if on_update_failure is not None:
-            pulumi.set(__self__, "on_update_failure", on_update_failure)
-
-    @_builtins.property
-    @pulumi.getter(name="onDataLoss")
-    def on_data_loss(self) -> Optional[_builtins.str]:
-        """
-        What to do in case operator needs to recreate StatefulSet due to PVC data loss or missing volumes.
-        Possible options:
-        1. abort - abort the process, do nothing with the problematic StatefulSet.
-        2. recreate - proceed and recreate StatefulSet.
-        """
-        return pulumi.get(self, "on_data_loss")
-
-    @_builtins.property
-    @pulumi.getter(name="onUpdateFailure")
-    def on_update_failure(self) -> Optional[_builtins.str]:
-        """
-        What to do in case operator needs to recreate StatefulSet due to update failure or StatefulSet not ready.
-        Possible options:
-        1. abort - abort the process, do nothing with the problematic StatefulSet.
-        2. recreate - proceed and recreate StatefulSet.
-        """
-        return pulumi.get(self, "on_update_failure")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatch(dict):
-    """
-    Behavior during recreate StatefulSet
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "onDataLoss":
-            suggest = "on_data_loss"
-        elif key == "onUpdateFailure":
-            suggest = "on_update_failure"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 on_data_loss: Optional[_builtins.str] = None,
-                 on_update_failure: Optional[_builtins.str] = None):
-        """
-        Behavior during recreate StatefulSet
-
-        :param _builtins.str on_data_loss: What to do in case operator needs to recreate StatefulSet due to PVC data loss or missing volumes.
-               Possible options:
-               1. abort - abort the process, do nothing with the problematic StatefulSet.
-               2. recreate - proceed and recreate StatefulSet.
-        :param _builtins.str on_update_failure: What to do in case operator needs to recreate StatefulSet due to update failure or StatefulSet not ready.
-               Possible options:
-               1. abort - abort the process, do nothing with the problematic StatefulSet.
-               2. recreate - proceed and recreate StatefulSet.
-        """
-        if on_data_loss is not None:
-            pulumi.set(__self__, "on_data_loss", on_data_loss)
-        if on_update_failure is not None:
-            pulumi.set(__self__, "on_update_failure", on_update_failure)
-
-    @_builtins.property
-    @pulumi.getter(name="onDataLoss")
-    def on_data_loss(self) -> Optional[_builtins.str]:
-        """
-        What to do in case operator needs to recreate StatefulSet due to PVC data loss or missing volumes.
-        Possible options:
-        1. abort - abort the process, do nothing with the problematic StatefulSet.
-        2. recreate - proceed and recreate StatefulSet.
-        """
-        return pulumi.get(self, "on_data_loss")
-
-    @_builtins.property
-    @pulumi.getter(name="onUpdateFailure")
-    def on_update_failure(self) -> Optional[_builtins.str]:
-        """
-        What to do in case operator needs to recreate StatefulSet due to update failure or StatefulSet not ready.
-        Possible options:
-        1. abort - abort the process, do nothing with the problematic StatefulSet.
-        2. recreate - proceed and recreate StatefulSet.
-        """
-        return pulumi.get(self, "on_update_failure")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingStatefulSetUpdate(dict):
-    """
-    Behavior during update StatefulSet
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "onFailure":
-            suggest = "on_failure"
-        elif key == "pollInterval":
-            suggest = "poll_interval"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingStatefulSetUpdate. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingStatefulSetUpdate.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingStatefulSetUpdate.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 on_failure: Optional[_builtins.str] = None,
-                 poll_interval: Optional[_builtins.int] = None,
-                 timeout: Optional[_builtins.int] = None):
-        """
-        Behavior during update StatefulSet
-
-        :param _builtins.str on_failure: What to do in case updated StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
-               Possible options:
-               1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
-               2. rollback - delete Pod and rollback StatefulSet to previous Generation. Follow 'abort' path afterwards.
-               3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
-        :param _builtins.int poll_interval: How many seconds to wait between checks for StatefulSet status during update
-        :param _builtins.int timeout: How many seconds to wait for StatefulSet to be 'Ready' during update
-        """
-        if on_failure is not None:
-            pulumi.set(__self__, "on_failure", on_failure)
-        if poll_interval is not None:
-            pulumi.set(__self__, "poll_interval", poll_interval)
-        if timeout is not None:
-            pulumi.set(__self__, "timeout", timeout)
-
-    @_builtins.property
-    @pulumi.getter(name="onFailure")
-    def on_failure(self) -> Optional[_builtins.str]:
-        """
-        What to do in case updated StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
-        Possible options:
-        1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
-        2. rollback - delete Pod and rollback StatefulSet to previous Generation. Follow 'abort' path afterwards.
-        3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
-        """
-        return pulumi.get(self, "on_failure")
-
-    @_builtins.property
-    @pulumi.getter(name="pollInterval")
-    def poll_interval(self) -> Optional[_builtins.int]:
-        """
-        How many seconds to wait between checks for StatefulSet status during update
-        """
-        return pulumi.get(self, "poll_interval")
-
-    @_builtins.property
-    @pulumi.getter
-    def timeout(self) -> Optional[_builtins.int]:
-        """
-        How many seconds to wait for StatefulSet to be 'Ready' during update
-        """
-        return pulumi.get(self, "timeout")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatch(dict):
-    """
-    Behavior during update StatefulSet
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "onFailure":
-            suggest = "on_failure"
-        elif key == "pollInterval":
-            suggest = "poll_interval"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 on_failure: Optional[_builtins.str] = None,
-                 poll_interval: Optional[_builtins.int] = None,
-                 timeout: Optional[_builtins.int] = None):
-        """
-        Behavior during update StatefulSet
-
-        :param _builtins.str on_failure: What to do in case updated StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
-               Possible options:
-               1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
-               2. rollback - delete Pod and rollback StatefulSet to previous Generation. Follow 'abort' path afterwards.
-               3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
-        :param _builtins.int poll_interval: How many seconds to wait between checks for StatefulSet status during update
-        :param _builtins.int timeout: How many seconds to wait for StatefulSet to be 'Ready' during update
-        """
-        if on_failure is not None:
-            pulumi.set(__self__, "on_failure", on_failure)
-        if poll_interval is not None:
-            pulumi.set(__self__, "poll_interval", poll_interval)
-        if timeout is not None:
-            pulumi.set(__self__, "timeout", timeout)
-
-    @_builtins.property
-    @pulumi.getter(name="onFailure")
-    def on_failure(self) -> Optional[_builtins.str]:
-        """
-        What to do in case updated StatefulSet is not in 'Ready' after `reconcile.statefulSet.update.timeout` seconds.
-        Possible options:
-        1. abort - abort the process, do nothing with the problematic StatefulSet, leave it as it is.
-        2. rollback - delete Pod and rollback StatefulSet to previous Generation. Follow 'abort' path afterwards.
-        3. ignore - ignore an error, pretend nothing happened, continue reconcile and move on to the next StatefulSet.
-        """
-        return pulumi.get(self, "on_failure")
-
-    @_builtins.property
-    @pulumi.getter(name="pollInterval")
-    def poll_interval(self) -> Optional[_builtins.int]:
-        """
-        How many seconds to wait between checks for StatefulSet status during update
-        """
-        return pulumi.get(self, "poll_interval")
-
-    @_builtins.property
-    @pulumi.getter
-    def timeout(self) -> Optional[_builtins.int]:
-        """
-        How many seconds to wait for StatefulSet to be 'Ready' during update
-        """
-        return pulumi.get(self, "timeout")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplates(dict):
-    """
-    allows define templates which will use for render Kubernetes resources like StatefulSet, ConfigMap, Service, PVC, by default, clickhouse-operator have own templates, but you can override it
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "hostTemplates":
-            suggest = "host_templates"
-        elif key == "podTemplates":
-            suggest = "pod_templates"
-        elif key == "serviceTemplates":
-            suggest = "service_templates"
-        elif key == "volumeClaimTemplates":
-            suggest = "volume_claim_templates"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplates. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecTemplates.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecTemplates.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 host_templates: Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesHostTemplates']] = None,
-                 pod_templates: Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesPodTemplates']] = None,
-                 service_templates: Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesServiceTemplates']] = None,
-                 volume_claim_templates: Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesVolumeClaimTemplates']] = None):
-        """
-        allows define templates which will use for render Kubernetes resources like StatefulSet, ConfigMap, Service, PVC, by default, clickhouse-operator have own templates, but you can override it
-
-        :param Sequence['ClickHouseInstallationSpecTemplatesHostTemplatesArgs'] host_templates: hostTemplate will use during apply to generate `clickhose-server` config files
-        :param Sequence['ClickHouseInstallationSpecTemplatesPodTemplatesArgs'] pod_templates: podTemplate will use during render `Pod` inside `StatefulSet.spec` and allows define rendered `Pod.spec`, pod scheduling distribution and pod zone
-               More information: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatespodtemplates
-        :param Sequence['ClickHouseInstallationSpecTemplatesServiceTemplatesArgs'] service_templates: allows define template for rendering `Service` which would get endpoint from Pods which scoped chi-wide, cluster-wide, shard-wide, replica-wide level
-        :param Sequence['ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgs'] volume_claim_templates: allows define template for rendering `PVC` kubernetes resource, which would use inside `Pod` for mount clickhouse `data`, clickhouse `logs` or something else
-        """
-        if host_templates is not None:
-            pulumi.set(__self__, "host_templates", host_templates)
-        if pod_templates is not None:
-            pulumi.set(__self__, "pod_templates", pod_templates)
-        if service_templates is not None:
-            pulumi.set(__self__, "service_templates", service_templates)
-        if volume_claim_templates is not None:
-            pulumi.set(__self__, "volume_claim_templates", volume_claim_templates)
-
-    @_builtins.property
-    @pulumi.getter(name="hostTemplates")
-    def host_templates(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesHostTemplates']]:
-        """
-        hostTemplate will use during apply to generate `clickhose-server` config files
-        """
-        return pulumi.get(self, "host_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="podTemplates")
-    def pod_templates(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesPodTemplates']]:
-        """
-        podTemplate will use during render `Pod` inside `StatefulSet.spec` and allows define rendered `Pod.spec`, pod scheduling distribution and pod zone
-        More information: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatespodtemplates
-        """
-        return pulumi.get(self, "pod_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplates")
-    def service_templates(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesServiceTemplates']]:
-        """
-        allows define template for rendering `Service` which would get endpoint from Pods which scoped chi-wide, cluster-wide, shard-wide, replica-wide level
-        """
-        return pulumi.get(self, "service_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="volumeClaimTemplates")
-    def volume_claim_templates(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesVolumeClaimTemplates']]:
-        """
-        allows define template for rendering `PVC` kubernetes resource, which would use inside `Pod` for mount clickhouse `data`, clickhouse `logs` or something else
-        """
-        return pulumi.get(self, "volume_claim_templates")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesHostTemplates(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "portDistribution":
-            suggest = "port_distribution"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesHostTemplates. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecTemplatesHostTemplates.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecTemplatesHostTemplates.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 port_distribution: Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesPortDistribution']] = None,
-                 spec: Optional['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesSpec'] = None):
-        """
-        :param _builtins.str name: template name, could use to link inside top-level `chi.spec.defaults.templates.hostTemplate`, cluster-level `chi.spec.configuration.clusters.templates.hostTemplate`, shard-level `chi.spec.configuration.clusters.layout.shards.temlates.hostTemplate`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates.hostTemplate`
-        :param Sequence['ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionArgs'] port_distribution: define how will distribute numeric values of named ports in `Pod.spec.containers.ports` and clickhouse-server configs
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if port_distribution is not None:
-            pulumi.set(__self__, "port_distribution", port_distribution)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        template name, could use to link inside top-level `chi.spec.defaults.templates.hostTemplate`, cluster-level `chi.spec.configuration.clusters.templates.hostTemplate`, shard-level `chi.spec.configuration.clusters.layout.shards.temlates.hostTemplate`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates.hostTemplate`
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter(name="portDistribution")
-    def port_distribution(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesPortDistribution']]:
-        """
-        define how will distribute numeric values of named ports in `Pod.spec.containers.ports` and clickhouse-server configs
-        """
-        return pulumi.get(self, "port_distribution")
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> Optional['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesSpec']:
-        return pulumi.get(self, "spec")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesHostTemplatesPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "portDistribution":
-            suggest = "port_distribution"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesHostTemplatesPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecTemplatesHostTemplatesPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecTemplatesHostTemplatesPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 port_distribution: Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatch']] = None,
-                 spec: Optional['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatch'] = None):
-        """
-        :param _builtins.str name: template name, could use to link inside top-level `chi.spec.defaults.templates.hostTemplate`, cluster-level `chi.spec.configuration.clusters.templates.hostTemplate`, shard-level `chi.spec.configuration.clusters.layout.shards.temlates.hostTemplate`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates.hostTemplate`
-        :param Sequence['ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatchArgs'] port_distribution: define how will distribute numeric values of named ports in `Pod.spec.containers.ports` and clickhouse-server configs
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if port_distribution is not None:
-            pulumi.set(__self__, "port_distribution", port_distribution)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        template name, could use to link inside top-level `chi.spec.defaults.templates.hostTemplate`, cluster-level `chi.spec.configuration.clusters.templates.hostTemplate`, shard-level `chi.spec.configuration.clusters.layout.shards.temlates.hostTemplate`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates.hostTemplate`
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter(name="portDistribution")
-    def port_distribution(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatch']]:
-        """
-        define how will distribute numeric values of named ports in `Pod.spec.containers.ports` and clickhouse-server configs
-        """
-        return pulumi.get(self, "port_distribution")
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> Optional['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatch']:
-        return pulumi.get(self, "spec")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesHostTemplatesPortDistribution(dict):
-    def __init__(__self__, *,
-                 type: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str type: type of distribution, when `Unspecified` (default value) then all listen ports on clickhouse-server configuration in all Pods will have the same value, when `ClusterScopeIndex` then ports will increment to offset from base value depends on shard and replica index inside cluster with combination of `chi.spec.templates.podTemlates.spec.HostNetwork` it allows setup ClickHouse cluster inside Kubernetes and provide access via external network bypass Kubernetes internal network
-        """
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type of distribution, when `Unspecified` (default value) then all listen ports on clickhouse-server configuration in all Pods will have the same value, when `ClusterScopeIndex` then ports will increment to offset from base value depends on shard and replica index inside cluster with combination of `chi.spec.templates.podTemlates.spec.HostNetwork` it allows setup ClickHouse cluster inside Kubernetes and provide access via external network bypass Kubernetes internal network
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatch(dict):
-    def __init__(__self__, *,
-                 type: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str type: type of distribution, when `Unspecified` (default value) then all listen ports on clickhouse-server configuration in all Pods will have the same value, when `ClusterScopeIndex` then ports will increment to offset from base value depends on shard and replica index inside cluster with combination of `chi.spec.templates.podTemlates.spec.HostNetwork` it allows setup ClickHouse cluster inside Kubernetes and provide access via external network bypass Kubernetes internal network
-        """
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type of distribution, when `Unspecified` (default value) then all listen ports on clickhouse-server configuration in all Pods will have the same value, when `ClusterScopeIndex` then ports will increment to offset from base value depends on shard and replica index inside cluster with combination of `chi.spec.templates.podTemlates.spec.HostNetwork` it allows setup ClickHouse cluster inside Kubernetes and provide access via external network bypass Kubernetes internal network
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesHostTemplatesSpec(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "httpPort":
-            suggest = "http_port"
-        elif key == "httpsPort":
-            suggest = "https_port"
-        elif key == "interserverHTTPPort":
-            suggest = "interserver_http_port"
-        elif key == "tcpPort":
-            suggest = "tcp_port"
-        elif key == "tlsPort":
-            suggest = "tls_port"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesHostTemplatesSpec. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecTemplatesHostTemplatesSpec.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecTemplatesHostTemplatesSpec.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 files: Optional[Mapping[str, Any]] = None,
-                 http_port: Optional[_builtins.int] = None,
-                 https_port: Optional[_builtins.int] = None,
-                 insecure: Optional[_builtins.str] = None,
-                 interserver_http_port: Optional[_builtins.int] = None,
-                 name: Optional[_builtins.str] = None,
-                 secure: Optional[_builtins.str] = None,
-                 settings: Optional[Mapping[str, Any]] = None,
-                 tcp_port: Optional[_builtins.int] = None,
-                 templates: Optional['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplates'] = None,
-                 tls_port: Optional[_builtins.int] = None):
-        """
-        :param Mapping[str, Any] files: optional, allows define content of any setting file inside each `Pod` where this template will apply during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-        :param _builtins.int http_port: optional, setup `http_port` inside `clickhouse-server` settings for each Pod where current template will apply
-               if specified, should have equal value with `chi.spec.templates.podTemplates.spec.containers.ports[name=http]`
-               More info: https://clickhouse.tech/docs/en/interfaces/http/
-        :param _builtins.str insecure: optional, open insecure ports for cluster, defaults to "yes"
-        :param _builtins.int interserver_http_port: optional, setup `interserver_http_port` inside `clickhouse-server` settings for each Pod where current template will apply
-               if specified, should have equal value with `chi.spec.templates.podTemplates.spec.containers.ports[name=interserver]`
-               More info: https://clickhouse.tech/docs/en/operations/server-configuration-parameters/settings/#interserver-http-port
-        :param _builtins.str name: by default, hostname will generate, but this allows define custom name for each `clickhouse-server`
-        :param _builtins.str secure: optional, open secure ports
-        :param Mapping[str, Any] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` where this template will apply during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
-               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        :param _builtins.int tcp_port: optional, setup `tcp_port` inside `clickhouse-server` settings for each Pod where current template will apply
-               if specified, should have equal value with `chi.spec.templates.podTemplates.spec.containers.ports[name=tcp]`
-               More info: https://clickhouse.tech/docs/en/interfaces/tcp/
-        """
-        if files is not None:
-            pulumi.set(__self__, "files", files)
-        if http_port is not None:
-            pulumi.set(__self__, "http_port", http_port)
-        if https_port is not None:
-            pulumi.set(__self__, "https_port", https_port)
-        if insecure is not None:
-            pulumi.set(__self__, "insecure", insecure)
-        if interserver_http_port is not None:
-            pulumi.set(__self__, "interserver_http_port", interserver_http_port)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if secure is not None:
-            pulumi.set(__self__, "secure", secure)
-        if settings is not None:
-            pulumi.set(__self__, "settings", settings)
-        if tcp_port is not None:
-            pulumi.set(__self__, "tcp_port", tcp_port)
-        if templates is not None:
-            pulumi.set(__self__, "templates", templates)
-        if tls_port is not None:
-            pulumi.set(__self__, "tls_port", tls_port)
-
-    @_builtins.property
-    @pulumi.getter
-    def files(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows define content of any setting file inside each `Pod` where this template will apply during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-        """
-        return pulumi.get(self, "files")
-
-    @_builtins.property
-    @pulumi.getter(name="httpPort")
-    def http_port(self) -> Optional[_builtins.int]:
-        """
-        optional, setup `http_port` inside `clickhouse-server` settings for each Pod where current template will apply
-        if specified, should have equal value with `chi.spec.templates.podTemplates.spec.containers.ports[name=http]`
-        More info: https://clickhouse.tech/docs/en/interfaces/http/
-        """
-        return pulumi.get(self, "http_port")
-
-    @_builtins.property
-    @pulumi.getter(name="httpsPort")
-    def https_port(self) -> Optional[_builtins.int]:
-        return pulumi.get(self, "https_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def insecure(self) -> Optional[_builtins.str]:
-        """
-        optional, open insecure ports for cluster, defaults to "yes"
-        """
-        return pulumi.get(self, "insecure")
-
-    @_builtins.property
-    @pulumi.getter(name="interserverHTTPPort")
-    def interserver_http_port(self) -> Optional[_builtins.int]:
-        """
-        optional, setup `interserver_http_port` inside `clickhouse-server` settings for each Pod where current template will apply
-        if specified, should have equal value with `chi.spec.templates.podTemplates.spec.containers.ports[name=interserver]`
-        More info: https://clickhouse.tech/docs/en/operations/server-configuration-parameters/settings/#interserver-http-port
-        """
-        return pulumi.get(self, "interserver_http_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        by default, hostname will generate, but this allows define custom name for each `clickhouse-server`
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def secure(self) -> Optional[_builtins.str]:
-        """
-        optional, open secure ports
-        """
-        return pulumi.get(self, "secure")
-
-    @_builtins.property
-    @pulumi.getter
-    def settings(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` where this template will apply during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
-        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        """
-        return pulumi.get(self, "settings")
-
-    @_builtins.property
-    @pulumi.getter(name="tcpPort")
-    def tcp_port(self) -> Optional[_builtins.int]:
-        """
-        optional, setup `tcp_port` inside `clickhouse-server` settings for each Pod where current template will apply
-        if specified, should have equal value with `chi.spec.templates.podTemplates.spec.containers.ports[name=tcp]`
-        More info: https://clickhouse.tech/docs/en/interfaces/tcp/
-        """
-        return pulumi.get(self, "tcp_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplates']:
-        return pulumi.get(self, "templates")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsPort")
-    def tls_port(self) -> Optional[_builtins.int]:
-        return pulumi.get(self, "tls_port")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "httpPort":
-            suggest = "http_port"
-        elif key == "httpsPort":
-            suggest = "https_port"
-        elif key == "interserverHTTPPort":
-            suggest = "interserver_http_port"
-        elif key == "tcpPort":
-            suggest = "tcp_port"
-        elif key == "tlsPort":
-            suggest = "tls_port"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 files: Optional[Mapping[str, Any]] = None,
-                 http_port: Optional[_builtins.int] = None,
-                 https_port: Optional[_builtins.int] = None,
-                 insecure: Optional[_builtins.str] = None,
-                 interserver_http_port: Optional[_builtins.int] = None,
-                 name: Optional[_builtins.str] = None,
-                 secure: Optional[_builtins.str] = None,
-                 settings: Optional[Mapping[str, Any]] = None,
-                 tcp_port: Optional[_builtins.int] = None,
-                 templates: Optional['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatch'] = None,
-                 tls_port: Optional[_builtins.int] = None):
-        """
-        :param Mapping[str, Any] files: optional, allows define content of any setting file inside each `Pod` where this template will apply during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-        :param _builtins.int http_port: optional, setup `http_port` inside `clickhouse-server` settings for each Pod where current template will apply
-               if specified, should have equal value with `chi.spec.templates.podTemplates.spec.containers.ports[name=http]`
-               More info: https://clickhouse.tech/docs/en/interfaces/http/
-        :param _builtins.str insecure: optional, open insecure ports for cluster, defaults to "yes"
-        :param _builtins.int interserver_http_port: optional, setup `interserver_http_port` inside `clickhouse-server` settings for each Pod where current template will apply
-               if specified, should have equal value with `chi.spec.templates.podTemplates.spec.containers.ports[name=interserver]`
-               More info: https://clickhouse.tech/docs/en/operations/server-configuration-parameters/settings/#interserver-http-port
-        :param _builtins.str name: by default, hostname will generate, but this allows define custom name for each `clickhouse-server`
-        :param _builtins.str secure: optional, open secure ports
-        :param Mapping[str, Any] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` where this template will apply during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
-               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        :param _builtins.int tcp_port: optional, setup `tcp_port` inside `clickhouse-server` settings for each Pod where current template will apply
-               if specified, should have equal value with `chi.spec.templates.podTemplates.spec.containers.ports[name=tcp]`
-               More info: https://clickhouse.tech/docs/en/interfaces/tcp/
-        """
-        if files is not None:
-            pulumi.set(__self__, "files", files)
-        if http_port is not None:
-            pulumi.set(__self__, "http_port", http_port)
-        if https_port is not None:
-            pulumi.set(__self__, "https_port", https_port)
-        if insecure is not None:
-            pulumi.set(__self__, "insecure", insecure)
-        if interserver_http_port is not None:
-            pulumi.set(__self__, "interserver_http_port", interserver_http_port)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if secure is not None:
-            pulumi.set(__self__, "secure", secure)
-        if settings is not None:
-            pulumi.set(__self__, "settings", settings)
-        if tcp_port is not None:
-            pulumi.set(__self__, "tcp_port", tcp_port)
-        if templates is not None:
-            pulumi.set(__self__, "templates", templates)
-        if tls_port is not None:
-            pulumi.set(__self__, "tls_port", tls_port)
-
-    @_builtins.property
-    @pulumi.getter
-    def files(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows define content of any setting file inside each `Pod` where this template will apply during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
-        """
-        return pulumi.get(self, "files")
-
-    @_builtins.property
-    @pulumi.getter(name="httpPort")
-    def http_port(self) -> Optional[_builtins.int]:
-        """
-        optional, setup `http_port` inside `clickhouse-server` settings for each Pod where current template will apply
-        if specified, should have equal value with `chi.spec.templates.podTemplates.spec.containers.ports[name=http]`
-        More info: https://clickhouse.tech/docs/en/interfaces/http/
-        """
-        return pulumi.get(self, "http_port")
-
-    @_builtins.property
-    @pulumi.getter(name="httpsPort")
-    def https_port(self) -> Optional[_builtins.int]:
-        return pulumi.get(self, "https_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def insecure(self) -> Optional[_builtins.str]:
-        """
-        optional, open insecure ports for cluster, defaults to "yes"
-        """
-        return pulumi.get(self, "insecure")
-
-    @_builtins.property
-    @pulumi.getter(name="interserverHTTPPort")
-    def interserver_http_port(self) -> Optional[_builtins.int]:
-        """
-        optional, setup `interserver_http_port` inside `clickhouse-server` settings for each Pod where current template will apply
-        if specified, should have equal value with `chi.spec.templates.podTemplates.spec.containers.ports[name=interserver]`
-        More info: https://clickhouse.tech/docs/en/operations/server-configuration-parameters/settings/#interserver-http-port
-        """
-        return pulumi.get(self, "interserver_http_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        by default, hostname will generate, but this allows define custom name for each `clickhouse-server`
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def secure(self) -> Optional[_builtins.str]:
-        """
-        optional, open secure ports
-        """
-        return pulumi.get(self, "secure")
-
-    @_builtins.property
-    @pulumi.getter
-    def settings(self) -> Optional[Mapping[str, Any]]:
-        """
-        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` where this template will apply during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
-        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
-        """
-        return pulumi.get(self, "settings")
-
-    @_builtins.property
-    @pulumi.getter(name="tcpPort")
-    def tcp_port(self) -> Optional[_builtins.int]:
-        """
-        optional, setup `tcp_port` inside `clickhouse-server` settings for each Pod where current template will apply
-        if specified, should have equal value with `chi.spec.templates.podTemplates.spec.containers.ports[name=tcp]`
-        More info: https://clickhouse.tech/docs/en/interfaces/tcp/
-        """
-        return pulumi.get(self, "tcp_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatch']:
-        return pulumi.get(self, "templates")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsPort")
-    def tls_port(self) -> Optional[_builtins.int]:
-        return pulumi.get(self, "tls_port")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplates(dict):
-    """
-    be careful, this part of CRD allows override template inside template, don't use it if you don't understand what you do
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clusterServiceTemplate":
-            suggest = "cluster_service_template"
-        elif key == "dataVolumeClaimTemplate":
-            suggest = "data_volume_claim_template"
-        elif key == "hostTemplate":
-            suggest = "host_template"
-        elif key == "logVolumeClaimTemplate":
-            suggest = "log_volume_claim_template"
-        elif key == "podTemplate":
-            suggest = "pod_template"
-        elif key == "replicaServiceTemplate":
-            suggest = "replica_service_template"
-        elif key == "serviceTemplate":
-            suggest = "service_template"
-        elif key == "serviceTemplates":
-            suggest = "service_templates"
-        elif key == "shardServiceTemplate":
-            suggest = "shard_service_template"
-        elif key == "volumeClaimTemplate":
-            suggest = "volume_claim_template"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplates. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplates.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplates.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cluster_service_template: Optional[_builtins.str] = None,
-                 data_volume_claim_template: Optional[_builtins.str] = None,
-                 host_template: Optional[_builtins.str] = None,
-                 log_volume_claim_template: Optional[_builtins.str] = None,
-                 pod_template: Optional[_builtins.str] = None,
-                 replica_service_template: Optional[_builtins.str] = None,
-                 service_template: Optional[_builtins.str] = None,
-                 service_templates: Optional[Sequence[_builtins.str]] = None,
-                 shard_service_template: Optional[_builtins.str] = None,
-                 volume_claim_template: Optional[_builtins.str] = None):
-        """
-        be careful, this part of CRD allows override template inside template, don't use it if you don't understand what you do
-
-        :param _builtins.str cluster_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str data_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str host_template: optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        :param _builtins.str log_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str pod_template: optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str replica_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str service_template: optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param Sequence[_builtins.str] service_templates: optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param _builtins.str shard_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str volume_claim_template: optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        if cluster_service_template is not None:
-            pulumi.set(__self__, "cluster_service_template", cluster_service_template)
-        if data_volume_claim_template is not None:
-            pulumi.set(__self__, "data_volume_claim_template", data_volume_claim_template)
-        if host_template is not None:
-            pulumi.set(__self__, "host_template", host_template)
-        if log_volume_claim_template is not None:
-            pulumi.set(__self__, "log_volume_claim_template", log_volume_claim_template)
-        if pod_template is not None:
-            pulumi.set(__self__, "pod_template", pod_template)
-        if replica_service_template is not None:
-            pulumi.set(__self__, "replica_service_template", replica_service_template)
-        if service_template is not None:
-            pulumi.set(__self__, "service_template", service_template)
-        if service_templates is not None:
-            pulumi.set(__self__, "service_templates", service_templates)
-        if shard_service_template is not None:
-            pulumi.set(__self__, "shard_service_template", shard_service_template)
-        if volume_claim_template is not None:
-            pulumi.set(__self__, "volume_claim_template", volume_claim_template)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterServiceTemplate")
-    def cluster_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "cluster_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="dataVolumeClaimTemplate")
-    def data_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "data_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="hostTemplate")
-    def host_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        """
-        return pulumi.get(self, "host_template")
-
-    @_builtins.property
-    @pulumi.getter(name="logVolumeClaimTemplate")
-    def log_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "log_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="podTemplate")
-    def pod_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "pod_template")
-
-    @_builtins.property
-    @pulumi.getter(name="replicaServiceTemplate")
-    def replica_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "replica_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplate")
-    def service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplates")
-    def service_templates(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="shardServiceTemplate")
-    def shard_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "shard_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="volumeClaimTemplate")
-    def volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "volume_claim_template")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatch(dict):
-    """
-    be careful, this part of CRD allows override template inside template, don't use it if you don't understand what you do
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clusterServiceTemplate":
-            suggest = "cluster_service_template"
-        elif key == "dataVolumeClaimTemplate":
-            suggest = "data_volume_claim_template"
-        elif key == "hostTemplate":
-            suggest = "host_template"
-        elif key == "logVolumeClaimTemplate":
-            suggest = "log_volume_claim_template"
-        elif key == "podTemplate":
-            suggest = "pod_template"
-        elif key == "replicaServiceTemplate":
-            suggest = "replica_service_template"
-        elif key == "serviceTemplate":
-            suggest = "service_template"
-        elif key == "serviceTemplates":
-            suggest = "service_templates"
-        elif key == "shardServiceTemplate":
-            suggest = "shard_service_template"
-        elif key == "volumeClaimTemplate":
-            suggest = "volume_claim_template"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cluster_service_template: Optional[_builtins.str] = None,
-                 data_volume_claim_template: Optional[_builtins.str] = None,
-                 host_template: Optional[_builtins.str] = None,
-                 log_volume_claim_template: Optional[_builtins.str] = None,
-                 pod_template: Optional[_builtins.str] = None,
-                 replica_service_template: Optional[_builtins.str] = None,
-                 service_template: Optional[_builtins.str] = None,
-                 service_templates: Optional[Sequence[_builtins.str]] = None,
-                 shard_service_template: Optional[_builtins.str] = None,
-                 volume_claim_template: Optional[_builtins.str] = None):
-        """
-        be careful, this part of CRD allows override template inside template, don't use it if you don't understand what you do
-
-        :param _builtins.str cluster_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str data_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str host_template: optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        :param _builtins.str log_volume_claim_template: optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str pod_template: optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        :param _builtins.str replica_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str service_template: optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param Sequence[_builtins.str] service_templates: optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        :param _builtins.str shard_service_template: optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        :param _builtins.str volume_claim_template: optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        if cluster_service_template is not None:
-            pulumi.set(__self__, "cluster_service_template", cluster_service_template)
-        if data_volume_claim_template is not None:
-            pulumi.set(__self__, "data_volume_claim_template", data_volume_claim_template)
-        if host_template is not None:
-            pulumi.set(__self__, "host_template", host_template)
-        if log_volume_claim_template is not None:
-            pulumi.set(__self__, "log_volume_claim_template", log_volume_claim_template)
-        if pod_template is not None:
-            pulumi.set(__self__, "pod_template", pod_template)
-        if replica_service_template is not None:
-            pulumi.set(__self__, "replica_service_template", replica_service_template)
-        if service_template is not None:
-            pulumi.set(__self__, "service_template", service_template)
-        if service_templates is not None:
-            pulumi.set(__self__, "service_templates", service_templates)
-        if shard_service_template is not None:
-            pulumi.set(__self__, "shard_service_template", shard_service_template)
-        if volume_claim_template is not None:
-            pulumi.set(__self__, "volume_claim_template", volume_claim_template)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterServiceTemplate")
-    def cluster_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "cluster_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="dataVolumeClaimTemplate")
-    def data_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "data_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="hostTemplate")
-    def host_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.hostTemplates, which will apply to configure every `clickhouse-server` instance during render ConfigMap resources which will mount into `Pod`
-        """
-        return pulumi.get(self, "host_template")
-
-    @_builtins.property
-    @pulumi.getter(name="logVolumeClaimTemplate")
-    def log_volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse log directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "log_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter(name="podTemplate")
-    def pod_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.podTemplates, allows customization each `Pod` resource during render and reconcile each StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "pod_template")
-
-    @_builtins.property
-    @pulumi.getter(name="replicaServiceTemplate")
-    def replica_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each replica inside each shard inside each clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "replica_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplate")
-    def service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates. used for customization of the `Service` resource, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplates")
-    def service_templates(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        optional, template names from chi.spec.templates.serviceTemplates. used for customization of the `Service` resources, created by `clickhouse-operator` to cover all clusters in whole `chi` resource
-        """
-        return pulumi.get(self, "service_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="shardServiceTemplate")
-    def shard_service_template(self) -> Optional[_builtins.str]:
-        """
-        optional, template name from chi.spec.templates.serviceTemplates, allows customization for each `Service` resource which will created by `clickhouse-operator` which cover each shard inside clickhouse cluster described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "shard_service_template")
-
-    @_builtins.property
-    @pulumi.getter(name="volumeClaimTemplate")
-    def volume_claim_template(self) -> Optional[_builtins.str]:
-        """
-        optional, alias for dataVolumeClaimTemplate, template name from chi.spec.templates.volumeClaimTemplates, allows customization each `PVC` which will mount for clickhouse data directory in each `Pod` during render and reconcile every StatefulSet.spec resource described in `chi.spec.configuration.clusters`
-        """
-        return pulumi.get(self, "volume_claim_template")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesPatch(dict):
-    """
-    allows define templates which will use for render Kubernetes resources like StatefulSet, ConfigMap, Service, PVC, by default, clickhouse-operator have own templates, but you can override it
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "hostTemplates":
-            suggest = "host_templates"
-        elif key == "podTemplates":
-            suggest = "pod_templates"
-        elif key == "serviceTemplates":
-            suggest = "service_templates"
-        elif key == "volumeClaimTemplates":
-            suggest = "volume_claim_templates"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecTemplatesPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecTemplatesPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 host_templates: Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesPatch']] = None,
-                 pod_templates: Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesPodTemplatesPatch']] = None,
-                 service_templates: Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesServiceTemplatesPatch']] = None,
-                 volume_claim_templates: Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatch']] = None):
-        """
-        allows define templates which will use for render Kubernetes resources like StatefulSet, ConfigMap, Service, PVC, by default, clickhouse-operator have own templates, but you can override it
-
-        :param Sequence['ClickHouseInstallationSpecTemplatesHostTemplatesPatchArgs'] host_templates: hostTemplate will use during apply to generate `clickhose-server` config files
-        :param Sequence['ClickHouseInstallationSpecTemplatesPodTemplatesPatchArgs'] pod_templates: podTemplate will use during render `Pod` inside `StatefulSet.spec` and allows define rendered `Pod.spec`, pod scheduling distribution and pod zone
-               More information: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatespodtemplates
-        :param Sequence['ClickHouseInstallationSpecTemplatesServiceTemplatesPatchArgs'] service_templates: allows define template for rendering `Service` which would get endpoint from Pods which scoped chi-wide, cluster-wide, shard-wide, replica-wide level
-        :param Sequence['ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatchArgs'] volume_claim_templates: allows define template for rendering `PVC` kubernetes resource, which would use inside `Pod` for mount clickhouse `data`, clickhouse `logs` or something else
-        """
-        if host_templates is not None:
-            pulumi.set(__self__, "host_templates", host_templates)
-        if pod_templates is not None:
-            pulumi.set(__self__, "pod_templates", pod_templates)
-        if service_templates is not None:
-            pulumi.set(__self__, "service_templates", service_templates)
-        if volume_claim_templates is not None:
-            pulumi.set(__self__, "volume_claim_templates", volume_claim_templates)
-
-    @_builtins.property
-    @pulumi.getter(name="hostTemplates")
-    def host_templates(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesPatch']]:
-        """
-        hostTemplate will use during apply to generate `clickhose-server` config files
-        """
-        return pulumi.get(self, "host_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="podTemplates")
-    def pod_templates(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesPodTemplatesPatch']]:
-        """
-        podTemplate will use during render `Pod` inside `StatefulSet.spec` and allows define rendered `Pod.spec`, pod scheduling distribution and pod zone
-        More information: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatespodtemplates
-        """
-        return pulumi.get(self, "pod_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceTemplates")
-    def service_templates(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesServiceTemplatesPatch']]:
-        """
-        allows define template for rendering `Service` which would get endpoint from Pods which scoped chi-wide, cluster-wide, shard-wide, replica-wide level
-        """
-        return pulumi.get(self, "service_templates")
-
-    @_builtins.property
-    @pulumi.getter(name="volumeClaimTemplates")
-    def volume_claim_templates(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatch']]:
-        """
-        allows define template for rendering `PVC` kubernetes resource, which would use inside `Pod` for mount clickhouse `data`, clickhouse `logs` or something else
-        """
-        return pulumi.get(self, "volume_claim_templates")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesPodTemplates(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "generateName":
-            suggest = "generate_name"
-        elif key == "podDistribution":
-            suggest = "pod_distribution"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesPodTemplates. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecTemplatesPodTemplates.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecTemplatesPodTemplates.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 distribution: Optional[_builtins.str] = None,
-                 generate_name: Optional[_builtins.str] = None,
-                 metadata: Optional[Mapping[str, Any]] = None,
-                 name: Optional[_builtins.str] = None,
-                 pod_distribution: Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesPodTemplatesPodDistribution']] = None,
-                 spec: Optional[Mapping[str, Any]] = None,
-                 zone: Optional['outputs.ClickHouseInstallationSpecTemplatesPodTemplatesZone'] = None):
-        """
-        :param _builtins.str distribution: DEPRECATED, shortcut for `chi.spec.templates.podTemplates.spec.affinity.podAntiAffinity`
-        :param _builtins.str generate_name: allows define format for generated `Pod` name, look to https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatesservicetemplates for details about available template variables
-        :param Mapping[str, Any] metadata: allows pass standard object's metadata from template to Pod
-               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        :param _builtins.str name: template name, could use to link inside top-level `chi.spec.defaults.templates.podTemplate`, cluster-level `chi.spec.configuration.clusters.templates.podTemplate`, shard-level `chi.spec.configuration.clusters.layout.shards.temlates.podTemplate`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates.podTemplate`
-        :param Sequence['ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionArgs'] pod_distribution: define ClickHouse Pod distribution policy between Kubernetes Nodes inside Shard, Replica, Namespace, CHI, another ClickHouse cluster
-        :param Mapping[str, Any] spec: allows define whole Pod.spec inside StaefulSet.spec, look to https://kubernetes.io/docs/concepts/workloads/pods/#pod-templates for details
-        """
-        if distribution is not None:
-            pulumi.set(__self__, "distribution", distribution)
-        if generate_name is not None:
-            pulumi.set(__self__, "generate_name", generate_name)
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if pod_distribution is not None:
-            pulumi.set(__self__, "pod_distribution", pod_distribution)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-        if zone is not None:
-            pulumi.set(__self__, "zone", zone)
-
-    @_builtins.property
-    @pulumi.getter
-    def distribution(self) -> Optional[_builtins.str]:
-        """
-        DEPRECATED, shortcut for `chi.spec.templates.podTemplates.spec.affinity.podAntiAffinity`
-        """
-        return pulumi.get(self, "distribution")
-
-    @_builtins.property
-    @pulumi.getter(name="generateName")
-    def generate_name(self) -> Optional[_builtins.str]:
-        """
-        allows define format for generated `Pod` name, look to https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatesservicetemplates for details about available template variables
-        """
-        return pulumi.get(self, "generate_name")
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows pass standard object's metadata from template to Pod
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        return pulumi.get(self, "metadata")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        template name, could use to link inside top-level `chi.spec.defaults.templates.podTemplate`, cluster-level `chi.spec.configuration.clusters.templates.podTemplate`, shard-level `chi.spec.configuration.clusters.layout.shards.temlates.podTemplate`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates.podTemplate`
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter(name="podDistribution")
-    def pod_distribution(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesPodTemplatesPodDistribution']]:
-        """
-        define ClickHouse Pod distribution policy between Kubernetes Nodes inside Shard, Replica, Namespace, CHI, another ClickHouse cluster
-        """
-        return pulumi.get(self, "pod_distribution")
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows define whole Pod.spec inside StaefulSet.spec, look to https://kubernetes.io/docs/concepts/workloads/pods/#pod-templates for details
-        """
-        return pulumi.get(self, "spec")
-
-    @_builtins.property
-    @pulumi.getter
-    def zone(self) -> Optional['outputs.ClickHouseInstallationSpecTemplatesPodTemplatesZone']:
-        return pulumi.get(self, "zone")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesPodTemplatesPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "generateName":
-            suggest = "generate_name"
-        elif key == "podDistribution":
-            suggest = "pod_distribution"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesPodTemplatesPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecTemplatesPodTemplatesPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecTemplatesPodTemplatesPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 distribution: Optional[_builtins.str] = None,
-                 generate_name: Optional[_builtins.str] = None,
-                 metadata: Optional[Mapping[str, Any]] = None,
-                 name: Optional[_builtins.str] = None,
-                 pod_distribution: Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatch']] = None,
-                 spec: Optional[Mapping[str, Any]] = None,
-                 zone: Optional['outputs.ClickHouseInstallationSpecTemplatesPodTemplatesZonePatch'] = None):
-        """
-        :param _builtins.str distribution: DEPRECATED, shortcut for `chi.spec.templates.podTemplates.spec.affinity.podAntiAffinity`
-        :param _builtins.str generate_name: allows define format for generated `Pod` name, look to https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatesservicetemplates for details about available template variables
-        :param Mapping[str, Any] metadata: allows pass standard object's metadata from template to Pod
-               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        :param _builtins.str name: template name, could use to link inside top-level `chi.spec.defaults.templates.podTemplate`, cluster-level `chi.spec.configuration.clusters.templates.podTemplate`, shard-level `chi.spec.configuration.clusters.layout.shards.temlates.podTemplate`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates.podTemplate`
-        :param Sequence['ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatchArgs'] pod_distribution: define ClickHouse Pod distribution policy between Kubernetes Nodes inside Shard, Replica, Namespace, CHI, another ClickHouse cluster
-        :param Mapping[str, Any] spec: allows define whole Pod.spec inside StaefulSet.spec, look to https://kubernetes.io/docs/concepts/workloads/pods/#pod-templates for details
-        """
-        if distribution is not None:
-            pulumi.set(__self__, "distribution", distribution)
-        if generate_name is not None:
-            pulumi.set(__self__, "generate_name", generate_name)
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if pod_distribution is not None:
-            pulumi.set(__self__, "pod_distribution", pod_distribution)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-        if zone is not None:
-            pulumi.set(__self__, "zone", zone)
-
-    @_builtins.property
-    @pulumi.getter
-    def distribution(self) -> Optional[_builtins.str]:
-        """
-        DEPRECATED, shortcut for `chi.spec.templates.podTemplates.spec.affinity.podAntiAffinity`
-        """
-        return pulumi.get(self, "distribution")
-
-    @_builtins.property
-    @pulumi.getter(name="generateName")
-    def generate_name(self) -> Optional[_builtins.str]:
-        """
-        allows define format for generated `Pod` name, look to https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatesservicetemplates for details about available template variables
-        """
-        return pulumi.get(self, "generate_name")
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows pass standard object's metadata from template to Pod
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        return pulumi.get(self, "metadata")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        template name, could use to link inside top-level `chi.spec.defaults.templates.podTemplate`, cluster-level `chi.spec.configuration.clusters.templates.podTemplate`, shard-level `chi.spec.configuration.clusters.layout.shards.temlates.podTemplate`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates.podTemplate`
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter(name="podDistribution")
-    def pod_distribution(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatch']]:
-        """
-        define ClickHouse Pod distribution policy between Kubernetes Nodes inside Shard, Replica, Namespace, CHI, another ClickHouse cluster
-        """
-        return pulumi.get(self, "pod_distribution")
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows define whole Pod.spec inside StaefulSet.spec, look to https://kubernetes.io/docs/concepts/workloads/pods/#pod-templates for details
-        """
-        return pulumi.get(self, "spec")
-
-    @_builtins.property
-    @pulumi.getter
-    def zone(self) -> Optional['outputs.ClickHouseInstallationSpecTemplatesPodTemplatesZonePatch']:
-        return pulumi.get(self, "zone")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesPodTemplatesPodDistribution(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "topologyKey":
-            suggest = "topology_key"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesPodTemplatesPodDistribution. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecTemplatesPodTemplatesPodDistribution.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecTemplatesPodTemplatesPodDistribution.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 number: Optional[_builtins.int] = None,
-                 scope: Optional[_builtins.str] = None,
-                 topology_key: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        :param _builtins.int number: define, how much ClickHouse Pods could be inside selected scope with selected distribution type
-        :param _builtins.str scope: scope for apply each podDistribution
-        :param _builtins.str topology_key: use for inter-pod affinity look to `pod.spec.affinity.podAntiAffinity.preferredDuringSchedulingIgnoredDuringExecution.podAffinityTerm.topologyKey`,
-               more info: https://kubernetes.io/docs/concepts/scheduling-eviction/assign-pod-node/#inter-pod-affinity-and-anti-affinity"
-        :param _builtins.str type: you can define multiple affinity policy types
-        """
-        if number is not None:
-            pulumi.set(__self__, "number", number)
-        if scope is not None:
-            pulumi.set(__self__, "scope", scope)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter
-    def number(self) -> Optional[_builtins.int]:
-        """
-        define, how much ClickHouse Pods could be inside selected scope with selected distribution type
-        """
-        return pulumi.get(self, "number")
-
-    @_builtins.property
-    @pulumi.getter
-    def scope(self) -> Optional[_builtins.str]:
-        """
-        scope for apply each podDistribution
-        """
-        return pulumi.get(self, "scope")
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> Optional[_builtins.str]:
-        """
-        use for inter-pod affinity look to `pod.spec.affinity.podAntiAffinity.preferredDuringSchedulingIgnoredDuringExecution.podAffinityTerm.topologyKey`,
-        more info: https://kubernetes.io/docs/concepts/scheduling-eviction/assign-pod-node/#inter-pod-affinity-and-anti-affinity"
-        """
-        return pulumi.get(self, "topology_key")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        you can define multiple affinity policy types
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "topologyKey":
-            suggest = "topology_key"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 number: Optional[_builtins.int] = None,
-                 scope: Optional[_builtins.str] = None,
-                 topology_key: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        :param _builtins.int number: define, how much ClickHouse Pods could be inside selected scope with selected distribution type
-        :param _builtins.str scope: scope for apply each podDistribution
-        :param _builtins.str topology_key: use for inter-pod affinity look to `pod.spec.affinity.podAntiAffinity.preferredDuringSchedulingIgnoredDuringExecution.podAffinityTerm.topologyKey`,
-               more info: https://kubernetes.io/docs/concepts/scheduling-eviction/assign-pod-node/#inter-pod-affinity-and-anti-affinity"
-        :param _builtins.str type: you can define multiple affinity policy types
-        """
-        if number is not None:
-            pulumi.set(__self__, "number", number)
-        if scope is not None:
-            pulumi.set(__self__, "scope", scope)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter
-    def number(self) -> Optional[_builtins.int]:
-        """
-        define, how much ClickHouse Pods could be inside selected scope with selected distribution type
-        """
-        return pulumi.get(self, "number")
-
-    @_builtins.property
-    @pulumi.getter
-    def scope(self) -> Optional[_builtins.str]:
-        """
-        scope for apply each podDistribution
-        """
-        return pulumi.get(self, "scope")
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> Optional[_builtins.str]:
-        """
-        use for inter-pod affinity look to `pod.spec.affinity.podAntiAffinity.preferredDuringSchedulingIgnoredDuringExecution.podAffinityTerm.topologyKey`,
-        more info: https://kubernetes.io/docs/concepts/scheduling-eviction/assign-pod-node/#inter-pod-affinity-and-anti-affinity"
-        """
-        return pulumi.get(self, "topology_key")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        you can define multiple affinity policy types
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesPodTemplatesZone(dict):
-    """
-    allows define custom zone name and will separate ClickHouse `Pods` between nodes, shortcut for `chi.spec.templates.podTemplates.spec.affinity.podAntiAffinity`
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        allows define custom zone name and will separate ClickHouse `Pods` between nodes, shortcut for `chi.spec.templates.podTemplates.spec.affinity.podAntiAffinity`
-
-        :param _builtins.str key: optional, if defined, allows select kubernetes nodes by label with `name` equal `key`
-        :param Sequence[_builtins.str] values: optional, if defined, allows select kubernetes nodes by label with `value` in `values`
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        optional, if defined, allows select kubernetes nodes by label with `name` equal `key`
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        optional, if defined, allows select kubernetes nodes by label with `value` in `values`
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesPodTemplatesZonePatch(dict):
-    """
-    allows define custom zone name and will separate ClickHouse `Pods` between nodes, shortcut for `chi.spec.templates.podTemplates.spec.affinity.podAntiAffinity`
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        allows define custom zone name and will separate ClickHouse `Pods` between nodes, shortcut for `chi.spec.templates.podTemplates.spec.affinity.podAntiAffinity`
-
-        :param _builtins.str key: optional, if defined, allows select kubernetes nodes by label with `name` equal `key`
-        :param Sequence[_builtins.str] values: optional, if defined, allows select kubernetes nodes by label with `value` in `values`
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        optional, if defined, allows select kubernetes nodes by label with `name` equal `key`
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        optional, if defined, allows select kubernetes nodes by label with `value` in `values`
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesServiceTemplates(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "generateName":
-            suggest = "generate_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesServiceTemplates. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecTemplatesServiceTemplates.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecTemplatesServiceTemplates.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 generate_name: Optional[_builtins.str] = None,
-                 metadata: Optional[Mapping[str, Any]] = None,
-                 name: Optional[_builtins.str] = None,
-                 spec: Optional[Mapping[str, Any]] = None):
-        """
-        :param _builtins.str generate_name: allows define format for generated `Service` name,
-               look to https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatesservicetemplates
-               for details about available template variables"
-        :param Mapping[str, Any] metadata: allows pass standard object's metadata from template to Service
-               Could be use for define specificly for Cloud Provider metadata which impact to behavior of service
-               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        :param _builtins.str name: template name, could use to link inside
-               chi-level `chi.spec.defaults.templates.serviceTemplate`
-               cluster-level `chi.spec.configuration.clusters.templates.clusterServiceTemplate`
-               shard-level `chi.spec.configuration.clusters.layout.shards.temlates.shardServiceTemplate`
-               replica-level `chi.spec.configuration.clusters.layout.replicas.templates.replicaServiceTemplate` or `chi.spec.configuration.clusters.layout.shards.replicas.replicaServiceTemplate`
-        :param Mapping[str, Any] spec: describe behavior of generated Service
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/
-        """
-        if generate_name is not None:
-            pulumi.set(__self__, "generate_name", generate_name)
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-
-    @_builtins.property
-    @pulumi.getter(name="generateName")
-    def generate_name(self) -> Optional[_builtins.str]:
-        """
-        allows define format for generated `Service` name,
-        look to https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatesservicetemplates
-        for details about available template variables"
-        """
-        return pulumi.get(self, "generate_name")
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows pass standard object's metadata from template to Service
-        Could be use for define specificly for Cloud Provider metadata which impact to behavior of service
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        return pulumi.get(self, "metadata")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        template name, could use to link inside
-        chi-level `chi.spec.defaults.templates.serviceTemplate`
-        cluster-level `chi.spec.configuration.clusters.templates.clusterServiceTemplate`
-        shard-level `chi.spec.configuration.clusters.layout.shards.temlates.shardServiceTemplate`
-        replica-level `chi.spec.configuration.clusters.layout.replicas.templates.replicaServiceTemplate` or `chi.spec.configuration.clusters.layout.shards.replicas.replicaServiceTemplate`
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> Optional[Mapping[str, Any]]:
-        """
-        describe behavior of generated Service
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/
-        """
-        return pulumi.get(self, "spec")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesServiceTemplatesPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "generateName":
-            suggest = "generate_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesServiceTemplatesPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecTemplatesServiceTemplatesPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecTemplatesServiceTemplatesPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 generate_name: Optional[_builtins.str] = None,
-                 metadata: Optional[Mapping[str, Any]] = None,
-                 name: Optional[_builtins.str] = None,
-                 spec: Optional[Mapping[str, Any]] = None):
-        """
-        :param _builtins.str generate_name: allows define format for generated `Service` name,
-               look to https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatesservicetemplates
-               for details about available template variables"
-        :param Mapping[str, Any] metadata: allows pass standard object's metadata from template to Service
-               Could be use for define specificly for Cloud Provider metadata which impact to behavior of service
-               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        :param _builtins.str name: template name, could use to link inside
-               chi-level `chi.spec.defaults.templates.serviceTemplate`
-               cluster-level `chi.spec.configuration.clusters.templates.clusterServiceTemplate`
-               shard-level `chi.spec.configuration.clusters.layout.shards.temlates.shardServiceTemplate`
-               replica-level `chi.spec.configuration.clusters.layout.replicas.templates.replicaServiceTemplate` or `chi.spec.configuration.clusters.layout.shards.replicas.replicaServiceTemplate`
-        :param Mapping[str, Any] spec: describe behavior of generated Service
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/
-        """
-        if generate_name is not None:
-            pulumi.set(__self__, "generate_name", generate_name)
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-
-    @_builtins.property
-    @pulumi.getter(name="generateName")
-    def generate_name(self) -> Optional[_builtins.str]:
-        """
-        allows define format for generated `Service` name,
-        look to https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatesservicetemplates
-        for details about available template variables"
-        """
-        return pulumi.get(self, "generate_name")
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows pass standard object's metadata from template to Service
-        Could be use for define specificly for Cloud Provider metadata which impact to behavior of service
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        return pulumi.get(self, "metadata")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        template name, could use to link inside
-        chi-level `chi.spec.defaults.templates.serviceTemplate`
-        cluster-level `chi.spec.configuration.clusters.templates.clusterServiceTemplate`
-        shard-level `chi.spec.configuration.clusters.layout.shards.temlates.shardServiceTemplate`
-        replica-level `chi.spec.configuration.clusters.layout.replicas.templates.replicaServiceTemplate` or `chi.spec.configuration.clusters.layout.shards.replicas.replicaServiceTemplate`
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> Optional[Mapping[str, Any]]:
-        """
-        describe behavior of generated Service
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/
-        """
-        return pulumi.get(self, "spec")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesVolumeClaimTemplates(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "reclaimPolicy":
-            suggest = "reclaim_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesVolumeClaimTemplates. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecTemplatesVolumeClaimTemplates.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecTemplatesVolumeClaimTemplates.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 metadata: Optional[Mapping[str, Any]] = None,
-                 name: Optional[_builtins.str] = None,
-                 provisioner: Optional[_builtins.str] = None,
-                 reclaim_policy: Optional[_builtins.str] = None,
-                 spec: Optional[Mapping[str, Any]] = None):
-        """
-        :param Mapping[str, Any] metadata: allows to pass standard object's metadata from template to PVC
-               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        :param _builtins.str name: template name, could use to link inside
-               top-level `chi.spec.defaults.templates.dataVolumeClaimTemplate` or `chi.spec.defaults.templates.logVolumeClaimTemplate`,
-               cluster-level `chi.spec.configuration.clusters.templates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.templates.logVolumeClaimTemplate`,
-               shard-level `chi.spec.configuration.clusters.layout.shards.temlates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.layout.shards.temlates.logVolumeClaimTemplate`
-               replica-level `chi.spec.configuration.clusters.layout.replicas.templates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.layout.replicas.templates.logVolumeClaimTemplate`
-        :param _builtins.str provisioner: defines `PVC` provisioner - be it StatefulSet or the Operator
-        :param _builtins.str reclaim_policy: defines behavior of `PVC` deletion.
-               `Delete` by default, if `Retain` specified then `PVC` will be kept when deleting StatefulSet
-        :param Mapping[str, Any] spec: allows define all aspects of `PVC` resource
-               More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes/#persistentvolumeclaims
-        """
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if provisioner is not None:
-            pulumi.set(__self__, "provisioner", provisioner)
-        if reclaim_policy is not None:
-            pulumi.set(__self__, "reclaim_policy", reclaim_policy)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows to pass standard object's metadata from template to PVC
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        return pulumi.get(self, "metadata")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        template name, could use to link inside
-        top-level `chi.spec.defaults.templates.dataVolumeClaimTemplate` or `chi.spec.defaults.templates.logVolumeClaimTemplate`,
-        cluster-level `chi.spec.configuration.clusters.templates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.templates.logVolumeClaimTemplate`,
-        shard-level `chi.spec.configuration.clusters.layout.shards.temlates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.layout.shards.temlates.logVolumeClaimTemplate`
-        replica-level `chi.spec.configuration.clusters.layout.replicas.templates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.layout.replicas.templates.logVolumeClaimTemplate`
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def provisioner(self) -> Optional[_builtins.str]:
-        """
-        defines `PVC` provisioner - be it StatefulSet or the Operator
-        """
-        return pulumi.get(self, "provisioner")
-
-    @_builtins.property
-    @pulumi.getter(name="reclaimPolicy")
-    def reclaim_policy(self) -> Optional[_builtins.str]:
-        """
-        defines behavior of `PVC` deletion.
-        `Delete` by default, if `Retain` specified then `PVC` will be kept when deleting StatefulSet
-        """
-        return pulumi.get(self, "reclaim_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows define all aspects of `PVC` resource
-        More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes/#persistentvolumeclaims
-        """
-        return pulumi.get(self, "spec")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "reclaimPolicy":
-            suggest = "reclaim_policy"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 metadata: Optional[Mapping[str, Any]] = None,
-                 name: Optional[_builtins.str] = None,
-                 provisioner: Optional[_builtins.str] = None,
-                 reclaim_policy: Optional[_builtins.str] = None,
-                 spec: Optional[Mapping[str, Any]] = None):
-        """
-        :param Mapping[str, Any] metadata: allows to pass standard object's metadata from template to PVC
-               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        :param _builtins.str name: template name, could use to link inside
-               top-level `chi.spec.defaults.templates.dataVolumeClaimTemplate` or `chi.spec.defaults.templates.logVolumeClaimTemplate`,
-               cluster-level `chi.spec.configuration.clusters.templates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.templates.logVolumeClaimTemplate`,
-               shard-level `chi.spec.configuration.clusters.layout.shards.temlates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.layout.shards.temlates.logVolumeClaimTemplate`
-               replica-level `chi.spec.configuration.clusters.layout.replicas.templates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.layout.replicas.templates.logVolumeClaimTemplate`
-        :param _builtins.str provisioner: defines `PVC` provisioner - be it StatefulSet or the Operator
-        :param _builtins.str reclaim_policy: defines behavior of `PVC` deletion.
-               `Delete` by default, if `Retain` specified then `PVC` will be kept when deleting StatefulSet
-        :param Mapping[str, Any] spec: allows define all aspects of `PVC` resource
-               More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes/#persistentvolumeclaims
-        """
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if provisioner is not None:
-            pulumi.set(__self__, "provisioner", provisioner)
-        if reclaim_policy is not None:
-            pulumi.set(__self__, "reclaim_policy", reclaim_policy)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows to pass standard object's metadata from template to PVC
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        return pulumi.get(self, "metadata")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        template name, could use to link inside
-        top-level `chi.spec.defaults.templates.dataVolumeClaimTemplate` or `chi.spec.defaults.templates.logVolumeClaimTemplate`,
-        cluster-level `chi.spec.configuration.clusters.templates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.templates.logVolumeClaimTemplate`,
-        shard-level `chi.spec.configuration.clusters.layout.shards.temlates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.layout.shards.temlates.logVolumeClaimTemplate`
-        replica-level `chi.spec.configuration.clusters.layout.replicas.templates.dataVolumeClaimTemplate` or `chi.spec.configuration.clusters.layout.replicas.templates.logVolumeClaimTemplate`
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def provisioner(self) -> Optional[_builtins.str]:
-        """
-        defines `PVC` provisioner - be it StatefulSet or the Operator
-        """
-        return pulumi.get(self, "provisioner")
-
-    @_builtins.property
-    @pulumi.getter(name="reclaimPolicy")
-    def reclaim_policy(self) -> Optional[_builtins.str]:
-        """
-        defines behavior of `PVC` deletion.
-        `Delete` by default, if `Retain` specified then `PVC` will be kept when deleting StatefulSet
-        """
-        return pulumi.get(self, "reclaim_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> Optional[Mapping[str, Any]]:
-        """
-        allows define all aspects of `PVC` resource
-        More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes/#persistentvolumeclaims
-        """
-        return pulumi.get(self, "spec")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplating(dict):
-    """
-    Optional, applicable inside ClickHouseInstallationTemplate only.
-    Defines current ClickHouseInstallationTemplate application options to target ClickHouseInstallation(s)."
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "chiSelector":
-            suggest = "chi_selector"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplating. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecTemplating.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecTemplating.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 chi_selector: Optional[Mapping[str, Any]] = None,
-                 policy: Optional[_builtins.str] = None):
-        """
-        Optional, applicable inside ClickHouseInstallationTemplate only.
-        Defines current ClickHouseInstallationTemplate application options to target ClickHouseInstallation(s)."
-
-
-        :param Mapping[str, Any] chi_selector: Optional, defines selector for ClickHouseInstallation(s) to be templated with ClickhouseInstallationTemplate
-        :param _builtins.str policy: When defined as `auto` inside ClickhouseInstallationTemplate, this ClickhouseInstallationTemplate
-               will be auto-added into ClickHouseInstallation, selectable by `chiSelector`.
-               Default value is `manual`, meaning ClickHouseInstallation should request this ClickhouseInstallationTemplate explicitly.
-        """
-        if chi_selector is not None:
-            pulumi.set(__self__, "chi_selector", chi_selector)
-        if policy is not None:
-            pulumi.set(__self__, "policy", policy)
-
-    @_builtins.property
-    @pulumi.getter(name="chiSelector")
-    def chi_selector(self) -> Optional[Mapping[str, Any]]:
-        """
-        Optional, defines selector for ClickHouseInstallation(s) to be templated with ClickhouseInstallationTemplate
-        """
-        return pulumi.get(self, "chi_selector")
-
-    @_builtins.property
-    @pulumi.getter
-    def policy(self) -> Optional[_builtins.str]:
-        """
-        When defined as `auto` inside ClickhouseInstallationTemplate, this ClickhouseInstallationTemplate
-        will be auto-added into ClickHouseInstallation, selectable by `chiSelector`.
-        Default value is `manual`, meaning ClickHouseInstallation should request this ClickhouseInstallationTemplate explicitly.
-        """
-        return pulumi.get(self, "policy")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecTemplatingPatch(dict):
-    """
-    Optional, applicable inside ClickHouseInstallationTemplate only.
-    Defines current ClickHouseInstallationTemplate application options to target ClickHouseInstallation(s)."
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "chiSelector":
-            suggest = "chi_selector"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatingPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecTemplatingPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecTemplatingPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 chi_selector: Optional[Mapping[str, Any]] = None,
-                 policy: Optional[_builtins.str] = None):
-        """
-        Optional, applicable inside ClickHouseInstallationTemplate only.
-        Defines current ClickHouseInstallationTemplate application options to target ClickHouseInstallation(s)."
-
-
-        :param Mapping[str, Any] chi_selector: Optional, defines selector for ClickHouseInstallation(s) to be templated with ClickhouseInstallationTemplate
-        :param _builtins.str policy: When defined as `auto` inside ClickhouseInstallationTemplate, this ClickhouseInstallationTemplate
-               will be auto-added into ClickHouseInstallation, selectable by `chiSelector`.
-               Default value is `manual`, meaning ClickHouseInstallation should request this ClickhouseInstallationTemplate explicitly.
-        """
-        if chi_selector is not None:
-            pulumi.set(__self__, "chi_selector", chi_selector)
-        if policy is not None:
-            pulumi.set(__self__, "policy", policy)
-
-    @_builtins.property
-    @pulumi.getter(name="chiSelector")
-    def chi_selector(self) -> Optional[Mapping[str, Any]]:
-        """
-        Optional, defines selector for ClickHouseInstallation(s) to be templated with ClickhouseInstallationTemplate
-        """
-        return pulumi.get(self, "chi_selector")
-
-    @_builtins.property
-    @pulumi.getter
-    def policy(self) -> Optional[_builtins.str]:
-        """
-        When defined as `auto` inside ClickhouseInstallationTemplate, this ClickhouseInstallationTemplate
-        will be auto-added into ClickHouseInstallation, selectable by `chiSelector`.
-        Default value is `manual`, meaning ClickHouseInstallation should request this ClickhouseInstallationTemplate explicitly.
-        """
-        return pulumi.get(self, "policy")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecUseTemplates(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "useType":
-            suggest = "use_type"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecUseTemplates. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecUseTemplates.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecUseTemplates.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 namespace: Optional[_builtins.str] = None,
-                 use_type: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str name: name of `ClickHouseInstallationTemplate` (chit) resource
-        :param _builtins.str namespace: Kubernetes namespace where need search `chit` resource, depending on `watchNamespaces` settings in `clickhouse-operator`
-        :param _builtins.str use_type: optional, current strategy is only merge, and current `chi` settings have more priority than merged template `chit`
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if namespace is not None:
-            pulumi.set(__self__, "namespace", namespace)
-        if use_type is not None:
-            pulumi.set(__self__, "use_type", use_type)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        name of `ClickHouseInstallationTemplate` (chit) resource
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespace(self) -> Optional[_builtins.str]:
-        """
-        Kubernetes namespace where need search `chit` resource, depending on `watchNamespaces` settings in `clickhouse-operator`
-        """
-        return pulumi.get(self, "namespace")
-
-    @_builtins.property
-    @pulumi.getter(name="useType")
-    def use_type(self) -> Optional[_builtins.str]:
-        """
-        optional, current strategy is only merge, and current `chi` settings have more priority than merged template `chit`
-        """
-        return pulumi.get(self, "use_type")
-
-
-@pulumi.output_type
-class ClickHouseInstallationSpecUseTemplatesPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "useType":
-            suggest = "use_type"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecUseTemplatesPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationSpecUseTemplatesPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationSpecUseTemplatesPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 namespace: Optional[_builtins.str] = None,
-                 use_type: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str name: name of `ClickHouseInstallationTemplate` (chit) resource
-        :param _builtins.str namespace: Kubernetes namespace where need search `chit` resource, depending on `watchNamespaces` settings in `clickhouse-operator`
-        :param _builtins.str use_type: optional, current strategy is only merge, and current `chi` settings have more priority than merged template `chit`
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if namespace is not None:
-            pulumi.set(__self__, "namespace", namespace)
-        if use_type is not None:
-            pulumi.set(__self__, "use_type", use_type)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        name of `ClickHouseInstallationTemplate` (chit) resource
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespace(self) -> Optional[_builtins.str]:
-        """
-        Kubernetes namespace where need search `chit` resource, depending on `watchNamespaces` settings in `clickhouse-operator`
-        """
-        return pulumi.get(self, "namespace")
-
-    @_builtins.property
-    @pulumi.getter(name="useType")
-    def use_type(self) -> Optional[_builtins.str]:
-        """
-        optional, current strategy is only merge, and current `chi` settings have more priority than merged template `chit`
-        """
-        return pulumi.get(self, "use_type")
-
-
-@pulumi.output_type
-class ClickHouseInstallationStatus(dict):
-    """
-    Status contains many fields like a normalized configuration, clickhouse-operator version, current action and all applied action list, current taskID and all applied taskIDs and other
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "actionPlan":
-            suggest = "action_plan"
-        elif key == "chop-commit":
-            suggest = "chop_commit"
-        elif key == "chop-date":
-            suggest = "chop_date"
-        elif key == "chop-ip":
-            suggest = "chop_ip"
-        elif key == "chop-version":
-            suggest = "chop_version"
-        elif key == "hostsAdded":
-            suggest = "hosts_added"
-        elif key == "hostsCompleted":
-            suggest = "hosts_completed"
-        elif key == "hostsDelete":
-            suggest = "hosts_delete"
-        elif key == "hostsDeleted":
-            suggest = "hosts_deleted"
-        elif key == "hostsUnchanged":
-            suggest = "hosts_unchanged"
-        elif key == "hostsUpdated":
-            suggest = "hosts_updated"
-        elif key == "hostsWithReplicaCaughtUp":
-            suggest = "hosts_with_replica_caught_up"
-        elif key == "hostsWithTablesCreated":
-            suggest = "hosts_with_tables_created"
-        elif key == "normalizedCompleted":
-            suggest = "normalized_completed"
-        elif key == "pod-ips":
-            suggest = "pod_ips"
-        elif key == "taskID":
-            suggest = "task_id"
-        elif key == "taskIDsCompleted":
-            suggest = "task_ids_completed"
-        elif key == "taskIDsStarted":
-            suggest = "task_ids_started"
-        elif key == "usedTemplates":
-            suggest = "used_templates"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationStatus. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationStatus.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationStatus.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 action: Optional[_builtins.str] = None,
-                 action_plan: Optional[Mapping[str, Any]] = None,
-                 actions: Optional[Sequence[_builtins.str]] = None,
-                 chop_commit: Optional[_builtins.str] = None,
-                 chop_date: Optional[_builtins.str] = None,
-                 chop_ip: Optional[_builtins.str] = None,
-                 chop_version: Optional[_builtins.str] = None,
-                 clusters: Optional[_builtins.int] = None,
-                 endpoint: Optional[_builtins.str] = None,
-                 endpoints: Optional[Sequence[_builtins.str]] = None,
-                 error: Optional[_builtins.str] = None,
-                 errors: Optional[Sequence[_builtins.str]] = None,
-                 fqdns: Optional[Sequence[_builtins.str]] = None,
-                 generation: Optional[_builtins.int] = None,
-                 hosts: Optional[_builtins.int] = None,
-                 hosts_added: Optional[_builtins.int] = None,
-                 hosts_completed: Optional[_builtins.int] = None,
-                 hosts_delete: Optional[_builtins.int] = None,
-                 hosts_deleted: Optional[_builtins.int] = None,
-                 hosts_unchanged: Optional[_builtins.int] = None,
-                 hosts_updated: Optional[_builtins.int] = None,
-                 hosts_with_replica_caught_up: Optional[Sequence[_builtins.str]] = None,
-                 hosts_with_tables_created: Optional[Sequence[_builtins.str]] = None,
-                 normalized: Optional[Mapping[str, Any]] = None,
-                 normalized_completed: Optional[Mapping[str, Any]] = None,
-                 pod_ips: Optional[Sequence[_builtins.str]] = None,
-                 pods: Optional[Sequence[_builtins.str]] = None,
-                 replicas: Optional[_builtins.int] = None,
-                 shards: Optional[_builtins.int] = None,
-                 status: Optional[_builtins.str] = None,
-                 task_id: Optional[_builtins.str] = None,
-                 task_ids_completed: Optional[Sequence[_builtins.str]] = None,
-                 task_ids_started: Optional[Sequence[_builtins.str]] = None,
-                 used_templates: Optional[Mapping[str, Any]] = None):
-        """
-        Status contains many fields like a normalized configuration, clickhouse-operator version, current action and all applied action list, current taskID and all applied taskIDs and other
-
-
-        :param _builtins.str action: Action
-        :param Mapping[str, Any] action_plan: Action Plan
-        :param Sequence[_builtins.str] actions: Actions
-        :param _builtins.str chop_commit: Operator git commit SHA
-        :param _builtins.str chop_date: Operator build date
-        :param _builtins.str chop_ip: IP address of the operator's pod which managed this resource
-        :param _builtins.str chop_version: Operator version
-        :param _builtins.int clusters: Clusters count
-        :param _builtins.str endpoint: Endpoint
-        :param Sequence[_builtins.str] endpoints: All endpoints
-        :param _builtins.str error: Last error
-        :param Sequence[_builtins.str] errors: Errors
-        :param Sequence[_builtins.str] fqdns: Pods FQDNs
-        :param _builtins.int generation: Generation
-        :param _builtins.int hosts: Hosts count
-        :param _builtins.int hosts_added: Added Hosts count
-        :param _builtins.int hosts_completed: Completed Hosts count
-        :param _builtins.int hosts_delete: About to delete Hosts count
-        :param _builtins.int hosts_deleted: Deleted Hosts count
-        :param _builtins.int hosts_unchanged: Unchanged Hosts count
-        :param _builtins.int hosts_updated: Updated Hosts count
-        :param Sequence[_builtins.str] hosts_with_replica_caught_up: List of hosts with replica caught up
-        :param Sequence[_builtins.str] hosts_with_tables_created: List of hosts with tables created by the operator
-        :param Mapping[str, Any] normalized: Normalized resource requested
-        :param Mapping[str, Any] normalized_completed: Normalized resource completed
-        :param Sequence[_builtins.str] pod_ips: Pod IPs
-        :param Sequence[_builtins.str] pods: Pods
-        :param _builtins.int replicas: Replicas count
-        :param _builtins.int shards: Shards count
-        :param _builtins.str status: Status
-        :param _builtins.str task_id: Current task id
-        :param Sequence[_builtins.str] task_ids_completed: Completed task ids
-        :param Sequence[_builtins.str] task_ids_started: Started task ids
-        :param Mapping[str, Any] used_templates: List of templates used to build this CHI
-        """
-        if action is not None:
-            pulumi.set(__self__, "action", action)
-        if action_plan is not None:
-            pulumi.set(__self__, "action_plan", action_plan)
-        if actions is not None:
-            pulumi.set(__self__, "actions", actions)
-        if chop_commit is not None:
-            pulumi.set(__self__, "chop_commit", chop_commit)
-        if chop_date is not None:
-            pulumi.set(__self__, "chop_date", chop_date)
-        if chop_ip is not None:
-            pulumi.set(__self__, "chop_ip", chop_ip)
-        if chop_version is not None:
-            pulumi.set(__self__, "chop_version", chop_version)
-        if clusters is not None:
-            pulumi.set(__self__, "clusters", clusters)
-        if endpoint is not None:
-            pulumi.set(__self__, "endpoint", endpoint)
-        if endpoints is not None:
-            pulumi.set(__self__, "endpoints", endpoints)
-        if error is not None:
-            pulumi.set(__self__, "error", error)
-        if errors is not None:
-            pulumi.set(__self__, "errors", errors)
-        if fqdns is not None:
-            pulumi.set(__self__, "fqdns", fqdns)
-        if generation is not None:
-            pulumi.set(__self__, "generation", generation)
-        if hosts is not None:
-            pulumi.set(__self__, "hosts", hosts)
-        if hosts_added is not None:
-            pulumi.set(__self__, "hosts_added", hosts_added)
-        if hosts_completed is not None:
-            pulumi.set(__self__, "hosts_completed", hosts_completed)
-        if hosts_delete is not None:
-            pulumi.set(__self__, "hosts_delete", hosts_delete)
-        if hosts_deleted is not None:
-            pulumi.set(__self__, "hosts_deleted", hosts_deleted)
-        if hosts_unchanged is not None:
-            pulumi.set(__self__, "hosts_unchanged", hosts_unchanged)
-        if hosts_updated is not None:
-            pulumi.set(__self__, "hosts_updated", hosts_updated)
-        if hosts_with_replica_caught_up is not None:
-            pulumi.set(__self__, "hosts_with_replica_caught_up", hosts_with_replica_caught_up)
-        if hosts_with_tables_created is not None:
-            pulumi.set(__self__, "hosts_with_tables_created", hosts_with_tables_created)
-        if normalized is not None:
-            pulumi.set(__self__, "normalized", normalized)
-        if normalized_completed is not None:
-            pulumi.set(__self__, "normalized_completed", normalized_completed)
-        if pod_ips is not None:
-            pulumi.set(__self__, "pod_ips", pod_ips)
-        if pods is not None:
-            pulumi.set(__self__, "pods", pods)
-        if replicas is not None:
-            pulumi.set(__self__, "replicas", replicas)
-        if shards is not None:
-            pulumi.set(__self__, "shards", shards)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-        if task_id is not None:
-            pulumi.set(__self__, "task_id", task_id)
-        if task_ids_completed is not None:
-            pulumi.set(__self__, "task_ids_completed", task_ids_completed)
-        if task_ids_started is not None:
-            pulumi.set(__self__, "task_ids_started", task_ids_started)
-        if used_templates is not None:
-            pulumi.set(__self__, "used_templates", used_templates)
-
-    @_builtins.property
-    @pulumi.getter
-    def action(self) -> Optional[_builtins.str]:
-        """
-        Action
-        """
-        return pulumi.get(self, "action")
-
-    @_builtins.property
-    @pulumi.getter(name="actionPlan")
-    def action_plan(self) -> Optional[Mapping[str, Any]]:
-        """
-        Action Plan
-        """
-        return pulumi.get(self, "action_plan")
-
-    @_builtins.property
-    @pulumi.getter
-    def actions(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Actions
-        """
-        return pulumi.get(self, "actions")
-
-    @_builtins.property
-    @pulumi.getter(name="chop-commit")
-    def chop_commit(self) -> Optional[_builtins.str]:
-        """
-        Operator git commit SHA
-        """
-        return pulumi.get(self, "chop_commit")
-
-    @_builtins.property
-    @pulumi.getter(name="chop-date")
-    def chop_date(self) -> Optional[_builtins.str]:
-        """
-        Operator build date
-        """
-        return pulumi.get(self, "chop_date")
-
-    @_builtins.property
-    @pulumi.getter(name="chop-ip")
-    def chop_ip(self) -> Optional[_builtins.str]:
-        """
-        IP address of the operator's pod which managed this resource
-        """
-        return pulumi.get(self, "chop_ip")
-
-    @_builtins.property
-    @pulumi.getter(name="chop-version")
-    def chop_version(self) -> Optional[_builtins.str]:
-        """
-        Operator version
-        """
-        return pulumi.get(self, "chop_version")
-
-    @_builtins.property
-    @pulumi.getter
-    def clusters(self) -> Optional[_builtins.int]:
-        """
-        Clusters count
-        """
-        return pulumi.get(self, "clusters")
-
-    @_builtins.property
-    @pulumi.getter
-    def endpoint(self) -> Optional[_builtins.str]:
-        """
-        Endpoint
-        """
-        return pulumi.get(self, "endpoint")
-
-    @_builtins.property
-    @pulumi.getter
-    def endpoints(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        All endpoints
-        """
-        return pulumi.get(self, "endpoints")
-
-    @_builtins.property
-    @pulumi.getter
-    def error(self) -> Optional[_builtins.str]:
-        """
-        Last error
-        """
-        return pulumi.get(self, "error")
-
-    @_builtins.property
-    @pulumi.getter
-    def errors(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Errors
-        """
-        return pulumi.get(self, "errors")
-
-    @_builtins.property
-    @pulumi.getter
-    def fqdns(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Pods FQDNs
-        """
-        return pulumi.get(self, "fqdns")
-
-    @_builtins.property
-    @pulumi.getter
-    def generation(self) -> Optional[_builtins.int]:
-        """
-        Generation
-        """
-        return pulumi.get(self, "generation")
-
-    @_builtins.property
-    @pulumi.getter
-    def hosts(self) -> Optional[_builtins.int]:
-        """
-        Hosts count
-        """
-        return pulumi.get(self, "hosts")
-
-    @_builtins.property
-    @pulumi.getter(name="hostsAdded")
-    def hosts_added(self) -> Optional[_builtins.int]:
-        """
-        Added Hosts count
-        """
-        return pulumi.get(self, "hosts_added")
-
-    @_builtins.property
-    @pulumi.getter(name="hostsCompleted")
-    def hosts_completed(self) -> Optional[_builtins.int]:
-        """
-        Completed Hosts count
-        """
-        return pulumi.get(self, "hosts_completed")
-
-    @_builtins.property
-    @pulumi.getter(name="hostsDelete")
-    def hosts_delete(self) -> Optional[_builtins.int]:
-        """
-        About to delete Hosts count
-        """
-        return pulumi.get(self, "hosts_delete")
-
-    @_builtins.property
-    @pulumi.getter(name="hostsDeleted")
-    def hosts_deleted(self) -> Optional[_builtins.int]:
-        """
-        Deleted Hosts count
-        """
-        return pulumi.get(self, "hosts_deleted")
-
-    @_builtins.property
-    @pulumi.getter(name="hostsUnchanged")
-    def hosts_unchanged(self) -> Optional[_builtins.int]:
-        """
-        Unchanged Hosts count
-        """
-        return pulumi.get(self, "hosts_unchanged")
-
-    @_builtins.property
-    @pulumi.getter(name="hostsUpdated")
-    def hosts_updated(self) -> Optional[_builtins.int]:
-        """
-        Updated Hosts count
-        """
-        return pulumi.get(self, "hosts_updated")
-
-    @_builtins.property
-    @pulumi.getter(name="hostsWithReplicaCaughtUp")
-    def hosts_with_replica_caught_up(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        List of hosts with replica caught up
-        """
-        return pulumi.get(self, "hosts_with_replica_caught_up")
-
-    @_builtins.property
-    @pulumi.getter(name="hostsWithTablesCreated")
-    def hosts_with_tables_created(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        List of hosts with tables created by the operator
-        """
-        return pulumi.get(self, "hosts_with_tables_created")
-
-    @_builtins.property
-    @pulumi.getter
-    def normalized(self) -> Optional[Mapping[str, Any]]:
-        """
-        Normalized resource requested
-        """
-        return pulumi.get(self, "normalized")
-
-    @_builtins.property
-    @pulumi.getter(name="normalizedCompleted")
-    def normalized_completed(self) -> Optional[Mapping[str, Any]]:
-        """
-        Normalized resource completed
-        """
-        return pulumi.get(self, "normalized_completed")
-
-    @_builtins.property
-    @pulumi.getter(name="pod-ips")
-    def pod_ips(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Pod IPs
-        """
-        return pulumi.get(self, "pod_ips")
-
-    @_builtins.property
-    @pulumi.getter
-    def pods(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Pods
-        """
-        return pulumi.get(self, "pods")
-
-    @_builtins.property
-    @pulumi.getter
-    def replicas(self) -> Optional[_builtins.int]:
-        """
-        Replicas count
-        """
-        return pulumi.get(self, "replicas")
-
-    @_builtins.property
-    @pulumi.getter
-    def shards(self) -> Optional[_builtins.int]:
-        """
-        Shards count
-        """
-        return pulumi.get(self, "shards")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional[_builtins.str]:
-        """
-        Status
-        """
-        return pulumi.get(self, "status")
-
-    @_builtins.property
-    @pulumi.getter(name="taskID")
-    def task_id(self) -> Optional[_builtins.str]:
-        """
-        Current task id
-        """
-        return pulumi.get(self, "task_id")
-
-    @_builtins.property
-    @pulumi.getter(name="taskIDsCompleted")
-    def task_ids_completed(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Completed task ids
-        """
-        return pulumi.get(self, "task_ids_completed")
-
-    @_builtins.property
-    @pulumi.getter(name="taskIDsStarted")
-    def task_ids_started(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Started task ids
-        """
-        return pulumi.get(self, "task_ids_started")
-
-    @_builtins.property
-    @pulumi.getter(name="usedTemplates")
-    def used_templates(self) -> Optional[Mapping[str, Any]]:
-        """
-        List of templates used to build this CHI
-        """
-        return pulumi.get(self, "used_templates")
-
-
-@pulumi.output_type
-class ClickHouseInstallationStatusPatch(dict):
-    """
-    Status contains many fields like a normalized configuration, clickhouse-operator version, current action and all applied action list, current taskID and all applied taskIDs and other
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "actionPlan":
-            suggest = "action_plan"
-        elif key == "chop-commit":
-            suggest = "chop_commit"
-        elif key == "chop-date":
-            suggest = "chop_date"
-        elif key == "chop-ip":
-            suggest = "chop_ip"
-        elif key == "chop-version":
-            suggest = "chop_version"
-        elif key == "hostsAdded":
-            suggest = "hosts_added"
-        elif key == "hostsCompleted":
-            suggest = "hosts_completed"
-        elif key == "hostsDelete":
-            suggest = "hosts_delete"
-        elif key == "hostsDeleted":
-            suggest = "hosts_deleted"
-        elif key == "hostsUnchanged":
-            suggest = "hosts_unchanged"
-        elif key == "hostsUpdated":
-            suggest = "hosts_updated"
-        elif key == "hostsWithReplicaCaughtUp":
-            suggest = "hosts_with_replica_caught_up"
-        elif key == "hostsWithTablesCreated":
-            suggest = "hosts_with_tables_created"
-        elif key == "normalizedCompleted":
-            suggest = "normalized_completed"
-        elif key == "pod-ips":
-            suggest = "pod_ips"
-        elif key == "taskID":
-            suggest = "task_id"
-        elif key == "taskIDsCompleted":
-            suggest = "task_ids_completed"
-        elif key == "taskIDsStarted":
-            suggest = "task_ids_started"
-        elif key == "usedTemplates":
-            suggest = "used_templates"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationStatusPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ClickHouseInstallationStatusPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ClickHouseInstallationStatusPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 action: Optional[_builtins.str] = None,
-                 action_plan: Optional[Mapping[str, Any]] = None,
-                 actions: Optional[Sequence[_builtins.str]] = None,
-                 chop_commit: Optional[_builtins.str] = None,
-                 chop_date: Optional[_builtins.str] = None,
-                 chop_ip: Optional[_builtins.str] = None,
-                 chop_version: Optional[_builtins.str] = None,
-                 clusters: Optional[_builtins.int] = None,
-                 endpoint: Optional[_builtins.str] = None,
-                 endpoints: Optional[Sequence[_builtins.str]] = None,
-                 error: Optional[_builtins.str] = None,
-                 errors: Optional[Sequence[_builtins.str]] = None,
-                 fqdns: Optional[Sequence[_builtins.str]] = None,
-                 generation: Optional[_builtins.int] = None,
-                 hosts: Optional[_builtins.int] = None,
-                 hosts_added: Optional[_builtins.int] = None,
-                 hosts_completed: Optional[_builtins.int] = None,
-                 hosts_delete: Optional[_builtins.int] = None,
-                 hosts_deleted: Optional[_builtins.int] = None,
-                 hosts_unchanged: Optional[_builtins.int] = None,
-                 hosts_updated: Optional[_builtins.int] = None,
-                 hosts_with_replica_caught_up: Optional[Sequence[_builtins.str]] = None,
-                 hosts_with_tables_created: Optional[Sequence[_builtins.str]] = None,
-                 normalized: Optional[Mapping[str, Any]] = None,
-                 normalized_completed: Optional[Mapping[str, Any]] = None,
-                 pod_ips: Optional[Sequence[_builtins.str]] = None,
-                 pods: Optional[Sequence[_builtins.str]] = None,
-                 replicas: Optional[_builtins.int] = None,
-                 shards: Optional[_builtins.int] = None,
-                 status: Optional[_builtins.str] = None,
-                 task_id: Optional[_builtins.str] = None,
-                 task_ids_completed: Optional[Sequence[_builtins.str]] = None,
-                 task_ids_started: Optional[Sequence[_builtins.str]] = None,
-                 used_templates: Optional[Mapping[str, Any]] = None):
-        """
-        Status contains many fields like a normalized configuration, clickhouse-operator version, current action and all applied action list, current taskID and all applied taskIDs and other
-
-
-        :param _builtins.str action: Action
-        :param Mapping[str, Any] action_plan: Action Plan
-        :param Sequence[_builtins.str] actions: Actions
-        :param _builtins.str chop_commit: Operator git commit SHA
-        :param _builtins.str chop_date: Operator build date
-        :param _builtins.str chop_ip: IP address of the operator's pod which managed this resource
-        :param _builtins.str chop_version: Operator version
-        :param _builtins.int clusters: Clusters count
-        :param _builtins.str endpoint: Endpoint
-        :param Sequence[_builtins.str] endpoints: All endpoints
-        :param _builtins.str error: Last error
-        :param Sequence[_builtins.str] errors: Errors
-        :param Sequence[_builtins.str] fqdns: Pods FQDNs
-        :param _builtins.int generation: Generation
-        :param _builtins.int hosts: Hosts count
-        :param _builtins.int hosts_added: Added Hosts count
-        :param _builtins.int hosts_completed: Completed Hosts count
-        :param _builtins.int hosts_delete: About to delete Hosts count
-        :param _builtins.int hosts_deleted: Deleted Hosts count
-        :param _builtins.int hosts_unchanged: Unchanged Hosts count
-        :param _builtins.int hosts_updated: Updated Hosts count
-        :param Sequence[_builtins.str] hosts_with_replica_caught_up: List of hosts with replica caught up
-        :param Sequence[_builtins.str] hosts_with_tables_created: List of hosts with tables created by the operator
-        :param Mapping[str, Any] normalized: Normalized resource requested
-        :param Mapping[str, Any] normalized_completed: Normalized resource completed
-        :param Sequence[_builtins.str] pod_ips: Pod IPs
-        :param Sequence[_builtins.str] pods: Pods
-        :param _builtins.int replicas: Replicas count
-        :param _builtins.int shards: Shards count
-        :param _builtins.str status: Status
-        :param _builtins.str task_id: Current task id
-        :param Sequence[_builtins.str] task_ids_completed: Completed task ids
-        :param Sequence[_builtins.str] task_ids_started: Started task ids
-        :param Mapping[str, Any] used_templates: List of templates used to build this CHI
-        """
-        if action is not None:
-            pulumi.set(__self__, "action", action)
-        if action_plan is not None:
-            pulumi.set(__self__, "action_plan", action_plan)
-        if actions is not None:
-            pulumi.set(__self__, "actions", actions)
-        if chop_commit is not None:
-            pulumi.set(__self__, "chop_commit", chop_commit)
-        if chop_date is not None:
-            pulumi.set(__self__, "chop_date", chop_date)
-        if chop_ip is not None:
-            pulumi.set(__self__, "chop_ip", chop_ip)
-        if chop_version is not None:
-            pulumi.set(__self__, "chop_version", chop_version)
-        if clusters is not None:
-            pulumi.set(__self__, "clusters", clusters)
-        if endpoint is not None:
-            pulumi.set(__self__, "endpoint", endpoint)
-        if endpoints is not None:
-            pulumi.set(__self__, "endpoints", endpoints)
-        if error is not None:
-            pulumi.set(__self__, "error", error)
-        if errors is not None:
-            pulumi.set(__self__, "errors", errors)
-        if fqdns is not None:
-            pulumi.set(__self__, "fqdns", fqdns)
-        if generation is not None:
-            pulumi.set(__self__, "generation", generation)
-        if hosts is not None:
-            pulumi.set(__self__, "hosts", hosts)
-        if hosts_added is not None:
-            pulumi.set(__self__, "hosts_added", hosts_added)
-        if hosts_completed is not None:
-            pulumi.set(__self__, "hosts_completed", hosts_completed)
-        if hosts_delete is not None:
-            pulumi.set(__self__, "hosts_delete", hosts_delete)
-        if hosts_deleted is not None:
-            pulumi.set(__self__, "hosts_deleted", hosts_deleted)
-        if hosts_unchanged is not None:
-            pulumi.set(__self__, "hosts_unchanged", hosts_unchanged)
-        if hosts_updated is not None:
-            pulumi.set(__self__, "hosts_updated", hosts_updated)
-        if hosts_with_replica_caught_up is not None:
-            pulumi.set(__self__, "hosts_with_replica_caught_up", hosts_with_replica_caught_up)
-        if hosts_with_tables_created is not None:
-            pulumi.set(__self__, "hosts_with_tables_created", hosts_with_tables_created)
-        if normalized is not None:
-            pulumi.set(__self__, "normalized", normalized)
-        if normalized_completed is not None:
-            pulumi.set(__self__, "normalized_completed", normalized_completed)
-        if pod_ips is not None:
-            pulumi.set(__self__, "pod_ips", pod_ips)
-        if pods is not None:
-            pulumi.set(__self__, "pods", pods)
-        if replicas is not None:
-            pulumi.set(__self__, "replicas", replicas)
-        if shards is not None:
-            pulumi.set(__self__, "shards", shards)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-        if task_id is not None:
-            pulumi.set(__self__, "task_id", task_id)
-        if task_ids_completed is not None:
-            pulumi.set(__self__, "task_ids_completed", task_ids_completed)
-        if task_ids_started is not None:
-            pulumi.set(__self__, "task_ids_started", task_ids_started)
-        if used_templates is not None:
-            pulumi.set(__self__, "used_templates", used_templates)
-
-    @_builtins.property
-    @pulumi.getter
-    def action(self) -> Optional[_builtins.str]:
-        """
-        Action
-        """
-        return pulumi.get(self, "action")
-
-    @_builtins.property
-    @pulumi.getter(name="actionPlan")
-    def action_plan(self) -> Optional[Mapping[str, Any]]:
-        """
-        Action Plan
-        """
-        return pulumi.get(self, "action_plan")
-
-    @_builtins.property
-    @pulumi.getter
-    def actions(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Actions
-        """
-        return pulumi.get(self, "actions")
-
-    @_builtins.property
-    @pulumi.getter(name="chop-commit")
-    def chop_commit(self) -> Optional[_builtins.str]:
-        """
-        Operator git commit SHA
-        """
-        return pulumi.get(self, "chop_commit")
-
-    @_builtins.property
-    @pulumi.getter(name="chop-date")
-    def chop_date(self) -> Optional[_builtins.str]:
-        """
-        Operator build date
-        """
-        return pulumi.get(self, "chop_date")
-
-    @_builtins.property
-    @pulumi.getter(name="chop-ip")
-    def chop_ip(self) -> Optional[_builtins.str]:
-        """
-        IP address of the operator's pod which managed this resource
-        """
-        return pulumi.get(self, "chop_ip")
-
-    @_builtins.property
-    @pulumi.getter(name="chop-version")
-    def chop_version(self) -> Optional[_builtins.str]:
-        """
-        Operator version
-        """
-        return pulumi.get(self, "chop_version")
-
-    @_builtins.property
-    @pulumi.getter
-    def clusters(self) -> Optional[_builtins.int]:
-        """
-        Clusters count
-        """
-        return pulumi.get(self, "clusters")
-
-    @_builtins.property
-    @pulumi.getter
-    def endpoint(self) -> Optional[_builtins.str]:
-        """
-        Endpoint
-        """
-        return pulumi.get(self, "endpoint")
-
-    @_builtins.property
-    @pulumi.getter
-    def endpoints(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        All endpoints
-        """
-        return pulumi.get(self, "endpoints")
-
-    @_builtins.property
-    @pulumi.getter
-    def error(self) -> Optional[_builtins.str]:
-        """
-        Last error
-        """
-        return pulumi.get(self, "error")
-
-    @_builtins.property
-    @pulumi.getter
-    def errors(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Errors
-        """
-        return pulumi.get(self, "errors")
-
-    @_builtins.property
-    @pulumi.getter
-    def fqdns(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Pods FQDNs
-        """
-        return pulumi.get(self, "fqdns")
-
-    @_builtins.property
-    @pulumi.getter
-    def generation(self) -> Optional[_builtins.int]:
-        """
-        Generation
-        """
-        return pulumi.get(self, "generation")
-
-    @_builtins.property
-    @pulumi.getter
-    def hosts(self) -> Optional[_builtins.int]:
-        """
-        Hosts count
-        """
-        return pulumi.get(self, "hosts")
-
-    @_builtins.property
-    @pulumi.getter(name="hostsAdded")
-    def hosts_added(self) -> Optional[_builtins.int]:
-        """
-        Added Hosts count
-        """
-        return pulumi.get(self, "hosts_added")
-
-    @_builtins.property
-    @pulumi.getter(name="hostsCompleted")
-    def hosts_completed(self) -> Optional[_builtins.int]:
-        """
-        Completed Hosts count
-        """
-        return pulumi.get(self, "hosts_completed")
-
-    @_builtins.property
-    @pulumi.getter(name="hostsDelete")
-    def hosts_delete(self) -> Optional[_builtins.int]:
-        """
-        About to delete Hosts count
-        """
-        return pulumi.get(self, "hosts_delete")
-
-    @_builtins.property
-    @pulumi.getter(name="hostsDeleted")
-    def hosts_deleted(self) -> Optional[_builtins.int]:
-        """
-        Deleted Hosts count
-        """
-        return pulumi.get(self, "hosts_deleted")
-
-    @_builtins.property
-    @pulumi.getter(name="hostsUnchanged")
-    def hosts_unchanged(self) -> Optional[_builtins.int]:
-        """
-        Unchanged Hosts count
-        """
-        return pulumi.get(self, "hosts_unchanged")
-
-    @_builtins.property
-    @pulumi.getter(name="hostsUpdated")
-    def hosts_updated(self) -> Optional[_builtins.int]:
-        """
-        Updated Hosts count
-        """
-        return pulumi.get(self, "hosts_updated")
-
-    @_builtins.property
-    @pulumi.getter(name="hostsWithReplicaCaughtUp")
-    def hosts_with_replica_caught_up(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        List of hosts with replica caught up
-        """
-        return pulumi.get(self, "hosts_with_replica_caught_up")
-
-    @_builtins.property
-    @pulumi.getter(name="hostsWithTablesCreated")
-    def hosts_with_tables_created(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        List of hosts with tables created by the operator
-        """
-        return pulumi.get(self, "hosts_with_tables_created")
-
-    @_builtins.property
-    @pulumi.getter
-    def normalized(self) -> Optional[Mapping[str, Any]]:
-        """
-        Normalized resource requested
-        """
-        return pulumi.get(self, "normalized")
-
-    @_builtins.property
-    @pulumi.getter(name="normalizedCompleted")
-    def normalized_completed(self) -> Optional[Mapping[str, Any]]:
-        """
-        Normalized resource completed
-        """
-        return pulumi.get(self, "normalized_completed")
-
-    @_builtins.property
-    @pulumi.getter(name="pod-ips")
-    def pod_ips(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Pod IPs
-        """
-        return pulumi.get(self, "pod_ips")
-
-    @_builtins.property
-    @pulumi.getter
-    def pods(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Pods
-        """
-        return pulumi.get(self, "pods")
-
-    @_builtins.property
-    @pulumi.getter
-    def replicas(self) -> Optional[_builtins.int]:
-        """
-        Replicas count
-        """
-        return pulumi.get(self, "replicas")
-
-    @_builtins.property
-    @pulumi.getter
-    def shards(self) -> Optional[_builtins.int]:
-        """
-        Shards count
-        """
-        return pulumi.get(self, "shards")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional[_builtins.str]:
-        """
-        Status
-        """
-        return pulumi.get(self, "status")
-
-    @_builtins.property
-    @pulumi.getter(name="taskID")
-    def task_id(self) -> Optional[_builtins.str]:
-        """
-        Current task id
-        """
-        return pulumi.get(self, "task_id")
-
-    @_builtins.property
-    @pulumi.getter(name="taskIDsCompleted")
-    def task_ids_completed(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Completed task ids
-        """
-        return pulumi.get(self, "task_ids_completed")
-
-    @_builtins.property
-    @pulumi.getter(name="taskIDsStarted")
-    def task_ids_started(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Started task ids
-        """
-        return pulumi.get(self, "task_ids_started")
-
-    @_builtins.property
-    @pulumi.getter(name="usedTemplates")
-    def used_templates(self) -> Optional[Mapping[str, Any]]:
-        """
-        List of templates used to build this CHI
-        """
-        return pulumi.get(self, "used_templates")
@@ -0,0 +1,218 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpec']
+
+@pulumi.output_type
+class ClickHouseInstallationSpec(dict):
+    """
+    Specification of the desired behavior of one or more ClickHouse clusters
+    More info: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "namespaceDomainPattern":
+            suggest = "namespace_domain_pattern"
+        elif key == "taskID":
+            suggest = "task_id"
+        elif key == "useTemplates":
+            suggest = "use_templates"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpec. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpec.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpec.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 configuration: Optional['outputs.ClickHouseInstallationSpecConfiguration'] = None,
+                 defaults: Optional['outputs.ClickHouseInstallationSpecDefaults'] = None,
+                 namespace_domain_pattern: Optional[_builtins.str] = None,
+                 reconcile: Optional['outputs.ClickHouseInstallationSpecReconcile'] = None,
+                 reconciling: Optional['outputs.ClickHouseInstallationSpecReconciling'] = None,
+                 restart: Optional[_builtins.str] = None,
+                 stop: Optional[_builtins.str] = None,
+                 suspend: Optional[_builtins.str] = None,
+                 task_id: Optional[_builtins.str] = None,
+                 templates: Optional['outputs.ClickHouseInstallationSpecTemplates'] = None,
+                 templating: Optional['outputs.ClickHouseInstallationSpecTemplating'] = None,
+                 troubleshoot: Optional[_builtins.str] = None,
+                 use_templates: Optional[Sequence['outputs.ClickHouseInstallationSpecUseTemplates']] = None):
+        """
+        Specification of the desired behavior of one or more ClickHouse clusters
+        More info: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md
+
+
+        :param _builtins.str namespace_domain_pattern: Custom domain pattern which will be used for DNS names of `Service` or `Pod`.
+               Typical use scenario - custom cluster domain in Kubernetes cluster
+               Example: %s.svc.my.test
+        :param _builtins.str restart: In case 'RollingUpdate' specified, the operator will always restart ClickHouse pods during reconcile.
+               This options is used in rare cases when force restart is required and is typically removed after the use in order to avoid unneeded restarts.
+        :param _builtins.str stop: Allows to stop all ClickHouse clusters defined in a CHI.
+               Works as the following:
+                - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
+                - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
+        :param _builtins.str suspend: Suspend reconciliation of resources managed by a ClickHouse Installation.
+               Works as the following:
+                - When `suspend` is `true` operator stops reconciling all resources.
+                - When `suspend` is `false` or not set, operator reconciles all resources.
+        :param _builtins.str task_id: Allows to define custom taskID for CHI update and watch status of this update execution.
+               Displayed in all .status.taskID* fields.
+               By default (if not filled) every update of CHI manifest will generate random taskID
+        :param _builtins.str troubleshoot: Allows to troubleshoot Pods during CrashLoopBack state.
+               This may happen when wrong configuration applied, in this case `clickhouse-server` wouldn't start.
+               Command within ClickHouse container is modified with `sleep` in order to avoid quick restarts
+               and give time to troubleshoot via CLI.
+               Liveness and Readiness probes are disabled as well.
+        :param Sequence['ClickHouseInstallationSpecUseTemplatesArgs'] use_templates: list of `ClickHouseInstallationTemplate` (chit) resource names which will merge with current `CHI`
+               manifest during render Kubernetes resources to create related ClickHouse clusters"
+        """
+        if configuration is not None:
+            pulumi.set(__self__, "configuration", configuration)
+        if defaults is not None:
+            pulumi.set(__self__, "defaults", defaults)
+        if namespace_domain_pattern is not None:
+            pulumi.set(__self__, "namespace_domain_pattern", namespace_domain_pattern)
+        if reconcile is not None:
+            pulumi.set(__self__, "reconcile", reconcile)
+        if reconciling is not None:
+            pulumi.set(__self__, "reconciling", reconciling)
+        if restart is not None:
+            pulumi.set(__self__, "restart", restart)
+        if stop is not None:
+            pulumi.set(__self__, "stop", stop)
+        if suspend is not None:
+            pulumi.set(__self__, "suspend", suspend)
+        if task_id is not None:
+            pulumi.set(__self__, "task_id", task_id)
+        if templates is not None:
+            pulumi.set(__self__, "templates", templates)
+        if templating is not None:
+            pulumi.set(__self__, "templating", templating)
+        if troubleshoot is not None:
+            pulumi.set(__self__, "troubleshoot", troubleshoot)
+        if use_templates is not None:
+            pulumi.set(__self__, "use_templates", use_templates)
+
+    @_builtins.property
+    @pulumi.getter
+    def configuration(self) -> Optional['outputs.ClickHouseInstallationSpecConfiguration']:
+        return pulumi.get(self, "configuration")
+
+    @_builtins.property
+    @pulumi.getter
+    def defaults(self) -> Optional['outputs.ClickHouseInstallationSpecDefaults']:
+        return pulumi.get(self, "defaults")
+
+    @_builtins.property
+    @pulumi.getter(name="namespaceDomainPattern")
+    def namespace_domain_pattern(self) -> Optional[_builtins.str]:
+        """
+        Custom domain pattern which will be used for DNS names of `Service` or `Pod`.
+        Typical use scenario - custom cluster domain in Kubernetes cluster
+        Example: %s.svc.my.test
+        """
+        return pulumi.get(self, "namespace_domain_pattern")
+
+    @_builtins.property
+    @pulumi.getter
+    def reconcile(self) -> Optional['outputs.ClickHouseInstallationSpecReconcile']:
+        return pulumi.get(self, "reconcile")
+
+    @_builtins.property
+    @pulumi.getter
+    def reconciling(self) -> Optional['outputs.ClickHouseInstallationSpecReconciling']:
+        return pulumi.get(self, "reconciling")
+
+    @_builtins.property
+    @pulumi.getter
+    def restart(self) -> Optional[_builtins.str]:
+        """
+        In case 'RollingUpdate' specified, the operator will always restart ClickHouse pods during reconcile.
+        This options is used in rare cases when force restart is required and is typically removed after the use in order to avoid unneeded restarts.
+        """
+        return pulumi.get(self, "restart")
+
+    @_builtins.property
+    @pulumi.getter
+    def stop(self) -> Optional[_builtins.str]:
+        """
+        Allows to stop all ClickHouse clusters defined in a CHI.
+        Works as the following:
+         - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
+         - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
+        """
+        return pulumi.get(self, "stop")
+
+    @_builtins.property
+    @pulumi.getter
+    def suspend(self) -> Optional[_builtins.str]:
+        """
+        Suspend reconciliation of resources managed by a ClickHouse Installation.
+        Works as the following:
+         - When `suspend` is `true` operator stops reconciling all resources.
+         - When `suspend` is `false` or not set, operator reconciles all resources.
+        """
+        return pulumi.get(self, "suspend")
+
+    @_builtins.property
+    @pulumi.getter(name="taskID")
+    def task_id(self) -> Optional[_builtins.str]:
+        """
+        Allows to define custom taskID for CHI update and watch status of this update execution.
+        Displayed in all .status.taskID* fields.
+        By default (if not filled) every update of CHI manifest will generate random taskID
+        """
+        return pulumi.get(self, "task_id")
+
+    @_builtins.property
+    @pulumi.getter
+    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecTemplates']:
+        return pulumi.get(self, "templates")
+
+    @_builtins.property
+    @pulumi.getter
+    def templating(self) -> Optional['outputs.ClickHouseInstallationSpecTemplating']:
+        return pulumi.get(self, "templating")
+
+    @_builtins.property
+    @pulumi.getter
+    def troubleshoot(self) -> Optional[_builtins.str]:
+        """
+        Allows to troubleshoot Pods during CrashLoopBack state.
+        This may happen when wrong configuration applied, in this case `clickhouse-server` wouldn't start.
+        Command within ClickHouse container is modified with `sleep` in order to avoid quick restarts
+        and give time to troubleshoot via CLI.
+        Liveness and Readiness probes are disabled as well.
+        """
+        return pulumi.get(self, "troubleshoot")
+
+    @_builtins.property
+    @pulumi.getter(name="useTemplates")
+    def use_templates(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecUseTemplates']]:
+        """
+        list of `ClickHouseInstallationTemplate` (chit) resource names which will merge with current `CHI`
+        manifest during render Kubernetes resources to create related ClickHouse clusters"
+        """
+        return pulumi.get(self, "use_templates")
@@ -0,0 +1,202 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecConfiguration']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecConfiguration(dict):
+    """
+    allows configure multiple aspects and behavior for `clickhouse-server` instance and also allows describe multiple `clickhouse-server` clusters inside one `chi` resource
+    """
+    def __init__(__self__, *,
+                 clusters: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClusters']] = None,
+                 files: Optional[Mapping[str, Any]] = None,
+                 profiles: Optional[Mapping[str, Any]] = None,
+                 quotas: Optional[Mapping[str, Any]] = None,
+                 settings: Optional[Mapping[str, Any]] = None,
+                 users: Optional[Mapping[str, Any]] = None,
+                 zookeeper: Optional['outputs.ClickHouseInstallationSpecConfigurationZookeeper'] = None):
+        """
+        allows configure multiple aspects and behavior for `clickhouse-server` instance and also allows describe multiple `clickhouse-server` clusters inside one `chi` resource
+
+        :param Sequence['ClickHouseInstallationSpecConfigurationClustersArgs'] clusters: describes clusters layout and allows change settings on cluster-level, shard-level and replica-level
+               every cluster is a set of StatefulSet, one StatefulSet contains only one Pod with `clickhouse-server`
+               all Pods will rendered in <remote_server> part of ClickHouse configs, mounted from ConfigMap as `/etc/clickhouse-server/config.d/chop-generated-remote_servers.xml`
+               Clusters will use for Distributed table engine, more details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
+               If `cluster` contains zookeeper settings (could be inherited from top `chi` level), when you can create *ReplicatedMergeTree tables
+        :param Mapping[str, Any] files: allows define content of any setting file inside each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+               every key in this object is the file name
+               every value in this object is the file content
+               you can use `!!binary |` and base64 for binary files, see details here https://yaml.org/type/binary.html
+               each key could contains prefix like {common}, {users}, {hosts} or config.d, users.d, conf.d, wrong prefixes will be ignored, subfolders also will be ignored
+               More details: https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-05-files-nested.yaml
+
+               any key could contains `valueFrom` with `secretKeyRef` which allow pass values from kubernetes secrets
+               secrets will mounted into pod as separate volume in /etc/clickhouse-server/secrets.d/
+               and will automatically update when update secret
+               it useful for pass SSL certificates from cert-manager or similar tool
+               look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
+        :param Mapping[str, Any] profiles: allows configure <yandex><profiles>..</profiles></yandex> section in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/users.d/`
+               you can configure any aspect of settings profile
+               More details: https://clickhouse.tech/docs/en/operations/settings/settings-profiles/
+               Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationprofiles
+        :param Mapping[str, Any] quotas: allows configure <yandex><quotas>..</quotas></yandex> section in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/users.d/`
+               you can configure any aspect of resource quotas
+               More details: https://clickhouse.tech/docs/en/operations/quotas/
+               Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationquotas
+        :param Mapping[str, Any] settings: allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
+               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+               Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationsettings
+
+               any key could contains `valueFrom` with `secretKeyRef` which allow pass password from kubernetes secrets
+               look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
+
+               secret value will pass in `pod.spec.env`, and generate with from_env=XXX in XML in /etc/clickhouse-server/config.d/chop-generated-settings.xml
+               it not allow automatically updates when updates `secret`, change spec.taskID for manually trigger reconcile cycle
+        :param Mapping[str, Any] users: allows configure <yandex><users>..</users></yandex> section in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/users.d/`
+               you can configure password hashed, authorization restrictions, database level security row filters etc.
+               More details: https://clickhouse.tech/docs/en/operations/settings/settings-users/
+               Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationusers
+
+               any key could contains `valueFrom` with `secretKeyRef` which allow pass password from kubernetes secrets
+               secret value will pass in `pod.spec.containers.evn`, and generate with from_env=XXX in XML in /etc/clickhouse-server/users.d/chop-generated-users.xml
+               it not allow automatically updates when updates `secret`, change spec.taskID for manually trigger reconcile cycle
+
+               look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
+
+               any key with prefix `k8s_secret_` shall has value with format namespace/secret/key or secret/key
+               in this case value from secret will write directly into XML tag during render *-usersd ConfigMap
+
+               any key with prefix `k8s_secret_env` shall has value with format namespace/secret/key or secret/key
+               in this case value from secret will write into environment variable and write to XML tag via from_env=XXX
+
+               look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
+        """
+        if clusters is not None:
+            pulumi.set(__self__, "clusters", clusters)
+        if files is not None:
+            pulumi.set(__self__, "files", files)
+        if profiles is not None:
+            pulumi.set(__self__, "profiles", profiles)
+        if quotas is not None:
+            pulumi.set(__self__, "quotas", quotas)
+        if settings is not None:
+            pulumi.set(__self__, "settings", settings)
+        if users is not None:
+            pulumi.set(__self__, "users", users)
+        if zookeeper is not None:
+            pulumi.set(__self__, "zookeeper", zookeeper)
+
+    @_builtins.property
+    @pulumi.getter
+    def clusters(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClusters']]:
+        """
+        describes clusters layout and allows change settings on cluster-level, shard-level and replica-level
+        every cluster is a set of StatefulSet, one StatefulSet contains only one Pod with `clickhouse-server`
+        all Pods will rendered in <remote_server> part of ClickHouse configs, mounted from ConfigMap as `/etc/clickhouse-server/config.d/chop-generated-remote_servers.xml`
+        Clusters will use for Distributed table engine, more details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
+        If `cluster` contains zookeeper settings (could be inherited from top `chi` level), when you can create *ReplicatedMergeTree tables
+        """
+        return pulumi.get(self, "clusters")
+
+    @_builtins.property
+    @pulumi.getter
+    def files(self) -> Optional[Mapping[str, Any]]:
+        """
+        allows define content of any setting file inside each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+        every key in this object is the file name
+        every value in this object is the file content
+        you can use `!!binary |` and base64 for binary files, see details here https://yaml.org/type/binary.html
+        each key could contains prefix like {common}, {users}, {hosts} or config.d, users.d, conf.d, wrong prefixes will be ignored, subfolders also will be ignored
+        More details: https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-05-files-nested.yaml
+
+        any key could contains `valueFrom` with `secretKeyRef` which allow pass values from kubernetes secrets
+        secrets will mounted into pod as separate volume in /etc/clickhouse-server/secrets.d/
+        and will automatically update when update secret
+        it useful for pass SSL certificates from cert-manager or similar tool
+        look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
+        """
+        return pulumi.get(self, "files")
+
+    @_builtins.property
+    @pulumi.getter
+    def profiles(self) -> Optional[Mapping[str, Any]]:
+        """
+        allows configure <yandex><profiles>..</profiles></yandex> section in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/users.d/`
+        you can configure any aspect of settings profile
+        More details: https://clickhouse.tech/docs/en/operations/settings/settings-profiles/
+        Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationprofiles
+        """
+        return pulumi.get(self, "profiles")
+
+    @_builtins.property
+    @pulumi.getter
+    def quotas(self) -> Optional[Mapping[str, Any]]:
+        """
+        allows configure <yandex><quotas>..</quotas></yandex> section in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/users.d/`
+        you can configure any aspect of resource quotas
+        More details: https://clickhouse.tech/docs/en/operations/quotas/
+        Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationquotas
+        """
+        return pulumi.get(self, "quotas")
+
+    @_builtins.property
+    @pulumi.getter
+    def settings(self) -> Optional[Mapping[str, Any]]:
+        """
+        allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
+        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationsettings
+
+        any key could contains `valueFrom` with `secretKeyRef` which allow pass password from kubernetes secrets
+        look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
+
+        secret value will pass in `pod.spec.env`, and generate with from_env=XXX in XML in /etc/clickhouse-server/config.d/chop-generated-settings.xml
+        it not allow automatically updates when updates `secret`, change spec.taskID for manually trigger reconcile cycle
+        """
+        return pulumi.get(self, "settings")
+
+    @_builtins.property
+    @pulumi.getter
+    def users(self) -> Optional[Mapping[str, Any]]:
+        """
+        allows configure <yandex><users>..</users></yandex> section in each `Pod` during generate `ConfigMap` which will mount in `/etc/clickhouse-server/users.d/`
+        you can configure password hashed, authorization restrictions, database level security row filters etc.
+        More details: https://clickhouse.tech/docs/en/operations/settings/settings-users/
+        Your yaml code will convert to XML, see examples https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specconfigurationusers
+
+        any key could contains `valueFrom` with `secretKeyRef` which allow pass password from kubernetes secrets
+        secret value will pass in `pod.spec.containers.evn`, and generate with from_env=XXX in XML in /etc/clickhouse-server/users.d/chop-generated-users.xml
+        it not allow automatically updates when updates `secret`, change spec.taskID for manually trigger reconcile cycle
+
+        look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
+
+        any key with prefix `k8s_secret_` shall has value with format namespace/secret/key or secret/key
+        in this case value from secret will write directly into XML tag during render *-usersd ConfigMap
+
+        any key with prefix `k8s_secret_env` shall has value with format namespace/secret/key or secret/key
+        in this case value from secret will write into environment variable and write to XML tag via from_env=XXX
+
+        look into https://github.com/Altinity/clickhouse-operator/blob/master/docs/chi-examples/05-settings-01-overview.yaml for examples
+        """
+        return pulumi.get(self, "users")
+
+    @_builtins.property
+    @pulumi.getter
+    def zookeeper(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationZookeeper']:
+        return pulumi.get(self, "zookeeper")
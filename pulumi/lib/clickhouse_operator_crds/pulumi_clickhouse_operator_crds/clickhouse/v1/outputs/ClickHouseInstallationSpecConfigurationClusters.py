@@ -0,0 +1,198 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClusters']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecConfigurationClusters(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "pdbManaged":
+            suggest = "pdb_managed"
+        elif key == "pdbMaxUnavailable":
+            suggest = "pdb_max_unavailable"
+        elif key == "schemaPolicy":
+            suggest = "schema_policy"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClusters. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecConfigurationClusters.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecConfigurationClusters.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 files: Optional[Mapping[str, Any]] = None,
+                 insecure: Optional[_builtins.str] = None,
+                 layout: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayout'] = None,
+                 name: Optional[_builtins.str] = None,
+                 pdb_managed: Optional[_builtins.str] = None,
+                 pdb_max_unavailable: Optional[_builtins.int] = None,
+                 reconcile: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcile'] = None,
+                 schema_policy: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSchemaPolicy'] = None,
+                 secret: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSecret'] = None,
+                 secure: Optional[_builtins.str] = None,
+                 settings: Optional[Mapping[str, Any]] = None,
+                 templates: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersTemplates'] = None,
+                 zookeeper: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersZookeeper'] = None):
+        """
+        :param Mapping[str, Any] files: optional, allows define content of any setting file inside each `Pod` on current cluster during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+               override top-level `chi.spec.configuration.files`
+        :param _builtins.str insecure: optional, open insecure ports for cluster, defaults to "yes"
+        :param _builtins.str name: cluster name, used to identify set of servers and wide used during generate names of related Kubernetes resources
+        :param _builtins.str pdb_managed: Specifies whether the Pod Disruption Budget (PDB) should be managed.
+               During the next installation, if PDB management is enabled, the operator will
+               attempt to retrieve any existing PDB. If none is found, it will create a new one
+               and initiate a reconciliation loop. If PDB management is disabled, the existing PDB
+               will remain intact, and the reconciliation loop will not be executed. By default,
+               PDB management is enabled.
+        :param _builtins.int pdb_max_unavailable: Pod eviction is allowed if at most "pdbMaxUnavailable" pods are unavailable after the eviction,
+               i.e. even in absence of the evicted pod. For example, one can prevent all voluntary evictions
+               by specifying 0. This is a mutually exclusive setting with "minAvailable".
+        :param _builtins.str secure: optional, open secure ports for cluster
+        :param Mapping[str, Any] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` only in one cluster during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
+               override top-level `chi.spec.configuration.settings`
+               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        """
+        if files is not None:
+            pulumi.set(__self__, "files", files)
+        if insecure is not None:
+            pulumi.set(__self__, "insecure", insecure)
+        if layout is not None:
+            pulumi.set(__self__, "layout", layout)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if pdb_managed is not None:
+            pulumi.set(__self__, "pdb_managed", pdb_managed)
+        if pdb_max_unavailable is not None:
+            pulumi.set(__self__, "pdb_max_unavailable", pdb_max_unavailable)
+        if reconcile is not None:
+            pulumi.set(__self__, "reconcile", reconcile)
+        if schema_policy is not None:
+            pulumi.set(__self__, "schema_policy", schema_policy)
+        if secret is not None:
+            pulumi.set(__self__, "secret", secret)
+        if secure is not None:
+            pulumi.set(__self__, "secure", secure)
+        if settings is not None:
+            pulumi.set(__self__, "settings", settings)
+        if templates is not None:
+            pulumi.set(__self__, "templates", templates)
+        if zookeeper is not None:
+            pulumi.set(__self__, "zookeeper", zookeeper)
+
+    @_builtins.property
+    @pulumi.getter
+    def files(self) -> Optional[Mapping[str, Any]]:
+        """
+        optional, allows define content of any setting file inside each `Pod` on current cluster during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+        override top-level `chi.spec.configuration.files`
+        """
+        return pulumi.get(self, "files")
+
+    @_builtins.property
+    @pulumi.getter
+    def insecure(self) -> Optional[_builtins.str]:
+        """
+        optional, open insecure ports for cluster, defaults to "yes"
+        """
+        return pulumi.get(self, "insecure")
+
+    @_builtins.property
+    @pulumi.getter
+    def layout(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayout']:
+        return pulumi.get(self, "layout")
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> Optional[_builtins.str]:
+        """
+        cluster name, used to identify set of servers and wide used during generate names of related Kubernetes resources
+        """
+        return pulumi.get(self, "name")
+
+    @_builtins.property
+    @pulumi.getter(name="pdbManaged")
+    def pdb_managed(self) -> Optional[_builtins.str]:
+        """
+        Specifies whether the Pod Disruption Budget (PDB) should be managed.
+        During the next installation, if PDB management is enabled, the operator will
+        attempt to retrieve any existing PDB. If none is found, it will create a new one
+        and initiate a reconciliation loop. If PDB management is disabled, the existing PDB
+        will remain intact, and the reconciliation loop will not be executed. By default,
+        PDB management is enabled.
+        """
+        return pulumi.get(self, "pdb_managed")
+
+    @_builtins.property
+    @pulumi.getter(name="pdbMaxUnavailable")
+    def pdb_max_unavailable(self) -> Optional[_builtins.int]:
+        """
+        Pod eviction is allowed if at most "pdbMaxUnavailable" pods are unavailable after the eviction,
+        i.e. even in absence of the evicted pod. For example, one can prevent all voluntary evictions
+        by specifying 0. This is a mutually exclusive setting with "minAvailable".
+        """
+        return pulumi.get(self, "pdb_max_unavailable")
+
+    @_builtins.property
+    @pulumi.getter
+    def reconcile(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcile']:
+        return pulumi.get(self, "reconcile")
+
+    @_builtins.property
+    @pulumi.getter(name="schemaPolicy")
+    def schema_policy(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSchemaPolicy']:
+        return pulumi.get(self, "schema_policy")
+
+    @_builtins.property
+    @pulumi.getter
+    def secret(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSecret']:
+        return pulumi.get(self, "secret")
+
+    @_builtins.property
+    @pulumi.getter
+    def secure(self) -> Optional[_builtins.str]:
+        """
+        optional, open secure ports for cluster
+        """
+        return pulumi.get(self, "secure")
+
+    @_builtins.property
+    @pulumi.getter
+    def settings(self) -> Optional[Mapping[str, Any]]:
+        """
+        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` only in one cluster during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
+        override top-level `chi.spec.configuration.settings`
+        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        """
+        return pulumi.get(self, "settings")
+
+    @_builtins.property
+    @pulumi.getter
+    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersTemplates']:
+        return pulumi.get(self, "templates")
+
+    @_builtins.property
+    @pulumi.getter
+    def zookeeper(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersZookeeper']:
+        return pulumi.get(self, "zookeeper")
@@ -0,0 +1,112 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersLayout']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecConfigurationClustersLayout(dict):
+    """
+    describe current cluster layout, how much shards in cluster, how much replica in shard
+    allows override settings on each shard and replica separatelly
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "replicasCount":
+            suggest = "replicas_count"
+        elif key == "shardsCount":
+            suggest = "shards_count"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayout. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecConfigurationClustersLayout.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecConfigurationClustersLayout.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 replicas: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicas']] = None,
+                 replicas_count: Optional[_builtins.int] = None,
+                 shards: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShards']] = None,
+                 shards_count: Optional[_builtins.int] = None):
+        """
+        describe current cluster layout, how much shards in cluster, how much replica in shard
+        allows override settings on each shard and replica separatelly
+
+
+        :param Sequence['ClickHouseInstallationSpecConfigurationClustersLayoutReplicasArgs'] replicas: optional, allows override top-level `chi.spec.configuration` and cluster-level `chi.spec.configuration.clusters` configuration for each replica and each shard relates to selected replica, use it only if you fully understand what you do
+        :param _builtins.int replicas_count: how much replicas in each shards for current cluster will run in Kubernetes,
+               each replica is a separate `StatefulSet` which contains only one `Pod` with `clickhouse-server` instance,
+               every shard contains 1 replica by default"
+        :param Sequence['ClickHouseInstallationSpecConfigurationClustersLayoutShardsArgs'] shards: optional, allows override top-level `chi.spec.configuration`, cluster-level
+               `chi.spec.configuration.clusters` settings for each shard separately,
+               use it only if you fully understand what you do"
+        :param _builtins.int shards_count: how much shards for current ClickHouse cluster will run in Kubernetes,
+               each shard contains shared-nothing part of data and contains set of replicas,
+               cluster contains 1 shard by default"
+        """
+        if replicas is not None:
+            pulumi.set(__self__, "replicas", replicas)
+        if replicas_count is not None:
+            pulumi.set(__self__, "replicas_count", replicas_count)
+        if shards is not None:
+            pulumi.set(__self__, "shards", shards)
+        if shards_count is not None:
+            pulumi.set(__self__, "shards_count", shards_count)
+
+    @_builtins.property
+    @pulumi.getter
+    def replicas(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicas']]:
+        """
+        optional, allows override top-level `chi.spec.configuration` and cluster-level `chi.spec.configuration.clusters` configuration for each replica and each shard relates to selected replica, use it only if you fully understand what you do
+        """
+        return pulumi.get(self, "replicas")
+
+    @_builtins.property
+    @pulumi.getter(name="replicasCount")
+    def replicas_count(self) -> Optional[_builtins.int]:
+        """
+        how much replicas in each shards for current cluster will run in Kubernetes,
+        each replica is a separate `StatefulSet` which contains only one `Pod` with `clickhouse-server` instance,
+        every shard contains 1 replica by default"
+        """
+        return pulumi.get(self, "replicas_count")
+
+    @_builtins.property
+    @pulumi.getter
+    def shards(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShards']]:
+        """
+        optional, allows override top-level `chi.spec.configuration`, cluster-level
+        `chi.spec.configuration.clusters` settings for each shard separately,
+        use it only if you fully understand what you do"
+        """
+        return pulumi.get(self, "shards")
+
+    @_builtins.property
+    @pulumi.getter(name="shardsCount")
+    def shards_count(self) -> Optional[_builtins.int]:
+        """
+        how much shards for current ClickHouse cluster will run in Kubernetes,
+        each shard contains shared-nothing part of data and contains set of replicas,
+        cluster contains 1 shard by default"
+        """
+        return pulumi.get(self, "shards_count")
@@ -0,0 +1,116 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersLayoutReplicas']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecConfigurationClustersLayoutReplicas(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "shardsCount":
+            suggest = "shards_count"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutReplicas. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecConfigurationClustersLayoutReplicas.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecConfigurationClustersLayoutReplicas.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 files: Optional[Mapping[str, Any]] = None,
+                 name: Optional[_builtins.str] = None,
+                 settings: Optional[Mapping[str, Any]] = None,
+                 shards: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShards']] = None,
+                 shards_count: Optional[_builtins.int] = None,
+                 templates: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplates'] = None):
+        """
+        :param Mapping[str, Any] files: optional, allows define content of any setting file inside each `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+               override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
+        :param _builtins.str name: optional, by default replica name is generated, but you can override it and setup custom name
+        :param Mapping[str, Any] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
+               override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and will ignore if shard-level `chi.spec.configuration.clusters.layout.shards` present
+               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        :param Sequence['ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsArgs'] shards: optional, list of shards related to current replica, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
+        :param _builtins.int shards_count: optional, count of shards related to current replica, you can override each shard behavior on low-level `chi.spec.configuration.clusters.layout.replicas.shards`
+        """
+        if files is not None:
+            pulumi.set(__self__, "files", files)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if settings is not None:
+            pulumi.set(__self__, "settings", settings)
+        if shards is not None:
+            pulumi.set(__self__, "shards", shards)
+        if shards_count is not None:
+            pulumi.set(__self__, "shards_count", shards_count)
+        if templates is not None:
+            pulumi.set(__self__, "templates", templates)
+
+    @_builtins.property
+    @pulumi.getter
+    def files(self) -> Optional[Mapping[str, Any]]:
+        """
+        optional, allows define content of any setting file inside each `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+        override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
+        """
+        return pulumi.get(self, "files")
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> Optional[_builtins.str]:
+        """
+        optional, by default replica name is generated, but you can override it and setup custom name
+        """
+        return pulumi.get(self, "name")
+
+    @_builtins.property
+    @pulumi.getter
+    def settings(self) -> Optional[Mapping[str, Any]]:
+        """
+        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
+        override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and will ignore if shard-level `chi.spec.configuration.clusters.layout.shards` present
+        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        """
+        return pulumi.get(self, "settings")
+
+    @_builtins.property
+    @pulumi.getter
+    def shards(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShards']]:
+        """
+        optional, list of shards related to current replica, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
+        """
+        return pulumi.get(self, "shards")
+
+    @_builtins.property
+    @pulumi.getter(name="shardsCount")
+    def shards_count(self) -> Optional[_builtins.int]:
+        """
+        optional, count of shards related to current replica, you can override each shard behavior on low-level `chi.spec.configuration.clusters.layout.replicas.shards`
+        """
+        return pulumi.get(self, "shards_count")
+
+    @_builtins.property
+    @pulumi.getter
+    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplates']:
+        return pulumi.get(self, "templates")
@@ -0,0 +1,182 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShards']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShards(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "httpPort":
+            suggest = "http_port"
+        elif key == "httpsPort":
+            suggest = "https_port"
+        elif key == "interserverHTTPPort":
+            suggest = "interserver_http_port"
+        elif key == "tcpPort":
+            suggest = "tcp_port"
+        elif key == "tlsPort":
+            suggest = "tls_port"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShards. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShards.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShards.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 files: Optional[Mapping[str, Any]] = None,
+                 http_port: Optional[_builtins.int] = None,
+                 https_port: Optional[_builtins.int] = None,
+                 insecure: Optional[_builtins.str] = None,
+                 interserver_http_port: Optional[_builtins.int] = None,
+                 name: Optional[_builtins.str] = None,
+                 secure: Optional[_builtins.str] = None,
+                 settings: Optional[Mapping[str, Any]] = None,
+                 tcp_port: Optional[_builtins.int] = None,
+                 templates: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplates'] = None,
+                 tls_port: Optional[_builtins.int] = None):
+        """
+        :param Mapping[str, Any] files: optional, allows define content of any setting file inside each `Pod` only in one shard related to current replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+               override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
+        :param _builtins.int http_port: optional, setup `Pod.spec.containers.ports` with name `http` for selected shard, override `chi.spec.templates.hostTemplates.spec.httpPort`
+               allows connect to `clickhouse-server` via HTTP protocol via kubernetes `Service`
+        :param _builtins.str insecure: optional, open insecure ports for cluster, defaults to "yes"
+        :param _builtins.int interserver_http_port: optional, setup `Pod.spec.containers.ports` with name `interserver` for selected shard, override `chi.spec.templates.hostTemplates.spec.interserverHTTPPort`
+               allows connect between replicas inside same shard during fetch replicated data parts HTTP protocol
+        :param _builtins.str name: optional, by default shard name is generated, but you can override it and setup custom name
+        :param _builtins.str secure: optional, open secure ports
+        :param Mapping[str, Any] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one shard related to current replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
+               override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and replica-level `chi.spec.configuration.clusters.layout.replicas.settings`
+               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        :param _builtins.int tcp_port: optional, setup `Pod.spec.containers.ports` with name `tcp` for selected shard, override `chi.spec.templates.hostTemplates.spec.tcpPort`
+               allows connect to `clickhouse-server` via TCP Native protocol via kubernetes `Service`
+        """
+        if files is not None:
+            pulumi.set(__self__, "files", files)
+        if http_port is not None:
+            pulumi.set(__self__, "http_port", http_port)
+        if https_port is not None:
+            pulumi.set(__self__, "https_port", https_port)
+        if insecure is not None:
+            pulumi.set(__self__, "insecure", insecure)
+        if interserver_http_port is not None:
+            pulumi.set(__self__, "interserver_http_port", interserver_http_port)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if secure is not None:
+            pulumi.set(__self__, "secure", secure)
+        if settings is not None:
+            pulumi.set(__self__, "settings", settings)
+        if tcp_port is not None:
+            pulumi.set(__self__, "tcp_port", tcp_port)
+        if templates is not None:
+            pulumi.set(__self__, "templates", templates)
+        if tls_port is not None:
+            pulumi.set(__self__, "tls_port", tls_port)
+
+    @_builtins.property
+    @pulumi.getter
+    def files(self) -> Optional[Mapping[str, Any]]:
+        """
+        optional, allows define content of any setting file inside each `Pod` only in one shard related to current replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+        override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`, will ignore if `chi.spec.configuration.clusters.layout.shards` presents
+        """
+        return pulumi.get(self, "files")
+
+    @_builtins.property
+    @pulumi.getter(name="httpPort")
+    def http_port(self) -> Optional[_builtins.int]:
+        """
+        optional, setup `Pod.spec.containers.ports` with name `http` for selected shard, override `chi.spec.templates.hostTemplates.spec.httpPort`
+        allows connect to `clickhouse-server` via HTTP protocol via kubernetes `Service`
+        """
+        return pulumi.get(self, "http_port")
+
+    @_builtins.property
+    @pulumi.getter(name="httpsPort")
+    def https_port(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "https_port")
+
+    @_builtins.property
+    @pulumi.getter
+    def insecure(self) -> Optional[_builtins.str]:
+        """
+        optional, open insecure ports for cluster, defaults to "yes"
+        """
+        return pulumi.get(self, "insecure")
+
+    @_builtins.property
+    @pulumi.getter(name="interserverHTTPPort")
+    def interserver_http_port(self) -> Optional[_builtins.int]:
+        """
+        optional, setup `Pod.spec.containers.ports` with name `interserver` for selected shard, override `chi.spec.templates.hostTemplates.spec.interserverHTTPPort`
+        allows connect between replicas inside same shard during fetch replicated data parts HTTP protocol
+        """
+        return pulumi.get(self, "interserver_http_port")
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> Optional[_builtins.str]:
+        """
+        optional, by default shard name is generated, but you can override it and setup custom name
+        """
+        return pulumi.get(self, "name")
+
+    @_builtins.property
+    @pulumi.getter
+    def secure(self) -> Optional[_builtins.str]:
+        """
+        optional, open secure ports
+        """
+        return pulumi.get(self, "secure")
+
+    @_builtins.property
+    @pulumi.getter
+    def settings(self) -> Optional[Mapping[str, Any]]:
+        """
+        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in `Pod` only in one shard related to current replica during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
+        override top-level `chi.spec.configuration.settings`, cluster-level `chi.spec.configuration.clusters.settings` and replica-level `chi.spec.configuration.clusters.layout.replicas.settings`
+        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        """
+        return pulumi.get(self, "settings")
+
+    @_builtins.property
+    @pulumi.getter(name="tcpPort")
+    def tcp_port(self) -> Optional[_builtins.int]:
+        """
+        optional, setup `Pod.spec.containers.ports` with name `tcp` for selected shard, override `chi.spec.templates.hostTemplates.spec.tcpPort`
+        allows connect to `clickhouse-server` via TCP Native protocol via kubernetes `Service`
+        """
+        return pulumi.get(self, "tcp_port")
+
+    @_builtins.property
+    @pulumi.getter
+    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplates']:
+        return pulumi.get(self, "templates")
+
+    @_builtins.property
+    @pulumi.getter(name="tlsPort")
+    def tls_port(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "tls_port")
@@ -0,0 +1,170 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatch']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "definitionType":
+            suggest = "definition_type"
+        elif key == "internalReplication":
+            suggest = "internal_replication"
+        elif key == "replicasCount":
+            suggest = "replicas_count"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 definition_type: Optional[_builtins.str] = None,
+                 files: Optional[Mapping[str, Any]] = None,
+                 internal_replication: Optional[_builtins.str] = None,
+                 name: Optional[_builtins.str] = None,
+                 replicas: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatch']] = None,
+                 replicas_count: Optional[_builtins.int] = None,
+                 settings: Optional[Mapping[str, Any]] = None,
+                 templates: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatch'] = None,
+                 weight: Optional[_builtins.int] = None):
+        """
+        :param _builtins.str definition_type: DEPRECATED - to be removed soon
+        :param Mapping[str, Any] files: optional, allows define content of any setting file inside each `Pod` only in one shard during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+               override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`
+        :param _builtins.str internal_replication: optional, `true` by default when `chi.spec.configuration.clusters[].layout.ReplicaCount` > 1 and 0 otherwise
+               allows setup <internal_replication> setting which will use during insert into tables with `Distributed` engine for insert only in one live replica and other replicas will download inserted data during replication,
+               will apply in <remote_servers> inside ConfigMap which will mount in /etc/clickhouse-server/config.d/chop-generated-remote_servers.xml
+               More details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
+        :param _builtins.str name: optional, by default shard name is generated, but you can override it and setup custom name
+        :param Sequence['ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatchArgs'] replicas: optional, allows override behavior for selected replicas from cluster-level `chi.spec.configuration.clusters` and shard-level `chi.spec.configuration.clusters.layout.shards`
+        :param _builtins.int replicas_count: optional, how much replicas in selected shard for selected ClickHouse cluster will run in Kubernetes, each replica is a separate `StatefulSet` which contains only one `Pod` with `clickhouse-server` instance,
+               shard contains 1 replica by default
+               override cluster-level `chi.spec.configuration.clusters.layout.replicasCount`
+        :param Mapping[str, Any] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` only in one shard during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
+               override top-level `chi.spec.configuration.settings` and cluster-level `chi.spec.configuration.clusters.settings`
+               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        :param _builtins.int weight: optional, 1 by default, allows setup shard <weight> setting which will use during insert into tables with `Distributed` engine,
+               will apply in <remote_servers> inside ConfigMap which will mount in /etc/clickhouse-server/config.d/chop-generated-remote_servers.xml
+               More details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
+        """
+        if definition_type is not None:
+            pulumi.set(__self__, "definition_type", definition_type)
+        if files is not None:
+            pulumi.set(__self__, "files", files)
+        if internal_replication is not None:
+            pulumi.set(__self__, "internal_replication", internal_replication)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if replicas is not None:
+            pulumi.set(__self__, "replicas", replicas)
+        if replicas_count is not None:
+            pulumi.set(__self__, "replicas_count", replicas_count)
+        if settings is not None:
+            pulumi.set(__self__, "settings", settings)
+        if templates is not None:
+            pulumi.set(__self__, "templates", templates)
+        if weight is not None:
+            pulumi.set(__self__, "weight", weight)
+
+    @_builtins.property
+    @pulumi.getter(name="definitionType")
+    def definition_type(self) -> Optional[_builtins.str]:
+        """
+        DEPRECATED - to be removed soon
+        """
+        return pulumi.get(self, "definition_type")
+
+    @_builtins.property
+    @pulumi.getter
+    def files(self) -> Optional[Mapping[str, Any]]:
+        """
+        optional, allows define content of any setting file inside each `Pod` only in one shard during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+        override top-level `chi.spec.configuration.files` and cluster-level `chi.spec.configuration.clusters.files`
+        """
+        return pulumi.get(self, "files")
+
+    @_builtins.property
+    @pulumi.getter(name="internalReplication")
+    def internal_replication(self) -> Optional[_builtins.str]:
+        """
+        optional, `true` by default when `chi.spec.configuration.clusters[].layout.ReplicaCount` > 1 and 0 otherwise
+        allows setup <internal_replication> setting which will use during insert into tables with `Distributed` engine for insert only in one live replica and other replicas will download inserted data during replication,
+        will apply in <remote_servers> inside ConfigMap which will mount in /etc/clickhouse-server/config.d/chop-generated-remote_servers.xml
+        More details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
+        """
+        return pulumi.get(self, "internal_replication")
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> Optional[_builtins.str]:
+        """
+        optional, by default shard name is generated, but you can override it and setup custom name
+        """
+        return pulumi.get(self, "name")
+
+    @_builtins.property
+    @pulumi.getter
+    def replicas(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatch']]:
+        """
+        optional, allows override behavior for selected replicas from cluster-level `chi.spec.configuration.clusters` and shard-level `chi.spec.configuration.clusters.layout.shards`
+        """
+        return pulumi.get(self, "replicas")
+
+    @_builtins.property
+    @pulumi.getter(name="replicasCount")
+    def replicas_count(self) -> Optional[_builtins.int]:
+        """
+        optional, how much replicas in selected shard for selected ClickHouse cluster will run in Kubernetes, each replica is a separate `StatefulSet` which contains only one `Pod` with `clickhouse-server` instance,
+        shard contains 1 replica by default
+        override cluster-level `chi.spec.configuration.clusters.layout.replicasCount`
+        """
+        return pulumi.get(self, "replicas_count")
+
+    @_builtins.property
+    @pulumi.getter
+    def settings(self) -> Optional[Mapping[str, Any]]:
+        """
+        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` only in one shard during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/`
+        override top-level `chi.spec.configuration.settings` and cluster-level `chi.spec.configuration.clusters.settings`
+        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        """
+        return pulumi.get(self, "settings")
+
+    @_builtins.property
+    @pulumi.getter
+    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatch']:
+        return pulumi.get(self, "templates")
+
+    @_builtins.property
+    @pulumi.getter
+    def weight(self) -> Optional[_builtins.int]:
+        """
+        optional, 1 by default, allows setup shard <weight> setting which will use during insert into tables with `Distributed` engine,
+        will apply in <remote_servers> inside ConfigMap which will mount in /etc/clickhouse-server/config.d/chop-generated-remote_servers.xml
+        More details: https://clickhouse.tech/docs/en/engines/table-engines/special/distributed/
+        """
+        return pulumi.get(self, "weight")
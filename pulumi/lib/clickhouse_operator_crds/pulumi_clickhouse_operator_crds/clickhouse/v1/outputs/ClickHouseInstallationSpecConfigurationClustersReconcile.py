@@ -0,0 +1,53 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersReconcile']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecConfigurationClustersReconcile(dict):
+    """
+    allow tuning reconciling process
+    """
+    def __init__(__self__, *,
+                 hooks: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooks'] = None,
+                 host: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHost'] = None,
+                 runtime: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileRuntime'] = None):
+        """
+        allow tuning reconciling process
+        """
+        if hooks is not None:
+            pulumi.set(__self__, "hooks", hooks)
+        if host is not None:
+            pulumi.set(__self__, "host", host)
+        if runtime is not None:
+            pulumi.set(__self__, "runtime", runtime)
+
+    @_builtins.property
+    @pulumi.getter
+    def hooks(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooks']:
+        return pulumi.get(self, "hooks")
+
+    @_builtins.property
+    @pulumi.getter
+    def host(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHost']:
+        return pulumi.get(self, "host")
+
+    @_builtins.property
+    @pulumi.getter
+    def runtime(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileRuntime']:
+        return pulumi.get(self, "runtime")
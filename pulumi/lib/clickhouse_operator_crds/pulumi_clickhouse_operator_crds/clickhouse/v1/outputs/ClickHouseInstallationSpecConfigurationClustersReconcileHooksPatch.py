@@ -0,0 +1,54 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatch']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatch(dict):
+    """
+    cluster-level hooks to execute before and after cluster reconcile
+    """
+    def __init__(__self__, *,
+                 post: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatch']] = None,
+                 pre: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatch']] = None):
+        """
+        cluster-level hooks to execute before and after cluster reconcile
+
+        :param Sequence['ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatchArgs'] post: actions to execute after cluster reconcile
+        :param Sequence['ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatchArgs'] pre: actions to execute before cluster reconcile
+        """
+        if post is not None:
+            pulumi.set(__self__, "post", post)
+        if pre is not None:
+            pulumi.set(__self__, "pre", pre)
+
+    @_builtins.property
+    @pulumi.getter
+    def post(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatch']]:
+        """
+        actions to execute after cluster reconcile
+        """
+        return pulumi.get(self, "post")
+
+    @_builtins.property
+    @pulumi.getter
+    def pre(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatch']]:
+        """
+        actions to execute before cluster reconcile
+        """
+        return pulumi.get(self, "pre")
@@ -0,0 +1,124 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersReconcileHooksPost']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecConfigurationClustersReconcileHooksPost(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "failurePolicy":
+            suggest = "failure_policy"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersReconcileHooksPost. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecConfigurationClustersReconcileHooksPost.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecConfigurationClustersReconcileHooksPost.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 events: Optional[Sequence[_builtins.str]] = None,
+                 failure_policy: Optional[_builtins.str] = None,
+                 http: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttp'] = None,
+                 shell: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShell'] = None,
+                 sql: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSql'] = None,
+                 target: Optional[_builtins.str] = None):
+        """
+        :param Sequence[_builtins.str] events: Cluster-scope reconcile lifecycle events. Required, non-empty.
+                 Any              - wildcard match: fires on every cluster reconcile pass
+                                    and the cluster delete sweep
+                 ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
+                                    only on the first reconcile of a brand-new cluster
+                 ClusterReconcile - ongoing reconcile pass over an existing cluster (at
+                                    least one host has prior state). Fires on every
+                                    operator reconcile cycle the upstream gates allow,
+                                    including taskID-only force-reconciles. NOT a "spec
+                                    changed" signal.
+                 ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
+        :param _builtins.str failure_policy: Controls what happens when this hook returns an error.
+               Fail (default) propagates the error; Ignore logs a warning and continues.
+        :param _builtins.str target: where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
+        """
+        if events is not None:
+            pulumi.set(__self__, "events", events)
+        if failure_policy is not None:
+            pulumi.set(__self__, "failure_policy", failure_policy)
+        if http is not None:
+            pulumi.set(__self__, "http", http)
+        if shell is not None:
+            pulumi.set(__self__, "shell", shell)
+        if sql is not None:
+            pulumi.set(__self__, "sql", sql)
+        if target is not None:
+            pulumi.set(__self__, "target", target)
+
+    @_builtins.property
+    @pulumi.getter
+    def events(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        Cluster-scope reconcile lifecycle events. Required, non-empty.
+          Any              - wildcard match: fires on every cluster reconcile pass
+                             and the cluster delete sweep
+          ClusterCreate    - all hosts in the cluster are new (no ancestor); fires
+                             only on the first reconcile of a brand-new cluster
+          ClusterReconcile - ongoing reconcile pass over an existing cluster (at
+                             least one host has prior state). Fires on every
+                             operator reconcile cycle the upstream gates allow,
+                             including taskID-only force-reconciles. NOT a "spec
+                             changed" signal.
+          ClusterDelete    - cluster is being removed (delete sweep — wiring follow-up)
+        """
+        return pulumi.get(self, "events")
+
+    @_builtins.property
+    @pulumi.getter(name="failurePolicy")
+    def failure_policy(self) -> Optional[_builtins.str]:
+        """
+        Controls what happens when this hook returns an error.
+        Fail (default) propagates the error; Ignore logs a warning and continues.
+        """
+        return pulumi.get(self, "failure_policy")
+
+    @_builtins.property
+    @pulumi.getter
+    def http(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttp']:
+        return pulumi.get(self, "http")
+
+    @_builtins.property
+    @pulumi.getter
+    def shell(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShell']:
+        return pulumi.get(self, "shell")
+
+    @_builtins.property
+    @pulumi.getter
+    def sql(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSql']:
+        return pulumi.get(self, "sql")
+
+    @_builtins.property
+    @pulumi.getter
+    def target(self) -> Optional[_builtins.str]:
+        """
+        where to execute hook for cluster-level hooks: FirstHost (default), AllHosts, AllShards
+        """
+        return pulumi.get(self, "target")
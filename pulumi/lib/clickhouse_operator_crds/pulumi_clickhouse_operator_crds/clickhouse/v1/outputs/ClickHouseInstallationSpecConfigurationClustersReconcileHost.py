@@ -0,0 +1,61 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersReconcileHost']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecConfigurationClustersReconcileHost(dict):
+    """
+    Whether the operator during reconcile procedure should wait for a ClickHouse host:
+      - to be excluded from a ClickHouse cluster
+      - to complete all running queries
+      - to be included into a ClickHouse cluster
+    respectfully before moving forward
+    """
+    def __init__(__self__, *,
+                 drop: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostDrop'] = None,
+                 hooks: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooks'] = None,
+                 wait: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWait'] = None):
+        """
+        Whether the operator during reconcile procedure should wait for a ClickHouse host:
+          - to be excluded from a ClickHouse cluster
+          - to complete all running queries
+          - to be included into a ClickHouse cluster
+        respectfully before moving forward
+        """
+        if drop is not None:
+            pulumi.set(__self__, "drop", drop)
+        if hooks is not None:
+            pulumi.set(__self__, "hooks", hooks)
+        if wait is not None:
+            pulumi.set(__self__, "wait", wait)
+
+    @_builtins.property
+    @pulumi.getter
+    def drop(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostDrop']:
+        return pulumi.get(self, "drop")
+
+    @_builtins.property
+    @pulumi.getter
+    def hooks(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostHooks']:
+        return pulumi.get(self, "hooks")
+
+    @_builtins.property
+    @pulumi.getter
+    def wait(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWait']:
+        return pulumi.get(self, "wait")
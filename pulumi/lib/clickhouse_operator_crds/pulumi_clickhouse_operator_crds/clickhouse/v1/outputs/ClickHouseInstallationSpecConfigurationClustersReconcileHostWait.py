@@ -0,0 +1,83 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersReconcileHostWait']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecConfigurationClustersReconcileHostWait(dict):
+    def __init__(__self__, *,
+                 exclude: Optional[_builtins.str] = None,
+                 include: Optional[_builtins.str] = None,
+                 probes: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbes'] = None,
+                 queries: Optional[_builtins.str] = None,
+                 replicas: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicas'] = None):
+        """
+        :param _builtins.str exclude: Allows to stop all ClickHouse clusters defined in a CHI.
+               Works as the following:
+                - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
+                - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
+        :param _builtins.str include: Whether the operator during reconcile procedure should wait for a ClickHouse host to be included into a ClickHouse cluster
+        :param _builtins.str queries: Whether the operator during reconcile procedure should wait for a ClickHouse host to complete all running queries
+        """
+        if exclude is not None:
+            pulumi.set(__self__, "exclude", exclude)
+        if include is not None:
+            pulumi.set(__self__, "include", include)
+        if probes is not None:
+            pulumi.set(__self__, "probes", probes)
+        if queries is not None:
+            pulumi.set(__self__, "queries", queries)
+        if replicas is not None:
+            pulumi.set(__self__, "replicas", replicas)
+
+    @_builtins.property
+    @pulumi.getter
+    def exclude(self) -> Optional[_builtins.str]:
+        """
+        Allows to stop all ClickHouse clusters defined in a CHI.
+        Works as the following:
+         - When `stop` is `1` operator sets `Replicas: 0` in each StatefulSet. Thie leads to having all `Pods` and `Service` deleted. All PVCs are kept intact.
+         - When `stop` is `0` operator sets `Replicas: 1` and `Pod`s and `Service`s will created again and all retained PVCs will be attached to `Pod`s.
+        """
+        return pulumi.get(self, "exclude")
+
+    @_builtins.property
+    @pulumi.getter
+    def include(self) -> Optional[_builtins.str]:
+        """
+        Whether the operator during reconcile procedure should wait for a ClickHouse host to be included into a ClickHouse cluster
+        """
+        return pulumi.get(self, "include")
+
+    @_builtins.property
+    @pulumi.getter
+    def probes(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbes']:
+        return pulumi.get(self, "probes")
+
+    @_builtins.property
+    @pulumi.getter
+    def queries(self) -> Optional[_builtins.str]:
+        """
+        Whether the operator during reconcile procedure should wait for a ClickHouse host to complete all running queries
+        """
+        return pulumi.get(self, "queries")
+
+    @_builtins.property
+    @pulumi.getter
+    def replicas(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicas']:
+        return pulumi.get(self, "replicas")
@@ -0,0 +1,66 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatch']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatch(dict):
+    """
+    Whether the operator during reconcile procedure should wait for replicas to catch-up
+    """
+    def __init__(__self__, *,
+                 all: Optional[_builtins.str] = None,
+                 delay: Optional[_builtins.int] = None,
+                 new: Optional[_builtins.str] = None):
+        """
+        Whether the operator during reconcile procedure should wait for replicas to catch-up
+
+        :param _builtins.str all: Whether the operator during reconcile procedure should wait for all replicas to catch-up
+        :param _builtins.int delay: replication max absolute delay to consider replica is not delayed
+        :param _builtins.str new: Whether the operator during reconcile procedure should wait for new replicas to catch-up
+        """
+        if all is not None:
+            pulumi.set(__self__, "all", all)
+        if delay is not None:
+            pulumi.set(__self__, "delay", delay)
+        if new is not None:
+            pulumi.set(__self__, "new", new)
+
+    @_builtins.property
+    @pulumi.getter
+    def all(self) -> Optional[_builtins.str]:
+        """
+        Whether the operator during reconcile procedure should wait for all replicas to catch-up
+        """
+        return pulumi.get(self, "all")
+
+    @_builtins.property
+    @pulumi.getter
+    def delay(self) -> Optional[_builtins.int]:
+        """
+        replication max absolute delay to consider replica is not delayed
+        """
+        return pulumi.get(self, "delay")
+
+    @_builtins.property
+    @pulumi.getter
+    def new(self) -> Optional[_builtins.str]:
+        """
+        Whether the operator during reconcile procedure should wait for new replicas to catch-up
+        """
+        return pulumi.get(self, "new")
@@ -0,0 +1,55 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersSchemaPolicy']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecConfigurationClustersSchemaPolicy(dict):
+    """
+    describes how schema is propagated within replicas and shards
+    """
+    def __init__(__self__, *,
+                 replica: Optional[_builtins.str] = None,
+                 shard: Optional[_builtins.str] = None):
+        """
+        describes how schema is propagated within replicas and shards
+
+
+        :param _builtins.str replica: how schema is propagated within a replica
+        :param _builtins.str shard: how schema is propagated between shards
+        """
+        if replica is not None:
+            pulumi.set(__self__, "replica", replica)
+        if shard is not None:
+            pulumi.set(__self__, "shard", shard)
+
+    @_builtins.property
+    @pulumi.getter
+    def replica(self) -> Optional[_builtins.str]:
+        """
+        how schema is propagated within a replica
+        """
+        return pulumi.get(self, "replica")
+
+    @_builtins.property
+    @pulumi.getter
+    def shard(self) -> Optional[_builtins.str]:
+        """
+        how schema is propagated between shards
+        """
+        return pulumi.get(self, "shard")
@@ -0,0 +1,79 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersSecret']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecConfigurationClustersSecret(dict):
+    """
+    optional, shared secret value to secure cluster communications
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "valueFrom":
+            suggest = "value_from"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersSecret. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecConfigurationClustersSecret.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecConfigurationClustersSecret.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 auto: Optional[_builtins.str] = None,
+                 value: Optional[_builtins.str] = None,
+                 value_from: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFrom'] = None):
+        """
+        optional, shared secret value to secure cluster communications
+
+        :param _builtins.str auto: Auto-generate shared secret value to secure cluster communications
+        :param _builtins.str value: Cluster shared secret value in plain text
+        """
+        if auto is not None:
+            pulumi.set(__self__, "auto", auto)
+        if value is not None:
+            pulumi.set(__self__, "value", value)
+        if value_from is not None:
+            pulumi.set(__self__, "value_from", value_from)
+
+    @_builtins.property
+    @pulumi.getter
+    def auto(self) -> Optional[_builtins.str]:
+        """
+        Auto-generate shared secret value to secure cluster communications
+        """
+        return pulumi.get(self, "auto")
+
+    @_builtins.property
+    @pulumi.getter
+    def value(self) -> Optional[_builtins.str]:
+        """
+        Cluster shared secret value in plain text
+        """
+        return pulumi.get(self, "value")
+
+    @_builtins.property
+    @pulumi.getter(name="valueFrom")
+    def value_from(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFrom']:
+        return pulumi.get(self, "value_from")
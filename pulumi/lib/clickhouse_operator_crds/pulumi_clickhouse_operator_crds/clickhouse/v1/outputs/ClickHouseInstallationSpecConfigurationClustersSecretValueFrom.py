@@ -0,0 +1,54 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersSecretValueFrom']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecConfigurationClustersSecretValueFrom(dict):
+    """
+    Cluster shared secret source
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "secretKeyRef":
+            suggest = "secret_key_ref"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecConfigurationClustersSecretValueFrom. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecConfigurationClustersSecretValueFrom.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecConfigurationClustersSecretValueFrom.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 secret_key_ref: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRef'] = None):
+        """
+        Cluster shared secret source
+        """
+        if secret_key_ref is not None:
+            pulumi.set(__self__, "secret_key_ref", secret_key_ref)
+
+    @_builtins.property
+    @pulumi.getter(name="secretKeyRef")
+    def secret_key_ref(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRef']:
+        return pulumi.get(self, "secret_key_ref")
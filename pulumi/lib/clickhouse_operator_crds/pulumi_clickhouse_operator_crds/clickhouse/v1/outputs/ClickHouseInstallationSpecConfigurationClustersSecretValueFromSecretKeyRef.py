@@ -0,0 +1,71 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRef']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRef(dict):
+    """
+    Selects a key of a secret in the clickhouse installation namespace.
+    Should not be used if value is not empty.
+    """
+    def __init__(__self__, *,
+                 key: Optional[_builtins.str] = None,
+                 name: Optional[_builtins.str] = None,
+                 optional: Optional[_builtins.bool] = None):
+        """
+        Selects a key of a secret in the clickhouse installation namespace.
+        Should not be used if value is not empty.
+
+
+        :param _builtins.str key: The key of the secret to select from. Must be a valid secret key.
+        :param _builtins.str name: Name of the referent. More info:
+               https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
+        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
+        """
+        if key is not None:
+            pulumi.set(__self__, "key", key)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if optional is not None:
+            pulumi.set(__self__, "optional", optional)
+
+    @_builtins.property
+    @pulumi.getter
+    def key(self) -> Optional[_builtins.str]:
+        """
+        The key of the secret to select from. Must be a valid secret key.
+        """
+        return pulumi.get(self, "key")
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> Optional[_builtins.str]:
+        """
+        Name of the referent. More info:
+        https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
+        """
+        return pulumi.get(self, "name")
+
+    @_builtins.property
+    @pulumi.getter
+    def optional(self) -> Optional[_builtins.bool]:
+        """
+        Specify whether the Secret or its key must be defined
+        """
+        return pulumi.get(self, "optional")
@@ -0,0 +1,113 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecConfigurationClustersZookeeperPatch']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecConfigurationClustersZookeeperPatch(dict):
+    """
+    optional, allows configure <yandex><zookeeper>..</zookeeper></yandex> section in each `Pod` only in current ClickHouse cluster, during generate `ConfigMap` which will mounted in `/etc/clickhouse-server/config.d/`
+    override top-level `chi.spec.configuration.zookeeper` settings
+    """
+    def __init__(__self__, *,
+                 identity: Optional[_builtins.str] = None,
+                 keeper: Optional['outputs.ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatch'] = None,
+                 nodes: Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatch']] = None,
+                 operation_timeout_ms: Optional[_builtins.int] = None,
+                 root: Optional[_builtins.str] = None,
+                 session_timeout_ms: Optional[_builtins.int] = None,
+                 use_compression: Optional[_builtins.str] = None):
+        """
+        optional, allows configure <yandex><zookeeper>..</zookeeper></yandex> section in each `Pod` only in current ClickHouse cluster, during generate `ConfigMap` which will mounted in `/etc/clickhouse-server/config.d/`
+        override top-level `chi.spec.configuration.zookeeper` settings
+
+
+        :param _builtins.str identity: optional access credentials string with `user:password` format used when use digest authorization in Zookeeper
+        :param Sequence['ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatchArgs'] nodes: describe every available zookeeper cluster node for interaction
+        :param _builtins.int operation_timeout_ms: one operation timeout during Zookeeper transactions
+        :param _builtins.str root: optional root znode path inside zookeeper to store ClickHouse related data (replication queue or distributed DDL)
+        :param _builtins.int session_timeout_ms: session timeout during connect to Zookeeper
+        :param _builtins.str use_compression: Enables compression in Keeper protocol if set to true
+        """
+        if identity is not None:
+            pulumi.set(__self__, "identity", identity)
+        if keeper is not None:
+            pulumi.set(__self__, "keeper", keeper)
+        if nodes is not None:
+            pulumi.set(__self__, "nodes", nodes)
+        if operation_timeout_ms is not None:
+            pulumi.set(__self__, "operation_timeout_ms", operation_timeout_ms)
+        if root is not None:
+            pulumi.set(__self__, "root", root)
+        if session_timeout_ms is not None:
+            pulumi.set(__self__, "session_timeout_ms", session_timeout_ms)
+        if use_compression is not None:
+            pulumi.set(__self__, "use_compression", use_compression)
+
+    @_builtins.property
+    @pulumi.getter
+    def identity(self) -> Optional[_builtins.str]:
+        """
+        optional access credentials string with `user:password` format used when use digest authorization in Zookeeper
+        """
+        return pulumi.get(self, "identity")
+
+    @_builtins.property
+    @pulumi.getter
+    def keeper(self) -> Optional['outputs.ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatch']:
+        return pulumi.get(self, "keeper")
+
+    @_builtins.property
+    @pulumi.getter
+    def nodes(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatch']]:
+        """
+        describe every available zookeeper cluster node for interaction
+        """
+        return pulumi.get(self, "nodes")
+
+    @_builtins.property
+    @pulumi.getter
+    def operation_timeout_ms(self) -> Optional[_builtins.int]:
+        """
+        one operation timeout during Zookeeper transactions
+        """
+        return pulumi.get(self, "operation_timeout_ms")
+
+    @_builtins.property
+    @pulumi.getter
+    def root(self) -> Optional[_builtins.str]:
+        """
+        optional root znode path inside zookeeper to store ClickHouse related data (replication queue or distributed DDL)
+        """
+        return pulumi.get(self, "root")
+
+    @_builtins.property
+    @pulumi.getter
+    def session_timeout_ms(self) -> Optional[_builtins.int]:
+        """
+        session timeout during connect to Zookeeper
+        """
+        return pulumi.get(self, "session_timeout_ms")
+
+    @_builtins.property
+    @pulumi.getter
+    def use_compression(self) -> Optional[_builtins.str]:
+        """
+        Enables compression in Keeper protocol if set to true
+        """
+        return pulumi.get(self, "use_compression")
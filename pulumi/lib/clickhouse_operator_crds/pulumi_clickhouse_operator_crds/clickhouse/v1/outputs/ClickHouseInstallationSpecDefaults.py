@@ -0,0 +1,94 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecDefaults']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecDefaults(dict):
+    """
+    define default behavior for whole ClickHouseInstallation, some behavior can be re-define on cluster, shard and replica level
+    More info: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specdefaults
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "distributedDDL":
+            suggest = "distributed_ddl"
+        elif key == "replicasUseFQDN":
+            suggest = "replicas_use_fqdn"
+        elif key == "storageManagement":
+            suggest = "storage_management"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecDefaults. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecDefaults.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecDefaults.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 distributed_ddl: Optional['outputs.ClickHouseInstallationSpecDefaultsDistributedDDL'] = None,
+                 replicas_use_fqdn: Optional[_builtins.str] = None,
+                 storage_management: Optional['outputs.ClickHouseInstallationSpecDefaultsStorageManagement'] = None,
+                 templates: Optional['outputs.ClickHouseInstallationSpecDefaultsTemplates'] = None):
+        """
+        define default behavior for whole ClickHouseInstallation, some behavior can be re-define on cluster, shard and replica level
+        More info: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#specdefaults
+
+
+        :param _builtins.str replicas_use_fqdn: define should replicas be specified by FQDN in `<host></host>`.
+               In case of "no" will use short hostname and clickhouse-server will use kubernetes default suffixes for DNS lookup
+               "no" by default
+        """
+        if distributed_ddl is not None:
+            pulumi.set(__self__, "distributed_ddl", distributed_ddl)
+        if replicas_use_fqdn is not None:
+            pulumi.set(__self__, "replicas_use_fqdn", replicas_use_fqdn)
+        if storage_management is not None:
+            pulumi.set(__self__, "storage_management", storage_management)
+        if templates is not None:
+            pulumi.set(__self__, "templates", templates)
+
+    @_builtins.property
+    @pulumi.getter(name="distributedDDL")
+    def distributed_ddl(self) -> Optional['outputs.ClickHouseInstallationSpecDefaultsDistributedDDL']:
+        return pulumi.get(self, "distributed_ddl")
+
+    @_builtins.property
+    @pulumi.getter(name="replicasUseFQDN")
+    def replicas_use_fqdn(self) -> Optional[_builtins.str]:
+        """
+        define should replicas be specified by FQDN in `<host></host>`.
+        In case of "no" will use short hostname and clickhouse-server will use kubernetes default suffixes for DNS lookup
+        "no" by default
+        """
+        return pulumi.get(self, "replicas_use_fqdn")
+
+    @_builtins.property
+    @pulumi.getter(name="storageManagement")
+    def storage_management(self) -> Optional['outputs.ClickHouseInstallationSpecDefaultsStorageManagement']:
+        return pulumi.get(self, "storage_management")
+
+    @_builtins.property
+    @pulumi.getter
+    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecDefaultsTemplates']:
+        return pulumi.get(self, "templates")
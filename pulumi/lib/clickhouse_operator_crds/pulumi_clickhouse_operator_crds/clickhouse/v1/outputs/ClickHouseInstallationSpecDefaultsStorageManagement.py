@@ -0,0 +1,73 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecDefaultsStorageManagement']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecDefaultsStorageManagement(dict):
+    """
+    default storage management options
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "reclaimPolicy":
+            suggest = "reclaim_policy"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecDefaultsStorageManagement. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecDefaultsStorageManagement.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecDefaultsStorageManagement.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 provisioner: Optional[_builtins.str] = None,
+                 reclaim_policy: Optional[_builtins.str] = None):
+        """
+        default storage management options
+
+        :param _builtins.str provisioner: defines `PVC` provisioner - be it StatefulSet or the Operator
+        :param _builtins.str reclaim_policy: defines behavior of `PVC` deletion.
+               `Delete` by default, if `Retain` specified then `PVC` will be kept when deleting StatefulSet
+        """
+        if provisioner is not None:
+            pulumi.set(__self__, "provisioner", provisioner)
+        if reclaim_policy is not None:
+            pulumi.set(__self__, "reclaim_policy", reclaim_policy)
+
+    @_builtins.property
+    @pulumi.getter
+    def provisioner(self) -> Optional[_builtins.str]:
+        """
+        defines `PVC` provisioner - be it StatefulSet or the Operator
+        """
+        return pulumi.get(self, "provisioner")
+
+    @_builtins.property
+    @pulumi.getter(name="reclaimPolicy")
+    def reclaim_policy(self) -> Optional[_builtins.str]:
+        """
+        defines behavior of `PVC` deletion.
+        `Delete` by default, if `Retain` specified then `PVC` will be kept when deleting StatefulSet
+        """
+        return pulumi.get(self, "reclaim_policy")
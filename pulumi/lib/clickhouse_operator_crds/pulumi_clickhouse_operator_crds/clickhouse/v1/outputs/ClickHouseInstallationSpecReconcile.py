@@ -0,0 +1,133 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecReconcile']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecReconcile(dict):
+    """
+    Optional, allows tuning reconciling cycle for ClickhouseInstallation from clickhouse-operator side
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "configMapPropagationTimeout":
+            suggest = "config_map_propagation_timeout"
+        elif key == "statefulSet":
+            suggest = "stateful_set"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcile. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecReconcile.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecReconcile.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 cleanup: Optional['outputs.ClickHouseInstallationSpecReconcileCleanup'] = None,
+                 cluster: Optional['outputs.ClickHouseInstallationSpecReconcileCluster'] = None,
+                 config_map_propagation_timeout: Optional[_builtins.int] = None,
+                 host: Optional['outputs.ClickHouseInstallationSpecReconcileHost'] = None,
+                 macros: Optional['outputs.ClickHouseInstallationSpecReconcileMacros'] = None,
+                 policy: Optional[_builtins.str] = None,
+                 runtime: Optional['outputs.ClickHouseInstallationSpecReconcileRuntime'] = None,
+                 stateful_set: Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSet'] = None):
+        """
+        Optional, allows tuning reconciling cycle for ClickhouseInstallation from clickhouse-operator side
+
+        :param _builtins.int config_map_propagation_timeout: Timeout in seconds for `clickhouse-operator` to wait for modified `ConfigMap` to propagate into the `Pod`
+               More details: https://kubernetes.io/docs/concepts/configuration/configmap/#mounted-configmaps-are-updated-automatically
+        :param _builtins.str policy: DISCUSSED TO BE DEPRECATED
+               Syntax sugar
+               Overrides all three 'reconcile.host.wait.{exclude, queries, include}' values from the operator's config
+               Possible values:
+                - wait - should wait to exclude host, complete queries and include host back into the cluster
+                - nowait - should NOT wait to exclude host, complete queries and include host back into the cluster
+        """
+        if cleanup is not None:
+            pulumi.set(__self__, "cleanup", cleanup)
+        if cluster is not None:
+            pulumi.set(__self__, "cluster", cluster)
+        if config_map_propagation_timeout is not None:
+            pulumi.set(__self__, "config_map_propagation_timeout", config_map_propagation_timeout)
+        if host is not None:
+            pulumi.set(__self__, "host", host)
+        if macros is not None:
+            pulumi.set(__self__, "macros", macros)
+        if policy is not None:
+            pulumi.set(__self__, "policy", policy)
+        if runtime is not None:
+            pulumi.set(__self__, "runtime", runtime)
+        if stateful_set is not None:
+            pulumi.set(__self__, "stateful_set", stateful_set)
+
+    @_builtins.property
+    @pulumi.getter
+    def cleanup(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileCleanup']:
+        return pulumi.get(self, "cleanup")
+
+    @_builtins.property
+    @pulumi.getter
+    def cluster(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileCluster']:
+        return pulumi.get(self, "cluster")
+
+    @_builtins.property
+    @pulumi.getter(name="configMapPropagationTimeout")
+    def config_map_propagation_timeout(self) -> Optional[_builtins.int]:
+        """
+        Timeout in seconds for `clickhouse-operator` to wait for modified `ConfigMap` to propagate into the `Pod`
+        More details: https://kubernetes.io/docs/concepts/configuration/configmap/#mounted-configmaps-are-updated-automatically
+        """
+        return pulumi.get(self, "config_map_propagation_timeout")
+
+    @_builtins.property
+    @pulumi.getter
+    def host(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileHost']:
+        return pulumi.get(self, "host")
+
+    @_builtins.property
+    @pulumi.getter
+    def macros(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacros']:
+        return pulumi.get(self, "macros")
+
+    @_builtins.property
+    @pulumi.getter
+    def policy(self) -> Optional[_builtins.str]:
+        """
+        DISCUSSED TO BE DEPRECATED
+        Syntax sugar
+        Overrides all three 'reconcile.host.wait.{exclude, queries, include}' values from the operator's config
+        Possible values:
+         - wait - should wait to exclude host, complete queries and include host back into the cluster
+         - nowait - should NOT wait to exclude host, complete queries and include host back into the cluster
+        """
+        return pulumi.get(self, "policy")
+
+    @_builtins.property
+    @pulumi.getter
+    def runtime(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileRuntime']:
+        return pulumi.get(self, "runtime")
+
+    @_builtins.property
+    @pulumi.getter(name="statefulSet")
+    def stateful_set(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSet']:
+        return pulumi.get(self, "stateful_set")
@@ -0,0 +1,64 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecReconcileCleanup']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecReconcileCleanup(dict):
+    """
+    Optional, defines behavior for cleanup Kubernetes resources during reconcile cycle
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "reconcileFailedObjects":
+            suggest = "reconcile_failed_objects"
+        elif key == "unknownObjects":
+            suggest = "unknown_objects"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileCleanup. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecReconcileCleanup.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecReconcileCleanup.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 reconcile_failed_objects: Optional['outputs.ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjects'] = None,
+                 unknown_objects: Optional['outputs.ClickHouseInstallationSpecReconcileCleanupUnknownObjects'] = None):
+        """
+        Optional, defines behavior for cleanup Kubernetes resources during reconcile cycle
+        """
+        if reconcile_failed_objects is not None:
+            pulumi.set(__self__, "reconcile_failed_objects", reconcile_failed_objects)
+        if unknown_objects is not None:
+            pulumi.set(__self__, "unknown_objects", unknown_objects)
+
+    @_builtins.property
+    @pulumi.getter(name="reconcileFailedObjects")
+    def reconcile_failed_objects(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjects']:
+        return pulumi.get(self, "reconcile_failed_objects")
+
+    @_builtins.property
+    @pulumi.getter(name="unknownObjects")
+    def unknown_objects(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileCleanupUnknownObjects']:
+        return pulumi.get(self, "unknown_objects")
@@ -0,0 +1,102 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecReconcileCleanupUnknownObjects']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecReconcileCleanupUnknownObjects(dict):
+    """
+    Describes what clickhouse-operator should do with found Kubernetes resources which should be managed by clickhouse-operator,
+    but do not have `ownerReference` to any currently managed `ClickHouseInstallation` resource.
+    Default behavior is `Delete`"
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "configMap":
+            suggest = "config_map"
+        elif key == "statefulSet":
+            suggest = "stateful_set"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileCleanupUnknownObjects. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecReconcileCleanupUnknownObjects.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecReconcileCleanupUnknownObjects.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 config_map: Optional[_builtins.str] = None,
+                 pvc: Optional[_builtins.str] = None,
+                 service: Optional[_builtins.str] = None,
+                 stateful_set: Optional[_builtins.str] = None):
+        """
+        Describes what clickhouse-operator should do with found Kubernetes resources which should be managed by clickhouse-operator,
+        but do not have `ownerReference` to any currently managed `ClickHouseInstallation` resource.
+        Default behavior is `Delete`"
+
+
+        :param _builtins.str config_map: Behavior policy for unknown ConfigMap, `Delete` by default
+        :param _builtins.str pvc: Behavior policy for unknown PVC, `Delete` by default
+        :param _builtins.str service: Behavior policy for unknown Service, `Delete` by default
+        :param _builtins.str stateful_set: Behavior policy for unknown StatefulSet, `Delete` by default
+        """
+        if config_map is not None:
+            pulumi.set(__self__, "config_map", config_map)
+        if pvc is not None:
+            pulumi.set(__self__, "pvc", pvc)
+        if service is not None:
+            pulumi.set(__self__, "service", service)
+        if stateful_set is not None:
+            pulumi.set(__self__, "stateful_set", stateful_set)
+
+    @_builtins.property
+    @pulumi.getter(name="configMap")
+    def config_map(self) -> Optional[_builtins.str]:
+        """
+        Behavior policy for unknown ConfigMap, `Delete` by default
+        """
+        return pulumi.get(self, "config_map")
+
+    @_builtins.property
+    @pulumi.getter
+    def pvc(self) -> Optional[_builtins.str]:
+        """
+        Behavior policy for unknown PVC, `Delete` by default
+        """
+        return pulumi.get(self, "pvc")
+
+    @_builtins.property
+    @pulumi.getter
+    def service(self) -> Optional[_builtins.str]:
+        """
+        Behavior policy for unknown Service, `Delete` by default
+        """
+        return pulumi.get(self, "service")
+
+    @_builtins.property
+    @pulumi.getter(name="statefulSet")
+    def stateful_set(self) -> Optional[_builtins.str]:
+        """
+        Behavior policy for unknown StatefulSet, `Delete` by default
+        """
+        return pulumi.get(self, "stateful_set")
@@ -0,0 +1,54 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecReconcileClusterHooks']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecReconcileClusterHooks(dict):
+    """
+    cluster-level hooks inherited by every cluster
+    """
+    def __init__(__self__, *,
+                 post: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileClusterHooksPost']] = None,
+                 pre: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileClusterHooksPre']] = None):
+        """
+        cluster-level hooks inherited by every cluster
+
+        :param Sequence['ClickHouseInstallationSpecReconcileClusterHooksPostArgs'] post: actions to execute after each cluster reconcile
+        :param Sequence['ClickHouseInstallationSpecReconcileClusterHooksPreArgs'] pre: actions to execute before each cluster reconcile
+        """
+        if post is not None:
+            pulumi.set(__self__, "post", post)
+        if pre is not None:
+            pulumi.set(__self__, "pre", pre)
+
+    @_builtins.property
+    @pulumi.getter
+    def post(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileClusterHooksPost']]:
+        """
+        actions to execute after each cluster reconcile
+        """
+        return pulumi.get(self, "post")
+
+    @_builtins.property
+    @pulumi.getter
+    def pre(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileClusterHooksPre']]:
+        """
+        actions to execute before each cluster reconcile
+        """
+        return pulumi.get(self, "pre")
@@ -0,0 +1,54 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecReconcileHostHooksPatch']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecReconcileHostHooksPatch(dict):
+    """
+    hooks to execute before and after host reconcile
+    """
+    def __init__(__self__, *,
+                 post: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileHostHooksPostPatch']] = None,
+                 pre: Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileHostHooksPrePatch']] = None):
+        """
+        hooks to execute before and after host reconcile
+
+        :param Sequence['ClickHouseInstallationSpecReconcileHostHooksPostPatchArgs'] post: actions to execute after reconcile
+        :param Sequence['ClickHouseInstallationSpecReconcileHostHooksPrePatchArgs'] pre: actions to execute before reconcile
+        """
+        if post is not None:
+            pulumi.set(__self__, "post", post)
+        if pre is not None:
+            pulumi.set(__self__, "pre", pre)
+
+    @_builtins.property
+    @pulumi.getter
+    def post(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileHostHooksPostPatch']]:
+        """
+        actions to execute after reconcile
+        """
+        return pulumi.get(self, "post")
+
+    @_builtins.property
+    @pulumi.getter
+    def pre(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecReconcileHostHooksPrePatch']]:
+        """
+        actions to execute before reconcile
+        """
+        return pulumi.get(self, "pre")
@@ -0,0 +1,69 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecReconcileMacrosSectionsPatch']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecReconcileMacrosSectionsPatch(dict):
+    """
+    sections behaviour for macros
+    """
+    def __init__(__self__, *,
+                 files: Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatch'] = None,
+                 profiles: Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatch'] = None,
+                 quotas: Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatch'] = None,
+                 settings: Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatch'] = None,
+                 users: Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatch'] = None):
+        """
+        sections behaviour for macros
+        """
+        if files is not None:
+            pulumi.set(__self__, "files", files)
+        if profiles is not None:
+            pulumi.set(__self__, "profiles", profiles)
+        if quotas is not None:
+            pulumi.set(__self__, "quotas", quotas)
+        if settings is not None:
+            pulumi.set(__self__, "settings", settings)
+        if users is not None:
+            pulumi.set(__self__, "users", users)
+
+    @_builtins.property
+    @pulumi.getter
+    def files(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatch']:
+        return pulumi.get(self, "files")
+
+    @_builtins.property
+    @pulumi.getter
+    def profiles(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatch']:
+        return pulumi.get(self, "profiles")
+
+    @_builtins.property
+    @pulumi.getter
+    def quotas(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatch']:
+        return pulumi.get(self, "quotas")
+
+    @_builtins.property
+    @pulumi.getter
+    def settings(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatch']:
+        return pulumi.get(self, "settings")
+
+    @_builtins.property
+    @pulumi.getter
+    def users(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatch']:
+        return pulumi.get(self, "users")
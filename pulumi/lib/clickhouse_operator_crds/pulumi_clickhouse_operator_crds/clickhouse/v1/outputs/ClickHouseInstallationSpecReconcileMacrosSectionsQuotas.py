@@ -0,0 +1,42 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecReconcileMacrosSectionsQuotas']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecReconcileMacrosSectionsQuotas(dict):
+    """
+    sections behaviour for macros on quotas
+    """
+    def __init__(__self__, *,
+                 enabled: Optional[_builtins.str] = None):
+        """
+        sections behaviour for macros on quotas
+
+        :param _builtins.str enabled: enabled or not
+        """
+        if enabled is not None:
+            pulumi.set(__self__, "enabled", enabled)
+
+    @_builtins.property
+    @pulumi.getter
+    def enabled(self) -> Optional[_builtins.str]:
+        """
+        enabled or not
+        """
+        return pulumi.get(self, "enabled")
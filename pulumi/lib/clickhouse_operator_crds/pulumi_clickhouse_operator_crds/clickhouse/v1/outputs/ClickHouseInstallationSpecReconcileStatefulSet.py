@@ -0,0 +1,53 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecReconcileStatefulSet']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecReconcileStatefulSet(dict):
+    """
+    Optional, StatefulSet reconcile behavior tuning
+    """
+    def __init__(__self__, *,
+                 create: Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetCreate'] = None,
+                 recreate: Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetRecreate'] = None,
+                 update: Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetUpdate'] = None):
+        """
+        Optional, StatefulSet reconcile behavior tuning
+        """
+        if create is not None:
+            pulumi.set(__self__, "create", create)
+        if recreate is not None:
+            pulumi.set(__self__, "recreate", recreate)
+        if update is not None:
+            pulumi.set(__self__, "update", update)
+
+    @_builtins.property
+    @pulumi.getter
+    def create(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetCreate']:
+        return pulumi.get(self, "create")
+
+    @_builtins.property
+    @pulumi.getter
+    def recreate(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetRecreate']:
+        return pulumi.get(self, "recreate")
+
+    @_builtins.property
+    @pulumi.getter
+    def update(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetUpdate']:
+        return pulumi.get(self, "update")
@@ -0,0 +1,53 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecReconcileStatefulSetPatch']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecReconcileStatefulSetPatch(dict):
+    """
+    Optional, StatefulSet reconcile behavior tuning
+    """
+    def __init__(__self__, *,
+                 create: Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetCreatePatch'] = None,
+                 recreate: Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetRecreatePatch'] = None,
+                 update: Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetUpdatePatch'] = None):
+        """
+        Optional, StatefulSet reconcile behavior tuning
+        """
+        if create is not None:
+            pulumi.set(__self__, "create", create)
+        if recreate is not None:
+            pulumi.set(__self__, "recreate", recreate)
+        if update is not None:
+            pulumi.set(__self__, "update", update)
+
+    @_builtins.property
+    @pulumi.getter
+    def create(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetCreatePatch']:
+        return pulumi.get(self, "create")
+
+    @_builtins.property
+    @pulumi.getter
+    def recreate(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetRecreatePatch']:
+        return pulumi.get(self, "recreate")
+
+    @_builtins.property
+    @pulumi.getter
+    def update(self) -> Optional['outputs.ClickHouseInstallationSpecReconcileStatefulSetUpdatePatch']:
+        return pulumi.get(self, "update")
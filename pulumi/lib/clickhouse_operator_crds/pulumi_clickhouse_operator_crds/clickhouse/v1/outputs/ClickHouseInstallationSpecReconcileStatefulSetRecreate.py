@@ -0,0 +1,85 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecReconcileStatefulSetRecreate']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecReconcileStatefulSetRecreate(dict):
+    """
+    Behavior during recreate StatefulSet
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "onDataLoss":
+            suggest = "on_data_loss"
+        elif key == "onUpdateFailure":
+            suggest = "on_update_failure"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecReconcileStatefulSetRecreate. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecReconcileStatefulSetRecreate.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecReconcileStatefulSetRecreate.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 on_data_loss: Optional[_builtins.str] = None,
+                 on_update_failure: Optional[_builtins.str] = None):
+        """
+        Behavior during recreate StatefulSet
+
+        :param _builtins.str on_data_loss: What to do in case operator needs to recreate StatefulSet due to PVC data loss or missing volumes.
+               Possible options:
+               1. abort - abort the process, do nothing with the problematic StatefulSet.
+               2. recreate - proceed and recreate StatefulSet.
+        :param _builtins.str on_update_failure: What to do in case operator needs to recreate StatefulSet due to update failure or StatefulSet not ready.
+               Possible options:
+               1. abort - abort the process, do nothing with the problematic StatefulSet.
+               2. recreate - proceed and recreate StatefulSet.
+        """
+        if on_data_loss is not None:
+            pulumi.set(__self__, "on_data_loss", on_data_loss)
+        if on_update_failure is not None:
+            pulumi.set(__self__, "on_update_failure", on_update_failure)
+
+    @_builtins.property
+    @pulumi.getter(name="onDataLoss")
+    def on_data_loss(self) -> Optional[_builtins.str]:
+        """
+        What to do in case operator needs to recreate StatefulSet due to PVC data loss or missing volumes.
+        Possible options:
+        1. abort - abort the process, do nothing with the problematic StatefulSet.
+        2. recreate - proceed and recreate StatefulSet.
+        """
+        return pulumi.get(self, "on_data_loss")
+
+    @_builtins.property
+    @pulumi.getter(name="onUpdateFailure")
+    def on_update_failure(self) -> Optional[_builtins.str]:
+        """
+        What to do in case operator needs to recreate StatefulSet due to update failure or StatefulSet not ready.
+        Possible options:
+        1. abort - abort the process, do nothing with the problematic StatefulSet.
+        2. recreate - proceed and recreate StatefulSet.
+        """
+        return pulumi.get(self, "on_update_failure")
@@ -0,0 +1,37 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecReconcilingMacros']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecReconcilingMacros(dict):
+    """
+    macros parameters
+    """
+    def __init__(__self__, *,
+                 sections: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSections'] = None):
+        """
+        macros parameters
+        """
+        if sections is not None:
+            pulumi.set(__self__, "sections", sections)
+
+    @_builtins.property
+    @pulumi.getter
+    def sections(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSections']:
+        return pulumi.get(self, "sections")
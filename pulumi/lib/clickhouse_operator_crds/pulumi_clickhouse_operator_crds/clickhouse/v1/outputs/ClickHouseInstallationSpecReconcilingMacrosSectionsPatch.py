@@ -0,0 +1,69 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecReconcilingMacrosSectionsPatch']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecReconcilingMacrosSectionsPatch(dict):
+    """
+    sections behaviour for macros
+    """
+    def __init__(__self__, *,
+                 files: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatch'] = None,
+                 profiles: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatch'] = None,
+                 quotas: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatch'] = None,
+                 settings: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatch'] = None,
+                 users: Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatch'] = None):
+        """
+        sections behaviour for macros
+        """
+        if files is not None:
+            pulumi.set(__self__, "files", files)
+        if profiles is not None:
+            pulumi.set(__self__, "profiles", profiles)
+        if quotas is not None:
+            pulumi.set(__self__, "quotas", quotas)
+        if settings is not None:
+            pulumi.set(__self__, "settings", settings)
+        if users is not None:
+            pulumi.set(__self__, "users", users)
+
+    @_builtins.property
+    @pulumi.getter
+    def files(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatch']:
+        return pulumi.get(self, "files")
+
+    @_builtins.property
+    @pulumi.getter
+    def profiles(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatch']:
+        return pulumi.get(self, "profiles")
+
+    @_builtins.property
+    @pulumi.getter
+    def quotas(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatch']:
+        return pulumi.get(self, "quotas")
+
+    @_builtins.property
+    @pulumi.getter
+    def settings(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatch']:
+        return pulumi.get(self, "settings")
+
+    @_builtins.property
+    @pulumi.getter
+    def users(self) -> Optional['outputs.ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatch']:
+        return pulumi.get(self, "users")
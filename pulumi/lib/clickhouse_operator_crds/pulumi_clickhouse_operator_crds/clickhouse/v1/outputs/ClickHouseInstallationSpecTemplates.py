@@ -0,0 +1,103 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecTemplates']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecTemplates(dict):
+    """
+    allows define templates which will use for render Kubernetes resources like StatefulSet, ConfigMap, Service, PVC, by default, clickhouse-operator have own templates, but you can override it
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "hostTemplates":
+            suggest = "host_templates"
+        elif key == "podTemplates":
+            suggest = "pod_templates"
+        elif key == "serviceTemplates":
+            suggest = "service_templates"
+        elif key == "volumeClaimTemplates":
+            suggest = "volume_claim_templates"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplates. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecTemplates.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecTemplates.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 host_templates: Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesHostTemplates']] = None,
+                 pod_templates: Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesPodTemplates']] = None,
+                 service_templates: Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesServiceTemplates']] = None,
+                 volume_claim_templates: Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesVolumeClaimTemplates']] = None):
+        """
+        allows define templates which will use for render Kubernetes resources like StatefulSet, ConfigMap, Service, PVC, by default, clickhouse-operator have own templates, but you can override it
+
+        :param Sequence['ClickHouseInstallationSpecTemplatesHostTemplatesArgs'] host_templates: hostTemplate will use during apply to generate `clickhose-server` config files
+        :param Sequence['ClickHouseInstallationSpecTemplatesPodTemplatesArgs'] pod_templates: podTemplate will use during render `Pod` inside `StatefulSet.spec` and allows define rendered `Pod.spec`, pod scheduling distribution and pod zone
+               More information: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatespodtemplates
+        :param Sequence['ClickHouseInstallationSpecTemplatesServiceTemplatesArgs'] service_templates: allows define template for rendering `Service` which would get endpoint from Pods which scoped chi-wide, cluster-wide, shard-wide, replica-wide level
+        :param Sequence['ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesArgs'] volume_claim_templates: allows define template for rendering `PVC` kubernetes resource, which would use inside `Pod` for mount clickhouse `data`, clickhouse `logs` or something else
+        """
+        if host_templates is not None:
+            pulumi.set(__self__, "host_templates", host_templates)
+        if pod_templates is not None:
+            pulumi.set(__self__, "pod_templates", pod_templates)
+        if service_templates is not None:
+            pulumi.set(__self__, "service_templates", service_templates)
+        if volume_claim_templates is not None:
+            pulumi.set(__self__, "volume_claim_templates", volume_claim_templates)
+
+    @_builtins.property
+    @pulumi.getter(name="hostTemplates")
+    def host_templates(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesHostTemplates']]:
+        """
+        hostTemplate will use during apply to generate `clickhose-server` config files
+        """
+        return pulumi.get(self, "host_templates")
+
+    @_builtins.property
+    @pulumi.getter(name="podTemplates")
+    def pod_templates(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesPodTemplates']]:
+        """
+        podTemplate will use during render `Pod` inside `StatefulSet.spec` and allows define rendered `Pod.spec`, pod scheduling distribution and pod zone
+        More information: https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatespodtemplates
+        """
+        return pulumi.get(self, "pod_templates")
+
+    @_builtins.property
+    @pulumi.getter(name="serviceTemplates")
+    def service_templates(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesServiceTemplates']]:
+        """
+        allows define template for rendering `Service` which would get endpoint from Pods which scoped chi-wide, cluster-wide, shard-wide, replica-wide level
+        """
+        return pulumi.get(self, "service_templates")
+
+    @_builtins.property
+    @pulumi.getter(name="volumeClaimTemplates")
+    def volume_claim_templates(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesVolumeClaimTemplates']]:
+        """
+        allows define template for rendering `PVC` kubernetes resource, which would use inside `Pod` for mount clickhouse `data`, clickhouse `logs` or something else
+        """
+        return pulumi.get(self, "volume_claim_templates")
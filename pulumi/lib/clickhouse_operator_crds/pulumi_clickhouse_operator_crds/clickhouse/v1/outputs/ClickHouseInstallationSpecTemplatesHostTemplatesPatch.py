@@ -0,0 +1,74 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecTemplatesHostTemplatesPatch']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecTemplatesHostTemplatesPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "portDistribution":
+            suggest = "port_distribution"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesHostTemplatesPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecTemplatesHostTemplatesPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecTemplatesHostTemplatesPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 name: Optional[_builtins.str] = None,
+                 port_distribution: Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatch']] = None,
+                 spec: Optional['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatch'] = None):
+        """
+        :param _builtins.str name: template name, could use to link inside top-level `chi.spec.defaults.templates.hostTemplate`, cluster-level `chi.spec.configuration.clusters.templates.hostTemplate`, shard-level `chi.spec.configuration.clusters.layout.shards.temlates.hostTemplate`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates.hostTemplate`
+        :param Sequence['ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatchArgs'] port_distribution: define how will distribute numeric values of named ports in `Pod.spec.containers.ports` and clickhouse-server configs
+        """
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if port_distribution is not None:
+            pulumi.set(__self__, "port_distribution", port_distribution)
+        if spec is not None:
+            pulumi.set(__self__, "spec", spec)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> Optional[_builtins.str]:
+        """
+        template name, could use to link inside top-level `chi.spec.defaults.templates.hostTemplate`, cluster-level `chi.spec.configuration.clusters.templates.hostTemplate`, shard-level `chi.spec.configuration.clusters.layout.shards.temlates.hostTemplate`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates.hostTemplate`
+        """
+        return pulumi.get(self, "name")
+
+    @_builtins.property
+    @pulumi.getter(name="portDistribution")
+    def port_distribution(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatch']]:
+        """
+        define how will distribute numeric values of named ports in `Pod.spec.containers.ports` and clickhouse-server configs
+        """
+        return pulumi.get(self, "port_distribution")
+
+    @_builtins.property
+    @pulumi.getter
+    def spec(self) -> Optional['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatch']:
+        return pulumi.get(self, "spec")
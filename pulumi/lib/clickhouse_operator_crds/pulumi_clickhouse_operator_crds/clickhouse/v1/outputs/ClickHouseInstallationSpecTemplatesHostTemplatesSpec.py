@@ -0,0 +1,184 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecTemplatesHostTemplatesSpec']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecTemplatesHostTemplatesSpec(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "httpPort":
+            suggest = "http_port"
+        elif key == "httpsPort":
+            suggest = "https_port"
+        elif key == "interserverHTTPPort":
+            suggest = "interserver_http_port"
+        elif key == "tcpPort":
+            suggest = "tcp_port"
+        elif key == "tlsPort":
+            suggest = "tls_port"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesHostTemplatesSpec. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecTemplatesHostTemplatesSpec.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecTemplatesHostTemplatesSpec.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 files: Optional[Mapping[str, Any]] = None,
+                 http_port: Optional[_builtins.int] = None,
+                 https_port: Optional[_builtins.int] = None,
+                 insecure: Optional[_builtins.str] = None,
+                 interserver_http_port: Optional[_builtins.int] = None,
+                 name: Optional[_builtins.str] = None,
+                 secure: Optional[_builtins.str] = None,
+                 settings: Optional[Mapping[str, Any]] = None,
+                 tcp_port: Optional[_builtins.int] = None,
+                 templates: Optional['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplates'] = None,
+                 tls_port: Optional[_builtins.int] = None):
+        """
+        :param Mapping[str, Any] files: optional, allows define content of any setting file inside each `Pod` where this template will apply during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+        :param _builtins.int http_port: optional, setup `http_port` inside `clickhouse-server` settings for each Pod where current template will apply
+               if specified, should have equal value with `chi.spec.templates.podTemplates.spec.containers.ports[name=http]`
+               More info: https://clickhouse.tech/docs/en/interfaces/http/
+        :param _builtins.str insecure: optional, open insecure ports for cluster, defaults to "yes"
+        :param _builtins.int interserver_http_port: optional, setup `interserver_http_port` inside `clickhouse-server` settings for each Pod where current template will apply
+               if specified, should have equal value with `chi.spec.templates.podTemplates.spec.containers.ports[name=interserver]`
+               More info: https://clickhouse.tech/docs/en/operations/server-configuration-parameters/settings/#interserver-http-port
+        :param _builtins.str name: by default, hostname will generate, but this allows define custom name for each `clickhouse-server`
+        :param _builtins.str secure: optional, open secure ports
+        :param Mapping[str, Any] settings: optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` where this template will apply during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
+               More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        :param _builtins.int tcp_port: optional, setup `tcp_port` inside `clickhouse-server` settings for each Pod where current template will apply
+               if specified, should have equal value with `chi.spec.templates.podTemplates.spec.containers.ports[name=tcp]`
+               More info: https://clickhouse.tech/docs/en/interfaces/tcp/
+        """
+        if files is not None:
+            pulumi.set(__self__, "files", files)
+        if http_port is not None:
+            pulumi.set(__self__, "http_port", http_port)
+        if https_port is not None:
+            pulumi.set(__self__, "https_port", https_port)
+        if insecure is not None:
+            pulumi.set(__self__, "insecure", insecure)
+        if interserver_http_port is not None:
+            pulumi.set(__self__, "interserver_http_port", interserver_http_port)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if secure is not None:
+            pulumi.set(__self__, "secure", secure)
+        if settings is not None:
+            pulumi.set(__self__, "settings", settings)
+        if tcp_port is not None:
+            pulumi.set(__self__, "tcp_port", tcp_port)
+        if templates is not None:
+            pulumi.set(__self__, "templates", templates)
+        if tls_port is not None:
+            pulumi.set(__self__, "tls_port", tls_port)
+
+    @_builtins.property
+    @pulumi.getter
+    def files(self) -> Optional[Mapping[str, Any]]:
+        """
+        optional, allows define content of any setting file inside each `Pod` where this template will apply during generate `ConfigMap` which will mount in `/etc/clickhouse-server/config.d/` or `/etc/clickhouse-server/conf.d/` or `/etc/clickhouse-server/users.d/`
+        """
+        return pulumi.get(self, "files")
+
+    @_builtins.property
+    @pulumi.getter(name="httpPort")
+    def http_port(self) -> Optional[_builtins.int]:
+        """
+        optional, setup `http_port` inside `clickhouse-server` settings for each Pod where current template will apply
+        if specified, should have equal value with `chi.spec.templates.podTemplates.spec.containers.ports[name=http]`
+        More info: https://clickhouse.tech/docs/en/interfaces/http/
+        """
+        return pulumi.get(self, "http_port")
+
+    @_builtins.property
+    @pulumi.getter(name="httpsPort")
+    def https_port(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "https_port")
+
+    @_builtins.property
+    @pulumi.getter
+    def insecure(self) -> Optional[_builtins.str]:
+        """
+        optional, open insecure ports for cluster, defaults to "yes"
+        """
+        return pulumi.get(self, "insecure")
+
+    @_builtins.property
+    @pulumi.getter(name="interserverHTTPPort")
+    def interserver_http_port(self) -> Optional[_builtins.int]:
+        """
+        optional, setup `interserver_http_port` inside `clickhouse-server` settings for each Pod where current template will apply
+        if specified, should have equal value with `chi.spec.templates.podTemplates.spec.containers.ports[name=interserver]`
+        More info: https://clickhouse.tech/docs/en/operations/server-configuration-parameters/settings/#interserver-http-port
+        """
+        return pulumi.get(self, "interserver_http_port")
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> Optional[_builtins.str]:
+        """
+        by default, hostname will generate, but this allows define custom name for each `clickhouse-server`
+        """
+        return pulumi.get(self, "name")
+
+    @_builtins.property
+    @pulumi.getter
+    def secure(self) -> Optional[_builtins.str]:
+        """
+        optional, open secure ports
+        """
+        return pulumi.get(self, "secure")
+
+    @_builtins.property
+    @pulumi.getter
+    def settings(self) -> Optional[Mapping[str, Any]]:
+        """
+        optional, allows configure `clickhouse-server` settings inside <yandex>...</yandex> tag in each `Pod` where this template will apply during generate `ConfigMap` which will mount in `/etc/clickhouse-server/conf.d/`
+        More details: https://clickhouse.tech/docs/en/operations/settings/settings/
+        """
+        return pulumi.get(self, "settings")
+
+    @_builtins.property
+    @pulumi.getter(name="tcpPort")
+    def tcp_port(self) -> Optional[_builtins.int]:
+        """
+        optional, setup `tcp_port` inside `clickhouse-server` settings for each Pod where current template will apply
+        if specified, should have equal value with `chi.spec.templates.podTemplates.spec.containers.ports[name=tcp]`
+        More info: https://clickhouse.tech/docs/en/interfaces/tcp/
+        """
+        return pulumi.get(self, "tcp_port")
+
+    @_builtins.property
+    @pulumi.getter
+    def templates(self) -> Optional['outputs.ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplates']:
+        return pulumi.get(self, "templates")
+
+    @_builtins.property
+    @pulumi.getter(name="tlsPort")
+    def tls_port(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "tls_port")
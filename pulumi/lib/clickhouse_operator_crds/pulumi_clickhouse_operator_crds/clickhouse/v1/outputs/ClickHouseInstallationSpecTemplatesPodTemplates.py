@@ -0,0 +1,126 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecTemplatesPodTemplates']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecTemplatesPodTemplates(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "generateName":
+            suggest = "generate_name"
+        elif key == "podDistribution":
+            suggest = "pod_distribution"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesPodTemplates. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecTemplatesPodTemplates.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecTemplatesPodTemplates.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 distribution: Optional[_builtins.str] = None,
+                 generate_name: Optional[_builtins.str] = None,
+                 metadata: Optional[Mapping[str, Any]] = None,
+                 name: Optional[_builtins.str] = None,
+                 pod_distribution: Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesPodTemplatesPodDistribution']] = None,
+                 spec: Optional[Mapping[str, Any]] = None,
+                 zone: Optional['outputs.ClickHouseInstallationSpecTemplatesPodTemplatesZone'] = None):
+        """
+        :param _builtins.str distribution: DEPRECATED, shortcut for `chi.spec.templates.podTemplates.spec.affinity.podAntiAffinity`
+        :param _builtins.str generate_name: allows define format for generated `Pod` name, look to https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatesservicetemplates for details about available template variables
+        :param Mapping[str, Any] metadata: allows pass standard object's metadata from template to Pod
+               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        :param _builtins.str name: template name, could use to link inside top-level `chi.spec.defaults.templates.podTemplate`, cluster-level `chi.spec.configuration.clusters.templates.podTemplate`, shard-level `chi.spec.configuration.clusters.layout.shards.temlates.podTemplate`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates.podTemplate`
+        :param Sequence['ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionArgs'] pod_distribution: define ClickHouse Pod distribution policy between Kubernetes Nodes inside Shard, Replica, Namespace, CHI, another ClickHouse cluster
+        :param Mapping[str, Any] spec: allows define whole Pod.spec inside StaefulSet.spec, look to https://kubernetes.io/docs/concepts/workloads/pods/#pod-templates for details
+        """
+        if distribution is not None:
+            pulumi.set(__self__, "distribution", distribution)
+        if generate_name is not None:
+            pulumi.set(__self__, "generate_name", generate_name)
+        if metadata is not None:
+            pulumi.set(__self__, "metadata", metadata)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if pod_distribution is not None:
+            pulumi.set(__self__, "pod_distribution", pod_distribution)
+        if spec is not None:
+            pulumi.set(__self__, "spec", spec)
+        if zone is not None:
+            pulumi.set(__self__, "zone", zone)
+
+    @_builtins.property
+    @pulumi.getter
+    def distribution(self) -> Optional[_builtins.str]:
+        """
+        DEPRECATED, shortcut for `chi.spec.templates.podTemplates.spec.affinity.podAntiAffinity`
+        """
+        return pulumi.get(self, "distribution")
+
+    @_builtins.property
+    @pulumi.getter(name="generateName")
+    def generate_name(self) -> Optional[_builtins.str]:
+        """
+        allows define format for generated `Pod` name, look to https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatesservicetemplates for details about available template variables
+        """
+        return pulumi.get(self, "generate_name")
+
+    @_builtins.property
+    @pulumi.getter
+    def metadata(self) -> Optional[Mapping[str, Any]]:
+        """
+        allows pass standard object's metadata from template to Pod
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        """
+        return pulumi.get(self, "metadata")
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> Optional[_builtins.str]:
+        """
+        template name, could use to link inside top-level `chi.spec.defaults.templates.podTemplate`, cluster-level `chi.spec.configuration.clusters.templates.podTemplate`, shard-level `chi.spec.configuration.clusters.layout.shards.temlates.podTemplate`, replica-level `chi.spec.configuration.clusters.layout.replicas.templates.podTemplate`
+        """
+        return pulumi.get(self, "name")
+
+    @_builtins.property
+    @pulumi.getter(name="podDistribution")
+    def pod_distribution(self) -> Optional[Sequence['outputs.ClickHouseInstallationSpecTemplatesPodTemplatesPodDistribution']]:
+        """
+        define ClickHouse Pod distribution policy between Kubernetes Nodes inside Shard, Replica, Namespace, CHI, another ClickHouse cluster
+        """
+        return pulumi.get(self, "pod_distribution")
+
+    @_builtins.property
+    @pulumi.getter
+    def spec(self) -> Optional[Mapping[str, Any]]:
+        """
+        allows define whole Pod.spec inside StaefulSet.spec, look to https://kubernetes.io/docs/concepts/workloads/pods/#pod-templates for details
+        """
+        return pulumi.get(self, "spec")
+
+    @_builtins.property
+    @pulumi.getter
+    def zone(self) -> Optional['outputs.ClickHouseInstallationSpecTemplatesPodTemplatesZone']:
+        return pulumi.get(self, "zone")
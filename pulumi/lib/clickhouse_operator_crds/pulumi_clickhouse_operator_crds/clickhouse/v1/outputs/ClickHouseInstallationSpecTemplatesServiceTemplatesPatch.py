@@ -0,0 +1,108 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecTemplatesServiceTemplatesPatch']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecTemplatesServiceTemplatesPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "generateName":
+            suggest = "generate_name"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatesServiceTemplatesPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecTemplatesServiceTemplatesPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecTemplatesServiceTemplatesPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 generate_name: Optional[_builtins.str] = None,
+                 metadata: Optional[Mapping[str, Any]] = None,
+                 name: Optional[_builtins.str] = None,
+                 spec: Optional[Mapping[str, Any]] = None):
+        """
+        :param _builtins.str generate_name: allows define format for generated `Service` name,
+               look to https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatesservicetemplates
+               for details about available template variables"
+        :param Mapping[str, Any] metadata: allows pass standard object's metadata from template to Service
+               Could be use for define specificly for Cloud Provider metadata which impact to behavior of service
+               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        :param _builtins.str name: template name, could use to link inside
+               chi-level `chi.spec.defaults.templates.serviceTemplate`
+               cluster-level `chi.spec.configuration.clusters.templates.clusterServiceTemplate`
+               shard-level `chi.spec.configuration.clusters.layout.shards.temlates.shardServiceTemplate`
+               replica-level `chi.spec.configuration.clusters.layout.replicas.templates.replicaServiceTemplate` or `chi.spec.configuration.clusters.layout.shards.replicas.replicaServiceTemplate`
+        :param Mapping[str, Any] spec: describe behavior of generated Service
+               More info: https://kubernetes.io/docs/concepts/services-networking/service/
+        """
+        if generate_name is not None:
+            pulumi.set(__self__, "generate_name", generate_name)
+        if metadata is not None:
+            pulumi.set(__self__, "metadata", metadata)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if spec is not None:
+            pulumi.set(__self__, "spec", spec)
+
+    @_builtins.property
+    @pulumi.getter(name="generateName")
+    def generate_name(self) -> Optional[_builtins.str]:
+        """
+        allows define format for generated `Service` name,
+        look to https://github.com/Altinity/clickhouse-operator/blob/master/docs/custom_resource_explained.md#spectemplatesservicetemplates
+        for details about available template variables"
+        """
+        return pulumi.get(self, "generate_name")
+
+    @_builtins.property
+    @pulumi.getter
+    def metadata(self) -> Optional[Mapping[str, Any]]:
+        """
+        allows pass standard object's metadata from template to Service
+        Could be use for define specificly for Cloud Provider metadata which impact to behavior of service
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        """
+        return pulumi.get(self, "metadata")
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> Optional[_builtins.str]:
+        """
+        template name, could use to link inside
+        chi-level `chi.spec.defaults.templates.serviceTemplate`
+        cluster-level `chi.spec.configuration.clusters.templates.clusterServiceTemplate`
+        shard-level `chi.spec.configuration.clusters.layout.shards.temlates.shardServiceTemplate`
+        replica-level `chi.spec.configuration.clusters.layout.replicas.templates.replicaServiceTemplate` or `chi.spec.configuration.clusters.layout.shards.replicas.replicaServiceTemplate`
+        """
+        return pulumi.get(self, "name")
+
+    @_builtins.property
+    @pulumi.getter
+    def spec(self) -> Optional[Mapping[str, Any]]:
+        """
+        describe behavior of generated Service
+        More info: https://kubernetes.io/docs/concepts/services-networking/service/
+        """
+        return pulumi.get(self, "spec")
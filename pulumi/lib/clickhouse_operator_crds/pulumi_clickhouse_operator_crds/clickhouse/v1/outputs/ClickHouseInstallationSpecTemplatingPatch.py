@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationSpecTemplatingPatch']
+
+@pulumi.output_type
+class ClickHouseInstallationSpecTemplatingPatch(dict):
+    """
+    Optional, applicable inside ClickHouseInstallationTemplate only.
+    Defines current ClickHouseInstallationTemplate application options to target ClickHouseInstallation(s)."
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "chiSelector":
+            suggest = "chi_selector"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationSpecTemplatingPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationSpecTemplatingPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationSpecTemplatingPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 chi_selector: Optional[Mapping[str, Any]] = None,
+                 policy: Optional[_builtins.str] = None):
+        """
+        Optional, applicable inside ClickHouseInstallationTemplate only.
+        Defines current ClickHouseInstallationTemplate application options to target ClickHouseInstallation(s)."
+
+
+        :param Mapping[str, Any] chi_selector: Optional, defines selector for ClickHouseInstallation(s) to be templated with ClickhouseInstallationTemplate
+        :param _builtins.str policy: When defined as `auto` inside ClickhouseInstallationTemplate, this ClickhouseInstallationTemplate
+               will be auto-added into ClickHouseInstallation, selectable by `chiSelector`.
+               Default value is `manual`, meaning ClickHouseInstallation should request this ClickhouseInstallationTemplate explicitly.
+        """
+        if chi_selector is not None:
+            pulumi.set(__self__, "chi_selector", chi_selector)
+        if policy is not None:
+            pulumi.set(__self__, "policy", policy)
+
+    @_builtins.property
+    @pulumi.getter(name="chiSelector")
+    def chi_selector(self) -> Optional[Mapping[str, Any]]:
+        """
+        Optional, defines selector for ClickHouseInstallation(s) to be templated with ClickhouseInstallationTemplate
+        """
+        return pulumi.get(self, "chi_selector")
+
+    @_builtins.property
+    @pulumi.getter
+    def policy(self) -> Optional[_builtins.str]:
+        """
+        When defined as `auto` inside ClickhouseInstallationTemplate, this ClickhouseInstallationTemplate
+        will be auto-added into ClickHouseInstallation, selectable by `chiSelector`.
+        Default value is `manual`, meaning ClickHouseInstallation should request this ClickhouseInstallationTemplate explicitly.
+        """
+        return pulumi.get(self, "policy")
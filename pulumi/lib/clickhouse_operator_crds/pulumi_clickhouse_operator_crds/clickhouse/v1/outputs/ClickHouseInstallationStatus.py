@@ -0,0 +1,492 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ClickHouseInstallationStatus']
+
+@pulumi.output_type
+class ClickHouseInstallationStatus(dict):
+    """
+    Status contains many fields like a normalized configuration, clickhouse-operator version, current action and all applied action list, current taskID and all applied taskIDs and other
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "actionPlan":
+            suggest = "action_plan"
+        elif key == "chop-commit":
+            suggest = "chop_commit"
+        elif key == "chop-date":
+            suggest = "chop_date"
+        elif key == "chop-ip":
+            suggest = "chop_ip"
+        elif key == "chop-version":
+            suggest = "chop_version"
+        elif key == "hostsAdded":
+            suggest = "hosts_added"
+        elif key == "hostsCompleted":
+            suggest = "hosts_completed"
+        elif key == "hostsDelete":
+            suggest = "hosts_delete"
+        elif key == "hostsDeleted":
+            suggest = "hosts_deleted"
+        elif key == "hostsUnchanged":
+            suggest = "hosts_unchanged"
+        elif key == "hostsUpdated":
+            suggest = "hosts_updated"
+        elif key == "hostsWithReplicaCaughtUp":
+            suggest = "hosts_with_replica_caught_up"
+        elif key == "hostsWithTablesCreated":
+            suggest = "hosts_with_tables_created"
+        elif key == "normalizedCompleted":
+            suggest = "normalized_completed"
+        elif key == "pod-ips":
+            suggest = "pod_ips"
+        elif key == "taskID":
+            suggest = "task_id"
+        elif key == "taskIDsCompleted":
+            suggest = "task_ids_completed"
+        elif key == "taskIDsStarted":
+            suggest = "task_ids_started"
+        elif key == "usedTemplates":
+            suggest = "used_templates"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ClickHouseInstallationStatus. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ClickHouseInstallationStatus.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ClickHouseInstallationStatus.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 action: Optional[_builtins.str] = None,
+                 action_plan: Optional[Mapping[str, Any]] = None,
+                 actions: Optional[Sequence[_builtins.str]] = None,
+                 chop_commit: Optional[_builtins.str] = None,
+                 chop_date: Optional[_builtins.str] = None,
+                 chop_ip: Optional[_builtins.str] = None,
+                 chop_version: Optional[_builtins.str] = None,
+                 clusters: Optional[_builtins.int] = None,
+                 endpoint: Optional[_builtins.str] = None,
+                 endpoints: Optional[Sequence[_builtins.str]] = None,
+                 error: Optional[_builtins.str] = None,
+                 errors: Optional[Sequence[_builtins.str]] = None,
+                 fqdns: Optional[Sequence[_builtins.str]] = None,
+                 generation: Optional[_builtins.int] = None,
+                 hosts: Optional[_builtins.int] = None,
+                 hosts_added: Optional[_builtins.int] = None,
+                 hosts_completed: Optional[_builtins.int] = None,
+                 hosts_delete: Optional[_builtins.int] = None,
+                 hosts_deleted: Optional[_builtins.int] = None,
+                 hosts_unchanged: Optional[_builtins.int] = None,
+                 hosts_updated: Optional[_builtins.int] = None,
+                 hosts_with_replica_caught_up: Optional[Sequence[_builtins.str]] = None,
+                 hosts_with_tables_created: Optional[Sequence[_builtins.str]] = None,
+                 normalized: Optional[Mapping[str, Any]] = None,
+                 normalized_completed: Optional[Mapping[str, Any]] = None,
+                 pod_ips: Optional[Sequence[_builtins.str]] = None,
+                 pods: Optional[Sequence[_builtins.str]] = None,
+                 replicas: Optional[_builtins.int] = None,
+                 shards: Optional[_builtins.int] = None,
+                 status: Optional[_builtins.str] = None,
+                 task_id: Optional[_builtins.str] = None,
+                 task_ids_completed: Optional[Sequence[_builtins.str]] = None,
+                 task_ids_started: Optional[Sequence[_builtins.str]] = None,
+                 used_templates: Optional[Mapping[str, Any]] = None):
+        """
+        Status contains many fields like a normalized configuration, clickhouse-operator version, current action and all applied action list, current taskID and all applied taskIDs and other
+
+
+        :param _builtins.str action: Action
+        :param Mapping[str, Any] action_plan: Action Plan
+        :param Sequence[_builtins.str] actions: Actions
+        :param _builtins.str chop_commit: Operator git commit SHA
+        :param _builtins.str chop_date: Operator build date
+        :param _builtins.str chop_ip: IP address of the operator's pod which managed this resource
+        :param _builtins.str chop_version: Operator version
+        :param _builtins.int clusters: Clusters count
+        :param _builtins.str endpoint: Endpoint
+        :param Sequence[_builtins.str] endpoints: All endpoints
+        :param _builtins.str error: Last error
+        :param Sequence[_builtins.str] errors: Errors
+        :param Sequence[_builtins.str] fqdns: Pods FQDNs
+        :param _builtins.int generation: Generation
+        :param _builtins.int hosts: Hosts count
+        :param _builtins.int hosts_added: Added Hosts count
+        :param _builtins.int hosts_completed: Completed Hosts count
+        :param _builtins.int hosts_delete: About to delete Hosts count
+        :param _builtins.int hosts_deleted: Deleted Hosts count
+        :param _builtins.int hosts_unchanged: Unchanged Hosts count
+        :param _builtins.int hosts_updated: Updated Hosts count
+        :param Sequence[_builtins.str] hosts_with_replica_caught_up: List of hosts with replica caught up
+        :param Sequence[_builtins.str] hosts_with_tables_created: List of hosts with tables created by the operator
+        :param Mapping[str, Any] normalized: Normalized resource requested
+        :param Mapping[str, Any] normalized_completed: Normalized resource completed
+        :param Sequence[_builtins.str] pod_ips: Pod IPs
+        :param Sequence[_builtins.str] pods: Pods
+        :param _builtins.int replicas: Replicas count
+        :param _builtins.int shards: Shards count
+        :param _builtins.str status: Status
+        :param _builtins.str task_id: Current task id
+        :param Sequence[_builtins.str] task_ids_completed: Completed task ids
+        :param Sequence[_builtins.str] task_ids_started: Started task ids
+        :param Mapping[str, Any] used_templates: List of templates used to build this CHI
+        """
+        if action is not None:
+            pulumi.set(__self__, "action", action)
+        if action_plan is not None:
+            pulumi.set(__self__, "action_plan", action_plan)
+        if actions is not None:
+            pulumi.set(__self__, "actions", actions)
+        if chop_commit is not None:
+            pulumi.set(__self__, "chop_commit", chop_commit)
+        if chop_date is not None:
+            pulumi.set(__self__, "chop_date", chop_date)
+        if chop_ip is not None:
+            pulumi.set(__self__, "chop_ip", chop_ip)
+        if chop_version is not None:
+            pulumi.set(__self__, "chop_version", chop_version)
+        if clusters is not None:
+            pulumi.set(__self__, "clusters", clusters)
+        if endpoint is not None:
+            pulumi.set(__self__, "endpoint", endpoint)
+        if endpoints is not None:
+            pulumi.set(__self__, "endpoints", endpoints)
+        if error is not None:
+            pulumi.set(__self__, "error", error)
+        if errors is not None:
+            pulumi.set(__self__, "errors", errors)
+        if fqdns is not None:
+            pulumi.set(__self__, "fqdns", fqdns)
+        if generation is not None:
+            pulumi.set(__self__, "generation", generation)
+        if hosts is not None:
+            pulumi.set(__self__, "hosts", hosts)
+        if hosts_added is not None:
+            pulumi.set(__self__, "hosts_added", hosts_added)
+        if hosts_completed is not None:
+            pulumi.set(__self__, "hosts_completed", hosts_completed)
+        if hosts_delete is not None:
+            pulumi.set(__self__, "hosts_delete", hosts_delete)
+        if hosts_deleted is not None:
+            pulumi.set(__self__, "hosts_deleted", hosts_deleted)
+        if hosts_unchanged is not None:
+            pulumi.set(__self__, "hosts_unchanged", hosts_unchanged)
+        if hosts_updated is not None:
+            pulumi.set(__self__, "hosts_updated", hosts_updated)
+        if hosts_with_replica_caught_up is not None:
+            pulumi.set(__self__, "hosts_with_replica_caught_up", hosts_with_replica_caught_up)
+        if hosts_with_tables_created is not None:
+            pulumi.set(__self__, "hosts_with_tables_created", hosts_with_tables_created)
+        if normalized is not None:
+            pulumi.set(__self__, "normalized", normalized)
+        if normalized_completed is not None:
+            pulumi.set(__self__, "normalized_completed", normalized_completed)
+        if pod_ips is not None:
+            pulumi.set(__self__, "pod_ips", pod_ips)
+        if pods is not None:
+            pulumi.set(__self__, "pods", pods)
+        if replicas is not None:
+            pulumi.set(__self__, "replicas", replicas)
+        if shards is not None:
+            pulumi.set(__self__, "shards", shards)
+        if status is not None:
+            pulumi.set(__self__, "status", status)
+        if task_id is not None:
+            pulumi.set(__self__, "task_id", task_id)
+        if task_ids_completed is not None:
+            pulumi.set(__self__, "task_ids_completed", task_ids_completed)
+        if task_ids_started is not None:
+            pulumi.set(__self__, "task_ids_started", task_ids_started)
+        if used_templates is not None:
+            pulumi.set(__self__, "used_templates", used_templates)
+
+    @_builtins.property
+    @pulumi.getter
+    def action(self) -> Optional[_builtins.str]:
+        """
+        Action
+        """
+        return pulumi.get(self, "action")
+
+    @_builtins.property
+    @pulumi.getter(name="actionPlan")
+    def action_plan(self) -> Optional[Mapping[str, Any]]:
+        """
+        Action Plan
+        """
+        return pulumi.get(self, "action_plan")
+
+    @_builtins.property
+    @pulumi.getter
+    def actions(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        Actions
+        """
+        return pulumi.get(self, "actions")
+
+    @_builtins.property
+    @pulumi.getter(name="chop-commit")
+    def chop_commit(self) -> Optional[_builtins.str]:
+        """
+        Operator git commit SHA
+        """
+        return pulumi.get(self, "chop_commit")
+
+    @_builtins.property
+    @pulumi.getter(name="chop-date")
+    def chop_date(self) -> Optional[_builtins.str]:
+        """
+        Operator build date
+        """
+        return pulumi.get(self, "chop_date")
+
+    @_builtins.property
+    @pulumi.getter(name="chop-ip")
+    def chop_ip(self) -> Optional[_builtins.str]:
+        """
+        IP address of the operator's pod which managed this resource
+        """
+        return pulumi.get(self, "chop_ip")
+
+    @_builtins.property
+    @pulumi.getter(name="chop-version")
+    def chop_version(self) -> Optional[_builtins.str]:
+        """
+        Operator version
+        """
+        return pulumi.get(self, "chop_version")
+
+    @_builtins.property
+    @pulumi.getter
+    def clusters(self) -> Optional[_builtins.int]:
+        """
+        Clusters count
+        """
+        return pulumi.get(self, "clusters")
+
+    @_builtins.property
+    @pulumi.getter
+    def endpoint(self) -> Optional[_builtins.str]:
+        """
+        Endpoint
+        """
+        return pulumi.get(self, "endpoint")
+
+    @_builtins.property
+    @pulumi.getter
+    def endpoints(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        All endpoints
+        """
+        return pulumi.get(self, "endpoints")
+
+    @_builtins.property
+    @pulumi.getter
+    def error(self) -> Optional[_builtins.str]:
+        """
+        Last error
+        """
+        return pulumi.get(self, "error")
+
+    @_builtins.property
+    @pulumi.getter
+    def errors(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        Errors
+        """
+        return pulumi.get(self, "errors")
+
+    @_builtins.property
+    @pulumi.getter
+    def fqdns(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        Pods FQDNs
+        """
+        return pulumi.get(self, "fqdns")
+
+    @_builtins.property
+    @pulumi.getter
+    def generation(self) -> Optional[_builtins.int]:
+        """
+        Generation
+        """
+        return pulumi.get(self, "generation")
+
+    @_builtins.property
+    @pulumi.getter
+    def hosts(self) -> Optional[_builtins.int]:
+        """
+        Hosts count
+        """
+        return pulumi.get(self, "hosts")
+
+    @_builtins.property
+    @pulumi.getter(name="hostsAdded")
+    def hosts_added(self) -> Optional[_builtins.int]:
+        """
+        Added Hosts count
+        """
+        return pulumi.get(self, "hosts_added")
+
+    @_builtins.property
+    @pulumi.getter(name="hostsCompleted")
+    def hosts_completed(self) -> Optional[_builtins.int]:
+        """
+        Completed Hosts count
+        """
+        return pulumi.get(self, "hosts_completed")
+
+    @_builtins.property
+    @pulumi.getter(name="hostsDelete")
+    def hosts_delete(self) -> Optional[_builtins.int]:
+        """
+        About to delete Hosts count
+        """
+        return pulumi.get(self, "hosts_delete")
+
+    @_builtins.property
+    @pulumi.getter(name="hostsDeleted")
+    def hosts_deleted(self) -> Optional[_builtins.int]:
+        """
+        Deleted Hosts count
+        """
+        return pulumi.get(self, "hosts_deleted")
+
+    @_builtins.property
+    @pulumi.getter(name="hostsUnchanged")
+    def hosts_unchanged(self) -> Optional[_builtins.int]:
+        """
+        Unchanged Hosts count
+        """
+        return pulumi.get(self, "hosts_unchanged")
+
+    @_builtins.property
+    @pulumi.getter(name="hostsUpdated")
+    def hosts_updated(self) -> Optional[_builtins.int]:
+        """
+        Updated Hosts count
+        """
+        return pulumi.get(self, "hosts_updated")
+
+    @_builtins.property
+    @pulumi.getter(name="hostsWithReplicaCaughtUp")
+    def hosts_with_replica_caught_up(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        List of hosts with replica caught up
+        """
+        return pulumi.get(self, "hosts_with_replica_caught_up")
+
+    @_builtins.property
+    @pulumi.getter(name="hostsWithTablesCreated")
+    def hosts_with_tables_created(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        List of hosts with tables created by the operator
+        """
+        return pulumi.get(self, "hosts_with_tables_created")
+
+    @_builtins.property
+    @pulumi.getter
+    def normalized(self) -> Optional[Mapping[str, Any]]:
+        """
+        Normalized resource requested
+        """
+        return pulumi.get(self, "normalized")
+
+    @_builtins.property
+    @pulumi.getter(name="normalizedCompleted")
+    def normalized_completed(self) -> Optional[Mapping[str, Any]]:
+        """
+        Normalized resource completed
+        """
+        return pulumi.get(self, "normalized_completed")
+
+    @_builtins.property
+    @pulumi.getter(name="pod-ips")
+    def pod_ips(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        Pod IPs
+        """
+        return pulumi.get(self, "pod_ips")
+
+    @_builtins.property
+    @pulumi.getter
+    def pods(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        Pods
+        """
+        return pulumi.get(self, "pods")
+
+    @_builtins.property
+    @pulumi.getter
+    def replicas(self) -> Optional[_builtins.int]:
+        """
+        Replicas count
+        """
+        return pulumi.get(self, "replicas")
+
+    @_builtins.property
+    @pulumi.getter
+    def shards(self) -> Optional[_builtins.int]:
+        """
+        Shards count
+        """
+        return pulumi.get(self, "shards")
+
+    @_builtins.property
+    @pulumi.getter
+    def status(self) -> Optional[_builtins.str]:
+        """
+        Status
+        """
+        return pulumi.get(self, "status")
+
+    @_builtins.property
+    @pulumi.getter(name="taskID")
+    def task_id(self) -> Optional[_builtins.str]:
+        """
+        Current task id
+        """
+        return pulumi.get(self, "task_id")
+
+    @_builtins.property
+    @pulumi.getter(name="taskIDsCompleted")
+    def task_ids_completed(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        Completed task ids
+        """
+        return pulumi.get(self, "task_ids_completed")
+
+    @_builtins.property
+    @pulumi.getter(name="taskIDsStarted")
+    def task_ids_started(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        Started task ids
+        """
+        return pulumi.get(self, "task_ids_started")
+
+    @_builtins.property
+    @pulumi.getter(name="usedTemplates")
+    def used_templates(self) -> Optional[Mapping[str, Any]]:
+        """
+        List of templates used to build this CHI
+        """
+        return pulumi.get(self, "used_templates")
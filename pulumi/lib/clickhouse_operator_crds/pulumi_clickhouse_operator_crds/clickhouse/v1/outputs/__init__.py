@@ -0,0 +1,918 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import importlib
+import typing
+
+__all__ = [
+    'ClickHouseInstallation',
+    'ClickHouseInstallationSpec',
+    'ClickHouseInstallationSpecConfiguration',
+    'ClickHouseInstallationSpecConfigurationClusters',
+    'ClickHouseInstallationSpecConfigurationClustersLayout',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutPatch',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicas',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatch',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShards',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatch',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplates',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatch',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplates',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatch',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShards',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatch',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicas',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatch',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplates',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatch',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplates',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatch',
+    'ClickHouseInstallationSpecConfigurationClustersPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcile',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooks',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPost',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttp',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShell',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSql',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPre',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttp',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShell',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSql',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHost',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDrop',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicas',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooks',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPost',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttp',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShell',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSql',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPre',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttp',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShell',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSql',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWait',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbes',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicas',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcilePatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileRuntime',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatch',
+    'ClickHouseInstallationSpecConfigurationClustersSchemaPolicy',
+    'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyPatch',
+    'ClickHouseInstallationSpecConfigurationClustersSecret',
+    'ClickHouseInstallationSpecConfigurationClustersSecretPatch',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFrom',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatch',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRef',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatch',
+    'ClickHouseInstallationSpecConfigurationClustersTemplates',
+    'ClickHouseInstallationSpecConfigurationClustersTemplatesPatch',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeper',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeper',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatch',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperNodes',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatch',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperPatch',
+    'ClickHouseInstallationSpecConfigurationPatch',
+    'ClickHouseInstallationSpecConfigurationZookeeper',
+    'ClickHouseInstallationSpecConfigurationZookeeperKeeper',
+    'ClickHouseInstallationSpecConfigurationZookeeperKeeperPatch',
+    'ClickHouseInstallationSpecConfigurationZookeeperNodes',
+    'ClickHouseInstallationSpecConfigurationZookeeperNodesPatch',
+    'ClickHouseInstallationSpecConfigurationZookeeperPatch',
+    'ClickHouseInstallationSpecDefaults',
+    'ClickHouseInstallationSpecDefaultsDistributedDDL',
+    'ClickHouseInstallationSpecDefaultsDistributedDDLPatch',
+    'ClickHouseInstallationSpecDefaultsPatch',
+    'ClickHouseInstallationSpecDefaultsStorageManagement',
+    'ClickHouseInstallationSpecDefaultsStorageManagementPatch',
+    'ClickHouseInstallationSpecDefaultsTemplates',
+    'ClickHouseInstallationSpecDefaultsTemplatesPatch',
+    'ClickHouseInstallationSpecPatch',
+    'ClickHouseInstallationSpecReconcile',
+    'ClickHouseInstallationSpecReconcileCleanup',
+    'ClickHouseInstallationSpecReconcileCleanupPatch',
+    'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjects',
+    'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatch',
+    'ClickHouseInstallationSpecReconcileCleanupUnknownObjects',
+    'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatch',
+    'ClickHouseInstallationSpecReconcileCluster',
+    'ClickHouseInstallationSpecReconcileClusterHooks',
+    'ClickHouseInstallationSpecReconcileClusterHooksPatch',
+    'ClickHouseInstallationSpecReconcileClusterHooksPost',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostHttp',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostHttpPatch',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostPatch',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostShell',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostShellPatch',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostSql',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostSqlPatch',
+    'ClickHouseInstallationSpecReconcileClusterHooksPre',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreHttp',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreHttpPatch',
+    'ClickHouseInstallationSpecReconcileClusterHooksPrePatch',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreShell',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreShellPatch',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreSql',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreSqlPatch',
+    'ClickHouseInstallationSpecReconcileClusterPatch',
+    'ClickHouseInstallationSpecReconcileHost',
+    'ClickHouseInstallationSpecReconcileHostDrop',
+    'ClickHouseInstallationSpecReconcileHostDropPatch',
+    'ClickHouseInstallationSpecReconcileHostDropReplicas',
+    'ClickHouseInstallationSpecReconcileHostDropReplicasPatch',
+    'ClickHouseInstallationSpecReconcileHostHooks',
+    'ClickHouseInstallationSpecReconcileHostHooksPatch',
+    'ClickHouseInstallationSpecReconcileHostHooksPost',
+    'ClickHouseInstallationSpecReconcileHostHooksPostHttp',
+    'ClickHouseInstallationSpecReconcileHostHooksPostHttpPatch',
+    'ClickHouseInstallationSpecReconcileHostHooksPostPatch',
+    'ClickHouseInstallationSpecReconcileHostHooksPostShell',
+    'ClickHouseInstallationSpecReconcileHostHooksPostShellPatch',
+    'ClickHouseInstallationSpecReconcileHostHooksPostSql',
+    'ClickHouseInstallationSpecReconcileHostHooksPostSqlPatch',
+    'ClickHouseInstallationSpecReconcileHostHooksPre',
+    'ClickHouseInstallationSpecReconcileHostHooksPreHttp',
+    'ClickHouseInstallationSpecReconcileHostHooksPreHttpPatch',
+    'ClickHouseInstallationSpecReconcileHostHooksPrePatch',
+    'ClickHouseInstallationSpecReconcileHostHooksPreShell',
+    'ClickHouseInstallationSpecReconcileHostHooksPreShellPatch',
+    'ClickHouseInstallationSpecReconcileHostHooksPreSql',
+    'ClickHouseInstallationSpecReconcileHostHooksPreSqlPatch',
+    'ClickHouseInstallationSpecReconcileHostPatch',
+    'ClickHouseInstallationSpecReconcileHostWait',
+    'ClickHouseInstallationSpecReconcileHostWaitPatch',
+    'ClickHouseInstallationSpecReconcileHostWaitProbes',
+    'ClickHouseInstallationSpecReconcileHostWaitProbesPatch',
+    'ClickHouseInstallationSpecReconcileHostWaitReplicas',
+    'ClickHouseInstallationSpecReconcileHostWaitReplicasPatch',
+    'ClickHouseInstallationSpecReconcileMacros',
+    'ClickHouseInstallationSpecReconcileMacrosPatch',
+    'ClickHouseInstallationSpecReconcileMacrosSections',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsFiles',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatch',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsPatch',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsProfiles',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatch',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsQuotas',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatch',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsSettings',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatch',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsUsers',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatch',
+    'ClickHouseInstallationSpecReconcilePatch',
+    'ClickHouseInstallationSpecReconcileRuntime',
+    'ClickHouseInstallationSpecReconcileRuntimePatch',
+    'ClickHouseInstallationSpecReconcileStatefulSet',
+    'ClickHouseInstallationSpecReconcileStatefulSetCreate',
+    'ClickHouseInstallationSpecReconcileStatefulSetCreatePatch',
+    'ClickHouseInstallationSpecReconcileStatefulSetPatch',
+    'ClickHouseInstallationSpecReconcileStatefulSetRecreate',
+    'ClickHouseInstallationSpecReconcileStatefulSetRecreatePatch',
+    'ClickHouseInstallationSpecReconcileStatefulSetUpdate',
+    'ClickHouseInstallationSpecReconcileStatefulSetUpdatePatch',
+    'ClickHouseInstallationSpecReconciling',
+    'ClickHouseInstallationSpecReconcilingCleanup',
+    'ClickHouseInstallationSpecReconcilingCleanupPatch',
+    'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjects',
+    'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatch',
+    'ClickHouseInstallationSpecReconcilingCleanupUnknownObjects',
+    'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatch',
+    'ClickHouseInstallationSpecReconcilingCluster',
+    'ClickHouseInstallationSpecReconcilingClusterHooks',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPatch',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPost',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostHttp',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpPatch',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostPatch',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostShell',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostShellPatch',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostSql',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlPatch',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPre',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreHttp',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpPatch',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPrePatch',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreShell',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreShellPatch',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreSql',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlPatch',
+    'ClickHouseInstallationSpecReconcilingClusterPatch',
+    'ClickHouseInstallationSpecReconcilingHost',
+    'ClickHouseInstallationSpecReconcilingHostDrop',
+    'ClickHouseInstallationSpecReconcilingHostDropPatch',
+    'ClickHouseInstallationSpecReconcilingHostDropReplicas',
+    'ClickHouseInstallationSpecReconcilingHostDropReplicasPatch',
+    'ClickHouseInstallationSpecReconcilingHostHooks',
+    'ClickHouseInstallationSpecReconcilingHostHooksPatch',
+    'ClickHouseInstallationSpecReconcilingHostHooksPost',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostHttp',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostHttpPatch',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostPatch',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostShell',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostShellPatch',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostSql',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostSqlPatch',
+    'ClickHouseInstallationSpecReconcilingHostHooksPre',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreHttp',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreHttpPatch',
+    'ClickHouseInstallationSpecReconcilingHostHooksPrePatch',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreShell',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreShellPatch',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreSql',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreSqlPatch',
+    'ClickHouseInstallationSpecReconcilingHostPatch',
+    'ClickHouseInstallationSpecReconcilingHostWait',
+    'ClickHouseInstallationSpecReconcilingHostWaitPatch',
+    'ClickHouseInstallationSpecReconcilingHostWaitProbes',
+    'ClickHouseInstallationSpecReconcilingHostWaitProbesPatch',
+    'ClickHouseInstallationSpecReconcilingHostWaitReplicas',
+    'ClickHouseInstallationSpecReconcilingHostWaitReplicasPatch',
+    'ClickHouseInstallationSpecReconcilingMacros',
+    'ClickHouseInstallationSpecReconcilingMacrosPatch',
+    'ClickHouseInstallationSpecReconcilingMacrosSections',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsFiles',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatch',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsPatch',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsProfiles',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatch',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotas',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatch',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsSettings',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatch',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsUsers',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatch',
+    'ClickHouseInstallationSpecReconcilingPatch',
+    'ClickHouseInstallationSpecReconcilingRuntime',
+    'ClickHouseInstallationSpecReconcilingRuntimePatch',
+    'ClickHouseInstallationSpecReconcilingStatefulSet',
+    'ClickHouseInstallationSpecReconcilingStatefulSetCreate',
+    'ClickHouseInstallationSpecReconcilingStatefulSetCreatePatch',
+    'ClickHouseInstallationSpecReconcilingStatefulSetPatch',
+    'ClickHouseInstallationSpecReconcilingStatefulSetRecreate',
+    'ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatch',
+    'ClickHouseInstallationSpecReconcilingStatefulSetUpdate',
+    'ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatch',
+    'ClickHouseInstallationSpecTemplates',
+    'ClickHouseInstallationSpecTemplatesHostTemplates',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPatch',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistribution',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatch',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpec',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatch',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplates',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatch',
+    'ClickHouseInstallationSpecTemplatesPatch',
+    'ClickHouseInstallationSpecTemplatesPodTemplates',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPatch',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistribution',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatch',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesZone',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesZonePatch',
+    'ClickHouseInstallationSpecTemplatesServiceTemplates',
+    'ClickHouseInstallationSpecTemplatesServiceTemplatesPatch',
+    'ClickHouseInstallationSpecTemplatesVolumeClaimTemplates',
+    'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatch',
+    'ClickHouseInstallationSpecTemplating',
+    'ClickHouseInstallationSpecTemplatingPatch',
+    'ClickHouseInstallationSpecUseTemplates',
+    'ClickHouseInstallationSpecUseTemplatesPatch',
+    'ClickHouseInstallationStatus',
+    'ClickHouseInstallationStatusPatch',
+]
+
+_TYPE_MODULES = {
+    'ClickHouseInstallation': 'ClickHouseInstallation',
+    'ClickHouseInstallationSpec': 'ClickHouseInstallationSpec',
+    'ClickHouseInstallationSpecConfiguration': 'ClickHouseInstallationSpecConfiguration',
+    'ClickHouseInstallationSpecConfigurationClusters': 'ClickHouseInstallationSpecConfigurationClusters',
+    'ClickHouseInstallationSpecConfigurationClustersLayout': 'ClickHouseInstallationSpecConfigurationClustersLayout',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutPatch': 'ClickHouseInstallationSpecConfigurationClustersLayoutPatch',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicas': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicas',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatch': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatch',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShards': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShards',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatch': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatch',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplates': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplates',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatch': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatch',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplates': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplates',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatch': 'ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatch',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShards': 'ClickHouseInstallationSpecConfigurationClustersLayoutShards',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatch': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatch',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicas': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicas',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatch': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatch',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplates': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplates',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatch': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatch',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplates': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplates',
+    'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatch': 'ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatch',
+    'ClickHouseInstallationSpecConfigurationClustersPatch': 'ClickHouseInstallationSpecConfigurationClustersPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcile': 'ClickHouseInstallationSpecConfigurationClustersReconcile',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooks': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooks',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPost': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPost',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttp': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttp',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShell': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShell',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSql': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSql',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPre': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPre',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttp': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttp',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShell': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShell',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSql': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSql',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHost': 'ClickHouseInstallationSpecConfigurationClustersReconcileHost',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDrop': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostDrop',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicas': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicas',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooks': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooks',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPost': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPost',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttp': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttp',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShell': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShell',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSql': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSql',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPre': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPre',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttp': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttp',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShell': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShell',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSql': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSql',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWait': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWait',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbes': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbes',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicas': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicas',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcilePatch': 'ClickHouseInstallationSpecConfigurationClustersReconcilePatch',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileRuntime': 'ClickHouseInstallationSpecConfigurationClustersReconcileRuntime',
+    'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatch': 'ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatch',
+    'ClickHouseInstallationSpecConfigurationClustersSchemaPolicy': 'ClickHouseInstallationSpecConfigurationClustersSchemaPolicy',
+    'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyPatch': 'ClickHouseInstallationSpecConfigurationClustersSchemaPolicyPatch',
+    'ClickHouseInstallationSpecConfigurationClustersSecret': 'ClickHouseInstallationSpecConfigurationClustersSecret',
+    'ClickHouseInstallationSpecConfigurationClustersSecretPatch': 'ClickHouseInstallationSpecConfigurationClustersSecretPatch',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFrom': 'ClickHouseInstallationSpecConfigurationClustersSecretValueFrom',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatch': 'ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatch',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRef': 'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRef',
+    'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatch': 'ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatch',
+    'ClickHouseInstallationSpecConfigurationClustersTemplates': 'ClickHouseInstallationSpecConfigurationClustersTemplates',
+    'ClickHouseInstallationSpecConfigurationClustersTemplatesPatch': 'ClickHouseInstallationSpecConfigurationClustersTemplatesPatch',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeper': 'ClickHouseInstallationSpecConfigurationClustersZookeeper',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeper': 'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeper',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatch': 'ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatch',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperNodes': 'ClickHouseInstallationSpecConfigurationClustersZookeeperNodes',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatch': 'ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatch',
+    'ClickHouseInstallationSpecConfigurationClustersZookeeperPatch': 'ClickHouseInstallationSpecConfigurationClustersZookeeperPatch',
+    'ClickHouseInstallationSpecConfigurationPatch': 'ClickHouseInstallationSpecConfigurationPatch',
+    'ClickHouseInstallationSpecConfigurationZookeeper': 'ClickHouseInstallationSpecConfigurationZookeeper',
+    'ClickHouseInstallationSpecConfigurationZookeeperKeeper': 'ClickHouseInstallationSpecConfigurationZookeeperKeeper',
+    'ClickHouseInstallationSpecConfigurationZookeeperKeeperPatch': 'ClickHouseInstallationSpecConfigurationZookeeperKeeperPatch',
+    'ClickHouseInstallationSpecConfigurationZookeeperNodes': 'ClickHouseInstallationSpecConfigurationZookeeperNodes',
+    'ClickHouseInstallationSpecConfigurationZookeeperNodesPatch': 'ClickHouseInstallationSpecConfigurationZookeeperNodesPatch',
+    'ClickHouseInstallationSpecConfigurationZookeeperPatch': 'ClickHouseInstallationSpecConfigurationZookeeperPatch',
+    'ClickHouseInstallationSpecDefaults': 'ClickHouseInstallationSpecDefaults',
+    'ClickHouseInstallationSpecDefaultsDistributedDDL': 'ClickHouseInstallationSpecDefaultsDistributedDDL',
+    'ClickHouseInstallationSpecDefaultsDistributedDDLPatch': 'ClickHouseInstallationSpecDefaultsDistributedDDLPatch',
+    'ClickHouseInstallationSpecDefaultsPatch': 'ClickHouseInstallationSpecDefaultsPatch',
+    'ClickHouseInstallationSpecDefaultsStorageManagement': 'ClickHouseInstallationSpecDefaultsStorageManagement',
+    'ClickHouseInstallationSpecDefaultsStorageManagementPatch': 'ClickHouseInstallationSpecDefaultsStorageManagementPatch',
+    'ClickHouseInstallationSpecDefaultsTemplates': 'ClickHouseInstallationSpecDefaultsTemplates',
+    'ClickHouseInstallationSpecDefaultsTemplatesPatch': 'ClickHouseInstallationSpecDefaultsTemplatesPatch',
+    'ClickHouseInstallationSpecPatch': 'ClickHouseInstallationSpecPatch',
+    'ClickHouseInstallationSpecReconcile': 'ClickHouseInstallationSpecReconcile',
+    'ClickHouseInstallationSpecReconcileCleanup': 'ClickHouseInstallationSpecReconcileCleanup',
+    'ClickHouseInstallationSpecReconcileCleanupPatch': 'ClickHouseInstallationSpecReconcileCleanupPatch',
+    'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjects': 'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjects',
+    'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatch': 'ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatch',
+    'ClickHouseInstallationSpecReconcileCleanupUnknownObjects': 'ClickHouseInstallationSpecReconcileCleanupUnknownObjects',
+    'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatch': 'ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatch',
+    'ClickHouseInstallationSpecReconcileCluster': 'ClickHouseInstallationSpecReconcileCluster',
+    'ClickHouseInstallationSpecReconcileClusterHooks': 'ClickHouseInstallationSpecReconcileClusterHooks',
+    'ClickHouseInstallationSpecReconcileClusterHooksPatch': 'ClickHouseInstallationSpecReconcileClusterHooksPatch',
+    'ClickHouseInstallationSpecReconcileClusterHooksPost': 'ClickHouseInstallationSpecReconcileClusterHooksPost',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostHttp': 'ClickHouseInstallationSpecReconcileClusterHooksPostHttp',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostHttpPatch': 'ClickHouseInstallationSpecReconcileClusterHooksPostHttpPatch',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostPatch': 'ClickHouseInstallationSpecReconcileClusterHooksPostPatch',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostShell': 'ClickHouseInstallationSpecReconcileClusterHooksPostShell',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostShellPatch': 'ClickHouseInstallationSpecReconcileClusterHooksPostShellPatch',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostSql': 'ClickHouseInstallationSpecReconcileClusterHooksPostSql',
+    'ClickHouseInstallationSpecReconcileClusterHooksPostSqlPatch': 'ClickHouseInstallationSpecReconcileClusterHooksPostSqlPatch',
+    'ClickHouseInstallationSpecReconcileClusterHooksPre': 'ClickHouseInstallationSpecReconcileClusterHooksPre',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreHttp': 'ClickHouseInstallationSpecReconcileClusterHooksPreHttp',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreHttpPatch': 'ClickHouseInstallationSpecReconcileClusterHooksPreHttpPatch',
+    'ClickHouseInstallationSpecReconcileClusterHooksPrePatch': 'ClickHouseInstallationSpecReconcileClusterHooksPrePatch',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreShell': 'ClickHouseInstallationSpecReconcileClusterHooksPreShell',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreShellPatch': 'ClickHouseInstallationSpecReconcileClusterHooksPreShellPatch',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreSql': 'ClickHouseInstallationSpecReconcileClusterHooksPreSql',
+    'ClickHouseInstallationSpecReconcileClusterHooksPreSqlPatch': 'ClickHouseInstallationSpecReconcileClusterHooksPreSqlPatch',
+    'ClickHouseInstallationSpecReconcileClusterPatch': 'ClickHouseInstallationSpecReconcileClusterPatch',
+    'ClickHouseInstallationSpecReconcileHost': 'ClickHouseInstallationSpecReconcileHost',
+    'ClickHouseInstallationSpecReconcileHostDrop': 'ClickHouseInstallationSpecReconcileHostDrop',
+    'ClickHouseInstallationSpecReconcileHostDropPatch': 'ClickHouseInstallationSpecReconcileHostDropPatch',
+    'ClickHouseInstallationSpecReconcileHostDropReplicas': 'ClickHouseInstallationSpecReconcileHostDropReplicas',
+    'ClickHouseInstallationSpecReconcileHostDropReplicasPatch': 'ClickHouseInstallationSpecReconcileHostDropReplicasPatch',
+    'ClickHouseInstallationSpecReconcileHostHooks': 'ClickHouseInstallationSpecReconcileHostHooks',
+    'ClickHouseInstallationSpecReconcileHostHooksPatch': 'ClickHouseInstallationSpecReconcileHostHooksPatch',
+    'ClickHouseInstallationSpecReconcileHostHooksPost': 'ClickHouseInstallationSpecReconcileHostHooksPost',
+    'ClickHouseInstallationSpecReconcileHostHooksPostHttp': 'ClickHouseInstallationSpecReconcileHostHooksPostHttp',
+    'ClickHouseInstallationSpecReconcileHostHooksPostHttpPatch': 'ClickHouseInstallationSpecReconcileHostHooksPostHttpPatch',
+    'ClickHouseInstallationSpecReconcileHostHooksPostPatch': 'ClickHouseInstallationSpecReconcileHostHooksPostPatch',
+    'ClickHouseInstallationSpecReconcileHostHooksPostShell': 'ClickHouseInstallationSpecReconcileHostHooksPostShell',
+    'ClickHouseInstallationSpecReconcileHostHooksPostShellPatch': 'ClickHouseInstallationSpecReconcileHostHooksPostShellPatch',
+    'ClickHouseInstallationSpecReconcileHostHooksPostSql': 'ClickHouseInstallationSpecReconcileHostHooksPostSql',
+    'ClickHouseInstallationSpecReconcileHostHooksPostSqlPatch': 'ClickHouseInstallationSpecReconcileHostHooksPostSqlPatch',
+    'ClickHouseInstallationSpecReconcileHostHooksPre': 'ClickHouseInstallationSpecReconcileHostHooksPre',
+    'ClickHouseInstallationSpecReconcileHostHooksPreHttp': 'ClickHouseInstallationSpecReconcileHostHooksPreHttp',
+    'ClickHouseInstallationSpecReconcileHostHooksPreHttpPatch': 'ClickHouseInstallationSpecReconcileHostHooksPreHttpPatch',
+    'ClickHouseInstallationSpecReconcileHostHooksPrePatch': 'ClickHouseInstallationSpecReconcileHostHooksPrePatch',
+    'ClickHouseInstallationSpecReconcileHostHooksPreShell': 'ClickHouseInstallationSpecReconcileHostHooksPreShell',
+    'ClickHouseInstallationSpecReconcileHostHooksPreShellPatch': 'ClickHouseInstallationSpecReconcileHostHooksPreShellPatch',
+    'ClickHouseInstallationSpecReconcileHostHooksPreSql': 'ClickHouseInstallationSpecReconcileHostHooksPreSql',
+    'ClickHouseInstallationSpecReconcileHostHooksPreSqlPatch': 'ClickHouseInstallationSpecReconcileHostHooksPreSqlPatch',
+    'ClickHouseInstallationSpecReconcileHostPatch': 'ClickHouseInstallationSpecReconcileHostPatch',
+    'ClickHouseInstallationSpecReconcileHostWait': 'ClickHouseInstallationSpecReconcileHostWait',
+    'ClickHouseInstallationSpecReconcileHostWaitPatch': 'ClickHouseInstallationSpecReconcileHostWaitPatch',
+    'ClickHouseInstallationSpecReconcileHostWaitProbes': 'ClickHouseInstallationSpecReconcileHostWaitProbes',
+    'ClickHouseInstallationSpecReconcileHostWaitProbesPatch': 'ClickHouseInstallationSpecReconcileHostWaitProbesPatch',
+    'ClickHouseInstallationSpecReconcileHostWaitReplicas': 'ClickHouseInstallationSpecReconcileHostWaitReplicas',
+    'ClickHouseInstallationSpecReconcileHostWaitReplicasPatch': 'ClickHouseInstallationSpecReconcileHostWaitReplicasPatch',
+    'ClickHouseInstallationSpecReconcileMacros': 'ClickHouseInstallationSpecReconcileMacros',
+    'ClickHouseInstallationSpecReconcileMacrosPatch': 'ClickHouseInstallationSpecReconcileMacrosPatch',
+    'ClickHouseInstallationSpecReconcileMacrosSections': 'ClickHouseInstallationSpecReconcileMacrosSections',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsFiles': 'ClickHouseInstallationSpecReconcileMacrosSectionsFiles',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatch': 'ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatch',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsPatch': 'ClickHouseInstallationSpecReconcileMacrosSectionsPatch',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsProfiles': 'ClickHouseInstallationSpecReconcileMacrosSectionsProfiles',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatch': 'ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatch',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsQuotas': 'ClickHouseInstallationSpecReconcileMacrosSectionsQuotas',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatch': 'ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatch',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsSettings': 'ClickHouseInstallationSpecReconcileMacrosSectionsSettings',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatch': 'ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatch',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsUsers': 'ClickHouseInstallationSpecReconcileMacrosSectionsUsers',
+    'ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatch': 'ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatch',
+    'ClickHouseInstallationSpecReconcilePatch': 'ClickHouseInstallationSpecReconcilePatch',
+    'ClickHouseInstallationSpecReconcileRuntime': 'ClickHouseInstallationSpecReconcileRuntime',
+    'ClickHouseInstallationSpecReconcileRuntimePatch': 'ClickHouseInstallationSpecReconcileRuntimePatch',
+    'ClickHouseInstallationSpecReconcileStatefulSet': 'ClickHouseInstallationSpecReconcileStatefulSet',
+    'ClickHouseInstallationSpecReconcileStatefulSetCreate': 'ClickHouseInstallationSpecReconcileStatefulSetCreate',
+    'ClickHouseInstallationSpecReconcileStatefulSetCreatePatch': 'ClickHouseInstallationSpecReconcileStatefulSetCreatePatch',
+    'ClickHouseInstallationSpecReconcileStatefulSetPatch': 'ClickHouseInstallationSpecReconcileStatefulSetPatch',
+    'ClickHouseInstallationSpecReconcileStatefulSetRecreate': 'ClickHouseInstallationSpecReconcileStatefulSetRecreate',
+    'ClickHouseInstallationSpecReconcileStatefulSetRecreatePatch': 'ClickHouseInstallationSpecReconcileStatefulSetRecreatePatch',
+    'ClickHouseInstallationSpecReconcileStatefulSetUpdate': 'ClickHouseInstallationSpecReconcileStatefulSetUpdate',
+    'ClickHouseInstallationSpecReconcileStatefulSetUpdatePatch': 'ClickHouseInstallationSpecReconcileStatefulSetUpdatePatch',
+    'ClickHouseInstallationSpecReconciling': 'ClickHouseInstallationSpecReconciling',
+    'ClickHouseInstallationSpecReconcilingCleanup': 'ClickHouseInstallationSpecReconcilingCleanup',
+    'ClickHouseInstallationSpecReconcilingCleanupPatch': 'ClickHouseInstallationSpecReconcilingCleanupPatch',
+    'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjects': 'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjects',
+    'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatch': 'ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatch',
+    'ClickHouseInstallationSpecReconcilingCleanupUnknownObjects': 'ClickHouseInstallationSpecReconcilingCleanupUnknownObjects',
+    'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatch': 'ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatch',
+    'ClickHouseInstallationSpecReconcilingCluster': 'ClickHouseInstallationSpecReconcilingCluster',
+    'ClickHouseInstallationSpecReconcilingClusterHooks': 'ClickHouseInstallationSpecReconcilingClusterHooks',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPatch': 'ClickHouseInstallationSpecReconcilingClusterHooksPatch',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPost': 'ClickHouseInstallationSpecReconcilingClusterHooksPost',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostHttp': 'ClickHouseInstallationSpecReconcilingClusterHooksPostHttp',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpPatch': 'ClickHouseInstallationSpecReconcilingClusterHooksPostHttpPatch',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostPatch': 'ClickHouseInstallationSpecReconcilingClusterHooksPostPatch',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostShell': 'ClickHouseInstallationSpecReconcilingClusterHooksPostShell',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostShellPatch': 'ClickHouseInstallationSpecReconcilingClusterHooksPostShellPatch',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostSql': 'ClickHouseInstallationSpecReconcilingClusterHooksPostSql',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlPatch': 'ClickHouseInstallationSpecReconcilingClusterHooksPostSqlPatch',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPre': 'ClickHouseInstallationSpecReconcilingClusterHooksPre',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreHttp': 'ClickHouseInstallationSpecReconcilingClusterHooksPreHttp',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpPatch': 'ClickHouseInstallationSpecReconcilingClusterHooksPreHttpPatch',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPrePatch': 'ClickHouseInstallationSpecReconcilingClusterHooksPrePatch',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreShell': 'ClickHouseInstallationSpecReconcilingClusterHooksPreShell',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreShellPatch': 'ClickHouseInstallationSpecReconcilingClusterHooksPreShellPatch',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreSql': 'ClickHouseInstallationSpecReconcilingClusterHooksPreSql',
+    'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlPatch': 'ClickHouseInstallationSpecReconcilingClusterHooksPreSqlPatch',
+    'ClickHouseInstallationSpecReconcilingClusterPatch': 'ClickHouseInstallationSpecReconcilingClusterPatch',
+    'ClickHouseInstallationSpecReconcilingHost': 'ClickHouseInstallationSpecReconcilingHost',
+    'ClickHouseInstallationSpecReconcilingHostDrop': 'ClickHouseInstallationSpecReconcilingHostDrop',
+    'ClickHouseInstallationSpecReconcilingHostDropPatch': 'ClickHouseInstallationSpecReconcilingHostDropPatch',
+    'ClickHouseInstallationSpecReconcilingHostDropReplicas': 'ClickHouseInstallationSpecReconcilingHostDropReplicas',
+    'ClickHouseInstallationSpecReconcilingHostDropReplicasPatch': 'ClickHouseInstallationSpecReconcilingHostDropReplicasPatch',
+    'ClickHouseInstallationSpecReconcilingHostHooks': 'ClickHouseInstallationSpecReconcilingHostHooks',
+    'ClickHouseInstallationSpecReconcilingHostHooksPatch': 'ClickHouseInstallationSpecReconcilingHostHooksPatch',
+    'ClickHouseInstallationSpecReconcilingHostHooksPost': 'ClickHouseInstallationSpecReconcilingHostHooksPost',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostHttp': 'ClickHouseInstallationSpecReconcilingHostHooksPostHttp',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostHttpPatch': 'ClickHouseInstallationSpecReconcilingHostHooksPostHttpPatch',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostPatch': 'ClickHouseInstallationSpecReconcilingHostHooksPostPatch',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostShell': 'ClickHouseInstallationSpecReconcilingHostHooksPostShell',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostShellPatch': 'ClickHouseInstallationSpecReconcilingHostHooksPostShellPatch',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostSql': 'ClickHouseInstallationSpecReconcilingHostHooksPostSql',
+    'ClickHouseInstallationSpecReconcilingHostHooksPostSqlPatch': 'ClickHouseInstallationSpecReconcilingHostHooksPostSqlPatch',
+    'ClickHouseInstallationSpecReconcilingHostHooksPre': 'ClickHouseInstallationSpecReconcilingHostHooksPre',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreHttp': 'ClickHouseInstallationSpecReconcilingHostHooksPreHttp',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreHttpPatch': 'ClickHouseInstallationSpecReconcilingHostHooksPreHttpPatch',
+    'ClickHouseInstallationSpecReconcilingHostHooksPrePatch': 'ClickHouseInstallationSpecReconcilingHostHooksPrePatch',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreShell': 'ClickHouseInstallationSpecReconcilingHostHooksPreShell',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreShellPatch': 'ClickHouseInstallationSpecReconcilingHostHooksPreShellPatch',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreSql': 'ClickHouseInstallationSpecReconcilingHostHooksPreSql',
+    'ClickHouseInstallationSpecReconcilingHostHooksPreSqlPatch': 'ClickHouseInstallationSpecReconcilingHostHooksPreSqlPatch',
+    'ClickHouseInstallationSpecReconcilingHostPatch': 'ClickHouseInstallationSpecReconcilingHostPatch',
+    'ClickHouseInstallationSpecReconcilingHostWait': 'ClickHouseInstallationSpecReconcilingHostWait',
+    'ClickHouseInstallationSpecReconcilingHostWaitPatch': 'ClickHouseInstallationSpecReconcilingHostWaitPatch',
+    'ClickHouseInstallationSpecReconcilingHostWaitProbes': 'ClickHouseInstallationSpecReconcilingHostWaitProbes',
+    'ClickHouseInstallationSpecReconcilingHostWaitProbesPatch': 'ClickHouseInstallationSpecReconcilingHostWaitProbesPatch',
+    'ClickHouseInstallationSpecReconcilingHostWaitReplicas': 'ClickHouseInstallationSpecReconcilingHostWaitReplicas',
+    'ClickHouseInstallationSpecReconcilingHostWaitReplicasPatch': 'ClickHouseInstallationSpecReconcilingHostWaitReplicasPatch',
+    'ClickHouseInstallationSpecReconcilingMacros': 'ClickHouseInstallationSpecReconcilingMacros',
+    'ClickHouseInstallationSpecReconcilingMacrosPatch': 'ClickHouseInstallationSpecReconcilingMacrosPatch',
+    'ClickHouseInstallationSpecReconcilingMacrosSections': 'ClickHouseInstallationSpecReconcilingMacrosSections',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsFiles': 'ClickHouseInstallationSpecReconcilingMacrosSectionsFiles',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatch': 'ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatch',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsPatch': 'ClickHouseInstallationSpecReconcilingMacrosSectionsPatch',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsProfiles': 'ClickHouseInstallationSpecReconcilingMacrosSectionsProfiles',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatch': 'ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatch',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotas': 'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotas',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatch': 'ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatch',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsSettings': 'ClickHouseInstallationSpecReconcilingMacrosSectionsSettings',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatch': 'ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatch',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsUsers': 'ClickHouseInstallationSpecReconcilingMacrosSectionsUsers',
+    'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatch': 'ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatch',
+    'ClickHouseInstallationSpecReconcilingPatch': 'ClickHouseInstallationSpecReconcilingPatch',
+    'ClickHouseInstallationSpecReconcilingRuntime': 'ClickHouseInstallationSpecReconcilingRuntime',
+    'ClickHouseInstallationSpecReconcilingRuntimePatch': 'ClickHouseInstallationSpecReconcilingRuntimePatch',
+    'ClickHouseInstallationSpecReconcilingStatefulSet': 'ClickHouseInstallationSpecReconcilingStatefulSet',
+    'ClickHouseInstallationSpecReconcilingStatefulSetCreate': 'ClickHouseInstallationSpecReconcilingStatefulSetCreate',
+    'ClickHouseInstallationSpecReconcilingStatefulSetCreatePatch': 'ClickHouseInstallationSpecReconcilingStatefulSetCreatePatch',
+    'ClickHouseInstallationSpecReconcilingStatefulSetPatch': 'ClickHouseInstallationSpecReconcilingStatefulSetPatch',
+    'ClickHouseInstallationSpecReconcilingStatefulSetRecreate': 'ClickHouseInstallationSpecReconcilingStatefulSetRecreate',
+    'ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatch': 'ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatch',
+    'ClickHouseInstallationSpecReconcilingStatefulSetUpdate': 'ClickHouseInstallationSpecReconcilingStatefulSetUpdate',
+    'ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatch': 'ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatch',
+    'ClickHouseInstallationSpecTemplates': 'ClickHouseInstallationSpecTemplates',
+    'ClickHouseInstallationSpecTemplatesHostTemplates': 'ClickHouseInstallationSpecTemplatesHostTemplates',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPatch': 'ClickHouseInstallationSpecTemplatesHostTemplatesPatch',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistribution': 'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistribution',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatch': 'ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatch',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpec': 'ClickHouseInstallationSpecTemplatesHostTemplatesSpec',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatch': 'ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatch',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplates': 'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplates',
+    'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatch': 'ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatch',
+    'ClickHouseInstallationSpecTemplatesPatch': 'ClickHouseInstallationSpecTemplatesPatch',
+    'ClickHouseInstallationSpecTemplatesPodTemplates': 'ClickHouseInstallationSpecTemplatesPodTemplates',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPatch': 'ClickHouseInstallationSpecTemplatesPodTemplatesPatch',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistribution': 'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistribution',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatch': 'ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatch',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesZone': 'ClickHouseInstallationSpecTemplatesPodTemplatesZone',
+    'ClickHouseInstallationSpecTemplatesPodTemplatesZonePatch': 'ClickHouseInstallationSpecTemplatesPodTemplatesZonePatch',
+    'ClickHouseInstallationSpecTemplatesServiceTemplates': 'ClickHouseInstallationSpecTemplatesServiceTemplates',
+    'ClickHouseInstallationSpecTemplatesServiceTemplatesPatch': 'ClickHouseInstallationSpecTemplatesServiceTemplatesPatch',
+    'ClickHouseInstallationSpecTemplatesVolumeClaimTemplates': 'ClickHouseInstallationSpecTemplatesVolumeClaimTemplates',
+    'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatch': 'ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatch',
+    'ClickHouseInstallationSpecTemplating': 'ClickHouseInstallationSpecTemplating',
+    'ClickHouseInstallationSpecTemplatingPatch': 'ClickHouseInstallationSpecTemplatingPatch',
+    'ClickHouseInstallationSpecUseTemplates': 'ClickHouseInstallationSpecUseTemplates',
+    'ClickHouseInstallationSpecUseTemplatesPatch': 'ClickHouseInstallationSpecUseTemplatesPatch',
+    'ClickHouseInstallationStatus': 'ClickHouseInstallationStatus',
+    'ClickHouseInstallationStatusPatch': 'ClickHouseInstallationStatusPatch',
+}
+
+if typing.TYPE_CHECKING:
+    from .ClickHouseInstallation import *
+    from .ClickHouseInstallationSpec import *
+    from .ClickHouseInstallationSpecConfiguration import *
+    from .ClickHouseInstallationSpecConfigurationClusters import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayout import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutReplicas import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutReplicasPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShards import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplates import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutReplicasShardsTemplatesPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplates import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutReplicasTemplatesPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutShards import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutShardsPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicas import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplates import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutShardsReplicasTemplatesPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplates import *
+    from .ClickHouseInstallationSpecConfigurationClustersLayoutShardsTemplatesPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcile import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooks import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPost import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttp import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostHttpPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShell import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostShellPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSql import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPostSqlPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPre import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttp import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreHttpPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPrePatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShell import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreShellPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSql import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHooksPreSqlPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHost import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostDrop import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostDropPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicas import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostDropReplicasPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooks import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPost import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttp import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostHttpPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShell import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostShellPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSql import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPostSqlPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPre import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttp import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreHttpPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPrePatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShell import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreShellPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSql import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostHooksPreSqlPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostWait import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbes import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitProbesPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicas import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileHostWaitReplicasPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcilePatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileRuntime import *
+    from .ClickHouseInstallationSpecConfigurationClustersReconcileRuntimePatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersSchemaPolicy import *
+    from .ClickHouseInstallationSpecConfigurationClustersSchemaPolicyPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersSecret import *
+    from .ClickHouseInstallationSpecConfigurationClustersSecretPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersSecretValueFrom import *
+    from .ClickHouseInstallationSpecConfigurationClustersSecretValueFromPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRef import *
+    from .ClickHouseInstallationSpecConfigurationClustersSecretValueFromSecretKeyRefPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersTemplates import *
+    from .ClickHouseInstallationSpecConfigurationClustersTemplatesPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersZookeeper import *
+    from .ClickHouseInstallationSpecConfigurationClustersZookeeperKeeper import *
+    from .ClickHouseInstallationSpecConfigurationClustersZookeeperKeeperPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersZookeeperNodes import *
+    from .ClickHouseInstallationSpecConfigurationClustersZookeeperNodesPatch import *
+    from .ClickHouseInstallationSpecConfigurationClustersZookeeperPatch import *
+    from .ClickHouseInstallationSpecConfigurationPatch import *
+    from .ClickHouseInstallationSpecConfigurationZookeeper import *
+    from .ClickHouseInstallationSpecConfigurationZookeeperKeeper import *
+    from .ClickHouseInstallationSpecConfigurationZookeeperKeeperPatch import *
+    from .ClickHouseInstallationSpecConfigurationZookeeperNodes import *
+    from .ClickHouseInstallationSpecConfigurationZookeeperNodesPatch import *
+    from .ClickHouseInstallationSpecConfigurationZookeeperPatch import *
+    from .ClickHouseInstallationSpecDefaults import *
+    from .ClickHouseInstallationSpecDefaultsDistributedDDL import *
+    from .ClickHouseInstallationSpecDefaultsDistributedDDLPatch import *
+    from .ClickHouseInstallationSpecDefaultsPatch import *
+    from .ClickHouseInstallationSpecDefaultsStorageManagement import *
+    from .ClickHouseInstallationSpecDefaultsStorageManagementPatch import *
+    from .ClickHouseInstallationSpecDefaultsTemplates import *
+    from .ClickHouseInstallationSpecDefaultsTemplatesPatch import *
+    from .ClickHouseInstallationSpecPatch import *
+    from .ClickHouseInstallationSpecReconcile import *
+    from .ClickHouseInstallationSpecReconcileCleanup import *
+    from .ClickHouseInstallationSpecReconcileCleanupPatch import *
+    from .ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjects import *
+    from .ClickHouseInstallationSpecReconcileCleanupReconcileFailedObjectsPatch import *
+    from .ClickHouseInstallationSpecReconcileCleanupUnknownObjects import *
+    from .ClickHouseInstallationSpecReconcileCleanupUnknownObjectsPatch import *
+    from .ClickHouseInstallationSpecReconcileCluster import *
+    from .ClickHouseInstallationSpecReconcileClusterHooks import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPatch import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPost import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPostHttp import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPostHttpPatch import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPostPatch import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPostShell import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPostShellPatch import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPostSql import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPostSqlPatch import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPre import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPreHttp import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPreHttpPatch import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPrePatch import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPreShell import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPreShellPatch import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPreSql import *
+    from .ClickHouseInstallationSpecReconcileClusterHooksPreSqlPatch import *
+    from .ClickHouseInstallationSpecReconcileClusterPatch import *
+    from .ClickHouseInstallationSpecReconcileHost import *
+    from .ClickHouseInstallationSpecReconcileHostDrop import *
+    from .ClickHouseInstallationSpecReconcileHostDropPatch import *
+    from .ClickHouseInstallationSpecReconcileHostDropReplicas import *
+    from .ClickHouseInstallationSpecReconcileHostDropReplicasPatch import *
+    from .ClickHouseInstallationSpecReconcileHostHooks import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPatch import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPost import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPostHttp import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPostHttpPatch import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPostPatch import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPostShell import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPostShellPatch import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPostSql import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPostSqlPatch import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPre import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPreHttp import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPreHttpPatch import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPrePatch import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPreShell import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPreShellPatch import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPreSql import *
+    from .ClickHouseInstallationSpecReconcileHostHooksPreSqlPatch import *
+    from .ClickHouseInstallationSpecReconcileHostPatch import *
+    from .ClickHouseInstallationSpecReconcileHostWait import *
+    from .ClickHouseInstallationSpecReconcileHostWaitPatch import *
+    from .ClickHouseInstallationSpecReconcileHostWaitProbes import *
+    from .ClickHouseInstallationSpecReconcileHostWaitProbesPatch import *
+    from .ClickHouseInstallationSpecReconcileHostWaitReplicas import *
+    from .ClickHouseInstallationSpecReconcileHostWaitReplicasPatch import *
+    from .ClickHouseInstallationSpecReconcileMacros import *
+    from .ClickHouseInstallationSpecReconcileMacrosPatch import *
+    from .ClickHouseInstallationSpecReconcileMacrosSections import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsFiles import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsFilesPatch import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsPatch import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsProfiles import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsProfilesPatch import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsQuotas import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsQuotasPatch import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsSettings import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsSettingsPatch import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsUsers import *
+    from .ClickHouseInstallationSpecReconcileMacrosSectionsUsersPatch import *
+    from .ClickHouseInstallationSpecReconcilePatch import *
+    from .ClickHouseInstallationSpecReconcileRuntime import *
+    from .ClickHouseInstallationSpecReconcileRuntimePatch import *
+    from .ClickHouseInstallationSpecReconcileStatefulSet import *
+    from .ClickHouseInstallationSpecReconcileStatefulSetCreate import *
+    from .ClickHouseInstallationSpecReconcileStatefulSetCreatePatch import *
+    from .ClickHouseInstallationSpecReconcileStatefulSetPatch import *
+    from .ClickHouseInstallationSpecReconcileStatefulSetRecreate import *
+    from .ClickHouseInstallationSpecReconcileStatefulSetRecreatePatch import *
+    from .ClickHouseInstallationSpecReconcileStatefulSetUpdate import *
+    from .ClickHouseInstallationSpecReconcileStatefulSetUpdatePatch import *
+    from .ClickHouseInstallationSpecReconciling import *
+    from .ClickHouseInstallationSpecReconcilingCleanup import *
+    from .ClickHouseInstallationSpecReconcilingCleanupPatch import *
+    from .ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjects import *
+    from .ClickHouseInstallationSpecReconcilingCleanupReconcileFailedObjectsPatch import *
+    from .ClickHouseInstallationSpecReconcilingCleanupUnknownObjects import *
+    from .ClickHouseInstallationSpecReconcilingCleanupUnknownObjectsPatch import *
+    from .ClickHouseInstallationSpecReconcilingCluster import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooks import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPatch import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPost import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPostHttp import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPostHttpPatch import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPostPatch import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPostShell import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPostShellPatch import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPostSql import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPostSqlPatch import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPre import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPreHttp import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPreHttpPatch import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPrePatch import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPreShell import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPreShellPatch import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPreSql import *
+    from .ClickHouseInstallationSpecReconcilingClusterHooksPreSqlPatch import *
+    from .ClickHouseInstallationSpecReconcilingClusterPatch import *
+    from .ClickHouseInstallationSpecReconcilingHost import *
+    from .ClickHouseInstallationSpecReconcilingHostDrop import *
+    from .ClickHouseInstallationSpecReconcilingHostDropPatch import *
+    from .ClickHouseInstallationSpecReconcilingHostDropReplicas import *
+    from .ClickHouseInstallationSpecReconcilingHostDropReplicasPatch import *
+    from .ClickHouseInstallationSpecReconcilingHostHooks import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPatch import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPost import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPostHttp import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPostHttpPatch import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPostPatch import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPostShell import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPostShellPatch import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPostSql import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPostSqlPatch import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPre import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPreHttp import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPreHttpPatch import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPrePatch import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPreShell import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPreShellPatch import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPreSql import *
+    from .ClickHouseInstallationSpecReconcilingHostHooksPreSqlPatch import *
+    from .ClickHouseInstallationSpecReconcilingHostPatch import *
+    from .ClickHouseInstallationSpecReconcilingHostWait import *
+    from .ClickHouseInstallationSpecReconcilingHostWaitPatch import *
+    from .ClickHouseInstallationSpecReconcilingHostWaitProbes import *
+    from .ClickHouseInstallationSpecReconcilingHostWaitProbesPatch import *
+    from .ClickHouseInstallationSpecReconcilingHostWaitReplicas import *
+    from .ClickHouseInstallationSpecReconcilingHostWaitReplicasPatch import *
+    from .ClickHouseInstallationSpecReconcilingMacros import *
+    from .ClickHouseInstallationSpecReconcilingMacrosPatch import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSections import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsFiles import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsFilesPatch import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsPatch import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsProfiles import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsProfilesPatch import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsQuotas import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsQuotasPatch import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsSettings import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsSettingsPatch import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsUsers import *
+    from .ClickHouseInstallationSpecReconcilingMacrosSectionsUsersPatch import *
+    from .ClickHouseInstallationSpecReconcilingPatch import *
+    from .ClickHouseInstallationSpecReconcilingRuntime import *
+    from .ClickHouseInstallationSpecReconcilingRuntimePatch import *
+    from .ClickHouseInstallationSpecReconcilingStatefulSet import *
+    from .ClickHouseInstallationSpecReconcilingStatefulSetCreate import *
+    from .ClickHouseInstallationSpecReconcilingStatefulSetCreatePatch import *
+    from .ClickHouseInstallationSpecReconcilingStatefulSetPatch import *
+    from .ClickHouseInstallationSpecReconcilingStatefulSetRecreate import *
+    from .ClickHouseInstallationSpecReconcilingStatefulSetRecreatePatch import *
+    from .ClickHouseInstallationSpecReconcilingStatefulSetUpdate import *
+    from .ClickHouseInstallationSpecReconcilingStatefulSetUpdatePatch import *
+    from .ClickHouseInstallationSpecTemplates import *
+    from .ClickHouseInstallationSpecTemplatesHostTemplates import *
+    from .ClickHouseInstallationSpecTemplatesHostTemplatesPatch import *
+    from .ClickHouseInstallationSpecTemplatesHostTemplatesPortDistribution import *
+    from .ClickHouseInstallationSpecTemplatesHostTemplatesPortDistributionPatch import *
+    from .ClickHouseInstallationSpecTemplatesHostTemplatesSpec import *
+    from .ClickHouseInstallationSpecTemplatesHostTemplatesSpecPatch import *
+    from .ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplates import *
+    from .ClickHouseInstallationSpecTemplatesHostTemplatesSpecTemplatesPatch import *
+    from .ClickHouseInstallationSpecTemplatesPatch import *
+    from .ClickHouseInstallationSpecTemplatesPodTemplates import *
+    from .ClickHouseInstallationSpecTemplatesPodTemplatesPatch import *
+    from .ClickHouseInstallationSpecTemplatesPodTemplatesPodDistribution import *
+    from .ClickHouseInstallationSpecTemplatesPodTemplatesPodDistributionPatch import *
+    from .ClickHouseInstallationSpecTemplatesPodTemplatesZone import *
+    from .ClickHouseInstallationSpecTemplatesPodTemplatesZonePatch import *
+    from .ClickHouseInstallationSpecTemplatesServiceTemplates import *
+    from .ClickHouseInstallationSpecTemplatesServiceTemplatesPatch import *
+    from .ClickHouseInstallationSpecTemplatesVolumeClaimTemplates import *
+    from .ClickHouseInstallationSpecTemplatesVolumeClaimTemplatesPatch import *
+    from .ClickHouseInstallationSpecTemplating import *
+    from .ClickHouseInstallationSpecTemplatingPatch import *
+    from .ClickHouseInstallationSpecUseTemplates import *
+    from .ClickHouseInstallationSpecUseTemplatesPatch import *
+    from .ClickHouseInstallationStatus import *
+    from .ClickHouseInstallationStatusPatch import *
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _TYPE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -15,21 +15,21 @@ else:
 from ... import _utilities
 from . import outputs
 from ... import meta as _meta
-from ._inputs import *
+from . import _inputs
 
 __all__ = ['RayClusterListArgs', 'RayClusterList']
 
 @pulumi.input_type
 class RayClusterListArgs:
     def __init__(__self__, *,
-                 items: pulumi.Input[Sequence[pulumi.Input['RayClusterArgs']]],
+                 items: pulumi.Input[Sequence[pulumi.Input['_inputs.RayClusterArgs']]],
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional['_meta.v1.ListMetaArgs']] = None):
         """
         The set of arguments for constructing a RayClusterList resource.
 
-        :param pulumi.Input[Sequence[pulumi.Input['RayClusterArgs']]] items: List of rayclusters. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.RayClusterArgs']]] items: List of rayclusters. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md
         :param pulumi.Input[_builtins.str] api_version: APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
         :param pulumi.Input[_builtins.str] kind: Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
         :param pulumi.Input['_meta.v1.ListMetaArgs'] metadata: Standard list metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
@@ -44,14 +44,14 @@ class RayClusterListArgs:
 
     @_builtins.property
     @pulumi.getter
-    def items(self) -> pulumi.Input[Sequence[pulumi.Input['RayClusterArgs']]]:
+    def items(self) -> pulumi.Input[Sequence[pulumi.Input['_inputs.RayClusterArgs']]]:
         """
         List of rayclusters. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md
         """
         return pulumi.get(self, "items")
 
     @items.setter
-    def items(self, value: pulumi.Input[Sequence[pulumi.Input['RayClusterArgs']]]):
+    def items(self, value: pulumi.Input[Sequence[pulumi.Input['_inputs.RayClusterArgs']]]):
         pulumi.set(self, "items", value)
 
     @_builtins.property
@@ -98,7 +98,7 @@ class RayClusterList(pulumi.CustomResource):
                  resource_name: str,
                  opts: Optional[pulumi.ResourceOptions] = None,
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 items: pulumi.Input[Optional[Sequence[pulumi.Input[Union['RayClusterArgs', 'RayClusterArgsDict']]]]] = None,
+                 items: pulumi.Input[Optional[Sequence[pulumi.Input[Union['_inputs.RayClusterArgs', '_inputs.RayClusterArgsDict']]]]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ListMetaArgs', '_meta.v1.ListMetaArgsDict']]] = None,
                  __props__=None):
@@ -109,7 +109,7 @@ class RayClusterList(pulumi.CustomResource):
         :param str resource_name: The name of the resource.
         :param pulumi.ResourceOptions opts: Options for the resource.
         :param pulumi.Input[_builtins.str] api_version: APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        :param pulumi.Input[Sequence[pulumi.Input[Union['RayClusterArgs', 'RayClusterArgsDict']]]] items: List of rayclusters. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md
+        :param pulumi.Input[Sequence[pulumi.Input[Union['_inputs.RayClusterArgs', '_inputs.RayClusterArgsDict']]]] items: List of rayclusters. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md
         :param pulumi.Input[_builtins.str] kind: Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
         :param pulumi.Input[Union['_meta.v1.ListMetaArgs', '_meta.v1.ListMetaArgsDict']] metadata: Standard list metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
         """
@@ -139,7 +139,7 @@ class RayClusterList(pulumi.CustomResource):
                  resource_name: str,
                  opts: Optional[pulumi.ResourceOptions] = None,
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 items: pulumi.Input[Optional[Sequence[pulumi.Input[Union['RayClusterArgs', 'RayClusterArgsDict']]]]] = None,
+                 items: pulumi.Input[Optional[Sequence[pulumi.Input[Union['_inputs.RayClusterArgs', '_inputs.RayClusterArgsDict']]]]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ListMetaArgs', '_meta.v1.ListMetaArgsDict']]] = None,
                  __props__=None):
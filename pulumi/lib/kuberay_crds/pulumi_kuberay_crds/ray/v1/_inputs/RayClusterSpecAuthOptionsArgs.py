@@ -0,0 +1,65 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecAuthOptionsArgsDict', 'RayClusterSpecAuthOptionsArgs']
+
+class RayClusterSpecAuthOptionsArgsDict(TypedDict):
+    enable_k8s_token_auth: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    mode: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    secret_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterSpecAuthOptionsArgs:
+    def __init__(__self__, *,
+                 enable_k8s_token_auth: pulumi.Input[Optional[_builtins.bool]] = None,
+                 mode: pulumi.Input[Optional[_builtins.str]] = None,
+                 secret_name: pulumi.Input[Optional[_builtins.str]] = None):
+        if enable_k8s_token_auth is not None:
+            pulumi.set(__self__, "enable_k8s_token_auth", enable_k8s_token_auth)
+        if mode is not None:
+            pulumi.set(__self__, "mode", mode)
+        if secret_name is not None:
+            pulumi.set(__self__, "secret_name", secret_name)
+
+    @_builtins.property
+    @pulumi.getter(name="enableK8sTokenAuth")
+    def enable_k8s_token_auth(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "enable_k8s_token_auth")
+
+    @enable_k8s_token_auth.setter
+    def enable_k8s_token_auth(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "enable_k8s_token_auth", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def mode(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "mode")
+
+    @mode.setter
+    def mode(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "mode", value)
+
+    @_builtins.property
+    @pulumi.getter(name="secretName")
+    def secret_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "secret_name")
+
+    @secret_name.setter
+    def secret_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "secret_name", value)
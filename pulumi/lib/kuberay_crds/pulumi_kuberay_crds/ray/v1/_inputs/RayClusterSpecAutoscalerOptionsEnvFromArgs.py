@@ -0,0 +1,65 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecAutoscalerOptionsEnvFromArgsDict', 'RayClusterSpecAutoscalerOptionsEnvFromArgs']
+
+class RayClusterSpecAutoscalerOptionsEnvFromArgsDict(TypedDict):
+    config_map_ref: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefArgs']]]
+    prefix: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    secret_ref: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvFromSecretRefArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecAutoscalerOptionsEnvFromArgs:
+    def __init__(__self__, *,
+                 config_map_ref: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefArgs']] = None,
+                 prefix: pulumi.Input[Optional[_builtins.str]] = None,
+                 secret_ref: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvFromSecretRefArgs']] = None):
+        if config_map_ref is not None:
+            pulumi.set(__self__, "config_map_ref", config_map_ref)
+        if prefix is not None:
+            pulumi.set(__self__, "prefix", prefix)
+        if secret_ref is not None:
+            pulumi.set(__self__, "secret_ref", secret_ref)
+
+    @_builtins.property
+    @pulumi.getter(name="configMapRef")
+    def config_map_ref(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefArgs']]:
+        return pulumi.get(self, "config_map_ref")
+
+    @config_map_ref.setter
+    def config_map_ref(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefArgs']]):
+        pulumi.set(self, "config_map_ref", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def prefix(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "prefix")
+
+    @prefix.setter
+    def prefix(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "prefix", value)
+
+    @_builtins.property
+    @pulumi.getter(name="secretRef")
+    def secret_ref(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvFromSecretRefArgs']]:
+        return pulumi.get(self, "secret_ref")
+
+    @secret_ref.setter
+    def secret_ref(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvFromSecretRefArgs']]):
+        pulumi.set(self, "secret_ref", value)
@@ -0,0 +1,91 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecAutoscalerOptionsEnvValueFromPatchArgsDict', 'RayClusterSpecAutoscalerOptionsEnvValueFromPatchArgs']
+
+class RayClusterSpecAutoscalerOptionsEnvValueFromPatchArgsDict(TypedDict):
+    config_map_key_ref: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefPatchArgs']]]
+    field_ref: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefPatchArgs']]]
+    file_key_ref: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefPatchArgs']]]
+    resource_field_ref: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefPatchArgs']]]
+    secret_key_ref: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefPatchArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecAutoscalerOptionsEnvValueFromPatchArgs:
+    def __init__(__self__, *,
+                 config_map_key_ref: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefPatchArgs']] = None,
+                 field_ref: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefPatchArgs']] = None,
+                 file_key_ref: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefPatchArgs']] = None,
+                 resource_field_ref: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefPatchArgs']] = None,
+                 secret_key_ref: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefPatchArgs']] = None):
+        if config_map_key_ref is not None:
+            pulumi.set(__self__, "config_map_key_ref", config_map_key_ref)
+        if field_ref is not None:
+            pulumi.set(__self__, "field_ref", field_ref)
+        if file_key_ref is not None:
+            pulumi.set(__self__, "file_key_ref", file_key_ref)
+        if resource_field_ref is not None:
+            pulumi.set(__self__, "resource_field_ref", resource_field_ref)
+        if secret_key_ref is not None:
+            pulumi.set(__self__, "secret_key_ref", secret_key_ref)
+
+    @_builtins.property
+    @pulumi.getter(name="configMapKeyRef")
+    def config_map_key_ref(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefPatchArgs']]:
+        return pulumi.get(self, "config_map_key_ref")
+
+    @config_map_key_ref.setter
+    def config_map_key_ref(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefPatchArgs']]):
+        pulumi.set(self, "config_map_key_ref", value)
+
+    @_builtins.property
+    @pulumi.getter(name="fieldRef")
+    def field_ref(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefPatchArgs']]:
+        return pulumi.get(self, "field_ref")
+
+    @field_ref.setter
+    def field_ref(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefPatchArgs']]):
+        pulumi.set(self, "field_ref", value)
+
+    @_builtins.property
+    @pulumi.getter(name="fileKeyRef")
+    def file_key_ref(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefPatchArgs']]:
+        return pulumi.get(self, "file_key_ref")
+
+    @file_key_ref.setter
+    def file_key_ref(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefPatchArgs']]):
+        pulumi.set(self, "file_key_ref", value)
+
+    @_builtins.property
+    @pulumi.getter(name="resourceFieldRef")
+    def resource_field_ref(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefPatchArgs']]:
+        return pulumi.get(self, "resource_field_ref")
+
+    @resource_field_ref.setter
+    def resource_field_ref(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefPatchArgs']]):
+        pulumi.set(self, "resource_field_ref", value)
+
+    @_builtins.property
+    @pulumi.getter(name="secretKeyRef")
+    def secret_key_ref(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefPatchArgs']]:
+        return pulumi.get(self, "secret_key_ref")
+
+    @secret_key_ref.setter
+    def secret_key_ref(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefPatchArgs']]):
+        pulumi.set(self, "secret_key_ref", value)
@@ -0,0 +1,156 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecAutoscalerOptionsPatchArgsDict', 'RayClusterSpecAutoscalerOptionsPatchArgs']
+
+class RayClusterSpecAutoscalerOptionsPatchArgsDict(TypedDict):
+    env: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecAutoscalerOptionsEnvPatchArgs']]]]]
+    env_from: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecAutoscalerOptionsEnvFromPatchArgs']]]]]
+    idle_timeout_seconds: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    image: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    image_pull_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    resources: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsResourcesPatchArgs']]]
+    security_context: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextPatchArgs']]]
+    upscaling_mode: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    volume_mounts: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecAutoscalerOptionsVolumeMountsPatchArgs']]]]]
+
+
+@pulumi.input_type
+class RayClusterSpecAutoscalerOptionsPatchArgs:
+    def __init__(__self__, *,
+                 env: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecAutoscalerOptionsEnvPatchArgs']]]] = None,
+                 env_from: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecAutoscalerOptionsEnvFromPatchArgs']]]] = None,
+                 idle_timeout_seconds: pulumi.Input[Optional[_builtins.int]] = None,
+                 image: pulumi.Input[Optional[_builtins.str]] = None,
+                 image_pull_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 resources: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsResourcesPatchArgs']] = None,
+                 security_context: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextPatchArgs']] = None,
+                 upscaling_mode: pulumi.Input[Optional[_builtins.str]] = None,
+                 version: pulumi.Input[Optional[_builtins.str]] = None,
+                 volume_mounts: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecAutoscalerOptionsVolumeMountsPatchArgs']]]] = None):
+        if env is not None:
+            pulumi.set(__self__, "env", env)
+        if env_from is not None:
+            pulumi.set(__self__, "env_from", env_from)
+        if idle_timeout_seconds is not None:
+            pulumi.set(__self__, "idle_timeout_seconds", idle_timeout_seconds)
+        if image is not None:
+            pulumi.set(__self__, "image", image)
+        if image_pull_policy is not None:
+            pulumi.set(__self__, "image_pull_policy", image_pull_policy)
+        if resources is not None:
+            pulumi.set(__self__, "resources", resources)
+        if security_context is not None:
+            pulumi.set(__self__, "security_context", security_context)
+        if upscaling_mode is not None:
+            pulumi.set(__self__, "upscaling_mode", upscaling_mode)
+        if version is not None:
+            pulumi.set(__self__, "version", version)
+        if volume_mounts is not None:
+            pulumi.set(__self__, "volume_mounts", volume_mounts)
+
+    @_builtins.property
+    @pulumi.getter
+    def env(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecAutoscalerOptionsEnvPatchArgs']]]]:
+        return pulumi.get(self, "env")
+
+    @env.setter
+    def env(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecAutoscalerOptionsEnvPatchArgs']]]]):
+        pulumi.set(self, "env", value)
+
+    @_builtins.property
+    @pulumi.getter(name="envFrom")
+    def env_from(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecAutoscalerOptionsEnvFromPatchArgs']]]]:
+        return pulumi.get(self, "env_from")
+
+    @env_from.setter
+    def env_from(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecAutoscalerOptionsEnvFromPatchArgs']]]]):
+        pulumi.set(self, "env_from", value)
+
+    @_builtins.property
+    @pulumi.getter(name="idleTimeoutSeconds")
+    def idle_timeout_seconds(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "idle_timeout_seconds")
+
+    @idle_timeout_seconds.setter
+    def idle_timeout_seconds(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "idle_timeout_seconds", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def image(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "image")
+
+    @image.setter
+    def image(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "image", value)
+
+    @_builtins.property
+    @pulumi.getter(name="imagePullPolicy")
+    def image_pull_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "image_pull_policy")
+
+    @image_pull_policy.setter
+    def image_pull_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "image_pull_policy", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def resources(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsResourcesPatchArgs']]:
+        return pulumi.get(self, "resources")
+
+    @resources.setter
+    def resources(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsResourcesPatchArgs']]):
+        pulumi.set(self, "resources", value)
+
+    @_builtins.property
+    @pulumi.getter(name="securityContext")
+    def security_context(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextPatchArgs']]:
+        return pulumi.get(self, "security_context")
+
+    @security_context.setter
+    def security_context(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextPatchArgs']]):
+        pulumi.set(self, "security_context", value)
+
+    @_builtins.property
+    @pulumi.getter(name="upscalingMode")
+    def upscaling_mode(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "upscaling_mode")
+
+    @upscaling_mode.setter
+    def upscaling_mode(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "upscaling_mode", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def version(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "version")
+
+    @version.setter
+    def version(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "version", value)
+
+    @_builtins.property
+    @pulumi.getter(name="volumeMounts")
+    def volume_mounts(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecAutoscalerOptionsVolumeMountsPatchArgs']]]]:
+        return pulumi.get(self, "volume_mounts")
+
+    @volume_mounts.setter
+    def volume_mounts(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecAutoscalerOptionsVolumeMountsPatchArgs']]]]):
+        pulumi.set(self, "volume_mounts", value)
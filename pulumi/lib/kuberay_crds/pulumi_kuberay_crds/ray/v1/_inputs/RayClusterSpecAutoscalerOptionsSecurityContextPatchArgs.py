@@ -0,0 +1,182 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecAutoscalerOptionsSecurityContextPatchArgsDict', 'RayClusterSpecAutoscalerOptionsSecurityContextPatchArgs']
+
+class RayClusterSpecAutoscalerOptionsSecurityContextPatchArgsDict(TypedDict):
+    allow_privilege_escalation: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    app_armor_profile: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatchArgs']]]
+    capabilities: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatchArgs']]]
+    privileged: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    proc_mount: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    read_only_root_filesystem: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    run_as_group: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    run_as_non_root: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    run_as_user: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    se_linux_options: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatchArgs']]]
+    seccomp_profile: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatchArgs']]]
+    windows_options: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatchArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecAutoscalerOptionsSecurityContextPatchArgs:
+    def __init__(__self__, *,
+                 allow_privilege_escalation: pulumi.Input[Optional[_builtins.bool]] = None,
+                 app_armor_profile: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatchArgs']] = None,
+                 capabilities: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatchArgs']] = None,
+                 privileged: pulumi.Input[Optional[_builtins.bool]] = None,
+                 proc_mount: pulumi.Input[Optional[_builtins.str]] = None,
+                 read_only_root_filesystem: pulumi.Input[Optional[_builtins.bool]] = None,
+                 run_as_group: pulumi.Input[Optional[_builtins.int]] = None,
+                 run_as_non_root: pulumi.Input[Optional[_builtins.bool]] = None,
+                 run_as_user: pulumi.Input[Optional[_builtins.int]] = None,
+                 se_linux_options: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatchArgs']] = None,
+                 seccomp_profile: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatchArgs']] = None,
+                 windows_options: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatchArgs']] = None):
+        if allow_privilege_escalation is not None:
+            pulumi.set(__self__, "allow_privilege_escalation", allow_privilege_escalation)
+        if app_armor_profile is not None:
+            pulumi.set(__self__, "app_armor_profile", app_armor_profile)
+        if capabilities is not None:
+            pulumi.set(__self__, "capabilities", capabilities)
+        if privileged is not None:
+            pulumi.set(__self__, "privileged", privileged)
+        if proc_mount is not None:
+            pulumi.set(__self__, "proc_mount", proc_mount)
+        if read_only_root_filesystem is not None:
+            pulumi.set(__self__, "read_only_root_filesystem", read_only_root_filesystem)
+        if run_as_group is not None:
+            pulumi.set(__self__, "run_as_group", run_as_group)
+        if run_as_non_root is not None:
+            pulumi.set(__self__, "run_as_non_root", run_as_non_root)
+        if run_as_user is not None:
+            pulumi.set(__self__, "run_as_user", run_as_user)
+        if se_linux_options is not None:
+            pulumi.set(__self__, "se_linux_options", se_linux_options)
+        if seccomp_profile is not None:
+            pulumi.set(__self__, "seccomp_profile", seccomp_profile)
+        if windows_options is not None:
+            pulumi.set(__self__, "windows_options", windows_options)
+
+    @_builtins.property
+    @pulumi.getter(name="allowPrivilegeEscalation")
+    def allow_privilege_escalation(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "allow_privilege_escalation")
+
+    @allow_privilege_escalation.setter
+    def allow_privilege_escalation(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "allow_privilege_escalation", value)
+
+    @_builtins.property
+    @pulumi.getter(name="appArmorProfile")
+    def app_armor_profile(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatchArgs']]:
+        return pulumi.get(self, "app_armor_profile")
+
+    @app_armor_profile.setter
+    def app_armor_profile(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatchArgs']]):
+        pulumi.set(self, "app_armor_profile", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def capabilities(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatchArgs']]:
+        return pulumi.get(self, "capabilities")
+
+    @capabilities.setter
+    def capabilities(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatchArgs']]):
+        pulumi.set(self, "capabilities", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def privileged(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "privileged")
+
+    @privileged.setter
+    def privileged(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "privileged", value)
+
+    @_builtins.property
+    @pulumi.getter(name="procMount")
+    def proc_mount(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "proc_mount")
+
+    @proc_mount.setter
+    def proc_mount(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "proc_mount", value)
+
+    @_builtins.property
+    @pulumi.getter(name="readOnlyRootFilesystem")
+    def read_only_root_filesystem(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "read_only_root_filesystem")
+
+    @read_only_root_filesystem.setter
+    def read_only_root_filesystem(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "read_only_root_filesystem", value)
+
+    @_builtins.property
+    @pulumi.getter(name="runAsGroup")
+    def run_as_group(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "run_as_group")
+
+    @run_as_group.setter
+    def run_as_group(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "run_as_group", value)
+
+    @_builtins.property
+    @pulumi.getter(name="runAsNonRoot")
+    def run_as_non_root(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "run_as_non_root")
+
+    @run_as_non_root.setter
+    def run_as_non_root(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "run_as_non_root", value)
+
+    @_builtins.property
+    @pulumi.getter(name="runAsUser")
+    def run_as_user(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "run_as_user")
+
+    @run_as_user.setter
+    def run_as_user(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "run_as_user", value)
+
+    @_builtins.property
+    @pulumi.getter(name="seLinuxOptions")
+    def se_linux_options(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatchArgs']]:
+        return pulumi.get(self, "se_linux_options")
+
+    @se_linux_options.setter
+    def se_linux_options(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatchArgs']]):
+        pulumi.set(self, "se_linux_options", value)
+
+    @_builtins.property
+    @pulumi.getter(name="seccompProfile")
+    def seccomp_profile(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatchArgs']]:
+        return pulumi.get(self, "seccomp_profile")
+
+    @seccomp_profile.setter
+    def seccomp_profile(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatchArgs']]):
+        pulumi.set(self, "seccomp_profile", value)
+
+    @_builtins.property
+    @pulumi.getter(name="windowsOptions")
+    def windows_options(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatchArgs']]:
+        return pulumi.get(self, "windows_options")
+
+    @windows_options.setter
+    def windows_options(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatchArgs']]):
+        pulumi.set(self, "windows_options", value)
@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecGcsFaultToleranceOptionsArgsDict', 'RayClusterSpecGcsFaultToleranceOptionsArgs']
+
+class RayClusterSpecGcsFaultToleranceOptionsArgsDict(TypedDict):
+    external_storage_namespace: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    redis_address: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    redis_password: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordArgs']]]
+    redis_username: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisUsernameArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecGcsFaultToleranceOptionsArgs:
+    def __init__(__self__, *,
+                 external_storage_namespace: pulumi.Input[Optional[_builtins.str]] = None,
+                 redis_address: pulumi.Input[Optional[_builtins.str]] = None,
+                 redis_password: pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordArgs']] = None,
+                 redis_username: pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisUsernameArgs']] = None):
+        if external_storage_namespace is not None:
+            pulumi.set(__self__, "external_storage_namespace", external_storage_namespace)
+        if redis_address is not None:
+            pulumi.set(__self__, "redis_address", redis_address)
+        if redis_password is not None:
+            pulumi.set(__self__, "redis_password", redis_password)
+        if redis_username is not None:
+            pulumi.set(__self__, "redis_username", redis_username)
+
+    @_builtins.property
+    @pulumi.getter(name="externalStorageNamespace")
+    def external_storage_namespace(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "external_storage_namespace")
+
+    @external_storage_namespace.setter
+    def external_storage_namespace(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "external_storage_namespace", value)
+
+    @_builtins.property
+    @pulumi.getter(name="redisAddress")
+    def redis_address(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "redis_address")
+
+    @redis_address.setter
+    def redis_address(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "redis_address", value)
+
+    @_builtins.property
+    @pulumi.getter(name="redisPassword")
+    def redis_password(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordArgs']]:
+        return pulumi.get(self, "redis_password")
+
+    @redis_password.setter
+    def redis_password(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordArgs']]):
+        pulumi.set(self, "redis_password", value)
+
+    @_builtins.property
+    @pulumi.getter(name="redisUsername")
+    def redis_username(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisUsernameArgs']]:
+        return pulumi.get(self, "redis_username")
+
+    @redis_username.setter
+    def redis_username(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisUsernameArgs']]):
+        pulumi.set(self, "redis_username", value)
@@ -0,0 +1,91 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromArgsDict', 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromArgs']
+
+class RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromArgsDict(TypedDict):
+    config_map_key_ref: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefArgs']]]
+    field_ref: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefArgs']]]
+    file_key_ref: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefArgs']]]
+    resource_field_ref: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefArgs']]]
+    secret_key_ref: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromArgs:
+    def __init__(__self__, *,
+                 config_map_key_ref: pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefArgs']] = None,
+                 field_ref: pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefArgs']] = None,
+                 file_key_ref: pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefArgs']] = None,
+                 resource_field_ref: pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefArgs']] = None,
+                 secret_key_ref: pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefArgs']] = None):
+        if config_map_key_ref is not None:
+            pulumi.set(__self__, "config_map_key_ref", config_map_key_ref)
+        if field_ref is not None:
+            pulumi.set(__self__, "field_ref", field_ref)
+        if file_key_ref is not None:
+            pulumi.set(__self__, "file_key_ref", file_key_ref)
+        if resource_field_ref is not None:
+            pulumi.set(__self__, "resource_field_ref", resource_field_ref)
+        if secret_key_ref is not None:
+            pulumi.set(__self__, "secret_key_ref", secret_key_ref)
+
+    @_builtins.property
+    @pulumi.getter(name="configMapKeyRef")
+    def config_map_key_ref(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefArgs']]:
+        return pulumi.get(self, "config_map_key_ref")
+
+    @config_map_key_ref.setter
+    def config_map_key_ref(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefArgs']]):
+        pulumi.set(self, "config_map_key_ref", value)
+
+    @_builtins.property
+    @pulumi.getter(name="fieldRef")
+    def field_ref(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefArgs']]:
+        return pulumi.get(self, "field_ref")
+
+    @field_ref.setter
+    def field_ref(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefArgs']]):
+        pulumi.set(self, "field_ref", value)
+
+    @_builtins.property
+    @pulumi.getter(name="fileKeyRef")
+    def file_key_ref(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefArgs']]:
+        return pulumi.get(self, "file_key_ref")
+
+    @file_key_ref.setter
+    def file_key_ref(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefArgs']]):
+        pulumi.set(self, "file_key_ref", value)
+
+    @_builtins.property
+    @pulumi.getter(name="resourceFieldRef")
+    def resource_field_ref(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefArgs']]:
+        return pulumi.get(self, "resource_field_ref")
+
+    @resource_field_ref.setter
+    def resource_field_ref(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefArgs']]):
+        pulumi.set(self, "resource_field_ref", value)
+
+    @_builtins.property
+    @pulumi.getter(name="secretKeyRef")
+    def secret_key_ref(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefArgs']]:
+        return pulumi.get(self, "secret_key_ref")
+
+    @secret_key_ref.setter
+    def secret_key_ref(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefArgs']]):
+        pulumi.set(self, "secret_key_ref", value)
@@ -0,0 +1,65 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefPatchArgsDict', 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefPatchArgs']
+
+class RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefPatchArgsDict(TypedDict):
+    container_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    divisor: NotRequired[pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]]
+    resource: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefPatchArgs:
+    def __init__(__self__, *,
+                 container_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 divisor: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]] = None,
+                 resource: pulumi.Input[Optional[_builtins.str]] = None):
+        if container_name is not None:
+            pulumi.set(__self__, "container_name", container_name)
+        if divisor is not None:
+            pulumi.set(__self__, "divisor", divisor)
+        if resource is not None:
+            pulumi.set(__self__, "resource", resource)
+
+    @_builtins.property
+    @pulumi.getter(name="containerName")
+    def container_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "container_name")
+
+    @container_name.setter
+    def container_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "container_name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def divisor(self) -> pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]:
+        return pulumi.get(self, "divisor")
+
+    @divisor.setter
+    def divisor(self, value: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]):
+        pulumi.set(self, "divisor", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def resource(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "resource")
+
+    @resource.setter
+    def resource(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "resource", value)
@@ -0,0 +1,91 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecHeadServiceArgsDict', 'RayClusterSpecHeadGroupSpecHeadServiceArgs']
+
+class RayClusterSpecHeadGroupSpecHeadServiceArgsDict(TypedDict):
+    api_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    kind: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    metadata: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServiceMetadataArgs']]]
+    spec: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServiceSpecArgs']]]
+    status: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServiceStatusArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecHeadServiceArgs:
+    def __init__(__self__, *,
+                 api_version: pulumi.Input[Optional[_builtins.str]] = None,
+                 kind: pulumi.Input[Optional[_builtins.str]] = None,
+                 metadata: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServiceMetadataArgs']] = None,
+                 spec: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServiceSpecArgs']] = None,
+                 status: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServiceStatusArgs']] = None):
+        if api_version is not None:
+            pulumi.set(__self__, "api_version", api_version)
+        if kind is not None:
+            pulumi.set(__self__, "kind", kind)
+        if metadata is not None:
+            pulumi.set(__self__, "metadata", metadata)
+        if spec is not None:
+            pulumi.set(__self__, "spec", spec)
+        if status is not None:
+            pulumi.set(__self__, "status", status)
+
+    @_builtins.property
+    @pulumi.getter(name="apiVersion")
+    def api_version(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "api_version")
+
+    @api_version.setter
+    def api_version(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "api_version", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def kind(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "kind")
+
+    @kind.setter
+    def kind(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "kind", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def metadata(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServiceMetadataArgs']]:
+        return pulumi.get(self, "metadata")
+
+    @metadata.setter
+    def metadata(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServiceMetadataArgs']]):
+        pulumi.set(self, "metadata", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def spec(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServiceSpecArgs']]:
+        return pulumi.get(self, "spec")
+
+    @spec.setter
+    def spec(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServiceSpecArgs']]):
+        pulumi.set(self, "spec", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def status(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServiceStatusArgs']]:
+        return pulumi.get(self, "status")
+
+    @status.setter
+    def status(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServiceStatusArgs']]):
+        pulumi.set(self, "status", value)
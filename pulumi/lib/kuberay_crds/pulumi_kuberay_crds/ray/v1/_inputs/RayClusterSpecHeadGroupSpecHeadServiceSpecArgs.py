@@ -0,0 +1,286 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecHeadServiceSpecArgsDict', 'RayClusterSpecHeadGroupSpecHeadServiceSpecArgs']
+
+class RayClusterSpecHeadGroupSpecHeadServiceSpecArgsDict(TypedDict):
+    allocate_load_balancer_node_ports: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    cluster_ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    cluster_ips: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    external_ips: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    external_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    external_traffic_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    health_check_node_port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    internal_traffic_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    ip_families: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    ip_family_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    load_balancer_class: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    load_balancer_ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    load_balancer_source_ranges: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    ports: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecHeadServiceSpecPortsArgs']]]]]
+    publish_not_ready_addresses: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    selector: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+    session_affinity: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    session_affinity_config: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigArgs']]]
+    traffic_distribution: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecHeadServiceSpecArgs:
+    def __init__(__self__, *,
+                 allocate_load_balancer_node_ports: pulumi.Input[Optional[_builtins.bool]] = None,
+                 cluster_ip: pulumi.Input[Optional[_builtins.str]] = None,
+                 cluster_ips: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 external_ips: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 external_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 external_traffic_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 health_check_node_port: pulumi.Input[Optional[_builtins.int]] = None,
+                 internal_traffic_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 ip_families: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 ip_family_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 load_balancer_class: pulumi.Input[Optional[_builtins.str]] = None,
+                 load_balancer_ip: pulumi.Input[Optional[_builtins.str]] = None,
+                 load_balancer_source_ranges: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 ports: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecHeadServiceSpecPortsArgs']]]] = None,
+                 publish_not_ready_addresses: pulumi.Input[Optional[_builtins.bool]] = None,
+                 selector: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
+                 session_affinity: pulumi.Input[Optional[_builtins.str]] = None,
+                 session_affinity_config: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigArgs']] = None,
+                 traffic_distribution: pulumi.Input[Optional[_builtins.str]] = None,
+                 type: pulumi.Input[Optional[_builtins.str]] = None):
+        if allocate_load_balancer_node_ports is not None:
+            pulumi.set(__self__, "allocate_load_balancer_node_ports", allocate_load_balancer_node_ports)
+        if cluster_ip is not None:
+            pulumi.set(__self__, "cluster_ip", cluster_ip)
+        if cluster_ips is not None:
+            pulumi.set(__self__, "cluster_ips", cluster_ips)
+        if external_ips is not None:
+            pulumi.set(__self__, "external_ips", external_ips)
+        if external_name is not None:
+            pulumi.set(__self__, "external_name", external_name)
+        if external_traffic_policy is not None:
+            pulumi.set(__self__, "external_traffic_policy", external_traffic_policy)
+        if health_check_node_port is not None:
+            pulumi.set(__self__, "health_check_node_port", health_check_node_port)
+        if internal_traffic_policy is not None:
+            pulumi.set(__self__, "internal_traffic_policy", internal_traffic_policy)
+        if ip_families is not None:
+            pulumi.set(__self__, "ip_families", ip_families)
+        if ip_family_policy is not None:
+            pulumi.set(__self__, "ip_family_policy", ip_family_policy)
+        if load_balancer_class is not None:
+            pulumi.set(__self__, "load_balancer_class", load_balancer_class)
+        if load_balancer_ip is not None:
+            pulumi.set(__self__, "load_balancer_ip", load_balancer_ip)
+        if load_balancer_source_ranges is not None:
+            pulumi.set(__self__, "load_balancer_source_ranges", load_balancer_source_ranges)
+        if ports is not None:
+            pulumi.set(__self__, "ports", ports)
+        if publish_not_ready_addresses is not None:
+            pulumi.set(__self__, "publish_not_ready_addresses", publish_not_ready_addresses)
+        if selector is not None:
+            pulumi.set(__self__, "selector", selector)
+        if session_affinity is not None:
+            pulumi.set(__self__, "session_affinity", session_affinity)
+        if session_affinity_config is not None:
+            pulumi.set(__self__, "session_affinity_config", session_affinity_config)
+        if traffic_distribution is not None:
+            pulumi.set(__self__, "traffic_distribution", traffic_distribution)
+        if type is not None:
+            pulumi.set(__self__, "type", type)
+
+    @_builtins.property
+    @pulumi.getter(name="allocateLoadBalancerNodePorts")
+    def allocate_load_balancer_node_ports(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "allocate_load_balancer_node_ports")
+
+    @allocate_load_balancer_node_ports.setter
+    def allocate_load_balancer_node_ports(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "allocate_load_balancer_node_ports", value)
+
+    @_builtins.property
+    @pulumi.getter(name="clusterIP")
+    def cluster_ip(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "cluster_ip")
+
+    @cluster_ip.setter
+    def cluster_ip(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "cluster_ip", value)
+
+    @_builtins.property
+    @pulumi.getter(name="clusterIPs")
+    def cluster_ips(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "cluster_ips")
+
+    @cluster_ips.setter
+    def cluster_ips(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "cluster_ips", value)
+
+    @_builtins.property
+    @pulumi.getter(name="externalIPs")
+    def external_ips(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "external_ips")
+
+    @external_ips.setter
+    def external_ips(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "external_ips", value)
+
+    @_builtins.property
+    @pulumi.getter(name="externalName")
+    def external_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "external_name")
+
+    @external_name.setter
+    def external_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "external_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="externalTrafficPolicy")
+    def external_traffic_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "external_traffic_policy")
+
+    @external_traffic_policy.setter
+    def external_traffic_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "external_traffic_policy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="healthCheckNodePort")
+    def health_check_node_port(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "health_check_node_port")
+
+    @health_check_node_port.setter
+    def health_check_node_port(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "health_check_node_port", value)
+
+    @_builtins.property
+    @pulumi.getter(name="internalTrafficPolicy")
+    def internal_traffic_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "internal_traffic_policy")
+
+    @internal_traffic_policy.setter
+    def internal_traffic_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "internal_traffic_policy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="ipFamilies")
+    def ip_families(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "ip_families")
+
+    @ip_families.setter
+    def ip_families(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "ip_families", value)
+
+    @_builtins.property
+    @pulumi.getter(name="ipFamilyPolicy")
+    def ip_family_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "ip_family_policy")
+
+    @ip_family_policy.setter
+    def ip_family_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "ip_family_policy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="loadBalancerClass")
+    def load_balancer_class(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "load_balancer_class")
+
+    @load_balancer_class.setter
+    def load_balancer_class(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "load_balancer_class", value)
+
+    @_builtins.property
+    @pulumi.getter(name="loadBalancerIP")
+    def load_balancer_ip(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "load_balancer_ip")
+
+    @load_balancer_ip.setter
+    def load_balancer_ip(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "load_balancer_ip", value)
+
+    @_builtins.property
+    @pulumi.getter(name="loadBalancerSourceRanges")
+    def load_balancer_source_ranges(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "load_balancer_source_ranges")
+
+    @load_balancer_source_ranges.setter
+    def load_balancer_source_ranges(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "load_balancer_source_ranges", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def ports(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecHeadServiceSpecPortsArgs']]]]:
+        return pulumi.get(self, "ports")
+
+    @ports.setter
+    def ports(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecHeadServiceSpecPortsArgs']]]]):
+        pulumi.set(self, "ports", value)
+
+    @_builtins.property
+    @pulumi.getter(name="publishNotReadyAddresses")
+    def publish_not_ready_addresses(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "publish_not_ready_addresses")
+
+    @publish_not_ready_addresses.setter
+    def publish_not_ready_addresses(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "publish_not_ready_addresses", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def selector(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "selector")
+
+    @selector.setter
+    def selector(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "selector", value)
+
+    @_builtins.property
+    @pulumi.getter(name="sessionAffinity")
+    def session_affinity(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "session_affinity")
+
+    @session_affinity.setter
+    def session_affinity(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "session_affinity", value)
+
+    @_builtins.property
+    @pulumi.getter(name="sessionAffinityConfig")
+    def session_affinity_config(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigArgs']]:
+        return pulumi.get(self, "session_affinity_config")
+
+    @session_affinity_config.setter
+    def session_affinity_config(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigArgs']]):
+        pulumi.set(self, "session_affinity_config", value)
+
+    @_builtins.property
+    @pulumi.getter(name="trafficDistribution")
+    def traffic_distribution(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "traffic_distribution")
+
+    @traffic_distribution.setter
+    def traffic_distribution(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "traffic_distribution", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "type")
+
+    @type.setter
+    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "type", value)
@@ -0,0 +1,39 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerPatchArgsDict', 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerPatchArgs']
+
+class RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerPatchArgsDict(TypedDict):
+    ingress: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatchArgs']]]]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerPatchArgs:
+    def __init__(__self__, *,
+                 ingress: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatchArgs']]]] = None):
+        if ingress is not None:
+            pulumi.set(__self__, "ingress", ingress)
+
+    @_builtins.property
+    @pulumi.getter
+    def ingress(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatchArgs']]]]:
+        return pulumi.get(self, "ingress")
+
+    @ingress.setter
+    def ingress(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatchArgs']]]]):
+        pulumi.set(self, "ingress", value)
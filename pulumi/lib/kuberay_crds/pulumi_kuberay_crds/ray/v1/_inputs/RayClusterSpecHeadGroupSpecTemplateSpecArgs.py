@@ -0,0 +1,572 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecArgsDict(TypedDict):
+    active_deadline_seconds: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    affinity: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecAffinityArgs']]]
+    automount_service_account_token: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    containers: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersArgs']]]]]
+    dns_config: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigArgs']]]
+    dns_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    enable_service_links: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    ephemeral_containers: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersArgs']]]]]
+    host_aliases: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesArgs']]]]]
+    host_ipc: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    host_network: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    host_pid: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    host_users: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    hostname: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    hostname_override: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    image_pull_secrets: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsArgs']]]]]
+    init_containers: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecInitContainersArgs']]]]]
+    node_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    node_selector: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+    os: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecOsArgs']]]
+    overhead: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]]
+    preemption_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    priority: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    priority_class_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    readiness_gates: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesArgs']]]]]
+    resource_claims: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsArgs']]]]]
+    resources: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecResourcesArgs']]]
+    restart_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    runtime_class_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    scheduler_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    scheduling_gates: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesArgs']]]]]
+    security_context: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextArgs']]]
+    service_account: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    service_account_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    set_hostname_as_fqdn: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    share_process_namespace: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    subdomain: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    termination_grace_period_seconds: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    tolerations: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecTolerationsArgs']]]]]
+    topology_spread_constraints: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsArgs']]]]]
+    volumes: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesArgs']]]]]
+    workload_ref: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecArgs:
+    def __init__(__self__, *,
+                 active_deadline_seconds: pulumi.Input[Optional[_builtins.int]] = None,
+                 affinity: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecAffinityArgs']] = None,
+                 automount_service_account_token: pulumi.Input[Optional[_builtins.bool]] = None,
+                 containers: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersArgs']]]] = None,
+                 dns_config: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigArgs']] = None,
+                 dns_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 enable_service_links: pulumi.Input[Optional[_builtins.bool]] = None,
+                 ephemeral_containers: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersArgs']]]] = None,
+                 host_aliases: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesArgs']]]] = None,
+                 host_ipc: pulumi.Input[Optional[_builtins.bool]] = None,
+                 host_network: pulumi.Input[Optional[_builtins.bool]] = None,
+                 host_pid: pulumi.Input[Optional[_builtins.bool]] = None,
+                 host_users: pulumi.Input[Optional[_builtins.bool]] = None,
+                 hostname: pulumi.Input[Optional[_builtins.str]] = None,
+                 hostname_override: pulumi.Input[Optional[_builtins.str]] = None,
+                 image_pull_secrets: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsArgs']]]] = None,
+                 init_containers: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecInitContainersArgs']]]] = None,
+                 node_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 node_selector: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
+                 os: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecOsArgs']] = None,
+                 overhead: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]] = None,
+                 preemption_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 priority: pulumi.Input[Optional[_builtins.int]] = None,
+                 priority_class_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 readiness_gates: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesArgs']]]] = None,
+                 resource_claims: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsArgs']]]] = None,
+                 resources: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecResourcesArgs']] = None,
+                 restart_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 runtime_class_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 scheduler_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 scheduling_gates: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesArgs']]]] = None,
+                 security_context: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextArgs']] = None,
+                 service_account: pulumi.Input[Optional[_builtins.str]] = None,
+                 service_account_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 set_hostname_as_fqdn: pulumi.Input[Optional[_builtins.bool]] = None,
+                 share_process_namespace: pulumi.Input[Optional[_builtins.bool]] = None,
+                 subdomain: pulumi.Input[Optional[_builtins.str]] = None,
+                 termination_grace_period_seconds: pulumi.Input[Optional[_builtins.int]] = None,
+                 tolerations: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecTolerationsArgs']]]] = None,
+                 topology_spread_constraints: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsArgs']]]] = None,
+                 volumes: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesArgs']]]] = None,
+                 workload_ref: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefArgs']] = None):
+        if active_deadline_seconds is not None:
+            pulumi.set(__self__, "active_deadline_seconds", active_deadline_seconds)
+        if affinity is not None:
+            pulumi.set(__self__, "affinity", affinity)
+        if automount_service_account_token is not None:
+            pulumi.set(__self__, "automount_service_account_token", automount_service_account_token)
+        if containers is not None:
+            pulumi.set(__self__, "containers", containers)
+        if dns_config is not None:
+            pulumi.set(__self__, "dns_config", dns_config)
+        if dns_policy is not None:
+            pulumi.set(__self__, "dns_policy", dns_policy)
+        if enable_service_links is not None:
+            pulumi.set(__self__, "enable_service_links", enable_service_links)
+        if ephemeral_containers is not None:
+            pulumi.set(__self__, "ephemeral_containers", ephemeral_containers)
+        if host_aliases is not None:
+            pulumi.set(__self__, "host_aliases", host_aliases)
+        if host_ipc is not None:
+            pulumi.set(__self__, "host_ipc", host_ipc)
+        if host_network is not None:
+            pulumi.set(__self__, "host_network", host_network)
+        if host_pid is not None:
+            pulumi.set(__self__, "host_pid", host_pid)
+        if host_users is not None:
+            pulumi.set(__self__, "host_users", host_users)
+        if hostname is not None:
+            pulumi.set(__self__, "hostname", hostname)
+        if hostname_override is not None:
+            pulumi.set(__self__, "hostname_override", hostname_override)
+        if image_pull_secrets is not None:
+            pulumi.set(__self__, "image_pull_secrets", image_pull_secrets)
+        if init_containers is not None:
+            pulumi.set(__self__, "init_containers", init_containers)
+        if node_name is not None:
+            pulumi.set(__self__, "node_name", node_name)
+        if node_selector is not None:
+            pulumi.set(__self__, "node_selector", node_selector)
+        if os is not None:
+            pulumi.set(__self__, "os", os)
+        if overhead is not None:
+            pulumi.set(__self__, "overhead", overhead)
+        if preemption_policy is not None:
+            pulumi.set(__self__, "preemption_policy", preemption_policy)
+        if priority is not None:
+            pulumi.set(__self__, "priority", priority)
+        if priority_class_name is not None:
+            pulumi.set(__self__, "priority_class_name", priority_class_name)
+        if readiness_gates is not None:
+            pulumi.set(__self__, "readiness_gates", readiness_gates)
+        if resource_claims is not None:
+            pulumi.set(__self__, "resource_claims", resource_claims)
+        if resources is not None:
+            pulumi.set(__self__, "resources", resources)
+        if restart_policy is not None:
+            pulumi.set(__self__, "restart_policy", restart_policy)
+        if runtime_class_name is not None:
+            pulumi.set(__self__, "runtime_class_name", runtime_class_name)
+        if scheduler_name is not None:
+            pulumi.set(__self__, "scheduler_name", scheduler_name)
+        if scheduling_gates is not None:
+            pulumi.set(__self__, "scheduling_gates", scheduling_gates)
+        if security_context is not None:
+            pulumi.set(__self__, "security_context", security_context)
+        if service_account is not None:
+            pulumi.set(__self__, "service_account", service_account)
+        if service_account_name is not None:
+            pulumi.set(__self__, "service_account_name", service_account_name)
+        if set_hostname_as_fqdn is not None:
+            pulumi.set(__self__, "set_hostname_as_fqdn", set_hostname_as_fqdn)
+        if share_process_namespace is not None:
+            pulumi.set(__self__, "share_process_namespace", share_process_namespace)
+        if subdomain is not None:
+            pulumi.set(__self__, "subdomain", subdomain)
+        if termination_grace_period_seconds is not None:
+            pulumi.set(__self__, "termination_grace_period_seconds", termination_grace_period_seconds)
+        if tolerations is not None:
+            pulumi.set(__self__, "tolerations", tolerations)
+        if topology_spread_constraints is not None:
+            pulumi.set(__self__, "topology_spread_constraints", topology_spread_constraints)
+        if volumes is not None:
+            pulumi.set(__self__, "volumes", volumes)
+        if workload_ref is not None:
+            pulumi.set(__self__, "workload_ref", workload_ref)
+
+    @_builtins.property
+    @pulumi.getter(name="activeDeadlineSeconds")
+    def active_deadline_seconds(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "active_deadline_seconds")
+
+    @active_deadline_seconds.setter
+    def active_deadline_seconds(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "active_deadline_seconds", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def affinity(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecAffinityArgs']]:
+        return pulumi.get(self, "affinity")
+
+    @affinity.setter
+    def affinity(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecAffinityArgs']]):
+        pulumi.set(self, "affinity", value)
+
+    @_builtins.property
+    @pulumi.getter(name="automountServiceAccountToken")
+    def automount_service_account_token(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "automount_service_account_token")
+
+    @automount_service_account_token.setter
+    def automount_service_account_token(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "automount_service_account_token", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def containers(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersArgs']]]]:
+        return pulumi.get(self, "containers")
+
+    @containers.setter
+    def containers(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersArgs']]]]):
+        pulumi.set(self, "containers", value)
+
+    @_builtins.property
+    @pulumi.getter(name="dnsConfig")
+    def dns_config(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigArgs']]:
+        return pulumi.get(self, "dns_config")
+
+    @dns_config.setter
+    def dns_config(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigArgs']]):
+        pulumi.set(self, "dns_config", value)
+
+    @_builtins.property
+    @pulumi.getter(name="dnsPolicy")
+    def dns_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "dns_policy")
+
+    @dns_policy.setter
+    def dns_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "dns_policy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="enableServiceLinks")
+    def enable_service_links(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "enable_service_links")
+
+    @enable_service_links.setter
+    def enable_service_links(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "enable_service_links", value)
+
+    @_builtins.property
+    @pulumi.getter(name="ephemeralContainers")
+    def ephemeral_containers(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersArgs']]]]:
+        return pulumi.get(self, "ephemeral_containers")
+
+    @ephemeral_containers.setter
+    def ephemeral_containers(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersArgs']]]]):
+        pulumi.set(self, "ephemeral_containers", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostAliases")
+    def host_aliases(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesArgs']]]]:
+        return pulumi.get(self, "host_aliases")
+
+    @host_aliases.setter
+    def host_aliases(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesArgs']]]]):
+        pulumi.set(self, "host_aliases", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostIPC")
+    def host_ipc(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "host_ipc")
+
+    @host_ipc.setter
+    def host_ipc(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "host_ipc", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostNetwork")
+    def host_network(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "host_network")
+
+    @host_network.setter
+    def host_network(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "host_network", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostPID")
+    def host_pid(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "host_pid")
+
+    @host_pid.setter
+    def host_pid(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "host_pid", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostUsers")
+    def host_users(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "host_users")
+
+    @host_users.setter
+    def host_users(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "host_users", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def hostname(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "hostname")
+
+    @hostname.setter
+    def hostname(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "hostname", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostnameOverride")
+    def hostname_override(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "hostname_override")
+
+    @hostname_override.setter
+    def hostname_override(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "hostname_override", value)
+
+    @_builtins.property
+    @pulumi.getter(name="imagePullSecrets")
+    def image_pull_secrets(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsArgs']]]]:
+        return pulumi.get(self, "image_pull_secrets")
+
+    @image_pull_secrets.setter
+    def image_pull_secrets(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsArgs']]]]):
+        pulumi.set(self, "image_pull_secrets", value)
+
+    @_builtins.property
+    @pulumi.getter(name="initContainers")
+    def init_containers(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecInitContainersArgs']]]]:
+        return pulumi.get(self, "init_containers")
+
+    @init_containers.setter
+    def init_containers(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecInitContainersArgs']]]]):
+        pulumi.set(self, "init_containers", value)
+
+    @_builtins.property
+    @pulumi.getter(name="nodeName")
+    def node_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "node_name")
+
+    @node_name.setter
+    def node_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "node_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="nodeSelector")
+    def node_selector(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "node_selector")
+
+    @node_selector.setter
+    def node_selector(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "node_selector", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def os(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecOsArgs']]:
+        return pulumi.get(self, "os")
+
+    @os.setter
+    def os(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecOsArgs']]):
+        pulumi.set(self, "os", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def overhead(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]:
+        return pulumi.get(self, "overhead")
+
+    @overhead.setter
+    def overhead(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]):
+        pulumi.set(self, "overhead", value)
+
+    @_builtins.property
+    @pulumi.getter(name="preemptionPolicy")
+    def preemption_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "preemption_policy")
+
+    @preemption_policy.setter
+    def preemption_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "preemption_policy", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def priority(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "priority")
+
+    @priority.setter
+    def priority(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "priority", value)
+
+    @_builtins.property
+    @pulumi.getter(name="priorityClassName")
+    def priority_class_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "priority_class_name")
+
+    @priority_class_name.setter
+    def priority_class_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "priority_class_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="readinessGates")
+    def readiness_gates(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesArgs']]]]:
+        return pulumi.get(self, "readiness_gates")
+
+    @readiness_gates.setter
+    def readiness_gates(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesArgs']]]]):
+        pulumi.set(self, "readiness_gates", value)
+
+    @_builtins.property
+    @pulumi.getter(name="resourceClaims")
+    def resource_claims(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsArgs']]]]:
+        return pulumi.get(self, "resource_claims")
+
+    @resource_claims.setter
+    def resource_claims(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsArgs']]]]):
+        pulumi.set(self, "resource_claims", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def resources(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecResourcesArgs']]:
+        return pulumi.get(self, "resources")
+
+    @resources.setter
+    def resources(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecResourcesArgs']]):
+        pulumi.set(self, "resources", value)
+
+    @_builtins.property
+    @pulumi.getter(name="restartPolicy")
+    def restart_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "restart_policy")
+
+    @restart_policy.setter
+    def restart_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "restart_policy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="runtimeClassName")
+    def runtime_class_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "runtime_class_name")
+
+    @runtime_class_name.setter
+    def runtime_class_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "runtime_class_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="schedulerName")
+    def scheduler_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "scheduler_name")
+
+    @scheduler_name.setter
+    def scheduler_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "scheduler_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="schedulingGates")
+    def scheduling_gates(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesArgs']]]]:
+        return pulumi.get(self, "scheduling_gates")
+
+    @scheduling_gates.setter
+    def scheduling_gates(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesArgs']]]]):
+        pulumi.set(self, "scheduling_gates", value)
+
+    @_builtins.property
+    @pulumi.getter(name="securityContext")
+    def security_context(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextArgs']]:
+        return pulumi.get(self, "security_context")
+
+    @security_context.setter
+    def security_context(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextArgs']]):
+        pulumi.set(self, "security_context", value)
+
+    @_builtins.property
+    @pulumi.getter(name="serviceAccount")
+    def service_account(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "service_account")
+
+    @service_account.setter
+    def service_account(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "service_account", value)
+
+    @_builtins.property
+    @pulumi.getter(name="serviceAccountName")
+    def service_account_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "service_account_name")
+
+    @service_account_name.setter
+    def service_account_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "service_account_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="setHostnameAsFQDN")
+    def set_hostname_as_fqdn(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "set_hostname_as_fqdn")
+
+    @set_hostname_as_fqdn.setter
+    def set_hostname_as_fqdn(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "set_hostname_as_fqdn", value)
+
+    @_builtins.property
+    @pulumi.getter(name="shareProcessNamespace")
+    def share_process_namespace(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "share_process_namespace")
+
+    @share_process_namespace.setter
+    def share_process_namespace(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "share_process_namespace", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def subdomain(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "subdomain")
+
+    @subdomain.setter
+    def subdomain(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "subdomain", value)
+
+    @_builtins.property
+    @pulumi.getter(name="terminationGracePeriodSeconds")
+    def termination_grace_period_seconds(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "termination_grace_period_seconds")
+
+    @termination_grace_period_seconds.setter
+    def termination_grace_period_seconds(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "termination_grace_period_seconds", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def tolerations(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecTolerationsArgs']]]]:
+        return pulumi.get(self, "tolerations")
+
+    @tolerations.setter
+    def tolerations(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecTolerationsArgs']]]]):
+        pulumi.set(self, "tolerations", value)
+
+    @_builtins.property
+    @pulumi.getter(name="topologySpreadConstraints")
+    def topology_spread_constraints(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsArgs']]]]:
+        return pulumi.get(self, "topology_spread_constraints")
+
+    @topology_spread_constraints.setter
+    def topology_spread_constraints(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsArgs']]]]):
+        pulumi.set(self, "topology_spread_constraints", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def volumes(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesArgs']]]]:
+        return pulumi.get(self, "volumes")
+
+    @volumes.setter
+    def volumes(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesArgs']]]]):
+        pulumi.set(self, "volumes", value)
+
+    @_builtins.property
+    @pulumi.getter(name="workloadRef")
+    def workload_ref(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefArgs']]:
+        return pulumi.get(self, "workload_ref")
+
+    @workload_ref.setter
+    def workload_ref(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefArgs']]):
+        pulumi.set(self, "workload_ref", value)
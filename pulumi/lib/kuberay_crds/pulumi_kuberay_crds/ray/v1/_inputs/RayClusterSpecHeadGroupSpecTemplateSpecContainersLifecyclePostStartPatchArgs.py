@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartPatchArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartPatchArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartPatchArgsDict(TypedDict):
+    exec_: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecPatchArgs']]]
+    http_get: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetPatchArgs']]]
+    sleep: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepPatchArgs']]]
+    tcp_socket: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartPatchArgs:
+    def __init__(__self__, *,
+                 exec_: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecPatchArgs']] = None,
+                 http_get: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetPatchArgs']] = None,
+                 sleep: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepPatchArgs']] = None,
+                 tcp_socket: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgs']] = None):
+        if exec_ is not None:
+            pulumi.set(__self__, "exec_", exec_)
+        if http_get is not None:
+            pulumi.set(__self__, "http_get", http_get)
+        if sleep is not None:
+            pulumi.set(__self__, "sleep", sleep)
+        if tcp_socket is not None:
+            pulumi.set(__self__, "tcp_socket", tcp_socket)
+
+    @_builtins.property
+    @pulumi.getter(name="exec")
+    def exec_(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecPatchArgs']]:
+        return pulumi.get(self, "exec_")
+
+    @exec_.setter
+    def exec_(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecPatchArgs']]):
+        pulumi.set(self, "exec_", value)
+
+    @_builtins.property
+    @pulumi.getter(name="httpGet")
+    def http_get(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetPatchArgs']]:
+        return pulumi.get(self, "http_get")
+
+    @http_get.setter
+    def http_get(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetPatchArgs']]):
+        pulumi.set(self, "http_get", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def sleep(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepPatchArgs']]:
+        return pulumi.get(self, "sleep")
+
+    @sleep.setter
+    def sleep(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepPatchArgs']]):
+        pulumi.set(self, "sleep", value)
+
+    @_builtins.property
+    @pulumi.getter(name="tcpSocket")
+    def tcp_socket(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgs']]:
+        return pulumi.get(self, "tcp_socket")
+
+    @tcp_socket.setter
+    def tcp_socket(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgs']]):
+        pulumi.set(self, "tcp_socket", value)
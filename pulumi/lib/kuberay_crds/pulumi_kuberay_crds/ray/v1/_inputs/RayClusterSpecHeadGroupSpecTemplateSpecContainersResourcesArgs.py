@@ -0,0 +1,65 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesArgsDict(TypedDict):
+    claims: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsArgs']]]]]
+    limits: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]]
+    requests: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesArgs:
+    def __init__(__self__, *,
+                 claims: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsArgs']]]] = None,
+                 limits: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]] = None,
+                 requests: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]] = None):
+        if claims is not None:
+            pulumi.set(__self__, "claims", claims)
+        if limits is not None:
+            pulumi.set(__self__, "limits", limits)
+        if requests is not None:
+            pulumi.set(__self__, "requests", requests)
+
+    @_builtins.property
+    @pulumi.getter
+    def claims(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsArgs']]]]:
+        return pulumi.get(self, "claims")
+
+    @claims.setter
+    def claims(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsArgs']]]]):
+        pulumi.set(self, "claims", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def limits(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]:
+        return pulumi.get(self, "limits")
+
+    @limits.setter
+    def limits(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]):
+        pulumi.set(self, "limits", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def requests(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]:
+        return pulumi.get(self, "requests")
+
+    @requests.setter
+    def requests(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]):
+        pulumi.set(self, "requests", value)
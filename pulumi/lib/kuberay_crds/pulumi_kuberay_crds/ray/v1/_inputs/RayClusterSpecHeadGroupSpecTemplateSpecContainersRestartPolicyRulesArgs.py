@@ -0,0 +1,52 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesArgsDict(TypedDict):
+    action: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    exit_codes: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesArgs:
+    def __init__(__self__, *,
+                 action: pulumi.Input[Optional[_builtins.str]] = None,
+                 exit_codes: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesArgs']] = None):
+        if action is not None:
+            pulumi.set(__self__, "action", action)
+        if exit_codes is not None:
+            pulumi.set(__self__, "exit_codes", exit_codes)
+
+    @_builtins.property
+    @pulumi.getter
+    def action(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "action")
+
+    @action.setter
+    def action(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "action", value)
+
+    @_builtins.property
+    @pulumi.getter(name="exitCodes")
+    def exit_codes(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesArgs']]:
+        return pulumi.get(self, "exit_codes")
+
+    @exit_codes.setter
+    def exit_codes(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesArgs']]):
+        pulumi.set(self, "exit_codes", value)
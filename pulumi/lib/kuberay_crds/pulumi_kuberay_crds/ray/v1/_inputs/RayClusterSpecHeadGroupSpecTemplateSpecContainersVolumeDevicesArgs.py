@@ -0,0 +1,52 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesArgsDict(TypedDict):
+    device_path: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesArgs:
+    def __init__(__self__, *,
+                 device_path: pulumi.Input[Optional[_builtins.str]] = None,
+                 name: pulumi.Input[Optional[_builtins.str]] = None):
+        if device_path is not None:
+            pulumi.set(__self__, "device_path", device_path)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+
+    @_builtins.property
+    @pulumi.getter(name="devicePath")
+    def device_path(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "device_path")
+
+    @device_path.setter
+    def device_path(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "device_path", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
@@ -0,0 +1,364 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersArgsDict(TypedDict):
+    args: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    command: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    env: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvArgs']]]]]
+    env_from: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromArgs']]]]]
+    image: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    image_pull_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    lifecycle: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecycleArgs']]]
+    liveness_probe: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeArgs']]]
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    ports: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsArgs']]]]]
+    readiness_probe: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeArgs']]]
+    resize_policy: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyArgs']]]]]
+    resources: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesArgs']]]
+    restart_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    restart_policy_rules: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesArgs']]]]]
+    security_context: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextArgs']]]
+    startup_probe: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeArgs']]]
+    stdin: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    stdin_once: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    target_container_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    termination_message_path: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    termination_message_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    tty: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    volume_devices: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesArgs']]]]]
+    volume_mounts: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsArgs']]]]]
+    working_dir: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersArgs:
+    def __init__(__self__, *,
+                 args: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 command: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 env: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvArgs']]]] = None,
+                 env_from: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromArgs']]]] = None,
+                 image: pulumi.Input[Optional[_builtins.str]] = None,
+                 image_pull_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 lifecycle: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecycleArgs']] = None,
+                 liveness_probe: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeArgs']] = None,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 ports: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsArgs']]]] = None,
+                 readiness_probe: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeArgs']] = None,
+                 resize_policy: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyArgs']]]] = None,
+                 resources: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesArgs']] = None,
+                 restart_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 restart_policy_rules: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesArgs']]]] = None,
+                 security_context: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextArgs']] = None,
+                 startup_probe: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeArgs']] = None,
+                 stdin: pulumi.Input[Optional[_builtins.bool]] = None,
+                 stdin_once: pulumi.Input[Optional[_builtins.bool]] = None,
+                 target_container_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 termination_message_path: pulumi.Input[Optional[_builtins.str]] = None,
+                 termination_message_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 tty: pulumi.Input[Optional[_builtins.bool]] = None,
+                 volume_devices: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesArgs']]]] = None,
+                 volume_mounts: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsArgs']]]] = None,
+                 working_dir: pulumi.Input[Optional[_builtins.str]] = None):
+        if args is not None:
+            pulumi.set(__self__, "args", args)
+        if command is not None:
+            pulumi.set(__self__, "command", command)
+        if env is not None:
+            pulumi.set(__self__, "env", env)
+        if env_from is not None:
+            pulumi.set(__self__, "env_from", env_from)
+        if image is not None:
+            pulumi.set(__self__, "image", image)
+        if image_pull_policy is not None:
+            pulumi.set(__self__, "image_pull_policy", image_pull_policy)
+        if lifecycle is not None:
+            pulumi.set(__self__, "lifecycle", lifecycle)
+        if liveness_probe is not None:
+            pulumi.set(__self__, "liveness_probe", liveness_probe)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if ports is not None:
+            pulumi.set(__self__, "ports", ports)
+        if readiness_probe is not None:
+            pulumi.set(__self__, "readiness_probe", readiness_probe)
+        if resize_policy is not None:
+            pulumi.set(__self__, "resize_policy", resize_policy)
+        if resources is not None:
+            pulumi.set(__self__, "resources", resources)
+        if restart_policy is not None:
+            pulumi.set(__self__, "restart_policy", restart_policy)
+        if restart_policy_rules is not None:
+            pulumi.set(__self__, "restart_policy_rules", restart_policy_rules)
+        if security_context is not None:
+            pulumi.set(__self__, "security_context", security_context)
+        if startup_probe is not None:
+            pulumi.set(__self__, "startup_probe", startup_probe)
+        if stdin is not None:
+            pulumi.set(__self__, "stdin", stdin)
+        if stdin_once is not None:
+            pulumi.set(__self__, "stdin_once", stdin_once)
+        if target_container_name is not None:
+            pulumi.set(__self__, "target_container_name", target_container_name)
+        if termination_message_path is not None:
+            pulumi.set(__self__, "termination_message_path", termination_message_path)
+        if termination_message_policy is not None:
+            pulumi.set(__self__, "termination_message_policy", termination_message_policy)
+        if tty is not None:
+            pulumi.set(__self__, "tty", tty)
+        if volume_devices is not None:
+            pulumi.set(__self__, "volume_devices", volume_devices)
+        if volume_mounts is not None:
+            pulumi.set(__self__, "volume_mounts", volume_mounts)
+        if working_dir is not None:
+            pulumi.set(__self__, "working_dir", working_dir)
+
+    @_builtins.property
+    @pulumi.getter
+    def args(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "args")
+
+    @args.setter
+    def args(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "args", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def command(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "command")
+
+    @command.setter
+    def command(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "command", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def env(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvArgs']]]]:
+        return pulumi.get(self, "env")
+
+    @env.setter
+    def env(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvArgs']]]]):
+        pulumi.set(self, "env", value)
+
+    @_builtins.property
+    @pulumi.getter(name="envFrom")
+    def env_from(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromArgs']]]]:
+        return pulumi.get(self, "env_from")
+
+    @env_from.setter
+    def env_from(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromArgs']]]]):
+        pulumi.set(self, "env_from", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def image(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "image")
+
+    @image.setter
+    def image(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "image", value)
+
+    @_builtins.property
+    @pulumi.getter(name="imagePullPolicy")
+    def image_pull_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "image_pull_policy")
+
+    @image_pull_policy.setter
+    def image_pull_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "image_pull_policy", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def lifecycle(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecycleArgs']]:
+        return pulumi.get(self, "lifecycle")
+
+    @lifecycle.setter
+    def lifecycle(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecycleArgs']]):
+        pulumi.set(self, "lifecycle", value)
+
+    @_builtins.property
+    @pulumi.getter(name="livenessProbe")
+    def liveness_probe(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeArgs']]:
+        return pulumi.get(self, "liveness_probe")
+
+    @liveness_probe.setter
+    def liveness_probe(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeArgs']]):
+        pulumi.set(self, "liveness_probe", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def ports(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsArgs']]]]:
+        return pulumi.get(self, "ports")
+
+    @ports.setter
+    def ports(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsArgs']]]]):
+        pulumi.set(self, "ports", value)
+
+    @_builtins.property
+    @pulumi.getter(name="readinessProbe")
+    def readiness_probe(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeArgs']]:
+        return pulumi.get(self, "readiness_probe")
+
+    @readiness_probe.setter
+    def readiness_probe(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeArgs']]):
+        pulumi.set(self, "readiness_probe", value)
+
+    @_builtins.property
+    @pulumi.getter(name="resizePolicy")
+    def resize_policy(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyArgs']]]]:
+        return pulumi.get(self, "resize_policy")
+
+    @resize_policy.setter
+    def resize_policy(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyArgs']]]]):
+        pulumi.set(self, "resize_policy", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def resources(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesArgs']]:
+        return pulumi.get(self, "resources")
+
+    @resources.setter
+    def resources(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesArgs']]):
+        pulumi.set(self, "resources", value)
+
+    @_builtins.property
+    @pulumi.getter(name="restartPolicy")
+    def restart_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "restart_policy")
+
+    @restart_policy.setter
+    def restart_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "restart_policy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="restartPolicyRules")
+    def restart_policy_rules(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesArgs']]]]:
+        return pulumi.get(self, "restart_policy_rules")
+
+    @restart_policy_rules.setter
+    def restart_policy_rules(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesArgs']]]]):
+        pulumi.set(self, "restart_policy_rules", value)
+
+    @_builtins.property
+    @pulumi.getter(name="securityContext")
+    def security_context(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextArgs']]:
+        return pulumi.get(self, "security_context")
+
+    @security_context.setter
+    def security_context(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextArgs']]):
+        pulumi.set(self, "security_context", value)
+
+    @_builtins.property
+    @pulumi.getter(name="startupProbe")
+    def startup_probe(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeArgs']]:
+        return pulumi.get(self, "startup_probe")
+
+    @startup_probe.setter
+    def startup_probe(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeArgs']]):
+        pulumi.set(self, "startup_probe", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def stdin(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "stdin")
+
+    @stdin.setter
+    def stdin(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "stdin", value)
+
+    @_builtins.property
+    @pulumi.getter(name="stdinOnce")
+    def stdin_once(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "stdin_once")
+
+    @stdin_once.setter
+    def stdin_once(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "stdin_once", value)
+
+    @_builtins.property
+    @pulumi.getter(name="targetContainerName")
+    def target_container_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "target_container_name")
+
+    @target_container_name.setter
+    def target_container_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "target_container_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="terminationMessagePath")
+    def termination_message_path(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "termination_message_path")
+
+    @termination_message_path.setter
+    def termination_message_path(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "termination_message_path", value)
+
+    @_builtins.property
+    @pulumi.getter(name="terminationMessagePolicy")
+    def termination_message_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "termination_message_policy")
+
+    @termination_message_policy.setter
+    def termination_message_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "termination_message_policy", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def tty(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "tty")
+
+    @tty.setter
+    def tty(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "tty", value)
+
+    @_builtins.property
+    @pulumi.getter(name="volumeDevices")
+    def volume_devices(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesArgs']]]]:
+        return pulumi.get(self, "volume_devices")
+
+    @volume_devices.setter
+    def volume_devices(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesArgs']]]]):
+        pulumi.set(self, "volume_devices", value)
+
+    @_builtins.property
+    @pulumi.getter(name="volumeMounts")
+    def volume_mounts(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsArgs']]]]:
+        return pulumi.get(self, "volume_mounts")
+
+    @volume_mounts.setter
+    def volume_mounts(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsArgs']]]]):
+        pulumi.set(self, "volume_mounts", value)
+
+    @_builtins.property
+    @pulumi.getter(name="workingDir")
+    def working_dir(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "working_dir")
+
+    @working_dir.setter
+    def working_dir(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "working_dir", value)
@@ -0,0 +1,117 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsArgsDict(TypedDict):
+    mount_path: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    mount_propagation: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    read_only: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    recursive_read_only: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    sub_path: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    sub_path_expr: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsArgs:
+    def __init__(__self__, *,
+                 mount_path: pulumi.Input[Optional[_builtins.str]] = None,
+                 mount_propagation: pulumi.Input[Optional[_builtins.str]] = None,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 read_only: pulumi.Input[Optional[_builtins.bool]] = None,
+                 recursive_read_only: pulumi.Input[Optional[_builtins.str]] = None,
+                 sub_path: pulumi.Input[Optional[_builtins.str]] = None,
+                 sub_path_expr: pulumi.Input[Optional[_builtins.str]] = None):
+        if mount_path is not None:
+            pulumi.set(__self__, "mount_path", mount_path)
+        if mount_propagation is not None:
+            pulumi.set(__self__, "mount_propagation", mount_propagation)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if read_only is not None:
+            pulumi.set(__self__, "read_only", read_only)
+        if recursive_read_only is not None:
+            pulumi.set(__self__, "recursive_read_only", recursive_read_only)
+        if sub_path is not None:
+            pulumi.set(__self__, "sub_path", sub_path)
+        if sub_path_expr is not None:
+            pulumi.set(__self__, "sub_path_expr", sub_path_expr)
+
+    @_builtins.property
+    @pulumi.getter(name="mountPath")
+    def mount_path(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "mount_path")
+
+    @mount_path.setter
+    def mount_path(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "mount_path", value)
+
+    @_builtins.property
+    @pulumi.getter(name="mountPropagation")
+    def mount_propagation(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "mount_propagation")
+
+    @mount_propagation.setter
+    def mount_propagation(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "mount_propagation", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="readOnly")
+    def read_only(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "read_only")
+
+    @read_only.setter
+    def read_only(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "read_only", value)
+
+    @_builtins.property
+    @pulumi.getter(name="recursiveReadOnly")
+    def recursive_read_only(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "recursive_read_only")
+
+    @recursive_read_only.setter
+    def recursive_read_only(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "recursive_read_only", value)
+
+    @_builtins.property
+    @pulumi.getter(name="subPath")
+    def sub_path(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "sub_path")
+
+    @sub_path.setter
+    def sub_path(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "sub_path", value)
+
+    @_builtins.property
+    @pulumi.getter(name="subPathExpr")
+    def sub_path_expr(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "sub_path_expr")
+
+    @sub_path_expr.setter
+    def sub_path_expr(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "sub_path_expr", value)
@@ -0,0 +1,65 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePatchArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePatchArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePatchArgsDict(TypedDict):
+    post_start: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartPatchArgs']]]
+    pre_stop: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopPatchArgs']]]
+    stop_signal: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePatchArgs:
+    def __init__(__self__, *,
+                 post_start: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartPatchArgs']] = None,
+                 pre_stop: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopPatchArgs']] = None,
+                 stop_signal: pulumi.Input[Optional[_builtins.str]] = None):
+        if post_start is not None:
+            pulumi.set(__self__, "post_start", post_start)
+        if pre_stop is not None:
+            pulumi.set(__self__, "pre_stop", pre_stop)
+        if stop_signal is not None:
+            pulumi.set(__self__, "stop_signal", stop_signal)
+
+    @_builtins.property
+    @pulumi.getter(name="postStart")
+    def post_start(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartPatchArgs']]:
+        return pulumi.get(self, "post_start")
+
+    @post_start.setter
+    def post_start(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartPatchArgs']]):
+        pulumi.set(self, "post_start", value)
+
+    @_builtins.property
+    @pulumi.getter(name="preStop")
+    def pre_stop(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopPatchArgs']]:
+        return pulumi.get(self, "pre_stop")
+
+    @pre_stop.setter
+    def pre_stop(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopPatchArgs']]):
+        pulumi.set(self, "pre_stop", value)
+
+    @_builtins.property
+    @pulumi.getter(name="stopSignal")
+    def stop_signal(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "stop_signal")
+
+    @stop_signal.setter
+    def stop_signal(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "stop_signal", value)
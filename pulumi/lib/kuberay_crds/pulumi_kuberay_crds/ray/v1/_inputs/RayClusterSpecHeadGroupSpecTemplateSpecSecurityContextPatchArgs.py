@@ -0,0 +1,195 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatchArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatchArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatchArgsDict(TypedDict):
+    app_armor_profile: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatchArgs']]]
+    fs_group: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    fs_group_change_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    run_as_group: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    run_as_non_root: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    run_as_user: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    se_linux_change_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    se_linux_options: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatchArgs']]]
+    seccomp_profile: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatchArgs']]]
+    supplemental_groups: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.int]]]]]
+    supplemental_groups_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    sysctls: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatchArgs']]]]]
+    windows_options: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatchArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatchArgs:
+    def __init__(__self__, *,
+                 app_armor_profile: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatchArgs']] = None,
+                 fs_group: pulumi.Input[Optional[_builtins.int]] = None,
+                 fs_group_change_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 run_as_group: pulumi.Input[Optional[_builtins.int]] = None,
+                 run_as_non_root: pulumi.Input[Optional[_builtins.bool]] = None,
+                 run_as_user: pulumi.Input[Optional[_builtins.int]] = None,
+                 se_linux_change_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 se_linux_options: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatchArgs']] = None,
+                 seccomp_profile: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatchArgs']] = None,
+                 supplemental_groups: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.int]]]] = None,
+                 supplemental_groups_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 sysctls: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatchArgs']]]] = None,
+                 windows_options: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatchArgs']] = None):
+        if app_armor_profile is not None:
+            pulumi.set(__self__, "app_armor_profile", app_armor_profile)
+        if fs_group is not None:
+            pulumi.set(__self__, "fs_group", fs_group)
+        if fs_group_change_policy is not None:
+            pulumi.set(__self__, "fs_group_change_policy", fs_group_change_policy)
+        if run_as_group is not None:
+            pulumi.set(__self__, "run_as_group", run_as_group)
+        if run_as_non_root is not None:
+            pulumi.set(__self__, "run_as_non_root", run_as_non_root)
+        if run_as_user is not None:
+            pulumi.set(__self__, "run_as_user", run_as_user)
+        if se_linux_change_policy is not None:
+            pulumi.set(__self__, "se_linux_change_policy", se_linux_change_policy)
+        if se_linux_options is not None:
+            pulumi.set(__self__, "se_linux_options", se_linux_options)
+        if seccomp_profile is not None:
+            pulumi.set(__self__, "seccomp_profile", seccomp_profile)
+        if supplemental_groups is not None:
+            pulumi.set(__self__, "supplemental_groups", supplemental_groups)
+        if supplemental_groups_policy is not None:
+            pulumi.set(__self__, "supplemental_groups_policy", supplemental_groups_policy)
+        if sysctls is not None:
+            pulumi.set(__self__, "sysctls", sysctls)
+        if windows_options is not None:
+            pulumi.set(__self__, "windows_options", windows_options)
+
+    @_builtins.property
+    @pulumi.getter(name="appArmorProfile")
+    def app_armor_profile(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatchArgs']]:
+        return pulumi.get(self, "app_armor_profile")
+
+    @app_armor_profile.setter
+    def app_armor_profile(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatchArgs']]):
+        pulumi.set(self, "app_armor_profile", value)
+
+    @_builtins.property
+    @pulumi.getter(name="fsGroup")
+    def fs_group(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "fs_group")
+
+    @fs_group.setter
+    def fs_group(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "fs_group", value)
+
+    @_builtins.property
+    @pulumi.getter(name="fsGroupChangePolicy")
+    def fs_group_change_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "fs_group_change_policy")
+
+    @fs_group_change_policy.setter
+    def fs_group_change_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "fs_group_change_policy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="runAsGroup")
+    def run_as_group(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "run_as_group")
+
+    @run_as_group.setter
+    def run_as_group(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "run_as_group", value)
+
+    @_builtins.property
+    @pulumi.getter(name="runAsNonRoot")
+    def run_as_non_root(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "run_as_non_root")
+
+    @run_as_non_root.setter
+    def run_as_non_root(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "run_as_non_root", value)
+
+    @_builtins.property
+    @pulumi.getter(name="runAsUser")
+    def run_as_user(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "run_as_user")
+
+    @run_as_user.setter
+    def run_as_user(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "run_as_user", value)
+
+    @_builtins.property
+    @pulumi.getter(name="seLinuxChangePolicy")
+    def se_linux_change_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "se_linux_change_policy")
+
+    @se_linux_change_policy.setter
+    def se_linux_change_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "se_linux_change_policy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="seLinuxOptions")
+    def se_linux_options(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatchArgs']]:
+        return pulumi.get(self, "se_linux_options")
+
+    @se_linux_options.setter
+    def se_linux_options(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatchArgs']]):
+        pulumi.set(self, "se_linux_options", value)
+
+    @_builtins.property
+    @pulumi.getter(name="seccompProfile")
+    def seccomp_profile(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatchArgs']]:
+        return pulumi.get(self, "seccomp_profile")
+
+    @seccomp_profile.setter
+    def seccomp_profile(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatchArgs']]):
+        pulumi.set(self, "seccomp_profile", value)
+
+    @_builtins.property
+    @pulumi.getter(name="supplementalGroups")
+    def supplemental_groups(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.int]]]]:
+        return pulumi.get(self, "supplemental_groups")
+
+    @supplemental_groups.setter
+    def supplemental_groups(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.int]]]]):
+        pulumi.set(self, "supplemental_groups", value)
+
+    @_builtins.property
+    @pulumi.getter(name="supplementalGroupsPolicy")
+    def supplemental_groups_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "supplemental_groups_policy")
+
+    @supplemental_groups_policy.setter
+    def supplemental_groups_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "supplemental_groups_policy", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def sysctls(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatchArgs']]]]:
+        return pulumi.get(self, "sysctls")
+
+    @sysctls.setter
+    def sysctls(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatchArgs']]]]):
+        pulumi.set(self, "sysctls", value)
+
+    @_builtins.property
+    @pulumi.getter(name="windowsOptions")
+    def windows_options(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatchArgs']]:
+        return pulumi.get(self, "windows_options")
+
+    @windows_options.setter
+    def windows_options(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatchArgs']]):
+        pulumi.set(self, "windows_options", value)
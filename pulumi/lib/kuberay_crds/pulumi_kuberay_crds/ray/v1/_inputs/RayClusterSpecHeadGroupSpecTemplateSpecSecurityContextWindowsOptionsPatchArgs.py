@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatchArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatchArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatchArgsDict(TypedDict):
+    gmsa_credential_spec: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    gmsa_credential_spec_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    host_process: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    run_as_user_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatchArgs:
+    def __init__(__self__, *,
+                 gmsa_credential_spec: pulumi.Input[Optional[_builtins.str]] = None,
+                 gmsa_credential_spec_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 host_process: pulumi.Input[Optional[_builtins.bool]] = None,
+                 run_as_user_name: pulumi.Input[Optional[_builtins.str]] = None):
+        if gmsa_credential_spec is not None:
+            pulumi.set(__self__, "gmsa_credential_spec", gmsa_credential_spec)
+        if gmsa_credential_spec_name is not None:
+            pulumi.set(__self__, "gmsa_credential_spec_name", gmsa_credential_spec_name)
+        if host_process is not None:
+            pulumi.set(__self__, "host_process", host_process)
+        if run_as_user_name is not None:
+            pulumi.set(__self__, "run_as_user_name", run_as_user_name)
+
+    @_builtins.property
+    @pulumi.getter(name="gmsaCredentialSpec")
+    def gmsa_credential_spec(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "gmsa_credential_spec")
+
+    @gmsa_credential_spec.setter
+    def gmsa_credential_spec(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "gmsa_credential_spec", value)
+
+    @_builtins.property
+    @pulumi.getter(name="gmsaCredentialSpecName")
+    def gmsa_credential_spec_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "gmsa_credential_spec_name")
+
+    @gmsa_credential_spec_name.setter
+    def gmsa_credential_spec_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "gmsa_credential_spec_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostProcess")
+    def host_process(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "host_process")
+
+    @host_process.setter
+    def host_process(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "host_process", value)
+
+    @_builtins.property
+    @pulumi.getter(name="runAsUserName")
+    def run_as_user_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "run_as_user_name")
+
+    @run_as_user_name.setter
+    def run_as_user_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "run_as_user_name", value)
@@ -0,0 +1,130 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsPatchArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsPatchArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsPatchArgsDict(TypedDict):
+    label_selector: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgs']]]
+    match_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    max_skew: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    min_domains: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    node_affinity_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    node_taints_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    topology_key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    when_unsatisfiable: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsPatchArgs:
+    def __init__(__self__, *,
+                 label_selector: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgs']] = None,
+                 match_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 max_skew: pulumi.Input[Optional[_builtins.int]] = None,
+                 min_domains: pulumi.Input[Optional[_builtins.int]] = None,
+                 node_affinity_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 node_taints_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 topology_key: pulumi.Input[Optional[_builtins.str]] = None,
+                 when_unsatisfiable: pulumi.Input[Optional[_builtins.str]] = None):
+        if label_selector is not None:
+            pulumi.set(__self__, "label_selector", label_selector)
+        if match_label_keys is not None:
+            pulumi.set(__self__, "match_label_keys", match_label_keys)
+        if max_skew is not None:
+            pulumi.set(__self__, "max_skew", max_skew)
+        if min_domains is not None:
+            pulumi.set(__self__, "min_domains", min_domains)
+        if node_affinity_policy is not None:
+            pulumi.set(__self__, "node_affinity_policy", node_affinity_policy)
+        if node_taints_policy is not None:
+            pulumi.set(__self__, "node_taints_policy", node_taints_policy)
+        if topology_key is not None:
+            pulumi.set(__self__, "topology_key", topology_key)
+        if when_unsatisfiable is not None:
+            pulumi.set(__self__, "when_unsatisfiable", when_unsatisfiable)
+
+    @_builtins.property
+    @pulumi.getter(name="labelSelector")
+    def label_selector(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgs']]:
+        return pulumi.get(self, "label_selector")
+
+    @label_selector.setter
+    def label_selector(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgs']]):
+        pulumi.set(self, "label_selector", value)
+
+    @_builtins.property
+    @pulumi.getter(name="matchLabelKeys")
+    def match_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "match_label_keys")
+
+    @match_label_keys.setter
+    def match_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "match_label_keys", value)
+
+    @_builtins.property
+    @pulumi.getter(name="maxSkew")
+    def max_skew(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "max_skew")
+
+    @max_skew.setter
+    def max_skew(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "max_skew", value)
+
+    @_builtins.property
+    @pulumi.getter(name="minDomains")
+    def min_domains(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "min_domains")
+
+    @min_domains.setter
+    def min_domains(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "min_domains", value)
+
+    @_builtins.property
+    @pulumi.getter(name="nodeAffinityPolicy")
+    def node_affinity_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "node_affinity_policy")
+
+    @node_affinity_policy.setter
+    def node_affinity_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "node_affinity_policy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="nodeTaintsPolicy")
+    def node_taints_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "node_taints_policy")
+
+    @node_taints_policy.setter
+    def node_taints_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "node_taints_policy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="topologyKey")
+    def topology_key(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "topology_key")
+
+    @topology_key.setter
+    def topology_key(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "topology_key", value)
+
+    @_builtins.property
+    @pulumi.getter(name="whenUnsatisfiable")
+    def when_unsatisfiable(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "when_unsatisfiable")
+
+    @when_unsatisfiable.setter
+    def when_unsatisfiable(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "when_unsatisfiable", value)
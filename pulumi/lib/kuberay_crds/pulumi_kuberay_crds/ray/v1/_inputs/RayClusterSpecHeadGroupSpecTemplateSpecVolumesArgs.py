@@ -0,0 +1,429 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesArgsDict(TypedDict):
+    aws_elastic_block_store: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStoreArgs']]]
+    azure_disk: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskArgs']]]
+    azure_file: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFileArgs']]]
+    cephfs: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsArgs']]]
+    cinder: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderArgs']]]
+    config_map: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapArgs']]]
+    csi: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiArgs']]]
+    downward_api: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIArgs']]]
+    empty_dir: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirArgs']]]
+    ephemeral: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralArgs']]]
+    fc: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcArgs']]]
+    flex_volume: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeArgs']]]
+    flocker: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerArgs']]]
+    gce_persistent_disk: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskArgs']]]
+    git_repo: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoArgs']]]
+    glusterfs: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsArgs']]]
+    host_path: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathArgs']]]
+    image: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesImageArgs']]]
+    iscsi: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiArgs']]]
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    nfs: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsArgs']]]
+    persistent_volume_claim: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimArgs']]]
+    photon_persistent_disk: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskArgs']]]
+    portworx_volume: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumeArgs']]]
+    projected: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedArgs']]]
+    quobyte: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobyteArgs']]]
+    rbd: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdArgs']]]
+    scale_io: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOArgs']]]
+    secret: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretArgs']]]
+    storageos: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosArgs']]]
+    vsphere_volume: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumeArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesArgs:
+    def __init__(__self__, *,
+                 aws_elastic_block_store: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStoreArgs']] = None,
+                 azure_disk: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskArgs']] = None,
+                 azure_file: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFileArgs']] = None,
+                 cephfs: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsArgs']] = None,
+                 cinder: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderArgs']] = None,
+                 config_map: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapArgs']] = None,
+                 csi: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiArgs']] = None,
+                 downward_api: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIArgs']] = None,
+                 empty_dir: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirArgs']] = None,
+                 ephemeral: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralArgs']] = None,
+                 fc: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcArgs']] = None,
+                 flex_volume: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeArgs']] = None,
+                 flocker: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerArgs']] = None,
+                 gce_persistent_disk: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskArgs']] = None,
+                 git_repo: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoArgs']] = None,
+                 glusterfs: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsArgs']] = None,
+                 host_path: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathArgs']] = None,
+                 image: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesImageArgs']] = None,
+                 iscsi: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiArgs']] = None,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 nfs: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsArgs']] = None,
+                 persistent_volume_claim: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimArgs']] = None,
+                 photon_persistent_disk: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskArgs']] = None,
+                 portworx_volume: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumeArgs']] = None,
+                 projected: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedArgs']] = None,
+                 quobyte: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobyteArgs']] = None,
+                 rbd: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdArgs']] = None,
+                 scale_io: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOArgs']] = None,
+                 secret: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretArgs']] = None,
+                 storageos: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosArgs']] = None,
+                 vsphere_volume: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumeArgs']] = None):
+        if aws_elastic_block_store is not None:
+            pulumi.set(__self__, "aws_elastic_block_store", aws_elastic_block_store)
+        if azure_disk is not None:
+            pulumi.set(__self__, "azure_disk", azure_disk)
+        if azure_file is not None:
+            pulumi.set(__self__, "azure_file", azure_file)
+        if cephfs is not None:
+            pulumi.set(__self__, "cephfs", cephfs)
+        if cinder is not None:
+            pulumi.set(__self__, "cinder", cinder)
+        if config_map is not None:
+            pulumi.set(__self__, "config_map", config_map)
+        if csi is not None:
+            pulumi.set(__self__, "csi", csi)
+        if downward_api is not None:
+            pulumi.set(__self__, "downward_api", downward_api)
+        if empty_dir is not None:
+            pulumi.set(__self__, "empty_dir", empty_dir)
+        if ephemeral is not None:
+            pulumi.set(__self__, "ephemeral", ephemeral)
+        if fc is not None:
+            pulumi.set(__self__, "fc", fc)
+        if flex_volume is not None:
+            pulumi.set(__self__, "flex_volume", flex_volume)
+        if flocker is not None:
+            pulumi.set(__self__, "flocker", flocker)
+        if gce_persistent_disk is not None:
+            pulumi.set(__self__, "gce_persistent_disk", gce_persistent_disk)
+        if git_repo is not None:
+            pulumi.set(__self__, "git_repo", git_repo)
+        if glusterfs is not None:
+            pulumi.set(__self__, "glusterfs", glusterfs)
+        if host_path is not None:
+            pulumi.set(__self__, "host_path", host_path)
+        if image is not None:
+            pulumi.set(__self__, "image", image)
+        if iscsi is not None:
+            pulumi.set(__self__, "iscsi", iscsi)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if nfs is not None:
+            pulumi.set(__self__, "nfs", nfs)
+        if persistent_volume_claim is not None:
+            pulumi.set(__self__, "persistent_volume_claim", persistent_volume_claim)
+        if photon_persistent_disk is not None:
+            pulumi.set(__self__, "photon_persistent_disk", photon_persistent_disk)
+        if portworx_volume is not None:
+            pulumi.set(__self__, "portworx_volume", portworx_volume)
+        if projected is not None:
+            pulumi.set(__self__, "projected", projected)
+        if quobyte is not None:
+            pulumi.set(__self__, "quobyte", quobyte)
+        if rbd is not None:
+            pulumi.set(__self__, "rbd", rbd)
+        if scale_io is not None:
+            pulumi.set(__self__, "scale_io", scale_io)
+        if secret is not None:
+            pulumi.set(__self__, "secret", secret)
+        if storageos is not None:
+            pulumi.set(__self__, "storageos", storageos)
+        if vsphere_volume is not None:
+            pulumi.set(__self__, "vsphere_volume", vsphere_volume)
+
+    @_builtins.property
+    @pulumi.getter(name="awsElasticBlockStore")
+    def aws_elastic_block_store(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStoreArgs']]:
+        return pulumi.get(self, "aws_elastic_block_store")
+
+    @aws_elastic_block_store.setter
+    def aws_elastic_block_store(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStoreArgs']]):
+        pulumi.set(self, "aws_elastic_block_store", value)
+
+    @_builtins.property
+    @pulumi.getter(name="azureDisk")
+    def azure_disk(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskArgs']]:
+        return pulumi.get(self, "azure_disk")
+
+    @azure_disk.setter
+    def azure_disk(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskArgs']]):
+        pulumi.set(self, "azure_disk", value)
+
+    @_builtins.property
+    @pulumi.getter(name="azureFile")
+    def azure_file(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFileArgs']]:
+        return pulumi.get(self, "azure_file")
+
+    @azure_file.setter
+    def azure_file(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFileArgs']]):
+        pulumi.set(self, "azure_file", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def cephfs(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsArgs']]:
+        return pulumi.get(self, "cephfs")
+
+    @cephfs.setter
+    def cephfs(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsArgs']]):
+        pulumi.set(self, "cephfs", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def cinder(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderArgs']]:
+        return pulumi.get(self, "cinder")
+
+    @cinder.setter
+    def cinder(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderArgs']]):
+        pulumi.set(self, "cinder", value)
+
+    @_builtins.property
+    @pulumi.getter(name="configMap")
+    def config_map(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapArgs']]:
+        return pulumi.get(self, "config_map")
+
+    @config_map.setter
+    def config_map(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapArgs']]):
+        pulumi.set(self, "config_map", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def csi(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiArgs']]:
+        return pulumi.get(self, "csi")
+
+    @csi.setter
+    def csi(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiArgs']]):
+        pulumi.set(self, "csi", value)
+
+    @_builtins.property
+    @pulumi.getter(name="downwardAPI")
+    def downward_api(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIArgs']]:
+        return pulumi.get(self, "downward_api")
+
+    @downward_api.setter
+    def downward_api(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIArgs']]):
+        pulumi.set(self, "downward_api", value)
+
+    @_builtins.property
+    @pulumi.getter(name="emptyDir")
+    def empty_dir(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirArgs']]:
+        return pulumi.get(self, "empty_dir")
+
+    @empty_dir.setter
+    def empty_dir(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirArgs']]):
+        pulumi.set(self, "empty_dir", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def ephemeral(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralArgs']]:
+        return pulumi.get(self, "ephemeral")
+
+    @ephemeral.setter
+    def ephemeral(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralArgs']]):
+        pulumi.set(self, "ephemeral", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def fc(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcArgs']]:
+        return pulumi.get(self, "fc")
+
+    @fc.setter
+    def fc(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcArgs']]):
+        pulumi.set(self, "fc", value)
+
+    @_builtins.property
+    @pulumi.getter(name="flexVolume")
+    def flex_volume(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeArgs']]:
+        return pulumi.get(self, "flex_volume")
+
+    @flex_volume.setter
+    def flex_volume(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeArgs']]):
+        pulumi.set(self, "flex_volume", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def flocker(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerArgs']]:
+        return pulumi.get(self, "flocker")
+
+    @flocker.setter
+    def flocker(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerArgs']]):
+        pulumi.set(self, "flocker", value)
+
+    @_builtins.property
+    @pulumi.getter(name="gcePersistentDisk")
+    def gce_persistent_disk(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskArgs']]:
+        return pulumi.get(self, "gce_persistent_disk")
+
+    @gce_persistent_disk.setter
+    def gce_persistent_disk(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskArgs']]):
+        pulumi.set(self, "gce_persistent_disk", value)
+
+    @_builtins.property
+    @pulumi.getter(name="gitRepo")
+    def git_repo(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoArgs']]:
+        return pulumi.get(self, "git_repo")
+
+    @git_repo.setter
+    def git_repo(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoArgs']]):
+        pulumi.set(self, "git_repo", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def glusterfs(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsArgs']]:
+        return pulumi.get(self, "glusterfs")
+
+    @glusterfs.setter
+    def glusterfs(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsArgs']]):
+        pulumi.set(self, "glusterfs", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostPath")
+    def host_path(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathArgs']]:
+        return pulumi.get(self, "host_path")
+
+    @host_path.setter
+    def host_path(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathArgs']]):
+        pulumi.set(self, "host_path", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def image(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesImageArgs']]:
+        return pulumi.get(self, "image")
+
+    @image.setter
+    def image(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesImageArgs']]):
+        pulumi.set(self, "image", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def iscsi(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiArgs']]:
+        return pulumi.get(self, "iscsi")
+
+    @iscsi.setter
+    def iscsi(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiArgs']]):
+        pulumi.set(self, "iscsi", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def nfs(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsArgs']]:
+        return pulumi.get(self, "nfs")
+
+    @nfs.setter
+    def nfs(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsArgs']]):
+        pulumi.set(self, "nfs", value)
+
+    @_builtins.property
+    @pulumi.getter(name="persistentVolumeClaim")
+    def persistent_volume_claim(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimArgs']]:
+        return pulumi.get(self, "persistent_volume_claim")
+
+    @persistent_volume_claim.setter
+    def persistent_volume_claim(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimArgs']]):
+        pulumi.set(self, "persistent_volume_claim", value)
+
+    @_builtins.property
+    @pulumi.getter(name="photonPersistentDisk")
+    def photon_persistent_disk(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskArgs']]:
+        return pulumi.get(self, "photon_persistent_disk")
+
+    @photon_persistent_disk.setter
+    def photon_persistent_disk(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskArgs']]):
+        pulumi.set(self, "photon_persistent_disk", value)
+
+    @_builtins.property
+    @pulumi.getter(name="portworxVolume")
+    def portworx_volume(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumeArgs']]:
+        return pulumi.get(self, "portworx_volume")
+
+    @portworx_volume.setter
+    def portworx_volume(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumeArgs']]):
+        pulumi.set(self, "portworx_volume", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def projected(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedArgs']]:
+        return pulumi.get(self, "projected")
+
+    @projected.setter
+    def projected(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedArgs']]):
+        pulumi.set(self, "projected", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def quobyte(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobyteArgs']]:
+        return pulumi.get(self, "quobyte")
+
+    @quobyte.setter
+    def quobyte(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobyteArgs']]):
+        pulumi.set(self, "quobyte", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def rbd(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdArgs']]:
+        return pulumi.get(self, "rbd")
+
+    @rbd.setter
+    def rbd(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdArgs']]):
+        pulumi.set(self, "rbd", value)
+
+    @_builtins.property
+    @pulumi.getter(name="scaleIO")
+    def scale_io(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOArgs']]:
+        return pulumi.get(self, "scale_io")
+
+    @scale_io.setter
+    def scale_io(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOArgs']]):
+        pulumi.set(self, "scale_io", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def secret(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretArgs']]:
+        return pulumi.get(self, "secret")
+
+    @secret.setter
+    def secret(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretArgs']]):
+        pulumi.set(self, "secret", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def storageos(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosArgs']]:
+        return pulumi.get(self, "storageos")
+
+    @storageos.setter
+    def storageos(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosArgs']]):
+        pulumi.set(self, "storageos", value)
+
+    @_builtins.property
+    @pulumi.getter(name="vsphereVolume")
+    def vsphere_volume(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumeArgs']]:
+        return pulumi.get(self, "vsphere_volume")
+
+    @vsphere_volume.setter
+    def vsphere_volume(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumeArgs']]):
+        pulumi.set(self, "vsphere_volume", value)
@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStoreArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStoreArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStoreArgsDict(TypedDict):
+    fs_type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    partition: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    read_only: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    volume_id: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStoreArgs:
+    def __init__(__self__, *,
+                 fs_type: pulumi.Input[Optional[_builtins.str]] = None,
+                 partition: pulumi.Input[Optional[_builtins.int]] = None,
+                 read_only: pulumi.Input[Optional[_builtins.bool]] = None,
+                 volume_id: pulumi.Input[Optional[_builtins.str]] = None):
+        if fs_type is not None:
+            pulumi.set(__self__, "fs_type", fs_type)
+        if partition is not None:
+            pulumi.set(__self__, "partition", partition)
+        if read_only is not None:
+            pulumi.set(__self__, "read_only", read_only)
+        if volume_id is not None:
+            pulumi.set(__self__, "volume_id", volume_id)
+
+    @_builtins.property
+    @pulumi.getter(name="fsType")
+    def fs_type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "fs_type")
+
+    @fs_type.setter
+    def fs_type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "fs_type", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def partition(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "partition")
+
+    @partition.setter
+    def partition(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "partition", value)
+
+    @_builtins.property
+    @pulumi.getter(name="readOnly")
+    def read_only(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "read_only")
+
+    @read_only.setter
+    def read_only(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "read_only", value)
+
+    @_builtins.property
+    @pulumi.getter(name="volumeID")
+    def volume_id(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "volume_id")
+
+    @volume_id.setter
+    def volume_id(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "volume_id", value)
@@ -0,0 +1,65 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFileArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFileArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFileArgsDict(TypedDict):
+    read_only: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    secret_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    share_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFileArgs:
+    def __init__(__self__, *,
+                 read_only: pulumi.Input[Optional[_builtins.bool]] = None,
+                 secret_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 share_name: pulumi.Input[Optional[_builtins.str]] = None):
+        if read_only is not None:
+            pulumi.set(__self__, "read_only", read_only)
+        if secret_name is not None:
+            pulumi.set(__self__, "secret_name", secret_name)
+        if share_name is not None:
+            pulumi.set(__self__, "share_name", share_name)
+
+    @_builtins.property
+    @pulumi.getter(name="readOnly")
+    def read_only(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "read_only")
+
+    @read_only.setter
+    def read_only(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "read_only", value)
+
+    @_builtins.property
+    @pulumi.getter(name="secretName")
+    def secret_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "secret_name")
+
+    @secret_name.setter
+    def secret_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "secret_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="shareName")
+    def share_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "share_name")
+
+    @share_name.setter
+    def share_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "share_name", value)
@@ -0,0 +1,91 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiArgsDict(TypedDict):
+    driver: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    fs_type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    node_publish_secret_ref: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefArgs']]]
+    read_only: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    volume_attributes: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiArgs:
+    def __init__(__self__, *,
+                 driver: pulumi.Input[Optional[_builtins.str]] = None,
+                 fs_type: pulumi.Input[Optional[_builtins.str]] = None,
+                 node_publish_secret_ref: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefArgs']] = None,
+                 read_only: pulumi.Input[Optional[_builtins.bool]] = None,
+                 volume_attributes: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
+        if driver is not None:
+            pulumi.set(__self__, "driver", driver)
+        if fs_type is not None:
+            pulumi.set(__self__, "fs_type", fs_type)
+        if node_publish_secret_ref is not None:
+            pulumi.set(__self__, "node_publish_secret_ref", node_publish_secret_ref)
+        if read_only is not None:
+            pulumi.set(__self__, "read_only", read_only)
+        if volume_attributes is not None:
+            pulumi.set(__self__, "volume_attributes", volume_attributes)
+
+    @_builtins.property
+    @pulumi.getter
+    def driver(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "driver")
+
+    @driver.setter
+    def driver(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "driver", value)
+
+    @_builtins.property
+    @pulumi.getter(name="fsType")
+    def fs_type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "fs_type")
+
+    @fs_type.setter
+    def fs_type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "fs_type", value)
+
+    @_builtins.property
+    @pulumi.getter(name="nodePublishSecretRef")
+    def node_publish_secret_ref(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefArgs']]:
+        return pulumi.get(self, "node_publish_secret_ref")
+
+    @node_publish_secret_ref.setter
+    def node_publish_secret_ref(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefArgs']]):
+        pulumi.set(self, "node_publish_secret_ref", value)
+
+    @_builtins.property
+    @pulumi.getter(name="readOnly")
+    def read_only(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "read_only")
+
+    @read_only.setter
+    def read_only(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "read_only", value)
+
+    @_builtins.property
+    @pulumi.getter(name="volumeAttributes")
+    def volume_attributes(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "volume_attributes")
+
+    @volume_attributes.setter
+    def volume_attributes(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "volume_attributes", value)
@@ -0,0 +1,52 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIArgsDict(TypedDict):
+    default_mode: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    items: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsArgs']]]]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIArgs:
+    def __init__(__self__, *,
+                 default_mode: pulumi.Input[Optional[_builtins.int]] = None,
+                 items: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsArgs']]]] = None):
+        if default_mode is not None:
+            pulumi.set(__self__, "default_mode", default_mode)
+        if items is not None:
+            pulumi.set(__self__, "items", items)
+
+    @_builtins.property
+    @pulumi.getter(name="defaultMode")
+    def default_mode(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "default_mode")
+
+    @default_mode.setter
+    def default_mode(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "default_mode", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def items(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsArgs']]]]:
+        return pulumi.get(self, "items")
+
+    @items.setter
+    def items(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsArgs']]]]):
+        pulumi.set(self, "items", value)
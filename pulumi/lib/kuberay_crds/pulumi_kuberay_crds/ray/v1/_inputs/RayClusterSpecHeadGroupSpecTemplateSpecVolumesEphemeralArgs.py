@@ -0,0 +1,39 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralArgsDict(TypedDict):
+    volume_claim_template: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralArgs:
+    def __init__(__self__, *,
+                 volume_claim_template: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateArgs']] = None):
+        if volume_claim_template is not None:
+            pulumi.set(__self__, "volume_claim_template", volume_claim_template)
+
+    @_builtins.property
+    @pulumi.getter(name="volumeClaimTemplate")
+    def volume_claim_template(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateArgs']]:
+        return pulumi.get(self, "volume_claim_template")
+
+    @volume_claim_template.setter
+    def volume_claim_template(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateArgs']]):
+        pulumi.set(self, "volume_claim_template", value)
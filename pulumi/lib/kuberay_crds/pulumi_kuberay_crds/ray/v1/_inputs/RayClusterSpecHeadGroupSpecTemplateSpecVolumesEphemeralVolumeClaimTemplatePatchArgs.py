@@ -0,0 +1,52 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgsDict(TypedDict):
+    metadata: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgs']]]
+    spec: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgs:
+    def __init__(__self__, *,
+                 metadata: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgs']] = None,
+                 spec: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgs']] = None):
+        if metadata is not None:
+            pulumi.set(__self__, "metadata", metadata)
+        if spec is not None:
+            pulumi.set(__self__, "spec", spec)
+
+    @_builtins.property
+    @pulumi.getter
+    def metadata(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgs']]:
+        return pulumi.get(self, "metadata")
+
+    @metadata.setter
+    def metadata(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgs']]):
+        pulumi.set(self, "metadata", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def spec(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgs']]:
+        return pulumi.get(self, "spec")
+
+    @spec.setter
+    def spec(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgs']]):
+        pulumi.set(self, "spec", value)
@@ -0,0 +1,91 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatchArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatchArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatchArgsDict(TypedDict):
+    fs_type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    lun: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    read_only: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    target_wwns: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    wwids: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatchArgs:
+    def __init__(__self__, *,
+                 fs_type: pulumi.Input[Optional[_builtins.str]] = None,
+                 lun: pulumi.Input[Optional[_builtins.int]] = None,
+                 read_only: pulumi.Input[Optional[_builtins.bool]] = None,
+                 target_wwns: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 wwids: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
+        if fs_type is not None:
+            pulumi.set(__self__, "fs_type", fs_type)
+        if lun is not None:
+            pulumi.set(__self__, "lun", lun)
+        if read_only is not None:
+            pulumi.set(__self__, "read_only", read_only)
+        if target_wwns is not None:
+            pulumi.set(__self__, "target_wwns", target_wwns)
+        if wwids is not None:
+            pulumi.set(__self__, "wwids", wwids)
+
+    @_builtins.property
+    @pulumi.getter(name="fsType")
+    def fs_type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "fs_type")
+
+    @fs_type.setter
+    def fs_type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "fs_type", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def lun(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "lun")
+
+    @lun.setter
+    def lun(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "lun", value)
+
+    @_builtins.property
+    @pulumi.getter(name="readOnly")
+    def read_only(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "read_only")
+
+    @read_only.setter
+    def read_only(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "read_only", value)
+
+    @_builtins.property
+    @pulumi.getter(name="targetWWNs")
+    def target_wwns(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "target_wwns")
+
+    @target_wwns.setter
+    def target_wwns(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "target_wwns", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def wwids(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "wwids")
+
+    @wwids.setter
+    def wwids(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "wwids", value)
@@ -0,0 +1,429 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatchArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatchArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatchArgsDict(TypedDict):
+    aws_elastic_block_store: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatchArgs']]]
+    azure_disk: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatchArgs']]]
+    azure_file: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatchArgs']]]
+    cephfs: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatchArgs']]]
+    cinder: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatchArgs']]]
+    config_map: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatchArgs']]]
+    csi: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatchArgs']]]
+    downward_api: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatchArgs']]]
+    empty_dir: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatchArgs']]]
+    ephemeral: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatchArgs']]]
+    fc: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatchArgs']]]
+    flex_volume: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatchArgs']]]
+    flocker: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatchArgs']]]
+    gce_persistent_disk: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatchArgs']]]
+    git_repo: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatchArgs']]]
+    glusterfs: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatchArgs']]]
+    host_path: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatchArgs']]]
+    image: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatchArgs']]]
+    iscsi: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatchArgs']]]
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    nfs: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatchArgs']]]
+    persistent_volume_claim: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatchArgs']]]
+    photon_persistent_disk: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatchArgs']]]
+    portworx_volume: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatchArgs']]]
+    projected: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatchArgs']]]
+    quobyte: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatchArgs']]]
+    rbd: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatchArgs']]]
+    scale_io: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatchArgs']]]
+    secret: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatchArgs']]]
+    storageos: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatchArgs']]]
+    vsphere_volume: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatchArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatchArgs:
+    def __init__(__self__, *,
+                 aws_elastic_block_store: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatchArgs']] = None,
+                 azure_disk: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatchArgs']] = None,
+                 azure_file: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatchArgs']] = None,
+                 cephfs: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatchArgs']] = None,
+                 cinder: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatchArgs']] = None,
+                 config_map: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatchArgs']] = None,
+                 csi: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatchArgs']] = None,
+                 downward_api: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatchArgs']] = None,
+                 empty_dir: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatchArgs']] = None,
+                 ephemeral: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatchArgs']] = None,
+                 fc: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatchArgs']] = None,
+                 flex_volume: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatchArgs']] = None,
+                 flocker: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatchArgs']] = None,
+                 gce_persistent_disk: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatchArgs']] = None,
+                 git_repo: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatchArgs']] = None,
+                 glusterfs: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatchArgs']] = None,
+                 host_path: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatchArgs']] = None,
+                 image: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatchArgs']] = None,
+                 iscsi: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatchArgs']] = None,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 nfs: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatchArgs']] = None,
+                 persistent_volume_claim: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatchArgs']] = None,
+                 photon_persistent_disk: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatchArgs']] = None,
+                 portworx_volume: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatchArgs']] = None,
+                 projected: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatchArgs']] = None,
+                 quobyte: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatchArgs']] = None,
+                 rbd: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatchArgs']] = None,
+                 scale_io: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatchArgs']] = None,
+                 secret: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatchArgs']] = None,
+                 storageos: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatchArgs']] = None,
+                 vsphere_volume: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatchArgs']] = None):
+        if aws_elastic_block_store is not None:
+            pulumi.set(__self__, "aws_elastic_block_store", aws_elastic_block_store)
+        if azure_disk is not None:
+            pulumi.set(__self__, "azure_disk", azure_disk)
+        if azure_file is not None:
+            pulumi.set(__self__, "azure_file", azure_file)
+        if cephfs is not None:
+            pulumi.set(__self__, "cephfs", cephfs)
+        if cinder is not None:
+            pulumi.set(__self__, "cinder", cinder)
+        if config_map is not None:
+            pulumi.set(__self__, "config_map", config_map)
+        if csi is not None:
+            pulumi.set(__self__, "csi", csi)
+        if downward_api is not None:
+            pulumi.set(__self__, "downward_api", downward_api)
+        if empty_dir is not None:
+            pulumi.set(__self__, "empty_dir", empty_dir)
+        if ephemeral is not None:
+            pulumi.set(__self__, "ephemeral", ephemeral)
+        if fc is not None:
+            pulumi.set(__self__, "fc", fc)
+        if flex_volume is not None:
+            pulumi.set(__self__, "flex_volume", flex_volume)
+        if flocker is not None:
+            pulumi.set(__self__, "flocker", flocker)
+        if gce_persistent_disk is not None:
+            pulumi.set(__self__, "gce_persistent_disk", gce_persistent_disk)
+        if git_repo is not None:
+            pulumi.set(__self__, "git_repo", git_repo)
+        if glusterfs is not None:
+            pulumi.set(__self__, "glusterfs", glusterfs)
+        if host_path is not None:
+            pulumi.set(__self__, "host_path", host_path)
+        if image is not None:
+            pulumi.set(__self__, "image", image)
+        if iscsi is not None:
+            pulumi.set(__self__, "iscsi", iscsi)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if nfs is not None:
+            pulumi.set(__self__, "nfs", nfs)
+        if persistent_volume_claim is not None:
+            pulumi.set(__self__, "persistent_volume_claim", persistent_volume_claim)
+        if photon_persistent_disk is not None:
+            pulumi.set(__self__, "photon_persistent_disk", photon_persistent_disk)
+        if portworx_volume is not None:
+            pulumi.set(__self__, "portworx_volume", portworx_volume)
+        if projected is not None:
+            pulumi.set(__self__, "projected", projected)
+        if quobyte is not None:
+            pulumi.set(__self__, "quobyte", quobyte)
+        if rbd is not None:
+            pulumi.set(__self__, "rbd", rbd)
+        if scale_io is not None:
+            pulumi.set(__self__, "scale_io", scale_io)
+        if secret is not None:
+            pulumi.set(__self__, "secret", secret)
+        if storageos is not None:
+            pulumi.set(__self__, "storageos", storageos)
+        if vsphere_volume is not None:
+            pulumi.set(__self__, "vsphere_volume", vsphere_volume)
+
+    @_builtins.property
+    @pulumi.getter(name="awsElasticBlockStore")
+    def aws_elastic_block_store(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatchArgs']]:
+        return pulumi.get(self, "aws_elastic_block_store")
+
+    @aws_elastic_block_store.setter
+    def aws_elastic_block_store(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatchArgs']]):
+        pulumi.set(self, "aws_elastic_block_store", value)
+
+    @_builtins.property
+    @pulumi.getter(name="azureDisk")
+    def azure_disk(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatchArgs']]:
+        return pulumi.get(self, "azure_disk")
+
+    @azure_disk.setter
+    def azure_disk(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatchArgs']]):
+        pulumi.set(self, "azure_disk", value)
+
+    @_builtins.property
+    @pulumi.getter(name="azureFile")
+    def azure_file(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatchArgs']]:
+        return pulumi.get(self, "azure_file")
+
+    @azure_file.setter
+    def azure_file(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatchArgs']]):
+        pulumi.set(self, "azure_file", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def cephfs(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatchArgs']]:
+        return pulumi.get(self, "cephfs")
+
+    @cephfs.setter
+    def cephfs(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatchArgs']]):
+        pulumi.set(self, "cephfs", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def cinder(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatchArgs']]:
+        return pulumi.get(self, "cinder")
+
+    @cinder.setter
+    def cinder(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatchArgs']]):
+        pulumi.set(self, "cinder", value)
+
+    @_builtins.property
+    @pulumi.getter(name="configMap")
+    def config_map(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatchArgs']]:
+        return pulumi.get(self, "config_map")
+
+    @config_map.setter
+    def config_map(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatchArgs']]):
+        pulumi.set(self, "config_map", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def csi(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatchArgs']]:
+        return pulumi.get(self, "csi")
+
+    @csi.setter
+    def csi(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatchArgs']]):
+        pulumi.set(self, "csi", value)
+
+    @_builtins.property
+    @pulumi.getter(name="downwardAPI")
+    def downward_api(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatchArgs']]:
+        return pulumi.get(self, "downward_api")
+
+    @downward_api.setter
+    def downward_api(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatchArgs']]):
+        pulumi.set(self, "downward_api", value)
+
+    @_builtins.property
+    @pulumi.getter(name="emptyDir")
+    def empty_dir(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatchArgs']]:
+        return pulumi.get(self, "empty_dir")
+
+    @empty_dir.setter
+    def empty_dir(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatchArgs']]):
+        pulumi.set(self, "empty_dir", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def ephemeral(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatchArgs']]:
+        return pulumi.get(self, "ephemeral")
+
+    @ephemeral.setter
+    def ephemeral(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatchArgs']]):
+        pulumi.set(self, "ephemeral", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def fc(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatchArgs']]:
+        return pulumi.get(self, "fc")
+
+    @fc.setter
+    def fc(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatchArgs']]):
+        pulumi.set(self, "fc", value)
+
+    @_builtins.property
+    @pulumi.getter(name="flexVolume")
+    def flex_volume(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatchArgs']]:
+        return pulumi.get(self, "flex_volume")
+
+    @flex_volume.setter
+    def flex_volume(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatchArgs']]):
+        pulumi.set(self, "flex_volume", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def flocker(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatchArgs']]:
+        return pulumi.get(self, "flocker")
+
+    @flocker.setter
+    def flocker(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatchArgs']]):
+        pulumi.set(self, "flocker", value)
+
+    @_builtins.property
+    @pulumi.getter(name="gcePersistentDisk")
+    def gce_persistent_disk(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatchArgs']]:
+        return pulumi.get(self, "gce_persistent_disk")
+
+    @gce_persistent_disk.setter
+    def gce_persistent_disk(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatchArgs']]):
+        pulumi.set(self, "gce_persistent_disk", value)
+
+    @_builtins.property
+    @pulumi.getter(name="gitRepo")
+    def git_repo(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatchArgs']]:
+        return pulumi.get(self, "git_repo")
+
+    @git_repo.setter
+    def git_repo(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatchArgs']]):
+        pulumi.set(self, "git_repo", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def glusterfs(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatchArgs']]:
+        return pulumi.get(self, "glusterfs")
+
+    @glusterfs.setter
+    def glusterfs(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatchArgs']]):
+        pulumi.set(self, "glusterfs", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostPath")
+    def host_path(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatchArgs']]:
+        return pulumi.get(self, "host_path")
+
+    @host_path.setter
+    def host_path(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatchArgs']]):
+        pulumi.set(self, "host_path", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def image(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatchArgs']]:
+        return pulumi.get(self, "image")
+
+    @image.setter
+    def image(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatchArgs']]):
+        pulumi.set(self, "image", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def iscsi(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatchArgs']]:
+        return pulumi.get(self, "iscsi")
+
+    @iscsi.setter
+    def iscsi(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatchArgs']]):
+        pulumi.set(self, "iscsi", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def nfs(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatchArgs']]:
+        return pulumi.get(self, "nfs")
+
+    @nfs.setter
+    def nfs(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatchArgs']]):
+        pulumi.set(self, "nfs", value)
+
+    @_builtins.property
+    @pulumi.getter(name="persistentVolumeClaim")
+    def persistent_volume_claim(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatchArgs']]:
+        return pulumi.get(self, "persistent_volume_claim")
+
+    @persistent_volume_claim.setter
+    def persistent_volume_claim(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatchArgs']]):
+        pulumi.set(self, "persistent_volume_claim", value)
+
+    @_builtins.property
+    @pulumi.getter(name="photonPersistentDisk")
+    def photon_persistent_disk(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatchArgs']]:
+        return pulumi.get(self, "photon_persistent_disk")
+
+    @photon_persistent_disk.setter
+    def photon_persistent_disk(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatchArgs']]):
+        pulumi.set(self, "photon_persistent_disk", value)
+
+    @_builtins.property
+    @pulumi.getter(name="portworxVolume")
+    def portworx_volume(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatchArgs']]:
+        return pulumi.get(self, "portworx_volume")
+
+    @portworx_volume.setter
+    def portworx_volume(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatchArgs']]):
+        pulumi.set(self, "portworx_volume", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def projected(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatchArgs']]:
+        return pulumi.get(self, "projected")
+
+    @projected.setter
+    def projected(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatchArgs']]):
+        pulumi.set(self, "projected", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def quobyte(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatchArgs']]:
+        return pulumi.get(self, "quobyte")
+
+    @quobyte.setter
+    def quobyte(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatchArgs']]):
+        pulumi.set(self, "quobyte", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def rbd(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatchArgs']]:
+        return pulumi.get(self, "rbd")
+
+    @rbd.setter
+    def rbd(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatchArgs']]):
+        pulumi.set(self, "rbd", value)
+
+    @_builtins.property
+    @pulumi.getter(name="scaleIO")
+    def scale_io(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatchArgs']]:
+        return pulumi.get(self, "scale_io")
+
+    @scale_io.setter
+    def scale_io(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatchArgs']]):
+        pulumi.set(self, "scale_io", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def secret(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatchArgs']]:
+        return pulumi.get(self, "secret")
+
+    @secret.setter
+    def secret(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatchArgs']]):
+        pulumi.set(self, "secret", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def storageos(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatchArgs']]:
+        return pulumi.get(self, "storageos")
+
+    @storageos.setter
+    def storageos(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatchArgs']]):
+        pulumi.set(self, "storageos", value)
+
+    @_builtins.property
+    @pulumi.getter(name="vsphereVolume")
+    def vsphere_volume(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatchArgs']]:
+        return pulumi.get(self, "vsphere_volume")
+
+    @vsphere_volume.setter
+    def vsphere_volume(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatchArgs']]):
+        pulumi.set(self, "vsphere_volume", value)
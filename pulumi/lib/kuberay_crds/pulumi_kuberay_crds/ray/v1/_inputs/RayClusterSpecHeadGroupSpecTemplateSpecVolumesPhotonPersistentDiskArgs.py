@@ -0,0 +1,52 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskArgsDict(TypedDict):
+    fs_type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    pd_id: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskArgs:
+    def __init__(__self__, *,
+                 fs_type: pulumi.Input[Optional[_builtins.str]] = None,
+                 pd_id: pulumi.Input[Optional[_builtins.str]] = None):
+        if fs_type is not None:
+            pulumi.set(__self__, "fs_type", fs_type)
+        if pd_id is not None:
+            pulumi.set(__self__, "pd_id", pd_id)
+
+    @_builtins.property
+    @pulumi.getter(name="fsType")
+    def fs_type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "fs_type")
+
+    @fs_type.setter
+    def fs_type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "fs_type", value)
+
+    @_builtins.property
+    @pulumi.getter(name="pdID")
+    def pd_id(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "pd_id")
+
+    @pd_id.setter
+    def pd_id(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "pd_id", value)
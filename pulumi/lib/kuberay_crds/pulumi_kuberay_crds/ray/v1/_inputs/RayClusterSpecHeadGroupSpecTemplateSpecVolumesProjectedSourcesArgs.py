@@ -0,0 +1,104 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesArgsDict(TypedDict):
+    cluster_trust_bundle: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs']]]
+    config_map: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapArgs']]]
+    downward_api: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIArgs']]]
+    pod_certificate: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificateArgs']]]
+    secret: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretArgs']]]
+    service_account_token: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesArgs:
+    def __init__(__self__, *,
+                 cluster_trust_bundle: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs']] = None,
+                 config_map: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapArgs']] = None,
+                 downward_api: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIArgs']] = None,
+                 pod_certificate: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificateArgs']] = None,
+                 secret: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretArgs']] = None,
+                 service_account_token: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs']] = None):
+        if cluster_trust_bundle is not None:
+            pulumi.set(__self__, "cluster_trust_bundle", cluster_trust_bundle)
+        if config_map is not None:
+            pulumi.set(__self__, "config_map", config_map)
+        if downward_api is not None:
+            pulumi.set(__self__, "downward_api", downward_api)
+        if pod_certificate is not None:
+            pulumi.set(__self__, "pod_certificate", pod_certificate)
+        if secret is not None:
+            pulumi.set(__self__, "secret", secret)
+        if service_account_token is not None:
+            pulumi.set(__self__, "service_account_token", service_account_token)
+
+    @_builtins.property
+    @pulumi.getter(name="clusterTrustBundle")
+    def cluster_trust_bundle(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs']]:
+        return pulumi.get(self, "cluster_trust_bundle")
+
+    @cluster_trust_bundle.setter
+    def cluster_trust_bundle(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs']]):
+        pulumi.set(self, "cluster_trust_bundle", value)
+
+    @_builtins.property
+    @pulumi.getter(name="configMap")
+    def config_map(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapArgs']]:
+        return pulumi.get(self, "config_map")
+
+    @config_map.setter
+    def config_map(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapArgs']]):
+        pulumi.set(self, "config_map", value)
+
+    @_builtins.property
+    @pulumi.getter(name="downwardAPI")
+    def downward_api(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIArgs']]:
+        return pulumi.get(self, "downward_api")
+
+    @downward_api.setter
+    def downward_api(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIArgs']]):
+        pulumi.set(self, "downward_api", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podCertificate")
+    def pod_certificate(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificateArgs']]:
+        return pulumi.get(self, "pod_certificate")
+
+    @pod_certificate.setter
+    def pod_certificate(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificateArgs']]):
+        pulumi.set(self, "pod_certificate", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def secret(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretArgs']]:
+        return pulumi.get(self, "secret")
+
+    @secret.setter
+    def secret(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretArgs']]):
+        pulumi.set(self, "secret", value)
+
+    @_builtins.property
+    @pulumi.getter(name="serviceAccountToken")
+    def service_account_token(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs']]:
+        return pulumi.get(self, "service_account_token")
+
+    @service_account_token.setter
+    def service_account_token(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs']]):
+        pulumi.set(self, "service_account_token", value)
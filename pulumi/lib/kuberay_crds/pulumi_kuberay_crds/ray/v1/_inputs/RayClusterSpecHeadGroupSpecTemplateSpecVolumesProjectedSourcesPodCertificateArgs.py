@@ -0,0 +1,117 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificateArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificateArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificateArgsDict(TypedDict):
+    certificate_chain_path: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    credential_bundle_path: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    key_path: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    key_type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    max_expiration_seconds: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    signer_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    user_annotations: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificateArgs:
+    def __init__(__self__, *,
+                 certificate_chain_path: pulumi.Input[Optional[_builtins.str]] = None,
+                 credential_bundle_path: pulumi.Input[Optional[_builtins.str]] = None,
+                 key_path: pulumi.Input[Optional[_builtins.str]] = None,
+                 key_type: pulumi.Input[Optional[_builtins.str]] = None,
+                 max_expiration_seconds: pulumi.Input[Optional[_builtins.int]] = None,
+                 signer_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 user_annotations: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
+        if certificate_chain_path is not None:
+            pulumi.set(__self__, "certificate_chain_path", certificate_chain_path)
+        if credential_bundle_path is not None:
+            pulumi.set(__self__, "credential_bundle_path", credential_bundle_path)
+        if key_path is not None:
+            pulumi.set(__self__, "key_path", key_path)
+        if key_type is not None:
+            pulumi.set(__self__, "key_type", key_type)
+        if max_expiration_seconds is not None:
+            pulumi.set(__self__, "max_expiration_seconds", max_expiration_seconds)
+        if signer_name is not None:
+            pulumi.set(__self__, "signer_name", signer_name)
+        if user_annotations is not None:
+            pulumi.set(__self__, "user_annotations", user_annotations)
+
+    @_builtins.property
+    @pulumi.getter(name="certificateChainPath")
+    def certificate_chain_path(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "certificate_chain_path")
+
+    @certificate_chain_path.setter
+    def certificate_chain_path(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "certificate_chain_path", value)
+
+    @_builtins.property
+    @pulumi.getter(name="credentialBundlePath")
+    def credential_bundle_path(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "credential_bundle_path")
+
+    @credential_bundle_path.setter
+    def credential_bundle_path(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "credential_bundle_path", value)
+
+    @_builtins.property
+    @pulumi.getter(name="keyPath")
+    def key_path(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "key_path")
+
+    @key_path.setter
+    def key_path(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "key_path", value)
+
+    @_builtins.property
+    @pulumi.getter(name="keyType")
+    def key_type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "key_type")
+
+    @key_type.setter
+    def key_type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "key_type", value)
+
+    @_builtins.property
+    @pulumi.getter(name="maxExpirationSeconds")
+    def max_expiration_seconds(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "max_expiration_seconds")
+
+    @max_expiration_seconds.setter
+    def max_expiration_seconds(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "max_expiration_seconds", value)
+
+    @_builtins.property
+    @pulumi.getter(name="signerName")
+    def signer_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "signer_name")
+
+    @signer_name.setter
+    def signer_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "signer_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="userAnnotations")
+    def user_annotations(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "user_annotations")
+
+    @user_annotations.setter
+    def user_annotations(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "user_annotations", value)
@@ -0,0 +1,182 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecWorkerGroupSpecsPatchArgsDict', 'RayClusterSpecWorkerGroupSpecsPatchArgs']
+
+class RayClusterSpecWorkerGroupSpecsPatchArgsDict(TypedDict):
+    group_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    idle_timeout_seconds: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+    max_replicas: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    min_replicas: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    num_of_hosts: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    ray_start_params: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+    replicas: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    resources: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+    scale_strategy: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsScaleStrategyPatchArgs']]]
+    suspend: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    template: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplatePatchArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecWorkerGroupSpecsPatchArgs:
+    def __init__(__self__, *,
+                 group_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 idle_timeout_seconds: pulumi.Input[Optional[_builtins.int]] = None,
+                 labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
+                 max_replicas: pulumi.Input[Optional[_builtins.int]] = None,
+                 min_replicas: pulumi.Input[Optional[_builtins.int]] = None,
+                 num_of_hosts: pulumi.Input[Optional[_builtins.int]] = None,
+                 ray_start_params: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
+                 replicas: pulumi.Input[Optional[_builtins.int]] = None,
+                 resources: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
+                 scale_strategy: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsScaleStrategyPatchArgs']] = None,
+                 suspend: pulumi.Input[Optional[_builtins.bool]] = None,
+                 template: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplatePatchArgs']] = None):
+        if group_name is not None:
+            pulumi.set(__self__, "group_name", group_name)
+        if idle_timeout_seconds is not None:
+            pulumi.set(__self__, "idle_timeout_seconds", idle_timeout_seconds)
+        if labels is not None:
+            pulumi.set(__self__, "labels", labels)
+        if max_replicas is not None:
+            pulumi.set(__self__, "max_replicas", max_replicas)
+        if min_replicas is not None:
+            pulumi.set(__self__, "min_replicas", min_replicas)
+        if num_of_hosts is not None:
+            pulumi.set(__self__, "num_of_hosts", num_of_hosts)
+        if ray_start_params is not None:
+            pulumi.set(__self__, "ray_start_params", ray_start_params)
+        if replicas is not None:
+            pulumi.set(__self__, "replicas", replicas)
+        if resources is not None:
+            pulumi.set(__self__, "resources", resources)
+        if scale_strategy is not None:
+            pulumi.set(__self__, "scale_strategy", scale_strategy)
+        if suspend is not None:
+            pulumi.set(__self__, "suspend", suspend)
+        if template is not None:
+            pulumi.set(__self__, "template", template)
+
+    @_builtins.property
+    @pulumi.getter(name="groupName")
+    def group_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "group_name")
+
+    @group_name.setter
+    def group_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "group_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="idleTimeoutSeconds")
+    def idle_timeout_seconds(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "idle_timeout_seconds")
+
+    @idle_timeout_seconds.setter
+    def idle_timeout_seconds(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "idle_timeout_seconds", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "labels")
+
+    @labels.setter
+    def labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "labels", value)
+
+    @_builtins.property
+    @pulumi.getter(name="maxReplicas")
+    def max_replicas(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "max_replicas")
+
+    @max_replicas.setter
+    def max_replicas(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "max_replicas", value)
+
+    @_builtins.property
+    @pulumi.getter(name="minReplicas")
+    def min_replicas(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "min_replicas")
+
+    @min_replicas.setter
+    def min_replicas(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "min_replicas", value)
+
+    @_builtins.property
+    @pulumi.getter(name="numOfHosts")
+    def num_of_hosts(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "num_of_hosts")
+
+    @num_of_hosts.setter
+    def num_of_hosts(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "num_of_hosts", value)
+
+    @_builtins.property
+    @pulumi.getter(name="rayStartParams")
+    def ray_start_params(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "ray_start_params")
+
+    @ray_start_params.setter
+    def ray_start_params(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "ray_start_params", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def replicas(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "replicas")
+
+    @replicas.setter
+    def replicas(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "replicas", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def resources(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "resources")
+
+    @resources.setter
+    def resources(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "resources", value)
+
+    @_builtins.property
+    @pulumi.getter(name="scaleStrategy")
+    def scale_strategy(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsScaleStrategyPatchArgs']]:
+        return pulumi.get(self, "scale_strategy")
+
+    @scale_strategy.setter
+    def scale_strategy(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsScaleStrategyPatchArgs']]):
+        pulumi.set(self, "scale_strategy", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def suspend(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "suspend")
+
+    @suspend.setter
+    def suspend(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "suspend", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def template(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplatePatchArgs']]:
+        return pulumi.get(self, "template")
+
+    @template.setter
+    def template(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplatePatchArgs']]):
+        pulumi.set(self, "template", value)
@@ -0,0 +1,65 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityArgsDict', 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityArgs']
+
+class RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityArgsDict(TypedDict):
+    node_affinity: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityArgs']]]
+    pod_affinity: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityArgs']]]
+    pod_anti_affinity: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityArgs:
+    def __init__(__self__, *,
+                 node_affinity: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityArgs']] = None,
+                 pod_affinity: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityArgs']] = None,
+                 pod_anti_affinity: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityArgs']] = None):
+        if node_affinity is not None:
+            pulumi.set(__self__, "node_affinity", node_affinity)
+        if pod_affinity is not None:
+            pulumi.set(__self__, "pod_affinity", pod_affinity)
+        if pod_anti_affinity is not None:
+            pulumi.set(__self__, "pod_anti_affinity", pod_anti_affinity)
+
+    @_builtins.property
+    @pulumi.getter(name="nodeAffinity")
+    def node_affinity(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityArgs']]:
+        return pulumi.get(self, "node_affinity")
+
+    @node_affinity.setter
+    def node_affinity(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityArgs']]):
+        pulumi.set(self, "node_affinity", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podAffinity")
+    def pod_affinity(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityArgs']]:
+        return pulumi.get(self, "pod_affinity")
+
+    @pod_affinity.setter
+    def pod_affinity(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityArgs']]):
+        pulumi.set(self, "pod_affinity", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podAntiAffinity")
+    def pod_anti_affinity(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityArgs']]:
+        return pulumi.get(self, "pod_anti_affinity")
+
+    @pod_anti_affinity.setter
+    def pod_anti_affinity(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityArgs']]):
+        pulumi.set(self, "pod_anti_affinity", value)
@@ -0,0 +1,39 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatchArgsDict', 'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatchArgs']
+
+class RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatchArgsDict(TypedDict):
+    condition_type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatchArgs:
+    def __init__(__self__, *,
+                 condition_type: pulumi.Input[Optional[_builtins.str]] = None):
+        if condition_type is not None:
+            pulumi.set(__self__, "condition_type", condition_type)
+
+    @_builtins.property
+    @pulumi.getter(name="conditionType")
+    def condition_type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "condition_type")
+
+    @condition_type.setter
+    def condition_type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "condition_type", value)
@@ -0,0 +1,104 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskArgsDict', 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskArgs']
+
+class RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskArgsDict(TypedDict):
+    caching_mode: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    disk_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    disk_uri: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    fs_type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    kind: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    read_only: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+
+
+@pulumi.input_type
+class RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskArgs:
+    def __init__(__self__, *,
+                 caching_mode: pulumi.Input[Optional[_builtins.str]] = None,
+                 disk_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 disk_uri: pulumi.Input[Optional[_builtins.str]] = None,
+                 fs_type: pulumi.Input[Optional[_builtins.str]] = None,
+                 kind: pulumi.Input[Optional[_builtins.str]] = None,
+                 read_only: pulumi.Input[Optional[_builtins.bool]] = None):
+        if caching_mode is not None:
+            pulumi.set(__self__, "caching_mode", caching_mode)
+        if disk_name is not None:
+            pulumi.set(__self__, "disk_name", disk_name)
+        if disk_uri is not None:
+            pulumi.set(__self__, "disk_uri", disk_uri)
+        if fs_type is not None:
+            pulumi.set(__self__, "fs_type", fs_type)
+        if kind is not None:
+            pulumi.set(__self__, "kind", kind)
+        if read_only is not None:
+            pulumi.set(__self__, "read_only", read_only)
+
+    @_builtins.property
+    @pulumi.getter(name="cachingMode")
+    def caching_mode(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "caching_mode")
+
+    @caching_mode.setter
+    def caching_mode(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "caching_mode", value)
+
+    @_builtins.property
+    @pulumi.getter(name="diskName")
+    def disk_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "disk_name")
+
+    @disk_name.setter
+    def disk_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "disk_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="diskURI")
+    def disk_uri(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "disk_uri")
+
+    @disk_uri.setter
+    def disk_uri(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "disk_uri", value)
+
+    @_builtins.property
+    @pulumi.getter(name="fsType")
+    def fs_type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "fs_type")
+
+    @fs_type.setter
+    def fs_type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "fs_type", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def kind(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "kind")
+
+    @kind.setter
+    def kind(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "kind", value)
+
+    @_builtins.property
+    @pulumi.getter(name="readOnly")
+    def read_only(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "read_only")
+
+    @read_only.setter
+    def read_only(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "read_only", value)
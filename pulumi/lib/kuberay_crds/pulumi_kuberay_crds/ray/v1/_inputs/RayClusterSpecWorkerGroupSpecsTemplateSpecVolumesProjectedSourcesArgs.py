@@ -0,0 +1,104 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesArgsDict', 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesArgs']
+
+class RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesArgsDict(TypedDict):
+    cluster_trust_bundle: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs']]]
+    config_map: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapArgs']]]
+    downward_api: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIArgs']]]
+    pod_certificate: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificateArgs']]]
+    secret: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretArgs']]]
+    service_account_token: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesArgs:
+    def __init__(__self__, *,
+                 cluster_trust_bundle: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs']] = None,
+                 config_map: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapArgs']] = None,
+                 downward_api: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIArgs']] = None,
+                 pod_certificate: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificateArgs']] = None,
+                 secret: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretArgs']] = None,
+                 service_account_token: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs']] = None):
+        if cluster_trust_bundle is not None:
+            pulumi.set(__self__, "cluster_trust_bundle", cluster_trust_bundle)
+        if config_map is not None:
+            pulumi.set(__self__, "config_map", config_map)
+        if downward_api is not None:
+            pulumi.set(__self__, "downward_api", downward_api)
+        if pod_certificate is not None:
+            pulumi.set(__self__, "pod_certificate", pod_certificate)
+        if secret is not None:
+            pulumi.set(__self__, "secret", secret)
+        if service_account_token is not None:
+            pulumi.set(__self__, "service_account_token", service_account_token)
+
+    @_builtins.property
+    @pulumi.getter(name="clusterTrustBundle")
+    def cluster_trust_bundle(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs']]:
+        return pulumi.get(self, "cluster_trust_bundle")
+
+    @cluster_trust_bundle.setter
+    def cluster_trust_bundle(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs']]):
+        pulumi.set(self, "cluster_trust_bundle", value)
+
+    @_builtins.property
+    @pulumi.getter(name="configMap")
+    def config_map(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapArgs']]:
+        return pulumi.get(self, "config_map")
+
+    @config_map.setter
+    def config_map(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapArgs']]):
+        pulumi.set(self, "config_map", value)
+
+    @_builtins.property
+    @pulumi.getter(name="downwardAPI")
+    def downward_api(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIArgs']]:
+        return pulumi.get(self, "downward_api")
+
+    @downward_api.setter
+    def downward_api(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIArgs']]):
+        pulumi.set(self, "downward_api", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podCertificate")
+    def pod_certificate(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificateArgs']]:
+        return pulumi.get(self, "pod_certificate")
+
+    @pod_certificate.setter
+    def pod_certificate(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificateArgs']]):
+        pulumi.set(self, "pod_certificate", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def secret(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretArgs']]:
+        return pulumi.get(self, "secret")
+
+    @secret.setter
+    def secret(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretArgs']]):
+        pulumi.set(self, "secret", value)
+
+    @_builtins.property
+    @pulumi.getter(name="serviceAccountToken")
+    def service_account_token(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs']]:
+        return pulumi.get(self, "service_account_token")
+
+    @service_account_token.setter
+    def service_account_token(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs']]):
+        pulumi.set(self, "service_account_token", value)
@@ -0,0 +1,65 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefArgsDict', 'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefArgs']
+
+class RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefArgsDict(TypedDict):
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    pod_group: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    pod_group_replica_key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefArgs:
+    def __init__(__self__, *,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 pod_group: pulumi.Input[Optional[_builtins.str]] = None,
+                 pod_group_replica_key: pulumi.Input[Optional[_builtins.str]] = None):
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if pod_group is not None:
+            pulumi.set(__self__, "pod_group", pod_group)
+        if pod_group_replica_key is not None:
+            pulumi.set(__self__, "pod_group_replica_key", pod_group_replica_key)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podGroup")
+    def pod_group(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "pod_group")
+
+    @pod_group.setter
+    def pod_group(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "pod_group", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podGroupReplicaKey")
+    def pod_group_replica_key(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "pod_group_replica_key")
+
+    @pod_group_replica_key.setter
+    def pod_group_replica_key(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "pod_group_replica_key", value)
@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterStatusHeadArgsDict', 'RayClusterStatusHeadArgs']
+
+class RayClusterStatusHeadArgsDict(TypedDict):
+    pod_ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    pod_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    service_ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    service_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterStatusHeadArgs:
+    def __init__(__self__, *,
+                 pod_ip: pulumi.Input[Optional[_builtins.str]] = None,
+                 pod_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 service_ip: pulumi.Input[Optional[_builtins.str]] = None,
+                 service_name: pulumi.Input[Optional[_builtins.str]] = None):
+        if pod_ip is not None:
+            pulumi.set(__self__, "pod_ip", pod_ip)
+        if pod_name is not None:
+            pulumi.set(__self__, "pod_name", pod_name)
+        if service_ip is not None:
+            pulumi.set(__self__, "service_ip", service_ip)
+        if service_name is not None:
+            pulumi.set(__self__, "service_name", service_name)
+
+    @_builtins.property
+    @pulumi.getter(name="podIP")
+    def pod_ip(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "pod_ip")
+
+    @pod_ip.setter
+    def pod_ip(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "pod_ip", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podName")
+    def pod_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "pod_name")
+
+    @pod_name.setter
+    def pod_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "pod_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="serviceIP")
+    def service_ip(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "service_ip")
+
+    @service_ip.setter
+    def service_ip(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "service_ip", value)
+
+    @_builtins.property
+    @pulumi.getter(name="serviceName")
+    def service_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "service_name")
+
+    @service_name.setter
+    def service_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "service_name", value)
@@ -0,0 +1,6407 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import importlib
+import typing
+
+__all__ = [
+    'RayClusterSpecAuthOptionsPatchArgsDict',
+    'RayClusterSpecAuthOptionsPatchArgs',
+    'RayClusterSpecAuthOptionsArgsDict',
+    'RayClusterSpecAuthOptionsArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvFromPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromSecretRefPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvFromSecretRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromSecretRefArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvFromSecretRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvFromArgs',
+    'RayClusterSpecAutoscalerOptionsEnvPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromArgs',
+    'RayClusterSpecAutoscalerOptionsEnvArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvArgs',
+    'RayClusterSpecAutoscalerOptionsPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsResourcesClaimsPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsResourcesClaimsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsResourcesClaimsArgsDict',
+    'RayClusterSpecAutoscalerOptionsResourcesClaimsArgs',
+    'RayClusterSpecAutoscalerOptionsResourcesPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsResourcesPatchArgs',
+    'RayClusterSpecAutoscalerOptionsResourcesArgsDict',
+    'RayClusterSpecAutoscalerOptionsResourcesArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfileArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextPatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfileArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfileArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextArgs',
+    'RayClusterSpecAutoscalerOptionsVolumeMountsPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsVolumeMountsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsVolumeMountsArgsDict',
+    'RayClusterSpecAutoscalerOptionsVolumeMountsArgs',
+    'RayClusterSpecAutoscalerOptionsArgsDict',
+    'RayClusterSpecAutoscalerOptionsArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsPatchArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordPatchArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefPatchArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefPatchArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefPatchArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromPatchArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefPatchArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefPatchArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernamePatchArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernamePatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRefPatchArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRefArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRefPatchArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRefArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRefPatchArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRefArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromPatchArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRefPatchArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRefArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRefPatchArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRefArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsArgsDict',
+    'RayClusterSpecGcsFaultToleranceOptionsArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceMetadataPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceMetadataPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceMetadataArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceMetadataArgs',
+    'RayClusterSpecHeadGroupSpecHeadServicePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServicePatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceArgs',
+    'RayClusterSpecHeadGroupSpecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateMetadataPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateMetadataPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateMetadataArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateMetadataArgs',
+    'RayClusterSpecHeadGroupSpecTemplatePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplatePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecycleArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecycleArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfilePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfileArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfilePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfileArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecycleArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecycleArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfileArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfileArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecycleArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecycleArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfilePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfileArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfilePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfileArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecOsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecOsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecOsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecOsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfileArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfileArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStoreArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStoreArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFileArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImageArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImageArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificatePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificatePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificateArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificateArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobyteArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobyteArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateArgs',
+    'RayClusterSpecHeadGroupSpecArgsDict',
+    'RayClusterSpecHeadGroupSpecArgs',
+    'RayClusterSpecPatchArgsDict',
+    'RayClusterSpecPatchArgs',
+    'RayClusterSpecUpgradeStrategyPatchArgsDict',
+    'RayClusterSpecUpgradeStrategyPatchArgs',
+    'RayClusterSpecUpgradeStrategyArgsDict',
+    'RayClusterSpecUpgradeStrategyArgs',
+    'RayClusterSpecWorkerGroupSpecsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsScaleStrategyPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsScaleStrategyPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsScaleStrategyArgsDict',
+    'RayClusterSpecWorkerGroupSpecsScaleStrategyArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateMetadataPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateMetadataPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateMetadataArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateMetadataArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplatePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplatePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecycleArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecycleArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfilePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfileArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfilePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfileArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecycleArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecycleArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfileArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfileArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecycleArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecycleArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfilePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfileArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfilePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfileArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecOsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecOsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecOsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecOsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfilePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfileArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfilePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfileArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStorePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStorePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStoreArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStoreArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFilePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFileArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImagePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImagePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImageArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImageArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificatePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificatePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificateArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificateArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobytePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobytePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobyteArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobyteArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateArgs',
+    'RayClusterSpecWorkerGroupSpecsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsArgs',
+    'RayClusterSpecArgsDict',
+    'RayClusterSpecArgs',
+    'RayClusterStatusConditionsArgsDict',
+    'RayClusterStatusConditionsArgs',
+    'RayClusterStatusHeadArgsDict',
+    'RayClusterStatusHeadArgs',
+    'RayClusterStatusArgsDict',
+    'RayClusterStatusArgs',
+    'RayClusterArgsDict',
+    'RayClusterArgs',
+]
+
+_TYPE_MODULES = {
+    'RayClusterSpecAuthOptionsPatchArgsDict': 'RayClusterSpecAuthOptionsPatchArgs',
+    'RayClusterSpecAuthOptionsPatchArgs': 'RayClusterSpecAuthOptionsPatchArgs',
+    'RayClusterSpecAuthOptionsArgsDict': 'RayClusterSpecAuthOptionsArgs',
+    'RayClusterSpecAuthOptionsArgs': 'RayClusterSpecAuthOptionsArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefPatchArgsDict': 'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefPatchArgs': 'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefArgsDict': 'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefArgs': 'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromPatchArgsDict': 'RayClusterSpecAutoscalerOptionsEnvFromPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromPatchArgs': 'RayClusterSpecAutoscalerOptionsEnvFromPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromSecretRefPatchArgsDict': 'RayClusterSpecAutoscalerOptionsEnvFromSecretRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromSecretRefPatchArgs': 'RayClusterSpecAutoscalerOptionsEnvFromSecretRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromSecretRefArgsDict': 'RayClusterSpecAutoscalerOptionsEnvFromSecretRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromSecretRefArgs': 'RayClusterSpecAutoscalerOptionsEnvFromSecretRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromArgsDict': 'RayClusterSpecAutoscalerOptionsEnvFromArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromArgs': 'RayClusterSpecAutoscalerOptionsEnvFromArgs',
+    'RayClusterSpecAutoscalerOptionsEnvPatchArgsDict': 'RayClusterSpecAutoscalerOptionsEnvPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvPatchArgs': 'RayClusterSpecAutoscalerOptionsEnvPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefPatchArgsDict': 'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefPatchArgs': 'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefArgsDict': 'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefArgs': 'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefPatchArgsDict': 'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefPatchArgs': 'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefArgsDict': 'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefArgs': 'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefPatchArgsDict': 'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefPatchArgs': 'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefArgsDict': 'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefArgs': 'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromPatchArgsDict': 'RayClusterSpecAutoscalerOptionsEnvValueFromPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromPatchArgs': 'RayClusterSpecAutoscalerOptionsEnvValueFromPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefPatchArgsDict': 'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefPatchArgs': 'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefArgsDict': 'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefArgs': 'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefPatchArgsDict': 'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefPatchArgs': 'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefArgsDict': 'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefArgs': 'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromArgsDict': 'RayClusterSpecAutoscalerOptionsEnvValueFromArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromArgs': 'RayClusterSpecAutoscalerOptionsEnvValueFromArgs',
+    'RayClusterSpecAutoscalerOptionsEnvArgsDict': 'RayClusterSpecAutoscalerOptionsEnvArgs',
+    'RayClusterSpecAutoscalerOptionsEnvArgs': 'RayClusterSpecAutoscalerOptionsEnvArgs',
+    'RayClusterSpecAutoscalerOptionsPatchArgsDict': 'RayClusterSpecAutoscalerOptionsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsPatchArgs': 'RayClusterSpecAutoscalerOptionsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsResourcesClaimsPatchArgsDict': 'RayClusterSpecAutoscalerOptionsResourcesClaimsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsResourcesClaimsPatchArgs': 'RayClusterSpecAutoscalerOptionsResourcesClaimsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsResourcesClaimsArgsDict': 'RayClusterSpecAutoscalerOptionsResourcesClaimsArgs',
+    'RayClusterSpecAutoscalerOptionsResourcesClaimsArgs': 'RayClusterSpecAutoscalerOptionsResourcesClaimsArgs',
+    'RayClusterSpecAutoscalerOptionsResourcesPatchArgsDict': 'RayClusterSpecAutoscalerOptionsResourcesPatchArgs',
+    'RayClusterSpecAutoscalerOptionsResourcesPatchArgs': 'RayClusterSpecAutoscalerOptionsResourcesPatchArgs',
+    'RayClusterSpecAutoscalerOptionsResourcesArgsDict': 'RayClusterSpecAutoscalerOptionsResourcesArgs',
+    'RayClusterSpecAutoscalerOptionsResourcesArgs': 'RayClusterSpecAutoscalerOptionsResourcesArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatchArgsDict': 'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatchArgs': 'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfileArgsDict': 'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfileArgs': 'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatchArgsDict': 'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatchArgs': 'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesArgsDict': 'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesArgs': 'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextPatchArgsDict': 'RayClusterSpecAutoscalerOptionsSecurityContextPatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextPatchArgs': 'RayClusterSpecAutoscalerOptionsSecurityContextPatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatchArgsDict': 'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatchArgs': 'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsArgsDict': 'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsArgs': 'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatchArgsDict': 'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatchArgs': 'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfileArgsDict': 'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfileArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfileArgs': 'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfileArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatchArgsDict': 'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatchArgs': 'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsArgsDict': 'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsArgs': 'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextArgsDict': 'RayClusterSpecAutoscalerOptionsSecurityContextArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextArgs': 'RayClusterSpecAutoscalerOptionsSecurityContextArgs',
+    'RayClusterSpecAutoscalerOptionsVolumeMountsPatchArgsDict': 'RayClusterSpecAutoscalerOptionsVolumeMountsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsVolumeMountsPatchArgs': 'RayClusterSpecAutoscalerOptionsVolumeMountsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsVolumeMountsArgsDict': 'RayClusterSpecAutoscalerOptionsVolumeMountsArgs',
+    'RayClusterSpecAutoscalerOptionsVolumeMountsArgs': 'RayClusterSpecAutoscalerOptionsVolumeMountsArgs',
+    'RayClusterSpecAutoscalerOptionsArgsDict': 'RayClusterSpecAutoscalerOptionsArgs',
+    'RayClusterSpecAutoscalerOptionsArgs': 'RayClusterSpecAutoscalerOptionsArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsPatchArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsPatchArgs': 'RayClusterSpecGcsFaultToleranceOptionsPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordPatchArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordPatchArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefPatchArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefPatchArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefPatchArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefPatchArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefPatchArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefPatchArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromPatchArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromPatchArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefPatchArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefPatchArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefPatchArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefPatchArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernamePatchArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernamePatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernamePatchArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernamePatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRefPatchArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRefPatchArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRefArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRefArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRefPatchArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRefPatchArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRefArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRefArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRefPatchArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRefPatchArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRefArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRefArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromPatchArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromPatchArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRefPatchArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRefPatchArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRefArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRefArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRefPatchArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRefPatchArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRefArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRefArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRefArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameArgs': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsArgsDict': 'RayClusterSpecGcsFaultToleranceOptionsArgs',
+    'RayClusterSpecGcsFaultToleranceOptionsArgs': 'RayClusterSpecGcsFaultToleranceOptionsArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceMetadataPatchArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceMetadataPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceMetadataPatchArgs': 'RayClusterSpecHeadGroupSpecHeadServiceMetadataPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceMetadataArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceMetadataArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceMetadataArgs': 'RayClusterSpecHeadGroupSpecHeadServiceMetadataArgs',
+    'RayClusterSpecHeadGroupSpecHeadServicePatchArgsDict': 'RayClusterSpecHeadGroupSpecHeadServicePatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServicePatchArgs': 'RayClusterSpecHeadGroupSpecHeadServicePatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPatchArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceSpecPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPatchArgs': 'RayClusterSpecHeadGroupSpecHeadServiceSpecPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsPatchArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsPatchArgs': 'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsArgs': 'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPPatchArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPPatchArgs': 'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPArgs': 'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatchArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatchArgs': 'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigArgs': 'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceSpecArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecArgs': 'RayClusterSpecHeadGroupSpecHeadServiceSpecArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsPatchArgs': 'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsArgs': 'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatchArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatchArgs': 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsPatchArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsPatchArgs': 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsArgs': 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressArgs': 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerPatchArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerPatchArgs': 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerArgs': 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusPatchArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceStatusPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusPatchArgs': 'RayClusterSpecHeadGroupSpecHeadServiceStatusPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceStatusArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusArgs': 'RayClusterSpecHeadGroupSpecHeadServiceStatusArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceArgsDict': 'RayClusterSpecHeadGroupSpecHeadServiceArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceArgs': 'RayClusterSpecHeadGroupSpecHeadServiceArgs',
+    'RayClusterSpecHeadGroupSpecPatchArgsDict': 'RayClusterSpecHeadGroupSpecPatchArgs',
+    'RayClusterSpecHeadGroupSpecPatchArgs': 'RayClusterSpecHeadGroupSpecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateMetadataPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateMetadataPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateMetadataPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateMetadataPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateMetadataArgsDict': 'RayClusterSpecHeadGroupSpecTemplateMetadataArgs',
+    'RayClusterSpecHeadGroupSpecTemplateMetadataArgs': 'RayClusterSpecHeadGroupSpecTemplateMetadataArgs',
+    'RayClusterSpecHeadGroupSpecTemplatePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplatePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplatePatchArgs': 'RayClusterSpecHeadGroupSpecTemplatePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecycleArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecycleArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecycleArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecycleArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfilePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfilePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfileArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfileArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfilePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfilePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfileArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfileArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecycleArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecycleArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecycleArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecycleArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfileArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfileArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfileArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfileArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecycleArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecycleArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecycleArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecycleArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfilePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfilePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfileArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfileArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfilePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfilePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfileArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfileArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecOsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecOsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecOsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecOsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecOsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecOsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecOsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecOsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfileArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfileArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfileArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfileArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStoreArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStoreArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStoreArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStoreArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFileArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFileArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImageArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImageArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImageArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImageArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumeArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumeArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificatePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificatePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificatePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificatePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificateArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificateArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificateArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificateArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobyteArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobyteArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobyteArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobyteArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumeArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumeArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefPatchArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefPatchArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecArgsDict': 'RayClusterSpecHeadGroupSpecTemplateSpecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecArgs': 'RayClusterSpecHeadGroupSpecTemplateSpecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateArgsDict': 'RayClusterSpecHeadGroupSpecTemplateArgs',
+    'RayClusterSpecHeadGroupSpecTemplateArgs': 'RayClusterSpecHeadGroupSpecTemplateArgs',
+    'RayClusterSpecHeadGroupSpecArgsDict': 'RayClusterSpecHeadGroupSpecArgs',
+    'RayClusterSpecHeadGroupSpecArgs': 'RayClusterSpecHeadGroupSpecArgs',
+    'RayClusterSpecPatchArgsDict': 'RayClusterSpecPatchArgs',
+    'RayClusterSpecPatchArgs': 'RayClusterSpecPatchArgs',
+    'RayClusterSpecUpgradeStrategyPatchArgsDict': 'RayClusterSpecUpgradeStrategyPatchArgs',
+    'RayClusterSpecUpgradeStrategyPatchArgs': 'RayClusterSpecUpgradeStrategyPatchArgs',
+    'RayClusterSpecUpgradeStrategyArgsDict': 'RayClusterSpecUpgradeStrategyArgs',
+    'RayClusterSpecUpgradeStrategyArgs': 'RayClusterSpecUpgradeStrategyArgs',
+    'RayClusterSpecWorkerGroupSpecsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsPatchArgs': 'RayClusterSpecWorkerGroupSpecsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsScaleStrategyPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsScaleStrategyPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsScaleStrategyPatchArgs': 'RayClusterSpecWorkerGroupSpecsScaleStrategyPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsScaleStrategyArgsDict': 'RayClusterSpecWorkerGroupSpecsScaleStrategyArgs',
+    'RayClusterSpecWorkerGroupSpecsScaleStrategyArgs': 'RayClusterSpecWorkerGroupSpecsScaleStrategyArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateMetadataPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateMetadataPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateMetadataPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateMetadataPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateMetadataArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateMetadataArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateMetadataArgs': 'RayClusterSpecWorkerGroupSpecsTemplateMetadataArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplatePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplatePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplatePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplatePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecycleArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecycleArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecycleArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecycleArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfilePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfilePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfileArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfileArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfilePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfilePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfileArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfileArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecycleArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecycleArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecycleArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecycleArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfileArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfileArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfileArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfileArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecycleArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecycleArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecycleArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecycleArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfilePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfilePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfileArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfileArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfilePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfilePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfileArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfileArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecOsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecOsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecOsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecOsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecOsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecOsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecOsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecOsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfilePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfilePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfileArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfileArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfilePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfilePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfileArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfileArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStorePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStorePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStorePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStorePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStoreArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStoreArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStoreArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStoreArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFilePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFilePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFileArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFileArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImagePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImagePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImagePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImagePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImageArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImageArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImageArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImageArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumeArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumeArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificatePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificatePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificatePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificatePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificateArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificateArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificateArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificateArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobytePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobytePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobytePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobytePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobyteArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobyteArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobyteArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobyteArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumePatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumePatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumeArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumeArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefPatchArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefPatchArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateSpecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecArgs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateArgsDict': 'RayClusterSpecWorkerGroupSpecsTemplateArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateArgs': 'RayClusterSpecWorkerGroupSpecsTemplateArgs',
+    'RayClusterSpecWorkerGroupSpecsArgsDict': 'RayClusterSpecWorkerGroupSpecsArgs',
+    'RayClusterSpecWorkerGroupSpecsArgs': 'RayClusterSpecWorkerGroupSpecsArgs',
+    'RayClusterSpecArgsDict': 'RayClusterSpecArgs',
+    'RayClusterSpecArgs': 'RayClusterSpecArgs',
+    'RayClusterStatusConditionsArgsDict': 'RayClusterStatusConditionsArgs',
+    'RayClusterStatusConditionsArgs': 'RayClusterStatusConditionsArgs',
+    'RayClusterStatusHeadArgsDict': 'RayClusterStatusHeadArgs',
+    'RayClusterStatusHeadArgs': 'RayClusterStatusHeadArgs',
+    'RayClusterStatusArgsDict': 'RayClusterStatusArgs',
+    'RayClusterStatusArgs': 'RayClusterStatusArgs',
+    'RayClusterArgsDict': 'RayClusterArgs',
+    'RayClusterArgs': 'RayClusterArgs',
+}
+
+if typing.TYPE_CHECKING:
+    from .RayClusterSpecAuthOptionsPatchArgs import *
+    from .RayClusterSpecAuthOptionsArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefPatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvFromPatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvFromSecretRefPatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvFromSecretRefArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvFromArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvPatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefPatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefPatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefPatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromPatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefPatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefPatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromArgs import *
+    from .RayClusterSpecAutoscalerOptionsEnvArgs import *
+    from .RayClusterSpecAutoscalerOptionsPatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsResourcesClaimsPatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsResourcesClaimsArgs import *
+    from .RayClusterSpecAutoscalerOptionsResourcesPatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsResourcesArgs import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfileArgs import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesArgs import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextPatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsArgs import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfileArgs import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsArgs import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextArgs import *
+    from .RayClusterSpecAutoscalerOptionsVolumeMountsPatchArgs import *
+    from .RayClusterSpecAutoscalerOptionsVolumeMountsArgs import *
+    from .RayClusterSpecAutoscalerOptionsArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsPatchArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordPatchArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefPatchArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefPatchArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefPatchArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromPatchArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefPatchArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefPatchArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernamePatchArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRefPatchArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRefArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRefPatchArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRefArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRefPatchArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRefArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromPatchArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRefPatchArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRefArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRefPatchArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRefArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameArgs import *
+    from .RayClusterSpecGcsFaultToleranceOptionsArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceMetadataPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceMetadataArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServicePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceSpecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceSpecPortsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceSpecPortsArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceSpecArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusArgs import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceArgs import *
+    from .RayClusterSpecHeadGroupSpecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateMetadataPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateMetadataArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplatePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecycleArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfilePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfileArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfilePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfileArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecycleArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfileArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfileArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecycleArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfilePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfileArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfilePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfileArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecOsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecOsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecResourcesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecResourcesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfileArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfileArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecTolerationsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecTolerationsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStoreArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFileArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesImageArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumeArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificatePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificateArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobyteArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumeArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefPatchArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecArgs import *
+    from .RayClusterSpecHeadGroupSpecTemplateArgs import *
+    from .RayClusterSpecHeadGroupSpecArgs import *
+    from .RayClusterSpecPatchArgs import *
+    from .RayClusterSpecUpgradeStrategyPatchArgs import *
+    from .RayClusterSpecUpgradeStrategyArgs import *
+    from .RayClusterSpecWorkerGroupSpecsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsScaleStrategyPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsScaleStrategyArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateMetadataPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateMetadataArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplatePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecycleArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfilePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfileArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfilePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfileArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecycleArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfileArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfileArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecycleArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfilePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfileArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfilePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfileArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecOsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecOsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfilePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfileArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfilePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfileArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStorePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStoreArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFilePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFileArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImagePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImageArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumeArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificatePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificateArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobytePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobyteArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumePatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumeArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefPatchArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecArgs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateArgs import *
+    from .RayClusterSpecWorkerGroupSpecsArgs import *
+    from .RayClusterSpecArgs import *
+    from .RayClusterStatusConditionsArgs import *
+    from .RayClusterStatusHeadArgs import *
+    from .RayClusterStatusArgs import *
+    from .RayClusterArgs import *
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _TYPE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,66 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecAuthOptionsPatch']
+
+@pulumi.output_type
+class RayClusterSpecAuthOptionsPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "enableK8sTokenAuth":
+            suggest = "enable_k8s_token_auth"
+        elif key == "secretName":
+            suggest = "secret_name"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecAuthOptionsPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecAuthOptionsPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecAuthOptionsPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 enable_k8s_token_auth: Optional[_builtins.bool] = None,
+                 mode: Optional[_builtins.str] = None,
+                 secret_name: Optional[_builtins.str] = None):
+        if enable_k8s_token_auth is not None:
+            pulumi.set(__self__, "enable_k8s_token_auth", enable_k8s_token_auth)
+        if mode is not None:
+            pulumi.set(__self__, "mode", mode)
+        if secret_name is not None:
+            pulumi.set(__self__, "secret_name", secret_name)
+
+    @_builtins.property
+    @pulumi.getter(name="enableK8sTokenAuth")
+    def enable_k8s_token_auth(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "enable_k8s_token_auth")
+
+    @_builtins.property
+    @pulumi.getter
+    def mode(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "mode")
+
+    @_builtins.property
+    @pulumi.getter(name="secretName")
+    def secret_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "secret_name")
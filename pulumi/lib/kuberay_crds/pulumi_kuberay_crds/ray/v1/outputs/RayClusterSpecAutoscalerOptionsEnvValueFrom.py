@@ -0,0 +1,88 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecAutoscalerOptionsEnvValueFrom']
+
+@pulumi.output_type
+class RayClusterSpecAutoscalerOptionsEnvValueFrom(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "configMapKeyRef":
+            suggest = "config_map_key_ref"
+        elif key == "fieldRef":
+            suggest = "field_ref"
+        elif key == "fileKeyRef":
+            suggest = "file_key_ref"
+        elif key == "resourceFieldRef":
+            suggest = "resource_field_ref"
+        elif key == "secretKeyRef":
+            suggest = "secret_key_ref"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecAutoscalerOptionsEnvValueFrom. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecAutoscalerOptionsEnvValueFrom.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecAutoscalerOptionsEnvValueFrom.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 config_map_key_ref: Optional['outputs.RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRef'] = None,
+                 field_ref: Optional['outputs.RayClusterSpecAutoscalerOptionsEnvValueFromFieldRef'] = None,
+                 file_key_ref: Optional['outputs.RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRef'] = None,
+                 resource_field_ref: Optional['outputs.RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRef'] = None,
+                 secret_key_ref: Optional['outputs.RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRef'] = None):
+        if config_map_key_ref is not None:
+            pulumi.set(__self__, "config_map_key_ref", config_map_key_ref)
+        if field_ref is not None:
+            pulumi.set(__self__, "field_ref", field_ref)
+        if file_key_ref is not None:
+            pulumi.set(__self__, "file_key_ref", file_key_ref)
+        if resource_field_ref is not None:
+            pulumi.set(__self__, "resource_field_ref", resource_field_ref)
+        if secret_key_ref is not None:
+            pulumi.set(__self__, "secret_key_ref", secret_key_ref)
+
+    @_builtins.property
+    @pulumi.getter(name="configMapKeyRef")
+    def config_map_key_ref(self) -> Optional['outputs.RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRef']:
+        return pulumi.get(self, "config_map_key_ref")
+
+    @_builtins.property
+    @pulumi.getter(name="fieldRef")
+    def field_ref(self) -> Optional['outputs.RayClusterSpecAutoscalerOptionsEnvValueFromFieldRef']:
+        return pulumi.get(self, "field_ref")
+
+    @_builtins.property
+    @pulumi.getter(name="fileKeyRef")
+    def file_key_ref(self) -> Optional['outputs.RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRef']:
+        return pulumi.get(self, "file_key_ref")
+
+    @_builtins.property
+    @pulumi.getter(name="resourceFieldRef")
+    def resource_field_ref(self) -> Optional['outputs.RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRef']:
+        return pulumi.get(self, "resource_field_ref")
+
+    @_builtins.property
+    @pulumi.getter(name="secretKeyRef")
+    def secret_key_ref(self) -> Optional['outputs.RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRef']:
+        return pulumi.get(self, "secret_key_ref")
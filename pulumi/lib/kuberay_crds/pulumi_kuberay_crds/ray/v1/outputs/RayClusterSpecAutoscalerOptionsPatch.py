@@ -0,0 +1,130 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecAutoscalerOptionsPatch']
+
+@pulumi.output_type
+class RayClusterSpecAutoscalerOptionsPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "envFrom":
+            suggest = "env_from"
+        elif key == "idleTimeoutSeconds":
+            suggest = "idle_timeout_seconds"
+        elif key == "imagePullPolicy":
+            suggest = "image_pull_policy"
+        elif key == "securityContext":
+            suggest = "security_context"
+        elif key == "upscalingMode":
+            suggest = "upscaling_mode"
+        elif key == "volumeMounts":
+            suggest = "volume_mounts"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecAutoscalerOptionsPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecAutoscalerOptionsPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecAutoscalerOptionsPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 env: Optional[Sequence['outputs.RayClusterSpecAutoscalerOptionsEnvPatch']] = None,
+                 env_from: Optional[Sequence['outputs.RayClusterSpecAutoscalerOptionsEnvFromPatch']] = None,
+                 idle_timeout_seconds: Optional[_builtins.int] = None,
+                 image: Optional[_builtins.str] = None,
+                 image_pull_policy: Optional[_builtins.str] = None,
+                 resources: Optional['outputs.RayClusterSpecAutoscalerOptionsResourcesPatch'] = None,
+                 security_context: Optional['outputs.RayClusterSpecAutoscalerOptionsSecurityContextPatch'] = None,
+                 upscaling_mode: Optional[_builtins.str] = None,
+                 version: Optional[_builtins.str] = None,
+                 volume_mounts: Optional[Sequence['outputs.RayClusterSpecAutoscalerOptionsVolumeMountsPatch']] = None):
+        if env is not None:
+            pulumi.set(__self__, "env", env)
+        if env_from is not None:
+            pulumi.set(__self__, "env_from", env_from)
+        if idle_timeout_seconds is not None:
+            pulumi.set(__self__, "idle_timeout_seconds", idle_timeout_seconds)
+        if image is not None:
+            pulumi.set(__self__, "image", image)
+        if image_pull_policy is not None:
+            pulumi.set(__self__, "image_pull_policy", image_pull_policy)
+        if resources is not None:
+            pulumi.set(__self__, "resources", resources)
+        if security_context is not None:
+            pulumi.set(__self__, "security_context", security_context)
+        if upscaling_mode is not None:
+            pulumi.set(__self__, "upscaling_mode", upscaling_mode)
+        if version is not None:
+            pulumi.set(__self__, "version", version)
+        if volume_mounts is not None:
+            pulumi.set(__self__, "volume_mounts", volume_mounts)
+
+    @_builtins.property
+    @pulumi.getter
+    def env(self) -> Optional[Sequence['outputs.RayClusterSpecAutoscalerOptionsEnvPatch']]:
+        return pulumi.get(self, "env")
+
+    @_builtins.property
+    @pulumi.getter(name="envFrom")
+    def env_from(self) -> Optional[Sequence['outputs.RayClusterSpecAutoscalerOptionsEnvFromPatch']]:
+        return pulumi.get(self, "env_from")
+
+    @_builtins.property
+    @pulumi.getter(name="idleTimeoutSeconds")
+    def idle_timeout_seconds(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "idle_timeout_seconds")
+
+    @_builtins.property
+    @pulumi.getter
+    def image(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "image")
+
+    @_builtins.property
+    @pulumi.getter(name="imagePullPolicy")
+    def image_pull_policy(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "image_pull_policy")
+
+    @_builtins.property
+    @pulumi.getter
+    def resources(self) -> Optional['outputs.RayClusterSpecAutoscalerOptionsResourcesPatch']:
+        return pulumi.get(self, "resources")
+
+    @_builtins.property
+    @pulumi.getter(name="securityContext")
+    def security_context(self) -> Optional['outputs.RayClusterSpecAutoscalerOptionsSecurityContextPatch']:
+        return pulumi.get(self, "security_context")
+
+    @_builtins.property
+    @pulumi.getter(name="upscalingMode")
+    def upscaling_mode(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "upscaling_mode")
+
+    @_builtins.property
+    @pulumi.getter
+    def version(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "version")
+
+    @_builtins.property
+    @pulumi.getter(name="volumeMounts")
+    def volume_mounts(self) -> Optional[Sequence['outputs.RayClusterSpecAutoscalerOptionsVolumeMountsPatch']]:
+        return pulumi.get(self, "volume_mounts")
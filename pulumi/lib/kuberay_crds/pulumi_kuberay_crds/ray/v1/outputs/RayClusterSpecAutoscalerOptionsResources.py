@@ -0,0 +1,47 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecAutoscalerOptionsResources']
+
+@pulumi.output_type
+class RayClusterSpecAutoscalerOptionsResources(dict):
+    def __init__(__self__, *,
+                 claims: Optional[Sequence['outputs.RayClusterSpecAutoscalerOptionsResourcesClaims']] = None,
+                 limits: Optional[Mapping[str, Any]] = None,
+                 requests: Optional[Mapping[str, Any]] = None):
+        if claims is not None:
+            pulumi.set(__self__, "claims", claims)
+        if limits is not None:
+            pulumi.set(__self__, "limits", limits)
+        if requests is not None:
+            pulumi.set(__self__, "requests", requests)
+
+    @_builtins.property
+    @pulumi.getter
+    def claims(self) -> Optional[Sequence['outputs.RayClusterSpecAutoscalerOptionsResourcesClaims']]:
+        return pulumi.get(self, "claims")
+
+    @_builtins.property
+    @pulumi.getter
+    def limits(self) -> Optional[Mapping[str, Any]]:
+        return pulumi.get(self, "limits")
+
+    @_builtins.property
+    @pulumi.getter
+    def requests(self) -> Optional[Mapping[str, Any]]:
+        return pulumi.get(self, "requests")
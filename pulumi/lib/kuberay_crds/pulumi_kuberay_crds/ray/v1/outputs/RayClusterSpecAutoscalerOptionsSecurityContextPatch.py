@@ -0,0 +1,154 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecAutoscalerOptionsSecurityContextPatch']
+
+@pulumi.output_type
+class RayClusterSpecAutoscalerOptionsSecurityContextPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "allowPrivilegeEscalation":
+            suggest = "allow_privilege_escalation"
+        elif key == "appArmorProfile":
+            suggest = "app_armor_profile"
+        elif key == "procMount":
+            suggest = "proc_mount"
+        elif key == "readOnlyRootFilesystem":
+            suggest = "read_only_root_filesystem"
+        elif key == "runAsGroup":
+            suggest = "run_as_group"
+        elif key == "runAsNonRoot":
+            suggest = "run_as_non_root"
+        elif key == "runAsUser":
+            suggest = "run_as_user"
+        elif key == "seLinuxOptions":
+            suggest = "se_linux_options"
+        elif key == "seccompProfile":
+            suggest = "seccomp_profile"
+        elif key == "windowsOptions":
+            suggest = "windows_options"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecAutoscalerOptionsSecurityContextPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecAutoscalerOptionsSecurityContextPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecAutoscalerOptionsSecurityContextPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 allow_privilege_escalation: Optional[_builtins.bool] = None,
+                 app_armor_profile: Optional['outputs.RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatch'] = None,
+                 capabilities: Optional['outputs.RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatch'] = None,
+                 privileged: Optional[_builtins.bool] = None,
+                 proc_mount: Optional[_builtins.str] = None,
+                 read_only_root_filesystem: Optional[_builtins.bool] = None,
+                 run_as_group: Optional[_builtins.int] = None,
+                 run_as_non_root: Optional[_builtins.bool] = None,
+                 run_as_user: Optional[_builtins.int] = None,
+                 se_linux_options: Optional['outputs.RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatch'] = None,
+                 seccomp_profile: Optional['outputs.RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatch'] = None,
+                 windows_options: Optional['outputs.RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatch'] = None):
+        if allow_privilege_escalation is not None:
+            pulumi.set(__self__, "allow_privilege_escalation", allow_privilege_escalation)
+        if app_armor_profile is not None:
+            pulumi.set(__self__, "app_armor_profile", app_armor_profile)
+        if capabilities is not None:
+            pulumi.set(__self__, "capabilities", capabilities)
+        if privileged is not None:
+            pulumi.set(__self__, "privileged", privileged)
+        if proc_mount is not None:
+            pulumi.set(__self__, "proc_mount", proc_mount)
+        if read_only_root_filesystem is not None:
+            pulumi.set(__self__, "read_only_root_filesystem", read_only_root_filesystem)
+        if run_as_group is not None:
+            pulumi.set(__self__, "run_as_group", run_as_group)
+        if run_as_non_root is not None:
+            pulumi.set(__self__, "run_as_non_root", run_as_non_root)
+        if run_as_user is not None:
+            pulumi.set(__self__, "run_as_user", run_as_user)
+        if se_linux_options is not None:
+            pulumi.set(__self__, "se_linux_options", se_linux_options)
+        if seccomp_profile is not None:
+            pulumi.set(__self__, "seccomp_profile", seccomp_profile)
+        if windows_options is not None:
+            pulumi.set(__self__, "windows_options", windows_options)
+
+    @_builtins.property
+    @pulumi.getter(name="allowPrivilegeEscalation")
+    def allow_privilege_escalation(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "allow_privilege_escalation")
+
+    @_builtins.property
+    @pulumi.getter(name="appArmorProfile")
+    def app_armor_profile(self) -> Optional['outputs.RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatch']:
+        return pulumi.get(self, "app_armor_profile")
+
+    @_builtins.property
+    @pulumi.getter
+    def capabilities(self) -> Optional['outputs.RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatch']:
+        return pulumi.get(self, "capabilities")
+
+    @_builtins.property
+    @pulumi.getter
+    def privileged(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "privileged")
+
+    @_builtins.property
+    @pulumi.getter(name="procMount")
+    def proc_mount(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "proc_mount")
+
+    @_builtins.property
+    @pulumi.getter(name="readOnlyRootFilesystem")
+    def read_only_root_filesystem(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "read_only_root_filesystem")
+
+    @_builtins.property
+    @pulumi.getter(name="runAsGroup")
+    def run_as_group(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "run_as_group")
+
+    @_builtins.property
+    @pulumi.getter(name="runAsNonRoot")
+    def run_as_non_root(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "run_as_non_root")
+
+    @_builtins.property
+    @pulumi.getter(name="runAsUser")
+    def run_as_user(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "run_as_user")
+
+    @_builtins.property
+    @pulumi.getter(name="seLinuxOptions")
+    def se_linux_options(self) -> Optional['outputs.RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatch']:
+        return pulumi.get(self, "se_linux_options")
+
+    @_builtins.property
+    @pulumi.getter(name="seccompProfile")
+    def seccomp_profile(self) -> Optional['outputs.RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatch']:
+        return pulumi.get(self, "seccomp_profile")
+
+    @_builtins.property
+    @pulumi.getter(name="windowsOptions")
+    def windows_options(self) -> Optional['outputs.RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatch']:
+        return pulumi.get(self, "windows_options")
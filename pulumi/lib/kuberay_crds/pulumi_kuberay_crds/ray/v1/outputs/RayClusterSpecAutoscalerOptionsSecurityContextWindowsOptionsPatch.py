@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatch']
+
+@pulumi.output_type
+class RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "gmsaCredentialSpec":
+            suggest = "gmsa_credential_spec"
+        elif key == "gmsaCredentialSpecName":
+            suggest = "gmsa_credential_spec_name"
+        elif key == "hostProcess":
+            suggest = "host_process"
+        elif key == "runAsUserName":
+            suggest = "run_as_user_name"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 gmsa_credential_spec: Optional[_builtins.str] = None,
+                 gmsa_credential_spec_name: Optional[_builtins.str] = None,
+                 host_process: Optional[_builtins.bool] = None,
+                 run_as_user_name: Optional[_builtins.str] = None):
+        if gmsa_credential_spec is not None:
+            pulumi.set(__self__, "gmsa_credential_spec", gmsa_credential_spec)
+        if gmsa_credential_spec_name is not None:
+            pulumi.set(__self__, "gmsa_credential_spec_name", gmsa_credential_spec_name)
+        if host_process is not None:
+            pulumi.set(__self__, "host_process", host_process)
+        if run_as_user_name is not None:
+            pulumi.set(__self__, "run_as_user_name", run_as_user_name)
+
+    @_builtins.property
+    @pulumi.getter(name="gmsaCredentialSpec")
+    def gmsa_credential_spec(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "gmsa_credential_spec")
+
+    @_builtins.property
+    @pulumi.getter(name="gmsaCredentialSpecName")
+    def gmsa_credential_spec_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "gmsa_credential_spec_name")
+
+    @_builtins.property
+    @pulumi.getter(name="hostProcess")
+    def host_process(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "host_process")
+
+    @_builtins.property
+    @pulumi.getter(name="runAsUserName")
+    def run_as_user_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "run_as_user_name")
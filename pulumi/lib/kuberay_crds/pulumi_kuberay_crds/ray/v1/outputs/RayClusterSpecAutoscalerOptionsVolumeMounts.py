@@ -0,0 +1,106 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecAutoscalerOptionsVolumeMounts']
+
+@pulumi.output_type
+class RayClusterSpecAutoscalerOptionsVolumeMounts(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "mountPath":
+            suggest = "mount_path"
+        elif key == "mountPropagation":
+            suggest = "mount_propagation"
+        elif key == "readOnly":
+            suggest = "read_only"
+        elif key == "recursiveReadOnly":
+            suggest = "recursive_read_only"
+        elif key == "subPath":
+            suggest = "sub_path"
+        elif key == "subPathExpr":
+            suggest = "sub_path_expr"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecAutoscalerOptionsVolumeMounts. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecAutoscalerOptionsVolumeMounts.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecAutoscalerOptionsVolumeMounts.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 mount_path: Optional[_builtins.str] = None,
+                 mount_propagation: Optional[_builtins.str] = None,
+                 name: Optional[_builtins.str] = None,
+                 read_only: Optional[_builtins.bool] = None,
+                 recursive_read_only: Optional[_builtins.str] = None,
+                 sub_path: Optional[_builtins.str] = None,
+                 sub_path_expr: Optional[_builtins.str] = None):
+        if mount_path is not None:
+            pulumi.set(__self__, "mount_path", mount_path)
+        if mount_propagation is not None:
+            pulumi.set(__self__, "mount_propagation", mount_propagation)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if read_only is not None:
+            pulumi.set(__self__, "read_only", read_only)
+        if recursive_read_only is not None:
+            pulumi.set(__self__, "recursive_read_only", recursive_read_only)
+        if sub_path is not None:
+            pulumi.set(__self__, "sub_path", sub_path)
+        if sub_path_expr is not None:
+            pulumi.set(__self__, "sub_path_expr", sub_path_expr)
+
+    @_builtins.property
+    @pulumi.getter(name="mountPath")
+    def mount_path(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "mount_path")
+
+    @_builtins.property
+    @pulumi.getter(name="mountPropagation")
+    def mount_propagation(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "mount_propagation")
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "name")
+
+    @_builtins.property
+    @pulumi.getter(name="readOnly")
+    def read_only(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "read_only")
+
+    @_builtins.property
+    @pulumi.getter(name="recursiveReadOnly")
+    def recursive_read_only(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "recursive_read_only")
+
+    @_builtins.property
+    @pulumi.getter(name="subPath")
+    def sub_path(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "sub_path")
+
+    @_builtins.property
+    @pulumi.getter(name="subPathExpr")
+    def sub_path_expr(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "sub_path_expr")
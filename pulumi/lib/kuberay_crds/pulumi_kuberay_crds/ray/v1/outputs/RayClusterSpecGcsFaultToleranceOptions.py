@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecGcsFaultToleranceOptions']
+
+@pulumi.output_type
+class RayClusterSpecGcsFaultToleranceOptions(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "externalStorageNamespace":
+            suggest = "external_storage_namespace"
+        elif key == "redisAddress":
+            suggest = "redis_address"
+        elif key == "redisPassword":
+            suggest = "redis_password"
+        elif key == "redisUsername":
+            suggest = "redis_username"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecGcsFaultToleranceOptions. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecGcsFaultToleranceOptions.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecGcsFaultToleranceOptions.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 external_storage_namespace: Optional[_builtins.str] = None,
+                 redis_address: Optional[_builtins.str] = None,
+                 redis_password: Optional['outputs.RayClusterSpecGcsFaultToleranceOptionsRedisPassword'] = None,
+                 redis_username: Optional['outputs.RayClusterSpecGcsFaultToleranceOptionsRedisUsername'] = None):
+        if external_storage_namespace is not None:
+            pulumi.set(__self__, "external_storage_namespace", external_storage_namespace)
+        if redis_address is not None:
+            pulumi.set(__self__, "redis_address", redis_address)
+        if redis_password is not None:
+            pulumi.set(__self__, "redis_password", redis_password)
+        if redis_username is not None:
+            pulumi.set(__self__, "redis_username", redis_username)
+
+    @_builtins.property
+    @pulumi.getter(name="externalStorageNamespace")
+    def external_storage_namespace(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "external_storage_namespace")
+
+    @_builtins.property
+    @pulumi.getter(name="redisAddress")
+    def redis_address(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "redis_address")
+
+    @_builtins.property
+    @pulumi.getter(name="redisPassword")
+    def redis_password(self) -> Optional['outputs.RayClusterSpecGcsFaultToleranceOptionsRedisPassword']:
+        return pulumi.get(self, "redis_password")
+
+    @_builtins.property
+    @pulumi.getter(name="redisUsername")
+    def redis_username(self) -> Optional['outputs.RayClusterSpecGcsFaultToleranceOptionsRedisUsername']:
+        return pulumi.get(self, "redis_username")
@@ -0,0 +1,102 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpec']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpec(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "enableIngress":
+            suggest = "enable_ingress"
+        elif key == "headService":
+            suggest = "head_service"
+        elif key == "rayStartParams":
+            suggest = "ray_start_params"
+        elif key == "serviceType":
+            suggest = "service_type"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpec. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpec.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpec.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 enable_ingress: Optional[_builtins.bool] = None,
+                 head_service: Optional['outputs.RayClusterSpecHeadGroupSpecHeadService'] = None,
+                 labels: Optional[Mapping[str, _builtins.str]] = None,
+                 ray_start_params: Optional[Mapping[str, _builtins.str]] = None,
+                 resources: Optional[Mapping[str, _builtins.str]] = None,
+                 service_type: Optional[_builtins.str] = None,
+                 template: Optional['outputs.RayClusterSpecHeadGroupSpecTemplate'] = None):
+        if enable_ingress is not None:
+            pulumi.set(__self__, "enable_ingress", enable_ingress)
+        if head_service is not None:
+            pulumi.set(__self__, "head_service", head_service)
+        if labels is not None:
+            pulumi.set(__self__, "labels", labels)
+        if ray_start_params is not None:
+            pulumi.set(__self__, "ray_start_params", ray_start_params)
+        if resources is not None:
+            pulumi.set(__self__, "resources", resources)
+        if service_type is not None:
+            pulumi.set(__self__, "service_type", service_type)
+        if template is not None:
+            pulumi.set(__self__, "template", template)
+
+    @_builtins.property
+    @pulumi.getter(name="enableIngress")
+    def enable_ingress(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "enable_ingress")
+
+    @_builtins.property
+    @pulumi.getter(name="headService")
+    def head_service(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecHeadService']:
+        return pulumi.get(self, "head_service")
+
+    @_builtins.property
+    @pulumi.getter
+    def labels(self) -> Optional[Mapping[str, _builtins.str]]:
+        return pulumi.get(self, "labels")
+
+    @_builtins.property
+    @pulumi.getter(name="rayStartParams")
+    def ray_start_params(self) -> Optional[Mapping[str, _builtins.str]]:
+        return pulumi.get(self, "ray_start_params")
+
+    @_builtins.property
+    @pulumi.getter
+    def resources(self) -> Optional[Mapping[str, _builtins.str]]:
+        return pulumi.get(self, "resources")
+
+    @_builtins.property
+    @pulumi.getter(name="serviceType")
+    def service_type(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "service_type")
+
+    @_builtins.property
+    @pulumi.getter
+    def template(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplate']:
+        return pulumi.get(self, "template")
@@ -0,0 +1,48 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatch']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "clientIP":
+            suggest = "client_ip"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 client_ip: Optional['outputs.RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPPatch'] = None):
+        if client_ip is not None:
+            pulumi.set(__self__, "client_ip", client_ip)
+
+    @_builtins.property
+    @pulumi.getter(name="clientIP")
+    def client_ip(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPPatch']:
+        return pulumi.get(self, "client_ip")
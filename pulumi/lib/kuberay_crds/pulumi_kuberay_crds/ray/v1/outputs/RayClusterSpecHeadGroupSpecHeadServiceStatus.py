@@ -0,0 +1,56 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecHeadServiceStatus']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecHeadServiceStatus(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "loadBalancer":
+            suggest = "load_balancer"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpecHeadServiceStatus. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpecHeadServiceStatus.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpecHeadServiceStatus.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 conditions: Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecHeadServiceStatusConditions']] = None,
+                 load_balancer: Optional['outputs.RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancer'] = None):
+        if conditions is not None:
+            pulumi.set(__self__, "conditions", conditions)
+        if load_balancer is not None:
+            pulumi.set(__self__, "load_balancer", load_balancer)
+
+    @_builtins.property
+    @pulumi.getter
+    def conditions(self) -> Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecHeadServiceStatusConditions']]:
+        return pulumi.get(self, "conditions")
+
+    @_builtins.property
+    @pulumi.getter(name="loadBalancer")
+    def load_balancer(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancer']:
+        return pulumi.get(self, "load_balancer")
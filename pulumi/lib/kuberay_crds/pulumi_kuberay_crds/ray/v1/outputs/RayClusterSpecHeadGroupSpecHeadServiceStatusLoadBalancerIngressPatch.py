@@ -0,0 +1,72 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatch']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "ipMode":
+            suggest = "ip_mode"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 hostname: Optional[_builtins.str] = None,
+                 ip: Optional[_builtins.str] = None,
+                 ip_mode: Optional[_builtins.str] = None,
+                 ports: Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsPatch']] = None):
+        if hostname is not None:
+            pulumi.set(__self__, "hostname", hostname)
+        if ip is not None:
+            pulumi.set(__self__, "ip", ip)
+        if ip_mode is not None:
+            pulumi.set(__self__, "ip_mode", ip_mode)
+        if ports is not None:
+            pulumi.set(__self__, "ports", ports)
+
+    @_builtins.property
+    @pulumi.getter
+    def hostname(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "hostname")
+
+    @_builtins.property
+    @pulumi.getter
+    def ip(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "ip")
+
+    @_builtins.property
+    @pulumi.getter(name="ipMode")
+    def ip_mode(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "ip_mode")
+
+    @_builtins.property
+    @pulumi.getter
+    def ports(self) -> Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsPatch']]:
+        return pulumi.get(self, "ports")
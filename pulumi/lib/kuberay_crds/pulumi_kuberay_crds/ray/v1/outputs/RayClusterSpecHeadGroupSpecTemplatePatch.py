@@ -0,0 +1,39 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplatePatch']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecTemplatePatch(dict):
+    def __init__(__self__, *,
+                 metadata: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateMetadataPatch'] = None,
+                 spec: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecPatch'] = None):
+        if metadata is not None:
+            pulumi.set(__self__, "metadata", metadata)
+        if spec is not None:
+            pulumi.set(__self__, "spec", spec)
+
+    @_builtins.property
+    @pulumi.getter
+    def metadata(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateMetadataPatch']:
+        return pulumi.get(self, "metadata")
+
+    @_builtins.property
+    @pulumi.getter
+    def spec(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecPatch']:
+        return pulumi.get(self, "spec")
@@ -0,0 +1,68 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecAffinity']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecTemplateSpecAffinity(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "nodeAffinity":
+            suggest = "node_affinity"
+        elif key == "podAffinity":
+            suggest = "pod_affinity"
+        elif key == "podAntiAffinity":
+            suggest = "pod_anti_affinity"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpecTemplateSpecAffinity. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecAffinity.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecAffinity.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 node_affinity: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinity'] = None,
+                 pod_affinity: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinity'] = None,
+                 pod_anti_affinity: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinity'] = None):
+        if node_affinity is not None:
+            pulumi.set(__self__, "node_affinity", node_affinity)
+        if pod_affinity is not None:
+            pulumi.set(__self__, "pod_affinity", pod_affinity)
+        if pod_anti_affinity is not None:
+            pulumi.set(__self__, "pod_anti_affinity", pod_anti_affinity)
+
+    @_builtins.property
+    @pulumi.getter(name="nodeAffinity")
+    def node_affinity(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinity']:
+        return pulumi.get(self, "node_affinity")
+
+    @_builtins.property
+    @pulumi.getter(name="podAffinity")
+    def pod_affinity(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinity']:
+        return pulumi.get(self, "pod_affinity")
+
+    @_builtins.property
+    @pulumi.getter(name="podAntiAffinity")
+    def pod_anti_affinity(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinity']:
+        return pulumi.get(self, "pod_anti_affinity")
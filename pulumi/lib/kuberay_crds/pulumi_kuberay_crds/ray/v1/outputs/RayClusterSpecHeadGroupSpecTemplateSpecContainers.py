@@ -0,0 +1,268 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecContainers']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecTemplateSpecContainers(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "envFrom":
+            suggest = "env_from"
+        elif key == "imagePullPolicy":
+            suggest = "image_pull_policy"
+        elif key == "livenessProbe":
+            suggest = "liveness_probe"
+        elif key == "readinessProbe":
+            suggest = "readiness_probe"
+        elif key == "resizePolicy":
+            suggest = "resize_policy"
+        elif key == "restartPolicy":
+            suggest = "restart_policy"
+        elif key == "restartPolicyRules":
+            suggest = "restart_policy_rules"
+        elif key == "securityContext":
+            suggest = "security_context"
+        elif key == "startupProbe":
+            suggest = "startup_probe"
+        elif key == "stdinOnce":
+            suggest = "stdin_once"
+        elif key == "terminationMessagePath":
+            suggest = "termination_message_path"
+        elif key == "terminationMessagePolicy":
+            suggest = "termination_message_policy"
+        elif key == "volumeDevices":
+            suggest = "volume_devices"
+        elif key == "volumeMounts":
+            suggest = "volume_mounts"
+        elif key == "workingDir":
+            suggest = "working_dir"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpecTemplateSpecContainers. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecContainers.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecContainers.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 args: Optional[Sequence[_builtins.str]] = None,
+                 command: Optional[Sequence[_builtins.str]] = None,
+                 env: Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersEnv']] = None,
+                 env_from: Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFrom']] = None,
+                 image: Optional[_builtins.str] = None,
+                 image_pull_policy: Optional[_builtins.str] = None,
+                 lifecycle: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecycle'] = None,
+                 liveness_probe: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbe'] = None,
+                 name: Optional[_builtins.str] = None,
+                 ports: Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersPorts']] = None,
+                 readiness_probe: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbe'] = None,
+                 resize_policy: Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicy']] = None,
+                 resources: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersResources'] = None,
+                 restart_policy: Optional[_builtins.str] = None,
+                 restart_policy_rules: Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRules']] = None,
+                 security_context: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContext'] = None,
+                 startup_probe: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbe'] = None,
+                 stdin: Optional[_builtins.bool] = None,
+                 stdin_once: Optional[_builtins.bool] = None,
+                 termination_message_path: Optional[_builtins.str] = None,
+                 termination_message_policy: Optional[_builtins.str] = None,
+                 tty: Optional[_builtins.bool] = None,
+                 volume_devices: Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevices']] = None,
+                 volume_mounts: Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMounts']] = None,
+                 working_dir: Optional[_builtins.str] = None):
+        if args is not None:
+            pulumi.set(__self__, "args", args)
+        if command is not None:
+            pulumi.set(__self__, "command", command)
+        if env is not None:
+            pulumi.set(__self__, "env", env)
+        if env_from is not None:
+            pulumi.set(__self__, "env_from", env_from)
+        if image is not None:
+            pulumi.set(__self__, "image", image)
+        if image_pull_policy is not None:
+            pulumi.set(__self__, "image_pull_policy", image_pull_policy)
+        if lifecycle is not None:
+            pulumi.set(__self__, "lifecycle", lifecycle)
+        if liveness_probe is not None:
+            pulumi.set(__self__, "liveness_probe", liveness_probe)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if ports is not None:
+            pulumi.set(__self__, "ports", ports)
+        if readiness_probe is not None:
+            pulumi.set(__self__, "readiness_probe", readiness_probe)
+        if resize_policy is not None:
+            pulumi.set(__self__, "resize_policy", resize_policy)
+        if resources is not None:
+            pulumi.set(__self__, "resources", resources)
+        if restart_policy is not None:
+            pulumi.set(__self__, "restart_policy", restart_policy)
+        if restart_policy_rules is not None:
+            pulumi.set(__self__, "restart_policy_rules", restart_policy_rules)
+        if security_context is not None:
+            pulumi.set(__self__, "security_context", security_context)
+        if startup_probe is not None:
+            pulumi.set(__self__, "startup_probe", startup_probe)
+        if stdin is not None:
+            pulumi.set(__self__, "stdin", stdin)
+        if stdin_once is not None:
+            pulumi.set(__self__, "stdin_once", stdin_once)
+        if termination_message_path is not None:
+            pulumi.set(__self__, "termination_message_path", termination_message_path)
+        if termination_message_policy is not None:
+            pulumi.set(__self__, "termination_message_policy", termination_message_policy)
+        if tty is not None:
+            pulumi.set(__self__, "tty", tty)
+        if volume_devices is not None:
+            pulumi.set(__self__, "volume_devices", volume_devices)
+        if volume_mounts is not None:
+            pulumi.set(__self__, "volume_mounts", volume_mounts)
+        if working_dir is not None:
+            pulumi.set(__self__, "working_dir", working_dir)
+
+    @_builtins.property
+    @pulumi.getter
+    def args(self) -> Optional[Sequence[_builtins.str]]:
+        return pulumi.get(self, "args")
+
+    @_builtins.property
+    @pulumi.getter
+    def command(self) -> Optional[Sequence[_builtins.str]]:
+        return pulumi.get(self, "command")
+
+    @_builtins.property
+    @pulumi.getter
+    def env(self) -> Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersEnv']]:
+        return pulumi.get(self, "env")
+
+    @_builtins.property
+    @pulumi.getter(name="envFrom")
+    def env_from(self) -> Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFrom']]:
+        return pulumi.get(self, "env_from")
+
+    @_builtins.property
+    @pulumi.getter
+    def image(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "image")
+
+    @_builtins.property
+    @pulumi.getter(name="imagePullPolicy")
+    def image_pull_policy(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "image_pull_policy")
+
+    @_builtins.property
+    @pulumi.getter
+    def lifecycle(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecycle']:
+        return pulumi.get(self, "lifecycle")
+
+    @_builtins.property
+    @pulumi.getter(name="livenessProbe")
+    def liveness_probe(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbe']:
+        return pulumi.get(self, "liveness_probe")
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "name")
+
+    @_builtins.property
+    @pulumi.getter
+    def ports(self) -> Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersPorts']]:
+        return pulumi.get(self, "ports")
+
+    @_builtins.property
+    @pulumi.getter(name="readinessProbe")
+    def readiness_probe(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbe']:
+        return pulumi.get(self, "readiness_probe")
+
+    @_builtins.property
+    @pulumi.getter(name="resizePolicy")
+    def resize_policy(self) -> Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicy']]:
+        return pulumi.get(self, "resize_policy")
+
+    @_builtins.property
+    @pulumi.getter
+    def resources(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersResources']:
+        return pulumi.get(self, "resources")
+
+    @_builtins.property
+    @pulumi.getter(name="restartPolicy")
+    def restart_policy(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "restart_policy")
+
+    @_builtins.property
+    @pulumi.getter(name="restartPolicyRules")
+    def restart_policy_rules(self) -> Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRules']]:
+        return pulumi.get(self, "restart_policy_rules")
+
+    @_builtins.property
+    @pulumi.getter(name="securityContext")
+    def security_context(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContext']:
+        return pulumi.get(self, "security_context")
+
+    @_builtins.property
+    @pulumi.getter(name="startupProbe")
+    def startup_probe(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbe']:
+        return pulumi.get(self, "startup_probe")
+
+    @_builtins.property
+    @pulumi.getter
+    def stdin(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "stdin")
+
+    @_builtins.property
+    @pulumi.getter(name="stdinOnce")
+    def stdin_once(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "stdin_once")
+
+    @_builtins.property
+    @pulumi.getter(name="terminationMessagePath")
+    def termination_message_path(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "termination_message_path")
+
+    @_builtins.property
+    @pulumi.getter(name="terminationMessagePolicy")
+    def termination_message_policy(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "termination_message_policy")
+
+    @_builtins.property
+    @pulumi.getter
+    def tty(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "tty")
+
+    @_builtins.property
+    @pulumi.getter(name="volumeDevices")
+    def volume_devices(self) -> Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevices']]:
+        return pulumi.get(self, "volume_devices")
+
+    @_builtins.property
+    @pulumi.getter(name="volumeMounts")
+    def volume_mounts(self) -> Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMounts']]:
+        return pulumi.get(self, "volume_mounts")
+
+    @_builtins.property
+    @pulumi.getter(name="workingDir")
+    def working_dir(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "working_dir")
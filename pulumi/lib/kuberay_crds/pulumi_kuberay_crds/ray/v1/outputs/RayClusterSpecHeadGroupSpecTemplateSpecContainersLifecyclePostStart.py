@@ -0,0 +1,76 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStart']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStart(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "exec":
+            suggest = "exec_"
+        elif key == "httpGet":
+            suggest = "http_get"
+        elif key == "tcpSocket":
+            suggest = "tcp_socket"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStart. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStart.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStart.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 exec_: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExec'] = None,
+                 http_get: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGet'] = None,
+                 sleep: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleep'] = None,
+                 tcp_socket: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocket'] = None):
+        if exec_ is not None:
+            pulumi.set(__self__, "exec_", exec_)
+        if http_get is not None:
+            pulumi.set(__self__, "http_get", http_get)
+        if sleep is not None:
+            pulumi.set(__self__, "sleep", sleep)
+        if tcp_socket is not None:
+            pulumi.set(__self__, "tcp_socket", tcp_socket)
+
+    @_builtins.property
+    @pulumi.getter(name="exec")
+    def exec_(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExec']:
+        return pulumi.get(self, "exec_")
+
+    @_builtins.property
+    @pulumi.getter(name="httpGet")
+    def http_get(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGet']:
+        return pulumi.get(self, "http_get")
+
+    @_builtins.property
+    @pulumi.getter
+    def sleep(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleep']:
+        return pulumi.get(self, "sleep")
+
+    @_builtins.property
+    @pulumi.getter(name="tcpSocket")
+    def tcp_socket(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocket']:
+        return pulumi.get(self, "tcp_socket")
@@ -0,0 +1,39 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilities']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilities(dict):
+    def __init__(__self__, *,
+                 add: Optional[Sequence[_builtins.str]] = None,
+                 drop: Optional[Sequence[_builtins.str]] = None):
+        if add is not None:
+            pulumi.set(__self__, "add", add)
+        if drop is not None:
+            pulumi.set(__self__, "drop", drop)
+
+    @_builtins.property
+    @pulumi.getter
+    def add(self) -> Optional[Sequence[_builtins.str]]:
+        return pulumi.get(self, "add")
+
+    @_builtins.property
+    @pulumi.getter
+    def drop(self) -> Optional[Sequence[_builtins.str]]:
+        return pulumi.get(self, "drop")
@@ -0,0 +1,47 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigPatch']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigPatch(dict):
+    def __init__(__self__, *,
+                 nameservers: Optional[Sequence[_builtins.str]] = None,
+                 options: Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsPatch']] = None,
+                 searches: Optional[Sequence[_builtins.str]] = None):
+        if nameservers is not None:
+            pulumi.set(__self__, "nameservers", nameservers)
+        if options is not None:
+            pulumi.set(__self__, "options", options)
+        if searches is not None:
+            pulumi.set(__self__, "searches", searches)
+
+    @_builtins.property
+    @pulumi.getter
+    def nameservers(self) -> Optional[Sequence[_builtins.str]]:
+        return pulumi.get(self, "nameservers")
+
+    @_builtins.property
+    @pulumi.getter
+    def options(self) -> Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsPatch']]:
+        return pulumi.get(self, "options")
+
+    @_builtins.property
+    @pulumi.getter
+    def searches(self) -> Optional[Sequence[_builtins.str]]:
+        return pulumi.get(self, "searches")
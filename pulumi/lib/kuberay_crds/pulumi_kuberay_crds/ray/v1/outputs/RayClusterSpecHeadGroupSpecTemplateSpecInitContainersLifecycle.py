@@ -0,0 +1,68 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecycle']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecycle(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "postStart":
+            suggest = "post_start"
+        elif key == "preStop":
+            suggest = "pre_stop"
+        elif key == "stopSignal":
+            suggest = "stop_signal"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecycle. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecycle.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecycle.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 post_start: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStart'] = None,
+                 pre_stop: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStop'] = None,
+                 stop_signal: Optional[_builtins.str] = None):
+        if post_start is not None:
+            pulumi.set(__self__, "post_start", post_start)
+        if pre_stop is not None:
+            pulumi.set(__self__, "pre_stop", pre_stop)
+        if stop_signal is not None:
+            pulumi.set(__self__, "stop_signal", stop_signal)
+
+    @_builtins.property
+    @pulumi.getter(name="postStart")
+    def post_start(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStart']:
+        return pulumi.get(self, "post_start")
+
+    @_builtins.property
+    @pulumi.getter(name="preStop")
+    def pre_stop(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStop']:
+        return pulumi.get(self, "pre_stop")
+
+    @_builtins.property
+    @pulumi.getter(name="stopSignal")
+    def stop_signal(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "stop_signal")
@@ -0,0 +1,166 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatch']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "appArmorProfile":
+            suggest = "app_armor_profile"
+        elif key == "fsGroup":
+            suggest = "fs_group"
+        elif key == "fsGroupChangePolicy":
+            suggest = "fs_group_change_policy"
+        elif key == "runAsGroup":
+            suggest = "run_as_group"
+        elif key == "runAsNonRoot":
+            suggest = "run_as_non_root"
+        elif key == "runAsUser":
+            suggest = "run_as_user"
+        elif key == "seLinuxChangePolicy":
+            suggest = "se_linux_change_policy"
+        elif key == "seLinuxOptions":
+            suggest = "se_linux_options"
+        elif key == "seccompProfile":
+            suggest = "seccomp_profile"
+        elif key == "supplementalGroups":
+            suggest = "supplemental_groups"
+        elif key == "supplementalGroupsPolicy":
+            suggest = "supplemental_groups_policy"
+        elif key == "windowsOptions":
+            suggest = "windows_options"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 app_armor_profile: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatch'] = None,
+                 fs_group: Optional[_builtins.int] = None,
+                 fs_group_change_policy: Optional[_builtins.str] = None,
+                 run_as_group: Optional[_builtins.int] = None,
+                 run_as_non_root: Optional[_builtins.bool] = None,
+                 run_as_user: Optional[_builtins.int] = None,
+                 se_linux_change_policy: Optional[_builtins.str] = None,
+                 se_linux_options: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatch'] = None,
+                 seccomp_profile: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatch'] = None,
+                 supplemental_groups: Optional[Sequence[_builtins.int]] = None,
+                 supplemental_groups_policy: Optional[_builtins.str] = None,
+                 sysctls: Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatch']] = None,
+                 windows_options: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatch'] = None):
+        if app_armor_profile is not None:
+            pulumi.set(__self__, "app_armor_profile", app_armor_profile)
+        if fs_group is not None:
+            pulumi.set(__self__, "fs_group", fs_group)
+        if fs_group_change_policy is not None:
+            pulumi.set(__self__, "fs_group_change_policy", fs_group_change_policy)
+        if run_as_group is not None:
+            pulumi.set(__self__, "run_as_group", run_as_group)
+        if run_as_non_root is not None:
+            pulumi.set(__self__, "run_as_non_root", run_as_non_root)
+        if run_as_user is not None:
+            pulumi.set(__self__, "run_as_user", run_as_user)
+        if se_linux_change_policy is not None:
+            pulumi.set(__self__, "se_linux_change_policy", se_linux_change_policy)
+        if se_linux_options is not None:
+            pulumi.set(__self__, "se_linux_options", se_linux_options)
+        if seccomp_profile is not None:
+            pulumi.set(__self__, "seccomp_profile", seccomp_profile)
+        if supplemental_groups is not None:
+            pulumi.set(__self__, "supplemental_groups", supplemental_groups)
+        if supplemental_groups_policy is not None:
+            pulumi.set(__self__, "supplemental_groups_policy", supplemental_groups_policy)
+        if sysctls is not None:
+            pulumi.set(__self__, "sysctls", sysctls)
+        if windows_options is not None:
+            pulumi.set(__self__, "windows_options", windows_options)
+
+    @_builtins.property
+    @pulumi.getter(name="appArmorProfile")
+    def app_armor_profile(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatch']:
+        return pulumi.get(self, "app_armor_profile")
+
+    @_builtins.property
+    @pulumi.getter(name="fsGroup")
+    def fs_group(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "fs_group")
+
+    @_builtins.property
+    @pulumi.getter(name="fsGroupChangePolicy")
+    def fs_group_change_policy(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "fs_group_change_policy")
+
+    @_builtins.property
+    @pulumi.getter(name="runAsGroup")
+    def run_as_group(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "run_as_group")
+
+    @_builtins.property
+    @pulumi.getter(name="runAsNonRoot")
+    def run_as_non_root(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "run_as_non_root")
+
+    @_builtins.property
+    @pulumi.getter(name="runAsUser")
+    def run_as_user(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "run_as_user")
+
+    @_builtins.property
+    @pulumi.getter(name="seLinuxChangePolicy")
+    def se_linux_change_policy(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "se_linux_change_policy")
+
+    @_builtins.property
+    @pulumi.getter(name="seLinuxOptions")
+    def se_linux_options(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatch']:
+        return pulumi.get(self, "se_linux_options")
+
+    @_builtins.property
+    @pulumi.getter(name="seccompProfile")
+    def seccomp_profile(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatch']:
+        return pulumi.get(self, "seccomp_profile")
+
+    @_builtins.property
+    @pulumi.getter(name="supplementalGroups")
+    def supplemental_groups(self) -> Optional[Sequence[_builtins.int]]:
+        return pulumi.get(self, "supplemental_groups")
+
+    @_builtins.property
+    @pulumi.getter(name="supplementalGroupsPolicy")
+    def supplemental_groups_policy(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "supplemental_groups_policy")
+
+    @_builtins.property
+    @pulumi.getter
+    def sysctls(self) -> Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatch']]:
+        return pulumi.get(self, "sysctls")
+
+    @_builtins.property
+    @pulumi.getter(name="windowsOptions")
+    def windows_options(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatch']:
+        return pulumi.get(self, "windows_options")
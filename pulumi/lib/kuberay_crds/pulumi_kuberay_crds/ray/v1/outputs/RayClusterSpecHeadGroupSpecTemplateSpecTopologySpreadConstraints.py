@@ -0,0 +1,118 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraints']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraints(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "labelSelector":
+            suggest = "label_selector"
+        elif key == "matchLabelKeys":
+            suggest = "match_label_keys"
+        elif key == "maxSkew":
+            suggest = "max_skew"
+        elif key == "minDomains":
+            suggest = "min_domains"
+        elif key == "nodeAffinityPolicy":
+            suggest = "node_affinity_policy"
+        elif key == "nodeTaintsPolicy":
+            suggest = "node_taints_policy"
+        elif key == "topologyKey":
+            suggest = "topology_key"
+        elif key == "whenUnsatisfiable":
+            suggest = "when_unsatisfiable"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraints. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraints.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraints.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 label_selector: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelector'] = None,
+                 match_label_keys: Optional[Sequence[_builtins.str]] = None,
+                 max_skew: Optional[_builtins.int] = None,
+                 min_domains: Optional[_builtins.int] = None,
+                 node_affinity_policy: Optional[_builtins.str] = None,
+                 node_taints_policy: Optional[_builtins.str] = None,
+                 topology_key: Optional[_builtins.str] = None,
+                 when_unsatisfiable: Optional[_builtins.str] = None):
+        if label_selector is not None:
+            pulumi.set(__self__, "label_selector", label_selector)
+        if match_label_keys is not None:
+            pulumi.set(__self__, "match_label_keys", match_label_keys)
+        if max_skew is not None:
+            pulumi.set(__self__, "max_skew", max_skew)
+        if min_domains is not None:
+            pulumi.set(__self__, "min_domains", min_domains)
+        if node_affinity_policy is not None:
+            pulumi.set(__self__, "node_affinity_policy", node_affinity_policy)
+        if node_taints_policy is not None:
+            pulumi.set(__self__, "node_taints_policy", node_taints_policy)
+        if topology_key is not None:
+            pulumi.set(__self__, "topology_key", topology_key)
+        if when_unsatisfiable is not None:
+            pulumi.set(__self__, "when_unsatisfiable", when_unsatisfiable)
+
+    @_builtins.property
+    @pulumi.getter(name="labelSelector")
+    def label_selector(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelector']:
+        return pulumi.get(self, "label_selector")
+
+    @_builtins.property
+    @pulumi.getter(name="matchLabelKeys")
+    def match_label_keys(self) -> Optional[Sequence[_builtins.str]]:
+        return pulumi.get(self, "match_label_keys")
+
+    @_builtins.property
+    @pulumi.getter(name="maxSkew")
+    def max_skew(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "max_skew")
+
+    @_builtins.property
+    @pulumi.getter(name="minDomains")
+    def min_domains(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "min_domains")
+
+    @_builtins.property
+    @pulumi.getter(name="nodeAffinityPolicy")
+    def node_affinity_policy(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "node_affinity_policy")
+
+    @_builtins.property
+    @pulumi.getter(name="nodeTaintsPolicy")
+    def node_taints_policy(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "node_taints_policy")
+
+    @_builtins.property
+    @pulumi.getter(name="topologyKey")
+    def topology_key(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "topology_key")
+
+    @_builtins.property
+    @pulumi.getter(name="whenUnsatisfiable")
+    def when_unsatisfiable(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "when_unsatisfiable")
@@ -0,0 +1,96 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDisk']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDisk(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "cachingMode":
+            suggest = "caching_mode"
+        elif key == "diskName":
+            suggest = "disk_name"
+        elif key == "diskURI":
+            suggest = "disk_uri"
+        elif key == "fsType":
+            suggest = "fs_type"
+        elif key == "readOnly":
+            suggest = "read_only"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDisk. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDisk.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDisk.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 caching_mode: Optional[_builtins.str] = None,
+                 disk_name: Optional[_builtins.str] = None,
+                 disk_uri: Optional[_builtins.str] = None,
+                 fs_type: Optional[_builtins.str] = None,
+                 kind: Optional[_builtins.str] = None,
+                 read_only: Optional[_builtins.bool] = None):
+        if caching_mode is not None:
+            pulumi.set(__self__, "caching_mode", caching_mode)
+        if disk_name is not None:
+            pulumi.set(__self__, "disk_name", disk_name)
+        if disk_uri is not None:
+            pulumi.set(__self__, "disk_uri", disk_uri)
+        if fs_type is not None:
+            pulumi.set(__self__, "fs_type", fs_type)
+        if kind is not None:
+            pulumi.set(__self__, "kind", kind)
+        if read_only is not None:
+            pulumi.set(__self__, "read_only", read_only)
+
+    @_builtins.property
+    @pulumi.getter(name="cachingMode")
+    def caching_mode(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "caching_mode")
+
+    @_builtins.property
+    @pulumi.getter(name="diskName")
+    def disk_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "disk_name")
+
+    @_builtins.property
+    @pulumi.getter(name="diskURI")
+    def disk_uri(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "disk_uri")
+
+    @_builtins.property
+    @pulumi.getter(name="fsType")
+    def fs_type(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "fs_type")
+
+    @_builtins.property
+    @pulumi.getter
+    def kind(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "kind")
+
+    @_builtins.property
+    @pulumi.getter(name="readOnly")
+    def read_only(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "read_only")
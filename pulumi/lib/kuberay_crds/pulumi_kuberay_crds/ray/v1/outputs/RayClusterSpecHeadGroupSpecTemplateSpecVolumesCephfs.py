@@ -0,0 +1,92 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfs']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfs(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "readOnly":
+            suggest = "read_only"
+        elif key == "secretFile":
+            suggest = "secret_file"
+        elif key == "secretRef":
+            suggest = "secret_ref"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfs. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfs.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfs.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 monitors: Optional[Sequence[_builtins.str]] = None,
+                 path: Optional[_builtins.str] = None,
+                 read_only: Optional[_builtins.bool] = None,
+                 secret_file: Optional[_builtins.str] = None,
+                 secret_ref: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRef'] = None,
+                 user: Optional[_builtins.str] = None):
+        if monitors is not None:
+            pulumi.set(__self__, "monitors", monitors)
+        if path is not None:
+            pulumi.set(__self__, "path", path)
+        if read_only is not None:
+            pulumi.set(__self__, "read_only", read_only)
+        if secret_file is not None:
+            pulumi.set(__self__, "secret_file", secret_file)
+        if secret_ref is not None:
+            pulumi.set(__self__, "secret_ref", secret_ref)
+        if user is not None:
+            pulumi.set(__self__, "user", user)
+
+    @_builtins.property
+    @pulumi.getter
+    def monitors(self) -> Optional[Sequence[_builtins.str]]:
+        return pulumi.get(self, "monitors")
+
+    @_builtins.property
+    @pulumi.getter
+    def path(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "path")
+
+    @_builtins.property
+    @pulumi.getter(name="readOnly")
+    def read_only(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "read_only")
+
+    @_builtins.property
+    @pulumi.getter(name="secretFile")
+    def secret_file(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "secret_file")
+
+    @_builtins.property
+    @pulumi.getter(name="secretRef")
+    def secret_ref(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRef']:
+        return pulumi.get(self, "secret_ref")
+
+    @_builtins.property
+    @pulumi.getter
+    def user(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "user")
@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinder']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinder(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "fsType":
+            suggest = "fs_type"
+        elif key == "readOnly":
+            suggest = "read_only"
+        elif key == "secretRef":
+            suggest = "secret_ref"
+        elif key == "volumeID":
+            suggest = "volume_id"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinder. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinder.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinder.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 fs_type: Optional[_builtins.str] = None,
+                 read_only: Optional[_builtins.bool] = None,
+                 secret_ref: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRef'] = None,
+                 volume_id: Optional[_builtins.str] = None):
+        if fs_type is not None:
+            pulumi.set(__self__, "fs_type", fs_type)
+        if read_only is not None:
+            pulumi.set(__self__, "read_only", read_only)
+        if secret_ref is not None:
+            pulumi.set(__self__, "secret_ref", secret_ref)
+        if volume_id is not None:
+            pulumi.set(__self__, "volume_id", volume_id)
+
+    @_builtins.property
+    @pulumi.getter(name="fsType")
+    def fs_type(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "fs_type")
+
+    @_builtins.property
+    @pulumi.getter(name="readOnly")
+    def read_only(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "read_only")
+
+    @_builtins.property
+    @pulumi.getter(name="secretRef")
+    def secret_ref(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRef']:
+        return pulumi.get(self, "secret_ref")
+
+    @_builtins.property
+    @pulumi.getter(name="volumeID")
+    def volume_id(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "volume_id")
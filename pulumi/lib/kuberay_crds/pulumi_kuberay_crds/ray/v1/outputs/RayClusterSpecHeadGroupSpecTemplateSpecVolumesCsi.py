@@ -0,0 +1,86 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsi']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsi(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "fsType":
+            suggest = "fs_type"
+        elif key == "nodePublishSecretRef":
+            suggest = "node_publish_secret_ref"
+        elif key == "readOnly":
+            suggest = "read_only"
+        elif key == "volumeAttributes":
+            suggest = "volume_attributes"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsi. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsi.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsi.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 driver: Optional[_builtins.str] = None,
+                 fs_type: Optional[_builtins.str] = None,
+                 node_publish_secret_ref: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRef'] = None,
+                 read_only: Optional[_builtins.bool] = None,
+                 volume_attributes: Optional[Mapping[str, _builtins.str]] = None):
+        if driver is not None:
+            pulumi.set(__self__, "driver", driver)
+        if fs_type is not None:
+            pulumi.set(__self__, "fs_type", fs_type)
+        if node_publish_secret_ref is not None:
+            pulumi.set(__self__, "node_publish_secret_ref", node_publish_secret_ref)
+        if read_only is not None:
+            pulumi.set(__self__, "read_only", read_only)
+        if volume_attributes is not None:
+            pulumi.set(__self__, "volume_attributes", volume_attributes)
+
+    @_builtins.property
+    @pulumi.getter
+    def driver(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "driver")
+
+    @_builtins.property
+    @pulumi.getter(name="fsType")
+    def fs_type(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "fs_type")
+
+    @_builtins.property
+    @pulumi.getter(name="nodePublishSecretRef")
+    def node_publish_secret_ref(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRef']:
+        return pulumi.get(self, "node_publish_secret_ref")
+
+    @_builtins.property
+    @pulumi.getter(name="readOnly")
+    def read_only(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "read_only")
+
+    @_builtins.property
+    @pulumi.getter(name="volumeAttributes")
+    def volume_attributes(self) -> Optional[Mapping[str, _builtins.str]]:
+        return pulumi.get(self, "volume_attributes")
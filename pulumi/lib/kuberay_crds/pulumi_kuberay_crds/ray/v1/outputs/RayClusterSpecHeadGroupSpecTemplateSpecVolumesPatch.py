@@ -0,0 +1,316 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatch']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "awsElasticBlockStore":
+            suggest = "aws_elastic_block_store"
+        elif key == "azureDisk":
+            suggest = "azure_disk"
+        elif key == "azureFile":
+            suggest = "azure_file"
+        elif key == "configMap":
+            suggest = "config_map"
+        elif key == "downwardAPI":
+            suggest = "downward_api"
+        elif key == "emptyDir":
+            suggest = "empty_dir"
+        elif key == "flexVolume":
+            suggest = "flex_volume"
+        elif key == "gcePersistentDisk":
+            suggest = "gce_persistent_disk"
+        elif key == "gitRepo":
+            suggest = "git_repo"
+        elif key == "hostPath":
+            suggest = "host_path"
+        elif key == "persistentVolumeClaim":
+            suggest = "persistent_volume_claim"
+        elif key == "photonPersistentDisk":
+            suggest = "photon_persistent_disk"
+        elif key == "portworxVolume":
+            suggest = "portworx_volume"
+        elif key == "scaleIO":
+            suggest = "scale_io"
+        elif key == "vsphereVolume":
+            suggest = "vsphere_volume"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 aws_elastic_block_store: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatch'] = None,
+                 azure_disk: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatch'] = None,
+                 azure_file: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatch'] = None,
+                 cephfs: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatch'] = None,
+                 cinder: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatch'] = None,
+                 config_map: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatch'] = None,
+                 csi: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatch'] = None,
+                 downward_api: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatch'] = None,
+                 empty_dir: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatch'] = None,
+                 ephemeral: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatch'] = None,
+                 fc: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatch'] = None,
+                 flex_volume: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatch'] = None,
+                 flocker: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatch'] = None,
+                 gce_persistent_disk: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatch'] = None,
+                 git_repo: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatch'] = None,
+                 glusterfs: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatch'] = None,
+                 host_path: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatch'] = None,
+                 image: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatch'] = None,
+                 iscsi: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatch'] = None,
+                 name: Optional[_builtins.str] = None,
+                 nfs: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatch'] = None,
+                 persistent_volume_claim: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatch'] = None,
+                 photon_persistent_disk: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatch'] = None,
+                 portworx_volume: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatch'] = None,
+                 projected: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatch'] = None,
+                 quobyte: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatch'] = None,
+                 rbd: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatch'] = None,
+                 scale_io: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatch'] = None,
+                 secret: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatch'] = None,
+                 storageos: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatch'] = None,
+                 vsphere_volume: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatch'] = None):
+        if aws_elastic_block_store is not None:
+            pulumi.set(__self__, "aws_elastic_block_store", aws_elastic_block_store)
+        if azure_disk is not None:
+            pulumi.set(__self__, "azure_disk", azure_disk)
+        if azure_file is not None:
+            pulumi.set(__self__, "azure_file", azure_file)
+        if cephfs is not None:
+            pulumi.set(__self__, "cephfs", cephfs)
+        if cinder is not None:
+            pulumi.set(__self__, "cinder", cinder)
+        if config_map is not None:
+            pulumi.set(__self__, "config_map", config_map)
+        if csi is not None:
+            pulumi.set(__self__, "csi", csi)
+        if downward_api is not None:
+            pulumi.set(__self__, "downward_api", downward_api)
+        if empty_dir is not None:
+            pulumi.set(__self__, "empty_dir", empty_dir)
+        if ephemeral is not None:
+            pulumi.set(__self__, "ephemeral", ephemeral)
+        if fc is not None:
+            pulumi.set(__self__, "fc", fc)
+        if flex_volume is not None:
+            pulumi.set(__self__, "flex_volume", flex_volume)
+        if flocker is not None:
+            pulumi.set(__self__, "flocker", flocker)
+        if gce_persistent_disk is not None:
+            pulumi.set(__self__, "gce_persistent_disk", gce_persistent_disk)
+        if git_repo is not None:
+            pulumi.set(__self__, "git_repo", git_repo)
+        if glusterfs is not None:
+            pulumi.set(__self__, "glusterfs", glusterfs)
+        if host_path is not None:
+            pulumi.set(__self__, "host_path", host_path)
+        if image is not None:
+            pulumi.set(__self__, "image", image)
+        if iscsi is not None:
+            pulumi.set(__self__, "iscsi", iscsi)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if nfs is not None:
+            pulumi.set(__self__, "nfs", nfs)
+        if persistent_volume_claim is not None:
+            pulumi.set(__self__, "persistent_volume_claim", persistent_volume_claim)
+        if photon_persistent_disk is not None:
+            pulumi.set(__self__, "photon_persistent_disk", photon_persistent_disk)
+        if portworx_volume is not None:
+            pulumi.set(__self__, "portworx_volume", portworx_volume)
+        if projected is not None:
+            pulumi.set(__self__, "projected", projected)
+        if quobyte is not None:
+            pulumi.set(__self__, "quobyte", quobyte)
+        if rbd is not None:
+            pulumi.set(__self__, "rbd", rbd)
+        if scale_io is not None:
+            pulumi.set(__self__, "scale_io", scale_io)
+        if secret is not None:
+            pulumi.set(__self__, "secret", secret)
+        if storageos is not None:
+            pulumi.set(__self__, "storageos", storageos)
+        if vsphere_volume is not None:
+            pulumi.set(__self__, "vsphere_volume", vsphere_volume)
+
+    @_builtins.property
+    @pulumi.getter(name="awsElasticBlockStore")
+    def aws_elastic_block_store(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatch']:
+        return pulumi.get(self, "aws_elastic_block_store")
+
+    @_builtins.property
+    @pulumi.getter(name="azureDisk")
+    def azure_disk(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatch']:
+        return pulumi.get(self, "azure_disk")
+
+    @_builtins.property
+    @pulumi.getter(name="azureFile")
+    def azure_file(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatch']:
+        return pulumi.get(self, "azure_file")
+
+    @_builtins.property
+    @pulumi.getter
+    def cephfs(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatch']:
+        return pulumi.get(self, "cephfs")
+
+    @_builtins.property
+    @pulumi.getter
+    def cinder(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatch']:
+        return pulumi.get(self, "cinder")
+
+    @_builtins.property
+    @pulumi.getter(name="configMap")
+    def config_map(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatch']:
+        return pulumi.get(self, "config_map")
+
+    @_builtins.property
+    @pulumi.getter
+    def csi(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatch']:
+        return pulumi.get(self, "csi")
+
+    @_builtins.property
+    @pulumi.getter(name="downwardAPI")
+    def downward_api(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatch']:
+        return pulumi.get(self, "downward_api")
+
+    @_builtins.property
+    @pulumi.getter(name="emptyDir")
+    def empty_dir(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatch']:
+        return pulumi.get(self, "empty_dir")
+
+    @_builtins.property
+    @pulumi.getter
+    def ephemeral(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatch']:
+        return pulumi.get(self, "ephemeral")
+
+    @_builtins.property
+    @pulumi.getter
+    def fc(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatch']:
+        return pulumi.get(self, "fc")
+
+    @_builtins.property
+    @pulumi.getter(name="flexVolume")
+    def flex_volume(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatch']:
+        return pulumi.get(self, "flex_volume")
+
+    @_builtins.property
+    @pulumi.getter
+    def flocker(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatch']:
+        return pulumi.get(self, "flocker")
+
+    @_builtins.property
+    @pulumi.getter(name="gcePersistentDisk")
+    def gce_persistent_disk(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatch']:
+        return pulumi.get(self, "gce_persistent_disk")
+
+    @_builtins.property
+    @pulumi.getter(name="gitRepo")
+    def git_repo(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatch']:
+        return pulumi.get(self, "git_repo")
+
+    @_builtins.property
+    @pulumi.getter
+    def glusterfs(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatch']:
+        return pulumi.get(self, "glusterfs")
+
+    @_builtins.property
+    @pulumi.getter(name="hostPath")
+    def host_path(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatch']:
+        return pulumi.get(self, "host_path")
+
+    @_builtins.property
+    @pulumi.getter
+    def image(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatch']:
+        return pulumi.get(self, "image")
+
+    @_builtins.property
+    @pulumi.getter
+    def iscsi(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatch']:
+        return pulumi.get(self, "iscsi")
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "name")
+
+    @_builtins.property
+    @pulumi.getter
+    def nfs(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatch']:
+        return pulumi.get(self, "nfs")
+
+    @_builtins.property
+    @pulumi.getter(name="persistentVolumeClaim")
+    def persistent_volume_claim(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatch']:
+        return pulumi.get(self, "persistent_volume_claim")
+
+    @_builtins.property
+    @pulumi.getter(name="photonPersistentDisk")
+    def photon_persistent_disk(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatch']:
+        return pulumi.get(self, "photon_persistent_disk")
+
+    @_builtins.property
+    @pulumi.getter(name="portworxVolume")
+    def portworx_volume(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatch']:
+        return pulumi.get(self, "portworx_volume")
+
+    @_builtins.property
+    @pulumi.getter
+    def projected(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatch']:
+        return pulumi.get(self, "projected")
+
+    @_builtins.property
+    @pulumi.getter
+    def quobyte(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatch']:
+        return pulumi.get(self, "quobyte")
+
+    @_builtins.property
+    @pulumi.getter
+    def rbd(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatch']:
+        return pulumi.get(self, "rbd")
+
+    @_builtins.property
+    @pulumi.getter(name="scaleIO")
+    def scale_io(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatch']:
+        return pulumi.get(self, "scale_io")
+
+    @_builtins.property
+    @pulumi.getter
+    def secret(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatch']:
+        return pulumi.get(self, "secret")
+
+    @_builtins.property
+    @pulumi.getter
+    def storageos(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatch']:
+        return pulumi.get(self, "storageos")
+
+    @_builtins.property
+    @pulumi.getter(name="vsphereVolume")
+    def vsphere_volume(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatch']:
+        return pulumi.get(self, "vsphere_volume")
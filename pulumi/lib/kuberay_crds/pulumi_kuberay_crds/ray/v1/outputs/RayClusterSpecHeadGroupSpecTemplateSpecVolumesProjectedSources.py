@@ -0,0 +1,96 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSources']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSources(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "clusterTrustBundle":
+            suggest = "cluster_trust_bundle"
+        elif key == "configMap":
+            suggest = "config_map"
+        elif key == "downwardAPI":
+            suggest = "downward_api"
+        elif key == "podCertificate":
+            suggest = "pod_certificate"
+        elif key == "serviceAccountToken":
+            suggest = "service_account_token"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSources. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSources.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSources.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 cluster_trust_bundle: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundle'] = None,
+                 config_map: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMap'] = None,
+                 downward_api: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPI'] = None,
+                 pod_certificate: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificate'] = None,
+                 secret: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecret'] = None,
+                 service_account_token: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountToken'] = None):
+        if cluster_trust_bundle is not None:
+            pulumi.set(__self__, "cluster_trust_bundle", cluster_trust_bundle)
+        if config_map is not None:
+            pulumi.set(__self__, "config_map", config_map)
+        if downward_api is not None:
+            pulumi.set(__self__, "downward_api", downward_api)
+        if pod_certificate is not None:
+            pulumi.set(__self__, "pod_certificate", pod_certificate)
+        if secret is not None:
+            pulumi.set(__self__, "secret", secret)
+        if service_account_token is not None:
+            pulumi.set(__self__, "service_account_token", service_account_token)
+
+    @_builtins.property
+    @pulumi.getter(name="clusterTrustBundle")
+    def cluster_trust_bundle(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundle']:
+        return pulumi.get(self, "cluster_trust_bundle")
+
+    @_builtins.property
+    @pulumi.getter(name="configMap")
+    def config_map(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMap']:
+        return pulumi.get(self, "config_map")
+
+    @_builtins.property
+    @pulumi.getter(name="downwardAPI")
+    def downward_api(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPI']:
+        return pulumi.get(self, "downward_api")
+
+    @_builtins.property
+    @pulumi.getter(name="podCertificate")
+    def pod_certificate(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificate']:
+        return pulumi.get(self, "pod_certificate")
+
+    @_builtins.property
+    @pulumi.getter
+    def secret(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecret']:
+        return pulumi.get(self, "secret")
+
+    @_builtins.property
+    @pulumi.getter(name="serviceAccountToken")
+    def service_account_token(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountToken']:
+        return pulumi.get(self, "service_account_token")
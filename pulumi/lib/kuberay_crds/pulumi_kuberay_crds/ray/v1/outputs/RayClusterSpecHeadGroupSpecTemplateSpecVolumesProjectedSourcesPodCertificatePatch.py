@@ -0,0 +1,108 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificatePatch']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificatePatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "certificateChainPath":
+            suggest = "certificate_chain_path"
+        elif key == "credentialBundlePath":
+            suggest = "credential_bundle_path"
+        elif key == "keyPath":
+            suggest = "key_path"
+        elif key == "keyType":
+            suggest = "key_type"
+        elif key == "maxExpirationSeconds":
+            suggest = "max_expiration_seconds"
+        elif key == "signerName":
+            suggest = "signer_name"
+        elif key == "userAnnotations":
+            suggest = "user_annotations"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificatePatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificatePatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificatePatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 certificate_chain_path: Optional[_builtins.str] = None,
+                 credential_bundle_path: Optional[_builtins.str] = None,
+                 key_path: Optional[_builtins.str] = None,
+                 key_type: Optional[_builtins.str] = None,
+                 max_expiration_seconds: Optional[_builtins.int] = None,
+                 signer_name: Optional[_builtins.str] = None,
+                 user_annotations: Optional[Mapping[str, _builtins.str]] = None):
+        if certificate_chain_path is not None:
+            pulumi.set(__self__, "certificate_chain_path", certificate_chain_path)
+        if credential_bundle_path is not None:
+            pulumi.set(__self__, "credential_bundle_path", credential_bundle_path)
+        if key_path is not None:
+            pulumi.set(__self__, "key_path", key_path)
+        if key_type is not None:
+            pulumi.set(__self__, "key_type", key_type)
+        if max_expiration_seconds is not None:
+            pulumi.set(__self__, "max_expiration_seconds", max_expiration_seconds)
+        if signer_name is not None:
+            pulumi.set(__self__, "signer_name", signer_name)
+        if user_annotations is not None:
+            pulumi.set(__self__, "user_annotations", user_annotations)
+
+    @_builtins.property
+    @pulumi.getter(name="certificateChainPath")
+    def certificate_chain_path(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "certificate_chain_path")
+
+    @_builtins.property
+    @pulumi.getter(name="credentialBundlePath")
+    def credential_bundle_path(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "credential_bundle_path")
+
+    @_builtins.property
+    @pulumi.getter(name="keyPath")
+    def key_path(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "key_path")
+
+    @_builtins.property
+    @pulumi.getter(name="keyType")
+    def key_type(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "key_type")
+
+    @_builtins.property
+    @pulumi.getter(name="maxExpirationSeconds")
+    def max_expiration_seconds(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "max_expiration_seconds")
+
+    @_builtins.property
+    @pulumi.getter(name="signerName")
+    def signer_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "signer_name")
+
+    @_builtins.property
+    @pulumi.getter(name="userAnnotations")
+    def user_annotations(self) -> Optional[Mapping[str, _builtins.str]]:
+        return pulumi.get(self, "user_annotations")
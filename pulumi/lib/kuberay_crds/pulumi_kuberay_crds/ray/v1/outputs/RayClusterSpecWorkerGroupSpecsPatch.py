@@ -0,0 +1,148 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecWorkerGroupSpecsPatch']
+
+@pulumi.output_type
+class RayClusterSpecWorkerGroupSpecsPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "groupName":
+            suggest = "group_name"
+        elif key == "idleTimeoutSeconds":
+            suggest = "idle_timeout_seconds"
+        elif key == "maxReplicas":
+            suggest = "max_replicas"
+        elif key == "minReplicas":
+            suggest = "min_replicas"
+        elif key == "numOfHosts":
+            suggest = "num_of_hosts"
+        elif key == "rayStartParams":
+            suggest = "ray_start_params"
+        elif key == "scaleStrategy":
+            suggest = "scale_strategy"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecWorkerGroupSpecsPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecWorkerGroupSpecsPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecWorkerGroupSpecsPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 group_name: Optional[_builtins.str] = None,
+                 idle_timeout_seconds: Optional[_builtins.int] = None,
+                 labels: Optional[Mapping[str, _builtins.str]] = None,
+                 max_replicas: Optional[_builtins.int] = None,
+                 min_replicas: Optional[_builtins.int] = None,
+                 num_of_hosts: Optional[_builtins.int] = None,
+                 ray_start_params: Optional[Mapping[str, _builtins.str]] = None,
+                 replicas: Optional[_builtins.int] = None,
+                 resources: Optional[Mapping[str, _builtins.str]] = None,
+                 scale_strategy: Optional['outputs.RayClusterSpecWorkerGroupSpecsScaleStrategyPatch'] = None,
+                 suspend: Optional[_builtins.bool] = None,
+                 template: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplatePatch'] = None):
+        if group_name is not None:
+            pulumi.set(__self__, "group_name", group_name)
+        if idle_timeout_seconds is not None:
+            pulumi.set(__self__, "idle_timeout_seconds", idle_timeout_seconds)
+        if labels is not None:
+            pulumi.set(__self__, "labels", labels)
+        if max_replicas is not None:
+            pulumi.set(__self__, "max_replicas", max_replicas)
+        if min_replicas is not None:
+            pulumi.set(__self__, "min_replicas", min_replicas)
+        if num_of_hosts is not None:
+            pulumi.set(__self__, "num_of_hosts", num_of_hosts)
+        if ray_start_params is not None:
+            pulumi.set(__self__, "ray_start_params", ray_start_params)
+        if replicas is not None:
+            pulumi.set(__self__, "replicas", replicas)
+        if resources is not None:
+            pulumi.set(__self__, "resources", resources)
+        if scale_strategy is not None:
+            pulumi.set(__self__, "scale_strategy", scale_strategy)
+        if suspend is not None:
+            pulumi.set(__self__, "suspend", suspend)
+        if template is not None:
+            pulumi.set(__self__, "template", template)
+
+    @_builtins.property
+    @pulumi.getter(name="groupName")
+    def group_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "group_name")
+
+    @_builtins.property
+    @pulumi.getter(name="idleTimeoutSeconds")
+    def idle_timeout_seconds(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "idle_timeout_seconds")
+
+    @_builtins.property
+    @pulumi.getter
+    def labels(self) -> Optional[Mapping[str, _builtins.str]]:
+        return pulumi.get(self, "labels")
+
+    @_builtins.property
+    @pulumi.getter(name="maxReplicas")
+    def max_replicas(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "max_replicas")
+
+    @_builtins.property
+    @pulumi.getter(name="minReplicas")
+    def min_replicas(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "min_replicas")
+
+    @_builtins.property
+    @pulumi.getter(name="numOfHosts")
+    def num_of_hosts(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "num_of_hosts")
+
+    @_builtins.property
+    @pulumi.getter(name="rayStartParams")
+    def ray_start_params(self) -> Optional[Mapping[str, _builtins.str]]:
+        return pulumi.get(self, "ray_start_params")
+
+    @_builtins.property
+    @pulumi.getter
+    def replicas(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "replicas")
+
+    @_builtins.property
+    @pulumi.getter
+    def resources(self) -> Optional[Mapping[str, _builtins.str]]:
+        return pulumi.get(self, "resources")
+
+    @_builtins.property
+    @pulumi.getter(name="scaleStrategy")
+    def scale_strategy(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsScaleStrategyPatch']:
+        return pulumi.get(self, "scale_strategy")
+
+    @_builtins.property
+    @pulumi.getter
+    def suspend(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "suspend")
+
+    @_builtins.property
+    @pulumi.getter
+    def template(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplatePatch']:
+        return pulumi.get(self, "template")
@@ -0,0 +1,438 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecWorkerGroupSpecsTemplateSpecPatch']
+
+@pulumi.output_type
+class RayClusterSpecWorkerGroupSpecsTemplateSpecPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "activeDeadlineSeconds":
+            suggest = "active_deadline_seconds"
+        elif key == "automountServiceAccountToken":
+            suggest = "automount_service_account_token"
+        elif key == "dnsConfig":
+            suggest = "dns_config"
+        elif key == "dnsPolicy":
+            suggest = "dns_policy"
+        elif key == "enableServiceLinks":
+            suggest = "enable_service_links"
+        elif key == "ephemeralContainers":
+            suggest = "ephemeral_containers"
+        elif key == "hostAliases":
+            suggest = "host_aliases"
+        elif key == "hostIPC":
+            suggest = "host_ipc"
+        elif key == "hostNetwork":
+            suggest = "host_network"
+        elif key == "hostPID":
+            suggest = "host_pid"
+        elif key == "hostUsers":
+            suggest = "host_users"
+        elif key == "hostnameOverride":
+            suggest = "hostname_override"
+        elif key == "imagePullSecrets":
+            suggest = "image_pull_secrets"
+        elif key == "initContainers":
+            suggest = "init_containers"
+        elif key == "nodeName":
+            suggest = "node_name"
+        elif key == "nodeSelector":
+            suggest = "node_selector"
+        elif key == "preemptionPolicy":
+            suggest = "preemption_policy"
+        elif key == "priorityClassName":
+            suggest = "priority_class_name"
+        elif key == "readinessGates":
+            suggest = "readiness_gates"
+        elif key == "resourceClaims":
+            suggest = "resource_claims"
+        elif key == "restartPolicy":
+            suggest = "restart_policy"
+        elif key == "runtimeClassName":
+            suggest = "runtime_class_name"
+        elif key == "schedulerName":
+            suggest = "scheduler_name"
+        elif key == "schedulingGates":
+            suggest = "scheduling_gates"
+        elif key == "securityContext":
+            suggest = "security_context"
+        elif key == "serviceAccount":
+            suggest = "service_account"
+        elif key == "serviceAccountName":
+            suggest = "service_account_name"
+        elif key == "setHostnameAsFQDN":
+            suggest = "set_hostname_as_fqdn"
+        elif key == "shareProcessNamespace":
+            suggest = "share_process_namespace"
+        elif key == "terminationGracePeriodSeconds":
+            suggest = "termination_grace_period_seconds"
+        elif key == "topologySpreadConstraints":
+            suggest = "topology_spread_constraints"
+        elif key == "workloadRef":
+            suggest = "workload_ref"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecWorkerGroupSpecsTemplateSpecPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecWorkerGroupSpecsTemplateSpecPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecWorkerGroupSpecsTemplateSpecPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 active_deadline_seconds: Optional[_builtins.int] = None,
+                 affinity: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPatch'] = None,
+                 automount_service_account_token: Optional[_builtins.bool] = None,
+                 containers: Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPatch']] = None,
+                 dns_config: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigPatch'] = None,
+                 dns_policy: Optional[_builtins.str] = None,
+                 enable_service_links: Optional[_builtins.bool] = None,
+                 ephemeral_containers: Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPatch']] = None,
+                 host_aliases: Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesPatch']] = None,
+                 host_ipc: Optional[_builtins.bool] = None,
+                 host_network: Optional[_builtins.bool] = None,
+                 host_pid: Optional[_builtins.bool] = None,
+                 host_users: Optional[_builtins.bool] = None,
+                 hostname: Optional[_builtins.str] = None,
+                 hostname_override: Optional[_builtins.str] = None,
+                 image_pull_secrets: Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsPatch']] = None,
+                 init_containers: Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPatch']] = None,
+                 node_name: Optional[_builtins.str] = None,
+                 node_selector: Optional[Mapping[str, _builtins.str]] = None,
+                 os: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecOsPatch'] = None,
+                 overhead: Optional[Mapping[str, Any]] = None,
+                 preemption_policy: Optional[_builtins.str] = None,
+                 priority: Optional[_builtins.int] = None,
+                 priority_class_name: Optional[_builtins.str] = None,
+                 readiness_gates: Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatch']] = None,
+                 resource_claims: Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsPatch']] = None,
+                 resources: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesPatch'] = None,
+                 restart_policy: Optional[_builtins.str] = None,
+                 runtime_class_name: Optional[_builtins.str] = None,
+                 scheduler_name: Optional[_builtins.str] = None,
+                 scheduling_gates: Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesPatch']] = None,
+                 security_context: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextPatch'] = None,
+                 service_account: Optional[_builtins.str] = None,
+                 service_account_name: Optional[_builtins.str] = None,
+                 set_hostname_as_fqdn: Optional[_builtins.bool] = None,
+                 share_process_namespace: Optional[_builtins.bool] = None,
+                 subdomain: Optional[_builtins.str] = None,
+                 termination_grace_period_seconds: Optional[_builtins.int] = None,
+                 tolerations: Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsPatch']] = None,
+                 topology_spread_constraints: Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsPatch']] = None,
+                 volumes: Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatch']] = None,
+                 workload_ref: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefPatch'] = None):
+        if active_deadline_seconds is not None:
+            pulumi.set(__self__, "active_deadline_seconds", active_deadline_seconds)
+        if affinity is not None:
+            pulumi.set(__self__, "affinity", affinity)
+        if automount_service_account_token is not None:
+            pulumi.set(__self__, "automount_service_account_token", automount_service_account_token)
+        if containers is not None:
+            pulumi.set(__self__, "containers", containers)
+        if dns_config is not None:
+            pulumi.set(__self__, "dns_config", dns_config)
+        if dns_policy is not None:
+            pulumi.set(__self__, "dns_policy", dns_policy)
+        if enable_service_links is not None:
+            pulumi.set(__self__, "enable_service_links", enable_service_links)
+        if ephemeral_containers is not None:
+            pulumi.set(__self__, "ephemeral_containers", ephemeral_containers)
+        if host_aliases is not None:
+            pulumi.set(__self__, "host_aliases", host_aliases)
+        if host_ipc is not None:
+            pulumi.set(__self__, "host_ipc", host_ipc)
+        if host_network is not None:
+            pulumi.set(__self__, "host_network", host_network)
+        if host_pid is not None:
+            pulumi.set(__self__, "host_pid", host_pid)
+        if host_users is not None:
+            pulumi.set(__self__, "host_users", host_users)
+        if hostname is not None:
+            pulumi.set(__self__, "hostname", hostname)
+        if hostname_override is not None:
+            pulumi.set(__self__, "hostname_override", hostname_override)
+        if image_pull_secrets is not None:
+            pulumi.set(__self__, "image_pull_secrets", image_pull_secrets)
+        if init_containers is not None:
+            pulumi.set(__self__, "init_containers", init_containers)
+        if node_name is not None:
+            pulumi.set(__self__, "node_name", node_name)
+        if node_selector is not None:
+            pulumi.set(__self__, "node_selector", node_selector)
+        if os is not None:
+            pulumi.set(__self__, "os", os)
+        if overhead is not None:
+            pulumi.set(__self__, "overhead", overhead)
+        if preemption_policy is not None:
+            pulumi.set(__self__, "preemption_policy", preemption_policy)
+        if priority is not None:
+            pulumi.set(__self__, "priority", priority)
+        if priority_class_name is not None:
+            pulumi.set(__self__, "priority_class_name", priority_class_name)
+        if readiness_gates is not None:
+            pulumi.set(__self__, "readiness_gates", readiness_gates)
+        if resource_claims is not None:
+            pulumi.set(__self__, "resource_claims", resource_claims)
+        if resources is not None:
+            pulumi.set(__self__, "resources", resources)
+        if restart_policy is not None:
+            pulumi.set(__self__, "restart_policy", restart_policy)
+        if runtime_class_name is not None:
+            pulumi.set(__self__, "runtime_class_name", runtime_class_name)
+        if scheduler_name is not None:
+            pulumi.set(__self__, "scheduler_name", scheduler_name)
+        if scheduling_gates is not None:
+            pulumi.set(__self__, "scheduling_gates", scheduling_gates)
+        if security_context is not None:
+            pulumi.set(__self__, "security_context", security_context)
+        if service_account is not None:
+            pulumi.set(__self__, "service_account", service_account)
+        if service_account_name is not None:
+            pulumi.set(__self__, "service_account_name", service_account_name)
+        if set_hostname_as_fqdn is not None:
+            pulumi.set(__self__, "set_hostname_as_fqdn", set_hostname_as_fqdn)
+        if share_process_namespace is not None:
+            pulumi.set(__self__, "share_process_namespace", share_process_namespace)
+        if subdomain is not None:
+            pulumi.set(__self__, "subdomain", subdomain)
+        if termination_grace_period_seconds is not None:
+            pulumi.set(__self__, "termination_grace_period_seconds", termination_grace_period_seconds)
+        if tolerations is not None:
+            pulumi.set(__self__, "tolerations", tolerations)
+        if topology_spread_constraints is not None:
+            pulumi.set(__self__, "topology_spread_constraints", topology_spread_constraints)
+        if volumes is not None:
+            pulumi.set(__self__, "volumes", volumes)
+        if workload_ref is not None:
+            pulumi.set(__self__, "workload_ref", workload_ref)
+
+    @_builtins.property
+    @pulumi.getter(name="activeDeadlineSeconds")
+    def active_deadline_seconds(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "active_deadline_seconds")
+
+    @_builtins.property
+    @pulumi.getter
+    def affinity(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPatch']:
+        return pulumi.get(self, "affinity")
+
+    @_builtins.property
+    @pulumi.getter(name="automountServiceAccountToken")
+    def automount_service_account_token(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "automount_service_account_token")
+
+    @_builtins.property
+    @pulumi.getter
+    def containers(self) -> Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPatch']]:
+        return pulumi.get(self, "containers")
+
+    @_builtins.property
+    @pulumi.getter(name="dnsConfig")
+    def dns_config(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigPatch']:
+        return pulumi.get(self, "dns_config")
+
+    @_builtins.property
+    @pulumi.getter(name="dnsPolicy")
+    def dns_policy(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "dns_policy")
+
+    @_builtins.property
+    @pulumi.getter(name="enableServiceLinks")
+    def enable_service_links(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "enable_service_links")
+
+    @_builtins.property
+    @pulumi.getter(name="ephemeralContainers")
+    def ephemeral_containers(self) -> Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPatch']]:
+        return pulumi.get(self, "ephemeral_containers")
+
+    @_builtins.property
+    @pulumi.getter(name="hostAliases")
+    def host_aliases(self) -> Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesPatch']]:
+        return pulumi.get(self, "host_aliases")
+
+    @_builtins.property
+    @pulumi.getter(name="hostIPC")
+    def host_ipc(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "host_ipc")
+
+    @_builtins.property
+    @pulumi.getter(name="hostNetwork")
+    def host_network(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "host_network")
+
+    @_builtins.property
+    @pulumi.getter(name="hostPID")
+    def host_pid(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "host_pid")
+
+    @_builtins.property
+    @pulumi.getter(name="hostUsers")
+    def host_users(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "host_users")
+
+    @_builtins.property
+    @pulumi.getter
+    def hostname(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "hostname")
+
+    @_builtins.property
+    @pulumi.getter(name="hostnameOverride")
+    def hostname_override(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "hostname_override")
+
+    @_builtins.property
+    @pulumi.getter(name="imagePullSecrets")
+    def image_pull_secrets(self) -> Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsPatch']]:
+        return pulumi.get(self, "image_pull_secrets")
+
+    @_builtins.property
+    @pulumi.getter(name="initContainers")
+    def init_containers(self) -> Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPatch']]:
+        return pulumi.get(self, "init_containers")
+
+    @_builtins.property
+    @pulumi.getter(name="nodeName")
+    def node_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "node_name")
+
+    @_builtins.property
+    @pulumi.getter(name="nodeSelector")
+    def node_selector(self) -> Optional[Mapping[str, _builtins.str]]:
+        return pulumi.get(self, "node_selector")
+
+    @_builtins.property
+    @pulumi.getter
+    def os(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecOsPatch']:
+        return pulumi.get(self, "os")
+
+    @_builtins.property
+    @pulumi.getter
+    def overhead(self) -> Optional[Mapping[str, Any]]:
+        return pulumi.get(self, "overhead")
+
+    @_builtins.property
+    @pulumi.getter(name="preemptionPolicy")
+    def preemption_policy(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "preemption_policy")
+
+    @_builtins.property
+    @pulumi.getter
+    def priority(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "priority")
+
+    @_builtins.property
+    @pulumi.getter(name="priorityClassName")
+    def priority_class_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "priority_class_name")
+
+    @_builtins.property
+    @pulumi.getter(name="readinessGates")
+    def readiness_gates(self) -> Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatch']]:
+        return pulumi.get(self, "readiness_gates")
+
+    @_builtins.property
+    @pulumi.getter(name="resourceClaims")
+    def resource_claims(self) -> Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsPatch']]:
+        return pulumi.get(self, "resource_claims")
+
+    @_builtins.property
+    @pulumi.getter
+    def resources(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesPatch']:
+        return pulumi.get(self, "resources")
+
+    @_builtins.property
+    @pulumi.getter(name="restartPolicy")
+    def restart_policy(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "restart_policy")
+
+    @_builtins.property
+    @pulumi.getter(name="runtimeClassName")
+    def runtime_class_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "runtime_class_name")
+
+    @_builtins.property
+    @pulumi.getter(name="schedulerName")
+    def scheduler_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "scheduler_name")
+
+    @_builtins.property
+    @pulumi.getter(name="schedulingGates")
+    def scheduling_gates(self) -> Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesPatch']]:
+        return pulumi.get(self, "scheduling_gates")
+
+    @_builtins.property
+    @pulumi.getter(name="securityContext")
+    def security_context(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextPatch']:
+        return pulumi.get(self, "security_context")
+
+    @_builtins.property
+    @pulumi.getter(name="serviceAccount")
+    def service_account(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "service_account")
+
+    @_builtins.property
+    @pulumi.getter(name="serviceAccountName")
+    def service_account_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "service_account_name")
+
+    @_builtins.property
+    @pulumi.getter(name="setHostnameAsFQDN")
+    def set_hostname_as_fqdn(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "set_hostname_as_fqdn")
+
+    @_builtins.property
+    @pulumi.getter(name="shareProcessNamespace")
+    def share_process_namespace(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "share_process_namespace")
+
+    @_builtins.property
+    @pulumi.getter
+    def subdomain(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "subdomain")
+
+    @_builtins.property
+    @pulumi.getter(name="terminationGracePeriodSeconds")
+    def termination_grace_period_seconds(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "termination_grace_period_seconds")
+
+    @_builtins.property
+    @pulumi.getter
+    def tolerations(self) -> Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsPatch']]:
+        return pulumi.get(self, "tolerations")
+
+    @_builtins.property
+    @pulumi.getter(name="topologySpreadConstraints")
+    def topology_spread_constraints(self) -> Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsPatch']]:
+        return pulumi.get(self, "topology_spread_constraints")
+
+    @_builtins.property
+    @pulumi.getter
+    def volumes(self) -> Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatch']]:
+        return pulumi.get(self, "volumes")
+
+    @_builtins.property
+    @pulumi.getter(name="workloadRef")
+    def workload_ref(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefPatch']:
+        return pulumi.get(self, "workload_ref")
@@ -0,0 +1,68 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFile']
+
+@pulumi.output_type
+class RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFile(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "readOnly":
+            suggest = "read_only"
+        elif key == "secretName":
+            suggest = "secret_name"
+        elif key == "shareName":
+            suggest = "share_name"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFile. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFile.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFile.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 read_only: Optional[_builtins.bool] = None,
+                 secret_name: Optional[_builtins.str] = None,
+                 share_name: Optional[_builtins.str] = None):
+        if read_only is not None:
+            pulumi.set(__self__, "read_only", read_only)
+        if secret_name is not None:
+            pulumi.set(__self__, "secret_name", secret_name)
+        if share_name is not None:
+            pulumi.set(__self__, "share_name", share_name)
+
+    @_builtins.property
+    @pulumi.getter(name="readOnly")
+    def read_only(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "read_only")
+
+    @_builtins.property
+    @pulumi.getter(name="secretName")
+    def secret_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "secret_name")
+
+    @_builtins.property
+    @pulumi.getter(name="shareName")
+    def share_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "share_name")
@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterStatusHead']
+
+@pulumi.output_type
+class RayClusterStatusHead(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "podIP":
+            suggest = "pod_ip"
+        elif key == "podName":
+            suggest = "pod_name"
+        elif key == "serviceIP":
+            suggest = "service_ip"
+        elif key == "serviceName":
+            suggest = "service_name"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterStatusHead. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterStatusHead.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterStatusHead.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 pod_ip: Optional[_builtins.str] = None,
+                 pod_name: Optional[_builtins.str] = None,
+                 service_ip: Optional[_builtins.str] = None,
+                 service_name: Optional[_builtins.str] = None):
+        if pod_ip is not None:
+            pulumi.set(__self__, "pod_ip", pod_ip)
+        if pod_name is not None:
+            pulumi.set(__self__, "pod_name", pod_name)
+        if service_ip is not None:
+            pulumi.set(__self__, "service_ip", service_ip)
+        if service_name is not None:
+            pulumi.set(__self__, "service_name", service_name)
+
+    @_builtins.property
+    @pulumi.getter(name="podIP")
+    def pod_ip(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "pod_ip")
+
+    @_builtins.property
+    @pulumi.getter(name="podName")
+    def pod_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "pod_name")
+
+    @_builtins.property
+    @pulumi.getter(name="serviceIP")
+    def service_ip(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "service_ip")
+
+    @_builtins.property
+    @pulumi.getter(name="serviceName")
+    def service_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "service_name")
@@ -0,0 +1,198 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterStatusPatch']
+
+@pulumi.output_type
+class RayClusterStatusPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "availableWorkerReplicas":
+            suggest = "available_worker_replicas"
+        elif key == "desiredCPU":
+            suggest = "desired_cpu"
+        elif key == "desiredGPU":
+            suggest = "desired_gpu"
+        elif key == "desiredMemory":
+            suggest = "desired_memory"
+        elif key == "desiredTPU":
+            suggest = "desired_tpu"
+        elif key == "desiredWorkerReplicas":
+            suggest = "desired_worker_replicas"
+        elif key == "lastUpdateTime":
+            suggest = "last_update_time"
+        elif key == "maxWorkerReplicas":
+            suggest = "max_worker_replicas"
+        elif key == "minWorkerReplicas":
+            suggest = "min_worker_replicas"
+        elif key == "observedGeneration":
+            suggest = "observed_generation"
+        elif key == "readyWorkerReplicas":
+            suggest = "ready_worker_replicas"
+        elif key == "stateTransitionTimes":
+            suggest = "state_transition_times"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterStatusPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterStatusPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterStatusPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 available_worker_replicas: Optional[_builtins.int] = None,
+                 conditions: Optional[Sequence['outputs.RayClusterStatusConditionsPatch']] = None,
+                 desired_cpu: Optional[Any] = None,
+                 desired_gpu: Optional[Any] = None,
+                 desired_memory: Optional[Any] = None,
+                 desired_tpu: Optional[Any] = None,
+                 desired_worker_replicas: Optional[_builtins.int] = None,
+                 endpoints: Optional[Mapping[str, _builtins.str]] = None,
+                 head: Optional['outputs.RayClusterStatusHeadPatch'] = None,
+                 last_update_time: Optional[_builtins.str] = None,
+                 max_worker_replicas: Optional[_builtins.int] = None,
+                 min_worker_replicas: Optional[_builtins.int] = None,
+                 observed_generation: Optional[_builtins.int] = None,
+                 ready_worker_replicas: Optional[_builtins.int] = None,
+                 reason: Optional[_builtins.str] = None,
+                 state: Optional[_builtins.str] = None,
+                 state_transition_times: Optional[Mapping[str, _builtins.str]] = None):
+        if available_worker_replicas is not None:
+            pulumi.set(__self__, "available_worker_replicas", available_worker_replicas)
+        if conditions is not None:
+            pulumi.set(__self__, "conditions", conditions)
+        if desired_cpu is not None:
+            pulumi.set(__self__, "desired_cpu", desired_cpu)
+        if desired_gpu is not None:
+            pulumi.set(__self__, "desired_gpu", desired_gpu)
+        if desired_memory is not None:
+            pulumi.set(__self__, "desired_memory", desired_memory)
+        if desired_tpu is not None:
+            pulumi.set(__self__, "desired_tpu", desired_tpu)
+        if desired_worker_replicas is not None:
+            pulumi.set(__self__, "desired_worker_replicas", desired_worker_replicas)
+        if endpoints is not None:
+            pulumi.set(__self__, "endpoints", endpoints)
+        if head is not None:
+            pulumi.set(__self__, "head", head)
+        if last_update_time is not None:
+            pulumi.set(__self__, "last_update_time", last_update_time)
+        if max_worker_replicas is not None:
+            pulumi.set(__self__, "max_worker_replicas", max_worker_replicas)
+        if min_worker_replicas is not None:
+            pulumi.set(__self__, "min_worker_replicas", min_worker_replicas)
+        if observed_generation is not None:
+            pulumi.set(__self__, "observed_generation", observed_generation)
+        if ready_worker_replicas is not None:
+            pulumi.set(__self__, "ready_worker_replicas", ready_worker_replicas)
+        if reason is not None:
+            pulumi.set(__self__, "reason", reason)
+        if state is not None:
+            pulumi.set(__self__, "state", state)
+        if state_transition_times is not None:
+            pulumi.set(__self__, "state_transition_times", state_transition_times)
+
+    @_builtins.property
+    @pulumi.getter(name="availableWorkerReplicas")
+    def available_worker_replicas(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "available_worker_replicas")
+
+    @_builtins.property
+    @pulumi.getter
+    def conditions(self) -> Optional[Sequence['outputs.RayClusterStatusConditionsPatch']]:
+        return pulumi.get(self, "conditions")
+
+    @_builtins.property
+    @pulumi.getter(name="desiredCPU")
+    def desired_cpu(self) -> Optional[Any]:
+        return pulumi.get(self, "desired_cpu")
+
+    @_builtins.property
+    @pulumi.getter(name="desiredGPU")
+    def desired_gpu(self) -> Optional[Any]:
+        return pulumi.get(self, "desired_gpu")
+
+    @_builtins.property
+    @pulumi.getter(name="desiredMemory")
+    def desired_memory(self) -> Optional[Any]:
+        return pulumi.get(self, "desired_memory")
+
+    @_builtins.property
+    @pulumi.getter(name="desiredTPU")
+    def desired_tpu(self) -> Optional[Any]:
+        return pulumi.get(self, "desired_tpu")
+
+    @_builtins.property
+    @pulumi.getter(name="desiredWorkerReplicas")
+    def desired_worker_replicas(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "desired_worker_replicas")
+
+    @_builtins.property
+    @pulumi.getter
+    def endpoints(self) -> Optional[Mapping[str, _builtins.str]]:
+        return pulumi.get(self, "endpoints")
+
+    @_builtins.property
+    @pulumi.getter
+    def head(self) -> Optional['outputs.RayClusterStatusHeadPatch']:
+        return pulumi.get(self, "head")
+
+    @_builtins.property
+    @pulumi.getter(name="lastUpdateTime")
+    def last_update_time(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "last_update_time")
+
+    @_builtins.property
+    @pulumi.getter(name="maxWorkerReplicas")
+    def max_worker_replicas(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "max_worker_replicas")
+
+    @_builtins.property
+    @pulumi.getter(name="minWorkerReplicas")
+    def min_worker_replicas(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "min_worker_replicas")
+
+    @_builtins.property
+    @pulumi.getter(name="observedGeneration")
+    def observed_generation(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "observed_generation")
+
+    @_builtins.property
+    @pulumi.getter(name="readyWorkerReplicas")
+    def ready_worker_replicas(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "ready_worker_replicas")
+
+    @_builtins.property
+    @pulumi.getter
+    def reason(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "reason")
+
+    @_builtins.property
+    @pulumi.getter
+    def state(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "state")
+
+    @_builtins.property
+    @pulumi.getter(name="stateTransitionTimes")
+    def state_transition_times(self) -> Optional[Mapping[str, _builtins.str]]:
+        return pulumi.get(self, "state_transition_times")
@@ -0,0 +1,3864 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import importlib
+import typing
+
+__all__ = [
+    'RayCluster',
+    'RayClusterSpec',
+    'RayClusterSpecAuthOptions',
+    'RayClusterSpecAuthOptionsPatch',
+    'RayClusterSpecAutoscalerOptions',
+    'RayClusterSpecAutoscalerOptionsEnv',
+    'RayClusterSpecAutoscalerOptionsEnvFrom',
+    'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRef',
+    'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefPatch',
+    'RayClusterSpecAutoscalerOptionsEnvFromPatch',
+    'RayClusterSpecAutoscalerOptionsEnvFromSecretRef',
+    'RayClusterSpecAutoscalerOptionsEnvFromSecretRefPatch',
+    'RayClusterSpecAutoscalerOptionsEnvPatch',
+    'RayClusterSpecAutoscalerOptionsEnvValueFrom',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRef',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefPatch',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRef',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefPatch',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRef',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefPatch',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromPatch',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRef',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefPatch',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRef',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefPatch',
+    'RayClusterSpecAutoscalerOptionsPatch',
+    'RayClusterSpecAutoscalerOptionsResources',
+    'RayClusterSpecAutoscalerOptionsResourcesClaims',
+    'RayClusterSpecAutoscalerOptionsResourcesClaimsPatch',
+    'RayClusterSpecAutoscalerOptionsResourcesPatch',
+    'RayClusterSpecAutoscalerOptionsSecurityContext',
+    'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfile',
+    'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatch',
+    'RayClusterSpecAutoscalerOptionsSecurityContextCapabilities',
+    'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatch',
+    'RayClusterSpecAutoscalerOptionsSecurityContextPatch',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptions',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatch',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfile',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatch',
+    'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptions',
+    'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatch',
+    'RayClusterSpecAutoscalerOptionsVolumeMounts',
+    'RayClusterSpecAutoscalerOptionsVolumeMountsPatch',
+    'RayClusterSpecGcsFaultToleranceOptions',
+    'RayClusterSpecGcsFaultToleranceOptionsPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPassword',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFrom',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsername',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernamePatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFrom',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRefPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRefPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRefPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRefPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRefPatch',
+    'RayClusterSpecHeadGroupSpec',
+    'RayClusterSpecHeadGroupSpecHeadService',
+    'RayClusterSpecHeadGroupSpecHeadServiceMetadata',
+    'RayClusterSpecHeadGroupSpecHeadServiceMetadataPatch',
+    'RayClusterSpecHeadGroupSpecHeadServicePatch',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpec',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPatch',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPorts',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsPatch',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfig',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIP',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPPatch',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatch',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatus',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusConditions',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsPatch',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancer',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngress',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatch',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPorts',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsPatch',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerPatch',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusPatch',
+    'RayClusterSpecHeadGroupSpecPatch',
+    'RayClusterSpecHeadGroupSpecTemplate',
+    'RayClusterSpecHeadGroupSpecTemplateMetadata',
+    'RayClusterSpecHeadGroupSpecTemplateMetadataPatch',
+    'RayClusterSpecHeadGroupSpecTemplatePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinity',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinity',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFields',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFields',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinity',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinity',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainers',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnv',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFrom',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFrom',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecycle',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStart',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleep',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStop',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleep',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbe',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPorts',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbe',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicy',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResources',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaims',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRules',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodes',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContext',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfile',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfilePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilities',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfile',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfilePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbe',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevices',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMounts',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfig',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainers',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnv',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFrom',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFrom',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecycle',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStart',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleep',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStop',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleep',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbe',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPorts',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbe',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicy',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResources',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaims',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRules',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodes',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContext',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfile',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilities',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfile',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbe',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevices',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMounts',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecHostAliases',
+    'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecrets',
+    'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainers',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnv',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFrom',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFrom',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecycle',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStart',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleep',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStop',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleep',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbe',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPorts',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbe',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicy',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResources',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaims',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRules',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodes',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContext',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfile',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfilePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilities',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfile',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfilePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbe',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevices',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMounts',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecOs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecOsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGates',
+    'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaims',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResources',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaims',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGates',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContext',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfile',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfile',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctls',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTolerations',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraints',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumes',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStore',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDisk',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFile',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinder',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMap',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItems',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsi',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPI',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItems',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDir',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeral',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplate',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadata',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplatePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSource',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResources',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolume',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlocker',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDisk',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepo',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPath',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImage',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsi',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaim',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDisk',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolume',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjected',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSources',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundle',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMap',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItems',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPI',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItems',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificate',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificatePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecret',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItems',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountToken',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobyte',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbd',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIO',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecret',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItems',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageos',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolume',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefPatch',
+    'RayClusterSpecPatch',
+    'RayClusterSpecUpgradeStrategy',
+    'RayClusterSpecUpgradeStrategyPatch',
+    'RayClusterSpecWorkerGroupSpecs',
+    'RayClusterSpecWorkerGroupSpecsPatch',
+    'RayClusterSpecWorkerGroupSpecsScaleStrategy',
+    'RayClusterSpecWorkerGroupSpecsScaleStrategyPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplate',
+    'RayClusterSpecWorkerGroupSpecsTemplateMetadata',
+    'RayClusterSpecWorkerGroupSpecsTemplateMetadataPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplatePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinity',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinity',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFields',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFields',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinity',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinity',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainers',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnv',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFrom',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFrom',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecycle',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStart',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleep',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStop',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleep',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbe',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPorts',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbe',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicy',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResources',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaims',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRules',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodes',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContext',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfile',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfilePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilities',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfile',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfilePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbe',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevices',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMounts',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfig',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainers',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnv',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFrom',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFrom',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecycle',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStart',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleep',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStop',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleep',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbe',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPorts',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbe',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicy',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResources',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaims',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRules',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodes',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContext',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfile',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilities',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfile',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbe',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevices',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMounts',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliases',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecrets',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainers',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnv',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFrom',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFrom',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecycle',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStart',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleep',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStop',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleep',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbe',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPorts',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbe',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicy',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResources',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaims',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRules',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodes',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContext',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfile',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfilePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilities',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfile',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfilePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbe',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevices',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMounts',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecOs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecOsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGates',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaims',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResources',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaims',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGates',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContext',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfile',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfilePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfile',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfilePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctls',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerations',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraints',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumes',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStore',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStorePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDisk',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFile',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFilePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinder',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMap',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItems',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsi',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPI',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItems',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDir',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeral',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplate',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadata',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplatePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSource',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResources',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolume',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlocker',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDisk',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepo',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPath',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImage',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImagePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsi',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaim',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDisk',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolume',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjected',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSources',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundle',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMap',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItems',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPI',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItems',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificate',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificatePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecret',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItems',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountToken',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobyte',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobytePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbd',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIO',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecret',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItems',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageos',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolume',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefPatch',
+    'RayClusterStatus',
+    'RayClusterStatusConditions',
+    'RayClusterStatusConditionsPatch',
+    'RayClusterStatusHead',
+    'RayClusterStatusHeadPatch',
+    'RayClusterStatusPatch',
+]
+
+_TYPE_MODULES = {
+    'RayCluster': 'RayCluster',
+    'RayClusterSpec': 'RayClusterSpec',
+    'RayClusterSpecAuthOptions': 'RayClusterSpecAuthOptions',
+    'RayClusterSpecAuthOptionsPatch': 'RayClusterSpecAuthOptionsPatch',
+    'RayClusterSpecAutoscalerOptions': 'RayClusterSpecAutoscalerOptions',
+    'RayClusterSpecAutoscalerOptionsEnv': 'RayClusterSpecAutoscalerOptionsEnv',
+    'RayClusterSpecAutoscalerOptionsEnvFrom': 'RayClusterSpecAutoscalerOptionsEnvFrom',
+    'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRef': 'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRef',
+    'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefPatch': 'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefPatch',
+    'RayClusterSpecAutoscalerOptionsEnvFromPatch': 'RayClusterSpecAutoscalerOptionsEnvFromPatch',
+    'RayClusterSpecAutoscalerOptionsEnvFromSecretRef': 'RayClusterSpecAutoscalerOptionsEnvFromSecretRef',
+    'RayClusterSpecAutoscalerOptionsEnvFromSecretRefPatch': 'RayClusterSpecAutoscalerOptionsEnvFromSecretRefPatch',
+    'RayClusterSpecAutoscalerOptionsEnvPatch': 'RayClusterSpecAutoscalerOptionsEnvPatch',
+    'RayClusterSpecAutoscalerOptionsEnvValueFrom': 'RayClusterSpecAutoscalerOptionsEnvValueFrom',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRef': 'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRef',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefPatch': 'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefPatch',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRef': 'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRef',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefPatch': 'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefPatch',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRef': 'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRef',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefPatch': 'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefPatch',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromPatch': 'RayClusterSpecAutoscalerOptionsEnvValueFromPatch',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRef': 'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRef',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefPatch': 'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefPatch',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRef': 'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRef',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefPatch': 'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefPatch',
+    'RayClusterSpecAutoscalerOptionsPatch': 'RayClusterSpecAutoscalerOptionsPatch',
+    'RayClusterSpecAutoscalerOptionsResources': 'RayClusterSpecAutoscalerOptionsResources',
+    'RayClusterSpecAutoscalerOptionsResourcesClaims': 'RayClusterSpecAutoscalerOptionsResourcesClaims',
+    'RayClusterSpecAutoscalerOptionsResourcesClaimsPatch': 'RayClusterSpecAutoscalerOptionsResourcesClaimsPatch',
+    'RayClusterSpecAutoscalerOptionsResourcesPatch': 'RayClusterSpecAutoscalerOptionsResourcesPatch',
+    'RayClusterSpecAutoscalerOptionsSecurityContext': 'RayClusterSpecAutoscalerOptionsSecurityContext',
+    'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfile': 'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfile',
+    'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatch': 'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatch',
+    'RayClusterSpecAutoscalerOptionsSecurityContextCapabilities': 'RayClusterSpecAutoscalerOptionsSecurityContextCapabilities',
+    'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatch': 'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatch',
+    'RayClusterSpecAutoscalerOptionsSecurityContextPatch': 'RayClusterSpecAutoscalerOptionsSecurityContextPatch',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptions': 'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptions',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatch': 'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatch',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfile': 'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfile',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatch': 'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatch',
+    'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptions': 'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptions',
+    'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatch': 'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatch',
+    'RayClusterSpecAutoscalerOptionsVolumeMounts': 'RayClusterSpecAutoscalerOptionsVolumeMounts',
+    'RayClusterSpecAutoscalerOptionsVolumeMountsPatch': 'RayClusterSpecAutoscalerOptionsVolumeMountsPatch',
+    'RayClusterSpecGcsFaultToleranceOptions': 'RayClusterSpecGcsFaultToleranceOptions',
+    'RayClusterSpecGcsFaultToleranceOptionsPatch': 'RayClusterSpecGcsFaultToleranceOptionsPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPassword': 'RayClusterSpecGcsFaultToleranceOptionsRedisPassword',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordPatch': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFrom': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFrom',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRef': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefPatch': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRef': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefPatch': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRef': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefPatch': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromPatch': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRef': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefPatch': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRef': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefPatch': 'RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsername': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsername',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernamePatch': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernamePatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFrom': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFrom',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRef': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRefPatch': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRefPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRef': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRefPatch': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRefPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRef': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRefPatch': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRefPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromPatch': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRef': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRefPatch': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRefPatch',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRef': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRef',
+    'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRefPatch': 'RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRefPatch',
+    'RayClusterSpecHeadGroupSpec': 'RayClusterSpecHeadGroupSpec',
+    'RayClusterSpecHeadGroupSpecHeadService': 'RayClusterSpecHeadGroupSpecHeadService',
+    'RayClusterSpecHeadGroupSpecHeadServiceMetadata': 'RayClusterSpecHeadGroupSpecHeadServiceMetadata',
+    'RayClusterSpecHeadGroupSpecHeadServiceMetadataPatch': 'RayClusterSpecHeadGroupSpecHeadServiceMetadataPatch',
+    'RayClusterSpecHeadGroupSpecHeadServicePatch': 'RayClusterSpecHeadGroupSpecHeadServicePatch',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpec': 'RayClusterSpecHeadGroupSpecHeadServiceSpec',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPatch': 'RayClusterSpecHeadGroupSpecHeadServiceSpecPatch',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPorts': 'RayClusterSpecHeadGroupSpecHeadServiceSpecPorts',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsPatch': 'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsPatch',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfig': 'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfig',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIP': 'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIP',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPPatch': 'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPPatch',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatch': 'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatch',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatus': 'RayClusterSpecHeadGroupSpecHeadServiceStatus',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusConditions': 'RayClusterSpecHeadGroupSpecHeadServiceStatusConditions',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsPatch': 'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsPatch',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancer': 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancer',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngress': 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngress',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatch': 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatch',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPorts': 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPorts',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsPatch': 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsPatch',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerPatch': 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerPatch',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusPatch': 'RayClusterSpecHeadGroupSpecHeadServiceStatusPatch',
+    'RayClusterSpecHeadGroupSpecPatch': 'RayClusterSpecHeadGroupSpecPatch',
+    'RayClusterSpecHeadGroupSpecTemplate': 'RayClusterSpecHeadGroupSpecTemplate',
+    'RayClusterSpecHeadGroupSpecTemplateMetadata': 'RayClusterSpecHeadGroupSpecTemplateMetadata',
+    'RayClusterSpecHeadGroupSpecTemplateMetadataPatch': 'RayClusterSpecHeadGroupSpecTemplateMetadataPatch',
+    'RayClusterSpecHeadGroupSpecTemplatePatch': 'RayClusterSpecHeadGroupSpecTemplatePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpec': 'RayClusterSpecHeadGroupSpecTemplateSpec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinity': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinity',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinity': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinity',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecution': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressions': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFields': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFields',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressions': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFields': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFields',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinity': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinity',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinity': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinity',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainers': 'RayClusterSpecHeadGroupSpecTemplateSpecContainers',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnv': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnv',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFrom': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFrom',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRef': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRef': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFrom': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFrom',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRef': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRef': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRef': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRef': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRef': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecycle': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecycle',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStart': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStart',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExec': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGet': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeaders': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleep': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleep',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocket': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStop': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStop',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExec': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGet': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeaders': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleep': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleep',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocket': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbe': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbe',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExec': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpc': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGet': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeaders': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocket': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPorts': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersPorts',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbe': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbe',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExec': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpc': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGet': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeaders': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocket': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicy': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicy',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResources': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResources',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaims': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaims',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRules': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRules',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodes': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodes',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContext': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContext',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfile': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfile',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfilePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfilePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilities': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilities',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptions': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfile': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfile',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfilePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfilePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptions': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbe': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbe',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExec': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpc': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGet': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeaders': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocket': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevices': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevices',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMounts': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMounts',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfig': 'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfig',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptions': 'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainers': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainers',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnv': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnv',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFrom': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFrom',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRef': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRef': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFrom': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFrom',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRef': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRef': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRef': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRef': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRef': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecycle': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecycle',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStart': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStart',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExec': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGet': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeaders': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleep': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleep',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocket': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStop': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStop',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExec': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGet': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeaders': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleep': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleep',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocket': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbe': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbe',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExec': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpc': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGet': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeaders': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocket': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPorts': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPorts',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbe': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbe',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExec': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpc': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGet': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeaders': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocket': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicy': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicy',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResources': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResources',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaims': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaims',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRules': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRules',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodes': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodes',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContext': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContext',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfile': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfile',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilities': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilities',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptions': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfile': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfile',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptions': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbe': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbe',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExec': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpc': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGet': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeaders': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocket': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevices': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevices',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMounts': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMounts',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecHostAliases': 'RayClusterSpecHeadGroupSpecTemplateSpecHostAliases',
+    'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecrets': 'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecrets',
+    'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainers': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainers',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnv': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnv',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFrom': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFrom',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRef': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRef': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFrom': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFrom',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRef': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRef': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRef': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRef': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRef': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecycle': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecycle',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStart': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStart',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExec': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGet': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeaders': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleep': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleep',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocket': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStop': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStop',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExec': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGet': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeaders': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleep': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleep',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocket': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbe': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbe',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExec': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpc': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGet': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeaders': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocket': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPorts': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPorts',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbe': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbe',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExec': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpc': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGet': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeaders': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocket': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicy': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicy',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResources': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResources',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaims': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaims',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRules': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRules',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodes': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodes',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContext': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContext',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfile': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfile',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfilePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfilePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilities': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilities',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptions': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfile': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfile',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfilePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfilePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptions': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbe': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbe',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExec': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpc': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGet': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGet',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeaders': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeaders',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocket': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocket',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevices': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevices',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMounts': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMounts',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecOs': 'RayClusterSpecHeadGroupSpecTemplateSpecOs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecOsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecOsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGates': 'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGates',
+    'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaims': 'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaims',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResources': 'RayClusterSpecHeadGroupSpecTemplateSpecResources',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaims': 'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaims',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecResourcesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGates': 'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGates',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContext': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContext',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfile': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfile',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptions': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfile': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfile',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctls': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctls',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptions': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTolerations': 'RayClusterSpecHeadGroupSpecTemplateSpecTolerations',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraints': 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraints',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelector': 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressions': 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumes': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumes',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStore': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStore',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDisk': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDisk',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFile': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFile',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRef': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinder': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinder',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRef': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMap': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMap',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItems': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItems',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsi': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsi',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRef': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPI': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPI',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItems': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItems',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRef': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRef': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDir': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDir',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeral': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeral',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplate': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplate',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadata': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadata',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplatePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplatePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpec': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpec',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSource': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSource',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRef': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResources': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResources',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelector': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressions': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFc': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFc',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolume': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolume',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRef': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlocker': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlocker',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDisk': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDisk',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepo': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepo',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPath': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPath',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImage': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImage',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsi': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsi',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRef': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfs': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaim': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaim',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDisk': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDisk',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolume': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolume',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjected': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjected',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSources': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSources',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundle': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundle',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelector': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelector',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressions': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressions',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMap': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMap',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItems': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItems',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPI': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPI',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItems': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItems',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRef': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRef': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificate': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificate',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificatePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificatePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecret': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecret',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItems': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItems',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountToken': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountToken',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobyte': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobyte',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbd': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbd',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRef': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIO': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIO',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRef': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecret': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecret',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItems': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItems',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageos': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageos',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRef': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefPatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolume': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolume',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatch': 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatch',
+    'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRef': 'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRef',
+    'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefPatch': 'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefPatch',
+    'RayClusterSpecPatch': 'RayClusterSpecPatch',
+    'RayClusterSpecUpgradeStrategy': 'RayClusterSpecUpgradeStrategy',
+    'RayClusterSpecUpgradeStrategyPatch': 'RayClusterSpecUpgradeStrategyPatch',
+    'RayClusterSpecWorkerGroupSpecs': 'RayClusterSpecWorkerGroupSpecs',
+    'RayClusterSpecWorkerGroupSpecsPatch': 'RayClusterSpecWorkerGroupSpecsPatch',
+    'RayClusterSpecWorkerGroupSpecsScaleStrategy': 'RayClusterSpecWorkerGroupSpecsScaleStrategy',
+    'RayClusterSpecWorkerGroupSpecsScaleStrategyPatch': 'RayClusterSpecWorkerGroupSpecsScaleStrategyPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplate': 'RayClusterSpecWorkerGroupSpecsTemplate',
+    'RayClusterSpecWorkerGroupSpecsTemplateMetadata': 'RayClusterSpecWorkerGroupSpecsTemplateMetadata',
+    'RayClusterSpecWorkerGroupSpecsTemplateMetadataPatch': 'RayClusterSpecWorkerGroupSpecsTemplateMetadataPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplatePatch': 'RayClusterSpecWorkerGroupSpecsTemplatePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpec': 'RayClusterSpecWorkerGroupSpecsTemplateSpec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinity': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinity',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinity': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinity',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecution': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFields': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFields',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFields': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFields',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinity': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinity',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinity': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinity',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainers': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainers',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnv': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnv',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFrom': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFrom',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFrom': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFrom',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecycle': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecycle',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStart': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStart',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExec': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGet': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeaders': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleep': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleep',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocket': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStop': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStop',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExec': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGet': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeaders': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleep': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleep',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocket': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbe': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbe',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExec': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpc': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGet': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeaders': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocket': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPorts': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPorts',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbe': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbe',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExec': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpc': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGet': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeaders': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocket': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicy': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicy',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResources': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResources',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaims': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaims',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRules': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRules',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodes': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodes',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContext': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContext',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfile': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfile',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfilePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfilePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilities': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilities',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfile': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfile',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfilePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfilePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbe': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbe',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExec': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpc': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGet': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeaders': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocket': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevices': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevices',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMounts': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMounts',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfig': 'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfig',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainers': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainers',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnv': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnv',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFrom': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFrom',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFrom': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFrom',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecycle': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecycle',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStart': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStart',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExec': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGet': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeaders': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleep': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleep',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocket': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStop': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStop',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExec': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGet': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeaders': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleep': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleep',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocket': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbe': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbe',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExec': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpc': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGet': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeaders': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocket': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPorts': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPorts',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbe': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbe',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExec': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpc': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGet': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeaders': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocket': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicy': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicy',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResources': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResources',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaims': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaims',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRules': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRules',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodes': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodes',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContext': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContext',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfile': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfile',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilities': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilities',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfile': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfile',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbe': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbe',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExec': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpc': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGet': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeaders': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocket': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevices': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevices',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMounts': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMounts',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliases': 'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliases',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecrets': 'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecrets',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainers': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainers',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnv': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnv',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFrom': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFrom',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFrom': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFrom',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecycle': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecycle',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStart': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStart',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExec': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGet': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeaders': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleep': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleep',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocket': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStop': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStop',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExec': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGet': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeaders': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleep': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleep',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocket': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbe': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbe',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExec': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpc': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGet': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeaders': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocket': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPorts': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPorts',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbe': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbe',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExec': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpc': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGet': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeaders': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocket': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicy': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicy',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResources': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResources',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaims': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaims',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRules': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRules',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodes': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodes',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContext': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContext',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfile': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfile',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfilePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfilePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilities': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilities',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfile': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfile',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfilePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfilePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbe': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbe',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExec': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpc': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGet': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGet',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeaders': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeaders',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocket': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocket',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevices': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevices',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMounts': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMounts',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecOs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecOs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecOsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecOsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGates': 'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGates',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaims': 'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaims',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResources': 'RayClusterSpecWorkerGroupSpecsTemplateSpecResources',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaims': 'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaims',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGates': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGates',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContext': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContext',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfile': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfile',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfilePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfilePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfile': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfile',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfilePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfilePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctls': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctls',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerations': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerations',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraints': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraints',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelector': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumes': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumes',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStore': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStore',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStorePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStorePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDisk': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDisk',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFile': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFile',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFilePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFilePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinder': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinder',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMap': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMap',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItems': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItems',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsi': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsi',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPI': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPI',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItems': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItems',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDir': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDir',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeral': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeral',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplate': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplate',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadata': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadata',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplatePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplatePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpec': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpec',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSource': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSource',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResources': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResources',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelector': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFc': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFc',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolume': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolume',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlocker': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlocker',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDisk': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDisk',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepo': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepo',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPath': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPath',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImage': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImage',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImagePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImagePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsi': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsi',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfs': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaim': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaim',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDisk': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDisk',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolume': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolume',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjected': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjected',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSources': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSources',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundle': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundle',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelector': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelector',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressions': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressions',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMap': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMap',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItems': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItems',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPI': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPI',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItems': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItems',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificate': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificate',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificatePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificatePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecret': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecret',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItems': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItems',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountToken': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountToken',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobyte': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobyte',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobytePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobytePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbd': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbd',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIO': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIO',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecret': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecret',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItems': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItems',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageos': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageos',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefPatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolume': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolume',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumePatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumePatch',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRef': 'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRef',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefPatch': 'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefPatch',
+    'RayClusterStatus': 'RayClusterStatus',
+    'RayClusterStatusConditions': 'RayClusterStatusConditions',
+    'RayClusterStatusConditionsPatch': 'RayClusterStatusConditionsPatch',
+    'RayClusterStatusHead': 'RayClusterStatusHead',
+    'RayClusterStatusHeadPatch': 'RayClusterStatusHeadPatch',
+    'RayClusterStatusPatch': 'RayClusterStatusPatch',
+}
+
+if typing.TYPE_CHECKING:
+    from .RayCluster import *
+    from .RayClusterSpec import *
+    from .RayClusterSpecAuthOptions import *
+    from .RayClusterSpecAuthOptionsPatch import *
+    from .RayClusterSpecAutoscalerOptions import *
+    from .RayClusterSpecAutoscalerOptionsEnv import *
+    from .RayClusterSpecAutoscalerOptionsEnvFrom import *
+    from .RayClusterSpecAutoscalerOptionsEnvFromConfigMapRef import *
+    from .RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefPatch import *
+    from .RayClusterSpecAutoscalerOptionsEnvFromPatch import *
+    from .RayClusterSpecAutoscalerOptionsEnvFromSecretRef import *
+    from .RayClusterSpecAutoscalerOptionsEnvFromSecretRefPatch import *
+    from .RayClusterSpecAutoscalerOptionsEnvPatch import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFrom import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRef import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefPatch import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromFieldRef import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefPatch import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRef import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefPatch import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromPatch import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRef import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefPatch import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRef import *
+    from .RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefPatch import *
+    from .RayClusterSpecAutoscalerOptionsPatch import *
+    from .RayClusterSpecAutoscalerOptionsResources import *
+    from .RayClusterSpecAutoscalerOptionsResourcesClaims import *
+    from .RayClusterSpecAutoscalerOptionsResourcesClaimsPatch import *
+    from .RayClusterSpecAutoscalerOptionsResourcesPatch import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContext import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfile import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatch import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextCapabilities import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatch import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextPatch import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptions import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatch import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfile import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatch import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptions import *
+    from .RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatch import *
+    from .RayClusterSpecAutoscalerOptionsVolumeMounts import *
+    from .RayClusterSpecAutoscalerOptionsVolumeMountsPatch import *
+    from .RayClusterSpecGcsFaultToleranceOptions import *
+    from .RayClusterSpecGcsFaultToleranceOptionsPatch import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPassword import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordPatch import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFrom import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRef import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromConfigMapKeyRefPatch import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRef import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFieldRefPatch import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRef import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromFileKeyRefPatch import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromPatch import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRef import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromResourceFieldRefPatch import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRef import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisPasswordValueFromSecretKeyRefPatch import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsername import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernamePatch import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFrom import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRef import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromConfigMapKeyRefPatch import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRef import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFieldRefPatch import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRef import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromFileKeyRefPatch import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromPatch import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRef import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromResourceFieldRefPatch import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRef import *
+    from .RayClusterSpecGcsFaultToleranceOptionsRedisUsernameValueFromSecretKeyRefPatch import *
+    from .RayClusterSpecHeadGroupSpec import *
+    from .RayClusterSpecHeadGroupSpecHeadService import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceMetadata import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceMetadataPatch import *
+    from .RayClusterSpecHeadGroupSpecHeadServicePatch import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceSpec import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceSpecPatch import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceSpecPorts import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceSpecPortsPatch import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfig import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIP import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPPatch import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatch import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatus import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusConditions import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsPatch import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancer import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngress import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatch import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPorts import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsPatch import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerPatch import *
+    from .RayClusterSpecHeadGroupSpecHeadServiceStatusPatch import *
+    from .RayClusterSpecHeadGroupSpecPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplate import *
+    from .RayClusterSpecHeadGroupSpecTemplateMetadata import *
+    from .RayClusterSpecHeadGroupSpecTemplateMetadataPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplatePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpec import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinity import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinity import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecution import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFields import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFields import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinity import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinity import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainers import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnv import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFrom import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFrom import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecycle import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStart import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExec import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGet import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeaders import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleep import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocket import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStop import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExec import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGet import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeaders import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleep import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocket import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbe import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExec import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpc import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGet import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeaders import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocket import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersPorts import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbe import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExec import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpc import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGet import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeaders import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocket import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicy import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersResources import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaims import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRules import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodes import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContext import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfile import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfilePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilities import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfile import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfilePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbe import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExec import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpc import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGet import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeaders import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocket import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevices import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMounts import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecDnsConfig import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainers import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnv import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFrom import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFrom import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecycle import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStart import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExec import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGet import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeaders import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleep import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocket import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStop import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExec import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGet import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeaders import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleep import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocket import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbe import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExec import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpc import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGet import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeaders import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocket import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPorts import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbe import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExec import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpc import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGet import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeaders import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocket import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicy import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResources import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaims import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRules import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodes import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContext import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfile import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilities import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfile import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbe import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExec import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpc import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGet import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeaders import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocket import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevices import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMounts import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecHostAliases import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecrets import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainers import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnv import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFrom import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFrom import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecycle import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStart import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExec import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGet import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeaders import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleep import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocket import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStop import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExec import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGet import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeaders import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleep import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocket import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbe import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExec import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpc import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGet import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeaders import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocket import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPorts import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbe import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExec import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpc import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGet import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeaders import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocket import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicy import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResources import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaims import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRules import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodes import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContext import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfile import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfilePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilities import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfile import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfilePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbe import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExec import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpc import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGet import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeaders import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocket import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevices import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMounts import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecOs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecOsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecReadinessGates import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecResourceClaims import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecResources import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaims import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecResourcesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGates import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContext import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfile import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfile import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctls import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecTolerations import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecTolerationsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraints import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelector import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumes import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStore import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDisk import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFile import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinder import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMap import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItems import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsi import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPI import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItems import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDir import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeral import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplate import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadata import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplatePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpec import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSource import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResources import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelector import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesFc import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolume import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlocker import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDisk import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepo import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPath import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesImage import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsi import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfs import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaim import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDisk import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolume import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjected import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSources import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundle import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelector import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressions import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMap import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItems import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPI import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItems import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificate import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificatePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecret import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItems import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountToken import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobyte import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbd import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIO import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecret import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItems import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageos import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefPatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolume import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatch import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRef import *
+    from .RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefPatch import *
+    from .RayClusterSpecPatch import *
+    from .RayClusterSpecUpgradeStrategy import *
+    from .RayClusterSpecUpgradeStrategyPatch import *
+    from .RayClusterSpecWorkerGroupSpecs import *
+    from .RayClusterSpecWorkerGroupSpecsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsScaleStrategy import *
+    from .RayClusterSpecWorkerGroupSpecsScaleStrategyPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplate import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateMetadata import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateMetadataPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplatePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpec import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinity import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinity import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecution import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFields import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFields import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinity import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinity import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainers import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnv import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFrom import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFrom import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecycle import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStart import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExec import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGet import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeaders import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleep import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocket import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStop import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExec import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGet import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeaders import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleep import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocket import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbe import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExec import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpc import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGet import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeaders import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocket import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPorts import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbe import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExec import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpc import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGet import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeaders import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocket import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicy import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResources import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaims import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRules import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodes import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContext import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfile import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfilePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilities import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfile import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfilePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbe import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExec import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpc import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGet import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeaders import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocket import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevices import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMounts import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfig import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainers import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnv import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFrom import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFrom import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecycle import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStart import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExec import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGet import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeaders import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleep import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocket import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStop import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExec import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGet import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeaders import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleep import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocket import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbe import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExec import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpc import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGet import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeaders import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocket import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPorts import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbe import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExec import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpc import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGet import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeaders import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocket import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicy import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResources import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaims import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRules import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodes import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContext import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfile import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilities import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfile import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbe import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExec import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpc import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGet import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeaders import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocket import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevices import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMounts import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliases import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecrets import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainers import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnv import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFrom import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFrom import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecycle import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStart import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExec import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGet import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeaders import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleep import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocket import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStop import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExec import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGet import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeaders import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleep import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocket import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbe import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExec import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpc import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGet import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeaders import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocket import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPorts import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbe import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExec import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpc import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGet import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeaders import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocket import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicy import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResources import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaims import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRules import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodes import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContext import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfile import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfilePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilities import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfile import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfilePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbe import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExec import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpc import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGet import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeaders import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocket import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevices import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMounts import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecOs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecOsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGates import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaims import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecResources import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaims import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGates import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContext import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfile import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfilePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfile import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfilePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctls import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecTolerations import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraints import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelector import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumes import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStore import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStorePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDisk import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFile import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFilePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinder import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMap import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItems import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsi import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPI import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItems import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDir import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeral import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplate import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadata import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplatePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpec import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSource import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResources import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelector import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFc import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolume import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlocker import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDisk import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepo import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPath import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImage import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImagePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsi import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfs import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaim import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDisk import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolume import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjected import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSources import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundle import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelector import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressions import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMap import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItems import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPI import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItems import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificate import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificatePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecret import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItems import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountToken import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobyte import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobytePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbd import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIO import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecret import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItems import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageos import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefPatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolume import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumePatch import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRef import *
+    from .RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefPatch import *
+    from .RayClusterStatus import *
+    from .RayClusterStatusConditions import *
+    from .RayClusterStatusConditionsPatch import *
+    from .RayClusterStatusHead import *
+    from .RayClusterStatusHeadPatch import *
+    from .RayClusterStatusPatch import *
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _TYPE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -3,11 +3,2534 @@
 # *** Do not edit by hand unless you're certain you know what you are doing! ***
 
 import builtins as _builtins
-from ... import _utilities
+import importlib
 import typing
-# Export this package's modules as members:
-from .RayCluster import *
-from .RayClusterList import *
-from .RayClusterPatch import *
-from ._inputs import *
-from . import outputs
+from ... import _utilities
+
+__all__ = [
+    'RayClusterInitArgs',
+    'RayCluster',
+    'RayClusterListArgs',
+    'RayClusterList',
+    'RayClusterPatchArgs',
+    'RayClusterPatch',
+    'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvFromConfigMapRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvFromPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromSecretRefPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvFromSecretRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromSecretRefArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvFromSecretRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvFromArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvFromArgs',
+    'RayClusterSpecAutoscalerOptionsEnvPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFieldRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvValueFromArgs',
+    'RayClusterSpecAutoscalerOptionsEnvArgsDict',
+    'RayClusterSpecAutoscalerOptionsEnvArgs',
+    'RayClusterSpecAutoscalerOptionsPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsResourcesClaimsPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsResourcesClaimsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsResourcesClaimsArgsDict',
+    'RayClusterSpecAutoscalerOptionsResourcesClaimsArgs',
+    'RayClusterSpecAutoscalerOptionsResourcesPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsResourcesPatchArgs',
+    'RayClusterSpecAutoscalerOptionsResourcesArgsDict',
+    'RayClusterSpecAutoscalerOptionsResourcesArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfileArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextCapabilitiesArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextPatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfileArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextSeccompProfileArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecAutoscalerOptionsSecurityContextArgsDict',
+    'RayClusterSpecAutoscalerOptionsSecurityContextArgs',
+    'RayClusterSpecAutoscalerOptionsVolumeMountsPatchArgsDict',
+    'RayClusterSpecAutoscalerOptionsVolumeMountsPatchArgs',
+    'RayClusterSpecAutoscalerOptionsVolumeMountsArgsDict',
+    'RayClusterSpecAutoscalerOptionsVolumeMountsArgs',
+    'RayClusterSpecAutoscalerOptionsArgsDict',
+    'RayClusterSpecAutoscalerOptionsArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceMetadataPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceMetadataPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceMetadataArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceMetadataArgs',
+    'RayClusterSpecHeadGroupSpecHeadServicePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServicePatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecPortsArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigClientIPArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceSpecArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusConditionsArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusPatchArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceStatusArgs',
+    'RayClusterSpecHeadGroupSpecHeadServiceArgsDict',
+    'RayClusterSpecHeadGroupSpecHeadServiceArgs',
+    'RayClusterSpecHeadGroupSpecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateMetadataPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateMetadataPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateMetadataArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateMetadataArgs',
+    'RayClusterSpecHeadGroupSpecTemplatePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplatePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityNodeAffinityArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAffinityArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityPodAntiAffinityArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecAffinityArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvValueFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersEnvArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePostStartArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecyclePreStopArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecycleArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLifecycleArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersLivenessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersPortsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersReadinessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResizePolicyArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersRestartPolicyRulesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfilePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfileArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfilePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfileArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersSecurityContextArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersStartupProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeDevicesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersVolumeMountsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecContainersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecDnsConfigArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvValueFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersEnvArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePostStartArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecyclePreStopArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecycleArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLifecycleArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersLivenessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersPortsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersReadinessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResizePolicyArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersRestartPolicyRulesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfileArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfileArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersSecurityContextArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersStartupProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeDevicesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersVolumeMountsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecEphemeralContainersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecHostAliasesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecImagePullSecretsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvValueFromArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersEnvArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePostStartArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecyclePreStopArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecycleArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLifecycleArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersLivenessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersPortsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersReadinessProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResizePolicyArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersRestartPolicyRulesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfilePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfileArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfilePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfileArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersSecurityContextArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeExecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeGrpcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersStartupProbeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeDevicesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersVolumeMountsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecInitContainersArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecOsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecOsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecOsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecOsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecReadinessGatesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourceClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesClaimsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSchedulingGatesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfileArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfileArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSeccompProfileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextSysctlsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecSecurityContextArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTolerationsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecTopologySpreadConstraintsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStorePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStoreArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAwsElasticBlockStoreArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureDiskArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFilePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFileArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesAzureFileArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCephfsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCinderArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesConfigMapArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiNodePublishSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesCsiArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesDownwardAPIArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEmptyDirArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralVolumeClaimTemplateArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesEphemeralArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFcArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlexVolumeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesFlockerArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGcePersistentDiskArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGitRepoArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesGlusterfsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesHostPathArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImagePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImageArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesImageArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesNfsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPersistentVolumeClaimArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPhotonPersistentDiskArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesPortworxVolumeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesConfigMapArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesDownwardAPIArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificatePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificatePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificateArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesPodCertificateArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesSecretArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedSourcesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesProjectedArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobytePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobyteArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesQuobyteArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesRbdArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesScaleIOArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretItemsArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesSecretArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosSecretRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesStorageosArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumePatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumeArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumeArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecVolumesArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefPatchArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefPatchArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecWorkloadRefArgs',
+    'RayClusterSpecHeadGroupSpecTemplateSpecArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateSpecArgs',
+    'RayClusterSpecHeadGroupSpecTemplateArgsDict',
+    'RayClusterSpecHeadGroupSpecTemplateArgs',
+    'RayClusterSpecHeadGroupSpecArgsDict',
+    'RayClusterSpecHeadGroupSpecArgs',
+    'RayClusterSpecPatchArgsDict',
+    'RayClusterSpecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsScaleStrategyPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsScaleStrategyPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsScaleStrategyArgsDict',
+    'RayClusterSpecWorkerGroupSpecsScaleStrategyArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateMetadataPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateMetadataPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateMetadataArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateMetadataArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplatePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplatePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityNodeAffinityArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAffinityArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityPodAntiAffinityArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecAffinityArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvValueFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersEnvArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePostStartArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecyclePreStopArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecycleArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLifecycleArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersLivenessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersPortsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersReadinessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResizePolicyArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersRestartPolicyRulesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfilePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfileArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfilePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfileArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersSecurityContextArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersStartupProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeDevicesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersVolumeMountsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecContainersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecDnsConfigArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvValueFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersEnvArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePostStartArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecyclePreStopArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecycleArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLifecycleArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersLivenessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersPortsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersReadinessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResizePolicyArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersRestartPolicyRulesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfileArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfileArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersSecurityContextArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersStartupProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeDevicesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersVolumeMountsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecEphemeralContainersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecHostAliasesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecImagePullSecretsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromConfigMapRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromConfigMapKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromFileKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromSecretKeyRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvValueFromArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersEnvArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePostStartArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopSleepArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecyclePreStopArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecycleArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLifecycleArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersLivenessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersPortsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersReadinessProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResizePolicyArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesExitCodesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersRestartPolicyRulesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfilePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfileArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextCapabilitiesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfilePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfileArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextSeccompProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersSecurityContextArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeExecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeGrpcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetHttpHeadersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeHttpGetArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeTcpSocketArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersStartupProbeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeDevicesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersVolumeMountsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecInitContainersArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecOsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecOsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecOsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecOsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecReadinessGatesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourceClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesClaimsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSchedulingGatesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfilePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfileArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextAppArmorProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeLinuxOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfilePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfileArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSeccompProfileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextSysctlsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextWindowsOptionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecSecurityContextArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTolerationsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecTopologySpreadConstraintsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStorePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStorePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStoreArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStoreArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFilePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFilePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFileArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFileArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiNodePublishSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateMetadataArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplatePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourcePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecDataSourceArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecResourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateSpecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralVolumeClaimTemplateArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImagePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImagePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImageArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImageArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorMatchExpressionsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleLabelSelectorArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundlePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesClusterTrustBundleArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesConfigMapArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsResourceFieldRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesDownwardAPIArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificatePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificatePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificateArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesPodCertificateArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesSecretArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesServiceAccountTokenArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedSourcesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobytePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobytePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobyteArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobyteArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretItemsArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosSecretRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumePatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumePatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumeArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumeArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefPatchArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefPatchArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecWorkloadRefArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateSpecArgs',
+    'RayClusterSpecWorkerGroupSpecsTemplateArgsDict',
+    'RayClusterSpecWorkerGroupSpecsTemplateArgs',
+    'RayClusterSpecWorkerGroupSpecsArgsDict',
+    'RayClusterSpecWorkerGroupSpecsArgs',
+    'RayClusterSpecArgsDict',
+    'RayClusterSpecArgs',
+    'RayClusterStatusHeadArgsDict',
+    'RayClusterStatusHeadArgs',
+    'RayClusterStatusArgsDict',
+    'RayClusterStatusArgs',
+    'RayClusterArgsDict',
+    'RayClusterArgs',
+    'outputs',
+]
+
+# Resource classes live in same-named modules; everything else is an input type.
+_RESOURCE_MODULES = {
+    'RayClusterInitArgs': 'RayCluster',
+    'RayCluster': 'RayCluster',
+    'RayClusterListArgs': 'RayClusterList',
+    'RayClusterList': 'RayClusterList',
+    'RayClusterPatchArgs': 'RayClusterPatch',
+    'RayClusterPatch': 'RayClusterPatch',
+}
+
+if typing.TYPE_CHECKING:
+    from .RayCluster import *
+    from .RayClusterList import *
+    from .RayClusterPatch import *
+    from ._inputs import *
+    from . import outputs
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in ("_inputs", "outputs"):
+        return importlib.import_module(f"{__name__}.{name}")
+    module_name = _RESOURCE_MODULES.get(name)
+    if module_name is not None:
+        module = importlib.import_module(f"{__name__}.{module_name}")
+    else:
+        module = importlib.import_module(f"{__name__}._inputs")
+        if name not in module.__all__:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressArgsDict', 'RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressArgs']
+
+class RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressArgsDict(TypedDict):
+    hostname: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    ip_mode: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    ports: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsArgs']]]]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressArgs:
+    def __init__(__self__, *,
+                 hostname: pulumi.Input[Optional[_builtins.str]] = None,
+                 ip: pulumi.Input[Optional[_builtins.str]] = None,
+                 ip_mode: pulumi.Input[Optional[_builtins.str]] = None,
+                 ports: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsArgs']]]] = None):
+        if hostname is not None:
+            pulumi.set(__self__, "hostname", hostname)
+        if ip is not None:
+            pulumi.set(__self__, "ip", ip)
+        if ip_mode is not None:
+            pulumi.set(__self__, "ip_mode", ip_mode)
+        if ports is not None:
+            pulumi.set(__self__, "ports", ports)
+
+    @_builtins.property
+    @pulumi.getter
+    def hostname(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "hostname")
+
+    @hostname.setter
+    def hostname(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "hostname", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def ip(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "ip")
+
+    @ip.setter
+    def ip(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "ip", value)
+
+    @_builtins.property
+    @pulumi.getter(name="ipMode")
+    def ip_mode(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "ip_mode")
+
+    @ip_mode.setter
+    def ip_mode(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "ip_mode", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def ports(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsArgs']]]]:
+        return pulumi.get(self, "ports")
+
+    @ports.setter
+    def ports(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngressPortsArgs']]]]):
+        pulumi.set(self, "ports", value)
@@ -0,0 +1,91 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecPatchArgsDict', 'RayClusterSpecHeadGroupSpecPatchArgs']
+
+class RayClusterSpecHeadGroupSpecPatchArgsDict(TypedDict):
+    enable_ingress: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    head_service: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServicePatchArgs']]]
+    ray_start_params: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+    service_type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    template: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplatePatchArgs']]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecPatchArgs:
+    def __init__(__self__, *,
+                 enable_ingress: pulumi.Input[Optional[_builtins.bool]] = None,
+                 head_service: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServicePatchArgs']] = None,
+                 ray_start_params: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
+                 service_type: pulumi.Input[Optional[_builtins.str]] = None,
+                 template: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplatePatchArgs']] = None):
+        if enable_ingress is not None:
+            pulumi.set(__self__, "enable_ingress", enable_ingress)
+        if head_service is not None:
+            pulumi.set(__self__, "head_service", head_service)
+        if ray_start_params is not None:
+            pulumi.set(__self__, "ray_start_params", ray_start_params)
+        if service_type is not None:
+            pulumi.set(__self__, "service_type", service_type)
+        if template is not None:
+            pulumi.set(__self__, "template", template)
+
+    @_builtins.property
+    @pulumi.getter(name="enableIngress")
+    def enable_ingress(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "enable_ingress")
+
+    @enable_ingress.setter
+    def enable_ingress(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "enable_ingress", value)
+
+    @_builtins.property
+    @pulumi.getter(name="headService")
+    def head_service(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServicePatchArgs']]:
+        return pulumi.get(self, "head_service")
+
+    @head_service.setter
+    def head_service(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecHeadServicePatchArgs']]):
+        pulumi.set(self, "head_service", value)
+
+    @_builtins.property
+    @pulumi.getter(name="rayStartParams")
+    def ray_start_params(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "ray_start_params")
+
+    @ray_start_params.setter
+    def ray_start_params(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "ray_start_params", value)
+
+    @_builtins.property
+    @pulumi.getter(name="serviceType")
+    def service_type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "service_type")
+
+    @service_type.setter
+    def service_type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "service_type", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def template(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplatePatchArgs']]:
+        return pulumi.get(self, "template")
+
+    @template.setter
+    def template(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecTemplatePatchArgs']]):
+        pulumi.set(self, "template", value)
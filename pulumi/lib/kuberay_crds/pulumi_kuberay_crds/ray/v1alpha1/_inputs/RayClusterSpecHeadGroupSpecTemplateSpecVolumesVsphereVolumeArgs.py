@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumeArgsDict', 'RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumeArgs']
+
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumeArgsDict(TypedDict):
+    fs_type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    storage_policy_id: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    storage_policy_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    volume_path: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesVsphereVolumeArgs:
+    def __init__(__self__, *,
+                 fs_type: pulumi.Input[Optional[_builtins.str]] = None,
+                 storage_policy_id: pulumi.Input[Optional[_builtins.str]] = None,
+                 storage_policy_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 volume_path: pulumi.Input[Optional[_builtins.str]] = None):
+        if fs_type is not None:
+            pulumi.set(__self__, "fs_type", fs_type)
+        if storage_policy_id is not None:
+            pulumi.set(__self__, "storage_policy_id", storage_policy_id)
+        if storage_policy_name is not None:
+            pulumi.set(__self__, "storage_policy_name", storage_policy_name)
+        if volume_path is not None:
+            pulumi.set(__self__, "volume_path", volume_path)
+
+    @_builtins.property
+    @pulumi.getter(name="fsType")
+    def fs_type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "fs_type")
+
+    @fs_type.setter
+    def fs_type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "fs_type", value)
+
+    @_builtins.property
+    @pulumi.getter(name="storagePolicyID")
+    def storage_policy_id(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "storage_policy_id")
+
+    @storage_policy_id.setter
+    def storage_policy_id(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "storage_policy_id", value)
+
+    @_builtins.property
+    @pulumi.getter(name="storagePolicyName")
+    def storage_policy_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "storage_policy_name")
+
+    @storage_policy_name.setter
+    def storage_policy_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "storage_policy_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="volumePath")
+    def volume_path(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "volume_path")
+
+    @volume_path.setter
+    def volume_path(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "volume_path", value)
@@ -0,0 +1,117 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecPatchArgsDict', 'RayClusterSpecPatchArgs']
+
+class RayClusterSpecPatchArgsDict(TypedDict):
+    autoscaler_options: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsPatchArgs']]]
+    enable_in_tree_autoscaling: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    head_group_spec: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecPatchArgs']]]
+    head_service_annotations: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+    ray_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    suspend: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    worker_group_specs: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecWorkerGroupSpecsPatchArgs']]]]]
+
+
+@pulumi.input_type
+class RayClusterSpecPatchArgs:
+    def __init__(__self__, *,
+                 autoscaler_options: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsPatchArgs']] = None,
+                 enable_in_tree_autoscaling: pulumi.Input[Optional[_builtins.bool]] = None,
+                 head_group_spec: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecPatchArgs']] = None,
+                 head_service_annotations: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
+                 ray_version: pulumi.Input[Optional[_builtins.str]] = None,
+                 suspend: pulumi.Input[Optional[_builtins.bool]] = None,
+                 worker_group_specs: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecWorkerGroupSpecsPatchArgs']]]] = None):
+        if autoscaler_options is not None:
+            pulumi.set(__self__, "autoscaler_options", autoscaler_options)
+        if enable_in_tree_autoscaling is not None:
+            pulumi.set(__self__, "enable_in_tree_autoscaling", enable_in_tree_autoscaling)
+        if head_group_spec is not None:
+            pulumi.set(__self__, "head_group_spec", head_group_spec)
+        if head_service_annotations is not None:
+            pulumi.set(__self__, "head_service_annotations", head_service_annotations)
+        if ray_version is not None:
+            pulumi.set(__self__, "ray_version", ray_version)
+        if suspend is not None:
+            pulumi.set(__self__, "suspend", suspend)
+        if worker_group_specs is not None:
+            pulumi.set(__self__, "worker_group_specs", worker_group_specs)
+
+    @_builtins.property
+    @pulumi.getter(name="autoscalerOptions")
+    def autoscaler_options(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsPatchArgs']]:
+        return pulumi.get(self, "autoscaler_options")
+
+    @autoscaler_options.setter
+    def autoscaler_options(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecAutoscalerOptionsPatchArgs']]):
+        pulumi.set(self, "autoscaler_options", value)
+
+    @_builtins.property
+    @pulumi.getter(name="enableInTreeAutoscaling")
+    def enable_in_tree_autoscaling(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "enable_in_tree_autoscaling")
+
+    @enable_in_tree_autoscaling.setter
+    def enable_in_tree_autoscaling(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "enable_in_tree_autoscaling", value)
+
+    @_builtins.property
+    @pulumi.getter(name="headGroupSpec")
+    def head_group_spec(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecPatchArgs']]:
+        return pulumi.get(self, "head_group_spec")
+
+    @head_group_spec.setter
+    def head_group_spec(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecHeadGroupSpecPatchArgs']]):
+        pulumi.set(self, "head_group_spec", value)
+
+    @_builtins.property
+    @pulumi.getter(name="headServiceAnnotations")
+    def head_service_annotations(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "head_service_annotations")
+
+    @head_service_annotations.setter
+    def head_service_annotations(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "head_service_annotations", value)
+
+    @_builtins.property
+    @pulumi.getter(name="rayVersion")
+    def ray_version(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "ray_version")
+
+    @ray_version.setter
+    def ray_version(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "ray_version", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def suspend(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "suspend")
+
+    @suspend.setter
+    def suspend(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "suspend", value)
+
+    @_builtins.property
+    @pulumi.getter(name="workerGroupSpecs")
+    def worker_group_specs(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecWorkerGroupSpecsPatchArgs']]]]:
+        return pulumi.get(self, "worker_group_specs")
+
+    @worker_group_specs.setter
+    def worker_group_specs(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.RayClusterSpecWorkerGroupSpecsPatchArgs']]]]):
+        pulumi.set(self, "worker_group_specs", value)
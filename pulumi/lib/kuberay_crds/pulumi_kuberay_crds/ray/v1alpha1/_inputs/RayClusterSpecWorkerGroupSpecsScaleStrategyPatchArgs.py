@@ -0,0 +1,39 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecWorkerGroupSpecsScaleStrategyPatchArgsDict', 'RayClusterSpecWorkerGroupSpecsScaleStrategyPatchArgs']
+
+class RayClusterSpecWorkerGroupSpecsScaleStrategyPatchArgsDict(TypedDict):
+    workers_to_delete: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+
+
+@pulumi.input_type
+class RayClusterSpecWorkerGroupSpecsScaleStrategyPatchArgs:
+    def __init__(__self__, *,
+                 workers_to_delete: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
+        if workers_to_delete is not None:
+            pulumi.set(__self__, "workers_to_delete", workers_to_delete)
+
+    @_builtins.property
+    @pulumi.getter(name="workersToDelete")
+    def workers_to_delete(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "workers_to_delete")
+
+    @workers_to_delete.setter
+    def workers_to_delete(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "workers_to_delete", value)
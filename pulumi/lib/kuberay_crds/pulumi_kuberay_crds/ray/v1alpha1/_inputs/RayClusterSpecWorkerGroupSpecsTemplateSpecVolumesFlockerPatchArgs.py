@@ -0,0 +1,52 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatchArgsDict', 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatchArgs']
+
+class RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatchArgsDict(TypedDict):
+    dataset_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    dataset_uuid: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatchArgs:
+    def __init__(__self__, *,
+                 dataset_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 dataset_uuid: pulumi.Input[Optional[_builtins.str]] = None):
+        if dataset_name is not None:
+            pulumi.set(__self__, "dataset_name", dataset_name)
+        if dataset_uuid is not None:
+            pulumi.set(__self__, "dataset_uuid", dataset_uuid)
+
+    @_builtins.property
+    @pulumi.getter(name="datasetName")
+    def dataset_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "dataset_name")
+
+    @dataset_name.setter
+    def dataset_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "dataset_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="datasetUUID")
+    def dataset_uuid(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "dataset_uuid")
+
+    @dataset_uuid.setter
+    def dataset_uuid(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "dataset_uuid", value)
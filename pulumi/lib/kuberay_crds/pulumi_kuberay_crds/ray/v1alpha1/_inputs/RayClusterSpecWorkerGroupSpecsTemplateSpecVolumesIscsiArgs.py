@@ -0,0 +1,169 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiArgsDict', 'RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiArgs']
+
+class RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiArgsDict(TypedDict):
+    chap_auth_discovery: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    chap_auth_session: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    fs_type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    initiator_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    iqn: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    iscsi_interface: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    lun: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    portals: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    read_only: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    secret_ref: NotRequired[pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefArgs']]]
+    target_portal: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiArgs:
+    def __init__(__self__, *,
+                 chap_auth_discovery: pulumi.Input[Optional[_builtins.bool]] = None,
+                 chap_auth_session: pulumi.Input[Optional[_builtins.bool]] = None,
+                 fs_type: pulumi.Input[Optional[_builtins.str]] = None,
+                 initiator_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 iqn: pulumi.Input[Optional[_builtins.str]] = None,
+                 iscsi_interface: pulumi.Input[Optional[_builtins.str]] = None,
+                 lun: pulumi.Input[Optional[_builtins.int]] = None,
+                 portals: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 read_only: pulumi.Input[Optional[_builtins.bool]] = None,
+                 secret_ref: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefArgs']] = None,
+                 target_portal: pulumi.Input[Optional[_builtins.str]] = None):
+        if chap_auth_discovery is not None:
+            pulumi.set(__self__, "chap_auth_discovery", chap_auth_discovery)
+        if chap_auth_session is not None:
+            pulumi.set(__self__, "chap_auth_session", chap_auth_session)
+        if fs_type is not None:
+            pulumi.set(__self__, "fs_type", fs_type)
+        if initiator_name is not None:
+            pulumi.set(__self__, "initiator_name", initiator_name)
+        if iqn is not None:
+            pulumi.set(__self__, "iqn", iqn)
+        if iscsi_interface is not None:
+            pulumi.set(__self__, "iscsi_interface", iscsi_interface)
+        if lun is not None:
+            pulumi.set(__self__, "lun", lun)
+        if portals is not None:
+            pulumi.set(__self__, "portals", portals)
+        if read_only is not None:
+            pulumi.set(__self__, "read_only", read_only)
+        if secret_ref is not None:
+            pulumi.set(__self__, "secret_ref", secret_ref)
+        if target_portal is not None:
+            pulumi.set(__self__, "target_portal", target_portal)
+
+    @_builtins.property
+    @pulumi.getter(name="chapAuthDiscovery")
+    def chap_auth_discovery(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "chap_auth_discovery")
+
+    @chap_auth_discovery.setter
+    def chap_auth_discovery(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "chap_auth_discovery", value)
+
+    @_builtins.property
+    @pulumi.getter(name="chapAuthSession")
+    def chap_auth_session(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "chap_auth_session")
+
+    @chap_auth_session.setter
+    def chap_auth_session(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "chap_auth_session", value)
+
+    @_builtins.property
+    @pulumi.getter(name="fsType")
+    def fs_type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "fs_type")
+
+    @fs_type.setter
+    def fs_type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "fs_type", value)
+
+    @_builtins.property
+    @pulumi.getter(name="initiatorName")
+    def initiator_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "initiator_name")
+
+    @initiator_name.setter
+    def initiator_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "initiator_name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def iqn(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "iqn")
+
+    @iqn.setter
+    def iqn(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "iqn", value)
+
+    @_builtins.property
+    @pulumi.getter(name="iscsiInterface")
+    def iscsi_interface(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "iscsi_interface")
+
+    @iscsi_interface.setter
+    def iscsi_interface(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "iscsi_interface", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def lun(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "lun")
+
+    @lun.setter
+    def lun(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "lun", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def portals(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "portals")
+
+    @portals.setter
+    def portals(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "portals", value)
+
+    @_builtins.property
+    @pulumi.getter(name="readOnly")
+    def read_only(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "read_only")
+
+    @read_only.setter
+    def read_only(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "read_only", value)
+
+    @_builtins.property
+    @pulumi.getter(name="secretRef")
+    def secret_ref(self) -> pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefArgs']]:
+        return pulumi.get(self, "secret_ref")
+
+    @secret_ref.setter
+    def secret_ref(self, value: pulumi.Input[Optional['_inputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiSecretRefArgs']]):
+        pulumi.set(self, "secret_ref", value)
+
+    @_builtins.property
+    @pulumi.getter(name="targetPortal")
+    def target_portal(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "target_portal")
+
+    @target_portal.setter
+    def target_portal(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "target_portal", value)
@@ -0,0 +1,221 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterStatusArgsDict', 'RayClusterStatusArgs']
+
+class RayClusterStatusArgsDict(TypedDict):
+    available_worker_replicas: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    desired_cpu: NotRequired[pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]]
+    desired_gpu: NotRequired[pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]]
+    desired_memory: NotRequired[pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]]
+    desired_tpu: NotRequired[pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]]
+    desired_worker_replicas: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    endpoints: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+    head: NotRequired[pulumi.Input[Optional['_inputs.RayClusterStatusHeadArgs']]]
+    last_update_time: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    max_worker_replicas: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    min_worker_replicas: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    observed_generation: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    ready_worker_replicas: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    reason: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    state: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterStatusArgs:
+    def __init__(__self__, *,
+                 available_worker_replicas: pulumi.Input[Optional[_builtins.int]] = None,
+                 desired_cpu: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]] = None,
+                 desired_gpu: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]] = None,
+                 desired_memory: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]] = None,
+                 desired_tpu: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]] = None,
+                 desired_worker_replicas: pulumi.Input[Optional[_builtins.int]] = None,
+                 endpoints: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
+                 head: pulumi.Input[Optional['_inputs.RayClusterStatusHeadArgs']] = None,
+                 last_update_time: pulumi.Input[Optional[_builtins.str]] = None,
+                 max_worker_replicas: pulumi.Input[Optional[_builtins.int]] = None,
+                 min_worker_replicas: pulumi.Input[Optional[_builtins.int]] = None,
+                 observed_generation: pulumi.Input[Optional[_builtins.int]] = None,
+                 ready_worker_replicas: pulumi.Input[Optional[_builtins.int]] = None,
+                 reason: pulumi.Input[Optional[_builtins.str]] = None,
+                 state: pulumi.Input[Optional[_builtins.str]] = None):
+        if available_worker_replicas is not None:
+            pulumi.set(__self__, "available_worker_replicas", available_worker_replicas)
+        if desired_cpu is not None:
+            pulumi.set(__self__, "desired_cpu", desired_cpu)
+        if desired_gpu is not None:
+            pulumi.set(__self__, "desired_gpu", desired_gpu)
+        if desired_memory is not None:
+            pulumi.set(__self__, "desired_memory", desired_memory)
+        if desired_tpu is not None:
+            pulumi.set(__self__, "desired_tpu", desired_tpu)
+        if desired_worker_replicas is not None:
+            pulumi.set(__self__, "desired_worker_replicas", desired_worker_replicas)
+        if endpoints is not None:
+            pulumi.set(__self__, "endpoints", endpoints)
+        if head is not None:
+            pulumi.set(__self__, "head", head)
+        if last_update_time is not None:
+            pulumi.set(__self__, "last_update_time", last_update_time)
+        if max_worker_replicas is not None:
+            pulumi.set(__self__, "max_worker_replicas", max_worker_replicas)
+        if min_worker_replicas is not None:
+            pulumi.set(__self__, "min_worker_replicas", min_worker_replicas)
+        if observed_generation is not None:
+            pulumi.set(__self__, "observed_generation", observed_generation)
+        if ready_worker_replicas is not None:
+            pulumi.set(__self__, "ready_worker_replicas", ready_worker_replicas)
+        if reason is not None:
+            pulumi.set(__self__, "reason", reason)
+        if state is not None:
+            pulumi.set(__self__, "state", state)
+
+    @_builtins.property
+    @pulumi.getter(name="availableWorkerReplicas")
+    def available_worker_replicas(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "available_worker_replicas")
+
+    @available_worker_replicas.setter
+    def available_worker_replicas(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "available_worker_replicas", value)
+
+    @_builtins.property
+    @pulumi.getter(name="desiredCPU")
+    def desired_cpu(self) -> pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]:
+        return pulumi.get(self, "desired_cpu")
+
+    @desired_cpu.setter
+    def desired_cpu(self, value: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]):
+        pulumi.set(self, "desired_cpu", value)
+
+    @_builtins.property
+    @pulumi.getter(name="desiredGPU")
+    def desired_gpu(self) -> pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]:
+        return pulumi.get(self, "desired_gpu")
+
+    @desired_gpu.setter
+    def desired_gpu(self, value: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]):
+        pulumi.set(self, "desired_gpu", value)
+
+    @_builtins.property
+    @pulumi.getter(name="desiredMemory")
+    def desired_memory(self) -> pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]:
+        return pulumi.get(self, "desired_memory")
+
+    @desired_memory.setter
+    def desired_memory(self, value: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]):
+        pulumi.set(self, "desired_memory", value)
+
+    @_builtins.property
+    @pulumi.getter(name="desiredTPU")
+    def desired_tpu(self) -> pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]:
+        return pulumi.get(self, "desired_tpu")
+
+    @desired_tpu.setter
+    def desired_tpu(self, value: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]):
+        pulumi.set(self, "desired_tpu", value)
+
+    @_builtins.property
+    @pulumi.getter(name="desiredWorkerReplicas")
+    def desired_worker_replicas(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "desired_worker_replicas")
+
+    @desired_worker_replicas.setter
+    def desired_worker_replicas(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "desired_worker_replicas", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def endpoints(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        return pulumi.get(self, "endpoints")
+
+    @endpoints.setter
+    def endpoints(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "endpoints", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def head(self) -> pulumi.Input[Optional['_inputs.RayClusterStatusHeadArgs']]:
+        return pulumi.get(self, "head")
+
+    @head.setter
+    def head(self, value: pulumi.Input[Optional['_inputs.RayClusterStatusHeadArgs']]):
+        pulumi.set(self, "head", value)
+
+    @_builtins.property
+    @pulumi.getter(name="lastUpdateTime")
+    def last_update_time(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "last_update_time")
+
+    @last_update_time.setter
+    def last_update_time(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "last_update_time", value)
+
+    @_builtins.property
+    @pulumi.getter(name="maxWorkerReplicas")
+    def max_worker_replicas(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "max_worker_replicas")
+
+    @max_worker_replicas.setter
+    def max_worker_replicas(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "max_worker_replicas", value)
+
+    @_builtins.property
+    @pulumi.getter(name="minWorkerReplicas")
+    def min_worker_replicas(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "min_worker_replicas")
+
+    @min_worker_replicas.setter
+    def min_worker_replicas(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "min_worker_replicas", value)
+
+    @_builtins.property
+    @pulumi.getter(name="observedGeneration")
+    def observed_generation(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "observed_generation")
+
+    @observed_generation.setter
+    def observed_generation(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "observed_generation", value)
+
+    @_builtins.property
+    @pulumi.getter(name="readyWorkerReplicas")
+    def ready_worker_replicas(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "ready_worker_replicas")
+
+    @ready_worker_replicas.setter
+    def ready_worker_replicas(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "ready_worker_replicas", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def reason(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "reason")
+
+    @reason.setter
+    def reason(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "reason", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def state(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "state")
+
+    @state.setter
+    def state(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "state", value)
@@ -0,0 +1,52 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['RayClusterStatusHeadArgsDict', 'RayClusterStatusHeadArgs']
+
+class RayClusterStatusHeadArgsDict(TypedDict):
+    pod_ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    service_ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class RayClusterStatusHeadArgs:
+    def __init__(__self__, *,
+                 pod_ip: pulumi.Input[Optional[_builtins.str]] = None,
+                 service_ip: pulumi.Input[Optional[_builtins.str]] = None):
+        if pod_ip is not None:
+            pulumi.set(__self__, "pod_ip", pod_ip)
+        if service_ip is not None:
+            pulumi.set(__self__, "service_ip", service_ip)
+
+    @_builtins.property
+    @pulumi.getter(name="podIP")
+    def pod_ip(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "pod_ip")
+
+    @pod_ip.setter
+    def pod_ip(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "pod_ip", value)
+
+    @_builtins.property
+    @pulumi.getter(name="serviceIP")
+    def service_ip(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "service_ip")
+
+    @service_ip.setter
+    def service_ip(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "service_ip", value)
@@ -0,0 +1,232 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecHeadServiceSpecPatch']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecHeadServiceSpecPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "allocateLoadBalancerNodePorts":
+            suggest = "allocate_load_balancer_node_ports"
+        elif key == "clusterIP":
+            suggest = "cluster_ip"
+        elif key == "clusterIPs":
+            suggest = "cluster_ips"
+        elif key == "externalIPs":
+            suggest = "external_ips"
+        elif key == "externalName":
+            suggest = "external_name"
+        elif key == "externalTrafficPolicy":
+            suggest = "external_traffic_policy"
+        elif key == "healthCheckNodePort":
+            suggest = "health_check_node_port"
+        elif key == "internalTrafficPolicy":
+            suggest = "internal_traffic_policy"
+        elif key == "ipFamilies":
+            suggest = "ip_families"
+        elif key == "ipFamilyPolicy":
+            suggest = "ip_family_policy"
+        elif key == "loadBalancerClass":
+            suggest = "load_balancer_class"
+        elif key == "loadBalancerIP":
+            suggest = "load_balancer_ip"
+        elif key == "loadBalancerSourceRanges":
+            suggest = "load_balancer_source_ranges"
+        elif key == "publishNotReadyAddresses":
+            suggest = "publish_not_ready_addresses"
+        elif key == "sessionAffinity":
+            suggest = "session_affinity"
+        elif key == "sessionAffinityConfig":
+            suggest = "session_affinity_config"
+        elif key == "trafficDistribution":
+            suggest = "traffic_distribution"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpecHeadServiceSpecPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpecHeadServiceSpecPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpecHeadServiceSpecPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 allocate_load_balancer_node_ports: Optional[_builtins.bool] = None,
+                 cluster_ip: Optional[_builtins.str] = None,
+                 cluster_ips: Optional[Sequence[_builtins.str]] = None,
+                 external_ips: Optional[Sequence[_builtins.str]] = None,
+                 external_name: Optional[_builtins.str] = None,
+                 external_traffic_policy: Optional[_builtins.str] = None,
+                 health_check_node_port: Optional[_builtins.int] = None,
+                 internal_traffic_policy: Optional[_builtins.str] = None,
+                 ip_families: Optional[Sequence[_builtins.str]] = None,
+                 ip_family_policy: Optional[_builtins.str] = None,
+                 load_balancer_class: Optional[_builtins.str] = None,
+                 load_balancer_ip: Optional[_builtins.str] = None,
+                 load_balancer_source_ranges: Optional[Sequence[_builtins.str]] = None,
+                 ports: Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecHeadServiceSpecPortsPatch']] = None,
+                 publish_not_ready_addresses: Optional[_builtins.bool] = None,
+                 selector: Optional[Mapping[str, _builtins.str]] = None,
+                 session_affinity: Optional[_builtins.str] = None,
+                 session_affinity_config: Optional['outputs.RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatch'] = None,
+                 traffic_distribution: Optional[_builtins.str] = None,
+                 type: Optional[_builtins.str] = None):
+        if allocate_load_balancer_node_ports is not None:
+            pulumi.set(__self__, "allocate_load_balancer_node_ports", allocate_load_balancer_node_ports)
+        if cluster_ip is not None:
+            pulumi.set(__self__, "cluster_ip", cluster_ip)
+        if cluster_ips is not None:
+            pulumi.set(__self__, "cluster_ips", cluster_ips)
+        if external_ips is not None:
+            pulumi.set(__self__, "external_ips", external_ips)
+        if external_name is not None:
+            pulumi.set(__self__, "external_name", external_name)
+        if external_traffic_policy is not None:
+            pulumi.set(__self__, "external_traffic_policy", external_traffic_policy)
+        if health_check_node_port is not None:
+            pulumi.set(__self__, "health_check_node_port", health_check_node_port)
+        if internal_traffic_policy is not None:
+            pulumi.set(__self__, "internal_traffic_policy", internal_traffic_policy)
+        if ip_families is not None:
+            pulumi.set(__self__, "ip_families", ip_families)
+        if ip_family_policy is not None:
+            pulumi.set(__self__, "ip_family_policy", ip_family_policy)
+        if load_balancer_class is not None:
+            pulumi.set(__self__, "load_balancer_class", load_balancer_class)
+        if load_balancer_ip is not None:
+            pulumi.set(__self__, "load_balancer_ip", load_balancer_ip)
+        if load_balancer_source_ranges is not None:
+            pulumi.set(__self__, "load_balancer_source_ranges", load_balancer_source_ranges)
+        if ports is not None:
+            pulumi.set(__self__, "ports", ports)
+        if publish_not_ready_addresses is not None:
+            pulumi.set(__self__, "publish_not_ready_addresses", publish_not_ready_addresses)
+        if selector is not None:
+            pulumi.set(__self__, "selector", selector)
+        if session_affinity is not None:
+            pulumi.set(__self__, "session_affinity", session_affinity)
+        if session_affinity_config is not None:
+            pulumi.set(__self__, "session_affinity_config", session_affinity_config)
+        if traffic_distribution is not None:
+            pulumi.set(__self__, "traffic_distribution", traffic_distribution)
+        if type is not None:
+            pulumi.set(__self__, "type", type)
+
+    @_builtins.property
+    @pulumi.getter(name="allocateLoadBalancerNodePorts")
+    def allocate_load_balancer_node_ports(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "allocate_load_balancer_node_ports")
+
+    @_builtins.property
+    @pulumi.getter(name="clusterIP")
+    def cluster_ip(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "cluster_ip")
+
+    @_builtins.property
+    @pulumi.getter(name="clusterIPs")
+    def cluster_ips(self) -> Optional[Sequence[_builtins.str]]:
+        return pulumi.get(self, "cluster_ips")
+
+    @_builtins.property
+    @pulumi.getter(name="externalIPs")
+    def external_ips(self) -> Optional[Sequence[_builtins.str]]:
+        return pulumi.get(self, "external_ips")
+
+    @_builtins.property
+    @pulumi.getter(name="externalName")
+    def external_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "external_name")
+
+    @_builtins.property
+    @pulumi.getter(name="externalTrafficPolicy")
+    def external_traffic_policy(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "external_traffic_policy")
+
+    @_builtins.property
+    @pulumi.getter(name="healthCheckNodePort")
+    def health_check_node_port(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "health_check_node_port")
+
+    @_builtins.property
+    @pulumi.getter(name="internalTrafficPolicy")
+    def internal_traffic_policy(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "internal_traffic_policy")
+
+    @_builtins.property
+    @pulumi.getter(name="ipFamilies")
+    def ip_families(self) -> Optional[Sequence[_builtins.str]]:
+        return pulumi.get(self, "ip_families")
+
+    @_builtins.property
+    @pulumi.getter(name="ipFamilyPolicy")
+    def ip_family_policy(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "ip_family_policy")
+
+    @_builtins.property
+    @pulumi.getter(name="loadBalancerClass")
+    def load_balancer_class(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "load_balancer_class")
+
+    @_builtins.property
+    @pulumi.getter(name="loadBalancerIP")
+    def load_balancer_ip(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "load_balancer_ip")
+
+    @_builtins.property
+    @pulumi.getter(name="loadBalancerSourceRanges")
+    def load_balancer_source_ranges(self) -> Optional[Sequence[_builtins.str]]:
+        return pulumi.get(self, "load_balancer_source_ranges")
+
+    @_builtins.property
+    @pulumi.getter
+    def ports(self) -> Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecHeadServiceSpecPortsPatch']]:
+        return pulumi.get(self, "ports")
+
+    @_builtins.property
+    @pulumi.getter(name="publishNotReadyAddresses")
+    def publish_not_ready_addresses(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "publish_not_ready_addresses")
+
+    @_builtins.property
+    @pulumi.getter
+    def selector(self) -> Optional[Mapping[str, _builtins.str]]:
+        return pulumi.get(self, "selector")
+
+    @_builtins.property
+    @pulumi.getter(name="sessionAffinity")
+    def session_affinity(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "session_affinity")
+
+    @_builtins.property
+    @pulumi.getter(name="sessionAffinityConfig")
+    def session_affinity_config(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecHeadServiceSpecSessionAffinityConfigPatch']:
+        return pulumi.get(self, "session_affinity_config")
+
+    @_builtins.property
+    @pulumi.getter(name="trafficDistribution")
+    def traffic_distribution(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "traffic_distribution")
+
+    @_builtins.property
+    @pulumi.getter
+    def type(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "type")
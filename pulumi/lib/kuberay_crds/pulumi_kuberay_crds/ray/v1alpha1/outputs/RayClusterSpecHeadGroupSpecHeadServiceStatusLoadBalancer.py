@@ -0,0 +1,31 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancer']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancer(dict):
+    def __init__(__self__, *,
+                 ingress: Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngress']] = None):
+        if ingress is not None:
+            pulumi.set(__self__, "ingress", ingress)
+
+    @_builtins.property
+    @pulumi.getter
+    def ingress(self) -> Optional[Sequence['outputs.RayClusterSpecHeadGroupSpecHeadServiceStatusLoadBalancerIngress']]:
+        return pulumi.get(self, "ingress")
@@ -0,0 +1,142 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsi']
+
+@pulumi.output_type
+class RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsi(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "chapAuthDiscovery":
+            suggest = "chap_auth_discovery"
+        elif key == "chapAuthSession":
+            suggest = "chap_auth_session"
+        elif key == "fsType":
+            suggest = "fs_type"
+        elif key == "initiatorName":
+            suggest = "initiator_name"
+        elif key == "iscsiInterface":
+            suggest = "iscsi_interface"
+        elif key == "readOnly":
+            suggest = "read_only"
+        elif key == "secretRef":
+            suggest = "secret_ref"
+        elif key == "targetPortal":
+            suggest = "target_portal"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsi. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsi.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsi.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 chap_auth_discovery: Optional[_builtins.bool] = None,
+                 chap_auth_session: Optional[_builtins.bool] = None,
+                 fs_type: Optional[_builtins.str] = None,
+                 initiator_name: Optional[_builtins.str] = None,
+                 iqn: Optional[_builtins.str] = None,
+                 iscsi_interface: Optional[_builtins.str] = None,
+                 lun: Optional[_builtins.int] = None,
+                 portals: Optional[Sequence[_builtins.str]] = None,
+                 read_only: Optional[_builtins.bool] = None,
+                 secret_ref: Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRef'] = None,
+                 target_portal: Optional[_builtins.str] = None):
+        if chap_auth_discovery is not None:
+            pulumi.set(__self__, "chap_auth_discovery", chap_auth_discovery)
+        if chap_auth_session is not None:
+            pulumi.set(__self__, "chap_auth_session", chap_auth_session)
+        if fs_type is not None:
+            pulumi.set(__self__, "fs_type", fs_type)
+        if initiator_name is not None:
+            pulumi.set(__self__, "initiator_name", initiator_name)
+        if iqn is not None:
+            pulumi.set(__self__, "iqn", iqn)
+        if iscsi_interface is not None:
+            pulumi.set(__self__, "iscsi_interface", iscsi_interface)
+        if lun is not None:
+            pulumi.set(__self__, "lun", lun)
+        if portals is not None:
+            pulumi.set(__self__, "portals", portals)
+        if read_only is not None:
+            pulumi.set(__self__, "read_only", read_only)
+        if secret_ref is not None:
+            pulumi.set(__self__, "secret_ref", secret_ref)
+        if target_portal is not None:
+            pulumi.set(__self__, "target_portal", target_portal)
+
+    @_builtins.property
+    @pulumi.getter(name="chapAuthDiscovery")
+    def chap_auth_discovery(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "chap_auth_discovery")
+
+    @_builtins.property
+    @pulumi.getter(name="chapAuthSession")
+    def chap_auth_session(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "chap_auth_session")
+
+    @_builtins.property
+    @pulumi.getter(name="fsType")
+    def fs_type(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "fs_type")
+
+    @_builtins.property
+    @pulumi.getter(name="initiatorName")
+    def initiator_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "initiator_name")
+
+    @_builtins.property
+    @pulumi.getter
+    def iqn(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "iqn")
+
+    @_builtins.property
+    @pulumi.getter(name="iscsiInterface")
+    def iscsi_interface(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "iscsi_interface")
+
+    @_builtins.property
+    @pulumi.getter
+    def lun(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "lun")
+
+    @_builtins.property
+    @pulumi.getter
+    def portals(self) -> Optional[Sequence[_builtins.str]]:
+        return pulumi.get(self, "portals")
+
+    @_builtins.property
+    @pulumi.getter(name="readOnly")
+    def read_only(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "read_only")
+
+    @_builtins.property
+    @pulumi.getter(name="secretRef")
+    def secret_ref(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecTemplateSpecVolumesIscsiSecretRef']:
+        return pulumi.get(self, "secret_ref")
+
+    @_builtins.property
+    @pulumi.getter(name="targetPortal")
+    def target_portal(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "target_portal")
@@ -0,0 +1,106 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecPatch']
+
+@pulumi.output_type
+class RayClusterSpecPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "autoscalerOptions":
+            suggest = "autoscaler_options"
+        elif key == "enableInTreeAutoscaling":
+            suggest = "enable_in_tree_autoscaling"
+        elif key == "headGroupSpec":
+            suggest = "head_group_spec"
+        elif key == "headServiceAnnotations":
+            suggest = "head_service_annotations"
+        elif key == "rayVersion":
+            suggest = "ray_version"
+        elif key == "workerGroupSpecs":
+            suggest = "worker_group_specs"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 autoscaler_options: Optional['outputs.RayClusterSpecAutoscalerOptionsPatch'] = None,
+                 enable_in_tree_autoscaling: Optional[_builtins.bool] = None,
+                 head_group_spec: Optional['outputs.RayClusterSpecHeadGroupSpecPatch'] = None,
+                 head_service_annotations: Optional[Mapping[str, _builtins.str]] = None,
+                 ray_version: Optional[_builtins.str] = None,
+                 suspend: Optional[_builtins.bool] = None,
+                 worker_group_specs: Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsPatch']] = None):
+        if autoscaler_options is not None:
+            pulumi.set(__self__, "autoscaler_options", autoscaler_options)
+        if enable_in_tree_autoscaling is not None:
+            pulumi.set(__self__, "enable_in_tree_autoscaling", enable_in_tree_autoscaling)
+        if head_group_spec is not None:
+            pulumi.set(__self__, "head_group_spec", head_group_spec)
+        if head_service_annotations is not None:
+            pulumi.set(__self__, "head_service_annotations", head_service_annotations)
+        if ray_version is not None:
+            pulumi.set(__self__, "ray_version", ray_version)
+        if suspend is not None:
+            pulumi.set(__self__, "suspend", suspend)
+        if worker_group_specs is not None:
+            pulumi.set(__self__, "worker_group_specs", worker_group_specs)
+
+    @_builtins.property
+    @pulumi.getter(name="autoscalerOptions")
+    def autoscaler_options(self) -> Optional['outputs.RayClusterSpecAutoscalerOptionsPatch']:
+        return pulumi.get(self, "autoscaler_options")
+
+    @_builtins.property
+    @pulumi.getter(name="enableInTreeAutoscaling")
+    def enable_in_tree_autoscaling(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "enable_in_tree_autoscaling")
+
+    @_builtins.property
+    @pulumi.getter(name="headGroupSpec")
+    def head_group_spec(self) -> Optional['outputs.RayClusterSpecHeadGroupSpecPatch']:
+        return pulumi.get(self, "head_group_spec")
+
+    @_builtins.property
+    @pulumi.getter(name="headServiceAnnotations")
+    def head_service_annotations(self) -> Optional[Mapping[str, _builtins.str]]:
+        return pulumi.get(self, "head_service_annotations")
+
+    @_builtins.property
+    @pulumi.getter(name="rayVersion")
+    def ray_version(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "ray_version")
+
+    @_builtins.property
+    @pulumi.getter
+    def suspend(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "suspend")
+
+    @_builtins.property
+    @pulumi.getter(name="workerGroupSpecs")
+    def worker_group_specs(self) -> Optional[Sequence['outputs.RayClusterSpecWorkerGroupSpecsPatch']]:
+        return pulumi.get(self, "worker_group_specs")
@@ -0,0 +1,316 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecWorkerGroupSpecsTemplateSpecVolumes']
+
+@pulumi.output_type
+class RayClusterSpecWorkerGroupSpecsTemplateSpecVolumes(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "awsElasticBlockStore":
+            suggest = "aws_elastic_block_store"
+        elif key == "azureDisk":
+            suggest = "azure_disk"
+        elif key == "azureFile":
+            suggest = "azure_file"
+        elif key == "configMap":
+            suggest = "config_map"
+        elif key == "downwardAPI":
+            suggest = "downward_api"
+        elif key == "emptyDir":
+            suggest = "empty_dir"
+        elif key == "flexVolume":
+            suggest = "flex_volume"
+        elif key == "gcePersistentDisk":
+            suggest = "gce_persistent_disk"
+        elif key == "gitRepo":
+            suggest = "git_repo"
+        elif key == "hostPath":
+            suggest = "host_path"
+        elif key == "persistentVolumeClaim":
+            suggest = "persistent_volume_claim"
+        elif key == "photonPersistentDisk":
+            suggest = "photon_persistent_disk"
+        elif key == "portworxVolume":
+            suggest = "portworx_volume"
+        elif key == "scaleIO":
+            suggest = "scale_io"
+        elif key == "vsphereVolume":
+            suggest = "vsphere_volume"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecWorkerGroupSpecsTemplateSpecVolumes. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecWorkerGroupSpecsTemplateSpecVolumes.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecWorkerGroupSpecsTemplateSpecVolumes.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 aws_elastic_block_store: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStore'] = None,
+                 azure_disk: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDisk'] = None,
+                 azure_file: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFile'] = None,
+                 cephfs: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfs'] = None,
+                 cinder: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinder'] = None,
+                 config_map: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMap'] = None,
+                 csi: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsi'] = None,
+                 downward_api: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPI'] = None,
+                 empty_dir: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDir'] = None,
+                 ephemeral: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeral'] = None,
+                 fc: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFc'] = None,
+                 flex_volume: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolume'] = None,
+                 flocker: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlocker'] = None,
+                 gce_persistent_disk: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDisk'] = None,
+                 git_repo: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepo'] = None,
+                 glusterfs: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfs'] = None,
+                 host_path: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPath'] = None,
+                 image: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImage'] = None,
+                 iscsi: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsi'] = None,
+                 name: Optional[_builtins.str] = None,
+                 nfs: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfs'] = None,
+                 persistent_volume_claim: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaim'] = None,
+                 photon_persistent_disk: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDisk'] = None,
+                 portworx_volume: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolume'] = None,
+                 projected: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjected'] = None,
+                 quobyte: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobyte'] = None,
+                 rbd: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbd'] = None,
+                 scale_io: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIO'] = None,
+                 secret: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecret'] = None,
+                 storageos: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageos'] = None,
+                 vsphere_volume: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolume'] = None):
+        if aws_elastic_block_store is not None:
+            pulumi.set(__self__, "aws_elastic_block_store", aws_elastic_block_store)
+        if azure_disk is not None:
+            pulumi.set(__self__, "azure_disk", azure_disk)
+        if azure_file is not None:
+            pulumi.set(__self__, "azure_file", azure_file)
+        if cephfs is not None:
+            pulumi.set(__self__, "cephfs", cephfs)
+        if cinder is not None:
+            pulumi.set(__self__, "cinder", cinder)
+        if config_map is not None:
+            pulumi.set(__self__, "config_map", config_map)
+        if csi is not None:
+            pulumi.set(__self__, "csi", csi)
+        if downward_api is not None:
+            pulumi.set(__self__, "downward_api", downward_api)
+        if empty_dir is not None:
+            pulumi.set(__self__, "empty_dir", empty_dir)
+        if ephemeral is not None:
+            pulumi.set(__self__, "ephemeral", ephemeral)
+        if fc is not None:
+            pulumi.set(__self__, "fc", fc)
+        if flex_volume is not None:
+            pulumi.set(__self__, "flex_volume", flex_volume)
+        if flocker is not None:
+            pulumi.set(__self__, "flocker", flocker)
+        if gce_persistent_disk is not None:
+            pulumi.set(__self__, "gce_persistent_disk", gce_persistent_disk)
+        if git_repo is not None:
+            pulumi.set(__self__, "git_repo", git_repo)
+        if glusterfs is not None:
+            pulumi.set(__self__, "glusterfs", glusterfs)
+        if host_path is not None:
+            pulumi.set(__self__, "host_path", host_path)
+        if image is not None:
+            pulumi.set(__self__, "image", image)
+        if iscsi is not None:
+            pulumi.set(__self__, "iscsi", iscsi)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if nfs is not None:
+            pulumi.set(__self__, "nfs", nfs)
+        if persistent_volume_claim is not None:
+            pulumi.set(__self__, "persistent_volume_claim", persistent_volume_claim)
+        if photon_persistent_disk is not None:
+            pulumi.set(__self__, "photon_persistent_disk", photon_persistent_disk)
+        if portworx_volume is not None:
+            pulumi.set(__self__, "portworx_volume", portworx_volume)
+        if projected is not None:
+            pulumi.set(__self__, "projected", projected)
+        if quobyte is not None:
+            pulumi.set(__self__, "quobyte", quobyte)
+        if rbd is not None:
+            pulumi.set(__self__, "rbd", rbd)
+        if scale_io is not None:
+            pulumi.set(__self__, "scale_io", scale_io)
+        if secret is not None:
+            pulumi.set(__self__, "secret", secret)
+        if storageos is not None:
+            pulumi.set(__self__, "storageos", storageos)
+        if vsphere_volume is not None:
+            pulumi.set(__self__, "vsphere_volume", vsphere_volume)
+
+    @_builtins.property
+    @pulumi.getter(name="awsElasticBlockStore")
+    def aws_elastic_block_store(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStore']:
+        return pulumi.get(self, "aws_elastic_block_store")
+
+    @_builtins.property
+    @pulumi.getter(name="azureDisk")
+    def azure_disk(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDisk']:
+        return pulumi.get(self, "azure_disk")
+
+    @_builtins.property
+    @pulumi.getter(name="azureFile")
+    def azure_file(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFile']:
+        return pulumi.get(self, "azure_file")
+
+    @_builtins.property
+    @pulumi.getter
+    def cephfs(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfs']:
+        return pulumi.get(self, "cephfs")
+
+    @_builtins.property
+    @pulumi.getter
+    def cinder(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinder']:
+        return pulumi.get(self, "cinder")
+
+    @_builtins.property
+    @pulumi.getter(name="configMap")
+    def config_map(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMap']:
+        return pulumi.get(self, "config_map")
+
+    @_builtins.property
+    @pulumi.getter
+    def csi(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsi']:
+        return pulumi.get(self, "csi")
+
+    @_builtins.property
+    @pulumi.getter(name="downwardAPI")
+    def downward_api(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPI']:
+        return pulumi.get(self, "downward_api")
+
+    @_builtins.property
+    @pulumi.getter(name="emptyDir")
+    def empty_dir(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDir']:
+        return pulumi.get(self, "empty_dir")
+
+    @_builtins.property
+    @pulumi.getter
+    def ephemeral(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeral']:
+        return pulumi.get(self, "ephemeral")
+
+    @_builtins.property
+    @pulumi.getter
+    def fc(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFc']:
+        return pulumi.get(self, "fc")
+
+    @_builtins.property
+    @pulumi.getter(name="flexVolume")
+    def flex_volume(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolume']:
+        return pulumi.get(self, "flex_volume")
+
+    @_builtins.property
+    @pulumi.getter
+    def flocker(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlocker']:
+        return pulumi.get(self, "flocker")
+
+    @_builtins.property
+    @pulumi.getter(name="gcePersistentDisk")
+    def gce_persistent_disk(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDisk']:
+        return pulumi.get(self, "gce_persistent_disk")
+
+    @_builtins.property
+    @pulumi.getter(name="gitRepo")
+    def git_repo(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepo']:
+        return pulumi.get(self, "git_repo")
+
+    @_builtins.property
+    @pulumi.getter
+    def glusterfs(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfs']:
+        return pulumi.get(self, "glusterfs")
+
+    @_builtins.property
+    @pulumi.getter(name="hostPath")
+    def host_path(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPath']:
+        return pulumi.get(self, "host_path")
+
+    @_builtins.property
+    @pulumi.getter
+    def image(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImage']:
+        return pulumi.get(self, "image")
+
+    @_builtins.property
+    @pulumi.getter
+    def iscsi(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsi']:
+        return pulumi.get(self, "iscsi")
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "name")
+
+    @_builtins.property
+    @pulumi.getter
+    def nfs(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfs']:
+        return pulumi.get(self, "nfs")
+
+    @_builtins.property
+    @pulumi.getter(name="persistentVolumeClaim")
+    def persistent_volume_claim(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaim']:
+        return pulumi.get(self, "persistent_volume_claim")
+
+    @_builtins.property
+    @pulumi.getter(name="photonPersistentDisk")
+    def photon_persistent_disk(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDisk']:
+        return pulumi.get(self, "photon_persistent_disk")
+
+    @_builtins.property
+    @pulumi.getter(name="portworxVolume")
+    def portworx_volume(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolume']:
+        return pulumi.get(self, "portworx_volume")
+
+    @_builtins.property
+    @pulumi.getter
+    def projected(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjected']:
+        return pulumi.get(self, "projected")
+
+    @_builtins.property
+    @pulumi.getter
+    def quobyte(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobyte']:
+        return pulumi.get(self, "quobyte")
+
+    @_builtins.property
+    @pulumi.getter
+    def rbd(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbd']:
+        return pulumi.get(self, "rbd")
+
+    @_builtins.property
+    @pulumi.getter(name="scaleIO")
+    def scale_io(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIO']:
+        return pulumi.get(self, "scale_io")
+
+    @_builtins.property
+    @pulumi.getter
+    def secret(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecret']:
+        return pulumi.get(self, "secret")
+
+    @_builtins.property
+    @pulumi.getter
+    def storageos(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageos']:
+        return pulumi.get(self, "storageos")
+
+    @_builtins.property
+    @pulumi.getter(name="vsphereVolume")
+    def vsphere_volume(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolume']:
+        return pulumi.get(self, "vsphere_volume")
@@ -0,0 +1,316 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatch']
+
+@pulumi.output_type
+class RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "awsElasticBlockStore":
+            suggest = "aws_elastic_block_store"
+        elif key == "azureDisk":
+            suggest = "azure_disk"
+        elif key == "azureFile":
+            suggest = "azure_file"
+        elif key == "configMap":
+            suggest = "config_map"
+        elif key == "downwardAPI":
+            suggest = "downward_api"
+        elif key == "emptyDir":
+            suggest = "empty_dir"
+        elif key == "flexVolume":
+            suggest = "flex_volume"
+        elif key == "gcePersistentDisk":
+            suggest = "gce_persistent_disk"
+        elif key == "gitRepo":
+            suggest = "git_repo"
+        elif key == "hostPath":
+            suggest = "host_path"
+        elif key == "persistentVolumeClaim":
+            suggest = "persistent_volume_claim"
+        elif key == "photonPersistentDisk":
+            suggest = "photon_persistent_disk"
+        elif key == "portworxVolume":
+            suggest = "portworx_volume"
+        elif key == "scaleIO":
+            suggest = "scale_io"
+        elif key == "vsphereVolume":
+            suggest = "vsphere_volume"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 aws_elastic_block_store: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStorePatch'] = None,
+                 azure_disk: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskPatch'] = None,
+                 azure_file: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFilePatch'] = None,
+                 cephfs: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsPatch'] = None,
+                 cinder: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderPatch'] = None,
+                 config_map: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapPatch'] = None,
+                 csi: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiPatch'] = None,
+                 downward_api: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIPatch'] = None,
+                 empty_dir: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirPatch'] = None,
+                 ephemeral: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralPatch'] = None,
+                 fc: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcPatch'] = None,
+                 flex_volume: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumePatch'] = None,
+                 flocker: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatch'] = None,
+                 gce_persistent_disk: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskPatch'] = None,
+                 git_repo: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoPatch'] = None,
+                 glusterfs: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsPatch'] = None,
+                 host_path: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathPatch'] = None,
+                 image: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImagePatch'] = None,
+                 iscsi: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiPatch'] = None,
+                 name: Optional[_builtins.str] = None,
+                 nfs: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsPatch'] = None,
+                 persistent_volume_claim: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimPatch'] = None,
+                 photon_persistent_disk: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskPatch'] = None,
+                 portworx_volume: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumePatch'] = None,
+                 projected: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedPatch'] = None,
+                 quobyte: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobytePatch'] = None,
+                 rbd: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdPatch'] = None,
+                 scale_io: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOPatch'] = None,
+                 secret: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretPatch'] = None,
+                 storageos: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosPatch'] = None,
+                 vsphere_volume: Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumePatch'] = None):
+        if aws_elastic_block_store is not None:
+            pulumi.set(__self__, "aws_elastic_block_store", aws_elastic_block_store)
+        if azure_disk is not None:
+            pulumi.set(__self__, "azure_disk", azure_disk)
+        if azure_file is not None:
+            pulumi.set(__self__, "azure_file", azure_file)
+        if cephfs is not None:
+            pulumi.set(__self__, "cephfs", cephfs)
+        if cinder is not None:
+            pulumi.set(__self__, "cinder", cinder)
+        if config_map is not None:
+            pulumi.set(__self__, "config_map", config_map)
+        if csi is not None:
+            pulumi.set(__self__, "csi", csi)
+        if downward_api is not None:
+            pulumi.set(__self__, "downward_api", downward_api)
+        if empty_dir is not None:
+            pulumi.set(__self__, "empty_dir", empty_dir)
+        if ephemeral is not None:
+            pulumi.set(__self__, "ephemeral", ephemeral)
+        if fc is not None:
+            pulumi.set(__self__, "fc", fc)
+        if flex_volume is not None:
+            pulumi.set(__self__, "flex_volume", flex_volume)
+        if flocker is not None:
+            pulumi.set(__self__, "flocker", flocker)
+        if gce_persistent_disk is not None:
+            pulumi.set(__self__, "gce_persistent_disk", gce_persistent_disk)
+        if git_repo is not None:
+            pulumi.set(__self__, "git_repo", git_repo)
+        if glusterfs is not None:
+            pulumi.set(__self__, "glusterfs", glusterfs)
+        if host_path is not None:
+            pulumi.set(__self__, "host_path", host_path)
+        if image is not None:
+            pulumi.set(__self__, "image", image)
+        if iscsi is not None:
+            pulumi.set(__self__, "iscsi", iscsi)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if nfs is not None:
+            pulumi.set(__self__, "nfs", nfs)
+        if persistent_volume_claim is not None:
+            pulumi.set(__self__, "persistent_volume_claim", persistent_volume_claim)
+        if photon_persistent_disk is not None:
+            pulumi.set(__self__, "photon_persistent_disk", photon_persistent_disk)
+        if portworx_volume is not None:
+            pulumi.set(__self__, "portworx_volume", portworx_volume)
+        if projected is not None:
+            pulumi.set(__self__, "projected", projected)
+        if quobyte is not None:
+            pulumi.set(__self__, "quobyte", quobyte)
+        if rbd is not None:
+            pulumi.set(__self__, "rbd", rbd)
+        if scale_io is not None:
+            pulumi.set(__self__, "scale_io", scale_io)
+        if secret is not None:
+            pulumi.set(__self__, "secret", secret)
+        if storageos is not None:
+            pulumi.set(__self__, "storageos", storageos)
+        if vsphere_volume is not None:
+            pulumi.set(__self__, "vsphere_volume", vsphere_volume)
+
+    @_builtins.property
+    @pulumi.getter(name="awsElasticBlockStore")
+    def aws_elastic_block_store(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAwsElasticBlockStorePatch']:
+        return pulumi.get(self, "aws_elastic_block_store")
+
+    @_builtins.property
+    @pulumi.getter(name="azureDisk")
+    def azure_disk(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureDiskPatch']:
+        return pulumi.get(self, "azure_disk")
+
+    @_builtins.property
+    @pulumi.getter(name="azureFile")
+    def azure_file(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesAzureFilePatch']:
+        return pulumi.get(self, "azure_file")
+
+    @_builtins.property
+    @pulumi.getter
+    def cephfs(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCephfsPatch']:
+        return pulumi.get(self, "cephfs")
+
+    @_builtins.property
+    @pulumi.getter
+    def cinder(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCinderPatch']:
+        return pulumi.get(self, "cinder")
+
+    @_builtins.property
+    @pulumi.getter(name="configMap")
+    def config_map(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesConfigMapPatch']:
+        return pulumi.get(self, "config_map")
+
+    @_builtins.property
+    @pulumi.getter
+    def csi(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesCsiPatch']:
+        return pulumi.get(self, "csi")
+
+    @_builtins.property
+    @pulumi.getter(name="downwardAPI")
+    def downward_api(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesDownwardAPIPatch']:
+        return pulumi.get(self, "downward_api")
+
+    @_builtins.property
+    @pulumi.getter(name="emptyDir")
+    def empty_dir(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEmptyDirPatch']:
+        return pulumi.get(self, "empty_dir")
+
+    @_builtins.property
+    @pulumi.getter
+    def ephemeral(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesEphemeralPatch']:
+        return pulumi.get(self, "ephemeral")
+
+    @_builtins.property
+    @pulumi.getter
+    def fc(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFcPatch']:
+        return pulumi.get(self, "fc")
+
+    @_builtins.property
+    @pulumi.getter(name="flexVolume")
+    def flex_volume(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlexVolumePatch']:
+        return pulumi.get(self, "flex_volume")
+
+    @_builtins.property
+    @pulumi.getter
+    def flocker(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesFlockerPatch']:
+        return pulumi.get(self, "flocker")
+
+    @_builtins.property
+    @pulumi.getter(name="gcePersistentDisk")
+    def gce_persistent_disk(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGcePersistentDiskPatch']:
+        return pulumi.get(self, "gce_persistent_disk")
+
+    @_builtins.property
+    @pulumi.getter(name="gitRepo")
+    def git_repo(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGitRepoPatch']:
+        return pulumi.get(self, "git_repo")
+
+    @_builtins.property
+    @pulumi.getter
+    def glusterfs(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesGlusterfsPatch']:
+        return pulumi.get(self, "glusterfs")
+
+    @_builtins.property
+    @pulumi.getter(name="hostPath")
+    def host_path(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesHostPathPatch']:
+        return pulumi.get(self, "host_path")
+
+    @_builtins.property
+    @pulumi.getter
+    def image(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesImagePatch']:
+        return pulumi.get(self, "image")
+
+    @_builtins.property
+    @pulumi.getter
+    def iscsi(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesIscsiPatch']:
+        return pulumi.get(self, "iscsi")
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "name")
+
+    @_builtins.property
+    @pulumi.getter
+    def nfs(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesNfsPatch']:
+        return pulumi.get(self, "nfs")
+
+    @_builtins.property
+    @pulumi.getter(name="persistentVolumeClaim")
+    def persistent_volume_claim(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPersistentVolumeClaimPatch']:
+        return pulumi.get(self, "persistent_volume_claim")
+
+    @_builtins.property
+    @pulumi.getter(name="photonPersistentDisk")
+    def photon_persistent_disk(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPhotonPersistentDiskPatch']:
+        return pulumi.get(self, "photon_persistent_disk")
+
+    @_builtins.property
+    @pulumi.getter(name="portworxVolume")
+    def portworx_volume(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesPortworxVolumePatch']:
+        return pulumi.get(self, "portworx_volume")
+
+    @_builtins.property
+    @pulumi.getter
+    def projected(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesProjectedPatch']:
+        return pulumi.get(self, "projected")
+
+    @_builtins.property
+    @pulumi.getter
+    def quobyte(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesQuobytePatch']:
+        return pulumi.get(self, "quobyte")
+
+    @_builtins.property
+    @pulumi.getter
+    def rbd(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesRbdPatch']:
+        return pulumi.get(self, "rbd")
+
+    @_builtins.property
+    @pulumi.getter(name="scaleIO")
+    def scale_io(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesScaleIOPatch']:
+        return pulumi.get(self, "scale_io")
+
+    @_builtins.property
+    @pulumi.getter
+    def secret(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesSecretPatch']:
+        return pulumi.get(self, "secret")
+
+    @_builtins.property
+    @pulumi.getter
+    def storageos(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesStorageosPatch']:
+        return pulumi.get(self, "storageos")
+
+    @_builtins.property
+    @pulumi.getter(name="vsphereVolume")
+    def vsphere_volume(self) -> Optional['outputs.RayClusterSpecWorkerGroupSpecsTemplateSpecVolumesVsphereVolumePatch']:
+        return pulumi.get(self, "vsphere_volume")
@@ -15,7 +15,7 @@ else:
 from ... import _utilities
 from . import outputs
 from ... import meta as _meta
-from ._inputs import *
+from . import _inputs
 
 __all__ = ['PodMonitorInitArgs', 'PodMonitor']
 
@@ -25,7 +25,7 @@ class PodMonitorInitArgs:
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']] = None,
-                 spec: pulumi.Input[Optional['PodMonitorSpecArgs']] = None):
+                 spec: pulumi.Input[Optional['_inputs.PodMonitorSpecArgs']] = None):
         """
         The set of arguments for constructing a PodMonitor resource.
 
@@ -80,11 +80,11 @@ class PodMonitorInitArgs:
 
     @_builtins.property
     @pulumi.getter
-    def spec(self) -> pulumi.Input[Optional['PodMonitorSpecArgs']]:
+    def spec(self) -> pulumi.Input[Optional['_inputs.PodMonitorSpecArgs']]:
         return pulumi.get(self, "spec")
 
     @spec.setter
-    def spec(self, value: pulumi.Input[Optional['PodMonitorSpecArgs']]):
+    def spec(self, value: pulumi.Input[Optional['_inputs.PodMonitorSpecArgs']]):
         pulumi.set(self, "spec", value)
 
 
@@ -97,7 +97,7 @@ class PodMonitor(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaArgs', '_meta.v1.ObjectMetaArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['PodMonitorSpecArgs', 'PodMonitorSpecArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.PodMonitorSpecArgs', '_inputs.PodMonitorSpecArgsDict']]] = None,
                  __props__=None):
         """
         The `PodMonitor` custom resource definition (CRD) defines how `Prometheus` and `PrometheusAgent` can scrape metrics from a group of pods.
@@ -151,7 +151,7 @@ class PodMonitor(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaArgs', '_meta.v1.ObjectMetaArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['PodMonitorSpecArgs', 'PodMonitorSpecArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.PodMonitorSpecArgs', '_inputs.PodMonitorSpecArgsDict']]] = None,
                  __props__=None):
         opts = pulumi.ResourceOptions.merge(_utilities.get_resource_opts_defaults(), opts)
         if not isinstance(opts, pulumi.ResourceOptions):
@@ -15,7 +15,7 @@ else:
 from ... import _utilities
 from . import outputs
 from ... import meta as _meta
-from ._inputs import *
+from . import _inputs
 
 __all__ = ['PodMonitorPatchArgs', 'PodMonitorPatch']
 
@@ -25,7 +25,7 @@ class PodMonitorPatchArgs:
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional['_meta.v1.ObjectMetaPatchArgs']] = None,
-                 spec: pulumi.Input[Optional['PodMonitorSpecPatchArgs']] = None):
+                 spec: pulumi.Input[Optional['_inputs.PodMonitorSpecPatchArgs']] = None):
         """
         The set of arguments for constructing a PodMonitorPatch resource.
 
@@ -80,11 +80,11 @@ class PodMonitorPatchArgs:
 
     @_builtins.property
     @pulumi.getter
-    def spec(self) -> pulumi.Input[Optional['PodMonitorSpecPatchArgs']]:
+    def spec(self) -> pulumi.Input[Optional['_inputs.PodMonitorSpecPatchArgs']]:
         return pulumi.get(self, "spec")
 
     @spec.setter
-    def spec(self, value: pulumi.Input[Optional['PodMonitorSpecPatchArgs']]):
+    def spec(self, value: pulumi.Input[Optional['_inputs.PodMonitorSpecPatchArgs']]):
         pulumi.set(self, "spec", value)
 
 
@@ -97,7 +97,7 @@ class PodMonitorPatch(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaPatchArgs', '_meta.v1.ObjectMetaPatchArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['PodMonitorSpecPatchArgs', 'PodMonitorSpecPatchArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.PodMonitorSpecPatchArgs', '_inputs.PodMonitorSpecPatchArgsDict']]] = None,
                  __props__=None):
         """
         Patch resources are used to modify existing Kubernetes resources by using
@@ -163,7 +163,7 @@ class PodMonitorPatch(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaPatchArgs', '_meta.v1.ObjectMetaPatchArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['PodMonitorSpecPatchArgs', 'PodMonitorSpecPatchArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.PodMonitorSpecPatchArgs', '_inputs.PodMonitorSpecPatchArgsDict']]] = None,
                  __props__=None):
         opts = pulumi.ResourceOptions.merge(_utilities.get_resource_opts_defaults(), opts)
         if not isinstance(opts, pulumi.ResourceOptions):
@@ -15,7 +15,7 @@ else:
 from ... import _utilities
 from . import outputs
 from ... import meta as _meta
-from ._inputs import *
+from . import _inputs
 
 __all__ = ['ServiceMonitorInitArgs', 'ServiceMonitor']
 
@@ -25,7 +25,7 @@ class ServiceMonitorInitArgs:
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']] = None,
-                 spec: pulumi.Input[Optional['ServiceMonitorSpecArgs']] = None):
+                 spec: pulumi.Input[Optional['_inputs.ServiceMonitorSpecArgs']] = None):
         """
         The set of arguments for constructing a ServiceMonitor resource.
 
@@ -80,11 +80,11 @@ class ServiceMonitorInitArgs:
 
     @_builtins.property
     @pulumi.getter
-    def spec(self) -> pulumi.Input[Optional['ServiceMonitorSpecArgs']]:
+    def spec(self) -> pulumi.Input[Optional['_inputs.ServiceMonitorSpecArgs']]:
         return pulumi.get(self, "spec")
 
     @spec.setter
-    def spec(self, value: pulumi.Input[Optional['ServiceMonitorSpecArgs']]):
+    def spec(self, value: pulumi.Input[Optional['_inputs.ServiceMonitorSpecArgs']]):
         pulumi.set(self, "spec", value)
 
 
@@ -97,7 +97,7 @@ class ServiceMonitor(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaArgs', '_meta.v1.ObjectMetaArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['ServiceMonitorSpecArgs', 'ServiceMonitorSpecArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.ServiceMonitorSpecArgs', '_inputs.ServiceMonitorSpecArgsDict']]] = None,
                  __props__=None):
         """
         The `ServiceMonitor` custom resource definition (CRD) defines how `Prometheus` and `PrometheusAgent` can scrape metrics from a group of services.
@@ -151,7 +151,7 @@ class ServiceMonitor(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaArgs', '_meta.v1.ObjectMetaArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['ServiceMonitorSpecArgs', 'ServiceMonitorSpecArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.ServiceMonitorSpecArgs', '_inputs.ServiceMonitorSpecArgsDict']]] = None,
                  __props__=None):
         opts = pulumi.ResourceOptions.merge(_utilities.get_resource_opts_defaults(), opts)
         if not isinstance(opts, pulumi.ResourceOptions):
@@ -3,14 +3,371 @@
 # *** Do not edit by hand unless you're certain you know what you are doing! ***
 
 import builtins as _builtins
-from ... import _utilities
+import importlib
 import typing
-# Export this package's modules as members:
-from .PodMonitor import *
-from .PodMonitorList import *
-from .PodMonitorPatch import *
-from .ServiceMonitor import *
-from .ServiceMonitorList import *
-from .ServiceMonitorPatch import *
-from ._inputs import *
-from . import outputs
+from ... import _utilities
+
+__all__ = [
+    'PodMonitorInitArgs',
+    'PodMonitor',
+    'PodMonitorListArgs',
+    'PodMonitorList',
+    'PodMonitorPatchArgs',
+    'PodMonitorPatch',
+    'ServiceMonitorInitArgs',
+    'ServiceMonitor',
+    'ServiceMonitorListArgs',
+    'ServiceMonitorList',
+    'ServiceMonitorPatchArgs',
+    'ServiceMonitorPatch',
+    'PodMonitorSpecAttachMetadataPatchArgsDict',
+    'PodMonitorSpecAttachMetadataPatchArgs',
+    'PodMonitorSpecAttachMetadataArgsDict',
+    'PodMonitorSpecAttachMetadataArgs',
+    'PodMonitorSpecNamespaceSelectorPatchArgsDict',
+    'PodMonitorSpecNamespaceSelectorPatchArgs',
+    'PodMonitorSpecNamespaceSelectorArgsDict',
+    'PodMonitorSpecNamespaceSelectorArgs',
+    'PodMonitorSpecPatchArgsDict',
+    'PodMonitorSpecPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsArgs',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthArgs',
+    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2PatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2PatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2Args',
+    'PodMonitorSpecPodMetricsEndpointsPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs',
+    'PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsRelabelingsArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsRelabelingsArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigArgs',
+    'PodMonitorSpecPodMetricsEndpointsArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsArgs',
+    'PodMonitorSpecSelectorMatchExpressionsPatchArgsDict',
+    'PodMonitorSpecSelectorMatchExpressionsPatchArgs',
+    'PodMonitorSpecSelectorMatchExpressionsArgsDict',
+    'PodMonitorSpecSelectorMatchExpressionsArgs',
+    'PodMonitorSpecSelectorPatchArgsDict',
+    'PodMonitorSpecSelectorPatchArgs',
+    'PodMonitorSpecSelectorArgsDict',
+    'PodMonitorSpecSelectorArgs',
+    'PodMonitorSpecArgsDict',
+    'PodMonitorSpecArgs',
+    'PodMonitorStatusBindingsConditionsArgsDict',
+    'PodMonitorStatusBindingsConditionsArgs',
+    'PodMonitorStatusBindingsArgsDict',
+    'PodMonitorStatusBindingsArgs',
+    'PodMonitorStatusArgsDict',
+    'PodMonitorStatusArgs',
+    'PodMonitorArgsDict',
+    'PodMonitorArgs',
+    'ServiceMonitorSpecAttachMetadataPatchArgsDict',
+    'ServiceMonitorSpecAttachMetadataPatchArgs',
+    'ServiceMonitorSpecAttachMetadataArgsDict',
+    'ServiceMonitorSpecAttachMetadataArgs',
+    'ServiceMonitorSpecEndpointsAuthorizationCredentialsPatchArgsDict',
+    'ServiceMonitorSpecEndpointsAuthorizationCredentialsPatchArgs',
+    'ServiceMonitorSpecEndpointsAuthorizationCredentialsArgsDict',
+    'ServiceMonitorSpecEndpointsAuthorizationCredentialsArgs',
+    'ServiceMonitorSpecEndpointsAuthorizationPatchArgsDict',
+    'ServiceMonitorSpecEndpointsAuthorizationPatchArgs',
+    'ServiceMonitorSpecEndpointsAuthorizationArgsDict',
+    'ServiceMonitorSpecEndpointsAuthorizationArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthPasswordPatchArgsDict',
+    'ServiceMonitorSpecEndpointsBasicAuthPasswordPatchArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthPasswordArgsDict',
+    'ServiceMonitorSpecEndpointsBasicAuthPasswordArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthPatchArgsDict',
+    'ServiceMonitorSpecEndpointsBasicAuthPatchArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthUsernamePatchArgsDict',
+    'ServiceMonitorSpecEndpointsBasicAuthUsernamePatchArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthUsernameArgsDict',
+    'ServiceMonitorSpecEndpointsBasicAuthUsernameArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthArgsDict',
+    'ServiceMonitorSpecEndpointsBasicAuthArgs',
+    'ServiceMonitorSpecEndpointsBearerTokenSecretPatchArgsDict',
+    'ServiceMonitorSpecEndpointsBearerTokenSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsBearerTokenSecretArgsDict',
+    'ServiceMonitorSpecEndpointsBearerTokenSecretArgs',
+    'ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgsDict',
+    'ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgs',
+    'ServiceMonitorSpecEndpointsMetricRelabelingsArgsDict',
+    'ServiceMonitorSpecEndpointsMetricRelabelingsArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientSecretPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2ClientSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientSecretArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2ClientSecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2PatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2PatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigArgs',
+    'ServiceMonitorSpecEndpointsOauth2ArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2Args',
+    'ServiceMonitorSpecEndpointsPatchArgsDict',
+    'ServiceMonitorSpecEndpointsPatchArgs',
+    'ServiceMonitorSpecEndpointsProxyConnectHeaderArgsDict',
+    'ServiceMonitorSpecEndpointsProxyConnectHeaderArgs',
+    'ServiceMonitorSpecEndpointsRelabelingsPatchArgsDict',
+    'ServiceMonitorSpecEndpointsRelabelingsPatchArgs',
+    'ServiceMonitorSpecEndpointsRelabelingsArgsDict',
+    'ServiceMonitorSpecEndpointsRelabelingsArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatchArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaPatchArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCaPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaSecretPatchArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCaSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaSecretArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCaSecretArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCaArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatchArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertPatchArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCertPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertSecretPatchArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCertSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertSecretArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCertSecretArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCertArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigKeySecretPatchArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigKeySecretPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigKeySecretArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigKeySecretArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigPatchArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigArgs',
+    'ServiceMonitorSpecEndpointsArgsDict',
+    'ServiceMonitorSpecEndpointsArgs',
+    'ServiceMonitorSpecNamespaceSelectorPatchArgsDict',
+    'ServiceMonitorSpecNamespaceSelectorPatchArgs',
+    'ServiceMonitorSpecNamespaceSelectorArgsDict',
+    'ServiceMonitorSpecNamespaceSelectorArgs',
+    'ServiceMonitorSpecPatchArgsDict',
+    'ServiceMonitorSpecPatchArgs',
+    'ServiceMonitorSpecSelectorMatchExpressionsPatchArgsDict',
+    'ServiceMonitorSpecSelectorMatchExpressionsPatchArgs',
+    'ServiceMonitorSpecSelectorMatchExpressionsArgsDict',
+    'ServiceMonitorSpecSelectorMatchExpressionsArgs',
+    'ServiceMonitorSpecSelectorPatchArgsDict',
+    'ServiceMonitorSpecSelectorPatchArgs',
+    'ServiceMonitorSpecSelectorArgsDict',
+    'ServiceMonitorSpecSelectorArgs',
+    'ServiceMonitorSpecArgsDict',
+    'ServiceMonitorSpecArgs',
+    'ServiceMonitorStatusBindingsConditionsArgsDict',
+    'ServiceMonitorStatusBindingsConditionsArgs',
+    'ServiceMonitorStatusBindingsArgsDict',
+    'ServiceMonitorStatusBindingsArgs',
+    'ServiceMonitorStatusArgsDict',
+    'ServiceMonitorStatusArgs',
+    'ServiceMonitorArgsDict',
+    'ServiceMonitorArgs',
+    'outputs',
+]
+
+# Resource classes live in same-named modules; everything else is an input type.
+_RESOURCE_MODULES = {
+    'PodMonitorInitArgs': 'PodMonitor',
+    'PodMonitor': 'PodMonitor',
+    'PodMonitorListArgs': 'PodMonitorList',
+    'PodMonitorList': 'PodMonitorList',
+    'PodMonitorPatchArgs': 'PodMonitorPatch',
+    'PodMonitorPatch': 'PodMonitorPatch',
+    'ServiceMonitorInitArgs': 'ServiceMonitor',
+    'ServiceMonitor': 'ServiceMonitor',
+    'ServiceMonitorListArgs': 'ServiceMonitorList',
+    'ServiceMonitorList': 'ServiceMonitorList',
+    'ServiceMonitorPatchArgs': 'ServiceMonitorPatch',
+    'ServiceMonitorPatch': 'ServiceMonitorPatch',
+}
+
+if typing.TYPE_CHECKING:
+    from .PodMonitor import *
+    from .PodMonitorList import *
+    from .PodMonitorPatch import *
+    from .ServiceMonitor import *
+    from .ServiceMonitorList import *
+    from .ServiceMonitorPatch import *
+    from ._inputs import *
+    from . import outputs
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in ("_inputs", "outputs"):
+        return importlib.import_module(f"{__name__}.{name}")
+    module_name = _RESOURCE_MODULES.get(name)
+    if module_name is not None:
+        module = importlib.import_module(f"{__name__}.{module_name}")
+    else:
+        module = importlib.import_module(f"{__name__}._inputs")
+        if name not in module.__all__:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,18528 +0,0 @@
-# coding=utf-8
-# *** WARNING: this file was generated by crd2pulumi. ***
-# *** Do not edit by hand unless you're certain you know what you are doing! ***
-
-import builtins as _builtins
-import warnings
-import sys
-import pulumi
-import pulumi.runtime
-from typing import Any, Mapping, Optional, Sequence, Union, overload
-if sys.version_info >= (3, 11):
-    from typing import NotRequired, TypedDict, TypeAlias
-else:
-    from typing_extensions import NotRequired, TypedDict, TypeAlias
-from ... import _utilities
-from ... import meta as _meta
-
-__all__ = [
-    'PodMonitorSpecAttachMetadataPatchArgs',
-    'PodMonitorSpecAttachMetadataPatchArgsDict',
-    'PodMonitorSpecAttachMetadataArgs',
-    'PodMonitorSpecAttachMetadataArgsDict',
-    'PodMonitorSpecNamespaceSelectorPatchArgs',
-    'PodMonitorSpecNamespaceSelectorPatchArgsDict',
-    'PodMonitorSpecNamespaceSelectorArgs',
-    'PodMonitorSpecNamespaceSelectorArgsDict',
-    'PodMonitorSpecPatchArgs',
-    'PodMonitorSpecPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsArgs',
-    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsAuthorizationPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsAuthorizationPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsAuthorizationArgs',
-    'PodMonitorSpecPodMetricsEndpointsAuthorizationArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgs',
-    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsBasicAuthPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsBasicAuthPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgs',
-    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsBasicAuthArgs',
-    'PodMonitorSpecPodMetricsEndpointsBasicAuthArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretArgs',
-    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgs',
-    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2PatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2PatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigArgs',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsOauth2Args',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs',
-    'PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsRelabelingsArgs',
-    'PodMonitorSpecPodMetricsEndpointsRelabelingsArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapArgs',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretArgs',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgs',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapArgs',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretArgs',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgs',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgs',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigPatchArgs',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigPatchArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigArgs',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigArgsDict',
-    'PodMonitorSpecPodMetricsEndpointsArgs',
-    'PodMonitorSpecPodMetricsEndpointsArgsDict',
-    'PodMonitorSpecSelectorMatchExpressionsPatchArgs',
-    'PodMonitorSpecSelectorMatchExpressionsPatchArgsDict',
-    'PodMonitorSpecSelectorMatchExpressionsArgs',
-    'PodMonitorSpecSelectorMatchExpressionsArgsDict',
-    'PodMonitorSpecSelectorPatchArgs',
-    'PodMonitorSpecSelectorPatchArgsDict',
-    'PodMonitorSpecSelectorArgs',
-    'PodMonitorSpecSelectorArgsDict',
-    'PodMonitorSpecArgs',
-    'PodMonitorSpecArgsDict',
-    'PodMonitorStatusBindingsConditionsArgs',
-    'PodMonitorStatusBindingsConditionsArgsDict',
-    'PodMonitorStatusBindingsArgs',
-    'PodMonitorStatusBindingsArgsDict',
-    'PodMonitorStatusArgs',
-    'PodMonitorStatusArgsDict',
-    'PodMonitorArgs',
-    'PodMonitorArgsDict',
-    'ServiceMonitorSpecAttachMetadataPatchArgs',
-    'ServiceMonitorSpecAttachMetadataPatchArgsDict',
-    'ServiceMonitorSpecAttachMetadataArgs',
-    'ServiceMonitorSpecAttachMetadataArgsDict',
-    'ServiceMonitorSpecEndpointsAuthorizationCredentialsPatchArgs',
-    'ServiceMonitorSpecEndpointsAuthorizationCredentialsPatchArgsDict',
-    'ServiceMonitorSpecEndpointsAuthorizationCredentialsArgs',
-    'ServiceMonitorSpecEndpointsAuthorizationCredentialsArgsDict',
-    'ServiceMonitorSpecEndpointsAuthorizationPatchArgs',
-    'ServiceMonitorSpecEndpointsAuthorizationPatchArgsDict',
-    'ServiceMonitorSpecEndpointsAuthorizationArgs',
-    'ServiceMonitorSpecEndpointsAuthorizationArgsDict',
-    'ServiceMonitorSpecEndpointsBasicAuthPasswordPatchArgs',
-    'ServiceMonitorSpecEndpointsBasicAuthPasswordPatchArgsDict',
-    'ServiceMonitorSpecEndpointsBasicAuthPasswordArgs',
-    'ServiceMonitorSpecEndpointsBasicAuthPasswordArgsDict',
-    'ServiceMonitorSpecEndpointsBasicAuthPatchArgs',
-    'ServiceMonitorSpecEndpointsBasicAuthPatchArgsDict',
-    'ServiceMonitorSpecEndpointsBasicAuthUsernamePatchArgs',
-    'ServiceMonitorSpecEndpointsBasicAuthUsernamePatchArgsDict',
-    'ServiceMonitorSpecEndpointsBasicAuthUsernameArgs',
-    'ServiceMonitorSpecEndpointsBasicAuthUsernameArgsDict',
-    'ServiceMonitorSpecEndpointsBasicAuthArgs',
-    'ServiceMonitorSpecEndpointsBasicAuthArgsDict',
-    'ServiceMonitorSpecEndpointsBearerTokenSecretPatchArgs',
-    'ServiceMonitorSpecEndpointsBearerTokenSecretPatchArgsDict',
-    'ServiceMonitorSpecEndpointsBearerTokenSecretArgs',
-    'ServiceMonitorSpecEndpointsBearerTokenSecretArgsDict',
-    'ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgs',
-    'ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgsDict',
-    'ServiceMonitorSpecEndpointsMetricRelabelingsArgs',
-    'ServiceMonitorSpecEndpointsMetricRelabelingsArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgs',
-    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapArgs',
-    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgs',
-    'ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgs',
-    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretArgs',
-    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2ClientIdArgs',
-    'ServiceMonitorSpecEndpointsOauth2ClientIdArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2ClientSecretPatchArgs',
-    'ServiceMonitorSpecEndpointsOauth2ClientSecretPatchArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2ClientSecretArgs',
-    'ServiceMonitorSpecEndpointsOauth2ClientSecretArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2PatchArgs',
-    'ServiceMonitorSpecEndpointsOauth2PatchArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs',
-    'ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatchArgs',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatchArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapArgs',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatchArgs',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatchArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatchArgs',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatchArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretArgs',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaArgs',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatchArgs',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatchArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapArgs',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatchArgs',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatchArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatchArgs',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatchArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretArgs',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertArgs',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatchArgs',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatchArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretArgs',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigPatchArgs',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigPatchArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigArgs',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigArgsDict',
-    'ServiceMonitorSpecEndpointsOauth2Args',
-    'ServiceMonitorSpecEndpointsOauth2ArgsDict',
-    'ServiceMonitorSpecEndpointsPatchArgs',
-    'ServiceMonitorSpecEndpointsPatchArgsDict',
-    'ServiceMonitorSpecEndpointsProxyConnectHeaderArgs',
-    'ServiceMonitorSpecEndpointsProxyConnectHeaderArgsDict',
-    'ServiceMonitorSpecEndpointsRelabelingsPatchArgs',
-    'ServiceMonitorSpecEndpointsRelabelingsPatchArgsDict',
-    'ServiceMonitorSpecEndpointsRelabelingsArgs',
-    'ServiceMonitorSpecEndpointsRelabelingsArgsDict',
-    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatchArgs',
-    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatchArgsDict',
-    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapArgs',
-    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapArgsDict',
-    'ServiceMonitorSpecEndpointsTlsConfigCaPatchArgs',
-    'ServiceMonitorSpecEndpointsTlsConfigCaPatchArgsDict',
-    'ServiceMonitorSpecEndpointsTlsConfigCaSecretPatchArgs',
-    'ServiceMonitorSpecEndpointsTlsConfigCaSecretPatchArgsDict',
-    'ServiceMonitorSpecEndpointsTlsConfigCaSecretArgs',
-    'ServiceMonitorSpecEndpointsTlsConfigCaSecretArgsDict',
-    'ServiceMonitorSpecEndpointsTlsConfigCaArgs',
-    'ServiceMonitorSpecEndpointsTlsConfigCaArgsDict',
-    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatchArgs',
-    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatchArgsDict',
-    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapArgs',
-    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapArgsDict',
-    'ServiceMonitorSpecEndpointsTlsConfigCertPatchArgs',
-    'ServiceMonitorSpecEndpointsTlsConfigCertPatchArgsDict',
-    'ServiceMonitorSpecEndpointsTlsConfigCertSecretPatchArgs',
-    'ServiceMonitorSpecEndpointsTlsConfigCertSecretPatchArgsDict',
-    'ServiceMonitorSpecEndpointsTlsConfigCertSecretArgs',
-    'ServiceMonitorSpecEndpointsTlsConfigCertSecretArgsDict',
-    'ServiceMonitorSpecEndpointsTlsConfigCertArgs',
-    'ServiceMonitorSpecEndpointsTlsConfigCertArgsDict',
-    'ServiceMonitorSpecEndpointsTlsConfigKeySecretPatchArgs',
-    'ServiceMonitorSpecEndpointsTlsConfigKeySecretPatchArgsDict',
-    'ServiceMonitorSpecEndpointsTlsConfigKeySecretArgs',
-    'ServiceMonitorSpecEndpointsTlsConfigKeySecretArgsDict',
-    'ServiceMonitorSpecEndpointsTlsConfigPatchArgs',
-    'ServiceMonitorSpecEndpointsTlsConfigPatchArgsDict',
-    'ServiceMonitorSpecEndpointsTlsConfigArgs',
-    'ServiceMonitorSpecEndpointsTlsConfigArgsDict',
-    'ServiceMonitorSpecEndpointsArgs',
-    'ServiceMonitorSpecEndpointsArgsDict',
-    'ServiceMonitorSpecNamespaceSelectorPatchArgs',
-    'ServiceMonitorSpecNamespaceSelectorPatchArgsDict',
-    'ServiceMonitorSpecNamespaceSelectorArgs',
-    'ServiceMonitorSpecNamespaceSelectorArgsDict',
-    'ServiceMonitorSpecPatchArgs',
-    'ServiceMonitorSpecPatchArgsDict',
-    'ServiceMonitorSpecSelectorMatchExpressionsPatchArgs',
-    'ServiceMonitorSpecSelectorMatchExpressionsPatchArgsDict',
-    'ServiceMonitorSpecSelectorMatchExpressionsArgs',
-    'ServiceMonitorSpecSelectorMatchExpressionsArgsDict',
-    'ServiceMonitorSpecSelectorPatchArgs',
-    'ServiceMonitorSpecSelectorPatchArgsDict',
-    'ServiceMonitorSpecSelectorArgs',
-    'ServiceMonitorSpecSelectorArgsDict',
-    'ServiceMonitorSpecArgs',
-    'ServiceMonitorSpecArgsDict',
-    'ServiceMonitorStatusBindingsConditionsArgs',
-    'ServiceMonitorStatusBindingsConditionsArgsDict',
-    'ServiceMonitorStatusBindingsArgs',
-    'ServiceMonitorStatusBindingsArgsDict',
-    'ServiceMonitorStatusArgs',
-    'ServiceMonitorStatusArgsDict',
-    'ServiceMonitorArgs',
-    'ServiceMonitorArgsDict',
-]
-
-class PodMonitorSpecAttachMetadataPatchArgsDict(TypedDict):
-    """
-    attachMetadata defines additional metadata which is added to the
-    discovered targets.
-
-    It requires Prometheus >= v2.35.0.
-    """
-    node: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    node when set to true, Prometheus attaches node metadata to the discovered
-    targets.
-
-    The Prometheus service account must have the `list` and `watch`
-    permissions on the `Nodes` objects.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecAttachMetadataPatchArgs:
-    def __init__(__self__, *,
-                 node: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        attachMetadata defines additional metadata which is added to the
-        discovered targets.
-
-        It requires Prometheus >= v2.35.0.
-
-        :param pulumi.Input[_builtins.bool] node: node when set to true, Prometheus attaches node metadata to the discovered
-               targets.
-
-               The Prometheus service account must have the `list` and `watch`
-               permissions on the `Nodes` objects.
-        """
-        if node is not None:
-            pulumi.set(__self__, "node", node)
-
-    @_builtins.property
-    @pulumi.getter
-    def node(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        node when set to true, Prometheus attaches node metadata to the discovered
-        targets.
-
-        The Prometheus service account must have the `list` and `watch`
-        permissions on the `Nodes` objects.
-        """
-        return pulumi.get(self, "node")
-
-    @node.setter
-    def node(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "node", value)
-
-
-class PodMonitorSpecAttachMetadataArgsDict(TypedDict):
-    """
-    attachMetadata defines additional metadata which is added to the
-    discovered targets.
-
-    It requires Prometheus >= v2.35.0.
-    """
-    node: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    node when set to true, Prometheus attaches node metadata to the discovered
-    targets.
-
-    The Prometheus service account must have the `list` and `watch`
-    permissions on the `Nodes` objects.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecAttachMetadataArgs:
-    def __init__(__self__, *,
-                 node: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        attachMetadata defines additional metadata which is added to the
-        discovered targets.
-
-        It requires Prometheus >= v2.35.0.
-
-        :param pulumi.Input[_builtins.bool] node: node when set to true, Prometheus attaches node metadata to the discovered
-               targets.
-
-               The Prometheus service account must have the `list` and `watch`
-               permissions on the `Nodes` objects.
-        """
-        if node is not None:
-            pulumi.set(__self__, "node", node)
-
-    @_builtins.property
-    @pulumi.getter
-    def node(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        node when set to true, Prometheus attaches node metadata to the discovered
-        targets.
-
-        The Prometheus service account must have the `list` and `watch`
-        permissions on the `Nodes` objects.
-        """
-        return pulumi.get(self, "node")
-
-    @node.setter
-    def node(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "node", value)
-
-
-class PodMonitorSpecNamespaceSelectorPatchArgsDict(TypedDict):
-    """
-    namespaceSelector defines in which namespace(s) Prometheus should discover the pods.
-    By default, the pods are discovered in the same namespace as the `PodMonitor` object but it is possible to select pods across different/all namespaces.
-    """
-    any: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    any defines the boolean describing whether all namespaces are selected in contrast to a
-    list restricting them.
-    """
-    match_names: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    matchNames defines the list of namespace names to select from.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecNamespaceSelectorPatchArgs:
-    def __init__(__self__, *,
-                 any: pulumi.Input[Optional[_builtins.bool]] = None,
-                 match_names: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        namespaceSelector defines in which namespace(s) Prometheus should discover the pods.
-        By default, the pods are discovered in the same namespace as the `PodMonitor` object but it is possible to select pods across different/all namespaces.
-
-        :param pulumi.Input[_builtins.bool] any: any defines the boolean describing whether all namespaces are selected in contrast to a
-               list restricting them.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] match_names: matchNames defines the list of namespace names to select from.
-        """
-        if any is not None:
-            pulumi.set(__self__, "any", any)
-        if match_names is not None:
-            pulumi.set(__self__, "match_names", match_names)
-
-    @_builtins.property
-    @pulumi.getter
-    def any(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        any defines the boolean describing whether all namespaces are selected in contrast to a
-        list restricting them.
-        """
-        return pulumi.get(self, "any")
-
-    @any.setter
-    def any(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "any", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchNames")
-    def match_names(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        matchNames defines the list of namespace names to select from.
-        """
-        return pulumi.get(self, "match_names")
-
-    @match_names.setter
-    def match_names(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_names", value)
-
-
-class PodMonitorSpecNamespaceSelectorArgsDict(TypedDict):
-    """
-    namespaceSelector defines in which namespace(s) Prometheus should discover the pods.
-    By default, the pods are discovered in the same namespace as the `PodMonitor` object but it is possible to select pods across different/all namespaces.
-    """
-    any: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    any defines the boolean describing whether all namespaces are selected in contrast to a
-    list restricting them.
-    """
-    match_names: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    matchNames defines the list of namespace names to select from.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecNamespaceSelectorArgs:
-    def __init__(__self__, *,
-                 any: pulumi.Input[Optional[_builtins.bool]] = None,
-                 match_names: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        namespaceSelector defines in which namespace(s) Prometheus should discover the pods.
-        By default, the pods are discovered in the same namespace as the `PodMonitor` object but it is possible to select pods across different/all namespaces.
-
-        :param pulumi.Input[_builtins.bool] any: any defines the boolean describing whether all namespaces are selected in contrast to a
-               list restricting them.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] match_names: matchNames defines the list of namespace names to select from.
-        """
-        if any is not None:
-            pulumi.set(__self__, "any", any)
-        if match_names is not None:
-            pulumi.set(__self__, "match_names", match_names)
-
-    @_builtins.property
-    @pulumi.getter
-    def any(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        any defines the boolean describing whether all namespaces are selected in contrast to a
-        list restricting them.
-        """
-        return pulumi.get(self, "any")
-
-    @any.setter
-    def any(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "any", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchNames")
-    def match_names(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        matchNames defines the list of namespace names to select from.
-        """
-        return pulumi.get(self, "match_names")
-
-    @match_names.setter
-    def match_names(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_names", value)
-
-
-class PodMonitorSpecPatchArgsDict(TypedDict):
-    """
-    spec defines the specification of desired Pod selection for target discovery by Prometheus.
-    """
-    attach_metadata: NotRequired[pulumi.Input[Optional['PodMonitorSpecAttachMetadataPatchArgs']]]
-    body_size_limit: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    bodySizeLimit when defined specifies a job level limit on the size
-    of uncompressed response body that will be accepted by Prometheus.
-
-    It requires Prometheus >= v2.28.0.
-    """
-    convert_classic_histograms_to_nhcb: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-    It requires Prometheus >= v3.0.0.
-    """
-    fallback_scrape_protocol: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-    It requires Prometheus >= v3.0.0.
-    """
-    job_label: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    jobLabel defines the label to use to retrieve the job name from.
-    `jobLabel` selects the label from the associated Kubernetes `Pod`
-    object which will be used as the `job` label for all metrics.
-
-    For example if `jobLabel` is set to `foo` and the Kubernetes `Pod`
-    object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-    label to all ingested metrics.
-
-    If the value of this field is empty, the `job` label of the metrics
-    defaults to the namespace and name of the PodMonitor object (e.g. `<namespace>/<name>`).
-    """
-    keep_dropped_targets: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-    that will be kept in memory. 0 means no limit.
-
-    It requires Prometheus >= v2.47.0.
-    """
-    label_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-    It requires Prometheus >= v2.27.0.
-    """
-    label_name_length_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-    It requires Prometheus >= v2.27.0.
-    """
-    label_value_length_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-    It requires Prometheus >= v2.27.0.
-    """
-    namespace_selector: NotRequired[pulumi.Input[Optional['PodMonitorSpecNamespaceSelectorPatchArgs']]]
-    native_histogram_bucket_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-    buckets will be merged to stay within the limit.
-    It requires Prometheus >= v2.45.0.
-    """
-    native_histogram_min_bucket_factor: NotRequired[pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]]
-    """
-    nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-    buckets will be merged to increase the factor sufficiently.
-    It requires Prometheus >= v2.50.0.
-    """
-    pod_metrics_endpoints: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsPatchArgs']]]]]
-    """
-    podMetricsEndpoints defines how to scrape metrics from the selected pods.
-    """
-    pod_target_labels: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    podTargetLabels defines the labels which are transferred from the
-    associated Kubernetes `Pod` object onto the ingested metrics.
-    """
-    sample_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    sampleLimit defines a per-scrape limit on the number of scraped samples
-    that will be accepted.
-    """
-    scrape_class: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    scrapeClass defines the scrape class to apply.
-    """
-    scrape_classic_histograms: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-    It requires Prometheus >= v2.45.0.
-
-    Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-    """
-    scrape_native_histograms: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    scrapeNativeHistograms defines whether to enable scraping of native histograms.
-    It requires Prometheus >= v3.8.0.
-    """
-    scrape_protocols: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-    protocols supported by Prometheus in order of preference (from most to least preferred).
-
-    If unset, Prometheus uses its default value.
-
-    It requires Prometheus >= v2.49.0.
-    """
-    selector: NotRequired[pulumi.Input[Optional['PodMonitorSpecSelectorPatchArgs']]]
-    selector_mechanism: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    selectorMechanism defines the mechanism used to select the endpoints to scrape.
-    By default, the selection process relies on relabel configurations to filter the discovered targets.
-    Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-    Which strategy is best for your use case needs to be carefully evaluated.
-
-    It requires Prometheus >= v2.17.0.
-    """
-    target_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    targetLimit defines a limit on the number of scraped targets that will
-    be accepted.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPatchArgs:
-    def __init__(__self__, *,
-                 attach_metadata: pulumi.Input[Optional['PodMonitorSpecAttachMetadataPatchArgs']] = None,
-                 body_size_limit: pulumi.Input[Optional[_builtins.str]] = None,
-                 convert_classic_histograms_to_nhcb: pulumi.Input[Optional[_builtins.bool]] = None,
-                 fallback_scrape_protocol: pulumi.Input[Optional[_builtins.str]] = None,
-                 job_label: pulumi.Input[Optional[_builtins.str]] = None,
-                 keep_dropped_targets: pulumi.Input[Optional[_builtins.int]] = None,
-                 label_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 label_name_length_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 label_value_length_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 namespace_selector: pulumi.Input[Optional['PodMonitorSpecNamespaceSelectorPatchArgs']] = None,
-                 native_histogram_bucket_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 native_histogram_min_bucket_factor: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]] = None,
-                 pod_metrics_endpoints: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsPatchArgs']]]] = None,
-                 pod_target_labels: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 sample_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 scrape_class: pulumi.Input[Optional[_builtins.str]] = None,
-                 scrape_classic_histograms: pulumi.Input[Optional[_builtins.bool]] = None,
-                 scrape_native_histograms: pulumi.Input[Optional[_builtins.bool]] = None,
-                 scrape_protocols: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 selector: pulumi.Input[Optional['PodMonitorSpecSelectorPatchArgs']] = None,
-                 selector_mechanism: pulumi.Input[Optional[_builtins.str]] = None,
-                 target_limit: pulumi.Input[Optional[_builtins.int]] = None):
-        """
-        spec defines the specification of desired Pod selection for target discovery by Prometheus.
-
-        :param pulumi.Input[_builtins.str] body_size_limit: bodySizeLimit when defined specifies a job level limit on the size
-               of uncompressed response body that will be accepted by Prometheus.
-
-               It requires Prometheus >= v2.28.0.
-        :param pulumi.Input[_builtins.bool] convert_classic_histograms_to_nhcb: convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-               It requires Prometheus >= v3.0.0.
-        :param pulumi.Input[_builtins.str] fallback_scrape_protocol: fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-               It requires Prometheus >= v3.0.0.
-        :param pulumi.Input[_builtins.str] job_label: jobLabel defines the label to use to retrieve the job name from.
-               `jobLabel` selects the label from the associated Kubernetes `Pod`
-               object which will be used as the `job` label for all metrics.
-
-               For example if `jobLabel` is set to `foo` and the Kubernetes `Pod`
-               object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-               label to all ingested metrics.
-
-               If the value of this field is empty, the `job` label of the metrics
-               defaults to the namespace and name of the PodMonitor object (e.g. `<namespace>/<name>`).
-        :param pulumi.Input[_builtins.int] keep_dropped_targets: keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-               that will be kept in memory. 0 means no limit.
-
-               It requires Prometheus >= v2.47.0.
-        :param pulumi.Input[_builtins.int] label_limit: labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param pulumi.Input[_builtins.int] label_name_length_limit: labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param pulumi.Input[_builtins.int] label_value_length_limit: labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param pulumi.Input[_builtins.int] native_histogram_bucket_limit: nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-               buckets will be merged to stay within the limit.
-               It requires Prometheus >= v2.45.0.
-        :param pulumi.Input[Union[_builtins.int, _builtins.str]] native_histogram_min_bucket_factor: nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-               buckets will be merged to increase the factor sufficiently.
-               It requires Prometheus >= v2.50.0.
-        :param pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsPatchArgs']]] pod_metrics_endpoints: podMetricsEndpoints defines how to scrape metrics from the selected pods.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] pod_target_labels: podTargetLabels defines the labels which are transferred from the
-               associated Kubernetes `Pod` object onto the ingested metrics.
-        :param pulumi.Input[_builtins.int] sample_limit: sampleLimit defines a per-scrape limit on the number of scraped samples
-               that will be accepted.
-        :param pulumi.Input[_builtins.str] scrape_class: scrapeClass defines the scrape class to apply.
-        :param pulumi.Input[_builtins.bool] scrape_classic_histograms: scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-               It requires Prometheus >= v2.45.0.
-
-               Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-        :param pulumi.Input[_builtins.bool] scrape_native_histograms: scrapeNativeHistograms defines whether to enable scraping of native histograms.
-               It requires Prometheus >= v3.8.0.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] scrape_protocols: scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-               protocols supported by Prometheus in order of preference (from most to least preferred).
-
-               If unset, Prometheus uses its default value.
-
-               It requires Prometheus >= v2.49.0.
-        :param pulumi.Input[_builtins.str] selector_mechanism: selectorMechanism defines the mechanism used to select the endpoints to scrape.
-               By default, the selection process relies on relabel configurations to filter the discovered targets.
-               Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-               Which strategy is best for your use case needs to be carefully evaluated.
-
-               It requires Prometheus >= v2.17.0.
-        :param pulumi.Input[_builtins.int] target_limit: targetLimit defines a limit on the number of scraped targets that will
-               be accepted.
-        """
-        if attach_metadata is not None:
-            pulumi.set(__self__, "attach_metadata", attach_metadata)
-        if body_size_limit is not None:
-            pulumi.set(__self__, "body_size_limit", body_size_limit)
-        if convert_classic_histograms_to_nhcb is not None:
-            pulumi.set(__self__, "convert_classic_histograms_to_nhcb", convert_classic_histograms_to_nhcb)
-        if fallback_scrape_protocol is not None:
-            pulumi.set(__self__, "fallback_scrape_protocol", fallback_scrape_protocol)
-        if job_label is not None:
-            pulumi.set(__self__, "job_label", job_label)
-        if keep_dropped_targets is not None:
-            pulumi.set(__self__, "keep_dropped_targets", keep_dropped_targets)
-        if label_limit is not None:
-            pulumi.set(__self__, "label_limit", label_limit)
-        if label_name_length_limit is not None:
-            pulumi.set(__self__, "label_name_length_limit", label_name_length_limit)
-        if label_value_length_limit is not None:
-            pulumi.set(__self__, "label_value_length_limit", label_value_length_limit)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if native_histogram_bucket_limit is not None:
-            pulumi.set(__self__, "native_histogram_bucket_limit", native_histogram_bucket_limit)
-        if native_histogram_min_bucket_factor is not None:
-            pulumi.set(__self__, "native_histogram_min_bucket_factor", native_histogram_min_bucket_factor)
-        if pod_metrics_endpoints is not None:
-            pulumi.set(__self__, "pod_metrics_endpoints", pod_metrics_endpoints)
-        if pod_target_labels is not None:
-            pulumi.set(__self__, "pod_target_labels", pod_target_labels)
-        if sample_limit is not None:
-            pulumi.set(__self__, "sample_limit", sample_limit)
-        if scrape_class is not None:
-            pulumi.set(__self__, "scrape_class", scrape_class)
-        if scrape_classic_histograms is not None:
-            pulumi.set(__self__, "scrape_classic_histograms", scrape_classic_histograms)
-        if scrape_native_histograms is not None:
-            pulumi.set(__self__, "scrape_native_histograms", scrape_native_histograms)
-        if scrape_protocols is not None:
-            pulumi.set(__self__, "scrape_protocols", scrape_protocols)
-        if selector is not None:
-            pulumi.set(__self__, "selector", selector)
-        if selector_mechanism is not None:
-            pulumi.set(__self__, "selector_mechanism", selector_mechanism)
-        if target_limit is not None:
-            pulumi.set(__self__, "target_limit", target_limit)
-
-    @_builtins.property
-    @pulumi.getter(name="attachMetadata")
-    def attach_metadata(self) -> pulumi.Input[Optional['PodMonitorSpecAttachMetadataPatchArgs']]:
-        return pulumi.get(self, "attach_metadata")
-
-    @attach_metadata.setter
-    def attach_metadata(self, value: pulumi.Input[Optional['PodMonitorSpecAttachMetadataPatchArgs']]):
-        pulumi.set(self, "attach_metadata", value)
-
-    @_builtins.property
-    @pulumi.getter(name="bodySizeLimit")
-    def body_size_limit(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        bodySizeLimit when defined specifies a job level limit on the size
-        of uncompressed response body that will be accepted by Prometheus.
-
-        It requires Prometheus >= v2.28.0.
-        """
-        return pulumi.get(self, "body_size_limit")
-
-    @body_size_limit.setter
-    def body_size_limit(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "body_size_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="convertClassicHistogramsToNHCB")
-    def convert_classic_histograms_to_nhcb(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-        It requires Prometheus >= v3.0.0.
-        """
-        return pulumi.get(self, "convert_classic_histograms_to_nhcb")
-
-    @convert_classic_histograms_to_nhcb.setter
-    def convert_classic_histograms_to_nhcb(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "convert_classic_histograms_to_nhcb", value)
-
-    @_builtins.property
-    @pulumi.getter(name="fallbackScrapeProtocol")
-    def fallback_scrape_protocol(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-        It requires Prometheus >= v3.0.0.
-        """
-        return pulumi.get(self, "fallback_scrape_protocol")
-
-    @fallback_scrape_protocol.setter
-    def fallback_scrape_protocol(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "fallback_scrape_protocol", value)
-
-    @_builtins.property
-    @pulumi.getter(name="jobLabel")
-    def job_label(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        jobLabel defines the label to use to retrieve the job name from.
-        `jobLabel` selects the label from the associated Kubernetes `Pod`
-        object which will be used as the `job` label for all metrics.
-
-        For example if `jobLabel` is set to `foo` and the Kubernetes `Pod`
-        object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-        label to all ingested metrics.
-
-        If the value of this field is empty, the `job` label of the metrics
-        defaults to the namespace and name of the PodMonitor object (e.g. `<namespace>/<name>`).
-        """
-        return pulumi.get(self, "job_label")
-
-    @job_label.setter
-    def job_label(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "job_label", value)
-
-    @_builtins.property
-    @pulumi.getter(name="keepDroppedTargets")
-    def keep_dropped_targets(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-        that will be kept in memory. 0 means no limit.
-
-        It requires Prometheus >= v2.47.0.
-        """
-        return pulumi.get(self, "keep_dropped_targets")
-
-    @keep_dropped_targets.setter
-    def keep_dropped_targets(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "keep_dropped_targets", value)
-
-    @_builtins.property
-    @pulumi.getter(name="labelLimit")
-    def label_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_limit")
-
-    @label_limit.setter
-    def label_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "label_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="labelNameLengthLimit")
-    def label_name_length_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_name_length_limit")
-
-    @label_name_length_limit.setter
-    def label_name_length_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "label_name_length_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="labelValueLengthLimit")
-    def label_value_length_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_value_length_limit")
-
-    @label_value_length_limit.setter
-    def label_value_length_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "label_value_length_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> pulumi.Input[Optional['PodMonitorSpecNamespaceSelectorPatchArgs']]:
-        return pulumi.get(self, "namespace_selector")
-
-    @namespace_selector.setter
-    def namespace_selector(self, value: pulumi.Input[Optional['PodMonitorSpecNamespaceSelectorPatchArgs']]):
-        pulumi.set(self, "namespace_selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="nativeHistogramBucketLimit")
-    def native_histogram_bucket_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-        buckets will be merged to stay within the limit.
-        It requires Prometheus >= v2.45.0.
-        """
-        return pulumi.get(self, "native_histogram_bucket_limit")
-
-    @native_histogram_bucket_limit.setter
-    def native_histogram_bucket_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "native_histogram_bucket_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="nativeHistogramMinBucketFactor")
-    def native_histogram_min_bucket_factor(self) -> pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]:
-        """
-        nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-        buckets will be merged to increase the factor sufficiently.
-        It requires Prometheus >= v2.50.0.
-        """
-        return pulumi.get(self, "native_histogram_min_bucket_factor")
-
-    @native_histogram_min_bucket_factor.setter
-    def native_histogram_min_bucket_factor(self, value: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]):
-        pulumi.set(self, "native_histogram_min_bucket_factor", value)
-
-    @_builtins.property
-    @pulumi.getter(name="podMetricsEndpoints")
-    def pod_metrics_endpoints(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsPatchArgs']]]]:
-        """
-        podMetricsEndpoints defines how to scrape metrics from the selected pods.
-        """
-        return pulumi.get(self, "pod_metrics_endpoints")
-
-    @pod_metrics_endpoints.setter
-    def pod_metrics_endpoints(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsPatchArgs']]]]):
-        pulumi.set(self, "pod_metrics_endpoints", value)
-
-    @_builtins.property
-    @pulumi.getter(name="podTargetLabels")
-    def pod_target_labels(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        podTargetLabels defines the labels which are transferred from the
-        associated Kubernetes `Pod` object onto the ingested metrics.
-        """
-        return pulumi.get(self, "pod_target_labels")
-
-    @pod_target_labels.setter
-    def pod_target_labels(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "pod_target_labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sampleLimit")
-    def sample_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        sampleLimit defines a per-scrape limit on the number of scraped samples
-        that will be accepted.
-        """
-        return pulumi.get(self, "sample_limit")
-
-    @sample_limit.setter
-    def sample_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "sample_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeClass")
-    def scrape_class(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        scrapeClass defines the scrape class to apply.
-        """
-        return pulumi.get(self, "scrape_class")
-
-    @scrape_class.setter
-    def scrape_class(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "scrape_class", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeClassicHistograms")
-    def scrape_classic_histograms(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-        It requires Prometheus >= v2.45.0.
-
-        Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-        """
-        return pulumi.get(self, "scrape_classic_histograms")
-
-    @scrape_classic_histograms.setter
-    def scrape_classic_histograms(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "scrape_classic_histograms", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeNativeHistograms")
-    def scrape_native_histograms(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        scrapeNativeHistograms defines whether to enable scraping of native histograms.
-        It requires Prometheus >= v3.8.0.
-        """
-        return pulumi.get(self, "scrape_native_histograms")
-
-    @scrape_native_histograms.setter
-    def scrape_native_histograms(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "scrape_native_histograms", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeProtocols")
-    def scrape_protocols(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-        protocols supported by Prometheus in order of preference (from most to least preferred).
-
-        If unset, Prometheus uses its default value.
-
-        It requires Prometheus >= v2.49.0.
-        """
-        return pulumi.get(self, "scrape_protocols")
-
-    @scrape_protocols.setter
-    def scrape_protocols(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "scrape_protocols", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def selector(self) -> pulumi.Input[Optional['PodMonitorSpecSelectorPatchArgs']]:
-        return pulumi.get(self, "selector")
-
-    @selector.setter
-    def selector(self, value: pulumi.Input[Optional['PodMonitorSpecSelectorPatchArgs']]):
-        pulumi.set(self, "selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="selectorMechanism")
-    def selector_mechanism(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        selectorMechanism defines the mechanism used to select the endpoints to scrape.
-        By default, the selection process relies on relabel configurations to filter the discovered targets.
-        Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-        Which strategy is best for your use case needs to be carefully evaluated.
-
-        It requires Prometheus >= v2.17.0.
-        """
-        return pulumi.get(self, "selector_mechanism")
-
-    @selector_mechanism.setter
-    def selector_mechanism(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "selector_mechanism", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetLimit")
-    def target_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        targetLimit defines a limit on the number of scraped targets that will
-        be accepted.
-        """
-        return pulumi.get(self, "target_limit")
-
-    @target_limit.setter
-    def target_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "target_limit", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatchArgsDict(TypedDict):
-    """
-    credentials defines a key of a Secret in the namespace that contains the credentials for authentication.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        credentials defines a key of a Secret in the namespace that contains the credentials for authentication.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsArgsDict(TypedDict):
-    """
-    credentials defines a key of a Secret in the namespace that contains the credentials for authentication.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        credentials defines a key of a Secret in the namespace that contains the credentials for authentication.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsAuthorizationPatchArgsDict(TypedDict):
-    """
-    authorization configures the Authorization header credentials used by
-    the client.
-
-    Cannot be set at the same time as `basicAuth`, `bearerTokenSecret` or `oauth2`.
-    """
-    credentials: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatchArgs']]]
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type defines the authentication type. The value is case-insensitive.
-
-    "Basic" is not a supported value.
-
-    Default: "Bearer"
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsAuthorizationPatchArgs:
-    def __init__(__self__, *,
-                 credentials: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatchArgs']] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        authorization configures the Authorization header credentials used by
-        the client.
-
-        Cannot be set at the same time as `basicAuth`, `bearerTokenSecret` or `oauth2`.
-
-        :param pulumi.Input[_builtins.str] type: type defines the authentication type. The value is case-insensitive.
-
-               "Basic" is not a supported value.
-
-               Default: "Bearer"
-        """
-        if credentials is not None:
-            pulumi.set(__self__, "credentials", credentials)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter
-    def credentials(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatchArgs']]:
-        return pulumi.get(self, "credentials")
-
-    @credentials.setter
-    def credentials(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatchArgs']]):
-        pulumi.set(self, "credentials", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type defines the authentication type. The value is case-insensitive.
-
-        "Basic" is not a supported value.
-
-        Default: "Bearer"
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsAuthorizationArgsDict(TypedDict):
-    """
-    authorization configures the Authorization header credentials used by
-    the client.
-
-    Cannot be set at the same time as `basicAuth`, `bearerTokenSecret` or `oauth2`.
-    """
-    credentials: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsArgs']]]
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type defines the authentication type. The value is case-insensitive.
-
-    "Basic" is not a supported value.
-
-    Default: "Bearer"
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsAuthorizationArgs:
-    def __init__(__self__, *,
-                 credentials: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsArgs']] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        authorization configures the Authorization header credentials used by
-        the client.
-
-        Cannot be set at the same time as `basicAuth`, `bearerTokenSecret` or `oauth2`.
-
-        :param pulumi.Input[_builtins.str] type: type defines the authentication type. The value is case-insensitive.
-
-               "Basic" is not a supported value.
-
-               Default: "Bearer"
-        """
-        if credentials is not None:
-            pulumi.set(__self__, "credentials", credentials)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter
-    def credentials(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsArgs']]:
-        return pulumi.get(self, "credentials")
-
-    @credentials.setter
-    def credentials(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsArgs']]):
-        pulumi.set(self, "credentials", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type defines the authentication type. The value is case-insensitive.
-
-        "Basic" is not a supported value.
-
-        Default: "Bearer"
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatchArgsDict(TypedDict):
-    """
-    password defines a key of a Secret containing the password for
-    authentication.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        password defines a key of a Secret containing the password for
-        authentication.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgsDict(TypedDict):
-    """
-    password defines a key of a Secret containing the password for
-    authentication.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        password defines a key of a Secret containing the password for
-        authentication.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsBasicAuthPatchArgsDict(TypedDict):
-    """
-    basicAuth defines the Basic Authentication credentials used by the
-    client.
-
-    Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
-    """
-    password: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatchArgs']]]
-    username: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatchArgs']]]
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsBasicAuthPatchArgs:
-    def __init__(__self__, *,
-                 password: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatchArgs']] = None,
-                 username: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatchArgs']] = None):
-        """
-        basicAuth defines the Basic Authentication credentials used by the
-        client.
-
-        Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
-        """
-        if password is not None:
-            pulumi.set(__self__, "password", password)
-        if username is not None:
-            pulumi.set(__self__, "username", username)
-
-    @_builtins.property
-    @pulumi.getter
-    def password(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatchArgs']]:
-        return pulumi.get(self, "password")
-
-    @password.setter
-    def password(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatchArgs']]):
-        pulumi.set(self, "password", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def username(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatchArgs']]:
-        return pulumi.get(self, "username")
-
-    @username.setter
-    def username(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatchArgs']]):
-        pulumi.set(self, "username", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatchArgsDict(TypedDict):
-    """
-    username defines a key of a Secret containing the username for
-    authentication.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        username defines a key of a Secret containing the username for
-        authentication.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgsDict(TypedDict):
-    """
-    username defines a key of a Secret containing the username for
-    authentication.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        username defines a key of a Secret containing the username for
-        authentication.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsBasicAuthArgsDict(TypedDict):
-    """
-    basicAuth defines the Basic Authentication credentials used by the
-    client.
-
-    Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
-    """
-    password: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgs']]]
-    username: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgs']]]
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsBasicAuthArgs:
-    def __init__(__self__, *,
-                 password: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgs']] = None,
-                 username: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgs']] = None):
-        """
-        basicAuth defines the Basic Authentication credentials used by the
-        client.
-
-        Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
-        """
-        if password is not None:
-            pulumi.set(__self__, "password", password)
-        if username is not None:
-            pulumi.set(__self__, "username", username)
-
-    @_builtins.property
-    @pulumi.getter
-    def password(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgs']]:
-        return pulumi.get(self, "password")
-
-    @password.setter
-    def password(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgs']]):
-        pulumi.set(self, "password", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def username(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgs']]:
-        return pulumi.get(self, "username")
-
-    @username.setter
-    def username(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgs']]):
-        pulumi.set(self, "username", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatchArgsDict(TypedDict):
-    """
-    bearerTokenSecret defines a key of a Secret containing the bearer token
-    used by the client for authentication. The secret needs to be in the
-    same namespace as the custom resource and readable by the Prometheus
-    Operator.
-
-    Cannot be set at the same time as `authorization`, `basicAuth` or `oauth2`.
-
-    Deprecated: use `authorization` instead.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        bearerTokenSecret defines a key of a Secret containing the bearer token
-        used by the client for authentication. The secret needs to be in the
-        same namespace as the custom resource and readable by the Prometheus
-        Operator.
-
-        Cannot be set at the same time as `authorization`, `basicAuth` or `oauth2`.
-
-        Deprecated: use `authorization` instead.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsBearerTokenSecretArgsDict(TypedDict):
-    """
-    bearerTokenSecret defines a key of a Secret containing the bearer token
-    used by the client for authentication. The secret needs to be in the
-    same namespace as the custom resource and readable by the Prometheus
-    Operator.
-
-    Cannot be set at the same time as `authorization`, `basicAuth` or `oauth2`.
-
-    Deprecated: use `authorization` instead.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsBearerTokenSecretArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        bearerTokenSecret defines a key of a Secret containing the bearer token
-        used by the client for authentication. The secret needs to be in the
-        same namespace as the custom resource and readable by the Prometheus
-        Operator.
-
-        Cannot be set at the same time as `authorization`, `basicAuth` or `oauth2`.
-
-        Deprecated: use `authorization` instead.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgsDict(TypedDict):
-    """
-    RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-    scraped samples and remote write samples.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    action: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    action to perform based on the regex matching.
-
-    `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-    `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-    Default: "Replace"
-    """
-    modulus: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    modulus to take of the hash of the source label values.
-
-    Only applicable when the action is `HashMod`.
-    """
-    regex: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    regex defines the regular expression against which the extracted value is matched.
-    """
-    replacement: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    replacement value against which a Replace action is performed if the
-    regular expression matches.
-
-    Regex capture groups are available.
-    """
-    separator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    separator defines the string between concatenated SourceLabels.
-    """
-    source_labels: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    sourceLabels defines the source labels select values from existing labels. Their content is
-    concatenated using the configured Separator and matched against the
-    configured regular expression.
-    """
-    target_label: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    targetLabel defines the label to which the resulting string is written in a replacement.
-
-    It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-    `KeepEqual` and `DropEqual` actions.
-
-    Regex capture groups are available.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgs:
-    def __init__(__self__, *,
-                 action: pulumi.Input[Optional[_builtins.str]] = None,
-                 modulus: pulumi.Input[Optional[_builtins.int]] = None,
-                 regex: pulumi.Input[Optional[_builtins.str]] = None,
-                 replacement: pulumi.Input[Optional[_builtins.str]] = None,
-                 separator: pulumi.Input[Optional[_builtins.str]] = None,
-                 source_labels: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 target_label: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-        scraped samples and remote write samples.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-
-        :param pulumi.Input[_builtins.str] action: action to perform based on the regex matching.
-
-               `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-               `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-               Default: "Replace"
-        :param pulumi.Input[_builtins.int] modulus: modulus to take of the hash of the source label values.
-
-               Only applicable when the action is `HashMod`.
-        :param pulumi.Input[_builtins.str] regex: regex defines the regular expression against which the extracted value is matched.
-        :param pulumi.Input[_builtins.str] replacement: replacement value against which a Replace action is performed if the
-               regular expression matches.
-
-               Regex capture groups are available.
-        :param pulumi.Input[_builtins.str] separator: separator defines the string between concatenated SourceLabels.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] source_labels: sourceLabels defines the source labels select values from existing labels. Their content is
-               concatenated using the configured Separator and matched against the
-               configured regular expression.
-        :param pulumi.Input[_builtins.str] target_label: targetLabel defines the label to which the resulting string is written in a replacement.
-
-               It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-               `KeepEqual` and `DropEqual` actions.
-
-               Regex capture groups are available.
-        """
-        if action is not None:
-            pulumi.set(__self__, "action", action)
-        if modulus is not None:
-            pulumi.set(__self__, "modulus", modulus)
-        if regex is not None:
-            pulumi.set(__self__, "regex", regex)
-        if replacement is not None:
-            pulumi.set(__self__, "replacement", replacement)
-        if separator is not None:
-            pulumi.set(__self__, "separator", separator)
-        if source_labels is not None:
-            pulumi.set(__self__, "source_labels", source_labels)
-        if target_label is not None:
-            pulumi.set(__self__, "target_label", target_label)
-
-    @_builtins.property
-    @pulumi.getter
-    def action(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        action to perform based on the regex matching.
-
-        `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-        `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-        Default: "Replace"
-        """
-        return pulumi.get(self, "action")
-
-    @action.setter
-    def action(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "action", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def modulus(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        modulus to take of the hash of the source label values.
-
-        Only applicable when the action is `HashMod`.
-        """
-        return pulumi.get(self, "modulus")
-
-    @modulus.setter
-    def modulus(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "modulus", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def regex(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        regex defines the regular expression against which the extracted value is matched.
-        """
-        return pulumi.get(self, "regex")
-
-    @regex.setter
-    def regex(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "regex", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def replacement(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        replacement value against which a Replace action is performed if the
-        regular expression matches.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "replacement")
-
-    @replacement.setter
-    def replacement(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "replacement", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def separator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        separator defines the string between concatenated SourceLabels.
-        """
-        return pulumi.get(self, "separator")
-
-    @separator.setter
-    def separator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "separator", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sourceLabels")
-    def source_labels(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        sourceLabels defines the source labels select values from existing labels. Their content is
-        concatenated using the configured Separator and matched against the
-        configured regular expression.
-        """
-        return pulumi.get(self, "source_labels")
-
-    @source_labels.setter
-    def source_labels(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "source_labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabel")
-    def target_label(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        targetLabel defines the label to which the resulting string is written in a replacement.
-
-        It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-        `KeepEqual` and `DropEqual` actions.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "target_label")
-
-    @target_label.setter
-    def target_label(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "target_label", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgsDict(TypedDict):
-    """
-    RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-    scraped samples and remote write samples.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    action: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    action to perform based on the regex matching.
-
-    `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-    `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-    Default: "Replace"
-    """
-    modulus: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    modulus to take of the hash of the source label values.
-
-    Only applicable when the action is `HashMod`.
-    """
-    regex: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    regex defines the regular expression against which the extracted value is matched.
-    """
-    replacement: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    replacement value against which a Replace action is performed if the
-    regular expression matches.
-
-    Regex capture groups are available.
-    """
-    separator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    separator defines the string between concatenated SourceLabels.
-    """
-    source_labels: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    sourceLabels defines the source labels select values from existing labels. Their content is
-    concatenated using the configured Separator and matched against the
-    configured regular expression.
-    """
-    target_label: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    targetLabel defines the label to which the resulting string is written in a replacement.
-
-    It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-    `KeepEqual` and `DropEqual` actions.
-
-    Regex capture groups are available.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgs:
-    def __init__(__self__, *,
-                 action: pulumi.Input[Optional[_builtins.str]] = None,
-                 modulus: pulumi.Input[Optional[_builtins.int]] = None,
-                 regex: pulumi.Input[Optional[_builtins.str]] = None,
-                 replacement: pulumi.Input[Optional[_builtins.str]] = None,
-                 separator: pulumi.Input[Optional[_builtins.str]] = None,
-                 source_labels: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 target_label: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-        scraped samples and remote write samples.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-
-        :param pulumi.Input[_builtins.str] action: action to perform based on the regex matching.
-
-               `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-               `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-               Default: "Replace"
-        :param pulumi.Input[_builtins.int] modulus: modulus to take of the hash of the source label values.
-
-               Only applicable when the action is `HashMod`.
-        :param pulumi.Input[_builtins.str] regex: regex defines the regular expression against which the extracted value is matched.
-        :param pulumi.Input[_builtins.str] replacement: replacement value against which a Replace action is performed if the
-               regular expression matches.
-
-               Regex capture groups are available.
-        :param pulumi.Input[_builtins.str] separator: separator defines the string between concatenated SourceLabels.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] source_labels: sourceLabels defines the source labels select values from existing labels. Their content is
-               concatenated using the configured Separator and matched against the
-               configured regular expression.
-        :param pulumi.Input[_builtins.str] target_label: targetLabel defines the label to which the resulting string is written in a replacement.
-
-               It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-               `KeepEqual` and `DropEqual` actions.
-
-               Regex capture groups are available.
-        """
-        if action is not None:
-            pulumi.set(__self__, "action", action)
-        if modulus is not None:
-            pulumi.set(__self__, "modulus", modulus)
-        if regex is not None:
-            pulumi.set(__self__, "regex", regex)
-        if replacement is not None:
-            pulumi.set(__self__, "replacement", replacement)
-        if separator is not None:
-            pulumi.set(__self__, "separator", separator)
-        if source_labels is not None:
-            pulumi.set(__self__, "source_labels", source_labels)
-        if target_label is not None:
-            pulumi.set(__self__, "target_label", target_label)
-
-    @_builtins.property
-    @pulumi.getter
-    def action(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        action to perform based on the regex matching.
-
-        `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-        `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-        Default: "Replace"
-        """
-        return pulumi.get(self, "action")
-
-    @action.setter
-    def action(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "action", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def modulus(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        modulus to take of the hash of the source label values.
-
-        Only applicable when the action is `HashMod`.
-        """
-        return pulumi.get(self, "modulus")
-
-    @modulus.setter
-    def modulus(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "modulus", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def regex(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        regex defines the regular expression against which the extracted value is matched.
-        """
-        return pulumi.get(self, "regex")
-
-    @regex.setter
-    def regex(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "regex", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def replacement(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        replacement value against which a Replace action is performed if the
-        regular expression matches.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "replacement")
-
-    @replacement.setter
-    def replacement(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "replacement", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def separator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        separator defines the string between concatenated SourceLabels.
-        """
-        return pulumi.get(self, "separator")
-
-    @separator.setter
-    def separator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "separator", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sourceLabels")
-    def source_labels(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        sourceLabels defines the source labels select values from existing labels. Their content is
-        concatenated using the configured Separator and matched against the
-        configured regular expression.
-        """
-        return pulumi.get(self, "source_labels")
-
-    @source_labels.setter
-    def source_labels(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "source_labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabel")
-    def target_label(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        targetLabel defines the label to which the resulting string is written in a replacement.
-
-        It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-        `KeepEqual` and `DropEqual` actions.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "target_label")
-
-    @target_label.setter
-    def target_label(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "target_label", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatchArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgsDict(TypedDict):
-    """
-    clientId defines a key of a Secret or ConfigMap containing the
-    OAuth2 client's ID.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatchArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatchArgs']]]
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatchArgs']] = None,
-                 secret: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatchArgs']] = None):
-        """
-        clientId defines a key of a Secret or ConfigMap containing the
-        OAuth2 client's ID.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatchArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatchArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatchArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatchArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatchArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientIdArgsDict(TypedDict):
-    """
-    clientId defines a key of a Secret or ConfigMap containing the
-    OAuth2 client's ID.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretArgs']]]
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientIdArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapArgs']] = None,
-                 secret: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretArgs']] = None):
-        """
-        clientId defines a key of a Secret or ConfigMap containing the
-        OAuth2 client's ID.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgsDict(TypedDict):
-    """
-    clientSecret defines a key of a Secret containing the OAuth2
-    client's secret.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        clientSecret defines a key of a Secret containing the OAuth2
-        client's secret.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretArgsDict(TypedDict):
-    """
-    clientSecret defines a key of a Secret containing the OAuth2
-    client's secret.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        clientSecret defines a key of a Secret containing the OAuth2
-        client's secret.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2PatchArgsDict(TypedDict):
-    """
-    oauth2 defines the OAuth2 settings used by the client.
-
-    It requires Prometheus >= 2.27.0.
-
-    Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
-    """
-    client_id: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgs']]]
-    client_secret: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgs']]]
-    endpoint_params: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    endpointParams configures the HTTP parameters to append to the token
-    URL.
-    """
-    no_proxy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-    that should be excluded from proxying. IP and domain names can
-    contain port numbers.
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_connect_header: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs']]]]]]]
-    """
-    proxyConnectHeader optionally specifies headers to send to
-    proxies during CONNECT requests.
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_from_environment: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_url: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    proxyUrl defines the HTTP proxy server to use.
-    """
-    scopes: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    scopes defines the OAuth2 scopes used for the token request.
-    """
-    tls_config: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgs']]]
-    token_url: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    tokenUrl defines the URL to fetch the token from.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2PatchArgs:
-    def __init__(__self__, *,
-                 client_id: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgs']] = None,
-                 client_secret: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgs']] = None,
-                 endpoint_params: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 no_proxy: pulumi.Input[Optional[_builtins.str]] = None,
-                 proxy_connect_header: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs']]]]]] = None,
-                 proxy_from_environment: pulumi.Input[Optional[_builtins.bool]] = None,
-                 proxy_url: pulumi.Input[Optional[_builtins.str]] = None,
-                 scopes: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 tls_config: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgs']] = None,
-                 token_url: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        oauth2 defines the OAuth2 settings used by the client.
-
-        It requires Prometheus >= 2.27.0.
-
-        Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
-
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] endpoint_params: endpointParams configures the HTTP parameters to append to the token
-               URL.
-        :param pulumi.Input[_builtins.str] no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-               that should be excluded from proxying. IP and domain names can
-               contain port numbers.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs']]]]] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
-               proxies during CONNECT requests.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[_builtins.bool] proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[_builtins.str] proxy_url: proxyUrl defines the HTTP proxy server to use.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] scopes: scopes defines the OAuth2 scopes used for the token request.
-        :param pulumi.Input[_builtins.str] token_url: tokenUrl defines the URL to fetch the token from.
-        """
-        if client_id is not None:
-            pulumi.set(__self__, "client_id", client_id)
-        if client_secret is not None:
-            pulumi.set(__self__, "client_secret", client_secret)
-        if endpoint_params is not None:
-            pulumi.set(__self__, "endpoint_params", endpoint_params)
-        if no_proxy is not None:
-            pulumi.set(__self__, "no_proxy", no_proxy)
-        if proxy_connect_header is not None:
-            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
-        if proxy_from_environment is not None:
-            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
-        if proxy_url is not None:
-            pulumi.set(__self__, "proxy_url", proxy_url)
-        if scopes is not None:
-            pulumi.set(__self__, "scopes", scopes)
-        if tls_config is not None:
-            pulumi.set(__self__, "tls_config", tls_config)
-        if token_url is not None:
-            pulumi.set(__self__, "token_url", token_url)
-
-    @_builtins.property
-    @pulumi.getter(name="clientId")
-    def client_id(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgs']]:
-        return pulumi.get(self, "client_id")
-
-    @client_id.setter
-    def client_id(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgs']]):
-        pulumi.set(self, "client_id", value)
-
-    @_builtins.property
-    @pulumi.getter(name="clientSecret")
-    def client_secret(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgs']]:
-        return pulumi.get(self, "client_secret")
-
-    @client_secret.setter
-    def client_secret(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgs']]):
-        pulumi.set(self, "client_secret", value)
-
-    @_builtins.property
-    @pulumi.getter(name="endpointParams")
-    def endpoint_params(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        endpointParams configures the HTTP parameters to append to the token
-        URL.
-        """
-        return pulumi.get(self, "endpoint_params")
-
-    @endpoint_params.setter
-    def endpoint_params(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "endpoint_params", value)
-
-    @_builtins.property
-    @pulumi.getter(name="noProxy")
-    def no_proxy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-        that should be excluded from proxying. IP and domain names can
-        contain port numbers.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "no_proxy")
-
-    @no_proxy.setter
-    def no_proxy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "no_proxy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyConnectHeader")
-    def proxy_connect_header(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs']]]]]]:
-        """
-        proxyConnectHeader optionally specifies headers to send to
-        proxies during CONNECT requests.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_connect_header")
-
-    @proxy_connect_header.setter
-    def proxy_connect_header(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs']]]]]]):
-        pulumi.set(self, "proxy_connect_header", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyFromEnvironment")
-    def proxy_from_environment(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_from_environment")
-
-    @proxy_from_environment.setter
-    def proxy_from_environment(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "proxy_from_environment", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyUrl")
-    def proxy_url(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        proxyUrl defines the HTTP proxy server to use.
-        """
-        return pulumi.get(self, "proxy_url")
-
-    @proxy_url.setter
-    def proxy_url(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "proxy_url", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def scopes(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        scopes defines the OAuth2 scopes used for the token request.
-        """
-        return pulumi.get(self, "scopes")
-
-    @scopes.setter
-    def scopes(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "scopes", value)
-
-    @_builtins.property
-    @pulumi.getter(name="tlsConfig")
-    def tls_config(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgs']]:
-        return pulumi.get(self, "tls_config")
-
-    @tls_config.setter
-    def tls_config(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgs']]):
-        pulumi.set(self, "tls_config", value)
-
-    @_builtins.property
-    @pulumi.getter(name="tokenUrl")
-    def token_url(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        tokenUrl defines the URL to fetch the token from.
-        """
-        return pulumi.get(self, "token_url")
-
-    @token_url.setter
-    def token_url(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "token_url", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgsDict(TypedDict):
-    """
-    SecretKeySelector selects a key of a Secret.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        SecretKeySelector selects a key of a Secret.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgsDict(TypedDict):
-    """
-    ca defines the Certificate authority used when verifying server certificates.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgs']]]
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgs']] = None,
-                 secret: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgs']] = None):
-        """
-        ca defines the Certificate authority used when verifying server certificates.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaArgsDict(TypedDict):
-    """
-    ca defines the Certificate authority used when verifying server certificates.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretArgs']]]
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapArgs']] = None,
-                 secret: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretArgs']] = None):
-        """
-        ca defines the Certificate authority used when verifying server certificates.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatchArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatchArgsDict(TypedDict):
-    """
-    cert defines the Client certificate to present when doing client-authentication.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatchArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatchArgs']]]
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatchArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatchArgs']] = None,
-                 secret: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatchArgs']] = None):
-        """
-        cert defines the Client certificate to present when doing client-authentication.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatchArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatchArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatchArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatchArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatchArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertArgsDict(TypedDict):
-    """
-    cert defines the Client certificate to present when doing client-authentication.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretArgs']]]
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapArgs']] = None,
-                 secret: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretArgs']] = None):
-        """
-        cert defines the Client certificate to present when doing client-authentication.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatchArgsDict(TypedDict):
-    """
-    keySecret defines the Secret containing the client key file for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        keySecret defines the Secret containing the client key file for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretArgsDict(TypedDict):
-    """
-    keySecret defines the Secret containing the client key file for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        keySecret defines the Secret containing the client key file for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgsDict(TypedDict):
-    """
-    tlsConfig defines the TLS configuration to use when connecting to the OAuth2 server.
-    It requires Prometheus >= v2.43.0.
-    """
-    ca: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgs']]]
-    cert: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatchArgs']]]
-    insecure_skip_verify: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    insecureSkipVerify defines how to disable target certificate validation.
-    """
-    key_secret: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatchArgs']]]
-    max_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    maxVersion defines the maximum acceptable TLS version.
-
-    It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-    """
-    min_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    minVersion defines the minimum acceptable TLS version.
-
-    It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-    """
-    server_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    serverName is used to verify the hostname for the targets.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgs:
-    def __init__(__self__, *,
-                 ca: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgs']] = None,
-                 cert: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatchArgs']] = None,
-                 insecure_skip_verify: pulumi.Input[Optional[_builtins.bool]] = None,
-                 key_secret: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatchArgs']] = None,
-                 max_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 min_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 server_name: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        tlsConfig defines the TLS configuration to use when connecting to the OAuth2 server.
-        It requires Prometheus >= v2.43.0.
-
-        :param pulumi.Input[_builtins.bool] insecure_skip_verify: insecureSkipVerify defines how to disable target certificate validation.
-        :param pulumi.Input[_builtins.str] max_version: maxVersion defines the maximum acceptable TLS version.
-
-               It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        :param pulumi.Input[_builtins.str] min_version: minVersion defines the minimum acceptable TLS version.
-
-               It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        :param pulumi.Input[_builtins.str] server_name: serverName is used to verify the hostname for the targets.
-        """
-        if ca is not None:
-            pulumi.set(__self__, "ca", ca)
-        if cert is not None:
-            pulumi.set(__self__, "cert", cert)
-        if insecure_skip_verify is not None:
-            pulumi.set(__self__, "insecure_skip_verify", insecure_skip_verify)
-        if key_secret is not None:
-            pulumi.set(__self__, "key_secret", key_secret)
-        if max_version is not None:
-            pulumi.set(__self__, "max_version", max_version)
-        if min_version is not None:
-            pulumi.set(__self__, "min_version", min_version)
-        if server_name is not None:
-            pulumi.set(__self__, "server_name", server_name)
-
-    @_builtins.property
-    @pulumi.getter
-    def ca(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgs']]:
-        return pulumi.get(self, "ca")
-
-    @ca.setter
-    def ca(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgs']]):
-        pulumi.set(self, "ca", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def cert(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatchArgs']]:
-        return pulumi.get(self, "cert")
-
-    @cert.setter
-    def cert(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatchArgs']]):
-        pulumi.set(self, "cert", value)
-
-    @_builtins.property
-    @pulumi.getter(name="insecureSkipVerify")
-    def insecure_skip_verify(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        insecureSkipVerify defines how to disable target certificate validation.
-        """
-        return pulumi.get(self, "insecure_skip_verify")
-
-    @insecure_skip_verify.setter
-    def insecure_skip_verify(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "insecure_skip_verify", value)
-
-    @_builtins.property
-    @pulumi.getter(name="keySecret")
-    def key_secret(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatchArgs']]:
-        return pulumi.get(self, "key_secret")
-
-    @key_secret.setter
-    def key_secret(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatchArgs']]):
-        pulumi.set(self, "key_secret", value)
-
-    @_builtins.property
-    @pulumi.getter(name="maxVersion")
-    def max_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        maxVersion defines the maximum acceptable TLS version.
-
-        It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        """
-        return pulumi.get(self, "max_version")
-
-    @max_version.setter
-    def max_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "max_version", value)
-
-    @_builtins.property
-    @pulumi.getter(name="minVersion")
-    def min_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        minVersion defines the minimum acceptable TLS version.
-
-        It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        """
-        return pulumi.get(self, "min_version")
-
-    @min_version.setter
-    def min_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "min_version", value)
-
-    @_builtins.property
-    @pulumi.getter(name="serverName")
-    def server_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        serverName is used to verify the hostname for the targets.
-        """
-        return pulumi.get(self, "server_name")
-
-    @server_name.setter
-    def server_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "server_name", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigArgsDict(TypedDict):
-    """
-    tlsConfig defines the TLS configuration to use when connecting to the OAuth2 server.
-    It requires Prometheus >= v2.43.0.
-    """
-    ca: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaArgs']]]
-    cert: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertArgs']]]
-    insecure_skip_verify: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    insecureSkipVerify defines how to disable target certificate validation.
-    """
-    key_secret: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretArgs']]]
-    max_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    maxVersion defines the maximum acceptable TLS version.
-
-    It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-    """
-    min_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    minVersion defines the minimum acceptable TLS version.
-
-    It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-    """
-    server_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    serverName is used to verify the hostname for the targets.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigArgs:
-    def __init__(__self__, *,
-                 ca: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaArgs']] = None,
-                 cert: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertArgs']] = None,
-                 insecure_skip_verify: pulumi.Input[Optional[_builtins.bool]] = None,
-                 key_secret: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretArgs']] = None,
-                 max_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 min_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 server_name: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        tlsConfig defines the TLS configuration to use when connecting to the OAuth2 server.
-        It requires Prometheus >= v2.43.0.
-
-        :param pulumi.Input[_builtins.bool] insecure_skip_verify: insecureSkipVerify defines how to disable target certificate validation.
-        :param pulumi.Input[_builtins.str] max_version: maxVersion defines the maximum acceptable TLS version.
-
-               It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        :param pulumi.Input[_builtins.str] min_version: minVersion defines the minimum acceptable TLS version.
-
-               It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        :param pulumi.Input[_builtins.str] server_name: serverName is used to verify the hostname for the targets.
-        """
-        if ca is not None:
-            pulumi.set(__self__, "ca", ca)
-        if cert is not None:
-            pulumi.set(__self__, "cert", cert)
-        if insecure_skip_verify is not None:
-            pulumi.set(__self__, "insecure_skip_verify", insecure_skip_verify)
-        if key_secret is not None:
-            pulumi.set(__self__, "key_secret", key_secret)
-        if max_version is not None:
-            pulumi.set(__self__, "max_version", max_version)
-        if min_version is not None:
-            pulumi.set(__self__, "min_version", min_version)
-        if server_name is not None:
-            pulumi.set(__self__, "server_name", server_name)
-
-    @_builtins.property
-    @pulumi.getter
-    def ca(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaArgs']]:
-        return pulumi.get(self, "ca")
-
-    @ca.setter
-    def ca(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaArgs']]):
-        pulumi.set(self, "ca", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def cert(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertArgs']]:
-        return pulumi.get(self, "cert")
-
-    @cert.setter
-    def cert(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertArgs']]):
-        pulumi.set(self, "cert", value)
-
-    @_builtins.property
-    @pulumi.getter(name="insecureSkipVerify")
-    def insecure_skip_verify(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        insecureSkipVerify defines how to disable target certificate validation.
-        """
-        return pulumi.get(self, "insecure_skip_verify")
-
-    @insecure_skip_verify.setter
-    def insecure_skip_verify(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "insecure_skip_verify", value)
-
-    @_builtins.property
-    @pulumi.getter(name="keySecret")
-    def key_secret(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretArgs']]:
-        return pulumi.get(self, "key_secret")
-
-    @key_secret.setter
-    def key_secret(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretArgs']]):
-        pulumi.set(self, "key_secret", value)
-
-    @_builtins.property
-    @pulumi.getter(name="maxVersion")
-    def max_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        maxVersion defines the maximum acceptable TLS version.
-
-        It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        """
-        return pulumi.get(self, "max_version")
-
-    @max_version.setter
-    def max_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "max_version", value)
-
-    @_builtins.property
-    @pulumi.getter(name="minVersion")
-    def min_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        minVersion defines the minimum acceptable TLS version.
-
-        It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        """
-        return pulumi.get(self, "min_version")
-
-    @min_version.setter
-    def min_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "min_version", value)
-
-    @_builtins.property
-    @pulumi.getter(name="serverName")
-    def server_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        serverName is used to verify the hostname for the targets.
-        """
-        return pulumi.get(self, "server_name")
-
-    @server_name.setter
-    def server_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "server_name", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsOauth2ArgsDict(TypedDict):
-    """
-    oauth2 defines the OAuth2 settings used by the client.
-
-    It requires Prometheus >= 2.27.0.
-
-    Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
-    """
-    client_id: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdArgs']]]
-    client_secret: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretArgs']]]
-    endpoint_params: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    endpointParams configures the HTTP parameters to append to the token
-    URL.
-    """
-    no_proxy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-    that should be excluded from proxying. IP and domain names can
-    contain port numbers.
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_connect_header: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs']]]]]]]
-    """
-    proxyConnectHeader optionally specifies headers to send to
-    proxies during CONNECT requests.
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_from_environment: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_url: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    proxyUrl defines the HTTP proxy server to use.
-    """
-    scopes: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    scopes defines the OAuth2 scopes used for the token request.
-    """
-    tls_config: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigArgs']]]
-    token_url: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    tokenUrl defines the URL to fetch the token from.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsOauth2Args:
-    def __init__(__self__, *,
-                 client_id: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdArgs']] = None,
-                 client_secret: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretArgs']] = None,
-                 endpoint_params: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 no_proxy: pulumi.Input[Optional[_builtins.str]] = None,
-                 proxy_connect_header: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs']]]]]] = None,
-                 proxy_from_environment: pulumi.Input[Optional[_builtins.bool]] = None,
-                 proxy_url: pulumi.Input[Optional[_builtins.str]] = None,
-                 scopes: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 tls_config: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigArgs']] = None,
-                 token_url: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        oauth2 defines the OAuth2 settings used by the client.
-
-        It requires Prometheus >= 2.27.0.
-
-        Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
-
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] endpoint_params: endpointParams configures the HTTP parameters to append to the token
-               URL.
-        :param pulumi.Input[_builtins.str] no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-               that should be excluded from proxying. IP and domain names can
-               contain port numbers.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs']]]]] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
-               proxies during CONNECT requests.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[_builtins.bool] proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[_builtins.str] proxy_url: proxyUrl defines the HTTP proxy server to use.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] scopes: scopes defines the OAuth2 scopes used for the token request.
-        :param pulumi.Input[_builtins.str] token_url: tokenUrl defines the URL to fetch the token from.
-        """
-        if client_id is not None:
-            pulumi.set(__self__, "client_id", client_id)
-        if client_secret is not None:
-            pulumi.set(__self__, "client_secret", client_secret)
-        if endpoint_params is not None:
-            pulumi.set(__self__, "endpoint_params", endpoint_params)
-        if no_proxy is not None:
-            pulumi.set(__self__, "no_proxy", no_proxy)
-        if proxy_connect_header is not None:
-            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
-        if proxy_from_environment is not None:
-            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
-        if proxy_url is not None:
-            pulumi.set(__self__, "proxy_url", proxy_url)
-        if scopes is not None:
-            pulumi.set(__self__, "scopes", scopes)
-        if tls_config is not None:
-            pulumi.set(__self__, "tls_config", tls_config)
-        if token_url is not None:
-            pulumi.set(__self__, "token_url", token_url)
-
-    @_builtins.property
-    @pulumi.getter(name="clientId")
-    def client_id(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdArgs']]:
-        return pulumi.get(self, "client_id")
-
-    @client_id.setter
-    def client_id(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientIdArgs']]):
-        pulumi.set(self, "client_id", value)
-
-    @_builtins.property
-    @pulumi.getter(name="clientSecret")
-    def client_secret(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretArgs']]:
-        return pulumi.get(self, "client_secret")
-
-    @client_secret.setter
-    def client_secret(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretArgs']]):
-        pulumi.set(self, "client_secret", value)
-
-    @_builtins.property
-    @pulumi.getter(name="endpointParams")
-    def endpoint_params(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        endpointParams configures the HTTP parameters to append to the token
-        URL.
-        """
-        return pulumi.get(self, "endpoint_params")
-
-    @endpoint_params.setter
-    def endpoint_params(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "endpoint_params", value)
-
-    @_builtins.property
-    @pulumi.getter(name="noProxy")
-    def no_proxy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-        that should be excluded from proxying. IP and domain names can
-        contain port numbers.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "no_proxy")
-
-    @no_proxy.setter
-    def no_proxy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "no_proxy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyConnectHeader")
-    def proxy_connect_header(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs']]]]]]:
-        """
-        proxyConnectHeader optionally specifies headers to send to
-        proxies during CONNECT requests.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_connect_header")
-
-    @proxy_connect_header.setter
-    def proxy_connect_header(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs']]]]]]):
-        pulumi.set(self, "proxy_connect_header", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyFromEnvironment")
-    def proxy_from_environment(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_from_environment")
-
-    @proxy_from_environment.setter
-    def proxy_from_environment(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "proxy_from_environment", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyUrl")
-    def proxy_url(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        proxyUrl defines the HTTP proxy server to use.
-        """
-        return pulumi.get(self, "proxy_url")
-
-    @proxy_url.setter
-    def proxy_url(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "proxy_url", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def scopes(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        scopes defines the OAuth2 scopes used for the token request.
-        """
-        return pulumi.get(self, "scopes")
-
-    @scopes.setter
-    def scopes(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "scopes", value)
-
-    @_builtins.property
-    @pulumi.getter(name="tlsConfig")
-    def tls_config(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigArgs']]:
-        return pulumi.get(self, "tls_config")
-
-    @tls_config.setter
-    def tls_config(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigArgs']]):
-        pulumi.set(self, "tls_config", value)
-
-    @_builtins.property
-    @pulumi.getter(name="tokenUrl")
-    def token_url(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        tokenUrl defines the URL to fetch the token from.
-        """
-        return pulumi.get(self, "token_url")
-
-    @token_url.setter
-    def token_url(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "token_url", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsPatchArgsDict(TypedDict):
-    """
-    PodMetricsEndpoint defines an endpoint serving Prometheus metrics to be scraped by
-    Prometheus.
-    """
-    authorization: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsAuthorizationPatchArgs']]]
-    basic_auth: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthPatchArgs']]]
-    bearer_token_secret: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatchArgs']]]
-    enable_http2: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    enableHttp2 can be used to disable HTTP2.
-    """
-    filter_running: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    filterRunning when true, the pods which are not running (e.g. either in Failed or
-    Succeeded state) are dropped during the target discovery.
-
-    If unset, the filtering is enabled.
-
-    More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-    """
-    follow_redirects: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    followRedirects defines whether the client should follow HTTP 3xx
-    redirects.
-    """
-    honor_labels: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    honorLabels when true preserves the metric's labels when they collide
-    with the target's labels.
-    """
-    honor_timestamps: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    honorTimestamps defines whether Prometheus preserves the timestamps
-    when exposed by the target.
-    """
-    interval: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    interval at which Prometheus scrapes the metrics from the target.
-
-    If empty, Prometheus uses the global scrape interval.
-    """
-    metric_relabelings: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgs']]]]]
-    """
-    metricRelabelings defines the relabeling rules to apply to the
-    samples before ingestion.
-    """
-    no_proxy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-    that should be excluded from proxying. IP and domain names can
-    contain port numbers.
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    oauth2: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2PatchArgs']]]
-    params: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]]]
-    """
-    params define optional HTTP URL parameters.
-    """
-    path: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    path defines the HTTP path from which to scrape for metrics.
-
-    If empty, Prometheus uses the default value (e.g. `/metrics`).
-    """
-    port: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    port defines the `Pod` port name which exposes the endpoint.
-
-    If the pod doesn't expose a port with the same name, it will result
-    in no targets being discovered.
-
-    If a `Pod` has multiple `Port`s with the same name (which is not
-    recommended), one target instance per unique port number will be
-    generated.
-
-    It takes precedence over the `portNumber` and `targetPort` fields.
-    """
-    port_number: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    portNumber defines the `Pod` port number which exposes the endpoint.
-
-    The `Pod` must declare the specified `Port` in its spec or the
-    target will be dropped by Prometheus.
-
-    This cannot be used to enable scraping of an undeclared port.
-    To scrape targets on a port which isn't exposed, you need to use
-    relabeling to override the `__address__` label (but beware of
-    duplicate targets if the `Pod` has other declared ports).
-
-    In practice Prometheus will select targets for which the
-    matches the target's __meta_kubernetes_pod_container_port_number.
-    """
-    proxy_connect_header: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs']]]]]]]
-    """
-    proxyConnectHeader optionally specifies headers to send to
-    proxies during CONNECT requests.
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_from_environment: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_url: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    proxyUrl defines the HTTP proxy server to use.
-    """
-    relabelings: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgs']]]]]
-    """
-    relabelings defines the relabeling rules to apply the target's
-    metadata labels.
-
-    The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-    The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    scheme: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    scheme defines the HTTP scheme to use for scraping.
-    """
-    scrape_timeout: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-    If empty, Prometheus uses the global scrape timeout unless it is less
-    than the target's scrape interval value in which the latter is used.
-    The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-    """
-    target_port: NotRequired[pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]]
-    """
-    targetPort defines the name or number of the target port of the `Pod` object behind the Service, the
-    port must be specified with container port property.
-
-    Deprecated: use 'port' or 'portNumber' instead.
-    """
-    tls_config: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigPatchArgs']]]
-    track_timestamps_staleness: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    trackTimestampsStaleness defines whether Prometheus tracks staleness of
-    the metrics that have an explicit timestamp present in scraped data.
-    Has no effect if `honorTimestamps` is false.
-
-    It requires Prometheus >= v2.48.0.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsPatchArgs:
-    def __init__(__self__, *,
-                 authorization: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsAuthorizationPatchArgs']] = None,
-                 basic_auth: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthPatchArgs']] = None,
-                 bearer_token_secret: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatchArgs']] = None,
-                 enable_http2: pulumi.Input[Optional[_builtins.bool]] = None,
-                 filter_running: pulumi.Input[Optional[_builtins.bool]] = None,
-                 follow_redirects: pulumi.Input[Optional[_builtins.bool]] = None,
-                 honor_labels: pulumi.Input[Optional[_builtins.bool]] = None,
-                 honor_timestamps: pulumi.Input[Optional[_builtins.bool]] = None,
-                 interval: pulumi.Input[Optional[_builtins.str]] = None,
-                 metric_relabelings: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgs']]]] = None,
-                 no_proxy: pulumi.Input[Optional[_builtins.str]] = None,
-                 oauth2: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2PatchArgs']] = None,
-                 params: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]] = None,
-                 path: pulumi.Input[Optional[_builtins.str]] = None,
-                 port: pulumi.Input[Optional[_builtins.str]] = None,
-                 port_number: pulumi.Input[Optional[_builtins.int]] = None,
-                 proxy_connect_header: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs']]]]]] = None,
-                 proxy_from_environment: pulumi.Input[Optional[_builtins.bool]] = None,
-                 proxy_url: pulumi.Input[Optional[_builtins.str]] = None,
-                 relabelings: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgs']]]] = None,
-                 scheme: pulumi.Input[Optional[_builtins.str]] = None,
-                 scrape_timeout: pulumi.Input[Optional[_builtins.str]] = None,
-                 target_port: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]] = None,
-                 tls_config: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigPatchArgs']] = None,
-                 track_timestamps_staleness: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        PodMetricsEndpoint defines an endpoint serving Prometheus metrics to be scraped by
-        Prometheus.
-
-        :param pulumi.Input[_builtins.bool] enable_http2: enableHttp2 can be used to disable HTTP2.
-        :param pulumi.Input[_builtins.bool] filter_running: filterRunning when true, the pods which are not running (e.g. either in Failed or
-               Succeeded state) are dropped during the target discovery.
-
-               If unset, the filtering is enabled.
-
-               More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-        :param pulumi.Input[_builtins.bool] follow_redirects: followRedirects defines whether the client should follow HTTP 3xx
-               redirects.
-        :param pulumi.Input[_builtins.bool] honor_labels: honorLabels when true preserves the metric's labels when they collide
-               with the target's labels.
-        :param pulumi.Input[_builtins.bool] honor_timestamps: honorTimestamps defines whether Prometheus preserves the timestamps
-               when exposed by the target.
-        :param pulumi.Input[_builtins.str] interval: interval at which Prometheus scrapes the metrics from the target.
-
-               If empty, Prometheus uses the global scrape interval.
-        :param pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgs']]] metric_relabelings: metricRelabelings defines the relabeling rules to apply to the
-               samples before ingestion.
-        :param pulumi.Input[_builtins.str] no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-               that should be excluded from proxying. IP and domain names can
-               contain port numbers.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]] params: params define optional HTTP URL parameters.
-        :param pulumi.Input[_builtins.str] path: path defines the HTTP path from which to scrape for metrics.
-
-               If empty, Prometheus uses the default value (e.g. `/metrics`).
-        :param pulumi.Input[_builtins.str] port: port defines the `Pod` port name which exposes the endpoint.
-
-               If the pod doesn't expose a port with the same name, it will result
-               in no targets being discovered.
-
-               If a `Pod` has multiple `Port`s with the same name (which is not
-               recommended), one target instance per unique port number will be
-               generated.
-
-               It takes precedence over the `portNumber` and `targetPort` fields.
-        :param pulumi.Input[_builtins.int] port_number: portNumber defines the `Pod` port number which exposes the endpoint.
-
-               The `Pod` must declare the specified `Port` in its spec or the
-               target will be dropped by Prometheus.
-
-               This cannot be used to enable scraping of an undeclared port.
-               To scrape targets on a port which isn't exposed, you need to use
-               relabeling to override the `__address__` label (but beware of
-               duplicate targets if the `Pod` has other declared ports).
-
-               In practice Prometheus will select targets for which the
-               matches the target's __meta_kubernetes_pod_container_port_number.
-        :param pulumi.Input[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs']]]]] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
-               proxies during CONNECT requests.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[_builtins.bool] proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[_builtins.str] proxy_url: proxyUrl defines the HTTP proxy server to use.
-        :param pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgs']]] relabelings: relabelings defines the relabeling rules to apply the target's
-               metadata labels.
-
-               The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-               The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-               More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-        :param pulumi.Input[_builtins.str] scheme: scheme defines the HTTP scheme to use for scraping.
-        :param pulumi.Input[_builtins.str] scrape_timeout: scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-               If empty, Prometheus uses the global scrape timeout unless it is less
-               than the target's scrape interval value in which the latter is used.
-               The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-        :param pulumi.Input[Union[_builtins.int, _builtins.str]] target_port: targetPort defines the name or number of the target port of the `Pod` object behind the Service, the
-               port must be specified with container port property.
-
-               Deprecated: use 'port' or 'portNumber' instead.
-        :param pulumi.Input[_builtins.bool] track_timestamps_staleness: trackTimestampsStaleness defines whether Prometheus tracks staleness of
-               the metrics that have an explicit timestamp present in scraped data.
-               Has no effect if `honorTimestamps` is false.
-
-               It requires Prometheus >= v2.48.0.
-        """
-        if authorization is not None:
-            pulumi.set(__self__, "authorization", authorization)
-        if basic_auth is not None:
-            pulumi.set(__self__, "basic_auth", basic_auth)
-        if bearer_token_secret is not None:
-            pulumi.set(__self__, "bearer_token_secret", bearer_token_secret)
-        if enable_http2 is not None:
-            pulumi.set(__self__, "enable_http2", enable_http2)
-        if filter_running is not None:
-            pulumi.set(__self__, "filter_running", filter_running)
-        if follow_redirects is not None:
-            pulumi.set(__self__, "follow_redirects", follow_redirects)
-        if honor_labels is not None:
-            pulumi.set(__self__, "honor_labels", honor_labels)
-        if honor_timestamps is not None:
-            pulumi.set(__self__, "honor_timestamps", honor_timestamps)
-        if interval is not None:
-            pulumi.set(__self__, "interval", interval)
-        if metric_relabelings is not None:
-            pulumi.set(__self__, "metric_relabelings", metric_relabelings)
-        if no_proxy is not None:
-            pulumi.set(__self__, "no_proxy", no_proxy)
-        if oauth2 is not None:
-            pulumi.set(__self__, "oauth2", oauth2)
-        if params is not None:
-            pulumi.set(__self__, "params", params)
-        if path is not None:
-            pulumi.set(__self__, "path", path)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if port_number is not None:
-            pulumi.set(__self__, "port_number", port_number)
-        if proxy_connect_header is not None:
-            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
-        if proxy_from_environment is not None:
-            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
-        if proxy_url is not None:
-            pulumi.set(__self__, "proxy_url", proxy_url)
-        if relabelings is not None:
-            pulumi.set(__self__, "relabelings", relabelings)
-        if scheme is not None:
-            pulumi.set(__self__, "scheme", scheme)
-        if scrape_timeout is not None:
-            pulumi.set(__self__, "scrape_timeout", scrape_timeout)
-        if target_port is not None:
-            pulumi.set(__self__, "target_port", target_port)
-        if tls_config is not None:
-            pulumi.set(__self__, "tls_config", tls_config)
-        if track_timestamps_staleness is not None:
-            pulumi.set(__self__, "track_timestamps_staleness", track_timestamps_staleness)
-
-    @_builtins.property
-    @pulumi.getter
-    def authorization(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsAuthorizationPatchArgs']]:
-        return pulumi.get(self, "authorization")
-
-    @authorization.setter
-    def authorization(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsAuthorizationPatchArgs']]):
-        pulumi.set(self, "authorization", value)
-
-    @_builtins.property
-    @pulumi.getter(name="basicAuth")
-    def basic_auth(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthPatchArgs']]:
-        return pulumi.get(self, "basic_auth")
-
-    @basic_auth.setter
-    def basic_auth(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthPatchArgs']]):
-        pulumi.set(self, "basic_auth", value)
-
-    @_builtins.property
-    @pulumi.getter(name="bearerTokenSecret")
-    def bearer_token_secret(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatchArgs']]:
-        return pulumi.get(self, "bearer_token_secret")
-
-    @bearer_token_secret.setter
-    def bearer_token_secret(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatchArgs']]):
-        pulumi.set(self, "bearer_token_secret", value)
-
-    @_builtins.property
-    @pulumi.getter(name="enableHttp2")
-    def enable_http2(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        enableHttp2 can be used to disable HTTP2.
-        """
-        return pulumi.get(self, "enable_http2")
-
-    @enable_http2.setter
-    def enable_http2(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "enable_http2", value)
-
-    @_builtins.property
-    @pulumi.getter(name="filterRunning")
-    def filter_running(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        filterRunning when true, the pods which are not running (e.g. either in Failed or
-        Succeeded state) are dropped during the target discovery.
-
-        If unset, the filtering is enabled.
-
-        More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-        """
-        return pulumi.get(self, "filter_running")
-
-    @filter_running.setter
-    def filter_running(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "filter_running", value)
-
-    @_builtins.property
-    @pulumi.getter(name="followRedirects")
-    def follow_redirects(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        followRedirects defines whether the client should follow HTTP 3xx
-        redirects.
-        """
-        return pulumi.get(self, "follow_redirects")
-
-    @follow_redirects.setter
-    def follow_redirects(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "follow_redirects", value)
-
-    @_builtins.property
-    @pulumi.getter(name="honorLabels")
-    def honor_labels(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        honorLabels when true preserves the metric's labels when they collide
-        with the target's labels.
-        """
-        return pulumi.get(self, "honor_labels")
-
-    @honor_labels.setter
-    def honor_labels(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "honor_labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="honorTimestamps")
-    def honor_timestamps(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        honorTimestamps defines whether Prometheus preserves the timestamps
-        when exposed by the target.
-        """
-        return pulumi.get(self, "honor_timestamps")
-
-    @honor_timestamps.setter
-    def honor_timestamps(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "honor_timestamps", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def interval(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        interval at which Prometheus scrapes the metrics from the target.
-
-        If empty, Prometheus uses the global scrape interval.
-        """
-        return pulumi.get(self, "interval")
-
-    @interval.setter
-    def interval(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "interval", value)
-
-    @_builtins.property
-    @pulumi.getter(name="metricRelabelings")
-    def metric_relabelings(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgs']]]]:
-        """
-        metricRelabelings defines the relabeling rules to apply to the
-        samples before ingestion.
-        """
-        return pulumi.get(self, "metric_relabelings")
-
-    @metric_relabelings.setter
-    def metric_relabelings(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgs']]]]):
-        pulumi.set(self, "metric_relabelings", value)
-
-    @_builtins.property
-    @pulumi.getter(name="noProxy")
-    def no_proxy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-        that should be excluded from proxying. IP and domain names can
-        contain port numbers.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "no_proxy")
-
-    @no_proxy.setter
-    def no_proxy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "no_proxy", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def oauth2(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2PatchArgs']]:
-        return pulumi.get(self, "oauth2")
-
-    @oauth2.setter
-    def oauth2(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2PatchArgs']]):
-        pulumi.set(self, "oauth2", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def params(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]]:
-        """
-        params define optional HTTP URL parameters.
-        """
-        return pulumi.get(self, "params")
-
-    @params.setter
-    def params(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]]):
-        pulumi.set(self, "params", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def path(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        path defines the HTTP path from which to scrape for metrics.
-
-        If empty, Prometheus uses the default value (e.g. `/metrics`).
-        """
-        return pulumi.get(self, "path")
-
-    @path.setter
-    def path(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "path", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        port defines the `Pod` port name which exposes the endpoint.
-
-        If the pod doesn't expose a port with the same name, it will result
-        in no targets being discovered.
-
-        If a `Pod` has multiple `Port`s with the same name (which is not
-        recommended), one target instance per unique port number will be
-        generated.
-
-        It takes precedence over the `portNumber` and `targetPort` fields.
-        """
-        return pulumi.get(self, "port")
-
-    @port.setter
-    def port(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "port", value)
-
-    @_builtins.property
-    @pulumi.getter(name="portNumber")
-    def port_number(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        portNumber defines the `Pod` port number which exposes the endpoint.
-
-        The `Pod` must declare the specified `Port` in its spec or the
-        target will be dropped by Prometheus.
-
-        This cannot be used to enable scraping of an undeclared port.
-        To scrape targets on a port which isn't exposed, you need to use
-        relabeling to override the `__address__` label (but beware of
-        duplicate targets if the `Pod` has other declared ports).
-
-        In practice Prometheus will select targets for which the
-        matches the target's __meta_kubernetes_pod_container_port_number.
-        """
-        return pulumi.get(self, "port_number")
-
-    @port_number.setter
-    def port_number(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "port_number", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyConnectHeader")
-    def proxy_connect_header(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs']]]]]]:
-        """
-        proxyConnectHeader optionally specifies headers to send to
-        proxies during CONNECT requests.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_connect_header")
-
-    @proxy_connect_header.setter
-    def proxy_connect_header(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs']]]]]]):
-        pulumi.set(self, "proxy_connect_header", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyFromEnvironment")
-    def proxy_from_environment(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_from_environment")
-
-    @proxy_from_environment.setter
-    def proxy_from_environment(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "proxy_from_environment", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyUrl")
-    def proxy_url(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        proxyUrl defines the HTTP proxy server to use.
-        """
-        return pulumi.get(self, "proxy_url")
-
-    @proxy_url.setter
-    def proxy_url(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "proxy_url", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def relabelings(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgs']]]]:
-        """
-        relabelings defines the relabeling rules to apply the target's
-        metadata labels.
-
-        The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-        The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-        """
-        return pulumi.get(self, "relabelings")
-
-    @relabelings.setter
-    def relabelings(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgs']]]]):
-        pulumi.set(self, "relabelings", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def scheme(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        scheme defines the HTTP scheme to use for scraping.
-        """
-        return pulumi.get(self, "scheme")
-
-    @scheme.setter
-    def scheme(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "scheme", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeTimeout")
-    def scrape_timeout(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-        If empty, Prometheus uses the global scrape timeout unless it is less
-        than the target's scrape interval value in which the latter is used.
-        The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-        """
-        return pulumi.get(self, "scrape_timeout")
-
-    @scrape_timeout.setter
-    def scrape_timeout(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "scrape_timeout", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetPort")
-    def target_port(self) -> pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]:
-        """
-        targetPort defines the name or number of the target port of the `Pod` object behind the Service, the
-        port must be specified with container port property.
-
-        Deprecated: use 'port' or 'portNumber' instead.
-        """
-        return pulumi.get(self, "target_port")
-
-    @target_port.setter
-    def target_port(self, value: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]):
-        pulumi.set(self, "target_port", value)
-
-    @_builtins.property
-    @pulumi.getter(name="tlsConfig")
-    def tls_config(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigPatchArgs']]:
-        return pulumi.get(self, "tls_config")
-
-    @tls_config.setter
-    def tls_config(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigPatchArgs']]):
-        pulumi.set(self, "tls_config", value)
-
-    @_builtins.property
-    @pulumi.getter(name="trackTimestampsStaleness")
-    def track_timestamps_staleness(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        trackTimestampsStaleness defines whether Prometheus tracks staleness of
-        the metrics that have an explicit timestamp present in scraped data.
-        Has no effect if `honorTimestamps` is false.
-
-        It requires Prometheus >= v2.48.0.
-        """
-        return pulumi.get(self, "track_timestamps_staleness")
-
-    @track_timestamps_staleness.setter
-    def track_timestamps_staleness(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "track_timestamps_staleness", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgsDict(TypedDict):
-    """
-    SecretKeySelector selects a key of a Secret.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        SecretKeySelector selects a key of a Secret.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgsDict(TypedDict):
-    """
-    RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-    scraped samples and remote write samples.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    action: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    action to perform based on the regex matching.
-
-    `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-    `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-    Default: "Replace"
-    """
-    modulus: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    modulus to take of the hash of the source label values.
-
-    Only applicable when the action is `HashMod`.
-    """
-    regex: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    regex defines the regular expression against which the extracted value is matched.
-    """
-    replacement: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    replacement value against which a Replace action is performed if the
-    regular expression matches.
-
-    Regex capture groups are available.
-    """
-    separator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    separator defines the string between concatenated SourceLabels.
-    """
-    source_labels: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    sourceLabels defines the source labels select values from existing labels. Their content is
-    concatenated using the configured Separator and matched against the
-    configured regular expression.
-    """
-    target_label: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    targetLabel defines the label to which the resulting string is written in a replacement.
-
-    It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-    `KeepEqual` and `DropEqual` actions.
-
-    Regex capture groups are available.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgs:
-    def __init__(__self__, *,
-                 action: pulumi.Input[Optional[_builtins.str]] = None,
-                 modulus: pulumi.Input[Optional[_builtins.int]] = None,
-                 regex: pulumi.Input[Optional[_builtins.str]] = None,
-                 replacement: pulumi.Input[Optional[_builtins.str]] = None,
-                 separator: pulumi.Input[Optional[_builtins.str]] = None,
-                 source_labels: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 target_label: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-        scraped samples and remote write samples.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-
-        :param pulumi.Input[_builtins.str] action: action to perform based on the regex matching.
-
-               `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-               `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-               Default: "Replace"
-        :param pulumi.Input[_builtins.int] modulus: modulus to take of the hash of the source label values.
-
-               Only applicable when the action is `HashMod`.
-        :param pulumi.Input[_builtins.str] regex: regex defines the regular expression against which the extracted value is matched.
-        :param pulumi.Input[_builtins.str] replacement: replacement value against which a Replace action is performed if the
-               regular expression matches.
-
-               Regex capture groups are available.
-        :param pulumi.Input[_builtins.str] separator: separator defines the string between concatenated SourceLabels.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] source_labels: sourceLabels defines the source labels select values from existing labels. Their content is
-               concatenated using the configured Separator and matched against the
-               configured regular expression.
-        :param pulumi.Input[_builtins.str] target_label: targetLabel defines the label to which the resulting string is written in a replacement.
-
-               It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-               `KeepEqual` and `DropEqual` actions.
-
-               Regex capture groups are available.
-        """
-        if action is not None:
-            pulumi.set(__self__, "action", action)
-        if modulus is not None:
-            pulumi.set(__self__, "modulus", modulus)
-        if regex is not None:
-            pulumi.set(__self__, "regex", regex)
-        if replacement is not None:
-            pulumi.set(__self__, "replacement", replacement)
-        if separator is not None:
-            pulumi.set(__self__, "separator", separator)
-        if source_labels is not None:
-            pulumi.set(__self__, "source_labels", source_labels)
-        if target_label is not None:
-            pulumi.set(__self__, "target_label", target_label)
-
-    @_builtins.property
-    @pulumi.getter
-    def action(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        action to perform based on the regex matching.
-
-        `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-        `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-        Default: "Replace"
-        """
-        return pulumi.get(self, "action")
-
-    @action.setter
-    def action(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "action", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def modulus(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        modulus to take of the hash of the source label values.
-
-        Only applicable when the action is `HashMod`.
-        """
-        return pulumi.get(self, "modulus")
-
-    @modulus.setter
-    def modulus(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "modulus", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def regex(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        regex defines the regular expression against which the extracted value is matched.
-        """
-        return pulumi.get(self, "regex")
-
-    @regex.setter
-    def regex(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "regex", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def replacement(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        replacement value against which a Replace action is performed if the
-        regular expression matches.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "replacement")
-
-    @replacement.setter
-    def replacement(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "replacement", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def separator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        separator defines the string between concatenated SourceLabels.
-        """
-        return pulumi.get(self, "separator")
-
-    @separator.setter
-    def separator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "separator", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sourceLabels")
-    def source_labels(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        sourceLabels defines the source labels select values from existing labels. Their content is
-        concatenated using the configured Separator and matched against the
-        configured regular expression.
-        """
-        return pulumi.get(self, "source_labels")
-
-    @source_labels.setter
-    def source_labels(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "source_labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabel")
-    def target_label(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        targetLabel defines the label to which the resulting string is written in a replacement.
-
-        It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-        `KeepEqual` and `DropEqual` actions.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "target_label")
-
-    @target_label.setter
-    def target_label(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "target_label", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsRelabelingsArgsDict(TypedDict):
-    """
-    RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-    scraped samples and remote write samples.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    action: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    action to perform based on the regex matching.
-
-    `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-    `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-    Default: "Replace"
-    """
-    modulus: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    modulus to take of the hash of the source label values.
-
-    Only applicable when the action is `HashMod`.
-    """
-    regex: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    regex defines the regular expression against which the extracted value is matched.
-    """
-    replacement: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    replacement value against which a Replace action is performed if the
-    regular expression matches.
-
-    Regex capture groups are available.
-    """
-    separator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    separator defines the string between concatenated SourceLabels.
-    """
-    source_labels: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    sourceLabels defines the source labels select values from existing labels. Their content is
-    concatenated using the configured Separator and matched against the
-    configured regular expression.
-    """
-    target_label: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    targetLabel defines the label to which the resulting string is written in a replacement.
-
-    It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-    `KeepEqual` and `DropEqual` actions.
-
-    Regex capture groups are available.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsRelabelingsArgs:
-    def __init__(__self__, *,
-                 action: pulumi.Input[Optional[_builtins.str]] = None,
-                 modulus: pulumi.Input[Optional[_builtins.int]] = None,
-                 regex: pulumi.Input[Optional[_builtins.str]] = None,
-                 replacement: pulumi.Input[Optional[_builtins.str]] = None,
-                 separator: pulumi.Input[Optional[_builtins.str]] = None,
-                 source_labels: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 target_label: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-        scraped samples and remote write samples.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-
-        :param pulumi.Input[_builtins.str] action: action to perform based on the regex matching.
-
-               `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-               `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-               Default: "Replace"
-        :param pulumi.Input[_builtins.int] modulus: modulus to take of the hash of the source label values.
-
-               Only applicable when the action is `HashMod`.
-        :param pulumi.Input[_builtins.str] regex: regex defines the regular expression against which the extracted value is matched.
-        :param pulumi.Input[_builtins.str] replacement: replacement value against which a Replace action is performed if the
-               regular expression matches.
-
-               Regex capture groups are available.
-        :param pulumi.Input[_builtins.str] separator: separator defines the string between concatenated SourceLabels.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] source_labels: sourceLabels defines the source labels select values from existing labels. Their content is
-               concatenated using the configured Separator and matched against the
-               configured regular expression.
-        :param pulumi.Input[_builtins.str] target_label: targetLabel defines the label to which the resulting string is written in a replacement.
-
-               It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-               `KeepEqual` and `DropEqual` actions.
-
-               Regex capture groups are available.
-        """
-        if action is not None:
-            pulumi.set(__self__, "action", action)
-        if modulus is not None:
-            pulumi.set(__self__, "modulus", modulus)
-        if regex is not None:
-            pulumi.set(__self__, "regex", regex)
-        if replacement is not None:
-            pulumi.set(__self__, "replacement", replacement)
-        if separator is not None:
-            pulumi.set(__self__, "separator", separator)
-        if source_labels is not None:
-            pulumi.set(__self__, "source_labels", source_labels)
-        if target_label is not None:
-            pulumi.set(__self__, "target_label", target_label)
-
-    @_builtins.property
-    @pulumi.getter
-    def action(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        action to perform based on the regex matching.
-
-        `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-        `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-        Default: "Replace"
-        """
-        return pulumi.get(self, "action")
-
-    @action.setter
-    def action(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "action", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def modulus(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        modulus to take of the hash of the source label values.
-
-        Only applicable when the action is `HashMod`.
-        """
-        return pulumi.get(self, "modulus")
-
-    @modulus.setter
-    def modulus(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "modulus", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def regex(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        regex defines the regular expression against which the extracted value is matched.
-        """
-        return pulumi.get(self, "regex")
-
-    @regex.setter
-    def regex(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "regex", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def replacement(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        replacement value against which a Replace action is performed if the
-        regular expression matches.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "replacement")
-
-    @replacement.setter
-    def replacement(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "replacement", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def separator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        separator defines the string between concatenated SourceLabels.
-        """
-        return pulumi.get(self, "separator")
-
-    @separator.setter
-    def separator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "separator", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sourceLabels")
-    def source_labels(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        sourceLabels defines the source labels select values from existing labels. Their content is
-        concatenated using the configured Separator and matched against the
-        configured regular expression.
-        """
-        return pulumi.get(self, "source_labels")
-
-    @source_labels.setter
-    def source_labels(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "source_labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabel")
-    def target_label(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        targetLabel defines the label to which the resulting string is written in a replacement.
-
-        It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-        `KeepEqual` and `DropEqual` actions.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "target_label")
-
-    @target_label.setter
-    def target_label(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "target_label", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatchArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatchArgsDict(TypedDict):
-    """
-    ca defines the Certificate authority used when verifying server certificates.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatchArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatchArgs']]]
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatchArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatchArgs']] = None,
-                 secret: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatchArgs']] = None):
-        """
-        ca defines the Certificate authority used when verifying server certificates.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatchArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatchArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatchArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatchArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatchArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgsDict(TypedDict):
-    """
-    ca defines the Certificate authority used when verifying server certificates.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretArgs']]]
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapArgs']] = None,
-                 secret: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretArgs']] = None):
-        """
-        ca defines the Certificate authority used when verifying server certificates.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatchArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatchArgsDict(TypedDict):
-    """
-    cert defines the Client certificate to present when doing client-authentication.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatchArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatchArgs']]]
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatchArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatchArgs']] = None,
-                 secret: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatchArgs']] = None):
-        """
-        cert defines the Client certificate to present when doing client-authentication.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatchArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatchArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatchArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatchArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatchArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgsDict(TypedDict):
-    """
-    cert defines the Client certificate to present when doing client-authentication.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretArgs']]]
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapArgs']] = None,
-                 secret: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretArgs']] = None):
-        """
-        cert defines the Client certificate to present when doing client-authentication.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatchArgsDict(TypedDict):
-    """
-    keySecret defines the Secret containing the client key file for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        keySecret defines the Secret containing the client key file for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgsDict(TypedDict):
-    """
-    keySecret defines the Secret containing the client key file for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        keySecret defines the Secret containing the client key file for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsTlsConfigPatchArgsDict(TypedDict):
-    """
-    tlsConfig defines the TLS configuration used by the client.
-    """
-    ca: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatchArgs']]]
-    cert: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatchArgs']]]
-    insecure_skip_verify: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    insecureSkipVerify defines how to disable target certificate validation.
-    """
-    key_secret: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatchArgs']]]
-    max_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    maxVersion defines the maximum acceptable TLS version.
-
-    It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-    """
-    min_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    minVersion defines the minimum acceptable TLS version.
-
-    It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-    """
-    server_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    serverName is used to verify the hostname for the targets.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigPatchArgs:
-    def __init__(__self__, *,
-                 ca: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatchArgs']] = None,
-                 cert: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatchArgs']] = None,
-                 insecure_skip_verify: pulumi.Input[Optional[_builtins.bool]] = None,
-                 key_secret: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatchArgs']] = None,
-                 max_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 min_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 server_name: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        tlsConfig defines the TLS configuration used by the client.
-
-        :param pulumi.Input[_builtins.bool] insecure_skip_verify: insecureSkipVerify defines how to disable target certificate validation.
-        :param pulumi.Input[_builtins.str] max_version: maxVersion defines the maximum acceptable TLS version.
-
-               It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        :param pulumi.Input[_builtins.str] min_version: minVersion defines the minimum acceptable TLS version.
-
-               It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        :param pulumi.Input[_builtins.str] server_name: serverName is used to verify the hostname for the targets.
-        """
-        if ca is not None:
-            pulumi.set(__self__, "ca", ca)
-        if cert is not None:
-            pulumi.set(__self__, "cert", cert)
-        if insecure_skip_verify is not None:
-            pulumi.set(__self__, "insecure_skip_verify", insecure_skip_verify)
-        if key_secret is not None:
-            pulumi.set(__self__, "key_secret", key_secret)
-        if max_version is not None:
-            pulumi.set(__self__, "max_version", max_version)
-        if min_version is not None:
-            pulumi.set(__self__, "min_version", min_version)
-        if server_name is not None:
-            pulumi.set(__self__, "server_name", server_name)
-
-    @_builtins.property
-    @pulumi.getter
-    def ca(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatchArgs']]:
-        return pulumi.get(self, "ca")
-
-    @ca.setter
-    def ca(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatchArgs']]):
-        pulumi.set(self, "ca", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def cert(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatchArgs']]:
-        return pulumi.get(self, "cert")
-
-    @cert.setter
-    def cert(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatchArgs']]):
-        pulumi.set(self, "cert", value)
-
-    @_builtins.property
-    @pulumi.getter(name="insecureSkipVerify")
-    def insecure_skip_verify(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        insecureSkipVerify defines how to disable target certificate validation.
-        """
-        return pulumi.get(self, "insecure_skip_verify")
-
-    @insecure_skip_verify.setter
-    def insecure_skip_verify(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "insecure_skip_verify", value)
-
-    @_builtins.property
-    @pulumi.getter(name="keySecret")
-    def key_secret(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatchArgs']]:
-        return pulumi.get(self, "key_secret")
-
-    @key_secret.setter
-    def key_secret(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatchArgs']]):
-        pulumi.set(self, "key_secret", value)
-
-    @_builtins.property
-    @pulumi.getter(name="maxVersion")
-    def max_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        maxVersion defines the maximum acceptable TLS version.
-
-        It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        """
-        return pulumi.get(self, "max_version")
-
-    @max_version.setter
-    def max_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "max_version", value)
-
-    @_builtins.property
-    @pulumi.getter(name="minVersion")
-    def min_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        minVersion defines the minimum acceptable TLS version.
-
-        It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        """
-        return pulumi.get(self, "min_version")
-
-    @min_version.setter
-    def min_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "min_version", value)
-
-    @_builtins.property
-    @pulumi.getter(name="serverName")
-    def server_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        serverName is used to verify the hostname for the targets.
-        """
-        return pulumi.get(self, "server_name")
-
-    @server_name.setter
-    def server_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "server_name", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsTlsConfigArgsDict(TypedDict):
-    """
-    tlsConfig defines the TLS configuration used by the client.
-    """
-    ca: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgs']]]
-    cert: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgs']]]
-    insecure_skip_verify: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    insecureSkipVerify defines how to disable target certificate validation.
-    """
-    key_secret: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgs']]]
-    max_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    maxVersion defines the maximum acceptable TLS version.
-
-    It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-    """
-    min_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    minVersion defines the minimum acceptable TLS version.
-
-    It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-    """
-    server_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    serverName is used to verify the hostname for the targets.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigArgs:
-    def __init__(__self__, *,
-                 ca: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgs']] = None,
-                 cert: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgs']] = None,
-                 insecure_skip_verify: pulumi.Input[Optional[_builtins.bool]] = None,
-                 key_secret: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgs']] = None,
-                 max_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 min_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 server_name: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        tlsConfig defines the TLS configuration used by the client.
-
-        :param pulumi.Input[_builtins.bool] insecure_skip_verify: insecureSkipVerify defines how to disable target certificate validation.
-        :param pulumi.Input[_builtins.str] max_version: maxVersion defines the maximum acceptable TLS version.
-
-               It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        :param pulumi.Input[_builtins.str] min_version: minVersion defines the minimum acceptable TLS version.
-
-               It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        :param pulumi.Input[_builtins.str] server_name: serverName is used to verify the hostname for the targets.
-        """
-        if ca is not None:
-            pulumi.set(__self__, "ca", ca)
-        if cert is not None:
-            pulumi.set(__self__, "cert", cert)
-        if insecure_skip_verify is not None:
-            pulumi.set(__self__, "insecure_skip_verify", insecure_skip_verify)
-        if key_secret is not None:
-            pulumi.set(__self__, "key_secret", key_secret)
-        if max_version is not None:
-            pulumi.set(__self__, "max_version", max_version)
-        if min_version is not None:
-            pulumi.set(__self__, "min_version", min_version)
-        if server_name is not None:
-            pulumi.set(__self__, "server_name", server_name)
-
-    @_builtins.property
-    @pulumi.getter
-    def ca(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgs']]:
-        return pulumi.get(self, "ca")
-
-    @ca.setter
-    def ca(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgs']]):
-        pulumi.set(self, "ca", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def cert(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgs']]:
-        return pulumi.get(self, "cert")
-
-    @cert.setter
-    def cert(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgs']]):
-        pulumi.set(self, "cert", value)
-
-    @_builtins.property
-    @pulumi.getter(name="insecureSkipVerify")
-    def insecure_skip_verify(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        insecureSkipVerify defines how to disable target certificate validation.
-        """
-        return pulumi.get(self, "insecure_skip_verify")
-
-    @insecure_skip_verify.setter
-    def insecure_skip_verify(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "insecure_skip_verify", value)
-
-    @_builtins.property
-    @pulumi.getter(name="keySecret")
-    def key_secret(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgs']]:
-        return pulumi.get(self, "key_secret")
-
-    @key_secret.setter
-    def key_secret(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgs']]):
-        pulumi.set(self, "key_secret", value)
-
-    @_builtins.property
-    @pulumi.getter(name="maxVersion")
-    def max_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        maxVersion defines the maximum acceptable TLS version.
-
-        It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        """
-        return pulumi.get(self, "max_version")
-
-    @max_version.setter
-    def max_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "max_version", value)
-
-    @_builtins.property
-    @pulumi.getter(name="minVersion")
-    def min_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        minVersion defines the minimum acceptable TLS version.
-
-        It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        """
-        return pulumi.get(self, "min_version")
-
-    @min_version.setter
-    def min_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "min_version", value)
-
-    @_builtins.property
-    @pulumi.getter(name="serverName")
-    def server_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        serverName is used to verify the hostname for the targets.
-        """
-        return pulumi.get(self, "server_name")
-
-    @server_name.setter
-    def server_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "server_name", value)
-
-
-class PodMonitorSpecPodMetricsEndpointsArgsDict(TypedDict):
-    """
-    PodMetricsEndpoint defines an endpoint serving Prometheus metrics to be scraped by
-    Prometheus.
-    """
-    authorization: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsAuthorizationArgs']]]
-    basic_auth: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthArgs']]]
-    bearer_token_secret: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBearerTokenSecretArgs']]]
-    enable_http2: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    enableHttp2 can be used to disable HTTP2.
-    """
-    filter_running: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    filterRunning when true, the pods which are not running (e.g. either in Failed or
-    Succeeded state) are dropped during the target discovery.
-
-    If unset, the filtering is enabled.
-
-    More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-    """
-    follow_redirects: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    followRedirects defines whether the client should follow HTTP 3xx
-    redirects.
-    """
-    honor_labels: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    honorLabels when true preserves the metric's labels when they collide
-    with the target's labels.
-    """
-    honor_timestamps: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    honorTimestamps defines whether Prometheus preserves the timestamps
-    when exposed by the target.
-    """
-    interval: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    interval at which Prometheus scrapes the metrics from the target.
-
-    If empty, Prometheus uses the global scrape interval.
-    """
-    metric_relabelings: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgs']]]]]
-    """
-    metricRelabelings defines the relabeling rules to apply to the
-    samples before ingestion.
-    """
-    no_proxy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-    that should be excluded from proxying. IP and domain names can
-    contain port numbers.
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    oauth2: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2Args']]]
-    params: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]]]
-    """
-    params define optional HTTP URL parameters.
-    """
-    path: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    path defines the HTTP path from which to scrape for metrics.
-
-    If empty, Prometheus uses the default value (e.g. `/metrics`).
-    """
-    port: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    port defines the `Pod` port name which exposes the endpoint.
-
-    If the pod doesn't expose a port with the same name, it will result
-    in no targets being discovered.
-
-    If a `Pod` has multiple `Port`s with the same name (which is not
-    recommended), one target instance per unique port number will be
-    generated.
-
-    It takes precedence over the `portNumber` and `targetPort` fields.
-    """
-    port_number: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    portNumber defines the `Pod` port number which exposes the endpoint.
-
-    The `Pod` must declare the specified `Port` in its spec or the
-    target will be dropped by Prometheus.
-
-    This cannot be used to enable scraping of an undeclared port.
-    To scrape targets on a port which isn't exposed, you need to use
-    relabeling to override the `__address__` label (but beware of
-    duplicate targets if the `Pod` has other declared ports).
-
-    In practice Prometheus will select targets for which the
-    matches the target's __meta_kubernetes_pod_container_port_number.
-    """
-    proxy_connect_header: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs']]]]]]]
-    """
-    proxyConnectHeader optionally specifies headers to send to
-    proxies during CONNECT requests.
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_from_environment: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_url: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    proxyUrl defines the HTTP proxy server to use.
-    """
-    relabelings: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsRelabelingsArgs']]]]]
-    """
-    relabelings defines the relabeling rules to apply the target's
-    metadata labels.
-
-    The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-    The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    scheme: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    scheme defines the HTTP scheme to use for scraping.
-    """
-    scrape_timeout: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-    If empty, Prometheus uses the global scrape timeout unless it is less
-    than the target's scrape interval value in which the latter is used.
-    The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-    """
-    target_port: NotRequired[pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]]
-    """
-    targetPort defines the name or number of the target port of the `Pod` object behind the Service, the
-    port must be specified with container port property.
-
-    Deprecated: use 'port' or 'portNumber' instead.
-    """
-    tls_config: NotRequired[pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigArgs']]]
-    track_timestamps_staleness: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    trackTimestampsStaleness defines whether Prometheus tracks staleness of
-    the metrics that have an explicit timestamp present in scraped data.
-    Has no effect if `honorTimestamps` is false.
-
-    It requires Prometheus >= v2.48.0.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecPodMetricsEndpointsArgs:
-    def __init__(__self__, *,
-                 authorization: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsAuthorizationArgs']] = None,
-                 basic_auth: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthArgs']] = None,
-                 bearer_token_secret: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBearerTokenSecretArgs']] = None,
-                 enable_http2: pulumi.Input[Optional[_builtins.bool]] = None,
-                 filter_running: pulumi.Input[Optional[_builtins.bool]] = None,
-                 follow_redirects: pulumi.Input[Optional[_builtins.bool]] = None,
-                 honor_labels: pulumi.Input[Optional[_builtins.bool]] = None,
-                 honor_timestamps: pulumi.Input[Optional[_builtins.bool]] = None,
-                 interval: pulumi.Input[Optional[_builtins.str]] = None,
-                 metric_relabelings: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgs']]]] = None,
-                 no_proxy: pulumi.Input[Optional[_builtins.str]] = None,
-                 oauth2: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2Args']] = None,
-                 params: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]] = None,
-                 path: pulumi.Input[Optional[_builtins.str]] = None,
-                 port: pulumi.Input[Optional[_builtins.str]] = None,
-                 port_number: pulumi.Input[Optional[_builtins.int]] = None,
-                 proxy_connect_header: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs']]]]]] = None,
-                 proxy_from_environment: pulumi.Input[Optional[_builtins.bool]] = None,
-                 proxy_url: pulumi.Input[Optional[_builtins.str]] = None,
-                 relabelings: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsRelabelingsArgs']]]] = None,
-                 scheme: pulumi.Input[Optional[_builtins.str]] = None,
-                 scrape_timeout: pulumi.Input[Optional[_builtins.str]] = None,
-                 target_port: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]] = None,
-                 tls_config: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigArgs']] = None,
-                 track_timestamps_staleness: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        PodMetricsEndpoint defines an endpoint serving Prometheus metrics to be scraped by
-        Prometheus.
-
-        :param pulumi.Input[_builtins.bool] enable_http2: enableHttp2 can be used to disable HTTP2.
-        :param pulumi.Input[_builtins.bool] filter_running: filterRunning when true, the pods which are not running (e.g. either in Failed or
-               Succeeded state) are dropped during the target discovery.
-
-               If unset, the filtering is enabled.
-
-               More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-        :param pulumi.Input[_builtins.bool] follow_redirects: followRedirects defines whether the client should follow HTTP 3xx
-               redirects.
-        :param pulumi.Input[_builtins.bool] honor_labels: honorLabels when true preserves the metric's labels when they collide
-               with the target's labels.
-        :param pulumi.Input[_builtins.bool] honor_timestamps: honorTimestamps defines whether Prometheus preserves the timestamps
-               when exposed by the target.
-        :param pulumi.Input[_builtins.str] interval: interval at which Prometheus scrapes the metrics from the target.
-
-               If empty, Prometheus uses the global scrape interval.
-        :param pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgs']]] metric_relabelings: metricRelabelings defines the relabeling rules to apply to the
-               samples before ingestion.
-        :param pulumi.Input[_builtins.str] no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-               that should be excluded from proxying. IP and domain names can
-               contain port numbers.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]] params: params define optional HTTP URL parameters.
-        :param pulumi.Input[_builtins.str] path: path defines the HTTP path from which to scrape for metrics.
-
-               If empty, Prometheus uses the default value (e.g. `/metrics`).
-        :param pulumi.Input[_builtins.str] port: port defines the `Pod` port name which exposes the endpoint.
-
-               If the pod doesn't expose a port with the same name, it will result
-               in no targets being discovered.
-
-               If a `Pod` has multiple `Port`s with the same name (which is not
-               recommended), one target instance per unique port number will be
-               generated.
-
-               It takes precedence over the `portNumber` and `targetPort` fields.
-        :param pulumi.Input[_builtins.int] port_number: portNumber defines the `Pod` port number which exposes the endpoint.
-
-               The `Pod` must declare the specified `Port` in its spec or the
-               target will be dropped by Prometheus.
-
-               This cannot be used to enable scraping of an undeclared port.
-               To scrape targets on a port which isn't exposed, you need to use
-               relabeling to override the `__address__` label (but beware of
-               duplicate targets if the `Pod` has other declared ports).
-
-               In practice Prometheus will select targets for which the
-               matches the target's __meta_kubernetes_pod_container_port_number.
-        :param pulumi.Input[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs']]]]] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
-               proxies during CONNECT requests.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[_builtins.bool] proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[_builtins.str] proxy_url: proxyUrl defines the HTTP proxy server to use.
-        :param pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsRelabelingsArgs']]] relabelings: relabelings defines the relabeling rules to apply the target's
-               metadata labels.
-
-               The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-               The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-               More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-        :param pulumi.Input[_builtins.str] scheme: scheme defines the HTTP scheme to use for scraping.
-        :param pulumi.Input[_builtins.str] scrape_timeout: scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-               If empty, Prometheus uses the global scrape timeout unless it is less
-               than the target's scrape interval value in which the latter is used.
-               The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-        :param pulumi.Input[Union[_builtins.int, _builtins.str]] target_port: targetPort defines the name or number of the target port of the `Pod` object behind the Service, the
-               port must be specified with container port property.
-
-               Deprecated: use 'port' or 'portNumber' instead.
-        :param pulumi.Input[_builtins.bool] track_timestamps_staleness: trackTimestampsStaleness defines whether Prometheus tracks staleness of
-               the metrics that have an explicit timestamp present in scraped data.
-               Has no effect if `honorTimestamps` is false.
-
-               It requires Prometheus >= v2.48.0.
-        """
-        if authorization is not None:
-            pulumi.set(__self__, "authorization", authorization)
-        if basic_auth is not None:
-            pulumi.set(__self__, "basic_auth", basic_auth)
-        if bearer_token_secret is not None:
-            pulumi.set(__self__, "bearer_token_secret", bearer_token_secret)
-        if enable_http2 is not None:
-            pulumi.set(__self__, "enable_http2", enable_http2)
-        if filter_running is not None:
-            pulumi.set(__self__, "filter_running", filter_running)
-        if follow_redirects is not None:
-            pulumi.set(__self__, "follow_redirects", follow_redirects)
-        if honor_labels is not None:
-            pulumi.set(__self__, "honor_labels", honor_labels)
-        if honor_timestamps is not None:
-            pulumi.set(__self__, "honor_timestamps", honor_timestamps)
-        if interval is not None:
-            pulumi.set(__self__, "interval", interval)
-        if metric_relabelings is not None:
-            pulumi.set(__self__, "metric_relabelings", metric_relabelings)
-        if no_proxy is not None:
-            pulumi.set(__self__, "no_proxy", no_proxy)
-        if oauth2 is not None:
-            pulumi.set(__self__, "oauth2", oauth2)
-        if params is not None:
-            pulumi.set(__self__, "params", params)
-        if path is not None:
-            pulumi.set(__self__, "path", path)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if port_number is not None:
-            pulumi.set(__self__, "port_number", port_number)
-        if proxy_connect_header is not None:
-            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
-        if proxy_from_environment is not None:
-            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
-        if proxy_url is not None:
-            pulumi.set(__self__, "proxy_url", proxy_url)
-        if relabelings is not None:
-            pulumi.set(__self__, "relabelings", relabelings)
-        if scheme is not None:
-            pulumi.set(__self__, "scheme", scheme)
-        if scrape_timeout is not None:
-            pulumi.set(__self__, "scrape_timeout", scrape_timeout)
-        if target_port is not None:
-            pulumi.set(__self__, "target_port", target_port)
-        if tls_config is not None:
-            pulumi.set(__self__, "tls_config", tls_config)
-        if track_timestamps_staleness is not None:
-            pulumi.set(__self__, "track_timestamps_staleness", track_timestamps_staleness)
-
-    @_builtins.property
-    @pulumi.getter
-    def authorization(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsAuthorizationArgs']]:
-        return pulumi.get(self, "authorization")
-
-    @authorization.setter
-    def authorization(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsAuthorizationArgs']]):
-        pulumi.set(self, "authorization", value)
-
-    @_builtins.property
-    @pulumi.getter(name="basicAuth")
-    def basic_auth(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthArgs']]:
-        return pulumi.get(self, "basic_auth")
-
-    @basic_auth.setter
-    def basic_auth(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBasicAuthArgs']]):
-        pulumi.set(self, "basic_auth", value)
-
-    @_builtins.property
-    @pulumi.getter(name="bearerTokenSecret")
-    def bearer_token_secret(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBearerTokenSecretArgs']]:
-        return pulumi.get(self, "bearer_token_secret")
-
-    @bearer_token_secret.setter
-    def bearer_token_secret(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsBearerTokenSecretArgs']]):
-        pulumi.set(self, "bearer_token_secret", value)
-
-    @_builtins.property
-    @pulumi.getter(name="enableHttp2")
-    def enable_http2(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        enableHttp2 can be used to disable HTTP2.
-        """
-        return pulumi.get(self, "enable_http2")
-
-    @enable_http2.setter
-    def enable_http2(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "enable_http2", value)
-
-    @_builtins.property
-    @pulumi.getter(name="filterRunning")
-    def filter_running(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        filterRunning when true, the pods which are not running (e.g. either in Failed or
-        Succeeded state) are dropped during the target discovery.
-
-        If unset, the filtering is enabled.
-
-        More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-        """
-        return pulumi.get(self, "filter_running")
-
-    @filter_running.setter
-    def filter_running(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "filter_running", value)
-
-    @_builtins.property
-    @pulumi.getter(name="followRedirects")
-    def follow_redirects(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        followRedirects defines whether the client should follow HTTP 3xx
-        redirects.
-        """
-        return pulumi.get(self, "follow_redirects")
-
-    @follow_redirects.setter
-    def follow_redirects(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "follow_redirects", value)
-
-    @_builtins.property
-    @pulumi.getter(name="honorLabels")
-    def honor_labels(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        honorLabels when true preserves the metric's labels when they collide
-        with the target's labels.
-        """
-        return pulumi.get(self, "honor_labels")
-
-    @honor_labels.setter
-    def honor_labels(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "honor_labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="honorTimestamps")
-    def honor_timestamps(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        honorTimestamps defines whether Prometheus preserves the timestamps
-        when exposed by the target.
-        """
-        return pulumi.get(self, "honor_timestamps")
-
-    @honor_timestamps.setter
-    def honor_timestamps(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "honor_timestamps", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def interval(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        interval at which Prometheus scrapes the metrics from the target.
-
-        If empty, Prometheus uses the global scrape interval.
-        """
-        return pulumi.get(self, "interval")
-
-    @interval.setter
-    def interval(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "interval", value)
-
-    @_builtins.property
-    @pulumi.getter(name="metricRelabelings")
-    def metric_relabelings(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgs']]]]:
-        """
-        metricRelabelings defines the relabeling rules to apply to the
-        samples before ingestion.
-        """
-        return pulumi.get(self, "metric_relabelings")
-
-    @metric_relabelings.setter
-    def metric_relabelings(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgs']]]]):
-        pulumi.set(self, "metric_relabelings", value)
-
-    @_builtins.property
-    @pulumi.getter(name="noProxy")
-    def no_proxy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-        that should be excluded from proxying. IP and domain names can
-        contain port numbers.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "no_proxy")
-
-    @no_proxy.setter
-    def no_proxy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "no_proxy", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def oauth2(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2Args']]:
-        return pulumi.get(self, "oauth2")
-
-    @oauth2.setter
-    def oauth2(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsOauth2Args']]):
-        pulumi.set(self, "oauth2", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def params(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]]:
-        """
-        params define optional HTTP URL parameters.
-        """
-        return pulumi.get(self, "params")
-
-    @params.setter
-    def params(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]]):
-        pulumi.set(self, "params", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def path(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        path defines the HTTP path from which to scrape for metrics.
-
-        If empty, Prometheus uses the default value (e.g. `/metrics`).
-        """
-        return pulumi.get(self, "path")
-
-    @path.setter
-    def path(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "path", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        port defines the `Pod` port name which exposes the endpoint.
-
-        If the pod doesn't expose a port with the same name, it will result
-        in no targets being discovered.
-
-        If a `Pod` has multiple `Port`s with the same name (which is not
-        recommended), one target instance per unique port number will be
-        generated.
-
-        It takes precedence over the `portNumber` and `targetPort` fields.
-        """
-        return pulumi.get(self, "port")
-
-    @port.setter
-    def port(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "port", value)
-
-    @_builtins.property
-    @pulumi.getter(name="portNumber")
-    def port_number(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        portNumber defines the `Pod` port number which exposes the endpoint.
-
-        The `Pod` must declare the specified `Port` in its spec or the
-        target will be dropped by Prometheus.
-
-        This cannot be used to enable scraping of an undeclared port.
-        To scrape targets on a port which isn't exposed, you need to use
-        relabeling to override the `__address__` label (but beware of
-        duplicate targets if the `Pod` has other declared ports).
-
-        In practice Prometheus will select targets for which the
-        matches the target's __meta_kubernetes_pod_container_port_number.
-        """
-        return pulumi.get(self, "port_number")
-
-    @port_number.setter
-    def port_number(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "port_number", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyConnectHeader")
-    def proxy_connect_header(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs']]]]]]:
-        """
-        proxyConnectHeader optionally specifies headers to send to
-        proxies during CONNECT requests.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_connect_header")
-
-    @proxy_connect_header.setter
-    def proxy_connect_header(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs']]]]]]):
-        pulumi.set(self, "proxy_connect_header", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyFromEnvironment")
-    def proxy_from_environment(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_from_environment")
-
-    @proxy_from_environment.setter
-    def proxy_from_environment(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "proxy_from_environment", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyUrl")
-    def proxy_url(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        proxyUrl defines the HTTP proxy server to use.
-        """
-        return pulumi.get(self, "proxy_url")
-
-    @proxy_url.setter
-    def proxy_url(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "proxy_url", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def relabelings(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsRelabelingsArgs']]]]:
-        """
-        relabelings defines the relabeling rules to apply the target's
-        metadata labels.
-
-        The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-        The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-        """
-        return pulumi.get(self, "relabelings")
-
-    @relabelings.setter
-    def relabelings(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsRelabelingsArgs']]]]):
-        pulumi.set(self, "relabelings", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def scheme(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        scheme defines the HTTP scheme to use for scraping.
-        """
-        return pulumi.get(self, "scheme")
-
-    @scheme.setter
-    def scheme(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "scheme", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeTimeout")
-    def scrape_timeout(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-        If empty, Prometheus uses the global scrape timeout unless it is less
-        than the target's scrape interval value in which the latter is used.
-        The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-        """
-        return pulumi.get(self, "scrape_timeout")
-
-    @scrape_timeout.setter
-    def scrape_timeout(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "scrape_timeout", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetPort")
-    def target_port(self) -> pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]:
-        """
-        targetPort defines the name or number of the target port of the `Pod` object behind the Service, the
-        port must be specified with container port property.
-
-        Deprecated: use 'port' or 'portNumber' instead.
-        """
-        return pulumi.get(self, "target_port")
-
-    @target_port.setter
-    def target_port(self, value: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]):
-        pulumi.set(self, "target_port", value)
-
-    @_builtins.property
-    @pulumi.getter(name="tlsConfig")
-    def tls_config(self) -> pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigArgs']]:
-        return pulumi.get(self, "tls_config")
-
-    @tls_config.setter
-    def tls_config(self, value: pulumi.Input[Optional['PodMonitorSpecPodMetricsEndpointsTlsConfigArgs']]):
-        pulumi.set(self, "tls_config", value)
-
-    @_builtins.property
-    @pulumi.getter(name="trackTimestampsStaleness")
-    def track_timestamps_staleness(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        trackTimestampsStaleness defines whether Prometheus tracks staleness of
-        the metrics that have an explicit timestamp present in scraped data.
-        Has no effect if `honorTimestamps` is false.
-
-        It requires Prometheus >= v2.48.0.
-        """
-        return pulumi.get(self, "track_timestamps_staleness")
-
-    @track_timestamps_staleness.setter
-    def track_timestamps_staleness(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "track_timestamps_staleness", value)
-
-
-class PodMonitorSpecSelectorMatchExpressionsPatchArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecSelectorMatchExpressionsPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class PodMonitorSpecSelectorMatchExpressionsArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecSelectorMatchExpressionsArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class PodMonitorSpecSelectorPatchArgsDict(TypedDict):
-    """
-    selector defines the label selector to select the Kubernetes `Pod` objects to scrape metrics from.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecSelectorMatchExpressionsPatchArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecSelectorPatchArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecSelectorMatchExpressionsPatchArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        selector defines the label selector to select the Kubernetes `Pod` objects to scrape metrics from.
-
-        :param pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecSelectorMatchExpressionsPatchArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecSelectorMatchExpressionsPatchArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecSelectorMatchExpressionsPatchArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class PodMonitorSpecSelectorArgsDict(TypedDict):
-    """
-    selector defines the label selector to select the Kubernetes `Pod` objects to scrape metrics from.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecSelectorMatchExpressionsArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecSelectorArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecSelectorMatchExpressionsArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        selector defines the label selector to select the Kubernetes `Pod` objects to scrape metrics from.
-
-        :param pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecSelectorMatchExpressionsArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecSelectorMatchExpressionsArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecSelectorMatchExpressionsArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class PodMonitorSpecArgsDict(TypedDict):
-    """
-    spec defines the specification of desired Pod selection for target discovery by Prometheus.
-    """
-    attach_metadata: NotRequired[pulumi.Input[Optional['PodMonitorSpecAttachMetadataArgs']]]
-    body_size_limit: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    bodySizeLimit when defined specifies a job level limit on the size
-    of uncompressed response body that will be accepted by Prometheus.
-
-    It requires Prometheus >= v2.28.0.
-    """
-    convert_classic_histograms_to_nhcb: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-    It requires Prometheus >= v3.0.0.
-    """
-    fallback_scrape_protocol: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-    It requires Prometheus >= v3.0.0.
-    """
-    job_label: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    jobLabel defines the label to use to retrieve the job name from.
-    `jobLabel` selects the label from the associated Kubernetes `Pod`
-    object which will be used as the `job` label for all metrics.
-
-    For example if `jobLabel` is set to `foo` and the Kubernetes `Pod`
-    object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-    label to all ingested metrics.
-
-    If the value of this field is empty, the `job` label of the metrics
-    defaults to the namespace and name of the PodMonitor object (e.g. `<namespace>/<name>`).
-    """
-    keep_dropped_targets: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-    that will be kept in memory. 0 means no limit.
-
-    It requires Prometheus >= v2.47.0.
-    """
-    label_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-    It requires Prometheus >= v2.27.0.
-    """
-    label_name_length_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-    It requires Prometheus >= v2.27.0.
-    """
-    label_value_length_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-    It requires Prometheus >= v2.27.0.
-    """
-    namespace_selector: NotRequired[pulumi.Input[Optional['PodMonitorSpecNamespaceSelectorArgs']]]
-    native_histogram_bucket_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-    buckets will be merged to stay within the limit.
-    It requires Prometheus >= v2.45.0.
-    """
-    native_histogram_min_bucket_factor: NotRequired[pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]]
-    """
-    nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-    buckets will be merged to increase the factor sufficiently.
-    It requires Prometheus >= v2.50.0.
-    """
-    pod_metrics_endpoints: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsArgs']]]]]
-    """
-    podMetricsEndpoints defines how to scrape metrics from the selected pods.
-    """
-    pod_target_labels: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    podTargetLabels defines the labels which are transferred from the
-    associated Kubernetes `Pod` object onto the ingested metrics.
-    """
-    sample_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    sampleLimit defines a per-scrape limit on the number of scraped samples
-    that will be accepted.
-    """
-    scrape_class: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    scrapeClass defines the scrape class to apply.
-    """
-    scrape_classic_histograms: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-    It requires Prometheus >= v2.45.0.
-
-    Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-    """
-    scrape_native_histograms: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    scrapeNativeHistograms defines whether to enable scraping of native histograms.
-    It requires Prometheus >= v3.8.0.
-    """
-    scrape_protocols: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-    protocols supported by Prometheus in order of preference (from most to least preferred).
-
-    If unset, Prometheus uses its default value.
-
-    It requires Prometheus >= v2.49.0.
-    """
-    selector: NotRequired[pulumi.Input[Optional['PodMonitorSpecSelectorArgs']]]
-    selector_mechanism: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    selectorMechanism defines the mechanism used to select the endpoints to scrape.
-    By default, the selection process relies on relabel configurations to filter the discovered targets.
-    Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-    Which strategy is best for your use case needs to be carefully evaluated.
-
-    It requires Prometheus >= v2.17.0.
-    """
-    target_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    targetLimit defines a limit on the number of scraped targets that will
-    be accepted.
-    """
-
-@pulumi.input_type
-class PodMonitorSpecArgs:
-    def __init__(__self__, *,
-                 attach_metadata: pulumi.Input[Optional['PodMonitorSpecAttachMetadataArgs']] = None,
-                 body_size_limit: pulumi.Input[Optional[_builtins.str]] = None,
-                 convert_classic_histograms_to_nhcb: pulumi.Input[Optional[_builtins.bool]] = None,
-                 fallback_scrape_protocol: pulumi.Input[Optional[_builtins.str]] = None,
-                 job_label: pulumi.Input[Optional[_builtins.str]] = None,
-                 keep_dropped_targets: pulumi.Input[Optional[_builtins.int]] = None,
-                 label_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 label_name_length_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 label_value_length_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 namespace_selector: pulumi.Input[Optional['PodMonitorSpecNamespaceSelectorArgs']] = None,
-                 native_histogram_bucket_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 native_histogram_min_bucket_factor: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]] = None,
-                 pod_metrics_endpoints: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsArgs']]]] = None,
-                 pod_target_labels: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 sample_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 scrape_class: pulumi.Input[Optional[_builtins.str]] = None,
-                 scrape_classic_histograms: pulumi.Input[Optional[_builtins.bool]] = None,
-                 scrape_native_histograms: pulumi.Input[Optional[_builtins.bool]] = None,
-                 scrape_protocols: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 selector: pulumi.Input[Optional['PodMonitorSpecSelectorArgs']] = None,
-                 selector_mechanism: pulumi.Input[Optional[_builtins.str]] = None,
-                 target_limit: pulumi.Input[Optional[_builtins.int]] = None):
-        """
-        spec defines the specification of desired Pod selection for target discovery by Prometheus.
-
-        :param pulumi.Input[_builtins.str] body_size_limit: bodySizeLimit when defined specifies a job level limit on the size
-               of uncompressed response body that will be accepted by Prometheus.
-
-               It requires Prometheus >= v2.28.0.
-        :param pulumi.Input[_builtins.bool] convert_classic_histograms_to_nhcb: convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-               It requires Prometheus >= v3.0.0.
-        :param pulumi.Input[_builtins.str] fallback_scrape_protocol: fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-               It requires Prometheus >= v3.0.0.
-        :param pulumi.Input[_builtins.str] job_label: jobLabel defines the label to use to retrieve the job name from.
-               `jobLabel` selects the label from the associated Kubernetes `Pod`
-               object which will be used as the `job` label for all metrics.
-
-               For example if `jobLabel` is set to `foo` and the Kubernetes `Pod`
-               object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-               label to all ingested metrics.
-
-               If the value of this field is empty, the `job` label of the metrics
-               defaults to the namespace and name of the PodMonitor object (e.g. `<namespace>/<name>`).
-        :param pulumi.Input[_builtins.int] keep_dropped_targets: keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-               that will be kept in memory. 0 means no limit.
-
-               It requires Prometheus >= v2.47.0.
-        :param pulumi.Input[_builtins.int] label_limit: labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param pulumi.Input[_builtins.int] label_name_length_limit: labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param pulumi.Input[_builtins.int] label_value_length_limit: labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param pulumi.Input[_builtins.int] native_histogram_bucket_limit: nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-               buckets will be merged to stay within the limit.
-               It requires Prometheus >= v2.45.0.
-        :param pulumi.Input[Union[_builtins.int, _builtins.str]] native_histogram_min_bucket_factor: nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-               buckets will be merged to increase the factor sufficiently.
-               It requires Prometheus >= v2.50.0.
-        :param pulumi.Input[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsArgs']]] pod_metrics_endpoints: podMetricsEndpoints defines how to scrape metrics from the selected pods.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] pod_target_labels: podTargetLabels defines the labels which are transferred from the
-               associated Kubernetes `Pod` object onto the ingested metrics.
-        :param pulumi.Input[_builtins.int] sample_limit: sampleLimit defines a per-scrape limit on the number of scraped samples
-               that will be accepted.
-        :param pulumi.Input[_builtins.str] scrape_class: scrapeClass defines the scrape class to apply.
-        :param pulumi.Input[_builtins.bool] scrape_classic_histograms: scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-               It requires Prometheus >= v2.45.0.
-
-               Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-        :param pulumi.Input[_builtins.bool] scrape_native_histograms: scrapeNativeHistograms defines whether to enable scraping of native histograms.
-               It requires Prometheus >= v3.8.0.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] scrape_protocols: scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-               protocols supported by Prometheus in order of preference (from most to least preferred).
-
-               If unset, Prometheus uses its default value.
-
-               It requires Prometheus >= v2.49.0.
-        :param pulumi.Input[_builtins.str] selector_mechanism: selectorMechanism defines the mechanism used to select the endpoints to scrape.
-               By default, the selection process relies on relabel configurations to filter the discovered targets.
-               Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-               Which strategy is best for your use case needs to be carefully evaluated.
-
-               It requires Prometheus >= v2.17.0.
-        :param pulumi.Input[_builtins.int] target_limit: targetLimit defines a limit on the number of scraped targets that will
-               be accepted.
-        """
-        if attach_metadata is not None:
-            pulumi.set(__self__, "attach_metadata", attach_metadata)
-        if body_size_limit is not None:
-            pulumi.set(__self__, "body_size_limit", body_size_limit)
-        if convert_classic_histograms_to_nhcb is not None:
-            pulumi.set(__self__, "convert_classic_histograms_to_nhcb", convert_classic_histograms_to_nhcb)
-        if fallback_scrape_protocol is not None:
-            pulumi.set(__self__, "fallback_scrape_protocol", fallback_scrape_protocol)
-        if job_label is not None:
-            pulumi.set(__self__, "job_label", job_label)
-        if keep_dropped_targets is not None:
-            pulumi.set(__self__, "keep_dropped_targets", keep_dropped_targets)
-        if label_limit is not None:
-            pulumi.set(__self__, "label_limit", label_limit)
-        if label_name_length_limit is not None:
-            pulumi.set(__self__, "label_name_length_limit", label_name_length_limit)
-        if label_value_length_limit is not None:
-            pulumi.set(__self__, "label_value_length_limit", label_value_length_limit)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if native_histogram_bucket_limit is not None:
-            pulumi.set(__self__, "native_histogram_bucket_limit", native_histogram_bucket_limit)
-        if native_histogram_min_bucket_factor is not None:
-            pulumi.set(__self__, "native_histogram_min_bucket_factor", native_histogram_min_bucket_factor)
-        if pod_metrics_endpoints is not None:
-            pulumi.set(__self__, "pod_metrics_endpoints", pod_metrics_endpoints)
-        if pod_target_labels is not None:
-            pulumi.set(__self__, "pod_target_labels", pod_target_labels)
-        if sample_limit is not None:
-            pulumi.set(__self__, "sample_limit", sample_limit)
-        if scrape_class is not None:
-            pulumi.set(__self__, "scrape_class", scrape_class)
-        if scrape_classic_histograms is not None:
-            pulumi.set(__self__, "scrape_classic_histograms", scrape_classic_histograms)
-        if scrape_native_histograms is not None:
-            pulumi.set(__self__, "scrape_native_histograms", scrape_native_histograms)
-        if scrape_protocols is not None:
-            pulumi.set(__self__, "scrape_protocols", scrape_protocols)
-        if selector is not None:
-            pulumi.set(__self__, "selector", selector)
-        if selector_mechanism is not None:
-            pulumi.set(__self__, "selector_mechanism", selector_mechanism)
-        if target_limit is not None:
-            pulumi.set(__self__, "target_limit", target_limit)
-
-    @_builtins.property
-    @pulumi.getter(name="attachMetadata")
-    def attach_metadata(self) -> pulumi.Input[Optional['PodMonitorSpecAttachMetadataArgs']]:
-        return pulumi.get(self, "attach_metadata")
-
-    @attach_metadata.setter
-    def attach_metadata(self, value: pulumi.Input[Optional['PodMonitorSpecAttachMetadataArgs']]):
-        pulumi.set(self, "attach_metadata", value)
-
-    @_builtins.property
-    @pulumi.getter(name="bodySizeLimit")
-    def body_size_limit(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        bodySizeLimit when defined specifies a job level limit on the size
-        of uncompressed response body that will be accepted by Prometheus.
-
-        It requires Prometheus >= v2.28.0.
-        """
-        return pulumi.get(self, "body_size_limit")
-
-    @body_size_limit.setter
-    def body_size_limit(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "body_size_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="convertClassicHistogramsToNHCB")
-    def convert_classic_histograms_to_nhcb(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-        It requires Prometheus >= v3.0.0.
-        """
-        return pulumi.get(self, "convert_classic_histograms_to_nhcb")
-
-    @convert_classic_histograms_to_nhcb.setter
-    def convert_classic_histograms_to_nhcb(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "convert_classic_histograms_to_nhcb", value)
-
-    @_builtins.property
-    @pulumi.getter(name="fallbackScrapeProtocol")
-    def fallback_scrape_protocol(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-        It requires Prometheus >= v3.0.0.
-        """
-        return pulumi.get(self, "fallback_scrape_protocol")
-
-    @fallback_scrape_protocol.setter
-    def fallback_scrape_protocol(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "fallback_scrape_protocol", value)
-
-    @_builtins.property
-    @pulumi.getter(name="jobLabel")
-    def job_label(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        jobLabel defines the label to use to retrieve the job name from.
-        `jobLabel` selects the label from the associated Kubernetes `Pod`
-        object which will be used as the `job` label for all metrics.
-
-        For example if `jobLabel` is set to `foo` and the Kubernetes `Pod`
-        object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-        label to all ingested metrics.
-
-        If the value of this field is empty, the `job` label of the metrics
-        defaults to the namespace and name of the PodMonitor object (e.g. `<namespace>/<name>`).
-        """
-        return pulumi.get(self, "job_label")
-
-    @job_label.setter
-    def job_label(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "job_label", value)
-
-    @_builtins.property
-    @pulumi.getter(name="keepDroppedTargets")
-    def keep_dropped_targets(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-        that will be kept in memory. 0 means no limit.
-
-        It requires Prometheus >= v2.47.0.
-        """
-        return pulumi.get(self, "keep_dropped_targets")
-
-    @keep_dropped_targets.setter
-    def keep_dropped_targets(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "keep_dropped_targets", value)
-
-    @_builtins.property
-    @pulumi.getter(name="labelLimit")
-    def label_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_limit")
-
-    @label_limit.setter
-    def label_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "label_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="labelNameLengthLimit")
-    def label_name_length_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_name_length_limit")
-
-    @label_name_length_limit.setter
-    def label_name_length_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "label_name_length_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="labelValueLengthLimit")
-    def label_value_length_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_value_length_limit")
-
-    @label_value_length_limit.setter
-    def label_value_length_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "label_value_length_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> pulumi.Input[Optional['PodMonitorSpecNamespaceSelectorArgs']]:
-        return pulumi.get(self, "namespace_selector")
-
-    @namespace_selector.setter
-    def namespace_selector(self, value: pulumi.Input[Optional['PodMonitorSpecNamespaceSelectorArgs']]):
-        pulumi.set(self, "namespace_selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="nativeHistogramBucketLimit")
-    def native_histogram_bucket_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-        buckets will be merged to stay within the limit.
-        It requires Prometheus >= v2.45.0.
-        """
-        return pulumi.get(self, "native_histogram_bucket_limit")
-
-    @native_histogram_bucket_limit.setter
-    def native_histogram_bucket_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "native_histogram_bucket_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="nativeHistogramMinBucketFactor")
-    def native_histogram_min_bucket_factor(self) -> pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]:
-        """
-        nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-        buckets will be merged to increase the factor sufficiently.
-        It requires Prometheus >= v2.50.0.
-        """
-        return pulumi.get(self, "native_histogram_min_bucket_factor")
-
-    @native_histogram_min_bucket_factor.setter
-    def native_histogram_min_bucket_factor(self, value: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]):
-        pulumi.set(self, "native_histogram_min_bucket_factor", value)
-
-    @_builtins.property
-    @pulumi.getter(name="podMetricsEndpoints")
-    def pod_metrics_endpoints(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsArgs']]]]:
-        """
-        podMetricsEndpoints defines how to scrape metrics from the selected pods.
-        """
-        return pulumi.get(self, "pod_metrics_endpoints")
-
-    @pod_metrics_endpoints.setter
-    def pod_metrics_endpoints(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorSpecPodMetricsEndpointsArgs']]]]):
-        pulumi.set(self, "pod_metrics_endpoints", value)
-
-    @_builtins.property
-    @pulumi.getter(name="podTargetLabels")
-    def pod_target_labels(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        podTargetLabels defines the labels which are transferred from the
-        associated Kubernetes `Pod` object onto the ingested metrics.
-        """
-        return pulumi.get(self, "pod_target_labels")
-
-    @pod_target_labels.setter
-    def pod_target_labels(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "pod_target_labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sampleLimit")
-    def sample_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        sampleLimit defines a per-scrape limit on the number of scraped samples
-        that will be accepted.
-        """
-        return pulumi.get(self, "sample_limit")
-
-    @sample_limit.setter
-    def sample_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "sample_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeClass")
-    def scrape_class(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        scrapeClass defines the scrape class to apply.
-        """
-        return pulumi.get(self, "scrape_class")
-
-    @scrape_class.setter
-    def scrape_class(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "scrape_class", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeClassicHistograms")
-    def scrape_classic_histograms(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-        It requires Prometheus >= v2.45.0.
-
-        Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-        """
-        return pulumi.get(self, "scrape_classic_histograms")
-
-    @scrape_classic_histograms.setter
-    def scrape_classic_histograms(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "scrape_classic_histograms", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeNativeHistograms")
-    def scrape_native_histograms(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        scrapeNativeHistograms defines whether to enable scraping of native histograms.
-        It requires Prometheus >= v3.8.0.
-        """
-        return pulumi.get(self, "scrape_native_histograms")
-
-    @scrape_native_histograms.setter
-    def scrape_native_histograms(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "scrape_native_histograms", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeProtocols")
-    def scrape_protocols(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-        protocols supported by Prometheus in order of preference (from most to least preferred).
-
-        If unset, Prometheus uses its default value.
-
-        It requires Prometheus >= v2.49.0.
-        """
-        return pulumi.get(self, "scrape_protocols")
-
-    @scrape_protocols.setter
-    def scrape_protocols(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "scrape_protocols", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def selector(self) -> pulumi.Input[Optional['PodMonitorSpecSelectorArgs']]:
-        return pulumi.get(self, "selector")
-
-    @selector.setter
-    def selector(self, value: pulumi.Input[Optional['PodMonitorSpecSelectorArgs']]):
-        pulumi.set(self, "selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="selectorMechanism")
-    def selector_mechanism(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        selectorMechanism defines the mechanism used to select the endpoints to scrape.
-        By default, the selection process relies on relabel configurations to filter the discovered targets.
-        Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-        Which strategy is best for your use case needs to be carefully evaluated.
-
-        It requires Prometheus >= v2.17.0.
-        """
-        return pulumi.get(self, "selector_mechanism")
-
-    @selector_mechanism.setter
-    def selector_mechanism(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "selector_mechanism", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetLimit")
-    def target_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        targetLimit defines a limit on the number of scraped targets that will
-        be accepted.
-        """
-        return pulumi.get(self, "target_limit")
-
-    @target_limit.setter
-    def target_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "target_limit", value)
-
-
-class PodMonitorStatusBindingsConditionsArgsDict(TypedDict):
-    """
-    ConfigResourceCondition describes the status of configuration resources linked to Prometheus, PrometheusAgent, Alertmanager or ThanosRuler.
-    """
-    last_transition_time: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    lastTransitionTime defines the time of the last update to the current status property.
-    """
-    message: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    message defines the human-readable message indicating details for the condition's last transition.
-    """
-    observed_generation: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    observedGeneration defines the .metadata.generation that the
-    condition was set based upon. For instance, if `.metadata.generation` is
-    currently 12, but the `.status.conditions[].observedGeneration` is 9, the
-    condition is out of date with respect to the current state of the object.
-    """
-    reason: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    reason for the condition's last transition.
-    """
-    status: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    status of the condition.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type of the condition being reported.
-    Currently, only "Accepted" is supported.
-    """
-
-@pulumi.input_type
-class PodMonitorStatusBindingsConditionsArgs:
-    def __init__(__self__, *,
-                 last_transition_time: pulumi.Input[Optional[_builtins.str]] = None,
-                 message: pulumi.Input[Optional[_builtins.str]] = None,
-                 observed_generation: pulumi.Input[Optional[_builtins.int]] = None,
-                 reason: pulumi.Input[Optional[_builtins.str]] = None,
-                 status: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        ConfigResourceCondition describes the status of configuration resources linked to Prometheus, PrometheusAgent, Alertmanager or ThanosRuler.
-
-        :param pulumi.Input[_builtins.str] last_transition_time: lastTransitionTime defines the time of the last update to the current status property.
-        :param pulumi.Input[_builtins.str] message: message defines the human-readable message indicating details for the condition's last transition.
-        :param pulumi.Input[_builtins.int] observed_generation: observedGeneration defines the .metadata.generation that the
-               condition was set based upon. For instance, if `.metadata.generation` is
-               currently 12, but the `.status.conditions[].observedGeneration` is 9, the
-               condition is out of date with respect to the current state of the object.
-        :param pulumi.Input[_builtins.str] reason: reason for the condition's last transition.
-        :param pulumi.Input[_builtins.str] status: status of the condition.
-        :param pulumi.Input[_builtins.str] type: type of the condition being reported.
-               Currently, only "Accepted" is supported.
-        """
-        if last_transition_time is not None:
-            pulumi.set(__self__, "last_transition_time", last_transition_time)
-        if message is not None:
-            pulumi.set(__self__, "message", message)
-        if observed_generation is not None:
-            pulumi.set(__self__, "observed_generation", observed_generation)
-        if reason is not None:
-            pulumi.set(__self__, "reason", reason)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="lastTransitionTime")
-    def last_transition_time(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        lastTransitionTime defines the time of the last update to the current status property.
-        """
-        return pulumi.get(self, "last_transition_time")
-
-    @last_transition_time.setter
-    def last_transition_time(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "last_transition_time", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def message(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        message defines the human-readable message indicating details for the condition's last transition.
-        """
-        return pulumi.get(self, "message")
-
-    @message.setter
-    def message(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "message", value)
-
-    @_builtins.property
-    @pulumi.getter(name="observedGeneration")
-    def observed_generation(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        observedGeneration defines the .metadata.generation that the
-        condition was set based upon. For instance, if `.metadata.generation` is
-        currently 12, but the `.status.conditions[].observedGeneration` is 9, the
-        condition is out of date with respect to the current state of the object.
-        """
-        return pulumi.get(self, "observed_generation")
-
-    @observed_generation.setter
-    def observed_generation(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "observed_generation", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def reason(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        reason for the condition's last transition.
-        """
-        return pulumi.get(self, "reason")
-
-    @reason.setter
-    def reason(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "reason", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        status of the condition.
-        """
-        return pulumi.get(self, "status")
-
-    @status.setter
-    def status(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "status", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type of the condition being reported.
-        Currently, only "Accepted" is supported.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class PodMonitorStatusBindingsArgsDict(TypedDict):
-    """
-    WorkloadBinding is a link between a configuration resource and a workload resource.
-    """
-    conditions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorStatusBindingsConditionsArgs']]]]]
-    """
-    conditions defines the current state of the configuration resource when bound to the referenced Workload object.
-    """
-    group: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    group defines the group of the referenced resource.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    name defines the name of the referenced object.
-    """
-    namespace: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    namespace defines the namespace of the referenced object.
-    """
-    resource: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
-    """
-
-@pulumi.input_type
-class PodMonitorStatusBindingsArgs:
-    def __init__(__self__, *,
-                 conditions: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorStatusBindingsConditionsArgs']]]] = None,
-                 group: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 namespace: pulumi.Input[Optional[_builtins.str]] = None,
-                 resource: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        WorkloadBinding is a link between a configuration resource and a workload resource.
-
-        :param pulumi.Input[Sequence[pulumi.Input['PodMonitorStatusBindingsConditionsArgs']]] conditions: conditions defines the current state of the configuration resource when bound to the referenced Workload object.
-        :param pulumi.Input[_builtins.str] group: group defines the group of the referenced resource.
-        :param pulumi.Input[_builtins.str] name: name defines the name of the referenced object.
-        :param pulumi.Input[_builtins.str] namespace: namespace defines the namespace of the referenced object.
-        :param pulumi.Input[_builtins.str] resource: resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
-        """
-        if conditions is not None:
-            pulumi.set(__self__, "conditions", conditions)
-        if group is not None:
-            pulumi.set(__self__, "group", group)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if namespace is not None:
-            pulumi.set(__self__, "namespace", namespace)
-        if resource is not None:
-            pulumi.set(__self__, "resource", resource)
-
-    @_builtins.property
-    @pulumi.getter
-    def conditions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorStatusBindingsConditionsArgs']]]]:
-        """
-        conditions defines the current state of the configuration resource when bound to the referenced Workload object.
-        """
-        return pulumi.get(self, "conditions")
-
-    @conditions.setter
-    def conditions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorStatusBindingsConditionsArgs']]]]):
-        pulumi.set(self, "conditions", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def group(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        group defines the group of the referenced resource.
-        """
-        return pulumi.get(self, "group")
-
-    @group.setter
-    def group(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "group", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        name defines the name of the referenced object.
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def namespace(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        namespace defines the namespace of the referenced object.
-        """
-        return pulumi.get(self, "namespace")
-
-    @namespace.setter
-    def namespace(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "namespace", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def resource(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
-        """
-        return pulumi.get(self, "resource")
-
-    @resource.setter
-    def resource(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "resource", value)
-
-
-class PodMonitorStatusArgsDict(TypedDict):
-    """
-    status defines the status subresource. It is under active development and is updated only when the
-    "StatusForConfigurationResources" feature gate is enabled.
-
-    Most recent observed status of the PodMonitor. Read-only.
-    More info:
-    https://github.com/kubernetes/community/blob/master/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    bindings: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorStatusBindingsArgs']]]]]
-    """
-    bindings defines the list of workload resources (Prometheus, PrometheusAgent, ThanosRuler or Alertmanager) which select the configuration resource.
-    """
-
-@pulumi.input_type
-class PodMonitorStatusArgs:
-    def __init__(__self__, *,
-                 bindings: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorStatusBindingsArgs']]]] = None):
-        """
-        status defines the status subresource. It is under active development and is updated only when the
-        "StatusForConfigurationResources" feature gate is enabled.
-
-        Most recent observed status of the PodMonitor. Read-only.
-        More info:
-        https://github.com/kubernetes/community/blob/master/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param pulumi.Input[Sequence[pulumi.Input['PodMonitorStatusBindingsArgs']]] bindings: bindings defines the list of workload resources (Prometheus, PrometheusAgent, ThanosRuler or Alertmanager) which select the configuration resource.
-        """
-        if bindings is not None:
-            pulumi.set(__self__, "bindings", bindings)
-
-    @_builtins.property
-    @pulumi.getter
-    def bindings(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorStatusBindingsArgs']]]]:
-        """
-        bindings defines the list of workload resources (Prometheus, PrometheusAgent, ThanosRuler or Alertmanager) which select the configuration resource.
-        """
-        return pulumi.get(self, "bindings")
-
-    @bindings.setter
-    def bindings(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['PodMonitorStatusBindingsArgs']]]]):
-        pulumi.set(self, "bindings", value)
-
-
-class PodMonitorArgsDict(TypedDict):
-    """
-    The `PodMonitor` custom resource definition (CRD) defines how `Prometheus` and `PrometheusAgent` can scrape metrics from a group of pods.
-    Among other things, it allows to specify:
-    * The pods to scrape via label selectors.
-    * The container ports to scrape.
-    * Authentication credentials to use.
-    * Target and metric relabeling.
-
-    `Prometheus` and `PrometheusAgent` objects select `PodMonitor` objects using label and namespace selectors.
-    """
-    api_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-    """
-    kind: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-    """
-    metadata: NotRequired[pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']]]
-    """
-    Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-    """
-    spec: NotRequired[pulumi.Input[Optional['PodMonitorSpecArgs']]]
-    status: NotRequired[pulumi.Input[Optional['PodMonitorStatusArgs']]]
-
-@pulumi.input_type
-class PodMonitorArgs:
-    def __init__(__self__, *,
-                 api_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 kind: pulumi.Input[Optional[_builtins.str]] = None,
-                 metadata: pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']] = None,
-                 spec: pulumi.Input[Optional['PodMonitorSpecArgs']] = None,
-                 status: pulumi.Input[Optional['PodMonitorStatusArgs']] = None):
-        """
-        The `PodMonitor` custom resource definition (CRD) defines how `Prometheus` and `PrometheusAgent` can scrape metrics from a group of pods.
-        Among other things, it allows to specify:
-        * The pods to scrape via label selectors.
-        * The container ports to scrape.
-        * Authentication credentials to use.
-        * Target and metric relabeling.
-
-        `Prometheus` and `PrometheusAgent` objects select `PodMonitor` objects using label and namespace selectors.
-
-        :param pulumi.Input[_builtins.str] api_version: APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        :param pulumi.Input[_builtins.str] kind: Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        :param pulumi.Input['_meta.v1.ObjectMetaArgs'] metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        if api_version is not None:
-            pulumi.set(__self__, "api_version", 'monitoring.coreos.com/v1')
-        if kind is not None:
-            pulumi.set(__self__, "kind", 'PodMonitor')
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter(name="apiVersion")
-    def api_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        """
-        return pulumi.get(self, "api_version")
-
-    @api_version.setter
-    def api_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "api_version", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def kind(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        return pulumi.get(self, "kind")
-
-    @kind.setter
-    def kind(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "kind", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']]:
-        """
-        Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        return pulumi.get(self, "metadata")
-
-    @metadata.setter
-    def metadata(self, value: pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']]):
-        pulumi.set(self, "metadata", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> pulumi.Input[Optional['PodMonitorSpecArgs']]:
-        return pulumi.get(self, "spec")
-
-    @spec.setter
-    def spec(self, value: pulumi.Input[Optional['PodMonitorSpecArgs']]):
-        pulumi.set(self, "spec", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> pulumi.Input[Optional['PodMonitorStatusArgs']]:
-        return pulumi.get(self, "status")
-
-    @status.setter
-    def status(self, value: pulumi.Input[Optional['PodMonitorStatusArgs']]):
-        pulumi.set(self, "status", value)
-
-
-class ServiceMonitorSpecAttachMetadataPatchArgsDict(TypedDict):
-    """
-    attachMetadata defines additional metadata which is added to the
-    discovered targets.
-
-    It requires Prometheus >= v2.37.0.
-    """
-    node: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    node when set to true, Prometheus attaches node metadata to the discovered
-    targets.
-
-    The Prometheus service account must have the `list` and `watch`
-    permissions on the `Nodes` objects.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecAttachMetadataPatchArgs:
-    def __init__(__self__, *,
-                 node: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        attachMetadata defines additional metadata which is added to the
-        discovered targets.
-
-        It requires Prometheus >= v2.37.0.
-
-        :param pulumi.Input[_builtins.bool] node: node when set to true, Prometheus attaches node metadata to the discovered
-               targets.
-
-               The Prometheus service account must have the `list` and `watch`
-               permissions on the `Nodes` objects.
-        """
-        if node is not None:
-            pulumi.set(__self__, "node", node)
-
-    @_builtins.property
-    @pulumi.getter
-    def node(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        node when set to true, Prometheus attaches node metadata to the discovered
-        targets.
-
-        The Prometheus service account must have the `list` and `watch`
-        permissions on the `Nodes` objects.
-        """
-        return pulumi.get(self, "node")
-
-    @node.setter
-    def node(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "node", value)
-
-
-class ServiceMonitorSpecAttachMetadataArgsDict(TypedDict):
-    """
-    attachMetadata defines additional metadata which is added to the
-    discovered targets.
-
-    It requires Prometheus >= v2.37.0.
-    """
-    node: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    node when set to true, Prometheus attaches node metadata to the discovered
-    targets.
-
-    The Prometheus service account must have the `list` and `watch`
-    permissions on the `Nodes` objects.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecAttachMetadataArgs:
-    def __init__(__self__, *,
-                 node: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        attachMetadata defines additional metadata which is added to the
-        discovered targets.
-
-        It requires Prometheus >= v2.37.0.
-
-        :param pulumi.Input[_builtins.bool] node: node when set to true, Prometheus attaches node metadata to the discovered
-               targets.
-
-               The Prometheus service account must have the `list` and `watch`
-               permissions on the `Nodes` objects.
-        """
-        if node is not None:
-            pulumi.set(__self__, "node", node)
-
-    @_builtins.property
-    @pulumi.getter
-    def node(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        node when set to true, Prometheus attaches node metadata to the discovered
-        targets.
-
-        The Prometheus service account must have the `list` and `watch`
-        permissions on the `Nodes` objects.
-        """
-        return pulumi.get(self, "node")
-
-    @node.setter
-    def node(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "node", value)
-
-
-class ServiceMonitorSpecEndpointsAuthorizationCredentialsPatchArgsDict(TypedDict):
-    """
-    credentials defines a key of a Secret in the namespace that contains the credentials for authentication.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsAuthorizationCredentialsPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        credentials defines a key of a Secret in the namespace that contains the credentials for authentication.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsAuthorizationCredentialsArgsDict(TypedDict):
-    """
-    credentials defines a key of a Secret in the namespace that contains the credentials for authentication.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsAuthorizationCredentialsArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        credentials defines a key of a Secret in the namespace that contains the credentials for authentication.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsAuthorizationPatchArgsDict(TypedDict):
-    """
-    authorization configures the Authorization header credentials used by
-    the client.
-
-    Cannot be set at the same time as `basicAuth`, `bearerTokenSecret` or `oauth2`.
-    """
-    credentials: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsAuthorizationCredentialsPatchArgs']]]
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type defines the authentication type. The value is case-insensitive.
-
-    "Basic" is not a supported value.
-
-    Default: "Bearer"
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsAuthorizationPatchArgs:
-    def __init__(__self__, *,
-                 credentials: pulumi.Input[Optional['ServiceMonitorSpecEndpointsAuthorizationCredentialsPatchArgs']] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        authorization configures the Authorization header credentials used by
-        the client.
-
-        Cannot be set at the same time as `basicAuth`, `bearerTokenSecret` or `oauth2`.
-
-        :param pulumi.Input[_builtins.str] type: type defines the authentication type. The value is case-insensitive.
-
-               "Basic" is not a supported value.
-
-               Default: "Bearer"
-        """
-        if credentials is not None:
-            pulumi.set(__self__, "credentials", credentials)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter
-    def credentials(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsAuthorizationCredentialsPatchArgs']]:
-        return pulumi.get(self, "credentials")
-
-    @credentials.setter
-    def credentials(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsAuthorizationCredentialsPatchArgs']]):
-        pulumi.set(self, "credentials", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type defines the authentication type. The value is case-insensitive.
-
-        "Basic" is not a supported value.
-
-        Default: "Bearer"
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class ServiceMonitorSpecEndpointsAuthorizationArgsDict(TypedDict):
-    """
-    authorization configures the Authorization header credentials used by
-    the client.
-
-    Cannot be set at the same time as `basicAuth`, `bearerTokenSecret` or `oauth2`.
-    """
-    credentials: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsAuthorizationCredentialsArgs']]]
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type defines the authentication type. The value is case-insensitive.
-
-    "Basic" is not a supported value.
-
-    Default: "Bearer"
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsAuthorizationArgs:
-    def __init__(__self__, *,
-                 credentials: pulumi.Input[Optional['ServiceMonitorSpecEndpointsAuthorizationCredentialsArgs']] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        authorization configures the Authorization header credentials used by
-        the client.
-
-        Cannot be set at the same time as `basicAuth`, `bearerTokenSecret` or `oauth2`.
-
-        :param pulumi.Input[_builtins.str] type: type defines the authentication type. The value is case-insensitive.
-
-               "Basic" is not a supported value.
-
-               Default: "Bearer"
-        """
-        if credentials is not None:
-            pulumi.set(__self__, "credentials", credentials)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter
-    def credentials(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsAuthorizationCredentialsArgs']]:
-        return pulumi.get(self, "credentials")
-
-    @credentials.setter
-    def credentials(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsAuthorizationCredentialsArgs']]):
-        pulumi.set(self, "credentials", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type defines the authentication type. The value is case-insensitive.
-
-        "Basic" is not a supported value.
-
-        Default: "Bearer"
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class ServiceMonitorSpecEndpointsBasicAuthPasswordPatchArgsDict(TypedDict):
-    """
-    password defines a key of a Secret containing the password for
-    authentication.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsBasicAuthPasswordPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        password defines a key of a Secret containing the password for
-        authentication.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsBasicAuthPasswordArgsDict(TypedDict):
-    """
-    password defines a key of a Secret containing the password for
-    authentication.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsBasicAuthPasswordArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        password defines a key of a Secret containing the password for
-        authentication.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsBasicAuthPatchArgsDict(TypedDict):
-    """
-    basicAuth defines the Basic Authentication credentials used by the
-    client.
-
-    Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
-    """
-    password: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthPasswordPatchArgs']]]
-    username: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthUsernamePatchArgs']]]
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsBasicAuthPatchArgs:
-    def __init__(__self__, *,
-                 password: pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthPasswordPatchArgs']] = None,
-                 username: pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthUsernamePatchArgs']] = None):
-        """
-        basicAuth defines the Basic Authentication credentials used by the
-        client.
-
-        Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
-        """
-        if password is not None:
-            pulumi.set(__self__, "password", password)
-        if username is not None:
-            pulumi.set(__self__, "username", username)
-
-    @_builtins.property
-    @pulumi.getter
-    def password(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthPasswordPatchArgs']]:
-        return pulumi.get(self, "password")
-
-    @password.setter
-    def password(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthPasswordPatchArgs']]):
-        pulumi.set(self, "password", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def username(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthUsernamePatchArgs']]:
-        return pulumi.get(self, "username")
-
-    @username.setter
-    def username(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthUsernamePatchArgs']]):
-        pulumi.set(self, "username", value)
-
-
-class ServiceMonitorSpecEndpointsBasicAuthUsernamePatchArgsDict(TypedDict):
-    """
-    username defines a key of a Secret containing the username for
-    authentication.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsBasicAuthUsernamePatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        username defines a key of a Secret containing the username for
-        authentication.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsBasicAuthUsernameArgsDict(TypedDict):
-    """
-    username defines a key of a Secret containing the username for
-    authentication.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsBasicAuthUsernameArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        username defines a key of a Secret containing the username for
-        authentication.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsBasicAuthArgsDict(TypedDict):
-    """
-    basicAuth defines the Basic Authentication credentials used by the
-    client.
-
-    Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
-    """
-    password: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthPasswordArgs']]]
-    username: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthUsernameArgs']]]
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsBasicAuthArgs:
-    def __init__(__self__, *,
-                 password: pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthPasswordArgs']] = None,
-                 username: pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthUsernameArgs']] = None):
-        """
-        basicAuth defines the Basic Authentication credentials used by the
-        client.
-
-        Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
-        """
-        if password is not None:
-            pulumi.set(__self__, "password", password)
-        if username is not None:
-            pulumi.set(__self__, "username", username)
-
-    @_builtins.property
-    @pulumi.getter
-    def password(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthPasswordArgs']]:
-        return pulumi.get(self, "password")
-
-    @password.setter
-    def password(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthPasswordArgs']]):
-        pulumi.set(self, "password", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def username(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthUsernameArgs']]:
-        return pulumi.get(self, "username")
-
-    @username.setter
-    def username(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthUsernameArgs']]):
-        pulumi.set(self, "username", value)
-
-
-class ServiceMonitorSpecEndpointsBearerTokenSecretPatchArgsDict(TypedDict):
-    """
-    bearerTokenSecret defines a key of a Secret containing the bearer token
-    used by the client for authentication. The secret needs to be in the
-    same namespace as the custom resource and readable by the Prometheus
-    Operator.
-
-    Cannot be set at the same time as `authorization`, `basicAuth` or `oauth2`.
-
-    Deprecated: use `authorization` instead.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsBearerTokenSecretPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        bearerTokenSecret defines a key of a Secret containing the bearer token
-        used by the client for authentication. The secret needs to be in the
-        same namespace as the custom resource and readable by the Prometheus
-        Operator.
-
-        Cannot be set at the same time as `authorization`, `basicAuth` or `oauth2`.
-
-        Deprecated: use `authorization` instead.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsBearerTokenSecretArgsDict(TypedDict):
-    """
-    bearerTokenSecret defines a key of a Secret containing the bearer token
-    used by the client for authentication. The secret needs to be in the
-    same namespace as the custom resource and readable by the Prometheus
-    Operator.
-
-    Cannot be set at the same time as `authorization`, `basicAuth` or `oauth2`.
-
-    Deprecated: use `authorization` instead.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsBearerTokenSecretArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        bearerTokenSecret defines a key of a Secret containing the bearer token
-        used by the client for authentication. The secret needs to be in the
-        same namespace as the custom resource and readable by the Prometheus
-        Operator.
-
-        Cannot be set at the same time as `authorization`, `basicAuth` or `oauth2`.
-
-        Deprecated: use `authorization` instead.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgsDict(TypedDict):
-    """
-    RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-    scraped samples and remote write samples.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    action: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    action to perform based on the regex matching.
-
-    `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-    `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-    Default: "Replace"
-    """
-    modulus: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    modulus to take of the hash of the source label values.
-
-    Only applicable when the action is `HashMod`.
-    """
-    regex: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    regex defines the regular expression against which the extracted value is matched.
-    """
-    replacement: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    replacement value against which a Replace action is performed if the
-    regular expression matches.
-
-    Regex capture groups are available.
-    """
-    separator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    separator defines the string between concatenated SourceLabels.
-    """
-    source_labels: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    sourceLabels defines the source labels select values from existing labels. Their content is
-    concatenated using the configured Separator and matched against the
-    configured regular expression.
-    """
-    target_label: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    targetLabel defines the label to which the resulting string is written in a replacement.
-
-    It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-    `KeepEqual` and `DropEqual` actions.
-
-    Regex capture groups are available.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgs:
-    def __init__(__self__, *,
-                 action: pulumi.Input[Optional[_builtins.str]] = None,
-                 modulus: pulumi.Input[Optional[_builtins.int]] = None,
-                 regex: pulumi.Input[Optional[_builtins.str]] = None,
-                 replacement: pulumi.Input[Optional[_builtins.str]] = None,
-                 separator: pulumi.Input[Optional[_builtins.str]] = None,
-                 source_labels: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 target_label: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-        scraped samples and remote write samples.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-
-        :param pulumi.Input[_builtins.str] action: action to perform based on the regex matching.
-
-               `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-               `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-               Default: "Replace"
-        :param pulumi.Input[_builtins.int] modulus: modulus to take of the hash of the source label values.
-
-               Only applicable when the action is `HashMod`.
-        :param pulumi.Input[_builtins.str] regex: regex defines the regular expression against which the extracted value is matched.
-        :param pulumi.Input[_builtins.str] replacement: replacement value against which a Replace action is performed if the
-               regular expression matches.
-
-               Regex capture groups are available.
-        :param pulumi.Input[_builtins.str] separator: separator defines the string between concatenated SourceLabels.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] source_labels: sourceLabels defines the source labels select values from existing labels. Their content is
-               concatenated using the configured Separator and matched against the
-               configured regular expression.
-        :param pulumi.Input[_builtins.str] target_label: targetLabel defines the label to which the resulting string is written in a replacement.
-
-               It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-               `KeepEqual` and `DropEqual` actions.
-
-               Regex capture groups are available.
-        """
-        if action is not None:
-            pulumi.set(__self__, "action", action)
-        if modulus is not None:
-            pulumi.set(__self__, "modulus", modulus)
-        if regex is not None:
-            pulumi.set(__self__, "regex", regex)
-        if replacement is not None:
-            pulumi.set(__self__, "replacement", replacement)
-        if separator is not None:
-            pulumi.set(__self__, "separator", separator)
-        if source_labels is not None:
-            pulumi.set(__self__, "source_labels", source_labels)
-        if target_label is not None:
-            pulumi.set(__self__, "target_label", target_label)
-
-    @_builtins.property
-    @pulumi.getter
-    def action(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        action to perform based on the regex matching.
-
-        `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-        `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-        Default: "Replace"
-        """
-        return pulumi.get(self, "action")
-
-    @action.setter
-    def action(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "action", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def modulus(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        modulus to take of the hash of the source label values.
-
-        Only applicable when the action is `HashMod`.
-        """
-        return pulumi.get(self, "modulus")
-
-    @modulus.setter
-    def modulus(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "modulus", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def regex(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        regex defines the regular expression against which the extracted value is matched.
-        """
-        return pulumi.get(self, "regex")
-
-    @regex.setter
-    def regex(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "regex", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def replacement(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        replacement value against which a Replace action is performed if the
-        regular expression matches.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "replacement")
-
-    @replacement.setter
-    def replacement(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "replacement", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def separator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        separator defines the string between concatenated SourceLabels.
-        """
-        return pulumi.get(self, "separator")
-
-    @separator.setter
-    def separator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "separator", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sourceLabels")
-    def source_labels(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        sourceLabels defines the source labels select values from existing labels. Their content is
-        concatenated using the configured Separator and matched against the
-        configured regular expression.
-        """
-        return pulumi.get(self, "source_labels")
-
-    @source_labels.setter
-    def source_labels(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "source_labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabel")
-    def target_label(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        targetLabel defines the label to which the resulting string is written in a replacement.
-
-        It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-        `KeepEqual` and `DropEqual` actions.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "target_label")
-
-    @target_label.setter
-    def target_label(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "target_label", value)
-
-
-class ServiceMonitorSpecEndpointsMetricRelabelingsArgsDict(TypedDict):
-    """
-    RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-    scraped samples and remote write samples.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    action: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    action to perform based on the regex matching.
-
-    `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-    `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-    Default: "Replace"
-    """
-    modulus: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    modulus to take of the hash of the source label values.
-
-    Only applicable when the action is `HashMod`.
-    """
-    regex: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    regex defines the regular expression against which the extracted value is matched.
-    """
-    replacement: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    replacement value against which a Replace action is performed if the
-    regular expression matches.
-
-    Regex capture groups are available.
-    """
-    separator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    separator defines the string between concatenated SourceLabels.
-    """
-    source_labels: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    sourceLabels defines the source labels select values from existing labels. Their content is
-    concatenated using the configured Separator and matched against the
-    configured regular expression.
-    """
-    target_label: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    targetLabel defines the label to which the resulting string is written in a replacement.
-
-    It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-    `KeepEqual` and `DropEqual` actions.
-
-    Regex capture groups are available.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsMetricRelabelingsArgs:
-    def __init__(__self__, *,
-                 action: pulumi.Input[Optional[_builtins.str]] = None,
-                 modulus: pulumi.Input[Optional[_builtins.int]] = None,
-                 regex: pulumi.Input[Optional[_builtins.str]] = None,
-                 replacement: pulumi.Input[Optional[_builtins.str]] = None,
-                 separator: pulumi.Input[Optional[_builtins.str]] = None,
-                 source_labels: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 target_label: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-        scraped samples and remote write samples.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-
-        :param pulumi.Input[_builtins.str] action: action to perform based on the regex matching.
-
-               `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-               `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-               Default: "Replace"
-        :param pulumi.Input[_builtins.int] modulus: modulus to take of the hash of the source label values.
-
-               Only applicable when the action is `HashMod`.
-        :param pulumi.Input[_builtins.str] regex: regex defines the regular expression against which the extracted value is matched.
-        :param pulumi.Input[_builtins.str] replacement: replacement value against which a Replace action is performed if the
-               regular expression matches.
-
-               Regex capture groups are available.
-        :param pulumi.Input[_builtins.str] separator: separator defines the string between concatenated SourceLabels.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] source_labels: sourceLabels defines the source labels select values from existing labels. Their content is
-               concatenated using the configured Separator and matched against the
-               configured regular expression.
-        :param pulumi.Input[_builtins.str] target_label: targetLabel defines the label to which the resulting string is written in a replacement.
-
-               It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-               `KeepEqual` and `DropEqual` actions.
-
-               Regex capture groups are available.
-        """
-        if action is not None:
-            pulumi.set(__self__, "action", action)
-        if modulus is not None:
-            pulumi.set(__self__, "modulus", modulus)
-        if regex is not None:
-            pulumi.set(__self__, "regex", regex)
-        if replacement is not None:
-            pulumi.set(__self__, "replacement", replacement)
-        if separator is not None:
-            pulumi.set(__self__, "separator", separator)
-        if source_labels is not None:
-            pulumi.set(__self__, "source_labels", source_labels)
-        if target_label is not None:
-            pulumi.set(__self__, "target_label", target_label)
-
-    @_builtins.property
-    @pulumi.getter
-    def action(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        action to perform based on the regex matching.
-
-        `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-        `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-        Default: "Replace"
-        """
-        return pulumi.get(self, "action")
-
-    @action.setter
-    def action(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "action", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def modulus(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        modulus to take of the hash of the source label values.
-
-        Only applicable when the action is `HashMod`.
-        """
-        return pulumi.get(self, "modulus")
-
-    @modulus.setter
-    def modulus(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "modulus", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def regex(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        regex defines the regular expression against which the extracted value is matched.
-        """
-        return pulumi.get(self, "regex")
-
-    @regex.setter
-    def regex(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "regex", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def replacement(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        replacement value against which a Replace action is performed if the
-        regular expression matches.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "replacement")
-
-    @replacement.setter
-    def replacement(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "replacement", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def separator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        separator defines the string between concatenated SourceLabels.
-        """
-        return pulumi.get(self, "separator")
-
-    @separator.setter
-    def separator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "separator", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sourceLabels")
-    def source_labels(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        sourceLabels defines the source labels select values from existing labels. Their content is
-        concatenated using the configured Separator and matched against the
-        configured regular expression.
-        """
-        return pulumi.get(self, "source_labels")
-
-    @source_labels.setter
-    def source_labels(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "source_labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabel")
-    def target_label(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        targetLabel defines the label to which the resulting string is written in a replacement.
-
-        It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-        `KeepEqual` and `DropEqual` actions.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "target_label")
-
-    @target_label.setter
-    def target_label(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "target_label", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgsDict(TypedDict):
-    """
-    clientId defines a key of a Secret or ConfigMap containing the
-    OAuth2 client's ID.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgs']]]
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgs']] = None,
-                 secret: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgs']] = None):
-        """
-        clientId defines a key of a Secret or ConfigMap containing the
-        OAuth2 client's ID.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2ClientIdSecretArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2ClientIdSecretArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2ClientIdArgsDict(TypedDict):
-    """
-    clientId defines a key of a Secret or ConfigMap containing the
-    OAuth2 client's ID.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdSecretArgs']]]
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2ClientIdArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapArgs']] = None,
-                 secret: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdSecretArgs']] = None):
-        """
-        clientId defines a key of a Secret or ConfigMap containing the
-        OAuth2 client's ID.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdSecretArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdSecretArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2ClientSecretPatchArgsDict(TypedDict):
-    """
-    clientSecret defines a key of a Secret containing the OAuth2
-    client's secret.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2ClientSecretPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        clientSecret defines a key of a Secret containing the OAuth2
-        client's secret.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2ClientSecretArgsDict(TypedDict):
-    """
-    clientSecret defines a key of a Secret containing the OAuth2
-    client's secret.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2ClientSecretArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        clientSecret defines a key of a Secret containing the OAuth2
-        client's secret.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2PatchArgsDict(TypedDict):
-    """
-    oauth2 defines the OAuth2 settings used by the client.
-
-    It requires Prometheus >= 2.27.0.
-
-    Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
-    """
-    client_id: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgs']]]
-    client_secret: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientSecretPatchArgs']]]
-    endpoint_params: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    endpointParams configures the HTTP parameters to append to the token
-    URL.
-    """
-    no_proxy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-    that should be excluded from proxying. IP and domain names can
-    contain port numbers.
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_connect_header: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs']]]]]]]
-    """
-    proxyConnectHeader optionally specifies headers to send to
-    proxies during CONNECT requests.
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_from_environment: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_url: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    proxyUrl defines the HTTP proxy server to use.
-    """
-    scopes: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    scopes defines the OAuth2 scopes used for the token request.
-    """
-    tls_config: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigPatchArgs']]]
-    token_url: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    tokenUrl defines the URL to fetch the token from.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2PatchArgs:
-    def __init__(__self__, *,
-                 client_id: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgs']] = None,
-                 client_secret: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientSecretPatchArgs']] = None,
-                 endpoint_params: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 no_proxy: pulumi.Input[Optional[_builtins.str]] = None,
-                 proxy_connect_header: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs']]]]]] = None,
-                 proxy_from_environment: pulumi.Input[Optional[_builtins.bool]] = None,
-                 proxy_url: pulumi.Input[Optional[_builtins.str]] = None,
-                 scopes: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 tls_config: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigPatchArgs']] = None,
-                 token_url: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        oauth2 defines the OAuth2 settings used by the client.
-
-        It requires Prometheus >= 2.27.0.
-
-        Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
-
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] endpoint_params: endpointParams configures the HTTP parameters to append to the token
-               URL.
-        :param pulumi.Input[_builtins.str] no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-               that should be excluded from proxying. IP and domain names can
-               contain port numbers.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs']]]]] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
-               proxies during CONNECT requests.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[_builtins.bool] proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[_builtins.str] proxy_url: proxyUrl defines the HTTP proxy server to use.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] scopes: scopes defines the OAuth2 scopes used for the token request.
-        :param pulumi.Input[_builtins.str] token_url: tokenUrl defines the URL to fetch the token from.
-        """
-        if client_id is not None:
-            pulumi.set(__self__, "client_id", client_id)
-        if client_secret is not None:
-            pulumi.set(__self__, "client_secret", client_secret)
-        if endpoint_params is not None:
-            pulumi.set(__self__, "endpoint_params", endpoint_params)
-        if no_proxy is not None:
-            pulumi.set(__self__, "no_proxy", no_proxy)
-        if proxy_connect_header is not None:
-            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
-        if proxy_from_environment is not None:
-            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
-        if proxy_url is not None:
-            pulumi.set(__self__, "proxy_url", proxy_url)
-        if scopes is not None:
-            pulumi.set(__self__, "scopes", scopes)
-        if tls_config is not None:
-            pulumi.set(__self__, "tls_config", tls_config)
-        if token_url is not None:
-            pulumi.set(__self__, "token_url", token_url)
-
-    @_builtins.property
-    @pulumi.getter(name="clientId")
-    def client_id(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgs']]:
-        return pulumi.get(self, "client_id")
-
-    @client_id.setter
-    def client_id(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgs']]):
-        pulumi.set(self, "client_id", value)
-
-    @_builtins.property
-    @pulumi.getter(name="clientSecret")
-    def client_secret(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientSecretPatchArgs']]:
-        return pulumi.get(self, "client_secret")
-
-    @client_secret.setter
-    def client_secret(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientSecretPatchArgs']]):
-        pulumi.set(self, "client_secret", value)
-
-    @_builtins.property
-    @pulumi.getter(name="endpointParams")
-    def endpoint_params(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        endpointParams configures the HTTP parameters to append to the token
-        URL.
-        """
-        return pulumi.get(self, "endpoint_params")
-
-    @endpoint_params.setter
-    def endpoint_params(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "endpoint_params", value)
-
-    @_builtins.property
-    @pulumi.getter(name="noProxy")
-    def no_proxy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-        that should be excluded from proxying. IP and domain names can
-        contain port numbers.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "no_proxy")
-
-    @no_proxy.setter
-    def no_proxy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "no_proxy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyConnectHeader")
-    def proxy_connect_header(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs']]]]]]:
-        """
-        proxyConnectHeader optionally specifies headers to send to
-        proxies during CONNECT requests.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_connect_header")
-
-    @proxy_connect_header.setter
-    def proxy_connect_header(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs']]]]]]):
-        pulumi.set(self, "proxy_connect_header", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyFromEnvironment")
-    def proxy_from_environment(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_from_environment")
-
-    @proxy_from_environment.setter
-    def proxy_from_environment(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "proxy_from_environment", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyUrl")
-    def proxy_url(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        proxyUrl defines the HTTP proxy server to use.
-        """
-        return pulumi.get(self, "proxy_url")
-
-    @proxy_url.setter
-    def proxy_url(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "proxy_url", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def scopes(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        scopes defines the OAuth2 scopes used for the token request.
-        """
-        return pulumi.get(self, "scopes")
-
-    @scopes.setter
-    def scopes(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "scopes", value)
-
-    @_builtins.property
-    @pulumi.getter(name="tlsConfig")
-    def tls_config(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigPatchArgs']]:
-        return pulumi.get(self, "tls_config")
-
-    @tls_config.setter
-    def tls_config(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigPatchArgs']]):
-        pulumi.set(self, "tls_config", value)
-
-    @_builtins.property
-    @pulumi.getter(name="tokenUrl")
-    def token_url(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        tokenUrl defines the URL to fetch the token from.
-        """
-        return pulumi.get(self, "token_url")
-
-    @token_url.setter
-    def token_url(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "token_url", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgsDict(TypedDict):
-    """
-    SecretKeySelector selects a key of a Secret.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        SecretKeySelector selects a key of a Secret.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatchArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatchArgsDict(TypedDict):
-    """
-    ca defines the Certificate authority used when verifying server certificates.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatchArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatchArgs']]]
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatchArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatchArgs']] = None,
-                 secret: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatchArgs']] = None):
-        """
-        ca defines the Certificate authority used when verifying server certificates.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatchArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatchArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatchArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatchArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatchArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCaArgsDict(TypedDict):
-    """
-    ca defines the Certificate authority used when verifying server certificates.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretArgs']]]
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCaArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapArgs']] = None,
-                 secret: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretArgs']] = None):
-        """
-        ca defines the Certificate authority used when verifying server certificates.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatchArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatchArgsDict(TypedDict):
-    """
-    cert defines the Client certificate to present when doing client-authentication.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatchArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatchArgs']]]
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatchArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatchArgs']] = None,
-                 secret: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatchArgs']] = None):
-        """
-        cert defines the Client certificate to present when doing client-authentication.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatchArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatchArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatchArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatchArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatchArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCertArgsDict(TypedDict):
-    """
-    cert defines the Client certificate to present when doing client-authentication.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretArgs']]]
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCertArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapArgs']] = None,
-                 secret: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretArgs']] = None):
-        """
-        cert defines the Client certificate to present when doing client-authentication.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatchArgsDict(TypedDict):
-    """
-    keySecret defines the Secret containing the client key file for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        keySecret defines the Secret containing the client key file for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretArgsDict(TypedDict):
-    """
-    keySecret defines the Secret containing the client key file for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        keySecret defines the Secret containing the client key file for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2TlsConfigPatchArgsDict(TypedDict):
-    """
-    tlsConfig defines the TLS configuration to use when connecting to the OAuth2 server.
-    It requires Prometheus >= v2.43.0.
-    """
-    ca: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatchArgs']]]
-    cert: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatchArgs']]]
-    insecure_skip_verify: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    insecureSkipVerify defines how to disable target certificate validation.
-    """
-    key_secret: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatchArgs']]]
-    max_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    maxVersion defines the maximum acceptable TLS version.
-
-    It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-    """
-    min_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    minVersion defines the minimum acceptable TLS version.
-
-    It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-    """
-    server_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    serverName is used to verify the hostname for the targets.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigPatchArgs:
-    def __init__(__self__, *,
-                 ca: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatchArgs']] = None,
-                 cert: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatchArgs']] = None,
-                 insecure_skip_verify: pulumi.Input[Optional[_builtins.bool]] = None,
-                 key_secret: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatchArgs']] = None,
-                 max_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 min_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 server_name: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        tlsConfig defines the TLS configuration to use when connecting to the OAuth2 server.
-        It requires Prometheus >= v2.43.0.
-
-        :param pulumi.Input[_builtins.bool] insecure_skip_verify: insecureSkipVerify defines how to disable target certificate validation.
-        :param pulumi.Input[_builtins.str] max_version: maxVersion defines the maximum acceptable TLS version.
-
-               It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        :param pulumi.Input[_builtins.str] min_version: minVersion defines the minimum acceptable TLS version.
-
-               It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        :param pulumi.Input[_builtins.str] server_name: serverName is used to verify the hostname for the targets.
-        """
-        if ca is not None:
-            pulumi.set(__self__, "ca", ca)
-        if cert is not None:
-            pulumi.set(__self__, "cert", cert)
-        if insecure_skip_verify is not None:
-            pulumi.set(__self__, "insecure_skip_verify", insecure_skip_verify)
-        if key_secret is not None:
-            pulumi.set(__self__, "key_secret", key_secret)
-        if max_version is not None:
-            pulumi.set(__self__, "max_version", max_version)
-        if min_version is not None:
-            pulumi.set(__self__, "min_version", min_version)
-        if server_name is not None:
-            pulumi.set(__self__, "server_name", server_name)
-
-    @_builtins.property
-    @pulumi.getter
-    def ca(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatchArgs']]:
-        return pulumi.get(self, "ca")
-
-    @ca.setter
-    def ca(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatchArgs']]):
-        pulumi.set(self, "ca", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def cert(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatchArgs']]:
-        return pulumi.get(self, "cert")
-
-    @cert.setter
-    def cert(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatchArgs']]):
-        pulumi.set(self, "cert", value)
-
-    @_builtins.property
-    @pulumi.getter(name="insecureSkipVerify")
-    def insecure_skip_verify(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        insecureSkipVerify defines how to disable target certificate validation.
-        """
-        return pulumi.get(self, "insecure_skip_verify")
-
-    @insecure_skip_verify.setter
-    def insecure_skip_verify(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "insecure_skip_verify", value)
-
-    @_builtins.property
-    @pulumi.getter(name="keySecret")
-    def key_secret(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatchArgs']]:
-        return pulumi.get(self, "key_secret")
-
-    @key_secret.setter
-    def key_secret(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatchArgs']]):
-        pulumi.set(self, "key_secret", value)
-
-    @_builtins.property
-    @pulumi.getter(name="maxVersion")
-    def max_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        maxVersion defines the maximum acceptable TLS version.
-
-        It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        """
-        return pulumi.get(self, "max_version")
-
-    @max_version.setter
-    def max_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "max_version", value)
-
-    @_builtins.property
-    @pulumi.getter(name="minVersion")
-    def min_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        minVersion defines the minimum acceptable TLS version.
-
-        It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        """
-        return pulumi.get(self, "min_version")
-
-    @min_version.setter
-    def min_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "min_version", value)
-
-    @_builtins.property
-    @pulumi.getter(name="serverName")
-    def server_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        serverName is used to verify the hostname for the targets.
-        """
-        return pulumi.get(self, "server_name")
-
-    @server_name.setter
-    def server_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "server_name", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2TlsConfigArgsDict(TypedDict):
-    """
-    tlsConfig defines the TLS configuration to use when connecting to the OAuth2 server.
-    It requires Prometheus >= v2.43.0.
-    """
-    ca: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaArgs']]]
-    cert: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertArgs']]]
-    insecure_skip_verify: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    insecureSkipVerify defines how to disable target certificate validation.
-    """
-    key_secret: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretArgs']]]
-    max_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    maxVersion defines the maximum acceptable TLS version.
-
-    It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-    """
-    min_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    minVersion defines the minimum acceptable TLS version.
-
-    It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-    """
-    server_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    serverName is used to verify the hostname for the targets.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigArgs:
-    def __init__(__self__, *,
-                 ca: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaArgs']] = None,
-                 cert: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertArgs']] = None,
-                 insecure_skip_verify: pulumi.Input[Optional[_builtins.bool]] = None,
-                 key_secret: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretArgs']] = None,
-                 max_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 min_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 server_name: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        tlsConfig defines the TLS configuration to use when connecting to the OAuth2 server.
-        It requires Prometheus >= v2.43.0.
-
-        :param pulumi.Input[_builtins.bool] insecure_skip_verify: insecureSkipVerify defines how to disable target certificate validation.
-        :param pulumi.Input[_builtins.str] max_version: maxVersion defines the maximum acceptable TLS version.
-
-               It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        :param pulumi.Input[_builtins.str] min_version: minVersion defines the minimum acceptable TLS version.
-
-               It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        :param pulumi.Input[_builtins.str] server_name: serverName is used to verify the hostname for the targets.
-        """
-        if ca is not None:
-            pulumi.set(__self__, "ca", ca)
-        if cert is not None:
-            pulumi.set(__self__, "cert", cert)
-        if insecure_skip_verify is not None:
-            pulumi.set(__self__, "insecure_skip_verify", insecure_skip_verify)
-        if key_secret is not None:
-            pulumi.set(__self__, "key_secret", key_secret)
-        if max_version is not None:
-            pulumi.set(__self__, "max_version", max_version)
-        if min_version is not None:
-            pulumi.set(__self__, "min_version", min_version)
-        if server_name is not None:
-            pulumi.set(__self__, "server_name", server_name)
-
-    @_builtins.property
-    @pulumi.getter
-    def ca(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaArgs']]:
-        return pulumi.get(self, "ca")
-
-    @ca.setter
-    def ca(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCaArgs']]):
-        pulumi.set(self, "ca", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def cert(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertArgs']]:
-        return pulumi.get(self, "cert")
-
-    @cert.setter
-    def cert(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigCertArgs']]):
-        pulumi.set(self, "cert", value)
-
-    @_builtins.property
-    @pulumi.getter(name="insecureSkipVerify")
-    def insecure_skip_verify(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        insecureSkipVerify defines how to disable target certificate validation.
-        """
-        return pulumi.get(self, "insecure_skip_verify")
-
-    @insecure_skip_verify.setter
-    def insecure_skip_verify(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "insecure_skip_verify", value)
-
-    @_builtins.property
-    @pulumi.getter(name="keySecret")
-    def key_secret(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretArgs']]:
-        return pulumi.get(self, "key_secret")
-
-    @key_secret.setter
-    def key_secret(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretArgs']]):
-        pulumi.set(self, "key_secret", value)
-
-    @_builtins.property
-    @pulumi.getter(name="maxVersion")
-    def max_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        maxVersion defines the maximum acceptable TLS version.
-
-        It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        """
-        return pulumi.get(self, "max_version")
-
-    @max_version.setter
-    def max_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "max_version", value)
-
-    @_builtins.property
-    @pulumi.getter(name="minVersion")
-    def min_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        minVersion defines the minimum acceptable TLS version.
-
-        It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        """
-        return pulumi.get(self, "min_version")
-
-    @min_version.setter
-    def min_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "min_version", value)
-
-    @_builtins.property
-    @pulumi.getter(name="serverName")
-    def server_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        serverName is used to verify the hostname for the targets.
-        """
-        return pulumi.get(self, "server_name")
-
-    @server_name.setter
-    def server_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "server_name", value)
-
-
-class ServiceMonitorSpecEndpointsOauth2ArgsDict(TypedDict):
-    """
-    oauth2 defines the OAuth2 settings used by the client.
-
-    It requires Prometheus >= 2.27.0.
-
-    Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
-    """
-    client_id: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdArgs']]]
-    client_secret: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientSecretArgs']]]
-    endpoint_params: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    endpointParams configures the HTTP parameters to append to the token
-    URL.
-    """
-    no_proxy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-    that should be excluded from proxying. IP and domain names can
-    contain port numbers.
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_connect_header: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs']]]]]]]
-    """
-    proxyConnectHeader optionally specifies headers to send to
-    proxies during CONNECT requests.
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_from_environment: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_url: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    proxyUrl defines the HTTP proxy server to use.
-    """
-    scopes: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    scopes defines the OAuth2 scopes used for the token request.
-    """
-    tls_config: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigArgs']]]
-    token_url: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    tokenUrl defines the URL to fetch the token from.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsOauth2Args:
-    def __init__(__self__, *,
-                 client_id: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdArgs']] = None,
-                 client_secret: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientSecretArgs']] = None,
-                 endpoint_params: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 no_proxy: pulumi.Input[Optional[_builtins.str]] = None,
-                 proxy_connect_header: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs']]]]]] = None,
-                 proxy_from_environment: pulumi.Input[Optional[_builtins.bool]] = None,
-                 proxy_url: pulumi.Input[Optional[_builtins.str]] = None,
-                 scopes: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 tls_config: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigArgs']] = None,
-                 token_url: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        oauth2 defines the OAuth2 settings used by the client.
-
-        It requires Prometheus >= 2.27.0.
-
-        Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
-
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] endpoint_params: endpointParams configures the HTTP parameters to append to the token
-               URL.
-        :param pulumi.Input[_builtins.str] no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-               that should be excluded from proxying. IP and domain names can
-               contain port numbers.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs']]]]] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
-               proxies during CONNECT requests.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[_builtins.bool] proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[_builtins.str] proxy_url: proxyUrl defines the HTTP proxy server to use.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] scopes: scopes defines the OAuth2 scopes used for the token request.
-        :param pulumi.Input[_builtins.str] token_url: tokenUrl defines the URL to fetch the token from.
-        """
-        if client_id is not None:
-            pulumi.set(__self__, "client_id", client_id)
-        if client_secret is not None:
-            pulumi.set(__self__, "client_secret", client_secret)
-        if endpoint_params is not None:
-            pulumi.set(__self__, "endpoint_params", endpoint_params)
-        if no_proxy is not None:
-            pulumi.set(__self__, "no_proxy", no_proxy)
-        if proxy_connect_header is not None:
-            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
-        if proxy_from_environment is not None:
-            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
-        if proxy_url is not None:
-            pulumi.set(__self__, "proxy_url", proxy_url)
-        if scopes is not None:
-            pulumi.set(__self__, "scopes", scopes)
-        if tls_config is not None:
-            pulumi.set(__self__, "tls_config", tls_config)
-        if token_url is not None:
-            pulumi.set(__self__, "token_url", token_url)
-
-    @_builtins.property
-    @pulumi.getter(name="clientId")
-    def client_id(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdArgs']]:
-        return pulumi.get(self, "client_id")
-
-    @client_id.setter
-    def client_id(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientIdArgs']]):
-        pulumi.set(self, "client_id", value)
-
-    @_builtins.property
-    @pulumi.getter(name="clientSecret")
-    def client_secret(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientSecretArgs']]:
-        return pulumi.get(self, "client_secret")
-
-    @client_secret.setter
-    def client_secret(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2ClientSecretArgs']]):
-        pulumi.set(self, "client_secret", value)
-
-    @_builtins.property
-    @pulumi.getter(name="endpointParams")
-    def endpoint_params(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        endpointParams configures the HTTP parameters to append to the token
-        URL.
-        """
-        return pulumi.get(self, "endpoint_params")
-
-    @endpoint_params.setter
-    def endpoint_params(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "endpoint_params", value)
-
-    @_builtins.property
-    @pulumi.getter(name="noProxy")
-    def no_proxy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-        that should be excluded from proxying. IP and domain names can
-        contain port numbers.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "no_proxy")
-
-    @no_proxy.setter
-    def no_proxy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "no_proxy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyConnectHeader")
-    def proxy_connect_header(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs']]]]]]:
-        """
-        proxyConnectHeader optionally specifies headers to send to
-        proxies during CONNECT requests.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_connect_header")
-
-    @proxy_connect_header.setter
-    def proxy_connect_header(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs']]]]]]):
-        pulumi.set(self, "proxy_connect_header", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyFromEnvironment")
-    def proxy_from_environment(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_from_environment")
-
-    @proxy_from_environment.setter
-    def proxy_from_environment(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "proxy_from_environment", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyUrl")
-    def proxy_url(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        proxyUrl defines the HTTP proxy server to use.
-        """
-        return pulumi.get(self, "proxy_url")
-
-    @proxy_url.setter
-    def proxy_url(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "proxy_url", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def scopes(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        scopes defines the OAuth2 scopes used for the token request.
-        """
-        return pulumi.get(self, "scopes")
-
-    @scopes.setter
-    def scopes(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "scopes", value)
-
-    @_builtins.property
-    @pulumi.getter(name="tlsConfig")
-    def tls_config(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigArgs']]:
-        return pulumi.get(self, "tls_config")
-
-    @tls_config.setter
-    def tls_config(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2TlsConfigArgs']]):
-        pulumi.set(self, "tls_config", value)
-
-    @_builtins.property
-    @pulumi.getter(name="tokenUrl")
-    def token_url(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        tokenUrl defines the URL to fetch the token from.
-        """
-        return pulumi.get(self, "token_url")
-
-    @token_url.setter
-    def token_url(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "token_url", value)
-
-
-class ServiceMonitorSpecEndpointsPatchArgsDict(TypedDict):
-    """
-    Endpoint defines an endpoint serving Prometheus metrics to be scraped by
-    Prometheus.
-    """
-    authorization: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsAuthorizationPatchArgs']]]
-    basic_auth: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthPatchArgs']]]
-    bearer_token_file: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    bearerTokenFile defines the file to read bearer token for scraping the target.
-
-    Deprecated: use `authorization` instead.
-    """
-    bearer_token_secret: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsBearerTokenSecretPatchArgs']]]
-    enable_http2: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    enableHttp2 can be used to disable HTTP2.
-    """
-    filter_running: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    filterRunning when true, the pods which are not running (e.g. either in Failed or
-    Succeeded state) are dropped during the target discovery.
-
-    If unset, the filtering is enabled.
-
-    More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-    """
-    follow_redirects: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    followRedirects defines whether the client should follow HTTP 3xx
-    redirects.
-    """
-    honor_labels: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    honorLabels defines when true the metric's labels when they collide
-    with the target's labels.
-    """
-    honor_timestamps: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    honorTimestamps defines whether Prometheus preserves the timestamps
-    when exposed by the target.
-    """
-    interval: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    interval at which Prometheus scrapes the metrics from the target.
-
-    If empty, Prometheus uses the global scrape interval.
-    """
-    metric_relabelings: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgs']]]]]
-    """
-    metricRelabelings defines the relabeling rules to apply to the
-    samples before ingestion.
-    """
-    no_proxy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-    that should be excluded from proxying. IP and domain names can
-    contain port numbers.
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    oauth2: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2PatchArgs']]]
-    params: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]]]
-    """
-    params define optional HTTP URL parameters.
-    """
-    path: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    path defines the HTTP path from which to scrape for metrics.
-
-    If empty, Prometheus uses the default value (e.g. `/metrics`).
-    """
-    port: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    port defines the name of the Service port which this endpoint refers to.
-
-    It takes precedence over `targetPort`.
-    """
-    proxy_connect_header: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsProxyConnectHeaderArgs']]]]]]]
-    """
-    proxyConnectHeader optionally specifies headers to send to
-    proxies during CONNECT requests.
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_from_environment: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_url: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    proxyUrl defines the HTTP proxy server to use.
-    """
-    relabelings: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsRelabelingsPatchArgs']]]]]
-    """
-    relabelings defines the relabeling rules to apply the target's
-    metadata labels.
-
-    The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-    The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    scheme: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    scheme defines the HTTP scheme to use when scraping the metrics.
-    """
-    scrape_timeout: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-    If empty, Prometheus uses the global scrape timeout unless it is less
-    than the target's scrape interval value in which the latter is used.
-    The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-    """
-    target_port: NotRequired[pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]]
-    """
-    targetPort defines the name or number of the target port of the `Pod` object behind the
-    Service. The port must be specified with the container's port property.
-    """
-    tls_config: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigPatchArgs']]]
-    track_timestamps_staleness: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    trackTimestampsStaleness defines whether Prometheus tracks staleness of
-    the metrics that have an explicit timestamp present in scraped data.
-    Has no effect if `honorTimestamps` is false.
-
-    It requires Prometheus >= v2.48.0.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsPatchArgs:
-    def __init__(__self__, *,
-                 authorization: pulumi.Input[Optional['ServiceMonitorSpecEndpointsAuthorizationPatchArgs']] = None,
-                 basic_auth: pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthPatchArgs']] = None,
-                 bearer_token_file: pulumi.Input[Optional[_builtins.str]] = None,
-                 bearer_token_secret: pulumi.Input[Optional['ServiceMonitorSpecEndpointsBearerTokenSecretPatchArgs']] = None,
-                 enable_http2: pulumi.Input[Optional[_builtins.bool]] = None,
-                 filter_running: pulumi.Input[Optional[_builtins.bool]] = None,
-                 follow_redirects: pulumi.Input[Optional[_builtins.bool]] = None,
-                 honor_labels: pulumi.Input[Optional[_builtins.bool]] = None,
-                 honor_timestamps: pulumi.Input[Optional[_builtins.bool]] = None,
-                 interval: pulumi.Input[Optional[_builtins.str]] = None,
-                 metric_relabelings: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgs']]]] = None,
-                 no_proxy: pulumi.Input[Optional[_builtins.str]] = None,
-                 oauth2: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2PatchArgs']] = None,
-                 params: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]] = None,
-                 path: pulumi.Input[Optional[_builtins.str]] = None,
-                 port: pulumi.Input[Optional[_builtins.str]] = None,
-                 proxy_connect_header: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsProxyConnectHeaderArgs']]]]]] = None,
-                 proxy_from_environment: pulumi.Input[Optional[_builtins.bool]] = None,
-                 proxy_url: pulumi.Input[Optional[_builtins.str]] = None,
-                 relabelings: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsRelabelingsPatchArgs']]]] = None,
-                 scheme: pulumi.Input[Optional[_builtins.str]] = None,
-                 scrape_timeout: pulumi.Input[Optional[_builtins.str]] = None,
-                 target_port: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]] = None,
-                 tls_config: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigPatchArgs']] = None,
-                 track_timestamps_staleness: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        Endpoint defines an endpoint serving Prometheus metrics to be scraped by
-        Prometheus.
-
-        :param pulumi.Input[_builtins.str] bearer_token_file: bearerTokenFile defines the file to read bearer token for scraping the target.
-
-               Deprecated: use `authorization` instead.
-        :param pulumi.Input[_builtins.bool] enable_http2: enableHttp2 can be used to disable HTTP2.
-        :param pulumi.Input[_builtins.bool] filter_running: filterRunning when true, the pods which are not running (e.g. either in Failed or
-               Succeeded state) are dropped during the target discovery.
-
-               If unset, the filtering is enabled.
-
-               More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-        :param pulumi.Input[_builtins.bool] follow_redirects: followRedirects defines whether the client should follow HTTP 3xx
-               redirects.
-        :param pulumi.Input[_builtins.bool] honor_labels: honorLabels defines when true the metric's labels when they collide
-               with the target's labels.
-        :param pulumi.Input[_builtins.bool] honor_timestamps: honorTimestamps defines whether Prometheus preserves the timestamps
-               when exposed by the target.
-        :param pulumi.Input[_builtins.str] interval: interval at which Prometheus scrapes the metrics from the target.
-
-               If empty, Prometheus uses the global scrape interval.
-        :param pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgs']]] metric_relabelings: metricRelabelings defines the relabeling rules to apply to the
-               samples before ingestion.
-        :param pulumi.Input[_builtins.str] no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-               that should be excluded from proxying. IP and domain names can
-               contain port numbers.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]] params: params define optional HTTP URL parameters.
-        :param pulumi.Input[_builtins.str] path: path defines the HTTP path from which to scrape for metrics.
-
-               If empty, Prometheus uses the default value (e.g. `/metrics`).
-        :param pulumi.Input[_builtins.str] port: port defines the name of the Service port which this endpoint refers to.
-
-               It takes precedence over `targetPort`.
-        :param pulumi.Input[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsProxyConnectHeaderArgs']]]]] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
-               proxies during CONNECT requests.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[_builtins.bool] proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[_builtins.str] proxy_url: proxyUrl defines the HTTP proxy server to use.
-        :param pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsRelabelingsPatchArgs']]] relabelings: relabelings defines the relabeling rules to apply the target's
-               metadata labels.
-
-               The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-               The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-               More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-        :param pulumi.Input[_builtins.str] scheme: scheme defines the HTTP scheme to use when scraping the metrics.
-        :param pulumi.Input[_builtins.str] scrape_timeout: scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-               If empty, Prometheus uses the global scrape timeout unless it is less
-               than the target's scrape interval value in which the latter is used.
-               The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-        :param pulumi.Input[Union[_builtins.int, _builtins.str]] target_port: targetPort defines the name or number of the target port of the `Pod` object behind the
-               Service. The port must be specified with the container's port property.
-        :param pulumi.Input[_builtins.bool] track_timestamps_staleness: trackTimestampsStaleness defines whether Prometheus tracks staleness of
-               the metrics that have an explicit timestamp present in scraped data.
-               Has no effect if `honorTimestamps` is false.
-
-               It requires Prometheus >= v2.48.0.
-        """
-        if authorization is not None:
-            pulumi.set(__self__, "authorization", authorization)
-        if basic_auth is not None:
-            pulumi.set(__self__, "basic_auth", basic_auth)
-        if bearer_token_file is not None:
-            pulumi.set(__self__, "bearer_token_file", bearer_token_file)
-        if bearer_token_secret is not None:
-            pulumi.set(__self__, "bearer_token_secret", bearer_token_secret)
-        if enable_http2 is not None:
-            pulumi.set(__self__, "enable_http2", enable_http2)
-        if filter_running is not None:
-            pulumi.set(__self__, "filter_running", filter_running)
-        if follow_redirects is not None:
-            pulumi.set(__self__, "follow_redirects", follow_redirects)
-        if honor_labels is not None:
-            pulumi.set(__self__, "honor_labels", honor_labels)
-        if honor_timestamps is not None:
-            pulumi.set(__self__, "honor_timestamps", honor_timestamps)
-        if interval is not None:
-            pulumi.set(__self__, "interval", interval)
-        if metric_relabelings is not None:
-            pulumi.set(__self__, "metric_relabelings", metric_relabelings)
-        if no_proxy is not None:
-            pulumi.set(__self__, "no_proxy", no_proxy)
-        if oauth2 is not None:
-            pulumi.set(__self__, "oauth2", oauth2)
-        if params is not None:
-            pulumi.set(__self__, "params", params)
-        if path is not None:
-            pulumi.set(__self__, "path", path)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if proxy_connect_header is not None:
-            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
-        if proxy_from_environment is not None:
-            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
-        if proxy_url is not None:
-            pulumi.set(__self__, "proxy_url", proxy_url)
-        if relabelings is not None:
-            pulumi.set(__self__, "relabelings", relabelings)
-        if scheme is not None:
-            pulumi.set(__self__, "scheme", scheme)
-        if scrape_timeout is not None:
-            pulumi.set(__self__, "scrape_timeout", scrape_timeout)
-        if target_port is not None:
-            pulumi.set(__self__, "target_port", target_port)
-        if tls_config is not None:
-            pulumi.set(__self__, "tls_config", tls_config)
-        if track_timestamps_staleness is not None:
-            pulumi.set(__self__, "track_timestamps_staleness", track_timestamps_staleness)
-
-    @_builtins.property
-    @pulumi.getter
-    def authorization(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsAuthorizationPatchArgs']]:
-        return pulumi.get(self, "authorization")
-
-    @authorization.setter
-    def authorization(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsAuthorizationPatchArgs']]):
-        pulumi.set(self, "authorization", value)
-
-    @_builtins.property
-    @pulumi.getter(name="basicAuth")
-    def basic_auth(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthPatchArgs']]:
-        return pulumi.get(self, "basic_auth")
-
-    @basic_auth.setter
-    def basic_auth(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthPatchArgs']]):
-        pulumi.set(self, "basic_auth", value)
-
-    @_builtins.property
-    @pulumi.getter(name="bearerTokenFile")
-    def bearer_token_file(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        bearerTokenFile defines the file to read bearer token for scraping the target.
-
-        Deprecated: use `authorization` instead.
-        """
-        return pulumi.get(self, "bearer_token_file")
-
-    @bearer_token_file.setter
-    def bearer_token_file(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "bearer_token_file", value)
-
-    @_builtins.property
-    @pulumi.getter(name="bearerTokenSecret")
-    def bearer_token_secret(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsBearerTokenSecretPatchArgs']]:
-        return pulumi.get(self, "bearer_token_secret")
-
-    @bearer_token_secret.setter
-    def bearer_token_secret(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsBearerTokenSecretPatchArgs']]):
-        pulumi.set(self, "bearer_token_secret", value)
-
-    @_builtins.property
-    @pulumi.getter(name="enableHttp2")
-    def enable_http2(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        enableHttp2 can be used to disable HTTP2.
-        """
-        return pulumi.get(self, "enable_http2")
-
-    @enable_http2.setter
-    def enable_http2(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "enable_http2", value)
-
-    @_builtins.property
-    @pulumi.getter(name="filterRunning")
-    def filter_running(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        filterRunning when true, the pods which are not running (e.g. either in Failed or
-        Succeeded state) are dropped during the target discovery.
-
-        If unset, the filtering is enabled.
-
-        More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-        """
-        return pulumi.get(self, "filter_running")
-
-    @filter_running.setter
-    def filter_running(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "filter_running", value)
-
-    @_builtins.property
-    @pulumi.getter(name="followRedirects")
-    def follow_redirects(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        followRedirects defines whether the client should follow HTTP 3xx
-        redirects.
-        """
-        return pulumi.get(self, "follow_redirects")
-
-    @follow_redirects.setter
-    def follow_redirects(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "follow_redirects", value)
-
-    @_builtins.property
-    @pulumi.getter(name="honorLabels")
-    def honor_labels(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        honorLabels defines when true the metric's labels when they collide
-        with the target's labels.
-        """
-        return pulumi.get(self, "honor_labels")
-
-    @honor_labels.setter
-    def honor_labels(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "honor_labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="honorTimestamps")
-    def honor_timestamps(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        honorTimestamps defines whether Prometheus preserves the timestamps
-        when exposed by the target.
-        """
-        return pulumi.get(self, "honor_timestamps")
-
-    @honor_timestamps.setter
-    def honor_timestamps(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "honor_timestamps", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def interval(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        interval at which Prometheus scrapes the metrics from the target.
-
-        If empty, Prometheus uses the global scrape interval.
-        """
-        return pulumi.get(self, "interval")
-
-    @interval.setter
-    def interval(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "interval", value)
-
-    @_builtins.property
-    @pulumi.getter(name="metricRelabelings")
-    def metric_relabelings(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgs']]]]:
-        """
-        metricRelabelings defines the relabeling rules to apply to the
-        samples before ingestion.
-        """
-        return pulumi.get(self, "metric_relabelings")
-
-    @metric_relabelings.setter
-    def metric_relabelings(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgs']]]]):
-        pulumi.set(self, "metric_relabelings", value)
-
-    @_builtins.property
-    @pulumi.getter(name="noProxy")
-    def no_proxy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-        that should be excluded from proxying. IP and domain names can
-        contain port numbers.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "no_proxy")
-
-    @no_proxy.setter
-    def no_proxy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "no_proxy", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def oauth2(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2PatchArgs']]:
-        return pulumi.get(self, "oauth2")
-
-    @oauth2.setter
-    def oauth2(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2PatchArgs']]):
-        pulumi.set(self, "oauth2", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def params(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]]:
-        """
-        params define optional HTTP URL parameters.
-        """
-        return pulumi.get(self, "params")
-
-    @params.setter
-    def params(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]]):
-        pulumi.set(self, "params", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def path(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        path defines the HTTP path from which to scrape for metrics.
-
-        If empty, Prometheus uses the default value (e.g. `/metrics`).
-        """
-        return pulumi.get(self, "path")
-
-    @path.setter
-    def path(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "path", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        port defines the name of the Service port which this endpoint refers to.
-
-        It takes precedence over `targetPort`.
-        """
-        return pulumi.get(self, "port")
-
-    @port.setter
-    def port(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "port", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyConnectHeader")
-    def proxy_connect_header(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsProxyConnectHeaderArgs']]]]]]:
-        """
-        proxyConnectHeader optionally specifies headers to send to
-        proxies during CONNECT requests.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_connect_header")
-
-    @proxy_connect_header.setter
-    def proxy_connect_header(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsProxyConnectHeaderArgs']]]]]]):
-        pulumi.set(self, "proxy_connect_header", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyFromEnvironment")
-    def proxy_from_environment(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_from_environment")
-
-    @proxy_from_environment.setter
-    def proxy_from_environment(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "proxy_from_environment", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyUrl")
-    def proxy_url(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        proxyUrl defines the HTTP proxy server to use.
-        """
-        return pulumi.get(self, "proxy_url")
-
-    @proxy_url.setter
-    def proxy_url(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "proxy_url", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def relabelings(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsRelabelingsPatchArgs']]]]:
-        """
-        relabelings defines the relabeling rules to apply the target's
-        metadata labels.
-
-        The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-        The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-        """
-        return pulumi.get(self, "relabelings")
-
-    @relabelings.setter
-    def relabelings(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsRelabelingsPatchArgs']]]]):
-        pulumi.set(self, "relabelings", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def scheme(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        scheme defines the HTTP scheme to use when scraping the metrics.
-        """
-        return pulumi.get(self, "scheme")
-
-    @scheme.setter
-    def scheme(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "scheme", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeTimeout")
-    def scrape_timeout(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-        If empty, Prometheus uses the global scrape timeout unless it is less
-        than the target's scrape interval value in which the latter is used.
-        The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-        """
-        return pulumi.get(self, "scrape_timeout")
-
-    @scrape_timeout.setter
-    def scrape_timeout(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "scrape_timeout", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetPort")
-    def target_port(self) -> pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]:
-        """
-        targetPort defines the name or number of the target port of the `Pod` object behind the
-        Service. The port must be specified with the container's port property.
-        """
-        return pulumi.get(self, "target_port")
-
-    @target_port.setter
-    def target_port(self, value: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]):
-        pulumi.set(self, "target_port", value)
-
-    @_builtins.property
-    @pulumi.getter(name="tlsConfig")
-    def tls_config(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigPatchArgs']]:
-        return pulumi.get(self, "tls_config")
-
-    @tls_config.setter
-    def tls_config(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigPatchArgs']]):
-        pulumi.set(self, "tls_config", value)
-
-    @_builtins.property
-    @pulumi.getter(name="trackTimestampsStaleness")
-    def track_timestamps_staleness(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        trackTimestampsStaleness defines whether Prometheus tracks staleness of
-        the metrics that have an explicit timestamp present in scraped data.
-        Has no effect if `honorTimestamps` is false.
-
-        It requires Prometheus >= v2.48.0.
-        """
-        return pulumi.get(self, "track_timestamps_staleness")
-
-    @track_timestamps_staleness.setter
-    def track_timestamps_staleness(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "track_timestamps_staleness", value)
-
-
-class ServiceMonitorSpecEndpointsProxyConnectHeaderArgsDict(TypedDict):
-    """
-    SecretKeySelector selects a key of a Secret.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsProxyConnectHeaderArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        SecretKeySelector selects a key of a Secret.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsRelabelingsPatchArgsDict(TypedDict):
-    """
-    RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-    scraped samples and remote write samples.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    action: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    action to perform based on the regex matching.
-
-    `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-    `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-    Default: "Replace"
-    """
-    modulus: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    modulus to take of the hash of the source label values.
-
-    Only applicable when the action is `HashMod`.
-    """
-    regex: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    regex defines the regular expression against which the extracted value is matched.
-    """
-    replacement: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    replacement value against which a Replace action is performed if the
-    regular expression matches.
-
-    Regex capture groups are available.
-    """
-    separator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    separator defines the string between concatenated SourceLabels.
-    """
-    source_labels: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    sourceLabels defines the source labels select values from existing labels. Their content is
-    concatenated using the configured Separator and matched against the
-    configured regular expression.
-    """
-    target_label: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    targetLabel defines the label to which the resulting string is written in a replacement.
-
-    It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-    `KeepEqual` and `DropEqual` actions.
-
-    Regex capture groups are available.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsRelabelingsPatchArgs:
-    def __init__(__self__, *,
-                 action: pulumi.Input[Optional[_builtins.str]] = None,
-                 modulus: pulumi.Input[Optional[_builtins.int]] = None,
-                 regex: pulumi.Input[Optional[_builtins.str]] = None,
-                 replacement: pulumi.Input[Optional[_builtins.str]] = None,
-                 separator: pulumi.Input[Optional[_builtins.str]] = None,
-                 source_labels: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 target_label: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-        scraped samples and remote write samples.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-
-        :param pulumi.Input[_builtins.str] action: action to perform based on the regex matching.
-
-               `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-               `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-               Default: "Replace"
-        :param pulumi.Input[_builtins.int] modulus: modulus to take of the hash of the source label values.
-
-               Only applicable when the action is `HashMod`.
-        :param pulumi.Input[_builtins.str] regex: regex defines the regular expression against which the extracted value is matched.
-        :param pulumi.Input[_builtins.str] replacement: replacement value against which a Replace action is performed if the
-               regular expression matches.
-
-               Regex capture groups are available.
-        :param pulumi.Input[_builtins.str] separator: separator defines the string between concatenated SourceLabels.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] source_labels: sourceLabels defines the source labels select values from existing labels. Their content is
-               concatenated using the configured Separator and matched against the
-               configured regular expression.
-        :param pulumi.Input[_builtins.str] target_label: targetLabel defines the label to which the resulting string is written in a replacement.
-
-               It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-               `KeepEqual` and `DropEqual` actions.
-
-               Regex capture groups are available.
-        """
-        if action is not None:
-            pulumi.set(__self__, "action", action)
-        if modulus is not None:
-            pulumi.set(__self__, "modulus", modulus)
-        if regex is not None:
-            pulumi.set(__self__, "regex", regex)
-        if replacement is not None:
-            pulumi.set(__self__, "replacement", replacement)
-        if separator is not None:
-            pulumi.set(__self__, "separator", separator)
-        if source_labels is not None:
-            pulumi.set(__self__, "source_labels", source_labels)
-        if target_label is not None:
-            pulumi.set(__self__, "target_label", target_label)
-
-    @_builtins.property
-    @pulumi.getter
-    def action(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        action to perform based on the regex matching.
-
-        `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-        `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-        Default: "Replace"
-        """
-        return pulumi.get(self, "action")
-
-    @action.setter
-    def action(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "action", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def modulus(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        modulus to take of the hash of the source label values.
-
-        Only applicable when the action is `HashMod`.
-        """
-        return pulumi.get(self, "modulus")
-
-    @modulus.setter
-    def modulus(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "modulus", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def regex(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        regex defines the regular expression against which the extracted value is matched.
-        """
-        return pulumi.get(self, "regex")
-
-    @regex.setter
-    def regex(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "regex", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def replacement(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        replacement value against which a Replace action is performed if the
-        regular expression matches.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "replacement")
-
-    @replacement.setter
-    def replacement(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "replacement", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def separator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        separator defines the string between concatenated SourceLabels.
-        """
-        return pulumi.get(self, "separator")
-
-    @separator.setter
-    def separator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "separator", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sourceLabels")
-    def source_labels(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        sourceLabels defines the source labels select values from existing labels. Their content is
-        concatenated using the configured Separator and matched against the
-        configured regular expression.
-        """
-        return pulumi.get(self, "source_labels")
-
-    @source_labels.setter
-    def source_labels(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "source_labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabel")
-    def target_label(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        targetLabel defines the label to which the resulting string is written in a replacement.
-
-        It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-        `KeepEqual` and `DropEqual` actions.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "target_label")
-
-    @target_label.setter
-    def target_label(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "target_label", value)
-
-
-class ServiceMonitorSpecEndpointsRelabelingsArgsDict(TypedDict):
-    """
-    RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-    scraped samples and remote write samples.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    action: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    action to perform based on the regex matching.
-
-    `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-    `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-    Default: "Replace"
-    """
-    modulus: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    modulus to take of the hash of the source label values.
-
-    Only applicable when the action is `HashMod`.
-    """
-    regex: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    regex defines the regular expression against which the extracted value is matched.
-    """
-    replacement: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    replacement value against which a Replace action is performed if the
-    regular expression matches.
-
-    Regex capture groups are available.
-    """
-    separator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    separator defines the string between concatenated SourceLabels.
-    """
-    source_labels: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    sourceLabels defines the source labels select values from existing labels. Their content is
-    concatenated using the configured Separator and matched against the
-    configured regular expression.
-    """
-    target_label: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    targetLabel defines the label to which the resulting string is written in a replacement.
-
-    It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-    `KeepEqual` and `DropEqual` actions.
-
-    Regex capture groups are available.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsRelabelingsArgs:
-    def __init__(__self__, *,
-                 action: pulumi.Input[Optional[_builtins.str]] = None,
-                 modulus: pulumi.Input[Optional[_builtins.int]] = None,
-                 regex: pulumi.Input[Optional[_builtins.str]] = None,
-                 replacement: pulumi.Input[Optional[_builtins.str]] = None,
-                 separator: pulumi.Input[Optional[_builtins.str]] = None,
-                 source_labels: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 target_label: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-        scraped samples and remote write samples.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-
-        :param pulumi.Input[_builtins.str] action: action to perform based on the regex matching.
-
-               `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-               `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-               Default: "Replace"
-        :param pulumi.Input[_builtins.int] modulus: modulus to take of the hash of the source label values.
-
-               Only applicable when the action is `HashMod`.
-        :param pulumi.Input[_builtins.str] regex: regex defines the regular expression against which the extracted value is matched.
-        :param pulumi.Input[_builtins.str] replacement: replacement value against which a Replace action is performed if the
-               regular expression matches.
-
-               Regex capture groups are available.
-        :param pulumi.Input[_builtins.str] separator: separator defines the string between concatenated SourceLabels.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] source_labels: sourceLabels defines the source labels select values from existing labels. Their content is
-               concatenated using the configured Separator and matched against the
-               configured regular expression.
-        :param pulumi.Input[_builtins.str] target_label: targetLabel defines the label to which the resulting string is written in a replacement.
-
-               It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-               `KeepEqual` and `DropEqual` actions.
-
-               Regex capture groups are available.
-        """
-        if action is not None:
-            pulumi.set(__self__, "action", action)
-        if modulus is not None:
-            pulumi.set(__self__, "modulus", modulus)
-        if regex is not None:
-            pulumi.set(__self__, "regex", regex)
-        if replacement is not None:
-            pulumi.set(__self__, "replacement", replacement)
-        if separator is not None:
-            pulumi.set(__self__, "separator", separator)
-        if source_labels is not None:
-            pulumi.set(__self__, "source_labels", source_labels)
-        if target_label is not None:
-            pulumi.set(__self__, "target_label", target_label)
-
-    @_builtins.property
-    @pulumi.getter
-    def action(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        action to perform based on the regex matching.
-
-        `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-        `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-        Default: "Replace"
-        """
-        return pulumi.get(self, "action")
-
-    @action.setter
-    def action(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "action", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def modulus(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        modulus to take of the hash of the source label values.
-
-        Only applicable when the action is `HashMod`.
-        """
-        return pulumi.get(self, "modulus")
-
-    @modulus.setter
-    def modulus(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "modulus", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def regex(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        regex defines the regular expression against which the extracted value is matched.
-        """
-        return pulumi.get(self, "regex")
-
-    @regex.setter
-    def regex(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "regex", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def replacement(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        replacement value against which a Replace action is performed if the
-        regular expression matches.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "replacement")
-
-    @replacement.setter
-    def replacement(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "replacement", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def separator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        separator defines the string between concatenated SourceLabels.
-        """
-        return pulumi.get(self, "separator")
-
-    @separator.setter
-    def separator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "separator", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sourceLabels")
-    def source_labels(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        sourceLabels defines the source labels select values from existing labels. Their content is
-        concatenated using the configured Separator and matched against the
-        configured regular expression.
-        """
-        return pulumi.get(self, "source_labels")
-
-    @source_labels.setter
-    def source_labels(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "source_labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabel")
-    def target_label(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        targetLabel defines the label to which the resulting string is written in a replacement.
-
-        It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-        `KeepEqual` and `DropEqual` actions.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "target_label")
-
-    @target_label.setter
-    def target_label(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "target_label", value)
-
-
-class ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatchArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsTlsConfigCaConfigMapArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsTlsConfigCaConfigMapArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsTlsConfigCaPatchArgsDict(TypedDict):
-    """
-    ca defines the Certificate authority used when verifying server certificates.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatchArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaSecretPatchArgs']]]
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsTlsConfigCaPatchArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatchArgs']] = None,
-                 secret: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaSecretPatchArgs']] = None):
-        """
-        ca defines the Certificate authority used when verifying server certificates.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatchArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatchArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaSecretPatchArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaSecretPatchArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class ServiceMonitorSpecEndpointsTlsConfigCaSecretPatchArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsTlsConfigCaSecretPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsTlsConfigCaSecretArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsTlsConfigCaSecretArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsTlsConfigCaArgsDict(TypedDict):
-    """
-    ca defines the Certificate authority used when verifying server certificates.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaConfigMapArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaSecretArgs']]]
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsTlsConfigCaArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaConfigMapArgs']] = None,
-                 secret: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaSecretArgs']] = None):
-        """
-        ca defines the Certificate authority used when verifying server certificates.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaConfigMapArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaConfigMapArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaSecretArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaSecretArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatchArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsTlsConfigCertConfigMapArgsDict(TypedDict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key to select.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the ConfigMap or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsTlsConfigCertConfigMapArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key to select.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsTlsConfigCertPatchArgsDict(TypedDict):
-    """
-    cert defines the Client certificate to present when doing client-authentication.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatchArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertSecretPatchArgs']]]
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsTlsConfigCertPatchArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatchArgs']] = None,
-                 secret: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertSecretPatchArgs']] = None):
-        """
-        cert defines the Client certificate to present when doing client-authentication.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatchArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatchArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertSecretPatchArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertSecretPatchArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class ServiceMonitorSpecEndpointsTlsConfigCertSecretPatchArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsTlsConfigCertSecretPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsTlsConfigCertSecretArgsDict(TypedDict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsTlsConfigCertSecretArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsTlsConfigCertArgsDict(TypedDict):
-    """
-    cert defines the Client certificate to present when doing client-authentication.
-    """
-    config_map: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertConfigMapArgs']]]
-    secret: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertSecretArgs']]]
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsTlsConfigCertArgs:
-    def __init__(__self__, *,
-                 config_map: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertConfigMapArgs']] = None,
-                 secret: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertSecretArgs']] = None):
-        """
-        cert defines the Client certificate to present when doing client-authentication.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertConfigMapArgs']]:
-        return pulumi.get(self, "config_map")
-
-    @config_map.setter
-    def config_map(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertConfigMapArgs']]):
-        pulumi.set(self, "config_map", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertSecretArgs']]:
-        return pulumi.get(self, "secret")
-
-    @secret.setter
-    def secret(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertSecretArgs']]):
-        pulumi.set(self, "secret", value)
-
-
-class ServiceMonitorSpecEndpointsTlsConfigKeySecretPatchArgsDict(TypedDict):
-    """
-    keySecret defines the Secret containing the client key file for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsTlsConfigKeySecretPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        keySecret defines the Secret containing the client key file for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsTlsConfigKeySecretArgsDict(TypedDict):
-    """
-    keySecret defines the Secret containing the client key file for the targets.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The key of the secret to select from.  Must be a valid secret key.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-    optional: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Specify whether the Secret or its key must be defined
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsTlsConfigKeySecretArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 optional: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        keySecret defines the Secret containing the client key file for the targets.
-
-        :param pulumi.Input[_builtins.str] key: The key of the secret to select from.  Must be a valid secret key.
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param pulumi.Input[_builtins.bool] optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-    @optional.setter
-    def optional(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "optional", value)
-
-
-class ServiceMonitorSpecEndpointsTlsConfigPatchArgsDict(TypedDict):
-    """
-    tlsConfig defines TLS configuration used by the client.
-    """
-    ca: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaPatchArgs']]]
-    ca_file: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    caFile defines the path to the CA cert in the Prometheus container to use for the targets.
-    """
-    cert: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertPatchArgs']]]
-    cert_file: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    certFile defines the path to the client cert file in the Prometheus container for the targets.
-    """
-    insecure_skip_verify: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    insecureSkipVerify defines how to disable target certificate validation.
-    """
-    key_file: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    keyFile defines the path to the client key file in the Prometheus container for the targets.
-    """
-    key_secret: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigKeySecretPatchArgs']]]
-    max_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    maxVersion defines the maximum acceptable TLS version.
-
-    It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-    """
-    min_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    minVersion defines the minimum acceptable TLS version.
-
-    It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-    """
-    server_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    serverName is used to verify the hostname for the targets.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsTlsConfigPatchArgs:
-    def __init__(__self__, *,
-                 ca: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaPatchArgs']] = None,
-                 ca_file: pulumi.Input[Optional[_builtins.str]] = None,
-                 cert: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertPatchArgs']] = None,
-                 cert_file: pulumi.Input[Optional[_builtins.str]] = None,
-                 insecure_skip_verify: pulumi.Input[Optional[_builtins.bool]] = None,
-                 key_file: pulumi.Input[Optional[_builtins.str]] = None,
-                 key_secret: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigKeySecretPatchArgs']] = None,
-                 max_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 min_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 server_name: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        tlsConfig defines TLS configuration used by the client.
-
-        :param pulumi.Input[_builtins.str] ca_file: caFile defines the path to the CA cert in the Prometheus container to use for the targets.
-        :param pulumi.Input[_builtins.str] cert_file: certFile defines the path to the client cert file in the Prometheus container for the targets.
-        :param pulumi.Input[_builtins.bool] insecure_skip_verify: insecureSkipVerify defines how to disable target certificate validation.
-        :param pulumi.Input[_builtins.str] key_file: keyFile defines the path to the client key file in the Prometheus container for the targets.
-        :param pulumi.Input[_builtins.str] max_version: maxVersion defines the maximum acceptable TLS version.
-
-               It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        :param pulumi.Input[_builtins.str] min_version: minVersion defines the minimum acceptable TLS version.
-
-               It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        :param pulumi.Input[_builtins.str] server_name: serverName is used to verify the hostname for the targets.
-        """
-        if ca is not None:
-            pulumi.set(__self__, "ca", ca)
-        if ca_file is not None:
-            pulumi.set(__self__, "ca_file", ca_file)
-        if cert is not None:
-            pulumi.set(__self__, "cert", cert)
-        if cert_file is not None:
-            pulumi.set(__self__, "cert_file", cert_file)
-        if insecure_skip_verify is not None:
-            pulumi.set(__self__, "insecure_skip_verify", insecure_skip_verify)
-        if key_file is not None:
-            pulumi.set(__self__, "key_file", key_file)
-        if key_secret is not None:
-            pulumi.set(__self__, "key_secret", key_secret)
-        if max_version is not None:
-            pulumi.set(__self__, "max_version", max_version)
-        if min_version is not None:
-            pulumi.set(__self__, "min_version", min_version)
-        if server_name is not None:
-            pulumi.set(__self__, "server_name", server_name)
-
-    @_builtins.property
-    @pulumi.getter
-    def ca(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaPatchArgs']]:
-        return pulumi.get(self, "ca")
-
-    @ca.setter
-    def ca(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaPatchArgs']]):
-        pulumi.set(self, "ca", value)
-
-    @_builtins.property
-    @pulumi.getter(name="caFile")
-    def ca_file(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        caFile defines the path to the CA cert in the Prometheus container to use for the targets.
-        """
-        return pulumi.get(self, "ca_file")
-
-    @ca_file.setter
-    def ca_file(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "ca_file", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def cert(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertPatchArgs']]:
-        return pulumi.get(self, "cert")
-
-    @cert.setter
-    def cert(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertPatchArgs']]):
-        pulumi.set(self, "cert", value)
-
-    @_builtins.property
-    @pulumi.getter(name="certFile")
-    def cert_file(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        certFile defines the path to the client cert file in the Prometheus container for the targets.
-        """
-        return pulumi.get(self, "cert_file")
-
-    @cert_file.setter
-    def cert_file(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "cert_file", value)
-
-    @_builtins.property
-    @pulumi.getter(name="insecureSkipVerify")
-    def insecure_skip_verify(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        insecureSkipVerify defines how to disable target certificate validation.
-        """
-        return pulumi.get(self, "insecure_skip_verify")
-
-    @insecure_skip_verify.setter
-    def insecure_skip_verify(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "insecure_skip_verify", value)
-
-    @_builtins.property
-    @pulumi.getter(name="keyFile")
-    def key_file(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        keyFile defines the path to the client key file in the Prometheus container for the targets.
-        """
-        return pulumi.get(self, "key_file")
-
-    @key_file.setter
-    def key_file(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key_file", value)
-
-    @_builtins.property
-    @pulumi.getter(name="keySecret")
-    def key_secret(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigKeySecretPatchArgs']]:
-        return pulumi.get(self, "key_secret")
-
-    @key_secret.setter
-    def key_secret(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigKeySecretPatchArgs']]):
-        pulumi.set(self, "key_secret", value)
-
-    @_builtins.property
-    @pulumi.getter(name="maxVersion")
-    def max_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        maxVersion defines the maximum acceptable TLS version.
-
-        It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        """
-        return pulumi.get(self, "max_version")
-
-    @max_version.setter
-    def max_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "max_version", value)
-
-    @_builtins.property
-    @pulumi.getter(name="minVersion")
-    def min_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        minVersion defines the minimum acceptable TLS version.
-
-        It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        """
-        return pulumi.get(self, "min_version")
-
-    @min_version.setter
-    def min_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "min_version", value)
-
-    @_builtins.property
-    @pulumi.getter(name="serverName")
-    def server_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        serverName is used to verify the hostname for the targets.
-        """
-        return pulumi.get(self, "server_name")
-
-    @server_name.setter
-    def server_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "server_name", value)
-
-
-class ServiceMonitorSpecEndpointsTlsConfigArgsDict(TypedDict):
-    """
-    tlsConfig defines TLS configuration used by the client.
-    """
-    ca: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaArgs']]]
-    ca_file: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    caFile defines the path to the CA cert in the Prometheus container to use for the targets.
-    """
-    cert: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertArgs']]]
-    cert_file: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    certFile defines the path to the client cert file in the Prometheus container for the targets.
-    """
-    insecure_skip_verify: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    insecureSkipVerify defines how to disable target certificate validation.
-    """
-    key_file: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    keyFile defines the path to the client key file in the Prometheus container for the targets.
-    """
-    key_secret: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigKeySecretArgs']]]
-    max_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    maxVersion defines the maximum acceptable TLS version.
-
-    It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-    """
-    min_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    minVersion defines the minimum acceptable TLS version.
-
-    It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-    """
-    server_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    serverName is used to verify the hostname for the targets.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsTlsConfigArgs:
-    def __init__(__self__, *,
-                 ca: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaArgs']] = None,
-                 ca_file: pulumi.Input[Optional[_builtins.str]] = None,
-                 cert: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertArgs']] = None,
-                 cert_file: pulumi.Input[Optional[_builtins.str]] = None,
-                 insecure_skip_verify: pulumi.Input[Optional[_builtins.bool]] = None,
-                 key_file: pulumi.Input[Optional[_builtins.str]] = None,
-                 key_secret: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigKeySecretArgs']] = None,
-                 max_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 min_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 server_name: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        tlsConfig defines TLS configuration used by the client.
-
-        :param pulumi.Input[_builtins.str] ca_file: caFile defines the path to the CA cert in the Prometheus container to use for the targets.
-        :param pulumi.Input[_builtins.str] cert_file: certFile defines the path to the client cert file in the Prometheus container for the targets.
-        :param pulumi.Input[_builtins.bool] insecure_skip_verify: insecureSkipVerify defines how to disable target certificate validation.
-        :param pulumi.Input[_builtins.str] key_file: keyFile defines the path to the client key file in the Prometheus container for the targets.
-        :param pulumi.Input[_builtins.str] max_version: maxVersion defines the maximum acceptable TLS version.
-
-               It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        :param pulumi.Input[_builtins.str] min_version: minVersion defines the minimum acceptable TLS version.
-
-               It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        :param pulumi.Input[_builtins.str] server_name: serverName is used to verify the hostname for the targets.
-        """
-        if ca is not None:
-            pulumi.set(__self__, "ca", ca)
-        if ca_file is not None:
-            pulumi.set(__self__, "ca_file", ca_file)
-        if cert is not None:
-            pulumi.set(__self__, "cert", cert)
-        if cert_file is not None:
-            pulumi.set(__self__, "cert_file", cert_file)
-        if insecure_skip_verify is not None:
-            pulumi.set(__self__, "insecure_skip_verify", insecure_skip_verify)
-        if key_file is not None:
-            pulumi.set(__self__, "key_file", key_file)
-        if key_secret is not None:
-            pulumi.set(__self__, "key_secret", key_secret)
-        if max_version is not None:
-            pulumi.set(__self__, "max_version", max_version)
-        if min_version is not None:
-            pulumi.set(__self__, "min_version", min_version)
-        if server_name is not None:
-            pulumi.set(__self__, "server_name", server_name)
-
-    @_builtins.property
-    @pulumi.getter
-    def ca(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaArgs']]:
-        return pulumi.get(self, "ca")
-
-    @ca.setter
-    def ca(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCaArgs']]):
-        pulumi.set(self, "ca", value)
-
-    @_builtins.property
-    @pulumi.getter(name="caFile")
-    def ca_file(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        caFile defines the path to the CA cert in the Prometheus container to use for the targets.
-        """
-        return pulumi.get(self, "ca_file")
-
-    @ca_file.setter
-    def ca_file(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "ca_file", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def cert(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertArgs']]:
-        return pulumi.get(self, "cert")
-
-    @cert.setter
-    def cert(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigCertArgs']]):
-        pulumi.set(self, "cert", value)
-
-    @_builtins.property
-    @pulumi.getter(name="certFile")
-    def cert_file(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        certFile defines the path to the client cert file in the Prometheus container for the targets.
-        """
-        return pulumi.get(self, "cert_file")
-
-    @cert_file.setter
-    def cert_file(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "cert_file", value)
-
-    @_builtins.property
-    @pulumi.getter(name="insecureSkipVerify")
-    def insecure_skip_verify(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        insecureSkipVerify defines how to disable target certificate validation.
-        """
-        return pulumi.get(self, "insecure_skip_verify")
-
-    @insecure_skip_verify.setter
-    def insecure_skip_verify(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "insecure_skip_verify", value)
-
-    @_builtins.property
-    @pulumi.getter(name="keyFile")
-    def key_file(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        keyFile defines the path to the client key file in the Prometheus container for the targets.
-        """
-        return pulumi.get(self, "key_file")
-
-    @key_file.setter
-    def key_file(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key_file", value)
-
-    @_builtins.property
-    @pulumi.getter(name="keySecret")
-    def key_secret(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigKeySecretArgs']]:
-        return pulumi.get(self, "key_secret")
-
-    @key_secret.setter
-    def key_secret(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigKeySecretArgs']]):
-        pulumi.set(self, "key_secret", value)
-
-    @_builtins.property
-    @pulumi.getter(name="maxVersion")
-    def max_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        maxVersion defines the maximum acceptable TLS version.
-
-        It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        """
-        return pulumi.get(self, "max_version")
-
-    @max_version.setter
-    def max_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "max_version", value)
-
-    @_builtins.property
-    @pulumi.getter(name="minVersion")
-    def min_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        minVersion defines the minimum acceptable TLS version.
-
-        It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        """
-        return pulumi.get(self, "min_version")
-
-    @min_version.setter
-    def min_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "min_version", value)
-
-    @_builtins.property
-    @pulumi.getter(name="serverName")
-    def server_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        serverName is used to verify the hostname for the targets.
-        """
-        return pulumi.get(self, "server_name")
-
-    @server_name.setter
-    def server_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "server_name", value)
-
-
-class ServiceMonitorSpecEndpointsArgsDict(TypedDict):
-    """
-    Endpoint defines an endpoint serving Prometheus metrics to be scraped by
-    Prometheus.
-    """
-    authorization: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsAuthorizationArgs']]]
-    basic_auth: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthArgs']]]
-    bearer_token_file: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    bearerTokenFile defines the file to read bearer token for scraping the target.
-
-    Deprecated: use `authorization` instead.
-    """
-    bearer_token_secret: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsBearerTokenSecretArgs']]]
-    enable_http2: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    enableHttp2 can be used to disable HTTP2.
-    """
-    filter_running: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    filterRunning when true, the pods which are not running (e.g. either in Failed or
-    Succeeded state) are dropped during the target discovery.
-
-    If unset, the filtering is enabled.
-
-    More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-    """
-    follow_redirects: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    followRedirects defines whether the client should follow HTTP 3xx
-    redirects.
-    """
-    honor_labels: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    honorLabels defines when true the metric's labels when they collide
-    with the target's labels.
-    """
-    honor_timestamps: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    honorTimestamps defines whether Prometheus preserves the timestamps
-    when exposed by the target.
-    """
-    interval: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    interval at which Prometheus scrapes the metrics from the target.
-
-    If empty, Prometheus uses the global scrape interval.
-    """
-    metric_relabelings: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsMetricRelabelingsArgs']]]]]
-    """
-    metricRelabelings defines the relabeling rules to apply to the
-    samples before ingestion.
-    """
-    no_proxy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-    that should be excluded from proxying. IP and domain names can
-    contain port numbers.
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    oauth2: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2Args']]]
-    params: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]]]
-    """
-    params define optional HTTP URL parameters.
-    """
-    path: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    path defines the HTTP path from which to scrape for metrics.
-
-    If empty, Prometheus uses the default value (e.g. `/metrics`).
-    """
-    port: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    port defines the name of the Service port which this endpoint refers to.
-
-    It takes precedence over `targetPort`.
-    """
-    proxy_connect_header: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsProxyConnectHeaderArgs']]]]]]]
-    """
-    proxyConnectHeader optionally specifies headers to send to
-    proxies during CONNECT requests.
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_from_environment: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-    """
-    proxy_url: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    proxyUrl defines the HTTP proxy server to use.
-    """
-    relabelings: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsRelabelingsArgs']]]]]
-    """
-    relabelings defines the relabeling rules to apply the target's
-    metadata labels.
-
-    The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-    The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    scheme: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    scheme defines the HTTP scheme to use when scraping the metrics.
-    """
-    scrape_timeout: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-    If empty, Prometheus uses the global scrape timeout unless it is less
-    than the target's scrape interval value in which the latter is used.
-    The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-    """
-    target_port: NotRequired[pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]]
-    """
-    targetPort defines the name or number of the target port of the `Pod` object behind the
-    Service. The port must be specified with the container's port property.
-    """
-    tls_config: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigArgs']]]
-    track_timestamps_staleness: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    trackTimestampsStaleness defines whether Prometheus tracks staleness of
-    the metrics that have an explicit timestamp present in scraped data.
-    Has no effect if `honorTimestamps` is false.
-
-    It requires Prometheus >= v2.48.0.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecEndpointsArgs:
-    def __init__(__self__, *,
-                 authorization: pulumi.Input[Optional['ServiceMonitorSpecEndpointsAuthorizationArgs']] = None,
-                 basic_auth: pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthArgs']] = None,
-                 bearer_token_file: pulumi.Input[Optional[_builtins.str]] = None,
-                 bearer_token_secret: pulumi.Input[Optional['ServiceMonitorSpecEndpointsBearerTokenSecretArgs']] = None,
-                 enable_http2: pulumi.Input[Optional[_builtins.bool]] = None,
-                 filter_running: pulumi.Input[Optional[_builtins.bool]] = None,
-                 follow_redirects: pulumi.Input[Optional[_builtins.bool]] = None,
-                 honor_labels: pulumi.Input[Optional[_builtins.bool]] = None,
-                 honor_timestamps: pulumi.Input[Optional[_builtins.bool]] = None,
-                 interval: pulumi.Input[Optional[_builtins.str]] = None,
-                 metric_relabelings: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsMetricRelabelingsArgs']]]] = None,
-                 no_proxy: pulumi.Input[Optional[_builtins.str]] = None,
-                 oauth2: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2Args']] = None,
-                 params: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]] = None,
-                 path: pulumi.Input[Optional[_builtins.str]] = None,
-                 port: pulumi.Input[Optional[_builtins.str]] = None,
-                 proxy_connect_header: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsProxyConnectHeaderArgs']]]]]] = None,
-                 proxy_from_environment: pulumi.Input[Optional[_builtins.bool]] = None,
-                 proxy_url: pulumi.Input[Optional[_builtins.str]] = None,
-                 relabelings: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsRelabelingsArgs']]]] = None,
-                 scheme: pulumi.Input[Optional[_builtins.str]] = None,
-                 scrape_timeout: pulumi.Input[Optional[_builtins.str]] = None,
-                 target_port: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]] = None,
-                 tls_config: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigArgs']] = None,
-                 track_timestamps_staleness: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        Endpoint defines an endpoint serving Prometheus metrics to be scraped by
-        Prometheus.
-
-        :param pulumi.Input[_builtins.str] bearer_token_file: bearerTokenFile defines the file to read bearer token for scraping the target.
-
-               Deprecated: use `authorization` instead.
-        :param pulumi.Input[_builtins.bool] enable_http2: enableHttp2 can be used to disable HTTP2.
-        :param pulumi.Input[_builtins.bool] filter_running: filterRunning when true, the pods which are not running (e.g. either in Failed or
-               Succeeded state) are dropped during the target discovery.
-
-               If unset, the filtering is enabled.
-
-               More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-        :param pulumi.Input[_builtins.bool] follow_redirects: followRedirects defines whether the client should follow HTTP 3xx
-               redirects.
-        :param pulumi.Input[_builtins.bool] honor_labels: honorLabels defines when true the metric's labels when they collide
-               with the target's labels.
-        :param pulumi.Input[_builtins.bool] honor_timestamps: honorTimestamps defines whether Prometheus preserves the timestamps
-               when exposed by the target.
-        :param pulumi.Input[_builtins.str] interval: interval at which Prometheus scrapes the metrics from the target.
-
-               If empty, Prometheus uses the global scrape interval.
-        :param pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsMetricRelabelingsArgs']]] metric_relabelings: metricRelabelings defines the relabeling rules to apply to the
-               samples before ingestion.
-        :param pulumi.Input[_builtins.str] no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-               that should be excluded from proxying. IP and domain names can
-               contain port numbers.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]] params: params define optional HTTP URL parameters.
-        :param pulumi.Input[_builtins.str] path: path defines the HTTP path from which to scrape for metrics.
-
-               If empty, Prometheus uses the default value (e.g. `/metrics`).
-        :param pulumi.Input[_builtins.str] port: port defines the name of the Service port which this endpoint refers to.
-
-               It takes precedence over `targetPort`.
-        :param pulumi.Input[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsProxyConnectHeaderArgs']]]]] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
-               proxies during CONNECT requests.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[_builtins.bool] proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param pulumi.Input[_builtins.str] proxy_url: proxyUrl defines the HTTP proxy server to use.
-        :param pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsRelabelingsArgs']]] relabelings: relabelings defines the relabeling rules to apply the target's
-               metadata labels.
-
-               The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-               The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-               More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-        :param pulumi.Input[_builtins.str] scheme: scheme defines the HTTP scheme to use when scraping the metrics.
-        :param pulumi.Input[_builtins.str] scrape_timeout: scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-               If empty, Prometheus uses the global scrape timeout unless it is less
-               than the target's scrape interval value in which the latter is used.
-               The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-        :param pulumi.Input[Union[_builtins.int, _builtins.str]] target_port: targetPort defines the name or number of the target port of the `Pod` object behind the
-               Service. The port must be specified with the container's port property.
-        :param pulumi.Input[_builtins.bool] track_timestamps_staleness: trackTimestampsStaleness defines whether Prometheus tracks staleness of
-               the metrics that have an explicit timestamp present in scraped data.
-               Has no effect if `honorTimestamps` is false.
-
-               It requires Prometheus >= v2.48.0.
-        """
-        if authorization is not None:
-            pulumi.set(__self__, "authorization", authorization)
-        if basic_auth is not None:
-            pulumi.set(__self__, "basic_auth", basic_auth)
-        if bearer_token_file is not None:
-            pulumi.set(__self__, "bearer_token_file", bearer_token_file)
-        if bearer_token_secret is not None:
-            pulumi.set(__self__, "bearer_token_secret", bearer_token_secret)
-        if enable_http2 is not None:
-            pulumi.set(__self__, "enable_http2", enable_http2)
-        if filter_running is not None:
-            pulumi.set(__self__, "filter_running", filter_running)
-        if follow_redirects is not None:
-            pulumi.set(__self__, "follow_redirects", follow_redirects)
-        if honor_labels is not None:
-            pulumi.set(__self__, "honor_labels", honor_labels)
-        if honor_timestamps is not None:
-            pulumi.set(__self__, "honor_timestamps", honor_timestamps)
-        if interval is not None:
-            pulumi.set(__self__, "interval", interval)
-        if metric_relabelings is not None:
-            pulumi.set(__self__, "metric_relabelings", metric_relabelings)
-        if no_proxy is not None:
-            pulumi.set(__self__, "no_proxy", no_proxy)
-        if oauth2 is not None:
-            pulumi.set(__self__, "oauth2", oauth2)
-        if params is not None:
-            pulumi.set(__self__, "params", params)
-        if path is not None:
-            pulumi.set(__self__, "path", path)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if proxy_connect_header is not None:
-            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
-        if proxy_from_environment is not None:
-            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
-        if proxy_url is not None:
-            pulumi.set(__self__, "proxy_url", proxy_url)
-        if relabelings is not None:
-            pulumi.set(__self__, "relabelings", relabelings)
-        if scheme is not None:
-            pulumi.set(__self__, "scheme", scheme)
-        if scrape_timeout is not None:
-            pulumi.set(__self__, "scrape_timeout", scrape_timeout)
-        if target_port is not None:
-            pulumi.set(__self__, "target_port", target_port)
-        if tls_config is not None:
-            pulumi.set(__self__, "tls_config", tls_config)
-        if track_timestamps_staleness is not None:
-            pulumi.set(__self__, "track_timestamps_staleness", track_timestamps_staleness)
-
-    @_builtins.property
-    @pulumi.getter
-    def authorization(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsAuthorizationArgs']]:
-        return pulumi.get(self, "authorization")
-
-    @authorization.setter
-    def authorization(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsAuthorizationArgs']]):
-        pulumi.set(self, "authorization", value)
-
-    @_builtins.property
-    @pulumi.getter(name="basicAuth")
-    def basic_auth(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthArgs']]:
-        return pulumi.get(self, "basic_auth")
-
-    @basic_auth.setter
-    def basic_auth(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsBasicAuthArgs']]):
-        pulumi.set(self, "basic_auth", value)
-
-    @_builtins.property
-    @pulumi.getter(name="bearerTokenFile")
-    def bearer_token_file(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        bearerTokenFile defines the file to read bearer token for scraping the target.
-
-        Deprecated: use `authorization` instead.
-        """
-        return pulumi.get(self, "bearer_token_file")
-
-    @bearer_token_file.setter
-    def bearer_token_file(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "bearer_token_file", value)
-
-    @_builtins.property
-    @pulumi.getter(name="bearerTokenSecret")
-    def bearer_token_secret(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsBearerTokenSecretArgs']]:
-        return pulumi.get(self, "bearer_token_secret")
-
-    @bearer_token_secret.setter
-    def bearer_token_secret(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsBearerTokenSecretArgs']]):
-        pulumi.set(self, "bearer_token_secret", value)
-
-    @_builtins.property
-    @pulumi.getter(name="enableHttp2")
-    def enable_http2(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        enableHttp2 can be used to disable HTTP2.
-        """
-        return pulumi.get(self, "enable_http2")
-
-    @enable_http2.setter
-    def enable_http2(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "enable_http2", value)
-
-    @_builtins.property
-    @pulumi.getter(name="filterRunning")
-    def filter_running(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        filterRunning when true, the pods which are not running (e.g. either in Failed or
-        Succeeded state) are dropped during the target discovery.
-
-        If unset, the filtering is enabled.
-
-        More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-        """
-        return pulumi.get(self, "filter_running")
-
-    @filter_running.setter
-    def filter_running(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "filter_running", value)
-
-    @_builtins.property
-    @pulumi.getter(name="followRedirects")
-    def follow_redirects(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        followRedirects defines whether the client should follow HTTP 3xx
-        redirects.
-        """
-        return pulumi.get(self, "follow_redirects")
-
-    @follow_redirects.setter
-    def follow_redirects(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "follow_redirects", value)
-
-    @_builtins.property
-    @pulumi.getter(name="honorLabels")
-    def honor_labels(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        honorLabels defines when true the metric's labels when they collide
-        with the target's labels.
-        """
-        return pulumi.get(self, "honor_labels")
-
-    @honor_labels.setter
-    def honor_labels(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "honor_labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="honorTimestamps")
-    def honor_timestamps(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        honorTimestamps defines whether Prometheus preserves the timestamps
-        when exposed by the target.
-        """
-        return pulumi.get(self, "honor_timestamps")
-
-    @honor_timestamps.setter
-    def honor_timestamps(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "honor_timestamps", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def interval(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        interval at which Prometheus scrapes the metrics from the target.
-
-        If empty, Prometheus uses the global scrape interval.
-        """
-        return pulumi.get(self, "interval")
-
-    @interval.setter
-    def interval(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "interval", value)
-
-    @_builtins.property
-    @pulumi.getter(name="metricRelabelings")
-    def metric_relabelings(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsMetricRelabelingsArgs']]]]:
-        """
-        metricRelabelings defines the relabeling rules to apply to the
-        samples before ingestion.
-        """
-        return pulumi.get(self, "metric_relabelings")
-
-    @metric_relabelings.setter
-    def metric_relabelings(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsMetricRelabelingsArgs']]]]):
-        pulumi.set(self, "metric_relabelings", value)
-
-    @_builtins.property
-    @pulumi.getter(name="noProxy")
-    def no_proxy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-        that should be excluded from proxying. IP and domain names can
-        contain port numbers.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "no_proxy")
-
-    @no_proxy.setter
-    def no_proxy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "no_proxy", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def oauth2(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2Args']]:
-        return pulumi.get(self, "oauth2")
-
-    @oauth2.setter
-    def oauth2(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsOauth2Args']]):
-        pulumi.set(self, "oauth2", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def params(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]]:
-        """
-        params define optional HTTP URL parameters.
-        """
-        return pulumi.get(self, "params")
-
-    @params.setter
-    def params(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]]):
-        pulumi.set(self, "params", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def path(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        path defines the HTTP path from which to scrape for metrics.
-
-        If empty, Prometheus uses the default value (e.g. `/metrics`).
-        """
-        return pulumi.get(self, "path")
-
-    @path.setter
-    def path(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "path", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        port defines the name of the Service port which this endpoint refers to.
-
-        It takes precedence over `targetPort`.
-        """
-        return pulumi.get(self, "port")
-
-    @port.setter
-    def port(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "port", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyConnectHeader")
-    def proxy_connect_header(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsProxyConnectHeaderArgs']]]]]]:
-        """
-        proxyConnectHeader optionally specifies headers to send to
-        proxies during CONNECT requests.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_connect_header")
-
-    @proxy_connect_header.setter
-    def proxy_connect_header(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsProxyConnectHeaderArgs']]]]]]):
-        pulumi.set(self, "proxy_connect_header", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyFromEnvironment")
-    def proxy_from_environment(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_from_environment")
-
-    @proxy_from_environment.setter
-    def proxy_from_environment(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "proxy_from_environment", value)
-
-    @_builtins.property
-    @pulumi.getter(name="proxyUrl")
-    def proxy_url(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        proxyUrl defines the HTTP proxy server to use.
-        """
-        return pulumi.get(self, "proxy_url")
-
-    @proxy_url.setter
-    def proxy_url(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "proxy_url", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def relabelings(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsRelabelingsArgs']]]]:
-        """
-        relabelings defines the relabeling rules to apply the target's
-        metadata labels.
-
-        The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-        The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-        """
-        return pulumi.get(self, "relabelings")
-
-    @relabelings.setter
-    def relabelings(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsRelabelingsArgs']]]]):
-        pulumi.set(self, "relabelings", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def scheme(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        scheme defines the HTTP scheme to use when scraping the metrics.
-        """
-        return pulumi.get(self, "scheme")
-
-    @scheme.setter
-    def scheme(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "scheme", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeTimeout")
-    def scrape_timeout(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-        If empty, Prometheus uses the global scrape timeout unless it is less
-        than the target's scrape interval value in which the latter is used.
-        The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-        """
-        return pulumi.get(self, "scrape_timeout")
-
-    @scrape_timeout.setter
-    def scrape_timeout(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "scrape_timeout", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetPort")
-    def target_port(self) -> pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]:
-        """
-        targetPort defines the name or number of the target port of the `Pod` object behind the
-        Service. The port must be specified with the container's port property.
-        """
-        return pulumi.get(self, "target_port")
-
-    @target_port.setter
-    def target_port(self, value: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]):
-        pulumi.set(self, "target_port", value)
-
-    @_builtins.property
-    @pulumi.getter(name="tlsConfig")
-    def tls_config(self) -> pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigArgs']]:
-        return pulumi.get(self, "tls_config")
-
-    @tls_config.setter
-    def tls_config(self, value: pulumi.Input[Optional['ServiceMonitorSpecEndpointsTlsConfigArgs']]):
-        pulumi.set(self, "tls_config", value)
-
-    @_builtins.property
-    @pulumi.getter(name="trackTimestampsStaleness")
-    def track_timestamps_staleness(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        trackTimestampsStaleness defines whether Prometheus tracks staleness of
-        the metrics that have an explicit timestamp present in scraped data.
-        Has no effect if `honorTimestamps` is false.
-
-        It requires Prometheus >= v2.48.0.
-        """
-        return pulumi.get(self, "track_timestamps_staleness")
-
-    @track_timestamps_staleness.setter
-    def track_timestamps_staleness(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "track_timestamps_staleness", value)
-
-
-class ServiceMonitorSpecNamespaceSelectorPatchArgsDict(TypedDict):
-    """
-    namespaceSelector defines in which namespace(s) Prometheus should discover the services.
-    By default, the services are discovered in the same namespace as the `ServiceMonitor` object but it is possible to select pods across different/all namespaces.
-    """
-    any: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    any defines the boolean describing whether all namespaces are selected in contrast to a
-    list restricting them.
-    """
-    match_names: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    matchNames defines the list of namespace names to select from.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecNamespaceSelectorPatchArgs:
-    def __init__(__self__, *,
-                 any: pulumi.Input[Optional[_builtins.bool]] = None,
-                 match_names: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        namespaceSelector defines in which namespace(s) Prometheus should discover the services.
-        By default, the services are discovered in the same namespace as the `ServiceMonitor` object but it is possible to select pods across different/all namespaces.
-
-        :param pulumi.Input[_builtins.bool] any: any defines the boolean describing whether all namespaces are selected in contrast to a
-               list restricting them.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] match_names: matchNames defines the list of namespace names to select from.
-        """
-        if any is not None:
-            pulumi.set(__self__, "any", any)
-        if match_names is not None:
-            pulumi.set(__self__, "match_names", match_names)
-
-    @_builtins.property
-    @pulumi.getter
-    def any(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        any defines the boolean describing whether all namespaces are selected in contrast to a
-        list restricting them.
-        """
-        return pulumi.get(self, "any")
-
-    @any.setter
-    def any(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "any", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchNames")
-    def match_names(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        matchNames defines the list of namespace names to select from.
-        """
-        return pulumi.get(self, "match_names")
-
-    @match_names.setter
-    def match_names(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_names", value)
-
-
-class ServiceMonitorSpecNamespaceSelectorArgsDict(TypedDict):
-    """
-    namespaceSelector defines in which namespace(s) Prometheus should discover the services.
-    By default, the services are discovered in the same namespace as the `ServiceMonitor` object but it is possible to select pods across different/all namespaces.
-    """
-    any: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    any defines the boolean describing whether all namespaces are selected in contrast to a
-    list restricting them.
-    """
-    match_names: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    matchNames defines the list of namespace names to select from.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecNamespaceSelectorArgs:
-    def __init__(__self__, *,
-                 any: pulumi.Input[Optional[_builtins.bool]] = None,
-                 match_names: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        namespaceSelector defines in which namespace(s) Prometheus should discover the services.
-        By default, the services are discovered in the same namespace as the `ServiceMonitor` object but it is possible to select pods across different/all namespaces.
-
-        :param pulumi.Input[_builtins.bool] any: any defines the boolean describing whether all namespaces are selected in contrast to a
-               list restricting them.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] match_names: matchNames defines the list of namespace names to select from.
-        """
-        if any is not None:
-            pulumi.set(__self__, "any", any)
-        if match_names is not None:
-            pulumi.set(__self__, "match_names", match_names)
-
-    @_builtins.property
-    @pulumi.getter
-    def any(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        any defines the boolean describing whether all namespaces are selected in contrast to a
-        list restricting them.
-        """
-        return pulumi.get(self, "any")
-
-    @any.setter
-    def any(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "any", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchNames")
-    def match_names(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        matchNames defines the list of namespace names to select from.
-        """
-        return pulumi.get(self, "match_names")
-
-    @match_names.setter
-    def match_names(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_names", value)
-
-
-class ServiceMonitorSpecPatchArgsDict(TypedDict):
-    """
-    spec defines the specification of desired Service selection for target discovery by
-    Prometheus.
-    """
-    attach_metadata: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecAttachMetadataPatchArgs']]]
-    body_size_limit: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    bodySizeLimit when defined, bodySizeLimit specifies a job level limit on the size
-    of uncompressed response body that will be accepted by Prometheus.
-
-    It requires Prometheus >= v2.28.0.
-    """
-    convert_classic_histograms_to_nhcb: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-    It requires Prometheus >= v3.0.0.
-    """
-    endpoints: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsPatchArgs']]]]]
-    """
-    endpoints defines the list of endpoints part of this ServiceMonitor.
-    Defines how to scrape metrics from Kubernetes [Endpoints](https://kubernetes.io/docs/concepts/services-networking/service/#endpoints) objects.
-    In most cases, an Endpoints object is backed by a Kubernetes [Service](https://kubernetes.io/docs/concepts/services-networking/service/) object with the same name and labels.
-    """
-    fallback_scrape_protocol: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-    It requires Prometheus >= v3.0.0.
-    """
-    job_label: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    jobLabel selects the label from the associated Kubernetes `Service`
-    object which will be used as the `job` label for all metrics.
-
-    For example if `jobLabel` is set to `foo` and the Kubernetes `Service`
-    object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-    label to all ingested metrics.
-
-    If the value of this field is empty or if the label doesn't exist for
-    the given Service, the `job` label of the metrics defaults to the name
-    of the associated Kubernetes `Service`.
-    """
-    keep_dropped_targets: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-    that will be kept in memory. 0 means no limit.
-
-    It requires Prometheus >= v2.47.0.
-    """
-    label_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-    It requires Prometheus >= v2.27.0.
-    """
-    label_name_length_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-    It requires Prometheus >= v2.27.0.
-    """
-    label_value_length_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-    It requires Prometheus >= v2.27.0.
-    """
-    namespace_selector: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecNamespaceSelectorPatchArgs']]]
-    native_histogram_bucket_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-    buckets will be merged to stay within the limit.
-    It requires Prometheus >= v2.45.0.
-    """
-    native_histogram_min_bucket_factor: NotRequired[pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]]
-    """
-    nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-    buckets will be merged to increase the factor sufficiently.
-    It requires Prometheus >= v2.50.0.
-    """
-    pod_target_labels: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    podTargetLabels defines the labels which are transferred from the
-    associated Kubernetes `Pod` object onto the ingested metrics.
-    """
-    sample_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    sampleLimit defines a per-scrape limit on the number of scraped samples
-    that will be accepted.
-    """
-    scrape_class: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    scrapeClass defines the scrape class to apply.
-    """
-    scrape_classic_histograms: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-    It requires Prometheus >= v2.45.0.
-
-    Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-    """
-    scrape_native_histograms: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    scrapeNativeHistograms defines whether to enable scraping of native histograms.
-    It requires Prometheus >= v3.8.0.
-    """
-    scrape_protocols: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-    protocols supported by Prometheus in order of preference (from most to least preferred).
-
-    If unset, Prometheus uses its default value.
-
-    It requires Prometheus >= v2.49.0.
-    """
-    selector: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecSelectorPatchArgs']]]
-    selector_mechanism: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    selectorMechanism defines the mechanism used to select the endpoints to scrape.
-    By default, the selection process relies on relabel configurations to filter the discovered targets.
-    Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-    Which strategy is best for your use case needs to be carefully evaluated.
-
-    It requires Prometheus >= v2.17.0.
-    """
-    service_discovery_role: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    serviceDiscoveryRole defines the service discovery role used to discover targets.
-
-    If set, the value should be either "Endpoints" or "EndpointSlice".
-    Otherwise it defaults to the value defined in the
-    Prometheus/PrometheusAgent resource.
-    """
-    target_labels: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    targetLabels defines the labels which are transferred from the
-    associated Kubernetes `Service` object onto the ingested metrics.
-    """
-    target_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    targetLimit defines a limit on the number of scraped targets that will
-    be accepted.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecPatchArgs:
-    def __init__(__self__, *,
-                 attach_metadata: pulumi.Input[Optional['ServiceMonitorSpecAttachMetadataPatchArgs']] = None,
-                 body_size_limit: pulumi.Input[Optional[_builtins.str]] = None,
-                 convert_classic_histograms_to_nhcb: pulumi.Input[Optional[_builtins.bool]] = None,
-                 endpoints: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsPatchArgs']]]] = None,
-                 fallback_scrape_protocol: pulumi.Input[Optional[_builtins.str]] = None,
-                 job_label: pulumi.Input[Optional[_builtins.str]] = None,
-                 keep_dropped_targets: pulumi.Input[Optional[_builtins.int]] = None,
-                 label_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 label_name_length_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 label_value_length_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 namespace_selector: pulumi.Input[Optional['ServiceMonitorSpecNamespaceSelectorPatchArgs']] = None,
-                 native_histogram_bucket_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 native_histogram_min_bucket_factor: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]] = None,
-                 pod_target_labels: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 sample_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 scrape_class: pulumi.Input[Optional[_builtins.str]] = None,
-                 scrape_classic_histograms: pulumi.Input[Optional[_builtins.bool]] = None,
-                 scrape_native_histograms: pulumi.Input[Optional[_builtins.bool]] = None,
-                 scrape_protocols: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 selector: pulumi.Input[Optional['ServiceMonitorSpecSelectorPatchArgs']] = None,
-                 selector_mechanism: pulumi.Input[Optional[_builtins.str]] = None,
-                 service_discovery_role: pulumi.Input[Optional[_builtins.str]] = None,
-                 target_labels: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 target_limit: pulumi.Input[Optional[_builtins.int]] = None):
-        """
-        spec defines the specification of desired Service selection for target discovery by
-        Prometheus.
-
-        :param pulumi.Input[_builtins.str] body_size_limit: bodySizeLimit when defined, bodySizeLimit specifies a job level limit on the size
-               of uncompressed response body that will be accepted by Prometheus.
-
-               It requires Prometheus >= v2.28.0.
-        :param pulumi.Input[_builtins.bool] convert_classic_histograms_to_nhcb: convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-               It requires Prometheus >= v3.0.0.
-        :param pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsPatchArgs']]] endpoints: endpoints defines the list of endpoints part of this ServiceMonitor.
-               Defines how to scrape metrics from Kubernetes [Endpoints](https://kubernetes.io/docs/concepts/services-networking/service/#endpoints) objects.
-               In most cases, an Endpoints object is backed by a Kubernetes [Service](https://kubernetes.io/docs/concepts/services-networking/service/) object with the same name and labels.
-        :param pulumi.Input[_builtins.str] fallback_scrape_protocol: fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-               It requires Prometheus >= v3.0.0.
-        :param pulumi.Input[_builtins.str] job_label: jobLabel selects the label from the associated Kubernetes `Service`
-               object which will be used as the `job` label for all metrics.
-
-               For example if `jobLabel` is set to `foo` and the Kubernetes `Service`
-               object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-               label to all ingested metrics.
-
-               If the value of this field is empty or if the label doesn't exist for
-               the given Service, the `job` label of the metrics defaults to the name
-               of the associated Kubernetes `Service`.
-        :param pulumi.Input[_builtins.int] keep_dropped_targets: keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-               that will be kept in memory. 0 means no limit.
-
-               It requires Prometheus >= v2.47.0.
-        :param pulumi.Input[_builtins.int] label_limit: labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param pulumi.Input[_builtins.int] label_name_length_limit: labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param pulumi.Input[_builtins.int] label_value_length_limit: labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param pulumi.Input[_builtins.int] native_histogram_bucket_limit: nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-               buckets will be merged to stay within the limit.
-               It requires Prometheus >= v2.45.0.
-        :param pulumi.Input[Union[_builtins.int, _builtins.str]] native_histogram_min_bucket_factor: nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-               buckets will be merged to increase the factor sufficiently.
-               It requires Prometheus >= v2.50.0.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] pod_target_labels: podTargetLabels defines the labels which are transferred from the
-               associated Kubernetes `Pod` object onto the ingested metrics.
-        :param pulumi.Input[_builtins.int] sample_limit: sampleLimit defines a per-scrape limit on the number of scraped samples
-               that will be accepted.
-        :param pulumi.Input[_builtins.str] scrape_class: scrapeClass defines the scrape class to apply.
-        :param pulumi.Input[_builtins.bool] scrape_classic_histograms: scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-               It requires Prometheus >= v2.45.0.
-
-               Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-        :param pulumi.Input[_builtins.bool] scrape_native_histograms: scrapeNativeHistograms defines whether to enable scraping of native histograms.
-               It requires Prometheus >= v3.8.0.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] scrape_protocols: scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-               protocols supported by Prometheus in order of preference (from most to least preferred).
-
-               If unset, Prometheus uses its default value.
-
-               It requires Prometheus >= v2.49.0.
-        :param pulumi.Input[_builtins.str] selector_mechanism: selectorMechanism defines the mechanism used to select the endpoints to scrape.
-               By default, the selection process relies on relabel configurations to filter the discovered targets.
-               Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-               Which strategy is best for your use case needs to be carefully evaluated.
-
-               It requires Prometheus >= v2.17.0.
-        :param pulumi.Input[_builtins.str] service_discovery_role: serviceDiscoveryRole defines the service discovery role used to discover targets.
-
-               If set, the value should be either "Endpoints" or "EndpointSlice".
-               Otherwise it defaults to the value defined in the
-               Prometheus/PrometheusAgent resource.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] target_labels: targetLabels defines the labels which are transferred from the
-               associated Kubernetes `Service` object onto the ingested metrics.
-        :param pulumi.Input[_builtins.int] target_limit: targetLimit defines a limit on the number of scraped targets that will
-               be accepted.
-        """
-        if attach_metadata is not None:
-            pulumi.set(__self__, "attach_metadata", attach_metadata)
-        if body_size_limit is not None:
-            pulumi.set(__self__, "body_size_limit", body_size_limit)
-        if convert_classic_histograms_to_nhcb is not None:
-            pulumi.set(__self__, "convert_classic_histograms_to_nhcb", convert_classic_histograms_to_nhcb)
-        if endpoints is not None:
-            pulumi.set(__self__, "endpoints", endpoints)
-        if fallback_scrape_protocol is not None:
-            pulumi.set(__self__, "fallback_scrape_protocol", fallback_scrape_protocol)
-        if job_label is not None:
-            pulumi.set(__self__, "job_label", job_label)
-        if keep_dropped_targets is not None:
-            pulumi.set(__self__, "keep_dropped_targets", keep_dropped_targets)
-        if label_limit is not None:
-            pulumi.set(__self__, "label_limit", label_limit)
-        if label_name_length_limit is not None:
-            pulumi.set(__self__, "label_name_length_limit", label_name_length_limit)
-        if label_value_length_limit is not None:
-            pulumi.set(__self__, "label_value_length_limit", label_value_length_limit)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if native_histogram_bucket_limit is not None:
-            pulumi.set(__self__, "native_histogram_bucket_limit", native_histogram_bucket_limit)
-        if native_histogram_min_bucket_factor is not None:
-            pulumi.set(__self__, "native_histogram_min_bucket_factor", native_histogram_min_bucket_factor)
-        if pod_target_labels is not None:
-            pulumi.set(__self__, "pod_target_labels", pod_target_labels)
-        if sample_limit is not None:
-            pulumi.set(__self__, "sample_limit", sample_limit)
-        if scrape_class is not None:
-            pulumi.set(__self__, "scrape_class", scrape_class)
-        if scrape_classic_histograms is not None:
-            pulumi.set(__self__, "scrape_classic_histograms", scrape_classic_histograms)
-        if scrape_native_histograms is not None:
-            pulumi.set(__self__, "scrape_native_histograms", scrape_native_histograms)
-        if scrape_protocols is not None:
-            pulumi.set(__self__, "scrape_protocols", scrape_protocols)
-        if selector is not None:
-            pulumi.set(__self__, "selector", selector)
-        if selector_mechanism is not None:
-            pulumi.set(__self__, "selector_mechanism", selector_mechanism)
-        if service_discovery_role is not None:
-            pulumi.set(__self__, "service_discovery_role", service_discovery_role)
-        if target_labels is not None:
-            pulumi.set(__self__, "target_labels", target_labels)
-        if target_limit is not None:
-            pulumi.set(__self__, "target_limit", target_limit)
-
-    @_builtins.property
-    @pulumi.getter(name="attachMetadata")
-    def attach_metadata(self) -> pulumi.Input[Optional['ServiceMonitorSpecAttachMetadataPatchArgs']]:
-        return pulumi.get(self, "attach_metadata")
-
-    @attach_metadata.setter
-    def attach_metadata(self, value: pulumi.Input[Optional['ServiceMonitorSpecAttachMetadataPatchArgs']]):
-        pulumi.set(self, "attach_metadata", value)
-
-    @_builtins.property
-    @pulumi.getter(name="bodySizeLimit")
-    def body_size_limit(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        bodySizeLimit when defined, bodySizeLimit specifies a job level limit on the size
-        of uncompressed response body that will be accepted by Prometheus.
-
-        It requires Prometheus >= v2.28.0.
-        """
-        return pulumi.get(self, "body_size_limit")
-
-    @body_size_limit.setter
-    def body_size_limit(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "body_size_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="convertClassicHistogramsToNHCB")
-    def convert_classic_histograms_to_nhcb(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-        It requires Prometheus >= v3.0.0.
-        """
-        return pulumi.get(self, "convert_classic_histograms_to_nhcb")
-
-    @convert_classic_histograms_to_nhcb.setter
-    def convert_classic_histograms_to_nhcb(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "convert_classic_histograms_to_nhcb", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def endpoints(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsPatchArgs']]]]:
-        """
-        endpoints defines the list of endpoints part of this ServiceMonitor.
-        Defines how to scrape metrics from Kubernetes [Endpoints](https://kubernetes.io/docs/concepts/services-networking/service/#endpoints) objects.
-        In most cases, an Endpoints object is backed by a Kubernetes [Service](https://kubernetes.io/docs/concepts/services-networking/service/) object with the same name and labels.
-        """
-        return pulumi.get(self, "endpoints")
-
-    @endpoints.setter
-    def endpoints(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsPatchArgs']]]]):
-        pulumi.set(self, "endpoints", value)
-
-    @_builtins.property
-    @pulumi.getter(name="fallbackScrapeProtocol")
-    def fallback_scrape_protocol(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-        It requires Prometheus >= v3.0.0.
-        """
-        return pulumi.get(self, "fallback_scrape_protocol")
-
-    @fallback_scrape_protocol.setter
-    def fallback_scrape_protocol(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "fallback_scrape_protocol", value)
-
-    @_builtins.property
-    @pulumi.getter(name="jobLabel")
-    def job_label(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        jobLabel selects the label from the associated Kubernetes `Service`
-        object which will be used as the `job` label for all metrics.
-
-        For example if `jobLabel` is set to `foo` and the Kubernetes `Service`
-        object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-        label to all ingested metrics.
-
-        If the value of this field is empty or if the label doesn't exist for
-        the given Service, the `job` label of the metrics defaults to the name
-        of the associated Kubernetes `Service`.
-        """
-        return pulumi.get(self, "job_label")
-
-    @job_label.setter
-    def job_label(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "job_label", value)
-
-    @_builtins.property
-    @pulumi.getter(name="keepDroppedTargets")
-    def keep_dropped_targets(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-        that will be kept in memory. 0 means no limit.
-
-        It requires Prometheus >= v2.47.0.
-        """
-        return pulumi.get(self, "keep_dropped_targets")
-
-    @keep_dropped_targets.setter
-    def keep_dropped_targets(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "keep_dropped_targets", value)
-
-    @_builtins.property
-    @pulumi.getter(name="labelLimit")
-    def label_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_limit")
-
-    @label_limit.setter
-    def label_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "label_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="labelNameLengthLimit")
-    def label_name_length_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_name_length_limit")
-
-    @label_name_length_limit.setter
-    def label_name_length_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "label_name_length_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="labelValueLengthLimit")
-    def label_value_length_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_value_length_limit")
-
-    @label_value_length_limit.setter
-    def label_value_length_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "label_value_length_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> pulumi.Input[Optional['ServiceMonitorSpecNamespaceSelectorPatchArgs']]:
-        return pulumi.get(self, "namespace_selector")
-
-    @namespace_selector.setter
-    def namespace_selector(self, value: pulumi.Input[Optional['ServiceMonitorSpecNamespaceSelectorPatchArgs']]):
-        pulumi.set(self, "namespace_selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="nativeHistogramBucketLimit")
-    def native_histogram_bucket_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-        buckets will be merged to stay within the limit.
-        It requires Prometheus >= v2.45.0.
-        """
-        return pulumi.get(self, "native_histogram_bucket_limit")
-
-    @native_histogram_bucket_limit.setter
-    def native_histogram_bucket_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "native_histogram_bucket_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="nativeHistogramMinBucketFactor")
-    def native_histogram_min_bucket_factor(self) -> pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]:
-        """
-        nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-        buckets will be merged to increase the factor sufficiently.
-        It requires Prometheus >= v2.50.0.
-        """
-        return pulumi.get(self, "native_histogram_min_bucket_factor")
-
-    @native_histogram_min_bucket_factor.setter
-    def native_histogram_min_bucket_factor(self, value: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]):
-        pulumi.set(self, "native_histogram_min_bucket_factor", value)
-
-    @_builtins.property
-    @pulumi.getter(name="podTargetLabels")
-    def pod_target_labels(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        podTargetLabels defines the labels which are transferred from the
-        associated Kubernetes `Pod` object onto the ingested metrics.
-        """
-        return pulumi.get(self, "pod_target_labels")
-
-    @pod_target_labels.setter
-    def pod_target_labels(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "pod_target_labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sampleLimit")
-    def sample_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        sampleLimit defines a per-scrape limit on the number of scraped samples
-        that will be accepted.
-        """
-        return pulumi.get(self, "sample_limit")
-
-    @sample_limit.setter
-    def sample_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "sample_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeClass")
-    def scrape_class(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        scrapeClass defines the scrape class to apply.
-        """
-        return pulumi.get(self, "scrape_class")
-
-    @scrape_class.setter
-    def scrape_class(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "scrape_class", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeClassicHistograms")
-    def scrape_classic_histograms(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-        It requires Prometheus >= v2.45.0.
-
-        Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-        """
-        return pulumi.get(self, "scrape_classic_histograms")
-
-    @scrape_classic_histograms.setter
-    def scrape_classic_histograms(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "scrape_classic_histograms", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeNativeHistograms")
-    def scrape_native_histograms(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        scrapeNativeHistograms defines whether to enable scraping of native histograms.
-        It requires Prometheus >= v3.8.0.
-        """
-        return pulumi.get(self, "scrape_native_histograms")
-
-    @scrape_native_histograms.setter
-    def scrape_native_histograms(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "scrape_native_histograms", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeProtocols")
-    def scrape_protocols(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-        protocols supported by Prometheus in order of preference (from most to least preferred).
-
-        If unset, Prometheus uses its default value.
-
-        It requires Prometheus >= v2.49.0.
-        """
-        return pulumi.get(self, "scrape_protocols")
-
-    @scrape_protocols.setter
-    def scrape_protocols(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "scrape_protocols", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def selector(self) -> pulumi.Input[Optional['ServiceMonitorSpecSelectorPatchArgs']]:
-        return pulumi.get(self, "selector")
-
-    @selector.setter
-    def selector(self, value: pulumi.Input[Optional['ServiceMonitorSpecSelectorPatchArgs']]):
-        pulumi.set(self, "selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="selectorMechanism")
-    def selector_mechanism(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        selectorMechanism defines the mechanism used to select the endpoints to scrape.
-        By default, the selection process relies on relabel configurations to filter the discovered targets.
-        Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-        Which strategy is best for your use case needs to be carefully evaluated.
-
-        It requires Prometheus >= v2.17.0.
-        """
-        return pulumi.get(self, "selector_mechanism")
-
-    @selector_mechanism.setter
-    def selector_mechanism(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "selector_mechanism", value)
-
-    @_builtins.property
-    @pulumi.getter(name="serviceDiscoveryRole")
-    def service_discovery_role(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        serviceDiscoveryRole defines the service discovery role used to discover targets.
-
-        If set, the value should be either "Endpoints" or "EndpointSlice".
-        Otherwise it defaults to the value defined in the
-        Prometheus/PrometheusAgent resource.
-        """
-        return pulumi.get(self, "service_discovery_role")
-
-    @service_discovery_role.setter
-    def service_discovery_role(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "service_discovery_role", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabels")
-    def target_labels(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        targetLabels defines the labels which are transferred from the
-        associated Kubernetes `Service` object onto the ingested metrics.
-        """
-        return pulumi.get(self, "target_labels")
-
-    @target_labels.setter
-    def target_labels(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "target_labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetLimit")
-    def target_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        targetLimit defines a limit on the number of scraped targets that will
-        be accepted.
-        """
-        return pulumi.get(self, "target_limit")
-
-    @target_limit.setter
-    def target_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "target_limit", value)
-
-
-class ServiceMonitorSpecSelectorMatchExpressionsPatchArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecSelectorMatchExpressionsPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ServiceMonitorSpecSelectorMatchExpressionsArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecSelectorMatchExpressionsArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ServiceMonitorSpecSelectorPatchArgsDict(TypedDict):
-    """
-    selector defines the label selector to select the Kubernetes `Endpoints` objects to scrape metrics from.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecSelectorMatchExpressionsPatchArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecSelectorPatchArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecSelectorMatchExpressionsPatchArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        selector defines the label selector to select the Kubernetes `Endpoints` objects to scrape metrics from.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecSelectorMatchExpressionsPatchArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecSelectorMatchExpressionsPatchArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecSelectorMatchExpressionsPatchArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ServiceMonitorSpecSelectorArgsDict(TypedDict):
-    """
-    selector defines the label selector to select the Kubernetes `Endpoints` objects to scrape metrics from.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecSelectorMatchExpressionsArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecSelectorArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecSelectorMatchExpressionsArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        selector defines the label selector to select the Kubernetes `Endpoints` objects to scrape metrics from.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecSelectorMatchExpressionsArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecSelectorMatchExpressionsArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecSelectorMatchExpressionsArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ServiceMonitorSpecArgsDict(TypedDict):
-    """
-    spec defines the specification of desired Service selection for target discovery by
-    Prometheus.
-    """
-    attach_metadata: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecAttachMetadataArgs']]]
-    body_size_limit: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    bodySizeLimit when defined, bodySizeLimit specifies a job level limit on the size
-    of uncompressed response body that will be accepted by Prometheus.
-
-    It requires Prometheus >= v2.28.0.
-    """
-    convert_classic_histograms_to_nhcb: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-    It requires Prometheus >= v3.0.0.
-    """
-    endpoints: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsArgs']]]]]
-    """
-    endpoints defines the list of endpoints part of this ServiceMonitor.
-    Defines how to scrape metrics from Kubernetes [Endpoints](https://kubernetes.io/docs/concepts/services-networking/service/#endpoints) objects.
-    In most cases, an Endpoints object is backed by a Kubernetes [Service](https://kubernetes.io/docs/concepts/services-networking/service/) object with the same name and labels.
-    """
-    fallback_scrape_protocol: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-    It requires Prometheus >= v3.0.0.
-    """
-    job_label: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    jobLabel selects the label from the associated Kubernetes `Service`
-    object which will be used as the `job` label for all metrics.
-
-    For example if `jobLabel` is set to `foo` and the Kubernetes `Service`
-    object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-    label to all ingested metrics.
-
-    If the value of this field is empty or if the label doesn't exist for
-    the given Service, the `job` label of the metrics defaults to the name
-    of the associated Kubernetes `Service`.
-    """
-    keep_dropped_targets: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-    that will be kept in memory. 0 means no limit.
-
-    It requires Prometheus >= v2.47.0.
-    """
-    label_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-    It requires Prometheus >= v2.27.0.
-    """
-    label_name_length_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-    It requires Prometheus >= v2.27.0.
-    """
-    label_value_length_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-    It requires Prometheus >= v2.27.0.
-    """
-    namespace_selector: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecNamespaceSelectorArgs']]]
-    native_histogram_bucket_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-    buckets will be merged to stay within the limit.
-    It requires Prometheus >= v2.45.0.
-    """
-    native_histogram_min_bucket_factor: NotRequired[pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]]
-    """
-    nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-    buckets will be merged to increase the factor sufficiently.
-    It requires Prometheus >= v2.50.0.
-    """
-    pod_target_labels: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    podTargetLabels defines the labels which are transferred from the
-    associated Kubernetes `Pod` object onto the ingested metrics.
-    """
-    sample_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    sampleLimit defines a per-scrape limit on the number of scraped samples
-    that will be accepted.
-    """
-    scrape_class: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    scrapeClass defines the scrape class to apply.
-    """
-    scrape_classic_histograms: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-    It requires Prometheus >= v2.45.0.
-
-    Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-    """
-    scrape_native_histograms: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    scrapeNativeHistograms defines whether to enable scraping of native histograms.
-    It requires Prometheus >= v3.8.0.
-    """
-    scrape_protocols: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-    protocols supported by Prometheus in order of preference (from most to least preferred).
-
-    If unset, Prometheus uses its default value.
-
-    It requires Prometheus >= v2.49.0.
-    """
-    selector: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecSelectorArgs']]]
-    selector_mechanism: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    selectorMechanism defines the mechanism used to select the endpoints to scrape.
-    By default, the selection process relies on relabel configurations to filter the discovered targets.
-    Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-    Which strategy is best for your use case needs to be carefully evaluated.
-
-    It requires Prometheus >= v2.17.0.
-    """
-    service_discovery_role: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    serviceDiscoveryRole defines the service discovery role used to discover targets.
-
-    If set, the value should be either "Endpoints" or "EndpointSlice".
-    Otherwise it defaults to the value defined in the
-    Prometheus/PrometheusAgent resource.
-    """
-    target_labels: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    targetLabels defines the labels which are transferred from the
-    associated Kubernetes `Service` object onto the ingested metrics.
-    """
-    target_limit: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    targetLimit defines a limit on the number of scraped targets that will
-    be accepted.
-    """
-
-@pulumi.input_type
-class ServiceMonitorSpecArgs:
-    def __init__(__self__, *,
-                 attach_metadata: pulumi.Input[Optional['ServiceMonitorSpecAttachMetadataArgs']] = None,
-                 body_size_limit: pulumi.Input[Optional[_builtins.str]] = None,
-                 convert_classic_histograms_to_nhcb: pulumi.Input[Optional[_builtins.bool]] = None,
-                 endpoints: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsArgs']]]] = None,
-                 fallback_scrape_protocol: pulumi.Input[Optional[_builtins.str]] = None,
-                 job_label: pulumi.Input[Optional[_builtins.str]] = None,
-                 keep_dropped_targets: pulumi.Input[Optional[_builtins.int]] = None,
-                 label_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 label_name_length_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 label_value_length_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 namespace_selector: pulumi.Input[Optional['ServiceMonitorSpecNamespaceSelectorArgs']] = None,
-                 native_histogram_bucket_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 native_histogram_min_bucket_factor: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]] = None,
-                 pod_target_labels: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 sample_limit: pulumi.Input[Optional[_builtins.int]] = None,
-                 scrape_class: pulumi.Input[Optional[_builtins.str]] = None,
-                 scrape_classic_histograms: pulumi.Input[Optional[_builtins.bool]] = None,
-                 scrape_native_histograms: pulumi.Input[Optional[_builtins.bool]] = None,
-                 scrape_protocols: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 selector: pulumi.Input[Optional['ServiceMonitorSpecSelectorArgs']] = None,
-                 selector_mechanism: pulumi.Input[Optional[_builtins.str]] = None,
-                 service_discovery_role: pulumi.Input[Optional[_builtins.str]] = None,
-                 target_labels: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 target_limit: pulumi.Input[Optional[_builtins.int]] = None):
-        """
-        spec defines the specification of desired Service selection for target discovery by
-        Prometheus.
-
-        :param pulumi.Input[_builtins.str] body_size_limit: bodySizeLimit when defined, bodySizeLimit specifies a job level limit on the size
-               of uncompressed response body that will be accepted by Prometheus.
-
-               It requires Prometheus >= v2.28.0.
-        :param pulumi.Input[_builtins.bool] convert_classic_histograms_to_nhcb: convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-               It requires Prometheus >= v3.0.0.
-        :param pulumi.Input[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsArgs']]] endpoints: endpoints defines the list of endpoints part of this ServiceMonitor.
-               Defines how to scrape metrics from Kubernetes [Endpoints](https://kubernetes.io/docs/concepts/services-networking/service/#endpoints) objects.
-               In most cases, an Endpoints object is backed by a Kubernetes [Service](https://kubernetes.io/docs/concepts/services-networking/service/) object with the same name and labels.
-        :param pulumi.Input[_builtins.str] fallback_scrape_protocol: fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-               It requires Prometheus >= v3.0.0.
-        :param pulumi.Input[_builtins.str] job_label: jobLabel selects the label from the associated Kubernetes `Service`
-               object which will be used as the `job` label for all metrics.
-
-               For example if `jobLabel` is set to `foo` and the Kubernetes `Service`
-               object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-               label to all ingested metrics.
-
-               If the value of this field is empty or if the label doesn't exist for
-               the given Service, the `job` label of the metrics defaults to the name
-               of the associated Kubernetes `Service`.
-        :param pulumi.Input[_builtins.int] keep_dropped_targets: keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-               that will be kept in memory. 0 means no limit.
-
-               It requires Prometheus >= v2.47.0.
-        :param pulumi.Input[_builtins.int] label_limit: labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param pulumi.Input[_builtins.int] label_name_length_limit: labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param pulumi.Input[_builtins.int] label_value_length_limit: labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param pulumi.Input[_builtins.int] native_histogram_bucket_limit: nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-               buckets will be merged to stay within the limit.
-               It requires Prometheus >= v2.45.0.
-        :param pulumi.Input[Union[_builtins.int, _builtins.str]] native_histogram_min_bucket_factor: nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-               buckets will be merged to increase the factor sufficiently.
-               It requires Prometheus >= v2.50.0.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] pod_target_labels: podTargetLabels defines the labels which are transferred from the
-               associated Kubernetes `Pod` object onto the ingested metrics.
-        :param pulumi.Input[_builtins.int] sample_limit: sampleLimit defines a per-scrape limit on the number of scraped samples
-               that will be accepted.
-        :param pulumi.Input[_builtins.str] scrape_class: scrapeClass defines the scrape class to apply.
-        :param pulumi.Input[_builtins.bool] scrape_classic_histograms: scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-               It requires Prometheus >= v2.45.0.
-
-               Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-        :param pulumi.Input[_builtins.bool] scrape_native_histograms: scrapeNativeHistograms defines whether to enable scraping of native histograms.
-               It requires Prometheus >= v3.8.0.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] scrape_protocols: scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-               protocols supported by Prometheus in order of preference (from most to least preferred).
-
-               If unset, Prometheus uses its default value.
-
-               It requires Prometheus >= v2.49.0.
-        :param pulumi.Input[_builtins.str] selector_mechanism: selectorMechanism defines the mechanism used to select the endpoints to scrape.
-               By default, the selection process relies on relabel configurations to filter the discovered targets.
-               Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-               Which strategy is best for your use case needs to be carefully evaluated.
-
-               It requires Prometheus >= v2.17.0.
-        :param pulumi.Input[_builtins.str] service_discovery_role: serviceDiscoveryRole defines the service discovery role used to discover targets.
-
-               If set, the value should be either "Endpoints" or "EndpointSlice".
-               Otherwise it defaults to the value defined in the
-               Prometheus/PrometheusAgent resource.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] target_labels: targetLabels defines the labels which are transferred from the
-               associated Kubernetes `Service` object onto the ingested metrics.
-        :param pulumi.Input[_builtins.int] target_limit: targetLimit defines a limit on the number of scraped targets that will
-               be accepted.
-        """
-        if attach_metadata is not None:
-            pulumi.set(__self__, "attach_metadata", attach_metadata)
-        if body_size_limit is not None:
-            pulumi.set(__self__, "body_size_limit", body_size_limit)
-        if convert_classic_histograms_to_nhcb is not None:
-            pulumi.set(__self__, "convert_classic_histograms_to_nhcb", convert_classic_histograms_to_nhcb)
-        if endpoints is not None:
-            pulumi.set(__self__, "endpoints", endpoints)
-        if fallback_scrape_protocol is not None:
-            pulumi.set(__self__, "fallback_scrape_protocol", fallback_scrape_protocol)
-        if job_label is not None:
-            pulumi.set(__self__, "job_label", job_label)
-        if keep_dropped_targets is not None:
-            pulumi.set(__self__, "keep_dropped_targets", keep_dropped_targets)
-        if label_limit is not None:
-            pulumi.set(__self__, "label_limit", label_limit)
-        if label_name_length_limit is not None:
-            pulumi.set(__self__, "label_name_length_limit", label_name_length_limit)
-        if label_value_length_limit is not None:
-            pulumi.set(__self__, "label_value_length_limit", label_value_length_limit)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if native_histogram_bucket_limit is not None:
-            pulumi.set(__self__, "native_histogram_bucket_limit", native_histogram_bucket_limit)
-        if native_histogram_min_bucket_factor is not None:
-            pulumi.set(__self__, "native_histogram_min_bucket_factor", native_histogram_min_bucket_factor)
-        if pod_target_labels is not None:
-            pulumi.set(__self__, "pod_target_labels", pod_target_labels)
-        if sample_limit is not None:
-            pulumi.set(__self__, "sample_limit", sample_limit)
-        if scrape_class is not None:
-            pulumi.set(__self__, "scrape_class", scrape_class)
-        if scrape_classic_histograms is not None:
-            pulumi.set(__self__, "scrape_classic_histograms", scrape_classic_histograms)
-        if scrape_native_histograms is not None:
-            pulumi.set(__self__, "scrape_native_histograms", scrape_native_histograms)
-        if scrape_protocols is not None:
-            pulumi.set(__self__, "scrape_protocols", scrape_protocols)
-        if selector is not None:
-            pulumi.set(__self__, "selector", selector)
-        if selector_mechanism is not None:
-            pulumi.set(__self__, "selector_mechanism", selector_mechanism)
-        if service_discovery_role is not None:
-            pulumi.set(__self__, "service_discovery_role", service_discovery_role)
-        if target_labels is not None:
-            pulumi.set(__self__, "target_labels", target_labels)
-        if target_limit is not None:
-            pulumi.set(__self__, "target_limit", target_limit)
-
-    @_builtins.property
-    @pulumi.getter(name="attachMetadata")
-    def attach_metadata(self) -> pulumi.Input[Optional['ServiceMonitorSpecAttachMetadataArgs']]:
-        return pulumi.get(self, "attach_metadata")
-
-    @attach_metadata.setter
-    def attach_metadata(self, value: pulumi.Input[Optional['ServiceMonitorSpecAttachMetadataArgs']]):
-        pulumi.set(self, "attach_metadata", value)
-
-    @_builtins.property
-    @pulumi.getter(name="bodySizeLimit")
-    def body_size_limit(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        bodySizeLimit when defined, bodySizeLimit specifies a job level limit on the size
-        of uncompressed response body that will be accepted by Prometheus.
-
-        It requires Prometheus >= v2.28.0.
-        """
-        return pulumi.get(self, "body_size_limit")
-
-    @body_size_limit.setter
-    def body_size_limit(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "body_size_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="convertClassicHistogramsToNHCB")
-    def convert_classic_histograms_to_nhcb(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-        It requires Prometheus >= v3.0.0.
-        """
-        return pulumi.get(self, "convert_classic_histograms_to_nhcb")
-
-    @convert_classic_histograms_to_nhcb.setter
-    def convert_classic_histograms_to_nhcb(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "convert_classic_histograms_to_nhcb", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def endpoints(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsArgs']]]]:
-        """
-        endpoints defines the list of endpoints part of this ServiceMonitor.
-        Defines how to scrape metrics from Kubernetes [Endpoints](https://kubernetes.io/docs/concepts/services-networking/service/#endpoints) objects.
-        In most cases, an Endpoints object is backed by a Kubernetes [Service](https://kubernetes.io/docs/concepts/services-networking/service/) object with the same name and labels.
-        """
-        return pulumi.get(self, "endpoints")
-
-    @endpoints.setter
-    def endpoints(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorSpecEndpointsArgs']]]]):
-        pulumi.set(self, "endpoints", value)
-
-    @_builtins.property
-    @pulumi.getter(name="fallbackScrapeProtocol")
-    def fallback_scrape_protocol(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-        It requires Prometheus >= v3.0.0.
-        """
-        return pulumi.get(self, "fallback_scrape_protocol")
-
-    @fallback_scrape_protocol.setter
-    def fallback_scrape_protocol(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "fallback_scrape_protocol", value)
-
-    @_builtins.property
-    @pulumi.getter(name="jobLabel")
-    def job_label(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        jobLabel selects the label from the associated Kubernetes `Service`
-        object which will be used as the `job` label for all metrics.
-
-        For example if `jobLabel` is set to `foo` and the Kubernetes `Service`
-        object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-        label to all ingested metrics.
-
-        If the value of this field is empty or if the label doesn't exist for
-        the given Service, the `job` label of the metrics defaults to the name
-        of the associated Kubernetes `Service`.
-        """
-        return pulumi.get(self, "job_label")
-
-    @job_label.setter
-    def job_label(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "job_label", value)
-
-    @_builtins.property
-    @pulumi.getter(name="keepDroppedTargets")
-    def keep_dropped_targets(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-        that will be kept in memory. 0 means no limit.
-
-        It requires Prometheus >= v2.47.0.
-        """
-        return pulumi.get(self, "keep_dropped_targets")
-
-    @keep_dropped_targets.setter
-    def keep_dropped_targets(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "keep_dropped_targets", value)
-
-    @_builtins.property
-    @pulumi.getter(name="labelLimit")
-    def label_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_limit")
-
-    @label_limit.setter
-    def label_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "label_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="labelNameLengthLimit")
-    def label_name_length_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_name_length_limit")
-
-    @label_name_length_limit.setter
-    def label_name_length_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "label_name_length_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="labelValueLengthLimit")
-    def label_value_length_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_value_length_limit")
-
-    @label_value_length_limit.setter
-    def label_value_length_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "label_value_length_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> pulumi.Input[Optional['ServiceMonitorSpecNamespaceSelectorArgs']]:
-        return pulumi.get(self, "namespace_selector")
-
-    @namespace_selector.setter
-    def namespace_selector(self, value: pulumi.Input[Optional['ServiceMonitorSpecNamespaceSelectorArgs']]):
-        pulumi.set(self, "namespace_selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="nativeHistogramBucketLimit")
-    def native_histogram_bucket_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-        buckets will be merged to stay within the limit.
-        It requires Prometheus >= v2.45.0.
-        """
-        return pulumi.get(self, "native_histogram_bucket_limit")
-
-    @native_histogram_bucket_limit.setter
-    def native_histogram_bucket_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "native_histogram_bucket_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="nativeHistogramMinBucketFactor")
-    def native_histogram_min_bucket_factor(self) -> pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]:
-        """
-        nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-        buckets will be merged to increase the factor sufficiently.
-        It requires Prometheus >= v2.50.0.
-        """
-        return pulumi.get(self, "native_histogram_min_bucket_factor")
-
-    @native_histogram_min_bucket_factor.setter
-    def native_histogram_min_bucket_factor(self, value: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]):
-        pulumi.set(self, "native_histogram_min_bucket_factor", value)
-
-    @_builtins.property
-    @pulumi.getter(name="podTargetLabels")
-    def pod_target_labels(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        podTargetLabels defines the labels which are transferred from the
-        associated Kubernetes `Pod` object onto the ingested metrics.
-        """
-        return pulumi.get(self, "pod_target_labels")
-
-    @pod_target_labels.setter
-    def pod_target_labels(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "pod_target_labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sampleLimit")
-    def sample_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        sampleLimit defines a per-scrape limit on the number of scraped samples
-        that will be accepted.
-        """
-        return pulumi.get(self, "sample_limit")
-
-    @sample_limit.setter
-    def sample_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "sample_limit", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeClass")
-    def scrape_class(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        scrapeClass defines the scrape class to apply.
-        """
-        return pulumi.get(self, "scrape_class")
-
-    @scrape_class.setter
-    def scrape_class(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "scrape_class", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeClassicHistograms")
-    def scrape_classic_histograms(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-        It requires Prometheus >= v2.45.0.
-
-        Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-        """
-        return pulumi.get(self, "scrape_classic_histograms")
-
-    @scrape_classic_histograms.setter
-    def scrape_classic_histograms(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "scrape_classic_histograms", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeNativeHistograms")
-    def scrape_native_histograms(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        scrapeNativeHistograms defines whether to enable scraping of native histograms.
-        It requires Prometheus >= v3.8.0.
-        """
-        return pulumi.get(self, "scrape_native_histograms")
-
-    @scrape_native_histograms.setter
-    def scrape_native_histograms(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "scrape_native_histograms", value)
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeProtocols")
-    def scrape_protocols(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-        protocols supported by Prometheus in order of preference (from most to least preferred).
-
-        If unset, Prometheus uses its default value.
-
-        It requires Prometheus >= v2.49.0.
-        """
-        return pulumi.get(self, "scrape_protocols")
-
-    @scrape_protocols.setter
-    def scrape_protocols(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "scrape_protocols", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def selector(self) -> pulumi.Input[Optional['ServiceMonitorSpecSelectorArgs']]:
-        return pulumi.get(self, "selector")
-
-    @selector.setter
-    def selector(self, value: pulumi.Input[Optional['ServiceMonitorSpecSelectorArgs']]):
-        pulumi.set(self, "selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="selectorMechanism")
-    def selector_mechanism(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        selectorMechanism defines the mechanism used to select the endpoints to scrape.
-        By default, the selection process relies on relabel configurations to filter the discovered targets.
-        Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-        Which strategy is best for your use case needs to be carefully evaluated.
-
-        It requires Prometheus >= v2.17.0.
-        """
-        return pulumi.get(self, "selector_mechanism")
-
-    @selector_mechanism.setter
-    def selector_mechanism(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "selector_mechanism", value)
-
-    @_builtins.property
-    @pulumi.getter(name="serviceDiscoveryRole")
-    def service_discovery_role(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        serviceDiscoveryRole defines the service discovery role used to discover targets.
-
-        If set, the value should be either "Endpoints" or "EndpointSlice".
-        Otherwise it defaults to the value defined in the
-        Prometheus/PrometheusAgent resource.
-        """
-        return pulumi.get(self, "service_discovery_role")
-
-    @service_discovery_role.setter
-    def service_discovery_role(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "service_discovery_role", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabels")
-    def target_labels(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        targetLabels defines the labels which are transferred from the
-        associated Kubernetes `Service` object onto the ingested metrics.
-        """
-        return pulumi.get(self, "target_labels")
-
-    @target_labels.setter
-    def target_labels(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "target_labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetLimit")
-    def target_limit(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        targetLimit defines a limit on the number of scraped targets that will
-        be accepted.
-        """
-        return pulumi.get(self, "target_limit")
-
-    @target_limit.setter
-    def target_limit(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "target_limit", value)
-
-
-class ServiceMonitorStatusBindingsConditionsArgsDict(TypedDict):
-    """
-    ConfigResourceCondition describes the status of configuration resources linked to Prometheus, PrometheusAgent, Alertmanager or ThanosRuler.
-    """
-    last_transition_time: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    lastTransitionTime defines the time of the last update to the current status property.
-    """
-    message: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    message defines the human-readable message indicating details for the condition's last transition.
-    """
-    observed_generation: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    observedGeneration defines the .metadata.generation that the
-    condition was set based upon. For instance, if `.metadata.generation` is
-    currently 12, but the `.status.conditions[].observedGeneration` is 9, the
-    condition is out of date with respect to the current state of the object.
-    """
-    reason: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    reason for the condition's last transition.
-    """
-    status: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    status of the condition.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type of the condition being reported.
-    Currently, only "Accepted" is supported.
-    """
-
-@pulumi.input_type
-class ServiceMonitorStatusBindingsConditionsArgs:
-    def __init__(__self__, *,
-                 last_transition_time: pulumi.Input[Optional[_builtins.str]] = None,
-                 message: pulumi.Input[Optional[_builtins.str]] = None,
-                 observed_generation: pulumi.Input[Optional[_builtins.int]] = None,
-                 reason: pulumi.Input[Optional[_builtins.str]] = None,
-                 status: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        ConfigResourceCondition describes the status of configuration resources linked to Prometheus, PrometheusAgent, Alertmanager or ThanosRuler.
-
-        :param pulumi.Input[_builtins.str] last_transition_time: lastTransitionTime defines the time of the last update to the current status property.
-        :param pulumi.Input[_builtins.str] message: message defines the human-readable message indicating details for the condition's last transition.
-        :param pulumi.Input[_builtins.int] observed_generation: observedGeneration defines the .metadata.generation that the
-               condition was set based upon. For instance, if `.metadata.generation` is
-               currently 12, but the `.status.conditions[].observedGeneration` is 9, the
-               condition is out of date with respect to the current state of the object.
-        :param pulumi.Input[_builtins.str] reason: reason for the condition's last transition.
-        :param pulumi.Input[_builtins.str] status: status of the condition.
-        :param pulumi.Input[_builtins.str] type: type of the condition being reported.
-               Currently, only "Accepted" is supported.
-        """
-        if last_transition_time is not None:
-            pulumi.set(__self__, "last_transition_time", last_transition_time)
-        if message is not None:
-            pulumi.set(__self__, "message", message)
-        if observed_generation is not None:
-            pulumi.set(__self__, "observed_generation", observed_generation)
-        if reason is not None:
-            pulumi.set(__self__, "reason", reason)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="lastTransitionTime")
-    def last_transition_time(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        lastTransitionTime defines the time of the last update to the current status property.
-        """
-        return pulumi.get(self, "last_transition_time")
-
-    @last_transition_time.setter
-    def last_transition_time(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "last_transition_time", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def message(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        message defines the human-readable message indicating details for the condition's last transition.
-        """
-        return pulumi.get(self, "message")
-
-    @message.setter
-    def message(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "message", value)
-
-    @_builtins.property
-    @pulumi.getter(name="observedGeneration")
-    def observed_generation(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        observedGeneration defines the .metadata.generation that the
-        condition was set based upon. For instance, if `.metadata.generation` is
-        currently 12, but the `.status.conditions[].observedGeneration` is 9, the
-        condition is out of date with respect to the current state of the object.
-        """
-        return pulumi.get(self, "observed_generation")
-
-    @observed_generation.setter
-    def observed_generation(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "observed_generation", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def reason(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        reason for the condition's last transition.
-        """
-        return pulumi.get(self, "reason")
-
-    @reason.setter
-    def reason(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "reason", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        status of the condition.
-        """
-        return pulumi.get(self, "status")
-
-    @status.setter
-    def status(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "status", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type of the condition being reported.
-        Currently, only "Accepted" is supported.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class ServiceMonitorStatusBindingsArgsDict(TypedDict):
-    """
-    WorkloadBinding is a link between a configuration resource and a workload resource.
-    """
-    conditions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorStatusBindingsConditionsArgs']]]]]
-    """
-    conditions defines the current state of the configuration resource when bound to the referenced Workload object.
-    """
-    group: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    group defines the group of the referenced resource.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    name defines the name of the referenced object.
-    """
-    namespace: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    namespace defines the namespace of the referenced object.
-    """
-    resource: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
-    """
-
-@pulumi.input_type
-class ServiceMonitorStatusBindingsArgs:
-    def __init__(__self__, *,
-                 conditions: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorStatusBindingsConditionsArgs']]]] = None,
-                 group: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 namespace: pulumi.Input[Optional[_builtins.str]] = None,
-                 resource: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        WorkloadBinding is a link between a configuration resource and a workload resource.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ServiceMonitorStatusBindingsConditionsArgs']]] conditions: conditions defines the current state of the configuration resource when bound to the referenced Workload object.
-        :param pulumi.Input[_builtins.str] group: group defines the group of the referenced resource.
-        :param pulumi.Input[_builtins.str] name: name defines the name of the referenced object.
-        :param pulumi.Input[_builtins.str] namespace: namespace defines the namespace of the referenced object.
-        :param pulumi.Input[_builtins.str] resource: resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
-        """
-        if conditions is not None:
-            pulumi.set(__self__, "conditions", conditions)
-        if group is not None:
-            pulumi.set(__self__, "group", group)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if namespace is not None:
-            pulumi.set(__self__, "namespace", namespace)
-        if resource is not None:
-            pulumi.set(__self__, "resource", resource)
-
-    @_builtins.property
-    @pulumi.getter
-    def conditions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorStatusBindingsConditionsArgs']]]]:
-        """
-        conditions defines the current state of the configuration resource when bound to the referenced Workload object.
-        """
-        return pulumi.get(self, "conditions")
-
-    @conditions.setter
-    def conditions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorStatusBindingsConditionsArgs']]]]):
-        pulumi.set(self, "conditions", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def group(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        group defines the group of the referenced resource.
-        """
-        return pulumi.get(self, "group")
-
-    @group.setter
-    def group(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "group", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        name defines the name of the referenced object.
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def namespace(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        namespace defines the namespace of the referenced object.
-        """
-        return pulumi.get(self, "namespace")
-
-    @namespace.setter
-    def namespace(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "namespace", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def resource(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
-        """
-        return pulumi.get(self, "resource")
-
-    @resource.setter
-    def resource(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "resource", value)
-
-
-class ServiceMonitorStatusArgsDict(TypedDict):
-    """
-    status defines the status subresource. It is under active development and is updated only when the
-    "StatusForConfigurationResources" feature gate is enabled.
-
-    Most recent observed status of the ServiceMonitor. Read-only.
-    More info:
-    https://github.com/kubernetes/community/blob/master/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    bindings: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorStatusBindingsArgs']]]]]
-    """
-    bindings defines the list of workload resources (Prometheus, PrometheusAgent, ThanosRuler or Alertmanager) which select the configuration resource.
-    """
-
-@pulumi.input_type
-class ServiceMonitorStatusArgs:
-    def __init__(__self__, *,
-                 bindings: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorStatusBindingsArgs']]]] = None):
-        """
-        status defines the status subresource. It is under active development and is updated only when the
-        "StatusForConfigurationResources" feature gate is enabled.
-
-        Most recent observed status of the ServiceMonitor. Read-only.
-        More info:
-        https://github.com/kubernetes/community/blob/master/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param pulumi.Input[Sequence[pulumi.Input['ServiceMonitorStatusBindingsArgs']]] bindings: bindings defines the list of workload resources (Prometheus, PrometheusAgent, ThanosRuler or Alertmanager) which select the configuration resource.
-        """
-        if bindings is not None:
-            pulumi.set(__self__, "bindings", bindings)
-
-    @_builtins.property
-    @pulumi.getter
-    def bindings(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorStatusBindingsArgs']]]]:
-        """
-        bindings defines the list of workload resources (Prometheus, PrometheusAgent, ThanosRuler or Alertmanager) which select the configuration resource.
-        """
-        return pulumi.get(self, "bindings")
-
-    @bindings.setter
-    def bindings(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ServiceMonitorStatusBindingsArgs']]]]):
-        pulumi.set(self, "bindings", value)
-
-
-class ServiceMonitorArgsDict(TypedDict):
-    """
-    The `ServiceMonitor` custom resource definition (CRD) defines how `Prometheus` and `PrometheusAgent` can scrape metrics from a group of services.
-    Among other things, it allows to specify:
-    * The services to scrape via label selectors.
-    * The container ports to scrape.
-    * Authentication credentials to use.
-    * Target and metric relabeling.
-
-    `Prometheus` and `PrometheusAgent` objects select `ServiceMonitor` objects using label and namespace selectors.
-    """
-    api_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-    """
-    kind: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-    """
-    metadata: NotRequired[pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']]]
-    """
-    Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-    """
-    spec: NotRequired[pulumi.Input[Optional['ServiceMonitorSpecArgs']]]
-    status: NotRequired[pulumi.Input[Optional['ServiceMonitorStatusArgs']]]
-
-@pulumi.input_type
-class ServiceMonitorArgs:
-    def __init__(__self__, *,
-                 api_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 kind: pulumi.Input[Optional[_builtins.str]] = None,
-                 metadata: pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']] = None,
-                 spec: pulumi.Input[Optional['ServiceMonitorSpecArgs']] = None,
-                 status: pulumi.Input[Optional['ServiceMonitorStatusArgs']] = None):
-        """
-        The `ServiceMonitor` custom resource definition (CRD) defines how `Prometheus` and `PrometheusAgent` can scrape metrics from a group of services.
-        Among other things, it allows to specify:
-        * The services to scrape via label selectors.
-        * The container ports to scrape.
-        * Authentication credentials to use.
-        * Target and metric relabeling.
-
-        `Prometheus` and `PrometheusAgent` objects select `ServiceMonitor` objects using label and namespace selectors.
-
-        :param pulumi.Input[_builtins.str] api_version: APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        :param pulumi.Input[_builtins.str] kind: Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        :param pulumi.Input['_meta.v1.ObjectMetaArgs'] metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        if api_version is not None:
-            pulumi.set(__self__, "api_version", 'monitoring.coreos.com/v1')
-        if kind is not None:
-            pulumi.set(__self__, "kind", 'ServiceMonitor')
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter(name="apiVersion")
-    def api_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        """
-        return pulumi.get(self, "api_version")
-
-    @api_version.setter
-    def api_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "api_version", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def kind(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        return pulumi.get(self, "kind")
-
-    @kind.setter
-    def kind(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "kind", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']]:
-        """
-        Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        return pulumi.get(self, "metadata")
-
-    @metadata.setter
-    def metadata(self, value: pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']]):
-        pulumi.set(self, "metadata", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> pulumi.Input[Optional['ServiceMonitorSpecArgs']]:
-        return pulumi.get(self, "spec")
-
-    @spec.setter
-    def spec(self, value: pulumi.Input[Optional['ServiceMonitorSpecArgs']]):
-        pulumi.set(self, "spec", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> pulumi.Input[Optional['ServiceMonitorStatusArgs']]:
-        return pulumi.get(self, "status")
-
-    @status.setter
-    def status(self, value: pulumi.Input[Optional['ServiceMonitorStatusArgs']]):
-        pulumi.set(self, "status", value)
@@ -0,0 +1,71 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['PodMonitorSpecAttachMetadataArgsDict', 'PodMonitorSpecAttachMetadataArgs']
+
+class PodMonitorSpecAttachMetadataArgsDict(TypedDict):
+    """
+    attachMetadata defines additional metadata which is added to the
+    discovered targets.
+
+    It requires Prometheus >= v2.35.0.
+    """
+    node: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    node when set to true, Prometheus attaches node metadata to the discovered
+    targets.
+
+    The Prometheus service account must have the `list` and `watch`
+    permissions on the `Nodes` objects.
+    """
+
+
+@pulumi.input_type
+class PodMonitorSpecAttachMetadataArgs:
+    def __init__(__self__, *,
+                 node: pulumi.Input[Optional[_builtins.bool]] = None):
+        """
+        attachMetadata defines additional metadata which is added to the
+        discovered targets.
+
+        It requires Prometheus >= v2.35.0.
+
+        :param pulumi.Input[_builtins.bool] node: node when set to true, Prometheus attaches node metadata to the discovered
+               targets.
+
+               The Prometheus service account must have the `list` and `watch`
+               permissions on the `Nodes` objects.
+        """
+        if node is not None:
+            pulumi.set(__self__, "node", node)
+
+    @_builtins.property
+    @pulumi.getter
+    def node(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        node when set to true, Prometheus attaches node metadata to the discovered
+        targets.
+
+        The Prometheus service account must have the `list` and `watch`
+        permissions on the `Nodes` objects.
+        """
+        return pulumi.get(self, "node")
+
+    @node.setter
+    def node(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "node", value)
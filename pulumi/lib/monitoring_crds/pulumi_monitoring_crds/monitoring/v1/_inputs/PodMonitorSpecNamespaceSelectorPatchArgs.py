@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['PodMonitorSpecNamespaceSelectorPatchArgsDict', 'PodMonitorSpecNamespaceSelectorPatchArgs']
+
+class PodMonitorSpecNamespaceSelectorPatchArgsDict(TypedDict):
+    """
+    namespaceSelector defines in which namespace(s) Prometheus should discover the pods.
+    By default, the pods are discovered in the same namespace as the `PodMonitor` object but it is possible to select pods across different/all namespaces.
+    """
+    any: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    any defines the boolean describing whether all namespaces are selected in contrast to a
+    list restricting them.
+    """
+    match_names: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    matchNames defines the list of namespace names to select from.
+    """
+
+
+@pulumi.input_type
+class PodMonitorSpecNamespaceSelectorPatchArgs:
+    def __init__(__self__, *,
+                 any: pulumi.Input[Optional[_builtins.bool]] = None,
+                 match_names: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
+        """
+        namespaceSelector defines in which namespace(s) Prometheus should discover the pods.
+        By default, the pods are discovered in the same namespace as the `PodMonitor` object but it is possible to select pods across different/all namespaces.
+
+        :param pulumi.Input[_builtins.bool] any: any defines the boolean describing whether all namespaces are selected in contrast to a
+               list restricting them.
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] match_names: matchNames defines the list of namespace names to select from.
+        """
+        if any is not None:
+            pulumi.set(__self__, "any", any)
+        if match_names is not None:
+            pulumi.set(__self__, "match_names", match_names)
+
+    @_builtins.property
+    @pulumi.getter
+    def any(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        any defines the boolean describing whether all namespaces are selected in contrast to a
+        list restricting them.
+        """
+        return pulumi.get(self, "any")
+
+    @any.setter
+    def any(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "any", value)
+
+    @_builtins.property
+    @pulumi.getter(name="matchNames")
+    def match_names(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        matchNames defines the list of namespace names to select from.
+        """
+        return pulumi.get(self, "match_names")
+
+    @match_names.setter
+    def match_names(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "match_names", value)
@@ -0,0 +1,64 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['PodMonitorSpecPodMetricsEndpointsBasicAuthArgsDict', 'PodMonitorSpecPodMetricsEndpointsBasicAuthArgs']
+
+class PodMonitorSpecPodMetricsEndpointsBasicAuthArgsDict(TypedDict):
+    """
+    basicAuth defines the Basic Authentication credentials used by the
+    client.
+
+    Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
+    """
+    password: NotRequired[pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgs']]]
+    username: NotRequired[pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgs']]]
+
+
+@pulumi.input_type
+class PodMonitorSpecPodMetricsEndpointsBasicAuthArgs:
+    def __init__(__self__, *,
+                 password: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgs']] = None,
+                 username: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgs']] = None):
+        """
+        basicAuth defines the Basic Authentication credentials used by the
+        client.
+
+        Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
+        """
+        if password is not None:
+            pulumi.set(__self__, "password", password)
+        if username is not None:
+            pulumi.set(__self__, "username", username)
+
+    @_builtins.property
+    @pulumi.getter
+    def password(self) -> pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgs']]:
+        return pulumi.get(self, "password")
+
+    @password.setter
+    def password(self, value: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgs']]):
+        pulumi.set(self, "password", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def username(self) -> pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgs']]:
+        return pulumi.get(self, "username")
+
+    @username.setter
+    def username(self, value: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgs']]):
+        pulumi.set(self, "username", value)
@@ -0,0 +1,250 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['PodMonitorSpecPodMetricsEndpointsOauth2PatchArgsDict', 'PodMonitorSpecPodMetricsEndpointsOauth2PatchArgs']
+
+class PodMonitorSpecPodMetricsEndpointsOauth2PatchArgsDict(TypedDict):
+    """
+    oauth2 defines the OAuth2 settings used by the client.
+
+    It requires Prometheus >= 2.27.0.
+
+    Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
+    """
+    client_id: NotRequired[pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgs']]]
+    client_secret: NotRequired[pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgs']]]
+    endpoint_params: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+    """
+    endpointParams configures the HTTP parameters to append to the token
+    URL.
+    """
+    no_proxy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
+    that should be excluded from proxying. IP and domain names can
+    contain port numbers.
+
+    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+    """
+    proxy_connect_header: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs']]]]]]]
+    """
+    proxyConnectHeader optionally specifies headers to send to
+    proxies during CONNECT requests.
+
+    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+    """
+    proxy_from_environment: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
+
+    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+    """
+    proxy_url: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    proxyUrl defines the HTTP proxy server to use.
+    """
+    scopes: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    scopes defines the OAuth2 scopes used for the token request.
+    """
+    tls_config: NotRequired[pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgs']]]
+    token_url: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    tokenUrl defines the URL to fetch the token from.
+    """
+
+
+@pulumi.input_type
+class PodMonitorSpecPodMetricsEndpointsOauth2PatchArgs:
+    def __init__(__self__, *,
+                 client_id: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgs']] = None,
+                 client_secret: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgs']] = None,
+                 endpoint_params: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
+                 no_proxy: pulumi.Input[Optional[_builtins.str]] = None,
+                 proxy_connect_header: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs']]]]]] = None,
+                 proxy_from_environment: pulumi.Input[Optional[_builtins.bool]] = None,
+                 proxy_url: pulumi.Input[Optional[_builtins.str]] = None,
+                 scopes: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 tls_config: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgs']] = None,
+                 token_url: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        oauth2 defines the OAuth2 settings used by the client.
+
+        It requires Prometheus >= 2.27.0.
+
+        Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
+
+        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] endpoint_params: endpointParams configures the HTTP parameters to append to the token
+               URL.
+        :param pulumi.Input[_builtins.str] no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
+               that should be excluded from proxying. IP and domain names can
+               contain port numbers.
+
+               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        :param pulumi.Input[Mapping[str, pulumi.Input[Sequence[pulumi.Input['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs']]]]] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
+               proxies during CONNECT requests.
+
+               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        :param pulumi.Input[_builtins.bool] proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
+
+               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        :param pulumi.Input[_builtins.str] proxy_url: proxyUrl defines the HTTP proxy server to use.
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] scopes: scopes defines the OAuth2 scopes used for the token request.
+        :param pulumi.Input[_builtins.str] token_url: tokenUrl defines the URL to fetch the token from.
+        """
+        if client_id is not None:
+            pulumi.set(__self__, "client_id", client_id)
+        if client_secret is not None:
+            pulumi.set(__self__, "client_secret", client_secret)
+        if endpoint_params is not None:
+            pulumi.set(__self__, "endpoint_params", endpoint_params)
+        if no_proxy is not None:
+            pulumi.set(__self__, "no_proxy", no_proxy)
+        if proxy_connect_header is not None:
+            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
+        if proxy_from_environment is not None:
+            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
+        if proxy_url is not None:
+            pulumi.set(__self__, "proxy_url", proxy_url)
+        if scopes is not None:
+            pulumi.set(__self__, "scopes", scopes)
+        if tls_config is not None:
+            pulumi.set(__self__, "tls_config", tls_config)
+        if token_url is not None:
+            pulumi.set(__self__, "token_url", token_url)
+
+    @_builtins.property
+    @pulumi.getter(name="clientId")
+    def client_id(self) -> pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgs']]:
+        return pulumi.get(self, "client_id")
+
+    @client_id.setter
+    def client_id(self, value: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgs']]):
+        pulumi.set(self, "client_id", value)
+
+    @_builtins.property
+    @pulumi.getter(name="clientSecret")
+    def client_secret(self) -> pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgs']]:
+        return pulumi.get(self, "client_secret")
+
+    @client_secret.setter
+    def client_secret(self, value: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgs']]):
+        pulumi.set(self, "client_secret", value)
+
+    @_builtins.property
+    @pulumi.getter(name="endpointParams")
+    def endpoint_params(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        """
+        endpointParams configures the HTTP parameters to append to the token
+        URL.
+        """
+        return pulumi.get(self, "endpoint_params")
+
+    @endpoint_params.setter
+    def endpoint_params(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "endpoint_params", value)
+
+    @_builtins.property
+    @pulumi.getter(name="noProxy")
+    def no_proxy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
+        that should be excluded from proxying. IP and domain names can
+        contain port numbers.
+
+        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        """
+        return pulumi.get(self, "no_proxy")
+
+    @no_proxy.setter
+    def no_proxy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "no_proxy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="proxyConnectHeader")
+    def proxy_connect_header(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs']]]]]]:
+        """
+        proxyConnectHeader optionally specifies headers to send to
+        proxies during CONNECT requests.
+
+        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        """
+        return pulumi.get(self, "proxy_connect_header")
+
+    @proxy_connect_header.setter
+    def proxy_connect_header(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs']]]]]]):
+        pulumi.set(self, "proxy_connect_header", value)
+
+    @_builtins.property
+    @pulumi.getter(name="proxyFromEnvironment")
+    def proxy_from_environment(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
+
+        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        """
+        return pulumi.get(self, "proxy_from_environment")
+
+    @proxy_from_environment.setter
+    def proxy_from_environment(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "proxy_from_environment", value)
+
+    @_builtins.property
+    @pulumi.getter(name="proxyUrl")
+    def proxy_url(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        proxyUrl defines the HTTP proxy server to use.
+        """
+        return pulumi.get(self, "proxy_url")
+
+    @proxy_url.setter
+    def proxy_url(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "proxy_url", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def scopes(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        scopes defines the OAuth2 scopes used for the token request.
+        """
+        return pulumi.get(self, "scopes")
+
+    @scopes.setter
+    def scopes(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "scopes", value)
+
+    @_builtins.property
+    @pulumi.getter(name="tlsConfig")
+    def tls_config(self) -> pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgs']]:
+        return pulumi.get(self, "tls_config")
+
+    @tls_config.setter
+    def tls_config(self, value: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgs']]):
+        pulumi.set(self, "tls_config", value)
+
+    @_builtins.property
+    @pulumi.getter(name="tokenUrl")
+    def token_url(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        tokenUrl defines the URL to fetch the token from.
+        """
+        return pulumi.get(self, "token_url")
+
+    @token_url.setter
+    def token_url(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "token_url", value)
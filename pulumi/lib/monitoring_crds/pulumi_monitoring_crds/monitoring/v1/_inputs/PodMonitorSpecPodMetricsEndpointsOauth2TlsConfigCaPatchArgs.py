@@ -0,0 +1,58 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgsDict', 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgs']
+
+class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgsDict(TypedDict):
+    """
+    ca defines the Certificate authority used when verifying server certificates.
+    """
+    config_map: NotRequired[pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgs']]]
+    secret: NotRequired[pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgs']]]
+
+
+@pulumi.input_type
+class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgs:
+    def __init__(__self__, *,
+                 config_map: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgs']] = None,
+                 secret: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgs']] = None):
+        """
+        ca defines the Certificate authority used when verifying server certificates.
+        """
+        if config_map is not None:
+            pulumi.set(__self__, "config_map", config_map)
+        if secret is not None:
+            pulumi.set(__self__, "secret", secret)
+
+    @_builtins.property
+    @pulumi.getter(name="configMap")
+    def config_map(self) -> pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgs']]:
+        return pulumi.get(self, "config_map")
+
+    @config_map.setter
+    def config_map(self, value: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgs']]):
+        pulumi.set(self, "config_map", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def secret(self) -> pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgs']]:
+        return pulumi.get(self, "secret")
+
+    @secret.setter
+    def secret(self, value: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgs']]):
+        pulumi.set(self, "secret", value)
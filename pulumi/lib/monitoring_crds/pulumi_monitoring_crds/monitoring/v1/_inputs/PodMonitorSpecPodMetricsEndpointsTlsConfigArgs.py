@@ -0,0 +1,164 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['PodMonitorSpecPodMetricsEndpointsTlsConfigArgsDict', 'PodMonitorSpecPodMetricsEndpointsTlsConfigArgs']
+
+class PodMonitorSpecPodMetricsEndpointsTlsConfigArgsDict(TypedDict):
+    """
+    tlsConfig defines the TLS configuration used by the client.
+    """
+    ca: NotRequired[pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgs']]]
+    cert: NotRequired[pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgs']]]
+    insecure_skip_verify: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    insecureSkipVerify defines how to disable target certificate validation.
+    """
+    key_secret: NotRequired[pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgs']]]
+    max_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    maxVersion defines the maximum acceptable TLS version.
+
+    It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
+    """
+    min_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    minVersion defines the minimum acceptable TLS version.
+
+    It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
+    """
+    server_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    serverName is used to verify the hostname for the targets.
+    """
+
+
+@pulumi.input_type
+class PodMonitorSpecPodMetricsEndpointsTlsConfigArgs:
+    def __init__(__self__, *,
+                 ca: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgs']] = None,
+                 cert: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgs']] = None,
+                 insecure_skip_verify: pulumi.Input[Optional[_builtins.bool]] = None,
+                 key_secret: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgs']] = None,
+                 max_version: pulumi.Input[Optional[_builtins.str]] = None,
+                 min_version: pulumi.Input[Optional[_builtins.str]] = None,
+                 server_name: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        tlsConfig defines the TLS configuration used by the client.
+
+        :param pulumi.Input[_builtins.bool] insecure_skip_verify: insecureSkipVerify defines how to disable target certificate validation.
+        :param pulumi.Input[_builtins.str] max_version: maxVersion defines the maximum acceptable TLS version.
+
+               It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
+        :param pulumi.Input[_builtins.str] min_version: minVersion defines the minimum acceptable TLS version.
+
+               It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
+        :param pulumi.Input[_builtins.str] server_name: serverName is used to verify the hostname for the targets.
+        """
+        if ca is not None:
+            pulumi.set(__self__, "ca", ca)
+        if cert is not None:
+            pulumi.set(__self__, "cert", cert)
+        if insecure_skip_verify is not None:
+            pulumi.set(__self__, "insecure_skip_verify", insecure_skip_verify)
+        if key_secret is not None:
+            pulumi.set(__self__, "key_secret", key_secret)
+        if max_version is not None:
+            pulumi.set(__self__, "max_version", max_version)
+        if min_version is not None:
+            pulumi.set(__self__, "min_version", min_version)
+        if server_name is not None:
+            pulumi.set(__self__, "server_name", server_name)
+
+    @_builtins.property
+    @pulumi.getter
+    def ca(self) -> pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgs']]:
+        return pulumi.get(self, "ca")
+
+    @ca.setter
+    def ca(self, value: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgs']]):
+        pulumi.set(self, "ca", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def cert(self) -> pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgs']]:
+        return pulumi.get(self, "cert")
+
+    @cert.setter
+    def cert(self, value: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgs']]):
+        pulumi.set(self, "cert", value)
+
+    @_builtins.property
+    @pulumi.getter(name="insecureSkipVerify")
+    def insecure_skip_verify(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        insecureSkipVerify defines how to disable target certificate validation.
+        """
+        return pulumi.get(self, "insecure_skip_verify")
+
+    @insecure_skip_verify.setter
+    def insecure_skip_verify(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "insecure_skip_verify", value)
+
+    @_builtins.property
+    @pulumi.getter(name="keySecret")
+    def key_secret(self) -> pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgs']]:
+        return pulumi.get(self, "key_secret")
+
+    @key_secret.setter
+    def key_secret(self, value: pulumi.Input[Optional['_inputs.PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgs']]):
+        pulumi.set(self, "key_secret", value)
+
+    @_builtins.property
+    @pulumi.getter(name="maxVersion")
+    def max_version(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        maxVersion defines the maximum acceptable TLS version.
+
+        It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
+        """
+        return pulumi.get(self, "max_version")
+
+    @max_version.setter
+    def max_version(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "max_version", value)
+
+    @_builtins.property
+    @pulumi.getter(name="minVersion")
+    def min_version(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        minVersion defines the minimum acceptable TLS version.
+
+        It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
+        """
+        return pulumi.get(self, "min_version")
+
+    @min_version.setter
+    def min_version(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "min_version", value)
+
+    @_builtins.property
+    @pulumi.getter(name="serverName")
+    def server_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        serverName is used to verify the hostname for the targets.
+        """
+        return pulumi.get(self, "server_name")
+
+    @server_name.setter
+    def server_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "server_name", value)
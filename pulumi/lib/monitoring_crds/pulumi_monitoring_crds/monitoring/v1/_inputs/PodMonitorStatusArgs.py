@@ -0,0 +1,63 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['PodMonitorStatusArgsDict', 'PodMonitorStatusArgs']
+
+class PodMonitorStatusArgsDict(TypedDict):
+    """
+    status defines the status subresource. It is under active development and is updated only when the
+    "StatusForConfigurationResources" feature gate is enabled.
+
+    Most recent observed status of the PodMonitor. Read-only.
+    More info:
+    https://github.com/kubernetes/community/blob/master/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
+    """
+    bindings: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.PodMonitorStatusBindingsArgs']]]]]
+    """
+    bindings defines the list of workload resources (Prometheus, PrometheusAgent, ThanosRuler or Alertmanager) which select the configuration resource.
+    """
+
+
+@pulumi.input_type
+class PodMonitorStatusArgs:
+    def __init__(__self__, *,
+                 bindings: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.PodMonitorStatusBindingsArgs']]]] = None):
+        """
+        status defines the status subresource. It is under active development and is updated only when the
+        "StatusForConfigurationResources" feature gate is enabled.
+
+        Most recent observed status of the PodMonitor. Read-only.
+        More info:
+        https://github.com/kubernetes/community/blob/master/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
+
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.PodMonitorStatusBindingsArgs']]] bindings: bindings defines the list of workload resources (Prometheus, PrometheusAgent, ThanosRuler or Alertmanager) which select the configuration resource.
+        """
+        if bindings is not None:
+            pulumi.set(__self__, "bindings", bindings)
+
+    @_builtins.property
+    @pulumi.getter
+    def bindings(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.PodMonitorStatusBindingsArgs']]]]:
+        """
+        bindings defines the list of workload resources (Prometheus, PrometheusAgent, ThanosRuler or Alertmanager) which select the configuration resource.
+        """
+        return pulumi.get(self, "bindings")
+
+    @bindings.setter
+    def bindings(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.PodMonitorStatusBindingsArgs']]]]):
+        pulumi.set(self, "bindings", value)
@@ -0,0 +1,133 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['PodMonitorStatusBindingsArgsDict', 'PodMonitorStatusBindingsArgs']
+
+class PodMonitorStatusBindingsArgsDict(TypedDict):
+    """
+    WorkloadBinding is a link between a configuration resource and a workload resource.
+    """
+    conditions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.PodMonitorStatusBindingsConditionsArgs']]]]]
+    """
+    conditions defines the current state of the configuration resource when bound to the referenced Workload object.
+    """
+    group: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    group defines the group of the referenced resource.
+    """
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    name defines the name of the referenced object.
+    """
+    namespace: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    namespace defines the namespace of the referenced object.
+    """
+    resource: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
+    """
+
+
+@pulumi.input_type
+class PodMonitorStatusBindingsArgs:
+    def __init__(__self__, *,
+                 conditions: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.PodMonitorStatusBindingsConditionsArgs']]]] = None,
+                 group: pulumi.Input[Optional[_builtins.str]] = None,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 namespace: pulumi.Input[Optional[_builtins.str]] = None,
+                 resource: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        WorkloadBinding is a link between a configuration resource and a workload resource.
+
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.PodMonitorStatusBindingsConditionsArgs']]] conditions: conditions defines the current state of the configuration resource when bound to the referenced Workload object.
+        :param pulumi.Input[_builtins.str] group: group defines the group of the referenced resource.
+        :param pulumi.Input[_builtins.str] name: name defines the name of the referenced object.
+        :param pulumi.Input[_builtins.str] namespace: namespace defines the namespace of the referenced object.
+        :param pulumi.Input[_builtins.str] resource: resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
+        """
+        if conditions is not None:
+            pulumi.set(__self__, "conditions", conditions)
+        if group is not None:
+            pulumi.set(__self__, "group", group)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if namespace is not None:
+            pulumi.set(__self__, "namespace", namespace)
+        if resource is not None:
+            pulumi.set(__self__, "resource", resource)
+
+    @_builtins.property
+    @pulumi.getter
+    def conditions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.PodMonitorStatusBindingsConditionsArgs']]]]:
+        """
+        conditions defines the current state of the configuration resource when bound to the referenced Workload object.
+        """
+        return pulumi.get(self, "conditions")
+
+    @conditions.setter
+    def conditions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.PodMonitorStatusBindingsConditionsArgs']]]]):
+        pulumi.set(self, "conditions", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def group(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        group defines the group of the referenced resource.
+        """
+        return pulumi.get(self, "group")
+
+    @group.setter
+    def group(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "group", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        name defines the name of the referenced object.
+        """
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def namespace(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        namespace defines the namespace of the referenced object.
+        """
+        return pulumi.get(self, "namespace")
+
+    @namespace.setter
+    def namespace(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "namespace", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def resource(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
+        """
+        return pulumi.get(self, "resource")
+
+    @resource.setter
+    def resource(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "resource", value)
@@ -0,0 +1,165 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['PodMonitorStatusBindingsConditionsArgsDict', 'PodMonitorStatusBindingsConditionsArgs']
+
+class PodMonitorStatusBindingsConditionsArgsDict(TypedDict):
+    """
+    ConfigResourceCondition describes the status of configuration resources linked to Prometheus, PrometheusAgent, Alertmanager or ThanosRuler.
+    """
+    last_transition_time: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    lastTransitionTime defines the time of the last update to the current status property.
+    """
+    message: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    message defines the human-readable message indicating details for the condition's last transition.
+    """
+    observed_generation: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    observedGeneration defines the .metadata.generation that the
+    condition was set based upon. For instance, if `.metadata.generation` is
+    currently 12, but the `.status.conditions[].observedGeneration` is 9, the
+    condition is out of date with respect to the current state of the object.
+    """
+    reason: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    reason for the condition's last transition.
+    """
+    status: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    status of the condition.
+    """
+    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    type of the condition being reported.
+    Currently, only "Accepted" is supported.
+    """
+
+
+@pulumi.input_type
+class PodMonitorStatusBindingsConditionsArgs:
+    def __init__(__self__, *,
+                 last_transition_time: pulumi.Input[Optional[_builtins.str]] = None,
+                 message: pulumi.Input[Optional[_builtins.str]] = None,
+                 observed_generation: pulumi.Input[Optional[_builtins.int]] = None,
+                 reason: pulumi.Input[Optional[_builtins.str]] = None,
+                 status: pulumi.Input[Optional[_builtins.str]] = None,
+                 type: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        ConfigResourceCondition describes the status of configuration resources linked to Prometheus, PrometheusAgent, Alertmanager or ThanosRuler.
+
+        :param pulumi.Input[_builtins.str] last_transition_time: lastTransitionTime defines the time of the last update to the current status property.
+        :param pulumi.Input[_builtins.str] message: message defines the human-readable message indicating details for the condition's last transition.
+        :param pulumi.Input[_builtins.int] observed_generation: observedGeneration defines the .metadata.generation that the
+               condition was set based upon. For instance, if `.metadata.generation` is
+               currently 12, but the `.status.conditions[].observedGeneration` is 9, the
+               condition is out of date with respect to the current state of the object.
+        :param pulumi.Input[_builtins.str] reason: reason for the condition's last transition.
+        :param pulumi.Input[_builtins.str] status: status of the condition.
+        :param pulumi.Input[_builtins.str] type: type of the condition being reported.
+               Currently, only "Accepted" is supported.
+        """
+        if last_transition_time is not None:
+            pulumi.set(__self__, "last_transition_time", last_transition_time)
+        if message is not None:
+            pulumi.set(__self__, "message", message)
+        if observed_generation is not None:
+            pulumi.set(__self__, "observed_generation", observed_generation)
+        if reason is not None:
+            pulumi.set(__self__, "reason", reason)
+        if status is not None:
+            pulumi.set(__self__, "status", status)
+        if type is not None:
+            pulumi.set(__self__, "type", type)
+
+    @_builtins.property
+    @pulumi.getter(name="lastTransitionTime")
+    def last_transition_time(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        lastTransitionTime defines the time of the last update to the current status property.
+        """
+        return pulumi.get(self, "last_transition_time")
+
+    @last_transition_time.setter
+    def last_transition_time(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "last_transition_time", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def message(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        message defines the human-readable message indicating details for the condition's last transition.
+        """
+        return pulumi.get(self, "message")
+
+    @message.setter
+    def message(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "message", value)
+
+    @_builtins.property
+    @pulumi.getter(name="observedGeneration")
+    def observed_generation(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        observedGeneration defines the .metadata.generation that the
+        condition was set based upon. For instance, if `.metadata.generation` is
+        currently 12, but the `.status.conditions[].observedGeneration` is 9, the
+        condition is out of date with respect to the current state of the object.
+        """
+        return pulumi.get(self, "observed_generation")
+
+    @observed_generation.setter
+    def observed_generation(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "observed_generation", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def reason(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        reason for the condition's last transition.
+        """
+        return pulumi.get(self, "reason")
+
+    @reason.setter
+    def reason(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "reason", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def status(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        status of the condition.
+        """
+        return pulumi.get(self, "status")
+
+    @status.setter
+    def status(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "status", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        type of the condition being reported.
+        Currently, only "Accepted" is supported.
+        """
+        return pulumi.get(self, "type")
+
+    @type.setter
+    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "type", value)
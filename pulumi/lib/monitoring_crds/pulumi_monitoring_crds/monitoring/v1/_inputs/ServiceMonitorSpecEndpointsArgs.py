@@ -0,0 +1,626 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ServiceMonitorSpecEndpointsArgsDict', 'ServiceMonitorSpecEndpointsArgs']
+
+class ServiceMonitorSpecEndpointsArgsDict(TypedDict):
+    """
+    Endpoint defines an endpoint serving Prometheus metrics to be scraped by
+    Prometheus.
+    """
+    authorization: NotRequired[pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsAuthorizationArgs']]]
+    basic_auth: NotRequired[pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsBasicAuthArgs']]]
+    bearer_token_file: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    bearerTokenFile defines the file to read bearer token for scraping the target.
+
+    Deprecated: use `authorization` instead.
+    """
+    bearer_token_secret: NotRequired[pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsBearerTokenSecretArgs']]]
+    enable_http2: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    enableHttp2 can be used to disable HTTP2.
+    """
+    filter_running: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    filterRunning when true, the pods which are not running (e.g. either in Failed or
+    Succeeded state) are dropped during the target discovery.
+
+    If unset, the filtering is enabled.
+
+    More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
+    """
+    follow_redirects: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    followRedirects defines whether the client should follow HTTP 3xx
+    redirects.
+    """
+    honor_labels: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    honorLabels defines when true the metric's labels when they collide
+    with the target's labels.
+    """
+    honor_timestamps: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    honorTimestamps defines whether Prometheus preserves the timestamps
+    when exposed by the target.
+    """
+    interval: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    interval at which Prometheus scrapes the metrics from the target.
+
+    If empty, Prometheus uses the global scrape interval.
+    """
+    metric_relabelings: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ServiceMonitorSpecEndpointsMetricRelabelingsArgs']]]]]
+    """
+    metricRelabelings defines the relabeling rules to apply to the
+    samples before ingestion.
+    """
+    no_proxy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
+    that should be excluded from proxying. IP and domain names can
+    contain port numbers.
+
+    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+    """
+    oauth2: NotRequired[pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsOauth2Args']]]
+    params: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]]]
+    """
+    params define optional HTTP URL parameters.
+    """
+    path: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    path defines the HTTP path from which to scrape for metrics.
+
+    If empty, Prometheus uses the default value (e.g. `/metrics`).
+    """
+    port: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    port defines the name of the Service port which this endpoint refers to.
+
+    It takes precedence over `targetPort`.
+    """
+    proxy_connect_header: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['_inputs.ServiceMonitorSpecEndpointsProxyConnectHeaderArgs']]]]]]]
+    """
+    proxyConnectHeader optionally specifies headers to send to
+    proxies during CONNECT requests.
+
+    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+    """
+    proxy_from_environment: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
+
+    It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+    """
+    proxy_url: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    proxyUrl defines the HTTP proxy server to use.
+    """
+    relabelings: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ServiceMonitorSpecEndpointsRelabelingsArgs']]]]]
+    """
+    relabelings defines the relabeling rules to apply the target's
+    metadata labels.
+
+    The Operator automatically adds relabelings for a few standard Kubernetes fields.
+
+    The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
+
+    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
+    """
+    scheme: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    scheme defines the HTTP scheme to use when scraping the metrics.
+    """
+    scrape_timeout: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
+
+    If empty, Prometheus uses the global scrape timeout unless it is less
+    than the target's scrape interval value in which the latter is used.
+    The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
+    """
+    target_port: NotRequired[pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]]
+    """
+    targetPort defines the name or number of the target port of the `Pod` object behind the
+    Service. The port must be specified with the container's port property.
+    """
+    tls_config: NotRequired[pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsTlsConfigArgs']]]
+    track_timestamps_staleness: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    trackTimestampsStaleness defines whether Prometheus tracks staleness of
+    the metrics that have an explicit timestamp present in scraped data.
+    Has no effect if `honorTimestamps` is false.
+
+    It requires Prometheus >= v2.48.0.
+    """
+
+
+@pulumi.input_type
+class ServiceMonitorSpecEndpointsArgs:
+    def __init__(__self__, *,
+                 authorization: pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsAuthorizationArgs']] = None,
+                 basic_auth: pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsBasicAuthArgs']] = None,
+                 bearer_token_file: pulumi.Input[Optional[_builtins.str]] = None,
+                 bearer_token_secret: pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsBearerTokenSecretArgs']] = None,
+                 enable_http2: pulumi.Input[Optional[_builtins.bool]] = None,
+                 filter_running: pulumi.Input[Optional[_builtins.bool]] = None,
+                 follow_redirects: pulumi.Input[Optional[_builtins.bool]] = None,
+                 honor_labels: pulumi.Input[Optional[_builtins.bool]] = None,
+                 honor_timestamps: pulumi.Input[Optional[_builtins.bool]] = None,
+                 interval: pulumi.Input[Optional[_builtins.str]] = None,
+                 metric_relabelings: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ServiceMonitorSpecEndpointsMetricRelabelingsArgs']]]] = None,
+                 no_proxy: pulumi.Input[Optional[_builtins.str]] = None,
+                 oauth2: pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsOauth2Args']] = None,
+                 params: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]] = None,
+                 path: pulumi.Input[Optional[_builtins.str]] = None,
+                 port: pulumi.Input[Optional[_builtins.str]] = None,
+                 proxy_connect_header: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['_inputs.ServiceMonitorSpecEndpointsProxyConnectHeaderArgs']]]]]] = None,
+                 proxy_from_environment: pulumi.Input[Optional[_builtins.bool]] = None,
+                 proxy_url: pulumi.Input[Optional[_builtins.str]] = None,
+                 relabelings: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ServiceMonitorSpecEndpointsRelabelingsArgs']]]] = None,
+                 scheme: pulumi.Input[Optional[_builtins.str]] = None,
+                 scrape_timeout: pulumi.Input[Optional[_builtins.str]] = None,
+                 target_port: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]] = None,
+                 tls_config: pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsTlsConfigArgs']] = None,
+                 track_timestamps_staleness: pulumi.Input[Optional[_builtins.bool]] = None):
+        """
+        Endpoint defines an endpoint serving Prometheus metrics to be scraped by
+        Prometheus.
+
+        :param pulumi.Input[_builtins.str] bearer_token_file: bearerTokenFile defines the file to read bearer token for scraping the target.
+
+               Deprecated: use `authorization` instead.
+        :param pulumi.Input[_builtins.bool] enable_http2: enableHttp2 can be used to disable HTTP2.
+        :param pulumi.Input[_builtins.bool] filter_running: filterRunning when true, the pods which are not running (e.g. either in Failed or
+               Succeeded state) are dropped during the target discovery.
+
+               If unset, the filtering is enabled.
+
+               More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
+        :param pulumi.Input[_builtins.bool] follow_redirects: followRedirects defines whether the client should follow HTTP 3xx
+               redirects.
+        :param pulumi.Input[_builtins.bool] honor_labels: honorLabels defines when true the metric's labels when they collide
+               with the target's labels.
+        :param pulumi.Input[_builtins.bool] honor_timestamps: honorTimestamps defines whether Prometheus preserves the timestamps
+               when exposed by the target.
+        :param pulumi.Input[_builtins.str] interval: interval at which Prometheus scrapes the metrics from the target.
+
+               If empty, Prometheus uses the global scrape interval.
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ServiceMonitorSpecEndpointsMetricRelabelingsArgs']]] metric_relabelings: metricRelabelings defines the relabeling rules to apply to the
+               samples before ingestion.
+        :param pulumi.Input[_builtins.str] no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
+               that should be excluded from proxying. IP and domain names can
+               contain port numbers.
+
+               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        :param pulumi.Input[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]] params: params define optional HTTP URL parameters.
+        :param pulumi.Input[_builtins.str] path: path defines the HTTP path from which to scrape for metrics.
+
+               If empty, Prometheus uses the default value (e.g. `/metrics`).
+        :param pulumi.Input[_builtins.str] port: port defines the name of the Service port which this endpoint refers to.
+
+               It takes precedence over `targetPort`.
+        :param pulumi.Input[Mapping[str, pulumi.Input[Sequence[pulumi.Input['_inputs.ServiceMonitorSpecEndpointsProxyConnectHeaderArgs']]]]] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
+               proxies during CONNECT requests.
+
+               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        :param pulumi.Input[_builtins.bool] proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
+
+               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        :param pulumi.Input[_builtins.str] proxy_url: proxyUrl defines the HTTP proxy server to use.
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ServiceMonitorSpecEndpointsRelabelingsArgs']]] relabelings: relabelings defines the relabeling rules to apply the target's
+               metadata labels.
+
+               The Operator automatically adds relabelings for a few standard Kubernetes fields.
+
+               The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
+
+               More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
+        :param pulumi.Input[_builtins.str] scheme: scheme defines the HTTP scheme to use when scraping the metrics.
+        :param pulumi.Input[_builtins.str] scrape_timeout: scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
+
+               If empty, Prometheus uses the global scrape timeout unless it is less
+               than the target's scrape interval value in which the latter is used.
+               The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
+        :param pulumi.Input[Union[_builtins.int, _builtins.str]] target_port: targetPort defines the name or number of the target port of the `Pod` object behind the
+               Service. The port must be specified with the container's port property.
+        :param pulumi.Input[_builtins.bool] track_timestamps_staleness: trackTimestampsStaleness defines whether Prometheus tracks staleness of
+               the metrics that have an explicit timestamp present in scraped data.
+               Has no effect if `honorTimestamps` is false.
+
+               It requires Prometheus >= v2.48.0.
+        """
+        if authorization is not None:
+            pulumi.set(__self__, "authorization", authorization)
+        if basic_auth is not None:
+            pulumi.set(__self__, "basic_auth", basic_auth)
+        if bearer_token_file is not None:
+            pulumi.set(__self__, "bearer_token_file", bearer_token_file)
+        if bearer_token_secret is not None:
+            pulumi.set(__self__, "bearer_token_secret", bearer_token_secret)
+        if enable_http2 is not None:
+            pulumi.set(__self__, "enable_http2", enable_http2)
+        if filter_running is not None:
+            pulumi.set(__self__, "filter_running", filter_running)
+        if follow_redirects is not None:
+            pulumi.set(__self__, "follow_redirects", follow_redirects)
+        if honor_labels is not None:
+            pulumi.set(__self__, "honor_labels", honor_labels)
+        if honor_timestamps is not None:
+            pulumi.set(__self__, "honor_timestamps", honor_timestamps)
+        if interval is not None:
+            pulumi.set(__self__, "interval", interval)
+        if metric_relabelings is not None:
+            pulumi.set(__self__, "metric_relabelings", metric_relabelings)
+        if no_proxy is not None:
+            pulumi.set(__self__, "no_proxy", no_proxy)
+        if oauth2 is not None:
+            pulumi.set(__self__, "oauth2", oauth2)
+        if params is not None:
+            pulumi.set(__self__, "params", params)
+        if path is not None:
+            pulumi.set(__self__, "path", path)
+        if port is not None:
+            pulumi.set(__self__, "port", port)
+        if proxy_connect_header is not None:
+            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
+        if proxy_from_environment is not None:
+            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
+        if proxy_url is not None:
+            pulumi.set(__self__, "proxy_url", proxy_url)
+        if relabelings is not None:
+            pulumi.set(__self__, "relabelings", relabelings)
+        if scheme is not None:
+            pulumi.set(__self__, "scheme", scheme)
+        if scrape_timeout is not None:
+            pulumi.set(__self__, "scrape_timeout", scrape_timeout)
+        if target_port is not None:
+            pulumi.set(__self__, "target_port", target_port)
+        if tls_config is not None:
+            pulumi.set(__self__, "tls_config", tls_config)
+        if track_timestamps_staleness is not None:
+            pulumi.set(__self__, "track_timestamps_staleness", track_timestamps_staleness)
+
+    @_builtins.property
+    @pulumi.getter
+    def authorization(self) -> pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsAuthorizationArgs']]:
+        return pulumi.get(self, "authorization")
+
+    @authorization.setter
+    def authorization(self, value: pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsAuthorizationArgs']]):
+        pulumi.set(self, "authorization", value)
+
+    @_builtins.property
+    @pulumi.getter(name="basicAuth")
+    def basic_auth(self) -> pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsBasicAuthArgs']]:
+        return pulumi.get(self, "basic_auth")
+
+    @basic_auth.setter
+    def basic_auth(self, value: pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsBasicAuthArgs']]):
+        pulumi.set(self, "basic_auth", value)
+
+    @_builtins.property
+    @pulumi.getter(name="bearerTokenFile")
+    def bearer_token_file(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        bearerTokenFile defines the file to read bearer token for scraping the target.
+
+        Deprecated: use `authorization` instead.
+        """
+        return pulumi.get(self, "bearer_token_file")
+
+    @bearer_token_file.setter
+    def bearer_token_file(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "bearer_token_file", value)
+
+    @_builtins.property
+    @pulumi.getter(name="bearerTokenSecret")
+    def bearer_token_secret(self) -> pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsBearerTokenSecretArgs']]:
+        return pulumi.get(self, "bearer_token_secret")
+
+    @bearer_token_secret.setter
+    def bearer_token_secret(self, value: pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsBearerTokenSecretArgs']]):
+        pulumi.set(self, "bearer_token_secret", value)
+
+    @_builtins.property
+    @pulumi.getter(name="enableHttp2")
+    def enable_http2(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        enableHttp2 can be used to disable HTTP2.
+        """
+        return pulumi.get(self, "enable_http2")
+
+    @enable_http2.setter
+    def enable_http2(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "enable_http2", value)
+
+    @_builtins.property
+    @pulumi.getter(name="filterRunning")
+    def filter_running(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        filterRunning when true, the pods which are not running (e.g. either in Failed or
+        Succeeded state) are dropped during the target discovery.
+
+        If unset, the filtering is enabled.
+
+        More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
+        """
+        return pulumi.get(self, "filter_running")
+
+    @filter_running.setter
+    def filter_running(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "filter_running", value)
+
+    @_builtins.property
+    @pulumi.getter(name="followRedirects")
+    def follow_redirects(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        followRedirects defines whether the client should follow HTTP 3xx
+        redirects.
+        """
+        return pulumi.get(self, "follow_redirects")
+
+    @follow_redirects.setter
+    def follow_redirects(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "follow_redirects", value)
+
+    @_builtins.property
+    @pulumi.getter(name="honorLabels")
+    def honor_labels(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        honorLabels defines when true the metric's labels when they collide
+        with the target's labels.
+        """
+        return pulumi.get(self, "honor_labels")
+
+    @honor_labels.setter
+    def honor_labels(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "honor_labels", value)
+
+    @_builtins.property
+    @pulumi.getter(name="honorTimestamps")
+    def honor_timestamps(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        honorTimestamps defines whether Prometheus preserves the timestamps
+        when exposed by the target.
+        """
+        return pulumi.get(self, "honor_timestamps")
+
+    @honor_timestamps.setter
+    def honor_timestamps(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "honor_timestamps", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def interval(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        interval at which Prometheus scrapes the metrics from the target.
+
+        If empty, Prometheus uses the global scrape interval.
+        """
+        return pulumi.get(self, "interval")
+
+    @interval.setter
+    def interval(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "interval", value)
+
+    @_builtins.property
+    @pulumi.getter(name="metricRelabelings")
+    def metric_relabelings(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ServiceMonitorSpecEndpointsMetricRelabelingsArgs']]]]:
+        """
+        metricRelabelings defines the relabeling rules to apply to the
+        samples before ingestion.
+        """
+        return pulumi.get(self, "metric_relabelings")
+
+    @metric_relabelings.setter
+    def metric_relabelings(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ServiceMonitorSpecEndpointsMetricRelabelingsArgs']]]]):
+        pulumi.set(self, "metric_relabelings", value)
+
+    @_builtins.property
+    @pulumi.getter(name="noProxy")
+    def no_proxy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
+        that should be excluded from proxying. IP and domain names can
+        contain port numbers.
+
+        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        """
+        return pulumi.get(self, "no_proxy")
+
+    @no_proxy.setter
+    def no_proxy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "no_proxy", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def oauth2(self) -> pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsOauth2Args']]:
+        return pulumi.get(self, "oauth2")
+
+    @oauth2.setter
+    def oauth2(self, value: pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsOauth2Args']]):
+        pulumi.set(self, "oauth2", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def params(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]]:
+        """
+        params define optional HTTP URL parameters.
+        """
+        return pulumi.get(self, "params")
+
+    @params.setter
+    def params(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input[_builtins.str]]]]]]):
+        pulumi.set(self, "params", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def path(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        path defines the HTTP path from which to scrape for metrics.
+
+        If empty, Prometheus uses the default value (e.g. `/metrics`).
+        """
+        return pulumi.get(self, "path")
+
+    @path.setter
+    def path(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "path", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def port(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        port defines the name of the Service port which this endpoint refers to.
+
+        It takes precedence over `targetPort`.
+        """
+        return pulumi.get(self, "port")
+
+    @port.setter
+    def port(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "port", value)
+
+    @_builtins.property
+    @pulumi.getter(name="proxyConnectHeader")
+    def proxy_connect_header(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['_inputs.ServiceMonitorSpecEndpointsProxyConnectHeaderArgs']]]]]]:
+        """
+        proxyConnectHeader optionally specifies headers to send to
+        proxies during CONNECT requests.
+
+        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        """
+        return pulumi.get(self, "proxy_connect_header")
+
+    @proxy_connect_header.setter
+    def proxy_connect_header(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Sequence[pulumi.Input['_inputs.ServiceMonitorSpecEndpointsProxyConnectHeaderArgs']]]]]]):
+        pulumi.set(self, "proxy_connect_header", value)
+
+    @_builtins.property
+    @pulumi.getter(name="proxyFromEnvironment")
+    def proxy_from_environment(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
+
+        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        """
+        return pulumi.get(self, "proxy_from_environment")
+
+    @proxy_from_environment.setter
+    def proxy_from_environment(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "proxy_from_environment", value)
+
+    @_builtins.property
+    @pulumi.getter(name="proxyUrl")
+    def proxy_url(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        proxyUrl defines the HTTP proxy server to use.
+        """
+        return pulumi.get(self, "proxy_url")
+
+    @proxy_url.setter
+    def proxy_url(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "proxy_url", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def relabelings(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ServiceMonitorSpecEndpointsRelabelingsArgs']]]]:
+        """
+        relabelings defines the relabeling rules to apply the target's
+        metadata labels.
+
+        The Operator automatically adds relabelings for a few standard Kubernetes fields.
+
+        The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
+
+        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
+        """
+        return pulumi.get(self, "relabelings")
+
+    @relabelings.setter
+    def relabelings(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ServiceMonitorSpecEndpointsRelabelingsArgs']]]]):
+        pulumi.set(self, "relabelings", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def scheme(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        scheme defines the HTTP scheme to use when scraping the metrics.
+        """
+        return pulumi.get(self, "scheme")
+
+    @scheme.setter
+    def scheme(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "scheme", value)
+
+    @_builtins.property
+    @pulumi.getter(name="scrapeTimeout")
+    def scrape_timeout(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
+
+        If empty, Prometheus uses the global scrape timeout unless it is less
+        than the target's scrape interval value in which the latter is used.
+        The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
+        """
+        return pulumi.get(self, "scrape_timeout")
+
+    @scrape_timeout.setter
+    def scrape_timeout(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "scrape_timeout", value)
+
+    @_builtins.property
+    @pulumi.getter(name="targetPort")
+    def target_port(self) -> pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]:
+        """
+        targetPort defines the name or number of the target port of the `Pod` object behind the
+        Service. The port must be specified with the container's port property.
+        """
+        return pulumi.get(self, "target_port")
+
+    @target_port.setter
+    def target_port(self, value: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]):
+        pulumi.set(self, "target_port", value)
+
+    @_builtins.property
+    @pulumi.getter(name="tlsConfig")
+    def tls_config(self) -> pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsTlsConfigArgs']]:
+        return pulumi.get(self, "tls_config")
+
+    @tls_config.setter
+    def tls_config(self, value: pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsTlsConfigArgs']]):
+        pulumi.set(self, "tls_config", value)
+
+    @_builtins.property
+    @pulumi.getter(name="trackTimestampsStaleness")
+    def track_timestamps_staleness(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        trackTimestampsStaleness defines whether Prometheus tracks staleness of
+        the metrics that have an explicit timestamp present in scraped data.
+        Has no effect if `honorTimestamps` is false.
+
+        It requires Prometheus >= v2.48.0.
+        """
+        return pulumi.get(self, "track_timestamps_staleness")
+
+    @track_timestamps_staleness.setter
+    def track_timestamps_staleness(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "track_timestamps_staleness", value)
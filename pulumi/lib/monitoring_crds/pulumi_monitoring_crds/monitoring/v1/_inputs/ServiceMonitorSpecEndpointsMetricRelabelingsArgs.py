@@ -0,0 +1,230 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ServiceMonitorSpecEndpointsMetricRelabelingsArgsDict', 'ServiceMonitorSpecEndpointsMetricRelabelingsArgs']
+
+class ServiceMonitorSpecEndpointsMetricRelabelingsArgsDict(TypedDict):
+    """
+    RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
+    scraped samples and remote write samples.
+
+    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
+    """
+    action: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    action to perform based on the regex matching.
+
+    `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
+    `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
+
+    Default: "Replace"
+    """
+    modulus: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    modulus to take of the hash of the source label values.
+
+    Only applicable when the action is `HashMod`.
+    """
+    regex: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    regex defines the regular expression against which the extracted value is matched.
+    """
+    replacement: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    replacement value against which a Replace action is performed if the
+    regular expression matches.
+
+    Regex capture groups are available.
+    """
+    separator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    separator defines the string between concatenated SourceLabels.
+    """
+    source_labels: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    sourceLabels defines the source labels select values from existing labels. Their content is
+    concatenated using the configured Separator and matched against the
+    configured regular expression.
+    """
+    target_label: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    targetLabel defines the label to which the resulting string is written in a replacement.
+
+    It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
+    `KeepEqual` and `DropEqual` actions.
+
+    Regex capture groups are available.
+    """
+
+
+@pulumi.input_type
+class ServiceMonitorSpecEndpointsMetricRelabelingsArgs:
+    def __init__(__self__, *,
+                 action: pulumi.Input[Optional[_builtins.str]] = None,
+                 modulus: pulumi.Input[Optional[_builtins.int]] = None,
+                 regex: pulumi.Input[Optional[_builtins.str]] = None,
+                 replacement: pulumi.Input[Optional[_builtins.str]] = None,
+                 separator: pulumi.Input[Optional[_builtins.str]] = None,
+                 source_labels: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 target_label: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
+        scraped samples and remote write samples.
+
+        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
+
+        :param pulumi.Input[_builtins.str] action: action to perform based on the regex matching.
+
+               `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
+               `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
+
+               Default: "Replace"
+        :param pulumi.Input[_builtins.int] modulus: modulus to take of the hash of the source label values.
+
+               Only applicable when the action is `HashMod`.
+        :param pulumi.Input[_builtins.str] regex: regex defines the regular expression against which the extracted value is matched.
+        :param pulumi.Input[_builtins.str] replacement: replacement value against which a Replace action is performed if the
+               regular expression matches.
+
+               Regex capture groups are available.
+        :param pulumi.Input[_builtins.str] separator: separator defines the string between concatenated SourceLabels.
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] source_labels: sourceLabels defines the source labels select values from existing labels. Their content is
+               concatenated using the configured Separator and matched against the
+               configured regular expression.
+        :param pulumi.Input[_builtins.str] target_label: targetLabel defines the label to which the resulting string is written in a replacement.
+
+               It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
+               `KeepEqual` and `DropEqual` actions.
+
+               Regex capture groups are available.
+        """
+        if action is not None:
+            pulumi.set(__self__, "action", action)
+        if modulus is not None:
+            pulumi.set(__self__, "modulus", modulus)
+        if regex is not None:
+            pulumi.set(__self__, "regex", regex)
+        if replacement is not None:
+            pulumi.set(__self__, "replacement", replacement)
+        if separator is not None:
+            pulumi.set(__self__, "separator", separator)
+        if source_labels is not None:
+            pulumi.set(__self__, "source_labels", source_labels)
+        if target_label is not None:
+            pulumi.set(__self__, "target_label", target_label)
+
+    @_builtins.property
+    @pulumi.getter
+    def action(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        action to perform based on the regex matching.
+
+        `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
+        `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
+
+        Default: "Replace"
+        """
+        return pulumi.get(self, "action")
+
+    @action.setter
+    def action(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "action", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def modulus(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        modulus to take of the hash of the source label values.
+
+        Only applicable when the action is `HashMod`.
+        """
+        return pulumi.get(self, "modulus")
+
+    @modulus.setter
+    def modulus(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "modulus", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def regex(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        regex defines the regular expression against which the extracted value is matched.
+        """
+        return pulumi.get(self, "regex")
+
+    @regex.setter
+    def regex(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "regex", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def replacement(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        replacement value against which a Replace action is performed if the
+        regular expression matches.
+
+        Regex capture groups are available.
+        """
+        return pulumi.get(self, "replacement")
+
+    @replacement.setter
+    def replacement(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "replacement", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def separator(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        separator defines the string between concatenated SourceLabels.
+        """
+        return pulumi.get(self, "separator")
+
+    @separator.setter
+    def separator(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "separator", value)
+
+    @_builtins.property
+    @pulumi.getter(name="sourceLabels")
+    def source_labels(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        sourceLabels defines the source labels select values from existing labels. Their content is
+        concatenated using the configured Separator and matched against the
+        configured regular expression.
+        """
+        return pulumi.get(self, "source_labels")
+
+    @source_labels.setter
+    def source_labels(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "source_labels", value)
+
+    @_builtins.property
+    @pulumi.getter(name="targetLabel")
+    def target_label(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        targetLabel defines the label to which the resulting string is written in a replacement.
+
+        It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
+        `KeepEqual` and `DropEqual` actions.
+
+        Regex capture groups are available.
+        """
+        return pulumi.get(self, "target_label")
+
+    @target_label.setter
+    def target_label(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "target_label", value)
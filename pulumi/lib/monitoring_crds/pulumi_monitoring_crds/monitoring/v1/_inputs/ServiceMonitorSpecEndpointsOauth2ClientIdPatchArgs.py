@@ -0,0 +1,60 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgsDict', 'ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgs']
+
+class ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgsDict(TypedDict):
+    """
+    clientId defines a key of a Secret or ConfigMap containing the
+    OAuth2 client's ID.
+    """
+    config_map: NotRequired[pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgs']]]
+    secret: NotRequired[pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgs']]]
+
+
+@pulumi.input_type
+class ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgs:
+    def __init__(__self__, *,
+                 config_map: pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgs']] = None,
+                 secret: pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgs']] = None):
+        """
+        clientId defines a key of a Secret or ConfigMap containing the
+        OAuth2 client's ID.
+        """
+        if config_map is not None:
+            pulumi.set(__self__, "config_map", config_map)
+        if secret is not None:
+            pulumi.set(__self__, "secret", secret)
+
+    @_builtins.property
+    @pulumi.getter(name="configMap")
+    def config_map(self) -> pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgs']]:
+        return pulumi.get(self, "config_map")
+
+    @config_map.setter
+    def config_map(self, value: pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgs']]):
+        pulumi.set(self, "config_map", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def secret(self) -> pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgs']]:
+        return pulumi.get(self, "secret")
+
+    @secret.setter
+    def secret(self, value: pulumi.Input[Optional['_inputs.ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgs']]):
+        pulumi.set(self, "secret", value)
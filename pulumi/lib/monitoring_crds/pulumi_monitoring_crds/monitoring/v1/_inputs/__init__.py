@@ -0,0 +1,787 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import importlib
+import typing
+
+__all__ = [
+    'PodMonitorSpecAttachMetadataPatchArgsDict',
+    'PodMonitorSpecAttachMetadataPatchArgs',
+    'PodMonitorSpecAttachMetadataArgsDict',
+    'PodMonitorSpecAttachMetadataArgs',
+    'PodMonitorSpecNamespaceSelectorPatchArgsDict',
+    'PodMonitorSpecNamespaceSelectorPatchArgs',
+    'PodMonitorSpecNamespaceSelectorArgsDict',
+    'PodMonitorSpecNamespaceSelectorArgs',
+    'PodMonitorSpecPatchArgsDict',
+    'PodMonitorSpecPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsArgs',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthArgs',
+    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2PatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2PatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsOauth2Args',
+    'PodMonitorSpecPodMetricsEndpointsPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs',
+    'PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsRelabelingsArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsRelabelingsArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigPatchArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigArgs',
+    'PodMonitorSpecPodMetricsEndpointsArgsDict',
+    'PodMonitorSpecPodMetricsEndpointsArgs',
+    'PodMonitorSpecSelectorMatchExpressionsPatchArgsDict',
+    'PodMonitorSpecSelectorMatchExpressionsPatchArgs',
+    'PodMonitorSpecSelectorMatchExpressionsArgsDict',
+    'PodMonitorSpecSelectorMatchExpressionsArgs',
+    'PodMonitorSpecSelectorPatchArgsDict',
+    'PodMonitorSpecSelectorPatchArgs',
+    'PodMonitorSpecSelectorArgsDict',
+    'PodMonitorSpecSelectorArgs',
+    'PodMonitorSpecArgsDict',
+    'PodMonitorSpecArgs',
+    'PodMonitorStatusBindingsConditionsArgsDict',
+    'PodMonitorStatusBindingsConditionsArgs',
+    'PodMonitorStatusBindingsArgsDict',
+    'PodMonitorStatusBindingsArgs',
+    'PodMonitorStatusArgsDict',
+    'PodMonitorStatusArgs',
+    'PodMonitorArgsDict',
+    'PodMonitorArgs',
+    'ServiceMonitorSpecAttachMetadataPatchArgsDict',
+    'ServiceMonitorSpecAttachMetadataPatchArgs',
+    'ServiceMonitorSpecAttachMetadataArgsDict',
+    'ServiceMonitorSpecAttachMetadataArgs',
+    'ServiceMonitorSpecEndpointsAuthorizationCredentialsPatchArgsDict',
+    'ServiceMonitorSpecEndpointsAuthorizationCredentialsPatchArgs',
+    'ServiceMonitorSpecEndpointsAuthorizationCredentialsArgsDict',
+    'ServiceMonitorSpecEndpointsAuthorizationCredentialsArgs',
+    'ServiceMonitorSpecEndpointsAuthorizationPatchArgsDict',
+    'ServiceMonitorSpecEndpointsAuthorizationPatchArgs',
+    'ServiceMonitorSpecEndpointsAuthorizationArgsDict',
+    'ServiceMonitorSpecEndpointsAuthorizationArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthPasswordPatchArgsDict',
+    'ServiceMonitorSpecEndpointsBasicAuthPasswordPatchArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthPasswordArgsDict',
+    'ServiceMonitorSpecEndpointsBasicAuthPasswordArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthPatchArgsDict',
+    'ServiceMonitorSpecEndpointsBasicAuthPatchArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthUsernamePatchArgsDict',
+    'ServiceMonitorSpecEndpointsBasicAuthUsernamePatchArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthUsernameArgsDict',
+    'ServiceMonitorSpecEndpointsBasicAuthUsernameArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthArgsDict',
+    'ServiceMonitorSpecEndpointsBasicAuthArgs',
+    'ServiceMonitorSpecEndpointsBearerTokenSecretPatchArgsDict',
+    'ServiceMonitorSpecEndpointsBearerTokenSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsBearerTokenSecretArgsDict',
+    'ServiceMonitorSpecEndpointsBearerTokenSecretArgs',
+    'ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgsDict',
+    'ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgs',
+    'ServiceMonitorSpecEndpointsMetricRelabelingsArgsDict',
+    'ServiceMonitorSpecEndpointsMetricRelabelingsArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientSecretPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2ClientSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientSecretArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2ClientSecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2PatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2PatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigPatchArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigArgs',
+    'ServiceMonitorSpecEndpointsOauth2ArgsDict',
+    'ServiceMonitorSpecEndpointsOauth2Args',
+    'ServiceMonitorSpecEndpointsPatchArgsDict',
+    'ServiceMonitorSpecEndpointsPatchArgs',
+    'ServiceMonitorSpecEndpointsProxyConnectHeaderArgsDict',
+    'ServiceMonitorSpecEndpointsProxyConnectHeaderArgs',
+    'ServiceMonitorSpecEndpointsRelabelingsPatchArgsDict',
+    'ServiceMonitorSpecEndpointsRelabelingsPatchArgs',
+    'ServiceMonitorSpecEndpointsRelabelingsArgsDict',
+    'ServiceMonitorSpecEndpointsRelabelingsArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatchArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaPatchArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCaPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaSecretPatchArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCaSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaSecretArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCaSecretArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCaArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatchArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertPatchArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCertPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertSecretPatchArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCertSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertSecretArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCertSecretArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigCertArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigKeySecretPatchArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigKeySecretPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigKeySecretArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigKeySecretArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigPatchArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigArgsDict',
+    'ServiceMonitorSpecEndpointsTlsConfigArgs',
+    'ServiceMonitorSpecEndpointsArgsDict',
+    'ServiceMonitorSpecEndpointsArgs',
+    'ServiceMonitorSpecNamespaceSelectorPatchArgsDict',
+    'ServiceMonitorSpecNamespaceSelectorPatchArgs',
+    'ServiceMonitorSpecNamespaceSelectorArgsDict',
+    'ServiceMonitorSpecNamespaceSelectorArgs',
+    'ServiceMonitorSpecPatchArgsDict',
+    'ServiceMonitorSpecPatchArgs',
+    'ServiceMonitorSpecSelectorMatchExpressionsPatchArgsDict',
+    'ServiceMonitorSpecSelectorMatchExpressionsPatchArgs',
+    'ServiceMonitorSpecSelectorMatchExpressionsArgsDict',
+    'ServiceMonitorSpecSelectorMatchExpressionsArgs',
+    'ServiceMonitorSpecSelectorPatchArgsDict',
+    'ServiceMonitorSpecSelectorPatchArgs',
+    'ServiceMonitorSpecSelectorArgsDict',
+    'ServiceMonitorSpecSelectorArgs',
+    'ServiceMonitorSpecArgsDict',
+    'ServiceMonitorSpecArgs',
+    'ServiceMonitorStatusBindingsConditionsArgsDict',
+    'ServiceMonitorStatusBindingsConditionsArgs',
+    'ServiceMonitorStatusBindingsArgsDict',
+    'ServiceMonitorStatusBindingsArgs',
+    'ServiceMonitorStatusArgsDict',
+    'ServiceMonitorStatusArgs',
+    'ServiceMonitorArgsDict',
+    'ServiceMonitorArgs',
+]
+
+_TYPE_MODULES = {
+    'PodMonitorSpecAttachMetadataPatchArgsDict': 'PodMonitorSpecAttachMetadataPatchArgs',
+    'PodMonitorSpecAttachMetadataPatchArgs': 'PodMonitorSpecAttachMetadataPatchArgs',
+    'PodMonitorSpecAttachMetadataArgsDict': 'PodMonitorSpecAttachMetadataArgs',
+    'PodMonitorSpecAttachMetadataArgs': 'PodMonitorSpecAttachMetadataArgs',
+    'PodMonitorSpecNamespaceSelectorPatchArgsDict': 'PodMonitorSpecNamespaceSelectorPatchArgs',
+    'PodMonitorSpecNamespaceSelectorPatchArgs': 'PodMonitorSpecNamespaceSelectorPatchArgs',
+    'PodMonitorSpecNamespaceSelectorArgsDict': 'PodMonitorSpecNamespaceSelectorArgs',
+    'PodMonitorSpecNamespaceSelectorArgs': 'PodMonitorSpecNamespaceSelectorArgs',
+    'PodMonitorSpecPatchArgsDict': 'PodMonitorSpecPatchArgs',
+    'PodMonitorSpecPatchArgs': 'PodMonitorSpecPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatchArgs': 'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsArgsDict': 'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsArgs',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsArgs': 'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsArgs',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsAuthorizationPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationPatchArgs': 'PodMonitorSpecPodMetricsEndpointsAuthorizationPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationArgsDict': 'PodMonitorSpecPodMetricsEndpointsAuthorizationArgs',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationArgs': 'PodMonitorSpecPodMetricsEndpointsAuthorizationArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatchArgs': 'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgsDict': 'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgs': 'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsBasicAuthPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPatchArgs': 'PodMonitorSpecPodMetricsEndpointsBasicAuthPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatchArgs': 'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgsDict': 'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgs': 'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthArgsDict': 'PodMonitorSpecPodMetricsEndpointsBasicAuthArgs',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthArgs': 'PodMonitorSpecPodMetricsEndpointsBasicAuthArgs',
+    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatchArgs': 'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretArgsDict': 'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretArgs': 'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgs': 'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgsDict': 'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgs',
+    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgs': 'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatchArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatchArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2PatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2PatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2PatchArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2PatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatchArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatchArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatchArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatchArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigArgs': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigArgs',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ArgsDict': 'PodMonitorSpecPodMetricsEndpointsOauth2Args',
+    'PodMonitorSpecPodMetricsEndpointsOauth2Args': 'PodMonitorSpecPodMetricsEndpointsOauth2Args',
+    'PodMonitorSpecPodMetricsEndpointsPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsPatchArgs': 'PodMonitorSpecPodMetricsEndpointsPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgsDict': 'PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs',
+    'PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs': 'PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs',
+    'PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgs': 'PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsRelabelingsArgsDict': 'PodMonitorSpecPodMetricsEndpointsRelabelingsArgs',
+    'PodMonitorSpecPodMetricsEndpointsRelabelingsArgs': 'PodMonitorSpecPodMetricsEndpointsRelabelingsArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatchArgs': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapArgsDict': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapArgs': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatchArgs': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatchArgs': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretArgsDict': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretArgs': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgsDict': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgs': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatchArgs': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapArgsDict': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapArgs': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatchArgs': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatchArgs': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretArgsDict': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretArgs': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgsDict': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgs': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatchArgs': 'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgsDict': 'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgs': 'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigPatchArgsDict': 'PodMonitorSpecPodMetricsEndpointsTlsConfigPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigPatchArgs': 'PodMonitorSpecPodMetricsEndpointsTlsConfigPatchArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigArgsDict': 'PodMonitorSpecPodMetricsEndpointsTlsConfigArgs',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigArgs': 'PodMonitorSpecPodMetricsEndpointsTlsConfigArgs',
+    'PodMonitorSpecPodMetricsEndpointsArgsDict': 'PodMonitorSpecPodMetricsEndpointsArgs',
+    'PodMonitorSpecPodMetricsEndpointsArgs': 'PodMonitorSpecPodMetricsEndpointsArgs',
+    'PodMonitorSpecSelectorMatchExpressionsPatchArgsDict': 'PodMonitorSpecSelectorMatchExpressionsPatchArgs',
+    'PodMonitorSpecSelectorMatchExpressionsPatchArgs': 'PodMonitorSpecSelectorMatchExpressionsPatchArgs',
+    'PodMonitorSpecSelectorMatchExpressionsArgsDict': 'PodMonitorSpecSelectorMatchExpressionsArgs',
+    'PodMonitorSpecSelectorMatchExpressionsArgs': 'PodMonitorSpecSelectorMatchExpressionsArgs',
+    'PodMonitorSpecSelectorPatchArgsDict': 'PodMonitorSpecSelectorPatchArgs',
+    'PodMonitorSpecSelectorPatchArgs': 'PodMonitorSpecSelectorPatchArgs',
+    'PodMonitorSpecSelectorArgsDict': 'PodMonitorSpecSelectorArgs',
+    'PodMonitorSpecSelectorArgs': 'PodMonitorSpecSelectorArgs',
+    'PodMonitorSpecArgsDict': 'PodMonitorSpecArgs',
+    'PodMonitorSpecArgs': 'PodMonitorSpecArgs',
+    'PodMonitorStatusBindingsConditionsArgsDict': 'PodMonitorStatusBindingsConditionsArgs',
+    'PodMonitorStatusBindingsConditionsArgs': 'PodMonitorStatusBindingsConditionsArgs',
+    'PodMonitorStatusBindingsArgsDict': 'PodMonitorStatusBindingsArgs',
+    'PodMonitorStatusBindingsArgs': 'PodMonitorStatusBindingsArgs',
+    'PodMonitorStatusArgsDict': 'PodMonitorStatusArgs',
+    'PodMonitorStatusArgs': 'PodMonitorStatusArgs',
+    'PodMonitorArgsDict': 'PodMonitorArgs',
+    'PodMonitorArgs': 'PodMonitorArgs',
+    'ServiceMonitorSpecAttachMetadataPatchArgsDict': 'ServiceMonitorSpecAttachMetadataPatchArgs',
+    'ServiceMonitorSpecAttachMetadataPatchArgs': 'ServiceMonitorSpecAttachMetadataPatchArgs',
+    'ServiceMonitorSpecAttachMetadataArgsDict': 'ServiceMonitorSpecAttachMetadataArgs',
+    'ServiceMonitorSpecAttachMetadataArgs': 'ServiceMonitorSpecAttachMetadataArgs',
+    'ServiceMonitorSpecEndpointsAuthorizationCredentialsPatchArgsDict': 'ServiceMonitorSpecEndpointsAuthorizationCredentialsPatchArgs',
+    'ServiceMonitorSpecEndpointsAuthorizationCredentialsPatchArgs': 'ServiceMonitorSpecEndpointsAuthorizationCredentialsPatchArgs',
+    'ServiceMonitorSpecEndpointsAuthorizationCredentialsArgsDict': 'ServiceMonitorSpecEndpointsAuthorizationCredentialsArgs',
+    'ServiceMonitorSpecEndpointsAuthorizationCredentialsArgs': 'ServiceMonitorSpecEndpointsAuthorizationCredentialsArgs',
+    'ServiceMonitorSpecEndpointsAuthorizationPatchArgsDict': 'ServiceMonitorSpecEndpointsAuthorizationPatchArgs',
+    'ServiceMonitorSpecEndpointsAuthorizationPatchArgs': 'ServiceMonitorSpecEndpointsAuthorizationPatchArgs',
+    'ServiceMonitorSpecEndpointsAuthorizationArgsDict': 'ServiceMonitorSpecEndpointsAuthorizationArgs',
+    'ServiceMonitorSpecEndpointsAuthorizationArgs': 'ServiceMonitorSpecEndpointsAuthorizationArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthPasswordPatchArgsDict': 'ServiceMonitorSpecEndpointsBasicAuthPasswordPatchArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthPasswordPatchArgs': 'ServiceMonitorSpecEndpointsBasicAuthPasswordPatchArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthPasswordArgsDict': 'ServiceMonitorSpecEndpointsBasicAuthPasswordArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthPasswordArgs': 'ServiceMonitorSpecEndpointsBasicAuthPasswordArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthPatchArgsDict': 'ServiceMonitorSpecEndpointsBasicAuthPatchArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthPatchArgs': 'ServiceMonitorSpecEndpointsBasicAuthPatchArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthUsernamePatchArgsDict': 'ServiceMonitorSpecEndpointsBasicAuthUsernamePatchArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthUsernamePatchArgs': 'ServiceMonitorSpecEndpointsBasicAuthUsernamePatchArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthUsernameArgsDict': 'ServiceMonitorSpecEndpointsBasicAuthUsernameArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthUsernameArgs': 'ServiceMonitorSpecEndpointsBasicAuthUsernameArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthArgsDict': 'ServiceMonitorSpecEndpointsBasicAuthArgs',
+    'ServiceMonitorSpecEndpointsBasicAuthArgs': 'ServiceMonitorSpecEndpointsBasicAuthArgs',
+    'ServiceMonitorSpecEndpointsBearerTokenSecretPatchArgsDict': 'ServiceMonitorSpecEndpointsBearerTokenSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsBearerTokenSecretPatchArgs': 'ServiceMonitorSpecEndpointsBearerTokenSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsBearerTokenSecretArgsDict': 'ServiceMonitorSpecEndpointsBearerTokenSecretArgs',
+    'ServiceMonitorSpecEndpointsBearerTokenSecretArgs': 'ServiceMonitorSpecEndpointsBearerTokenSecretArgs',
+    'ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgsDict': 'ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgs',
+    'ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgs': 'ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgs',
+    'ServiceMonitorSpecEndpointsMetricRelabelingsArgsDict': 'ServiceMonitorSpecEndpointsMetricRelabelingsArgs',
+    'ServiceMonitorSpecEndpointsMetricRelabelingsArgs': 'ServiceMonitorSpecEndpointsMetricRelabelingsArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgsDict': 'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgs': 'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapArgsDict': 'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapArgs': 'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgsDict': 'ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgs': 'ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgsDict': 'ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgs': 'ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretArgsDict': 'ServiceMonitorSpecEndpointsOauth2ClientIdSecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretArgs': 'ServiceMonitorSpecEndpointsOauth2ClientIdSecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdArgsDict': 'ServiceMonitorSpecEndpointsOauth2ClientIdArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdArgs': 'ServiceMonitorSpecEndpointsOauth2ClientIdArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientSecretPatchArgsDict': 'ServiceMonitorSpecEndpointsOauth2ClientSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientSecretPatchArgs': 'ServiceMonitorSpecEndpointsOauth2ClientSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientSecretArgsDict': 'ServiceMonitorSpecEndpointsOauth2ClientSecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2ClientSecretArgs': 'ServiceMonitorSpecEndpointsOauth2ClientSecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2PatchArgsDict': 'ServiceMonitorSpecEndpointsOauth2PatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2PatchArgs': 'ServiceMonitorSpecEndpointsOauth2PatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgsDict': 'ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs',
+    'ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs': 'ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatchArgsDict': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatchArgs': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapArgsDict': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapArgs': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatchArgsDict': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatchArgs': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatchArgsDict': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatchArgs': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretArgsDict': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretArgs': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaArgsDict': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCaArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaArgs': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCaArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatchArgsDict': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatchArgs': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapArgsDict': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapArgs': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatchArgsDict': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatchArgs': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatchArgsDict': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatchArgs': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretArgsDict': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretArgs': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertArgsDict': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCertArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertArgs': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCertArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatchArgsDict': 'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatchArgs': 'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretArgsDict': 'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretArgs': 'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigPatchArgsDict': 'ServiceMonitorSpecEndpointsOauth2TlsConfigPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigPatchArgs': 'ServiceMonitorSpecEndpointsOauth2TlsConfigPatchArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigArgsDict': 'ServiceMonitorSpecEndpointsOauth2TlsConfigArgs',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigArgs': 'ServiceMonitorSpecEndpointsOauth2TlsConfigArgs',
+    'ServiceMonitorSpecEndpointsOauth2ArgsDict': 'ServiceMonitorSpecEndpointsOauth2Args',
+    'ServiceMonitorSpecEndpointsOauth2Args': 'ServiceMonitorSpecEndpointsOauth2Args',
+    'ServiceMonitorSpecEndpointsPatchArgsDict': 'ServiceMonitorSpecEndpointsPatchArgs',
+    'ServiceMonitorSpecEndpointsPatchArgs': 'ServiceMonitorSpecEndpointsPatchArgs',
+    'ServiceMonitorSpecEndpointsProxyConnectHeaderArgsDict': 'ServiceMonitorSpecEndpointsProxyConnectHeaderArgs',
+    'ServiceMonitorSpecEndpointsProxyConnectHeaderArgs': 'ServiceMonitorSpecEndpointsProxyConnectHeaderArgs',
+    'ServiceMonitorSpecEndpointsRelabelingsPatchArgsDict': 'ServiceMonitorSpecEndpointsRelabelingsPatchArgs',
+    'ServiceMonitorSpecEndpointsRelabelingsPatchArgs': 'ServiceMonitorSpecEndpointsRelabelingsPatchArgs',
+    'ServiceMonitorSpecEndpointsRelabelingsArgsDict': 'ServiceMonitorSpecEndpointsRelabelingsArgs',
+    'ServiceMonitorSpecEndpointsRelabelingsArgs': 'ServiceMonitorSpecEndpointsRelabelingsArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatchArgsDict': 'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatchArgs': 'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapArgsDict': 'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapArgs': 'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaPatchArgsDict': 'ServiceMonitorSpecEndpointsTlsConfigCaPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaPatchArgs': 'ServiceMonitorSpecEndpointsTlsConfigCaPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaSecretPatchArgsDict': 'ServiceMonitorSpecEndpointsTlsConfigCaSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaSecretPatchArgs': 'ServiceMonitorSpecEndpointsTlsConfigCaSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaSecretArgsDict': 'ServiceMonitorSpecEndpointsTlsConfigCaSecretArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaSecretArgs': 'ServiceMonitorSpecEndpointsTlsConfigCaSecretArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaArgsDict': 'ServiceMonitorSpecEndpointsTlsConfigCaArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCaArgs': 'ServiceMonitorSpecEndpointsTlsConfigCaArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatchArgsDict': 'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatchArgs': 'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapArgsDict': 'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapArgs': 'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertPatchArgsDict': 'ServiceMonitorSpecEndpointsTlsConfigCertPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertPatchArgs': 'ServiceMonitorSpecEndpointsTlsConfigCertPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertSecretPatchArgsDict': 'ServiceMonitorSpecEndpointsTlsConfigCertSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertSecretPatchArgs': 'ServiceMonitorSpecEndpointsTlsConfigCertSecretPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertSecretArgsDict': 'ServiceMonitorSpecEndpointsTlsConfigCertSecretArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertSecretArgs': 'ServiceMonitorSpecEndpointsTlsConfigCertSecretArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertArgsDict': 'ServiceMonitorSpecEndpointsTlsConfigCertArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigCertArgs': 'ServiceMonitorSpecEndpointsTlsConfigCertArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigKeySecretPatchArgsDict': 'ServiceMonitorSpecEndpointsTlsConfigKeySecretPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigKeySecretPatchArgs': 'ServiceMonitorSpecEndpointsTlsConfigKeySecretPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigKeySecretArgsDict': 'ServiceMonitorSpecEndpointsTlsConfigKeySecretArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigKeySecretArgs': 'ServiceMonitorSpecEndpointsTlsConfigKeySecretArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigPatchArgsDict': 'ServiceMonitorSpecEndpointsTlsConfigPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigPatchArgs': 'ServiceMonitorSpecEndpointsTlsConfigPatchArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigArgsDict': 'ServiceMonitorSpecEndpointsTlsConfigArgs',
+    'ServiceMonitorSpecEndpointsTlsConfigArgs': 'ServiceMonitorSpecEndpointsTlsConfigArgs',
+    'ServiceMonitorSpecEndpointsArgsDict': 'ServiceMonitorSpecEndpointsArgs',
+    'ServiceMonitorSpecEndpointsArgs': 'ServiceMonitorSpecEndpointsArgs',
+    'ServiceMonitorSpecNamespaceSelectorPatchArgsDict': 'ServiceMonitorSpecNamespaceSelectorPatchArgs',
+    'ServiceMonitorSpecNamespaceSelectorPatchArgs': 'ServiceMonitorSpecNamespaceSelectorPatchArgs',
+    'ServiceMonitorSpecNamespaceSelectorArgsDict': 'ServiceMonitorSpecNamespaceSelectorArgs',
+    'ServiceMonitorSpecNamespaceSelectorArgs': 'ServiceMonitorSpecNamespaceSelectorArgs',
+    'ServiceMonitorSpecPatchArgsDict': 'ServiceMonitorSpecPatchArgs',
+    'ServiceMonitorSpecPatchArgs': 'ServiceMonitorSpecPatchArgs',
+    'ServiceMonitorSpecSelectorMatchExpressionsPatchArgsDict': 'ServiceMonitorSpecSelectorMatchExpressionsPatchArgs',
+    'ServiceMonitorSpecSelectorMatchExpressionsPatchArgs': 'ServiceMonitorSpecSelectorMatchExpressionsPatchArgs',
+    'ServiceMonitorSpecSelectorMatchExpressionsArgsDict': 'ServiceMonitorSpecSelectorMatchExpressionsArgs',
+    'ServiceMonitorSpecSelectorMatchExpressionsArgs': 'ServiceMonitorSpecSelectorMatchExpressionsArgs',
+    'ServiceMonitorSpecSelectorPatchArgsDict': 'ServiceMonitorSpecSelectorPatchArgs',
+    'ServiceMonitorSpecSelectorPatchArgs': 'ServiceMonitorSpecSelectorPatchArgs',
+    'ServiceMonitorSpecSelectorArgsDict': 'ServiceMonitorSpecSelectorArgs',
+    'ServiceMonitorSpecSelectorArgs': 'ServiceMonitorSpecSelectorArgs',
+    'ServiceMonitorSpecArgsDict': 'ServiceMonitorSpecArgs',
+    'ServiceMonitorSpecArgs': 'ServiceMonitorSpecArgs',
+    'ServiceMonitorStatusBindingsConditionsArgsDict': 'ServiceMonitorStatusBindingsConditionsArgs',
+    'ServiceMonitorStatusBindingsConditionsArgs': 'ServiceMonitorStatusBindingsConditionsArgs',
+    'ServiceMonitorStatusBindingsArgsDict': 'ServiceMonitorStatusBindingsArgs',
+    'ServiceMonitorStatusBindingsArgs': 'ServiceMonitorStatusBindingsArgs',
+    'ServiceMonitorStatusArgsDict': 'ServiceMonitorStatusArgs',
+    'ServiceMonitorStatusArgs': 'ServiceMonitorStatusArgs',
+    'ServiceMonitorArgsDict': 'ServiceMonitorArgs',
+    'ServiceMonitorArgs': 'ServiceMonitorArgs',
+}
+
+if typing.TYPE_CHECKING:
+    from .PodMonitorSpecAttachMetadataPatchArgs import *
+    from .PodMonitorSpecAttachMetadataArgs import *
+    from .PodMonitorSpecNamespaceSelectorPatchArgs import *
+    from .PodMonitorSpecNamespaceSelectorArgs import *
+    from .PodMonitorSpecPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsAuthorizationPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsAuthorizationArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsBasicAuthPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsBasicAuthUsernameArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsBasicAuthArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsBearerTokenSecretArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2ClientIdArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2PatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2Args import *
+    from .PodMonitorSpecPodMetricsEndpointsPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsRelabelingsArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCaArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCertArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigPatchArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigArgs import *
+    from .PodMonitorSpecPodMetricsEndpointsArgs import *
+    from .PodMonitorSpecSelectorMatchExpressionsPatchArgs import *
+    from .PodMonitorSpecSelectorMatchExpressionsArgs import *
+    from .PodMonitorSpecSelectorPatchArgs import *
+    from .PodMonitorSpecSelectorArgs import *
+    from .PodMonitorSpecArgs import *
+    from .PodMonitorStatusBindingsConditionsArgs import *
+    from .PodMonitorStatusBindingsArgs import *
+    from .PodMonitorStatusArgs import *
+    from .PodMonitorArgs import *
+    from .ServiceMonitorSpecAttachMetadataPatchArgs import *
+    from .ServiceMonitorSpecAttachMetadataArgs import *
+    from .ServiceMonitorSpecEndpointsAuthorizationCredentialsPatchArgs import *
+    from .ServiceMonitorSpecEndpointsAuthorizationCredentialsArgs import *
+    from .ServiceMonitorSpecEndpointsAuthorizationPatchArgs import *
+    from .ServiceMonitorSpecEndpointsAuthorizationArgs import *
+    from .ServiceMonitorSpecEndpointsBasicAuthPasswordPatchArgs import *
+    from .ServiceMonitorSpecEndpointsBasicAuthPasswordArgs import *
+    from .ServiceMonitorSpecEndpointsBasicAuthPatchArgs import *
+    from .ServiceMonitorSpecEndpointsBasicAuthUsernamePatchArgs import *
+    from .ServiceMonitorSpecEndpointsBasicAuthUsernameArgs import *
+    from .ServiceMonitorSpecEndpointsBasicAuthArgs import *
+    from .ServiceMonitorSpecEndpointsBearerTokenSecretPatchArgs import *
+    from .ServiceMonitorSpecEndpointsBearerTokenSecretArgs import *
+    from .ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgs import *
+    from .ServiceMonitorSpecEndpointsMetricRelabelingsArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatchArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2ClientIdPatchArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatchArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2ClientIdSecretArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2ClientIdArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2ClientSecretPatchArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2ClientSecretArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2PatchArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatchArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatchArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatchArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCaArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatchArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatchArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatchArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCertArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatchArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigPatchArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigArgs import *
+    from .ServiceMonitorSpecEndpointsOauth2Args import *
+    from .ServiceMonitorSpecEndpointsPatchArgs import *
+    from .ServiceMonitorSpecEndpointsProxyConnectHeaderArgs import *
+    from .ServiceMonitorSpecEndpointsRelabelingsPatchArgs import *
+    from .ServiceMonitorSpecEndpointsRelabelingsArgs import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatchArgs import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCaConfigMapArgs import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCaPatchArgs import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCaSecretPatchArgs import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCaSecretArgs import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCaArgs import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatchArgs import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCertConfigMapArgs import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCertPatchArgs import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCertSecretPatchArgs import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCertSecretArgs import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCertArgs import *
+    from .ServiceMonitorSpecEndpointsTlsConfigKeySecretPatchArgs import *
+    from .ServiceMonitorSpecEndpointsTlsConfigKeySecretArgs import *
+    from .ServiceMonitorSpecEndpointsTlsConfigPatchArgs import *
+    from .ServiceMonitorSpecEndpointsTlsConfigArgs import *
+    from .ServiceMonitorSpecEndpointsArgs import *
+    from .ServiceMonitorSpecNamespaceSelectorPatchArgs import *
+    from .ServiceMonitorSpecNamespaceSelectorArgs import *
+    from .ServiceMonitorSpecPatchArgs import *
+    from .ServiceMonitorSpecSelectorMatchExpressionsPatchArgs import *
+    from .ServiceMonitorSpecSelectorMatchExpressionsArgs import *
+    from .ServiceMonitorSpecSelectorPatchArgs import *
+    from .ServiceMonitorSpecSelectorArgs import *
+    from .ServiceMonitorSpecArgs import *
+    from .ServiceMonitorStatusBindingsConditionsArgs import *
+    from .ServiceMonitorStatusBindingsArgs import *
+    from .ServiceMonitorStatusArgs import *
+    from .ServiceMonitorArgs import *
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _TYPE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
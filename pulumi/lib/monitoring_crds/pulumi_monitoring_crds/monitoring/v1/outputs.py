@@ -1,13899 +0,0 @@
-# coding=utf-8
-# *** WARNING: this file was generated by crd2pulumi. ***
-# *** Do not edit by hand unless you're certain you know what you are doing! ***
-
-import builtins as _builtins
-import warnings
-import sys
-import pulumi
-import pulumi.runtime
-from typing import Any, Mapping, Optional, Sequence, Union, overload
-if sys.version_info >= (3, 11):
-    from typing import NotRequired, TypedDict, TypeAlias
-else:
-    from typing_extensions import NotRequired, TypedDict, TypeAlias
-from ... import _utilities
-from . import outputs
-from ... import meta as _meta
-
-__all__ = [
-    'PodMonitor',
-    'PodMonitorSpec',
-    'PodMonitorSpecAttachMetadata',
-    'PodMonitorSpecAttachMetadataPatch',
-    'PodMonitorSpecNamespaceSelector',
-    'PodMonitorSpecNamespaceSelectorPatch',
-    'PodMonitorSpecPatch',
-    'PodMonitorSpecPodMetricsEndpoints',
-    'PodMonitorSpecPodMetricsEndpointsAuthorization',
-    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentials',
-    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatch',
-    'PodMonitorSpecPodMetricsEndpointsAuthorizationPatch',
-    'PodMonitorSpecPodMetricsEndpointsBasicAuth',
-    'PodMonitorSpecPodMetricsEndpointsBasicAuthPassword',
-    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatch',
-    'PodMonitorSpecPodMetricsEndpointsBasicAuthPatch',
-    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsername',
-    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatch',
-    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecret',
-    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatch',
-    'PodMonitorSpecPodMetricsEndpointsMetricRelabelings',
-    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatch',
-    'PodMonitorSpecPodMetricsEndpointsOauth2',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientId',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMap',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatch',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatch',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecret',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatch',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecret',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatch',
-    'PodMonitorSpecPodMetricsEndpointsOauth2Patch',
-    'PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeader',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfig',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCa',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMap',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatch',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatch',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecret',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatch',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCert',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMap',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatch',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatch',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecret',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatch',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecret',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatch',
-    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatch',
-    'PodMonitorSpecPodMetricsEndpointsPatch',
-    'PodMonitorSpecPodMetricsEndpointsProxyConnectHeader',
-    'PodMonitorSpecPodMetricsEndpointsRelabelings',
-    'PodMonitorSpecPodMetricsEndpointsRelabelingsPatch',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfig',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCa',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMap',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatch',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatch',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecret',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatch',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCert',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMap',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatch',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatch',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecret',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatch',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecret',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatch',
-    'PodMonitorSpecPodMetricsEndpointsTlsConfigPatch',
-    'PodMonitorSpecSelector',
-    'PodMonitorSpecSelectorMatchExpressions',
-    'PodMonitorSpecSelectorMatchExpressionsPatch',
-    'PodMonitorSpecSelectorPatch',
-    'PodMonitorStatus',
-    'PodMonitorStatusBindings',
-    'PodMonitorStatusBindingsConditions',
-    'PodMonitorStatusBindingsConditionsPatch',
-    'PodMonitorStatusBindingsPatch',
-    'PodMonitorStatusPatch',
-    'ServiceMonitor',
-    'ServiceMonitorSpec',
-    'ServiceMonitorSpecAttachMetadata',
-    'ServiceMonitorSpecAttachMetadataPatch',
-    'ServiceMonitorSpecEndpoints',
-    'ServiceMonitorSpecEndpointsAuthorization',
-    'ServiceMonitorSpecEndpointsAuthorizationCredentials',
-    'ServiceMonitorSpecEndpointsAuthorizationCredentialsPatch',
-    'ServiceMonitorSpecEndpointsAuthorizationPatch',
-    'ServiceMonitorSpecEndpointsBasicAuth',
-    'ServiceMonitorSpecEndpointsBasicAuthPassword',
-    'ServiceMonitorSpecEndpointsBasicAuthPasswordPatch',
-    'ServiceMonitorSpecEndpointsBasicAuthPatch',
-    'ServiceMonitorSpecEndpointsBasicAuthUsername',
-    'ServiceMonitorSpecEndpointsBasicAuthUsernamePatch',
-    'ServiceMonitorSpecEndpointsBearerTokenSecret',
-    'ServiceMonitorSpecEndpointsBearerTokenSecretPatch',
-    'ServiceMonitorSpecEndpointsMetricRelabelings',
-    'ServiceMonitorSpecEndpointsMetricRelabelingsPatch',
-    'ServiceMonitorSpecEndpointsOauth2',
-    'ServiceMonitorSpecEndpointsOauth2ClientId',
-    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMap',
-    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatch',
-    'ServiceMonitorSpecEndpointsOauth2ClientIdPatch',
-    'ServiceMonitorSpecEndpointsOauth2ClientIdSecret',
-    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatch',
-    'ServiceMonitorSpecEndpointsOauth2ClientSecret',
-    'ServiceMonitorSpecEndpointsOauth2ClientSecretPatch',
-    'ServiceMonitorSpecEndpointsOauth2Patch',
-    'ServiceMonitorSpecEndpointsOauth2ProxyConnectHeader',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfig',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCa',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMap',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatch',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatch',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecret',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatch',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCert',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMap',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatch',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatch',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecret',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatch',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecret',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatch',
-    'ServiceMonitorSpecEndpointsOauth2TlsConfigPatch',
-    'ServiceMonitorSpecEndpointsPatch',
-    'ServiceMonitorSpecEndpointsProxyConnectHeader',
-    'ServiceMonitorSpecEndpointsRelabelings',
-    'ServiceMonitorSpecEndpointsRelabelingsPatch',
-    'ServiceMonitorSpecEndpointsTlsConfig',
-    'ServiceMonitorSpecEndpointsTlsConfigCa',
-    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMap',
-    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatch',
-    'ServiceMonitorSpecEndpointsTlsConfigCaPatch',
-    'ServiceMonitorSpecEndpointsTlsConfigCaSecret',
-    'ServiceMonitorSpecEndpointsTlsConfigCaSecretPatch',
-    'ServiceMonitorSpecEndpointsTlsConfigCert',
-    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMap',
-    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatch',
-    'ServiceMonitorSpecEndpointsTlsConfigCertPatch',
-    'ServiceMonitorSpecEndpointsTlsConfigCertSecret',
-    'ServiceMonitorSpecEndpointsTlsConfigCertSecretPatch',
-    'ServiceMonitorSpecEndpointsTlsConfigKeySecret',
-    'ServiceMonitorSpecEndpointsTlsConfigKeySecretPatch',
-    'ServiceMonitorSpecEndpointsTlsConfigPatch',
-    'ServiceMonitorSpecNamespaceSelector',
-    'ServiceMonitorSpecNamespaceSelectorPatch',
-    'ServiceMonitorSpecPatch',
-    'ServiceMonitorSpecSelector',
-    'ServiceMonitorSpecSelectorMatchExpressions',
-    'ServiceMonitorSpecSelectorMatchExpressionsPatch',
-    'ServiceMonitorSpecSelectorPatch',
-    'ServiceMonitorStatus',
-    'ServiceMonitorStatusBindings',
-    'ServiceMonitorStatusBindingsConditions',
-    'ServiceMonitorStatusBindingsConditionsPatch',
-    'ServiceMonitorStatusBindingsPatch',
-    'ServiceMonitorStatusPatch',
-]
-
-@pulumi.output_type
-class PodMonitor(dict):
-    """
-    The `PodMonitor` custom resource definition (CRD) defines how `Prometheus` and `PrometheusAgent` can scrape metrics from a group of pods.
-    Among other things, it allows to specify:
-    * The pods to scrape via label selectors.
-    * The container ports to scrape.
-    * Authentication credentials to use.
-    * Target and metric relabeling.
-
-    `Prometheus` and `PrometheusAgent` objects select `PodMonitor` objects using label and namespace selectors.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "apiVersion":
-            suggest = "api_version"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitor. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitor.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitor.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 api_version: Optional[_builtins.str] = None,
-                 kind: Optional[_builtins.str] = None,
-                 metadata: Optional['_meta.v1.outputs.ObjectMeta'] = None,
-                 spec: Optional['outputs.PodMonitorSpec'] = None,
-                 status: Optional['outputs.PodMonitorStatus'] = None):
-        """
-        The `PodMonitor` custom resource definition (CRD) defines how `Prometheus` and `PrometheusAgent` can scrape metrics from a group of pods.
-        Among other things, it allows to specify:
-        * The pods to scrape via label selectors.
-        * The container ports to scrape.
-        * Authentication credentials to use.
-        * Target and metric relabeling.
-
-        `Prometheus` and `PrometheusAgent` objects select `PodMonitor` objects using label and namespace selectors.
-
-        :param _builtins.str api_version: APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        :param _builtins.str kind: Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        :param '_meta.v1.ObjectMetaArgs' metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        if api_version is not None:
-            pulumi.set(__self__, "api_version", 'monitoring.coreos.com/v1')
-        if kind is not None:
-            pulumi.set(__self__, "kind", 'PodMonitor')
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter(name="apiVersion")
-    def api_version(self) -> Optional[_builtins.str]:
-        """
-        APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        """
-        return pulumi.get(self, "api_version")
-
-    @_builtins.property
-    @pulumi.getter
-    def kind(self) -> Optional[_builtins.str]:
-        """
-        Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        return pulumi.get(self, "kind")
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> Optional['_meta.v1.outputs.ObjectMeta']:
-        """
-        Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        return pulumi.get(self, "metadata")
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> Optional['outputs.PodMonitorSpec']:
-        return pulumi.get(self, "spec")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional['outputs.PodMonitorStatus']:
-        return pulumi.get(self, "status")
-
-
-@pulumi.output_type
-class PodMonitorSpec(dict):
-    """
-    spec defines the specification of desired Pod selection for target discovery by Prometheus.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "attachMetadata":
-            suggest = "attach_metadata"
-        elif key == "bodySizeLimit":
-            suggest = "body_size_limit"
-        elif key == "convertClassicHistogramsToNHCB":
-            suggest = "convert_classic_histograms_to_nhcb"
-        elif key == "fallbackScrapeProtocol":
-            suggest = "fallback_scrape_protocol"
-        elif key == "jobLabel":
-            suggest = "job_label"
-        elif key == "keepDroppedTargets":
-            suggest = "keep_dropped_targets"
-        elif key == "labelLimit":
-            suggest = "label_limit"
-        elif key == "labelNameLengthLimit":
-            suggest = "label_name_length_limit"
-        elif key == "labelValueLengthLimit":
-            suggest = "label_value_length_limit"
-        elif key == "namespaceSelector":
-            suggest = "namespace_selector"
-        elif key == "nativeHistogramBucketLimit":
-            suggest = "native_histogram_bucket_limit"
-        elif key == "nativeHistogramMinBucketFactor":
-            suggest = "native_histogram_min_bucket_factor"
-        elif key == "podMetricsEndpoints":
-            suggest = "pod_metrics_endpoints"
-        elif key == "podTargetLabels":
-            suggest = "pod_target_labels"
-        elif key == "sampleLimit":
-            suggest = "sample_limit"
-        elif key == "scrapeClass":
-            suggest = "scrape_class"
-        elif key == "scrapeClassicHistograms":
-            suggest = "scrape_classic_histograms"
-        elif key == "scrapeNativeHistograms":
-            suggest = "scrape_native_histograms"
-        elif key == "scrapeProtocols":
-            suggest = "scrape_protocols"
-        elif key == "selectorMechanism":
-            suggest = "selector_mechanism"
-        elif key == "targetLimit":
-            suggest = "target_limit"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpec. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpec.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpec.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 attach_metadata: Optional['outputs.PodMonitorSpecAttachMetadata'] = None,
-                 body_size_limit: Optional[_builtins.str] = None,
-                 convert_classic_histograms_to_nhcb: Optional[_builtins.bool] = None,
-                 fallback_scrape_protocol: Optional[_builtins.str] = None,
-                 job_label: Optional[_builtins.str] = None,
-                 keep_dropped_targets: Optional[_builtins.int] = None,
-                 label_limit: Optional[_builtins.int] = None,
-                 label_name_length_limit: Optional[_builtins.int] = None,
-                 label_value_length_limit: Optional[_builtins.int] = None,
-                 namespace_selector: Optional['outputs.PodMonitorSpecNamespaceSelector'] = None,
-                 native_histogram_bucket_limit: Optional[_builtins.int] = None,
-                 native_histogram_min_bucket_factor: Optional[Any] = None,
-                 pod_metrics_endpoints: Optional[Sequence['outputs.PodMonitorSpecPodMetricsEndpoints']] = None,
-                 pod_target_labels: Optional[Sequence[_builtins.str]] = None,
-                 sample_limit: Optional[_builtins.int] = None,
-                 scrape_class: Optional[_builtins.str] = None,
-                 scrape_classic_histograms: Optional[_builtins.bool] = None,
-                 scrape_native_histograms: Optional[_builtins.bool] = None,
-                 scrape_protocols: Optional[Sequence[_builtins.str]] = None,
-                 selector: Optional['outputs.PodMonitorSpecSelector'] = None,
-                 selector_mechanism: Optional[_builtins.str] = None,
-                 target_limit: Optional[_builtins.int] = None):
-        """
-        spec defines the specification of desired Pod selection for target discovery by Prometheus.
-
-        :param _builtins.str body_size_limit: bodySizeLimit when defined specifies a job level limit on the size
-               of uncompressed response body that will be accepted by Prometheus.
-
-               It requires Prometheus >= v2.28.0.
-        :param _builtins.bool convert_classic_histograms_to_nhcb: convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-               It requires Prometheus >= v3.0.0.
-        :param _builtins.str fallback_scrape_protocol: fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-               It requires Prometheus >= v3.0.0.
-        :param _builtins.str job_label: jobLabel defines the label to use to retrieve the job name from.
-               `jobLabel` selects the label from the associated Kubernetes `Pod`
-               object which will be used as the `job` label for all metrics.
-
-               For example if `jobLabel` is set to `foo` and the Kubernetes `Pod`
-               object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-               label to all ingested metrics.
-
-               If the value of this field is empty, the `job` label of the metrics
-               defaults to the namespace and name of the PodMonitor object (e.g. `<namespace>/<name>`).
-        :param _builtins.int keep_dropped_targets: keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-               that will be kept in memory. 0 means no limit.
-
-               It requires Prometheus >= v2.47.0.
-        :param _builtins.int label_limit: labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param _builtins.int label_name_length_limit: labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param _builtins.int label_value_length_limit: labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param _builtins.int native_histogram_bucket_limit: nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-               buckets will be merged to stay within the limit.
-               It requires Prometheus >= v2.45.0.
-        :param Union[_builtins.int, _builtins.str] native_histogram_min_bucket_factor: nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-               buckets will be merged to increase the factor sufficiently.
-               It requires Prometheus >= v2.50.0.
-        :param Sequence['PodMonitorSpecPodMetricsEndpointsArgs'] pod_metrics_endpoints: podMetricsEndpoints defines how to scrape metrics from the selected pods.
-        :param Sequence[_builtins.str] pod_target_labels: podTargetLabels defines the labels which are transferred from the
-               associated Kubernetes `Pod` object onto the ingested metrics.
-        :param _builtins.int sample_limit: sampleLimit defines a per-scrape limit on the number of scraped samples
-               that will be accepted.
-        :param _builtins.str scrape_class: scrapeClass defines the scrape class to apply.
-        :param _builtins.bool scrape_classic_histograms: scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-               It requires Prometheus >= v2.45.0.
-
-               Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-        :param _builtins.bool scrape_native_histograms: scrapeNativeHistograms defines whether to enable scraping of native histograms.
-               It requires Prometheus >= v3.8.0.
-        :param Sequence[_builtins.str] scrape_protocols: scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-               protocols supported by Prometheus in order of preference (from most to least preferred).
-
-               If unset, Prometheus uses its default value.
-
-               It requires Prometheus >= v2.49.0.
-        :param _builtins.str selector_mechanism: selectorMechanism defines the mechanism used to select the endpoints to scrape.
-               By default, the selection process relies on relabel configurations to filter the discovered targets.
-               Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-               Which strategy is best for your use case needs to be carefully evaluated.
-
-               It requires Prometheus >= v2.17.0.
-        :param _builtins.int target_limit: targetLimit defines a limit on the number of scraped targets that will
-               be accepted.
-        """
-        if attach_metadata is not None:
-            pulumi.set(__self__, "attach_metadata", attach_metadata)
-        if body_size_limit is not None:
-            pulumi.set(__self__, "body_size_limit", body_size_limit)
-        if convert_classic_histograms_to_nhcb is not None:
-            pulumi.set(__self__, "convert_classic_histograms_to_nhcb", convert_classic_histograms_to_nhcb)
-        if fallback_scrape_protocol is not None:
-            pulumi.set(__self__, "fallback_scrape_protocol", fallback_scrape_protocol)
-        if job_label is not None:
-            pulumi.set(__self__, "job_label", job_label)
-        if keep_dropped_targets is not None:
-            pulumi.set(__self__, "keep_dropped_targets", keep_dropped_targets)
-        if label_limit is not None:
-            pulumi.set(__self__, "label_limit", label_limit)
-        if label_name_length_limit is not None:
-            pulumi.set(__self__, "label_name_length_limit", label_name_length_limit)
-        if label_value_length_limit is not None:
-            pulumi.set(__self__, "label_value_length_limit", label_value_length_limit)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if native_histogram_bucket_limit is not None:
-            pulumi.set(__self__, "native_histogram_bucket_limit", native_histogram_bucket_limit)
-        if native_histogram_min_bucket_factor is not None:
-            pulumi.set(__self__, "native_histogram_min_bucket_factor", native_histogram_min_bucket_factor)
-        if pod_metrics_endpoints is not None:
-            pulumi.set(__self__, "pod_metrics_endpoints", pod_metrics_endpoints)
-        if pod_target_labels is not None:
-            pulumi.set(__self__, "pod_target_labels", pod_target_labels)
-        if sample_limit is not None:
-            pulumi.set(__self__, "sample_limit", sample_limit)
-        if scrape_class is not None:
-            pulumi.set(__self__, "scrape_class", scrape_class)
-        if scrape_classic_histograms is not None:
-            pulumi.set(__self__, "scrape_classic_histograms", scrape_classic_histograms)
-        if scrape_native_histograms is not None:
-            pulumi.set(__self__, "scrape_native_histograms", scrape_native_histograms)
-        if scrape_protocols is not None:
-            pulumi.set(__self__, "scrape_protocols", scrape_protocols)
-        if selector is not None:
-            pulumi.set(__self__, "selector", selector)
-        if selector_mechanism is not None:
-            pulumi.set(__self__, "selector_mechanism", selector_mechanism)
-        if target_limit is not None:
-            pulumi.set(__self__, "target_limit", target_limit)
-
-    @_builtins.property
-    @pulumi.getter(name="attachMetadata")
-    def attach_metadata(self) -> Optional['outputs.PodMonitorSpecAttachMetadata']:
-        return pulumi.get(self, "attach_metadata")
-
-    @_builtins.property
-    @pulumi.getter(name="bodySizeLimit")
-    def body_size_limit(self) -> Optional[_builtins.str]:
-        """
-        bodySizeLimit when defined specifies a job level limit on the size
-        of uncompressed response body that will be accepted by Prometheus.
-
-        It requires Prometheus >= v2.28.0.
-        """
-        return pulumi.get(self, "body_size_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="convertClassicHistogramsToNHCB")
-    def convert_classic_histograms_to_nhcb(self) -> Optional[_builtins.bool]:
-        """
-        convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-        It requires Prometheus >= v3.0.0.
-        """
-        return pulumi.get(self, "convert_classic_histograms_to_nhcb")
-
-    @_builtins.property
-    @pulumi.getter(name="fallbackScrapeProtocol")
-    def fallback_scrape_protocol(self) -> Optional[_builtins.str]:
-        """
-        fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-        It requires Prometheus >= v3.0.0.
-        """
-        return pulumi.get(self, "fallback_scrape_protocol")
-
-    @_builtins.property
-    @pulumi.getter(name="jobLabel")
-    def job_label(self) -> Optional[_builtins.str]:
-        """
-        jobLabel defines the label to use to retrieve the job name from.
-        `jobLabel` selects the label from the associated Kubernetes `Pod`
-        object which will be used as the `job` label for all metrics.
-
-        For example if `jobLabel` is set to `foo` and the Kubernetes `Pod`
-        object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-        label to all ingested metrics.
-
-        If the value of this field is empty, the `job` label of the metrics
-        defaults to the namespace and name of the PodMonitor object (e.g. `<namespace>/<name>`).
-        """
-        return pulumi.get(self, "job_label")
-
-    @_builtins.property
-    @pulumi.getter(name="keepDroppedTargets")
-    def keep_dropped_targets(self) -> Optional[_builtins.int]:
-        """
-        keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-        that will be kept in memory. 0 means no limit.
-
-        It requires Prometheus >= v2.47.0.
-        """
-        return pulumi.get(self, "keep_dropped_targets")
-
-    @_builtins.property
-    @pulumi.getter(name="labelLimit")
-    def label_limit(self) -> Optional[_builtins.int]:
-        """
-        labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="labelNameLengthLimit")
-    def label_name_length_limit(self) -> Optional[_builtins.int]:
-        """
-        labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_name_length_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="labelValueLengthLimit")
-    def label_value_length_limit(self) -> Optional[_builtins.int]:
-        """
-        labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_value_length_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> Optional['outputs.PodMonitorSpecNamespaceSelector']:
-        return pulumi.get(self, "namespace_selector")
-
-    @_builtins.property
-    @pulumi.getter(name="nativeHistogramBucketLimit")
-    def native_histogram_bucket_limit(self) -> Optional[_builtins.int]:
-        """
-        nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-        buckets will be merged to stay within the limit.
-        It requires Prometheus >= v2.45.0.
-        """
-        return pulumi.get(self, "native_histogram_bucket_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="nativeHistogramMinBucketFactor")
-    def native_histogram_min_bucket_factor(self) -> Optional[Any]:
-        """
-        nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-        buckets will be merged to increase the factor sufficiently.
-        It requires Prometheus >= v2.50.0.
-        """
-        return pulumi.get(self, "native_histogram_min_bucket_factor")
-
-    @_builtins.property
-    @pulumi.getter(name="podMetricsEndpoints")
-    def pod_metrics_endpoints(self) -> Optional[Sequence['outputs.PodMonitorSpecPodMetricsEndpoints']]:
-        """
-        podMetricsEndpoints defines how to scrape metrics from the selected pods.
-        """
-        return pulumi.get(self, "pod_metrics_endpoints")
-
-    @_builtins.property
-    @pulumi.getter(name="podTargetLabels")
-    def pod_target_labels(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        podTargetLabels defines the labels which are transferred from the
-        associated Kubernetes `Pod` object onto the ingested metrics.
-        """
-        return pulumi.get(self, "pod_target_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="sampleLimit")
-    def sample_limit(self) -> Optional[_builtins.int]:
-        """
-        sampleLimit defines a per-scrape limit on the number of scraped samples
-        that will be accepted.
-        """
-        return pulumi.get(self, "sample_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeClass")
-    def scrape_class(self) -> Optional[_builtins.str]:
-        """
-        scrapeClass defines the scrape class to apply.
-        """
-        return pulumi.get(self, "scrape_class")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeClassicHistograms")
-    def scrape_classic_histograms(self) -> Optional[_builtins.bool]:
-        """
-        scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-        It requires Prometheus >= v2.45.0.
-
-        Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-        """
-        return pulumi.get(self, "scrape_classic_histograms")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeNativeHistograms")
-    def scrape_native_histograms(self) -> Optional[_builtins.bool]:
-        """
-        scrapeNativeHistograms defines whether to enable scraping of native histograms.
-        It requires Prometheus >= v3.8.0.
-        """
-        return pulumi.get(self, "scrape_native_histograms")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeProtocols")
-    def scrape_protocols(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-        protocols supported by Prometheus in order of preference (from most to least preferred).
-
-        If unset, Prometheus uses its default value.
-
-        It requires Prometheus >= v2.49.0.
-        """
-        return pulumi.get(self, "scrape_protocols")
-
-    @_builtins.property
-    @pulumi.getter
-    def selector(self) -> Optional['outputs.PodMonitorSpecSelector']:
-        return pulumi.get(self, "selector")
-
-    @_builtins.property
-    @pulumi.getter(name="selectorMechanism")
-    def selector_mechanism(self) -> Optional[_builtins.str]:
-        """
-        selectorMechanism defines the mechanism used to select the endpoints to scrape.
-        By default, the selection process relies on relabel configurations to filter the discovered targets.
-        Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-        Which strategy is best for your use case needs to be carefully evaluated.
-
-        It requires Prometheus >= v2.17.0.
-        """
-        return pulumi.get(self, "selector_mechanism")
-
-    @_builtins.property
-    @pulumi.getter(name="targetLimit")
-    def target_limit(self) -> Optional[_builtins.int]:
-        """
-        targetLimit defines a limit on the number of scraped targets that will
-        be accepted.
-        """
-        return pulumi.get(self, "target_limit")
-
-
-@pulumi.output_type
-class PodMonitorSpecAttachMetadata(dict):
-    """
-    attachMetadata defines additional metadata which is added to the
-    discovered targets.
-
-    It requires Prometheus >= v2.35.0.
-    """
-    def __init__(__self__, *,
-                 node: Optional[_builtins.bool] = None):
-        """
-        attachMetadata defines additional metadata which is added to the
-        discovered targets.
-
-        It requires Prometheus >= v2.35.0.
-
-        :param _builtins.bool node: node when set to true, Prometheus attaches node metadata to the discovered
-               targets.
-
-               The Prometheus service account must have the `list` and `watch`
-               permissions on the `Nodes` objects.
-        """
-        if node is not None:
-            pulumi.set(__self__, "node", node)
-
-    @_builtins.property
-    @pulumi.getter
-    def node(self) -> Optional[_builtins.bool]:
-        """
-        node when set to true, Prometheus attaches node metadata to the discovered
-        targets.
-
-        The Prometheus service account must have the `list` and `watch`
-        permissions on the `Nodes` objects.
-        """
-        return pulumi.get(self, "node")
-
-
-@pulumi.output_type
-class PodMonitorSpecAttachMetadataPatch(dict):
-    """
-    attachMetadata defines additional metadata which is added to the
-    discovered targets.
-
-    It requires Prometheus >= v2.35.0.
-    """
-    def __init__(__self__, *,
-                 node: Optional[_builtins.bool] = None):
-        """
-        attachMetadata defines additional metadata which is added to the
-        discovered targets.
-
-        It requires Prometheus >= v2.35.0.
-
-        :param _builtins.bool node: node when set to true, Prometheus attaches node metadata to the discovered
-               targets.
-
-               The Prometheus service account must have the `list` and `watch`
-               permissions on the `Nodes` objects.
-        """
-        if node is not None:
-            pulumi.set(__self__, "node", node)
-
-    @_builtins.property
-    @pulumi.getter
-    def node(self) -> Optional[_builtins.bool]:
-        """
-        node when set to true, Prometheus attaches node metadata to the discovered
-        targets.
-
-        The Prometheus service account must have the `list` and `watch`
-        permissions on the `Nodes` objects.
-        """
-        return pulumi.get(self, "node")
-
-
-@pulumi.output_type
-class PodMonitorSpecNamespaceSelector(dict):
-    """
-    namespaceSelector defines in which namespace(s) Prometheus should discover the pods.
-    By default, the pods are discovered in the same namespace as the `PodMonitor` object but it is possible to select pods across different/all namespaces.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchNames":
-            suggest = "match_names"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecNamespaceSelector. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecNamespaceSelector.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecNamespaceSelector.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 any: Optional[_builtins.bool] = None,
-                 match_names: Optional[Sequence[_builtins.str]] = None):
-        """
-        namespaceSelector defines in which namespace(s) Prometheus should discover the pods.
-        By default, the pods are discovered in the same namespace as the `PodMonitor` object but it is possible to select pods across different/all namespaces.
-
-        :param _builtins.bool any: any defines the boolean describing whether all namespaces are selected in contrast to a
-               list restricting them.
-        :param Sequence[_builtins.str] match_names: matchNames defines the list of namespace names to select from.
-        """
-        if any is not None:
-            pulumi.set(__self__, "any", any)
-        if match_names is not None:
-            pulumi.set(__self__, "match_names", match_names)
-
-    @_builtins.property
-    @pulumi.getter
-    def any(self) -> Optional[_builtins.bool]:
-        """
-        any defines the boolean describing whether all namespaces are selected in contrast to a
-        list restricting them.
-        """
-        return pulumi.get(self, "any")
-
-    @_builtins.property
-    @pulumi.getter(name="matchNames")
-    def match_names(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        matchNames defines the list of namespace names to select from.
-        """
-        return pulumi.get(self, "match_names")
-
-
-@pulumi.output_type
-class PodMonitorSpecNamespaceSelectorPatch(dict):
-    """
-    namespaceSelector defines in which namespace(s) Prometheus should discover the pods.
-    By default, the pods are discovered in the same namespace as the `PodMonitor` object but it is possible to select pods across different/all namespaces.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchNames":
-            suggest = "match_names"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecNamespaceSelectorPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecNamespaceSelectorPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecNamespaceSelectorPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 any: Optional[_builtins.bool] = None,
-                 match_names: Optional[Sequence[_builtins.str]] = None):
-        """
-        namespaceSelector defines in which namespace(s) Prometheus should discover the pods.
-        By default, the pods are discovered in the same namespace as the `PodMonitor` object but it is possible to select pods across different/all namespaces.
-
-        :param _builtins.bool any: any defines the boolean describing whether all namespaces are selected in contrast to a
-               list restricting them.
-        :param Sequence[_builtins.str] match_names: matchNames defines the list of namespace names to select from.
-        """
-        if any is not None:
-            pulumi.set(__self__, "any", any)
-        if match_names is not None:
-            pulumi.set(__self__, "match_names", match_names)
-
-    @_builtins.property
-    @pulumi.getter
-    def any(self) -> Optional[_builtins.bool]:
-        """
-        any defines the boolean describing whether all namespaces are selected in contrast to a
-        list restricting them.
-        """
-        return pulumi.get(self, "any")
-
-    @_builtins.property
-    @pulumi.getter(name="matchNames")
-    def match_names(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        matchNames defines the list of namespace names to select from.
-        """
-        return pulumi.get(self, "match_names")
-
-
-@pulumi.output_type
-class PodMonitorSpecPatch(dict):
-    """
-    spec defines the specification of desired Pod selection for target discovery by Prometheus.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "attachMetadata":
-            suggest = "attach_metadata"
-        elif key == "bodySizeLimit":
-            suggest = "body_size_limit"
-        elif key == "convertClassicHistogramsToNHCB":
-            suggest = "convert_classic_histograms_to_nhcb"
-        elif key == "fallbackScrapeProtocol":
-            suggest = "fallback_scrape_protocol"
-        elif key == "jobLabel":
-            suggest = "job_label"
-        elif key == "keepDroppedTargets":
-            suggest = "keep_dropped_targets"
-        elif key == "labelLimit":
-            suggest = "label_limit"
-        elif key == "labelNameLengthLimit":
-            suggest = "label_name_length_limit"
-        elif key == "labelValueLengthLimit":
-            suggest = "label_value_length_limit"
-        elif key == "namespaceSelector":
-            suggest = "namespace_selector"
-        elif key == "nativeHistogramBucketLimit":
-            suggest = "native_histogram_bucket_limit"
-        elif key == "nativeHistogramMinBucketFactor":
-            suggest = "native_histogram_min_bucket_factor"
-        elif key == "podMetricsEndpoints":
-            suggest = "pod_metrics_endpoints"
-        elif key == "podTargetLabels":
-            suggest = "pod_target_labels"
-        elif key == "sampleLimit":
-            suggest = "sample_limit"
-        elif key == "scrapeClass":
-            suggest = "scrape_class"
-        elif key == "scrapeClassicHistograms":
-            suggest = "scrape_classic_histograms"
-        elif key == "scrapeNativeHistograms":
-            suggest = "scrape_native_histograms"
-        elif key == "scrapeProtocols":
-            suggest = "scrape_protocols"
-        elif key == "selectorMechanism":
-            suggest = "selector_mechanism"
-        elif key == "targetLimit":
-            suggest = "target_limit"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 attach_metadata: Optional['outputs.PodMonitorSpecAttachMetadataPatch'] = None,
-                 body_size_limit: Optional[_builtins.str] = None,
-                 convert_classic_histograms_to_nhcb: Optional[_builtins.bool] = None,
-                 fallback_scrape_protocol: Optional[_builtins.str] = None,
-                 job_label: Optional[_builtins.str] = None,
-                 keep_dropped_targets: Optional[_builtins.int] = None,
-                 label_limit: Optional[_builtins.int] = None,
-                 label_name_length_limit: Optional[_builtins.int] = None,
-                 label_value_length_limit: Optional[_builtins.int] = None,
-                 namespace_selector: Optional['outputs.PodMonitorSpecNamespaceSelectorPatch'] = None,
-                 native_histogram_bucket_limit: Optional[_builtins.int] = None,
-                 native_histogram_min_bucket_factor: Optional[Any] = None,
-                 pod_metrics_endpoints: Optional[Sequence['outputs.PodMonitorSpecPodMetricsEndpointsPatch']] = None,
-                 pod_target_labels: Optional[Sequence[_builtins.str]] = None,
-                 sample_limit: Optional[_builtins.int] = None,
-                 scrape_class: Optional[_builtins.str] = None,
-                 scrape_classic_histograms: Optional[_builtins.bool] = None,
-                 scrape_native_histograms: Optional[_builtins.bool] = None,
-                 scrape_protocols: Optional[Sequence[_builtins.str]] = None,
-                 selector: Optional['outputs.PodMonitorSpecSelectorPatch'] = None,
-                 selector_mechanism: Optional[_builtins.str] = None,
-                 target_limit: Optional[_builtins.int] = None):
-        """
-        spec defines the specification of desired Pod selection for target discovery by Prometheus.
-
-        :param _builtins.str body_size_limit: bodySizeLimit when defined specifies a job level limit on the size
-               of uncompressed response body that will be accepted by Prometheus.
-
-               It requires Prometheus >= v2.28.0.
-        :param _builtins.bool convert_classic_histograms_to_nhcb: convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-               It requires Prometheus >= v3.0.0.
-        :param _builtins.str fallback_scrape_protocol: fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-               It requires Prometheus >= v3.0.0.
-        :param _builtins.str job_label: jobLabel defines the label to use to retrieve the job name from.
-               `jobLabel` selects the label from the associated Kubernetes `Pod`
-               object which will be used as the `job` label for all metrics.
-
-               For example if `jobLabel` is set to `foo` and the Kubernetes `Pod`
-               object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-               label to all ingested metrics.
-
-               If the value of this field is empty, the `job` label of the metrics
-               defaults to the namespace and name of the PodMonitor object (e.g. `<namespace>/<name>`).
-        :param _builtins.int keep_dropped_targets: keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-               that will be kept in memory. 0 means no limit.
-
-               It requires Prometheus >= v2.47.0.
-        :param _builtins.int label_limit: labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param _builtins.int label_name_length_limit: labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param _builtins.int label_value_length_limit: labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param _builtins.int native_histogram_bucket_limit: nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-               buckets will be merged to stay within the limit.
-               It requires Prometheus >= v2.45.0.
-        :param Union[_builtins.int, _builtins.str] native_histogram_min_bucket_factor: nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-               buckets will be merged to increase the factor sufficiently.
-               It requires Prometheus >= v2.50.0.
-        :param Sequence['PodMonitorSpecPodMetricsEndpointsPatchArgs'] pod_metrics_endpoints: podMetricsEndpoints defines how to scrape metrics from the selected pods.
-        :param Sequence[_builtins.str] pod_target_labels: podTargetLabels defines the labels which are transferred from the
-               associated Kubernetes `Pod` object onto the ingested metrics.
-        :param _builtins.int sample_limit: sampleLimit defines a per-scrape limit on the number of scraped samples
-               that will be accepted.
-        :param _builtins.str scrape_class: scrapeClass defines the scrape class to apply.
-        :param _builtins.bool scrape_classic_histograms: scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-               It requires Prometheus >= v2.45.0.
-
-               Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-        :param _builtins.bool scrape_native_histograms: scrapeNativeHistograms defines whether to enable scraping of native histograms.
-               It requires Prometheus >= v3.8.0.
-        :param Sequence[_builtins.str] scrape_protocols: scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-               protocols supported by Prometheus in order of preference (from most to least preferred).
-
-               If unset, Prometheus uses its default value.
-
-               It requires Prometheus >= v2.49.0.
-        :param _builtins.str selector_mechanism: selectorMechanism defines the mechanism used to select the endpoints to scrape.
-               By default, the selection process relies on relabel configurations to filter the discovered targets.
-               Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-               Which strategy is best for your use case needs to be carefully evaluated.
-
-               It requires Prometheus >= v2.17.0.
-        :param _builtins.int target_limit: targetLimit defines a limit on the number of scraped targets that will
-               be accepted.
-        """
-        if attach_metadata is not None:
-            pulumi.set(__self__, "attach_metadata", attach_metadata)
-        if body_size_limit is not None:
-            pulumi.set(__self__, "body_size_limit", body_size_limit)
-        if convert_classic_histograms_to_nhcb is not None:
-            pulumi.set(__self__, "convert_classic_histograms_to_nhcb", convert_classic_histograms_to_nhcb)
-        if fallback_scrape_protocol is not None:
-            pulumi.set(__self__, "fallback_scrape_protocol", fallback_scrape_protocol)
-        if job_label is not None:
-            pulumi.set(__self__, "job_label", job_label)
-        if keep_dropped_targets is not None:
-            pulumi.set(__self__, "keep_dropped_targets", keep_dropped_targets)
-        if label_limit is not None:
-            pulumi.set(__self__, "label_limit", label_limit)
-        if label_name_length_limit is not None:
-            pulumi.set(__self__, "label_name_length_limit", label_name_length_limit)
-        if label_value_length_limit is not None:
-            pulumi.set(__self__, "label_value_length_limit", label_value_length_limit)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if native_histogram_bucket_limit is not None:
-            pulumi.set(__self__, "native_histogram_bucket_limit", native_histogram_bucket_limit)
-        if native_histogram_min_bucket_factor is not None:
-            pulumi.set(__self__, "native_histogram_min_bucket_factor", native_histogram_min_bucket_factor)
-        if pod_metrics_endpoints is not None:
-            pulumi.set(__self__, "pod_metrics_endpoints", pod_metrics_endpoints)
-        if pod_target_labels is not None:
-            pulumi.set(__self__, "pod_target_labels", pod_target_labels)
-        if sample_limit is not None:
-            pulumi.set(__self__, "sample_limit", sample_limit)
-        if scrape_class is not None:
-            pulumi.set(__self__, "scrape_class", scrape_class)
-        if scrape_classic_histograms is not None:
-            pulumi.set(__self__, "scrape_classic_histograms", scrape_classic_histograms)
-        if scrape_native_histograms is not None:
-            pulumi.set(__self__, "scrape_native_histograms", scrape_native_histograms)
-        if scrape_protocols is not None:
-            pulumi.set(__self__, "scrape_protocols", scrape_protocols)
-        if selector is not None:
-            pulumi.set(__self__, "selector", selector)
-        if selector_mechanism is not None:
-            pulumi.set(__self__, "selector_mechanism", selector_mechanism)
-        if target_limit is not None:
-            pulumi.set(__self__, "target_limit", target_limit)
-
-    @_builtins.property
-    @pulumi.getter(name="attachMetadata")
-    def attach_metadata(self) -> Optional['outputs.PodMonitorSpecAttachMetadataPatch']:
-        return pulumi.get(self, "attach_metadata")
-
-    @_builtins.property
-    @pulumi.getter(name="bodySizeLimit")
-    def body_size_limit(self) -> Optional[_builtins.str]:
-        """
-        bodySizeLimit when defined specifies a job level limit on the size
-        of uncompressed response body that will be accepted by Prometheus.
-
-        It requires Prometheus >= v2.28.0.
-        """
-        return pulumi.get(self, "body_size_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="convertClassicHistogramsToNHCB")
-    def convert_classic_histograms_to_nhcb(self) -> Optional[_builtins.bool]:
-        """
-        convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-        It requires Prometheus >= v3.0.0.
-        """
-        return pulumi.get(self, "convert_classic_histograms_to_nhcb")
-
-    @_builtins.property
-    @pulumi.getter(name="fallbackScrapeProtocol")
-    def fallback_scrape_protocol(self) -> Optional[_builtins.str]:
-        """
-        fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-        It requires Prometheus >= v3.0.0.
-        """
-        return pulumi.get(self, "fallback_scrape_protocol")
-
-    @_builtins.property
-    @pulumi.getter(name="jobLabel")
-    def job_label(self) -> Optional[_builtins.str]:
-        """
-        jobLabel defines the label to use to retrieve the job name from.
-        `jobLabel` selects the label from the associated Kubernetes `Pod`
-        object which will be used as the `job` label for all metrics.
-
-        For example if `jobLabel` is set to `foo` and the Kubernetes `Pod`
-        object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-        label to all ingested metrics.
-
-        If the value of this field is empty, the `job` label of the metrics
-        defaults to the namespace and name of the PodMonitor object (e.g. `<namespace>/<name>`).
-        """
-        return pulumi.get(self, "job_label")
-
-    @_builtins.property
-    @pulumi.getter(name="keepDroppedTargets")
-    def keep_dropped_targets(self) -> Optional[_builtins.int]:
-        """
-        keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-        that will be kept in memory. 0 means no limit.
-
-        It requires Prometheus >= v2.47.0.
-        """
-        return pulumi.get(self, "keep_dropped_targets")
-
-    @_builtins.property
-    @pulumi.getter(name="labelLimit")
-    def label_limit(self) -> Optional[_builtins.int]:
-        """
-        labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="labelNameLengthLimit")
-    def label_name_length_limit(self) -> Optional[_builtins.int]:
-        """
-        labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_name_length_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="labelValueLengthLimit")
-    def label_value_length_limit(self) -> Optional[_builtins.int]:
-        """
-        labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_value_length_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> Optional['outputs.PodMonitorSpecNamespaceSelectorPatch']:
-        return pulumi.get(self, "namespace_selector")
-
-    @_builtins.property
-    @pulumi.getter(name="nativeHistogramBucketLimit")
-    def native_histogram_bucket_limit(self) -> Optional[_builtins.int]:
-        """
-        nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-        buckets will be merged to stay within the limit.
-        It requires Prometheus >= v2.45.0.
-        """
-        return pulumi.get(self, "native_histogram_bucket_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="nativeHistogramMinBucketFactor")
-    def native_histogram_min_bucket_factor(self) -> Optional[Any]:
-        """
-        nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-        buckets will be merged to increase the factor sufficiently.
-        It requires Prometheus >= v2.50.0.
-        """
-        return pulumi.get(self, "native_histogram_min_bucket_factor")
-
-    @_builtins.property
-    @pulumi.getter(name="podMetricsEndpoints")
-    def pod_metrics_endpoints(self) -> Optional[Sequence['outputs.PodMonitorSpecPodMetricsEndpointsPatch']]:
-        """
-        podMetricsEndpoints defines how to scrape metrics from the selected pods.
-        """
-        return pulumi.get(self, "pod_metrics_endpoints")
-
-    @_builtins.property
-    @pulumi.getter(name="podTargetLabels")
-    def pod_target_labels(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        podTargetLabels defines the labels which are transferred from the
-        associated Kubernetes `Pod` object onto the ingested metrics.
-        """
-        return pulumi.get(self, "pod_target_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="sampleLimit")
-    def sample_limit(self) -> Optional[_builtins.int]:
-        """
-        sampleLimit defines a per-scrape limit on the number of scraped samples
-        that will be accepted.
-        """
-        return pulumi.get(self, "sample_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeClass")
-    def scrape_class(self) -> Optional[_builtins.str]:
-        """
-        scrapeClass defines the scrape class to apply.
-        """
-        return pulumi.get(self, "scrape_class")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeClassicHistograms")
-    def scrape_classic_histograms(self) -> Optional[_builtins.bool]:
-        """
-        scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-        It requires Prometheus >= v2.45.0.
-
-        Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-        """
-        return pulumi.get(self, "scrape_classic_histograms")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeNativeHistograms")
-    def scrape_native_histograms(self) -> Optional[_builtins.bool]:
-        """
-        scrapeNativeHistograms defines whether to enable scraping of native histograms.
-        It requires Prometheus >= v3.8.0.
-        """
-        return pulumi.get(self, "scrape_native_histograms")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeProtocols")
-    def scrape_protocols(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-        protocols supported by Prometheus in order of preference (from most to least preferred).
-
-        If unset, Prometheus uses its default value.
-
-        It requires Prometheus >= v2.49.0.
-        """
-        return pulumi.get(self, "scrape_protocols")
-
-    @_builtins.property
-    @pulumi.getter
-    def selector(self) -> Optional['outputs.PodMonitorSpecSelectorPatch']:
-        return pulumi.get(self, "selector")
-
-    @_builtins.property
-    @pulumi.getter(name="selectorMechanism")
-    def selector_mechanism(self) -> Optional[_builtins.str]:
-        """
-        selectorMechanism defines the mechanism used to select the endpoints to scrape.
-        By default, the selection process relies on relabel configurations to filter the discovered targets.
-        Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-        Which strategy is best for your use case needs to be carefully evaluated.
-
-        It requires Prometheus >= v2.17.0.
-        """
-        return pulumi.get(self, "selector_mechanism")
-
-    @_builtins.property
-    @pulumi.getter(name="targetLimit")
-    def target_limit(self) -> Optional[_builtins.int]:
-        """
-        targetLimit defines a limit on the number of scraped targets that will
-        be accepted.
-        """
-        return pulumi.get(self, "target_limit")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpoints(dict):
-    """
-    PodMetricsEndpoint defines an endpoint serving Prometheus metrics to be scraped by
-    Prometheus.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "basicAuth":
-            suggest = "basic_auth"
-        elif key == "bearerTokenSecret":
-            suggest = "bearer_token_secret"
-        elif key == "enableHttp2":
-            suggest = "enable_http2"
-        elif key == "filterRunning":
-            suggest = "filter_running"
-        elif key == "followRedirects":
-            suggest = "follow_redirects"
-        elif key == "honorLabels":
-            suggest = "honor_labels"
-        elif key == "honorTimestamps":
-            suggest = "honor_timestamps"
-        elif key == "metricRelabelings":
-            suggest = "metric_relabelings"
-        elif key == "noProxy":
-            suggest = "no_proxy"
-        elif key == "portNumber":
-            suggest = "port_number"
-        elif key == "proxyConnectHeader":
-            suggest = "proxy_connect_header"
-        elif key == "proxyFromEnvironment":
-            suggest = "proxy_from_environment"
-        elif key == "proxyUrl":
-            suggest = "proxy_url"
-        elif key == "scrapeTimeout":
-            suggest = "scrape_timeout"
-        elif key == "targetPort":
-            suggest = "target_port"
-        elif key == "tlsConfig":
-            suggest = "tls_config"
-        elif key == "trackTimestampsStaleness":
-            suggest = "track_timestamps_staleness"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpoints. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpoints.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpoints.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 authorization: Optional['outputs.PodMonitorSpecPodMetricsEndpointsAuthorization'] = None,
-                 basic_auth: Optional['outputs.PodMonitorSpecPodMetricsEndpointsBasicAuth'] = None,
-                 bearer_token_secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsBearerTokenSecret'] = None,
-                 enable_http2: Optional[_builtins.bool] = None,
-                 filter_running: Optional[_builtins.bool] = None,
-                 follow_redirects: Optional[_builtins.bool] = None,
-                 honor_labels: Optional[_builtins.bool] = None,
-                 honor_timestamps: Optional[_builtins.bool] = None,
-                 interval: Optional[_builtins.str] = None,
-                 metric_relabelings: Optional[Sequence['outputs.PodMonitorSpecPodMetricsEndpointsMetricRelabelings']] = None,
-                 no_proxy: Optional[_builtins.str] = None,
-                 oauth2: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2'] = None,
-                 params: Optional[Mapping[str, Sequence[_builtins.str]]] = None,
-                 path: Optional[_builtins.str] = None,
-                 port: Optional[_builtins.str] = None,
-                 port_number: Optional[_builtins.int] = None,
-                 proxy_connect_header: Optional[Mapping[str, Sequence['outputs.PodMonitorSpecPodMetricsEndpointsProxyConnectHeader']]] = None,
-                 proxy_from_environment: Optional[_builtins.bool] = None,
-                 proxy_url: Optional[_builtins.str] = None,
-                 relabelings: Optional[Sequence['outputs.PodMonitorSpecPodMetricsEndpointsRelabelings']] = None,
-                 scheme: Optional[_builtins.str] = None,
-                 scrape_timeout: Optional[_builtins.str] = None,
-                 target_port: Optional[Any] = None,
-                 tls_config: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfig'] = None,
-                 track_timestamps_staleness: Optional[_builtins.bool] = None):
-        """
-        PodMetricsEndpoint defines an endpoint serving Prometheus metrics to be scraped by
-        Prometheus.
-
-        :param _builtins.bool enable_http2: enableHttp2 can be used to disable HTTP2.
-        :param _builtins.bool filter_running: filterRunning when true, the pods which are not running (e.g. either in Failed or
-               Succeeded state) are dropped during the target discovery.
-
-               If unset, the filtering is enabled.
-
-               More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-        :param _builtins.bool follow_redirects: followRedirects defines whether the client should follow HTTP 3xx
-               redirects.
-        :param _builtins.bool honor_labels: honorLabels when true preserves the metric's labels when they collide
-               with the target's labels.
-        :param _builtins.bool honor_timestamps: honorTimestamps defines whether Prometheus preserves the timestamps
-               when exposed by the target.
-        :param _builtins.str interval: interval at which Prometheus scrapes the metrics from the target.
-
-               If empty, Prometheus uses the global scrape interval.
-        :param Sequence['PodMonitorSpecPodMetricsEndpointsMetricRelabelingsArgs'] metric_relabelings: metricRelabelings defines the relabeling rules to apply to the
-               samples before ingestion.
-        :param _builtins.str no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-               that should be excluded from proxying. IP and domain names can
-               contain port numbers.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param Mapping[str, Sequence[_builtins.str]] params: params define optional HTTP URL parameters.
-        :param _builtins.str path: path defines the HTTP path from which to scrape for metrics.
-
-               If empty, Prometheus uses the default value (e.g. `/metrics`).
-        :param _builtins.str port: port defines the `Pod` port name which exposes the endpoint.
-
-               If the pod doesn't expose a port with the same name, it will result
-               in no targets being discovered.
-
-               If a `Pod` has multiple `Port`s with the same name (which is not
-               recommended), one target instance per unique port number will be
-               generated.
-
-               It takes precedence over the `portNumber` and `targetPort` fields.
-        :param _builtins.int port_number: portNumber defines the `Pod` port number which exposes the endpoint.
-
-               The `Pod` must declare the specified `Port` in its spec or the
-               target will be dropped by Prometheus.
-
-               This cannot be used to enable scraping of an undeclared port.
-               To scrape targets on a port which isn't exposed, you need to use
-               relabeling to override the `__address__` label (but beware of
-               duplicate targets if the `Pod` has other declared ports).
-
-               In practice Prometheus will select targets for which the
-               matches the target's __meta_kubernetes_pod_container_port_number.
-        :param Mapping[str, Sequence['PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs']] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
-               proxies during CONNECT requests.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param _builtins.bool proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param _builtins.str proxy_url: proxyUrl defines the HTTP proxy server to use.
-        :param Sequence['PodMonitorSpecPodMetricsEndpointsRelabelingsArgs'] relabelings: relabelings defines the relabeling rules to apply the target's
-               metadata labels.
-
-               The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-               The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-               More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-        :param _builtins.str scheme: scheme defines the HTTP scheme to use for scraping.
-        :param _builtins.str scrape_timeout: scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-               If empty, Prometheus uses the global scrape timeout unless it is less
-               than the target's scrape interval value in which the latter is used.
-               The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-        :param Union[_builtins.int, _builtins.str] target_port: targetPort defines the name or number of the target port of the `Pod` object behind the Service, the
-               port must be specified with container port property.
-
-               Deprecated: use 'port' or 'portNumber' instead.
-        :param _builtins.bool track_timestamps_staleness: trackTimestampsStaleness defines whether Prometheus tracks staleness of
-               the metrics that have an explicit timestamp present in scraped data.
-               Has no effect if `honorTimestamps` is false.
-
-               It requires Prometheus >= v2.48.0.
-        """
-        if authorization is not None:
-            pulumi.set(__self__, "authorization", authorization)
-        if basic_auth is not None:
-            pulumi.set(__self__, "basic_auth", basic_auth)
-        if bearer_token_secret is not None:
-            pulumi.set(__self__, "bearer_token_secret", bearer_token_secret)
-        if enable_http2 is not None:
-            pulumi.set(__self__, "enable_http2", enable_http2)
-        if filter_running is not None:
-            pulumi.set(__self__, "filter_running", filter_running)
-        if follow_redirects is not None:
-            pulumi.set(__self__, "follow_redirects", follow_redirects)
-        if honor_labels is not None:
-            pulumi.set(__self__, "honor_labels", honor_labels)
-        if honor_timestamps is not None:
-            pulumi.set(__self__, "honor_timestamps", honor_timestamps)
-        if interval is not None:
-            pulumi.set(__self__, "interval", interval)
-        if metric_relabelings is not None:
-            pulumi.set(__self__, "metric_relabelings", metric_relabelings)
-        if no_proxy is not None:
-            pulumi.set(__self__, "no_proxy", no_proxy)
-        if oauth2 is not None:
-            pulumi.set(__self__, "oauth2", oauth2)
-        if params is not None:
-            pulumi.set(__self__, "params", params)
-        if path is not None:
-            pulumi.set(__self__, "path", path)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if port_number is not None:
-            pulumi.set(__self__, "port_number", port_number)
-        if proxy_connect_header is not None:
-            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
-        if proxy_from_environment is not None:
-            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
-        if proxy_url is not None:
-            pulumi.set(__self__, "proxy_url", proxy_url)
-        if relabelings is not None:
-            pulumi.set(__self__, "relabelings", relabelings)
-        if scheme is not None:
-            pulumi.set(__self__, "scheme", scheme)
-        if scrape_timeout is not None:
-            pulumi.set(__self__, "scrape_timeout", scrape_timeout)
-        if target_port is not None:
-            pulumi.set(__self__, "target_port", target_port)
-        if tls_config is not None:
-            pulumi.set(__self__, "tls_config", tls_config)
-        if track_timestamps_staleness is not None:
-            pulumi.set(__self__, "track_timestamps_staleness", track_timestamps_staleness)
-
-    @_builtins.property
-    @pulumi.getter
-    def authorization(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsAuthorization']:
-        return pulumi.get(self, "authorization")
-
-    @_builtins.property
-    @pulumi.getter(name="basicAuth")
-    def basic_auth(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsBasicAuth']:
-        return pulumi.get(self, "basic_auth")
-
-    @_builtins.property
-    @pulumi.getter(name="bearerTokenSecret")
-    def bearer_token_secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsBearerTokenSecret']:
-        return pulumi.get(self, "bearer_token_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="enableHttp2")
-    def enable_http2(self) -> Optional[_builtins.bool]:
-        """
-        enableHttp2 can be used to disable HTTP2.
-        """
-        return pulumi.get(self, "enable_http2")
-
-    @_builtins.property
-    @pulumi.getter(name="filterRunning")
-    def filter_running(self) -> Optional[_builtins.bool]:
-        """
-        filterRunning when true, the pods which are not running (e.g. either in Failed or
-        Succeeded state) are dropped during the target discovery.
-
-        If unset, the filtering is enabled.
-
-        More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-        """
-        return pulumi.get(self, "filter_running")
-
-    @_builtins.property
-    @pulumi.getter(name="followRedirects")
-    def follow_redirects(self) -> Optional[_builtins.bool]:
-        """
-        followRedirects defines whether the client should follow HTTP 3xx
-        redirects.
-        """
-        return pulumi.get(self, "follow_redirects")
-
-    @_builtins.property
-    @pulumi.getter(name="honorLabels")
-    def honor_labels(self) -> Optional[_builtins.bool]:
-        """
-        honorLabels when true preserves the metric's labels when they collide
-        with the target's labels.
-        """
-        return pulumi.get(self, "honor_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="honorTimestamps")
-    def honor_timestamps(self) -> Optional[_builtins.bool]:
-        """
-        honorTimestamps defines whether Prometheus preserves the timestamps
-        when exposed by the target.
-        """
-        return pulumi.get(self, "honor_timestamps")
-
-    @_builtins.property
-    @pulumi.getter
-    def interval(self) -> Optional[_builtins.str]:
-        """
-        interval at which Prometheus scrapes the metrics from the target.
-
-        If empty, Prometheus uses the global scrape interval.
-        """
-        return pulumi.get(self, "interval")
-
-    @_builtins.property
-    @pulumi.getter(name="metricRelabelings")
-    def metric_relabelings(self) -> Optional[Sequence['outputs.PodMonitorSpecPodMetricsEndpointsMetricRelabelings']]:
-        """
-        metricRelabelings defines the relabeling rules to apply to the
-        samples before ingestion.
-        """
-        return pulumi.get(self, "metric_relabelings")
-
-    @_builtins.property
-    @pulumi.getter(name="noProxy")
-    def no_proxy(self) -> Optional[_builtins.str]:
-        """
-        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-        that should be excluded from proxying. IP and domain names can
-        contain port numbers.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "no_proxy")
-
-    @_builtins.property
-    @pulumi.getter
-    def oauth2(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2']:
-        return pulumi.get(self, "oauth2")
-
-    @_builtins.property
-    @pulumi.getter
-    def params(self) -> Optional[Mapping[str, Sequence[_builtins.str]]]:
-        """
-        params define optional HTTP URL parameters.
-        """
-        return pulumi.get(self, "params")
-
-    @_builtins.property
-    @pulumi.getter
-    def path(self) -> Optional[_builtins.str]:
-        """
-        path defines the HTTP path from which to scrape for metrics.
-
-        If empty, Prometheus uses the default value (e.g. `/metrics`).
-        """
-        return pulumi.get(self, "path")
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> Optional[_builtins.str]:
-        """
-        port defines the `Pod` port name which exposes the endpoint.
-
-        If the pod doesn't expose a port with the same name, it will result
-        in no targets being discovered.
-
-        If a `Pod` has multiple `Port`s with the same name (which is not
-        recommended), one target instance per unique port number will be
-        generated.
-
-        It takes precedence over the `portNumber` and `targetPort` fields.
-        """
-        return pulumi.get(self, "port")
-
-    @_builtins.property
-    @pulumi.getter(name="portNumber")
-    def port_number(self) -> Optional[_builtins.int]:
-        """
-        portNumber defines the `Pod` port number which exposes the endpoint.
-
-        The `Pod` must declare the specified `Port` in its spec or the
-        target will be dropped by Prometheus.
-
-        This cannot be used to enable scraping of an undeclared port.
-        To scrape targets on a port which isn't exposed, you need to use
-        relabeling to override the `__address__` label (but beware of
-        duplicate targets if the `Pod` has other declared ports).
-
-        In practice Prometheus will select targets for which the
-        matches the target's __meta_kubernetes_pod_container_port_number.
-        """
-        return pulumi.get(self, "port_number")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyConnectHeader")
-    def proxy_connect_header(self) -> Optional[Mapping[str, Sequence['outputs.PodMonitorSpecPodMetricsEndpointsProxyConnectHeader']]]:
-        """
-        proxyConnectHeader optionally specifies headers to send to
-        proxies during CONNECT requests.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_connect_header")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyFromEnvironment")
-    def proxy_from_environment(self) -> Optional[_builtins.bool]:
-        """
-        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_from_environment")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyUrl")
-    def proxy_url(self) -> Optional[_builtins.str]:
-        """
-        proxyUrl defines the HTTP proxy server to use.
-        """
-        return pulumi.get(self, "proxy_url")
-
-    @_builtins.property
-    @pulumi.getter
-    def relabelings(self) -> Optional[Sequence['outputs.PodMonitorSpecPodMetricsEndpointsRelabelings']]:
-        """
-        relabelings defines the relabeling rules to apply the target's
-        metadata labels.
-
-        The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-        The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-        """
-        return pulumi.get(self, "relabelings")
-
-    @_builtins.property
-    @pulumi.getter
-    def scheme(self) -> Optional[_builtins.str]:
-        """
-        scheme defines the HTTP scheme to use for scraping.
-        """
-        return pulumi.get(self, "scheme")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeTimeout")
-    def scrape_timeout(self) -> Optional[_builtins.str]:
-        """
-        scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-        If empty, Prometheus uses the global scrape timeout unless it is less
-        than the target's scrape interval value in which the latter is used.
-        The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-        """
-        return pulumi.get(self, "scrape_timeout")
-
-    @_builtins.property
-    @pulumi.getter(name="targetPort")
-    def target_port(self) -> Optional[Any]:
-        """
-        targetPort defines the name or number of the target port of the `Pod` object behind the Service, the
-        port must be specified with container port property.
-
-        Deprecated: use 'port' or 'portNumber' instead.
-        """
-        return pulumi.get(self, "target_port")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsConfig")
-    def tls_config(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfig']:
-        return pulumi.get(self, "tls_config")
-
-    @_builtins.property
-    @pulumi.getter(name="trackTimestampsStaleness")
-    def track_timestamps_staleness(self) -> Optional[_builtins.bool]:
-        """
-        trackTimestampsStaleness defines whether Prometheus tracks staleness of
-        the metrics that have an explicit timestamp present in scraped data.
-        Has no effect if `honorTimestamps` is false.
-
-        It requires Prometheus >= v2.48.0.
-        """
-        return pulumi.get(self, "track_timestamps_staleness")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsAuthorization(dict):
-    """
-    authorization configures the Authorization header credentials used by
-    the client.
-
-    Cannot be set at the same time as `basicAuth`, `bearerTokenSecret` or `oauth2`.
-    """
-    def __init__(__self__, *,
-                 credentials: Optional['outputs.PodMonitorSpecPodMetricsEndpointsAuthorizationCredentials'] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        authorization configures the Authorization header credentials used by
-        the client.
-
-        Cannot be set at the same time as `basicAuth`, `bearerTokenSecret` or `oauth2`.
-
-        :param _builtins.str type: type defines the authentication type. The value is case-insensitive.
-
-               "Basic" is not a supported value.
-
-               Default: "Bearer"
-        """
-        if credentials is not None:
-            pulumi.set(__self__, "credentials", credentials)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter
-    def credentials(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsAuthorizationCredentials']:
-        return pulumi.get(self, "credentials")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type defines the authentication type. The value is case-insensitive.
-
-        "Basic" is not a supported value.
-
-        Default: "Bearer"
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsAuthorizationCredentials(dict):
-    """
-    credentials defines a key of a Secret in the namespace that contains the credentials for authentication.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        credentials defines a key of a Secret in the namespace that contains the credentials for authentication.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatch(dict):
-    """
-    credentials defines a key of a Secret in the namespace that contains the credentials for authentication.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        credentials defines a key of a Secret in the namespace that contains the credentials for authentication.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsAuthorizationPatch(dict):
-    """
-    authorization configures the Authorization header credentials used by
-    the client.
-
-    Cannot be set at the same time as `basicAuth`, `bearerTokenSecret` or `oauth2`.
-    """
-    def __init__(__self__, *,
-                 credentials: Optional['outputs.PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatch'] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        authorization configures the Authorization header credentials used by
-        the client.
-
-        Cannot be set at the same time as `basicAuth`, `bearerTokenSecret` or `oauth2`.
-
-        :param _builtins.str type: type defines the authentication type. The value is case-insensitive.
-
-               "Basic" is not a supported value.
-
-               Default: "Bearer"
-        """
-        if credentials is not None:
-            pulumi.set(__self__, "credentials", credentials)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter
-    def credentials(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatch']:
-        return pulumi.get(self, "credentials")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type defines the authentication type. The value is case-insensitive.
-
-        "Basic" is not a supported value.
-
-        Default: "Bearer"
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsBasicAuth(dict):
-    """
-    basicAuth defines the Basic Authentication credentials used by the
-    client.
-
-    Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
-    """
-    def __init__(__self__, *,
-                 password: Optional['outputs.PodMonitorSpecPodMetricsEndpointsBasicAuthPassword'] = None,
-                 username: Optional['outputs.PodMonitorSpecPodMetricsEndpointsBasicAuthUsername'] = None):
-        """
-        basicAuth defines the Basic Authentication credentials used by the
-        client.
-
-        Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
-        """
-        if password is not None:
-            pulumi.set(__self__, "password", password)
-        if username is not None:
-            pulumi.set(__self__, "username", username)
-
-    @_builtins.property
-    @pulumi.getter
-    def password(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsBasicAuthPassword']:
-        return pulumi.get(self, "password")
-
-    @_builtins.property
-    @pulumi.getter
-    def username(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsBasicAuthUsername']:
-        return pulumi.get(self, "username")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsBasicAuthPassword(dict):
-    """
-    password defines a key of a Secret containing the password for
-    authentication.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        password defines a key of a Secret containing the password for
-        authentication.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatch(dict):
-    """
-    password defines a key of a Secret containing the password for
-    authentication.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        password defines a key of a Secret containing the password for
-        authentication.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsBasicAuthPatch(dict):
-    """
-    basicAuth defines the Basic Authentication credentials used by the
-    client.
-
-    Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
-    """
-    def __init__(__self__, *,
-                 password: Optional['outputs.PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatch'] = None,
-                 username: Optional['outputs.PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatch'] = None):
-        """
-        basicAuth defines the Basic Authentication credentials used by the
-        client.
-
-        Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
-        """
-        if password is not None:
-            pulumi.set(__self__, "password", password)
-        if username is not None:
-            pulumi.set(__self__, "username", username)
-
-    @_builtins.property
-    @pulumi.getter
-    def password(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatch']:
-        return pulumi.get(self, "password")
-
-    @_builtins.property
-    @pulumi.getter
-    def username(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatch']:
-        return pulumi.get(self, "username")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsBasicAuthUsername(dict):
-    """
-    username defines a key of a Secret containing the username for
-    authentication.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        username defines a key of a Secret containing the username for
-        authentication.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatch(dict):
-    """
-    username defines a key of a Secret containing the username for
-    authentication.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        username defines a key of a Secret containing the username for
-        authentication.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsBearerTokenSecret(dict):
-    """
-    bearerTokenSecret defines a key of a Secret containing the bearer token
-    used by the client for authentication. The secret needs to be in the
-    same namespace as the custom resource and readable by the Prometheus
-    Operator.
-
-    Cannot be set at the same time as `authorization`, `basicAuth` or `oauth2`.
-
-    Deprecated: use `authorization` instead.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        bearerTokenSecret defines a key of a Secret containing the bearer token
-        used by the client for authentication. The secret needs to be in the
-        same namespace as the custom resource and readable by the Prometheus
-        Operator.
-
-        Cannot be set at the same time as `authorization`, `basicAuth` or `oauth2`.
-
-        Deprecated: use `authorization` instead.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatch(dict):
-    """
-    bearerTokenSecret defines a key of a Secret containing the bearer token
-    used by the client for authentication. The secret needs to be in the
-    same namespace as the custom resource and readable by the Prometheus
-    Operator.
-
-    Cannot be set at the same time as `authorization`, `basicAuth` or `oauth2`.
-
-    Deprecated: use `authorization` instead.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        bearerTokenSecret defines a key of a Secret containing the bearer token
-        used by the client for authentication. The secret needs to be in the
-        same namespace as the custom resource and readable by the Prometheus
-        Operator.
-
-        Cannot be set at the same time as `authorization`, `basicAuth` or `oauth2`.
-
-        Deprecated: use `authorization` instead.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsMetricRelabelings(dict):
-    """
-    RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-    scraped samples and remote write samples.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "sourceLabels":
-            suggest = "source_labels"
-        elif key == "targetLabel":
-            suggest = "target_label"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsMetricRelabelings. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsMetricRelabelings.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsMetricRelabelings.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 action: Optional[_builtins.str] = None,
-                 modulus: Optional[_builtins.int] = None,
-                 regex: Optional[_builtins.str] = None,
-                 replacement: Optional[_builtins.str] = None,
-                 separator: Optional[_builtins.str] = None,
-                 source_labels: Optional[Sequence[_builtins.str]] = None,
-                 target_label: Optional[_builtins.str] = None):
-        """
-        RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-        scraped samples and remote write samples.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-
-        :param _builtins.str action: action to perform based on the regex matching.
-
-               `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-               `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-               Default: "Replace"
-        :param _builtins.int modulus: modulus to take of the hash of the source label values.
-
-               Only applicable when the action is `HashMod`.
-        :param _builtins.str regex: regex defines the regular expression against which the extracted value is matched.
-        :param _builtins.str replacement: replacement value against which a Replace action is performed if the
-               regular expression matches.
-
-               Regex capture groups are available.
-        :param _builtins.str separator: separator defines the string between concatenated SourceLabels.
-        :param Sequence[_builtins.str] source_labels: sourceLabels defines the source labels select values from existing labels. Their content is
-               concatenated using the configured Separator and matched against the
-               configured regular expression.
-        :param _builtins.str target_label: targetLabel defines the label to which the resulting string is written in a replacement.
-
-               It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-               `KeepEqual` and `DropEqual` actions.
-
-               Regex capture groups are available.
-        """
-        if action is not None:
-            pulumi.set(__self__, "action", action)
-        if modulus is not None:
-            pulumi.set(__self__, "modulus", modulus)
-        if regex is not None:
-            pulumi.set(__self__, "regex", regex)
-        if replacement is not None:
-            pulumi.set(__self__, "replacement", replacement)
-        if separator is not None:
-            pulumi.set(__self__, "separator", separator)
-        if source_labels is not None:
-            pulumi.set(__self__, "source_labels", source_labels)
-        if target_label is not None:
-            pulumi.set(__self__, "target_label", target_label)
-
-    @_builtins.property
-    @pulumi.getter
-    def action(self) -> Optional[_builtins.str]:
-        """
-        action to perform based on the regex matching.
-
-        `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-        `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-        Default: "Replace"
-        """
-        return pulumi.get(self, "action")
-
-    @_builtins.property
-    @pulumi.getter
-    def modulus(self) -> Optional[_builtins.int]:
-        """
-        modulus to take of the hash of the source label values.
-
-        Only applicable when the action is `HashMod`.
-        """
-        return pulumi.get(self, "modulus")
-
-    @_builtins.property
-    @pulumi.getter
-    def regex(self) -> Optional[_builtins.str]:
-        """
-        regex defines the regular expression against which the extracted value is matched.
-        """
-        return pulumi.get(self, "regex")
-
-    @_builtins.property
-    @pulumi.getter
-    def replacement(self) -> Optional[_builtins.str]:
-        """
-        replacement value against which a Replace action is performed if the
-        regular expression matches.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "replacement")
-
-    @_builtins.property
-    @pulumi.getter
-    def separator(self) -> Optional[_builtins.str]:
-        """
-        separator defines the string between concatenated SourceLabels.
-        """
-        return pulumi.get(self, "separator")
-
-    @_builtins.property
-    @pulumi.getter(name="sourceLabels")
-    def source_labels(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        sourceLabels defines the source labels select values from existing labels. Their content is
-        concatenated using the configured Separator and matched against the
-        configured regular expression.
-        """
-        return pulumi.get(self, "source_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabel")
-    def target_label(self) -> Optional[_builtins.str]:
-        """
-        targetLabel defines the label to which the resulting string is written in a replacement.
-
-        It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-        `KeepEqual` and `DropEqual` actions.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "target_label")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatch(dict):
-    """
-    RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-    scraped samples and remote write samples.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "sourceLabels":
-            suggest = "source_labels"
-        elif key == "targetLabel":
-            suggest = "target_label"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 action: Optional[_builtins.str] = None,
-                 modulus: Optional[_builtins.int] = None,
-                 regex: Optional[_builtins.str] = None,
-                 replacement: Optional[_builtins.str] = None,
-                 separator: Optional[_builtins.str] = None,
-                 source_labels: Optional[Sequence[_builtins.str]] = None,
-                 target_label: Optional[_builtins.str] = None):
-        """
-        RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-        scraped samples and remote write samples.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-
-        :param _builtins.str action: action to perform based on the regex matching.
-
-               `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-               `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-               Default: "Replace"
-        :param _builtins.int modulus: modulus to take of the hash of the source label values.
-
-               Only applicable when the action is `HashMod`.
-        :param _builtins.str regex: regex defines the regular expression against which the extracted value is matched.
-        :param _builtins.str replacement: replacement value against which a Replace action is performed if the
-               regular expression matches.
-
-               Regex capture groups are available.
-        :param _builtins.str separator: separator defines the string between concatenated SourceLabels.
-        :param Sequence[_builtins.str] source_labels: sourceLabels defines the source labels select values from existing labels. Their content is
-               concatenated using the configured Separator and matched against the
-               configured regular expression.
-        :param _builtins.str target_label: targetLabel defines the label to which the resulting string is written in a replacement.
-
-               It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-               `KeepEqual` and `DropEqual` actions.
-
-               Regex capture groups are available.
-        """
-        if action is not None:
-            pulumi.set(__self__, "action", action)
-        if modulus is not None:
-            pulumi.set(__self__, "modulus", modulus)
-        if regex is not None:
-            pulumi.set(__self__, "regex", regex)
-        if replacement is not None:
-            pulumi.set(__self__, "replacement", replacement)
-        if separator is not None:
-            pulumi.set(__self__, "separator", separator)
-        if source_labels is not None:
-            pulumi.set(__self__, "source_labels", source_labels)
-        if target_label is not None:
-            pulumi.set(__self__, "target_label", target_label)
-
-    @_builtins.property
-    @pulumi.getter
-    def action(self) -> Optional[_builtins.str]:
-        """
-        action to perform based on the regex matching.
-
-        `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-        `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-        Default: "Replace"
-        """
-        return pulumi.get(self, "action")
-
-    @_builtins.property
-    @pulumi.getter
-    def modulus(self) -> Optional[_builtins.int]:
-        """
-        modulus to take of the hash of the source label values.
-
-        Only applicable when the action is `HashMod`.
-        """
-        return pulumi.get(self, "modulus")
-
-    @_builtins.property
-    @pulumi.getter
-    def regex(self) -> Optional[_builtins.str]:
-        """
-        regex defines the regular expression against which the extracted value is matched.
-        """
-        return pulumi.get(self, "regex")
-
-    @_builtins.property
-    @pulumi.getter
-    def replacement(self) -> Optional[_builtins.str]:
-        """
-        replacement value against which a Replace action is performed if the
-        regular expression matches.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "replacement")
-
-    @_builtins.property
-    @pulumi.getter
-    def separator(self) -> Optional[_builtins.str]:
-        """
-        separator defines the string between concatenated SourceLabels.
-        """
-        return pulumi.get(self, "separator")
-
-    @_builtins.property
-    @pulumi.getter(name="sourceLabels")
-    def source_labels(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        sourceLabels defines the source labels select values from existing labels. Their content is
-        concatenated using the configured Separator and matched against the
-        configured regular expression.
-        """
-        return pulumi.get(self, "source_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabel")
-    def target_label(self) -> Optional[_builtins.str]:
-        """
-        targetLabel defines the label to which the resulting string is written in a replacement.
-
-        It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-        `KeepEqual` and `DropEqual` actions.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "target_label")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2(dict):
-    """
-    oauth2 defines the OAuth2 settings used by the client.
-
-    It requires Prometheus >= 2.27.0.
-
-    Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clientId":
-            suggest = "client_id"
-        elif key == "clientSecret":
-            suggest = "client_secret"
-        elif key == "endpointParams":
-            suggest = "endpoint_params"
-        elif key == "noProxy":
-            suggest = "no_proxy"
-        elif key == "proxyConnectHeader":
-            suggest = "proxy_connect_header"
-        elif key == "proxyFromEnvironment":
-            suggest = "proxy_from_environment"
-        elif key == "proxyUrl":
-            suggest = "proxy_url"
-        elif key == "tlsConfig":
-            suggest = "tls_config"
-        elif key == "tokenUrl":
-            suggest = "token_url"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsOauth2. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 client_id: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientId'] = None,
-                 client_secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientSecret'] = None,
-                 endpoint_params: Optional[Mapping[str, _builtins.str]] = None,
-                 no_proxy: Optional[_builtins.str] = None,
-                 proxy_connect_header: Optional[Mapping[str, Sequence['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeader']]] = None,
-                 proxy_from_environment: Optional[_builtins.bool] = None,
-                 proxy_url: Optional[_builtins.str] = None,
-                 scopes: Optional[Sequence[_builtins.str]] = None,
-                 tls_config: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfig'] = None,
-                 token_url: Optional[_builtins.str] = None):
-        """
-        oauth2 defines the OAuth2 settings used by the client.
-
-        It requires Prometheus >= 2.27.0.
-
-        Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
-
-        :param Mapping[str, _builtins.str] endpoint_params: endpointParams configures the HTTP parameters to append to the token
-               URL.
-        :param _builtins.str no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-               that should be excluded from proxying. IP and domain names can
-               contain port numbers.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param Mapping[str, Sequence['PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs']] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
-               proxies during CONNECT requests.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param _builtins.bool proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param _builtins.str proxy_url: proxyUrl defines the HTTP proxy server to use.
-        :param Sequence[_builtins.str] scopes: scopes defines the OAuth2 scopes used for the token request.
-        :param _builtins.str token_url: tokenUrl defines the URL to fetch the token from.
-        """
-        if client_id is not None:
-            pulumi.set(__self__, "client_id", client_id)
-        if client_secret is not None:
-            pulumi.set(__self__, "client_secret", client_secret)
-        if endpoint_params is not None:
-            pulumi.set(__self__, "endpoint_params", endpoint_params)
-        if no_proxy is not None:
-            pulumi.set(__self__, "no_proxy", no_proxy)
-        if proxy_connect_header is not None:
-            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
-        if proxy_from_environment is not None:
-            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
-        if proxy_url is not None:
-            pulumi.set(__self__, "proxy_url", proxy_url)
-        if scopes is not None:
-            pulumi.set(__self__, "scopes", scopes)
-        if tls_config is not None:
-            pulumi.set(__self__, "tls_config", tls_config)
-        if token_url is not None:
-            pulumi.set(__self__, "token_url", token_url)
-
-    @_builtins.property
-    @pulumi.getter(name="clientId")
-    def client_id(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientId']:
-        return pulumi.get(self, "client_id")
-
-    @_builtins.property
-    @pulumi.getter(name="clientSecret")
-    def client_secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientSecret']:
-        return pulumi.get(self, "client_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="endpointParams")
-    def endpoint_params(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        endpointParams configures the HTTP parameters to append to the token
-        URL.
-        """
-        return pulumi.get(self, "endpoint_params")
-
-    @_builtins.property
-    @pulumi.getter(name="noProxy")
-    def no_proxy(self) -> Optional[_builtins.str]:
-        """
-        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-        that should be excluded from proxying. IP and domain names can
-        contain port numbers.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "no_proxy")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyConnectHeader")
-    def proxy_connect_header(self) -> Optional[Mapping[str, Sequence['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeader']]]:
-        """
-        proxyConnectHeader optionally specifies headers to send to
-        proxies during CONNECT requests.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_connect_header")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyFromEnvironment")
-    def proxy_from_environment(self) -> Optional[_builtins.bool]:
-        """
-        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_from_environment")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyUrl")
-    def proxy_url(self) -> Optional[_builtins.str]:
-        """
-        proxyUrl defines the HTTP proxy server to use.
-        """
-        return pulumi.get(self, "proxy_url")
-
-    @_builtins.property
-    @pulumi.getter
-    def scopes(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        scopes defines the OAuth2 scopes used for the token request.
-        """
-        return pulumi.get(self, "scopes")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsConfig")
-    def tls_config(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfig']:
-        return pulumi.get(self, "tls_config")
-
-    @_builtins.property
-    @pulumi.getter(name="tokenUrl")
-    def token_url(self) -> Optional[_builtins.str]:
-        """
-        tokenUrl defines the URL to fetch the token from.
-        """
-        return pulumi.get(self, "token_url")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientId(dict):
-    """
-    clientId defines a key of a Secret or ConfigMap containing the
-    OAuth2 client's ID.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsOauth2ClientId. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2ClientId.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2ClientId.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMap'] = None,
-                 secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecret'] = None):
-        """
-        clientId defines a key of a Secret or ConfigMap containing the
-        OAuth2 client's ID.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMap']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecret']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMap(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatch(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatch(dict):
-    """
-    clientId defines a key of a Secret or ConfigMap containing the
-    OAuth2 client's ID.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatch'] = None,
-                 secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatch'] = None):
-        """
-        clientId defines a key of a Secret or ConfigMap containing the
-        OAuth2 client's ID.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatch']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatch']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecret(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatch(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientSecret(dict):
-    """
-    clientSecret defines a key of a Secret containing the OAuth2
-    client's secret.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        clientSecret defines a key of a Secret containing the OAuth2
-        client's secret.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatch(dict):
-    """
-    clientSecret defines a key of a Secret containing the OAuth2
-    client's secret.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        clientSecret defines a key of a Secret containing the OAuth2
-        client's secret.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2Patch(dict):
-    """
-    oauth2 defines the OAuth2 settings used by the client.
-
-    It requires Prometheus >= 2.27.0.
-
-    Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clientId":
-            suggest = "client_id"
-        elif key == "clientSecret":
-            suggest = "client_secret"
-        elif key == "endpointParams":
-            suggest = "endpoint_params"
-        elif key == "noProxy":
-            suggest = "no_proxy"
-        elif key == "proxyConnectHeader":
-            suggest = "proxy_connect_header"
-        elif key == "proxyFromEnvironment":
-            suggest = "proxy_from_environment"
-        elif key == "proxyUrl":
-            suggest = "proxy_url"
-        elif key == "tlsConfig":
-            suggest = "tls_config"
-        elif key == "tokenUrl":
-            suggest = "token_url"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsOauth2Patch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2Patch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2Patch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 client_id: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatch'] = None,
-                 client_secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatch'] = None,
-                 endpoint_params: Optional[Mapping[str, _builtins.str]] = None,
-                 no_proxy: Optional[_builtins.str] = None,
-                 proxy_connect_header: Optional[Mapping[str, Sequence['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeader']]] = None,
-                 proxy_from_environment: Optional[_builtins.bool] = None,
-                 proxy_url: Optional[_builtins.str] = None,
-                 scopes: Optional[Sequence[_builtins.str]] = None,
-                 tls_config: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatch'] = None,
-                 token_url: Optional[_builtins.str] = None):
-        """
-        oauth2 defines the OAuth2 settings used by the client.
-
-        It requires Prometheus >= 2.27.0.
-
-        Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
-
-        :param Mapping[str, _builtins.str] endpoint_params: endpointParams configures the HTTP parameters to append to the token
-               URL.
-        :param _builtins.str no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-               that should be excluded from proxying. IP and domain names can
-               contain port numbers.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param Mapping[str, Sequence['PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs']] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
-               proxies during CONNECT requests.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param _builtins.bool proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param _builtins.str proxy_url: proxyUrl defines the HTTP proxy server to use.
-        :param Sequence[_builtins.str] scopes: scopes defines the OAuth2 scopes used for the token request.
-        :param _builtins.str token_url: tokenUrl defines the URL to fetch the token from.
-        """
-        if client_id is not None:
-            pulumi.set(__self__, "client_id", client_id)
-        if client_secret is not None:
-            pulumi.set(__self__, "client_secret", client_secret)
-        if endpoint_params is not None:
-            pulumi.set(__self__, "endpoint_params", endpoint_params)
-        if no_proxy is not None:
-            pulumi.set(__self__, "no_proxy", no_proxy)
-        if proxy_connect_header is not None:
-            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
-        if proxy_from_environment is not None:
-            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
-        if proxy_url is not None:
-            pulumi.set(__self__, "proxy_url", proxy_url)
-        if scopes is not None:
-            pulumi.set(__self__, "scopes", scopes)
-        if tls_config is not None:
-            pulumi.set(__self__, "tls_config", tls_config)
-        if token_url is not None:
-            pulumi.set(__self__, "token_url", token_url)
-
-    @_builtins.property
-    @pulumi.getter(name="clientId")
-    def client_id(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatch']:
-        return pulumi.get(self, "client_id")
-
-    @_builtins.property
-    @pulumi.getter(name="clientSecret")
-    def client_secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatch']:
-        return pulumi.get(self, "client_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="endpointParams")
-    def endpoint_params(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        endpointParams configures the HTTP parameters to append to the token
-        URL.
-        """
-        return pulumi.get(self, "endpoint_params")
-
-    @_builtins.property
-    @pulumi.getter(name="noProxy")
-    def no_proxy(self) -> Optional[_builtins.str]:
-        """
-        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-        that should be excluded from proxying. IP and domain names can
-        contain port numbers.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "no_proxy")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyConnectHeader")
-    def proxy_connect_header(self) -> Optional[Mapping[str, Sequence['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeader']]]:
-        """
-        proxyConnectHeader optionally specifies headers to send to
-        proxies during CONNECT requests.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_connect_header")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyFromEnvironment")
-    def proxy_from_environment(self) -> Optional[_builtins.bool]:
-        """
-        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_from_environment")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyUrl")
-    def proxy_url(self) -> Optional[_builtins.str]:
-        """
-        proxyUrl defines the HTTP proxy server to use.
-        """
-        return pulumi.get(self, "proxy_url")
-
-    @_builtins.property
-    @pulumi.getter
-    def scopes(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        scopes defines the OAuth2 scopes used for the token request.
-        """
-        return pulumi.get(self, "scopes")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsConfig")
-    def tls_config(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatch']:
-        return pulumi.get(self, "tls_config")
-
-    @_builtins.property
-    @pulumi.getter(name="tokenUrl")
-    def token_url(self) -> Optional[_builtins.str]:
-        """
-        tokenUrl defines the URL to fetch the token from.
-        """
-        return pulumi.get(self, "token_url")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeader(dict):
-    """
-    SecretKeySelector selects a key of a Secret.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        SecretKeySelector selects a key of a Secret.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfig(dict):
-    """
-    tlsConfig defines the TLS configuration to use when connecting to the OAuth2 server.
-    It requires Prometheus >= v2.43.0.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "insecureSkipVerify":
-            suggest = "insecure_skip_verify"
-        elif key == "keySecret":
-            suggest = "key_secret"
-        elif key == "maxVersion":
-            suggest = "max_version"
-        elif key == "minVersion":
-            suggest = "min_version"
-        elif key == "serverName":
-            suggest = "server_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsOauth2TlsConfig. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2TlsConfig.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2TlsConfig.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 ca: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCa'] = None,
-                 cert: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCert'] = None,
-                 insecure_skip_verify: Optional[_builtins.bool] = None,
-                 key_secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecret'] = None,
-                 max_version: Optional[_builtins.str] = None,
-                 min_version: Optional[_builtins.str] = None,
-                 server_name: Optional[_builtins.str] = None):
-        """
-        tlsConfig defines the TLS configuration to use when connecting to the OAuth2 server.
-        It requires Prometheus >= v2.43.0.
-
-        :param _builtins.bool insecure_skip_verify: insecureSkipVerify defines how to disable target certificate validation.
-        :param _builtins.str max_version: maxVersion defines the maximum acceptable TLS version.
-
-               It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        :param _builtins.str min_version: minVersion defines the minimum acceptable TLS version.
-
-               It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        :param _builtins.str server_name: serverName is used to verify the hostname for the targets.
-        """
-        if ca is not None:
-            pulumi.set(__self__, "ca", ca)
-        if cert is not None:
-            pulumi.set(__self__, "cert", cert)
-        if insecure_skip_verify is not None:
-            pulumi.set(__self__, "insecure_skip_verify", insecure_skip_verify)
-        if key_secret is not None:
-            pulumi.set(__self__, "key_secret", key_secret)
-        if max_version is not None:
-            pulumi.set(__self__, "max_version", max_version)
-        if min_version is not None:
-            pulumi.set(__self__, "min_version", min_version)
-        if server_name is not None:
-            pulumi.set(__self__, "server_name", server_name)
-
-    @_builtins.property
-    @pulumi.getter
-    def ca(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCa']:
-        return pulumi.get(self, "ca")
-
-    @_builtins.property
-    @pulumi.getter
-    def cert(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCert']:
-        return pulumi.get(self, "cert")
-
-    @_builtins.property
-    @pulumi.getter(name="insecureSkipVerify")
-    def insecure_skip_verify(self) -> Optional[_builtins.bool]:
-        """
-        insecureSkipVerify defines how to disable target certificate validation.
-        """
-        return pulumi.get(self, "insecure_skip_verify")
-
-    @_builtins.property
-    @pulumi.getter(name="keySecret")
-    def key_secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecret']:
-        return pulumi.get(self, "key_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="maxVersion")
-    def max_version(self) -> Optional[_builtins.str]:
-        """
-        maxVersion defines the maximum acceptable TLS version.
-
-        It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        """
-        return pulumi.get(self, "max_version")
-
-    @_builtins.property
-    @pulumi.getter(name="minVersion")
-    def min_version(self) -> Optional[_builtins.str]:
-        """
-        minVersion defines the minimum acceptable TLS version.
-
-        It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        """
-        return pulumi.get(self, "min_version")
-
-    @_builtins.property
-    @pulumi.getter(name="serverName")
-    def server_name(self) -> Optional[_builtins.str]:
-        """
-        serverName is used to verify the hostname for the targets.
-        """
-        return pulumi.get(self, "server_name")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCa(dict):
-    """
-    ca defines the Certificate authority used when verifying server certificates.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCa. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCa.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCa.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMap'] = None,
-                 secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecret'] = None):
-        """
-        ca defines the Certificate authority used when verifying server certificates.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMap']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecret']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMap(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatch(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatch(dict):
-    """
-    ca defines the Certificate authority used when verifying server certificates.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatch'] = None,
-                 secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatch'] = None):
-        """
-        ca defines the Certificate authority used when verifying server certificates.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatch']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatch']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecret(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatch(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCert(dict):
-    """
-    cert defines the Client certificate to present when doing client-authentication.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCert. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCert.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCert.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMap'] = None,
-                 secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecret'] = None):
-        """
-        cert defines the Client certificate to present when doing client-authentication.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMap']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecret']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMap(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatch(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatch(dict):
-    """
-    cert defines the Client certificate to present when doing client-authentication.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatch'] = None,
-                 secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatch'] = None):
-        """
-        cert defines the Client certificate to present when doing client-authentication.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatch']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatch']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecret(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatch(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecret(dict):
-    """
-    keySecret defines the Secret containing the client key file for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        keySecret defines the Secret containing the client key file for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatch(dict):
-    """
-    keySecret defines the Secret containing the client key file for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        keySecret defines the Secret containing the client key file for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatch(dict):
-    """
-    tlsConfig defines the TLS configuration to use when connecting to the OAuth2 server.
-    It requires Prometheus >= v2.43.0.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "insecureSkipVerify":
-            suggest = "insecure_skip_verify"
-        elif key == "keySecret":
-            suggest = "key_secret"
-        elif key == "maxVersion":
-            suggest = "max_version"
-        elif key == "minVersion":
-            suggest = "min_version"
-        elif key == "serverName":
-            suggest = "server_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 ca: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatch'] = None,
-                 cert: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatch'] = None,
-                 insecure_skip_verify: Optional[_builtins.bool] = None,
-                 key_secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatch'] = None,
-                 max_version: Optional[_builtins.str] = None,
-                 min_version: Optional[_builtins.str] = None,
-                 server_name: Optional[_builtins.str] = None):
-        """
-        tlsConfig defines the TLS configuration to use when connecting to the OAuth2 server.
-        It requires Prometheus >= v2.43.0.
-
-        :param _builtins.bool insecure_skip_verify: insecureSkipVerify defines how to disable target certificate validation.
-        :param _builtins.str max_version: maxVersion defines the maximum acceptable TLS version.
-
-               It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        :param _builtins.str min_version: minVersion defines the minimum acceptable TLS version.
-
-               It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        :param _builtins.str server_name: serverName is used to verify the hostname for the targets.
-        """
-        if ca is not None:
-            pulumi.set(__self__, "ca", ca)
-        if cert is not None:
-            pulumi.set(__self__, "cert", cert)
-        if insecure_skip_verify is not None:
-            pulumi.set(__self__, "insecure_skip_verify", insecure_skip_verify)
-        if key_secret is not None:
-            pulumi.set(__self__, "key_secret", key_secret)
-        if max_version is not None:
-            pulumi.set(__self__, "max_version", max_version)
-        if min_version is not None:
-            pulumi.set(__self__, "min_version", min_version)
-        if server_name is not None:
-            pulumi.set(__self__, "server_name", server_name)
-
-    @_builtins.property
-    @pulumi.getter
-    def ca(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatch']:
-        return pulumi.get(self, "ca")
-
-    @_builtins.property
-    @pulumi.getter
-    def cert(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatch']:
-        return pulumi.get(self, "cert")
-
-    @_builtins.property
-    @pulumi.getter(name="insecureSkipVerify")
-    def insecure_skip_verify(self) -> Optional[_builtins.bool]:
-        """
-        insecureSkipVerify defines how to disable target certificate validation.
-        """
-        return pulumi.get(self, "insecure_skip_verify")
-
-    @_builtins.property
-    @pulumi.getter(name="keySecret")
-    def key_secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatch']:
-        return pulumi.get(self, "key_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="maxVersion")
-    def max_version(self) -> Optional[_builtins.str]:
-        """
-        maxVersion defines the maximum acceptable TLS version.
-
-        It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        """
-        return pulumi.get(self, "max_version")
-
-    @_builtins.property
-    @pulumi.getter(name="minVersion")
-    def min_version(self) -> Optional[_builtins.str]:
-        """
-        minVersion defines the minimum acceptable TLS version.
-
-        It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        """
-        return pulumi.get(self, "min_version")
-
-    @_builtins.property
-    @pulumi.getter(name="serverName")
-    def server_name(self) -> Optional[_builtins.str]:
-        """
-        serverName is used to verify the hostname for the targets.
-        """
-        return pulumi.get(self, "server_name")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsPatch(dict):
-    """
-    PodMetricsEndpoint defines an endpoint serving Prometheus metrics to be scraped by
-    Prometheus.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "basicAuth":
-            suggest = "basic_auth"
-        elif key == "bearerTokenSecret":
-            suggest = "bearer_token_secret"
-        elif key == "enableHttp2":
-            suggest = "enable_http2"
-        elif key == "filterRunning":
-            suggest = "filter_running"
-        elif key == "followRedirects":
-            suggest = "follow_redirects"
-        elif key == "honorLabels":
-            suggest = "honor_labels"
-        elif key == "honorTimestamps":
-            suggest = "honor_timestamps"
-        elif key == "metricRelabelings":
-            suggest = "metric_relabelings"
-        elif key == "noProxy":
-            suggest = "no_proxy"
-        elif key == "portNumber":
-            suggest = "port_number"
-        elif key == "proxyConnectHeader":
-            suggest = "proxy_connect_header"
-        elif key == "proxyFromEnvironment":
-            suggest = "proxy_from_environment"
-        elif key == "proxyUrl":
-            suggest = "proxy_url"
-        elif key == "scrapeTimeout":
-            suggest = "scrape_timeout"
-        elif key == "targetPort":
-            suggest = "target_port"
-        elif key == "tlsConfig":
-            suggest = "tls_config"
-        elif key == "trackTimestampsStaleness":
-            suggest = "track_timestamps_staleness"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 authorization: Optional['outputs.PodMonitorSpecPodMetricsEndpointsAuthorizationPatch'] = None,
-                 basic_auth: Optional['outputs.PodMonitorSpecPodMetricsEndpointsBasicAuthPatch'] = None,
-                 bearer_token_secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatch'] = None,
-                 enable_http2: Optional[_builtins.bool] = None,
-                 filter_running: Optional[_builtins.bool] = None,
-                 follow_redirects: Optional[_builtins.bool] = None,
-                 honor_labels: Optional[_builtins.bool] = None,
-                 honor_timestamps: Optional[_builtins.bool] = None,
-                 interval: Optional[_builtins.str] = None,
-                 metric_relabelings: Optional[Sequence['outputs.PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatch']] = None,
-                 no_proxy: Optional[_builtins.str] = None,
-                 oauth2: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2Patch'] = None,
-                 params: Optional[Mapping[str, Sequence[_builtins.str]]] = None,
-                 path: Optional[_builtins.str] = None,
-                 port: Optional[_builtins.str] = None,
-                 port_number: Optional[_builtins.int] = None,
-                 proxy_connect_header: Optional[Mapping[str, Sequence['outputs.PodMonitorSpecPodMetricsEndpointsProxyConnectHeader']]] = None,
-                 proxy_from_environment: Optional[_builtins.bool] = None,
-                 proxy_url: Optional[_builtins.str] = None,
-                 relabelings: Optional[Sequence['outputs.PodMonitorSpecPodMetricsEndpointsRelabelingsPatch']] = None,
-                 scheme: Optional[_builtins.str] = None,
-                 scrape_timeout: Optional[_builtins.str] = None,
-                 target_port: Optional[Any] = None,
-                 tls_config: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigPatch'] = None,
-                 track_timestamps_staleness: Optional[_builtins.bool] = None):
-        """
-        PodMetricsEndpoint defines an endpoint serving Prometheus metrics to be scraped by
-        Prometheus.
-
-        :param _builtins.bool enable_http2: enableHttp2 can be used to disable HTTP2.
-        :param _builtins.bool filter_running: filterRunning when true, the pods which are not running (e.g. either in Failed or
-               Succeeded state) are dropped during the target discovery.
-
-               If unset, the filtering is enabled.
-
-               More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-        :param _builtins.bool follow_redirects: followRedirects defines whether the client should follow HTTP 3xx
-               redirects.
-        :param _builtins.bool honor_labels: honorLabels when true preserves the metric's labels when they collide
-               with the target's labels.
-        :param _builtins.bool honor_timestamps: honorTimestamps defines whether Prometheus preserves the timestamps
-               when exposed by the target.
-        :param _builtins.str interval: interval at which Prometheus scrapes the metrics from the target.
-
-               If empty, Prometheus uses the global scrape interval.
-        :param Sequence['PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatchArgs'] metric_relabelings: metricRelabelings defines the relabeling rules to apply to the
-               samples before ingestion.
-        :param _builtins.str no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-               that should be excluded from proxying. IP and domain names can
-               contain port numbers.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param Mapping[str, Sequence[_builtins.str]] params: params define optional HTTP URL parameters.
-        :param _builtins.str path: path defines the HTTP path from which to scrape for metrics.
-
-               If empty, Prometheus uses the default value (e.g. `/metrics`).
-        :param _builtins.str port: port defines the `Pod` port name which exposes the endpoint.
-
-               If the pod doesn't expose a port with the same name, it will result
-               in no targets being discovered.
-
-               If a `Pod` has multiple `Port`s with the same name (which is not
-               recommended), one target instance per unique port number will be
-               generated.
-
-               It takes precedence over the `portNumber` and `targetPort` fields.
-        :param _builtins.int port_number: portNumber defines the `Pod` port number which exposes the endpoint.
-
-               The `Pod` must declare the specified `Port` in its spec or the
-               target will be dropped by Prometheus.
-
-               This cannot be used to enable scraping of an undeclared port.
-               To scrape targets on a port which isn't exposed, you need to use
-               relabeling to override the `__address__` label (but beware of
-               duplicate targets if the `Pod` has other declared ports).
-
-               In practice Prometheus will select targets for which the
-               matches the target's __meta_kubernetes_pod_container_port_number.
-        :param Mapping[str, Sequence['PodMonitorSpecPodMetricsEndpointsProxyConnectHeaderArgs']] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
-               proxies during CONNECT requests.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param _builtins.bool proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param _builtins.str proxy_url: proxyUrl defines the HTTP proxy server to use.
-        :param Sequence['PodMonitorSpecPodMetricsEndpointsRelabelingsPatchArgs'] relabelings: relabelings defines the relabeling rules to apply the target's
-               metadata labels.
-
-               The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-               The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-               More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-        :param _builtins.str scheme: scheme defines the HTTP scheme to use for scraping.
-        :param _builtins.str scrape_timeout: scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-               If empty, Prometheus uses the global scrape timeout unless it is less
-               than the target's scrape interval value in which the latter is used.
-               The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-        :param Union[_builtins.int, _builtins.str] target_port: targetPort defines the name or number of the target port of the `Pod` object behind the Service, the
-               port must be specified with container port property.
-
-               Deprecated: use 'port' or 'portNumber' instead.
-        :param _builtins.bool track_timestamps_staleness: trackTimestampsStaleness defines whether Prometheus tracks staleness of
-               the metrics that have an explicit timestamp present in scraped data.
-               Has no effect if `honorTimestamps` is false.
-
-               It requires Prometheus >= v2.48.0.
-        """
-        if authorization is not None:
-            pulumi.set(__self__, "authorization", authorization)
-        if basic_auth is not None:
-            pulumi.set(__self__, "basic_auth", basic_auth)
-        if bearer_token_secret is not None:
-            pulumi.set(__self__, "bearer_token_secret", bearer_token_secret)
-        if enable_http2 is not None:
-            pulumi.set(__self__, "enable_http2", enable_http2)
-        if filter_running is not None:
-            pulumi.set(__self__, "filter_running", filter_running)
-        if follow_redirects is not None:
-            pulumi.set(__self__, "follow_redirects", follow_redirects)
-        if honor_labels is not None:
-            pulumi.set(__self__, "honor_labels", honor_labels)
-        if honor_timestamps is not None:
-            pulumi.set(__self__, "honor_timestamps", honor_timestamps)
-        if interval is not None:
-            pulumi.set(__self__, "interval", interval)
-        if metric_relabelings is not None:
-            pulumi.set(__self__, "metric_relabelings", metric_relabelings)
-        if no_proxy is not None:
-            pulumi.set(__self__, "no_proxy", no_proxy)
-        if oauth2 is not None:
-            pulumi.set(__self__, "oauth2", oauth2)
-        if params is not None:
-            pulumi.set(__self__, "params", params)
-        if path is not None:
-            pulumi.set(__self__, "path", path)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if port_number is not None:
-            pulumi.set(__self__, "port_number", port_number)
-        if proxy_connect_header is not None:
-            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
-        if proxy_from_environment is not None:
-            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
-        if proxy_url is not None:
-            pulumi.set(__self__, "proxy_url", proxy_url)
-        if relabelings is not None:
-            pulumi.set(__self__, "relabelings", relabelings)
-        if scheme is not None:
-            pulumi.set(__self__, "scheme", scheme)
-        if scrape_timeout is not None:
-            pulumi.set(__self__, "scrape_timeout", scrape_timeout)
-        if target_port is not None:
-            pulumi.set(__self__, "target_port", target_port)
-        if tls_config is not None:
-            pulumi.set(__self__, "tls_config", tls_config)
-        if track_timestamps_staleness is not None:
-            pulumi.set(__self__, "track_timestamps_staleness", track_timestamps_staleness)
-
-    @_builtins.property
-    @pulumi.getter
-    def authorization(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsAuthorizationPatch']:
-        return pulumi.get(self, "authorization")
-
-    @_builtins.property
-    @pulumi.getter(name="basicAuth")
-    def basic_auth(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsBasicAuthPatch']:
-        return pulumi.get(self, "basic_auth")
-
-    @_builtins.property
-    @pulumi.getter(name="bearerTokenSecret")
-    def bearer_token_secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatch']:
-        return pulumi.get(self, "bearer_token_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="enableHttp2")
-    def enable_http2(self) -> Optional[_builtins.bool]:
-        """
-        enableHttp2 can be used to disable HTTP2.
-        """
-        return pulumi.get(self, "enable_http2")
-
-    @_builtins.property
-    @pulumi.getter(name="filterRunning")
-    def filter_running(self) -> Optional[_builtins.bool]:
-        """
-        filterRunning when true, the pods which are not running (e.g. either in Failed or
-        Succeeded state) are dropped during the target discovery.
-
-        If unset, the filtering is enabled.
-
-        More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-        """
-        return pulumi.get(self, "filter_running")
-
-    @_builtins.property
-    @pulumi.getter(name="followRedirects")
-    def follow_redirects(self) -> Optional[_builtins.bool]:
-        """
-        followRedirects defines whether the client should follow HTTP 3xx
-        redirects.
-        """
-        return pulumi.get(self, "follow_redirects")
-
-    @_builtins.property
-    @pulumi.getter(name="honorLabels")
-    def honor_labels(self) -> Optional[_builtins.bool]:
-        """
-        honorLabels when true preserves the metric's labels when they collide
-        with the target's labels.
-        """
-        return pulumi.get(self, "honor_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="honorTimestamps")
-    def honor_timestamps(self) -> Optional[_builtins.bool]:
-        """
-        honorTimestamps defines whether Prometheus preserves the timestamps
-        when exposed by the target.
-        """
-        return pulumi.get(self, "honor_timestamps")
-
-    @_builtins.property
-    @pulumi.getter
-    def interval(self) -> Optional[_builtins.str]:
-        """
-        interval at which Prometheus scrapes the metrics from the target.
-
-        If empty, Prometheus uses the global scrape interval.
-        """
-        return pulumi.get(self, "interval")
-
-    @_builtins.property
-    @pulumi.getter(name="metricRelabelings")
-    def metric_relabelings(self) -> Optional[Sequence['outputs.PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatch']]:
-        """
-        metricRelabelings defines the relabeling rules to apply to the
-        samples before ingestion.
-        """
-        return pulumi.get(self, "metric_relabelings")
-
-    @_builtins.property
-    @pulumi.getter(name="noProxy")
-    def no_proxy(self) -> Optional[_builtins.str]:
-        """
-        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-        that should be excluded from proxying. IP and domain names can
-        contain port numbers.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "no_proxy")
-
-    @_builtins.property
-    @pulumi.getter
-    def oauth2(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2Patch']:
-        return pulumi.get(self, "oauth2")
-
-    @_builtins.property
-    @pulumi.getter
-    def params(self) -> Optional[Mapping[str, Sequence[_builtins.str]]]:
-        """
-        params define optional HTTP URL parameters.
-        """
-        return pulumi.get(self, "params")
-
-    @_builtins.property
-    @pulumi.getter
-    def path(self) -> Optional[_builtins.str]:
-        """
-        path defines the HTTP path from which to scrape for metrics.
-
-        If empty, Prometheus uses the default value (e.g. `/metrics`).
-        """
-        return pulumi.get(self, "path")
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> Optional[_builtins.str]:
-        """
-        port defines the `Pod` port name which exposes the endpoint.
-
-        If the pod doesn't expose a port with the same name, it will result
-        in no targets being discovered.
-
-        If a `Pod` has multiple `Port`s with the same name (which is not
-        recommended), one target instance per unique port number will be
-        generated.
-
-        It takes precedence over the `portNumber` and `targetPort` fields.
-        """
-        return pulumi.get(self, "port")
-
-    @_builtins.property
-    @pulumi.getter(name="portNumber")
-    def port_number(self) -> Optional[_builtins.int]:
-        """
-        portNumber defines the `Pod` port number which exposes the endpoint.
-
-        The `Pod` must declare the specified `Port` in its spec or the
-        target will be dropped by Prometheus.
-
-        This cannot be used to enable scraping of an undeclared port.
-        To scrape targets on a port which isn't exposed, you need to use
-        relabeling to override the `__address__` label (but beware of
-        duplicate targets if the `Pod` has other declared ports).
-
-        In practice Prometheus will select targets for which the
-        matches the target's __meta_kubernetes_pod_container_port_number.
-        """
-        return pulumi.get(self, "port_number")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyConnectHeader")
-    def proxy_connect_header(self) -> Optional[Mapping[str, Sequence['outputs.PodMonitorSpecPodMetricsEndpointsProxyConnectHeader']]]:
-        """
-        proxyConnectHeader optionally specifies headers to send to
-        proxies during CONNECT requests.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_connect_header")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyFromEnvironment")
-    def proxy_from_environment(self) -> Optional[_builtins.bool]:
-        """
-        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_from_environment")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyUrl")
-    def proxy_url(self) -> Optional[_builtins.str]:
-        """
-        proxyUrl defines the HTTP proxy server to use.
-        """
-        return pulumi.get(self, "proxy_url")
-
-    @_builtins.property
-    @pulumi.getter
-    def relabelings(self) -> Optional[Sequence['outputs.PodMonitorSpecPodMetricsEndpointsRelabelingsPatch']]:
-        """
-        relabelings defines the relabeling rules to apply the target's
-        metadata labels.
-
-        The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-        The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-        """
-        return pulumi.get(self, "relabelings")
-
-    @_builtins.property
-    @pulumi.getter
-    def scheme(self) -> Optional[_builtins.str]:
-        """
-        scheme defines the HTTP scheme to use for scraping.
-        """
-        return pulumi.get(self, "scheme")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeTimeout")
-    def scrape_timeout(self) -> Optional[_builtins.str]:
-        """
-        scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-        If empty, Prometheus uses the global scrape timeout unless it is less
-        than the target's scrape interval value in which the latter is used.
-        The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-        """
-        return pulumi.get(self, "scrape_timeout")
-
-    @_builtins.property
-    @pulumi.getter(name="targetPort")
-    def target_port(self) -> Optional[Any]:
-        """
-        targetPort defines the name or number of the target port of the `Pod` object behind the Service, the
-        port must be specified with container port property.
-
-        Deprecated: use 'port' or 'portNumber' instead.
-        """
-        return pulumi.get(self, "target_port")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsConfig")
-    def tls_config(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigPatch']:
-        return pulumi.get(self, "tls_config")
-
-    @_builtins.property
-    @pulumi.getter(name="trackTimestampsStaleness")
-    def track_timestamps_staleness(self) -> Optional[_builtins.bool]:
-        """
-        trackTimestampsStaleness defines whether Prometheus tracks staleness of
-        the metrics that have an explicit timestamp present in scraped data.
-        Has no effect if `honorTimestamps` is false.
-
-        It requires Prometheus >= v2.48.0.
-        """
-        return pulumi.get(self, "track_timestamps_staleness")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsProxyConnectHeader(dict):
-    """
-    SecretKeySelector selects a key of a Secret.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        SecretKeySelector selects a key of a Secret.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsRelabelings(dict):
-    """
-    RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-    scraped samples and remote write samples.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "sourceLabels":
-            suggest = "source_labels"
-        elif key == "targetLabel":
-            suggest = "target_label"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsRelabelings. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsRelabelings.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsRelabelings.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 action: Optional[_builtins.str] = None,
-                 modulus: Optional[_builtins.int] = None,
-                 regex: Optional[_builtins.str] = None,
-                 replacement: Optional[_builtins.str] = None,
-                 separator: Optional[_builtins.str] = None,
-                 source_labels: Optional[Sequence[_builtins.str]] = None,
-                 target_label: Optional[_builtins.str] = None):
-        """
-        RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-        scraped samples and remote write samples.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-
-        :param _builtins.str action: action to perform based on the regex matching.
-
-               `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-               `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-               Default: "Replace"
-        :param _builtins.int modulus: modulus to take of the hash of the source label values.
-
-               Only applicable when the action is `HashMod`.
-        :param _builtins.str regex: regex defines the regular expression against which the extracted value is matched.
-        :param _builtins.str replacement: replacement value against which a Replace action is performed if the
-               regular expression matches.
-
-               Regex capture groups are available.
-        :param _builtins.str separator: separator defines the string between concatenated SourceLabels.
-        :param Sequence[_builtins.str] source_labels: sourceLabels defines the source labels select values from existing labels. Their content is
-               concatenated using the configured Separator and matched against the
-               configured regular expression.
-        :param _builtins.str target_label: targetLabel defines the label to which the resulting string is written in a replacement.
-
-               It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-               `KeepEqual` and `DropEqual` actions.
-
-               Regex capture groups are available.
-        """
-        if action is not None:
-            pulumi.set(__self__, "action", action)
-        if modulus is not None:
-            pulumi.set(__self__, "modulus", modulus)
-        if regex is not None:
-            pulumi.set(__self__, "regex", regex)
-        if replacement is not None:
-            pulumi.set(__self__, "replacement", replacement)
-        if separator is not None:
-            pulumi.set(__self__, "separator", separator)
-        if source_labels is not None:
-            pulumi.set(__self__, "source_labels", source_labels)
-        if target_label is not None:
-            pulumi.set(__self__, "target_label", target_label)
-
-    @_builtins.property
-    @pulumi.getter
-    def action(self) -> Optional[_builtins.str]:
-        """
-        action to perform based on the regex matching.
-
-        `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-        `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-        Default: "Replace"
-        """
-        return pulumi.get(self, "action")
-
-    @_builtins.property
-    @pulumi.getter
-    def modulus(self) -> Optional[_builtins.int]:
-        """
-        modulus to take of the hash of the source label values.
-
-        Only applicable when the action is `HashMod`.
-        """
-        return pulumi.get(self, "modulus")
-
-    @_builtins.property
-    @pulumi.getter
-    def regex(self) -> Optional[_builtins.str]:
-        """
-        regex defines the regular expression against which the extracted value is matched.
-        """
-        return pulumi.get(self, "regex")
-
-    @_builtins.property
-    @pulumi.getter
-    def replacement(self) -> Optional[_builtins.str]:
-        """
-        replacement value against which a Replace action is performed if the
-        regular expression matches.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "replacement")
-
-    @_builtins.property
-    @pulumi.getter
-    def separator(self) -> Optional[_builtins.str]:
-        """
-        separator defines the string between concatenated SourceLabels.
-        """
-        return pulumi.get(self, "separator")
-
-    @_builtins.property
-    @pulumi.getter(name="sourceLabels")
-    def source_labels(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        sourceLabels defines the source labels select values from existing labels. Their content is
-        concatenated using the configured Separator and matched against the
-        configured regular expression.
-        """
-        return pulumi.get(self, "source_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabel")
-    def target_label(self) -> Optional[_builtins.str]:
-        """
-        targetLabel defines the label to which the resulting string is written in a replacement.
-
-        It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-        `KeepEqual` and `DropEqual` actions.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "target_label")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsRelabelingsPatch(dict):
-    """
-    RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-    scraped samples and remote write samples.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "sourceLabels":
-            suggest = "source_labels"
-        elif key == "targetLabel":
-            suggest = "target_label"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsRelabelingsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsRelabelingsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsRelabelingsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 action: Optional[_builtins.str] = None,
-                 modulus: Optional[_builtins.int] = None,
-                 regex: Optional[_builtins.str] = None,
-                 replacement: Optional[_builtins.str] = None,
-                 separator: Optional[_builtins.str] = None,
-                 source_labels: Optional[Sequence[_builtins.str]] = None,
-                 target_label: Optional[_builtins.str] = None):
-        """
-        RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-        scraped samples and remote write samples.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-
-        :param _builtins.str action: action to perform based on the regex matching.
-
-               `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-               `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-               Default: "Replace"
-        :param _builtins.int modulus: modulus to take of the hash of the source label values.
-
-               Only applicable when the action is `HashMod`.
-        :param _builtins.str regex: regex defines the regular expression against which the extracted value is matched.
-        :param _builtins.str replacement: replacement value against which a Replace action is performed if the
-               regular expression matches.
-
-               Regex capture groups are available.
-        :param _builtins.str separator: separator defines the string between concatenated SourceLabels.
-        :param Sequence[_builtins.str] source_labels: sourceLabels defines the source labels select values from existing labels. Their content is
-               concatenated using the configured Separator and matched against the
-               configured regular expression.
-        :param _builtins.str target_label: targetLabel defines the label to which the resulting string is written in a replacement.
-
-               It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-               `KeepEqual` and `DropEqual` actions.
-
-               Regex capture groups are available.
-        """
-        if action is not None:
-            pulumi.set(__self__, "action", action)
-        if modulus is not None:
-            pulumi.set(__self__, "modulus", modulus)
-        if regex is not None:
-            pulumi.set(__self__, "regex", regex)
-        if replacement is not None:
-            pulumi.set(__self__, "replacement", replacement)
-        if separator is not None:
-            pulumi.set(__self__, "separator", separator)
-        if source_labels is not None:
-            pulumi.set(__self__, "source_labels", source_labels)
-        if target_label is not None:
-            pulumi.set(__self__, "target_label", target_label)
-
-    @_builtins.property
-    @pulumi.getter
-    def action(self) -> Optional[_builtins.str]:
-        """
-        action to perform based on the regex matching.
-
-        `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-        `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-        Default: "Replace"
-        """
-        return pulumi.get(self, "action")
-
-    @_builtins.property
-    @pulumi.getter
-    def modulus(self) -> Optional[_builtins.int]:
-        """
-        modulus to take of the hash of the source label values.
-
-        Only applicable when the action is `HashMod`.
-        """
-        return pulumi.get(self, "modulus")
-
-    @_builtins.property
-    @pulumi.getter
-    def regex(self) -> Optional[_builtins.str]:
-        """
-        regex defines the regular expression against which the extracted value is matched.
-        """
-        return pulumi.get(self, "regex")
-
-    @_builtins.property
-    @pulumi.getter
-    def replacement(self) -> Optional[_builtins.str]:
-        """
-        replacement value against which a Replace action is performed if the
-        regular expression matches.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "replacement")
-
-    @_builtins.property
-    @pulumi.getter
-    def separator(self) -> Optional[_builtins.str]:
-        """
-        separator defines the string between concatenated SourceLabels.
-        """
-        return pulumi.get(self, "separator")
-
-    @_builtins.property
-    @pulumi.getter(name="sourceLabels")
-    def source_labels(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        sourceLabels defines the source labels select values from existing labels. Their content is
-        concatenated using the configured Separator and matched against the
-        configured regular expression.
-        """
-        return pulumi.get(self, "source_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabel")
-    def target_label(self) -> Optional[_builtins.str]:
-        """
-        targetLabel defines the label to which the resulting string is written in a replacement.
-
-        It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-        `KeepEqual` and `DropEqual` actions.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "target_label")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfig(dict):
-    """
-    tlsConfig defines the TLS configuration used by the client.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "insecureSkipVerify":
-            suggest = "insecure_skip_verify"
-        elif key == "keySecret":
-            suggest = "key_secret"
-        elif key == "maxVersion":
-            suggest = "max_version"
-        elif key == "minVersion":
-            suggest = "min_version"
-        elif key == "serverName":
-            suggest = "server_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsTlsConfig. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsTlsConfig.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsTlsConfig.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 ca: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCa'] = None,
-                 cert: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCert'] = None,
-                 insecure_skip_verify: Optional[_builtins.bool] = None,
-                 key_secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecret'] = None,
-                 max_version: Optional[_builtins.str] = None,
-                 min_version: Optional[_builtins.str] = None,
-                 server_name: Optional[_builtins.str] = None):
-        """
-        tlsConfig defines the TLS configuration used by the client.
-
-        :param _builtins.bool insecure_skip_verify: insecureSkipVerify defines how to disable target certificate validation.
-        :param _builtins.str max_version: maxVersion defines the maximum acceptable TLS version.
-
-               It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        :param _builtins.str min_version: minVersion defines the minimum acceptable TLS version.
-
-               It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        :param _builtins.str server_name: serverName is used to verify the hostname for the targets.
-        """
-        if ca is not None:
-            pulumi.set(__self__, "ca", ca)
-        if cert is not None:
-            pulumi.set(__self__, "cert", cert)
-        if insecure_skip_verify is not None:
-            pulumi.set(__self__, "insecure_skip_verify", insecure_skip_verify)
-        if key_secret is not None:
-            pulumi.set(__self__, "key_secret", key_secret)
-        if max_version is not None:
-            pulumi.set(__self__, "max_version", max_version)
-        if min_version is not None:
-            pulumi.set(__self__, "min_version", min_version)
-        if server_name is not None:
-            pulumi.set(__self__, "server_name", server_name)
-
-    @_builtins.property
-    @pulumi.getter
-    def ca(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCa']:
-        return pulumi.get(self, "ca")
-
-    @_builtins.property
-    @pulumi.getter
-    def cert(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCert']:
-        return pulumi.get(self, "cert")
-
-    @_builtins.property
-    @pulumi.getter(name="insecureSkipVerify")
-    def insecure_skip_verify(self) -> Optional[_builtins.bool]:
-        """
-        insecureSkipVerify defines how to disable target certificate validation.
-        """
-        return pulumi.get(self, "insecure_skip_verify")
-
-    @_builtins.property
-    @pulumi.getter(name="keySecret")
-    def key_secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecret']:
-        return pulumi.get(self, "key_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="maxVersion")
-    def max_version(self) -> Optional[_builtins.str]:
-        """
-        maxVersion defines the maximum acceptable TLS version.
-
-        It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        """
-        return pulumi.get(self, "max_version")
-
-    @_builtins.property
-    @pulumi.getter(name="minVersion")
-    def min_version(self) -> Optional[_builtins.str]:
-        """
-        minVersion defines the minimum acceptable TLS version.
-
-        It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        """
-        return pulumi.get(self, "min_version")
-
-    @_builtins.property
-    @pulumi.getter(name="serverName")
-    def server_name(self) -> Optional[_builtins.str]:
-        """
-        serverName is used to verify the hostname for the targets.
-        """
-        return pulumi.get(self, "server_name")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCa(dict):
-    """
-    ca defines the Certificate authority used when verifying server certificates.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsTlsConfigCa. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsTlsConfigCa.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsTlsConfigCa.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMap'] = None,
-                 secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecret'] = None):
-        """
-        ca defines the Certificate authority used when verifying server certificates.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMap']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecret']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMap(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatch(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatch(dict):
-    """
-    ca defines the Certificate authority used when verifying server certificates.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatch'] = None,
-                 secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatch'] = None):
-        """
-        ca defines the Certificate authority used when verifying server certificates.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatch']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatch']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecret(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatch(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCert(dict):
-    """
-    cert defines the Client certificate to present when doing client-authentication.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsTlsConfigCert. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsTlsConfigCert.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsTlsConfigCert.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMap'] = None,
-                 secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecret'] = None):
-        """
-        cert defines the Client certificate to present when doing client-authentication.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMap']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecret']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMap(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatch(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatch(dict):
-    """
-    cert defines the Client certificate to present when doing client-authentication.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatch'] = None,
-                 secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatch'] = None):
-        """
-        cert defines the Client certificate to present when doing client-authentication.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatch']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatch']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecret(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatch(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecret(dict):
-    """
-    keySecret defines the Secret containing the client key file for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        keySecret defines the Secret containing the client key file for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatch(dict):
-    """
-    keySecret defines the Secret containing the client key file for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        keySecret defines the Secret containing the client key file for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class PodMonitorSpecPodMetricsEndpointsTlsConfigPatch(dict):
-    """
-    tlsConfig defines the TLS configuration used by the client.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "insecureSkipVerify":
-            suggest = "insecure_skip_verify"
-        elif key == "keySecret":
-            suggest = "key_secret"
-        elif key == "maxVersion":
-            suggest = "max_version"
-        elif key == "minVersion":
-            suggest = "min_version"
-        elif key == "serverName":
-            suggest = "server_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsTlsConfigPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecPodMetricsEndpointsTlsConfigPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecPodMetricsEndpointsTlsConfigPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 ca: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatch'] = None,
-                 cert: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatch'] = None,
-                 insecure_skip_verify: Optional[_builtins.bool] = None,
-                 key_secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatch'] = None,
-                 max_version: Optional[_builtins.str] = None,
-                 min_version: Optional[_builtins.str] = None,
-                 server_name: Optional[_builtins.str] = None):
-        """
-        tlsConfig defines the TLS configuration used by the client.
-
-        :param _builtins.bool insecure_skip_verify: insecureSkipVerify defines how to disable target certificate validation.
-        :param _builtins.str max_version: maxVersion defines the maximum acceptable TLS version.
-
-               It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        :param _builtins.str min_version: minVersion defines the minimum acceptable TLS version.
-
-               It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        :param _builtins.str server_name: serverName is used to verify the hostname for the targets.
-        """
-        if ca is not None:
-            pulumi.set(__self__, "ca", ca)
-        if cert is not None:
-            pulumi.set(__self__, "cert", cert)
-        if insecure_skip_verify is not None:
-            pulumi.set(__self__, "insecure_skip_verify", insecure_skip_verify)
-        if key_secret is not None:
-            pulumi.set(__self__, "key_secret", key_secret)
-        if max_version is not None:
-            pulumi.set(__self__, "max_version", max_version)
-        if min_version is not None:
-            pulumi.set(__self__, "min_version", min_version)
-        if server_name is not None:
-            pulumi.set(__self__, "server_name", server_name)
-
-    @_builtins.property
-    @pulumi.getter
-    def ca(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatch']:
-        return pulumi.get(self, "ca")
-
-    @_builtins.property
-    @pulumi.getter
-    def cert(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatch']:
-        return pulumi.get(self, "cert")
-
-    @_builtins.property
-    @pulumi.getter(name="insecureSkipVerify")
-    def insecure_skip_verify(self) -> Optional[_builtins.bool]:
-        """
-        insecureSkipVerify defines how to disable target certificate validation.
-        """
-        return pulumi.get(self, "insecure_skip_verify")
-
-    @_builtins.property
-    @pulumi.getter(name="keySecret")
-    def key_secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatch']:
-        return pulumi.get(self, "key_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="maxVersion")
-    def max_version(self) -> Optional[_builtins.str]:
-        """
-        maxVersion defines the maximum acceptable TLS version.
-
-        It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        """
-        return pulumi.get(self, "max_version")
-
-    @_builtins.property
-    @pulumi.getter(name="minVersion")
-    def min_version(self) -> Optional[_builtins.str]:
-        """
-        minVersion defines the minimum acceptable TLS version.
-
-        It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        """
-        return pulumi.get(self, "min_version")
-
-    @_builtins.property
-    @pulumi.getter(name="serverName")
-    def server_name(self) -> Optional[_builtins.str]:
-        """
-        serverName is used to verify the hostname for the targets.
-        """
-        return pulumi.get(self, "server_name")
-
-
-@pulumi.output_type
-class PodMonitorSpecSelector(dict):
-    """
-    selector defines the label selector to select the Kubernetes `Pod` objects to scrape metrics from.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecSelector. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecSelector.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecSelector.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.PodMonitorSpecSelectorMatchExpressions']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        selector defines the label selector to select the Kubernetes `Pod` objects to scrape metrics from.
-
-        :param Sequence['PodMonitorSpecSelectorMatchExpressionsArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.PodMonitorSpecSelectorMatchExpressions']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class PodMonitorSpecSelectorMatchExpressions(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class PodMonitorSpecSelectorMatchExpressionsPatch(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class PodMonitorSpecSelectorPatch(dict):
-    """
-    selector defines the label selector to select the Kubernetes `Pod` objects to scrape metrics from.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecSelectorPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorSpecSelectorPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorSpecSelectorPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.PodMonitorSpecSelectorMatchExpressionsPatch']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        selector defines the label selector to select the Kubernetes `Pod` objects to scrape metrics from.
-
-        :param Sequence['PodMonitorSpecSelectorMatchExpressionsPatchArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.PodMonitorSpecSelectorMatchExpressionsPatch']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class PodMonitorStatus(dict):
-    """
-    status defines the status subresource. It is under active development and is updated only when the
-    "StatusForConfigurationResources" feature gate is enabled.
-
-    Most recent observed status of the PodMonitor. Read-only.
-    More info:
-    https://github.com/kubernetes/community/blob/master/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    def __init__(__self__, *,
-                 bindings: Optional[Sequence['outputs.PodMonitorStatusBindings']] = None):
-        """
-        status defines the status subresource. It is under active development and is updated only when the
-        "StatusForConfigurationResources" feature gate is enabled.
-
-        Most recent observed status of the PodMonitor. Read-only.
-        More info:
-        https://github.com/kubernetes/community/blob/master/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param Sequence['PodMonitorStatusBindingsArgs'] bindings: bindings defines the list of workload resources (Prometheus, PrometheusAgent, ThanosRuler or Alertmanager) which select the configuration resource.
-        """
-        if bindings is not None:
-            pulumi.set(__self__, "bindings", bindings)
-
-    @_builtins.property
-    @pulumi.getter
-    def bindings(self) -> Optional[Sequence['outputs.PodMonitorStatusBindings']]:
-        """
-        bindings defines the list of workload resources (Prometheus, PrometheusAgent, ThanosRuler or Alertmanager) which select the configuration resource.
-        """
-        return pulumi.get(self, "bindings")
-
-
-@pulumi.output_type
-class PodMonitorStatusBindings(dict):
-    """
-    WorkloadBinding is a link between a configuration resource and a workload resource.
-    """
-    def __init__(__self__, *,
-                 conditions: Optional[Sequence['outputs.PodMonitorStatusBindingsConditions']] = None,
-                 group: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 namespace: Optional[_builtins.str] = None,
-                 resource: Optional[_builtins.str] = None):
-        """
-        WorkloadBinding is a link between a configuration resource and a workload resource.
-
-        :param Sequence['PodMonitorStatusBindingsConditionsArgs'] conditions: conditions defines the current state of the configuration resource when bound to the referenced Workload object.
-        :param _builtins.str group: group defines the group of the referenced resource.
-        :param _builtins.str name: name defines the name of the referenced object.
-        :param _builtins.str namespace: namespace defines the namespace of the referenced object.
-        :param _builtins.str resource: resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
-        """
-        if conditions is not None:
-            pulumi.set(__self__, "conditions", conditions)
-        if group is not None:
-            pulumi.set(__self__, "group", group)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if namespace is not None:
-            pulumi.set(__self__, "namespace", namespace)
-        if resource is not None:
-            pulumi.set(__self__, "resource", resource)
-
-    @_builtins.property
-    @pulumi.getter
-    def conditions(self) -> Optional[Sequence['outputs.PodMonitorStatusBindingsConditions']]:
-        """
-        conditions defines the current state of the configuration resource when bound to the referenced Workload object.
-        """
-        return pulumi.get(self, "conditions")
-
-    @_builtins.property
-    @pulumi.getter
-    def group(self) -> Optional[_builtins.str]:
-        """
-        group defines the group of the referenced resource.
-        """
-        return pulumi.get(self, "group")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        name defines the name of the referenced object.
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespace(self) -> Optional[_builtins.str]:
-        """
-        namespace defines the namespace of the referenced object.
-        """
-        return pulumi.get(self, "namespace")
-
-    @_builtins.property
-    @pulumi.getter
-    def resource(self) -> Optional[_builtins.str]:
-        """
-        resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
-        """
-        return pulumi.get(self, "resource")
-
-
-@pulumi.output_type
-class PodMonitorStatusBindingsConditions(dict):
-    """
-    ConfigResourceCondition describes the status of configuration resources linked to Prometheus, PrometheusAgent, Alertmanager or ThanosRuler.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "lastTransitionTime":
-            suggest = "last_transition_time"
-        elif key == "observedGeneration":
-            suggest = "observed_generation"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorStatusBindingsConditions. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorStatusBindingsConditions.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorStatusBindingsConditions.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 last_transition_time: Optional[_builtins.str] = None,
-                 message: Optional[_builtins.str] = None,
-                 observed_generation: Optional[_builtins.int] = None,
-                 reason: Optional[_builtins.str] = None,
-                 status: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        ConfigResourceCondition describes the status of configuration resources linked to Prometheus, PrometheusAgent, Alertmanager or ThanosRuler.
-
-        :param _builtins.str last_transition_time: lastTransitionTime defines the time of the last update to the current status property.
-        :param _builtins.str message: message defines the human-readable message indicating details for the condition's last transition.
-        :param _builtins.int observed_generation: observedGeneration defines the .metadata.generation that the
-               condition was set based upon. For instance, if `.metadata.generation` is
-               currently 12, but the `.status.conditions[].observedGeneration` is 9, the
-               condition is out of date with respect to the current state of the object.
-        :param _builtins.str reason: reason for the condition's last transition.
-        :param _builtins.str status: status of the condition.
-        :param _builtins.str type: type of the condition being reported.
-               Currently, only "Accepted" is supported.
-        """
-        if last_transition_time is not None:
-            pulumi.set(__self__, "last_transition_time", last_transition_time)
-        if message is not None:
-            pulumi.set(__self__, "message", message)
-        if observed_generation is not None:
-            pulumi.set(__self__, "observed_generation", observed_generation)
-        if reason is not None:
-            pulumi.set(__self__, "reason", reason)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="lastTransitionTime")
-    def last_transition_time(self) -> Optional[_builtins.str]:
-        """
-        lastTransitionTime defines the time of the last update to the current status property.
-        """
-        return pulumi.get(self, "last_transition_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def message(self) -> Optional[_builtins.str]:
-        """
-        message defines the human-readable message indicating details for the condition's last transition.
-        """
-        return pulumi.get(self, "message")
-
-    @_builtins.property
-    @pulumi.getter(name="observedGeneration")
-    def observed_generation(self) -> Optional[_builtins.int]:
-        """
-        observedGeneration defines the .metadata.generation that the
-        condition was set based upon. For instance, if `.metadata.generation` is
-        currently 12, but the `.status.conditions[].observedGeneration` is 9, the
-        condition is out of date with respect to the current state of the object.
-        """
-        return pulumi.get(self, "observed_generation")
-
-    @_builtins.property
-    @pulumi.getter
-    def reason(self) -> Optional[_builtins.str]:
-        """
-        reason for the condition's last transition.
-        """
-        return pulumi.get(self, "reason")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional[_builtins.str]:
-        """
-        status of the condition.
-        """
-        return pulumi.get(self, "status")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type of the condition being reported.
-        Currently, only "Accepted" is supported.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class PodMonitorStatusBindingsConditionsPatch(dict):
-    """
-    ConfigResourceCondition describes the status of configuration resources linked to Prometheus, PrometheusAgent, Alertmanager or ThanosRuler.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "lastTransitionTime":
-            suggest = "last_transition_time"
-        elif key == "observedGeneration":
-            suggest = "observed_generation"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in PodMonitorStatusBindingsConditionsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        PodMonitorStatusBindingsConditionsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        PodMonitorStatusBindingsConditionsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 last_transition_time: Optional[_builtins.str] = None,
-                 message: Optional[_builtins.str] = None,
-                 observed_generation: Optional[_builtins.int] = None,
-                 reason: Optional[_builtins.str] = None,
-                 status: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        ConfigResourceCondition describes the status of configuration resources linked to Prometheus, PrometheusAgent, Alertmanager or ThanosRuler.
-
-        :param _builtins.str last_transition_time: lastTransitionTime defines the time of the last update to the current status property.
-        :param _builtins.str message: message defines the human-readable message indicating details for the condition's last transition.
-        :param _builtins.int observed_generation: observedGeneration defines the .metadata.generation that the
-               condition was set based upon. For instance, if `.metadata.generation` is
-               currently 12, but the `.status.conditions[].observedGeneration` is 9, the
-               condition is out of date with respect to the current state of the object.
-        :param _builtins.str reason: reason for the condition's last transition.
-        :param _builtins.str status: status of the condition.
-        :param _builtins.str type: type of the condition being reported.
-               Currently, only "Accepted" is supported.
-        """
-        if last_transition_time is not None:
-            pulumi.set(__self__, "last_transition_time", last_transition_time)
-        if message is not None:
-            pulumi.set(__self__, "message", message)
-        if observed_generation is not None:
-            pulumi.set(__self__, "observed_generation", observed_generation)
-        if reason is not None:
-            pulumi.set(__self__, "reason", reason)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="lastTransitionTime")
-    def last_transition_time(self) -> Optional[_builtins.str]:
-        """
-        lastTransitionTime defines the time of the last update to the current status property.
-        """
-        return pulumi.get(self, "last_transition_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def message(self) -> Optional[_builtins.str]:
-        """
-        message defines the human-readable message indicating details for the condition's last transition.
-        """
-        return pulumi.get(self, "message")
-
-    @_builtins.property
-    @pulumi.getter(name="observedGeneration")
-    def observed_generation(self) -> Optional[_builtins.int]:
-        """
-        observedGeneration defines the .metadata.generation that the
-        condition was set based upon. For instance, if `.metadata.generation` is
-        currently 12, but the `.status.conditions[].observedGeneration` is 9, the
-        condition is out of date with respect to the current state of the object.
-        """
-        return pulumi.get(self, "observed_generation")
-
-    @_builtins.property
-    @pulumi.getter
-    def reason(self) -> Optional[_builtins.str]:
-        """
-        reason for the condition's last transition.
-        """
-        return pulumi.get(self, "reason")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional[_builtins.str]:
-        """
-        status of the condition.
-        """
-        return pulumi.get(self, "status")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type of the condition being reported.
-        Currently, only "Accepted" is supported.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class PodMonitorStatusBindingsPatch(dict):
-    """
-    WorkloadBinding is a link between a configuration resource and a workload resource.
-    """
-    def __init__(__self__, *,
-                 conditions: Optional[Sequence['outputs.PodMonitorStatusBindingsConditionsPatch']] = None,
-                 group: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 namespace: Optional[_builtins.str] = None,
-                 resource: Optional[_builtins.str] = None):
-        """
-        WorkloadBinding is a link between a configuration resource and a workload resource.
-
-        :param Sequence['PodMonitorStatusBindingsConditionsPatchArgs'] conditions: conditions defines the current state of the configuration resource when bound to the referenced Workload object.
-        :param _builtins.str group: group defines the group of the referenced resource.
-        :param _builtins.str name: name defines the name of the referenced object.
-        :param _builtins.str namespace: namespace defines the namespace of the referenced object.
-        :param _builtins.str resource: resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
-        """
-        if conditions is not None:
-            pulumi.set(__self__, "conditions", conditions)
-        if group is not None:
-            pulumi.set(__self__, "group", group)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if namespace is not None:
-            pulumi.set(__self__, "namespace", namespace)
-        if resource is not None:
-            pulumi.set(__self__, "resource", resource)
-
-    @_builtins.property
-    @pulumi.getter
-    def conditions(self) -> Optional[Sequence['outputs.PodMonitorStatusBindingsConditionsPatch']]:
-        """
-        conditions defines the current state of the configuration resource when bound to the referenced Workload object.
-        """
-        return pulumi.get(self, "conditions")
-
-    @_builtins.property
-    @pulumi.getter
-    def group(self) -> Optional[_builtins.str]:
-        """
-        group defines the group of the referenced resource.
-        """
-        return pulumi.get(self, "group")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        name defines the name of the referenced object.
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespace(self) -> Optional[_builtins.str]:
-        """
-        namespace defines the namespace of the referenced object.
-        """
-        return pulumi.get(self, "namespace")
-
-    @_builtins.property
-    @pulumi.getter
-    def resource(self) -> Optional[_builtins.str]:
-        """
-        resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
-        """
-        return pulumi.get(self, "resource")
-
-
-@pulumi.output_type
-class PodMonitorStatusPatch(dict):
-    """
-    status defines the status subresource. It is under active development and is updated only when the
-    "StatusForConfigurationResources" feature gate is enabled.
-
-    Most recent observed status of the PodMonitor. Read-only.
-    More info:
-    https://github.com/kubernetes/community/blob/master/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    def __init__(__self__, *,
-                 bindings: Optional[Sequence['outputs.PodMonitorStatusBindingsPatch']] = None):
-        """
-        status defines the status subresource. It is under active development and is updated only when the
-        "StatusForConfigurationResources" feature gate is enabled.
-
-        Most recent observed status of the PodMonitor. Read-only.
-        More info:
-        https://github.com/kubernetes/community/blob/master/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param Sequence['PodMonitorStatusBindingsPatchArgs'] bindings: bindings defines the list of workload resources (Prometheus, PrometheusAgent, ThanosRuler or Alertmanager) which select the configuration resource.
-        """
-        if bindings is not None:
-            pulumi.set(__self__, "bindings", bindings)
-
-    @_builtins.property
-    @pulumi.getter
-    def bindings(self) -> Optional[Sequence['outputs.PodMonitorStatusBindingsPatch']]:
-        """
-        bindings defines the list of workload resources (Prometheus, PrometheusAgent, ThanosRuler or Alertmanager) which select the configuration resource.
-        """
-        return pulumi.get(self, "bindings")
-
-
-@pulumi.output_type
-class ServiceMonitor(dict):
-    """
-    The `ServiceMonitor` custom resource definition (CRD) defines how `Prometheus` and `PrometheusAgent` can scrape metrics from a group of services.
-    Among other things, it allows to specify:
-    * The services to scrape via label selectors.
-    * The container ports to scrape.
-    * Authentication credentials to use.
-    * Target and metric relabeling.
-
-    `Prometheus` and `PrometheusAgent` objects select `ServiceMonitor` objects using label and namespace selectors.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "apiVersion":
-            suggest = "api_version"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitor. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitor.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitor.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 api_version: Optional[_builtins.str] = None,
-                 kind: Optional[_builtins.str] = None,
-                 metadata: Optional['_meta.v1.outputs.ObjectMeta'] = None,
-                 spec: Optional['outputs.ServiceMonitorSpec'] = None,
-                 status: Optional['outputs.ServiceMonitorStatus'] = None):
-        """
-        The `ServiceMonitor` custom resource definition (CRD) defines how `Prometheus` and `PrometheusAgent` can scrape metrics from a group of services.
-        Among other things, it allows to specify:
-        * The services to scrape via label selectors.
-        * The container ports to scrape.
-        * Authentication credentials to use.
-        * Target and metric relabeling.
-
-        `Prometheus` and `PrometheusAgent` objects select `ServiceMonitor` objects using label and namespace selectors.
-
-        :param _builtins.str api_version: APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        :param _builtins.str kind: Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        :param '_meta.v1.ObjectMetaArgs' metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        if api_version is not None:
-            pulumi.set(__self__, "api_version", 'monitoring.coreos.com/v1')
-        if kind is not None:
-            pulumi.set(__self__, "kind", 'ServiceMonitor')
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter(name="apiVersion")
-    def api_version(self) -> Optional[_builtins.str]:
-        """
-        APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        """
-        return pulumi.get(self, "api_version")
-
-    @_builtins.property
-    @pulumi.getter
-    def kind(self) -> Optional[_builtins.str]:
-        """
-        Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        return pulumi.get(self, "kind")
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> Optional['_meta.v1.outputs.ObjectMeta']:
-        """
-        Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        return pulumi.get(self, "metadata")
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> Optional['outputs.ServiceMonitorSpec']:
-        return pulumi.get(self, "spec")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional['outputs.ServiceMonitorStatus']:
-        return pulumi.get(self, "status")
-
-
-@pulumi.output_type
-class ServiceMonitorSpec(dict):
-    """
-    spec defines the specification of desired Service selection for target discovery by
-    Prometheus.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "attachMetadata":
-            suggest = "attach_metadata"
-        elif key == "bodySizeLimit":
-            suggest = "body_size_limit"
-        elif key == "convertClassicHistogramsToNHCB":
-            suggest = "convert_classic_histograms_to_nhcb"
-        elif key == "fallbackScrapeProtocol":
-            suggest = "fallback_scrape_protocol"
-        elif key == "jobLabel":
-            suggest = "job_label"
-        elif key == "keepDroppedTargets":
-            suggest = "keep_dropped_targets"
-        elif key == "labelLimit":
-            suggest = "label_limit"
-        elif key == "labelNameLengthLimit":
-            suggest = "label_name_length_limit"
-        elif key == "labelValueLengthLimit":
-            suggest = "label_value_length_limit"
-        elif key == "namespaceSelector":
-            suggest = "namespace_selector"
-        elif key == "nativeHistogramBucketLimit":
-            suggest = "native_histogram_bucket_limit"
-        elif key == "nativeHistogramMinBucketFactor":
-            suggest = "native_histogram_min_bucket_factor"
-        elif key == "podTargetLabels":
-            suggest = "pod_target_labels"
-        elif key == "sampleLimit":
-            suggest = "sample_limit"
-        elif key == "scrapeClass":
-            suggest = "scrape_class"
-        elif key == "scrapeClassicHistograms":
-            suggest = "scrape_classic_histograms"
-        elif key == "scrapeNativeHistograms":
-            suggest = "scrape_native_histograms"
-        elif key == "scrapeProtocols":
-            suggest = "scrape_protocols"
-        elif key == "selectorMechanism":
-            suggest = "selector_mechanism"
-        elif key == "serviceDiscoveryRole":
-            suggest = "service_discovery_role"
-        elif key == "targetLabels":
-            suggest = "target_labels"
-        elif key == "targetLimit":
-            suggest = "target_limit"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpec. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpec.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpec.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 attach_metadata: Optional['outputs.ServiceMonitorSpecAttachMetadata'] = None,
-                 body_size_limit: Optional[_builtins.str] = None,
-                 convert_classic_histograms_to_nhcb: Optional[_builtins.bool] = None,
-                 endpoints: Optional[Sequence['outputs.ServiceMonitorSpecEndpoints']] = None,
-                 fallback_scrape_protocol: Optional[_builtins.str] = None,
-                 job_label: Optional[_builtins.str] = None,
-                 keep_dropped_targets: Optional[_builtins.int] = None,
-                 label_limit: Optional[_builtins.int] = None,
-                 label_name_length_limit: Optional[_builtins.int] = None,
-                 label_value_length_limit: Optional[_builtins.int] = None,
-                 namespace_selector: Optional['outputs.ServiceMonitorSpecNamespaceSelector'] = None,
-                 native_histogram_bucket_limit: Optional[_builtins.int] = None,
-                 native_histogram_min_bucket_factor: Optional[Any] = None,
-                 pod_target_labels: Optional[Sequence[_builtins.str]] = None,
-                 sample_limit: Optional[_builtins.int] = None,
-                 scrape_class: Optional[_builtins.str] = None,
-                 scrape_classic_histograms: Optional[_builtins.bool] = None,
-                 scrape_native_histograms: Optional[_builtins.bool] = None,
-                 scrape_protocols: Optional[Sequence[_builtins.str]] = None,
-                 selector: Optional['outputs.ServiceMonitorSpecSelector'] = None,
-                 selector_mechanism: Optional[_builtins.str] = None,
-                 service_discovery_role: Optional[_builtins.str] = None,
-                 target_labels: Optional[Sequence[_builtins.str]] = None,
-                 target_limit: Optional[_builtins.int] = None):
-        """
-        spec defines the specification of desired Service selection for target discovery by
-        Prometheus.
-
-        :param _builtins.str body_size_limit: bodySizeLimit when defined, bodySizeLimit specifies a job level limit on the size
-               of uncompressed response body that will be accepted by Prometheus.
-
-               It requires Prometheus >= v2.28.0.
-        :param _builtins.bool convert_classic_histograms_to_nhcb: convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-               It requires Prometheus >= v3.0.0.
-        :param Sequence['ServiceMonitorSpecEndpointsArgs'] endpoints: endpoints defines the list of endpoints part of this ServiceMonitor.
-               Defines how to scrape metrics from Kubernetes [Endpoints](https://kubernetes.io/docs/concepts/services-networking/service/#endpoints) objects.
-               In most cases, an Endpoints object is backed by a Kubernetes [Service](https://kubernetes.io/docs/concepts/services-networking/service/) object with the same name and labels.
-        :param _builtins.str fallback_scrape_protocol: fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-               It requires Prometheus >= v3.0.0.
-        :param _builtins.str job_label: jobLabel selects the label from the associated Kubernetes `Service`
-               object which will be used as the `job` label for all metrics.
-
-               For example if `jobLabel` is set to `foo` and the Kubernetes `Service`
-               object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-               label to all ingested metrics.
-
-               If the value of this field is empty or if the label doesn't exist for
-               the given Service, the `job` label of the metrics defaults to the name
-               of the associated Kubernetes `Service`.
-        :param _builtins.int keep_dropped_targets: keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-               that will be kept in memory. 0 means no limit.
-
-               It requires Prometheus >= v2.47.0.
-        :param _builtins.int label_limit: labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param _builtins.int label_name_length_limit: labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param _builtins.int label_value_length_limit: labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param _builtins.int native_histogram_bucket_limit: nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-               buckets will be merged to stay within the limit.
-               It requires Prometheus >= v2.45.0.
-        :param Union[_builtins.int, _builtins.str] native_histogram_min_bucket_factor: nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-               buckets will be merged to increase the factor sufficiently.
-               It requires Prometheus >= v2.50.0.
-        :param Sequence[_builtins.str] pod_target_labels: podTargetLabels defines the labels which are transferred from the
-               associated Kubernetes `Pod` object onto the ingested metrics.
-        :param _builtins.int sample_limit: sampleLimit defines a per-scrape limit on the number of scraped samples
-               that will be accepted.
-        :param _builtins.str scrape_class: scrapeClass defines the scrape class to apply.
-        :param _builtins.bool scrape_classic_histograms: scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-               It requires Prometheus >= v2.45.0.
-
-               Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-        :param _builtins.bool scrape_native_histograms: scrapeNativeHistograms defines whether to enable scraping of native histograms.
-               It requires Prometheus >= v3.8.0.
-        :param Sequence[_builtins.str] scrape_protocols: scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-               protocols supported by Prometheus in order of preference (from most to least preferred).
-
-               If unset, Prometheus uses its default value.
-
-               It requires Prometheus >= v2.49.0.
-        :param _builtins.str selector_mechanism: selectorMechanism defines the mechanism used to select the endpoints to scrape.
-               By default, the selection process relies on relabel configurations to filter the discovered targets.
-               Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-               Which strategy is best for your use case needs to be carefully evaluated.
-
-               It requires Prometheus >= v2.17.0.
-        :param _builtins.str service_discovery_role: serviceDiscoveryRole defines the service discovery role used to discover targets.
-
-               If set, the value should be either "Endpoints" or "EndpointSlice".
-               Otherwise it defaults to the value defined in the
-               Prometheus/PrometheusAgent resource.
-        :param Sequence[_builtins.str] target_labels: targetLabels defines the labels which are transferred from the
-               associated Kubernetes `Service` object onto the ingested metrics.
-        :param _builtins.int target_limit: targetLimit defines a limit on the number of scraped targets that will
-               be accepted.
-        """
-        if attach_metadata is not None:
-            pulumi.set(__self__, "attach_metadata", attach_metadata)
-        if body_size_limit is not None:
-            pulumi.set(__self__, "body_size_limit", body_size_limit)
-        if convert_classic_histograms_to_nhcb is not None:
-            pulumi.set(__self__, "convert_classic_histograms_to_nhcb", convert_classic_histograms_to_nhcb)
-        if endpoints is not None:
-            pulumi.set(__self__, "endpoints", endpoints)
-        if fallback_scrape_protocol is not None:
-            pulumi.set(__self__, "fallback_scrape_protocol", fallback_scrape_protocol)
-        if job_label is not None:
-            pulumi.set(__self__, "job_label", job_label)
-        if keep_dropped_targets is not None:
-            pulumi.set(__self__, "keep_dropped_targets", keep_dropped_targets)
-        if label_limit is not None:
-            pulumi.set(__self__, "label_limit", label_limit)
-        if label_name_length_limit is not None:
-            pulumi.set(__self__, "label_name_length_limit", label_name_length_limit)
-        if label_value_length_limit is not None:
-            pulumi.set(__self__, "label_value_length_limit", label_value_length_limit)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if native_histogram_bucket_limit is not None:
-            pulumi.set(__self__, "native_histogram_bucket_limit", native_histogram_bucket_limit)
-        if native_histogram_min_bucket_factor is not None:
-            pulumi.set(__self__, "native_histogram_min_bucket_factor", native_histogram_min_bucket_factor)
-        if pod_target_labels is not None:
-            pulumi.set(__self__, "pod_target_labels", pod_target_labels)
-        if sample_limit is not None:
-            pulumi.set(__self__, "sample_limit", sample_limit)
-        if scrape_class is not None:
-            pulumi.set(__self__, "scrape_class", scrape_class)
-        if scrape_classic_histograms is not None:
-            pulumi.set(__self__, "scrape_classic_histograms", scrape_classic_histograms)
-        if scrape_native_histograms is not None:
-            pulumi.set(__self__, "scrape_native_histograms", scrape_native_histograms)
-        if scrape_protocols is not None:
-            pulumi.set(__self__, "scrape_protocols", scrape_protocols)
-        if selector is not None:
-            pulumi.set(__self__, "selector", selector)
-        if selector_mechanism is not None:
-            pulumi.set(__self__, "selector_mechanism", selector_mechanism)
-        if service_discovery_role is not None:
-            pulumi.set(__self__, "service_discovery_role", service_discovery_role)
-        if target_labels is not None:
-            pulumi.set(__self__, "target_labels", target_labels)
-        if target_limit is not None:
-            pulumi.set(__self__, "target_limit", target_limit)
-
-    @_builtins.property
-    @pulumi.getter(name="attachMetadata")
-    def attach_metadata(self) -> Optional['outputs.ServiceMonitorSpecAttachMetadata']:
-        return pulumi.get(self, "attach_metadata")
-
-    @_builtins.property
-    @pulumi.getter(name="bodySizeLimit")
-    def body_size_limit(self) -> Optional[_builtins.str]:
-        """
-        bodySizeLimit when defined, bodySizeLimit specifies a job level limit on the size
-        of uncompressed response body that will be accepted by Prometheus.
-
-        It requires Prometheus >= v2.28.0.
-        """
-        return pulumi.get(self, "body_size_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="convertClassicHistogramsToNHCB")
-    def convert_classic_histograms_to_nhcb(self) -> Optional[_builtins.bool]:
-        """
-        convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-        It requires Prometheus >= v3.0.0.
-        """
-        return pulumi.get(self, "convert_classic_histograms_to_nhcb")
-
-    @_builtins.property
-    @pulumi.getter
-    def endpoints(self) -> Optional[Sequence['outputs.ServiceMonitorSpecEndpoints']]:
-        """
-        endpoints defines the list of endpoints part of this ServiceMonitor.
-        Defines how to scrape metrics from Kubernetes [Endpoints](https://kubernetes.io/docs/concepts/services-networking/service/#endpoints) objects.
-        In most cases, an Endpoints object is backed by a Kubernetes [Service](https://kubernetes.io/docs/concepts/services-networking/service/) object with the same name and labels.
-        """
-        return pulumi.get(self, "endpoints")
-
-    @_builtins.property
-    @pulumi.getter(name="fallbackScrapeProtocol")
-    def fallback_scrape_protocol(self) -> Optional[_builtins.str]:
-        """
-        fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-        It requires Prometheus >= v3.0.0.
-        """
-        return pulumi.get(self, "fallback_scrape_protocol")
-
-    @_builtins.property
-    @pulumi.getter(name="jobLabel")
-    def job_label(self) -> Optional[_builtins.str]:
-        """
-        jobLabel selects the label from the associated Kubernetes `Service`
-        object which will be used as the `job` label for all metrics.
-
-        For example if `jobLabel` is set to `foo` and the Kubernetes `Service`
-        object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-        label to all ingested metrics.
-
-        If the value of this field is empty or if the label doesn't exist for
-        the given Service, the `job` label of the metrics defaults to the name
-        of the associated Kubernetes `Service`.
-        """
-        return pulumi.get(self, "job_label")
-
-    @_builtins.property
-    @pulumi.getter(name="keepDroppedTargets")
-    def keep_dropped_targets(self) -> Optional[_builtins.int]:
-        """
-        keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-        that will be kept in memory. 0 means no limit.
-
-        It requires Prometheus >= v2.47.0.
-        """
-        return pulumi.get(self, "keep_dropped_targets")
-
-    @_builtins.property
-    @pulumi.getter(name="labelLimit")
-    def label_limit(self) -> Optional[_builtins.int]:
-        """
-        labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="labelNameLengthLimit")
-    def label_name_length_limit(self) -> Optional[_builtins.int]:
-        """
-        labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_name_length_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="labelValueLengthLimit")
-    def label_value_length_limit(self) -> Optional[_builtins.int]:
-        """
-        labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_value_length_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> Optional['outputs.ServiceMonitorSpecNamespaceSelector']:
-        return pulumi.get(self, "namespace_selector")
-
-    @_builtins.property
-    @pulumi.getter(name="nativeHistogramBucketLimit")
-    def native_histogram_bucket_limit(self) -> Optional[_builtins.int]:
-        """
-        nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-        buckets will be merged to stay within the limit.
-        It requires Prometheus >= v2.45.0.
-        """
-        return pulumi.get(self, "native_histogram_bucket_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="nativeHistogramMinBucketFactor")
-    def native_histogram_min_bucket_factor(self) -> Optional[Any]:
-        """
-        nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-        buckets will be merged to increase the factor sufficiently.
-        It requires Prometheus >= v2.50.0.
-        """
-        return pulumi.get(self, "native_histogram_min_bucket_factor")
-
-    @_builtins.property
-    @pulumi.getter(name="podTargetLabels")
-    def pod_target_labels(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        podTargetLabels defines the labels which are transferred from the
-        associated Kubernetes `Pod` object onto the ingested metrics.
-        """
-        return pulumi.get(self, "pod_target_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="sampleLimit")
-    def sample_limit(self) -> Optional[_builtins.int]:
-        """
-        sampleLimit defines a per-scrape limit on the number of scraped samples
-        that will be accepted.
-        """
-        return pulumi.get(self, "sample_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeClass")
-    def scrape_class(self) -> Optional[_builtins.str]:
-        """
-        scrapeClass defines the scrape class to apply.
-        """
-        return pulumi.get(self, "scrape_class")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeClassicHistograms")
-    def scrape_classic_histograms(self) -> Optional[_builtins.bool]:
-        """
-        scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-        It requires Prometheus >= v2.45.0.
-
-        Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-        """
-        return pulumi.get(self, "scrape_classic_histograms")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeNativeHistograms")
-    def scrape_native_histograms(self) -> Optional[_builtins.bool]:
-        """
-        scrapeNativeHistograms defines whether to enable scraping of native histograms.
-        It requires Prometheus >= v3.8.0.
-        """
-        return pulumi.get(self, "scrape_native_histograms")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeProtocols")
-    def scrape_protocols(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-        protocols supported by Prometheus in order of preference (from most to least preferred).
-
-        If unset, Prometheus uses its default value.
-
-        It requires Prometheus >= v2.49.0.
-        """
-        return pulumi.get(self, "scrape_protocols")
-
-    @_builtins.property
-    @pulumi.getter
-    def selector(self) -> Optional['outputs.ServiceMonitorSpecSelector']:
-        return pulumi.get(self, "selector")
-
-    @_builtins.property
-    @pulumi.getter(name="selectorMechanism")
-    def selector_mechanism(self) -> Optional[_builtins.str]:
-        """
-        selectorMechanism defines the mechanism used to select the endpoints to scrape.
-        By default, the selection process relies on relabel configurations to filter the discovered targets.
-        Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-        Which strategy is best for your use case needs to be carefully evaluated.
-
-        It requires Prometheus >= v2.17.0.
-        """
-        return pulumi.get(self, "selector_mechanism")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceDiscoveryRole")
-    def service_discovery_role(self) -> Optional[_builtins.str]:
-        """
-        serviceDiscoveryRole defines the service discovery role used to discover targets.
-
-        If set, the value should be either "Endpoints" or "EndpointSlice".
-        Otherwise it defaults to the value defined in the
-        Prometheus/PrometheusAgent resource.
-        """
-        return pulumi.get(self, "service_discovery_role")
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabels")
-    def target_labels(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        targetLabels defines the labels which are transferred from the
-        associated Kubernetes `Service` object onto the ingested metrics.
-        """
-        return pulumi.get(self, "target_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="targetLimit")
-    def target_limit(self) -> Optional[_builtins.int]:
-        """
-        targetLimit defines a limit on the number of scraped targets that will
-        be accepted.
-        """
-        return pulumi.get(self, "target_limit")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecAttachMetadata(dict):
-    """
-    attachMetadata defines additional metadata which is added to the
-    discovered targets.
-
-    It requires Prometheus >= v2.37.0.
-    """
-    def __init__(__self__, *,
-                 node: Optional[_builtins.bool] = None):
-        """
-        attachMetadata defines additional metadata which is added to the
-        discovered targets.
-
-        It requires Prometheus >= v2.37.0.
-
-        :param _builtins.bool node: node when set to true, Prometheus attaches node metadata to the discovered
-               targets.
-
-               The Prometheus service account must have the `list` and `watch`
-               permissions on the `Nodes` objects.
-        """
-        if node is not None:
-            pulumi.set(__self__, "node", node)
-
-    @_builtins.property
-    @pulumi.getter
-    def node(self) -> Optional[_builtins.bool]:
-        """
-        node when set to true, Prometheus attaches node metadata to the discovered
-        targets.
-
-        The Prometheus service account must have the `list` and `watch`
-        permissions on the `Nodes` objects.
-        """
-        return pulumi.get(self, "node")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecAttachMetadataPatch(dict):
-    """
-    attachMetadata defines additional metadata which is added to the
-    discovered targets.
-
-    It requires Prometheus >= v2.37.0.
-    """
-    def __init__(__self__, *,
-                 node: Optional[_builtins.bool] = None):
-        """
-        attachMetadata defines additional metadata which is added to the
-        discovered targets.
-
-        It requires Prometheus >= v2.37.0.
-
-        :param _builtins.bool node: node when set to true, Prometheus attaches node metadata to the discovered
-               targets.
-
-               The Prometheus service account must have the `list` and `watch`
-               permissions on the `Nodes` objects.
-        """
-        if node is not None:
-            pulumi.set(__self__, "node", node)
-
-    @_builtins.property
-    @pulumi.getter
-    def node(self) -> Optional[_builtins.bool]:
-        """
-        node when set to true, Prometheus attaches node metadata to the discovered
-        targets.
-
-        The Prometheus service account must have the `list` and `watch`
-        permissions on the `Nodes` objects.
-        """
-        return pulumi.get(self, "node")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpoints(dict):
-    """
-    Endpoint defines an endpoint serving Prometheus metrics to be scraped by
-    Prometheus.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "basicAuth":
-            suggest = "basic_auth"
-        elif key == "bearerTokenFile":
-            suggest = "bearer_token_file"
-        elif key == "bearerTokenSecret":
-            suggest = "bearer_token_secret"
-        elif key == "enableHttp2":
-            suggest = "enable_http2"
-        elif key == "filterRunning":
-            suggest = "filter_running"
-        elif key == "followRedirects":
-            suggest = "follow_redirects"
-        elif key == "honorLabels":
-            suggest = "honor_labels"
-        elif key == "honorTimestamps":
-            suggest = "honor_timestamps"
-        elif key == "metricRelabelings":
-            suggest = "metric_relabelings"
-        elif key == "noProxy":
-            suggest = "no_proxy"
-        elif key == "proxyConnectHeader":
-            suggest = "proxy_connect_header"
-        elif key == "proxyFromEnvironment":
-            suggest = "proxy_from_environment"
-        elif key == "proxyUrl":
-            suggest = "proxy_url"
-        elif key == "scrapeTimeout":
-            suggest = "scrape_timeout"
-        elif key == "targetPort":
-            suggest = "target_port"
-        elif key == "tlsConfig":
-            suggest = "tls_config"
-        elif key == "trackTimestampsStaleness":
-            suggest = "track_timestamps_staleness"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpoints. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpoints.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpoints.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 authorization: Optional['outputs.ServiceMonitorSpecEndpointsAuthorization'] = None,
-                 basic_auth: Optional['outputs.ServiceMonitorSpecEndpointsBasicAuth'] = None,
-                 bearer_token_file: Optional[_builtins.str] = None,
-                 bearer_token_secret: Optional['outputs.ServiceMonitorSpecEndpointsBearerTokenSecret'] = None,
-                 enable_http2: Optional[_builtins.bool] = None,
-                 filter_running: Optional[_builtins.bool] = None,
-                 follow_redirects: Optional[_builtins.bool] = None,
-                 honor_labels: Optional[_builtins.bool] = None,
-                 honor_timestamps: Optional[_builtins.bool] = None,
-                 interval: Optional[_builtins.str] = None,
-                 metric_relabelings: Optional[Sequence['outputs.ServiceMonitorSpecEndpointsMetricRelabelings']] = None,
-                 no_proxy: Optional[_builtins.str] = None,
-                 oauth2: Optional['outputs.ServiceMonitorSpecEndpointsOauth2'] = None,
-                 params: Optional[Mapping[str, Sequence[_builtins.str]]] = None,
-                 path: Optional[_builtins.str] = None,
-                 port: Optional[_builtins.str] = None,
-                 proxy_connect_header: Optional[Mapping[str, Sequence['outputs.ServiceMonitorSpecEndpointsProxyConnectHeader']]] = None,
-                 proxy_from_environment: Optional[_builtins.bool] = None,
-                 proxy_url: Optional[_builtins.str] = None,
-                 relabelings: Optional[Sequence['outputs.ServiceMonitorSpecEndpointsRelabelings']] = None,
-                 scheme: Optional[_builtins.str] = None,
-                 scrape_timeout: Optional[_builtins.str] = None,
-                 target_port: Optional[Any] = None,
-                 tls_config: Optional['outputs.ServiceMonitorSpecEndpointsTlsConfig'] = None,
-                 track_timestamps_staleness: Optional[_builtins.bool] = None):
-        """
-        Endpoint defines an endpoint serving Prometheus metrics to be scraped by
-        Prometheus.
-
-        :param _builtins.str bearer_token_file: bearerTokenFile defines the file to read bearer token for scraping the target.
-
-               Deprecated: use `authorization` instead.
-        :param _builtins.bool enable_http2: enableHttp2 can be used to disable HTTP2.
-        :param _builtins.bool filter_running: filterRunning when true, the pods which are not running (e.g. either in Failed or
-               Succeeded state) are dropped during the target discovery.
-
-               If unset, the filtering is enabled.
-
-               More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-        :param _builtins.bool follow_redirects: followRedirects defines whether the client should follow HTTP 3xx
-               redirects.
-        :param _builtins.bool honor_labels: honorLabels defines when true the metric's labels when they collide
-               with the target's labels.
-        :param _builtins.bool honor_timestamps: honorTimestamps defines whether Prometheus preserves the timestamps
-               when exposed by the target.
-        :param _builtins.str interval: interval at which Prometheus scrapes the metrics from the target.
-
-               If empty, Prometheus uses the global scrape interval.
-        :param Sequence['ServiceMonitorSpecEndpointsMetricRelabelingsArgs'] metric_relabelings: metricRelabelings defines the relabeling rules to apply to the
-               samples before ingestion.
-        :param _builtins.str no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-               that should be excluded from proxying. IP and domain names can
-               contain port numbers.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param Mapping[str, Sequence[_builtins.str]] params: params define optional HTTP URL parameters.
-        :param _builtins.str path: path defines the HTTP path from which to scrape for metrics.
-
-               If empty, Prometheus uses the default value (e.g. `/metrics`).
-        :param _builtins.str port: port defines the name of the Service port which this endpoint refers to.
-
-               It takes precedence over `targetPort`.
-        :param Mapping[str, Sequence['ServiceMonitorSpecEndpointsProxyConnectHeaderArgs']] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
-               proxies during CONNECT requests.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param _builtins.bool proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param _builtins.str proxy_url: proxyUrl defines the HTTP proxy server to use.
-        :param Sequence['ServiceMonitorSpecEndpointsRelabelingsArgs'] relabelings: relabelings defines the relabeling rules to apply the target's
-               metadata labels.
-
-               The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-               The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-               More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-        :param _builtins.str scheme: scheme defines the HTTP scheme to use when scraping the metrics.
-        :param _builtins.str scrape_timeout: scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-               If empty, Prometheus uses the global scrape timeout unless it is less
-               than the target's scrape interval value in which the latter is used.
-               The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-        :param Union[_builtins.int, _builtins.str] target_port: targetPort defines the name or number of the target port of the `Pod` object behind the
-               Service. The port must be specified with the container's port property.
-        :param _builtins.bool track_timestamps_staleness: trackTimestampsStaleness defines whether Prometheus tracks staleness of
-               the metrics that have an explicit timestamp present in scraped data.
-               Has no effect if `honorTimestamps` is false.
-
-               It requires Prometheus >= v2.48.0.
-        """
-        if authorization is not None:
-            pulumi.set(__self__, "authorization", authorization)
-        if basic_auth is not None:
-            pulumi.set(__self__, "basic_auth", basic_auth)
-        if bearer_token_file is not None:
-            pulumi.set(__self__, "bearer_token_file", bearer_token_file)
-        if bearer_token_secret is not None:
-            pulumi.set(__self__, "bearer_token_secret", bearer_token_secret)
-        if enable_http2 is not None:
-            pulumi.set(__self__, "enable_http2", enable_http2)
-        if filter_running is not None:
-            pulumi.set(__self__, "filter_running", filter_running)
-        if follow_redirects is not None:
-            pulumi.set(__self__, "follow_redirects", follow_redirects)
-        if honor_labels is not None:
-            pulumi.set(__self__, "honor_labels", honor_labels)
-        if honor_timestamps is not None:
-            pulumi.set(__self__, "honor_timestamps", honor_timestamps)
-        if interval is not None:
-            pulumi.set(__self__, "interval", interval)
-        if metric_relabelings is not None:
-            pulumi.set(__self__, "metric_relabelings", metric_relabelings)
-        if no_proxy is not None:
-            pulumi.set(__self__, "no_proxy", no_proxy)
-        if oauth2 is not None:
-            pulumi.set(__self__, "oauth2", oauth2)
-        if params is not None:
-            pulumi.set(__self__, "params", params)
-        if path is not None:
-            pulumi.set(__self__, "path", path)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if proxy_connect_header is not None:
-            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
-        if proxy_from_environment is not None:
-            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
-        if proxy_url is not None:
-            pulumi.set(__self__, "proxy_url", proxy_url)
-        if relabelings is not None:
-            pulumi.set(__self__, "relabelings", relabelings)
-        if scheme is not None:
-            pulumi.set(__self__, "scheme", scheme)
-        if scrape_timeout is not None:
-            pulumi.set(__self__, "scrape_timeout", scrape_timeout)
-        if target_port is not None:
-            pulumi.set(__self__, "target_port", target_port)
-        if tls_config is not None:
-            pulumi.set(__self__, "tls_config", tls_config)
-        if track_timestamps_staleness is not None:
-            pulumi.set(__self__, "track_timestamps_staleness", track_timestamps_staleness)
-
-    @_builtins.property
-    @pulumi.getter
-    def authorization(self) -> Optional['outputs.ServiceMonitorSpecEndpointsAuthorization']:
-        return pulumi.get(self, "authorization")
-
-    @_builtins.property
-    @pulumi.getter(name="basicAuth")
-    def basic_auth(self) -> Optional['outputs.ServiceMonitorSpecEndpointsBasicAuth']:
-        return pulumi.get(self, "basic_auth")
-
-    @_builtins.property
-    @pulumi.getter(name="bearerTokenFile")
-    def bearer_token_file(self) -> Optional[_builtins.str]:
-        """
-        bearerTokenFile defines the file to read bearer token for scraping the target.
-
-        Deprecated: use `authorization` instead.
-        """
-        return pulumi.get(self, "bearer_token_file")
-
-    @_builtins.property
-    @pulumi.getter(name="bearerTokenSecret")
-    def bearer_token_secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsBearerTokenSecret']:
-        return pulumi.get(self, "bearer_token_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="enableHttp2")
-    def enable_http2(self) -> Optional[_builtins.bool]:
-        """
-        enableHttp2 can be used to disable HTTP2.
-        """
-        return pulumi.get(self, "enable_http2")
-
-    @_builtins.property
-    @pulumi.getter(name="filterRunning")
-    def filter_running(self) -> Optional[_builtins.bool]:
-        """
-        filterRunning when true, the pods which are not running (e.g. either in Failed or
-        Succeeded state) are dropped during the target discovery.
-
-        If unset, the filtering is enabled.
-
-        More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-        """
-        return pulumi.get(self, "filter_running")
-
-    @_builtins.property
-    @pulumi.getter(name="followRedirects")
-    def follow_redirects(self) -> Optional[_builtins.bool]:
-        """
-        followRedirects defines whether the client should follow HTTP 3xx
-        redirects.
-        """
-        return pulumi.get(self, "follow_redirects")
-
-    @_builtins.property
-    @pulumi.getter(name="honorLabels")
-    def honor_labels(self) -> Optional[_builtins.bool]:
-        """
-        honorLabels defines when true the metric's labels when they collide
-        with the target's labels.
-        """
-        return pulumi.get(self, "honor_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="honorTimestamps")
-    def honor_timestamps(self) -> Optional[_builtins.bool]:
-        """
-        honorTimestamps defines whether Prometheus preserves the timestamps
-        when exposed by the target.
-        """
-        return pulumi.get(self, "honor_timestamps")
-
-    @_builtins.property
-    @pulumi.getter
-    def interval(self) -> Optional[_builtins.str]:
-        """
-        interval at which Prometheus scrapes the metrics from the target.
-
-        If empty, Prometheus uses the global scrape interval.
-        """
-        return pulumi.get(self, "interval")
-
-    @_builtins.property
-    @pulumi.getter(name="metricRelabelings")
-    def metric_relabelings(self) -> Optional[Sequence['outputs.ServiceMonitorSpecEndpointsMetricRelabelings']]:
-        """
-        metricRelabelings defines the relabeling rules to apply to the
-        samples before ingestion.
-        """
-        return pulumi.get(self, "metric_relabelings")
-
-    @_builtins.property
-    @pulumi.getter(name="noProxy")
-    def no_proxy(self) -> Optional[_builtins.str]:
-        """
-        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-        that should be excluded from proxying. IP and domain names can
-        contain port numbers.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "no_proxy")
-
-    @_builtins.property
-    @pulumi.getter
-    def oauth2(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2']:
-        return pulumi.get(self, "oauth2")
-
-    @_builtins.property
-    @pulumi.getter
-    def params(self) -> Optional[Mapping[str, Sequence[_builtins.str]]]:
-        """
-        params define optional HTTP URL parameters.
-        """
-        return pulumi.get(self, "params")
-
-    @_builtins.property
-    @pulumi.getter
-    def path(self) -> Optional[_builtins.str]:
-        """
-        path defines the HTTP path from which to scrape for metrics.
-
-        If empty, Prometheus uses the default value (e.g. `/metrics`).
-        """
-        return pulumi.get(self, "path")
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> Optional[_builtins.str]:
-        """
-        port defines the name of the Service port which this endpoint refers to.
-
-        It takes precedence over `targetPort`.
-        """
-        return pulumi.get(self, "port")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyConnectHeader")
-    def proxy_connect_header(self) -> Optional[Mapping[str, Sequence['outputs.ServiceMonitorSpecEndpointsProxyConnectHeader']]]:
-        """
-        proxyConnectHeader optionally specifies headers to send to
-        proxies during CONNECT requests.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_connect_header")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyFromEnvironment")
-    def proxy_from_environment(self) -> Optional[_builtins.bool]:
-        """
-        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_from_environment")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyUrl")
-    def proxy_url(self) -> Optional[_builtins.str]:
-        """
-        proxyUrl defines the HTTP proxy server to use.
-        """
-        return pulumi.get(self, "proxy_url")
-
-    @_builtins.property
-    @pulumi.getter
-    def relabelings(self) -> Optional[Sequence['outputs.ServiceMonitorSpecEndpointsRelabelings']]:
-        """
-        relabelings defines the relabeling rules to apply the target's
-        metadata labels.
-
-        The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-        The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-        """
-        return pulumi.get(self, "relabelings")
-
-    @_builtins.property
-    @pulumi.getter
-    def scheme(self) -> Optional[_builtins.str]:
-        """
-        scheme defines the HTTP scheme to use when scraping the metrics.
-        """
-        return pulumi.get(self, "scheme")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeTimeout")
-    def scrape_timeout(self) -> Optional[_builtins.str]:
-        """
-        scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-        If empty, Prometheus uses the global scrape timeout unless it is less
-        than the target's scrape interval value in which the latter is used.
-        The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-        """
-        return pulumi.get(self, "scrape_timeout")
-
-    @_builtins.property
-    @pulumi.getter(name="targetPort")
-    def target_port(self) -> Optional[Any]:
-        """
-        targetPort defines the name or number of the target port of the `Pod` object behind the
-        Service. The port must be specified with the container's port property.
-        """
-        return pulumi.get(self, "target_port")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsConfig")
-    def tls_config(self) -> Optional['outputs.ServiceMonitorSpecEndpointsTlsConfig']:
-        return pulumi.get(self, "tls_config")
-
-    @_builtins.property
-    @pulumi.getter(name="trackTimestampsStaleness")
-    def track_timestamps_staleness(self) -> Optional[_builtins.bool]:
-        """
-        trackTimestampsStaleness defines whether Prometheus tracks staleness of
-        the metrics that have an explicit timestamp present in scraped data.
-        Has no effect if `honorTimestamps` is false.
-
-        It requires Prometheus >= v2.48.0.
-        """
-        return pulumi.get(self, "track_timestamps_staleness")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsAuthorization(dict):
-    """
-    authorization configures the Authorization header credentials used by
-    the client.
-
-    Cannot be set at the same time as `basicAuth`, `bearerTokenSecret` or `oauth2`.
-    """
-    def __init__(__self__, *,
-                 credentials: Optional['outputs.ServiceMonitorSpecEndpointsAuthorizationCredentials'] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        authorization configures the Authorization header credentials used by
-        the client.
-
-        Cannot be set at the same time as `basicAuth`, `bearerTokenSecret` or `oauth2`.
-
-        :param _builtins.str type: type defines the authentication type. The value is case-insensitive.
-
-               "Basic" is not a supported value.
-
-               Default: "Bearer"
-        """
-        if credentials is not None:
-            pulumi.set(__self__, "credentials", credentials)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter
-    def credentials(self) -> Optional['outputs.ServiceMonitorSpecEndpointsAuthorizationCredentials']:
-        return pulumi.get(self, "credentials")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type defines the authentication type. The value is case-insensitive.
-
-        "Basic" is not a supported value.
-
-        Default: "Bearer"
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsAuthorizationCredentials(dict):
-    """
-    credentials defines a key of a Secret in the namespace that contains the credentials for authentication.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        credentials defines a key of a Secret in the namespace that contains the credentials for authentication.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsAuthorizationCredentialsPatch(dict):
-    """
-    credentials defines a key of a Secret in the namespace that contains the credentials for authentication.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        credentials defines a key of a Secret in the namespace that contains the credentials for authentication.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsAuthorizationPatch(dict):
-    """
-    authorization configures the Authorization header credentials used by
-    the client.
-
-    Cannot be set at the same time as `basicAuth`, `bearerTokenSecret` or `oauth2`.
-    """
-    def __init__(__self__, *,
-                 credentials: Optional['outputs.ServiceMonitorSpecEndpointsAuthorizationCredentialsPatch'] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        authorization configures the Authorization header credentials used by
-        the client.
-
-        Cannot be set at the same time as `basicAuth`, `bearerTokenSecret` or `oauth2`.
-
-        :param _builtins.str type: type defines the authentication type. The value is case-insensitive.
-
-               "Basic" is not a supported value.
-
-               Default: "Bearer"
-        """
-        if credentials is not None:
-            pulumi.set(__self__, "credentials", credentials)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter
-    def credentials(self) -> Optional['outputs.ServiceMonitorSpecEndpointsAuthorizationCredentialsPatch']:
-        return pulumi.get(self, "credentials")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type defines the authentication type. The value is case-insensitive.
-
-        "Basic" is not a supported value.
-
-        Default: "Bearer"
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsBasicAuth(dict):
-    """
-    basicAuth defines the Basic Authentication credentials used by the
-    client.
-
-    Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
-    """
-    def __init__(__self__, *,
-                 password: Optional['outputs.ServiceMonitorSpecEndpointsBasicAuthPassword'] = None,
-                 username: Optional['outputs.ServiceMonitorSpecEndpointsBasicAuthUsername'] = None):
-        """
-        basicAuth defines the Basic Authentication credentials used by the
-        client.
-
-        Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
-        """
-        if password is not None:
-            pulumi.set(__self__, "password", password)
-        if username is not None:
-            pulumi.set(__self__, "username", username)
-
-    @_builtins.property
-    @pulumi.getter
-    def password(self) -> Optional['outputs.ServiceMonitorSpecEndpointsBasicAuthPassword']:
-        return pulumi.get(self, "password")
-
-    @_builtins.property
-    @pulumi.getter
-    def username(self) -> Optional['outputs.ServiceMonitorSpecEndpointsBasicAuthUsername']:
-        return pulumi.get(self, "username")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsBasicAuthPassword(dict):
-    """
-    password defines a key of a Secret containing the password for
-    authentication.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        password defines a key of a Secret containing the password for
-        authentication.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsBasicAuthPasswordPatch(dict):
-    """
-    password defines a key of a Secret containing the password for
-    authentication.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        password defines a key of a Secret containing the password for
-        authentication.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsBasicAuthPatch(dict):
-    """
-    basicAuth defines the Basic Authentication credentials used by the
-    client.
-
-    Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
-    """
-    def __init__(__self__, *,
-                 password: Optional['outputs.ServiceMonitorSpecEndpointsBasicAuthPasswordPatch'] = None,
-                 username: Optional['outputs.ServiceMonitorSpecEndpointsBasicAuthUsernamePatch'] = None):
-        """
-        basicAuth defines the Basic Authentication credentials used by the
-        client.
-
-        Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
-        """
-        if password is not None:
-            pulumi.set(__self__, "password", password)
-        if username is not None:
-            pulumi.set(__self__, "username", username)
-
-    @_builtins.property
-    @pulumi.getter
-    def password(self) -> Optional['outputs.ServiceMonitorSpecEndpointsBasicAuthPasswordPatch']:
-        return pulumi.get(self, "password")
-
-    @_builtins.property
-    @pulumi.getter
-    def username(self) -> Optional['outputs.ServiceMonitorSpecEndpointsBasicAuthUsernamePatch']:
-        return pulumi.get(self, "username")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsBasicAuthUsername(dict):
-    """
-    username defines a key of a Secret containing the username for
-    authentication.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        username defines a key of a Secret containing the username for
-        authentication.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsBasicAuthUsernamePatch(dict):
-    """
-    username defines a key of a Secret containing the username for
-    authentication.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        username defines a key of a Secret containing the username for
-        authentication.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsBearerTokenSecret(dict):
-    """
-    bearerTokenSecret defines a key of a Secret containing the bearer token
-    used by the client for authentication. The secret needs to be in the
-    same namespace as the custom resource and readable by the Prometheus
-    Operator.
-
-    Cannot be set at the same time as `authorization`, `basicAuth` or `oauth2`.
-
-    Deprecated: use `authorization` instead.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        bearerTokenSecret defines a key of a Secret containing the bearer token
-        used by the client for authentication. The secret needs to be in the
-        same namespace as the custom resource and readable by the Prometheus
-        Operator.
-
-        Cannot be set at the same time as `authorization`, `basicAuth` or `oauth2`.
-
-        Deprecated: use `authorization` instead.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsBearerTokenSecretPatch(dict):
-    """
-    bearerTokenSecret defines a key of a Secret containing the bearer token
-    used by the client for authentication. The secret needs to be in the
-    same namespace as the custom resource and readable by the Prometheus
-    Operator.
-
-    Cannot be set at the same time as `authorization`, `basicAuth` or `oauth2`.
-
-    Deprecated: use `authorization` instead.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        bearerTokenSecret defines a key of a Secret containing the bearer token
-        used by the client for authentication. The secret needs to be in the
-        same namespace as the custom resource and readable by the Prometheus
-        Operator.
-
-        Cannot be set at the same time as `authorization`, `basicAuth` or `oauth2`.
-
-        Deprecated: use `authorization` instead.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsMetricRelabelings(dict):
-    """
-    RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-    scraped samples and remote write samples.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "sourceLabels":
-            suggest = "source_labels"
-        elif key == "targetLabel":
-            suggest = "target_label"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsMetricRelabelings. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsMetricRelabelings.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsMetricRelabelings.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 action: Optional[_builtins.str] = None,
-                 modulus: Optional[_builtins.int] = None,
-                 regex: Optional[_builtins.str] = None,
-                 replacement: Optional[_builtins.str] = None,
-                 separator: Optional[_builtins.str] = None,
-                 source_labels: Optional[Sequence[_builtins.str]] = None,
-                 target_label: Optional[_builtins.str] = None):
-        """
-        RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-        scraped samples and remote write samples.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-
-        :param _builtins.str action: action to perform based on the regex matching.
-
-               `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-               `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-               Default: "Replace"
-        :param _builtins.int modulus: modulus to take of the hash of the source label values.
-
-               Only applicable when the action is `HashMod`.
-        :param _builtins.str regex: regex defines the regular expression against which the extracted value is matched.
-        :param _builtins.str replacement: replacement value against which a Replace action is performed if the
-               regular expression matches.
-
-               Regex capture groups are available.
-        :param _builtins.str separator: separator defines the string between concatenated SourceLabels.
-        :param Sequence[_builtins.str] source_labels: sourceLabels defines the source labels select values from existing labels. Their content is
-               concatenated using the configured Separator and matched against the
-               configured regular expression.
-        :param _builtins.str target_label: targetLabel defines the label to which the resulting string is written in a replacement.
-
-               It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-               `KeepEqual` and `DropEqual` actions.
-
-               Regex capture groups are available.
-        """
-        if action is not None:
-            pulumi.set(__self__, "action", action)
-        if modulus is not None:
-            pulumi.set(__self__, "modulus", modulus)
-        if regex is not None:
-            pulumi.set(__self__, "regex", regex)
-        if replacement is not None:
-            pulumi.set(__self__, "replacement", replacement)
-        if separator is not None:
-            pulumi.set(__self__, "separator", separator)
-        if source_labels is not None:
-            pulumi.set(__self__, "source_labels", source_labels)
-        if target_label is not None:
-            pulumi.set(__self__, "target_label", target_label)
-
-    @_builtins.property
-    @pulumi.getter
-    def action(self) -> Optional[_builtins.str]:
-        """
-        action to perform based on the regex matching.
-
-        `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-        `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-        Default: "Replace"
-        """
-        return pulumi.get(self, "action")
-
-    @_builtins.property
-    @pulumi.getter
-    def modulus(self) -> Optional[_builtins.int]:
-        """
-        modulus to take of the hash of the source label values.
-
-        Only applicable when the action is `HashMod`.
-        """
-        return pulumi.get(self, "modulus")
-
-    @_builtins.property
-    @pulumi.getter
-    def regex(self) -> Optional[_builtins.str]:
-        """
-        regex defines the regular expression against which the extracted value is matched.
-        """
-        return pulumi.get(self, "regex")
-
-    @_builtins.property
-    @pulumi.getter
-    def replacement(self) -> Optional[_builtins.str]:
-        """
-        replacement value against which a Replace action is performed if the
-        regular expression matches.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "replacement")
-
-    @_builtins.property
-    @pulumi.getter
-    def separator(self) -> Optional[_builtins.str]:
-        """
-        separator defines the string between concatenated SourceLabels.
-        """
-        return pulumi.get(self, "separator")
-
-    @_builtins.property
-    @pulumi.getter(name="sourceLabels")
-    def source_labels(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        sourceLabels defines the source labels select values from existing labels. Their content is
-        concatenated using the configured Separator and matched against the
-        configured regular expression.
-        """
-        return pulumi.get(self, "source_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabel")
-    def target_label(self) -> Optional[_builtins.str]:
-        """
-        targetLabel defines the label to which the resulting string is written in a replacement.
-
-        It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-        `KeepEqual` and `DropEqual` actions.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "target_label")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsMetricRelabelingsPatch(dict):
-    """
-    RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-    scraped samples and remote write samples.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "sourceLabels":
-            suggest = "source_labels"
-        elif key == "targetLabel":
-            suggest = "target_label"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsMetricRelabelingsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsMetricRelabelingsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsMetricRelabelingsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 action: Optional[_builtins.str] = None,
-                 modulus: Optional[_builtins.int] = None,
-                 regex: Optional[_builtins.str] = None,
-                 replacement: Optional[_builtins.str] = None,
-                 separator: Optional[_builtins.str] = None,
-                 source_labels: Optional[Sequence[_builtins.str]] = None,
-                 target_label: Optional[_builtins.str] = None):
-        """
-        RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-        scraped samples and remote write samples.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-
-        :param _builtins.str action: action to perform based on the regex matching.
-
-               `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-               `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-               Default: "Replace"
-        :param _builtins.int modulus: modulus to take of the hash of the source label values.
-
-               Only applicable when the action is `HashMod`.
-        :param _builtins.str regex: regex defines the regular expression against which the extracted value is matched.
-        :param _builtins.str replacement: replacement value against which a Replace action is performed if the
-               regular expression matches.
-
-               Regex capture groups are available.
-        :param _builtins.str separator: separator defines the string between concatenated SourceLabels.
-        :param Sequence[_builtins.str] source_labels: sourceLabels defines the source labels select values from existing labels. Their content is
-               concatenated using the configured Separator and matched against the
-               configured regular expression.
-        :param _builtins.str target_label: targetLabel defines the label to which the resulting string is written in a replacement.
-
-               It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-               `KeepEqual` and `DropEqual` actions.
-
-               Regex capture groups are available.
-        """
-        if action is not None:
-            pulumi.set(__self__, "action", action)
-        if modulus is not None:
-            pulumi.set(__self__, "modulus", modulus)
-        if regex is not None:
-            pulumi.set(__self__, "regex", regex)
-        if replacement is not None:
-            pulumi.set(__self__, "replacement", replacement)
-        if separator is not None:
-            pulumi.set(__self__, "separator", separator)
-        if source_labels is not None:
-            pulumi.set(__self__, "source_labels", source_labels)
-        if target_label is not None:
-            pulumi.set(__self__, "target_label", target_label)
-
-    @_builtins.property
-    @pulumi.getter
-    def action(self) -> Optional[_builtins.str]:
-        """
-        action to perform based on the regex matching.
-
-        `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-        `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-        Default: "Replace"
-        """
-        return pulumi.get(self, "action")
-
-    @_builtins.property
-    @pulumi.getter
-    def modulus(self) -> Optional[_builtins.int]:
-        """
-        modulus to take of the hash of the source label values.
-
-        Only applicable when the action is `HashMod`.
-        """
-        return pulumi.get(self, "modulus")
-
-    @_builtins.property
-    @pulumi.getter
-    def regex(self) -> Optional[_builtins.str]:
-        """
-        regex defines the regular expression against which the extracted value is matched.
-        """
-        return pulumi.get(self, "regex")
-
-    @_builtins.property
-    @pulumi.getter
-    def replacement(self) -> Optional[_builtins.str]:
-        """
-        replacement value against which a Replace action is performed if the
-        regular expression matches.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "replacement")
-
-    @_builtins.property
-    @pulumi.getter
-    def separator(self) -> Optional[_builtins.str]:
-        """
-        separator defines the string between concatenated SourceLabels.
-        """
-        return pulumi.get(self, "separator")
-
-    @_builtins.property
-    @pulumi.getter(name="sourceLabels")
-    def source_labels(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        sourceLabels defines the source labels select values from existing labels. Their content is
-        concatenated using the configured Separator and matched against the
-        configured regular expression.
-        """
-        return pulumi.get(self, "source_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabel")
-    def target_label(self) -> Optional[_builtins.str]:
-        """
-        targetLabel defines the label to which the resulting string is written in a replacement.
-
-        It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-        `KeepEqual` and `DropEqual` actions.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "target_label")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2(dict):
-    """
-    oauth2 defines the OAuth2 settings used by the client.
-
-    It requires Prometheus >= 2.27.0.
-
-    Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clientId":
-            suggest = "client_id"
-        elif key == "clientSecret":
-            suggest = "client_secret"
-        elif key == "endpointParams":
-            suggest = "endpoint_params"
-        elif key == "noProxy":
-            suggest = "no_proxy"
-        elif key == "proxyConnectHeader":
-            suggest = "proxy_connect_header"
-        elif key == "proxyFromEnvironment":
-            suggest = "proxy_from_environment"
-        elif key == "proxyUrl":
-            suggest = "proxy_url"
-        elif key == "tlsConfig":
-            suggest = "tls_config"
-        elif key == "tokenUrl":
-            suggest = "token_url"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsOauth2. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsOauth2.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsOauth2.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 client_id: Optional['outputs.ServiceMonitorSpecEndpointsOauth2ClientId'] = None,
-                 client_secret: Optional['outputs.ServiceMonitorSpecEndpointsOauth2ClientSecret'] = None,
-                 endpoint_params: Optional[Mapping[str, _builtins.str]] = None,
-                 no_proxy: Optional[_builtins.str] = None,
-                 proxy_connect_header: Optional[Mapping[str, Sequence['outputs.ServiceMonitorSpecEndpointsOauth2ProxyConnectHeader']]] = None,
-                 proxy_from_environment: Optional[_builtins.bool] = None,
-                 proxy_url: Optional[_builtins.str] = None,
-                 scopes: Optional[Sequence[_builtins.str]] = None,
-                 tls_config: Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfig'] = None,
-                 token_url: Optional[_builtins.str] = None):
-        """
-        oauth2 defines the OAuth2 settings used by the client.
-
-        It requires Prometheus >= 2.27.0.
-
-        Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
-
-        :param Mapping[str, _builtins.str] endpoint_params: endpointParams configures the HTTP parameters to append to the token
-               URL.
-        :param _builtins.str no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-               that should be excluded from proxying. IP and domain names can
-               contain port numbers.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param Mapping[str, Sequence['ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs']] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
-               proxies during CONNECT requests.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param _builtins.bool proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param _builtins.str proxy_url: proxyUrl defines the HTTP proxy server to use.
-        :param Sequence[_builtins.str] scopes: scopes defines the OAuth2 scopes used for the token request.
-        :param _builtins.str token_url: tokenUrl defines the URL to fetch the token from.
-        """
-        if client_id is not None:
-            pulumi.set(__self__, "client_id", client_id)
-        if client_secret is not None:
-            pulumi.set(__self__, "client_secret", client_secret)
-        if endpoint_params is not None:
-            pulumi.set(__self__, "endpoint_params", endpoint_params)
-        if no_proxy is not None:
-            pulumi.set(__self__, "no_proxy", no_proxy)
-        if proxy_connect_header is not None:
-            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
-        if proxy_from_environment is not None:
-            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
-        if proxy_url is not None:
-            pulumi.set(__self__, "proxy_url", proxy_url)
-        if scopes is not None:
-            pulumi.set(__self__, "scopes", scopes)
-        if tls_config is not None:
-            pulumi.set(__self__, "tls_config", tls_config)
-        if token_url is not None:
-            pulumi.set(__self__, "token_url", token_url)
-
-    @_builtins.property
-    @pulumi.getter(name="clientId")
-    def client_id(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2ClientId']:
-        return pulumi.get(self, "client_id")
-
-    @_builtins.property
-    @pulumi.getter(name="clientSecret")
-    def client_secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2ClientSecret']:
-        return pulumi.get(self, "client_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="endpointParams")
-    def endpoint_params(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        endpointParams configures the HTTP parameters to append to the token
-        URL.
-        """
-        return pulumi.get(self, "endpoint_params")
-
-    @_builtins.property
-    @pulumi.getter(name="noProxy")
-    def no_proxy(self) -> Optional[_builtins.str]:
-        """
-        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-        that should be excluded from proxying. IP and domain names can
-        contain port numbers.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "no_proxy")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyConnectHeader")
-    def proxy_connect_header(self) -> Optional[Mapping[str, Sequence['outputs.ServiceMonitorSpecEndpointsOauth2ProxyConnectHeader']]]:
-        """
-        proxyConnectHeader optionally specifies headers to send to
-        proxies during CONNECT requests.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_connect_header")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyFromEnvironment")
-    def proxy_from_environment(self) -> Optional[_builtins.bool]:
-        """
-        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_from_environment")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyUrl")
-    def proxy_url(self) -> Optional[_builtins.str]:
-        """
-        proxyUrl defines the HTTP proxy server to use.
-        """
-        return pulumi.get(self, "proxy_url")
-
-    @_builtins.property
-    @pulumi.getter
-    def scopes(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        scopes defines the OAuth2 scopes used for the token request.
-        """
-        return pulumi.get(self, "scopes")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsConfig")
-    def tls_config(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfig']:
-        return pulumi.get(self, "tls_config")
-
-    @_builtins.property
-    @pulumi.getter(name="tokenUrl")
-    def token_url(self) -> Optional[_builtins.str]:
-        """
-        tokenUrl defines the URL to fetch the token from.
-        """
-        return pulumi.get(self, "token_url")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2ClientId(dict):
-    """
-    clientId defines a key of a Secret or ConfigMap containing the
-    OAuth2 client's ID.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsOauth2ClientId. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsOauth2ClientId.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsOauth2ClientId.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.ServiceMonitorSpecEndpointsOauth2ClientIdConfigMap'] = None,
-                 secret: Optional['outputs.ServiceMonitorSpecEndpointsOauth2ClientIdSecret'] = None):
-        """
-        clientId defines a key of a Secret or ConfigMap containing the
-        OAuth2 client's ID.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2ClientIdConfigMap']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2ClientIdSecret']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2ClientIdConfigMap(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatch(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2ClientIdPatch(dict):
-    """
-    clientId defines a key of a Secret or ConfigMap containing the
-    OAuth2 client's ID.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsOauth2ClientIdPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsOauth2ClientIdPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsOauth2ClientIdPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatch'] = None,
-                 secret: Optional['outputs.ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatch'] = None):
-        """
-        clientId defines a key of a Secret or ConfigMap containing the
-        OAuth2 client's ID.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatch']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatch']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2ClientIdSecret(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatch(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2ClientSecret(dict):
-    """
-    clientSecret defines a key of a Secret containing the OAuth2
-    client's secret.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        clientSecret defines a key of a Secret containing the OAuth2
-        client's secret.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2ClientSecretPatch(dict):
-    """
-    clientSecret defines a key of a Secret containing the OAuth2
-    client's secret.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        clientSecret defines a key of a Secret containing the OAuth2
-        client's secret.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2Patch(dict):
-    """
-    oauth2 defines the OAuth2 settings used by the client.
-
-    It requires Prometheus >= 2.27.0.
-
-    Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clientId":
-            suggest = "client_id"
-        elif key == "clientSecret":
-            suggest = "client_secret"
-        elif key == "endpointParams":
-            suggest = "endpoint_params"
-        elif key == "noProxy":
-            suggest = "no_proxy"
-        elif key == "proxyConnectHeader":
-            suggest = "proxy_connect_header"
-        elif key == "proxyFromEnvironment":
-            suggest = "proxy_from_environment"
-        elif key == "proxyUrl":
-            suggest = "proxy_url"
-        elif key == "tlsConfig":
-            suggest = "tls_config"
-        elif key == "tokenUrl":
-            suggest = "token_url"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsOauth2Patch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsOauth2Patch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsOauth2Patch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 client_id: Optional['outputs.ServiceMonitorSpecEndpointsOauth2ClientIdPatch'] = None,
-                 client_secret: Optional['outputs.ServiceMonitorSpecEndpointsOauth2ClientSecretPatch'] = None,
-                 endpoint_params: Optional[Mapping[str, _builtins.str]] = None,
-                 no_proxy: Optional[_builtins.str] = None,
-                 proxy_connect_header: Optional[Mapping[str, Sequence['outputs.ServiceMonitorSpecEndpointsOauth2ProxyConnectHeader']]] = None,
-                 proxy_from_environment: Optional[_builtins.bool] = None,
-                 proxy_url: Optional[_builtins.str] = None,
-                 scopes: Optional[Sequence[_builtins.str]] = None,
-                 tls_config: Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigPatch'] = None,
-                 token_url: Optional[_builtins.str] = None):
-        """
-        oauth2 defines the OAuth2 settings used by the client.
-
-        It requires Prometheus >= 2.27.0.
-
-        Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
-
-        :param Mapping[str, _builtins.str] endpoint_params: endpointParams configures the HTTP parameters to append to the token
-               URL.
-        :param _builtins.str no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-               that should be excluded from proxying. IP and domain names can
-               contain port numbers.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param Mapping[str, Sequence['ServiceMonitorSpecEndpointsOauth2ProxyConnectHeaderArgs']] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
-               proxies during CONNECT requests.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param _builtins.bool proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param _builtins.str proxy_url: proxyUrl defines the HTTP proxy server to use.
-        :param Sequence[_builtins.str] scopes: scopes defines the OAuth2 scopes used for the token request.
-        :param _builtins.str token_url: tokenUrl defines the URL to fetch the token from.
-        """
-        if client_id is not None:
-            pulumi.set(__self__, "client_id", client_id)
-        if client_secret is not None:
-            pulumi.set(__self__, "client_secret", client_secret)
-        if endpoint_params is not None:
-            pulumi.set(__self__, "endpoint_params", endpoint_params)
-        if no_proxy is not None:
-            pulumi.set(__self__, "no_proxy", no_proxy)
-        if proxy_connect_header is not None:
-            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
-        if proxy_from_environment is not None:
-            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
-        if proxy_url is not None:
-            pulumi.set(__self__, "proxy_url", proxy_url)
-        if scopes is not None:
-            pulumi.set(__self__, "scopes", scopes)
-        if tls_config is not None:
-            pulumi.set(__self__, "tls_config", tls_config)
-        if token_url is not None:
-            pulumi.set(__self__, "token_url", token_url)
-
-    @_builtins.property
-    @pulumi.getter(name="clientId")
-    def client_id(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2ClientIdPatch']:
-        return pulumi.get(self, "client_id")
-
-    @_builtins.property
-    @pulumi.getter(name="clientSecret")
-    def client_secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2ClientSecretPatch']:
-        return pulumi.get(self, "client_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="endpointParams")
-    def endpoint_params(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        endpointParams configures the HTTP parameters to append to the token
-        URL.
-        """
-        return pulumi.get(self, "endpoint_params")
-
-    @_builtins.property
-    @pulumi.getter(name="noProxy")
-    def no_proxy(self) -> Optional[_builtins.str]:
-        """
-        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-        that should be excluded from proxying. IP and domain names can
-        contain port numbers.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "no_proxy")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyConnectHeader")
-    def proxy_connect_header(self) -> Optional[Mapping[str, Sequence['outputs.ServiceMonitorSpecEndpointsOauth2ProxyConnectHeader']]]:
-        """
-        proxyConnectHeader optionally specifies headers to send to
-        proxies during CONNECT requests.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_connect_header")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyFromEnvironment")
-    def proxy_from_environment(self) -> Optional[_builtins.bool]:
-        """
-        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_from_environment")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyUrl")
-    def proxy_url(self) -> Optional[_builtins.str]:
-        """
-        proxyUrl defines the HTTP proxy server to use.
-        """
-        return pulumi.get(self, "proxy_url")
-
-    @_builtins.property
-    @pulumi.getter
-    def scopes(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        scopes defines the OAuth2 scopes used for the token request.
-        """
-        return pulumi.get(self, "scopes")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsConfig")
-    def tls_config(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigPatch']:
-        return pulumi.get(self, "tls_config")
-
-    @_builtins.property
-    @pulumi.getter(name="tokenUrl")
-    def token_url(self) -> Optional[_builtins.str]:
-        """
-        tokenUrl defines the URL to fetch the token from.
-        """
-        return pulumi.get(self, "token_url")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2ProxyConnectHeader(dict):
-    """
-    SecretKeySelector selects a key of a Secret.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        SecretKeySelector selects a key of a Secret.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfig(dict):
-    """
-    tlsConfig defines the TLS configuration to use when connecting to the OAuth2 server.
-    It requires Prometheus >= v2.43.0.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "insecureSkipVerify":
-            suggest = "insecure_skip_verify"
-        elif key == "keySecret":
-            suggest = "key_secret"
-        elif key == "maxVersion":
-            suggest = "max_version"
-        elif key == "minVersion":
-            suggest = "min_version"
-        elif key == "serverName":
-            suggest = "server_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsOauth2TlsConfig. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsOauth2TlsConfig.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsOauth2TlsConfig.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 ca: Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCa'] = None,
-                 cert: Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCert'] = None,
-                 insecure_skip_verify: Optional[_builtins.bool] = None,
-                 key_secret: Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecret'] = None,
-                 max_version: Optional[_builtins.str] = None,
-                 min_version: Optional[_builtins.str] = None,
-                 server_name: Optional[_builtins.str] = None):
-        """
-        tlsConfig defines the TLS configuration to use when connecting to the OAuth2 server.
-        It requires Prometheus >= v2.43.0.
-
-        :param _builtins.bool insecure_skip_verify: insecureSkipVerify defines how to disable target certificate validation.
-        :param _builtins.str max_version: maxVersion defines the maximum acceptable TLS version.
-
-               It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        :param _builtins.str min_version: minVersion defines the minimum acceptable TLS version.
-
-               It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        :param _builtins.str server_name: serverName is used to verify the hostname for the targets.
-        """
-        if ca is not None:
-            pulumi.set(__self__, "ca", ca)
-        if cert is not None:
-            pulumi.set(__self__, "cert", cert)
-        if insecure_skip_verify is not None:
-            pulumi.set(__self__, "insecure_skip_verify", insecure_skip_verify)
-        if key_secret is not None:
-            pulumi.set(__self__, "key_secret", key_secret)
-        if max_version is not None:
-            pulumi.set(__self__, "max_version", max_version)
-        if min_version is not None:
-            pulumi.set(__self__, "min_version", min_version)
-        if server_name is not None:
-            pulumi.set(__self__, "server_name", server_name)
-
-    @_builtins.property
-    @pulumi.getter
-    def ca(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCa']:
-        return pulumi.get(self, "ca")
-
-    @_builtins.property
-    @pulumi.getter
-    def cert(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCert']:
-        return pulumi.get(self, "cert")
-
-    @_builtins.property
-    @pulumi.getter(name="insecureSkipVerify")
-    def insecure_skip_verify(self) -> Optional[_builtins.bool]:
-        """
-        insecureSkipVerify defines how to disable target certificate validation.
-        """
-        return pulumi.get(self, "insecure_skip_verify")
-
-    @_builtins.property
-    @pulumi.getter(name="keySecret")
-    def key_secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecret']:
-        return pulumi.get(self, "key_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="maxVersion")
-    def max_version(self) -> Optional[_builtins.str]:
-        """
-        maxVersion defines the maximum acceptable TLS version.
-
-        It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        """
-        return pulumi.get(self, "max_version")
-
-    @_builtins.property
-    @pulumi.getter(name="minVersion")
-    def min_version(self) -> Optional[_builtins.str]:
-        """
-        minVersion defines the minimum acceptable TLS version.
-
-        It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        """
-        return pulumi.get(self, "min_version")
-
-    @_builtins.property
-    @pulumi.getter(name="serverName")
-    def server_name(self) -> Optional[_builtins.str]:
-        """
-        serverName is used to verify the hostname for the targets.
-        """
-        return pulumi.get(self, "server_name")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCa(dict):
-    """
-    ca defines the Certificate authority used when verifying server certificates.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsOauth2TlsConfigCa. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsOauth2TlsConfigCa.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsOauth2TlsConfigCa.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMap'] = None,
-                 secret: Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecret'] = None):
-        """
-        ca defines the Certificate authority used when verifying server certificates.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMap']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecret']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMap(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatch(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatch(dict):
-    """
-    ca defines the Certificate authority used when verifying server certificates.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatch'] = None,
-                 secret: Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatch'] = None):
-        """
-        ca defines the Certificate authority used when verifying server certificates.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatch']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatch']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecret(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatch(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCert(dict):
-    """
-    cert defines the Client certificate to present when doing client-authentication.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsOauth2TlsConfigCert. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsOauth2TlsConfigCert.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsOauth2TlsConfigCert.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMap'] = None,
-                 secret: Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecret'] = None):
-        """
-        cert defines the Client certificate to present when doing client-authentication.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMap']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecret']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMap(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatch(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatch(dict):
-    """
-    cert defines the Client certificate to present when doing client-authentication.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatch'] = None,
-                 secret: Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatch'] = None):
-        """
-        cert defines the Client certificate to present when doing client-authentication.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatch']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatch']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecret(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatch(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecret(dict):
-    """
-    keySecret defines the Secret containing the client key file for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        keySecret defines the Secret containing the client key file for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatch(dict):
-    """
-    keySecret defines the Secret containing the client key file for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        keySecret defines the Secret containing the client key file for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsOauth2TlsConfigPatch(dict):
-    """
-    tlsConfig defines the TLS configuration to use when connecting to the OAuth2 server.
-    It requires Prometheus >= v2.43.0.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "insecureSkipVerify":
-            suggest = "insecure_skip_verify"
-        elif key == "keySecret":
-            suggest = "key_secret"
-        elif key == "maxVersion":
-            suggest = "max_version"
-        elif key == "minVersion":
-            suggest = "min_version"
-        elif key == "serverName":
-            suggest = "server_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsOauth2TlsConfigPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsOauth2TlsConfigPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsOauth2TlsConfigPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 ca: Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatch'] = None,
-                 cert: Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatch'] = None,
-                 insecure_skip_verify: Optional[_builtins.bool] = None,
-                 key_secret: Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatch'] = None,
-                 max_version: Optional[_builtins.str] = None,
-                 min_version: Optional[_builtins.str] = None,
-                 server_name: Optional[_builtins.str] = None):
-        """
-        tlsConfig defines the TLS configuration to use when connecting to the OAuth2 server.
-        It requires Prometheus >= v2.43.0.
-
-        :param _builtins.bool insecure_skip_verify: insecureSkipVerify defines how to disable target certificate validation.
-        :param _builtins.str max_version: maxVersion defines the maximum acceptable TLS version.
-
-               It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        :param _builtins.str min_version: minVersion defines the minimum acceptable TLS version.
-
-               It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        :param _builtins.str server_name: serverName is used to verify the hostname for the targets.
-        """
-        if ca is not None:
-            pulumi.set(__self__, "ca", ca)
-        if cert is not None:
-            pulumi.set(__self__, "cert", cert)
-        if insecure_skip_verify is not None:
-            pulumi.set(__self__, "insecure_skip_verify", insecure_skip_verify)
-        if key_secret is not None:
-            pulumi.set(__self__, "key_secret", key_secret)
-        if max_version is not None:
-            pulumi.set(__self__, "max_version", max_version)
-        if min_version is not None:
-            pulumi.set(__self__, "min_version", min_version)
-        if server_name is not None:
-            pulumi.set(__self__, "server_name", server_name)
-
-    @_builtins.property
-    @pulumi.getter
-    def ca(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatch']:
-        return pulumi.get(self, "ca")
-
-    @_builtins.property
-    @pulumi.getter
-    def cert(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatch']:
-        return pulumi.get(self, "cert")
-
-    @_builtins.property
-    @pulumi.getter(name="insecureSkipVerify")
-    def insecure_skip_verify(self) -> Optional[_builtins.bool]:
-        """
-        insecureSkipVerify defines how to disable target certificate validation.
-        """
-        return pulumi.get(self, "insecure_skip_verify")
-
-    @_builtins.property
-    @pulumi.getter(name="keySecret")
-    def key_secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatch']:
-        return pulumi.get(self, "key_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="maxVersion")
-    def max_version(self) -> Optional[_builtins.str]:
-        """
-        maxVersion defines the maximum acceptable TLS version.
-
-        It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        """
-        return pulumi.get(self, "max_version")
-
-    @_builtins.property
-    @pulumi.getter(name="minVersion")
-    def min_version(self) -> Optional[_builtins.str]:
-        """
-        minVersion defines the minimum acceptable TLS version.
-
-        It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        """
-        return pulumi.get(self, "min_version")
-
-    @_builtins.property
-    @pulumi.getter(name="serverName")
-    def server_name(self) -> Optional[_builtins.str]:
-        """
-        serverName is used to verify the hostname for the targets.
-        """
-        return pulumi.get(self, "server_name")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsPatch(dict):
-    """
-    Endpoint defines an endpoint serving Prometheus metrics to be scraped by
-    Prometheus.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "basicAuth":
-            suggest = "basic_auth"
-        elif key == "bearerTokenFile":
-            suggest = "bearer_token_file"
-        elif key == "bearerTokenSecret":
-            suggest = "bearer_token_secret"
-        elif key == "enableHttp2":
-            suggest = "enable_http2"
-        elif key == "filterRunning":
-            suggest = "filter_running"
-        elif key == "followRedirects":
-            suggest = "follow_redirects"
-        elif key == "honorLabels":
-            suggest = "honor_labels"
-        elif key == "honorTimestamps":
-            suggest = "honor_timestamps"
-        elif key == "metricRelabelings":
-            suggest = "metric_relabelings"
-        elif key == "noProxy":
-            suggest = "no_proxy"
-        elif key == "proxyConnectHeader":
-            suggest = "proxy_connect_header"
-        elif key == "proxyFromEnvironment":
-            suggest = "proxy_from_environment"
-        elif key == "proxyUrl":
-            suggest = "proxy_url"
-        elif key == "scrapeTimeout":
-            suggest = "scrape_timeout"
-        elif key == "targetPort":
-            suggest = "target_port"
-        elif key == "tlsConfig":
-            suggest = "tls_config"
-        elif key == "trackTimestampsStaleness":
-            suggest = "track_timestamps_staleness"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 authorization: Optional['outputs.ServiceMonitorSpecEndpointsAuthorizationPatch'] = None,
-                 basic_auth: Optional['outputs.ServiceMonitorSpecEndpointsBasicAuthPatch'] = None,
-                 bearer_token_file: Optional[_builtins.str] = None,
-                 bearer_token_secret: Optional['outputs.ServiceMonitorSpecEndpointsBearerTokenSecretPatch'] = None,
-                 enable_http2: Optional[_builtins.bool] = None,
-                 filter_running: Optional[_builtins.bool] = None,
-                 follow_redirects: Optional[_builtins.bool] = None,
-                 honor_labels: Optional[_builtins.bool] = None,
-                 honor_timestamps: Optional[_builtins.bool] = None,
-                 interval: Optional[_builtins.str] = None,
-                 metric_relabelings: Optional[Sequence['outputs.ServiceMonitorSpecEndpointsMetricRelabelingsPatch']] = None,
-                 no_proxy: Optional[_builtins.str] = None,
-                 oauth2: Optional['outputs.ServiceMonitorSpecEndpointsOauth2Patch'] = None,
-                 params: Optional[Mapping[str, Sequence[_builtins.str]]] = None,
-                 path: Optional[_builtins.str] = None,
-                 port: Optional[_builtins.str] = None,
-                 proxy_connect_header: Optional[Mapping[str, Sequence['outputs.ServiceMonitorSpecEndpointsProxyConnectHeader']]] = None,
-                 proxy_from_environment: Optional[_builtins.bool] = None,
-                 proxy_url: Optional[_builtins.str] = None,
-                 relabelings: Optional[Sequence['outputs.ServiceMonitorSpecEndpointsRelabelingsPatch']] = None,
-                 scheme: Optional[_builtins.str] = None,
-                 scrape_timeout: Optional[_builtins.str] = None,
-                 target_port: Optional[Any] = None,
-                 tls_config: Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigPatch'] = None,
-                 track_timestamps_staleness: Optional[_builtins.bool] = None):
-        """
-        Endpoint defines an endpoint serving Prometheus metrics to be scraped by
-        Prometheus.
-
-        :param _builtins.str bearer_token_file: bearerTokenFile defines the file to read bearer token for scraping the target.
-
-               Deprecated: use `authorization` instead.
-        :param _builtins.bool enable_http2: enableHttp2 can be used to disable HTTP2.
-        :param _builtins.bool filter_running: filterRunning when true, the pods which are not running (e.g. either in Failed or
-               Succeeded state) are dropped during the target discovery.
-
-               If unset, the filtering is enabled.
-
-               More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-        :param _builtins.bool follow_redirects: followRedirects defines whether the client should follow HTTP 3xx
-               redirects.
-        :param _builtins.bool honor_labels: honorLabels defines when true the metric's labels when they collide
-               with the target's labels.
-        :param _builtins.bool honor_timestamps: honorTimestamps defines whether Prometheus preserves the timestamps
-               when exposed by the target.
-        :param _builtins.str interval: interval at which Prometheus scrapes the metrics from the target.
-
-               If empty, Prometheus uses the global scrape interval.
-        :param Sequence['ServiceMonitorSpecEndpointsMetricRelabelingsPatchArgs'] metric_relabelings: metricRelabelings defines the relabeling rules to apply to the
-               samples before ingestion.
-        :param _builtins.str no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-               that should be excluded from proxying. IP and domain names can
-               contain port numbers.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param Mapping[str, Sequence[_builtins.str]] params: params define optional HTTP URL parameters.
-        :param _builtins.str path: path defines the HTTP path from which to scrape for metrics.
-
-               If empty, Prometheus uses the default value (e.g. `/metrics`).
-        :param _builtins.str port: port defines the name of the Service port which this endpoint refers to.
-
-               It takes precedence over `targetPort`.
-        :param Mapping[str, Sequence['ServiceMonitorSpecEndpointsProxyConnectHeaderArgs']] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
-               proxies during CONNECT requests.
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param _builtins.bool proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        :param _builtins.str proxy_url: proxyUrl defines the HTTP proxy server to use.
-        :param Sequence['ServiceMonitorSpecEndpointsRelabelingsPatchArgs'] relabelings: relabelings defines the relabeling rules to apply the target's
-               metadata labels.
-
-               The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-               The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-               More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-        :param _builtins.str scheme: scheme defines the HTTP scheme to use when scraping the metrics.
-        :param _builtins.str scrape_timeout: scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-               If empty, Prometheus uses the global scrape timeout unless it is less
-               than the target's scrape interval value in which the latter is used.
-               The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-        :param Union[_builtins.int, _builtins.str] target_port: targetPort defines the name or number of the target port of the `Pod` object behind the
-               Service. The port must be specified with the container's port property.
-        :param _builtins.bool track_timestamps_staleness: trackTimestampsStaleness defines whether Prometheus tracks staleness of
-               the metrics that have an explicit timestamp present in scraped data.
-               Has no effect if `honorTimestamps` is false.
-
-               It requires Prometheus >= v2.48.0.
-        """
-        if authorization is not None:
-            pulumi.set(__self__, "authorization", authorization)
-        if basic_auth is not None:
-            pulumi.set(__self__, "basic_auth", basic_auth)
-        if bearer_token_file is not None:
-            pulumi.set(__self__, "bearer_token_file", bearer_token_file)
-        if bearer_token_secret is not None:
-            pulumi.set(__self__, "bearer_token_secret", bearer_token_secret)
-        if enable_http2 is not None:
-            pulumi.set(__self__, "enable_http2", enable_http2)
-        if filter_running is not None:
-            pulumi.set(__self__, "filter_running", filter_running)
-        if follow_redirects is not None:
-            pulumi.set(__self__, "follow_redirects", follow_redirects)
-        if honor_labels is not None:
-            pulumi.set(__self__, "honor_labels", honor_labels)
-        if honor_timestamps is not None:
-            pulumi.set(__self__, "honor_timestamps", honor_timestamps)
-        if interval is not None:
-            pulumi.set(__self__, "interval", interval)
-        if metric_relabelings is not None:
-            pulumi.set(__self__, "metric_relabelings", metric_relabelings)
-        if no_proxy is not None:
-            pulumi.set(__self__, "no_proxy", no_proxy)
-        if oauth2 is not None:
-            pulumi.set(__self__, "oauth2", oauth2)
-        if params is not None:
-            pulumi.set(__self__, "params", params)
-        if path is not None:
-            pulumi.set(__self__, "path", path)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if proxy_connect_header is not None:
-            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
-        if proxy_from_environment is not None:
-            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
-        if proxy_url is not None:
-            pulumi.set(__self__, "proxy_url", proxy_url)
-        if relabelings is not None:
-            pulumi.set(__self__, "relabelings", relabelings)
-        if scheme is not None:
-            pulumi.set(__self__, "scheme", scheme)
-        if scrape_timeout is not None:
-            pulumi.set(__self__, "scrape_timeout", scrape_timeout)
-        if target_port is not None:
-            pulumi.set(__self__, "target_port", target_port)
-        if tls_config is not None:
-            pulumi.set(__self__, "tls_config", tls_config)
-        if track_timestamps_staleness is not None:
-            pulumi.set(__self__, "track_timestamps_staleness", track_timestamps_staleness)
-
-    @_builtins.property
-    @pulumi.getter
-    def authorization(self) -> Optional['outputs.ServiceMonitorSpecEndpointsAuthorizationPatch']:
-        return pulumi.get(self, "authorization")
-
-    @_builtins.property
-    @pulumi.getter(name="basicAuth")
-    def basic_auth(self) -> Optional['outputs.ServiceMonitorSpecEndpointsBasicAuthPatch']:
-        return pulumi.get(self, "basic_auth")
-
-    @_builtins.property
-    @pulumi.getter(name="bearerTokenFile")
-    def bearer_token_file(self) -> Optional[_builtins.str]:
-        """
-        bearerTokenFile defines the file to read bearer token for scraping the target.
-
-        Deprecated: use `authorization` instead.
-        """
-        return pulumi.get(self, "bearer_token_file")
-
-    @_builtins.property
-    @pulumi.getter(name="bearerTokenSecret")
-    def bearer_token_secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsBearerTokenSecretPatch']:
-        return pulumi.get(self, "bearer_token_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="enableHttp2")
-    def enable_http2(self) -> Optional[_builtins.bool]:
-        """
-        enableHttp2 can be used to disable HTTP2.
-        """
-        return pulumi.get(self, "enable_http2")
-
-    @_builtins.property
-    @pulumi.getter(name="filterRunning")
-    def filter_running(self) -> Optional[_builtins.bool]:
-        """
-        filterRunning when true, the pods which are not running (e.g. either in Failed or
-        Succeeded state) are dropped during the target discovery.
-
-        If unset, the filtering is enabled.
-
-        More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
-        """
-        return pulumi.get(self, "filter_running")
-
-    @_builtins.property
-    @pulumi.getter(name="followRedirects")
-    def follow_redirects(self) -> Optional[_builtins.bool]:
-        """
-        followRedirects defines whether the client should follow HTTP 3xx
-        redirects.
-        """
-        return pulumi.get(self, "follow_redirects")
-
-    @_builtins.property
-    @pulumi.getter(name="honorLabels")
-    def honor_labels(self) -> Optional[_builtins.bool]:
-        """
-        honorLabels defines when true the metric's labels when they collide
-        with the target's labels.
-        """
-        return pulumi.get(self, "honor_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="honorTimestamps")
-    def honor_timestamps(self) -> Optional[_builtins.bool]:
-        """
-        honorTimestamps defines whether Prometheus preserves the timestamps
-        when exposed by the target.
-        """
-        return pulumi.get(self, "honor_timestamps")
-
-    @_builtins.property
-    @pulumi.getter
-    def interval(self) -> Optional[_builtins.str]:
-        """
-        interval at which Prometheus scrapes the metrics from the target.
-
-        If empty, Prometheus uses the global scrape interval.
-        """
-        return pulumi.get(self, "interval")
-
-    @_builtins.property
-    @pulumi.getter(name="metricRelabelings")
-    def metric_relabelings(self) -> Optional[Sequence['outputs.ServiceMonitorSpecEndpointsMetricRelabelingsPatch']]:
-        """
-        metricRelabelings defines the relabeling rules to apply to the
-        samples before ingestion.
-        """
-        return pulumi.get(self, "metric_relabelings")
-
-    @_builtins.property
-    @pulumi.getter(name="noProxy")
-    def no_proxy(self) -> Optional[_builtins.str]:
-        """
-        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
-        that should be excluded from proxying. IP and domain names can
-        contain port numbers.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "no_proxy")
-
-    @_builtins.property
-    @pulumi.getter
-    def oauth2(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2Patch']:
-        return pulumi.get(self, "oauth2")
-
-    @_builtins.property
-    @pulumi.getter
-    def params(self) -> Optional[Mapping[str, Sequence[_builtins.str]]]:
-        """
-        params define optional HTTP URL parameters.
-        """
-        return pulumi.get(self, "params")
-
-    @_builtins.property
-    @pulumi.getter
-    def path(self) -> Optional[_builtins.str]:
-        """
-        path defines the HTTP path from which to scrape for metrics.
-
-        If empty, Prometheus uses the default value (e.g. `/metrics`).
-        """
-        return pulumi.get(self, "path")
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> Optional[_builtins.str]:
-        """
-        port defines the name of the Service port which this endpoint refers to.
-
-        It takes precedence over `targetPort`.
-        """
-        return pulumi.get(self, "port")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyConnectHeader")
-    def proxy_connect_header(self) -> Optional[Mapping[str, Sequence['outputs.ServiceMonitorSpecEndpointsProxyConnectHeader']]]:
-        """
-        proxyConnectHeader optionally specifies headers to send to
-        proxies during CONNECT requests.
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_connect_header")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyFromEnvironment")
-    def proxy_from_environment(self) -> Optional[_builtins.bool]:
-        """
-        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
-
-        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
-        """
-        return pulumi.get(self, "proxy_from_environment")
-
-    @_builtins.property
-    @pulumi.getter(name="proxyUrl")
-    def proxy_url(self) -> Optional[_builtins.str]:
-        """
-        proxyUrl defines the HTTP proxy server to use.
-        """
-        return pulumi.get(self, "proxy_url")
-
-    @_builtins.property
-    @pulumi.getter
-    def relabelings(self) -> Optional[Sequence['outputs.ServiceMonitorSpecEndpointsRelabelingsPatch']]:
-        """
-        relabelings defines the relabeling rules to apply the target's
-        metadata labels.
-
-        The Operator automatically adds relabelings for a few standard Kubernetes fields.
-
-        The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-        """
-        return pulumi.get(self, "relabelings")
-
-    @_builtins.property
-    @pulumi.getter
-    def scheme(self) -> Optional[_builtins.str]:
-        """
-        scheme defines the HTTP scheme to use when scraping the metrics.
-        """
-        return pulumi.get(self, "scheme")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeTimeout")
-    def scrape_timeout(self) -> Optional[_builtins.str]:
-        """
-        scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
-
-        If empty, Prometheus uses the global scrape timeout unless it is less
-        than the target's scrape interval value in which the latter is used.
-        The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
-        """
-        return pulumi.get(self, "scrape_timeout")
-
-    @_builtins.property
-    @pulumi.getter(name="targetPort")
-    def target_port(self) -> Optional[Any]:
-        """
-        targetPort defines the name or number of the target port of the `Pod` object behind the
-        Service. The port must be specified with the container's port property.
-        """
-        return pulumi.get(self, "target_port")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsConfig")
-    def tls_config(self) -> Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigPatch']:
-        return pulumi.get(self, "tls_config")
-
-    @_builtins.property
-    @pulumi.getter(name="trackTimestampsStaleness")
-    def track_timestamps_staleness(self) -> Optional[_builtins.bool]:
-        """
-        trackTimestampsStaleness defines whether Prometheus tracks staleness of
-        the metrics that have an explicit timestamp present in scraped data.
-        Has no effect if `honorTimestamps` is false.
-
-        It requires Prometheus >= v2.48.0.
-        """
-        return pulumi.get(self, "track_timestamps_staleness")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsProxyConnectHeader(dict):
-    """
-    SecretKeySelector selects a key of a Secret.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        SecretKeySelector selects a key of a Secret.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsRelabelings(dict):
-    """
-    RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-    scraped samples and remote write samples.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "sourceLabels":
-            suggest = "source_labels"
-        elif key == "targetLabel":
-            suggest = "target_label"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsRelabelings. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsRelabelings.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsRelabelings.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 action: Optional[_builtins.str] = None,
-                 modulus: Optional[_builtins.int] = None,
-                 regex: Optional[_builtins.str] = None,
-                 replacement: Optional[_builtins.str] = None,
-                 separator: Optional[_builtins.str] = None,
-                 source_labels: Optional[Sequence[_builtins.str]] = None,
-                 target_label: Optional[_builtins.str] = None):
-        """
-        RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-        scraped samples and remote write samples.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-
-        :param _builtins.str action: action to perform based on the regex matching.
-
-               `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-               `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-               Default: "Replace"
-        :param _builtins.int modulus: modulus to take of the hash of the source label values.
-
-               Only applicable when the action is `HashMod`.
-        :param _builtins.str regex: regex defines the regular expression against which the extracted value is matched.
-        :param _builtins.str replacement: replacement value against which a Replace action is performed if the
-               regular expression matches.
-
-               Regex capture groups are available.
-        :param _builtins.str separator: separator defines the string between concatenated SourceLabels.
-        :param Sequence[_builtins.str] source_labels: sourceLabels defines the source labels select values from existing labels. Their content is
-               concatenated using the configured Separator and matched against the
-               configured regular expression.
-        :param _builtins.str target_label: targetLabel defines the label to which the resulting string is written in a replacement.
-
-               It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-               `KeepEqual` and `DropEqual` actions.
-
-               Regex capture groups are available.
-        """
-        if action is not None:
-            pulumi.set(__self__, "action", action)
-        if modulus is not None:
-            pulumi.set(__self__, "modulus", modulus)
-        if regex is not None:
-            pulumi.set(__self__, "regex", regex)
-        if replacement is not None:
-            pulumi.set(__self__, "replacement", replacement)
-        if separator is not None:
-            pulumi.set(__self__, "separator", separator)
-        if source_labels is not None:
-            pulumi.set(__self__, "source_labels", source_labels)
-        if target_label is not None:
-            pulumi.set(__self__, "target_label", target_label)
-
-    @_builtins.property
-    @pulumi.getter
-    def action(self) -> Optional[_builtins.str]:
-        """
-        action to perform based on the regex matching.
-
-        `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-        `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-        Default: "Replace"
-        """
-        return pulumi.get(self, "action")
-
-    @_builtins.property
-    @pulumi.getter
-    def modulus(self) -> Optional[_builtins.int]:
-        """
-        modulus to take of the hash of the source label values.
-
-        Only applicable when the action is `HashMod`.
-        """
-        return pulumi.get(self, "modulus")
-
-    @_builtins.property
-    @pulumi.getter
-    def regex(self) -> Optional[_builtins.str]:
-        """
-        regex defines the regular expression against which the extracted value is matched.
-        """
-        return pulumi.get(self, "regex")
-
-    @_builtins.property
-    @pulumi.getter
-    def replacement(self) -> Optional[_builtins.str]:
-        """
-        replacement value against which a Replace action is performed if the
-        regular expression matches.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "replacement")
-
-    @_builtins.property
-    @pulumi.getter
-    def separator(self) -> Optional[_builtins.str]:
-        """
-        separator defines the string between concatenated SourceLabels.
-        """
-        return pulumi.get(self, "separator")
-
-    @_builtins.property
-    @pulumi.getter(name="sourceLabels")
-    def source_labels(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        sourceLabels defines the source labels select values from existing labels. Their content is
-        concatenated using the configured Separator and matched against the
-        configured regular expression.
-        """
-        return pulumi.get(self, "source_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabel")
-    def target_label(self) -> Optional[_builtins.str]:
-        """
-        targetLabel defines the label to which the resulting string is written in a replacement.
-
-        It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-        `KeepEqual` and `DropEqual` actions.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "target_label")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsRelabelingsPatch(dict):
-    """
-    RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-    scraped samples and remote write samples.
-
-    More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "sourceLabels":
-            suggest = "source_labels"
-        elif key == "targetLabel":
-            suggest = "target_label"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsRelabelingsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsRelabelingsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsRelabelingsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 action: Optional[_builtins.str] = None,
-                 modulus: Optional[_builtins.int] = None,
-                 regex: Optional[_builtins.str] = None,
-                 replacement: Optional[_builtins.str] = None,
-                 separator: Optional[_builtins.str] = None,
-                 source_labels: Optional[Sequence[_builtins.str]] = None,
-                 target_label: Optional[_builtins.str] = None):
-        """
-        RelabelConfig allows dynamic rewriting of the label set for targets, alerts,
-        scraped samples and remote write samples.
-
-        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
-
-        :param _builtins.str action: action to perform based on the regex matching.
-
-               `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-               `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-               Default: "Replace"
-        :param _builtins.int modulus: modulus to take of the hash of the source label values.
-
-               Only applicable when the action is `HashMod`.
-        :param _builtins.str regex: regex defines the regular expression against which the extracted value is matched.
-        :param _builtins.str replacement: replacement value against which a Replace action is performed if the
-               regular expression matches.
-
-               Regex capture groups are available.
-        :param _builtins.str separator: separator defines the string between concatenated SourceLabels.
-        :param Sequence[_builtins.str] source_labels: sourceLabels defines the source labels select values from existing labels. Their content is
-               concatenated using the configured Separator and matched against the
-               configured regular expression.
-        :param _builtins.str target_label: targetLabel defines the label to which the resulting string is written in a replacement.
-
-               It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-               `KeepEqual` and `DropEqual` actions.
-
-               Regex capture groups are available.
-        """
-        if action is not None:
-            pulumi.set(__self__, "action", action)
-        if modulus is not None:
-            pulumi.set(__self__, "modulus", modulus)
-        if regex is not None:
-            pulumi.set(__self__, "regex", regex)
-        if replacement is not None:
-            pulumi.set(__self__, "replacement", replacement)
-        if separator is not None:
-            pulumi.set(__self__, "separator", separator)
-        if source_labels is not None:
-            pulumi.set(__self__, "source_labels", source_labels)
-        if target_label is not None:
-            pulumi.set(__self__, "target_label", target_label)
-
-    @_builtins.property
-    @pulumi.getter
-    def action(self) -> Optional[_builtins.str]:
-        """
-        action to perform based on the regex matching.
-
-        `Uppercase` and `Lowercase` actions require Prometheus >= v2.36.0.
-        `DropEqual` and `KeepEqual` actions require Prometheus >= v2.41.0.
-
-        Default: "Replace"
-        """
-        return pulumi.get(self, "action")
-
-    @_builtins.property
-    @pulumi.getter
-    def modulus(self) -> Optional[_builtins.int]:
-        """
-        modulus to take of the hash of the source label values.
-
-        Only applicable when the action is `HashMod`.
-        """
-        return pulumi.get(self, "modulus")
-
-    @_builtins.property
-    @pulumi.getter
-    def regex(self) -> Optional[_builtins.str]:
-        """
-        regex defines the regular expression against which the extracted value is matched.
-        """
-        return pulumi.get(self, "regex")
-
-    @_builtins.property
-    @pulumi.getter
-    def replacement(self) -> Optional[_builtins.str]:
-        """
-        replacement value against which a Replace action is performed if the
-        regular expression matches.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "replacement")
-
-    @_builtins.property
-    @pulumi.getter
-    def separator(self) -> Optional[_builtins.str]:
-        """
-        separator defines the string between concatenated SourceLabels.
-        """
-        return pulumi.get(self, "separator")
-
-    @_builtins.property
-    @pulumi.getter(name="sourceLabels")
-    def source_labels(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        sourceLabels defines the source labels select values from existing labels. Their content is
-        concatenated using the configured Separator and matched against the
-        configured regular expression.
-        """
-        return pulumi.get(self, "source_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabel")
-    def target_label(self) -> Optional[_builtins.str]:
-        """
-        targetLabel defines the label to which the resulting string is written in a replacement.
-
-        It is mandatory for `Replace`, `HashMod`, `Lowercase`, `Uppercase`,
-        `KeepEqual` and `DropEqual` actions.
-
-        Regex capture groups are available.
-        """
-        return pulumi.get(self, "target_label")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsTlsConfig(dict):
-    """
-    tlsConfig defines TLS configuration used by the client.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "caFile":
-            suggest = "ca_file"
-        elif key == "certFile":
-            suggest = "cert_file"
-        elif key == "insecureSkipVerify":
-            suggest = "insecure_skip_verify"
-        elif key == "keyFile":
-            suggest = "key_file"
-        elif key == "keySecret":
-            suggest = "key_secret"
-        elif key == "maxVersion":
-            suggest = "max_version"
-        elif key == "minVersion":
-            suggest = "min_version"
-        elif key == "serverName":
-            suggest = "server_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsTlsConfig. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsTlsConfig.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsTlsConfig.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 ca: Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCa'] = None,
-                 ca_file: Optional[_builtins.str] = None,
-                 cert: Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCert'] = None,
-                 cert_file: Optional[_builtins.str] = None,
-                 insecure_skip_verify: Optional[_builtins.bool] = None,
-                 key_file: Optional[_builtins.str] = None,
-                 key_secret: Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigKeySecret'] = None,
-                 max_version: Optional[_builtins.str] = None,
-                 min_version: Optional[_builtins.str] = None,
-                 server_name: Optional[_builtins.str] = None):
-        """
-        tlsConfig defines TLS configuration used by the client.
-
-        :param _builtins.str ca_file: caFile defines the path to the CA cert in the Prometheus container to use for the targets.
-        :param _builtins.str cert_file: certFile defines the path to the client cert file in the Prometheus container for the targets.
-        :param _builtins.bool insecure_skip_verify: insecureSkipVerify defines how to disable target certificate validation.
-        :param _builtins.str key_file: keyFile defines the path to the client key file in the Prometheus container for the targets.
-        :param _builtins.str max_version: maxVersion defines the maximum acceptable TLS version.
-
-               It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        :param _builtins.str min_version: minVersion defines the minimum acceptable TLS version.
-
-               It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        :param _builtins.str server_name: serverName is used to verify the hostname for the targets.
-        """
-        if ca is not None:
-            pulumi.set(__self__, "ca", ca)
-        if ca_file is not None:
-            pulumi.set(__self__, "ca_file", ca_file)
-        if cert is not None:
-            pulumi.set(__self__, "cert", cert)
-        if cert_file is not None:
-            pulumi.set(__self__, "cert_file", cert_file)
-        if insecure_skip_verify is not None:
-            pulumi.set(__self__, "insecure_skip_verify", insecure_skip_verify)
-        if key_file is not None:
-            pulumi.set(__self__, "key_file", key_file)
-        if key_secret is not None:
-            pulumi.set(__self__, "key_secret", key_secret)
-        if max_version is not None:
-            pulumi.set(__self__, "max_version", max_version)
-        if min_version is not None:
-            pulumi.set(__self__, "min_version", min_version)
-        if server_name is not None:
-            pulumi.set(__self__, "server_name", server_name)
-
-    @_builtins.property
-    @pulumi.getter
-    def ca(self) -> Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCa']:
-        return pulumi.get(self, "ca")
-
-    @_builtins.property
-    @pulumi.getter(name="caFile")
-    def ca_file(self) -> Optional[_builtins.str]:
-        """
-        caFile defines the path to the CA cert in the Prometheus container to use for the targets.
-        """
-        return pulumi.get(self, "ca_file")
-
-    @_builtins.property
-    @pulumi.getter
-    def cert(self) -> Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCert']:
-        return pulumi.get(self, "cert")
-
-    @_builtins.property
-    @pulumi.getter(name="certFile")
-    def cert_file(self) -> Optional[_builtins.str]:
-        """
-        certFile defines the path to the client cert file in the Prometheus container for the targets.
-        """
-        return pulumi.get(self, "cert_file")
-
-    @_builtins.property
-    @pulumi.getter(name="insecureSkipVerify")
-    def insecure_skip_verify(self) -> Optional[_builtins.bool]:
-        """
-        insecureSkipVerify defines how to disable target certificate validation.
-        """
-        return pulumi.get(self, "insecure_skip_verify")
-
-    @_builtins.property
-    @pulumi.getter(name="keyFile")
-    def key_file(self) -> Optional[_builtins.str]:
-        """
-        keyFile defines the path to the client key file in the Prometheus container for the targets.
-        """
-        return pulumi.get(self, "key_file")
-
-    @_builtins.property
-    @pulumi.getter(name="keySecret")
-    def key_secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigKeySecret']:
-        return pulumi.get(self, "key_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="maxVersion")
-    def max_version(self) -> Optional[_builtins.str]:
-        """
-        maxVersion defines the maximum acceptable TLS version.
-
-        It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        """
-        return pulumi.get(self, "max_version")
-
-    @_builtins.property
-    @pulumi.getter(name="minVersion")
-    def min_version(self) -> Optional[_builtins.str]:
-        """
-        minVersion defines the minimum acceptable TLS version.
-
-        It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        """
-        return pulumi.get(self, "min_version")
-
-    @_builtins.property
-    @pulumi.getter(name="serverName")
-    def server_name(self) -> Optional[_builtins.str]:
-        """
-        serverName is used to verify the hostname for the targets.
-        """
-        return pulumi.get(self, "server_name")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsTlsConfigCa(dict):
-    """
-    ca defines the Certificate authority used when verifying server certificates.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsTlsConfigCa. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsTlsConfigCa.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsTlsConfigCa.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCaConfigMap'] = None,
-                 secret: Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCaSecret'] = None):
-        """
-        ca defines the Certificate authority used when verifying server certificates.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCaConfigMap']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCaSecret']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsTlsConfigCaConfigMap(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatch(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsTlsConfigCaPatch(dict):
-    """
-    ca defines the Certificate authority used when verifying server certificates.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsTlsConfigCaPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsTlsConfigCaPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsTlsConfigCaPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatch'] = None,
-                 secret: Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCaSecretPatch'] = None):
-        """
-        ca defines the Certificate authority used when verifying server certificates.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatch']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCaSecretPatch']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsTlsConfigCaSecret(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsTlsConfigCaSecretPatch(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsTlsConfigCert(dict):
-    """
-    cert defines the Client certificate to present when doing client-authentication.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsTlsConfigCert. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsTlsConfigCert.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsTlsConfigCert.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCertConfigMap'] = None,
-                 secret: Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCertSecret'] = None):
-        """
-        cert defines the Client certificate to present when doing client-authentication.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCertConfigMap']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCertSecret']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsTlsConfigCertConfigMap(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatch(dict):
-    """
-    configMap defines the ConfigMap containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        configMap defines the ConfigMap containing data to use for the targets.
-
-        :param _builtins.str key: The key to select.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the ConfigMap or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key to select.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the ConfigMap or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsTlsConfigCertPatch(dict):
-    """
-    cert defines the Client certificate to present when doing client-authentication.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "configMap":
-            suggest = "config_map"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsTlsConfigCertPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsTlsConfigCertPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsTlsConfigCertPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 config_map: Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatch'] = None,
-                 secret: Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCertSecretPatch'] = None):
-        """
-        cert defines the Client certificate to present when doing client-authentication.
-        """
-        if config_map is not None:
-            pulumi.set(__self__, "config_map", config_map)
-        if secret is not None:
-            pulumi.set(__self__, "secret", secret)
-
-    @_builtins.property
-    @pulumi.getter(name="configMap")
-    def config_map(self) -> Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatch']:
-        return pulumi.get(self, "config_map")
-
-    @_builtins.property
-    @pulumi.getter
-    def secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCertSecretPatch']:
-        return pulumi.get(self, "secret")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsTlsConfigCertSecret(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsTlsConfigCertSecretPatch(dict):
-    """
-    secret defines the Secret containing data to use for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        secret defines the Secret containing data to use for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsTlsConfigKeySecret(dict):
-    """
-    keySecret defines the Secret containing the client key file for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        keySecret defines the Secret containing the client key file for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsTlsConfigKeySecretPatch(dict):
-    """
-    keySecret defines the Secret containing the client key file for the targets.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 optional: Optional[_builtins.bool] = None):
-        """
-        keySecret defines the Secret containing the client key file for the targets.
-
-        :param _builtins.str key: The key of the secret to select from.  Must be a valid secret key.
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        :param _builtins.bool optional: Specify whether the Secret or its key must be defined
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if optional is not None:
-            pulumi.set(__self__, "optional", optional)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The key of the secret to select from.  Must be a valid secret key.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def optional(self) -> Optional[_builtins.bool]:
-        """
-        Specify whether the Secret or its key must be defined
-        """
-        return pulumi.get(self, "optional")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecEndpointsTlsConfigPatch(dict):
-    """
-    tlsConfig defines TLS configuration used by the client.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "caFile":
-            suggest = "ca_file"
-        elif key == "certFile":
-            suggest = "cert_file"
-        elif key == "insecureSkipVerify":
-            suggest = "insecure_skip_verify"
-        elif key == "keyFile":
-            suggest = "key_file"
-        elif key == "keySecret":
-            suggest = "key_secret"
-        elif key == "maxVersion":
-            suggest = "max_version"
-        elif key == "minVersion":
-            suggest = "min_version"
-        elif key == "serverName":
-            suggest = "server_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpointsTlsConfigPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecEndpointsTlsConfigPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecEndpointsTlsConfigPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 ca: Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCaPatch'] = None,
-                 ca_file: Optional[_builtins.str] = None,
-                 cert: Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCertPatch'] = None,
-                 cert_file: Optional[_builtins.str] = None,
-                 insecure_skip_verify: Optional[_builtins.bool] = None,
-                 key_file: Optional[_builtins.str] = None,
-                 key_secret: Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigKeySecretPatch'] = None,
-                 max_version: Optional[_builtins.str] = None,
-                 min_version: Optional[_builtins.str] = None,
-                 server_name: Optional[_builtins.str] = None):
-        """
-        tlsConfig defines TLS configuration used by the client.
-
-        :param _builtins.str ca_file: caFile defines the path to the CA cert in the Prometheus container to use for the targets.
-        :param _builtins.str cert_file: certFile defines the path to the client cert file in the Prometheus container for the targets.
-        :param _builtins.bool insecure_skip_verify: insecureSkipVerify defines how to disable target certificate validation.
-        :param _builtins.str key_file: keyFile defines the path to the client key file in the Prometheus container for the targets.
-        :param _builtins.str max_version: maxVersion defines the maximum acceptable TLS version.
-
-               It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        :param _builtins.str min_version: minVersion defines the minimum acceptable TLS version.
-
-               It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        :param _builtins.str server_name: serverName is used to verify the hostname for the targets.
-        """
-        if ca is not None:
-            pulumi.set(__self__, "ca", ca)
-        if ca_file is not None:
-            pulumi.set(__self__, "ca_file", ca_file)
-        if cert is not None:
-            pulumi.set(__self__, "cert", cert)
-        if cert_file is not None:
-            pulumi.set(__self__, "cert_file", cert_file)
-        if insecure_skip_verify is not None:
-            pulumi.set(__self__, "insecure_skip_verify", insecure_skip_verify)
-        if key_file is not None:
-            pulumi.set(__self__, "key_file", key_file)
-        if key_secret is not None:
-            pulumi.set(__self__, "key_secret", key_secret)
-        if max_version is not None:
-            pulumi.set(__self__, "max_version", max_version)
-        if min_version is not None:
-            pulumi.set(__self__, "min_version", min_version)
-        if server_name is not None:
-            pulumi.set(__self__, "server_name", server_name)
-
-    @_builtins.property
-    @pulumi.getter
-    def ca(self) -> Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCaPatch']:
-        return pulumi.get(self, "ca")
-
-    @_builtins.property
-    @pulumi.getter(name="caFile")
-    def ca_file(self) -> Optional[_builtins.str]:
-        """
-        caFile defines the path to the CA cert in the Prometheus container to use for the targets.
-        """
-        return pulumi.get(self, "ca_file")
-
-    @_builtins.property
-    @pulumi.getter
-    def cert(self) -> Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigCertPatch']:
-        return pulumi.get(self, "cert")
-
-    @_builtins.property
-    @pulumi.getter(name="certFile")
-    def cert_file(self) -> Optional[_builtins.str]:
-        """
-        certFile defines the path to the client cert file in the Prometheus container for the targets.
-        """
-        return pulumi.get(self, "cert_file")
-
-    @_builtins.property
-    @pulumi.getter(name="insecureSkipVerify")
-    def insecure_skip_verify(self) -> Optional[_builtins.bool]:
-        """
-        insecureSkipVerify defines how to disable target certificate validation.
-        """
-        return pulumi.get(self, "insecure_skip_verify")
-
-    @_builtins.property
-    @pulumi.getter(name="keyFile")
-    def key_file(self) -> Optional[_builtins.str]:
-        """
-        keyFile defines the path to the client key file in the Prometheus container for the targets.
-        """
-        return pulumi.get(self, "key_file")
-
-    @_builtins.property
-    @pulumi.getter(name="keySecret")
-    def key_secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsTlsConfigKeySecretPatch']:
-        return pulumi.get(self, "key_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="maxVersion")
-    def max_version(self) -> Optional[_builtins.str]:
-        """
-        maxVersion defines the maximum acceptable TLS version.
-
-        It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
-        """
-        return pulumi.get(self, "max_version")
-
-    @_builtins.property
-    @pulumi.getter(name="minVersion")
-    def min_version(self) -> Optional[_builtins.str]:
-        """
-        minVersion defines the minimum acceptable TLS version.
-
-        It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
-        """
-        return pulumi.get(self, "min_version")
-
-    @_builtins.property
-    @pulumi.getter(name="serverName")
-    def server_name(self) -> Optional[_builtins.str]:
-        """
-        serverName is used to verify the hostname for the targets.
-        """
-        return pulumi.get(self, "server_name")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecNamespaceSelector(dict):
-    """
-    namespaceSelector defines in which namespace(s) Prometheus should discover the services.
-    By default, the services are discovered in the same namespace as the `ServiceMonitor` object but it is possible to select pods across different/all namespaces.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchNames":
-            suggest = "match_names"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecNamespaceSelector. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecNamespaceSelector.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecNamespaceSelector.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 any: Optional[_builtins.bool] = None,
-                 match_names: Optional[Sequence[_builtins.str]] = None):
-        """
-        namespaceSelector defines in which namespace(s) Prometheus should discover the services.
-        By default, the services are discovered in the same namespace as the `ServiceMonitor` object but it is possible to select pods across different/all namespaces.
-
-        :param _builtins.bool any: any defines the boolean describing whether all namespaces are selected in contrast to a
-               list restricting them.
-        :param Sequence[_builtins.str] match_names: matchNames defines the list of namespace names to select from.
-        """
-        if any is not None:
-            pulumi.set(__self__, "any", any)
-        if match_names is not None:
-            pulumi.set(__self__, "match_names", match_names)
-
-    @_builtins.property
-    @pulumi.getter
-    def any(self) -> Optional[_builtins.bool]:
-        """
-        any defines the boolean describing whether all namespaces are selected in contrast to a
-        list restricting them.
-        """
-        return pulumi.get(self, "any")
-
-    @_builtins.property
-    @pulumi.getter(name="matchNames")
-    def match_names(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        matchNames defines the list of namespace names to select from.
-        """
-        return pulumi.get(self, "match_names")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecNamespaceSelectorPatch(dict):
-    """
-    namespaceSelector defines in which namespace(s) Prometheus should discover the services.
-    By default, the services are discovered in the same namespace as the `ServiceMonitor` object but it is possible to select pods across different/all namespaces.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchNames":
-            suggest = "match_names"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecNamespaceSelectorPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecNamespaceSelectorPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecNamespaceSelectorPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 any: Optional[_builtins.bool] = None,
-                 match_names: Optional[Sequence[_builtins.str]] = None):
-        """
-        namespaceSelector defines in which namespace(s) Prometheus should discover the services.
-        By default, the services are discovered in the same namespace as the `ServiceMonitor` object but it is possible to select pods across different/all namespaces.
-
-        :param _builtins.bool any: any defines the boolean describing whether all namespaces are selected in contrast to a
-               list restricting them.
-        :param Sequence[_builtins.str] match_names: matchNames defines the list of namespace names to select from.
-        """
-        if any is not None:
-            pulumi.set(__self__, "any", any)
-        if match_names is not None:
-            pulumi.set(__self__, "match_names", match_names)
-
-    @_builtins.property
-    @pulumi.getter
-    def any(self) -> Optional[_builtins.bool]:
-        """
-        any defines the boolean describing whether all namespaces are selected in contrast to a
-        list restricting them.
-        """
-        return pulumi.get(self, "any")
-
-    @_builtins.property
-    @pulumi.getter(name="matchNames")
-    def match_names(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        matchNames defines the list of namespace names to select from.
-        """
-        return pulumi.get(self, "match_names")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecPatch(dict):
-    """
-    spec defines the specification of desired Service selection for target discovery by
-    Prometheus.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "attachMetadata":
-            suggest = "attach_metadata"
-        elif key == "bodySizeLimit":
-            suggest = "body_size_limit"
-        elif key == "convertClassicHistogramsToNHCB":
-            suggest = "convert_classic_histograms_to_nhcb"
-        elif key == "fallbackScrapeProtocol":
-            suggest = "fallback_scrape_protocol"
-        elif key == "jobLabel":
-            suggest = "job_label"
-        elif key == "keepDroppedTargets":
-            suggest = "keep_dropped_targets"
-        elif key == "labelLimit":
-            suggest = "label_limit"
-        elif key == "labelNameLengthLimit":
-            suggest = "label_name_length_limit"
-        elif key == "labelValueLengthLimit":
-            suggest = "label_value_length_limit"
-        elif key == "namespaceSelector":
-            suggest = "namespace_selector"
-        elif key == "nativeHistogramBucketLimit":
-            suggest = "native_histogram_bucket_limit"
-        elif key == "nativeHistogramMinBucketFactor":
-            suggest = "native_histogram_min_bucket_factor"
-        elif key == "podTargetLabels":
-            suggest = "pod_target_labels"
-        elif key == "sampleLimit":
-            suggest = "sample_limit"
-        elif key == "scrapeClass":
-            suggest = "scrape_class"
-        elif key == "scrapeClassicHistograms":
-            suggest = "scrape_classic_histograms"
-        elif key == "scrapeNativeHistograms":
-            suggest = "scrape_native_histograms"
-        elif key == "scrapeProtocols":
-            suggest = "scrape_protocols"
-        elif key == "selectorMechanism":
-            suggest = "selector_mechanism"
-        elif key == "serviceDiscoveryRole":
-            suggest = "service_discovery_role"
-        elif key == "targetLabels":
-            suggest = "target_labels"
-        elif key == "targetLimit":
-            suggest = "target_limit"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 attach_metadata: Optional['outputs.ServiceMonitorSpecAttachMetadataPatch'] = None,
-                 body_size_limit: Optional[_builtins.str] = None,
-                 convert_classic_histograms_to_nhcb: Optional[_builtins.bool] = None,
-                 endpoints: Optional[Sequence['outputs.ServiceMonitorSpecEndpointsPatch']] = None,
-                 fallback_scrape_protocol: Optional[_builtins.str] = None,
-                 job_label: Optional[_builtins.str] = None,
-                 keep_dropped_targets: Optional[_builtins.int] = None,
-                 label_limit: Optional[_builtins.int] = None,
-                 label_name_length_limit: Optional[_builtins.int] = None,
-                 label_value_length_limit: Optional[_builtins.int] = None,
-                 namespace_selector: Optional['outputs.ServiceMonitorSpecNamespaceSelectorPatch'] = None,
-                 native_histogram_bucket_limit: Optional[_builtins.int] = None,
-                 native_histogram_min_bucket_factor: Optional[Any] = None,
-                 pod_target_labels: Optional[Sequence[_builtins.str]] = None,
-                 sample_limit: Optional[_builtins.int] = None,
-                 scrape_class: Optional[_builtins.str] = None,
-                 scrape_classic_histograms: Optional[_builtins.bool] = None,
-                 scrape_native_histograms: Optional[_builtins.bool] = None,
-                 scrape_protocols: Optional[Sequence[_builtins.str]] = None,
-                 selector: Optional['outputs.ServiceMonitorSpecSelectorPatch'] = None,
-                 selector_mechanism: Optional[_builtins.str] = None,
-                 service_discovery_role: Optional[_builtins.str] = None,
-                 target_labels: Optional[Sequence[_builtins.str]] = None,
-                 target_limit: Optional[_builtins.int] = None):
-        """
-        spec defines the specification of desired Service selection for target discovery by
-        Prometheus.
-
-        :param _builtins.str body_size_limit: bodySizeLimit when defined, bodySizeLimit specifies a job level limit on the size
-               of uncompressed response body that will be accepted by Prometheus.
-
-               It requires Prometheus >= v2.28.0.
-        :param _builtins.bool convert_classic_histograms_to_nhcb: convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-               It requires Prometheus >= v3.0.0.
-        :param Sequence['ServiceMonitorSpecEndpointsPatchArgs'] endpoints: endpoints defines the list of endpoints part of this ServiceMonitor.
-               Defines how to scrape metrics from Kubernetes [Endpoints](https://kubernetes.io/docs/concepts/services-networking/service/#endpoints) objects.
-               In most cases, an Endpoints object is backed by a Kubernetes [Service](https://kubernetes.io/docs/concepts/services-networking/service/) object with the same name and labels.
-        :param _builtins.str fallback_scrape_protocol: fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-               It requires Prometheus >= v3.0.0.
-        :param _builtins.str job_label: jobLabel selects the label from the associated Kubernetes `Service`
-               object which will be used as the `job` label for all metrics.
-
-               For example if `jobLabel` is set to `foo` and the Kubernetes `Service`
-               object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-               label to all ingested metrics.
-
-               If the value of this field is empty or if the label doesn't exist for
-               the given Service, the `job` label of the metrics defaults to the name
-               of the associated Kubernetes `Service`.
-        :param _builtins.int keep_dropped_targets: keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-               that will be kept in memory. 0 means no limit.
-
-               It requires Prometheus >= v2.47.0.
-        :param _builtins.int label_limit: labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param _builtins.int label_name_length_limit: labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param _builtins.int label_value_length_limit: labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-               It requires Prometheus >= v2.27.0.
-        :param _builtins.int native_histogram_bucket_limit: nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-               buckets will be merged to stay within the limit.
-               It requires Prometheus >= v2.45.0.
-        :param Union[_builtins.int, _builtins.str] native_histogram_min_bucket_factor: nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-               buckets will be merged to increase the factor sufficiently.
-               It requires Prometheus >= v2.50.0.
-        :param Sequence[_builtins.str] pod_target_labels: podTargetLabels defines the labels which are transferred from the
-               associated Kubernetes `Pod` object onto the ingested metrics.
-        :param _builtins.int sample_limit: sampleLimit defines a per-scrape limit on the number of scraped samples
-               that will be accepted.
-        :param _builtins.str scrape_class: scrapeClass defines the scrape class to apply.
-        :param _builtins.bool scrape_classic_histograms: scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-               It requires Prometheus >= v2.45.0.
-
-               Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-        :param _builtins.bool scrape_native_histograms: scrapeNativeHistograms defines whether to enable scraping of native histograms.
-               It requires Prometheus >= v3.8.0.
-        :param Sequence[_builtins.str] scrape_protocols: scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-               protocols supported by Prometheus in order of preference (from most to least preferred).
-
-               If unset, Prometheus uses its default value.
-
-               It requires Prometheus >= v2.49.0.
-        :param _builtins.str selector_mechanism: selectorMechanism defines the mechanism used to select the endpoints to scrape.
-               By default, the selection process relies on relabel configurations to filter the discovered targets.
-               Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-               Which strategy is best for your use case needs to be carefully evaluated.
-
-               It requires Prometheus >= v2.17.0.
-        :param _builtins.str service_discovery_role: serviceDiscoveryRole defines the service discovery role used to discover targets.
-
-               If set, the value should be either "Endpoints" or "EndpointSlice".
-               Otherwise it defaults to the value defined in the
-               Prometheus/PrometheusAgent resource.
-        :param Sequence[_builtins.str] target_labels: targetLabels defines the labels which are transferred from the
-               associated Kubernetes `Service` object onto the ingested metrics.
-        :param _builtins.int target_limit: targetLimit defines a limit on the number of scraped targets that will
-               be accepted.
-        """
-        if attach_metadata is not None:
-            pulumi.set(__self__, "attach_metadata", attach_metadata)
-        if body_size_limit is not None:
-            pulumi.set(__self__, "body_size_limit", body_size_limit)
-        if convert_classic_histograms_to_nhcb is not None:
-            pulumi.set(__self__, "convert_classic_histograms_to_nhcb", convert_classic_histograms_to_nhcb)
-        if endpoints is not None:
-            pulumi.set(__self__, "endpoints", endpoints)
-        if fallback_scrape_protocol is not None:
-            pulumi.set(__self__, "fallback_scrape_protocol", fallback_scrape_protocol)
-        if job_label is not None:
-            pulumi.set(__self__, "job_label", job_label)
-        if keep_dropped_targets is not None:
-            pulumi.set(__self__, "keep_dropped_targets", keep_dropped_targets)
-        if label_limit is not None:
-            pulumi.set(__self__, "label_limit", label_limit)
-        if label_name_length_limit is not None:
-            pulumi.set(__self__, "label_name_length_limit", label_name_length_limit)
-        if label_value_length_limit is not None:
-            pulumi.set(__self__, "label_value_length_limit", label_value_length_limit)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if native_histogram_bucket_limit is not None:
-            pulumi.set(__self__, "native_histogram_bucket_limit", native_histogram_bucket_limit)
-        if native_histogram_min_bucket_factor is not None:
-            pulumi.set(__self__, "native_histogram_min_bucket_factor", native_histogram_min_bucket_factor)
-        if pod_target_labels is not None:
-            pulumi.set(__self__, "pod_target_labels", pod_target_labels)
-        if sample_limit is not None:
-            pulumi.set(__self__, "sample_limit", sample_limit)
-        if scrape_class is not None:
-            pulumi.set(__self__, "scrape_class", scrape_class)
-        if scrape_classic_histograms is not None:
-            pulumi.set(__self__, "scrape_classic_histograms", scrape_classic_histograms)
-        if scrape_native_histograms is not None:
-            pulumi.set(__self__, "scrape_native_histograms", scrape_native_histograms)
-        if scrape_protocols is not None:
-            pulumi.set(__self__, "scrape_protocols", scrape_protocols)
-        if selector is not None:
-            pulumi.set(__self__, "selector", selector)
-        if selector_mechanism is not None:
-            pulumi.set(__self__, "selector_mechanism", selector_mechanism)
-        if service_discovery_role is not None:
-            pulumi.set(__self__, "service_discovery_role", service_discovery_role)
-        if target_labels is not None:
-            pulumi.set(__self__, "target_labels", target_labels)
-        if target_limit is not None:
-            pulumi.set(__self__, "target_limit", target_limit)
-
-    @_builtins.property
-    @pulumi.getter(name="attachMetadata")
-    def attach_metadata(self) -> Optional['outputs.ServiceMonitorSpecAttachMetadataPatch']:
-        return pulumi.get(self, "attach_metadata")
-
-    @_builtins.property
-    @pulumi.getter(name="bodySizeLimit")
-    def body_size_limit(self) -> Optional[_builtins.str]:
-        """
-        bodySizeLimit when defined, bodySizeLimit specifies a job level limit on the size
-        of uncompressed response body that will be accepted by Prometheus.
-
-        It requires Prometheus >= v2.28.0.
-        """
-        return pulumi.get(self, "body_size_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="convertClassicHistogramsToNHCB")
-    def convert_classic_histograms_to_nhcb(self) -> Optional[_builtins.bool]:
-        """
-        convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
-        It requires Prometheus >= v3.0.0.
-        """
-        return pulumi.get(self, "convert_classic_histograms_to_nhcb")
-
-    @_builtins.property
-    @pulumi.getter
-    def endpoints(self) -> Optional[Sequence['outputs.ServiceMonitorSpecEndpointsPatch']]:
-        """
-        endpoints defines the list of endpoints part of this ServiceMonitor.
-        Defines how to scrape metrics from Kubernetes [Endpoints](https://kubernetes.io/docs/concepts/services-networking/service/#endpoints) objects.
-        In most cases, an Endpoints object is backed by a Kubernetes [Service](https://kubernetes.io/docs/concepts/services-networking/service/) object with the same name and labels.
-        """
-        return pulumi.get(self, "endpoints")
-
-    @_builtins.property
-    @pulumi.getter(name="fallbackScrapeProtocol")
-    def fallback_scrape_protocol(self) -> Optional[_builtins.str]:
-        """
-        fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
-
-        It requires Prometheus >= v3.0.0.
-        """
-        return pulumi.get(self, "fallback_scrape_protocol")
-
-    @_builtins.property
-    @pulumi.getter(name="jobLabel")
-    def job_label(self) -> Optional[_builtins.str]:
-        """
-        jobLabel selects the label from the associated Kubernetes `Service`
-        object which will be used as the `job` label for all metrics.
-
-        For example if `jobLabel` is set to `foo` and the Kubernetes `Service`
-        object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
-        label to all ingested metrics.
-
-        If the value of this field is empty or if the label doesn't exist for
-        the given Service, the `job` label of the metrics defaults to the name
-        of the associated Kubernetes `Service`.
-        """
-        return pulumi.get(self, "job_label")
-
-    @_builtins.property
-    @pulumi.getter(name="keepDroppedTargets")
-    def keep_dropped_targets(self) -> Optional[_builtins.int]:
-        """
-        keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
-        that will be kept in memory. 0 means no limit.
-
-        It requires Prometheus >= v2.47.0.
-        """
-        return pulumi.get(self, "keep_dropped_targets")
-
-    @_builtins.property
-    @pulumi.getter(name="labelLimit")
-    def label_limit(self) -> Optional[_builtins.int]:
-        """
-        labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="labelNameLengthLimit")
-    def label_name_length_limit(self) -> Optional[_builtins.int]:
-        """
-        labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_name_length_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="labelValueLengthLimit")
-    def label_value_length_limit(self) -> Optional[_builtins.int]:
-        """
-        labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
-
-        It requires Prometheus >= v2.27.0.
-        """
-        return pulumi.get(self, "label_value_length_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> Optional['outputs.ServiceMonitorSpecNamespaceSelectorPatch']:
-        return pulumi.get(self, "namespace_selector")
-
-    @_builtins.property
-    @pulumi.getter(name="nativeHistogramBucketLimit")
-    def native_histogram_bucket_limit(self) -> Optional[_builtins.int]:
-        """
-        nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
-        buckets will be merged to stay within the limit.
-        It requires Prometheus >= v2.45.0.
-        """
-        return pulumi.get(self, "native_histogram_bucket_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="nativeHistogramMinBucketFactor")
-    def native_histogram_min_bucket_factor(self) -> Optional[Any]:
-        """
-        nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
-        buckets will be merged to increase the factor sufficiently.
-        It requires Prometheus >= v2.50.0.
-        """
-        return pulumi.get(self, "native_histogram_min_bucket_factor")
-
-    @_builtins.property
-    @pulumi.getter(name="podTargetLabels")
-    def pod_target_labels(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        podTargetLabels defines the labels which are transferred from the
-        associated Kubernetes `Pod` object onto the ingested metrics.
-        """
-        return pulumi.get(self, "pod_target_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="sampleLimit")
-    def sample_limit(self) -> Optional[_builtins.int]:
-        """
-        sampleLimit defines a per-scrape limit on the number of scraped samples
-        that will be accepted.
-        """
-        return pulumi.get(self, "sample_limit")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeClass")
-    def scrape_class(self) -> Optional[_builtins.str]:
-        """
-        scrapeClass defines the scrape class to apply.
-        """
-        return pulumi.get(self, "scrape_class")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeClassicHistograms")
-    def scrape_classic_histograms(self) -> Optional[_builtins.bool]:
-        """
-        scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
-        It requires Prometheus >= v2.45.0.
-
-        Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
-        """
-        return pulumi.get(self, "scrape_classic_histograms")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeNativeHistograms")
-    def scrape_native_histograms(self) -> Optional[_builtins.bool]:
-        """
-        scrapeNativeHistograms defines whether to enable scraping of native histograms.
-        It requires Prometheus >= v3.8.0.
-        """
-        return pulumi.get(self, "scrape_native_histograms")
-
-    @_builtins.property
-    @pulumi.getter(name="scrapeProtocols")
-    def scrape_protocols(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
-        protocols supported by Prometheus in order of preference (from most to least preferred).
-
-        If unset, Prometheus uses its default value.
-
-        It requires Prometheus >= v2.49.0.
-        """
-        return pulumi.get(self, "scrape_protocols")
-
-    @_builtins.property
-    @pulumi.getter
-    def selector(self) -> Optional['outputs.ServiceMonitorSpecSelectorPatch']:
-        return pulumi.get(self, "selector")
-
-    @_builtins.property
-    @pulumi.getter(name="selectorMechanism")
-    def selector_mechanism(self) -> Optional[_builtins.str]:
-        """
-        selectorMechanism defines the mechanism used to select the endpoints to scrape.
-        By default, the selection process relies on relabel configurations to filter the discovered targets.
-        Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
-        Which strategy is best for your use case needs to be carefully evaluated.
-
-        It requires Prometheus >= v2.17.0.
-        """
-        return pulumi.get(self, "selector_mechanism")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceDiscoveryRole")
-    def service_discovery_role(self) -> Optional[_builtins.str]:
-        """
-        serviceDiscoveryRole defines the service discovery role used to discover targets.
-
-        If set, the value should be either "Endpoints" or "EndpointSlice".
-        Otherwise it defaults to the value defined in the
-        Prometheus/PrometheusAgent resource.
-        """
-        return pulumi.get(self, "service_discovery_role")
-
-    @_builtins.property
-    @pulumi.getter(name="targetLabels")
-    def target_labels(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        targetLabels defines the labels which are transferred from the
-        associated Kubernetes `Service` object onto the ingested metrics.
-        """
-        return pulumi.get(self, "target_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="targetLimit")
-    def target_limit(self) -> Optional[_builtins.int]:
-        """
-        targetLimit defines a limit on the number of scraped targets that will
-        be accepted.
-        """
-        return pulumi.get(self, "target_limit")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecSelector(dict):
-    """
-    selector defines the label selector to select the Kubernetes `Endpoints` objects to scrape metrics from.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecSelector. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecSelector.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecSelector.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ServiceMonitorSpecSelectorMatchExpressions']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        selector defines the label selector to select the Kubernetes `Endpoints` objects to scrape metrics from.
-
-        :param Sequence['ServiceMonitorSpecSelectorMatchExpressionsArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ServiceMonitorSpecSelectorMatchExpressions']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecSelectorMatchExpressions(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecSelectorMatchExpressionsPatch(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ServiceMonitorSpecSelectorPatch(dict):
-    """
-    selector defines the label selector to select the Kubernetes `Endpoints` objects to scrape metrics from.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecSelectorPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorSpecSelectorPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorSpecSelectorPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ServiceMonitorSpecSelectorMatchExpressionsPatch']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        selector defines the label selector to select the Kubernetes `Endpoints` objects to scrape metrics from.
-
-        :param Sequence['ServiceMonitorSpecSelectorMatchExpressionsPatchArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ServiceMonitorSpecSelectorMatchExpressionsPatch']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ServiceMonitorStatus(dict):
-    """
-    status defines the status subresource. It is under active development and is updated only when the
-    "StatusForConfigurationResources" feature gate is enabled.
-
-    Most recent observed status of the ServiceMonitor. Read-only.
-    More info:
-    https://github.com/kubernetes/community/blob/master/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    def __init__(__self__, *,
-                 bindings: Optional[Sequence['outputs.ServiceMonitorStatusBindings']] = None):
-        """
-        status defines the status subresource. It is under active development and is updated only when the
-        "StatusForConfigurationResources" feature gate is enabled.
-
-        Most recent observed status of the ServiceMonitor. Read-only.
-        More info:
-        https://github.com/kubernetes/community/blob/master/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param Sequence['ServiceMonitorStatusBindingsArgs'] bindings: bindings defines the list of workload resources (Prometheus, PrometheusAgent, ThanosRuler or Alertmanager) which select the configuration resource.
-        """
-        if bindings is not None:
-            pulumi.set(__self__, "bindings", bindings)
-
-    @_builtins.property
-    @pulumi.getter
-    def bindings(self) -> Optional[Sequence['outputs.ServiceMonitorStatusBindings']]:
-        """
-        bindings defines the list of workload resources (Prometheus, PrometheusAgent, ThanosRuler or Alertmanager) which select the configuration resource.
-        """
-        return pulumi.get(self, "bindings")
-
-
-@pulumi.output_type
-class ServiceMonitorStatusBindings(dict):
-    """
-    WorkloadBinding is a link between a configuration resource and a workload resource.
-    """
-    def __init__(__self__, *,
-                 conditions: Optional[Sequence['outputs.ServiceMonitorStatusBindingsConditions']] = None,
-                 group: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 namespace: Optional[_builtins.str] = None,
-                 resource: Optional[_builtins.str] = None):
-        """
-        WorkloadBinding is a link between a configuration resource and a workload resource.
-
-        :param Sequence['ServiceMonitorStatusBindingsConditionsArgs'] conditions: conditions defines the current state of the configuration resource when bound to the referenced Workload object.
-        :param _builtins.str group: group defines the group of the referenced resource.
-        :param _builtins.str name: name defines the name of the referenced object.
-        :param _builtins.str namespace: namespace defines the namespace of the referenced object.
-        :param _builtins.str resource: resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
-        """
-        if conditions is not None:
-            pulumi.set(__self__, "conditions", conditions)
-        if group is not None:
-            pulumi.set(__self__, "group", group)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if namespace is not None:
-            pulumi.set(__self__, "namespace", namespace)
-        if resource is not None:
-            pulumi.set(__self__, "resource", resource)
-
-    @_builtins.property
-    @pulumi.getter
-    def conditions(self) -> Optional[Sequence['outputs.ServiceMonitorStatusBindingsConditions']]:
-        """
-        conditions defines the current state of the configuration resource when bound to the referenced Workload object.
-        """
-        return pulumi.get(self, "conditions")
-
-    @_builtins.property
-    @pulumi.getter
-    def group(self) -> Optional[_builtins.str]:
-        """
-        group defines the group of the referenced resource.
-        """
-        return pulumi.get(self, "group")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        name defines the name of the referenced object.
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespace(self) -> Optional[_builtins.str]:
-        """
-        namespace defines the namespace of the referenced object.
-        """
-        return pulumi.get(self, "namespace")
-
-    @_builtins.property
-    @pulumi.getter
-    def resource(self) -> Optional[_builtins.str]:
-        """
-        resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
-        """
-        return pulumi.get(self, "resource")
-
-
-@pulumi.output_type
-class ServiceMonitorStatusBindingsConditions(dict):
-    """
-    ConfigResourceCondition describes the status of configuration resources linked to Prometheus, PrometheusAgent, Alertmanager or ThanosRuler.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "lastTransitionTime":
-            suggest = "last_transition_time"
-        elif key == "observedGeneration":
-            suggest = "observed_generation"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorStatusBindingsConditions. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorStatusBindingsConditions.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorStatusBindingsConditions.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 last_transition_time: Optional[_builtins.str] = None,
-                 message: Optional[_builtins.str] = None,
-                 observed_generation: Optional[_builtins.int] = None,
-                 reason: Optional[_builtins.str] = None,
-                 status: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        ConfigResourceCondition describes the status of configuration resources linked to Prometheus, PrometheusAgent, Alertmanager or ThanosRuler.
-
-        :param _builtins.str last_transition_time: lastTransitionTime defines the time of the last update to the current status property.
-        :param _builtins.str message: message defines the human-readable message indicating details for the condition's last transition.
-        :param _builtins.int observed_generation: observedGeneration defines the .metadata.generation that the
-               condition was set based upon. For instance, if `.metadata.generation` is
-               currently 12, but the `.status.conditions[].observedGeneration` is 9, the
-               condition is out of date with respect to the current state of the object.
-        :param _builtins.str reason: reason for the condition's last transition.
-        :param _builtins.str status: status of the condition.
-        :param _builtins.str type: type of the condition being reported.
-               Currently, only "Accepted" is supported.
-        """
-        if last_transition_time is not None:
-            pulumi.set(__self__, "last_transition_time", last_transition_time)
-        if message is not None:
-            pulumi.set(__self__, "message", message)
-        if observed_generation is not None:
-            pulumi.set(__self__, "observed_generation", observed_generation)
-        if reason is not None:
-            pulumi.set(__self__, "reason", reason)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="lastTransitionTime")
-    def last_transition_time(self) -> Optional[_builtins.str]:
-        """
-        lastTransitionTime defines the time of the last update to the current status property.
-        """
-        return pulumi.get(self, "last_transition_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def message(self) -> Optional[_builtins.str]:
-        """
-        message defines the human-readable message indicating details for the condition's last transition.
-        """
-        return pulumi.get(self, "message")
-
-    @_builtins.property
-    @pulumi.getter(name="observedGeneration")
-    def observed_generation(self) -> Optional[_builtins.int]:
-        """
-        observedGeneration defines the .metadata.generation that the
-        condition was set based upon. For instance, if `.metadata.generation` is
-        currently 12, but the `.status.conditions[].observedGeneration` is 9, the
-        condition is out of date with respect to the current state of the object.
-        """
-        return pulumi.get(self, "observed_generation")
-
-    @_builtins.property
-    @pulumi.getter
-    def reason(self) -> Optional[_builtins.str]:
-        """
-        reason for the condition's last transition.
-        """
-        return pulumi.get(self, "reason")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional[_builtins.str]:
-        """
-        status of the condition.
-        """
-        return pulumi.get(self, "status")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type of the condition being reported.
-        Currently, only "Accepted" is supported.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ServiceMonitorStatusBindingsConditionsPatch(dict):
-    """
-    ConfigResourceCondition describes the status of configuration resources linked to Prometheus, PrometheusAgent, Alertmanager or ThanosRuler.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "lastTransitionTime":
-            suggest = "last_transition_time"
-        elif key == "observedGeneration":
-            suggest = "observed_generation"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorStatusBindingsConditionsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ServiceMonitorStatusBindingsConditionsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ServiceMonitorStatusBindingsConditionsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 last_transition_time: Optional[_builtins.str] = None,
-                 message: Optional[_builtins.str] = None,
-                 observed_generation: Optional[_builtins.int] = None,
-                 reason: Optional[_builtins.str] = None,
-                 status: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        ConfigResourceCondition describes the status of configuration resources linked to Prometheus, PrometheusAgent, Alertmanager or ThanosRuler.
-
-        :param _builtins.str last_transition_time: lastTransitionTime defines the time of the last update to the current status property.
-        :param _builtins.str message: message defines the human-readable message indicating details for the condition's last transition.
-        :param _builtins.int observed_generation: observedGeneration defines the .metadata.generation that the
-               condition was set based upon. For instance, if `.metadata.generation` is
-               currently 12, but the `.status.conditions[].observedGeneration` is 9, the
-               condition is out of date with respect to the current state of the object.
-        :param _builtins.str reason: reason for the condition's last transition.
-        :param _builtins.str status: status of the condition.
-        :param _builtins.str type: type of the condition being reported.
-               Currently, only "Accepted" is supported.
-        """
-        if last_transition_time is not None:
-            pulumi.set(__self__, "last_transition_time", last_transition_time)
-        if message is not None:
-            pulumi.set(__self__, "message", message)
-        if observed_generation is not None:
-            pulumi.set(__self__, "observed_generation", observed_generation)
-        if reason is not None:
-            pulumi.set(__self__, "reason", reason)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="lastTransitionTime")
-    def last_transition_time(self) -> Optional[_builtins.str]:
-        """
-        lastTransitionTime defines the time of the last update to the current status property.
-        """
-        return pulumi.get(self, "last_transition_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def message(self) -> Optional[_builtins.str]:
-        """
-        message defines the human-readable message indicating details for the condition's last transition.
-        """
-        return pulumi.get(self, "message")
-
-    @_builtins.property
-    @pulumi.getter(name="observedGeneration")
-    def observed_generation(self) -> Optional[_builtins.int]:
-        """
-        observedGeneration defines the .metadata.generation that the
-        condition was set based upon. For instance, if `.metadata.generation` is
-        currently 12, but the `.status.conditions[].observedGeneration` is 9, the
-        condition is out of date with respect to the current state of the object.
-        """
-        return pulumi.get(self, "observed_generation")
-
-    @_builtins.property
-    @pulumi.getter
-    def reason(self) -> Optional[_builtins.str]:
-        """
-        reason for the condition's last transition.
-        """
-        return pulumi.get(self, "reason")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional[_builtins.str]:
-        """
-        status of the condition.
-        """
-        return pulumi.get(self, "status")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type of the condition being reported.
-        Currently, only "Accepted" is supported.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ServiceMonitorStatusBindingsPatch(dict):
-    """
-    WorkloadBinding is a link between a configuration resource and a workload resource.
-    """
-    def __init__(__self__, *,
-                 conditions: Optional[Sequence['outputs.ServiceMonitorStatusBindingsConditionsPatch']] = None,
-                 group: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 namespace: Optional[_builtins.str] = None,
-                 resource: Optional[_builtins.str] = None):
-        """
-        WorkloadBinding is a link between a configuration resource and a workload resource.
-
-        :param Sequence['ServiceMonitorStatusBindingsConditionsPatchArgs'] conditions: conditions defines the current state of the configuration resource when bound to the referenced Workload object.
-        :param _builtins.str group: group defines the group of the referenced resource.
-        :param _builtins.str name: name defines the name of the referenced object.
-        :param _builtins.str namespace: namespace defines the namespace of the referenced object.
-        :param _builtins.str resource: resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
-        """
-        if conditions is not None:
-            pulumi.set(__self__, "conditions", conditions)
-        if group is not None:
-            pulumi.set(__self__, "group", group)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if namespace is not None:
-            pulumi.set(__self__, "namespace", namespace)
-        if resource is not None:
-            pulumi.set(__self__, "resource", resource)
-
-    @_builtins.property
-    @pulumi.getter
-    def conditions(self) -> Optional[Sequence['outputs.ServiceMonitorStatusBindingsConditionsPatch']]:
-        """
-        conditions defines the current state of the configuration resource when bound to the referenced Workload object.
-        """
-        return pulumi.get(self, "conditions")
-
-    @_builtins.property
-    @pulumi.getter
-    def group(self) -> Optional[_builtins.str]:
-        """
-        group defines the group of the referenced resource.
-        """
-        return pulumi.get(self, "group")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        name defines the name of the referenced object.
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespace(self) -> Optional[_builtins.str]:
-        """
-        namespace defines the namespace of the referenced object.
-        """
-        return pulumi.get(self, "namespace")
-
-    @_builtins.property
-    @pulumi.getter
-    def resource(self) -> Optional[_builtins.str]:
-        """
-        resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
-        """
-        return pulumi.get(self, "resource")
-
-
-@pulumi.output_type
-class ServiceMonitorStatusPatch(dict):
-    """
-    status defines the status subresource. It is under active development and is updated only when the
-    "StatusForConfigurationResources" feature gate is enabled.
-
-    Most recent observed status of the ServiceMonitor. Read-only.
-    More info:
-    https://github.com/kubernetes/community/blob/master/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    def __init__(__self__, *,
-                 bindings: Optional[Sequence['outputs.ServiceMonitorStatusBindingsPatch']] = None):
-        """
-        status defines the status subresource. It is under active development and is updated only when the
-        "StatusForConfigurationResources" feature gate is enabled.
-
-        Most recent observed status of the ServiceMonitor. Read-only.
-        More info:
-        https://github.com/kubernetes/community/blob/master/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param Sequence['ServiceMonitorStatusBindingsPatchArgs'] bindings: bindings defines the list of workload resources (Prometheus, PrometheusAgent, ThanosRuler or Alertmanager) which select the configuration resource.
-        """
-        if bindings is not None:
-            pulumi.set(__self__, "bindings", bindings)
-
-    @_builtins.property
-    @pulumi.getter
-    def bindings(self) -> Optional[Sequence['outputs.ServiceMonitorStatusBindingsPatch']]:
-        """
-        bindings defines the list of workload resources (Prometheus, PrometheusAgent, ThanosRuler or Alertmanager) which select the configuration resource.
-        """
-        return pulumi.get(self, "bindings")
@@ -0,0 +1,429 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['PodMonitorSpec']
+
+@pulumi.output_type
+class PodMonitorSpec(dict):
+    """
+    spec defines the specification of desired Pod selection for target discovery by Prometheus.
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "attachMetadata":
+            suggest = "attach_metadata"
+        elif key == "bodySizeLimit":
+            suggest = "body_size_limit"
+        elif key == "convertClassicHistogramsToNHCB":
+            suggest = "convert_classic_histograms_to_nhcb"
+        elif key == "fallbackScrapeProtocol":
+            suggest = "fallback_scrape_protocol"
+        elif key == "jobLabel":
+            suggest = "job_label"
+        elif key == "keepDroppedTargets":
+            suggest = "keep_dropped_targets"
+        elif key == "labelLimit":
+            suggest = "label_limit"
+        elif key == "labelNameLengthLimit":
+            suggest = "label_name_length_limit"
+        elif key == "labelValueLengthLimit":
+            suggest = "label_value_length_limit"
+        elif key == "namespaceSelector":
+            suggest = "namespace_selector"
+        elif key == "nativeHistogramBucketLimit":
+            suggest = "native_histogram_bucket_limit"
+        elif key == "nativeHistogramMinBucketFactor":
+            suggest = "native_histogram_min_bucket_factor"
+        elif key == "podMetricsEndpoints":
+            suggest = "pod_metrics_endpoints"
+        elif key == "podTargetLabels":
+            suggest = "pod_target_labels"
+        elif key == "sampleLimit":
+            suggest = "sample_limit"
+        elif key == "scrapeClass":
+            suggest = "scrape_class"
+        elif key == "scrapeClassicHistograms":
+            suggest = "scrape_classic_histograms"
+        elif key == "scrapeNativeHistograms":
+            suggest = "scrape_native_histograms"
+        elif key == "scrapeProtocols":
+            suggest = "scrape_protocols"
+        elif key == "selectorMechanism":
+            suggest = "selector_mechanism"
+        elif key == "targetLimit":
+            suggest = "target_limit"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpec. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        PodMonitorSpec.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        PodMonitorSpec.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 attach_metadata: Optional['outputs.PodMonitorSpecAttachMetadata'] = None,
+                 body_size_limit: Optional[_builtins.str] = None,
+                 convert_classic_histograms_to_nhcb: Optional[_builtins.bool] = None,
+                 fallback_scrape_protocol: Optional[_builtins.str] = None,
+                 job_label: Optional[_builtins.str] = None,
+                 keep_dropped_targets: Optional[_builtins.int] = None,
+                 label_limit: Optional[_builtins.int] = None,
+                 label_name_length_limit: Optional[_builtins.int] = None,
+                 label_value_length_limit: Optional[_builtins.int] = None,
+                 namespace_selector: Optional['outputs.PodMonitorSpecNamespaceSelector'] = None,
+                 native_histogram_bucket_limit: Optional[_builtins.int] = None,
+                 native_histogram_min_bucket_factor: Optional[Any] = None,
+                 pod_metrics_endpoints: Optional[Sequence['outputs.PodMonitorSpecPodMetricsEndpoints']] = None,
+                 pod_target_labels: Optional[Sequence[_builtins.str]] = None,
+                 sample_limit: Optional[_builtins.int] = None,
+                 scrape_class: Optional[_builtins.str] = None,
+                 scrape_classic_histograms: Optional[_builtins.bool] = None,
+                 scrape_native_histograms: Optional[_builtins.bool] = None,
+                 scrape_protocols: Optional[Sequence[_builtins.str]] = None,
+                 selector: Optional['outputs.PodMonitorSpecSelector'] = None,
+                 selector_mechanism: Optional[_builtins.str] = None,
+                 target_limit: Optional[_builtins.int] = None):
+        """
+        spec defines the specification of desired Pod selection for target discovery by Prometheus.
+
+        :param _builtins.str body_size_limit: bodySizeLimit when defined specifies a job level limit on the size
+               of uncompressed response body that will be accepted by Prometheus.
+
+               It requires Prometheus >= v2.28.0.
+        :param _builtins.bool convert_classic_histograms_to_nhcb: convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
+               It requires Prometheus >= v3.0.0.
+        :param _builtins.str fallback_scrape_protocol: fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
+
+               It requires Prometheus >= v3.0.0.
+        :param _builtins.str job_label: jobLabel defines the label to use to retrieve the job name from.
+               `jobLabel` selects the label from the associated Kubernetes `Pod`
+               object which will be used as the `job` label for all metrics.
+
+               For example if `jobLabel` is set to `foo` and the Kubernetes `Pod`
+               object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
+               label to all ingested metrics.
+
+               If the value of this field is empty, the `job` label of the metrics
+               defaults to the namespace and name of the PodMonitor object (e.g. `<namespace>/<name>`).
+        :param _builtins.int keep_dropped_targets: keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
+               that will be kept in memory. 0 means no limit.
+
+               It requires Prometheus >= v2.47.0.
+        :param _builtins.int label_limit: labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
+
+               It requires Prometheus >= v2.27.0.
+        :param _builtins.int label_name_length_limit: labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
+
+               It requires Prometheus >= v2.27.0.
+        :param _builtins.int label_value_length_limit: labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
+
+               It requires Prometheus >= v2.27.0.
+        :param _builtins.int native_histogram_bucket_limit: nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
+               buckets will be merged to stay within the limit.
+               It requires Prometheus >= v2.45.0.
+        :param Union[_builtins.int, _builtins.str] native_histogram_min_bucket_factor: nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
+               buckets will be merged to increase the factor sufficiently.
+               It requires Prometheus >= v2.50.0.
+        :param Sequence['PodMonitorSpecPodMetricsEndpointsArgs'] pod_metrics_endpoints: podMetricsEndpoints defines how to scrape metrics from the selected pods.
+        :param Sequence[_builtins.str] pod_target_labels: podTargetLabels defines the labels which are transferred from the
+               associated Kubernetes `Pod` object onto the ingested metrics.
+        :param _builtins.int sample_limit: sampleLimit defines a per-scrape limit on the number of scraped samples
+               that will be accepted.
+        :param _builtins.str scrape_class: scrapeClass defines the scrape class to apply.
+        :param _builtins.bool scrape_classic_histograms: scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
+               It requires Prometheus >= v2.45.0.
+
+               Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
+        :param _builtins.bool scrape_native_histograms: scrapeNativeHistograms defines whether to enable scraping of native histograms.
+               It requires Prometheus >= v3.8.0.
+        :param Sequence[_builtins.str] scrape_protocols: scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
+               protocols supported by Prometheus in order of preference (from most to least preferred).
+
+               If unset, Prometheus uses its default value.
+
+               It requires Prometheus >= v2.49.0.
+        :param _builtins.str selector_mechanism: selectorMechanism defines the mechanism used to select the endpoints to scrape.
+               By default, the selection process relies on relabel configurations to filter the discovered targets.
+               Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
+               Which strategy is best for your use case needs to be carefully evaluated.
+
+               It requires Prometheus >= v2.17.0.
+        :param _builtins.int target_limit: targetLimit defines a limit on the number of scraped targets that will
+               be accepted.
+        """
+        if attach_metadata is not None:
+            pulumi.set(__self__, "attach_metadata", attach_metadata)
+        if body_size_limit is not None:
+            pulumi.set(__self__, "body_size_limit", body_size_limit)
+        if convert_classic_histograms_to_nhcb is not None:
+            pulumi.set(__self__, "convert_classic_histograms_to_nhcb", convert_classic_histograms_to_nhcb)
+        if fallback_scrape_protocol is not None:
+            pulumi.set(__self__, "fallback_scrape_protocol", fallback_scrape_protocol)
+        if job_label is not None:
+            pulumi.set(__self__, "job_label", job_label)
+        if keep_dropped_targets is not None:
+            pulumi.set(__self__, "keep_dropped_targets", keep_dropped_targets)
+        if label_limit is not None:
+            pulumi.set(__self__, "label_limit", label_limit)
+        if label_name_length_limit is not None:
+            pulumi.set(__self__, "label_name_length_limit", label_name_length_limit)
+        if label_value_length_limit is not None:
+            pulumi.set(__self__, "label_value_length_limit", label_value_length_limit)
+        if namespace_selector is not None:
+            pulumi.set(__self__, "namespace_selector", namespace_selector)
+        if native_histogram_bucket_limit is not None:
+            pulumi.set(__self__, "native_histogram_bucket_limit", native_histogram_bucket_limit)
+        if native_histogram_min_bucket_factor is not None:
+            pulumi.set(__self__, "native_histogram_min_bucket_factor", native_histogram_min_bucket_factor)
+        if pod_metrics_endpoints is not None:
+            pulumi.set(__self__, "pod_metrics_endpoints", pod_metrics_endpoints)
+        if pod_target_labels is not None:
+            pulumi.set(__self__, "pod_target_labels", pod_target_labels)
+        if sample_limit is not None:
+            pulumi.set(__self__, "sample_limit", sample_limit)
+        if scrape_class is not None:
+            pulumi.set(__self__, "scrape_class", scrape_class)
+        if scrape_classic_histograms is not None:
+            pulumi.set(__self__, "scrape_classic_histograms", scrape_classic_histograms)
+        if scrape_native_histograms is not None:
+            pulumi.set(__self__, "scrape_native_histograms", scrape_native_histograms)
+        if scrape_protocols is not None:
+            pulumi.set(__self__, "scrape_protocols", scrape_protocols)
+        if selector is not None:
+            pulumi.set(__self__, "selector", selector)
+        if selector_mechanism is not None:
+            pulumi.set(__self__, "selector_mechanism", selector_mechanism)
+        if target_limit is not None:
+            pulumi.set(__self__, "target_limit", target_limit)
+
+    @_builtins.property
+    @pulumi.getter(name="attachMetadata")
+    def attach_metadata(self) -> Optional['outputs.PodMonitorSpecAttachMetadata']:
+        return pulumi.get(self, "attach_metadata")
+
+    @_builtins.property
+    @pulumi.getter(name="bodySizeLimit")
+    def body_size_limit(self) -> Optional[_builtins.str]:
+        """
+        bodySizeLimit when defined specifies a job level limit on the size
+        of uncompressed response body that will be accepted by Prometheus.
+
+        It requires Prometheus >= v2.28.0.
+        """
+        return pulumi.get(self, "body_size_limit")
+
+    @_builtins.property
+    @pulumi.getter(name="convertClassicHistogramsToNHCB")
+    def convert_classic_histograms_to_nhcb(self) -> Optional[_builtins.bool]:
+        """
+        convertClassicHistogramsToNHCB defines whether to convert all scraped classic histograms into a native histogram with custom buckets.
+        It requires Prometheus >= v3.0.0.
+        """
+        return pulumi.get(self, "convert_classic_histograms_to_nhcb")
+
+    @_builtins.property
+    @pulumi.getter(name="fallbackScrapeProtocol")
+    def fallback_scrape_protocol(self) -> Optional[_builtins.str]:
+        """
+        fallbackScrapeProtocol defines the protocol to use if a scrape returns blank, unparseable, or otherwise invalid Content-Type.
+
+        It requires Prometheus >= v3.0.0.
+        """
+        return pulumi.get(self, "fallback_scrape_protocol")
+
+    @_builtins.property
+    @pulumi.getter(name="jobLabel")
+    def job_label(self) -> Optional[_builtins.str]:
+        """
+        jobLabel defines the label to use to retrieve the job name from.
+        `jobLabel` selects the label from the associated Kubernetes `Pod`
+        object which will be used as the `job` label for all metrics.
+
+        For example if `jobLabel` is set to `foo` and the Kubernetes `Pod`
+        object is labeled with `foo: bar`, then Prometheus adds the `job="bar"`
+        label to all ingested metrics.
+
+        If the value of this field is empty, the `job` label of the metrics
+        defaults to the namespace and name of the PodMonitor object (e.g. `<namespace>/<name>`).
+        """
+        return pulumi.get(self, "job_label")
+
+    @_builtins.property
+    @pulumi.getter(name="keepDroppedTargets")
+    def keep_dropped_targets(self) -> Optional[_builtins.int]:
+        """
+        keepDroppedTargets defines the per-scrape limit on the number of targets dropped by relabeling
+        that will be kept in memory. 0 means no limit.
+
+        It requires Prometheus >= v2.47.0.
+        """
+        return pulumi.get(self, "keep_dropped_targets")
+
+    @_builtins.property
+    @pulumi.getter(name="labelLimit")
+    def label_limit(self) -> Optional[_builtins.int]:
+        """
+        labelLimit defines the per-scrape limit on number of labels that will be accepted for a sample.
+
+        It requires Prometheus >= v2.27.0.
+        """
+        return pulumi.get(self, "label_limit")
+
+    @_builtins.property
+    @pulumi.getter(name="labelNameLengthLimit")
+    def label_name_length_limit(self) -> Optional[_builtins.int]:
+        """
+        labelNameLengthLimit defines the per-scrape limit on length of labels name that will be accepted for a sample.
+
+        It requires Prometheus >= v2.27.0.
+        """
+        return pulumi.get(self, "label_name_length_limit")
+
+    @_builtins.property
+    @pulumi.getter(name="labelValueLengthLimit")
+    def label_value_length_limit(self) -> Optional[_builtins.int]:
+        """
+        labelValueLengthLimit defines the per-scrape limit on length of labels value that will be accepted for a sample.
+
+        It requires Prometheus >= v2.27.0.
+        """
+        return pulumi.get(self, "label_value_length_limit")
+
+    @_builtins.property
+    @pulumi.getter(name="namespaceSelector")
+    def namespace_selector(self) -> Optional['outputs.PodMonitorSpecNamespaceSelector']:
+        return pulumi.get(self, "namespace_selector")
+
+    @_builtins.property
+    @pulumi.getter(name="nativeHistogramBucketLimit")
+    def native_histogram_bucket_limit(self) -> Optional[_builtins.int]:
+        """
+        nativeHistogramBucketLimit defines ff there are more than this many buckets in a native histogram,
+        buckets will be merged to stay within the limit.
+        It requires Prometheus >= v2.45.0.
+        """
+        return pulumi.get(self, "native_histogram_bucket_limit")
+
+    @_builtins.property
+    @pulumi.getter(name="nativeHistogramMinBucketFactor")
+    def native_histogram_min_bucket_factor(self) -> Optional[Any]:
+        """
+        nativeHistogramMinBucketFactor defines if the growth factor of one bucket to the next is smaller than this,
+        buckets will be merged to increase the factor sufficiently.
+        It requires Prometheus >= v2.50.0.
+        """
+        return pulumi.get(self, "native_histogram_min_bucket_factor")
+
+    @_builtins.property
+    @pulumi.getter(name="podMetricsEndpoints")
+    def pod_metrics_endpoints(self) -> Optional[Sequence['outputs.PodMonitorSpecPodMetricsEndpoints']]:
+        """
+        podMetricsEndpoints defines how to scrape metrics from the selected pods.
+        """
+        return pulumi.get(self, "pod_metrics_endpoints")
+
+    @_builtins.property
+    @pulumi.getter(name="podTargetLabels")
+    def pod_target_labels(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        podTargetLabels defines the labels which are transferred from the
+        associated Kubernetes `Pod` object onto the ingested metrics.
+        """
+        return pulumi.get(self, "pod_target_labels")
+
+    @_builtins.property
+    @pulumi.getter(name="sampleLimit")
+    def sample_limit(self) -> Optional[_builtins.int]:
+        """
+        sampleLimit defines a per-scrape limit on the number of scraped samples
+        that will be accepted.
+        """
+        return pulumi.get(self, "sample_limit")
+
+    @_builtins.property
+    @pulumi.getter(name="scrapeClass")
+    def scrape_class(self) -> Optional[_builtins.str]:
+        """
+        scrapeClass defines the scrape class to apply.
+        """
+        return pulumi.get(self, "scrape_class")
+
+    @_builtins.property
+    @pulumi.getter(name="scrapeClassicHistograms")
+    def scrape_classic_histograms(self) -> Optional[_builtins.bool]:
+        """
+        scrapeClassicHistograms defines whether to scrape a classic histogram that is also exposed as a native histogram.
+        It requires Prometheus >= v2.45.0.
+
+        Notice: `scrapeClassicHistograms` corresponds to the `always_scrape_classic_histograms` field in the Prometheus configuration.
+        """
+        return pulumi.get(self, "scrape_classic_histograms")
+
+    @_builtins.property
+    @pulumi.getter(name="scrapeNativeHistograms")
+    def scrape_native_histograms(self) -> Optional[_builtins.bool]:
+        """
+        scrapeNativeHistograms defines whether to enable scraping of native histograms.
+        It requires Prometheus >= v3.8.0.
+        """
+        return pulumi.get(self, "scrape_native_histograms")
+
+    @_builtins.property
+    @pulumi.getter(name="scrapeProtocols")
+    def scrape_protocols(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        scrapeProtocols defines the protocols to negotiate during a scrape. It tells clients the
+        protocols supported by Prometheus in order of preference (from most to least preferred).
+
+        If unset, Prometheus uses its default value.
+
+        It requires Prometheus >= v2.49.0.
+        """
+        return pulumi.get(self, "scrape_protocols")
+
+    @_builtins.property
+    @pulumi.getter
+    def selector(self) -> Optional['outputs.PodMonitorSpecSelector']:
+        return pulumi.get(self, "selector")
+
+    @_builtins.property
+    @pulumi.getter(name="selectorMechanism")
+    def selector_mechanism(self) -> Optional[_builtins.str]:
+        """
+        selectorMechanism defines the mechanism used to select the endpoints to scrape.
+        By default, the selection process relies on relabel configurations to filter the discovered targets.
+        Alternatively, you can opt in for role selectors, which may offer better efficiency in large clusters.
+        Which strategy is best for your use case needs to be carefully evaluated.
+
+        It requires Prometheus >= v2.17.0.
+        """
+        return pulumi.get(self, "selector_mechanism")
+
+    @_builtins.property
+    @pulumi.getter(name="targetLimit")
+    def target_limit(self) -> Optional[_builtins.int]:
+        """
+        targetLimit defines a limit on the number of scraped targets that will
+        be accepted.
+        """
+        return pulumi.get(self, "target_limit")
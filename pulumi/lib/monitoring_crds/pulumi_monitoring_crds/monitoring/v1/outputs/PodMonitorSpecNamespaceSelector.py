@@ -0,0 +1,75 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['PodMonitorSpecNamespaceSelector']
+
+@pulumi.output_type
+class PodMonitorSpecNamespaceSelector(dict):
+    """
+    namespaceSelector defines in which namespace(s) Prometheus should discover the pods.
+    By default, the pods are discovered in the same namespace as the `PodMonitor` object but it is possible to select pods across different/all namespaces.
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "matchNames":
+            suggest = "match_names"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecNamespaceSelector. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        PodMonitorSpecNamespaceSelector.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        PodMonitorSpecNamespaceSelector.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 any: Optional[_builtins.bool] = None,
+                 match_names: Optional[Sequence[_builtins.str]] = None):
+        """
+        namespaceSelector defines in which namespace(s) Prometheus should discover the pods.
+        By default, the pods are discovered in the same namespace as the `PodMonitor` object but it is possible to select pods across different/all namespaces.
+
+        :param _builtins.bool any: any defines the boolean describing whether all namespaces are selected in contrast to a
+               list restricting them.
+        :param Sequence[_builtins.str] match_names: matchNames defines the list of namespace names to select from.
+        """
+        if any is not None:
+            pulumi.set(__self__, "any", any)
+        if match_names is not None:
+            pulumi.set(__self__, "match_names", match_names)
+
+    @_builtins.property
+    @pulumi.getter
+    def any(self) -> Optional[_builtins.bool]:
+        """
+        any defines the boolean describing whether all namespaces are selected in contrast to a
+        list restricting them.
+        """
+        return pulumi.get(self, "any")
+
+    @_builtins.property
+    @pulumi.getter(name="matchNames")
+    def match_names(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        matchNames defines the list of namespace names to select from.
+        """
+        return pulumi.get(self, "match_names")
@@ -0,0 +1,64 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['PodMonitorSpecPodMetricsEndpointsAuthorization']
+
+@pulumi.output_type
+class PodMonitorSpecPodMetricsEndpointsAuthorization(dict):
+    """
+    authorization configures the Authorization header credentials used by
+    the client.
+
+    Cannot be set at the same time as `basicAuth`, `bearerTokenSecret` or `oauth2`.
+    """
+    def __init__(__self__, *,
+                 credentials: Optional['outputs.PodMonitorSpecPodMetricsEndpointsAuthorizationCredentials'] = None,
+                 type: Optional[_builtins.str] = None):
+        """
+        authorization configures the Authorization header credentials used by
+        the client.
+
+        Cannot be set at the same time as `basicAuth`, `bearerTokenSecret` or `oauth2`.
+
+        :param _builtins.str type: type defines the authentication type. The value is case-insensitive.
+
+               "Basic" is not a supported value.
+
+               Default: "Bearer"
+        """
+        if credentials is not None:
+            pulumi.set(__self__, "credentials", credentials)
+        if type is not None:
+            pulumi.set(__self__, "type", type)
+
+    @_builtins.property
+    @pulumi.getter
+    def credentials(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsAuthorizationCredentials']:
+        return pulumi.get(self, "credentials")
+
+    @_builtins.property
+    @pulumi.getter
+    def type(self) -> Optional[_builtins.str]:
+        """
+        type defines the authentication type. The value is case-insensitive.
+
+        "Basic" is not a supported value.
+
+        Default: "Bearer"
+        """
+        return pulumi.get(self, "type")
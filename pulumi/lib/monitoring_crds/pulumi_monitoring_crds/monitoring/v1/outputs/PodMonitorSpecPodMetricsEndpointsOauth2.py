@@ -0,0 +1,199 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['PodMonitorSpecPodMetricsEndpointsOauth2']
+
+@pulumi.output_type
+class PodMonitorSpecPodMetricsEndpointsOauth2(dict):
+    """
+    oauth2 defines the OAuth2 settings used by the client.
+
+    It requires Prometheus >= 2.27.0.
+
+    Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "clientId":
+            suggest = "client_id"
+        elif key == "clientSecret":
+            suggest = "client_secret"
+        elif key == "endpointParams":
+            suggest = "endpoint_params"
+        elif key == "noProxy":
+            suggest = "no_proxy"
+        elif key == "proxyConnectHeader":
+            suggest = "proxy_connect_header"
+        elif key == "proxyFromEnvironment":
+            suggest = "proxy_from_environment"
+        elif key == "proxyUrl":
+            suggest = "proxy_url"
+        elif key == "tlsConfig":
+            suggest = "tls_config"
+        elif key == "tokenUrl":
+            suggest = "token_url"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsOauth2. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        PodMonitorSpecPodMetricsEndpointsOauth2.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        PodMonitorSpecPodMetricsEndpointsOauth2.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 client_id: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientId'] = None,
+                 client_secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientSecret'] = None,
+                 endpoint_params: Optional[Mapping[str, _builtins.str]] = None,
+                 no_proxy: Optional[_builtins.str] = None,
+                 proxy_connect_header: Optional[Mapping[str, Sequence['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeader']]] = None,
+                 proxy_from_environment: Optional[_builtins.bool] = None,
+                 proxy_url: Optional[_builtins.str] = None,
+                 scopes: Optional[Sequence[_builtins.str]] = None,
+                 tls_config: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfig'] = None,
+                 token_url: Optional[_builtins.str] = None):
+        """
+        oauth2 defines the OAuth2 settings used by the client.
+
+        It requires Prometheus >= 2.27.0.
+
+        Cannot be set at the same time as `authorization`, `basicAuth` or `bearerTokenSecret`.
+
+        :param Mapping[str, _builtins.str] endpoint_params: endpointParams configures the HTTP parameters to append to the token
+               URL.
+        :param _builtins.str no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
+               that should be excluded from proxying. IP and domain names can
+               contain port numbers.
+
+               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        :param Mapping[str, Sequence['PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeaderArgs']] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
+               proxies during CONNECT requests.
+
+               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        :param _builtins.bool proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
+
+               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        :param _builtins.str proxy_url: proxyUrl defines the HTTP proxy server to use.
+        :param Sequence[_builtins.str] scopes: scopes defines the OAuth2 scopes used for the token request.
+        :param _builtins.str token_url: tokenUrl defines the URL to fetch the token from.
+        """
+        if client_id is not None:
+            pulumi.set(__self__, "client_id", client_id)
+        if client_secret is not None:
+            pulumi.set(__self__, "client_secret", client_secret)
+        if endpoint_params is not None:
+            pulumi.set(__self__, "endpoint_params", endpoint_params)
+        if no_proxy is not None:
+            pulumi.set(__self__, "no_proxy", no_proxy)
+        if proxy_connect_header is not None:
+            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
+        if proxy_from_environment is not None:
+            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
+        if proxy_url is not None:
+            pulumi.set(__self__, "proxy_url", proxy_url)
+        if scopes is not None:
+            pulumi.set(__self__, "scopes", scopes)
+        if tls_config is not None:
+            pulumi.set(__self__, "tls_config", tls_config)
+        if token_url is not None:
+            pulumi.set(__self__, "token_url", token_url)
+
+    @_builtins.property
+    @pulumi.getter(name="clientId")
+    def client_id(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientId']:
+        return pulumi.get(self, "client_id")
+
+    @_builtins.property
+    @pulumi.getter(name="clientSecret")
+    def client_secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientSecret']:
+        return pulumi.get(self, "client_secret")
+
+    @_builtins.property
+    @pulumi.getter(name="endpointParams")
+    def endpoint_params(self) -> Optional[Mapping[str, _builtins.str]]:
+        """
+        endpointParams configures the HTTP parameters to append to the token
+        URL.
+        """
+        return pulumi.get(self, "endpoint_params")
+
+    @_builtins.property
+    @pulumi.getter(name="noProxy")
+    def no_proxy(self) -> Optional[_builtins.str]:
+        """
+        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
+        that should be excluded from proxying. IP and domain names can
+        contain port numbers.
+
+        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        """
+        return pulumi.get(self, "no_proxy")
+
+    @_builtins.property
+    @pulumi.getter(name="proxyConnectHeader")
+    def proxy_connect_header(self) -> Optional[Mapping[str, Sequence['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeader']]]:
+        """
+        proxyConnectHeader optionally specifies headers to send to
+        proxies during CONNECT requests.
+
+        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        """
+        return pulumi.get(self, "proxy_connect_header")
+
+    @_builtins.property
+    @pulumi.getter(name="proxyFromEnvironment")
+    def proxy_from_environment(self) -> Optional[_builtins.bool]:
+        """
+        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
+
+        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        """
+        return pulumi.get(self, "proxy_from_environment")
+
+    @_builtins.property
+    @pulumi.getter(name="proxyUrl")
+    def proxy_url(self) -> Optional[_builtins.str]:
+        """
+        proxyUrl defines the HTTP proxy server to use.
+        """
+        return pulumi.get(self, "proxy_url")
+
+    @_builtins.property
+    @pulumi.getter
+    def scopes(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        scopes defines the OAuth2 scopes used for the token request.
+        """
+        return pulumi.get(self, "scopes")
+
+    @_builtins.property
+    @pulumi.getter(name="tlsConfig")
+    def tls_config(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2TlsConfig']:
+        return pulumi.get(self, "tls_config")
+
+    @_builtins.property
+    @pulumi.getter(name="tokenUrl")
+    def token_url(self) -> Optional[_builtins.str]:
+        """
+        tokenUrl defines the URL to fetch the token from.
+        """
+        return pulumi.get(self, "token_url")
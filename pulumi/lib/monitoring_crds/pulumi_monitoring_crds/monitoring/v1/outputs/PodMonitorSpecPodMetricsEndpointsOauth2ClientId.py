@@ -0,0 +1,64 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['PodMonitorSpecPodMetricsEndpointsOauth2ClientId']
+
+@pulumi.output_type
+class PodMonitorSpecPodMetricsEndpointsOauth2ClientId(dict):
+    """
+    clientId defines a key of a Secret or ConfigMap containing the
+    OAuth2 client's ID.
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "configMap":
+            suggest = "config_map"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsOauth2ClientId. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        PodMonitorSpecPodMetricsEndpointsOauth2ClientId.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        PodMonitorSpecPodMetricsEndpointsOauth2ClientId.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 config_map: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMap'] = None,
+                 secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecret'] = None):
+        """
+        clientId defines a key of a Secret or ConfigMap containing the
+        OAuth2 client's ID.
+        """
+        if config_map is not None:
+            pulumi.set(__self__, "config_map", config_map)
+        if secret is not None:
+            pulumi.set(__self__, "secret", secret)
+
+    @_builtins.property
+    @pulumi.getter(name="configMap")
+    def config_map(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMap']:
+        return pulumi.get(self, "config_map")
+
+    @_builtins.property
+    @pulumi.getter
+    def secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecret']:
+        return pulumi.get(self, "secret")
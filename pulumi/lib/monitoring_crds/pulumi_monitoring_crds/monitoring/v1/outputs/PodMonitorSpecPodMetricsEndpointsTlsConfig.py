@@ -0,0 +1,135 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['PodMonitorSpecPodMetricsEndpointsTlsConfig']
+
+@pulumi.output_type
+class PodMonitorSpecPodMetricsEndpointsTlsConfig(dict):
+    """
+    tlsConfig defines the TLS configuration used by the client.
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "insecureSkipVerify":
+            suggest = "insecure_skip_verify"
+        elif key == "keySecret":
+            suggest = "key_secret"
+        elif key == "maxVersion":
+            suggest = "max_version"
+        elif key == "minVersion":
+            suggest = "min_version"
+        elif key == "serverName":
+            suggest = "server_name"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in PodMonitorSpecPodMetricsEndpointsTlsConfig. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        PodMonitorSpecPodMetricsEndpointsTlsConfig.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        PodMonitorSpecPodMetricsEndpointsTlsConfig.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 ca: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCa'] = None,
+                 cert: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCert'] = None,
+                 insecure_skip_verify: Optional[_builtins.bool] = None,
+                 key_secret: Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecret'] = None,
+                 max_version: Optional[_builtins.str] = None,
+                 min_version: Optional[_builtins.str] = None,
+                 server_name: Optional[_builtins.str] = None):
+        """
+        tlsConfig defines the TLS configuration used by the client.
+
+        :param _builtins.bool insecure_skip_verify: insecureSkipVerify defines how to disable target certificate validation.
+        :param _builtins.str max_version: maxVersion defines the maximum acceptable TLS version.
+
+               It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
+        :param _builtins.str min_version: minVersion defines the minimum acceptable TLS version.
+
+               It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
+        :param _builtins.str server_name: serverName is used to verify the hostname for the targets.
+        """
+        if ca is not None:
+            pulumi.set(__self__, "ca", ca)
+        if cert is not None:
+            pulumi.set(__self__, "cert", cert)
+        if insecure_skip_verify is not None:
+            pulumi.set(__self__, "insecure_skip_verify", insecure_skip_verify)
+        if key_secret is not None:
+            pulumi.set(__self__, "key_secret", key_secret)
+        if max_version is not None:
+            pulumi.set(__self__, "max_version", max_version)
+        if min_version is not None:
+            pulumi.set(__self__, "min_version", min_version)
+        if server_name is not None:
+            pulumi.set(__self__, "server_name", server_name)
+
+    @_builtins.property
+    @pulumi.getter
+    def ca(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCa']:
+        return pulumi.get(self, "ca")
+
+    @_builtins.property
+    @pulumi.getter
+    def cert(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigCert']:
+        return pulumi.get(self, "cert")
+
+    @_builtins.property
+    @pulumi.getter(name="insecureSkipVerify")
+    def insecure_skip_verify(self) -> Optional[_builtins.bool]:
+        """
+        insecureSkipVerify defines how to disable target certificate validation.
+        """
+        return pulumi.get(self, "insecure_skip_verify")
+
+    @_builtins.property
+    @pulumi.getter(name="keySecret")
+    def key_secret(self) -> Optional['outputs.PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecret']:
+        return pulumi.get(self, "key_secret")
+
+    @_builtins.property
+    @pulumi.getter(name="maxVersion")
+    def max_version(self) -> Optional[_builtins.str]:
+        """
+        maxVersion defines the maximum acceptable TLS version.
+
+        It requires Prometheus >= v2.41.0 or Thanos >= v0.31.0.
+        """
+        return pulumi.get(self, "max_version")
+
+    @_builtins.property
+    @pulumi.getter(name="minVersion")
+    def min_version(self) -> Optional[_builtins.str]:
+        """
+        minVersion defines the minimum acceptable TLS version.
+
+        It requires Prometheus >= v2.35.0 or Thanos >= v0.28.0.
+        """
+        return pulumi.get(self, "min_version")
+
+    @_builtins.property
+    @pulumi.getter(name="serverName")
+    def server_name(self) -> Optional[_builtins.str]:
+        """
+        serverName is used to verify the hostname for the targets.
+        """
+        return pulumi.get(self, "server_name")
@@ -0,0 +1,445 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ServiceMonitorSpecEndpoints']
+
+@pulumi.output_type
+class ServiceMonitorSpecEndpoints(dict):
+    """
+    Endpoint defines an endpoint serving Prometheus metrics to be scraped by
+    Prometheus.
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "basicAuth":
+            suggest = "basic_auth"
+        elif key == "bearerTokenFile":
+            suggest = "bearer_token_file"
+        elif key == "bearerTokenSecret":
+            suggest = "bearer_token_secret"
+        elif key == "enableHttp2":
+            suggest = "enable_http2"
+        elif key == "filterRunning":
+            suggest = "filter_running"
+        elif key == "followRedirects":
+            suggest = "follow_redirects"
+        elif key == "honorLabels":
+            suggest = "honor_labels"
+        elif key == "honorTimestamps":
+            suggest = "honor_timestamps"
+        elif key == "metricRelabelings":
+            suggest = "metric_relabelings"
+        elif key == "noProxy":
+            suggest = "no_proxy"
+        elif key == "proxyConnectHeader":
+            suggest = "proxy_connect_header"
+        elif key == "proxyFromEnvironment":
+            suggest = "proxy_from_environment"
+        elif key == "proxyUrl":
+            suggest = "proxy_url"
+        elif key == "scrapeTimeout":
+            suggest = "scrape_timeout"
+        elif key == "targetPort":
+            suggest = "target_port"
+        elif key == "tlsConfig":
+            suggest = "tls_config"
+        elif key == "trackTimestampsStaleness":
+            suggest = "track_timestamps_staleness"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ServiceMonitorSpecEndpoints. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ServiceMonitorSpecEndpoints.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ServiceMonitorSpecEndpoints.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 authorization: Optional['outputs.ServiceMonitorSpecEndpointsAuthorization'] = None,
+                 basic_auth: Optional['outputs.ServiceMonitorSpecEndpointsBasicAuth'] = None,
+                 bearer_token_file: Optional[_builtins.str] = None,
+                 bearer_token_secret: Optional['outputs.ServiceMonitorSpecEndpointsBearerTokenSecret'] = None,
+                 enable_http2: Optional[_builtins.bool] = None,
+                 filter_running: Optional[_builtins.bool] = None,
+                 follow_redirects: Optional[_builtins.bool] = None,
+                 honor_labels: Optional[_builtins.bool] = None,
+                 honor_timestamps: Optional[_builtins.bool] = None,
+                 interval: Optional[_builtins.str] = None,
+                 metric_relabelings: Optional[Sequence['outputs.ServiceMonitorSpecEndpointsMetricRelabelings']] = None,
+                 no_proxy: Optional[_builtins.str] = None,
+                 oauth2: Optional['outputs.ServiceMonitorSpecEndpointsOauth2'] = None,
+                 params: Optional[Mapping[str, Sequence[_builtins.str]]] = None,
+                 path: Optional[_builtins.str] = None,
+                 port: Optional[_builtins.str] = None,
+                 proxy_connect_header: Optional[Mapping[str, Sequence['outputs.ServiceMonitorSpecEndpointsProxyConnectHeader']]] = None,
+                 proxy_from_environment: Optional[_builtins.bool] = None,
+                 proxy_url: Optional[_builtins.str] = None,
+                 relabelings: Optional[Sequence['outputs.ServiceMonitorSpecEndpointsRelabelings']] = None,
+                 scheme: Optional[_builtins.str] = None,
+                 scrape_timeout: Optional[_builtins.str] = None,
+                 target_port: Optional[Any] = None,
+                 tls_config: Optional['outputs.ServiceMonitorSpecEndpointsTlsConfig'] = None,
+                 track_timestamps_staleness: Optional[_builtins.bool] = None):
+        """
+        Endpoint defines an endpoint serving Prometheus metrics to be scraped by
+        Prometheus.
+
+        :param _builtins.str bearer_token_file: bearerTokenFile defines the file to read bearer token for scraping the target.
+
+               Deprecated: use `authorization` instead.
+        :param _builtins.bool enable_http2: enableHttp2 can be used to disable HTTP2.
+        :param _builtins.bool filter_running: filterRunning when true, the pods which are not running (e.g. either in Failed or
+               Succeeded state) are dropped during the target discovery.
+
+               If unset, the filtering is enabled.
+
+               More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
+        :param _builtins.bool follow_redirects: followRedirects defines whether the client should follow HTTP 3xx
+               redirects.
+        :param _builtins.bool honor_labels: honorLabels defines when true the metric's labels when they collide
+               with the target's labels.
+        :param _builtins.bool honor_timestamps: honorTimestamps defines whether Prometheus preserves the timestamps
+               when exposed by the target.
+        :param _builtins.str interval: interval at which Prometheus scrapes the metrics from the target.
+
+               If empty, Prometheus uses the global scrape interval.
+        :param Sequence['ServiceMonitorSpecEndpointsMetricRelabelingsArgs'] metric_relabelings: metricRelabelings defines the relabeling rules to apply to the
+               samples before ingestion.
+        :param _builtins.str no_proxy: noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
+               that should be excluded from proxying. IP and domain names can
+               contain port numbers.
+
+               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        :param Mapping[str, Sequence[_builtins.str]] params: params define optional HTTP URL parameters.
+        :param _builtins.str path: path defines the HTTP path from which to scrape for metrics.
+
+               If empty, Prometheus uses the default value (e.g. `/metrics`).
+        :param _builtins.str port: port defines the name of the Service port which this endpoint refers to.
+
+               It takes precedence over `targetPort`.
+        :param Mapping[str, Sequence['ServiceMonitorSpecEndpointsProxyConnectHeaderArgs']] proxy_connect_header: proxyConnectHeader optionally specifies headers to send to
+               proxies during CONNECT requests.
+
+               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        :param _builtins.bool proxy_from_environment: proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
+
+               It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        :param _builtins.str proxy_url: proxyUrl defines the HTTP proxy server to use.
+        :param Sequence['ServiceMonitorSpecEndpointsRelabelingsArgs'] relabelings: relabelings defines the relabeling rules to apply the target's
+               metadata labels.
+
+               The Operator automatically adds relabelings for a few standard Kubernetes fields.
+
+               The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
+
+               More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
+        :param _builtins.str scheme: scheme defines the HTTP scheme to use when scraping the metrics.
+        :param _builtins.str scrape_timeout: scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
+
+               If empty, Prometheus uses the global scrape timeout unless it is less
+               than the target's scrape interval value in which the latter is used.
+               The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
+        :param Union[_builtins.int, _builtins.str] target_port: targetPort defines the name or number of the target port of the `Pod` object behind the
+               Service. The port must be specified with the container's port property.
+        :param _builtins.bool track_timestamps_staleness: trackTimestampsStaleness defines whether Prometheus tracks staleness of
+               the metrics that have an explicit timestamp present in scraped data.
+               Has no effect if `honorTimestamps` is false.
+
+               It requires Prometheus >= v2.48.0.
+        """
+        if authorization is not None:
+            pulumi.set(__self__, "authorization", authorization)
+        if basic_auth is not None:
+            pulumi.set(__self__, "basic_auth", basic_auth)
+        if bearer_token_file is not None:
+            pulumi.set(__self__, "bearer_token_file", bearer_token_file)
+        if bearer_token_secret is not None:
+            pulumi.set(__self__, "bearer_token_secret", bearer_token_secret)
+        if enable_http2 is not None:
+            pulumi.set(__self__, "enable_http2", enable_http2)
+        if filter_running is not None:
+            pulumi.set(__self__, "filter_running", filter_running)
+        if follow_redirects is not None:
+            pulumi.set(__self__, "follow_redirects", follow_redirects)
+        if honor_labels is not None:
+            pulumi.set(__self__, "honor_labels", honor_labels)
+        if honor_timestamps is not None:
+            pulumi.set(__self__, "honor_timestamps", honor_timestamps)
+        if interval is not None:
+            pulumi.set(__self__, "interval", interval)
+        if metric_relabelings is not None:
+            pulumi.set(__self__, "metric_relabelings", metric_relabelings)
+        if no_proxy is not None:
+            pulumi.set(__self__, "no_proxy", no_proxy)
+        if oauth2 is not None:
+            pulumi.set(__self__, "oauth2", oauth2)
+        if params is not None:
+            pulumi.set(__self__, "params", params)
+        if path is not None:
+            pulumi.set(__self__, "path", path)
+        if port is not None:
+            pulumi.set(__self__, "port", port)
+        if proxy_connect_header is not None:
+            pulumi.set(__self__, "proxy_connect_header", proxy_connect_header)
+        if proxy_from_environment is not None:
+            pulumi.set(__self__, "proxy_from_environment", proxy_from_environment)
+        if proxy_url is not None:
+            pulumi.set(__self__, "proxy_url", proxy_url)
+        if relabelings is not None:
+            pulumi.set(__self__, "relabelings", relabelings)
+        if scheme is not None:
+            pulumi.set(__self__, "scheme", scheme)
+        if scrape_timeout is not None:
+            pulumi.set(__self__, "scrape_timeout", scrape_timeout)
+        if target_port is not None:
+            pulumi.set(__self__, "target_port", target_port)
+        if tls_config is not None:
+            pulumi.set(__self__, "tls_config", tls_config)
+        if track_timestamps_staleness is not None:
+            pulumi.set(__self__, "track_timestamps_staleness", track_timestamps_staleness)
+
+    @_builtins.property
+    @pulumi.getter
+    def authorization(self) -> Optional['outputs.ServiceMonitorSpecEndpointsAuthorization']:
+        return pulumi.get(self, "authorization")
+
+    @_builtins.property
+    @pulumi.getter(name="basicAuth")
+    def basic_auth(self) -> Optional['outputs.ServiceMonitorSpecEndpointsBasicAuth']:
+        return pulumi.get(self, "basic_auth")
+
+    @_builtins.property
+    @pulumi.getter(name="bearerTokenFile")
+    def bearer_token_file(self) -> Optional[_builtins.str]:
+        """
+        bearerTokenFile defines the file to read bearer token for scraping the target.
+
+        Deprecated: use `authorization` instead.
+        """
+        return pulumi.get(self, "bearer_token_file")
+
+    @_builtins.property
+    @pulumi.getter(name="bearerTokenSecret")
+    def bearer_token_secret(self) -> Optional['outputs.ServiceMonitorSpecEndpointsBearerTokenSecret']:
+        return pulumi.get(self, "bearer_token_secret")
+
+    @_builtins.property
+    @pulumi.getter(name="enableHttp2")
+    def enable_http2(self) -> Optional[_builtins.bool]:
+        """
+        enableHttp2 can be used to disable HTTP2.
+        """
+        return pulumi.get(self, "enable_http2")
+
+    @_builtins.property
+    @pulumi.getter(name="filterRunning")
+    def filter_running(self) -> Optional[_builtins.bool]:
+        """
+        filterRunning when true, the pods which are not running (e.g. either in Failed or
+        Succeeded state) are dropped during the target discovery.
+
+        If unset, the filtering is enabled.
+
+        More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#pod-phase
+        """
+        return pulumi.get(self, "filter_running")
+
+    @_builtins.property
+    @pulumi.getter(name="followRedirects")
+    def follow_redirects(self) -> Optional[_builtins.bool]:
+        """
+        followRedirects defines whether the client should follow HTTP 3xx
+        redirects.
+        """
+        return pulumi.get(self, "follow_redirects")
+
+    @_builtins.property
+    @pulumi.getter(name="honorLabels")
+    def honor_labels(self) -> Optional[_builtins.bool]:
+        """
+        honorLabels defines when true the metric's labels when they collide
+        with the target's labels.
+        """
+        return pulumi.get(self, "honor_labels")
+
+    @_builtins.property
+    @pulumi.getter(name="honorTimestamps")
+    def honor_timestamps(self) -> Optional[_builtins.bool]:
+        """
+        honorTimestamps defines whether Prometheus preserves the timestamps
+        when exposed by the target.
+        """
+        return pulumi.get(self, "honor_timestamps")
+
+    @_builtins.property
+    @pulumi.getter
+    def interval(self) -> Optional[_builtins.str]:
+        """
+        interval at which Prometheus scrapes the metrics from the target.
+
+        If empty, Prometheus uses the global scrape interval.
+        """
+        return pulumi.get(self, "interval")
+
+    @_builtins.property
+    @pulumi.getter(name="metricRelabelings")
+    def metric_relabelings(self) -> Optional[Sequence['outputs.ServiceMonitorSpecEndpointsMetricRelabelings']]:
+        """
+        metricRelabelings defines the relabeling rules to apply to the
+        samples before ingestion.
+        """
+        return pulumi.get(self, "metric_relabelings")
+
+    @_builtins.property
+    @pulumi.getter(name="noProxy")
+    def no_proxy(self) -> Optional[_builtins.str]:
+        """
+        noProxy defines a comma-separated string that can contain IPs, CIDR notation, domain names
+        that should be excluded from proxying. IP and domain names can
+        contain port numbers.
+
+        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        """
+        return pulumi.get(self, "no_proxy")
+
+    @_builtins.property
+    @pulumi.getter
+    def oauth2(self) -> Optional['outputs.ServiceMonitorSpecEndpointsOauth2']:
+        return pulumi.get(self, "oauth2")
+
+    @_builtins.property
+    @pulumi.getter
+    def params(self) -> Optional[Mapping[str, Sequence[_builtins.str]]]:
+        """
+        params define optional HTTP URL parameters.
+        """
+        return pulumi.get(self, "params")
+
+    @_builtins.property
+    @pulumi.getter
+    def path(self) -> Optional[_builtins.str]:
+        """
+        path defines the HTTP path from which to scrape for metrics.
+
+        If empty, Prometheus uses the default value (e.g. `/metrics`).
+        """
+        return pulumi.get(self, "path")
+
+    @_builtins.property
+    @pulumi.getter
+    def port(self) -> Optional[_builtins.str]:
+        """
+        port defines the name of the Service port which this endpoint refers to.
+
+        It takes precedence over `targetPort`.
+        """
+        return pulumi.get(self, "port")
+
+    @_builtins.property
+    @pulumi.getter(name="proxyConnectHeader")
+    def proxy_connect_header(self) -> Optional[Mapping[str, Sequence['outputs.ServiceMonitorSpecEndpointsProxyConnectHeader']]]:
+        """
+        proxyConnectHeader optionally specifies headers to send to
+        proxies during CONNECT requests.
+
+        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        """
+        return pulumi.get(self, "proxy_connect_header")
+
+    @_builtins.property
+    @pulumi.getter(name="proxyFromEnvironment")
+    def proxy_from_environment(self) -> Optional[_builtins.bool]:
+        """
+        proxyFromEnvironment defines whether to use the proxy configuration defined by environment variables (HTTP_PROXY, HTTPS_PROXY, and NO_PROXY).
+
+        It requires Prometheus >= v2.43.0, Alertmanager >= v0.25.0 or Thanos >= v0.32.0.
+        """
+        return pulumi.get(self, "proxy_from_environment")
+
+    @_builtins.property
+    @pulumi.getter(name="proxyUrl")
+    def proxy_url(self) -> Optional[_builtins.str]:
+        """
+        proxyUrl defines the HTTP proxy server to use.
+        """
+        return pulumi.get(self, "proxy_url")
+
+    @_builtins.property
+    @pulumi.getter
+    def relabelings(self) -> Optional[Sequence['outputs.ServiceMonitorSpecEndpointsRelabelings']]:
+        """
+        relabelings defines the relabeling rules to apply the target's
+        metadata labels.
+
+        The Operator automatically adds relabelings for a few standard Kubernetes fields.
+
+        The original scrape job's name is available via the `__tmp_prometheus_job_name` label.
+
+        More info: https://prometheus.io/docs/prometheus/latest/configuration/configuration/#relabel_config
+        """
+        return pulumi.get(self, "relabelings")
+
+    @_builtins.property
+    @pulumi.getter
+    def scheme(self) -> Optional[_builtins.str]:
+        """
+        scheme defines the HTTP scheme to use when scraping the metrics.
+        """
+        return pulumi.get(self, "scheme")
+
+    @_builtins.property
+    @pulumi.getter(name="scrapeTimeout")
+    def scrape_timeout(self) -> Optional[_builtins.str]:
+        """
+        scrapeTimeout defines the timeout after which Prometheus considers the scrape to be failed.
+
+        If empty, Prometheus uses the global scrape timeout unless it is less
+        than the target's scrape interval value in which the latter is used.
+        The value cannot be greater than the scrape interval otherwise the operator will reject the resource.
+        """
+        return pulumi.get(self, "scrape_timeout")
+
+    @_builtins.property
+    @pulumi.getter(name="targetPort")
+    def target_port(self) -> Optional[Any]:
+        """
+        targetPort defines the name or number of the target port of the `Pod` object behind the
+        Service. The port must be specified with the container's port property.
+        """
+        return pulumi.get(self, "target_port")
+
+    @_builtins.property
+    @pulumi.getter(name="tlsConfig")
+    def tls_config(self) -> Optional['outputs.ServiceMonitorSpecEndpointsTlsConfig']:
+        return pulumi.get(self, "tls_config")
+
+    @_builtins.property
+    @pulumi.getter(name="trackTimestampsStaleness")
+    def track_timestamps_staleness(self) -> Optional[_builtins.bool]:
+        """
+        trackTimestampsStaleness defines whether Prometheus tracks staleness of
+        the metrics that have an explicit timestamp present in scraped data.
+        Has no effect if `honorTimestamps` is false.
+
+        It requires Prometheus >= v2.48.0.
+        """
+        return pulumi.get(self, "track_timestamps_staleness")
@@ -0,0 +1,51 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ServiceMonitorSpecEndpointsBasicAuthPatch']
+
+@pulumi.output_type
+class ServiceMonitorSpecEndpointsBasicAuthPatch(dict):
+    """
+    basicAuth defines the Basic Authentication credentials used by the
+    client.
+
+    Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
+    """
+    def __init__(__self__, *,
+                 password: Optional['outputs.ServiceMonitorSpecEndpointsBasicAuthPasswordPatch'] = None,
+                 username: Optional['outputs.ServiceMonitorSpecEndpointsBasicAuthUsernamePatch'] = None):
+        """
+        basicAuth defines the Basic Authentication credentials used by the
+        client.
+
+        Cannot be set at the same time as `authorization`, `bearerTokenSecret` or `oauth2`.
+        """
+        if password is not None:
+            pulumi.set(__self__, "password", password)
+        if username is not None:
+            pulumi.set(__self__, "username", username)
+
+    @_builtins.property
+    @pulumi.getter
+    def password(self) -> Optional['outputs.ServiceMonitorSpecEndpointsBasicAuthPasswordPatch']:
+        return pulumi.get(self, "password")
+
+    @_builtins.property
+    @pulumi.getter
+    def username(self) -> Optional['outputs.ServiceMonitorSpecEndpointsBasicAuthUsernamePatch']:
+        return pulumi.get(self, "username")
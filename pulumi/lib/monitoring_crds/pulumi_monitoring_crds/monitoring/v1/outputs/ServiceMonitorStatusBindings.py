@@ -0,0 +1,90 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ServiceMonitorStatusBindings']
+
+@pulumi.output_type
+class ServiceMonitorStatusBindings(dict):
+    """
+    WorkloadBinding is a link between a configuration resource and a workload resource.
+    """
+    def __init__(__self__, *,
+                 conditions: Optional[Sequence['outputs.ServiceMonitorStatusBindingsConditions']] = None,
+                 group: Optional[_builtins.str] = None,
+                 name: Optional[_builtins.str] = None,
+                 namespace: Optional[_builtins.str] = None,
+                 resource: Optional[_builtins.str] = None):
+        """
+        WorkloadBinding is a link between a configuration resource and a workload resource.
+
+        :param Sequence['ServiceMonitorStatusBindingsConditionsArgs'] conditions: conditions defines the current state of the configuration resource when bound to the referenced Workload object.
+        :param _builtins.str group: group defines the group of the referenced resource.
+        :param _builtins.str name: name defines the name of the referenced object.
+        :param _builtins.str namespace: namespace defines the namespace of the referenced object.
+        :param _builtins.str resource: resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
+        """
+        if conditions is not None:
+            pulumi.set(__self__, "conditions", conditions)
+        if group is not None:
+            pulumi.set(__self__, "group", group)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if namespace is not None:
+            pulumi.set(__self__, "namespace", namespace)
+        if resource is not None:
+            pulumi.set(__self__, "resource", resource)
+
+    @_builtins.property
+    @pulumi.getter
+    def conditions(self) -> Optional[Sequence['outputs.ServiceMonitorStatusBindingsConditions']]:
+        """
+        conditions defines the current state of the configuration resource when bound to the referenced Workload object.
+        """
+        return pulumi.get(self, "conditions")
+
+    @_builtins.property
+    @pulumi.getter
+    def group(self) -> Optional[_builtins.str]:
+        """
+        group defines the group of the referenced resource.
+        """
+        return pulumi.get(self, "group")
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> Optional[_builtins.str]:
+        """
+        name defines the name of the referenced object.
+        """
+        return pulumi.get(self, "name")
+
+    @_builtins.property
+    @pulumi.getter
+    def namespace(self) -> Optional[_builtins.str]:
+        """
+        namespace defines the namespace of the referenced object.
+        """
+        return pulumi.get(self, "namespace")
+
+    @_builtins.property
+    @pulumi.getter
+    def resource(self) -> Optional[_builtins.str]:
+        """
+        resource defines the type of resource being referenced (e.g. Prometheus, PrometheusAgent, ThanosRuler or Alertmanager).
+        """
+        return pulumi.get(self, "resource")
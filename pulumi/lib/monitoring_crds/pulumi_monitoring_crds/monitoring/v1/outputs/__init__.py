@@ -0,0 +1,501 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import importlib
+import typing
+
+__all__ = [
+    'PodMonitor',
+    'PodMonitorSpec',
+    'PodMonitorSpecAttachMetadata',
+    'PodMonitorSpecAttachMetadataPatch',
+    'PodMonitorSpecNamespaceSelector',
+    'PodMonitorSpecNamespaceSelectorPatch',
+    'PodMonitorSpecPatch',
+    'PodMonitorSpecPodMetricsEndpoints',
+    'PodMonitorSpecPodMetricsEndpointsAuthorization',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentials',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatch',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationPatch',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuth',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPassword',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatch',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPatch',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsername',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatch',
+    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecret',
+    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatch',
+    'PodMonitorSpecPodMetricsEndpointsMetricRelabelings',
+    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientId',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMap',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecret',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecret',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2Patch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeader',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfig',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCa',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMap',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecret',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCert',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMap',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecret',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecret',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatch',
+    'PodMonitorSpecPodMetricsEndpointsPatch',
+    'PodMonitorSpecPodMetricsEndpointsProxyConnectHeader',
+    'PodMonitorSpecPodMetricsEndpointsRelabelings',
+    'PodMonitorSpecPodMetricsEndpointsRelabelingsPatch',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfig',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCa',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMap',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatch',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatch',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecret',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatch',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCert',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMap',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatch',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatch',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecret',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatch',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecret',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatch',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigPatch',
+    'PodMonitorSpecSelector',
+    'PodMonitorSpecSelectorMatchExpressions',
+    'PodMonitorSpecSelectorMatchExpressionsPatch',
+    'PodMonitorSpecSelectorPatch',
+    'PodMonitorStatus',
+    'PodMonitorStatusBindings',
+    'PodMonitorStatusBindingsConditions',
+    'PodMonitorStatusBindingsConditionsPatch',
+    'PodMonitorStatusBindingsPatch',
+    'PodMonitorStatusPatch',
+    'ServiceMonitor',
+    'ServiceMonitorSpec',
+    'ServiceMonitorSpecAttachMetadata',
+    'ServiceMonitorSpecAttachMetadataPatch',
+    'ServiceMonitorSpecEndpoints',
+    'ServiceMonitorSpecEndpointsAuthorization',
+    'ServiceMonitorSpecEndpointsAuthorizationCredentials',
+    'ServiceMonitorSpecEndpointsAuthorizationCredentialsPatch',
+    'ServiceMonitorSpecEndpointsAuthorizationPatch',
+    'ServiceMonitorSpecEndpointsBasicAuth',
+    'ServiceMonitorSpecEndpointsBasicAuthPassword',
+    'ServiceMonitorSpecEndpointsBasicAuthPasswordPatch',
+    'ServiceMonitorSpecEndpointsBasicAuthPatch',
+    'ServiceMonitorSpecEndpointsBasicAuthUsername',
+    'ServiceMonitorSpecEndpointsBasicAuthUsernamePatch',
+    'ServiceMonitorSpecEndpointsBearerTokenSecret',
+    'ServiceMonitorSpecEndpointsBearerTokenSecretPatch',
+    'ServiceMonitorSpecEndpointsMetricRelabelings',
+    'ServiceMonitorSpecEndpointsMetricRelabelingsPatch',
+    'ServiceMonitorSpecEndpointsOauth2',
+    'ServiceMonitorSpecEndpointsOauth2ClientId',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMap',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatch',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdPatch',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdSecret',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatch',
+    'ServiceMonitorSpecEndpointsOauth2ClientSecret',
+    'ServiceMonitorSpecEndpointsOauth2ClientSecretPatch',
+    'ServiceMonitorSpecEndpointsOauth2Patch',
+    'ServiceMonitorSpecEndpointsOauth2ProxyConnectHeader',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfig',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCa',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMap',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatch',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatch',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecret',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatch',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCert',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMap',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatch',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatch',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecret',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatch',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecret',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatch',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigPatch',
+    'ServiceMonitorSpecEndpointsPatch',
+    'ServiceMonitorSpecEndpointsProxyConnectHeader',
+    'ServiceMonitorSpecEndpointsRelabelings',
+    'ServiceMonitorSpecEndpointsRelabelingsPatch',
+    'ServiceMonitorSpecEndpointsTlsConfig',
+    'ServiceMonitorSpecEndpointsTlsConfigCa',
+    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMap',
+    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatch',
+    'ServiceMonitorSpecEndpointsTlsConfigCaPatch',
+    'ServiceMonitorSpecEndpointsTlsConfigCaSecret',
+    'ServiceMonitorSpecEndpointsTlsConfigCaSecretPatch',
+    'ServiceMonitorSpecEndpointsTlsConfigCert',
+    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMap',
+    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatch',
+    'ServiceMonitorSpecEndpointsTlsConfigCertPatch',
+    'ServiceMonitorSpecEndpointsTlsConfigCertSecret',
+    'ServiceMonitorSpecEndpointsTlsConfigCertSecretPatch',
+    'ServiceMonitorSpecEndpointsTlsConfigKeySecret',
+    'ServiceMonitorSpecEndpointsTlsConfigKeySecretPatch',
+    'ServiceMonitorSpecEndpointsTlsConfigPatch',
+    'ServiceMonitorSpecNamespaceSelector',
+    'ServiceMonitorSpecNamespaceSelectorPatch',
+    'ServiceMonitorSpecPatch',
+    'ServiceMonitorSpecSelector',
+    'ServiceMonitorSpecSelectorMatchExpressions',
+    'ServiceMonitorSpecSelectorMatchExpressionsPatch',
+    'ServiceMonitorSpecSelectorPatch',
+    'ServiceMonitorStatus',
+    'ServiceMonitorStatusBindings',
+    'ServiceMonitorStatusBindingsConditions',
+    'ServiceMonitorStatusBindingsConditionsPatch',
+    'ServiceMonitorStatusBindingsPatch',
+    'ServiceMonitorStatusPatch',
+]
+
+_TYPE_MODULES = {
+    'PodMonitor': 'PodMonitor',
+    'PodMonitorSpec': 'PodMonitorSpec',
+    'PodMonitorSpecAttachMetadata': 'PodMonitorSpecAttachMetadata',
+    'PodMonitorSpecAttachMetadataPatch': 'PodMonitorSpecAttachMetadataPatch',
+    'PodMonitorSpecNamespaceSelector': 'PodMonitorSpecNamespaceSelector',
+    'PodMonitorSpecNamespaceSelectorPatch': 'PodMonitorSpecNamespaceSelectorPatch',
+    'PodMonitorSpecPatch': 'PodMonitorSpecPatch',
+    'PodMonitorSpecPodMetricsEndpoints': 'PodMonitorSpecPodMetricsEndpoints',
+    'PodMonitorSpecPodMetricsEndpointsAuthorization': 'PodMonitorSpecPodMetricsEndpointsAuthorization',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentials': 'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentials',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatch': 'PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatch',
+    'PodMonitorSpecPodMetricsEndpointsAuthorizationPatch': 'PodMonitorSpecPodMetricsEndpointsAuthorizationPatch',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuth': 'PodMonitorSpecPodMetricsEndpointsBasicAuth',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPassword': 'PodMonitorSpecPodMetricsEndpointsBasicAuthPassword',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatch': 'PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatch',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthPatch': 'PodMonitorSpecPodMetricsEndpointsBasicAuthPatch',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsername': 'PodMonitorSpecPodMetricsEndpointsBasicAuthUsername',
+    'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatch': 'PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatch',
+    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecret': 'PodMonitorSpecPodMetricsEndpointsBearerTokenSecret',
+    'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatch': 'PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatch',
+    'PodMonitorSpecPodMetricsEndpointsMetricRelabelings': 'PodMonitorSpecPodMetricsEndpointsMetricRelabelings',
+    'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatch': 'PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2': 'PodMonitorSpecPodMetricsEndpointsOauth2',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientId': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientId',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMap': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMap',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatch': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatch': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecret': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecret',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatch': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecret': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecret',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatch': 'PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2Patch': 'PodMonitorSpecPodMetricsEndpointsOauth2Patch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeader': 'PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeader',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfig': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfig',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCa': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCa',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMap': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMap',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatch': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatch': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecret': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecret',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatch': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCert': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCert',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMap': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMap',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatch': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatch': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecret': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecret',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatch': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecret': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecret',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatch': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatch',
+    'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatch': 'PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatch',
+    'PodMonitorSpecPodMetricsEndpointsPatch': 'PodMonitorSpecPodMetricsEndpointsPatch',
+    'PodMonitorSpecPodMetricsEndpointsProxyConnectHeader': 'PodMonitorSpecPodMetricsEndpointsProxyConnectHeader',
+    'PodMonitorSpecPodMetricsEndpointsRelabelings': 'PodMonitorSpecPodMetricsEndpointsRelabelings',
+    'PodMonitorSpecPodMetricsEndpointsRelabelingsPatch': 'PodMonitorSpecPodMetricsEndpointsRelabelingsPatch',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfig': 'PodMonitorSpecPodMetricsEndpointsTlsConfig',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCa': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCa',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMap': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMap',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatch': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatch',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatch': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatch',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecret': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecret',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatch': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatch',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCert': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCert',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMap': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMap',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatch': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatch',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatch': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatch',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecret': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecret',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatch': 'PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatch',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecret': 'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecret',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatch': 'PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatch',
+    'PodMonitorSpecPodMetricsEndpointsTlsConfigPatch': 'PodMonitorSpecPodMetricsEndpointsTlsConfigPatch',
+    'PodMonitorSpecSelector': 'PodMonitorSpecSelector',
+    'PodMonitorSpecSelectorMatchExpressions': 'PodMonitorSpecSelectorMatchExpressions',
+    'PodMonitorSpecSelectorMatchExpressionsPatch': 'PodMonitorSpecSelectorMatchExpressionsPatch',
+    'PodMonitorSpecSelectorPatch': 'PodMonitorSpecSelectorPatch',
+    'PodMonitorStatus': 'PodMonitorStatus',
+    'PodMonitorStatusBindings': 'PodMonitorStatusBindings',
+    'PodMonitorStatusBindingsConditions': 'PodMonitorStatusBindingsConditions',
+    'PodMonitorStatusBindingsConditionsPatch': 'PodMonitorStatusBindingsConditionsPatch',
+    'PodMonitorStatusBindingsPatch': 'PodMonitorStatusBindingsPatch',
+    'PodMonitorStatusPatch': 'PodMonitorStatusPatch',
+    'ServiceMonitor': 'ServiceMonitor',
+    'ServiceMonitorSpec': 'ServiceMonitorSpec',
+    'ServiceMonitorSpecAttachMetadata': 'ServiceMonitorSpecAttachMetadata',
+    'ServiceMonitorSpecAttachMetadataPatch': 'ServiceMonitorSpecAttachMetadataPatch',
+    'ServiceMonitorSpecEndpoints': 'ServiceMonitorSpecEndpoints',
+    'ServiceMonitorSpecEndpointsAuthorization': 'ServiceMonitorSpecEndpointsAuthorization',
+    'ServiceMonitorSpecEndpointsAuthorizationCredentials': 'ServiceMonitorSpecEndpointsAuthorizationCredentials',
+    'ServiceMonitorSpecEndpointsAuthorizationCredentialsPatch': 'ServiceMonitorSpecEndpointsAuthorizationCredentialsPatch',
+    'ServiceMonitorSpecEndpointsAuthorizationPatch': 'ServiceMonitorSpecEndpointsAuthorizationPatch',
+    'ServiceMonitorSpecEndpointsBasicAuth': 'ServiceMonitorSpecEndpointsBasicAuth',
+    'ServiceMonitorSpecEndpointsBasicAuthPassword': 'ServiceMonitorSpecEndpointsBasicAuthPassword',
+    'ServiceMonitorSpecEndpointsBasicAuthPasswordPatch': 'ServiceMonitorSpecEndpointsBasicAuthPasswordPatch',
+    'ServiceMonitorSpecEndpointsBasicAuthPatch': 'ServiceMonitorSpecEndpointsBasicAuthPatch',
+    'ServiceMonitorSpecEndpointsBasicAuthUsername': 'ServiceMonitorSpecEndpointsBasicAuthUsername',
+    'ServiceMonitorSpecEndpointsBasicAuthUsernamePatch': 'ServiceMonitorSpecEndpointsBasicAuthUsernamePatch',
+    'ServiceMonitorSpecEndpointsBearerTokenSecret': 'ServiceMonitorSpecEndpointsBearerTokenSecret',
+    'ServiceMonitorSpecEndpointsBearerTokenSecretPatch': 'ServiceMonitorSpecEndpointsBearerTokenSecretPatch',
+    'ServiceMonitorSpecEndpointsMetricRelabelings': 'ServiceMonitorSpecEndpointsMetricRelabelings',
+    'ServiceMonitorSpecEndpointsMetricRelabelingsPatch': 'ServiceMonitorSpecEndpointsMetricRelabelingsPatch',
+    'ServiceMonitorSpecEndpointsOauth2': 'ServiceMonitorSpecEndpointsOauth2',
+    'ServiceMonitorSpecEndpointsOauth2ClientId': 'ServiceMonitorSpecEndpointsOauth2ClientId',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMap': 'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMap',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatch': 'ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatch',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdPatch': 'ServiceMonitorSpecEndpointsOauth2ClientIdPatch',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdSecret': 'ServiceMonitorSpecEndpointsOauth2ClientIdSecret',
+    'ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatch': 'ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatch',
+    'ServiceMonitorSpecEndpointsOauth2ClientSecret': 'ServiceMonitorSpecEndpointsOauth2ClientSecret',
+    'ServiceMonitorSpecEndpointsOauth2ClientSecretPatch': 'ServiceMonitorSpecEndpointsOauth2ClientSecretPatch',
+    'ServiceMonitorSpecEndpointsOauth2Patch': 'ServiceMonitorSpecEndpointsOauth2Patch',
+    'ServiceMonitorSpecEndpointsOauth2ProxyConnectHeader': 'ServiceMonitorSpecEndpointsOauth2ProxyConnectHeader',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfig': 'ServiceMonitorSpecEndpointsOauth2TlsConfig',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCa': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCa',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMap': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMap',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatch': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatch',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatch': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatch',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecret': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecret',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatch': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatch',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCert': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCert',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMap': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMap',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatch': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatch',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatch': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatch',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecret': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecret',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatch': 'ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatch',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecret': 'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecret',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatch': 'ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatch',
+    'ServiceMonitorSpecEndpointsOauth2TlsConfigPatch': 'ServiceMonitorSpecEndpointsOauth2TlsConfigPatch',
+    'ServiceMonitorSpecEndpointsPatch': 'ServiceMonitorSpecEndpointsPatch',
+    'ServiceMonitorSpecEndpointsProxyConnectHeader': 'ServiceMonitorSpecEndpointsProxyConnectHeader',
+    'ServiceMonitorSpecEndpointsRelabelings': 'ServiceMonitorSpecEndpointsRelabelings',
+    'ServiceMonitorSpecEndpointsRelabelingsPatch': 'ServiceMonitorSpecEndpointsRelabelingsPatch',
+    'ServiceMonitorSpecEndpointsTlsConfig': 'ServiceMonitorSpecEndpointsTlsConfig',
+    'ServiceMonitorSpecEndpointsTlsConfigCa': 'ServiceMonitorSpecEndpointsTlsConfigCa',
+    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMap': 'ServiceMonitorSpecEndpointsTlsConfigCaConfigMap',
+    'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatch': 'ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatch',
+    'ServiceMonitorSpecEndpointsTlsConfigCaPatch': 'ServiceMonitorSpecEndpointsTlsConfigCaPatch',
+    'ServiceMonitorSpecEndpointsTlsConfigCaSecret': 'ServiceMonitorSpecEndpointsTlsConfigCaSecret',
+    'ServiceMonitorSpecEndpointsTlsConfigCaSecretPatch': 'ServiceMonitorSpecEndpointsTlsConfigCaSecretPatch',
+    'ServiceMonitorSpecEndpointsTlsConfigCert': 'ServiceMonitorSpecEndpointsTlsConfigCert',
+    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMap': 'ServiceMonitorSpecEndpointsTlsConfigCertConfigMap',
+    'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatch': 'ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatch',
+    'ServiceMonitorSpecEndpointsTlsConfigCertPatch': 'ServiceMonitorSpecEndpointsTlsConfigCertPatch',
+    'ServiceMonitorSpecEndpointsTlsConfigCertSecret': 'ServiceMonitorSpecEndpointsTlsConfigCertSecret',
+    'ServiceMonitorSpecEndpointsTlsConfigCertSecretPatch': 'ServiceMonitorSpecEndpointsTlsConfigCertSecretPatch',
+    'ServiceMonitorSpecEndpointsTlsConfigKeySecret': 'ServiceMonitorSpecEndpointsTlsConfigKeySecret',
+    'ServiceMonitorSpecEndpointsTlsConfigKeySecretPatch': 'ServiceMonitorSpecEndpointsTlsConfigKeySecretPatch',
+    'ServiceMonitorSpecEndpointsTlsConfigPatch': 'ServiceMonitorSpecEndpointsTlsConfigPatch',
+    'ServiceMonitorSpecNamespaceSelector': 'ServiceMonitorSpecNamespaceSelector',
+    'ServiceMonitorSpecNamespaceSelectorPatch': 'ServiceMonitorSpecNamespaceSelectorPatch',
+    'ServiceMonitorSpecPatch': 'ServiceMonitorSpecPatch',
+    'ServiceMonitorSpecSelector': 'ServiceMonitorSpecSelector',
+    'ServiceMonitorSpecSelectorMatchExpressions': 'ServiceMonitorSpecSelectorMatchExpressions',
+    'ServiceMonitorSpecSelectorMatchExpressionsPatch': 'ServiceMonitorSpecSelectorMatchExpressionsPatch',
+    'ServiceMonitorSpecSelectorPatch': 'ServiceMonitorSpecSelectorPatch',
+    'ServiceMonitorStatus': 'ServiceMonitorStatus',
+    'ServiceMonitorStatusBindings': 'ServiceMonitorStatusBindings',
+    'ServiceMonitorStatusBindingsConditions': 'ServiceMonitorStatusBindingsConditions',
+    'ServiceMonitorStatusBindingsConditionsPatch': 'ServiceMonitorStatusBindingsConditionsPatch',
+    'ServiceMonitorStatusBindingsPatch': 'ServiceMonitorStatusBindingsPatch',
+    'ServiceMonitorStatusPatch': 'ServiceMonitorStatusPatch',
+}
+
+if typing.TYPE_CHECKING:
+    from .PodMonitor import *
+    from .PodMonitorSpec import *
+    from .PodMonitorSpecAttachMetadata import *
+    from .PodMonitorSpecAttachMetadataPatch import *
+    from .PodMonitorSpecNamespaceSelector import *
+    from .PodMonitorSpecNamespaceSelectorPatch import *
+    from .PodMonitorSpecPatch import *
+    from .PodMonitorSpecPodMetricsEndpoints import *
+    from .PodMonitorSpecPodMetricsEndpointsAuthorization import *
+    from .PodMonitorSpecPodMetricsEndpointsAuthorizationCredentials import *
+    from .PodMonitorSpecPodMetricsEndpointsAuthorizationCredentialsPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsAuthorizationPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsBasicAuth import *
+    from .PodMonitorSpecPodMetricsEndpointsBasicAuthPassword import *
+    from .PodMonitorSpecPodMetricsEndpointsBasicAuthPasswordPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsBasicAuthPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsBasicAuthUsername import *
+    from .PodMonitorSpecPodMetricsEndpointsBasicAuthUsernamePatch import *
+    from .PodMonitorSpecPodMetricsEndpointsBearerTokenSecret import *
+    from .PodMonitorSpecPodMetricsEndpointsBearerTokenSecretPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsMetricRelabelings import *
+    from .PodMonitorSpecPodMetricsEndpointsMetricRelabelingsPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2 import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2ClientId import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMap import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2ClientIdConfigMapPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2ClientIdPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecret import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2ClientIdSecretPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2ClientSecret import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2ClientSecretPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2Patch import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2ProxyConnectHeader import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfig import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCa import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMap import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaConfigMapPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecret import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCaSecretPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCert import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMap import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertConfigMapPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecret import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigCertSecretPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecret import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigKeySecretPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsOauth2TlsConfigPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsProxyConnectHeader import *
+    from .PodMonitorSpecPodMetricsEndpointsRelabelings import *
+    from .PodMonitorSpecPodMetricsEndpointsRelabelingsPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfig import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCa import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMap import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCaConfigMapPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCaPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecret import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCaSecretPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCert import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMap import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCertConfigMapPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCertPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecret import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigCertSecretPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecret import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigKeySecretPatch import *
+    from .PodMonitorSpecPodMetricsEndpointsTlsConfigPatch import *
+    from .PodMonitorSpecSelector import *
+    from .PodMonitorSpecSelectorMatchExpressions import *
+    from .PodMonitorSpecSelectorMatchExpressionsPatch import *
+    from .PodMonitorSpecSelectorPatch import *
+    from .PodMonitorStatus import *
+    from .PodMonitorStatusBindings import *
+    from .PodMonitorStatusBindingsConditions import *
+    from .PodMonitorStatusBindingsConditionsPatch import *
+    from .PodMonitorStatusBindingsPatch import *
+    from .PodMonitorStatusPatch import *
+    from .ServiceMonitor import *
+    from .ServiceMonitorSpec import *
+    from .ServiceMonitorSpecAttachMetadata import *
+    from .ServiceMonitorSpecAttachMetadataPatch import *
+    from .ServiceMonitorSpecEndpoints import *
+    from .ServiceMonitorSpecEndpointsAuthorization import *
+    from .ServiceMonitorSpecEndpointsAuthorizationCredentials import *
+    from .ServiceMonitorSpecEndpointsAuthorizationCredentialsPatch import *
+    from .ServiceMonitorSpecEndpointsAuthorizationPatch import *
+    from .ServiceMonitorSpecEndpointsBasicAuth import *
+    from .ServiceMonitorSpecEndpointsBasicAuthPassword import *
+    from .ServiceMonitorSpecEndpointsBasicAuthPasswordPatch import *
+    from .ServiceMonitorSpecEndpointsBasicAuthPatch import *
+    from .ServiceMonitorSpecEndpointsBasicAuthUsername import *
+    from .ServiceMonitorSpecEndpointsBasicAuthUsernamePatch import *
+    from .ServiceMonitorSpecEndpointsBearerTokenSecret import *
+    from .ServiceMonitorSpecEndpointsBearerTokenSecretPatch import *
+    from .ServiceMonitorSpecEndpointsMetricRelabelings import *
+    from .ServiceMonitorSpecEndpointsMetricRelabelingsPatch import *
+    from .ServiceMonitorSpecEndpointsOauth2 import *
+    from .ServiceMonitorSpecEndpointsOauth2ClientId import *
+    from .ServiceMonitorSpecEndpointsOauth2ClientIdConfigMap import *
+    from .ServiceMonitorSpecEndpointsOauth2ClientIdConfigMapPatch import *
+    from .ServiceMonitorSpecEndpointsOauth2ClientIdPatch import *
+    from .ServiceMonitorSpecEndpointsOauth2ClientIdSecret import *
+    from .ServiceMonitorSpecEndpointsOauth2ClientIdSecretPatch import *
+    from .ServiceMonitorSpecEndpointsOauth2ClientSecret import *
+    from .ServiceMonitorSpecEndpointsOauth2ClientSecretPatch import *
+    from .ServiceMonitorSpecEndpointsOauth2Patch import *
+    from .ServiceMonitorSpecEndpointsOauth2ProxyConnectHeader import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfig import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCa import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMap import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCaConfigMapPatch import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCaPatch import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecret import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCaSecretPatch import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCert import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMap import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCertConfigMapPatch import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCertPatch import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecret import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigCertSecretPatch import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecret import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigKeySecretPatch import *
+    from .ServiceMonitorSpecEndpointsOauth2TlsConfigPatch import *
+    from .ServiceMonitorSpecEndpointsPatch import *
+    from .ServiceMonitorSpecEndpointsProxyConnectHeader import *
+    from .ServiceMonitorSpecEndpointsRelabelings import *
+    from .ServiceMonitorSpecEndpointsRelabelingsPatch import *
+    from .ServiceMonitorSpecEndpointsTlsConfig import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCa import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCaConfigMap import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCaConfigMapPatch import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCaPatch import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCaSecret import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCaSecretPatch import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCert import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCertConfigMap import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCertConfigMapPatch import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCertPatch import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCertSecret import *
+    from .ServiceMonitorSpecEndpointsTlsConfigCertSecretPatch import *
+    from .ServiceMonitorSpecEndpointsTlsConfigKeySecret import *
+    from .ServiceMonitorSpecEndpointsTlsConfigKeySecretPatch import *
+    from .ServiceMonitorSpecEndpointsTlsConfigPatch import *
+    from .ServiceMonitorSpecNamespaceSelector import *
+    from .ServiceMonitorSpecNamespaceSelectorPatch import *
+    from .ServiceMonitorSpecPatch import *
+    from .ServiceMonitorSpecSelector import *
+    from .ServiceMonitorSpecSelectorMatchExpressions import *
+    from .ServiceMonitorSpecSelectorMatchExpressionsPatch import *
+    from .ServiceMonitorSpecSelectorPatch import *
+    from .ServiceMonitorStatus import *
+    from .ServiceMonitorStatusBindings import *
+    from .ServiceMonitorStatusBindingsConditions import *
+    from .ServiceMonitorStatusBindingsConditionsPatch import *
+    from .ServiceMonitorStatusBindingsPatch import *
+    from .ServiceMonitorStatusPatch import *
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _TYPE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
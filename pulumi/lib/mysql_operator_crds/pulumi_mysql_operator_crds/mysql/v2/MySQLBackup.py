@@ -15,7 +15,7 @@ else:
 from ... import _utilities
 from . import outputs
 from ... import meta as _meta
-from ._inputs import *
+from . import _inputs
 
 __all__ = ['MySQLBackupInitArgs', 'MySQLBackup']
 
@@ -25,7 +25,7 @@ class MySQLBackupInitArgs:
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']] = None,
-                 spec: pulumi.Input[Optional['MySQLBackupSpecArgs']] = None):
+                 spec: pulumi.Input[Optional['_inputs.MySQLBackupSpecArgs']] = None):
         """
         The set of arguments for constructing a MySQLBackup resource.
 
@@ -80,11 +80,11 @@ class MySQLBackupInitArgs:
 
     @_builtins.property
     @pulumi.getter
-    def spec(self) -> pulumi.Input[Optional['MySQLBackupSpecArgs']]:
+    def spec(self) -> pulumi.Input[Optional['_inputs.MySQLBackupSpecArgs']]:
         return pulumi.get(self, "spec")
 
     @spec.setter
-    def spec(self, value: pulumi.Input[Optional['MySQLBackupSpecArgs']]):
+    def spec(self, value: pulumi.Input[Optional['_inputs.MySQLBackupSpecArgs']]):
         pulumi.set(self, "spec", value)
 
 
@@ -97,7 +97,7 @@ class MySQLBackup(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaArgs', '_meta.v1.ObjectMetaArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['MySQLBackupSpecArgs', 'MySQLBackupSpecArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.MySQLBackupSpecArgs', '_inputs.MySQLBackupSpecArgsDict']]] = None,
                  __props__=None):
         """
         Create a MySQLBackup resource with the given unique name, props, and options.
@@ -135,7 +135,7 @@ class MySQLBackup(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaArgs', '_meta.v1.ObjectMetaArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['MySQLBackupSpecArgs', 'MySQLBackupSpecArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.MySQLBackupSpecArgs', '_inputs.MySQLBackupSpecArgsDict']]] = None,
                  __props__=None):
         opts = pulumi.ResourceOptions.merge(_utilities.get_resource_opts_defaults(), opts)
         if not isinstance(opts, pulumi.ResourceOptions):
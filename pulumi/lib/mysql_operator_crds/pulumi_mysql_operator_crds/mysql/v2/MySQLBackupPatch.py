@@ -15,7 +15,7 @@ else:
 from ... import _utilities
 from . import outputs
 from ... import meta as _meta
-from ._inputs import *
+from . import _inputs
 
 __all__ = ['MySQLBackupPatchArgs', 'MySQLBackupPatch']
 
@@ -25,7 +25,7 @@ class MySQLBackupPatchArgs:
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional['_meta.v1.ObjectMetaPatchArgs']] = None,
-                 spec: pulumi.Input[Optional['MySQLBackupSpecPatchArgs']] = None):
+                 spec: pulumi.Input[Optional['_inputs.MySQLBackupSpecPatchArgs']] = None):
         """
         The set of arguments for constructing a MySQLBackupPatch resource.
 
@@ -80,11 +80,11 @@ class MySQLBackupPatchArgs:
 
     @_builtins.property
     @pulumi.getter
-    def spec(self) -> pulumi.Input[Optional['MySQLBackupSpecPatchArgs']]:
+    def spec(self) -> pulumi.Input[Optional['_inputs.MySQLBackupSpecPatchArgs']]:
         return pulumi.get(self, "spec")
 
     @spec.setter
-    def spec(self, value: pulumi.Input[Optional['MySQLBackupSpecPatchArgs']]):
+    def spec(self, value: pulumi.Input[Optional['_inputs.MySQLBackupSpecPatchArgs']]):
         pulumi.set(self, "spec", value)
 
 
@@ -97,7 +97,7 @@ class MySQLBackupPatch(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaPatchArgs', '_meta.v1.ObjectMetaPatchArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['MySQLBackupSpecPatchArgs', 'MySQLBackupSpecPatchArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.MySQLBackupSpecPatchArgs', '_inputs.MySQLBackupSpecPatchArgsDict']]] = None,
                  __props__=None):
         """
         Patch resources are used to modify existing Kubernetes resources by using
@@ -147,7 +147,7 @@ class MySQLBackupPatch(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaPatchArgs', '_meta.v1.ObjectMetaPatchArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['MySQLBackupSpecPatchArgs', 'MySQLBackupSpecPatchArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.MySQLBackupSpecPatchArgs', '_inputs.MySQLBackupSpecPatchArgsDict']]] = None,
                  __props__=None):
         opts = pulumi.ResourceOptions.merge(_utilities.get_resource_opts_defaults(), opts)
         if not isinstance(opts, pulumi.ResourceOptions):
@@ -15,7 +15,7 @@ else:
 from ... import _utilities
 from . import outputs
 from ... import meta as _meta
-from ._inputs import *
+from . import _inputs
 
 __all__ = ['MySQLClusterSetFailoverInitArgs', 'MySQLClusterSetFailover']
 
@@ -25,7 +25,7 @@ class MySQLClusterSetFailoverInitArgs:
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']] = None,
-                 spec: pulumi.Input[Optional['MySQLClusterSetFailoverSpecArgs']] = None):
+                 spec: pulumi.Input[Optional['_inputs.MySQLClusterSetFailoverSpecArgs']] = None):
         """
         The set of arguments for constructing a MySQLClusterSetFailover resource.
 
@@ -80,11 +80,11 @@ class MySQLClusterSetFailoverInitArgs:
 
     @_builtins.property
     @pulumi.getter
-    def spec(self) -> pulumi.Input[Optional['MySQLClusterSetFailoverSpecArgs']]:
+    def spec(self) -> pulumi.Input[Optional['_inputs.MySQLClusterSetFailoverSpecArgs']]:
         return pulumi.get(self, "spec")
 
     @spec.setter
-    def spec(self, value: pulumi.Input[Optional['MySQLClusterSetFailoverSpecArgs']]):
+    def spec(self, value: pulumi.Input[Optional['_inputs.MySQLClusterSetFailoverSpecArgs']]):
         pulumi.set(self, "spec", value)
 
 
@@ -97,7 +97,7 @@ class MySQLClusterSetFailover(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaArgs', '_meta.v1.ObjectMetaArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['MySQLClusterSetFailoverSpecArgs', 'MySQLClusterSetFailoverSpecArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.MySQLClusterSetFailoverSpecArgs', '_inputs.MySQLClusterSetFailoverSpecArgsDict']]] = None,
                  __props__=None):
         """
         Create a MySQLClusterSetFailover resource with the given unique name, props, and options.
@@ -135,7 +135,7 @@ class MySQLClusterSetFailover(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaArgs', '_meta.v1.ObjectMetaArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['MySQLClusterSetFailoverSpecArgs', 'MySQLClusterSetFailoverSpecArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.MySQLClusterSetFailoverSpecArgs', '_inputs.MySQLClusterSetFailoverSpecArgsDict']]] = None,
                  __props__=None):
         opts = pulumi.ResourceOptions.merge(_utilities.get_resource_opts_defaults(), opts)
         if not isinstance(opts, pulumi.ResourceOptions):
@@ -3,17 +3,224 @@
 # *** Do not edit by hand unless you're certain you know what you are doing! ***
 
 import builtins as _builtins
-from ... import _utilities
+import importlib
 import typing
-# Export this package's modules as members:
-from .InnoDBCluster import *
-from .InnoDBClusterList import *
-from .InnoDBClusterPatch import *
-from .MySQLBackup import *
-from .MySQLBackupList import *
-from .MySQLBackupPatch import *
-from .MySQLClusterSetFailover import *
-from .MySQLClusterSetFailoverList import *
-from .MySQLClusterSetFailoverPatch import *
-from ._inputs import *
-from . import outputs
+from ... import _utilities
+
+__all__ = [
+    'InnoDBClusterInitArgs',
+    'InnoDBCluster',
+    'InnoDBClusterListArgs',
+    'InnoDBClusterList',
+    'InnoDBClusterPatchArgs',
+    'InnoDBClusterPatch',
+    'MySQLBackupInitArgs',
+    'MySQLBackup',
+    'MySQLBackupListArgs',
+    'MySQLBackupList',
+    'MySQLBackupPatchArgs',
+    'MySQLBackupPatch',
+    'MySQLClusterSetFailoverInitArgs',
+    'MySQLClusterSetFailover',
+    'MySQLClusterSetFailoverListArgs',
+    'MySQLClusterSetFailoverList',
+    'MySQLClusterSetFailoverPatchArgs',
+    'MySQLClusterSetFailoverPatch',
+    'InnoDBClusterSpecDatadirPermissionsPatchArgsDict',
+    'InnoDBClusterSpecDatadirPermissionsPatchArgs',
+    'InnoDBClusterSpecDatadirPermissionsArgsDict',
+    'InnoDBClusterSpecDatadirPermissionsArgs',
+    'InnoDBClusterSpecImagePullSecretsPatchArgsDict',
+    'InnoDBClusterSpecImagePullSecretsPatchArgs',
+    'InnoDBClusterSpecImagePullSecretsArgsDict',
+    'InnoDBClusterSpecImagePullSecretsArgs',
+    'InnoDBClusterSpecInstanceServicePatchArgsDict',
+    'InnoDBClusterSpecInstanceServicePatchArgs',
+    'InnoDBClusterSpecInstanceServiceArgsDict',
+    'InnoDBClusterSpecInstanceServiceArgs',
+    'InnoDBClusterSpecKeyringEncryptedFilePatchArgsDict',
+    'InnoDBClusterSpecKeyringEncryptedFilePatchArgs',
+    'InnoDBClusterSpecKeyringEncryptedFileArgsDict',
+    'InnoDBClusterSpecKeyringEncryptedFileArgs',
+    'InnoDBClusterSpecKeyringFilePatchArgsDict',
+    'InnoDBClusterSpecKeyringFilePatchArgs',
+    'InnoDBClusterSpecKeyringFileArgsDict',
+    'InnoDBClusterSpecKeyringFileArgs',
+    'InnoDBClusterSpecKeyringKmipPatchArgsDict',
+    'InnoDBClusterSpecKeyringKmipPatchArgs',
+    'InnoDBClusterSpecKeyringKmipArgsDict',
+    'InnoDBClusterSpecKeyringKmipArgs',
+    'InnoDBClusterSpecKeyringOciEndpointsPatchArgsDict',
+    'InnoDBClusterSpecKeyringOciEndpointsPatchArgs',
+    'InnoDBClusterSpecKeyringOciEndpointsArgsDict',
+    'InnoDBClusterSpecKeyringOciEndpointsArgs',
+    'InnoDBClusterSpecKeyringOciPatchArgsDict',
+    'InnoDBClusterSpecKeyringOciPatchArgs',
+    'InnoDBClusterSpecKeyringOciArgsDict',
+    'InnoDBClusterSpecKeyringOciArgs',
+    'InnoDBClusterSpecKeyringPatchArgsDict',
+    'InnoDBClusterSpecKeyringPatchArgs',
+    'InnoDBClusterSpecKeyringArgsDict',
+    'InnoDBClusterSpecKeyringArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdErrorLogPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdErrorLogPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdErrorLogArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdErrorLogArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdGeneralLogArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdGeneralLogArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdArgs',
+    'InnoDBClusterSpecLogsCollectorPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorPatchArgs',
+    'InnoDBClusterSpecLogsCollectorArgsDict',
+    'InnoDBClusterSpecLogsCollectorArgs',
+    'InnoDBClusterSpecLogsErrorPatchArgsDict',
+    'InnoDBClusterSpecLogsErrorPatchArgs',
+    'InnoDBClusterSpecLogsErrorArgsDict',
+    'InnoDBClusterSpecLogsErrorArgs',
+    'InnoDBClusterSpecLogsGeneralPatchArgsDict',
+    'InnoDBClusterSpecLogsGeneralPatchArgs',
+    'InnoDBClusterSpecLogsGeneralArgsDict',
+    'InnoDBClusterSpecLogsGeneralArgs',
+    'InnoDBClusterSpecLogsPatchArgsDict',
+    'InnoDBClusterSpecLogsPatchArgs',
+    'InnoDBClusterSpecLogsSlowQueryPatchArgsDict',
+    'InnoDBClusterSpecLogsSlowQueryPatchArgs',
+    'InnoDBClusterSpecLogsSlowQueryArgsDict',
+    'InnoDBClusterSpecLogsSlowQueryArgs',
+    'InnoDBClusterSpecLogsArgsDict',
+    'InnoDBClusterSpecLogsArgs',
+    'InnoDBClusterSpecMetricsPatchArgsDict',
+    'InnoDBClusterSpecMetricsPatchArgs',
+    'InnoDBClusterSpecMetricsArgsDict',
+    'InnoDBClusterSpecMetricsArgs',
+    'InnoDBClusterSpecPatchArgsDict',
+    'InnoDBClusterSpecPatchArgs',
+    'InnoDBClusterSpecReadReplicasPatchArgsDict',
+    'InnoDBClusterSpecReadReplicasPatchArgs',
+    'InnoDBClusterSpecReadReplicasArgsDict',
+    'InnoDBClusterSpecReadReplicasArgs',
+    'InnoDBClusterSpecRouterPatchArgsDict',
+    'InnoDBClusterSpecRouterPatchArgs',
+    'InnoDBClusterSpecRouterRoutingOptionsPatchArgsDict',
+    'InnoDBClusterSpecRouterRoutingOptionsPatchArgs',
+    'InnoDBClusterSpecRouterRoutingOptionsArgsDict',
+    'InnoDBClusterSpecRouterRoutingOptionsArgs',
+    'InnoDBClusterSpecRouterArgsDict',
+    'InnoDBClusterSpecRouterArgs',
+    'InnoDBClusterSpecServicePatchArgsDict',
+    'InnoDBClusterSpecServicePatchArgs',
+    'InnoDBClusterSpecServiceArgsDict',
+    'InnoDBClusterSpecServiceArgs',
+    'InnoDBClusterSpecArgsDict',
+    'InnoDBClusterSpecArgs',
+    'InnoDBClusterArgsDict',
+    'InnoDBClusterArgs',
+    'MySQLBackupSpecPatchArgsDict',
+    'MySQLBackupSpecPatchArgs',
+    'MySQLBackupSpecArgsDict',
+    'MySQLBackupSpecArgs',
+    'MySQLBackupStatusArgsDict',
+    'MySQLBackupStatusArgs',
+    'MySQLBackupArgsDict',
+    'MySQLBackupArgs',
+    'MySQLClusterSetFailoverSpecOptionsPatchArgsDict',
+    'MySQLClusterSetFailoverSpecOptionsPatchArgs',
+    'MySQLClusterSetFailoverSpecOptionsArgsDict',
+    'MySQLClusterSetFailoverSpecOptionsArgs',
+    'MySQLClusterSetFailoverSpecPatchArgsDict',
+    'MySQLClusterSetFailoverSpecPatchArgs',
+    'MySQLClusterSetFailoverSpecArgsDict',
+    'MySQLClusterSetFailoverSpecArgs',
+    'MySQLClusterSetFailoverStatusArgsDict',
+    'MySQLClusterSetFailoverStatusArgs',
+    'MySQLClusterSetFailoverArgsDict',
+    'MySQLClusterSetFailoverArgs',
+    'outputs',
+]
+
+# Resource classes live in same-named modules; everything else is an input type.
+_RESOURCE_MODULES = {
+    'InnoDBClusterInitArgs': 'InnoDBCluster',
+    'InnoDBCluster': 'InnoDBCluster',
+    'InnoDBClusterListArgs': 'InnoDBClusterList',
+    'InnoDBClusterList': 'InnoDBClusterList',
+    'InnoDBClusterPatchArgs': 'InnoDBClusterPatch',
+    'InnoDBClusterPatch': 'InnoDBClusterPatch',
+    'MySQLBackupInitArgs': 'MySQLBackup',
+    'MySQLBackup': 'MySQLBackup',
+    'MySQLBackupListArgs': 'MySQLBackupList',
+    'MySQLBackupList': 'MySQLBackupList',
+    'MySQLBackupPatchArgs': 'MySQLBackupPatch',
+    'MySQLBackupPatch': 'MySQLBackupPatch',
+    'MySQLClusterSetFailoverInitArgs': 'MySQLClusterSetFailover',
+    'MySQLClusterSetFailover': 'MySQLClusterSetFailover',
+    'MySQLClusterSetFailoverListArgs': 'MySQLClusterSetFailoverList',
+    'MySQLClusterSetFailoverList': 'MySQLClusterSetFailoverList',
+    'MySQLClusterSetFailoverPatchArgs': 'MySQLClusterSetFailoverPatch',
+    'MySQLClusterSetFailoverPatch': 'MySQLClusterSetFailoverPatch',
+}
+
+if typing.TYPE_CHECKING:
+    from .InnoDBCluster import *
+    from .InnoDBClusterList import *
+    from .InnoDBClusterPatch import *
+    from .MySQLBackup import *
+    from .MySQLBackupList import *
+    from .MySQLBackupPatch import *
+    from .MySQLClusterSetFailover import *
+    from .MySQLClusterSetFailoverList import *
+    from .MySQLClusterSetFailoverPatch import *
+    from ._inputs import *
+    from . import outputs
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in ("_inputs", "outputs"):
+        return importlib.import_module(f"{__name__}.{name}")
+    module_name = _RESOURCE_MODULES.get(name)
+    if module_name is not None:
+        module = importlib.import_module(f"{__name__}.{module_name}")
+    else:
+        module = importlib.import_module(f"{__name__}._inputs")
+        if name not in module.__all__:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,68 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecDatadirPermissionsArgsDict', 'InnoDBClusterSpecDatadirPermissionsArgs']
+
+class InnoDBClusterSpecDatadirPermissionsArgsDict(TypedDict):
+    fs_group_change_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Optional fsGroupChangePolicy value to be set in the pod security context. Some possible values are OnRootMismatch and Always. For more information check the official Kubernetes documentation
+    """
+    set_rights_using_init_container: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Whether to use an init container to set at start the DataDir permissions
+    """
+
+
+@pulumi.input_type
+class InnoDBClusterSpecDatadirPermissionsArgs:
+    def __init__(__self__, *,
+                 fs_group_change_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 set_rights_using_init_container: pulumi.Input[Optional[_builtins.bool]] = None):
+        """
+        :param pulumi.Input[_builtins.str] fs_group_change_policy: Optional fsGroupChangePolicy value to be set in the pod security context. Some possible values are OnRootMismatch and Always. For more information check the official Kubernetes documentation
+        :param pulumi.Input[_builtins.bool] set_rights_using_init_container: Whether to use an init container to set at start the DataDir permissions
+        """
+        if fs_group_change_policy is not None:
+            pulumi.set(__self__, "fs_group_change_policy", fs_group_change_policy)
+        if set_rights_using_init_container is not None:
+            pulumi.set(__self__, "set_rights_using_init_container", set_rights_using_init_container)
+
+    @_builtins.property
+    @pulumi.getter(name="fsGroupChangePolicy")
+    def fs_group_change_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Optional fsGroupChangePolicy value to be set in the pod security context. Some possible values are OnRootMismatch and Always. For more information check the official Kubernetes documentation
+        """
+        return pulumi.get(self, "fs_group_change_policy")
+
+    @fs_group_change_policy.setter
+    def fs_group_change_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "fs_group_change_policy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="setRightsUsingInitContainer")
+    def set_rights_using_init_container(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Whether to use an init container to set at start the DataDir permissions
+        """
+        return pulumi.get(self, "set_rights_using_init_container")
+
+    @set_rights_using_init_container.setter
+    def set_rights_using_init_container(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "set_rights_using_init_container", value)
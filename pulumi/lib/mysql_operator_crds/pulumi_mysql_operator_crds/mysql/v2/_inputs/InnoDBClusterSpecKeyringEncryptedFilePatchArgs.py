@@ -0,0 +1,113 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecKeyringEncryptedFilePatchArgsDict', 'InnoDBClusterSpecKeyringEncryptedFilePatchArgs']
+
+class InnoDBClusterSpecKeyringEncryptedFilePatchArgsDict(TypedDict):
+    """
+    Keyring 'Encrypted File' specification
+    """
+    file_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Path to the keyring file name inside the storage volume (will be prefixed by mount path)
+    """
+    password: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Name of a secret that contains password for the keyring in the key 'keyring_password'
+    """
+    read_only: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Whether to open the keyring file in read-only mode
+    """
+    storage: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    Specification of the volume to be mounted where the keyring file resides
+    """
+
+
+@pulumi.input_type
+class InnoDBClusterSpecKeyringEncryptedFilePatchArgs:
+    def __init__(__self__, *,
+                 file_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 password: pulumi.Input[Optional[_builtins.str]] = None,
+                 read_only: pulumi.Input[Optional[_builtins.bool]] = None,
+                 storage: pulumi.Input[Optional[Mapping[str, Any]]] = None):
+        """
+        Keyring 'Encrypted File' specification
+
+        :param pulumi.Input[_builtins.str] file_name: Path to the keyring file name inside the storage volume (will be prefixed by mount path)
+        :param pulumi.Input[_builtins.str] password: Name of a secret that contains password for the keyring in the key 'keyring_password'
+        :param pulumi.Input[_builtins.bool] read_only: Whether to open the keyring file in read-only mode
+        :param pulumi.Input[Mapping[str, Any]] storage: Specification of the volume to be mounted where the keyring file resides
+        """
+        if file_name is not None:
+            pulumi.set(__self__, "file_name", file_name)
+        if password is not None:
+            pulumi.set(__self__, "password", password)
+        if read_only is not None:
+            pulumi.set(__self__, "read_only", read_only)
+        if storage is not None:
+            pulumi.set(__self__, "storage", storage)
+
+    @_builtins.property
+    @pulumi.getter(name="fileName")
+    def file_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Path to the keyring file name inside the storage volume (will be prefixed by mount path)
+        """
+        return pulumi.get(self, "file_name")
+
+    @file_name.setter
+    def file_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "file_name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def password(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Name of a secret that contains password for the keyring in the key 'keyring_password'
+        """
+        return pulumi.get(self, "password")
+
+    @password.setter
+    def password(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "password", value)
+
+    @_builtins.property
+    @pulumi.getter(name="readOnly")
+    def read_only(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Whether to open the keyring file in read-only mode
+        """
+        return pulumi.get(self, "read_only")
+
+    @read_only.setter
+    def read_only(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "read_only", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def storage(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        Specification of the volume to be mounted where the keyring file resides
+        """
+        return pulumi.get(self, "storage")
+
+    @storage.setter
+    def storage(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "storage", value)
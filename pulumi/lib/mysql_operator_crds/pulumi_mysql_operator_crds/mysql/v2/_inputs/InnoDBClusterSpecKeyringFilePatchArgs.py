@@ -0,0 +1,93 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecKeyringFilePatchArgsDict', 'InnoDBClusterSpecKeyringFilePatchArgs']
+
+class InnoDBClusterSpecKeyringFilePatchArgsDict(TypedDict):
+    """
+    Keyring 'File' specification
+    """
+    file_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Path to the keyring file name inside the storage volume (will be prefixed by mount path)
+    """
+    read_only: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Whether to open the keyring file in read-only mode
+    """
+    storage: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    Specification of the volume to be mounted where the keyring file resides
+    """
+
+
+@pulumi.input_type
+class InnoDBClusterSpecKeyringFilePatchArgs:
+    def __init__(__self__, *,
+                 file_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 read_only: pulumi.Input[Optional[_builtins.bool]] = None,
+                 storage: pulumi.Input[Optional[Mapping[str, Any]]] = None):
+        """
+        Keyring 'File' specification
+
+        :param pulumi.Input[_builtins.str] file_name: Path to the keyring file name inside the storage volume (will be prefixed by mount path)
+        :param pulumi.Input[_builtins.bool] read_only: Whether to open the keyring file in read-only mode
+        :param pulumi.Input[Mapping[str, Any]] storage: Specification of the volume to be mounted where the keyring file resides
+        """
+        if file_name is not None:
+            pulumi.set(__self__, "file_name", file_name)
+        if read_only is not None:
+            pulumi.set(__self__, "read_only", read_only)
+        if storage is not None:
+            pulumi.set(__self__, "storage", storage)
+
+    @_builtins.property
+    @pulumi.getter(name="fileName")
+    def file_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Path to the keyring file name inside the storage volume (will be prefixed by mount path)
+        """
+        return pulumi.get(self, "file_name")
+
+    @file_name.setter
+    def file_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "file_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="readOnly")
+    def read_only(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Whether to open the keyring file in read-only mode
+        """
+        return pulumi.get(self, "read_only")
+
+    @read_only.setter
+    def read_only(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "read_only", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def storage(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        Specification of the volume to be mounted where the keyring file resides
+        """
+        return pulumi.get(self, "storage")
+
+    @storage.setter
+    def storage(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "storage", value)
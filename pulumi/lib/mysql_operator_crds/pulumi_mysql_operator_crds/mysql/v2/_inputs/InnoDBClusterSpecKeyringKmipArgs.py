@@ -0,0 +1,113 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecKeyringKmipArgsDict', 'InnoDBClusterSpecKeyringKmipArgs']
+
+class InnoDBClusterSpecKeyringKmipArgsDict(TypedDict):
+    """
+    Keyring 'KMIP' specification
+    """
+    cache_keys: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Whether the keys are cached by the MySQL Server in RAM in plaintext. If set to false the keys are decrypted on every access
+    """
+    configuration: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Name of a secret that contains TLS certificates
+    """
+    server: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Primary OKV Server host with port number in the format <host>:<port>
+    """
+    standby_server: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    A list of standby servers in the format <host>:<port>
+    """
+
+
+@pulumi.input_type
+class InnoDBClusterSpecKeyringKmipArgs:
+    def __init__(__self__, *,
+                 cache_keys: pulumi.Input[Optional[_builtins.bool]] = None,
+                 configuration: pulumi.Input[Optional[_builtins.str]] = None,
+                 server: pulumi.Input[Optional[_builtins.str]] = None,
+                 standby_server: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
+        """
+        Keyring 'KMIP' specification
+
+        :param pulumi.Input[_builtins.bool] cache_keys: Whether the keys are cached by the MySQL Server in RAM in plaintext. If set to false the keys are decrypted on every access
+        :param pulumi.Input[_builtins.str] configuration: Name of a secret that contains TLS certificates
+        :param pulumi.Input[_builtins.str] server: Primary OKV Server host with port number in the format <host>:<port>
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] standby_server: A list of standby servers in the format <host>:<port>
+        """
+        if cache_keys is not None:
+            pulumi.set(__self__, "cache_keys", cache_keys)
+        if configuration is not None:
+            pulumi.set(__self__, "configuration", configuration)
+        if server is not None:
+            pulumi.set(__self__, "server", server)
+        if standby_server is not None:
+            pulumi.set(__self__, "standby_server", standby_server)
+
+    @_builtins.property
+    @pulumi.getter(name="cacheKeys")
+    def cache_keys(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Whether the keys are cached by the MySQL Server in RAM in plaintext. If set to false the keys are decrypted on every access
+        """
+        return pulumi.get(self, "cache_keys")
+
+    @cache_keys.setter
+    def cache_keys(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "cache_keys", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def configuration(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Name of a secret that contains TLS certificates
+        """
+        return pulumi.get(self, "configuration")
+
+    @configuration.setter
+    def configuration(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "configuration", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def server(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Primary OKV Server host with port number in the format <host>:<port>
+        """
+        return pulumi.get(self, "server")
+
+    @server.setter
+    def server(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "server", value)
+
+    @_builtins.property
+    @pulumi.getter(name="standbyServer")
+    def standby_server(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        A list of standby servers in the format <host>:<port>
+        """
+        return pulumi.get(self, "standby_server")
+
+    @standby_server.setter
+    def standby_server(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "standby_server", value)
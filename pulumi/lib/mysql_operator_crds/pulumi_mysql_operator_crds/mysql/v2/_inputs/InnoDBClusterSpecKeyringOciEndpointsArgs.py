@@ -0,0 +1,108 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecKeyringOciEndpointsArgsDict', 'InnoDBClusterSpecKeyringOciEndpointsArgs']
+
+class InnoDBClusterSpecKeyringOciEndpointsArgsDict(TypedDict):
+    encryption: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Encryption endpoint URI like {identifier}-crypto.kms.{region}.oraclecloud.com
+    """
+    management: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Management endpoint URI like {identifier}-management.kms.{region}.oraclecloud.com
+    """
+    secrets: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Secrets endpoint URI like secrets.vaults.{region}.oci.oraclecloud.com
+    """
+    vaults: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Vaults endpoint URI like vaults.{region}.oci.oraclecloud.com
+    """
+
+
+@pulumi.input_type
+class InnoDBClusterSpecKeyringOciEndpointsArgs:
+    def __init__(__self__, *,
+                 encryption: pulumi.Input[Optional[_builtins.str]] = None,
+                 management: pulumi.Input[Optional[_builtins.str]] = None,
+                 secrets: pulumi.Input[Optional[_builtins.str]] = None,
+                 vaults: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        :param pulumi.Input[_builtins.str] encryption: Encryption endpoint URI like {identifier}-crypto.kms.{region}.oraclecloud.com
+        :param pulumi.Input[_builtins.str] management: Management endpoint URI like {identifier}-management.kms.{region}.oraclecloud.com
+        :param pulumi.Input[_builtins.str] secrets: Secrets endpoint URI like secrets.vaults.{region}.oci.oraclecloud.com
+        :param pulumi.Input[_builtins.str] vaults: Vaults endpoint URI like vaults.{region}.oci.oraclecloud.com
+        """
+        if encryption is not None:
+            pulumi.set(__self__, "encryption", encryption)
+        if management is not None:
+            pulumi.set(__self__, "management", management)
+        if secrets is not None:
+            pulumi.set(__self__, "secrets", secrets)
+        if vaults is not None:
+            pulumi.set(__self__, "vaults", vaults)
+
+    @_builtins.property
+    @pulumi.getter
+    def encryption(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Encryption endpoint URI like {identifier}-crypto.kms.{region}.oraclecloud.com
+        """
+        return pulumi.get(self, "encryption")
+
+    @encryption.setter
+    def encryption(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "encryption", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def management(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Management endpoint URI like {identifier}-management.kms.{region}.oraclecloud.com
+        """
+        return pulumi.get(self, "management")
+
+    @management.setter
+    def management(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "management", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def secrets(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Secrets endpoint URI like secrets.vaults.{region}.oci.oraclecloud.com
+        """
+        return pulumi.get(self, "secrets")
+
+    @secrets.setter
+    def secrets(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "secrets", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def vaults(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Vaults endpoint URI like vaults.{region}.oci.oraclecloud.com
+        """
+        return pulumi.get(self, "vaults")
+
+    @vaults.setter
+    def vaults(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "vaults", value)
@@ -0,0 +1,206 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecKeyringOciPatchArgsDict', 'InnoDBClusterSpecKeyringOciPatchArgs']
+
+class InnoDBClusterSpecKeyringOciPatchArgsDict(TypedDict):
+    """
+    Keyring 'OCI' specification
+    """
+    ca_certificate: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Secret that contains ca.crt field with CA certificate bundle file that the keyring_oci plugin uses for Oracle Cloud Infrastructure certificate verification
+    """
+    compartment: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Compartment identifier in the form ocid1.compartment.oc1...
+    """
+    endpoints: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringOciEndpointsPatchArgs']]]
+    key_fingerprint: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Private key fingerprint
+    """
+    key_secret: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    A secret that contains the private key under the field 'privatekey'
+    """
+    master_key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Master key identified in the form ocid1.key.oc1...
+    """
+    tenancy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Tenancy identifier in the form ocid1.tenancy.oc1...
+    """
+    user: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    User identifier in the form of ocid1.user.oc1...
+    """
+    virtual_vault: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Vault identifier in the form ocid1.vault.oc1...
+    """
+
+
+@pulumi.input_type
+class InnoDBClusterSpecKeyringOciPatchArgs:
+    def __init__(__self__, *,
+                 ca_certificate: pulumi.Input[Optional[_builtins.str]] = None,
+                 compartment: pulumi.Input[Optional[_builtins.str]] = None,
+                 endpoints: pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringOciEndpointsPatchArgs']] = None,
+                 key_fingerprint: pulumi.Input[Optional[_builtins.str]] = None,
+                 key_secret: pulumi.Input[Optional[_builtins.str]] = None,
+                 master_key: pulumi.Input[Optional[_builtins.str]] = None,
+                 tenancy: pulumi.Input[Optional[_builtins.str]] = None,
+                 user: pulumi.Input[Optional[_builtins.str]] = None,
+                 virtual_vault: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        Keyring 'OCI' specification
+
+        :param pulumi.Input[_builtins.str] ca_certificate: Secret that contains ca.crt field with CA certificate bundle file that the keyring_oci plugin uses for Oracle Cloud Infrastructure certificate verification
+        :param pulumi.Input[_builtins.str] compartment: Compartment identifier in the form ocid1.compartment.oc1...
+        :param pulumi.Input[_builtins.str] key_fingerprint: Private key fingerprint
+        :param pulumi.Input[_builtins.str] key_secret: A secret that contains the private key under the field 'privatekey'
+        :param pulumi.Input[_builtins.str] master_key: Master key identified in the form ocid1.key.oc1...
+        :param pulumi.Input[_builtins.str] tenancy: Tenancy identifier in the form ocid1.tenancy.oc1...
+        :param pulumi.Input[_builtins.str] user: User identifier in the form of ocid1.user.oc1...
+        :param pulumi.Input[_builtins.str] virtual_vault: Vault identifier in the form ocid1.vault.oc1...
+        """
+        if ca_certificate is not None:
+            pulumi.set(__self__, "ca_certificate", ca_certificate)
+        if compartment is not None:
+            pulumi.set(__self__, "compartment", compartment)
+        if endpoints is not None:
+            pulumi.set(__self__, "endpoints", endpoints)
+        if key_fingerprint is not None:
+            pulumi.set(__self__, "key_fingerprint", key_fingerprint)
+        if key_secret is not None:
+            pulumi.set(__self__, "key_secret", key_secret)
+        if master_key is not None:
+            pulumi.set(__self__, "master_key", master_key)
+        if tenancy is not None:
+            pulumi.set(__self__, "tenancy", tenancy)
+        if user is not None:
+            pulumi.set(__self__, "user", user)
+        if virtual_vault is not None:
+            pulumi.set(__self__, "virtual_vault", virtual_vault)
+
+    @_builtins.property
+    @pulumi.getter(name="caCertificate")
+    def ca_certificate(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Secret that contains ca.crt field with CA certificate bundle file that the keyring_oci plugin uses for Oracle Cloud Infrastructure certificate verification
+        """
+        return pulumi.get(self, "ca_certificate")
+
+    @ca_certificate.setter
+    def ca_certificate(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "ca_certificate", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def compartment(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Compartment identifier in the form ocid1.compartment.oc1...
+        """
+        return pulumi.get(self, "compartment")
+
+    @compartment.setter
+    def compartment(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "compartment", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def endpoints(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringOciEndpointsPatchArgs']]:
+        return pulumi.get(self, "endpoints")
+
+    @endpoints.setter
+    def endpoints(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringOciEndpointsPatchArgs']]):
+        pulumi.set(self, "endpoints", value)
+
+    @_builtins.property
+    @pulumi.getter(name="keyFingerprint")
+    def key_fingerprint(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Private key fingerprint
+        """
+        return pulumi.get(self, "key_fingerprint")
+
+    @key_fingerprint.setter
+    def key_fingerprint(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "key_fingerprint", value)
+
+    @_builtins.property
+    @pulumi.getter(name="keySecret")
+    def key_secret(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        A secret that contains the private key under the field 'privatekey'
+        """
+        return pulumi.get(self, "key_secret")
+
+    @key_secret.setter
+    def key_secret(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "key_secret", value)
+
+    @_builtins.property
+    @pulumi.getter(name="masterKey")
+    def master_key(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Master key identified in the form ocid1.key.oc1...
+        """
+        return pulumi.get(self, "master_key")
+
+    @master_key.setter
+    def master_key(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "master_key", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def tenancy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Tenancy identifier in the form ocid1.tenancy.oc1...
+        """
+        return pulumi.get(self, "tenancy")
+
+    @tenancy.setter
+    def tenancy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "tenancy", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def user(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        User identifier in the form of ocid1.user.oc1...
+        """
+        return pulumi.get(self, "user")
+
+    @user.setter
+    def user(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "user", value)
+
+    @_builtins.property
+    @pulumi.getter(name="virtualVault")
+    def virtual_vault(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Vault identifier in the form ocid1.vault.oc1...
+        """
+        return pulumi.get(self, "virtual_vault")
+
+    @virtual_vault.setter
+    def virtual_vault(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "virtual_vault", value)
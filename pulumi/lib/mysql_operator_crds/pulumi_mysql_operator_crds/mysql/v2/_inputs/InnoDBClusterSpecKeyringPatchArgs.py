@@ -0,0 +1,84 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecKeyringPatchArgsDict', 'InnoDBClusterSpecKeyringPatchArgs']
+
+class InnoDBClusterSpecKeyringPatchArgsDict(TypedDict):
+    """
+    Keyring specification
+    """
+    encrypted_file: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringEncryptedFilePatchArgs']]]
+    file: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringFilePatchArgs']]]
+    kmip: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringKmipPatchArgs']]]
+    oci: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringOciPatchArgs']]]
+
+
+@pulumi.input_type
+class InnoDBClusterSpecKeyringPatchArgs:
+    def __init__(__self__, *,
+                 encrypted_file: pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringEncryptedFilePatchArgs']] = None,
+                 file: pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringFilePatchArgs']] = None,
+                 kmip: pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringKmipPatchArgs']] = None,
+                 oci: pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringOciPatchArgs']] = None):
+        """
+        Keyring specification
+        """
+        if encrypted_file is not None:
+            pulumi.set(__self__, "encrypted_file", encrypted_file)
+        if file is not None:
+            pulumi.set(__self__, "file", file)
+        if kmip is not None:
+            pulumi.set(__self__, "kmip", kmip)
+        if oci is not None:
+            pulumi.set(__self__, "oci", oci)
+
+    @_builtins.property
+    @pulumi.getter(name="encryptedFile")
+    def encrypted_file(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringEncryptedFilePatchArgs']]:
+        return pulumi.get(self, "encrypted_file")
+
+    @encrypted_file.setter
+    def encrypted_file(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringEncryptedFilePatchArgs']]):
+        pulumi.set(self, "encrypted_file", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def file(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringFilePatchArgs']]:
+        return pulumi.get(self, "file")
+
+    @file.setter
+    def file(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringFilePatchArgs']]):
+        pulumi.set(self, "file", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def kmip(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringKmipPatchArgs']]:
+        return pulumi.get(self, "kmip")
+
+    @kmip.setter
+    def kmip(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringKmipPatchArgs']]):
+        pulumi.set(self, "kmip", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def oci(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringOciPatchArgs']]:
+        return pulumi.get(self, "oci")
+
+    @oci.setter
+    def oci(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringOciPatchArgs']]):
+        pulumi.set(self, "oci", value)
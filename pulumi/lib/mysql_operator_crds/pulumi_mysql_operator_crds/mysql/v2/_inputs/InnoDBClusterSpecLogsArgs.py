@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecLogsArgsDict', 'InnoDBClusterSpecLogsArgs']
+
+class InnoDBClusterSpecLogsArgsDict(TypedDict):
+    collector: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorArgs']]]
+    error: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsErrorArgs']]]
+    general: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsGeneralArgs']]]
+    slow_query: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsSlowQueryArgs']]]
+
+
+@pulumi.input_type
+class InnoDBClusterSpecLogsArgs:
+    def __init__(__self__, *,
+                 collector: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorArgs']] = None,
+                 error: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsErrorArgs']] = None,
+                 general: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsGeneralArgs']] = None,
+                 slow_query: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsSlowQueryArgs']] = None):
+        if collector is not None:
+            pulumi.set(__self__, "collector", collector)
+        if error is not None:
+            pulumi.set(__self__, "error", error)
+        if general is not None:
+            pulumi.set(__self__, "general", general)
+        if slow_query is not None:
+            pulumi.set(__self__, "slow_query", slow_query)
+
+    @_builtins.property
+    @pulumi.getter
+    def collector(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorArgs']]:
+        return pulumi.get(self, "collector")
+
+    @collector.setter
+    def collector(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorArgs']]):
+        pulumi.set(self, "collector", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def error(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsErrorArgs']]:
+        return pulumi.get(self, "error")
+
+    @error.setter
+    def error(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsErrorArgs']]):
+        pulumi.set(self, "error", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def general(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsGeneralArgs']]:
+        return pulumi.get(self, "general")
+
+    @general.setter
+    def general(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsGeneralArgs']]):
+        pulumi.set(self, "general", value)
+
+    @_builtins.property
+    @pulumi.getter(name="slowQuery")
+    def slow_query(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsSlowQueryArgs']]:
+        return pulumi.get(self, "slow_query")
+
+    @slow_query.setter
+    def slow_query(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsSlowQueryArgs']]):
+        pulumi.set(self, "slow_query", value)
@@ -0,0 +1,68 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecLogsCollectorFluentdGeneralLogArgsDict', 'InnoDBClusterSpecLogsCollectorFluentdGeneralLogArgs']
+
+class InnoDBClusterSpecLogsCollectorFluentdGeneralLogArgsDict(TypedDict):
+    options: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    fluentd specific options for the general log
+    """
+    tag: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Tag for the general log records
+    """
+
+
+@pulumi.input_type
+class InnoDBClusterSpecLogsCollectorFluentdGeneralLogArgs:
+    def __init__(__self__, *,
+                 options: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 tag: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        :param pulumi.Input[Mapping[str, Any]] options: fluentd specific options for the general log
+        :param pulumi.Input[_builtins.str] tag: Tag for the general log records
+        """
+        if options is not None:
+            pulumi.set(__self__, "options", options)
+        if tag is not None:
+            pulumi.set(__self__, "tag", tag)
+
+    @_builtins.property
+    @pulumi.getter
+    def options(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        fluentd specific options for the general log
+        """
+        return pulumi.get(self, "options")
+
+    @options.setter
+    def options(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "options", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def tag(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Tag for the general log records
+        """
+        return pulumi.get(self, "tag")
+
+    @tag.setter
+    def tag(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "tag", value)
@@ -0,0 +1,118 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecLogsCollectorFluentdPatchArgsDict', 'InnoDBClusterSpecLogsCollectorFluentdPatchArgs']
+
+class InnoDBClusterSpecLogsCollectorFluentdPatchArgsDict(TypedDict):
+    """
+    Properties of the fluentd log collector
+    """
+    additional_filter_configuration: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Raw configuration of additional Fluentd filters to be added to the configuration file
+    """
+    error_log: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdErrorLogPatchArgs']]]
+    general_log: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatchArgs']]]
+    record_augmentation: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatchArgs']]]
+    sinks: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[Mapping[str, Any]]]]]]
+    slow_query_log: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatchArgs']]]
+
+
+@pulumi.input_type
+class InnoDBClusterSpecLogsCollectorFluentdPatchArgs:
+    def __init__(__self__, *,
+                 additional_filter_configuration: pulumi.Input[Optional[_builtins.str]] = None,
+                 error_log: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdErrorLogPatchArgs']] = None,
+                 general_log: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatchArgs']] = None,
+                 record_augmentation: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatchArgs']] = None,
+                 sinks: pulumi.Input[Optional[Sequence[pulumi.Input[Mapping[str, Any]]]]] = None,
+                 slow_query_log: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatchArgs']] = None):
+        """
+        Properties of the fluentd log collector
+
+        :param pulumi.Input[_builtins.str] additional_filter_configuration: Raw configuration of additional Fluentd filters to be added to the configuration file
+        """
+        if additional_filter_configuration is not None:
+            pulumi.set(__self__, "additional_filter_configuration", additional_filter_configuration)
+        if error_log is not None:
+            pulumi.set(__self__, "error_log", error_log)
+        if general_log is not None:
+            pulumi.set(__self__, "general_log", general_log)
+        if record_augmentation is not None:
+            pulumi.set(__self__, "record_augmentation", record_augmentation)
+        if sinks is not None:
+            pulumi.set(__self__, "sinks", sinks)
+        if slow_query_log is not None:
+            pulumi.set(__self__, "slow_query_log", slow_query_log)
+
+    @_builtins.property
+    @pulumi.getter(name="additionalFilterConfiguration")
+    def additional_filter_configuration(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Raw configuration of additional Fluentd filters to be added to the configuration file
+        """
+        return pulumi.get(self, "additional_filter_configuration")
+
+    @additional_filter_configuration.setter
+    def additional_filter_configuration(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "additional_filter_configuration", value)
+
+    @_builtins.property
+    @pulumi.getter(name="errorLog")
+    def error_log(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdErrorLogPatchArgs']]:
+        return pulumi.get(self, "error_log")
+
+    @error_log.setter
+    def error_log(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdErrorLogPatchArgs']]):
+        pulumi.set(self, "error_log", value)
+
+    @_builtins.property
+    @pulumi.getter(name="generalLog")
+    def general_log(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatchArgs']]:
+        return pulumi.get(self, "general_log")
+
+    @general_log.setter
+    def general_log(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatchArgs']]):
+        pulumi.set(self, "general_log", value)
+
+    @_builtins.property
+    @pulumi.getter(name="recordAugmentation")
+    def record_augmentation(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatchArgs']]:
+        return pulumi.get(self, "record_augmentation")
+
+    @record_augmentation.setter
+    def record_augmentation(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatchArgs']]):
+        pulumi.set(self, "record_augmentation", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def sinks(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[Mapping[str, Any]]]]]:
+        return pulumi.get(self, "sinks")
+
+    @sinks.setter
+    def sinks(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[Mapping[str, Any]]]]]):
+        pulumi.set(self, "sinks", value)
+
+    @_builtins.property
+    @pulumi.getter(name="slowQueryLog")
+    def slow_query_log(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatchArgs']]:
+        return pulumi.get(self, "slow_query_log")
+
+    @slow_query_log.setter
+    def slow_query_log(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatchArgs']]):
+        pulumi.set(self, "slow_query_log", value)
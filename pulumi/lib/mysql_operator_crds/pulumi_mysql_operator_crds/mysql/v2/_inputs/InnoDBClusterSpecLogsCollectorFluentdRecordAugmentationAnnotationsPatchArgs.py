@@ -0,0 +1,68 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatchArgsDict', 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatchArgs']
+
+class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatchArgsDict(TypedDict):
+    annotation_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Name of the pod label that holds the value to be stored under fieldName in the log record
+    """
+    field_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Name of the field added to the log record with value from annotationName
+    """
+
+
+@pulumi.input_type
+class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatchArgs:
+    def __init__(__self__, *,
+                 annotation_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 field_name: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        :param pulumi.Input[_builtins.str] annotation_name: Name of the pod label that holds the value to be stored under fieldName in the log record
+        :param pulumi.Input[_builtins.str] field_name: Name of the field added to the log record with value from annotationName
+        """
+        if annotation_name is not None:
+            pulumi.set(__self__, "annotation_name", annotation_name)
+        if field_name is not None:
+            pulumi.set(__self__, "field_name", field_name)
+
+    @_builtins.property
+    @pulumi.getter(name="annotationName")
+    def annotation_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Name of the pod label that holds the value to be stored under fieldName in the log record
+        """
+        return pulumi.get(self, "annotation_name")
+
+    @annotation_name.setter
+    def annotation_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "annotation_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="fieldName")
+    def field_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Name of the field added to the log record with value from annotationName
+        """
+        return pulumi.get(self, "field_name")
+
+    @field_name.setter
+    def field_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "field_name", value)
@@ -0,0 +1,68 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatchArgsDict', 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatchArgs']
+
+class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatchArgsDict(TypedDict):
+    field_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Name of the field added to the log record with value from labelName
+    """
+    label_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Name of the pod label that holds the value to be stored under fieldName in the log record
+    """
+
+
+@pulumi.input_type
+class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatchArgs:
+    def __init__(__self__, *,
+                 field_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 label_name: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        :param pulumi.Input[_builtins.str] field_name: Name of the field added to the log record with value from labelName
+        :param pulumi.Input[_builtins.str] label_name: Name of the pod label that holds the value to be stored under fieldName in the log record
+        """
+        if field_name is not None:
+            pulumi.set(__self__, "field_name", field_name)
+        if label_name is not None:
+            pulumi.set(__self__, "label_name", label_name)
+
+    @_builtins.property
+    @pulumi.getter(name="fieldName")
+    def field_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Name of the field added to the log record with value from labelName
+        """
+        return pulumi.get(self, "field_name")
+
+    @field_name.setter
+    def field_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "field_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="labelName")
+    def label_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Name of the pod label that holds the value to be stored under fieldName in the log record
+        """
+        return pulumi.get(self, "label_name")
+
+    @label_name.setter
+    def label_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "label_name", value)
@@ -0,0 +1,113 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatchArgsDict', 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatchArgs']
+
+class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatchArgsDict(TypedDict):
+    annotations: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatchArgs']]]]]
+    enabled: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Whether to enable record augmentation with additional data
+    """
+    labels: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatchArgs']]]]]
+    pod_fields: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatchArgs']]]]]
+    resource_fields: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatchArgs']]]]]
+    static_fields: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatchArgs']]]]]
+
+
+@pulumi.input_type
+class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatchArgs:
+    def __init__(__self__, *,
+                 annotations: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatchArgs']]]] = None,
+                 enabled: pulumi.Input[Optional[_builtins.bool]] = None,
+                 labels: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatchArgs']]]] = None,
+                 pod_fields: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatchArgs']]]] = None,
+                 resource_fields: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatchArgs']]]] = None,
+                 static_fields: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatchArgs']]]] = None):
+        """
+        :param pulumi.Input[_builtins.bool] enabled: Whether to enable record augmentation with additional data
+        """
+        if annotations is not None:
+            pulumi.set(__self__, "annotations", annotations)
+        if enabled is not None:
+            pulumi.set(__self__, "enabled", enabled)
+        if labels is not None:
+            pulumi.set(__self__, "labels", labels)
+        if pod_fields is not None:
+            pulumi.set(__self__, "pod_fields", pod_fields)
+        if resource_fields is not None:
+            pulumi.set(__self__, "resource_fields", resource_fields)
+        if static_fields is not None:
+            pulumi.set(__self__, "static_fields", static_fields)
+
+    @_builtins.property
+    @pulumi.getter
+    def annotations(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatchArgs']]]]:
+        return pulumi.get(self, "annotations")
+
+    @annotations.setter
+    def annotations(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatchArgs']]]]):
+        pulumi.set(self, "annotations", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def enabled(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Whether to enable record augmentation with additional data
+        """
+        return pulumi.get(self, "enabled")
+
+    @enabled.setter
+    def enabled(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "enabled", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def labels(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatchArgs']]]]:
+        return pulumi.get(self, "labels")
+
+    @labels.setter
+    def labels(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatchArgs']]]]):
+        pulumi.set(self, "labels", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podFields")
+    def pod_fields(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatchArgs']]]]:
+        return pulumi.get(self, "pod_fields")
+
+    @pod_fields.setter
+    def pod_fields(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatchArgs']]]]):
+        pulumi.set(self, "pod_fields", value)
+
+    @_builtins.property
+    @pulumi.getter(name="resourceFields")
+    def resource_fields(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatchArgs']]]]:
+        return pulumi.get(self, "resource_fields")
+
+    @resource_fields.setter
+    def resource_fields(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatchArgs']]]]):
+        pulumi.set(self, "resource_fields", value)
+
+    @_builtins.property
+    @pulumi.getter(name="staticFields")
+    def static_fields(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatchArgs']]]]:
+        return pulumi.get(self, "static_fields")
+
+    @static_fields.setter
+    def static_fields(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatchArgs']]]]):
+        pulumi.set(self, "static_fields", value)
@@ -0,0 +1,68 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatchArgsDict', 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatchArgs']
+
+class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatchArgsDict(TypedDict):
+    field_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Name of the field added to the log record with value from fieldValue
+    """
+    field_value: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Value for the static field with name taken from fieldName
+    """
+
+
+@pulumi.input_type
+class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatchArgs:
+    def __init__(__self__, *,
+                 field_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 field_value: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        :param pulumi.Input[_builtins.str] field_name: Name of the field added to the log record with value from fieldValue
+        :param pulumi.Input[_builtins.str] field_value: Value for the static field with name taken from fieldName
+        """
+        if field_name is not None:
+            pulumi.set(__self__, "field_name", field_name)
+        if field_value is not None:
+            pulumi.set(__self__, "field_value", field_value)
+
+    @_builtins.property
+    @pulumi.getter(name="fieldName")
+    def field_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Name of the field added to the log record with value from fieldValue
+        """
+        return pulumi.get(self, "field_name")
+
+    @field_name.setter
+    def field_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "field_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="fieldValue")
+    def field_value(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Value for the static field with name taken from fieldName
+        """
+        return pulumi.get(self, "field_value")
+
+    @field_value.setter
+    def field_value(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "field_value", value)
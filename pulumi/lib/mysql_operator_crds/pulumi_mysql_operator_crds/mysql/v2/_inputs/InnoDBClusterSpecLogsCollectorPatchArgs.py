@@ -0,0 +1,94 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecLogsCollectorPatchArgsDict', 'InnoDBClusterSpecLogsCollectorPatchArgs']
+
+class InnoDBClusterSpecLogsCollectorPatchArgsDict(TypedDict):
+    container_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Name of the collector container sidecar
+    """
+    env: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[Mapping[str, Any]]]]]]
+    fluentd: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdPatchArgs']]]
+    image: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Name of an image, including registry and repository, to be used for the log collector sidecar. If provided it needs to be an image for the configured collector type.
+    """
+
+
+@pulumi.input_type
+class InnoDBClusterSpecLogsCollectorPatchArgs:
+    def __init__(__self__, *,
+                 container_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 env: pulumi.Input[Optional[Sequence[pulumi.Input[Mapping[str, Any]]]]] = None,
+                 fluentd: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdPatchArgs']] = None,
+                 image: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        :param pulumi.Input[_builtins.str] container_name: Name of the collector container sidecar
+        :param pulumi.Input[_builtins.str] image: Name of an image, including registry and repository, to be used for the log collector sidecar. If provided it needs to be an image for the configured collector type.
+        """
+        if container_name is not None:
+            pulumi.set(__self__, "container_name", container_name)
+        if env is not None:
+            pulumi.set(__self__, "env", env)
+        if fluentd is not None:
+            pulumi.set(__self__, "fluentd", fluentd)
+        if image is not None:
+            pulumi.set(__self__, "image", image)
+
+    @_builtins.property
+    @pulumi.getter(name="containerName")
+    def container_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Name of the collector container sidecar
+        """
+        return pulumi.get(self, "container_name")
+
+    @container_name.setter
+    def container_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "container_name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def env(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[Mapping[str, Any]]]]]:
+        return pulumi.get(self, "env")
+
+    @env.setter
+    def env(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[Mapping[str, Any]]]]]):
+        pulumi.set(self, "env", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def fluentd(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdPatchArgs']]:
+        return pulumi.get(self, "fluentd")
+
+    @fluentd.setter
+    def fluentd(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsCollectorFluentdPatchArgs']]):
+        pulumi.set(self, "fluentd", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def image(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Name of an image, including registry and repository, to be used for the log collector sidecar. If provided it needs to be an image for the configured collector type.
+        """
+        return pulumi.get(self, "image")
+
+    @image.setter
+    def image(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "image", value)
@@ -0,0 +1,68 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecLogsGeneralArgsDict', 'InnoDBClusterSpecLogsGeneralArgs']
+
+class InnoDBClusterSpecLogsGeneralArgsDict(TypedDict):
+    collect: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Whether general logging data should be collected. Implies that the logging should be enabled.
+    """
+    enabled: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Whether general logging should be enabled
+    """
+
+
+@pulumi.input_type
+class InnoDBClusterSpecLogsGeneralArgs:
+    def __init__(__self__, *,
+                 collect: pulumi.Input[Optional[_builtins.bool]] = None,
+                 enabled: pulumi.Input[Optional[_builtins.bool]] = None):
+        """
+        :param pulumi.Input[_builtins.bool] collect: Whether general logging data should be collected. Implies that the logging should be enabled.
+        :param pulumi.Input[_builtins.bool] enabled: Whether general logging should be enabled
+        """
+        if collect is not None:
+            pulumi.set(__self__, "collect", collect)
+        if enabled is not None:
+            pulumi.set(__self__, "enabled", enabled)
+
+    @_builtins.property
+    @pulumi.getter
+    def collect(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Whether general logging data should be collected. Implies that the logging should be enabled.
+        """
+        return pulumi.get(self, "collect")
+
+    @collect.setter
+    def collect(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "collect", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def enabled(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Whether general logging should be enabled
+        """
+        return pulumi.get(self, "enabled")
+
+    @enabled.setter
+    def enabled(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "enabled", value)
@@ -0,0 +1,88 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecLogsSlowQueryArgsDict', 'InnoDBClusterSpecLogsSlowQueryArgs']
+
+class InnoDBClusterSpecLogsSlowQueryArgsDict(TypedDict):
+    collect: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Whether slow query logging data should be collected. Implies that the logging should be enabled.
+    """
+    enabled: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Whether slow query logging should be enabled
+    """
+    long_query_time: NotRequired[pulumi.Input[Optional[_builtins.float]]]
+    """
+    Long query time threshold
+    """
+
+
+@pulumi.input_type
+class InnoDBClusterSpecLogsSlowQueryArgs:
+    def __init__(__self__, *,
+                 collect: pulumi.Input[Optional[_builtins.bool]] = None,
+                 enabled: pulumi.Input[Optional[_builtins.bool]] = None,
+                 long_query_time: pulumi.Input[Optional[_builtins.float]] = None):
+        """
+        :param pulumi.Input[_builtins.bool] collect: Whether slow query logging data should be collected. Implies that the logging should be enabled.
+        :param pulumi.Input[_builtins.bool] enabled: Whether slow query logging should be enabled
+        :param pulumi.Input[_builtins.float] long_query_time: Long query time threshold
+        """
+        if collect is not None:
+            pulumi.set(__self__, "collect", collect)
+        if enabled is not None:
+            pulumi.set(__self__, "enabled", enabled)
+        if long_query_time is not None:
+            pulumi.set(__self__, "long_query_time", long_query_time)
+
+    @_builtins.property
+    @pulumi.getter
+    def collect(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Whether slow query logging data should be collected. Implies that the logging should be enabled.
+        """
+        return pulumi.get(self, "collect")
+
+    @collect.setter
+    def collect(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "collect", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def enabled(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Whether slow query logging should be enabled
+        """
+        return pulumi.get(self, "enabled")
+
+    @enabled.setter
+    def enabled(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "enabled", value)
+
+    @_builtins.property
+    @pulumi.getter(name="longQueryTime")
+    def long_query_time(self) -> pulumi.Input[Optional[_builtins.float]]:
+        """
+        Long query time threshold
+        """
+        return pulumi.get(self, "long_query_time")
+
+    @long_query_time.setter
+    def long_query_time(self, value: pulumi.Input[Optional[_builtins.float]]):
+        pulumi.set(self, "long_query_time", value)
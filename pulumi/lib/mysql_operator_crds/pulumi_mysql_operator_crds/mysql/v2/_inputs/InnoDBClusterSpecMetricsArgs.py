@@ -0,0 +1,173 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecMetricsArgsDict', 'InnoDBClusterSpecMetricsArgs']
+
+class InnoDBClusterSpecMetricsArgsDict(TypedDict):
+    """
+    Configuration of a Prometheus-style metrics provider
+    """
+    enable: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Toggle to enable or disable the metrics sidecar
+    """
+    image: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Name of an image to be used for the metrics sidecar, if provided metrics will be enabled
+    """
+    monitor: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Create a ServiceMonitor for Prometheus Operator
+    """
+    monitor_spec: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    Custom configuration for the ServiceMonitor object
+    """
+    options: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    Options passed to the metrics provider as command line arguments
+    """
+    tls_secret: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Name of a Secret with TLS certificate, key and CA, which will be mounted at /tls into the container an can be used from webConfig
+    """
+    web_config: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Name of a ConfigMap with a web.config file, if this option is provided a command line option --web.config.file is added
+    """
+
+
+@pulumi.input_type
+class InnoDBClusterSpecMetricsArgs:
+    def __init__(__self__, *,
+                 enable: pulumi.Input[Optional[_builtins.bool]] = None,
+                 image: pulumi.Input[Optional[_builtins.str]] = None,
+                 monitor: pulumi.Input[Optional[_builtins.bool]] = None,
+                 monitor_spec: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 options: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 tls_secret: pulumi.Input[Optional[_builtins.str]] = None,
+                 web_config: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        Configuration of a Prometheus-style metrics provider
+
+        :param pulumi.Input[_builtins.bool] enable: Toggle to enable or disable the metrics sidecar
+        :param pulumi.Input[_builtins.str] image: Name of an image to be used for the metrics sidecar, if provided metrics will be enabled
+        :param pulumi.Input[_builtins.bool] monitor: Create a ServiceMonitor for Prometheus Operator
+        :param pulumi.Input[Mapping[str, Any]] monitor_spec: Custom configuration for the ServiceMonitor object
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] options: Options passed to the metrics provider as command line arguments
+        :param pulumi.Input[_builtins.str] tls_secret: Name of a Secret with TLS certificate, key and CA, which will be mounted at /tls into the container an can be used from webConfig
+        :param pulumi.Input[_builtins.str] web_config: Name of a ConfigMap with a web.config file, if this option is provided a command line option --web.config.file is added
+        """
+        if enable is not None:
+            pulumi.set(__self__, "enable", enable)
+        if image is not None:
+            pulumi.set(__self__, "image", image)
+        if monitor is not None:
+            pulumi.set(__self__, "monitor", monitor)
+        if monitor_spec is not None:
+            pulumi.set(__self__, "monitor_spec", monitor_spec)
+        if options is not None:
+            pulumi.set(__self__, "options", options)
+        if tls_secret is not None:
+            pulumi.set(__self__, "tls_secret", tls_secret)
+        if web_config is not None:
+            pulumi.set(__self__, "web_config", web_config)
+
+    @_builtins.property
+    @pulumi.getter
+    def enable(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Toggle to enable or disable the metrics sidecar
+        """
+        return pulumi.get(self, "enable")
+
+    @enable.setter
+    def enable(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "enable", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def image(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Name of an image to be used for the metrics sidecar, if provided metrics will be enabled
+        """
+        return pulumi.get(self, "image")
+
+    @image.setter
+    def image(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "image", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def monitor(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Create a ServiceMonitor for Prometheus Operator
+        """
+        return pulumi.get(self, "monitor")
+
+    @monitor.setter
+    def monitor(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "monitor", value)
+
+    @_builtins.property
+    @pulumi.getter(name="monitorSpec")
+    def monitor_spec(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        Custom configuration for the ServiceMonitor object
+        """
+        return pulumi.get(self, "monitor_spec")
+
+    @monitor_spec.setter
+    def monitor_spec(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "monitor_spec", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def options(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        Options passed to the metrics provider as command line arguments
+        """
+        return pulumi.get(self, "options")
+
+    @options.setter
+    def options(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "options", value)
+
+    @_builtins.property
+    @pulumi.getter(name="tlsSecret")
+    def tls_secret(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Name of a Secret with TLS certificate, key and CA, which will be mounted at /tls into the container an can be used from webConfig
+        """
+        return pulumi.get(self, "tls_secret")
+
+    @tls_secret.setter
+    def tls_secret(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "tls_secret", value)
+
+    @_builtins.property
+    @pulumi.getter(name="webConfig")
+    def web_config(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Name of a ConfigMap with a web.config file, if this option is provided a command line option --web.config.file is added
+        """
+        return pulumi.get(self, "web_config")
+
+    @web_config.setter
+    def web_config(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "web_config", value)
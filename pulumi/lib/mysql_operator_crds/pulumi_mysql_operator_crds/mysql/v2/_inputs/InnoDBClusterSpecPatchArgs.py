@@ -0,0 +1,517 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecPatchArgsDict', 'InnoDBClusterSpecPatchArgs']
+
+class InnoDBClusterSpecPatchArgsDict(TypedDict):
+    backup_profiles: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[Mapping[str, Any]]]]]]
+    """
+    Backup profile specifications for the cluster, which can be referenced from backup schedules and one-off backup jobs
+    """
+    backup_schedules: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[Mapping[str, Any]]]]]]
+    """
+    Schedules for periodically executed backups
+    """
+    base_server_id: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Base value for MySQL server_id for instances in the cluster
+    """
+    datadir_permissions: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecDatadirPermissionsPatchArgs']]]
+    datadir_volume_claim_template: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    Template for a PersistentVolumeClaim, to be used as datadir
+    """
+    edition: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    MySQL Server Edition (community or enterprise)
+    """
+    image_pull_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Defaults to Always, but set to IfNotPresent in deploy-operator.yaml when deploying Operator
+    """
+    image_pull_secrets: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecImagePullSecretsPatchArgs']]]]]
+    image_repository: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Repository where images are pulled from; defaults to container-registry.oracle.com/mysql
+    """
+    init_db: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    instance_service: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecInstanceServicePatchArgs']]]
+    instances: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Number of MySQL replica instances for the cluster
+    """
+    keyring: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringPatchArgs']]]
+    logs: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsPatchArgs']]]
+    metrics: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecMetricsPatchArgs']]]
+    mycnf: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Custom configuration additions for my.cnf
+    """
+    pod_annotations: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    pod_labels: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    pod_spec: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    Customization specification to be merged into the InnoDBCluster StatefulSet pod template. IMPORTANT: podSpec is regarded only during StatefulSet buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the InnoDBCluster StatefulSet will not be updated
+    """
+    read_replicas: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecReadReplicasPatchArgs']]]]]
+    router: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecRouterPatchArgs']]]
+    secret_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Name of a generic type Secret containing root/default account password
+    """
+    service: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecServicePatchArgs']]]
+    service_account_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    service_fqdn_template: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Template for a FQDN resolving to the cluster's headless instance Service and individual Pods
+    """
+    tls_ca_secret_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Name of a generic type Secret containing CA (ca.pem) and optional CRL (crl.pem) for SSL
+    """
+    tls_secret_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Name of a TLS type Secret containing Server certificate and private key for SSL
+    """
+    tls_use_self_signed: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Enables use of self-signed TLS certificates, reducing or disabling TLS based security verifications
+    """
+    version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    MySQL Server version
+    """
+
+
+@pulumi.input_type
+class InnoDBClusterSpecPatchArgs:
+    def __init__(__self__, *,
+                 backup_profiles: pulumi.Input[Optional[Sequence[pulumi.Input[Mapping[str, Any]]]]] = None,
+                 backup_schedules: pulumi.Input[Optional[Sequence[pulumi.Input[Mapping[str, Any]]]]] = None,
+                 base_server_id: pulumi.Input[Optional[_builtins.int]] = None,
+                 datadir_permissions: pulumi.Input[Optional['_inputs.InnoDBClusterSpecDatadirPermissionsPatchArgs']] = None,
+                 datadir_volume_claim_template: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 edition: pulumi.Input[Optional[_builtins.str]] = None,
+                 image_pull_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 image_pull_secrets: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecImagePullSecretsPatchArgs']]]] = None,
+                 image_repository: pulumi.Input[Optional[_builtins.str]] = None,
+                 init_db: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 instance_service: pulumi.Input[Optional['_inputs.InnoDBClusterSpecInstanceServicePatchArgs']] = None,
+                 instances: pulumi.Input[Optional[_builtins.int]] = None,
+                 keyring: pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringPatchArgs']] = None,
+                 logs: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsPatchArgs']] = None,
+                 metrics: pulumi.Input[Optional['_inputs.InnoDBClusterSpecMetricsPatchArgs']] = None,
+                 mycnf: pulumi.Input[Optional[_builtins.str]] = None,
+                 pod_annotations: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 pod_labels: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 pod_spec: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 read_replicas: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecReadReplicasPatchArgs']]]] = None,
+                 router: pulumi.Input[Optional['_inputs.InnoDBClusterSpecRouterPatchArgs']] = None,
+                 secret_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 service: pulumi.Input[Optional['_inputs.InnoDBClusterSpecServicePatchArgs']] = None,
+                 service_account_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 service_fqdn_template: pulumi.Input[Optional[_builtins.str]] = None,
+                 tls_ca_secret_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 tls_secret_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 tls_use_self_signed: pulumi.Input[Optional[_builtins.bool]] = None,
+                 version: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        :param pulumi.Input[Sequence[pulumi.Input[Mapping[str, Any]]]] backup_profiles: Backup profile specifications for the cluster, which can be referenced from backup schedules and one-off backup jobs
+        :param pulumi.Input[Sequence[pulumi.Input[Mapping[str, Any]]]] backup_schedules: Schedules for periodically executed backups
+        :param pulumi.Input[_builtins.int] base_server_id: Base value for MySQL server_id for instances in the cluster
+        :param pulumi.Input[Mapping[str, Any]] datadir_volume_claim_template: Template for a PersistentVolumeClaim, to be used as datadir
+        :param pulumi.Input[_builtins.str] edition: MySQL Server Edition (community or enterprise)
+        :param pulumi.Input[_builtins.str] image_pull_policy: Defaults to Always, but set to IfNotPresent in deploy-operator.yaml when deploying Operator
+        :param pulumi.Input[_builtins.str] image_repository: Repository where images are pulled from; defaults to container-registry.oracle.com/mysql
+        :param pulumi.Input[_builtins.int] instances: Number of MySQL replica instances for the cluster
+        :param pulumi.Input[_builtins.str] mycnf: Custom configuration additions for my.cnf
+        :param pulumi.Input[Mapping[str, Any]] pod_spec: Customization specification to be merged into the InnoDBCluster StatefulSet pod template. IMPORTANT: podSpec is regarded only during StatefulSet buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the InnoDBCluster StatefulSet will not be updated
+        :param pulumi.Input[_builtins.str] secret_name: Name of a generic type Secret containing root/default account password
+        :param pulumi.Input[_builtins.str] service_fqdn_template: Template for a FQDN resolving to the cluster's headless instance Service and individual Pods
+        :param pulumi.Input[_builtins.str] tls_ca_secret_name: Name of a generic type Secret containing CA (ca.pem) and optional CRL (crl.pem) for SSL
+        :param pulumi.Input[_builtins.str] tls_secret_name: Name of a TLS type Secret containing Server certificate and private key for SSL
+        :param pulumi.Input[_builtins.bool] tls_use_self_signed: Enables use of self-signed TLS certificates, reducing or disabling TLS based security verifications
+        :param pulumi.Input[_builtins.str] version: MySQL Server version
+        """
+        if backup_profiles is not None:
+            pulumi.set(__self__, "backup_profiles", backup_profiles)
+        if backup_schedules is not None:
+            pulumi.set(__self__, "backup_schedules", backup_schedules)
+        if base_server_id is not None:
+            pulumi.set(__self__, "base_server_id", base_server_id)
+        if datadir_permissions is not None:
+            pulumi.set(__self__, "datadir_permissions", datadir_permissions)
+        if datadir_volume_claim_template is not None:
+            pulumi.set(__self__, "datadir_volume_claim_template", datadir_volume_claim_template)
+        if edition is not None:
+            pulumi.set(__self__, "edition", edition)
+        if image_pull_policy is not None:
+            pulumi.set(__self__, "image_pull_policy", image_pull_policy)
+        if image_pull_secrets is not None:
+            pulumi.set(__self__, "image_pull_secrets", image_pull_secrets)
+        if image_repository is not None:
+            pulumi.set(__self__, "image_repository", image_repository)
+        if init_db is not None:
+            pulumi.set(__self__, "init_db", init_db)
+        if instance_service is not None:
+            pulumi.set(__self__, "instance_service", instance_service)
+        if instances is not None:
+            pulumi.set(__self__, "instances", instances)
+        if keyring is not None:
+            pulumi.set(__self__, "keyring", keyring)
+        if logs is not None:
+            pulumi.set(__self__, "logs", logs)
+        if metrics is not None:
+            pulumi.set(__self__, "metrics", metrics)
+        if mycnf is not None:
+            pulumi.set(__self__, "mycnf", mycnf)
+        if pod_annotations is not None:
+            pulumi.set(__self__, "pod_annotations", pod_annotations)
+        if pod_labels is not None:
+            pulumi.set(__self__, "pod_labels", pod_labels)
+        if pod_spec is not None:
+            pulumi.set(__self__, "pod_spec", pod_spec)
+        if read_replicas is not None:
+            pulumi.set(__self__, "read_replicas", read_replicas)
+        if router is not None:
+            pulumi.set(__self__, "router", router)
+        if secret_name is not None:
+            pulumi.set(__self__, "secret_name", secret_name)
+        if service is not None:
+            pulumi.set(__self__, "service", service)
+        if service_account_name is not None:
+            pulumi.set(__self__, "service_account_name", service_account_name)
+        if service_fqdn_template is not None:
+            pulumi.set(__self__, "service_fqdn_template", service_fqdn_template)
+        if tls_ca_secret_name is not None:
+            pulumi.set(__self__, "tls_ca_secret_name", tls_ca_secret_name)
+        if tls_secret_name is not None:
+            pulumi.set(__self__, "tls_secret_name", tls_secret_name)
+        if tls_use_self_signed is not None:
+            pulumi.set(__self__, "tls_use_self_signed", tls_use_self_signed)
+        if version is not None:
+            pulumi.set(__self__, "version", version)
+
+    @_builtins.property
+    @pulumi.getter(name="backupProfiles")
+    def backup_profiles(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[Mapping[str, Any]]]]]:
+        """
+        Backup profile specifications for the cluster, which can be referenced from backup schedules and one-off backup jobs
+        """
+        return pulumi.get(self, "backup_profiles")
+
+    @backup_profiles.setter
+    def backup_profiles(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[Mapping[str, Any]]]]]):
+        pulumi.set(self, "backup_profiles", value)
+
+    @_builtins.property
+    @pulumi.getter(name="backupSchedules")
+    def backup_schedules(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[Mapping[str, Any]]]]]:
+        """
+        Schedules for periodically executed backups
+        """
+        return pulumi.get(self, "backup_schedules")
+
+    @backup_schedules.setter
+    def backup_schedules(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[Mapping[str, Any]]]]]):
+        pulumi.set(self, "backup_schedules", value)
+
+    @_builtins.property
+    @pulumi.getter(name="baseServerId")
+    def base_server_id(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Base value for MySQL server_id for instances in the cluster
+        """
+        return pulumi.get(self, "base_server_id")
+
+    @base_server_id.setter
+    def base_server_id(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "base_server_id", value)
+
+    @_builtins.property
+    @pulumi.getter(name="datadirPermissions")
+    def datadir_permissions(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecDatadirPermissionsPatchArgs']]:
+        return pulumi.get(self, "datadir_permissions")
+
+    @datadir_permissions.setter
+    def datadir_permissions(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecDatadirPermissionsPatchArgs']]):
+        pulumi.set(self, "datadir_permissions", value)
+
+    @_builtins.property
+    @pulumi.getter(name="datadirVolumeClaimTemplate")
+    def datadir_volume_claim_template(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        Template for a PersistentVolumeClaim, to be used as datadir
+        """
+        return pulumi.get(self, "datadir_volume_claim_template")
+
+    @datadir_volume_claim_template.setter
+    def datadir_volume_claim_template(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "datadir_volume_claim_template", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def edition(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        MySQL Server Edition (community or enterprise)
+        """
+        return pulumi.get(self, "edition")
+
+    @edition.setter
+    def edition(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "edition", value)
+
+    @_builtins.property
+    @pulumi.getter(name="imagePullPolicy")
+    def image_pull_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Defaults to Always, but set to IfNotPresent in deploy-operator.yaml when deploying Operator
+        """
+        return pulumi.get(self, "image_pull_policy")
+
+    @image_pull_policy.setter
+    def image_pull_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "image_pull_policy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="imagePullSecrets")
+    def image_pull_secrets(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecImagePullSecretsPatchArgs']]]]:
+        return pulumi.get(self, "image_pull_secrets")
+
+    @image_pull_secrets.setter
+    def image_pull_secrets(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecImagePullSecretsPatchArgs']]]]):
+        pulumi.set(self, "image_pull_secrets", value)
+
+    @_builtins.property
+    @pulumi.getter(name="imageRepository")
+    def image_repository(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Repository where images are pulled from; defaults to container-registry.oracle.com/mysql
+        """
+        return pulumi.get(self, "image_repository")
+
+    @image_repository.setter
+    def image_repository(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "image_repository", value)
+
+    @_builtins.property
+    @pulumi.getter(name="initDB")
+    def init_db(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        return pulumi.get(self, "init_db")
+
+    @init_db.setter
+    def init_db(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "init_db", value)
+
+    @_builtins.property
+    @pulumi.getter(name="instanceService")
+    def instance_service(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecInstanceServicePatchArgs']]:
+        return pulumi.get(self, "instance_service")
+
+    @instance_service.setter
+    def instance_service(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecInstanceServicePatchArgs']]):
+        pulumi.set(self, "instance_service", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def instances(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Number of MySQL replica instances for the cluster
+        """
+        return pulumi.get(self, "instances")
+
+    @instances.setter
+    def instances(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "instances", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def keyring(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringPatchArgs']]:
+        return pulumi.get(self, "keyring")
+
+    @keyring.setter
+    def keyring(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecKeyringPatchArgs']]):
+        pulumi.set(self, "keyring", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def logs(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsPatchArgs']]:
+        return pulumi.get(self, "logs")
+
+    @logs.setter
+    def logs(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecLogsPatchArgs']]):
+        pulumi.set(self, "logs", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def metrics(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecMetricsPatchArgs']]:
+        return pulumi.get(self, "metrics")
+
+    @metrics.setter
+    def metrics(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecMetricsPatchArgs']]):
+        pulumi.set(self, "metrics", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def mycnf(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Custom configuration additions for my.cnf
+        """
+        return pulumi.get(self, "mycnf")
+
+    @mycnf.setter
+    def mycnf(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "mycnf", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podAnnotations")
+    def pod_annotations(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        return pulumi.get(self, "pod_annotations")
+
+    @pod_annotations.setter
+    def pod_annotations(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "pod_annotations", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podLabels")
+    def pod_labels(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        return pulumi.get(self, "pod_labels")
+
+    @pod_labels.setter
+    def pod_labels(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "pod_labels", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podSpec")
+    def pod_spec(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        Customization specification to be merged into the InnoDBCluster StatefulSet pod template. IMPORTANT: podSpec is regarded only during StatefulSet buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the InnoDBCluster StatefulSet will not be updated
+        """
+        return pulumi.get(self, "pod_spec")
+
+    @pod_spec.setter
+    def pod_spec(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "pod_spec", value)
+
+    @_builtins.property
+    @pulumi.getter(name="readReplicas")
+    def read_replicas(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecReadReplicasPatchArgs']]]]:
+        return pulumi.get(self, "read_replicas")
+
+    @read_replicas.setter
+    def read_replicas(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.InnoDBClusterSpecReadReplicasPatchArgs']]]]):
+        pulumi.set(self, "read_replicas", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def router(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecRouterPatchArgs']]:
+        return pulumi.get(self, "router")
+
+    @router.setter
+    def router(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecRouterPatchArgs']]):
+        pulumi.set(self, "router", value)
+
+    @_builtins.property
+    @pulumi.getter(name="secretName")
+    def secret_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Name of a generic type Secret containing root/default account password
+        """
+        return pulumi.get(self, "secret_name")
+
+    @secret_name.setter
+    def secret_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "secret_name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def service(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecServicePatchArgs']]:
+        return pulumi.get(self, "service")
+
+    @service.setter
+    def service(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecServicePatchArgs']]):
+        pulumi.set(self, "service", value)
+
+    @_builtins.property
+    @pulumi.getter(name="serviceAccountName")
+    def service_account_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "service_account_name")
+
+    @service_account_name.setter
+    def service_account_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "service_account_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="serviceFqdnTemplate")
+    def service_fqdn_template(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Template for a FQDN resolving to the cluster's headless instance Service and individual Pods
+        """
+        return pulumi.get(self, "service_fqdn_template")
+
+    @service_fqdn_template.setter
+    def service_fqdn_template(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "service_fqdn_template", value)
+
+    @_builtins.property
+    @pulumi.getter(name="tlsCASecretName")
+    def tls_ca_secret_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Name of a generic type Secret containing CA (ca.pem) and optional CRL (crl.pem) for SSL
+        """
+        return pulumi.get(self, "tls_ca_secret_name")
+
+    @tls_ca_secret_name.setter
+    def tls_ca_secret_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "tls_ca_secret_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="tlsSecretName")
+    def tls_secret_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Name of a TLS type Secret containing Server certificate and private key for SSL
+        """
+        return pulumi.get(self, "tls_secret_name")
+
+    @tls_secret_name.setter
+    def tls_secret_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "tls_secret_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="tlsUseSelfSigned")
+    def tls_use_self_signed(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Enables use of self-signed TLS certificates, reducing or disabling TLS based security verifications
+        """
+        return pulumi.get(self, "tls_use_self_signed")
+
+    @tls_use_self_signed.setter
+    def tls_use_self_signed(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "tls_use_self_signed", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def version(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        MySQL Server version
+        """
+        return pulumi.get(self, "version")
+
+    @version.setter
+    def version(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "version", value)
@@ -0,0 +1,187 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecReadReplicasPatchArgsDict', 'InnoDBClusterSpecReadReplicasPatchArgs']
+
+class InnoDBClusterSpecReadReplicasPatchArgsDict(TypedDict):
+    base_server_id: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Base value for MySQL server_id for instances of the readReplica, if 0 it will be assigned automatically
+    """
+    datadir_volume_claim_template: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    Template for a PersistentVolumeClaim, to be used as datadir
+    """
+    instances: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Number of MySQL instances for the set of read replica
+    """
+    mycnf: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Custom configuration additions for my.cnf
+    """
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    pod_annotations: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    pod_labels: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    pod_spec: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    Customization specification to be merged into the InnoDBCluster StatefulSet pod template. IMPORTANT: podSpec is regarded only during StatefulSet buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the InnoDBCluster StatefulSet will not be updated
+    """
+    version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    MySQL Server version
+    """
+
+
+@pulumi.input_type
+class InnoDBClusterSpecReadReplicasPatchArgs:
+    def __init__(__self__, *,
+                 base_server_id: pulumi.Input[Optional[_builtins.int]] = None,
+                 datadir_volume_claim_template: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 instances: pulumi.Input[Optional[_builtins.int]] = None,
+                 mycnf: pulumi.Input[Optional[_builtins.str]] = None,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 pod_annotations: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 pod_labels: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 pod_spec: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 version: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        :param pulumi.Input[_builtins.int] base_server_id: Base value for MySQL server_id for instances of the readReplica, if 0 it will be assigned automatically
+        :param pulumi.Input[Mapping[str, Any]] datadir_volume_claim_template: Template for a PersistentVolumeClaim, to be used as datadir
+        :param pulumi.Input[_builtins.int] instances: Number of MySQL instances for the set of read replica
+        :param pulumi.Input[_builtins.str] mycnf: Custom configuration additions for my.cnf
+        :param pulumi.Input[Mapping[str, Any]] pod_spec: Customization specification to be merged into the InnoDBCluster StatefulSet pod template. IMPORTANT: podSpec is regarded only during StatefulSet buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the InnoDBCluster StatefulSet will not be updated
+        :param pulumi.Input[_builtins.str] version: MySQL Server version
+        """
+        if base_server_id is not None:
+            pulumi.set(__self__, "base_server_id", base_server_id)
+        if datadir_volume_claim_template is not None:
+            pulumi.set(__self__, "datadir_volume_claim_template", datadir_volume_claim_template)
+        if instances is not None:
+            pulumi.set(__self__, "instances", instances)
+        if mycnf is not None:
+            pulumi.set(__self__, "mycnf", mycnf)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if pod_annotations is not None:
+            pulumi.set(__self__, "pod_annotations", pod_annotations)
+        if pod_labels is not None:
+            pulumi.set(__self__, "pod_labels", pod_labels)
+        if pod_spec is not None:
+            pulumi.set(__self__, "pod_spec", pod_spec)
+        if version is not None:
+            pulumi.set(__self__, "version", version)
+
+    @_builtins.property
+    @pulumi.getter(name="baseServerId")
+    def base_server_id(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Base value for MySQL server_id for instances of the readReplica, if 0 it will be assigned automatically
+        """
+        return pulumi.get(self, "base_server_id")
+
+    @base_server_id.setter
+    def base_server_id(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "base_server_id", value)
+
+    @_builtins.property
+    @pulumi.getter(name="datadirVolumeClaimTemplate")
+    def datadir_volume_claim_template(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        Template for a PersistentVolumeClaim, to be used as datadir
+        """
+        return pulumi.get(self, "datadir_volume_claim_template")
+
+    @datadir_volume_claim_template.setter
+    def datadir_volume_claim_template(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "datadir_volume_claim_template", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def instances(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Number of MySQL instances for the set of read replica
+        """
+        return pulumi.get(self, "instances")
+
+    @instances.setter
+    def instances(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "instances", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def mycnf(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Custom configuration additions for my.cnf
+        """
+        return pulumi.get(self, "mycnf")
+
+    @mycnf.setter
+    def mycnf(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "mycnf", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podAnnotations")
+    def pod_annotations(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        return pulumi.get(self, "pod_annotations")
+
+    @pod_annotations.setter
+    def pod_annotations(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "pod_annotations", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podLabels")
+    def pod_labels(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        return pulumi.get(self, "pod_labels")
+
+    @pod_labels.setter
+    def pod_labels(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "pod_labels", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podSpec")
+    def pod_spec(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        Customization specification to be merged into the InnoDBCluster StatefulSet pod template. IMPORTANT: podSpec is regarded only during StatefulSet buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the InnoDBCluster StatefulSet will not be updated
+        """
+        return pulumi.get(self, "pod_spec")
+
+    @pod_spec.setter
+    def pod_spec(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "pod_spec", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def version(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        MySQL Server version
+        """
+        return pulumi.get(self, "version")
+
+    @version.setter
+    def version(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "version", value)
@@ -0,0 +1,192 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecRouterArgsDict', 'InnoDBClusterSpecRouterArgs']
+
+class InnoDBClusterSpecRouterArgsDict(TypedDict):
+    """
+    MySQL Router specification
+    """
+    bootstrap_options: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    Command line options passed to MySQL Router while bootstrapping
+    """
+    instances: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Number of MySQL Router instances to deploy
+    """
+    options: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    Command line options passed to MySQL Router while running
+    """
+    pod_annotations: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    pod_labels: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    pod_spec: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    Customization specification to be merged into the Router Deployment pod template. IMPORTANT: podSpec is regarded only during Deployment buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the Router Deployment will not be updated
+    """
+    routing_options: NotRequired[pulumi.Input[Optional['_inputs.InnoDBClusterSpecRouterRoutingOptionsArgs']]]
+    tls_secret_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Name of a TLS type Secret containing MySQL Router certificate and private key used for SSL
+    """
+    version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Override MySQL Router version
+    """
+
+
+@pulumi.input_type
+class InnoDBClusterSpecRouterArgs:
+    def __init__(__self__, *,
+                 bootstrap_options: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 instances: pulumi.Input[Optional[_builtins.int]] = None,
+                 options: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 pod_annotations: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 pod_labels: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 pod_spec: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 routing_options: pulumi.Input[Optional['_inputs.InnoDBClusterSpecRouterRoutingOptionsArgs']] = None,
+                 tls_secret_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 version: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        MySQL Router specification
+
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] bootstrap_options: Command line options passed to MySQL Router while bootstrapping
+        :param pulumi.Input[_builtins.int] instances: Number of MySQL Router instances to deploy
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] options: Command line options passed to MySQL Router while running
+        :param pulumi.Input[Mapping[str, Any]] pod_spec: Customization specification to be merged into the Router Deployment pod template. IMPORTANT: podSpec is regarded only during Deployment buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the Router Deployment will not be updated
+        :param pulumi.Input[_builtins.str] tls_secret_name: Name of a TLS type Secret containing MySQL Router certificate and private key used for SSL
+        :param pulumi.Input[_builtins.str] version: Override MySQL Router version
+        """
+        if bootstrap_options is not None:
+            pulumi.set(__self__, "bootstrap_options", bootstrap_options)
+        if instances is not None:
+            pulumi.set(__self__, "instances", instances)
+        if options is not None:
+            pulumi.set(__self__, "options", options)
+        if pod_annotations is not None:
+            pulumi.set(__self__, "pod_annotations", pod_annotations)
+        if pod_labels is not None:
+            pulumi.set(__self__, "pod_labels", pod_labels)
+        if pod_spec is not None:
+            pulumi.set(__self__, "pod_spec", pod_spec)
+        if routing_options is not None:
+            pulumi.set(__self__, "routing_options", routing_options)
+        if tls_secret_name is not None:
+            pulumi.set(__self__, "tls_secret_name", tls_secret_name)
+        if version is not None:
+            pulumi.set(__self__, "version", version)
+
+    @_builtins.property
+    @pulumi.getter(name="bootstrapOptions")
+    def bootstrap_options(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        Command line options passed to MySQL Router while bootstrapping
+        """
+        return pulumi.get(self, "bootstrap_options")
+
+    @bootstrap_options.setter
+    def bootstrap_options(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "bootstrap_options", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def instances(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Number of MySQL Router instances to deploy
+        """
+        return pulumi.get(self, "instances")
+
+    @instances.setter
+    def instances(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "instances", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def options(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        Command line options passed to MySQL Router while running
+        """
+        return pulumi.get(self, "options")
+
+    @options.setter
+    def options(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "options", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podAnnotations")
+    def pod_annotations(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        return pulumi.get(self, "pod_annotations")
+
+    @pod_annotations.setter
+    def pod_annotations(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "pod_annotations", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podLabels")
+    def pod_labels(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        return pulumi.get(self, "pod_labels")
+
+    @pod_labels.setter
+    def pod_labels(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "pod_labels", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podSpec")
+    def pod_spec(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        Customization specification to be merged into the Router Deployment pod template. IMPORTANT: podSpec is regarded only during Deployment buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the Router Deployment will not be updated
+        """
+        return pulumi.get(self, "pod_spec")
+
+    @pod_spec.setter
+    def pod_spec(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "pod_spec", value)
+
+    @_builtins.property
+    @pulumi.getter(name="routingOptions")
+    def routing_options(self) -> pulumi.Input[Optional['_inputs.InnoDBClusterSpecRouterRoutingOptionsArgs']]:
+        return pulumi.get(self, "routing_options")
+
+    @routing_options.setter
+    def routing_options(self, value: pulumi.Input[Optional['_inputs.InnoDBClusterSpecRouterRoutingOptionsArgs']]):
+        pulumi.set(self, "routing_options", value)
+
+    @_builtins.property
+    @pulumi.getter(name="tlsSecretName")
+    def tls_secret_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Name of a TLS type Secret containing MySQL Router certificate and private key used for SSL
+        """
+        return pulumi.get(self, "tls_secret_name")
+
+    @tls_secret_name.setter
+    def tls_secret_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "tls_secret_name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def version(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Override MySQL Router version
+        """
+        return pulumi.get(self, "version")
+
+    @version.setter
+    def version(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "version", value)
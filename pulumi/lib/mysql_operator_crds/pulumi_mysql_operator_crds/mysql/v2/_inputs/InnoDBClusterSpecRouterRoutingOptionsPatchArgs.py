@@ -0,0 +1,71 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecRouterRoutingOptionsPatchArgsDict', 'InnoDBClusterSpecRouterRoutingOptionsPatchArgs']
+
+class InnoDBClusterSpecRouterRoutingOptionsPatchArgsDict(TypedDict):
+    """
+    Set routing options for the cluster
+    """
+    invalidated_cluster_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    read_only_targets: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    stats_updates_frequency: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+
+
+@pulumi.input_type
+class InnoDBClusterSpecRouterRoutingOptionsPatchArgs:
+    def __init__(__self__, *,
+                 invalidated_cluster_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 read_only_targets: pulumi.Input[Optional[_builtins.str]] = None,
+                 stats_updates_frequency: pulumi.Input[Optional[_builtins.int]] = None):
+        """
+        Set routing options for the cluster
+        """
+        if invalidated_cluster_policy is not None:
+            pulumi.set(__self__, "invalidated_cluster_policy", invalidated_cluster_policy)
+        if read_only_targets is not None:
+            pulumi.set(__self__, "read_only_targets", read_only_targets)
+        if stats_updates_frequency is not None:
+            pulumi.set(__self__, "stats_updates_frequency", stats_updates_frequency)
+
+    @_builtins.property
+    @pulumi.getter
+    def invalidated_cluster_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "invalidated_cluster_policy")
+
+    @invalidated_cluster_policy.setter
+    def invalidated_cluster_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "invalidated_cluster_policy", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def read_only_targets(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "read_only_targets")
+
+    @read_only_targets.setter
+    def read_only_targets(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "read_only_targets", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def stats_updates_frequency(self) -> pulumi.Input[Optional[_builtins.int]]:
+        return pulumi.get(self, "stats_updates_frequency")
+
+    @stats_updates_frequency.setter
+    def stats_updates_frequency(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "stats_updates_frequency", value)
@@ -0,0 +1,106 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['InnoDBClusterSpecServicePatchArgsDict', 'InnoDBClusterSpecServicePatchArgs']
+
+class InnoDBClusterSpecServicePatchArgsDict(TypedDict):
+    """
+    Configuration of the Service used by applications connecting to the InnoDB Cluster
+    """
+    annotations: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    Custom annotations for the Service
+    """
+    default_port: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Target for the Service's default (3306) port. If mysql-rw traffic will go to the primary and allow read and write operations, with mysql-ro traffic goes to the replica and allows only read operations, with mysql-rw-split the router's read-write-splitting will be targeted
+    """
+    labels: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    Custom labels for the Service
+    """
+    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class InnoDBClusterSpecServicePatchArgs:
+    def __init__(__self__, *,
+                 annotations: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 default_port: pulumi.Input[Optional[_builtins.str]] = None,
+                 labels: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 type: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        Configuration of the Service used by applications connecting to the InnoDB Cluster
+
+        :param pulumi.Input[Mapping[str, Any]] annotations: Custom annotations for the Service
+        :param pulumi.Input[_builtins.str] default_port: Target for the Service's default (3306) port. If mysql-rw traffic will go to the primary and allow read and write operations, with mysql-ro traffic goes to the replica and allows only read operations, with mysql-rw-split the router's read-write-splitting will be targeted
+        :param pulumi.Input[Mapping[str, Any]] labels: Custom labels for the Service
+        """
+        if annotations is not None:
+            pulumi.set(__self__, "annotations", annotations)
+        if default_port is not None:
+            pulumi.set(__self__, "default_port", default_port)
+        if labels is not None:
+            pulumi.set(__self__, "labels", labels)
+        if type is not None:
+            pulumi.set(__self__, "type", type)
+
+    @_builtins.property
+    @pulumi.getter
+    def annotations(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        Custom annotations for the Service
+        """
+        return pulumi.get(self, "annotations")
+
+    @annotations.setter
+    def annotations(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "annotations", value)
+
+    @_builtins.property
+    @pulumi.getter(name="defaultPort")
+    def default_port(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Target for the Service's default (3306) port. If mysql-rw traffic will go to the primary and allow read and write operations, with mysql-ro traffic goes to the replica and allows only read operations, with mysql-rw-split the router's read-write-splitting will be targeted
+        """
+        return pulumi.get(self, "default_port")
+
+    @default_port.setter
+    def default_port(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "default_port", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def labels(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        Custom labels for the Service
+        """
+        return pulumi.get(self, "labels")
+
+    @labels.setter
+    def labels(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "labels", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "type")
+
+    @type.setter
+    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "type", value)
@@ -0,0 +1,140 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['MySQLBackupSpecArgsDict', 'MySQLBackupSpecArgs']
+
+class MySQLBackupSpecArgsDict(TypedDict):
+    add_timestamp_to_backup_directory: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    backup_profile: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    backupProfile specification if backupProfileName is not specified
+    """
+    backup_profile_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    cluster_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    delete_backup_data: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    incremental: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    MySQL Enterprise Backup only: Request taking an incremental backup
+    """
+    incremental_base: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    MySQL Enterprise Backup only: Base for incremental backup,  either last_backup or last_full_backup
+    """
+
+
+@pulumi.input_type
+class MySQLBackupSpecArgs:
+    def __init__(__self__, *,
+                 add_timestamp_to_backup_directory: pulumi.Input[Optional[_builtins.bool]] = None,
+                 backup_profile: pulumi.Input[Optional[Mapping[str, Any]]] = None,
+                 backup_profile_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 cluster_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 delete_backup_data: pulumi.Input[Optional[_builtins.bool]] = None,
+                 incremental: pulumi.Input[Optional[_builtins.bool]] = None,
+                 incremental_base: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        :param pulumi.Input[Mapping[str, Any]] backup_profile: backupProfile specification if backupProfileName is not specified
+        :param pulumi.Input[_builtins.bool] incremental: MySQL Enterprise Backup only: Request taking an incremental backup
+        :param pulumi.Input[_builtins.str] incremental_base: MySQL Enterprise Backup only: Base for incremental backup,  either last_backup or last_full_backup
+        """
+        if add_timestamp_to_backup_directory is not None:
+            pulumi.set(__self__, "add_timestamp_to_backup_directory", add_timestamp_to_backup_directory)
+        if backup_profile is not None:
+            pulumi.set(__self__, "backup_profile", backup_profile)
+        if backup_profile_name is not None:
+            pulumi.set(__self__, "backup_profile_name", backup_profile_name)
+        if cluster_name is not None:
+            pulumi.set(__self__, "cluster_name", cluster_name)
+        if delete_backup_data is not None:
+            pulumi.set(__self__, "delete_backup_data", delete_backup_data)
+        if incremental is not None:
+            pulumi.set(__self__, "incremental", incremental)
+        if incremental_base is not None:
+            pulumi.set(__self__, "incremental_base", incremental_base)
+
+    @_builtins.property
+    @pulumi.getter(name="addTimestampToBackupDirectory")
+    def add_timestamp_to_backup_directory(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "add_timestamp_to_backup_directory")
+
+    @add_timestamp_to_backup_directory.setter
+    def add_timestamp_to_backup_directory(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "add_timestamp_to_backup_directory", value)
+
+    @_builtins.property
+    @pulumi.getter(name="backupProfile")
+    def backup_profile(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        backupProfile specification if backupProfileName is not specified
+        """
+        return pulumi.get(self, "backup_profile")
+
+    @backup_profile.setter
+    def backup_profile(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "backup_profile", value)
+
+    @_builtins.property
+    @pulumi.getter(name="backupProfileName")
+    def backup_profile_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "backup_profile_name")
+
+    @backup_profile_name.setter
+    def backup_profile_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "backup_profile_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="clusterName")
+    def cluster_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "cluster_name")
+
+    @cluster_name.setter
+    def cluster_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "cluster_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="deleteBackupData")
+    def delete_backup_data(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "delete_backup_data")
+
+    @delete_backup_data.setter
+    def delete_backup_data(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "delete_backup_data", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def incremental(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        MySQL Enterprise Backup only: Request taking an incremental backup
+        """
+        return pulumi.get(self, "incremental")
+
+    @incremental.setter
+    def incremental(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "incremental", value)
+
+    @_builtins.property
+    @pulumi.getter(name="incrementalBase")
+    def incremental_base(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        MySQL Enterprise Backup only: Base for incremental backup,  either last_backup or last_full_backup
+        """
+        return pulumi.get(self, "incremental_base")
+
+    @incremental_base.setter
+    def incremental_base(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "incremental_base", value)
@@ -0,0 +1,195 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['MySQLBackupStatusArgsDict', 'MySQLBackupStatusArgs']
+
+class MySQLBackupStatusArgsDict(TypedDict):
+    bucket: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    completion_time: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    container: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    elapsed_time: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    message: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    method: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    oci_tenancy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    output: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    size: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    source: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    space_available: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    start_time: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    status: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class MySQLBackupStatusArgs:
+    def __init__(__self__, *,
+                 bucket: pulumi.Input[Optional[_builtins.str]] = None,
+                 completion_time: pulumi.Input[Optional[_builtins.str]] = None,
+                 container: pulumi.Input[Optional[_builtins.str]] = None,
+                 elapsed_time: pulumi.Input[Optional[_builtins.str]] = None,
+                 message: pulumi.Input[Optional[_builtins.str]] = None,
+                 method: pulumi.Input[Optional[_builtins.str]] = None,
+                 oci_tenancy: pulumi.Input[Optional[_builtins.str]] = None,
+                 output: pulumi.Input[Optional[_builtins.str]] = None,
+                 size: pulumi.Input[Optional[_builtins.str]] = None,
+                 source: pulumi.Input[Optional[_builtins.str]] = None,
+                 space_available: pulumi.Input[Optional[_builtins.str]] = None,
+                 start_time: pulumi.Input[Optional[_builtins.str]] = None,
+                 status: pulumi.Input[Optional[_builtins.str]] = None):
+        if bucket is not None:
+            pulumi.set(__self__, "bucket", bucket)
+        if completion_time is not None:
+            pulumi.set(__self__, "completion_time", completion_time)
+        if container is not None:
+            pulumi.set(__self__, "container", container)
+        if elapsed_time is not None:
+            pulumi.set(__self__, "elapsed_time", elapsed_time)
+        if message is not None:
+            pulumi.set(__self__, "message", message)
+        if method is not None:
+            pulumi.set(__self__, "method", method)
+        if oci_tenancy is not None:
+            pulumi.set(__self__, "oci_tenancy", oci_tenancy)
+        if output is not None:
+            pulumi.set(__self__, "output", output)
+        if size is not None:
+            pulumi.set(__self__, "size", size)
+        if source is not None:
+            pulumi.set(__self__, "source", source)
+        if space_available is not None:
+            pulumi.set(__self__, "space_available", space_available)
+        if start_time is not None:
+            pulumi.set(__self__, "start_time", start_time)
+        if status is not None:
+            pulumi.set(__self__, "status", status)
+
+    @_builtins.property
+    @pulumi.getter
+    def bucket(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "bucket")
+
+    @bucket.setter
+    def bucket(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "bucket", value)
+
+    @_builtins.property
+    @pulumi.getter(name="completionTime")
+    def completion_time(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "completion_time")
+
+    @completion_time.setter
+    def completion_time(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "completion_time", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def container(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "container")
+
+    @container.setter
+    def container(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "container", value)
+
+    @_builtins.property
+    @pulumi.getter(name="elapsedTime")
+    def elapsed_time(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "elapsed_time")
+
+    @elapsed_time.setter
+    def elapsed_time(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "elapsed_time", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def message(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "message")
+
+    @message.setter
+    def message(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "message", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def method(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "method")
+
+    @method.setter
+    def method(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "method", value)
+
+    @_builtins.property
+    @pulumi.getter(name="ociTenancy")
+    def oci_tenancy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "oci_tenancy")
+
+    @oci_tenancy.setter
+    def oci_tenancy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "oci_tenancy", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def output(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "output")
+
+    @output.setter
+    def output(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "output", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def size(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "size")
+
+    @size.setter
+    def size(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "size", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def source(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "source")
+
+    @source.setter
+    def source(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "source", value)
+
+    @_builtins.property
+    @pulumi.getter(name="spaceAvailable")
+    def space_available(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "space_available")
+
+    @space_available.setter
+    def space_available(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "space_available", value)
+
+    @_builtins.property
+    @pulumi.getter(name="startTime")
+    def start_time(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "start_time")
+
+    @start_time.setter
+    def start_time(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "start_time", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def status(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "status")
+
+    @status.setter
+    def status(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "status", value)
@@ -0,0 +1,65 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['MySQLClusterSetFailoverSpecArgsDict', 'MySQLClusterSetFailoverSpecArgs']
+
+class MySQLClusterSetFailoverSpecArgsDict(TypedDict):
+    cluster_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    force: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    options: NotRequired[pulumi.Input[Optional['_inputs.MySQLClusterSetFailoverSpecOptionsArgs']]]
+
+
+@pulumi.input_type
+class MySQLClusterSetFailoverSpecArgs:
+    def __init__(__self__, *,
+                 cluster_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 force: pulumi.Input[Optional[_builtins.bool]] = None,
+                 options: pulumi.Input[Optional['_inputs.MySQLClusterSetFailoverSpecOptionsArgs']] = None):
+        if cluster_name is not None:
+            pulumi.set(__self__, "cluster_name", cluster_name)
+        if force is not None:
+            pulumi.set(__self__, "force", force)
+        if options is not None:
+            pulumi.set(__self__, "options", options)
+
+    @_builtins.property
+    @pulumi.getter(name="clusterName")
+    def cluster_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "cluster_name")
+
+    @cluster_name.setter
+    def cluster_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "cluster_name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def force(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        return pulumi.get(self, "force")
+
+    @force.setter
+    def force(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "force", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def options(self) -> pulumi.Input[Optional['_inputs.MySQLClusterSetFailoverSpecOptionsArgs']]:
+        return pulumi.get(self, "options")
+
+    @options.setter
+    def options(self, value: pulumi.Input[Optional['_inputs.MySQLClusterSetFailoverSpecOptionsArgs']]):
+        pulumi.set(self, "options", value)
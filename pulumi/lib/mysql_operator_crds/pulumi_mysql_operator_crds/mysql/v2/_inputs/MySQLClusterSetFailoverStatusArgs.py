@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['MySQLClusterSetFailoverStatusArgsDict', 'MySQLClusterSetFailoverStatusArgs']
+
+class MySQLClusterSetFailoverStatusArgsDict(TypedDict):
+    completion_time: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    elapsed_time: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    start_time: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    status: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+
+
+@pulumi.input_type
+class MySQLClusterSetFailoverStatusArgs:
+    def __init__(__self__, *,
+                 completion_time: pulumi.Input[Optional[_builtins.str]] = None,
+                 elapsed_time: pulumi.Input[Optional[_builtins.str]] = None,
+                 start_time: pulumi.Input[Optional[_builtins.str]] = None,
+                 status: pulumi.Input[Optional[_builtins.str]] = None):
+        if completion_time is not None:
+            pulumi.set(__self__, "completion_time", completion_time)
+        if elapsed_time is not None:
+            pulumi.set(__self__, "elapsed_time", elapsed_time)
+        if start_time is not None:
+            pulumi.set(__self__, "start_time", start_time)
+        if status is not None:
+            pulumi.set(__self__, "status", status)
+
+    @_builtins.property
+    @pulumi.getter(name="completionTime")
+    def completion_time(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "completion_time")
+
+    @completion_time.setter
+    def completion_time(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "completion_time", value)
+
+    @_builtins.property
+    @pulumi.getter(name="elapsedTime")
+    def elapsed_time(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "elapsed_time")
+
+    @elapsed_time.setter
+    def elapsed_time(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "elapsed_time", value)
+
+    @_builtins.property
+    @pulumi.getter(name="startTime")
+    def start_time(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "start_time")
+
+    @start_time.setter
+    def start_time(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "start_time", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def status(self) -> pulumi.Input[Optional[_builtins.str]]:
+        return pulumi.get(self, "status")
+
+    @status.setter
+    def status(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "status", value)
@@ -0,0 +1,382 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import importlib
+import typing
+
+__all__ = [
+    'InnoDBClusterSpecDatadirPermissionsPatchArgsDict',
+    'InnoDBClusterSpecDatadirPermissionsPatchArgs',
+    'InnoDBClusterSpecDatadirPermissionsArgsDict',
+    'InnoDBClusterSpecDatadirPermissionsArgs',
+    'InnoDBClusterSpecImagePullSecretsPatchArgsDict',
+    'InnoDBClusterSpecImagePullSecretsPatchArgs',
+    'InnoDBClusterSpecImagePullSecretsArgsDict',
+    'InnoDBClusterSpecImagePullSecretsArgs',
+    'InnoDBClusterSpecInstanceServicePatchArgsDict',
+    'InnoDBClusterSpecInstanceServicePatchArgs',
+    'InnoDBClusterSpecInstanceServiceArgsDict',
+    'InnoDBClusterSpecInstanceServiceArgs',
+    'InnoDBClusterSpecKeyringEncryptedFilePatchArgsDict',
+    'InnoDBClusterSpecKeyringEncryptedFilePatchArgs',
+    'InnoDBClusterSpecKeyringEncryptedFileArgsDict',
+    'InnoDBClusterSpecKeyringEncryptedFileArgs',
+    'InnoDBClusterSpecKeyringFilePatchArgsDict',
+    'InnoDBClusterSpecKeyringFilePatchArgs',
+    'InnoDBClusterSpecKeyringFileArgsDict',
+    'InnoDBClusterSpecKeyringFileArgs',
+    'InnoDBClusterSpecKeyringKmipPatchArgsDict',
+    'InnoDBClusterSpecKeyringKmipPatchArgs',
+    'InnoDBClusterSpecKeyringKmipArgsDict',
+    'InnoDBClusterSpecKeyringKmipArgs',
+    'InnoDBClusterSpecKeyringOciEndpointsPatchArgsDict',
+    'InnoDBClusterSpecKeyringOciEndpointsPatchArgs',
+    'InnoDBClusterSpecKeyringOciEndpointsArgsDict',
+    'InnoDBClusterSpecKeyringOciEndpointsArgs',
+    'InnoDBClusterSpecKeyringOciPatchArgsDict',
+    'InnoDBClusterSpecKeyringOciPatchArgs',
+    'InnoDBClusterSpecKeyringOciArgsDict',
+    'InnoDBClusterSpecKeyringOciArgs',
+    'InnoDBClusterSpecKeyringPatchArgsDict',
+    'InnoDBClusterSpecKeyringPatchArgs',
+    'InnoDBClusterSpecKeyringArgsDict',
+    'InnoDBClusterSpecKeyringArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdErrorLogPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdErrorLogPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdErrorLogArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdErrorLogArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdGeneralLogArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdGeneralLogArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdArgsDict',
+    'InnoDBClusterSpecLogsCollectorFluentdArgs',
+    'InnoDBClusterSpecLogsCollectorPatchArgsDict',
+    'InnoDBClusterSpecLogsCollectorPatchArgs',
+    'InnoDBClusterSpecLogsCollectorArgsDict',
+    'InnoDBClusterSpecLogsCollectorArgs',
+    'InnoDBClusterSpecLogsErrorPatchArgsDict',
+    'InnoDBClusterSpecLogsErrorPatchArgs',
+    'InnoDBClusterSpecLogsErrorArgsDict',
+    'InnoDBClusterSpecLogsErrorArgs',
+    'InnoDBClusterSpecLogsGeneralPatchArgsDict',
+    'InnoDBClusterSpecLogsGeneralPatchArgs',
+    'InnoDBClusterSpecLogsGeneralArgsDict',
+    'InnoDBClusterSpecLogsGeneralArgs',
+    'InnoDBClusterSpecLogsPatchArgsDict',
+    'InnoDBClusterSpecLogsPatchArgs',
+    'InnoDBClusterSpecLogsSlowQueryPatchArgsDict',
+    'InnoDBClusterSpecLogsSlowQueryPatchArgs',
+    'InnoDBClusterSpecLogsSlowQueryArgsDict',
+    'InnoDBClusterSpecLogsSlowQueryArgs',
+    'InnoDBClusterSpecLogsArgsDict',
+    'InnoDBClusterSpecLogsArgs',
+    'InnoDBClusterSpecMetricsPatchArgsDict',
+    'InnoDBClusterSpecMetricsPatchArgs',
+    'InnoDBClusterSpecMetricsArgsDict',
+    'InnoDBClusterSpecMetricsArgs',
+    'InnoDBClusterSpecPatchArgsDict',
+    'InnoDBClusterSpecPatchArgs',
+    'InnoDBClusterSpecReadReplicasPatchArgsDict',
+    'InnoDBClusterSpecReadReplicasPatchArgs',
+    'InnoDBClusterSpecReadReplicasArgsDict',
+    'InnoDBClusterSpecReadReplicasArgs',
+    'InnoDBClusterSpecRouterPatchArgsDict',
+    'InnoDBClusterSpecRouterPatchArgs',
+    'InnoDBClusterSpecRouterRoutingOptionsPatchArgsDict',
+    'InnoDBClusterSpecRouterRoutingOptionsPatchArgs',
+    'InnoDBClusterSpecRouterRoutingOptionsArgsDict',
+    'InnoDBClusterSpecRouterRoutingOptionsArgs',
+    'InnoDBClusterSpecRouterArgsDict',
+    'InnoDBClusterSpecRouterArgs',
+    'InnoDBClusterSpecServicePatchArgsDict',
+    'InnoDBClusterSpecServicePatchArgs',
+    'InnoDBClusterSpecServiceArgsDict',
+    'InnoDBClusterSpecServiceArgs',
+    'InnoDBClusterSpecArgsDict',
+    'InnoDBClusterSpecArgs',
+    'InnoDBClusterArgsDict',
+    'InnoDBClusterArgs',
+    'MySQLBackupSpecPatchArgsDict',
+    'MySQLBackupSpecPatchArgs',
+    'MySQLBackupSpecArgsDict',
+    'MySQLBackupSpecArgs',
+    'MySQLBackupStatusArgsDict',
+    'MySQLBackupStatusArgs',
+    'MySQLBackupArgsDict',
+    'MySQLBackupArgs',
+    'MySQLClusterSetFailoverSpecOptionsPatchArgsDict',
+    'MySQLClusterSetFailoverSpecOptionsPatchArgs',
+    'MySQLClusterSetFailoverSpecOptionsArgsDict',
+    'MySQLClusterSetFailoverSpecOptionsArgs',
+    'MySQLClusterSetFailoverSpecPatchArgsDict',
+    'MySQLClusterSetFailoverSpecPatchArgs',
+    'MySQLClusterSetFailoverSpecArgsDict',
+    'MySQLClusterSetFailoverSpecArgs',
+    'MySQLClusterSetFailoverStatusArgsDict',
+    'MySQLClusterSetFailoverStatusArgs',
+    'MySQLClusterSetFailoverArgsDict',
+    'MySQLClusterSetFailoverArgs',
+]
+
+_TYPE_MODULES = {
+    'InnoDBClusterSpecDatadirPermissionsPatchArgsDict': 'InnoDBClusterSpecDatadirPermissionsPatchArgs',
+    'InnoDBClusterSpecDatadirPermissionsPatchArgs': 'InnoDBClusterSpecDatadirPermissionsPatchArgs',
+    'InnoDBClusterSpecDatadirPermissionsArgsDict': 'InnoDBClusterSpecDatadirPermissionsArgs',
+    'InnoDBClusterSpecDatadirPermissionsArgs': 'InnoDBClusterSpecDatadirPermissionsArgs',
+    'InnoDBClusterSpecImagePullSecretsPatchArgsDict': 'InnoDBClusterSpecImagePullSecretsPatchArgs',
+    'InnoDBClusterSpecImagePullSecretsPatchArgs': 'InnoDBClusterSpecImagePullSecretsPatchArgs',
+    'InnoDBClusterSpecImagePullSecretsArgsDict': 'InnoDBClusterSpecImagePullSecretsArgs',
+    'InnoDBClusterSpecImagePullSecretsArgs': 'InnoDBClusterSpecImagePullSecretsArgs',
+    'InnoDBClusterSpecInstanceServicePatchArgsDict': 'InnoDBClusterSpecInstanceServicePatchArgs',
+    'InnoDBClusterSpecInstanceServicePatchArgs': 'InnoDBClusterSpecInstanceServicePatchArgs',
+    'InnoDBClusterSpecInstanceServiceArgsDict': 'InnoDBClusterSpecInstanceServiceArgs',
+    'InnoDBClusterSpecInstanceServiceArgs': 'InnoDBClusterSpecInstanceServiceArgs',
+    'InnoDBClusterSpecKeyringEncryptedFilePatchArgsDict': 'InnoDBClusterSpecKeyringEncryptedFilePatchArgs',
+    'InnoDBClusterSpecKeyringEncryptedFilePatchArgs': 'InnoDBClusterSpecKeyringEncryptedFilePatchArgs',
+    'InnoDBClusterSpecKeyringEncryptedFileArgsDict': 'InnoDBClusterSpecKeyringEncryptedFileArgs',
+    'InnoDBClusterSpecKeyringEncryptedFileArgs': 'InnoDBClusterSpecKeyringEncryptedFileArgs',
+    'InnoDBClusterSpecKeyringFilePatchArgsDict': 'InnoDBClusterSpecKeyringFilePatchArgs',
+    'InnoDBClusterSpecKeyringFilePatchArgs': 'InnoDBClusterSpecKeyringFilePatchArgs',
+    'InnoDBClusterSpecKeyringFileArgsDict': 'InnoDBClusterSpecKeyringFileArgs',
+    'InnoDBClusterSpecKeyringFileArgs': 'InnoDBClusterSpecKeyringFileArgs',
+    'InnoDBClusterSpecKeyringKmipPatchArgsDict': 'InnoDBClusterSpecKeyringKmipPatchArgs',
+    'InnoDBClusterSpecKeyringKmipPatchArgs': 'InnoDBClusterSpecKeyringKmipPatchArgs',
+    'InnoDBClusterSpecKeyringKmipArgsDict': 'InnoDBClusterSpecKeyringKmipArgs',
+    'InnoDBClusterSpecKeyringKmipArgs': 'InnoDBClusterSpecKeyringKmipArgs',
+    'InnoDBClusterSpecKeyringOciEndpointsPatchArgsDict': 'InnoDBClusterSpecKeyringOciEndpointsPatchArgs',
+    'InnoDBClusterSpecKeyringOciEndpointsPatchArgs': 'InnoDBClusterSpecKeyringOciEndpointsPatchArgs',
+    'InnoDBClusterSpecKeyringOciEndpointsArgsDict': 'InnoDBClusterSpecKeyringOciEndpointsArgs',
+    'InnoDBClusterSpecKeyringOciEndpointsArgs': 'InnoDBClusterSpecKeyringOciEndpointsArgs',
+    'InnoDBClusterSpecKeyringOciPatchArgsDict': 'InnoDBClusterSpecKeyringOciPatchArgs',
+    'InnoDBClusterSpecKeyringOciPatchArgs': 'InnoDBClusterSpecKeyringOciPatchArgs',
+    'InnoDBClusterSpecKeyringOciArgsDict': 'InnoDBClusterSpecKeyringOciArgs',
+    'InnoDBClusterSpecKeyringOciArgs': 'InnoDBClusterSpecKeyringOciArgs',
+    'InnoDBClusterSpecKeyringPatchArgsDict': 'InnoDBClusterSpecKeyringPatchArgs',
+    'InnoDBClusterSpecKeyringPatchArgs': 'InnoDBClusterSpecKeyringPatchArgs',
+    'InnoDBClusterSpecKeyringArgsDict': 'InnoDBClusterSpecKeyringArgs',
+    'InnoDBClusterSpecKeyringArgs': 'InnoDBClusterSpecKeyringArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdErrorLogPatchArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdErrorLogPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdErrorLogPatchArgs': 'InnoDBClusterSpecLogsCollectorFluentdErrorLogPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdErrorLogArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdErrorLogArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdErrorLogArgs': 'InnoDBClusterSpecLogsCollectorFluentdErrorLogArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatchArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatchArgs': 'InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdGeneralLogArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdGeneralLogArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdGeneralLogArgs': 'InnoDBClusterSpecLogsCollectorFluentdGeneralLogArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdPatchArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdPatchArgs': 'InnoDBClusterSpecLogsCollectorFluentdPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatchArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatchArgs': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsArgs': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatchArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatchArgs': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsArgs': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatchArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatchArgs': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatchArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatchArgs': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsArgs': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatchArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatchArgs': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsArgs': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatchArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatchArgs': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsArgs': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationArgs': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatchArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatchArgs': 'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatchArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogArgs': 'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdArgsDict': 'InnoDBClusterSpecLogsCollectorFluentdArgs',
+    'InnoDBClusterSpecLogsCollectorFluentdArgs': 'InnoDBClusterSpecLogsCollectorFluentdArgs',
+    'InnoDBClusterSpecLogsCollectorPatchArgsDict': 'InnoDBClusterSpecLogsCollectorPatchArgs',
+    'InnoDBClusterSpecLogsCollectorPatchArgs': 'InnoDBClusterSpecLogsCollectorPatchArgs',
+    'InnoDBClusterSpecLogsCollectorArgsDict': 'InnoDBClusterSpecLogsCollectorArgs',
+    'InnoDBClusterSpecLogsCollectorArgs': 'InnoDBClusterSpecLogsCollectorArgs',
+    'InnoDBClusterSpecLogsErrorPatchArgsDict': 'InnoDBClusterSpecLogsErrorPatchArgs',
+    'InnoDBClusterSpecLogsErrorPatchArgs': 'InnoDBClusterSpecLogsErrorPatchArgs',
+    'InnoDBClusterSpecLogsErrorArgsDict': 'InnoDBClusterSpecLogsErrorArgs',
+    'InnoDBClusterSpecLogsErrorArgs': 'InnoDBClusterSpecLogsErrorArgs',
+    'InnoDBClusterSpecLogsGeneralPatchArgsDict': 'InnoDBClusterSpecLogsGeneralPatchArgs',
+    'InnoDBClusterSpecLogsGeneralPatchArgs': 'InnoDBClusterSpecLogsGeneralPatchArgs',
+    'InnoDBClusterSpecLogsGeneralArgsDict': 'InnoDBClusterSpecLogsGeneralArgs',
+    'InnoDBClusterSpecLogsGeneralArgs': 'InnoDBClusterSpecLogsGeneralArgs',
+    'InnoDBClusterSpecLogsPatchArgsDict': 'InnoDBClusterSpecLogsPatchArgs',
+    'InnoDBClusterSpecLogsPatchArgs': 'InnoDBClusterSpecLogsPatchArgs',
+    'InnoDBClusterSpecLogsSlowQueryPatchArgsDict': 'InnoDBClusterSpecLogsSlowQueryPatchArgs',
+    'InnoDBClusterSpecLogsSlowQueryPatchArgs': 'InnoDBClusterSpecLogsSlowQueryPatchArgs',
+    'InnoDBClusterSpecLogsSlowQueryArgsDict': 'InnoDBClusterSpecLogsSlowQueryArgs',
+    'InnoDBClusterSpecLogsSlowQueryArgs': 'InnoDBClusterSpecLogsSlowQueryArgs',
+    'InnoDBClusterSpecLogsArgsDict': 'InnoDBClusterSpecLogsArgs',
+    'InnoDBClusterSpecLogsArgs': 'InnoDBClusterSpecLogsArgs',
+    'InnoDBClusterSpecMetricsPatchArgsDict': 'InnoDBClusterSpecMetricsPatchArgs',
+    'InnoDBClusterSpecMetricsPatchArgs': 'InnoDBClusterSpecMetricsPatchArgs',
+    'InnoDBClusterSpecMetricsArgsDict': 'InnoDBClusterSpecMetricsArgs',
+    'InnoDBClusterSpecMetricsArgs': 'InnoDBClusterSpecMetricsArgs',
+    'InnoDBClusterSpecPatchArgsDict': 'InnoDBClusterSpecPatchArgs',
+    'InnoDBClusterSpecPatchArgs': 'InnoDBClusterSpecPatchArgs',
+    'InnoDBClusterSpecReadReplicasPatchArgsDict': 'InnoDBClusterSpecReadReplicasPatchArgs',
+    'InnoDBClusterSpecReadReplicasPatchArgs': 'InnoDBClusterSpecReadReplicasPatchArgs',
+    'InnoDBClusterSpecReadReplicasArgsDict': 'InnoDBClusterSpecReadReplicasArgs',
+    'InnoDBClusterSpecReadReplicasArgs': 'InnoDBClusterSpecReadReplicasArgs',
+    'InnoDBClusterSpecRouterPatchArgsDict': 'InnoDBClusterSpecRouterPatchArgs',
+    'InnoDBClusterSpecRouterPatchArgs': 'InnoDBClusterSpecRouterPatchArgs',
+    'InnoDBClusterSpecRouterRoutingOptionsPatchArgsDict': 'InnoDBClusterSpecRouterRoutingOptionsPatchArgs',
+    'InnoDBClusterSpecRouterRoutingOptionsPatchArgs': 'InnoDBClusterSpecRouterRoutingOptionsPatchArgs',
+    'InnoDBClusterSpecRouterRoutingOptionsArgsDict': 'InnoDBClusterSpecRouterRoutingOptionsArgs',
+    'InnoDBClusterSpecRouterRoutingOptionsArgs': 'InnoDBClusterSpecRouterRoutingOptionsArgs',
+    'InnoDBClusterSpecRouterArgsDict': 'InnoDBClusterSpecRouterArgs',
+    'InnoDBClusterSpecRouterArgs': 'InnoDBClusterSpecRouterArgs',
+    'InnoDBClusterSpecServicePatchArgsDict': 'InnoDBClusterSpecServicePatchArgs',
+    'InnoDBClusterSpecServicePatchArgs': 'InnoDBClusterSpecServicePatchArgs',
+    'InnoDBClusterSpecServiceArgsDict': 'InnoDBClusterSpecServiceArgs',
+    'InnoDBClusterSpecServiceArgs': 'InnoDBClusterSpecServiceArgs',
+    'InnoDBClusterSpecArgsDict': 'InnoDBClusterSpecArgs',
+    'InnoDBClusterSpecArgs': 'InnoDBClusterSpecArgs',
+    'InnoDBClusterArgsDict': 'InnoDBClusterArgs',
+    'InnoDBClusterArgs': 'InnoDBClusterArgs',
+    'MySQLBackupSpecPatchArgsDict': 'MySQLBackupSpecPatchArgs',
+    'MySQLBackupSpecPatchArgs': 'MySQLBackupSpecPatchArgs',
+    'MySQLBackupSpecArgsDict': 'MySQLBackupSpecArgs',
+    'MySQLBackupSpecArgs': 'MySQLBackupSpecArgs',
+    'MySQLBackupStatusArgsDict': 'MySQLBackupStatusArgs',
+    'MySQLBackupStatusArgs': 'MySQLBackupStatusArgs',
+    'MySQLBackupArgsDict': 'MySQLBackupArgs',
+    'MySQLBackupArgs': 'MySQLBackupArgs',
+    'MySQLClusterSetFailoverSpecOptionsPatchArgsDict': 'MySQLClusterSetFailoverSpecOptionsPatchArgs',
+    'MySQLClusterSetFailoverSpecOptionsPatchArgs': 'MySQLClusterSetFailoverSpecOptionsPatchArgs',
+    'MySQLClusterSetFailoverSpecOptionsArgsDict': 'MySQLClusterSetFailoverSpecOptionsArgs',
+    'MySQLClusterSetFailoverSpecOptionsArgs': 'MySQLClusterSetFailoverSpecOptionsArgs',
+    'MySQLClusterSetFailoverSpecPatchArgsDict': 'MySQLClusterSetFailoverSpecPatchArgs',
+    'MySQLClusterSetFailoverSpecPatchArgs': 'MySQLClusterSetFailoverSpecPatchArgs',
+    'MySQLClusterSetFailoverSpecArgsDict': 'MySQLClusterSetFailoverSpecArgs',
+    'MySQLClusterSetFailoverSpecArgs': 'MySQLClusterSetFailoverSpecArgs',
+    'MySQLClusterSetFailoverStatusArgsDict': 'MySQLClusterSetFailoverStatusArgs',
+    'MySQLClusterSetFailoverStatusArgs': 'MySQLClusterSetFailoverStatusArgs',
+    'MySQLClusterSetFailoverArgsDict': 'MySQLClusterSetFailoverArgs',
+    'MySQLClusterSetFailoverArgs': 'MySQLClusterSetFailoverArgs',
+}
+
+if typing.TYPE_CHECKING:
+    from .InnoDBClusterSpecDatadirPermissionsPatchArgs import *
+    from .InnoDBClusterSpecDatadirPermissionsArgs import *
+    from .InnoDBClusterSpecImagePullSecretsPatchArgs import *
+    from .InnoDBClusterSpecImagePullSecretsArgs import *
+    from .InnoDBClusterSpecInstanceServicePatchArgs import *
+    from .InnoDBClusterSpecInstanceServiceArgs import *
+    from .InnoDBClusterSpecKeyringEncryptedFilePatchArgs import *
+    from .InnoDBClusterSpecKeyringEncryptedFileArgs import *
+    from .InnoDBClusterSpecKeyringFilePatchArgs import *
+    from .InnoDBClusterSpecKeyringFileArgs import *
+    from .InnoDBClusterSpecKeyringKmipPatchArgs import *
+    from .InnoDBClusterSpecKeyringKmipArgs import *
+    from .InnoDBClusterSpecKeyringOciEndpointsPatchArgs import *
+    from .InnoDBClusterSpecKeyringOciEndpointsArgs import *
+    from .InnoDBClusterSpecKeyringOciPatchArgs import *
+    from .InnoDBClusterSpecKeyringOciArgs import *
+    from .InnoDBClusterSpecKeyringPatchArgs import *
+    from .InnoDBClusterSpecKeyringArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdErrorLogPatchArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdErrorLogArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatchArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdGeneralLogArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdPatchArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatchArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatchArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatchArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatchArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatchArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatchArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatchArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogArgs import *
+    from .InnoDBClusterSpecLogsCollectorFluentdArgs import *
+    from .InnoDBClusterSpecLogsCollectorPatchArgs import *
+    from .InnoDBClusterSpecLogsCollectorArgs import *
+    from .InnoDBClusterSpecLogsErrorPatchArgs import *
+    from .InnoDBClusterSpecLogsErrorArgs import *
+    from .InnoDBClusterSpecLogsGeneralPatchArgs import *
+    from .InnoDBClusterSpecLogsGeneralArgs import *
+    from .InnoDBClusterSpecLogsPatchArgs import *
+    from .InnoDBClusterSpecLogsSlowQueryPatchArgs import *
+    from .InnoDBClusterSpecLogsSlowQueryArgs import *
+    from .InnoDBClusterSpecLogsArgs import *
+    from .InnoDBClusterSpecMetricsPatchArgs import *
+    from .InnoDBClusterSpecMetricsArgs import *
+    from .InnoDBClusterSpecPatchArgs import *
+    from .InnoDBClusterSpecReadReplicasPatchArgs import *
+    from .InnoDBClusterSpecReadReplicasArgs import *
+    from .InnoDBClusterSpecRouterPatchArgs import *
+    from .InnoDBClusterSpecRouterRoutingOptionsPatchArgs import *
+    from .InnoDBClusterSpecRouterRoutingOptionsArgs import *
+    from .InnoDBClusterSpecRouterArgs import *
+    from .InnoDBClusterSpecServicePatchArgs import *
+    from .InnoDBClusterSpecServiceArgs import *
+    from .InnoDBClusterSpecArgs import *
+    from .InnoDBClusterArgs import *
+    from .MySQLBackupSpecPatchArgs import *
+    from .MySQLBackupSpecArgs import *
+    from .MySQLBackupStatusArgs import *
+    from .MySQLBackupArgs import *
+    from .MySQLClusterSetFailoverSpecOptionsPatchArgs import *
+    from .MySQLClusterSetFailoverSpecOptionsArgs import *
+    from .MySQLClusterSetFailoverSpecPatchArgs import *
+    from .MySQLClusterSetFailoverSpecArgs import *
+    from .MySQLClusterSetFailoverStatusArgs import *
+    from .MySQLClusterSetFailoverArgs import *
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _TYPE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,5448 +0,0 @@
-# coding=utf-8
-# *** WARNING: this file was generated by crd2pulumi. ***
-# *** Do not edit by hand unless you're certain you know what you are doing! ***
-
-import builtins as _builtins
-import warnings
-import sys
-import pulumi
-import pulumi.runtime
-from typing import Any, Mapping, Optional, Sequence, Union, overload
-if sys.version_info >= (3, 11):
-    from typing import NotRequired, TypedDict, TypeAlias
-else:
-    from typing_extensions import NotRequired, TypedDict, TypeAlias
-from ... import _utilities
-from . import outputs
-from ... import meta as _meta
-
-__all__ = [
-    'InnoDBCluster',
-    'InnoDBClusterSpec',
-    'InnoDBClusterSpecDatadirPermissions',
-    'InnoDBClusterSpecDatadirPermissionsPatch',
-    'InnoDBClusterSpecImagePullSecrets',
-    'InnoDBClusterSpecImagePullSecretsPatch',
-    'InnoDBClusterSpecInstanceService',
-    'InnoDBClusterSpecInstanceServicePatch',
-    'InnoDBClusterSpecKeyring',
-    'InnoDBClusterSpecKeyringEncryptedFile',
-    'InnoDBClusterSpecKeyringEncryptedFilePatch',
-    'InnoDBClusterSpecKeyringFile',
-    'InnoDBClusterSpecKeyringFilePatch',
-    'InnoDBClusterSpecKeyringKmip',
-    'InnoDBClusterSpecKeyringKmipPatch',
-    'InnoDBClusterSpecKeyringOci',
-    'InnoDBClusterSpecKeyringOciEndpoints',
-    'InnoDBClusterSpecKeyringOciEndpointsPatch',
-    'InnoDBClusterSpecKeyringOciPatch',
-    'InnoDBClusterSpecKeyringPatch',
-    'InnoDBClusterSpecLogs',
-    'InnoDBClusterSpecLogsCollector',
-    'InnoDBClusterSpecLogsCollectorFluentd',
-    'InnoDBClusterSpecLogsCollectorFluentdErrorLog',
-    'InnoDBClusterSpecLogsCollectorFluentdErrorLogPatch',
-    'InnoDBClusterSpecLogsCollectorFluentdGeneralLog',
-    'InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatch',
-    'InnoDBClusterSpecLogsCollectorFluentdPatch',
-    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentation',
-    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotations',
-    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatch',
-    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabels',
-    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatch',
-    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatch',
-    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFields',
-    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatch',
-    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFields',
-    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatch',
-    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFields',
-    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatch',
-    'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLog',
-    'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatch',
-    'InnoDBClusterSpecLogsCollectorPatch',
-    'InnoDBClusterSpecLogsError',
-    'InnoDBClusterSpecLogsErrorPatch',
-    'InnoDBClusterSpecLogsGeneral',
-    'InnoDBClusterSpecLogsGeneralPatch',
-    'InnoDBClusterSpecLogsPatch',
-    'InnoDBClusterSpecLogsSlowQuery',
-    'InnoDBClusterSpecLogsSlowQueryPatch',
-    'InnoDBClusterSpecMetrics',
-    'InnoDBClusterSpecMetricsPatch',
-    'InnoDBClusterSpecPatch',
-    'InnoDBClusterSpecReadReplicas',
-    'InnoDBClusterSpecReadReplicasPatch',
-    'InnoDBClusterSpecRouter',
-    'InnoDBClusterSpecRouterPatch',
-    'InnoDBClusterSpecRouterRoutingOptions',
-    'InnoDBClusterSpecRouterRoutingOptionsPatch',
-    'InnoDBClusterSpecService',
-    'InnoDBClusterSpecServicePatch',
-    'MySQLBackup',
-    'MySQLBackupSpec',
-    'MySQLBackupSpecPatch',
-    'MySQLBackupStatus',
-    'MySQLBackupStatusPatch',
-    'MySQLClusterSetFailover',
-    'MySQLClusterSetFailoverSpec',
-    'MySQLClusterSetFailoverSpecOptions',
-    'MySQLClusterSetFailoverSpecOptionsPatch',
-    'MySQLClusterSetFailoverSpecPatch',
-    'MySQLClusterSetFailoverStatus',
-    'MySQLClusterSetFailoverStatusPatch',
-]
-
-@pulumi.output_type
-class InnoDBCluster(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "apiVersion":
-            suggest = "api_version"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBCluster. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBCluster.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBCluster.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 api_version: Optional[_builtins.str] = None,
-                 kind: Optional[_builtins.str] = None,
-                 metadata: Optional['_meta.v1.outputs.ObjectMeta'] = None,
-                 spec: Optional['outputs.InnoDBClusterSpec'] = None,
-                 status: Optional[Mapping[str, Any]] = None):
-        """
-        :param _builtins.str api_version: APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        :param _builtins.str kind: Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        :param '_meta.v1.ObjectMetaArgs' metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        if api_version is not None:
-            pulumi.set(__self__, "api_version", 'mysql.oracle.com/v2')
-        if kind is not None:
-            pulumi.set(__self__, "kind", 'InnoDBCluster')
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter(name="apiVersion")
-    def api_version(self) -> Optional[_builtins.str]:
-        """
-        APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        """
-        return pulumi.get(self, "api_version")
-
-    @_builtins.property
-    @pulumi.getter
-    def kind(self) -> Optional[_builtins.str]:
-        """
-        Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        return pulumi.get(self, "kind")
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> Optional['_meta.v1.outputs.ObjectMeta']:
-        """
-        Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        return pulumi.get(self, "metadata")
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> Optional['outputs.InnoDBClusterSpec']:
-        return pulumi.get(self, "spec")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional[Mapping[str, Any]]:
-        return pulumi.get(self, "status")
-
-
-@pulumi.output_type
-class InnoDBClusterSpec(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "backupProfiles":
-            suggest = "backup_profiles"
-        elif key == "backupSchedules":
-            suggest = "backup_schedules"
-        elif key == "baseServerId":
-            suggest = "base_server_id"
-        elif key == "datadirPermissions":
-            suggest = "datadir_permissions"
-        elif key == "datadirVolumeClaimTemplate":
-            suggest = "datadir_volume_claim_template"
-        elif key == "imagePullPolicy":
-            suggest = "image_pull_policy"
-        elif key == "imagePullSecrets":
-            suggest = "image_pull_secrets"
-        elif key == "imageRepository":
-            suggest = "image_repository"
-        elif key == "initDB":
-            suggest = "init_db"
-        elif key == "instanceService":
-            suggest = "instance_service"
-        elif key == "podAnnotations":
-            suggest = "pod_annotations"
-        elif key == "podLabels":
-            suggest = "pod_labels"
-        elif key == "podSpec":
-            suggest = "pod_spec"
-        elif key == "readReplicas":
-            suggest = "read_replicas"
-        elif key == "secretName":
-            suggest = "secret_name"
-        elif key == "serviceAccountName":
-            suggest = "service_account_name"
-        elif key == "serviceFqdnTemplate":
-            suggest = "service_fqdn_template"
-        elif key == "tlsCASecretName":
-            suggest = "tls_ca_secret_name"
-        elif key == "tlsSecretName":
-            suggest = "tls_secret_name"
-        elif key == "tlsUseSelfSigned":
-            suggest = "tls_use_self_signed"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpec. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpec.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpec.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 backup_profiles: Optional[Sequence[Mapping[str, Any]]] = None,
-                 backup_schedules: Optional[Sequence[Mapping[str, Any]]] = None,
-                 base_server_id: Optional[_builtins.int] = None,
-                 datadir_permissions: Optional['outputs.InnoDBClusterSpecDatadirPermissions'] = None,
-                 datadir_volume_claim_template: Optional[Mapping[str, Any]] = None,
-                 edition: Optional[_builtins.str] = None,
-                 image_pull_policy: Optional[_builtins.str] = None,
-                 image_pull_secrets: Optional[Sequence['outputs.InnoDBClusterSpecImagePullSecrets']] = None,
-                 image_repository: Optional[_builtins.str] = None,
-                 init_db: Optional[Mapping[str, Any]] = None,
-                 instance_service: Optional['outputs.InnoDBClusterSpecInstanceService'] = None,
-                 instances: Optional[_builtins.int] = None,
-                 keyring: Optional['outputs.InnoDBClusterSpecKeyring'] = None,
-                 logs: Optional['outputs.InnoDBClusterSpecLogs'] = None,
-                 metrics: Optional['outputs.InnoDBClusterSpecMetrics'] = None,
-                 mycnf: Optional[_builtins.str] = None,
-                 pod_annotations: Optional[Mapping[str, Any]] = None,
-                 pod_labels: Optional[Mapping[str, Any]] = None,
-                 pod_spec: Optional[Mapping[str, Any]] = None,
-                 read_replicas: Optional[Sequence['outputs.InnoDBClusterSpecReadReplicas']] = None,
-                 router: Optional['outputs.InnoDBClusterSpecRouter'] = None,
-                 secret_name: Optional[_builtins.str] = None,
-                 service: Optional['outputs.InnoDBClusterSpecService'] = None,
-                 service_account_name: Optional[_builtins.str] = None,
-                 service_fqdn_template: Optional[_builtins.str] = None,
-                 tls_ca_secret_name: Optional[_builtins.str] = None,
-                 tls_secret_name: Optional[_builtins.str] = None,
-                 tls_use_self_signed: Optional[_builtins.bool] = None,
-                 version: Optional[_builtins.str] = None):
-        """
-        :param Sequence[Mapping[str, Any]] backup_profiles: Backup profile specifications for the cluster, which can be referenced from backup schedules and one-off backup jobs
-        :param Sequence[Mapping[str, Any]] backup_schedules: Schedules for periodically executed backups
-        :param _builtins.int base_server_id: Base value for MySQL server_id for instances in the cluster
-        :param Mapping[str, Any] datadir_volume_claim_template: Template for a PersistentVolumeClaim, to be used as datadir
-        :param _builtins.str edition: MySQL Server Edition (community or enterprise)
-        :param _builtins.str image_pull_policy: Defaults to Always, but set to IfNotPresent in deploy-operator.yaml when deploying Operator
-        :param _builtins.str image_repository: Repository where images are pulled from; defaults to container-registry.oracle.com/mysql
-        :param _builtins.int instances: Number of MySQL replica instances for the cluster
-        :param _builtins.str mycnf: Custom configuration additions for my.cnf
-        :param Mapping[str, Any] pod_spec: Customization specification to be merged into the InnoDBCluster StatefulSet pod template. IMPORTANT: podSpec is regarded only during StatefulSet buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the InnoDBCluster StatefulSet will not be updated
-        :param _builtins.str secret_name: Name of a generic type Secret containing root/default account password
-        :param _builtins.str service_fqdn_template: Template for a FQDN resolving to the cluster's headless instance Service and individual Pods
-        :param _builtins.str tls_ca_secret_name: Name of a generic type Secret containing CA (ca.pem) and optional CRL (crl.pem) for SSL
-        :param _builtins.str tls_secret_name: Name of a TLS type Secret containing Server certificate and private key for SSL
-        :param _builtins.bool tls_use_self_signed: Enables use of self-signed TLS certificates, reducing or disabling TLS based security verifications
-        :param _builtins.str version: MySQL Server version
-        """
-        if backup_profiles is not None:
-            pulumi.set(__self__, "backup_profiles", backup_profiles)
-        if backup_schedules is not None:
-            pulumi.set(__self__, "backup_schedules", backup_schedules)
-        if base_server_id is not None:
-            pulumi.set(__self__, "base_server_id", base_server_id)
-        if datadir_permissions is not None:
-            pulumi.set(__self__, "datadir_permissions", datadir_permissions)
-        if datadir_volume_claim_template is not None:
-            pulumi.set(__self__, "datadir_volume_claim_template", datadir_volume_claim_template)
-        if edition is not None:
-            pulumi.set(__self__, "edition", edition)
-        if image_pull_policy is not None:
-            pulumi.set(__self__, "image_pull_policy", image_pull_policy)
-        if image_pull_secrets is not None:
-            pulumi.set(__self__, "image_pull_secrets", image_pull_secrets)
-        if image_repository is not None:
-            pulumi.set(__self__, "image_repository", image_repository)
-        if init_db is not None:
-            pulumi.set(__self__, "init_db", init_db)
-        if instance_service is not None:
-            pulumi.set(__self__, "instance_service", instance_service)
-        if instances is not None:
-            pulumi.set(__self__, "instances", instances)
-        if keyring is not None:
-            pulumi.set(__self__, "keyring", keyring)
-        if logs is not None:
-            pulumi.set(__self__, "logs", logs)
-        if metrics is not None:
-            pulumi.set(__self__, "metrics", metrics)
-        if mycnf is not None:
-            pulumi.set(__self__, "mycnf", mycnf)
-        if pod_annotations is not None:
-            pulumi.set(__self__, "pod_annotations", pod_annotations)
-        if pod_labels is not None:
-            pulumi.set(__self__, "pod_labels", pod_labels)
-        if pod_spec is not None:
-            pulumi.set(__self__, "pod_spec", pod_spec)
-        if read_replicas is not None:
-            pulumi.set(__self__, "read_replicas", read_replicas)
-        if router is not None:
-            pulumi.set(__self__, "router", router)
-        if secret_name is not None:
-            pulumi.set(__self__, "secret_name", secret_name)
-        if service is not None:
-            pulumi.set(__self__, "service", service)
-        if service_account_name is not None:
-            pulumi.set(__self__, "service_account_name", service_account_name)
-        if service_fqdn_template is not None:
-            pulumi.set(__self__, "service_fqdn_template", service_fqdn_template)
-        if tls_ca_secret_name is not None:
-            pulumi.set(__self__, "tls_ca_secret_name", tls_ca_secret_name)
-        if tls_secret_name is not None:
-            pulumi.set(__self__, "tls_secret_name", tls_secret_name)
-        if tls_use_self_signed is not None:
-            pulumi.set(__self__, "tls_use_self_signed", tls_use_self_signed)
-        if version is not None:
-            pulumi.set(__self__, "version", version)
-
-    @_builtins.property
-    @pulumi.getter(name="backupProfiles")
-    def backup_profiles(self) -> Optional[Sequence[Mapping[str, Any]]]:
-        """
-        Backup profile specifications for the cluster, which can be referenced from backup schedules and one-off backup jobs
-        """
-        return pulumi.get(self, "backup_profiles")
-
-    @_builtins.property
-    @pulumi.getter(name="backupSchedules")
-    def backup_schedules(self) -> Optional[Sequence[Mapping[str, Any]]]:
-        """
-        Schedules for periodically executed backups
-        """
-        return pulumi.get(self, "backup_schedules")
-
-    @_builtins.property
-    @pulumi.getter(name="baseServerId")
-    def base_server_id(self) -> Optional[_builtins.int]:
-        """
-        Base value for MySQL server_id for instances in the cluster
-        """
-        return pulumi.get(self, "base_server_id")
-
-    @_builtins.property
-    @pulumi.getter(name="datadirPermissions")
-    def datadir_permissions(self) -> Optional['outputs.InnoDBClusterSpecDatadirPermissions']:
-        return pulumi.get(self, "datadir_permissions")
-
-    @_builtins.property
-    @pulumi.getter(name="datadirVolumeClaimTemplate")
-    def datadir_volume_claim_template(self) -> Optional[Mapping[str, Any]]:
-        """
-        Template for a PersistentVolumeClaim, to be used as datadir
-        """
-        return pulumi.get(self, "datadir_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter
-    def edition(self) -> Optional[_builtins.str]:
-        """
-        MySQL Server Edition (community or enterprise)
-        """
-        return pulumi.get(self, "edition")
-
-    @_builtins.property
-    @pulumi.getter(name="imagePullPolicy")
-    def image_pull_policy(self) -> Optional[_builtins.str]:
-        """
-        Defaults to Always, but set to IfNotPresent in deploy-operator.yaml when deploying Operator
-        """
-        return pulumi.get(self, "image_pull_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="imagePullSecrets")
-    def image_pull_secrets(self) -> Optional[Sequence['outputs.InnoDBClusterSpecImagePullSecrets']]:
-        return pulumi.get(self, "image_pull_secrets")
-
-    @_builtins.property
-    @pulumi.getter(name="imageRepository")
-    def image_repository(self) -> Optional[_builtins.str]:
-        """
-        Repository where images are pulled from; defaults to container-registry.oracle.com/mysql
-        """
-        return pulumi.get(self, "image_repository")
-
-    @_builtins.property
-    @pulumi.getter(name="initDB")
-    def init_db(self) -> Optional[Mapping[str, Any]]:
-        return pulumi.get(self, "init_db")
-
-    @_builtins.property
-    @pulumi.getter(name="instanceService")
-    def instance_service(self) -> Optional['outputs.InnoDBClusterSpecInstanceService']:
-        return pulumi.get(self, "instance_service")
-
-    @_builtins.property
-    @pulumi.getter
-    def instances(self) -> Optional[_builtins.int]:
-        """
-        Number of MySQL replica instances for the cluster
-        """
-        return pulumi.get(self, "instances")
-
-    @_builtins.property
-    @pulumi.getter
-    def keyring(self) -> Optional['outputs.InnoDBClusterSpecKeyring']:
-        return pulumi.get(self, "keyring")
-
-    @_builtins.property
-    @pulumi.getter
-    def logs(self) -> Optional['outputs.InnoDBClusterSpecLogs']:
-        return pulumi.get(self, "logs")
-
-    @_builtins.property
-    @pulumi.getter
-    def metrics(self) -> Optional['outputs.InnoDBClusterSpecMetrics']:
-        return pulumi.get(self, "metrics")
-
-    @_builtins.property
-    @pulumi.getter
-    def mycnf(self) -> Optional[_builtins.str]:
-        """
-        Custom configuration additions for my.cnf
-        """
-        return pulumi.get(self, "mycnf")
-
-    @_builtins.property
-    @pulumi.getter(name="podAnnotations")
-    def pod_annotations(self) -> Optional[Mapping[str, Any]]:
-        return pulumi.get(self, "pod_annotations")
-
-    @_builtins.property
-    @pulumi.getter(name="podLabels")
-    def pod_labels(self) -> Optional[Mapping[str, Any]]:
-        return pulumi.get(self, "pod_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="podSpec")
-    def pod_spec(self) -> Optional[Mapping[str, Any]]:
-        """
-        Customization specification to be merged into the InnoDBCluster StatefulSet pod template. IMPORTANT: podSpec is regarded only during StatefulSet buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the InnoDBCluster StatefulSet will not be updated
-        """
-        return pulumi.get(self, "pod_spec")
-
-    @_builtins.property
-    @pulumi.getter(name="readReplicas")
-    def read_replicas(self) -> Optional[Sequence['outputs.InnoDBClusterSpecReadReplicas']]:
-        return pulumi.get(self, "read_replicas")
-
-    @_builtins.property
-    @pulumi.getter
-    def router(self) -> Optional['outputs.InnoDBClusterSpecRouter']:
-        return pulumi.get(self, "router")
-
-    @_builtins.property
-    @pulumi.getter(name="secretName")
-    def secret_name(self) -> Optional[_builtins.str]:
-        """
-        Name of a generic type Secret containing root/default account password
-        """
-        return pulumi.get(self, "secret_name")
-
-    @_builtins.property
-    @pulumi.getter
-    def service(self) -> Optional['outputs.InnoDBClusterSpecService']:
-        return pulumi.get(self, "service")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceAccountName")
-    def service_account_name(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "service_account_name")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceFqdnTemplate")
-    def service_fqdn_template(self) -> Optional[_builtins.str]:
-        """
-        Template for a FQDN resolving to the cluster's headless instance Service and individual Pods
-        """
-        return pulumi.get(self, "service_fqdn_template")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsCASecretName")
-    def tls_ca_secret_name(self) -> Optional[_builtins.str]:
-        """
-        Name of a generic type Secret containing CA (ca.pem) and optional CRL (crl.pem) for SSL
-        """
-        return pulumi.get(self, "tls_ca_secret_name")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsSecretName")
-    def tls_secret_name(self) -> Optional[_builtins.str]:
-        """
-        Name of a TLS type Secret containing Server certificate and private key for SSL
-        """
-        return pulumi.get(self, "tls_secret_name")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsUseSelfSigned")
-    def tls_use_self_signed(self) -> Optional[_builtins.bool]:
-        """
-        Enables use of self-signed TLS certificates, reducing or disabling TLS based security verifications
-        """
-        return pulumi.get(self, "tls_use_self_signed")
-
-    @_builtins.property
-    @pulumi.getter
-    def version(self) -> Optional[_builtins.str]:
-        """
-        MySQL Server version
-        """
-        return pulumi.get(self, "version")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecDatadirPermissions(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "fsGroupChangePolicy":
-            suggest = "fs_group_change_policy"
-        elif key == "setRightsUsingInitContainer":
-            suggest = "set_rights_using_init_container"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecDatadirPermissions. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecDatadirPermissions.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecDatadirPermissions.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 fs_group_change_policy: Optional[_builtins.str] = None,
-                 set_rights_using_init_container: Optional[_builtins.bool] = None):
-        """
-        :param _builtins.str fs_group_change_policy: Optional fsGroupChangePolicy value to be set in the pod security context. Some possible values are OnRootMismatch and Always. For more information check the official Kubernetes documentation
-        :param _builtins.bool set_rights_using_init_container: Whether to use an init container to set at start the DataDir permissions
-        """
-        if fs_group_change_policy is not None:
-            pulumi.set(__self__, "fs_group_change_policy", fs_group_change_policy)
-        if set_rights_using_init_container is not None:
-            pulumi.set(__self__, "set_rights_using_init_container", set_rights_using_init_container)
-
-    @_builtins.property
-    @pulumi.getter(name="fsGroupChangePolicy")
-    def fs_group_change_policy(self) -> Optional[_builtins.str]:
-        """
-        Optional fsGroupChangePolicy value to be set in the pod security context. Some possible values are OnRootMismatch and Always. For more information check the official Kubernetes documentation
-        """
-        return pulumi.get(self, "fs_group_change_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="setRightsUsingInitContainer")
-    def set_rights_using_init_container(self) -> Optional[_builtins.bool]:
-        """
-        Whether to use an init container to set at start the DataDir permissions
-        """
-        return pulumi.get(self, "set_rights_using_init_container")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecDatadirPermissionsPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "fsGroupChangePolicy":
-            suggest = "fs_group_change_policy"
-        elif key == "setRightsUsingInitContainer":
-            suggest = "set_rights_using_init_container"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecDatadirPermissionsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecDatadirPermissionsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecDatadirPermissionsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 fs_group_change_policy: Optional[_builtins.str] = None,
-                 set_rights_using_init_container: Optional[_builtins.bool] = None):
-        """
-        :param _builtins.str fs_group_change_policy: Optional fsGroupChangePolicy value to be set in the pod security context. Some possible values are OnRootMismatch and Always. For more information check the official Kubernetes documentation
-        :param _builtins.bool set_rights_using_init_container: Whether to use an init container to set at start the DataDir permissions
-        """
-        if fs_group_change_policy is not None:
-            pulumi.set(__self__, "fs_group_change_policy", fs_group_change_policy)
-        if set_rights_using_init_container is not None:
-            pulumi.set(__self__, "set_rights_using_init_container", set_rights_using_init_container)
-
-    @_builtins.property
-    @pulumi.getter(name="fsGroupChangePolicy")
-    def fs_group_change_policy(self) -> Optional[_builtins.str]:
-        """
-        Optional fsGroupChangePolicy value to be set in the pod security context. Some possible values are OnRootMismatch and Always. For more information check the official Kubernetes documentation
-        """
-        return pulumi.get(self, "fs_group_change_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="setRightsUsingInitContainer")
-    def set_rights_using_init_container(self) -> Optional[_builtins.bool]:
-        """
-        Whether to use an init container to set at start the DataDir permissions
-        """
-        return pulumi.get(self, "set_rights_using_init_container")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecImagePullSecrets(dict):
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None):
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "name")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecImagePullSecretsPatch(dict):
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None):
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "name")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecInstanceService(dict):
-    """
-    Configuration of the Service used by the InnoDB Cluster GR members internally
-    """
-    def __init__(__self__, *,
-                 annotations: Optional[Mapping[str, Any]] = None,
-                 labels: Optional[Mapping[str, Any]] = None):
-        """
-        Configuration of the Service used by the InnoDB Cluster GR members internally
-
-        :param Mapping[str, Any] annotations: Custom annotations for the Service
-        :param Mapping[str, Any] labels: Custom labels for the Service
-        """
-        if annotations is not None:
-            pulumi.set(__self__, "annotations", annotations)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-
-    @_builtins.property
-    @pulumi.getter
-    def annotations(self) -> Optional[Mapping[str, Any]]:
-        """
-        Custom annotations for the Service
-        """
-        return pulumi.get(self, "annotations")
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> Optional[Mapping[str, Any]]:
-        """
-        Custom labels for the Service
-        """
-        return pulumi.get(self, "labels")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecInstanceServicePatch(dict):
-    """
-    Configuration of the Service used by the InnoDB Cluster GR members internally
-    """
-    def __init__(__self__, *,
-                 annotations: Optional[Mapping[str, Any]] = None,
-                 labels: Optional[Mapping[str, Any]] = None):
-        """
-        Configuration of the Service used by the InnoDB Cluster GR members internally
-
-        :param Mapping[str, Any] annotations: Custom annotations for the Service
-        :param Mapping[str, Any] labels: Custom labels for the Service
-        """
-        if annotations is not None:
-            pulumi.set(__self__, "annotations", annotations)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-
-    @_builtins.property
-    @pulumi.getter
-    def annotations(self) -> Optional[Mapping[str, Any]]:
-        """
-        Custom annotations for the Service
-        """
-        return pulumi.get(self, "annotations")
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> Optional[Mapping[str, Any]]:
-        """
-        Custom labels for the Service
-        """
-        return pulumi.get(self, "labels")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecKeyring(dict):
-    """
-    Keyring specification
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "encryptedFile":
-            suggest = "encrypted_file"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecKeyring. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecKeyring.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecKeyring.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 encrypted_file: Optional['outputs.InnoDBClusterSpecKeyringEncryptedFile'] = None,
-                 file: Optional['outputs.InnoDBClusterSpecKeyringFile'] = None,
-                 kmip: Optional['outputs.InnoDBClusterSpecKeyringKmip'] = None,
-                 oci: Optional['outputs.InnoDBClusterSpecKeyringOci'] = None):
-        """
-        Keyring specification
-        """
-        if encrypted_file is not None:
-            pulumi.set(__self__, "encrypted_file", encrypted_file)
-        if file is not None:
-            pulumi.set(__self__, "file", file)
-        if kmip is not None:
-            pulumi.set(__self__, "kmip", kmip)
-        if oci is not None:
-            pulumi.set(__self__, "oci", oci)
-
-    @_builtins.property
-    @pulumi.getter(name="encryptedFile")
-    def encrypted_file(self) -> Optional['outputs.InnoDBClusterSpecKeyringEncryptedFile']:
-        return pulumi.get(self, "encrypted_file")
-
-    @_builtins.property
-    @pulumi.getter
-    def file(self) -> Optional['outputs.InnoDBClusterSpecKeyringFile']:
-        return pulumi.get(self, "file")
-
-    @_builtins.property
-    @pulumi.getter
-    def kmip(self) -> Optional['outputs.InnoDBClusterSpecKeyringKmip']:
-        return pulumi.get(self, "kmip")
-
-    @_builtins.property
-    @pulumi.getter
-    def oci(self) -> Optional['outputs.InnoDBClusterSpecKeyringOci']:
-        return pulumi.get(self, "oci")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecKeyringEncryptedFile(dict):
-    """
-    Keyring 'Encrypted File' specification
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "fileName":
-            suggest = "file_name"
-        elif key == "readOnly":
-            suggest = "read_only"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecKeyringEncryptedFile. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecKeyringEncryptedFile.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecKeyringEncryptedFile.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 file_name: Optional[_builtins.str] = None,
-                 password: Optional[_builtins.str] = None,
-                 read_only: Optional[_builtins.bool] = None,
-                 storage: Optional[Mapping[str, Any]] = None):
-        """
-        Keyring 'Encrypted File' specification
-
-        :param _builtins.str file_name: Path to the keyring file name inside the storage volume (will be prefixed by mount path)
-        :param _builtins.str password: Name of a secret that contains password for the keyring in the key 'keyring_password'
-        :param _builtins.bool read_only: Whether to open the keyring file in read-only mode
-        :param Mapping[str, Any] storage: Specification of the volume to be mounted where the keyring file resides
-        """
-        if file_name is not None:
-            pulumi.set(__self__, "file_name", file_name)
-        if password is not None:
-            pulumi.set(__self__, "password", password)
-        if read_only is not None:
-            pulumi.set(__self__, "read_only", read_only)
-        if storage is not None:
-            pulumi.set(__self__, "storage", storage)
-
-    @_builtins.property
-    @pulumi.getter(name="fileName")
-    def file_name(self) -> Optional[_builtins.str]:
-        """
-        Path to the keyring file name inside the storage volume (will be prefixed by mount path)
-        """
-        return pulumi.get(self, "file_name")
-
-    @_builtins.property
-    @pulumi.getter
-    def password(self) -> Optional[_builtins.str]:
-        """
-        Name of a secret that contains password for the keyring in the key 'keyring_password'
-        """
-        return pulumi.get(self, "password")
-
-    @_builtins.property
-    @pulumi.getter(name="readOnly")
-    def read_only(self) -> Optional[_builtins.bool]:
-        """
-        Whether to open the keyring file in read-only mode
-        """
-        return pulumi.get(self, "read_only")
-
-    @_builtins.property
-    @pulumi.getter
-    def storage(self) -> Optional[Mapping[str, Any]]:
-        """
-        Specification of the volume to be mounted where the keyring file resides
-        """
-        return pulumi.get(self, "storage")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecKeyringEncryptedFilePatch(dict):
-    """
-    Keyring 'Encrypted File' specification
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "fileName":
-            suggest = "file_name"
-        elif key == "readOnly":
-            suggest = "read_only"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecKeyringEncryptedFilePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecKeyringEncryptedFilePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecKeyringEncryptedFilePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 file_name: Optional[_builtins.str] = None,
-                 password: Optional[_builtins.str] = None,
-                 read_only: Optional[_builtins.bool] = None,
-                 storage: Optional[Mapping[str, Any]] = None):
-        """
-        Keyring 'Encrypted File' specification
-
-        :param _builtins.str file_name: Path to the keyring file name inside the storage volume (will be prefixed by mount path)
-        :param _builtins.str password: Name of a secret that contains password for the keyring in the key 'keyring_password'
-        :param _builtins.bool read_only: Whether to open the keyring file in read-only mode
-        :param Mapping[str, Any] storage: Specification of the volume to be mounted where the keyring file resides
-        """
-        if file_name is not None:
-            pulumi.set(__self__, "file_name", file_name)
-        if password is not None:
-            pulumi.set(__self__, "password", password)
-        if read_only is not None:
-            pulumi.set(__self__, "read_only", read_only)
-        if storage is not None:
-            pulumi.set(__self__, "storage", storage)
-
-    @_builtins.property
-    @pulumi.getter(name="fileName")
-    def file_name(self) -> Optional[_builtins.str]:
-        """
-        Path to the keyring file name inside the storage volume (will be prefixed by mount path)
-        """
-        return pulumi.get(self, "file_name")
-
-    @_builtins.property
-    @pulumi.getter
-    def password(self) -> Optional[_builtins.str]:
-        """
-        Name of a secret that contains password for the keyring in the key 'keyring_password'
-        """
-        return pulumi.get(self, "password")
-
-    @_builtins.property
-    @pulumi.getter(name="readOnly")
-    def read_only(self) -> Optional[_builtins.bool]:
-        """
-        Whether to open the keyring file in read-only mode
-        """
-        return pulumi.get(self, "read_only")
-
-    @_builtins.property
-    @pulumi.getter
-    def storage(self) -> Optional[Mapping[str, Any]]:
-        """
-        Specification of the volume to be mounted where the keyring file resides
-        """
-        return pulumi.get(self, "storage")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecKeyringFile(dict):
-    """
-    Keyring 'File' specification
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "fileName":
-            suggest = "file_name"
-        elif key == "readOnly":
-            suggest = "read_only"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecKeyringFile. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecKeyringFile.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecKeyringFile.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 file_name: Optional[_builtins.str] = None,
-                 read_only: Optional[_builtins.bool] = None,
-                 storage: Optional[Mapping[str, Any]] = None):
-        """
-        Keyring 'File' specification
-
-        :param _builtins.str file_name: Path to the keyring file name inside the storage volume (will be prefixed by mount path)
-        :param _builtins.bool read_only: Whether to open the keyring file in read-only mode
-        :param Mapping[str, Any] storage: Specification of the volume to be mounted where the keyring file resides
-        """
-        if file_name is not None:
-            pulumi.set(__self__, "file_name", file_name)
-        if read_only is not None:
-            pulumi.set(__self__, "read_only", read_only)
-        if storage is not None:
-            pulumi.set(__self__, "storage", storage)
-
-    @_builtins.property
-    @pulumi.getter(name="fileName")
-    def file_name(self) -> Optional[_builtins.str]:
-        """
-        Path to the keyring file name inside the storage volume (will be prefixed by mount path)
-        """
-        return pulumi.get(self, "file_name")
-
-    @_builtins.property
-    @pulumi.getter(name="readOnly")
-    def read_only(self) -> Optional[_builtins.bool]:
-        """
-        Whether to open the keyring file in read-only mode
-        """
-        return pulumi.get(self, "read_only")
-
-    @_builtins.property
-    @pulumi.getter
-    def storage(self) -> Optional[Mapping[str, Any]]:
-        """
-        Specification of the volume to be mounted where the keyring file resides
-        """
-        return pulumi.get(self, "storage")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecKeyringFilePatch(dict):
-    """
-    Keyring 'File' specification
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "fileName":
-            suggest = "file_name"
-        elif key == "readOnly":
-            suggest = "read_only"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecKeyringFilePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecKeyringFilePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecKeyringFilePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 file_name: Optional[_builtins.str] = None,
-                 read_only: Optional[_builtins.bool] = None,
-                 storage: Optional[Mapping[str, Any]] = None):
-        """
-        Keyring 'File' specification
-
-        :param _builtins.str file_name: Path to the keyring file name inside the storage volume (will be prefixed by mount path)
-        :param _builtins.bool read_only: Whether to open the keyring file in read-only mode
-        :param Mapping[str, Any] storage: Specification of the volume to be mounted where the keyring file resides
-        """
-        if file_name is not None:
-            pulumi.set(__self__, "file_name", file_name)
-        if read_only is not None:
-            pulumi.set(__self__, "read_only", read_only)
-        if storage is not None:
-            pulumi.set(__self__, "storage", storage)
-
-    @_builtins.property
-    @pulumi.getter(name="fileName")
-    def file_name(self) -> Optional[_builtins.str]:
-        """
-        Path to the keyring file name inside the storage volume (will be prefixed by mount path)
-        """
-        return pulumi.get(self, "file_name")
-
-    @_builtins.property
-    @pulumi.getter(name="readOnly")
-    def read_only(self) -> Optional[_builtins.bool]:
-        """
-        Whether to open the keyring file in read-only mode
-        """
-        return pulumi.get(self, "read_only")
-
-    @_builtins.property
-    @pulumi.getter
-    def storage(self) -> Optional[Mapping[str, Any]]:
-        """
-        Specification of the volume to be mounted where the keyring file resides
-        """
-        return pulumi.get(self, "storage")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecKeyringKmip(dict):
-    """
-    Keyring 'KMIP' specification
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "cacheKeys":
-            suggest = "cache_keys"
-        elif key == "standbyServer":
-            suggest = "standby_server"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecKeyringKmip. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecKeyringKmip.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecKeyringKmip.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cache_keys: Optional[_builtins.bool] = None,
-                 configuration: Optional[_builtins.str] = None,
-                 server: Optional[_builtins.str] = None,
-                 standby_server: Optional[Sequence[_builtins.str]] = None):
-        """
-        Keyring 'KMIP' specification
-
-        :param _builtins.bool cache_keys: Whether the keys are cached by the MySQL Server in RAM in plaintext. If set to false the keys are decrypted on every access
-        :param _builtins.str configuration: Name of a secret that contains TLS certificates
-        :param _builtins.str server: Primary OKV Server host with port number in the format <host>:<port>
-        :param Sequence[_builtins.str] standby_server: A list of standby servers in the format <host>:<port>
-        """
-        if cache_keys is not None:
-            pulumi.set(__self__, "cache_keys", cache_keys)
-        if configuration is not None:
-            pulumi.set(__self__, "configuration", configuration)
-        if server is not None:
-            pulumi.set(__self__, "server", server)
-        if standby_server is not None:
-            pulumi.set(__self__, "standby_server", standby_server)
-
-    @_builtins.property
-    @pulumi.getter(name="cacheKeys")
-    def cache_keys(self) -> Optional[_builtins.bool]:
-        """
-        Whether the keys are cached by the MySQL Server in RAM in plaintext. If set to false the keys are decrypted on every access
-        """
-        return pulumi.get(self, "cache_keys")
-
-    @_builtins.property
-    @pulumi.getter
-    def configuration(self) -> Optional[_builtins.str]:
-        """
-        Name of a secret that contains TLS certificates
-        """
-        return pulumi.get(self, "configuration")
-
-    @_builtins.property
-    @pulumi.getter
-    def server(self) -> Optional[_builtins.str]:
-        """
-        Primary OKV Server host with port number in the format <host>:<port>
-        """
-        return pulumi.get(self, "server")
-
-    @_builtins.property
-    @pulumi.getter(name="standbyServer")
-    def standby_server(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        A list of standby servers in the format <host>:<port>
-        """
-        return pulumi.get(self, "standby_server")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecKeyringKmipPatch(dict):
-    """
-    Keyring 'KMIP' specification
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "cacheKeys":
-            suggest = "cache_keys"
-        elif key == "standbyServer":
-            suggest = "standby_server"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecKeyringKmipPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecKeyringKmipPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecKeyringKmipPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cache_keys: Optional[_builtins.bool] = None,
-                 configuration: Optional[_builtins.str] = None,
-                 server: Optional[_builtins.str] = None,
-                 standby_server: Optional[Sequence[_builtins.str]] = None):
-        """
-        Keyring 'KMIP' specification
-
-        :param _builtins.bool cache_keys: Whether the keys are cached by the MySQL Server in RAM in plaintext. If set to false the keys are decrypted on every access
-        :param _builtins.str configuration: Name of a secret that contains TLS certificates
-        :param _builtins.str server: Primary OKV Server host with port number in the format <host>:<port>
-        :param Sequence[_builtins.str] standby_server: A list of standby servers in the format <host>:<port>
-        """
-        if cache_keys is not None:
-            pulumi.set(__self__, "cache_keys", cache_keys)
-        if configuration is not None:
-            pulumi.set(__self__, "configuration", configuration)
-        if server is not None:
-            pulumi.set(__self__, "server", server)
-        if standby_server is not None:
-            pulumi.set(__self__, "standby_server", standby_server)
-
-    @_builtins.property
-    @pulumi.getter(name="cacheKeys")
-    def cache_keys(self) -> Optional[_builtins.bool]:
-        """
-        Whether the keys are cached by the MySQL Server in RAM in plaintext. If set to false the keys are decrypted on every access
-        """
-        return pulumi.get(self, "cache_keys")
-
-    @_builtins.property
-    @pulumi.getter
-    def configuration(self) -> Optional[_builtins.str]:
-        """
-        Name of a secret that contains TLS certificates
-        """
-        return pulumi.get(self, "configuration")
-
-    @_builtins.property
-    @pulumi.getter
-    def server(self) -> Optional[_builtins.str]:
-        """
-        Primary OKV Server host with port number in the format <host>:<port>
-        """
-        return pulumi.get(self, "server")
-
-    @_builtins.property
-    @pulumi.getter(name="standbyServer")
-    def standby_server(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        A list of standby servers in the format <host>:<port>
-        """
-        return pulumi.get(self, "standby_server")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecKeyringOci(dict):
-    """
-    Keyring 'OCI' specification
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "caCertificate":
-            suggest = "ca_certificate"
-        elif key == "keyFingerprint":
-            suggest = "key_fingerprint"
-        elif key == "keySecret":
-            suggest = "key_secret"
-        elif key == "masterKey":
-            suggest = "master_key"
-        elif key == "virtualVault":
-            suggest = "virtual_vault"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecKeyringOci. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecKeyringOci.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecKeyringOci.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 ca_certificate: Optional[_builtins.str] = None,
-                 compartment: Optional[_builtins.str] = None,
-                 endpoints: Optional['outputs.InnoDBClusterSpecKeyringOciEndpoints'] = None,
-                 key_fingerprint: Optional[_builtins.str] = None,
-                 key_secret: Optional[_builtins.str] = None,
-                 master_key: Optional[_builtins.str] = None,
-                 tenancy: Optional[_builtins.str] = None,
-                 user: Optional[_builtins.str] = None,
-                 virtual_vault: Optional[_builtins.str] = None):
-        """
-        Keyring 'OCI' specification
-
-        :param _builtins.str ca_certificate: Secret that contains ca.crt field with CA certificate bundle file that the keyring_oci plugin uses for Oracle Cloud Infrastructure certificate verification
-        :param _builtins.str compartment: Compartment identifier in the form ocid1.compartment.oc1...
-        :param _builtins.str key_fingerprint: Private key fingerprint
-        :param _builtins.str key_secret: A secret that contains the private key under the field 'privatekey'
-        :param _builtins.str master_key: Master key identified in the form ocid1.key.oc1...
-        :param _builtins.str tenancy: Tenancy identifier in the form ocid1.tenancy.oc1...
-        :param _builtins.str user: User identifier in the form of ocid1.user.oc1...
-        :param _builtins.str virtual_vault: Vault identifier in the form ocid1.vault.oc1...
-        """
-        if ca_certificate is not None:
-            pulumi.set(__self__, "ca_certificate", ca_certificate)
-        if compartment is not None:
-            pulumi.set(__self__, "compartment", compartment)
-        if endpoints is not None:
-            pulumi.set(__self__, "endpoints", endpoints)
-        if key_fingerprint is not None:
-            pulumi.set(__self__, "key_fingerprint", key_fingerprint)
-        if key_secret is not None:
-            pulumi.set(__self__, "key_secret", key_secret)
-        if master_key is not None:
-            pulumi.set(__self__, "master_key", master_key)
-        if tenancy is not None:
-            pulumi.set(__self__, "tenancy", tenancy)
-        if user is not None:
-            pulumi.set(__self__, "user", user)
-        if virtual_vault is not None:
-            pulumi.set(__self__, "virtual_vault", virtual_vault)
-
-    @_builtins.property
-    @pulumi.getter(name="caCertificate")
-    def ca_certificate(self) -> Optional[_builtins.str]:
-        """
-        Secret that contains ca.crt field with CA certificate bundle file that the keyring_oci plugin uses for Oracle Cloud Infrastructure certificate verification
-        """
-        return pulumi.get(self, "ca_certificate")
-
-    @_builtins.property
-    @pulumi.getter
-    def compartment(self) -> Optional[_builtins.str]:
-        """
-        Compartment identifier in the form ocid1.compartment.oc1...
-        """
-        return pulumi.get(self, "compartment")
-
-    @_builtins.property
-    @pulumi.getter
-    def endpoints(self) -> Optional['outputs.InnoDBClusterSpecKeyringOciEndpoints']:
-        return pulumi.get(self, "endpoints")
-
-    @_builtins.property
-    @pulumi.getter(name="keyFingerprint")
-    def key_fingerprint(self) -> Optional[_builtins.str]:
-        """
-        Private key fingerprint
-        """
-        return pulumi.get(self, "key_fingerprint")
-
-    @_builtins.property
-    @pulumi.getter(name="keySecret")
-    def key_secret(self) -> Optional[_builtins.str]:
-        """
-        A secret that contains the private key under the field 'privatekey'
-        """
-        return pulumi.get(self, "key_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="masterKey")
-    def master_key(self) -> Optional[_builtins.str]:
-        """
-        Master key identified in the form ocid1.key.oc1...
-        """
-        return pulumi.get(self, "master_key")
-
-    @_builtins.property
-    @pulumi.getter
-    def tenancy(self) -> Optional[_builtins.str]:
-        """
-        Tenancy identifier in the form ocid1.tenancy.oc1...
-        """
-        return pulumi.get(self, "tenancy")
-
-    @_builtins.property
-    @pulumi.getter
-    def user(self) -> Optional[_builtins.str]:
-        """
-        User identifier in the form of ocid1.user.oc1...
-        """
-        return pulumi.get(self, "user")
-
-    @_builtins.property
-    @pulumi.getter(name="virtualVault")
-    def virtual_vault(self) -> Optional[_builtins.str]:
-        """
-        Vault identifier in the form ocid1.vault.oc1...
-        """
-        return pulumi.get(self, "virtual_vault")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecKeyringOciEndpoints(dict):
-    def __init__(__self__, *,
-                 encryption: Optional[_builtins.str] = None,
-                 management: Optional[_builtins.str] = None,
-                 secrets: Optional[_builtins.str] = None,
-                 vaults: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str encryption: Encryption endpoint URI like {identifier}-crypto.kms.{region}.oraclecloud.com
-        :param _builtins.str management: Management endpoint URI like {identifier}-management.kms.{region}.oraclecloud.com
-        :param _builtins.str secrets: Secrets endpoint URI like secrets.vaults.{region}.oci.oraclecloud.com
-        :param _builtins.str vaults: Vaults endpoint URI like vaults.{region}.oci.oraclecloud.com
-        """
-        if encryption is not None:
-            pulumi.set(__self__, "encryption", encryption)
-        if management is not None:
-            pulumi.set(__self__, "management", management)
-        if secrets is not None:
-            pulumi.set(__self__, "secrets", secrets)
-        if vaults is not None:
-            pulumi.set(__self__, "vaults", vaults)
-
-    @_builtins.property
-    @pulumi.getter
-    def encryption(self) -> Optional[_builtins.str]:
-        """
-        Encryption endpoint URI like {identifier}-crypto.kms.{region}.oraclecloud.com
-        """
-        return pulumi.get(self, "encryption")
-
-    @_builtins.property
-    @pulumi.getter
-    def management(self) -> Optional[_builtins.str]:
-        """
-        Management endpoint URI like {identifier}-management.kms.{region}.oraclecloud.com
-        """
-        return pulumi.get(self, "management")
-
-    @_builtins.property
-    @pulumi.getter
-    def secrets(self) -> Optional[_builtins.str]:
-        """
-        Secrets endpoint URI like secrets.vaults.{region}.oci.oraclecloud.com
-        """
-        return pulumi.get(self, "secrets")
-
-    @_builtins.property
-    @pulumi.getter
-    def vaults(self) -> Optional[_builtins.str]:
-        """
-        Vaults endpoint URI like vaults.{region}.oci.oraclecloud.com
-        """
-        return pulumi.get(self, "vaults")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecKeyringOciEndpointsPatch(dict):
-    def __init__(__self__, *,
-                 encryption: Optional[_builtins.str] = None,
-                 management: Optional[_builtins.str] = None,
-                 secrets: Optional[_builtins.str] = None,
-                 vaults: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str encryption: Encryption endpoint URI like {identifier}-crypto.kms.{region}.oraclecloud.com
-        :param _builtins.str management: Management endpoint URI like {identifier}-management.kms.{region}.oraclecloud.com
-        :param _builtins.str secrets: Secrets endpoint URI like secrets.vaults.{region}.oci.oraclecloud.com
-        :param _builtins.str vaults: Vaults endpoint URI like vaults.{region}.oci.oraclecloud.com
-        """
-        if encryption is not None:
-            pulumi.set(__self__, "encryption", encryption)
-        if management is not None:
-            pulumi.set(__self__, "management", management)
-        if secrets is not None:
-            pulumi.set(__self__, "secrets", secrets)
-        if vaults is not None:
-            pulumi.set(__self__, "vaults", vaults)
-
-    @_builtins.property
-    @pulumi.getter
-    def encryption(self) -> Optional[_builtins.str]:
-        """
-        Encryption endpoint URI like {identifier}-crypto.kms.{region}.oraclecloud.com
-        """
-        return pulumi.get(self, "encryption")
-
-    @_builtins.property
-    @pulumi.getter
-    def management(self) -> Optional[_builtins.str]:
-        """
-        Management endpoint URI like {identifier}-management.kms.{region}.oraclecloud.com
-        """
-        return pulumi.get(self, "management")
-
-    @_builtins.property
-    @pulumi.getter
-    def secrets(self) -> Optional[_builtins.str]:
-        """
-        Secrets endpoint URI like secrets.vaults.{region}.oci.oraclecloud.com
-        """
-        return pulumi.get(self, "secrets")
-
-    @_builtins.property
-    @pulumi.getter
-    def vaults(self) -> Optional[_builtins.str]:
-        """
-        Vaults endpoint URI like vaults.{region}.oci.oraclecloud.com
-        """
-        return pulumi.get(self, "vaults")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecKeyringOciPatch(dict):
-    """
-    Keyring 'OCI' specification
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "caCertificate":
-            suggest = "ca_certificate"
-        elif key == "keyFingerprint":
-            suggest = "key_fingerprint"
-        elif key == "keySecret":
-            suggest = "key_secret"
-        elif key == "masterKey":
-            suggest = "master_key"
-        elif key == "virtualVault":
-            suggest = "virtual_vault"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecKeyringOciPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecKeyringOciPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecKeyringOciPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 ca_certificate: Optional[_builtins.str] = None,
-                 compartment: Optional[_builtins.str] = None,
-                 endpoints: Optional['outputs.InnoDBClusterSpecKeyringOciEndpointsPatch'] = None,
-                 key_fingerprint: Optional[_builtins.str] = None,
-                 key_secret: Optional[_builtins.str] = None,
-                 master_key: Optional[_builtins.str] = None,
-                 tenancy: Optional[_builtins.str] = None,
-                 user: Optional[_builtins.str] = None,
-                 virtual_vault: Optional[_builtins.str] = None):
-        """
-        Keyring 'OCI' specification
-
-        :param _builtins.str ca_certificate: Secret that contains ca.crt field with CA certificate bundle file that the keyring_oci plugin uses for Oracle Cloud Infrastructure certificate verification
-        :param _builtins.str compartment: Compartment identifier in the form ocid1.compartment.oc1...
-        :param _builtins.str key_fingerprint: Private key fingerprint
-        :param _builtins.str key_secret: A secret that contains the private key under the field 'privatekey'
-        :param _builtins.str master_key: Master key identified in the form ocid1.key.oc1...
-        :param _builtins.str tenancy: Tenancy identifier in the form ocid1.tenancy.oc1...
-        :param _builtins.str user: User identifier in the form of ocid1.user.oc1...
-        :param _builtins.str virtual_vault: Vault identifier in the form ocid1.vault.oc1...
-        """
-        if ca_certificate is not None:
-            pulumi.set(__self__, "ca_certificate", ca_certificate)
-        if compartment is not None:
-            pulumi.set(__self__, "compartment", compartment)
-        if endpoints is not None:
-            pulumi.set(__self__, "endpoints", endpoints)
-        if key_fingerprint is not None:
-            pulumi.set(__self__, "key_fingerprint", key_fingerprint)
-        if key_secret is not None:
-            pulumi.set(__self__, "key_secret", key_secret)
-        if master_key is not None:
-            pulumi.set(__self__, "master_key", master_key)
-        if tenancy is not None:
-            pulumi.set(__self__, "tenancy", tenancy)
-        if user is not None:
-            pulumi.set(__self__, "user", user)
-        if virtual_vault is not None:
-            pulumi.set(__self__, "virtual_vault", virtual_vault)
-
-    @_builtins.property
-    @pulumi.getter(name="caCertificate")
-    def ca_certificate(self) -> Optional[_builtins.str]:
-        """
-        Secret that contains ca.crt field with CA certificate bundle file that the keyring_oci plugin uses for Oracle Cloud Infrastructure certificate verification
-        """
-        return pulumi.get(self, "ca_certificate")
-
-    @_builtins.property
-    @pulumi.getter
-    def compartment(self) -> Optional[_builtins.str]:
-        """
-        Compartment identifier in the form ocid1.compartment.oc1...
-        """
-        return pulumi.get(self, "compartment")
-
-    @_builtins.property
-    @pulumi.getter
-    def endpoints(self) -> Optional['outputs.InnoDBClusterSpecKeyringOciEndpointsPatch']:
-        return pulumi.get(self, "endpoints")
-
-    @_builtins.property
-    @pulumi.getter(name="keyFingerprint")
-    def key_fingerprint(self) -> Optional[_builtins.str]:
-        """
-        Private key fingerprint
-        """
-        return pulumi.get(self, "key_fingerprint")
-
-    @_builtins.property
-    @pulumi.getter(name="keySecret")
-    def key_secret(self) -> Optional[_builtins.str]:
-        """
-        A secret that contains the private key under the field 'privatekey'
-        """
-        return pulumi.get(self, "key_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="masterKey")
-    def master_key(self) -> Optional[_builtins.str]:
-        """
-        Master key identified in the form ocid1.key.oc1...
-        """
-        return pulumi.get(self, "master_key")
-
-    @_builtins.property
-    @pulumi.getter
-    def tenancy(self) -> Optional[_builtins.str]:
-        """
-        Tenancy identifier in the form ocid1.tenancy.oc1...
-        """
-        return pulumi.get(self, "tenancy")
-
-    @_builtins.property
-    @pulumi.getter
-    def user(self) -> Optional[_builtins.str]:
-        """
-        User identifier in the form of ocid1.user.oc1...
-        """
-        return pulumi.get(self, "user")
-
-    @_builtins.property
-    @pulumi.getter(name="virtualVault")
-    def virtual_vault(self) -> Optional[_builtins.str]:
-        """
-        Vault identifier in the form ocid1.vault.oc1...
-        """
-        return pulumi.get(self, "virtual_vault")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecKeyringPatch(dict):
-    """
-    Keyring specification
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "encryptedFile":
-            suggest = "encrypted_file"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecKeyringPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecKeyringPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecKeyringPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 encrypted_file: Optional['outputs.InnoDBClusterSpecKeyringEncryptedFilePatch'] = None,
-                 file: Optional['outputs.InnoDBClusterSpecKeyringFilePatch'] = None,
-                 kmip: Optional['outputs.InnoDBClusterSpecKeyringKmipPatch'] = None,
-                 oci: Optional['outputs.InnoDBClusterSpecKeyringOciPatch'] = None):
-        """
-        Keyring specification
-        """
-        if encrypted_file is not None:
-            pulumi.set(__self__, "encrypted_file", encrypted_file)
-        if file is not None:
-            pulumi.set(__self__, "file", file)
-        if kmip is not None:
-            pulumi.set(__self__, "kmip", kmip)
-        if oci is not None:
-            pulumi.set(__self__, "oci", oci)
-
-    @_builtins.property
-    @pulumi.getter(name="encryptedFile")
-    def encrypted_file(self) -> Optional['outputs.InnoDBClusterSpecKeyringEncryptedFilePatch']:
-        return pulumi.get(self, "encrypted_file")
-
-    @_builtins.property
-    @pulumi.getter
-    def file(self) -> Optional['outputs.InnoDBClusterSpecKeyringFilePatch']:
-        return pulumi.get(self, "file")
-
-    @_builtins.property
-    @pulumi.getter
-    def kmip(self) -> Optional['outputs.InnoDBClusterSpecKeyringKmipPatch']:
-        return pulumi.get(self, "kmip")
-
-    @_builtins.property
-    @pulumi.getter
-    def oci(self) -> Optional['outputs.InnoDBClusterSpecKeyringOciPatch']:
-        return pulumi.get(self, "oci")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogs(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "slowQuery":
-            suggest = "slow_query"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogs. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogs.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogs.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 collector: Optional['outputs.InnoDBClusterSpecLogsCollector'] = None,
-                 error: Optional['outputs.InnoDBClusterSpecLogsError'] = None,
-                 general: Optional['outputs.InnoDBClusterSpecLogsGeneral'] = None,
-                 slow_query: Optional['outputs.InnoDBClusterSpecLogsSlowQuery'] = None):
-        if collector is not None:
-            pulumi.set(__self__, "collector", collector)
-        if error is not None:
-            pulumi.set(__self__, "error", error)
-        if general is not None:
-            pulumi.set(__self__, "general", general)
-        if slow_query is not None:
-            pulumi.set(__self__, "slow_query", slow_query)
-
-    @_builtins.property
-    @pulumi.getter
-    def collector(self) -> Optional['outputs.InnoDBClusterSpecLogsCollector']:
-        return pulumi.get(self, "collector")
-
-    @_builtins.property
-    @pulumi.getter
-    def error(self) -> Optional['outputs.InnoDBClusterSpecLogsError']:
-        return pulumi.get(self, "error")
-
-    @_builtins.property
-    @pulumi.getter
-    def general(self) -> Optional['outputs.InnoDBClusterSpecLogsGeneral']:
-        return pulumi.get(self, "general")
-
-    @_builtins.property
-    @pulumi.getter(name="slowQuery")
-    def slow_query(self) -> Optional['outputs.InnoDBClusterSpecLogsSlowQuery']:
-        return pulumi.get(self, "slow_query")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollector(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "containerName":
-            suggest = "container_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollector. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsCollector.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsCollector.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 container_name: Optional[_builtins.str] = None,
-                 env: Optional[Sequence[Mapping[str, Any]]] = None,
-                 fluentd: Optional['outputs.InnoDBClusterSpecLogsCollectorFluentd'] = None,
-                 image: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str container_name: Name of the collector container sidecar
-        :param _builtins.str image: Name of an image, including registry and repository, to be used for the log collector sidecar. If provided it needs to be an image for the configured collector type.
-        """
-        if container_name is not None:
-            pulumi.set(__self__, "container_name", container_name)
-        if env is not None:
-            pulumi.set(__self__, "env", env)
-        if fluentd is not None:
-            pulumi.set(__self__, "fluentd", fluentd)
-        if image is not None:
-            pulumi.set(__self__, "image", image)
-
-    @_builtins.property
-    @pulumi.getter(name="containerName")
-    def container_name(self) -> Optional[_builtins.str]:
-        """
-        Name of the collector container sidecar
-        """
-        return pulumi.get(self, "container_name")
-
-    @_builtins.property
-    @pulumi.getter
-    def env(self) -> Optional[Sequence[Mapping[str, Any]]]:
-        return pulumi.get(self, "env")
-
-    @_builtins.property
-    @pulumi.getter
-    def fluentd(self) -> Optional['outputs.InnoDBClusterSpecLogsCollectorFluentd']:
-        return pulumi.get(self, "fluentd")
-
-    @_builtins.property
-    @pulumi.getter
-    def image(self) -> Optional[_builtins.str]:
-        """
-        Name of an image, including registry and repository, to be used for the log collector sidecar. If provided it needs to be an image for the configured collector type.
-        """
-        return pulumi.get(self, "image")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentd(dict):
-    """
-    Properties of the fluentd log collector
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "additionalFilterConfiguration":
-            suggest = "additional_filter_configuration"
-        elif key == "errorLog":
-            suggest = "error_log"
-        elif key == "generalLog":
-            suggest = "general_log"
-        elif key == "recordAugmentation":
-            suggest = "record_augmentation"
-        elif key == "slowQueryLog":
-            suggest = "slow_query_log"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorFluentd. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentd.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentd.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 additional_filter_configuration: Optional[_builtins.str] = None,
-                 error_log: Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdErrorLog'] = None,
-                 general_log: Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdGeneralLog'] = None,
-                 record_augmentation: Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentation'] = None,
-                 sinks: Optional[Sequence[Mapping[str, Any]]] = None,
-                 slow_query_log: Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdSlowQueryLog'] = None):
-        """
-        Properties of the fluentd log collector
-
-        :param _builtins.str additional_filter_configuration: Raw configuration of additional Fluentd filters to be added to the configuration file
-        """
-        if additional_filter_configuration is not None:
-            pulumi.set(__self__, "additional_filter_configuration", additional_filter_configuration)
-        if error_log is not None:
-            pulumi.set(__self__, "error_log", error_log)
-        if general_log is not None:
-            pulumi.set(__self__, "general_log", general_log)
-        if record_augmentation is not None:
-            pulumi.set(__self__, "record_augmentation", record_augmentation)
-        if sinks is not None:
-            pulumi.set(__self__, "sinks", sinks)
-        if slow_query_log is not None:
-            pulumi.set(__self__, "slow_query_log", slow_query_log)
-
-    @_builtins.property
-    @pulumi.getter(name="additionalFilterConfiguration")
-    def additional_filter_configuration(self) -> Optional[_builtins.str]:
-        """
-        Raw configuration of additional Fluentd filters to be added to the configuration file
-        """
-        return pulumi.get(self, "additional_filter_configuration")
-
-    @_builtins.property
-    @pulumi.getter(name="errorLog")
-    def error_log(self) -> Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdErrorLog']:
-        return pulumi.get(self, "error_log")
-
-    @_builtins.property
-    @pulumi.getter(name="generalLog")
-    def general_log(self) -> Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdGeneralLog']:
-        return pulumi.get(self, "general_log")
-
-    @_builtins.property
-    @pulumi.getter(name="recordAugmentation")
-    def record_augmentation(self) -> Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentation']:
-        return pulumi.get(self, "record_augmentation")
-
-    @_builtins.property
-    @pulumi.getter
-    def sinks(self) -> Optional[Sequence[Mapping[str, Any]]]:
-        return pulumi.get(self, "sinks")
-
-    @_builtins.property
-    @pulumi.getter(name="slowQueryLog")
-    def slow_query_log(self) -> Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdSlowQueryLog']:
-        return pulumi.get(self, "slow_query_log")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdErrorLog(dict):
-    def __init__(__self__, *,
-                 options: Optional[Mapping[str, Any]] = None,
-                 tag: Optional[_builtins.str] = None):
-        """
-        :param Mapping[str, Any] options: fluentd specific options for the error log
-        :param _builtins.str tag: Tag for the error log records
-        """
-        if options is not None:
-            pulumi.set(__self__, "options", options)
-        if tag is not None:
-            pulumi.set(__self__, "tag", tag)
-
-    @_builtins.property
-    @pulumi.getter
-    def options(self) -> Optional[Mapping[str, Any]]:
-        """
-        fluentd specific options for the error log
-        """
-        return pulumi.get(self, "options")
-
-    @_builtins.property
-    @pulumi.getter
-    def tag(self) -> Optional[_builtins.str]:
-        """
-        Tag for the error log records
-        """
-        return pulumi.get(self, "tag")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdErrorLogPatch(dict):
-    def __init__(__self__, *,
-                 options: Optional[Mapping[str, Any]] = None,
-                 tag: Optional[_builtins.str] = None):
-        """
-        :param Mapping[str, Any] options: fluentd specific options for the error log
-        :param _builtins.str tag: Tag for the error log records
-        """
-        if options is not None:
-            pulumi.set(__self__, "options", options)
-        if tag is not None:
-            pulumi.set(__self__, "tag", tag)
-
-    @_builtins.property
-    @pulumi.getter
-    def options(self) -> Optional[Mapping[str, Any]]:
-        """
-        fluentd specific options for the error log
-        """
-        return pulumi.get(self, "options")
-
-    @_builtins.property
-    @pulumi.getter
-    def tag(self) -> Optional[_builtins.str]:
-        """
-        Tag for the error log records
-        """
-        return pulumi.get(self, "tag")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdGeneralLog(dict):
-    def __init__(__self__, *,
-                 options: Optional[Mapping[str, Any]] = None,
-                 tag: Optional[_builtins.str] = None):
-        """
-        :param Mapping[str, Any] options: fluentd specific options for the general log
-        :param _builtins.str tag: Tag for the general log records
-        """
-        if options is not None:
-            pulumi.set(__self__, "options", options)
-        if tag is not None:
-            pulumi.set(__self__, "tag", tag)
-
-    @_builtins.property
-    @pulumi.getter
-    def options(self) -> Optional[Mapping[str, Any]]:
-        """
-        fluentd specific options for the general log
-        """
-        return pulumi.get(self, "options")
-
-    @_builtins.property
-    @pulumi.getter
-    def tag(self) -> Optional[_builtins.str]:
-        """
-        Tag for the general log records
-        """
-        return pulumi.get(self, "tag")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatch(dict):
-    def __init__(__self__, *,
-                 options: Optional[Mapping[str, Any]] = None,
-                 tag: Optional[_builtins.str] = None):
-        """
-        :param Mapping[str, Any] options: fluentd specific options for the general log
-        :param _builtins.str tag: Tag for the general log records
-        """
-        if options is not None:
-            pulumi.set(__self__, "options", options)
-        if tag is not None:
-            pulumi.set(__self__, "tag", tag)
-
-    @_builtins.property
-    @pulumi.getter
-    def options(self) -> Optional[Mapping[str, Any]]:
-        """
-        fluentd specific options for the general log
-        """
-        return pulumi.get(self, "options")
-
-    @_builtins.property
-    @pulumi.getter
-    def tag(self) -> Optional[_builtins.str]:
-        """
-        Tag for the general log records
-        """
-        return pulumi.get(self, "tag")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdPatch(dict):
-    """
-    Properties of the fluentd log collector
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "additionalFilterConfiguration":
-            suggest = "additional_filter_configuration"
-        elif key == "errorLog":
-            suggest = "error_log"
-        elif key == "generalLog":
-            suggest = "general_log"
-        elif key == "recordAugmentation":
-            suggest = "record_augmentation"
-        elif key == "slowQueryLog":
-            suggest = "slow_query_log"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorFluentdPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 additional_filter_configuration: Optional[_builtins.str] = None,
-                 error_log: Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdErrorLogPatch'] = None,
-                 general_log: Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatch'] = None,
-                 record_augmentation: Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatch'] = None,
-                 sinks: Optional[Sequence[Mapping[str, Any]]] = None,
-                 slow_query_log: Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatch'] = None):
-        """
-        Properties of the fluentd log collector
-
-        :param _builtins.str additional_filter_configuration: Raw configuration of additional Fluentd filters to be added to the configuration file
-        """
-        if additional_filter_configuration is not None:
-            pulumi.set(__self__, "additional_filter_configuration", additional_filter_configuration)
-        if error_log is not None:
-            pulumi.set(__self__, "error_log", error_log)
-        if general_log is not None:
-            pulumi.set(__self__, "general_log", general_log)
-        if record_augmentation is not None:
-            pulumi.set(__self__, "record_augmentation", record_augmentation)
-        if sinks is not None:
-            pulumi.set(__self__, "sinks", sinks)
-        if slow_query_log is not None:
-            pulumi.set(__self__, "slow_query_log", slow_query_log)
-
-    @_builtins.property
-    @pulumi.getter(name="additionalFilterConfiguration")
-    def additional_filter_configuration(self) -> Optional[_builtins.str]:
-        """
-        Raw configuration of additional Fluentd filters to be added to the configuration file
-        """
-        return pulumi.get(self, "additional_filter_configuration")
-
-    @_builtins.property
-    @pulumi.getter(name="errorLog")
-    def error_log(self) -> Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdErrorLogPatch']:
-        return pulumi.get(self, "error_log")
-
-    @_builtins.property
-    @pulumi.getter(name="generalLog")
-    def general_log(self) -> Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatch']:
-        return pulumi.get(self, "general_log")
-
-    @_builtins.property
-    @pulumi.getter(name="recordAugmentation")
-    def record_augmentation(self) -> Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatch']:
-        return pulumi.get(self, "record_augmentation")
-
-    @_builtins.property
-    @pulumi.getter
-    def sinks(self) -> Optional[Sequence[Mapping[str, Any]]]:
-        return pulumi.get(self, "sinks")
-
-    @_builtins.property
-    @pulumi.getter(name="slowQueryLog")
-    def slow_query_log(self) -> Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatch']:
-        return pulumi.get(self, "slow_query_log")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentation(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "podFields":
-            suggest = "pod_fields"
-        elif key == "resourceFields":
-            suggest = "resource_fields"
-        elif key == "staticFields":
-            suggest = "static_fields"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorFluentdRecordAugmentation. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentation.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentation.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 annotations: Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotations']] = None,
-                 enabled: Optional[_builtins.bool] = None,
-                 labels: Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabels']] = None,
-                 pod_fields: Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFields']] = None,
-                 resource_fields: Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFields']] = None,
-                 static_fields: Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFields']] = None):
-        """
-        :param _builtins.bool enabled: Whether to enable record augmentation with additional data
-        """
-        if annotations is not None:
-            pulumi.set(__self__, "annotations", annotations)
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-        if pod_fields is not None:
-            pulumi.set(__self__, "pod_fields", pod_fields)
-        if resource_fields is not None:
-            pulumi.set(__self__, "resource_fields", resource_fields)
-        if static_fields is not None:
-            pulumi.set(__self__, "static_fields", static_fields)
-
-    @_builtins.property
-    @pulumi.getter
-    def annotations(self) -> Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotations']]:
-        return pulumi.get(self, "annotations")
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.bool]:
-        """
-        Whether to enable record augmentation with additional data
-        """
-        return pulumi.get(self, "enabled")
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabels']]:
-        return pulumi.get(self, "labels")
-
-    @_builtins.property
-    @pulumi.getter(name="podFields")
-    def pod_fields(self) -> Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFields']]:
-        return pulumi.get(self, "pod_fields")
-
-    @_builtins.property
-    @pulumi.getter(name="resourceFields")
-    def resource_fields(self) -> Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFields']]:
-        return pulumi.get(self, "resource_fields")
-
-    @_builtins.property
-    @pulumi.getter(name="staticFields")
-    def static_fields(self) -> Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFields']]:
-        return pulumi.get(self, "static_fields")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotations(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "annotationName":
-            suggest = "annotation_name"
-        elif key == "fieldName":
-            suggest = "field_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotations. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotations.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotations.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 annotation_name: Optional[_builtins.str] = None,
-                 field_name: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str annotation_name: Name of the pod label that holds the value to be stored under fieldName in the log record
-        :param _builtins.str field_name: Name of the field added to the log record with value from annotationName
-        """
-        if annotation_name is not None:
-            pulumi.set(__self__, "annotation_name", annotation_name)
-        if field_name is not None:
-            pulumi.set(__self__, "field_name", field_name)
-
-    @_builtins.property
-    @pulumi.getter(name="annotationName")
-    def annotation_name(self) -> Optional[_builtins.str]:
-        """
-        Name of the pod label that holds the value to be stored under fieldName in the log record
-        """
-        return pulumi.get(self, "annotation_name")
-
-    @_builtins.property
-    @pulumi.getter(name="fieldName")
-    def field_name(self) -> Optional[_builtins.str]:
-        """
-        Name of the field added to the log record with value from annotationName
-        """
-        return pulumi.get(self, "field_name")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "annotationName":
-            suggest = "annotation_name"
-        elif key == "fieldName":
-            suggest = "field_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 annotation_name: Optional[_builtins.str] = None,
-                 field_name: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str annotation_name: Name of the pod label that holds the value to be stored under fieldName in the log record
-        :param _builtins.str field_name: Name of the field added to the log record with value from annotationName
-        """
-        if annotation_name is not None:
-            pulumi.set(__self__, "annotation_name", annotation_name)
-        if field_name is not None:
-            pulumi.set(__self__, "field_name", field_name)
-
-    @_builtins.property
-    @pulumi.getter(name="annotationName")
-    def annotation_name(self) -> Optional[_builtins.str]:
-        """
-        Name of the pod label that holds the value to be stored under fieldName in the log record
-        """
-        return pulumi.get(self, "annotation_name")
-
-    @_builtins.property
-    @pulumi.getter(name="fieldName")
-    def field_name(self) -> Optional[_builtins.str]:
-        """
-        Name of the field added to the log record with value from annotationName
-        """
-        return pulumi.get(self, "field_name")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabels(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "fieldName":
-            suggest = "field_name"
-        elif key == "labelName":
-            suggest = "label_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabels. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabels.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabels.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 field_name: Optional[_builtins.str] = None,
-                 label_name: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str field_name: Name of the field added to the log record with value from labelName
-        :param _builtins.str label_name: Name of the pod label that holds the value to be stored under fieldName in the log record
-        """
-        if field_name is not None:
-            pulumi.set(__self__, "field_name", field_name)
-        if label_name is not None:
-            pulumi.set(__self__, "label_name", label_name)
-
-    @_builtins.property
-    @pulumi.getter(name="fieldName")
-    def field_name(self) -> Optional[_builtins.str]:
-        """
-        Name of the field added to the log record with value from labelName
-        """
-        return pulumi.get(self, "field_name")
-
-    @_builtins.property
-    @pulumi.getter(name="labelName")
-    def label_name(self) -> Optional[_builtins.str]:
-        """
-        Name of the pod label that holds the value to be stored under fieldName in the log record
-        """
-        return pulumi.get(self, "label_name")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "fieldName":
-            suggest = "field_name"
-        elif key == "labelName":
-            suggest = "label_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 field_name: Optional[_builtins.str] = None,
-                 label_name: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str field_name: Name of the field added to the log record with value from labelName
-        :param _builtins.str label_name: Name of the pod label that holds the value to be stored under fieldName in the log record
-        """
-        if field_name is not None:
-            pulumi.set(__self__, "field_name", field_name)
-        if label_name is not None:
-            pulumi.set(__self__, "label_name", label_name)
-
-    @_builtins.property
-    @pulumi.getter(name="fieldName")
-    def field_name(self) -> Optional[_builtins.str]:
-        """
-        Name of the field added to the log record with value from labelName
-        """
-        return pulumi.get(self, "field_name")
-
-    @_builtins.property
-    @pulumi.getter(name="labelName")
-    def label_name(self) -> Optional[_builtins.str]:
-        """
-        Name of the pod label that holds the value to be stored under fieldName in the log record
-        """
-        return pulumi.get(self, "label_name")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "podFields":
-            suggest = "pod_fields"
-        elif key == "resourceFields":
-            suggest = "resource_fields"
-        elif key == "staticFields":
-            suggest = "static_fields"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 annotations: Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatch']] = None,
-                 enabled: Optional[_builtins.bool] = None,
-                 labels: Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatch']] = None,
-                 pod_fields: Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatch']] = None,
-                 resource_fields: Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatch']] = None,
-                 static_fields: Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatch']] = None):
-        """
-        :param _builtins.bool enabled: Whether to enable record augmentation with additional data
-        """
-        if annotations is not None:
-            pulumi.set(__self__, "annotations", annotations)
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-        if pod_fields is not None:
-            pulumi.set(__self__, "pod_fields", pod_fields)
-        if resource_fields is not None:
-            pulumi.set(__self__, "resource_fields", resource_fields)
-        if static_fields is not None:
-            pulumi.set(__self__, "static_fields", static_fields)
-
-    @_builtins.property
-    @pulumi.getter
-    def annotations(self) -> Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatch']]:
-        return pulumi.get(self, "annotations")
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.bool]:
-        """
-        Whether to enable record augmentation with additional data
-        """
-        return pulumi.get(self, "enabled")
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatch']]:
-        return pulumi.get(self, "labels")
-
-    @_builtins.property
-    @pulumi.getter(name="podFields")
-    def pod_fields(self) -> Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatch']]:
-        return pulumi.get(self, "pod_fields")
-
-    @_builtins.property
-    @pulumi.getter(name="resourceFields")
-    def resource_fields(self) -> Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatch']]:
-        return pulumi.get(self, "resource_fields")
-
-    @_builtins.property
-    @pulumi.getter(name="staticFields")
-    def static_fields(self) -> Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatch']]:
-        return pulumi.get(self, "static_fields")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFields(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "fieldName":
-            suggest = "field_name"
-        elif key == "fieldPath":
-            suggest = "field_path"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFields. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFields.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFields.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 field_name: Optional[_builtins.str] = None,
-                 field_path: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str field_name: Name of the field added to the log record with value taken from a field with path stored in fieldPath
-        :param _builtins.str field_path: Value for the field fieldName. The path should be of the same syntax as the one used for mounting environment variables from field reference - valueFrom.fieldRef.fieldPath . The field will be mounted in the pod as a environment variable, prefixed with a prefix and used then added to the log record. Examples for fieldRef are : spec.nodeName, metadata.namespace, status.podIP, etc.
-        """
-        if field_name is not None:
-            pulumi.set(__self__, "field_name", field_name)
-        if field_path is not None:
-            pulumi.set(__self__, "field_path", field_path)
-
-    @_builtins.property
-    @pulumi.getter(name="fieldName")
-    def field_name(self) -> Optional[_builtins.str]:
-        """
-        Name of the field added to the log record with value taken from a field with path stored in fieldPath
-        """
-        return pulumi.get(self, "field_name")
-
-    @_builtins.property
-    @pulumi.getter(name="fieldPath")
-    def field_path(self) -> Optional[_builtins.str]:
-        """
-        Value for the field fieldName. The path should be of the same syntax as the one used for mounting environment variables from field reference - valueFrom.fieldRef.fieldPath . The field will be mounted in the pod as a environment variable, prefixed with a prefix and used then added to the log record. Examples for fieldRef are : spec.nodeName, metadata.namespace, status.podIP, etc.
-        """
-        return pulumi.get(self, "field_path")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "fieldName":
-            suggest = "field_name"
-        elif key == "fieldPath":
-            suggest = "field_path"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 field_name: Optional[_builtins.str] = None,
-                 field_path: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str field_name: Name of the field added to the log record with value taken from a field with path stored in fieldPath
-        :param _builtins.str field_path: Value for the field fieldName. The path should be of the same syntax as the one used for mounting environment variables from field reference - valueFrom.fieldRef.fieldPath . The field will be mounted in the pod as a environment variable, prefixed with a prefix and used then added to the log record. Examples for fieldRef are : spec.nodeName, metadata.namespace, status.podIP, etc.
-        """
-        if field_name is not None:
-            pulumi.set(__self__, "field_name", field_name)
-        if field_path is not None:
-            pulumi.set(__self__, "field_path", field_path)
-
-    @_builtins.property
-    @pulumi.getter(name="fieldName")
-    def field_name(self) -> Optional[_builtins.str]:
-        """
-        Name of the field added to the log record with value taken from a field with path stored in fieldPath
-        """
-        return pulumi.get(self, "field_name")
-
-    @_builtins.property
-    @pulumi.getter(name="fieldPath")
-    def field_path(self) -> Optional[_builtins.str]:
-        """
-        Value for the field fieldName. The path should be of the same syntax as the one used for mounting environment variables from field reference - valueFrom.fieldRef.fieldPath . The field will be mounted in the pod as a environment variable, prefixed with a prefix and used then added to the log record. Examples for fieldRef are : spec.nodeName, metadata.namespace, status.podIP, etc.
-        """
-        return pulumi.get(self, "field_path")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFields(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "containerName":
-            suggest = "container_name"
-        elif key == "fieldName":
-            suggest = "field_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFields. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFields.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFields.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 container_name: Optional[_builtins.str] = None,
-                 field_name: Optional[_builtins.str] = None,
-                 resource: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str field_name: Name of the field added to the log record with value taken from a field with path stored in fieldPath
-        :param _builtins.str resource: See https://kubernetes.io/docs/tasks/inject-data-application/environment-variable-expose-pod-information/#use-container-fields-as-values-for-environment-variables
-        """
-        if container_name is not None:
-            pulumi.set(__self__, "container_name", container_name)
-        if field_name is not None:
-            pulumi.set(__self__, "field_name", field_name)
-        if resource is not None:
-            pulumi.set(__self__, "resource", resource)
-
-    @_builtins.property
-    @pulumi.getter(name="containerName")
-    def container_name(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container_name")
-
-    @_builtins.property
-    @pulumi.getter(name="fieldName")
-    def field_name(self) -> Optional[_builtins.str]:
-        """
-        Name of the field added to the log record with value taken from a field with path stored in fieldPath
-        """
-        return pulumi.get(self, "field_name")
-
-    @_builtins.property
-    @pulumi.getter
-    def resource(self) -> Optional[_builtins.str]:
-        """
-        See https://kubernetes.io/docs/tasks/inject-data-application/environment-variable-expose-pod-information/#use-container-fields-as-values-for-environment-variables
-        """
-        return pulumi.get(self, "resource")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "containerName":
-            suggest = "container_name"
-        elif key == "fieldName":
-            suggest = "field_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 container_name: Optional[_builtins.str] = None,
-                 field_name: Optional[_builtins.str] = None,
-                 resource: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str field_name: Name of the field added to the log record with value taken from a field with path stored in fieldPath
-        :param _builtins.str resource: See https://kubernetes.io/docs/tasks/inject-data-application/environment-variable-expose-pod-information/#use-container-fields-as-values-for-environment-variables
-        """
-        if container_name is not None:
-            pulumi.set(__self__, "container_name", container_name)
-        if field_name is not None:
-            pulumi.set(__self__, "field_name", field_name)
-        if resource is not None:
-            pulumi.set(__self__, "resource", resource)
-
-    @_builtins.property
-    @pulumi.getter(name="containerName")
-    def container_name(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container_name")
-
-    @_builtins.property
-    @pulumi.getter(name="fieldName")
-    def field_name(self) -> Optional[_builtins.str]:
-        """
-        Name of the field added to the log record with value taken from a field with path stored in fieldPath
-        """
-        return pulumi.get(self, "field_name")
-
-    @_builtins.property
-    @pulumi.getter
-    def resource(self) -> Optional[_builtins.str]:
-        """
-        See https://kubernetes.io/docs/tasks/inject-data-application/environment-variable-expose-pod-information/#use-container-fields-as-values-for-environment-variables
-        """
-        return pulumi.get(self, "resource")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFields(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "fieldName":
-            suggest = "field_name"
-        elif key == "fieldValue":
-            suggest = "field_value"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFields. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFields.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFields.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 field_name: Optional[_builtins.str] = None,
-                 field_value: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str field_name: Name of the field added to the log record with value from fieldValue
-        :param _builtins.str field_value: Value for the static field with name taken from fieldName
-        """
-        if field_name is not None:
-            pulumi.set(__self__, "field_name", field_name)
-        if field_value is not None:
-            pulumi.set(__self__, "field_value", field_value)
-
-    @_builtins.property
-    @pulumi.getter(name="fieldName")
-    def field_name(self) -> Optional[_builtins.str]:
-        """
-        Name of the field added to the log record with value from fieldValue
-        """
-        return pulumi.get(self, "field_name")
-
-    @_builtins.property
-    @pulumi.getter(name="fieldValue")
-    def field_value(self) -> Optional[_builtins.str]:
-        """
-        Value for the static field with name taken from fieldName
-        """
-        return pulumi.get(self, "field_value")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "fieldName":
-            suggest = "field_name"
-        elif key == "fieldValue":
-            suggest = "field_value"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 field_name: Optional[_builtins.str] = None,
-                 field_value: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str field_name: Name of the field added to the log record with value from fieldValue
-        :param _builtins.str field_value: Value for the static field with name taken from fieldName
-        """
-        if field_name is not None:
-            pulumi.set(__self__, "field_name", field_name)
-        if field_value is not None:
-            pulumi.set(__self__, "field_value", field_value)
-
-    @_builtins.property
-    @pulumi.getter(name="fieldName")
-    def field_name(self) -> Optional[_builtins.str]:
-        """
-        Name of the field added to the log record with value from fieldValue
-        """
-        return pulumi.get(self, "field_name")
-
-    @_builtins.property
-    @pulumi.getter(name="fieldValue")
-    def field_value(self) -> Optional[_builtins.str]:
-        """
-        Value for the static field with name taken from fieldName
-        """
-        return pulumi.get(self, "field_value")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdSlowQueryLog(dict):
-    def __init__(__self__, *,
-                 options: Optional[Mapping[str, Any]] = None,
-                 tag: Optional[_builtins.str] = None):
-        """
-        :param Mapping[str, Any] options: fluentd specific options for the slow log
-        :param _builtins.str tag: Tag for the slow log records
-        """
-        if options is not None:
-            pulumi.set(__self__, "options", options)
-        if tag is not None:
-            pulumi.set(__self__, "tag", tag)
-
-    @_builtins.property
-    @pulumi.getter
-    def options(self) -> Optional[Mapping[str, Any]]:
-        """
-        fluentd specific options for the slow log
-        """
-        return pulumi.get(self, "options")
-
-    @_builtins.property
-    @pulumi.getter
-    def tag(self) -> Optional[_builtins.str]:
-        """
-        Tag for the slow log records
-        """
-        return pulumi.get(self, "tag")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatch(dict):
-    def __init__(__self__, *,
-                 options: Optional[Mapping[str, Any]] = None,
-                 tag: Optional[_builtins.str] = None):
-        """
-        :param Mapping[str, Any] options: fluentd specific options for the slow log
-        :param _builtins.str tag: Tag for the slow log records
-        """
-        if options is not None:
-            pulumi.set(__self__, "options", options)
-        if tag is not None:
-            pulumi.set(__self__, "tag", tag)
-
-    @_builtins.property
-    @pulumi.getter
-    def options(self) -> Optional[Mapping[str, Any]]:
-        """
-        fluentd specific options for the slow log
-        """
-        return pulumi.get(self, "options")
-
-    @_builtins.property
-    @pulumi.getter
-    def tag(self) -> Optional[_builtins.str]:
-        """
-        Tag for the slow log records
-        """
-        return pulumi.get(self, "tag")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsCollectorPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "containerName":
-            suggest = "container_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsCollectorPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsCollectorPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 container_name: Optional[_builtins.str] = None,
-                 env: Optional[Sequence[Mapping[str, Any]]] = None,
-                 fluentd: Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdPatch'] = None,
-                 image: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str container_name: Name of the collector container sidecar
-        :param _builtins.str image: Name of an image, including registry and repository, to be used for the log collector sidecar. If provided it needs to be an image for the configured collector type.
-        """
-        if container_name is not None:
-            pulumi.set(__self__, "container_name", container_name)
-        if env is not None:
-            pulumi.set(__self__, "env", env)
-        if fluentd is not None:
-            pulumi.set(__self__, "fluentd", fluentd)
-        if image is not None:
-            pulumi.set(__self__, "image", image)
-
-    @_builtins.property
-    @pulumi.getter(name="containerName")
-    def container_name(self) -> Optional[_builtins.str]:
-        """
-        Name of the collector container sidecar
-        """
-        return pulumi.get(self, "container_name")
-
-    @_builtins.property
-    @pulumi.getter
-    def env(self) -> Optional[Sequence[Mapping[str, Any]]]:
-        return pulumi.get(self, "env")
-
-    @_builtins.property
-    @pulumi.getter
-    def fluentd(self) -> Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdPatch']:
-        return pulumi.get(self, "fluentd")
-
-    @_builtins.property
-    @pulumi.getter
-    def image(self) -> Optional[_builtins.str]:
-        """
-        Name of an image, including registry and repository, to be used for the log collector sidecar. If provided it needs to be an image for the configured collector type.
-        """
-        return pulumi.get(self, "image")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsError(dict):
-    def __init__(__self__, *,
-                 collect: Optional[_builtins.bool] = None,
-                 verbosity: Optional[_builtins.int] = None):
-        """
-        :param _builtins.bool collect: Whether error logging data should be collected. Implies that the logging should be enabled. If enabled the error log will be switched to JSON format output
-        :param _builtins.int verbosity: Log error verbosity. For details, see the MySQL Server --log-error-verbosity documentation.
-        """
-        if collect is not None:
-            pulumi.set(__self__, "collect", collect)
-        if verbosity is not None:
-            pulumi.set(__self__, "verbosity", verbosity)
-
-    @_builtins.property
-    @pulumi.getter
-    def collect(self) -> Optional[_builtins.bool]:
-        """
-        Whether error logging data should be collected. Implies that the logging should be enabled. If enabled the error log will be switched to JSON format output
-        """
-        return pulumi.get(self, "collect")
-
-    @_builtins.property
-    @pulumi.getter
-    def verbosity(self) -> Optional[_builtins.int]:
-        """
-        Log error verbosity. For details, see the MySQL Server --log-error-verbosity documentation.
-        """
-        return pulumi.get(self, "verbosity")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsErrorPatch(dict):
-    def __init__(__self__, *,
-                 collect: Optional[_builtins.bool] = None,
-                 verbosity: Optional[_builtins.int] = None):
-        """
-        :param _builtins.bool collect: Whether error logging data should be collected. Implies that the logging should be enabled. If enabled the error log will be switched to JSON format output
-        :param _builtins.int verbosity: Log error verbosity. For details, see the MySQL Server --log-error-verbosity documentation.
-        """
-        if collect is not None:
-            pulumi.set(__self__, "collect", collect)
-        if verbosity is not None:
-            pulumi.set(__self__, "verbosity", verbosity)
-
-    @_builtins.property
-    @pulumi.getter
-    def collect(self) -> Optional[_builtins.bool]:
-        """
-        Whether error logging data should be collected. Implies that the logging should be enabled. If enabled the error log will be switched to JSON format output
-        """
-        return pulumi.get(self, "collect")
-
-    @_builtins.property
-    @pulumi.getter
-    def verbosity(self) -> Optional[_builtins.int]:
-        """
-        Log error verbosity. For details, see the MySQL Server --log-error-verbosity documentation.
-        """
-        return pulumi.get(self, "verbosity")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsGeneral(dict):
-    def __init__(__self__, *,
-                 collect: Optional[_builtins.bool] = None,
-                 enabled: Optional[_builtins.bool] = None):
-        """
-        :param _builtins.bool collect: Whether general logging data should be collected. Implies that the logging should be enabled.
-        :param _builtins.bool enabled: Whether general logging should be enabled
-        """
-        if collect is not None:
-            pulumi.set(__self__, "collect", collect)
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def collect(self) -> Optional[_builtins.bool]:
-        """
-        Whether general logging data should be collected. Implies that the logging should be enabled.
-        """
-        return pulumi.get(self, "collect")
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.bool]:
-        """
-        Whether general logging should be enabled
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsGeneralPatch(dict):
-    def __init__(__self__, *,
-                 collect: Optional[_builtins.bool] = None,
-                 enabled: Optional[_builtins.bool] = None):
-        """
-        :param _builtins.bool collect: Whether general logging data should be collected. Implies that the logging should be enabled.
-        :param _builtins.bool enabled: Whether general logging should be enabled
-        """
-        if collect is not None:
-            pulumi.set(__self__, "collect", collect)
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-
-    @_builtins.property
-    @pulumi.getter
-    def collect(self) -> Optional[_builtins.bool]:
-        """
-        Whether general logging data should be collected. Implies that the logging should be enabled.
-        """
-        return pulumi.get(self, "collect")
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.bool]:
-        """
-        Whether general logging should be enabled
-        """
-        return pulumi.get(self, "enabled")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "slowQuery":
-            suggest = "slow_query"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 collector: Optional['outputs.InnoDBClusterSpecLogsCollectorPatch'] = None,
-                 error: Optional['outputs.InnoDBClusterSpecLogsErrorPatch'] = None,
-                 general: Optional['outputs.InnoDBClusterSpecLogsGeneralPatch'] = None,
-                 slow_query: Optional['outputs.InnoDBClusterSpecLogsSlowQueryPatch'] = None):
-        if collector is not None:
-            pulumi.set(__self__, "collector", collector)
-        if error is not None:
-            pulumi.set(__self__, "error", error)
-        if general is not None:
-            pulumi.set(__self__, "general", general)
-        if slow_query is not None:
-            pulumi.set(__self__, "slow_query", slow_query)
-
-    @_builtins.property
-    @pulumi.getter
-    def collector(self) -> Optional['outputs.InnoDBClusterSpecLogsCollectorPatch']:
-        return pulumi.get(self, "collector")
-
-    @_builtins.property
-    @pulumi.getter
-    def error(self) -> Optional['outputs.InnoDBClusterSpecLogsErrorPatch']:
-        return pulumi.get(self, "error")
-
-    @_builtins.property
-    @pulumi.getter
-    def general(self) -> Optional['outputs.InnoDBClusterSpecLogsGeneralPatch']:
-        return pulumi.get(self, "general")
-
-    @_builtins.property
-    @pulumi.getter(name="slowQuery")
-    def slow_query(self) -> Optional['outputs.InnoDBClusterSpecLogsSlowQueryPatch']:
-        return pulumi.get(self, "slow_query")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsSlowQuery(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "longQueryTime":
-            suggest = "long_query_time"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsSlowQuery. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsSlowQuery.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsSlowQuery.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 collect: Optional[_builtins.bool] = None,
-                 enabled: Optional[_builtins.bool] = None,
-                 long_query_time: Optional[_builtins.float] = None):
-        """
-        :param _builtins.bool collect: Whether slow query logging data should be collected. Implies that the logging should be enabled.
-        :param _builtins.bool enabled: Whether slow query logging should be enabled
-        :param _builtins.float long_query_time: Long query time threshold
-        """
-        if collect is not None:
-            pulumi.set(__self__, "collect", collect)
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-        if long_query_time is not None:
-            pulumi.set(__self__, "long_query_time", long_query_time)
-
-    @_builtins.property
-    @pulumi.getter
-    def collect(self) -> Optional[_builtins.bool]:
-        """
-        Whether slow query logging data should be collected. Implies that the logging should be enabled.
-        """
-        return pulumi.get(self, "collect")
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.bool]:
-        """
-        Whether slow query logging should be enabled
-        """
-        return pulumi.get(self, "enabled")
-
-    @_builtins.property
-    @pulumi.getter(name="longQueryTime")
-    def long_query_time(self) -> Optional[_builtins.float]:
-        """
-        Long query time threshold
-        """
-        return pulumi.get(self, "long_query_time")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecLogsSlowQueryPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "longQueryTime":
-            suggest = "long_query_time"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsSlowQueryPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecLogsSlowQueryPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecLogsSlowQueryPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 collect: Optional[_builtins.bool] = None,
-                 enabled: Optional[_builtins.bool] = None,
-                 long_query_time: Optional[_builtins.float] = None):
-        """
-        :param _builtins.bool collect: Whether slow query logging data should be collected. Implies that the logging should be enabled.
-        :param _builtins.bool enabled: Whether slow query logging should be enabled
-        :param _builtins.float long_query_time: Long query time threshold
-        """
-        if collect is not None:
-            pulumi.set(__self__, "collect", collect)
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-        if long_query_time is not None:
-            pulumi.set(__self__, "long_query_time", long_query_time)
-
-    @_builtins.property
-    @pulumi.getter
-    def collect(self) -> Optional[_builtins.bool]:
-        """
-        Whether slow query logging data should be collected. Implies that the logging should be enabled.
-        """
-        return pulumi.get(self, "collect")
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.bool]:
-        """
-        Whether slow query logging should be enabled
-        """
-        return pulumi.get(self, "enabled")
-
-    @_builtins.property
-    @pulumi.getter(name="longQueryTime")
-    def long_query_time(self) -> Optional[_builtins.float]:
-        """
-        Long query time threshold
-        """
-        return pulumi.get(self, "long_query_time")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecMetrics(dict):
-    """
-    Configuration of a Prometheus-style metrics provider
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "monitorSpec":
-            suggest = "monitor_spec"
-        elif key == "tlsSecret":
-            suggest = "tls_secret"
-        elif key == "webConfig":
-            suggest = "web_config"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecMetrics. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecMetrics.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecMetrics.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 enable: Optional[_builtins.bool] = None,
-                 image: Optional[_builtins.str] = None,
-                 monitor: Optional[_builtins.bool] = None,
-                 monitor_spec: Optional[Mapping[str, Any]] = None,
-                 options: Optional[Sequence[_builtins.str]] = None,
-                 tls_secret: Optional[_builtins.str] = None,
-                 web_config: Optional[_builtins.str] = None):
-        """
-        Configuration of a Prometheus-style metrics provider
-
-        :param _builtins.bool enable: Toggle to enable or disable the metrics sidecar
-        :param _builtins.str image: Name of an image to be used for the metrics sidecar, if provided metrics will be enabled
-        :param _builtins.bool monitor: Create a ServiceMonitor for Prometheus Operator
-        :param Mapping[str, Any] monitor_spec: Custom configuration for the ServiceMonitor object
-        :param Sequence[_builtins.str] options: Options passed to the metrics provider as command line arguments
-        :param _builtins.str tls_secret: Name of a Secret with TLS certificate, key and CA, which will be mounted at /tls into the container an can be used from webConfig
-        :param _builtins.str web_config: Name of a ConfigMap with a web.config file, if this option is provided a command line option --web.config.file is added
-        """
-        if enable is not None:
-            pulumi.set(__self__, "enable", enable)
-        if image is not None:
-            pulumi.set(__self__, "image", image)
-        if monitor is not None:
-            pulumi.set(__self__, "monitor", monitor)
-        if monitor_spec is not None:
-            pulumi.set(__self__, "monitor_spec", monitor_spec)
-        if options is not None:
-            pulumi.set(__self__, "options", options)
-        if tls_secret is not None:
-            pulumi.set(__self__, "tls_secret", tls_secret)
-        if web_config is not None:
-            pulumi.set(__self__, "web_config", web_config)
-
-    @_builtins.property
-    @pulumi.getter
-    def enable(self) -> Optional[_builtins.bool]:
-        """
-        Toggle to enable or disable the metrics sidecar
-        """
-        return pulumi.get(self, "enable")
-
-    @_builtins.property
-    @pulumi.getter
-    def image(self) -> Optional[_builtins.str]:
-        """
-        Name of an image to be used for the metrics sidecar, if provided metrics will be enabled
-        """
-        return pulumi.get(self, "image")
-
-    @_builtins.property
-    @pulumi.getter
-    def monitor(self) -> Optional[_builtins.bool]:
-        """
-        Create a ServiceMonitor for Prometheus Operator
-        """
-        return pulumi.get(self, "monitor")
-
-    @_builtins.property
-    @pulumi.getter(name="monitorSpec")
-    def monitor_spec(self) -> Optional[Mapping[str, Any]]:
-        """
-        Custom configuration for the ServiceMonitor object
-        """
-        return pulumi.get(self, "monitor_spec")
-
-    @_builtins.property
-    @pulumi.getter
-    def options(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Options passed to the metrics provider as command line arguments
-        """
-        return pulumi.get(self, "options")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsSecret")
-    def tls_secret(self) -> Optional[_builtins.str]:
-        """
-        Name of a Secret with TLS certificate, key and CA, which will be mounted at /tls into the container an can be used from webConfig
-        """
-        return pulumi.get(self, "tls_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="webConfig")
-    def web_config(self) -> Optional[_builtins.str]:
-        """
-        Name of a ConfigMap with a web.config file, if this option is provided a command line option --web.config.file is added
-        """
-        return pulumi.get(self, "web_config")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecMetricsPatch(dict):
-    """
-    Configuration of a Prometheus-style metrics provider
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "monitorSpec":
-            suggest = "monitor_spec"
-        elif key == "tlsSecret":
-            suggest = "tls_secret"
-        elif key == "webConfig":
-            suggest = "web_config"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecMetricsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecMetricsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecMetricsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 enable: Optional[_builtins.bool] = None,
-                 image: Optional[_builtins.str] = None,
-                 monitor: Optional[_builtins.bool] = None,
-                 monitor_spec: Optional[Mapping[str, Any]] = None,
-                 options: Optional[Sequence[_builtins.str]] = None,
-                 tls_secret: Optional[_builtins.str] = None,
-                 web_config: Optional[_builtins.str] = None):
-        """
-        Configuration of a Prometheus-style metrics provider
-
-        :param _builtins.bool enable: Toggle to enable or disable the metrics sidecar
-        :param _builtins.str image: Name of an image to be used for the metrics sidecar, if provided metrics will be enabled
-        :param _builtins.bool monitor: Create a ServiceMonitor for Prometheus Operator
-        :param Mapping[str, Any] monitor_spec: Custom configuration for the ServiceMonitor object
-        :param Sequence[_builtins.str] options: Options passed to the metrics provider as command line arguments
-        :param _builtins.str tls_secret: Name of a Secret with TLS certificate, key and CA, which will be mounted at /tls into the container an can be used from webConfig
-        :param _builtins.str web_config: Name of a ConfigMap with a web.config file, if this option is provided a command line option --web.config.file is added
-        """
-        if enable is not None:
-            pulumi.set(__self__, "enable", enable)
-        if image is not None:
-            pulumi.set(__self__, "image", image)
-        if monitor is not None:
-            pulumi.set(__self__, "monitor", monitor)
-        if monitor_spec is not None:
-            pulumi.set(__self__, "monitor_spec", monitor_spec)
-        if options is not None:
-            pulumi.set(__self__, "options", options)
-        if tls_secret is not None:
-            pulumi.set(__self__, "tls_secret", tls_secret)
-        if web_config is not None:
-            pulumi.set(__self__, "web_config", web_config)
-
-    @_builtins.property
-    @pulumi.getter
-    def enable(self) -> Optional[_builtins.bool]:
-        """
-        Toggle to enable or disable the metrics sidecar
-        """
-        return pulumi.get(self, "enable")
-
-    @_builtins.property
-    @pulumi.getter
-    def image(self) -> Optional[_builtins.str]:
-        """
-        Name of an image to be used for the metrics sidecar, if provided metrics will be enabled
-        """
-        return pulumi.get(self, "image")
-
-    @_builtins.property
-    @pulumi.getter
-    def monitor(self) -> Optional[_builtins.bool]:
-        """
-        Create a ServiceMonitor for Prometheus Operator
-        """
-        return pulumi.get(self, "monitor")
-
-    @_builtins.property
-    @pulumi.getter(name="monitorSpec")
-    def monitor_spec(self) -> Optional[Mapping[str, Any]]:
-        """
-        Custom configuration for the ServiceMonitor object
-        """
-        return pulumi.get(self, "monitor_spec")
-
-    @_builtins.property
-    @pulumi.getter
-    def options(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Options passed to the metrics provider as command line arguments
-        """
-        return pulumi.get(self, "options")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsSecret")
-    def tls_secret(self) -> Optional[_builtins.str]:
-        """
-        Name of a Secret with TLS certificate, key and CA, which will be mounted at /tls into the container an can be used from webConfig
-        """
-        return pulumi.get(self, "tls_secret")
-
-    @_builtins.property
-    @pulumi.getter(name="webConfig")
-    def web_config(self) -> Optional[_builtins.str]:
-        """
-        Name of a ConfigMap with a web.config file, if this option is provided a command line option --web.config.file is added
-        """
-        return pulumi.get(self, "web_config")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "backupProfiles":
-            suggest = "backup_profiles"
-        elif key == "backupSchedules":
-            suggest = "backup_schedules"
-        elif key == "baseServerId":
-            suggest = "base_server_id"
-        elif key == "datadirPermissions":
-            suggest = "datadir_permissions"
-        elif key == "datadirVolumeClaimTemplate":
-            suggest = "datadir_volume_claim_template"
-        elif key == "imagePullPolicy":
-            suggest = "image_pull_policy"
-        elif key == "imagePullSecrets":
-            suggest = "image_pull_secrets"
-        elif key == "imageRepository":
-            suggest = "image_repository"
-        elif key == "initDB":
-            suggest = "init_db"
-        elif key == "instanceService":
-            suggest = "instance_service"
-        elif key == "podAnnotations":
-            suggest = "pod_annotations"
-        elif key == "podLabels":
-            suggest = "pod_labels"
-        elif key == "podSpec":
-            suggest = "pod_spec"
-        elif key == "readReplicas":
-            suggest = "read_replicas"
-        elif key == "secretName":
-            suggest = "secret_name"
-        elif key == "serviceAccountName":
-            suggest = "service_account_name"
-        elif key == "serviceFqdnTemplate":
-            suggest = "service_fqdn_template"
-        elif key == "tlsCASecretName":
-            suggest = "tls_ca_secret_name"
-        elif key == "tlsSecretName":
-            suggest = "tls_secret_name"
-        elif key == "tlsUseSelfSigned":
-            suggest = "tls_use_self_signed"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 backup_profiles: Optional[Sequence[Mapping[str, Any]]] = None,
-                 backup_schedules: Optional[Sequence[Mapping[str, Any]]] = None,
-                 base_server_id: Optional[_builtins.int] = None,
-                 datadir_permissions: Optional['outputs.InnoDBClusterSpecDatadirPermissionsPatch'] = None,
-                 datadir_volume_claim_template: Optional[Mapping[str, Any]] = None,
-                 edition: Optional[_builtins.str] = None,
-                 image_pull_policy: Optional[_builtins.str] = None,
-                 image_pull_secrets: Optional[Sequence['outputs.InnoDBClusterSpecImagePullSecretsPatch']] = None,
-                 image_repository: Optional[_builtins.str] = None,
-                 init_db: Optional[Mapping[str, Any]] = None,
-                 instance_service: Optional['outputs.InnoDBClusterSpecInstanceServicePatch'] = None,
-                 instances: Optional[_builtins.int] = None,
-                 keyring: Optional['outputs.InnoDBClusterSpecKeyringPatch'] = None,
-                 logs: Optional['outputs.InnoDBClusterSpecLogsPatch'] = None,
-                 metrics: Optional['outputs.InnoDBClusterSpecMetricsPatch'] = None,
-                 mycnf: Optional[_builtins.str] = None,
-                 pod_annotations: Optional[Mapping[str, Any]] = None,
-                 pod_labels: Optional[Mapping[str, Any]] = None,
-                 pod_spec: Optional[Mapping[str, Any]] = None,
-                 read_replicas: Optional[Sequence['outputs.InnoDBClusterSpecReadReplicasPatch']] = None,
-                 router: Optional['outputs.InnoDBClusterSpecRouterPatch'] = None,
-                 secret_name: Optional[_builtins.str] = None,
-                 service: Optional['outputs.InnoDBClusterSpecServicePatch'] = None,
-                 service_account_name: Optional[_builtins.str] = None,
-                 service_fqdn_template: Optional[_builtins.str] = None,
-                 tls_ca_secret_name: Optional[_builtins.str] = None,
-                 tls_secret_name: Optional[_builtins.str] = None,
-                 tls_use_self_signed: Optional[_builtins.bool] = None,
-                 version: Optional[_builtins.str] = None):
-        """
-        :param Sequence[Mapping[str, Any]] backup_profiles: Backup profile specifications for the cluster, which can be referenced from backup schedules and one-off backup jobs
-        :param Sequence[Mapping[str, Any]] backup_schedules: Schedules for periodically executed backups
-        :param _builtins.int base_server_id: Base value for MySQL server_id for instances in the cluster
-        :param Mapping[str, Any] datadir_volume_claim_template: Template for a PersistentVolumeClaim, to be used as datadir
-        :param _builtins.str edition: MySQL Server Edition (community or enterprise)
-        :param _builtins.str image_pull_policy: Defaults to Always, but set to IfNotPresent in deploy-operator.yaml when deploying Operator
-        :param _builtins.str image_repository: Repository where images are pulled from; defaults to container-registry.oracle.com/mysql
-        :param _builtins.int instances: Number of MySQL replica instances for the cluster
-        :param _builtins.str mycnf: Custom configuration additions for my.cnf
-        :param Mapping[str, Any] pod_spec: Customization specification to be merged into the InnoDBCluster StatefulSet pod template. IMPORTANT: podSpec is regarded only during StatefulSet buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the InnoDBCluster StatefulSet will not be updated
-        :param _builtins.str secret_name: Name of a generic type Secret containing root/default account password
-        :param _builtins.str service_fqdn_template: Template for a FQDN resolving to the cluster's headless instance Service and individual Pods
-        :param _builtins.str tls_ca_secret_name: Name of a generic type Secret containing CA (ca.pem) and optional CRL (crl.pem) for SSL
-        :param _builtins.str tls_secret_name: Name of a TLS type Secret containing Server certificate and private key for SSL
-        :param _builtins.bool tls_use_self_signed: Enables use of self-signed TLS certificates, reducing or disabling TLS based security verifications
-        :param _builtins.str version: MySQL Server version
-        """
-        if backup_profiles is not None:
-            pulumi.set(__self__, "backup_profiles", backup_profiles)
-        if backup_schedules is not None:
-            pulumi.set(__self__, "backup_schedules", backup_schedules)
-        if base_server_id is not None:
-            pulumi.set(__self__, "base_server_id", base_server_id)
-        if datadir_permissions is not None:
-            pulumi.set(__self__, "datadir_permissions", datadir_permissions)
-        if datadir_volume_claim_template is not None:
-            pulumi.set(__self__, "datadir_volume_claim_template", datadir_volume_claim_template)
-        if edition is not None:
-            pulumi.set(__self__, "edition", edition)
-        if image_pull_policy is not None:
-            pulumi.set(__self__, "image_pull_policy", image_pull_policy)
-        if image_pull_secrets is not None:
-            pulumi.set(__self__, "image_pull_secrets", image_pull_secrets)
-        if image_repository is not None:
-            pulumi.set(__self__, "image_repository", image_repository)
-        if init_db is not None:
-            pulumi.set(__self__, "init_db", init_db)
-        if instance_service is not None:
-            pulumi.set(__self__, "instance_service", instance_service)
-        if instances is not None:
-            pulumi.set(__self__, "instances", instances)
-        if keyring is not None:
-            pulumi.set(__self__, "keyring", keyring)
-        if logs is not None:
-            pulumi.set(__self__, "logs", logs)
-        if metrics is not None:
-            pulumi.set(__self__, "metrics", metrics)
-        if mycnf is not None:
-            pulumi.set(__self__, "mycnf", mycnf)
-        if pod_annotations is not None:
-            pulumi.set(__self__, "pod_annotations", pod_annotations)
-        if pod_labels is not None:
-            pulumi.set(__self__, "pod_labels", pod_labels)
-        if pod_spec is not None:
-            pulumi.set(__self__, "pod_spec", pod_spec)
-        if read_replicas is not None:
-            pulumi.set(__self__, "read_replicas", read_replicas)
-        if router is not None:
-            pulumi.set(__self__, "router", router)
-        if secret_name is not None:
-            pulumi.set(__self__, "secret_name", secret_name)
-        if service is not None:
-            pulumi.set(__self__, "service", service)
-        if service_account_name is not None:
-            pulumi.set(__self__, "service_account_name", service_account_name)
-        if service_fqdn_template is not None:
-            pulumi.set(__self__, "service_fqdn_template", service_fqdn_template)
-        if tls_ca_secret_name is not None:
-            pulumi.set(__self__, "tls_ca_secret_name", tls_ca_secret_name)
-        if tls_secret_name is not None:
-            pulumi.set(__self__, "tls_secret_name", tls_secret_name)
-        if tls_use_self_signed is not None:
-            pulumi.set(__self__, "tls_use_self_signed", tls_use_self_signed)
-        if version is not None:
-            pulumi.set(__self__, "version", version)
-
-    @_builtins.property
-    @pulumi.getter(name="backupProfiles")
-    def backup_profiles(self) -> Optional[Sequence[Mapping[str, Any]]]:
-        """
-        Backup profile specifications for the cluster, which can be referenced from backup schedules and one-off backup jobs
-        """
-        return pulumi.get(self, "backup_profiles")
-
-    @_builtins.property
-    @pulumi.getter(name="backupSchedules")
-    def backup_schedules(self) -> Optional[Sequence[Mapping[str, Any]]]:
-        """
-        Schedules for periodically executed backups
-        """
-        return pulumi.get(self, "backup_schedules")
-
-    @_builtins.property
-    @pulumi.getter(name="baseServerId")
-    def base_server_id(self) -> Optional[_builtins.int]:
-        """
-        Base value for MySQL server_id for instances in the cluster
-        """
-        return pulumi.get(self, "base_server_id")
-
-    @_builtins.property
-    @pulumi.getter(name="datadirPermissions")
-    def datadir_permissions(self) -> Optional['outputs.InnoDBClusterSpecDatadirPermissionsPatch']:
-        return pulumi.get(self, "datadir_permissions")
-
-    @_builtins.property
-    @pulumi.getter(name="datadirVolumeClaimTemplate")
-    def datadir_volume_claim_template(self) -> Optional[Mapping[str, Any]]:
-        """
-        Template for a PersistentVolumeClaim, to be used as datadir
-        """
-        return pulumi.get(self, "datadir_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter
-    def edition(self) -> Optional[_builtins.str]:
-        """
-        MySQL Server Edition (community or enterprise)
-        """
-        return pulumi.get(self, "edition")
-
-    @_builtins.property
-    @pulumi.getter(name="imagePullPolicy")
-    def image_pull_policy(self) -> Optional[_builtins.str]:
-        """
-        Defaults to Always, but set to IfNotPresent in deploy-operator.yaml when deploying Operator
-        """
-        return pulumi.get(self, "image_pull_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="imagePullSecrets")
-    def image_pull_secrets(self) -> Optional[Sequence['outputs.InnoDBClusterSpecImagePullSecretsPatch']]:
-        return pulumi.get(self, "image_pull_secrets")
-
-    @_builtins.property
-    @pulumi.getter(name="imageRepository")
-    def image_repository(self) -> Optional[_builtins.str]:
-        """
-        Repository where images are pulled from; defaults to container-registry.oracle.com/mysql
-        """
-        return pulumi.get(self, "image_repository")
-
-    @_builtins.property
-    @pulumi.getter(name="initDB")
-    def init_db(self) -> Optional[Mapping[str, Any]]:
-        return pulumi.get(self, "init_db")
-
-    @_builtins.property
-    @pulumi.getter(name="instanceService")
-    def instance_service(self) -> Optional['outputs.InnoDBClusterSpecInstanceServicePatch']:
-        return pulumi.get(self, "instance_service")
-
-    @_builtins.property
-    @pulumi.getter
-    def instances(self) -> Optional[_builtins.int]:
-        """
-        Number of MySQL replica instances for the cluster
-        """
-        return pulumi.get(self, "instances")
-
-    @_builtins.property
-    @pulumi.getter
-    def keyring(self) -> Optional['outputs.InnoDBClusterSpecKeyringPatch']:
-        return pulumi.get(self, "keyring")
-
-    @_builtins.property
-    @pulumi.getter
-    def logs(self) -> Optional['outputs.InnoDBClusterSpecLogsPatch']:
-        return pulumi.get(self, "logs")
-
-    @_builtins.property
-    @pulumi.getter
-    def metrics(self) -> Optional['outputs.InnoDBClusterSpecMetricsPatch']:
-        return pulumi.get(self, "metrics")
-
-    @_builtins.property
-    @pulumi.getter
-    def mycnf(self) -> Optional[_builtins.str]:
-        """
-        Custom configuration additions for my.cnf
-        """
-        return pulumi.get(self, "mycnf")
-
-    @_builtins.property
-    @pulumi.getter(name="podAnnotations")
-    def pod_annotations(self) -> Optional[Mapping[str, Any]]:
-        return pulumi.get(self, "pod_annotations")
-
-    @_builtins.property
-    @pulumi.getter(name="podLabels")
-    def pod_labels(self) -> Optional[Mapping[str, Any]]:
-        return pulumi.get(self, "pod_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="podSpec")
-    def pod_spec(self) -> Optional[Mapping[str, Any]]:
-        """
-        Customization specification to be merged into the InnoDBCluster StatefulSet pod template. IMPORTANT: podSpec is regarded only during StatefulSet buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the InnoDBCluster StatefulSet will not be updated
-        """
-        return pulumi.get(self, "pod_spec")
-
-    @_builtins.property
-    @pulumi.getter(name="readReplicas")
-    def read_replicas(self) -> Optional[Sequence['outputs.InnoDBClusterSpecReadReplicasPatch']]:
-        return pulumi.get(self, "read_replicas")
-
-    @_builtins.property
-    @pulumi.getter
-    def router(self) -> Optional['outputs.InnoDBClusterSpecRouterPatch']:
-        return pulumi.get(self, "router")
-
-    @_builtins.property
-    @pulumi.getter(name="secretName")
-    def secret_name(self) -> Optional[_builtins.str]:
-        """
-        Name of a generic type Secret containing root/default account password
-        """
-        return pulumi.get(self, "secret_name")
-
-    @_builtins.property
-    @pulumi.getter
-    def service(self) -> Optional['outputs.InnoDBClusterSpecServicePatch']:
-        return pulumi.get(self, "service")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceAccountName")
-    def service_account_name(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "service_account_name")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceFqdnTemplate")
-    def service_fqdn_template(self) -> Optional[_builtins.str]:
-        """
-        Template for a FQDN resolving to the cluster's headless instance Service and individual Pods
-        """
-        return pulumi.get(self, "service_fqdn_template")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsCASecretName")
-    def tls_ca_secret_name(self) -> Optional[_builtins.str]:
-        """
-        Name of a generic type Secret containing CA (ca.pem) and optional CRL (crl.pem) for SSL
-        """
-        return pulumi.get(self, "tls_ca_secret_name")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsSecretName")
-    def tls_secret_name(self) -> Optional[_builtins.str]:
-        """
-        Name of a TLS type Secret containing Server certificate and private key for SSL
-        """
-        return pulumi.get(self, "tls_secret_name")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsUseSelfSigned")
-    def tls_use_self_signed(self) -> Optional[_builtins.bool]:
-        """
-        Enables use of self-signed TLS certificates, reducing or disabling TLS based security verifications
-        """
-        return pulumi.get(self, "tls_use_self_signed")
-
-    @_builtins.property
-    @pulumi.getter
-    def version(self) -> Optional[_builtins.str]:
-        """
-        MySQL Server version
-        """
-        return pulumi.get(self, "version")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecReadReplicas(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "baseServerId":
-            suggest = "base_server_id"
-        elif key == "datadirVolumeClaimTemplate":
-            suggest = "datadir_volume_claim_template"
-        elif key == "podAnnotations":
-            suggest = "pod_annotations"
-        elif key == "podLabels":
-            suggest = "pod_labels"
-        elif key == "podSpec":
-            suggest = "pod_spec"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecReadReplicas. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecReadReplicas.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecReadReplicas.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 base_server_id: Optional[_builtins.int] = None,
-                 datadir_volume_claim_template: Optional[Mapping[str, Any]] = None,
-                 instances: Optional[_builtins.int] = None,
-                 mycnf: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 pod_annotations: Optional[Mapping[str, Any]] = None,
-                 pod_labels: Optional[Mapping[str, Any]] = None,
-                 pod_spec: Optional[Mapping[str, Any]] = None,
-                 version: Optional[_builtins.str] = None):
-        """
-        :param _builtins.int base_server_id: Base value for MySQL server_id for instances of the readReplica, if 0 it will be assigned automatically
-        :param Mapping[str, Any] datadir_volume_claim_template: Template for a PersistentVolumeClaim, to be used as datadir
-        :param _builtins.int instances: Number of MySQL instances for the set of read replica
-        :param _builtins.str mycnf: Custom configuration additions for my.cnf
-        :param Mapping[str, Any] pod_spec: Customization specification to be merged into the InnoDBCluster StatefulSet pod template. IMPORTANT: podSpec is regarded only during StatefulSet buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the InnoDBCluster StatefulSet will not be updated
-        :param _builtins.str version: MySQL Server version
-        """
-        if base_server_id is not None:
-            pulumi.set(__self__, "base_server_id", base_server_id)
-        if datadir_volume_claim_template is not None:
-            pulumi.set(__self__, "datadir_volume_claim_template", datadir_volume_claim_template)
-        if instances is not None:
-            pulumi.set(__self__, "instances", instances)
-        if mycnf is not None:
-            pulumi.set(__self__, "mycnf", mycnf)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if pod_annotations is not None:
-            pulumi.set(__self__, "pod_annotations", pod_annotations)
-        if pod_labels is not None:
-            pulumi.set(__self__, "pod_labels", pod_labels)
-        if pod_spec is not None:
-            pulumi.set(__self__, "pod_spec", pod_spec)
-        if version is not None:
-            pulumi.set(__self__, "version", version)
-
-    @_builtins.property
-    @pulumi.getter(name="baseServerId")
-    def base_server_id(self) -> Optional[_builtins.int]:
-        """
-        Base value for MySQL server_id for instances of the readReplica, if 0 it will be assigned automatically
-        """
-        return pulumi.get(self, "base_server_id")
-
-    @_builtins.property
-    @pulumi.getter(name="datadirVolumeClaimTemplate")
-    def datadir_volume_claim_template(self) -> Optional[Mapping[str, Any]]:
-        """
-        Template for a PersistentVolumeClaim, to be used as datadir
-        """
-        return pulumi.get(self, "datadir_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter
-    def instances(self) -> Optional[_builtins.int]:
-        """
-        Number of MySQL instances for the set of read replica
-        """
-        return pulumi.get(self, "instances")
-
-    @_builtins.property
-    @pulumi.getter
-    def mycnf(self) -> Optional[_builtins.str]:
-        """
-        Custom configuration additions for my.cnf
-        """
-        return pulumi.get(self, "mycnf")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter(name="podAnnotations")
-    def pod_annotations(self) -> Optional[Mapping[str, Any]]:
-        return pulumi.get(self, "pod_annotations")
-
-    @_builtins.property
-    @pulumi.getter(name="podLabels")
-    def pod_labels(self) -> Optional[Mapping[str, Any]]:
-        return pulumi.get(self, "pod_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="podSpec")
-    def pod_spec(self) -> Optional[Mapping[str, Any]]:
-        """
-        Customization specification to be merged into the InnoDBCluster StatefulSet pod template. IMPORTANT: podSpec is regarded only during StatefulSet buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the InnoDBCluster StatefulSet will not be updated
-        """
-        return pulumi.get(self, "pod_spec")
-
-    @_builtins.property
-    @pulumi.getter
-    def version(self) -> Optional[_builtins.str]:
-        """
-        MySQL Server version
-        """
-        return pulumi.get(self, "version")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecReadReplicasPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "baseServerId":
-            suggest = "base_server_id"
-        elif key == "datadirVolumeClaimTemplate":
-            suggest = "datadir_volume_claim_template"
-        elif key == "podAnnotations":
-            suggest = "pod_annotations"
-        elif key == "podLabels":
-            suggest = "pod_labels"
-        elif key == "podSpec":
-            suggest = "pod_spec"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecReadReplicasPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecReadReplicasPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecReadReplicasPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 base_server_id: Optional[_builtins.int] = None,
-                 datadir_volume_claim_template: Optional[Mapping[str, Any]] = None,
-                 instances: Optional[_builtins.int] = None,
-                 mycnf: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 pod_annotations: Optional[Mapping[str, Any]] = None,
-                 pod_labels: Optional[Mapping[str, Any]] = None,
-                 pod_spec: Optional[Mapping[str, Any]] = None,
-                 version: Optional[_builtins.str] = None):
-        """
-        :param _builtins.int base_server_id: Base value for MySQL server_id for instances of the readReplica, if 0 it will be assigned automatically
-        :param Mapping[str, Any] datadir_volume_claim_template: Template for a PersistentVolumeClaim, to be used as datadir
-        :param _builtins.int instances: Number of MySQL instances for the set of read replica
-        :param _builtins.str mycnf: Custom configuration additions for my.cnf
-        :param Mapping[str, Any] pod_spec: Customization specification to be merged into the InnoDBCluster StatefulSet pod template. IMPORTANT: podSpec is regarded only during StatefulSet buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the InnoDBCluster StatefulSet will not be updated
-        :param _builtins.str version: MySQL Server version
-        """
-        if base_server_id is not None:
-            pulumi.set(__self__, "base_server_id", base_server_id)
-        if datadir_volume_claim_template is not None:
-            pulumi.set(__self__, "datadir_volume_claim_template", datadir_volume_claim_template)
-        if instances is not None:
-            pulumi.set(__self__, "instances", instances)
-        if mycnf is not None:
-            pulumi.set(__self__, "mycnf", mycnf)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if pod_annotations is not None:
-            pulumi.set(__self__, "pod_annotations", pod_annotations)
-        if pod_labels is not None:
-            pulumi.set(__self__, "pod_labels", pod_labels)
-        if pod_spec is not None:
-            pulumi.set(__self__, "pod_spec", pod_spec)
-        if version is not None:
-            pulumi.set(__self__, "version", version)
-
-    @_builtins.property
-    @pulumi.getter(name="baseServerId")
-    def base_server_id(self) -> Optional[_builtins.int]:
-        """
-        Base value for MySQL server_id for instances of the readReplica, if 0 it will be assigned automatically
-        """
-        return pulumi.get(self, "base_server_id")
-
-    @_builtins.property
-    @pulumi.getter(name="datadirVolumeClaimTemplate")
-    def datadir_volume_claim_template(self) -> Optional[Mapping[str, Any]]:
-        """
-        Template for a PersistentVolumeClaim, to be used as datadir
-        """
-        return pulumi.get(self, "datadir_volume_claim_template")
-
-    @_builtins.property
-    @pulumi.getter
-    def instances(self) -> Optional[_builtins.int]:
-        """
-        Number of MySQL instances for the set of read replica
-        """
-        return pulumi.get(self, "instances")
-
-    @_builtins.property
-    @pulumi.getter
-    def mycnf(self) -> Optional[_builtins.str]:
-        """
-        Custom configuration additions for my.cnf
-        """
-        return pulumi.get(self, "mycnf")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter(name="podAnnotations")
-    def pod_annotations(self) -> Optional[Mapping[str, Any]]:
-        return pulumi.get(self, "pod_annotations")
-
-    @_builtins.property
-    @pulumi.getter(name="podLabels")
-    def pod_labels(self) -> Optional[Mapping[str, Any]]:
-        return pulumi.get(self, "pod_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="podSpec")
-    def pod_spec(self) -> Optional[Mapping[str, Any]]:
-        """
-        Customization specification to be merged into the InnoDBCluster StatefulSet pod template. IMPORTANT: podSpec is regarded only during StatefulSet buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the InnoDBCluster StatefulSet will not be updated
-        """
-        return pulumi.get(self, "pod_spec")
-
-    @_builtins.property
-    @pulumi.getter
-    def version(self) -> Optional[_builtins.str]:
-        """
-        MySQL Server version
-        """
-        return pulumi.get(self, "version")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecRouter(dict):
-    """
-    MySQL Router specification
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "bootstrapOptions":
-            suggest = "bootstrap_options"
-        elif key == "podAnnotations":
-            suggest = "pod_annotations"
-        elif key == "podLabels":
-            suggest = "pod_labels"
-        elif key == "podSpec":
-            suggest = "pod_spec"
-        elif key == "routingOptions":
-            suggest = "routing_options"
-        elif key == "tlsSecretName":
-            suggest = "tls_secret_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecRouter. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecRouter.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecRouter.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 bootstrap_options: Optional[Sequence[_builtins.str]] = None,
-                 instances: Optional[_builtins.int] = None,
-                 options: Optional[Sequence[_builtins.str]] = None,
-                 pod_annotations: Optional[Mapping[str, Any]] = None,
-                 pod_labels: Optional[Mapping[str, Any]] = None,
-                 pod_spec: Optional[Mapping[str, Any]] = None,
-                 routing_options: Optional['outputs.InnoDBClusterSpecRouterRoutingOptions'] = None,
-                 tls_secret_name: Optional[_builtins.str] = None,
-                 version: Optional[_builtins.str] = None):
-        """
-        MySQL Router specification
-
-        :param Sequence[_builtins.str] bootstrap_options: Command line options passed to MySQL Router while bootstrapping
-        :param _builtins.int instances: Number of MySQL Router instances to deploy
-        :param Sequence[_builtins.str] options: Command line options passed to MySQL Router while running
-        :param Mapping[str, Any] pod_spec: Customization specification to be merged into the Router Deployment pod template. IMPORTANT: podSpec is regarded only during Deployment buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the Router Deployment will not be updated
-        :param _builtins.str tls_secret_name: Name of a TLS type Secret containing MySQL Router certificate and private key used for SSL
-        :param _builtins.str version: Override MySQL Router version
-        """
-        if bootstrap_options is not None:
-            pulumi.set(__self__, "bootstrap_options", bootstrap_options)
-        if instances is not None:
-            pulumi.set(__self__, "instances", instances)
-        if options is not None:
-            pulumi.set(__self__, "options", options)
-        if pod_annotations is not None:
-            pulumi.set(__self__, "pod_annotations", pod_annotations)
-        if pod_labels is not None:
-            pulumi.set(__self__, "pod_labels", pod_labels)
-        if pod_spec is not None:
-            pulumi.set(__self__, "pod_spec", pod_spec)
-        if routing_options is not None:
-            pulumi.set(__self__, "routing_options", routing_options)
-        if tls_secret_name is not None:
-            pulumi.set(__self__, "tls_secret_name", tls_secret_name)
-        if version is not None:
-            pulumi.set(__self__, "version", version)
-
-    @_builtins.property
-    @pulumi.getter(name="bootstrapOptions")
-    def bootstrap_options(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Command line options passed to MySQL Router while bootstrapping
-        """
-        return pulumi.get(self, "bootstrap_options")
-
-    @_builtins.property
-    @pulumi.getter
-    def instances(self) -> Optional[_builtins.int]:
-        """
-        Number of MySQL Router instances to deploy
-        """
-        return pulumi.get(self, "instances")
-
-    @_builtins.property
-    @pulumi.getter
-    def options(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Command line options passed to MySQL Router while running
-        """
-        return pulumi.get(self, "options")
-
-    @_builtins.property
-    @pulumi.getter(name="podAnnotations")
-    def pod_annotations(self) -> Optional[Mapping[str, Any]]:
-        return pulumi.get(self, "pod_annotations")
-
-    @_builtins.property
-    @pulumi.getter(name="podLabels")
-    def pod_labels(self) -> Optional[Mapping[str, Any]]:
-        return pulumi.get(self, "pod_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="podSpec")
-    def pod_spec(self) -> Optional[Mapping[str, Any]]:
-        """
-        Customization specification to be merged into the Router Deployment pod template. IMPORTANT: podSpec is regarded only during Deployment buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the Router Deployment will not be updated
-        """
-        return pulumi.get(self, "pod_spec")
-
-    @_builtins.property
-    @pulumi.getter(name="routingOptions")
-    def routing_options(self) -> Optional['outputs.InnoDBClusterSpecRouterRoutingOptions']:
-        return pulumi.get(self, "routing_options")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsSecretName")
-    def tls_secret_name(self) -> Optional[_builtins.str]:
-        """
-        Name of a TLS type Secret containing MySQL Router certificate and private key used for SSL
-        """
-        return pulumi.get(self, "tls_secret_name")
-
-    @_builtins.property
-    @pulumi.getter
-    def version(self) -> Optional[_builtins.str]:
-        """
-        Override MySQL Router version
-        """
-        return pulumi.get(self, "version")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecRouterPatch(dict):
-    """
-    MySQL Router specification
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "bootstrapOptions":
-            suggest = "bootstrap_options"
-        elif key == "podAnnotations":
-            suggest = "pod_annotations"
-        elif key == "podLabels":
-            suggest = "pod_labels"
-        elif key == "podSpec":
-            suggest = "pod_spec"
-        elif key == "routingOptions":
-            suggest = "routing_options"
-        elif key == "tlsSecretName":
-            suggest = "tls_secret_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecRouterPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecRouterPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecRouterPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 bootstrap_options: Optional[Sequence[_builtins.str]] = None,
-                 instances: Optional[_builtins.int] = None,
-                 options: Optional[Sequence[_builtins.str]] = None,
-                 pod_annotations: Optional[Mapping[str, Any]] = None,
-                 pod_labels: Optional[Mapping[str, Any]] = None,
-                 pod_spec: Optional[Mapping[str, Any]] = None,
-                 routing_options: Optional['outputs.InnoDBClusterSpecRouterRoutingOptionsPatch'] = None,
-                 tls_secret_name: Optional[_builtins.str] = None,
-                 version: Optional[_builtins.str] = None):
-        """
-        MySQL Router specification
-
-        :param Sequence[_builtins.str] bootstrap_options: Command line options passed to MySQL Router while bootstrapping
-        :param _builtins.int instances: Number of MySQL Router instances to deploy
-        :param Sequence[_builtins.str] options: Command line options passed to MySQL Router while running
-        :param Mapping[str, Any] pod_spec: Customization specification to be merged into the Router Deployment pod template. IMPORTANT: podSpec is regarded only during Deployment buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the Router Deployment will not be updated
-        :param _builtins.str tls_secret_name: Name of a TLS type Secret containing MySQL Router certificate and private key used for SSL
-        :param _builtins.str version: Override MySQL Router version
-        """
-        if bootstrap_options is not None:
-            pulumi.set(__self__, "bootstrap_options", bootstrap_options)
-        if instances is not None:
-            pulumi.set(__self__, "instances", instances)
-        if options is not None:
-            pulumi.set(__self__, "options", options)
-        if pod_annotations is not None:
-            pulumi.set(__self__, "pod_annotations", pod_annotations)
-        if pod_labels is not None:
-            pulumi.set(__self__, "pod_labels", pod_labels)
-        if pod_spec is not None:
-            pulumi.set(__self__, "pod_spec", pod_spec)
-        if routing_options is not None:
-            pulumi.set(__self__, "routing_options", routing_options)
-        if tls_secret_name is not None:
-            pulumi.set(__self__, "tls_secret_name", tls_secret_name)
-        if version is not None:
-            pulumi.set(__self__, "version", version)
-
-    @_builtins.property
-    @pulumi.getter(name="bootstrapOptions")
-    def bootstrap_options(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Command line options passed to MySQL Router while bootstrapping
-        """
-        return pulumi.get(self, "bootstrap_options")
-
-    @_builtins.property
-    @pulumi.getter
-    def instances(self) -> Optional[_builtins.int]:
-        """
-        Number of MySQL Router instances to deploy
-        """
-        return pulumi.get(self, "instances")
-
-    @_builtins.property
-    @pulumi.getter
-    def options(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Command line options passed to MySQL Router while running
-        """
-        return pulumi.get(self, "options")
-
-    @_builtins.property
-    @pulumi.getter(name="podAnnotations")
-    def pod_annotations(self) -> Optional[Mapping[str, Any]]:
-        return pulumi.get(self, "pod_annotations")
-
-    @_builtins.property
-    @pulumi.getter(name="podLabels")
-    def pod_labels(self) -> Optional[Mapping[str, Any]]:
-        return pulumi.get(self, "pod_labels")
-
-    @_builtins.property
-    @pulumi.getter(name="podSpec")
-    def pod_spec(self) -> Optional[Mapping[str, Any]]:
-        """
-        Customization specification to be merged into the Router Deployment pod template. IMPORTANT: podSpec is regarded only during Deployment buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the Router Deployment will not be updated
-        """
-        return pulumi.get(self, "pod_spec")
-
-    @_builtins.property
-    @pulumi.getter(name="routingOptions")
-    def routing_options(self) -> Optional['outputs.InnoDBClusterSpecRouterRoutingOptionsPatch']:
-        return pulumi.get(self, "routing_options")
-
-    @_builtins.property
-    @pulumi.getter(name="tlsSecretName")
-    def tls_secret_name(self) -> Optional[_builtins.str]:
-        """
-        Name of a TLS type Secret containing MySQL Router certificate and private key used for SSL
-        """
-        return pulumi.get(self, "tls_secret_name")
-
-    @_builtins.property
-    @pulumi.getter
-    def version(self) -> Optional[_builtins.str]:
-        """
-        Override MySQL Router version
-        """
-        return pulumi.get(self, "version")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecRouterRoutingOptions(dict):
-    """
-    Set routing options for the cluster
-    """
-    def __init__(__self__, *,
-                 invalidated_cluster_policy: Optional[_builtins.str] = None,
-                 read_only_targets: Optional[_builtins.str] = None,
-                 stats_updates_frequency: Optional[_builtins.int] = None):
-        """
-        Set routing options for the cluster
-        """
-        if invalidated_cluster_policy is not None:
-            pulumi.set(__self__, "invalidated_cluster_policy", invalidated_cluster_policy)
-        if read_only_targets is not None:
-            pulumi.set(__self__, "read_only_targets", read_only_targets)
-        if stats_updates_frequency is not None:
-            pulumi.set(__self__, "stats_updates_frequency", stats_updates_frequency)
-
-    @_builtins.property
-    @pulumi.getter
-    def invalidated_cluster_policy(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "invalidated_cluster_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def read_only_targets(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "read_only_targets")
-
-    @_builtins.property
-    @pulumi.getter
-    def stats_updates_frequency(self) -> Optional[_builtins.int]:
-        return pulumi.get(self, "stats_updates_frequency")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecRouterRoutingOptionsPatch(dict):
-    """
-    Set routing options for the cluster
-    """
-    def __init__(__self__, *,
-                 invalidated_cluster_policy: Optional[_builtins.str] = None,
-                 read_only_targets: Optional[_builtins.str] = None,
-                 stats_updates_frequency: Optional[_builtins.int] = None):
-        """
-        Set routing options for the cluster
-        """
-        if invalidated_cluster_policy is not None:
-            pulumi.set(__self__, "invalidated_cluster_policy", invalidated_cluster_policy)
-        if read_only_targets is not None:
-            pulumi.set(__self__, "read_only_targets", read_only_targets)
-        if stats_updates_frequency is not None:
-            pulumi.set(__self__, "stats_updates_frequency", stats_updates_frequency)
-
-    @_builtins.property
-    @pulumi.getter
-    def invalidated_cluster_policy(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "invalidated_cluster_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def read_only_targets(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "read_only_targets")
-
-    @_builtins.property
-    @pulumi.getter
-    def stats_updates_frequency(self) -> Optional[_builtins.int]:
-        return pulumi.get(self, "stats_updates_frequency")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecService(dict):
-    """
-    Configuration of the Service used by applications connecting to the InnoDB Cluster
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "defaultPort":
-            suggest = "default_port"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecService. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecService.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecService.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 annotations: Optional[Mapping[str, Any]] = None,
-                 default_port: Optional[_builtins.str] = None,
-                 labels: Optional[Mapping[str, Any]] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        Configuration of the Service used by applications connecting to the InnoDB Cluster
-
-        :param Mapping[str, Any] annotations: Custom annotations for the Service
-        :param _builtins.str default_port: Target for the Service's default (3306) port. If mysql-rw traffic will go to the primary and allow read and write operations, with mysql-ro traffic goes to the replica and allows only read operations, with mysql-rw-split the router's read-write-splitting will be targeted
-        :param Mapping[str, Any] labels: Custom labels for the Service
-        """
-        if annotations is not None:
-            pulumi.set(__self__, "annotations", annotations)
-        if default_port is not None:
-            pulumi.set(__self__, "default_port", default_port)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter
-    def annotations(self) -> Optional[Mapping[str, Any]]:
-        """
-        Custom annotations for the Service
-        """
-        return pulumi.get(self, "annotations")
-
-    @_builtins.property
-    @pulumi.getter(name="defaultPort")
-    def default_port(self) -> Optional[_builtins.str]:
-        """
-        Target for the Service's default (3306) port. If mysql-rw traffic will go to the primary and allow read and write operations, with mysql-ro traffic goes to the replica and allows only read operations, with mysql-rw-split the router's read-write-splitting will be targeted
-        """
-        return pulumi.get(self, "default_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> Optional[Mapping[str, Any]]:
-        """
-        Custom labels for the Service
-        """
-        return pulumi.get(self, "labels")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class InnoDBClusterSpecServicePatch(dict):
-    """
-    Configuration of the Service used by applications connecting to the InnoDB Cluster
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "defaultPort":
-            suggest = "default_port"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecServicePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        InnoDBClusterSpecServicePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        InnoDBClusterSpecServicePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 annotations: Optional[Mapping[str, Any]] = None,
-                 default_port: Optional[_builtins.str] = None,
-                 labels: Optional[Mapping[str, Any]] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        Configuration of the Service used by applications connecting to the InnoDB Cluster
-
-        :param Mapping[str, Any] annotations: Custom annotations for the Service
-        :param _builtins.str default_port: Target for the Service's default (3306) port. If mysql-rw traffic will go to the primary and allow read and write operations, with mysql-ro traffic goes to the replica and allows only read operations, with mysql-rw-split the router's read-write-splitting will be targeted
-        :param Mapping[str, Any] labels: Custom labels for the Service
-        """
-        if annotations is not None:
-            pulumi.set(__self__, "annotations", annotations)
-        if default_port is not None:
-            pulumi.set(__self__, "default_port", default_port)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter
-    def annotations(self) -> Optional[Mapping[str, Any]]:
-        """
-        Custom annotations for the Service
-        """
-        return pulumi.get(self, "annotations")
-
-    @_builtins.property
-    @pulumi.getter(name="defaultPort")
-    def default_port(self) -> Optional[_builtins.str]:
-        """
-        Target for the Service's default (3306) port. If mysql-rw traffic will go to the primary and allow read and write operations, with mysql-ro traffic goes to the replica and allows only read operations, with mysql-rw-split the router's read-write-splitting will be targeted
-        """
-        return pulumi.get(self, "default_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> Optional[Mapping[str, Any]]:
-        """
-        Custom labels for the Service
-        """
-        return pulumi.get(self, "labels")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class MySQLBackup(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "apiVersion":
-            suggest = "api_version"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in MySQLBackup. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        MySQLBackup.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        MySQLBackup.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 api_version: Optional[_builtins.str] = None,
-                 kind: Optional[_builtins.str] = None,
-                 metadata: Optional['_meta.v1.outputs.ObjectMeta'] = None,
-                 spec: Optional['outputs.MySQLBackupSpec'] = None,
-                 status: Optional['outputs.MySQLBackupStatus'] = None):
-        """
-        :param _builtins.str api_version: APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        :param _builtins.str kind: Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        :param '_meta.v1.ObjectMetaArgs' metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        if api_version is not None:
-            pulumi.set(__self__, "api_version", 'mysql.oracle.com/v2')
-        if kind is not None:
-            pulumi.set(__self__, "kind", 'MySQLBackup')
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter(name="apiVersion")
-    def api_version(self) -> Optional[_builtins.str]:
-        """
-        APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        """
-        return pulumi.get(self, "api_version")
-
-    @_builtins.property
-    @pulumi.getter
-    def kind(self) -> Optional[_builtins.str]:
-        """
-        Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        return pulumi.get(self, "kind")
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> Optional['_meta.v1.outputs.ObjectMeta']:
-        """
-        Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        return pulumi.get(self, "metadata")
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> Optional['outputs.MySQLBackupSpec']:
-        return pulumi.get(self, "spec")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional['outputs.MySQLBackupStatus']:
-        return pulumi.get(self, "status")
-
-
-@pulumi.output_type
-class MySQLBackupSpec(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "addTimestampToBackupDirectory":
-            suggest = "add_timestamp_to_backup_directory"
-        elif key == "backupProfile":
-            suggest = "backup_profile"
-        elif key == "backupProfileName":
-            suggest = "backup_profile_name"
-        elif key == "clusterName":
-            suggest = "cluster_name"
-        elif key == "deleteBackupData":
-            suggest = "delete_backup_data"
-        elif key == "incrementalBase":
-            suggest = "incremental_base"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in MySQLBackupSpec. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        MySQLBackupSpec.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        MySQLBackupSpec.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 add_timestamp_to_backup_directory: Optional[_builtins.bool] = None,
-                 backup_profile: Optional[Mapping[str, Any]] = None,
-                 backup_profile_name: Optional[_builtins.str] = None,
-                 cluster_name: Optional[_builtins.str] = None,
-                 delete_backup_data: Optional[_builtins.bool] = None,
-                 incremental: Optional[_builtins.bool] = None,
-                 incremental_base: Optional[_builtins.str] = None):
-        """
-        :param Mapping[str, Any] backup_profile: backupProfile specification if backupProfileName is not specified
-        :param _builtins.bool incremental: MySQL Enterprise Backup only: Request taking an incremental backup
-        :param _builtins.str incremental_base: MySQL Enterprise Backup only: Base for incremental backup,  either last_backup or last_full_backup
-        """
-        if add_timestamp_to_backup_directory is not None:
-            pulumi.set(__self__, "add_timestamp_to_backup_directory", add_timestamp_to_backup_directory)
-        if backup_profile is not None:
-            pulumi.set(__self__, "backup_profile", backup_profile)
-        if backup_profile_name is not None:
-            pulumi.set(__self__, "backup_profile_name", backup_profile_name)
-        if cluster_name is not None:
-            pulumi.set(__self__, "cluster_name", cluster_name)
-        if delete_backup_data is not None:
-            pulumi.set(__self__, "delete_backup_data", delete_backup_data)
-        if incremental is not None:
-            pulumi.set(__self__, "incremental", incremental)
-        if incremental_base is not None:
-            pulumi.set(__self__, "incremental_base", incremental_base)
-
-    @_builtins.property
-    @pulumi.getter(name="addTimestampToBackupDirectory")
-    def add_timestamp_to_backup_directory(self) -> Optional[_builtins.bool]:
-        return pulumi.get(self, "add_timestamp_to_backup_directory")
-
-    @_builtins.property
-    @pulumi.getter(name="backupProfile")
-    def backup_profile(self) -> Optional[Mapping[str, Any]]:
-        """
-        backupProfile specification if backupProfileName is not specified
-        """
-        return pulumi.get(self, "backup_profile")
-
-    @_builtins.property
-    @pulumi.getter(name="backupProfileName")
-    def backup_profile_name(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "backup_profile_name")
-
-    @_builtins.property
-    @pulumi.getter(name="clusterName")
-    def cluster_name(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "cluster_name")
-
-    @_builtins.property
-    @pulumi.getter(name="deleteBackupData")
-    def delete_backup_data(self) -> Optional[_builtins.bool]:
-        return pulumi.get(self, "delete_backup_data")
-
-    @_builtins.property
-    @pulumi.getter
-    def incremental(self) -> Optional[_builtins.bool]:
-        """
-        MySQL Enterprise Backup only: Request taking an incremental backup
-        """
-        return pulumi.get(self, "incremental")
-
-    @_builtins.property
-    @pulumi.getter(name="incrementalBase")
-    def incremental_base(self) -> Optional[_builtins.str]:
-        """
-        MySQL Enterprise Backup only: Base for incremental backup,  either last_backup or last_full_backup
-        """
-        return pulumi.get(self, "incremental_base")
-
-
-@pulumi.output_type
-class MySQLBackupSpecPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "addTimestampToBackupDirectory":
-            suggest = "add_timestamp_to_backup_directory"
-        elif key == "backupProfile":
-            suggest = "backup_profile"
-        elif key == "backupProfileName":
-            suggest = "backup_profile_name"
-        elif key == "clusterName":
-            suggest = "cluster_name"
-        elif key == "deleteBackupData":
-            suggest = "delete_backup_data"
-        elif key == "incrementalBase":
-            suggest = "incremental_base"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in MySQLBackupSpecPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        MySQLBackupSpecPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        MySQLBackupSpecPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 add_timestamp_to_backup_directory: Optional[_builtins.bool] = None,
-                 backup_profile: Optional[Mapping[str, Any]] = None,
-                 backup_profile_name: Optional[_builtins.str] = None,
-                 cluster_name: Optional[_builtins.str] = None,
-                 delete_backup_data: Optional[_builtins.bool] = None,
-                 incremental: Optional[_builtins.bool] = None,
-                 incremental_base: Optional[_builtins.str] = None):
-        """
-        :param Mapping[str, Any] backup_profile: backupProfile specification if backupProfileName is not specified
-        :param _builtins.bool incremental: MySQL Enterprise Backup only: Request taking an incremental backup
-        :param _builtins.str incremental_base: MySQL Enterprise Backup only: Base for incremental backup,  either last_backup or last_full_backup
-        """
-        if add_timestamp_to_backup_directory is not None:
-            pulumi.set(__self__, "add_timestamp_to_backup_directory", add_timestamp_to_backup_directory)
-        if backup_profile is not None:
-            pulumi.set(__self__, "backup_profile", backup_profile)
-        if backup_profile_name is not None:
-            pulumi.set(__self__, "backup_profile_name", backup_profile_name)
-        if cluster_name is not None:
-            pulumi.set(__self__, "cluster_name", cluster_name)
-        if delete_backup_data is not None:
-            pulumi.set(__self__, "delete_backup_data", delete_backup_data)
-        if incremental is not None:
-            pulumi.set(__self__, "incremental", incremental)
-        if incremental_base is not None:
-            pulumi.set(__self__, "incremental_base", incremental_base)
-
-    @_builtins.property
-    @pulumi.getter(name="addTimestampToBackupDirectory")
-    def add_timestamp_to_backup_directory(self) -> Optional[_builtins.bool]:
-        return pulumi.get(self, "add_timestamp_to_backup_directory")
-
-    @_builtins.property
-    @pulumi.getter(name="backupProfile")
-    def backup_profile(self) -> Optional[Mapping[str, Any]]:
-        """
-        backupProfile specification if backupProfileName is not specified
-        """
-        return pulumi.get(self, "backup_profile")
-
-    @_builtins.property
-    @pulumi.getter(name="backupProfileName")
-    def backup_profile_name(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "backup_profile_name")
-
-    @_builtins.property
-    @pulumi.getter(name="clusterName")
-    def cluster_name(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "cluster_name")
-
-    @_builtins.property
-    @pulumi.getter(name="deleteBackupData")
-    def delete_backup_data(self) -> Optional[_builtins.bool]:
-        return pulumi.get(self, "delete_backup_data")
-
-    @_builtins.property
-    @pulumi.getter
-    def incremental(self) -> Optional[_builtins.bool]:
-        """
-        MySQL Enterprise Backup only: Request taking an incremental backup
-        """
-        return pulumi.get(self, "incremental")
-
-    @_builtins.property
-    @pulumi.getter(name="incrementalBase")
-    def incremental_base(self) -> Optional[_builtins.str]:
-        """
-        MySQL Enterprise Backup only: Base for incremental backup,  either last_backup or last_full_backup
-        """
-        return pulumi.get(self, "incremental_base")
-
-
-@pulumi.output_type
-class MySQLBackupStatus(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "completionTime":
-            suggest = "completion_time"
-        elif key == "elapsedTime":
-            suggest = "elapsed_time"
-        elif key == "ociTenancy":
-            suggest = "oci_tenancy"
-        elif key == "spaceAvailable":
-            suggest = "space_available"
-        elif key == "startTime":
-            suggest = "start_time"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in MySQLBackupStatus. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        MySQLBackupStatus.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        MySQLBackupStatus.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 bucket: Optional[_builtins.str] = None,
-                 completion_time: Optional[_builtins.str] = None,
-                 container: Optional[_builtins.str] = None,
-                 elapsed_time: Optional[_builtins.str] = None,
-                 message: Optional[_builtins.str] = None,
-                 method: Optional[_builtins.str] = None,
-                 oci_tenancy: Optional[_builtins.str] = None,
-                 output: Optional[_builtins.str] = None,
-                 size: Optional[_builtins.str] = None,
-                 source: Optional[_builtins.str] = None,
-                 space_available: Optional[_builtins.str] = None,
-                 start_time: Optional[_builtins.str] = None,
-                 status: Optional[_builtins.str] = None):
-        if bucket is not None:
-            pulumi.set(__self__, "bucket", bucket)
-        if completion_time is not None:
-            pulumi.set(__self__, "completion_time", completion_time)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-        if elapsed_time is not None:
-            pulumi.set(__self__, "elapsed_time", elapsed_time)
-        if message is not None:
-            pulumi.set(__self__, "message", message)
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if oci_tenancy is not None:
-            pulumi.set(__self__, "oci_tenancy", oci_tenancy)
-        if output is not None:
-            pulumi.set(__self__, "output", output)
-        if size is not None:
-            pulumi.set(__self__, "size", size)
-        if source is not None:
-            pulumi.set(__self__, "source", source)
-        if space_available is not None:
-            pulumi.set(__self__, "space_available", space_available)
-        if start_time is not None:
-            pulumi.set(__self__, "start_time", start_time)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter
-    def bucket(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "bucket")
-
-    @_builtins.property
-    @pulumi.getter(name="completionTime")
-    def completion_time(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "completion_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-    @_builtins.property
-    @pulumi.getter(name="elapsedTime")
-    def elapsed_time(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "elapsed_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def message(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "message")
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter(name="ociTenancy")
-    def oci_tenancy(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "oci_tenancy")
-
-    @_builtins.property
-    @pulumi.getter
-    def output(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "output")
-
-    @_builtins.property
-    @pulumi.getter
-    def size(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "size")
-
-    @_builtins.property
-    @pulumi.getter
-    def source(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "source")
-
-    @_builtins.property
-    @pulumi.getter(name="spaceAvailable")
-    def space_available(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "space_available")
-
-    @_builtins.property
-    @pulumi.getter(name="startTime")
-    def start_time(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "start_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "status")
-
-
-@pulumi.output_type
-class MySQLBackupStatusPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "completionTime":
-            suggest = "completion_time"
-        elif key == "elapsedTime":
-            suggest = "elapsed_time"
-        elif key == "ociTenancy":
-            suggest = "oci_tenancy"
-        elif key == "spaceAvailable":
-            suggest = "space_available"
-        elif key == "startTime":
-            suggest = "start_time"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in MySQLBackupStatusPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        MySQLBackupStatusPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        MySQLBackupStatusPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 bucket: Optional[_builtins.str] = None,
-                 completion_time: Optional[_builtins.str] = None,
-                 container: Optional[_builtins.str] = None,
-                 elapsed_time: Optional[_builtins.str] = None,
-                 message: Optional[_builtins.str] = None,
-                 method: Optional[_builtins.str] = None,
-                 oci_tenancy: Optional[_builtins.str] = None,
-                 output: Optional[_builtins.str] = None,
-                 size: Optional[_builtins.str] = None,
-                 source: Optional[_builtins.str] = None,
-                 space_available: Optional[_builtins.str] = None,
-                 start_time: Optional[_builtins.str] = None,
-                 status: Optional[_builtins.str] = None):
-        if bucket is not None:
-            pulumi.set(__self__, "bucket", bucket)
-        if completion_time is not None:
-            pulumi.set(__self__, "completion_time", completion_time)
-        if container is not None:
-            pulumi.set(__self__, "container", container)
-        if elapsed_time is not None:
-            pulumi.set(__self__, "elapsed_time", elapsed_time)
-        if message is not None:
-            pulumi.set(__self__, "message", message)
-        if method is not None:
-            pulumi.set(__self__, "method", method)
-        if oci_tenancy is not None:
-            pulumi.set(__self__, "oci_tenancy", oci_tenancy)
-        if output is not None:
-            pulumi.set(__self__, "output", output)
-        if size is not None:
-            pulumi.set(__self__, "size", size)
-        if source is not None:
-            pulumi.set(__self__, "source", source)
-        if space_available is not None:
-            pulumi.set(__self__, "space_available", space_available)
-        if start_time is not None:
-            pulumi.set(__self__, "start_time", start_time)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter
-    def bucket(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "bucket")
-
-    @_builtins.property
-    @pulumi.getter(name="completionTime")
-    def completion_time(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "completion_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def container(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "container")
-
-    @_builtins.property
-    @pulumi.getter(name="elapsedTime")
-    def elapsed_time(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "elapsed_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def message(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "message")
-
-    @_builtins.property
-    @pulumi.getter
-    def method(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "method")
-
-    @_builtins.property
-    @pulumi.getter(name="ociTenancy")
-    def oci_tenancy(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "oci_tenancy")
-
-    @_builtins.property
-    @pulumi.getter
-    def output(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "output")
-
-    @_builtins.property
-    @pulumi.getter
-    def size(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "size")
-
-    @_builtins.property
-    @pulumi.getter
-    def source(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "source")
-
-    @_builtins.property
-    @pulumi.getter(name="spaceAvailable")
-    def space_available(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "space_available")
-
-    @_builtins.property
-    @pulumi.getter(name="startTime")
-    def start_time(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "start_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "status")
-
-
-@pulumi.output_type
-class MySQLClusterSetFailover(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "apiVersion":
-            suggest = "api_version"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in MySQLClusterSetFailover. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        MySQLClusterSetFailover.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        MySQLClusterSetFailover.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 api_version: Optional[_builtins.str] = None,
-                 kind: Optional[_builtins.str] = None,
-                 metadata: Optional['_meta.v1.outputs.ObjectMeta'] = None,
-                 spec: Optional['outputs.MySQLClusterSetFailoverSpec'] = None,
-                 status: Optional['outputs.MySQLClusterSetFailoverStatus'] = None):
-        """
-        :param _builtins.str api_version: APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        :param _builtins.str kind: Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        :param '_meta.v1.ObjectMetaArgs' metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        if api_version is not None:
-            pulumi.set(__self__, "api_version", 'mysql.oracle.com/v2')
-        if kind is not None:
-            pulumi.set(__self__, "kind", 'MySQLClusterSetFailover')
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter(name="apiVersion")
-    def api_version(self) -> Optional[_builtins.str]:
-        """
-        APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        """
-        return pulumi.get(self, "api_version")
-
-    @_builtins.property
-    @pulumi.getter
-    def kind(self) -> Optional[_builtins.str]:
-        """
-        Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        return pulumi.get(self, "kind")
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> Optional['_meta.v1.outputs.ObjectMeta']:
-        """
-        Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        return pulumi.get(self, "metadata")
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> Optional['outputs.MySQLClusterSetFailoverSpec']:
-        return pulumi.get(self, "spec")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional['outputs.MySQLClusterSetFailoverStatus']:
-        return pulumi.get(self, "status")
-
-
-@pulumi.output_type
-class MySQLClusterSetFailoverSpec(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clusterName":
-            suggest = "cluster_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in MySQLClusterSetFailoverSpec. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        MySQLClusterSetFailoverSpec.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        MySQLClusterSetFailoverSpec.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cluster_name: Optional[_builtins.str] = None,
-                 force: Optional[_builtins.bool] = None,
-                 options: Optional['outputs.MySQLClusterSetFailoverSpecOptions'] = None):
-        if cluster_name is not None:
-            pulumi.set(__self__, "cluster_name", cluster_name)
-        if force is not None:
-            pulumi.set(__self__, "force", force)
-        if options is not None:
-            pulumi.set(__self__, "options", options)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterName")
-    def cluster_name(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "cluster_name")
-
-    @_builtins.property
-    @pulumi.getter
-    def force(self) -> Optional[_builtins.bool]:
-        return pulumi.get(self, "force")
-
-    @_builtins.property
-    @pulumi.getter
-    def options(self) -> Optional['outputs.MySQLClusterSetFailoverSpecOptions']:
-        return pulumi.get(self, "options")
-
-
-@pulumi.output_type
-class MySQLClusterSetFailoverSpecOptions(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "invalidateReplicaClusters":
-            suggest = "invalidate_replica_clusters"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in MySQLClusterSetFailoverSpecOptions. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        MySQLClusterSetFailoverSpecOptions.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        MySQLClusterSetFailoverSpecOptions.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 invalidate_replica_clusters: Optional[Sequence[_builtins.str]] = None,
-                 timeout: Optional[_builtins.int] = None):
-        if invalidate_replica_clusters is not None:
-            pulumi.set(__self__, "invalidate_replica_clusters", invalidate_replica_clusters)
-        if timeout is not None:
-            pulumi.set(__self__, "timeout", timeout)
-
-    @_builtins.property
-    @pulumi.getter(name="invalidateReplicaClusters")
-    def invalidate_replica_clusters(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "invalidate_replica_clusters")
-
-    @_builtins.property
-    @pulumi.getter
-    def timeout(self) -> Optional[_builtins.int]:
-        return pulumi.get(self, "timeout")
-
-
-@pulumi.output_type
-class MySQLClusterSetFailoverSpecOptionsPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "invalidateReplicaClusters":
-            suggest = "invalidate_replica_clusters"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in MySQLClusterSetFailoverSpecOptionsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        MySQLClusterSetFailoverSpecOptionsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        MySQLClusterSetFailoverSpecOptionsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 invalidate_replica_clusters: Optional[Sequence[_builtins.str]] = None,
-                 timeout: Optional[_builtins.int] = None):
-        if invalidate_replica_clusters is not None:
-            pulumi.set(__self__, "invalidate_replica_clusters", invalidate_replica_clusters)
-        if timeout is not None:
-            pulumi.set(__self__, "timeout", timeout)
-
-    @_builtins.property
-    @pulumi.getter(name="invalidateReplicaClusters")
-    def invalidate_replica_clusters(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "invalidate_replica_clusters")
-
-    @_builtins.property
-    @pulumi.getter
-    def timeout(self) -> Optional[_builtins.int]:
-        return pulumi.get(self, "timeout")
-
-
-@pulumi.output_type
-class MySQLClusterSetFailoverSpecPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clusterName":
-            suggest = "cluster_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in MySQLClusterSetFailoverSpecPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        MySQLClusterSetFailoverSpecPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        MySQLClusterSetFailoverSpecPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 cluster_name: Optional[_builtins.str] = None,
-                 force: Optional[_builtins.bool] = None,
-                 options: Optional['outputs.MySQLClusterSetFailoverSpecOptionsPatch'] = None):
-        if cluster_name is not None:
-            pulumi.set(__self__, "cluster_name", cluster_name)
-        if force is not None:
-            pulumi.set(__self__, "force", force)
-        if options is not None:
-            pulumi.set(__self__, "options", options)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterName")
-    def cluster_name(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "cluster_name")
-
-    @_builtins.property
-    @pulumi.getter
-    def force(self) -> Optional[_builtins.bool]:
-        return pulumi.get(self, "force")
-
-    @_builtins.property
-    @pulumi.getter
-    def options(self) -> Optional['outputs.MySQLClusterSetFailoverSpecOptionsPatch']:
-        return pulumi.get(self, "options")
-
-
-@pulumi.output_type
-class MySQLClusterSetFailoverStatus(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "completionTime":
-            suggest = "completion_time"
-        elif key == "elapsedTime":
-            suggest = "elapsed_time"
-        elif key == "startTime":
-            suggest = "start_time"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in MySQLClusterSetFailoverStatus. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        MySQLClusterSetFailoverStatus.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        MySQLClusterSetFailoverStatus.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 completion_time: Optional[_builtins.str] = None,
-                 elapsed_time: Optional[_builtins.str] = None,
-                 start_time: Optional[_builtins.str] = None,
-                 status: Optional[_builtins.str] = None):
-        if completion_time is not None:
-            pulumi.set(__self__, "completion_time", completion_time)
-        if elapsed_time is not None:
-            pulumi.set(__self__, "elapsed_time", elapsed_time)
-        if start_time is not None:
-            pulumi.set(__self__, "start_time", start_time)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter(name="completionTime")
-    def completion_time(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "completion_time")
-
-    @_builtins.property
-    @pulumi.getter(name="elapsedTime")
-    def elapsed_time(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "elapsed_time")
-
-    @_builtins.property
-    @pulumi.getter(name="startTime")
-    def start_time(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "start_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "status")
-
-
-@pulumi.output_type
-class MySQLClusterSetFailoverStatusPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "completionTime":
-            suggest = "completion_time"
-        elif key == "elapsedTime":
-            suggest = "elapsed_time"
-        elif key == "startTime":
-            suggest = "start_time"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in MySQLClusterSetFailoverStatusPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        MySQLClusterSetFailoverStatusPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        MySQLClusterSetFailoverStatusPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 completion_time: Optional[_builtins.str] = None,
-                 elapsed_time: Optional[_builtins.str] = None,
-                 start_time: Optional[_builtins.str] = None,
-                 status: Optional[_builtins.str] = None):
-        if completion_time is not None:
-            pulumi.set(__self__, "completion_time", completion_time)
-        if elapsed_time is not None:
-            pulumi.set(__self__, "elapsed_time", elapsed_time)
-        if start_time is not None:
-            pulumi.set(__self__, "start_time", start_time)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter(name="completionTime")
-    def completion_time(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "completion_time")
-
-    @_builtins.property
-    @pulumi.getter(name="elapsedTime")
-    def elapsed_time(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "elapsed_time")
-
-    @_builtins.property
-    @pulumi.getter(name="startTime")
-    def start_time(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "start_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "status")
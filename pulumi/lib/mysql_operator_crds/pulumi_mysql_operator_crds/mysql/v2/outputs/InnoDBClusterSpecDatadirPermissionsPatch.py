@@ -0,0 +1,68 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecDatadirPermissionsPatch']
+
+@pulumi.output_type
+class InnoDBClusterSpecDatadirPermissionsPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "fsGroupChangePolicy":
+            suggest = "fs_group_change_policy"
+        elif key == "setRightsUsingInitContainer":
+            suggest = "set_rights_using_init_container"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecDatadirPermissionsPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        InnoDBClusterSpecDatadirPermissionsPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        InnoDBClusterSpecDatadirPermissionsPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 fs_group_change_policy: Optional[_builtins.str] = None,
+                 set_rights_using_init_container: Optional[_builtins.bool] = None):
+        """
+        :param _builtins.str fs_group_change_policy: Optional fsGroupChangePolicy value to be set in the pod security context. Some possible values are OnRootMismatch and Always. For more information check the official Kubernetes documentation
+        :param _builtins.bool set_rights_using_init_container: Whether to use an init container to set at start the DataDir permissions
+        """
+        if fs_group_change_policy is not None:
+            pulumi.set(__self__, "fs_group_change_policy", fs_group_change_policy)
+        if set_rights_using_init_container is not None:
+            pulumi.set(__self__, "set_rights_using_init_container", set_rights_using_init_container)
+
+    @_builtins.property
+    @pulumi.getter(name="fsGroupChangePolicy")
+    def fs_group_change_policy(self) -> Optional[_builtins.str]:
+        """
+        Optional fsGroupChangePolicy value to be set in the pod security context. Some possible values are OnRootMismatch and Always. For more information check the official Kubernetes documentation
+        """
+        return pulumi.get(self, "fs_group_change_policy")
+
+    @_builtins.property
+    @pulumi.getter(name="setRightsUsingInitContainer")
+    def set_rights_using_init_container(self) -> Optional[_builtins.bool]:
+        """
+        Whether to use an init container to set at start the DataDir permissions
+        """
+        return pulumi.get(self, "set_rights_using_init_container")
@@ -0,0 +1,54 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecInstanceServicePatch']
+
+@pulumi.output_type
+class InnoDBClusterSpecInstanceServicePatch(dict):
+    """
+    Configuration of the Service used by the InnoDB Cluster GR members internally
+    """
+    def __init__(__self__, *,
+                 annotations: Optional[Mapping[str, Any]] = None,
+                 labels: Optional[Mapping[str, Any]] = None):
+        """
+        Configuration of the Service used by the InnoDB Cluster GR members internally
+
+        :param Mapping[str, Any] annotations: Custom annotations for the Service
+        :param Mapping[str, Any] labels: Custom labels for the Service
+        """
+        if annotations is not None:
+            pulumi.set(__self__, "annotations", annotations)
+        if labels is not None:
+            pulumi.set(__self__, "labels", labels)
+
+    @_builtins.property
+    @pulumi.getter
+    def annotations(self) -> Optional[Mapping[str, Any]]:
+        """
+        Custom annotations for the Service
+        """
+        return pulumi.get(self, "annotations")
+
+    @_builtins.property
+    @pulumi.getter
+    def labels(self) -> Optional[Mapping[str, Any]]:
+        """
+        Custom labels for the Service
+        """
+        return pulumi.get(self, "labels")
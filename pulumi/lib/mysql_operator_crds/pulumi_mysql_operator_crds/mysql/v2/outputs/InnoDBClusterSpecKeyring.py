@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecKeyring']
+
+@pulumi.output_type
+class InnoDBClusterSpecKeyring(dict):
+    """
+    Keyring specification
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "encryptedFile":
+            suggest = "encrypted_file"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecKeyring. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        InnoDBClusterSpecKeyring.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        InnoDBClusterSpecKeyring.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 encrypted_file: Optional['outputs.InnoDBClusterSpecKeyringEncryptedFile'] = None,
+                 file: Optional['outputs.InnoDBClusterSpecKeyringFile'] = None,
+                 kmip: Optional['outputs.InnoDBClusterSpecKeyringKmip'] = None,
+                 oci: Optional['outputs.InnoDBClusterSpecKeyringOci'] = None):
+        """
+        Keyring specification
+        """
+        if encrypted_file is not None:
+            pulumi.set(__self__, "encrypted_file", encrypted_file)
+        if file is not None:
+            pulumi.set(__self__, "file", file)
+        if kmip is not None:
+            pulumi.set(__self__, "kmip", kmip)
+        if oci is not None:
+            pulumi.set(__self__, "oci", oci)
+
+    @_builtins.property
+    @pulumi.getter(name="encryptedFile")
+    def encrypted_file(self) -> Optional['outputs.InnoDBClusterSpecKeyringEncryptedFile']:
+        return pulumi.get(self, "encrypted_file")
+
+    @_builtins.property
+    @pulumi.getter
+    def file(self) -> Optional['outputs.InnoDBClusterSpecKeyringFile']:
+        return pulumi.get(self, "file")
+
+    @_builtins.property
+    @pulumi.getter
+    def kmip(self) -> Optional['outputs.InnoDBClusterSpecKeyringKmip']:
+        return pulumi.get(self, "kmip")
+
+    @_builtins.property
+    @pulumi.getter
+    def oci(self) -> Optional['outputs.InnoDBClusterSpecKeyringOci']:
+        return pulumi.get(self, "oci")
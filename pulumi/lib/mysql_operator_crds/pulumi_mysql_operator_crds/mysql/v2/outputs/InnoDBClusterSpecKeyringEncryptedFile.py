@@ -0,0 +1,97 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecKeyringEncryptedFile']
+
+@pulumi.output_type
+class InnoDBClusterSpecKeyringEncryptedFile(dict):
+    """
+    Keyring 'Encrypted File' specification
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "fileName":
+            suggest = "file_name"
+        elif key == "readOnly":
+            suggest = "read_only"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecKeyringEncryptedFile. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        InnoDBClusterSpecKeyringEncryptedFile.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        InnoDBClusterSpecKeyringEncryptedFile.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 file_name: Optional[_builtins.str] = None,
+                 password: Optional[_builtins.str] = None,
+                 read_only: Optional[_builtins.bool] = None,
+                 storage: Optional[Mapping[str, Any]] = None):
+        """
+        Keyring 'Encrypted File' specification
+
+        :param _builtins.str file_name: Path to the keyring file name inside the storage volume (will be prefixed by mount path)
+        :param _builtins.str password: Name of a secret that contains password for the keyring in the key 'keyring_password'
+        :param _builtins.bool read_only: Whether to open the keyring file in read-only mode
+        :param Mapping[str, Any] storage: Specification of the volume to be mounted where the keyring file resides
+        """
+        if file_name is not None:
+            pulumi.set(__self__, "file_name", file_name)
+        if password is not None:
+            pulumi.set(__self__, "password", password)
+        if read_only is not None:
+            pulumi.set(__self__, "read_only", read_only)
+        if storage is not None:
+            pulumi.set(__self__, "storage", storage)
+
+    @_builtins.property
+    @pulumi.getter(name="fileName")
+    def file_name(self) -> Optional[_builtins.str]:
+        """
+        Path to the keyring file name inside the storage volume (will be prefixed by mount path)
+        """
+        return pulumi.get(self, "file_name")
+
+    @_builtins.property
+    @pulumi.getter
+    def password(self) -> Optional[_builtins.str]:
+        """
+        Name of a secret that contains password for the keyring in the key 'keyring_password'
+        """
+        return pulumi.get(self, "password")
+
+    @_builtins.property
+    @pulumi.getter(name="readOnly")
+    def read_only(self) -> Optional[_builtins.bool]:
+        """
+        Whether to open the keyring file in read-only mode
+        """
+        return pulumi.get(self, "read_only")
+
+    @_builtins.property
+    @pulumi.getter
+    def storage(self) -> Optional[Mapping[str, Any]]:
+        """
+        Specification of the volume to be mounted where the keyring file resides
+        """
+        return pulumi.get(self, "storage")
@@ -0,0 +1,97 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecKeyringKmip']
+
+@pulumi.output_type
+class InnoDBClusterSpecKeyringKmip(dict):
+    """
+    Keyring 'KMIP' specification
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "cacheKeys":
+            suggest = "cache_keys"
+        elif key == "standbyServer":
+            suggest = "standby_server"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecKeyringKmip. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        InnoDBClusterSpecKeyringKmip.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        InnoDBClusterSpecKeyringKmip.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 cache_keys: Optional[_builtins.bool] = None,
+                 configuration: Optional[_builtins.str] = None,
+                 server: Optional[_builtins.str] = None,
+                 standby_server: Optional[Sequence[_builtins.str]] = None):
+        """
+        Keyring 'KMIP' specification
+
+        :param _builtins.bool cache_keys: Whether the keys are cached by the MySQL Server in RAM in plaintext. If set to false the keys are decrypted on every access
+        :param _builtins.str configuration: Name of a secret that contains TLS certificates
+        :param _builtins.str server: Primary OKV Server host with port number in the format <host>:<port>
+        :param Sequence[_builtins.str] standby_server: A list of standby servers in the format <host>:<port>
+        """
+        if cache_keys is not None:
+            pulumi.set(__self__, "cache_keys", cache_keys)
+        if configuration is not None:
+            pulumi.set(__self__, "configuration", configuration)
+        if server is not None:
+            pulumi.set(__self__, "server", server)
+        if standby_server is not None:
+            pulumi.set(__self__, "standby_server", standby_server)
+
+    @_builtins.property
+    @pulumi.getter(name="cacheKeys")
+    def cache_keys(self) -> Optional[_builtins.bool]:
+        """
+        Whether the keys are cached by the MySQL Server in RAM in plaintext. If set to false the keys are decrypted on every access
+        """
+        return pulumi.get(self, "cache_keys")
+
+    @_builtins.property
+    @pulumi.getter
+    def configuration(self) -> Optional[_builtins.str]:
+        """
+        Name of a secret that contains TLS certificates
+        """
+        return pulumi.get(self, "configuration")
+
+    @_builtins.property
+    @pulumi.getter
+    def server(self) -> Optional[_builtins.str]:
+        """
+        Primary OKV Server host with port number in the format <host>:<port>
+        """
+        return pulumi.get(self, "server")
+
+    @_builtins.property
+    @pulumi.getter(name="standbyServer")
+    def standby_server(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        A list of standby servers in the format <host>:<port>
+        """
+        return pulumi.get(self, "standby_server")
@@ -0,0 +1,73 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecKeyringOciEndpointsPatch']
+
+@pulumi.output_type
+class InnoDBClusterSpecKeyringOciEndpointsPatch(dict):
+    def __init__(__self__, *,
+                 encryption: Optional[_builtins.str] = None,
+                 management: Optional[_builtins.str] = None,
+                 secrets: Optional[_builtins.str] = None,
+                 vaults: Optional[_builtins.str] = None):
+        """
+        :param _builtins.str encryption: Encryption endpoint URI like {identifier}-crypto.kms.{region}.oraclecloud.com
+        :param _builtins.str management: Management endpoint URI like {identifier}-management.kms.{region}.oraclecloud.com
+        :param _builtins.str secrets: Secrets endpoint URI like secrets.vaults.{region}.oci.oraclecloud.com
+        :param _builtins.str vaults: Vaults endpoint URI like vaults.{region}.oci.oraclecloud.com
+        """
+        if encryption is not None:
+            pulumi.set(__self__, "encryption", encryption)
+        if management is not None:
+            pulumi.set(__self__, "management", management)
+        if secrets is not None:
+            pulumi.set(__self__, "secrets", secrets)
+        if vaults is not None:
+            pulumi.set(__self__, "vaults", vaults)
+
+    @_builtins.property
+    @pulumi.getter
+    def encryption(self) -> Optional[_builtins.str]:
+        """
+        Encryption endpoint URI like {identifier}-crypto.kms.{region}.oraclecloud.com
+        """
+        return pulumi.get(self, "encryption")
+
+    @_builtins.property
+    @pulumi.getter
+    def management(self) -> Optional[_builtins.str]:
+        """
+        Management endpoint URI like {identifier}-management.kms.{region}.oraclecloud.com
+        """
+        return pulumi.get(self, "management")
+
+    @_builtins.property
+    @pulumi.getter
+    def secrets(self) -> Optional[_builtins.str]:
+        """
+        Secrets endpoint URI like secrets.vaults.{region}.oci.oraclecloud.com
+        """
+        return pulumi.get(self, "secrets")
+
+    @_builtins.property
+    @pulumi.getter
+    def vaults(self) -> Optional[_builtins.str]:
+        """
+        Vaults endpoint URI like vaults.{region}.oci.oraclecloud.com
+        """
+        return pulumi.get(self, "vaults")
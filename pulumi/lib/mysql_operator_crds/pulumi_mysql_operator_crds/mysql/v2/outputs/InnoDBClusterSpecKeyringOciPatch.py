@@ -0,0 +1,159 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecKeyringOciPatch']
+
+@pulumi.output_type
+class InnoDBClusterSpecKeyringOciPatch(dict):
+    """
+    Keyring 'OCI' specification
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "caCertificate":
+            suggest = "ca_certificate"
+        elif key == "keyFingerprint":
+            suggest = "key_fingerprint"
+        elif key == "keySecret":
+            suggest = "key_secret"
+        elif key == "masterKey":
+            suggest = "master_key"
+        elif key == "virtualVault":
+            suggest = "virtual_vault"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecKeyringOciPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        InnoDBClusterSpecKeyringOciPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        InnoDBClusterSpecKeyringOciPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 ca_certificate: Optional[_builtins.str] = None,
+                 compartment: Optional[_builtins.str] = None,
+                 endpoints: Optional['outputs.InnoDBClusterSpecKeyringOciEndpointsPatch'] = None,
+                 key_fingerprint: Optional[_builtins.str] = None,
+                 key_secret: Optional[_builtins.str] = None,
+                 master_key: Optional[_builtins.str] = None,
+                 tenancy: Optional[_builtins.str] = None,
+                 user: Optional[_builtins.str] = None,
+                 virtual_vault: Optional[_builtins.str] = None):
+        """
+        Keyring 'OCI' specification
+
+        :param _builtins.str ca_certificate: Secret that contains ca.crt field with CA certificate bundle file that the keyring_oci plugin uses for Oracle Cloud Infrastructure certificate verification
+        :param _builtins.str compartment: Compartment identifier in the form ocid1.compartment.oc1...
+        :param _builtins.str key_fingerprint: Private key fingerprint
+        :param _builtins.str key_secret: A secret that contains the private key under the field 'privatekey'
+        :param _builtins.str master_key: Master key identified in the form ocid1.key.oc1...
+        :param _builtins.str tenancy: Tenancy identifier in the form ocid1.tenancy.oc1...
+        :param _builtins.str user: User identifier in the form of ocid1.user.oc1...
+        :param _builtins.str virtual_vault: Vault identifier in the form ocid1.vault.oc1...
+        """
+        if ca_certificate is not None:
+            pulumi.set(__self__, "ca_certificate", ca_certificate)
+        if compartment is not None:
+            pulumi.set(__self__, "compartment", compartment)
+        if endpoints is not None:
+            pulumi.set(__self__, "endpoints", endpoints)
+        if key_fingerprint is not None:
+            pulumi.set(__self__, "key_fingerprint", key_fingerprint)
+        if key_secret is not None:
+            pulumi.set(__self__, "key_secret", key_secret)
+        if master_key is not None:
+            pulumi.set(__self__, "master_key", master_key)
+        if tenancy is not None:
+            pulumi.set(__self__, "tenancy", tenancy)
+        if user is not None:
+            pulumi.set(__self__, "user", user)
+        if virtual_vault is not None:
+            pulumi.set(__self__, "virtual_vault", virtual_vault)
+
+    @_builtins.property
+    @pulumi.getter(name="caCertificate")
+    def ca_certificate(self) -> Optional[_builtins.str]:
+        """
+        Secret that contains ca.crt field with CA certificate bundle file that the keyring_oci plugin uses for Oracle Cloud Infrastructure certificate verification
+        """
+        return pulumi.get(self, "ca_certificate")
+
+    @_builtins.property
+    @pulumi.getter
+    def compartment(self) -> Optional[_builtins.str]:
+        """
+        Compartment identifier in the form ocid1.compartment.oc1...
+        """
+        return pulumi.get(self, "compartment")
+
+    @_builtins.property
+    @pulumi.getter
+    def endpoints(self) -> Optional['outputs.InnoDBClusterSpecKeyringOciEndpointsPatch']:
+        return pulumi.get(self, "endpoints")
+
+    @_builtins.property
+    @pulumi.getter(name="keyFingerprint")
+    def key_fingerprint(self) -> Optional[_builtins.str]:
+        """
+        Private key fingerprint
+        """
+        return pulumi.get(self, "key_fingerprint")
+
+    @_builtins.property
+    @pulumi.getter(name="keySecret")
+    def key_secret(self) -> Optional[_builtins.str]:
+        """
+        A secret that contains the private key under the field 'privatekey'
+        """
+        return pulumi.get(self, "key_secret")
+
+    @_builtins.property
+    @pulumi.getter(name="masterKey")
+    def master_key(self) -> Optional[_builtins.str]:
+        """
+        Master key identified in the form ocid1.key.oc1...
+        """
+        return pulumi.get(self, "master_key")
+
+    @_builtins.property
+    @pulumi.getter
+    def tenancy(self) -> Optional[_builtins.str]:
+        """
+        Tenancy identifier in the form ocid1.tenancy.oc1...
+        """
+        return pulumi.get(self, "tenancy")
+
+    @_builtins.property
+    @pulumi.getter
+    def user(self) -> Optional[_builtins.str]:
+        """
+        User identifier in the form of ocid1.user.oc1...
+        """
+        return pulumi.get(self, "user")
+
+    @_builtins.property
+    @pulumi.getter(name="virtualVault")
+    def virtual_vault(self) -> Optional[_builtins.str]:
+        """
+        Vault identifier in the form ocid1.vault.oc1...
+        """
+        return pulumi.get(self, "virtual_vault")
@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecKeyringPatch']
+
+@pulumi.output_type
+class InnoDBClusterSpecKeyringPatch(dict):
+    """
+    Keyring specification
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "encryptedFile":
+            suggest = "encrypted_file"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecKeyringPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        InnoDBClusterSpecKeyringPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        InnoDBClusterSpecKeyringPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 encrypted_file: Optional['outputs.InnoDBClusterSpecKeyringEncryptedFilePatch'] = None,
+                 file: Optional['outputs.InnoDBClusterSpecKeyringFilePatch'] = None,
+                 kmip: Optional['outputs.InnoDBClusterSpecKeyringKmipPatch'] = None,
+                 oci: Optional['outputs.InnoDBClusterSpecKeyringOciPatch'] = None):
+        """
+        Keyring specification
+        """
+        if encrypted_file is not None:
+            pulumi.set(__self__, "encrypted_file", encrypted_file)
+        if file is not None:
+            pulumi.set(__self__, "file", file)
+        if kmip is not None:
+            pulumi.set(__self__, "kmip", kmip)
+        if oci is not None:
+            pulumi.set(__self__, "oci", oci)
+
+    @_builtins.property
+    @pulumi.getter(name="encryptedFile")
+    def encrypted_file(self) -> Optional['outputs.InnoDBClusterSpecKeyringEncryptedFilePatch']:
+        return pulumi.get(self, "encrypted_file")
+
+    @_builtins.property
+    @pulumi.getter
+    def file(self) -> Optional['outputs.InnoDBClusterSpecKeyringFilePatch']:
+        return pulumi.get(self, "file")
+
+    @_builtins.property
+    @pulumi.getter
+    def kmip(self) -> Optional['outputs.InnoDBClusterSpecKeyringKmipPatch']:
+        return pulumi.get(self, "kmip")
+
+    @_builtins.property
+    @pulumi.getter
+    def oci(self) -> Optional['outputs.InnoDBClusterSpecKeyringOciPatch']:
+        return pulumi.get(self, "oci")
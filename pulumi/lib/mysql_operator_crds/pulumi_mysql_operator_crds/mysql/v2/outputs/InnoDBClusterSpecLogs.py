@@ -0,0 +1,72 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecLogs']
+
+@pulumi.output_type
+class InnoDBClusterSpecLogs(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "slowQuery":
+            suggest = "slow_query"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogs. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        InnoDBClusterSpecLogs.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        InnoDBClusterSpecLogs.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 collector: Optional['outputs.InnoDBClusterSpecLogsCollector'] = None,
+                 error: Optional['outputs.InnoDBClusterSpecLogsError'] = None,
+                 general: Optional['outputs.InnoDBClusterSpecLogsGeneral'] = None,
+                 slow_query: Optional['outputs.InnoDBClusterSpecLogsSlowQuery'] = None):
+        if collector is not None:
+            pulumi.set(__self__, "collector", collector)
+        if error is not None:
+            pulumi.set(__self__, "error", error)
+        if general is not None:
+            pulumi.set(__self__, "general", general)
+        if slow_query is not None:
+            pulumi.set(__self__, "slow_query", slow_query)
+
+    @_builtins.property
+    @pulumi.getter
+    def collector(self) -> Optional['outputs.InnoDBClusterSpecLogsCollector']:
+        return pulumi.get(self, "collector")
+
+    @_builtins.property
+    @pulumi.getter
+    def error(self) -> Optional['outputs.InnoDBClusterSpecLogsError']:
+        return pulumi.get(self, "error")
+
+    @_builtins.property
+    @pulumi.getter
+    def general(self) -> Optional['outputs.InnoDBClusterSpecLogsGeneral']:
+        return pulumi.get(self, "general")
+
+    @_builtins.property
+    @pulumi.getter(name="slowQuery")
+    def slow_query(self) -> Optional['outputs.InnoDBClusterSpecLogsSlowQuery']:
+        return pulumi.get(self, "slow_query")
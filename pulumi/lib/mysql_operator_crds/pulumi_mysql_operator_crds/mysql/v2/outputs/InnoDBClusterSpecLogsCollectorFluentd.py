@@ -0,0 +1,107 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecLogsCollectorFluentd']
+
+@pulumi.output_type
+class InnoDBClusterSpecLogsCollectorFluentd(dict):
+    """
+    Properties of the fluentd log collector
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "additionalFilterConfiguration":
+            suggest = "additional_filter_configuration"
+        elif key == "errorLog":
+            suggest = "error_log"
+        elif key == "generalLog":
+            suggest = "general_log"
+        elif key == "recordAugmentation":
+            suggest = "record_augmentation"
+        elif key == "slowQueryLog":
+            suggest = "slow_query_log"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorFluentd. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        InnoDBClusterSpecLogsCollectorFluentd.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        InnoDBClusterSpecLogsCollectorFluentd.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 additional_filter_configuration: Optional[_builtins.str] = None,
+                 error_log: Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdErrorLog'] = None,
+                 general_log: Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdGeneralLog'] = None,
+                 record_augmentation: Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentation'] = None,
+                 sinks: Optional[Sequence[Mapping[str, Any]]] = None,
+                 slow_query_log: Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdSlowQueryLog'] = None):
+        """
+        Properties of the fluentd log collector
+
+        :param _builtins.str additional_filter_configuration: Raw configuration of additional Fluentd filters to be added to the configuration file
+        """
+        if additional_filter_configuration is not None:
+            pulumi.set(__self__, "additional_filter_configuration", additional_filter_configuration)
+        if error_log is not None:
+            pulumi.set(__self__, "error_log", error_log)
+        if general_log is not None:
+            pulumi.set(__self__, "general_log", general_log)
+        if record_augmentation is not None:
+            pulumi.set(__self__, "record_augmentation", record_augmentation)
+        if sinks is not None:
+            pulumi.set(__self__, "sinks", sinks)
+        if slow_query_log is not None:
+            pulumi.set(__self__, "slow_query_log", slow_query_log)
+
+    @_builtins.property
+    @pulumi.getter(name="additionalFilterConfiguration")
+    def additional_filter_configuration(self) -> Optional[_builtins.str]:
+        """
+        Raw configuration of additional Fluentd filters to be added to the configuration file
+        """
+        return pulumi.get(self, "additional_filter_configuration")
+
+    @_builtins.property
+    @pulumi.getter(name="errorLog")
+    def error_log(self) -> Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdErrorLog']:
+        return pulumi.get(self, "error_log")
+
+    @_builtins.property
+    @pulumi.getter(name="generalLog")
+    def general_log(self) -> Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdGeneralLog']:
+        return pulumi.get(self, "general_log")
+
+    @_builtins.property
+    @pulumi.getter(name="recordAugmentation")
+    def record_augmentation(self) -> Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentation']:
+        return pulumi.get(self, "record_augmentation")
+
+    @_builtins.property
+    @pulumi.getter
+    def sinks(self) -> Optional[Sequence[Mapping[str, Any]]]:
+        return pulumi.get(self, "sinks")
+
+    @_builtins.property
+    @pulumi.getter(name="slowQueryLog")
+    def slow_query_log(self) -> Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdSlowQueryLog']:
+        return pulumi.get(self, "slow_query_log")
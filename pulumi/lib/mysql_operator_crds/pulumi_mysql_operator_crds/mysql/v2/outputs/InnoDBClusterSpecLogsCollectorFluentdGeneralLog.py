@@ -0,0 +1,49 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecLogsCollectorFluentdGeneralLog']
+
+@pulumi.output_type
+class InnoDBClusterSpecLogsCollectorFluentdGeneralLog(dict):
+    def __init__(__self__, *,
+                 options: Optional[Mapping[str, Any]] = None,
+                 tag: Optional[_builtins.str] = None):
+        """
+        :param Mapping[str, Any] options: fluentd specific options for the general log
+        :param _builtins.str tag: Tag for the general log records
+        """
+        if options is not None:
+            pulumi.set(__self__, "options", options)
+        if tag is not None:
+            pulumi.set(__self__, "tag", tag)
+
+    @_builtins.property
+    @pulumi.getter
+    def options(self) -> Optional[Mapping[str, Any]]:
+        """
+        fluentd specific options for the general log
+        """
+        return pulumi.get(self, "options")
+
+    @_builtins.property
+    @pulumi.getter
+    def tag(self) -> Optional[_builtins.str]:
+        """
+        Tag for the general log records
+        """
+        return pulumi.get(self, "tag")
@@ -0,0 +1,68 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatch']
+
+@pulumi.output_type
+class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "annotationName":
+            suggest = "annotation_name"
+        elif key == "fieldName":
+            suggest = "field_name"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 annotation_name: Optional[_builtins.str] = None,
+                 field_name: Optional[_builtins.str] = None):
+        """
+        :param _builtins.str annotation_name: Name of the pod label that holds the value to be stored under fieldName in the log record
+        :param _builtins.str field_name: Name of the field added to the log record with value from annotationName
+        """
+        if annotation_name is not None:
+            pulumi.set(__self__, "annotation_name", annotation_name)
+        if field_name is not None:
+            pulumi.set(__self__, "field_name", field_name)
+
+    @_builtins.property
+    @pulumi.getter(name="annotationName")
+    def annotation_name(self) -> Optional[_builtins.str]:
+        """
+        Name of the pod label that holds the value to be stored under fieldName in the log record
+        """
+        return pulumi.get(self, "annotation_name")
+
+    @_builtins.property
+    @pulumi.getter(name="fieldName")
+    def field_name(self) -> Optional[_builtins.str]:
+        """
+        Name of the field added to the log record with value from annotationName
+        """
+        return pulumi.get(self, "field_name")
@@ -0,0 +1,98 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatch']
+
+@pulumi.output_type
+class InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "podFields":
+            suggest = "pod_fields"
+        elif key == "resourceFields":
+            suggest = "resource_fields"
+        elif key == "staticFields":
+            suggest = "static_fields"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 annotations: Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatch']] = None,
+                 enabled: Optional[_builtins.bool] = None,
+                 labels: Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatch']] = None,
+                 pod_fields: Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatch']] = None,
+                 resource_fields: Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatch']] = None,
+                 static_fields: Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatch']] = None):
+        """
+        :param _builtins.bool enabled: Whether to enable record augmentation with additional data
+        """
+        if annotations is not None:
+            pulumi.set(__self__, "annotations", annotations)
+        if enabled is not None:
+            pulumi.set(__self__, "enabled", enabled)
+        if labels is not None:
+            pulumi.set(__self__, "labels", labels)
+        if pod_fields is not None:
+            pulumi.set(__self__, "pod_fields", pod_fields)
+        if resource_fields is not None:
+            pulumi.set(__self__, "resource_fields", resource_fields)
+        if static_fields is not None:
+            pulumi.set(__self__, "static_fields", static_fields)
+
+    @_builtins.property
+    @pulumi.getter
+    def annotations(self) -> Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatch']]:
+        return pulumi.get(self, "annotations")
+
+    @_builtins.property
+    @pulumi.getter
+    def enabled(self) -> Optional[_builtins.bool]:
+        """
+        Whether to enable record augmentation with additional data
+        """
+        return pulumi.get(self, "enabled")
+
+    @_builtins.property
+    @pulumi.getter
+    def labels(self) -> Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatch']]:
+        return pulumi.get(self, "labels")
+
+    @_builtins.property
+    @pulumi.getter(name="podFields")
+    def pod_fields(self) -> Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatch']]:
+        return pulumi.get(self, "pod_fields")
+
+    @_builtins.property
+    @pulumi.getter(name="resourceFields")
+    def resource_fields(self) -> Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatch']]:
+        return pulumi.get(self, "resource_fields")
+
+    @_builtins.property
+    @pulumi.getter(name="staticFields")
+    def static_fields(self) -> Optional[Sequence['outputs.InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatch']]:
+        return pulumi.get(self, "static_fields")
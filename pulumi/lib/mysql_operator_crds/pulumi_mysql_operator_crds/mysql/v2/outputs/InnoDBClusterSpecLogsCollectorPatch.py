@@ -0,0 +1,82 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecLogsCollectorPatch']
+
+@pulumi.output_type
+class InnoDBClusterSpecLogsCollectorPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "containerName":
+            suggest = "container_name"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsCollectorPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        InnoDBClusterSpecLogsCollectorPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        InnoDBClusterSpecLogsCollectorPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 container_name: Optional[_builtins.str] = None,
+                 env: Optional[Sequence[Mapping[str, Any]]] = None,
+                 fluentd: Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdPatch'] = None,
+                 image: Optional[_builtins.str] = None):
+        """
+        :param _builtins.str container_name: Name of the collector container sidecar
+        :param _builtins.str image: Name of an image, including registry and repository, to be used for the log collector sidecar. If provided it needs to be an image for the configured collector type.
+        """
+        if container_name is not None:
+            pulumi.set(__self__, "container_name", container_name)
+        if env is not None:
+            pulumi.set(__self__, "env", env)
+        if fluentd is not None:
+            pulumi.set(__self__, "fluentd", fluentd)
+        if image is not None:
+            pulumi.set(__self__, "image", image)
+
+    @_builtins.property
+    @pulumi.getter(name="containerName")
+    def container_name(self) -> Optional[_builtins.str]:
+        """
+        Name of the collector container sidecar
+        """
+        return pulumi.get(self, "container_name")
+
+    @_builtins.property
+    @pulumi.getter
+    def env(self) -> Optional[Sequence[Mapping[str, Any]]]:
+        return pulumi.get(self, "env")
+
+    @_builtins.property
+    @pulumi.getter
+    def fluentd(self) -> Optional['outputs.InnoDBClusterSpecLogsCollectorFluentdPatch']:
+        return pulumi.get(self, "fluentd")
+
+    @_builtins.property
+    @pulumi.getter
+    def image(self) -> Optional[_builtins.str]:
+        """
+        Name of an image, including registry and repository, to be used for the log collector sidecar. If provided it needs to be an image for the configured collector type.
+        """
+        return pulumi.get(self, "image")
@@ -0,0 +1,49 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecLogsErrorPatch']
+
+@pulumi.output_type
+class InnoDBClusterSpecLogsErrorPatch(dict):
+    def __init__(__self__, *,
+                 collect: Optional[_builtins.bool] = None,
+                 verbosity: Optional[_builtins.int] = None):
+        """
+        :param _builtins.bool collect: Whether error logging data should be collected. Implies that the logging should be enabled. If enabled the error log will be switched to JSON format output
+        :param _builtins.int verbosity: Log error verbosity. For details, see the MySQL Server --log-error-verbosity documentation.
+        """
+        if collect is not None:
+            pulumi.set(__self__, "collect", collect)
+        if verbosity is not None:
+            pulumi.set(__self__, "verbosity", verbosity)
+
+    @_builtins.property
+    @pulumi.getter
+    def collect(self) -> Optional[_builtins.bool]:
+        """
+        Whether error logging data should be collected. Implies that the logging should be enabled. If enabled the error log will be switched to JSON format output
+        """
+        return pulumi.get(self, "collect")
+
+    @_builtins.property
+    @pulumi.getter
+    def verbosity(self) -> Optional[_builtins.int]:
+        """
+        Log error verbosity. For details, see the MySQL Server --log-error-verbosity documentation.
+        """
+        return pulumi.get(self, "verbosity")
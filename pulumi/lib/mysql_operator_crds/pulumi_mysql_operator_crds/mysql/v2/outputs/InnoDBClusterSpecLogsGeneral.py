@@ -0,0 +1,49 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecLogsGeneral']
+
+@pulumi.output_type
+class InnoDBClusterSpecLogsGeneral(dict):
+    def __init__(__self__, *,
+                 collect: Optional[_builtins.bool] = None,
+                 enabled: Optional[_builtins.bool] = None):
+        """
+        :param _builtins.bool collect: Whether general logging data should be collected. Implies that the logging should be enabled.
+        :param _builtins.bool enabled: Whether general logging should be enabled
+        """
+        if collect is not None:
+            pulumi.set(__self__, "collect", collect)
+        if enabled is not None:
+            pulumi.set(__self__, "enabled", enabled)
+
+    @_builtins.property
+    @pulumi.getter
+    def collect(self) -> Optional[_builtins.bool]:
+        """
+        Whether general logging data should be collected. Implies that the logging should be enabled.
+        """
+        return pulumi.get(self, "collect")
+
+    @_builtins.property
+    @pulumi.getter
+    def enabled(self) -> Optional[_builtins.bool]:
+        """
+        Whether general logging should be enabled
+        """
+        return pulumi.get(self, "enabled")
@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecLogsSlowQueryPatch']
+
+@pulumi.output_type
+class InnoDBClusterSpecLogsSlowQueryPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "longQueryTime":
+            suggest = "long_query_time"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecLogsSlowQueryPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        InnoDBClusterSpecLogsSlowQueryPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        InnoDBClusterSpecLogsSlowQueryPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 collect: Optional[_builtins.bool] = None,
+                 enabled: Optional[_builtins.bool] = None,
+                 long_query_time: Optional[_builtins.float] = None):
+        """
+        :param _builtins.bool collect: Whether slow query logging data should be collected. Implies that the logging should be enabled.
+        :param _builtins.bool enabled: Whether slow query logging should be enabled
+        :param _builtins.float long_query_time: Long query time threshold
+        """
+        if collect is not None:
+            pulumi.set(__self__, "collect", collect)
+        if enabled is not None:
+            pulumi.set(__self__, "enabled", enabled)
+        if long_query_time is not None:
+            pulumi.set(__self__, "long_query_time", long_query_time)
+
+    @_builtins.property
+    @pulumi.getter
+    def collect(self) -> Optional[_builtins.bool]:
+        """
+        Whether slow query logging data should be collected. Implies that the logging should be enabled.
+        """
+        return pulumi.get(self, "collect")
+
+    @_builtins.property
+    @pulumi.getter
+    def enabled(self) -> Optional[_builtins.bool]:
+        """
+        Whether slow query logging should be enabled
+        """
+        return pulumi.get(self, "enabled")
+
+    @_builtins.property
+    @pulumi.getter(name="longQueryTime")
+    def long_query_time(self) -> Optional[_builtins.float]:
+        """
+        Long query time threshold
+        """
+        return pulumi.get(self, "long_query_time")
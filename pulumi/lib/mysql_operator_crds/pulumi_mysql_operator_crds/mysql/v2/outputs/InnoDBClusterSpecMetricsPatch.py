@@ -0,0 +1,135 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecMetricsPatch']
+
+@pulumi.output_type
+class InnoDBClusterSpecMetricsPatch(dict):
+    """
+    Configuration of a Prometheus-style metrics provider
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "monitorSpec":
+            suggest = "monitor_spec"
+        elif key == "tlsSecret":
+            suggest = "tls_secret"
+        elif key == "webConfig":
+            suggest = "web_config"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecMetricsPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        InnoDBClusterSpecMetricsPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        InnoDBClusterSpecMetricsPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 enable: Optional[_builtins.bool] = None,
+                 image: Optional[_builtins.str] = None,
+                 monitor: Optional[_builtins.bool] = None,
+                 monitor_spec: Optional[Mapping[str, Any]] = None,
+                 options: Optional[Sequence[_builtins.str]] = None,
+                 tls_secret: Optional[_builtins.str] = None,
+                 web_config: Optional[_builtins.str] = None):
+        """
+        Configuration of a Prometheus-style metrics provider
+
+        :param _builtins.bool enable: Toggle to enable or disable the metrics sidecar
+        :param _builtins.str image: Name of an image to be used for the metrics sidecar, if provided metrics will be enabled
+        :param _builtins.bool monitor: Create a ServiceMonitor for Prometheus Operator
+        :param Mapping[str, Any] monitor_spec: Custom configuration for the ServiceMonitor object
+        :param Sequence[_builtins.str] options: Options passed to the metrics provider as command line arguments
+        :param _builtins.str tls_secret: Name of a Secret with TLS certificate, key and CA, which will be mounted at /tls into the container an can be used from webConfig
+        :param _builtins.str web_config: Name of a ConfigMap with a web.config file, if this option is provided a command line option --web.config.file is added
+        """
+        if enable is not None:
+            pulumi.set(__self__, "enable", enable)
+        if image is not None:
+            pulumi.set(__self__, "image", image)
+        if monitor is not None:
+            pulumi.set(__self__, "monitor", monitor)
+        if monitor_spec is not None:
+            pulumi.set(__self__, "monitor_spec", monitor_spec)
+        if options is not None:
+            pulumi.set(__self__, "options", options)
+        if tls_secret is not None:
+            pulumi.set(__self__, "tls_secret", tls_secret)
+        if web_config is not None:
+            pulumi.set(__self__, "web_config", web_config)
+
+    @_builtins.property
+    @pulumi.getter
+    def enable(self) -> Optional[_builtins.bool]:
+        """
+        Toggle to enable or disable the metrics sidecar
+        """
+        return pulumi.get(self, "enable")
+
+    @_builtins.property
+    @pulumi.getter
+    def image(self) -> Optional[_builtins.str]:
+        """
+        Name of an image to be used for the metrics sidecar, if provided metrics will be enabled
+        """
+        return pulumi.get(self, "image")
+
+    @_builtins.property
+    @pulumi.getter
+    def monitor(self) -> Optional[_builtins.bool]:
+        """
+        Create a ServiceMonitor for Prometheus Operator
+        """
+        return pulumi.get(self, "monitor")
+
+    @_builtins.property
+    @pulumi.getter(name="monitorSpec")
+    def monitor_spec(self) -> Optional[Mapping[str, Any]]:
+        """
+        Custom configuration for the ServiceMonitor object
+        """
+        return pulumi.get(self, "monitor_spec")
+
+    @_builtins.property
+    @pulumi.getter
+    def options(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        Options passed to the metrics provider as command line arguments
+        """
+        return pulumi.get(self, "options")
+
+    @_builtins.property
+    @pulumi.getter(name="tlsSecret")
+    def tls_secret(self) -> Optional[_builtins.str]:
+        """
+        Name of a Secret with TLS certificate, key and CA, which will be mounted at /tls into the container an can be used from webConfig
+        """
+        return pulumi.get(self, "tls_secret")
+
+    @_builtins.property
+    @pulumi.getter(name="webConfig")
+    def web_config(self) -> Optional[_builtins.str]:
+        """
+        Name of a ConfigMap with a web.config file, if this option is provided a command line option --web.config.file is added
+        """
+        return pulumi.get(self, "web_config")
@@ -0,0 +1,376 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecPatch']
+
+@pulumi.output_type
+class InnoDBClusterSpecPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "backupProfiles":
+            suggest = "backup_profiles"
+        elif key == "backupSchedules":
+            suggest = "backup_schedules"
+        elif key == "baseServerId":
+            suggest = "base_server_id"
+        elif key == "datadirPermissions":
+            suggest = "datadir_permissions"
+        elif key == "datadirVolumeClaimTemplate":
+            suggest = "datadir_volume_claim_template"
+        elif key == "imagePullPolicy":
+            suggest = "image_pull_policy"
+        elif key == "imagePullSecrets":
+            suggest = "image_pull_secrets"
+        elif key == "imageRepository":
+            suggest = "image_repository"
+        elif key == "initDB":
+            suggest = "init_db"
+        elif key == "instanceService":
+            suggest = "instance_service"
+        elif key == "podAnnotations":
+            suggest = "pod_annotations"
+        elif key == "podLabels":
+            suggest = "pod_labels"
+        elif key == "podSpec":
+            suggest = "pod_spec"
+        elif key == "readReplicas":
+            suggest = "read_replicas"
+        elif key == "secretName":
+            suggest = "secret_name"
+        elif key == "serviceAccountName":
+            suggest = "service_account_name"
+        elif key == "serviceFqdnTemplate":
+            suggest = "service_fqdn_template"
+        elif key == "tlsCASecretName":
+            suggest = "tls_ca_secret_name"
+        elif key == "tlsSecretName":
+            suggest = "tls_secret_name"
+        elif key == "tlsUseSelfSigned":
+            suggest = "tls_use_self_signed"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        InnoDBClusterSpecPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        InnoDBClusterSpecPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 backup_profiles: Optional[Sequence[Mapping[str, Any]]] = None,
+                 backup_schedules: Optional[Sequence[Mapping[str, Any]]] = None,
+                 base_server_id: Optional[_builtins.int] = None,
+                 datadir_permissions: Optional['outputs.InnoDBClusterSpecDatadirPermissionsPatch'] = None,
+                 datadir_volume_claim_template: Optional[Mapping[str, Any]] = None,
+                 edition: Optional[_builtins.str] = None,
+                 image_pull_policy: Optional[_builtins.str] = None,
+                 image_pull_secrets: Optional[Sequence['outputs.InnoDBClusterSpecImagePullSecretsPatch']] = None,
+                 image_repository: Optional[_builtins.str] = None,
+                 init_db: Optional[Mapping[str, Any]] = None,
+                 instance_service: Optional['outputs.InnoDBClusterSpecInstanceServicePatch'] = None,
+                 instances: Optional[_builtins.int] = None,
+                 keyring: Optional['outputs.InnoDBClusterSpecKeyringPatch'] = None,
+                 logs: Optional['outputs.InnoDBClusterSpecLogsPatch'] = None,
+                 metrics: Optional['outputs.InnoDBClusterSpecMetricsPatch'] = None,
+                 mycnf: Optional[_builtins.str] = None,
+                 pod_annotations: Optional[Mapping[str, Any]] = None,
+                 pod_labels: Optional[Mapping[str, Any]] = None,
+                 pod_spec: Optional[Mapping[str, Any]] = None,
+                 read_replicas: Optional[Sequence['outputs.InnoDBClusterSpecReadReplicasPatch']] = None,
+                 router: Optional['outputs.InnoDBClusterSpecRouterPatch'] = None,
+                 secret_name: Optional[_builtins.str] = None,
+                 service: Optional['outputs.InnoDBClusterSpecServicePatch'] = None,
+                 service_account_name: Optional[_builtins.str] = None,
+                 service_fqdn_template: Optional[_builtins.str] = None,
+                 tls_ca_secret_name: Optional[_builtins.str] = None,
+                 tls_secret_name: Optional[_builtins.str] = None,
+                 tls_use_self_signed: Optional[_builtins.bool] = None,
+                 version: Optional[_builtins.str] = None):
+        """
+        :param Sequence[Mapping[str, Any]] backup_profiles: Backup profile specifications for the cluster, which can be referenced from backup schedules and one-off backup jobs
+        :param Sequence[Mapping[str, Any]] backup_schedules: Schedules for periodically executed backups
+        :param _builtins.int base_server_id: Base value for MySQL server_id for instances in the cluster
+        :param Mapping[str, Any] datadir_volume_claim_template: Template for a PersistentVolumeClaim, to be used as datadir
+        :param _builtins.str edition: MySQL Server Edition (community or enterprise)
+        :param _builtins.str image_pull_policy: Defaults to Always, but set to IfNotPresent in deploy-operator.yaml when deploying Operator
+        :param _builtins.str image_repository: Repository where images are pulled from; defaults to container-registry.oracle.com/mysql
+        :param _builtins.int instances: Number of MySQL replica instances for the cluster
+        :param _builtins.str mycnf: Custom configuration additions for my.cnf
+        :param Mapping[str, Any] pod_spec: Customization specification to be merged into the InnoDBCluster StatefulSet pod template. IMPORTANT: podSpec is regarded only during StatefulSet buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the InnoDBCluster StatefulSet will not be updated
+        :param _builtins.str secret_name: Name of a generic type Secret containing root/default account password
+        :param _builtins.str service_fqdn_template: Template for a FQDN resolving to the cluster's headless instance Service and individual Pods
+        :param _builtins.str tls_ca_secret_name: Name of a generic type Secret containing CA (ca.pem) and optional CRL (crl.pem) for SSL
+        :param _builtins.str tls_secret_name: Name of a TLS type Secret containing Server certificate and private key for SSL
+        :param _builtins.bool tls_use_self_signed: Enables use of self-signed TLS certificates, reducing or disabling TLS based security verifications
+        :param _builtins.str version: MySQL Server version
+        """
+        if backup_profiles is not None:
+            pulumi.set(__self__, "backup_profiles", backup_profiles)
+        if backup_schedules is not None:
+            pulumi.set(__self__, "backup_schedules", backup_schedules)
+        if base_server_id is not None:
+            pulumi.set(__self__, "base_server_id", base_server_id)
+        if datadir_permissions is not None:
+            pulumi.set(__self__, "datadir_permissions", datadir_permissions)
+        if datadir_volume_claim_template is not None:
+            pulumi.set(__self__, "datadir_volume_claim_template", datadir_volume_claim_template)
+        if edition is not None:
+            pulumi.set(__self__, "edition", edition)
+        if image_pull_policy is not None:
+            pulumi.set(__self__, "image_pull_policy", image_pull_policy)
+        if image_pull_secrets is not None:
+            pulumi.set(__self__, "image_pull_secrets", image_pull_secrets)
+        if image_repository is not None:
+            pulumi.set(__self__, "image_repository", image_repository)
+        if init_db is not None:
+            pulumi.set(__self__, "init_db", init_db)
+        if instance_service is not None:
+            pulumi.set(__self__, "instance_service", instance_service)
+        if instances is not None:
+            pulumi.set(__self__, "instances", instances)
+        if keyring is not None:
+            pulumi.set(__self__, "keyring", keyring)
+        if logs is not None:
+            pulumi.set(__self__, "logs", logs)
+        if metrics is not None:
+            pulumi.set(__self__, "metrics", metrics)
+        if mycnf is not None:
+            pulumi.set(__self__, "mycnf", mycnf)
+        if pod_annotations is not None:
+            pulumi.set(__self__, "pod_annotations", pod_annotations)
+        if pod_labels is not None:
+            pulumi.set(__self__, "pod_labels", pod_labels)
+        if pod_spec is not None:
+            pulumi.set(__self__, "pod_spec", pod_spec)
+        if read_replicas is not None:
+            pulumi.set(__self__, "read_replicas", read_replicas)
+        if router is not None:
+            pulumi.set(__self__, "router", router)
+        if secret_name is not None:
+            pulumi.set(__self__, "secret_name", secret_name)
+        if service is not None:
+            pulumi.set(__self__, "service", service)
+        if service_account_name is not None:
+            pulumi.set(__self__, "service_account_name", service_account_name)
+        if service_fqdn_template is not None:
+            pulumi.set(__self__, "service_fqdn_template", service_fqdn_template)
+        if tls_ca_secret_name is not None:
+            pulumi.set(__self__, "tls_ca_secret_name", tls_ca_secret_name)
+        if tls_secret_name is not None:
+            pulumi.set(__self__, "tls_secret_name", tls_secret_name)
+        if tls_use_self_signed is not None:
+            pulumi.set(__self__, "tls_use_self_signed", tls_use_self_signed)
+        if version is not None:
+            pulumi.set(__self__, "version", version)
+
+    @_builtins.property
+    @pulumi.getter(name="backupProfiles")
+    def backup_profiles(self) -> Optional[Sequence[Mapping[str, Any]]]:
+        """
+        Backup profile specifications for the cluster, which can be referenced from backup schedules and one-off backup jobs
+        """
+        return pulumi.get(self, "backup_profiles")
+
+    @_builtins.property
+    @pulumi.getter(name="backupSchedules")
+    def backup_schedules(self) -> Optional[Sequence[Mapping[str, Any]]]:
+        """
+        Schedules for periodically executed backups
+        """
+        return pulumi.get(self, "backup_schedules")
+
+    @_builtins.property
+    @pulumi.getter(name="baseServerId")
+    def base_server_id(self) -> Optional[_builtins.int]:
+        """
+        Base value for MySQL server_id for instances in the cluster
+        """
+        return pulumi.get(self, "base_server_id")
+
+    @_builtins.property
+    @pulumi.getter(name="datadirPermissions")
+    def datadir_permissions(self) -> Optional['outputs.InnoDBClusterSpecDatadirPermissionsPatch']:
+        return pulumi.get(self, "datadir_permissions")
+
+    @_builtins.property
+    @pulumi.getter(name="datadirVolumeClaimTemplate")
+    def datadir_volume_claim_template(self) -> Optional[Mapping[str, Any]]:
+        """
+        Template for a PersistentVolumeClaim, to be used as datadir
+        """
+        return pulumi.get(self, "datadir_volume_claim_template")
+
+    @_builtins.property
+    @pulumi.getter
+    def edition(self) -> Optional[_builtins.str]:
+        """
+        MySQL Server Edition (community or enterprise)
+        """
+        return pulumi.get(self, "edition")
+
+    @_builtins.property
+    @pulumi.getter(name="imagePullPolicy")
+    def image_pull_policy(self) -> Optional[_builtins.str]:
+        """
+        Defaults to Always, but set to IfNotPresent in deploy-operator.yaml when deploying Operator
+        """
+        return pulumi.get(self, "image_pull_policy")
+
+    @_builtins.property
+    @pulumi.getter(name="imagePullSecrets")
+    def image_pull_secrets(self) -> Optional[Sequence['outputs.InnoDBClusterSpecImagePullSecretsPatch']]:
+        return pulumi.get(self, "image_pull_secrets")
+
+    @_builtins.property
+    @pulumi.getter(name="imageRepository")
+    def image_repository(self) -> Optional[_builtins.str]:
+        """
+        Repository where images are pulled from; defaults to container-registry.oracle.com/mysql
+        """
+        return pulumi.get(self, "image_repository")
+
+    @_builtins.property
+    @pulumi.getter(name="initDB")
+    def init_db(self) -> Optional[Mapping[str, Any]]:
+        return pulumi.get(self, "init_db")
+
+    @_builtins.property
+    @pulumi.getter(name="instanceService")
+    def instance_service(self) -> Optional['outputs.InnoDBClusterSpecInstanceServicePatch']:
+        return pulumi.get(self, "instance_service")
+
+    @_builtins.property
+    @pulumi.getter
+    def instances(self) -> Optional[_builtins.int]:
+        """
+        Number of MySQL replica instances for the cluster
+        """
+        return pulumi.get(self, "instances")
+
+    @_builtins.property
+    @pulumi.getter
+    def keyring(self) -> Optional['outputs.InnoDBClusterSpecKeyringPatch']:
+        return pulumi.get(self, "keyring")
+
+    @_builtins.property
+    @pulumi.getter
+    def logs(self) -> Optional['outputs.InnoDBClusterSpecLogsPatch']:
+        return pulumi.get(self, "logs")
+
+    @_builtins.property
+    @pulumi.getter
+    def metrics(self) -> Optional['outputs.InnoDBClusterSpecMetricsPatch']:
+        return pulumi.get(self, "metrics")
+
+    @_builtins.property
+    @pulumi.getter
+    def mycnf(self) -> Optional[_builtins.str]:
+        """
+        Custom configuration additions for my.cnf
+        """
+        return pulumi.get(self, "mycnf")
+
+    @_builtins.property
+    @pulumi.getter(name="podAnnotations")
+    def pod_annotations(self) -> Optional[Mapping[str, Any]]:
+        return pulumi.get(self, "pod_annotations")
+
+    @_builtins.property
+    @pulumi.getter(name="podLabels")
+    def pod_labels(self) -> Optional[Mapping[str, Any]]:
+        return pulumi.get(self, "pod_labels")
+
+    @_builtins.property
+    @pulumi.getter(name="podSpec")
+    def pod_spec(self) -> Optional[Mapping[str, Any]]:
+        """
+        Customization specification to be merged into the InnoDBCluster StatefulSet pod template. IMPORTANT: podSpec is regarded only during StatefulSet buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the InnoDBCluster StatefulSet will not be updated
+        """
+        return pulumi.get(self, "pod_spec")
+
+    @_builtins.property
+    @pulumi.getter(name="readReplicas")
+    def read_replicas(self) -> Optional[Sequence['outputs.InnoDBClusterSpecReadReplicasPatch']]:
+        return pulumi.get(self, "read_replicas")
+
+    @_builtins.property
+    @pulumi.getter
+    def router(self) -> Optional['outputs.InnoDBClusterSpecRouterPatch']:
+        return pulumi.get(self, "router")
+
+    @_builtins.property
+    @pulumi.getter(name="secretName")
+    def secret_name(self) -> Optional[_builtins.str]:
+        """
+        Name of a generic type Secret containing root/default account password
+        """
+        return pulumi.get(self, "secret_name")
+
+    @_builtins.property
+    @pulumi.getter
+    def service(self) -> Optional['outputs.InnoDBClusterSpecServicePatch']:
+        return pulumi.get(self, "service")
+
+    @_builtins.property
+    @pulumi.getter(name="serviceAccountName")
+    def service_account_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "service_account_name")
+
+    @_builtins.property
+    @pulumi.getter(name="serviceFqdnTemplate")
+    def service_fqdn_template(self) -> Optional[_builtins.str]:
+        """
+        Template for a FQDN resolving to the cluster's headless instance Service and individual Pods
+        """
+        return pulumi.get(self, "service_fqdn_template")
+
+    @_builtins.property
+    @pulumi.getter(name="tlsCASecretName")
+    def tls_ca_secret_name(self) -> Optional[_builtins.str]:
+        """
+        Name of a generic type Secret containing CA (ca.pem) and optional CRL (crl.pem) for SSL
+        """
+        return pulumi.get(self, "tls_ca_secret_name")
+
+    @_builtins.property
+    @pulumi.getter(name="tlsSecretName")
+    def tls_secret_name(self) -> Optional[_builtins.str]:
+        """
+        Name of a TLS type Secret containing Server certificate and private key for SSL
+        """
+        return pulumi.get(self, "tls_secret_name")
+
+    @_builtins.property
+    @pulumi.getter(name="tlsUseSelfSigned")
+    def tls_use_self_signed(self) -> Optional[_builtins.bool]:
+        """
+        Enables use of self-signed TLS certificates, reducing or disabling TLS based security verifications
+        """
+        return pulumi.get(self, "tls_use_self_signed")
+
+    @_builtins.property
+    @pulumi.getter
+    def version(self) -> Optional[_builtins.str]:
+        """
+        MySQL Server version
+        """
+        return pulumi.get(self, "version")
@@ -0,0 +1,146 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecReadReplicasPatch']
+
+@pulumi.output_type
+class InnoDBClusterSpecReadReplicasPatch(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "baseServerId":
+            suggest = "base_server_id"
+        elif key == "datadirVolumeClaimTemplate":
+            suggest = "datadir_volume_claim_template"
+        elif key == "podAnnotations":
+            suggest = "pod_annotations"
+        elif key == "podLabels":
+            suggest = "pod_labels"
+        elif key == "podSpec":
+            suggest = "pod_spec"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecReadReplicasPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        InnoDBClusterSpecReadReplicasPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        InnoDBClusterSpecReadReplicasPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 base_server_id: Optional[_builtins.int] = None,
+                 datadir_volume_claim_template: Optional[Mapping[str, Any]] = None,
+                 instances: Optional[_builtins.int] = None,
+                 mycnf: Optional[_builtins.str] = None,
+                 name: Optional[_builtins.str] = None,
+                 pod_annotations: Optional[Mapping[str, Any]] = None,
+                 pod_labels: Optional[Mapping[str, Any]] = None,
+                 pod_spec: Optional[Mapping[str, Any]] = None,
+                 version: Optional[_builtins.str] = None):
+        """
+        :param _builtins.int base_server_id: Base value for MySQL server_id for instances of the readReplica, if 0 it will be assigned automatically
+        :param Mapping[str, Any] datadir_volume_claim_template: Template for a PersistentVolumeClaim, to be used as datadir
+        :param _builtins.int instances: Number of MySQL instances for the set of read replica
+        :param _builtins.str mycnf: Custom configuration additions for my.cnf
+        :param Mapping[str, Any] pod_spec: Customization specification to be merged into the InnoDBCluster StatefulSet pod template. IMPORTANT: podSpec is regarded only during StatefulSet buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the InnoDBCluster StatefulSet will not be updated
+        :param _builtins.str version: MySQL Server version
+        """
+        if base_server_id is not None:
+            pulumi.set(__self__, "base_server_id", base_server_id)
+        if datadir_volume_claim_template is not None:
+            pulumi.set(__self__, "datadir_volume_claim_template", datadir_volume_claim_template)
+        if instances is not None:
+            pulumi.set(__self__, "instances", instances)
+        if mycnf is not None:
+            pulumi.set(__self__, "mycnf", mycnf)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if pod_annotations is not None:
+            pulumi.set(__self__, "pod_annotations", pod_annotations)
+        if pod_labels is not None:
+            pulumi.set(__self__, "pod_labels", pod_labels)
+        if pod_spec is not None:
+            pulumi.set(__self__, "pod_spec", pod_spec)
+        if version is not None:
+            pulumi.set(__self__, "version", version)
+
+    @_builtins.property
+    @pulumi.getter(name="baseServerId")
+    def base_server_id(self) -> Optional[_builtins.int]:
+        """
+        Base value for MySQL server_id for instances of the readReplica, if 0 it will be assigned automatically
+        """
+        return pulumi.get(self, "base_server_id")
+
+    @_builtins.property
+    @pulumi.getter(name="datadirVolumeClaimTemplate")
+    def datadir_volume_claim_template(self) -> Optional[Mapping[str, Any]]:
+        """
+        Template for a PersistentVolumeClaim, to be used as datadir
+        """
+        return pulumi.get(self, "datadir_volume_claim_template")
+
+    @_builtins.property
+    @pulumi.getter
+    def instances(self) -> Optional[_builtins.int]:
+        """
+        Number of MySQL instances for the set of read replica
+        """
+        return pulumi.get(self, "instances")
+
+    @_builtins.property
+    @pulumi.getter
+    def mycnf(self) -> Optional[_builtins.str]:
+        """
+        Custom configuration additions for my.cnf
+        """
+        return pulumi.get(self, "mycnf")
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "name")
+
+    @_builtins.property
+    @pulumi.getter(name="podAnnotations")
+    def pod_annotations(self) -> Optional[Mapping[str, Any]]:
+        return pulumi.get(self, "pod_annotations")
+
+    @_builtins.property
+    @pulumi.getter(name="podLabels")
+    def pod_labels(self) -> Optional[Mapping[str, Any]]:
+        return pulumi.get(self, "pod_labels")
+
+    @_builtins.property
+    @pulumi.getter(name="podSpec")
+    def pod_spec(self) -> Optional[Mapping[str, Any]]:
+        """
+        Customization specification to be merged into the InnoDBCluster StatefulSet pod template. IMPORTANT: podSpec is regarded only during StatefulSet buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the InnoDBCluster StatefulSet will not be updated
+        """
+        return pulumi.get(self, "pod_spec")
+
+    @_builtins.property
+    @pulumi.getter
+    def version(self) -> Optional[_builtins.str]:
+        """
+        MySQL Server version
+        """
+        return pulumi.get(self, "version")
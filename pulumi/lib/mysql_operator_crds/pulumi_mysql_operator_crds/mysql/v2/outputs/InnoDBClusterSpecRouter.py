@@ -0,0 +1,153 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['InnoDBClusterSpecRouter']
+
+@pulumi.output_type
+class InnoDBClusterSpecRouter(dict):
+    """
+    MySQL Router specification
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "bootstrapOptions":
+            suggest = "bootstrap_options"
+        elif key == "podAnnotations":
+            suggest = "pod_annotations"
+        elif key == "podLabels":
+            suggest = "pod_labels"
+        elif key == "podSpec":
+            suggest = "pod_spec"
+        elif key == "routingOptions":
+            suggest = "routing_options"
+        elif key == "tlsSecretName":
+            suggest = "tls_secret_name"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in InnoDBClusterSpecRouter. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        InnoDBClusterSpecRouter.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        InnoDBClusterSpecRouter.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 bootstrap_options: Optional[Sequence[_builtins.str]] = None,
+                 instances: Optional[_builtins.int] = None,
+                 options: Optional[Sequence[_builtins.str]] = None,
+                 pod_annotations: Optional[Mapping[str, Any]] = None,
+                 pod_labels: Optional[Mapping[str, Any]] = None,
+                 pod_spec: Optional[Mapping[str, Any]] = None,
+                 routing_options: Optional['outputs.InnoDBClusterSpecRouterRoutingOptions'] = None,
+                 tls_secret_name: Optional[_builtins.str] = None,
+                 version: Optional[_builtins.str] = None):
+        """
+        MySQL Router specification
+
+        :param Sequence[_builtins.str] bootstrap_options: Command line options passed to MySQL Router while bootstrapping
+        :param _builtins.int instances: Number of MySQL Router instances to deploy
+        :param Sequence[_builtins.str] options: Command line options passed to MySQL Router while running
+        :param Mapping[str, Any] pod_spec: Customization specification to be merged into the Router Deployment pod template. IMPORTANT: podSpec is regarded only during Deployment buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the Router Deployment will not be updated
+        :param _builtins.str tls_secret_name: Name of a TLS type Secret containing MySQL Router certificate and private key used for SSL
+        :param _builtins.str version: Override MySQL Router version
+        """
+        if bootstrap_options is not None:
+            pulumi.set(__self__, "bootstrap_options", bootstrap_options)
+        if instances is not None:
+            pulumi.set(__self__, "instances", instances)
+        if options is not None:
+            pulumi.set(__self__, "options", options)
+        if pod_annotations is not None:
+            pulumi.set(__self__, "pod_annotations", pod_annotations)
+        if pod_labels is not None:
+            pulumi.set(__self__, "pod_labels", pod_labels)
+        if pod_spec is not None:
+            pulumi.set(__self__, "pod_spec", pod_spec)
+        if routing_options is not None:
+            pulumi.set(__self__, "routing_options", routing_options)
+        if tls_secret_name is not None:
+            pulumi.set(__self__, "tls_secret_name", tls_secret_name)
+        if version is not None:
+            pulumi.set(__self__, "version", version)
+
+    @_builtins.property
+    @pulumi.getter(name="bootstrapOptions")
+    def bootstrap_options(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        Command line options passed to MySQL Router while bootstrapping
+        """
+        return pulumi.get(self, "bootstrap_options")
+
+    @_builtins.property
+    @pulumi.getter
+    def instances(self) -> Optional[_builtins.int]:
+        """
+        Number of MySQL Router instances to deploy
+        """
+        return pulumi.get(self, "instances")
+
+    @_builtins.property
+    @pulumi.getter
+    def options(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        Command line options passed to MySQL Router while running
+        """
+        return pulumi.get(self, "options")
+
+    @_builtins.property
+    @pulumi.getter(name="podAnnotations")
+    def pod_annotations(self) -> Optional[Mapping[str, Any]]:
+        return pulumi.get(self, "pod_annotations")
+
+    @_builtins.property
+    @pulumi.getter(name="podLabels")
+    def pod_labels(self) -> Optional[Mapping[str, Any]]:
+        return pulumi.get(self, "pod_labels")
+
+    @_builtins.property
+    @pulumi.getter(name="podSpec")
+    def pod_spec(self) -> Optional[Mapping[str, Any]]:
+        """
+        Customization specification to be merged into the Router Deployment pod template. IMPORTANT: podSpec is regarded only during Deployment buildup and the operator neither checks the values in podSpec nor later watches for changes of this field. Thus if changes are made to this field the Router Deployment will not be updated
+        """
+        return pulumi.get(self, "pod_spec")
+
+    @_builtins.property
+    @pulumi.getter(name="routingOptions")
+    def routing_options(self) -> Optional['outputs.InnoDBClusterSpecRouterRoutingOptions']:
+        return pulumi.get(self, "routing_options")
+
+    @_builtins.property
+    @pulumi.getter(name="tlsSecretName")
+    def tls_secret_name(self) -> Optional[_builtins.str]:
+        """
+        Name of a TLS type Secret containing MySQL Router certificate and private key used for SSL
+        """
+        return pulumi.get(self, "tls_secret_name")
+
+    @_builtins.property
+    @pulumi.getter
+    def version(self) -> Optional[_builtins.str]:
+        """
+        Override MySQL Router version
+        """
+        return pulumi.get(self, "version")
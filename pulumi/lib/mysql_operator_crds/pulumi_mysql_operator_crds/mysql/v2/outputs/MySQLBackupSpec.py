@@ -0,0 +1,120 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['MySQLBackupSpec']
+
+@pulumi.output_type
+class MySQLBackupSpec(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "addTimestampToBackupDirectory":
+            suggest = "add_timestamp_to_backup_directory"
+        elif key == "backupProfile":
+            suggest = "backup_profile"
+        elif key == "backupProfileName":
+            suggest = "backup_profile_name"
+        elif key == "clusterName":
+            suggest = "cluster_name"
+        elif key == "deleteBackupData":
+            suggest = "delete_backup_data"
+        elif key == "incrementalBase":
+            suggest = "incremental_base"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in MySQLBackupSpec. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        MySQLBackupSpec.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        MySQLBackupSpec.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 add_timestamp_to_backup_directory: Optional[_builtins.bool] = None,
+                 backup_profile: Optional[Mapping[str, Any]] = None,
+                 backup_profile_name: Optional[_builtins.str] = None,
+                 cluster_name: Optional[_builtins.str] = None,
+                 delete_backup_data: Optional[_builtins.bool] = None,
+                 incremental: Optional[_builtins.bool] = None,
+                 incremental_base: Optional[_builtins.str] = None):
+        """
+        :param Mapping[str, Any] backup_profile: backupProfile specification if backupProfileName is not specified
+        :param _builtins.bool incremental: MySQL Enterprise Backup only: Request taking an incremental backup
+        :param _builtins.str incremental_base: MySQL Enterprise Backup only: Base for incremental backup,  either last_backup or last_full_backup
+        """
+        if add_timestamp_to_backup_directory is not None:
+            pulumi.set(__self__, "add_timestamp_to_backup_directory", add_timestamp_to_backup_directory)
+        if backup_profile is not None:
+            pulumi.set(__self__, "backup_profile", backup_profile)
+        if backup_profile_name is not None:
+            pulumi.set(__self__, "backup_profile_name", backup_profile_name)
+        if cluster_name is not None:
+            pulumi.set(__self__, "cluster_name", cluster_name)
+        if delete_backup_data is not None:
+            pulumi.set(__self__, "delete_backup_data", delete_backup_data)
+        if incremental is not None:
+            pulumi.set(__self__, "incremental", incremental)
+        if incremental_base is not None:
+            pulumi.set(__self__, "incremental_base", incremental_base)
+
+    @_builtins.property
+    @pulumi.getter(name="addTimestampToBackupDirectory")
+    def add_timestamp_to_backup_directory(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "add_timestamp_to_backup_directory")
+
+    @_builtins.property
+    @pulumi.getter(name="backupProfile")
+    def backup_profile(self) -> Optional[Mapping[str, Any]]:
+        """
+        backupProfile specification if backupProfileName is not specified
+        """
+        return pulumi.get(self, "backup_profile")
+
+    @_builtins.property
+    @pulumi.getter(name="backupProfileName")
+    def backup_profile_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "backup_profile_name")
+
+    @_builtins.property
+    @pulumi.getter(name="clusterName")
+    def cluster_name(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "cluster_name")
+
+    @_builtins.property
+    @pulumi.getter(name="deleteBackupData")
+    def delete_backup_data(self) -> Optional[_builtins.bool]:
+        return pulumi.get(self, "delete_backup_data")
+
+    @_builtins.property
+    @pulumi.getter
+    def incremental(self) -> Optional[_builtins.bool]:
+        """
+        MySQL Enterprise Backup only: Request taking an incremental backup
+        """
+        return pulumi.get(self, "incremental")
+
+    @_builtins.property
+    @pulumi.getter(name="incrementalBase")
+    def incremental_base(self) -> Optional[_builtins.str]:
+        """
+        MySQL Enterprise Backup only: Base for incremental backup,  either last_backup or last_full_backup
+        """
+        return pulumi.get(self, "incremental_base")
@@ -0,0 +1,152 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['MySQLBackupStatus']
+
+@pulumi.output_type
+class MySQLBackupStatus(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "completionTime":
+            suggest = "completion_time"
+        elif key == "elapsedTime":
+            suggest = "elapsed_time"
+        elif key == "ociTenancy":
+            suggest = "oci_tenancy"
+        elif key == "spaceAvailable":
+            suggest = "space_available"
+        elif key == "startTime":
+            suggest = "start_time"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in MySQLBackupStatus. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        MySQLBackupStatus.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        MySQLBackupStatus.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 bucket: Optional[_builtins.str] = None,
+                 completion_time: Optional[_builtins.str] = None,
+                 container: Optional[_builtins.str] = None,
+                 elapsed_time: Optional[_builtins.str] = None,
+                 message: Optional[_builtins.str] = None,
+                 method: Optional[_builtins.str] = None,
+                 oci_tenancy: Optional[_builtins.str] = None,
+                 output: Optional[_builtins.str] = None,
+                 size: Optional[_builtins.str] = None,
+                 source: Optional[_builtins.str] = None,
+                 space_available: Optional[_builtins.str] = None,
+                 start_time: Optional[_builtins.str] = None,
+                 status: Optional[_builtins.str] = None):
+        if bucket is not None:
+            pulumi.set(__self__, "bucket", bucket)
+        if completion_time is not None:
+            pulumi.set(__self__, "completion_time", completion_time)
+        if container is not None:
+            pulumi.set(__self__, "container", container)
+        if elapsed_time is not None:
+            pulumi.set(__self__, "elapsed_time", elapsed_time)
+        if message is not None:
+            pulumi.set(__self__, "message", message)
+        if method is not None:
+            pulumi.set(__self__, "method", method)
+        if oci_tenancy is not None:
+            pulumi.set(__self__, "oci_tenancy", oci_tenancy)
+        if output is not None:
+            pulumi.set(__self__, "output", output)
+        if size is not None:
+            pulumi.set(__self__, "size", size)
+        if source is not None:
+            pulumi.set(__self__, "source", source)
+        if space_available is not None:
+            pulumi.set(__self__, "space_available", space_available)
+        if start_time is not None:
+            pulumi.set(__self__, "start_time", start_time)
+        if status is not None:
+            pulumi.set(__self__, "status", status)
+
+    @_builtins.property
+    @pulumi.getter
+    def bucket(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "bucket")
+
+    @_builtins.property
+    @pulumi.getter(name="completionTime")
+    def completion_time(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "completion_time")
+
+    @_builtins.property
+    @pulumi.getter
+    def container(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "container")
+
+    @_builtins.property
+    @pulumi.getter(name="elapsedTime")
+    def elapsed_time(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "elapsed_time")
+
+    @_builtins.property
+    @pulumi.getter
+    def message(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "message")
+
+    @_builtins.property
+    @pulumi.getter
+    def method(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "method")
+
+    @_builtins.property
+    @pulumi.getter(name="ociTenancy")
+    def oci_tenancy(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "oci_tenancy")
+
+    @_builtins.property
+    @pulumi.getter
+    def output(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "output")
+
+    @_builtins.property
+    @pulumi.getter
+    def size(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "size")
+
+    @_builtins.property
+    @pulumi.getter
+    def source(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "source")
+
+    @_builtins.property
+    @pulumi.getter(name="spaceAvailable")
+    def space_available(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "space_available")
+
+    @_builtins.property
+    @pulumi.getter(name="startTime")
+    def start_time(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "start_time")
+
+    @_builtins.property
+    @pulumi.getter
+    def status(self) -> Optional[_builtins.str]:
+        return pulumi.get(self, "status")
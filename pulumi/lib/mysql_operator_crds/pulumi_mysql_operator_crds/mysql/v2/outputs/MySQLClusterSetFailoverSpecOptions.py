@@ -0,0 +1,56 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['MySQLClusterSetFailoverSpecOptions']
+
+@pulumi.output_type
+class MySQLClusterSetFailoverSpecOptions(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "invalidateReplicaClusters":
+            suggest = "invalidate_replica_clusters"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in MySQLClusterSetFailoverSpecOptions. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        MySQLClusterSetFailoverSpecOptions.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        MySQLClusterSetFailoverSpecOptions.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 invalidate_replica_clusters: Optional[Sequence[_builtins.str]] = None,
+                 timeout: Optional[_builtins.int] = None):
+        if invalidate_replica_clusters is not None:
+            pulumi.set(__self__, "invalidate_replica_clusters", invalidate_replica_clusters)
+        if timeout is not None:
+            pulumi.set(__self__, "timeout", timeout)
+
+    @_builtins.property
+    @pulumi.getter(name="invalidateReplicaClusters")
+    def invalidate_replica_clusters(self) -> Optional[Sequence[_builtins.str]]:
+        return pulumi.get(self, "invalidate_replica_clusters")
+
+    @_builtins.property
+    @pulumi.getter
+    def timeout(self) -> Optional[_builtins.int]:
+        return pulumi.get(self, "timeout")
@@ -0,0 +1,246 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import importlib
+import typing
+
+__all__ = [
+    'InnoDBCluster',
+    'InnoDBClusterSpec',
+    'InnoDBClusterSpecDatadirPermissions',
+    'InnoDBClusterSpecDatadirPermissionsPatch',
+    'InnoDBClusterSpecImagePullSecrets',
+    'InnoDBClusterSpecImagePullSecretsPatch',
+    'InnoDBClusterSpecInstanceService',
+    'InnoDBClusterSpecInstanceServicePatch',
+    'InnoDBClusterSpecKeyring',
+    'InnoDBClusterSpecKeyringEncryptedFile',
+    'InnoDBClusterSpecKeyringEncryptedFilePatch',
+    'InnoDBClusterSpecKeyringFile',
+    'InnoDBClusterSpecKeyringFilePatch',
+    'InnoDBClusterSpecKeyringKmip',
+    'InnoDBClusterSpecKeyringKmipPatch',
+    'InnoDBClusterSpecKeyringOci',
+    'InnoDBClusterSpecKeyringOciEndpoints',
+    'InnoDBClusterSpecKeyringOciEndpointsPatch',
+    'InnoDBClusterSpecKeyringOciPatch',
+    'InnoDBClusterSpecKeyringPatch',
+    'InnoDBClusterSpecLogs',
+    'InnoDBClusterSpecLogsCollector',
+    'InnoDBClusterSpecLogsCollectorFluentd',
+    'InnoDBClusterSpecLogsCollectorFluentdErrorLog',
+    'InnoDBClusterSpecLogsCollectorFluentdErrorLogPatch',
+    'InnoDBClusterSpecLogsCollectorFluentdGeneralLog',
+    'InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatch',
+    'InnoDBClusterSpecLogsCollectorFluentdPatch',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentation',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotations',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatch',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabels',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatch',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatch',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFields',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatch',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFields',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatch',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFields',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatch',
+    'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLog',
+    'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatch',
+    'InnoDBClusterSpecLogsCollectorPatch',
+    'InnoDBClusterSpecLogsError',
+    'InnoDBClusterSpecLogsErrorPatch',
+    'InnoDBClusterSpecLogsGeneral',
+    'InnoDBClusterSpecLogsGeneralPatch',
+    'InnoDBClusterSpecLogsPatch',
+    'InnoDBClusterSpecLogsSlowQuery',
+    'InnoDBClusterSpecLogsSlowQueryPatch',
+    'InnoDBClusterSpecMetrics',
+    'InnoDBClusterSpecMetricsPatch',
+    'InnoDBClusterSpecPatch',
+    'InnoDBClusterSpecReadReplicas',
+    'InnoDBClusterSpecReadReplicasPatch',
+    'InnoDBClusterSpecRouter',
+    'InnoDBClusterSpecRouterPatch',
+    'InnoDBClusterSpecRouterRoutingOptions',
+    'InnoDBClusterSpecRouterRoutingOptionsPatch',
+    'InnoDBClusterSpecService',
+    'InnoDBClusterSpecServicePatch',
+    'MySQLBackup',
+    'MySQLBackupSpec',
+    'MySQLBackupSpecPatch',
+    'MySQLBackupStatus',
+    'MySQLBackupStatusPatch',
+    'MySQLClusterSetFailover',
+    'MySQLClusterSetFailoverSpec',
+    'MySQLClusterSetFailoverSpecOptions',
+    'MySQLClusterSetFailoverSpecOptionsPatch',
+    'MySQLClusterSetFailoverSpecPatch',
+    'MySQLClusterSetFailoverStatus',
+    'MySQLClusterSetFailoverStatusPatch',
+]
+
+_TYPE_MODULES = {
+    'InnoDBCluster': 'InnoDBCluster',
+    'InnoDBClusterSpec': 'InnoDBClusterSpec',
+    'InnoDBClusterSpecDatadirPermissions': 'InnoDBClusterSpecDatadirPermissions',
+    'InnoDBClusterSpecDatadirPermissionsPatch': 'InnoDBClusterSpecDatadirPermissionsPatch',
+    'InnoDBClusterSpecImagePullSecrets': 'InnoDBClusterSpecImagePullSecrets',
+    'InnoDBClusterSpecImagePullSecretsPatch': 'InnoDBClusterSpecImagePullSecretsPatch',
+    'InnoDBClusterSpecInstanceService': 'InnoDBClusterSpecInstanceService',
+    'InnoDBClusterSpecInstanceServicePatch': 'InnoDBClusterSpecInstanceServicePatch',
+    'InnoDBClusterSpecKeyring': 'InnoDBClusterSpecKeyring',
+    'InnoDBClusterSpecKeyringEncryptedFile': 'InnoDBClusterSpecKeyringEncryptedFile',
+    'InnoDBClusterSpecKeyringEncryptedFilePatch': 'InnoDBClusterSpecKeyringEncryptedFilePatch',
+    'InnoDBClusterSpecKeyringFile': 'InnoDBClusterSpecKeyringFile',
+    'InnoDBClusterSpecKeyringFilePatch': 'InnoDBClusterSpecKeyringFilePatch',
+    'InnoDBClusterSpecKeyringKmip': 'InnoDBClusterSpecKeyringKmip',
+    'InnoDBClusterSpecKeyringKmipPatch': 'InnoDBClusterSpecKeyringKmipPatch',
+    'InnoDBClusterSpecKeyringOci': 'InnoDBClusterSpecKeyringOci',
+    'InnoDBClusterSpecKeyringOciEndpoints': 'InnoDBClusterSpecKeyringOciEndpoints',
+    'InnoDBClusterSpecKeyringOciEndpointsPatch': 'InnoDBClusterSpecKeyringOciEndpointsPatch',
+    'InnoDBClusterSpecKeyringOciPatch': 'InnoDBClusterSpecKeyringOciPatch',
+    'InnoDBClusterSpecKeyringPatch': 'InnoDBClusterSpecKeyringPatch',
+    'InnoDBClusterSpecLogs': 'InnoDBClusterSpecLogs',
+    'InnoDBClusterSpecLogsCollector': 'InnoDBClusterSpecLogsCollector',
+    'InnoDBClusterSpecLogsCollectorFluentd': 'InnoDBClusterSpecLogsCollectorFluentd',
+    'InnoDBClusterSpecLogsCollectorFluentdErrorLog': 'InnoDBClusterSpecLogsCollectorFluentdErrorLog',
+    'InnoDBClusterSpecLogsCollectorFluentdErrorLogPatch': 'InnoDBClusterSpecLogsCollectorFluentdErrorLogPatch',
+    'InnoDBClusterSpecLogsCollectorFluentdGeneralLog': 'InnoDBClusterSpecLogsCollectorFluentdGeneralLog',
+    'InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatch': 'InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatch',
+    'InnoDBClusterSpecLogsCollectorFluentdPatch': 'InnoDBClusterSpecLogsCollectorFluentdPatch',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentation': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentation',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotations': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotations',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatch': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatch',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabels': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabels',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatch': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatch',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatch': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatch',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFields': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFields',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatch': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatch',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFields': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFields',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatch': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatch',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFields': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFields',
+    'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatch': 'InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatch',
+    'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLog': 'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLog',
+    'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatch': 'InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatch',
+    'InnoDBClusterSpecLogsCollectorPatch': 'InnoDBClusterSpecLogsCollectorPatch',
+    'InnoDBClusterSpecLogsError': 'InnoDBClusterSpecLogsError',
+    'InnoDBClusterSpecLogsErrorPatch': 'InnoDBClusterSpecLogsErrorPatch',
+    'InnoDBClusterSpecLogsGeneral': 'InnoDBClusterSpecLogsGeneral',
+    'InnoDBClusterSpecLogsGeneralPatch': 'InnoDBClusterSpecLogsGeneralPatch',
+    'InnoDBClusterSpecLogsPatch': 'InnoDBClusterSpecLogsPatch',
+    'InnoDBClusterSpecLogsSlowQuery': 'InnoDBClusterSpecLogsSlowQuery',
+    'InnoDBClusterSpecLogsSlowQueryPatch': 'InnoDBClusterSpecLogsSlowQueryPatch',
+    'InnoDBClusterSpecMetrics': 'InnoDBClusterSpecMetrics',
+    'InnoDBClusterSpecMetricsPatch': 'InnoDBClusterSpecMetricsPatch',
+    'InnoDBClusterSpecPatch': 'InnoDBClusterSpecPatch',
+    'InnoDBClusterSpecReadReplicas': 'InnoDBClusterSpecReadReplicas',
+    'InnoDBClusterSpecReadReplicasPatch': 'InnoDBClusterSpecReadReplicasPatch',
+    'InnoDBClusterSpecRouter': 'InnoDBClusterSpecRouter',
+    'InnoDBClusterSpecRouterPatch': 'InnoDBClusterSpecRouterPatch',
+    'InnoDBClusterSpecRouterRoutingOptions': 'InnoDBClusterSpecRouterRoutingOptions',
+    'InnoDBClusterSpecRouterRoutingOptionsPatch': 'InnoDBClusterSpecRouterRoutingOptionsPatch',
+    'InnoDBClusterSpecService': 'InnoDBClusterSpecService',
+    'InnoDBClusterSpecServicePatch': 'InnoDBClusterSpecServicePatch',
+    'MySQLBackup': 'MySQLBackup',
+    'MySQLBackupSpec': 'MySQLBackupSpec',
+    'MySQLBackupSpecPatch': 'MySQLBackupSpecPatch',
+    'MySQLBackupStatus': 'MySQLBackupStatus',
+    'MySQLBackupStatusPatch': 'MySQLBackupStatusPatch',
+    'MySQLClusterSetFailover': 'MySQLClusterSetFailover',
+    'MySQLClusterSetFailoverSpec': 'MySQLClusterSetFailoverSpec',
+    'MySQLClusterSetFailoverSpecOptions': 'MySQLClusterSetFailoverSpecOptions',
+    'MySQLClusterSetFailoverSpecOptionsPatch': 'MySQLClusterSetFailoverSpecOptionsPatch',
+    'MySQLClusterSetFailoverSpecPatch': 'MySQLClusterSetFailoverSpecPatch',
+    'MySQLClusterSetFailoverStatus': 'MySQLClusterSetFailoverStatus',
+    'MySQLClusterSetFailoverStatusPatch': 'MySQLClusterSetFailoverStatusPatch',
+}
+
+if typing.TYPE_CHECKING:
+    from .InnoDBCluster import *
+    from .InnoDBClusterSpec import *
+    from .InnoDBClusterSpecDatadirPermissions import *
+    from .InnoDBClusterSpecDatadirPermissionsPatch import *
+    from .InnoDBClusterSpecImagePullSecrets import *
+    from .InnoDBClusterSpecImagePullSecretsPatch import *
+    from .InnoDBClusterSpecInstanceService import *
+    from .InnoDBClusterSpecInstanceServicePatch import *
+    from .InnoDBClusterSpecKeyring import *
+    from .InnoDBClusterSpecKeyringEncryptedFile import *
+    from .InnoDBClusterSpecKeyringEncryptedFilePatch import *
+    from .InnoDBClusterSpecKeyringFile import *
+    from .InnoDBClusterSpecKeyringFilePatch import *
+    from .InnoDBClusterSpecKeyringKmip import *
+    from .InnoDBClusterSpecKeyringKmipPatch import *
+    from .InnoDBClusterSpecKeyringOci import *
+    from .InnoDBClusterSpecKeyringOciEndpoints import *
+    from .InnoDBClusterSpecKeyringOciEndpointsPatch import *
+    from .InnoDBClusterSpecKeyringOciPatch import *
+    from .InnoDBClusterSpecKeyringPatch import *
+    from .InnoDBClusterSpecLogs import *
+    from .InnoDBClusterSpecLogsCollector import *
+    from .InnoDBClusterSpecLogsCollectorFluentd import *
+    from .InnoDBClusterSpecLogsCollectorFluentdErrorLog import *
+    from .InnoDBClusterSpecLogsCollectorFluentdErrorLogPatch import *
+    from .InnoDBClusterSpecLogsCollectorFluentdGeneralLog import *
+    from .InnoDBClusterSpecLogsCollectorFluentdGeneralLogPatch import *
+    from .InnoDBClusterSpecLogsCollectorFluentdPatch import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentation import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotations import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationAnnotationsPatch import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabels import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationLabelsPatch import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPatch import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFields import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationPodFieldsPatch import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFields import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationResourceFieldsPatch import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFields import *
+    from .InnoDBClusterSpecLogsCollectorFluentdRecordAugmentationStaticFieldsPatch import *
+    from .InnoDBClusterSpecLogsCollectorFluentdSlowQueryLog import *
+    from .InnoDBClusterSpecLogsCollectorFluentdSlowQueryLogPatch import *
+    from .InnoDBClusterSpecLogsCollectorPatch import *
+    from .InnoDBClusterSpecLogsError import *
+    from .InnoDBClusterSpecLogsErrorPatch import *
+    from .InnoDBClusterSpecLogsGeneral import *
+    from .InnoDBClusterSpecLogsGeneralPatch import *
+    from .InnoDBClusterSpecLogsPatch import *
+    from .InnoDBClusterSpecLogsSlowQuery import *
+    from .InnoDBClusterSpecLogsSlowQueryPatch import *
+    from .InnoDBClusterSpecMetrics import *
+    from .InnoDBClusterSpecMetricsPatch import *
+    from .InnoDBClusterSpecPatch import *
+    from .InnoDBClusterSpecReadReplicas import *
+    from .InnoDBClusterSpecReadReplicasPatch import *
+    from .InnoDBClusterSpecRouter import *
+    from .InnoDBClusterSpecRouterPatch import *
+    from .InnoDBClusterSpecRouterRoutingOptions import *
+    from .InnoDBClusterSpecRouterRoutingOptionsPatch import *
+    from .InnoDBClusterSpecService import *
+    from .InnoDBClusterSpecServicePatch import *
+    from .MySQLBackup import *
+    from .MySQLBackupSpec import *
+    from .MySQLBackupSpecPatch import *
+    from .MySQLBackupStatus import *
+    from .MySQLBackupStatusPatch import *
+    from .MySQLClusterSetFailover import *
+    from .MySQLClusterSetFailoverSpec import *
+    from .MySQLClusterSetFailoverSpecOptions import *
+    from .MySQLClusterSetFailoverSpecOptionsPatch import *
+    from .MySQLClusterSetFailoverSpecPatch import *
+    from .MySQLClusterSetFailoverStatus import *
+    from .MySQLClusterSetFailoverStatusPatch import *
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _TYPE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
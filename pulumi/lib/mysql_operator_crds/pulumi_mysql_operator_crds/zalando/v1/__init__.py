@@ -3,14 +3,71 @@
 # *** Do not edit by hand unless you're certain you know what you are doing! ***
 
 import builtins as _builtins
-from ... import _utilities
+import importlib
 import typing
-# Export this package's modules as members:
-from .ClusterKopfPeering import *
-from .ClusterKopfPeeringList import *
-from .ClusterKopfPeeringPatch import *
-from .KopfPeering import *
-from .KopfPeeringList import *
-from .KopfPeeringPatch import *
-from ._inputs import *
-from . import outputs
+from ... import _utilities
+
+__all__ = [
+    'ClusterKopfPeeringInitArgs',
+    'ClusterKopfPeering',
+    'ClusterKopfPeeringListArgs',
+    'ClusterKopfPeeringList',
+    'ClusterKopfPeeringPatchArgs',
+    'ClusterKopfPeeringPatch',
+    'KopfPeeringInitArgs',
+    'KopfPeering',
+    'KopfPeeringListArgs',
+    'KopfPeeringList',
+    'KopfPeeringPatchArgs',
+    'KopfPeeringPatch',
+    'ClusterKopfPeeringArgsDict',
+    'ClusterKopfPeeringArgs',
+    'KopfPeeringArgsDict',
+    'KopfPeeringArgs',
+    'outputs',
+]
+
+# Resource classes live in same-named modules; everything else is an input type.
+_RESOURCE_MODULES = {
+    'ClusterKopfPeeringInitArgs': 'ClusterKopfPeering',
+    'ClusterKopfPeering': 'ClusterKopfPeering',
+    'ClusterKopfPeeringListArgs': 'ClusterKopfPeeringList',
+    'ClusterKopfPeeringList': 'ClusterKopfPeeringList',
+    'ClusterKopfPeeringPatchArgs': 'ClusterKopfPeeringPatch',
+    'ClusterKopfPeeringPatch': 'ClusterKopfPeeringPatch',
+    'KopfPeeringInitArgs': 'KopfPeering',
+    'KopfPeering': 'KopfPeering',
+    'KopfPeeringListArgs': 'KopfPeeringList',
+    'KopfPeeringList': 'KopfPeeringList',
+    'KopfPeeringPatchArgs': 'KopfPeeringPatch',
+    'KopfPeeringPatch': 'KopfPeeringPatch',
+}
+
+if typing.TYPE_CHECKING:
+    from .ClusterKopfPeering import *
+    from .ClusterKopfPeeringList import *
+    from .ClusterKopfPeeringPatch import *
+    from .KopfPeering import *
+    from .KopfPeeringList import *
+    from .KopfPeeringPatch import *
+    from ._inputs import *
+    from . import outputs
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in ("_inputs", "outputs"):
+        return importlib.import_module(f"{__name__}.{name}")
+    module_name = _RESOURCE_MODULES.get(name)
+    if module_name is not None:
+        module = importlib.import_module(f"{__name__}.{module_name}")
+    else:
+        module = importlib.import_module(f"{__name__}._inputs")
+        if name not in module.__all__:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,33 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import importlib
+import typing
+
+__all__ = [
+    'ClusterKopfPeering',
+    'KopfPeering',
+]
+
+_TYPE_MODULES = {
+    'ClusterKopfPeering': 'ClusterKopfPeering',
+    'KopfPeering': 'KopfPeering',
+}
+
+if typing.TYPE_CHECKING:
+    from .ClusterKopfPeering import *
+    from .KopfPeering import *
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _TYPE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -15,7 +15,7 @@ else:
 from ... import _utilities
 from . import outputs
 from ... import meta as _meta
-from ._inputs import *
+from . import _inputs
 
 __all__ = ['SparkConnectInitArgs', 'SparkConnect']
 
@@ -25,7 +25,7 @@ class SparkConnectInitArgs:
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']] = None,
-                 spec: pulumi.Input[Optional['SparkConnectSpecArgs']] = None):
+                 spec: pulumi.Input[Optional['_inputs.SparkConnectSpecArgs']] = None):
         """
         The set of arguments for constructing a SparkConnect resource.
 
@@ -80,11 +80,11 @@ class SparkConnectInitArgs:
 
     @_builtins.property
     @pulumi.getter
-    def spec(self) -> pulumi.Input[Optional['SparkConnectSpecArgs']]:
+    def spec(self) -> pulumi.Input[Optional['_inputs.SparkConnectSpecArgs']]:
         return pulumi.get(self, "spec")
 
     @spec.setter
-    def spec(self, value: pulumi.Input[Optional['SparkConnectSpecArgs']]):
+    def spec(self, value: pulumi.Input[Optional['_inputs.SparkConnectSpecArgs']]):
         pulumi.set(self, "spec", value)
 
 
@@ -97,7 +97,7 @@ class SparkConnect(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaArgs', '_meta.v1.ObjectMetaArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['SparkConnectSpecArgs', 'SparkConnectSpecArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.SparkConnectSpecArgs', '_inputs.SparkConnectSpecArgsDict']]] = None,
                  __props__=None):
         """
         SparkConnect is the Schema for the sparkconnections API.
@@ -137,7 +137,7 @@ class SparkConnect(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaArgs', '_meta.v1.ObjectMetaArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['SparkConnectSpecArgs', 'SparkConnectSpecArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.SparkConnectSpecArgs', '_inputs.SparkConnectSpecArgsDict']]] = None,
                  __props__=None):
         opts = pulumi.ResourceOptions.merge(_utilities.get_resource_opts_defaults(), opts)
         if not isinstance(opts, pulumi.ResourceOptions):
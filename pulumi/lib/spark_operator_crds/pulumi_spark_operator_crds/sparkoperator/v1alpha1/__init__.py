@@ -3,11 +3,120 @@
 # *** Do not edit by hand unless you're certain you know what you are doing! ***
 
 import builtins as _builtins
-from ... import _utilities
+import importlib
 import typing
-# Export this package's modules as members:
-from .SparkConnect import *
-from .SparkConnectList import *
-from .SparkConnectPatch import *
-from ._inputs import *
-from . import outputs
+from ... import _utilities
+
+__all__ = [
+    'SparkConnectInitArgs',
+    'SparkConnect',
+    'SparkConnectListArgs',
+    'SparkConnectList',
+    'SparkConnectPatchArgs',
+    'SparkConnectPatch',
+    'SparkConnectSpecDynamicAllocationPatchArgsDict',
+    'SparkConnectSpecDynamicAllocationPatchArgs',
+    'SparkConnectSpecDynamicAllocationArgsDict',
+    'SparkConnectSpecDynamicAllocationArgs',
+    'SparkConnectSpecExecutorPatchArgsDict',
+    'SparkConnectSpecExecutorPatchArgs',
+    'SparkConnectSpecExecutorArgsDict',
+    'SparkConnectSpecExecutorArgs',
+    'SparkConnectSpecPatchArgsDict',
+    'SparkConnectSpecPatchArgs',
+    'SparkConnectSpecServerPatchArgsDict',
+    'SparkConnectSpecServerPatchArgs',
+    'SparkConnectSpecServerServiceMetadataPatchArgsDict',
+    'SparkConnectSpecServerServiceMetadataPatchArgs',
+    'SparkConnectSpecServerServiceMetadataArgsDict',
+    'SparkConnectSpecServerServiceMetadataArgs',
+    'SparkConnectSpecServerServicePatchArgsDict',
+    'SparkConnectSpecServerServicePatchArgs',
+    'SparkConnectSpecServerServiceSpecPatchArgsDict',
+    'SparkConnectSpecServerServiceSpecPatchArgs',
+    'SparkConnectSpecServerServiceSpecPortsPatchArgsDict',
+    'SparkConnectSpecServerServiceSpecPortsPatchArgs',
+    'SparkConnectSpecServerServiceSpecPortsArgsDict',
+    'SparkConnectSpecServerServiceSpecPortsArgs',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgsDict',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgs',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgsDict',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgs',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigPatchArgsDict',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigPatchArgs',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigArgsDict',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigArgs',
+    'SparkConnectSpecServerServiceSpecArgsDict',
+    'SparkConnectSpecServerServiceSpecArgs',
+    'SparkConnectSpecServerServiceStatusConditionsPatchArgsDict',
+    'SparkConnectSpecServerServiceStatusConditionsPatchArgs',
+    'SparkConnectSpecServerServiceStatusConditionsArgsDict',
+    'SparkConnectSpecServerServiceStatusConditionsArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgsDict',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgsDict',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgsDict',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressArgsDict',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerPatchArgsDict',
+    'SparkConnectSpecServerServiceStatusLoadBalancerPatchArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerArgsDict',
+    'SparkConnectSpecServerServiceStatusLoadBalancerArgs',
+    'SparkConnectSpecServerServiceStatusPatchArgsDict',
+    'SparkConnectSpecServerServiceStatusPatchArgs',
+    'SparkConnectSpecServerServiceStatusArgsDict',
+    'SparkConnectSpecServerServiceStatusArgs',
+    'SparkConnectSpecServerServiceArgsDict',
+    'SparkConnectSpecServerServiceArgs',
+    'SparkConnectSpecServerArgsDict',
+    'SparkConnectSpecServerArgs',
+    'SparkConnectSpecArgsDict',
+    'SparkConnectSpecArgs',
+    'SparkConnectStatusConditionsArgsDict',
+    'SparkConnectStatusConditionsArgs',
+    'SparkConnectStatusServerArgsDict',
+    'SparkConnectStatusServerArgs',
+    'SparkConnectStatusArgsDict',
+    'SparkConnectStatusArgs',
+    'SparkConnectArgsDict',
+    'SparkConnectArgs',
+    'outputs',
+]
+
+# Resource classes live in same-named modules; everything else is an input type.
+_RESOURCE_MODULES = {
+    'SparkConnectInitArgs': 'SparkConnect',
+    'SparkConnect': 'SparkConnect',
+    'SparkConnectListArgs': 'SparkConnectList',
+    'SparkConnectList': 'SparkConnectList',
+    'SparkConnectPatchArgs': 'SparkConnectPatch',
+    'SparkConnectPatch': 'SparkConnectPatch',
+}
+
+if typing.TYPE_CHECKING:
+    from .SparkConnect import *
+    from .SparkConnectList import *
+    from .SparkConnectPatch import *
+    from ._inputs import *
+    from . import outputs
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in ("_inputs", "outputs"):
+        return importlib.import_module(f"{__name__}.{name}")
+    module_name = _RESOURCE_MODULES.get(name)
+    if module_name is not None:
+        module = importlib.import_module(f"{__name__}.{module_name}")
+    else:
+        module = importlib.import_module(f"{__name__}._inputs")
+        if name not in module.__all__:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
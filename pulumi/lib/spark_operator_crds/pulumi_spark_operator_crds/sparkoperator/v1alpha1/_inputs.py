@@ -1,5175 +0,0 @@
-# coding=utf-8
-# *** WARNING: this file was generated by crd2pulumi. ***
-# *** Do not edit by hand unless you're certain you know what you are doing! ***
-
-import builtins as _builtins
-import warnings
-import sys
-import pulumi
-import pulumi.runtime
-from typing import Any, Mapping, Optional, Sequence, Union, overload
-if sys.version_info >= (3, 11):
-    from typing import NotRequired, TypedDict, TypeAlias
-else:
-    from typing_extensions import NotRequired, TypedDict, TypeAlias
-from ... import _utilities
-from ... import meta as _meta
-
-__all__ = [
-    'SparkConnectSpecDynamicAllocationPatchArgs',
-    'SparkConnectSpecDynamicAllocationPatchArgsDict',
-    'SparkConnectSpecDynamicAllocationArgs',
-    'SparkConnectSpecDynamicAllocationArgsDict',
-    'SparkConnectSpecExecutorPatchArgs',
-    'SparkConnectSpecExecutorPatchArgsDict',
-    'SparkConnectSpecExecutorArgs',
-    'SparkConnectSpecExecutorArgsDict',
-    'SparkConnectSpecPatchArgs',
-    'SparkConnectSpecPatchArgsDict',
-    'SparkConnectSpecServerPatchArgs',
-    'SparkConnectSpecServerPatchArgsDict',
-    'SparkConnectSpecServerServiceMetadataPatchArgs',
-    'SparkConnectSpecServerServiceMetadataPatchArgsDict',
-    'SparkConnectSpecServerServiceMetadataArgs',
-    'SparkConnectSpecServerServiceMetadataArgsDict',
-    'SparkConnectSpecServerServicePatchArgs',
-    'SparkConnectSpecServerServicePatchArgsDict',
-    'SparkConnectSpecServerServiceSpecPatchArgs',
-    'SparkConnectSpecServerServiceSpecPatchArgsDict',
-    'SparkConnectSpecServerServiceSpecPortsPatchArgs',
-    'SparkConnectSpecServerServiceSpecPortsPatchArgsDict',
-    'SparkConnectSpecServerServiceSpecPortsArgs',
-    'SparkConnectSpecServerServiceSpecPortsArgsDict',
-    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgs',
-    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgsDict',
-    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgs',
-    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgsDict',
-    'SparkConnectSpecServerServiceSpecSessionAffinityConfigPatchArgs',
-    'SparkConnectSpecServerServiceSpecSessionAffinityConfigPatchArgsDict',
-    'SparkConnectSpecServerServiceSpecSessionAffinityConfigArgs',
-    'SparkConnectSpecServerServiceSpecSessionAffinityConfigArgsDict',
-    'SparkConnectSpecServerServiceSpecArgs',
-    'SparkConnectSpecServerServiceSpecArgsDict',
-    'SparkConnectSpecServerServiceStatusConditionsPatchArgs',
-    'SparkConnectSpecServerServiceStatusConditionsPatchArgsDict',
-    'SparkConnectSpecServerServiceStatusConditionsArgs',
-    'SparkConnectSpecServerServiceStatusConditionsArgsDict',
-    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgs',
-    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgsDict',
-    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgs',
-    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgsDict',
-    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs',
-    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgsDict',
-    'SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs',
-    'SparkConnectSpecServerServiceStatusLoadBalancerIngressArgsDict',
-    'SparkConnectSpecServerServiceStatusLoadBalancerPatchArgs',
-    'SparkConnectSpecServerServiceStatusLoadBalancerPatchArgsDict',
-    'SparkConnectSpecServerServiceStatusLoadBalancerArgs',
-    'SparkConnectSpecServerServiceStatusLoadBalancerArgsDict',
-    'SparkConnectSpecServerServiceStatusPatchArgs',
-    'SparkConnectSpecServerServiceStatusPatchArgsDict',
-    'SparkConnectSpecServerServiceStatusArgs',
-    'SparkConnectSpecServerServiceStatusArgsDict',
-    'SparkConnectSpecServerServiceArgs',
-    'SparkConnectSpecServerServiceArgsDict',
-    'SparkConnectSpecServerArgs',
-    'SparkConnectSpecServerArgsDict',
-    'SparkConnectSpecArgs',
-    'SparkConnectSpecArgsDict',
-    'SparkConnectStatusConditionsArgs',
-    'SparkConnectStatusConditionsArgsDict',
-    'SparkConnectStatusServerArgs',
-    'SparkConnectStatusServerArgsDict',
-    'SparkConnectStatusArgs',
-    'SparkConnectStatusArgsDict',
-    'SparkConnectArgs',
-    'SparkConnectArgsDict',
-]
-
-class SparkConnectSpecDynamicAllocationPatchArgsDict(TypedDict):
-    """
-    DynamicAllocation configures dynamic allocation that becomes available for the Kubernetes
-    scheduler backend since Spark 3.0.
-    """
-    enabled: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Enabled controls whether dynamic allocation is enabled or not.
-    """
-    initial_executors: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    InitialExecutors is the initial number of executors to request. If .spec.executor.instances
-    is also set, the initial number of executors is set to the bigger of that and this option.
-    """
-    max_executors: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    MaxExecutors is the upper bound for the number of executors if dynamic allocation is enabled.
-    """
-    min_executors: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    MinExecutors is the lower bound for the number of executors if dynamic allocation is enabled.
-    """
-    shuffle_tracking_enabled: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    ShuffleTrackingEnabled enables shuffle file tracking for executors, which allows dynamic allocation without
-    the need for an external shuffle service. This option will try to keep alive executors that are storing
-    shuffle data for active jobs. If external shuffle service is enabled, set ShuffleTrackingEnabled to false.
-    ShuffleTrackingEnabled is true by default if dynamicAllocation.enabled is true.
-    """
-    shuffle_tracking_timeout: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    ShuffleTrackingTimeout controls the timeout in milliseconds for executors that are holding
-    shuffle data if shuffle tracking is enabled (true by default if dynamic allocation is enabled).
-    """
-
-@pulumi.input_type
-class SparkConnectSpecDynamicAllocationPatchArgs:
-    def __init__(__self__, *,
-                 enabled: pulumi.Input[Optional[_builtins.bool]] = None,
-                 initial_executors: pulumi.Input[Optional[_builtins.int]] = None,
-                 max_executors: pulumi.Input[Optional[_builtins.int]] = None,
-                 min_executors: pulumi.Input[Optional[_builtins.int]] = None,
-                 shuffle_tracking_enabled: pulumi.Input[Optional[_builtins.bool]] = None,
-                 shuffle_tracking_timeout: pulumi.Input[Optional[_builtins.int]] = None):
-        """
-        DynamicAllocation configures dynamic allocation that becomes available for the Kubernetes
-        scheduler backend since Spark 3.0.
-
-        :param pulumi.Input[_builtins.bool] enabled: Enabled controls whether dynamic allocation is enabled or not.
-        :param pulumi.Input[_builtins.int] initial_executors: InitialExecutors is the initial number of executors to request. If .spec.executor.instances
-               is also set, the initial number of executors is set to the bigger of that and this option.
-        :param pulumi.Input[_builtins.int] max_executors: MaxExecutors is the upper bound for the number of executors if dynamic allocation is enabled.
-        :param pulumi.Input[_builtins.int] min_executors: MinExecutors is the lower bound for the number of executors if dynamic allocation is enabled.
-        :param pulumi.Input[_builtins.bool] shuffle_tracking_enabled: ShuffleTrackingEnabled enables shuffle file tracking for executors, which allows dynamic allocation without
-               the need for an external shuffle service. This option will try to keep alive executors that are storing
-               shuffle data for active jobs. If external shuffle service is enabled, set ShuffleTrackingEnabled to false.
-               ShuffleTrackingEnabled is true by default if dynamicAllocation.enabled is true.
-        :param pulumi.Input[_builtins.int] shuffle_tracking_timeout: ShuffleTrackingTimeout controls the timeout in milliseconds for executors that are holding
-               shuffle data if shuffle tracking is enabled (true by default if dynamic allocation is enabled).
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-        if initial_executors is not None:
-            pulumi.set(__self__, "initial_executors", initial_executors)
-        if max_executors is not None:
-            pulumi.set(__self__, "max_executors", max_executors)
-        if min_executors is not None:
-            pulumi.set(__self__, "min_executors", min_executors)
-        if shuffle_tracking_enabled is not None:
-            pulumi.set(__self__, "shuffle_tracking_enabled", shuffle_tracking_enabled)
-        if shuffle_tracking_timeout is not None:
-            pulumi.set(__self__, "shuffle_tracking_timeout", shuffle_tracking_timeout)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Enabled controls whether dynamic allocation is enabled or not.
-        """
-        return pulumi.get(self, "enabled")
-
-    @enabled.setter
-    def enabled(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "enabled", value)
-
-    @_builtins.property
-    @pulumi.getter(name="initialExecutors")
-    def initial_executors(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        InitialExecutors is the initial number of executors to request. If .spec.executor.instances
-        is also set, the initial number of executors is set to the bigger of that and this option.
-        """
-        return pulumi.get(self, "initial_executors")
-
-    @initial_executors.setter
-    def initial_executors(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "initial_executors", value)
-
-    @_builtins.property
-    @pulumi.getter(name="maxExecutors")
-    def max_executors(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        MaxExecutors is the upper bound for the number of executors if dynamic allocation is enabled.
-        """
-        return pulumi.get(self, "max_executors")
-
-    @max_executors.setter
-    def max_executors(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "max_executors", value)
-
-    @_builtins.property
-    @pulumi.getter(name="minExecutors")
-    def min_executors(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        MinExecutors is the lower bound for the number of executors if dynamic allocation is enabled.
-        """
-        return pulumi.get(self, "min_executors")
-
-    @min_executors.setter
-    def min_executors(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "min_executors", value)
-
-    @_builtins.property
-    @pulumi.getter(name="shuffleTrackingEnabled")
-    def shuffle_tracking_enabled(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        ShuffleTrackingEnabled enables shuffle file tracking for executors, which allows dynamic allocation without
-        the need for an external shuffle service. This option will try to keep alive executors that are storing
-        shuffle data for active jobs. If external shuffle service is enabled, set ShuffleTrackingEnabled to false.
-        ShuffleTrackingEnabled is true by default if dynamicAllocation.enabled is true.
-        """
-        return pulumi.get(self, "shuffle_tracking_enabled")
-
-    @shuffle_tracking_enabled.setter
-    def shuffle_tracking_enabled(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "shuffle_tracking_enabled", value)
-
-    @_builtins.property
-    @pulumi.getter(name="shuffleTrackingTimeout")
-    def shuffle_tracking_timeout(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        ShuffleTrackingTimeout controls the timeout in milliseconds for executors that are holding
-        shuffle data if shuffle tracking is enabled (true by default if dynamic allocation is enabled).
-        """
-        return pulumi.get(self, "shuffle_tracking_timeout")
-
-    @shuffle_tracking_timeout.setter
-    def shuffle_tracking_timeout(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "shuffle_tracking_timeout", value)
-
-
-class SparkConnectSpecDynamicAllocationArgsDict(TypedDict):
-    """
-    DynamicAllocation configures dynamic allocation that becomes available for the Kubernetes
-    scheduler backend since Spark 3.0.
-    """
-    enabled: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Enabled controls whether dynamic allocation is enabled or not.
-    """
-    initial_executors: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    InitialExecutors is the initial number of executors to request. If .spec.executor.instances
-    is also set, the initial number of executors is set to the bigger of that and this option.
-    """
-    max_executors: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    MaxExecutors is the upper bound for the number of executors if dynamic allocation is enabled.
-    """
-    min_executors: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    MinExecutors is the lower bound for the number of executors if dynamic allocation is enabled.
-    """
-    shuffle_tracking_enabled: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    ShuffleTrackingEnabled enables shuffle file tracking for executors, which allows dynamic allocation without
-    the need for an external shuffle service. This option will try to keep alive executors that are storing
-    shuffle data for active jobs. If external shuffle service is enabled, set ShuffleTrackingEnabled to false.
-    ShuffleTrackingEnabled is true by default if dynamicAllocation.enabled is true.
-    """
-    shuffle_tracking_timeout: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    ShuffleTrackingTimeout controls the timeout in milliseconds for executors that are holding
-    shuffle data if shuffle tracking is enabled (true by default if dynamic allocation is enabled).
-    """
-
-@pulumi.input_type
-class SparkConnectSpecDynamicAllocationArgs:
-    def __init__(__self__, *,
-                 enabled: pulumi.Input[Optional[_builtins.bool]] = None,
-                 initial_executors: pulumi.Input[Optional[_builtins.int]] = None,
-                 max_executors: pulumi.Input[Optional[_builtins.int]] = None,
-                 min_executors: pulumi.Input[Optional[_builtins.int]] = None,
-                 shuffle_tracking_enabled: pulumi.Input[Optional[_builtins.bool]] = None,
-                 shuffle_tracking_timeout: pulumi.Input[Optional[_builtins.int]] = None):
-        """
-        DynamicAllocation configures dynamic allocation that becomes available for the Kubernetes
-        scheduler backend since Spark 3.0.
-
-        :param pulumi.Input[_builtins.bool] enabled: Enabled controls whether dynamic allocation is enabled or not.
-        :param pulumi.Input[_builtins.int] initial_executors: InitialExecutors is the initial number of executors to request. If .spec.executor.instances
-               is also set, the initial number of executors is set to the bigger of that and this option.
-        :param pulumi.Input[_builtins.int] max_executors: MaxExecutors is the upper bound for the number of executors if dynamic allocation is enabled.
-        :param pulumi.Input[_builtins.int] min_executors: MinExecutors is the lower bound for the number of executors if dynamic allocation is enabled.
-        :param pulumi.Input[_builtins.bool] shuffle_tracking_enabled: ShuffleTrackingEnabled enables shuffle file tracking for executors, which allows dynamic allocation without
-               the need for an external shuffle service. This option will try to keep alive executors that are storing
-               shuffle data for active jobs. If external shuffle service is enabled, set ShuffleTrackingEnabled to false.
-               ShuffleTrackingEnabled is true by default if dynamicAllocation.enabled is true.
-        :param pulumi.Input[_builtins.int] shuffle_tracking_timeout: ShuffleTrackingTimeout controls the timeout in milliseconds for executors that are holding
-               shuffle data if shuffle tracking is enabled (true by default if dynamic allocation is enabled).
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-        if initial_executors is not None:
-            pulumi.set(__self__, "initial_executors", initial_executors)
-        if max_executors is not None:
-            pulumi.set(__self__, "max_executors", max_executors)
-        if min_executors is not None:
-            pulumi.set(__self__, "min_executors", min_executors)
-        if shuffle_tracking_enabled is not None:
-            pulumi.set(__self__, "shuffle_tracking_enabled", shuffle_tracking_enabled)
-        if shuffle_tracking_timeout is not None:
-            pulumi.set(__self__, "shuffle_tracking_timeout", shuffle_tracking_timeout)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Enabled controls whether dynamic allocation is enabled or not.
-        """
-        return pulumi.get(self, "enabled")
-
-    @enabled.setter
-    def enabled(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "enabled", value)
-
-    @_builtins.property
-    @pulumi.getter(name="initialExecutors")
-    def initial_executors(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        InitialExecutors is the initial number of executors to request. If .spec.executor.instances
-        is also set, the initial number of executors is set to the bigger of that and this option.
-        """
-        return pulumi.get(self, "initial_executors")
-
-    @initial_executors.setter
-    def initial_executors(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "initial_executors", value)
-
-    @_builtins.property
-    @pulumi.getter(name="maxExecutors")
-    def max_executors(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        MaxExecutors is the upper bound for the number of executors if dynamic allocation is enabled.
-        """
-        return pulumi.get(self, "max_executors")
-
-    @max_executors.setter
-    def max_executors(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "max_executors", value)
-
-    @_builtins.property
-    @pulumi.getter(name="minExecutors")
-    def min_executors(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        MinExecutors is the lower bound for the number of executors if dynamic allocation is enabled.
-        """
-        return pulumi.get(self, "min_executors")
-
-    @min_executors.setter
-    def min_executors(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "min_executors", value)
-
-    @_builtins.property
-    @pulumi.getter(name="shuffleTrackingEnabled")
-    def shuffle_tracking_enabled(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        ShuffleTrackingEnabled enables shuffle file tracking for executors, which allows dynamic allocation without
-        the need for an external shuffle service. This option will try to keep alive executors that are storing
-        shuffle data for active jobs. If external shuffle service is enabled, set ShuffleTrackingEnabled to false.
-        ShuffleTrackingEnabled is true by default if dynamicAllocation.enabled is true.
-        """
-        return pulumi.get(self, "shuffle_tracking_enabled")
-
-    @shuffle_tracking_enabled.setter
-    def shuffle_tracking_enabled(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "shuffle_tracking_enabled", value)
-
-    @_builtins.property
-    @pulumi.getter(name="shuffleTrackingTimeout")
-    def shuffle_tracking_timeout(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        ShuffleTrackingTimeout controls the timeout in milliseconds for executors that are holding
-        shuffle data if shuffle tracking is enabled (true by default if dynamic allocation is enabled).
-        """
-        return pulumi.get(self, "shuffle_tracking_timeout")
-
-    @shuffle_tracking_timeout.setter
-    def shuffle_tracking_timeout(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "shuffle_tracking_timeout", value)
-
-
-class SparkConnectSpecExecutorPatchArgsDict(TypedDict):
-    """
-    Executor is the Spark executor specification.
-    """
-    cores: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-    """
-    instances: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    Instances is the number of executor instances.
-    """
-    memory: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Memory is the amount of memory to request for the pod.
-    """
-    template: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
-    """
-    Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-    Spark version >= 3.0.0 is required.
-    Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-    """
-
-@pulumi.input_type
-class SparkConnectSpecExecutorPatchArgs:
-    def __init__(__self__, *,
-                 cores: pulumi.Input[Optional[_builtins.int]] = None,
-                 instances: pulumi.Input[Optional[_builtins.int]] = None,
-                 memory: pulumi.Input[Optional[_builtins.str]] = None,
-                 template: pulumi.Input[Optional[Mapping[str, Any]]] = None):
-        """
-        Executor is the Spark executor specification.
-
-        :param pulumi.Input[_builtins.int] cores: Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-        :param pulumi.Input[_builtins.int] instances: Instances is the number of executor instances.
-        :param pulumi.Input[_builtins.str] memory: Memory is the amount of memory to request for the pod.
-        :param pulumi.Input[Mapping[str, Any]] template: Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-               Spark version >= 3.0.0 is required.
-               Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-        """
-        if cores is not None:
-            pulumi.set(__self__, "cores", cores)
-        if instances is not None:
-            pulumi.set(__self__, "instances", instances)
-        if memory is not None:
-            pulumi.set(__self__, "memory", memory)
-        if template is not None:
-            pulumi.set(__self__, "template", template)
-
-    @_builtins.property
-    @pulumi.getter
-    def cores(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-        """
-        return pulumi.get(self, "cores")
-
-    @cores.setter
-    def cores(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "cores", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def instances(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        Instances is the number of executor instances.
-        """
-        return pulumi.get(self, "instances")
-
-    @instances.setter
-    def instances(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "instances", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def memory(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Memory is the amount of memory to request for the pod.
-        """
-        return pulumi.get(self, "memory")
-
-    @memory.setter
-    def memory(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "memory", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def template(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
-        """
-        Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-        Spark version >= 3.0.0 is required.
-        Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-        """
-        return pulumi.get(self, "template")
-
-    @template.setter
-    def template(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
-        pulumi.set(self, "template", value)
-
-
-class SparkConnectSpecExecutorArgsDict(TypedDict):
-    """
-    Executor is the Spark executor specification.
-    """
-    cores: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-    """
-    instances: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    Instances is the number of executor instances.
-    """
-    memory: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Memory is the amount of memory to request for the pod.
-    """
-    template: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
-    """
-    Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-    Spark version >= 3.0.0 is required.
-    Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-    """
-
-@pulumi.input_type
-class SparkConnectSpecExecutorArgs:
-    def __init__(__self__, *,
-                 cores: pulumi.Input[Optional[_builtins.int]] = None,
-                 instances: pulumi.Input[Optional[_builtins.int]] = None,
-                 memory: pulumi.Input[Optional[_builtins.str]] = None,
-                 template: pulumi.Input[Optional[Mapping[str, Any]]] = None):
-        """
-        Executor is the Spark executor specification.
-
-        :param pulumi.Input[_builtins.int] cores: Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-        :param pulumi.Input[_builtins.int] instances: Instances is the number of executor instances.
-        :param pulumi.Input[_builtins.str] memory: Memory is the amount of memory to request for the pod.
-        :param pulumi.Input[Mapping[str, Any]] template: Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-               Spark version >= 3.0.0 is required.
-               Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-        """
-        if cores is not None:
-            pulumi.set(__self__, "cores", cores)
-        if instances is not None:
-            pulumi.set(__self__, "instances", instances)
-        if memory is not None:
-            pulumi.set(__self__, "memory", memory)
-        if template is not None:
-            pulumi.set(__self__, "template", template)
-
-    @_builtins.property
-    @pulumi.getter
-    def cores(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-        """
-        return pulumi.get(self, "cores")
-
-    @cores.setter
-    def cores(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "cores", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def instances(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        Instances is the number of executor instances.
-        """
-        return pulumi.get(self, "instances")
-
-    @instances.setter
-    def instances(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "instances", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def memory(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Memory is the amount of memory to request for the pod.
-        """
-        return pulumi.get(self, "memory")
-
-    @memory.setter
-    def memory(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "memory", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def template(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
-        """
-        Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-        Spark version >= 3.0.0 is required.
-        Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-        """
-        return pulumi.get(self, "template")
-
-    @template.setter
-    def template(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
-        pulumi.set(self, "template", value)
-
-
-class SparkConnectSpecPatchArgsDict(TypedDict):
-    """
-    SparkConnectSpec defines the desired state of SparkConnect.
-    """
-    dynamic_allocation: NotRequired[pulumi.Input[Optional['SparkConnectSpecDynamicAllocationPatchArgs']]]
-    executor: NotRequired[pulumi.Input[Optional['SparkConnectSpecExecutorPatchArgs']]]
-    hadoop_conf: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    HadoopConf carries user-specified Hadoop configuration properties as they would use the "--conf" option
-    in spark-submit. The SparkApplication controller automatically adds prefix "spark.hadoop." to Hadoop
-    configuration properties.
-    """
-    image: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Image is the container image for the driver, executor, and init-container. Any custom container images for the
-    driver, executor, or init-container takes precedence over this.
-    """
-    server: NotRequired[pulumi.Input[Optional['SparkConnectSpecServerPatchArgs']]]
-    spark_conf: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    SparkConf carries user-specified Spark configuration properties as they would use the "--conf" option in
-    spark-submit.
-    """
-    spark_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    SparkVersion is the version of Spark the spark connect use.
-    """
-
-@pulumi.input_type
-class SparkConnectSpecPatchArgs:
-    def __init__(__self__, *,
-                 dynamic_allocation: pulumi.Input[Optional['SparkConnectSpecDynamicAllocationPatchArgs']] = None,
-                 executor: pulumi.Input[Optional['SparkConnectSpecExecutorPatchArgs']] = None,
-                 hadoop_conf: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 image: pulumi.Input[Optional[_builtins.str]] = None,
-                 server: pulumi.Input[Optional['SparkConnectSpecServerPatchArgs']] = None,
-                 spark_conf: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 spark_version: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        SparkConnectSpec defines the desired state of SparkConnect.
-
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] hadoop_conf: HadoopConf carries user-specified Hadoop configuration properties as they would use the "--conf" option
-               in spark-submit. The SparkApplication controller automatically adds prefix "spark.hadoop." to Hadoop
-               configuration properties.
-        :param pulumi.Input[_builtins.str] image: Image is the container image for the driver, executor, and init-container. Any custom container images for the
-               driver, executor, or init-container takes precedence over this.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] spark_conf: SparkConf carries user-specified Spark configuration properties as they would use the "--conf" option in
-               spark-submit.
-        :param pulumi.Input[_builtins.str] spark_version: SparkVersion is the version of Spark the spark connect use.
-        """
-        if dynamic_allocation is not None:
-            pulumi.set(__self__, "dynamic_allocation", dynamic_allocation)
-        if executor is not None:
-            pulumi.set(__self__, "executor", executor)
-        if hadoop_conf is not None:
-            pulumi.set(__self__, "hadoop_conf", hadoop_conf)
-        if image is not None:
-            pulumi.set(__self__, "image", image)
-        if server is not None:
-            pulumi.set(__self__, "server", server)
-        if spark_conf is not None:
-            pulumi.set(__self__, "spark_conf", spark_conf)
-        if spark_version is not None:
-            pulumi.set(__self__, "spark_version", spark_version)
-
-    @_builtins.property
-    @pulumi.getter(name="dynamicAllocation")
-    def dynamic_allocation(self) -> pulumi.Input[Optional['SparkConnectSpecDynamicAllocationPatchArgs']]:
-        return pulumi.get(self, "dynamic_allocation")
-
-    @dynamic_allocation.setter
-    def dynamic_allocation(self, value: pulumi.Input[Optional['SparkConnectSpecDynamicAllocationPatchArgs']]):
-        pulumi.set(self, "dynamic_allocation", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def executor(self) -> pulumi.Input[Optional['SparkConnectSpecExecutorPatchArgs']]:
-        return pulumi.get(self, "executor")
-
-    @executor.setter
-    def executor(self, value: pulumi.Input[Optional['SparkConnectSpecExecutorPatchArgs']]):
-        pulumi.set(self, "executor", value)
-
-    @_builtins.property
-    @pulumi.getter(name="hadoopConf")
-    def hadoop_conf(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        HadoopConf carries user-specified Hadoop configuration properties as they would use the "--conf" option
-        in spark-submit. The SparkApplication controller automatically adds prefix "spark.hadoop." to Hadoop
-        configuration properties.
-        """
-        return pulumi.get(self, "hadoop_conf")
-
-    @hadoop_conf.setter
-    def hadoop_conf(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "hadoop_conf", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def image(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Image is the container image for the driver, executor, and init-container. Any custom container images for the
-        driver, executor, or init-container takes precedence over this.
-        """
-        return pulumi.get(self, "image")
-
-    @image.setter
-    def image(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "image", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def server(self) -> pulumi.Input[Optional['SparkConnectSpecServerPatchArgs']]:
-        return pulumi.get(self, "server")
-
-    @server.setter
-    def server(self, value: pulumi.Input[Optional['SparkConnectSpecServerPatchArgs']]):
-        pulumi.set(self, "server", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sparkConf")
-    def spark_conf(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        SparkConf carries user-specified Spark configuration properties as they would use the "--conf" option in
-        spark-submit.
-        """
-        return pulumi.get(self, "spark_conf")
-
-    @spark_conf.setter
-    def spark_conf(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "spark_conf", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sparkVersion")
-    def spark_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        SparkVersion is the version of Spark the spark connect use.
-        """
-        return pulumi.get(self, "spark_version")
-
-    @spark_version.setter
-    def spark_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "spark_version", value)
-
-
-class SparkConnectSpecServerPatchArgsDict(TypedDict):
-    """
-    Server is the Spark connect server specification.
-    """
-    cores: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-    """
-    memory: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Memory is the amount of memory to request for the pod.
-    """
-    service: NotRequired[pulumi.Input[Optional['SparkConnectSpecServerServicePatchArgs']]]
-    template: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
-    """
-    Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-    Spark version >= 3.0.0 is required.
-    Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-    """
-
-@pulumi.input_type
-class SparkConnectSpecServerPatchArgs:
-    def __init__(__self__, *,
-                 cores: pulumi.Input[Optional[_builtins.int]] = None,
-                 memory: pulumi.Input[Optional[_builtins.str]] = None,
-                 service: pulumi.Input[Optional['SparkConnectSpecServerServicePatchArgs']] = None,
-                 template: pulumi.Input[Optional[Mapping[str, Any]]] = None):
-        """
-        Server is the Spark connect server specification.
-
-        :param pulumi.Input[_builtins.int] cores: Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-        :param pulumi.Input[_builtins.str] memory: Memory is the amount of memory to request for the pod.
-        :param pulumi.Input[Mapping[str, Any]] template: Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-               Spark version >= 3.0.0 is required.
-               Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-        """
-        if cores is not None:
-            pulumi.set(__self__, "cores", cores)
-        if memory is not None:
-            pulumi.set(__self__, "memory", memory)
-        if service is not None:
-            pulumi.set(__self__, "service", service)
-        if template is not None:
-            pulumi.set(__self__, "template", template)
-
-    @_builtins.property
-    @pulumi.getter
-    def cores(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-        """
-        return pulumi.get(self, "cores")
-
-    @cores.setter
-    def cores(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "cores", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def memory(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Memory is the amount of memory to request for the pod.
-        """
-        return pulumi.get(self, "memory")
-
-    @memory.setter
-    def memory(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "memory", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def service(self) -> pulumi.Input[Optional['SparkConnectSpecServerServicePatchArgs']]:
-        return pulumi.get(self, "service")
-
-    @service.setter
-    def service(self, value: pulumi.Input[Optional['SparkConnectSpecServerServicePatchArgs']]):
-        pulumi.set(self, "service", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def template(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
-        """
-        Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-        Spark version >= 3.0.0 is required.
-        Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-        """
-        return pulumi.get(self, "template")
-
-    @template.setter
-    def template(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
-        pulumi.set(self, "template", value)
-
-
-class SparkConnectSpecServerServiceMetadataPatchArgsDict(TypedDict):
-    """
-    Standard object's metadata.
-    More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-    """
-    annotations: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    finalizers: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    namespace: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceMetadataPatchArgs:
-    def __init__(__self__, *,
-                 annotations: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 finalizers: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 namespace: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Standard object's metadata.
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        if annotations is not None:
-            pulumi.set(__self__, "annotations", annotations)
-        if finalizers is not None:
-            pulumi.set(__self__, "finalizers", finalizers)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if namespace is not None:
-            pulumi.set(__self__, "namespace", namespace)
-
-    @_builtins.property
-    @pulumi.getter
-    def annotations(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        return pulumi.get(self, "annotations")
-
-    @annotations.setter
-    def annotations(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "annotations", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def finalizers(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        return pulumi.get(self, "finalizers")
-
-    @finalizers.setter
-    def finalizers(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "finalizers", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        return pulumi.get(self, "labels")
-
-    @labels.setter
-    def labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "labels", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def namespace(self) -> pulumi.Input[Optional[_builtins.str]]:
-        return pulumi.get(self, "namespace")
-
-    @namespace.setter
-    def namespace(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "namespace", value)
-
-
-class SparkConnectSpecServerServiceMetadataArgsDict(TypedDict):
-    """
-    Standard object's metadata.
-    More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-    """
-    annotations: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    finalizers: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    namespace: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceMetadataArgs:
-    def __init__(__self__, *,
-                 annotations: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 finalizers: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 namespace: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Standard object's metadata.
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        if annotations is not None:
-            pulumi.set(__self__, "annotations", annotations)
-        if finalizers is not None:
-            pulumi.set(__self__, "finalizers", finalizers)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if namespace is not None:
-            pulumi.set(__self__, "namespace", namespace)
-
-    @_builtins.property
-    @pulumi.getter
-    def annotations(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        return pulumi.get(self, "annotations")
-
-    @annotations.setter
-    def annotations(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "annotations", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def finalizers(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        return pulumi.get(self, "finalizers")
-
-    @finalizers.setter
-    def finalizers(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "finalizers", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        return pulumi.get(self, "labels")
-
-    @labels.setter
-    def labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "labels", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def namespace(self) -> pulumi.Input[Optional[_builtins.str]]:
-        return pulumi.get(self, "namespace")
-
-    @namespace.setter
-    def namespace(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "namespace", value)
-
-
-class SparkConnectSpecServerServicePatchArgsDict(TypedDict):
-    """
-    Service exposes the Spark connect server.
-    """
-    api_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    APIVersion defines the versioned schema of this representation of an object.
-    Servers should convert recognized schemas to the latest internal value, and
-    may reject unrecognized values.
-    More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-    """
-    kind: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Kind is a string value representing the REST resource this object represents.
-    Servers may infer this from the endpoint the client submits requests to.
-    Cannot be updated.
-    In CamelCase.
-    More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-    """
-    metadata: NotRequired[pulumi.Input[Optional['SparkConnectSpecServerServiceMetadataPatchArgs']]]
-    spec: NotRequired[pulumi.Input[Optional['SparkConnectSpecServerServiceSpecPatchArgs']]]
-    status: NotRequired[pulumi.Input[Optional['SparkConnectSpecServerServiceStatusPatchArgs']]]
-
-@pulumi.input_type
-class SparkConnectSpecServerServicePatchArgs:
-    def __init__(__self__, *,
-                 api_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 kind: pulumi.Input[Optional[_builtins.str]] = None,
-                 metadata: pulumi.Input[Optional['SparkConnectSpecServerServiceMetadataPatchArgs']] = None,
-                 spec: pulumi.Input[Optional['SparkConnectSpecServerServiceSpecPatchArgs']] = None,
-                 status: pulumi.Input[Optional['SparkConnectSpecServerServiceStatusPatchArgs']] = None):
-        """
-        Service exposes the Spark connect server.
-
-        :param pulumi.Input[_builtins.str] api_version: APIVersion defines the versioned schema of this representation of an object.
-               Servers should convert recognized schemas to the latest internal value, and
-               may reject unrecognized values.
-               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        :param pulumi.Input[_builtins.str] kind: Kind is a string value representing the REST resource this object represents.
-               Servers may infer this from the endpoint the client submits requests to.
-               Cannot be updated.
-               In CamelCase.
-               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        if api_version is not None:
-            pulumi.set(__self__, "api_version", api_version)
-        if kind is not None:
-            pulumi.set(__self__, "kind", kind)
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter(name="apiVersion")
-    def api_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        APIVersion defines the versioned schema of this representation of an object.
-        Servers should convert recognized schemas to the latest internal value, and
-        may reject unrecognized values.
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        """
-        return pulumi.get(self, "api_version")
-
-    @api_version.setter
-    def api_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "api_version", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def kind(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Kind is a string value representing the REST resource this object represents.
-        Servers may infer this from the endpoint the client submits requests to.
-        Cannot be updated.
-        In CamelCase.
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        return pulumi.get(self, "kind")
-
-    @kind.setter
-    def kind(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "kind", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> pulumi.Input[Optional['SparkConnectSpecServerServiceMetadataPatchArgs']]:
-        return pulumi.get(self, "metadata")
-
-    @metadata.setter
-    def metadata(self, value: pulumi.Input[Optional['SparkConnectSpecServerServiceMetadataPatchArgs']]):
-        pulumi.set(self, "metadata", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> pulumi.Input[Optional['SparkConnectSpecServerServiceSpecPatchArgs']]:
-        return pulumi.get(self, "spec")
-
-    @spec.setter
-    def spec(self, value: pulumi.Input[Optional['SparkConnectSpecServerServiceSpecPatchArgs']]):
-        pulumi.set(self, "spec", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> pulumi.Input[Optional['SparkConnectSpecServerServiceStatusPatchArgs']]:
-        return pulumi.get(self, "status")
-
-    @status.setter
-    def status(self, value: pulumi.Input[Optional['SparkConnectSpecServerServiceStatusPatchArgs']]):
-        pulumi.set(self, "status", value)
-
-
-class SparkConnectSpecServerServiceSpecPatchArgsDict(TypedDict):
-    """
-    Spec defines the behavior of a service.
-    https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    allocate_load_balancer_node_ports: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    allocateLoadBalancerNodePorts defines if NodePorts will be automatically
-    allocated for services with type LoadBalancer.  Default is "true". It
-    may be set to "false" if the cluster load-balancer does not rely on
-    NodePorts.  If the caller requests specific NodePorts (by specifying a
-    value), those requests will be respected, regardless of this field.
-    This field may only be set for services with type LoadBalancer and will
-    be cleared if the type is changed to any other type.
-    """
-    cluster_ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    clusterIP is the IP address of the service and is usually assigned
-    randomly. If an address is specified manually, is in-range (as per
-    system configuration), and is not in use, it will be allocated to the
-    service; otherwise creation of the service will fail. This field may not
-    be changed through updates unless the type field is also being changed
-    to ExternalName (which requires this field to be blank) or the type
-    field is being changed from ExternalName (in which case this field may
-    optionally be specified, as describe above).  Valid values are "None",
-    empty string (""), or a valid IP address. Setting this to "None" makes a
-    "headless service" (no virtual IP), which is useful when direct endpoint
-    connections are preferred and proxying is not required.  Only applies to
-    types ClusterIP, NodePort, and LoadBalancer. If this field is specified
-    when creating a Service of type ExternalName, creation will fail. This
-    field will be wiped when updating a Service to type ExternalName.
-    More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-    """
-    cluster_ips: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    ClusterIPs is a list of IP addresses assigned to this service, and are
-    usually assigned randomly.  If an address is specified manually, is
-    in-range (as per system configuration), and is not in use, it will be
-    allocated to the service; otherwise creation of the service will fail.
-    This field may not be changed through updates unless the type field is
-    also being changed to ExternalName (which requires this field to be
-    empty) or the type field is being changed from ExternalName (in which
-    case this field may optionally be specified, as describe above).  Valid
-    values are "None", empty string (""), or a valid IP address.  Setting
-    this to "None" makes a "headless service" (no virtual IP), which is
-    useful when direct endpoint connections are preferred and proxying is
-    not required.  Only applies to types ClusterIP, NodePort, and
-    LoadBalancer. If this field is specified when creating a Service of type
-    ExternalName, creation will fail. This field will be wiped when updating
-    a Service to type ExternalName.  If this field is not specified, it will
-    be initialized from the clusterIP field.  If this field is specified,
-    clients must ensure that clusterIPs[0] and clusterIP have the same
-    value.
-
-    This field may hold a maximum of two entries (dual-stack IPs, in either order).
-    These IPs must correspond to the values of the ipFamilies field. Both
-    clusterIPs and ipFamilies are governed by the ipFamilyPolicy field.
-    More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-    """
-    external_ips: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    externalIPs is a list of IP addresses for which nodes in the cluster
-    will also accept traffic for this service.  These IPs are not managed by
-    Kubernetes.  The user is responsible for ensuring that traffic arrives
-    at a node with this IP.  A common example is external load-balancers
-    that are not part of the Kubernetes system.
-    """
-    external_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    externalName is the external reference that discovery mechanisms will
-    return as an alias for this service (e.g. a DNS CNAME record). No
-    proxying will be involved.  Must be a lowercase RFC-1123 hostname
-    (https://tools.ietf.org/html/rfc1123) and requires `type` to be "ExternalName".
-    """
-    external_traffic_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    externalTrafficPolicy describes how nodes distribute service traffic they
-    receive on one of the Service's "externally-facing" addresses (NodePorts,
-    ExternalIPs, and LoadBalancer IPs). If set to "Local", the proxy will configure
-    the service in a way that assumes that external load balancers will take care
-    of balancing the service traffic between nodes, and so each node will deliver
-    traffic only to the node-local endpoints of the service, without masquerading
-    the client source IP. (Traffic mistakenly sent to a node with no endpoints will
-    be dropped.) The default value, "Cluster", uses the standard behavior of
-    routing to all endpoints evenly (possibly modified by topology and other
-    features). Note that traffic sent to an External IP or LoadBalancer IP from
-    within the cluster will always get "Cluster" semantics, but clients sending to
-    a NodePort from within the cluster may need to take traffic policy into account
-    when picking a node.
-    """
-    health_check_node_port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    healthCheckNodePort specifies the healthcheck nodePort for the service.
-    This only applies when type is set to LoadBalancer and
-    externalTrafficPolicy is set to Local. If a value is specified, is
-    in-range, and is not in use, it will be used.  If not specified, a value
-    will be automatically allocated.  External systems (e.g. load-balancers)
-    can use this port to determine if a given node holds endpoints for this
-    service or not.  If this field is specified when creating a Service
-    which does not need it, creation will fail. This field will be wiped
-    when updating a Service to no longer need it (e.g. changing type).
-    This field cannot be updated once set.
-    """
-    internal_traffic_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    InternalTrafficPolicy describes how nodes distribute service traffic they
-    receive on the ClusterIP. If set to "Local", the proxy will assume that pods
-    only want to talk to endpoints of the service on the same node as the pod,
-    dropping the traffic if there are no local endpoints. The default value,
-    "Cluster", uses the standard behavior of routing to all endpoints evenly
-    (possibly modified by topology and other features).
-    """
-    ip_families: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    IPFamilies is a list of IP families (e.g. IPv4, IPv6) assigned to this
-    service. This field is usually assigned automatically based on cluster
-    configuration and the ipFamilyPolicy field. If this field is specified
-    manually, the requested family is available in the cluster,
-    and ipFamilyPolicy allows it, it will be used; otherwise creation of
-    the service will fail. This field is conditionally mutable: it allows
-    for adding or removing a secondary IP family, but it does not allow
-    changing the primary IP family of the Service. Valid values are "IPv4"
-    and "IPv6".  This field only applies to Services of types ClusterIP,
-    NodePort, and LoadBalancer, and does apply to "headless" services.
-    This field will be wiped when updating a Service to type ExternalName.
-
-    This field may hold a maximum of two entries (dual-stack families, in
-    either order).  These families must correspond to the values of the
-    clusterIPs field, if specified. Both clusterIPs and ipFamilies are
-    governed by the ipFamilyPolicy field.
-    """
-    ip_family_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    IPFamilyPolicy represents the dual-stack-ness requested or required by
-    this Service. If there is no value provided, then this field will be set
-    to SingleStack. Services can be "SingleStack" (a single IP family),
-    "PreferDualStack" (two IP families on dual-stack configured clusters or
-    a single IP family on single-stack clusters), or "RequireDualStack"
-    (two IP families on dual-stack configured clusters, otherwise fail). The
-    ipFamilies and clusterIPs fields depend on the value of this field. This
-    field will be wiped when updating a service to type ExternalName.
-    """
-    load_balancer_class: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    loadBalancerClass is the class of the load balancer implementation this Service belongs to.
-    If specified, the value of this field must be a label-style identifier, with an optional prefix,
-    e.g. "internal-vip" or "example.com/internal-vip". Unprefixed names are reserved for end-users.
-    This field can only be set when the Service type is 'LoadBalancer'. If not set, the default load
-    balancer implementation is used, today this is typically done through the cloud provider integration,
-    but should apply for any default implementation. If set, it is assumed that a load balancer
-    implementation is watching for Services with a matching class. Any default load balancer
-    implementation (e.g. cloud providers) should ignore Services that set this field.
-    This field can only be set when creating or updating a Service to type 'LoadBalancer'.
-    Once set, it can not be changed. This field will be wiped when a service is updated to a non 'LoadBalancer' type.
-    """
-    load_balancer_ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Only applies to Service Type: LoadBalancer.
-    This feature depends on whether the underlying cloud-provider supports specifying
-    the loadBalancerIP when a load balancer is created.
-    This field will be ignored if the cloud-provider does not support the feature.
-    Deprecated: This field was under-specified and its meaning varies across implementations.
-    Using it is non-portable and it may not support dual-stack.
-    Users are encouraged to use implementation-specific annotations when available.
-    """
-    load_balancer_source_ranges: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    If specified and supported by the platform, this will restrict traffic through the cloud-provider
-    load-balancer will be restricted to the specified client IPs. This field will be ignored if the
-    cloud-provider does not support the feature."
-    More info: https://kubernetes.io/docs/tasks/access-application-cluster/create-external-load-balancer/
-    """
-    ports: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceSpecPortsPatchArgs']]]]]
-    """
-    The list of ports that are exposed by this service.
-    More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-    """
-    publish_not_ready_addresses: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    publishNotReadyAddresses indicates that any agent which deals with endpoints for this
-    Service should disregard any indications of ready/not-ready.
-    The primary use case for setting this field is for a StatefulSet's Headless Service to
-    propagate SRV DNS records for its Pods for the purpose of peer discovery.
-    The Kubernetes controllers that generate Endpoints and EndpointSlice resources for
-    Services interpret this to mean that all endpoints are considered "ready" even if the
-    Pods themselves are not. Agents which consume only Kubernetes generated endpoints
-    through the Endpoints or EndpointSlice resources can safely assume this behavior.
-    """
-    selector: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    Route service traffic to pods with label keys and values matching this
-    selector. If empty or not present, the service is assumed to have an
-    external process managing its endpoints, which Kubernetes will not
-    modify. Only applies to types ClusterIP, NodePort, and LoadBalancer.
-    Ignored if type is ExternalName.
-    More info: https://kubernetes.io/docs/concepts/services-networking/service/
-    """
-    session_affinity: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Supports "ClientIP" and "None". Used to maintain session affinity.
-    Enable client IP based session affinity.
-    Must be ClientIP or None.
-    Defaults to None.
-    More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-    """
-    session_affinity_config: NotRequired[pulumi.Input[Optional['SparkConnectSpecServerServiceSpecSessionAffinityConfigPatchArgs']]]
-    traffic_distribution: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    TrafficDistribution offers a way to express preferences for how traffic is
-    distributed to Service endpoints. Implementations can use this field as a
-    hint, but are not required to guarantee strict adherence. If the field is
-    not set, the implementation will apply its default routing strategy. If set
-    to "PreferClose", implementations should prioritize endpoints that are
-    topologically close (e.g., same zone).
-    This is a beta field and requires enabling ServiceTrafficDistribution feature.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type determines how the Service is exposed. Defaults to ClusterIP. Valid
-    options are ExternalName, ClusterIP, NodePort, and LoadBalancer.
-    "ClusterIP" allocates a cluster-internal IP address for load-balancing
-    to endpoints. Endpoints are determined by the selector or if that is not
-    specified, by manual construction of an Endpoints object or
-    EndpointSlice objects. If clusterIP is "None", no virtual IP is
-    allocated and the endpoints are published as a set of endpoints rather
-    than a virtual IP.
-    "NodePort" builds on ClusterIP and allocates a port on every node which
-    routes to the same endpoints as the clusterIP.
-    "LoadBalancer" builds on NodePort and creates an external load-balancer
-    (if supported in the current cloud) which routes to the same endpoints
-    as the clusterIP.
-    "ExternalName" aliases this service to the specified externalName.
-    Several other fields do not apply to ExternalName services.
-    More info: https://kubernetes.io/docs/concepts/services-networking/service/#publishing-services-service-types
-    """
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceSpecPatchArgs:
-    def __init__(__self__, *,
-                 allocate_load_balancer_node_ports: pulumi.Input[Optional[_builtins.bool]] = None,
-                 cluster_ip: pulumi.Input[Optional[_builtins.str]] = None,
-                 cluster_ips: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 external_ips: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 external_name: pulumi.Input[Optional[_builtins.str]] = None,
-                 external_traffic_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 health_check_node_port: pulumi.Input[Optional[_builtins.int]] = None,
-                 internal_traffic_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 ip_families: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 ip_family_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 load_balancer_class: pulumi.Input[Optional[_builtins.str]] = None,
-                 load_balancer_ip: pulumi.Input[Optional[_builtins.str]] = None,
-                 load_balancer_source_ranges: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 ports: pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceSpecPortsPatchArgs']]]] = None,
-                 publish_not_ready_addresses: pulumi.Input[Optional[_builtins.bool]] = None,
-                 selector: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 session_affinity: pulumi.Input[Optional[_builtins.str]] = None,
-                 session_affinity_config: pulumi.Input[Optional['SparkConnectSpecServerServiceSpecSessionAffinityConfigPatchArgs']] = None,
-                 traffic_distribution: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Spec defines the behavior of a service.
-        https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param pulumi.Input[_builtins.bool] allocate_load_balancer_node_ports: allocateLoadBalancerNodePorts defines if NodePorts will be automatically
-               allocated for services with type LoadBalancer.  Default is "true". It
-               may be set to "false" if the cluster load-balancer does not rely on
-               NodePorts.  If the caller requests specific NodePorts (by specifying a
-               value), those requests will be respected, regardless of this field.
-               This field may only be set for services with type LoadBalancer and will
-               be cleared if the type is changed to any other type.
-        :param pulumi.Input[_builtins.str] cluster_ip: clusterIP is the IP address of the service and is usually assigned
-               randomly. If an address is specified manually, is in-range (as per
-               system configuration), and is not in use, it will be allocated to the
-               service; otherwise creation of the service will fail. This field may not
-               be changed through updates unless the type field is also being changed
-               to ExternalName (which requires this field to be blank) or the type
-               field is being changed from ExternalName (in which case this field may
-               optionally be specified, as describe above).  Valid values are "None",
-               empty string (""), or a valid IP address. Setting this to "None" makes a
-               "headless service" (no virtual IP), which is useful when direct endpoint
-               connections are preferred and proxying is not required.  Only applies to
-               types ClusterIP, NodePort, and LoadBalancer. If this field is specified
-               when creating a Service of type ExternalName, creation will fail. This
-               field will be wiped when updating a Service to type ExternalName.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] cluster_ips: ClusterIPs is a list of IP addresses assigned to this service, and are
-               usually assigned randomly.  If an address is specified manually, is
-               in-range (as per system configuration), and is not in use, it will be
-               allocated to the service; otherwise creation of the service will fail.
-               This field may not be changed through updates unless the type field is
-               also being changed to ExternalName (which requires this field to be
-               empty) or the type field is being changed from ExternalName (in which
-               case this field may optionally be specified, as describe above).  Valid
-               values are "None", empty string (""), or a valid IP address.  Setting
-               this to "None" makes a "headless service" (no virtual IP), which is
-               useful when direct endpoint connections are preferred and proxying is
-               not required.  Only applies to types ClusterIP, NodePort, and
-               LoadBalancer. If this field is specified when creating a Service of type
-               ExternalName, creation will fail. This field will be wiped when updating
-               a Service to type ExternalName.  If this field is not specified, it will
-               be initialized from the clusterIP field.  If this field is specified,
-               clients must ensure that clusterIPs[0] and clusterIP have the same
-               value.
-
-               This field may hold a maximum of two entries (dual-stack IPs, in either order).
-               These IPs must correspond to the values of the ipFamilies field. Both
-               clusterIPs and ipFamilies are governed by the ipFamilyPolicy field.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] external_ips: externalIPs is a list of IP addresses for which nodes in the cluster
-               will also accept traffic for this service.  These IPs are not managed by
-               Kubernetes.  The user is responsible for ensuring that traffic arrives
-               at a node with this IP.  A common example is external load-balancers
-               that are not part of the Kubernetes system.
-        :param pulumi.Input[_builtins.str] external_name: externalName is the external reference that discovery mechanisms will
-               return as an alias for this service (e.g. a DNS CNAME record). No
-               proxying will be involved.  Must be a lowercase RFC-1123 hostname
-               (https://tools.ietf.org/html/rfc1123) and requires `type` to be "ExternalName".
-        :param pulumi.Input[_builtins.str] external_traffic_policy: externalTrafficPolicy describes how nodes distribute service traffic they
-               receive on one of the Service's "externally-facing" addresses (NodePorts,
-               ExternalIPs, and LoadBalancer IPs). If set to "Local", the proxy will configure
-               the service in a way that assumes that external load balancers will take care
-               of balancing the service traffic between nodes, and so each node will deliver
-               traffic only to the node-local endpoints of the service, without masquerading
-               the client source IP. (Traffic mistakenly sent to a node with no endpoints will
-               be dropped.) The default value, "Cluster", uses the standard behavior of
-               routing to all endpoints evenly (possibly modified by topology and other
-               features). Note that traffic sent to an External IP or LoadBalancer IP from
-               within the cluster will always get "Cluster" semantics, but clients sending to
-               a NodePort from within the cluster may need to take traffic policy into account
-               when picking a node.
-        :param pulumi.Input[_builtins.int] health_check_node_port: healthCheckNodePort specifies the healthcheck nodePort for the service.
-               This only applies when type is set to LoadBalancer and
-               externalTrafficPolicy is set to Local. If a value is specified, is
-               in-range, and is not in use, it will be used.  If not specified, a value
-               will be automatically allocated.  External systems (e.g. load-balancers)
-               can use this port to determine if a given node holds endpoints for this
-               service or not.  If this field is specified when creating a Service
-               which does not need it, creation will fail. This field will be wiped
-               when updating a Service to no longer need it (e.g. changing type).
-               This field cannot be updated once set.
-        :param pulumi.Input[_builtins.str] internal_traffic_policy: InternalTrafficPolicy describes how nodes distribute service traffic they
-               receive on the ClusterIP. If set to "Local", the proxy will assume that pods
-               only want to talk to endpoints of the service on the same node as the pod,
-               dropping the traffic if there are no local endpoints. The default value,
-               "Cluster", uses the standard behavior of routing to all endpoints evenly
-               (possibly modified by topology and other features).
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] ip_families: IPFamilies is a list of IP families (e.g. IPv4, IPv6) assigned to this
-               service. This field is usually assigned automatically based on cluster
-               configuration and the ipFamilyPolicy field. If this field is specified
-               manually, the requested family is available in the cluster,
-               and ipFamilyPolicy allows it, it will be used; otherwise creation of
-               the service will fail. This field is conditionally mutable: it allows
-               for adding or removing a secondary IP family, but it does not allow
-               changing the primary IP family of the Service. Valid values are "IPv4"
-               and "IPv6".  This field only applies to Services of types ClusterIP,
-               NodePort, and LoadBalancer, and does apply to "headless" services.
-               This field will be wiped when updating a Service to type ExternalName.
-
-               This field may hold a maximum of two entries (dual-stack families, in
-               either order).  These families must correspond to the values of the
-               clusterIPs field, if specified. Both clusterIPs and ipFamilies are
-               governed by the ipFamilyPolicy field.
-        :param pulumi.Input[_builtins.str] ip_family_policy: IPFamilyPolicy represents the dual-stack-ness requested or required by
-               this Service. If there is no value provided, then this field will be set
-               to SingleStack. Services can be "SingleStack" (a single IP family),
-               "PreferDualStack" (two IP families on dual-stack configured clusters or
-               a single IP family on single-stack clusters), or "RequireDualStack"
-               (two IP families on dual-stack configured clusters, otherwise fail). The
-               ipFamilies and clusterIPs fields depend on the value of this field. This
-               field will be wiped when updating a service to type ExternalName.
-        :param pulumi.Input[_builtins.str] load_balancer_class: loadBalancerClass is the class of the load balancer implementation this Service belongs to.
-               If specified, the value of this field must be a label-style identifier, with an optional prefix,
-               e.g. "internal-vip" or "example.com/internal-vip". Unprefixed names are reserved for end-users.
-               This field can only be set when the Service type is 'LoadBalancer'. If not set, the default load
-               balancer implementation is used, today this is typically done through the cloud provider integration,
-               but should apply for any default implementation. If set, it is assumed that a load balancer
-               implementation is watching for Services with a matching class. Any default load balancer
-               implementation (e.g. cloud providers) should ignore Services that set this field.
-               This field can only be set when creating or updating a Service to type 'LoadBalancer'.
-               Once set, it can not be changed. This field will be wiped when a service is updated to a non 'LoadBalancer' type.
-        :param pulumi.Input[_builtins.str] load_balancer_ip: Only applies to Service Type: LoadBalancer.
-               This feature depends on whether the underlying cloud-provider supports specifying
-               the loadBalancerIP when a load balancer is created.
-               This field will be ignored if the cloud-provider does not support the feature.
-               Deprecated: This field was under-specified and its meaning varies across implementations.
-               Using it is non-portable and it may not support dual-stack.
-               Users are encouraged to use implementation-specific annotations when available.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] load_balancer_source_ranges: If specified and supported by the platform, this will restrict traffic through the cloud-provider
-               load-balancer will be restricted to the specified client IPs. This field will be ignored if the
-               cloud-provider does not support the feature."
-               More info: https://kubernetes.io/docs/tasks/access-application-cluster/create-external-load-balancer/
-        :param pulumi.Input[Sequence[pulumi.Input['SparkConnectSpecServerServiceSpecPortsPatchArgs']]] ports: The list of ports that are exposed by this service.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        :param pulumi.Input[_builtins.bool] publish_not_ready_addresses: publishNotReadyAddresses indicates that any agent which deals with endpoints for this
-               Service should disregard any indications of ready/not-ready.
-               The primary use case for setting this field is for a StatefulSet's Headless Service to
-               propagate SRV DNS records for its Pods for the purpose of peer discovery.
-               The Kubernetes controllers that generate Endpoints and EndpointSlice resources for
-               Services interpret this to mean that all endpoints are considered "ready" even if the
-               Pods themselves are not. Agents which consume only Kubernetes generated endpoints
-               through the Endpoints or EndpointSlice resources can safely assume this behavior.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] selector: Route service traffic to pods with label keys and values matching this
-               selector. If empty or not present, the service is assumed to have an
-               external process managing its endpoints, which Kubernetes will not
-               modify. Only applies to types ClusterIP, NodePort, and LoadBalancer.
-               Ignored if type is ExternalName.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/
-        :param pulumi.Input[_builtins.str] session_affinity: Supports "ClientIP" and "None". Used to maintain session affinity.
-               Enable client IP based session affinity.
-               Must be ClientIP or None.
-               Defaults to None.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        :param pulumi.Input[_builtins.str] traffic_distribution: TrafficDistribution offers a way to express preferences for how traffic is
-               distributed to Service endpoints. Implementations can use this field as a
-               hint, but are not required to guarantee strict adherence. If the field is
-               not set, the implementation will apply its default routing strategy. If set
-               to "PreferClose", implementations should prioritize endpoints that are
-               topologically close (e.g., same zone).
-               This is a beta field and requires enabling ServiceTrafficDistribution feature.
-        :param pulumi.Input[_builtins.str] type: type determines how the Service is exposed. Defaults to ClusterIP. Valid
-               options are ExternalName, ClusterIP, NodePort, and LoadBalancer.
-               "ClusterIP" allocates a cluster-internal IP address for load-balancing
-               to endpoints. Endpoints are determined by the selector or if that is not
-               specified, by manual construction of an Endpoints object or
-               EndpointSlice objects. If clusterIP is "None", no virtual IP is
-               allocated and the endpoints are published as a set of endpoints rather
-               than a virtual IP.
-               "NodePort" builds on ClusterIP and allocates a port on every node which
-               routes to the same endpoints as the clusterIP.
-               "LoadBalancer" builds on NodePort and creates an external load-balancer
-               (if supported in the current cloud) which routes to the same endpoints
-               as the clusterIP.
-               "ExternalName" aliases this service to the specified externalName.
-               Several other fields do not apply to ExternalName services.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#publishing-services-service-types
-        """
-        if allocate_load_balancer_node_ports is not None:
-            pulumi.set(__self__, "allocate_load_balancer_node_ports", allocate_load_balancer_node_ports)
-        if cluster_ip is not None:
-            pulumi.set(__self__, "cluster_ip", cluster_ip)
-        if cluster_ips is not None:
-            pulumi.set(__self__, "cluster_ips", cluster_ips)
-        if external_ips is not None:
-            pulumi.set(__self__, "external_ips", external_ips)
-        if external_name is not None:
-            pulumi.set(__self__, "external_name", external_name)
-        if external_traffic_policy is not None:
-            pulumi.set(__self__, "external_traffic_policy", external_traffic_policy)
-        if health_check_node_port is not None:
-            pulumi.set(__self__, "health_check_node_port", health_check_node_port)
-        if internal_traffic_policy is not None:
-            pulumi.set(__self__, "internal_traffic_policy", internal_traffic_policy)
-        if ip_families is not None:
-            pulumi.set(__self__, "ip_families", ip_families)
-        if ip_family_policy is not None:
-            pulumi.set(__self__, "ip_family_policy", ip_family_policy)
-        if load_balancer_class is not None:
-            pulumi.set(__self__, "load_balancer_class", load_balancer_class)
-        if load_balancer_ip is not None:
-            pulumi.set(__self__, "load_balancer_ip", load_balancer_ip)
-        if load_balancer_source_ranges is not None:
-            pulumi.set(__self__, "load_balancer_source_ranges", load_balancer_source_ranges)
-        if ports is not None:
-            pulumi.set(__self__, "ports", ports)
-        if publish_not_ready_addresses is not None:
-            pulumi.set(__self__, "publish_not_ready_addresses", publish_not_ready_addresses)
-        if selector is not None:
-            pulumi.set(__self__, "selector", selector)
-        if session_affinity is not None:
-            pulumi.set(__self__, "session_affinity", session_affinity)
-        if session_affinity_config is not None:
-            pulumi.set(__self__, "session_affinity_config", session_affinity_config)
-        if traffic_distribution is not None:
-            pulumi.set(__self__, "traffic_distribution", traffic_distribution)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="allocateLoadBalancerNodePorts")
-    def allocate_load_balancer_node_ports(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        allocateLoadBalancerNodePorts defines if NodePorts will be automatically
-        allocated for services with type LoadBalancer.  Default is "true". It
-        may be set to "false" if the cluster load-balancer does not rely on
-        NodePorts.  If the caller requests specific NodePorts (by specifying a
-        value), those requests will be respected, regardless of this field.
-        This field may only be set for services with type LoadBalancer and will
-        be cleared if the type is changed to any other type.
-        """
-        return pulumi.get(self, "allocate_load_balancer_node_ports")
-
-    @allocate_load_balancer_node_ports.setter
-    def allocate_load_balancer_node_ports(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "allocate_load_balancer_node_ports", value)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterIP")
-    def cluster_ip(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        clusterIP is the IP address of the service and is usually assigned
-        randomly. If an address is specified manually, is in-range (as per
-        system configuration), and is not in use, it will be allocated to the
-        service; otherwise creation of the service will fail. This field may not
-        be changed through updates unless the type field is also being changed
-        to ExternalName (which requires this field to be blank) or the type
-        field is being changed from ExternalName (in which case this field may
-        optionally be specified, as describe above).  Valid values are "None",
-        empty string (""), or a valid IP address. Setting this to "None" makes a
-        "headless service" (no virtual IP), which is useful when direct endpoint
-        connections are preferred and proxying is not required.  Only applies to
-        types ClusterIP, NodePort, and LoadBalancer. If this field is specified
-        when creating a Service of type ExternalName, creation will fail. This
-        field will be wiped when updating a Service to type ExternalName.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        """
-        return pulumi.get(self, "cluster_ip")
-
-    @cluster_ip.setter
-    def cluster_ip(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "cluster_ip", value)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterIPs")
-    def cluster_ips(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        ClusterIPs is a list of IP addresses assigned to this service, and are
-        usually assigned randomly.  If an address is specified manually, is
-        in-range (as per system configuration), and is not in use, it will be
-        allocated to the service; otherwise creation of the service will fail.
-        This field may not be changed through updates unless the type field is
-        also being changed to ExternalName (which requires this field to be
-        empty) or the type field is being changed from ExternalName (in which
-        case this field may optionally be specified, as describe above).  Valid
-        values are "None", empty string (""), or a valid IP address.  Setting
-        this to "None" makes a "headless service" (no virtual IP), which is
-        useful when direct endpoint connections are preferred and proxying is
-        not required.  Only applies to types ClusterIP, NodePort, and
-        LoadBalancer. If this field is specified when creating a Service of type
-        ExternalName, creation will fail. This field will be wiped when updating
-        a Service to type ExternalName.  If this field is not specified, it will
-        be initialized from the clusterIP field.  If this field is specified,
-        clients must ensure that clusterIPs[0] and clusterIP have the same
-        value.
-
-        This field may hold a maximum of two entries (dual-stack IPs, in either order).
-        These IPs must correspond to the values of the ipFamilies field. Both
-        clusterIPs and ipFamilies are governed by the ipFamilyPolicy field.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        """
-        return pulumi.get(self, "cluster_ips")
-
-    @cluster_ips.setter
-    def cluster_ips(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "cluster_ips", value)
-
-    @_builtins.property
-    @pulumi.getter(name="externalIPs")
-    def external_ips(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        externalIPs is a list of IP addresses for which nodes in the cluster
-        will also accept traffic for this service.  These IPs are not managed by
-        Kubernetes.  The user is responsible for ensuring that traffic arrives
-        at a node with this IP.  A common example is external load-balancers
-        that are not part of the Kubernetes system.
-        """
-        return pulumi.get(self, "external_ips")
-
-    @external_ips.setter
-    def external_ips(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "external_ips", value)
-
-    @_builtins.property
-    @pulumi.getter(name="externalName")
-    def external_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        externalName is the external reference that discovery mechanisms will
-        return as an alias for this service (e.g. a DNS CNAME record). No
-        proxying will be involved.  Must be a lowercase RFC-1123 hostname
-        (https://tools.ietf.org/html/rfc1123) and requires `type` to be "ExternalName".
-        """
-        return pulumi.get(self, "external_name")
-
-    @external_name.setter
-    def external_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "external_name", value)
-
-    @_builtins.property
-    @pulumi.getter(name="externalTrafficPolicy")
-    def external_traffic_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        externalTrafficPolicy describes how nodes distribute service traffic they
-        receive on one of the Service's "externally-facing" addresses (NodePorts,
-        ExternalIPs, and LoadBalancer IPs). If set to "Local", the proxy will configure
-        the service in a way that assumes that external load balancers will take care
-        of balancing the service traffic between nodes, and so each node will deliver
-        traffic only to the node-local endpoints of the service, without masquerading
-        the client source IP. (Traffic mistakenly sent to a node with no endpoints will
-        be dropped.) The default value, "Cluster", uses the standard behavior of
-        routing to all endpoints evenly (possibly modified by topology and other
-        features). Note that traffic sent to an External IP or LoadBalancer IP from
-        within the cluster will always get "Cluster" semantics, but clients sending to
-        a NodePort from within the cluster may need to take traffic policy into account
-        when picking a node.
-        """
-        return pulumi.get(self, "external_traffic_policy")
-
-    @external_traffic_policy.setter
-    def external_traffic_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "external_traffic_policy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="healthCheckNodePort")
-    def health_check_node_port(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        healthCheckNodePort specifies the healthcheck nodePort for the service.
-        This only applies when type is set to LoadBalancer and
-        externalTrafficPolicy is set to Local. If a value is specified, is
-        in-range, and is not in use, it will be used.  If not specified, a value
-        will be automatically allocated.  External systems (e.g. load-balancers)
-        can use this port to determine if a given node holds endpoints for this
-        service or not.  If this field is specified when creating a Service
-        which does not need it, creation will fail. This field will be wiped
-        when updating a Service to no longer need it (e.g. changing type).
-        This field cannot be updated once set.
-        """
-        return pulumi.get(self, "health_check_node_port")
-
-    @health_check_node_port.setter
-    def health_check_node_port(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "health_check_node_port", value)
-
-    @_builtins.property
-    @pulumi.getter(name="internalTrafficPolicy")
-    def internal_traffic_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        InternalTrafficPolicy describes how nodes distribute service traffic they
-        receive on the ClusterIP. If set to "Local", the proxy will assume that pods
-        only want to talk to endpoints of the service on the same node as the pod,
-        dropping the traffic if there are no local endpoints. The default value,
-        "Cluster", uses the standard behavior of routing to all endpoints evenly
-        (possibly modified by topology and other features).
-        """
-        return pulumi.get(self, "internal_traffic_policy")
-
-    @internal_traffic_policy.setter
-    def internal_traffic_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "internal_traffic_policy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="ipFamilies")
-    def ip_families(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        IPFamilies is a list of IP families (e.g. IPv4, IPv6) assigned to this
-        service. This field is usually assigned automatically based on cluster
-        configuration and the ipFamilyPolicy field. If this field is specified
-        manually, the requested family is available in the cluster,
-        and ipFamilyPolicy allows it, it will be used; otherwise creation of
-        the service will fail. This field is conditionally mutable: it allows
-        for adding or removing a secondary IP family, but it does not allow
-        changing the primary IP family of the Service. Valid values are "IPv4"
-        and "IPv6".  This field only applies to Services of types ClusterIP,
-        NodePort, and LoadBalancer, and does apply to "headless" services.
-        This field will be wiped when updating a Service to type ExternalName.
-
-        This field may hold a maximum of two entries (dual-stack families, in
-        either order).  These families must correspond to the values of the
-        clusterIPs field, if specified. Both clusterIPs and ipFamilies are
-        governed by the ipFamilyPolicy field.
-        """
-        return pulumi.get(self, "ip_families")
-
-    @ip_families.setter
-    def ip_families(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "ip_families", value)
-
-    @_builtins.property
-    @pulumi.getter(name="ipFamilyPolicy")
-    def ip_family_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        IPFamilyPolicy represents the dual-stack-ness requested or required by
-        this Service. If there is no value provided, then this field will be set
-        to SingleStack. Services can be "SingleStack" (a single IP family),
-        "PreferDualStack" (two IP families on dual-stack configured clusters or
-        a single IP family on single-stack clusters), or "RequireDualStack"
-        (two IP families on dual-stack configured clusters, otherwise fail). The
-        ipFamilies and clusterIPs fields depend on the value of this field. This
-        field will be wiped when updating a service to type ExternalName.
-        """
-        return pulumi.get(self, "ip_family_policy")
-
-    @ip_family_policy.setter
-    def ip_family_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "ip_family_policy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="loadBalancerClass")
-    def load_balancer_class(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        loadBalancerClass is the class of the load balancer implementation this Service belongs to.
-        If specified, the value of this field must be a label-style identifier, with an optional prefix,
-        e.g. "internal-vip" or "example.com/internal-vip". Unprefixed names are reserved for end-users.
-        This field can only be set when the Service type is 'LoadBalancer'. If not set, the default load
-        balancer implementation is used, today this is typically done through the cloud provider integration,
-        but should apply for any default implementation. If set, it is assumed that a load balancer
-        implementation is watching for Services with a matching class. Any default load balancer
-        implementation (e.g. cloud providers) should ignore Services that set this field.
-        This field can only be set when creating or updating a Service to type 'LoadBalancer'.
-        Once set, it can not be changed. This field will be wiped when a service is updated to a non 'LoadBalancer' type.
-        """
-        return pulumi.get(self, "load_balancer_class")
-
-    @load_balancer_class.setter
-    def load_balancer_class(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "load_balancer_class", value)
-
-    @_builtins.property
-    @pulumi.getter(name="loadBalancerIP")
-    def load_balancer_ip(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Only applies to Service Type: LoadBalancer.
-        This feature depends on whether the underlying cloud-provider supports specifying
-        the loadBalancerIP when a load balancer is created.
-        This field will be ignored if the cloud-provider does not support the feature.
-        Deprecated: This field was under-specified and its meaning varies across implementations.
-        Using it is non-portable and it may not support dual-stack.
-        Users are encouraged to use implementation-specific annotations when available.
-        """
-        return pulumi.get(self, "load_balancer_ip")
-
-    @load_balancer_ip.setter
-    def load_balancer_ip(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "load_balancer_ip", value)
-
-    @_builtins.property
-    @pulumi.getter(name="loadBalancerSourceRanges")
-    def load_balancer_source_ranges(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        If specified and supported by the platform, this will restrict traffic through the cloud-provider
-        load-balancer will be restricted to the specified client IPs. This field will be ignored if the
-        cloud-provider does not support the feature."
-        More info: https://kubernetes.io/docs/tasks/access-application-cluster/create-external-load-balancer/
-        """
-        return pulumi.get(self, "load_balancer_source_ranges")
-
-    @load_balancer_source_ranges.setter
-    def load_balancer_source_ranges(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "load_balancer_source_ranges", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def ports(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceSpecPortsPatchArgs']]]]:
-        """
-        The list of ports that are exposed by this service.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        """
-        return pulumi.get(self, "ports")
-
-    @ports.setter
-    def ports(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceSpecPortsPatchArgs']]]]):
-        pulumi.set(self, "ports", value)
-
-    @_builtins.property
-    @pulumi.getter(name="publishNotReadyAddresses")
-    def publish_not_ready_addresses(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        publishNotReadyAddresses indicates that any agent which deals with endpoints for this
-        Service should disregard any indications of ready/not-ready.
-        The primary use case for setting this field is for a StatefulSet's Headless Service to
-        propagate SRV DNS records for its Pods for the purpose of peer discovery.
-        The Kubernetes controllers that generate Endpoints and EndpointSlice resources for
-        Services interpret this to mean that all endpoints are considered "ready" even if the
-        Pods themselves are not. Agents which consume only Kubernetes generated endpoints
-        through the Endpoints or EndpointSlice resources can safely assume this behavior.
-        """
-        return pulumi.get(self, "publish_not_ready_addresses")
-
-    @publish_not_ready_addresses.setter
-    def publish_not_ready_addresses(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "publish_not_ready_addresses", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def selector(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        Route service traffic to pods with label keys and values matching this
-        selector. If empty or not present, the service is assumed to have an
-        external process managing its endpoints, which Kubernetes will not
-        modify. Only applies to types ClusterIP, NodePort, and LoadBalancer.
-        Ignored if type is ExternalName.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/
-        """
-        return pulumi.get(self, "selector")
-
-    @selector.setter
-    def selector(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sessionAffinity")
-    def session_affinity(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Supports "ClientIP" and "None". Used to maintain session affinity.
-        Enable client IP based session affinity.
-        Must be ClientIP or None.
-        Defaults to None.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        """
-        return pulumi.get(self, "session_affinity")
-
-    @session_affinity.setter
-    def session_affinity(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "session_affinity", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sessionAffinityConfig")
-    def session_affinity_config(self) -> pulumi.Input[Optional['SparkConnectSpecServerServiceSpecSessionAffinityConfigPatchArgs']]:
-        return pulumi.get(self, "session_affinity_config")
-
-    @session_affinity_config.setter
-    def session_affinity_config(self, value: pulumi.Input[Optional['SparkConnectSpecServerServiceSpecSessionAffinityConfigPatchArgs']]):
-        pulumi.set(self, "session_affinity_config", value)
-
-    @_builtins.property
-    @pulumi.getter(name="trafficDistribution")
-    def traffic_distribution(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        TrafficDistribution offers a way to express preferences for how traffic is
-        distributed to Service endpoints. Implementations can use this field as a
-        hint, but are not required to guarantee strict adherence. If the field is
-        not set, the implementation will apply its default routing strategy. If set
-        to "PreferClose", implementations should prioritize endpoints that are
-        topologically close (e.g., same zone).
-        This is a beta field and requires enabling ServiceTrafficDistribution feature.
-        """
-        return pulumi.get(self, "traffic_distribution")
-
-    @traffic_distribution.setter
-    def traffic_distribution(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "traffic_distribution", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type determines how the Service is exposed. Defaults to ClusterIP. Valid
-        options are ExternalName, ClusterIP, NodePort, and LoadBalancer.
-        "ClusterIP" allocates a cluster-internal IP address for load-balancing
-        to endpoints. Endpoints are determined by the selector or if that is not
-        specified, by manual construction of an Endpoints object or
-        EndpointSlice objects. If clusterIP is "None", no virtual IP is
-        allocated and the endpoints are published as a set of endpoints rather
-        than a virtual IP.
-        "NodePort" builds on ClusterIP and allocates a port on every node which
-        routes to the same endpoints as the clusterIP.
-        "LoadBalancer" builds on NodePort and creates an external load-balancer
-        (if supported in the current cloud) which routes to the same endpoints
-        as the clusterIP.
-        "ExternalName" aliases this service to the specified externalName.
-        Several other fields do not apply to ExternalName services.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#publishing-services-service-types
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class SparkConnectSpecServerServiceSpecPortsPatchArgsDict(TypedDict):
-    """
-    ServicePort contains information on service's port.
-    """
-    app_protocol: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The application protocol for this port.
-    This is used as a hint for implementations to offer richer behavior for protocols that they understand.
-    This field follows standard Kubernetes label syntax.
-    Valid values are either:
-
-    * Un-prefixed protocol names - reserved for IANA standard service names (as per
-    RFC-6335 and https://www.iana.org/assignments/service-names).
-
-    * Kubernetes-defined prefixed names:
-      * 'kubernetes.io/h2c' - HTTP/2 prior knowledge over cleartext as described in https://www.rfc-editor.org/rfc/rfc9113.html#name-starting-http-2-with-prior-
-      * 'kubernetes.io/ws'  - WebSocket over cleartext as described in https://www.rfc-editor.org/rfc/rfc6455
-      * 'kubernetes.io/wss' - WebSocket over TLS as described in https://www.rfc-editor.org/rfc/rfc6455
-
-    * Other protocols should use implementation-defined prefixed names such as
-    mycompany.com/my-custom-protocol.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The name of this port within the service. This must be a DNS_LABEL.
-    All ports within a ServiceSpec must have unique names. When considering
-    the endpoints for a Service, this must match the 'name' field in the
-    EndpointPort.
-    Optional if only one ServicePort is defined on this service.
-    """
-    node_port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    The port on each node on which this service is exposed when type is
-    NodePort or LoadBalancer.  Usually assigned by the system. If a value is
-    specified, in-range, and not in use it will be used, otherwise the
-    operation will fail.  If not specified, a port will be allocated if this
-    Service requires one.  If this field is specified when creating a
-    Service which does not need it, creation will fail. This field will be
-    wiped when updating a Service to no longer need it (e.g. changing type
-    from NodePort to ClusterIP).
-    More info: https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport
-    """
-    port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    The port that will be exposed by this service.
-    """
-    protocol: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The IP protocol for this port. Supports "TCP", "UDP", and "SCTP".
-    Default is TCP.
-    """
-    target_port: NotRequired[pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]]
-    """
-    Number or name of the port to access on the pods targeted by the service.
-    Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME.
-    If this is a string, it will be looked up as a named port in the
-    target Pod's container ports. If this is not specified, the value
-    of the 'port' field is used (an identity map).
-    This field is ignored for services with clusterIP=None, and should be
-    omitted or set equal to the 'port' field.
-    More info: https://kubernetes.io/docs/concepts/services-networking/service/#defining-a-service
-    """
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceSpecPortsPatchArgs:
-    def __init__(__self__, *,
-                 app_protocol: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 node_port: pulumi.Input[Optional[_builtins.int]] = None,
-                 port: pulumi.Input[Optional[_builtins.int]] = None,
-                 protocol: pulumi.Input[Optional[_builtins.str]] = None,
-                 target_port: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]] = None):
-        """
-        ServicePort contains information on service's port.
-
-        :param pulumi.Input[_builtins.str] app_protocol: The application protocol for this port.
-               This is used as a hint for implementations to offer richer behavior for protocols that they understand.
-               This field follows standard Kubernetes label syntax.
-               Valid values are either:
-
-               * Un-prefixed protocol names - reserved for IANA standard service names (as per
-               RFC-6335 and https://www.iana.org/assignments/service-names).
-
-               * Kubernetes-defined prefixed names:
-                 * 'kubernetes.io/h2c' - HTTP/2 prior knowledge over cleartext as described in https://www.rfc-editor.org/rfc/rfc9113.html#name-starting-http-2-with-prior-
-                 * 'kubernetes.io/ws'  - WebSocket over cleartext as described in https://www.rfc-editor.org/rfc/rfc6455
-                 * 'kubernetes.io/wss' - WebSocket over TLS as described in https://www.rfc-editor.org/rfc/rfc6455
-
-               * Other protocols should use implementation-defined prefixed names such as
-               mycompany.com/my-custom-protocol.
-        :param pulumi.Input[_builtins.str] name: The name of this port within the service. This must be a DNS_LABEL.
-               All ports within a ServiceSpec must have unique names. When considering
-               the endpoints for a Service, this must match the 'name' field in the
-               EndpointPort.
-               Optional if only one ServicePort is defined on this service.
-        :param pulumi.Input[_builtins.int] node_port: The port on each node on which this service is exposed when type is
-               NodePort or LoadBalancer.  Usually assigned by the system. If a value is
-               specified, in-range, and not in use it will be used, otherwise the
-               operation will fail.  If not specified, a port will be allocated if this
-               Service requires one.  If this field is specified when creating a
-               Service which does not need it, creation will fail. This field will be
-               wiped when updating a Service to no longer need it (e.g. changing type
-               from NodePort to ClusterIP).
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport
-        :param pulumi.Input[_builtins.int] port: The port that will be exposed by this service.
-        :param pulumi.Input[_builtins.str] protocol: The IP protocol for this port. Supports "TCP", "UDP", and "SCTP".
-               Default is TCP.
-        :param pulumi.Input[Union[_builtins.int, _builtins.str]] target_port: Number or name of the port to access on the pods targeted by the service.
-               Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME.
-               If this is a string, it will be looked up as a named port in the
-               target Pod's container ports. If this is not specified, the value
-               of the 'port' field is used (an identity map).
-               This field is ignored for services with clusterIP=None, and should be
-               omitted or set equal to the 'port' field.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#defining-a-service
-        """
-        if app_protocol is not None:
-            pulumi.set(__self__, "app_protocol", app_protocol)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if node_port is not None:
-            pulumi.set(__self__, "node_port", node_port)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if protocol is not None:
-            pulumi.set(__self__, "protocol", protocol)
-        if target_port is not None:
-            pulumi.set(__self__, "target_port", target_port)
-
-    @_builtins.property
-    @pulumi.getter(name="appProtocol")
-    def app_protocol(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The application protocol for this port.
-        This is used as a hint for implementations to offer richer behavior for protocols that they understand.
-        This field follows standard Kubernetes label syntax.
-        Valid values are either:
-
-        * Un-prefixed protocol names - reserved for IANA standard service names (as per
-        RFC-6335 and https://www.iana.org/assignments/service-names).
-
-        * Kubernetes-defined prefixed names:
-          * 'kubernetes.io/h2c' - HTTP/2 prior knowledge over cleartext as described in https://www.rfc-editor.org/rfc/rfc9113.html#name-starting-http-2-with-prior-
-          * 'kubernetes.io/ws'  - WebSocket over cleartext as described in https://www.rfc-editor.org/rfc/rfc6455
-          * 'kubernetes.io/wss' - WebSocket over TLS as described in https://www.rfc-editor.org/rfc/rfc6455
-
-        * Other protocols should use implementation-defined prefixed names such as
-        mycompany.com/my-custom-protocol.
-        """
-        return pulumi.get(self, "app_protocol")
-
-    @app_protocol.setter
-    def app_protocol(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "app_protocol", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The name of this port within the service. This must be a DNS_LABEL.
-        All ports within a ServiceSpec must have unique names. When considering
-        the endpoints for a Service, this must match the 'name' field in the
-        EndpointPort.
-        Optional if only one ServicePort is defined on this service.
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter(name="nodePort")
-    def node_port(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        The port on each node on which this service is exposed when type is
-        NodePort or LoadBalancer.  Usually assigned by the system. If a value is
-        specified, in-range, and not in use it will be used, otherwise the
-        operation will fail.  If not specified, a port will be allocated if this
-        Service requires one.  If this field is specified when creating a
-        Service which does not need it, creation will fail. This field will be
-        wiped when updating a Service to no longer need it (e.g. changing type
-        from NodePort to ClusterIP).
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport
-        """
-        return pulumi.get(self, "node_port")
-
-    @node_port.setter
-    def node_port(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "node_port", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        The port that will be exposed by this service.
-        """
-        return pulumi.get(self, "port")
-
-    @port.setter
-    def port(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "port", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def protocol(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The IP protocol for this port. Supports "TCP", "UDP", and "SCTP".
-        Default is TCP.
-        """
-        return pulumi.get(self, "protocol")
-
-    @protocol.setter
-    def protocol(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "protocol", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetPort")
-    def target_port(self) -> pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]:
-        """
-        Number or name of the port to access on the pods targeted by the service.
-        Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME.
-        If this is a string, it will be looked up as a named port in the
-        target Pod's container ports. If this is not specified, the value
-        of the 'port' field is used (an identity map).
-        This field is ignored for services with clusterIP=None, and should be
-        omitted or set equal to the 'port' field.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#defining-a-service
-        """
-        return pulumi.get(self, "target_port")
-
-    @target_port.setter
-    def target_port(self, value: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]):
-        pulumi.set(self, "target_port", value)
-
-
-class SparkConnectSpecServerServiceSpecPortsArgsDict(TypedDict):
-    """
-    ServicePort contains information on service's port.
-    """
-    app_protocol: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The application protocol for this port.
-    This is used as a hint for implementations to offer richer behavior for protocols that they understand.
-    This field follows standard Kubernetes label syntax.
-    Valid values are either:
-
-    * Un-prefixed protocol names - reserved for IANA standard service names (as per
-    RFC-6335 and https://www.iana.org/assignments/service-names).
-
-    * Kubernetes-defined prefixed names:
-      * 'kubernetes.io/h2c' - HTTP/2 prior knowledge over cleartext as described in https://www.rfc-editor.org/rfc/rfc9113.html#name-starting-http-2-with-prior-
-      * 'kubernetes.io/ws'  - WebSocket over cleartext as described in https://www.rfc-editor.org/rfc/rfc6455
-      * 'kubernetes.io/wss' - WebSocket over TLS as described in https://www.rfc-editor.org/rfc/rfc6455
-
-    * Other protocols should use implementation-defined prefixed names such as
-    mycompany.com/my-custom-protocol.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The name of this port within the service. This must be a DNS_LABEL.
-    All ports within a ServiceSpec must have unique names. When considering
-    the endpoints for a Service, this must match the 'name' field in the
-    EndpointPort.
-    Optional if only one ServicePort is defined on this service.
-    """
-    node_port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    The port on each node on which this service is exposed when type is
-    NodePort or LoadBalancer.  Usually assigned by the system. If a value is
-    specified, in-range, and not in use it will be used, otherwise the
-    operation will fail.  If not specified, a port will be allocated if this
-    Service requires one.  If this field is specified when creating a
-    Service which does not need it, creation will fail. This field will be
-    wiped when updating a Service to no longer need it (e.g. changing type
-    from NodePort to ClusterIP).
-    More info: https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport
-    """
-    port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    The port that will be exposed by this service.
-    """
-    protocol: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The IP protocol for this port. Supports "TCP", "UDP", and "SCTP".
-    Default is TCP.
-    """
-    target_port: NotRequired[pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]]
-    """
-    Number or name of the port to access on the pods targeted by the service.
-    Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME.
-    If this is a string, it will be looked up as a named port in the
-    target Pod's container ports. If this is not specified, the value
-    of the 'port' field is used (an identity map).
-    This field is ignored for services with clusterIP=None, and should be
-    omitted or set equal to the 'port' field.
-    More info: https://kubernetes.io/docs/concepts/services-networking/service/#defining-a-service
-    """
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceSpecPortsArgs:
-    def __init__(__self__, *,
-                 app_protocol: pulumi.Input[Optional[_builtins.str]] = None,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 node_port: pulumi.Input[Optional[_builtins.int]] = None,
-                 port: pulumi.Input[Optional[_builtins.int]] = None,
-                 protocol: pulumi.Input[Optional[_builtins.str]] = None,
-                 target_port: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]] = None):
-        """
-        ServicePort contains information on service's port.
-
-        :param pulumi.Input[_builtins.str] app_protocol: The application protocol for this port.
-               This is used as a hint for implementations to offer richer behavior for protocols that they understand.
-               This field follows standard Kubernetes label syntax.
-               Valid values are either:
-
-               * Un-prefixed protocol names - reserved for IANA standard service names (as per
-               RFC-6335 and https://www.iana.org/assignments/service-names).
-
-               * Kubernetes-defined prefixed names:
-                 * 'kubernetes.io/h2c' - HTTP/2 prior knowledge over cleartext as described in https://www.rfc-editor.org/rfc/rfc9113.html#name-starting-http-2-with-prior-
-                 * 'kubernetes.io/ws'  - WebSocket over cleartext as described in https://www.rfc-editor.org/rfc/rfc6455
-                 * 'kubernetes.io/wss' - WebSocket over TLS as described in https://www.rfc-editor.org/rfc/rfc6455
-
-               * Other protocols should use implementation-defined prefixed names such as
-               mycompany.com/my-custom-protocol.
-        :param pulumi.Input[_builtins.str] name: The name of this port within the service. This must be a DNS_LABEL.
-               All ports within a ServiceSpec must have unique names. When considering
-               the endpoints for a Service, this must match the 'name' field in the
-               EndpointPort.
-               Optional if only one ServicePort is defined on this service.
-        :param pulumi.Input[_builtins.int] node_port: The port on each node on which this service is exposed when type is
-               NodePort or LoadBalancer.  Usually assigned by the system. If a value is
-               specified, in-range, and not in use it will be used, otherwise the
-               operation will fail.  If not specified, a port will be allocated if this
-               Service requires one.  If this field is specified when creating a
-               Service which does not need it, creation will fail. This field will be
-               wiped when updating a Service to no longer need it (e.g. changing type
-               from NodePort to ClusterIP).
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport
-        :param pulumi.Input[_builtins.int] port: The port that will be exposed by this service.
-        :param pulumi.Input[_builtins.str] protocol: The IP protocol for this port. Supports "TCP", "UDP", and "SCTP".
-               Default is TCP.
-        :param pulumi.Input[Union[_builtins.int, _builtins.str]] target_port: Number or name of the port to access on the pods targeted by the service.
-               Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME.
-               If this is a string, it will be looked up as a named port in the
-               target Pod's container ports. If this is not specified, the value
-               of the 'port' field is used (an identity map).
-               This field is ignored for services with clusterIP=None, and should be
-               omitted or set equal to the 'port' field.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#defining-a-service
-        """
-        if app_protocol is not None:
-            pulumi.set(__self__, "app_protocol", app_protocol)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if node_port is not None:
-            pulumi.set(__self__, "node_port", node_port)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if protocol is not None:
-            pulumi.set(__self__, "protocol", protocol)
-        if target_port is not None:
-            pulumi.set(__self__, "target_port", target_port)
-
-    @_builtins.property
-    @pulumi.getter(name="appProtocol")
-    def app_protocol(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The application protocol for this port.
-        This is used as a hint for implementations to offer richer behavior for protocols that they understand.
-        This field follows standard Kubernetes label syntax.
-        Valid values are either:
-
-        * Un-prefixed protocol names - reserved for IANA standard service names (as per
-        RFC-6335 and https://www.iana.org/assignments/service-names).
-
-        * Kubernetes-defined prefixed names:
-          * 'kubernetes.io/h2c' - HTTP/2 prior knowledge over cleartext as described in https://www.rfc-editor.org/rfc/rfc9113.html#name-starting-http-2-with-prior-
-          * 'kubernetes.io/ws'  - WebSocket over cleartext as described in https://www.rfc-editor.org/rfc/rfc6455
-          * 'kubernetes.io/wss' - WebSocket over TLS as described in https://www.rfc-editor.org/rfc/rfc6455
-
-        * Other protocols should use implementation-defined prefixed names such as
-        mycompany.com/my-custom-protocol.
-        """
-        return pulumi.get(self, "app_protocol")
-
-    @app_protocol.setter
-    def app_protocol(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "app_protocol", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The name of this port within the service. This must be a DNS_LABEL.
-        All ports within a ServiceSpec must have unique names. When considering
-        the endpoints for a Service, this must match the 'name' field in the
-        EndpointPort.
-        Optional if only one ServicePort is defined on this service.
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter(name="nodePort")
-    def node_port(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        The port on each node on which this service is exposed when type is
-        NodePort or LoadBalancer.  Usually assigned by the system. If a value is
-        specified, in-range, and not in use it will be used, otherwise the
-        operation will fail.  If not specified, a port will be allocated if this
-        Service requires one.  If this field is specified when creating a
-        Service which does not need it, creation will fail. This field will be
-        wiped when updating a Service to no longer need it (e.g. changing type
-        from NodePort to ClusterIP).
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport
-        """
-        return pulumi.get(self, "node_port")
-
-    @node_port.setter
-    def node_port(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "node_port", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        The port that will be exposed by this service.
-        """
-        return pulumi.get(self, "port")
-
-    @port.setter
-    def port(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "port", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def protocol(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The IP protocol for this port. Supports "TCP", "UDP", and "SCTP".
-        Default is TCP.
-        """
-        return pulumi.get(self, "protocol")
-
-    @protocol.setter
-    def protocol(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "protocol", value)
-
-    @_builtins.property
-    @pulumi.getter(name="targetPort")
-    def target_port(self) -> pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]:
-        """
-        Number or name of the port to access on the pods targeted by the service.
-        Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME.
-        If this is a string, it will be looked up as a named port in the
-        target Pod's container ports. If this is not specified, the value
-        of the 'port' field is used (an identity map).
-        This field is ignored for services with clusterIP=None, and should be
-        omitted or set equal to the 'port' field.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#defining-a-service
-        """
-        return pulumi.get(self, "target_port")
-
-    @target_port.setter
-    def target_port(self, value: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]):
-        pulumi.set(self, "target_port", value)
-
-
-class SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgsDict(TypedDict):
-    """
-    clientIP contains the configurations of Client IP based session affinity.
-    """
-    timeout_seconds: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    timeoutSeconds specifies the seconds of ClientIP type session sticky time.
-    The value must be >0 && <=86400(for 1 day) if ServiceAffinity == "ClientIP".
-    Default value is 10800(for 3 hours).
-    """
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgs:
-    def __init__(__self__, *,
-                 timeout_seconds: pulumi.Input[Optional[_builtins.int]] = None):
-        """
-        clientIP contains the configurations of Client IP based session affinity.
-
-        :param pulumi.Input[_builtins.int] timeout_seconds: timeoutSeconds specifies the seconds of ClientIP type session sticky time.
-               The value must be >0 && <=86400(for 1 day) if ServiceAffinity == "ClientIP".
-               Default value is 10800(for 3 hours).
-        """
-        if timeout_seconds is not None:
-            pulumi.set(__self__, "timeout_seconds", timeout_seconds)
-
-    @_builtins.property
-    @pulumi.getter(name="timeoutSeconds")
-    def timeout_seconds(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        timeoutSeconds specifies the seconds of ClientIP type session sticky time.
-        The value must be >0 && <=86400(for 1 day) if ServiceAffinity == "ClientIP".
-        Default value is 10800(for 3 hours).
-        """
-        return pulumi.get(self, "timeout_seconds")
-
-    @timeout_seconds.setter
-    def timeout_seconds(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "timeout_seconds", value)
-
-
-class SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgsDict(TypedDict):
-    """
-    clientIP contains the configurations of Client IP based session affinity.
-    """
-    timeout_seconds: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    timeoutSeconds specifies the seconds of ClientIP type session sticky time.
-    The value must be >0 && <=86400(for 1 day) if ServiceAffinity == "ClientIP".
-    Default value is 10800(for 3 hours).
-    """
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgs:
-    def __init__(__self__, *,
-                 timeout_seconds: pulumi.Input[Optional[_builtins.int]] = None):
-        """
-        clientIP contains the configurations of Client IP based session affinity.
-
-        :param pulumi.Input[_builtins.int] timeout_seconds: timeoutSeconds specifies the seconds of ClientIP type session sticky time.
-               The value must be >0 && <=86400(for 1 day) if ServiceAffinity == "ClientIP".
-               Default value is 10800(for 3 hours).
-        """
-        if timeout_seconds is not None:
-            pulumi.set(__self__, "timeout_seconds", timeout_seconds)
-
-    @_builtins.property
-    @pulumi.getter(name="timeoutSeconds")
-    def timeout_seconds(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        timeoutSeconds specifies the seconds of ClientIP type session sticky time.
-        The value must be >0 && <=86400(for 1 day) if ServiceAffinity == "ClientIP".
-        Default value is 10800(for 3 hours).
-        """
-        return pulumi.get(self, "timeout_seconds")
-
-    @timeout_seconds.setter
-    def timeout_seconds(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "timeout_seconds", value)
-
-
-class SparkConnectSpecServerServiceSpecSessionAffinityConfigPatchArgsDict(TypedDict):
-    """
-    sessionAffinityConfig contains the configurations of session affinity.
-    """
-    client_ip: NotRequired[pulumi.Input[Optional['SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgs']]]
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceSpecSessionAffinityConfigPatchArgs:
-    def __init__(__self__, *,
-                 client_ip: pulumi.Input[Optional['SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgs']] = None):
-        """
-        sessionAffinityConfig contains the configurations of session affinity.
-        """
-        if client_ip is not None:
-            pulumi.set(__self__, "client_ip", client_ip)
-
-    @_builtins.property
-    @pulumi.getter(name="clientIP")
-    def client_ip(self) -> pulumi.Input[Optional['SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgs']]:
-        return pulumi.get(self, "client_ip")
-
-    @client_ip.setter
-    def client_ip(self, value: pulumi.Input[Optional['SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgs']]):
-        pulumi.set(self, "client_ip", value)
-
-
-class SparkConnectSpecServerServiceSpecSessionAffinityConfigArgsDict(TypedDict):
-    """
-    sessionAffinityConfig contains the configurations of session affinity.
-    """
-    client_ip: NotRequired[pulumi.Input[Optional['SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgs']]]
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceSpecSessionAffinityConfigArgs:
-    def __init__(__self__, *,
-                 client_ip: pulumi.Input[Optional['SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgs']] = None):
-        """
-        sessionAffinityConfig contains the configurations of session affinity.
-        """
-        if client_ip is not None:
-            pulumi.set(__self__, "client_ip", client_ip)
-
-    @_builtins.property
-    @pulumi.getter(name="clientIP")
-    def client_ip(self) -> pulumi.Input[Optional['SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgs']]:
-        return pulumi.get(self, "client_ip")
-
-    @client_ip.setter
-    def client_ip(self, value: pulumi.Input[Optional['SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgs']]):
-        pulumi.set(self, "client_ip", value)
-
-
-class SparkConnectSpecServerServiceSpecArgsDict(TypedDict):
-    """
-    Spec defines the behavior of a service.
-    https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    allocate_load_balancer_node_ports: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    allocateLoadBalancerNodePorts defines if NodePorts will be automatically
-    allocated for services with type LoadBalancer.  Default is "true". It
-    may be set to "false" if the cluster load-balancer does not rely on
-    NodePorts.  If the caller requests specific NodePorts (by specifying a
-    value), those requests will be respected, regardless of this field.
-    This field may only be set for services with type LoadBalancer and will
-    be cleared if the type is changed to any other type.
-    """
-    cluster_ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    clusterIP is the IP address of the service and is usually assigned
-    randomly. If an address is specified manually, is in-range (as per
-    system configuration), and is not in use, it will be allocated to the
-    service; otherwise creation of the service will fail. This field may not
-    be changed through updates unless the type field is also being changed
-    to ExternalName (which requires this field to be blank) or the type
-    field is being changed from ExternalName (in which case this field may
-    optionally be specified, as describe above).  Valid values are "None",
-    empty string (""), or a valid IP address. Setting this to "None" makes a
-    "headless service" (no virtual IP), which is useful when direct endpoint
-    connections are preferred and proxying is not required.  Only applies to
-    types ClusterIP, NodePort, and LoadBalancer. If this field is specified
-    when creating a Service of type ExternalName, creation will fail. This
-    field will be wiped when updating a Service to type ExternalName.
-    More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-    """
-    cluster_ips: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    ClusterIPs is a list of IP addresses assigned to this service, and are
-    usually assigned randomly.  If an address is specified manually, is
-    in-range (as per system configuration), and is not in use, it will be
-    allocated to the service; otherwise creation of the service will fail.
-    This field may not be changed through updates unless the type field is
-    also being changed to ExternalName (which requires this field to be
-    empty) or the type field is being changed from ExternalName (in which
-    case this field may optionally be specified, as describe above).  Valid
-    values are "None", empty string (""), or a valid IP address.  Setting
-    this to "None" makes a "headless service" (no virtual IP), which is
-    useful when direct endpoint connections are preferred and proxying is
-    not required.  Only applies to types ClusterIP, NodePort, and
-    LoadBalancer. If this field is specified when creating a Service of type
-    ExternalName, creation will fail. This field will be wiped when updating
-    a Service to type ExternalName.  If this field is not specified, it will
-    be initialized from the clusterIP field.  If this field is specified,
-    clients must ensure that clusterIPs[0] and clusterIP have the same
-    value.
-
-    This field may hold a maximum of two entries (dual-stack IPs, in either order).
-    These IPs must correspond to the values of the ipFamilies field. Both
-    clusterIPs and ipFamilies are governed by the ipFamilyPolicy field.
-    More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-    """
-    external_ips: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    externalIPs is a list of IP addresses for which nodes in the cluster
-    will also accept traffic for this service.  These IPs are not managed by
-    Kubernetes.  The user is responsible for ensuring that traffic arrives
-    at a node with this IP.  A common example is external load-balancers
-    that are not part of the Kubernetes system.
-    """
-    external_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    externalName is the external reference that discovery mechanisms will
-    return as an alias for this service (e.g. a DNS CNAME record). No
-    proxying will be involved.  Must be a lowercase RFC-1123 hostname
-    (https://tools.ietf.org/html/rfc1123) and requires `type` to be "ExternalName".
-    """
-    external_traffic_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    externalTrafficPolicy describes how nodes distribute service traffic they
-    receive on one of the Service's "externally-facing" addresses (NodePorts,
-    ExternalIPs, and LoadBalancer IPs). If set to "Local", the proxy will configure
-    the service in a way that assumes that external load balancers will take care
-    of balancing the service traffic between nodes, and so each node will deliver
-    traffic only to the node-local endpoints of the service, without masquerading
-    the client source IP. (Traffic mistakenly sent to a node with no endpoints will
-    be dropped.) The default value, "Cluster", uses the standard behavior of
-    routing to all endpoints evenly (possibly modified by topology and other
-    features). Note that traffic sent to an External IP or LoadBalancer IP from
-    within the cluster will always get "Cluster" semantics, but clients sending to
-    a NodePort from within the cluster may need to take traffic policy into account
-    when picking a node.
-    """
-    health_check_node_port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    healthCheckNodePort specifies the healthcheck nodePort for the service.
-    This only applies when type is set to LoadBalancer and
-    externalTrafficPolicy is set to Local. If a value is specified, is
-    in-range, and is not in use, it will be used.  If not specified, a value
-    will be automatically allocated.  External systems (e.g. load-balancers)
-    can use this port to determine if a given node holds endpoints for this
-    service or not.  If this field is specified when creating a Service
-    which does not need it, creation will fail. This field will be wiped
-    when updating a Service to no longer need it (e.g. changing type).
-    This field cannot be updated once set.
-    """
-    internal_traffic_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    InternalTrafficPolicy describes how nodes distribute service traffic they
-    receive on the ClusterIP. If set to "Local", the proxy will assume that pods
-    only want to talk to endpoints of the service on the same node as the pod,
-    dropping the traffic if there are no local endpoints. The default value,
-    "Cluster", uses the standard behavior of routing to all endpoints evenly
-    (possibly modified by topology and other features).
-    """
-    ip_families: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    IPFamilies is a list of IP families (e.g. IPv4, IPv6) assigned to this
-    service. This field is usually assigned automatically based on cluster
-    configuration and the ipFamilyPolicy field. If this field is specified
-    manually, the requested family is available in the cluster,
-    and ipFamilyPolicy allows it, it will be used; otherwise creation of
-    the service will fail. This field is conditionally mutable: it allows
-    for adding or removing a secondary IP family, but it does not allow
-    changing the primary IP family of the Service. Valid values are "IPv4"
-    and "IPv6".  This field only applies to Services of types ClusterIP,
-    NodePort, and LoadBalancer, and does apply to "headless" services.
-    This field will be wiped when updating a Service to type ExternalName.
-
-    This field may hold a maximum of two entries (dual-stack families, in
-    either order).  These families must correspond to the values of the
-    clusterIPs field, if specified. Both clusterIPs and ipFamilies are
-    governed by the ipFamilyPolicy field.
-    """
-    ip_family_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    IPFamilyPolicy represents the dual-stack-ness requested or required by
-    this Service. If there is no value provided, then this field will be set
-    to SingleStack. Services can be "SingleStack" (a single IP family),
-    "PreferDualStack" (two IP families on dual-stack configured clusters or
-    a single IP family on single-stack clusters), or "RequireDualStack"
-    (two IP families on dual-stack configured clusters, otherwise fail). The
-    ipFamilies and clusterIPs fields depend on the value of this field. This
-    field will be wiped when updating a service to type ExternalName.
-    """
-    load_balancer_class: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    loadBalancerClass is the class of the load balancer implementation this Service belongs to.
-    If specified, the value of this field must be a label-style identifier, with an optional prefix,
-    e.g. "internal-vip" or "example.com/internal-vip". Unprefixed names are reserved for end-users.
-    This field can only be set when the Service type is 'LoadBalancer'. If not set, the default load
-    balancer implementation is used, today this is typically done through the cloud provider integration,
-    but should apply for any default implementation. If set, it is assumed that a load balancer
-    implementation is watching for Services with a matching class. Any default load balancer
-    implementation (e.g. cloud providers) should ignore Services that set this field.
-    This field can only be set when creating or updating a Service to type 'LoadBalancer'.
-    Once set, it can not be changed. This field will be wiped when a service is updated to a non 'LoadBalancer' type.
-    """
-    load_balancer_ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Only applies to Service Type: LoadBalancer.
-    This feature depends on whether the underlying cloud-provider supports specifying
-    the loadBalancerIP when a load balancer is created.
-    This field will be ignored if the cloud-provider does not support the feature.
-    Deprecated: This field was under-specified and its meaning varies across implementations.
-    Using it is non-portable and it may not support dual-stack.
-    Users are encouraged to use implementation-specific annotations when available.
-    """
-    load_balancer_source_ranges: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    If specified and supported by the platform, this will restrict traffic through the cloud-provider
-    load-balancer will be restricted to the specified client IPs. This field will be ignored if the
-    cloud-provider does not support the feature."
-    More info: https://kubernetes.io/docs/tasks/access-application-cluster/create-external-load-balancer/
-    """
-    ports: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceSpecPortsArgs']]]]]
-    """
-    The list of ports that are exposed by this service.
-    More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-    """
-    publish_not_ready_addresses: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    publishNotReadyAddresses indicates that any agent which deals with endpoints for this
-    Service should disregard any indications of ready/not-ready.
-    The primary use case for setting this field is for a StatefulSet's Headless Service to
-    propagate SRV DNS records for its Pods for the purpose of peer discovery.
-    The Kubernetes controllers that generate Endpoints and EndpointSlice resources for
-    Services interpret this to mean that all endpoints are considered "ready" even if the
-    Pods themselves are not. Agents which consume only Kubernetes generated endpoints
-    through the Endpoints or EndpointSlice resources can safely assume this behavior.
-    """
-    selector: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    Route service traffic to pods with label keys and values matching this
-    selector. If empty or not present, the service is assumed to have an
-    external process managing its endpoints, which Kubernetes will not
-    modify. Only applies to types ClusterIP, NodePort, and LoadBalancer.
-    Ignored if type is ExternalName.
-    More info: https://kubernetes.io/docs/concepts/services-networking/service/
-    """
-    session_affinity: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Supports "ClientIP" and "None". Used to maintain session affinity.
-    Enable client IP based session affinity.
-    Must be ClientIP or None.
-    Defaults to None.
-    More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-    """
-    session_affinity_config: NotRequired[pulumi.Input[Optional['SparkConnectSpecServerServiceSpecSessionAffinityConfigArgs']]]
-    traffic_distribution: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    TrafficDistribution offers a way to express preferences for how traffic is
-    distributed to Service endpoints. Implementations can use this field as a
-    hint, but are not required to guarantee strict adherence. If the field is
-    not set, the implementation will apply its default routing strategy. If set
-    to "PreferClose", implementations should prioritize endpoints that are
-    topologically close (e.g., same zone).
-    This is a beta field and requires enabling ServiceTrafficDistribution feature.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type determines how the Service is exposed. Defaults to ClusterIP. Valid
-    options are ExternalName, ClusterIP, NodePort, and LoadBalancer.
-    "ClusterIP" allocates a cluster-internal IP address for load-balancing
-    to endpoints. Endpoints are determined by the selector or if that is not
-    specified, by manual construction of an Endpoints object or
-    EndpointSlice objects. If clusterIP is "None", no virtual IP is
-    allocated and the endpoints are published as a set of endpoints rather
-    than a virtual IP.
-    "NodePort" builds on ClusterIP and allocates a port on every node which
-    routes to the same endpoints as the clusterIP.
-    "LoadBalancer" builds on NodePort and creates an external load-balancer
-    (if supported in the current cloud) which routes to the same endpoints
-    as the clusterIP.
-    "ExternalName" aliases this service to the specified externalName.
-    Several other fields do not apply to ExternalName services.
-    More info: https://kubernetes.io/docs/concepts/services-networking/service/#publishing-services-service-types
-    """
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceSpecArgs:
-    def __init__(__self__, *,
-                 allocate_load_balancer_node_ports: pulumi.Input[Optional[_builtins.bool]] = None,
-                 cluster_ip: pulumi.Input[Optional[_builtins.str]] = None,
-                 cluster_ips: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 external_ips: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 external_name: pulumi.Input[Optional[_builtins.str]] = None,
-                 external_traffic_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 health_check_node_port: pulumi.Input[Optional[_builtins.int]] = None,
-                 internal_traffic_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 ip_families: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 ip_family_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 load_balancer_class: pulumi.Input[Optional[_builtins.str]] = None,
-                 load_balancer_ip: pulumi.Input[Optional[_builtins.str]] = None,
-                 load_balancer_source_ranges: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 ports: pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceSpecPortsArgs']]]] = None,
-                 publish_not_ready_addresses: pulumi.Input[Optional[_builtins.bool]] = None,
-                 selector: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 session_affinity: pulumi.Input[Optional[_builtins.str]] = None,
-                 session_affinity_config: pulumi.Input[Optional['SparkConnectSpecServerServiceSpecSessionAffinityConfigArgs']] = None,
-                 traffic_distribution: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Spec defines the behavior of a service.
-        https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param pulumi.Input[_builtins.bool] allocate_load_balancer_node_ports: allocateLoadBalancerNodePorts defines if NodePorts will be automatically
-               allocated for services with type LoadBalancer.  Default is "true". It
-               may be set to "false" if the cluster load-balancer does not rely on
-               NodePorts.  If the caller requests specific NodePorts (by specifying a
-               value), those requests will be respected, regardless of this field.
-               This field may only be set for services with type LoadBalancer and will
-               be cleared if the type is changed to any other type.
-        :param pulumi.Input[_builtins.str] cluster_ip: clusterIP is the IP address of the service and is usually assigned
-               randomly. If an address is specified manually, is in-range (as per
-               system configuration), and is not in use, it will be allocated to the
-               service; otherwise creation of the service will fail. This field may not
-               be changed through updates unless the type field is also being changed
-               to ExternalName (which requires this field to be blank) or the type
-               field is being changed from ExternalName (in which case this field may
-               optionally be specified, as describe above).  Valid values are "None",
-               empty string (""), or a valid IP address. Setting this to "None" makes a
-               "headless service" (no virtual IP), which is useful when direct endpoint
-               connections are preferred and proxying is not required.  Only applies to
-               types ClusterIP, NodePort, and LoadBalancer. If this field is specified
-               when creating a Service of type ExternalName, creation will fail. This
-               field will be wiped when updating a Service to type ExternalName.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] cluster_ips: ClusterIPs is a list of IP addresses assigned to this service, and are
-               usually assigned randomly.  If an address is specified manually, is
-               in-range (as per system configuration), and is not in use, it will be
-               allocated to the service; otherwise creation of the service will fail.
-               This field may not be changed through updates unless the type field is
-               also being changed to ExternalName (which requires this field to be
-               empty) or the type field is being changed from ExternalName (in which
-               case this field may optionally be specified, as describe above).  Valid
-               values are "None", empty string (""), or a valid IP address.  Setting
-               this to "None" makes a "headless service" (no virtual IP), which is
-               useful when direct endpoint connections are preferred and proxying is
-               not required.  Only applies to types ClusterIP, NodePort, and
-               LoadBalancer. If this field is specified when creating a Service of type
-               ExternalName, creation will fail. This field will be wiped when updating
-               a Service to type ExternalName.  If this field is not specified, it will
-               be initialized from the clusterIP field.  If this field is specified,
-               clients must ensure that clusterIPs[0] and clusterIP have the same
-               value.
-
-               This field may hold a maximum of two entries (dual-stack IPs, in either order).
-               These IPs must correspond to the values of the ipFamilies field. Both
-               clusterIPs and ipFamilies are governed by the ipFamilyPolicy field.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] external_ips: externalIPs is a list of IP addresses for which nodes in the cluster
-               will also accept traffic for this service.  These IPs are not managed by
-               Kubernetes.  The user is responsible for ensuring that traffic arrives
-               at a node with this IP.  A common example is external load-balancers
-               that are not part of the Kubernetes system.
-        :param pulumi.Input[_builtins.str] external_name: externalName is the external reference that discovery mechanisms will
-               return as an alias for this service (e.g. a DNS CNAME record). No
-               proxying will be involved.  Must be a lowercase RFC-1123 hostname
-               (https://tools.ietf.org/html/rfc1123) and requires `type` to be "ExternalName".
-        :param pulumi.Input[_builtins.str] external_traffic_policy: externalTrafficPolicy describes how nodes distribute service traffic they
-               receive on one of the Service's "externally-facing" addresses (NodePorts,
-               ExternalIPs, and LoadBalancer IPs). If set to "Local", the proxy will configure
-               the service in a way that assumes that external load balancers will take care
-               of balancing the service traffic between nodes, and so each node will deliver
-               traffic only to the node-local endpoints of the service, without masquerading
-               the client source IP. (Traffic mistakenly sent to a node with no endpoints will
-               be dropped.) The default value, "Cluster", uses the standard behavior of
-               routing to all endpoints evenly (possibly modified by topology and other
-               features). Note that traffic sent to an External IP or LoadBalancer IP from
-               within the cluster will always get "Cluster" semantics, but clients sending to
-               a NodePort from within the cluster may need to take traffic policy into account
-               when picking a node.
-        :param pulumi.Input[_builtins.int] health_check_node_port: healthCheckNodePort specifies the healthcheck nodePort for the service.
-               This only applies when type is set to LoadBalancer and
-               externalTrafficPolicy is set to Local. If a value is specified, is
-               in-range, and is not in use, it will be used.  If not specified, a value
-               will be automatically allocated.  External systems (e.g. load-balancers)
-               can use this port to determine if a given node holds endpoints for this
-               service or not.  If this field is specified when creating a Service
-               which does not need it, creation will fail. This field will be wiped
-               when updating a Service to no longer need it (e.g. changing type).
-               This field cannot be updated once set.
-        :param pulumi.Input[_builtins.str] internal_traffic_policy: InternalTrafficPolicy describes how nodes distribute service traffic they
-               receive on the ClusterIP. If set to "Local", the proxy will assume that pods
-               only want to talk to endpoints of the service on the same node as the pod,
-               dropping the traffic if there are no local endpoints. The default value,
-               "Cluster", uses the standard behavior of routing to all endpoints evenly
-               (possibly modified by topology and other features).
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] ip_families: IPFamilies is a list of IP families (e.g. IPv4, IPv6) assigned to this
-               service. This field is usually assigned automatically based on cluster
-               configuration and the ipFamilyPolicy field. If this field is specified
-               manually, the requested family is available in the cluster,
-               and ipFamilyPolicy allows it, it will be used; otherwise creation of
-               the service will fail. This field is conditionally mutable: it allows
-               for adding or removing a secondary IP family, but it does not allow
-               changing the primary IP family of the Service. Valid values are "IPv4"
-               and "IPv6".  This field only applies to Services of types ClusterIP,
-               NodePort, and LoadBalancer, and does apply to "headless" services.
-               This field will be wiped when updating a Service to type ExternalName.
-
-               This field may hold a maximum of two entries (dual-stack families, in
-               either order).  These families must correspond to the values of the
-               clusterIPs field, if specified. Both clusterIPs and ipFamilies are
-               governed by the ipFamilyPolicy field.
-        :param pulumi.Input[_builtins.str] ip_family_policy: IPFamilyPolicy represents the dual-stack-ness requested or required by
-               this Service. If there is no value provided, then this field will be set
-               to SingleStack. Services can be "SingleStack" (a single IP family),
-               "PreferDualStack" (two IP families on dual-stack configured clusters or
-               a single IP family on single-stack clusters), or "RequireDualStack"
-               (two IP families on dual-stack configured clusters, otherwise fail). The
-               ipFamilies and clusterIPs fields depend on the value of this field. This
-               field will be wiped when updating a service to type ExternalName.
-        :param pulumi.Input[_builtins.str] load_balancer_class: loadBalancerClass is the class of the load balancer implementation this Service belongs to.
-               If specified, the value of this field must be a label-style identifier, with an optional prefix,
-               e.g. "internal-vip" or "example.com/internal-vip". Unprefixed names are reserved for end-users.
-               This field can only be set when the Service type is 'LoadBalancer'. If not set, the default load
-               balancer implementation is used, today this is typically done through the cloud provider integration,
-               but should apply for any default implementation. If set, it is assumed that a load balancer
-               implementation is watching for Services with a matching class. Any default load balancer
-               implementation (e.g. cloud providers) should ignore Services that set this field.
-               This field can only be set when creating or updating a Service to type 'LoadBalancer'.
-               Once set, it can not be changed. This field will be wiped when a service is updated to a non 'LoadBalancer' type.
-        :param pulumi.Input[_builtins.str] load_balancer_ip: Only applies to Service Type: LoadBalancer.
-               This feature depends on whether the underlying cloud-provider supports specifying
-               the loadBalancerIP when a load balancer is created.
-               This field will be ignored if the cloud-provider does not support the feature.
-               Deprecated: This field was under-specified and its meaning varies across implementations.
-               Using it is non-portable and it may not support dual-stack.
-               Users are encouraged to use implementation-specific annotations when available.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] load_balancer_source_ranges: If specified and supported by the platform, this will restrict traffic through the cloud-provider
-               load-balancer will be restricted to the specified client IPs. This field will be ignored if the
-               cloud-provider does not support the feature."
-               More info: https://kubernetes.io/docs/tasks/access-application-cluster/create-external-load-balancer/
-        :param pulumi.Input[Sequence[pulumi.Input['SparkConnectSpecServerServiceSpecPortsArgs']]] ports: The list of ports that are exposed by this service.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        :param pulumi.Input[_builtins.bool] publish_not_ready_addresses: publishNotReadyAddresses indicates that any agent which deals with endpoints for this
-               Service should disregard any indications of ready/not-ready.
-               The primary use case for setting this field is for a StatefulSet's Headless Service to
-               propagate SRV DNS records for its Pods for the purpose of peer discovery.
-               The Kubernetes controllers that generate Endpoints and EndpointSlice resources for
-               Services interpret this to mean that all endpoints are considered "ready" even if the
-               Pods themselves are not. Agents which consume only Kubernetes generated endpoints
-               through the Endpoints or EndpointSlice resources can safely assume this behavior.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] selector: Route service traffic to pods with label keys and values matching this
-               selector. If empty or not present, the service is assumed to have an
-               external process managing its endpoints, which Kubernetes will not
-               modify. Only applies to types ClusterIP, NodePort, and LoadBalancer.
-               Ignored if type is ExternalName.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/
-        :param pulumi.Input[_builtins.str] session_affinity: Supports "ClientIP" and "None". Used to maintain session affinity.
-               Enable client IP based session affinity.
-               Must be ClientIP or None.
-               Defaults to None.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        :param pulumi.Input[_builtins.str] traffic_distribution: TrafficDistribution offers a way to express preferences for how traffic is
-               distributed to Service endpoints. Implementations can use this field as a
-               hint, but are not required to guarantee strict adherence. If the field is
-               not set, the implementation will apply its default routing strategy. If set
-               to "PreferClose", implementations should prioritize endpoints that are
-               topologically close (e.g., same zone).
-               This is a beta field and requires enabling ServiceTrafficDistribution feature.
-        :param pulumi.Input[_builtins.str] type: type determines how the Service is exposed. Defaults to ClusterIP. Valid
-               options are ExternalName, ClusterIP, NodePort, and LoadBalancer.
-               "ClusterIP" allocates a cluster-internal IP address for load-balancing
-               to endpoints. Endpoints are determined by the selector or if that is not
-               specified, by manual construction of an Endpoints object or
-               EndpointSlice objects. If clusterIP is "None", no virtual IP is
-               allocated and the endpoints are published as a set of endpoints rather
-               than a virtual IP.
-               "NodePort" builds on ClusterIP and allocates a port on every node which
-               routes to the same endpoints as the clusterIP.
-               "LoadBalancer" builds on NodePort and creates an external load-balancer
-               (if supported in the current cloud) which routes to the same endpoints
-               as the clusterIP.
-               "ExternalName" aliases this service to the specified externalName.
-               Several other fields do not apply to ExternalName services.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#publishing-services-service-types
-        """
-        if allocate_load_balancer_node_ports is not None:
-            pulumi.set(__self__, "allocate_load_balancer_node_ports", allocate_load_balancer_node_ports)
-        if cluster_ip is not None:
-            pulumi.set(__self__, "cluster_ip", cluster_ip)
-        if cluster_ips is not None:
-            pulumi.set(__self__, "cluster_ips", cluster_ips)
-        if external_ips is not None:
-            pulumi.set(__self__, "external_ips", external_ips)
-        if external_name is not None:
-            pulumi.set(__self__, "external_name", external_name)
-        if external_traffic_policy is not None:
-            pulumi.set(__self__, "external_traffic_policy", external_traffic_policy)
-        if health_check_node_port is not None:
-            pulumi.set(__self__, "health_check_node_port", health_check_node_port)
-        if internal_traffic_policy is not None:
-            pulumi.set(__self__, "internal_traffic_policy", internal_traffic_policy)
-        if ip_families is not None:
-            pulumi.set(__self__, "ip_families", ip_families)
-        if ip_family_policy is not None:
-            pulumi.set(__self__, "ip_family_policy", ip_family_policy)
-        if load_balancer_class is not None:
-            pulumi.set(__self__, "load_balancer_class", load_balancer_class)
-        if load_balancer_ip is not None:
-            pulumi.set(__self__, "load_balancer_ip", load_balancer_ip)
-        if load_balancer_source_ranges is not None:
-            pulumi.set(__self__, "load_balancer_source_ranges", load_balancer_source_ranges)
-        if ports is not None:
-            pulumi.set(__self__, "ports", ports)
-        if publish_not_ready_addresses is not None:
-            pulumi.set(__self__, "publish_not_ready_addresses", publish_not_ready_addresses)
-        if selector is not None:
-            pulumi.set(__self__, "selector", selector)
-        if session_affinity is not None:
-            pulumi.set(__self__, "session_affinity", session_affinity)
-        if session_affinity_config is not None:
-            pulumi.set(__self__, "session_affinity_config", session_affinity_config)
-        if traffic_distribution is not None:
-            pulumi.set(__self__, "traffic_distribution", traffic_distribution)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="allocateLoadBalancerNodePorts")
-    def allocate_load_balancer_node_ports(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        allocateLoadBalancerNodePorts defines if NodePorts will be automatically
-        allocated for services with type LoadBalancer.  Default is "true". It
-        may be set to "false" if the cluster load-balancer does not rely on
-        NodePorts.  If the caller requests specific NodePorts (by specifying a
-        value), those requests will be respected, regardless of this field.
-        This field may only be set for services with type LoadBalancer and will
-        be cleared if the type is changed to any other type.
-        """
-        return pulumi.get(self, "allocate_load_balancer_node_ports")
-
-    @allocate_load_balancer_node_ports.setter
-    def allocate_load_balancer_node_ports(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "allocate_load_balancer_node_ports", value)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterIP")
-    def cluster_ip(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        clusterIP is the IP address of the service and is usually assigned
-        randomly. If an address is specified manually, is in-range (as per
-        system configuration), and is not in use, it will be allocated to the
-        service; otherwise creation of the service will fail. This field may not
-        be changed through updates unless the type field is also being changed
-        to ExternalName (which requires this field to be blank) or the type
-        field is being changed from ExternalName (in which case this field may
-        optionally be specified, as describe above).  Valid values are "None",
-        empty string (""), or a valid IP address. Setting this to "None" makes a
-        "headless service" (no virtual IP), which is useful when direct endpoint
-        connections are preferred and proxying is not required.  Only applies to
-        types ClusterIP, NodePort, and LoadBalancer. If this field is specified
-        when creating a Service of type ExternalName, creation will fail. This
-        field will be wiped when updating a Service to type ExternalName.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        """
-        return pulumi.get(self, "cluster_ip")
-
-    @cluster_ip.setter
-    def cluster_ip(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "cluster_ip", value)
-
-    @_builtins.property
-    @pulumi.getter(name="clusterIPs")
-    def cluster_ips(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        ClusterIPs is a list of IP addresses assigned to this service, and are
-        usually assigned randomly.  If an address is specified manually, is
-        in-range (as per system configuration), and is not in use, it will be
-        allocated to the service; otherwise creation of the service will fail.
-        This field may not be changed through updates unless the type field is
-        also being changed to ExternalName (which requires this field to be
-        empty) or the type field is being changed from ExternalName (in which
-        case this field may optionally be specified, as describe above).  Valid
-        values are "None", empty string (""), or a valid IP address.  Setting
-        this to "None" makes a "headless service" (no virtual IP), which is
-        useful when direct endpoint connections are preferred and proxying is
-        not required.  Only applies to types ClusterIP, NodePort, and
-        LoadBalancer. If this field is specified when creating a Service of type
-        ExternalName, creation will fail. This field will be wiped when updating
-        a Service to type ExternalName.  If this field is not specified, it will
-        be initialized from the clusterIP field.  If this field is specified,
-        clients must ensure that clusterIPs[0] and clusterIP have the same
-        value.
-
-        This field may hold a maximum of two entries (dual-stack IPs, in either order).
-        These IPs must correspond to the values of the ipFamilies field. Both
-        clusterIPs and ipFamilies are governed by the ipFamilyPolicy field.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        """
-        return pulumi.get(self, "cluster_ips")
-
-    @cluster_ips.setter
-    def cluster_ips(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "cluster_ips", value)
-
-    @_builtins.property
-    @pulumi.getter(name="externalIPs")
-    def external_ips(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        externalIPs is a list of IP addresses for which nodes in the cluster
-        will also accept traffic for this service.  These IPs are not managed by
-        Kubernetes.  The user is responsible for ensuring that traffic arrives
-        at a node with this IP.  A common example is external load-balancers
-        that are not part of the Kubernetes system.
-        """
-        return pulumi.get(self, "external_ips")
-
-    @external_ips.setter
-    def external_ips(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "external_ips", value)
-
-    @_builtins.property
-    @pulumi.getter(name="externalName")
-    def external_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        externalName is the external reference that discovery mechanisms will
-        return as an alias for this service (e.g. a DNS CNAME record). No
-        proxying will be involved.  Must be a lowercase RFC-1123 hostname
-        (https://tools.ietf.org/html/rfc1123) and requires `type` to be "ExternalName".
-        """
-        return pulumi.get(self, "external_name")
-
-    @external_name.setter
-    def external_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "external_name", value)
-
-    @_builtins.property
-    @pulumi.getter(name="externalTrafficPolicy")
-    def external_traffic_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        externalTrafficPolicy describes how nodes distribute service traffic they
-        receive on one of the Service's "externally-facing" addresses (NodePorts,
-        ExternalIPs, and LoadBalancer IPs). If set to "Local", the proxy will configure
-        the service in a way that assumes that external load balancers will take care
-        of balancing the service traffic between nodes, and so each node will deliver
-        traffic only to the node-local endpoints of the service, without masquerading
-        the client source IP. (Traffic mistakenly sent to a node with no endpoints will
-        be dropped.) The default value, "Cluster", uses the standard behavior of
-        routing to all endpoints evenly (possibly modified by topology and other
-        features). Note that traffic sent to an External IP or LoadBalancer IP from
-        within the cluster will always get "Cluster" semantics, but clients sending to
-        a NodePort from within the cluster may need to take traffic policy into account
-        when picking a node.
-        """
-        return pulumi.get(self, "external_traffic_policy")
-
-    @external_traffic_policy.setter
-    def external_traffic_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "external_traffic_policy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="healthCheckNodePort")
-    def health_check_node_port(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        healthCheckNodePort specifies the healthcheck nodePort for the service.
-        This only applies when type is set to LoadBalancer and
-        externalTrafficPolicy is set to Local. If a value is specified, is
-        in-range, and is not in use, it will be used.  If not specified, a value
-        will be automatically allocated.  External systems (e.g. load-balancers)
-        can use this port to determine if a given node holds endpoints for this
-        service or not.  If this field is specified when creating a Service
-        which does not need it, creation will fail. This field will be wiped
-        when updating a Service to no longer need it (e.g. changing type).
-        This field cannot be updated once set.
-        """
-        return pulumi.get(self, "health_check_node_port")
-
-    @health_check_node_port.setter
-    def health_check_node_port(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "health_check_node_port", value)
-
-    @_builtins.property
-    @pulumi.getter(name="internalTrafficPolicy")
-    def internal_traffic_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        InternalTrafficPolicy describes how nodes distribute service traffic they
-        receive on the ClusterIP. If set to "Local", the proxy will assume that pods
-        only want to talk to endpoints of the service on the same node as the pod,
-        dropping the traffic if there are no local endpoints. The default value,
-        "Cluster", uses the standard behavior of routing to all endpoints evenly
-        (possibly modified by topology and other features).
-        """
-        return pulumi.get(self, "internal_traffic_policy")
-
-    @internal_traffic_policy.setter
-    def internal_traffic_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "internal_traffic_policy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="ipFamilies")
-    def ip_families(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        IPFamilies is a list of IP families (e.g. IPv4, IPv6) assigned to this
-        service. This field is usually assigned automatically based on cluster
-        configuration and the ipFamilyPolicy field. If this field is specified
-        manually, the requested family is available in the cluster,
-        and ipFamilyPolicy allows it, it will be used; otherwise creation of
-        the service will fail. This field is conditionally mutable: it allows
-        for adding or removing a secondary IP family, but it does not allow
-        changing the primary IP family of the Service. Valid values are "IPv4"
-        and "IPv6".  This field only applies to Services of types ClusterIP,
-        NodePort, and LoadBalancer, and does apply to "headless" services.
-        This field will be wiped when updating a Service to type ExternalName.
-
-        This field may hold a maximum of two entries (dual-stack families, in
-        either order).  These families must correspond to the values of the
-        clusterIPs field, if specified. Both clusterIPs and ipFamilies are
-        governed by the ipFamilyPolicy field.
-        """
-        return pulumi.get(self, "ip_families")
-
-    @ip_families.setter
-    def ip_families(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "ip_families", value)
-
-    @_builtins.property
-    @pulumi.getter(name="ipFamilyPolicy")
-    def ip_family_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        IPFamilyPolicy represents the dual-stack-ness requested or required by
-        this Service. If there is no value provided, then this field will be set
-        to SingleStack. Services can be "SingleStack" (a single IP family),
-        "PreferDualStack" (two IP families on dual-stack configured clusters or
-        a single IP family on single-stack clusters), or "RequireDualStack"
-        (two IP families on dual-stack configured clusters, otherwise fail). The
-        ipFamilies and clusterIPs fields depend on the value of this field. This
-        field will be wiped when updating a service to type ExternalName.
-        """
-        return pulumi.get(self, "ip_family_policy")
-
-    @ip_family_policy.setter
-    def ip_family_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "ip_family_policy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="loadBalancerClass")
-    def load_balancer_class(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        loadBalancerClass is the class of the load balancer implementation this Service belongs to.
-        If specified, the value of this field must be a label-style identifier, with an optional prefix,
-        e.g. "internal-vip" or "example.com/internal-vip". Unprefixed names are reserved for end-users.
-        This field can only be set when the Service type is 'LoadBalancer'. If not set, the default load
-        balancer implementation is used, today this is typically done through the cloud provider integration,
-        but should apply for any default implementation. If set, it is assumed that a load balancer
-        implementation is watching for Services with a matching class. Any default load balancer
-        implementation (e.g. cloud providers) should ignore Services that set this field.
-        This field can only be set when creating or updating a Service to type 'LoadBalancer'.
-        Once set, it can not be changed. This field will be wiped when a service is updated to a non 'LoadBalancer' type.
-        """
-        return pulumi.get(self, "load_balancer_class")
-
-    @load_balancer_class.setter
-    def load_balancer_class(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "load_balancer_class", value)
-
-    @_builtins.property
-    @pulumi.getter(name="loadBalancerIP")
-    def load_balancer_ip(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Only applies to Service Type: LoadBalancer.
-        This feature depends on whether the underlying cloud-provider supports specifying
-        the loadBalancerIP when a load balancer is created.
-        This field will be ignored if the cloud-provider does not support the feature.
-        Deprecated: This field was under-specified and its meaning varies across implementations.
-        Using it is non-portable and it may not support dual-stack.
-        Users are encouraged to use implementation-specific annotations when available.
-        """
-        return pulumi.get(self, "load_balancer_ip")
-
-    @load_balancer_ip.setter
-    def load_balancer_ip(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "load_balancer_ip", value)
-
-    @_builtins.property
-    @pulumi.getter(name="loadBalancerSourceRanges")
-    def load_balancer_source_ranges(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        If specified and supported by the platform, this will restrict traffic through the cloud-provider
-        load-balancer will be restricted to the specified client IPs. This field will be ignored if the
-        cloud-provider does not support the feature."
-        More info: https://kubernetes.io/docs/tasks/access-application-cluster/create-external-load-balancer/
-        """
-        return pulumi.get(self, "load_balancer_source_ranges")
-
-    @load_balancer_source_ranges.setter
-    def load_balancer_source_ranges(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "load_balancer_source_ranges", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def ports(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceSpecPortsArgs']]]]:
-        """
-        The list of ports that are exposed by this service.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        """
-        return pulumi.get(self, "ports")
-
-    @ports.setter
-    def ports(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceSpecPortsArgs']]]]):
-        pulumi.set(self, "ports", value)
-
-    @_builtins.property
-    @pulumi.getter(name="publishNotReadyAddresses")
-    def publish_not_ready_addresses(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        publishNotReadyAddresses indicates that any agent which deals with endpoints for this
-        Service should disregard any indications of ready/not-ready.
-        The primary use case for setting this field is for a StatefulSet's Headless Service to
-        propagate SRV DNS records for its Pods for the purpose of peer discovery.
-        The Kubernetes controllers that generate Endpoints and EndpointSlice resources for
-        Services interpret this to mean that all endpoints are considered "ready" even if the
-        Pods themselves are not. Agents which consume only Kubernetes generated endpoints
-        through the Endpoints or EndpointSlice resources can safely assume this behavior.
-        """
-        return pulumi.get(self, "publish_not_ready_addresses")
-
-    @publish_not_ready_addresses.setter
-    def publish_not_ready_addresses(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "publish_not_ready_addresses", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def selector(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        Route service traffic to pods with label keys and values matching this
-        selector. If empty or not present, the service is assumed to have an
-        external process managing its endpoints, which Kubernetes will not
-        modify. Only applies to types ClusterIP, NodePort, and LoadBalancer.
-        Ignored if type is ExternalName.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/
-        """
-        return pulumi.get(self, "selector")
-
-    @selector.setter
-    def selector(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sessionAffinity")
-    def session_affinity(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Supports "ClientIP" and "None". Used to maintain session affinity.
-        Enable client IP based session affinity.
-        Must be ClientIP or None.
-        Defaults to None.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        """
-        return pulumi.get(self, "session_affinity")
-
-    @session_affinity.setter
-    def session_affinity(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "session_affinity", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sessionAffinityConfig")
-    def session_affinity_config(self) -> pulumi.Input[Optional['SparkConnectSpecServerServiceSpecSessionAffinityConfigArgs']]:
-        return pulumi.get(self, "session_affinity_config")
-
-    @session_affinity_config.setter
-    def session_affinity_config(self, value: pulumi.Input[Optional['SparkConnectSpecServerServiceSpecSessionAffinityConfigArgs']]):
-        pulumi.set(self, "session_affinity_config", value)
-
-    @_builtins.property
-    @pulumi.getter(name="trafficDistribution")
-    def traffic_distribution(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        TrafficDistribution offers a way to express preferences for how traffic is
-        distributed to Service endpoints. Implementations can use this field as a
-        hint, but are not required to guarantee strict adherence. If the field is
-        not set, the implementation will apply its default routing strategy. If set
-        to "PreferClose", implementations should prioritize endpoints that are
-        topologically close (e.g., same zone).
-        This is a beta field and requires enabling ServiceTrafficDistribution feature.
-        """
-        return pulumi.get(self, "traffic_distribution")
-
-    @traffic_distribution.setter
-    def traffic_distribution(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "traffic_distribution", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type determines how the Service is exposed. Defaults to ClusterIP. Valid
-        options are ExternalName, ClusterIP, NodePort, and LoadBalancer.
-        "ClusterIP" allocates a cluster-internal IP address for load-balancing
-        to endpoints. Endpoints are determined by the selector or if that is not
-        specified, by manual construction of an Endpoints object or
-        EndpointSlice objects. If clusterIP is "None", no virtual IP is
-        allocated and the endpoints are published as a set of endpoints rather
-        than a virtual IP.
-        "NodePort" builds on ClusterIP and allocates a port on every node which
-        routes to the same endpoints as the clusterIP.
-        "LoadBalancer" builds on NodePort and creates an external load-balancer
-        (if supported in the current cloud) which routes to the same endpoints
-        as the clusterIP.
-        "ExternalName" aliases this service to the specified externalName.
-        Several other fields do not apply to ExternalName services.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#publishing-services-service-types
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class SparkConnectSpecServerServiceStatusConditionsPatchArgsDict(TypedDict):
-    """
-    Condition contains details for one aspect of the current state of this API Resource.
-    """
-    last_transition_time: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    lastTransitionTime is the last time the condition transitioned from one status to another.
-    This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-    """
-    message: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    message is a human readable message indicating details about the transition.
-    This may be an empty string.
-    """
-    observed_generation: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    observedGeneration represents the .metadata.generation that the condition was set based upon.
-    For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-    with respect to the current state of the instance.
-    """
-    reason: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    reason contains a programmatic identifier indicating the reason for the condition's last transition.
-    Producers of specific condition types may define expected values and meanings for this field,
-    and whether the values are considered a guaranteed API.
-    The value should be a CamelCase string.
-    This field may not be empty.
-    """
-    status: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    status of the condition, one of True, False, Unknown.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type of condition in CamelCase or in foo.example.com/CamelCase.
-    """
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceStatusConditionsPatchArgs:
-    def __init__(__self__, *,
-                 last_transition_time: pulumi.Input[Optional[_builtins.str]] = None,
-                 message: pulumi.Input[Optional[_builtins.str]] = None,
-                 observed_generation: pulumi.Input[Optional[_builtins.int]] = None,
-                 reason: pulumi.Input[Optional[_builtins.str]] = None,
-                 status: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Condition contains details for one aspect of the current state of this API Resource.
-
-        :param pulumi.Input[_builtins.str] last_transition_time: lastTransitionTime is the last time the condition transitioned from one status to another.
-               This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        :param pulumi.Input[_builtins.str] message: message is a human readable message indicating details about the transition.
-               This may be an empty string.
-        :param pulumi.Input[_builtins.int] observed_generation: observedGeneration represents the .metadata.generation that the condition was set based upon.
-               For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-               with respect to the current state of the instance.
-        :param pulumi.Input[_builtins.str] reason: reason contains a programmatic identifier indicating the reason for the condition's last transition.
-               Producers of specific condition types may define expected values and meanings for this field,
-               and whether the values are considered a guaranteed API.
-               The value should be a CamelCase string.
-               This field may not be empty.
-        :param pulumi.Input[_builtins.str] status: status of the condition, one of True, False, Unknown.
-        :param pulumi.Input[_builtins.str] type: type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        if last_transition_time is not None:
-            pulumi.set(__self__, "last_transition_time", last_transition_time)
-        if message is not None:
-            pulumi.set(__self__, "message", message)
-        if observed_generation is not None:
-            pulumi.set(__self__, "observed_generation", observed_generation)
-        if reason is not None:
-            pulumi.set(__self__, "reason", reason)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="lastTransitionTime")
-    def last_transition_time(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        lastTransitionTime is the last time the condition transitioned from one status to another.
-        This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        """
-        return pulumi.get(self, "last_transition_time")
-
-    @last_transition_time.setter
-    def last_transition_time(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "last_transition_time", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def message(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        message is a human readable message indicating details about the transition.
-        This may be an empty string.
-        """
-        return pulumi.get(self, "message")
-
-    @message.setter
-    def message(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "message", value)
-
-    @_builtins.property
-    @pulumi.getter(name="observedGeneration")
-    def observed_generation(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        observedGeneration represents the .metadata.generation that the condition was set based upon.
-        For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-        with respect to the current state of the instance.
-        """
-        return pulumi.get(self, "observed_generation")
-
-    @observed_generation.setter
-    def observed_generation(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "observed_generation", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def reason(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        reason contains a programmatic identifier indicating the reason for the condition's last transition.
-        Producers of specific condition types may define expected values and meanings for this field,
-        and whether the values are considered a guaranteed API.
-        The value should be a CamelCase string.
-        This field may not be empty.
-        """
-        return pulumi.get(self, "reason")
-
-    @reason.setter
-    def reason(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "reason", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        status of the condition, one of True, False, Unknown.
-        """
-        return pulumi.get(self, "status")
-
-    @status.setter
-    def status(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "status", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class SparkConnectSpecServerServiceStatusConditionsArgsDict(TypedDict):
-    """
-    Condition contains details for one aspect of the current state of this API Resource.
-    """
-    last_transition_time: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    lastTransitionTime is the last time the condition transitioned from one status to another.
-    This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-    """
-    message: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    message is a human readable message indicating details about the transition.
-    This may be an empty string.
-    """
-    observed_generation: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    observedGeneration represents the .metadata.generation that the condition was set based upon.
-    For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-    with respect to the current state of the instance.
-    """
-    reason: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    reason contains a programmatic identifier indicating the reason for the condition's last transition.
-    Producers of specific condition types may define expected values and meanings for this field,
-    and whether the values are considered a guaranteed API.
-    The value should be a CamelCase string.
-    This field may not be empty.
-    """
-    status: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    status of the condition, one of True, False, Unknown.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type of condition in CamelCase or in foo.example.com/CamelCase.
-    """
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceStatusConditionsArgs:
-    def __init__(__self__, *,
-                 last_transition_time: pulumi.Input[Optional[_builtins.str]] = None,
-                 message: pulumi.Input[Optional[_builtins.str]] = None,
-                 observed_generation: pulumi.Input[Optional[_builtins.int]] = None,
-                 reason: pulumi.Input[Optional[_builtins.str]] = None,
-                 status: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Condition contains details for one aspect of the current state of this API Resource.
-
-        :param pulumi.Input[_builtins.str] last_transition_time: lastTransitionTime is the last time the condition transitioned from one status to another.
-               This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        :param pulumi.Input[_builtins.str] message: message is a human readable message indicating details about the transition.
-               This may be an empty string.
-        :param pulumi.Input[_builtins.int] observed_generation: observedGeneration represents the .metadata.generation that the condition was set based upon.
-               For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-               with respect to the current state of the instance.
-        :param pulumi.Input[_builtins.str] reason: reason contains a programmatic identifier indicating the reason for the condition's last transition.
-               Producers of specific condition types may define expected values and meanings for this field,
-               and whether the values are considered a guaranteed API.
-               The value should be a CamelCase string.
-               This field may not be empty.
-        :param pulumi.Input[_builtins.str] status: status of the condition, one of True, False, Unknown.
-        :param pulumi.Input[_builtins.str] type: type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        if last_transition_time is not None:
-            pulumi.set(__self__, "last_transition_time", last_transition_time)
-        if message is not None:
-            pulumi.set(__self__, "message", message)
-        if observed_generation is not None:
-            pulumi.set(__self__, "observed_generation", observed_generation)
-        if reason is not None:
-            pulumi.set(__self__, "reason", reason)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="lastTransitionTime")
-    def last_transition_time(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        lastTransitionTime is the last time the condition transitioned from one status to another.
-        This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        """
-        return pulumi.get(self, "last_transition_time")
-
-    @last_transition_time.setter
-    def last_transition_time(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "last_transition_time", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def message(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        message is a human readable message indicating details about the transition.
-        This may be an empty string.
-        """
-        return pulumi.get(self, "message")
-
-    @message.setter
-    def message(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "message", value)
-
-    @_builtins.property
-    @pulumi.getter(name="observedGeneration")
-    def observed_generation(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        observedGeneration represents the .metadata.generation that the condition was set based upon.
-        For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-        with respect to the current state of the instance.
-        """
-        return pulumi.get(self, "observed_generation")
-
-    @observed_generation.setter
-    def observed_generation(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "observed_generation", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def reason(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        reason contains a programmatic identifier indicating the reason for the condition's last transition.
-        Producers of specific condition types may define expected values and meanings for this field,
-        and whether the values are considered a guaranteed API.
-        The value should be a CamelCase string.
-        This field may not be empty.
-        """
-        return pulumi.get(self, "reason")
-
-    @reason.setter
-    def reason(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "reason", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        status of the condition, one of True, False, Unknown.
-        """
-        return pulumi.get(self, "status")
-
-    @status.setter
-    def status(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "status", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgsDict(TypedDict):
-    """
-    LoadBalancerIngress represents the status of a load-balancer ingress point:
-    traffic intended for the service should be sent to an ingress point.
-    """
-    hostname: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Hostname is set for load-balancer ingress points that are DNS based
-    (typically AWS load-balancers)
-    """
-    ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    IP is set for load-balancer ingress points that are IP based
-    (typically GCE or OpenStack load-balancers)
-    """
-    ip_mode: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    IPMode specifies how the load-balancer IP behaves, and may only be specified when the ip field is specified.
-    Setting this to "VIP" indicates that traffic is delivered to the node with
-    the destination set to the load-balancer's IP and port.
-    Setting this to "Proxy" indicates that traffic is delivered to the node or pod with
-    the destination set to the node's IP and node port or the pod's IP and port.
-    Service implementations may use this information to adjust traffic routing.
-    """
-    ports: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgs']]]]]
-    """
-    Ports is a list of records of service ports
-    If used, every port defined in the service should have an entry in it
-    """
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgs:
-    def __init__(__self__, *,
-                 hostname: pulumi.Input[Optional[_builtins.str]] = None,
-                 ip: pulumi.Input[Optional[_builtins.str]] = None,
-                 ip_mode: pulumi.Input[Optional[_builtins.str]] = None,
-                 ports: pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgs']]]] = None):
-        """
-        LoadBalancerIngress represents the status of a load-balancer ingress point:
-        traffic intended for the service should be sent to an ingress point.
-
-        :param pulumi.Input[_builtins.str] hostname: Hostname is set for load-balancer ingress points that are DNS based
-               (typically AWS load-balancers)
-        :param pulumi.Input[_builtins.str] ip: IP is set for load-balancer ingress points that are IP based
-               (typically GCE or OpenStack load-balancers)
-        :param pulumi.Input[_builtins.str] ip_mode: IPMode specifies how the load-balancer IP behaves, and may only be specified when the ip field is specified.
-               Setting this to "VIP" indicates that traffic is delivered to the node with
-               the destination set to the load-balancer's IP and port.
-               Setting this to "Proxy" indicates that traffic is delivered to the node or pod with
-               the destination set to the node's IP and node port or the pod's IP and port.
-               Service implementations may use this information to adjust traffic routing.
-        :param pulumi.Input[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgs']]] ports: Ports is a list of records of service ports
-               If used, every port defined in the service should have an entry in it
-        """
-        if hostname is not None:
-            pulumi.set(__self__, "hostname", hostname)
-        if ip is not None:
-            pulumi.set(__self__, "ip", ip)
-        if ip_mode is not None:
-            pulumi.set(__self__, "ip_mode", ip_mode)
-        if ports is not None:
-            pulumi.set(__self__, "ports", ports)
-
-    @_builtins.property
-    @pulumi.getter
-    def hostname(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Hostname is set for load-balancer ingress points that are DNS based
-        (typically AWS load-balancers)
-        """
-        return pulumi.get(self, "hostname")
-
-    @hostname.setter
-    def hostname(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "hostname", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def ip(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        IP is set for load-balancer ingress points that are IP based
-        (typically GCE or OpenStack load-balancers)
-        """
-        return pulumi.get(self, "ip")
-
-    @ip.setter
-    def ip(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "ip", value)
-
-    @_builtins.property
-    @pulumi.getter(name="ipMode")
-    def ip_mode(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        IPMode specifies how the load-balancer IP behaves, and may only be specified when the ip field is specified.
-        Setting this to "VIP" indicates that traffic is delivered to the node with
-        the destination set to the load-balancer's IP and port.
-        Setting this to "Proxy" indicates that traffic is delivered to the node or pod with
-        the destination set to the node's IP and node port or the pod's IP and port.
-        Service implementations may use this information to adjust traffic routing.
-        """
-        return pulumi.get(self, "ip_mode")
-
-    @ip_mode.setter
-    def ip_mode(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "ip_mode", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def ports(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgs']]]]:
-        """
-        Ports is a list of records of service ports
-        If used, every port defined in the service should have an entry in it
-        """
-        return pulumi.get(self, "ports")
-
-    @ports.setter
-    def ports(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgs']]]]):
-        pulumi.set(self, "ports", value)
-
-
-class SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgsDict(TypedDict):
-    """
-    PortStatus represents the error condition of a service port
-    """
-    error: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Error is to record the problem with the service port
-    The format of the error shall comply with the following rules:
-    - built-in error values shall be specified in this file and those shall use
-      CamelCase names
-    - cloud provider specific error values must have names that comply with the
-      format foo.example.com/CamelCase.
-    """
-    port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    Port is the port number of the service port of which status is recorded here
-    """
-    protocol: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Protocol is the protocol of the service port of which status is recorded here
-    The supported values are: "TCP", "UDP", "SCTP"
-    """
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgs:
-    def __init__(__self__, *,
-                 error: pulumi.Input[Optional[_builtins.str]] = None,
-                 port: pulumi.Input[Optional[_builtins.int]] = None,
-                 protocol: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        PortStatus represents the error condition of a service port
-
-        :param pulumi.Input[_builtins.str] error: Error is to record the problem with the service port
-               The format of the error shall comply with the following rules:
-               - built-in error values shall be specified in this file and those shall use
-                 CamelCase names
-               - cloud provider specific error values must have names that comply with the
-                 format foo.example.com/CamelCase.
-        :param pulumi.Input[_builtins.int] port: Port is the port number of the service port of which status is recorded here
-        :param pulumi.Input[_builtins.str] protocol: Protocol is the protocol of the service port of which status is recorded here
-               The supported values are: "TCP", "UDP", "SCTP"
-        """
-        if error is not None:
-            pulumi.set(__self__, "error", error)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if protocol is not None:
-            pulumi.set(__self__, "protocol", protocol)
-
-    @_builtins.property
-    @pulumi.getter
-    def error(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Error is to record the problem with the service port
-        The format of the error shall comply with the following rules:
-        - built-in error values shall be specified in this file and those shall use
-          CamelCase names
-        - cloud provider specific error values must have names that comply with the
-          format foo.example.com/CamelCase.
-        """
-        return pulumi.get(self, "error")
-
-    @error.setter
-    def error(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "error", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        Port is the port number of the service port of which status is recorded here
-        """
-        return pulumi.get(self, "port")
-
-    @port.setter
-    def port(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "port", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def protocol(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Protocol is the protocol of the service port of which status is recorded here
-        The supported values are: "TCP", "UDP", "SCTP"
-        """
-        return pulumi.get(self, "protocol")
-
-    @protocol.setter
-    def protocol(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "protocol", value)
-
-
-class SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgsDict(TypedDict):
-    """
-    PortStatus represents the error condition of a service port
-    """
-    error: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Error is to record the problem with the service port
-    The format of the error shall comply with the following rules:
-    - built-in error values shall be specified in this file and those shall use
-      CamelCase names
-    - cloud provider specific error values must have names that comply with the
-      format foo.example.com/CamelCase.
-    """
-    port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    Port is the port number of the service port of which status is recorded here
-    """
-    protocol: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Protocol is the protocol of the service port of which status is recorded here
-    The supported values are: "TCP", "UDP", "SCTP"
-    """
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs:
-    def __init__(__self__, *,
-                 error: pulumi.Input[Optional[_builtins.str]] = None,
-                 port: pulumi.Input[Optional[_builtins.int]] = None,
-                 protocol: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        PortStatus represents the error condition of a service port
-
-        :param pulumi.Input[_builtins.str] error: Error is to record the problem with the service port
-               The format of the error shall comply with the following rules:
-               - built-in error values shall be specified in this file and those shall use
-                 CamelCase names
-               - cloud provider specific error values must have names that comply with the
-                 format foo.example.com/CamelCase.
-        :param pulumi.Input[_builtins.int] port: Port is the port number of the service port of which status is recorded here
-        :param pulumi.Input[_builtins.str] protocol: Protocol is the protocol of the service port of which status is recorded here
-               The supported values are: "TCP", "UDP", "SCTP"
-        """
-        if error is not None:
-            pulumi.set(__self__, "error", error)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if protocol is not None:
-            pulumi.set(__self__, "protocol", protocol)
-
-    @_builtins.property
-    @pulumi.getter
-    def error(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Error is to record the problem with the service port
-        The format of the error shall comply with the following rules:
-        - built-in error values shall be specified in this file and those shall use
-          CamelCase names
-        - cloud provider specific error values must have names that comply with the
-          format foo.example.com/CamelCase.
-        """
-        return pulumi.get(self, "error")
-
-    @error.setter
-    def error(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "error", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        Port is the port number of the service port of which status is recorded here
-        """
-        return pulumi.get(self, "port")
-
-    @port.setter
-    def port(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "port", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def protocol(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Protocol is the protocol of the service port of which status is recorded here
-        The supported values are: "TCP", "UDP", "SCTP"
-        """
-        return pulumi.get(self, "protocol")
-
-    @protocol.setter
-    def protocol(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "protocol", value)
-
-
-class SparkConnectSpecServerServiceStatusLoadBalancerIngressArgsDict(TypedDict):
-    """
-    LoadBalancerIngress represents the status of a load-balancer ingress point:
-    traffic intended for the service should be sent to an ingress point.
-    """
-    hostname: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Hostname is set for load-balancer ingress points that are DNS based
-    (typically AWS load-balancers)
-    """
-    ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    IP is set for load-balancer ingress points that are IP based
-    (typically GCE or OpenStack load-balancers)
-    """
-    ip_mode: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    IPMode specifies how the load-balancer IP behaves, and may only be specified when the ip field is specified.
-    Setting this to "VIP" indicates that traffic is delivered to the node with
-    the destination set to the load-balancer's IP and port.
-    Setting this to "Proxy" indicates that traffic is delivered to the node or pod with
-    the destination set to the node's IP and node port or the pod's IP and port.
-    Service implementations may use this information to adjust traffic routing.
-    """
-    ports: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs']]]]]
-    """
-    Ports is a list of records of service ports
-    If used, every port defined in the service should have an entry in it
-    """
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs:
-    def __init__(__self__, *,
-                 hostname: pulumi.Input[Optional[_builtins.str]] = None,
-                 ip: pulumi.Input[Optional[_builtins.str]] = None,
-                 ip_mode: pulumi.Input[Optional[_builtins.str]] = None,
-                 ports: pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs']]]] = None):
-        """
-        LoadBalancerIngress represents the status of a load-balancer ingress point:
-        traffic intended for the service should be sent to an ingress point.
-
-        :param pulumi.Input[_builtins.str] hostname: Hostname is set for load-balancer ingress points that are DNS based
-               (typically AWS load-balancers)
-        :param pulumi.Input[_builtins.str] ip: IP is set for load-balancer ingress points that are IP based
-               (typically GCE or OpenStack load-balancers)
-        :param pulumi.Input[_builtins.str] ip_mode: IPMode specifies how the load-balancer IP behaves, and may only be specified when the ip field is specified.
-               Setting this to "VIP" indicates that traffic is delivered to the node with
-               the destination set to the load-balancer's IP and port.
-               Setting this to "Proxy" indicates that traffic is delivered to the node or pod with
-               the destination set to the node's IP and node port or the pod's IP and port.
-               Service implementations may use this information to adjust traffic routing.
-        :param pulumi.Input[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs']]] ports: Ports is a list of records of service ports
-               If used, every port defined in the service should have an entry in it
-        """
-        if hostname is not None:
-            pulumi.set(__self__, "hostname", hostname)
-        if ip is not None:
-            pulumi.set(__self__, "ip", ip)
-        if ip_mode is not None:
-            pulumi.set(__self__, "ip_mode", ip_mode)
-        if ports is not None:
-            pulumi.set(__self__, "ports", ports)
-
-    @_builtins.property
-    @pulumi.getter
-    def hostname(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Hostname is set for load-balancer ingress points that are DNS based
-        (typically AWS load-balancers)
-        """
-        return pulumi.get(self, "hostname")
-
-    @hostname.setter
-    def hostname(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "hostname", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def ip(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        IP is set for load-balancer ingress points that are IP based
-        (typically GCE or OpenStack load-balancers)
-        """
-        return pulumi.get(self, "ip")
-
-    @ip.setter
-    def ip(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "ip", value)
-
-    @_builtins.property
-    @pulumi.getter(name="ipMode")
-    def ip_mode(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        IPMode specifies how the load-balancer IP behaves, and may only be specified when the ip field is specified.
-        Setting this to "VIP" indicates that traffic is delivered to the node with
-        the destination set to the load-balancer's IP and port.
-        Setting this to "Proxy" indicates that traffic is delivered to the node or pod with
-        the destination set to the node's IP and node port or the pod's IP and port.
-        Service implementations may use this information to adjust traffic routing.
-        """
-        return pulumi.get(self, "ip_mode")
-
-    @ip_mode.setter
-    def ip_mode(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "ip_mode", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def ports(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs']]]]:
-        """
-        Ports is a list of records of service ports
-        If used, every port defined in the service should have an entry in it
-        """
-        return pulumi.get(self, "ports")
-
-    @ports.setter
-    def ports(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs']]]]):
-        pulumi.set(self, "ports", value)
-
-
-class SparkConnectSpecServerServiceStatusLoadBalancerPatchArgsDict(TypedDict):
-    """
-    LoadBalancer contains the current status of the load-balancer,
-    if one is present.
-    """
-    ingress: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgs']]]]]
-    """
-    Ingress is a list containing ingress points for the load-balancer.
-    Traffic intended for the service should be sent to these ingress points.
-    """
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceStatusLoadBalancerPatchArgs:
-    def __init__(__self__, *,
-                 ingress: pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgs']]]] = None):
-        """
-        LoadBalancer contains the current status of the load-balancer,
-        if one is present.
-
-        :param pulumi.Input[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgs']]] ingress: Ingress is a list containing ingress points for the load-balancer.
-               Traffic intended for the service should be sent to these ingress points.
-        """
-        if ingress is not None:
-            pulumi.set(__self__, "ingress", ingress)
-
-    @_builtins.property
-    @pulumi.getter
-    def ingress(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgs']]]]:
-        """
-        Ingress is a list containing ingress points for the load-balancer.
-        Traffic intended for the service should be sent to these ingress points.
-        """
-        return pulumi.get(self, "ingress")
-
-    @ingress.setter
-    def ingress(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgs']]]]):
-        pulumi.set(self, "ingress", value)
-
-
-class SparkConnectSpecServerServiceStatusLoadBalancerArgsDict(TypedDict):
-    """
-    LoadBalancer contains the current status of the load-balancer,
-    if one is present.
-    """
-    ingress: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs']]]]]
-    """
-    Ingress is a list containing ingress points for the load-balancer.
-    Traffic intended for the service should be sent to these ingress points.
-    """
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceStatusLoadBalancerArgs:
-    def __init__(__self__, *,
-                 ingress: pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs']]]] = None):
-        """
-        LoadBalancer contains the current status of the load-balancer,
-        if one is present.
-
-        :param pulumi.Input[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs']]] ingress: Ingress is a list containing ingress points for the load-balancer.
-               Traffic intended for the service should be sent to these ingress points.
-        """
-        if ingress is not None:
-            pulumi.set(__self__, "ingress", ingress)
-
-    @_builtins.property
-    @pulumi.getter
-    def ingress(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs']]]]:
-        """
-        Ingress is a list containing ingress points for the load-balancer.
-        Traffic intended for the service should be sent to these ingress points.
-        """
-        return pulumi.get(self, "ingress")
-
-    @ingress.setter
-    def ingress(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs']]]]):
-        pulumi.set(self, "ingress", value)
-
-
-class SparkConnectSpecServerServiceStatusPatchArgsDict(TypedDict):
-    """
-    Most recently observed status of the service.
-    Populated by the system.
-    Read-only.
-    More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    conditions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusConditionsPatchArgs']]]]]
-    """
-    Current service state
-    """
-    load_balancer: NotRequired[pulumi.Input[Optional['SparkConnectSpecServerServiceStatusLoadBalancerPatchArgs']]]
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceStatusPatchArgs:
-    def __init__(__self__, *,
-                 conditions: pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusConditionsPatchArgs']]]] = None,
-                 load_balancer: pulumi.Input[Optional['SparkConnectSpecServerServiceStatusLoadBalancerPatchArgs']] = None):
-        """
-        Most recently observed status of the service.
-        Populated by the system.
-        Read-only.
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param pulumi.Input[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusConditionsPatchArgs']]] conditions: Current service state
-        """
-        if conditions is not None:
-            pulumi.set(__self__, "conditions", conditions)
-        if load_balancer is not None:
-            pulumi.set(__self__, "load_balancer", load_balancer)
-
-    @_builtins.property
-    @pulumi.getter
-    def conditions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusConditionsPatchArgs']]]]:
-        """
-        Current service state
-        """
-        return pulumi.get(self, "conditions")
-
-    @conditions.setter
-    def conditions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusConditionsPatchArgs']]]]):
-        pulumi.set(self, "conditions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="loadBalancer")
-    def load_balancer(self) -> pulumi.Input[Optional['SparkConnectSpecServerServiceStatusLoadBalancerPatchArgs']]:
-        return pulumi.get(self, "load_balancer")
-
-    @load_balancer.setter
-    def load_balancer(self, value: pulumi.Input[Optional['SparkConnectSpecServerServiceStatusLoadBalancerPatchArgs']]):
-        pulumi.set(self, "load_balancer", value)
-
-
-class SparkConnectSpecServerServiceStatusArgsDict(TypedDict):
-    """
-    Most recently observed status of the service.
-    Populated by the system.
-    Read-only.
-    More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    conditions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusConditionsArgs']]]]]
-    """
-    Current service state
-    """
-    load_balancer: NotRequired[pulumi.Input[Optional['SparkConnectSpecServerServiceStatusLoadBalancerArgs']]]
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceStatusArgs:
-    def __init__(__self__, *,
-                 conditions: pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusConditionsArgs']]]] = None,
-                 load_balancer: pulumi.Input[Optional['SparkConnectSpecServerServiceStatusLoadBalancerArgs']] = None):
-        """
-        Most recently observed status of the service.
-        Populated by the system.
-        Read-only.
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param pulumi.Input[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusConditionsArgs']]] conditions: Current service state
-        """
-        if conditions is not None:
-            pulumi.set(__self__, "conditions", conditions)
-        if load_balancer is not None:
-            pulumi.set(__self__, "load_balancer", load_balancer)
-
-    @_builtins.property
-    @pulumi.getter
-    def conditions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusConditionsArgs']]]]:
-        """
-        Current service state
-        """
-        return pulumi.get(self, "conditions")
-
-    @conditions.setter
-    def conditions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectSpecServerServiceStatusConditionsArgs']]]]):
-        pulumi.set(self, "conditions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="loadBalancer")
-    def load_balancer(self) -> pulumi.Input[Optional['SparkConnectSpecServerServiceStatusLoadBalancerArgs']]:
-        return pulumi.get(self, "load_balancer")
-
-    @load_balancer.setter
-    def load_balancer(self, value: pulumi.Input[Optional['SparkConnectSpecServerServiceStatusLoadBalancerArgs']]):
-        pulumi.set(self, "load_balancer", value)
-
-
-class SparkConnectSpecServerServiceArgsDict(TypedDict):
-    """
-    Service exposes the Spark connect server.
-    """
-    api_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    APIVersion defines the versioned schema of this representation of an object.
-    Servers should convert recognized schemas to the latest internal value, and
-    may reject unrecognized values.
-    More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-    """
-    kind: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Kind is a string value representing the REST resource this object represents.
-    Servers may infer this from the endpoint the client submits requests to.
-    Cannot be updated.
-    In CamelCase.
-    More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-    """
-    metadata: NotRequired[pulumi.Input[Optional['SparkConnectSpecServerServiceMetadataArgs']]]
-    spec: NotRequired[pulumi.Input[Optional['SparkConnectSpecServerServiceSpecArgs']]]
-    status: NotRequired[pulumi.Input[Optional['SparkConnectSpecServerServiceStatusArgs']]]
-
-@pulumi.input_type
-class SparkConnectSpecServerServiceArgs:
-    def __init__(__self__, *,
-                 api_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 kind: pulumi.Input[Optional[_builtins.str]] = None,
-                 metadata: pulumi.Input[Optional['SparkConnectSpecServerServiceMetadataArgs']] = None,
-                 spec: pulumi.Input[Optional['SparkConnectSpecServerServiceSpecArgs']] = None,
-                 status: pulumi.Input[Optional['SparkConnectSpecServerServiceStatusArgs']] = None):
-        """
-        Service exposes the Spark connect server.
-
-        :param pulumi.Input[_builtins.str] api_version: APIVersion defines the versioned schema of this representation of an object.
-               Servers should convert recognized schemas to the latest internal value, and
-               may reject unrecognized values.
-               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        :param pulumi.Input[_builtins.str] kind: Kind is a string value representing the REST resource this object represents.
-               Servers may infer this from the endpoint the client submits requests to.
-               Cannot be updated.
-               In CamelCase.
-               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        if api_version is not None:
-            pulumi.set(__self__, "api_version", api_version)
-        if kind is not None:
-            pulumi.set(__self__, "kind", kind)
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter(name="apiVersion")
-    def api_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        APIVersion defines the versioned schema of this representation of an object.
-        Servers should convert recognized schemas to the latest internal value, and
-        may reject unrecognized values.
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        """
-        return pulumi.get(self, "api_version")
-
-    @api_version.setter
-    def api_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "api_version", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def kind(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Kind is a string value representing the REST resource this object represents.
-        Servers may infer this from the endpoint the client submits requests to.
-        Cannot be updated.
-        In CamelCase.
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        return pulumi.get(self, "kind")
-
-    @kind.setter
-    def kind(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "kind", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> pulumi.Input[Optional['SparkConnectSpecServerServiceMetadataArgs']]:
-        return pulumi.get(self, "metadata")
-
-    @metadata.setter
-    def metadata(self, value: pulumi.Input[Optional['SparkConnectSpecServerServiceMetadataArgs']]):
-        pulumi.set(self, "metadata", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> pulumi.Input[Optional['SparkConnectSpecServerServiceSpecArgs']]:
-        return pulumi.get(self, "spec")
-
-    @spec.setter
-    def spec(self, value: pulumi.Input[Optional['SparkConnectSpecServerServiceSpecArgs']]):
-        pulumi.set(self, "spec", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> pulumi.Input[Optional['SparkConnectSpecServerServiceStatusArgs']]:
-        return pulumi.get(self, "status")
-
-    @status.setter
-    def status(self, value: pulumi.Input[Optional['SparkConnectSpecServerServiceStatusArgs']]):
-        pulumi.set(self, "status", value)
-
-
-class SparkConnectSpecServerArgsDict(TypedDict):
-    """
-    Server is the Spark connect server specification.
-    """
-    cores: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-    """
-    memory: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Memory is the amount of memory to request for the pod.
-    """
-    service: NotRequired[pulumi.Input[Optional['SparkConnectSpecServerServiceArgs']]]
-    template: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
-    """
-    Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-    Spark version >= 3.0.0 is required.
-    Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-    """
-
-@pulumi.input_type
-class SparkConnectSpecServerArgs:
-    def __init__(__self__, *,
-                 cores: pulumi.Input[Optional[_builtins.int]] = None,
-                 memory: pulumi.Input[Optional[_builtins.str]] = None,
-                 service: pulumi.Input[Optional['SparkConnectSpecServerServiceArgs']] = None,
-                 template: pulumi.Input[Optional[Mapping[str, Any]]] = None):
-        """
-        Server is the Spark connect server specification.
-
-        :param pulumi.Input[_builtins.int] cores: Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-        :param pulumi.Input[_builtins.str] memory: Memory is the amount of memory to request for the pod.
-        :param pulumi.Input[Mapping[str, Any]] template: Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-               Spark version >= 3.0.0 is required.
-               Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-        """
-        if cores is not None:
-            pulumi.set(__self__, "cores", cores)
-        if memory is not None:
-            pulumi.set(__self__, "memory", memory)
-        if service is not None:
-            pulumi.set(__self__, "service", service)
-        if template is not None:
-            pulumi.set(__self__, "template", template)
-
-    @_builtins.property
-    @pulumi.getter
-    def cores(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-        """
-        return pulumi.get(self, "cores")
-
-    @cores.setter
-    def cores(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "cores", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def memory(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Memory is the amount of memory to request for the pod.
-        """
-        return pulumi.get(self, "memory")
-
-    @memory.setter
-    def memory(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "memory", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def service(self) -> pulumi.Input[Optional['SparkConnectSpecServerServiceArgs']]:
-        return pulumi.get(self, "service")
-
-    @service.setter
-    def service(self, value: pulumi.Input[Optional['SparkConnectSpecServerServiceArgs']]):
-        pulumi.set(self, "service", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def template(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
-        """
-        Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-        Spark version >= 3.0.0 is required.
-        Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-        """
-        return pulumi.get(self, "template")
-
-    @template.setter
-    def template(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
-        pulumi.set(self, "template", value)
-
-
-class SparkConnectSpecArgsDict(TypedDict):
-    """
-    SparkConnectSpec defines the desired state of SparkConnect.
-    """
-    dynamic_allocation: NotRequired[pulumi.Input[Optional['SparkConnectSpecDynamicAllocationArgs']]]
-    executor: NotRequired[pulumi.Input[Optional['SparkConnectSpecExecutorArgs']]]
-    hadoop_conf: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    HadoopConf carries user-specified Hadoop configuration properties as they would use the "--conf" option
-    in spark-submit. The SparkApplication controller automatically adds prefix "spark.hadoop." to Hadoop
-    configuration properties.
-    """
-    image: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Image is the container image for the driver, executor, and init-container. Any custom container images for the
-    driver, executor, or init-container takes precedence over this.
-    """
-    server: NotRequired[pulumi.Input[Optional['SparkConnectSpecServerArgs']]]
-    spark_conf: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    SparkConf carries user-specified Spark configuration properties as they would use the "--conf" option in
-    spark-submit.
-    """
-    spark_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    SparkVersion is the version of Spark the spark connect use.
-    """
-
-@pulumi.input_type
-class SparkConnectSpecArgs:
-    def __init__(__self__, *,
-                 dynamic_allocation: pulumi.Input[Optional['SparkConnectSpecDynamicAllocationArgs']] = None,
-                 executor: pulumi.Input[Optional['SparkConnectSpecExecutorArgs']] = None,
-                 hadoop_conf: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 image: pulumi.Input[Optional[_builtins.str]] = None,
-                 server: pulumi.Input[Optional['SparkConnectSpecServerArgs']] = None,
-                 spark_conf: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 spark_version: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        SparkConnectSpec defines the desired state of SparkConnect.
-
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] hadoop_conf: HadoopConf carries user-specified Hadoop configuration properties as they would use the "--conf" option
-               in spark-submit. The SparkApplication controller automatically adds prefix "spark.hadoop." to Hadoop
-               configuration properties.
-        :param pulumi.Input[_builtins.str] image: Image is the container image for the driver, executor, and init-container. Any custom container images for the
-               driver, executor, or init-container takes precedence over this.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] spark_conf: SparkConf carries user-specified Spark configuration properties as they would use the "--conf" option in
-               spark-submit.
-        :param pulumi.Input[_builtins.str] spark_version: SparkVersion is the version of Spark the spark connect use.
-        """
-        if dynamic_allocation is not None:
-            pulumi.set(__self__, "dynamic_allocation", dynamic_allocation)
-        if executor is not None:
-            pulumi.set(__self__, "executor", executor)
-        if hadoop_conf is not None:
-            pulumi.set(__self__, "hadoop_conf", hadoop_conf)
-        if image is not None:
-            pulumi.set(__self__, "image", image)
-        if server is not None:
-            pulumi.set(__self__, "server", server)
-        if spark_conf is not None:
-            pulumi.set(__self__, "spark_conf", spark_conf)
-        if spark_version is not None:
-            pulumi.set(__self__, "spark_version", spark_version)
-
-    @_builtins.property
-    @pulumi.getter(name="dynamicAllocation")
-    def dynamic_allocation(self) -> pulumi.Input[Optional['SparkConnectSpecDynamicAllocationArgs']]:
-        return pulumi.get(self, "dynamic_allocation")
-
-    @dynamic_allocation.setter
-    def dynamic_allocation(self, value: pulumi.Input[Optional['SparkConnectSpecDynamicAllocationArgs']]):
-        pulumi.set(self, "dynamic_allocation", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def executor(self) -> pulumi.Input[Optional['SparkConnectSpecExecutorArgs']]:
-        return pulumi.get(self, "executor")
-
-    @executor.setter
-    def executor(self, value: pulumi.Input[Optional['SparkConnectSpecExecutorArgs']]):
-        pulumi.set(self, "executor", value)
-
-    @_builtins.property
-    @pulumi.getter(name="hadoopConf")
-    def hadoop_conf(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        HadoopConf carries user-specified Hadoop configuration properties as they would use the "--conf" option
-        in spark-submit. The SparkApplication controller automatically adds prefix "spark.hadoop." to Hadoop
-        configuration properties.
-        """
-        return pulumi.get(self, "hadoop_conf")
-
-    @hadoop_conf.setter
-    def hadoop_conf(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "hadoop_conf", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def image(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Image is the container image for the driver, executor, and init-container. Any custom container images for the
-        driver, executor, or init-container takes precedence over this.
-        """
-        return pulumi.get(self, "image")
-
-    @image.setter
-    def image(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "image", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def server(self) -> pulumi.Input[Optional['SparkConnectSpecServerArgs']]:
-        return pulumi.get(self, "server")
-
-    @server.setter
-    def server(self, value: pulumi.Input[Optional['SparkConnectSpecServerArgs']]):
-        pulumi.set(self, "server", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sparkConf")
-    def spark_conf(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        SparkConf carries user-specified Spark configuration properties as they would use the "--conf" option in
-        spark-submit.
-        """
-        return pulumi.get(self, "spark_conf")
-
-    @spark_conf.setter
-    def spark_conf(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "spark_conf", value)
-
-    @_builtins.property
-    @pulumi.getter(name="sparkVersion")
-    def spark_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        SparkVersion is the version of Spark the spark connect use.
-        """
-        return pulumi.get(self, "spark_version")
-
-    @spark_version.setter
-    def spark_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "spark_version", value)
-
-
-class SparkConnectStatusConditionsArgsDict(TypedDict):
-    """
-    Condition contains details for one aspect of the current state of this API Resource.
-    """
-    last_transition_time: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    lastTransitionTime is the last time the condition transitioned from one status to another.
-    This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-    """
-    message: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    message is a human readable message indicating details about the transition.
-    This may be an empty string.
-    """
-    observed_generation: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    observedGeneration represents the .metadata.generation that the condition was set based upon.
-    For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-    with respect to the current state of the instance.
-    """
-    reason: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    reason contains a programmatic identifier indicating the reason for the condition's last transition.
-    Producers of specific condition types may define expected values and meanings for this field,
-    and whether the values are considered a guaranteed API.
-    The value should be a CamelCase string.
-    This field may not be empty.
-    """
-    status: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    status of the condition, one of True, False, Unknown.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type of condition in CamelCase or in foo.example.com/CamelCase.
-    """
-
-@pulumi.input_type
-class SparkConnectStatusConditionsArgs:
-    def __init__(__self__, *,
-                 last_transition_time: pulumi.Input[Optional[_builtins.str]] = None,
-                 message: pulumi.Input[Optional[_builtins.str]] = None,
-                 observed_generation: pulumi.Input[Optional[_builtins.int]] = None,
-                 reason: pulumi.Input[Optional[_builtins.str]] = None,
-                 status: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Condition contains details for one aspect of the current state of this API Resource.
-
-        :param pulumi.Input[_builtins.str] last_transition_time: lastTransitionTime is the last time the condition transitioned from one status to another.
-               This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        :param pulumi.Input[_builtins.str] message: message is a human readable message indicating details about the transition.
-               This may be an empty string.
-        :param pulumi.Input[_builtins.int] observed_generation: observedGeneration represents the .metadata.generation that the condition was set based upon.
-               For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-               with respect to the current state of the instance.
-        :param pulumi.Input[_builtins.str] reason: reason contains a programmatic identifier indicating the reason for the condition's last transition.
-               Producers of specific condition types may define expected values and meanings for this field,
-               and whether the values are considered a guaranteed API.
-               The value should be a CamelCase string.
-               This field may not be empty.
-        :param pulumi.Input[_builtins.str] status: status of the condition, one of True, False, Unknown.
-        :param pulumi.Input[_builtins.str] type: type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        if last_transition_time is not None:
-            pulumi.set(__self__, "last_transition_time", last_transition_time)
-        if message is not None:
-            pulumi.set(__self__, "message", message)
-        if observed_generation is not None:
-            pulumi.set(__self__, "observed_generation", observed_generation)
-        if reason is not None:
-            pulumi.set(__self__, "reason", reason)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="lastTransitionTime")
-    def last_transition_time(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        lastTransitionTime is the last time the condition transitioned from one status to another.
-        This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        """
-        return pulumi.get(self, "last_transition_time")
-
-    @last_transition_time.setter
-    def last_transition_time(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "last_transition_time", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def message(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        message is a human readable message indicating details about the transition.
-        This may be an empty string.
-        """
-        return pulumi.get(self, "message")
-
-    @message.setter
-    def message(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "message", value)
-
-    @_builtins.property
-    @pulumi.getter(name="observedGeneration")
-    def observed_generation(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        observedGeneration represents the .metadata.generation that the condition was set based upon.
-        For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-        with respect to the current state of the instance.
-        """
-        return pulumi.get(self, "observed_generation")
-
-    @observed_generation.setter
-    def observed_generation(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "observed_generation", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def reason(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        reason contains a programmatic identifier indicating the reason for the condition's last transition.
-        Producers of specific condition types may define expected values and meanings for this field,
-        and whether the values are considered a guaranteed API.
-        The value should be a CamelCase string.
-        This field may not be empty.
-        """
-        return pulumi.get(self, "reason")
-
-    @reason.setter
-    def reason(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "reason", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        status of the condition, one of True, False, Unknown.
-        """
-        return pulumi.get(self, "status")
-
-    @status.setter
-    def status(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "status", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class SparkConnectStatusServerArgsDict(TypedDict):
-    """
-    Server represents the current state of the SparkConnect server.
-    """
-    pod_ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    PodIP is the IP address of the pod that is running the Spark Connect server.
-    """
-    pod_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    PodName is the name of the pod that is running the Spark Connect server.
-    """
-    service_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    ServiceName is the name of the service that is exposing the Spark Connect server.
-    """
-
-@pulumi.input_type
-class SparkConnectStatusServerArgs:
-    def __init__(__self__, *,
-                 pod_ip: pulumi.Input[Optional[_builtins.str]] = None,
-                 pod_name: pulumi.Input[Optional[_builtins.str]] = None,
-                 service_name: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Server represents the current state of the SparkConnect server.
-
-        :param pulumi.Input[_builtins.str] pod_ip: PodIP is the IP address of the pod that is running the Spark Connect server.
-        :param pulumi.Input[_builtins.str] pod_name: PodName is the name of the pod that is running the Spark Connect server.
-        :param pulumi.Input[_builtins.str] service_name: ServiceName is the name of the service that is exposing the Spark Connect server.
-        """
-        if pod_ip is not None:
-            pulumi.set(__self__, "pod_ip", pod_ip)
-        if pod_name is not None:
-            pulumi.set(__self__, "pod_name", pod_name)
-        if service_name is not None:
-            pulumi.set(__self__, "service_name", service_name)
-
-    @_builtins.property
-    @pulumi.getter(name="podIp")
-    def pod_ip(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        PodIP is the IP address of the pod that is running the Spark Connect server.
-        """
-        return pulumi.get(self, "pod_ip")
-
-    @pod_ip.setter
-    def pod_ip(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "pod_ip", value)
-
-    @_builtins.property
-    @pulumi.getter(name="podName")
-    def pod_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        PodName is the name of the pod that is running the Spark Connect server.
-        """
-        return pulumi.get(self, "pod_name")
-
-    @pod_name.setter
-    def pod_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "pod_name", value)
-
-    @_builtins.property
-    @pulumi.getter(name="serviceName")
-    def service_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        ServiceName is the name of the service that is exposing the Spark Connect server.
-        """
-        return pulumi.get(self, "service_name")
-
-    @service_name.setter
-    def service_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "service_name", value)
-
-
-class SparkConnectStatusArgsDict(TypedDict):
-    """
-    SparkConnectStatus defines the observed state of SparkConnect.
-    """
-    conditions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectStatusConditionsArgs']]]]]
-    """
-    Represents the latest available observations of a SparkConnect's current state.
-    """
-    executors: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.int]]]]]
-    """
-    Executors represents the current state of the SparkConnect executors.
-    """
-    last_update_time: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    LastUpdateTime is the time at which the SparkConnect controller last updated the SparkConnect.
-    """
-    server: NotRequired[pulumi.Input[Optional['SparkConnectStatusServerArgs']]]
-    start_time: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    StartTime is the time at which the SparkConnect controller started processing the SparkConnect.
-    """
-    state: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    State represents the current state of the SparkConnect.
-    """
-
-@pulumi.input_type
-class SparkConnectStatusArgs:
-    def __init__(__self__, *,
-                 conditions: pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectStatusConditionsArgs']]]] = None,
-                 executors: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.int]]]] = None,
-                 last_update_time: pulumi.Input[Optional[_builtins.str]] = None,
-                 server: pulumi.Input[Optional['SparkConnectStatusServerArgs']] = None,
-                 start_time: pulumi.Input[Optional[_builtins.str]] = None,
-                 state: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        SparkConnectStatus defines the observed state of SparkConnect.
-
-        :param pulumi.Input[Sequence[pulumi.Input['SparkConnectStatusConditionsArgs']]] conditions: Represents the latest available observations of a SparkConnect's current state.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.int]]] executors: Executors represents the current state of the SparkConnect executors.
-        :param pulumi.Input[_builtins.str] last_update_time: LastUpdateTime is the time at which the SparkConnect controller last updated the SparkConnect.
-        :param pulumi.Input[_builtins.str] start_time: StartTime is the time at which the SparkConnect controller started processing the SparkConnect.
-        :param pulumi.Input[_builtins.str] state: State represents the current state of the SparkConnect.
-        """
-        if conditions is not None:
-            pulumi.set(__self__, "conditions", conditions)
-        if executors is not None:
-            pulumi.set(__self__, "executors", executors)
-        if last_update_time is not None:
-            pulumi.set(__self__, "last_update_time", last_update_time)
-        if server is not None:
-            pulumi.set(__self__, "server", server)
-        if start_time is not None:
-            pulumi.set(__self__, "start_time", start_time)
-        if state is not None:
-            pulumi.set(__self__, "state", state)
-
-    @_builtins.property
-    @pulumi.getter
-    def conditions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectStatusConditionsArgs']]]]:
-        """
-        Represents the latest available observations of a SparkConnect's current state.
-        """
-        return pulumi.get(self, "conditions")
-
-    @conditions.setter
-    def conditions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['SparkConnectStatusConditionsArgs']]]]):
-        pulumi.set(self, "conditions", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def executors(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.int]]]]:
-        """
-        Executors represents the current state of the SparkConnect executors.
-        """
-        return pulumi.get(self, "executors")
-
-    @executors.setter
-    def executors(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.int]]]]):
-        pulumi.set(self, "executors", value)
-
-    @_builtins.property
-    @pulumi.getter(name="lastUpdateTime")
-    def last_update_time(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        LastUpdateTime is the time at which the SparkConnect controller last updated the SparkConnect.
-        """
-        return pulumi.get(self, "last_update_time")
-
-    @last_update_time.setter
-    def last_update_time(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "last_update_time", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def server(self) -> pulumi.Input[Optional['SparkConnectStatusServerArgs']]:
-        return pulumi.get(self, "server")
-
-    @server.setter
-    def server(self, value: pulumi.Input[Optional['SparkConnectStatusServerArgs']]):
-        pulumi.set(self, "server", value)
-
-    @_builtins.property
-    @pulumi.getter(name="startTime")
-    def start_time(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        StartTime is the time at which the SparkConnect controller started processing the SparkConnect.
-        """
-        return pulumi.get(self, "start_time")
-
-    @start_time.setter
-    def start_time(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "start_time", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def state(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        State represents the current state of the SparkConnect.
-        """
-        return pulumi.get(self, "state")
-
-    @state.setter
-    def state(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "state", value)
-
-
-class SparkConnectArgsDict(TypedDict):
-    """
-    SparkConnect is the Schema for the sparkconnections API.
-    """
-    api_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-    """
-    kind: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-    """
-    metadata: NotRequired[pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']]]
-    """
-    Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-    """
-    spec: NotRequired[pulumi.Input[Optional['SparkConnectSpecArgs']]]
-    status: NotRequired[pulumi.Input[Optional['SparkConnectStatusArgs']]]
-
-@pulumi.input_type
-class SparkConnectArgs:
-    def __init__(__self__, *,
-                 api_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 kind: pulumi.Input[Optional[_builtins.str]] = None,
-                 metadata: pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']] = None,
-                 spec: pulumi.Input[Optional['SparkConnectSpecArgs']] = None,
-                 status: pulumi.Input[Optional['SparkConnectStatusArgs']] = None):
-        """
-        SparkConnect is the Schema for the sparkconnections API.
-
-        :param pulumi.Input[_builtins.str] api_version: APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        :param pulumi.Input[_builtins.str] kind: Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        :param pulumi.Input['_meta.v1.ObjectMetaArgs'] metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        if api_version is not None:
-            pulumi.set(__self__, "api_version", 'sparkoperator.k8s.io/v1alpha1')
-        if kind is not None:
-            pulumi.set(__self__, "kind", 'SparkConnect')
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter(name="apiVersion")
-    def api_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        """
-        return pulumi.get(self, "api_version")
-
-    @api_version.setter
-    def api_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "api_version", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def kind(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        return pulumi.get(self, "kind")
-
-    @kind.setter
-    def kind(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "kind", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']]:
-        """
-        Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        return pulumi.get(self, "metadata")
-
-    @metadata.setter
-    def metadata(self, value: pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']]):
-        pulumi.set(self, "metadata", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> pulumi.Input[Optional['SparkConnectSpecArgs']]:
-        return pulumi.get(self, "spec")
-
-    @spec.setter
-    def spec(self, value: pulumi.Input[Optional['SparkConnectSpecArgs']]):
-        pulumi.set(self, "spec", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> pulumi.Input[Optional['SparkConnectStatusArgs']]:
-        return pulumi.get(self, "status")
-
-    @status.setter
-    def status(self, value: pulumi.Input[Optional['SparkConnectStatusArgs']]):
-        pulumi.set(self, "status", value)
@@ -0,0 +1,164 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['SparkConnectSpecArgsDict', 'SparkConnectSpecArgs']
+
+class SparkConnectSpecArgsDict(TypedDict):
+    """
+    SparkConnectSpec defines the desired state of SparkConnect.
+    """
+    dynamic_allocation: NotRequired[pulumi.Input[Optional['_inputs.SparkConnectSpecDynamicAllocationArgs']]]
+    executor: NotRequired[pulumi.Input[Optional['_inputs.SparkConnectSpecExecutorArgs']]]
+    hadoop_conf: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+    """
+    HadoopConf carries user-specified Hadoop configuration properties as they would use the "--conf" option
+    in spark-submit. The SparkApplication controller automatically adds prefix "spark.hadoop." to Hadoop
+    configuration properties.
+    """
+    image: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Image is the container image for the driver, executor, and init-container. Any custom container images for the
+    driver, executor, or init-container takes precedence over this.
+    """
+    server: NotRequired[pulumi.Input[Optional['_inputs.SparkConnectSpecServerArgs']]]
+    spark_conf: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+    """
+    SparkConf carries user-specified Spark configuration properties as they would use the "--conf" option in
+    spark-submit.
+    """
+    spark_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    SparkVersion is the version of Spark the spark connect use.
+    """
+
+
+@pulumi.input_type
+class SparkConnectSpecArgs:
+    def __init__(__self__, *,
+                 dynamic_allocation: pulumi.Input[Optional['_inputs.SparkConnectSpecDynamicAllocationArgs']] = None,
+                 executor: pulumi.Input[Optional['_inputs.SparkConnectSpecExecutorArgs']] = None,
+                 hadoop_conf: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
+                 image: pulumi.Input[Optional[_builtins.str]] = None,
+                 server: pulumi.Input[Optional['_inputs.SparkConnectSpecServerArgs']] = None,
+                 spark_conf: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
+                 spark_version: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        SparkConnectSpec defines the desired state of SparkConnect.
+
+        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] hadoop_conf: HadoopConf carries user-specified Hadoop configuration properties as they would use the "--conf" option
+               in spark-submit. The SparkApplication controller automatically adds prefix "spark.hadoop." to Hadoop
+               configuration properties.
+        :param pulumi.Input[_builtins.str] image: Image is the container image for the driver, executor, and init-container. Any custom container images for the
+               driver, executor, or init-container takes precedence over this.
+        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] spark_conf: SparkConf carries user-specified Spark configuration properties as they would use the "--conf" option in
+               spark-submit.
+        :param pulumi.Input[_builtins.str] spark_version: SparkVersion is the version of Spark the spark connect use.
+        """
+        if dynamic_allocation is not None:
+            pulumi.set(__self__, "dynamic_allocation", dynamic_allocation)
+        if executor is not None:
+            pulumi.set(__self__, "executor", executor)
+        if hadoop_conf is not None:
+            pulumi.set(__self__, "hadoop_conf", hadoop_conf)
+        if image is not None:
+            pulumi.set(__self__, "image", image)
+        if server is not None:
+            pulumi.set(__self__, "server", server)
+        if spark_conf is not None:
+            pulumi.set(__self__, "spark_conf", spark_conf)
+        if spark_version is not None:
+            pulumi.set(__self__, "spark_version", spark_version)
+
+    @_builtins.property
+    @pulumi.getter(name="dynamicAllocation")
+    def dynamic_allocation(self) -> pulumi.Input[Optional['_inputs.SparkConnectSpecDynamicAllocationArgs']]:
+        return pulumi.get(self, "dynamic_allocation")
+
+    @dynamic_allocation.setter
+    def dynamic_allocation(self, value: pulumi.Input[Optional['_inputs.SparkConnectSpecDynamicAllocationArgs']]):
+        pulumi.set(self, "dynamic_allocation", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def executor(self) -> pulumi.Input[Optional['_inputs.SparkConnectSpecExecutorArgs']]:
+        return pulumi.get(self, "executor")
+
+    @executor.setter
+    def executor(self, value: pulumi.Input[Optional['_inputs.SparkConnectSpecExecutorArgs']]):
+        pulumi.set(self, "executor", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hadoopConf")
+    def hadoop_conf(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        """
+        HadoopConf carries user-specified Hadoop configuration properties as they would use the "--conf" option
+        in spark-submit. The SparkApplication controller automatically adds prefix "spark.hadoop." to Hadoop
+        configuration properties.
+        """
+        return pulumi.get(self, "hadoop_conf")
+
+    @hadoop_conf.setter
+    def hadoop_conf(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "hadoop_conf", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def image(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Image is the container image for the driver, executor, and init-container. Any custom container images for the
+        driver, executor, or init-container takes precedence over this.
+        """
+        return pulumi.get(self, "image")
+
+    @image.setter
+    def image(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "image", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def server(self) -> pulumi.Input[Optional['_inputs.SparkConnectSpecServerArgs']]:
+        return pulumi.get(self, "server")
+
+    @server.setter
+    def server(self, value: pulumi.Input[Optional['_inputs.SparkConnectSpecServerArgs']]):
+        pulumi.set(self, "server", value)
+
+    @_builtins.property
+    @pulumi.getter(name="sparkConf")
+    def spark_conf(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        """
+        SparkConf carries user-specified Spark configuration properties as they would use the "--conf" option in
+        spark-submit.
+        """
+        return pulumi.get(self, "spark_conf")
+
+    @spark_conf.setter
+    def spark_conf(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "spark_conf", value)
+
+    @_builtins.property
+    @pulumi.getter(name="sparkVersion")
+    def spark_version(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        SparkVersion is the version of Spark the spark connect use.
+        """
+        return pulumi.get(self, "spark_version")
+
+    @spark_version.setter
+    def spark_version(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "spark_version", value)
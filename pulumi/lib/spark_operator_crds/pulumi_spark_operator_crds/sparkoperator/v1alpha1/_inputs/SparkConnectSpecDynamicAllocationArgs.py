@@ -0,0 +1,170 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['SparkConnectSpecDynamicAllocationArgsDict', 'SparkConnectSpecDynamicAllocationArgs']
+
+class SparkConnectSpecDynamicAllocationArgsDict(TypedDict):
+    """
+    DynamicAllocation configures dynamic allocation that becomes available for the Kubernetes
+    scheduler backend since Spark 3.0.
+    """
+    enabled: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Enabled controls whether dynamic allocation is enabled or not.
+    """
+    initial_executors: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    InitialExecutors is the initial number of executors to request. If .spec.executor.instances
+    is also set, the initial number of executors is set to the bigger of that and this option.
+    """
+    max_executors: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    MaxExecutors is the upper bound for the number of executors if dynamic allocation is enabled.
+    """
+    min_executors: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    MinExecutors is the lower bound for the number of executors if dynamic allocation is enabled.
+    """
+    shuffle_tracking_enabled: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    ShuffleTrackingEnabled enables shuffle file tracking for executors, which allows dynamic allocation without
+    the need for an external shuffle service. This option will try to keep alive executors that are storing
+    shuffle data for active jobs. If external shuffle service is enabled, set ShuffleTrackingEnabled to false.
+    ShuffleTrackingEnabled is true by default if dynamicAllocation.enabled is true.
+    """
+    shuffle_tracking_timeout: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    ShuffleTrackingTimeout controls the timeout in milliseconds for executors that are holding
+    shuffle data if shuffle tracking is enabled (true by default if dynamic allocation is enabled).
+    """
+
+
+@pulumi.input_type
+class SparkConnectSpecDynamicAllocationArgs:
+    def __init__(__self__, *,
+                 enabled: pulumi.Input[Optional[_builtins.bool]] = None,
+                 initial_executors: pulumi.Input[Optional[_builtins.int]] = None,
+                 max_executors: pulumi.Input[Optional[_builtins.int]] = None,
+                 min_executors: pulumi.Input[Optional[_builtins.int]] = None,
+                 shuffle_tracking_enabled: pulumi.Input[Optional[_builtins.bool]] = None,
+                 shuffle_tracking_timeout: pulumi.Input[Optional[_builtins.int]] = None):
+        """
+        DynamicAllocation configures dynamic allocation that becomes available for the Kubernetes
+        scheduler backend since Spark 3.0.
+
+        :param pulumi.Input[_builtins.bool] enabled: Enabled controls whether dynamic allocation is enabled or not.
+        :param pulumi.Input[_builtins.int] initial_executors: InitialExecutors is the initial number of executors to request. If .spec.executor.instances
+               is also set, the initial number of executors is set to the bigger of that and this option.
+        :param pulumi.Input[_builtins.int] max_executors: MaxExecutors is the upper bound for the number of executors if dynamic allocation is enabled.
+        :param pulumi.Input[_builtins.int] min_executors: MinExecutors is the lower bound for the number of executors if dynamic allocation is enabled.
+        :param pulumi.Input[_builtins.bool] shuffle_tracking_enabled: ShuffleTrackingEnabled enables shuffle file tracking for executors, which allows dynamic allocation without
+               the need for an external shuffle service. This option will try to keep alive executors that are storing
+               shuffle data for active jobs. If external shuffle service is enabled, set ShuffleTrackingEnabled to false.
+               ShuffleTrackingEnabled is true by default if dynamicAllocation.enabled is true.
+        :param pulumi.Input[_builtins.int] shuffle_tracking_timeout: ShuffleTrackingTimeout controls the timeout in milliseconds for executors that are holding
+               shuffle data if shuffle tracking is enabled (true by default if dynamic allocation is enabled).
+        """
+        if enabled is not None:
+            pulumi.set(__self__, "enabled", enabled)
+        if initial_executors is not None:
+            pulumi.set(__self__, "initial_executors", initial_executors)
+        if max_executors is not None:
+            pulumi.set(__self__, "max_executors", max_executors)
+        if min_executors is not None:
+            pulumi.set(__self__, "min_executors", min_executors)
+        if shuffle_tracking_enabled is not None:
+            pulumi.set(__self__, "shuffle_tracking_enabled", shuffle_tracking_enabled)
+        if shuffle_tracking_timeout is not None:
+            pulumi.set(__self__, "shuffle_tracking_timeout", shuffle_tracking_timeout)
+
+    @_builtins.property
+    @pulumi.getter
+    def enabled(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Enabled controls whether dynamic allocation is enabled or not.
+        """
+        return pulumi.get(self, "enabled")
+
+    @enabled.setter
+    def enabled(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "enabled", value)
+
+    @_builtins.property
+    @pulumi.getter(name="initialExecutors")
+    def initial_executors(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        InitialExecutors is the initial number of executors to request. If .spec.executor.instances
+        is also set, the initial number of executors is set to the bigger of that and this option.
+        """
+        return pulumi.get(self, "initial_executors")
+
+    @initial_executors.setter
+    def initial_executors(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "initial_executors", value)
+
+    @_builtins.property
+    @pulumi.getter(name="maxExecutors")
+    def max_executors(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        MaxExecutors is the upper bound for the number of executors if dynamic allocation is enabled.
+        """
+        return pulumi.get(self, "max_executors")
+
+    @max_executors.setter
+    def max_executors(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "max_executors", value)
+
+    @_builtins.property
+    @pulumi.getter(name="minExecutors")
+    def min_executors(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        MinExecutors is the lower bound for the number of executors if dynamic allocation is enabled.
+        """
+        return pulumi.get(self, "min_executors")
+
+    @min_executors.setter
+    def min_executors(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "min_executors", value)
+
+    @_builtins.property
+    @pulumi.getter(name="shuffleTrackingEnabled")
+    def shuffle_tracking_enabled(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        ShuffleTrackingEnabled enables shuffle file tracking for executors, which allows dynamic allocation without
+        the need for an external shuffle service. This option will try to keep alive executors that are storing
+        shuffle data for active jobs. If external shuffle service is enabled, set ShuffleTrackingEnabled to false.
+        ShuffleTrackingEnabled is true by default if dynamicAllocation.enabled is true.
+        """
+        return pulumi.get(self, "shuffle_tracking_enabled")
+
+    @shuffle_tracking_enabled.setter
+    def shuffle_tracking_enabled(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "shuffle_tracking_enabled", value)
+
+    @_builtins.property
+    @pulumi.getter(name="shuffleTrackingTimeout")
+    def shuffle_tracking_timeout(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        ShuffleTrackingTimeout controls the timeout in milliseconds for executors that are holding
+        shuffle data if shuffle tracking is enabled (true by default if dynamic allocation is enabled).
+        """
+        return pulumi.get(self, "shuffle_tracking_timeout")
+
+    @shuffle_tracking_timeout.setter
+    def shuffle_tracking_timeout(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "shuffle_tracking_timeout", value)
@@ -0,0 +1,119 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['SparkConnectSpecExecutorPatchArgsDict', 'SparkConnectSpecExecutorPatchArgs']
+
+class SparkConnectSpecExecutorPatchArgsDict(TypedDict):
+    """
+    Executor is the Spark executor specification.
+    """
+    cores: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
+    """
+    instances: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Instances is the number of executor instances.
+    """
+    memory: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Memory is the amount of memory to request for the pod.
+    """
+    template: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
+    Spark version >= 3.0.0 is required.
+    Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
+    """
+
+
+@pulumi.input_type
+class SparkConnectSpecExecutorPatchArgs:
+    def __init__(__self__, *,
+                 cores: pulumi.Input[Optional[_builtins.int]] = None,
+                 instances: pulumi.Input[Optional[_builtins.int]] = None,
+                 memory: pulumi.Input[Optional[_builtins.str]] = None,
+                 template: pulumi.Input[Optional[Mapping[str, Any]]] = None):
+        """
+        Executor is the Spark executor specification.
+
+        :param pulumi.Input[_builtins.int] cores: Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
+        :param pulumi.Input[_builtins.int] instances: Instances is the number of executor instances.
+        :param pulumi.Input[_builtins.str] memory: Memory is the amount of memory to request for the pod.
+        :param pulumi.Input[Mapping[str, Any]] template: Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
+               Spark version >= 3.0.0 is required.
+               Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
+        """
+        if cores is not None:
+            pulumi.set(__self__, "cores", cores)
+        if instances is not None:
+            pulumi.set(__self__, "instances", instances)
+        if memory is not None:
+            pulumi.set(__self__, "memory", memory)
+        if template is not None:
+            pulumi.set(__self__, "template", template)
+
+    @_builtins.property
+    @pulumi.getter
+    def cores(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
+        """
+        return pulumi.get(self, "cores")
+
+    @cores.setter
+    def cores(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "cores", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def instances(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Instances is the number of executor instances.
+        """
+        return pulumi.get(self, "instances")
+
+    @instances.setter
+    def instances(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "instances", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def memory(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Memory is the amount of memory to request for the pod.
+        """
+        return pulumi.get(self, "memory")
+
+    @memory.setter
+    def memory(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "memory", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def template(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
+        Spark version >= 3.0.0 is required.
+        Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
+        """
+        return pulumi.get(self, "template")
+
+    @template.setter
+    def template(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "template", value)
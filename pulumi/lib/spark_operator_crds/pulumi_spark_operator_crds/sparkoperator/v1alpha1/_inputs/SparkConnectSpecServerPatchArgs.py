@@ -0,0 +1,112 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['SparkConnectSpecServerPatchArgsDict', 'SparkConnectSpecServerPatchArgs']
+
+class SparkConnectSpecServerPatchArgsDict(TypedDict):
+    """
+    Server is the Spark connect server specification.
+    """
+    cores: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
+    """
+    memory: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Memory is the amount of memory to request for the pod.
+    """
+    service: NotRequired[pulumi.Input[Optional['_inputs.SparkConnectSpecServerServicePatchArgs']]]
+    template: NotRequired[pulumi.Input[Optional[Mapping[str, Any]]]]
+    """
+    Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
+    Spark version >= 3.0.0 is required.
+    Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
+    """
+
+
+@pulumi.input_type
+class SparkConnectSpecServerPatchArgs:
+    def __init__(__self__, *,
+                 cores: pulumi.Input[Optional[_builtins.int]] = None,
+                 memory: pulumi.Input[Optional[_builtins.str]] = None,
+                 service: pulumi.Input[Optional['_inputs.SparkConnectSpecServerServicePatchArgs']] = None,
+                 template: pulumi.Input[Optional[Mapping[str, Any]]] = None):
+        """
+        Server is the Spark connect server specification.
+
+        :param pulumi.Input[_builtins.int] cores: Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
+        :param pulumi.Input[_builtins.str] memory: Memory is the amount of memory to request for the pod.
+        :param pulumi.Input[Mapping[str, Any]] template: Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
+               Spark version >= 3.0.0 is required.
+               Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
+        """
+        if cores is not None:
+            pulumi.set(__self__, "cores", cores)
+        if memory is not None:
+            pulumi.set(__self__, "memory", memory)
+        if service is not None:
+            pulumi.set(__self__, "service", service)
+        if template is not None:
+            pulumi.set(__self__, "template", template)
+
+    @_builtins.property
+    @pulumi.getter
+    def cores(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
+        """
+        return pulumi.get(self, "cores")
+
+    @cores.setter
+    def cores(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "cores", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def memory(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Memory is the amount of memory to request for the pod.
+        """
+        return pulumi.get(self, "memory")
+
+    @memory.setter
+    def memory(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "memory", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def service(self) -> pulumi.Input[Optional['_inputs.SparkConnectSpecServerServicePatchArgs']]:
+        return pulumi.get(self, "service")
+
+    @service.setter
+    def service(self, value: pulumi.Input[Optional['_inputs.SparkConnectSpecServerServicePatchArgs']]):
+        pulumi.set(self, "service", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def template(self) -> pulumi.Input[Optional[Mapping[str, Any]]]:
+        """
+        Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
+        Spark version >= 3.0.0 is required.
+        Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
+        """
+        return pulumi.get(self, "template")
+
+    @template.setter
+    def template(self, value: pulumi.Input[Optional[Mapping[str, Any]]]):
+        pulumi.set(self, "template", value)
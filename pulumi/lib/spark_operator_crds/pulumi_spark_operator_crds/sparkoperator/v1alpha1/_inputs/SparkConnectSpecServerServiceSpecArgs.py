@@ -0,0 +1,887 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['SparkConnectSpecServerServiceSpecArgsDict', 'SparkConnectSpecServerServiceSpecArgs']
+
+class SparkConnectSpecServerServiceSpecArgsDict(TypedDict):
+    """
+    Spec defines the behavior of a service.
+    https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
+    """
+    allocate_load_balancer_node_ports: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    allocateLoadBalancerNodePorts defines if NodePorts will be automatically
+    allocated for services with type LoadBalancer.  Default is "true". It
+    may be set to "false" if the cluster load-balancer does not rely on
+    NodePorts.  If the caller requests specific NodePorts (by specifying a
+    value), those requests will be respected, regardless of this field.
+    This field may only be set for services with type LoadBalancer and will
+    be cleared if the type is changed to any other type.
+    """
+    cluster_ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    clusterIP is the IP address of the service and is usually assigned
+    randomly. If an address is specified manually, is in-range (as per
+    system configuration), and is not in use, it will be allocated to the
+    service; otherwise creation of the service will fail. This field may not
+    be changed through updates unless the type field is also being changed
+    to ExternalName (which requires this field to be blank) or the type
+    field is being changed from ExternalName (in which case this field may
+    optionally be specified, as describe above).  Valid values are "None",
+    empty string (""), or a valid IP address. Setting this to "None" makes a
+    "headless service" (no virtual IP), which is useful when direct endpoint
+    connections are preferred and proxying is not required.  Only applies to
+    types ClusterIP, NodePort, and LoadBalancer. If this field is specified
+    when creating a Service of type ExternalName, creation will fail. This
+    field will be wiped when updating a Service to type ExternalName.
+    More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+    """
+    cluster_ips: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    ClusterIPs is a list of IP addresses assigned to this service, and are
+    usually assigned randomly.  If an address is specified manually, is
+    in-range (as per system configuration), and is not in use, it will be
+    allocated to the service; otherwise creation of the service will fail.
+    This field may not be changed through updates unless the type field is
+    also being changed to ExternalName (which requires this field to be
+    empty) or the type field is being changed from ExternalName (in which
+    case this field may optionally be specified, as describe above).  Valid
+    values are "None", empty string (""), or a valid IP address.  Setting
+    this to "None" makes a "headless service" (no virtual IP), which is
+    useful when direct endpoint connections are preferred and proxying is
+    not required.  Only applies to types ClusterIP, NodePort, and
+    LoadBalancer. If this field is specified when creating a Service of type
+    ExternalName, creation will fail. This field will be wiped when updating
+    a Service to type ExternalName.  If this field is not specified, it will
+    be initialized from the clusterIP field.  If this field is specified,
+    clients must ensure that clusterIPs[0] and clusterIP have the same
+    value.
+
+    This field may hold a maximum of two entries (dual-stack IPs, in either order).
+    These IPs must correspond to the values of the ipFamilies field. Both
+    clusterIPs and ipFamilies are governed by the ipFamilyPolicy field.
+    More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+    """
+    external_ips: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    externalIPs is a list of IP addresses for which nodes in the cluster
+    will also accept traffic for this service.  These IPs are not managed by
+    Kubernetes.  The user is responsible for ensuring that traffic arrives
+    at a node with this IP.  A common example is external load-balancers
+    that are not part of the Kubernetes system.
+    """
+    external_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    externalName is the external reference that discovery mechanisms will
+    return as an alias for this service (e.g. a DNS CNAME record). No
+    proxying will be involved.  Must be a lowercase RFC-1123 hostname
+    (https://tools.ietf.org/html/rfc1123) and requires `type` to be "ExternalName".
+    """
+    external_traffic_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    externalTrafficPolicy describes how nodes distribute service traffic they
+    receive on one of the Service's "externally-facing" addresses (NodePorts,
+    ExternalIPs, and LoadBalancer IPs). If set to "Local", the proxy will configure
+    the service in a way that assumes that external load balancers will take care
+    of balancing the service traffic between nodes, and so each node will deliver
+    traffic only to the node-local endpoints of the service, without masquerading
+    the client source IP. (Traffic mistakenly sent to a node with no endpoints will
+    be dropped.) The default value, "Cluster", uses the standard behavior of
+    routing to all endpoints evenly (possibly modified by topology and other
+    features). Note that traffic sent to an External IP or LoadBalancer IP from
+    within the cluster will always get "Cluster" semantics, but clients sending to
+    a NodePort from within the cluster may need to take traffic policy into account
+    when picking a node.
+    """
+    health_check_node_port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    healthCheckNodePort specifies the healthcheck nodePort for the service.
+    This only applies when type is set to LoadBalancer and
+    externalTrafficPolicy is set to Local. If a value is specified, is
+    in-range, and is not in use, it will be used.  If not specified, a value
+    will be automatically allocated.  External systems (e.g. load-balancers)
+    can use this port to determine if a given node holds endpoints for this
+    service or not.  If this field is specified when creating a Service
+    which does not need it, creation will fail. This field will be wiped
+    when updating a Service to no longer need it (e.g. changing type).
+    This field cannot be updated once set.
+    """
+    internal_traffic_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    InternalTrafficPolicy describes how nodes distribute service traffic they
+    receive on the ClusterIP. If set to "Local", the proxy will assume that pods
+    only want to talk to endpoints of the service on the same node as the pod,
+    dropping the traffic if there are no local endpoints. The default value,
+    "Cluster", uses the standard behavior of routing to all endpoints evenly
+    (possibly modified by topology and other features).
+    """
+    ip_families: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    IPFamilies is a list of IP families (e.g. IPv4, IPv6) assigned to this
+    service. This field is usually assigned automatically based on cluster
+    configuration and the ipFamilyPolicy field. If this field is specified
+    manually, the requested family is available in the cluster,
+    and ipFamilyPolicy allows it, it will be used; otherwise creation of
+    the service will fail. This field is conditionally mutable: it allows
+    for adding or removing a secondary IP family, but it does not allow
+    changing the primary IP family of the Service. Valid values are "IPv4"
+    and "IPv6".  This field only applies to Services of types ClusterIP,
+    NodePort, and LoadBalancer, and does apply to "headless" services.
+    This field will be wiped when updating a Service to type ExternalName.
+
+    This field may hold a maximum of two entries (dual-stack families, in
+    either order).  These families must correspond to the values of the
+    clusterIPs field, if specified. Both clusterIPs and ipFamilies are
+    governed by the ipFamilyPolicy field.
+    """
+    ip_family_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    IPFamilyPolicy represents the dual-stack-ness requested or required by
+    this Service. If there is no value provided, then this field will be set
+    to SingleStack. Services can be "SingleStack" (a single IP family),
+    "PreferDualStack" (two IP families on dual-stack configured clusters or
+    a single IP family on single-stack clusters), or "RequireDualStack"
+    (two IP families on dual-stack configured clusters, otherwise fail). The
+    ipFamilies and clusterIPs fields depend on the value of this field. This
+    field will be wiped when updating a service to type ExternalName.
+    """
+    load_balancer_class: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    loadBalancerClass is the class of the load balancer implementation this Service belongs to.
+    If specified, the value of this field must be a label-style identifier, with an optional prefix,
+    e.g. "internal-vip" or "example.com/internal-vip". Unprefixed names are reserved for end-users.
+    This field can only be set when the Service type is 'LoadBalancer'. If not set, the default load
+    balancer implementation is used, today this is typically done through the cloud provider integration,
+    but should apply for any default implementation. If set, it is assumed that a load balancer
+    implementation is watching for Services with a matching class. Any default load balancer
+    implementation (e.g. cloud providers) should ignore Services that set this field.
+    This field can only be set when creating or updating a Service to type 'LoadBalancer'.
+    Once set, it can not be changed. This field will be wiped when a service is updated to a non 'LoadBalancer' type.
+    """
+    load_balancer_ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Only applies to Service Type: LoadBalancer.
+    This feature depends on whether the underlying cloud-provider supports specifying
+    the loadBalancerIP when a load balancer is created.
+    This field will be ignored if the cloud-provider does not support the feature.
+    Deprecated: This field was under-specified and its meaning varies across implementations.
+    Using it is non-portable and it may not support dual-stack.
+    Users are encouraged to use implementation-specific annotations when available.
+    """
+    load_balancer_source_ranges: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    If specified and supported by the platform, this will restrict traffic through the cloud-provider
+    load-balancer will be restricted to the specified client IPs. This field will be ignored if the
+    cloud-provider does not support the feature."
+    More info: https://kubernetes.io/docs/tasks/access-application-cluster/create-external-load-balancer/
+    """
+    ports: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceSpecPortsArgs']]]]]
+    """
+    The list of ports that are exposed by this service.
+    More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+    """
+    publish_not_ready_addresses: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    publishNotReadyAddresses indicates that any agent which deals with endpoints for this
+    Service should disregard any indications of ready/not-ready.
+    The primary use case for setting this field is for a StatefulSet's Headless Service to
+    propagate SRV DNS records for its Pods for the purpose of peer discovery.
+    The Kubernetes controllers that generate Endpoints and EndpointSlice resources for
+    Services interpret this to mean that all endpoints are considered "ready" even if the
+    Pods themselves are not. Agents which consume only Kubernetes generated endpoints
+    through the Endpoints or EndpointSlice resources can safely assume this behavior.
+    """
+    selector: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+    """
+    Route service traffic to pods with label keys and values matching this
+    selector. If empty or not present, the service is assumed to have an
+    external process managing its endpoints, which Kubernetes will not
+    modify. Only applies to types ClusterIP, NodePort, and LoadBalancer.
+    Ignored if type is ExternalName.
+    More info: https://kubernetes.io/docs/concepts/services-networking/service/
+    """
+    session_affinity: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Supports "ClientIP" and "None". Used to maintain session affinity.
+    Enable client IP based session affinity.
+    Must be ClientIP or None.
+    Defaults to None.
+    More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+    """
+    session_affinity_config: NotRequired[pulumi.Input[Optional['_inputs.SparkConnectSpecServerServiceSpecSessionAffinityConfigArgs']]]
+    traffic_distribution: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    TrafficDistribution offers a way to express preferences for how traffic is
+    distributed to Service endpoints. Implementations can use this field as a
+    hint, but are not required to guarantee strict adherence. If the field is
+    not set, the implementation will apply its default routing strategy. If set
+    to "PreferClose", implementations should prioritize endpoints that are
+    topologically close (e.g., same zone).
+    This is a beta field and requires enabling ServiceTrafficDistribution feature.
+    """
+    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    type determines how the Service is exposed. Defaults to ClusterIP. Valid
+    options are ExternalName, ClusterIP, NodePort, and LoadBalancer.
+    "ClusterIP" allocates a cluster-internal IP address for load-balancing
+    to endpoints. Endpoints are determined by the selector or if that is not
+    specified, by manual construction of an Endpoints object or
+    EndpointSlice objects. If clusterIP is "None", no virtual IP is
+    allocated and the endpoints are published as a set of endpoints rather
+    than a virtual IP.
+    "NodePort" builds on ClusterIP and allocates a port on every node which
+    routes to the same endpoints as the clusterIP.
+    "LoadBalancer" builds on NodePort and creates an external load-balancer
+    (if supported in the current cloud) which routes to the same endpoints
+    as the clusterIP.
+    "ExternalName" aliases this service to the specified externalName.
+    Several other fields do not apply to ExternalName services.
+    More info: https://kubernetes.io/docs/concepts/services-networking/service/#publishing-services-service-types
+    """
+
+
+@pulumi.input_type
+class SparkConnectSpecServerServiceSpecArgs:
+    def __init__(__self__, *,
+                 allocate_load_balancer_node_ports: pulumi.Input[Optional[_builtins.bool]] = None,
+                 cluster_ip: pulumi.Input[Optional[_builtins.str]] = None,
+                 cluster_ips: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 external_ips: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 external_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 external_traffic_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 health_check_node_port: pulumi.Input[Optional[_builtins.int]] = None,
+                 internal_traffic_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 ip_families: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 ip_family_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 load_balancer_class: pulumi.Input[Optional[_builtins.str]] = None,
+                 load_balancer_ip: pulumi.Input[Optional[_builtins.str]] = None,
+                 load_balancer_source_ranges: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 ports: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceSpecPortsArgs']]]] = None,
+                 publish_not_ready_addresses: pulumi.Input[Optional[_builtins.bool]] = None,
+                 selector: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
+                 session_affinity: pulumi.Input[Optional[_builtins.str]] = None,
+                 session_affinity_config: pulumi.Input[Optional['_inputs.SparkConnectSpecServerServiceSpecSessionAffinityConfigArgs']] = None,
+                 traffic_distribution: pulumi.Input[Optional[_builtins.str]] = None,
+                 type: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        Spec defines the behavior of a service.
+        https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
+
+        :param pulumi.Input[_builtins.bool] allocate_load_balancer_node_ports: allocateLoadBalancerNodePorts defines if NodePorts will be automatically
+               allocated for services with type LoadBalancer.  Default is "true". It
+               may be set to "false" if the cluster load-balancer does not rely on
+               NodePorts.  If the caller requests specific NodePorts (by specifying a
+               value), those requests will be respected, regardless of this field.
+               This field may only be set for services with type LoadBalancer and will
+               be cleared if the type is changed to any other type.
+        :param pulumi.Input[_builtins.str] cluster_ip: clusterIP is the IP address of the service and is usually assigned
+               randomly. If an address is specified manually, is in-range (as per
+               system configuration), and is not in use, it will be allocated to the
+               service; otherwise creation of the service will fail. This field may not
+               be changed through updates unless the type field is also being changed
+               to ExternalName (which requires this field to be blank) or the type
+               field is being changed from ExternalName (in which case this field may
+               optionally be specified, as describe above).  Valid values are "None",
+               empty string (""), or a valid IP address. Setting this to "None" makes a
+               "headless service" (no virtual IP), which is useful when direct endpoint
+               connections are preferred and proxying is not required.  Only applies to
+               types ClusterIP, NodePort, and LoadBalancer. If this field is specified
+               when creating a Service of type ExternalName, creation will fail. This
+               field will be wiped when updating a Service to type ExternalName.
+               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] cluster_ips: ClusterIPs is a list of IP addresses assigned to this service, and are
+               usually assigned randomly.  If an address is specified manually, is
+               in-range (as per system configuration), and is not in use, it will be
+               allocated to the service; otherwise creation of the service will fail.
+               This field may not be changed through updates unless the type field is
+               also being changed to ExternalName (which requires this field to be
+               empty) or the type field is being changed from ExternalName (in which
+               case this field may optionally be specified, as describe above).  Valid
+               values are "None", empty string (""), or a valid IP address.  Setting
+               this to "None" makes a "headless service" (no virtual IP), which is
+               useful when direct endpoint connections are preferred and proxying is
+               not required.  Only applies to types ClusterIP, NodePort, and
+               LoadBalancer. If this field is specified when creating a Service of type
+               ExternalName, creation will fail. This field will be wiped when updating
+               a Service to type ExternalName.  If this field is not specified, it will
+               be initialized from the clusterIP field.  If this field is specified,
+               clients must ensure that clusterIPs[0] and clusterIP have the same
+               value.
+
+               This field may hold a maximum of two entries (dual-stack IPs, in either order).
+               These IPs must correspond to the values of the ipFamilies field. Both
+               clusterIPs and ipFamilies are governed by the ipFamilyPolicy field.
+               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] external_ips: externalIPs is a list of IP addresses for which nodes in the cluster
+               will also accept traffic for this service.  These IPs are not managed by
+               Kubernetes.  The user is responsible for ensuring that traffic arrives
+               at a node with this IP.  A common example is external load-balancers
+               that are not part of the Kubernetes system.
+        :param pulumi.Input[_builtins.str] external_name: externalName is the external reference that discovery mechanisms will
+               return as an alias for this service (e.g. a DNS CNAME record). No
+               proxying will be involved.  Must be a lowercase RFC-1123 hostname
+               (https://tools.ietf.org/html/rfc1123) and requires `type` to be "ExternalName".
+        :param pulumi.Input[_builtins.str] external_traffic_policy: externalTrafficPolicy describes how nodes distribute service traffic they
+               receive on one of the Service's "externally-facing" addresses (NodePorts,
+               ExternalIPs, and LoadBalancer IPs). If set to "Local", the proxy will configure
+               the service in a way that assumes that external load balancers will take care
+               of balancing the service traffic between nodes, and so each node will deliver
+               traffic only to the node-local endpoints of the service, without masquerading
+               the client source IP. (Traffic mistakenly sent to a node with no endpoints will
+               be dropped.) The default value, "Cluster", uses the standard behavior of
+               routing to all endpoints evenly (possibly modified by topology and other
+               features). Note that traffic sent to an External IP or LoadBalancer IP from
+               within the cluster will always get "Cluster" semantics, but clients sending to
+               a NodePort from within the cluster may need to take traffic policy into account
+               when picking a node.
+        :param pulumi.Input[_builtins.int] health_check_node_port: healthCheckNodePort specifies the healthcheck nodePort for the service.
+               This only applies when type is set to LoadBalancer and
+               externalTrafficPolicy is set to Local. If a value is specified, is
+               in-range, and is not in use, it will be used.  If not specified, a value
+               will be automatically allocated.  External systems (e.g. load-balancers)
+               can use this port to determine if a given node holds endpoints for this
+               service or not.  If this field is specified when creating a Service
+               which does not need it, creation will fail. This field will be wiped
+               when updating a Service to no longer need it (e.g. changing type).
+               This field cannot be updated once set.
+        :param pulumi.Input[_builtins.str] internal_traffic_policy: InternalTrafficPolicy describes how nodes distribute service traffic they
+               receive on the ClusterIP. If set to "Local", the proxy will assume that pods
+               only want to talk to endpoints of the service on the same node as the pod,
+               dropping the traffic if there are no local endpoints. The default value,
+               "Cluster", uses the standard behavior of routing to all endpoints evenly
+               (possibly modified by topology and other features).
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] ip_families: IPFamilies is a list of IP families (e.g. IPv4, IPv6) assigned to this
+               service. This field is usually assigned automatically based on cluster
+               configuration and the ipFamilyPolicy field. If this field is specified
+               manually, the requested family is available in the cluster,
+               and ipFamilyPolicy allows it, it will be used; otherwise creation of
+               the service will fail. This field is conditionally mutable: it allows
+               for adding or removing a secondary IP family, but it does not allow
+               changing the primary IP family of the Service. Valid values are "IPv4"
+               and "IPv6".  This field only applies to Services of types ClusterIP,
+               NodePort, and LoadBalancer, and does apply to "headless" services.
+               This field will be wiped when updating a Service to type ExternalName.
+
+               This field may hold a maximum of two entries (dual-stack families, in
+               either order).  These families must correspond to the values of the
+               clusterIPs field, if specified. Both clusterIPs and ipFamilies are
+               governed by the ipFamilyPolicy field.
+        :param pulumi.Input[_builtins.str] ip_family_policy: IPFamilyPolicy represents the dual-stack-ness requested or required by
+               this Service. If there is no value provided, then this field will be set
+               to SingleStack. Services can be "SingleStack" (a single IP family),
+               "PreferDualStack" (two IP families on dual-stack configured clusters or
+               a single IP family on single-stack clusters), or "RequireDualStack"
+               (two IP families on dual-stack configured clusters, otherwise fail). The
+               ipFamilies and clusterIPs fields depend on the value of this field. This
+               field will be wiped when updating a service to type ExternalName.
+        :param pulumi.Input[_builtins.str] load_balancer_class: loadBalancerClass is the class of the load balancer implementation this Service belongs to.
+               If specified, the value of this field must be a label-style identifier, with an optional prefix,
+               e.g. "internal-vip" or "example.com/internal-vip". Unprefixed names are reserved for end-users.
+               This field can only be set when the Service type is 'LoadBalancer'. If not set, the default load
+               balancer implementation is used, today this is typically done through the cloud provider integration,
+               but should apply for any default implementation. If set, it is assumed that a load balancer
+               implementation is watching for Services with a matching class. Any default load balancer
+               implementation (e.g. cloud providers) should ignore Services that set this field.
+               This field can only be set when creating or updating a Service to type 'LoadBalancer'.
+               Once set, it can not be changed. This field will be wiped when a service is updated to a non 'LoadBalancer' type.
+        :param pulumi.Input[_builtins.str] load_balancer_ip: Only applies to Service Type: LoadBalancer.
+               This feature depends on whether the underlying cloud-provider supports specifying
+               the loadBalancerIP when a load balancer is created.
+               This field will be ignored if the cloud-provider does not support the feature.
+               Deprecated: This field was under-specified and its meaning varies across implementations.
+               Using it is non-portable and it may not support dual-stack.
+               Users are encouraged to use implementation-specific annotations when available.
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] load_balancer_source_ranges: If specified and supported by the platform, this will restrict traffic through the cloud-provider
+               load-balancer will be restricted to the specified client IPs. This field will be ignored if the
+               cloud-provider does not support the feature."
+               More info: https://kubernetes.io/docs/tasks/access-application-cluster/create-external-load-balancer/
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceSpecPortsArgs']]] ports: The list of ports that are exposed by this service.
+               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+        :param pulumi.Input[_builtins.bool] publish_not_ready_addresses: publishNotReadyAddresses indicates that any agent which deals with endpoints for this
+               Service should disregard any indications of ready/not-ready.
+               The primary use case for setting this field is for a StatefulSet's Headless Service to
+               propagate SRV DNS records for its Pods for the purpose of peer discovery.
+               The Kubernetes controllers that generate Endpoints and EndpointSlice resources for
+               Services interpret this to mean that all endpoints are considered "ready" even if the
+               Pods themselves are not. Agents which consume only Kubernetes generated endpoints
+               through the Endpoints or EndpointSlice resources can safely assume this behavior.
+        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] selector: Route service traffic to pods with label keys and values matching this
+               selector. If empty or not present, the service is assumed to have an
+               external process managing its endpoints, which Kubernetes will not
+               modify. Only applies to types ClusterIP, NodePort, and LoadBalancer.
+               Ignored if type is ExternalName.
+               More info: https://kubernetes.io/docs/concepts/services-networking/service/
+        :param pulumi.Input[_builtins.str] session_affinity: Supports "ClientIP" and "None". Used to maintain session affinity.
+               Enable client IP based session affinity.
+               Must be ClientIP or None.
+               Defaults to None.
+               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+        :param pulumi.Input[_builtins.str] traffic_distribution: TrafficDistribution offers a way to express preferences for how traffic is
+               distributed to Service endpoints. Implementations can use this field as a
+               hint, but are not required to guarantee strict adherence. If the field is
+               not set, the implementation will apply its default routing strategy. If set
+               to "PreferClose", implementations should prioritize endpoints that are
+               topologically close (e.g., same zone).
+               This is a beta field and requires enabling ServiceTrafficDistribution feature.
+        :param pulumi.Input[_builtins.str] type: type determines how the Service is exposed. Defaults to ClusterIP. Valid
+               options are ExternalName, ClusterIP, NodePort, and LoadBalancer.
+               "ClusterIP" allocates a cluster-internal IP address for load-balancing
+               to endpoints. Endpoints are determined by the selector or if that is not
+               specified, by manual construction of an Endpoints object or
+               EndpointSlice objects. If clusterIP is "None", no virtual IP is
+               allocated and the endpoints are published as a set of endpoints rather
+               than a virtual IP.
+               "NodePort" builds on ClusterIP and allocates a port on every node which
+               routes to the same endpoints as the clusterIP.
+               "LoadBalancer" builds on NodePort and creates an external load-balancer
+               (if supported in the current cloud) which routes to the same endpoints
+               as the clusterIP.
+               "ExternalName" aliases this service to the specified externalName.
+               Several other fields do not apply to ExternalName services.
+               More info: https://kubernetes.io/docs/concepts/services-networking/service/#publishing-services-service-types
+        """
+        if allocate_load_balancer_node_ports is not None:
+            pulumi.set(__self__, "allocate_load_balancer_node_ports", allocate_load_balancer_node_ports)
+        if cluster_ip is not None:
+            pulumi.set(__self__, "cluster_ip", cluster_ip)
+        if cluster_ips is not None:
+            pulumi.set(__self__, "cluster_ips", cluster_ips)
+        if external_ips is not None:
+            pulumi.set(__self__, "external_ips", external_ips)
+        if external_name is not None:
+            pulumi.set(__self__, "external_name", external_name)
+        if external_traffic_policy is not None:
+            pulumi.set(__self__, "external_traffic_policy", external_traffic_policy)
+        if health_check_node_port is not None:
+            pulumi.set(__self__, "health_check_node_port", health_check_node_port)
+        if internal_traffic_policy is not None:
+            pulumi.set(__self__, "internal_traffic_policy", internal_traffic_policy)
+        if ip_families is not None:
+            pulumi.set(__self__, "ip_families", ip_families)
+        if ip_family_policy is not None:
+            pulumi.set(__self__, "ip_family_policy", ip_family_policy)
+        if load_balancer_class is not None:
+            pulumi.set(__self__, "load_balancer_class", load_balancer_class)
+        if load_balancer_ip is not None:
+            pulumi.set(__self__, "load_balancer_ip", load_balancer_ip)
+        if load_balancer_source_ranges is not None:
+            pulumi.set(__self__, "load_balancer_source_ranges", load_balancer_source_ranges)
+        if ports is not None:
+            pulumi.set(__self__, "ports", ports)
+        if publish_not_ready_addresses is not None:
+            pulumi.set(__self__, "publish_not_ready_addresses", publish_not_ready_addresses)
+        if selector is not None:
+            pulumi.set(__self__, "selector", selector)
+        if session_affinity is not None:
+            pulumi.set(__self__, "session_affinity", session_affinity)
+        if session_affinity_config is not None:
+            pulumi.set(__self__, "session_affinity_config", session_affinity_config)
+        if traffic_distribution is not None:
+            pulumi.set(__self__, "traffic_distribution", traffic_distribution)
+        if type is not None:
+            pulumi.set(__self__, "type", type)
+
+    @_builtins.property
+    @pulumi.getter(name="allocateLoadBalancerNodePorts")
+    def allocate_load_balancer_node_ports(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        allocateLoadBalancerNodePorts defines if NodePorts will be automatically
+        allocated for services with type LoadBalancer.  Default is "true". It
+        may be set to "false" if the cluster load-balancer does not rely on
+        NodePorts.  If the caller requests specific NodePorts (by specifying a
+        value), those requests will be respected, regardless of this field.
+        This field may only be set for services with type LoadBalancer and will
+        be cleared if the type is changed to any other type.
+        """
+        return pulumi.get(self, "allocate_load_balancer_node_ports")
+
+    @allocate_load_balancer_node_ports.setter
+    def allocate_load_balancer_node_ports(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "allocate_load_balancer_node_ports", value)
+
+    @_builtins.property
+    @pulumi.getter(name="clusterIP")
+    def cluster_ip(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        clusterIP is the IP address of the service and is usually assigned
+        randomly. If an address is specified manually, is in-range (as per
+        system configuration), and is not in use, it will be allocated to the
+        service; otherwise creation of the service will fail. This field may not
+        be changed through updates unless the type field is also being changed
+        to ExternalName (which requires this field to be blank) or the type
+        field is being changed from ExternalName (in which case this field may
+        optionally be specified, as describe above).  Valid values are "None",
+        empty string (""), or a valid IP address. Setting this to "None" makes a
+        "headless service" (no virtual IP), which is useful when direct endpoint
+        connections are preferred and proxying is not required.  Only applies to
+        types ClusterIP, NodePort, and LoadBalancer. If this field is specified
+        when creating a Service of type ExternalName, creation will fail. This
+        field will be wiped when updating a Service to type ExternalName.
+        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+        """
+        return pulumi.get(self, "cluster_ip")
+
+    @cluster_ip.setter
+    def cluster_ip(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "cluster_ip", value)
+
+    @_builtins.property
+    @pulumi.getter(name="clusterIPs")
+    def cluster_ips(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        ClusterIPs is a list of IP addresses assigned to this service, and are
+        usually assigned randomly.  If an address is specified manually, is
+        in-range (as per system configuration), and is not in use, it will be
+        allocated to the service; otherwise creation of the service will fail.
+        This field may not be changed through updates unless the type field is
+        also being changed to ExternalName (which requires this field to be
+        empty) or the type field is being changed from ExternalName (in which
+        case this field may optionally be specified, as describe above).  Valid
+        values are "None", empty string (""), or a valid IP address.  Setting
+        this to "None" makes a "headless service" (no virtual IP), which is
+        useful when direct endpoint connections are preferred and proxying is
+        not required.  Only applies to types ClusterIP, NodePort, and
+        LoadBalancer. If this field is specified when creating a Service of type
+        ExternalName, creation will fail. This field will be wiped when updating
+        a Service to type ExternalName.  If this field is not specified, it will
+        be initialized from the clusterIP field.  If this field is specified,
+        clients must ensure that clusterIPs[0] and clusterIP have the same
+        value.
+
+        This field may hold a maximum of two entries (dual-stack IPs, in either order).
+        These IPs must correspond to the values of the ipFamilies field. Both
+        clusterIPs and ipFamilies are governed by the ipFamilyPolicy field.
+        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+        """
+        return pulumi.get(self, "cluster_ips")
+
+    @cluster_ips.setter
+    def cluster_ips(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "cluster_ips", value)
+
+    @_builtins.property
+    @pulumi.getter(name="externalIPs")
+    def external_ips(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        externalIPs is a list of IP addresses for which nodes in the cluster
+        will also accept traffic for this service.  These IPs are not managed by
+        Kubernetes.  The user is responsible for ensuring that traffic arrives
+        at a node with this IP.  A common example is external load-balancers
+        that are not part of the Kubernetes system.
+        """
+        return pulumi.get(self, "external_ips")
+
+    @external_ips.setter
+    def external_ips(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "external_ips", value)
+
+    @_builtins.property
+    @pulumi.getter(name="externalName")
+    def external_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        externalName is the external reference that discovery mechanisms will
+        return as an alias for this service (e.g. a DNS CNAME record). No
+        proxying will be involved.  Must be a lowercase RFC-1123 hostname
+        (https://tools.ietf.org/html/rfc1123) and requires `type` to be "ExternalName".
+        """
+        return pulumi.get(self, "external_name")
+
+    @external_name.setter
+    def external_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "external_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="externalTrafficPolicy")
+    def external_traffic_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        externalTrafficPolicy describes how nodes distribute service traffic they
+        receive on one of the Service's "externally-facing" addresses (NodePorts,
+        ExternalIPs, and LoadBalancer IPs). If set to "Local", the proxy will configure
+        the service in a way that assumes that external load balancers will take care
+        of balancing the service traffic between nodes, and so each node will deliver
+        traffic only to the node-local endpoints of the service, without masquerading
+        the client source IP. (Traffic mistakenly sent to a node with no endpoints will
+        be dropped.) The default value, "Cluster", uses the standard behavior of
+        routing to all endpoints evenly (possibly modified by topology and other
+        features). Note that traffic sent to an External IP or LoadBalancer IP from
+        within the cluster will always get "Cluster" semantics, but clients sending to
+        a NodePort from within the cluster may need to take traffic policy into account
+        when picking a node.
+        """
+        return pulumi.get(self, "external_traffic_policy")
+
+    @external_traffic_policy.setter
+    def external_traffic_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "external_traffic_policy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="healthCheckNodePort")
+    def health_check_node_port(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        healthCheckNodePort specifies the healthcheck nodePort for the service.
+        This only applies when type is set to LoadBalancer and
+        externalTrafficPolicy is set to Local. If a value is specified, is
+        in-range, and is not in use, it will be used.  If not specified, a value
+        will be automatically allocated.  External systems (e.g. load-balancers)
+        can use this port to determine if a given node holds endpoints for this
+        service or not.  If this field is specified when creating a Service
+        which does not need it, creation will fail. This field will be wiped
+        when updating a Service to no longer need it (e.g. changing type).
+        This field cannot be updated once set.
+        """
+        return pulumi.get(self, "health_check_node_port")
+
+    @health_check_node_port.setter
+    def health_check_node_port(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "health_check_node_port", value)
+
+    @_builtins.property
+    @pulumi.getter(name="internalTrafficPolicy")
+    def internal_traffic_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        InternalTrafficPolicy describes how nodes distribute service traffic they
+        receive on the ClusterIP. If set to "Local", the proxy will assume that pods
+        only want to talk to endpoints of the service on the same node as the pod,
+        dropping the traffic if there are no local endpoints. The default value,
+        "Cluster", uses the standard behavior of routing to all endpoints evenly
+        (possibly modified by topology and other features).
+        """
+        return pulumi.get(self, "internal_traffic_policy")
+
+    @internal_traffic_policy.setter
+    def internal_traffic_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "internal_traffic_policy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="ipFamilies")
+    def ip_families(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        IPFamilies is a list of IP families (e.g. IPv4, IPv6) assigned to this
+        service. This field is usually assigned automatically based on cluster
+        configuration and the ipFamilyPolicy field. If this field is specified
+        manually, the requested family is available in the cluster,
+        and ipFamilyPolicy allows it, it will be used; otherwise creation of
+        the service will fail. This field is conditionally mutable: it allows
+        for adding or removing a secondary IP family, but it does not allow
+        changing the primary IP family of the Service. Valid values are "IPv4"
+        and "IPv6".  This field only applies to Services of types ClusterIP,
+        NodePort, and LoadBalancer, and does apply to "headless" services.
+        This field will be wiped when updating a Service to type ExternalName.
+
+        This field may hold a maximum of two entries (dual-stack families, in
+        either order).  These families must correspond to the values of the
+        clusterIPs field, if specified. Both clusterIPs and ipFamilies are
+        governed by the ipFamilyPolicy field.
+        """
+        return pulumi.get(self, "ip_families")
+
+    @ip_families.setter
+    def ip_families(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "ip_families", value)
+
+    @_builtins.property
+    @pulumi.getter(name="ipFamilyPolicy")
+    def ip_family_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        IPFamilyPolicy represents the dual-stack-ness requested or required by
+        this Service. If there is no value provided, then this field will be set
+        to SingleStack. Services can be "SingleStack" (a single IP family),
+        "PreferDualStack" (two IP families on dual-stack configured clusters or
+        a single IP family on single-stack clusters), or "RequireDualStack"
+        (two IP families on dual-stack configured clusters, otherwise fail). The
+        ipFamilies and clusterIPs fields depend on the value of this field. This
+        field will be wiped when updating a service to type ExternalName.
+        """
+        return pulumi.get(self, "ip_family_policy")
+
+    @ip_family_policy.setter
+    def ip_family_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "ip_family_policy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="loadBalancerClass")
+    def load_balancer_class(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        loadBalancerClass is the class of the load balancer implementation this Service belongs to.
+        If specified, the value of this field must be a label-style identifier, with an optional prefix,
+        e.g. "internal-vip" or "example.com/internal-vip". Unprefixed names are reserved for end-users.
+        This field can only be set when the Service type is 'LoadBalancer'. If not set, the default load
+        balancer implementation is used, today this is typically done through the cloud provider integration,
+        but should apply for any default implementation. If set, it is assumed that a load balancer
+        implementation is watching for Services with a matching class. Any default load balancer
+        implementation (e.g. cloud providers) should ignore Services that set this field.
+        This field can only be set when creating or updating a Service to type 'LoadBalancer'.
+        Once set, it can not be changed. This field will be wiped when a service is updated to a non 'LoadBalancer' type.
+        """
+        return pulumi.get(self, "load_balancer_class")
+
+    @load_balancer_class.setter
+    def load_balancer_class(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "load_balancer_class", value)
+
+    @_builtins.property
+    @pulumi.getter(name="loadBalancerIP")
+    def load_balancer_ip(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Only applies to Service Type: LoadBalancer.
+        This feature depends on whether the underlying cloud-provider supports specifying
+        the loadBalancerIP when a load balancer is created.
+        This field will be ignored if the cloud-provider does not support the feature.
+        Deprecated: This field was under-specified and its meaning varies across implementations.
+        Using it is non-portable and it may not support dual-stack.
+        Users are encouraged to use implementation-specific annotations when available.
+        """
+        return pulumi.get(self, "load_balancer_ip")
+
+    @load_balancer_ip.setter
+    def load_balancer_ip(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "load_balancer_ip", value)
+
+    @_builtins.property
+    @pulumi.getter(name="loadBalancerSourceRanges")
+    def load_balancer_source_ranges(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        If specified and supported by the platform, this will restrict traffic through the cloud-provider
+        load-balancer will be restricted to the specified client IPs. This field will be ignored if the
+        cloud-provider does not support the feature."
+        More info: https://kubernetes.io/docs/tasks/access-application-cluster/create-external-load-balancer/
+        """
+        return pulumi.get(self, "load_balancer_source_ranges")
+
+    @load_balancer_source_ranges.setter
+    def load_balancer_source_ranges(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "load_balancer_source_ranges", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def ports(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceSpecPortsArgs']]]]:
+        """
+        The list of ports that are exposed by this service.
+        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+        """
+        return pulumi.get(self, "ports")
+
+    @ports.setter
+    def ports(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceSpecPortsArgs']]]]):
+        pulumi.set(self, "ports", value)
+
+    @_builtins.property
+    @pulumi.getter(name="publishNotReadyAddresses")
+    def publish_not_ready_addresses(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        publishNotReadyAddresses indicates that any agent which deals with endpoints for this
+        Service should disregard any indications of ready/not-ready.
+        The primary use case for setting this field is for a StatefulSet's Headless Service to
+        propagate SRV DNS records for its Pods for the purpose of peer discovery.
+        The Kubernetes controllers that generate Endpoints and EndpointSlice resources for
+        Services interpret this to mean that all endpoints are considered "ready" even if the
+        Pods themselves are not. Agents which consume only Kubernetes generated endpoints
+        through the Endpoints or EndpointSlice resources can safely assume this behavior.
+        """
+        return pulumi.get(self, "publish_not_ready_addresses")
+
+    @publish_not_ready_addresses.setter
+    def publish_not_ready_addresses(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "publish_not_ready_addresses", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def selector(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        """
+        Route service traffic to pods with label keys and values matching this
+        selector. If empty or not present, the service is assumed to have an
+        external process managing its endpoints, which Kubernetes will not
+        modify. Only applies to types ClusterIP, NodePort, and LoadBalancer.
+        Ignored if type is ExternalName.
+        More info: https://kubernetes.io/docs/concepts/services-networking/service/
+        """
+        return pulumi.get(self, "selector")
+
+    @selector.setter
+    def selector(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "selector", value)
+
+    @_builtins.property
+    @pulumi.getter(name="sessionAffinity")
+    def session_affinity(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Supports "ClientIP" and "None". Used to maintain session affinity.
+        Enable client IP based session affinity.
+        Must be ClientIP or None.
+        Defaults to None.
+        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+        """
+        return pulumi.get(self, "session_affinity")
+
+    @session_affinity.setter
+    def session_affinity(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "session_affinity", value)
+
+    @_builtins.property
+    @pulumi.getter(name="sessionAffinityConfig")
+    def session_affinity_config(self) -> pulumi.Input[Optional['_inputs.SparkConnectSpecServerServiceSpecSessionAffinityConfigArgs']]:
+        return pulumi.get(self, "session_affinity_config")
+
+    @session_affinity_config.setter
+    def session_affinity_config(self, value: pulumi.Input[Optional['_inputs.SparkConnectSpecServerServiceSpecSessionAffinityConfigArgs']]):
+        pulumi.set(self, "session_affinity_config", value)
+
+    @_builtins.property
+    @pulumi.getter(name="trafficDistribution")
+    def traffic_distribution(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        TrafficDistribution offers a way to express preferences for how traffic is
+        distributed to Service endpoints. Implementations can use this field as a
+        hint, but are not required to guarantee strict adherence. If the field is
+        not set, the implementation will apply its default routing strategy. If set
+        to "PreferClose", implementations should prioritize endpoints that are
+        topologically close (e.g., same zone).
+        This is a beta field and requires enabling ServiceTrafficDistribution feature.
+        """
+        return pulumi.get(self, "traffic_distribution")
+
+    @traffic_distribution.setter
+    def traffic_distribution(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "traffic_distribution", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        type determines how the Service is exposed. Defaults to ClusterIP. Valid
+        options are ExternalName, ClusterIP, NodePort, and LoadBalancer.
+        "ClusterIP" allocates a cluster-internal IP address for load-balancing
+        to endpoints. Endpoints are determined by the selector or if that is not
+        specified, by manual construction of an Endpoints object or
+        EndpointSlice objects. If clusterIP is "None", no virtual IP is
+        allocated and the endpoints are published as a set of endpoints rather
+        than a virtual IP.
+        "NodePort" builds on ClusterIP and allocates a port on every node which
+        routes to the same endpoints as the clusterIP.
+        "LoadBalancer" builds on NodePort and creates an external load-balancer
+        (if supported in the current cloud) which routes to the same endpoints
+        as the clusterIP.
+        "ExternalName" aliases this service to the specified externalName.
+        Several other fields do not apply to ExternalName services.
+        More info: https://kubernetes.io/docs/concepts/services-networking/service/#publishing-services-service-types
+        """
+        return pulumi.get(self, "type")
+
+    @type.setter
+    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "type", value)
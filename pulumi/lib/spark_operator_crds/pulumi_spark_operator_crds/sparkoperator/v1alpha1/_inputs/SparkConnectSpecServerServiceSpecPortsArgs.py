@@ -0,0 +1,255 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['SparkConnectSpecServerServiceSpecPortsArgsDict', 'SparkConnectSpecServerServiceSpecPortsArgs']
+
+class SparkConnectSpecServerServiceSpecPortsArgsDict(TypedDict):
+    """
+    ServicePort contains information on service's port.
+    """
+    app_protocol: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    The application protocol for this port.
+    This is used as a hint for implementations to offer richer behavior for protocols that they understand.
+    This field follows standard Kubernetes label syntax.
+    Valid values are either:
+
+    * Un-prefixed protocol names - reserved for IANA standard service names (as per
+    RFC-6335 and https://www.iana.org/assignments/service-names).
+
+    * Kubernetes-defined prefixed names:
+      * 'kubernetes.io/h2c' - HTTP/2 prior knowledge over cleartext as described in https://www.rfc-editor.org/rfc/rfc9113.html#name-starting-http-2-with-prior-
+      * 'kubernetes.io/ws'  - WebSocket over cleartext as described in https://www.rfc-editor.org/rfc/rfc6455
+      * 'kubernetes.io/wss' - WebSocket over TLS as described in https://www.rfc-editor.org/rfc/rfc6455
+
+    * Other protocols should use implementation-defined prefixed names such as
+    mycompany.com/my-custom-protocol.
+    """
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    The name of this port within the service. This must be a DNS_LABEL.
+    All ports within a ServiceSpec must have unique names. When considering
+    the endpoints for a Service, this must match the 'name' field in the
+    EndpointPort.
+    Optional if only one ServicePort is defined on this service.
+    """
+    node_port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    The port on each node on which this service is exposed when type is
+    NodePort or LoadBalancer.  Usually assigned by the system. If a value is
+    specified, in-range, and not in use it will be used, otherwise the
+    operation will fail.  If not specified, a port will be allocated if this
+    Service requires one.  If this field is specified when creating a
+    Service which does not need it, creation will fail. This field will be
+    wiped when updating a Service to no longer need it (e.g. changing type
+    from NodePort to ClusterIP).
+    More info: https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport
+    """
+    port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    The port that will be exposed by this service.
+    """
+    protocol: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    The IP protocol for this port. Supports "TCP", "UDP", and "SCTP".
+    Default is TCP.
+    """
+    target_port: NotRequired[pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]]
+    """
+    Number or name of the port to access on the pods targeted by the service.
+    Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME.
+    If this is a string, it will be looked up as a named port in the
+    target Pod's container ports. If this is not specified, the value
+    of the 'port' field is used (an identity map).
+    This field is ignored for services with clusterIP=None, and should be
+    omitted or set equal to the 'port' field.
+    More info: https://kubernetes.io/docs/concepts/services-networking/service/#defining-a-service
+    """
+
+
+@pulumi.input_type
+class SparkConnectSpecServerServiceSpecPortsArgs:
+    def __init__(__self__, *,
+                 app_protocol: pulumi.Input[Optional[_builtins.str]] = None,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 node_port: pulumi.Input[Optional[_builtins.int]] = None,
+                 port: pulumi.Input[Optional[_builtins.int]] = None,
+                 protocol: pulumi.Input[Optional[_builtins.str]] = None,
+                 target_port: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]] = None):
+        """
+        ServicePort contains information on service's port.
+
+        :param pulumi.Input[_builtins.str] app_protocol: The application protocol for this port.
+               This is used as a hint for implementations to offer richer behavior for protocols that they understand.
+               This field follows standard Kubernetes label syntax.
+               Valid values are either:
+
+               * Un-prefixed protocol names - reserved for IANA standard service names (as per
+               RFC-6335 and https://www.iana.org/assignments/service-names).
+
+               * Kubernetes-defined prefixed names:
+                 * 'kubernetes.io/h2c' - HTTP/2 prior knowledge over cleartext as described in https://www.rfc-editor.org/rfc/rfc9113.html#name-starting-http-2-with-prior-
+                 * 'kubernetes.io/ws'  - WebSocket over cleartext as described in https://www.rfc-editor.org/rfc/rfc6455
+                 * 'kubernetes.io/wss' - WebSocket over TLS as described in https://www.rfc-editor.org/rfc/rfc6455
+
+               * Other protocols should use implementation-defined prefixed names such as
+               mycompany.com/my-custom-protocol.
+        :param pulumi.Input[_builtins.str] name: The name of this port within the service. This must be a DNS_LABEL.
+               All ports within a ServiceSpec must have unique names. When considering
+               the endpoints for a Service, this must match the 'name' field in the
+               EndpointPort.
+               Optional if only one ServicePort is defined on this service.
+        :param pulumi.Input[_builtins.int] node_port: The port on each node on which this service is exposed when type is
+               NodePort or LoadBalancer.  Usually assigned by the system. If a value is
+               specified, in-range, and not in use it will be used, otherwise the
+               operation will fail.  If not specified, a port will be allocated if this
+               Service requires one.  If this field is specified when creating a
+               Service which does not need it, creation will fail. This field will be
+               wiped when updating a Service to no longer need it (e.g. changing type
+               from NodePort to ClusterIP).
+               More info: https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport
+        :param pulumi.Input[_builtins.int] port: The port that will be exposed by this service.
+        :param pulumi.Input[_builtins.str] protocol: The IP protocol for this port. Supports "TCP", "UDP", and "SCTP".
+               Default is TCP.
+        :param pulumi.Input[Union[_builtins.int, _builtins.str]] target_port: Number or name of the port to access on the pods targeted by the service.
+               Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME.
+               If this is a string, it will be looked up as a named port in the
+               target Pod's container ports. If this is not specified, the value
+               of the 'port' field is used (an identity map).
+               This field is ignored for services with clusterIP=None, and should be
+               omitted or set equal to the 'port' field.
+               More info: https://kubernetes.io/docs/concepts/services-networking/service/#defining-a-service
+        """
+        if app_protocol is not None:
+            pulumi.set(__self__, "app_protocol", app_protocol)
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if node_port is not None:
+            pulumi.set(__self__, "node_port", node_port)
+        if port is not None:
+            pulumi.set(__self__, "port", port)
+        if protocol is not None:
+            pulumi.set(__self__, "protocol", protocol)
+        if target_port is not None:
+            pulumi.set(__self__, "target_port", target_port)
+
+    @_builtins.property
+    @pulumi.getter(name="appProtocol")
+    def app_protocol(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        The application protocol for this port.
+        This is used as a hint for implementations to offer richer behavior for protocols that they understand.
+        This field follows standard Kubernetes label syntax.
+        Valid values are either:
+
+        * Un-prefixed protocol names - reserved for IANA standard service names (as per
+        RFC-6335 and https://www.iana.org/assignments/service-names).
+
+        * Kubernetes-defined prefixed names:
+          * 'kubernetes.io/h2c' - HTTP/2 prior knowledge over cleartext as described in https://www.rfc-editor.org/rfc/rfc9113.html#name-starting-http-2-with-prior-
+          * 'kubernetes.io/ws'  - WebSocket over cleartext as described in https://www.rfc-editor.org/rfc/rfc6455
+          * 'kubernetes.io/wss' - WebSocket over TLS as described in https://www.rfc-editor.org/rfc/rfc6455
+
+        * Other protocols should use implementation-defined prefixed names such as
+        mycompany.com/my-custom-protocol.
+        """
+        return pulumi.get(self, "app_protocol")
+
+    @app_protocol.setter
+    def app_protocol(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "app_protocol", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        The name of this port within the service. This must be a DNS_LABEL.
+        All ports within a ServiceSpec must have unique names. When considering
+        the endpoints for a Service, this must match the 'name' field in the
+        EndpointPort.
+        Optional if only one ServicePort is defined on this service.
+        """
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="nodePort")
+    def node_port(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        The port on each node on which this service is exposed when type is
+        NodePort or LoadBalancer.  Usually assigned by the system. If a value is
+        specified, in-range, and not in use it will be used, otherwise the
+        operation will fail.  If not specified, a port will be allocated if this
+        Service requires one.  If this field is specified when creating a
+        Service which does not need it, creation will fail. This field will be
+        wiped when updating a Service to no longer need it (e.g. changing type
+        from NodePort to ClusterIP).
+        More info: https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport
+        """
+        return pulumi.get(self, "node_port")
+
+    @node_port.setter
+    def node_port(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "node_port", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def port(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        The port that will be exposed by this service.
+        """
+        return pulumi.get(self, "port")
+
+    @port.setter
+    def port(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "port", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def protocol(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        The IP protocol for this port. Supports "TCP", "UDP", and "SCTP".
+        Default is TCP.
+        """
+        return pulumi.get(self, "protocol")
+
+    @protocol.setter
+    def protocol(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "protocol", value)
+
+    @_builtins.property
+    @pulumi.getter(name="targetPort")
+    def target_port(self) -> pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]:
+        """
+        Number or name of the port to access on the pods targeted by the service.
+        Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME.
+        If this is a string, it will be looked up as a named port in the
+        target Pod's container ports. If this is not specified, the value
+        of the 'port' field is used (an identity map).
+        This field is ignored for services with clusterIP=None, and should be
+        omitted or set equal to the 'port' field.
+        More info: https://kubernetes.io/docs/concepts/services-networking/service/#defining-a-service
+        """
+        return pulumi.get(self, "target_port")
+
+    @target_port.setter
+    def target_port(self, value: pulumi.Input[Optional[Union[_builtins.int, _builtins.str]]]):
+        pulumi.set(self, "target_port", value)
@@ -0,0 +1,45 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['SparkConnectSpecServerServiceSpecSessionAffinityConfigArgsDict', 'SparkConnectSpecServerServiceSpecSessionAffinityConfigArgs']
+
+class SparkConnectSpecServerServiceSpecSessionAffinityConfigArgsDict(TypedDict):
+    """
+    sessionAffinityConfig contains the configurations of session affinity.
+    """
+    client_ip: NotRequired[pulumi.Input[Optional['_inputs.SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgs']]]
+
+
+@pulumi.input_type
+class SparkConnectSpecServerServiceSpecSessionAffinityConfigArgs:
+    def __init__(__self__, *,
+                 client_ip: pulumi.Input[Optional['_inputs.SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgs']] = None):
+        """
+        sessionAffinityConfig contains the configurations of session affinity.
+        """
+        if client_ip is not None:
+            pulumi.set(__self__, "client_ip", client_ip)
+
+    @_builtins.property
+    @pulumi.getter(name="clientIP")
+    def client_ip(self) -> pulumi.Input[Optional['_inputs.SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgs']]:
+        return pulumi.get(self, "client_ip")
+
+    @client_ip.setter
+    def client_ip(self, value: pulumi.Input[Optional['_inputs.SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgs']]):
+        pulumi.set(self, "client_ip", value)
@@ -0,0 +1,59 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgsDict', 'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgs']
+
+class SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgsDict(TypedDict):
+    """
+    clientIP contains the configurations of Client IP based session affinity.
+    """
+    timeout_seconds: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    timeoutSeconds specifies the seconds of ClientIP type session sticky time.
+    The value must be >0 && <=86400(for 1 day) if ServiceAffinity == "ClientIP".
+    Default value is 10800(for 3 hours).
+    """
+
+
+@pulumi.input_type
+class SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgs:
+    def __init__(__self__, *,
+                 timeout_seconds: pulumi.Input[Optional[_builtins.int]] = None):
+        """
+        clientIP contains the configurations of Client IP based session affinity.
+
+        :param pulumi.Input[_builtins.int] timeout_seconds: timeoutSeconds specifies the seconds of ClientIP type session sticky time.
+               The value must be >0 && <=86400(for 1 day) if ServiceAffinity == "ClientIP".
+               Default value is 10800(for 3 hours).
+        """
+        if timeout_seconds is not None:
+            pulumi.set(__self__, "timeout_seconds", timeout_seconds)
+
+    @_builtins.property
+    @pulumi.getter(name="timeoutSeconds")
+    def timeout_seconds(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        timeoutSeconds specifies the seconds of ClientIP type session sticky time.
+        The value must be >0 && <=86400(for 1 day) if ServiceAffinity == "ClientIP".
+        Default value is 10800(for 3 hours).
+        """
+        return pulumi.get(self, "timeout_seconds")
+
+    @timeout_seconds.setter
+    def timeout_seconds(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "timeout_seconds", value)
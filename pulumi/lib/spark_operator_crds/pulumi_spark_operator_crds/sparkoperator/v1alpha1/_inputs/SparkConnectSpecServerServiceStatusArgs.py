@@ -0,0 +1,72 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['SparkConnectSpecServerServiceStatusArgsDict', 'SparkConnectSpecServerServiceStatusArgs']
+
+class SparkConnectSpecServerServiceStatusArgsDict(TypedDict):
+    """
+    Most recently observed status of the service.
+    Populated by the system.
+    Read-only.
+    More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
+    """
+    conditions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceStatusConditionsArgs']]]]]
+    """
+    Current service state
+    """
+    load_balancer: NotRequired[pulumi.Input[Optional['_inputs.SparkConnectSpecServerServiceStatusLoadBalancerArgs']]]
+
+
+@pulumi.input_type
+class SparkConnectSpecServerServiceStatusArgs:
+    def __init__(__self__, *,
+                 conditions: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceStatusConditionsArgs']]]] = None,
+                 load_balancer: pulumi.Input[Optional['_inputs.SparkConnectSpecServerServiceStatusLoadBalancerArgs']] = None):
+        """
+        Most recently observed status of the service.
+        Populated by the system.
+        Read-only.
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
+
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceStatusConditionsArgs']]] conditions: Current service state
+        """
+        if conditions is not None:
+            pulumi.set(__self__, "conditions", conditions)
+        if load_balancer is not None:
+            pulumi.set(__self__, "load_balancer", load_balancer)
+
+    @_builtins.property
+    @pulumi.getter
+    def conditions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceStatusConditionsArgs']]]]:
+        """
+        Current service state
+        """
+        return pulumi.get(self, "conditions")
+
+    @conditions.setter
+    def conditions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceStatusConditionsArgs']]]]):
+        pulumi.set(self, "conditions", value)
+
+    @_builtins.property
+    @pulumi.getter(name="loadBalancer")
+    def load_balancer(self) -> pulumi.Input[Optional['_inputs.SparkConnectSpecServerServiceStatusLoadBalancerArgs']]:
+        return pulumi.get(self, "load_balancer")
+
+    @load_balancer.setter
+    def load_balancer(self, value: pulumi.Input[Optional['_inputs.SparkConnectSpecServerServiceStatusLoadBalancerArgs']]):
+        pulumi.set(self, "load_balancer", value)
@@ -0,0 +1,58 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['SparkConnectSpecServerServiceStatusLoadBalancerArgsDict', 'SparkConnectSpecServerServiceStatusLoadBalancerArgs']
+
+class SparkConnectSpecServerServiceStatusLoadBalancerArgsDict(TypedDict):
+    """
+    LoadBalancer contains the current status of the load-balancer,
+    if one is present.
+    """
+    ingress: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs']]]]]
+    """
+    Ingress is a list containing ingress points for the load-balancer.
+    Traffic intended for the service should be sent to these ingress points.
+    """
+
+
+@pulumi.input_type
+class SparkConnectSpecServerServiceStatusLoadBalancerArgs:
+    def __init__(__self__, *,
+                 ingress: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs']]]] = None):
+        """
+        LoadBalancer contains the current status of the load-balancer,
+        if one is present.
+
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs']]] ingress: Ingress is a list containing ingress points for the load-balancer.
+               Traffic intended for the service should be sent to these ingress points.
+        """
+        if ingress is not None:
+            pulumi.set(__self__, "ingress", ingress)
+
+    @_builtins.property
+    @pulumi.getter
+    def ingress(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs']]]]:
+        """
+        Ingress is a list containing ingress points for the load-balancer.
+        Traffic intended for the service should be sent to these ingress points.
+        """
+        return pulumi.get(self, "ingress")
+
+    @ingress.setter
+    def ingress(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs']]]]):
+        pulumi.set(self, "ingress", value)
@@ -0,0 +1,139 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['SparkConnectSpecServerServiceStatusLoadBalancerIngressArgsDict', 'SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs']
+
+class SparkConnectSpecServerServiceStatusLoadBalancerIngressArgsDict(TypedDict):
+    """
+    LoadBalancerIngress represents the status of a load-balancer ingress point:
+    traffic intended for the service should be sent to an ingress point.
+    """
+    hostname: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Hostname is set for load-balancer ingress points that are DNS based
+    (typically AWS load-balancers)
+    """
+    ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    IP is set for load-balancer ingress points that are IP based
+    (typically GCE or OpenStack load-balancers)
+    """
+    ip_mode: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    IPMode specifies how the load-balancer IP behaves, and may only be specified when the ip field is specified.
+    Setting this to "VIP" indicates that traffic is delivered to the node with
+    the destination set to the load-balancer's IP and port.
+    Setting this to "Proxy" indicates that traffic is delivered to the node or pod with
+    the destination set to the node's IP and node port or the pod's IP and port.
+    Service implementations may use this information to adjust traffic routing.
+    """
+    ports: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs']]]]]
+    """
+    Ports is a list of records of service ports
+    If used, every port defined in the service should have an entry in it
+    """
+
+
+@pulumi.input_type
+class SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs:
+    def __init__(__self__, *,
+                 hostname: pulumi.Input[Optional[_builtins.str]] = None,
+                 ip: pulumi.Input[Optional[_builtins.str]] = None,
+                 ip_mode: pulumi.Input[Optional[_builtins.str]] = None,
+                 ports: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs']]]] = None):
+        """
+        LoadBalancerIngress represents the status of a load-balancer ingress point:
+        traffic intended for the service should be sent to an ingress point.
+
+        :param pulumi.Input[_builtins.str] hostname: Hostname is set for load-balancer ingress points that are DNS based
+               (typically AWS load-balancers)
+        :param pulumi.Input[_builtins.str] ip: IP is set for load-balancer ingress points that are IP based
+               (typically GCE or OpenStack load-balancers)
+        :param pulumi.Input[_builtins.str] ip_mode: IPMode specifies how the load-balancer IP behaves, and may only be specified when the ip field is specified.
+               Setting this to "VIP" indicates that traffic is delivered to the node with
+               the destination set to the load-balancer's IP and port.
+               Setting this to "Proxy" indicates that traffic is delivered to the node or pod with
+               the destination set to the node's IP and node port or the pod's IP and port.
+               Service implementations may use this information to adjust traffic routing.
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs']]] ports: Ports is a list of records of service ports
+               If used, every port defined in the service should have an entry in it
+        """
+        if hostname is not None:
+            pulumi.set(__self__, "hostname", hostname)
+        if ip is not None:
+            pulumi.set(__self__, "ip", ip)
+        if ip_mode is not None:
+            pulumi.set(__self__, "ip_mode", ip_mode)
+        if ports is not None:
+            pulumi.set(__self__, "ports", ports)
+
+    @_builtins.property
+    @pulumi.getter
+    def hostname(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Hostname is set for load-balancer ingress points that are DNS based
+        (typically AWS load-balancers)
+        """
+        return pulumi.get(self, "hostname")
+
+    @hostname.setter
+    def hostname(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "hostname", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def ip(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        IP is set for load-balancer ingress points that are IP based
+        (typically GCE or OpenStack load-balancers)
+        """
+        return pulumi.get(self, "ip")
+
+    @ip.setter
+    def ip(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "ip", value)
+
+    @_builtins.property
+    @pulumi.getter(name="ipMode")
+    def ip_mode(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        IPMode specifies how the load-balancer IP behaves, and may only be specified when the ip field is specified.
+        Setting this to "VIP" indicates that traffic is delivered to the node with
+        the destination set to the load-balancer's IP and port.
+        Setting this to "Proxy" indicates that traffic is delivered to the node or pod with
+        the destination set to the node's IP and node port or the pod's IP and port.
+        Service implementations may use this information to adjust traffic routing.
+        """
+        return pulumi.get(self, "ip_mode")
+
+    @ip_mode.setter
+    def ip_mode(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "ip_mode", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def ports(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs']]]]:
+        """
+        Ports is a list of records of service ports
+        If used, every port defined in the service should have an entry in it
+        """
+        return pulumi.get(self, "ports")
+
+    @ports.setter
+    def ports(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs']]]]):
+        pulumi.set(self, "ports", value)
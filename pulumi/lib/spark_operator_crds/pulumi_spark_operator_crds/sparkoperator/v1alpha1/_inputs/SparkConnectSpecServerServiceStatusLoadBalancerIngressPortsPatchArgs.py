@@ -0,0 +1,111 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgsDict', 'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgs']
+
+class SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgsDict(TypedDict):
+    """
+    PortStatus represents the error condition of a service port
+    """
+    error: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Error is to record the problem with the service port
+    The format of the error shall comply with the following rules:
+    - built-in error values shall be specified in this file and those shall use
+      CamelCase names
+    - cloud provider specific error values must have names that comply with the
+      format foo.example.com/CamelCase.
+    """
+    port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    Port is the port number of the service port of which status is recorded here
+    """
+    protocol: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Protocol is the protocol of the service port of which status is recorded here
+    The supported values are: "TCP", "UDP", "SCTP"
+    """
+
+
+@pulumi.input_type
+class SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgs:
+    def __init__(__self__, *,
+                 error: pulumi.Input[Optional[_builtins.str]] = None,
+                 port: pulumi.Input[Optional[_builtins.int]] = None,
+                 protocol: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        PortStatus represents the error condition of a service port
+
+        :param pulumi.Input[_builtins.str] error: Error is to record the problem with the service port
+               The format of the error shall comply with the following rules:
+               - built-in error values shall be specified in this file and those shall use
+                 CamelCase names
+               - cloud provider specific error values must have names that comply with the
+                 format foo.example.com/CamelCase.
+        :param pulumi.Input[_builtins.int] port: Port is the port number of the service port of which status is recorded here
+        :param pulumi.Input[_builtins.str] protocol: Protocol is the protocol of the service port of which status is recorded here
+               The supported values are: "TCP", "UDP", "SCTP"
+        """
+        if error is not None:
+            pulumi.set(__self__, "error", error)
+        if port is not None:
+            pulumi.set(__self__, "port", port)
+        if protocol is not None:
+            pulumi.set(__self__, "protocol", protocol)
+
+    @_builtins.property
+    @pulumi.getter
+    def error(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Error is to record the problem with the service port
+        The format of the error shall comply with the following rules:
+        - built-in error values shall be specified in this file and those shall use
+          CamelCase names
+        - cloud provider specific error values must have names that comply with the
+          format foo.example.com/CamelCase.
+        """
+        return pulumi.get(self, "error")
+
+    @error.setter
+    def error(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "error", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def port(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        Port is the port number of the service port of which status is recorded here
+        """
+        return pulumi.get(self, "port")
+
+    @port.setter
+    def port(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "port", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def protocol(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Protocol is the protocol of the service port of which status is recorded here
+        The supported values are: "TCP", "UDP", "SCTP"
+        """
+        return pulumi.get(self, "protocol")
+
+    @protocol.setter
+    def protocol(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "protocol", value)
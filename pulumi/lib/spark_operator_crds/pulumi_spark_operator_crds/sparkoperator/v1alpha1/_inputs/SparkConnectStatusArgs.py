@@ -0,0 +1,146 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['SparkConnectStatusArgsDict', 'SparkConnectStatusArgs']
+
+class SparkConnectStatusArgsDict(TypedDict):
+    """
+    SparkConnectStatus defines the observed state of SparkConnect.
+    """
+    conditions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectStatusConditionsArgs']]]]]
+    """
+    Represents the latest available observations of a SparkConnect's current state.
+    """
+    executors: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.int]]]]]
+    """
+    Executors represents the current state of the SparkConnect executors.
+    """
+    last_update_time: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    LastUpdateTime is the time at which the SparkConnect controller last updated the SparkConnect.
+    """
+    server: NotRequired[pulumi.Input[Optional['_inputs.SparkConnectStatusServerArgs']]]
+    start_time: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    StartTime is the time at which the SparkConnect controller started processing the SparkConnect.
+    """
+    state: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    State represents the current state of the SparkConnect.
+    """
+
+
+@pulumi.input_type
+class SparkConnectStatusArgs:
+    def __init__(__self__, *,
+                 conditions: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectStatusConditionsArgs']]]] = None,
+                 executors: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.int]]]] = None,
+                 last_update_time: pulumi.Input[Optional[_builtins.str]] = None,
+                 server: pulumi.Input[Optional['_inputs.SparkConnectStatusServerArgs']] = None,
+                 start_time: pulumi.Input[Optional[_builtins.str]] = None,
+                 state: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        SparkConnectStatus defines the observed state of SparkConnect.
+
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.SparkConnectStatusConditionsArgs']]] conditions: Represents the latest available observations of a SparkConnect's current state.
+        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.int]]] executors: Executors represents the current state of the SparkConnect executors.
+        :param pulumi.Input[_builtins.str] last_update_time: LastUpdateTime is the time at which the SparkConnect controller last updated the SparkConnect.
+        :param pulumi.Input[_builtins.str] start_time: StartTime is the time at which the SparkConnect controller started processing the SparkConnect.
+        :param pulumi.Input[_builtins.str] state: State represents the current state of the SparkConnect.
+        """
+        if conditions is not None:
+            pulumi.set(__self__, "conditions", conditions)
+        if executors is not None:
+            pulumi.set(__self__, "executors", executors)
+        if last_update_time is not None:
+            pulumi.set(__self__, "last_update_time", last_update_time)
+        if server is not None:
+            pulumi.set(__self__, "server", server)
+        if start_time is not None:
+            pulumi.set(__self__, "start_time", start_time)
+        if state is not None:
+            pulumi.set(__self__, "state", state)
+
+    @_builtins.property
+    @pulumi.getter
+    def conditions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectStatusConditionsArgs']]]]:
+        """
+        Represents the latest available observations of a SparkConnect's current state.
+        """
+        return pulumi.get(self, "conditions")
+
+    @conditions.setter
+    def conditions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.SparkConnectStatusConditionsArgs']]]]):
+        pulumi.set(self, "conditions", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def executors(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.int]]]]:
+        """
+        Executors represents the current state of the SparkConnect executors.
+        """
+        return pulumi.get(self, "executors")
+
+    @executors.setter
+    def executors(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.int]]]]):
+        pulumi.set(self, "executors", value)
+
+    @_builtins.property
+    @pulumi.getter(name="lastUpdateTime")
+    def last_update_time(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        LastUpdateTime is the time at which the SparkConnect controller last updated the SparkConnect.
+        """
+        return pulumi.get(self, "last_update_time")
+
+    @last_update_time.setter
+    def last_update_time(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "last_update_time", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def server(self) -> pulumi.Input[Optional['_inputs.SparkConnectStatusServerArgs']]:
+        return pulumi.get(self, "server")
+
+    @server.setter
+    def server(self, value: pulumi.Input[Optional['_inputs.SparkConnectStatusServerArgs']]):
+        pulumi.set(self, "server", value)
+
+    @_builtins.property
+    @pulumi.getter(name="startTime")
+    def start_time(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        StartTime is the time at which the SparkConnect controller started processing the SparkConnect.
+        """
+        return pulumi.get(self, "start_time")
+
+    @start_time.setter
+    def start_time(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "start_time", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def state(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        State represents the current state of the SparkConnect.
+        """
+        return pulumi.get(self, "state")
+
+    @state.setter
+    def state(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "state", value)
@@ -0,0 +1,93 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['SparkConnectStatusServerArgsDict', 'SparkConnectStatusServerArgs']
+
+class SparkConnectStatusServerArgsDict(TypedDict):
+    """
+    Server represents the current state of the SparkConnect server.
+    """
+    pod_ip: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    PodIP is the IP address of the pod that is running the Spark Connect server.
+    """
+    pod_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    PodName is the name of the pod that is running the Spark Connect server.
+    """
+    service_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    ServiceName is the name of the service that is exposing the Spark Connect server.
+    """
+
+
+@pulumi.input_type
+class SparkConnectStatusServerArgs:
+    def __init__(__self__, *,
+                 pod_ip: pulumi.Input[Optional[_builtins.str]] = None,
+                 pod_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 service_name: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        Server represents the current state of the SparkConnect server.
+
+        :param pulumi.Input[_builtins.str] pod_ip: PodIP is the IP address of the pod that is running the Spark Connect server.
+        :param pulumi.Input[_builtins.str] pod_name: PodName is the name of the pod that is running the Spark Connect server.
+        :param pulumi.Input[_builtins.str] service_name: ServiceName is the name of the service that is exposing the Spark Connect server.
+        """
+        if pod_ip is not None:
+            pulumi.set(__self__, "pod_ip", pod_ip)
+        if pod_name is not None:
+            pulumi.set(__self__, "pod_name", pod_name)
+        if service_name is not None:
+            pulumi.set(__self__, "service_name", service_name)
+
+    @_builtins.property
+    @pulumi.getter(name="podIp")
+    def pod_ip(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        PodIP is the IP address of the pod that is running the Spark Connect server.
+        """
+        return pulumi.get(self, "pod_ip")
+
+    @pod_ip.setter
+    def pod_ip(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "pod_ip", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podName")
+    def pod_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        PodName is the name of the pod that is running the Spark Connect server.
+        """
+        return pulumi.get(self, "pod_name")
+
+    @pod_name.setter
+    def pod_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "pod_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="serviceName")
+    def service_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        ServiceName is the name of the service that is exposing the Spark Connect server.
+        """
+        return pulumi.get(self, "service_name")
+
+    @service_name.setter
+    def service_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "service_name", value)
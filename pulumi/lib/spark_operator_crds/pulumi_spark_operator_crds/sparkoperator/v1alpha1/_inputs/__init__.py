@@ -0,0 +1,197 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import importlib
+import typing
+
+__all__ = [
+    'SparkConnectSpecDynamicAllocationPatchArgsDict',
+    'SparkConnectSpecDynamicAllocationPatchArgs',
+    'SparkConnectSpecDynamicAllocationArgsDict',
+    'SparkConnectSpecDynamicAllocationArgs',
+    'SparkConnectSpecExecutorPatchArgsDict',
+    'SparkConnectSpecExecutorPatchArgs',
+    'SparkConnectSpecExecutorArgsDict',
+    'SparkConnectSpecExecutorArgs',
+    'SparkConnectSpecPatchArgsDict',
+    'SparkConnectSpecPatchArgs',
+    'SparkConnectSpecServerPatchArgsDict',
+    'SparkConnectSpecServerPatchArgs',
+    'SparkConnectSpecServerServiceMetadataPatchArgsDict',
+    'SparkConnectSpecServerServiceMetadataPatchArgs',
+    'SparkConnectSpecServerServiceMetadataArgsDict',
+    'SparkConnectSpecServerServiceMetadataArgs',
+    'SparkConnectSpecServerServicePatchArgsDict',
+    'SparkConnectSpecServerServicePatchArgs',
+    'SparkConnectSpecServerServiceSpecPatchArgsDict',
+    'SparkConnectSpecServerServiceSpecPatchArgs',
+    'SparkConnectSpecServerServiceSpecPortsPatchArgsDict',
+    'SparkConnectSpecServerServiceSpecPortsPatchArgs',
+    'SparkConnectSpecServerServiceSpecPortsArgsDict',
+    'SparkConnectSpecServerServiceSpecPortsArgs',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgsDict',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgs',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgsDict',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgs',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigPatchArgsDict',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigPatchArgs',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigArgsDict',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigArgs',
+    'SparkConnectSpecServerServiceSpecArgsDict',
+    'SparkConnectSpecServerServiceSpecArgs',
+    'SparkConnectSpecServerServiceStatusConditionsPatchArgsDict',
+    'SparkConnectSpecServerServiceStatusConditionsPatchArgs',
+    'SparkConnectSpecServerServiceStatusConditionsArgsDict',
+    'SparkConnectSpecServerServiceStatusConditionsArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgsDict',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgsDict',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgsDict',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressArgsDict',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerPatchArgsDict',
+    'SparkConnectSpecServerServiceStatusLoadBalancerPatchArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerArgsDict',
+    'SparkConnectSpecServerServiceStatusLoadBalancerArgs',
+    'SparkConnectSpecServerServiceStatusPatchArgsDict',
+    'SparkConnectSpecServerServiceStatusPatchArgs',
+    'SparkConnectSpecServerServiceStatusArgsDict',
+    'SparkConnectSpecServerServiceStatusArgs',
+    'SparkConnectSpecServerServiceArgsDict',
+    'SparkConnectSpecServerServiceArgs',
+    'SparkConnectSpecServerArgsDict',
+    'SparkConnectSpecServerArgs',
+    'SparkConnectSpecArgsDict',
+    'SparkConnectSpecArgs',
+    'SparkConnectStatusConditionsArgsDict',
+    'SparkConnectStatusConditionsArgs',
+    'SparkConnectStatusServerArgsDict',
+    'SparkConnectStatusServerArgs',
+    'SparkConnectStatusArgsDict',
+    'SparkConnectStatusArgs',
+    'SparkConnectArgsDict',
+    'SparkConnectArgs',
+]
+
+_TYPE_MODULES = {
+    'SparkConnectSpecDynamicAllocationPatchArgsDict': 'SparkConnectSpecDynamicAllocationPatchArgs',
+    'SparkConnectSpecDynamicAllocationPatchArgs': 'SparkConnectSpecDynamicAllocationPatchArgs',
+    'SparkConnectSpecDynamicAllocationArgsDict': 'SparkConnectSpecDynamicAllocationArgs',
+    'SparkConnectSpecDynamicAllocationArgs': 'SparkConnectSpecDynamicAllocationArgs',
+    'SparkConnectSpecExecutorPatchArgsDict': 'SparkConnectSpecExecutorPatchArgs',
+    'SparkConnectSpecExecutorPatchArgs': 'SparkConnectSpecExecutorPatchArgs',
+    'SparkConnectSpecExecutorArgsDict': 'SparkConnectSpecExecutorArgs',
+    'SparkConnectSpecExecutorArgs': 'SparkConnectSpecExecutorArgs',
+    'SparkConnectSpecPatchArgsDict': 'SparkConnectSpecPatchArgs',
+    'SparkConnectSpecPatchArgs': 'SparkConnectSpecPatchArgs',
+    'SparkConnectSpecServerPatchArgsDict': 'SparkConnectSpecServerPatchArgs',
+    'SparkConnectSpecServerPatchArgs': 'SparkConnectSpecServerPatchArgs',
+    'SparkConnectSpecServerServiceMetadataPatchArgsDict': 'SparkConnectSpecServerServiceMetadataPatchArgs',
+    'SparkConnectSpecServerServiceMetadataPatchArgs': 'SparkConnectSpecServerServiceMetadataPatchArgs',
+    'SparkConnectSpecServerServiceMetadataArgsDict': 'SparkConnectSpecServerServiceMetadataArgs',
+    'SparkConnectSpecServerServiceMetadataArgs': 'SparkConnectSpecServerServiceMetadataArgs',
+    'SparkConnectSpecServerServicePatchArgsDict': 'SparkConnectSpecServerServicePatchArgs',
+    'SparkConnectSpecServerServicePatchArgs': 'SparkConnectSpecServerServicePatchArgs',
+    'SparkConnectSpecServerServiceSpecPatchArgsDict': 'SparkConnectSpecServerServiceSpecPatchArgs',
+    'SparkConnectSpecServerServiceSpecPatchArgs': 'SparkConnectSpecServerServiceSpecPatchArgs',
+    'SparkConnectSpecServerServiceSpecPortsPatchArgsDict': 'SparkConnectSpecServerServiceSpecPortsPatchArgs',
+    'SparkConnectSpecServerServiceSpecPortsPatchArgs': 'SparkConnectSpecServerServiceSpecPortsPatchArgs',
+    'SparkConnectSpecServerServiceSpecPortsArgsDict': 'SparkConnectSpecServerServiceSpecPortsArgs',
+    'SparkConnectSpecServerServiceSpecPortsArgs': 'SparkConnectSpecServerServiceSpecPortsArgs',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgsDict': 'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgs',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgs': 'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgs',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgsDict': 'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgs',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgs': 'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgs',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigPatchArgsDict': 'SparkConnectSpecServerServiceSpecSessionAffinityConfigPatchArgs',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigPatchArgs': 'SparkConnectSpecServerServiceSpecSessionAffinityConfigPatchArgs',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigArgsDict': 'SparkConnectSpecServerServiceSpecSessionAffinityConfigArgs',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigArgs': 'SparkConnectSpecServerServiceSpecSessionAffinityConfigArgs',
+    'SparkConnectSpecServerServiceSpecArgsDict': 'SparkConnectSpecServerServiceSpecArgs',
+    'SparkConnectSpecServerServiceSpecArgs': 'SparkConnectSpecServerServiceSpecArgs',
+    'SparkConnectSpecServerServiceStatusConditionsPatchArgsDict': 'SparkConnectSpecServerServiceStatusConditionsPatchArgs',
+    'SparkConnectSpecServerServiceStatusConditionsPatchArgs': 'SparkConnectSpecServerServiceStatusConditionsPatchArgs',
+    'SparkConnectSpecServerServiceStatusConditionsArgsDict': 'SparkConnectSpecServerServiceStatusConditionsArgs',
+    'SparkConnectSpecServerServiceStatusConditionsArgs': 'SparkConnectSpecServerServiceStatusConditionsArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgsDict': 'SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgs': 'SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgsDict': 'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgs': 'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgsDict': 'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs': 'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressArgsDict': 'SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs': 'SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerPatchArgsDict': 'SparkConnectSpecServerServiceStatusLoadBalancerPatchArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerPatchArgs': 'SparkConnectSpecServerServiceStatusLoadBalancerPatchArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerArgsDict': 'SparkConnectSpecServerServiceStatusLoadBalancerArgs',
+    'SparkConnectSpecServerServiceStatusLoadBalancerArgs': 'SparkConnectSpecServerServiceStatusLoadBalancerArgs',
+    'SparkConnectSpecServerServiceStatusPatchArgsDict': 'SparkConnectSpecServerServiceStatusPatchArgs',
+    'SparkConnectSpecServerServiceStatusPatchArgs': 'SparkConnectSpecServerServiceStatusPatchArgs',
+    'SparkConnectSpecServerServiceStatusArgsDict': 'SparkConnectSpecServerServiceStatusArgs',
+    'SparkConnectSpecServerServiceStatusArgs': 'SparkConnectSpecServerServiceStatusArgs',
+    'SparkConnectSpecServerServiceArgsDict': 'SparkConnectSpecServerServiceArgs',
+    'SparkConnectSpecServerServiceArgs': 'SparkConnectSpecServerServiceArgs',
+    'SparkConnectSpecServerArgsDict': 'SparkConnectSpecServerArgs',
+    'SparkConnectSpecServerArgs': 'SparkConnectSpecServerArgs',
+    'SparkConnectSpecArgsDict': 'SparkConnectSpecArgs',
+    'SparkConnectSpecArgs': 'SparkConnectSpecArgs',
+    'SparkConnectStatusConditionsArgsDict': 'SparkConnectStatusConditionsArgs',
+    'SparkConnectStatusConditionsArgs': 'SparkConnectStatusConditionsArgs',
+    'SparkConnectStatusServerArgsDict': 'SparkConnectStatusServerArgs',
+    'SparkConnectStatusServerArgs': 'SparkConnectStatusServerArgs',
+    'SparkConnectStatusArgsDict': 'SparkConnectStatusArgs',
+    'SparkConnectStatusArgs': 'SparkConnectStatusArgs',
+    'SparkConnectArgsDict': 'SparkConnectArgs',
+    'SparkConnectArgs': 'SparkConnectArgs',
+}
+
+if typing.TYPE_CHECKING:
+    from .SparkConnectSpecDynamicAllocationPatchArgs import *
+    from .SparkConnectSpecDynamicAllocationArgs import *
+    from .SparkConnectSpecExecutorPatchArgs import *
+    from .SparkConnectSpecExecutorArgs import *
+    from .SparkConnectSpecPatchArgs import *
+    from .SparkConnectSpecServerPatchArgs import *
+    from .SparkConnectSpecServerServiceMetadataPatchArgs import *
+    from .SparkConnectSpecServerServiceMetadataArgs import *
+    from .SparkConnectSpecServerServicePatchArgs import *
+    from .SparkConnectSpecServerServiceSpecPatchArgs import *
+    from .SparkConnectSpecServerServiceSpecPortsPatchArgs import *
+    from .SparkConnectSpecServerServiceSpecPortsArgs import *
+    from .SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatchArgs import *
+    from .SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPArgs import *
+    from .SparkConnectSpecServerServiceSpecSessionAffinityConfigPatchArgs import *
+    from .SparkConnectSpecServerServiceSpecSessionAffinityConfigArgs import *
+    from .SparkConnectSpecServerServiceSpecArgs import *
+    from .SparkConnectSpecServerServiceStatusConditionsPatchArgs import *
+    from .SparkConnectSpecServerServiceStatusConditionsArgs import *
+    from .SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgs import *
+    from .SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgs import *
+    from .SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs import *
+    from .SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs import *
+    from .SparkConnectSpecServerServiceStatusLoadBalancerPatchArgs import *
+    from .SparkConnectSpecServerServiceStatusLoadBalancerArgs import *
+    from .SparkConnectSpecServerServiceStatusPatchArgs import *
+    from .SparkConnectSpecServerServiceStatusArgs import *
+    from .SparkConnectSpecServerServiceArgs import *
+    from .SparkConnectSpecServerArgs import *
+    from .SparkConnectSpecArgs import *
+    from .SparkConnectStatusConditionsArgs import *
+    from .SparkConnectStatusServerArgs import *
+    from .SparkConnectStatusArgs import *
+    from .SparkConnectArgs import *
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _TYPE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
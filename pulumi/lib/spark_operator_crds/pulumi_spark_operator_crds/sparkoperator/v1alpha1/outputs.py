@@ -1,4151 +0,0 @@
-# coding=utf-8
-# *** WARNING: this file was generated by crd2pulumi. ***
-# *** Do not edit by hand unless you're certain you know what you are doing! ***
-
-import builtins as _builtins
-import warnings
-import sys
-import pulumi
-import pulumi.runtime
-from typing import Any, Mapping, Optional, Sequence, Union, overload
-if sys.version_info >= (3, 11):
-    from typing import NotRequired, TypedDict, TypeAlias
-else:
-    from typing_extensions import NotRequired, TypedDict, TypeAlias
-from ... import _utilities
-from . import outputs
-from ... import meta as _meta
-
-__all__ = [
-    'SparkConnect',
-    'SparkConnectSpec',
-    'SparkConnectSpecDynamicAllocation',
-    'SparkConnectSpecDynamicAllocationPatch',
-    'SparkConnectSpecExecutor',
-    'SparkConnectSpecExecutorPatch',
-    'SparkConnectSpecPatch',
-    'SparkConnectSpecServer',
-    'SparkConnectSpecServerPatch',
-    'SparkConnectSpecServerService',
-    'SparkConnectSpecServerServiceMetadata',
-    'SparkConnectSpecServerServiceMetadataPatch',
-    'SparkConnectSpecServerServicePatch',
-    'SparkConnectSpecServerServiceSpec',
-    'SparkConnectSpecServerServiceSpecPatch',
-    'SparkConnectSpecServerServiceSpecPorts',
-    'SparkConnectSpecServerServiceSpecPortsPatch',
-    'SparkConnectSpecServerServiceSpecSessionAffinityConfig',
-    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIP',
-    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatch',
-    'SparkConnectSpecServerServiceSpecSessionAffinityConfigPatch',
-    'SparkConnectSpecServerServiceStatus',
-    'SparkConnectSpecServerServiceStatusConditions',
-    'SparkConnectSpecServerServiceStatusConditionsPatch',
-    'SparkConnectSpecServerServiceStatusLoadBalancer',
-    'SparkConnectSpecServerServiceStatusLoadBalancerIngress',
-    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPatch',
-    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPorts',
-    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatch',
-    'SparkConnectSpecServerServiceStatusLoadBalancerPatch',
-    'SparkConnectSpecServerServiceStatusPatch',
-    'SparkConnectStatus',
-    'SparkConnectStatusConditions',
-    'SparkConnectStatusConditionsPatch',
-    'SparkConnectStatusPatch',
-    'SparkConnectStatusServer',
-    'SparkConnectStatusServerPatch',
-]
-
-@pulumi.output_type
-class SparkConnect(dict):
-    """
-    SparkConnect is the Schema for the sparkconnections API.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "apiVersion":
-            suggest = "api_version"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnect. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnect.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnect.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 api_version: Optional[_builtins.str] = None,
-                 kind: Optional[_builtins.str] = None,
-                 metadata: Optional['_meta.v1.outputs.ObjectMeta'] = None,
-                 spec: Optional['outputs.SparkConnectSpec'] = None,
-                 status: Optional['outputs.SparkConnectStatus'] = None):
-        """
-        SparkConnect is the Schema for the sparkconnections API.
-
-        :param _builtins.str api_version: APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        :param _builtins.str kind: Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        :param '_meta.v1.ObjectMetaArgs' metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        if api_version is not None:
-            pulumi.set(__self__, "api_version", 'sparkoperator.k8s.io/v1alpha1')
-        if kind is not None:
-            pulumi.set(__self__, "kind", 'SparkConnect')
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter(name="apiVersion")
-    def api_version(self) -> Optional[_builtins.str]:
-        """
-        APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        """
-        return pulumi.get(self, "api_version")
-
-    @_builtins.property
-    @pulumi.getter
-    def kind(self) -> Optional[_builtins.str]:
-        """
-        Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        return pulumi.get(self, "kind")
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> Optional['_meta.v1.outputs.ObjectMeta']:
-        """
-        Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        return pulumi.get(self, "metadata")
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> Optional['outputs.SparkConnectSpec']:
-        return pulumi.get(self, "spec")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional['outputs.SparkConnectStatus']:
-        return pulumi.get(self, "status")
-
-
-@pulumi.output_type
-class SparkConnectSpec(dict):
-    """
-    SparkConnectSpec defines the desired state of SparkConnect.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "dynamicAllocation":
-            suggest = "dynamic_allocation"
-        elif key == "hadoopConf":
-            suggest = "hadoop_conf"
-        elif key == "sparkConf":
-            suggest = "spark_conf"
-        elif key == "sparkVersion":
-            suggest = "spark_version"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpec. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpec.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpec.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 dynamic_allocation: Optional['outputs.SparkConnectSpecDynamicAllocation'] = None,
-                 executor: Optional['outputs.SparkConnectSpecExecutor'] = None,
-                 hadoop_conf: Optional[Mapping[str, _builtins.str]] = None,
-                 image: Optional[_builtins.str] = None,
-                 server: Optional['outputs.SparkConnectSpecServer'] = None,
-                 spark_conf: Optional[Mapping[str, _builtins.str]] = None,
-                 spark_version: Optional[_builtins.str] = None):
-        """
-        SparkConnectSpec defines the desired state of SparkConnect.
-
-        :param Mapping[str, _builtins.str] hadoop_conf: HadoopConf carries user-specified Hadoop configuration properties as they would use the "--conf" option
-               in spark-submit. The SparkApplication controller automatically adds prefix "spark.hadoop." to Hadoop
-               configuration properties.
-        :param _builtins.str image: Image is the container image for the driver, executor, and init-container. Any custom container images for the
-               driver, executor, or init-container takes precedence over this.
-        :param Mapping[str, _builtins.str] spark_conf: SparkConf carries user-specified Spark configuration properties as they would use the "--conf" option in
-               spark-submit.
-        :param _builtins.str spark_version: SparkVersion is the version of Spark the spark connect use.
-        """
-        if dynamic_allocation is not None:
-            pulumi.set(__self__, "dynamic_allocation", dynamic_allocation)
-        if executor is not None:
-            pulumi.set(__self__, "executor", executor)
-        if hadoop_conf is not None:
-            pulumi.set(__self__, "hadoop_conf", hadoop_conf)
-        if image is not None:
-            pulumi.set(__self__, "image", image)
-        if server is not None:
-            pulumi.set(__self__, "server", server)
-        if spark_conf is not None:
-            pulumi.set(__self__, "spark_conf", spark_conf)
-        if spark_version is not None:
-            pulumi.set(__self__, "spark_version", spark_version)
-
-    @_builtins.property
-    @pulumi.getter(name="dynamicAllocation")
-    def dynamic_allocation(self) -> Optional['outputs.SparkConnectSpecDynamicAllocation']:
-        return pulumi.get(self, "dynamic_allocation")
-
-    @_builtins.property
-    @pulumi.getter
-    def executor(self) -> Optional['outputs.SparkConnectSpecExecutor']:
-        return pulumi.get(self, "executor")
-
-    @_builtins.property
-    @pulumi.getter(name="hadoopConf")
-    def hadoop_conf(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        HadoopConf carries user-specified Hadoop configuration properties as they would use the "--conf" option
-        in spark-submit. The SparkApplication controller automatically adds prefix "spark.hadoop." to Hadoop
-        configuration properties.
-        """
-        return pulumi.get(self, "hadoop_conf")
-
-    @_builtins.property
-    @pulumi.getter
-    def image(self) -> Optional[_builtins.str]:
-        """
-        Image is the container image for the driver, executor, and init-container. Any custom container images for the
-        driver, executor, or init-container takes precedence over this.
-        """
-        return pulumi.get(self, "image")
-
-    @_builtins.property
-    @pulumi.getter
-    def server(self) -> Optional['outputs.SparkConnectSpecServer']:
-        return pulumi.get(self, "server")
-
-    @_builtins.property
-    @pulumi.getter(name="sparkConf")
-    def spark_conf(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        SparkConf carries user-specified Spark configuration properties as they would use the "--conf" option in
-        spark-submit.
-        """
-        return pulumi.get(self, "spark_conf")
-
-    @_builtins.property
-    @pulumi.getter(name="sparkVersion")
-    def spark_version(self) -> Optional[_builtins.str]:
-        """
-        SparkVersion is the version of Spark the spark connect use.
-        """
-        return pulumi.get(self, "spark_version")
-
-
-@pulumi.output_type
-class SparkConnectSpecDynamicAllocation(dict):
-    """
-    DynamicAllocation configures dynamic allocation that becomes available for the Kubernetes
-    scheduler backend since Spark 3.0.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "initialExecutors":
-            suggest = "initial_executors"
-        elif key == "maxExecutors":
-            suggest = "max_executors"
-        elif key == "minExecutors":
-            suggest = "min_executors"
-        elif key == "shuffleTrackingEnabled":
-            suggest = "shuffle_tracking_enabled"
-        elif key == "shuffleTrackingTimeout":
-            suggest = "shuffle_tracking_timeout"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecDynamicAllocation. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecDynamicAllocation.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecDynamicAllocation.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.bool] = None,
-                 initial_executors: Optional[_builtins.int] = None,
-                 max_executors: Optional[_builtins.int] = None,
-                 min_executors: Optional[_builtins.int] = None,
-                 shuffle_tracking_enabled: Optional[_builtins.bool] = None,
-                 shuffle_tracking_timeout: Optional[_builtins.int] = None):
-        """
-        DynamicAllocation configures dynamic allocation that becomes available for the Kubernetes
-        scheduler backend since Spark 3.0.
-
-        :param _builtins.bool enabled: Enabled controls whether dynamic allocation is enabled or not.
-        :param _builtins.int initial_executors: InitialExecutors is the initial number of executors to request. If .spec.executor.instances
-               is also set, the initial number of executors is set to the bigger of that and this option.
-        :param _builtins.int max_executors: MaxExecutors is the upper bound for the number of executors if dynamic allocation is enabled.
-        :param _builtins.int min_executors: MinExecutors is the lower bound for the number of executors if dynamic allocation is enabled.
-        :param _builtins.bool shuffle_tracking_enabled: ShuffleTrackingEnabled enables shuffle file tracking for executors, which allows dynamic allocation without
-               the need for an external shuffle service. This option will try to keep alive executors that are storing
-               shuffle data for active jobs. If external shuffle service is enabled, set ShuffleTrackingEnabled to false.
-               ShuffleTrackingEnabled is true by default if dynamicAllocation.enabled is true.
-        :param _builtins.int shuffle_tracking_timeout: ShuffleTrackingTimeout controls the timeout in milliseconds for executors that are holding
-               shuffle data if shuffle tracking is enabled (true by default if dynamic allocation is enabled).
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-        if initial_executors is not None:
-            pulumi.set(__self__, "initial_executors", initial_executors)
-        if max_executors is not None:
-            pulumi.set(__self__, "max_executors", max_executors)
-        if min_executors is not None:
-            pulumi.set(__self__, "min_executors", min_executors)
-        if shuffle_tracking_enabled is not None:
-            pulumi.set(__self__, "shuffle_tracking_enabled", shuffle_tracking_enabled)
-        if shuffle_tracking_timeout is not None:
-            pulumi.set(__self__, "shuffle_tracking_timeout", shuffle_tracking_timeout)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.bool]:
-        """
-        Enabled controls whether dynamic allocation is enabled or not.
-        """
-        return pulumi.get(self, "enabled")
-
-    @_builtins.property
-    @pulumi.getter(name="initialExecutors")
-    def initial_executors(self) -> Optional[_builtins.int]:
-        """
-        InitialExecutors is the initial number of executors to request. If .spec.executor.instances
-        is also set, the initial number of executors is set to the bigger of that and this option.
-        """
-        return pulumi.get(self, "initial_executors")
-
-    @_builtins.property
-    @pulumi.getter(name="maxExecutors")
-    def max_executors(self) -> Optional[_builtins.int]:
-        """
-        MaxExecutors is the upper bound for the number of executors if dynamic allocation is enabled.
-        """
-        return pulumi.get(self, "max_executors")
-
-    @_builtins.property
-    @pulumi.getter(name="minExecutors")
-    def min_executors(self) -> Optional[_builtins.int]:
-        """
-        MinExecutors is the lower bound for the number of executors if dynamic allocation is enabled.
-        """
-        return pulumi.get(self, "min_executors")
-
-    @_builtins.property
-    @pulumi.getter(name="shuffleTrackingEnabled")
-    def shuffle_tracking_enabled(self) -> Optional[_builtins.bool]:
-        """
-        ShuffleTrackingEnabled enables shuffle file tracking for executors, which allows dynamic allocation without
-        the need for an external shuffle service. This option will try to keep alive executors that are storing
-        shuffle data for active jobs. If external shuffle service is enabled, set ShuffleTrackingEnabled to false.
-        ShuffleTrackingEnabled is true by default if dynamicAllocation.enabled is true.
-        """
-        return pulumi.get(self, "shuffle_tracking_enabled")
-
-    @_builtins.property
-    @pulumi.getter(name="shuffleTrackingTimeout")
-    def shuffle_tracking_timeout(self) -> Optional[_builtins.int]:
-        """
-        ShuffleTrackingTimeout controls the timeout in milliseconds for executors that are holding
-        shuffle data if shuffle tracking is enabled (true by default if dynamic allocation is enabled).
-        """
-        return pulumi.get(self, "shuffle_tracking_timeout")
-
-
-@pulumi.output_type
-class SparkConnectSpecDynamicAllocationPatch(dict):
-    """
-    DynamicAllocation configures dynamic allocation that becomes available for the Kubernetes
-    scheduler backend since Spark 3.0.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "initialExecutors":
-            suggest = "initial_executors"
-        elif key == "maxExecutors":
-            suggest = "max_executors"
-        elif key == "minExecutors":
-            suggest = "min_executors"
-        elif key == "shuffleTrackingEnabled":
-            suggest = "shuffle_tracking_enabled"
-        elif key == "shuffleTrackingTimeout":
-            suggest = "shuffle_tracking_timeout"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecDynamicAllocationPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecDynamicAllocationPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecDynamicAllocationPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 enabled: Optional[_builtins.bool] = None,
-                 initial_executors: Optional[_builtins.int] = None,
-                 max_executors: Optional[_builtins.int] = None,
-                 min_executors: Optional[_builtins.int] = None,
-                 shuffle_tracking_enabled: Optional[_builtins.bool] = None,
-                 shuffle_tracking_timeout: Optional[_builtins.int] = None):
-        """
-        DynamicAllocation configures dynamic allocation that becomes available for the Kubernetes
-        scheduler backend since Spark 3.0.
-
-        :param _builtins.bool enabled: Enabled controls whether dynamic allocation is enabled or not.
-        :param _builtins.int initial_executors: InitialExecutors is the initial number of executors to request. If .spec.executor.instances
-               is also set, the initial number of executors is set to the bigger of that and this option.
-        :param _builtins.int max_executors: MaxExecutors is the upper bound for the number of executors if dynamic allocation is enabled.
-        :param _builtins.int min_executors: MinExecutors is the lower bound for the number of executors if dynamic allocation is enabled.
-        :param _builtins.bool shuffle_tracking_enabled: ShuffleTrackingEnabled enables shuffle file tracking for executors, which allows dynamic allocation without
-               the need for an external shuffle service. This option will try to keep alive executors that are storing
-               shuffle data for active jobs. If external shuffle service is enabled, set ShuffleTrackingEnabled to false.
-               ShuffleTrackingEnabled is true by default if dynamicAllocation.enabled is true.
-        :param _builtins.int shuffle_tracking_timeout: ShuffleTrackingTimeout controls the timeout in milliseconds for executors that are holding
-               shuffle data if shuffle tracking is enabled (true by default if dynamic allocation is enabled).
-        """
-        if enabled is not None:
-            pulumi.set(__self__, "enabled", enabled)
-        if initial_executors is not None:
-            pulumi.set(__self__, "initial_executors", initial_executors)
-        if max_executors is not None:
-            pulumi.set(__self__, "max_executors", max_executors)
-        if min_executors is not None:
-            pulumi.set(__self__, "min_executors", min_executors)
-        if shuffle_tracking_enabled is not None:
-            pulumi.set(__self__, "shuffle_tracking_enabled", shuffle_tracking_enabled)
-        if shuffle_tracking_timeout is not None:
-            pulumi.set(__self__, "shuffle_tracking_timeout", shuffle_tracking_timeout)
-
-    @_builtins.property
-    @pulumi.getter
-    def enabled(self) -> Optional[_builtins.bool]:
-        """
-        Enabled controls whether dynamic allocation is enabled or not.
-        """
-        return pulumi.get(self, "enabled")
-
-    @_builtins.property
-    @pulumi.getter(name="initialExecutors")
-    def initial_executors(self) -> Optional[_builtins.int]:
-        """
-        InitialExecutors is the initial number of executors to request. If .spec.executor.instances
-        is also set, the initial number of executors is set to the bigger of that and this option.
-        """
-        return pulumi.get(self, "initial_executors")
-
-    @_builtins.property
-    @pulumi.getter(name="maxExecutors")
-    def max_executors(self) -> Optional[_builtins.int]:
-        """
-        MaxExecutors is the upper bound for the number of executors if dynamic allocation is enabled.
-        """
-        return pulumi.get(self, "max_executors")
-
-    @_builtins.property
-    @pulumi.getter(name="minExecutors")
-    def min_executors(self) -> Optional[_builtins.int]:
-        """
-        MinExecutors is the lower bound for the number of executors if dynamic allocation is enabled.
-        """
-        return pulumi.get(self, "min_executors")
-
-    @_builtins.property
-    @pulumi.getter(name="shuffleTrackingEnabled")
-    def shuffle_tracking_enabled(self) -> Optional[_builtins.bool]:
-        """
-        ShuffleTrackingEnabled enables shuffle file tracking for executors, which allows dynamic allocation without
-        the need for an external shuffle service. This option will try to keep alive executors that are storing
-        shuffle data for active jobs. If external shuffle service is enabled, set ShuffleTrackingEnabled to false.
-        ShuffleTrackingEnabled is true by default if dynamicAllocation.enabled is true.
-        """
-        return pulumi.get(self, "shuffle_tracking_enabled")
-
-    @_builtins.property
-    @pulumi.getter(name="shuffleTrackingTimeout")
-    def shuffle_tracking_timeout(self) -> Optional[_builtins.int]:
-        """
-        ShuffleTrackingTimeout controls the timeout in milliseconds for executors that are holding
-        shuffle data if shuffle tracking is enabled (true by default if dynamic allocation is enabled).
-        """
-        return pulumi.get(self, "shuffle_tracking_timeout")
-
-
-@pulumi.output_type
-class SparkConnectSpecExecutor(dict):
-    """
-    Executor is the Spark executor specification.
-    """
-    def __init__(__self__, *,
-                 cores: Optional[_builtins.int] = None,
-                 instances: Optional[_builtins.int] = None,
-                 memory: Optional[_builtins.str] = None,
-                 template: Optional[Mapping[str, Any]] = None):
-        """
-        Executor is the Spark executor specification.
-
-        :param _builtins.int cores: Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-        :param _builtins.int instances: Instances is the number of executor instances.
-        :param _builtins.str memory: Memory is the amount of memory to request for the pod.
-        :param Mapping[str, Any] template: Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-               Spark version >= 3.0.0 is required.
-               Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-        """
-        if cores is not None:
-            pulumi.set(__self__, "cores", cores)
-        if instances is not None:
-            pulumi.set(__self__, "instances", instances)
-        if memory is not None:
-            pulumi.set(__self__, "memory", memory)
-        if template is not None:
-            pulumi.set(__self__, "template", template)
-
-    @_builtins.property
-    @pulumi.getter
-    def cores(self) -> Optional[_builtins.int]:
-        """
-        Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-        """
-        return pulumi.get(self, "cores")
-
-    @_builtins.property
-    @pulumi.getter
-    def instances(self) -> Optional[_builtins.int]:
-        """
-        Instances is the number of executor instances.
-        """
-        return pulumi.get(self, "instances")
-
-    @_builtins.property
-    @pulumi.getter
-    def memory(self) -> Optional[_builtins.str]:
-        """
-        Memory is the amount of memory to request for the pod.
-        """
-        return pulumi.get(self, "memory")
-
-    @_builtins.property
-    @pulumi.getter
-    def template(self) -> Optional[Mapping[str, Any]]:
-        """
-        Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-        Spark version >= 3.0.0 is required.
-        Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-        """
-        return pulumi.get(self, "template")
-
-
-@pulumi.output_type
-class SparkConnectSpecExecutorPatch(dict):
-    """
-    Executor is the Spark executor specification.
-    """
-    def __init__(__self__, *,
-                 cores: Optional[_builtins.int] = None,
-                 instances: Optional[_builtins.int] = None,
-                 memory: Optional[_builtins.str] = None,
-                 template: Optional[Mapping[str, Any]] = None):
-        """
-        Executor is the Spark executor specification.
-
-        :param _builtins.int cores: Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-        :param _builtins.int instances: Instances is the number of executor instances.
-        :param _builtins.str memory: Memory is the amount of memory to request for the pod.
-        :param Mapping[str, Any] template: Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-               Spark version >= 3.0.0 is required.
-               Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-        """
-        if cores is not None:
-            pulumi.set(__self__, "cores", cores)
-        if instances is not None:
-            pulumi.set(__self__, "instances", instances)
-        if memory is not None:
-            pulumi.set(__self__, "memory", memory)
-        if template is not None:
-            pulumi.set(__self__, "template", template)
-
-    @_builtins.property
-    @pulumi.getter
-    def cores(self) -> Optional[_builtins.int]:
-        """
-        Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-        """
-        return pulumi.get(self, "cores")
-
-    @_builtins.property
-    @pulumi.getter
-    def instances(self) -> Optional[_builtins.int]:
-        """
-        Instances is the number of executor instances.
-        """
-        return pulumi.get(self, "instances")
-
-    @_builtins.property
-    @pulumi.getter
-    def memory(self) -> Optional[_builtins.str]:
-        """
-        Memory is the amount of memory to request for the pod.
-        """
-        return pulumi.get(self, "memory")
-
-    @_builtins.property
-    @pulumi.getter
-    def template(self) -> Optional[Mapping[str, Any]]:
-        """
-        Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-        Spark version >= 3.0.0 is required.
-        Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-        """
-        return pulumi.get(self, "template")
-
-
-@pulumi.output_type
-class SparkConnectSpecPatch(dict):
-    """
-    SparkConnectSpec defines the desired state of SparkConnect.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "dynamicAllocation":
-            suggest = "dynamic_allocation"
-        elif key == "hadoopConf":
-            suggest = "hadoop_conf"
-        elif key == "sparkConf":
-            suggest = "spark_conf"
-        elif key == "sparkVersion":
-            suggest = "spark_version"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 dynamic_allocation: Optional['outputs.SparkConnectSpecDynamicAllocationPatch'] = None,
-                 executor: Optional['outputs.SparkConnectSpecExecutorPatch'] = None,
-                 hadoop_conf: Optional[Mapping[str, _builtins.str]] = None,
-                 image: Optional[_builtins.str] = None,
-                 server: Optional['outputs.SparkConnectSpecServerPatch'] = None,
-                 spark_conf: Optional[Mapping[str, _builtins.str]] = None,
-                 spark_version: Optional[_builtins.str] = None):
-        """
-        SparkConnectSpec defines the desired state of SparkConnect.
-
-        :param Mapping[str, _builtins.str] hadoop_conf: HadoopConf carries user-specified Hadoop configuration properties as they would use the "--conf" option
-               in spark-submit. The SparkApplication controller automatically adds prefix "spark.hadoop." to Hadoop
-               configuration properties.
-        :param _builtins.str image: Image is the container image for the driver, executor, and init-container. Any custom container images for the
-               driver, executor, or init-container takes precedence over this.
-        :param Mapping[str, _builtins.str] spark_conf: SparkConf carries user-specified Spark configuration properties as they would use the "--conf" option in
-               spark-submit.
-        :param _builtins.str spark_version: SparkVersion is the version of Spark the spark connect use.
-        """
-        if dynamic_allocation is not None:
-            pulumi.set(__self__, "dynamic_allocation", dynamic_allocation)
-        if executor is not None:
-            pulumi.set(__self__, "executor", executor)
-        if hadoop_conf is not None:
-            pulumi.set(__self__, "hadoop_conf", hadoop_conf)
-        if image is not None:
-            pulumi.set(__self__, "image", image)
-        if server is not None:
-            pulumi.set(__self__, "server", server)
-        if spark_conf is not None:
-            pulumi.set(__self__, "spark_conf", spark_conf)
-        if spark_version is not None:
-            pulumi.set(__self__, "spark_version", spark_version)
-
-    @_builtins.property
-    @pulumi.getter(name="dynamicAllocation")
-    def dynamic_allocation(self) -> Optional['outputs.SparkConnectSpecDynamicAllocationPatch']:
-        return pulumi.get(self, "dynamic_allocation")
-
-    @_builtins.property
-    @pulumi.getter
-    def executor(self) -> Optional['outputs.SparkConnectSpecExecutorPatch']:
-        return pulumi.get(self, "executor")
-
-    @_builtins.property
-    @pulumi.getter(name="hadoopConf")
-    def hadoop_conf(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        HadoopConf carries user-specified Hadoop configuration properties as they would use the "--conf" option
-        in spark-submit. The SparkApplication controller automatically adds prefix "spark.hadoop." to Hadoop
-        configuration properties.
-        """
-        return pulumi.get(self, "hadoop_conf")
-
-    @_builtins.property
-    @pulumi.getter
-    def image(self) -> Optional[_builtins.str]:
-        """
-        Image is the container image for the driver, executor, and init-container. Any custom container images for the
-        driver, executor, or init-container takes precedence over this.
-        """
-        return pulumi.get(self, "image")
-
-    @_builtins.property
-    @pulumi.getter
-    def server(self) -> Optional['outputs.SparkConnectSpecServerPatch']:
-        return pulumi.get(self, "server")
-
-    @_builtins.property
-    @pulumi.getter(name="sparkConf")
-    def spark_conf(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        SparkConf carries user-specified Spark configuration properties as they would use the "--conf" option in
-        spark-submit.
-        """
-        return pulumi.get(self, "spark_conf")
-
-    @_builtins.property
-    @pulumi.getter(name="sparkVersion")
-    def spark_version(self) -> Optional[_builtins.str]:
-        """
-        SparkVersion is the version of Spark the spark connect use.
-        """
-        return pulumi.get(self, "spark_version")
-
-
-@pulumi.output_type
-class SparkConnectSpecServer(dict):
-    """
-    Server is the Spark connect server specification.
-    """
-    def __init__(__self__, *,
-                 cores: Optional[_builtins.int] = None,
-                 memory: Optional[_builtins.str] = None,
-                 service: Optional['outputs.SparkConnectSpecServerService'] = None,
-                 template: Optional[Mapping[str, Any]] = None):
-        """
-        Server is the Spark connect server specification.
-
-        :param _builtins.int cores: Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-        :param _builtins.str memory: Memory is the amount of memory to request for the pod.
-        :param Mapping[str, Any] template: Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-               Spark version >= 3.0.0 is required.
-               Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-        """
-        if cores is not None:
-            pulumi.set(__self__, "cores", cores)
-        if memory is not None:
-            pulumi.set(__self__, "memory", memory)
-        if service is not None:
-            pulumi.set(__self__, "service", service)
-        if template is not None:
-            pulumi.set(__self__, "template", template)
-
-    @_builtins.property
-    @pulumi.getter
-    def cores(self) -> Optional[_builtins.int]:
-        """
-        Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-        """
-        return pulumi.get(self, "cores")
-
-    @_builtins.property
-    @pulumi.getter
-    def memory(self) -> Optional[_builtins.str]:
-        """
-        Memory is the amount of memory to request for the pod.
-        """
-        return pulumi.get(self, "memory")
-
-    @_builtins.property
-    @pulumi.getter
-    def service(self) -> Optional['outputs.SparkConnectSpecServerService']:
-        return pulumi.get(self, "service")
-
-    @_builtins.property
-    @pulumi.getter
-    def template(self) -> Optional[Mapping[str, Any]]:
-        """
-        Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-        Spark version >= 3.0.0 is required.
-        Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-        """
-        return pulumi.get(self, "template")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerPatch(dict):
-    """
-    Server is the Spark connect server specification.
-    """
-    def __init__(__self__, *,
-                 cores: Optional[_builtins.int] = None,
-                 memory: Optional[_builtins.str] = None,
-                 service: Optional['outputs.SparkConnectSpecServerServicePatch'] = None,
-                 template: Optional[Mapping[str, Any]] = None):
-        """
-        Server is the Spark connect server specification.
-
-        :param _builtins.int cores: Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-        :param _builtins.str memory: Memory is the amount of memory to request for the pod.
-        :param Mapping[str, Any] template: Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-               Spark version >= 3.0.0 is required.
-               Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-        """
-        if cores is not None:
-            pulumi.set(__self__, "cores", cores)
-        if memory is not None:
-            pulumi.set(__self__, "memory", memory)
-        if service is not None:
-            pulumi.set(__self__, "service", service)
-        if template is not None:
-            pulumi.set(__self__, "template", template)
-
-    @_builtins.property
-    @pulumi.getter
-    def cores(self) -> Optional[_builtins.int]:
-        """
-        Cores maps to `spark.driver.cores` or `spark.executor.cores` for the driver and executors, respectively.
-        """
-        return pulumi.get(self, "cores")
-
-    @_builtins.property
-    @pulumi.getter
-    def memory(self) -> Optional[_builtins.str]:
-        """
-        Memory is the amount of memory to request for the pod.
-        """
-        return pulumi.get(self, "memory")
-
-    @_builtins.property
-    @pulumi.getter
-    def service(self) -> Optional['outputs.SparkConnectSpecServerServicePatch']:
-        return pulumi.get(self, "service")
-
-    @_builtins.property
-    @pulumi.getter
-    def template(self) -> Optional[Mapping[str, Any]]:
-        """
-        Template is a pod template that can be used to define the driver or executor pod configurations that Spark configurations do not support.
-        Spark version >= 3.0.0 is required.
-        Ref: https://spark.apache.org/docs/latest/running-on-kubernetes.html#pod-template.
-        """
-        return pulumi.get(self, "template")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerService(dict):
-    """
-    Service exposes the Spark connect server.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "apiVersion":
-            suggest = "api_version"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecServerService. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecServerService.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecServerService.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 api_version: Optional[_builtins.str] = None,
-                 kind: Optional[_builtins.str] = None,
-                 metadata: Optional['outputs.SparkConnectSpecServerServiceMetadata'] = None,
-                 spec: Optional['outputs.SparkConnectSpecServerServiceSpec'] = None,
-                 status: Optional['outputs.SparkConnectSpecServerServiceStatus'] = None):
-        """
-        Service exposes the Spark connect server.
-
-        :param _builtins.str api_version: APIVersion defines the versioned schema of this representation of an object.
-               Servers should convert recognized schemas to the latest internal value, and
-               may reject unrecognized values.
-               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        :param _builtins.str kind: Kind is a string value representing the REST resource this object represents.
-               Servers may infer this from the endpoint the client submits requests to.
-               Cannot be updated.
-               In CamelCase.
-               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        if api_version is not None:
-            pulumi.set(__self__, "api_version", api_version)
-        if kind is not None:
-            pulumi.set(__self__, "kind", kind)
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter(name="apiVersion")
-    def api_version(self) -> Optional[_builtins.str]:
-        """
-        APIVersion defines the versioned schema of this representation of an object.
-        Servers should convert recognized schemas to the latest internal value, and
-        may reject unrecognized values.
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        """
-        return pulumi.get(self, "api_version")
-
-    @_builtins.property
-    @pulumi.getter
-    def kind(self) -> Optional[_builtins.str]:
-        """
-        Kind is a string value representing the REST resource this object represents.
-        Servers may infer this from the endpoint the client submits requests to.
-        Cannot be updated.
-        In CamelCase.
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        return pulumi.get(self, "kind")
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> Optional['outputs.SparkConnectSpecServerServiceMetadata']:
-        return pulumi.get(self, "metadata")
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> Optional['outputs.SparkConnectSpecServerServiceSpec']:
-        return pulumi.get(self, "spec")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional['outputs.SparkConnectSpecServerServiceStatus']:
-        return pulumi.get(self, "status")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceMetadata(dict):
-    """
-    Standard object's metadata.
-    More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-    """
-    def __init__(__self__, *,
-                 annotations: Optional[Mapping[str, _builtins.str]] = None,
-                 finalizers: Optional[Sequence[_builtins.str]] = None,
-                 labels: Optional[Mapping[str, _builtins.str]] = None,
-                 name: Optional[_builtins.str] = None,
-                 namespace: Optional[_builtins.str] = None):
-        """
-        Standard object's metadata.
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        if annotations is not None:
-            pulumi.set(__self__, "annotations", annotations)
-        if finalizers is not None:
-            pulumi.set(__self__, "finalizers", finalizers)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if namespace is not None:
-            pulumi.set(__self__, "namespace", namespace)
-
-    @_builtins.property
-    @pulumi.getter
-    def annotations(self) -> Optional[Mapping[str, _builtins.str]]:
-        return pulumi.get(self, "annotations")
-
-    @_builtins.property
-    @pulumi.getter
-    def finalizers(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "finalizers")
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        return pulumi.get(self, "labels")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespace(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "namespace")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceMetadataPatch(dict):
-    """
-    Standard object's metadata.
-    More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-    """
-    def __init__(__self__, *,
-                 annotations: Optional[Mapping[str, _builtins.str]] = None,
-                 finalizers: Optional[Sequence[_builtins.str]] = None,
-                 labels: Optional[Mapping[str, _builtins.str]] = None,
-                 name: Optional[_builtins.str] = None,
-                 namespace: Optional[_builtins.str] = None):
-        """
-        Standard object's metadata.
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        if annotations is not None:
-            pulumi.set(__self__, "annotations", annotations)
-        if finalizers is not None:
-            pulumi.set(__self__, "finalizers", finalizers)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if namespace is not None:
-            pulumi.set(__self__, "namespace", namespace)
-
-    @_builtins.property
-    @pulumi.getter
-    def annotations(self) -> Optional[Mapping[str, _builtins.str]]:
-        return pulumi.get(self, "annotations")
-
-    @_builtins.property
-    @pulumi.getter
-    def finalizers(self) -> Optional[Sequence[_builtins.str]]:
-        return pulumi.get(self, "finalizers")
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        return pulumi.get(self, "labels")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespace(self) -> Optional[_builtins.str]:
-        return pulumi.get(self, "namespace")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServicePatch(dict):
-    """
-    Service exposes the Spark connect server.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "apiVersion":
-            suggest = "api_version"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecServerServicePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecServerServicePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecServerServicePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 api_version: Optional[_builtins.str] = None,
-                 kind: Optional[_builtins.str] = None,
-                 metadata: Optional['outputs.SparkConnectSpecServerServiceMetadataPatch'] = None,
-                 spec: Optional['outputs.SparkConnectSpecServerServiceSpecPatch'] = None,
-                 status: Optional['outputs.SparkConnectSpecServerServiceStatusPatch'] = None):
-        """
-        Service exposes the Spark connect server.
-
-        :param _builtins.str api_version: APIVersion defines the versioned schema of this representation of an object.
-               Servers should convert recognized schemas to the latest internal value, and
-               may reject unrecognized values.
-               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        :param _builtins.str kind: Kind is a string value representing the REST resource this object represents.
-               Servers may infer this from the endpoint the client submits requests to.
-               Cannot be updated.
-               In CamelCase.
-               More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        if api_version is not None:
-            pulumi.set(__self__, "api_version", api_version)
-        if kind is not None:
-            pulumi.set(__self__, "kind", kind)
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter(name="apiVersion")
-    def api_version(self) -> Optional[_builtins.str]:
-        """
-        APIVersion defines the versioned schema of this representation of an object.
-        Servers should convert recognized schemas to the latest internal value, and
-        may reject unrecognized values.
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        """
-        return pulumi.get(self, "api_version")
-
-    @_builtins.property
-    @pulumi.getter
-    def kind(self) -> Optional[_builtins.str]:
-        """
-        Kind is a string value representing the REST resource this object represents.
-        Servers may infer this from the endpoint the client submits requests to.
-        Cannot be updated.
-        In CamelCase.
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        return pulumi.get(self, "kind")
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> Optional['outputs.SparkConnectSpecServerServiceMetadataPatch']:
-        return pulumi.get(self, "metadata")
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> Optional['outputs.SparkConnectSpecServerServiceSpecPatch']:
-        return pulumi.get(self, "spec")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional['outputs.SparkConnectSpecServerServiceStatusPatch']:
-        return pulumi.get(self, "status")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceSpec(dict):
-    """
-    Spec defines the behavior of a service.
-    https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "allocateLoadBalancerNodePorts":
-            suggest = "allocate_load_balancer_node_ports"
-        elif key == "clusterIP":
-            suggest = "cluster_ip"
-        elif key == "clusterIPs":
-            suggest = "cluster_ips"
-        elif key == "externalIPs":
-            suggest = "external_ips"
-        elif key == "externalName":
-            suggest = "external_name"
-        elif key == "externalTrafficPolicy":
-            suggest = "external_traffic_policy"
-        elif key == "healthCheckNodePort":
-            suggest = "health_check_node_port"
-        elif key == "internalTrafficPolicy":
-            suggest = "internal_traffic_policy"
-        elif key == "ipFamilies":
-            suggest = "ip_families"
-        elif key == "ipFamilyPolicy":
-            suggest = "ip_family_policy"
-        elif key == "loadBalancerClass":
-            suggest = "load_balancer_class"
-        elif key == "loadBalancerIP":
-            suggest = "load_balancer_ip"
-        elif key == "loadBalancerSourceRanges":
-            suggest = "load_balancer_source_ranges"
-        elif key == "publishNotReadyAddresses":
-            suggest = "publish_not_ready_addresses"
-        elif key == "sessionAffinity":
-            suggest = "session_affinity"
-        elif key == "sessionAffinityConfig":
-            suggest = "session_affinity_config"
-        elif key == "trafficDistribution":
-            suggest = "traffic_distribution"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecServerServiceSpec. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecServerServiceSpec.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecServerServiceSpec.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 allocate_load_balancer_node_ports: Optional[_builtins.bool] = None,
-                 cluster_ip: Optional[_builtins.str] = None,
-                 cluster_ips: Optional[Sequence[_builtins.str]] = None,
-                 external_ips: Optional[Sequence[_builtins.str]] = None,
-                 external_name: Optional[_builtins.str] = None,
-                 external_traffic_policy: Optional[_builtins.str] = None,
-                 health_check_node_port: Optional[_builtins.int] = None,
-                 internal_traffic_policy: Optional[_builtins.str] = None,
-                 ip_families: Optional[Sequence[_builtins.str]] = None,
-                 ip_family_policy: Optional[_builtins.str] = None,
-                 load_balancer_class: Optional[_builtins.str] = None,
-                 load_balancer_ip: Optional[_builtins.str] = None,
-                 load_balancer_source_ranges: Optional[Sequence[_builtins.str]] = None,
-                 ports: Optional[Sequence['outputs.SparkConnectSpecServerServiceSpecPorts']] = None,
-                 publish_not_ready_addresses: Optional[_builtins.bool] = None,
-                 selector: Optional[Mapping[str, _builtins.str]] = None,
-                 session_affinity: Optional[_builtins.str] = None,
-                 session_affinity_config: Optional['outputs.SparkConnectSpecServerServiceSpecSessionAffinityConfig'] = None,
-                 traffic_distribution: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        Spec defines the behavior of a service.
-        https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param _builtins.bool allocate_load_balancer_node_ports: allocateLoadBalancerNodePorts defines if NodePorts will be automatically
-               allocated for services with type LoadBalancer.  Default is "true". It
-               may be set to "false" if the cluster load-balancer does not rely on
-               NodePorts.  If the caller requests specific NodePorts (by specifying a
-               value), those requests will be respected, regardless of this field.
-               This field may only be set for services with type LoadBalancer and will
-               be cleared if the type is changed to any other type.
-        :param _builtins.str cluster_ip: clusterIP is the IP address of the service and is usually assigned
-               randomly. If an address is specified manually, is in-range (as per
-               system configuration), and is not in use, it will be allocated to the
-               service; otherwise creation of the service will fail. This field may not
-               be changed through updates unless the type field is also being changed
-               to ExternalName (which requires this field to be blank) or the type
-               field is being changed from ExternalName (in which case this field may
-               optionally be specified, as describe above).  Valid values are "None",
-               empty string (""), or a valid IP address. Setting this to "None" makes a
-               "headless service" (no virtual IP), which is useful when direct endpoint
-               connections are preferred and proxying is not required.  Only applies to
-               types ClusterIP, NodePort, and LoadBalancer. If this field is specified
-               when creating a Service of type ExternalName, creation will fail. This
-               field will be wiped when updating a Service to type ExternalName.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        :param Sequence[_builtins.str] cluster_ips: ClusterIPs is a list of IP addresses assigned to this service, and are
-               usually assigned randomly.  If an address is specified manually, is
-               in-range (as per system configuration), and is not in use, it will be
-               allocated to the service; otherwise creation of the service will fail.
-               This field may not be changed through updates unless the type field is
-               also being changed to ExternalName (which requires this field to be
-               empty) or the type field is being changed from ExternalName (in which
-               case this field may optionally be specified, as describe above).  Valid
-               values are "None", empty string (""), or a valid IP address.  Setting
-               this to "None" makes a "headless service" (no virtual IP), which is
-               useful when direct endpoint connections are preferred and proxying is
-               not required.  Only applies to types ClusterIP, NodePort, and
-               LoadBalancer. If this field is specified when creating a Service of type
-               ExternalName, creation will fail. This field will be wiped when updating
-               a Service to type ExternalName.  If this field is not specified, it will
-               be initialized from the clusterIP field.  If this field is specified,
-               clients must ensure that clusterIPs[0] and clusterIP have the same
-               value.
-
-               This field may hold a maximum of two entries (dual-stack IPs, in either order).
-               These IPs must correspond to the values of the ipFamilies field. Both
-               clusterIPs and ipFamilies are governed by the ipFamilyPolicy field.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        :param Sequence[_builtins.str] external_ips: externalIPs is a list of IP addresses for which nodes in the cluster
-               will also accept traffic for this service.  These IPs are not managed by
-               Kubernetes.  The user is responsible for ensuring that traffic arrives
-               at a node with this IP.  A common example is external load-balancers
-               that are not part of the Kubernetes system.
-        :param _builtins.str external_name: externalName is the external reference that discovery mechanisms will
-               return as an alias for this service (e.g. a DNS CNAME record). No
-               proxying will be involved.  Must be a lowercase RFC-1123 hostname
-               (https://tools.ietf.org/html/rfc1123) and requires `type` to be "ExternalName".
-        :param _builtins.str external_traffic_policy: externalTrafficPolicy describes how nodes distribute service traffic they
-               receive on one of the Service's "externally-facing" addresses (NodePorts,
-               ExternalIPs, and LoadBalancer IPs). If set to "Local", the proxy will configure
-               the service in a way that assumes that external load balancers will take care
-               of balancing the service traffic between nodes, and so each node will deliver
-               traffic only to the node-local endpoints of the service, without masquerading
-               the client source IP. (Traffic mistakenly sent to a node with no endpoints will
-               be dropped.) The default value, "Cluster", uses the standard behavior of
-               routing to all endpoints evenly (possibly modified by topology and other
-               features). Note that traffic sent to an External IP or LoadBalancer IP from
-               within the cluster will always get "Cluster" semantics, but clients sending to
-               a NodePort from within the cluster may need to take traffic policy into account
-               when picking a node.
-        :param _builtins.int health_check_node_port: healthCheckNodePort specifies the healthcheck nodePort for the service.
-               This only applies when type is set to LoadBalancer and
-               externalTrafficPolicy is set to Local. If a value is specified, is
-               in-range, and is not in use, it will be used.  If not specified, a value
-               will be automatically allocated.  External systems (e.g. load-balancers)
-               can use this port to determine if a given node holds endpoints for this
-               service or not.  If this field is specified when creating a Service
-               which does not need it, creation will fail. This field will be wiped
-               when updating a Service to no longer need it (e.g. changing type).
-               This field cannot be updated once set.
-        :param _builtins.str internal_traffic_policy: InternalTrafficPolicy describes how nodes distribute service traffic they
-               receive on the ClusterIP. If set to "Local", the proxy will assume that pods
-               only want to talk to endpoints of the service on the same node as the pod,
-               dropping the traffic if there are no local endpoints. The default value,
-               "Cluster", uses the standard behavior of routing to all endpoints evenly
-               (possibly modified by topology and other features).
-        :param Sequence[_builtins.str] ip_families: IPFamilies is a list of IP families (e.g. IPv4, IPv6) assigned to this
-               service. This field is usually assigned automatically based on cluster
-               configuration and the ipFamilyPolicy field. If this field is specified
-               manually, the requested family is available in the cluster,
-               and ipFamilyPolicy allows it, it will be used; otherwise creation of
-               the service will fail. This field is conditionally mutable: it allows
-               for adding or removing a secondary IP family, but it does not allow
-               changing the primary IP family of the Service. Valid values are "IPv4"
-               and "IPv6".  This field only applies to Services of types ClusterIP,
-               NodePort, and LoadBalancer, and does apply to "headless" services.
-               This field will be wiped when updating a Service to type ExternalName.
-
-               This field may hold a maximum of two entries (dual-stack families, in
-               either order).  These families must correspond to the values of the
-               clusterIPs field, if specified. Both clusterIPs and ipFamilies are
-               governed by the ipFamilyPolicy field.
-        :param _builtins.str ip_family_policy: IPFamilyPolicy represents the dual-stack-ness requested or required by
-               this Service. If there is no value provided, then this field will be set
-               to SingleStack. Services can be "SingleStack" (a single IP family),
-               "PreferDualStack" (two IP families on dual-stack configured clusters or
-               a single IP family on single-stack clusters), or "RequireDualStack"
-               (two IP families on dual-stack configured clusters, otherwise fail). The
-               ipFamilies and clusterIPs fields depend on the value of this field. This
-               field will be wiped when updating a service to type ExternalName.
-        :param _builtins.str load_balancer_class: loadBalancerClass is the class of the load balancer implementation this Service belongs to.
-               If specified, the value of this field must be a label-style identifier, with an optional prefix,
-               e.g. "internal-vip" or "example.com/internal-vip". Unprefixed names are reserved for end-users.
-               This field can only be set when the Service type is 'LoadBalancer'. If not set, the default load
-               balancer implementation is used, today this is typically done through the cloud provider integration,
-               but should apply for any default implementation. If set, it is assumed that a load balancer
-               implementation is watching for Services with a matching class. Any default load balancer
-               implementation (e.g. cloud providers) should ignore Services that set this field.
-               This field can only be set when creating or updating a Service to type 'LoadBalancer'.
-               Once set, it can not be changed. This field will be wiped when a service is updated to a non 'LoadBalancer' type.
-        :param _builtins.str load_balancer_ip: Only applies to Service Type: LoadBalancer.
-               This feature depends on whether the underlying cloud-provider supports specifying
-               the loadBalancerIP when a load balancer is created.
-               This field will be ignored if the cloud-provider does not support the feature.
-               Deprecated: This field was under-specified and its meaning varies across implementations.
-               Using it is non-portable and it may not support dual-stack.
-               Users are encouraged to use implementation-specific annotations when available.
-        :param Sequence[_builtins.str] load_balancer_source_ranges: If specified and supported by the platform, this will restrict traffic through the cloud-provider
-               load-balancer will be restricted to the specified client IPs. This field will be ignored if the
-               cloud-provider does not support the feature."
-               More info: https://kubernetes.io/docs/tasks/access-application-cluster/create-external-load-balancer/
-        :param Sequence['SparkConnectSpecServerServiceSpecPortsArgs'] ports: The list of ports that are exposed by this service.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        :param _builtins.bool publish_not_ready_addresses: publishNotReadyAddresses indicates that any agent which deals with endpoints for this
-               Service should disregard any indications of ready/not-ready.
-               The primary use case for setting this field is for a StatefulSet's Headless Service to
-               propagate SRV DNS records for its Pods for the purpose of peer discovery.
-               The Kubernetes controllers that generate Endpoints and EndpointSlice resources for
-               Services interpret this to mean that all endpoints are considered "ready" even if the
-               Pods themselves are not. Agents which consume only Kubernetes generated endpoints
-               through the Endpoints or EndpointSlice resources can safely assume this behavior.
-        :param Mapping[str, _builtins.str] selector: Route service traffic to pods with label keys and values matching this
-               selector. If empty or not present, the service is assumed to have an
-               external process managing its endpoints, which Kubernetes will not
-               modify. Only applies to types ClusterIP, NodePort, and LoadBalancer.
-               Ignored if type is ExternalName.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/
-        :param _builtins.str session_affinity: Supports "ClientIP" and "None". Used to maintain session affinity.
-               Enable client IP based session affinity.
-               Must be ClientIP or None.
-               Defaults to None.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        :param _builtins.str traffic_distribution: TrafficDistribution offers a way to express preferences for how traffic is
-               distributed to Service endpoints. Implementations can use this field as a
-               hint, but are not required to guarantee strict adherence. If the field is
-               not set, the implementation will apply its default routing strategy. If set
-               to "PreferClose", implementations should prioritize endpoints that are
-               topologically close (e.g., same zone).
-               This is a beta field and requires enabling ServiceTrafficDistribution feature.
-        :param _builtins.str type: type determines how the Service is exposed. Defaults to ClusterIP. Valid
-               options are ExternalName, ClusterIP, NodePort, and LoadBalancer.
-               "ClusterIP" allocates a cluster-internal IP address for load-balancing
-               to endpoints. Endpoints are determined by the selector or if that is not
-               specified, by manual construction of an Endpoints object or
-               EndpointSlice objects. If clusterIP is "None", no virtual IP is
-               allocated and the endpoints are published as a set of endpoints rather
-               than a virtual IP.
-               "NodePort" builds on ClusterIP and allocates a port on every node which
-               routes to the same endpoints as the clusterIP.
-               "LoadBalancer" builds on NodePort and creates an external load-balancer
-               (if supported in the current cloud) which routes to the same endpoints
-               as the clusterIP.
-               "ExternalName" aliases this service to the specified externalName.
-               Several other fields do not apply to ExternalName services.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#publishing-services-service-types
-        """
-        if allocate_load_balancer_node_ports is not None:
-            pulumi.set(__self__, "allocate_load_balancer_node_ports", allocate_load_balancer_node_ports)
-        if cluster_ip is not None:
-            pulumi.set(__self__, "cluster_ip", cluster_ip)
-        if cluster_ips is not None:
-            pulumi.set(__self__, "cluster_ips", cluster_ips)
-        if external_ips is not None:
-            pulumi.set(__self__, "external_ips", external_ips)
-        if external_name is not None:
-            pulumi.set(__self__, "external_name", external_name)
-        if external_traffic_policy is not None:
-            pulumi.set(__self__, "external_traffic_policy", external_traffic_policy)
-        if health_check_node_port is not None:
-            pulumi.set(__self__, "health_check_node_port", health_check_node_port)
-        if internal_traffic_policy is not None:
-            pulumi.set(__self__, "internal_traffic_policy", internal_traffic_policy)
-        if ip_families is not None:
-            pulumi.set(__self__, "ip_families", ip_families)
-        if ip_family_policy is not None:
-            pulumi.set(__self__, "ip_family_policy", ip_family_policy)
-        if load_balancer_class is not None:
-            pulumi.set(__self__, "load_balancer_class", load_balancer_class)
-        if load_balancer_ip is not None:
-            pulumi.set(__self__, "load_balancer_ip", load_balancer_ip)
-        if load_balancer_source_ranges is not None:
-            pulumi.set(__self__, "load_balancer_source_ranges", load_balancer_source_ranges)
-        if ports is not None:
-            pulumi.set(__self__, "ports", ports)
-        if publish_not_ready_addresses is not None:
-            pulumi.set(__self__, "publish_not_ready_addresses", publish_not_ready_addresses)
-        if selector is not None:
-            pulumi.set(__self__, "selector", selector)
-        if session_affinity is not None:
-            pulumi.set(__self__, "session_affinity", session_affinity)
-        if session_affinity_config is not None:
-            pulumi.set(__self__, "session_affinity_config", session_affinity_config)
-        if traffic_distribution is not None:
-            pulumi.set(__self__, "traffic_distribution", traffic_distribution)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="allocateLoadBalancerNodePorts")
-    def allocate_load_balancer_node_ports(self) -> Optional[_builtins.bool]:
-        """
-        allocateLoadBalancerNodePorts defines if NodePorts will be automatically
-        allocated for services with type LoadBalancer.  Default is "true". It
-        may be set to "false" if the cluster load-balancer does not rely on
-        NodePorts.  If the caller requests specific NodePorts (by specifying a
-        value), those requests will be respected, regardless of this field.
-        This field may only be set for services with type LoadBalancer and will
-        be cleared if the type is changed to any other type.
-        """
-        return pulumi.get(self, "allocate_load_balancer_node_ports")
-
-    @_builtins.property
-    @pulumi.getter(name="clusterIP")
-    def cluster_ip(self) -> Optional[_builtins.str]:
-        """
-        clusterIP is the IP address of the service and is usually assigned
-        randomly. If an address is specified manually, is in-range (as per
-        system configuration), and is not in use, it will be allocated to the
-        service; otherwise creation of the service will fail. This field may not
-        be changed through updates unless the type field is also being changed
-        to ExternalName (which requires this field to be blank) or the type
-        field is being changed from ExternalName (in which case this field may
-        optionally be specified, as describe above).  Valid values are "None",
-        empty string (""), or a valid IP address. Setting this to "None" makes a
-        "headless service" (no virtual IP), which is useful when direct endpoint
-        connections are preferred and proxying is not required.  Only applies to
-        types ClusterIP, NodePort, and LoadBalancer. If this field is specified
-        when creating a Service of type ExternalName, creation will fail. This
-        field will be wiped when updating a Service to type ExternalName.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        """
-        return pulumi.get(self, "cluster_ip")
-
-    @_builtins.property
-    @pulumi.getter(name="clusterIPs")
-    def cluster_ips(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        ClusterIPs is a list of IP addresses assigned to this service, and are
-        usually assigned randomly.  If an address is specified manually, is
-        in-range (as per system configuration), and is not in use, it will be
-        allocated to the service; otherwise creation of the service will fail.
-        This field may not be changed through updates unless the type field is
-        also being changed to ExternalName (which requires this field to be
-        empty) or the type field is being changed from ExternalName (in which
-        case this field may optionally be specified, as describe above).  Valid
-        values are "None", empty string (""), or a valid IP address.  Setting
-        this to "None" makes a "headless service" (no virtual IP), which is
-        useful when direct endpoint connections are preferred and proxying is
-        not required.  Only applies to types ClusterIP, NodePort, and
-        LoadBalancer. If this field is specified when creating a Service of type
-        ExternalName, creation will fail. This field will be wiped when updating
-        a Service to type ExternalName.  If this field is not specified, it will
-        be initialized from the clusterIP field.  If this field is specified,
-        clients must ensure that clusterIPs[0] and clusterIP have the same
-        value.
-
-        This field may hold a maximum of two entries (dual-stack IPs, in either order).
-        These IPs must correspond to the values of the ipFamilies field. Both
-        clusterIPs and ipFamilies are governed by the ipFamilyPolicy field.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        """
-        return pulumi.get(self, "cluster_ips")
-
-    @_builtins.property
-    @pulumi.getter(name="externalIPs")
-    def external_ips(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        externalIPs is a list of IP addresses for which nodes in the cluster
-        will also accept traffic for this service.  These IPs are not managed by
-        Kubernetes.  The user is responsible for ensuring that traffic arrives
-        at a node with this IP.  A common example is external load-balancers
-        that are not part of the Kubernetes system.
-        """
-        return pulumi.get(self, "external_ips")
-
-    @_builtins.property
-    @pulumi.getter(name="externalName")
-    def external_name(self) -> Optional[_builtins.str]:
-        """
-        externalName is the external reference that discovery mechanisms will
-        return as an alias for this service (e.g. a DNS CNAME record). No
-        proxying will be involved.  Must be a lowercase RFC-1123 hostname
-        (https://tools.ietf.org/html/rfc1123) and requires `type` to be "ExternalName".
-        """
-        return pulumi.get(self, "external_name")
-
-    @_builtins.property
-    @pulumi.getter(name="externalTrafficPolicy")
-    def external_traffic_policy(self) -> Optional[_builtins.str]:
-        """
-        externalTrafficPolicy describes how nodes distribute service traffic they
-        receive on one of the Service's "externally-facing" addresses (NodePorts,
-        ExternalIPs, and LoadBalancer IPs). If set to "Local", the proxy will configure
-        the service in a way that assumes that external load balancers will take care
-        of balancing the service traffic between nodes, and so each node will deliver
-        traffic only to the node-local endpoints of the service, without masquerading
-        the client source IP. (Traffic mistakenly sent to a node with no endpoints will
-        be dropped.) The default value, "Cluster", uses the standard behavior of
-        routing to all endpoints evenly (possibly modified by topology and other
-        features). Note that traffic sent to an External IP or LoadBalancer IP from
-        within the cluster will always get "Cluster" semantics, but clients sending to
-        a NodePort from within the cluster may need to take traffic policy into account
-        when picking a node.
-        """
-        return pulumi.get(self, "external_traffic_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="healthCheckNodePort")
-    def health_check_node_port(self) -> Optional[_builtins.int]:
-        """
-        healthCheckNodePort specifies the healthcheck nodePort for the service.
-        This only applies when type is set to LoadBalancer and
-        externalTrafficPolicy is set to Local. If a value is specified, is
-        in-range, and is not in use, it will be used.  If not specified, a value
-        will be automatically allocated.  External systems (e.g. load-balancers)
-        can use this port to determine if a given node holds endpoints for this
-        service or not.  If this field is specified when creating a Service
-        which does not need it, creation will fail. This field will be wiped
-        when updating a Service to no longer need it (e.g. changing type).
-        This field cannot be updated once set.
-        """
-        return pulumi.get(self, "health_check_node_port")
-
-    @_builtins.property
-    @pulumi.getter(name="internalTrafficPolicy")
-    def internal_traffic_policy(self) -> Optional[_builtins.str]:
-        """
-        InternalTrafficPolicy describes how nodes distribute service traffic they
-        receive on the ClusterIP. If set to "Local", the proxy will assume that pods
-        only want to talk to endpoints of the service on the same node as the pod,
-        dropping the traffic if there are no local endpoints. The default value,
-        "Cluster", uses the standard behavior of routing to all endpoints evenly
-        (possibly modified by topology and other features).
-        """
-        return pulumi.get(self, "internal_traffic_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="ipFamilies")
-    def ip_families(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        IPFamilies is a list of IP families (e.g. IPv4, IPv6) assigned to this
-        service. This field is usually assigned automatically based on cluster
-        configuration and the ipFamilyPolicy field. If this field is specified
-        manually, the requested family is available in the cluster,
-        and ipFamilyPolicy allows it, it will be used; otherwise creation of
-        the service will fail. This field is conditionally mutable: it allows
-        for adding or removing a secondary IP family, but it does not allow
-        changing the primary IP family of the Service. Valid values are "IPv4"
-        and "IPv6".  This field only applies to Services of types ClusterIP,
-        NodePort, and LoadBalancer, and does apply to "headless" services.
-        This field will be wiped when updating a Service to type ExternalName.
-
-        This field may hold a maximum of two entries (dual-stack families, in
-        either order).  These families must correspond to the values of the
-        clusterIPs field, if specified. Both clusterIPs and ipFamilies are
-        governed by the ipFamilyPolicy field.
-        """
-        return pulumi.get(self, "ip_families")
-
-    @_builtins.property
-    @pulumi.getter(name="ipFamilyPolicy")
-    def ip_family_policy(self) -> Optional[_builtins.str]:
-        """
-        IPFamilyPolicy represents the dual-stack-ness requested or required by
-        this Service. If there is no value provided, then this field will be set
-        to SingleStack. Services can be "SingleStack" (a single IP family),
-        "PreferDualStack" (two IP families on dual-stack configured clusters or
-        a single IP family on single-stack clusters), or "RequireDualStack"
-        (two IP families on dual-stack configured clusters, otherwise fail). The
-        ipFamilies and clusterIPs fields depend on the value of this field. This
-        field will be wiped when updating a service to type ExternalName.
-        """
-        return pulumi.get(self, "ip_family_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="loadBalancerClass")
-    def load_balancer_class(self) -> Optional[_builtins.str]:
-        """
-        loadBalancerClass is the class of the load balancer implementation this Service belongs to.
-        If specified, the value of this field must be a label-style identifier, with an optional prefix,
-        e.g. "internal-vip" or "example.com/internal-vip". Unprefixed names are reserved for end-users.
-        This field can only be set when the Service type is 'LoadBalancer'. If not set, the default load
-        balancer implementation is used, today this is typically done through the cloud provider integration,
-        but should apply for any default implementation. If set, it is assumed that a load balancer
-        implementation is watching for Services with a matching class. Any default load balancer
-        implementation (e.g. cloud providers) should ignore Services that set this field.
-        This field can only be set when creating or updating a Service to type 'LoadBalancer'.
-        Once set, it can not be changed. This field will be wiped when a service is updated to a non 'LoadBalancer' type.
-        """
-        return pulumi.get(self, "load_balancer_class")
-
-    @_builtins.property
-    @pulumi.getter(name="loadBalancerIP")
-    def load_balancer_ip(self) -> Optional[_builtins.str]:
-        """
-        Only applies to Service Type: LoadBalancer.
-        This feature depends on whether the underlying cloud-provider supports specifying
-        the loadBalancerIP when a load balancer is created.
-        This field will be ignored if the cloud-provider does not support the feature.
-        Deprecated: This field was under-specified and its meaning varies across implementations.
-        Using it is non-portable and it may not support dual-stack.
-        Users are encouraged to use implementation-specific annotations when available.
-        """
-        return pulumi.get(self, "load_balancer_ip")
-
-    @_builtins.property
-    @pulumi.getter(name="loadBalancerSourceRanges")
-    def load_balancer_source_ranges(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        If specified and supported by the platform, this will restrict traffic through the cloud-provider
-        load-balancer will be restricted to the specified client IPs. This field will be ignored if the
-        cloud-provider does not support the feature."
-        More info: https://kubernetes.io/docs/tasks/access-application-cluster/create-external-load-balancer/
-        """
-        return pulumi.get(self, "load_balancer_source_ranges")
-
-    @_builtins.property
-    @pulumi.getter
-    def ports(self) -> Optional[Sequence['outputs.SparkConnectSpecServerServiceSpecPorts']]:
-        """
-        The list of ports that are exposed by this service.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        """
-        return pulumi.get(self, "ports")
-
-    @_builtins.property
-    @pulumi.getter(name="publishNotReadyAddresses")
-    def publish_not_ready_addresses(self) -> Optional[_builtins.bool]:
-        """
-        publishNotReadyAddresses indicates that any agent which deals with endpoints for this
-        Service should disregard any indications of ready/not-ready.
-        The primary use case for setting this field is for a StatefulSet's Headless Service to
-        propagate SRV DNS records for its Pods for the purpose of peer discovery.
-        The Kubernetes controllers that generate Endpoints and EndpointSlice resources for
-        Services interpret this to mean that all endpoints are considered "ready" even if the
-        Pods themselves are not. Agents which consume only Kubernetes generated endpoints
-        through the Endpoints or EndpointSlice resources can safely assume this behavior.
-        """
-        return pulumi.get(self, "publish_not_ready_addresses")
-
-    @_builtins.property
-    @pulumi.getter
-    def selector(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        Route service traffic to pods with label keys and values matching this
-        selector. If empty or not present, the service is assumed to have an
-        external process managing its endpoints, which Kubernetes will not
-        modify. Only applies to types ClusterIP, NodePort, and LoadBalancer.
-        Ignored if type is ExternalName.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/
-        """
-        return pulumi.get(self, "selector")
-
-    @_builtins.property
-    @pulumi.getter(name="sessionAffinity")
-    def session_affinity(self) -> Optional[_builtins.str]:
-        """
-        Supports "ClientIP" and "None". Used to maintain session affinity.
-        Enable client IP based session affinity.
-        Must be ClientIP or None.
-        Defaults to None.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        """
-        return pulumi.get(self, "session_affinity")
-
-    @_builtins.property
-    @pulumi.getter(name="sessionAffinityConfig")
-    def session_affinity_config(self) -> Optional['outputs.SparkConnectSpecServerServiceSpecSessionAffinityConfig']:
-        return pulumi.get(self, "session_affinity_config")
-
-    @_builtins.property
-    @pulumi.getter(name="trafficDistribution")
-    def traffic_distribution(self) -> Optional[_builtins.str]:
-        """
-        TrafficDistribution offers a way to express preferences for how traffic is
-        distributed to Service endpoints. Implementations can use this field as a
-        hint, but are not required to guarantee strict adherence. If the field is
-        not set, the implementation will apply its default routing strategy. If set
-        to "PreferClose", implementations should prioritize endpoints that are
-        topologically close (e.g., same zone).
-        This is a beta field and requires enabling ServiceTrafficDistribution feature.
-        """
-        return pulumi.get(self, "traffic_distribution")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type determines how the Service is exposed. Defaults to ClusterIP. Valid
-        options are ExternalName, ClusterIP, NodePort, and LoadBalancer.
-        "ClusterIP" allocates a cluster-internal IP address for load-balancing
-        to endpoints. Endpoints are determined by the selector or if that is not
-        specified, by manual construction of an Endpoints object or
-        EndpointSlice objects. If clusterIP is "None", no virtual IP is
-        allocated and the endpoints are published as a set of endpoints rather
-        than a virtual IP.
-        "NodePort" builds on ClusterIP and allocates a port on every node which
-        routes to the same endpoints as the clusterIP.
-        "LoadBalancer" builds on NodePort and creates an external load-balancer
-        (if supported in the current cloud) which routes to the same endpoints
-        as the clusterIP.
-        "ExternalName" aliases this service to the specified externalName.
-        Several other fields do not apply to ExternalName services.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#publishing-services-service-types
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceSpecPatch(dict):
-    """
-    Spec defines the behavior of a service.
-    https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "allocateLoadBalancerNodePorts":
-            suggest = "allocate_load_balancer_node_ports"
-        elif key == "clusterIP":
-            suggest = "cluster_ip"
-        elif key == "clusterIPs":
-            suggest = "cluster_ips"
-        elif key == "externalIPs":
-            suggest = "external_ips"
-        elif key == "externalName":
-            suggest = "external_name"
-        elif key == "externalTrafficPolicy":
-            suggest = "external_traffic_policy"
-        elif key == "healthCheckNodePort":
-            suggest = "health_check_node_port"
-        elif key == "internalTrafficPolicy":
-            suggest = "internal_traffic_policy"
-        elif key == "ipFamilies":
-            suggest = "ip_families"
-        elif key == "ipFamilyPolicy":
-            suggest = "ip_family_policy"
-        elif key == "loadBalancerClass":
-            suggest = "load_balancer_class"
-        elif key == "loadBalancerIP":
-            suggest = "load_balancer_ip"
-        elif key == "loadBalancerSourceRanges":
-            suggest = "load_balancer_source_ranges"
-        elif key == "publishNotReadyAddresses":
-            suggest = "publish_not_ready_addresses"
-        elif key == "sessionAffinity":
-            suggest = "session_affinity"
-        elif key == "sessionAffinityConfig":
-            suggest = "session_affinity_config"
-        elif key == "trafficDistribution":
-            suggest = "traffic_distribution"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecServerServiceSpecPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecServerServiceSpecPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecServerServiceSpecPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 allocate_load_balancer_node_ports: Optional[_builtins.bool] = None,
-                 cluster_ip: Optional[_builtins.str] = None,
-                 cluster_ips: Optional[Sequence[_builtins.str]] = None,
-                 external_ips: Optional[Sequence[_builtins.str]] = None,
-                 external_name: Optional[_builtins.str] = None,
-                 external_traffic_policy: Optional[_builtins.str] = None,
-                 health_check_node_port: Optional[_builtins.int] = None,
-                 internal_traffic_policy: Optional[_builtins.str] = None,
-                 ip_families: Optional[Sequence[_builtins.str]] = None,
-                 ip_family_policy: Optional[_builtins.str] = None,
-                 load_balancer_class: Optional[_builtins.str] = None,
-                 load_balancer_ip: Optional[_builtins.str] = None,
-                 load_balancer_source_ranges: Optional[Sequence[_builtins.str]] = None,
-                 ports: Optional[Sequence['outputs.SparkConnectSpecServerServiceSpecPortsPatch']] = None,
-                 publish_not_ready_addresses: Optional[_builtins.bool] = None,
-                 selector: Optional[Mapping[str, _builtins.str]] = None,
-                 session_affinity: Optional[_builtins.str] = None,
-                 session_affinity_config: Optional['outputs.SparkConnectSpecServerServiceSpecSessionAffinityConfigPatch'] = None,
-                 traffic_distribution: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        Spec defines the behavior of a service.
-        https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param _builtins.bool allocate_load_balancer_node_ports: allocateLoadBalancerNodePorts defines if NodePorts will be automatically
-               allocated for services with type LoadBalancer.  Default is "true". It
-               may be set to "false" if the cluster load-balancer does not rely on
-               NodePorts.  If the caller requests specific NodePorts (by specifying a
-               value), those requests will be respected, regardless of this field.
-               This field may only be set for services with type LoadBalancer and will
-               be cleared if the type is changed to any other type.
-        :param _builtins.str cluster_ip: clusterIP is the IP address of the service and is usually assigned
-               randomly. If an address is specified manually, is in-range (as per
-               system configuration), and is not in use, it will be allocated to the
-               service; otherwise creation of the service will fail. This field may not
-               be changed through updates unless the type field is also being changed
-               to ExternalName (which requires this field to be blank) or the type
-               field is being changed from ExternalName (in which case this field may
-               optionally be specified, as describe above).  Valid values are "None",
-               empty string (""), or a valid IP address. Setting this to "None" makes a
-               "headless service" (no virtual IP), which is useful when direct endpoint
-               connections are preferred and proxying is not required.  Only applies to
-               types ClusterIP, NodePort, and LoadBalancer. If this field is specified
-               when creating a Service of type ExternalName, creation will fail. This
-               field will be wiped when updating a Service to type ExternalName.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        :param Sequence[_builtins.str] cluster_ips: ClusterIPs is a list of IP addresses assigned to this service, and are
-               usually assigned randomly.  If an address is specified manually, is
-               in-range (as per system configuration), and is not in use, it will be
-               allocated to the service; otherwise creation of the service will fail.
-               This field may not be changed through updates unless the type field is
-               also being changed to ExternalName (which requires this field to be
-               empty) or the type field is being changed from ExternalName (in which
-               case this field may optionally be specified, as describe above).  Valid
-               values are "None", empty string (""), or a valid IP address.  Setting
-               this to "None" makes a "headless service" (no virtual IP), which is
-               useful when direct endpoint connections are preferred and proxying is
-               not required.  Only applies to types ClusterIP, NodePort, and
-               LoadBalancer. If this field is specified when creating a Service of type
-               ExternalName, creation will fail. This field will be wiped when updating
-               a Service to type ExternalName.  If this field is not specified, it will
-               be initialized from the clusterIP field.  If this field is specified,
-               clients must ensure that clusterIPs[0] and clusterIP have the same
-               value.
-
-               This field may hold a maximum of two entries (dual-stack IPs, in either order).
-               These IPs must correspond to the values of the ipFamilies field. Both
-               clusterIPs and ipFamilies are governed by the ipFamilyPolicy field.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        :param Sequence[_builtins.str] external_ips: externalIPs is a list of IP addresses for which nodes in the cluster
-               will also accept traffic for this service.  These IPs are not managed by
-               Kubernetes.  The user is responsible for ensuring that traffic arrives
-               at a node with this IP.  A common example is external load-balancers
-               that are not part of the Kubernetes system.
-        :param _builtins.str external_name: externalName is the external reference that discovery mechanisms will
-               return as an alias for this service (e.g. a DNS CNAME record). No
-               proxying will be involved.  Must be a lowercase RFC-1123 hostname
-               (https://tools.ietf.org/html/rfc1123) and requires `type` to be "ExternalName".
-        :param _builtins.str external_traffic_policy: externalTrafficPolicy describes how nodes distribute service traffic they
-               receive on one of the Service's "externally-facing" addresses (NodePorts,
-               ExternalIPs, and LoadBalancer IPs). If set to "Local", the proxy will configure
-               the service in a way that assumes that external load balancers will take care
-               of balancing the service traffic between nodes, and so each node will deliver
-               traffic only to the node-local endpoints of the service, without masquerading
-               the client source IP. (Traffic mistakenly sent to a node with no endpoints will
-               be dropped.) The default value, "Cluster", uses the standard behavior of
-               routing to all endpoints evenly (possibly modified by topology and other
-               features). Note that traffic sent to an External IP or LoadBalancer IP from
-               within the cluster will always get "Cluster" semantics, but clients sending to
-               a NodePort from within the cluster may need to take traffic policy into account
-               when picking a node.
-        :param _builtins.int health_check_node_port: healthCheckNodePort specifies the healthcheck nodePort for the service.
-               This only applies when type is set to LoadBalancer and
-               externalTrafficPolicy is set to Local. If a value is specified, is
-               in-range, and is not in use, it will be used.  If not specified, a value
-               will be automatically allocated.  External systems (e.g. load-balancers)
-               can use this port to determine if a given node holds endpoints for this
-               service or not.  If this field is specified when creating a Service
-               which does not need it, creation will fail. This field will be wiped
-               when updating a Service to no longer need it (e.g. changing type).
-               This field cannot be updated once set.
-        :param _builtins.str internal_traffic_policy: InternalTrafficPolicy describes how nodes distribute service traffic they
-               receive on the ClusterIP. If set to "Local", the proxy will assume that pods
-               only want to talk to endpoints of the service on the same node as the pod,
-               dropping the traffic if there are no local endpoints. The default value,
-               "Cluster", uses the standard behavior of routing to all endpoints evenly
-               (possibly modified by topology and other features).
-        :param Sequence[_builtins.str] ip_families: IPFamilies is a list of IP families (e.g. IPv4, IPv6) assigned to this
-               service. This field is usually assigned automatically based on cluster
-               configuration and the ipFamilyPolicy field. If this field is specified
-               manually, the requested family is available in the cluster,
-               and ipFamilyPolicy allows it, it will be used; otherwise creation of
-               the service will fail. This field is conditionally mutable: it allows
-               for adding or removing a secondary IP family, but it does not allow
-               changing the primary IP family of the Service. Valid values are "IPv4"
-               and "IPv6".  This field only applies to Services of types ClusterIP,
-               NodePort, and LoadBalancer, and does apply to "headless" services.
-               This field will be wiped when updating a Service to type ExternalName.
-
-               This field may hold a maximum of two entries (dual-stack families, in
-               either order).  These families must correspond to the values of the
-               clusterIPs field, if specified. Both clusterIPs and ipFamilies are
-               governed by the ipFamilyPolicy field.
-        :param _builtins.str ip_family_policy: IPFamilyPolicy represents the dual-stack-ness requested or required by
-               this Service. If there is no value provided, then this field will be set
-               to SingleStack. Services can be "SingleStack" (a single IP family),
-               "PreferDualStack" (two IP families on dual-stack configured clusters or
-               a single IP family on single-stack clusters), or "RequireDualStack"
-               (two IP families on dual-stack configured clusters, otherwise fail). The
-               ipFamilies and clusterIPs fields depend on the value of this field. This
-               field will be wiped when updating a service to type ExternalName.
-        :param _builtins.str load_balancer_class: loadBalancerClass is the class of the load balancer implementation this Service belongs to.
-               If specified, the value of this field must be a label-style identifier, with an optional prefix,
-               e.g. "internal-vip" or "example.com/internal-vip". Unprefixed names are reserved for end-users.
-               This field can only be set when the Service type is 'LoadBalancer'. If not set, the default load
-               balancer implementation is used, today this is typically done through the cloud provider integration,
-               but should apply for any default implementation. If set, it is assumed that a load balancer
-               implementation is watching for Services with a matching class. Any default load balancer
-               implementation (e.g. cloud providers) should ignore Services that set this field.
-               This field can only be set when creating or updating a Service to type 'LoadBalancer'.
-               Once set, it can not be changed. This field will be wiped when a service is updated to a non 'LoadBalancer' type.
-        :param _builtins.str load_balancer_ip: Only applies to Service Type: LoadBalancer.
-               This feature depends on whether the underlying cloud-provider supports specifying
-               the loadBalancerIP when a load balancer is created.
-               This field will be ignored if the cloud-provider does not support the feature.
-               Deprecated: This field was under-specified and its meaning varies across implementations.
-               Using it is non-portable and it may not support dual-stack.
-               Users are encouraged to use implementation-specific annotations when available.
-        :param Sequence[_builtins.str] load_balancer_source_ranges: If specified and supported by the platform, this will restrict traffic through the cloud-provider
-               load-balancer will be restricted to the specified client IPs. This field will be ignored if the
-               cloud-provider does not support the feature."
-               More info: https://kubernetes.io/docs/tasks/access-application-cluster/create-external-load-balancer/
-        :param Sequence['SparkConnectSpecServerServiceSpecPortsPatchArgs'] ports: The list of ports that are exposed by this service.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        :param _builtins.bool publish_not_ready_addresses: publishNotReadyAddresses indicates that any agent which deals with endpoints for this
-               Service should disregard any indications of ready/not-ready.
-               The primary use case for setting this field is for a StatefulSet's Headless Service to
-               propagate SRV DNS records for its Pods for the purpose of peer discovery.
-               The Kubernetes controllers that generate Endpoints and EndpointSlice resources for
-               Services interpret this to mean that all endpoints are considered "ready" even if the
-               Pods themselves are not. Agents which consume only Kubernetes generated endpoints
-               through the Endpoints or EndpointSlice resources can safely assume this behavior.
-        :param Mapping[str, _builtins.str] selector: Route service traffic to pods with label keys and values matching this
-               selector. If empty or not present, the service is assumed to have an
-               external process managing its endpoints, which Kubernetes will not
-               modify. Only applies to types ClusterIP, NodePort, and LoadBalancer.
-               Ignored if type is ExternalName.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/
-        :param _builtins.str session_affinity: Supports "ClientIP" and "None". Used to maintain session affinity.
-               Enable client IP based session affinity.
-               Must be ClientIP or None.
-               Defaults to None.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        :param _builtins.str traffic_distribution: TrafficDistribution offers a way to express preferences for how traffic is
-               distributed to Service endpoints. Implementations can use this field as a
-               hint, but are not required to guarantee strict adherence. If the field is
-               not set, the implementation will apply its default routing strategy. If set
-               to "PreferClose", implementations should prioritize endpoints that are
-               topologically close (e.g., same zone).
-               This is a beta field and requires enabling ServiceTrafficDistribution feature.
-        :param _builtins.str type: type determines how the Service is exposed. Defaults to ClusterIP. Valid
-               options are ExternalName, ClusterIP, NodePort, and LoadBalancer.
-               "ClusterIP" allocates a cluster-internal IP address for load-balancing
-               to endpoints. Endpoints are determined by the selector or if that is not
-               specified, by manual construction of an Endpoints object or
-               EndpointSlice objects. If clusterIP is "None", no virtual IP is
-               allocated and the endpoints are published as a set of endpoints rather
-               than a virtual IP.
-               "NodePort" builds on ClusterIP and allocates a port on every node which
-               routes to the same endpoints as the clusterIP.
-               "LoadBalancer" builds on NodePort and creates an external load-balancer
-               (if supported in the current cloud) which routes to the same endpoints
-               as the clusterIP.
-               "ExternalName" aliases this service to the specified externalName.
-               Several other fields do not apply to ExternalName services.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#publishing-services-service-types
-        """
-        if allocate_load_balancer_node_ports is not None:
-            pulumi.set(__self__, "allocate_load_balancer_node_ports", allocate_load_balancer_node_ports)
-        if cluster_ip is not None:
-            pulumi.set(__self__, "cluster_ip", cluster_ip)
-        if cluster_ips is not None:
-            pulumi.set(__self__, "cluster_ips", cluster_ips)
-        if external_ips is not None:
-            pulumi.set(__self__, "external_ips", external_ips)
-        if external_name is not None:
-            pulumi.set(__self__, "external_name", external_name)
-        if external_traffic_policy is not None:
-            pulumi.set(__self__, "external_traffic_policy", external_traffic_policy)
-        if health_check_node_port is not None:
-            pulumi.set(__self__, "health_check_node_port", health_check_node_port)
-        if internal_traffic_policy is not None:
-            pulumi.set(__self__, "internal_traffic_policy", internal_traffic_policy)
-        if ip_families is not None:
-            pulumi.set(__self__, "ip_families", ip_families)
-        if ip_family_policy is not None:
-            pulumi.set(__self__, "ip_family_policy", ip_family_policy)
-        if load_balancer_class is not None:
-            pulumi.set(__self__, "load_balancer_class", load_balancer_class)
-        if load_balancer_ip is not None:
-            pulumi.set(__self__, "load_balancer_ip", load_balancer_ip)
-        if load_balancer_source_ranges is not None:
-            pulumi.set(__self__, "load_balancer_source_ranges", load_balancer_source_ranges)
-        if ports is not None:
-            pulumi.set(__self__, "ports", ports)
-        if publish_not_ready_addresses is not None:
-            pulumi.set(__self__, "publish_not_ready_addresses", publish_not_ready_addresses)
-        if selector is not None:
-            pulumi.set(__self__, "selector", selector)
-        if session_affinity is not None:
-            pulumi.set(__self__, "session_affinity", session_affinity)
-        if session_affinity_config is not None:
-            pulumi.set(__self__, "session_affinity_config", session_affinity_config)
-        if traffic_distribution is not None:
-            pulumi.set(__self__, "traffic_distribution", traffic_distribution)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="allocateLoadBalancerNodePorts")
-    def allocate_load_balancer_node_ports(self) -> Optional[_builtins.bool]:
-        """
-        allocateLoadBalancerNodePorts defines if NodePorts will be automatically
-        allocated for services with type LoadBalancer.  Default is "true". It
-        may be set to "false" if the cluster load-balancer does not rely on
-        NodePorts.  If the caller requests specific NodePorts (by specifying a
-        value), those requests will be respected, regardless of this field.
-        This field may only be set for services with type LoadBalancer and will
-        be cleared if the type is changed to any other type.
-        """
-        return pulumi.get(self, "allocate_load_balancer_node_ports")
-
-    @_builtins.property
-    @pulumi.getter(name="clusterIP")
-    def cluster_ip(self) -> Optional[_builtins.str]:
-        """
-        clusterIP is the IP address of the service and is usually assigned
-        randomly. If an address is specified manually, is in-range (as per
-        system configuration), and is not in use, it will be allocated to the
-        service; otherwise creation of the service will fail. This field may not
-        be changed through updates unless the type field is also being changed
-        to ExternalName (which requires this field to be blank) or the type
-        field is being changed from ExternalName (in which case this field may
-        optionally be specified, as describe above).  Valid values are "None",
-        empty string (""), or a valid IP address. Setting this to "None" makes a
-        "headless service" (no virtual IP), which is useful when direct endpoint
-        connections are preferred and proxying is not required.  Only applies to
-        types ClusterIP, NodePort, and LoadBalancer. If this field is specified
-        when creating a Service of type ExternalName, creation will fail. This
-        field will be wiped when updating a Service to type ExternalName.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        """
-        return pulumi.get(self, "cluster_ip")
-
-    @_builtins.property
-    @pulumi.getter(name="clusterIPs")
-    def cluster_ips(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        ClusterIPs is a list of IP addresses assigned to this service, and are
-        usually assigned randomly.  If an address is specified manually, is
-        in-range (as per system configuration), and is not in use, it will be
-        allocated to the service; otherwise creation of the service will fail.
-        This field may not be changed through updates unless the type field is
-        also being changed to ExternalName (which requires this field to be
-        empty) or the type field is being changed from ExternalName (in which
-        case this field may optionally be specified, as describe above).  Valid
-        values are "None", empty string (""), or a valid IP address.  Setting
-        this to "None" makes a "headless service" (no virtual IP), which is
-        useful when direct endpoint connections are preferred and proxying is
-        not required.  Only applies to types ClusterIP, NodePort, and
-        LoadBalancer. If this field is specified when creating a Service of type
-        ExternalName, creation will fail. This field will be wiped when updating
-        a Service to type ExternalName.  If this field is not specified, it will
-        be initialized from the clusterIP field.  If this field is specified,
-        clients must ensure that clusterIPs[0] and clusterIP have the same
-        value.
-
-        This field may hold a maximum of two entries (dual-stack IPs, in either order).
-        These IPs must correspond to the values of the ipFamilies field. Both
-        clusterIPs and ipFamilies are governed by the ipFamilyPolicy field.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        """
-        return pulumi.get(self, "cluster_ips")
-
-    @_builtins.property
-    @pulumi.getter(name="externalIPs")
-    def external_ips(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        externalIPs is a list of IP addresses for which nodes in the cluster
-        will also accept traffic for this service.  These IPs are not managed by
-        Kubernetes.  The user is responsible for ensuring that traffic arrives
-        at a node with this IP.  A common example is external load-balancers
-        that are not part of the Kubernetes system.
-        """
-        return pulumi.get(self, "external_ips")
-
-    @_builtins.property
-    @pulumi.getter(name="externalName")
-    def external_name(self) -> Optional[_builtins.str]:
-        """
-        externalName is the external reference that discovery mechanisms will
-        return as an alias for this service (e.g. a DNS CNAME record). No
-        proxying will be involved.  Must be a lowercase RFC-1123 hostname
-        (https://tools.ietf.org/html/rfc1123) and requires `type` to be "ExternalName".
-        """
-        return pulumi.get(self, "external_name")
-
-    @_builtins.property
-    @pulumi.getter(name="externalTrafficPolicy")
-    def external_traffic_policy(self) -> Optional[_builtins.str]:
-        """
-        externalTrafficPolicy describes how nodes distribute service traffic they
-        receive on one of the Service's "externally-facing" addresses (NodePorts,
-        ExternalIPs, and LoadBalancer IPs). If set to "Local", the proxy will configure
-        the service in a way that assumes that external load balancers will take care
-        of balancing the service traffic between nodes, and so each node will deliver
-        traffic only to the node-local endpoints of the service, without masquerading
-        the client source IP. (Traffic mistakenly sent to a node with no endpoints will
-        be dropped.) The default value, "Cluster", uses the standard behavior of
-        routing to all endpoints evenly (possibly modified by topology and other
-        features). Note that traffic sent to an External IP or LoadBalancer IP from
-        within the cluster will always get "Cluster" semantics, but clients sending to
-        a NodePort from within the cluster may need to take traffic policy into account
-        when picking a node.
-        """
-        return pulumi.get(self, "external_traffic_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="healthCheckNodePort")
-    def health_check_node_port(self) -> Optional[_builtins.int]:
-        """
-        healthCheckNodePort specifies the healthcheck nodePort for the service.
-        This only applies when type is set to LoadBalancer and
-        externalTrafficPolicy is set to Local. If a value is specified, is
-        in-range, and is not in use, it will be used.  If not specified, a value
-        will be automatically allocated.  External systems (e.g. load-balancers)
-        can use this port to determine if a given node holds endpoints for this
-        service or not.  If this field is specified when creating a Service
-        which does not need it, creation will fail. This field will be wiped
-        when updating a Service to no longer need it (e.g. changing type).
-        This field cannot be updated once set.
-        """
-        return pulumi.get(self, "health_check_node_port")
-
-    @_builtins.property
-    @pulumi.getter(name="internalTrafficPolicy")
-    def internal_traffic_policy(self) -> Optional[_builtins.str]:
-        """
-        InternalTrafficPolicy describes how nodes distribute service traffic they
-        receive on the ClusterIP. If set to "Local", the proxy will assume that pods
-        only want to talk to endpoints of the service on the same node as the pod,
-        dropping the traffic if there are no local endpoints. The default value,
-        "Cluster", uses the standard behavior of routing to all endpoints evenly
-        (possibly modified by topology and other features).
-        """
-        return pulumi.get(self, "internal_traffic_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="ipFamilies")
-    def ip_families(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        IPFamilies is a list of IP families (e.g. IPv4, IPv6) assigned to this
-        service. This field is usually assigned automatically based on cluster
-        configuration and the ipFamilyPolicy field. If this field is specified
-        manually, the requested family is available in the cluster,
-        and ipFamilyPolicy allows it, it will be used; otherwise creation of
-        the service will fail. This field is conditionally mutable: it allows
-        for adding or removing a secondary IP family, but it does not allow
-        changing the primary IP family of the Service. Valid values are "IPv4"
-        and "IPv6".  This field only applies to Services of types ClusterIP,
-        NodePort, and LoadBalancer, and does apply to "headless" services.
-        This field will be wiped when updating a Service to type ExternalName.
-
-        This field may hold a maximum of two entries (dual-stack families, in
-        either order).  These families must correspond to the values of the
-        clusterIPs field, if specified. Both clusterIPs and ipFamilies are
-        governed by the ipFamilyPolicy field.
-        """
-        return pulumi.get(self, "ip_families")
-
-    @_builtins.property
-    @pulumi.getter(name="ipFamilyPolicy")
-    def ip_family_policy(self) -> Optional[_builtins.str]:
-        """
-        IPFamilyPolicy represents the dual-stack-ness requested or required by
-        this Service. If there is no value provided, then this field will be set
-        to SingleStack. Services can be "SingleStack" (a single IP family),
-        "PreferDualStack" (two IP families on dual-stack configured clusters or
-        a single IP family on single-stack clusters), or "RequireDualStack"
-        (two IP families on dual-stack configured clusters, otherwise fail). The
-        ipFamilies and clusterIPs fields depend on the value of this field. This
-        field will be wiped when updating a service to type ExternalName.
-        """
-        return pulumi.get(self, "ip_family_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="loadBalancerClass")
-    def load_balancer_class(self) -> Optional[_builtins.str]:
-        """
-        loadBalancerClass is the class of the load balancer implementation this Service belongs to.
-        If specified, the value of this field must be a label-style identifier, with an optional prefix,
-        e.g. "internal-vip" or "example.com/internal-vip". Unprefixed names are reserved for end-users.
-        This field can only be set when the Service type is 'LoadBalancer'. If not set, the default load
-        balancer implementation is used, today this is typically done through the cloud provider integration,
-        but should apply for any default implementation. If set, it is assumed that a load balancer
-        implementation is watching for Services with a matching class. Any default load balancer
-        implementation (e.g. cloud providers) should ignore Services that set this field.
-        This field can only be set when creating or updating a Service to type 'LoadBalancer'.
-        Once set, it can not be changed. This field will be wiped when a service is updated to a non 'LoadBalancer' type.
-        """
-        return pulumi.get(self, "load_balancer_class")
-
-    @_builtins.property
-    @pulumi.getter(name="loadBalancerIP")
-    def load_balancer_ip(self) -> Optional[_builtins.str]:
-        """
-        Only applies to Service Type: LoadBalancer.
-        This feature depends on whether the underlying cloud-provider supports specifying
-        the loadBalancerIP when a load balancer is created.
-        This field will be ignored if the cloud-provider does not support the feature.
-        Deprecated: This field was under-specified and its meaning varies across implementations.
-        Using it is non-portable and it may not support dual-stack.
-        Users are encouraged to use implementation-specific annotations when available.
-        """
-        return pulumi.get(self, "load_balancer_ip")
-
-    @_builtins.property
-    @pulumi.getter(name="loadBalancerSourceRanges")
-    def load_balancer_source_ranges(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        If specified and supported by the platform, this will restrict traffic through the cloud-provider
-        load-balancer will be restricted to the specified client IPs. This field will be ignored if the
-        cloud-provider does not support the feature."
-        More info: https://kubernetes.io/docs/tasks/access-application-cluster/create-external-load-balancer/
-        """
-        return pulumi.get(self, "load_balancer_source_ranges")
-
-    @_builtins.property
-    @pulumi.getter
-    def ports(self) -> Optional[Sequence['outputs.SparkConnectSpecServerServiceSpecPortsPatch']]:
-        """
-        The list of ports that are exposed by this service.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        """
-        return pulumi.get(self, "ports")
-
-    @_builtins.property
-    @pulumi.getter(name="publishNotReadyAddresses")
-    def publish_not_ready_addresses(self) -> Optional[_builtins.bool]:
-        """
-        publishNotReadyAddresses indicates that any agent which deals with endpoints for this
-        Service should disregard any indications of ready/not-ready.
-        The primary use case for setting this field is for a StatefulSet's Headless Service to
-        propagate SRV DNS records for its Pods for the purpose of peer discovery.
-        The Kubernetes controllers that generate Endpoints and EndpointSlice resources for
-        Services interpret this to mean that all endpoints are considered "ready" even if the
-        Pods themselves are not. Agents which consume only Kubernetes generated endpoints
-        through the Endpoints or EndpointSlice resources can safely assume this behavior.
-        """
-        return pulumi.get(self, "publish_not_ready_addresses")
-
-    @_builtins.property
-    @pulumi.getter
-    def selector(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        Route service traffic to pods with label keys and values matching this
-        selector. If empty or not present, the service is assumed to have an
-        external process managing its endpoints, which Kubernetes will not
-        modify. Only applies to types ClusterIP, NodePort, and LoadBalancer.
-        Ignored if type is ExternalName.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/
-        """
-        return pulumi.get(self, "selector")
-
-    @_builtins.property
-    @pulumi.getter(name="sessionAffinity")
-    def session_affinity(self) -> Optional[_builtins.str]:
-        """
-        Supports "ClientIP" and "None". Used to maintain session affinity.
-        Enable client IP based session affinity.
-        Must be ClientIP or None.
-        Defaults to None.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
-        """
-        return pulumi.get(self, "session_affinity")
-
-    @_builtins.property
-    @pulumi.getter(name="sessionAffinityConfig")
-    def session_affinity_config(self) -> Optional['outputs.SparkConnectSpecServerServiceSpecSessionAffinityConfigPatch']:
-        return pulumi.get(self, "session_affinity_config")
-
-    @_builtins.property
-    @pulumi.getter(name="trafficDistribution")
-    def traffic_distribution(self) -> Optional[_builtins.str]:
-        """
-        TrafficDistribution offers a way to express preferences for how traffic is
-        distributed to Service endpoints. Implementations can use this field as a
-        hint, but are not required to guarantee strict adherence. If the field is
-        not set, the implementation will apply its default routing strategy. If set
-        to "PreferClose", implementations should prioritize endpoints that are
-        topologically close (e.g., same zone).
-        This is a beta field and requires enabling ServiceTrafficDistribution feature.
-        """
-        return pulumi.get(self, "traffic_distribution")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type determines how the Service is exposed. Defaults to ClusterIP. Valid
-        options are ExternalName, ClusterIP, NodePort, and LoadBalancer.
-        "ClusterIP" allocates a cluster-internal IP address for load-balancing
-        to endpoints. Endpoints are determined by the selector or if that is not
-        specified, by manual construction of an Endpoints object or
-        EndpointSlice objects. If clusterIP is "None", no virtual IP is
-        allocated and the endpoints are published as a set of endpoints rather
-        than a virtual IP.
-        "NodePort" builds on ClusterIP and allocates a port on every node which
-        routes to the same endpoints as the clusterIP.
-        "LoadBalancer" builds on NodePort and creates an external load-balancer
-        (if supported in the current cloud) which routes to the same endpoints
-        as the clusterIP.
-        "ExternalName" aliases this service to the specified externalName.
-        Several other fields do not apply to ExternalName services.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#publishing-services-service-types
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceSpecPorts(dict):
-    """
-    ServicePort contains information on service's port.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "appProtocol":
-            suggest = "app_protocol"
-        elif key == "nodePort":
-            suggest = "node_port"
-        elif key == "targetPort":
-            suggest = "target_port"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecServerServiceSpecPorts. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecServerServiceSpecPorts.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecServerServiceSpecPorts.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 app_protocol: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 node_port: Optional[_builtins.int] = None,
-                 port: Optional[_builtins.int] = None,
-                 protocol: Optional[_builtins.str] = None,
-                 target_port: Optional[Any] = None):
-        """
-        ServicePort contains information on service's port.
-
-        :param _builtins.str app_protocol: The application protocol for this port.
-               This is used as a hint for implementations to offer richer behavior for protocols that they understand.
-               This field follows standard Kubernetes label syntax.
-               Valid values are either:
-
-               * Un-prefixed protocol names - reserved for IANA standard service names (as per
-               RFC-6335 and https://www.iana.org/assignments/service-names).
-
-               * Kubernetes-defined prefixed names:
-                 * 'kubernetes.io/h2c' - HTTP/2 prior knowledge over cleartext as described in https://www.rfc-editor.org/rfc/rfc9113.html#name-starting-http-2-with-prior-
-                 * 'kubernetes.io/ws'  - WebSocket over cleartext as described in https://www.rfc-editor.org/rfc/rfc6455
-                 * 'kubernetes.io/wss' - WebSocket over TLS as described in https://www.rfc-editor.org/rfc/rfc6455
-
-               * Other protocols should use implementation-defined prefixed names such as
-               mycompany.com/my-custom-protocol.
-        :param _builtins.str name: The name of this port within the service. This must be a DNS_LABEL.
-               All ports within a ServiceSpec must have unique names. When considering
-               the endpoints for a Service, this must match the 'name' field in the
-               EndpointPort.
-               Optional if only one ServicePort is defined on this service.
-        :param _builtins.int node_port: The port on each node on which this service is exposed when type is
-               NodePort or LoadBalancer.  Usually assigned by the system. If a value is
-               specified, in-range, and not in use it will be used, otherwise the
-               operation will fail.  If not specified, a port will be allocated if this
-               Service requires one.  If this field is specified when creating a
-               Service which does not need it, creation will fail. This field will be
-               wiped when updating a Service to no longer need it (e.g. changing type
-               from NodePort to ClusterIP).
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport
-        :param _builtins.int port: The port that will be exposed by this service.
-        :param _builtins.str protocol: The IP protocol for this port. Supports "TCP", "UDP", and "SCTP".
-               Default is TCP.
-        :param Union[_builtins.int, _builtins.str] target_port: Number or name of the port to access on the pods targeted by the service.
-               Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME.
-               If this is a string, it will be looked up as a named port in the
-               target Pod's container ports. If this is not specified, the value
-               of the 'port' field is used (an identity map).
-               This field is ignored for services with clusterIP=None, and should be
-               omitted or set equal to the 'port' field.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#defining-a-service
-        """
-        if app_protocol is not None:
-            pulumi.set(__self__, "app_protocol", app_protocol)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if node_port is not None:
-            pulumi.set(__self__, "node_port", node_port)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if protocol is not None:
-            pulumi.set(__self__, "protocol", protocol)
-        if target_port is not None:
-            pulumi.set(__self__, "target_port", target_port)
-
-    @_builtins.property
-    @pulumi.getter(name="appProtocol")
-    def app_protocol(self) -> Optional[_builtins.str]:
-        """
-        The application protocol for this port.
-        This is used as a hint for implementations to offer richer behavior for protocols that they understand.
-        This field follows standard Kubernetes label syntax.
-        Valid values are either:
-
-        * Un-prefixed protocol names - reserved for IANA standard service names (as per
-        RFC-6335 and https://www.iana.org/assignments/service-names).
-
-        * Kubernetes-defined prefixed names:
-          * 'kubernetes.io/h2c' - HTTP/2 prior knowledge over cleartext as described in https://www.rfc-editor.org/rfc/rfc9113.html#name-starting-http-2-with-prior-
-          * 'kubernetes.io/ws'  - WebSocket over cleartext as described in https://www.rfc-editor.org/rfc/rfc6455
-          * 'kubernetes.io/wss' - WebSocket over TLS as described in https://www.rfc-editor.org/rfc/rfc6455
-
-        * Other protocols should use implementation-defined prefixed names such as
-        mycompany.com/my-custom-protocol.
-        """
-        return pulumi.get(self, "app_protocol")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        The name of this port within the service. This must be a DNS_LABEL.
-        All ports within a ServiceSpec must have unique names. When considering
-        the endpoints for a Service, this must match the 'name' field in the
-        EndpointPort.
-        Optional if only one ServicePort is defined on this service.
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter(name="nodePort")
-    def node_port(self) -> Optional[_builtins.int]:
-        """
-        The port on each node on which this service is exposed when type is
-        NodePort or LoadBalancer.  Usually assigned by the system. If a value is
-        specified, in-range, and not in use it will be used, otherwise the
-        operation will fail.  If not specified, a port will be allocated if this
-        Service requires one.  If this field is specified when creating a
-        Service which does not need it, creation will fail. This field will be
-        wiped when updating a Service to no longer need it (e.g. changing type
-        from NodePort to ClusterIP).
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport
-        """
-        return pulumi.get(self, "node_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> Optional[_builtins.int]:
-        """
-        The port that will be exposed by this service.
-        """
-        return pulumi.get(self, "port")
-
-    @_builtins.property
-    @pulumi.getter
-    def protocol(self) -> Optional[_builtins.str]:
-        """
-        The IP protocol for this port. Supports "TCP", "UDP", and "SCTP".
-        Default is TCP.
-        """
-        return pulumi.get(self, "protocol")
-
-    @_builtins.property
-    @pulumi.getter(name="targetPort")
-    def target_port(self) -> Optional[Any]:
-        """
-        Number or name of the port to access on the pods targeted by the service.
-        Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME.
-        If this is a string, it will be looked up as a named port in the
-        target Pod's container ports. If this is not specified, the value
-        of the 'port' field is used (an identity map).
-        This field is ignored for services with clusterIP=None, and should be
-        omitted or set equal to the 'port' field.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#defining-a-service
-        """
-        return pulumi.get(self, "target_port")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceSpecPortsPatch(dict):
-    """
-    ServicePort contains information on service's port.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "appProtocol":
-            suggest = "app_protocol"
-        elif key == "nodePort":
-            suggest = "node_port"
-        elif key == "targetPort":
-            suggest = "target_port"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecServerServiceSpecPortsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecServerServiceSpecPortsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecServerServiceSpecPortsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 app_protocol: Optional[_builtins.str] = None,
-                 name: Optional[_builtins.str] = None,
-                 node_port: Optional[_builtins.int] = None,
-                 port: Optional[_builtins.int] = None,
-                 protocol: Optional[_builtins.str] = None,
-                 target_port: Optional[Any] = None):
-        """
-        ServicePort contains information on service's port.
-
-        :param _builtins.str app_protocol: The application protocol for this port.
-               This is used as a hint for implementations to offer richer behavior for protocols that they understand.
-               This field follows standard Kubernetes label syntax.
-               Valid values are either:
-
-               * Un-prefixed protocol names - reserved for IANA standard service names (as per
-               RFC-6335 and https://www.iana.org/assignments/service-names).
-
-               * Kubernetes-defined prefixed names:
-                 * 'kubernetes.io/h2c' - HTTP/2 prior knowledge over cleartext as described in https://www.rfc-editor.org/rfc/rfc9113.html#name-starting-http-2-with-prior-
-                 * 'kubernetes.io/ws'  - WebSocket over cleartext as described in https://www.rfc-editor.org/rfc/rfc6455
-                 * 'kubernetes.io/wss' - WebSocket over TLS as described in https://www.rfc-editor.org/rfc/rfc6455
-
-               * Other protocols should use implementation-defined prefixed names such as
-               mycompany.com/my-custom-protocol.
-        :param _builtins.str name: The name of this port within the service. This must be a DNS_LABEL.
-               All ports within a ServiceSpec must have unique names. When considering
-               the endpoints for a Service, this must match the 'name' field in the
-               EndpointPort.
-               Optional if only one ServicePort is defined on this service.
-        :param _builtins.int node_port: The port on each node on which this service is exposed when type is
-               NodePort or LoadBalancer.  Usually assigned by the system. If a value is
-               specified, in-range, and not in use it will be used, otherwise the
-               operation will fail.  If not specified, a port will be allocated if this
-               Service requires one.  If this field is specified when creating a
-               Service which does not need it, creation will fail. This field will be
-               wiped when updating a Service to no longer need it (e.g. changing type
-               from NodePort to ClusterIP).
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport
-        :param _builtins.int port: The port that will be exposed by this service.
-        :param _builtins.str protocol: The IP protocol for this port. Supports "TCP", "UDP", and "SCTP".
-               Default is TCP.
-        :param Union[_builtins.int, _builtins.str] target_port: Number or name of the port to access on the pods targeted by the service.
-               Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME.
-               If this is a string, it will be looked up as a named port in the
-               target Pod's container ports. If this is not specified, the value
-               of the 'port' field is used (an identity map).
-               This field is ignored for services with clusterIP=None, and should be
-               omitted or set equal to the 'port' field.
-               More info: https://kubernetes.io/docs/concepts/services-networking/service/#defining-a-service
-        """
-        if app_protocol is not None:
-            pulumi.set(__self__, "app_protocol", app_protocol)
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if node_port is not None:
-            pulumi.set(__self__, "node_port", node_port)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if protocol is not None:
-            pulumi.set(__self__, "protocol", protocol)
-        if target_port is not None:
-            pulumi.set(__self__, "target_port", target_port)
-
-    @_builtins.property
-    @pulumi.getter(name="appProtocol")
-    def app_protocol(self) -> Optional[_builtins.str]:
-        """
-        The application protocol for this port.
-        This is used as a hint for implementations to offer richer behavior for protocols that they understand.
-        This field follows standard Kubernetes label syntax.
-        Valid values are either:
-
-        * Un-prefixed protocol names - reserved for IANA standard service names (as per
-        RFC-6335 and https://www.iana.org/assignments/service-names).
-
-        * Kubernetes-defined prefixed names:
-          * 'kubernetes.io/h2c' - HTTP/2 prior knowledge over cleartext as described in https://www.rfc-editor.org/rfc/rfc9113.html#name-starting-http-2-with-prior-
-          * 'kubernetes.io/ws'  - WebSocket over cleartext as described in https://www.rfc-editor.org/rfc/rfc6455
-          * 'kubernetes.io/wss' - WebSocket over TLS as described in https://www.rfc-editor.org/rfc/rfc6455
-
-        * Other protocols should use implementation-defined prefixed names such as
-        mycompany.com/my-custom-protocol.
-        """
-        return pulumi.get(self, "app_protocol")
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        The name of this port within the service. This must be a DNS_LABEL.
-        All ports within a ServiceSpec must have unique names. When considering
-        the endpoints for a Service, this must match the 'name' field in the
-        EndpointPort.
-        Optional if only one ServicePort is defined on this service.
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter(name="nodePort")
-    def node_port(self) -> Optional[_builtins.int]:
-        """
-        The port on each node on which this service is exposed when type is
-        NodePort or LoadBalancer.  Usually assigned by the system. If a value is
-        specified, in-range, and not in use it will be used, otherwise the
-        operation will fail.  If not specified, a port will be allocated if this
-        Service requires one.  If this field is specified when creating a
-        Service which does not need it, creation will fail. This field will be
-        wiped when updating a Service to no longer need it (e.g. changing type
-        from NodePort to ClusterIP).
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport
-        """
-        return pulumi.get(self, "node_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> Optional[_builtins.int]:
-        """
-        The port that will be exposed by this service.
-        """
-        return pulumi.get(self, "port")
-
-    @_builtins.property
-    @pulumi.getter
-    def protocol(self) -> Optional[_builtins.str]:
-        """
-        The IP protocol for this port. Supports "TCP", "UDP", and "SCTP".
-        Default is TCP.
-        """
-        return pulumi.get(self, "protocol")
-
-    @_builtins.property
-    @pulumi.getter(name="targetPort")
-    def target_port(self) -> Optional[Any]:
-        """
-        Number or name of the port to access on the pods targeted by the service.
-        Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME.
-        If this is a string, it will be looked up as a named port in the
-        target Pod's container ports. If this is not specified, the value
-        of the 'port' field is used (an identity map).
-        This field is ignored for services with clusterIP=None, and should be
-        omitted or set equal to the 'port' field.
-        More info: https://kubernetes.io/docs/concepts/services-networking/service/#defining-a-service
-        """
-        return pulumi.get(self, "target_port")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceSpecSessionAffinityConfig(dict):
-    """
-    sessionAffinityConfig contains the configurations of session affinity.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clientIP":
-            suggest = "client_ip"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecServerServiceSpecSessionAffinityConfig. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecServerServiceSpecSessionAffinityConfig.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecServerServiceSpecSessionAffinityConfig.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 client_ip: Optional['outputs.SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIP'] = None):
-        """
-        sessionAffinityConfig contains the configurations of session affinity.
-        """
-        if client_ip is not None:
-            pulumi.set(__self__, "client_ip", client_ip)
-
-    @_builtins.property
-    @pulumi.getter(name="clientIP")
-    def client_ip(self) -> Optional['outputs.SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIP']:
-        return pulumi.get(self, "client_ip")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIP(dict):
-    """
-    clientIP contains the configurations of Client IP based session affinity.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "timeoutSeconds":
-            suggest = "timeout_seconds"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIP. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIP.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIP.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 timeout_seconds: Optional[_builtins.int] = None):
-        """
-        clientIP contains the configurations of Client IP based session affinity.
-
-        :param _builtins.int timeout_seconds: timeoutSeconds specifies the seconds of ClientIP type session sticky time.
-               The value must be >0 && <=86400(for 1 day) if ServiceAffinity == "ClientIP".
-               Default value is 10800(for 3 hours).
-        """
-        if timeout_seconds is not None:
-            pulumi.set(__self__, "timeout_seconds", timeout_seconds)
-
-    @_builtins.property
-    @pulumi.getter(name="timeoutSeconds")
-    def timeout_seconds(self) -> Optional[_builtins.int]:
-        """
-        timeoutSeconds specifies the seconds of ClientIP type session sticky time.
-        The value must be >0 && <=86400(for 1 day) if ServiceAffinity == "ClientIP".
-        Default value is 10800(for 3 hours).
-        """
-        return pulumi.get(self, "timeout_seconds")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatch(dict):
-    """
-    clientIP contains the configurations of Client IP based session affinity.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "timeoutSeconds":
-            suggest = "timeout_seconds"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 timeout_seconds: Optional[_builtins.int] = None):
-        """
-        clientIP contains the configurations of Client IP based session affinity.
-
-        :param _builtins.int timeout_seconds: timeoutSeconds specifies the seconds of ClientIP type session sticky time.
-               The value must be >0 && <=86400(for 1 day) if ServiceAffinity == "ClientIP".
-               Default value is 10800(for 3 hours).
-        """
-        if timeout_seconds is not None:
-            pulumi.set(__self__, "timeout_seconds", timeout_seconds)
-
-    @_builtins.property
-    @pulumi.getter(name="timeoutSeconds")
-    def timeout_seconds(self) -> Optional[_builtins.int]:
-        """
-        timeoutSeconds specifies the seconds of ClientIP type session sticky time.
-        The value must be >0 && <=86400(for 1 day) if ServiceAffinity == "ClientIP".
-        Default value is 10800(for 3 hours).
-        """
-        return pulumi.get(self, "timeout_seconds")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceSpecSessionAffinityConfigPatch(dict):
-    """
-    sessionAffinityConfig contains the configurations of session affinity.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "clientIP":
-            suggest = "client_ip"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecServerServiceSpecSessionAffinityConfigPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecServerServiceSpecSessionAffinityConfigPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecServerServiceSpecSessionAffinityConfigPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 client_ip: Optional['outputs.SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatch'] = None):
-        """
-        sessionAffinityConfig contains the configurations of session affinity.
-        """
-        if client_ip is not None:
-            pulumi.set(__self__, "client_ip", client_ip)
-
-    @_builtins.property
-    @pulumi.getter(name="clientIP")
-    def client_ip(self) -> Optional['outputs.SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatch']:
-        return pulumi.get(self, "client_ip")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceStatus(dict):
-    """
-    Most recently observed status of the service.
-    Populated by the system.
-    Read-only.
-    More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "loadBalancer":
-            suggest = "load_balancer"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecServerServiceStatus. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecServerServiceStatus.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecServerServiceStatus.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 conditions: Optional[Sequence['outputs.SparkConnectSpecServerServiceStatusConditions']] = None,
-                 load_balancer: Optional['outputs.SparkConnectSpecServerServiceStatusLoadBalancer'] = None):
-        """
-        Most recently observed status of the service.
-        Populated by the system.
-        Read-only.
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param Sequence['SparkConnectSpecServerServiceStatusConditionsArgs'] conditions: Current service state
-        """
-        if conditions is not None:
-            pulumi.set(__self__, "conditions", conditions)
-        if load_balancer is not None:
-            pulumi.set(__self__, "load_balancer", load_balancer)
-
-    @_builtins.property
-    @pulumi.getter
-    def conditions(self) -> Optional[Sequence['outputs.SparkConnectSpecServerServiceStatusConditions']]:
-        """
-        Current service state
-        """
-        return pulumi.get(self, "conditions")
-
-    @_builtins.property
-    @pulumi.getter(name="loadBalancer")
-    def load_balancer(self) -> Optional['outputs.SparkConnectSpecServerServiceStatusLoadBalancer']:
-        return pulumi.get(self, "load_balancer")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceStatusConditions(dict):
-    """
-    Condition contains details for one aspect of the current state of this API Resource.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "lastTransitionTime":
-            suggest = "last_transition_time"
-        elif key == "observedGeneration":
-            suggest = "observed_generation"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecServerServiceStatusConditions. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecServerServiceStatusConditions.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecServerServiceStatusConditions.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 last_transition_time: Optional[_builtins.str] = None,
-                 message: Optional[_builtins.str] = None,
-                 observed_generation: Optional[_builtins.int] = None,
-                 reason: Optional[_builtins.str] = None,
-                 status: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        Condition contains details for one aspect of the current state of this API Resource.
-
-        :param _builtins.str last_transition_time: lastTransitionTime is the last time the condition transitioned from one status to another.
-               This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        :param _builtins.str message: message is a human readable message indicating details about the transition.
-               This may be an empty string.
-        :param _builtins.int observed_generation: observedGeneration represents the .metadata.generation that the condition was set based upon.
-               For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-               with respect to the current state of the instance.
-        :param _builtins.str reason: reason contains a programmatic identifier indicating the reason for the condition's last transition.
-               Producers of specific condition types may define expected values and meanings for this field,
-               and whether the values are considered a guaranteed API.
-               The value should be a CamelCase string.
-               This field may not be empty.
-        :param _builtins.str status: status of the condition, one of True, False, Unknown.
-        :param _builtins.str type: type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        if last_transition_time is not None:
-            pulumi.set(__self__, "last_transition_time", last_transition_time)
-        if message is not None:
-            pulumi.set(__self__, "message", message)
-        if observed_generation is not None:
-            pulumi.set(__self__, "observed_generation", observed_generation)
-        if reason is not None:
-            pulumi.set(__self__, "reason", reason)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="lastTransitionTime")
-    def last_transition_time(self) -> Optional[_builtins.str]:
-        """
-        lastTransitionTime is the last time the condition transitioned from one status to another.
-        This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        """
-        return pulumi.get(self, "last_transition_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def message(self) -> Optional[_builtins.str]:
-        """
-        message is a human readable message indicating details about the transition.
-        This may be an empty string.
-        """
-        return pulumi.get(self, "message")
-
-    @_builtins.property
-    @pulumi.getter(name="observedGeneration")
-    def observed_generation(self) -> Optional[_builtins.int]:
-        """
-        observedGeneration represents the .metadata.generation that the condition was set based upon.
-        For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-        with respect to the current state of the instance.
-        """
-        return pulumi.get(self, "observed_generation")
-
-    @_builtins.property
-    @pulumi.getter
-    def reason(self) -> Optional[_builtins.str]:
-        """
-        reason contains a programmatic identifier indicating the reason for the condition's last transition.
-        Producers of specific condition types may define expected values and meanings for this field,
-        and whether the values are considered a guaranteed API.
-        The value should be a CamelCase string.
-        This field may not be empty.
-        """
-        return pulumi.get(self, "reason")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional[_builtins.str]:
-        """
-        status of the condition, one of True, False, Unknown.
-        """
-        return pulumi.get(self, "status")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceStatusConditionsPatch(dict):
-    """
-    Condition contains details for one aspect of the current state of this API Resource.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "lastTransitionTime":
-            suggest = "last_transition_time"
-        elif key == "observedGeneration":
-            suggest = "observed_generation"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecServerServiceStatusConditionsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecServerServiceStatusConditionsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecServerServiceStatusConditionsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 last_transition_time: Optional[_builtins.str] = None,
-                 message: Optional[_builtins.str] = None,
-                 observed_generation: Optional[_builtins.int] = None,
-                 reason: Optional[_builtins.str] = None,
-                 status: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        Condition contains details for one aspect of the current state of this API Resource.
-
-        :param _builtins.str last_transition_time: lastTransitionTime is the last time the condition transitioned from one status to another.
-               This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        :param _builtins.str message: message is a human readable message indicating details about the transition.
-               This may be an empty string.
-        :param _builtins.int observed_generation: observedGeneration represents the .metadata.generation that the condition was set based upon.
-               For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-               with respect to the current state of the instance.
-        :param _builtins.str reason: reason contains a programmatic identifier indicating the reason for the condition's last transition.
-               Producers of specific condition types may define expected values and meanings for this field,
-               and whether the values are considered a guaranteed API.
-               The value should be a CamelCase string.
-               This field may not be empty.
-        :param _builtins.str status: status of the condition, one of True, False, Unknown.
-        :param _builtins.str type: type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        if last_transition_time is not None:
-            pulumi.set(__self__, "last_transition_time", last_transition_time)
-        if message is not None:
-            pulumi.set(__self__, "message", message)
-        if observed_generation is not None:
-            pulumi.set(__self__, "observed_generation", observed_generation)
-        if reason is not None:
-            pulumi.set(__self__, "reason", reason)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="lastTransitionTime")
-    def last_transition_time(self) -> Optional[_builtins.str]:
-        """
-        lastTransitionTime is the last time the condition transitioned from one status to another.
-        This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        """
-        return pulumi.get(self, "last_transition_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def message(self) -> Optional[_builtins.str]:
-        """
-        message is a human readable message indicating details about the transition.
-        This may be an empty string.
-        """
-        return pulumi.get(self, "message")
-
-    @_builtins.property
-    @pulumi.getter(name="observedGeneration")
-    def observed_generation(self) -> Optional[_builtins.int]:
-        """
-        observedGeneration represents the .metadata.generation that the condition was set based upon.
-        For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-        with respect to the current state of the instance.
-        """
-        return pulumi.get(self, "observed_generation")
-
-    @_builtins.property
-    @pulumi.getter
-    def reason(self) -> Optional[_builtins.str]:
-        """
-        reason contains a programmatic identifier indicating the reason for the condition's last transition.
-        Producers of specific condition types may define expected values and meanings for this field,
-        and whether the values are considered a guaranteed API.
-        The value should be a CamelCase string.
-        This field may not be empty.
-        """
-        return pulumi.get(self, "reason")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional[_builtins.str]:
-        """
-        status of the condition, one of True, False, Unknown.
-        """
-        return pulumi.get(self, "status")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceStatusLoadBalancer(dict):
-    """
-    LoadBalancer contains the current status of the load-balancer,
-    if one is present.
-    """
-    def __init__(__self__, *,
-                 ingress: Optional[Sequence['outputs.SparkConnectSpecServerServiceStatusLoadBalancerIngress']] = None):
-        """
-        LoadBalancer contains the current status of the load-balancer,
-        if one is present.
-
-        :param Sequence['SparkConnectSpecServerServiceStatusLoadBalancerIngressArgs'] ingress: Ingress is a list containing ingress points for the load-balancer.
-               Traffic intended for the service should be sent to these ingress points.
-        """
-        if ingress is not None:
-            pulumi.set(__self__, "ingress", ingress)
-
-    @_builtins.property
-    @pulumi.getter
-    def ingress(self) -> Optional[Sequence['outputs.SparkConnectSpecServerServiceStatusLoadBalancerIngress']]:
-        """
-        Ingress is a list containing ingress points for the load-balancer.
-        Traffic intended for the service should be sent to these ingress points.
-        """
-        return pulumi.get(self, "ingress")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceStatusLoadBalancerIngress(dict):
-    """
-    LoadBalancerIngress represents the status of a load-balancer ingress point:
-    traffic intended for the service should be sent to an ingress point.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "ipMode":
-            suggest = "ip_mode"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecServerServiceStatusLoadBalancerIngress. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecServerServiceStatusLoadBalancerIngress.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecServerServiceStatusLoadBalancerIngress.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 hostname: Optional[_builtins.str] = None,
-                 ip: Optional[_builtins.str] = None,
-                 ip_mode: Optional[_builtins.str] = None,
-                 ports: Optional[Sequence['outputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressPorts']] = None):
-        """
-        LoadBalancerIngress represents the status of a load-balancer ingress point:
-        traffic intended for the service should be sent to an ingress point.
-
-        :param _builtins.str hostname: Hostname is set for load-balancer ingress points that are DNS based
-               (typically AWS load-balancers)
-        :param _builtins.str ip: IP is set for load-balancer ingress points that are IP based
-               (typically GCE or OpenStack load-balancers)
-        :param _builtins.str ip_mode: IPMode specifies how the load-balancer IP behaves, and may only be specified when the ip field is specified.
-               Setting this to "VIP" indicates that traffic is delivered to the node with
-               the destination set to the load-balancer's IP and port.
-               Setting this to "Proxy" indicates that traffic is delivered to the node or pod with
-               the destination set to the node's IP and node port or the pod's IP and port.
-               Service implementations may use this information to adjust traffic routing.
-        :param Sequence['SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs'] ports: Ports is a list of records of service ports
-               If used, every port defined in the service should have an entry in it
-        """
-        if hostname is not None:
-            pulumi.set(__self__, "hostname", hostname)
-        if ip is not None:
-            pulumi.set(__self__, "ip", ip)
-        if ip_mode is not None:
-            pulumi.set(__self__, "ip_mode", ip_mode)
-        if ports is not None:
-            pulumi.set(__self__, "ports", ports)
-
-    @_builtins.property
-    @pulumi.getter
-    def hostname(self) -> Optional[_builtins.str]:
-        """
-        Hostname is set for load-balancer ingress points that are DNS based
-        (typically AWS load-balancers)
-        """
-        return pulumi.get(self, "hostname")
-
-    @_builtins.property
-    @pulumi.getter
-    def ip(self) -> Optional[_builtins.str]:
-        """
-        IP is set for load-balancer ingress points that are IP based
-        (typically GCE or OpenStack load-balancers)
-        """
-        return pulumi.get(self, "ip")
-
-    @_builtins.property
-    @pulumi.getter(name="ipMode")
-    def ip_mode(self) -> Optional[_builtins.str]:
-        """
-        IPMode specifies how the load-balancer IP behaves, and may only be specified when the ip field is specified.
-        Setting this to "VIP" indicates that traffic is delivered to the node with
-        the destination set to the load-balancer's IP and port.
-        Setting this to "Proxy" indicates that traffic is delivered to the node or pod with
-        the destination set to the node's IP and node port or the pod's IP and port.
-        Service implementations may use this information to adjust traffic routing.
-        """
-        return pulumi.get(self, "ip_mode")
-
-    @_builtins.property
-    @pulumi.getter
-    def ports(self) -> Optional[Sequence['outputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressPorts']]:
-        """
-        Ports is a list of records of service ports
-        If used, every port defined in the service should have an entry in it
-        """
-        return pulumi.get(self, "ports")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceStatusLoadBalancerIngressPatch(dict):
-    """
-    LoadBalancerIngress represents the status of a load-balancer ingress point:
-    traffic intended for the service should be sent to an ingress point.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "ipMode":
-            suggest = "ip_mode"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecServerServiceStatusLoadBalancerIngressPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecServerServiceStatusLoadBalancerIngressPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecServerServiceStatusLoadBalancerIngressPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 hostname: Optional[_builtins.str] = None,
-                 ip: Optional[_builtins.str] = None,
-                 ip_mode: Optional[_builtins.str] = None,
-                 ports: Optional[Sequence['outputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatch']] = None):
-        """
-        LoadBalancerIngress represents the status of a load-balancer ingress point:
-        traffic intended for the service should be sent to an ingress point.
-
-        :param _builtins.str hostname: Hostname is set for load-balancer ingress points that are DNS based
-               (typically AWS load-balancers)
-        :param _builtins.str ip: IP is set for load-balancer ingress points that are IP based
-               (typically GCE or OpenStack load-balancers)
-        :param _builtins.str ip_mode: IPMode specifies how the load-balancer IP behaves, and may only be specified when the ip field is specified.
-               Setting this to "VIP" indicates that traffic is delivered to the node with
-               the destination set to the load-balancer's IP and port.
-               Setting this to "Proxy" indicates that traffic is delivered to the node or pod with
-               the destination set to the node's IP and node port or the pod's IP and port.
-               Service implementations may use this information to adjust traffic routing.
-        :param Sequence['SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatchArgs'] ports: Ports is a list of records of service ports
-               If used, every port defined in the service should have an entry in it
-        """
-        if hostname is not None:
-            pulumi.set(__self__, "hostname", hostname)
-        if ip is not None:
-            pulumi.set(__self__, "ip", ip)
-        if ip_mode is not None:
-            pulumi.set(__self__, "ip_mode", ip_mode)
-        if ports is not None:
-            pulumi.set(__self__, "ports", ports)
-
-    @_builtins.property
-    @pulumi.getter
-    def hostname(self) -> Optional[_builtins.str]:
-        """
-        Hostname is set for load-balancer ingress points that are DNS based
-        (typically AWS load-balancers)
-        """
-        return pulumi.get(self, "hostname")
-
-    @_builtins.property
-    @pulumi.getter
-    def ip(self) -> Optional[_builtins.str]:
-        """
-        IP is set for load-balancer ingress points that are IP based
-        (typically GCE or OpenStack load-balancers)
-        """
-        return pulumi.get(self, "ip")
-
-    @_builtins.property
-    @pulumi.getter(name="ipMode")
-    def ip_mode(self) -> Optional[_builtins.str]:
-        """
-        IPMode specifies how the load-balancer IP behaves, and may only be specified when the ip field is specified.
-        Setting this to "VIP" indicates that traffic is delivered to the node with
-        the destination set to the load-balancer's IP and port.
-        Setting this to "Proxy" indicates that traffic is delivered to the node or pod with
-        the destination set to the node's IP and node port or the pod's IP and port.
-        Service implementations may use this information to adjust traffic routing.
-        """
-        return pulumi.get(self, "ip_mode")
-
-    @_builtins.property
-    @pulumi.getter
-    def ports(self) -> Optional[Sequence['outputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatch']]:
-        """
-        Ports is a list of records of service ports
-        If used, every port defined in the service should have an entry in it
-        """
-        return pulumi.get(self, "ports")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceStatusLoadBalancerIngressPorts(dict):
-    """
-    PortStatus represents the error condition of a service port
-    """
-    def __init__(__self__, *,
-                 error: Optional[_builtins.str] = None,
-                 port: Optional[_builtins.int] = None,
-                 protocol: Optional[_builtins.str] = None):
-        """
-        PortStatus represents the error condition of a service port
-
-        :param _builtins.str error: Error is to record the problem with the service port
-               The format of the error shall comply with the following rules:
-               - built-in error values shall be specified in this file and those shall use
-                 CamelCase names
-               - cloud provider specific error values must have names that comply with the
-                 format foo.example.com/CamelCase.
-        :param _builtins.int port: Port is the port number of the service port of which status is recorded here
-        :param _builtins.str protocol: Protocol is the protocol of the service port of which status is recorded here
-               The supported values are: "TCP", "UDP", "SCTP"
-        """
-        if error is not None:
-            pulumi.set(__self__, "error", error)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if protocol is not None:
-            pulumi.set(__self__, "protocol", protocol)
-
-    @_builtins.property
-    @pulumi.getter
-    def error(self) -> Optional[_builtins.str]:
-        """
-        Error is to record the problem with the service port
-        The format of the error shall comply with the following rules:
-        - built-in error values shall be specified in this file and those shall use
-          CamelCase names
-        - cloud provider specific error values must have names that comply with the
-          format foo.example.com/CamelCase.
-        """
-        return pulumi.get(self, "error")
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> Optional[_builtins.int]:
-        """
-        Port is the port number of the service port of which status is recorded here
-        """
-        return pulumi.get(self, "port")
-
-    @_builtins.property
-    @pulumi.getter
-    def protocol(self) -> Optional[_builtins.str]:
-        """
-        Protocol is the protocol of the service port of which status is recorded here
-        The supported values are: "TCP", "UDP", "SCTP"
-        """
-        return pulumi.get(self, "protocol")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatch(dict):
-    """
-    PortStatus represents the error condition of a service port
-    """
-    def __init__(__self__, *,
-                 error: Optional[_builtins.str] = None,
-                 port: Optional[_builtins.int] = None,
-                 protocol: Optional[_builtins.str] = None):
-        """
-        PortStatus represents the error condition of a service port
-
-        :param _builtins.str error: Error is to record the problem with the service port
-               The format of the error shall comply with the following rules:
-               - built-in error values shall be specified in this file and those shall use
-                 CamelCase names
-               - cloud provider specific error values must have names that comply with the
-                 format foo.example.com/CamelCase.
-        :param _builtins.int port: Port is the port number of the service port of which status is recorded here
-        :param _builtins.str protocol: Protocol is the protocol of the service port of which status is recorded here
-               The supported values are: "TCP", "UDP", "SCTP"
-        """
-        if error is not None:
-            pulumi.set(__self__, "error", error)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-        if protocol is not None:
-            pulumi.set(__self__, "protocol", protocol)
-
-    @_builtins.property
-    @pulumi.getter
-    def error(self) -> Optional[_builtins.str]:
-        """
-        Error is to record the problem with the service port
-        The format of the error shall comply with the following rules:
-        - built-in error values shall be specified in this file and those shall use
-          CamelCase names
-        - cloud provider specific error values must have names that comply with the
-          format foo.example.com/CamelCase.
-        """
-        return pulumi.get(self, "error")
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> Optional[_builtins.int]:
-        """
-        Port is the port number of the service port of which status is recorded here
-        """
-        return pulumi.get(self, "port")
-
-    @_builtins.property
-    @pulumi.getter
-    def protocol(self) -> Optional[_builtins.str]:
-        """
-        Protocol is the protocol of the service port of which status is recorded here
-        The supported values are: "TCP", "UDP", "SCTP"
-        """
-        return pulumi.get(self, "protocol")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceStatusLoadBalancerPatch(dict):
-    """
-    LoadBalancer contains the current status of the load-balancer,
-    if one is present.
-    """
-    def __init__(__self__, *,
-                 ingress: Optional[Sequence['outputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressPatch']] = None):
-        """
-        LoadBalancer contains the current status of the load-balancer,
-        if one is present.
-
-        :param Sequence['SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgs'] ingress: Ingress is a list containing ingress points for the load-balancer.
-               Traffic intended for the service should be sent to these ingress points.
-        """
-        if ingress is not None:
-            pulumi.set(__self__, "ingress", ingress)
-
-    @_builtins.property
-    @pulumi.getter
-    def ingress(self) -> Optional[Sequence['outputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressPatch']]:
-        """
-        Ingress is a list containing ingress points for the load-balancer.
-        Traffic intended for the service should be sent to these ingress points.
-        """
-        return pulumi.get(self, "ingress")
-
-
-@pulumi.output_type
-class SparkConnectSpecServerServiceStatusPatch(dict):
-    """
-    Most recently observed status of the service.
-    Populated by the system.
-    Read-only.
-    More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "loadBalancer":
-            suggest = "load_balancer"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecServerServiceStatusPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectSpecServerServiceStatusPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectSpecServerServiceStatusPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 conditions: Optional[Sequence['outputs.SparkConnectSpecServerServiceStatusConditionsPatch']] = None,
-                 load_balancer: Optional['outputs.SparkConnectSpecServerServiceStatusLoadBalancerPatch'] = None):
-        """
-        Most recently observed status of the service.
-        Populated by the system.
-        Read-only.
-        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param Sequence['SparkConnectSpecServerServiceStatusConditionsPatchArgs'] conditions: Current service state
-        """
-        if conditions is not None:
-            pulumi.set(__self__, "conditions", conditions)
-        if load_balancer is not None:
-            pulumi.set(__self__, "load_balancer", load_balancer)
-
-    @_builtins.property
-    @pulumi.getter
-    def conditions(self) -> Optional[Sequence['outputs.SparkConnectSpecServerServiceStatusConditionsPatch']]:
-        """
-        Current service state
-        """
-        return pulumi.get(self, "conditions")
-
-    @_builtins.property
-    @pulumi.getter(name="loadBalancer")
-    def load_balancer(self) -> Optional['outputs.SparkConnectSpecServerServiceStatusLoadBalancerPatch']:
-        return pulumi.get(self, "load_balancer")
-
-
-@pulumi.output_type
-class SparkConnectStatus(dict):
-    """
-    SparkConnectStatus defines the observed state of SparkConnect.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "lastUpdateTime":
-            suggest = "last_update_time"
-        elif key == "startTime":
-            suggest = "start_time"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectStatus. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectStatus.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectStatus.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 conditions: Optional[Sequence['outputs.SparkConnectStatusConditions']] = None,
-                 executors: Optional[Mapping[str, _builtins.int]] = None,
-                 last_update_time: Optional[_builtins.str] = None,
-                 server: Optional['outputs.SparkConnectStatusServer'] = None,
-                 start_time: Optional[_builtins.str] = None,
-                 state: Optional[_builtins.str] = None):
-        """
-        SparkConnectStatus defines the observed state of SparkConnect.
-
-        :param Sequence['SparkConnectStatusConditionsArgs'] conditions: Represents the latest available observations of a SparkConnect's current state.
-        :param Mapping[str, _builtins.int] executors: Executors represents the current state of the SparkConnect executors.
-        :param _builtins.str last_update_time: LastUpdateTime is the time at which the SparkConnect controller last updated the SparkConnect.
-        :param _builtins.str start_time: StartTime is the time at which the SparkConnect controller started processing the SparkConnect.
-        :param _builtins.str state: State represents the current state of the SparkConnect.
-        """
-        if conditions is not None:
-            pulumi.set(__self__, "conditions", conditions)
-        if executors is not None:
-            pulumi.set(__self__, "executors", executors)
-        if last_update_time is not None:
-            pulumi.set(__self__, "last_update_time", last_update_time)
-        if server is not None:
-            pulumi.set(__self__, "server", server)
-        if start_time is not None:
-            pulumi.set(__self__, "start_time", start_time)
-        if state is not None:
-            pulumi.set(__self__, "state", state)
-
-    @_builtins.property
-    @pulumi.getter
-    def conditions(self) -> Optional[Sequence['outputs.SparkConnectStatusConditions']]:
-        """
-        Represents the latest available observations of a SparkConnect's current state.
-        """
-        return pulumi.get(self, "conditions")
-
-    @_builtins.property
-    @pulumi.getter
-    def executors(self) -> Optional[Mapping[str, _builtins.int]]:
-        """
-        Executors represents the current state of the SparkConnect executors.
-        """
-        return pulumi.get(self, "executors")
-
-    @_builtins.property
-    @pulumi.getter(name="lastUpdateTime")
-    def last_update_time(self) -> Optional[_builtins.str]:
-        """
-        LastUpdateTime is the time at which the SparkConnect controller last updated the SparkConnect.
-        """
-        return pulumi.get(self, "last_update_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def server(self) -> Optional['outputs.SparkConnectStatusServer']:
-        return pulumi.get(self, "server")
-
-    @_builtins.property
-    @pulumi.getter(name="startTime")
-    def start_time(self) -> Optional[_builtins.str]:
-        """
-        StartTime is the time at which the SparkConnect controller started processing the SparkConnect.
-        """
-        return pulumi.get(self, "start_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def state(self) -> Optional[_builtins.str]:
-        """
-        State represents the current state of the SparkConnect.
-        """
-        return pulumi.get(self, "state")
-
-
-@pulumi.output_type
-class SparkConnectStatusConditions(dict):
-    """
-    Condition contains details for one aspect of the current state of this API Resource.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "lastTransitionTime":
-            suggest = "last_transition_time"
-        elif key == "observedGeneration":
-            suggest = "observed_generation"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectStatusConditions. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectStatusConditions.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectStatusConditions.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 last_transition_time: Optional[_builtins.str] = None,
-                 message: Optional[_builtins.str] = None,
-                 observed_generation: Optional[_builtins.int] = None,
-                 reason: Optional[_builtins.str] = None,
-                 status: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        Condition contains details for one aspect of the current state of this API Resource.
-
-        :param _builtins.str last_transition_time: lastTransitionTime is the last time the condition transitioned from one status to another.
-               This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        :param _builtins.str message: message is a human readable message indicating details about the transition.
-               This may be an empty string.
-        :param _builtins.int observed_generation: observedGeneration represents the .metadata.generation that the condition was set based upon.
-               For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-               with respect to the current state of the instance.
-        :param _builtins.str reason: reason contains a programmatic identifier indicating the reason for the condition's last transition.
-               Producers of specific condition types may define expected values and meanings for this field,
-               and whether the values are considered a guaranteed API.
-               The value should be a CamelCase string.
-               This field may not be empty.
-        :param _builtins.str status: status of the condition, one of True, False, Unknown.
-        :param _builtins.str type: type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        if last_transition_time is not None:
-            pulumi.set(__self__, "last_transition_time", last_transition_time)
-        if message is not None:
-            pulumi.set(__self__, "message", message)
-        if observed_generation is not None:
-            pulumi.set(__self__, "observed_generation", observed_generation)
-        if reason is not None:
-            pulumi.set(__self__, "reason", reason)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="lastTransitionTime")
-    def last_transition_time(self) -> Optional[_builtins.str]:
-        """
-        lastTransitionTime is the last time the condition transitioned from one status to another.
-        This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        """
-        return pulumi.get(self, "last_transition_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def message(self) -> Optional[_builtins.str]:
-        """
-        message is a human readable message indicating details about the transition.
-        This may be an empty string.
-        """
-        return pulumi.get(self, "message")
-
-    @_builtins.property
-    @pulumi.getter(name="observedGeneration")
-    def observed_generation(self) -> Optional[_builtins.int]:
-        """
-        observedGeneration represents the .metadata.generation that the condition was set based upon.
-        For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-        with respect to the current state of the instance.
-        """
-        return pulumi.get(self, "observed_generation")
-
-    @_builtins.property
-    @pulumi.getter
-    def reason(self) -> Optional[_builtins.str]:
-        """
-        reason contains a programmatic identifier indicating the reason for the condition's last transition.
-        Producers of specific condition types may define expected values and meanings for this field,
-        and whether the values are considered a guaranteed API.
-        The value should be a CamelCase string.
-        This field may not be empty.
-        """
-        return pulumi.get(self, "reason")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional[_builtins.str]:
-        """
-        status of the condition, one of True, False, Unknown.
-        """
-        return pulumi.get(self, "status")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class SparkConnectStatusConditionsPatch(dict):
-    """
-    Condition contains details for one aspect of the current state of this API Resource.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "lastTransitionTime":
-            suggest = "last_transition_time"
-        elif key == "observedGeneration":
-            suggest = "observed_generation"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectStatusConditionsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectStatusConditionsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectStatusConditionsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 last_transition_time: Optional[_builtins.str] = None,
-                 message: Optional[_builtins.str] = None,
-                 observed_generation: Optional[_builtins.int] = None,
-                 reason: Optional[_builtins.str] = None,
-                 status: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        Condition contains details for one aspect of the current state of this API Resource.
-
-        :param _builtins.str last_transition_time: lastTransitionTime is the last time the condition transitioned from one status to another.
-               This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        :param _builtins.str message: message is a human readable message indicating details about the transition.
-               This may be an empty string.
-        :param _builtins.int observed_generation: observedGeneration represents the .metadata.generation that the condition was set based upon.
-               For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-               with respect to the current state of the instance.
-        :param _builtins.str reason: reason contains a programmatic identifier indicating the reason for the condition's last transition.
-               Producers of specific condition types may define expected values and meanings for this field,
-               and whether the values are considered a guaranteed API.
-               The value should be a CamelCase string.
-               This field may not be empty.
-        :param _builtins.str status: status of the condition, one of True, False, Unknown.
-        :param _builtins.str type: type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        if last_transition_time is not None:
-            pulumi.set(__self__, "last_transition_time", last_transition_time)
-        if message is not None:
-            pulumi.set(__self__, "message", message)
-        if observed_generation is not None:
-            pulumi.set(__self__, "observed_generation", observed_generation)
-        if reason is not None:
-            pulumi.set(__self__, "reason", reason)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="lastTransitionTime")
-    def last_transition_time(self) -> Optional[_builtins.str]:
-        """
-        lastTransitionTime is the last time the condition transitioned from one status to another.
-        This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        """
-        return pulumi.get(self, "last_transition_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def message(self) -> Optional[_builtins.str]:
-        """
-        message is a human readable message indicating details about the transition.
-        This may be an empty string.
-        """
-        return pulumi.get(self, "message")
-
-    @_builtins.property
-    @pulumi.getter(name="observedGeneration")
-    def observed_generation(self) -> Optional[_builtins.int]:
-        """
-        observedGeneration represents the .metadata.generation that the condition was set based upon.
-        For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-        with respect to the current state of the instance.
-        """
-        return pulumi.get(self, "observed_generation")
-
-    @_builtins.property
-    @pulumi.getter
-    def reason(self) -> Optional[_builtins.str]:
-        """
-        reason contains a programmatic identifier indicating the reason for the condition's last transition.
-        Producers of specific condition types may define expected values and meanings for this field,
-        and whether the values are considered a guaranteed API.
-        The value should be a CamelCase string.
-        This field may not be empty.
-        """
-        return pulumi.get(self, "reason")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional[_builtins.str]:
-        """
-        status of the condition, one of True, False, Unknown.
-        """
-        return pulumi.get(self, "status")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class SparkConnectStatusPatch(dict):
-    """
-    SparkConnectStatus defines the observed state of SparkConnect.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "lastUpdateTime":
-            suggest = "last_update_time"
-        elif key == "startTime":
-            suggest = "start_time"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectStatusPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectStatusPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectStatusPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 conditions: Optional[Sequence['outputs.SparkConnectStatusConditionsPatch']] = None,
-                 executors: Optional[Mapping[str, _builtins.int]] = None,
-                 last_update_time: Optional[_builtins.str] = None,
-                 server: Optional['outputs.SparkConnectStatusServerPatch'] = None,
-                 start_time: Optional[_builtins.str] = None,
-                 state: Optional[_builtins.str] = None):
-        """
-        SparkConnectStatus defines the observed state of SparkConnect.
-
-        :param Sequence['SparkConnectStatusConditionsPatchArgs'] conditions: Represents the latest available observations of a SparkConnect's current state.
-        :param Mapping[str, _builtins.int] executors: Executors represents the current state of the SparkConnect executors.
-        :param _builtins.str last_update_time: LastUpdateTime is the time at which the SparkConnect controller last updated the SparkConnect.
-        :param _builtins.str start_time: StartTime is the time at which the SparkConnect controller started processing the SparkConnect.
-        :param _builtins.str state: State represents the current state of the SparkConnect.
-        """
-        if conditions is not None:
-            pulumi.set(__self__, "conditions", conditions)
-        if executors is not None:
-            pulumi.set(__self__, "executors", executors)
-        if last_update_time is not None:
-            pulumi.set(__self__, "last_update_time", last_update_time)
-        if server is not None:
-            pulumi.set(__self__, "server", server)
-        if start_time is not None:
-            pulumi.set(__self__, "start_time", start_time)
-        if state is not None:
-            pulumi.set(__self__, "state", state)
-
-    @_builtins.property
-    @pulumi.getter
-    def conditions(self) -> Optional[Sequence['outputs.SparkConnectStatusConditionsPatch']]:
-        """
-        Represents the latest available observations of a SparkConnect's current state.
-        """
-        return pulumi.get(self, "conditions")
-
-    @_builtins.property
-    @pulumi.getter
-    def executors(self) -> Optional[Mapping[str, _builtins.int]]:
-        """
-        Executors represents the current state of the SparkConnect executors.
-        """
-        return pulumi.get(self, "executors")
-
-    @_builtins.property
-    @pulumi.getter(name="lastUpdateTime")
-    def last_update_time(self) -> Optional[_builtins.str]:
-        """
-        LastUpdateTime is the time at which the SparkConnect controller last updated the SparkConnect.
-        """
-        return pulumi.get(self, "last_update_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def server(self) -> Optional['outputs.SparkConnectStatusServerPatch']:
-        return pulumi.get(self, "server")
-
-    @_builtins.property
-    @pulumi.getter(name="startTime")
-    def start_time(self) -> Optional[_builtins.str]:
-        """
-        StartTime is the time at which the SparkConnect controller started processing the SparkConnect.
-        """
-        return pulumi.get(self, "start_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def state(self) -> Optional[_builtins.str]:
-        """
-        State represents the current state of the SparkConnect.
-        """
-        return pulumi.get(self, "state")
-
-
-@pulumi.output_type
-class SparkConnectStatusServer(dict):
-    """
-    Server represents the current state of the SparkConnect server.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "podIp":
-            suggest = "pod_ip"
-        elif key == "podName":
-            suggest = "pod_name"
-        elif key == "serviceName":
-            suggest = "service_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectStatusServer. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectStatusServer.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectStatusServer.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 pod_ip: Optional[_builtins.str] = None,
-                 pod_name: Optional[_builtins.str] = None,
-                 service_name: Optional[_builtins.str] = None):
-        """
-        Server represents the current state of the SparkConnect server.
-
-        :param _builtins.str pod_ip: PodIP is the IP address of the pod that is running the Spark Connect server.
-        :param _builtins.str pod_name: PodName is the name of the pod that is running the Spark Connect server.
-        :param _builtins.str service_name: ServiceName is the name of the service that is exposing the Spark Connect server.
-        """
-        if pod_ip is not None:
-            pulumi.set(__self__, "pod_ip", pod_ip)
-        if pod_name is not None:
-            pulumi.set(__self__, "pod_name", pod_name)
-        if service_name is not None:
-            pulumi.set(__self__, "service_name", service_name)
-
-    @_builtins.property
-    @pulumi.getter(name="podIp")
-    def pod_ip(self) -> Optional[_builtins.str]:
-        """
-        PodIP is the IP address of the pod that is running the Spark Connect server.
-        """
-        return pulumi.get(self, "pod_ip")
-
-    @_builtins.property
-    @pulumi.getter(name="podName")
-    def pod_name(self) -> Optional[_builtins.str]:
-        """
-        PodName is the name of the pod that is running the Spark Connect server.
-        """
-        return pulumi.get(self, "pod_name")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceName")
-    def service_name(self) -> Optional[_builtins.str]:
-        """
-        ServiceName is the name of the service that is exposing the Spark Connect server.
-        """
-        return pulumi.get(self, "service_name")
-
-
-@pulumi.output_type
-class SparkConnectStatusServerPatch(dict):
-    """
-    Server represents the current state of the SparkConnect server.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "podIp":
-            suggest = "pod_ip"
-        elif key == "podName":
-            suggest = "pod_name"
-        elif key == "serviceName":
-            suggest = "service_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in SparkConnectStatusServerPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        SparkConnectStatusServerPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        SparkConnectStatusServerPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 pod_ip: Optional[_builtins.str] = None,
-                 pod_name: Optional[_builtins.str] = None,
-                 service_name: Optional[_builtins.str] = None):
-        """
-        Server represents the current state of the SparkConnect server.
-
-        :param _builtins.str pod_ip: PodIP is the IP address of the pod that is running the Spark Connect server.
-        :param _builtins.str pod_name: PodName is the name of the pod that is running the Spark Connect server.
-        :param _builtins.str service_name: ServiceName is the name of the service that is exposing the Spark Connect server.
-        """
-        if pod_ip is not None:
-            pulumi.set(__self__, "pod_ip", pod_ip)
-        if pod_name is not None:
-            pulumi.set(__self__, "pod_name", pod_name)
-        if service_name is not None:
-            pulumi.set(__self__, "service_name", service_name)
-
-    @_builtins.property
-    @pulumi.getter(name="podIp")
-    def pod_ip(self) -> Optional[_builtins.str]:
-        """
-        PodIP is the IP address of the pod that is running the Spark Connect server.
-        """
-        return pulumi.get(self, "pod_ip")
-
-    @_builtins.property
-    @pulumi.getter(name="podName")
-    def pod_name(self) -> Optional[_builtins.str]:
-        """
-        PodName is the name of the pod that is running the Spark Connect server.
-        """
-        return pulumi.get(self, "pod_name")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceName")
-    def service_name(self) -> Optional[_builtins.str]:
-        """
-        ServiceName is the name of the service that is exposing the Spark Connect server.
-        """
-        return pulumi.get(self, "service_name")
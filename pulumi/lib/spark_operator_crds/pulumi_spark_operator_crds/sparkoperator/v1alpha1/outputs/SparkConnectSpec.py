@@ -0,0 +1,133 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['SparkConnectSpec']
+
+@pulumi.output_type
+class SparkConnectSpec(dict):
+    """
+    SparkConnectSpec defines the desired state of SparkConnect.
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "dynamicAllocation":
+            suggest = "dynamic_allocation"
+        elif key == "hadoopConf":
+            suggest = "hadoop_conf"
+        elif key == "sparkConf":
+            suggest = "spark_conf"
+        elif key == "sparkVersion":
+            suggest = "spark_version"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpec. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        SparkConnectSpec.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        SparkConnectSpec.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 dynamic_allocation: Optional['outputs.SparkConnectSpecDynamicAllocation'] = None,
+                 executor: Optional['outputs.SparkConnectSpecExecutor'] = None,
+                 hadoop_conf: Optional[Mapping[str, _builtins.str]] = None,
+                 image: Optional[_builtins.str] = None,
+                 server: Optional['outputs.SparkConnectSpecServer'] = None,
+                 spark_conf: Optional[Mapping[str, _builtins.str]] = None,
+                 spark_version: Optional[_builtins.str] = None):
+        """
+        SparkConnectSpec defines the desired state of SparkConnect.
+
+        :param Mapping[str, _builtins.str] hadoop_conf: HadoopConf carries user-specified Hadoop configuration properties as they would use the "--conf" option
+               in spark-submit. The SparkApplication controller automatically adds prefix "spark.hadoop." to Hadoop
+               configuration properties.
+        :param _builtins.str image: Image is the container image for the driver, executor, and init-container. Any custom container images for the
+               driver, executor, or init-container takes precedence over this.
+        :param Mapping[str, _builtins.str] spark_conf: SparkConf carries user-specified Spark configuration properties as they would use the "--conf" option in
+               spark-submit.
+        :param _builtins.str spark_version: SparkVersion is the version of Spark the spark connect use.
+        """
+        if dynamic_allocation is not None:
+            pulumi.set(__self__, "dynamic_allocation", dynamic_allocation)
+        if executor is not None:
+            pulumi.set(__self__, "executor", executor)
+        if hadoop_conf is not None:
+            pulumi.set(__self__, "hadoop_conf", hadoop_conf)
+        if image is not None:
+            pulumi.set(__self__, "image", image)
+        if server is not None:
+            pulumi.set(__self__, "server", server)
+        if spark_conf is not None:
+            pulumi.set(__self__, "spark_conf", spark_conf)
+        if spark_version is not None:
+            pulumi.set(__self__, "spark_version", spark_version)
+
+    @_builtins.property
+    @pulumi.getter(name="dynamicAllocation")
+    def dynamic_allocation(self) -> Optional['outputs.SparkConnectSpecDynamicAllocation']:
+        return pulumi.get(self, "dynamic_allocation")
+
+    @_builtins.property
+    @pulumi.getter
+    def executor(self) -> Optional['outputs.SparkConnectSpecExecutor']:
+        return pulumi.get(self, "executor")
+
+    @_builtins.property
+    @pulumi.getter(name="hadoopConf")
+    def hadoop_conf(self) -> Optional[Mapping[str, _builtins.str]]:
+        """
+        HadoopConf carries user-specified Hadoop configuration properties as they would use the "--conf" option
+        in spark-submit. The SparkApplication controller automatically adds prefix "spark.hadoop." to Hadoop
+        configuration properties.
+        """
+        return pulumi.get(self, "hadoop_conf")
+
+    @_builtins.property
+    @pulumi.getter
+    def image(self) -> Optional[_builtins.str]:
+        """
+        Image is the container image for the driver, executor, and init-container. Any custom container images for the
+        driver, executor, or init-container takes precedence over this.
+        """
+        return pulumi.get(self, "image")
+
+    @_builtins.property
+    @pulumi.getter
+    def server(self) -> Optional['outputs.SparkConnectSpecServer']:
+        return pulumi.get(self, "server")
+
+    @_builtins.property
+    @pulumi.getter(name="sparkConf")
+    def spark_conf(self) -> Optional[Mapping[str, _builtins.str]]:
+        """
+        SparkConf carries user-specified Spark configuration properties as they would use the "--conf" option in
+        spark-submit.
+        """
+        return pulumi.get(self, "spark_conf")
+
+    @_builtins.property
+    @pulumi.getter(name="sparkVersion")
+    def spark_version(self) -> Optional[_builtins.str]:
+        """
+        SparkVersion is the version of Spark the spark connect use.
+        """
+        return pulumi.get(self, "spark_version")
@@ -0,0 +1,139 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['SparkConnectSpecDynamicAllocation']
+
+@pulumi.output_type
+class SparkConnectSpecDynamicAllocation(dict):
+    """
+    DynamicAllocation configures dynamic allocation that becomes available for the Kubernetes
+    scheduler backend since Spark 3.0.
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "initialExecutors":
+            suggest = "initial_executors"
+        elif key == "maxExecutors":
+            suggest = "max_executors"
+        elif key == "minExecutors":
+            suggest = "min_executors"
+        elif key == "shuffleTrackingEnabled":
+            suggest = "shuffle_tracking_enabled"
+        elif key == "shuffleTrackingTimeout":
+            suggest = "shuffle_tracking_timeout"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecDynamicAllocation. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        SparkConnectSpecDynamicAllocation.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        SparkConnectSpecDynamicAllocation.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 enabled: Optional[_builtins.bool] = None,
+                 initial_executors: Optional[_builtins.int] = None,
+                 max_executors: Optional[_builtins.int] = None,
+                 min_executors: Optional[_builtins.int] = None,
+                 shuffle_tracking_enabled: Optional[_builtins.bool] = None,
+                 shuffle_tracking_timeout: Optional[_builtins.int] = None):
+        """
+        DynamicAllocation configures dynamic allocation that becomes available for the Kubernetes
+        scheduler backend since Spark 3.0.
+
+        :param _builtins.bool enabled: Enabled controls whether dynamic allocation is enabled or not.
+        :param _builtins.int initial_executors: InitialExecutors is the initial number of executors to request. If .spec.executor.instances
+               is also set, the initial number of executors is set to the bigger of that and this option.
+        :param _builtins.int max_executors: MaxExecutors is the upper bound for the number of executors if dynamic allocation is enabled.
+        :param _builtins.int min_executors: MinExecutors is the lower bound for the number of executors if dynamic allocation is enabled.
+        :param _builtins.bool shuffle_tracking_enabled: ShuffleTrackingEnabled enables shuffle file tracking for executors, which allows dynamic allocation without
+               the need for an external shuffle service. This option will try to keep alive executors that are storing
+               shuffle data for active jobs. If external shuffle service is enabled, set ShuffleTrackingEnabled to false.
+               ShuffleTrackingEnabled is true by default if dynamicAllocation.enabled is true.
+        :param _builtins.int shuffle_tracking_timeout: ShuffleTrackingTimeout controls the timeout in milliseconds for executors that are holding
+               shuffle data if shuffle tracking is enabled (true by default if dynamic allocation is enabled).
+        """
+        if enabled is not None:
+            pulumi.set(__self__, "enabled", enabled)
+        if initial_executors is not None:
+            pulumi.set(__self__, "initial_executors", initial_executors)
+        if max_executors is not None:
+            pulumi.set(__self__, "max_executors", max_executors)
+        if min_executors is not None:
+            pulumi.set(__self__, "min_executors", min_executors)
+        if shuffle_tracking_enabled is not None:
+            pulumi.set(__self__, "shuffle_tracking_enabled", shuffle_tracking_enabled)
+        if shuffle_tracking_timeout is not None:
+            pulumi.set(__self__, "shuffle_tracking_timeout", shuffle_tracking_timeout)
+
+    @_builtins.property
+    @pulumi.getter
+    def enabled(self) -> Optional[_builtins.bool]:
+        """
+        Enabled controls whether dynamic allocation is enabled or not.
+        """
+        return pulumi.get(self, "enabled")
+
+    @_builtins.property
+    @pulumi.getter(name="initialExecutors")
+    def initial_executors(self) -> Optional[_builtins.int]:
+        """
+        InitialExecutors is the initial number of executors to request. If .spec.executor.instances
+        is also set, the initial number of executors is set to the bigger of that and this option.
+        """
+        return pulumi.get(self, "initial_executors")
+
+    @_builtins.property
+    @pulumi.getter(name="maxExecutors")
+    def max_executors(self) -> Optional[_builtins.int]:
+        """
+        MaxExecutors is the upper bound for the number of executors if dynamic allocation is enabled.
+        """
+        return pulumi.get(self, "max_executors")
+
+    @_builtins.property
+    @pulumi.getter(name="minExecutors")
+    def min_executors(self) -> Optional[_builtins.int]:
+        """
+        MinExecutors is the lower bound for the number of executors if dynamic allocation is enabled.
+        """
+        return pulumi.get(self, "min_executors")
+
+    @_builtins.property
+    @pulumi.getter(name="shuffleTrackingEnabled")
+    def shuffle_tracking_enabled(self) -> Optional[_builtins.bool]:
+        """
+        ShuffleTrackingEnabled enables shuffle file tracking for executors, which allows dynamic allocation without
+        the need for an external shuffle service. This option will try to keep alive executors that are storing
+        shuffle data for active jobs. If external shuffle service is enabled, set ShuffleTrackingEnabled to false.
+        ShuffleTrackingEnabled is true by default if dynamicAllocation.enabled is true.
+        """
+        return pulumi.get(self, "shuffle_tracking_enabled")
+
+    @_builtins.property
+    @pulumi.getter(name="shuffleTrackingTimeout")
+    def shuffle_tracking_timeout(self) -> Optional[_builtins.int]:
+        """
+        ShuffleTrackingTimeout controls the timeout in milliseconds for executors that are holding
+        shuffle data if shuffle tracking is enabled (true by default if dynamic allocation is enabled).
+        """
+        return pulumi.get(self, "shuffle_tracking_timeout")
@@ -0,0 +1,63 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIP']
+
+@pulumi.output_type
+class SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIP(dict):
+    """
+    clientIP contains the configurations of Client IP based session affinity.
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "timeoutSeconds":
+            suggest = "timeout_seconds"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIP. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIP.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIP.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 timeout_seconds: Optional[_builtins.int] = None):
+        """
+        clientIP contains the configurations of Client IP based session affinity.
+
+        :param _builtins.int timeout_seconds: timeoutSeconds specifies the seconds of ClientIP type session sticky time.
+               The value must be >0 && <=86400(for 1 day) if ServiceAffinity == "ClientIP".
+               Default value is 10800(for 3 hours).
+        """
+        if timeout_seconds is not None:
+            pulumi.set(__self__, "timeout_seconds", timeout_seconds)
+
+    @_builtins.property
+    @pulumi.getter(name="timeoutSeconds")
+    def timeout_seconds(self) -> Optional[_builtins.int]:
+        """
+        timeoutSeconds specifies the seconds of ClientIP type session sticky time.
+        The value must be >0 && <=86400(for 1 day) if ServiceAffinity == "ClientIP".
+        Default value is 10800(for 3 hours).
+        """
+        return pulumi.get(self, "timeout_seconds")
@@ -0,0 +1,113 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['SparkConnectSpecServerServiceStatusLoadBalancerIngress']
+
+@pulumi.output_type
+class SparkConnectSpecServerServiceStatusLoadBalancerIngress(dict):
+    """
+    LoadBalancerIngress represents the status of a load-balancer ingress point:
+    traffic intended for the service should be sent to an ingress point.
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "ipMode":
+            suggest = "ip_mode"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in SparkConnectSpecServerServiceStatusLoadBalancerIngress. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        SparkConnectSpecServerServiceStatusLoadBalancerIngress.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        SparkConnectSpecServerServiceStatusLoadBalancerIngress.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 hostname: Optional[_builtins.str] = None,
+                 ip: Optional[_builtins.str] = None,
+                 ip_mode: Optional[_builtins.str] = None,
+                 ports: Optional[Sequence['outputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressPorts']] = None):
+        """
+        LoadBalancerIngress represents the status of a load-balancer ingress point:
+        traffic intended for the service should be sent to an ingress point.
+
+        :param _builtins.str hostname: Hostname is set for load-balancer ingress points that are DNS based
+               (typically AWS load-balancers)
+        :param _builtins.str ip: IP is set for load-balancer ingress points that are IP based
+               (typically GCE or OpenStack load-balancers)
+        :param _builtins.str ip_mode: IPMode specifies how the load-balancer IP behaves, and may only be specified when the ip field is specified.
+               Setting this to "VIP" indicates that traffic is delivered to the node with
+               the destination set to the load-balancer's IP and port.
+               Setting this to "Proxy" indicates that traffic is delivered to the node or pod with
+               the destination set to the node's IP and node port or the pod's IP and port.
+               Service implementations may use this information to adjust traffic routing.
+        :param Sequence['SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsArgs'] ports: Ports is a list of records of service ports
+               If used, every port defined in the service should have an entry in it
+        """
+        if hostname is not None:
+            pulumi.set(__self__, "hostname", hostname)
+        if ip is not None:
+            pulumi.set(__self__, "ip", ip)
+        if ip_mode is not None:
+            pulumi.set(__self__, "ip_mode", ip_mode)
+        if ports is not None:
+            pulumi.set(__self__, "ports", ports)
+
+    @_builtins.property
+    @pulumi.getter
+    def hostname(self) -> Optional[_builtins.str]:
+        """
+        Hostname is set for load-balancer ingress points that are DNS based
+        (typically AWS load-balancers)
+        """
+        return pulumi.get(self, "hostname")
+
+    @_builtins.property
+    @pulumi.getter
+    def ip(self) -> Optional[_builtins.str]:
+        """
+        IP is set for load-balancer ingress points that are IP based
+        (typically GCE or OpenStack load-balancers)
+        """
+        return pulumi.get(self, "ip")
+
+    @_builtins.property
+    @pulumi.getter(name="ipMode")
+    def ip_mode(self) -> Optional[_builtins.str]:
+        """
+        IPMode specifies how the load-balancer IP behaves, and may only be specified when the ip field is specified.
+        Setting this to "VIP" indicates that traffic is delivered to the node with
+        the destination set to the load-balancer's IP and port.
+        Setting this to "Proxy" indicates that traffic is delivered to the node or pod with
+        the destination set to the node's IP and node port or the pod's IP and port.
+        Service implementations may use this information to adjust traffic routing.
+        """
+        return pulumi.get(self, "ip_mode")
+
+    @_builtins.property
+    @pulumi.getter
+    def ports(self) -> Optional[Sequence['outputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressPorts']]:
+        """
+        Ports is a list of records of service ports
+        If used, every port defined in the service should have an entry in it
+        """
+        return pulumi.get(self, "ports")
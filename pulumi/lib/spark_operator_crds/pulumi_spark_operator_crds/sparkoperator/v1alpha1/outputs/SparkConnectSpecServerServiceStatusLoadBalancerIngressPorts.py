@@ -0,0 +1,78 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['SparkConnectSpecServerServiceStatusLoadBalancerIngressPorts']
+
+@pulumi.output_type
+class SparkConnectSpecServerServiceStatusLoadBalancerIngressPorts(dict):
+    """
+    PortStatus represents the error condition of a service port
+    """
+    def __init__(__self__, *,
+                 error: Optional[_builtins.str] = None,
+                 port: Optional[_builtins.int] = None,
+                 protocol: Optional[_builtins.str] = None):
+        """
+        PortStatus represents the error condition of a service port
+
+        :param _builtins.str error: Error is to record the problem with the service port
+               The format of the error shall comply with the following rules:
+               - built-in error values shall be specified in this file and those shall use
+                 CamelCase names
+               - cloud provider specific error values must have names that comply with the
+                 format foo.example.com/CamelCase.
+        :param _builtins.int port: Port is the port number of the service port of which status is recorded here
+        :param _builtins.str protocol: Protocol is the protocol of the service port of which status is recorded here
+               The supported values are: "TCP", "UDP", "SCTP"
+        """
+        if error is not None:
+            pulumi.set(__self__, "error", error)
+        if port is not None:
+            pulumi.set(__self__, "port", port)
+        if protocol is not None:
+            pulumi.set(__self__, "protocol", protocol)
+
+    @_builtins.property
+    @pulumi.getter
+    def error(self) -> Optional[_builtins.str]:
+        """
+        Error is to record the problem with the service port
+        The format of the error shall comply with the following rules:
+        - built-in error values shall be specified in this file and those shall use
+          CamelCase names
+        - cloud provider specific error values must have names that comply with the
+          format foo.example.com/CamelCase.
+        """
+        return pulumi.get(self, "error")
+
+    @_builtins.property
+    @pulumi.getter
+    def port(self) -> Optional[_builtins.int]:
+        """
+        Port is the port number of the service port of which status is recorded here
+        """
+        return pulumi.get(self, "port")
+
+    @_builtins.property
+    @pulumi.getter
+    def protocol(self) -> Optional[_builtins.str]:
+        """
+        Protocol is the protocol of the service port of which status is recorded here
+        The supported values are: "TCP", "UDP", "SCTP"
+        """
+        return pulumi.get(self, "protocol")
@@ -0,0 +1,46 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['SparkConnectSpecServerServiceStatusLoadBalancerPatch']
+
+@pulumi.output_type
+class SparkConnectSpecServerServiceStatusLoadBalancerPatch(dict):
+    """
+    LoadBalancer contains the current status of the load-balancer,
+    if one is present.
+    """
+    def __init__(__self__, *,
+                 ingress: Optional[Sequence['outputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressPatch']] = None):
+        """
+        LoadBalancer contains the current status of the load-balancer,
+        if one is present.
+
+        :param Sequence['SparkConnectSpecServerServiceStatusLoadBalancerIngressPatchArgs'] ingress: Ingress is a list containing ingress points for the load-balancer.
+               Traffic intended for the service should be sent to these ingress points.
+        """
+        if ingress is not None:
+            pulumi.set(__self__, "ingress", ingress)
+
+    @_builtins.property
+    @pulumi.getter
+    def ingress(self) -> Optional[Sequence['outputs.SparkConnectSpecServerServiceStatusLoadBalancerIngressPatch']]:
+        """
+        Ingress is a list containing ingress points for the load-balancer.
+        Traffic intended for the service should be sent to these ingress points.
+        """
+        return pulumi.get(self, "ingress")
@@ -0,0 +1,117 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['SparkConnectStatusPatch']
+
+@pulumi.output_type
+class SparkConnectStatusPatch(dict):
+    """
+    SparkConnectStatus defines the observed state of SparkConnect.
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "lastUpdateTime":
+            suggest = "last_update_time"
+        elif key == "startTime":
+            suggest = "start_time"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in SparkConnectStatusPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        SparkConnectStatusPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        SparkConnectStatusPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 conditions: Optional[Sequence['outputs.SparkConnectStatusConditionsPatch']] = None,
+                 executors: Optional[Mapping[str, _builtins.int]] = None,
+                 last_update_time: Optional[_builtins.str] = None,
+                 server: Optional['outputs.SparkConnectStatusServerPatch'] = None,
+                 start_time: Optional[_builtins.str] = None,
+                 state: Optional[_builtins.str] = None):
+        """
+        SparkConnectStatus defines the observed state of SparkConnect.
+
+        :param Sequence['SparkConnectStatusConditionsPatchArgs'] conditions: Represents the latest available observations of a SparkConnect's current state.
+        :param Mapping[str, _builtins.int] executors: Executors represents the current state of the SparkConnect executors.
+        :param _builtins.str last_update_time: LastUpdateTime is the time at which the SparkConnect controller last updated the SparkConnect.
+        :param _builtins.str start_time: StartTime is the time at which the SparkConnect controller started processing the SparkConnect.
+        :param _builtins.str state: State represents the current state of the SparkConnect.
+        """
+        if conditions is not None:
+            pulumi.set(__self__, "conditions", conditions)
+        if executors is not None:
+            pulumi.set(__self__, "executors", executors)
+        if last_update_time is not None:
+            pulumi.set(__self__, "last_update_time", last_update_time)
+        if server is not None:
+            pulumi.set(__self__, "server", server)
+        if start_time is not None:
+            pulumi.set(__self__, "start_time", start_time)
+        if state is not None:
+            pulumi.set(__self__, "state", state)
+
+    @_builtins.property
+    @pulumi.getter
+    def conditions(self) -> Optional[Sequence['outputs.SparkConnectStatusConditionsPatch']]:
+        """
+        Represents the latest available observations of a SparkConnect's current state.
+        """
+        return pulumi.get(self, "conditions")
+
+    @_builtins.property
+    @pulumi.getter
+    def executors(self) -> Optional[Mapping[str, _builtins.int]]:
+        """
+        Executors represents the current state of the SparkConnect executors.
+        """
+        return pulumi.get(self, "executors")
+
+    @_builtins.property
+    @pulumi.getter(name="lastUpdateTime")
+    def last_update_time(self) -> Optional[_builtins.str]:
+        """
+        LastUpdateTime is the time at which the SparkConnect controller last updated the SparkConnect.
+        """
+        return pulumi.get(self, "last_update_time")
+
+    @_builtins.property
+    @pulumi.getter
+    def server(self) -> Optional['outputs.SparkConnectStatusServerPatch']:
+        return pulumi.get(self, "server")
+
+    @_builtins.property
+    @pulumi.getter(name="startTime")
+    def start_time(self) -> Optional[_builtins.str]:
+        """
+        StartTime is the time at which the SparkConnect controller started processing the SparkConnect.
+        """
+        return pulumi.get(self, "start_time")
+
+    @_builtins.property
+    @pulumi.getter
+    def state(self) -> Optional[_builtins.str]:
+        """
+        State represents the current state of the SparkConnect.
+        """
+        return pulumi.get(self, "state")
@@ -0,0 +1,87 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['SparkConnectStatusServerPatch']
+
+@pulumi.output_type
+class SparkConnectStatusServerPatch(dict):
+    """
+    Server represents the current state of the SparkConnect server.
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "podIp":
+            suggest = "pod_ip"
+        elif key == "podName":
+            suggest = "pod_name"
+        elif key == "serviceName":
+            suggest = "service_name"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in SparkConnectStatusServerPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        SparkConnectStatusServerPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        SparkConnectStatusServerPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 pod_ip: Optional[_builtins.str] = None,
+                 pod_name: Optional[_builtins.str] = None,
+                 service_name: Optional[_builtins.str] = None):
+        """
+        Server represents the current state of the SparkConnect server.
+
+        :param _builtins.str pod_ip: PodIP is the IP address of the pod that is running the Spark Connect server.
+        :param _builtins.str pod_name: PodName is the name of the pod that is running the Spark Connect server.
+        :param _builtins.str service_name: ServiceName is the name of the service that is exposing the Spark Connect server.
+        """
+        if pod_ip is not None:
+            pulumi.set(__self__, "pod_ip", pod_ip)
+        if pod_name is not None:
+            pulumi.set(__self__, "pod_name", pod_name)
+        if service_name is not None:
+            pulumi.set(__self__, "service_name", service_name)
+
+    @_builtins.property
+    @pulumi.getter(name="podIp")
+    def pod_ip(self) -> Optional[_builtins.str]:
+        """
+        PodIP is the IP address of the pod that is running the Spark Connect server.
+        """
+        return pulumi.get(self, "pod_ip")
+
+    @_builtins.property
+    @pulumi.getter(name="podName")
+    def pod_name(self) -> Optional[_builtins.str]:
+        """
+        PodName is the name of the pod that is running the Spark Connect server.
+        """
+        return pulumi.get(self, "pod_name")
+
+    @_builtins.property
+    @pulumi.getter(name="serviceName")
+    def service_name(self) -> Optional[_builtins.str]:
+        """
+        ServiceName is the name of the service that is exposing the Spark Connect server.
+        """
+        return pulumi.get(self, "service_name")
@@ -0,0 +1,138 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import importlib
+import typing
+
+__all__ = [
+    'SparkConnect',
+    'SparkConnectSpec',
+    'SparkConnectSpecDynamicAllocation',
+    'SparkConnectSpecDynamicAllocationPatch',
+    'SparkConnectSpecExecutor',
+    'SparkConnectSpecExecutorPatch',
+    'SparkConnectSpecPatch',
+    'SparkConnectSpecServer',
+    'SparkConnectSpecServerPatch',
+    'SparkConnectSpecServerService',
+    'SparkConnectSpecServerServiceMetadata',
+    'SparkConnectSpecServerServiceMetadataPatch',
+    'SparkConnectSpecServerServicePatch',
+    'SparkConnectSpecServerServiceSpec',
+    'SparkConnectSpecServerServiceSpecPatch',
+    'SparkConnectSpecServerServiceSpecPorts',
+    'SparkConnectSpecServerServiceSpecPortsPatch',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfig',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIP',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatch',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigPatch',
+    'SparkConnectSpecServerServiceStatus',
+    'SparkConnectSpecServerServiceStatusConditions',
+    'SparkConnectSpecServerServiceStatusConditionsPatch',
+    'SparkConnectSpecServerServiceStatusLoadBalancer',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngress',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPatch',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPorts',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatch',
+    'SparkConnectSpecServerServiceStatusLoadBalancerPatch',
+    'SparkConnectSpecServerServiceStatusPatch',
+    'SparkConnectStatus',
+    'SparkConnectStatusConditions',
+    'SparkConnectStatusConditionsPatch',
+    'SparkConnectStatusPatch',
+    'SparkConnectStatusServer',
+    'SparkConnectStatusServerPatch',
+]
+
+_TYPE_MODULES = {
+    'SparkConnect': 'SparkConnect',
+    'SparkConnectSpec': 'SparkConnectSpec',
+    'SparkConnectSpecDynamicAllocation': 'SparkConnectSpecDynamicAllocation',
+    'SparkConnectSpecDynamicAllocationPatch': 'SparkConnectSpecDynamicAllocationPatch',
+    'SparkConnectSpecExecutor': 'SparkConnectSpecExecutor',
+    'SparkConnectSpecExecutorPatch': 'SparkConnectSpecExecutorPatch',
+    'SparkConnectSpecPatch': 'SparkConnectSpecPatch',
+    'SparkConnectSpecServer': 'SparkConnectSpecServer',
+    'SparkConnectSpecServerPatch': 'SparkConnectSpecServerPatch',
+    'SparkConnectSpecServerService': 'SparkConnectSpecServerService',
+    'SparkConnectSpecServerServiceMetadata': 'SparkConnectSpecServerServiceMetadata',
+    'SparkConnectSpecServerServiceMetadataPatch': 'SparkConnectSpecServerServiceMetadataPatch',
+    'SparkConnectSpecServerServicePatch': 'SparkConnectSpecServerServicePatch',
+    'SparkConnectSpecServerServiceSpec': 'SparkConnectSpecServerServiceSpec',
+    'SparkConnectSpecServerServiceSpecPatch': 'SparkConnectSpecServerServiceSpecPatch',
+    'SparkConnectSpecServerServiceSpecPorts': 'SparkConnectSpecServerServiceSpecPorts',
+    'SparkConnectSpecServerServiceSpecPortsPatch': 'SparkConnectSpecServerServiceSpecPortsPatch',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfig': 'SparkConnectSpecServerServiceSpecSessionAffinityConfig',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIP': 'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIP',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatch': 'SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatch',
+    'SparkConnectSpecServerServiceSpecSessionAffinityConfigPatch': 'SparkConnectSpecServerServiceSpecSessionAffinityConfigPatch',
+    'SparkConnectSpecServerServiceStatus': 'SparkConnectSpecServerServiceStatus',
+    'SparkConnectSpecServerServiceStatusConditions': 'SparkConnectSpecServerServiceStatusConditions',
+    'SparkConnectSpecServerServiceStatusConditionsPatch': 'SparkConnectSpecServerServiceStatusConditionsPatch',
+    'SparkConnectSpecServerServiceStatusLoadBalancer': 'SparkConnectSpecServerServiceStatusLoadBalancer',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngress': 'SparkConnectSpecServerServiceStatusLoadBalancerIngress',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPatch': 'SparkConnectSpecServerServiceStatusLoadBalancerIngressPatch',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPorts': 'SparkConnectSpecServerServiceStatusLoadBalancerIngressPorts',
+    'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatch': 'SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatch',
+    'SparkConnectSpecServerServiceStatusLoadBalancerPatch': 'SparkConnectSpecServerServiceStatusLoadBalancerPatch',
+    'SparkConnectSpecServerServiceStatusPatch': 'SparkConnectSpecServerServiceStatusPatch',
+    'SparkConnectStatus': 'SparkConnectStatus',
+    'SparkConnectStatusConditions': 'SparkConnectStatusConditions',
+    'SparkConnectStatusConditionsPatch': 'SparkConnectStatusConditionsPatch',
+    'SparkConnectStatusPatch': 'SparkConnectStatusPatch',
+    'SparkConnectStatusServer': 'SparkConnectStatusServer',
+    'SparkConnectStatusServerPatch': 'SparkConnectStatusServerPatch',
+}
+
+if typing.TYPE_CHECKING:
+    from .SparkConnect import *
+    from .SparkConnectSpec import *
+    from .SparkConnectSpecDynamicAllocation import *
+    from .SparkConnectSpecDynamicAllocationPatch import *
+    from .SparkConnectSpecExecutor import *
+    from .SparkConnectSpecExecutorPatch import *
+    from .SparkConnectSpecPatch import *
+    from .SparkConnectSpecServer import *
+    from .SparkConnectSpecServerPatch import *
+    from .SparkConnectSpecServerService import *
+    from .SparkConnectSpecServerServiceMetadata import *
+    from .SparkConnectSpecServerServiceMetadataPatch import *
+    from .SparkConnectSpecServerServicePatch import *
+    from .SparkConnectSpecServerServiceSpec import *
+    from .SparkConnectSpecServerServiceSpecPatch import *
+    from .SparkConnectSpecServerServiceSpecPorts import *
+    from .SparkConnectSpecServerServiceSpecPortsPatch import *
+    from .SparkConnectSpecServerServiceSpecSessionAffinityConfig import *
+    from .SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIP import *
+    from .SparkConnectSpecServerServiceSpecSessionAffinityConfigClientIPPatch import *
+    from .SparkConnectSpecServerServiceSpecSessionAffinityConfigPatch import *
+    from .SparkConnectSpecServerServiceStatus import *
+    from .SparkConnectSpecServerServiceStatusConditions import *
+    from .SparkConnectSpecServerServiceStatusConditionsPatch import *
+    from .SparkConnectSpecServerServiceStatusLoadBalancer import *
+    from .SparkConnectSpecServerServiceStatusLoadBalancerIngress import *
+    from .SparkConnectSpecServerServiceStatusLoadBalancerIngressPatch import *
+    from .SparkConnectSpecServerServiceStatusLoadBalancerIngressPorts import *
+    from .SparkConnectSpecServerServiceStatusLoadBalancerIngressPortsPatch import *
+    from .SparkConnectSpecServerServiceStatusLoadBalancerPatch import *
+    from .SparkConnectSpecServerServiceStatusPatch import *
+    from .SparkConnectStatus import *
+    from .SparkConnectStatusConditions import *
+    from .SparkConnectStatusConditionsPatch import *
+    from .SparkConnectStatusPatch import *
+    from .SparkConnectStatusServer import *
+    from .SparkConnectStatusServerPatch import *
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _TYPE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
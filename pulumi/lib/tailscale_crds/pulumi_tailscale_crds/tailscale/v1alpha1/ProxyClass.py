@@ -15,7 +15,7 @@ else:
 from ... import _utilities
 from . import outputs
 from ... import meta as _meta
-from ._inputs import *
+from . import _inputs
 
 __all__ = ['ProxyClassInitArgs', 'ProxyClass']
 
@@ -25,7 +25,7 @@ class ProxyClassInitArgs:
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']] = None,
-                 spec: pulumi.Input[Optional['ProxyClassSpecArgs']] = None):
+                 spec: pulumi.Input[Optional['_inputs.ProxyClassSpecArgs']] = None):
         """
         The set of arguments for constructing a ProxyClass resource.
 
@@ -80,11 +80,11 @@ class ProxyClassInitArgs:
 
     @_builtins.property
     @pulumi.getter
-    def spec(self) -> pulumi.Input[Optional['ProxyClassSpecArgs']]:
+    def spec(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecArgs']]:
         return pulumi.get(self, "spec")
 
     @spec.setter
-    def spec(self, value: pulumi.Input[Optional['ProxyClassSpecArgs']]):
+    def spec(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecArgs']]):
         pulumi.set(self, "spec", value)
 
 
@@ -97,7 +97,7 @@ class ProxyClass(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaArgs', '_meta.v1.ObjectMetaArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['ProxyClassSpecArgs', 'ProxyClassSpecArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.ProxyClassSpecArgs', '_inputs.ProxyClassSpecArgsDict']]] = None,
                  __props__=None):
         """
         ProxyClass describes a set of configuration parameters that can be applied to
@@ -153,7 +153,7 @@ class ProxyClass(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaArgs', '_meta.v1.ObjectMetaArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['ProxyClassSpecArgs', 'ProxyClassSpecArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.ProxyClassSpecArgs', '_inputs.ProxyClassSpecArgsDict']]] = None,
                  __props__=None):
         opts = pulumi.ResourceOptions.merge(_utilities.get_resource_opts_defaults(), opts)
         if not isinstance(opts, pulumi.ResourceOptions):
@@ -15,7 +15,7 @@ else:
 from ... import _utilities
 from . import outputs
 from ... import meta as _meta
-from ._inputs import *
+from . import _inputs
 
 __all__ = ['ProxyClassPatchArgs', 'ProxyClassPatch']
 
@@ -25,7 +25,7 @@ class ProxyClassPatchArgs:
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional['_meta.v1.ObjectMetaPatchArgs']] = None,
-                 spec: pulumi.Input[Optional['ProxyClassSpecPatchArgs']] = None):
+                 spec: pulumi.Input[Optional['_inputs.ProxyClassSpecPatchArgs']] = None):
         """
         The set of arguments for constructing a ProxyClassPatch resource.
 
@@ -80,11 +80,11 @@ class ProxyClassPatchArgs:
 
     @_builtins.property
     @pulumi.getter
-    def spec(self) -> pulumi.Input[Optional['ProxyClassSpecPatchArgs']]:
+    def spec(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecPatchArgs']]:
         return pulumi.get(self, "spec")
 
     @spec.setter
-    def spec(self, value: pulumi.Input[Optional['ProxyClassSpecPatchArgs']]):
+    def spec(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecPatchArgs']]):
         pulumi.set(self, "spec", value)
 
 
@@ -97,7 +97,7 @@ class ProxyClassPatch(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaPatchArgs', '_meta.v1.ObjectMetaPatchArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['ProxyClassSpecPatchArgs', 'ProxyClassSpecPatchArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.ProxyClassSpecPatchArgs', '_inputs.ProxyClassSpecPatchArgsDict']]] = None,
                  __props__=None):
         """
         Patch resources are used to modify existing Kubernetes resources by using
@@ -165,7 +165,7 @@ class ProxyClassPatch(pulumi.CustomResource):
                  api_version: pulumi.Input[Optional[_builtins.str]] = None,
                  kind: pulumi.Input[Optional[_builtins.str]] = None,
                  metadata: pulumi.Input[Optional[Union['_meta.v1.ObjectMetaPatchArgs', '_meta.v1.ObjectMetaPatchArgsDict']]] = None,
-                 spec: pulumi.Input[Optional[Union['ProxyClassSpecPatchArgs', 'ProxyClassSpecPatchArgsDict']]] = None,
+                 spec: pulumi.Input[Optional[Union['_inputs.ProxyClassSpecPatchArgs', '_inputs.ProxyClassSpecPatchArgsDict']]] = None,
                  __props__=None):
         opts = pulumi.ResourceOptions.merge(_utilities.get_resource_opts_defaults(), opts)
         if not isinstance(opts, pulumi.ResourceOptions):
@@ -3,11 +3,370 @@
 # *** Do not edit by hand unless you're certain you know what you are doing! ***
 
 import builtins as _builtins
-from ... import _utilities
+import importlib
 import typing
-# Export this package's modules as members:
-from .ProxyClass import *
-from .ProxyClassList import *
-from .ProxyClassPatch import *
-from ._inputs import *
-from . import outputs
+from ... import _utilities
+
+__all__ = [
+    'ProxyClassInitArgs',
+    'ProxyClass',
+    'ProxyClassListArgs',
+    'ProxyClassList',
+    'ProxyClassPatchArgs',
+    'ProxyClassPatch',
+    'ProxyClassSpecMetricsPatchArgsDict',
+    'ProxyClassSpecMetricsPatchArgs',
+    'ProxyClassSpecMetricsServiceMonitorPatchArgsDict',
+    'ProxyClassSpecMetricsServiceMonitorPatchArgs',
+    'ProxyClassSpecMetricsServiceMonitorArgsDict',
+    'ProxyClassSpecMetricsServiceMonitorArgs',
+    'ProxyClassSpecMetricsArgsDict',
+    'ProxyClassSpecMetricsArgs',
+    'ProxyClassSpecPatchArgsDict',
+    'ProxyClassSpecPatchArgs',
+    'ProxyClassSpecStatefulSetPatchArgsDict',
+    'ProxyClassSpecStatefulSetPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityArgs',
+    'ProxyClassSpecStatefulSetPodAffinityArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityArgs',
+    'ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodDnsConfigOptionsArgsDict',
+    'ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs',
+    'ProxyClassSpecStatefulSetPodDnsConfigPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodDnsConfigPatchArgs',
+    'ProxyClassSpecStatefulSetPodDnsConfigArgsDict',
+    'ProxyClassSpecStatefulSetPodDnsConfigArgs',
+    'ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgs',
+    'ProxyClassSpecStatefulSetPodImagePullSecretsArgsDict',
+    'ProxyClassSpecStatefulSetPodImagePullSecretsArgs',
+    'ProxyClassSpecStatefulSetPodPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfileArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfileArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfileArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfileArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerArgs',
+    'ProxyClassSpecStatefulSetPodTolerationsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTolerationsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTolerationsArgsDict',
+    'ProxyClassSpecStatefulSetPodTolerationsArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorArgsDict',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgsDict',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs',
+    'ProxyClassSpecStatefulSetPodArgsDict',
+    'ProxyClassSpecStatefulSetPodArgs',
+    'ProxyClassSpecStatefulSetArgsDict',
+    'ProxyClassSpecStatefulSetArgs',
+    'ProxyClassSpecStaticEndpointsNodePortPatchArgsDict',
+    'ProxyClassSpecStaticEndpointsNodePortPatchArgs',
+    'ProxyClassSpecStaticEndpointsNodePortPortsPatchArgsDict',
+    'ProxyClassSpecStaticEndpointsNodePortPortsPatchArgs',
+    'ProxyClassSpecStaticEndpointsNodePortPortsArgsDict',
+    'ProxyClassSpecStaticEndpointsNodePortPortsArgs',
+    'ProxyClassSpecStaticEndpointsNodePortArgsDict',
+    'ProxyClassSpecStaticEndpointsNodePortArgs',
+    'ProxyClassSpecStaticEndpointsPatchArgsDict',
+    'ProxyClassSpecStaticEndpointsPatchArgs',
+    'ProxyClassSpecStaticEndpointsArgsDict',
+    'ProxyClassSpecStaticEndpointsArgs',
+    'ProxyClassSpecTailscalePatchArgsDict',
+    'ProxyClassSpecTailscalePatchArgs',
+    'ProxyClassSpecTailscaleArgsDict',
+    'ProxyClassSpecTailscaleArgs',
+    'ProxyClassSpecArgsDict',
+    'ProxyClassSpecArgs',
+    'ProxyClassStatusConditionsArgsDict',
+    'ProxyClassStatusConditionsArgs',
+    'ProxyClassStatusArgsDict',
+    'ProxyClassStatusArgs',
+    'ProxyClassArgsDict',
+    'ProxyClassArgs',
+    'outputs',
+]
+
+# Resource classes live in same-named modules; everything else is an input type.
+_RESOURCE_MODULES = {
+    'ProxyClassInitArgs': 'ProxyClass',
+    'ProxyClass': 'ProxyClass',
+    'ProxyClassListArgs': 'ProxyClassList',
+    'ProxyClassList': 'ProxyClassList',
+    'ProxyClassPatchArgs': 'ProxyClassPatch',
+    'ProxyClassPatch': 'ProxyClassPatch',
+}
+
+if typing.TYPE_CHECKING:
+    from .ProxyClass import *
+    from .ProxyClassList import *
+    from .ProxyClassPatch import *
+    from ._inputs import *
+    from . import outputs
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in ("_inputs", "outputs"):
+        return importlib.import_module(f"{__name__}.{name}")
+    module_name = _RESOURCE_MODULES.get(name)
+    if module_name is not None:
+        module = importlib.import_module(f"{__name__}.{module_name}")
+    else:
+        module = importlib.import_module(f"{__name__}._inputs")
+        if name not in module.__all__:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
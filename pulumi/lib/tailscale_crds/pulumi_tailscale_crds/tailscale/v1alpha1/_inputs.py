@@ -1,17025 +0,0 @@
-# coding=utf-8
-# *** WARNING: this file was generated by crd2pulumi. ***
-# *** Do not edit by hand unless you're certain you know what you are doing! ***
-
-import builtins as _builtins
-import warnings
-import sys
-import pulumi
-import pulumi.runtime
-from typing import Any, Mapping, Optional, Sequence, Union, overload
-if sys.version_info >= (3, 11):
-    from typing import NotRequired, TypedDict, TypeAlias
-else:
-    from typing_extensions import NotRequired, TypedDict, TypeAlias
-from ... import _utilities
-from ... import meta as _meta
-
-__all__ = [
-    'ProxyClassSpecMetricsPatchArgs',
-    'ProxyClassSpecMetricsPatchArgsDict',
-    'ProxyClassSpecMetricsServiceMonitorPatchArgs',
-    'ProxyClassSpecMetricsServiceMonitorPatchArgsDict',
-    'ProxyClassSpecMetricsServiceMonitorArgs',
-    'ProxyClassSpecMetricsServiceMonitorArgsDict',
-    'ProxyClassSpecMetricsArgs',
-    'ProxyClassSpecMetricsArgsDict',
-    'ProxyClassSpecPatchArgs',
-    'ProxyClassSpecPatchArgsDict',
-    'ProxyClassSpecStatefulSetPatchArgs',
-    'ProxyClassSpecStatefulSetPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityArgs',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityArgs',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityArgsDict',
-    'ProxyClassSpecStatefulSetPodAffinityArgs',
-    'ProxyClassSpecStatefulSetPodAffinityArgsDict',
-    'ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgs',
-    'ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs',
-    'ProxyClassSpecStatefulSetPodDnsConfigOptionsArgsDict',
-    'ProxyClassSpecStatefulSetPodDnsConfigPatchArgs',
-    'ProxyClassSpecStatefulSetPodDnsConfigPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodDnsConfigArgs',
-    'ProxyClassSpecStatefulSetPodDnsConfigArgsDict',
-    'ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgs',
-    'ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodImagePullSecretsArgs',
-    'ProxyClassSpecStatefulSetPodImagePullSecretsArgsDict',
-    'ProxyClassSpecStatefulSetPodPatchArgs',
-    'ProxyClassSpecStatefulSetPodPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgs',
-    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgsDict',
-    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgs',
-    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgsDict',
-    'ProxyClassSpecStatefulSetPodSecurityContextPatchArgs',
-    'ProxyClassSpecStatefulSetPodSecurityContextPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgs',
-    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgs',
-    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgsDict',
-    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgs',
-    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgsDict',
-    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgs',
-    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgsDict',
-    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs',
-    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgs',
-    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgsDict',
-    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgs',
-    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgs',
-    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgsDict',
-    'ProxyClassSpecStatefulSetPodSecurityContextArgs',
-    'ProxyClassSpecStatefulSetPodSecurityContextArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerPatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerPatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfileArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfileArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfileArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfileArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatchArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgsDict',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerArgs',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerArgsDict',
-    'ProxyClassSpecStatefulSetPodTolerationsPatchArgs',
-    'ProxyClassSpecStatefulSetPodTolerationsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTolerationsArgs',
-    'ProxyClassSpecStatefulSetPodTolerationsArgsDict',
-    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs',
-    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs',
-    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgsDict',
-    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatchArgs',
-    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorArgs',
-    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorArgsDict',
-    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgs',
-    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgsDict',
-    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs',
-    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgsDict',
-    'ProxyClassSpecStatefulSetPodArgs',
-    'ProxyClassSpecStatefulSetPodArgsDict',
-    'ProxyClassSpecStatefulSetArgs',
-    'ProxyClassSpecStatefulSetArgsDict',
-    'ProxyClassSpecStaticEndpointsNodePortPatchArgs',
-    'ProxyClassSpecStaticEndpointsNodePortPatchArgsDict',
-    'ProxyClassSpecStaticEndpointsNodePortPortsPatchArgs',
-    'ProxyClassSpecStaticEndpointsNodePortPortsPatchArgsDict',
-    'ProxyClassSpecStaticEndpointsNodePortPortsArgs',
-    'ProxyClassSpecStaticEndpointsNodePortPortsArgsDict',
-    'ProxyClassSpecStaticEndpointsNodePortArgs',
-    'ProxyClassSpecStaticEndpointsNodePortArgsDict',
-    'ProxyClassSpecStaticEndpointsPatchArgs',
-    'ProxyClassSpecStaticEndpointsPatchArgsDict',
-    'ProxyClassSpecStaticEndpointsArgs',
-    'ProxyClassSpecStaticEndpointsArgsDict',
-    'ProxyClassSpecTailscalePatchArgs',
-    'ProxyClassSpecTailscalePatchArgsDict',
-    'ProxyClassSpecTailscaleArgs',
-    'ProxyClassSpecTailscaleArgsDict',
-    'ProxyClassSpecArgs',
-    'ProxyClassSpecArgsDict',
-    'ProxyClassStatusConditionsArgs',
-    'ProxyClassStatusConditionsArgsDict',
-    'ProxyClassStatusArgs',
-    'ProxyClassStatusArgsDict',
-    'ProxyClassArgs',
-    'ProxyClassArgsDict',
-]
-
-class ProxyClassSpecMetricsPatchArgsDict(TypedDict):
-    """
-    Configuration for proxy metrics. Metrics are currently not supported
-    for egress proxies and for Ingress proxies that have been configured
-    with tailscale.com/experimental-forward-cluster-traffic-via-ingress
-    annotation. Note that the metrics are currently considered unstable
-    and will likely change in breaking ways in the future - we only
-    recommend that you use those for debugging purposes.
-    """
-    enable: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Setting enable to true will make the proxy serve Tailscale metrics
-    at <pod-ip>:9002/metrics.
-    A metrics Service named <proxy-statefulset>-metrics will also be created in the operator's namespace and will
-    serve the metrics at <service-ip>:9002/metrics.
-
-    In 1.78.x and 1.80.x, this field also serves as the default value for
-    .spec.statefulSet.pod.tailscaleContainer.debug.enable. From 1.82.0, both
-    fields will independently default to false.
-
-    Defaults to false.
-    """
-    service_monitor: NotRequired[pulumi.Input[Optional['ProxyClassSpecMetricsServiceMonitorPatchArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecMetricsPatchArgs:
-    def __init__(__self__, *,
-                 enable: pulumi.Input[Optional[_builtins.bool]] = None,
-                 service_monitor: pulumi.Input[Optional['ProxyClassSpecMetricsServiceMonitorPatchArgs']] = None):
-        """
-        Configuration for proxy metrics. Metrics are currently not supported
-        for egress proxies and for Ingress proxies that have been configured
-        with tailscale.com/experimental-forward-cluster-traffic-via-ingress
-        annotation. Note that the metrics are currently considered unstable
-        and will likely change in breaking ways in the future - we only
-        recommend that you use those for debugging purposes.
-
-        :param pulumi.Input[_builtins.bool] enable: Setting enable to true will make the proxy serve Tailscale metrics
-               at <pod-ip>:9002/metrics.
-               A metrics Service named <proxy-statefulset>-metrics will also be created in the operator's namespace and will
-               serve the metrics at <service-ip>:9002/metrics.
-
-               In 1.78.x and 1.80.x, this field also serves as the default value for
-               .spec.statefulSet.pod.tailscaleContainer.debug.enable. From 1.82.0, both
-               fields will independently default to false.
-
-               Defaults to false.
-        """
-        if enable is not None:
-            pulumi.set(__self__, "enable", enable)
-        if service_monitor is not None:
-            pulumi.set(__self__, "service_monitor", service_monitor)
-
-    @_builtins.property
-    @pulumi.getter
-    def enable(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Setting enable to true will make the proxy serve Tailscale metrics
-        at <pod-ip>:9002/metrics.
-        A metrics Service named <proxy-statefulset>-metrics will also be created in the operator's namespace and will
-        serve the metrics at <service-ip>:9002/metrics.
-
-        In 1.78.x and 1.80.x, this field also serves as the default value for
-        .spec.statefulSet.pod.tailscaleContainer.debug.enable. From 1.82.0, both
-        fields will independently default to false.
-
-        Defaults to false.
-        """
-        return pulumi.get(self, "enable")
-
-    @enable.setter
-    def enable(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "enable", value)
-
-    @_builtins.property
-    @pulumi.getter(name="serviceMonitor")
-    def service_monitor(self) -> pulumi.Input[Optional['ProxyClassSpecMetricsServiceMonitorPatchArgs']]:
-        return pulumi.get(self, "service_monitor")
-
-    @service_monitor.setter
-    def service_monitor(self, value: pulumi.Input[Optional['ProxyClassSpecMetricsServiceMonitorPatchArgs']]):
-        pulumi.set(self, "service_monitor", value)
-
-
-class ProxyClassSpecMetricsServiceMonitorPatchArgsDict(TypedDict):
-    """
-    Enable to create a Prometheus ServiceMonitor for scraping the proxy's Tailscale metrics.
-    The ServiceMonitor will select the metrics Service that gets created when metrics are enabled.
-    The ingested metrics for each Service monitor will have labels to identify the proxy:
-    ts_proxy_type: ingress_service|ingress_resource|connector|proxygroup
-    ts_proxy_parent_name: name of the parent resource (i.e name of the Connector, Tailscale Ingress, Tailscale Service or ProxyGroup)
-    ts_proxy_parent_namespace: namespace of the parent resource (if the parent resource is not cluster scoped)
-    job: ts_<proxy type>_[<parent namespace>]_<parent_name>
-    """
-    enable: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    If Enable is set to true, a Prometheus ServiceMonitor will be created. Enable can only be set to true if metrics are enabled.
-    """
-    labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    Labels to add to the ServiceMonitor.
-    Labels must be valid Kubernetes labels.
-    https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-    """
-
-@pulumi.input_type
-class ProxyClassSpecMetricsServiceMonitorPatchArgs:
-    def __init__(__self__, *,
-                 enable: pulumi.Input[Optional[_builtins.bool]] = None,
-                 labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        Enable to create a Prometheus ServiceMonitor for scraping the proxy's Tailscale metrics.
-        The ServiceMonitor will select the metrics Service that gets created when metrics are enabled.
-        The ingested metrics for each Service monitor will have labels to identify the proxy:
-        ts_proxy_type: ingress_service|ingress_resource|connector|proxygroup
-        ts_proxy_parent_name: name of the parent resource (i.e name of the Connector, Tailscale Ingress, Tailscale Service or ProxyGroup)
-        ts_proxy_parent_namespace: namespace of the parent resource (if the parent resource is not cluster scoped)
-        job: ts_<proxy type>_[<parent namespace>]_<parent_name>
-
-        :param pulumi.Input[_builtins.bool] enable: If Enable is set to true, a Prometheus ServiceMonitor will be created. Enable can only be set to true if metrics are enabled.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] labels: Labels to add to the ServiceMonitor.
-               Labels must be valid Kubernetes labels.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        if enable is not None:
-            pulumi.set(__self__, "enable", enable)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-
-    @_builtins.property
-    @pulumi.getter
-    def enable(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        If Enable is set to true, a Prometheus ServiceMonitor will be created. Enable can only be set to true if metrics are enabled.
-        """
-        return pulumi.get(self, "enable")
-
-    @enable.setter
-    def enable(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "enable", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        Labels to add to the ServiceMonitor.
-        Labels must be valid Kubernetes labels.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        return pulumi.get(self, "labels")
-
-    @labels.setter
-    def labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "labels", value)
-
-
-class ProxyClassSpecMetricsServiceMonitorArgsDict(TypedDict):
-    """
-    Enable to create a Prometheus ServiceMonitor for scraping the proxy's Tailscale metrics.
-    The ServiceMonitor will select the metrics Service that gets created when metrics are enabled.
-    The ingested metrics for each Service monitor will have labels to identify the proxy:
-    ts_proxy_type: ingress_service|ingress_resource|connector|proxygroup
-    ts_proxy_parent_name: name of the parent resource (i.e name of the Connector, Tailscale Ingress, Tailscale Service or ProxyGroup)
-    ts_proxy_parent_namespace: namespace of the parent resource (if the parent resource is not cluster scoped)
-    job: ts_<proxy type>_[<parent namespace>]_<parent_name>
-    """
-    enable: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    If Enable is set to true, a Prometheus ServiceMonitor will be created. Enable can only be set to true if metrics are enabled.
-    """
-    labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    Labels to add to the ServiceMonitor.
-    Labels must be valid Kubernetes labels.
-    https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-    """
-
-@pulumi.input_type
-class ProxyClassSpecMetricsServiceMonitorArgs:
-    def __init__(__self__, *,
-                 enable: pulumi.Input[Optional[_builtins.bool]] = None,
-                 labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        Enable to create a Prometheus ServiceMonitor for scraping the proxy's Tailscale metrics.
-        The ServiceMonitor will select the metrics Service that gets created when metrics are enabled.
-        The ingested metrics for each Service monitor will have labels to identify the proxy:
-        ts_proxy_type: ingress_service|ingress_resource|connector|proxygroup
-        ts_proxy_parent_name: name of the parent resource (i.e name of the Connector, Tailscale Ingress, Tailscale Service or ProxyGroup)
-        ts_proxy_parent_namespace: namespace of the parent resource (if the parent resource is not cluster scoped)
-        job: ts_<proxy type>_[<parent namespace>]_<parent_name>
-
-        :param pulumi.Input[_builtins.bool] enable: If Enable is set to true, a Prometheus ServiceMonitor will be created. Enable can only be set to true if metrics are enabled.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] labels: Labels to add to the ServiceMonitor.
-               Labels must be valid Kubernetes labels.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        if enable is not None:
-            pulumi.set(__self__, "enable", enable)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-
-    @_builtins.property
-    @pulumi.getter
-    def enable(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        If Enable is set to true, a Prometheus ServiceMonitor will be created. Enable can only be set to true if metrics are enabled.
-        """
-        return pulumi.get(self, "enable")
-
-    @enable.setter
-    def enable(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "enable", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        Labels to add to the ServiceMonitor.
-        Labels must be valid Kubernetes labels.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        return pulumi.get(self, "labels")
-
-    @labels.setter
-    def labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "labels", value)
-
-
-class ProxyClassSpecMetricsArgsDict(TypedDict):
-    """
-    Configuration for proxy metrics. Metrics are currently not supported
-    for egress proxies and for Ingress proxies that have been configured
-    with tailscale.com/experimental-forward-cluster-traffic-via-ingress
-    annotation. Note that the metrics are currently considered unstable
-    and will likely change in breaking ways in the future - we only
-    recommend that you use those for debugging purposes.
-    """
-    enable: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Setting enable to true will make the proxy serve Tailscale metrics
-    at <pod-ip>:9002/metrics.
-    A metrics Service named <proxy-statefulset>-metrics will also be created in the operator's namespace and will
-    serve the metrics at <service-ip>:9002/metrics.
-
-    In 1.78.x and 1.80.x, this field also serves as the default value for
-    .spec.statefulSet.pod.tailscaleContainer.debug.enable. From 1.82.0, both
-    fields will independently default to false.
-
-    Defaults to false.
-    """
-    service_monitor: NotRequired[pulumi.Input[Optional['ProxyClassSpecMetricsServiceMonitorArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecMetricsArgs:
-    def __init__(__self__, *,
-                 enable: pulumi.Input[Optional[_builtins.bool]] = None,
-                 service_monitor: pulumi.Input[Optional['ProxyClassSpecMetricsServiceMonitorArgs']] = None):
-        """
-        Configuration for proxy metrics. Metrics are currently not supported
-        for egress proxies and for Ingress proxies that have been configured
-        with tailscale.com/experimental-forward-cluster-traffic-via-ingress
-        annotation. Note that the metrics are currently considered unstable
-        and will likely change in breaking ways in the future - we only
-        recommend that you use those for debugging purposes.
-
-        :param pulumi.Input[_builtins.bool] enable: Setting enable to true will make the proxy serve Tailscale metrics
-               at <pod-ip>:9002/metrics.
-               A metrics Service named <proxy-statefulset>-metrics will also be created in the operator's namespace and will
-               serve the metrics at <service-ip>:9002/metrics.
-
-               In 1.78.x and 1.80.x, this field also serves as the default value for
-               .spec.statefulSet.pod.tailscaleContainer.debug.enable. From 1.82.0, both
-               fields will independently default to false.
-
-               Defaults to false.
-        """
-        if enable is not None:
-            pulumi.set(__self__, "enable", enable)
-        if service_monitor is not None:
-            pulumi.set(__self__, "service_monitor", service_monitor)
-
-    @_builtins.property
-    @pulumi.getter
-    def enable(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Setting enable to true will make the proxy serve Tailscale metrics
-        at <pod-ip>:9002/metrics.
-        A metrics Service named <proxy-statefulset>-metrics will also be created in the operator's namespace and will
-        serve the metrics at <service-ip>:9002/metrics.
-
-        In 1.78.x and 1.80.x, this field also serves as the default value for
-        .spec.statefulSet.pod.tailscaleContainer.debug.enable. From 1.82.0, both
-        fields will independently default to false.
-
-        Defaults to false.
-        """
-        return pulumi.get(self, "enable")
-
-    @enable.setter
-    def enable(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "enable", value)
-
-    @_builtins.property
-    @pulumi.getter(name="serviceMonitor")
-    def service_monitor(self) -> pulumi.Input[Optional['ProxyClassSpecMetricsServiceMonitorArgs']]:
-        return pulumi.get(self, "service_monitor")
-
-    @service_monitor.setter
-    def service_monitor(self, value: pulumi.Input[Optional['ProxyClassSpecMetricsServiceMonitorArgs']]):
-        pulumi.set(self, "service_monitor", value)
-
-
-class ProxyClassSpecPatchArgsDict(TypedDict):
-    """
-    Specification of the desired state of the ProxyClass resource.
-    https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    metrics: NotRequired[pulumi.Input[Optional['ProxyClassSpecMetricsPatchArgs']]]
-    stateful_set: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPatchArgs']]]
-    static_endpoints: NotRequired[pulumi.Input[Optional['ProxyClassSpecStaticEndpointsPatchArgs']]]
-    tailscale: NotRequired[pulumi.Input[Optional['ProxyClassSpecTailscalePatchArgs']]]
-    use_lets_encrypt_staging_environment: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Set UseLetsEncryptStagingEnvironment to true to issue TLS
-    certificates for any HTTPS endpoints exposed to the tailnet from
-    LetsEncrypt's staging environment.
-    https://letsencrypt.org/docs/staging-environment/
-    This setting only affects Tailscale Ingress resources.
-    By default Ingress TLS certificates are issued from LetsEncrypt's
-    production environment.
-    Changing this setting true -> false, will result in any
-    existing certs being re-issued from the production environment.
-    Changing this setting false (default) -> true, when certs have already
-    been provisioned from production environment will NOT result in certs
-    being re-issued from the staging environment before they need to be
-    renewed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecPatchArgs:
-    def __init__(__self__, *,
-                 metrics: pulumi.Input[Optional['ProxyClassSpecMetricsPatchArgs']] = None,
-                 stateful_set: pulumi.Input[Optional['ProxyClassSpecStatefulSetPatchArgs']] = None,
-                 static_endpoints: pulumi.Input[Optional['ProxyClassSpecStaticEndpointsPatchArgs']] = None,
-                 tailscale: pulumi.Input[Optional['ProxyClassSpecTailscalePatchArgs']] = None,
-                 use_lets_encrypt_staging_environment: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        Specification of the desired state of the ProxyClass resource.
-        https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param pulumi.Input[_builtins.bool] use_lets_encrypt_staging_environment: Set UseLetsEncryptStagingEnvironment to true to issue TLS
-               certificates for any HTTPS endpoints exposed to the tailnet from
-               LetsEncrypt's staging environment.
-               https://letsencrypt.org/docs/staging-environment/
-               This setting only affects Tailscale Ingress resources.
-               By default Ingress TLS certificates are issued from LetsEncrypt's
-               production environment.
-               Changing this setting true -> false, will result in any
-               existing certs being re-issued from the production environment.
-               Changing this setting false (default) -> true, when certs have already
-               been provisioned from production environment will NOT result in certs
-               being re-issued from the staging environment before they need to be
-               renewed.
-        """
-        if metrics is not None:
-            pulumi.set(__self__, "metrics", metrics)
-        if stateful_set is not None:
-            pulumi.set(__self__, "stateful_set", stateful_set)
-        if static_endpoints is not None:
-            pulumi.set(__self__, "static_endpoints", static_endpoints)
-        if tailscale is not None:
-            pulumi.set(__self__, "tailscale", tailscale)
-        if use_lets_encrypt_staging_environment is not None:
-            pulumi.set(__self__, "use_lets_encrypt_staging_environment", use_lets_encrypt_staging_environment)
-
-    @_builtins.property
-    @pulumi.getter
-    def metrics(self) -> pulumi.Input[Optional['ProxyClassSpecMetricsPatchArgs']]:
-        return pulumi.get(self, "metrics")
-
-    @metrics.setter
-    def metrics(self, value: pulumi.Input[Optional['ProxyClassSpecMetricsPatchArgs']]):
-        pulumi.set(self, "metrics", value)
-
-    @_builtins.property
-    @pulumi.getter(name="statefulSet")
-    def stateful_set(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPatchArgs']]:
-        return pulumi.get(self, "stateful_set")
-
-    @stateful_set.setter
-    def stateful_set(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPatchArgs']]):
-        pulumi.set(self, "stateful_set", value)
-
-    @_builtins.property
-    @pulumi.getter(name="staticEndpoints")
-    def static_endpoints(self) -> pulumi.Input[Optional['ProxyClassSpecStaticEndpointsPatchArgs']]:
-        return pulumi.get(self, "static_endpoints")
-
-    @static_endpoints.setter
-    def static_endpoints(self, value: pulumi.Input[Optional['ProxyClassSpecStaticEndpointsPatchArgs']]):
-        pulumi.set(self, "static_endpoints", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def tailscale(self) -> pulumi.Input[Optional['ProxyClassSpecTailscalePatchArgs']]:
-        return pulumi.get(self, "tailscale")
-
-    @tailscale.setter
-    def tailscale(self, value: pulumi.Input[Optional['ProxyClassSpecTailscalePatchArgs']]):
-        pulumi.set(self, "tailscale", value)
-
-    @_builtins.property
-    @pulumi.getter(name="useLetsEncryptStagingEnvironment")
-    def use_lets_encrypt_staging_environment(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Set UseLetsEncryptStagingEnvironment to true to issue TLS
-        certificates for any HTTPS endpoints exposed to the tailnet from
-        LetsEncrypt's staging environment.
-        https://letsencrypt.org/docs/staging-environment/
-        This setting only affects Tailscale Ingress resources.
-        By default Ingress TLS certificates are issued from LetsEncrypt's
-        production environment.
-        Changing this setting true -> false, will result in any
-        existing certs being re-issued from the production environment.
-        Changing this setting false (default) -> true, when certs have already
-        been provisioned from production environment will NOT result in certs
-        being re-issued from the staging environment before they need to be
-        renewed.
-        """
-        return pulumi.get(self, "use_lets_encrypt_staging_environment")
-
-    @use_lets_encrypt_staging_environment.setter
-    def use_lets_encrypt_staging_environment(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "use_lets_encrypt_staging_environment", value)
-
-
-class ProxyClassSpecStatefulSetPatchArgsDict(TypedDict):
-    """
-    Configuration parameters for the proxy's StatefulSet. Tailscale
-    Kubernetes operator deploys a StatefulSet for each of the user
-    configured proxies (Tailscale Ingress, Tailscale Service, Connector).
-    """
-    annotations: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    Annotations that will be added to the StatefulSet created for the proxy.
-    Any Annotations specified here will be merged with the default annotations
-    applied to the StatefulSet by the Tailscale Kubernetes operator as
-    well as any other annotations that might have been applied by other
-    actors.
-    Annotations must be valid Kubernetes annotations.
-    https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-    """
-    labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    Labels that will be added to the StatefulSet created for the proxy.
-    Any labels specified here will be merged with the default labels
-    applied to the StatefulSet by the Tailscale Kubernetes operator as
-    well as any other labels that might have been applied by other
-    actors.
-    Label keys and values must be valid Kubernetes label keys and values.
-    https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-    """
-    pod: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodPatchArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPatchArgs:
-    def __init__(__self__, *,
-                 annotations: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 pod: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodPatchArgs']] = None):
-        """
-        Configuration parameters for the proxy's StatefulSet. Tailscale
-        Kubernetes operator deploys a StatefulSet for each of the user
-        configured proxies (Tailscale Ingress, Tailscale Service, Connector).
-
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] annotations: Annotations that will be added to the StatefulSet created for the proxy.
-               Any Annotations specified here will be merged with the default annotations
-               applied to the StatefulSet by the Tailscale Kubernetes operator as
-               well as any other annotations that might have been applied by other
-               actors.
-               Annotations must be valid Kubernetes annotations.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] labels: Labels that will be added to the StatefulSet created for the proxy.
-               Any labels specified here will be merged with the default labels
-               applied to the StatefulSet by the Tailscale Kubernetes operator as
-               well as any other labels that might have been applied by other
-               actors.
-               Label keys and values must be valid Kubernetes label keys and values.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        if annotations is not None:
-            pulumi.set(__self__, "annotations", annotations)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-        if pod is not None:
-            pulumi.set(__self__, "pod", pod)
-
-    @_builtins.property
-    @pulumi.getter
-    def annotations(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        Annotations that will be added to the StatefulSet created for the proxy.
-        Any Annotations specified here will be merged with the default annotations
-        applied to the StatefulSet by the Tailscale Kubernetes operator as
-        well as any other annotations that might have been applied by other
-        actors.
-        Annotations must be valid Kubernetes annotations.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-        """
-        return pulumi.get(self, "annotations")
-
-    @annotations.setter
-    def annotations(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "annotations", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        Labels that will be added to the StatefulSet created for the proxy.
-        Any labels specified here will be merged with the default labels
-        applied to the StatefulSet by the Tailscale Kubernetes operator as
-        well as any other labels that might have been applied by other
-        actors.
-        Label keys and values must be valid Kubernetes label keys and values.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        return pulumi.get(self, "labels")
-
-    @labels.setter
-    def labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "labels", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def pod(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodPatchArgs']]:
-        return pulumi.get(self, "pod")
-
-    @pod.setter
-    def pod(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodPatchArgs']]):
-        pulumi.set(self, "pod", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgsDict(TypedDict):
-    """
-    Describes node affinity scheduling rules for the pod.
-    """
-    preferred_during_scheduling_ignored_during_execution: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]]]
-    """
-    The scheduler will prefer to schedule pods to nodes that satisfy
-    the affinity expressions specified by this field, but it may choose
-    a node that violates one or more of the expressions. The node that is
-    most preferred is the one with the greatest sum of weights, i.e.
-    for each node that meets all of the scheduling requirements (resource
-    request, requiredDuringScheduling affinity expressions, etc.),
-    compute a sum by iterating through the elements of this field and adding
-    "weight" to the sum if the node matches the corresponding matchExpressions; the
-    node(s) with the highest sum are the most preferred.
-    """
-    required_during_scheduling_ignored_during_execution: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgs:
-    def __init__(__self__, *,
-                 preferred_during_scheduling_ignored_during_execution: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]] = None,
-                 required_during_scheduling_ignored_during_execution: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs']] = None):
-        """
-        Describes node affinity scheduling rules for the pod.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]] preferred_during_scheduling_ignored_during_execution: The scheduler will prefer to schedule pods to nodes that satisfy
-               the affinity expressions specified by this field, but it may choose
-               a node that violates one or more of the expressions. The node that is
-               most preferred is the one with the greatest sum of weights, i.e.
-               for each node that meets all of the scheduling requirements (resource
-               request, requiredDuringScheduling affinity expressions, etc.),
-               compute a sum by iterating through the elements of this field and adding
-               "weight" to the sum if the node matches the corresponding matchExpressions; the
-               node(s) with the highest sum are the most preferred.
-        """
-        if preferred_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "preferred_during_scheduling_ignored_during_execution", preferred_during_scheduling_ignored_during_execution)
-        if required_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "required_during_scheduling_ignored_during_execution", required_during_scheduling_ignored_during_execution)
-
-    @_builtins.property
-    @pulumi.getter(name="preferredDuringSchedulingIgnoredDuringExecution")
-    def preferred_during_scheduling_ignored_during_execution(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]]:
-        """
-        The scheduler will prefer to schedule pods to nodes that satisfy
-        the affinity expressions specified by this field, but it may choose
-        a node that violates one or more of the expressions. The node that is
-        most preferred is the one with the greatest sum of weights, i.e.
-        for each node that meets all of the scheduling requirements (resource
-        request, requiredDuringScheduling affinity expressions, etc.),
-        compute a sum by iterating through the elements of this field and adding
-        "weight" to the sum if the node matches the corresponding matchExpressions; the
-        node(s) with the highest sum are the most preferred.
-        """
-        return pulumi.get(self, "preferred_during_scheduling_ignored_during_execution")
-
-    @preferred_during_scheduling_ignored_during_execution.setter
-    def preferred_during_scheduling_ignored_during_execution(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]]):
-        pulumi.set(self, "preferred_during_scheduling_ignored_during_execution", value)
-
-    @_builtins.property
-    @pulumi.getter(name="requiredDuringSchedulingIgnoredDuringExecution")
-    def required_during_scheduling_ignored_during_execution(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs']]:
-        return pulumi.get(self, "required_during_scheduling_ignored_during_execution")
-
-    @required_during_scheduling_ignored_during_execution.setter
-    def required_during_scheduling_ignored_during_execution(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs']]):
-        pulumi.set(self, "required_during_scheduling_ignored_during_execution", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict(TypedDict):
-    """
-    An empty preferred scheduling term matches all objects with implicit weight 0
-    (i.e. it's a no-op). A null preferred scheduling term matches no objects (i.e. is also a no-op).
-    """
-    preference: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs']]]
-    weight: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    Weight associated with matching the corresponding nodeSelectorTerm, in the range 1-100.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs:
-    def __init__(__self__, *,
-                 preference: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs']] = None,
-                 weight: pulumi.Input[Optional[_builtins.int]] = None):
-        """
-        An empty preferred scheduling term matches all objects with implicit weight 0
-        (i.e. it's a no-op). A null preferred scheduling term matches no objects (i.e. is also a no-op).
-
-        :param pulumi.Input[_builtins.int] weight: Weight associated with matching the corresponding nodeSelectorTerm, in the range 1-100.
-        """
-        if preference is not None:
-            pulumi.set(__self__, "preference", preference)
-        if weight is not None:
-            pulumi.set(__self__, "weight", weight)
-
-    @_builtins.property
-    @pulumi.getter
-    def preference(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs']]:
-        return pulumi.get(self, "preference")
-
-    @preference.setter
-    def preference(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs']]):
-        pulumi.set(self, "preference", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def weight(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        Weight associated with matching the corresponding nodeSelectorTerm, in the range 1-100.
-        """
-        return pulumi.get(self, "weight")
-
-    @weight.setter
-    def weight(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "weight", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgsDict(TypedDict):
-    """
-    A node selector requirement is a selector that contains values, a key, and an operator
-    that relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    An array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. If the operator is Gt or Lt, the values
-    array must have a single element, which will be interpreted as an integer.
-    This array is replaced during a strategic merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A node selector requirement is a selector that contains values, a key, and an operator
-        that relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: The label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: Represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: An array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. If the operator is Gt or Lt, the values
-               array must have a single element, which will be interpreted as an integer.
-               This array is replaced during a strategic merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        An array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. If the operator is Gt or Lt, the values
-        array must have a single element, which will be interpreted as an integer.
-        This array is replaced during a strategic merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgsDict(TypedDict):
-    """
-    A node selector requirement is a selector that contains values, a key, and an operator
-    that relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    An array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. If the operator is Gt or Lt, the values
-    array must have a single element, which will be interpreted as an integer.
-    This array is replaced during a strategic merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A node selector requirement is a selector that contains values, a key, and an operator
-        that relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: The label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: Represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: An array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. If the operator is Gt or Lt, the values
-               array must have a single element, which will be interpreted as an integer.
-               This array is replaced during a strategic merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        An array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. If the operator is Gt or Lt, the values
-        array must have a single element, which will be interpreted as an integer.
-        This array is replaced during a strategic merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgsDict(TypedDict):
-    """
-    A node selector requirement is a selector that contains values, a key, and an operator
-    that relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    An array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. If the operator is Gt or Lt, the values
-    array must have a single element, which will be interpreted as an integer.
-    This array is replaced during a strategic merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A node selector requirement is a selector that contains values, a key, and an operator
-        that relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: The label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: Represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: An array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. If the operator is Gt or Lt, the values
-               array must have a single element, which will be interpreted as an integer.
-               This array is replaced during a strategic merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        An array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. If the operator is Gt or Lt, the values
-        array must have a single element, which will be interpreted as an integer.
-        This array is replaced during a strategic merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgsDict(TypedDict):
-    """
-    A node selector requirement is a selector that contains values, a key, and an operator
-    that relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    An array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. If the operator is Gt or Lt, the values
-    array must have a single element, which will be interpreted as an integer.
-    This array is replaced during a strategic merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A node selector requirement is a selector that contains values, a key, and an operator
-        that relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: The label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: Represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: An array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. If the operator is Gt or Lt, the values
-               array must have a single element, which will be interpreted as an integer.
-               This array is replaced during a strategic merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        An array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. If the operator is Gt or Lt, the values
-        array must have a single element, which will be interpreted as an integer.
-        This array is replaced during a strategic merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgsDict(TypedDict):
-    """
-    A node selector term, associated with the corresponding weight.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs']]]]]
-    """
-    A list of node selector requirements by node's labels.
-    """
-    match_fields: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs']]]]]
-    """
-    A list of node selector requirements by node's fields.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs']]]] = None,
-                 match_fields: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs']]]] = None):
-        """
-        A node selector term, associated with the corresponding weight.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs']]] match_expressions: A list of node selector requirements by node's labels.
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs']]] match_fields: A list of node selector requirements by node's fields.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_fields is not None:
-            pulumi.set(__self__, "match_fields", match_fields)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs']]]]:
-        """
-        A list of node selector requirements by node's labels.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchFields")
-    def match_fields(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs']]]]:
-        """
-        A list of node selector requirements by node's fields.
-        """
-        return pulumi.get(self, "match_fields")
-
-    @match_fields.setter
-    def match_fields(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs']]]]):
-        pulumi.set(self, "match_fields", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgsDict(TypedDict):
-    """
-    A node selector term, associated with the corresponding weight.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs']]]]]
-    """
-    A list of node selector requirements by node's labels.
-    """
-    match_fields: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs']]]]]
-    """
-    A list of node selector requirements by node's fields.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs']]]] = None,
-                 match_fields: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs']]]] = None):
-        """
-        A node selector term, associated with the corresponding weight.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs']]] match_expressions: A list of node selector requirements by node's labels.
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs']]] match_fields: A list of node selector requirements by node's fields.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_fields is not None:
-            pulumi.set(__self__, "match_fields", match_fields)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs']]]]:
-        """
-        A list of node selector requirements by node's labels.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchFields")
-    def match_fields(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs']]]]:
-        """
-        A list of node selector requirements by node's fields.
-        """
-        return pulumi.get(self, "match_fields")
-
-    @match_fields.setter
-    def match_fields(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs']]]]):
-        pulumi.set(self, "match_fields", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict(TypedDict):
-    """
-    An empty preferred scheduling term matches all objects with implicit weight 0
-    (i.e. it's a no-op). A null preferred scheduling term matches no objects (i.e. is also a no-op).
-    """
-    preference: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs']]]
-    weight: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    Weight associated with matching the corresponding nodeSelectorTerm, in the range 1-100.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs:
-    def __init__(__self__, *,
-                 preference: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs']] = None,
-                 weight: pulumi.Input[Optional[_builtins.int]] = None):
-        """
-        An empty preferred scheduling term matches all objects with implicit weight 0
-        (i.e. it's a no-op). A null preferred scheduling term matches no objects (i.e. is also a no-op).
-
-        :param pulumi.Input[_builtins.int] weight: Weight associated with matching the corresponding nodeSelectorTerm, in the range 1-100.
-        """
-        if preference is not None:
-            pulumi.set(__self__, "preference", preference)
-        if weight is not None:
-            pulumi.set(__self__, "weight", weight)
-
-    @_builtins.property
-    @pulumi.getter
-    def preference(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs']]:
-        return pulumi.get(self, "preference")
-
-    @preference.setter
-    def preference(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs']]):
-        pulumi.set(self, "preference", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def weight(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        Weight associated with matching the corresponding nodeSelectorTerm, in the range 1-100.
-        """
-        return pulumi.get(self, "weight")
-
-    @weight.setter
-    def weight(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "weight", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgsDict(TypedDict):
-    """
-    A node selector requirement is a selector that contains values, a key, and an operator
-    that relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    An array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. If the operator is Gt or Lt, the values
-    array must have a single element, which will be interpreted as an integer.
-    This array is replaced during a strategic merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A node selector requirement is a selector that contains values, a key, and an operator
-        that relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: The label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: Represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: An array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. If the operator is Gt or Lt, the values
-               array must have a single element, which will be interpreted as an integer.
-               This array is replaced during a strategic merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        An array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. If the operator is Gt or Lt, the values
-        array must have a single element, which will be interpreted as an integer.
-        This array is replaced during a strategic merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgsDict(TypedDict):
-    """
-    A node selector requirement is a selector that contains values, a key, and an operator
-    that relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    An array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. If the operator is Gt or Lt, the values
-    array must have a single element, which will be interpreted as an integer.
-    This array is replaced during a strategic merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A node selector requirement is a selector that contains values, a key, and an operator
-        that relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: The label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: Represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: An array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. If the operator is Gt or Lt, the values
-               array must have a single element, which will be interpreted as an integer.
-               This array is replaced during a strategic merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        An array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. If the operator is Gt or Lt, the values
-        array must have a single element, which will be interpreted as an integer.
-        This array is replaced during a strategic merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgsDict(TypedDict):
-    """
-    A node selector requirement is a selector that contains values, a key, and an operator
-    that relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    An array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. If the operator is Gt or Lt, the values
-    array must have a single element, which will be interpreted as an integer.
-    This array is replaced during a strategic merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A node selector requirement is a selector that contains values, a key, and an operator
-        that relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: The label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: Represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: An array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. If the operator is Gt or Lt, the values
-               array must have a single element, which will be interpreted as an integer.
-               This array is replaced during a strategic merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        An array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. If the operator is Gt or Lt, the values
-        array must have a single element, which will be interpreted as an integer.
-        This array is replaced during a strategic merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgsDict(TypedDict):
-    """
-    A node selector requirement is a selector that contains values, a key, and an operator
-    that relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    An array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. If the operator is Gt or Lt, the values
-    array must have a single element, which will be interpreted as an integer.
-    This array is replaced during a strategic merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A node selector requirement is a selector that contains values, a key, and an operator
-        that relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: The label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: Represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: An array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. If the operator is Gt or Lt, the values
-               array must have a single element, which will be interpreted as an integer.
-               This array is replaced during a strategic merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        An array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. If the operator is Gt or Lt, the values
-        array must have a single element, which will be interpreted as an integer.
-        This array is replaced during a strategic merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgsDict(TypedDict):
-    """
-    A null or empty node selector term matches no objects. The requirements of
-    them are ANDed.
-    The TopologySelectorTerm type implements a subset of the NodeSelectorTerm.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs']]]]]
-    """
-    A list of node selector requirements by node's labels.
-    """
-    match_fields: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs']]]]]
-    """
-    A list of node selector requirements by node's fields.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs']]]] = None,
-                 match_fields: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs']]]] = None):
-        """
-        A null or empty node selector term matches no objects. The requirements of
-        them are ANDed.
-        The TopologySelectorTerm type implements a subset of the NodeSelectorTerm.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs']]] match_expressions: A list of node selector requirements by node's labels.
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs']]] match_fields: A list of node selector requirements by node's fields.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_fields is not None:
-            pulumi.set(__self__, "match_fields", match_fields)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs']]]]:
-        """
-        A list of node selector requirements by node's labels.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchFields")
-    def match_fields(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs']]]]:
-        """
-        A list of node selector requirements by node's fields.
-        """
-        return pulumi.get(self, "match_fields")
-
-    @match_fields.setter
-    def match_fields(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs']]]]):
-        pulumi.set(self, "match_fields", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgsDict(TypedDict):
-    """
-    A null or empty node selector term matches no objects. The requirements of
-    them are ANDed.
-    The TopologySelectorTerm type implements a subset of the NodeSelectorTerm.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs']]]]]
-    """
-    A list of node selector requirements by node's labels.
-    """
-    match_fields: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs']]]]]
-    """
-    A list of node selector requirements by node's fields.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs']]]] = None,
-                 match_fields: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs']]]] = None):
-        """
-        A null or empty node selector term matches no objects. The requirements of
-        them are ANDed.
-        The TopologySelectorTerm type implements a subset of the NodeSelectorTerm.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs']]] match_expressions: A list of node selector requirements by node's labels.
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs']]] match_fields: A list of node selector requirements by node's fields.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_fields is not None:
-            pulumi.set(__self__, "match_fields", match_fields)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs']]]]:
-        """
-        A list of node selector requirements by node's labels.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchFields")
-    def match_fields(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs']]]]:
-        """
-        A list of node selector requirements by node's fields.
-        """
-        return pulumi.get(self, "match_fields")
-
-    @match_fields.setter
-    def match_fields(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs']]]]):
-        pulumi.set(self, "match_fields", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict(TypedDict):
-    """
-    If the affinity requirements specified by this field are not met at
-    scheduling time, the pod will not be scheduled onto the node.
-    If the affinity requirements specified by this field cease to be met
-    at some point during pod execution (e.g. due to an update), the system
-    may or may not try to eventually evict the pod from its node.
-    """
-    node_selector_terms: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs']]]]]
-    """
-    Required. A list of node selector terms. The terms are ORed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs:
-    def __init__(__self__, *,
-                 node_selector_terms: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs']]]] = None):
-        """
-        If the affinity requirements specified by this field are not met at
-        scheduling time, the pod will not be scheduled onto the node.
-        If the affinity requirements specified by this field cease to be met
-        at some point during pod execution (e.g. due to an update), the system
-        may or may not try to eventually evict the pod from its node.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs']]] node_selector_terms: Required. A list of node selector terms. The terms are ORed.
-        """
-        if node_selector_terms is not None:
-            pulumi.set(__self__, "node_selector_terms", node_selector_terms)
-
-    @_builtins.property
-    @pulumi.getter(name="nodeSelectorTerms")
-    def node_selector_terms(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs']]]]:
-        """
-        Required. A list of node selector terms. The terms are ORed.
-        """
-        return pulumi.get(self, "node_selector_terms")
-
-    @node_selector_terms.setter
-    def node_selector_terms(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs']]]]):
-        pulumi.set(self, "node_selector_terms", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict(TypedDict):
-    """
-    If the affinity requirements specified by this field are not met at
-    scheduling time, the pod will not be scheduled onto the node.
-    If the affinity requirements specified by this field cease to be met
-    at some point during pod execution (e.g. due to an update), the system
-    may or may not try to eventually evict the pod from its node.
-    """
-    node_selector_terms: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs']]]]]
-    """
-    Required. A list of node selector terms. The terms are ORed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs:
-    def __init__(__self__, *,
-                 node_selector_terms: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs']]]] = None):
-        """
-        If the affinity requirements specified by this field are not met at
-        scheduling time, the pod will not be scheduled onto the node.
-        If the affinity requirements specified by this field cease to be met
-        at some point during pod execution (e.g. due to an update), the system
-        may or may not try to eventually evict the pod from its node.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs']]] node_selector_terms: Required. A list of node selector terms. The terms are ORed.
-        """
-        if node_selector_terms is not None:
-            pulumi.set(__self__, "node_selector_terms", node_selector_terms)
-
-    @_builtins.property
-    @pulumi.getter(name="nodeSelectorTerms")
-    def node_selector_terms(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs']]]]:
-        """
-        Required. A list of node selector terms. The terms are ORed.
-        """
-        return pulumi.get(self, "node_selector_terms")
-
-    @node_selector_terms.setter
-    def node_selector_terms(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs']]]]):
-        pulumi.set(self, "node_selector_terms", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityArgsDict(TypedDict):
-    """
-    Describes node affinity scheduling rules for the pod.
-    """
-    preferred_during_scheduling_ignored_during_execution: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]]]]
-    """
-    The scheduler will prefer to schedule pods to nodes that satisfy
-    the affinity expressions specified by this field, but it may choose
-    a node that violates one or more of the expressions. The node that is
-    most preferred is the one with the greatest sum of weights, i.e.
-    for each node that meets all of the scheduling requirements (resource
-    request, requiredDuringScheduling affinity expressions, etc.),
-    compute a sum by iterating through the elements of this field and adding
-    "weight" to the sum if the node matches the corresponding matchExpressions; the
-    node(s) with the highest sum are the most preferred.
-    """
-    required_during_scheduling_ignored_during_execution: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityArgs:
-    def __init__(__self__, *,
-                 preferred_during_scheduling_ignored_during_execution: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]]] = None,
-                 required_during_scheduling_ignored_during_execution: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']] = None):
-        """
-        Describes node affinity scheduling rules for the pod.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]] preferred_during_scheduling_ignored_during_execution: The scheduler will prefer to schedule pods to nodes that satisfy
-               the affinity expressions specified by this field, but it may choose
-               a node that violates one or more of the expressions. The node that is
-               most preferred is the one with the greatest sum of weights, i.e.
-               for each node that meets all of the scheduling requirements (resource
-               request, requiredDuringScheduling affinity expressions, etc.),
-               compute a sum by iterating through the elements of this field and adding
-               "weight" to the sum if the node matches the corresponding matchExpressions; the
-               node(s) with the highest sum are the most preferred.
-        """
-        if preferred_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "preferred_during_scheduling_ignored_during_execution", preferred_during_scheduling_ignored_during_execution)
-        if required_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "required_during_scheduling_ignored_during_execution", required_during_scheduling_ignored_during_execution)
-
-    @_builtins.property
-    @pulumi.getter(name="preferredDuringSchedulingIgnoredDuringExecution")
-    def preferred_during_scheduling_ignored_during_execution(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]]]:
-        """
-        The scheduler will prefer to schedule pods to nodes that satisfy
-        the affinity expressions specified by this field, but it may choose
-        a node that violates one or more of the expressions. The node that is
-        most preferred is the one with the greatest sum of weights, i.e.
-        for each node that meets all of the scheduling requirements (resource
-        request, requiredDuringScheduling affinity expressions, etc.),
-        compute a sum by iterating through the elements of this field and adding
-        "weight" to the sum if the node matches the corresponding matchExpressions; the
-        node(s) with the highest sum are the most preferred.
-        """
-        return pulumi.get(self, "preferred_during_scheduling_ignored_during_execution")
-
-    @preferred_during_scheduling_ignored_during_execution.setter
-    def preferred_during_scheduling_ignored_during_execution(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]]]):
-        pulumi.set(self, "preferred_during_scheduling_ignored_during_execution", value)
-
-    @_builtins.property
-    @pulumi.getter(name="requiredDuringSchedulingIgnoredDuringExecution")
-    def required_during_scheduling_ignored_during_execution(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']]:
-        return pulumi.get(self, "required_during_scheduling_ignored_during_execution")
-
-    @required_during_scheduling_ignored_during_execution.setter
-    def required_during_scheduling_ignored_during_execution(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']]):
-        pulumi.set(self, "required_during_scheduling_ignored_during_execution", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPatchArgsDict(TypedDict):
-    """
-    Proxy Pod's affinity rules.
-    By default, the Tailscale Kubernetes operator does not apply any affinity rules.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#affinity
-    """
-    node_affinity: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgs']]]
-    pod_affinity: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgs']]]
-    pod_anti_affinity: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPatchArgs:
-    def __init__(__self__, *,
-                 node_affinity: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgs']] = None,
-                 pod_affinity: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgs']] = None,
-                 pod_anti_affinity: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgs']] = None):
-        """
-        Proxy Pod's affinity rules.
-        By default, the Tailscale Kubernetes operator does not apply any affinity rules.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#affinity
-        """
-        if node_affinity is not None:
-            pulumi.set(__self__, "node_affinity", node_affinity)
-        if pod_affinity is not None:
-            pulumi.set(__self__, "pod_affinity", pod_affinity)
-        if pod_anti_affinity is not None:
-            pulumi.set(__self__, "pod_anti_affinity", pod_anti_affinity)
-
-    @_builtins.property
-    @pulumi.getter(name="nodeAffinity")
-    def node_affinity(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgs']]:
-        return pulumi.get(self, "node_affinity")
-
-    @node_affinity.setter
-    def node_affinity(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgs']]):
-        pulumi.set(self, "node_affinity", value)
-
-    @_builtins.property
-    @pulumi.getter(name="podAffinity")
-    def pod_affinity(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgs']]:
-        return pulumi.get(self, "pod_affinity")
-
-    @pod_affinity.setter
-    def pod_affinity(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgs']]):
-        pulumi.set(self, "pod_affinity", value)
-
-    @_builtins.property
-    @pulumi.getter(name="podAntiAffinity")
-    def pod_anti_affinity(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgs']]:
-        return pulumi.get(self, "pod_anti_affinity")
-
-    @pod_anti_affinity.setter
-    def pod_anti_affinity(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgs']]):
-        pulumi.set(self, "pod_anti_affinity", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgsDict(TypedDict):
-    """
-    Describes pod affinity scheduling rules (e.g. co-locate this pod in the same node, zone, etc. as some other pod(s)).
-    """
-    preferred_during_scheduling_ignored_during_execution: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]]]
-    """
-    The scheduler will prefer to schedule pods to nodes that satisfy
-    the affinity expressions specified by this field, but it may choose
-    a node that violates one or more of the expressions. The node that is
-    most preferred is the one with the greatest sum of weights, i.e.
-    for each node that meets all of the scheduling requirements (resource
-    request, requiredDuringScheduling affinity expressions, etc.),
-    compute a sum by iterating through the elements of this field and adding
-    "weight" to the sum if the node has pods which matches the corresponding podAffinityTerm; the
-    node(s) with the highest sum are the most preferred.
-    """
-    required_during_scheduling_ignored_during_execution: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]]]
-    """
-    If the affinity requirements specified by this field are not met at
-    scheduling time, the pod will not be scheduled onto the node.
-    If the affinity requirements specified by this field cease to be met
-    at some point during pod execution (e.g. due to a pod label update), the
-    system may or may not try to eventually evict the pod from its node.
-    When there are multiple elements, the lists of nodes corresponding to each
-    podAffinityTerm are intersected, i.e. all terms must be satisfied.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgs:
-    def __init__(__self__, *,
-                 preferred_during_scheduling_ignored_during_execution: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]] = None,
-                 required_during_scheduling_ignored_during_execution: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]] = None):
-        """
-        Describes pod affinity scheduling rules (e.g. co-locate this pod in the same node, zone, etc. as some other pod(s)).
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]] preferred_during_scheduling_ignored_during_execution: The scheduler will prefer to schedule pods to nodes that satisfy
-               the affinity expressions specified by this field, but it may choose
-               a node that violates one or more of the expressions. The node that is
-               most preferred is the one with the greatest sum of weights, i.e.
-               for each node that meets all of the scheduling requirements (resource
-               request, requiredDuringScheduling affinity expressions, etc.),
-               compute a sum by iterating through the elements of this field and adding
-               "weight" to the sum if the node has pods which matches the corresponding podAffinityTerm; the
-               node(s) with the highest sum are the most preferred.
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs']]] required_during_scheduling_ignored_during_execution: If the affinity requirements specified by this field are not met at
-               scheduling time, the pod will not be scheduled onto the node.
-               If the affinity requirements specified by this field cease to be met
-               at some point during pod execution (e.g. due to a pod label update), the
-               system may or may not try to eventually evict the pod from its node.
-               When there are multiple elements, the lists of nodes corresponding to each
-               podAffinityTerm are intersected, i.e. all terms must be satisfied.
-        """
-        if preferred_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "preferred_during_scheduling_ignored_during_execution", preferred_during_scheduling_ignored_during_execution)
-        if required_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "required_during_scheduling_ignored_during_execution", required_during_scheduling_ignored_during_execution)
-
-    @_builtins.property
-    @pulumi.getter(name="preferredDuringSchedulingIgnoredDuringExecution")
-    def preferred_during_scheduling_ignored_during_execution(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]]:
-        """
-        The scheduler will prefer to schedule pods to nodes that satisfy
-        the affinity expressions specified by this field, but it may choose
-        a node that violates one or more of the expressions. The node that is
-        most preferred is the one with the greatest sum of weights, i.e.
-        for each node that meets all of the scheduling requirements (resource
-        request, requiredDuringScheduling affinity expressions, etc.),
-        compute a sum by iterating through the elements of this field and adding
-        "weight" to the sum if the node has pods which matches the corresponding podAffinityTerm; the
-        node(s) with the highest sum are the most preferred.
-        """
-        return pulumi.get(self, "preferred_during_scheduling_ignored_during_execution")
-
-    @preferred_during_scheduling_ignored_during_execution.setter
-    def preferred_during_scheduling_ignored_during_execution(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]]):
-        pulumi.set(self, "preferred_during_scheduling_ignored_during_execution", value)
-
-    @_builtins.property
-    @pulumi.getter(name="requiredDuringSchedulingIgnoredDuringExecution")
-    def required_during_scheduling_ignored_during_execution(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]]:
-        """
-        If the affinity requirements specified by this field are not met at
-        scheduling time, the pod will not be scheduled onto the node.
-        If the affinity requirements specified by this field cease to be met
-        at some point during pod execution (e.g. due to a pod label update), the
-        system may or may not try to eventually evict the pod from its node.
-        When there are multiple elements, the lists of nodes corresponding to each
-        podAffinityTerm are intersected, i.e. all terms must be satisfied.
-        """
-        return pulumi.get(self, "required_during_scheduling_ignored_during_execution")
-
-    @required_during_scheduling_ignored_during_execution.setter
-    def required_during_scheduling_ignored_during_execution(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]]):
-        pulumi.set(self, "required_during_scheduling_ignored_during_execution", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict(TypedDict):
-    """
-    The weights of all of the matched WeightedPodAffinityTerm fields are added per-node to find the most preferred node(s)
-    """
-    pod_affinity_term: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs']]]
-    weight: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    weight associated with matching the corresponding podAffinityTerm,
-    in the range 1-100.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs:
-    def __init__(__self__, *,
-                 pod_affinity_term: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs']] = None,
-                 weight: pulumi.Input[Optional[_builtins.int]] = None):
-        """
-        The weights of all of the matched WeightedPodAffinityTerm fields are added per-node to find the most preferred node(s)
-
-        :param pulumi.Input[_builtins.int] weight: weight associated with matching the corresponding podAffinityTerm,
-               in the range 1-100.
-        """
-        if pod_affinity_term is not None:
-            pulumi.set(__self__, "pod_affinity_term", pod_affinity_term)
-        if weight is not None:
-            pulumi.set(__self__, "weight", weight)
-
-    @_builtins.property
-    @pulumi.getter(name="podAffinityTerm")
-    def pod_affinity_term(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs']]:
-        return pulumi.get(self, "pod_affinity_term")
-
-    @pod_affinity_term.setter
-    def pod_affinity_term(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs']]):
-        pulumi.set(self, "pod_affinity_term", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def weight(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        weight associated with matching the corresponding podAffinityTerm,
-        in the range 1-100.
-        """
-        return pulumi.get(self, "weight")
-
-    @weight.setter
-    def weight(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "weight", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict(TypedDict):
-    """
-    A label query over a set of resources, in this case pods.
-    If it's null, this PodAffinityTerm matches with no Pods.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label query over a set of resources, in this case pods.
-        If it's null, this PodAffinityTerm matches with no Pods.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict(TypedDict):
-    """
-    A label query over a set of resources, in this case pods.
-    If it's null, this PodAffinityTerm matches with no Pods.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label query over a set of resources, in this case pods.
-        If it's null, this PodAffinityTerm matches with no Pods.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict(TypedDict):
-    """
-    A label query over the set of namespaces that the term applies to.
-    The term is applied to the union of the namespaces selected by this field
-    and the ones listed in the namespaces field.
-    null selector and null or empty namespaces list means "this pod's namespace".
-    An empty selector ({}) matches all namespaces.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label query over the set of namespaces that the term applies to.
-        The term is applied to the union of the namespaces selected by this field
-        and the ones listed in the namespaces field.
-        null selector and null or empty namespaces list means "this pod's namespace".
-        An empty selector ({}) matches all namespaces.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict(TypedDict):
-    """
-    A label query over the set of namespaces that the term applies to.
-    The term is applied to the union of the namespaces selected by this field
-    and the ones listed in the namespaces field.
-    null selector and null or empty namespaces list means "this pod's namespace".
-    An empty selector ({}) matches all namespaces.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label query over the set of namespaces that the term applies to.
-        The term is applied to the union of the namespaces selected by this field
-        and the ones listed in the namespaces field.
-        null selector and null or empty namespaces list means "this pod's namespace".
-        An empty selector ({}) matches all namespaces.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict(TypedDict):
-    """
-    Required. A pod affinity term, associated with the corresponding weight.
-    """
-    label_selector: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs']]]
-    match_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    MatchLabelKeys is a set of pod label keys to select which pods will
-    be taken into consideration. The keys are used to lookup values from the
-    incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-    to select the group of existing pods which pods will be taken into consideration
-    for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-    pod labels will be ignored. The default value is empty.
-    The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-    Also, matchLabelKeys cannot be set when labelSelector isn't set.
-    """
-    mismatch_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    MismatchLabelKeys is a set of pod label keys to select which pods will
-    be taken into consideration. The keys are used to lookup values from the
-    incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-    to select the group of existing pods which pods will be taken into consideration
-    for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-    pod labels will be ignored. The default value is empty.
-    The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-    Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-    """
-    namespace_selector: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs']]]
-    namespaces: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    namespaces specifies a static list of namespace names that the term applies to.
-    The term is applied to the union of the namespaces listed in this field
-    and the ones selected by namespaceSelector.
-    null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-    """
-    topology_key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-    the labelSelector in the specified namespaces, where co-located is defined as running on a node
-    whose value of the label with key topologyKey matches that of any node on which any of the
-    selected pods is running.
-    Empty topologyKey is not allowed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs:
-    def __init__(__self__, *,
-                 label_selector: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs']] = None,
-                 match_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 mismatch_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 namespace_selector: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs']] = None,
-                 namespaces: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 topology_key: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Required. A pod affinity term, associated with the corresponding weight.
-
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] match_label_keys: MatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-               Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] mismatch_label_keys: MismatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-               Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] namespaces: namespaces specifies a static list of namespace names that the term applies to.
-               The term is applied to the union of the namespaces listed in this field
-               and the ones selected by namespaceSelector.
-               null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        :param pulumi.Input[_builtins.str] topology_key: This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-               the labelSelector in the specified namespaces, where co-located is defined as running on a node
-               whose value of the label with key topologyKey matches that of any node on which any of the
-               selected pods is running.
-               Empty topologyKey is not allowed.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if mismatch_label_keys is not None:
-            pulumi.set(__self__, "mismatch_label_keys", mismatch_label_keys)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if namespaces is not None:
-            pulumi.set(__self__, "namespaces", namespaces)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs']]:
-        return pulumi.get(self, "label_selector")
-
-    @label_selector.setter
-    def label_selector(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs']]):
-        pulumi.set(self, "label_selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-        Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @match_label_keys.setter
-    def match_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_label_keys", value)
-
-    @_builtins.property
-    @pulumi.getter(name="mismatchLabelKeys")
-    def mismatch_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        MismatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-        Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "mismatch_label_keys")
-
-    @mismatch_label_keys.setter
-    def mismatch_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "mismatch_label_keys", value)
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs']]:
-        return pulumi.get(self, "namespace_selector")
-
-    @namespace_selector.setter
-    def namespace_selector(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs']]):
-        pulumi.set(self, "namespace_selector", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def namespaces(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        namespaces specifies a static list of namespace names that the term applies to.
-        The term is applied to the union of the namespaces listed in this field
-        and the ones selected by namespaceSelector.
-        null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        """
-        return pulumi.get(self, "namespaces")
-
-    @namespaces.setter
-    def namespaces(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "namespaces", value)
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-        the labelSelector in the specified namespaces, where co-located is defined as running on a node
-        whose value of the label with key topologyKey matches that of any node on which any of the
-        selected pods is running.
-        Empty topologyKey is not allowed.
-        """
-        return pulumi.get(self, "topology_key")
-
-    @topology_key.setter
-    def topology_key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "topology_key", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict(TypedDict):
-    """
-    Required. A pod affinity term, associated with the corresponding weight.
-    """
-    label_selector: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs']]]
-    match_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    MatchLabelKeys is a set of pod label keys to select which pods will
-    be taken into consideration. The keys are used to lookup values from the
-    incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-    to select the group of existing pods which pods will be taken into consideration
-    for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-    pod labels will be ignored. The default value is empty.
-    The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-    Also, matchLabelKeys cannot be set when labelSelector isn't set.
-    """
-    mismatch_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    MismatchLabelKeys is a set of pod label keys to select which pods will
-    be taken into consideration. The keys are used to lookup values from the
-    incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-    to select the group of existing pods which pods will be taken into consideration
-    for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-    pod labels will be ignored. The default value is empty.
-    The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-    Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-    """
-    namespace_selector: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs']]]
-    namespaces: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    namespaces specifies a static list of namespace names that the term applies to.
-    The term is applied to the union of the namespaces listed in this field
-    and the ones selected by namespaceSelector.
-    null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-    """
-    topology_key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-    the labelSelector in the specified namespaces, where co-located is defined as running on a node
-    whose value of the label with key topologyKey matches that of any node on which any of the
-    selected pods is running.
-    Empty topologyKey is not allowed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs:
-    def __init__(__self__, *,
-                 label_selector: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs']] = None,
-                 match_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 mismatch_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 namespace_selector: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs']] = None,
-                 namespaces: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 topology_key: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Required. A pod affinity term, associated with the corresponding weight.
-
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] match_label_keys: MatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-               Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] mismatch_label_keys: MismatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-               Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] namespaces: namespaces specifies a static list of namespace names that the term applies to.
-               The term is applied to the union of the namespaces listed in this field
-               and the ones selected by namespaceSelector.
-               null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        :param pulumi.Input[_builtins.str] topology_key: This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-               the labelSelector in the specified namespaces, where co-located is defined as running on a node
-               whose value of the label with key topologyKey matches that of any node on which any of the
-               selected pods is running.
-               Empty topologyKey is not allowed.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if mismatch_label_keys is not None:
-            pulumi.set(__self__, "mismatch_label_keys", mismatch_label_keys)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if namespaces is not None:
-            pulumi.set(__self__, "namespaces", namespaces)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs']]:
-        return pulumi.get(self, "label_selector")
-
-    @label_selector.setter
-    def label_selector(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs']]):
-        pulumi.set(self, "label_selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-        Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @match_label_keys.setter
-    def match_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_label_keys", value)
-
-    @_builtins.property
-    @pulumi.getter(name="mismatchLabelKeys")
-    def mismatch_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        MismatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-        Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "mismatch_label_keys")
-
-    @mismatch_label_keys.setter
-    def mismatch_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "mismatch_label_keys", value)
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs']]:
-        return pulumi.get(self, "namespace_selector")
-
-    @namespace_selector.setter
-    def namespace_selector(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs']]):
-        pulumi.set(self, "namespace_selector", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def namespaces(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        namespaces specifies a static list of namespace names that the term applies to.
-        The term is applied to the union of the namespaces listed in this field
-        and the ones selected by namespaceSelector.
-        null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        """
-        return pulumi.get(self, "namespaces")
-
-    @namespaces.setter
-    def namespaces(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "namespaces", value)
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-        the labelSelector in the specified namespaces, where co-located is defined as running on a node
-        whose value of the label with key topologyKey matches that of any node on which any of the
-        selected pods is running.
-        Empty topologyKey is not allowed.
-        """
-        return pulumi.get(self, "topology_key")
-
-    @topology_key.setter
-    def topology_key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "topology_key", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict(TypedDict):
-    """
-    The weights of all of the matched WeightedPodAffinityTerm fields are added per-node to find the most preferred node(s)
-    """
-    pod_affinity_term: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs']]]
-    weight: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    weight associated with matching the corresponding podAffinityTerm,
-    in the range 1-100.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs:
-    def __init__(__self__, *,
-                 pod_affinity_term: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs']] = None,
-                 weight: pulumi.Input[Optional[_builtins.int]] = None):
-        """
-        The weights of all of the matched WeightedPodAffinityTerm fields are added per-node to find the most preferred node(s)
-
-        :param pulumi.Input[_builtins.int] weight: weight associated with matching the corresponding podAffinityTerm,
-               in the range 1-100.
-        """
-        if pod_affinity_term is not None:
-            pulumi.set(__self__, "pod_affinity_term", pod_affinity_term)
-        if weight is not None:
-            pulumi.set(__self__, "weight", weight)
-
-    @_builtins.property
-    @pulumi.getter(name="podAffinityTerm")
-    def pod_affinity_term(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs']]:
-        return pulumi.get(self, "pod_affinity_term")
-
-    @pod_affinity_term.setter
-    def pod_affinity_term(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs']]):
-        pulumi.set(self, "pod_affinity_term", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def weight(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        weight associated with matching the corresponding podAffinityTerm,
-        in the range 1-100.
-        """
-        return pulumi.get(self, "weight")
-
-    @weight.setter
-    def weight(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "weight", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict(TypedDict):
-    """
-    A label query over a set of resources, in this case pods.
-    If it's null, this PodAffinityTerm matches with no Pods.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label query over a set of resources, in this case pods.
-        If it's null, this PodAffinityTerm matches with no Pods.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict(TypedDict):
-    """
-    A label query over a set of resources, in this case pods.
-    If it's null, this PodAffinityTerm matches with no Pods.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label query over a set of resources, in this case pods.
-        If it's null, this PodAffinityTerm matches with no Pods.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict(TypedDict):
-    """
-    A label query over the set of namespaces that the term applies to.
-    The term is applied to the union of the namespaces selected by this field
-    and the ones listed in the namespaces field.
-    null selector and null or empty namespaces list means "this pod's namespace".
-    An empty selector ({}) matches all namespaces.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label query over the set of namespaces that the term applies to.
-        The term is applied to the union of the namespaces selected by this field
-        and the ones listed in the namespaces field.
-        null selector and null or empty namespaces list means "this pod's namespace".
-        An empty selector ({}) matches all namespaces.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict(TypedDict):
-    """
-    A label query over the set of namespaces that the term applies to.
-    The term is applied to the union of the namespaces selected by this field
-    and the ones listed in the namespaces field.
-    null selector and null or empty namespaces list means "this pod's namespace".
-    An empty selector ({}) matches all namespaces.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label query over the set of namespaces that the term applies to.
-        The term is applied to the union of the namespaces selected by this field
-        and the ones listed in the namespaces field.
-        null selector and null or empty namespaces list means "this pod's namespace".
-        An empty selector ({}) matches all namespaces.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict(TypedDict):
-    """
-    Defines a set of pods (namely those matching the labelSelector
-    relative to the given namespace(s)) that this pod should be
-    co-located (affinity) or not co-located (anti-affinity) with,
-    where co-located is defined as running on a node whose value of
-    the label with key <topologyKey> matches that of any node on which
-    a pod of the set of pods is running
-    """
-    label_selector: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs']]]
-    match_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    MatchLabelKeys is a set of pod label keys to select which pods will
-    be taken into consideration. The keys are used to lookup values from the
-    incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-    to select the group of existing pods which pods will be taken into consideration
-    for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-    pod labels will be ignored. The default value is empty.
-    The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-    Also, matchLabelKeys cannot be set when labelSelector isn't set.
-    """
-    mismatch_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    MismatchLabelKeys is a set of pod label keys to select which pods will
-    be taken into consideration. The keys are used to lookup values from the
-    incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-    to select the group of existing pods which pods will be taken into consideration
-    for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-    pod labels will be ignored. The default value is empty.
-    The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-    Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-    """
-    namespace_selector: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs']]]
-    namespaces: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    namespaces specifies a static list of namespace names that the term applies to.
-    The term is applied to the union of the namespaces listed in this field
-    and the ones selected by namespaceSelector.
-    null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-    """
-    topology_key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-    the labelSelector in the specified namespaces, where co-located is defined as running on a node
-    whose value of the label with key topologyKey matches that of any node on which any of the
-    selected pods is running.
-    Empty topologyKey is not allowed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs:
-    def __init__(__self__, *,
-                 label_selector: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs']] = None,
-                 match_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 mismatch_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 namespace_selector: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs']] = None,
-                 namespaces: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 topology_key: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Defines a set of pods (namely those matching the labelSelector
-        relative to the given namespace(s)) that this pod should be
-        co-located (affinity) or not co-located (anti-affinity) with,
-        where co-located is defined as running on a node whose value of
-        the label with key <topologyKey> matches that of any node on which
-        a pod of the set of pods is running
-
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] match_label_keys: MatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-               Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] mismatch_label_keys: MismatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-               Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] namespaces: namespaces specifies a static list of namespace names that the term applies to.
-               The term is applied to the union of the namespaces listed in this field
-               and the ones selected by namespaceSelector.
-               null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        :param pulumi.Input[_builtins.str] topology_key: This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-               the labelSelector in the specified namespaces, where co-located is defined as running on a node
-               whose value of the label with key topologyKey matches that of any node on which any of the
-               selected pods is running.
-               Empty topologyKey is not allowed.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if mismatch_label_keys is not None:
-            pulumi.set(__self__, "mismatch_label_keys", mismatch_label_keys)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if namespaces is not None:
-            pulumi.set(__self__, "namespaces", namespaces)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs']]:
-        return pulumi.get(self, "label_selector")
-
-    @label_selector.setter
-    def label_selector(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs']]):
-        pulumi.set(self, "label_selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-        Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @match_label_keys.setter
-    def match_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_label_keys", value)
-
-    @_builtins.property
-    @pulumi.getter(name="mismatchLabelKeys")
-    def mismatch_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        MismatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-        Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "mismatch_label_keys")
-
-    @mismatch_label_keys.setter
-    def mismatch_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "mismatch_label_keys", value)
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs']]:
-        return pulumi.get(self, "namespace_selector")
-
-    @namespace_selector.setter
-    def namespace_selector(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs']]):
-        pulumi.set(self, "namespace_selector", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def namespaces(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        namespaces specifies a static list of namespace names that the term applies to.
-        The term is applied to the union of the namespaces listed in this field
-        and the ones selected by namespaceSelector.
-        null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        """
-        return pulumi.get(self, "namespaces")
-
-    @namespaces.setter
-    def namespaces(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "namespaces", value)
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-        the labelSelector in the specified namespaces, where co-located is defined as running on a node
-        whose value of the label with key topologyKey matches that of any node on which any of the
-        selected pods is running.
-        Empty topologyKey is not allowed.
-        """
-        return pulumi.get(self, "topology_key")
-
-    @topology_key.setter
-    def topology_key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "topology_key", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict(TypedDict):
-    """
-    Defines a set of pods (namely those matching the labelSelector
-    relative to the given namespace(s)) that this pod should be
-    co-located (affinity) or not co-located (anti-affinity) with,
-    where co-located is defined as running on a node whose value of
-    the label with key <topologyKey> matches that of any node on which
-    a pod of the set of pods is running
-    """
-    label_selector: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs']]]
-    match_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    MatchLabelKeys is a set of pod label keys to select which pods will
-    be taken into consideration. The keys are used to lookup values from the
-    incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-    to select the group of existing pods which pods will be taken into consideration
-    for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-    pod labels will be ignored. The default value is empty.
-    The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-    Also, matchLabelKeys cannot be set when labelSelector isn't set.
-    """
-    mismatch_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    MismatchLabelKeys is a set of pod label keys to select which pods will
-    be taken into consideration. The keys are used to lookup values from the
-    incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-    to select the group of existing pods which pods will be taken into consideration
-    for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-    pod labels will be ignored. The default value is empty.
-    The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-    Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-    """
-    namespace_selector: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs']]]
-    namespaces: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    namespaces specifies a static list of namespace names that the term applies to.
-    The term is applied to the union of the namespaces listed in this field
-    and the ones selected by namespaceSelector.
-    null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-    """
-    topology_key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-    the labelSelector in the specified namespaces, where co-located is defined as running on a node
-    whose value of the label with key topologyKey matches that of any node on which any of the
-    selected pods is running.
-    Empty topologyKey is not allowed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs:
-    def __init__(__self__, *,
-                 label_selector: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs']] = None,
-                 match_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 mismatch_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 namespace_selector: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs']] = None,
-                 namespaces: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 topology_key: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Defines a set of pods (namely those matching the labelSelector
-        relative to the given namespace(s)) that this pod should be
-        co-located (affinity) or not co-located (anti-affinity) with,
-        where co-located is defined as running on a node whose value of
-        the label with key <topologyKey> matches that of any node on which
-        a pod of the set of pods is running
-
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] match_label_keys: MatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-               Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] mismatch_label_keys: MismatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-               Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] namespaces: namespaces specifies a static list of namespace names that the term applies to.
-               The term is applied to the union of the namespaces listed in this field
-               and the ones selected by namespaceSelector.
-               null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        :param pulumi.Input[_builtins.str] topology_key: This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-               the labelSelector in the specified namespaces, where co-located is defined as running on a node
-               whose value of the label with key topologyKey matches that of any node on which any of the
-               selected pods is running.
-               Empty topologyKey is not allowed.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if mismatch_label_keys is not None:
-            pulumi.set(__self__, "mismatch_label_keys", mismatch_label_keys)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if namespaces is not None:
-            pulumi.set(__self__, "namespaces", namespaces)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs']]:
-        return pulumi.get(self, "label_selector")
-
-    @label_selector.setter
-    def label_selector(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs']]):
-        pulumi.set(self, "label_selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-        Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @match_label_keys.setter
-    def match_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_label_keys", value)
-
-    @_builtins.property
-    @pulumi.getter(name="mismatchLabelKeys")
-    def mismatch_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        MismatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-        Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "mismatch_label_keys")
-
-    @mismatch_label_keys.setter
-    def mismatch_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "mismatch_label_keys", value)
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs']]:
-        return pulumi.get(self, "namespace_selector")
-
-    @namespace_selector.setter
-    def namespace_selector(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs']]):
-        pulumi.set(self, "namespace_selector", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def namespaces(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        namespaces specifies a static list of namespace names that the term applies to.
-        The term is applied to the union of the namespaces listed in this field
-        and the ones selected by namespaceSelector.
-        null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        """
-        return pulumi.get(self, "namespaces")
-
-    @namespaces.setter
-    def namespaces(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "namespaces", value)
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-        the labelSelector in the specified namespaces, where co-located is defined as running on a node
-        whose value of the label with key topologyKey matches that of any node on which any of the
-        selected pods is running.
-        Empty topologyKey is not allowed.
-        """
-        return pulumi.get(self, "topology_key")
-
-    @topology_key.setter
-    def topology_key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "topology_key", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityArgsDict(TypedDict):
-    """
-    Describes pod affinity scheduling rules (e.g. co-locate this pod in the same node, zone, etc. as some other pod(s)).
-    """
-    preferred_during_scheduling_ignored_during_execution: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]]]]
-    """
-    The scheduler will prefer to schedule pods to nodes that satisfy
-    the affinity expressions specified by this field, but it may choose
-    a node that violates one or more of the expressions. The node that is
-    most preferred is the one with the greatest sum of weights, i.e.
-    for each node that meets all of the scheduling requirements (resource
-    request, requiredDuringScheduling affinity expressions, etc.),
-    compute a sum by iterating through the elements of this field and adding
-    "weight" to the sum if the node has pods which matches the corresponding podAffinityTerm; the
-    node(s) with the highest sum are the most preferred.
-    """
-    required_during_scheduling_ignored_during_execution: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']]]]]
-    """
-    If the affinity requirements specified by this field are not met at
-    scheduling time, the pod will not be scheduled onto the node.
-    If the affinity requirements specified by this field cease to be met
-    at some point during pod execution (e.g. due to a pod label update), the
-    system may or may not try to eventually evict the pod from its node.
-    When there are multiple elements, the lists of nodes corresponding to each
-    podAffinityTerm are intersected, i.e. all terms must be satisfied.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityArgs:
-    def __init__(__self__, *,
-                 preferred_during_scheduling_ignored_during_execution: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]]] = None,
-                 required_during_scheduling_ignored_during_execution: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']]]] = None):
-        """
-        Describes pod affinity scheduling rules (e.g. co-locate this pod in the same node, zone, etc. as some other pod(s)).
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]] preferred_during_scheduling_ignored_during_execution: The scheduler will prefer to schedule pods to nodes that satisfy
-               the affinity expressions specified by this field, but it may choose
-               a node that violates one or more of the expressions. The node that is
-               most preferred is the one with the greatest sum of weights, i.e.
-               for each node that meets all of the scheduling requirements (resource
-               request, requiredDuringScheduling affinity expressions, etc.),
-               compute a sum by iterating through the elements of this field and adding
-               "weight" to the sum if the node has pods which matches the corresponding podAffinityTerm; the
-               node(s) with the highest sum are the most preferred.
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']]] required_during_scheduling_ignored_during_execution: If the affinity requirements specified by this field are not met at
-               scheduling time, the pod will not be scheduled onto the node.
-               If the affinity requirements specified by this field cease to be met
-               at some point during pod execution (e.g. due to a pod label update), the
-               system may or may not try to eventually evict the pod from its node.
-               When there are multiple elements, the lists of nodes corresponding to each
-               podAffinityTerm are intersected, i.e. all terms must be satisfied.
-        """
-        if preferred_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "preferred_during_scheduling_ignored_during_execution", preferred_during_scheduling_ignored_during_execution)
-        if required_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "required_during_scheduling_ignored_during_execution", required_during_scheduling_ignored_during_execution)
-
-    @_builtins.property
-    @pulumi.getter(name="preferredDuringSchedulingIgnoredDuringExecution")
-    def preferred_during_scheduling_ignored_during_execution(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]]]:
-        """
-        The scheduler will prefer to schedule pods to nodes that satisfy
-        the affinity expressions specified by this field, but it may choose
-        a node that violates one or more of the expressions. The node that is
-        most preferred is the one with the greatest sum of weights, i.e.
-        for each node that meets all of the scheduling requirements (resource
-        request, requiredDuringScheduling affinity expressions, etc.),
-        compute a sum by iterating through the elements of this field and adding
-        "weight" to the sum if the node has pods which matches the corresponding podAffinityTerm; the
-        node(s) with the highest sum are the most preferred.
-        """
-        return pulumi.get(self, "preferred_during_scheduling_ignored_during_execution")
-
-    @preferred_during_scheduling_ignored_during_execution.setter
-    def preferred_during_scheduling_ignored_during_execution(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]]]):
-        pulumi.set(self, "preferred_during_scheduling_ignored_during_execution", value)
-
-    @_builtins.property
-    @pulumi.getter(name="requiredDuringSchedulingIgnoredDuringExecution")
-    def required_during_scheduling_ignored_during_execution(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']]]]:
-        """
-        If the affinity requirements specified by this field are not met at
-        scheduling time, the pod will not be scheduled onto the node.
-        If the affinity requirements specified by this field cease to be met
-        at some point during pod execution (e.g. due to a pod label update), the
-        system may or may not try to eventually evict the pod from its node.
-        When there are multiple elements, the lists of nodes corresponding to each
-        podAffinityTerm are intersected, i.e. all terms must be satisfied.
-        """
-        return pulumi.get(self, "required_during_scheduling_ignored_during_execution")
-
-    @required_during_scheduling_ignored_during_execution.setter
-    def required_during_scheduling_ignored_during_execution(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']]]]):
-        pulumi.set(self, "required_during_scheduling_ignored_during_execution", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgsDict(TypedDict):
-    """
-    Describes pod anti-affinity scheduling rules (e.g. avoid putting this pod in the same node, zone, etc. as some other pod(s)).
-    """
-    preferred_during_scheduling_ignored_during_execution: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]]]
-    """
-    The scheduler will prefer to schedule pods to nodes that satisfy
-    the anti-affinity expressions specified by this field, but it may choose
-    a node that violates one or more of the expressions. The node that is
-    most preferred is the one with the greatest sum of weights, i.e.
-    for each node that meets all of the scheduling requirements (resource
-    request, requiredDuringScheduling anti-affinity expressions, etc.),
-    compute a sum by iterating through the elements of this field and subtracting
-    "weight" from the sum if the node has pods which matches the corresponding podAffinityTerm; the
-    node(s) with the highest sum are the most preferred.
-    """
-    required_during_scheduling_ignored_during_execution: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]]]
-    """
-    If the anti-affinity requirements specified by this field are not met at
-    scheduling time, the pod will not be scheduled onto the node.
-    If the anti-affinity requirements specified by this field cease to be met
-    at some point during pod execution (e.g. due to a pod label update), the
-    system may or may not try to eventually evict the pod from its node.
-    When there are multiple elements, the lists of nodes corresponding to each
-    podAffinityTerm are intersected, i.e. all terms must be satisfied.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgs:
-    def __init__(__self__, *,
-                 preferred_during_scheduling_ignored_during_execution: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]] = None,
-                 required_during_scheduling_ignored_during_execution: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]] = None):
-        """
-        Describes pod anti-affinity scheduling rules (e.g. avoid putting this pod in the same node, zone, etc. as some other pod(s)).
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]] preferred_during_scheduling_ignored_during_execution: The scheduler will prefer to schedule pods to nodes that satisfy
-               the anti-affinity expressions specified by this field, but it may choose
-               a node that violates one or more of the expressions. The node that is
-               most preferred is the one with the greatest sum of weights, i.e.
-               for each node that meets all of the scheduling requirements (resource
-               request, requiredDuringScheduling anti-affinity expressions, etc.),
-               compute a sum by iterating through the elements of this field and subtracting
-               "weight" from the sum if the node has pods which matches the corresponding podAffinityTerm; the
-               node(s) with the highest sum are the most preferred.
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs']]] required_during_scheduling_ignored_during_execution: If the anti-affinity requirements specified by this field are not met at
-               scheduling time, the pod will not be scheduled onto the node.
-               If the anti-affinity requirements specified by this field cease to be met
-               at some point during pod execution (e.g. due to a pod label update), the
-               system may or may not try to eventually evict the pod from its node.
-               When there are multiple elements, the lists of nodes corresponding to each
-               podAffinityTerm are intersected, i.e. all terms must be satisfied.
-        """
-        if preferred_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "preferred_during_scheduling_ignored_during_execution", preferred_during_scheduling_ignored_during_execution)
-        if required_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "required_during_scheduling_ignored_during_execution", required_during_scheduling_ignored_during_execution)
-
-    @_builtins.property
-    @pulumi.getter(name="preferredDuringSchedulingIgnoredDuringExecution")
-    def preferred_during_scheduling_ignored_during_execution(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]]:
-        """
-        The scheduler will prefer to schedule pods to nodes that satisfy
-        the anti-affinity expressions specified by this field, but it may choose
-        a node that violates one or more of the expressions. The node that is
-        most preferred is the one with the greatest sum of weights, i.e.
-        for each node that meets all of the scheduling requirements (resource
-        request, requiredDuringScheduling anti-affinity expressions, etc.),
-        compute a sum by iterating through the elements of this field and subtracting
-        "weight" from the sum if the node has pods which matches the corresponding podAffinityTerm; the
-        node(s) with the highest sum are the most preferred.
-        """
-        return pulumi.get(self, "preferred_during_scheduling_ignored_during_execution")
-
-    @preferred_during_scheduling_ignored_during_execution.setter
-    def preferred_during_scheduling_ignored_during_execution(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]]):
-        pulumi.set(self, "preferred_during_scheduling_ignored_during_execution", value)
-
-    @_builtins.property
-    @pulumi.getter(name="requiredDuringSchedulingIgnoredDuringExecution")
-    def required_during_scheduling_ignored_during_execution(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]]:
-        """
-        If the anti-affinity requirements specified by this field are not met at
-        scheduling time, the pod will not be scheduled onto the node.
-        If the anti-affinity requirements specified by this field cease to be met
-        at some point during pod execution (e.g. due to a pod label update), the
-        system may or may not try to eventually evict the pod from its node.
-        When there are multiple elements, the lists of nodes corresponding to each
-        podAffinityTerm are intersected, i.e. all terms must be satisfied.
-        """
-        return pulumi.get(self, "required_during_scheduling_ignored_during_execution")
-
-    @required_during_scheduling_ignored_during_execution.setter
-    def required_during_scheduling_ignored_during_execution(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]]):
-        pulumi.set(self, "required_during_scheduling_ignored_during_execution", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict(TypedDict):
-    """
-    The weights of all of the matched WeightedPodAffinityTerm fields are added per-node to find the most preferred node(s)
-    """
-    pod_affinity_term: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs']]]
-    weight: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    weight associated with matching the corresponding podAffinityTerm,
-    in the range 1-100.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs:
-    def __init__(__self__, *,
-                 pod_affinity_term: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs']] = None,
-                 weight: pulumi.Input[Optional[_builtins.int]] = None):
-        """
-        The weights of all of the matched WeightedPodAffinityTerm fields are added per-node to find the most preferred node(s)
-
-        :param pulumi.Input[_builtins.int] weight: weight associated with matching the corresponding podAffinityTerm,
-               in the range 1-100.
-        """
-        if pod_affinity_term is not None:
-            pulumi.set(__self__, "pod_affinity_term", pod_affinity_term)
-        if weight is not None:
-            pulumi.set(__self__, "weight", weight)
-
-    @_builtins.property
-    @pulumi.getter(name="podAffinityTerm")
-    def pod_affinity_term(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs']]:
-        return pulumi.get(self, "pod_affinity_term")
-
-    @pod_affinity_term.setter
-    def pod_affinity_term(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs']]):
-        pulumi.set(self, "pod_affinity_term", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def weight(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        weight associated with matching the corresponding podAffinityTerm,
-        in the range 1-100.
-        """
-        return pulumi.get(self, "weight")
-
-    @weight.setter
-    def weight(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "weight", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict(TypedDict):
-    """
-    A label query over a set of resources, in this case pods.
-    If it's null, this PodAffinityTerm matches with no Pods.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label query over a set of resources, in this case pods.
-        If it's null, this PodAffinityTerm matches with no Pods.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict(TypedDict):
-    """
-    A label query over a set of resources, in this case pods.
-    If it's null, this PodAffinityTerm matches with no Pods.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label query over a set of resources, in this case pods.
-        If it's null, this PodAffinityTerm matches with no Pods.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict(TypedDict):
-    """
-    A label query over the set of namespaces that the term applies to.
-    The term is applied to the union of the namespaces selected by this field
-    and the ones listed in the namespaces field.
-    null selector and null or empty namespaces list means "this pod's namespace".
-    An empty selector ({}) matches all namespaces.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label query over the set of namespaces that the term applies to.
-        The term is applied to the union of the namespaces selected by this field
-        and the ones listed in the namespaces field.
-        null selector and null or empty namespaces list means "this pod's namespace".
-        An empty selector ({}) matches all namespaces.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict(TypedDict):
-    """
-    A label query over the set of namespaces that the term applies to.
-    The term is applied to the union of the namespaces selected by this field
-    and the ones listed in the namespaces field.
-    null selector and null or empty namespaces list means "this pod's namespace".
-    An empty selector ({}) matches all namespaces.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label query over the set of namespaces that the term applies to.
-        The term is applied to the union of the namespaces selected by this field
-        and the ones listed in the namespaces field.
-        null selector and null or empty namespaces list means "this pod's namespace".
-        An empty selector ({}) matches all namespaces.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict(TypedDict):
-    """
-    Required. A pod affinity term, associated with the corresponding weight.
-    """
-    label_selector: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs']]]
-    match_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    MatchLabelKeys is a set of pod label keys to select which pods will
-    be taken into consideration. The keys are used to lookup values from the
-    incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-    to select the group of existing pods which pods will be taken into consideration
-    for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-    pod labels will be ignored. The default value is empty.
-    The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-    Also, matchLabelKeys cannot be set when labelSelector isn't set.
-    """
-    mismatch_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    MismatchLabelKeys is a set of pod label keys to select which pods will
-    be taken into consideration. The keys are used to lookup values from the
-    incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-    to select the group of existing pods which pods will be taken into consideration
-    for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-    pod labels will be ignored. The default value is empty.
-    The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-    Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-    """
-    namespace_selector: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs']]]
-    namespaces: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    namespaces specifies a static list of namespace names that the term applies to.
-    The term is applied to the union of the namespaces listed in this field
-    and the ones selected by namespaceSelector.
-    null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-    """
-    topology_key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-    the labelSelector in the specified namespaces, where co-located is defined as running on a node
-    whose value of the label with key topologyKey matches that of any node on which any of the
-    selected pods is running.
-    Empty topologyKey is not allowed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs:
-    def __init__(__self__, *,
-                 label_selector: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs']] = None,
-                 match_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 mismatch_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 namespace_selector: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs']] = None,
-                 namespaces: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 topology_key: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Required. A pod affinity term, associated with the corresponding weight.
-
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] match_label_keys: MatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-               Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] mismatch_label_keys: MismatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-               Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] namespaces: namespaces specifies a static list of namespace names that the term applies to.
-               The term is applied to the union of the namespaces listed in this field
-               and the ones selected by namespaceSelector.
-               null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        :param pulumi.Input[_builtins.str] topology_key: This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-               the labelSelector in the specified namespaces, where co-located is defined as running on a node
-               whose value of the label with key topologyKey matches that of any node on which any of the
-               selected pods is running.
-               Empty topologyKey is not allowed.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if mismatch_label_keys is not None:
-            pulumi.set(__self__, "mismatch_label_keys", mismatch_label_keys)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if namespaces is not None:
-            pulumi.set(__self__, "namespaces", namespaces)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs']]:
-        return pulumi.get(self, "label_selector")
-
-    @label_selector.setter
-    def label_selector(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs']]):
-        pulumi.set(self, "label_selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-        Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @match_label_keys.setter
-    def match_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_label_keys", value)
-
-    @_builtins.property
-    @pulumi.getter(name="mismatchLabelKeys")
-    def mismatch_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        MismatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-        Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "mismatch_label_keys")
-
-    @mismatch_label_keys.setter
-    def mismatch_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "mismatch_label_keys", value)
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs']]:
-        return pulumi.get(self, "namespace_selector")
-
-    @namespace_selector.setter
-    def namespace_selector(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs']]):
-        pulumi.set(self, "namespace_selector", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def namespaces(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        namespaces specifies a static list of namespace names that the term applies to.
-        The term is applied to the union of the namespaces listed in this field
-        and the ones selected by namespaceSelector.
-        null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        """
-        return pulumi.get(self, "namespaces")
-
-    @namespaces.setter
-    def namespaces(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "namespaces", value)
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-        the labelSelector in the specified namespaces, where co-located is defined as running on a node
-        whose value of the label with key topologyKey matches that of any node on which any of the
-        selected pods is running.
-        Empty topologyKey is not allowed.
-        """
-        return pulumi.get(self, "topology_key")
-
-    @topology_key.setter
-    def topology_key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "topology_key", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict(TypedDict):
-    """
-    Required. A pod affinity term, associated with the corresponding weight.
-    """
-    label_selector: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs']]]
-    match_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    MatchLabelKeys is a set of pod label keys to select which pods will
-    be taken into consideration. The keys are used to lookup values from the
-    incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-    to select the group of existing pods which pods will be taken into consideration
-    for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-    pod labels will be ignored. The default value is empty.
-    The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-    Also, matchLabelKeys cannot be set when labelSelector isn't set.
-    """
-    mismatch_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    MismatchLabelKeys is a set of pod label keys to select which pods will
-    be taken into consideration. The keys are used to lookup values from the
-    incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-    to select the group of existing pods which pods will be taken into consideration
-    for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-    pod labels will be ignored. The default value is empty.
-    The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-    Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-    """
-    namespace_selector: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs']]]
-    namespaces: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    namespaces specifies a static list of namespace names that the term applies to.
-    The term is applied to the union of the namespaces listed in this field
-    and the ones selected by namespaceSelector.
-    null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-    """
-    topology_key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-    the labelSelector in the specified namespaces, where co-located is defined as running on a node
-    whose value of the label with key topologyKey matches that of any node on which any of the
-    selected pods is running.
-    Empty topologyKey is not allowed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs:
-    def __init__(__self__, *,
-                 label_selector: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs']] = None,
-                 match_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 mismatch_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 namespace_selector: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs']] = None,
-                 namespaces: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 topology_key: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Required. A pod affinity term, associated with the corresponding weight.
-
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] match_label_keys: MatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-               Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] mismatch_label_keys: MismatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-               Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] namespaces: namespaces specifies a static list of namespace names that the term applies to.
-               The term is applied to the union of the namespaces listed in this field
-               and the ones selected by namespaceSelector.
-               null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        :param pulumi.Input[_builtins.str] topology_key: This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-               the labelSelector in the specified namespaces, where co-located is defined as running on a node
-               whose value of the label with key topologyKey matches that of any node on which any of the
-               selected pods is running.
-               Empty topologyKey is not allowed.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if mismatch_label_keys is not None:
-            pulumi.set(__self__, "mismatch_label_keys", mismatch_label_keys)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if namespaces is not None:
-            pulumi.set(__self__, "namespaces", namespaces)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs']]:
-        return pulumi.get(self, "label_selector")
-
-    @label_selector.setter
-    def label_selector(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs']]):
-        pulumi.set(self, "label_selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-        Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @match_label_keys.setter
-    def match_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_label_keys", value)
-
-    @_builtins.property
-    @pulumi.getter(name="mismatchLabelKeys")
-    def mismatch_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        MismatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-        Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "mismatch_label_keys")
-
-    @mismatch_label_keys.setter
-    def mismatch_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "mismatch_label_keys", value)
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs']]:
-        return pulumi.get(self, "namespace_selector")
-
-    @namespace_selector.setter
-    def namespace_selector(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs']]):
-        pulumi.set(self, "namespace_selector", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def namespaces(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        namespaces specifies a static list of namespace names that the term applies to.
-        The term is applied to the union of the namespaces listed in this field
-        and the ones selected by namespaceSelector.
-        null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        """
-        return pulumi.get(self, "namespaces")
-
-    @namespaces.setter
-    def namespaces(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "namespaces", value)
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-        the labelSelector in the specified namespaces, where co-located is defined as running on a node
-        whose value of the label with key topologyKey matches that of any node on which any of the
-        selected pods is running.
-        Empty topologyKey is not allowed.
-        """
-        return pulumi.get(self, "topology_key")
-
-    @topology_key.setter
-    def topology_key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "topology_key", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict(TypedDict):
-    """
-    The weights of all of the matched WeightedPodAffinityTerm fields are added per-node to find the most preferred node(s)
-    """
-    pod_affinity_term: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs']]]
-    weight: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    weight associated with matching the corresponding podAffinityTerm,
-    in the range 1-100.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs:
-    def __init__(__self__, *,
-                 pod_affinity_term: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs']] = None,
-                 weight: pulumi.Input[Optional[_builtins.int]] = None):
-        """
-        The weights of all of the matched WeightedPodAffinityTerm fields are added per-node to find the most preferred node(s)
-
-        :param pulumi.Input[_builtins.int] weight: weight associated with matching the corresponding podAffinityTerm,
-               in the range 1-100.
-        """
-        if pod_affinity_term is not None:
-            pulumi.set(__self__, "pod_affinity_term", pod_affinity_term)
-        if weight is not None:
-            pulumi.set(__self__, "weight", weight)
-
-    @_builtins.property
-    @pulumi.getter(name="podAffinityTerm")
-    def pod_affinity_term(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs']]:
-        return pulumi.get(self, "pod_affinity_term")
-
-    @pod_affinity_term.setter
-    def pod_affinity_term(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs']]):
-        pulumi.set(self, "pod_affinity_term", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def weight(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        weight associated with matching the corresponding podAffinityTerm,
-        in the range 1-100.
-        """
-        return pulumi.get(self, "weight")
-
-    @weight.setter
-    def weight(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "weight", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict(TypedDict):
-    """
-    A label query over a set of resources, in this case pods.
-    If it's null, this PodAffinityTerm matches with no Pods.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label query over a set of resources, in this case pods.
-        If it's null, this PodAffinityTerm matches with no Pods.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict(TypedDict):
-    """
-    A label query over a set of resources, in this case pods.
-    If it's null, this PodAffinityTerm matches with no Pods.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label query over a set of resources, in this case pods.
-        If it's null, this PodAffinityTerm matches with no Pods.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict(TypedDict):
-    """
-    A label query over the set of namespaces that the term applies to.
-    The term is applied to the union of the namespaces selected by this field
-    and the ones listed in the namespaces field.
-    null selector and null or empty namespaces list means "this pod's namespace".
-    An empty selector ({}) matches all namespaces.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label query over the set of namespaces that the term applies to.
-        The term is applied to the union of the namespaces selected by this field
-        and the ones listed in the namespaces field.
-        null selector and null or empty namespaces list means "this pod's namespace".
-        An empty selector ({}) matches all namespaces.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict(TypedDict):
-    """
-    A label query over the set of namespaces that the term applies to.
-    The term is applied to the union of the namespaces selected by this field
-    and the ones listed in the namespaces field.
-    null selector and null or empty namespaces list means "this pod's namespace".
-    An empty selector ({}) matches all namespaces.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label query over the set of namespaces that the term applies to.
-        The term is applied to the union of the namespaces selected by this field
-        and the ones listed in the namespaces field.
-        null selector and null or empty namespaces list means "this pod's namespace".
-        An empty selector ({}) matches all namespaces.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict(TypedDict):
-    """
-    Defines a set of pods (namely those matching the labelSelector
-    relative to the given namespace(s)) that this pod should be
-    co-located (affinity) or not co-located (anti-affinity) with,
-    where co-located is defined as running on a node whose value of
-    the label with key <topologyKey> matches that of any node on which
-    a pod of the set of pods is running
-    """
-    label_selector: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs']]]
-    match_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    MatchLabelKeys is a set of pod label keys to select which pods will
-    be taken into consideration. The keys are used to lookup values from the
-    incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-    to select the group of existing pods which pods will be taken into consideration
-    for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-    pod labels will be ignored. The default value is empty.
-    The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-    Also, matchLabelKeys cannot be set when labelSelector isn't set.
-    """
-    mismatch_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    MismatchLabelKeys is a set of pod label keys to select which pods will
-    be taken into consideration. The keys are used to lookup values from the
-    incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-    to select the group of existing pods which pods will be taken into consideration
-    for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-    pod labels will be ignored. The default value is empty.
-    The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-    Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-    """
-    namespace_selector: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs']]]
-    namespaces: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    namespaces specifies a static list of namespace names that the term applies to.
-    The term is applied to the union of the namespaces listed in this field
-    and the ones selected by namespaceSelector.
-    null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-    """
-    topology_key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-    the labelSelector in the specified namespaces, where co-located is defined as running on a node
-    whose value of the label with key topologyKey matches that of any node on which any of the
-    selected pods is running.
-    Empty topologyKey is not allowed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs:
-    def __init__(__self__, *,
-                 label_selector: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs']] = None,
-                 match_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 mismatch_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 namespace_selector: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs']] = None,
-                 namespaces: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 topology_key: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Defines a set of pods (namely those matching the labelSelector
-        relative to the given namespace(s)) that this pod should be
-        co-located (affinity) or not co-located (anti-affinity) with,
-        where co-located is defined as running on a node whose value of
-        the label with key <topologyKey> matches that of any node on which
-        a pod of the set of pods is running
-
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] match_label_keys: MatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-               Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] mismatch_label_keys: MismatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-               Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] namespaces: namespaces specifies a static list of namespace names that the term applies to.
-               The term is applied to the union of the namespaces listed in this field
-               and the ones selected by namespaceSelector.
-               null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        :param pulumi.Input[_builtins.str] topology_key: This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-               the labelSelector in the specified namespaces, where co-located is defined as running on a node
-               whose value of the label with key topologyKey matches that of any node on which any of the
-               selected pods is running.
-               Empty topologyKey is not allowed.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if mismatch_label_keys is not None:
-            pulumi.set(__self__, "mismatch_label_keys", mismatch_label_keys)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if namespaces is not None:
-            pulumi.set(__self__, "namespaces", namespaces)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs']]:
-        return pulumi.get(self, "label_selector")
-
-    @label_selector.setter
-    def label_selector(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs']]):
-        pulumi.set(self, "label_selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-        Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @match_label_keys.setter
-    def match_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_label_keys", value)
-
-    @_builtins.property
-    @pulumi.getter(name="mismatchLabelKeys")
-    def mismatch_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        MismatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-        Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "mismatch_label_keys")
-
-    @mismatch_label_keys.setter
-    def mismatch_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "mismatch_label_keys", value)
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs']]:
-        return pulumi.get(self, "namespace_selector")
-
-    @namespace_selector.setter
-    def namespace_selector(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs']]):
-        pulumi.set(self, "namespace_selector", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def namespaces(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        namespaces specifies a static list of namespace names that the term applies to.
-        The term is applied to the union of the namespaces listed in this field
-        and the ones selected by namespaceSelector.
-        null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        """
-        return pulumi.get(self, "namespaces")
-
-    @namespaces.setter
-    def namespaces(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "namespaces", value)
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-        the labelSelector in the specified namespaces, where co-located is defined as running on a node
-        whose value of the label with key topologyKey matches that of any node on which any of the
-        selected pods is running.
-        Empty topologyKey is not allowed.
-        """
-        return pulumi.get(self, "topology_key")
-
-    @topology_key.setter
-    def topology_key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "topology_key", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict(TypedDict):
-    """
-    Defines a set of pods (namely those matching the labelSelector
-    relative to the given namespace(s)) that this pod should be
-    co-located (affinity) or not co-located (anti-affinity) with,
-    where co-located is defined as running on a node whose value of
-    the label with key <topologyKey> matches that of any node on which
-    a pod of the set of pods is running
-    """
-    label_selector: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs']]]
-    match_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    MatchLabelKeys is a set of pod label keys to select which pods will
-    be taken into consideration. The keys are used to lookup values from the
-    incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-    to select the group of existing pods which pods will be taken into consideration
-    for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-    pod labels will be ignored. The default value is empty.
-    The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-    Also, matchLabelKeys cannot be set when labelSelector isn't set.
-    """
-    mismatch_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    MismatchLabelKeys is a set of pod label keys to select which pods will
-    be taken into consideration. The keys are used to lookup values from the
-    incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-    to select the group of existing pods which pods will be taken into consideration
-    for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-    pod labels will be ignored. The default value is empty.
-    The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-    Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-    """
-    namespace_selector: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs']]]
-    namespaces: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    namespaces specifies a static list of namespace names that the term applies to.
-    The term is applied to the union of the namespaces listed in this field
-    and the ones selected by namespaceSelector.
-    null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-    """
-    topology_key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-    the labelSelector in the specified namespaces, where co-located is defined as running on a node
-    whose value of the label with key topologyKey matches that of any node on which any of the
-    selected pods is running.
-    Empty topologyKey is not allowed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs:
-    def __init__(__self__, *,
-                 label_selector: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs']] = None,
-                 match_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 mismatch_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 namespace_selector: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs']] = None,
-                 namespaces: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 topology_key: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Defines a set of pods (namely those matching the labelSelector
-        relative to the given namespace(s)) that this pod should be
-        co-located (affinity) or not co-located (anti-affinity) with,
-        where co-located is defined as running on a node whose value of
-        the label with key <topologyKey> matches that of any node on which
-        a pod of the set of pods is running
-
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] match_label_keys: MatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-               Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] mismatch_label_keys: MismatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-               Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] namespaces: namespaces specifies a static list of namespace names that the term applies to.
-               The term is applied to the union of the namespaces listed in this field
-               and the ones selected by namespaceSelector.
-               null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        :param pulumi.Input[_builtins.str] topology_key: This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-               the labelSelector in the specified namespaces, where co-located is defined as running on a node
-               whose value of the label with key topologyKey matches that of any node on which any of the
-               selected pods is running.
-               Empty topologyKey is not allowed.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if mismatch_label_keys is not None:
-            pulumi.set(__self__, "mismatch_label_keys", mismatch_label_keys)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if namespaces is not None:
-            pulumi.set(__self__, "namespaces", namespaces)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs']]:
-        return pulumi.get(self, "label_selector")
-
-    @label_selector.setter
-    def label_selector(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs']]):
-        pulumi.set(self, "label_selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-        Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @match_label_keys.setter
-    def match_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_label_keys", value)
-
-    @_builtins.property
-    @pulumi.getter(name="mismatchLabelKeys")
-    def mismatch_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        MismatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-        Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "mismatch_label_keys")
-
-    @mismatch_label_keys.setter
-    def mismatch_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "mismatch_label_keys", value)
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs']]:
-        return pulumi.get(self, "namespace_selector")
-
-    @namespace_selector.setter
-    def namespace_selector(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs']]):
-        pulumi.set(self, "namespace_selector", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def namespaces(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        namespaces specifies a static list of namespace names that the term applies to.
-        The term is applied to the union of the namespaces listed in this field
-        and the ones selected by namespaceSelector.
-        null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        """
-        return pulumi.get(self, "namespaces")
-
-    @namespaces.setter
-    def namespaces(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "namespaces", value)
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-        the labelSelector in the specified namespaces, where co-located is defined as running on a node
-        whose value of the label with key topologyKey matches that of any node on which any of the
-        selected pods is running.
-        Empty topologyKey is not allowed.
-        """
-        return pulumi.get(self, "topology_key")
-
-    @topology_key.setter
-    def topology_key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "topology_key", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityArgsDict(TypedDict):
-    """
-    Describes pod anti-affinity scheduling rules (e.g. avoid putting this pod in the same node, zone, etc. as some other pod(s)).
-    """
-    preferred_during_scheduling_ignored_during_execution: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]]]]
-    """
-    The scheduler will prefer to schedule pods to nodes that satisfy
-    the anti-affinity expressions specified by this field, but it may choose
-    a node that violates one or more of the expressions. The node that is
-    most preferred is the one with the greatest sum of weights, i.e.
-    for each node that meets all of the scheduling requirements (resource
-    request, requiredDuringScheduling anti-affinity expressions, etc.),
-    compute a sum by iterating through the elements of this field and subtracting
-    "weight" from the sum if the node has pods which matches the corresponding podAffinityTerm; the
-    node(s) with the highest sum are the most preferred.
-    """
-    required_during_scheduling_ignored_during_execution: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']]]]]
-    """
-    If the anti-affinity requirements specified by this field are not met at
-    scheduling time, the pod will not be scheduled onto the node.
-    If the anti-affinity requirements specified by this field cease to be met
-    at some point during pod execution (e.g. due to a pod label update), the
-    system may or may not try to eventually evict the pod from its node.
-    When there are multiple elements, the lists of nodes corresponding to each
-    podAffinityTerm are intersected, i.e. all terms must be satisfied.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityArgs:
-    def __init__(__self__, *,
-                 preferred_during_scheduling_ignored_during_execution: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]]] = None,
-                 required_during_scheduling_ignored_during_execution: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']]]] = None):
-        """
-        Describes pod anti-affinity scheduling rules (e.g. avoid putting this pod in the same node, zone, etc. as some other pod(s)).
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]] preferred_during_scheduling_ignored_during_execution: The scheduler will prefer to schedule pods to nodes that satisfy
-               the anti-affinity expressions specified by this field, but it may choose
-               a node that violates one or more of the expressions. The node that is
-               most preferred is the one with the greatest sum of weights, i.e.
-               for each node that meets all of the scheduling requirements (resource
-               request, requiredDuringScheduling anti-affinity expressions, etc.),
-               compute a sum by iterating through the elements of this field and subtracting
-               "weight" from the sum if the node has pods which matches the corresponding podAffinityTerm; the
-               node(s) with the highest sum are the most preferred.
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']]] required_during_scheduling_ignored_during_execution: If the anti-affinity requirements specified by this field are not met at
-               scheduling time, the pod will not be scheduled onto the node.
-               If the anti-affinity requirements specified by this field cease to be met
-               at some point during pod execution (e.g. due to a pod label update), the
-               system may or may not try to eventually evict the pod from its node.
-               When there are multiple elements, the lists of nodes corresponding to each
-               podAffinityTerm are intersected, i.e. all terms must be satisfied.
-        """
-        if preferred_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "preferred_during_scheduling_ignored_during_execution", preferred_during_scheduling_ignored_during_execution)
-        if required_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "required_during_scheduling_ignored_during_execution", required_during_scheduling_ignored_during_execution)
-
-    @_builtins.property
-    @pulumi.getter(name="preferredDuringSchedulingIgnoredDuringExecution")
-    def preferred_during_scheduling_ignored_during_execution(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]]]:
-        """
-        The scheduler will prefer to schedule pods to nodes that satisfy
-        the anti-affinity expressions specified by this field, but it may choose
-        a node that violates one or more of the expressions. The node that is
-        most preferred is the one with the greatest sum of weights, i.e.
-        for each node that meets all of the scheduling requirements (resource
-        request, requiredDuringScheduling anti-affinity expressions, etc.),
-        compute a sum by iterating through the elements of this field and subtracting
-        "weight" from the sum if the node has pods which matches the corresponding podAffinityTerm; the
-        node(s) with the highest sum are the most preferred.
-        """
-        return pulumi.get(self, "preferred_during_scheduling_ignored_during_execution")
-
-    @preferred_during_scheduling_ignored_during_execution.setter
-    def preferred_during_scheduling_ignored_during_execution(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]]]):
-        pulumi.set(self, "preferred_during_scheduling_ignored_during_execution", value)
-
-    @_builtins.property
-    @pulumi.getter(name="requiredDuringSchedulingIgnoredDuringExecution")
-    def required_during_scheduling_ignored_during_execution(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']]]]:
-        """
-        If the anti-affinity requirements specified by this field are not met at
-        scheduling time, the pod will not be scheduled onto the node.
-        If the anti-affinity requirements specified by this field cease to be met
-        at some point during pod execution (e.g. due to a pod label update), the
-        system may or may not try to eventually evict the pod from its node.
-        When there are multiple elements, the lists of nodes corresponding to each
-        podAffinityTerm are intersected, i.e. all terms must be satisfied.
-        """
-        return pulumi.get(self, "required_during_scheduling_ignored_during_execution")
-
-    @required_during_scheduling_ignored_during_execution.setter
-    def required_during_scheduling_ignored_during_execution(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']]]]):
-        pulumi.set(self, "required_during_scheduling_ignored_during_execution", value)
-
-
-class ProxyClassSpecStatefulSetPodAffinityArgsDict(TypedDict):
-    """
-    Proxy Pod's affinity rules.
-    By default, the Tailscale Kubernetes operator does not apply any affinity rules.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#affinity
-    """
-    node_affinity: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityArgs']]]
-    pod_affinity: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityArgs']]]
-    pod_anti_affinity: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodAffinityArgs:
-    def __init__(__self__, *,
-                 node_affinity: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityArgs']] = None,
-                 pod_affinity: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityArgs']] = None,
-                 pod_anti_affinity: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityArgs']] = None):
-        """
-        Proxy Pod's affinity rules.
-        By default, the Tailscale Kubernetes operator does not apply any affinity rules.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#affinity
-        """
-        if node_affinity is not None:
-            pulumi.set(__self__, "node_affinity", node_affinity)
-        if pod_affinity is not None:
-            pulumi.set(__self__, "pod_affinity", pod_affinity)
-        if pod_anti_affinity is not None:
-            pulumi.set(__self__, "pod_anti_affinity", pod_anti_affinity)
-
-    @_builtins.property
-    @pulumi.getter(name="nodeAffinity")
-    def node_affinity(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityArgs']]:
-        return pulumi.get(self, "node_affinity")
-
-    @node_affinity.setter
-    def node_affinity(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityNodeAffinityArgs']]):
-        pulumi.set(self, "node_affinity", value)
-
-    @_builtins.property
-    @pulumi.getter(name="podAffinity")
-    def pod_affinity(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityArgs']]:
-        return pulumi.get(self, "pod_affinity")
-
-    @pod_affinity.setter
-    def pod_affinity(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAffinityArgs']]):
-        pulumi.set(self, "pod_affinity", value)
-
-    @_builtins.property
-    @pulumi.getter(name="podAntiAffinity")
-    def pod_anti_affinity(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityArgs']]:
-        return pulumi.get(self, "pod_anti_affinity")
-
-    @pod_anti_affinity.setter
-    def pod_anti_affinity(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityArgs']]):
-        pulumi.set(self, "pod_anti_affinity", value)
-
-
-class ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgsDict(TypedDict):
-    """
-    PodDNSConfigOption defines DNS resolver options of a pod.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name is this DNS resolver option's name.
-    Required.
-    """
-    value: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Value is this DNS resolver option's value.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgs:
-    def __init__(__self__, *,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 value: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        PodDNSConfigOption defines DNS resolver options of a pod.
-
-        :param pulumi.Input[_builtins.str] name: Name is this DNS resolver option's name.
-               Required.
-        :param pulumi.Input[_builtins.str] value: Value is this DNS resolver option's value.
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name is this DNS resolver option's name.
-        Required.
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Value is this DNS resolver option's value.
-        """
-        return pulumi.get(self, "value")
-
-    @value.setter
-    def value(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "value", value)
-
-
-class ProxyClassSpecStatefulSetPodDnsConfigOptionsArgsDict(TypedDict):
-    """
-    PodDNSConfigOption defines DNS resolver options of a pod.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name is this DNS resolver option's name.
-    Required.
-    """
-    value: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Value is this DNS resolver option's value.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs:
-    def __init__(__self__, *,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 value: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        PodDNSConfigOption defines DNS resolver options of a pod.
-
-        :param pulumi.Input[_builtins.str] name: Name is this DNS resolver option's name.
-               Required.
-        :param pulumi.Input[_builtins.str] value: Value is this DNS resolver option's value.
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name is this DNS resolver option's name.
-        Required.
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Value is this DNS resolver option's value.
-        """
-        return pulumi.get(self, "value")
-
-    @value.setter
-    def value(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "value", value)
-
-
-class ProxyClassSpecStatefulSetPodDnsConfigPatchArgsDict(TypedDict):
-    """
-    DNSConfig defines DNS parameters for the proxy Pod in addition to those generated from DNSPolicy.
-    When DNSPolicy is set to "None", DNSConfig must be specified.
-    https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-dns-config
-    """
-    nameservers: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    A list of DNS name server IP addresses.
-    This will be appended to the base nameservers generated from DNSPolicy.
-    Duplicated nameservers will be removed.
-    """
-    options: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgs']]]]]
-    """
-    A list of DNS resolver options.
-    This will be merged with the base options generated from DNSPolicy.
-    Duplicated entries will be removed. Resolution options given in Options
-    will override those that appear in the base DNSPolicy.
-    """
-    searches: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    A list of DNS search domains for host-name lookup.
-    This will be appended to the base search paths generated from DNSPolicy.
-    Duplicated search paths will be removed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodDnsConfigPatchArgs:
-    def __init__(__self__, *,
-                 nameservers: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 options: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgs']]]] = None,
-                 searches: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        DNSConfig defines DNS parameters for the proxy Pod in addition to those generated from DNSPolicy.
-        When DNSPolicy is set to "None", DNSConfig must be specified.
-        https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-dns-config
-
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] nameservers: A list of DNS name server IP addresses.
-               This will be appended to the base nameservers generated from DNSPolicy.
-               Duplicated nameservers will be removed.
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgs']]] options: A list of DNS resolver options.
-               This will be merged with the base options generated from DNSPolicy.
-               Duplicated entries will be removed. Resolution options given in Options
-               will override those that appear in the base DNSPolicy.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] searches: A list of DNS search domains for host-name lookup.
-               This will be appended to the base search paths generated from DNSPolicy.
-               Duplicated search paths will be removed.
-        """
-        if nameservers is not None:
-            pulumi.set(__self__, "nameservers", nameservers)
-        if options is not None:
-            pulumi.set(__self__, "options", options)
-        if searches is not None:
-            pulumi.set(__self__, "searches", searches)
-
-    @_builtins.property
-    @pulumi.getter
-    def nameservers(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        A list of DNS name server IP addresses.
-        This will be appended to the base nameservers generated from DNSPolicy.
-        Duplicated nameservers will be removed.
-        """
-        return pulumi.get(self, "nameservers")
-
-    @nameservers.setter
-    def nameservers(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "nameservers", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def options(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgs']]]]:
-        """
-        A list of DNS resolver options.
-        This will be merged with the base options generated from DNSPolicy.
-        Duplicated entries will be removed. Resolution options given in Options
-        will override those that appear in the base DNSPolicy.
-        """
-        return pulumi.get(self, "options")
-
-    @options.setter
-    def options(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgs']]]]):
-        pulumi.set(self, "options", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def searches(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        A list of DNS search domains for host-name lookup.
-        This will be appended to the base search paths generated from DNSPolicy.
-        Duplicated search paths will be removed.
-        """
-        return pulumi.get(self, "searches")
-
-    @searches.setter
-    def searches(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "searches", value)
-
-
-class ProxyClassSpecStatefulSetPodDnsConfigArgsDict(TypedDict):
-    """
-    DNSConfig defines DNS parameters for the proxy Pod in addition to those generated from DNSPolicy.
-    When DNSPolicy is set to "None", DNSConfig must be specified.
-    https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-dns-config
-    """
-    nameservers: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    A list of DNS name server IP addresses.
-    This will be appended to the base nameservers generated from DNSPolicy.
-    Duplicated nameservers will be removed.
-    """
-    options: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs']]]]]
-    """
-    A list of DNS resolver options.
-    This will be merged with the base options generated from DNSPolicy.
-    Duplicated entries will be removed. Resolution options given in Options
-    will override those that appear in the base DNSPolicy.
-    """
-    searches: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    A list of DNS search domains for host-name lookup.
-    This will be appended to the base search paths generated from DNSPolicy.
-    Duplicated search paths will be removed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodDnsConfigArgs:
-    def __init__(__self__, *,
-                 nameservers: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 options: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs']]]] = None,
-                 searches: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        DNSConfig defines DNS parameters for the proxy Pod in addition to those generated from DNSPolicy.
-        When DNSPolicy is set to "None", DNSConfig must be specified.
-        https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-dns-config
-
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] nameservers: A list of DNS name server IP addresses.
-               This will be appended to the base nameservers generated from DNSPolicy.
-               Duplicated nameservers will be removed.
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs']]] options: A list of DNS resolver options.
-               This will be merged with the base options generated from DNSPolicy.
-               Duplicated entries will be removed. Resolution options given in Options
-               will override those that appear in the base DNSPolicy.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] searches: A list of DNS search domains for host-name lookup.
-               This will be appended to the base search paths generated from DNSPolicy.
-               Duplicated search paths will be removed.
-        """
-        if nameservers is not None:
-            pulumi.set(__self__, "nameservers", nameservers)
-        if options is not None:
-            pulumi.set(__self__, "options", options)
-        if searches is not None:
-            pulumi.set(__self__, "searches", searches)
-
-    @_builtins.property
-    @pulumi.getter
-    def nameservers(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        A list of DNS name server IP addresses.
-        This will be appended to the base nameservers generated from DNSPolicy.
-        Duplicated nameservers will be removed.
-        """
-        return pulumi.get(self, "nameservers")
-
-    @nameservers.setter
-    def nameservers(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "nameservers", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def options(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs']]]]:
-        """
-        A list of DNS resolver options.
-        This will be merged with the base options generated from DNSPolicy.
-        Duplicated entries will be removed. Resolution options given in Options
-        will override those that appear in the base DNSPolicy.
-        """
-        return pulumi.get(self, "options")
-
-    @options.setter
-    def options(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs']]]]):
-        pulumi.set(self, "options", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def searches(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        A list of DNS search domains for host-name lookup.
-        This will be appended to the base search paths generated from DNSPolicy.
-        Duplicated search paths will be removed.
-        """
-        return pulumi.get(self, "searches")
-
-    @searches.setter
-    def searches(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "searches", value)
-
-
-class ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgsDict(TypedDict):
-    """
-    LocalObjectReference contains enough information to let you locate the
-    referenced object inside the same namespace.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgs:
-    def __init__(__self__, *,
-                 name: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        LocalObjectReference contains enough information to let you locate the
-        referenced object inside the same namespace.
-
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-
-class ProxyClassSpecStatefulSetPodImagePullSecretsArgsDict(TypedDict):
-    """
-    LocalObjectReference contains enough information to let you locate the
-    referenced object inside the same namespace.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the referent.
-    This field is effectively required, but due to backwards compatibility is
-    allowed to be empty. Instances of this type with an empty value here are
-    almost certainly wrong.
-    More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodImagePullSecretsArgs:
-    def __init__(__self__, *,
-                 name: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        LocalObjectReference contains enough information to let you locate the
-        referenced object inside the same namespace.
-
-        :param pulumi.Input[_builtins.str] name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-
-class ProxyClassSpecStatefulSetPodPatchArgsDict(TypedDict):
-    """
-    Configuration for the proxy Pod.
-    """
-    affinity: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPatchArgs']]]
-    annotations: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    Annotations that will be added to the proxy Pod.
-    Any annotations specified here will be merged with the default
-    annotations applied to the Pod by the Tailscale Kubernetes operator.
-    Annotations must be valid Kubernetes annotations.
-    https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-    """
-    dns_config: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodDnsConfigPatchArgs']]]
-    dns_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    DNSPolicy defines how DNS will be configured for the proxy Pod.
-    By default the Tailscale Kubernetes Operator does not set a DNS policy (uses cluster default).
-    https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-s-dns-policy
-    """
-    image_pull_secrets: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgs']]]]]
-    """
-    Proxy Pod's image pull Secrets.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#PodSpec
-    """
-    labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    Labels that will be added to the proxy Pod.
-    Any labels specified here will be merged with the default labels
-    applied to the Pod by the Tailscale Kubernetes operator.
-    Label keys and values must be valid Kubernetes label keys and values.
-    https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-    """
-    node_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Proxy Pod's node name.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-    """
-    node_selector: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    Proxy Pod's node selector.
-    By default Tailscale Kubernetes operator does not apply any node
-    selector.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-    """
-    priority_class_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    PriorityClassName for the proxy Pod.
-    By default Tailscale Kubernetes operator does not apply any priority class.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-    """
-    security_context: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextPatchArgs']]]
-    tailscale_container: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerPatchArgs']]]
-    tailscale_init_container: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerPatchArgs']]]
-    tolerations: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTolerationsPatchArgs']]]]]
-    """
-    Proxy Pod's tolerations.
-    By default Tailscale Kubernetes operator does not apply any
-    tolerations.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-    """
-    topology_spread_constraints: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgs']]]]]
-    """
-    Proxy Pod's topology spread constraints.
-    By default Tailscale Kubernetes operator does not apply any topology spread constraints.
-    https://kubernetes.io/docs/concepts/scheduling-eviction/topology-spread-constraints/
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodPatchArgs:
-    def __init__(__self__, *,
-                 affinity: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPatchArgs']] = None,
-                 annotations: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 dns_config: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodDnsConfigPatchArgs']] = None,
-                 dns_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 image_pull_secrets: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgs']]]] = None,
-                 labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 node_name: pulumi.Input[Optional[_builtins.str]] = None,
-                 node_selector: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 priority_class_name: pulumi.Input[Optional[_builtins.str]] = None,
-                 security_context: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextPatchArgs']] = None,
-                 tailscale_container: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerPatchArgs']] = None,
-                 tailscale_init_container: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerPatchArgs']] = None,
-                 tolerations: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTolerationsPatchArgs']]]] = None,
-                 topology_spread_constraints: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgs']]]] = None):
-        """
-        Configuration for the proxy Pod.
-
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] annotations: Annotations that will be added to the proxy Pod.
-               Any annotations specified here will be merged with the default
-               annotations applied to the Pod by the Tailscale Kubernetes operator.
-               Annotations must be valid Kubernetes annotations.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-        :param pulumi.Input[_builtins.str] dns_policy: DNSPolicy defines how DNS will be configured for the proxy Pod.
-               By default the Tailscale Kubernetes Operator does not set a DNS policy (uses cluster default).
-               https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-s-dns-policy
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgs']]] image_pull_secrets: Proxy Pod's image pull Secrets.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#PodSpec
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] labels: Labels that will be added to the proxy Pod.
-               Any labels specified here will be merged with the default labels
-               applied to the Pod by the Tailscale Kubernetes operator.
-               Label keys and values must be valid Kubernetes label keys and values.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        :param pulumi.Input[_builtins.str] node_name: Proxy Pod's node name.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] node_selector: Proxy Pod's node selector.
-               By default Tailscale Kubernetes operator does not apply any node
-               selector.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        :param pulumi.Input[_builtins.str] priority_class_name: PriorityClassName for the proxy Pod.
-               By default Tailscale Kubernetes operator does not apply any priority class.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTolerationsPatchArgs']]] tolerations: Proxy Pod's tolerations.
-               By default Tailscale Kubernetes operator does not apply any
-               tolerations.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgs']]] topology_spread_constraints: Proxy Pod's topology spread constraints.
-               By default Tailscale Kubernetes operator does not apply any topology spread constraints.
-               https://kubernetes.io/docs/concepts/scheduling-eviction/topology-spread-constraints/
-        """
-        if affinity is not None:
-            pulumi.set(__self__, "affinity", affinity)
-        if annotations is not None:
-            pulumi.set(__self__, "annotations", annotations)
-        if dns_config is not None:
-            pulumi.set(__self__, "dns_config", dns_config)
-        if dns_policy is not None:
-            pulumi.set(__self__, "dns_policy", dns_policy)
-        if image_pull_secrets is not None:
-            pulumi.set(__self__, "image_pull_secrets", image_pull_secrets)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-        if node_name is not None:
-            pulumi.set(__self__, "node_name", node_name)
-        if node_selector is not None:
-            pulumi.set(__self__, "node_selector", node_selector)
-        if priority_class_name is not None:
-            pulumi.set(__self__, "priority_class_name", priority_class_name)
-        if security_context is not None:
-            pulumi.set(__self__, "security_context", security_context)
-        if tailscale_container is not None:
-            pulumi.set(__self__, "tailscale_container", tailscale_container)
-        if tailscale_init_container is not None:
-            pulumi.set(__self__, "tailscale_init_container", tailscale_init_container)
-        if tolerations is not None:
-            pulumi.set(__self__, "tolerations", tolerations)
-        if topology_spread_constraints is not None:
-            pulumi.set(__self__, "topology_spread_constraints", topology_spread_constraints)
-
-    @_builtins.property
-    @pulumi.getter
-    def affinity(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPatchArgs']]:
-        return pulumi.get(self, "affinity")
-
-    @affinity.setter
-    def affinity(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityPatchArgs']]):
-        pulumi.set(self, "affinity", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def annotations(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        Annotations that will be added to the proxy Pod.
-        Any annotations specified here will be merged with the default
-        annotations applied to the Pod by the Tailscale Kubernetes operator.
-        Annotations must be valid Kubernetes annotations.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-        """
-        return pulumi.get(self, "annotations")
-
-    @annotations.setter
-    def annotations(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "annotations", value)
-
-    @_builtins.property
-    @pulumi.getter(name="dnsConfig")
-    def dns_config(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodDnsConfigPatchArgs']]:
-        return pulumi.get(self, "dns_config")
-
-    @dns_config.setter
-    def dns_config(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodDnsConfigPatchArgs']]):
-        pulumi.set(self, "dns_config", value)
-
-    @_builtins.property
-    @pulumi.getter(name="dnsPolicy")
-    def dns_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        DNSPolicy defines how DNS will be configured for the proxy Pod.
-        By default the Tailscale Kubernetes Operator does not set a DNS policy (uses cluster default).
-        https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-s-dns-policy
-        """
-        return pulumi.get(self, "dns_policy")
-
-    @dns_policy.setter
-    def dns_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "dns_policy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="imagePullSecrets")
-    def image_pull_secrets(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgs']]]]:
-        """
-        Proxy Pod's image pull Secrets.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#PodSpec
-        """
-        return pulumi.get(self, "image_pull_secrets")
-
-    @image_pull_secrets.setter
-    def image_pull_secrets(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgs']]]]):
-        pulumi.set(self, "image_pull_secrets", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        Labels that will be added to the proxy Pod.
-        Any labels specified here will be merged with the default labels
-        applied to the Pod by the Tailscale Kubernetes operator.
-        Label keys and values must be valid Kubernetes label keys and values.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        return pulumi.get(self, "labels")
-
-    @labels.setter
-    def labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="nodeName")
-    def node_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Proxy Pod's node name.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        """
-        return pulumi.get(self, "node_name")
-
-    @node_name.setter
-    def node_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "node_name", value)
-
-    @_builtins.property
-    @pulumi.getter(name="nodeSelector")
-    def node_selector(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        Proxy Pod's node selector.
-        By default Tailscale Kubernetes operator does not apply any node
-        selector.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        """
-        return pulumi.get(self, "node_selector")
-
-    @node_selector.setter
-    def node_selector(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "node_selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="priorityClassName")
-    def priority_class_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        PriorityClassName for the proxy Pod.
-        By default Tailscale Kubernetes operator does not apply any priority class.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        """
-        return pulumi.get(self, "priority_class_name")
-
-    @priority_class_name.setter
-    def priority_class_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "priority_class_name", value)
-
-    @_builtins.property
-    @pulumi.getter(name="securityContext")
-    def security_context(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextPatchArgs']]:
-        return pulumi.get(self, "security_context")
-
-    @security_context.setter
-    def security_context(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextPatchArgs']]):
-        pulumi.set(self, "security_context", value)
-
-    @_builtins.property
-    @pulumi.getter(name="tailscaleContainer")
-    def tailscale_container(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerPatchArgs']]:
-        return pulumi.get(self, "tailscale_container")
-
-    @tailscale_container.setter
-    def tailscale_container(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerPatchArgs']]):
-        pulumi.set(self, "tailscale_container", value)
-
-    @_builtins.property
-    @pulumi.getter(name="tailscaleInitContainer")
-    def tailscale_init_container(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerPatchArgs']]:
-        return pulumi.get(self, "tailscale_init_container")
-
-    @tailscale_init_container.setter
-    def tailscale_init_container(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerPatchArgs']]):
-        pulumi.set(self, "tailscale_init_container", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def tolerations(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTolerationsPatchArgs']]]]:
-        """
-        Proxy Pod's tolerations.
-        By default Tailscale Kubernetes operator does not apply any
-        tolerations.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        """
-        return pulumi.get(self, "tolerations")
-
-    @tolerations.setter
-    def tolerations(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTolerationsPatchArgs']]]]):
-        pulumi.set(self, "tolerations", value)
-
-    @_builtins.property
-    @pulumi.getter(name="topologySpreadConstraints")
-    def topology_spread_constraints(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgs']]]]:
-        """
-        Proxy Pod's topology spread constraints.
-        By default Tailscale Kubernetes operator does not apply any topology spread constraints.
-        https://kubernetes.io/docs/concepts/scheduling-eviction/topology-spread-constraints/
-        """
-        return pulumi.get(self, "topology_spread_constraints")
-
-    @topology_spread_constraints.setter
-    def topology_spread_constraints(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgs']]]]):
-        pulumi.set(self, "topology_spread_constraints", value)
-
-
-class ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgsDict(TypedDict):
-    """
-    appArmorProfile is the AppArmor options to use by the containers in this pod.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    localhost_profile: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    localhostProfile indicates a profile loaded on the node that should be used.
-    The profile must be preconfigured on the node to work.
-    Must match the loaded name of the profile.
-    Must be set if and only if type is "Localhost".
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type indicates which kind of AppArmor profile will be applied.
-    Valid options are:
-      Localhost - a profile pre-loaded on the node.
-      RuntimeDefault - the container runtime's default profile.
-      Unconfined - no AppArmor enforcement.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgs:
-    def __init__(__self__, *,
-                 localhost_profile: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        appArmorProfile is the AppArmor options to use by the containers in this pod.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[_builtins.str] localhost_profile: localhostProfile indicates a profile loaded on the node that should be used.
-               The profile must be preconfigured on the node to work.
-               Must match the loaded name of the profile.
-               Must be set if and only if type is "Localhost".
-        :param pulumi.Input[_builtins.str] type: type indicates which kind of AppArmor profile will be applied.
-               Valid options are:
-                 Localhost - a profile pre-loaded on the node.
-                 RuntimeDefault - the container runtime's default profile.
-                 Unconfined - no AppArmor enforcement.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        localhostProfile indicates a profile loaded on the node that should be used.
-        The profile must be preconfigured on the node to work.
-        Must match the loaded name of the profile.
-        Must be set if and only if type is "Localhost".
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @localhost_profile.setter
-    def localhost_profile(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "localhost_profile", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type indicates which kind of AppArmor profile will be applied.
-        Valid options are:
-          Localhost - a profile pre-loaded on the node.
-          RuntimeDefault - the container runtime's default profile.
-          Unconfined - no AppArmor enforcement.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgsDict(TypedDict):
-    """
-    appArmorProfile is the AppArmor options to use by the containers in this pod.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    localhost_profile: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    localhostProfile indicates a profile loaded on the node that should be used.
-    The profile must be preconfigured on the node to work.
-    Must match the loaded name of the profile.
-    Must be set if and only if type is "Localhost".
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type indicates which kind of AppArmor profile will be applied.
-    Valid options are:
-      Localhost - a profile pre-loaded on the node.
-      RuntimeDefault - the container runtime's default profile.
-      Unconfined - no AppArmor enforcement.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgs:
-    def __init__(__self__, *,
-                 localhost_profile: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        appArmorProfile is the AppArmor options to use by the containers in this pod.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[_builtins.str] localhost_profile: localhostProfile indicates a profile loaded on the node that should be used.
-               The profile must be preconfigured on the node to work.
-               Must match the loaded name of the profile.
-               Must be set if and only if type is "Localhost".
-        :param pulumi.Input[_builtins.str] type: type indicates which kind of AppArmor profile will be applied.
-               Valid options are:
-                 Localhost - a profile pre-loaded on the node.
-                 RuntimeDefault - the container runtime's default profile.
-                 Unconfined - no AppArmor enforcement.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        localhostProfile indicates a profile loaded on the node that should be used.
-        The profile must be preconfigured on the node to work.
-        Must match the loaded name of the profile.
-        Must be set if and only if type is "Localhost".
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @localhost_profile.setter
-    def localhost_profile(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "localhost_profile", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type indicates which kind of AppArmor profile will be applied.
-        Valid options are:
-          Localhost - a profile pre-loaded on the node.
-          RuntimeDefault - the container runtime's default profile.
-          Unconfined - no AppArmor enforcement.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class ProxyClassSpecStatefulSetPodSecurityContextPatchArgsDict(TypedDict):
-    """
-    Proxy Pod's security context.
-    By default Tailscale Kubernetes operator does not apply any Pod
-    security context.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context-2
-    """
-    app_armor_profile: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgs']]]
-    fs_group: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    A special supplemental group that applies to all containers in a pod.
-    Some volume types allow the Kubelet to change the ownership of that volume
-    to be owned by the pod:
-
-    1. The owning GID will be the FSGroup
-    2. The setgid bit is set (new files created in the volume will be owned by FSGroup)
-    3. The permission bits are OR'd with rw-rw----
-
-    If unset, the Kubelet will not modify the ownership and permissions of any volume.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    fs_group_change_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    fsGroupChangePolicy defines behavior of changing ownership and permission of the volume
-    before being exposed inside Pod. This field will only apply to
-    volume types which support fsGroup based ownership(and permissions).
-    It will have no effect on ephemeral volume types such as: secret, configmaps
-    and emptydir.
-    Valid values are "OnRootMismatch" and "Always". If not specified, "Always" is used.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    run_as_group: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    The GID to run the entrypoint of the container process.
-    Uses runtime default if unset.
-    May also be set in SecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence
-    for that container.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    run_as_non_root: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Indicates that the container must run as a non-root user.
-    If true, the Kubelet will validate the image at runtime to ensure that it
-    does not run as UID 0 (root) and fail to start the container if it does.
-    If unset or false, no such validation will be performed.
-    May also be set in SecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    """
-    run_as_user: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    The UID to run the entrypoint of the container process.
-    Defaults to user specified in image metadata if unspecified.
-    May also be set in SecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence
-    for that container.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    se_linux_change_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    seLinuxChangePolicy defines how the container's SELinux label is applied to all volumes used by the Pod.
-    It has no effect on nodes that do not support SELinux or to volumes does not support SELinux.
-    Valid values are "MountOption" and "Recursive".
-
-    "Recursive" means relabeling of all files on all Pod volumes by the container runtime.
-    This may be slow for large volumes, but allows mixing privileged and unprivileged Pods sharing the same volume on the same node.
-
-    "MountOption" mounts all eligible Pod volumes with `-o context` mount option.
-    This requires all Pods that share the same volume to use the same SELinux label.
-    It is not possible to share the same volume among privileged and unprivileged Pods.
-    Eligible volumes are in-tree FibreChannel and iSCSI volumes, and all CSI volumes
-    whose CSI driver announces SELinux support by setting spec.seLinuxMount: true in their
-    CSIDriver instance. Other volumes are always re-labelled recursively.
-    "MountOption" value is allowed only when SELinuxMount feature gate is enabled.
-
-    If not specified and SELinuxMount feature gate is enabled, "MountOption" is used.
-    If not specified and SELinuxMount feature gate is disabled, "MountOption" is used for ReadWriteOncePod volumes
-    and "Recursive" for all other volumes.
-
-    This field affects only Pods that have SELinux label set, either in PodSecurityContext or in SecurityContext of all containers.
-
-    All Pods that use the same volume should use the same seLinuxChangePolicy, otherwise some pods can get stuck in ContainerCreating state.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    se_linux_options: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgs']]]
-    seccomp_profile: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgs']]]
-    supplemental_groups: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.int]]]]]
-    """
-    A list of groups applied to the first process run in each container, in
-    addition to the container's primary GID and fsGroup (if specified).  If
-    the SupplementalGroupsPolicy feature is enabled, the
-    supplementalGroupsPolicy field determines whether these are in addition
-    to or instead of any group memberships defined in the container image.
-    If unspecified, no additional groups are added, though group memberships
-    defined in the container image may still be used, depending on the
-    supplementalGroupsPolicy field.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    supplemental_groups_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Defines how supplemental groups of the first container processes are calculated.
-    Valid values are "Merge" and "Strict". If not specified, "Merge" is used.
-    (Alpha) Using the field requires the SupplementalGroupsPolicy feature gate to be enabled
-    and the container runtime must implement support for this feature.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    sysctls: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs']]]]]
-    """
-    Sysctls hold a list of namespaced sysctls used for the pod. Pods with unsupported
-    sysctls (by the container runtime) might fail to launch.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    windows_options: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodSecurityContextPatchArgs:
-    def __init__(__self__, *,
-                 app_armor_profile: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgs']] = None,
-                 fs_group: pulumi.Input[Optional[_builtins.int]] = None,
-                 fs_group_change_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 run_as_group: pulumi.Input[Optional[_builtins.int]] = None,
-                 run_as_non_root: pulumi.Input[Optional[_builtins.bool]] = None,
-                 run_as_user: pulumi.Input[Optional[_builtins.int]] = None,
-                 se_linux_change_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 se_linux_options: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgs']] = None,
-                 seccomp_profile: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgs']] = None,
-                 supplemental_groups: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.int]]]] = None,
-                 supplemental_groups_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 sysctls: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs']]]] = None,
-                 windows_options: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgs']] = None):
-        """
-        Proxy Pod's security context.
-        By default Tailscale Kubernetes operator does not apply any Pod
-        security context.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context-2
-
-        :param pulumi.Input[_builtins.int] fs_group: A special supplemental group that applies to all containers in a pod.
-               Some volume types allow the Kubelet to change the ownership of that volume
-               to be owned by the pod:
-
-               1. The owning GID will be the FSGroup
-               2. The setgid bit is set (new files created in the volume will be owned by FSGroup)
-               3. The permission bits are OR'd with rw-rw----
-
-               If unset, the Kubelet will not modify the ownership and permissions of any volume.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.str] fs_group_change_policy: fsGroupChangePolicy defines behavior of changing ownership and permission of the volume
-               before being exposed inside Pod. This field will only apply to
-               volume types which support fsGroup based ownership(and permissions).
-               It will have no effect on ephemeral volume types such as: secret, configmaps
-               and emptydir.
-               Valid values are "OnRootMismatch" and "Always". If not specified, "Always" is used.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.int] run_as_group: The GID to run the entrypoint of the container process.
-               Uses runtime default if unset.
-               May also be set in SecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence
-               for that container.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.bool] run_as_non_root: Indicates that the container must run as a non-root user.
-               If true, the Kubelet will validate the image at runtime to ensure that it
-               does not run as UID 0 (root) and fail to start the container if it does.
-               If unset or false, no such validation will be performed.
-               May also be set in SecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        :param pulumi.Input[_builtins.int] run_as_user: The UID to run the entrypoint of the container process.
-               Defaults to user specified in image metadata if unspecified.
-               May also be set in SecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence
-               for that container.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.str] se_linux_change_policy: seLinuxChangePolicy defines how the container's SELinux label is applied to all volumes used by the Pod.
-               It has no effect on nodes that do not support SELinux or to volumes does not support SELinux.
-               Valid values are "MountOption" and "Recursive".
-
-               "Recursive" means relabeling of all files on all Pod volumes by the container runtime.
-               This may be slow for large volumes, but allows mixing privileged and unprivileged Pods sharing the same volume on the same node.
-
-               "MountOption" mounts all eligible Pod volumes with `-o context` mount option.
-               This requires all Pods that share the same volume to use the same SELinux label.
-               It is not possible to share the same volume among privileged and unprivileged Pods.
-               Eligible volumes are in-tree FibreChannel and iSCSI volumes, and all CSI volumes
-               whose CSI driver announces SELinux support by setting spec.seLinuxMount: true in their
-               CSIDriver instance. Other volumes are always re-labelled recursively.
-               "MountOption" value is allowed only when SELinuxMount feature gate is enabled.
-
-               If not specified and SELinuxMount feature gate is enabled, "MountOption" is used.
-               If not specified and SELinuxMount feature gate is disabled, "MountOption" is used for ReadWriteOncePod volumes
-               and "Recursive" for all other volumes.
-
-               This field affects only Pods that have SELinux label set, either in PodSecurityContext or in SecurityContext of all containers.
-
-               All Pods that use the same volume should use the same seLinuxChangePolicy, otherwise some pods can get stuck in ContainerCreating state.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.int]]] supplemental_groups: A list of groups applied to the first process run in each container, in
-               addition to the container's primary GID and fsGroup (if specified).  If
-               the SupplementalGroupsPolicy feature is enabled, the
-               supplementalGroupsPolicy field determines whether these are in addition
-               to or instead of any group memberships defined in the container image.
-               If unspecified, no additional groups are added, though group memberships
-               defined in the container image may still be used, depending on the
-               supplementalGroupsPolicy field.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.str] supplemental_groups_policy: Defines how supplemental groups of the first container processes are calculated.
-               Valid values are "Merge" and "Strict". If not specified, "Merge" is used.
-               (Alpha) Using the field requires the SupplementalGroupsPolicy feature gate to be enabled
-               and the container runtime must implement support for this feature.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs']]] sysctls: Sysctls hold a list of namespaced sysctls used for the pod. Pods with unsupported
-               sysctls (by the container runtime) might fail to launch.
-               Note that this field cannot be set when spec.os.name is windows.
-        """
-        if app_armor_profile is not None:
-            pulumi.set(__self__, "app_armor_profile", app_armor_profile)
-        if fs_group is not None:
-            pulumi.set(__self__, "fs_group", fs_group)
-        if fs_group_change_policy is not None:
-            pulumi.set(__self__, "fs_group_change_policy", fs_group_change_policy)
-        if run_as_group is not None:
-            pulumi.set(__self__, "run_as_group", run_as_group)
-        if run_as_non_root is not None:
-            pulumi.set(__self__, "run_as_non_root", run_as_non_root)
-        if run_as_user is not None:
-            pulumi.set(__self__, "run_as_user", run_as_user)
-        if se_linux_change_policy is not None:
-            pulumi.set(__self__, "se_linux_change_policy", se_linux_change_policy)
-        if se_linux_options is not None:
-            pulumi.set(__self__, "se_linux_options", se_linux_options)
-        if seccomp_profile is not None:
-            pulumi.set(__self__, "seccomp_profile", seccomp_profile)
-        if supplemental_groups is not None:
-            pulumi.set(__self__, "supplemental_groups", supplemental_groups)
-        if supplemental_groups_policy is not None:
-            pulumi.set(__self__, "supplemental_groups_policy", supplemental_groups_policy)
-        if sysctls is not None:
-            pulumi.set(__self__, "sysctls", sysctls)
-        if windows_options is not None:
-            pulumi.set(__self__, "windows_options", windows_options)
-
-    @_builtins.property
-    @pulumi.getter(name="appArmorProfile")
-    def app_armor_profile(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgs']]:
-        return pulumi.get(self, "app_armor_profile")
-
-    @app_armor_profile.setter
-    def app_armor_profile(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgs']]):
-        pulumi.set(self, "app_armor_profile", value)
-
-    @_builtins.property
-    @pulumi.getter(name="fsGroup")
-    def fs_group(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        A special supplemental group that applies to all containers in a pod.
-        Some volume types allow the Kubelet to change the ownership of that volume
-        to be owned by the pod:
-
-        1. The owning GID will be the FSGroup
-        2. The setgid bit is set (new files created in the volume will be owned by FSGroup)
-        3. The permission bits are OR'd with rw-rw----
-
-        If unset, the Kubelet will not modify the ownership and permissions of any volume.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "fs_group")
-
-    @fs_group.setter
-    def fs_group(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "fs_group", value)
-
-    @_builtins.property
-    @pulumi.getter(name="fsGroupChangePolicy")
-    def fs_group_change_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        fsGroupChangePolicy defines behavior of changing ownership and permission of the volume
-        before being exposed inside Pod. This field will only apply to
-        volume types which support fsGroup based ownership(and permissions).
-        It will have no effect on ephemeral volume types such as: secret, configmaps
-        and emptydir.
-        Valid values are "OnRootMismatch" and "Always". If not specified, "Always" is used.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "fs_group_change_policy")
-
-    @fs_group_change_policy.setter
-    def fs_group_change_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "fs_group_change_policy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsGroup")
-    def run_as_group(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        The GID to run the entrypoint of the container process.
-        Uses runtime default if unset.
-        May also be set in SecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence
-        for that container.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_group")
-
-    @run_as_group.setter
-    def run_as_group(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "run_as_group", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsNonRoot")
-    def run_as_non_root(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Indicates that the container must run as a non-root user.
-        If true, the Kubelet will validate the image at runtime to ensure that it
-        does not run as UID 0 (root) and fail to start the container if it does.
-        If unset or false, no such validation will be performed.
-        May also be set in SecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_non_root")
-
-    @run_as_non_root.setter
-    def run_as_non_root(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "run_as_non_root", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUser")
-    def run_as_user(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        The UID to run the entrypoint of the container process.
-        Defaults to user specified in image metadata if unspecified.
-        May also be set in SecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence
-        for that container.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_user")
-
-    @run_as_user.setter
-    def run_as_user(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "run_as_user", value)
-
-    @_builtins.property
-    @pulumi.getter(name="seLinuxChangePolicy")
-    def se_linux_change_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        seLinuxChangePolicy defines how the container's SELinux label is applied to all volumes used by the Pod.
-        It has no effect on nodes that do not support SELinux or to volumes does not support SELinux.
-        Valid values are "MountOption" and "Recursive".
-
-        "Recursive" means relabeling of all files on all Pod volumes by the container runtime.
-        This may be slow for large volumes, but allows mixing privileged and unprivileged Pods sharing the same volume on the same node.
-
-        "MountOption" mounts all eligible Pod volumes with `-o context` mount option.
-        This requires all Pods that share the same volume to use the same SELinux label.
-        It is not possible to share the same volume among privileged and unprivileged Pods.
-        Eligible volumes are in-tree FibreChannel and iSCSI volumes, and all CSI volumes
-        whose CSI driver announces SELinux support by setting spec.seLinuxMount: true in their
-        CSIDriver instance. Other volumes are always re-labelled recursively.
-        "MountOption" value is allowed only when SELinuxMount feature gate is enabled.
-
-        If not specified and SELinuxMount feature gate is enabled, "MountOption" is used.
-        If not specified and SELinuxMount feature gate is disabled, "MountOption" is used for ReadWriteOncePod volumes
-        and "Recursive" for all other volumes.
-
-        This field affects only Pods that have SELinux label set, either in PodSecurityContext or in SecurityContext of all containers.
-
-        All Pods that use the same volume should use the same seLinuxChangePolicy, otherwise some pods can get stuck in ContainerCreating state.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "se_linux_change_policy")
-
-    @se_linux_change_policy.setter
-    def se_linux_change_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "se_linux_change_policy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="seLinuxOptions")
-    def se_linux_options(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgs']]:
-        return pulumi.get(self, "se_linux_options")
-
-    @se_linux_options.setter
-    def se_linux_options(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgs']]):
-        pulumi.set(self, "se_linux_options", value)
-
-    @_builtins.property
-    @pulumi.getter(name="seccompProfile")
-    def seccomp_profile(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgs']]:
-        return pulumi.get(self, "seccomp_profile")
-
-    @seccomp_profile.setter
-    def seccomp_profile(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgs']]):
-        pulumi.set(self, "seccomp_profile", value)
-
-    @_builtins.property
-    @pulumi.getter(name="supplementalGroups")
-    def supplemental_groups(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.int]]]]:
-        """
-        A list of groups applied to the first process run in each container, in
-        addition to the container's primary GID and fsGroup (if specified).  If
-        the SupplementalGroupsPolicy feature is enabled, the
-        supplementalGroupsPolicy field determines whether these are in addition
-        to or instead of any group memberships defined in the container image.
-        If unspecified, no additional groups are added, though group memberships
-        defined in the container image may still be used, depending on the
-        supplementalGroupsPolicy field.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "supplemental_groups")
-
-    @supplemental_groups.setter
-    def supplemental_groups(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.int]]]]):
-        pulumi.set(self, "supplemental_groups", value)
-
-    @_builtins.property
-    @pulumi.getter(name="supplementalGroupsPolicy")
-    def supplemental_groups_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Defines how supplemental groups of the first container processes are calculated.
-        Valid values are "Merge" and "Strict". If not specified, "Merge" is used.
-        (Alpha) Using the field requires the SupplementalGroupsPolicy feature gate to be enabled
-        and the container runtime must implement support for this feature.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "supplemental_groups_policy")
-
-    @supplemental_groups_policy.setter
-    def supplemental_groups_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "supplemental_groups_policy", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def sysctls(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs']]]]:
-        """
-        Sysctls hold a list of namespaced sysctls used for the pod. Pods with unsupported
-        sysctls (by the container runtime) might fail to launch.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "sysctls")
-
-    @sysctls.setter
-    def sysctls(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs']]]]):
-        pulumi.set(self, "sysctls", value)
-
-    @_builtins.property
-    @pulumi.getter(name="windowsOptions")
-    def windows_options(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgs']]:
-        return pulumi.get(self, "windows_options")
-
-    @windows_options.setter
-    def windows_options(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgs']]):
-        pulumi.set(self, "windows_options", value)
-
-
-class ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgsDict(TypedDict):
-    """
-    The SELinux context to be applied to all containers.
-    If unspecified, the container runtime will allocate a random SELinux context for each
-    container.  May also be set in SecurityContext.  If set in
-    both SecurityContext and PodSecurityContext, the value specified in SecurityContext
-    takes precedence for that container.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    level: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Level is SELinux level label that applies to the container.
-    """
-    role: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Role is a SELinux role label that applies to the container.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Type is a SELinux type label that applies to the container.
-    """
-    user: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    User is a SELinux user label that applies to the container.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgs:
-    def __init__(__self__, *,
-                 level: pulumi.Input[Optional[_builtins.str]] = None,
-                 role: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None,
-                 user: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The SELinux context to be applied to all containers.
-        If unspecified, the container runtime will allocate a random SELinux context for each
-        container.  May also be set in SecurityContext.  If set in
-        both SecurityContext and PodSecurityContext, the value specified in SecurityContext
-        takes precedence for that container.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[_builtins.str] level: Level is SELinux level label that applies to the container.
-        :param pulumi.Input[_builtins.str] role: Role is a SELinux role label that applies to the container.
-        :param pulumi.Input[_builtins.str] type: Type is a SELinux type label that applies to the container.
-        :param pulumi.Input[_builtins.str] user: User is a SELinux user label that applies to the container.
-        """
-        if level is not None:
-            pulumi.set(__self__, "level", level)
-        if role is not None:
-            pulumi.set(__self__, "role", role)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-        if user is not None:
-            pulumi.set(__self__, "user", user)
-
-    @_builtins.property
-    @pulumi.getter
-    def level(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Level is SELinux level label that applies to the container.
-        """
-        return pulumi.get(self, "level")
-
-    @level.setter
-    def level(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "level", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def role(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Role is a SELinux role label that applies to the container.
-        """
-        return pulumi.get(self, "role")
-
-    @role.setter
-    def role(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "role", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Type is a SELinux type label that applies to the container.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def user(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        User is a SELinux user label that applies to the container.
-        """
-        return pulumi.get(self, "user")
-
-    @user.setter
-    def user(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "user", value)
-
-
-class ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgsDict(TypedDict):
-    """
-    The SELinux context to be applied to all containers.
-    If unspecified, the container runtime will allocate a random SELinux context for each
-    container.  May also be set in SecurityContext.  If set in
-    both SecurityContext and PodSecurityContext, the value specified in SecurityContext
-    takes precedence for that container.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    level: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Level is SELinux level label that applies to the container.
-    """
-    role: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Role is a SELinux role label that applies to the container.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Type is a SELinux type label that applies to the container.
-    """
-    user: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    User is a SELinux user label that applies to the container.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgs:
-    def __init__(__self__, *,
-                 level: pulumi.Input[Optional[_builtins.str]] = None,
-                 role: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None,
-                 user: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The SELinux context to be applied to all containers.
-        If unspecified, the container runtime will allocate a random SELinux context for each
-        container.  May also be set in SecurityContext.  If set in
-        both SecurityContext and PodSecurityContext, the value specified in SecurityContext
-        takes precedence for that container.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[_builtins.str] level: Level is SELinux level label that applies to the container.
-        :param pulumi.Input[_builtins.str] role: Role is a SELinux role label that applies to the container.
-        :param pulumi.Input[_builtins.str] type: Type is a SELinux type label that applies to the container.
-        :param pulumi.Input[_builtins.str] user: User is a SELinux user label that applies to the container.
-        """
-        if level is not None:
-            pulumi.set(__self__, "level", level)
-        if role is not None:
-            pulumi.set(__self__, "role", role)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-        if user is not None:
-            pulumi.set(__self__, "user", user)
-
-    @_builtins.property
-    @pulumi.getter
-    def level(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Level is SELinux level label that applies to the container.
-        """
-        return pulumi.get(self, "level")
-
-    @level.setter
-    def level(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "level", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def role(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Role is a SELinux role label that applies to the container.
-        """
-        return pulumi.get(self, "role")
-
-    @role.setter
-    def role(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "role", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Type is a SELinux type label that applies to the container.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def user(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        User is a SELinux user label that applies to the container.
-        """
-        return pulumi.get(self, "user")
-
-    @user.setter
-    def user(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "user", value)
-
-
-class ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgsDict(TypedDict):
-    """
-    The seccomp options to use by the containers in this pod.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    localhost_profile: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    localhostProfile indicates a profile defined in a file on the node should be used.
-    The profile must be preconfigured on the node to work.
-    Must be a descending path, relative to the kubelet's configured seccomp profile location.
-    Must be set if type is "Localhost". Must NOT be set for any other type.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type indicates which kind of seccomp profile will be applied.
-    Valid options are:
-
-    Localhost - a profile defined in a file on the node should be used.
-    RuntimeDefault - the container runtime default profile should be used.
-    Unconfined - no profile should be applied.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgs:
-    def __init__(__self__, *,
-                 localhost_profile: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The seccomp options to use by the containers in this pod.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[_builtins.str] localhost_profile: localhostProfile indicates a profile defined in a file on the node should be used.
-               The profile must be preconfigured on the node to work.
-               Must be a descending path, relative to the kubelet's configured seccomp profile location.
-               Must be set if type is "Localhost". Must NOT be set for any other type.
-        :param pulumi.Input[_builtins.str] type: type indicates which kind of seccomp profile will be applied.
-               Valid options are:
-
-               Localhost - a profile defined in a file on the node should be used.
-               RuntimeDefault - the container runtime default profile should be used.
-               Unconfined - no profile should be applied.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        localhostProfile indicates a profile defined in a file on the node should be used.
-        The profile must be preconfigured on the node to work.
-        Must be a descending path, relative to the kubelet's configured seccomp profile location.
-        Must be set if type is "Localhost". Must NOT be set for any other type.
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @localhost_profile.setter
-    def localhost_profile(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "localhost_profile", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type indicates which kind of seccomp profile will be applied.
-        Valid options are:
-
-        Localhost - a profile defined in a file on the node should be used.
-        RuntimeDefault - the container runtime default profile should be used.
-        Unconfined - no profile should be applied.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgsDict(TypedDict):
-    """
-    The seccomp options to use by the containers in this pod.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    localhost_profile: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    localhostProfile indicates a profile defined in a file on the node should be used.
-    The profile must be preconfigured on the node to work.
-    Must be a descending path, relative to the kubelet's configured seccomp profile location.
-    Must be set if type is "Localhost". Must NOT be set for any other type.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type indicates which kind of seccomp profile will be applied.
-    Valid options are:
-
-    Localhost - a profile defined in a file on the node should be used.
-    RuntimeDefault - the container runtime default profile should be used.
-    Unconfined - no profile should be applied.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgs:
-    def __init__(__self__, *,
-                 localhost_profile: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The seccomp options to use by the containers in this pod.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[_builtins.str] localhost_profile: localhostProfile indicates a profile defined in a file on the node should be used.
-               The profile must be preconfigured on the node to work.
-               Must be a descending path, relative to the kubelet's configured seccomp profile location.
-               Must be set if type is "Localhost". Must NOT be set for any other type.
-        :param pulumi.Input[_builtins.str] type: type indicates which kind of seccomp profile will be applied.
-               Valid options are:
-
-               Localhost - a profile defined in a file on the node should be used.
-               RuntimeDefault - the container runtime default profile should be used.
-               Unconfined - no profile should be applied.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        localhostProfile indicates a profile defined in a file on the node should be used.
-        The profile must be preconfigured on the node to work.
-        Must be a descending path, relative to the kubelet's configured seccomp profile location.
-        Must be set if type is "Localhost". Must NOT be set for any other type.
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @localhost_profile.setter
-    def localhost_profile(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "localhost_profile", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type indicates which kind of seccomp profile will be applied.
-        Valid options are:
-
-        Localhost - a profile defined in a file on the node should be used.
-        RuntimeDefault - the container runtime default profile should be used.
-        Unconfined - no profile should be applied.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgsDict(TypedDict):
-    """
-    Sysctl defines a kernel parameter to be set
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of a property to set
-    """
-    value: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Value of a property to set
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs:
-    def __init__(__self__, *,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 value: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Sysctl defines a kernel parameter to be set
-
-        :param pulumi.Input[_builtins.str] name: Name of a property to set
-        :param pulumi.Input[_builtins.str] value: Value of a property to set
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of a property to set
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Value of a property to set
-        """
-        return pulumi.get(self, "value")
-
-    @value.setter
-    def value(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "value", value)
-
-
-class ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgsDict(TypedDict):
-    """
-    Sysctl defines a kernel parameter to be set
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of a property to set
-    """
-    value: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Value of a property to set
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgs:
-    def __init__(__self__, *,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 value: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Sysctl defines a kernel parameter to be set
-
-        :param pulumi.Input[_builtins.str] name: Name of a property to set
-        :param pulumi.Input[_builtins.str] value: Value of a property to set
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of a property to set
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Value of a property to set
-        """
-        return pulumi.get(self, "value")
-
-    @value.setter
-    def value(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "value", value)
-
-
-class ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgsDict(TypedDict):
-    """
-    The Windows specific settings applied to all containers.
-    If unspecified, the options within a container's SecurityContext will be used.
-    If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is linux.
-    """
-    gmsa_credential_spec: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    GMSACredentialSpec is where the GMSA admission webhook
-    (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-    GMSA credential spec named by the GMSACredentialSpecName field.
-    """
-    gmsa_credential_spec_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    GMSACredentialSpecName is the name of the GMSA credential spec to use.
-    """
-    host_process: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    HostProcess determines if a container should be run as a 'Host Process' container.
-    All of a Pod's containers must have the same effective HostProcess value
-    (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-    In addition, if HostProcess is true then HostNetwork must also be set to true.
-    """
-    run_as_user_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The UserName in Windows to run the entrypoint of the container process.
-    Defaults to the user specified in image metadata if unspecified.
-    May also be set in PodSecurityContext. If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgs:
-    def __init__(__self__, *,
-                 gmsa_credential_spec: pulumi.Input[Optional[_builtins.str]] = None,
-                 gmsa_credential_spec_name: pulumi.Input[Optional[_builtins.str]] = None,
-                 host_process: pulumi.Input[Optional[_builtins.bool]] = None,
-                 run_as_user_name: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The Windows specific settings applied to all containers.
-        If unspecified, the options within a container's SecurityContext will be used.
-        If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is linux.
-
-        :param pulumi.Input[_builtins.str] gmsa_credential_spec: GMSACredentialSpec is where the GMSA admission webhook
-               (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-               GMSA credential spec named by the GMSACredentialSpecName field.
-        :param pulumi.Input[_builtins.str] gmsa_credential_spec_name: GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        :param pulumi.Input[_builtins.bool] host_process: HostProcess determines if a container should be run as a 'Host Process' container.
-               All of a Pod's containers must have the same effective HostProcess value
-               (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-               In addition, if HostProcess is true then HostNetwork must also be set to true.
-        :param pulumi.Input[_builtins.str] run_as_user_name: The UserName in Windows to run the entrypoint of the container process.
-               Defaults to the user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext. If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        if gmsa_credential_spec is not None:
-            pulumi.set(__self__, "gmsa_credential_spec", gmsa_credential_spec)
-        if gmsa_credential_spec_name is not None:
-            pulumi.set(__self__, "gmsa_credential_spec_name", gmsa_credential_spec_name)
-        if host_process is not None:
-            pulumi.set(__self__, "host_process", host_process)
-        if run_as_user_name is not None:
-            pulumi.set(__self__, "run_as_user_name", run_as_user_name)
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpec")
-    def gmsa_credential_spec(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        GMSACredentialSpec is where the GMSA admission webhook
-        (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-        GMSA credential spec named by the GMSACredentialSpecName field.
-        """
-        return pulumi.get(self, "gmsa_credential_spec")
-
-    @gmsa_credential_spec.setter
-    def gmsa_credential_spec(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "gmsa_credential_spec", value)
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpecName")
-    def gmsa_credential_spec_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        """
-        return pulumi.get(self, "gmsa_credential_spec_name")
-
-    @gmsa_credential_spec_name.setter
-    def gmsa_credential_spec_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "gmsa_credential_spec_name", value)
-
-    @_builtins.property
-    @pulumi.getter(name="hostProcess")
-    def host_process(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        HostProcess determines if a container should be run as a 'Host Process' container.
-        All of a Pod's containers must have the same effective HostProcess value
-        (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-        In addition, if HostProcess is true then HostNetwork must also be set to true.
-        """
-        return pulumi.get(self, "host_process")
-
-    @host_process.setter
-    def host_process(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "host_process", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUserName")
-    def run_as_user_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The UserName in Windows to run the entrypoint of the container process.
-        Defaults to the user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext. If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_user_name")
-
-    @run_as_user_name.setter
-    def run_as_user_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "run_as_user_name", value)
-
-
-class ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgsDict(TypedDict):
-    """
-    The Windows specific settings applied to all containers.
-    If unspecified, the options within a container's SecurityContext will be used.
-    If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is linux.
-    """
-    gmsa_credential_spec: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    GMSACredentialSpec is where the GMSA admission webhook
-    (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-    GMSA credential spec named by the GMSACredentialSpecName field.
-    """
-    gmsa_credential_spec_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    GMSACredentialSpecName is the name of the GMSA credential spec to use.
-    """
-    host_process: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    HostProcess determines if a container should be run as a 'Host Process' container.
-    All of a Pod's containers must have the same effective HostProcess value
-    (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-    In addition, if HostProcess is true then HostNetwork must also be set to true.
-    """
-    run_as_user_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The UserName in Windows to run the entrypoint of the container process.
-    Defaults to the user specified in image metadata if unspecified.
-    May also be set in PodSecurityContext. If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgs:
-    def __init__(__self__, *,
-                 gmsa_credential_spec: pulumi.Input[Optional[_builtins.str]] = None,
-                 gmsa_credential_spec_name: pulumi.Input[Optional[_builtins.str]] = None,
-                 host_process: pulumi.Input[Optional[_builtins.bool]] = None,
-                 run_as_user_name: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The Windows specific settings applied to all containers.
-        If unspecified, the options within a container's SecurityContext will be used.
-        If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is linux.
-
-        :param pulumi.Input[_builtins.str] gmsa_credential_spec: GMSACredentialSpec is where the GMSA admission webhook
-               (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-               GMSA credential spec named by the GMSACredentialSpecName field.
-        :param pulumi.Input[_builtins.str] gmsa_credential_spec_name: GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        :param pulumi.Input[_builtins.bool] host_process: HostProcess determines if a container should be run as a 'Host Process' container.
-               All of a Pod's containers must have the same effective HostProcess value
-               (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-               In addition, if HostProcess is true then HostNetwork must also be set to true.
-        :param pulumi.Input[_builtins.str] run_as_user_name: The UserName in Windows to run the entrypoint of the container process.
-               Defaults to the user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext. If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        if gmsa_credential_spec is not None:
-            pulumi.set(__self__, "gmsa_credential_spec", gmsa_credential_spec)
-        if gmsa_credential_spec_name is not None:
-            pulumi.set(__self__, "gmsa_credential_spec_name", gmsa_credential_spec_name)
-        if host_process is not None:
-            pulumi.set(__self__, "host_process", host_process)
-        if run_as_user_name is not None:
-            pulumi.set(__self__, "run_as_user_name", run_as_user_name)
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpec")
-    def gmsa_credential_spec(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        GMSACredentialSpec is where the GMSA admission webhook
-        (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-        GMSA credential spec named by the GMSACredentialSpecName field.
-        """
-        return pulumi.get(self, "gmsa_credential_spec")
-
-    @gmsa_credential_spec.setter
-    def gmsa_credential_spec(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "gmsa_credential_spec", value)
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpecName")
-    def gmsa_credential_spec_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        """
-        return pulumi.get(self, "gmsa_credential_spec_name")
-
-    @gmsa_credential_spec_name.setter
-    def gmsa_credential_spec_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "gmsa_credential_spec_name", value)
-
-    @_builtins.property
-    @pulumi.getter(name="hostProcess")
-    def host_process(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        HostProcess determines if a container should be run as a 'Host Process' container.
-        All of a Pod's containers must have the same effective HostProcess value
-        (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-        In addition, if HostProcess is true then HostNetwork must also be set to true.
-        """
-        return pulumi.get(self, "host_process")
-
-    @host_process.setter
-    def host_process(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "host_process", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUserName")
-    def run_as_user_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The UserName in Windows to run the entrypoint of the container process.
-        Defaults to the user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext. If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_user_name")
-
-    @run_as_user_name.setter
-    def run_as_user_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "run_as_user_name", value)
-
-
-class ProxyClassSpecStatefulSetPodSecurityContextArgsDict(TypedDict):
-    """
-    Proxy Pod's security context.
-    By default Tailscale Kubernetes operator does not apply any Pod
-    security context.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context-2
-    """
-    app_armor_profile: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgs']]]
-    fs_group: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    A special supplemental group that applies to all containers in a pod.
-    Some volume types allow the Kubelet to change the ownership of that volume
-    to be owned by the pod:
-
-    1. The owning GID will be the FSGroup
-    2. The setgid bit is set (new files created in the volume will be owned by FSGroup)
-    3. The permission bits are OR'd with rw-rw----
-
-    If unset, the Kubelet will not modify the ownership and permissions of any volume.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    fs_group_change_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    fsGroupChangePolicy defines behavior of changing ownership and permission of the volume
-    before being exposed inside Pod. This field will only apply to
-    volume types which support fsGroup based ownership(and permissions).
-    It will have no effect on ephemeral volume types such as: secret, configmaps
-    and emptydir.
-    Valid values are "OnRootMismatch" and "Always". If not specified, "Always" is used.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    run_as_group: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    The GID to run the entrypoint of the container process.
-    Uses runtime default if unset.
-    May also be set in SecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence
-    for that container.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    run_as_non_root: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Indicates that the container must run as a non-root user.
-    If true, the Kubelet will validate the image at runtime to ensure that it
-    does not run as UID 0 (root) and fail to start the container if it does.
-    If unset or false, no such validation will be performed.
-    May also be set in SecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    """
-    run_as_user: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    The UID to run the entrypoint of the container process.
-    Defaults to user specified in image metadata if unspecified.
-    May also be set in SecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence
-    for that container.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    se_linux_change_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    seLinuxChangePolicy defines how the container's SELinux label is applied to all volumes used by the Pod.
-    It has no effect on nodes that do not support SELinux or to volumes does not support SELinux.
-    Valid values are "MountOption" and "Recursive".
-
-    "Recursive" means relabeling of all files on all Pod volumes by the container runtime.
-    This may be slow for large volumes, but allows mixing privileged and unprivileged Pods sharing the same volume on the same node.
-
-    "MountOption" mounts all eligible Pod volumes with `-o context` mount option.
-    This requires all Pods that share the same volume to use the same SELinux label.
-    It is not possible to share the same volume among privileged and unprivileged Pods.
-    Eligible volumes are in-tree FibreChannel and iSCSI volumes, and all CSI volumes
-    whose CSI driver announces SELinux support by setting spec.seLinuxMount: true in their
-    CSIDriver instance. Other volumes are always re-labelled recursively.
-    "MountOption" value is allowed only when SELinuxMount feature gate is enabled.
-
-    If not specified and SELinuxMount feature gate is enabled, "MountOption" is used.
-    If not specified and SELinuxMount feature gate is disabled, "MountOption" is used for ReadWriteOncePod volumes
-    and "Recursive" for all other volumes.
-
-    This field affects only Pods that have SELinux label set, either in PodSecurityContext or in SecurityContext of all containers.
-
-    All Pods that use the same volume should use the same seLinuxChangePolicy, otherwise some pods can get stuck in ContainerCreating state.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    se_linux_options: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgs']]]
-    seccomp_profile: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgs']]]
-    supplemental_groups: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.int]]]]]
-    """
-    A list of groups applied to the first process run in each container, in
-    addition to the container's primary GID and fsGroup (if specified).  If
-    the SupplementalGroupsPolicy feature is enabled, the
-    supplementalGroupsPolicy field determines whether these are in addition
-    to or instead of any group memberships defined in the container image.
-    If unspecified, no additional groups are added, though group memberships
-    defined in the container image may still be used, depending on the
-    supplementalGroupsPolicy field.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    supplemental_groups_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Defines how supplemental groups of the first container processes are calculated.
-    Valid values are "Merge" and "Strict". If not specified, "Merge" is used.
-    (Alpha) Using the field requires the SupplementalGroupsPolicy feature gate to be enabled
-    and the container runtime must implement support for this feature.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    sysctls: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgs']]]]]
-    """
-    Sysctls hold a list of namespaced sysctls used for the pod. Pods with unsupported
-    sysctls (by the container runtime) might fail to launch.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    windows_options: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodSecurityContextArgs:
-    def __init__(__self__, *,
-                 app_armor_profile: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgs']] = None,
-                 fs_group: pulumi.Input[Optional[_builtins.int]] = None,
-                 fs_group_change_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 run_as_group: pulumi.Input[Optional[_builtins.int]] = None,
-                 run_as_non_root: pulumi.Input[Optional[_builtins.bool]] = None,
-                 run_as_user: pulumi.Input[Optional[_builtins.int]] = None,
-                 se_linux_change_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 se_linux_options: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgs']] = None,
-                 seccomp_profile: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgs']] = None,
-                 supplemental_groups: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.int]]]] = None,
-                 supplemental_groups_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 sysctls: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgs']]]] = None,
-                 windows_options: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgs']] = None):
-        """
-        Proxy Pod's security context.
-        By default Tailscale Kubernetes operator does not apply any Pod
-        security context.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context-2
-
-        :param pulumi.Input[_builtins.int] fs_group: A special supplemental group that applies to all containers in a pod.
-               Some volume types allow the Kubelet to change the ownership of that volume
-               to be owned by the pod:
-
-               1. The owning GID will be the FSGroup
-               2. The setgid bit is set (new files created in the volume will be owned by FSGroup)
-               3. The permission bits are OR'd with rw-rw----
-
-               If unset, the Kubelet will not modify the ownership and permissions of any volume.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.str] fs_group_change_policy: fsGroupChangePolicy defines behavior of changing ownership and permission of the volume
-               before being exposed inside Pod. This field will only apply to
-               volume types which support fsGroup based ownership(and permissions).
-               It will have no effect on ephemeral volume types such as: secret, configmaps
-               and emptydir.
-               Valid values are "OnRootMismatch" and "Always". If not specified, "Always" is used.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.int] run_as_group: The GID to run the entrypoint of the container process.
-               Uses runtime default if unset.
-               May also be set in SecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence
-               for that container.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.bool] run_as_non_root: Indicates that the container must run as a non-root user.
-               If true, the Kubelet will validate the image at runtime to ensure that it
-               does not run as UID 0 (root) and fail to start the container if it does.
-               If unset or false, no such validation will be performed.
-               May also be set in SecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        :param pulumi.Input[_builtins.int] run_as_user: The UID to run the entrypoint of the container process.
-               Defaults to user specified in image metadata if unspecified.
-               May also be set in SecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence
-               for that container.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.str] se_linux_change_policy: seLinuxChangePolicy defines how the container's SELinux label is applied to all volumes used by the Pod.
-               It has no effect on nodes that do not support SELinux or to volumes does not support SELinux.
-               Valid values are "MountOption" and "Recursive".
-
-               "Recursive" means relabeling of all files on all Pod volumes by the container runtime.
-               This may be slow for large volumes, but allows mixing privileged and unprivileged Pods sharing the same volume on the same node.
-
-               "MountOption" mounts all eligible Pod volumes with `-o context` mount option.
-               This requires all Pods that share the same volume to use the same SELinux label.
-               It is not possible to share the same volume among privileged and unprivileged Pods.
-               Eligible volumes are in-tree FibreChannel and iSCSI volumes, and all CSI volumes
-               whose CSI driver announces SELinux support by setting spec.seLinuxMount: true in their
-               CSIDriver instance. Other volumes are always re-labelled recursively.
-               "MountOption" value is allowed only when SELinuxMount feature gate is enabled.
-
-               If not specified and SELinuxMount feature gate is enabled, "MountOption" is used.
-               If not specified and SELinuxMount feature gate is disabled, "MountOption" is used for ReadWriteOncePod volumes
-               and "Recursive" for all other volumes.
-
-               This field affects only Pods that have SELinux label set, either in PodSecurityContext or in SecurityContext of all containers.
-
-               All Pods that use the same volume should use the same seLinuxChangePolicy, otherwise some pods can get stuck in ContainerCreating state.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.int]]] supplemental_groups: A list of groups applied to the first process run in each container, in
-               addition to the container's primary GID and fsGroup (if specified).  If
-               the SupplementalGroupsPolicy feature is enabled, the
-               supplementalGroupsPolicy field determines whether these are in addition
-               to or instead of any group memberships defined in the container image.
-               If unspecified, no additional groups are added, though group memberships
-               defined in the container image may still be used, depending on the
-               supplementalGroupsPolicy field.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.str] supplemental_groups_policy: Defines how supplemental groups of the first container processes are calculated.
-               Valid values are "Merge" and "Strict". If not specified, "Merge" is used.
-               (Alpha) Using the field requires the SupplementalGroupsPolicy feature gate to be enabled
-               and the container runtime must implement support for this feature.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgs']]] sysctls: Sysctls hold a list of namespaced sysctls used for the pod. Pods with unsupported
-               sysctls (by the container runtime) might fail to launch.
-               Note that this field cannot be set when spec.os.name is windows.
-        """
-        if app_armor_profile is not None:
-            pulumi.set(__self__, "app_armor_profile", app_armor_profile)
-        if fs_group is not None:
-            pulumi.set(__self__, "fs_group", fs_group)
-        if fs_group_change_policy is not None:
-            pulumi.set(__self__, "fs_group_change_policy", fs_group_change_policy)
-        if run_as_group is not None:
-            pulumi.set(__self__, "run_as_group", run_as_group)
-        if run_as_non_root is not None:
-            pulumi.set(__self__, "run_as_non_root", run_as_non_root)
-        if run_as_user is not None:
-            pulumi.set(__self__, "run_as_user", run_as_user)
-        if se_linux_change_policy is not None:
-            pulumi.set(__self__, "se_linux_change_policy", se_linux_change_policy)
-        if se_linux_options is not None:
-            pulumi.set(__self__, "se_linux_options", se_linux_options)
-        if seccomp_profile is not None:
-            pulumi.set(__self__, "seccomp_profile", seccomp_profile)
-        if supplemental_groups is not None:
-            pulumi.set(__self__, "supplemental_groups", supplemental_groups)
-        if supplemental_groups_policy is not None:
-            pulumi.set(__self__, "supplemental_groups_policy", supplemental_groups_policy)
-        if sysctls is not None:
-            pulumi.set(__self__, "sysctls", sysctls)
-        if windows_options is not None:
-            pulumi.set(__self__, "windows_options", windows_options)
-
-    @_builtins.property
-    @pulumi.getter(name="appArmorProfile")
-    def app_armor_profile(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgs']]:
-        return pulumi.get(self, "app_armor_profile")
-
-    @app_armor_profile.setter
-    def app_armor_profile(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgs']]):
-        pulumi.set(self, "app_armor_profile", value)
-
-    @_builtins.property
-    @pulumi.getter(name="fsGroup")
-    def fs_group(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        A special supplemental group that applies to all containers in a pod.
-        Some volume types allow the Kubelet to change the ownership of that volume
-        to be owned by the pod:
-
-        1. The owning GID will be the FSGroup
-        2. The setgid bit is set (new files created in the volume will be owned by FSGroup)
-        3. The permission bits are OR'd with rw-rw----
-
-        If unset, the Kubelet will not modify the ownership and permissions of any volume.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "fs_group")
-
-    @fs_group.setter
-    def fs_group(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "fs_group", value)
-
-    @_builtins.property
-    @pulumi.getter(name="fsGroupChangePolicy")
-    def fs_group_change_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        fsGroupChangePolicy defines behavior of changing ownership and permission of the volume
-        before being exposed inside Pod. This field will only apply to
-        volume types which support fsGroup based ownership(and permissions).
-        It will have no effect on ephemeral volume types such as: secret, configmaps
-        and emptydir.
-        Valid values are "OnRootMismatch" and "Always". If not specified, "Always" is used.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "fs_group_change_policy")
-
-    @fs_group_change_policy.setter
-    def fs_group_change_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "fs_group_change_policy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsGroup")
-    def run_as_group(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        The GID to run the entrypoint of the container process.
-        Uses runtime default if unset.
-        May also be set in SecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence
-        for that container.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_group")
-
-    @run_as_group.setter
-    def run_as_group(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "run_as_group", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsNonRoot")
-    def run_as_non_root(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Indicates that the container must run as a non-root user.
-        If true, the Kubelet will validate the image at runtime to ensure that it
-        does not run as UID 0 (root) and fail to start the container if it does.
-        If unset or false, no such validation will be performed.
-        May also be set in SecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_non_root")
-
-    @run_as_non_root.setter
-    def run_as_non_root(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "run_as_non_root", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUser")
-    def run_as_user(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        The UID to run the entrypoint of the container process.
-        Defaults to user specified in image metadata if unspecified.
-        May also be set in SecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence
-        for that container.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_user")
-
-    @run_as_user.setter
-    def run_as_user(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "run_as_user", value)
-
-    @_builtins.property
-    @pulumi.getter(name="seLinuxChangePolicy")
-    def se_linux_change_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        seLinuxChangePolicy defines how the container's SELinux label is applied to all volumes used by the Pod.
-        It has no effect on nodes that do not support SELinux or to volumes does not support SELinux.
-        Valid values are "MountOption" and "Recursive".
-
-        "Recursive" means relabeling of all files on all Pod volumes by the container runtime.
-        This may be slow for large volumes, but allows mixing privileged and unprivileged Pods sharing the same volume on the same node.
-
-        "MountOption" mounts all eligible Pod volumes with `-o context` mount option.
-        This requires all Pods that share the same volume to use the same SELinux label.
-        It is not possible to share the same volume among privileged and unprivileged Pods.
-        Eligible volumes are in-tree FibreChannel and iSCSI volumes, and all CSI volumes
-        whose CSI driver announces SELinux support by setting spec.seLinuxMount: true in their
-        CSIDriver instance. Other volumes are always re-labelled recursively.
-        "MountOption" value is allowed only when SELinuxMount feature gate is enabled.
-
-        If not specified and SELinuxMount feature gate is enabled, "MountOption" is used.
-        If not specified and SELinuxMount feature gate is disabled, "MountOption" is used for ReadWriteOncePod volumes
-        and "Recursive" for all other volumes.
-
-        This field affects only Pods that have SELinux label set, either in PodSecurityContext or in SecurityContext of all containers.
-
-        All Pods that use the same volume should use the same seLinuxChangePolicy, otherwise some pods can get stuck in ContainerCreating state.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "se_linux_change_policy")
-
-    @se_linux_change_policy.setter
-    def se_linux_change_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "se_linux_change_policy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="seLinuxOptions")
-    def se_linux_options(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgs']]:
-        return pulumi.get(self, "se_linux_options")
-
-    @se_linux_options.setter
-    def se_linux_options(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgs']]):
-        pulumi.set(self, "se_linux_options", value)
-
-    @_builtins.property
-    @pulumi.getter(name="seccompProfile")
-    def seccomp_profile(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgs']]:
-        return pulumi.get(self, "seccomp_profile")
-
-    @seccomp_profile.setter
-    def seccomp_profile(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgs']]):
-        pulumi.set(self, "seccomp_profile", value)
-
-    @_builtins.property
-    @pulumi.getter(name="supplementalGroups")
-    def supplemental_groups(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.int]]]]:
-        """
-        A list of groups applied to the first process run in each container, in
-        addition to the container's primary GID and fsGroup (if specified).  If
-        the SupplementalGroupsPolicy feature is enabled, the
-        supplementalGroupsPolicy field determines whether these are in addition
-        to or instead of any group memberships defined in the container image.
-        If unspecified, no additional groups are added, though group memberships
-        defined in the container image may still be used, depending on the
-        supplementalGroupsPolicy field.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "supplemental_groups")
-
-    @supplemental_groups.setter
-    def supplemental_groups(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.int]]]]):
-        pulumi.set(self, "supplemental_groups", value)
-
-    @_builtins.property
-    @pulumi.getter(name="supplementalGroupsPolicy")
-    def supplemental_groups_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Defines how supplemental groups of the first container processes are calculated.
-        Valid values are "Merge" and "Strict". If not specified, "Merge" is used.
-        (Alpha) Using the field requires the SupplementalGroupsPolicy feature gate to be enabled
-        and the container runtime must implement support for this feature.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "supplemental_groups_policy")
-
-    @supplemental_groups_policy.setter
-    def supplemental_groups_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "supplemental_groups_policy", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def sysctls(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgs']]]]:
-        """
-        Sysctls hold a list of namespaced sysctls used for the pod. Pods with unsupported
-        sysctls (by the container runtime) might fail to launch.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "sysctls")
-
-    @sysctls.setter
-    def sysctls(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgs']]]]):
-        pulumi.set(self, "sysctls", value)
-
-    @_builtins.property
-    @pulumi.getter(name="windowsOptions")
-    def windows_options(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgs']]:
-        return pulumi.get(self, "windows_options")
-
-    @windows_options.setter
-    def windows_options(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgs']]):
-        pulumi.set(self, "windows_options", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatchArgsDict(TypedDict):
-    """
-    Configuration for enabling extra debug information in the container.
-    Not recommended for production use.
-    """
-    enable: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-    and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-    9001 is a container port named "debug". The endpoints and their responses
-    may change in backwards incompatible ways in the future, and should not
-    be considered stable.
-
-    In 1.78.x and 1.80.x, this setting will default to the value of
-    .spec.metrics.enable, and requests to the "metrics" port matching the
-    mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-    this setting will default to false, and no requests will be proxied.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatchArgs:
-    def __init__(__self__, *,
-                 enable: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        Configuration for enabling extra debug information in the container.
-        Not recommended for production use.
-
-        :param pulumi.Input[_builtins.bool] enable: Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-               and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-               9001 is a container port named "debug". The endpoints and their responses
-               may change in backwards incompatible ways in the future, and should not
-               be considered stable.
-
-               In 1.78.x and 1.80.x, this setting will default to the value of
-               .spec.metrics.enable, and requests to the "metrics" port matching the
-               mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-               this setting will default to false, and no requests will be proxied.
-        """
-        if enable is not None:
-            pulumi.set(__self__, "enable", enable)
-
-    @_builtins.property
-    @pulumi.getter
-    def enable(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-        and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-        9001 is a container port named "debug". The endpoints and their responses
-        may change in backwards incompatible ways in the future, and should not
-        be considered stable.
-
-        In 1.78.x and 1.80.x, this setting will default to the value of
-        .spec.metrics.enable, and requests to the "metrics" port matching the
-        mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-        this setting will default to false, and no requests will be proxied.
-        """
-        return pulumi.get(self, "enable")
-
-    @enable.setter
-    def enable(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "enable", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerDebugArgsDict(TypedDict):
-    """
-    Configuration for enabling extra debug information in the container.
-    Not recommended for production use.
-    """
-    enable: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-    and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-    9001 is a container port named "debug". The endpoints and their responses
-    may change in backwards incompatible ways in the future, and should not
-    be considered stable.
-
-    In 1.78.x and 1.80.x, this setting will default to the value of
-    .spec.metrics.enable, and requests to the "metrics" port matching the
-    mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-    this setting will default to false, and no requests will be proxied.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerDebugArgs:
-    def __init__(__self__, *,
-                 enable: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        Configuration for enabling extra debug information in the container.
-        Not recommended for production use.
-
-        :param pulumi.Input[_builtins.bool] enable: Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-               and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-               9001 is a container port named "debug". The endpoints and their responses
-               may change in backwards incompatible ways in the future, and should not
-               be considered stable.
-
-               In 1.78.x and 1.80.x, this setting will default to the value of
-               .spec.metrics.enable, and requests to the "metrics" port matching the
-               mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-               this setting will default to false, and no requests will be proxied.
-        """
-        if enable is not None:
-            pulumi.set(__self__, "enable", enable)
-
-    @_builtins.property
-    @pulumi.getter
-    def enable(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-        and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-        9001 is a container port named "debug". The endpoints and their responses
-        may change in backwards incompatible ways in the future, and should not
-        be considered stable.
-
-        In 1.78.x and 1.80.x, this setting will default to the value of
-        .spec.metrics.enable, and requests to the "metrics" port matching the
-        mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-        this setting will default to false, and no requests will be proxied.
-        """
-        return pulumi.get(self, "enable")
-
-    @enable.setter
-    def enable(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "enable", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgsDict(TypedDict):
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the environment variable. Must be a C_IDENTIFIER.
-    """
-    value: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Variable references $(VAR_NAME) are expanded using the previously defined
-     environment variables in the container and any service environment
-    variables. If a variable cannot be resolved, the reference in the input
-    string will be unchanged. Double $$ are reduced to a single $, which
-    allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-    produce the string literal "$(VAR_NAME)". Escaped references will never
-    be expanded, regardless of whether the variable exists or not. Defaults
-    to "".
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgs:
-    def __init__(__self__, *,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 value: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        :param pulumi.Input[_builtins.str] name: Name of the environment variable. Must be a C_IDENTIFIER.
-        :param pulumi.Input[_builtins.str] value: Variable references $(VAR_NAME) are expanded using the previously defined
-                environment variables in the container and any service environment
-               variables. If a variable cannot be resolved, the reference in the input
-               string will be unchanged. Double $$ are reduced to a single $, which
-               allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-               produce the string literal "$(VAR_NAME)". Escaped references will never
-               be expanded, regardless of whether the variable exists or not. Defaults
-               to "".
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the environment variable. Must be a C_IDENTIFIER.
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Variable references $(VAR_NAME) are expanded using the previously defined
-         environment variables in the container and any service environment
-        variables. If a variable cannot be resolved, the reference in the input
-        string will be unchanged. Double $$ are reduced to a single $, which
-        allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-        produce the string literal "$(VAR_NAME)". Escaped references will never
-        be expanded, regardless of whether the variable exists or not. Defaults
-        to "".
-        """
-        return pulumi.get(self, "value")
-
-    @value.setter
-    def value(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "value", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgsDict(TypedDict):
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the environment variable. Must be a C_IDENTIFIER.
-    """
-    value: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Variable references $(VAR_NAME) are expanded using the previously defined
-     environment variables in the container and any service environment
-    variables. If a variable cannot be resolved, the reference in the input
-    string will be unchanged. Double $$ are reduced to a single $, which
-    allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-    produce the string literal "$(VAR_NAME)". Escaped references will never
-    be expanded, regardless of whether the variable exists or not. Defaults
-    to "".
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgs:
-    def __init__(__self__, *,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 value: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        :param pulumi.Input[_builtins.str] name: Name of the environment variable. Must be a C_IDENTIFIER.
-        :param pulumi.Input[_builtins.str] value: Variable references $(VAR_NAME) are expanded using the previously defined
-                environment variables in the container and any service environment
-               variables. If a variable cannot be resolved, the reference in the input
-               string will be unchanged. Double $$ are reduced to a single $, which
-               allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-               produce the string literal "$(VAR_NAME)". Escaped references will never
-               be expanded, regardless of whether the variable exists or not. Defaults
-               to "".
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the environment variable. Must be a C_IDENTIFIER.
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Variable references $(VAR_NAME) are expanded using the previously defined
-         environment variables in the container and any service environment
-        variables. If a variable cannot be resolved, the reference in the input
-        string will be unchanged. Double $$ are reduced to a single $, which
-        allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-        produce the string literal "$(VAR_NAME)". Escaped references will never
-        be expanded, regardless of whether the variable exists or not. Defaults
-        to "".
-        """
-        return pulumi.get(self, "value")
-
-    @value.setter
-    def value(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "value", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerPatchArgsDict(TypedDict):
-    """
-    Configuration for the proxy container running tailscale.
-    """
-    debug: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatchArgs']]]
-    env: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgs']]]]]
-    """
-    List of environment variables to set in the container.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-    Note that environment variables provided here will take precedence
-    over Tailscale-specific environment variables set by the operator,
-    however running proxies with custom values for Tailscale environment
-    variables (i.e TS_USERSPACE) is not recommended and might break in
-    the future.
-    """
-    image: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Container image name. By default images are pulled from docker.io/tailscale,
-    but the official images are also available at ghcr.io/tailscale.
-
-    For all uses except on ProxyGroups of type "kube-apiserver", this image must
-    be either tailscale/tailscale, or an equivalent mirror of that image.
-    To apply to ProxyGroups of type "kube-apiserver", this image must be
-    tailscale/k8s-proxy or a mirror of that image.
-
-    For "tailscale/tailscale"-based proxies, specifying image name here will
-    override any proxy image values specified via the Kubernetes operator's
-    Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-    For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-    configure your own default, and this field is the only way to use a
-    custom image.
-
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-    """
-    image_pull_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-    """
-    resources: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatchArgs']]]
-    security_context: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatchArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerPatchArgs:
-    def __init__(__self__, *,
-                 debug: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatchArgs']] = None,
-                 env: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgs']]]] = None,
-                 image: pulumi.Input[Optional[_builtins.str]] = None,
-                 image_pull_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 resources: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatchArgs']] = None,
-                 security_context: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatchArgs']] = None):
-        """
-        Configuration for the proxy container running tailscale.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgs']]] env: List of environment variables to set in the container.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-               Note that environment variables provided here will take precedence
-               over Tailscale-specific environment variables set by the operator,
-               however running proxies with custom values for Tailscale environment
-               variables (i.e TS_USERSPACE) is not recommended and might break in
-               the future.
-        :param pulumi.Input[_builtins.str] image: Container image name. By default images are pulled from docker.io/tailscale,
-               but the official images are also available at ghcr.io/tailscale.
-
-               For all uses except on ProxyGroups of type "kube-apiserver", this image must
-               be either tailscale/tailscale, or an equivalent mirror of that image.
-               To apply to ProxyGroups of type "kube-apiserver", this image must be
-               tailscale/k8s-proxy or a mirror of that image.
-
-               For "tailscale/tailscale"-based proxies, specifying image name here will
-               override any proxy image values specified via the Kubernetes operator's
-               Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-               For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-               configure your own default, and this field is the only way to use a
-               custom image.
-
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        :param pulumi.Input[_builtins.str] image_pull_policy: Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        if debug is not None:
-            pulumi.set(__self__, "debug", debug)
-        if env is not None:
-            pulumi.set(__self__, "env", env)
-        if image is not None:
-            pulumi.set(__self__, "image", image)
-        if image_pull_policy is not None:
-            pulumi.set(__self__, "image_pull_policy", image_pull_policy)
-        if resources is not None:
-            pulumi.set(__self__, "resources", resources)
-        if security_context is not None:
-            pulumi.set(__self__, "security_context", security_context)
-
-    @_builtins.property
-    @pulumi.getter
-    def debug(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatchArgs']]:
-        return pulumi.get(self, "debug")
-
-    @debug.setter
-    def debug(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatchArgs']]):
-        pulumi.set(self, "debug", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def env(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgs']]]]:
-        """
-        List of environment variables to set in the container.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-        Note that environment variables provided here will take precedence
-        over Tailscale-specific environment variables set by the operator,
-        however running proxies with custom values for Tailscale environment
-        variables (i.e TS_USERSPACE) is not recommended and might break in
-        the future.
-        """
-        return pulumi.get(self, "env")
-
-    @env.setter
-    def env(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgs']]]]):
-        pulumi.set(self, "env", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def image(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Container image name. By default images are pulled from docker.io/tailscale,
-        but the official images are also available at ghcr.io/tailscale.
-
-        For all uses except on ProxyGroups of type "kube-apiserver", this image must
-        be either tailscale/tailscale, or an equivalent mirror of that image.
-        To apply to ProxyGroups of type "kube-apiserver", this image must be
-        tailscale/k8s-proxy or a mirror of that image.
-
-        For "tailscale/tailscale"-based proxies, specifying image name here will
-        override any proxy image values specified via the Kubernetes operator's
-        Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-        For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-        configure your own default, and this field is the only way to use a
-        custom image.
-
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        return pulumi.get(self, "image")
-
-    @image.setter
-    def image(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "image", value)
-
-    @_builtins.property
-    @pulumi.getter(name="imagePullPolicy")
-    def image_pull_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        return pulumi.get(self, "image_pull_policy")
-
-    @image_pull_policy.setter
-    def image_pull_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "image_pull_policy", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def resources(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatchArgs']]:
-        return pulumi.get(self, "resources")
-
-    @resources.setter
-    def resources(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatchArgs']]):
-        pulumi.set(self, "resources", value)
-
-    @_builtins.property
-    @pulumi.getter(name="securityContext")
-    def security_context(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatchArgs']]:
-        return pulumi.get(self, "security_context")
-
-    @security_context.setter
-    def security_context(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatchArgs']]):
-        pulumi.set(self, "security_context", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgsDict(TypedDict):
-    """
-    ResourceClaim references one entry in PodSpec.ResourceClaims.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name must match the name of one entry in pod.spec.resourceClaims of
-    the Pod where this field is used. It makes that resource available
-    inside a container.
-    """
-    request: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Request is the name chosen for a request in the referenced claim.
-    If empty, everything from the claim is made available, otherwise
-    only the result of this request.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgs:
-    def __init__(__self__, *,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 request: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        ResourceClaim references one entry in PodSpec.ResourceClaims.
-
-        :param pulumi.Input[_builtins.str] name: Name must match the name of one entry in pod.spec.resourceClaims of
-               the Pod where this field is used. It makes that resource available
-               inside a container.
-        :param pulumi.Input[_builtins.str] request: Request is the name chosen for a request in the referenced claim.
-               If empty, everything from the claim is made available, otherwise
-               only the result of this request.
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if request is not None:
-            pulumi.set(__self__, "request", request)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name must match the name of one entry in pod.spec.resourceClaims of
-        the Pod where this field is used. It makes that resource available
-        inside a container.
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def request(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Request is the name chosen for a request in the referenced claim.
-        If empty, everything from the claim is made available, otherwise
-        only the result of this request.
-        """
-        return pulumi.get(self, "request")
-
-    @request.setter
-    def request(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "request", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgsDict(TypedDict):
-    """
-    ResourceClaim references one entry in PodSpec.ResourceClaims.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name must match the name of one entry in pod.spec.resourceClaims of
-    the Pod where this field is used. It makes that resource available
-    inside a container.
-    """
-    request: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Request is the name chosen for a request in the referenced claim.
-    If empty, everything from the claim is made available, otherwise
-    only the result of this request.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgs:
-    def __init__(__self__, *,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 request: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        ResourceClaim references one entry in PodSpec.ResourceClaims.
-
-        :param pulumi.Input[_builtins.str] name: Name must match the name of one entry in pod.spec.resourceClaims of
-               the Pod where this field is used. It makes that resource available
-               inside a container.
-        :param pulumi.Input[_builtins.str] request: Request is the name chosen for a request in the referenced claim.
-               If empty, everything from the claim is made available, otherwise
-               only the result of this request.
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if request is not None:
-            pulumi.set(__self__, "request", request)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name must match the name of one entry in pod.spec.resourceClaims of
-        the Pod where this field is used. It makes that resource available
-        inside a container.
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def request(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Request is the name chosen for a request in the referenced claim.
-        If empty, everything from the claim is made available, otherwise
-        only the result of this request.
-        """
-        return pulumi.get(self, "request")
-
-    @request.setter
-    def request(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "request", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatchArgsDict(TypedDict):
-    """
-    Container resource requirements.
-    By default Tailscale Kubernetes operator does not apply any resource
-    requirements. The amount of resources required wil depend on the
-    amount of resources the operator needs to parse, usage patterns and
-    cluster size.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#resources
-    """
-    claims: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgs']]]]]
-    """
-    Claims lists the names of resources, defined in spec.resourceClaims,
-    that are used by this container.
-
-    This field depends on the
-    DynamicResourceAllocation feature gate.
-
-    This field is immutable. It can only be set for containers.
-    """
-    limits: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]]
-    """
-    Limits describes the maximum amount of compute resources allowed.
-    More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-    """
-    requests: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]]
-    """
-    Requests describes the minimum amount of compute resources required.
-    If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-    otherwise to an implementation-defined value. Requests cannot exceed Limits.
-    More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatchArgs:
-    def __init__(__self__, *,
-                 claims: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgs']]]] = None,
-                 limits: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]] = None,
-                 requests: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]] = None):
-        """
-        Container resource requirements.
-        By default Tailscale Kubernetes operator does not apply any resource
-        requirements. The amount of resources required wil depend on the
-        amount of resources the operator needs to parse, usage patterns and
-        cluster size.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#resources
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgs']]] claims: Claims lists the names of resources, defined in spec.resourceClaims,
-               that are used by this container.
-
-               This field depends on the
-               DynamicResourceAllocation feature gate.
-
-               This field is immutable. It can only be set for containers.
-        :param pulumi.Input[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]] limits: Limits describes the maximum amount of compute resources allowed.
-               More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        :param pulumi.Input[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]] requests: Requests describes the minimum amount of compute resources required.
-               If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-               otherwise to an implementation-defined value. Requests cannot exceed Limits.
-               More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        if claims is not None:
-            pulumi.set(__self__, "claims", claims)
-        if limits is not None:
-            pulumi.set(__self__, "limits", limits)
-        if requests is not None:
-            pulumi.set(__self__, "requests", requests)
-
-    @_builtins.property
-    @pulumi.getter
-    def claims(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgs']]]]:
-        """
-        Claims lists the names of resources, defined in spec.resourceClaims,
-        that are used by this container.
-
-        This field depends on the
-        DynamicResourceAllocation feature gate.
-
-        This field is immutable. It can only be set for containers.
-        """
-        return pulumi.get(self, "claims")
-
-    @claims.setter
-    def claims(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgs']]]]):
-        pulumi.set(self, "claims", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def limits(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]:
-        """
-        Limits describes the maximum amount of compute resources allowed.
-        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        return pulumi.get(self, "limits")
-
-    @limits.setter
-    def limits(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]):
-        pulumi.set(self, "limits", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def requests(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]:
-        """
-        Requests describes the minimum amount of compute resources required.
-        If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-        otherwise to an implementation-defined value. Requests cannot exceed Limits.
-        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        return pulumi.get(self, "requests")
-
-    @requests.setter
-    def requests(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]):
-        pulumi.set(self, "requests", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerResourcesArgsDict(TypedDict):
-    """
-    Container resource requirements.
-    By default Tailscale Kubernetes operator does not apply any resource
-    requirements. The amount of resources required wil depend on the
-    amount of resources the operator needs to parse, usage patterns and
-    cluster size.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#resources
-    """
-    claims: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgs']]]]]
-    """
-    Claims lists the names of resources, defined in spec.resourceClaims,
-    that are used by this container.
-
-    This field depends on the
-    DynamicResourceAllocation feature gate.
-
-    This field is immutable. It can only be set for containers.
-    """
-    limits: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]]
-    """
-    Limits describes the maximum amount of compute resources allowed.
-    More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-    """
-    requests: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]]
-    """
-    Requests describes the minimum amount of compute resources required.
-    If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-    otherwise to an implementation-defined value. Requests cannot exceed Limits.
-    More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerResourcesArgs:
-    def __init__(__self__, *,
-                 claims: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgs']]]] = None,
-                 limits: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]] = None,
-                 requests: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]] = None):
-        """
-        Container resource requirements.
-        By default Tailscale Kubernetes operator does not apply any resource
-        requirements. The amount of resources required wil depend on the
-        amount of resources the operator needs to parse, usage patterns and
-        cluster size.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#resources
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgs']]] claims: Claims lists the names of resources, defined in spec.resourceClaims,
-               that are used by this container.
-
-               This field depends on the
-               DynamicResourceAllocation feature gate.
-
-               This field is immutable. It can only be set for containers.
-        :param pulumi.Input[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]] limits: Limits describes the maximum amount of compute resources allowed.
-               More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        :param pulumi.Input[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]] requests: Requests describes the minimum amount of compute resources required.
-               If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-               otherwise to an implementation-defined value. Requests cannot exceed Limits.
-               More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        if claims is not None:
-            pulumi.set(__self__, "claims", claims)
-        if limits is not None:
-            pulumi.set(__self__, "limits", limits)
-        if requests is not None:
-            pulumi.set(__self__, "requests", requests)
-
-    @_builtins.property
-    @pulumi.getter
-    def claims(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgs']]]]:
-        """
-        Claims lists the names of resources, defined in spec.resourceClaims,
-        that are used by this container.
-
-        This field depends on the
-        DynamicResourceAllocation feature gate.
-
-        This field is immutable. It can only be set for containers.
-        """
-        return pulumi.get(self, "claims")
-
-    @claims.setter
-    def claims(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgs']]]]):
-        pulumi.set(self, "claims", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def limits(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]:
-        """
-        Limits describes the maximum amount of compute resources allowed.
-        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        return pulumi.get(self, "limits")
-
-    @limits.setter
-    def limits(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]):
-        pulumi.set(self, "limits", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def requests(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]:
-        """
-        Requests describes the minimum amount of compute resources required.
-        If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-        otherwise to an implementation-defined value. Requests cannot exceed Limits.
-        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        return pulumi.get(self, "requests")
-
-    @requests.setter
-    def requests(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]):
-        pulumi.set(self, "requests", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatchArgsDict(TypedDict):
-    """
-    appArmorProfile is the AppArmor options to use by this container. If set, this profile
-    overrides the pod's appArmorProfile.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    localhost_profile: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    localhostProfile indicates a profile loaded on the node that should be used.
-    The profile must be preconfigured on the node to work.
-    Must match the loaded name of the profile.
-    Must be set if and only if type is "Localhost".
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type indicates which kind of AppArmor profile will be applied.
-    Valid options are:
-      Localhost - a profile pre-loaded on the node.
-      RuntimeDefault - the container runtime's default profile.
-      Unconfined - no AppArmor enforcement.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatchArgs:
-    def __init__(__self__, *,
-                 localhost_profile: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        appArmorProfile is the AppArmor options to use by this container. If set, this profile
-        overrides the pod's appArmorProfile.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[_builtins.str] localhost_profile: localhostProfile indicates a profile loaded on the node that should be used.
-               The profile must be preconfigured on the node to work.
-               Must match the loaded name of the profile.
-               Must be set if and only if type is "Localhost".
-        :param pulumi.Input[_builtins.str] type: type indicates which kind of AppArmor profile will be applied.
-               Valid options are:
-                 Localhost - a profile pre-loaded on the node.
-                 RuntimeDefault - the container runtime's default profile.
-                 Unconfined - no AppArmor enforcement.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        localhostProfile indicates a profile loaded on the node that should be used.
-        The profile must be preconfigured on the node to work.
-        Must match the loaded name of the profile.
-        Must be set if and only if type is "Localhost".
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @localhost_profile.setter
-    def localhost_profile(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "localhost_profile", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type indicates which kind of AppArmor profile will be applied.
-        Valid options are:
-          Localhost - a profile pre-loaded on the node.
-          RuntimeDefault - the container runtime's default profile.
-          Unconfined - no AppArmor enforcement.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgsDict(TypedDict):
-    """
-    appArmorProfile is the AppArmor options to use by this container. If set, this profile
-    overrides the pod's appArmorProfile.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    localhost_profile: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    localhostProfile indicates a profile loaded on the node that should be used.
-    The profile must be preconfigured on the node to work.
-    Must match the loaded name of the profile.
-    Must be set if and only if type is "Localhost".
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type indicates which kind of AppArmor profile will be applied.
-    Valid options are:
-      Localhost - a profile pre-loaded on the node.
-      RuntimeDefault - the container runtime's default profile.
-      Unconfined - no AppArmor enforcement.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgs:
-    def __init__(__self__, *,
-                 localhost_profile: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        appArmorProfile is the AppArmor options to use by this container. If set, this profile
-        overrides the pod's appArmorProfile.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[_builtins.str] localhost_profile: localhostProfile indicates a profile loaded on the node that should be used.
-               The profile must be preconfigured on the node to work.
-               Must match the loaded name of the profile.
-               Must be set if and only if type is "Localhost".
-        :param pulumi.Input[_builtins.str] type: type indicates which kind of AppArmor profile will be applied.
-               Valid options are:
-                 Localhost - a profile pre-loaded on the node.
-                 RuntimeDefault - the container runtime's default profile.
-                 Unconfined - no AppArmor enforcement.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        localhostProfile indicates a profile loaded on the node that should be used.
-        The profile must be preconfigured on the node to work.
-        Must match the loaded name of the profile.
-        Must be set if and only if type is "Localhost".
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @localhost_profile.setter
-    def localhost_profile(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "localhost_profile", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type indicates which kind of AppArmor profile will be applied.
-        Valid options are:
-          Localhost - a profile pre-loaded on the node.
-          RuntimeDefault - the container runtime's default profile.
-          Unconfined - no AppArmor enforcement.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatchArgsDict(TypedDict):
-    """
-    The capabilities to add/drop when running containers.
-    Defaults to the default set of capabilities granted by the container runtime.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    add: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    Added capabilities
-    """
-    drop: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    Removed capabilities
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatchArgs:
-    def __init__(__self__, *,
-                 add: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 drop: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        The capabilities to add/drop when running containers.
-        Defaults to the default set of capabilities granted by the container runtime.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] add: Added capabilities
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] drop: Removed capabilities
-        """
-        if add is not None:
-            pulumi.set(__self__, "add", add)
-        if drop is not None:
-            pulumi.set(__self__, "drop", drop)
-
-    @_builtins.property
-    @pulumi.getter
-    def add(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        Added capabilities
-        """
-        return pulumi.get(self, "add")
-
-    @add.setter
-    def add(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "add", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def drop(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        Removed capabilities
-        """
-        return pulumi.get(self, "drop")
-
-    @drop.setter
-    def drop(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "drop", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgsDict(TypedDict):
-    """
-    The capabilities to add/drop when running containers.
-    Defaults to the default set of capabilities granted by the container runtime.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    add: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    Added capabilities
-    """
-    drop: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    Removed capabilities
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgs:
-    def __init__(__self__, *,
-                 add: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 drop: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        The capabilities to add/drop when running containers.
-        Defaults to the default set of capabilities granted by the container runtime.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] add: Added capabilities
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] drop: Removed capabilities
-        """
-        if add is not None:
-            pulumi.set(__self__, "add", add)
-        if drop is not None:
-            pulumi.set(__self__, "drop", drop)
-
-    @_builtins.property
-    @pulumi.getter
-    def add(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        Added capabilities
-        """
-        return pulumi.get(self, "add")
-
-    @add.setter
-    def add(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "add", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def drop(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        Removed capabilities
-        """
-        return pulumi.get(self, "drop")
-
-    @drop.setter
-    def drop(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "drop", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatchArgsDict(TypedDict):
-    """
-    Container security context.
-    Security context specified here will override the security context set by the operator.
-    By default the operator sets the Tailscale container and the Tailscale init container to privileged
-    for proxies created for Tailscale ingress and egress Service, Connector and ProxyGroup.
-    You can reduce the permissions of the Tailscale container to cap NET_ADMIN by
-    installing device plugin in your cluster and configuring the proxies tun device to be created
-    by the device plugin, see  https://github.com/tailscale/tailscale/issues/10814#issuecomment-2479977752
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context
-    """
-    allow_privilege_escalation: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    AllowPrivilegeEscalation controls whether a process can gain more
-    privileges than its parent process. This bool directly controls if
-    the no_new_privs flag will be set on the container process.
-    AllowPrivilegeEscalation is true always when the container is:
-    1) run as Privileged
-    2) has CAP_SYS_ADMIN
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    app_armor_profile: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatchArgs']]]
-    capabilities: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatchArgs']]]
-    privileged: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Run container in privileged mode.
-    Processes in privileged containers are essentially equivalent to root on the host.
-    Defaults to false.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    proc_mount: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    procMount denotes the type of proc mount to use for the containers.
-    The default value is Default which uses the container runtime defaults for
-    readonly paths and masked paths.
-    This requires the ProcMountType feature flag to be enabled.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    read_only_root_filesystem: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Whether this container has a read-only root filesystem.
-    Default is false.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    run_as_group: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    The GID to run the entrypoint of the container process.
-    Uses runtime default if unset.
-    May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    run_as_non_root: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Indicates that the container must run as a non-root user.
-    If true, the Kubelet will validate the image at runtime to ensure that it
-    does not run as UID 0 (root) and fail to start the container if it does.
-    If unset or false, no such validation will be performed.
-    May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    """
-    run_as_user: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    The UID to run the entrypoint of the container process.
-    Defaults to user specified in image metadata if unspecified.
-    May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    se_linux_options: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatchArgs']]]
-    seccomp_profile: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatchArgs']]]
-    windows_options: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatchArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatchArgs:
-    def __init__(__self__, *,
-                 allow_privilege_escalation: pulumi.Input[Optional[_builtins.bool]] = None,
-                 app_armor_profile: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatchArgs']] = None,
-                 capabilities: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatchArgs']] = None,
-                 privileged: pulumi.Input[Optional[_builtins.bool]] = None,
-                 proc_mount: pulumi.Input[Optional[_builtins.str]] = None,
-                 read_only_root_filesystem: pulumi.Input[Optional[_builtins.bool]] = None,
-                 run_as_group: pulumi.Input[Optional[_builtins.int]] = None,
-                 run_as_non_root: pulumi.Input[Optional[_builtins.bool]] = None,
-                 run_as_user: pulumi.Input[Optional[_builtins.int]] = None,
-                 se_linux_options: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatchArgs']] = None,
-                 seccomp_profile: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatchArgs']] = None,
-                 windows_options: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatchArgs']] = None):
-        """
-        Container security context.
-        Security context specified here will override the security context set by the operator.
-        By default the operator sets the Tailscale container and the Tailscale init container to privileged
-        for proxies created for Tailscale ingress and egress Service, Connector and ProxyGroup.
-        You can reduce the permissions of the Tailscale container to cap NET_ADMIN by
-        installing device plugin in your cluster and configuring the proxies tun device to be created
-        by the device plugin, see  https://github.com/tailscale/tailscale/issues/10814#issuecomment-2479977752
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context
-
-        :param pulumi.Input[_builtins.bool] allow_privilege_escalation: AllowPrivilegeEscalation controls whether a process can gain more
-               privileges than its parent process. This bool directly controls if
-               the no_new_privs flag will be set on the container process.
-               AllowPrivilegeEscalation is true always when the container is:
-               1) run as Privileged
-               2) has CAP_SYS_ADMIN
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.bool] privileged: Run container in privileged mode.
-               Processes in privileged containers are essentially equivalent to root on the host.
-               Defaults to false.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.str] proc_mount: procMount denotes the type of proc mount to use for the containers.
-               The default value is Default which uses the container runtime defaults for
-               readonly paths and masked paths.
-               This requires the ProcMountType feature flag to be enabled.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.bool] read_only_root_filesystem: Whether this container has a read-only root filesystem.
-               Default is false.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.int] run_as_group: The GID to run the entrypoint of the container process.
-               Uses runtime default if unset.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.bool] run_as_non_root: Indicates that the container must run as a non-root user.
-               If true, the Kubelet will validate the image at runtime to ensure that it
-               does not run as UID 0 (root) and fail to start the container if it does.
-               If unset or false, no such validation will be performed.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        :param pulumi.Input[_builtins.int] run_as_user: The UID to run the entrypoint of the container process.
-               Defaults to user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-               Note that this field cannot be set when spec.os.name is windows.
-        """
-        if allow_privilege_escalation is not None:
-            pulumi.set(__self__, "allow_privilege_escalation", allow_privilege_escalation)
-        if app_armor_profile is not None:
-            pulumi.set(__self__, "app_armor_profile", app_armor_profile)
-        if capabilities is not None:
-            pulumi.set(__self__, "capabilities", capabilities)
-        if privileged is not None:
-            pulumi.set(__self__, "privileged", privileged)
-        if proc_mount is not None:
-            pulumi.set(__self__, "proc_mount", proc_mount)
-        if read_only_root_filesystem is not None:
-            pulumi.set(__self__, "read_only_root_filesystem", read_only_root_filesystem)
-        if run_as_group is not None:
-            pulumi.set(__self__, "run_as_group", run_as_group)
-        if run_as_non_root is not None:
-            pulumi.set(__self__, "run_as_non_root", run_as_non_root)
-        if run_as_user is not None:
-            pulumi.set(__self__, "run_as_user", run_as_user)
-        if se_linux_options is not None:
-            pulumi.set(__self__, "se_linux_options", se_linux_options)
-        if seccomp_profile is not None:
-            pulumi.set(__self__, "seccomp_profile", seccomp_profile)
-        if windows_options is not None:
-            pulumi.set(__self__, "windows_options", windows_options)
-
-    @_builtins.property
-    @pulumi.getter(name="allowPrivilegeEscalation")
-    def allow_privilege_escalation(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        AllowPrivilegeEscalation controls whether a process can gain more
-        privileges than its parent process. This bool directly controls if
-        the no_new_privs flag will be set on the container process.
-        AllowPrivilegeEscalation is true always when the container is:
-        1) run as Privileged
-        2) has CAP_SYS_ADMIN
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "allow_privilege_escalation")
-
-    @allow_privilege_escalation.setter
-    def allow_privilege_escalation(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "allow_privilege_escalation", value)
-
-    @_builtins.property
-    @pulumi.getter(name="appArmorProfile")
-    def app_armor_profile(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatchArgs']]:
-        return pulumi.get(self, "app_armor_profile")
-
-    @app_armor_profile.setter
-    def app_armor_profile(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatchArgs']]):
-        pulumi.set(self, "app_armor_profile", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def capabilities(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatchArgs']]:
-        return pulumi.get(self, "capabilities")
-
-    @capabilities.setter
-    def capabilities(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatchArgs']]):
-        pulumi.set(self, "capabilities", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def privileged(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Run container in privileged mode.
-        Processes in privileged containers are essentially equivalent to root on the host.
-        Defaults to false.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "privileged")
-
-    @privileged.setter
-    def privileged(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "privileged", value)
-
-    @_builtins.property
-    @pulumi.getter(name="procMount")
-    def proc_mount(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        procMount denotes the type of proc mount to use for the containers.
-        The default value is Default which uses the container runtime defaults for
-        readonly paths and masked paths.
-        This requires the ProcMountType feature flag to be enabled.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "proc_mount")
-
-    @proc_mount.setter
-    def proc_mount(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "proc_mount", value)
-
-    @_builtins.property
-    @pulumi.getter(name="readOnlyRootFilesystem")
-    def read_only_root_filesystem(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Whether this container has a read-only root filesystem.
-        Default is false.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "read_only_root_filesystem")
-
-    @read_only_root_filesystem.setter
-    def read_only_root_filesystem(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "read_only_root_filesystem", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsGroup")
-    def run_as_group(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        The GID to run the entrypoint of the container process.
-        Uses runtime default if unset.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_group")
-
-    @run_as_group.setter
-    def run_as_group(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "run_as_group", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsNonRoot")
-    def run_as_non_root(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Indicates that the container must run as a non-root user.
-        If true, the Kubelet will validate the image at runtime to ensure that it
-        does not run as UID 0 (root) and fail to start the container if it does.
-        If unset or false, no such validation will be performed.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_non_root")
-
-    @run_as_non_root.setter
-    def run_as_non_root(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "run_as_non_root", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUser")
-    def run_as_user(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        The UID to run the entrypoint of the container process.
-        Defaults to user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_user")
-
-    @run_as_user.setter
-    def run_as_user(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "run_as_user", value)
-
-    @_builtins.property
-    @pulumi.getter(name="seLinuxOptions")
-    def se_linux_options(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatchArgs']]:
-        return pulumi.get(self, "se_linux_options")
-
-    @se_linux_options.setter
-    def se_linux_options(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatchArgs']]):
-        pulumi.set(self, "se_linux_options", value)
-
-    @_builtins.property
-    @pulumi.getter(name="seccompProfile")
-    def seccomp_profile(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatchArgs']]:
-        return pulumi.get(self, "seccomp_profile")
-
-    @seccomp_profile.setter
-    def seccomp_profile(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatchArgs']]):
-        pulumi.set(self, "seccomp_profile", value)
-
-    @_builtins.property
-    @pulumi.getter(name="windowsOptions")
-    def windows_options(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatchArgs']]:
-        return pulumi.get(self, "windows_options")
-
-    @windows_options.setter
-    def windows_options(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatchArgs']]):
-        pulumi.set(self, "windows_options", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatchArgsDict(TypedDict):
-    """
-    The SELinux context to be applied to the container.
-    If unspecified, the container runtime will allocate a random SELinux context for each
-    container.  May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    level: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Level is SELinux level label that applies to the container.
-    """
-    role: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Role is a SELinux role label that applies to the container.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Type is a SELinux type label that applies to the container.
-    """
-    user: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    User is a SELinux user label that applies to the container.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatchArgs:
-    def __init__(__self__, *,
-                 level: pulumi.Input[Optional[_builtins.str]] = None,
-                 role: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None,
-                 user: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The SELinux context to be applied to the container.
-        If unspecified, the container runtime will allocate a random SELinux context for each
-        container.  May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[_builtins.str] level: Level is SELinux level label that applies to the container.
-        :param pulumi.Input[_builtins.str] role: Role is a SELinux role label that applies to the container.
-        :param pulumi.Input[_builtins.str] type: Type is a SELinux type label that applies to the container.
-        :param pulumi.Input[_builtins.str] user: User is a SELinux user label that applies to the container.
-        """
-        if level is not None:
-            pulumi.set(__self__, "level", level)
-        if role is not None:
-            pulumi.set(__self__, "role", role)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-        if user is not None:
-            pulumi.set(__self__, "user", user)
-
-    @_builtins.property
-    @pulumi.getter
-    def level(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Level is SELinux level label that applies to the container.
-        """
-        return pulumi.get(self, "level")
-
-    @level.setter
-    def level(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "level", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def role(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Role is a SELinux role label that applies to the container.
-        """
-        return pulumi.get(self, "role")
-
-    @role.setter
-    def role(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "role", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Type is a SELinux type label that applies to the container.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def user(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        User is a SELinux user label that applies to the container.
-        """
-        return pulumi.get(self, "user")
-
-    @user.setter
-    def user(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "user", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgsDict(TypedDict):
-    """
-    The SELinux context to be applied to the container.
-    If unspecified, the container runtime will allocate a random SELinux context for each
-    container.  May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    level: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Level is SELinux level label that applies to the container.
-    """
-    role: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Role is a SELinux role label that applies to the container.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Type is a SELinux type label that applies to the container.
-    """
-    user: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    User is a SELinux user label that applies to the container.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgs:
-    def __init__(__self__, *,
-                 level: pulumi.Input[Optional[_builtins.str]] = None,
-                 role: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None,
-                 user: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The SELinux context to be applied to the container.
-        If unspecified, the container runtime will allocate a random SELinux context for each
-        container.  May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[_builtins.str] level: Level is SELinux level label that applies to the container.
-        :param pulumi.Input[_builtins.str] role: Role is a SELinux role label that applies to the container.
-        :param pulumi.Input[_builtins.str] type: Type is a SELinux type label that applies to the container.
-        :param pulumi.Input[_builtins.str] user: User is a SELinux user label that applies to the container.
-        """
-        if level is not None:
-            pulumi.set(__self__, "level", level)
-        if role is not None:
-            pulumi.set(__self__, "role", role)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-        if user is not None:
-            pulumi.set(__self__, "user", user)
-
-    @_builtins.property
-    @pulumi.getter
-    def level(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Level is SELinux level label that applies to the container.
-        """
-        return pulumi.get(self, "level")
-
-    @level.setter
-    def level(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "level", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def role(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Role is a SELinux role label that applies to the container.
-        """
-        return pulumi.get(self, "role")
-
-    @role.setter
-    def role(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "role", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Type is a SELinux type label that applies to the container.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def user(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        User is a SELinux user label that applies to the container.
-        """
-        return pulumi.get(self, "user")
-
-    @user.setter
-    def user(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "user", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatchArgsDict(TypedDict):
-    """
-    The seccomp options to use by this container. If seccomp options are
-    provided at both the pod & container level, the container options
-    override the pod options.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    localhost_profile: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    localhostProfile indicates a profile defined in a file on the node should be used.
-    The profile must be preconfigured on the node to work.
-    Must be a descending path, relative to the kubelet's configured seccomp profile location.
-    Must be set if type is "Localhost". Must NOT be set for any other type.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type indicates which kind of seccomp profile will be applied.
-    Valid options are:
-
-    Localhost - a profile defined in a file on the node should be used.
-    RuntimeDefault - the container runtime default profile should be used.
-    Unconfined - no profile should be applied.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatchArgs:
-    def __init__(__self__, *,
-                 localhost_profile: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The seccomp options to use by this container. If seccomp options are
-        provided at both the pod & container level, the container options
-        override the pod options.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[_builtins.str] localhost_profile: localhostProfile indicates a profile defined in a file on the node should be used.
-               The profile must be preconfigured on the node to work.
-               Must be a descending path, relative to the kubelet's configured seccomp profile location.
-               Must be set if type is "Localhost". Must NOT be set for any other type.
-        :param pulumi.Input[_builtins.str] type: type indicates which kind of seccomp profile will be applied.
-               Valid options are:
-
-               Localhost - a profile defined in a file on the node should be used.
-               RuntimeDefault - the container runtime default profile should be used.
-               Unconfined - no profile should be applied.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        localhostProfile indicates a profile defined in a file on the node should be used.
-        The profile must be preconfigured on the node to work.
-        Must be a descending path, relative to the kubelet's configured seccomp profile location.
-        Must be set if type is "Localhost". Must NOT be set for any other type.
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @localhost_profile.setter
-    def localhost_profile(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "localhost_profile", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type indicates which kind of seccomp profile will be applied.
-        Valid options are:
-
-        Localhost - a profile defined in a file on the node should be used.
-        RuntimeDefault - the container runtime default profile should be used.
-        Unconfined - no profile should be applied.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgsDict(TypedDict):
-    """
-    The seccomp options to use by this container. If seccomp options are
-    provided at both the pod & container level, the container options
-    override the pod options.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    localhost_profile: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    localhostProfile indicates a profile defined in a file on the node should be used.
-    The profile must be preconfigured on the node to work.
-    Must be a descending path, relative to the kubelet's configured seccomp profile location.
-    Must be set if type is "Localhost". Must NOT be set for any other type.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type indicates which kind of seccomp profile will be applied.
-    Valid options are:
-
-    Localhost - a profile defined in a file on the node should be used.
-    RuntimeDefault - the container runtime default profile should be used.
-    Unconfined - no profile should be applied.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgs:
-    def __init__(__self__, *,
-                 localhost_profile: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The seccomp options to use by this container. If seccomp options are
-        provided at both the pod & container level, the container options
-        override the pod options.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[_builtins.str] localhost_profile: localhostProfile indicates a profile defined in a file on the node should be used.
-               The profile must be preconfigured on the node to work.
-               Must be a descending path, relative to the kubelet's configured seccomp profile location.
-               Must be set if type is "Localhost". Must NOT be set for any other type.
-        :param pulumi.Input[_builtins.str] type: type indicates which kind of seccomp profile will be applied.
-               Valid options are:
-
-               Localhost - a profile defined in a file on the node should be used.
-               RuntimeDefault - the container runtime default profile should be used.
-               Unconfined - no profile should be applied.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        localhostProfile indicates a profile defined in a file on the node should be used.
-        The profile must be preconfigured on the node to work.
-        Must be a descending path, relative to the kubelet's configured seccomp profile location.
-        Must be set if type is "Localhost". Must NOT be set for any other type.
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @localhost_profile.setter
-    def localhost_profile(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "localhost_profile", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type indicates which kind of seccomp profile will be applied.
-        Valid options are:
-
-        Localhost - a profile defined in a file on the node should be used.
-        RuntimeDefault - the container runtime default profile should be used.
-        Unconfined - no profile should be applied.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatchArgsDict(TypedDict):
-    """
-    The Windows specific settings applied to all containers.
-    If unspecified, the options from the PodSecurityContext will be used.
-    If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is linux.
-    """
-    gmsa_credential_spec: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    GMSACredentialSpec is where the GMSA admission webhook
-    (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-    GMSA credential spec named by the GMSACredentialSpecName field.
-    """
-    gmsa_credential_spec_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    GMSACredentialSpecName is the name of the GMSA credential spec to use.
-    """
-    host_process: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    HostProcess determines if a container should be run as a 'Host Process' container.
-    All of a Pod's containers must have the same effective HostProcess value
-    (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-    In addition, if HostProcess is true then HostNetwork must also be set to true.
-    """
-    run_as_user_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The UserName in Windows to run the entrypoint of the container process.
-    Defaults to the user specified in image metadata if unspecified.
-    May also be set in PodSecurityContext. If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatchArgs:
-    def __init__(__self__, *,
-                 gmsa_credential_spec: pulumi.Input[Optional[_builtins.str]] = None,
-                 gmsa_credential_spec_name: pulumi.Input[Optional[_builtins.str]] = None,
-                 host_process: pulumi.Input[Optional[_builtins.bool]] = None,
-                 run_as_user_name: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The Windows specific settings applied to all containers.
-        If unspecified, the options from the PodSecurityContext will be used.
-        If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is linux.
-
-        :param pulumi.Input[_builtins.str] gmsa_credential_spec: GMSACredentialSpec is where the GMSA admission webhook
-               (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-               GMSA credential spec named by the GMSACredentialSpecName field.
-        :param pulumi.Input[_builtins.str] gmsa_credential_spec_name: GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        :param pulumi.Input[_builtins.bool] host_process: HostProcess determines if a container should be run as a 'Host Process' container.
-               All of a Pod's containers must have the same effective HostProcess value
-               (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-               In addition, if HostProcess is true then HostNetwork must also be set to true.
-        :param pulumi.Input[_builtins.str] run_as_user_name: The UserName in Windows to run the entrypoint of the container process.
-               Defaults to the user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext. If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        if gmsa_credential_spec is not None:
-            pulumi.set(__self__, "gmsa_credential_spec", gmsa_credential_spec)
-        if gmsa_credential_spec_name is not None:
-            pulumi.set(__self__, "gmsa_credential_spec_name", gmsa_credential_spec_name)
-        if host_process is not None:
-            pulumi.set(__self__, "host_process", host_process)
-        if run_as_user_name is not None:
-            pulumi.set(__self__, "run_as_user_name", run_as_user_name)
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpec")
-    def gmsa_credential_spec(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        GMSACredentialSpec is where the GMSA admission webhook
-        (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-        GMSA credential spec named by the GMSACredentialSpecName field.
-        """
-        return pulumi.get(self, "gmsa_credential_spec")
-
-    @gmsa_credential_spec.setter
-    def gmsa_credential_spec(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "gmsa_credential_spec", value)
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpecName")
-    def gmsa_credential_spec_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        """
-        return pulumi.get(self, "gmsa_credential_spec_name")
-
-    @gmsa_credential_spec_name.setter
-    def gmsa_credential_spec_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "gmsa_credential_spec_name", value)
-
-    @_builtins.property
-    @pulumi.getter(name="hostProcess")
-    def host_process(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        HostProcess determines if a container should be run as a 'Host Process' container.
-        All of a Pod's containers must have the same effective HostProcess value
-        (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-        In addition, if HostProcess is true then HostNetwork must also be set to true.
-        """
-        return pulumi.get(self, "host_process")
-
-    @host_process.setter
-    def host_process(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "host_process", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUserName")
-    def run_as_user_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The UserName in Windows to run the entrypoint of the container process.
-        Defaults to the user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext. If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_user_name")
-
-    @run_as_user_name.setter
-    def run_as_user_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "run_as_user_name", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgsDict(TypedDict):
-    """
-    The Windows specific settings applied to all containers.
-    If unspecified, the options from the PodSecurityContext will be used.
-    If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is linux.
-    """
-    gmsa_credential_spec: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    GMSACredentialSpec is where the GMSA admission webhook
-    (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-    GMSA credential spec named by the GMSACredentialSpecName field.
-    """
-    gmsa_credential_spec_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    GMSACredentialSpecName is the name of the GMSA credential spec to use.
-    """
-    host_process: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    HostProcess determines if a container should be run as a 'Host Process' container.
-    All of a Pod's containers must have the same effective HostProcess value
-    (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-    In addition, if HostProcess is true then HostNetwork must also be set to true.
-    """
-    run_as_user_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The UserName in Windows to run the entrypoint of the container process.
-    Defaults to the user specified in image metadata if unspecified.
-    May also be set in PodSecurityContext. If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgs:
-    def __init__(__self__, *,
-                 gmsa_credential_spec: pulumi.Input[Optional[_builtins.str]] = None,
-                 gmsa_credential_spec_name: pulumi.Input[Optional[_builtins.str]] = None,
-                 host_process: pulumi.Input[Optional[_builtins.bool]] = None,
-                 run_as_user_name: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The Windows specific settings applied to all containers.
-        If unspecified, the options from the PodSecurityContext will be used.
-        If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is linux.
-
-        :param pulumi.Input[_builtins.str] gmsa_credential_spec: GMSACredentialSpec is where the GMSA admission webhook
-               (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-               GMSA credential spec named by the GMSACredentialSpecName field.
-        :param pulumi.Input[_builtins.str] gmsa_credential_spec_name: GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        :param pulumi.Input[_builtins.bool] host_process: HostProcess determines if a container should be run as a 'Host Process' container.
-               All of a Pod's containers must have the same effective HostProcess value
-               (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-               In addition, if HostProcess is true then HostNetwork must also be set to true.
-        :param pulumi.Input[_builtins.str] run_as_user_name: The UserName in Windows to run the entrypoint of the container process.
-               Defaults to the user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext. If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        if gmsa_credential_spec is not None:
-            pulumi.set(__self__, "gmsa_credential_spec", gmsa_credential_spec)
-        if gmsa_credential_spec_name is not None:
-            pulumi.set(__self__, "gmsa_credential_spec_name", gmsa_credential_spec_name)
-        if host_process is not None:
-            pulumi.set(__self__, "host_process", host_process)
-        if run_as_user_name is not None:
-            pulumi.set(__self__, "run_as_user_name", run_as_user_name)
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpec")
-    def gmsa_credential_spec(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        GMSACredentialSpec is where the GMSA admission webhook
-        (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-        GMSA credential spec named by the GMSACredentialSpecName field.
-        """
-        return pulumi.get(self, "gmsa_credential_spec")
-
-    @gmsa_credential_spec.setter
-    def gmsa_credential_spec(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "gmsa_credential_spec", value)
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpecName")
-    def gmsa_credential_spec_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        """
-        return pulumi.get(self, "gmsa_credential_spec_name")
-
-    @gmsa_credential_spec_name.setter
-    def gmsa_credential_spec_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "gmsa_credential_spec_name", value)
-
-    @_builtins.property
-    @pulumi.getter(name="hostProcess")
-    def host_process(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        HostProcess determines if a container should be run as a 'Host Process' container.
-        All of a Pod's containers must have the same effective HostProcess value
-        (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-        In addition, if HostProcess is true then HostNetwork must also be set to true.
-        """
-        return pulumi.get(self, "host_process")
-
-    @host_process.setter
-    def host_process(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "host_process", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUserName")
-    def run_as_user_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The UserName in Windows to run the entrypoint of the container process.
-        Defaults to the user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext. If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_user_name")
-
-    @run_as_user_name.setter
-    def run_as_user_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "run_as_user_name", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgsDict(TypedDict):
-    """
-    Container security context.
-    Security context specified here will override the security context set by the operator.
-    By default the operator sets the Tailscale container and the Tailscale init container to privileged
-    for proxies created for Tailscale ingress and egress Service, Connector and ProxyGroup.
-    You can reduce the permissions of the Tailscale container to cap NET_ADMIN by
-    installing device plugin in your cluster and configuring the proxies tun device to be created
-    by the device plugin, see  https://github.com/tailscale/tailscale/issues/10814#issuecomment-2479977752
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context
-    """
-    allow_privilege_escalation: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    AllowPrivilegeEscalation controls whether a process can gain more
-    privileges than its parent process. This bool directly controls if
-    the no_new_privs flag will be set on the container process.
-    AllowPrivilegeEscalation is true always when the container is:
-    1) run as Privileged
-    2) has CAP_SYS_ADMIN
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    app_armor_profile: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgs']]]
-    capabilities: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgs']]]
-    privileged: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Run container in privileged mode.
-    Processes in privileged containers are essentially equivalent to root on the host.
-    Defaults to false.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    proc_mount: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    procMount denotes the type of proc mount to use for the containers.
-    The default value is Default which uses the container runtime defaults for
-    readonly paths and masked paths.
-    This requires the ProcMountType feature flag to be enabled.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    read_only_root_filesystem: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Whether this container has a read-only root filesystem.
-    Default is false.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    run_as_group: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    The GID to run the entrypoint of the container process.
-    Uses runtime default if unset.
-    May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    run_as_non_root: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Indicates that the container must run as a non-root user.
-    If true, the Kubelet will validate the image at runtime to ensure that it
-    does not run as UID 0 (root) and fail to start the container if it does.
-    If unset or false, no such validation will be performed.
-    May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    """
-    run_as_user: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    The UID to run the entrypoint of the container process.
-    Defaults to user specified in image metadata if unspecified.
-    May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    se_linux_options: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgs']]]
-    seccomp_profile: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgs']]]
-    windows_options: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgs:
-    def __init__(__self__, *,
-                 allow_privilege_escalation: pulumi.Input[Optional[_builtins.bool]] = None,
-                 app_armor_profile: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgs']] = None,
-                 capabilities: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgs']] = None,
-                 privileged: pulumi.Input[Optional[_builtins.bool]] = None,
-                 proc_mount: pulumi.Input[Optional[_builtins.str]] = None,
-                 read_only_root_filesystem: pulumi.Input[Optional[_builtins.bool]] = None,
-                 run_as_group: pulumi.Input[Optional[_builtins.int]] = None,
-                 run_as_non_root: pulumi.Input[Optional[_builtins.bool]] = None,
-                 run_as_user: pulumi.Input[Optional[_builtins.int]] = None,
-                 se_linux_options: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgs']] = None,
-                 seccomp_profile: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgs']] = None,
-                 windows_options: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgs']] = None):
-        """
-        Container security context.
-        Security context specified here will override the security context set by the operator.
-        By default the operator sets the Tailscale container and the Tailscale init container to privileged
-        for proxies created for Tailscale ingress and egress Service, Connector and ProxyGroup.
-        You can reduce the permissions of the Tailscale container to cap NET_ADMIN by
-        installing device plugin in your cluster and configuring the proxies tun device to be created
-        by the device plugin, see  https://github.com/tailscale/tailscale/issues/10814#issuecomment-2479977752
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context
-
-        :param pulumi.Input[_builtins.bool] allow_privilege_escalation: AllowPrivilegeEscalation controls whether a process can gain more
-               privileges than its parent process. This bool directly controls if
-               the no_new_privs flag will be set on the container process.
-               AllowPrivilegeEscalation is true always when the container is:
-               1) run as Privileged
-               2) has CAP_SYS_ADMIN
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.bool] privileged: Run container in privileged mode.
-               Processes in privileged containers are essentially equivalent to root on the host.
-               Defaults to false.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.str] proc_mount: procMount denotes the type of proc mount to use for the containers.
-               The default value is Default which uses the container runtime defaults for
-               readonly paths and masked paths.
-               This requires the ProcMountType feature flag to be enabled.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.bool] read_only_root_filesystem: Whether this container has a read-only root filesystem.
-               Default is false.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.int] run_as_group: The GID to run the entrypoint of the container process.
-               Uses runtime default if unset.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.bool] run_as_non_root: Indicates that the container must run as a non-root user.
-               If true, the Kubelet will validate the image at runtime to ensure that it
-               does not run as UID 0 (root) and fail to start the container if it does.
-               If unset or false, no such validation will be performed.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        :param pulumi.Input[_builtins.int] run_as_user: The UID to run the entrypoint of the container process.
-               Defaults to user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-               Note that this field cannot be set when spec.os.name is windows.
-        """
-        if allow_privilege_escalation is not None:
-            pulumi.set(__self__, "allow_privilege_escalation", allow_privilege_escalation)
-        if app_armor_profile is not None:
-            pulumi.set(__self__, "app_armor_profile", app_armor_profile)
-        if capabilities is not None:
-            pulumi.set(__self__, "capabilities", capabilities)
-        if privileged is not None:
-            pulumi.set(__self__, "privileged", privileged)
-        if proc_mount is not None:
-            pulumi.set(__self__, "proc_mount", proc_mount)
-        if read_only_root_filesystem is not None:
-            pulumi.set(__self__, "read_only_root_filesystem", read_only_root_filesystem)
-        if run_as_group is not None:
-            pulumi.set(__self__, "run_as_group", run_as_group)
-        if run_as_non_root is not None:
-            pulumi.set(__self__, "run_as_non_root", run_as_non_root)
-        if run_as_user is not None:
-            pulumi.set(__self__, "run_as_user", run_as_user)
-        if se_linux_options is not None:
-            pulumi.set(__self__, "se_linux_options", se_linux_options)
-        if seccomp_profile is not None:
-            pulumi.set(__self__, "seccomp_profile", seccomp_profile)
-        if windows_options is not None:
-            pulumi.set(__self__, "windows_options", windows_options)
-
-    @_builtins.property
-    @pulumi.getter(name="allowPrivilegeEscalation")
-    def allow_privilege_escalation(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        AllowPrivilegeEscalation controls whether a process can gain more
-        privileges than its parent process. This bool directly controls if
-        the no_new_privs flag will be set on the container process.
-        AllowPrivilegeEscalation is true always when the container is:
-        1) run as Privileged
-        2) has CAP_SYS_ADMIN
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "allow_privilege_escalation")
-
-    @allow_privilege_escalation.setter
-    def allow_privilege_escalation(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "allow_privilege_escalation", value)
-
-    @_builtins.property
-    @pulumi.getter(name="appArmorProfile")
-    def app_armor_profile(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgs']]:
-        return pulumi.get(self, "app_armor_profile")
-
-    @app_armor_profile.setter
-    def app_armor_profile(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgs']]):
-        pulumi.set(self, "app_armor_profile", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def capabilities(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgs']]:
-        return pulumi.get(self, "capabilities")
-
-    @capabilities.setter
-    def capabilities(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgs']]):
-        pulumi.set(self, "capabilities", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def privileged(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Run container in privileged mode.
-        Processes in privileged containers are essentially equivalent to root on the host.
-        Defaults to false.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "privileged")
-
-    @privileged.setter
-    def privileged(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "privileged", value)
-
-    @_builtins.property
-    @pulumi.getter(name="procMount")
-    def proc_mount(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        procMount denotes the type of proc mount to use for the containers.
-        The default value is Default which uses the container runtime defaults for
-        readonly paths and masked paths.
-        This requires the ProcMountType feature flag to be enabled.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "proc_mount")
-
-    @proc_mount.setter
-    def proc_mount(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "proc_mount", value)
-
-    @_builtins.property
-    @pulumi.getter(name="readOnlyRootFilesystem")
-    def read_only_root_filesystem(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Whether this container has a read-only root filesystem.
-        Default is false.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "read_only_root_filesystem")
-
-    @read_only_root_filesystem.setter
-    def read_only_root_filesystem(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "read_only_root_filesystem", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsGroup")
-    def run_as_group(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        The GID to run the entrypoint of the container process.
-        Uses runtime default if unset.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_group")
-
-    @run_as_group.setter
-    def run_as_group(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "run_as_group", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsNonRoot")
-    def run_as_non_root(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Indicates that the container must run as a non-root user.
-        If true, the Kubelet will validate the image at runtime to ensure that it
-        does not run as UID 0 (root) and fail to start the container if it does.
-        If unset or false, no such validation will be performed.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_non_root")
-
-    @run_as_non_root.setter
-    def run_as_non_root(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "run_as_non_root", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUser")
-    def run_as_user(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        The UID to run the entrypoint of the container process.
-        Defaults to user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_user")
-
-    @run_as_user.setter
-    def run_as_user(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "run_as_user", value)
-
-    @_builtins.property
-    @pulumi.getter(name="seLinuxOptions")
-    def se_linux_options(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgs']]:
-        return pulumi.get(self, "se_linux_options")
-
-    @se_linux_options.setter
-    def se_linux_options(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgs']]):
-        pulumi.set(self, "se_linux_options", value)
-
-    @_builtins.property
-    @pulumi.getter(name="seccompProfile")
-    def seccomp_profile(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgs']]:
-        return pulumi.get(self, "seccomp_profile")
-
-    @seccomp_profile.setter
-    def seccomp_profile(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgs']]):
-        pulumi.set(self, "seccomp_profile", value)
-
-    @_builtins.property
-    @pulumi.getter(name="windowsOptions")
-    def windows_options(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgs']]:
-        return pulumi.get(self, "windows_options")
-
-    @windows_options.setter
-    def windows_options(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgs']]):
-        pulumi.set(self, "windows_options", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleContainerArgsDict(TypedDict):
-    """
-    Configuration for the proxy container running tailscale.
-    """
-    debug: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerDebugArgs']]]
-    env: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgs']]]]]
-    """
-    List of environment variables to set in the container.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-    Note that environment variables provided here will take precedence
-    over Tailscale-specific environment variables set by the operator,
-    however running proxies with custom values for Tailscale environment
-    variables (i.e TS_USERSPACE) is not recommended and might break in
-    the future.
-    """
-    image: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Container image name. By default images are pulled from docker.io/tailscale,
-    but the official images are also available at ghcr.io/tailscale.
-
-    For all uses except on ProxyGroups of type "kube-apiserver", this image must
-    be either tailscale/tailscale, or an equivalent mirror of that image.
-    To apply to ProxyGroups of type "kube-apiserver", this image must be
-    tailscale/k8s-proxy or a mirror of that image.
-
-    For "tailscale/tailscale"-based proxies, specifying image name here will
-    override any proxy image values specified via the Kubernetes operator's
-    Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-    For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-    configure your own default, and this field is the only way to use a
-    custom image.
-
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-    """
-    image_pull_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-    """
-    resources: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesArgs']]]
-    security_context: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerArgs:
-    def __init__(__self__, *,
-                 debug: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerDebugArgs']] = None,
-                 env: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgs']]]] = None,
-                 image: pulumi.Input[Optional[_builtins.str]] = None,
-                 image_pull_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 resources: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesArgs']] = None,
-                 security_context: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgs']] = None):
-        """
-        Configuration for the proxy container running tailscale.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgs']]] env: List of environment variables to set in the container.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-               Note that environment variables provided here will take precedence
-               over Tailscale-specific environment variables set by the operator,
-               however running proxies with custom values for Tailscale environment
-               variables (i.e TS_USERSPACE) is not recommended and might break in
-               the future.
-        :param pulumi.Input[_builtins.str] image: Container image name. By default images are pulled from docker.io/tailscale,
-               but the official images are also available at ghcr.io/tailscale.
-
-               For all uses except on ProxyGroups of type "kube-apiserver", this image must
-               be either tailscale/tailscale, or an equivalent mirror of that image.
-               To apply to ProxyGroups of type "kube-apiserver", this image must be
-               tailscale/k8s-proxy or a mirror of that image.
-
-               For "tailscale/tailscale"-based proxies, specifying image name here will
-               override any proxy image values specified via the Kubernetes operator's
-               Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-               For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-               configure your own default, and this field is the only way to use a
-               custom image.
-
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        :param pulumi.Input[_builtins.str] image_pull_policy: Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        if debug is not None:
-            pulumi.set(__self__, "debug", debug)
-        if env is not None:
-            pulumi.set(__self__, "env", env)
-        if image is not None:
-            pulumi.set(__self__, "image", image)
-        if image_pull_policy is not None:
-            pulumi.set(__self__, "image_pull_policy", image_pull_policy)
-        if resources is not None:
-            pulumi.set(__self__, "resources", resources)
-        if security_context is not None:
-            pulumi.set(__self__, "security_context", security_context)
-
-    @_builtins.property
-    @pulumi.getter
-    def debug(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerDebugArgs']]:
-        return pulumi.get(self, "debug")
-
-    @debug.setter
-    def debug(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerDebugArgs']]):
-        pulumi.set(self, "debug", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def env(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgs']]]]:
-        """
-        List of environment variables to set in the container.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-        Note that environment variables provided here will take precedence
-        over Tailscale-specific environment variables set by the operator,
-        however running proxies with custom values for Tailscale environment
-        variables (i.e TS_USERSPACE) is not recommended and might break in
-        the future.
-        """
-        return pulumi.get(self, "env")
-
-    @env.setter
-    def env(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgs']]]]):
-        pulumi.set(self, "env", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def image(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Container image name. By default images are pulled from docker.io/tailscale,
-        but the official images are also available at ghcr.io/tailscale.
-
-        For all uses except on ProxyGroups of type "kube-apiserver", this image must
-        be either tailscale/tailscale, or an equivalent mirror of that image.
-        To apply to ProxyGroups of type "kube-apiserver", this image must be
-        tailscale/k8s-proxy or a mirror of that image.
-
-        For "tailscale/tailscale"-based proxies, specifying image name here will
-        override any proxy image values specified via the Kubernetes operator's
-        Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-        For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-        configure your own default, and this field is the only way to use a
-        custom image.
-
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        return pulumi.get(self, "image")
-
-    @image.setter
-    def image(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "image", value)
-
-    @_builtins.property
-    @pulumi.getter(name="imagePullPolicy")
-    def image_pull_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        return pulumi.get(self, "image_pull_policy")
-
-    @image_pull_policy.setter
-    def image_pull_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "image_pull_policy", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def resources(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesArgs']]:
-        return pulumi.get(self, "resources")
-
-    @resources.setter
-    def resources(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesArgs']]):
-        pulumi.set(self, "resources", value)
-
-    @_builtins.property
-    @pulumi.getter(name="securityContext")
-    def security_context(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgs']]:
-        return pulumi.get(self, "security_context")
-
-    @security_context.setter
-    def security_context(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgs']]):
-        pulumi.set(self, "security_context", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatchArgsDict(TypedDict):
-    """
-    Configuration for enabling extra debug information in the container.
-    Not recommended for production use.
-    """
-    enable: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-    and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-    9001 is a container port named "debug". The endpoints and their responses
-    may change in backwards incompatible ways in the future, and should not
-    be considered stable.
-
-    In 1.78.x and 1.80.x, this setting will default to the value of
-    .spec.metrics.enable, and requests to the "metrics" port matching the
-    mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-    this setting will default to false, and no requests will be proxied.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatchArgs:
-    def __init__(__self__, *,
-                 enable: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        Configuration for enabling extra debug information in the container.
-        Not recommended for production use.
-
-        :param pulumi.Input[_builtins.bool] enable: Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-               and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-               9001 is a container port named "debug". The endpoints and their responses
-               may change in backwards incompatible ways in the future, and should not
-               be considered stable.
-
-               In 1.78.x and 1.80.x, this setting will default to the value of
-               .spec.metrics.enable, and requests to the "metrics" port matching the
-               mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-               this setting will default to false, and no requests will be proxied.
-        """
-        if enable is not None:
-            pulumi.set(__self__, "enable", enable)
-
-    @_builtins.property
-    @pulumi.getter
-    def enable(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-        and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-        9001 is a container port named "debug". The endpoints and their responses
-        may change in backwards incompatible ways in the future, and should not
-        be considered stable.
-
-        In 1.78.x and 1.80.x, this setting will default to the value of
-        .spec.metrics.enable, and requests to the "metrics" port matching the
-        mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-        this setting will default to false, and no requests will be proxied.
-        """
-        return pulumi.get(self, "enable")
-
-    @enable.setter
-    def enable(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "enable", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgsDict(TypedDict):
-    """
-    Configuration for enabling extra debug information in the container.
-    Not recommended for production use.
-    """
-    enable: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-    and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-    9001 is a container port named "debug". The endpoints and their responses
-    may change in backwards incompatible ways in the future, and should not
-    be considered stable.
-
-    In 1.78.x and 1.80.x, this setting will default to the value of
-    .spec.metrics.enable, and requests to the "metrics" port matching the
-    mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-    this setting will default to false, and no requests will be proxied.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgs:
-    def __init__(__self__, *,
-                 enable: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        Configuration for enabling extra debug information in the container.
-        Not recommended for production use.
-
-        :param pulumi.Input[_builtins.bool] enable: Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-               and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-               9001 is a container port named "debug". The endpoints and their responses
-               may change in backwards incompatible ways in the future, and should not
-               be considered stable.
-
-               In 1.78.x and 1.80.x, this setting will default to the value of
-               .spec.metrics.enable, and requests to the "metrics" port matching the
-               mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-               this setting will default to false, and no requests will be proxied.
-        """
-        if enable is not None:
-            pulumi.set(__self__, "enable", enable)
-
-    @_builtins.property
-    @pulumi.getter
-    def enable(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-        and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-        9001 is a container port named "debug". The endpoints and their responses
-        may change in backwards incompatible ways in the future, and should not
-        be considered stable.
-
-        In 1.78.x and 1.80.x, this setting will default to the value of
-        .spec.metrics.enable, and requests to the "metrics" port matching the
-        mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-        this setting will default to false, and no requests will be proxied.
-        """
-        return pulumi.get(self, "enable")
-
-    @enable.setter
-    def enable(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "enable", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgsDict(TypedDict):
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the environment variable. Must be a C_IDENTIFIER.
-    """
-    value: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Variable references $(VAR_NAME) are expanded using the previously defined
-     environment variables in the container and any service environment
-    variables. If a variable cannot be resolved, the reference in the input
-    string will be unchanged. Double $$ are reduced to a single $, which
-    allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-    produce the string literal "$(VAR_NAME)". Escaped references will never
-    be expanded, regardless of whether the variable exists or not. Defaults
-    to "".
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgs:
-    def __init__(__self__, *,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 value: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        :param pulumi.Input[_builtins.str] name: Name of the environment variable. Must be a C_IDENTIFIER.
-        :param pulumi.Input[_builtins.str] value: Variable references $(VAR_NAME) are expanded using the previously defined
-                environment variables in the container and any service environment
-               variables. If a variable cannot be resolved, the reference in the input
-               string will be unchanged. Double $$ are reduced to a single $, which
-               allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-               produce the string literal "$(VAR_NAME)". Escaped references will never
-               be expanded, regardless of whether the variable exists or not. Defaults
-               to "".
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the environment variable. Must be a C_IDENTIFIER.
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Variable references $(VAR_NAME) are expanded using the previously defined
-         environment variables in the container and any service environment
-        variables. If a variable cannot be resolved, the reference in the input
-        string will be unchanged. Double $$ are reduced to a single $, which
-        allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-        produce the string literal "$(VAR_NAME)". Escaped references will never
-        be expanded, regardless of whether the variable exists or not. Defaults
-        to "".
-        """
-        return pulumi.get(self, "value")
-
-    @value.setter
-    def value(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "value", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgsDict(TypedDict):
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name of the environment variable. Must be a C_IDENTIFIER.
-    """
-    value: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Variable references $(VAR_NAME) are expanded using the previously defined
-     environment variables in the container and any service environment
-    variables. If a variable cannot be resolved, the reference in the input
-    string will be unchanged. Double $$ are reduced to a single $, which
-    allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-    produce the string literal "$(VAR_NAME)". Escaped references will never
-    be expanded, regardless of whether the variable exists or not. Defaults
-    to "".
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs:
-    def __init__(__self__, *,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 value: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        :param pulumi.Input[_builtins.str] name: Name of the environment variable. Must be a C_IDENTIFIER.
-        :param pulumi.Input[_builtins.str] value: Variable references $(VAR_NAME) are expanded using the previously defined
-                environment variables in the container and any service environment
-               variables. If a variable cannot be resolved, the reference in the input
-               string will be unchanged. Double $$ are reduced to a single $, which
-               allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-               produce the string literal "$(VAR_NAME)". Escaped references will never
-               be expanded, regardless of whether the variable exists or not. Defaults
-               to "".
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name of the environment variable. Must be a C_IDENTIFIER.
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Variable references $(VAR_NAME) are expanded using the previously defined
-         environment variables in the container and any service environment
-        variables. If a variable cannot be resolved, the reference in the input
-        string will be unchanged. Double $$ are reduced to a single $, which
-        allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-        produce the string literal "$(VAR_NAME)". Escaped references will never
-        be expanded, regardless of whether the variable exists or not. Defaults
-        to "".
-        """
-        return pulumi.get(self, "value")
-
-    @value.setter
-    def value(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "value", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerPatchArgsDict(TypedDict):
-    """
-    Configuration for the proxy init container that enables forwarding.
-    Not valid to apply to ProxyGroups of type "kube-apiserver".
-    """
-    debug: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatchArgs']]]
-    env: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgs']]]]]
-    """
-    List of environment variables to set in the container.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-    Note that environment variables provided here will take precedence
-    over Tailscale-specific environment variables set by the operator,
-    however running proxies with custom values for Tailscale environment
-    variables (i.e TS_USERSPACE) is not recommended and might break in
-    the future.
-    """
-    image: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Container image name. By default images are pulled from docker.io/tailscale,
-    but the official images are also available at ghcr.io/tailscale.
-
-    For all uses except on ProxyGroups of type "kube-apiserver", this image must
-    be either tailscale/tailscale, or an equivalent mirror of that image.
-    To apply to ProxyGroups of type "kube-apiserver", this image must be
-    tailscale/k8s-proxy or a mirror of that image.
-
-    For "tailscale/tailscale"-based proxies, specifying image name here will
-    override any proxy image values specified via the Kubernetes operator's
-    Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-    For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-    configure your own default, and this field is the only way to use a
-    custom image.
-
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-    """
-    image_pull_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-    """
-    resources: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatchArgs']]]
-    security_context: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatchArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerPatchArgs:
-    def __init__(__self__, *,
-                 debug: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatchArgs']] = None,
-                 env: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgs']]]] = None,
-                 image: pulumi.Input[Optional[_builtins.str]] = None,
-                 image_pull_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 resources: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatchArgs']] = None,
-                 security_context: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatchArgs']] = None):
-        """
-        Configuration for the proxy init container that enables forwarding.
-        Not valid to apply to ProxyGroups of type "kube-apiserver".
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgs']]] env: List of environment variables to set in the container.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-               Note that environment variables provided here will take precedence
-               over Tailscale-specific environment variables set by the operator,
-               however running proxies with custom values for Tailscale environment
-               variables (i.e TS_USERSPACE) is not recommended and might break in
-               the future.
-        :param pulumi.Input[_builtins.str] image: Container image name. By default images are pulled from docker.io/tailscale,
-               but the official images are also available at ghcr.io/tailscale.
-
-               For all uses except on ProxyGroups of type "kube-apiserver", this image must
-               be either tailscale/tailscale, or an equivalent mirror of that image.
-               To apply to ProxyGroups of type "kube-apiserver", this image must be
-               tailscale/k8s-proxy or a mirror of that image.
-
-               For "tailscale/tailscale"-based proxies, specifying image name here will
-               override any proxy image values specified via the Kubernetes operator's
-               Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-               For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-               configure your own default, and this field is the only way to use a
-               custom image.
-
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        :param pulumi.Input[_builtins.str] image_pull_policy: Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        if debug is not None:
-            pulumi.set(__self__, "debug", debug)
-        if env is not None:
-            pulumi.set(__self__, "env", env)
-        if image is not None:
-            pulumi.set(__self__, "image", image)
-        if image_pull_policy is not None:
-            pulumi.set(__self__, "image_pull_policy", image_pull_policy)
-        if resources is not None:
-            pulumi.set(__self__, "resources", resources)
-        if security_context is not None:
-            pulumi.set(__self__, "security_context", security_context)
-
-    @_builtins.property
-    @pulumi.getter
-    def debug(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatchArgs']]:
-        return pulumi.get(self, "debug")
-
-    @debug.setter
-    def debug(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatchArgs']]):
-        pulumi.set(self, "debug", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def env(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgs']]]]:
-        """
-        List of environment variables to set in the container.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-        Note that environment variables provided here will take precedence
-        over Tailscale-specific environment variables set by the operator,
-        however running proxies with custom values for Tailscale environment
-        variables (i.e TS_USERSPACE) is not recommended and might break in
-        the future.
-        """
-        return pulumi.get(self, "env")
-
-    @env.setter
-    def env(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgs']]]]):
-        pulumi.set(self, "env", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def image(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Container image name. By default images are pulled from docker.io/tailscale,
-        but the official images are also available at ghcr.io/tailscale.
-
-        For all uses except on ProxyGroups of type "kube-apiserver", this image must
-        be either tailscale/tailscale, or an equivalent mirror of that image.
-        To apply to ProxyGroups of type "kube-apiserver", this image must be
-        tailscale/k8s-proxy or a mirror of that image.
-
-        For "tailscale/tailscale"-based proxies, specifying image name here will
-        override any proxy image values specified via the Kubernetes operator's
-        Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-        For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-        configure your own default, and this field is the only way to use a
-        custom image.
-
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        return pulumi.get(self, "image")
-
-    @image.setter
-    def image(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "image", value)
-
-    @_builtins.property
-    @pulumi.getter(name="imagePullPolicy")
-    def image_pull_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        return pulumi.get(self, "image_pull_policy")
-
-    @image_pull_policy.setter
-    def image_pull_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "image_pull_policy", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def resources(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatchArgs']]:
-        return pulumi.get(self, "resources")
-
-    @resources.setter
-    def resources(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatchArgs']]):
-        pulumi.set(self, "resources", value)
-
-    @_builtins.property
-    @pulumi.getter(name="securityContext")
-    def security_context(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatchArgs']]:
-        return pulumi.get(self, "security_context")
-
-    @security_context.setter
-    def security_context(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatchArgs']]):
-        pulumi.set(self, "security_context", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgsDict(TypedDict):
-    """
-    ResourceClaim references one entry in PodSpec.ResourceClaims.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name must match the name of one entry in pod.spec.resourceClaims of
-    the Pod where this field is used. It makes that resource available
-    inside a container.
-    """
-    request: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Request is the name chosen for a request in the referenced claim.
-    If empty, everything from the claim is made available, otherwise
-    only the result of this request.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgs:
-    def __init__(__self__, *,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 request: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        ResourceClaim references one entry in PodSpec.ResourceClaims.
-
-        :param pulumi.Input[_builtins.str] name: Name must match the name of one entry in pod.spec.resourceClaims of
-               the Pod where this field is used. It makes that resource available
-               inside a container.
-        :param pulumi.Input[_builtins.str] request: Request is the name chosen for a request in the referenced claim.
-               If empty, everything from the claim is made available, otherwise
-               only the result of this request.
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if request is not None:
-            pulumi.set(__self__, "request", request)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name must match the name of one entry in pod.spec.resourceClaims of
-        the Pod where this field is used. It makes that resource available
-        inside a container.
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def request(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Request is the name chosen for a request in the referenced claim.
-        If empty, everything from the claim is made available, otherwise
-        only the result of this request.
-        """
-        return pulumi.get(self, "request")
-
-    @request.setter
-    def request(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "request", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgsDict(TypedDict):
-    """
-    ResourceClaim references one entry in PodSpec.ResourceClaims.
-    """
-    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Name must match the name of one entry in pod.spec.resourceClaims of
-    the Pod where this field is used. It makes that resource available
-    inside a container.
-    """
-    request: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Request is the name chosen for a request in the referenced claim.
-    If empty, everything from the claim is made available, otherwise
-    only the result of this request.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs:
-    def __init__(__self__, *,
-                 name: pulumi.Input[Optional[_builtins.str]] = None,
-                 request: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        ResourceClaim references one entry in PodSpec.ResourceClaims.
-
-        :param pulumi.Input[_builtins.str] name: Name must match the name of one entry in pod.spec.resourceClaims of
-               the Pod where this field is used. It makes that resource available
-               inside a container.
-        :param pulumi.Input[_builtins.str] request: Request is the name chosen for a request in the referenced claim.
-               If empty, everything from the claim is made available, otherwise
-               only the result of this request.
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if request is not None:
-            pulumi.set(__self__, "request", request)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Name must match the name of one entry in pod.spec.resourceClaims of
-        the Pod where this field is used. It makes that resource available
-        inside a container.
-        """
-        return pulumi.get(self, "name")
-
-    @name.setter
-    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "name", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def request(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Request is the name chosen for a request in the referenced claim.
-        If empty, everything from the claim is made available, otherwise
-        only the result of this request.
-        """
-        return pulumi.get(self, "request")
-
-    @request.setter
-    def request(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "request", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatchArgsDict(TypedDict):
-    """
-    Container resource requirements.
-    By default Tailscale Kubernetes operator does not apply any resource
-    requirements. The amount of resources required wil depend on the
-    amount of resources the operator needs to parse, usage patterns and
-    cluster size.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#resources
-    """
-    claims: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgs']]]]]
-    """
-    Claims lists the names of resources, defined in spec.resourceClaims,
-    that are used by this container.
-
-    This field depends on the
-    DynamicResourceAllocation feature gate.
-
-    This field is immutable. It can only be set for containers.
-    """
-    limits: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]]
-    """
-    Limits describes the maximum amount of compute resources allowed.
-    More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-    """
-    requests: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]]
-    """
-    Requests describes the minimum amount of compute resources required.
-    If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-    otherwise to an implementation-defined value. Requests cannot exceed Limits.
-    More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatchArgs:
-    def __init__(__self__, *,
-                 claims: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgs']]]] = None,
-                 limits: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]] = None,
-                 requests: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]] = None):
-        """
-        Container resource requirements.
-        By default Tailscale Kubernetes operator does not apply any resource
-        requirements. The amount of resources required wil depend on the
-        amount of resources the operator needs to parse, usage patterns and
-        cluster size.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#resources
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgs']]] claims: Claims lists the names of resources, defined in spec.resourceClaims,
-               that are used by this container.
-
-               This field depends on the
-               DynamicResourceAllocation feature gate.
-
-               This field is immutable. It can only be set for containers.
-        :param pulumi.Input[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]] limits: Limits describes the maximum amount of compute resources allowed.
-               More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        :param pulumi.Input[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]] requests: Requests describes the minimum amount of compute resources required.
-               If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-               otherwise to an implementation-defined value. Requests cannot exceed Limits.
-               More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        if claims is not None:
-            pulumi.set(__self__, "claims", claims)
-        if limits is not None:
-            pulumi.set(__self__, "limits", limits)
-        if requests is not None:
-            pulumi.set(__self__, "requests", requests)
-
-    @_builtins.property
-    @pulumi.getter
-    def claims(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgs']]]]:
-        """
-        Claims lists the names of resources, defined in spec.resourceClaims,
-        that are used by this container.
-
-        This field depends on the
-        DynamicResourceAllocation feature gate.
-
-        This field is immutable. It can only be set for containers.
-        """
-        return pulumi.get(self, "claims")
-
-    @claims.setter
-    def claims(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgs']]]]):
-        pulumi.set(self, "claims", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def limits(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]:
-        """
-        Limits describes the maximum amount of compute resources allowed.
-        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        return pulumi.get(self, "limits")
-
-    @limits.setter
-    def limits(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]):
-        pulumi.set(self, "limits", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def requests(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]:
-        """
-        Requests describes the minimum amount of compute resources required.
-        If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-        otherwise to an implementation-defined value. Requests cannot exceed Limits.
-        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        return pulumi.get(self, "requests")
-
-    @requests.setter
-    def requests(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]):
-        pulumi.set(self, "requests", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgsDict(TypedDict):
-    """
-    Container resource requirements.
-    By default Tailscale Kubernetes operator does not apply any resource
-    requirements. The amount of resources required wil depend on the
-    amount of resources the operator needs to parse, usage patterns and
-    cluster size.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#resources
-    """
-    claims: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs']]]]]
-    """
-    Claims lists the names of resources, defined in spec.resourceClaims,
-    that are used by this container.
-
-    This field depends on the
-    DynamicResourceAllocation feature gate.
-
-    This field is immutable. It can only be set for containers.
-    """
-    limits: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]]
-    """
-    Limits describes the maximum amount of compute resources allowed.
-    More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-    """
-    requests: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]]
-    """
-    Requests describes the minimum amount of compute resources required.
-    If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-    otherwise to an implementation-defined value. Requests cannot exceed Limits.
-    More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgs:
-    def __init__(__self__, *,
-                 claims: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs']]]] = None,
-                 limits: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]] = None,
-                 requests: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]] = None):
-        """
-        Container resource requirements.
-        By default Tailscale Kubernetes operator does not apply any resource
-        requirements. The amount of resources required wil depend on the
-        amount of resources the operator needs to parse, usage patterns and
-        cluster size.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#resources
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs']]] claims: Claims lists the names of resources, defined in spec.resourceClaims,
-               that are used by this container.
-
-               This field depends on the
-               DynamicResourceAllocation feature gate.
-
-               This field is immutable. It can only be set for containers.
-        :param pulumi.Input[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]] limits: Limits describes the maximum amount of compute resources allowed.
-               More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        :param pulumi.Input[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]] requests: Requests describes the minimum amount of compute resources required.
-               If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-               otherwise to an implementation-defined value. Requests cannot exceed Limits.
-               More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        if claims is not None:
-            pulumi.set(__self__, "claims", claims)
-        if limits is not None:
-            pulumi.set(__self__, "limits", limits)
-        if requests is not None:
-            pulumi.set(__self__, "requests", requests)
-
-    @_builtins.property
-    @pulumi.getter
-    def claims(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs']]]]:
-        """
-        Claims lists the names of resources, defined in spec.resourceClaims,
-        that are used by this container.
-
-        This field depends on the
-        DynamicResourceAllocation feature gate.
-
-        This field is immutable. It can only be set for containers.
-        """
-        return pulumi.get(self, "claims")
-
-    @claims.setter
-    def claims(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs']]]]):
-        pulumi.set(self, "claims", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def limits(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]:
-        """
-        Limits describes the maximum amount of compute resources allowed.
-        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        return pulumi.get(self, "limits")
-
-    @limits.setter
-    def limits(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]):
-        pulumi.set(self, "limits", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def requests(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]:
-        """
-        Requests describes the minimum amount of compute resources required.
-        If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-        otherwise to an implementation-defined value. Requests cannot exceed Limits.
-        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        return pulumi.get(self, "requests")
-
-    @requests.setter
-    def requests(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]):
-        pulumi.set(self, "requests", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatchArgsDict(TypedDict):
-    """
-    appArmorProfile is the AppArmor options to use by this container. If set, this profile
-    overrides the pod's appArmorProfile.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    localhost_profile: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    localhostProfile indicates a profile loaded on the node that should be used.
-    The profile must be preconfigured on the node to work.
-    Must match the loaded name of the profile.
-    Must be set if and only if type is "Localhost".
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type indicates which kind of AppArmor profile will be applied.
-    Valid options are:
-      Localhost - a profile pre-loaded on the node.
-      RuntimeDefault - the container runtime's default profile.
-      Unconfined - no AppArmor enforcement.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatchArgs:
-    def __init__(__self__, *,
-                 localhost_profile: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        appArmorProfile is the AppArmor options to use by this container. If set, this profile
-        overrides the pod's appArmorProfile.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[_builtins.str] localhost_profile: localhostProfile indicates a profile loaded on the node that should be used.
-               The profile must be preconfigured on the node to work.
-               Must match the loaded name of the profile.
-               Must be set if and only if type is "Localhost".
-        :param pulumi.Input[_builtins.str] type: type indicates which kind of AppArmor profile will be applied.
-               Valid options are:
-                 Localhost - a profile pre-loaded on the node.
-                 RuntimeDefault - the container runtime's default profile.
-                 Unconfined - no AppArmor enforcement.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        localhostProfile indicates a profile loaded on the node that should be used.
-        The profile must be preconfigured on the node to work.
-        Must match the loaded name of the profile.
-        Must be set if and only if type is "Localhost".
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @localhost_profile.setter
-    def localhost_profile(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "localhost_profile", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type indicates which kind of AppArmor profile will be applied.
-        Valid options are:
-          Localhost - a profile pre-loaded on the node.
-          RuntimeDefault - the container runtime's default profile.
-          Unconfined - no AppArmor enforcement.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfileArgsDict(TypedDict):
-    """
-    appArmorProfile is the AppArmor options to use by this container. If set, this profile
-    overrides the pod's appArmorProfile.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    localhost_profile: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    localhostProfile indicates a profile loaded on the node that should be used.
-    The profile must be preconfigured on the node to work.
-    Must match the loaded name of the profile.
-    Must be set if and only if type is "Localhost".
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type indicates which kind of AppArmor profile will be applied.
-    Valid options are:
-      Localhost - a profile pre-loaded on the node.
-      RuntimeDefault - the container runtime's default profile.
-      Unconfined - no AppArmor enforcement.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfileArgs:
-    def __init__(__self__, *,
-                 localhost_profile: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        appArmorProfile is the AppArmor options to use by this container. If set, this profile
-        overrides the pod's appArmorProfile.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[_builtins.str] localhost_profile: localhostProfile indicates a profile loaded on the node that should be used.
-               The profile must be preconfigured on the node to work.
-               Must match the loaded name of the profile.
-               Must be set if and only if type is "Localhost".
-        :param pulumi.Input[_builtins.str] type: type indicates which kind of AppArmor profile will be applied.
-               Valid options are:
-                 Localhost - a profile pre-loaded on the node.
-                 RuntimeDefault - the container runtime's default profile.
-                 Unconfined - no AppArmor enforcement.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        localhostProfile indicates a profile loaded on the node that should be used.
-        The profile must be preconfigured on the node to work.
-        Must match the loaded name of the profile.
-        Must be set if and only if type is "Localhost".
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @localhost_profile.setter
-    def localhost_profile(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "localhost_profile", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type indicates which kind of AppArmor profile will be applied.
-        Valid options are:
-          Localhost - a profile pre-loaded on the node.
-          RuntimeDefault - the container runtime's default profile.
-          Unconfined - no AppArmor enforcement.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatchArgsDict(TypedDict):
-    """
-    The capabilities to add/drop when running containers.
-    Defaults to the default set of capabilities granted by the container runtime.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    add: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    Added capabilities
-    """
-    drop: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    Removed capabilities
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatchArgs:
-    def __init__(__self__, *,
-                 add: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 drop: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        The capabilities to add/drop when running containers.
-        Defaults to the default set of capabilities granted by the container runtime.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] add: Added capabilities
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] drop: Removed capabilities
-        """
-        if add is not None:
-            pulumi.set(__self__, "add", add)
-        if drop is not None:
-            pulumi.set(__self__, "drop", drop)
-
-    @_builtins.property
-    @pulumi.getter
-    def add(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        Added capabilities
-        """
-        return pulumi.get(self, "add")
-
-    @add.setter
-    def add(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "add", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def drop(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        Removed capabilities
-        """
-        return pulumi.get(self, "drop")
-
-    @drop.setter
-    def drop(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "drop", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesArgsDict(TypedDict):
-    """
-    The capabilities to add/drop when running containers.
-    Defaults to the default set of capabilities granted by the container runtime.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    add: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    Added capabilities
-    """
-    drop: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    Removed capabilities
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesArgs:
-    def __init__(__self__, *,
-                 add: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 drop: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        The capabilities to add/drop when running containers.
-        Defaults to the default set of capabilities granted by the container runtime.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] add: Added capabilities
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] drop: Removed capabilities
-        """
-        if add is not None:
-            pulumi.set(__self__, "add", add)
-        if drop is not None:
-            pulumi.set(__self__, "drop", drop)
-
-    @_builtins.property
-    @pulumi.getter
-    def add(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        Added capabilities
-        """
-        return pulumi.get(self, "add")
-
-    @add.setter
-    def add(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "add", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def drop(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        Removed capabilities
-        """
-        return pulumi.get(self, "drop")
-
-    @drop.setter
-    def drop(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "drop", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatchArgsDict(TypedDict):
-    """
-    Container security context.
-    Security context specified here will override the security context set by the operator.
-    By default the operator sets the Tailscale container and the Tailscale init container to privileged
-    for proxies created for Tailscale ingress and egress Service, Connector and ProxyGroup.
-    You can reduce the permissions of the Tailscale container to cap NET_ADMIN by
-    installing device plugin in your cluster and configuring the proxies tun device to be created
-    by the device plugin, see  https://github.com/tailscale/tailscale/issues/10814#issuecomment-2479977752
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context
-    """
-    allow_privilege_escalation: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    AllowPrivilegeEscalation controls whether a process can gain more
-    privileges than its parent process. This bool directly controls if
-    the no_new_privs flag will be set on the container process.
-    AllowPrivilegeEscalation is true always when the container is:
-    1) run as Privileged
-    2) has CAP_SYS_ADMIN
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    app_armor_profile: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatchArgs']]]
-    capabilities: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatchArgs']]]
-    privileged: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Run container in privileged mode.
-    Processes in privileged containers are essentially equivalent to root on the host.
-    Defaults to false.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    proc_mount: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    procMount denotes the type of proc mount to use for the containers.
-    The default value is Default which uses the container runtime defaults for
-    readonly paths and masked paths.
-    This requires the ProcMountType feature flag to be enabled.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    read_only_root_filesystem: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Whether this container has a read-only root filesystem.
-    Default is false.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    run_as_group: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    The GID to run the entrypoint of the container process.
-    Uses runtime default if unset.
-    May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    run_as_non_root: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Indicates that the container must run as a non-root user.
-    If true, the Kubelet will validate the image at runtime to ensure that it
-    does not run as UID 0 (root) and fail to start the container if it does.
-    If unset or false, no such validation will be performed.
-    May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    """
-    run_as_user: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    The UID to run the entrypoint of the container process.
-    Defaults to user specified in image metadata if unspecified.
-    May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    se_linux_options: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatchArgs']]]
-    seccomp_profile: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatchArgs']]]
-    windows_options: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatchArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatchArgs:
-    def __init__(__self__, *,
-                 allow_privilege_escalation: pulumi.Input[Optional[_builtins.bool]] = None,
-                 app_armor_profile: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatchArgs']] = None,
-                 capabilities: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatchArgs']] = None,
-                 privileged: pulumi.Input[Optional[_builtins.bool]] = None,
-                 proc_mount: pulumi.Input[Optional[_builtins.str]] = None,
-                 read_only_root_filesystem: pulumi.Input[Optional[_builtins.bool]] = None,
-                 run_as_group: pulumi.Input[Optional[_builtins.int]] = None,
-                 run_as_non_root: pulumi.Input[Optional[_builtins.bool]] = None,
-                 run_as_user: pulumi.Input[Optional[_builtins.int]] = None,
-                 se_linux_options: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatchArgs']] = None,
-                 seccomp_profile: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatchArgs']] = None,
-                 windows_options: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatchArgs']] = None):
-        """
-        Container security context.
-        Security context specified here will override the security context set by the operator.
-        By default the operator sets the Tailscale container and the Tailscale init container to privileged
-        for proxies created for Tailscale ingress and egress Service, Connector and ProxyGroup.
-        You can reduce the permissions of the Tailscale container to cap NET_ADMIN by
-        installing device plugin in your cluster and configuring the proxies tun device to be created
-        by the device plugin, see  https://github.com/tailscale/tailscale/issues/10814#issuecomment-2479977752
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context
-
-        :param pulumi.Input[_builtins.bool] allow_privilege_escalation: AllowPrivilegeEscalation controls whether a process can gain more
-               privileges than its parent process. This bool directly controls if
-               the no_new_privs flag will be set on the container process.
-               AllowPrivilegeEscalation is true always when the container is:
-               1) run as Privileged
-               2) has CAP_SYS_ADMIN
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.bool] privileged: Run container in privileged mode.
-               Processes in privileged containers are essentially equivalent to root on the host.
-               Defaults to false.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.str] proc_mount: procMount denotes the type of proc mount to use for the containers.
-               The default value is Default which uses the container runtime defaults for
-               readonly paths and masked paths.
-               This requires the ProcMountType feature flag to be enabled.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.bool] read_only_root_filesystem: Whether this container has a read-only root filesystem.
-               Default is false.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.int] run_as_group: The GID to run the entrypoint of the container process.
-               Uses runtime default if unset.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.bool] run_as_non_root: Indicates that the container must run as a non-root user.
-               If true, the Kubelet will validate the image at runtime to ensure that it
-               does not run as UID 0 (root) and fail to start the container if it does.
-               If unset or false, no such validation will be performed.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        :param pulumi.Input[_builtins.int] run_as_user: The UID to run the entrypoint of the container process.
-               Defaults to user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-               Note that this field cannot be set when spec.os.name is windows.
-        """
-        if allow_privilege_escalation is not None:
-            pulumi.set(__self__, "allow_privilege_escalation", allow_privilege_escalation)
-        if app_armor_profile is not None:
-            pulumi.set(__self__, "app_armor_profile", app_armor_profile)
-        if capabilities is not None:
-            pulumi.set(__self__, "capabilities", capabilities)
-        if privileged is not None:
-            pulumi.set(__self__, "privileged", privileged)
-        if proc_mount is not None:
-            pulumi.set(__self__, "proc_mount", proc_mount)
-        if read_only_root_filesystem is not None:
-            pulumi.set(__self__, "read_only_root_filesystem", read_only_root_filesystem)
-        if run_as_group is not None:
-            pulumi.set(__self__, "run_as_group", run_as_group)
-        if run_as_non_root is not None:
-            pulumi.set(__self__, "run_as_non_root", run_as_non_root)
-        if run_as_user is not None:
-            pulumi.set(__self__, "run_as_user", run_as_user)
-        if se_linux_options is not None:
-            pulumi.set(__self__, "se_linux_options", se_linux_options)
-        if seccomp_profile is not None:
-            pulumi.set(__self__, "seccomp_profile", seccomp_profile)
-        if windows_options is not None:
-            pulumi.set(__self__, "windows_options", windows_options)
-
-    @_builtins.property
-    @pulumi.getter(name="allowPrivilegeEscalation")
-    def allow_privilege_escalation(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        AllowPrivilegeEscalation controls whether a process can gain more
-        privileges than its parent process. This bool directly controls if
-        the no_new_privs flag will be set on the container process.
-        AllowPrivilegeEscalation is true always when the container is:
-        1) run as Privileged
-        2) has CAP_SYS_ADMIN
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "allow_privilege_escalation")
-
-    @allow_privilege_escalation.setter
-    def allow_privilege_escalation(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "allow_privilege_escalation", value)
-
-    @_builtins.property
-    @pulumi.getter(name="appArmorProfile")
-    def app_armor_profile(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatchArgs']]:
-        return pulumi.get(self, "app_armor_profile")
-
-    @app_armor_profile.setter
-    def app_armor_profile(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatchArgs']]):
-        pulumi.set(self, "app_armor_profile", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def capabilities(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatchArgs']]:
-        return pulumi.get(self, "capabilities")
-
-    @capabilities.setter
-    def capabilities(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatchArgs']]):
-        pulumi.set(self, "capabilities", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def privileged(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Run container in privileged mode.
-        Processes in privileged containers are essentially equivalent to root on the host.
-        Defaults to false.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "privileged")
-
-    @privileged.setter
-    def privileged(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "privileged", value)
-
-    @_builtins.property
-    @pulumi.getter(name="procMount")
-    def proc_mount(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        procMount denotes the type of proc mount to use for the containers.
-        The default value is Default which uses the container runtime defaults for
-        readonly paths and masked paths.
-        This requires the ProcMountType feature flag to be enabled.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "proc_mount")
-
-    @proc_mount.setter
-    def proc_mount(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "proc_mount", value)
-
-    @_builtins.property
-    @pulumi.getter(name="readOnlyRootFilesystem")
-    def read_only_root_filesystem(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Whether this container has a read-only root filesystem.
-        Default is false.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "read_only_root_filesystem")
-
-    @read_only_root_filesystem.setter
-    def read_only_root_filesystem(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "read_only_root_filesystem", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsGroup")
-    def run_as_group(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        The GID to run the entrypoint of the container process.
-        Uses runtime default if unset.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_group")
-
-    @run_as_group.setter
-    def run_as_group(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "run_as_group", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsNonRoot")
-    def run_as_non_root(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Indicates that the container must run as a non-root user.
-        If true, the Kubelet will validate the image at runtime to ensure that it
-        does not run as UID 0 (root) and fail to start the container if it does.
-        If unset or false, no such validation will be performed.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_non_root")
-
-    @run_as_non_root.setter
-    def run_as_non_root(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "run_as_non_root", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUser")
-    def run_as_user(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        The UID to run the entrypoint of the container process.
-        Defaults to user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_user")
-
-    @run_as_user.setter
-    def run_as_user(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "run_as_user", value)
-
-    @_builtins.property
-    @pulumi.getter(name="seLinuxOptions")
-    def se_linux_options(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatchArgs']]:
-        return pulumi.get(self, "se_linux_options")
-
-    @se_linux_options.setter
-    def se_linux_options(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatchArgs']]):
-        pulumi.set(self, "se_linux_options", value)
-
-    @_builtins.property
-    @pulumi.getter(name="seccompProfile")
-    def seccomp_profile(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatchArgs']]:
-        return pulumi.get(self, "seccomp_profile")
-
-    @seccomp_profile.setter
-    def seccomp_profile(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatchArgs']]):
-        pulumi.set(self, "seccomp_profile", value)
-
-    @_builtins.property
-    @pulumi.getter(name="windowsOptions")
-    def windows_options(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatchArgs']]:
-        return pulumi.get(self, "windows_options")
-
-    @windows_options.setter
-    def windows_options(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatchArgs']]):
-        pulumi.set(self, "windows_options", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatchArgsDict(TypedDict):
-    """
-    The SELinux context to be applied to the container.
-    If unspecified, the container runtime will allocate a random SELinux context for each
-    container.  May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    level: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Level is SELinux level label that applies to the container.
-    """
-    role: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Role is a SELinux role label that applies to the container.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Type is a SELinux type label that applies to the container.
-    """
-    user: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    User is a SELinux user label that applies to the container.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatchArgs:
-    def __init__(__self__, *,
-                 level: pulumi.Input[Optional[_builtins.str]] = None,
-                 role: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None,
-                 user: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The SELinux context to be applied to the container.
-        If unspecified, the container runtime will allocate a random SELinux context for each
-        container.  May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[_builtins.str] level: Level is SELinux level label that applies to the container.
-        :param pulumi.Input[_builtins.str] role: Role is a SELinux role label that applies to the container.
-        :param pulumi.Input[_builtins.str] type: Type is a SELinux type label that applies to the container.
-        :param pulumi.Input[_builtins.str] user: User is a SELinux user label that applies to the container.
-        """
-        if level is not None:
-            pulumi.set(__self__, "level", level)
-        if role is not None:
-            pulumi.set(__self__, "role", role)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-        if user is not None:
-            pulumi.set(__self__, "user", user)
-
-    @_builtins.property
-    @pulumi.getter
-    def level(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Level is SELinux level label that applies to the container.
-        """
-        return pulumi.get(self, "level")
-
-    @level.setter
-    def level(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "level", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def role(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Role is a SELinux role label that applies to the container.
-        """
-        return pulumi.get(self, "role")
-
-    @role.setter
-    def role(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "role", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Type is a SELinux type label that applies to the container.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def user(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        User is a SELinux user label that applies to the container.
-        """
-        return pulumi.get(self, "user")
-
-    @user.setter
-    def user(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "user", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsArgsDict(TypedDict):
-    """
-    The SELinux context to be applied to the container.
-    If unspecified, the container runtime will allocate a random SELinux context for each
-    container.  May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    level: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Level is SELinux level label that applies to the container.
-    """
-    role: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Role is a SELinux role label that applies to the container.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Type is a SELinux type label that applies to the container.
-    """
-    user: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    User is a SELinux user label that applies to the container.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsArgs:
-    def __init__(__self__, *,
-                 level: pulumi.Input[Optional[_builtins.str]] = None,
-                 role: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None,
-                 user: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The SELinux context to be applied to the container.
-        If unspecified, the container runtime will allocate a random SELinux context for each
-        container.  May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[_builtins.str] level: Level is SELinux level label that applies to the container.
-        :param pulumi.Input[_builtins.str] role: Role is a SELinux role label that applies to the container.
-        :param pulumi.Input[_builtins.str] type: Type is a SELinux type label that applies to the container.
-        :param pulumi.Input[_builtins.str] user: User is a SELinux user label that applies to the container.
-        """
-        if level is not None:
-            pulumi.set(__self__, "level", level)
-        if role is not None:
-            pulumi.set(__self__, "role", role)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-        if user is not None:
-            pulumi.set(__self__, "user", user)
-
-    @_builtins.property
-    @pulumi.getter
-    def level(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Level is SELinux level label that applies to the container.
-        """
-        return pulumi.get(self, "level")
-
-    @level.setter
-    def level(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "level", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def role(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Role is a SELinux role label that applies to the container.
-        """
-        return pulumi.get(self, "role")
-
-    @role.setter
-    def role(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "role", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Type is a SELinux type label that applies to the container.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def user(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        User is a SELinux user label that applies to the container.
-        """
-        return pulumi.get(self, "user")
-
-    @user.setter
-    def user(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "user", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatchArgsDict(TypedDict):
-    """
-    The seccomp options to use by this container. If seccomp options are
-    provided at both the pod & container level, the container options
-    override the pod options.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    localhost_profile: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    localhostProfile indicates a profile defined in a file on the node should be used.
-    The profile must be preconfigured on the node to work.
-    Must be a descending path, relative to the kubelet's configured seccomp profile location.
-    Must be set if type is "Localhost". Must NOT be set for any other type.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type indicates which kind of seccomp profile will be applied.
-    Valid options are:
-
-    Localhost - a profile defined in a file on the node should be used.
-    RuntimeDefault - the container runtime default profile should be used.
-    Unconfined - no profile should be applied.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatchArgs:
-    def __init__(__self__, *,
-                 localhost_profile: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The seccomp options to use by this container. If seccomp options are
-        provided at both the pod & container level, the container options
-        override the pod options.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[_builtins.str] localhost_profile: localhostProfile indicates a profile defined in a file on the node should be used.
-               The profile must be preconfigured on the node to work.
-               Must be a descending path, relative to the kubelet's configured seccomp profile location.
-               Must be set if type is "Localhost". Must NOT be set for any other type.
-        :param pulumi.Input[_builtins.str] type: type indicates which kind of seccomp profile will be applied.
-               Valid options are:
-
-               Localhost - a profile defined in a file on the node should be used.
-               RuntimeDefault - the container runtime default profile should be used.
-               Unconfined - no profile should be applied.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        localhostProfile indicates a profile defined in a file on the node should be used.
-        The profile must be preconfigured on the node to work.
-        Must be a descending path, relative to the kubelet's configured seccomp profile location.
-        Must be set if type is "Localhost". Must NOT be set for any other type.
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @localhost_profile.setter
-    def localhost_profile(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "localhost_profile", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type indicates which kind of seccomp profile will be applied.
-        Valid options are:
-
-        Localhost - a profile defined in a file on the node should be used.
-        RuntimeDefault - the container runtime default profile should be used.
-        Unconfined - no profile should be applied.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfileArgsDict(TypedDict):
-    """
-    The seccomp options to use by this container. If seccomp options are
-    provided at both the pod & container level, the container options
-    override the pod options.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    localhost_profile: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    localhostProfile indicates a profile defined in a file on the node should be used.
-    The profile must be preconfigured on the node to work.
-    Must be a descending path, relative to the kubelet's configured seccomp profile location.
-    Must be set if type is "Localhost". Must NOT be set for any other type.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type indicates which kind of seccomp profile will be applied.
-    Valid options are:
-
-    Localhost - a profile defined in a file on the node should be used.
-    RuntimeDefault - the container runtime default profile should be used.
-    Unconfined - no profile should be applied.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfileArgs:
-    def __init__(__self__, *,
-                 localhost_profile: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The seccomp options to use by this container. If seccomp options are
-        provided at both the pod & container level, the container options
-        override the pod options.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param pulumi.Input[_builtins.str] localhost_profile: localhostProfile indicates a profile defined in a file on the node should be used.
-               The profile must be preconfigured on the node to work.
-               Must be a descending path, relative to the kubelet's configured seccomp profile location.
-               Must be set if type is "Localhost". Must NOT be set for any other type.
-        :param pulumi.Input[_builtins.str] type: type indicates which kind of seccomp profile will be applied.
-               Valid options are:
-
-               Localhost - a profile defined in a file on the node should be used.
-               RuntimeDefault - the container runtime default profile should be used.
-               Unconfined - no profile should be applied.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        localhostProfile indicates a profile defined in a file on the node should be used.
-        The profile must be preconfigured on the node to work.
-        Must be a descending path, relative to the kubelet's configured seccomp profile location.
-        Must be set if type is "Localhost". Must NOT be set for any other type.
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @localhost_profile.setter
-    def localhost_profile(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "localhost_profile", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type indicates which kind of seccomp profile will be applied.
-        Valid options are:
-
-        Localhost - a profile defined in a file on the node should be used.
-        RuntimeDefault - the container runtime default profile should be used.
-        Unconfined - no profile should be applied.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatchArgsDict(TypedDict):
-    """
-    The Windows specific settings applied to all containers.
-    If unspecified, the options from the PodSecurityContext will be used.
-    If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is linux.
-    """
-    gmsa_credential_spec: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    GMSACredentialSpec is where the GMSA admission webhook
-    (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-    GMSA credential spec named by the GMSACredentialSpecName field.
-    """
-    gmsa_credential_spec_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    GMSACredentialSpecName is the name of the GMSA credential spec to use.
-    """
-    host_process: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    HostProcess determines if a container should be run as a 'Host Process' container.
-    All of a Pod's containers must have the same effective HostProcess value
-    (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-    In addition, if HostProcess is true then HostNetwork must also be set to true.
-    """
-    run_as_user_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The UserName in Windows to run the entrypoint of the container process.
-    Defaults to the user specified in image metadata if unspecified.
-    May also be set in PodSecurityContext. If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatchArgs:
-    def __init__(__self__, *,
-                 gmsa_credential_spec: pulumi.Input[Optional[_builtins.str]] = None,
-                 gmsa_credential_spec_name: pulumi.Input[Optional[_builtins.str]] = None,
-                 host_process: pulumi.Input[Optional[_builtins.bool]] = None,
-                 run_as_user_name: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The Windows specific settings applied to all containers.
-        If unspecified, the options from the PodSecurityContext will be used.
-        If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is linux.
-
-        :param pulumi.Input[_builtins.str] gmsa_credential_spec: GMSACredentialSpec is where the GMSA admission webhook
-               (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-               GMSA credential spec named by the GMSACredentialSpecName field.
-        :param pulumi.Input[_builtins.str] gmsa_credential_spec_name: GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        :param pulumi.Input[_builtins.bool] host_process: HostProcess determines if a container should be run as a 'Host Process' container.
-               All of a Pod's containers must have the same effective HostProcess value
-               (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-               In addition, if HostProcess is true then HostNetwork must also be set to true.
-        :param pulumi.Input[_builtins.str] run_as_user_name: The UserName in Windows to run the entrypoint of the container process.
-               Defaults to the user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext. If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        if gmsa_credential_spec is not None:
-            pulumi.set(__self__, "gmsa_credential_spec", gmsa_credential_spec)
-        if gmsa_credential_spec_name is not None:
-            pulumi.set(__self__, "gmsa_credential_spec_name", gmsa_credential_spec_name)
-        if host_process is not None:
-            pulumi.set(__self__, "host_process", host_process)
-        if run_as_user_name is not None:
-            pulumi.set(__self__, "run_as_user_name", run_as_user_name)
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpec")
-    def gmsa_credential_spec(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        GMSACredentialSpec is where the GMSA admission webhook
-        (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-        GMSA credential spec named by the GMSACredentialSpecName field.
-        """
-        return pulumi.get(self, "gmsa_credential_spec")
-
-    @gmsa_credential_spec.setter
-    def gmsa_credential_spec(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "gmsa_credential_spec", value)
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpecName")
-    def gmsa_credential_spec_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        """
-        return pulumi.get(self, "gmsa_credential_spec_name")
-
-    @gmsa_credential_spec_name.setter
-    def gmsa_credential_spec_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "gmsa_credential_spec_name", value)
-
-    @_builtins.property
-    @pulumi.getter(name="hostProcess")
-    def host_process(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        HostProcess determines if a container should be run as a 'Host Process' container.
-        All of a Pod's containers must have the same effective HostProcess value
-        (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-        In addition, if HostProcess is true then HostNetwork must also be set to true.
-        """
-        return pulumi.get(self, "host_process")
-
-    @host_process.setter
-    def host_process(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "host_process", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUserName")
-    def run_as_user_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The UserName in Windows to run the entrypoint of the container process.
-        Defaults to the user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext. If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_user_name")
-
-    @run_as_user_name.setter
-    def run_as_user_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "run_as_user_name", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsArgsDict(TypedDict):
-    """
-    The Windows specific settings applied to all containers.
-    If unspecified, the options from the PodSecurityContext will be used.
-    If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is linux.
-    """
-    gmsa_credential_spec: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    GMSACredentialSpec is where the GMSA admission webhook
-    (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-    GMSA credential spec named by the GMSACredentialSpecName field.
-    """
-    gmsa_credential_spec_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    GMSACredentialSpecName is the name of the GMSA credential spec to use.
-    """
-    host_process: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    HostProcess determines if a container should be run as a 'Host Process' container.
-    All of a Pod's containers must have the same effective HostProcess value
-    (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-    In addition, if HostProcess is true then HostNetwork must also be set to true.
-    """
-    run_as_user_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    The UserName in Windows to run the entrypoint of the container process.
-    Defaults to the user specified in image metadata if unspecified.
-    May also be set in PodSecurityContext. If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsArgs:
-    def __init__(__self__, *,
-                 gmsa_credential_spec: pulumi.Input[Optional[_builtins.str]] = None,
-                 gmsa_credential_spec_name: pulumi.Input[Optional[_builtins.str]] = None,
-                 host_process: pulumi.Input[Optional[_builtins.bool]] = None,
-                 run_as_user_name: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The Windows specific settings applied to all containers.
-        If unspecified, the options from the PodSecurityContext will be used.
-        If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is linux.
-
-        :param pulumi.Input[_builtins.str] gmsa_credential_spec: GMSACredentialSpec is where the GMSA admission webhook
-               (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-               GMSA credential spec named by the GMSACredentialSpecName field.
-        :param pulumi.Input[_builtins.str] gmsa_credential_spec_name: GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        :param pulumi.Input[_builtins.bool] host_process: HostProcess determines if a container should be run as a 'Host Process' container.
-               All of a Pod's containers must have the same effective HostProcess value
-               (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-               In addition, if HostProcess is true then HostNetwork must also be set to true.
-        :param pulumi.Input[_builtins.str] run_as_user_name: The UserName in Windows to run the entrypoint of the container process.
-               Defaults to the user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext. If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        if gmsa_credential_spec is not None:
-            pulumi.set(__self__, "gmsa_credential_spec", gmsa_credential_spec)
-        if gmsa_credential_spec_name is not None:
-            pulumi.set(__self__, "gmsa_credential_spec_name", gmsa_credential_spec_name)
-        if host_process is not None:
-            pulumi.set(__self__, "host_process", host_process)
-        if run_as_user_name is not None:
-            pulumi.set(__self__, "run_as_user_name", run_as_user_name)
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpec")
-    def gmsa_credential_spec(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        GMSACredentialSpec is where the GMSA admission webhook
-        (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-        GMSA credential spec named by the GMSACredentialSpecName field.
-        """
-        return pulumi.get(self, "gmsa_credential_spec")
-
-    @gmsa_credential_spec.setter
-    def gmsa_credential_spec(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "gmsa_credential_spec", value)
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpecName")
-    def gmsa_credential_spec_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        """
-        return pulumi.get(self, "gmsa_credential_spec_name")
-
-    @gmsa_credential_spec_name.setter
-    def gmsa_credential_spec_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "gmsa_credential_spec_name", value)
-
-    @_builtins.property
-    @pulumi.getter(name="hostProcess")
-    def host_process(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        HostProcess determines if a container should be run as a 'Host Process' container.
-        All of a Pod's containers must have the same effective HostProcess value
-        (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-        In addition, if HostProcess is true then HostNetwork must also be set to true.
-        """
-        return pulumi.get(self, "host_process")
-
-    @host_process.setter
-    def host_process(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "host_process", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUserName")
-    def run_as_user_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        The UserName in Windows to run the entrypoint of the container process.
-        Defaults to the user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext. If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_user_name")
-
-    @run_as_user_name.setter
-    def run_as_user_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "run_as_user_name", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgsDict(TypedDict):
-    """
-    Container security context.
-    Security context specified here will override the security context set by the operator.
-    By default the operator sets the Tailscale container and the Tailscale init container to privileged
-    for proxies created for Tailscale ingress and egress Service, Connector and ProxyGroup.
-    You can reduce the permissions of the Tailscale container to cap NET_ADMIN by
-    installing device plugin in your cluster and configuring the proxies tun device to be created
-    by the device plugin, see  https://github.com/tailscale/tailscale/issues/10814#issuecomment-2479977752
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context
-    """
-    allow_privilege_escalation: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    AllowPrivilegeEscalation controls whether a process can gain more
-    privileges than its parent process. This bool directly controls if
-    the no_new_privs flag will be set on the container process.
-    AllowPrivilegeEscalation is true always when the container is:
-    1) run as Privileged
-    2) has CAP_SYS_ADMIN
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    app_armor_profile: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfileArgs']]]
-    capabilities: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesArgs']]]
-    privileged: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Run container in privileged mode.
-    Processes in privileged containers are essentially equivalent to root on the host.
-    Defaults to false.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    proc_mount: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    procMount denotes the type of proc mount to use for the containers.
-    The default value is Default which uses the container runtime defaults for
-    readonly paths and masked paths.
-    This requires the ProcMountType feature flag to be enabled.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    read_only_root_filesystem: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Whether this container has a read-only root filesystem.
-    Default is false.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    run_as_group: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    The GID to run the entrypoint of the container process.
-    Uses runtime default if unset.
-    May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    run_as_non_root: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Indicates that the container must run as a non-root user.
-    If true, the Kubelet will validate the image at runtime to ensure that it
-    does not run as UID 0 (root) and fail to start the container if it does.
-    If unset or false, no such validation will be performed.
-    May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    """
-    run_as_user: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    The UID to run the entrypoint of the container process.
-    Defaults to user specified in image metadata if unspecified.
-    May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    se_linux_options: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsArgs']]]
-    seccomp_profile: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfileArgs']]]
-    windows_options: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgs:
-    def __init__(__self__, *,
-                 allow_privilege_escalation: pulumi.Input[Optional[_builtins.bool]] = None,
-                 app_armor_profile: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfileArgs']] = None,
-                 capabilities: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesArgs']] = None,
-                 privileged: pulumi.Input[Optional[_builtins.bool]] = None,
-                 proc_mount: pulumi.Input[Optional[_builtins.str]] = None,
-                 read_only_root_filesystem: pulumi.Input[Optional[_builtins.bool]] = None,
-                 run_as_group: pulumi.Input[Optional[_builtins.int]] = None,
-                 run_as_non_root: pulumi.Input[Optional[_builtins.bool]] = None,
-                 run_as_user: pulumi.Input[Optional[_builtins.int]] = None,
-                 se_linux_options: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsArgs']] = None,
-                 seccomp_profile: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfileArgs']] = None,
-                 windows_options: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsArgs']] = None):
-        """
-        Container security context.
-        Security context specified here will override the security context set by the operator.
-        By default the operator sets the Tailscale container and the Tailscale init container to privileged
-        for proxies created for Tailscale ingress and egress Service, Connector and ProxyGroup.
-        You can reduce the permissions of the Tailscale container to cap NET_ADMIN by
-        installing device plugin in your cluster and configuring the proxies tun device to be created
-        by the device plugin, see  https://github.com/tailscale/tailscale/issues/10814#issuecomment-2479977752
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context
-
-        :param pulumi.Input[_builtins.bool] allow_privilege_escalation: AllowPrivilegeEscalation controls whether a process can gain more
-               privileges than its parent process. This bool directly controls if
-               the no_new_privs flag will be set on the container process.
-               AllowPrivilegeEscalation is true always when the container is:
-               1) run as Privileged
-               2) has CAP_SYS_ADMIN
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.bool] privileged: Run container in privileged mode.
-               Processes in privileged containers are essentially equivalent to root on the host.
-               Defaults to false.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.str] proc_mount: procMount denotes the type of proc mount to use for the containers.
-               The default value is Default which uses the container runtime defaults for
-               readonly paths and masked paths.
-               This requires the ProcMountType feature flag to be enabled.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.bool] read_only_root_filesystem: Whether this container has a read-only root filesystem.
-               Default is false.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.int] run_as_group: The GID to run the entrypoint of the container process.
-               Uses runtime default if unset.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param pulumi.Input[_builtins.bool] run_as_non_root: Indicates that the container must run as a non-root user.
-               If true, the Kubelet will validate the image at runtime to ensure that it
-               does not run as UID 0 (root) and fail to start the container if it does.
-               If unset or false, no such validation will be performed.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        :param pulumi.Input[_builtins.int] run_as_user: The UID to run the entrypoint of the container process.
-               Defaults to user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-               Note that this field cannot be set when spec.os.name is windows.
-        """
-        if allow_privilege_escalation is not None:
-            pulumi.set(__self__, "allow_privilege_escalation", allow_privilege_escalation)
-        if app_armor_profile is not None:
-            pulumi.set(__self__, "app_armor_profile", app_armor_profile)
-        if capabilities is not None:
-            pulumi.set(__self__, "capabilities", capabilities)
-        if privileged is not None:
-            pulumi.set(__self__, "privileged", privileged)
-        if proc_mount is not None:
-            pulumi.set(__self__, "proc_mount", proc_mount)
-        if read_only_root_filesystem is not None:
-            pulumi.set(__self__, "read_only_root_filesystem", read_only_root_filesystem)
-        if run_as_group is not None:
-            pulumi.set(__self__, "run_as_group", run_as_group)
-        if run_as_non_root is not None:
-            pulumi.set(__self__, "run_as_non_root", run_as_non_root)
-        if run_as_user is not None:
-            pulumi.set(__self__, "run_as_user", run_as_user)
-        if se_linux_options is not None:
-            pulumi.set(__self__, "se_linux_options", se_linux_options)
-        if seccomp_profile is not None:
-            pulumi.set(__self__, "seccomp_profile", seccomp_profile)
-        if windows_options is not None:
-            pulumi.set(__self__, "windows_options", windows_options)
-
-    @_builtins.property
-    @pulumi.getter(name="allowPrivilegeEscalation")
-    def allow_privilege_escalation(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        AllowPrivilegeEscalation controls whether a process can gain more
-        privileges than its parent process. This bool directly controls if
-        the no_new_privs flag will be set on the container process.
-        AllowPrivilegeEscalation is true always when the container is:
-        1) run as Privileged
-        2) has CAP_SYS_ADMIN
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "allow_privilege_escalation")
-
-    @allow_privilege_escalation.setter
-    def allow_privilege_escalation(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "allow_privilege_escalation", value)
-
-    @_builtins.property
-    @pulumi.getter(name="appArmorProfile")
-    def app_armor_profile(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfileArgs']]:
-        return pulumi.get(self, "app_armor_profile")
-
-    @app_armor_profile.setter
-    def app_armor_profile(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfileArgs']]):
-        pulumi.set(self, "app_armor_profile", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def capabilities(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesArgs']]:
-        return pulumi.get(self, "capabilities")
-
-    @capabilities.setter
-    def capabilities(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesArgs']]):
-        pulumi.set(self, "capabilities", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def privileged(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Run container in privileged mode.
-        Processes in privileged containers are essentially equivalent to root on the host.
-        Defaults to false.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "privileged")
-
-    @privileged.setter
-    def privileged(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "privileged", value)
-
-    @_builtins.property
-    @pulumi.getter(name="procMount")
-    def proc_mount(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        procMount denotes the type of proc mount to use for the containers.
-        The default value is Default which uses the container runtime defaults for
-        readonly paths and masked paths.
-        This requires the ProcMountType feature flag to be enabled.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "proc_mount")
-
-    @proc_mount.setter
-    def proc_mount(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "proc_mount", value)
-
-    @_builtins.property
-    @pulumi.getter(name="readOnlyRootFilesystem")
-    def read_only_root_filesystem(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Whether this container has a read-only root filesystem.
-        Default is false.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "read_only_root_filesystem")
-
-    @read_only_root_filesystem.setter
-    def read_only_root_filesystem(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "read_only_root_filesystem", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsGroup")
-    def run_as_group(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        The GID to run the entrypoint of the container process.
-        Uses runtime default if unset.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_group")
-
-    @run_as_group.setter
-    def run_as_group(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "run_as_group", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsNonRoot")
-    def run_as_non_root(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Indicates that the container must run as a non-root user.
-        If true, the Kubelet will validate the image at runtime to ensure that it
-        does not run as UID 0 (root) and fail to start the container if it does.
-        If unset or false, no such validation will be performed.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_non_root")
-
-    @run_as_non_root.setter
-    def run_as_non_root(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "run_as_non_root", value)
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUser")
-    def run_as_user(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        The UID to run the entrypoint of the container process.
-        Defaults to user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_user")
-
-    @run_as_user.setter
-    def run_as_user(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "run_as_user", value)
-
-    @_builtins.property
-    @pulumi.getter(name="seLinuxOptions")
-    def se_linux_options(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsArgs']]:
-        return pulumi.get(self, "se_linux_options")
-
-    @se_linux_options.setter
-    def se_linux_options(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsArgs']]):
-        pulumi.set(self, "se_linux_options", value)
-
-    @_builtins.property
-    @pulumi.getter(name="seccompProfile")
-    def seccomp_profile(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfileArgs']]:
-        return pulumi.get(self, "seccomp_profile")
-
-    @seccomp_profile.setter
-    def seccomp_profile(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfileArgs']]):
-        pulumi.set(self, "seccomp_profile", value)
-
-    @_builtins.property
-    @pulumi.getter(name="windowsOptions")
-    def windows_options(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsArgs']]:
-        return pulumi.get(self, "windows_options")
-
-    @windows_options.setter
-    def windows_options(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsArgs']]):
-        pulumi.set(self, "windows_options", value)
-
-
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerArgsDict(TypedDict):
-    """
-    Configuration for the proxy init container that enables forwarding.
-    Not valid to apply to ProxyGroups of type "kube-apiserver".
-    """
-    debug: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgs']]]
-    env: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs']]]]]
-    """
-    List of environment variables to set in the container.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-    Note that environment variables provided here will take precedence
-    over Tailscale-specific environment variables set by the operator,
-    however running proxies with custom values for Tailscale environment
-    variables (i.e TS_USERSPACE) is not recommended and might break in
-    the future.
-    """
-    image: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Container image name. By default images are pulled from docker.io/tailscale,
-    but the official images are also available at ghcr.io/tailscale.
-
-    For all uses except on ProxyGroups of type "kube-apiserver", this image must
-    be either tailscale/tailscale, or an equivalent mirror of that image.
-    To apply to ProxyGroups of type "kube-apiserver", this image must be
-    tailscale/k8s-proxy or a mirror of that image.
-
-    For "tailscale/tailscale"-based proxies, specifying image name here will
-    override any proxy image values specified via the Kubernetes operator's
-    Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-    For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-    configure your own default, and this field is the only way to use a
-    custom image.
-
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-    """
-    image_pull_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-    """
-    resources: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgs']]]
-    security_context: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerArgs:
-    def __init__(__self__, *,
-                 debug: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgs']] = None,
-                 env: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs']]]] = None,
-                 image: pulumi.Input[Optional[_builtins.str]] = None,
-                 image_pull_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 resources: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgs']] = None,
-                 security_context: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgs']] = None):
-        """
-        Configuration for the proxy init container that enables forwarding.
-        Not valid to apply to ProxyGroups of type "kube-apiserver".
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs']]] env: List of environment variables to set in the container.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-               Note that environment variables provided here will take precedence
-               over Tailscale-specific environment variables set by the operator,
-               however running proxies with custom values for Tailscale environment
-               variables (i.e TS_USERSPACE) is not recommended and might break in
-               the future.
-        :param pulumi.Input[_builtins.str] image: Container image name. By default images are pulled from docker.io/tailscale,
-               but the official images are also available at ghcr.io/tailscale.
-
-               For all uses except on ProxyGroups of type "kube-apiserver", this image must
-               be either tailscale/tailscale, or an equivalent mirror of that image.
-               To apply to ProxyGroups of type "kube-apiserver", this image must be
-               tailscale/k8s-proxy or a mirror of that image.
-
-               For "tailscale/tailscale"-based proxies, specifying image name here will
-               override any proxy image values specified via the Kubernetes operator's
-               Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-               For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-               configure your own default, and this field is the only way to use a
-               custom image.
-
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        :param pulumi.Input[_builtins.str] image_pull_policy: Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        if debug is not None:
-            pulumi.set(__self__, "debug", debug)
-        if env is not None:
-            pulumi.set(__self__, "env", env)
-        if image is not None:
-            pulumi.set(__self__, "image", image)
-        if image_pull_policy is not None:
-            pulumi.set(__self__, "image_pull_policy", image_pull_policy)
-        if resources is not None:
-            pulumi.set(__self__, "resources", resources)
-        if security_context is not None:
-            pulumi.set(__self__, "security_context", security_context)
-
-    @_builtins.property
-    @pulumi.getter
-    def debug(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgs']]:
-        return pulumi.get(self, "debug")
-
-    @debug.setter
-    def debug(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgs']]):
-        pulumi.set(self, "debug", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def env(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs']]]]:
-        """
-        List of environment variables to set in the container.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-        Note that environment variables provided here will take precedence
-        over Tailscale-specific environment variables set by the operator,
-        however running proxies with custom values for Tailscale environment
-        variables (i.e TS_USERSPACE) is not recommended and might break in
-        the future.
-        """
-        return pulumi.get(self, "env")
-
-    @env.setter
-    def env(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs']]]]):
-        pulumi.set(self, "env", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def image(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Container image name. By default images are pulled from docker.io/tailscale,
-        but the official images are also available at ghcr.io/tailscale.
-
-        For all uses except on ProxyGroups of type "kube-apiserver", this image must
-        be either tailscale/tailscale, or an equivalent mirror of that image.
-        To apply to ProxyGroups of type "kube-apiserver", this image must be
-        tailscale/k8s-proxy or a mirror of that image.
-
-        For "tailscale/tailscale"-based proxies, specifying image name here will
-        override any proxy image values specified via the Kubernetes operator's
-        Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-        For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-        configure your own default, and this field is the only way to use a
-        custom image.
-
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        return pulumi.get(self, "image")
-
-    @image.setter
-    def image(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "image", value)
-
-    @_builtins.property
-    @pulumi.getter(name="imagePullPolicy")
-    def image_pull_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        return pulumi.get(self, "image_pull_policy")
-
-    @image_pull_policy.setter
-    def image_pull_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "image_pull_policy", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def resources(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgs']]:
-        return pulumi.get(self, "resources")
-
-    @resources.setter
-    def resources(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgs']]):
-        pulumi.set(self, "resources", value)
-
-    @_builtins.property
-    @pulumi.getter(name="securityContext")
-    def security_context(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgs']]:
-        return pulumi.get(self, "security_context")
-
-    @security_context.setter
-    def security_context(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgs']]):
-        pulumi.set(self, "security_context", value)
-
-
-class ProxyClassSpecStatefulSetPodTolerationsPatchArgsDict(TypedDict):
-    """
-    The pod this Toleration is attached to tolerates any taint that matches
-    the triple <key,value,effect> using the matching operator <operator>.
-    """
-    effect: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Effect indicates the taint effect to match. Empty means match all taint effects.
-    When specified, allowed values are NoSchedule, PreferNoSchedule and NoExecute.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Key is the taint key that the toleration applies to. Empty means match all taint keys.
-    If the key is empty, operator must be Exists; this combination means to match all values and all keys.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Operator represents a key's relationship to the value.
-    Valid operators are Exists and Equal. Defaults to Equal.
-    Exists is equivalent to wildcard for value, so that a pod can
-    tolerate all taints of a particular category.
-    """
-    toleration_seconds: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    TolerationSeconds represents the period of time the toleration (which must be
-    of effect NoExecute, otherwise this field is ignored) tolerates the taint. By default,
-    it is not set, which means tolerate the taint forever (do not evict). Zero and
-    negative values will be treated as 0 (evict immediately) by the system.
-    """
-    value: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Value is the taint value the toleration matches to.
-    If the operator is Exists, the value should be empty, otherwise just a regular string.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTolerationsPatchArgs:
-    def __init__(__self__, *,
-                 effect: pulumi.Input[Optional[_builtins.str]] = None,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 toleration_seconds: pulumi.Input[Optional[_builtins.int]] = None,
-                 value: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The pod this Toleration is attached to tolerates any taint that matches
-        the triple <key,value,effect> using the matching operator <operator>.
-
-        :param pulumi.Input[_builtins.str] effect: Effect indicates the taint effect to match. Empty means match all taint effects.
-               When specified, allowed values are NoSchedule, PreferNoSchedule and NoExecute.
-        :param pulumi.Input[_builtins.str] key: Key is the taint key that the toleration applies to. Empty means match all taint keys.
-               If the key is empty, operator must be Exists; this combination means to match all values and all keys.
-        :param pulumi.Input[_builtins.str] operator: Operator represents a key's relationship to the value.
-               Valid operators are Exists and Equal. Defaults to Equal.
-               Exists is equivalent to wildcard for value, so that a pod can
-               tolerate all taints of a particular category.
-        :param pulumi.Input[_builtins.int] toleration_seconds: TolerationSeconds represents the period of time the toleration (which must be
-               of effect NoExecute, otherwise this field is ignored) tolerates the taint. By default,
-               it is not set, which means tolerate the taint forever (do not evict). Zero and
-               negative values will be treated as 0 (evict immediately) by the system.
-        :param pulumi.Input[_builtins.str] value: Value is the taint value the toleration matches to.
-               If the operator is Exists, the value should be empty, otherwise just a regular string.
-        """
-        if effect is not None:
-            pulumi.set(__self__, "effect", effect)
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if toleration_seconds is not None:
-            pulumi.set(__self__, "toleration_seconds", toleration_seconds)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def effect(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Effect indicates the taint effect to match. Empty means match all taint effects.
-        When specified, allowed values are NoSchedule, PreferNoSchedule and NoExecute.
-        """
-        return pulumi.get(self, "effect")
-
-    @effect.setter
-    def effect(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "effect", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Key is the taint key that the toleration applies to. Empty means match all taint keys.
-        If the key is empty, operator must be Exists; this combination means to match all values and all keys.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Operator represents a key's relationship to the value.
-        Valid operators are Exists and Equal. Defaults to Equal.
-        Exists is equivalent to wildcard for value, so that a pod can
-        tolerate all taints of a particular category.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter(name="tolerationSeconds")
-    def toleration_seconds(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        TolerationSeconds represents the period of time the toleration (which must be
-        of effect NoExecute, otherwise this field is ignored) tolerates the taint. By default,
-        it is not set, which means tolerate the taint forever (do not evict). Zero and
-        negative values will be treated as 0 (evict immediately) by the system.
-        """
-        return pulumi.get(self, "toleration_seconds")
-
-    @toleration_seconds.setter
-    def toleration_seconds(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "toleration_seconds", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Value is the taint value the toleration matches to.
-        If the operator is Exists, the value should be empty, otherwise just a regular string.
-        """
-        return pulumi.get(self, "value")
-
-    @value.setter
-    def value(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "value", value)
-
-
-class ProxyClassSpecStatefulSetPodTolerationsArgsDict(TypedDict):
-    """
-    The pod this Toleration is attached to tolerates any taint that matches
-    the triple <key,value,effect> using the matching operator <operator>.
-    """
-    effect: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Effect indicates the taint effect to match. Empty means match all taint effects.
-    When specified, allowed values are NoSchedule, PreferNoSchedule and NoExecute.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Key is the taint key that the toleration applies to. Empty means match all taint keys.
-    If the key is empty, operator must be Exists; this combination means to match all values and all keys.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Operator represents a key's relationship to the value.
-    Valid operators are Exists and Equal. Defaults to Equal.
-    Exists is equivalent to wildcard for value, so that a pod can
-    tolerate all taints of a particular category.
-    """
-    toleration_seconds: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    TolerationSeconds represents the period of time the toleration (which must be
-    of effect NoExecute, otherwise this field is ignored) tolerates the taint. By default,
-    it is not set, which means tolerate the taint forever (do not evict). Zero and
-    negative values will be treated as 0 (evict immediately) by the system.
-    """
-    value: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Value is the taint value the toleration matches to.
-    If the operator is Exists, the value should be empty, otherwise just a regular string.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTolerationsArgs:
-    def __init__(__self__, *,
-                 effect: pulumi.Input[Optional[_builtins.str]] = None,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 toleration_seconds: pulumi.Input[Optional[_builtins.int]] = None,
-                 value: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        The pod this Toleration is attached to tolerates any taint that matches
-        the triple <key,value,effect> using the matching operator <operator>.
-
-        :param pulumi.Input[_builtins.str] effect: Effect indicates the taint effect to match. Empty means match all taint effects.
-               When specified, allowed values are NoSchedule, PreferNoSchedule and NoExecute.
-        :param pulumi.Input[_builtins.str] key: Key is the taint key that the toleration applies to. Empty means match all taint keys.
-               If the key is empty, operator must be Exists; this combination means to match all values and all keys.
-        :param pulumi.Input[_builtins.str] operator: Operator represents a key's relationship to the value.
-               Valid operators are Exists and Equal. Defaults to Equal.
-               Exists is equivalent to wildcard for value, so that a pod can
-               tolerate all taints of a particular category.
-        :param pulumi.Input[_builtins.int] toleration_seconds: TolerationSeconds represents the period of time the toleration (which must be
-               of effect NoExecute, otherwise this field is ignored) tolerates the taint. By default,
-               it is not set, which means tolerate the taint forever (do not evict). Zero and
-               negative values will be treated as 0 (evict immediately) by the system.
-        :param pulumi.Input[_builtins.str] value: Value is the taint value the toleration matches to.
-               If the operator is Exists, the value should be empty, otherwise just a regular string.
-        """
-        if effect is not None:
-            pulumi.set(__self__, "effect", effect)
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if toleration_seconds is not None:
-            pulumi.set(__self__, "toleration_seconds", toleration_seconds)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def effect(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Effect indicates the taint effect to match. Empty means match all taint effects.
-        When specified, allowed values are NoSchedule, PreferNoSchedule and NoExecute.
-        """
-        return pulumi.get(self, "effect")
-
-    @effect.setter
-    def effect(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "effect", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Key is the taint key that the toleration applies to. Empty means match all taint keys.
-        If the key is empty, operator must be Exists; this combination means to match all values and all keys.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Operator represents a key's relationship to the value.
-        Valid operators are Exists and Equal. Defaults to Equal.
-        Exists is equivalent to wildcard for value, so that a pod can
-        tolerate all taints of a particular category.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter(name="tolerationSeconds")
-    def toleration_seconds(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        TolerationSeconds represents the period of time the toleration (which must be
-        of effect NoExecute, otherwise this field is ignored) tolerates the taint. By default,
-        it is not set, which means tolerate the taint forever (do not evict). Zero and
-        negative values will be treated as 0 (evict immediately) by the system.
-        """
-        return pulumi.get(self, "toleration_seconds")
-
-    @toleration_seconds.setter
-    def toleration_seconds(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "toleration_seconds", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Value is the taint value the toleration matches to.
-        If the operator is Exists, the value should be empty, otherwise just a regular string.
-        """
-        return pulumi.get(self, "value")
-
-    @value.setter
-    def value(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "value", value)
-
-
-class ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgsDict(TypedDict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    key is the label key that the selector applies to.
-    """
-    operator: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    operator represents a key's relationship to a set of values.
-    Valid operators are In, NotIn, Exists and DoesNotExist.
-    """
-    values: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    values is an array of string values. If the operator is In or NotIn,
-    the values array must be non-empty. If the operator is Exists or DoesNotExist,
-    the values array must be empty. This array is replaced during a strategic
-    merge patch.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs:
-    def __init__(__self__, *,
-                 key: pulumi.Input[Optional[_builtins.str]] = None,
-                 operator: pulumi.Input[Optional[_builtins.str]] = None,
-                 values: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param pulumi.Input[_builtins.str] key: key is the label key that the selector applies to.
-        :param pulumi.Input[_builtins.str] operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @key.setter
-    def key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "key", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @operator.setter
-    def operator(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "operator", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-    @values.setter
-    def values(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "values", value)
-
-
-class ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatchArgsDict(TypedDict):
-    """
-    LabelSelector is used to find matching pods.
-    Pods that match this label selector are counted to determine the number of pods
-    in their corresponding topology domain.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatchArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        LabelSelector is used to find matching pods.
-        Pods that match this label selector are counted to determine the number of pods
-        in their corresponding topology domain.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorArgsDict(TypedDict):
-    """
-    LabelSelector is used to find matching pods.
-    Pods that match this label selector are counted to determine the number of pods
-    in their corresponding topology domain.
-    """
-    match_expressions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs']]]]]
-    """
-    matchExpressions is a list of label selector requirements. The requirements are ANDed.
-    """
-    match_labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-    map is equivalent to an element of matchExpressions, whose key field is "key", the
-    operator is "In", and the values array contains only "value". The requirements are ANDed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorArgs:
-    def __init__(__self__, *,
-                 match_expressions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs']]]] = None,
-                 match_labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        LabelSelector is used to find matching pods.
-        Pods that match this label selector are counted to determine the number of pods
-        in their corresponding topology domain.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs']]] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs']]]]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @match_expressions.setter
-    def match_expressions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs']]]]):
-        pulumi.set(self, "match_expressions", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-    @match_labels.setter
-    def match_labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_labels", value)
-
-
-class ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgsDict(TypedDict):
-    """
-    TopologySpreadConstraint specifies how to spread matching pods among the given topology.
-    """
-    label_selector: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatchArgs']]]
-    match_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    MatchLabelKeys is a set of pod label keys to select the pods over which
-    spreading will be calculated. The keys are used to lookup values from the
-    incoming pod labels, those key-value labels are ANDed with labelSelector
-    to select the group of existing pods over which spreading will be calculated
-    for the incoming pod. The same key is forbidden to exist in both MatchLabelKeys and LabelSelector.
-    MatchLabelKeys cannot be set when LabelSelector isn't set.
-    Keys that don't exist in the incoming pod labels will
-    be ignored. A null or empty list means only match against labelSelector.
-
-    This is a beta field and requires the MatchLabelKeysInPodTopologySpread feature gate to be enabled (enabled by default).
-    """
-    max_skew: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    MaxSkew describes the degree to which pods may be unevenly distributed.
-    When `whenUnsatisfiable=DoNotSchedule`, it is the maximum permitted difference
-    between the number of matching pods in the target topology and the global minimum.
-    The global minimum is the minimum number of matching pods in an eligible domain
-    or zero if the number of eligible domains is less than MinDomains.
-    For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-    labelSelector spread as 2/2/1:
-    In this case, the global minimum is 1.
-    | zone1 | zone2 | zone3 |
-    |  P P  |  P P  |   P   |
-    - if MaxSkew is 1, incoming pod can only be scheduled to zone3 to become 2/2/2;
-    scheduling it onto zone1(zone2) would make the ActualSkew(3-1) on zone1(zone2)
-    violate MaxSkew(1).
-    - if MaxSkew is 2, incoming pod can be scheduled onto any zone.
-    When `whenUnsatisfiable=ScheduleAnyway`, it is used to give higher precedence
-    to topologies that satisfy it.
-    It's a required field. Default value is 1 and 0 is not allowed.
-    """
-    min_domains: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    MinDomains indicates a minimum number of eligible domains.
-    When the number of eligible domains with matching topology keys is less than minDomains,
-    Pod Topology Spread treats "global minimum" as 0, and then the calculation of Skew is performed.
-    And when the number of eligible domains with matching topology keys equals or greater than minDomains,
-    this value has no effect on scheduling.
-    As a result, when the number of eligible domains is less than minDomains,
-    scheduler won't schedule more than maxSkew Pods to those domains.
-    If value is nil, the constraint behaves as if MinDomains is equal to 1.
-    Valid values are integers greater than 0.
-    When value is not nil, WhenUnsatisfiable must be DoNotSchedule.
-
-    For example, in a 3-zone cluster, MaxSkew is set to 2, MinDomains is set to 5 and pods with the same
-    labelSelector spread as 2/2/2:
-    | zone1 | zone2 | zone3 |
-    |  P P  |  P P  |  P P  |
-    The number of domains is less than 5(MinDomains), so "global minimum" is treated as 0.
-    In this situation, new pod with the same labelSelector cannot be scheduled,
-    because computed skew will be 3(3 - 0) if new Pod is scheduled to any of the three zones,
-    it will violate MaxSkew.
-    """
-    node_affinity_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    NodeAffinityPolicy indicates how we will treat Pod's nodeAffinity/nodeSelector
-    when calculating pod topology spread skew. Options are:
-    - Honor: only nodes matching nodeAffinity/nodeSelector are included in the calculations.
-    - Ignore: nodeAffinity/nodeSelector are ignored. All nodes are included in the calculations.
-
-    If this value is nil, the behavior is equivalent to the Honor policy.
-    """
-    node_taints_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    NodeTaintsPolicy indicates how we will treat node taints when calculating
-    pod topology spread skew. Options are:
-    - Honor: nodes without taints, along with tainted nodes for which the incoming pod
-    has a toleration, are included.
-    - Ignore: node taints are ignored. All nodes are included.
-
-    If this value is nil, the behavior is equivalent to the Ignore policy.
-    """
-    topology_key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    TopologyKey is the key of node labels. Nodes that have a label with this key
-    and identical values are considered to be in the same topology.
-    We consider each <key, value> as a "bucket", and try to put balanced number
-    of pods into each bucket.
-    We define a domain as a particular instance of a topology.
-    Also, we define an eligible domain as a domain whose nodes meet the requirements of
-    nodeAffinityPolicy and nodeTaintsPolicy.
-    e.g. If TopologyKey is "kubernetes.io/hostname", each Node is a domain of that topology.
-    And, if TopologyKey is "topology.kubernetes.io/zone", each zone is a domain of that topology.
-    It's a required field.
-    """
-    when_unsatisfiable: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    WhenUnsatisfiable indicates how to deal with a pod if it doesn't satisfy
-    the spread constraint.
-    - DoNotSchedule (default) tells the scheduler not to schedule it.
-    - ScheduleAnyway tells the scheduler to schedule the pod in any location,
-      but giving higher precedence to topologies that would help reduce the
-      skew.
-    A constraint is considered "Unsatisfiable" for an incoming pod
-    if and only if every possible node assignment for that pod would violate
-    "MaxSkew" on some topology.
-    For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-    labelSelector spread as 3/1/1:
-    | zone1 | zone2 | zone3 |
-    | P P P |   P   |   P   |
-    If WhenUnsatisfiable is set to DoNotSchedule, incoming pod can only be scheduled
-    to zone2(zone3) to become 3/2/1(3/1/2) as ActualSkew(2-1) on zone2(zone3) satisfies
-    MaxSkew(1). In other words, the cluster can still be imbalanced, but scheduler
-    won't make it *more* imbalanced.
-    It's a required field.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgs:
-    def __init__(__self__, *,
-                 label_selector: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatchArgs']] = None,
-                 match_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 max_skew: pulumi.Input[Optional[_builtins.int]] = None,
-                 min_domains: pulumi.Input[Optional[_builtins.int]] = None,
-                 node_affinity_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 node_taints_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 topology_key: pulumi.Input[Optional[_builtins.str]] = None,
-                 when_unsatisfiable: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        TopologySpreadConstraint specifies how to spread matching pods among the given topology.
-
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] match_label_keys: MatchLabelKeys is a set of pod label keys to select the pods over which
-               spreading will be calculated. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are ANDed with labelSelector
-               to select the group of existing pods over which spreading will be calculated
-               for the incoming pod. The same key is forbidden to exist in both MatchLabelKeys and LabelSelector.
-               MatchLabelKeys cannot be set when LabelSelector isn't set.
-               Keys that don't exist in the incoming pod labels will
-               be ignored. A null or empty list means only match against labelSelector.
-
-               This is a beta field and requires the MatchLabelKeysInPodTopologySpread feature gate to be enabled (enabled by default).
-        :param pulumi.Input[_builtins.int] max_skew: MaxSkew describes the degree to which pods may be unevenly distributed.
-               When `whenUnsatisfiable=DoNotSchedule`, it is the maximum permitted difference
-               between the number of matching pods in the target topology and the global minimum.
-               The global minimum is the minimum number of matching pods in an eligible domain
-               or zero if the number of eligible domains is less than MinDomains.
-               For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-               labelSelector spread as 2/2/1:
-               In this case, the global minimum is 1.
-               | zone1 | zone2 | zone3 |
-               |  P P  |  P P  |   P   |
-               - if MaxSkew is 1, incoming pod can only be scheduled to zone3 to become 2/2/2;
-               scheduling it onto zone1(zone2) would make the ActualSkew(3-1) on zone1(zone2)
-               violate MaxSkew(1).
-               - if MaxSkew is 2, incoming pod can be scheduled onto any zone.
-               When `whenUnsatisfiable=ScheduleAnyway`, it is used to give higher precedence
-               to topologies that satisfy it.
-               It's a required field. Default value is 1 and 0 is not allowed.
-        :param pulumi.Input[_builtins.int] min_domains: MinDomains indicates a minimum number of eligible domains.
-               When the number of eligible domains with matching topology keys is less than minDomains,
-               Pod Topology Spread treats "global minimum" as 0, and then the calculation of Skew is performed.
-               And when the number of eligible domains with matching topology keys equals or greater than minDomains,
-               this value has no effect on scheduling.
-               As a result, when the number of eligible domains is less than minDomains,
-               scheduler won't schedule more than maxSkew Pods to those domains.
-               If value is nil, the constraint behaves as if MinDomains is equal to 1.
-               Valid values are integers greater than 0.
-               When value is not nil, WhenUnsatisfiable must be DoNotSchedule.
-
-               For example, in a 3-zone cluster, MaxSkew is set to 2, MinDomains is set to 5 and pods with the same
-               labelSelector spread as 2/2/2:
-               | zone1 | zone2 | zone3 |
-               |  P P  |  P P  |  P P  |
-               The number of domains is less than 5(MinDomains), so "global minimum" is treated as 0.
-               In this situation, new pod with the same labelSelector cannot be scheduled,
-               because computed skew will be 3(3 - 0) if new Pod is scheduled to any of the three zones,
-               it will violate MaxSkew.
-        :param pulumi.Input[_builtins.str] node_affinity_policy: NodeAffinityPolicy indicates how we will treat Pod's nodeAffinity/nodeSelector
-               when calculating pod topology spread skew. Options are:
-               - Honor: only nodes matching nodeAffinity/nodeSelector are included in the calculations.
-               - Ignore: nodeAffinity/nodeSelector are ignored. All nodes are included in the calculations.
-
-               If this value is nil, the behavior is equivalent to the Honor policy.
-        :param pulumi.Input[_builtins.str] node_taints_policy: NodeTaintsPolicy indicates how we will treat node taints when calculating
-               pod topology spread skew. Options are:
-               - Honor: nodes without taints, along with tainted nodes for which the incoming pod
-               has a toleration, are included.
-               - Ignore: node taints are ignored. All nodes are included.
-
-               If this value is nil, the behavior is equivalent to the Ignore policy.
-        :param pulumi.Input[_builtins.str] topology_key: TopologyKey is the key of node labels. Nodes that have a label with this key
-               and identical values are considered to be in the same topology.
-               We consider each <key, value> as a "bucket", and try to put balanced number
-               of pods into each bucket.
-               We define a domain as a particular instance of a topology.
-               Also, we define an eligible domain as a domain whose nodes meet the requirements of
-               nodeAffinityPolicy and nodeTaintsPolicy.
-               e.g. If TopologyKey is "kubernetes.io/hostname", each Node is a domain of that topology.
-               And, if TopologyKey is "topology.kubernetes.io/zone", each zone is a domain of that topology.
-               It's a required field.
-        :param pulumi.Input[_builtins.str] when_unsatisfiable: WhenUnsatisfiable indicates how to deal with a pod if it doesn't satisfy
-               the spread constraint.
-               - DoNotSchedule (default) tells the scheduler not to schedule it.
-               - ScheduleAnyway tells the scheduler to schedule the pod in any location,
-                 but giving higher precedence to topologies that would help reduce the
-                 skew.
-               A constraint is considered "Unsatisfiable" for an incoming pod
-               if and only if every possible node assignment for that pod would violate
-               "MaxSkew" on some topology.
-               For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-               labelSelector spread as 3/1/1:
-               | zone1 | zone2 | zone3 |
-               | P P P |   P   |   P   |
-               If WhenUnsatisfiable is set to DoNotSchedule, incoming pod can only be scheduled
-               to zone2(zone3) to become 3/2/1(3/1/2) as ActualSkew(2-1) on zone2(zone3) satisfies
-               MaxSkew(1). In other words, the cluster can still be imbalanced, but scheduler
-               won't make it *more* imbalanced.
-               It's a required field.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if max_skew is not None:
-            pulumi.set(__self__, "max_skew", max_skew)
-        if min_domains is not None:
-            pulumi.set(__self__, "min_domains", min_domains)
-        if node_affinity_policy is not None:
-            pulumi.set(__self__, "node_affinity_policy", node_affinity_policy)
-        if node_taints_policy is not None:
-            pulumi.set(__self__, "node_taints_policy", node_taints_policy)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-        if when_unsatisfiable is not None:
-            pulumi.set(__self__, "when_unsatisfiable", when_unsatisfiable)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatchArgs']]:
-        return pulumi.get(self, "label_selector")
-
-    @label_selector.setter
-    def label_selector(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatchArgs']]):
-        pulumi.set(self, "label_selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select the pods over which
-        spreading will be calculated. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are ANDed with labelSelector
-        to select the group of existing pods over which spreading will be calculated
-        for the incoming pod. The same key is forbidden to exist in both MatchLabelKeys and LabelSelector.
-        MatchLabelKeys cannot be set when LabelSelector isn't set.
-        Keys that don't exist in the incoming pod labels will
-        be ignored. A null or empty list means only match against labelSelector.
-
-        This is a beta field and requires the MatchLabelKeysInPodTopologySpread feature gate to be enabled (enabled by default).
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @match_label_keys.setter
-    def match_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_label_keys", value)
-
-    @_builtins.property
-    @pulumi.getter(name="maxSkew")
-    def max_skew(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        MaxSkew describes the degree to which pods may be unevenly distributed.
-        When `whenUnsatisfiable=DoNotSchedule`, it is the maximum permitted difference
-        between the number of matching pods in the target topology and the global minimum.
-        The global minimum is the minimum number of matching pods in an eligible domain
-        or zero if the number of eligible domains is less than MinDomains.
-        For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-        labelSelector spread as 2/2/1:
-        In this case, the global minimum is 1.
-        | zone1 | zone2 | zone3 |
-        |  P P  |  P P  |   P   |
-        - if MaxSkew is 1, incoming pod can only be scheduled to zone3 to become 2/2/2;
-        scheduling it onto zone1(zone2) would make the ActualSkew(3-1) on zone1(zone2)
-        violate MaxSkew(1).
-        - if MaxSkew is 2, incoming pod can be scheduled onto any zone.
-        When `whenUnsatisfiable=ScheduleAnyway`, it is used to give higher precedence
-        to topologies that satisfy it.
-        It's a required field. Default value is 1 and 0 is not allowed.
-        """
-        return pulumi.get(self, "max_skew")
-
-    @max_skew.setter
-    def max_skew(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "max_skew", value)
-
-    @_builtins.property
-    @pulumi.getter(name="minDomains")
-    def min_domains(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        MinDomains indicates a minimum number of eligible domains.
-        When the number of eligible domains with matching topology keys is less than minDomains,
-        Pod Topology Spread treats "global minimum" as 0, and then the calculation of Skew is performed.
-        And when the number of eligible domains with matching topology keys equals or greater than minDomains,
-        this value has no effect on scheduling.
-        As a result, when the number of eligible domains is less than minDomains,
-        scheduler won't schedule more than maxSkew Pods to those domains.
-        If value is nil, the constraint behaves as if MinDomains is equal to 1.
-        Valid values are integers greater than 0.
-        When value is not nil, WhenUnsatisfiable must be DoNotSchedule.
-
-        For example, in a 3-zone cluster, MaxSkew is set to 2, MinDomains is set to 5 and pods with the same
-        labelSelector spread as 2/2/2:
-        | zone1 | zone2 | zone3 |
-        |  P P  |  P P  |  P P  |
-        The number of domains is less than 5(MinDomains), so "global minimum" is treated as 0.
-        In this situation, new pod with the same labelSelector cannot be scheduled,
-        because computed skew will be 3(3 - 0) if new Pod is scheduled to any of the three zones,
-        it will violate MaxSkew.
-        """
-        return pulumi.get(self, "min_domains")
-
-    @min_domains.setter
-    def min_domains(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "min_domains", value)
-
-    @_builtins.property
-    @pulumi.getter(name="nodeAffinityPolicy")
-    def node_affinity_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        NodeAffinityPolicy indicates how we will treat Pod's nodeAffinity/nodeSelector
-        when calculating pod topology spread skew. Options are:
-        - Honor: only nodes matching nodeAffinity/nodeSelector are included in the calculations.
-        - Ignore: nodeAffinity/nodeSelector are ignored. All nodes are included in the calculations.
-
-        If this value is nil, the behavior is equivalent to the Honor policy.
-        """
-        return pulumi.get(self, "node_affinity_policy")
-
-    @node_affinity_policy.setter
-    def node_affinity_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "node_affinity_policy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="nodeTaintsPolicy")
-    def node_taints_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        NodeTaintsPolicy indicates how we will treat node taints when calculating
-        pod topology spread skew. Options are:
-        - Honor: nodes without taints, along with tainted nodes for which the incoming pod
-        has a toleration, are included.
-        - Ignore: node taints are ignored. All nodes are included.
-
-        If this value is nil, the behavior is equivalent to the Ignore policy.
-        """
-        return pulumi.get(self, "node_taints_policy")
-
-    @node_taints_policy.setter
-    def node_taints_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "node_taints_policy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        TopologyKey is the key of node labels. Nodes that have a label with this key
-        and identical values are considered to be in the same topology.
-        We consider each <key, value> as a "bucket", and try to put balanced number
-        of pods into each bucket.
-        We define a domain as a particular instance of a topology.
-        Also, we define an eligible domain as a domain whose nodes meet the requirements of
-        nodeAffinityPolicy and nodeTaintsPolicy.
-        e.g. If TopologyKey is "kubernetes.io/hostname", each Node is a domain of that topology.
-        And, if TopologyKey is "topology.kubernetes.io/zone", each zone is a domain of that topology.
-        It's a required field.
-        """
-        return pulumi.get(self, "topology_key")
-
-    @topology_key.setter
-    def topology_key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "topology_key", value)
-
-    @_builtins.property
-    @pulumi.getter(name="whenUnsatisfiable")
-    def when_unsatisfiable(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        WhenUnsatisfiable indicates how to deal with a pod if it doesn't satisfy
-        the spread constraint.
-        - DoNotSchedule (default) tells the scheduler not to schedule it.
-        - ScheduleAnyway tells the scheduler to schedule the pod in any location,
-          but giving higher precedence to topologies that would help reduce the
-          skew.
-        A constraint is considered "Unsatisfiable" for an incoming pod
-        if and only if every possible node assignment for that pod would violate
-        "MaxSkew" on some topology.
-        For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-        labelSelector spread as 3/1/1:
-        | zone1 | zone2 | zone3 |
-        | P P P |   P   |   P   |
-        If WhenUnsatisfiable is set to DoNotSchedule, incoming pod can only be scheduled
-        to zone2(zone3) to become 3/2/1(3/1/2) as ActualSkew(2-1) on zone2(zone3) satisfies
-        MaxSkew(1). In other words, the cluster can still be imbalanced, but scheduler
-        won't make it *more* imbalanced.
-        It's a required field.
-        """
-        return pulumi.get(self, "when_unsatisfiable")
-
-    @when_unsatisfiable.setter
-    def when_unsatisfiable(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "when_unsatisfiable", value)
-
-
-class ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgsDict(TypedDict):
-    """
-    TopologySpreadConstraint specifies how to spread matching pods among the given topology.
-    """
-    label_selector: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorArgs']]]
-    match_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
-    """
-    MatchLabelKeys is a set of pod label keys to select the pods over which
-    spreading will be calculated. The keys are used to lookup values from the
-    incoming pod labels, those key-value labels are ANDed with labelSelector
-    to select the group of existing pods over which spreading will be calculated
-    for the incoming pod. The same key is forbidden to exist in both MatchLabelKeys and LabelSelector.
-    MatchLabelKeys cannot be set when LabelSelector isn't set.
-    Keys that don't exist in the incoming pod labels will
-    be ignored. A null or empty list means only match against labelSelector.
-
-    This is a beta field and requires the MatchLabelKeysInPodTopologySpread feature gate to be enabled (enabled by default).
-    """
-    max_skew: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    MaxSkew describes the degree to which pods may be unevenly distributed.
-    When `whenUnsatisfiable=DoNotSchedule`, it is the maximum permitted difference
-    between the number of matching pods in the target topology and the global minimum.
-    The global minimum is the minimum number of matching pods in an eligible domain
-    or zero if the number of eligible domains is less than MinDomains.
-    For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-    labelSelector spread as 2/2/1:
-    In this case, the global minimum is 1.
-    | zone1 | zone2 | zone3 |
-    |  P P  |  P P  |   P   |
-    - if MaxSkew is 1, incoming pod can only be scheduled to zone3 to become 2/2/2;
-    scheduling it onto zone1(zone2) would make the ActualSkew(3-1) on zone1(zone2)
-    violate MaxSkew(1).
-    - if MaxSkew is 2, incoming pod can be scheduled onto any zone.
-    When `whenUnsatisfiable=ScheduleAnyway`, it is used to give higher precedence
-    to topologies that satisfy it.
-    It's a required field. Default value is 1 and 0 is not allowed.
-    """
-    min_domains: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    MinDomains indicates a minimum number of eligible domains.
-    When the number of eligible domains with matching topology keys is less than minDomains,
-    Pod Topology Spread treats "global minimum" as 0, and then the calculation of Skew is performed.
-    And when the number of eligible domains with matching topology keys equals or greater than minDomains,
-    this value has no effect on scheduling.
-    As a result, when the number of eligible domains is less than minDomains,
-    scheduler won't schedule more than maxSkew Pods to those domains.
-    If value is nil, the constraint behaves as if MinDomains is equal to 1.
-    Valid values are integers greater than 0.
-    When value is not nil, WhenUnsatisfiable must be DoNotSchedule.
-
-    For example, in a 3-zone cluster, MaxSkew is set to 2, MinDomains is set to 5 and pods with the same
-    labelSelector spread as 2/2/2:
-    | zone1 | zone2 | zone3 |
-    |  P P  |  P P  |  P P  |
-    The number of domains is less than 5(MinDomains), so "global minimum" is treated as 0.
-    In this situation, new pod with the same labelSelector cannot be scheduled,
-    because computed skew will be 3(3 - 0) if new Pod is scheduled to any of the three zones,
-    it will violate MaxSkew.
-    """
-    node_affinity_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    NodeAffinityPolicy indicates how we will treat Pod's nodeAffinity/nodeSelector
-    when calculating pod topology spread skew. Options are:
-    - Honor: only nodes matching nodeAffinity/nodeSelector are included in the calculations.
-    - Ignore: nodeAffinity/nodeSelector are ignored. All nodes are included in the calculations.
-
-    If this value is nil, the behavior is equivalent to the Honor policy.
-    """
-    node_taints_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    NodeTaintsPolicy indicates how we will treat node taints when calculating
-    pod topology spread skew. Options are:
-    - Honor: nodes without taints, along with tainted nodes for which the incoming pod
-    has a toleration, are included.
-    - Ignore: node taints are ignored. All nodes are included.
-
-    If this value is nil, the behavior is equivalent to the Ignore policy.
-    """
-    topology_key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    TopologyKey is the key of node labels. Nodes that have a label with this key
-    and identical values are considered to be in the same topology.
-    We consider each <key, value> as a "bucket", and try to put balanced number
-    of pods into each bucket.
-    We define a domain as a particular instance of a topology.
-    Also, we define an eligible domain as a domain whose nodes meet the requirements of
-    nodeAffinityPolicy and nodeTaintsPolicy.
-    e.g. If TopologyKey is "kubernetes.io/hostname", each Node is a domain of that topology.
-    And, if TopologyKey is "topology.kubernetes.io/zone", each zone is a domain of that topology.
-    It's a required field.
-    """
-    when_unsatisfiable: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    WhenUnsatisfiable indicates how to deal with a pod if it doesn't satisfy
-    the spread constraint.
-    - DoNotSchedule (default) tells the scheduler not to schedule it.
-    - ScheduleAnyway tells the scheduler to schedule the pod in any location,
-      but giving higher precedence to topologies that would help reduce the
-      skew.
-    A constraint is considered "Unsatisfiable" for an incoming pod
-    if and only if every possible node assignment for that pod would violate
-    "MaxSkew" on some topology.
-    For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-    labelSelector spread as 3/1/1:
-    | zone1 | zone2 | zone3 |
-    | P P P |   P   |   P   |
-    If WhenUnsatisfiable is set to DoNotSchedule, incoming pod can only be scheduled
-    to zone2(zone3) to become 3/2/1(3/1/2) as ActualSkew(2-1) on zone2(zone3) satisfies
-    MaxSkew(1). In other words, the cluster can still be imbalanced, but scheduler
-    won't make it *more* imbalanced.
-    It's a required field.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs:
-    def __init__(__self__, *,
-                 label_selector: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorArgs']] = None,
-                 match_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
-                 max_skew: pulumi.Input[Optional[_builtins.int]] = None,
-                 min_domains: pulumi.Input[Optional[_builtins.int]] = None,
-                 node_affinity_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 node_taints_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 topology_key: pulumi.Input[Optional[_builtins.str]] = None,
-                 when_unsatisfiable: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        TopologySpreadConstraint specifies how to spread matching pods among the given topology.
-
-        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] match_label_keys: MatchLabelKeys is a set of pod label keys to select the pods over which
-               spreading will be calculated. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are ANDed with labelSelector
-               to select the group of existing pods over which spreading will be calculated
-               for the incoming pod. The same key is forbidden to exist in both MatchLabelKeys and LabelSelector.
-               MatchLabelKeys cannot be set when LabelSelector isn't set.
-               Keys that don't exist in the incoming pod labels will
-               be ignored. A null or empty list means only match against labelSelector.
-
-               This is a beta field and requires the MatchLabelKeysInPodTopologySpread feature gate to be enabled (enabled by default).
-        :param pulumi.Input[_builtins.int] max_skew: MaxSkew describes the degree to which pods may be unevenly distributed.
-               When `whenUnsatisfiable=DoNotSchedule`, it is the maximum permitted difference
-               between the number of matching pods in the target topology and the global minimum.
-               The global minimum is the minimum number of matching pods in an eligible domain
-               or zero if the number of eligible domains is less than MinDomains.
-               For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-               labelSelector spread as 2/2/1:
-               In this case, the global minimum is 1.
-               | zone1 | zone2 | zone3 |
-               |  P P  |  P P  |   P   |
-               - if MaxSkew is 1, incoming pod can only be scheduled to zone3 to become 2/2/2;
-               scheduling it onto zone1(zone2) would make the ActualSkew(3-1) on zone1(zone2)
-               violate MaxSkew(1).
-               - if MaxSkew is 2, incoming pod can be scheduled onto any zone.
-               When `whenUnsatisfiable=ScheduleAnyway`, it is used to give higher precedence
-               to topologies that satisfy it.
-               It's a required field. Default value is 1 and 0 is not allowed.
-        :param pulumi.Input[_builtins.int] min_domains: MinDomains indicates a minimum number of eligible domains.
-               When the number of eligible domains with matching topology keys is less than minDomains,
-               Pod Topology Spread treats "global minimum" as 0, and then the calculation of Skew is performed.
-               And when the number of eligible domains with matching topology keys equals or greater than minDomains,
-               this value has no effect on scheduling.
-               As a result, when the number of eligible domains is less than minDomains,
-               scheduler won't schedule more than maxSkew Pods to those domains.
-               If value is nil, the constraint behaves as if MinDomains is equal to 1.
-               Valid values are integers greater than 0.
-               When value is not nil, WhenUnsatisfiable must be DoNotSchedule.
-
-               For example, in a 3-zone cluster, MaxSkew is set to 2, MinDomains is set to 5 and pods with the same
-               labelSelector spread as 2/2/2:
-               | zone1 | zone2 | zone3 |
-               |  P P  |  P P  |  P P  |
-               The number of domains is less than 5(MinDomains), so "global minimum" is treated as 0.
-               In this situation, new pod with the same labelSelector cannot be scheduled,
-               because computed skew will be 3(3 - 0) if new Pod is scheduled to any of the three zones,
-               it will violate MaxSkew.
-        :param pulumi.Input[_builtins.str] node_affinity_policy: NodeAffinityPolicy indicates how we will treat Pod's nodeAffinity/nodeSelector
-               when calculating pod topology spread skew. Options are:
-               - Honor: only nodes matching nodeAffinity/nodeSelector are included in the calculations.
-               - Ignore: nodeAffinity/nodeSelector are ignored. All nodes are included in the calculations.
-
-               If this value is nil, the behavior is equivalent to the Honor policy.
-        :param pulumi.Input[_builtins.str] node_taints_policy: NodeTaintsPolicy indicates how we will treat node taints when calculating
-               pod topology spread skew. Options are:
-               - Honor: nodes without taints, along with tainted nodes for which the incoming pod
-               has a toleration, are included.
-               - Ignore: node taints are ignored. All nodes are included.
-
-               If this value is nil, the behavior is equivalent to the Ignore policy.
-        :param pulumi.Input[_builtins.str] topology_key: TopologyKey is the key of node labels. Nodes that have a label with this key
-               and identical values are considered to be in the same topology.
-               We consider each <key, value> as a "bucket", and try to put balanced number
-               of pods into each bucket.
-               We define a domain as a particular instance of a topology.
-               Also, we define an eligible domain as a domain whose nodes meet the requirements of
-               nodeAffinityPolicy and nodeTaintsPolicy.
-               e.g. If TopologyKey is "kubernetes.io/hostname", each Node is a domain of that topology.
-               And, if TopologyKey is "topology.kubernetes.io/zone", each zone is a domain of that topology.
-               It's a required field.
-        :param pulumi.Input[_builtins.str] when_unsatisfiable: WhenUnsatisfiable indicates how to deal with a pod if it doesn't satisfy
-               the spread constraint.
-               - DoNotSchedule (default) tells the scheduler not to schedule it.
-               - ScheduleAnyway tells the scheduler to schedule the pod in any location,
-                 but giving higher precedence to topologies that would help reduce the
-                 skew.
-               A constraint is considered "Unsatisfiable" for an incoming pod
-               if and only if every possible node assignment for that pod would violate
-               "MaxSkew" on some topology.
-               For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-               labelSelector spread as 3/1/1:
-               | zone1 | zone2 | zone3 |
-               | P P P |   P   |   P   |
-               If WhenUnsatisfiable is set to DoNotSchedule, incoming pod can only be scheduled
-               to zone2(zone3) to become 3/2/1(3/1/2) as ActualSkew(2-1) on zone2(zone3) satisfies
-               MaxSkew(1). In other words, the cluster can still be imbalanced, but scheduler
-               won't make it *more* imbalanced.
-               It's a required field.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if max_skew is not None:
-            pulumi.set(__self__, "max_skew", max_skew)
-        if min_domains is not None:
-            pulumi.set(__self__, "min_domains", min_domains)
-        if node_affinity_policy is not None:
-            pulumi.set(__self__, "node_affinity_policy", node_affinity_policy)
-        if node_taints_policy is not None:
-            pulumi.set(__self__, "node_taints_policy", node_taints_policy)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-        if when_unsatisfiable is not None:
-            pulumi.set(__self__, "when_unsatisfiable", when_unsatisfiable)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorArgs']]:
-        return pulumi.get(self, "label_selector")
-
-    @label_selector.setter
-    def label_selector(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorArgs']]):
-        pulumi.set(self, "label_selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select the pods over which
-        spreading will be calculated. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are ANDed with labelSelector
-        to select the group of existing pods over which spreading will be calculated
-        for the incoming pod. The same key is forbidden to exist in both MatchLabelKeys and LabelSelector.
-        MatchLabelKeys cannot be set when LabelSelector isn't set.
-        Keys that don't exist in the incoming pod labels will
-        be ignored. A null or empty list means only match against labelSelector.
-
-        This is a beta field and requires the MatchLabelKeysInPodTopologySpread feature gate to be enabled (enabled by default).
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @match_label_keys.setter
-    def match_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "match_label_keys", value)
-
-    @_builtins.property
-    @pulumi.getter(name="maxSkew")
-    def max_skew(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        MaxSkew describes the degree to which pods may be unevenly distributed.
-        When `whenUnsatisfiable=DoNotSchedule`, it is the maximum permitted difference
-        between the number of matching pods in the target topology and the global minimum.
-        The global minimum is the minimum number of matching pods in an eligible domain
-        or zero if the number of eligible domains is less than MinDomains.
-        For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-        labelSelector spread as 2/2/1:
-        In this case, the global minimum is 1.
-        | zone1 | zone2 | zone3 |
-        |  P P  |  P P  |   P   |
-        - if MaxSkew is 1, incoming pod can only be scheduled to zone3 to become 2/2/2;
-        scheduling it onto zone1(zone2) would make the ActualSkew(3-1) on zone1(zone2)
-        violate MaxSkew(1).
-        - if MaxSkew is 2, incoming pod can be scheduled onto any zone.
-        When `whenUnsatisfiable=ScheduleAnyway`, it is used to give higher precedence
-        to topologies that satisfy it.
-        It's a required field. Default value is 1 and 0 is not allowed.
-        """
-        return pulumi.get(self, "max_skew")
-
-    @max_skew.setter
-    def max_skew(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "max_skew", value)
-
-    @_builtins.property
-    @pulumi.getter(name="minDomains")
-    def min_domains(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        MinDomains indicates a minimum number of eligible domains.
-        When the number of eligible domains with matching topology keys is less than minDomains,
-        Pod Topology Spread treats "global minimum" as 0, and then the calculation of Skew is performed.
-        And when the number of eligible domains with matching topology keys equals or greater than minDomains,
-        this value has no effect on scheduling.
-        As a result, when the number of eligible domains is less than minDomains,
-        scheduler won't schedule more than maxSkew Pods to those domains.
-        If value is nil, the constraint behaves as if MinDomains is equal to 1.
-        Valid values are integers greater than 0.
-        When value is not nil, WhenUnsatisfiable must be DoNotSchedule.
-
-        For example, in a 3-zone cluster, MaxSkew is set to 2, MinDomains is set to 5 and pods with the same
-        labelSelector spread as 2/2/2:
-        | zone1 | zone2 | zone3 |
-        |  P P  |  P P  |  P P  |
-        The number of domains is less than 5(MinDomains), so "global minimum" is treated as 0.
-        In this situation, new pod with the same labelSelector cannot be scheduled,
-        because computed skew will be 3(3 - 0) if new Pod is scheduled to any of the three zones,
-        it will violate MaxSkew.
-        """
-        return pulumi.get(self, "min_domains")
-
-    @min_domains.setter
-    def min_domains(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "min_domains", value)
-
-    @_builtins.property
-    @pulumi.getter(name="nodeAffinityPolicy")
-    def node_affinity_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        NodeAffinityPolicy indicates how we will treat Pod's nodeAffinity/nodeSelector
-        when calculating pod topology spread skew. Options are:
-        - Honor: only nodes matching nodeAffinity/nodeSelector are included in the calculations.
-        - Ignore: nodeAffinity/nodeSelector are ignored. All nodes are included in the calculations.
-
-        If this value is nil, the behavior is equivalent to the Honor policy.
-        """
-        return pulumi.get(self, "node_affinity_policy")
-
-    @node_affinity_policy.setter
-    def node_affinity_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "node_affinity_policy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="nodeTaintsPolicy")
-    def node_taints_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        NodeTaintsPolicy indicates how we will treat node taints when calculating
-        pod topology spread skew. Options are:
-        - Honor: nodes without taints, along with tainted nodes for which the incoming pod
-        has a toleration, are included.
-        - Ignore: node taints are ignored. All nodes are included.
-
-        If this value is nil, the behavior is equivalent to the Ignore policy.
-        """
-        return pulumi.get(self, "node_taints_policy")
-
-    @node_taints_policy.setter
-    def node_taints_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "node_taints_policy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        TopologyKey is the key of node labels. Nodes that have a label with this key
-        and identical values are considered to be in the same topology.
-        We consider each <key, value> as a "bucket", and try to put balanced number
-        of pods into each bucket.
-        We define a domain as a particular instance of a topology.
-        Also, we define an eligible domain as a domain whose nodes meet the requirements of
-        nodeAffinityPolicy and nodeTaintsPolicy.
-        e.g. If TopologyKey is "kubernetes.io/hostname", each Node is a domain of that topology.
-        And, if TopologyKey is "topology.kubernetes.io/zone", each zone is a domain of that topology.
-        It's a required field.
-        """
-        return pulumi.get(self, "topology_key")
-
-    @topology_key.setter
-    def topology_key(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "topology_key", value)
-
-    @_builtins.property
-    @pulumi.getter(name="whenUnsatisfiable")
-    def when_unsatisfiable(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        WhenUnsatisfiable indicates how to deal with a pod if it doesn't satisfy
-        the spread constraint.
-        - DoNotSchedule (default) tells the scheduler not to schedule it.
-        - ScheduleAnyway tells the scheduler to schedule the pod in any location,
-          but giving higher precedence to topologies that would help reduce the
-          skew.
-        A constraint is considered "Unsatisfiable" for an incoming pod
-        if and only if every possible node assignment for that pod would violate
-        "MaxSkew" on some topology.
-        For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-        labelSelector spread as 3/1/1:
-        | zone1 | zone2 | zone3 |
-        | P P P |   P   |   P   |
-        If WhenUnsatisfiable is set to DoNotSchedule, incoming pod can only be scheduled
-        to zone2(zone3) to become 3/2/1(3/1/2) as ActualSkew(2-1) on zone2(zone3) satisfies
-        MaxSkew(1). In other words, the cluster can still be imbalanced, but scheduler
-        won't make it *more* imbalanced.
-        It's a required field.
-        """
-        return pulumi.get(self, "when_unsatisfiable")
-
-    @when_unsatisfiable.setter
-    def when_unsatisfiable(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "when_unsatisfiable", value)
-
-
-class ProxyClassSpecStatefulSetPodArgsDict(TypedDict):
-    """
-    Configuration for the proxy Pod.
-    """
-    affinity: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityArgs']]]
-    annotations: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    Annotations that will be added to the proxy Pod.
-    Any annotations specified here will be merged with the default
-    annotations applied to the Pod by the Tailscale Kubernetes operator.
-    Annotations must be valid Kubernetes annotations.
-    https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-    """
-    dns_config: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodDnsConfigArgs']]]
-    dns_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    DNSPolicy defines how DNS will be configured for the proxy Pod.
-    By default the Tailscale Kubernetes Operator does not set a DNS policy (uses cluster default).
-    https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-s-dns-policy
-    """
-    image_pull_secrets: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodImagePullSecretsArgs']]]]]
-    """
-    Proxy Pod's image pull Secrets.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#PodSpec
-    """
-    labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    Labels that will be added to the proxy Pod.
-    Any labels specified here will be merged with the default labels
-    applied to the Pod by the Tailscale Kubernetes operator.
-    Label keys and values must be valid Kubernetes label keys and values.
-    https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-    """
-    node_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Proxy Pod's node name.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-    """
-    node_selector: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    Proxy Pod's node selector.
-    By default Tailscale Kubernetes operator does not apply any node
-    selector.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-    """
-    priority_class_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    PriorityClassName for the proxy Pod.
-    By default Tailscale Kubernetes operator does not apply any priority class.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-    """
-    security_context: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextArgs']]]
-    tailscale_container: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerArgs']]]
-    tailscale_init_container: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerArgs']]]
-    tolerations: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTolerationsArgs']]]]]
-    """
-    Proxy Pod's tolerations.
-    By default Tailscale Kubernetes operator does not apply any
-    tolerations.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-    """
-    topology_spread_constraints: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs']]]]]
-    """
-    Proxy Pod's topology spread constraints.
-    By default Tailscale Kubernetes operator does not apply any topology spread constraints.
-    https://kubernetes.io/docs/concepts/scheduling-eviction/topology-spread-constraints/
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetPodArgs:
-    def __init__(__self__, *,
-                 affinity: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityArgs']] = None,
-                 annotations: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 dns_config: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodDnsConfigArgs']] = None,
-                 dns_policy: pulumi.Input[Optional[_builtins.str]] = None,
-                 image_pull_secrets: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodImagePullSecretsArgs']]]] = None,
-                 labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 node_name: pulumi.Input[Optional[_builtins.str]] = None,
-                 node_selector: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 priority_class_name: pulumi.Input[Optional[_builtins.str]] = None,
-                 security_context: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextArgs']] = None,
-                 tailscale_container: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerArgs']] = None,
-                 tailscale_init_container: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerArgs']] = None,
-                 tolerations: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTolerationsArgs']]]] = None,
-                 topology_spread_constraints: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs']]]] = None):
-        """
-        Configuration for the proxy Pod.
-
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] annotations: Annotations that will be added to the proxy Pod.
-               Any annotations specified here will be merged with the default
-               annotations applied to the Pod by the Tailscale Kubernetes operator.
-               Annotations must be valid Kubernetes annotations.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-        :param pulumi.Input[_builtins.str] dns_policy: DNSPolicy defines how DNS will be configured for the proxy Pod.
-               By default the Tailscale Kubernetes Operator does not set a DNS policy (uses cluster default).
-               https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-s-dns-policy
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodImagePullSecretsArgs']]] image_pull_secrets: Proxy Pod's image pull Secrets.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#PodSpec
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] labels: Labels that will be added to the proxy Pod.
-               Any labels specified here will be merged with the default labels
-               applied to the Pod by the Tailscale Kubernetes operator.
-               Label keys and values must be valid Kubernetes label keys and values.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        :param pulumi.Input[_builtins.str] node_name: Proxy Pod's node name.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] node_selector: Proxy Pod's node selector.
-               By default Tailscale Kubernetes operator does not apply any node
-               selector.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        :param pulumi.Input[_builtins.str] priority_class_name: PriorityClassName for the proxy Pod.
-               By default Tailscale Kubernetes operator does not apply any priority class.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTolerationsArgs']]] tolerations: Proxy Pod's tolerations.
-               By default Tailscale Kubernetes operator does not apply any
-               tolerations.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs']]] topology_spread_constraints: Proxy Pod's topology spread constraints.
-               By default Tailscale Kubernetes operator does not apply any topology spread constraints.
-               https://kubernetes.io/docs/concepts/scheduling-eviction/topology-spread-constraints/
-        """
-        if affinity is not None:
-            pulumi.set(__self__, "affinity", affinity)
-        if annotations is not None:
-            pulumi.set(__self__, "annotations", annotations)
-        if dns_config is not None:
-            pulumi.set(__self__, "dns_config", dns_config)
-        if dns_policy is not None:
-            pulumi.set(__self__, "dns_policy", dns_policy)
-        if image_pull_secrets is not None:
-            pulumi.set(__self__, "image_pull_secrets", image_pull_secrets)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-        if node_name is not None:
-            pulumi.set(__self__, "node_name", node_name)
-        if node_selector is not None:
-            pulumi.set(__self__, "node_selector", node_selector)
-        if priority_class_name is not None:
-            pulumi.set(__self__, "priority_class_name", priority_class_name)
-        if security_context is not None:
-            pulumi.set(__self__, "security_context", security_context)
-        if tailscale_container is not None:
-            pulumi.set(__self__, "tailscale_container", tailscale_container)
-        if tailscale_init_container is not None:
-            pulumi.set(__self__, "tailscale_init_container", tailscale_init_container)
-        if tolerations is not None:
-            pulumi.set(__self__, "tolerations", tolerations)
-        if topology_spread_constraints is not None:
-            pulumi.set(__self__, "topology_spread_constraints", topology_spread_constraints)
-
-    @_builtins.property
-    @pulumi.getter
-    def affinity(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityArgs']]:
-        return pulumi.get(self, "affinity")
-
-    @affinity.setter
-    def affinity(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodAffinityArgs']]):
-        pulumi.set(self, "affinity", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def annotations(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        Annotations that will be added to the proxy Pod.
-        Any annotations specified here will be merged with the default
-        annotations applied to the Pod by the Tailscale Kubernetes operator.
-        Annotations must be valid Kubernetes annotations.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-        """
-        return pulumi.get(self, "annotations")
-
-    @annotations.setter
-    def annotations(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "annotations", value)
-
-    @_builtins.property
-    @pulumi.getter(name="dnsConfig")
-    def dns_config(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodDnsConfigArgs']]:
-        return pulumi.get(self, "dns_config")
-
-    @dns_config.setter
-    def dns_config(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodDnsConfigArgs']]):
-        pulumi.set(self, "dns_config", value)
-
-    @_builtins.property
-    @pulumi.getter(name="dnsPolicy")
-    def dns_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        DNSPolicy defines how DNS will be configured for the proxy Pod.
-        By default the Tailscale Kubernetes Operator does not set a DNS policy (uses cluster default).
-        https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-s-dns-policy
-        """
-        return pulumi.get(self, "dns_policy")
-
-    @dns_policy.setter
-    def dns_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "dns_policy", value)
-
-    @_builtins.property
-    @pulumi.getter(name="imagePullSecrets")
-    def image_pull_secrets(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodImagePullSecretsArgs']]]]:
-        """
-        Proxy Pod's image pull Secrets.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#PodSpec
-        """
-        return pulumi.get(self, "image_pull_secrets")
-
-    @image_pull_secrets.setter
-    def image_pull_secrets(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodImagePullSecretsArgs']]]]):
-        pulumi.set(self, "image_pull_secrets", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        Labels that will be added to the proxy Pod.
-        Any labels specified here will be merged with the default labels
-        applied to the Pod by the Tailscale Kubernetes operator.
-        Label keys and values must be valid Kubernetes label keys and values.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        return pulumi.get(self, "labels")
-
-    @labels.setter
-    def labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "labels", value)
-
-    @_builtins.property
-    @pulumi.getter(name="nodeName")
-    def node_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Proxy Pod's node name.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        """
-        return pulumi.get(self, "node_name")
-
-    @node_name.setter
-    def node_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "node_name", value)
-
-    @_builtins.property
-    @pulumi.getter(name="nodeSelector")
-    def node_selector(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        Proxy Pod's node selector.
-        By default Tailscale Kubernetes operator does not apply any node
-        selector.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        """
-        return pulumi.get(self, "node_selector")
-
-    @node_selector.setter
-    def node_selector(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "node_selector", value)
-
-    @_builtins.property
-    @pulumi.getter(name="priorityClassName")
-    def priority_class_name(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        PriorityClassName for the proxy Pod.
-        By default Tailscale Kubernetes operator does not apply any priority class.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        """
-        return pulumi.get(self, "priority_class_name")
-
-    @priority_class_name.setter
-    def priority_class_name(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "priority_class_name", value)
-
-    @_builtins.property
-    @pulumi.getter(name="securityContext")
-    def security_context(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextArgs']]:
-        return pulumi.get(self, "security_context")
-
-    @security_context.setter
-    def security_context(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodSecurityContextArgs']]):
-        pulumi.set(self, "security_context", value)
-
-    @_builtins.property
-    @pulumi.getter(name="tailscaleContainer")
-    def tailscale_container(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerArgs']]:
-        return pulumi.get(self, "tailscale_container")
-
-    @tailscale_container.setter
-    def tailscale_container(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleContainerArgs']]):
-        pulumi.set(self, "tailscale_container", value)
-
-    @_builtins.property
-    @pulumi.getter(name="tailscaleInitContainer")
-    def tailscale_init_container(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerArgs']]:
-        return pulumi.get(self, "tailscale_init_container")
-
-    @tailscale_init_container.setter
-    def tailscale_init_container(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodTailscaleInitContainerArgs']]):
-        pulumi.set(self, "tailscale_init_container", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def tolerations(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTolerationsArgs']]]]:
-        """
-        Proxy Pod's tolerations.
-        By default Tailscale Kubernetes operator does not apply any
-        tolerations.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        """
-        return pulumi.get(self, "tolerations")
-
-    @tolerations.setter
-    def tolerations(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTolerationsArgs']]]]):
-        pulumi.set(self, "tolerations", value)
-
-    @_builtins.property
-    @pulumi.getter(name="topologySpreadConstraints")
-    def topology_spread_constraints(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs']]]]:
-        """
-        Proxy Pod's topology spread constraints.
-        By default Tailscale Kubernetes operator does not apply any topology spread constraints.
-        https://kubernetes.io/docs/concepts/scheduling-eviction/topology-spread-constraints/
-        """
-        return pulumi.get(self, "topology_spread_constraints")
-
-    @topology_spread_constraints.setter
-    def topology_spread_constraints(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs']]]]):
-        pulumi.set(self, "topology_spread_constraints", value)
-
-
-class ProxyClassSpecStatefulSetArgsDict(TypedDict):
-    """
-    Configuration parameters for the proxy's StatefulSet. Tailscale
-    Kubernetes operator deploys a StatefulSet for each of the user
-    configured proxies (Tailscale Ingress, Tailscale Service, Connector).
-    """
-    annotations: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    Annotations that will be added to the StatefulSet created for the proxy.
-    Any Annotations specified here will be merged with the default annotations
-    applied to the StatefulSet by the Tailscale Kubernetes operator as
-    well as any other annotations that might have been applied by other
-    actors.
-    Annotations must be valid Kubernetes annotations.
-    https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-    """
-    labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    Labels that will be added to the StatefulSet created for the proxy.
-    Any labels specified here will be merged with the default labels
-    applied to the StatefulSet by the Tailscale Kubernetes operator as
-    well as any other labels that might have been applied by other
-    actors.
-    Label keys and values must be valid Kubernetes label keys and values.
-    https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-    """
-    pod: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetPodArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecStatefulSetArgs:
-    def __init__(__self__, *,
-                 annotations: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
-                 pod: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodArgs']] = None):
-        """
-        Configuration parameters for the proxy's StatefulSet. Tailscale
-        Kubernetes operator deploys a StatefulSet for each of the user
-        configured proxies (Tailscale Ingress, Tailscale Service, Connector).
-
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] annotations: Annotations that will be added to the StatefulSet created for the proxy.
-               Any Annotations specified here will be merged with the default annotations
-               applied to the StatefulSet by the Tailscale Kubernetes operator as
-               well as any other annotations that might have been applied by other
-               actors.
-               Annotations must be valid Kubernetes annotations.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] labels: Labels that will be added to the StatefulSet created for the proxy.
-               Any labels specified here will be merged with the default labels
-               applied to the StatefulSet by the Tailscale Kubernetes operator as
-               well as any other labels that might have been applied by other
-               actors.
-               Label keys and values must be valid Kubernetes label keys and values.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        if annotations is not None:
-            pulumi.set(__self__, "annotations", annotations)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-        if pod is not None:
-            pulumi.set(__self__, "pod", pod)
-
-    @_builtins.property
-    @pulumi.getter
-    def annotations(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        Annotations that will be added to the StatefulSet created for the proxy.
-        Any Annotations specified here will be merged with the default annotations
-        applied to the StatefulSet by the Tailscale Kubernetes operator as
-        well as any other annotations that might have been applied by other
-        actors.
-        Annotations must be valid Kubernetes annotations.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-        """
-        return pulumi.get(self, "annotations")
-
-    @annotations.setter
-    def annotations(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "annotations", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        Labels that will be added to the StatefulSet created for the proxy.
-        Any labels specified here will be merged with the default labels
-        applied to the StatefulSet by the Tailscale Kubernetes operator as
-        well as any other labels that might have been applied by other
-        actors.
-        Label keys and values must be valid Kubernetes label keys and values.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        return pulumi.get(self, "labels")
-
-    @labels.setter
-    def labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "labels", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def pod(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetPodArgs']]:
-        return pulumi.get(self, "pod")
-
-    @pod.setter
-    def pod(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetPodArgs']]):
-        pulumi.set(self, "pod", value)
-
-
-class ProxyClassSpecStaticEndpointsNodePortPatchArgsDict(TypedDict):
-    """
-    The configuration for static endpoints using NodePort Services.
-    """
-    ports: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStaticEndpointsNodePortPortsPatchArgs']]]]]
-    """
-    The port ranges from which the operator will select NodePorts for the Services.
-    You must ensure that firewall rules allow UDP ingress traffic for these ports
-    to the node's external IPs.
-    The ports must be in the range of service node ports for the cluster (default `30000-32767`).
-    See https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport.
-    """
-    selector: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    A selector which will be used to select the node's that will have their `ExternalIP`'s advertised
-    by the ProxyGroup as Static Endpoints.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStaticEndpointsNodePortPatchArgs:
-    def __init__(__self__, *,
-                 ports: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStaticEndpointsNodePortPortsPatchArgs']]]] = None,
-                 selector: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        The configuration for static endpoints using NodePort Services.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStaticEndpointsNodePortPortsPatchArgs']]] ports: The port ranges from which the operator will select NodePorts for the Services.
-               You must ensure that firewall rules allow UDP ingress traffic for these ports
-               to the node's external IPs.
-               The ports must be in the range of service node ports for the cluster (default `30000-32767`).
-               See https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] selector: A selector which will be used to select the node's that will have their `ExternalIP`'s advertised
-               by the ProxyGroup as Static Endpoints.
-        """
-        if ports is not None:
-            pulumi.set(__self__, "ports", ports)
-        if selector is not None:
-            pulumi.set(__self__, "selector", selector)
-
-    @_builtins.property
-    @pulumi.getter
-    def ports(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStaticEndpointsNodePortPortsPatchArgs']]]]:
-        """
-        The port ranges from which the operator will select NodePorts for the Services.
-        You must ensure that firewall rules allow UDP ingress traffic for these ports
-        to the node's external IPs.
-        The ports must be in the range of service node ports for the cluster (default `30000-32767`).
-        See https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport.
-        """
-        return pulumi.get(self, "ports")
-
-    @ports.setter
-    def ports(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStaticEndpointsNodePortPortsPatchArgs']]]]):
-        pulumi.set(self, "ports", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def selector(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        A selector which will be used to select the node's that will have their `ExternalIP`'s advertised
-        by the ProxyGroup as Static Endpoints.
-        """
-        return pulumi.get(self, "selector")
-
-    @selector.setter
-    def selector(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "selector", value)
-
-
-class ProxyClassSpecStaticEndpointsNodePortPortsPatchArgsDict(TypedDict):
-    end_port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    endPort indicates that the range of ports from port to endPort if set, inclusive,
-    should be used. This field cannot be defined if the port field is not defined.
-    The endPort must be either unset, or equal or greater than port.
-    """
-    port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    port represents a port selected to be used. This is a required field.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStaticEndpointsNodePortPortsPatchArgs:
-    def __init__(__self__, *,
-                 end_port: pulumi.Input[Optional[_builtins.int]] = None,
-                 port: pulumi.Input[Optional[_builtins.int]] = None):
-        """
-        :param pulumi.Input[_builtins.int] end_port: endPort indicates that the range of ports from port to endPort if set, inclusive,
-               should be used. This field cannot be defined if the port field is not defined.
-               The endPort must be either unset, or equal or greater than port.
-        :param pulumi.Input[_builtins.int] port: port represents a port selected to be used. This is a required field.
-        """
-        if end_port is not None:
-            pulumi.set(__self__, "end_port", end_port)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-
-    @_builtins.property
-    @pulumi.getter(name="endPort")
-    def end_port(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        endPort indicates that the range of ports from port to endPort if set, inclusive,
-        should be used. This field cannot be defined if the port field is not defined.
-        The endPort must be either unset, or equal or greater than port.
-        """
-        return pulumi.get(self, "end_port")
-
-    @end_port.setter
-    def end_port(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "end_port", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        port represents a port selected to be used. This is a required field.
-        """
-        return pulumi.get(self, "port")
-
-    @port.setter
-    def port(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "port", value)
-
-
-class ProxyClassSpecStaticEndpointsNodePortPortsArgsDict(TypedDict):
-    end_port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    endPort indicates that the range of ports from port to endPort if set, inclusive,
-    should be used. This field cannot be defined if the port field is not defined.
-    The endPort must be either unset, or equal or greater than port.
-    """
-    port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    port represents a port selected to be used. This is a required field.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStaticEndpointsNodePortPortsArgs:
-    def __init__(__self__, *,
-                 end_port: pulumi.Input[Optional[_builtins.int]] = None,
-                 port: pulumi.Input[Optional[_builtins.int]] = None):
-        """
-        :param pulumi.Input[_builtins.int] end_port: endPort indicates that the range of ports from port to endPort if set, inclusive,
-               should be used. This field cannot be defined if the port field is not defined.
-               The endPort must be either unset, or equal or greater than port.
-        :param pulumi.Input[_builtins.int] port: port represents a port selected to be used. This is a required field.
-        """
-        if end_port is not None:
-            pulumi.set(__self__, "end_port", end_port)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-
-    @_builtins.property
-    @pulumi.getter(name="endPort")
-    def end_port(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        endPort indicates that the range of ports from port to endPort if set, inclusive,
-        should be used. This field cannot be defined if the port field is not defined.
-        The endPort must be either unset, or equal or greater than port.
-        """
-        return pulumi.get(self, "end_port")
-
-    @end_port.setter
-    def end_port(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "end_port", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        port represents a port selected to be used. This is a required field.
-        """
-        return pulumi.get(self, "port")
-
-    @port.setter
-    def port(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "port", value)
-
-
-class ProxyClassSpecStaticEndpointsNodePortArgsDict(TypedDict):
-    """
-    The configuration for static endpoints using NodePort Services.
-    """
-    ports: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStaticEndpointsNodePortPortsArgs']]]]]
-    """
-    The port ranges from which the operator will select NodePorts for the Services.
-    You must ensure that firewall rules allow UDP ingress traffic for these ports
-    to the node's external IPs.
-    The ports must be in the range of service node ports for the cluster (default `30000-32767`).
-    See https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport.
-    """
-    selector: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
-    """
-    A selector which will be used to select the node's that will have their `ExternalIP`'s advertised
-    by the ProxyGroup as Static Endpoints.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecStaticEndpointsNodePortArgs:
-    def __init__(__self__, *,
-                 ports: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStaticEndpointsNodePortPortsArgs']]]] = None,
-                 selector: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
-        """
-        The configuration for static endpoints using NodePort Services.
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassSpecStaticEndpointsNodePortPortsArgs']]] ports: The port ranges from which the operator will select NodePorts for the Services.
-               You must ensure that firewall rules allow UDP ingress traffic for these ports
-               to the node's external IPs.
-               The ports must be in the range of service node ports for the cluster (default `30000-32767`).
-               See https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport.
-        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] selector: A selector which will be used to select the node's that will have their `ExternalIP`'s advertised
-               by the ProxyGroup as Static Endpoints.
-        """
-        if ports is not None:
-            pulumi.set(__self__, "ports", ports)
-        if selector is not None:
-            pulumi.set(__self__, "selector", selector)
-
-    @_builtins.property
-    @pulumi.getter
-    def ports(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStaticEndpointsNodePortPortsArgs']]]]:
-        """
-        The port ranges from which the operator will select NodePorts for the Services.
-        You must ensure that firewall rules allow UDP ingress traffic for these ports
-        to the node's external IPs.
-        The ports must be in the range of service node ports for the cluster (default `30000-32767`).
-        See https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport.
-        """
-        return pulumi.get(self, "ports")
-
-    @ports.setter
-    def ports(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassSpecStaticEndpointsNodePortPortsArgs']]]]):
-        pulumi.set(self, "ports", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def selector(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
-        """
-        A selector which will be used to select the node's that will have their `ExternalIP`'s advertised
-        by the ProxyGroup as Static Endpoints.
-        """
-        return pulumi.get(self, "selector")
-
-    @selector.setter
-    def selector(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
-        pulumi.set(self, "selector", value)
-
-
-class ProxyClassSpecStaticEndpointsPatchArgsDict(TypedDict):
-    """
-    Configuration for 'static endpoints' on proxies in order to facilitate
-    direct connections from other devices on the tailnet.
-    See https://tailscale.com/kb/1445/kubernetes-operator-customization#static-endpoints.
-    """
-    node_port: NotRequired[pulumi.Input[Optional['ProxyClassSpecStaticEndpointsNodePortPatchArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecStaticEndpointsPatchArgs:
-    def __init__(__self__, *,
-                 node_port: pulumi.Input[Optional['ProxyClassSpecStaticEndpointsNodePortPatchArgs']] = None):
-        """
-        Configuration for 'static endpoints' on proxies in order to facilitate
-        direct connections from other devices on the tailnet.
-        See https://tailscale.com/kb/1445/kubernetes-operator-customization#static-endpoints.
-        """
-        if node_port is not None:
-            pulumi.set(__self__, "node_port", node_port)
-
-    @_builtins.property
-    @pulumi.getter(name="nodePort")
-    def node_port(self) -> pulumi.Input[Optional['ProxyClassSpecStaticEndpointsNodePortPatchArgs']]:
-        return pulumi.get(self, "node_port")
-
-    @node_port.setter
-    def node_port(self, value: pulumi.Input[Optional['ProxyClassSpecStaticEndpointsNodePortPatchArgs']]):
-        pulumi.set(self, "node_port", value)
-
-
-class ProxyClassSpecStaticEndpointsArgsDict(TypedDict):
-    """
-    Configuration for 'static endpoints' on proxies in order to facilitate
-    direct connections from other devices on the tailnet.
-    See https://tailscale.com/kb/1445/kubernetes-operator-customization#static-endpoints.
-    """
-    node_port: NotRequired[pulumi.Input[Optional['ProxyClassSpecStaticEndpointsNodePortArgs']]]
-
-@pulumi.input_type
-class ProxyClassSpecStaticEndpointsArgs:
-    def __init__(__self__, *,
-                 node_port: pulumi.Input[Optional['ProxyClassSpecStaticEndpointsNodePortArgs']] = None):
-        """
-        Configuration for 'static endpoints' on proxies in order to facilitate
-        direct connections from other devices on the tailnet.
-        See https://tailscale.com/kb/1445/kubernetes-operator-customization#static-endpoints.
-        """
-        if node_port is not None:
-            pulumi.set(__self__, "node_port", node_port)
-
-    @_builtins.property
-    @pulumi.getter(name="nodePort")
-    def node_port(self) -> pulumi.Input[Optional['ProxyClassSpecStaticEndpointsNodePortArgs']]:
-        return pulumi.get(self, "node_port")
-
-    @node_port.setter
-    def node_port(self, value: pulumi.Input[Optional['ProxyClassSpecStaticEndpointsNodePortArgs']]):
-        pulumi.set(self, "node_port", value)
-
-
-class ProxyClassSpecTailscalePatchArgsDict(TypedDict):
-    """
-    TailscaleConfig contains options to configure the tailscale-specific
-    parameters of proxies.
-    """
-    accept_routes: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    AcceptRoutes can be set to true to make the proxy instance accept
-    routes advertized by other nodes on the tailnet, such as subnet
-    routes.
-    This is equivalent of passing --accept-routes flag to a tailscale Linux client.
-    https://tailscale.com/kb/1019/subnets#use-your-subnet-routes-from-other-devices
-    Defaults to false.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecTailscalePatchArgs:
-    def __init__(__self__, *,
-                 accept_routes: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        TailscaleConfig contains options to configure the tailscale-specific
-        parameters of proxies.
-
-        :param pulumi.Input[_builtins.bool] accept_routes: AcceptRoutes can be set to true to make the proxy instance accept
-               routes advertized by other nodes on the tailnet, such as subnet
-               routes.
-               This is equivalent of passing --accept-routes flag to a tailscale Linux client.
-               https://tailscale.com/kb/1019/subnets#use-your-subnet-routes-from-other-devices
-               Defaults to false.
-        """
-        if accept_routes is not None:
-            pulumi.set(__self__, "accept_routes", accept_routes)
-
-    @_builtins.property
-    @pulumi.getter(name="acceptRoutes")
-    def accept_routes(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        AcceptRoutes can be set to true to make the proxy instance accept
-        routes advertized by other nodes on the tailnet, such as subnet
-        routes.
-        This is equivalent of passing --accept-routes flag to a tailscale Linux client.
-        https://tailscale.com/kb/1019/subnets#use-your-subnet-routes-from-other-devices
-        Defaults to false.
-        """
-        return pulumi.get(self, "accept_routes")
-
-    @accept_routes.setter
-    def accept_routes(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "accept_routes", value)
-
-
-class ProxyClassSpecTailscaleArgsDict(TypedDict):
-    """
-    TailscaleConfig contains options to configure the tailscale-specific
-    parameters of proxies.
-    """
-    accept_routes: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    AcceptRoutes can be set to true to make the proxy instance accept
-    routes advertized by other nodes on the tailnet, such as subnet
-    routes.
-    This is equivalent of passing --accept-routes flag to a tailscale Linux client.
-    https://tailscale.com/kb/1019/subnets#use-your-subnet-routes-from-other-devices
-    Defaults to false.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecTailscaleArgs:
-    def __init__(__self__, *,
-                 accept_routes: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        TailscaleConfig contains options to configure the tailscale-specific
-        parameters of proxies.
-
-        :param pulumi.Input[_builtins.bool] accept_routes: AcceptRoutes can be set to true to make the proxy instance accept
-               routes advertized by other nodes on the tailnet, such as subnet
-               routes.
-               This is equivalent of passing --accept-routes flag to a tailscale Linux client.
-               https://tailscale.com/kb/1019/subnets#use-your-subnet-routes-from-other-devices
-               Defaults to false.
-        """
-        if accept_routes is not None:
-            pulumi.set(__self__, "accept_routes", accept_routes)
-
-    @_builtins.property
-    @pulumi.getter(name="acceptRoutes")
-    def accept_routes(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        AcceptRoutes can be set to true to make the proxy instance accept
-        routes advertized by other nodes on the tailnet, such as subnet
-        routes.
-        This is equivalent of passing --accept-routes flag to a tailscale Linux client.
-        https://tailscale.com/kb/1019/subnets#use-your-subnet-routes-from-other-devices
-        Defaults to false.
-        """
-        return pulumi.get(self, "accept_routes")
-
-    @accept_routes.setter
-    def accept_routes(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "accept_routes", value)
-
-
-class ProxyClassSpecArgsDict(TypedDict):
-    """
-    Specification of the desired state of the ProxyClass resource.
-    https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    metrics: NotRequired[pulumi.Input[Optional['ProxyClassSpecMetricsArgs']]]
-    stateful_set: NotRequired[pulumi.Input[Optional['ProxyClassSpecStatefulSetArgs']]]
-    static_endpoints: NotRequired[pulumi.Input[Optional['ProxyClassSpecStaticEndpointsArgs']]]
-    tailscale: NotRequired[pulumi.Input[Optional['ProxyClassSpecTailscaleArgs']]]
-    use_lets_encrypt_staging_environment: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
-    """
-    Set UseLetsEncryptStagingEnvironment to true to issue TLS
-    certificates for any HTTPS endpoints exposed to the tailnet from
-    LetsEncrypt's staging environment.
-    https://letsencrypt.org/docs/staging-environment/
-    This setting only affects Tailscale Ingress resources.
-    By default Ingress TLS certificates are issued from LetsEncrypt's
-    production environment.
-    Changing this setting true -> false, will result in any
-    existing certs being re-issued from the production environment.
-    Changing this setting false (default) -> true, when certs have already
-    been provisioned from production environment will NOT result in certs
-    being re-issued from the staging environment before they need to be
-    renewed.
-    """
-
-@pulumi.input_type
-class ProxyClassSpecArgs:
-    def __init__(__self__, *,
-                 metrics: pulumi.Input[Optional['ProxyClassSpecMetricsArgs']] = None,
-                 stateful_set: pulumi.Input[Optional['ProxyClassSpecStatefulSetArgs']] = None,
-                 static_endpoints: pulumi.Input[Optional['ProxyClassSpecStaticEndpointsArgs']] = None,
-                 tailscale: pulumi.Input[Optional['ProxyClassSpecTailscaleArgs']] = None,
-                 use_lets_encrypt_staging_environment: pulumi.Input[Optional[_builtins.bool]] = None):
-        """
-        Specification of the desired state of the ProxyClass resource.
-        https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param pulumi.Input[_builtins.bool] use_lets_encrypt_staging_environment: Set UseLetsEncryptStagingEnvironment to true to issue TLS
-               certificates for any HTTPS endpoints exposed to the tailnet from
-               LetsEncrypt's staging environment.
-               https://letsencrypt.org/docs/staging-environment/
-               This setting only affects Tailscale Ingress resources.
-               By default Ingress TLS certificates are issued from LetsEncrypt's
-               production environment.
-               Changing this setting true -> false, will result in any
-               existing certs being re-issued from the production environment.
-               Changing this setting false (default) -> true, when certs have already
-               been provisioned from production environment will NOT result in certs
-               being re-issued from the staging environment before they need to be
-               renewed.
-        """
-        if metrics is not None:
-            pulumi.set(__self__, "metrics", metrics)
-        if stateful_set is not None:
-            pulumi.set(__self__, "stateful_set", stateful_set)
-        if static_endpoints is not None:
-            pulumi.set(__self__, "static_endpoints", static_endpoints)
-        if tailscale is not None:
-            pulumi.set(__self__, "tailscale", tailscale)
-        if use_lets_encrypt_staging_environment is not None:
-            pulumi.set(__self__, "use_lets_encrypt_staging_environment", use_lets_encrypt_staging_environment)
-
-    @_builtins.property
-    @pulumi.getter
-    def metrics(self) -> pulumi.Input[Optional['ProxyClassSpecMetricsArgs']]:
-        return pulumi.get(self, "metrics")
-
-    @metrics.setter
-    def metrics(self, value: pulumi.Input[Optional['ProxyClassSpecMetricsArgs']]):
-        pulumi.set(self, "metrics", value)
-
-    @_builtins.property
-    @pulumi.getter(name="statefulSet")
-    def stateful_set(self) -> pulumi.Input[Optional['ProxyClassSpecStatefulSetArgs']]:
-        return pulumi.get(self, "stateful_set")
-
-    @stateful_set.setter
-    def stateful_set(self, value: pulumi.Input[Optional['ProxyClassSpecStatefulSetArgs']]):
-        pulumi.set(self, "stateful_set", value)
-
-    @_builtins.property
-    @pulumi.getter(name="staticEndpoints")
-    def static_endpoints(self) -> pulumi.Input[Optional['ProxyClassSpecStaticEndpointsArgs']]:
-        return pulumi.get(self, "static_endpoints")
-
-    @static_endpoints.setter
-    def static_endpoints(self, value: pulumi.Input[Optional['ProxyClassSpecStaticEndpointsArgs']]):
-        pulumi.set(self, "static_endpoints", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def tailscale(self) -> pulumi.Input[Optional['ProxyClassSpecTailscaleArgs']]:
-        return pulumi.get(self, "tailscale")
-
-    @tailscale.setter
-    def tailscale(self, value: pulumi.Input[Optional['ProxyClassSpecTailscaleArgs']]):
-        pulumi.set(self, "tailscale", value)
-
-    @_builtins.property
-    @pulumi.getter(name="useLetsEncryptStagingEnvironment")
-    def use_lets_encrypt_staging_environment(self) -> pulumi.Input[Optional[_builtins.bool]]:
-        """
-        Set UseLetsEncryptStagingEnvironment to true to issue TLS
-        certificates for any HTTPS endpoints exposed to the tailnet from
-        LetsEncrypt's staging environment.
-        https://letsencrypt.org/docs/staging-environment/
-        This setting only affects Tailscale Ingress resources.
-        By default Ingress TLS certificates are issued from LetsEncrypt's
-        production environment.
-        Changing this setting true -> false, will result in any
-        existing certs being re-issued from the production environment.
-        Changing this setting false (default) -> true, when certs have already
-        been provisioned from production environment will NOT result in certs
-        being re-issued from the staging environment before they need to be
-        renewed.
-        """
-        return pulumi.get(self, "use_lets_encrypt_staging_environment")
-
-    @use_lets_encrypt_staging_environment.setter
-    def use_lets_encrypt_staging_environment(self, value: pulumi.Input[Optional[_builtins.bool]]):
-        pulumi.set(self, "use_lets_encrypt_staging_environment", value)
-
-
-class ProxyClassStatusConditionsArgsDict(TypedDict):
-    """
-    Condition contains details for one aspect of the current state of this API Resource.
-    """
-    last_transition_time: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    lastTransitionTime is the last time the condition transitioned from one status to another.
-    This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-    """
-    message: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    message is a human readable message indicating details about the transition.
-    This may be an empty string.
-    """
-    observed_generation: NotRequired[pulumi.Input[Optional[_builtins.int]]]
-    """
-    observedGeneration represents the .metadata.generation that the condition was set based upon.
-    For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-    with respect to the current state of the instance.
-    """
-    reason: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    reason contains a programmatic identifier indicating the reason for the condition's last transition.
-    Producers of specific condition types may define expected values and meanings for this field,
-    and whether the values are considered a guaranteed API.
-    The value should be a CamelCase string.
-    This field may not be empty.
-    """
-    status: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    status of the condition, one of True, False, Unknown.
-    """
-    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    type of condition in CamelCase or in foo.example.com/CamelCase.
-    """
-
-@pulumi.input_type
-class ProxyClassStatusConditionsArgs:
-    def __init__(__self__, *,
-                 last_transition_time: pulumi.Input[Optional[_builtins.str]] = None,
-                 message: pulumi.Input[Optional[_builtins.str]] = None,
-                 observed_generation: pulumi.Input[Optional[_builtins.int]] = None,
-                 reason: pulumi.Input[Optional[_builtins.str]] = None,
-                 status: pulumi.Input[Optional[_builtins.str]] = None,
-                 type: pulumi.Input[Optional[_builtins.str]] = None):
-        """
-        Condition contains details for one aspect of the current state of this API Resource.
-
-        :param pulumi.Input[_builtins.str] last_transition_time: lastTransitionTime is the last time the condition transitioned from one status to another.
-               This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        :param pulumi.Input[_builtins.str] message: message is a human readable message indicating details about the transition.
-               This may be an empty string.
-        :param pulumi.Input[_builtins.int] observed_generation: observedGeneration represents the .metadata.generation that the condition was set based upon.
-               For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-               with respect to the current state of the instance.
-        :param pulumi.Input[_builtins.str] reason: reason contains a programmatic identifier indicating the reason for the condition's last transition.
-               Producers of specific condition types may define expected values and meanings for this field,
-               and whether the values are considered a guaranteed API.
-               The value should be a CamelCase string.
-               This field may not be empty.
-        :param pulumi.Input[_builtins.str] status: status of the condition, one of True, False, Unknown.
-        :param pulumi.Input[_builtins.str] type: type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        if last_transition_time is not None:
-            pulumi.set(__self__, "last_transition_time", last_transition_time)
-        if message is not None:
-            pulumi.set(__self__, "message", message)
-        if observed_generation is not None:
-            pulumi.set(__self__, "observed_generation", observed_generation)
-        if reason is not None:
-            pulumi.set(__self__, "reason", reason)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="lastTransitionTime")
-    def last_transition_time(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        lastTransitionTime is the last time the condition transitioned from one status to another.
-        This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        """
-        return pulumi.get(self, "last_transition_time")
-
-    @last_transition_time.setter
-    def last_transition_time(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "last_transition_time", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def message(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        message is a human readable message indicating details about the transition.
-        This may be an empty string.
-        """
-        return pulumi.get(self, "message")
-
-    @message.setter
-    def message(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "message", value)
-
-    @_builtins.property
-    @pulumi.getter(name="observedGeneration")
-    def observed_generation(self) -> pulumi.Input[Optional[_builtins.int]]:
-        """
-        observedGeneration represents the .metadata.generation that the condition was set based upon.
-        For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-        with respect to the current state of the instance.
-        """
-        return pulumi.get(self, "observed_generation")
-
-    @observed_generation.setter
-    def observed_generation(self, value: pulumi.Input[Optional[_builtins.int]]):
-        pulumi.set(self, "observed_generation", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def reason(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        reason contains a programmatic identifier indicating the reason for the condition's last transition.
-        Producers of specific condition types may define expected values and meanings for this field,
-        and whether the values are considered a guaranteed API.
-        The value should be a CamelCase string.
-        This field may not be empty.
-        """
-        return pulumi.get(self, "reason")
-
-    @reason.setter
-    def reason(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "reason", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        status of the condition, one of True, False, Unknown.
-        """
-        return pulumi.get(self, "status")
-
-    @status.setter
-    def status(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "status", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        return pulumi.get(self, "type")
-
-    @type.setter
-    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "type", value)
-
-
-class ProxyClassStatusArgsDict(TypedDict):
-    """
-    Status of the ProxyClass. This is set and managed automatically.
-    https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    conditions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassStatusConditionsArgs']]]]]
-    """
-    List of status conditions to indicate the status of the ProxyClass.
-    Known condition types are `ProxyClassReady`.
-    """
-
-@pulumi.input_type
-class ProxyClassStatusArgs:
-    def __init__(__self__, *,
-                 conditions: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassStatusConditionsArgs']]]] = None):
-        """
-        Status of the ProxyClass. This is set and managed automatically.
-        https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param pulumi.Input[Sequence[pulumi.Input['ProxyClassStatusConditionsArgs']]] conditions: List of status conditions to indicate the status of the ProxyClass.
-               Known condition types are `ProxyClassReady`.
-        """
-        if conditions is not None:
-            pulumi.set(__self__, "conditions", conditions)
-
-    @_builtins.property
-    @pulumi.getter
-    def conditions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassStatusConditionsArgs']]]]:
-        """
-        List of status conditions to indicate the status of the ProxyClass.
-        Known condition types are `ProxyClassReady`.
-        """
-        return pulumi.get(self, "conditions")
-
-    @conditions.setter
-    def conditions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['ProxyClassStatusConditionsArgs']]]]):
-        pulumi.set(self, "conditions", value)
-
-
-class ProxyClassArgsDict(TypedDict):
-    """
-    ProxyClass describes a set of configuration parameters that can be applied to
-    proxy resources created by the Tailscale Kubernetes operator.
-    To apply a given ProxyClass to resources created for a tailscale Ingress or
-    Service, use tailscale.com/proxy-class=<proxyclass-name> label. To apply a
-    given ProxyClass to resources created for a Connector, use
-    connector.spec.proxyClass field.
-    ProxyClass is a cluster scoped resource.
-    More info:
-    https://tailscale.com/kb/1445/kubernetes-operator-customization#cluster-resource-customization-using-proxyclass-custom-resource
-    """
-    api_version: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-    """
-    kind: NotRequired[pulumi.Input[Optional[_builtins.str]]]
-    """
-    Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-    """
-    metadata: NotRequired[pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']]]
-    """
-    Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-    """
-    spec: NotRequired[pulumi.Input[Optional['ProxyClassSpecArgs']]]
-    status: NotRequired[pulumi.Input[Optional['ProxyClassStatusArgs']]]
-
-@pulumi.input_type
-class ProxyClassArgs:
-    def __init__(__self__, *,
-                 api_version: pulumi.Input[Optional[_builtins.str]] = None,
-                 kind: pulumi.Input[Optional[_builtins.str]] = None,
-                 metadata: pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']] = None,
-                 spec: pulumi.Input[Optional['ProxyClassSpecArgs']] = None,
-                 status: pulumi.Input[Optional['ProxyClassStatusArgs']] = None):
-        """
-        ProxyClass describes a set of configuration parameters that can be applied to
-        proxy resources created by the Tailscale Kubernetes operator.
-        To apply a given ProxyClass to resources created for a tailscale Ingress or
-        Service, use tailscale.com/proxy-class=<proxyclass-name> label. To apply a
-        given ProxyClass to resources created for a Connector, use
-        connector.spec.proxyClass field.
-        ProxyClass is a cluster scoped resource.
-        More info:
-        https://tailscale.com/kb/1445/kubernetes-operator-customization#cluster-resource-customization-using-proxyclass-custom-resource
-
-        :param pulumi.Input[_builtins.str] api_version: APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        :param pulumi.Input[_builtins.str] kind: Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        :param pulumi.Input['_meta.v1.ObjectMetaArgs'] metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        if api_version is not None:
-            pulumi.set(__self__, "api_version", 'tailscale.com/v1alpha1')
-        if kind is not None:
-            pulumi.set(__self__, "kind", 'ProxyClass')
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter(name="apiVersion")
-    def api_version(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        """
-        return pulumi.get(self, "api_version")
-
-    @api_version.setter
-    def api_version(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "api_version", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def kind(self) -> pulumi.Input[Optional[_builtins.str]]:
-        """
-        Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        return pulumi.get(self, "kind")
-
-    @kind.setter
-    def kind(self, value: pulumi.Input[Optional[_builtins.str]]):
-        pulumi.set(self, "kind", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']]:
-        """
-        Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        return pulumi.get(self, "metadata")
-
-    @metadata.setter
-    def metadata(self, value: pulumi.Input[Optional['_meta.v1.ObjectMetaArgs']]):
-        pulumi.set(self, "metadata", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> pulumi.Input[Optional['ProxyClassSpecArgs']]:
-        return pulumi.get(self, "spec")
-
-    @spec.setter
-    def spec(self, value: pulumi.Input[Optional['ProxyClassSpecArgs']]):
-        pulumi.set(self, "spec", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> pulumi.Input[Optional['ProxyClassStatusArgs']]:
-        return pulumi.get(self, "status")
-
-    @status.setter
-    def status(self, value: pulumi.Input[Optional['ProxyClassStatusArgs']]):
-        pulumi.set(self, "status", value)
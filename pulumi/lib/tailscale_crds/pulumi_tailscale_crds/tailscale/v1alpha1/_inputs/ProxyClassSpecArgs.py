@@ -0,0 +1,143 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecArgsDict', 'ProxyClassSpecArgs']
+
+class ProxyClassSpecArgsDict(TypedDict):
+    """
+    Specification of the desired state of the ProxyClass resource.
+    https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
+    """
+    metrics: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecMetricsArgs']]]
+    stateful_set: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetArgs']]]
+    static_endpoints: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStaticEndpointsArgs']]]
+    tailscale: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecTailscaleArgs']]]
+    use_lets_encrypt_staging_environment: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Set UseLetsEncryptStagingEnvironment to true to issue TLS
+    certificates for any HTTPS endpoints exposed to the tailnet from
+    LetsEncrypt's staging environment.
+    https://letsencrypt.org/docs/staging-environment/
+    This setting only affects Tailscale Ingress resources.
+    By default Ingress TLS certificates are issued from LetsEncrypt's
+    production environment.
+    Changing this setting true -> false, will result in any
+    existing certs being re-issued from the production environment.
+    Changing this setting false (default) -> true, when certs have already
+    been provisioned from production environment will NOT result in certs
+    being re-issued from the staging environment before they need to be
+    renewed.
+    """
+
+
+@pulumi.input_type
+class ProxyClassSpecArgs:
+    def __init__(__self__, *,
+                 metrics: pulumi.Input[Optional['_inputs.ProxyClassSpecMetricsArgs']] = None,
+                 stateful_set: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetArgs']] = None,
+                 static_endpoints: pulumi.Input[Optional['_inputs.ProxyClassSpecStaticEndpointsArgs']] = None,
+                 tailscale: pulumi.Input[Optional['_inputs.ProxyClassSpecTailscaleArgs']] = None,
+                 use_lets_encrypt_staging_environment: pulumi.Input[Optional[_builtins.bool]] = None):
+        """
+        Specification of the desired state of the ProxyClass resource.
+        https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
+
+        :param pulumi.Input[_builtins.bool] use_lets_encrypt_staging_environment: Set UseLetsEncryptStagingEnvironment to true to issue TLS
+               certificates for any HTTPS endpoints exposed to the tailnet from
+               LetsEncrypt's staging environment.
+               https://letsencrypt.org/docs/staging-environment/
+               This setting only affects Tailscale Ingress resources.
+               By default Ingress TLS certificates are issued from LetsEncrypt's
+               production environment.
+               Changing this setting true -> false, will result in any
+               existing certs being re-issued from the production environment.
+               Changing this setting false (default) -> true, when certs have already
+               been provisioned from production environment will NOT result in certs
+               being re-issued from the staging environment before they need to be
+               renewed.
+        """
+        if metrics is not None:
+            pulumi.set(__self__, "metrics", metrics)
+        if stateful_set is not None:
+            pulumi.set(__self__, "stateful_set", stateful_set)
+        if static_endpoints is not None:
+            pulumi.set(__self__, "static_endpoints", static_endpoints)
+        if tailscale is not None:
+            pulumi.set(__self__, "tailscale", tailscale)
+        if use_lets_encrypt_staging_environment is not None:
+            pulumi.set(__self__, "use_lets_encrypt_staging_environment", use_lets_encrypt_staging_environment)
+
+    @_builtins.property
+    @pulumi.getter
+    def metrics(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecMetricsArgs']]:
+        return pulumi.get(self, "metrics")
+
+    @metrics.setter
+    def metrics(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecMetricsArgs']]):
+        pulumi.set(self, "metrics", value)
+
+    @_builtins.property
+    @pulumi.getter(name="statefulSet")
+    def stateful_set(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetArgs']]:
+        return pulumi.get(self, "stateful_set")
+
+    @stateful_set.setter
+    def stateful_set(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetArgs']]):
+        pulumi.set(self, "stateful_set", value)
+
+    @_builtins.property
+    @pulumi.getter(name="staticEndpoints")
+    def static_endpoints(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStaticEndpointsArgs']]:
+        return pulumi.get(self, "static_endpoints")
+
+    @static_endpoints.setter
+    def static_endpoints(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStaticEndpointsArgs']]):
+        pulumi.set(self, "static_endpoints", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def tailscale(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecTailscaleArgs']]:
+        return pulumi.get(self, "tailscale")
+
+    @tailscale.setter
+    def tailscale(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecTailscaleArgs']]):
+        pulumi.set(self, "tailscale", value)
+
+    @_builtins.property
+    @pulumi.getter(name="useLetsEncryptStagingEnvironment")
+    def use_lets_encrypt_staging_environment(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Set UseLetsEncryptStagingEnvironment to true to issue TLS
+        certificates for any HTTPS endpoints exposed to the tailnet from
+        LetsEncrypt's staging environment.
+        https://letsencrypt.org/docs/staging-environment/
+        This setting only affects Tailscale Ingress resources.
+        By default Ingress TLS certificates are issued from LetsEncrypt's
+        production environment.
+        Changing this setting true -> false, will result in any
+        existing certs being re-issued from the production environment.
+        Changing this setting false (default) -> true, when certs have already
+        been provisioned from production environment will NOT result in certs
+        being re-issued from the staging environment before they need to be
+        renewed.
+        """
+        return pulumi.get(self, "use_lets_encrypt_staging_environment")
+
+    @use_lets_encrypt_staging_environment.setter
+    def use_lets_encrypt_staging_environment(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "use_lets_encrypt_staging_environment", value)
@@ -0,0 +1,103 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecMetricsPatchArgsDict', 'ProxyClassSpecMetricsPatchArgs']
+
+class ProxyClassSpecMetricsPatchArgsDict(TypedDict):
+    """
+    Configuration for proxy metrics. Metrics are currently not supported
+    for egress proxies and for Ingress proxies that have been configured
+    with tailscale.com/experimental-forward-cluster-traffic-via-ingress
+    annotation. Note that the metrics are currently considered unstable
+    and will likely change in breaking ways in the future - we only
+    recommend that you use those for debugging purposes.
+    """
+    enable: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Setting enable to true will make the proxy serve Tailscale metrics
+    at <pod-ip>:9002/metrics.
+    A metrics Service named <proxy-statefulset>-metrics will also be created in the operator's namespace and will
+    serve the metrics at <service-ip>:9002/metrics.
+
+    In 1.78.x and 1.80.x, this field also serves as the default value for
+    .spec.statefulSet.pod.tailscaleContainer.debug.enable. From 1.82.0, both
+    fields will independently default to false.
+
+    Defaults to false.
+    """
+    service_monitor: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecMetricsServiceMonitorPatchArgs']]]
+
+
+@pulumi.input_type
+class ProxyClassSpecMetricsPatchArgs:
+    def __init__(__self__, *,
+                 enable: pulumi.Input[Optional[_builtins.bool]] = None,
+                 service_monitor: pulumi.Input[Optional['_inputs.ProxyClassSpecMetricsServiceMonitorPatchArgs']] = None):
+        """
+        Configuration for proxy metrics. Metrics are currently not supported
+        for egress proxies and for Ingress proxies that have been configured
+        with tailscale.com/experimental-forward-cluster-traffic-via-ingress
+        annotation. Note that the metrics are currently considered unstable
+        and will likely change in breaking ways in the future - we only
+        recommend that you use those for debugging purposes.
+
+        :param pulumi.Input[_builtins.bool] enable: Setting enable to true will make the proxy serve Tailscale metrics
+               at <pod-ip>:9002/metrics.
+               A metrics Service named <proxy-statefulset>-metrics will also be created in the operator's namespace and will
+               serve the metrics at <service-ip>:9002/metrics.
+
+               In 1.78.x and 1.80.x, this field also serves as the default value for
+               .spec.statefulSet.pod.tailscaleContainer.debug.enable. From 1.82.0, both
+               fields will independently default to false.
+
+               Defaults to false.
+        """
+        if enable is not None:
+            pulumi.set(__self__, "enable", enable)
+        if service_monitor is not None:
+            pulumi.set(__self__, "service_monitor", service_monitor)
+
+    @_builtins.property
+    @pulumi.getter
+    def enable(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Setting enable to true will make the proxy serve Tailscale metrics
+        at <pod-ip>:9002/metrics.
+        A metrics Service named <proxy-statefulset>-metrics will also be created in the operator's namespace and will
+        serve the metrics at <service-ip>:9002/metrics.
+
+        In 1.78.x and 1.80.x, this field also serves as the default value for
+        .spec.statefulSet.pod.tailscaleContainer.debug.enable. From 1.82.0, both
+        fields will independently default to false.
+
+        Defaults to false.
+        """
+        return pulumi.get(self, "enable")
+
+    @enable.setter
+    def enable(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "enable", value)
+
+    @_builtins.property
+    @pulumi.getter(name="serviceMonitor")
+    def service_monitor(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecMetricsServiceMonitorPatchArgs']]:
+        return pulumi.get(self, "service_monitor")
+
+    @service_monitor.setter
+    def service_monitor(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecMetricsServiceMonitorPatchArgs']]):
+        pulumi.set(self, "service_monitor", value)
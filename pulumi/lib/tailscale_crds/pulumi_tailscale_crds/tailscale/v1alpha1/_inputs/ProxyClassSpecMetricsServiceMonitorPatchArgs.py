@@ -0,0 +1,91 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecMetricsServiceMonitorPatchArgsDict', 'ProxyClassSpecMetricsServiceMonitorPatchArgs']
+
+class ProxyClassSpecMetricsServiceMonitorPatchArgsDict(TypedDict):
+    """
+    Enable to create a Prometheus ServiceMonitor for scraping the proxy's Tailscale metrics.
+    The ServiceMonitor will select the metrics Service that gets created when metrics are enabled.
+    The ingested metrics for each Service monitor will have labels to identify the proxy:
+    ts_proxy_type: ingress_service|ingress_resource|connector|proxygroup
+    ts_proxy_parent_name: name of the parent resource (i.e name of the Connector, Tailscale Ingress, Tailscale Service or ProxyGroup)
+    ts_proxy_parent_namespace: namespace of the parent resource (if the parent resource is not cluster scoped)
+    job: ts_<proxy type>_[<parent namespace>]_<parent_name>
+    """
+    enable: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    If Enable is set to true, a Prometheus ServiceMonitor will be created. Enable can only be set to true if metrics are enabled.
+    """
+    labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+    """
+    Labels to add to the ServiceMonitor.
+    Labels must be valid Kubernetes labels.
+    https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
+    """
+
+
+@pulumi.input_type
+class ProxyClassSpecMetricsServiceMonitorPatchArgs:
+    def __init__(__self__, *,
+                 enable: pulumi.Input[Optional[_builtins.bool]] = None,
+                 labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
+        """
+        Enable to create a Prometheus ServiceMonitor for scraping the proxy's Tailscale metrics.
+        The ServiceMonitor will select the metrics Service that gets created when metrics are enabled.
+        The ingested metrics for each Service monitor will have labels to identify the proxy:
+        ts_proxy_type: ingress_service|ingress_resource|connector|proxygroup
+        ts_proxy_parent_name: name of the parent resource (i.e name of the Connector, Tailscale Ingress, Tailscale Service or ProxyGroup)
+        ts_proxy_parent_namespace: namespace of the parent resource (if the parent resource is not cluster scoped)
+        job: ts_<proxy type>_[<parent namespace>]_<parent_name>
+
+        :param pulumi.Input[_builtins.bool] enable: If Enable is set to true, a Prometheus ServiceMonitor will be created. Enable can only be set to true if metrics are enabled.
+        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] labels: Labels to add to the ServiceMonitor.
+               Labels must be valid Kubernetes labels.
+               https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
+        """
+        if enable is not None:
+            pulumi.set(__self__, "enable", enable)
+        if labels is not None:
+            pulumi.set(__self__, "labels", labels)
+
+    @_builtins.property
+    @pulumi.getter
+    def enable(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        If Enable is set to true, a Prometheus ServiceMonitor will be created. Enable can only be set to true if metrics are enabled.
+        """
+        return pulumi.get(self, "enable")
+
+    @enable.setter
+    def enable(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "enable", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        """
+        Labels to add to the ServiceMonitor.
+        Labels must be valid Kubernetes labels.
+        https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
+        """
+        return pulumi.get(self, "labels")
+
+    @labels.setter
+    def labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "labels", value)
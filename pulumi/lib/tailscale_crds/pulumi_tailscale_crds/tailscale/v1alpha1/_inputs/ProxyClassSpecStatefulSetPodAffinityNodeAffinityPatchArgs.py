@@ -0,0 +1,90 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgsDict', 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgs']
+
+class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgsDict(TypedDict):
+    """
+    Describes node affinity scheduling rules for the pod.
+    """
+    preferred_during_scheduling_ignored_during_execution: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]]]
+    """
+    The scheduler will prefer to schedule pods to nodes that satisfy
+    the affinity expressions specified by this field, but it may choose
+    a node that violates one or more of the expressions. The node that is
+    most preferred is the one with the greatest sum of weights, i.e.
+    for each node that meets all of the scheduling requirements (resource
+    request, requiredDuringScheduling affinity expressions, etc.),
+    compute a sum by iterating through the elements of this field and adding
+    "weight" to the sum if the node matches the corresponding matchExpressions; the
+    node(s) with the highest sum are the most preferred.
+    """
+    required_during_scheduling_ignored_during_execution: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]
+
+
+@pulumi.input_type
+class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgs:
+    def __init__(__self__, *,
+                 preferred_during_scheduling_ignored_during_execution: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]] = None,
+                 required_during_scheduling_ignored_during_execution: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs']] = None):
+        """
+        Describes node affinity scheduling rules for the pod.
+
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]] preferred_during_scheduling_ignored_during_execution: The scheduler will prefer to schedule pods to nodes that satisfy
+               the affinity expressions specified by this field, but it may choose
+               a node that violates one or more of the expressions. The node that is
+               most preferred is the one with the greatest sum of weights, i.e.
+               for each node that meets all of the scheduling requirements (resource
+               request, requiredDuringScheduling affinity expressions, etc.),
+               compute a sum by iterating through the elements of this field and adding
+               "weight" to the sum if the node matches the corresponding matchExpressions; the
+               node(s) with the highest sum are the most preferred.
+        """
+        if preferred_during_scheduling_ignored_during_execution is not None:
+            pulumi.set(__self__, "preferred_during_scheduling_ignored_during_execution", preferred_during_scheduling_ignored_during_execution)
+        if required_during_scheduling_ignored_during_execution is not None:
+            pulumi.set(__self__, "required_during_scheduling_ignored_during_execution", required_during_scheduling_ignored_during_execution)
+
+    @_builtins.property
+    @pulumi.getter(name="preferredDuringSchedulingIgnoredDuringExecution")
+    def preferred_during_scheduling_ignored_during_execution(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]]:
+        """
+        The scheduler will prefer to schedule pods to nodes that satisfy
+        the affinity expressions specified by this field, but it may choose
+        a node that violates one or more of the expressions. The node that is
+        most preferred is the one with the greatest sum of weights, i.e.
+        for each node that meets all of the scheduling requirements (resource
+        request, requiredDuringScheduling affinity expressions, etc.),
+        compute a sum by iterating through the elements of this field and adding
+        "weight" to the sum if the node matches the corresponding matchExpressions; the
+        node(s) with the highest sum are the most preferred.
+        """
+        return pulumi.get(self, "preferred_during_scheduling_ignored_during_execution")
+
+    @preferred_during_scheduling_ignored_during_execution.setter
+    def preferred_during_scheduling_ignored_during_execution(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs']]]]):
+        pulumi.set(self, "preferred_during_scheduling_ignored_during_execution", value)
+
+    @_builtins.property
+    @pulumi.getter(name="requiredDuringSchedulingIgnoredDuringExecution")
+    def required_during_scheduling_ignored_during_execution(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs']]:
+        return pulumi.get(self, "required_during_scheduling_ignored_during_execution")
+
+    @required_during_scheduling_ignored_during_execution.setter
+    def required_during_scheduling_ignored_during_execution(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs']]):
+        pulumi.set(self, "required_during_scheduling_ignored_during_execution", value)
@@ -0,0 +1,75 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecStatefulSetPodAffinityPatchArgsDict', 'ProxyClassSpecStatefulSetPodAffinityPatchArgs']
+
+class ProxyClassSpecStatefulSetPodAffinityPatchArgsDict(TypedDict):
+    """
+    Proxy Pod's affinity rules.
+    By default, the Tailscale Kubernetes operator does not apply any affinity rules.
+    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#affinity
+    """
+    node_affinity: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgs']]]
+    pod_affinity: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgs']]]
+    pod_anti_affinity: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgs']]]
+
+
+@pulumi.input_type
+class ProxyClassSpecStatefulSetPodAffinityPatchArgs:
+    def __init__(__self__, *,
+                 node_affinity: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgs']] = None,
+                 pod_affinity: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgs']] = None,
+                 pod_anti_affinity: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgs']] = None):
+        """
+        Proxy Pod's affinity rules.
+        By default, the Tailscale Kubernetes operator does not apply any affinity rules.
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#affinity
+        """
+        if node_affinity is not None:
+            pulumi.set(__self__, "node_affinity", node_affinity)
+        if pod_affinity is not None:
+            pulumi.set(__self__, "pod_affinity", pod_affinity)
+        if pod_anti_affinity is not None:
+            pulumi.set(__self__, "pod_anti_affinity", pod_anti_affinity)
+
+    @_builtins.property
+    @pulumi.getter(name="nodeAffinity")
+    def node_affinity(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgs']]:
+        return pulumi.get(self, "node_affinity")
+
+    @node_affinity.setter
+    def node_affinity(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgs']]):
+        pulumi.set(self, "node_affinity", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podAffinity")
+    def pod_affinity(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgs']]:
+        return pulumi.get(self, "pod_affinity")
+
+    @pod_affinity.setter
+    def pod_affinity(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgs']]):
+        pulumi.set(self, "pod_affinity", value)
+
+    @_builtins.property
+    @pulumi.getter(name="podAntiAffinity")
+    def pod_anti_affinity(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgs']]:
+        return pulumi.get(self, "pod_anti_affinity")
+
+    @pod_anti_affinity.setter
+    def pod_anti_affinity(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgs']]):
+        pulumi.set(self, "pod_anti_affinity", value)
@@ -0,0 +1,115 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecStatefulSetPodAffinityPodAffinityArgsDict', 'ProxyClassSpecStatefulSetPodAffinityPodAffinityArgs']
+
+class ProxyClassSpecStatefulSetPodAffinityPodAffinityArgsDict(TypedDict):
+    """
+    Describes pod affinity scheduling rules (e.g. co-locate this pod in the same node, zone, etc. as some other pod(s)).
+    """
+    preferred_during_scheduling_ignored_during_execution: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]]]]
+    """
+    The scheduler will prefer to schedule pods to nodes that satisfy
+    the affinity expressions specified by this field, but it may choose
+    a node that violates one or more of the expressions. The node that is
+    most preferred is the one with the greatest sum of weights, i.e.
+    for each node that meets all of the scheduling requirements (resource
+    request, requiredDuringScheduling affinity expressions, etc.),
+    compute a sum by iterating through the elements of this field and adding
+    "weight" to the sum if the node has pods which matches the corresponding podAffinityTerm; the
+    node(s) with the highest sum are the most preferred.
+    """
+    required_during_scheduling_ignored_during_execution: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']]]]]
+    """
+    If the affinity requirements specified by this field are not met at
+    scheduling time, the pod will not be scheduled onto the node.
+    If the affinity requirements specified by this field cease to be met
+    at some point during pod execution (e.g. due to a pod label update), the
+    system may or may not try to eventually evict the pod from its node.
+    When there are multiple elements, the lists of nodes corresponding to each
+    podAffinityTerm are intersected, i.e. all terms must be satisfied.
+    """
+
+
+@pulumi.input_type
+class ProxyClassSpecStatefulSetPodAffinityPodAffinityArgs:
+    def __init__(__self__, *,
+                 preferred_during_scheduling_ignored_during_execution: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]]] = None,
+                 required_during_scheduling_ignored_during_execution: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']]]] = None):
+        """
+        Describes pod affinity scheduling rules (e.g. co-locate this pod in the same node, zone, etc. as some other pod(s)).
+
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]] preferred_during_scheduling_ignored_during_execution: The scheduler will prefer to schedule pods to nodes that satisfy
+               the affinity expressions specified by this field, but it may choose
+               a node that violates one or more of the expressions. The node that is
+               most preferred is the one with the greatest sum of weights, i.e.
+               for each node that meets all of the scheduling requirements (resource
+               request, requiredDuringScheduling affinity expressions, etc.),
+               compute a sum by iterating through the elements of this field and adding
+               "weight" to the sum if the node has pods which matches the corresponding podAffinityTerm; the
+               node(s) with the highest sum are the most preferred.
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']]] required_during_scheduling_ignored_during_execution: If the affinity requirements specified by this field are not met at
+               scheduling time, the pod will not be scheduled onto the node.
+               If the affinity requirements specified by this field cease to be met
+               at some point during pod execution (e.g. due to a pod label update), the
+               system may or may not try to eventually evict the pod from its node.
+               When there are multiple elements, the lists of nodes corresponding to each
+               podAffinityTerm are intersected, i.e. all terms must be satisfied.
+        """
+        if preferred_during_scheduling_ignored_during_execution is not None:
+            pulumi.set(__self__, "preferred_during_scheduling_ignored_during_execution", preferred_during_scheduling_ignored_during_execution)
+        if required_during_scheduling_ignored_during_execution is not None:
+            pulumi.set(__self__, "required_during_scheduling_ignored_during_execution", required_during_scheduling_ignored_during_execution)
+
+    @_builtins.property
+    @pulumi.getter(name="preferredDuringSchedulingIgnoredDuringExecution")
+    def preferred_during_scheduling_ignored_during_execution(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]]]:
+        """
+        The scheduler will prefer to schedule pods to nodes that satisfy
+        the affinity expressions specified by this field, but it may choose
+        a node that violates one or more of the expressions. The node that is
+        most preferred is the one with the greatest sum of weights, i.e.
+        for each node that meets all of the scheduling requirements (resource
+        request, requiredDuringScheduling affinity expressions, etc.),
+        compute a sum by iterating through the elements of this field and adding
+        "weight" to the sum if the node has pods which matches the corresponding podAffinityTerm; the
+        node(s) with the highest sum are the most preferred.
+        """
+        return pulumi.get(self, "preferred_during_scheduling_ignored_during_execution")
+
+    @preferred_during_scheduling_ignored_during_execution.setter
+    def preferred_during_scheduling_ignored_during_execution(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs']]]]):
+        pulumi.set(self, "preferred_during_scheduling_ignored_during_execution", value)
+
+    @_builtins.property
+    @pulumi.getter(name="requiredDuringSchedulingIgnoredDuringExecution")
+    def required_during_scheduling_ignored_during_execution(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']]]]:
+        """
+        If the affinity requirements specified by this field are not met at
+        scheduling time, the pod will not be scheduled onto the node.
+        If the affinity requirements specified by this field cease to be met
+        at some point during pod execution (e.g. due to a pod label update), the
+        system may or may not try to eventually evict the pod from its node.
+        When there are multiple elements, the lists of nodes corresponding to each
+        podAffinityTerm are intersected, i.e. all terms must be satisfied.
+        """
+        return pulumi.get(self, "required_during_scheduling_ignored_during_execution")
+
+    @required_during_scheduling_ignored_during_execution.setter
+    def required_during_scheduling_ignored_during_execution(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']]]]):
+        pulumi.set(self, "required_during_scheduling_ignored_during_execution", value)
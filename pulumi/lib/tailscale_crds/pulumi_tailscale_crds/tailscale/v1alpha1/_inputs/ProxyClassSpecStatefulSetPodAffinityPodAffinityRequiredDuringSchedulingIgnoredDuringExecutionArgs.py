@@ -0,0 +1,212 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict', 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs']
+
+class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict(TypedDict):
+    """
+    Defines a set of pods (namely those matching the labelSelector
+    relative to the given namespace(s)) that this pod should be
+    co-located (affinity) or not co-located (anti-affinity) with,
+    where co-located is defined as running on a node whose value of
+    the label with key <topologyKey> matches that of any node on which
+    a pod of the set of pods is running
+    """
+    label_selector: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs']]]
+    match_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    MatchLabelKeys is a set of pod label keys to select which pods will
+    be taken into consideration. The keys are used to lookup values from the
+    incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
+    to select the group of existing pods which pods will be taken into consideration
+    for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
+    pod labels will be ignored. The default value is empty.
+    The same key is forbidden to exist in both matchLabelKeys and labelSelector.
+    Also, matchLabelKeys cannot be set when labelSelector isn't set.
+    """
+    mismatch_label_keys: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    MismatchLabelKeys is a set of pod label keys to select which pods will
+    be taken into consideration. The keys are used to lookup values from the
+    incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
+    to select the group of existing pods which pods will be taken into consideration
+    for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
+    pod labels will be ignored. The default value is empty.
+    The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
+    Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
+    """
+    namespace_selector: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs']]]
+    namespaces: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    namespaces specifies a static list of namespace names that the term applies to.
+    The term is applied to the union of the namespaces listed in this field
+    and the ones selected by namespaceSelector.
+    null or empty namespaces list and null namespaceSelector means "this pod's namespace".
+    """
+    topology_key: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
+    the labelSelector in the specified namespaces, where co-located is defined as running on a node
+    whose value of the label with key topologyKey matches that of any node on which any of the
+    selected pods is running.
+    Empty topologyKey is not allowed.
+    """
+
+
+@pulumi.input_type
+class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs:
+    def __init__(__self__, *,
+                 label_selector: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs']] = None,
+                 match_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 mismatch_label_keys: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 namespace_selector: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs']] = None,
+                 namespaces: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 topology_key: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        Defines a set of pods (namely those matching the labelSelector
+        relative to the given namespace(s)) that this pod should be
+        co-located (affinity) or not co-located (anti-affinity) with,
+        where co-located is defined as running on a node whose value of
+        the label with key <topologyKey> matches that of any node on which
+        a pod of the set of pods is running
+
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] match_label_keys: MatchLabelKeys is a set of pod label keys to select which pods will
+               be taken into consideration. The keys are used to lookup values from the
+               incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
+               to select the group of existing pods which pods will be taken into consideration
+               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
+               pod labels will be ignored. The default value is empty.
+               The same key is forbidden to exist in both matchLabelKeys and labelSelector.
+               Also, matchLabelKeys cannot be set when labelSelector isn't set.
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] mismatch_label_keys: MismatchLabelKeys is a set of pod label keys to select which pods will
+               be taken into consideration. The keys are used to lookup values from the
+               incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
+               to select the group of existing pods which pods will be taken into consideration
+               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
+               pod labels will be ignored. The default value is empty.
+               The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
+               Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] namespaces: namespaces specifies a static list of namespace names that the term applies to.
+               The term is applied to the union of the namespaces listed in this field
+               and the ones selected by namespaceSelector.
+               null or empty namespaces list and null namespaceSelector means "this pod's namespace".
+        :param pulumi.Input[_builtins.str] topology_key: This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
+               the labelSelector in the specified namespaces, where co-located is defined as running on a node
+               whose value of the label with key topologyKey matches that of any node on which any of the
+               selected pods is running.
+               Empty topologyKey is not allowed.
+        """
+        if label_selector is not None:
+            pulumi.set(__self__, "label_selector", label_selector)
+        if match_label_keys is not None:
+            pulumi.set(__self__, "match_label_keys", match_label_keys)
+        if mismatch_label_keys is not None:
+            pulumi.set(__self__, "mismatch_label_keys", mismatch_label_keys)
+        if namespace_selector is not None:
+            pulumi.set(__self__, "namespace_selector", namespace_selector)
+        if namespaces is not None:
+            pulumi.set(__self__, "namespaces", namespaces)
+        if topology_key is not None:
+            pulumi.set(__self__, "topology_key", topology_key)
+
+    @_builtins.property
+    @pulumi.getter(name="labelSelector")
+    def label_selector(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs']]:
+        return pulumi.get(self, "label_selector")
+
+    @label_selector.setter
+    def label_selector(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs']]):
+        pulumi.set(self, "label_selector", value)
+
+    @_builtins.property
+    @pulumi.getter(name="matchLabelKeys")
+    def match_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        MatchLabelKeys is a set of pod label keys to select which pods will
+        be taken into consideration. The keys are used to lookup values from the
+        incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
+        to select the group of existing pods which pods will be taken into consideration
+        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
+        pod labels will be ignored. The default value is empty.
+        The same key is forbidden to exist in both matchLabelKeys and labelSelector.
+        Also, matchLabelKeys cannot be set when labelSelector isn't set.
+        """
+        return pulumi.get(self, "match_label_keys")
+
+    @match_label_keys.setter
+    def match_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "match_label_keys", value)
+
+    @_builtins.property
+    @pulumi.getter(name="mismatchLabelKeys")
+    def mismatch_label_keys(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        MismatchLabelKeys is a set of pod label keys to select which pods will
+        be taken into consideration. The keys are used to lookup values from the
+        incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
+        to select the group of existing pods which pods will be taken into consideration
+        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
+        pod labels will be ignored. The default value is empty.
+        The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
+        Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
+        """
+        return pulumi.get(self, "mismatch_label_keys")
+
+    @mismatch_label_keys.setter
+    def mismatch_label_keys(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "mismatch_label_keys", value)
+
+    @_builtins.property
+    @pulumi.getter(name="namespaceSelector")
+    def namespace_selector(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs']]:
+        return pulumi.get(self, "namespace_selector")
+
+    @namespace_selector.setter
+    def namespace_selector(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs']]):
+        pulumi.set(self, "namespace_selector", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def namespaces(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        namespaces specifies a static list of namespace names that the term applies to.
+        The term is applied to the union of the namespaces listed in this field
+        and the ones selected by namespaceSelector.
+        null or empty namespaces list and null namespaceSelector means "this pod's namespace".
+        """
+        return pulumi.get(self, "namespaces")
+
+    @namespaces.setter
+    def namespaces(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "namespaces", value)
+
+    @_builtins.property
+    @pulumi.getter(name="topologyKey")
+    def topology_key(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
+        the labelSelector in the specified namespaces, where co-located is defined as running on a node
+        whose value of the label with key topologyKey matches that of any node on which any of the
+        selected pods is running.
+        Empty topologyKey is not allowed.
+        """
+        return pulumi.get(self, "topology_key")
+
+    @topology_key.setter
+    def topology_key(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "topology_key", value)
@@ -0,0 +1,344 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecStatefulSetPodArgsDict', 'ProxyClassSpecStatefulSetPodArgs']
+
+class ProxyClassSpecStatefulSetPodArgsDict(TypedDict):
+    """
+    Configuration for the proxy Pod.
+    """
+    affinity: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityArgs']]]
+    annotations: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+    """
+    Annotations that will be added to the proxy Pod.
+    Any annotations specified here will be merged with the default
+    annotations applied to the Pod by the Tailscale Kubernetes operator.
+    Annotations must be valid Kubernetes annotations.
+    https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
+    """
+    dns_config: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodDnsConfigArgs']]]
+    dns_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    DNSPolicy defines how DNS will be configured for the proxy Pod.
+    By default the Tailscale Kubernetes Operator does not set a DNS policy (uses cluster default).
+    https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-s-dns-policy
+    """
+    image_pull_secrets: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodImagePullSecretsArgs']]]]]
+    """
+    Proxy Pod's image pull Secrets.
+    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#PodSpec
+    """
+    labels: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+    """
+    Labels that will be added to the proxy Pod.
+    Any labels specified here will be merged with the default labels
+    applied to the Pod by the Tailscale Kubernetes operator.
+    Label keys and values must be valid Kubernetes label keys and values.
+    https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
+    """
+    node_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Proxy Pod's node name.
+    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+    """
+    node_selector: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+    """
+    Proxy Pod's node selector.
+    By default Tailscale Kubernetes operator does not apply any node
+    selector.
+    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+    """
+    priority_class_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    PriorityClassName for the proxy Pod.
+    By default Tailscale Kubernetes operator does not apply any priority class.
+    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+    """
+    security_context: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextArgs']]]
+    tailscale_container: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerArgs']]]
+    tailscale_init_container: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerArgs']]]
+    tolerations: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTolerationsArgs']]]]]
+    """
+    Proxy Pod's tolerations.
+    By default Tailscale Kubernetes operator does not apply any
+    tolerations.
+    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+    """
+    topology_spread_constraints: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs']]]]]
+    """
+    Proxy Pod's topology spread constraints.
+    By default Tailscale Kubernetes operator does not apply any topology spread constraints.
+    https://kubernetes.io/docs/concepts/scheduling-eviction/topology-spread-constraints/
+    """
+
+
+@pulumi.input_type
+class ProxyClassSpecStatefulSetPodArgs:
+    def __init__(__self__, *,
+                 affinity: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityArgs']] = None,
+                 annotations: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
+                 dns_config: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodDnsConfigArgs']] = None,
+                 dns_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 image_pull_secrets: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodImagePullSecretsArgs']]]] = None,
+                 labels: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
+                 node_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 node_selector: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None,
+                 priority_class_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 security_context: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextArgs']] = None,
+                 tailscale_container: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerArgs']] = None,
+                 tailscale_init_container: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerArgs']] = None,
+                 tolerations: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTolerationsArgs']]]] = None,
+                 topology_spread_constraints: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs']]]] = None):
+        """
+        Configuration for the proxy Pod.
+
+        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] annotations: Annotations that will be added to the proxy Pod.
+               Any annotations specified here will be merged with the default
+               annotations applied to the Pod by the Tailscale Kubernetes operator.
+               Annotations must be valid Kubernetes annotations.
+               https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
+        :param pulumi.Input[_builtins.str] dns_policy: DNSPolicy defines how DNS will be configured for the proxy Pod.
+               By default the Tailscale Kubernetes Operator does not set a DNS policy (uses cluster default).
+               https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-s-dns-policy
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodImagePullSecretsArgs']]] image_pull_secrets: Proxy Pod's image pull Secrets.
+               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#PodSpec
+        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] labels: Labels that will be added to the proxy Pod.
+               Any labels specified here will be merged with the default labels
+               applied to the Pod by the Tailscale Kubernetes operator.
+               Label keys and values must be valid Kubernetes label keys and values.
+               https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
+        :param pulumi.Input[_builtins.str] node_name: Proxy Pod's node name.
+               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] node_selector: Proxy Pod's node selector.
+               By default Tailscale Kubernetes operator does not apply any node
+               selector.
+               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+        :param pulumi.Input[_builtins.str] priority_class_name: PriorityClassName for the proxy Pod.
+               By default Tailscale Kubernetes operator does not apply any priority class.
+               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTolerationsArgs']]] tolerations: Proxy Pod's tolerations.
+               By default Tailscale Kubernetes operator does not apply any
+               tolerations.
+               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs']]] topology_spread_constraints: Proxy Pod's topology spread constraints.
+               By default Tailscale Kubernetes operator does not apply any topology spread constraints.
+               https://kubernetes.io/docs/concepts/scheduling-eviction/topology-spread-constraints/
+        """
+        if affinity is not None:
+            pulumi.set(__self__, "affinity", affinity)
+        if annotations is not None:
+            pulumi.set(__self__, "annotations", annotations)
+        if dns_config is not None:
+            pulumi.set(__self__, "dns_config", dns_config)
+        if dns_policy is not None:
+            pulumi.set(__self__, "dns_policy", dns_policy)
+        if image_pull_secrets is not None:
+            pulumi.set(__self__, "image_pull_secrets", image_pull_secrets)
+        if labels is not None:
+            pulumi.set(__self__, "labels", labels)
+        if node_name is not None:
+            pulumi.set(__self__, "node_name", node_name)
+        if node_selector is not None:
+            pulumi.set(__self__, "node_selector", node_selector)
+        if priority_class_name is not None:
+            pulumi.set(__self__, "priority_class_name", priority_class_name)
+        if security_context is not None:
+            pulumi.set(__self__, "security_context", security_context)
+        if tailscale_container is not None:
+            pulumi.set(__self__, "tailscale_container", tailscale_container)
+        if tailscale_init_container is not None:
+            pulumi.set(__self__, "tailscale_init_container", tailscale_init_container)
+        if tolerations is not None:
+            pulumi.set(__self__, "tolerations", tolerations)
+        if topology_spread_constraints is not None:
+            pulumi.set(__self__, "topology_spread_constraints", topology_spread_constraints)
+
+    @_builtins.property
+    @pulumi.getter
+    def affinity(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityArgs']]:
+        return pulumi.get(self, "affinity")
+
+    @affinity.setter
+    def affinity(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodAffinityArgs']]):
+        pulumi.set(self, "affinity", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def annotations(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        """
+        Annotations that will be added to the proxy Pod.
+        Any annotations specified here will be merged with the default
+        annotations applied to the Pod by the Tailscale Kubernetes operator.
+        Annotations must be valid Kubernetes annotations.
+        https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
+        """
+        return pulumi.get(self, "annotations")
+
+    @annotations.setter
+    def annotations(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "annotations", value)
+
+    @_builtins.property
+    @pulumi.getter(name="dnsConfig")
+    def dns_config(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodDnsConfigArgs']]:
+        return pulumi.get(self, "dns_config")
+
+    @dns_config.setter
+    def dns_config(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodDnsConfigArgs']]):
+        pulumi.set(self, "dns_config", value)
+
+    @_builtins.property
+    @pulumi.getter(name="dnsPolicy")
+    def dns_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        DNSPolicy defines how DNS will be configured for the proxy Pod.
+        By default the Tailscale Kubernetes Operator does not set a DNS policy (uses cluster default).
+        https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-s-dns-policy
+        """
+        return pulumi.get(self, "dns_policy")
+
+    @dns_policy.setter
+    def dns_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "dns_policy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="imagePullSecrets")
+    def image_pull_secrets(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodImagePullSecretsArgs']]]]:
+        """
+        Proxy Pod's image pull Secrets.
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#PodSpec
+        """
+        return pulumi.get(self, "image_pull_secrets")
+
+    @image_pull_secrets.setter
+    def image_pull_secrets(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodImagePullSecretsArgs']]]]):
+        pulumi.set(self, "image_pull_secrets", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def labels(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        """
+        Labels that will be added to the proxy Pod.
+        Any labels specified here will be merged with the default labels
+        applied to the Pod by the Tailscale Kubernetes operator.
+        Label keys and values must be valid Kubernetes label keys and values.
+        https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
+        """
+        return pulumi.get(self, "labels")
+
+    @labels.setter
+    def labels(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "labels", value)
+
+    @_builtins.property
+    @pulumi.getter(name="nodeName")
+    def node_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Proxy Pod's node name.
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+        """
+        return pulumi.get(self, "node_name")
+
+    @node_name.setter
+    def node_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "node_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="nodeSelector")
+    def node_selector(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        """
+        Proxy Pod's node selector.
+        By default Tailscale Kubernetes operator does not apply any node
+        selector.
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+        """
+        return pulumi.get(self, "node_selector")
+
+    @node_selector.setter
+    def node_selector(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "node_selector", value)
+
+    @_builtins.property
+    @pulumi.getter(name="priorityClassName")
+    def priority_class_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        PriorityClassName for the proxy Pod.
+        By default Tailscale Kubernetes operator does not apply any priority class.
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+        """
+        return pulumi.get(self, "priority_class_name")
+
+    @priority_class_name.setter
+    def priority_class_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "priority_class_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="securityContext")
+    def security_context(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextArgs']]:
+        return pulumi.get(self, "security_context")
+
+    @security_context.setter
+    def security_context(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextArgs']]):
+        pulumi.set(self, "security_context", value)
+
+    @_builtins.property
+    @pulumi.getter(name="tailscaleContainer")
+    def tailscale_container(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerArgs']]:
+        return pulumi.get(self, "tailscale_container")
+
+    @tailscale_container.setter
+    def tailscale_container(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerArgs']]):
+        pulumi.set(self, "tailscale_container", value)
+
+    @_builtins.property
+    @pulumi.getter(name="tailscaleInitContainer")
+    def tailscale_init_container(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerArgs']]:
+        return pulumi.get(self, "tailscale_init_container")
+
+    @tailscale_init_container.setter
+    def tailscale_init_container(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerArgs']]):
+        pulumi.set(self, "tailscale_init_container", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def tolerations(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTolerationsArgs']]]]:
+        """
+        Proxy Pod's tolerations.
+        By default Tailscale Kubernetes operator does not apply any
+        tolerations.
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+        """
+        return pulumi.get(self, "tolerations")
+
+    @tolerations.setter
+    def tolerations(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTolerationsArgs']]]]):
+        pulumi.set(self, "tolerations", value)
+
+    @_builtins.property
+    @pulumi.getter(name="topologySpreadConstraints")
+    def topology_spread_constraints(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs']]]]:
+        """
+        Proxy Pod's topology spread constraints.
+        By default Tailscale Kubernetes operator does not apply any topology spread constraints.
+        https://kubernetes.io/docs/concepts/scheduling-eviction/topology-spread-constraints/
+        """
+        return pulumi.get(self, "topology_spread_constraints")
+
+    @topology_spread_constraints.setter
+    def topology_spread_constraints(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs']]]]):
+        pulumi.set(self, "topology_spread_constraints", value)
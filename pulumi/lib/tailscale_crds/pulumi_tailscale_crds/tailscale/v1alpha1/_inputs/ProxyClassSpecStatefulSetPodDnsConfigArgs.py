@@ -0,0 +1,118 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecStatefulSetPodDnsConfigArgsDict', 'ProxyClassSpecStatefulSetPodDnsConfigArgs']
+
+class ProxyClassSpecStatefulSetPodDnsConfigArgsDict(TypedDict):
+    """
+    DNSConfig defines DNS parameters for the proxy Pod in addition to those generated from DNSPolicy.
+    When DNSPolicy is set to "None", DNSConfig must be specified.
+    https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-dns-config
+    """
+    nameservers: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    A list of DNS name server IP addresses.
+    This will be appended to the base nameservers generated from DNSPolicy.
+    Duplicated nameservers will be removed.
+    """
+    options: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs']]]]]
+    """
+    A list of DNS resolver options.
+    This will be merged with the base options generated from DNSPolicy.
+    Duplicated entries will be removed. Resolution options given in Options
+    will override those that appear in the base DNSPolicy.
+    """
+    searches: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]]
+    """
+    A list of DNS search domains for host-name lookup.
+    This will be appended to the base search paths generated from DNSPolicy.
+    Duplicated search paths will be removed.
+    """
+
+
+@pulumi.input_type
+class ProxyClassSpecStatefulSetPodDnsConfigArgs:
+    def __init__(__self__, *,
+                 nameservers: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None,
+                 options: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs']]]] = None,
+                 searches: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]] = None):
+        """
+        DNSConfig defines DNS parameters for the proxy Pod in addition to those generated from DNSPolicy.
+        When DNSPolicy is set to "None", DNSConfig must be specified.
+        https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-dns-config
+
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] nameservers: A list of DNS name server IP addresses.
+               This will be appended to the base nameservers generated from DNSPolicy.
+               Duplicated nameservers will be removed.
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs']]] options: A list of DNS resolver options.
+               This will be merged with the base options generated from DNSPolicy.
+               Duplicated entries will be removed. Resolution options given in Options
+               will override those that appear in the base DNSPolicy.
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.str]]] searches: A list of DNS search domains for host-name lookup.
+               This will be appended to the base search paths generated from DNSPolicy.
+               Duplicated search paths will be removed.
+        """
+        if nameservers is not None:
+            pulumi.set(__self__, "nameservers", nameservers)
+        if options is not None:
+            pulumi.set(__self__, "options", options)
+        if searches is not None:
+            pulumi.set(__self__, "searches", searches)
+
+    @_builtins.property
+    @pulumi.getter
+    def nameservers(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        A list of DNS name server IP addresses.
+        This will be appended to the base nameservers generated from DNSPolicy.
+        Duplicated nameservers will be removed.
+        """
+        return pulumi.get(self, "nameservers")
+
+    @nameservers.setter
+    def nameservers(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "nameservers", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def options(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs']]]]:
+        """
+        A list of DNS resolver options.
+        This will be merged with the base options generated from DNSPolicy.
+        Duplicated entries will be removed. Resolution options given in Options
+        will override those that appear in the base DNSPolicy.
+        """
+        return pulumi.get(self, "options")
+
+    @options.setter
+    def options(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs']]]]):
+        pulumi.set(self, "options", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def searches(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]:
+        """
+        A list of DNS search domains for host-name lookup.
+        This will be appended to the base search paths generated from DNSPolicy.
+        Duplicated search paths will be removed.
+        """
+        return pulumi.get(self, "searches")
+
+    @searches.setter
+    def searches(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "searches", value)
@@ -0,0 +1,96 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgsDict', 'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgs']
+
+class ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgsDict(TypedDict):
+    """
+    appArmorProfile is the AppArmor options to use by the containers in this pod.
+    Note that this field cannot be set when spec.os.name is windows.
+    """
+    localhost_profile: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    localhostProfile indicates a profile loaded on the node that should be used.
+    The profile must be preconfigured on the node to work.
+    Must match the loaded name of the profile.
+    Must be set if and only if type is "Localhost".
+    """
+    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    type indicates which kind of AppArmor profile will be applied.
+    Valid options are:
+      Localhost - a profile pre-loaded on the node.
+      RuntimeDefault - the container runtime's default profile.
+      Unconfined - no AppArmor enforcement.
+    """
+
+
+@pulumi.input_type
+class ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgs:
+    def __init__(__self__, *,
+                 localhost_profile: pulumi.Input[Optional[_builtins.str]] = None,
+                 type: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        appArmorProfile is the AppArmor options to use by the containers in this pod.
+        Note that this field cannot be set when spec.os.name is windows.
+
+        :param pulumi.Input[_builtins.str] localhost_profile: localhostProfile indicates a profile loaded on the node that should be used.
+               The profile must be preconfigured on the node to work.
+               Must match the loaded name of the profile.
+               Must be set if and only if type is "Localhost".
+        :param pulumi.Input[_builtins.str] type: type indicates which kind of AppArmor profile will be applied.
+               Valid options are:
+                 Localhost - a profile pre-loaded on the node.
+                 RuntimeDefault - the container runtime's default profile.
+                 Unconfined - no AppArmor enforcement.
+        """
+        if localhost_profile is not None:
+            pulumi.set(__self__, "localhost_profile", localhost_profile)
+        if type is not None:
+            pulumi.set(__self__, "type", type)
+
+    @_builtins.property
+    @pulumi.getter(name="localhostProfile")
+    def localhost_profile(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        localhostProfile indicates a profile loaded on the node that should be used.
+        The profile must be preconfigured on the node to work.
+        Must match the loaded name of the profile.
+        Must be set if and only if type is "Localhost".
+        """
+        return pulumi.get(self, "localhost_profile")
+
+    @localhost_profile.setter
+    def localhost_profile(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "localhost_profile", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        type indicates which kind of AppArmor profile will be applied.
+        Valid options are:
+          Localhost - a profile pre-loaded on the node.
+          RuntimeDefault - the container runtime's default profile.
+          Unconfined - no AppArmor enforcement.
+        """
+        return pulumi.get(self, "type")
+
+    @type.setter
+    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "type", value)
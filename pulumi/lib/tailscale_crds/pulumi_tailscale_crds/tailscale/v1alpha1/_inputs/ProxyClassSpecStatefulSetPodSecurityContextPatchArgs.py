@@ -0,0 +1,469 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecStatefulSetPodSecurityContextPatchArgsDict', 'ProxyClassSpecStatefulSetPodSecurityContextPatchArgs']
+
+class ProxyClassSpecStatefulSetPodSecurityContextPatchArgsDict(TypedDict):
+    """
+    Proxy Pod's security context.
+    By default Tailscale Kubernetes operator does not apply any Pod
+    security context.
+    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context-2
+    """
+    app_armor_profile: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgs']]]
+    fs_group: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    A special supplemental group that applies to all containers in a pod.
+    Some volume types allow the Kubelet to change the ownership of that volume
+    to be owned by the pod:
+
+    1. The owning GID will be the FSGroup
+    2. The setgid bit is set (new files created in the volume will be owned by FSGroup)
+    3. The permission bits are OR'd with rw-rw----
+
+    If unset, the Kubelet will not modify the ownership and permissions of any volume.
+    Note that this field cannot be set when spec.os.name is windows.
+    """
+    fs_group_change_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    fsGroupChangePolicy defines behavior of changing ownership and permission of the volume
+    before being exposed inside Pod. This field will only apply to
+    volume types which support fsGroup based ownership(and permissions).
+    It will have no effect on ephemeral volume types such as: secret, configmaps
+    and emptydir.
+    Valid values are "OnRootMismatch" and "Always". If not specified, "Always" is used.
+    Note that this field cannot be set when spec.os.name is windows.
+    """
+    run_as_group: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    The GID to run the entrypoint of the container process.
+    Uses runtime default if unset.
+    May also be set in SecurityContext.  If set in both SecurityContext and
+    PodSecurityContext, the value specified in SecurityContext takes precedence
+    for that container.
+    Note that this field cannot be set when spec.os.name is windows.
+    """
+    run_as_non_root: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Indicates that the container must run as a non-root user.
+    If true, the Kubelet will validate the image at runtime to ensure that it
+    does not run as UID 0 (root) and fail to start the container if it does.
+    If unset or false, no such validation will be performed.
+    May also be set in SecurityContext.  If set in both SecurityContext and
+    PodSecurityContext, the value specified in SecurityContext takes precedence.
+    """
+    run_as_user: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    The UID to run the entrypoint of the container process.
+    Defaults to user specified in image metadata if unspecified.
+    May also be set in SecurityContext.  If set in both SecurityContext and
+    PodSecurityContext, the value specified in SecurityContext takes precedence
+    for that container.
+    Note that this field cannot be set when spec.os.name is windows.
+    """
+    se_linux_change_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    seLinuxChangePolicy defines how the container's SELinux label is applied to all volumes used by the Pod.
+    It has no effect on nodes that do not support SELinux or to volumes does not support SELinux.
+    Valid values are "MountOption" and "Recursive".
+
+    "Recursive" means relabeling of all files on all Pod volumes by the container runtime.
+    This may be slow for large volumes, but allows mixing privileged and unprivileged Pods sharing the same volume on the same node.
+
+    "MountOption" mounts all eligible Pod volumes with `-o context` mount option.
+    This requires all Pods that share the same volume to use the same SELinux label.
+    It is not possible to share the same volume among privileged and unprivileged Pods.
+    Eligible volumes are in-tree FibreChannel and iSCSI volumes, and all CSI volumes
+    whose CSI driver announces SELinux support by setting spec.seLinuxMount: true in their
+    CSIDriver instance. Other volumes are always re-labelled recursively.
+    "MountOption" value is allowed only when SELinuxMount feature gate is enabled.
+
+    If not specified and SELinuxMount feature gate is enabled, "MountOption" is used.
+    If not specified and SELinuxMount feature gate is disabled, "MountOption" is used for ReadWriteOncePod volumes
+    and "Recursive" for all other volumes.
+
+    This field affects only Pods that have SELinux label set, either in PodSecurityContext or in SecurityContext of all containers.
+
+    All Pods that use the same volume should use the same seLinuxChangePolicy, otherwise some pods can get stuck in ContainerCreating state.
+    Note that this field cannot be set when spec.os.name is windows.
+    """
+    se_linux_options: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgs']]]
+    seccomp_profile: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgs']]]
+    supplemental_groups: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.int]]]]]
+    """
+    A list of groups applied to the first process run in each container, in
+    addition to the container's primary GID and fsGroup (if specified).  If
+    the SupplementalGroupsPolicy feature is enabled, the
+    supplementalGroupsPolicy field determines whether these are in addition
+    to or instead of any group memberships defined in the container image.
+    If unspecified, no additional groups are added, though group memberships
+    defined in the container image may still be used, depending on the
+    supplementalGroupsPolicy field.
+    Note that this field cannot be set when spec.os.name is windows.
+    """
+    supplemental_groups_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Defines how supplemental groups of the first container processes are calculated.
+    Valid values are "Merge" and "Strict". If not specified, "Merge" is used.
+    (Alpha) Using the field requires the SupplementalGroupsPolicy feature gate to be enabled
+    and the container runtime must implement support for this feature.
+    Note that this field cannot be set when spec.os.name is windows.
+    """
+    sysctls: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs']]]]]
+    """
+    Sysctls hold a list of namespaced sysctls used for the pod. Pods with unsupported
+    sysctls (by the container runtime) might fail to launch.
+    Note that this field cannot be set when spec.os.name is windows.
+    """
+    windows_options: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgs']]]
+
+
+@pulumi.input_type
+class ProxyClassSpecStatefulSetPodSecurityContextPatchArgs:
+    def __init__(__self__, *,
+                 app_armor_profile: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgs']] = None,
+                 fs_group: pulumi.Input[Optional[_builtins.int]] = None,
+                 fs_group_change_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 run_as_group: pulumi.Input[Optional[_builtins.int]] = None,
+                 run_as_non_root: pulumi.Input[Optional[_builtins.bool]] = None,
+                 run_as_user: pulumi.Input[Optional[_builtins.int]] = None,
+                 se_linux_change_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 se_linux_options: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgs']] = None,
+                 seccomp_profile: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgs']] = None,
+                 supplemental_groups: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.int]]]] = None,
+                 supplemental_groups_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 sysctls: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs']]]] = None,
+                 windows_options: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgs']] = None):
+        """
+        Proxy Pod's security context.
+        By default Tailscale Kubernetes operator does not apply any Pod
+        security context.
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context-2
+
+        :param pulumi.Input[_builtins.int] fs_group: A special supplemental group that applies to all containers in a pod.
+               Some volume types allow the Kubelet to change the ownership of that volume
+               to be owned by the pod:
+
+               1. The owning GID will be the FSGroup
+               2. The setgid bit is set (new files created in the volume will be owned by FSGroup)
+               3. The permission bits are OR'd with rw-rw----
+
+               If unset, the Kubelet will not modify the ownership and permissions of any volume.
+               Note that this field cannot be set when spec.os.name is windows.
+        :param pulumi.Input[_builtins.str] fs_group_change_policy: fsGroupChangePolicy defines behavior of changing ownership and permission of the volume
+               before being exposed inside Pod. This field will only apply to
+               volume types which support fsGroup based ownership(and permissions).
+               It will have no effect on ephemeral volume types such as: secret, configmaps
+               and emptydir.
+               Valid values are "OnRootMismatch" and "Always". If not specified, "Always" is used.
+               Note that this field cannot be set when spec.os.name is windows.
+        :param pulumi.Input[_builtins.int] run_as_group: The GID to run the entrypoint of the container process.
+               Uses runtime default if unset.
+               May also be set in SecurityContext.  If set in both SecurityContext and
+               PodSecurityContext, the value specified in SecurityContext takes precedence
+               for that container.
+               Note that this field cannot be set when spec.os.name is windows.
+        :param pulumi.Input[_builtins.bool] run_as_non_root: Indicates that the container must run as a non-root user.
+               If true, the Kubelet will validate the image at runtime to ensure that it
+               does not run as UID 0 (root) and fail to start the container if it does.
+               If unset or false, no such validation will be performed.
+               May also be set in SecurityContext.  If set in both SecurityContext and
+               PodSecurityContext, the value specified in SecurityContext takes precedence.
+        :param pulumi.Input[_builtins.int] run_as_user: The UID to run the entrypoint of the container process.
+               Defaults to user specified in image metadata if unspecified.
+               May also be set in SecurityContext.  If set in both SecurityContext and
+               PodSecurityContext, the value specified in SecurityContext takes precedence
+               for that container.
+               Note that this field cannot be set when spec.os.name is windows.
+        :param pulumi.Input[_builtins.str] se_linux_change_policy: seLinuxChangePolicy defines how the container's SELinux label is applied to all volumes used by the Pod.
+               It has no effect on nodes that do not support SELinux or to volumes does not support SELinux.
+               Valid values are "MountOption" and "Recursive".
+
+               "Recursive" means relabeling of all files on all Pod volumes by the container runtime.
+               This may be slow for large volumes, but allows mixing privileged and unprivileged Pods sharing the same volume on the same node.
+
+               "MountOption" mounts all eligible Pod volumes with `-o context` mount option.
+               This requires all Pods that share the same volume to use the same SELinux label.
+               It is not possible to share the same volume among privileged and unprivileged Pods.
+               Eligible volumes are in-tree FibreChannel and iSCSI volumes, and all CSI volumes
+               whose CSI driver announces SELinux support by setting spec.seLinuxMount: true in their
+               CSIDriver instance. Other volumes are always re-labelled recursively.
+               "MountOption" value is allowed only when SELinuxMount feature gate is enabled.
+
+               If not specified and SELinuxMount feature gate is enabled, "MountOption" is used.
+               If not specified and SELinuxMount feature gate is disabled, "MountOption" is used for ReadWriteOncePod volumes
+               and "Recursive" for all other volumes.
+
+               This field affects only Pods that have SELinux label set, either in PodSecurityContext or in SecurityContext of all containers.
+
+               All Pods that use the same volume should use the same seLinuxChangePolicy, otherwise some pods can get stuck in ContainerCreating state.
+               Note that this field cannot be set when spec.os.name is windows.
+        :param pulumi.Input[Sequence[pulumi.Input[_builtins.int]]] supplemental_groups: A list of groups applied to the first process run in each container, in
+               addition to the container's primary GID and fsGroup (if specified).  If
+               the SupplementalGroupsPolicy feature is enabled, the
+               supplementalGroupsPolicy field determines whether these are in addition
+               to or instead of any group memberships defined in the container image.
+               If unspecified, no additional groups are added, though group memberships
+               defined in the container image may still be used, depending on the
+               supplementalGroupsPolicy field.
+               Note that this field cannot be set when spec.os.name is windows.
+        :param pulumi.Input[_builtins.str] supplemental_groups_policy: Defines how supplemental groups of the first container processes are calculated.
+               Valid values are "Merge" and "Strict". If not specified, "Merge" is used.
+               (Alpha) Using the field requires the SupplementalGroupsPolicy feature gate to be enabled
+               and the container runtime must implement support for this feature.
+               Note that this field cannot be set when spec.os.name is windows.
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs']]] sysctls: Sysctls hold a list of namespaced sysctls used for the pod. Pods with unsupported
+               sysctls (by the container runtime) might fail to launch.
+               Note that this field cannot be set when spec.os.name is windows.
+        """
+        if app_armor_profile is not None:
+            pulumi.set(__self__, "app_armor_profile", app_armor_profile)
+        if fs_group is not None:
+            pulumi.set(__self__, "fs_group", fs_group)
+        if fs_group_change_policy is not None:
+            pulumi.set(__self__, "fs_group_change_policy", fs_group_change_policy)
+        if run_as_group is not None:
+            pulumi.set(__self__, "run_as_group", run_as_group)
+        if run_as_non_root is not None:
+            pulumi.set(__self__, "run_as_non_root", run_as_non_root)
+        if run_as_user is not None:
+            pulumi.set(__self__, "run_as_user", run_as_user)
+        if se_linux_change_policy is not None:
+            pulumi.set(__self__, "se_linux_change_policy", se_linux_change_policy)
+        if se_linux_options is not None:
+            pulumi.set(__self__, "se_linux_options", se_linux_options)
+        if seccomp_profile is not None:
+            pulumi.set(__self__, "seccomp_profile", seccomp_profile)
+        if supplemental_groups is not None:
+            pulumi.set(__self__, "supplemental_groups", supplemental_groups)
+        if supplemental_groups_policy is not None:
+            pulumi.set(__self__, "supplemental_groups_policy", supplemental_groups_policy)
+        if sysctls is not None:
+            pulumi.set(__self__, "sysctls", sysctls)
+        if windows_options is not None:
+            pulumi.set(__self__, "windows_options", windows_options)
+
+    @_builtins.property
+    @pulumi.getter(name="appArmorProfile")
+    def app_armor_profile(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgs']]:
+        return pulumi.get(self, "app_armor_profile")
+
+    @app_armor_profile.setter
+    def app_armor_profile(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgs']]):
+        pulumi.set(self, "app_armor_profile", value)
+
+    @_builtins.property
+    @pulumi.getter(name="fsGroup")
+    def fs_group(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        A special supplemental group that applies to all containers in a pod.
+        Some volume types allow the Kubelet to change the ownership of that volume
+        to be owned by the pod:
+
+        1. The owning GID will be the FSGroup
+        2. The setgid bit is set (new files created in the volume will be owned by FSGroup)
+        3. The permission bits are OR'd with rw-rw----
+
+        If unset, the Kubelet will not modify the ownership and permissions of any volume.
+        Note that this field cannot be set when spec.os.name is windows.
+        """
+        return pulumi.get(self, "fs_group")
+
+    @fs_group.setter
+    def fs_group(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "fs_group", value)
+
+    @_builtins.property
+    @pulumi.getter(name="fsGroupChangePolicy")
+    def fs_group_change_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        fsGroupChangePolicy defines behavior of changing ownership and permission of the volume
+        before being exposed inside Pod. This field will only apply to
+        volume types which support fsGroup based ownership(and permissions).
+        It will have no effect on ephemeral volume types such as: secret, configmaps
+        and emptydir.
+        Valid values are "OnRootMismatch" and "Always". If not specified, "Always" is used.
+        Note that this field cannot be set when spec.os.name is windows.
+        """
+        return pulumi.get(self, "fs_group_change_policy")
+
+    @fs_group_change_policy.setter
+    def fs_group_change_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "fs_group_change_policy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="runAsGroup")
+    def run_as_group(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        The GID to run the entrypoint of the container process.
+        Uses runtime default if unset.
+        May also be set in SecurityContext.  If set in both SecurityContext and
+        PodSecurityContext, the value specified in SecurityContext takes precedence
+        for that container.
+        Note that this field cannot be set when spec.os.name is windows.
+        """
+        return pulumi.get(self, "run_as_group")
+
+    @run_as_group.setter
+    def run_as_group(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "run_as_group", value)
+
+    @_builtins.property
+    @pulumi.getter(name="runAsNonRoot")
+    def run_as_non_root(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Indicates that the container must run as a non-root user.
+        If true, the Kubelet will validate the image at runtime to ensure that it
+        does not run as UID 0 (root) and fail to start the container if it does.
+        If unset or false, no such validation will be performed.
+        May also be set in SecurityContext.  If set in both SecurityContext and
+        PodSecurityContext, the value specified in SecurityContext takes precedence.
+        """
+        return pulumi.get(self, "run_as_non_root")
+
+    @run_as_non_root.setter
+    def run_as_non_root(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "run_as_non_root", value)
+
+    @_builtins.property
+    @pulumi.getter(name="runAsUser")
+    def run_as_user(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        The UID to run the entrypoint of the container process.
+        Defaults to user specified in image metadata if unspecified.
+        May also be set in SecurityContext.  If set in both SecurityContext and
+        PodSecurityContext, the value specified in SecurityContext takes precedence
+        for that container.
+        Note that this field cannot be set when spec.os.name is windows.
+        """
+        return pulumi.get(self, "run_as_user")
+
+    @run_as_user.setter
+    def run_as_user(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "run_as_user", value)
+
+    @_builtins.property
+    @pulumi.getter(name="seLinuxChangePolicy")
+    def se_linux_change_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        seLinuxChangePolicy defines how the container's SELinux label is applied to all volumes used by the Pod.
+        It has no effect on nodes that do not support SELinux or to volumes does not support SELinux.
+        Valid values are "MountOption" and "Recursive".
+
+        "Recursive" means relabeling of all files on all Pod volumes by the container runtime.
+        This may be slow for large volumes, but allows mixing privileged and unprivileged Pods sharing the same volume on the same node.
+
+        "MountOption" mounts all eligible Pod volumes with `-o context` mount option.
+        This requires all Pods that share the same volume to use the same SELinux label.
+        It is not possible to share the same volume among privileged and unprivileged Pods.
+        Eligible volumes are in-tree FibreChannel and iSCSI volumes, and all CSI volumes
+        whose CSI driver announces SELinux support by setting spec.seLinuxMount: true in their
+        CSIDriver instance. Other volumes are always re-labelled recursively.
+        "MountOption" value is allowed only when SELinuxMount feature gate is enabled.
+
+        If not specified and SELinuxMount feature gate is enabled, "MountOption" is used.
+        If not specified and SELinuxMount feature gate is disabled, "MountOption" is used for ReadWriteOncePod volumes
+        and "Recursive" for all other volumes.
+
+        This field affects only Pods that have SELinux label set, either in PodSecurityContext or in SecurityContext of all containers.
+
+        All Pods that use the same volume should use the same seLinuxChangePolicy, otherwise some pods can get stuck in ContainerCreating state.
+        Note that this field cannot be set when spec.os.name is windows.
+        """
+        return pulumi.get(self, "se_linux_change_policy")
+
+    @se_linux_change_policy.setter
+    def se_linux_change_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "se_linux_change_policy", value)
+
+    @_builtins.property
+    @pulumi.getter(name="seLinuxOptions")
+    def se_linux_options(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgs']]:
+        return pulumi.get(self, "se_linux_options")
+
+    @se_linux_options.setter
+    def se_linux_options(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgs']]):
+        pulumi.set(self, "se_linux_options", value)
+
+    @_builtins.property
+    @pulumi.getter(name="seccompProfile")
+    def seccomp_profile(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgs']]:
+        return pulumi.get(self, "seccomp_profile")
+
+    @seccomp_profile.setter
+    def seccomp_profile(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgs']]):
+        pulumi.set(self, "seccomp_profile", value)
+
+    @_builtins.property
+    @pulumi.getter(name="supplementalGroups")
+    def supplemental_groups(self) -> pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.int]]]]:
+        """
+        A list of groups applied to the first process run in each container, in
+        addition to the container's primary GID and fsGroup (if specified).  If
+        the SupplementalGroupsPolicy feature is enabled, the
+        supplementalGroupsPolicy field determines whether these are in addition
+        to or instead of any group memberships defined in the container image.
+        If unspecified, no additional groups are added, though group memberships
+        defined in the container image may still be used, depending on the
+        supplementalGroupsPolicy field.
+        Note that this field cannot be set when spec.os.name is windows.
+        """
+        return pulumi.get(self, "supplemental_groups")
+
+    @supplemental_groups.setter
+    def supplemental_groups(self, value: pulumi.Input[Optional[Sequence[pulumi.Input[_builtins.int]]]]):
+        pulumi.set(self, "supplemental_groups", value)
+
+    @_builtins.property
+    @pulumi.getter(name="supplementalGroupsPolicy")
+    def supplemental_groups_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Defines how supplemental groups of the first container processes are calculated.
+        Valid values are "Merge" and "Strict". If not specified, "Merge" is used.
+        (Alpha) Using the field requires the SupplementalGroupsPolicy feature gate to be enabled
+        and the container runtime must implement support for this feature.
+        Note that this field cannot be set when spec.os.name is windows.
+        """
+        return pulumi.get(self, "supplemental_groups_policy")
+
+    @supplemental_groups_policy.setter
+    def supplemental_groups_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "supplemental_groups_policy", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def sysctls(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs']]]]:
+        """
+        Sysctls hold a list of namespaced sysctls used for the pod. Pods with unsupported
+        sysctls (by the container runtime) might fail to launch.
+        Note that this field cannot be set when spec.os.name is windows.
+        """
+        return pulumi.get(self, "sysctls")
+
+    @sysctls.setter
+    def sysctls(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs']]]]):
+        pulumi.set(self, "sysctls", value)
+
+    @_builtins.property
+    @pulumi.getter(name="windowsOptions")
+    def windows_options(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgs']]:
+        return pulumi.get(self, "windows_options")
+
+    @windows_options.setter
+    def windows_options(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgs']]):
+        pulumi.set(self, "windows_options", value)
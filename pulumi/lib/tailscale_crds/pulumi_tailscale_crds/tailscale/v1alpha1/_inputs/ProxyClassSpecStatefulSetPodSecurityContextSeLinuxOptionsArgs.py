@@ -0,0 +1,123 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgsDict', 'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgs']
+
+class ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgsDict(TypedDict):
+    """
+    The SELinux context to be applied to all containers.
+    If unspecified, the container runtime will allocate a random SELinux context for each
+    container.  May also be set in SecurityContext.  If set in
+    both SecurityContext and PodSecurityContext, the value specified in SecurityContext
+    takes precedence for that container.
+    Note that this field cannot be set when spec.os.name is windows.
+    """
+    level: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Level is SELinux level label that applies to the container.
+    """
+    role: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Role is a SELinux role label that applies to the container.
+    """
+    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Type is a SELinux type label that applies to the container.
+    """
+    user: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    User is a SELinux user label that applies to the container.
+    """
+
+
+@pulumi.input_type
+class ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgs:
+    def __init__(__self__, *,
+                 level: pulumi.Input[Optional[_builtins.str]] = None,
+                 role: pulumi.Input[Optional[_builtins.str]] = None,
+                 type: pulumi.Input[Optional[_builtins.str]] = None,
+                 user: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        The SELinux context to be applied to all containers.
+        If unspecified, the container runtime will allocate a random SELinux context for each
+        container.  May also be set in SecurityContext.  If set in
+        both SecurityContext and PodSecurityContext, the value specified in SecurityContext
+        takes precedence for that container.
+        Note that this field cannot be set when spec.os.name is windows.
+
+        :param pulumi.Input[_builtins.str] level: Level is SELinux level label that applies to the container.
+        :param pulumi.Input[_builtins.str] role: Role is a SELinux role label that applies to the container.
+        :param pulumi.Input[_builtins.str] type: Type is a SELinux type label that applies to the container.
+        :param pulumi.Input[_builtins.str] user: User is a SELinux user label that applies to the container.
+        """
+        if level is not None:
+            pulumi.set(__self__, "level", level)
+        if role is not None:
+            pulumi.set(__self__, "role", role)
+        if type is not None:
+            pulumi.set(__self__, "type", type)
+        if user is not None:
+            pulumi.set(__self__, "user", user)
+
+    @_builtins.property
+    @pulumi.getter
+    def level(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Level is SELinux level label that applies to the container.
+        """
+        return pulumi.get(self, "level")
+
+    @level.setter
+    def level(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "level", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def role(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Role is a SELinux role label that applies to the container.
+        """
+        return pulumi.get(self, "role")
+
+    @role.setter
+    def role(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "role", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Type is a SELinux type label that applies to the container.
+        """
+        return pulumi.get(self, "type")
+
+    @type.setter
+    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "type", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def user(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        User is a SELinux user label that applies to the container.
+        """
+        return pulumi.get(self, "user")
+
+    @user.setter
+    def user(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "user", value)
@@ -0,0 +1,99 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgsDict', 'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgs']
+
+class ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgsDict(TypedDict):
+    """
+    The seccomp options to use by the containers in this pod.
+    Note that this field cannot be set when spec.os.name is windows.
+    """
+    localhost_profile: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    localhostProfile indicates a profile defined in a file on the node should be used.
+    The profile must be preconfigured on the node to work.
+    Must be a descending path, relative to the kubelet's configured seccomp profile location.
+    Must be set if type is "Localhost". Must NOT be set for any other type.
+    """
+    type: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    type indicates which kind of seccomp profile will be applied.
+    Valid options are:
+
+    Localhost - a profile defined in a file on the node should be used.
+    RuntimeDefault - the container runtime default profile should be used.
+    Unconfined - no profile should be applied.
+    """
+
+
+@pulumi.input_type
+class ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgs:
+    def __init__(__self__, *,
+                 localhost_profile: pulumi.Input[Optional[_builtins.str]] = None,
+                 type: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        The seccomp options to use by the containers in this pod.
+        Note that this field cannot be set when spec.os.name is windows.
+
+        :param pulumi.Input[_builtins.str] localhost_profile: localhostProfile indicates a profile defined in a file on the node should be used.
+               The profile must be preconfigured on the node to work.
+               Must be a descending path, relative to the kubelet's configured seccomp profile location.
+               Must be set if type is "Localhost". Must NOT be set for any other type.
+        :param pulumi.Input[_builtins.str] type: type indicates which kind of seccomp profile will be applied.
+               Valid options are:
+
+               Localhost - a profile defined in a file on the node should be used.
+               RuntimeDefault - the container runtime default profile should be used.
+               Unconfined - no profile should be applied.
+        """
+        if localhost_profile is not None:
+            pulumi.set(__self__, "localhost_profile", localhost_profile)
+        if type is not None:
+            pulumi.set(__self__, "type", type)
+
+    @_builtins.property
+    @pulumi.getter(name="localhostProfile")
+    def localhost_profile(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        localhostProfile indicates a profile defined in a file on the node should be used.
+        The profile must be preconfigured on the node to work.
+        Must be a descending path, relative to the kubelet's configured seccomp profile location.
+        Must be set if type is "Localhost". Must NOT be set for any other type.
+        """
+        return pulumi.get(self, "localhost_profile")
+
+    @localhost_profile.setter
+    def localhost_profile(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "localhost_profile", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def type(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        type indicates which kind of seccomp profile will be applied.
+        Valid options are:
+
+        Localhost - a profile defined in a file on the node should be used.
+        RuntimeDefault - the container runtime default profile should be used.
+        Unconfined - no profile should be applied.
+        """
+        return pulumi.get(self, "type")
+
+    @type.setter
+    def type(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "type", value)
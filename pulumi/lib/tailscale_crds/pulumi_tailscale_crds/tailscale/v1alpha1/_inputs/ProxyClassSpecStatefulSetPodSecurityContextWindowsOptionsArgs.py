@@ -0,0 +1,143 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgsDict', 'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgs']
+
+class ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgsDict(TypedDict):
+    """
+    The Windows specific settings applied to all containers.
+    If unspecified, the options within a container's SecurityContext will be used.
+    If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
+    Note that this field cannot be set when spec.os.name is linux.
+    """
+    gmsa_credential_spec: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    GMSACredentialSpec is where the GMSA admission webhook
+    (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
+    GMSA credential spec named by the GMSACredentialSpecName field.
+    """
+    gmsa_credential_spec_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    GMSACredentialSpecName is the name of the GMSA credential spec to use.
+    """
+    host_process: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    HostProcess determines if a container should be run as a 'Host Process' container.
+    All of a Pod's containers must have the same effective HostProcess value
+    (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
+    In addition, if HostProcess is true then HostNetwork must also be set to true.
+    """
+    run_as_user_name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    The UserName in Windows to run the entrypoint of the container process.
+    Defaults to the user specified in image metadata if unspecified.
+    May also be set in PodSecurityContext. If set in both SecurityContext and
+    PodSecurityContext, the value specified in SecurityContext takes precedence.
+    """
+
+
+@pulumi.input_type
+class ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgs:
+    def __init__(__self__, *,
+                 gmsa_credential_spec: pulumi.Input[Optional[_builtins.str]] = None,
+                 gmsa_credential_spec_name: pulumi.Input[Optional[_builtins.str]] = None,
+                 host_process: pulumi.Input[Optional[_builtins.bool]] = None,
+                 run_as_user_name: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        The Windows specific settings applied to all containers.
+        If unspecified, the options within a container's SecurityContext will be used.
+        If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
+        Note that this field cannot be set when spec.os.name is linux.
+
+        :param pulumi.Input[_builtins.str] gmsa_credential_spec: GMSACredentialSpec is where the GMSA admission webhook
+               (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
+               GMSA credential spec named by the GMSACredentialSpecName field.
+        :param pulumi.Input[_builtins.str] gmsa_credential_spec_name: GMSACredentialSpecName is the name of the GMSA credential spec to use.
+        :param pulumi.Input[_builtins.bool] host_process: HostProcess determines if a container should be run as a 'Host Process' container.
+               All of a Pod's containers must have the same effective HostProcess value
+               (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
+               In addition, if HostProcess is true then HostNetwork must also be set to true.
+        :param pulumi.Input[_builtins.str] run_as_user_name: The UserName in Windows to run the entrypoint of the container process.
+               Defaults to the user specified in image metadata if unspecified.
+               May also be set in PodSecurityContext. If set in both SecurityContext and
+               PodSecurityContext, the value specified in SecurityContext takes precedence.
+        """
+        if gmsa_credential_spec is not None:
+            pulumi.set(__self__, "gmsa_credential_spec", gmsa_credential_spec)
+        if gmsa_credential_spec_name is not None:
+            pulumi.set(__self__, "gmsa_credential_spec_name", gmsa_credential_spec_name)
+        if host_process is not None:
+            pulumi.set(__self__, "host_process", host_process)
+        if run_as_user_name is not None:
+            pulumi.set(__self__, "run_as_user_name", run_as_user_name)
+
+    @_builtins.property
+    @pulumi.getter(name="gmsaCredentialSpec")
+    def gmsa_credential_spec(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        GMSACredentialSpec is where the GMSA admission webhook
+        (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
+        GMSA credential spec named by the GMSACredentialSpecName field.
+        """
+        return pulumi.get(self, "gmsa_credential_spec")
+
+    @gmsa_credential_spec.setter
+    def gmsa_credential_spec(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "gmsa_credential_spec", value)
+
+    @_builtins.property
+    @pulumi.getter(name="gmsaCredentialSpecName")
+    def gmsa_credential_spec_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        GMSACredentialSpecName is the name of the GMSA credential spec to use.
+        """
+        return pulumi.get(self, "gmsa_credential_spec_name")
+
+    @gmsa_credential_spec_name.setter
+    def gmsa_credential_spec_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "gmsa_credential_spec_name", value)
+
+    @_builtins.property
+    @pulumi.getter(name="hostProcess")
+    def host_process(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        HostProcess determines if a container should be run as a 'Host Process' container.
+        All of a Pod's containers must have the same effective HostProcess value
+        (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
+        In addition, if HostProcess is true then HostNetwork must also be set to true.
+        """
+        return pulumi.get(self, "host_process")
+
+    @host_process.setter
+    def host_process(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "host_process", value)
+
+    @_builtins.property
+    @pulumi.getter(name="runAsUserName")
+    def run_as_user_name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        The UserName in Windows to run the entrypoint of the container process.
+        Defaults to the user specified in image metadata if unspecified.
+        May also be set in PodSecurityContext. If set in both SecurityContext and
+        PodSecurityContext, the value specified in SecurityContext takes precedence.
+        """
+        return pulumi.get(self, "run_as_user_name")
+
+    @run_as_user_name.setter
+    def run_as_user_name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "run_as_user_name", value)
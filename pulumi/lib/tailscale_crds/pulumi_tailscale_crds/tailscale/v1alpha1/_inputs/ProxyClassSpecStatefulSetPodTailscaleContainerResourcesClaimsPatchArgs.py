@@ -0,0 +1,85 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgsDict', 'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgs']
+
+class ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgsDict(TypedDict):
+    """
+    ResourceClaim references one entry in PodSpec.ResourceClaims.
+    """
+    name: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Name must match the name of one entry in pod.spec.resourceClaims of
+    the Pod where this field is used. It makes that resource available
+    inside a container.
+    """
+    request: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Request is the name chosen for a request in the referenced claim.
+    If empty, everything from the claim is made available, otherwise
+    only the result of this request.
+    """
+
+
+@pulumi.input_type
+class ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgs:
+    def __init__(__self__, *,
+                 name: pulumi.Input[Optional[_builtins.str]] = None,
+                 request: pulumi.Input[Optional[_builtins.str]] = None):
+        """
+        ResourceClaim references one entry in PodSpec.ResourceClaims.
+
+        :param pulumi.Input[_builtins.str] name: Name must match the name of one entry in pod.spec.resourceClaims of
+               the Pod where this field is used. It makes that resource available
+               inside a container.
+        :param pulumi.Input[_builtins.str] request: Request is the name chosen for a request in the referenced claim.
+               If empty, everything from the claim is made available, otherwise
+               only the result of this request.
+        """
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if request is not None:
+            pulumi.set(__self__, "request", request)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Name must match the name of one entry in pod.spec.resourceClaims of
+        the Pod where this field is used. It makes that resource available
+        inside a container.
+        """
+        return pulumi.get(self, "name")
+
+    @name.setter
+    def name(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "name", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def request(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Request is the name chosen for a request in the referenced claim.
+        If empty, everything from the claim is made available, otherwise
+        only the result of this request.
+        """
+        return pulumi.get(self, "request")
+
+    @request.setter
+    def request(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "request", value)
@@ -0,0 +1,336 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgsDict', 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgs']
+
+class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgsDict(TypedDict):
+    """
+    Container security context.
+    Security context specified here will override the security context set by the operator.
+    By default the operator sets the Tailscale container and the Tailscale init container to privileged
+    for proxies created for Tailscale ingress and egress Service, Connector and ProxyGroup.
+    You can reduce the permissions of the Tailscale container to cap NET_ADMIN by
+    installing device plugin in your cluster and configuring the proxies tun device to be created
+    by the device plugin, see  https://github.com/tailscale/tailscale/issues/10814#issuecomment-2479977752
+    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context
+    """
+    allow_privilege_escalation: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    AllowPrivilegeEscalation controls whether a process can gain more
+    privileges than its parent process. This bool directly controls if
+    the no_new_privs flag will be set on the container process.
+    AllowPrivilegeEscalation is true always when the container is:
+    1) run as Privileged
+    2) has CAP_SYS_ADMIN
+    Note that this field cannot be set when spec.os.name is windows.
+    """
+    app_armor_profile: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgs']]]
+    capabilities: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgs']]]
+    privileged: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Run container in privileged mode.
+    Processes in privileged containers are essentially equivalent to root on the host.
+    Defaults to false.
+    Note that this field cannot be set when spec.os.name is windows.
+    """
+    proc_mount: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    procMount denotes the type of proc mount to use for the containers.
+    The default value is Default which uses the container runtime defaults for
+    readonly paths and masked paths.
+    This requires the ProcMountType feature flag to be enabled.
+    Note that this field cannot be set when spec.os.name is windows.
+    """
+    read_only_root_filesystem: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Whether this container has a read-only root filesystem.
+    Default is false.
+    Note that this field cannot be set when spec.os.name is windows.
+    """
+    run_as_group: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    The GID to run the entrypoint of the container process.
+    Uses runtime default if unset.
+    May also be set in PodSecurityContext.  If set in both SecurityContext and
+    PodSecurityContext, the value specified in SecurityContext takes precedence.
+    Note that this field cannot be set when spec.os.name is windows.
+    """
+    run_as_non_root: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    Indicates that the container must run as a non-root user.
+    If true, the Kubelet will validate the image at runtime to ensure that it
+    does not run as UID 0 (root) and fail to start the container if it does.
+    If unset or false, no such validation will be performed.
+    May also be set in PodSecurityContext.  If set in both SecurityContext and
+    PodSecurityContext, the value specified in SecurityContext takes precedence.
+    """
+    run_as_user: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    The UID to run the entrypoint of the container process.
+    Defaults to user specified in image metadata if unspecified.
+    May also be set in PodSecurityContext.  If set in both SecurityContext and
+    PodSecurityContext, the value specified in SecurityContext takes precedence.
+    Note that this field cannot be set when spec.os.name is windows.
+    """
+    se_linux_options: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgs']]]
+    seccomp_profile: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgs']]]
+    windows_options: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgs']]]
+
+
+@pulumi.input_type
+class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgs:
+    def __init__(__self__, *,
+                 allow_privilege_escalation: pulumi.Input[Optional[_builtins.bool]] = None,
+                 app_armor_profile: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgs']] = None,
+                 capabilities: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgs']] = None,
+                 privileged: pulumi.Input[Optional[_builtins.bool]] = None,
+                 proc_mount: pulumi.Input[Optional[_builtins.str]] = None,
+                 read_only_root_filesystem: pulumi.Input[Optional[_builtins.bool]] = None,
+                 run_as_group: pulumi.Input[Optional[_builtins.int]] = None,
+                 run_as_non_root: pulumi.Input[Optional[_builtins.bool]] = None,
+                 run_as_user: pulumi.Input[Optional[_builtins.int]] = None,
+                 se_linux_options: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgs']] = None,
+                 seccomp_profile: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgs']] = None,
+                 windows_options: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgs']] = None):
+        """
+        Container security context.
+        Security context specified here will override the security context set by the operator.
+        By default the operator sets the Tailscale container and the Tailscale init container to privileged
+        for proxies created for Tailscale ingress and egress Service, Connector and ProxyGroup.
+        You can reduce the permissions of the Tailscale container to cap NET_ADMIN by
+        installing device plugin in your cluster and configuring the proxies tun device to be created
+        by the device plugin, see  https://github.com/tailscale/tailscale/issues/10814#issuecomment-2479977752
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context
+
+        :param pulumi.Input[_builtins.bool] allow_privilege_escalation: AllowPrivilegeEscalation controls whether a process can gain more
+               privileges than its parent process. This bool directly controls if
+               the no_new_privs flag will be set on the container process.
+               AllowPrivilegeEscalation is true always when the container is:
+               1) run as Privileged
+               2) has CAP_SYS_ADMIN
+               Note that this field cannot be set when spec.os.name is windows.
+        :param pulumi.Input[_builtins.bool] privileged: Run container in privileged mode.
+               Processes in privileged containers are essentially equivalent to root on the host.
+               Defaults to false.
+               Note that this field cannot be set when spec.os.name is windows.
+        :param pulumi.Input[_builtins.str] proc_mount: procMount denotes the type of proc mount to use for the containers.
+               The default value is Default which uses the container runtime defaults for
+               readonly paths and masked paths.
+               This requires the ProcMountType feature flag to be enabled.
+               Note that this field cannot be set when spec.os.name is windows.
+        :param pulumi.Input[_builtins.bool] read_only_root_filesystem: Whether this container has a read-only root filesystem.
+               Default is false.
+               Note that this field cannot be set when spec.os.name is windows.
+        :param pulumi.Input[_builtins.int] run_as_group: The GID to run the entrypoint of the container process.
+               Uses runtime default if unset.
+               May also be set in PodSecurityContext.  If set in both SecurityContext and
+               PodSecurityContext, the value specified in SecurityContext takes precedence.
+               Note that this field cannot be set when spec.os.name is windows.
+        :param pulumi.Input[_builtins.bool] run_as_non_root: Indicates that the container must run as a non-root user.
+               If true, the Kubelet will validate the image at runtime to ensure that it
+               does not run as UID 0 (root) and fail to start the container if it does.
+               If unset or false, no such validation will be performed.
+               May also be set in PodSecurityContext.  If set in both SecurityContext and
+               PodSecurityContext, the value specified in SecurityContext takes precedence.
+        :param pulumi.Input[_builtins.int] run_as_user: The UID to run the entrypoint of the container process.
+               Defaults to user specified in image metadata if unspecified.
+               May also be set in PodSecurityContext.  If set in both SecurityContext and
+               PodSecurityContext, the value specified in SecurityContext takes precedence.
+               Note that this field cannot be set when spec.os.name is windows.
+        """
+        if allow_privilege_escalation is not None:
+            pulumi.set(__self__, "allow_privilege_escalation", allow_privilege_escalation)
+        if app_armor_profile is not None:
+            pulumi.set(__self__, "app_armor_profile", app_armor_profile)
+        if capabilities is not None:
+            pulumi.set(__self__, "capabilities", capabilities)
+        if privileged is not None:
+            pulumi.set(__self__, "privileged", privileged)
+        if proc_mount is not None:
+            pulumi.set(__self__, "proc_mount", proc_mount)
+        if read_only_root_filesystem is not None:
+            pulumi.set(__self__, "read_only_root_filesystem", read_only_root_filesystem)
+        if run_as_group is not None:
+            pulumi.set(__self__, "run_as_group", run_as_group)
+        if run_as_non_root is not None:
+            pulumi.set(__self__, "run_as_non_root", run_as_non_root)
+        if run_as_user is not None:
+            pulumi.set(__self__, "run_as_user", run_as_user)
+        if se_linux_options is not None:
+            pulumi.set(__self__, "se_linux_options", se_linux_options)
+        if seccomp_profile is not None:
+            pulumi.set(__self__, "seccomp_profile", seccomp_profile)
+        if windows_options is not None:
+            pulumi.set(__self__, "windows_options", windows_options)
+
+    @_builtins.property
+    @pulumi.getter(name="allowPrivilegeEscalation")
+    def allow_privilege_escalation(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        AllowPrivilegeEscalation controls whether a process can gain more
+        privileges than its parent process. This bool directly controls if
+        the no_new_privs flag will be set on the container process.
+        AllowPrivilegeEscalation is true always when the container is:
+        1) run as Privileged
+        2) has CAP_SYS_ADMIN
+        Note that this field cannot be set when spec.os.name is windows.
+        """
+        return pulumi.get(self, "allow_privilege_escalation")
+
+    @allow_privilege_escalation.setter
+    def allow_privilege_escalation(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "allow_privilege_escalation", value)
+
+    @_builtins.property
+    @pulumi.getter(name="appArmorProfile")
+    def app_armor_profile(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgs']]:
+        return pulumi.get(self, "app_armor_profile")
+
+    @app_armor_profile.setter
+    def app_armor_profile(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgs']]):
+        pulumi.set(self, "app_armor_profile", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def capabilities(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgs']]:
+        return pulumi.get(self, "capabilities")
+
+    @capabilities.setter
+    def capabilities(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgs']]):
+        pulumi.set(self, "capabilities", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def privileged(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Run container in privileged mode.
+        Processes in privileged containers are essentially equivalent to root on the host.
+        Defaults to false.
+        Note that this field cannot be set when spec.os.name is windows.
+        """
+        return pulumi.get(self, "privileged")
+
+    @privileged.setter
+    def privileged(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "privileged", value)
+
+    @_builtins.property
+    @pulumi.getter(name="procMount")
+    def proc_mount(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        procMount denotes the type of proc mount to use for the containers.
+        The default value is Default which uses the container runtime defaults for
+        readonly paths and masked paths.
+        This requires the ProcMountType feature flag to be enabled.
+        Note that this field cannot be set when spec.os.name is windows.
+        """
+        return pulumi.get(self, "proc_mount")
+
+    @proc_mount.setter
+    def proc_mount(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "proc_mount", value)
+
+    @_builtins.property
+    @pulumi.getter(name="readOnlyRootFilesystem")
+    def read_only_root_filesystem(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Whether this container has a read-only root filesystem.
+        Default is false.
+        Note that this field cannot be set when spec.os.name is windows.
+        """
+        return pulumi.get(self, "read_only_root_filesystem")
+
+    @read_only_root_filesystem.setter
+    def read_only_root_filesystem(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "read_only_root_filesystem", value)
+
+    @_builtins.property
+    @pulumi.getter(name="runAsGroup")
+    def run_as_group(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        The GID to run the entrypoint of the container process.
+        Uses runtime default if unset.
+        May also be set in PodSecurityContext.  If set in both SecurityContext and
+        PodSecurityContext, the value specified in SecurityContext takes precedence.
+        Note that this field cannot be set when spec.os.name is windows.
+        """
+        return pulumi.get(self, "run_as_group")
+
+    @run_as_group.setter
+    def run_as_group(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "run_as_group", value)
+
+    @_builtins.property
+    @pulumi.getter(name="runAsNonRoot")
+    def run_as_non_root(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        Indicates that the container must run as a non-root user.
+        If true, the Kubelet will validate the image at runtime to ensure that it
+        does not run as UID 0 (root) and fail to start the container if it does.
+        If unset or false, no such validation will be performed.
+        May also be set in PodSecurityContext.  If set in both SecurityContext and
+        PodSecurityContext, the value specified in SecurityContext takes precedence.
+        """
+        return pulumi.get(self, "run_as_non_root")
+
+    @run_as_non_root.setter
+    def run_as_non_root(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "run_as_non_root", value)
+
+    @_builtins.property
+    @pulumi.getter(name="runAsUser")
+    def run_as_user(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        The UID to run the entrypoint of the container process.
+        Defaults to user specified in image metadata if unspecified.
+        May also be set in PodSecurityContext.  If set in both SecurityContext and
+        PodSecurityContext, the value specified in SecurityContext takes precedence.
+        Note that this field cannot be set when spec.os.name is windows.
+        """
+        return pulumi.get(self, "run_as_user")
+
+    @run_as_user.setter
+    def run_as_user(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "run_as_user", value)
+
+    @_builtins.property
+    @pulumi.getter(name="seLinuxOptions")
+    def se_linux_options(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgs']]:
+        return pulumi.get(self, "se_linux_options")
+
+    @se_linux_options.setter
+    def se_linux_options(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgs']]):
+        pulumi.set(self, "se_linux_options", value)
+
+    @_builtins.property
+    @pulumi.getter(name="seccompProfile")
+    def seccomp_profile(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgs']]:
+        return pulumi.get(self, "seccomp_profile")
+
+    @seccomp_profile.setter
+    def seccomp_profile(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgs']]):
+        pulumi.set(self, "seccomp_profile", value)
+
+    @_builtins.property
+    @pulumi.getter(name="windowsOptions")
+    def windows_options(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgs']]:
+        return pulumi.get(self, "windows_options")
+
+    @windows_options.setter
+    def windows_options(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgs']]):
+        pulumi.set(self, "windows_options", value)
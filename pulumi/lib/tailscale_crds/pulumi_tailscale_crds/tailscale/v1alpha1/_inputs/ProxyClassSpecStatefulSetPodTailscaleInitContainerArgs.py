@@ -0,0 +1,200 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecStatefulSetPodTailscaleInitContainerArgsDict', 'ProxyClassSpecStatefulSetPodTailscaleInitContainerArgs']
+
+class ProxyClassSpecStatefulSetPodTailscaleInitContainerArgsDict(TypedDict):
+    """
+    Configuration for the proxy init container that enables forwarding.
+    Not valid to apply to ProxyGroups of type "kube-apiserver".
+    """
+    debug: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgs']]]
+    env: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs']]]]]
+    """
+    List of environment variables to set in the container.
+    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
+    Note that environment variables provided here will take precedence
+    over Tailscale-specific environment variables set by the operator,
+    however running proxies with custom values for Tailscale environment
+    variables (i.e TS_USERSPACE) is not recommended and might break in
+    the future.
+    """
+    image: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Container image name. By default images are pulled from docker.io/tailscale,
+    but the official images are also available at ghcr.io/tailscale.
+
+    For all uses except on ProxyGroups of type "kube-apiserver", this image must
+    be either tailscale/tailscale, or an equivalent mirror of that image.
+    To apply to ProxyGroups of type "kube-apiserver", this image must be
+    tailscale/k8s-proxy or a mirror of that image.
+
+    For "tailscale/tailscale"-based proxies, specifying image name here will
+    override any proxy image values specified via the Kubernetes operator's
+    Helm chart values or PROXY_IMAGE env var in the operator Deployment.
+    For "tailscale/k8s-proxy"-based proxies, there is currently no way to
+    configure your own default, and this field is the only way to use a
+    custom image.
+
+    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
+    """
+    image_pull_policy: NotRequired[pulumi.Input[Optional[_builtins.str]]]
+    """
+    Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
+    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
+    """
+    resources: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgs']]]
+    security_context: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgs']]]
+
+
+@pulumi.input_type
+class ProxyClassSpecStatefulSetPodTailscaleInitContainerArgs:
+    def __init__(__self__, *,
+                 debug: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgs']] = None,
+                 env: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs']]]] = None,
+                 image: pulumi.Input[Optional[_builtins.str]] = None,
+                 image_pull_policy: pulumi.Input[Optional[_builtins.str]] = None,
+                 resources: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgs']] = None,
+                 security_context: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgs']] = None):
+        """
+        Configuration for the proxy init container that enables forwarding.
+        Not valid to apply to ProxyGroups of type "kube-apiserver".
+
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs']]] env: List of environment variables to set in the container.
+               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
+               Note that environment variables provided here will take precedence
+               over Tailscale-specific environment variables set by the operator,
+               however running proxies with custom values for Tailscale environment
+               variables (i.e TS_USERSPACE) is not recommended and might break in
+               the future.
+        :param pulumi.Input[_builtins.str] image: Container image name. By default images are pulled from docker.io/tailscale,
+               but the official images are also available at ghcr.io/tailscale.
+
+               For all uses except on ProxyGroups of type "kube-apiserver", this image must
+               be either tailscale/tailscale, or an equivalent mirror of that image.
+               To apply to ProxyGroups of type "kube-apiserver", this image must be
+               tailscale/k8s-proxy or a mirror of that image.
+
+               For "tailscale/tailscale"-based proxies, specifying image name here will
+               override any proxy image values specified via the Kubernetes operator's
+               Helm chart values or PROXY_IMAGE env var in the operator Deployment.
+               For "tailscale/k8s-proxy"-based proxies, there is currently no way to
+               configure your own default, and this field is the only way to use a
+               custom image.
+
+               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
+        :param pulumi.Input[_builtins.str] image_pull_policy: Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
+               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
+        """
+        if debug is not None:
+            pulumi.set(__self__, "debug", debug)
+        if env is not None:
+            pulumi.set(__self__, "env", env)
+        if image is not None:
+            pulumi.set(__self__, "image", image)
+        if image_pull_policy is not None:
+            pulumi.set(__self__, "image_pull_policy", image_pull_policy)
+        if resources is not None:
+            pulumi.set(__self__, "resources", resources)
+        if security_context is not None:
+            pulumi.set(__self__, "security_context", security_context)
+
+    @_builtins.property
+    @pulumi.getter
+    def debug(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgs']]:
+        return pulumi.get(self, "debug")
+
+    @debug.setter
+    def debug(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgs']]):
+        pulumi.set(self, "debug", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def env(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs']]]]:
+        """
+        List of environment variables to set in the container.
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
+        Note that environment variables provided here will take precedence
+        over Tailscale-specific environment variables set by the operator,
+        however running proxies with custom values for Tailscale environment
+        variables (i.e TS_USERSPACE) is not recommended and might break in
+        the future.
+        """
+        return pulumi.get(self, "env")
+
+    @env.setter
+    def env(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs']]]]):
+        pulumi.set(self, "env", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def image(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Container image name. By default images are pulled from docker.io/tailscale,
+        but the official images are also available at ghcr.io/tailscale.
+
+        For all uses except on ProxyGroups of type "kube-apiserver", this image must
+        be either tailscale/tailscale, or an equivalent mirror of that image.
+        To apply to ProxyGroups of type "kube-apiserver", this image must be
+        tailscale/k8s-proxy or a mirror of that image.
+
+        For "tailscale/tailscale"-based proxies, specifying image name here will
+        override any proxy image values specified via the Kubernetes operator's
+        Helm chart values or PROXY_IMAGE env var in the operator Deployment.
+        For "tailscale/k8s-proxy"-based proxies, there is currently no way to
+        configure your own default, and this field is the only way to use a
+        custom image.
+
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
+        """
+        return pulumi.get(self, "image")
+
+    @image.setter
+    def image(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "image", value)
+
+    @_builtins.property
+    @pulumi.getter(name="imagePullPolicy")
+    def image_pull_policy(self) -> pulumi.Input[Optional[_builtins.str]]:
+        """
+        Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
+        """
+        return pulumi.get(self, "image_pull_policy")
+
+    @image_pull_policy.setter
+    def image_pull_policy(self, value: pulumi.Input[Optional[_builtins.str]]):
+        pulumi.set(self, "image_pull_policy", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def resources(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgs']]:
+        return pulumi.get(self, "resources")
+
+    @resources.setter
+    def resources(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgs']]):
+        pulumi.set(self, "resources", value)
+
+    @_builtins.property
+    @pulumi.getter(name="securityContext")
+    def security_context(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgs']]:
+        return pulumi.get(self, "security_context")
+
+    @security_context.setter
+    def security_context(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgs']]):
+        pulumi.set(self, "security_context", value)
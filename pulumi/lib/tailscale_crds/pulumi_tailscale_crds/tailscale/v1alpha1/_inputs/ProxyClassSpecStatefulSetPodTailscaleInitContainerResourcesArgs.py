@@ -0,0 +1,133 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgsDict', 'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgs']
+
+class ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgsDict(TypedDict):
+    """
+    Container resource requirements.
+    By default Tailscale Kubernetes operator does not apply any resource
+    requirements. The amount of resources required wil depend on the
+    amount of resources the operator needs to parse, usage patterns and
+    cluster size.
+    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#resources
+    """
+    claims: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs']]]]]
+    """
+    Claims lists the names of resources, defined in spec.resourceClaims,
+    that are used by this container.
+
+    This field depends on the
+    DynamicResourceAllocation feature gate.
+
+    This field is immutable. It can only be set for containers.
+    """
+    limits: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]]
+    """
+    Limits describes the maximum amount of compute resources allowed.
+    More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
+    """
+    requests: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]]
+    """
+    Requests describes the minimum amount of compute resources required.
+    If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
+    otherwise to an implementation-defined value. Requests cannot exceed Limits.
+    More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
+    """
+
+
+@pulumi.input_type
+class ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgs:
+    def __init__(__self__, *,
+                 claims: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs']]]] = None,
+                 limits: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]] = None,
+                 requests: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]] = None):
+        """
+        Container resource requirements.
+        By default Tailscale Kubernetes operator does not apply any resource
+        requirements. The amount of resources required wil depend on the
+        amount of resources the operator needs to parse, usage patterns and
+        cluster size.
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#resources
+
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs']]] claims: Claims lists the names of resources, defined in spec.resourceClaims,
+               that are used by this container.
+
+               This field depends on the
+               DynamicResourceAllocation feature gate.
+
+               This field is immutable. It can only be set for containers.
+        :param pulumi.Input[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]] limits: Limits describes the maximum amount of compute resources allowed.
+               More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
+        :param pulumi.Input[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]] requests: Requests describes the minimum amount of compute resources required.
+               If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
+               otherwise to an implementation-defined value. Requests cannot exceed Limits.
+               More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
+        """
+        if claims is not None:
+            pulumi.set(__self__, "claims", claims)
+        if limits is not None:
+            pulumi.set(__self__, "limits", limits)
+        if requests is not None:
+            pulumi.set(__self__, "requests", requests)
+
+    @_builtins.property
+    @pulumi.getter
+    def claims(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs']]]]:
+        """
+        Claims lists the names of resources, defined in spec.resourceClaims,
+        that are used by this container.
+
+        This field depends on the
+        DynamicResourceAllocation feature gate.
+
+        This field is immutable. It can only be set for containers.
+        """
+        return pulumi.get(self, "claims")
+
+    @claims.setter
+    def claims(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs']]]]):
+        pulumi.set(self, "claims", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def limits(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]:
+        """
+        Limits describes the maximum amount of compute resources allowed.
+        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
+        """
+        return pulumi.get(self, "limits")
+
+    @limits.setter
+    def limits(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]):
+        pulumi.set(self, "limits", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def requests(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]:
+        """
+        Requests describes the minimum amount of compute resources required.
+        If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
+        otherwise to an implementation-defined value. Requests cannot exceed Limits.
+        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
+        """
+        return pulumi.get(self, "requests")
+
+    @requests.setter
+    def requests(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[Union[_builtins.int, _builtins.str]]]]]):
+        pulumi.set(self, "requests", value)
@@ -0,0 +1,88 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecStaticEndpointsNodePortArgsDict', 'ProxyClassSpecStaticEndpointsNodePortArgs']
+
+class ProxyClassSpecStaticEndpointsNodePortArgsDict(TypedDict):
+    """
+    The configuration for static endpoints using NodePort Services.
+    """
+    ports: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStaticEndpointsNodePortPortsArgs']]]]]
+    """
+    The port ranges from which the operator will select NodePorts for the Services.
+    You must ensure that firewall rules allow UDP ingress traffic for these ports
+    to the node's external IPs.
+    The ports must be in the range of service node ports for the cluster (default `30000-32767`).
+    See https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport.
+    """
+    selector: NotRequired[pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]]
+    """
+    A selector which will be used to select the node's that will have their `ExternalIP`'s advertised
+    by the ProxyGroup as Static Endpoints.
+    """
+
+
+@pulumi.input_type
+class ProxyClassSpecStaticEndpointsNodePortArgs:
+    def __init__(__self__, *,
+                 ports: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStaticEndpointsNodePortPortsArgs']]]] = None,
+                 selector: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]] = None):
+        """
+        The configuration for static endpoints using NodePort Services.
+
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ProxyClassSpecStaticEndpointsNodePortPortsArgs']]] ports: The port ranges from which the operator will select NodePorts for the Services.
+               You must ensure that firewall rules allow UDP ingress traffic for these ports
+               to the node's external IPs.
+               The ports must be in the range of service node ports for the cluster (default `30000-32767`).
+               See https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport.
+        :param pulumi.Input[Mapping[str, pulumi.Input[_builtins.str]]] selector: A selector which will be used to select the node's that will have their `ExternalIP`'s advertised
+               by the ProxyGroup as Static Endpoints.
+        """
+        if ports is not None:
+            pulumi.set(__self__, "ports", ports)
+        if selector is not None:
+            pulumi.set(__self__, "selector", selector)
+
+    @_builtins.property
+    @pulumi.getter
+    def ports(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStaticEndpointsNodePortPortsArgs']]]]:
+        """
+        The port ranges from which the operator will select NodePorts for the Services.
+        You must ensure that firewall rules allow UDP ingress traffic for these ports
+        to the node's external IPs.
+        The ports must be in the range of service node ports for the cluster (default `30000-32767`).
+        See https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport.
+        """
+        return pulumi.get(self, "ports")
+
+    @ports.setter
+    def ports(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassSpecStaticEndpointsNodePortPortsArgs']]]]):
+        pulumi.set(self, "ports", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def selector(self) -> pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]:
+        """
+        A selector which will be used to select the node's that will have their `ExternalIP`'s advertised
+        by the ProxyGroup as Static Endpoints.
+        """
+        return pulumi.get(self, "selector")
+
+    @selector.setter
+    def selector(self, value: pulumi.Input[Optional[Mapping[str, pulumi.Input[_builtins.str]]]]):
+        pulumi.set(self, "selector", value)
@@ -0,0 +1,74 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecStaticEndpointsNodePortPortsArgsDict', 'ProxyClassSpecStaticEndpointsNodePortPortsArgs']
+
+class ProxyClassSpecStaticEndpointsNodePortPortsArgsDict(TypedDict):
+    end_port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    endPort indicates that the range of ports from port to endPort if set, inclusive,
+    should be used. This field cannot be defined if the port field is not defined.
+    The endPort must be either unset, or equal or greater than port.
+    """
+    port: NotRequired[pulumi.Input[Optional[_builtins.int]]]
+    """
+    port represents a port selected to be used. This is a required field.
+    """
+
+
+@pulumi.input_type
+class ProxyClassSpecStaticEndpointsNodePortPortsArgs:
+    def __init__(__self__, *,
+                 end_port: pulumi.Input[Optional[_builtins.int]] = None,
+                 port: pulumi.Input[Optional[_builtins.int]] = None):
+        """
+        :param pulumi.Input[_builtins.int] end_port: endPort indicates that the range of ports from port to endPort if set, inclusive,
+               should be used. This field cannot be defined if the port field is not defined.
+               The endPort must be either unset, or equal or greater than port.
+        :param pulumi.Input[_builtins.int] port: port represents a port selected to be used. This is a required field.
+        """
+        if end_port is not None:
+            pulumi.set(__self__, "end_port", end_port)
+        if port is not None:
+            pulumi.set(__self__, "port", port)
+
+    @_builtins.property
+    @pulumi.getter(name="endPort")
+    def end_port(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        endPort indicates that the range of ports from port to endPort if set, inclusive,
+        should be used. This field cannot be defined if the port field is not defined.
+        The endPort must be either unset, or equal or greater than port.
+        """
+        return pulumi.get(self, "end_port")
+
+    @end_port.setter
+    def end_port(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "end_port", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def port(self) -> pulumi.Input[Optional[_builtins.int]]:
+        """
+        port represents a port selected to be used. This is a required field.
+        """
+        return pulumi.get(self, "port")
+
+    @port.setter
+    def port(self, value: pulumi.Input[Optional[_builtins.int]]):
+        pulumi.set(self, "port", value)
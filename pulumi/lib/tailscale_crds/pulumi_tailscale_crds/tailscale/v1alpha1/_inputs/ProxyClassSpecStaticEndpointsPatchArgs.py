@@ -0,0 +1,49 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecStaticEndpointsPatchArgsDict', 'ProxyClassSpecStaticEndpointsPatchArgs']
+
+class ProxyClassSpecStaticEndpointsPatchArgsDict(TypedDict):
+    """
+    Configuration for 'static endpoints' on proxies in order to facilitate
+    direct connections from other devices on the tailnet.
+    See https://tailscale.com/kb/1445/kubernetes-operator-customization#static-endpoints.
+    """
+    node_port: NotRequired[pulumi.Input[Optional['_inputs.ProxyClassSpecStaticEndpointsNodePortPatchArgs']]]
+
+
+@pulumi.input_type
+class ProxyClassSpecStaticEndpointsPatchArgs:
+    def __init__(__self__, *,
+                 node_port: pulumi.Input[Optional['_inputs.ProxyClassSpecStaticEndpointsNodePortPatchArgs']] = None):
+        """
+        Configuration for 'static endpoints' on proxies in order to facilitate
+        direct connections from other devices on the tailnet.
+        See https://tailscale.com/kb/1445/kubernetes-operator-customization#static-endpoints.
+        """
+        if node_port is not None:
+            pulumi.set(__self__, "node_port", node_port)
+
+    @_builtins.property
+    @pulumi.getter(name="nodePort")
+    def node_port(self) -> pulumi.Input[Optional['_inputs.ProxyClassSpecStaticEndpointsNodePortPatchArgs']]:
+        return pulumi.get(self, "node_port")
+
+    @node_port.setter
+    def node_port(self, value: pulumi.Input[Optional['_inputs.ProxyClassSpecStaticEndpointsNodePortPatchArgs']]):
+        pulumi.set(self, "node_port", value)
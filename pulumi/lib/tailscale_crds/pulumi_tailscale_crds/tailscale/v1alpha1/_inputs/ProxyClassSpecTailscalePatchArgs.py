@@ -0,0 +1,70 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassSpecTailscalePatchArgsDict', 'ProxyClassSpecTailscalePatchArgs']
+
+class ProxyClassSpecTailscalePatchArgsDict(TypedDict):
+    """
+    TailscaleConfig contains options to configure the tailscale-specific
+    parameters of proxies.
+    """
+    accept_routes: NotRequired[pulumi.Input[Optional[_builtins.bool]]]
+    """
+    AcceptRoutes can be set to true to make the proxy instance accept
+    routes advertized by other nodes on the tailnet, such as subnet
+    routes.
+    This is equivalent of passing --accept-routes flag to a tailscale Linux client.
+    https://tailscale.com/kb/1019/subnets#use-your-subnet-routes-from-other-devices
+    Defaults to false.
+    """
+
+
+@pulumi.input_type
+class ProxyClassSpecTailscalePatchArgs:
+    def __init__(__self__, *,
+                 accept_routes: pulumi.Input[Optional[_builtins.bool]] = None):
+        """
+        TailscaleConfig contains options to configure the tailscale-specific
+        parameters of proxies.
+
+        :param pulumi.Input[_builtins.bool] accept_routes: AcceptRoutes can be set to true to make the proxy instance accept
+               routes advertized by other nodes on the tailnet, such as subnet
+               routes.
+               This is equivalent of passing --accept-routes flag to a tailscale Linux client.
+               https://tailscale.com/kb/1019/subnets#use-your-subnet-routes-from-other-devices
+               Defaults to false.
+        """
+        if accept_routes is not None:
+            pulumi.set(__self__, "accept_routes", accept_routes)
+
+    @_builtins.property
+    @pulumi.getter(name="acceptRoutes")
+    def accept_routes(self) -> pulumi.Input[Optional[_builtins.bool]]:
+        """
+        AcceptRoutes can be set to true to make the proxy instance accept
+        routes advertized by other nodes on the tailnet, such as subnet
+        routes.
+        This is equivalent of passing --accept-routes flag to a tailscale Linux client.
+        https://tailscale.com/kb/1019/subnets#use-your-subnet-routes-from-other-devices
+        Defaults to false.
+        """
+        return pulumi.get(self, "accept_routes")
+
+    @accept_routes.setter
+    def accept_routes(self, value: pulumi.Input[Optional[_builtins.bool]]):
+        pulumi.set(self, "accept_routes", value)
@@ -0,0 +1,58 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .... import meta as _meta
+from .. import _inputs
+
+__all__ = ['ProxyClassStatusArgsDict', 'ProxyClassStatusArgs']
+
+class ProxyClassStatusArgsDict(TypedDict):
+    """
+    Status of the ProxyClass. This is set and managed automatically.
+    https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
+    """
+    conditions: NotRequired[pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassStatusConditionsArgs']]]]]
+    """
+    List of status conditions to indicate the status of the ProxyClass.
+    Known condition types are `ProxyClassReady`.
+    """
+
+
+@pulumi.input_type
+class ProxyClassStatusArgs:
+    def __init__(__self__, *,
+                 conditions: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassStatusConditionsArgs']]]] = None):
+        """
+        Status of the ProxyClass. This is set and managed automatically.
+        https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
+
+        :param pulumi.Input[Sequence[pulumi.Input['_inputs.ProxyClassStatusConditionsArgs']]] conditions: List of status conditions to indicate the status of the ProxyClass.
+               Known condition types are `ProxyClassReady`.
+        """
+        if conditions is not None:
+            pulumi.set(__self__, "conditions", conditions)
+
+    @_builtins.property
+    @pulumi.getter
+    def conditions(self) -> pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassStatusConditionsArgs']]]]:
+        """
+        List of status conditions to indicate the status of the ProxyClass.
+        Known condition types are `ProxyClassReady`.
+        """
+        return pulumi.get(self, "conditions")
+
+    @conditions.setter
+    def conditions(self, value: pulumi.Input[Optional[Sequence[pulumi.Input['_inputs.ProxyClassStatusConditionsArgs']]]]):
+        pulumi.set(self, "conditions", value)
@@ -0,0 +1,822 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import importlib
+import typing
+
+__all__ = [
+    'ProxyClassSpecMetricsPatchArgsDict',
+    'ProxyClassSpecMetricsPatchArgs',
+    'ProxyClassSpecMetricsServiceMonitorPatchArgsDict',
+    'ProxyClassSpecMetricsServiceMonitorPatchArgs',
+    'ProxyClassSpecMetricsServiceMonitorArgsDict',
+    'ProxyClassSpecMetricsServiceMonitorArgs',
+    'ProxyClassSpecMetricsArgsDict',
+    'ProxyClassSpecMetricsArgs',
+    'ProxyClassSpecPatchArgsDict',
+    'ProxyClassSpecPatchArgs',
+    'ProxyClassSpecStatefulSetPatchArgsDict',
+    'ProxyClassSpecStatefulSetPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityArgs',
+    'ProxyClassSpecStatefulSetPodAffinityArgsDict',
+    'ProxyClassSpecStatefulSetPodAffinityArgs',
+    'ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodDnsConfigOptionsArgsDict',
+    'ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs',
+    'ProxyClassSpecStatefulSetPodDnsConfigPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodDnsConfigPatchArgs',
+    'ProxyClassSpecStatefulSetPodDnsConfigArgsDict',
+    'ProxyClassSpecStatefulSetPodDnsConfigArgs',
+    'ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgs',
+    'ProxyClassSpecStatefulSetPodImagePullSecretsArgsDict',
+    'ProxyClassSpecStatefulSetPodImagePullSecretsArgs',
+    'ProxyClassSpecStatefulSetPodPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextArgsDict',
+    'ProxyClassSpecStatefulSetPodSecurityContextArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfileArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfileArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfileArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfileArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerArgsDict',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerArgs',
+    'ProxyClassSpecStatefulSetPodTolerationsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTolerationsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTolerationsArgsDict',
+    'ProxyClassSpecStatefulSetPodTolerationsArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgsDict',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorArgsDict',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgsDict',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgsDict',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs',
+    'ProxyClassSpecStatefulSetPodArgsDict',
+    'ProxyClassSpecStatefulSetPodArgs',
+    'ProxyClassSpecStatefulSetArgsDict',
+    'ProxyClassSpecStatefulSetArgs',
+    'ProxyClassSpecStaticEndpointsNodePortPatchArgsDict',
+    'ProxyClassSpecStaticEndpointsNodePortPatchArgs',
+    'ProxyClassSpecStaticEndpointsNodePortPortsPatchArgsDict',
+    'ProxyClassSpecStaticEndpointsNodePortPortsPatchArgs',
+    'ProxyClassSpecStaticEndpointsNodePortPortsArgsDict',
+    'ProxyClassSpecStaticEndpointsNodePortPortsArgs',
+    'ProxyClassSpecStaticEndpointsNodePortArgsDict',
+    'ProxyClassSpecStaticEndpointsNodePortArgs',
+    'ProxyClassSpecStaticEndpointsPatchArgsDict',
+    'ProxyClassSpecStaticEndpointsPatchArgs',
+    'ProxyClassSpecStaticEndpointsArgsDict',
+    'ProxyClassSpecStaticEndpointsArgs',
+    'ProxyClassSpecTailscalePatchArgsDict',
+    'ProxyClassSpecTailscalePatchArgs',
+    'ProxyClassSpecTailscaleArgsDict',
+    'ProxyClassSpecTailscaleArgs',
+    'ProxyClassSpecArgsDict',
+    'ProxyClassSpecArgs',
+    'ProxyClassStatusConditionsArgsDict',
+    'ProxyClassStatusConditionsArgs',
+    'ProxyClassStatusArgsDict',
+    'ProxyClassStatusArgs',
+    'ProxyClassArgsDict',
+    'ProxyClassArgs',
+]
+
+_TYPE_MODULES = {
+    'ProxyClassSpecMetricsPatchArgsDict': 'ProxyClassSpecMetricsPatchArgs',
+    'ProxyClassSpecMetricsPatchArgs': 'ProxyClassSpecMetricsPatchArgs',
+    'ProxyClassSpecMetricsServiceMonitorPatchArgsDict': 'ProxyClassSpecMetricsServiceMonitorPatchArgs',
+    'ProxyClassSpecMetricsServiceMonitorPatchArgs': 'ProxyClassSpecMetricsServiceMonitorPatchArgs',
+    'ProxyClassSpecMetricsServiceMonitorArgsDict': 'ProxyClassSpecMetricsServiceMonitorArgs',
+    'ProxyClassSpecMetricsServiceMonitorArgs': 'ProxyClassSpecMetricsServiceMonitorArgs',
+    'ProxyClassSpecMetricsArgsDict': 'ProxyClassSpecMetricsArgs',
+    'ProxyClassSpecMetricsArgs': 'ProxyClassSpecMetricsArgs',
+    'ProxyClassSpecPatchArgsDict': 'ProxyClassSpecPatchArgs',
+    'ProxyClassSpecPatchArgs': 'ProxyClassSpecPatchArgs',
+    'ProxyClassSpecStatefulSetPatchArgsDict': 'ProxyClassSpecStatefulSetPatchArgs',
+    'ProxyClassSpecStatefulSetPatchArgs': 'ProxyClassSpecStatefulSetPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgsDict': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgsDict': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgsDict': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgsDict': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgsDict': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgsDict': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityArgsDict': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityArgs',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityArgs': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityArgsDict': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityArgs',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityArgs': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityArgs',
+    'ProxyClassSpecStatefulSetPodAffinityArgsDict': 'ProxyClassSpecStatefulSetPodAffinityArgs',
+    'ProxyClassSpecStatefulSetPodAffinityArgs': 'ProxyClassSpecStatefulSetPodAffinityArgs',
+    'ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgsDict': 'ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgs': 'ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodDnsConfigOptionsArgsDict': 'ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs',
+    'ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs': 'ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs',
+    'ProxyClassSpecStatefulSetPodDnsConfigPatchArgsDict': 'ProxyClassSpecStatefulSetPodDnsConfigPatchArgs',
+    'ProxyClassSpecStatefulSetPodDnsConfigPatchArgs': 'ProxyClassSpecStatefulSetPodDnsConfigPatchArgs',
+    'ProxyClassSpecStatefulSetPodDnsConfigArgsDict': 'ProxyClassSpecStatefulSetPodDnsConfigArgs',
+    'ProxyClassSpecStatefulSetPodDnsConfigArgs': 'ProxyClassSpecStatefulSetPodDnsConfigArgs',
+    'ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgsDict': 'ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgs',
+    'ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgs': 'ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgs',
+    'ProxyClassSpecStatefulSetPodImagePullSecretsArgsDict': 'ProxyClassSpecStatefulSetPodImagePullSecretsArgs',
+    'ProxyClassSpecStatefulSetPodImagePullSecretsArgs': 'ProxyClassSpecStatefulSetPodImagePullSecretsArgs',
+    'ProxyClassSpecStatefulSetPodPatchArgsDict': 'ProxyClassSpecStatefulSetPodPatchArgs',
+    'ProxyClassSpecStatefulSetPodPatchArgs': 'ProxyClassSpecStatefulSetPodPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgsDict': 'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgs': 'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgsDict': 'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgs': 'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextPatchArgsDict': 'ProxyClassSpecStatefulSetPodSecurityContextPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextPatchArgs': 'ProxyClassSpecStatefulSetPodSecurityContextPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgsDict': 'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgs': 'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgsDict': 'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgs': 'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgsDict': 'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgs': 'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgsDict': 'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgs': 'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgsDict': 'ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs': 'ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgsDict': 'ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgs': 'ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgsDict': 'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgs': 'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgsDict': 'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgs': 'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextArgsDict': 'ProxyClassSpecStatefulSetPodSecurityContextArgs',
+    'ProxyClassSpecStatefulSetPodSecurityContextArgs': 'ProxyClassSpecStatefulSetPodSecurityContextArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerDebugArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerDebugArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerPatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerPatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleContainerArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerArgs': 'ProxyClassSpecStatefulSetPodTailscaleContainerArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerPatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerPatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfileArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfileArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfileArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfileArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfileArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfileArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfileArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfileArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatchArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatchArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerArgsDict': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerArgs',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerArgs': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerArgs',
+    'ProxyClassSpecStatefulSetPodTolerationsPatchArgsDict': 'ProxyClassSpecStatefulSetPodTolerationsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTolerationsPatchArgs': 'ProxyClassSpecStatefulSetPodTolerationsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTolerationsArgsDict': 'ProxyClassSpecStatefulSetPodTolerationsArgs',
+    'ProxyClassSpecStatefulSetPodTolerationsArgs': 'ProxyClassSpecStatefulSetPodTolerationsArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgsDict': 'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs': 'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgsDict': 'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs': 'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatchArgsDict': 'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatchArgs': 'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatchArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorArgsDict': 'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorArgs': 'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgsDict': 'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgs': 'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgsDict': 'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs': 'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs',
+    'ProxyClassSpecStatefulSetPodArgsDict': 'ProxyClassSpecStatefulSetPodArgs',
+    'ProxyClassSpecStatefulSetPodArgs': 'ProxyClassSpecStatefulSetPodArgs',
+    'ProxyClassSpecStatefulSetArgsDict': 'ProxyClassSpecStatefulSetArgs',
+    'ProxyClassSpecStatefulSetArgs': 'ProxyClassSpecStatefulSetArgs',
+    'ProxyClassSpecStaticEndpointsNodePortPatchArgsDict': 'ProxyClassSpecStaticEndpointsNodePortPatchArgs',
+    'ProxyClassSpecStaticEndpointsNodePortPatchArgs': 'ProxyClassSpecStaticEndpointsNodePortPatchArgs',
+    'ProxyClassSpecStaticEndpointsNodePortPortsPatchArgsDict': 'ProxyClassSpecStaticEndpointsNodePortPortsPatchArgs',
+    'ProxyClassSpecStaticEndpointsNodePortPortsPatchArgs': 'ProxyClassSpecStaticEndpointsNodePortPortsPatchArgs',
+    'ProxyClassSpecStaticEndpointsNodePortPortsArgsDict': 'ProxyClassSpecStaticEndpointsNodePortPortsArgs',
+    'ProxyClassSpecStaticEndpointsNodePortPortsArgs': 'ProxyClassSpecStaticEndpointsNodePortPortsArgs',
+    'ProxyClassSpecStaticEndpointsNodePortArgsDict': 'ProxyClassSpecStaticEndpointsNodePortArgs',
+    'ProxyClassSpecStaticEndpointsNodePortArgs': 'ProxyClassSpecStaticEndpointsNodePortArgs',
+    'ProxyClassSpecStaticEndpointsPatchArgsDict': 'ProxyClassSpecStaticEndpointsPatchArgs',
+    'ProxyClassSpecStaticEndpointsPatchArgs': 'ProxyClassSpecStaticEndpointsPatchArgs',
+    'ProxyClassSpecStaticEndpointsArgsDict': 'ProxyClassSpecStaticEndpointsArgs',
+    'ProxyClassSpecStaticEndpointsArgs': 'ProxyClassSpecStaticEndpointsArgs',
+    'ProxyClassSpecTailscalePatchArgsDict': 'ProxyClassSpecTailscalePatchArgs',
+    'ProxyClassSpecTailscalePatchArgs': 'ProxyClassSpecTailscalePatchArgs',
+    'ProxyClassSpecTailscaleArgsDict': 'ProxyClassSpecTailscaleArgs',
+    'ProxyClassSpecTailscaleArgs': 'ProxyClassSpecTailscaleArgs',
+    'ProxyClassSpecArgsDict': 'ProxyClassSpecArgs',
+    'ProxyClassSpecArgs': 'ProxyClassSpecArgs',
+    'ProxyClassStatusConditionsArgsDict': 'ProxyClassStatusConditionsArgs',
+    'ProxyClassStatusConditionsArgs': 'ProxyClassStatusConditionsArgs',
+    'ProxyClassStatusArgsDict': 'ProxyClassStatusArgs',
+    'ProxyClassStatusArgs': 'ProxyClassStatusArgs',
+    'ProxyClassArgsDict': 'ProxyClassArgs',
+    'ProxyClassArgs': 'ProxyClassArgs',
+}
+
+if typing.TYPE_CHECKING:
+    from .ProxyClassSpecMetricsPatchArgs import *
+    from .ProxyClassSpecMetricsServiceMonitorPatchArgs import *
+    from .ProxyClassSpecMetricsServiceMonitorArgs import *
+    from .ProxyClassSpecMetricsArgs import *
+    from .ProxyClassSpecPatchArgs import *
+    from .ProxyClassSpecStatefulSetPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityArgs import *
+    from .ProxyClassSpecStatefulSetPodAffinityArgs import *
+    from .ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs import *
+    from .ProxyClassSpecStatefulSetPodDnsConfigPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodDnsConfigArgs import *
+    from .ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodImagePullSecretsArgs import *
+    from .ProxyClassSpecStatefulSetPodPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatchArgs import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfileArgs import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsArgs import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatchArgs import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextSeccompProfileArgs import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgs import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsArgs import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerDebugArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerResourcesArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfileArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfileArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfileArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfileArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextArgs import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerArgs import *
+    from .ProxyClassSpecStatefulSetPodTolerationsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTolerationsArgs import *
+    from .ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs import *
+    from .ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorArgs import *
+    from .ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgs import *
+    from .ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs import *
+    from .ProxyClassSpecStatefulSetPodArgs import *
+    from .ProxyClassSpecStatefulSetArgs import *
+    from .ProxyClassSpecStaticEndpointsNodePortPatchArgs import *
+    from .ProxyClassSpecStaticEndpointsNodePortPortsPatchArgs import *
+    from .ProxyClassSpecStaticEndpointsNodePortPortsArgs import *
+    from .ProxyClassSpecStaticEndpointsNodePortArgs import *
+    from .ProxyClassSpecStaticEndpointsPatchArgs import *
+    from .ProxyClassSpecStaticEndpointsArgs import *
+    from .ProxyClassSpecTailscalePatchArgs import *
+    from .ProxyClassSpecTailscaleArgs import *
+    from .ProxyClassSpecArgs import *
+    from .ProxyClassStatusConditionsArgs import *
+    from .ProxyClassStatusArgs import *
+    from .ProxyClassArgs import *
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _TYPE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,13313 +0,0 @@
-# coding=utf-8
-# *** WARNING: this file was generated by crd2pulumi. ***
-# *** Do not edit by hand unless you're certain you know what you are doing! ***
-
-import builtins as _builtins
-import warnings
-import sys
-import pulumi
-import pulumi.runtime
-from typing import Any, Mapping, Optional, Sequence, Union, overload
-if sys.version_info >= (3, 11):
-    from typing import NotRequired, TypedDict, TypeAlias
-else:
-    from typing_extensions import NotRequired, TypedDict, TypeAlias
-from ... import _utilities
-from . import outputs
-from ... import meta as _meta
-
-__all__ = [
-    'ProxyClass',
-    'ProxyClassSpec',
-    'ProxyClassSpecMetrics',
-    'ProxyClassSpecMetricsPatch',
-    'ProxyClassSpecMetricsServiceMonitor',
-    'ProxyClassSpecMetricsServiceMonitorPatch',
-    'ProxyClassSpecPatch',
-    'ProxyClassSpecStatefulSet',
-    'ProxyClassSpecStatefulSetPatch',
-    'ProxyClassSpecStatefulSetPod',
-    'ProxyClassSpecStatefulSetPodAffinity',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinity',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatch',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecution',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressions',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatch',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFields',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatch',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressions',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatch',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFields',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatch',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch',
-    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinity',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinity',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch',
-    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
-    'ProxyClassSpecStatefulSetPodDnsConfig',
-    'ProxyClassSpecStatefulSetPodDnsConfigOptions',
-    'ProxyClassSpecStatefulSetPodDnsConfigOptionsPatch',
-    'ProxyClassSpecStatefulSetPodDnsConfigPatch',
-    'ProxyClassSpecStatefulSetPodImagePullSecrets',
-    'ProxyClassSpecStatefulSetPodImagePullSecretsPatch',
-    'ProxyClassSpecStatefulSetPodPatch',
-    'ProxyClassSpecStatefulSetPodSecurityContext',
-    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfile',
-    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatch',
-    'ProxyClassSpecStatefulSetPodSecurityContextPatch',
-    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptions',
-    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatch',
-    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfile',
-    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatch',
-    'ProxyClassSpecStatefulSetPodSecurityContextSysctls',
-    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatch',
-    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptions',
-    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatch',
-    'ProxyClassSpecStatefulSetPodTailscaleContainer',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerDebug',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatch',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerEnv',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatch',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerPatch',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerResources',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaims',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatch',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatch',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContext',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfile',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatch',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilities',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatch',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatch',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptions',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatch',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfile',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatch',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptions',
-    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatch',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainer',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebug',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatch',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnv',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatch',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerPatch',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResources',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaims',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatch',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatch',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContext',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfile',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatch',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilities',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatch',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatch',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptions',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatch',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfile',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatch',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptions',
-    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatch',
-    'ProxyClassSpecStatefulSetPodTolerations',
-    'ProxyClassSpecStatefulSetPodTolerationsPatch',
-    'ProxyClassSpecStatefulSetPodTopologySpreadConstraints',
-    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelector',
-    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressions',
-    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatch',
-    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatch',
-    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatch',
-    'ProxyClassSpecStaticEndpoints',
-    'ProxyClassSpecStaticEndpointsNodePort',
-    'ProxyClassSpecStaticEndpointsNodePortPatch',
-    'ProxyClassSpecStaticEndpointsNodePortPorts',
-    'ProxyClassSpecStaticEndpointsNodePortPortsPatch',
-    'ProxyClassSpecStaticEndpointsPatch',
-    'ProxyClassSpecTailscale',
-    'ProxyClassSpecTailscalePatch',
-    'ProxyClassStatus',
-    'ProxyClassStatusConditions',
-    'ProxyClassStatusConditionsPatch',
-    'ProxyClassStatusPatch',
-]
-
-@pulumi.output_type
-class ProxyClass(dict):
-    """
-    ProxyClass describes a set of configuration parameters that can be applied to
-    proxy resources created by the Tailscale Kubernetes operator.
-    To apply a given ProxyClass to resources created for a tailscale Ingress or
-    Service, use tailscale.com/proxy-class=<proxyclass-name> label. To apply a
-    given ProxyClass to resources created for a Connector, use
-    connector.spec.proxyClass field.
-    ProxyClass is a cluster scoped resource.
-    More info:
-    https://tailscale.com/kb/1445/kubernetes-operator-customization#cluster-resource-customization-using-proxyclass-custom-resource
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "apiVersion":
-            suggest = "api_version"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClass. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClass.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClass.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 api_version: Optional[_builtins.str] = None,
-                 kind: Optional[_builtins.str] = None,
-                 metadata: Optional['_meta.v1.outputs.ObjectMeta'] = None,
-                 spec: Optional['outputs.ProxyClassSpec'] = None,
-                 status: Optional['outputs.ProxyClassStatus'] = None):
-        """
-        ProxyClass describes a set of configuration parameters that can be applied to
-        proxy resources created by the Tailscale Kubernetes operator.
-        To apply a given ProxyClass to resources created for a tailscale Ingress or
-        Service, use tailscale.com/proxy-class=<proxyclass-name> label. To apply a
-        given ProxyClass to resources created for a Connector, use
-        connector.spec.proxyClass field.
-        ProxyClass is a cluster scoped resource.
-        More info:
-        https://tailscale.com/kb/1445/kubernetes-operator-customization#cluster-resource-customization-using-proxyclass-custom-resource
-
-        :param _builtins.str api_version: APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        :param _builtins.str kind: Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        :param '_meta.v1.ObjectMetaArgs' metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        if api_version is not None:
-            pulumi.set(__self__, "api_version", 'tailscale.com/v1alpha1')
-        if kind is not None:
-            pulumi.set(__self__, "kind", 'ProxyClass')
-        if metadata is not None:
-            pulumi.set(__self__, "metadata", metadata)
-        if spec is not None:
-            pulumi.set(__self__, "spec", spec)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-
-    @_builtins.property
-    @pulumi.getter(name="apiVersion")
-    def api_version(self) -> Optional[_builtins.str]:
-        """
-        APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
-        """
-        return pulumi.get(self, "api_version")
-
-    @_builtins.property
-    @pulumi.getter
-    def kind(self) -> Optional[_builtins.str]:
-        """
-        Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
-        """
-        return pulumi.get(self, "kind")
-
-    @_builtins.property
-    @pulumi.getter
-    def metadata(self) -> Optional['_meta.v1.outputs.ObjectMeta']:
-        """
-        Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
-        """
-        return pulumi.get(self, "metadata")
-
-    @_builtins.property
-    @pulumi.getter
-    def spec(self) -> Optional['outputs.ProxyClassSpec']:
-        return pulumi.get(self, "spec")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional['outputs.ProxyClassStatus']:
-        return pulumi.get(self, "status")
-
-
-@pulumi.output_type
-class ProxyClassSpec(dict):
-    """
-    Specification of the desired state of the ProxyClass resource.
-    https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "statefulSet":
-            suggest = "stateful_set"
-        elif key == "staticEndpoints":
-            suggest = "static_endpoints"
-        elif key == "useLetsEncryptStagingEnvironment":
-            suggest = "use_lets_encrypt_staging_environment"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpec. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpec.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpec.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 metrics: Optional['outputs.ProxyClassSpecMetrics'] = None,
-                 stateful_set: Optional['outputs.ProxyClassSpecStatefulSet'] = None,
-                 static_endpoints: Optional['outputs.ProxyClassSpecStaticEndpoints'] = None,
-                 tailscale: Optional['outputs.ProxyClassSpecTailscale'] = None,
-                 use_lets_encrypt_staging_environment: Optional[_builtins.bool] = None):
-        """
-        Specification of the desired state of the ProxyClass resource.
-        https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param _builtins.bool use_lets_encrypt_staging_environment: Set UseLetsEncryptStagingEnvironment to true to issue TLS
-               certificates for any HTTPS endpoints exposed to the tailnet from
-               LetsEncrypt's staging environment.
-               https://letsencrypt.org/docs/staging-environment/
-               This setting only affects Tailscale Ingress resources.
-               By default Ingress TLS certificates are issued from LetsEncrypt's
-               production environment.
-               Changing this setting true -> false, will result in any
-               existing certs being re-issued from the production environment.
-               Changing this setting false (default) -> true, when certs have already
-               been provisioned from production environment will NOT result in certs
-               being re-issued from the staging environment before they need to be
-               renewed.
-        """
-        if metrics is not None:
-            pulumi.set(__self__, "metrics", metrics)
-        if stateful_set is not None:
-            pulumi.set(__self__, "stateful_set", stateful_set)
-        if static_endpoints is not None:
-            pulumi.set(__self__, "static_endpoints", static_endpoints)
-        if tailscale is not None:
-            pulumi.set(__self__, "tailscale", tailscale)
-        if use_lets_encrypt_staging_environment is not None:
-            pulumi.set(__self__, "use_lets_encrypt_staging_environment", use_lets_encrypt_staging_environment)
-
-    @_builtins.property
-    @pulumi.getter
-    def metrics(self) -> Optional['outputs.ProxyClassSpecMetrics']:
-        return pulumi.get(self, "metrics")
-
-    @_builtins.property
-    @pulumi.getter(name="statefulSet")
-    def stateful_set(self) -> Optional['outputs.ProxyClassSpecStatefulSet']:
-        return pulumi.get(self, "stateful_set")
-
-    @_builtins.property
-    @pulumi.getter(name="staticEndpoints")
-    def static_endpoints(self) -> Optional['outputs.ProxyClassSpecStaticEndpoints']:
-        return pulumi.get(self, "static_endpoints")
-
-    @_builtins.property
-    @pulumi.getter
-    def tailscale(self) -> Optional['outputs.ProxyClassSpecTailscale']:
-        return pulumi.get(self, "tailscale")
-
-    @_builtins.property
-    @pulumi.getter(name="useLetsEncryptStagingEnvironment")
-    def use_lets_encrypt_staging_environment(self) -> Optional[_builtins.bool]:
-        """
-        Set UseLetsEncryptStagingEnvironment to true to issue TLS
-        certificates for any HTTPS endpoints exposed to the tailnet from
-        LetsEncrypt's staging environment.
-        https://letsencrypt.org/docs/staging-environment/
-        This setting only affects Tailscale Ingress resources.
-        By default Ingress TLS certificates are issued from LetsEncrypt's
-        production environment.
-        Changing this setting true -> false, will result in any
-        existing certs being re-issued from the production environment.
-        Changing this setting false (default) -> true, when certs have already
-        been provisioned from production environment will NOT result in certs
-        being re-issued from the staging environment before they need to be
-        renewed.
-        """
-        return pulumi.get(self, "use_lets_encrypt_staging_environment")
-
-
-@pulumi.output_type
-class ProxyClassSpecMetrics(dict):
-    """
-    Configuration for proxy metrics. Metrics are currently not supported
-    for egress proxies and for Ingress proxies that have been configured
-    with tailscale.com/experimental-forward-cluster-traffic-via-ingress
-    annotation. Note that the metrics are currently considered unstable
-    and will likely change in breaking ways in the future - we only
-    recommend that you use those for debugging purposes.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "serviceMonitor":
-            suggest = "service_monitor"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecMetrics. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecMetrics.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecMetrics.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 enable: Optional[_builtins.bool] = None,
-                 service_monitor: Optional['outputs.ProxyClassSpecMetricsServiceMonitor'] = None):
-        """
-        Configuration for proxy metrics. Metrics are currently not supported
-        for egress proxies and for Ingress proxies that have been configured
-        with tailscale.com/experimental-forward-cluster-traffic-via-ingress
-        annotation. Note that the metrics are currently considered unstable
-        and will likely change in breaking ways in the future - we only
-        recommend that you use those for debugging purposes.
-
-        :param _builtins.bool enable: Setting enable to true will make the proxy serve Tailscale metrics
-               at <pod-ip>:9002/metrics.
-               A metrics Service named <proxy-statefulset>-metrics will also be created in the operator's namespace and will
-               serve the metrics at <service-ip>:9002/metrics.
-
-               In 1.78.x and 1.80.x, this field also serves as the default value for
-               .spec.statefulSet.pod.tailscaleContainer.debug.enable. From 1.82.0, both
-               fields will independently default to false.
-
-               Defaults to false.
-        """
-        if enable is not None:
-            pulumi.set(__self__, "enable", enable)
-        if service_monitor is not None:
-            pulumi.set(__self__, "service_monitor", service_monitor)
-
-    @_builtins.property
-    @pulumi.getter
-    def enable(self) -> Optional[_builtins.bool]:
-        """
-        Setting enable to true will make the proxy serve Tailscale metrics
-        at <pod-ip>:9002/metrics.
-        A metrics Service named <proxy-statefulset>-metrics will also be created in the operator's namespace and will
-        serve the metrics at <service-ip>:9002/metrics.
-
-        In 1.78.x and 1.80.x, this field also serves as the default value for
-        .spec.statefulSet.pod.tailscaleContainer.debug.enable. From 1.82.0, both
-        fields will independently default to false.
-
-        Defaults to false.
-        """
-        return pulumi.get(self, "enable")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceMonitor")
-    def service_monitor(self) -> Optional['outputs.ProxyClassSpecMetricsServiceMonitor']:
-        return pulumi.get(self, "service_monitor")
-
-
-@pulumi.output_type
-class ProxyClassSpecMetricsPatch(dict):
-    """
-    Configuration for proxy metrics. Metrics are currently not supported
-    for egress proxies and for Ingress proxies that have been configured
-    with tailscale.com/experimental-forward-cluster-traffic-via-ingress
-    annotation. Note that the metrics are currently considered unstable
-    and will likely change in breaking ways in the future - we only
-    recommend that you use those for debugging purposes.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "serviceMonitor":
-            suggest = "service_monitor"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecMetricsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecMetricsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecMetricsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 enable: Optional[_builtins.bool] = None,
-                 service_monitor: Optional['outputs.ProxyClassSpecMetricsServiceMonitorPatch'] = None):
-        """
-        Configuration for proxy metrics. Metrics are currently not supported
-        for egress proxies and for Ingress proxies that have been configured
-        with tailscale.com/experimental-forward-cluster-traffic-via-ingress
-        annotation. Note that the metrics are currently considered unstable
-        and will likely change in breaking ways in the future - we only
-        recommend that you use those for debugging purposes.
-
-        :param _builtins.bool enable: Setting enable to true will make the proxy serve Tailscale metrics
-               at <pod-ip>:9002/metrics.
-               A metrics Service named <proxy-statefulset>-metrics will also be created in the operator's namespace and will
-               serve the metrics at <service-ip>:9002/metrics.
-
-               In 1.78.x and 1.80.x, this field also serves as the default value for
-               .spec.statefulSet.pod.tailscaleContainer.debug.enable. From 1.82.0, both
-               fields will independently default to false.
-
-               Defaults to false.
-        """
-        if enable is not None:
-            pulumi.set(__self__, "enable", enable)
-        if service_monitor is not None:
-            pulumi.set(__self__, "service_monitor", service_monitor)
-
-    @_builtins.property
-    @pulumi.getter
-    def enable(self) -> Optional[_builtins.bool]:
-        """
-        Setting enable to true will make the proxy serve Tailscale metrics
-        at <pod-ip>:9002/metrics.
-        A metrics Service named <proxy-statefulset>-metrics will also be created in the operator's namespace and will
-        serve the metrics at <service-ip>:9002/metrics.
-
-        In 1.78.x and 1.80.x, this field also serves as the default value for
-        .spec.statefulSet.pod.tailscaleContainer.debug.enable. From 1.82.0, both
-        fields will independently default to false.
-
-        Defaults to false.
-        """
-        return pulumi.get(self, "enable")
-
-    @_builtins.property
-    @pulumi.getter(name="serviceMonitor")
-    def service_monitor(self) -> Optional['outputs.ProxyClassSpecMetricsServiceMonitorPatch']:
-        return pulumi.get(self, "service_monitor")
-
-
-@pulumi.output_type
-class ProxyClassSpecMetricsServiceMonitor(dict):
-    """
-    Enable to create a Prometheus ServiceMonitor for scraping the proxy's Tailscale metrics.
-    The ServiceMonitor will select the metrics Service that gets created when metrics are enabled.
-    The ingested metrics for each Service monitor will have labels to identify the proxy:
-    ts_proxy_type: ingress_service|ingress_resource|connector|proxygroup
-    ts_proxy_parent_name: name of the parent resource (i.e name of the Connector, Tailscale Ingress, Tailscale Service or ProxyGroup)
-    ts_proxy_parent_namespace: namespace of the parent resource (if the parent resource is not cluster scoped)
-    job: ts_<proxy type>_[<parent namespace>]_<parent_name>
-    """
-    def __init__(__self__, *,
-                 enable: Optional[_builtins.bool] = None,
-                 labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        Enable to create a Prometheus ServiceMonitor for scraping the proxy's Tailscale metrics.
-        The ServiceMonitor will select the metrics Service that gets created when metrics are enabled.
-        The ingested metrics for each Service monitor will have labels to identify the proxy:
-        ts_proxy_type: ingress_service|ingress_resource|connector|proxygroup
-        ts_proxy_parent_name: name of the parent resource (i.e name of the Connector, Tailscale Ingress, Tailscale Service or ProxyGroup)
-        ts_proxy_parent_namespace: namespace of the parent resource (if the parent resource is not cluster scoped)
-        job: ts_<proxy type>_[<parent namespace>]_<parent_name>
-
-        :param _builtins.bool enable: If Enable is set to true, a Prometheus ServiceMonitor will be created. Enable can only be set to true if metrics are enabled.
-        :param Mapping[str, _builtins.str] labels: Labels to add to the ServiceMonitor.
-               Labels must be valid Kubernetes labels.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        if enable is not None:
-            pulumi.set(__self__, "enable", enable)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-
-    @_builtins.property
-    @pulumi.getter
-    def enable(self) -> Optional[_builtins.bool]:
-        """
-        If Enable is set to true, a Prometheus ServiceMonitor will be created. Enable can only be set to true if metrics are enabled.
-        """
-        return pulumi.get(self, "enable")
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        Labels to add to the ServiceMonitor.
-        Labels must be valid Kubernetes labels.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        return pulumi.get(self, "labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecMetricsServiceMonitorPatch(dict):
-    """
-    Enable to create a Prometheus ServiceMonitor for scraping the proxy's Tailscale metrics.
-    The ServiceMonitor will select the metrics Service that gets created when metrics are enabled.
-    The ingested metrics for each Service monitor will have labels to identify the proxy:
-    ts_proxy_type: ingress_service|ingress_resource|connector|proxygroup
-    ts_proxy_parent_name: name of the parent resource (i.e name of the Connector, Tailscale Ingress, Tailscale Service or ProxyGroup)
-    ts_proxy_parent_namespace: namespace of the parent resource (if the parent resource is not cluster scoped)
-    job: ts_<proxy type>_[<parent namespace>]_<parent_name>
-    """
-    def __init__(__self__, *,
-                 enable: Optional[_builtins.bool] = None,
-                 labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        Enable to create a Prometheus ServiceMonitor for scraping the proxy's Tailscale metrics.
-        The ServiceMonitor will select the metrics Service that gets created when metrics are enabled.
-        The ingested metrics for each Service monitor will have labels to identify the proxy:
-        ts_proxy_type: ingress_service|ingress_resource|connector|proxygroup
-        ts_proxy_parent_name: name of the parent resource (i.e name of the Connector, Tailscale Ingress, Tailscale Service or ProxyGroup)
-        ts_proxy_parent_namespace: namespace of the parent resource (if the parent resource is not cluster scoped)
-        job: ts_<proxy type>_[<parent namespace>]_<parent_name>
-
-        :param _builtins.bool enable: If Enable is set to true, a Prometheus ServiceMonitor will be created. Enable can only be set to true if metrics are enabled.
-        :param Mapping[str, _builtins.str] labels: Labels to add to the ServiceMonitor.
-               Labels must be valid Kubernetes labels.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        if enable is not None:
-            pulumi.set(__self__, "enable", enable)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-
-    @_builtins.property
-    @pulumi.getter
-    def enable(self) -> Optional[_builtins.bool]:
-        """
-        If Enable is set to true, a Prometheus ServiceMonitor will be created. Enable can only be set to true if metrics are enabled.
-        """
-        return pulumi.get(self, "enable")
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        Labels to add to the ServiceMonitor.
-        Labels must be valid Kubernetes labels.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        return pulumi.get(self, "labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecPatch(dict):
-    """
-    Specification of the desired state of the ProxyClass resource.
-    https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "statefulSet":
-            suggest = "stateful_set"
-        elif key == "staticEndpoints":
-            suggest = "static_endpoints"
-        elif key == "useLetsEncryptStagingEnvironment":
-            suggest = "use_lets_encrypt_staging_environment"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 metrics: Optional['outputs.ProxyClassSpecMetricsPatch'] = None,
-                 stateful_set: Optional['outputs.ProxyClassSpecStatefulSetPatch'] = None,
-                 static_endpoints: Optional['outputs.ProxyClassSpecStaticEndpointsPatch'] = None,
-                 tailscale: Optional['outputs.ProxyClassSpecTailscalePatch'] = None,
-                 use_lets_encrypt_staging_environment: Optional[_builtins.bool] = None):
-        """
-        Specification of the desired state of the ProxyClass resource.
-        https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param _builtins.bool use_lets_encrypt_staging_environment: Set UseLetsEncryptStagingEnvironment to true to issue TLS
-               certificates for any HTTPS endpoints exposed to the tailnet from
-               LetsEncrypt's staging environment.
-               https://letsencrypt.org/docs/staging-environment/
-               This setting only affects Tailscale Ingress resources.
-               By default Ingress TLS certificates are issued from LetsEncrypt's
-               production environment.
-               Changing this setting true -> false, will result in any
-               existing certs being re-issued from the production environment.
-               Changing this setting false (default) -> true, when certs have already
-               been provisioned from production environment will NOT result in certs
-               being re-issued from the staging environment before they need to be
-               renewed.
-        """
-        if metrics is not None:
-            pulumi.set(__self__, "metrics", metrics)
-        if stateful_set is not None:
-            pulumi.set(__self__, "stateful_set", stateful_set)
-        if static_endpoints is not None:
-            pulumi.set(__self__, "static_endpoints", static_endpoints)
-        if tailscale is not None:
-            pulumi.set(__self__, "tailscale", tailscale)
-        if use_lets_encrypt_staging_environment is not None:
-            pulumi.set(__self__, "use_lets_encrypt_staging_environment", use_lets_encrypt_staging_environment)
-
-    @_builtins.property
-    @pulumi.getter
-    def metrics(self) -> Optional['outputs.ProxyClassSpecMetricsPatch']:
-        return pulumi.get(self, "metrics")
-
-    @_builtins.property
-    @pulumi.getter(name="statefulSet")
-    def stateful_set(self) -> Optional['outputs.ProxyClassSpecStatefulSetPatch']:
-        return pulumi.get(self, "stateful_set")
-
-    @_builtins.property
-    @pulumi.getter(name="staticEndpoints")
-    def static_endpoints(self) -> Optional['outputs.ProxyClassSpecStaticEndpointsPatch']:
-        return pulumi.get(self, "static_endpoints")
-
-    @_builtins.property
-    @pulumi.getter
-    def tailscale(self) -> Optional['outputs.ProxyClassSpecTailscalePatch']:
-        return pulumi.get(self, "tailscale")
-
-    @_builtins.property
-    @pulumi.getter(name="useLetsEncryptStagingEnvironment")
-    def use_lets_encrypt_staging_environment(self) -> Optional[_builtins.bool]:
-        """
-        Set UseLetsEncryptStagingEnvironment to true to issue TLS
-        certificates for any HTTPS endpoints exposed to the tailnet from
-        LetsEncrypt's staging environment.
-        https://letsencrypt.org/docs/staging-environment/
-        This setting only affects Tailscale Ingress resources.
-        By default Ingress TLS certificates are issued from LetsEncrypt's
-        production environment.
-        Changing this setting true -> false, will result in any
-        existing certs being re-issued from the production environment.
-        Changing this setting false (default) -> true, when certs have already
-        been provisioned from production environment will NOT result in certs
-        being re-issued from the staging environment before they need to be
-        renewed.
-        """
-        return pulumi.get(self, "use_lets_encrypt_staging_environment")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSet(dict):
-    """
-    Configuration parameters for the proxy's StatefulSet. Tailscale
-    Kubernetes operator deploys a StatefulSet for each of the user
-    configured proxies (Tailscale Ingress, Tailscale Service, Connector).
-    """
-    def __init__(__self__, *,
-                 annotations: Optional[Mapping[str, _builtins.str]] = None,
-                 labels: Optional[Mapping[str, _builtins.str]] = None,
-                 pod: Optional['outputs.ProxyClassSpecStatefulSetPod'] = None):
-        """
-        Configuration parameters for the proxy's StatefulSet. Tailscale
-        Kubernetes operator deploys a StatefulSet for each of the user
-        configured proxies (Tailscale Ingress, Tailscale Service, Connector).
-
-        :param Mapping[str, _builtins.str] annotations: Annotations that will be added to the StatefulSet created for the proxy.
-               Any Annotations specified here will be merged with the default annotations
-               applied to the StatefulSet by the Tailscale Kubernetes operator as
-               well as any other annotations that might have been applied by other
-               actors.
-               Annotations must be valid Kubernetes annotations.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-        :param Mapping[str, _builtins.str] labels: Labels that will be added to the StatefulSet created for the proxy.
-               Any labels specified here will be merged with the default labels
-               applied to the StatefulSet by the Tailscale Kubernetes operator as
-               well as any other labels that might have been applied by other
-               actors.
-               Label keys and values must be valid Kubernetes label keys and values.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        if annotations is not None:
-            pulumi.set(__self__, "annotations", annotations)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-        if pod is not None:
-            pulumi.set(__self__, "pod", pod)
-
-    @_builtins.property
-    @pulumi.getter
-    def annotations(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        Annotations that will be added to the StatefulSet created for the proxy.
-        Any Annotations specified here will be merged with the default annotations
-        applied to the StatefulSet by the Tailscale Kubernetes operator as
-        well as any other annotations that might have been applied by other
-        actors.
-        Annotations must be valid Kubernetes annotations.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-        """
-        return pulumi.get(self, "annotations")
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        Labels that will be added to the StatefulSet created for the proxy.
-        Any labels specified here will be merged with the default labels
-        applied to the StatefulSet by the Tailscale Kubernetes operator as
-        well as any other labels that might have been applied by other
-        actors.
-        Label keys and values must be valid Kubernetes label keys and values.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        return pulumi.get(self, "labels")
-
-    @_builtins.property
-    @pulumi.getter
-    def pod(self) -> Optional['outputs.ProxyClassSpecStatefulSetPod']:
-        return pulumi.get(self, "pod")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPatch(dict):
-    """
-    Configuration parameters for the proxy's StatefulSet. Tailscale
-    Kubernetes operator deploys a StatefulSet for each of the user
-    configured proxies (Tailscale Ingress, Tailscale Service, Connector).
-    """
-    def __init__(__self__, *,
-                 annotations: Optional[Mapping[str, _builtins.str]] = None,
-                 labels: Optional[Mapping[str, _builtins.str]] = None,
-                 pod: Optional['outputs.ProxyClassSpecStatefulSetPodPatch'] = None):
-        """
-        Configuration parameters for the proxy's StatefulSet. Tailscale
-        Kubernetes operator deploys a StatefulSet for each of the user
-        configured proxies (Tailscale Ingress, Tailscale Service, Connector).
-
-        :param Mapping[str, _builtins.str] annotations: Annotations that will be added to the StatefulSet created for the proxy.
-               Any Annotations specified here will be merged with the default annotations
-               applied to the StatefulSet by the Tailscale Kubernetes operator as
-               well as any other annotations that might have been applied by other
-               actors.
-               Annotations must be valid Kubernetes annotations.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-        :param Mapping[str, _builtins.str] labels: Labels that will be added to the StatefulSet created for the proxy.
-               Any labels specified here will be merged with the default labels
-               applied to the StatefulSet by the Tailscale Kubernetes operator as
-               well as any other labels that might have been applied by other
-               actors.
-               Label keys and values must be valid Kubernetes label keys and values.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        if annotations is not None:
-            pulumi.set(__self__, "annotations", annotations)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-        if pod is not None:
-            pulumi.set(__self__, "pod", pod)
-
-    @_builtins.property
-    @pulumi.getter
-    def annotations(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        Annotations that will be added to the StatefulSet created for the proxy.
-        Any Annotations specified here will be merged with the default annotations
-        applied to the StatefulSet by the Tailscale Kubernetes operator as
-        well as any other annotations that might have been applied by other
-        actors.
-        Annotations must be valid Kubernetes annotations.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-        """
-        return pulumi.get(self, "annotations")
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        Labels that will be added to the StatefulSet created for the proxy.
-        Any labels specified here will be merged with the default labels
-        applied to the StatefulSet by the Tailscale Kubernetes operator as
-        well as any other labels that might have been applied by other
-        actors.
-        Label keys and values must be valid Kubernetes label keys and values.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        return pulumi.get(self, "labels")
-
-    @_builtins.property
-    @pulumi.getter
-    def pod(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodPatch']:
-        return pulumi.get(self, "pod")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPod(dict):
-    """
-    Configuration for the proxy Pod.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "dnsConfig":
-            suggest = "dns_config"
-        elif key == "dnsPolicy":
-            suggest = "dns_policy"
-        elif key == "imagePullSecrets":
-            suggest = "image_pull_secrets"
-        elif key == "nodeName":
-            suggest = "node_name"
-        elif key == "nodeSelector":
-            suggest = "node_selector"
-        elif key == "priorityClassName":
-            suggest = "priority_class_name"
-        elif key == "securityContext":
-            suggest = "security_context"
-        elif key == "tailscaleContainer":
-            suggest = "tailscale_container"
-        elif key == "tailscaleInitContainer":
-            suggest = "tailscale_init_container"
-        elif key == "topologySpreadConstraints":
-            suggest = "topology_spread_constraints"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPod. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPod.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPod.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 affinity: Optional['outputs.ProxyClassSpecStatefulSetPodAffinity'] = None,
-                 annotations: Optional[Mapping[str, _builtins.str]] = None,
-                 dns_config: Optional['outputs.ProxyClassSpecStatefulSetPodDnsConfig'] = None,
-                 dns_policy: Optional[_builtins.str] = None,
-                 image_pull_secrets: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodImagePullSecrets']] = None,
-                 labels: Optional[Mapping[str, _builtins.str]] = None,
-                 node_name: Optional[_builtins.str] = None,
-                 node_selector: Optional[Mapping[str, _builtins.str]] = None,
-                 priority_class_name: Optional[_builtins.str] = None,
-                 security_context: Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContext'] = None,
-                 tailscale_container: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainer'] = None,
-                 tailscale_init_container: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainer'] = None,
-                 tolerations: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTolerations']] = None,
-                 topology_spread_constraints: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraints']] = None):
-        """
-        Configuration for the proxy Pod.
-
-        :param Mapping[str, _builtins.str] annotations: Annotations that will be added to the proxy Pod.
-               Any annotations specified here will be merged with the default
-               annotations applied to the Pod by the Tailscale Kubernetes operator.
-               Annotations must be valid Kubernetes annotations.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-        :param _builtins.str dns_policy: DNSPolicy defines how DNS will be configured for the proxy Pod.
-               By default the Tailscale Kubernetes Operator does not set a DNS policy (uses cluster default).
-               https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-s-dns-policy
-        :param Sequence['ProxyClassSpecStatefulSetPodImagePullSecretsArgs'] image_pull_secrets: Proxy Pod's image pull Secrets.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#PodSpec
-        :param Mapping[str, _builtins.str] labels: Labels that will be added to the proxy Pod.
-               Any labels specified here will be merged with the default labels
-               applied to the Pod by the Tailscale Kubernetes operator.
-               Label keys and values must be valid Kubernetes label keys and values.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        :param _builtins.str node_name: Proxy Pod's node name.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        :param Mapping[str, _builtins.str] node_selector: Proxy Pod's node selector.
-               By default Tailscale Kubernetes operator does not apply any node
-               selector.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        :param _builtins.str priority_class_name: PriorityClassName for the proxy Pod.
-               By default Tailscale Kubernetes operator does not apply any priority class.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        :param Sequence['ProxyClassSpecStatefulSetPodTolerationsArgs'] tolerations: Proxy Pod's tolerations.
-               By default Tailscale Kubernetes operator does not apply any
-               tolerations.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        :param Sequence['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsArgs'] topology_spread_constraints: Proxy Pod's topology spread constraints.
-               By default Tailscale Kubernetes operator does not apply any topology spread constraints.
-               https://kubernetes.io/docs/concepts/scheduling-eviction/topology-spread-constraints/
-        """
-        if affinity is not None:
-            pulumi.set(__self__, "affinity", affinity)
-        if annotations is not None:
-            pulumi.set(__self__, "annotations", annotations)
-        if dns_config is not None:
-            pulumi.set(__self__, "dns_config", dns_config)
-        if dns_policy is not None:
-            pulumi.set(__self__, "dns_policy", dns_policy)
-        if image_pull_secrets is not None:
-            pulumi.set(__self__, "image_pull_secrets", image_pull_secrets)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-        if node_name is not None:
-            pulumi.set(__self__, "node_name", node_name)
-        if node_selector is not None:
-            pulumi.set(__self__, "node_selector", node_selector)
-        if priority_class_name is not None:
-            pulumi.set(__self__, "priority_class_name", priority_class_name)
-        if security_context is not None:
-            pulumi.set(__self__, "security_context", security_context)
-        if tailscale_container is not None:
-            pulumi.set(__self__, "tailscale_container", tailscale_container)
-        if tailscale_init_container is not None:
-            pulumi.set(__self__, "tailscale_init_container", tailscale_init_container)
-        if tolerations is not None:
-            pulumi.set(__self__, "tolerations", tolerations)
-        if topology_spread_constraints is not None:
-            pulumi.set(__self__, "topology_spread_constraints", topology_spread_constraints)
-
-    @_builtins.property
-    @pulumi.getter
-    def affinity(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinity']:
-        return pulumi.get(self, "affinity")
-
-    @_builtins.property
-    @pulumi.getter
-    def annotations(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        Annotations that will be added to the proxy Pod.
-        Any annotations specified here will be merged with the default
-        annotations applied to the Pod by the Tailscale Kubernetes operator.
-        Annotations must be valid Kubernetes annotations.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-        """
-        return pulumi.get(self, "annotations")
-
-    @_builtins.property
-    @pulumi.getter(name="dnsConfig")
-    def dns_config(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodDnsConfig']:
-        return pulumi.get(self, "dns_config")
-
-    @_builtins.property
-    @pulumi.getter(name="dnsPolicy")
-    def dns_policy(self) -> Optional[_builtins.str]:
-        """
-        DNSPolicy defines how DNS will be configured for the proxy Pod.
-        By default the Tailscale Kubernetes Operator does not set a DNS policy (uses cluster default).
-        https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-s-dns-policy
-        """
-        return pulumi.get(self, "dns_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="imagePullSecrets")
-    def image_pull_secrets(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodImagePullSecrets']]:
-        """
-        Proxy Pod's image pull Secrets.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#PodSpec
-        """
-        return pulumi.get(self, "image_pull_secrets")
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        Labels that will be added to the proxy Pod.
-        Any labels specified here will be merged with the default labels
-        applied to the Pod by the Tailscale Kubernetes operator.
-        Label keys and values must be valid Kubernetes label keys and values.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        return pulumi.get(self, "labels")
-
-    @_builtins.property
-    @pulumi.getter(name="nodeName")
-    def node_name(self) -> Optional[_builtins.str]:
-        """
-        Proxy Pod's node name.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        """
-        return pulumi.get(self, "node_name")
-
-    @_builtins.property
-    @pulumi.getter(name="nodeSelector")
-    def node_selector(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        Proxy Pod's node selector.
-        By default Tailscale Kubernetes operator does not apply any node
-        selector.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        """
-        return pulumi.get(self, "node_selector")
-
-    @_builtins.property
-    @pulumi.getter(name="priorityClassName")
-    def priority_class_name(self) -> Optional[_builtins.str]:
-        """
-        PriorityClassName for the proxy Pod.
-        By default Tailscale Kubernetes operator does not apply any priority class.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        """
-        return pulumi.get(self, "priority_class_name")
-
-    @_builtins.property
-    @pulumi.getter(name="securityContext")
-    def security_context(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContext']:
-        return pulumi.get(self, "security_context")
-
-    @_builtins.property
-    @pulumi.getter(name="tailscaleContainer")
-    def tailscale_container(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainer']:
-        return pulumi.get(self, "tailscale_container")
-
-    @_builtins.property
-    @pulumi.getter(name="tailscaleInitContainer")
-    def tailscale_init_container(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainer']:
-        return pulumi.get(self, "tailscale_init_container")
-
-    @_builtins.property
-    @pulumi.getter
-    def tolerations(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTolerations']]:
-        """
-        Proxy Pod's tolerations.
-        By default Tailscale Kubernetes operator does not apply any
-        tolerations.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        """
-        return pulumi.get(self, "tolerations")
-
-    @_builtins.property
-    @pulumi.getter(name="topologySpreadConstraints")
-    def topology_spread_constraints(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraints']]:
-        """
-        Proxy Pod's topology spread constraints.
-        By default Tailscale Kubernetes operator does not apply any topology spread constraints.
-        https://kubernetes.io/docs/concepts/scheduling-eviction/topology-spread-constraints/
-        """
-        return pulumi.get(self, "topology_spread_constraints")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinity(dict):
-    """
-    Proxy Pod's affinity rules.
-    By default, the Tailscale Kubernetes operator does not apply any affinity rules.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#affinity
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "nodeAffinity":
-            suggest = "node_affinity"
-        elif key == "podAffinity":
-            suggest = "pod_affinity"
-        elif key == "podAntiAffinity":
-            suggest = "pod_anti_affinity"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinity. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinity.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinity.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 node_affinity: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinity'] = None,
-                 pod_affinity: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinity'] = None,
-                 pod_anti_affinity: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinity'] = None):
-        """
-        Proxy Pod's affinity rules.
-        By default, the Tailscale Kubernetes operator does not apply any affinity rules.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#affinity
-        """
-        if node_affinity is not None:
-            pulumi.set(__self__, "node_affinity", node_affinity)
-        if pod_affinity is not None:
-            pulumi.set(__self__, "pod_affinity", pod_affinity)
-        if pod_anti_affinity is not None:
-            pulumi.set(__self__, "pod_anti_affinity", pod_anti_affinity)
-
-    @_builtins.property
-    @pulumi.getter(name="nodeAffinity")
-    def node_affinity(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinity']:
-        return pulumi.get(self, "node_affinity")
-
-    @_builtins.property
-    @pulumi.getter(name="podAffinity")
-    def pod_affinity(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinity']:
-        return pulumi.get(self, "pod_affinity")
-
-    @_builtins.property
-    @pulumi.getter(name="podAntiAffinity")
-    def pod_anti_affinity(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinity']:
-        return pulumi.get(self, "pod_anti_affinity")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinity(dict):
-    """
-    Describes node affinity scheduling rules for the pod.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "preferredDuringSchedulingIgnoredDuringExecution":
-            suggest = "preferred_during_scheduling_ignored_during_execution"
-        elif key == "requiredDuringSchedulingIgnoredDuringExecution":
-            suggest = "required_during_scheduling_ignored_during_execution"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityNodeAffinity. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityNodeAffinity.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityNodeAffinity.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 preferred_during_scheduling_ignored_during_execution: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecution']] = None,
-                 required_during_scheduling_ignored_during_execution: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution'] = None):
-        """
-        Describes node affinity scheduling rules for the pod.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs'] preferred_during_scheduling_ignored_during_execution: The scheduler will prefer to schedule pods to nodes that satisfy
-               the affinity expressions specified by this field, but it may choose
-               a node that violates one or more of the expressions. The node that is
-               most preferred is the one with the greatest sum of weights, i.e.
-               for each node that meets all of the scheduling requirements (resource
-               request, requiredDuringScheduling affinity expressions, etc.),
-               compute a sum by iterating through the elements of this field and adding
-               "weight" to the sum if the node matches the corresponding matchExpressions; the
-               node(s) with the highest sum are the most preferred.
-        """
-        if preferred_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "preferred_during_scheduling_ignored_during_execution", preferred_during_scheduling_ignored_during_execution)
-        if required_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "required_during_scheduling_ignored_during_execution", required_during_scheduling_ignored_during_execution)
-
-    @_builtins.property
-    @pulumi.getter(name="preferredDuringSchedulingIgnoredDuringExecution")
-    def preferred_during_scheduling_ignored_during_execution(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecution']]:
-        """
-        The scheduler will prefer to schedule pods to nodes that satisfy
-        the affinity expressions specified by this field, but it may choose
-        a node that violates one or more of the expressions. The node that is
-        most preferred is the one with the greatest sum of weights, i.e.
-        for each node that meets all of the scheduling requirements (resource
-        request, requiredDuringScheduling affinity expressions, etc.),
-        compute a sum by iterating through the elements of this field and adding
-        "weight" to the sum if the node matches the corresponding matchExpressions; the
-        node(s) with the highest sum are the most preferred.
-        """
-        return pulumi.get(self, "preferred_during_scheduling_ignored_during_execution")
-
-    @_builtins.property
-    @pulumi.getter(name="requiredDuringSchedulingIgnoredDuringExecution")
-    def required_during_scheduling_ignored_during_execution(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution']:
-        return pulumi.get(self, "required_during_scheduling_ignored_during_execution")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatch(dict):
-    """
-    Describes node affinity scheduling rules for the pod.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "preferredDuringSchedulingIgnoredDuringExecution":
-            suggest = "preferred_during_scheduling_ignored_during_execution"
-        elif key == "requiredDuringSchedulingIgnoredDuringExecution":
-            suggest = "required_during_scheduling_ignored_during_execution"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 preferred_during_scheduling_ignored_during_execution: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch']] = None,
-                 required_during_scheduling_ignored_during_execution: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch'] = None):
-        """
-        Describes node affinity scheduling rules for the pod.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs'] preferred_during_scheduling_ignored_during_execution: The scheduler will prefer to schedule pods to nodes that satisfy
-               the affinity expressions specified by this field, but it may choose
-               a node that violates one or more of the expressions. The node that is
-               most preferred is the one with the greatest sum of weights, i.e.
-               for each node that meets all of the scheduling requirements (resource
-               request, requiredDuringScheduling affinity expressions, etc.),
-               compute a sum by iterating through the elements of this field and adding
-               "weight" to the sum if the node matches the corresponding matchExpressions; the
-               node(s) with the highest sum are the most preferred.
-        """
-        if preferred_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "preferred_during_scheduling_ignored_during_execution", preferred_during_scheduling_ignored_during_execution)
-        if required_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "required_during_scheduling_ignored_during_execution", required_during_scheduling_ignored_during_execution)
-
-    @_builtins.property
-    @pulumi.getter(name="preferredDuringSchedulingIgnoredDuringExecution")
-    def preferred_during_scheduling_ignored_during_execution(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch']]:
-        """
-        The scheduler will prefer to schedule pods to nodes that satisfy
-        the affinity expressions specified by this field, but it may choose
-        a node that violates one or more of the expressions. The node that is
-        most preferred is the one with the greatest sum of weights, i.e.
-        for each node that meets all of the scheduling requirements (resource
-        request, requiredDuringScheduling affinity expressions, etc.),
-        compute a sum by iterating through the elements of this field and adding
-        "weight" to the sum if the node matches the corresponding matchExpressions; the
-        node(s) with the highest sum are the most preferred.
-        """
-        return pulumi.get(self, "preferred_during_scheduling_ignored_during_execution")
-
-    @_builtins.property
-    @pulumi.getter(name="requiredDuringSchedulingIgnoredDuringExecution")
-    def required_during_scheduling_ignored_during_execution(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch']:
-        return pulumi.get(self, "required_during_scheduling_ignored_during_execution")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecution(dict):
-    """
-    An empty preferred scheduling term matches all objects with implicit weight 0
-    (i.e. it's a no-op). A null preferred scheduling term matches no objects (i.e. is also a no-op).
-    """
-    def __init__(__self__, *,
-                 preference: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference'] = None,
-                 weight: Optional[_builtins.int] = None):
-        """
-        An empty preferred scheduling term matches all objects with implicit weight 0
-        (i.e. it's a no-op). A null preferred scheduling term matches no objects (i.e. is also a no-op).
-
-        :param _builtins.int weight: Weight associated with matching the corresponding nodeSelectorTerm, in the range 1-100.
-        """
-        if preference is not None:
-            pulumi.set(__self__, "preference", preference)
-        if weight is not None:
-            pulumi.set(__self__, "weight", weight)
-
-    @_builtins.property
-    @pulumi.getter
-    def preference(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference']:
-        return pulumi.get(self, "preference")
-
-    @_builtins.property
-    @pulumi.getter
-    def weight(self) -> Optional[_builtins.int]:
-        """
-        Weight associated with matching the corresponding nodeSelectorTerm, in the range 1-100.
-        """
-        return pulumi.get(self, "weight")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch(dict):
-    """
-    An empty preferred scheduling term matches all objects with implicit weight 0
-    (i.e. it's a no-op). A null preferred scheduling term matches no objects (i.e. is also a no-op).
-    """
-    def __init__(__self__, *,
-                 preference: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch'] = None,
-                 weight: Optional[_builtins.int] = None):
-        """
-        An empty preferred scheduling term matches all objects with implicit weight 0
-        (i.e. it's a no-op). A null preferred scheduling term matches no objects (i.e. is also a no-op).
-
-        :param _builtins.int weight: Weight associated with matching the corresponding nodeSelectorTerm, in the range 1-100.
-        """
-        if preference is not None:
-            pulumi.set(__self__, "preference", preference)
-        if weight is not None:
-            pulumi.set(__self__, "weight", weight)
-
-    @_builtins.property
-    @pulumi.getter
-    def preference(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch']:
-        return pulumi.get(self, "preference")
-
-    @_builtins.property
-    @pulumi.getter
-    def weight(self) -> Optional[_builtins.int]:
-        """
-        Weight associated with matching the corresponding nodeSelectorTerm, in the range 1-100.
-        """
-        return pulumi.get(self, "weight")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference(dict):
-    """
-    A node selector term, associated with the corresponding weight.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchFields":
-            suggest = "match_fields"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressions']] = None,
-                 match_fields: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFields']] = None):
-        """
-        A node selector term, associated with the corresponding weight.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsArgs'] match_expressions: A list of node selector requirements by node's labels.
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsArgs'] match_fields: A list of node selector requirements by node's fields.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_fields is not None:
-            pulumi.set(__self__, "match_fields", match_fields)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressions']]:
-        """
-        A list of node selector requirements by node's labels.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchFields")
-    def match_fields(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFields']]:
-        """
-        A list of node selector requirements by node's fields.
-        """
-        return pulumi.get(self, "match_fields")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressions(dict):
-    """
-    A node selector requirement is a selector that contains values, a key, and an operator
-    that relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A node selector requirement is a selector that contains values, a key, and an operator
-        that relates the key and values.
-
-        :param _builtins.str key: The label key that the selector applies to.
-        :param _builtins.str operator: Represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        :param Sequence[_builtins.str] values: An array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. If the operator is Gt or Lt, the values
-               array must have a single element, which will be interpreted as an integer.
-               This array is replaced during a strategic merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        Represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        An array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. If the operator is Gt or Lt, the values
-        array must have a single element, which will be interpreted as an integer.
-        This array is replaced during a strategic merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatch(dict):
-    """
-    A node selector requirement is a selector that contains values, a key, and an operator
-    that relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A node selector requirement is a selector that contains values, a key, and an operator
-        that relates the key and values.
-
-        :param _builtins.str key: The label key that the selector applies to.
-        :param _builtins.str operator: Represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        :param Sequence[_builtins.str] values: An array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. If the operator is Gt or Lt, the values
-               array must have a single element, which will be interpreted as an integer.
-               This array is replaced during a strategic merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        Represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        An array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. If the operator is Gt or Lt, the values
-        array must have a single element, which will be interpreted as an integer.
-        This array is replaced during a strategic merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFields(dict):
-    """
-    A node selector requirement is a selector that contains values, a key, and an operator
-    that relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A node selector requirement is a selector that contains values, a key, and an operator
-        that relates the key and values.
-
-        :param _builtins.str key: The label key that the selector applies to.
-        :param _builtins.str operator: Represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        :param Sequence[_builtins.str] values: An array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. If the operator is Gt or Lt, the values
-               array must have a single element, which will be interpreted as an integer.
-               This array is replaced during a strategic merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        Represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        An array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. If the operator is Gt or Lt, the values
-        array must have a single element, which will be interpreted as an integer.
-        This array is replaced during a strategic merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatch(dict):
-    """
-    A node selector requirement is a selector that contains values, a key, and an operator
-    that relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A node selector requirement is a selector that contains values, a key, and an operator
-        that relates the key and values.
-
-        :param _builtins.str key: The label key that the selector applies to.
-        :param _builtins.str operator: Represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        :param Sequence[_builtins.str] values: An array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. If the operator is Gt or Lt, the values
-               array must have a single element, which will be interpreted as an integer.
-               This array is replaced during a strategic merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        Represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        An array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. If the operator is Gt or Lt, the values
-        array must have a single element, which will be interpreted as an integer.
-        This array is replaced during a strategic merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch(dict):
-    """
-    A node selector term, associated with the corresponding weight.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchFields":
-            suggest = "match_fields"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatch']] = None,
-                 match_fields: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatch']] = None):
-        """
-        A node selector term, associated with the corresponding weight.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatchArgs'] match_expressions: A list of node selector requirements by node's labels.
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatchArgs'] match_fields: A list of node selector requirements by node's fields.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_fields is not None:
-            pulumi.set(__self__, "match_fields", match_fields)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatch']]:
-        """
-        A list of node selector requirements by node's labels.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchFields")
-    def match_fields(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatch']]:
-        """
-        A list of node selector requirements by node's fields.
-        """
-        return pulumi.get(self, "match_fields")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution(dict):
-    """
-    If the affinity requirements specified by this field are not met at
-    scheduling time, the pod will not be scheduled onto the node.
-    If the affinity requirements specified by this field cease to be met
-    at some point during pod execution (e.g. due to an update), the system
-    may or may not try to eventually evict the pod from its node.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "nodeSelectorTerms":
-            suggest = "node_selector_terms"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 node_selector_terms: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms']] = None):
-        """
-        If the affinity requirements specified by this field are not met at
-        scheduling time, the pod will not be scheduled onto the node.
-        If the affinity requirements specified by this field cease to be met
-        at some point during pod execution (e.g. due to an update), the system
-        may or may not try to eventually evict the pod from its node.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsArgs'] node_selector_terms: Required. A list of node selector terms. The terms are ORed.
-        """
-        if node_selector_terms is not None:
-            pulumi.set(__self__, "node_selector_terms", node_selector_terms)
-
-    @_builtins.property
-    @pulumi.getter(name="nodeSelectorTerms")
-    def node_selector_terms(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms']]:
-        """
-        Required. A list of node selector terms. The terms are ORed.
-        """
-        return pulumi.get(self, "node_selector_terms")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms(dict):
-    """
-    A null or empty node selector term matches no objects. The requirements of
-    them are ANDed.
-    The TopologySelectorTerm type implements a subset of the NodeSelectorTerm.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchFields":
-            suggest = "match_fields"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressions']] = None,
-                 match_fields: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFields']] = None):
-        """
-        A null or empty node selector term matches no objects. The requirements of
-        them are ANDed.
-        The TopologySelectorTerm type implements a subset of the NodeSelectorTerm.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsArgs'] match_expressions: A list of node selector requirements by node's labels.
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsArgs'] match_fields: A list of node selector requirements by node's fields.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_fields is not None:
-            pulumi.set(__self__, "match_fields", match_fields)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressions']]:
-        """
-        A list of node selector requirements by node's labels.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchFields")
-    def match_fields(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFields']]:
-        """
-        A list of node selector requirements by node's fields.
-        """
-        return pulumi.get(self, "match_fields")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressions(dict):
-    """
-    A node selector requirement is a selector that contains values, a key, and an operator
-    that relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A node selector requirement is a selector that contains values, a key, and an operator
-        that relates the key and values.
-
-        :param _builtins.str key: The label key that the selector applies to.
-        :param _builtins.str operator: Represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        :param Sequence[_builtins.str] values: An array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. If the operator is Gt or Lt, the values
-               array must have a single element, which will be interpreted as an integer.
-               This array is replaced during a strategic merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        Represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        An array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. If the operator is Gt or Lt, the values
-        array must have a single element, which will be interpreted as an integer.
-        This array is replaced during a strategic merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatch(dict):
-    """
-    A node selector requirement is a selector that contains values, a key, and an operator
-    that relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A node selector requirement is a selector that contains values, a key, and an operator
-        that relates the key and values.
-
-        :param _builtins.str key: The label key that the selector applies to.
-        :param _builtins.str operator: Represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        :param Sequence[_builtins.str] values: An array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. If the operator is Gt or Lt, the values
-               array must have a single element, which will be interpreted as an integer.
-               This array is replaced during a strategic merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        Represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        An array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. If the operator is Gt or Lt, the values
-        array must have a single element, which will be interpreted as an integer.
-        This array is replaced during a strategic merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFields(dict):
-    """
-    A node selector requirement is a selector that contains values, a key, and an operator
-    that relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A node selector requirement is a selector that contains values, a key, and an operator
-        that relates the key and values.
-
-        :param _builtins.str key: The label key that the selector applies to.
-        :param _builtins.str operator: Represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        :param Sequence[_builtins.str] values: An array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. If the operator is Gt or Lt, the values
-               array must have a single element, which will be interpreted as an integer.
-               This array is replaced during a strategic merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        Represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        An array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. If the operator is Gt or Lt, the values
-        array must have a single element, which will be interpreted as an integer.
-        This array is replaced during a strategic merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatch(dict):
-    """
-    A node selector requirement is a selector that contains values, a key, and an operator
-    that relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A node selector requirement is a selector that contains values, a key, and an operator
-        that relates the key and values.
-
-        :param _builtins.str key: The label key that the selector applies to.
-        :param _builtins.str operator: Represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        :param Sequence[_builtins.str] values: An array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. If the operator is Gt or Lt, the values
-               array must have a single element, which will be interpreted as an integer.
-               This array is replaced during a strategic merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        The label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        Represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists, DoesNotExist. Gt, and Lt.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        An array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. If the operator is Gt or Lt, the values
-        array must have a single element, which will be interpreted as an integer.
-        This array is replaced during a strategic merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch(dict):
-    """
-    A null or empty node selector term matches no objects. The requirements of
-    them are ANDed.
-    The TopologySelectorTerm type implements a subset of the NodeSelectorTerm.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchFields":
-            suggest = "match_fields"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatch']] = None,
-                 match_fields: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatch']] = None):
-        """
-        A null or empty node selector term matches no objects. The requirements of
-        them are ANDed.
-        The TopologySelectorTerm type implements a subset of the NodeSelectorTerm.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatchArgs'] match_expressions: A list of node selector requirements by node's labels.
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatchArgs'] match_fields: A list of node selector requirements by node's fields.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_fields is not None:
-            pulumi.set(__self__, "match_fields", match_fields)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatch']]:
-        """
-        A list of node selector requirements by node's labels.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchFields")
-    def match_fields(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatch']]:
-        """
-        A list of node selector requirements by node's fields.
-        """
-        return pulumi.get(self, "match_fields")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch(dict):
-    """
-    If the affinity requirements specified by this field are not met at
-    scheduling time, the pod will not be scheduled onto the node.
-    If the affinity requirements specified by this field cease to be met
-    at some point during pod execution (e.g. due to an update), the system
-    may or may not try to eventually evict the pod from its node.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "nodeSelectorTerms":
-            suggest = "node_selector_terms"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 node_selector_terms: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch']] = None):
-        """
-        If the affinity requirements specified by this field are not met at
-        scheduling time, the pod will not be scheduled onto the node.
-        If the affinity requirements specified by this field cease to be met
-        at some point during pod execution (e.g. due to an update), the system
-        may or may not try to eventually evict the pod from its node.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatchArgs'] node_selector_terms: Required. A list of node selector terms. The terms are ORed.
-        """
-        if node_selector_terms is not None:
-            pulumi.set(__self__, "node_selector_terms", node_selector_terms)
-
-    @_builtins.property
-    @pulumi.getter(name="nodeSelectorTerms")
-    def node_selector_terms(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch']]:
-        """
-        Required. A list of node selector terms. The terms are ORed.
-        """
-        return pulumi.get(self, "node_selector_terms")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPatch(dict):
-    """
-    Proxy Pod's affinity rules.
-    By default, the Tailscale Kubernetes operator does not apply any affinity rules.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#affinity
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "nodeAffinity":
-            suggest = "node_affinity"
-        elif key == "podAffinity":
-            suggest = "pod_affinity"
-        elif key == "podAntiAffinity":
-            suggest = "pod_anti_affinity"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 node_affinity: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatch'] = None,
-                 pod_affinity: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPatch'] = None,
-                 pod_anti_affinity: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatch'] = None):
-        """
-        Proxy Pod's affinity rules.
-        By default, the Tailscale Kubernetes operator does not apply any affinity rules.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#affinity
-        """
-        if node_affinity is not None:
-            pulumi.set(__self__, "node_affinity", node_affinity)
-        if pod_affinity is not None:
-            pulumi.set(__self__, "pod_affinity", pod_affinity)
-        if pod_anti_affinity is not None:
-            pulumi.set(__self__, "pod_anti_affinity", pod_anti_affinity)
-
-    @_builtins.property
-    @pulumi.getter(name="nodeAffinity")
-    def node_affinity(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatch']:
-        return pulumi.get(self, "node_affinity")
-
-    @_builtins.property
-    @pulumi.getter(name="podAffinity")
-    def pod_affinity(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPatch']:
-        return pulumi.get(self, "pod_affinity")
-
-    @_builtins.property
-    @pulumi.getter(name="podAntiAffinity")
-    def pod_anti_affinity(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatch']:
-        return pulumi.get(self, "pod_anti_affinity")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinity(dict):
-    """
-    Describes pod affinity scheduling rules (e.g. co-locate this pod in the same node, zone, etc. as some other pod(s)).
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "preferredDuringSchedulingIgnoredDuringExecution":
-            suggest = "preferred_during_scheduling_ignored_during_execution"
-        elif key == "requiredDuringSchedulingIgnoredDuringExecution":
-            suggest = "required_during_scheduling_ignored_during_execution"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAffinity. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinity.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinity.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 preferred_during_scheduling_ignored_during_execution: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution']] = None,
-                 required_during_scheduling_ignored_during_execution: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution']] = None):
-        """
-        Describes pod affinity scheduling rules (e.g. co-locate this pod in the same node, zone, etc. as some other pod(s)).
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs'] preferred_during_scheduling_ignored_during_execution: The scheduler will prefer to schedule pods to nodes that satisfy
-               the affinity expressions specified by this field, but it may choose
-               a node that violates one or more of the expressions. The node that is
-               most preferred is the one with the greatest sum of weights, i.e.
-               for each node that meets all of the scheduling requirements (resource
-               request, requiredDuringScheduling affinity expressions, etc.),
-               compute a sum by iterating through the elements of this field and adding
-               "weight" to the sum if the node has pods which matches the corresponding podAffinityTerm; the
-               node(s) with the highest sum are the most preferred.
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs'] required_during_scheduling_ignored_during_execution: If the affinity requirements specified by this field are not met at
-               scheduling time, the pod will not be scheduled onto the node.
-               If the affinity requirements specified by this field cease to be met
-               at some point during pod execution (e.g. due to a pod label update), the
-               system may or may not try to eventually evict the pod from its node.
-               When there are multiple elements, the lists of nodes corresponding to each
-               podAffinityTerm are intersected, i.e. all terms must be satisfied.
-        """
-        if preferred_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "preferred_during_scheduling_ignored_during_execution", preferred_during_scheduling_ignored_during_execution)
-        if required_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "required_during_scheduling_ignored_during_execution", required_during_scheduling_ignored_during_execution)
-
-    @_builtins.property
-    @pulumi.getter(name="preferredDuringSchedulingIgnoredDuringExecution")
-    def preferred_during_scheduling_ignored_during_execution(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution']]:
-        """
-        The scheduler will prefer to schedule pods to nodes that satisfy
-        the affinity expressions specified by this field, but it may choose
-        a node that violates one or more of the expressions. The node that is
-        most preferred is the one with the greatest sum of weights, i.e.
-        for each node that meets all of the scheduling requirements (resource
-        request, requiredDuringScheduling affinity expressions, etc.),
-        compute a sum by iterating through the elements of this field and adding
-        "weight" to the sum if the node has pods which matches the corresponding podAffinityTerm; the
-        node(s) with the highest sum are the most preferred.
-        """
-        return pulumi.get(self, "preferred_during_scheduling_ignored_during_execution")
-
-    @_builtins.property
-    @pulumi.getter(name="requiredDuringSchedulingIgnoredDuringExecution")
-    def required_during_scheduling_ignored_during_execution(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution']]:
-        """
-        If the affinity requirements specified by this field are not met at
-        scheduling time, the pod will not be scheduled onto the node.
-        If the affinity requirements specified by this field cease to be met
-        at some point during pod execution (e.g. due to a pod label update), the
-        system may or may not try to eventually evict the pod from its node.
-        When there are multiple elements, the lists of nodes corresponding to each
-        podAffinityTerm are intersected, i.e. all terms must be satisfied.
-        """
-        return pulumi.get(self, "required_during_scheduling_ignored_during_execution")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPatch(dict):
-    """
-    Describes pod affinity scheduling rules (e.g. co-locate this pod in the same node, zone, etc. as some other pod(s)).
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "preferredDuringSchedulingIgnoredDuringExecution":
-            suggest = "preferred_during_scheduling_ignored_during_execution"
-        elif key == "requiredDuringSchedulingIgnoredDuringExecution":
-            suggest = "required_during_scheduling_ignored_during_execution"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAffinityPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 preferred_during_scheduling_ignored_during_execution: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch']] = None,
-                 required_during_scheduling_ignored_during_execution: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch']] = None):
-        """
-        Describes pod affinity scheduling rules (e.g. co-locate this pod in the same node, zone, etc. as some other pod(s)).
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs'] preferred_during_scheduling_ignored_during_execution: The scheduler will prefer to schedule pods to nodes that satisfy
-               the affinity expressions specified by this field, but it may choose
-               a node that violates one or more of the expressions. The node that is
-               most preferred is the one with the greatest sum of weights, i.e.
-               for each node that meets all of the scheduling requirements (resource
-               request, requiredDuringScheduling affinity expressions, etc.),
-               compute a sum by iterating through the elements of this field and adding
-               "weight" to the sum if the node has pods which matches the corresponding podAffinityTerm; the
-               node(s) with the highest sum are the most preferred.
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs'] required_during_scheduling_ignored_during_execution: If the affinity requirements specified by this field are not met at
-               scheduling time, the pod will not be scheduled onto the node.
-               If the affinity requirements specified by this field cease to be met
-               at some point during pod execution (e.g. due to a pod label update), the
-               system may or may not try to eventually evict the pod from its node.
-               When there are multiple elements, the lists of nodes corresponding to each
-               podAffinityTerm are intersected, i.e. all terms must be satisfied.
-        """
-        if preferred_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "preferred_during_scheduling_ignored_during_execution", preferred_during_scheduling_ignored_during_execution)
-        if required_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "required_during_scheduling_ignored_during_execution", required_during_scheduling_ignored_during_execution)
-
-    @_builtins.property
-    @pulumi.getter(name="preferredDuringSchedulingIgnoredDuringExecution")
-    def preferred_during_scheduling_ignored_during_execution(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch']]:
-        """
-        The scheduler will prefer to schedule pods to nodes that satisfy
-        the affinity expressions specified by this field, but it may choose
-        a node that violates one or more of the expressions. The node that is
-        most preferred is the one with the greatest sum of weights, i.e.
-        for each node that meets all of the scheduling requirements (resource
-        request, requiredDuringScheduling affinity expressions, etc.),
-        compute a sum by iterating through the elements of this field and adding
-        "weight" to the sum if the node has pods which matches the corresponding podAffinityTerm; the
-        node(s) with the highest sum are the most preferred.
-        """
-        return pulumi.get(self, "preferred_during_scheduling_ignored_during_execution")
-
-    @_builtins.property
-    @pulumi.getter(name="requiredDuringSchedulingIgnoredDuringExecution")
-    def required_during_scheduling_ignored_during_execution(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch']]:
-        """
-        If the affinity requirements specified by this field are not met at
-        scheduling time, the pod will not be scheduled onto the node.
-        If the affinity requirements specified by this field cease to be met
-        at some point during pod execution (e.g. due to a pod label update), the
-        system may or may not try to eventually evict the pod from its node.
-        When there are multiple elements, the lists of nodes corresponding to each
-        podAffinityTerm are intersected, i.e. all terms must be satisfied.
-        """
-        return pulumi.get(self, "required_during_scheduling_ignored_during_execution")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution(dict):
-    """
-    The weights of all of the matched WeightedPodAffinityTerm fields are added per-node to find the most preferred node(s)
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "podAffinityTerm":
-            suggest = "pod_affinity_term"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 pod_affinity_term: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm'] = None,
-                 weight: Optional[_builtins.int] = None):
-        """
-        The weights of all of the matched WeightedPodAffinityTerm fields are added per-node to find the most preferred node(s)
-
-        :param _builtins.int weight: weight associated with matching the corresponding podAffinityTerm,
-               in the range 1-100.
-        """
-        if pod_affinity_term is not None:
-            pulumi.set(__self__, "pod_affinity_term", pod_affinity_term)
-        if weight is not None:
-            pulumi.set(__self__, "weight", weight)
-
-    @_builtins.property
-    @pulumi.getter(name="podAffinityTerm")
-    def pod_affinity_term(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm']:
-        return pulumi.get(self, "pod_affinity_term")
-
-    @_builtins.property
-    @pulumi.getter
-    def weight(self) -> Optional[_builtins.int]:
-        """
-        weight associated with matching the corresponding podAffinityTerm,
-        in the range 1-100.
-        """
-        return pulumi.get(self, "weight")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch(dict):
-    """
-    The weights of all of the matched WeightedPodAffinityTerm fields are added per-node to find the most preferred node(s)
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "podAffinityTerm":
-            suggest = "pod_affinity_term"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 pod_affinity_term: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch'] = None,
-                 weight: Optional[_builtins.int] = None):
-        """
-        The weights of all of the matched WeightedPodAffinityTerm fields are added per-node to find the most preferred node(s)
-
-        :param _builtins.int weight: weight associated with matching the corresponding podAffinityTerm,
-               in the range 1-100.
-        """
-        if pod_affinity_term is not None:
-            pulumi.set(__self__, "pod_affinity_term", pod_affinity_term)
-        if weight is not None:
-            pulumi.set(__self__, "weight", weight)
-
-    @_builtins.property
-    @pulumi.getter(name="podAffinityTerm")
-    def pod_affinity_term(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch']:
-        return pulumi.get(self, "pod_affinity_term")
-
-    @_builtins.property
-    @pulumi.getter
-    def weight(self) -> Optional[_builtins.int]:
-        """
-        weight associated with matching the corresponding podAffinityTerm,
-        in the range 1-100.
-        """
-        return pulumi.get(self, "weight")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm(dict):
-    """
-    Required. A pod affinity term, associated with the corresponding weight.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "labelSelector":
-            suggest = "label_selector"
-        elif key == "matchLabelKeys":
-            suggest = "match_label_keys"
-        elif key == "mismatchLabelKeys":
-            suggest = "mismatch_label_keys"
-        elif key == "namespaceSelector":
-            suggest = "namespace_selector"
-        elif key == "topologyKey":
-            suggest = "topology_key"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 label_selector: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector'] = None,
-                 match_label_keys: Optional[Sequence[_builtins.str]] = None,
-                 mismatch_label_keys: Optional[Sequence[_builtins.str]] = None,
-                 namespace_selector: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector'] = None,
-                 namespaces: Optional[Sequence[_builtins.str]] = None,
-                 topology_key: Optional[_builtins.str] = None):
-        """
-        Required. A pod affinity term, associated with the corresponding weight.
-
-        :param Sequence[_builtins.str] match_label_keys: MatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-               Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        :param Sequence[_builtins.str] mismatch_label_keys: MismatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-               Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        :param Sequence[_builtins.str] namespaces: namespaces specifies a static list of namespace names that the term applies to.
-               The term is applied to the union of the namespaces listed in this field
-               and the ones selected by namespaceSelector.
-               null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        :param _builtins.str topology_key: This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-               the labelSelector in the specified namespaces, where co-located is defined as running on a node
-               whose value of the label with key topologyKey matches that of any node on which any of the
-               selected pods is running.
-               Empty topologyKey is not allowed.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if mismatch_label_keys is not None:
-            pulumi.set(__self__, "mismatch_label_keys", mismatch_label_keys)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if namespaces is not None:
-            pulumi.set(__self__, "namespaces", namespaces)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector']:
-        return pulumi.get(self, "label_selector")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-        Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @_builtins.property
-    @pulumi.getter(name="mismatchLabelKeys")
-    def mismatch_label_keys(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        MismatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-        Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "mismatch_label_keys")
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector']:
-        return pulumi.get(self, "namespace_selector")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespaces(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        namespaces specifies a static list of namespace names that the term applies to.
-        The term is applied to the union of the namespaces listed in this field
-        and the ones selected by namespaceSelector.
-        null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        """
-        return pulumi.get(self, "namespaces")
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> Optional[_builtins.str]:
-        """
-        This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-        the labelSelector in the specified namespaces, where co-located is defined as running on a node
-        whose value of the label with key topologyKey matches that of any node on which any of the
-        selected pods is running.
-        Empty topologyKey is not allowed.
-        """
-        return pulumi.get(self, "topology_key")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector(dict):
-    """
-    A label query over a set of resources, in this case pods.
-    If it's null, this PodAffinityTerm matches with no Pods.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        A label query over a set of resources, in this case pods.
-        If it's null, this PodAffinityTerm matches with no Pods.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch(dict):
-    """
-    A label query over a set of resources, in this case pods.
-    If it's null, this PodAffinityTerm matches with no Pods.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        A label query over a set of resources, in this case pods.
-        If it's null, this PodAffinityTerm matches with no Pods.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector(dict):
-    """
-    A label query over the set of namespaces that the term applies to.
-    The term is applied to the union of the namespaces selected by this field
-    and the ones listed in the namespaces field.
-    null selector and null or empty namespaces list means "this pod's namespace".
-    An empty selector ({}) matches all namespaces.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        A label query over the set of namespaces that the term applies to.
-        The term is applied to the union of the namespaces selected by this field
-        and the ones listed in the namespaces field.
-        null selector and null or empty namespaces list means "this pod's namespace".
-        An empty selector ({}) matches all namespaces.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch(dict):
-    """
-    A label query over the set of namespaces that the term applies to.
-    The term is applied to the union of the namespaces selected by this field
-    and the ones listed in the namespaces field.
-    null selector and null or empty namespaces list means "this pod's namespace".
-    An empty selector ({}) matches all namespaces.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        A label query over the set of namespaces that the term applies to.
-        The term is applied to the union of the namespaces selected by this field
-        and the ones listed in the namespaces field.
-        null selector and null or empty namespaces list means "this pod's namespace".
-        An empty selector ({}) matches all namespaces.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch(dict):
-    """
-    Required. A pod affinity term, associated with the corresponding weight.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "labelSelector":
-            suggest = "label_selector"
-        elif key == "matchLabelKeys":
-            suggest = "match_label_keys"
-        elif key == "mismatchLabelKeys":
-            suggest = "mismatch_label_keys"
-        elif key == "namespaceSelector":
-            suggest = "namespace_selector"
-        elif key == "topologyKey":
-            suggest = "topology_key"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 label_selector: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch'] = None,
-                 match_label_keys: Optional[Sequence[_builtins.str]] = None,
-                 mismatch_label_keys: Optional[Sequence[_builtins.str]] = None,
-                 namespace_selector: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch'] = None,
-                 namespaces: Optional[Sequence[_builtins.str]] = None,
-                 topology_key: Optional[_builtins.str] = None):
-        """
-        Required. A pod affinity term, associated with the corresponding weight.
-
-        :param Sequence[_builtins.str] match_label_keys: MatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-               Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        :param Sequence[_builtins.str] mismatch_label_keys: MismatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-               Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        :param Sequence[_builtins.str] namespaces: namespaces specifies a static list of namespace names that the term applies to.
-               The term is applied to the union of the namespaces listed in this field
-               and the ones selected by namespaceSelector.
-               null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        :param _builtins.str topology_key: This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-               the labelSelector in the specified namespaces, where co-located is defined as running on a node
-               whose value of the label with key topologyKey matches that of any node on which any of the
-               selected pods is running.
-               Empty topologyKey is not allowed.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if mismatch_label_keys is not None:
-            pulumi.set(__self__, "mismatch_label_keys", mismatch_label_keys)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if namespaces is not None:
-            pulumi.set(__self__, "namespaces", namespaces)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch']:
-        return pulumi.get(self, "label_selector")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-        Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @_builtins.property
-    @pulumi.getter(name="mismatchLabelKeys")
-    def mismatch_label_keys(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        MismatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-        Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "mismatch_label_keys")
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch']:
-        return pulumi.get(self, "namespace_selector")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespaces(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        namespaces specifies a static list of namespace names that the term applies to.
-        The term is applied to the union of the namespaces listed in this field
-        and the ones selected by namespaceSelector.
-        null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        """
-        return pulumi.get(self, "namespaces")
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> Optional[_builtins.str]:
-        """
-        This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-        the labelSelector in the specified namespaces, where co-located is defined as running on a node
-        whose value of the label with key topologyKey matches that of any node on which any of the
-        selected pods is running.
-        Empty topologyKey is not allowed.
-        """
-        return pulumi.get(self, "topology_key")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution(dict):
-    """
-    Defines a set of pods (namely those matching the labelSelector
-    relative to the given namespace(s)) that this pod should be
-    co-located (affinity) or not co-located (anti-affinity) with,
-    where co-located is defined as running on a node whose value of
-    the label with key <topologyKey> matches that of any node on which
-    a pod of the set of pods is running
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "labelSelector":
-            suggest = "label_selector"
-        elif key == "matchLabelKeys":
-            suggest = "match_label_keys"
-        elif key == "mismatchLabelKeys":
-            suggest = "mismatch_label_keys"
-        elif key == "namespaceSelector":
-            suggest = "namespace_selector"
-        elif key == "topologyKey":
-            suggest = "topology_key"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 label_selector: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector'] = None,
-                 match_label_keys: Optional[Sequence[_builtins.str]] = None,
-                 mismatch_label_keys: Optional[Sequence[_builtins.str]] = None,
-                 namespace_selector: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector'] = None,
-                 namespaces: Optional[Sequence[_builtins.str]] = None,
-                 topology_key: Optional[_builtins.str] = None):
-        """
-        Defines a set of pods (namely those matching the labelSelector
-        relative to the given namespace(s)) that this pod should be
-        co-located (affinity) or not co-located (anti-affinity) with,
-        where co-located is defined as running on a node whose value of
-        the label with key <topologyKey> matches that of any node on which
-        a pod of the set of pods is running
-
-        :param Sequence[_builtins.str] match_label_keys: MatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-               Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        :param Sequence[_builtins.str] mismatch_label_keys: MismatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-               Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        :param Sequence[_builtins.str] namespaces: namespaces specifies a static list of namespace names that the term applies to.
-               The term is applied to the union of the namespaces listed in this field
-               and the ones selected by namespaceSelector.
-               null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        :param _builtins.str topology_key: This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-               the labelSelector in the specified namespaces, where co-located is defined as running on a node
-               whose value of the label with key topologyKey matches that of any node on which any of the
-               selected pods is running.
-               Empty topologyKey is not allowed.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if mismatch_label_keys is not None:
-            pulumi.set(__self__, "mismatch_label_keys", mismatch_label_keys)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if namespaces is not None:
-            pulumi.set(__self__, "namespaces", namespaces)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector']:
-        return pulumi.get(self, "label_selector")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-        Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @_builtins.property
-    @pulumi.getter(name="mismatchLabelKeys")
-    def mismatch_label_keys(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        MismatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-        Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "mismatch_label_keys")
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector']:
-        return pulumi.get(self, "namespace_selector")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespaces(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        namespaces specifies a static list of namespace names that the term applies to.
-        The term is applied to the union of the namespaces listed in this field
-        and the ones selected by namespaceSelector.
-        null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        """
-        return pulumi.get(self, "namespaces")
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> Optional[_builtins.str]:
-        """
-        This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-        the labelSelector in the specified namespaces, where co-located is defined as running on a node
-        whose value of the label with key topologyKey matches that of any node on which any of the
-        selected pods is running.
-        Empty topologyKey is not allowed.
-        """
-        return pulumi.get(self, "topology_key")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector(dict):
-    """
-    A label query over a set of resources, in this case pods.
-    If it's null, this PodAffinityTerm matches with no Pods.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        A label query over a set of resources, in this case pods.
-        If it's null, this PodAffinityTerm matches with no Pods.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch(dict):
-    """
-    A label query over a set of resources, in this case pods.
-    If it's null, this PodAffinityTerm matches with no Pods.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        A label query over a set of resources, in this case pods.
-        If it's null, this PodAffinityTerm matches with no Pods.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector(dict):
-    """
-    A label query over the set of namespaces that the term applies to.
-    The term is applied to the union of the namespaces selected by this field
-    and the ones listed in the namespaces field.
-    null selector and null or empty namespaces list means "this pod's namespace".
-    An empty selector ({}) matches all namespaces.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        A label query over the set of namespaces that the term applies to.
-        The term is applied to the union of the namespaces selected by this field
-        and the ones listed in the namespaces field.
-        null selector and null or empty namespaces list means "this pod's namespace".
-        An empty selector ({}) matches all namespaces.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch(dict):
-    """
-    A label query over the set of namespaces that the term applies to.
-    The term is applied to the union of the namespaces selected by this field
-    and the ones listed in the namespaces field.
-    null selector and null or empty namespaces list means "this pod's namespace".
-    An empty selector ({}) matches all namespaces.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        A label query over the set of namespaces that the term applies to.
-        The term is applied to the union of the namespaces selected by this field
-        and the ones listed in the namespaces field.
-        null selector and null or empty namespaces list means "this pod's namespace".
-        An empty selector ({}) matches all namespaces.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch(dict):
-    """
-    Defines a set of pods (namely those matching the labelSelector
-    relative to the given namespace(s)) that this pod should be
-    co-located (affinity) or not co-located (anti-affinity) with,
-    where co-located is defined as running on a node whose value of
-    the label with key <topologyKey> matches that of any node on which
-    a pod of the set of pods is running
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "labelSelector":
-            suggest = "label_selector"
-        elif key == "matchLabelKeys":
-            suggest = "match_label_keys"
-        elif key == "mismatchLabelKeys":
-            suggest = "mismatch_label_keys"
-        elif key == "namespaceSelector":
-            suggest = "namespace_selector"
-        elif key == "topologyKey":
-            suggest = "topology_key"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 label_selector: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch'] = None,
-                 match_label_keys: Optional[Sequence[_builtins.str]] = None,
-                 mismatch_label_keys: Optional[Sequence[_builtins.str]] = None,
-                 namespace_selector: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch'] = None,
-                 namespaces: Optional[Sequence[_builtins.str]] = None,
-                 topology_key: Optional[_builtins.str] = None):
-        """
-        Defines a set of pods (namely those matching the labelSelector
-        relative to the given namespace(s)) that this pod should be
-        co-located (affinity) or not co-located (anti-affinity) with,
-        where co-located is defined as running on a node whose value of
-        the label with key <topologyKey> matches that of any node on which
-        a pod of the set of pods is running
-
-        :param Sequence[_builtins.str] match_label_keys: MatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-               Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        :param Sequence[_builtins.str] mismatch_label_keys: MismatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-               Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        :param Sequence[_builtins.str] namespaces: namespaces specifies a static list of namespace names that the term applies to.
-               The term is applied to the union of the namespaces listed in this field
-               and the ones selected by namespaceSelector.
-               null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        :param _builtins.str topology_key: This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-               the labelSelector in the specified namespaces, where co-located is defined as running on a node
-               whose value of the label with key topologyKey matches that of any node on which any of the
-               selected pods is running.
-               Empty topologyKey is not allowed.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if mismatch_label_keys is not None:
-            pulumi.set(__self__, "mismatch_label_keys", mismatch_label_keys)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if namespaces is not None:
-            pulumi.set(__self__, "namespaces", namespaces)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch']:
-        return pulumi.get(self, "label_selector")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-        Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @_builtins.property
-    @pulumi.getter(name="mismatchLabelKeys")
-    def mismatch_label_keys(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        MismatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-        Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "mismatch_label_keys")
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch']:
-        return pulumi.get(self, "namespace_selector")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespaces(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        namespaces specifies a static list of namespace names that the term applies to.
-        The term is applied to the union of the namespaces listed in this field
-        and the ones selected by namespaceSelector.
-        null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        """
-        return pulumi.get(self, "namespaces")
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> Optional[_builtins.str]:
-        """
-        This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-        the labelSelector in the specified namespaces, where co-located is defined as running on a node
-        whose value of the label with key topologyKey matches that of any node on which any of the
-        selected pods is running.
-        Empty topologyKey is not allowed.
-        """
-        return pulumi.get(self, "topology_key")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinity(dict):
-    """
-    Describes pod anti-affinity scheduling rules (e.g. avoid putting this pod in the same node, zone, etc. as some other pod(s)).
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "preferredDuringSchedulingIgnoredDuringExecution":
-            suggest = "preferred_during_scheduling_ignored_during_execution"
-        elif key == "requiredDuringSchedulingIgnoredDuringExecution":
-            suggest = "required_during_scheduling_ignored_during_execution"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAntiAffinity. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinity.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinity.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 preferred_during_scheduling_ignored_during_execution: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution']] = None,
-                 required_during_scheduling_ignored_during_execution: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution']] = None):
-        """
-        Describes pod anti-affinity scheduling rules (e.g. avoid putting this pod in the same node, zone, etc. as some other pod(s)).
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionArgs'] preferred_during_scheduling_ignored_during_execution: The scheduler will prefer to schedule pods to nodes that satisfy
-               the anti-affinity expressions specified by this field, but it may choose
-               a node that violates one or more of the expressions. The node that is
-               most preferred is the one with the greatest sum of weights, i.e.
-               for each node that meets all of the scheduling requirements (resource
-               request, requiredDuringScheduling anti-affinity expressions, etc.),
-               compute a sum by iterating through the elements of this field and subtracting
-               "weight" from the sum if the node has pods which matches the corresponding podAffinityTerm; the
-               node(s) with the highest sum are the most preferred.
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionArgs'] required_during_scheduling_ignored_during_execution: If the anti-affinity requirements specified by this field are not met at
-               scheduling time, the pod will not be scheduled onto the node.
-               If the anti-affinity requirements specified by this field cease to be met
-               at some point during pod execution (e.g. due to a pod label update), the
-               system may or may not try to eventually evict the pod from its node.
-               When there are multiple elements, the lists of nodes corresponding to each
-               podAffinityTerm are intersected, i.e. all terms must be satisfied.
-        """
-        if preferred_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "preferred_during_scheduling_ignored_during_execution", preferred_during_scheduling_ignored_during_execution)
-        if required_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "required_during_scheduling_ignored_during_execution", required_during_scheduling_ignored_during_execution)
-
-    @_builtins.property
-    @pulumi.getter(name="preferredDuringSchedulingIgnoredDuringExecution")
-    def preferred_during_scheduling_ignored_during_execution(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution']]:
-        """
-        The scheduler will prefer to schedule pods to nodes that satisfy
-        the anti-affinity expressions specified by this field, but it may choose
-        a node that violates one or more of the expressions. The node that is
-        most preferred is the one with the greatest sum of weights, i.e.
-        for each node that meets all of the scheduling requirements (resource
-        request, requiredDuringScheduling anti-affinity expressions, etc.),
-        compute a sum by iterating through the elements of this field and subtracting
-        "weight" from the sum if the node has pods which matches the corresponding podAffinityTerm; the
-        node(s) with the highest sum are the most preferred.
-        """
-        return pulumi.get(self, "preferred_during_scheduling_ignored_during_execution")
-
-    @_builtins.property
-    @pulumi.getter(name="requiredDuringSchedulingIgnoredDuringExecution")
-    def required_during_scheduling_ignored_during_execution(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution']]:
-        """
-        If the anti-affinity requirements specified by this field are not met at
-        scheduling time, the pod will not be scheduled onto the node.
-        If the anti-affinity requirements specified by this field cease to be met
-        at some point during pod execution (e.g. due to a pod label update), the
-        system may or may not try to eventually evict the pod from its node.
-        When there are multiple elements, the lists of nodes corresponding to each
-        podAffinityTerm are intersected, i.e. all terms must be satisfied.
-        """
-        return pulumi.get(self, "required_during_scheduling_ignored_during_execution")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatch(dict):
-    """
-    Describes pod anti-affinity scheduling rules (e.g. avoid putting this pod in the same node, zone, etc. as some other pod(s)).
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "preferredDuringSchedulingIgnoredDuringExecution":
-            suggest = "preferred_during_scheduling_ignored_during_execution"
-        elif key == "requiredDuringSchedulingIgnoredDuringExecution":
-            suggest = "required_during_scheduling_ignored_during_execution"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 preferred_during_scheduling_ignored_during_execution: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch']] = None,
-                 required_during_scheduling_ignored_during_execution: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch']] = None):
-        """
-        Describes pod anti-affinity scheduling rules (e.g. avoid putting this pod in the same node, zone, etc. as some other pod(s)).
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatchArgs'] preferred_during_scheduling_ignored_during_execution: The scheduler will prefer to schedule pods to nodes that satisfy
-               the anti-affinity expressions specified by this field, but it may choose
-               a node that violates one or more of the expressions. The node that is
-               most preferred is the one with the greatest sum of weights, i.e.
-               for each node that meets all of the scheduling requirements (resource
-               request, requiredDuringScheduling anti-affinity expressions, etc.),
-               compute a sum by iterating through the elements of this field and subtracting
-               "weight" from the sum if the node has pods which matches the corresponding podAffinityTerm; the
-               node(s) with the highest sum are the most preferred.
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatchArgs'] required_during_scheduling_ignored_during_execution: If the anti-affinity requirements specified by this field are not met at
-               scheduling time, the pod will not be scheduled onto the node.
-               If the anti-affinity requirements specified by this field cease to be met
-               at some point during pod execution (e.g. due to a pod label update), the
-               system may or may not try to eventually evict the pod from its node.
-               When there are multiple elements, the lists of nodes corresponding to each
-               podAffinityTerm are intersected, i.e. all terms must be satisfied.
-        """
-        if preferred_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "preferred_during_scheduling_ignored_during_execution", preferred_during_scheduling_ignored_during_execution)
-        if required_during_scheduling_ignored_during_execution is not None:
-            pulumi.set(__self__, "required_during_scheduling_ignored_during_execution", required_during_scheduling_ignored_during_execution)
-
-    @_builtins.property
-    @pulumi.getter(name="preferredDuringSchedulingIgnoredDuringExecution")
-    def preferred_during_scheduling_ignored_during_execution(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch']]:
-        """
-        The scheduler will prefer to schedule pods to nodes that satisfy
-        the anti-affinity expressions specified by this field, but it may choose
-        a node that violates one or more of the expressions. The node that is
-        most preferred is the one with the greatest sum of weights, i.e.
-        for each node that meets all of the scheduling requirements (resource
-        request, requiredDuringScheduling anti-affinity expressions, etc.),
-        compute a sum by iterating through the elements of this field and subtracting
-        "weight" from the sum if the node has pods which matches the corresponding podAffinityTerm; the
-        node(s) with the highest sum are the most preferred.
-        """
-        return pulumi.get(self, "preferred_during_scheduling_ignored_during_execution")
-
-    @_builtins.property
-    @pulumi.getter(name="requiredDuringSchedulingIgnoredDuringExecution")
-    def required_during_scheduling_ignored_during_execution(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch']]:
-        """
-        If the anti-affinity requirements specified by this field are not met at
-        scheduling time, the pod will not be scheduled onto the node.
-        If the anti-affinity requirements specified by this field cease to be met
-        at some point during pod execution (e.g. due to a pod label update), the
-        system may or may not try to eventually evict the pod from its node.
-        When there are multiple elements, the lists of nodes corresponding to each
-        podAffinityTerm are intersected, i.e. all terms must be satisfied.
-        """
-        return pulumi.get(self, "required_during_scheduling_ignored_during_execution")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution(dict):
-    """
-    The weights of all of the matched WeightedPodAffinityTerm fields are added per-node to find the most preferred node(s)
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "podAffinityTerm":
-            suggest = "pod_affinity_term"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 pod_affinity_term: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm'] = None,
-                 weight: Optional[_builtins.int] = None):
-        """
-        The weights of all of the matched WeightedPodAffinityTerm fields are added per-node to find the most preferred node(s)
-
-        :param _builtins.int weight: weight associated with matching the corresponding podAffinityTerm,
-               in the range 1-100.
-        """
-        if pod_affinity_term is not None:
-            pulumi.set(__self__, "pod_affinity_term", pod_affinity_term)
-        if weight is not None:
-            pulumi.set(__self__, "weight", weight)
-
-    @_builtins.property
-    @pulumi.getter(name="podAffinityTerm")
-    def pod_affinity_term(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm']:
-        return pulumi.get(self, "pod_affinity_term")
-
-    @_builtins.property
-    @pulumi.getter
-    def weight(self) -> Optional[_builtins.int]:
-        """
-        weight associated with matching the corresponding podAffinityTerm,
-        in the range 1-100.
-        """
-        return pulumi.get(self, "weight")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch(dict):
-    """
-    The weights of all of the matched WeightedPodAffinityTerm fields are added per-node to find the most preferred node(s)
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "podAffinityTerm":
-            suggest = "pod_affinity_term"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 pod_affinity_term: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch'] = None,
-                 weight: Optional[_builtins.int] = None):
-        """
-        The weights of all of the matched WeightedPodAffinityTerm fields are added per-node to find the most preferred node(s)
-
-        :param _builtins.int weight: weight associated with matching the corresponding podAffinityTerm,
-               in the range 1-100.
-        """
-        if pod_affinity_term is not None:
-            pulumi.set(__self__, "pod_affinity_term", pod_affinity_term)
-        if weight is not None:
-            pulumi.set(__self__, "weight", weight)
-
-    @_builtins.property
-    @pulumi.getter(name="podAffinityTerm")
-    def pod_affinity_term(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch']:
-        return pulumi.get(self, "pod_affinity_term")
-
-    @_builtins.property
-    @pulumi.getter
-    def weight(self) -> Optional[_builtins.int]:
-        """
-        weight associated with matching the corresponding podAffinityTerm,
-        in the range 1-100.
-        """
-        return pulumi.get(self, "weight")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm(dict):
-    """
-    Required. A pod affinity term, associated with the corresponding weight.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "labelSelector":
-            suggest = "label_selector"
-        elif key == "matchLabelKeys":
-            suggest = "match_label_keys"
-        elif key == "mismatchLabelKeys":
-            suggest = "mismatch_label_keys"
-        elif key == "namespaceSelector":
-            suggest = "namespace_selector"
-        elif key == "topologyKey":
-            suggest = "topology_key"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 label_selector: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector'] = None,
-                 match_label_keys: Optional[Sequence[_builtins.str]] = None,
-                 mismatch_label_keys: Optional[Sequence[_builtins.str]] = None,
-                 namespace_selector: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector'] = None,
-                 namespaces: Optional[Sequence[_builtins.str]] = None,
-                 topology_key: Optional[_builtins.str] = None):
-        """
-        Required. A pod affinity term, associated with the corresponding weight.
-
-        :param Sequence[_builtins.str] match_label_keys: MatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-               Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        :param Sequence[_builtins.str] mismatch_label_keys: MismatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-               Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        :param Sequence[_builtins.str] namespaces: namespaces specifies a static list of namespace names that the term applies to.
-               The term is applied to the union of the namespaces listed in this field
-               and the ones selected by namespaceSelector.
-               null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        :param _builtins.str topology_key: This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-               the labelSelector in the specified namespaces, where co-located is defined as running on a node
-               whose value of the label with key topologyKey matches that of any node on which any of the
-               selected pods is running.
-               Empty topologyKey is not allowed.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if mismatch_label_keys is not None:
-            pulumi.set(__self__, "mismatch_label_keys", mismatch_label_keys)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if namespaces is not None:
-            pulumi.set(__self__, "namespaces", namespaces)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector']:
-        return pulumi.get(self, "label_selector")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-        Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @_builtins.property
-    @pulumi.getter(name="mismatchLabelKeys")
-    def mismatch_label_keys(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        MismatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-        Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "mismatch_label_keys")
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector']:
-        return pulumi.get(self, "namespace_selector")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespaces(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        namespaces specifies a static list of namespace names that the term applies to.
-        The term is applied to the union of the namespaces listed in this field
-        and the ones selected by namespaceSelector.
-        null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        """
-        return pulumi.get(self, "namespaces")
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> Optional[_builtins.str]:
-        """
-        This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-        the labelSelector in the specified namespaces, where co-located is defined as running on a node
-        whose value of the label with key topologyKey matches that of any node on which any of the
-        selected pods is running.
-        Empty topologyKey is not allowed.
-        """
-        return pulumi.get(self, "topology_key")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector(dict):
-    """
-    A label query over a set of resources, in this case pods.
-    If it's null, this PodAffinityTerm matches with no Pods.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        A label query over a set of resources, in this case pods.
-        If it's null, this PodAffinityTerm matches with no Pods.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch(dict):
-    """
-    A label query over a set of resources, in this case pods.
-    If it's null, this PodAffinityTerm matches with no Pods.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        A label query over a set of resources, in this case pods.
-        If it's null, this PodAffinityTerm matches with no Pods.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatchArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector(dict):
-    """
-    A label query over the set of namespaces that the term applies to.
-    The term is applied to the union of the namespaces selected by this field
-    and the ones listed in the namespaces field.
-    null selector and null or empty namespaces list means "this pod's namespace".
-    An empty selector ({}) matches all namespaces.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        A label query over the set of namespaces that the term applies to.
-        The term is applied to the union of the namespaces selected by this field
-        and the ones listed in the namespaces field.
-        null selector and null or empty namespaces list means "this pod's namespace".
-        An empty selector ({}) matches all namespaces.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch(dict):
-    """
-    A label query over the set of namespaces that the term applies to.
-    The term is applied to the union of the namespaces selected by this field
-    and the ones listed in the namespaces field.
-    null selector and null or empty namespaces list means "this pod's namespace".
-    An empty selector ({}) matches all namespaces.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        A label query over the set of namespaces that the term applies to.
-        The term is applied to the union of the namespaces selected by this field
-        and the ones listed in the namespaces field.
-        null selector and null or empty namespaces list means "this pod's namespace".
-        An empty selector ({}) matches all namespaces.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatchArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch(dict):
-    """
-    Required. A pod affinity term, associated with the corresponding weight.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "labelSelector":
-            suggest = "label_selector"
-        elif key == "matchLabelKeys":
-            suggest = "match_label_keys"
-        elif key == "mismatchLabelKeys":
-            suggest = "mismatch_label_keys"
-        elif key == "namespaceSelector":
-            suggest = "namespace_selector"
-        elif key == "topologyKey":
-            suggest = "topology_key"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 label_selector: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch'] = None,
-                 match_label_keys: Optional[Sequence[_builtins.str]] = None,
-                 mismatch_label_keys: Optional[Sequence[_builtins.str]] = None,
-                 namespace_selector: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch'] = None,
-                 namespaces: Optional[Sequence[_builtins.str]] = None,
-                 topology_key: Optional[_builtins.str] = None):
-        """
-        Required. A pod affinity term, associated with the corresponding weight.
-
-        :param Sequence[_builtins.str] match_label_keys: MatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-               Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        :param Sequence[_builtins.str] mismatch_label_keys: MismatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-               Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        :param Sequence[_builtins.str] namespaces: namespaces specifies a static list of namespace names that the term applies to.
-               The term is applied to the union of the namespaces listed in this field
-               and the ones selected by namespaceSelector.
-               null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        :param _builtins.str topology_key: This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-               the labelSelector in the specified namespaces, where co-located is defined as running on a node
-               whose value of the label with key topologyKey matches that of any node on which any of the
-               selected pods is running.
-               Empty topologyKey is not allowed.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if mismatch_label_keys is not None:
-            pulumi.set(__self__, "mismatch_label_keys", mismatch_label_keys)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if namespaces is not None:
-            pulumi.set(__self__, "namespaces", namespaces)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch']:
-        return pulumi.get(self, "label_selector")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-        Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @_builtins.property
-    @pulumi.getter(name="mismatchLabelKeys")
-    def mismatch_label_keys(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        MismatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-        Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "mismatch_label_keys")
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch']:
-        return pulumi.get(self, "namespace_selector")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespaces(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        namespaces specifies a static list of namespace names that the term applies to.
-        The term is applied to the union of the namespaces listed in this field
-        and the ones selected by namespaceSelector.
-        null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        """
-        return pulumi.get(self, "namespaces")
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> Optional[_builtins.str]:
-        """
-        This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-        the labelSelector in the specified namespaces, where co-located is defined as running on a node
-        whose value of the label with key topologyKey matches that of any node on which any of the
-        selected pods is running.
-        Empty topologyKey is not allowed.
-        """
-        return pulumi.get(self, "topology_key")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution(dict):
-    """
-    Defines a set of pods (namely those matching the labelSelector
-    relative to the given namespace(s)) that this pod should be
-    co-located (affinity) or not co-located (anti-affinity) with,
-    where co-located is defined as running on a node whose value of
-    the label with key <topologyKey> matches that of any node on which
-    a pod of the set of pods is running
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "labelSelector":
-            suggest = "label_selector"
-        elif key == "matchLabelKeys":
-            suggest = "match_label_keys"
-        elif key == "mismatchLabelKeys":
-            suggest = "mismatch_label_keys"
-        elif key == "namespaceSelector":
-            suggest = "namespace_selector"
-        elif key == "topologyKey":
-            suggest = "topology_key"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 label_selector: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector'] = None,
-                 match_label_keys: Optional[Sequence[_builtins.str]] = None,
-                 mismatch_label_keys: Optional[Sequence[_builtins.str]] = None,
-                 namespace_selector: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector'] = None,
-                 namespaces: Optional[Sequence[_builtins.str]] = None,
-                 topology_key: Optional[_builtins.str] = None):
-        """
-        Defines a set of pods (namely those matching the labelSelector
-        relative to the given namespace(s)) that this pod should be
-        co-located (affinity) or not co-located (anti-affinity) with,
-        where co-located is defined as running on a node whose value of
-        the label with key <topologyKey> matches that of any node on which
-        a pod of the set of pods is running
-
-        :param Sequence[_builtins.str] match_label_keys: MatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-               Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        :param Sequence[_builtins.str] mismatch_label_keys: MismatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-               Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        :param Sequence[_builtins.str] namespaces: namespaces specifies a static list of namespace names that the term applies to.
-               The term is applied to the union of the namespaces listed in this field
-               and the ones selected by namespaceSelector.
-               null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        :param _builtins.str topology_key: This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-               the labelSelector in the specified namespaces, where co-located is defined as running on a node
-               whose value of the label with key topologyKey matches that of any node on which any of the
-               selected pods is running.
-               Empty topologyKey is not allowed.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if mismatch_label_keys is not None:
-            pulumi.set(__self__, "mismatch_label_keys", mismatch_label_keys)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if namespaces is not None:
-            pulumi.set(__self__, "namespaces", namespaces)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector']:
-        return pulumi.get(self, "label_selector")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-        Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @_builtins.property
-    @pulumi.getter(name="mismatchLabelKeys")
-    def mismatch_label_keys(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        MismatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-        Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "mismatch_label_keys")
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector']:
-        return pulumi.get(self, "namespace_selector")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespaces(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        namespaces specifies a static list of namespace names that the term applies to.
-        The term is applied to the union of the namespaces listed in this field
-        and the ones selected by namespaceSelector.
-        null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        """
-        return pulumi.get(self, "namespaces")
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> Optional[_builtins.str]:
-        """
-        This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-        the labelSelector in the specified namespaces, where co-located is defined as running on a node
-        whose value of the label with key topologyKey matches that of any node on which any of the
-        selected pods is running.
-        Empty topologyKey is not allowed.
-        """
-        return pulumi.get(self, "topology_key")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector(dict):
-    """
-    A label query over a set of resources, in this case pods.
-    If it's null, this PodAffinityTerm matches with no Pods.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        A label query over a set of resources, in this case pods.
-        If it's null, this PodAffinityTerm matches with no Pods.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch(dict):
-    """
-    A label query over a set of resources, in this case pods.
-    If it's null, this PodAffinityTerm matches with no Pods.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        A label query over a set of resources, in this case pods.
-        If it's null, this PodAffinityTerm matches with no Pods.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatchArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector(dict):
-    """
-    A label query over the set of namespaces that the term applies to.
-    The term is applied to the union of the namespaces selected by this field
-    and the ones listed in the namespaces field.
-    null selector and null or empty namespaces list means "this pod's namespace".
-    An empty selector ({}) matches all namespaces.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        A label query over the set of namespaces that the term applies to.
-        The term is applied to the union of the namespaces selected by this field
-        and the ones listed in the namespaces field.
-        null selector and null or empty namespaces list means "this pod's namespace".
-        An empty selector ({}) matches all namespaces.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch(dict):
-    """
-    A label query over the set of namespaces that the term applies to.
-    The term is applied to the union of the namespaces selected by this field
-    and the ones listed in the namespaces field.
-    null selector and null or empty namespaces list means "this pod's namespace".
-    An empty selector ({}) matches all namespaces.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        A label query over the set of namespaces that the term applies to.
-        The term is applied to the union of the namespaces selected by this field
-        and the ones listed in the namespaces field.
-        null selector and null or empty namespaces list means "this pod's namespace".
-        An empty selector ({}) matches all namespaces.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatchArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch(dict):
-    """
-    Defines a set of pods (namely those matching the labelSelector
-    relative to the given namespace(s)) that this pod should be
-    co-located (affinity) or not co-located (anti-affinity) with,
-    where co-located is defined as running on a node whose value of
-    the label with key <topologyKey> matches that of any node on which
-    a pod of the set of pods is running
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "labelSelector":
-            suggest = "label_selector"
-        elif key == "matchLabelKeys":
-            suggest = "match_label_keys"
-        elif key == "mismatchLabelKeys":
-            suggest = "mismatch_label_keys"
-        elif key == "namespaceSelector":
-            suggest = "namespace_selector"
-        elif key == "topologyKey":
-            suggest = "topology_key"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 label_selector: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch'] = None,
-                 match_label_keys: Optional[Sequence[_builtins.str]] = None,
-                 mismatch_label_keys: Optional[Sequence[_builtins.str]] = None,
-                 namespace_selector: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch'] = None,
-                 namespaces: Optional[Sequence[_builtins.str]] = None,
-                 topology_key: Optional[_builtins.str] = None):
-        """
-        Defines a set of pods (namely those matching the labelSelector
-        relative to the given namespace(s)) that this pod should be
-        co-located (affinity) or not co-located (anti-affinity) with,
-        where co-located is defined as running on a node whose value of
-        the label with key <topologyKey> matches that of any node on which
-        a pod of the set of pods is running
-
-        :param Sequence[_builtins.str] match_label_keys: MatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-               Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        :param Sequence[_builtins.str] mismatch_label_keys: MismatchLabelKeys is a set of pod label keys to select which pods will
-               be taken into consideration. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-               to select the group of existing pods which pods will be taken into consideration
-               for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-               pod labels will be ignored. The default value is empty.
-               The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-               Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        :param Sequence[_builtins.str] namespaces: namespaces specifies a static list of namespace names that the term applies to.
-               The term is applied to the union of the namespaces listed in this field
-               and the ones selected by namespaceSelector.
-               null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        :param _builtins.str topology_key: This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-               the labelSelector in the specified namespaces, where co-located is defined as running on a node
-               whose value of the label with key topologyKey matches that of any node on which any of the
-               selected pods is running.
-               Empty topologyKey is not allowed.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if mismatch_label_keys is not None:
-            pulumi.set(__self__, "mismatch_label_keys", mismatch_label_keys)
-        if namespace_selector is not None:
-            pulumi.set(__self__, "namespace_selector", namespace_selector)
-        if namespaces is not None:
-            pulumi.set(__self__, "namespaces", namespaces)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch']:
-        return pulumi.get(self, "label_selector")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key in (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both matchLabelKeys and labelSelector.
-        Also, matchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @_builtins.property
-    @pulumi.getter(name="mismatchLabelKeys")
-    def mismatch_label_keys(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        MismatchLabelKeys is a set of pod label keys to select which pods will
-        be taken into consideration. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are merged with `labelSelector` as `key notin (value)`
-        to select the group of existing pods which pods will be taken into consideration
-        for the incoming pod's pod (anti) affinity. Keys that don't exist in the incoming
-        pod labels will be ignored. The default value is empty.
-        The same key is forbidden to exist in both mismatchLabelKeys and labelSelector.
-        Also, mismatchLabelKeys cannot be set when labelSelector isn't set.
-        """
-        return pulumi.get(self, "mismatch_label_keys")
-
-    @_builtins.property
-    @pulumi.getter(name="namespaceSelector")
-    def namespace_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch']:
-        return pulumi.get(self, "namespace_selector")
-
-    @_builtins.property
-    @pulumi.getter
-    def namespaces(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        namespaces specifies a static list of namespace names that the term applies to.
-        The term is applied to the union of the namespaces listed in this field
-        and the ones selected by namespaceSelector.
-        null or empty namespaces list and null namespaceSelector means "this pod's namespace".
-        """
-        return pulumi.get(self, "namespaces")
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> Optional[_builtins.str]:
-        """
-        This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching
-        the labelSelector in the specified namespaces, where co-located is defined as running on a node
-        whose value of the label with key topologyKey matches that of any node on which any of the
-        selected pods is running.
-        Empty topologyKey is not allowed.
-        """
-        return pulumi.get(self, "topology_key")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodDnsConfig(dict):
-    """
-    DNSConfig defines DNS parameters for the proxy Pod in addition to those generated from DNSPolicy.
-    When DNSPolicy is set to "None", DNSConfig must be specified.
-    https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-dns-config
-    """
-    def __init__(__self__, *,
-                 nameservers: Optional[Sequence[_builtins.str]] = None,
-                 options: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodDnsConfigOptions']] = None,
-                 searches: Optional[Sequence[_builtins.str]] = None):
-        """
-        DNSConfig defines DNS parameters for the proxy Pod in addition to those generated from DNSPolicy.
-        When DNSPolicy is set to "None", DNSConfig must be specified.
-        https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-dns-config
-
-        :param Sequence[_builtins.str] nameservers: A list of DNS name server IP addresses.
-               This will be appended to the base nameservers generated from DNSPolicy.
-               Duplicated nameservers will be removed.
-        :param Sequence['ProxyClassSpecStatefulSetPodDnsConfigOptionsArgs'] options: A list of DNS resolver options.
-               This will be merged with the base options generated from DNSPolicy.
-               Duplicated entries will be removed. Resolution options given in Options
-               will override those that appear in the base DNSPolicy.
-        :param Sequence[_builtins.str] searches: A list of DNS search domains for host-name lookup.
-               This will be appended to the base search paths generated from DNSPolicy.
-               Duplicated search paths will be removed.
-        """
-        if nameservers is not None:
-            pulumi.set(__self__, "nameservers", nameservers)
-        if options is not None:
-            pulumi.set(__self__, "options", options)
-        if searches is not None:
-            pulumi.set(__self__, "searches", searches)
-
-    @_builtins.property
-    @pulumi.getter
-    def nameservers(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        A list of DNS name server IP addresses.
-        This will be appended to the base nameservers generated from DNSPolicy.
-        Duplicated nameservers will be removed.
-        """
-        return pulumi.get(self, "nameservers")
-
-    @_builtins.property
-    @pulumi.getter
-    def options(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodDnsConfigOptions']]:
-        """
-        A list of DNS resolver options.
-        This will be merged with the base options generated from DNSPolicy.
-        Duplicated entries will be removed. Resolution options given in Options
-        will override those that appear in the base DNSPolicy.
-        """
-        return pulumi.get(self, "options")
-
-    @_builtins.property
-    @pulumi.getter
-    def searches(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        A list of DNS search domains for host-name lookup.
-        This will be appended to the base search paths generated from DNSPolicy.
-        Duplicated search paths will be removed.
-        """
-        return pulumi.get(self, "searches")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodDnsConfigOptions(dict):
-    """
-    PodDNSConfigOption defines DNS resolver options of a pod.
-    """
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 value: Optional[_builtins.str] = None):
-        """
-        PodDNSConfigOption defines DNS resolver options of a pod.
-
-        :param _builtins.str name: Name is this DNS resolver option's name.
-               Required.
-        :param _builtins.str value: Value is this DNS resolver option's value.
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name is this DNS resolver option's name.
-        Required.
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> Optional[_builtins.str]:
-        """
-        Value is this DNS resolver option's value.
-        """
-        return pulumi.get(self, "value")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodDnsConfigOptionsPatch(dict):
-    """
-    PodDNSConfigOption defines DNS resolver options of a pod.
-    """
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 value: Optional[_builtins.str] = None):
-        """
-        PodDNSConfigOption defines DNS resolver options of a pod.
-
-        :param _builtins.str name: Name is this DNS resolver option's name.
-               Required.
-        :param _builtins.str value: Value is this DNS resolver option's value.
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name is this DNS resolver option's name.
-        Required.
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> Optional[_builtins.str]:
-        """
-        Value is this DNS resolver option's value.
-        """
-        return pulumi.get(self, "value")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodDnsConfigPatch(dict):
-    """
-    DNSConfig defines DNS parameters for the proxy Pod in addition to those generated from DNSPolicy.
-    When DNSPolicy is set to "None", DNSConfig must be specified.
-    https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-dns-config
-    """
-    def __init__(__self__, *,
-                 nameservers: Optional[Sequence[_builtins.str]] = None,
-                 options: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodDnsConfigOptionsPatch']] = None,
-                 searches: Optional[Sequence[_builtins.str]] = None):
-        """
-        DNSConfig defines DNS parameters for the proxy Pod in addition to those generated from DNSPolicy.
-        When DNSPolicy is set to "None", DNSConfig must be specified.
-        https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-dns-config
-
-        :param Sequence[_builtins.str] nameservers: A list of DNS name server IP addresses.
-               This will be appended to the base nameservers generated from DNSPolicy.
-               Duplicated nameservers will be removed.
-        :param Sequence['ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgs'] options: A list of DNS resolver options.
-               This will be merged with the base options generated from DNSPolicy.
-               Duplicated entries will be removed. Resolution options given in Options
-               will override those that appear in the base DNSPolicy.
-        :param Sequence[_builtins.str] searches: A list of DNS search domains for host-name lookup.
-               This will be appended to the base search paths generated from DNSPolicy.
-               Duplicated search paths will be removed.
-        """
-        if nameservers is not None:
-            pulumi.set(__self__, "nameservers", nameservers)
-        if options is not None:
-            pulumi.set(__self__, "options", options)
-        if searches is not None:
-            pulumi.set(__self__, "searches", searches)
-
-    @_builtins.property
-    @pulumi.getter
-    def nameservers(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        A list of DNS name server IP addresses.
-        This will be appended to the base nameservers generated from DNSPolicy.
-        Duplicated nameservers will be removed.
-        """
-        return pulumi.get(self, "nameservers")
-
-    @_builtins.property
-    @pulumi.getter
-    def options(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodDnsConfigOptionsPatch']]:
-        """
-        A list of DNS resolver options.
-        This will be merged with the base options generated from DNSPolicy.
-        Duplicated entries will be removed. Resolution options given in Options
-        will override those that appear in the base DNSPolicy.
-        """
-        return pulumi.get(self, "options")
-
-    @_builtins.property
-    @pulumi.getter
-    def searches(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        A list of DNS search domains for host-name lookup.
-        This will be appended to the base search paths generated from DNSPolicy.
-        Duplicated search paths will be removed.
-        """
-        return pulumi.get(self, "searches")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodImagePullSecrets(dict):
-    """
-    LocalObjectReference contains enough information to let you locate the
-    referenced object inside the same namespace.
-    """
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None):
-        """
-        LocalObjectReference contains enough information to let you locate the
-        referenced object inside the same namespace.
-
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodImagePullSecretsPatch(dict):
-    """
-    LocalObjectReference contains enough information to let you locate the
-    referenced object inside the same namespace.
-    """
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None):
-        """
-        LocalObjectReference contains enough information to let you locate the
-        referenced object inside the same namespace.
-
-        :param _builtins.str name: Name of the referent.
-               This field is effectively required, but due to backwards compatibility is
-               allowed to be empty. Instances of this type with an empty value here are
-               almost certainly wrong.
-               More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the referent.
-        This field is effectively required, but due to backwards compatibility is
-        allowed to be empty. Instances of this type with an empty value here are
-        almost certainly wrong.
-        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
-        """
-        return pulumi.get(self, "name")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodPatch(dict):
-    """
-    Configuration for the proxy Pod.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "dnsConfig":
-            suggest = "dns_config"
-        elif key == "dnsPolicy":
-            suggest = "dns_policy"
-        elif key == "imagePullSecrets":
-            suggest = "image_pull_secrets"
-        elif key == "nodeName":
-            suggest = "node_name"
-        elif key == "nodeSelector":
-            suggest = "node_selector"
-        elif key == "priorityClassName":
-            suggest = "priority_class_name"
-        elif key == "securityContext":
-            suggest = "security_context"
-        elif key == "tailscaleContainer":
-            suggest = "tailscale_container"
-        elif key == "tailscaleInitContainer":
-            suggest = "tailscale_init_container"
-        elif key == "topologySpreadConstraints":
-            suggest = "topology_spread_constraints"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 affinity: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPatch'] = None,
-                 annotations: Optional[Mapping[str, _builtins.str]] = None,
-                 dns_config: Optional['outputs.ProxyClassSpecStatefulSetPodDnsConfigPatch'] = None,
-                 dns_policy: Optional[_builtins.str] = None,
-                 image_pull_secrets: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodImagePullSecretsPatch']] = None,
-                 labels: Optional[Mapping[str, _builtins.str]] = None,
-                 node_name: Optional[_builtins.str] = None,
-                 node_selector: Optional[Mapping[str, _builtins.str]] = None,
-                 priority_class_name: Optional[_builtins.str] = None,
-                 security_context: Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextPatch'] = None,
-                 tailscale_container: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerPatch'] = None,
-                 tailscale_init_container: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerPatch'] = None,
-                 tolerations: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTolerationsPatch']] = None,
-                 topology_spread_constraints: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatch']] = None):
-        """
-        Configuration for the proxy Pod.
-
-        :param Mapping[str, _builtins.str] annotations: Annotations that will be added to the proxy Pod.
-               Any annotations specified here will be merged with the default
-               annotations applied to the Pod by the Tailscale Kubernetes operator.
-               Annotations must be valid Kubernetes annotations.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-        :param _builtins.str dns_policy: DNSPolicy defines how DNS will be configured for the proxy Pod.
-               By default the Tailscale Kubernetes Operator does not set a DNS policy (uses cluster default).
-               https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-s-dns-policy
-        :param Sequence['ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgs'] image_pull_secrets: Proxy Pod's image pull Secrets.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#PodSpec
-        :param Mapping[str, _builtins.str] labels: Labels that will be added to the proxy Pod.
-               Any labels specified here will be merged with the default labels
-               applied to the Pod by the Tailscale Kubernetes operator.
-               Label keys and values must be valid Kubernetes label keys and values.
-               https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        :param _builtins.str node_name: Proxy Pod's node name.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        :param Mapping[str, _builtins.str] node_selector: Proxy Pod's node selector.
-               By default Tailscale Kubernetes operator does not apply any node
-               selector.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        :param _builtins.str priority_class_name: PriorityClassName for the proxy Pod.
-               By default Tailscale Kubernetes operator does not apply any priority class.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        :param Sequence['ProxyClassSpecStatefulSetPodTolerationsPatchArgs'] tolerations: Proxy Pod's tolerations.
-               By default Tailscale Kubernetes operator does not apply any
-               tolerations.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        :param Sequence['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgs'] topology_spread_constraints: Proxy Pod's topology spread constraints.
-               By default Tailscale Kubernetes operator does not apply any topology spread constraints.
-               https://kubernetes.io/docs/concepts/scheduling-eviction/topology-spread-constraints/
-        """
-        if affinity is not None:
-            pulumi.set(__self__, "affinity", affinity)
-        if annotations is not None:
-            pulumi.set(__self__, "annotations", annotations)
-        if dns_config is not None:
-            pulumi.set(__self__, "dns_config", dns_config)
-        if dns_policy is not None:
-            pulumi.set(__self__, "dns_policy", dns_policy)
-        if image_pull_secrets is not None:
-            pulumi.set(__self__, "image_pull_secrets", image_pull_secrets)
-        if labels is not None:
-            pulumi.set(__self__, "labels", labels)
-        if node_name is not None:
-            pulumi.set(__self__, "node_name", node_name)
-        if node_selector is not None:
-            pulumi.set(__self__, "node_selector", node_selector)
-        if priority_class_name is not None:
-            pulumi.set(__self__, "priority_class_name", priority_class_name)
-        if security_context is not None:
-            pulumi.set(__self__, "security_context", security_context)
-        if tailscale_container is not None:
-            pulumi.set(__self__, "tailscale_container", tailscale_container)
-        if tailscale_init_container is not None:
-            pulumi.set(__self__, "tailscale_init_container", tailscale_init_container)
-        if tolerations is not None:
-            pulumi.set(__self__, "tolerations", tolerations)
-        if topology_spread_constraints is not None:
-            pulumi.set(__self__, "topology_spread_constraints", topology_spread_constraints)
-
-    @_builtins.property
-    @pulumi.getter
-    def affinity(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPatch']:
-        return pulumi.get(self, "affinity")
-
-    @_builtins.property
-    @pulumi.getter
-    def annotations(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        Annotations that will be added to the proxy Pod.
-        Any annotations specified here will be merged with the default
-        annotations applied to the Pod by the Tailscale Kubernetes operator.
-        Annotations must be valid Kubernetes annotations.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
-        """
-        return pulumi.get(self, "annotations")
-
-    @_builtins.property
-    @pulumi.getter(name="dnsConfig")
-    def dns_config(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodDnsConfigPatch']:
-        return pulumi.get(self, "dns_config")
-
-    @_builtins.property
-    @pulumi.getter(name="dnsPolicy")
-    def dns_policy(self) -> Optional[_builtins.str]:
-        """
-        DNSPolicy defines how DNS will be configured for the proxy Pod.
-        By default the Tailscale Kubernetes Operator does not set a DNS policy (uses cluster default).
-        https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-s-dns-policy
-        """
-        return pulumi.get(self, "dns_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="imagePullSecrets")
-    def image_pull_secrets(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodImagePullSecretsPatch']]:
-        """
-        Proxy Pod's image pull Secrets.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#PodSpec
-        """
-        return pulumi.get(self, "image_pull_secrets")
-
-    @_builtins.property
-    @pulumi.getter
-    def labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        Labels that will be added to the proxy Pod.
-        Any labels specified here will be merged with the default labels
-        applied to the Pod by the Tailscale Kubernetes operator.
-        Label keys and values must be valid Kubernetes label keys and values.
-        https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
-        """
-        return pulumi.get(self, "labels")
-
-    @_builtins.property
-    @pulumi.getter(name="nodeName")
-    def node_name(self) -> Optional[_builtins.str]:
-        """
-        Proxy Pod's node name.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        """
-        return pulumi.get(self, "node_name")
-
-    @_builtins.property
-    @pulumi.getter(name="nodeSelector")
-    def node_selector(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        Proxy Pod's node selector.
-        By default Tailscale Kubernetes operator does not apply any node
-        selector.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        """
-        return pulumi.get(self, "node_selector")
-
-    @_builtins.property
-    @pulumi.getter(name="priorityClassName")
-    def priority_class_name(self) -> Optional[_builtins.str]:
-        """
-        PriorityClassName for the proxy Pod.
-        By default Tailscale Kubernetes operator does not apply any priority class.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        """
-        return pulumi.get(self, "priority_class_name")
-
-    @_builtins.property
-    @pulumi.getter(name="securityContext")
-    def security_context(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextPatch']:
-        return pulumi.get(self, "security_context")
-
-    @_builtins.property
-    @pulumi.getter(name="tailscaleContainer")
-    def tailscale_container(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerPatch']:
-        return pulumi.get(self, "tailscale_container")
-
-    @_builtins.property
-    @pulumi.getter(name="tailscaleInitContainer")
-    def tailscale_init_container(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerPatch']:
-        return pulumi.get(self, "tailscale_init_container")
-
-    @_builtins.property
-    @pulumi.getter
-    def tolerations(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTolerationsPatch']]:
-        """
-        Proxy Pod's tolerations.
-        By default Tailscale Kubernetes operator does not apply any
-        tolerations.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
-        """
-        return pulumi.get(self, "tolerations")
-
-    @_builtins.property
-    @pulumi.getter(name="topologySpreadConstraints")
-    def topology_spread_constraints(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatch']]:
-        """
-        Proxy Pod's topology spread constraints.
-        By default Tailscale Kubernetes operator does not apply any topology spread constraints.
-        https://kubernetes.io/docs/concepts/scheduling-eviction/topology-spread-constraints/
-        """
-        return pulumi.get(self, "topology_spread_constraints")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodSecurityContext(dict):
-    """
-    Proxy Pod's security context.
-    By default Tailscale Kubernetes operator does not apply any Pod
-    security context.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context-2
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "appArmorProfile":
-            suggest = "app_armor_profile"
-        elif key == "fsGroup":
-            suggest = "fs_group"
-        elif key == "fsGroupChangePolicy":
-            suggest = "fs_group_change_policy"
-        elif key == "runAsGroup":
-            suggest = "run_as_group"
-        elif key == "runAsNonRoot":
-            suggest = "run_as_non_root"
-        elif key == "runAsUser":
-            suggest = "run_as_user"
-        elif key == "seLinuxChangePolicy":
-            suggest = "se_linux_change_policy"
-        elif key == "seLinuxOptions":
-            suggest = "se_linux_options"
-        elif key == "seccompProfile":
-            suggest = "seccomp_profile"
-        elif key == "supplementalGroups":
-            suggest = "supplemental_groups"
-        elif key == "supplementalGroupsPolicy":
-            suggest = "supplemental_groups_policy"
-        elif key == "windowsOptions":
-            suggest = "windows_options"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodSecurityContext. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodSecurityContext.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodSecurityContext.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 app_armor_profile: Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfile'] = None,
-                 fs_group: Optional[_builtins.int] = None,
-                 fs_group_change_policy: Optional[_builtins.str] = None,
-                 run_as_group: Optional[_builtins.int] = None,
-                 run_as_non_root: Optional[_builtins.bool] = None,
-                 run_as_user: Optional[_builtins.int] = None,
-                 se_linux_change_policy: Optional[_builtins.str] = None,
-                 se_linux_options: Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptions'] = None,
-                 seccomp_profile: Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextSeccompProfile'] = None,
-                 supplemental_groups: Optional[Sequence[_builtins.int]] = None,
-                 supplemental_groups_policy: Optional[_builtins.str] = None,
-                 sysctls: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodSecurityContextSysctls']] = None,
-                 windows_options: Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextWindowsOptions'] = None):
-        """
-        Proxy Pod's security context.
-        By default Tailscale Kubernetes operator does not apply any Pod
-        security context.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context-2
-
-        :param _builtins.int fs_group: A special supplemental group that applies to all containers in a pod.
-               Some volume types allow the Kubelet to change the ownership of that volume
-               to be owned by the pod:
-
-               1. The owning GID will be the FSGroup
-               2. The setgid bit is set (new files created in the volume will be owned by FSGroup)
-               3. The permission bits are OR'd with rw-rw----
-
-               If unset, the Kubelet will not modify the ownership and permissions of any volume.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.str fs_group_change_policy: fsGroupChangePolicy defines behavior of changing ownership and permission of the volume
-               before being exposed inside Pod. This field will only apply to
-               volume types which support fsGroup based ownership(and permissions).
-               It will have no effect on ephemeral volume types such as: secret, configmaps
-               and emptydir.
-               Valid values are "OnRootMismatch" and "Always". If not specified, "Always" is used.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.int run_as_group: The GID to run the entrypoint of the container process.
-               Uses runtime default if unset.
-               May also be set in SecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence
-               for that container.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.bool run_as_non_root: Indicates that the container must run as a non-root user.
-               If true, the Kubelet will validate the image at runtime to ensure that it
-               does not run as UID 0 (root) and fail to start the container if it does.
-               If unset or false, no such validation will be performed.
-               May also be set in SecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        :param _builtins.int run_as_user: The UID to run the entrypoint of the container process.
-               Defaults to user specified in image metadata if unspecified.
-               May also be set in SecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence
-               for that container.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.str se_linux_change_policy: seLinuxChangePolicy defines how the container's SELinux label is applied to all volumes used by the Pod.
-               It has no effect on nodes that do not support SELinux or to volumes does not support SELinux.
-               Valid values are "MountOption" and "Recursive".
-
-               "Recursive" means relabeling of all files on all Pod volumes by the container runtime.
-               This may be slow for large volumes, but allows mixing privileged and unprivileged Pods sharing the same volume on the same node.
-
-               "MountOption" mounts all eligible Pod volumes with `-o context` mount option.
-               This requires all Pods that share the same volume to use the same SELinux label.
-               It is not possible to share the same volume among privileged and unprivileged Pods.
-               Eligible volumes are in-tree FibreChannel and iSCSI volumes, and all CSI volumes
-               whose CSI driver announces SELinux support by setting spec.seLinuxMount: true in their
-               CSIDriver instance. Other volumes are always re-labelled recursively.
-               "MountOption" value is allowed only when SELinuxMount feature gate is enabled.
-
-               If not specified and SELinuxMount feature gate is enabled, "MountOption" is used.
-               If not specified and SELinuxMount feature gate is disabled, "MountOption" is used for ReadWriteOncePod volumes
-               and "Recursive" for all other volumes.
-
-               This field affects only Pods that have SELinux label set, either in PodSecurityContext or in SecurityContext of all containers.
-
-               All Pods that use the same volume should use the same seLinuxChangePolicy, otherwise some pods can get stuck in ContainerCreating state.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param Sequence[_builtins.int] supplemental_groups: A list of groups applied to the first process run in each container, in
-               addition to the container's primary GID and fsGroup (if specified).  If
-               the SupplementalGroupsPolicy feature is enabled, the
-               supplementalGroupsPolicy field determines whether these are in addition
-               to or instead of any group memberships defined in the container image.
-               If unspecified, no additional groups are added, though group memberships
-               defined in the container image may still be used, depending on the
-               supplementalGroupsPolicy field.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.str supplemental_groups_policy: Defines how supplemental groups of the first container processes are calculated.
-               Valid values are "Merge" and "Strict". If not specified, "Merge" is used.
-               (Alpha) Using the field requires the SupplementalGroupsPolicy feature gate to be enabled
-               and the container runtime must implement support for this feature.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param Sequence['ProxyClassSpecStatefulSetPodSecurityContextSysctlsArgs'] sysctls: Sysctls hold a list of namespaced sysctls used for the pod. Pods with unsupported
-               sysctls (by the container runtime) might fail to launch.
-               Note that this field cannot be set when spec.os.name is windows.
-        """
-        if app_armor_profile is not None:
-            pulumi.set(__self__, "app_armor_profile", app_armor_profile)
-        if fs_group is not None:
-            pulumi.set(__self__, "fs_group", fs_group)
-        if fs_group_change_policy is not None:
-            pulumi.set(__self__, "fs_group_change_policy", fs_group_change_policy)
-        if run_as_group is not None:
-            pulumi.set(__self__, "run_as_group", run_as_group)
-        if run_as_non_root is not None:
-            pulumi.set(__self__, "run_as_non_root", run_as_non_root)
-        if run_as_user is not None:
-            pulumi.set(__self__, "run_as_user", run_as_user)
-        if se_linux_change_policy is not None:
-            pulumi.set(__self__, "se_linux_change_policy", se_linux_change_policy)
-        if se_linux_options is not None:
-            pulumi.set(__self__, "se_linux_options", se_linux_options)
-        if seccomp_profile is not None:
-            pulumi.set(__self__, "seccomp_profile", seccomp_profile)
-        if supplemental_groups is not None:
-            pulumi.set(__self__, "supplemental_groups", supplemental_groups)
-        if supplemental_groups_policy is not None:
-            pulumi.set(__self__, "supplemental_groups_policy", supplemental_groups_policy)
-        if sysctls is not None:
-            pulumi.set(__self__, "sysctls", sysctls)
-        if windows_options is not None:
-            pulumi.set(__self__, "windows_options", windows_options)
-
-    @_builtins.property
-    @pulumi.getter(name="appArmorProfile")
-    def app_armor_profile(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfile']:
-        return pulumi.get(self, "app_armor_profile")
-
-    @_builtins.property
-    @pulumi.getter(name="fsGroup")
-    def fs_group(self) -> Optional[_builtins.int]:
-        """
-        A special supplemental group that applies to all containers in a pod.
-        Some volume types allow the Kubelet to change the ownership of that volume
-        to be owned by the pod:
-
-        1. The owning GID will be the FSGroup
-        2. The setgid bit is set (new files created in the volume will be owned by FSGroup)
-        3. The permission bits are OR'd with rw-rw----
-
-        If unset, the Kubelet will not modify the ownership and permissions of any volume.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "fs_group")
-
-    @_builtins.property
-    @pulumi.getter(name="fsGroupChangePolicy")
-    def fs_group_change_policy(self) -> Optional[_builtins.str]:
-        """
-        fsGroupChangePolicy defines behavior of changing ownership and permission of the volume
-        before being exposed inside Pod. This field will only apply to
-        volume types which support fsGroup based ownership(and permissions).
-        It will have no effect on ephemeral volume types such as: secret, configmaps
-        and emptydir.
-        Valid values are "OnRootMismatch" and "Always". If not specified, "Always" is used.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "fs_group_change_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsGroup")
-    def run_as_group(self) -> Optional[_builtins.int]:
-        """
-        The GID to run the entrypoint of the container process.
-        Uses runtime default if unset.
-        May also be set in SecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence
-        for that container.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_group")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsNonRoot")
-    def run_as_non_root(self) -> Optional[_builtins.bool]:
-        """
-        Indicates that the container must run as a non-root user.
-        If true, the Kubelet will validate the image at runtime to ensure that it
-        does not run as UID 0 (root) and fail to start the container if it does.
-        If unset or false, no such validation will be performed.
-        May also be set in SecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_non_root")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUser")
-    def run_as_user(self) -> Optional[_builtins.int]:
-        """
-        The UID to run the entrypoint of the container process.
-        Defaults to user specified in image metadata if unspecified.
-        May also be set in SecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence
-        for that container.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_user")
-
-    @_builtins.property
-    @pulumi.getter(name="seLinuxChangePolicy")
-    def se_linux_change_policy(self) -> Optional[_builtins.str]:
-        """
-        seLinuxChangePolicy defines how the container's SELinux label is applied to all volumes used by the Pod.
-        It has no effect on nodes that do not support SELinux or to volumes does not support SELinux.
-        Valid values are "MountOption" and "Recursive".
-
-        "Recursive" means relabeling of all files on all Pod volumes by the container runtime.
-        This may be slow for large volumes, but allows mixing privileged and unprivileged Pods sharing the same volume on the same node.
-
-        "MountOption" mounts all eligible Pod volumes with `-o context` mount option.
-        This requires all Pods that share the same volume to use the same SELinux label.
-        It is not possible to share the same volume among privileged and unprivileged Pods.
-        Eligible volumes are in-tree FibreChannel and iSCSI volumes, and all CSI volumes
-        whose CSI driver announces SELinux support by setting spec.seLinuxMount: true in their
-        CSIDriver instance. Other volumes are always re-labelled recursively.
-        "MountOption" value is allowed only when SELinuxMount feature gate is enabled.
-
-        If not specified and SELinuxMount feature gate is enabled, "MountOption" is used.
-        If not specified and SELinuxMount feature gate is disabled, "MountOption" is used for ReadWriteOncePod volumes
-        and "Recursive" for all other volumes.
-
-        This field affects only Pods that have SELinux label set, either in PodSecurityContext or in SecurityContext of all containers.
-
-        All Pods that use the same volume should use the same seLinuxChangePolicy, otherwise some pods can get stuck in ContainerCreating state.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "se_linux_change_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="seLinuxOptions")
-    def se_linux_options(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptions']:
-        return pulumi.get(self, "se_linux_options")
-
-    @_builtins.property
-    @pulumi.getter(name="seccompProfile")
-    def seccomp_profile(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextSeccompProfile']:
-        return pulumi.get(self, "seccomp_profile")
-
-    @_builtins.property
-    @pulumi.getter(name="supplementalGroups")
-    def supplemental_groups(self) -> Optional[Sequence[_builtins.int]]:
-        """
-        A list of groups applied to the first process run in each container, in
-        addition to the container's primary GID and fsGroup (if specified).  If
-        the SupplementalGroupsPolicy feature is enabled, the
-        supplementalGroupsPolicy field determines whether these are in addition
-        to or instead of any group memberships defined in the container image.
-        If unspecified, no additional groups are added, though group memberships
-        defined in the container image may still be used, depending on the
-        supplementalGroupsPolicy field.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "supplemental_groups")
-
-    @_builtins.property
-    @pulumi.getter(name="supplementalGroupsPolicy")
-    def supplemental_groups_policy(self) -> Optional[_builtins.str]:
-        """
-        Defines how supplemental groups of the first container processes are calculated.
-        Valid values are "Merge" and "Strict". If not specified, "Merge" is used.
-        (Alpha) Using the field requires the SupplementalGroupsPolicy feature gate to be enabled
-        and the container runtime must implement support for this feature.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "supplemental_groups_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def sysctls(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodSecurityContextSysctls']]:
-        """
-        Sysctls hold a list of namespaced sysctls used for the pod. Pods with unsupported
-        sysctls (by the container runtime) might fail to launch.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "sysctls")
-
-    @_builtins.property
-    @pulumi.getter(name="windowsOptions")
-    def windows_options(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextWindowsOptions']:
-        return pulumi.get(self, "windows_options")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfile(dict):
-    """
-    appArmorProfile is the AppArmor options to use by the containers in this pod.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "localhostProfile":
-            suggest = "localhost_profile"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfile. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfile.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfile.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 localhost_profile: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        appArmorProfile is the AppArmor options to use by the containers in this pod.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param _builtins.str localhost_profile: localhostProfile indicates a profile loaded on the node that should be used.
-               The profile must be preconfigured on the node to work.
-               Must match the loaded name of the profile.
-               Must be set if and only if type is "Localhost".
-        :param _builtins.str type: type indicates which kind of AppArmor profile will be applied.
-               Valid options are:
-                 Localhost - a profile pre-loaded on the node.
-                 RuntimeDefault - the container runtime's default profile.
-                 Unconfined - no AppArmor enforcement.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> Optional[_builtins.str]:
-        """
-        localhostProfile indicates a profile loaded on the node that should be used.
-        The profile must be preconfigured on the node to work.
-        Must match the loaded name of the profile.
-        Must be set if and only if type is "Localhost".
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type indicates which kind of AppArmor profile will be applied.
-        Valid options are:
-          Localhost - a profile pre-loaded on the node.
-          RuntimeDefault - the container runtime's default profile.
-          Unconfined - no AppArmor enforcement.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatch(dict):
-    """
-    appArmorProfile is the AppArmor options to use by the containers in this pod.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "localhostProfile":
-            suggest = "localhost_profile"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 localhost_profile: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        appArmorProfile is the AppArmor options to use by the containers in this pod.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param _builtins.str localhost_profile: localhostProfile indicates a profile loaded on the node that should be used.
-               The profile must be preconfigured on the node to work.
-               Must match the loaded name of the profile.
-               Must be set if and only if type is "Localhost".
-        :param _builtins.str type: type indicates which kind of AppArmor profile will be applied.
-               Valid options are:
-                 Localhost - a profile pre-loaded on the node.
-                 RuntimeDefault - the container runtime's default profile.
-                 Unconfined - no AppArmor enforcement.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> Optional[_builtins.str]:
-        """
-        localhostProfile indicates a profile loaded on the node that should be used.
-        The profile must be preconfigured on the node to work.
-        Must match the loaded name of the profile.
-        Must be set if and only if type is "Localhost".
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type indicates which kind of AppArmor profile will be applied.
-        Valid options are:
-          Localhost - a profile pre-loaded on the node.
-          RuntimeDefault - the container runtime's default profile.
-          Unconfined - no AppArmor enforcement.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodSecurityContextPatch(dict):
-    """
-    Proxy Pod's security context.
-    By default Tailscale Kubernetes operator does not apply any Pod
-    security context.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context-2
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "appArmorProfile":
-            suggest = "app_armor_profile"
-        elif key == "fsGroup":
-            suggest = "fs_group"
-        elif key == "fsGroupChangePolicy":
-            suggest = "fs_group_change_policy"
-        elif key == "runAsGroup":
-            suggest = "run_as_group"
-        elif key == "runAsNonRoot":
-            suggest = "run_as_non_root"
-        elif key == "runAsUser":
-            suggest = "run_as_user"
-        elif key == "seLinuxChangePolicy":
-            suggest = "se_linux_change_policy"
-        elif key == "seLinuxOptions":
-            suggest = "se_linux_options"
-        elif key == "seccompProfile":
-            suggest = "seccomp_profile"
-        elif key == "supplementalGroups":
-            suggest = "supplemental_groups"
-        elif key == "supplementalGroupsPolicy":
-            suggest = "supplemental_groups_policy"
-        elif key == "windowsOptions":
-            suggest = "windows_options"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodSecurityContextPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodSecurityContextPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodSecurityContextPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 app_armor_profile: Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatch'] = None,
-                 fs_group: Optional[_builtins.int] = None,
-                 fs_group_change_policy: Optional[_builtins.str] = None,
-                 run_as_group: Optional[_builtins.int] = None,
-                 run_as_non_root: Optional[_builtins.bool] = None,
-                 run_as_user: Optional[_builtins.int] = None,
-                 se_linux_change_policy: Optional[_builtins.str] = None,
-                 se_linux_options: Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatch'] = None,
-                 seccomp_profile: Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatch'] = None,
-                 supplemental_groups: Optional[Sequence[_builtins.int]] = None,
-                 supplemental_groups_policy: Optional[_builtins.str] = None,
-                 sysctls: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatch']] = None,
-                 windows_options: Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatch'] = None):
-        """
-        Proxy Pod's security context.
-        By default Tailscale Kubernetes operator does not apply any Pod
-        security context.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context-2
-
-        :param _builtins.int fs_group: A special supplemental group that applies to all containers in a pod.
-               Some volume types allow the Kubelet to change the ownership of that volume
-               to be owned by the pod:
-
-               1. The owning GID will be the FSGroup
-               2. The setgid bit is set (new files created in the volume will be owned by FSGroup)
-               3. The permission bits are OR'd with rw-rw----
-
-               If unset, the Kubelet will not modify the ownership and permissions of any volume.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.str fs_group_change_policy: fsGroupChangePolicy defines behavior of changing ownership and permission of the volume
-               before being exposed inside Pod. This field will only apply to
-               volume types which support fsGroup based ownership(and permissions).
-               It will have no effect on ephemeral volume types such as: secret, configmaps
-               and emptydir.
-               Valid values are "OnRootMismatch" and "Always". If not specified, "Always" is used.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.int run_as_group: The GID to run the entrypoint of the container process.
-               Uses runtime default if unset.
-               May also be set in SecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence
-               for that container.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.bool run_as_non_root: Indicates that the container must run as a non-root user.
-               If true, the Kubelet will validate the image at runtime to ensure that it
-               does not run as UID 0 (root) and fail to start the container if it does.
-               If unset or false, no such validation will be performed.
-               May also be set in SecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        :param _builtins.int run_as_user: The UID to run the entrypoint of the container process.
-               Defaults to user specified in image metadata if unspecified.
-               May also be set in SecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence
-               for that container.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.str se_linux_change_policy: seLinuxChangePolicy defines how the container's SELinux label is applied to all volumes used by the Pod.
-               It has no effect on nodes that do not support SELinux or to volumes does not support SELinux.
-               Valid values are "MountOption" and "Recursive".
-
-               "Recursive" means relabeling of all files on all Pod volumes by the container runtime.
-               This may be slow for large volumes, but allows mixing privileged and unprivileged Pods sharing the same volume on the same node.
-
-               "MountOption" mounts all eligible Pod volumes with `-o context` mount option.
-               This requires all Pods that share the same volume to use the same SELinux label.
-               It is not possible to share the same volume among privileged and unprivileged Pods.
-               Eligible volumes are in-tree FibreChannel and iSCSI volumes, and all CSI volumes
-               whose CSI driver announces SELinux support by setting spec.seLinuxMount: true in their
-               CSIDriver instance. Other volumes are always re-labelled recursively.
-               "MountOption" value is allowed only when SELinuxMount feature gate is enabled.
-
-               If not specified and SELinuxMount feature gate is enabled, "MountOption" is used.
-               If not specified and SELinuxMount feature gate is disabled, "MountOption" is used for ReadWriteOncePod volumes
-               and "Recursive" for all other volumes.
-
-               This field affects only Pods that have SELinux label set, either in PodSecurityContext or in SecurityContext of all containers.
-
-               All Pods that use the same volume should use the same seLinuxChangePolicy, otherwise some pods can get stuck in ContainerCreating state.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param Sequence[_builtins.int] supplemental_groups: A list of groups applied to the first process run in each container, in
-               addition to the container's primary GID and fsGroup (if specified).  If
-               the SupplementalGroupsPolicy feature is enabled, the
-               supplementalGroupsPolicy field determines whether these are in addition
-               to or instead of any group memberships defined in the container image.
-               If unspecified, no additional groups are added, though group memberships
-               defined in the container image may still be used, depending on the
-               supplementalGroupsPolicy field.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.str supplemental_groups_policy: Defines how supplemental groups of the first container processes are calculated.
-               Valid values are "Merge" and "Strict". If not specified, "Merge" is used.
-               (Alpha) Using the field requires the SupplementalGroupsPolicy feature gate to be enabled
-               and the container runtime must implement support for this feature.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param Sequence['ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatchArgs'] sysctls: Sysctls hold a list of namespaced sysctls used for the pod. Pods with unsupported
-               sysctls (by the container runtime) might fail to launch.
-               Note that this field cannot be set when spec.os.name is windows.
-        """
-        if app_armor_profile is not None:
-            pulumi.set(__self__, "app_armor_profile", app_armor_profile)
-        if fs_group is not None:
-            pulumi.set(__self__, "fs_group", fs_group)
-        if fs_group_change_policy is not None:
-            pulumi.set(__self__, "fs_group_change_policy", fs_group_change_policy)
-        if run_as_group is not None:
-            pulumi.set(__self__, "run_as_group", run_as_group)
-        if run_as_non_root is not None:
-            pulumi.set(__self__, "run_as_non_root", run_as_non_root)
-        if run_as_user is not None:
-            pulumi.set(__self__, "run_as_user", run_as_user)
-        if se_linux_change_policy is not None:
-            pulumi.set(__self__, "se_linux_change_policy", se_linux_change_policy)
-        if se_linux_options is not None:
-            pulumi.set(__self__, "se_linux_options", se_linux_options)
-        if seccomp_profile is not None:
-            pulumi.set(__self__, "seccomp_profile", seccomp_profile)
-        if supplemental_groups is not None:
-            pulumi.set(__self__, "supplemental_groups", supplemental_groups)
-        if supplemental_groups_policy is not None:
-            pulumi.set(__self__, "supplemental_groups_policy", supplemental_groups_policy)
-        if sysctls is not None:
-            pulumi.set(__self__, "sysctls", sysctls)
-        if windows_options is not None:
-            pulumi.set(__self__, "windows_options", windows_options)
-
-    @_builtins.property
-    @pulumi.getter(name="appArmorProfile")
-    def app_armor_profile(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatch']:
-        return pulumi.get(self, "app_armor_profile")
-
-    @_builtins.property
-    @pulumi.getter(name="fsGroup")
-    def fs_group(self) -> Optional[_builtins.int]:
-        """
-        A special supplemental group that applies to all containers in a pod.
-        Some volume types allow the Kubelet to change the ownership of that volume
-        to be owned by the pod:
-
-        1. The owning GID will be the FSGroup
-        2. The setgid bit is set (new files created in the volume will be owned by FSGroup)
-        3. The permission bits are OR'd with rw-rw----
-
-        If unset, the Kubelet will not modify the ownership and permissions of any volume.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "fs_group")
-
-    @_builtins.property
-    @pulumi.getter(name="fsGroupChangePolicy")
-    def fs_group_change_policy(self) -> Optional[_builtins.str]:
-        """
-        fsGroupChangePolicy defines behavior of changing ownership and permission of the volume
-        before being exposed inside Pod. This field will only apply to
-        volume types which support fsGroup based ownership(and permissions).
-        It will have no effect on ephemeral volume types such as: secret, configmaps
-        and emptydir.
-        Valid values are "OnRootMismatch" and "Always". If not specified, "Always" is used.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "fs_group_change_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsGroup")
-    def run_as_group(self) -> Optional[_builtins.int]:
-        """
-        The GID to run the entrypoint of the container process.
-        Uses runtime default if unset.
-        May also be set in SecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence
-        for that container.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_group")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsNonRoot")
-    def run_as_non_root(self) -> Optional[_builtins.bool]:
-        """
-        Indicates that the container must run as a non-root user.
-        If true, the Kubelet will validate the image at runtime to ensure that it
-        does not run as UID 0 (root) and fail to start the container if it does.
-        If unset or false, no such validation will be performed.
-        May also be set in SecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_non_root")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUser")
-    def run_as_user(self) -> Optional[_builtins.int]:
-        """
-        The UID to run the entrypoint of the container process.
-        Defaults to user specified in image metadata if unspecified.
-        May also be set in SecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence
-        for that container.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_user")
-
-    @_builtins.property
-    @pulumi.getter(name="seLinuxChangePolicy")
-    def se_linux_change_policy(self) -> Optional[_builtins.str]:
-        """
-        seLinuxChangePolicy defines how the container's SELinux label is applied to all volumes used by the Pod.
-        It has no effect on nodes that do not support SELinux or to volumes does not support SELinux.
-        Valid values are "MountOption" and "Recursive".
-
-        "Recursive" means relabeling of all files on all Pod volumes by the container runtime.
-        This may be slow for large volumes, but allows mixing privileged and unprivileged Pods sharing the same volume on the same node.
-
-        "MountOption" mounts all eligible Pod volumes with `-o context` mount option.
-        This requires all Pods that share the same volume to use the same SELinux label.
-        It is not possible to share the same volume among privileged and unprivileged Pods.
-        Eligible volumes are in-tree FibreChannel and iSCSI volumes, and all CSI volumes
-        whose CSI driver announces SELinux support by setting spec.seLinuxMount: true in their
-        CSIDriver instance. Other volumes are always re-labelled recursively.
-        "MountOption" value is allowed only when SELinuxMount feature gate is enabled.
-
-        If not specified and SELinuxMount feature gate is enabled, "MountOption" is used.
-        If not specified and SELinuxMount feature gate is disabled, "MountOption" is used for ReadWriteOncePod volumes
-        and "Recursive" for all other volumes.
-
-        This field affects only Pods that have SELinux label set, either in PodSecurityContext or in SecurityContext of all containers.
-
-        All Pods that use the same volume should use the same seLinuxChangePolicy, otherwise some pods can get stuck in ContainerCreating state.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "se_linux_change_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="seLinuxOptions")
-    def se_linux_options(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatch']:
-        return pulumi.get(self, "se_linux_options")
-
-    @_builtins.property
-    @pulumi.getter(name="seccompProfile")
-    def seccomp_profile(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatch']:
-        return pulumi.get(self, "seccomp_profile")
-
-    @_builtins.property
-    @pulumi.getter(name="supplementalGroups")
-    def supplemental_groups(self) -> Optional[Sequence[_builtins.int]]:
-        """
-        A list of groups applied to the first process run in each container, in
-        addition to the container's primary GID and fsGroup (if specified).  If
-        the SupplementalGroupsPolicy feature is enabled, the
-        supplementalGroupsPolicy field determines whether these are in addition
-        to or instead of any group memberships defined in the container image.
-        If unspecified, no additional groups are added, though group memberships
-        defined in the container image may still be used, depending on the
-        supplementalGroupsPolicy field.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "supplemental_groups")
-
-    @_builtins.property
-    @pulumi.getter(name="supplementalGroupsPolicy")
-    def supplemental_groups_policy(self) -> Optional[_builtins.str]:
-        """
-        Defines how supplemental groups of the first container processes are calculated.
-        Valid values are "Merge" and "Strict". If not specified, "Merge" is used.
-        (Alpha) Using the field requires the SupplementalGroupsPolicy feature gate to be enabled
-        and the container runtime must implement support for this feature.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "supplemental_groups_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def sysctls(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatch']]:
-        """
-        Sysctls hold a list of namespaced sysctls used for the pod. Pods with unsupported
-        sysctls (by the container runtime) might fail to launch.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "sysctls")
-
-    @_builtins.property
-    @pulumi.getter(name="windowsOptions")
-    def windows_options(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatch']:
-        return pulumi.get(self, "windows_options")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptions(dict):
-    """
-    The SELinux context to be applied to all containers.
-    If unspecified, the container runtime will allocate a random SELinux context for each
-    container.  May also be set in SecurityContext.  If set in
-    both SecurityContext and PodSecurityContext, the value specified in SecurityContext
-    takes precedence for that container.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    def __init__(__self__, *,
-                 level: Optional[_builtins.str] = None,
-                 role: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None,
-                 user: Optional[_builtins.str] = None):
-        """
-        The SELinux context to be applied to all containers.
-        If unspecified, the container runtime will allocate a random SELinux context for each
-        container.  May also be set in SecurityContext.  If set in
-        both SecurityContext and PodSecurityContext, the value specified in SecurityContext
-        takes precedence for that container.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param _builtins.str level: Level is SELinux level label that applies to the container.
-        :param _builtins.str role: Role is a SELinux role label that applies to the container.
-        :param _builtins.str type: Type is a SELinux type label that applies to the container.
-        :param _builtins.str user: User is a SELinux user label that applies to the container.
-        """
-        if level is not None:
-            pulumi.set(__self__, "level", level)
-        if role is not None:
-            pulumi.set(__self__, "role", role)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-        if user is not None:
-            pulumi.set(__self__, "user", user)
-
-    @_builtins.property
-    @pulumi.getter
-    def level(self) -> Optional[_builtins.str]:
-        """
-        Level is SELinux level label that applies to the container.
-        """
-        return pulumi.get(self, "level")
-
-    @_builtins.property
-    @pulumi.getter
-    def role(self) -> Optional[_builtins.str]:
-        """
-        Role is a SELinux role label that applies to the container.
-        """
-        return pulumi.get(self, "role")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        Type is a SELinux type label that applies to the container.
-        """
-        return pulumi.get(self, "type")
-
-    @_builtins.property
-    @pulumi.getter
-    def user(self) -> Optional[_builtins.str]:
-        """
-        User is a SELinux user label that applies to the container.
-        """
-        return pulumi.get(self, "user")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatch(dict):
-    """
-    The SELinux context to be applied to all containers.
-    If unspecified, the container runtime will allocate a random SELinux context for each
-    container.  May also be set in SecurityContext.  If set in
-    both SecurityContext and PodSecurityContext, the value specified in SecurityContext
-    takes precedence for that container.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    def __init__(__self__, *,
-                 level: Optional[_builtins.str] = None,
-                 role: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None,
-                 user: Optional[_builtins.str] = None):
-        """
-        The SELinux context to be applied to all containers.
-        If unspecified, the container runtime will allocate a random SELinux context for each
-        container.  May also be set in SecurityContext.  If set in
-        both SecurityContext and PodSecurityContext, the value specified in SecurityContext
-        takes precedence for that container.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param _builtins.str level: Level is SELinux level label that applies to the container.
-        :param _builtins.str role: Role is a SELinux role label that applies to the container.
-        :param _builtins.str type: Type is a SELinux type label that applies to the container.
-        :param _builtins.str user: User is a SELinux user label that applies to the container.
-        """
-        if level is not None:
-            pulumi.set(__self__, "level", level)
-        if role is not None:
-            pulumi.set(__self__, "role", role)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-        if user is not None:
-            pulumi.set(__self__, "user", user)
-
-    @_builtins.property
-    @pulumi.getter
-    def level(self) -> Optional[_builtins.str]:
-        """
-        Level is SELinux level label that applies to the container.
-        """
-        return pulumi.get(self, "level")
-
-    @_builtins.property
-    @pulumi.getter
-    def role(self) -> Optional[_builtins.str]:
-        """
-        Role is a SELinux role label that applies to the container.
-        """
-        return pulumi.get(self, "role")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        Type is a SELinux type label that applies to the container.
-        """
-        return pulumi.get(self, "type")
-
-    @_builtins.property
-    @pulumi.getter
-    def user(self) -> Optional[_builtins.str]:
-        """
-        User is a SELinux user label that applies to the container.
-        """
-        return pulumi.get(self, "user")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodSecurityContextSeccompProfile(dict):
-    """
-    The seccomp options to use by the containers in this pod.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "localhostProfile":
-            suggest = "localhost_profile"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodSecurityContextSeccompProfile. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodSecurityContextSeccompProfile.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodSecurityContextSeccompProfile.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 localhost_profile: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        The seccomp options to use by the containers in this pod.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param _builtins.str localhost_profile: localhostProfile indicates a profile defined in a file on the node should be used.
-               The profile must be preconfigured on the node to work.
-               Must be a descending path, relative to the kubelet's configured seccomp profile location.
-               Must be set if type is "Localhost". Must NOT be set for any other type.
-        :param _builtins.str type: type indicates which kind of seccomp profile will be applied.
-               Valid options are:
-
-               Localhost - a profile defined in a file on the node should be used.
-               RuntimeDefault - the container runtime default profile should be used.
-               Unconfined - no profile should be applied.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> Optional[_builtins.str]:
-        """
-        localhostProfile indicates a profile defined in a file on the node should be used.
-        The profile must be preconfigured on the node to work.
-        Must be a descending path, relative to the kubelet's configured seccomp profile location.
-        Must be set if type is "Localhost". Must NOT be set for any other type.
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type indicates which kind of seccomp profile will be applied.
-        Valid options are:
-
-        Localhost - a profile defined in a file on the node should be used.
-        RuntimeDefault - the container runtime default profile should be used.
-        Unconfined - no profile should be applied.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatch(dict):
-    """
-    The seccomp options to use by the containers in this pod.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "localhostProfile":
-            suggest = "localhost_profile"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 localhost_profile: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        The seccomp options to use by the containers in this pod.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param _builtins.str localhost_profile: localhostProfile indicates a profile defined in a file on the node should be used.
-               The profile must be preconfigured on the node to work.
-               Must be a descending path, relative to the kubelet's configured seccomp profile location.
-               Must be set if type is "Localhost". Must NOT be set for any other type.
-        :param _builtins.str type: type indicates which kind of seccomp profile will be applied.
-               Valid options are:
-
-               Localhost - a profile defined in a file on the node should be used.
-               RuntimeDefault - the container runtime default profile should be used.
-               Unconfined - no profile should be applied.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> Optional[_builtins.str]:
-        """
-        localhostProfile indicates a profile defined in a file on the node should be used.
-        The profile must be preconfigured on the node to work.
-        Must be a descending path, relative to the kubelet's configured seccomp profile location.
-        Must be set if type is "Localhost". Must NOT be set for any other type.
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type indicates which kind of seccomp profile will be applied.
-        Valid options are:
-
-        Localhost - a profile defined in a file on the node should be used.
-        RuntimeDefault - the container runtime default profile should be used.
-        Unconfined - no profile should be applied.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodSecurityContextSysctls(dict):
-    """
-    Sysctl defines a kernel parameter to be set
-    """
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 value: Optional[_builtins.str] = None):
-        """
-        Sysctl defines a kernel parameter to be set
-
-        :param _builtins.str name: Name of a property to set
-        :param _builtins.str value: Value of a property to set
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of a property to set
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> Optional[_builtins.str]:
-        """
-        Value of a property to set
-        """
-        return pulumi.get(self, "value")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatch(dict):
-    """
-    Sysctl defines a kernel parameter to be set
-    """
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 value: Optional[_builtins.str] = None):
-        """
-        Sysctl defines a kernel parameter to be set
-
-        :param _builtins.str name: Name of a property to set
-        :param _builtins.str value: Value of a property to set
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of a property to set
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> Optional[_builtins.str]:
-        """
-        Value of a property to set
-        """
-        return pulumi.get(self, "value")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodSecurityContextWindowsOptions(dict):
-    """
-    The Windows specific settings applied to all containers.
-    If unspecified, the options within a container's SecurityContext will be used.
-    If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is linux.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "gmsaCredentialSpec":
-            suggest = "gmsa_credential_spec"
-        elif key == "gmsaCredentialSpecName":
-            suggest = "gmsa_credential_spec_name"
-        elif key == "hostProcess":
-            suggest = "host_process"
-        elif key == "runAsUserName":
-            suggest = "run_as_user_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodSecurityContextWindowsOptions. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodSecurityContextWindowsOptions.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodSecurityContextWindowsOptions.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 gmsa_credential_spec: Optional[_builtins.str] = None,
-                 gmsa_credential_spec_name: Optional[_builtins.str] = None,
-                 host_process: Optional[_builtins.bool] = None,
-                 run_as_user_name: Optional[_builtins.str] = None):
-        """
-        The Windows specific settings applied to all containers.
-        If unspecified, the options within a container's SecurityContext will be used.
-        If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is linux.
-
-        :param _builtins.str gmsa_credential_spec: GMSACredentialSpec is where the GMSA admission webhook
-               (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-               GMSA credential spec named by the GMSACredentialSpecName field.
-        :param _builtins.str gmsa_credential_spec_name: GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        :param _builtins.bool host_process: HostProcess determines if a container should be run as a 'Host Process' container.
-               All of a Pod's containers must have the same effective HostProcess value
-               (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-               In addition, if HostProcess is true then HostNetwork must also be set to true.
-        :param _builtins.str run_as_user_name: The UserName in Windows to run the entrypoint of the container process.
-               Defaults to the user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext. If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        if gmsa_credential_spec is not None:
-            pulumi.set(__self__, "gmsa_credential_spec", gmsa_credential_spec)
-        if gmsa_credential_spec_name is not None:
-            pulumi.set(__self__, "gmsa_credential_spec_name", gmsa_credential_spec_name)
-        if host_process is not None:
-            pulumi.set(__self__, "host_process", host_process)
-        if run_as_user_name is not None:
-            pulumi.set(__self__, "run_as_user_name", run_as_user_name)
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpec")
-    def gmsa_credential_spec(self) -> Optional[_builtins.str]:
-        """
-        GMSACredentialSpec is where the GMSA admission webhook
-        (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-        GMSA credential spec named by the GMSACredentialSpecName field.
-        """
-        return pulumi.get(self, "gmsa_credential_spec")
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpecName")
-    def gmsa_credential_spec_name(self) -> Optional[_builtins.str]:
-        """
-        GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        """
-        return pulumi.get(self, "gmsa_credential_spec_name")
-
-    @_builtins.property
-    @pulumi.getter(name="hostProcess")
-    def host_process(self) -> Optional[_builtins.bool]:
-        """
-        HostProcess determines if a container should be run as a 'Host Process' container.
-        All of a Pod's containers must have the same effective HostProcess value
-        (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-        In addition, if HostProcess is true then HostNetwork must also be set to true.
-        """
-        return pulumi.get(self, "host_process")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUserName")
-    def run_as_user_name(self) -> Optional[_builtins.str]:
-        """
-        The UserName in Windows to run the entrypoint of the container process.
-        Defaults to the user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext. If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_user_name")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatch(dict):
-    """
-    The Windows specific settings applied to all containers.
-    If unspecified, the options within a container's SecurityContext will be used.
-    If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is linux.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "gmsaCredentialSpec":
-            suggest = "gmsa_credential_spec"
-        elif key == "gmsaCredentialSpecName":
-            suggest = "gmsa_credential_spec_name"
-        elif key == "hostProcess":
-            suggest = "host_process"
-        elif key == "runAsUserName":
-            suggest = "run_as_user_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 gmsa_credential_spec: Optional[_builtins.str] = None,
-                 gmsa_credential_spec_name: Optional[_builtins.str] = None,
-                 host_process: Optional[_builtins.bool] = None,
-                 run_as_user_name: Optional[_builtins.str] = None):
-        """
-        The Windows specific settings applied to all containers.
-        If unspecified, the options within a container's SecurityContext will be used.
-        If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is linux.
-
-        :param _builtins.str gmsa_credential_spec: GMSACredentialSpec is where the GMSA admission webhook
-               (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-               GMSA credential spec named by the GMSACredentialSpecName field.
-        :param _builtins.str gmsa_credential_spec_name: GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        :param _builtins.bool host_process: HostProcess determines if a container should be run as a 'Host Process' container.
-               All of a Pod's containers must have the same effective HostProcess value
-               (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-               In addition, if HostProcess is true then HostNetwork must also be set to true.
-        :param _builtins.str run_as_user_name: The UserName in Windows to run the entrypoint of the container process.
-               Defaults to the user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext. If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        if gmsa_credential_spec is not None:
-            pulumi.set(__self__, "gmsa_credential_spec", gmsa_credential_spec)
-        if gmsa_credential_spec_name is not None:
-            pulumi.set(__self__, "gmsa_credential_spec_name", gmsa_credential_spec_name)
-        if host_process is not None:
-            pulumi.set(__self__, "host_process", host_process)
-        if run_as_user_name is not None:
-            pulumi.set(__self__, "run_as_user_name", run_as_user_name)
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpec")
-    def gmsa_credential_spec(self) -> Optional[_builtins.str]:
-        """
-        GMSACredentialSpec is where the GMSA admission webhook
-        (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-        GMSA credential spec named by the GMSACredentialSpecName field.
-        """
-        return pulumi.get(self, "gmsa_credential_spec")
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpecName")
-    def gmsa_credential_spec_name(self) -> Optional[_builtins.str]:
-        """
-        GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        """
-        return pulumi.get(self, "gmsa_credential_spec_name")
-
-    @_builtins.property
-    @pulumi.getter(name="hostProcess")
-    def host_process(self) -> Optional[_builtins.bool]:
-        """
-        HostProcess determines if a container should be run as a 'Host Process' container.
-        All of a Pod's containers must have the same effective HostProcess value
-        (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-        In addition, if HostProcess is true then HostNetwork must also be set to true.
-        """
-        return pulumi.get(self, "host_process")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUserName")
-    def run_as_user_name(self) -> Optional[_builtins.str]:
-        """
-        The UserName in Windows to run the entrypoint of the container process.
-        Defaults to the user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext. If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_user_name")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainer(dict):
-    """
-    Configuration for the proxy container running tailscale.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "imagePullPolicy":
-            suggest = "image_pull_policy"
-        elif key == "securityContext":
-            suggest = "security_context"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleContainer. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainer.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainer.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 debug: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerDebug'] = None,
-                 env: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerEnv']] = None,
-                 image: Optional[_builtins.str] = None,
-                 image_pull_policy: Optional[_builtins.str] = None,
-                 resources: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerResources'] = None,
-                 security_context: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContext'] = None):
-        """
-        Configuration for the proxy container running tailscale.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgs'] env: List of environment variables to set in the container.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-               Note that environment variables provided here will take precedence
-               over Tailscale-specific environment variables set by the operator,
-               however running proxies with custom values for Tailscale environment
-               variables (i.e TS_USERSPACE) is not recommended and might break in
-               the future.
-        :param _builtins.str image: Container image name. By default images are pulled from docker.io/tailscale,
-               but the official images are also available at ghcr.io/tailscale.
-
-               For all uses except on ProxyGroups of type "kube-apiserver", this image must
-               be either tailscale/tailscale, or an equivalent mirror of that image.
-               To apply to ProxyGroups of type "kube-apiserver", this image must be
-               tailscale/k8s-proxy or a mirror of that image.
-
-               For "tailscale/tailscale"-based proxies, specifying image name here will
-               override any proxy image values specified via the Kubernetes operator's
-               Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-               For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-               configure your own default, and this field is the only way to use a
-               custom image.
-
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        :param _builtins.str image_pull_policy: Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        if debug is not None:
-            pulumi.set(__self__, "debug", debug)
-        if env is not None:
-            pulumi.set(__self__, "env", env)
-        if image is not None:
-            pulumi.set(__self__, "image", image)
-        if image_pull_policy is not None:
-            pulumi.set(__self__, "image_pull_policy", image_pull_policy)
-        if resources is not None:
-            pulumi.set(__self__, "resources", resources)
-        if security_context is not None:
-            pulumi.set(__self__, "security_context", security_context)
-
-    @_builtins.property
-    @pulumi.getter
-    def debug(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerDebug']:
-        return pulumi.get(self, "debug")
-
-    @_builtins.property
-    @pulumi.getter
-    def env(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerEnv']]:
-        """
-        List of environment variables to set in the container.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-        Note that environment variables provided here will take precedence
-        over Tailscale-specific environment variables set by the operator,
-        however running proxies with custom values for Tailscale environment
-        variables (i.e TS_USERSPACE) is not recommended and might break in
-        the future.
-        """
-        return pulumi.get(self, "env")
-
-    @_builtins.property
-    @pulumi.getter
-    def image(self) -> Optional[_builtins.str]:
-        """
-        Container image name. By default images are pulled from docker.io/tailscale,
-        but the official images are also available at ghcr.io/tailscale.
-
-        For all uses except on ProxyGroups of type "kube-apiserver", this image must
-        be either tailscale/tailscale, or an equivalent mirror of that image.
-        To apply to ProxyGroups of type "kube-apiserver", this image must be
-        tailscale/k8s-proxy or a mirror of that image.
-
-        For "tailscale/tailscale"-based proxies, specifying image name here will
-        override any proxy image values specified via the Kubernetes operator's
-        Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-        For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-        configure your own default, and this field is the only way to use a
-        custom image.
-
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        return pulumi.get(self, "image")
-
-    @_builtins.property
-    @pulumi.getter(name="imagePullPolicy")
-    def image_pull_policy(self) -> Optional[_builtins.str]:
-        """
-        Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        return pulumi.get(self, "image_pull_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def resources(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerResources']:
-        return pulumi.get(self, "resources")
-
-    @_builtins.property
-    @pulumi.getter(name="securityContext")
-    def security_context(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContext']:
-        return pulumi.get(self, "security_context")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerDebug(dict):
-    """
-    Configuration for enabling extra debug information in the container.
-    Not recommended for production use.
-    """
-    def __init__(__self__, *,
-                 enable: Optional[_builtins.bool] = None):
-        """
-        Configuration for enabling extra debug information in the container.
-        Not recommended for production use.
-
-        :param _builtins.bool enable: Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-               and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-               9001 is a container port named "debug". The endpoints and their responses
-               may change in backwards incompatible ways in the future, and should not
-               be considered stable.
-
-               In 1.78.x and 1.80.x, this setting will default to the value of
-               .spec.metrics.enable, and requests to the "metrics" port matching the
-               mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-               this setting will default to false, and no requests will be proxied.
-        """
-        if enable is not None:
-            pulumi.set(__self__, "enable", enable)
-
-    @_builtins.property
-    @pulumi.getter
-    def enable(self) -> Optional[_builtins.bool]:
-        """
-        Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-        and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-        9001 is a container port named "debug". The endpoints and their responses
-        may change in backwards incompatible ways in the future, and should not
-        be considered stable.
-
-        In 1.78.x and 1.80.x, this setting will default to the value of
-        .spec.metrics.enable, and requests to the "metrics" port matching the
-        mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-        this setting will default to false, and no requests will be proxied.
-        """
-        return pulumi.get(self, "enable")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatch(dict):
-    """
-    Configuration for enabling extra debug information in the container.
-    Not recommended for production use.
-    """
-    def __init__(__self__, *,
-                 enable: Optional[_builtins.bool] = None):
-        """
-        Configuration for enabling extra debug information in the container.
-        Not recommended for production use.
-
-        :param _builtins.bool enable: Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-               and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-               9001 is a container port named "debug". The endpoints and their responses
-               may change in backwards incompatible ways in the future, and should not
-               be considered stable.
-
-               In 1.78.x and 1.80.x, this setting will default to the value of
-               .spec.metrics.enable, and requests to the "metrics" port matching the
-               mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-               this setting will default to false, and no requests will be proxied.
-        """
-        if enable is not None:
-            pulumi.set(__self__, "enable", enable)
-
-    @_builtins.property
-    @pulumi.getter
-    def enable(self) -> Optional[_builtins.bool]:
-        """
-        Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-        and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-        9001 is a container port named "debug". The endpoints and their responses
-        may change in backwards incompatible ways in the future, and should not
-        be considered stable.
-
-        In 1.78.x and 1.80.x, this setting will default to the value of
-        .spec.metrics.enable, and requests to the "metrics" port matching the
-        mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-        this setting will default to false, and no requests will be proxied.
-        """
-        return pulumi.get(self, "enable")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerEnv(dict):
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 value: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str name: Name of the environment variable. Must be a C_IDENTIFIER.
-        :param _builtins.str value: Variable references $(VAR_NAME) are expanded using the previously defined
-                environment variables in the container and any service environment
-               variables. If a variable cannot be resolved, the reference in the input
-               string will be unchanged. Double $$ are reduced to a single $, which
-               allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-               produce the string literal "$(VAR_NAME)". Escaped references will never
-               be expanded, regardless of whether the variable exists or not. Defaults
-               to "".
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the environment variable. Must be a C_IDENTIFIER.
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> Optional[_builtins.str]:
-        """
-        Variable references $(VAR_NAME) are expanded using the previously defined
-         environment variables in the container and any service environment
-        variables. If a variable cannot be resolved, the reference in the input
-        string will be unchanged. Double $$ are reduced to a single $, which
-        allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-        produce the string literal "$(VAR_NAME)". Escaped references will never
-        be expanded, regardless of whether the variable exists or not. Defaults
-        to "".
-        """
-        return pulumi.get(self, "value")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatch(dict):
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 value: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str name: Name of the environment variable. Must be a C_IDENTIFIER.
-        :param _builtins.str value: Variable references $(VAR_NAME) are expanded using the previously defined
-                environment variables in the container and any service environment
-               variables. If a variable cannot be resolved, the reference in the input
-               string will be unchanged. Double $$ are reduced to a single $, which
-               allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-               produce the string literal "$(VAR_NAME)". Escaped references will never
-               be expanded, regardless of whether the variable exists or not. Defaults
-               to "".
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the environment variable. Must be a C_IDENTIFIER.
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> Optional[_builtins.str]:
-        """
-        Variable references $(VAR_NAME) are expanded using the previously defined
-         environment variables in the container and any service environment
-        variables. If a variable cannot be resolved, the reference in the input
-        string will be unchanged. Double $$ are reduced to a single $, which
-        allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-        produce the string literal "$(VAR_NAME)". Escaped references will never
-        be expanded, regardless of whether the variable exists or not. Defaults
-        to "".
-        """
-        return pulumi.get(self, "value")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerPatch(dict):
-    """
-    Configuration for the proxy container running tailscale.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "imagePullPolicy":
-            suggest = "image_pull_policy"
-        elif key == "securityContext":
-            suggest = "security_context"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleContainerPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainerPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainerPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 debug: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatch'] = None,
-                 env: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatch']] = None,
-                 image: Optional[_builtins.str] = None,
-                 image_pull_policy: Optional[_builtins.str] = None,
-                 resources: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatch'] = None,
-                 security_context: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatch'] = None):
-        """
-        Configuration for the proxy container running tailscale.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatchArgs'] env: List of environment variables to set in the container.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-               Note that environment variables provided here will take precedence
-               over Tailscale-specific environment variables set by the operator,
-               however running proxies with custom values for Tailscale environment
-               variables (i.e TS_USERSPACE) is not recommended and might break in
-               the future.
-        :param _builtins.str image: Container image name. By default images are pulled from docker.io/tailscale,
-               but the official images are also available at ghcr.io/tailscale.
-
-               For all uses except on ProxyGroups of type "kube-apiserver", this image must
-               be either tailscale/tailscale, or an equivalent mirror of that image.
-               To apply to ProxyGroups of type "kube-apiserver", this image must be
-               tailscale/k8s-proxy or a mirror of that image.
-
-               For "tailscale/tailscale"-based proxies, specifying image name here will
-               override any proxy image values specified via the Kubernetes operator's
-               Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-               For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-               configure your own default, and this field is the only way to use a
-               custom image.
-
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        :param _builtins.str image_pull_policy: Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        if debug is not None:
-            pulumi.set(__self__, "debug", debug)
-        if env is not None:
-            pulumi.set(__self__, "env", env)
-        if image is not None:
-            pulumi.set(__self__, "image", image)
-        if image_pull_policy is not None:
-            pulumi.set(__self__, "image_pull_policy", image_pull_policy)
-        if resources is not None:
-            pulumi.set(__self__, "resources", resources)
-        if security_context is not None:
-            pulumi.set(__self__, "security_context", security_context)
-
-    @_builtins.property
-    @pulumi.getter
-    def debug(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatch']:
-        return pulumi.get(self, "debug")
-
-    @_builtins.property
-    @pulumi.getter
-    def env(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatch']]:
-        """
-        List of environment variables to set in the container.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-        Note that environment variables provided here will take precedence
-        over Tailscale-specific environment variables set by the operator,
-        however running proxies with custom values for Tailscale environment
-        variables (i.e TS_USERSPACE) is not recommended and might break in
-        the future.
-        """
-        return pulumi.get(self, "env")
-
-    @_builtins.property
-    @pulumi.getter
-    def image(self) -> Optional[_builtins.str]:
-        """
-        Container image name. By default images are pulled from docker.io/tailscale,
-        but the official images are also available at ghcr.io/tailscale.
-
-        For all uses except on ProxyGroups of type "kube-apiserver", this image must
-        be either tailscale/tailscale, or an equivalent mirror of that image.
-        To apply to ProxyGroups of type "kube-apiserver", this image must be
-        tailscale/k8s-proxy or a mirror of that image.
-
-        For "tailscale/tailscale"-based proxies, specifying image name here will
-        override any proxy image values specified via the Kubernetes operator's
-        Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-        For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-        configure your own default, and this field is the only way to use a
-        custom image.
-
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        return pulumi.get(self, "image")
-
-    @_builtins.property
-    @pulumi.getter(name="imagePullPolicy")
-    def image_pull_policy(self) -> Optional[_builtins.str]:
-        """
-        Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        return pulumi.get(self, "image_pull_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def resources(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatch']:
-        return pulumi.get(self, "resources")
-
-    @_builtins.property
-    @pulumi.getter(name="securityContext")
-    def security_context(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatch']:
-        return pulumi.get(self, "security_context")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerResources(dict):
-    """
-    Container resource requirements.
-    By default Tailscale Kubernetes operator does not apply any resource
-    requirements. The amount of resources required wil depend on the
-    amount of resources the operator needs to parse, usage patterns and
-    cluster size.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#resources
-    """
-    def __init__(__self__, *,
-                 claims: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaims']] = None,
-                 limits: Optional[Mapping[str, Any]] = None,
-                 requests: Optional[Mapping[str, Any]] = None):
-        """
-        Container resource requirements.
-        By default Tailscale Kubernetes operator does not apply any resource
-        requirements. The amount of resources required wil depend on the
-        amount of resources the operator needs to parse, usage patterns and
-        cluster size.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#resources
-
-        :param Sequence['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsArgs'] claims: Claims lists the names of resources, defined in spec.resourceClaims,
-               that are used by this container.
-
-               This field depends on the
-               DynamicResourceAllocation feature gate.
-
-               This field is immutable. It can only be set for containers.
-        :param Mapping[str, Union[_builtins.int, _builtins.str]] limits: Limits describes the maximum amount of compute resources allowed.
-               More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        :param Mapping[str, Union[_builtins.int, _builtins.str]] requests: Requests describes the minimum amount of compute resources required.
-               If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-               otherwise to an implementation-defined value. Requests cannot exceed Limits.
-               More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        if claims is not None:
-            pulumi.set(__self__, "claims", claims)
-        if limits is not None:
-            pulumi.set(__self__, "limits", limits)
-        if requests is not None:
-            pulumi.set(__self__, "requests", requests)
-
-    @_builtins.property
-    @pulumi.getter
-    def claims(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaims']]:
-        """
-        Claims lists the names of resources, defined in spec.resourceClaims,
-        that are used by this container.
-
-        This field depends on the
-        DynamicResourceAllocation feature gate.
-
-        This field is immutable. It can only be set for containers.
-        """
-        return pulumi.get(self, "claims")
-
-    @_builtins.property
-    @pulumi.getter
-    def limits(self) -> Optional[Mapping[str, Any]]:
-        """
-        Limits describes the maximum amount of compute resources allowed.
-        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        return pulumi.get(self, "limits")
-
-    @_builtins.property
-    @pulumi.getter
-    def requests(self) -> Optional[Mapping[str, Any]]:
-        """
-        Requests describes the minimum amount of compute resources required.
-        If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-        otherwise to an implementation-defined value. Requests cannot exceed Limits.
-        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        return pulumi.get(self, "requests")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaims(dict):
-    """
-    ResourceClaim references one entry in PodSpec.ResourceClaims.
-    """
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 request: Optional[_builtins.str] = None):
-        """
-        ResourceClaim references one entry in PodSpec.ResourceClaims.
-
-        :param _builtins.str name: Name must match the name of one entry in pod.spec.resourceClaims of
-               the Pod where this field is used. It makes that resource available
-               inside a container.
-        :param _builtins.str request: Request is the name chosen for a request in the referenced claim.
-               If empty, everything from the claim is made available, otherwise
-               only the result of this request.
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if request is not None:
-            pulumi.set(__self__, "request", request)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name must match the name of one entry in pod.spec.resourceClaims of
-        the Pod where this field is used. It makes that resource available
-        inside a container.
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def request(self) -> Optional[_builtins.str]:
-        """
-        Request is the name chosen for a request in the referenced claim.
-        If empty, everything from the claim is made available, otherwise
-        only the result of this request.
-        """
-        return pulumi.get(self, "request")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatch(dict):
-    """
-    ResourceClaim references one entry in PodSpec.ResourceClaims.
-    """
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 request: Optional[_builtins.str] = None):
-        """
-        ResourceClaim references one entry in PodSpec.ResourceClaims.
-
-        :param _builtins.str name: Name must match the name of one entry in pod.spec.resourceClaims of
-               the Pod where this field is used. It makes that resource available
-               inside a container.
-        :param _builtins.str request: Request is the name chosen for a request in the referenced claim.
-               If empty, everything from the claim is made available, otherwise
-               only the result of this request.
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if request is not None:
-            pulumi.set(__self__, "request", request)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name must match the name of one entry in pod.spec.resourceClaims of
-        the Pod where this field is used. It makes that resource available
-        inside a container.
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def request(self) -> Optional[_builtins.str]:
-        """
-        Request is the name chosen for a request in the referenced claim.
-        If empty, everything from the claim is made available, otherwise
-        only the result of this request.
-        """
-        return pulumi.get(self, "request")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatch(dict):
-    """
-    Container resource requirements.
-    By default Tailscale Kubernetes operator does not apply any resource
-    requirements. The amount of resources required wil depend on the
-    amount of resources the operator needs to parse, usage patterns and
-    cluster size.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#resources
-    """
-    def __init__(__self__, *,
-                 claims: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatch']] = None,
-                 limits: Optional[Mapping[str, Any]] = None,
-                 requests: Optional[Mapping[str, Any]] = None):
-        """
-        Container resource requirements.
-        By default Tailscale Kubernetes operator does not apply any resource
-        requirements. The amount of resources required wil depend on the
-        amount of resources the operator needs to parse, usage patterns and
-        cluster size.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#resources
-
-        :param Sequence['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatchArgs'] claims: Claims lists the names of resources, defined in spec.resourceClaims,
-               that are used by this container.
-
-               This field depends on the
-               DynamicResourceAllocation feature gate.
-
-               This field is immutable. It can only be set for containers.
-        :param Mapping[str, Union[_builtins.int, _builtins.str]] limits: Limits describes the maximum amount of compute resources allowed.
-               More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        :param Mapping[str, Union[_builtins.int, _builtins.str]] requests: Requests describes the minimum amount of compute resources required.
-               If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-               otherwise to an implementation-defined value. Requests cannot exceed Limits.
-               More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        if claims is not None:
-            pulumi.set(__self__, "claims", claims)
-        if limits is not None:
-            pulumi.set(__self__, "limits", limits)
-        if requests is not None:
-            pulumi.set(__self__, "requests", requests)
-
-    @_builtins.property
-    @pulumi.getter
-    def claims(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatch']]:
-        """
-        Claims lists the names of resources, defined in spec.resourceClaims,
-        that are used by this container.
-
-        This field depends on the
-        DynamicResourceAllocation feature gate.
-
-        This field is immutable. It can only be set for containers.
-        """
-        return pulumi.get(self, "claims")
-
-    @_builtins.property
-    @pulumi.getter
-    def limits(self) -> Optional[Mapping[str, Any]]:
-        """
-        Limits describes the maximum amount of compute resources allowed.
-        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        return pulumi.get(self, "limits")
-
-    @_builtins.property
-    @pulumi.getter
-    def requests(self) -> Optional[Mapping[str, Any]]:
-        """
-        Requests describes the minimum amount of compute resources required.
-        If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-        otherwise to an implementation-defined value. Requests cannot exceed Limits.
-        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        return pulumi.get(self, "requests")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContext(dict):
-    """
-    Container security context.
-    Security context specified here will override the security context set by the operator.
-    By default the operator sets the Tailscale container and the Tailscale init container to privileged
-    for proxies created for Tailscale ingress and egress Service, Connector and ProxyGroup.
-    You can reduce the permissions of the Tailscale container to cap NET_ADMIN by
-    installing device plugin in your cluster and configuring the proxies tun device to be created
-    by the device plugin, see  https://github.com/tailscale/tailscale/issues/10814#issuecomment-2479977752
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "allowPrivilegeEscalation":
-            suggest = "allow_privilege_escalation"
-        elif key == "appArmorProfile":
-            suggest = "app_armor_profile"
-        elif key == "procMount":
-            suggest = "proc_mount"
-        elif key == "readOnlyRootFilesystem":
-            suggest = "read_only_root_filesystem"
-        elif key == "runAsGroup":
-            suggest = "run_as_group"
-        elif key == "runAsNonRoot":
-            suggest = "run_as_non_root"
-        elif key == "runAsUser":
-            suggest = "run_as_user"
-        elif key == "seLinuxOptions":
-            suggest = "se_linux_options"
-        elif key == "seccompProfile":
-            suggest = "seccomp_profile"
-        elif key == "windowsOptions":
-            suggest = "windows_options"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContext. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContext.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContext.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 allow_privilege_escalation: Optional[_builtins.bool] = None,
-                 app_armor_profile: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfile'] = None,
-                 capabilities: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilities'] = None,
-                 privileged: Optional[_builtins.bool] = None,
-                 proc_mount: Optional[_builtins.str] = None,
-                 read_only_root_filesystem: Optional[_builtins.bool] = None,
-                 run_as_group: Optional[_builtins.int] = None,
-                 run_as_non_root: Optional[_builtins.bool] = None,
-                 run_as_user: Optional[_builtins.int] = None,
-                 se_linux_options: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptions'] = None,
-                 seccomp_profile: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfile'] = None,
-                 windows_options: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptions'] = None):
-        """
-        Container security context.
-        Security context specified here will override the security context set by the operator.
-        By default the operator sets the Tailscale container and the Tailscale init container to privileged
-        for proxies created for Tailscale ingress and egress Service, Connector and ProxyGroup.
-        You can reduce the permissions of the Tailscale container to cap NET_ADMIN by
-        installing device plugin in your cluster and configuring the proxies tun device to be created
-        by the device plugin, see  https://github.com/tailscale/tailscale/issues/10814#issuecomment-2479977752
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context
-
-        :param _builtins.bool allow_privilege_escalation: AllowPrivilegeEscalation controls whether a process can gain more
-               privileges than its parent process. This bool directly controls if
-               the no_new_privs flag will be set on the container process.
-               AllowPrivilegeEscalation is true always when the container is:
-               1) run as Privileged
-               2) has CAP_SYS_ADMIN
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.bool privileged: Run container in privileged mode.
-               Processes in privileged containers are essentially equivalent to root on the host.
-               Defaults to false.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.str proc_mount: procMount denotes the type of proc mount to use for the containers.
-               The default value is Default which uses the container runtime defaults for
-               readonly paths and masked paths.
-               This requires the ProcMountType feature flag to be enabled.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.bool read_only_root_filesystem: Whether this container has a read-only root filesystem.
-               Default is false.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.int run_as_group: The GID to run the entrypoint of the container process.
-               Uses runtime default if unset.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.bool run_as_non_root: Indicates that the container must run as a non-root user.
-               If true, the Kubelet will validate the image at runtime to ensure that it
-               does not run as UID 0 (root) and fail to start the container if it does.
-               If unset or false, no such validation will be performed.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        :param _builtins.int run_as_user: The UID to run the entrypoint of the container process.
-               Defaults to user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-               Note that this field cannot be set when spec.os.name is windows.
-        """
-        if allow_privilege_escalation is not None:
-            pulumi.set(__self__, "allow_privilege_escalation", allow_privilege_escalation)
-        if app_armor_profile is not None:
-            pulumi.set(__self__, "app_armor_profile", app_armor_profile)
-        if capabilities is not None:
-            pulumi.set(__self__, "capabilities", capabilities)
-        if privileged is not None:
-            pulumi.set(__self__, "privileged", privileged)
-        if proc_mount is not None:
-            pulumi.set(__self__, "proc_mount", proc_mount)
-        if read_only_root_filesystem is not None:
-            pulumi.set(__self__, "read_only_root_filesystem", read_only_root_filesystem)
-        if run_as_group is not None:
-            pulumi.set(__self__, "run_as_group", run_as_group)
-        if run_as_non_root is not None:
-            pulumi.set(__self__, "run_as_non_root", run_as_non_root)
-        if run_as_user is not None:
-            pulumi.set(__self__, "run_as_user", run_as_user)
-        if se_linux_options is not None:
-            pulumi.set(__self__, "se_linux_options", se_linux_options)
-        if seccomp_profile is not None:
-            pulumi.set(__self__, "seccomp_profile", seccomp_profile)
-        if windows_options is not None:
-            pulumi.set(__self__, "windows_options", windows_options)
-
-    @_builtins.property
-    @pulumi.getter(name="allowPrivilegeEscalation")
-    def allow_privilege_escalation(self) -> Optional[_builtins.bool]:
-        """
-        AllowPrivilegeEscalation controls whether a process can gain more
-        privileges than its parent process. This bool directly controls if
-        the no_new_privs flag will be set on the container process.
-        AllowPrivilegeEscalation is true always when the container is:
-        1) run as Privileged
-        2) has CAP_SYS_ADMIN
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "allow_privilege_escalation")
-
-    @_builtins.property
-    @pulumi.getter(name="appArmorProfile")
-    def app_armor_profile(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfile']:
-        return pulumi.get(self, "app_armor_profile")
-
-    @_builtins.property
-    @pulumi.getter
-    def capabilities(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilities']:
-        return pulumi.get(self, "capabilities")
-
-    @_builtins.property
-    @pulumi.getter
-    def privileged(self) -> Optional[_builtins.bool]:
-        """
-        Run container in privileged mode.
-        Processes in privileged containers are essentially equivalent to root on the host.
-        Defaults to false.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "privileged")
-
-    @_builtins.property
-    @pulumi.getter(name="procMount")
-    def proc_mount(self) -> Optional[_builtins.str]:
-        """
-        procMount denotes the type of proc mount to use for the containers.
-        The default value is Default which uses the container runtime defaults for
-        readonly paths and masked paths.
-        This requires the ProcMountType feature flag to be enabled.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "proc_mount")
-
-    @_builtins.property
-    @pulumi.getter(name="readOnlyRootFilesystem")
-    def read_only_root_filesystem(self) -> Optional[_builtins.bool]:
-        """
-        Whether this container has a read-only root filesystem.
-        Default is false.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "read_only_root_filesystem")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsGroup")
-    def run_as_group(self) -> Optional[_builtins.int]:
-        """
-        The GID to run the entrypoint of the container process.
-        Uses runtime default if unset.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_group")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsNonRoot")
-    def run_as_non_root(self) -> Optional[_builtins.bool]:
-        """
-        Indicates that the container must run as a non-root user.
-        If true, the Kubelet will validate the image at runtime to ensure that it
-        does not run as UID 0 (root) and fail to start the container if it does.
-        If unset or false, no such validation will be performed.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_non_root")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUser")
-    def run_as_user(self) -> Optional[_builtins.int]:
-        """
-        The UID to run the entrypoint of the container process.
-        Defaults to user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_user")
-
-    @_builtins.property
-    @pulumi.getter(name="seLinuxOptions")
-    def se_linux_options(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptions']:
-        return pulumi.get(self, "se_linux_options")
-
-    @_builtins.property
-    @pulumi.getter(name="seccompProfile")
-    def seccomp_profile(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfile']:
-        return pulumi.get(self, "seccomp_profile")
-
-    @_builtins.property
-    @pulumi.getter(name="windowsOptions")
-    def windows_options(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptions']:
-        return pulumi.get(self, "windows_options")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfile(dict):
-    """
-    appArmorProfile is the AppArmor options to use by this container. If set, this profile
-    overrides the pod's appArmorProfile.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "localhostProfile":
-            suggest = "localhost_profile"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfile. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfile.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfile.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 localhost_profile: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        appArmorProfile is the AppArmor options to use by this container. If set, this profile
-        overrides the pod's appArmorProfile.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param _builtins.str localhost_profile: localhostProfile indicates a profile loaded on the node that should be used.
-               The profile must be preconfigured on the node to work.
-               Must match the loaded name of the profile.
-               Must be set if and only if type is "Localhost".
-        :param _builtins.str type: type indicates which kind of AppArmor profile will be applied.
-               Valid options are:
-                 Localhost - a profile pre-loaded on the node.
-                 RuntimeDefault - the container runtime's default profile.
-                 Unconfined - no AppArmor enforcement.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> Optional[_builtins.str]:
-        """
-        localhostProfile indicates a profile loaded on the node that should be used.
-        The profile must be preconfigured on the node to work.
-        Must match the loaded name of the profile.
-        Must be set if and only if type is "Localhost".
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type indicates which kind of AppArmor profile will be applied.
-        Valid options are:
-          Localhost - a profile pre-loaded on the node.
-          RuntimeDefault - the container runtime's default profile.
-          Unconfined - no AppArmor enforcement.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatch(dict):
-    """
-    appArmorProfile is the AppArmor options to use by this container. If set, this profile
-    overrides the pod's appArmorProfile.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "localhostProfile":
-            suggest = "localhost_profile"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 localhost_profile: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        appArmorProfile is the AppArmor options to use by this container. If set, this profile
-        overrides the pod's appArmorProfile.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param _builtins.str localhost_profile: localhostProfile indicates a profile loaded on the node that should be used.
-               The profile must be preconfigured on the node to work.
-               Must match the loaded name of the profile.
-               Must be set if and only if type is "Localhost".
-        :param _builtins.str type: type indicates which kind of AppArmor profile will be applied.
-               Valid options are:
-                 Localhost - a profile pre-loaded on the node.
-                 RuntimeDefault - the container runtime's default profile.
-                 Unconfined - no AppArmor enforcement.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> Optional[_builtins.str]:
-        """
-        localhostProfile indicates a profile loaded on the node that should be used.
-        The profile must be preconfigured on the node to work.
-        Must match the loaded name of the profile.
-        Must be set if and only if type is "Localhost".
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type indicates which kind of AppArmor profile will be applied.
-        Valid options are:
-          Localhost - a profile pre-loaded on the node.
-          RuntimeDefault - the container runtime's default profile.
-          Unconfined - no AppArmor enforcement.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilities(dict):
-    """
-    The capabilities to add/drop when running containers.
-    Defaults to the default set of capabilities granted by the container runtime.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    def __init__(__self__, *,
-                 add: Optional[Sequence[_builtins.str]] = None,
-                 drop: Optional[Sequence[_builtins.str]] = None):
-        """
-        The capabilities to add/drop when running containers.
-        Defaults to the default set of capabilities granted by the container runtime.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param Sequence[_builtins.str] add: Added capabilities
-        :param Sequence[_builtins.str] drop: Removed capabilities
-        """
-        if add is not None:
-            pulumi.set(__self__, "add", add)
-        if drop is not None:
-            pulumi.set(__self__, "drop", drop)
-
-    @_builtins.property
-    @pulumi.getter
-    def add(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Added capabilities
-        """
-        return pulumi.get(self, "add")
-
-    @_builtins.property
-    @pulumi.getter
-    def drop(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Removed capabilities
-        """
-        return pulumi.get(self, "drop")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatch(dict):
-    """
-    The capabilities to add/drop when running containers.
-    Defaults to the default set of capabilities granted by the container runtime.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    def __init__(__self__, *,
-                 add: Optional[Sequence[_builtins.str]] = None,
-                 drop: Optional[Sequence[_builtins.str]] = None):
-        """
-        The capabilities to add/drop when running containers.
-        Defaults to the default set of capabilities granted by the container runtime.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param Sequence[_builtins.str] add: Added capabilities
-        :param Sequence[_builtins.str] drop: Removed capabilities
-        """
-        if add is not None:
-            pulumi.set(__self__, "add", add)
-        if drop is not None:
-            pulumi.set(__self__, "drop", drop)
-
-    @_builtins.property
-    @pulumi.getter
-    def add(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Added capabilities
-        """
-        return pulumi.get(self, "add")
-
-    @_builtins.property
-    @pulumi.getter
-    def drop(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Removed capabilities
-        """
-        return pulumi.get(self, "drop")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatch(dict):
-    """
-    Container security context.
-    Security context specified here will override the security context set by the operator.
-    By default the operator sets the Tailscale container and the Tailscale init container to privileged
-    for proxies created for Tailscale ingress and egress Service, Connector and ProxyGroup.
-    You can reduce the permissions of the Tailscale container to cap NET_ADMIN by
-    installing device plugin in your cluster and configuring the proxies tun device to be created
-    by the device plugin, see  https://github.com/tailscale/tailscale/issues/10814#issuecomment-2479977752
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "allowPrivilegeEscalation":
-            suggest = "allow_privilege_escalation"
-        elif key == "appArmorProfile":
-            suggest = "app_armor_profile"
-        elif key == "procMount":
-            suggest = "proc_mount"
-        elif key == "readOnlyRootFilesystem":
-            suggest = "read_only_root_filesystem"
-        elif key == "runAsGroup":
-            suggest = "run_as_group"
-        elif key == "runAsNonRoot":
-            suggest = "run_as_non_root"
-        elif key == "runAsUser":
-            suggest = "run_as_user"
-        elif key == "seLinuxOptions":
-            suggest = "se_linux_options"
-        elif key == "seccompProfile":
-            suggest = "seccomp_profile"
-        elif key == "windowsOptions":
-            suggest = "windows_options"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 allow_privilege_escalation: Optional[_builtins.bool] = None,
-                 app_armor_profile: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatch'] = None,
-                 capabilities: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatch'] = None,
-                 privileged: Optional[_builtins.bool] = None,
-                 proc_mount: Optional[_builtins.str] = None,
-                 read_only_root_filesystem: Optional[_builtins.bool] = None,
-                 run_as_group: Optional[_builtins.int] = None,
-                 run_as_non_root: Optional[_builtins.bool] = None,
-                 run_as_user: Optional[_builtins.int] = None,
-                 se_linux_options: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatch'] = None,
-                 seccomp_profile: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatch'] = None,
-                 windows_options: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatch'] = None):
-        """
-        Container security context.
-        Security context specified here will override the security context set by the operator.
-        By default the operator sets the Tailscale container and the Tailscale init container to privileged
-        for proxies created for Tailscale ingress and egress Service, Connector and ProxyGroup.
-        You can reduce the permissions of the Tailscale container to cap NET_ADMIN by
-        installing device plugin in your cluster and configuring the proxies tun device to be created
-        by the device plugin, see  https://github.com/tailscale/tailscale/issues/10814#issuecomment-2479977752
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context
-
-        :param _builtins.bool allow_privilege_escalation: AllowPrivilegeEscalation controls whether a process can gain more
-               privileges than its parent process. This bool directly controls if
-               the no_new_privs flag will be set on the container process.
-               AllowPrivilegeEscalation is true always when the container is:
-               1) run as Privileged
-               2) has CAP_SYS_ADMIN
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.bool privileged: Run container in privileged mode.
-               Processes in privileged containers are essentially equivalent to root on the host.
-               Defaults to false.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.str proc_mount: procMount denotes the type of proc mount to use for the containers.
-               The default value is Default which uses the container runtime defaults for
-               readonly paths and masked paths.
-               This requires the ProcMountType feature flag to be enabled.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.bool read_only_root_filesystem: Whether this container has a read-only root filesystem.
-               Default is false.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.int run_as_group: The GID to run the entrypoint of the container process.
-               Uses runtime default if unset.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.bool run_as_non_root: Indicates that the container must run as a non-root user.
-               If true, the Kubelet will validate the image at runtime to ensure that it
-               does not run as UID 0 (root) and fail to start the container if it does.
-               If unset or false, no such validation will be performed.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        :param _builtins.int run_as_user: The UID to run the entrypoint of the container process.
-               Defaults to user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-               Note that this field cannot be set when spec.os.name is windows.
-        """
-        if allow_privilege_escalation is not None:
-            pulumi.set(__self__, "allow_privilege_escalation", allow_privilege_escalation)
-        if app_armor_profile is not None:
-            pulumi.set(__self__, "app_armor_profile", app_armor_profile)
-        if capabilities is not None:
-            pulumi.set(__self__, "capabilities", capabilities)
-        if privileged is not None:
-            pulumi.set(__self__, "privileged", privileged)
-        if proc_mount is not None:
-            pulumi.set(__self__, "proc_mount", proc_mount)
-        if read_only_root_filesystem is not None:
-            pulumi.set(__self__, "read_only_root_filesystem", read_only_root_filesystem)
-        if run_as_group is not None:
-            pulumi.set(__self__, "run_as_group", run_as_group)
-        if run_as_non_root is not None:
-            pulumi.set(__self__, "run_as_non_root", run_as_non_root)
-        if run_as_user is not None:
-            pulumi.set(__self__, "run_as_user", run_as_user)
-        if se_linux_options is not None:
-            pulumi.set(__self__, "se_linux_options", se_linux_options)
-        if seccomp_profile is not None:
-            pulumi.set(__self__, "seccomp_profile", seccomp_profile)
-        if windows_options is not None:
-            pulumi.set(__self__, "windows_options", windows_options)
-
-    @_builtins.property
-    @pulumi.getter(name="allowPrivilegeEscalation")
-    def allow_privilege_escalation(self) -> Optional[_builtins.bool]:
-        """
-        AllowPrivilegeEscalation controls whether a process can gain more
-        privileges than its parent process. This bool directly controls if
-        the no_new_privs flag will be set on the container process.
-        AllowPrivilegeEscalation is true always when the container is:
-        1) run as Privileged
-        2) has CAP_SYS_ADMIN
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "allow_privilege_escalation")
-
-    @_builtins.property
-    @pulumi.getter(name="appArmorProfile")
-    def app_armor_profile(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatch']:
-        return pulumi.get(self, "app_armor_profile")
-
-    @_builtins.property
-    @pulumi.getter
-    def capabilities(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatch']:
-        return pulumi.get(self, "capabilities")
-
-    @_builtins.property
-    @pulumi.getter
-    def privileged(self) -> Optional[_builtins.bool]:
-        """
-        Run container in privileged mode.
-        Processes in privileged containers are essentially equivalent to root on the host.
-        Defaults to false.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "privileged")
-
-    @_builtins.property
-    @pulumi.getter(name="procMount")
-    def proc_mount(self) -> Optional[_builtins.str]:
-        """
-        procMount denotes the type of proc mount to use for the containers.
-        The default value is Default which uses the container runtime defaults for
-        readonly paths and masked paths.
-        This requires the ProcMountType feature flag to be enabled.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "proc_mount")
-
-    @_builtins.property
-    @pulumi.getter(name="readOnlyRootFilesystem")
-    def read_only_root_filesystem(self) -> Optional[_builtins.bool]:
-        """
-        Whether this container has a read-only root filesystem.
-        Default is false.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "read_only_root_filesystem")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsGroup")
-    def run_as_group(self) -> Optional[_builtins.int]:
-        """
-        The GID to run the entrypoint of the container process.
-        Uses runtime default if unset.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_group")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsNonRoot")
-    def run_as_non_root(self) -> Optional[_builtins.bool]:
-        """
-        Indicates that the container must run as a non-root user.
-        If true, the Kubelet will validate the image at runtime to ensure that it
-        does not run as UID 0 (root) and fail to start the container if it does.
-        If unset or false, no such validation will be performed.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_non_root")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUser")
-    def run_as_user(self) -> Optional[_builtins.int]:
-        """
-        The UID to run the entrypoint of the container process.
-        Defaults to user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_user")
-
-    @_builtins.property
-    @pulumi.getter(name="seLinuxOptions")
-    def se_linux_options(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatch']:
-        return pulumi.get(self, "se_linux_options")
-
-    @_builtins.property
-    @pulumi.getter(name="seccompProfile")
-    def seccomp_profile(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatch']:
-        return pulumi.get(self, "seccomp_profile")
-
-    @_builtins.property
-    @pulumi.getter(name="windowsOptions")
-    def windows_options(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatch']:
-        return pulumi.get(self, "windows_options")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptions(dict):
-    """
-    The SELinux context to be applied to the container.
-    If unspecified, the container runtime will allocate a random SELinux context for each
-    container.  May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    def __init__(__self__, *,
-                 level: Optional[_builtins.str] = None,
-                 role: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None,
-                 user: Optional[_builtins.str] = None):
-        """
-        The SELinux context to be applied to the container.
-        If unspecified, the container runtime will allocate a random SELinux context for each
-        container.  May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param _builtins.str level: Level is SELinux level label that applies to the container.
-        :param _builtins.str role: Role is a SELinux role label that applies to the container.
-        :param _builtins.str type: Type is a SELinux type label that applies to the container.
-        :param _builtins.str user: User is a SELinux user label that applies to the container.
-        """
-        if level is not None:
-            pulumi.set(__self__, "level", level)
-        if role is not None:
-            pulumi.set(__self__, "role", role)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-        if user is not None:
-            pulumi.set(__self__, "user", user)
-
-    @_builtins.property
-    @pulumi.getter
-    def level(self) -> Optional[_builtins.str]:
-        """
-        Level is SELinux level label that applies to the container.
-        """
-        return pulumi.get(self, "level")
-
-    @_builtins.property
-    @pulumi.getter
-    def role(self) -> Optional[_builtins.str]:
-        """
-        Role is a SELinux role label that applies to the container.
-        """
-        return pulumi.get(self, "role")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        Type is a SELinux type label that applies to the container.
-        """
-        return pulumi.get(self, "type")
-
-    @_builtins.property
-    @pulumi.getter
-    def user(self) -> Optional[_builtins.str]:
-        """
-        User is a SELinux user label that applies to the container.
-        """
-        return pulumi.get(self, "user")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatch(dict):
-    """
-    The SELinux context to be applied to the container.
-    If unspecified, the container runtime will allocate a random SELinux context for each
-    container.  May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    def __init__(__self__, *,
-                 level: Optional[_builtins.str] = None,
-                 role: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None,
-                 user: Optional[_builtins.str] = None):
-        """
-        The SELinux context to be applied to the container.
-        If unspecified, the container runtime will allocate a random SELinux context for each
-        container.  May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param _builtins.str level: Level is SELinux level label that applies to the container.
-        :param _builtins.str role: Role is a SELinux role label that applies to the container.
-        :param _builtins.str type: Type is a SELinux type label that applies to the container.
-        :param _builtins.str user: User is a SELinux user label that applies to the container.
-        """
-        if level is not None:
-            pulumi.set(__self__, "level", level)
-        if role is not None:
-            pulumi.set(__self__, "role", role)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-        if user is not None:
-            pulumi.set(__self__, "user", user)
-
-    @_builtins.property
-    @pulumi.getter
-    def level(self) -> Optional[_builtins.str]:
-        """
-        Level is SELinux level label that applies to the container.
-        """
-        return pulumi.get(self, "level")
-
-    @_builtins.property
-    @pulumi.getter
-    def role(self) -> Optional[_builtins.str]:
-        """
-        Role is a SELinux role label that applies to the container.
-        """
-        return pulumi.get(self, "role")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        Type is a SELinux type label that applies to the container.
-        """
-        return pulumi.get(self, "type")
-
-    @_builtins.property
-    @pulumi.getter
-    def user(self) -> Optional[_builtins.str]:
-        """
-        User is a SELinux user label that applies to the container.
-        """
-        return pulumi.get(self, "user")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfile(dict):
-    """
-    The seccomp options to use by this container. If seccomp options are
-    provided at both the pod & container level, the container options
-    override the pod options.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "localhostProfile":
-            suggest = "localhost_profile"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfile. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfile.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfile.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 localhost_profile: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        The seccomp options to use by this container. If seccomp options are
-        provided at both the pod & container level, the container options
-        override the pod options.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param _builtins.str localhost_profile: localhostProfile indicates a profile defined in a file on the node should be used.
-               The profile must be preconfigured on the node to work.
-               Must be a descending path, relative to the kubelet's configured seccomp profile location.
-               Must be set if type is "Localhost". Must NOT be set for any other type.
-        :param _builtins.str type: type indicates which kind of seccomp profile will be applied.
-               Valid options are:
-
-               Localhost - a profile defined in a file on the node should be used.
-               RuntimeDefault - the container runtime default profile should be used.
-               Unconfined - no profile should be applied.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> Optional[_builtins.str]:
-        """
-        localhostProfile indicates a profile defined in a file on the node should be used.
-        The profile must be preconfigured on the node to work.
-        Must be a descending path, relative to the kubelet's configured seccomp profile location.
-        Must be set if type is "Localhost". Must NOT be set for any other type.
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type indicates which kind of seccomp profile will be applied.
-        Valid options are:
-
-        Localhost - a profile defined in a file on the node should be used.
-        RuntimeDefault - the container runtime default profile should be used.
-        Unconfined - no profile should be applied.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatch(dict):
-    """
-    The seccomp options to use by this container. If seccomp options are
-    provided at both the pod & container level, the container options
-    override the pod options.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "localhostProfile":
-            suggest = "localhost_profile"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 localhost_profile: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        The seccomp options to use by this container. If seccomp options are
-        provided at both the pod & container level, the container options
-        override the pod options.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param _builtins.str localhost_profile: localhostProfile indicates a profile defined in a file on the node should be used.
-               The profile must be preconfigured on the node to work.
-               Must be a descending path, relative to the kubelet's configured seccomp profile location.
-               Must be set if type is "Localhost". Must NOT be set for any other type.
-        :param _builtins.str type: type indicates which kind of seccomp profile will be applied.
-               Valid options are:
-
-               Localhost - a profile defined in a file on the node should be used.
-               RuntimeDefault - the container runtime default profile should be used.
-               Unconfined - no profile should be applied.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> Optional[_builtins.str]:
-        """
-        localhostProfile indicates a profile defined in a file on the node should be used.
-        The profile must be preconfigured on the node to work.
-        Must be a descending path, relative to the kubelet's configured seccomp profile location.
-        Must be set if type is "Localhost". Must NOT be set for any other type.
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type indicates which kind of seccomp profile will be applied.
-        Valid options are:
-
-        Localhost - a profile defined in a file on the node should be used.
-        RuntimeDefault - the container runtime default profile should be used.
-        Unconfined - no profile should be applied.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptions(dict):
-    """
-    The Windows specific settings applied to all containers.
-    If unspecified, the options from the PodSecurityContext will be used.
-    If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is linux.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "gmsaCredentialSpec":
-            suggest = "gmsa_credential_spec"
-        elif key == "gmsaCredentialSpecName":
-            suggest = "gmsa_credential_spec_name"
-        elif key == "hostProcess":
-            suggest = "host_process"
-        elif key == "runAsUserName":
-            suggest = "run_as_user_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptions. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptions.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptions.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 gmsa_credential_spec: Optional[_builtins.str] = None,
-                 gmsa_credential_spec_name: Optional[_builtins.str] = None,
-                 host_process: Optional[_builtins.bool] = None,
-                 run_as_user_name: Optional[_builtins.str] = None):
-        """
-        The Windows specific settings applied to all containers.
-        If unspecified, the options from the PodSecurityContext will be used.
-        If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is linux.
-
-        :param _builtins.str gmsa_credential_spec: GMSACredentialSpec is where the GMSA admission webhook
-               (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-               GMSA credential spec named by the GMSACredentialSpecName field.
-        :param _builtins.str gmsa_credential_spec_name: GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        :param _builtins.bool host_process: HostProcess determines if a container should be run as a 'Host Process' container.
-               All of a Pod's containers must have the same effective HostProcess value
-               (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-               In addition, if HostProcess is true then HostNetwork must also be set to true.
-        :param _builtins.str run_as_user_name: The UserName in Windows to run the entrypoint of the container process.
-               Defaults to the user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext. If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        if gmsa_credential_spec is not None:
-            pulumi.set(__self__, "gmsa_credential_spec", gmsa_credential_spec)
-        if gmsa_credential_spec_name is not None:
-            pulumi.set(__self__, "gmsa_credential_spec_name", gmsa_credential_spec_name)
-        if host_process is not None:
-            pulumi.set(__self__, "host_process", host_process)
-        if run_as_user_name is not None:
-            pulumi.set(__self__, "run_as_user_name", run_as_user_name)
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpec")
-    def gmsa_credential_spec(self) -> Optional[_builtins.str]:
-        """
-        GMSACredentialSpec is where the GMSA admission webhook
-        (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-        GMSA credential spec named by the GMSACredentialSpecName field.
-        """
-        return pulumi.get(self, "gmsa_credential_spec")
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpecName")
-    def gmsa_credential_spec_name(self) -> Optional[_builtins.str]:
-        """
-        GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        """
-        return pulumi.get(self, "gmsa_credential_spec_name")
-
-    @_builtins.property
-    @pulumi.getter(name="hostProcess")
-    def host_process(self) -> Optional[_builtins.bool]:
-        """
-        HostProcess determines if a container should be run as a 'Host Process' container.
-        All of a Pod's containers must have the same effective HostProcess value
-        (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-        In addition, if HostProcess is true then HostNetwork must also be set to true.
-        """
-        return pulumi.get(self, "host_process")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUserName")
-    def run_as_user_name(self) -> Optional[_builtins.str]:
-        """
-        The UserName in Windows to run the entrypoint of the container process.
-        Defaults to the user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext. If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_user_name")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatch(dict):
-    """
-    The Windows specific settings applied to all containers.
-    If unspecified, the options from the PodSecurityContext will be used.
-    If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is linux.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "gmsaCredentialSpec":
-            suggest = "gmsa_credential_spec"
-        elif key == "gmsaCredentialSpecName":
-            suggest = "gmsa_credential_spec_name"
-        elif key == "hostProcess":
-            suggest = "host_process"
-        elif key == "runAsUserName":
-            suggest = "run_as_user_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 gmsa_credential_spec: Optional[_builtins.str] = None,
-                 gmsa_credential_spec_name: Optional[_builtins.str] = None,
-                 host_process: Optional[_builtins.bool] = None,
-                 run_as_user_name: Optional[_builtins.str] = None):
-        """
-        The Windows specific settings applied to all containers.
-        If unspecified, the options from the PodSecurityContext will be used.
-        If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is linux.
-
-        :param _builtins.str gmsa_credential_spec: GMSACredentialSpec is where the GMSA admission webhook
-               (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-               GMSA credential spec named by the GMSACredentialSpecName field.
-        :param _builtins.str gmsa_credential_spec_name: GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        :param _builtins.bool host_process: HostProcess determines if a container should be run as a 'Host Process' container.
-               All of a Pod's containers must have the same effective HostProcess value
-               (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-               In addition, if HostProcess is true then HostNetwork must also be set to true.
-        :param _builtins.str run_as_user_name: The UserName in Windows to run the entrypoint of the container process.
-               Defaults to the user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext. If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        if gmsa_credential_spec is not None:
-            pulumi.set(__self__, "gmsa_credential_spec", gmsa_credential_spec)
-        if gmsa_credential_spec_name is not None:
-            pulumi.set(__self__, "gmsa_credential_spec_name", gmsa_credential_spec_name)
-        if host_process is not None:
-            pulumi.set(__self__, "host_process", host_process)
-        if run_as_user_name is not None:
-            pulumi.set(__self__, "run_as_user_name", run_as_user_name)
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpec")
-    def gmsa_credential_spec(self) -> Optional[_builtins.str]:
-        """
-        GMSACredentialSpec is where the GMSA admission webhook
-        (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-        GMSA credential spec named by the GMSACredentialSpecName field.
-        """
-        return pulumi.get(self, "gmsa_credential_spec")
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpecName")
-    def gmsa_credential_spec_name(self) -> Optional[_builtins.str]:
-        """
-        GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        """
-        return pulumi.get(self, "gmsa_credential_spec_name")
-
-    @_builtins.property
-    @pulumi.getter(name="hostProcess")
-    def host_process(self) -> Optional[_builtins.bool]:
-        """
-        HostProcess determines if a container should be run as a 'Host Process' container.
-        All of a Pod's containers must have the same effective HostProcess value
-        (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-        In addition, if HostProcess is true then HostNetwork must also be set to true.
-        """
-        return pulumi.get(self, "host_process")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUserName")
-    def run_as_user_name(self) -> Optional[_builtins.str]:
-        """
-        The UserName in Windows to run the entrypoint of the container process.
-        Defaults to the user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext. If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_user_name")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainer(dict):
-    """
-    Configuration for the proxy init container that enables forwarding.
-    Not valid to apply to ProxyGroups of type "kube-apiserver".
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "imagePullPolicy":
-            suggest = "image_pull_policy"
-        elif key == "securityContext":
-            suggest = "security_context"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleInitContainer. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainer.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainer.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 debug: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerDebug'] = None,
-                 env: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerEnv']] = None,
-                 image: Optional[_builtins.str] = None,
-                 image_pull_policy: Optional[_builtins.str] = None,
-                 resources: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerResources'] = None,
-                 security_context: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContext'] = None):
-        """
-        Configuration for the proxy init container that enables forwarding.
-        Not valid to apply to ProxyGroups of type "kube-apiserver".
-
-        :param Sequence['ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvArgs'] env: List of environment variables to set in the container.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-               Note that environment variables provided here will take precedence
-               over Tailscale-specific environment variables set by the operator,
-               however running proxies with custom values for Tailscale environment
-               variables (i.e TS_USERSPACE) is not recommended and might break in
-               the future.
-        :param _builtins.str image: Container image name. By default images are pulled from docker.io/tailscale,
-               but the official images are also available at ghcr.io/tailscale.
-
-               For all uses except on ProxyGroups of type "kube-apiserver", this image must
-               be either tailscale/tailscale, or an equivalent mirror of that image.
-               To apply to ProxyGroups of type "kube-apiserver", this image must be
-               tailscale/k8s-proxy or a mirror of that image.
-
-               For "tailscale/tailscale"-based proxies, specifying image name here will
-               override any proxy image values specified via the Kubernetes operator's
-               Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-               For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-               configure your own default, and this field is the only way to use a
-               custom image.
-
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        :param _builtins.str image_pull_policy: Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        if debug is not None:
-            pulumi.set(__self__, "debug", debug)
-        if env is not None:
-            pulumi.set(__self__, "env", env)
-        if image is not None:
-            pulumi.set(__self__, "image", image)
-        if image_pull_policy is not None:
-            pulumi.set(__self__, "image_pull_policy", image_pull_policy)
-        if resources is not None:
-            pulumi.set(__self__, "resources", resources)
-        if security_context is not None:
-            pulumi.set(__self__, "security_context", security_context)
-
-    @_builtins.property
-    @pulumi.getter
-    def debug(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerDebug']:
-        return pulumi.get(self, "debug")
-
-    @_builtins.property
-    @pulumi.getter
-    def env(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerEnv']]:
-        """
-        List of environment variables to set in the container.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-        Note that environment variables provided here will take precedence
-        over Tailscale-specific environment variables set by the operator,
-        however running proxies with custom values for Tailscale environment
-        variables (i.e TS_USERSPACE) is not recommended and might break in
-        the future.
-        """
-        return pulumi.get(self, "env")
-
-    @_builtins.property
-    @pulumi.getter
-    def image(self) -> Optional[_builtins.str]:
-        """
-        Container image name. By default images are pulled from docker.io/tailscale,
-        but the official images are also available at ghcr.io/tailscale.
-
-        For all uses except on ProxyGroups of type "kube-apiserver", this image must
-        be either tailscale/tailscale, or an equivalent mirror of that image.
-        To apply to ProxyGroups of type "kube-apiserver", this image must be
-        tailscale/k8s-proxy or a mirror of that image.
-
-        For "tailscale/tailscale"-based proxies, specifying image name here will
-        override any proxy image values specified via the Kubernetes operator's
-        Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-        For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-        configure your own default, and this field is the only way to use a
-        custom image.
-
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        return pulumi.get(self, "image")
-
-    @_builtins.property
-    @pulumi.getter(name="imagePullPolicy")
-    def image_pull_policy(self) -> Optional[_builtins.str]:
-        """
-        Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        return pulumi.get(self, "image_pull_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def resources(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerResources']:
-        return pulumi.get(self, "resources")
-
-    @_builtins.property
-    @pulumi.getter(name="securityContext")
-    def security_context(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContext']:
-        return pulumi.get(self, "security_context")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerDebug(dict):
-    """
-    Configuration for enabling extra debug information in the container.
-    Not recommended for production use.
-    """
-    def __init__(__self__, *,
-                 enable: Optional[_builtins.bool] = None):
-        """
-        Configuration for enabling extra debug information in the container.
-        Not recommended for production use.
-
-        :param _builtins.bool enable: Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-               and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-               9001 is a container port named "debug". The endpoints and their responses
-               may change in backwards incompatible ways in the future, and should not
-               be considered stable.
-
-               In 1.78.x and 1.80.x, this setting will default to the value of
-               .spec.metrics.enable, and requests to the "metrics" port matching the
-               mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-               this setting will default to false, and no requests will be proxied.
-        """
-        if enable is not None:
-            pulumi.set(__self__, "enable", enable)
-
-    @_builtins.property
-    @pulumi.getter
-    def enable(self) -> Optional[_builtins.bool]:
-        """
-        Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-        and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-        9001 is a container port named "debug". The endpoints and their responses
-        may change in backwards incompatible ways in the future, and should not
-        be considered stable.
-
-        In 1.78.x and 1.80.x, this setting will default to the value of
-        .spec.metrics.enable, and requests to the "metrics" port matching the
-        mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-        this setting will default to false, and no requests will be proxied.
-        """
-        return pulumi.get(self, "enable")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatch(dict):
-    """
-    Configuration for enabling extra debug information in the container.
-    Not recommended for production use.
-    """
-    def __init__(__self__, *,
-                 enable: Optional[_builtins.bool] = None):
-        """
-        Configuration for enabling extra debug information in the container.
-        Not recommended for production use.
-
-        :param _builtins.bool enable: Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-               and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-               9001 is a container port named "debug". The endpoints and their responses
-               may change in backwards incompatible ways in the future, and should not
-               be considered stable.
-
-               In 1.78.x and 1.80.x, this setting will default to the value of
-               .spec.metrics.enable, and requests to the "metrics" port matching the
-               mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-               this setting will default to false, and no requests will be proxied.
-        """
-        if enable is not None:
-            pulumi.set(__self__, "enable", enable)
-
-    @_builtins.property
-    @pulumi.getter
-    def enable(self) -> Optional[_builtins.bool]:
-        """
-        Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
-        and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
-        9001 is a container port named "debug". The endpoints and their responses
-        may change in backwards incompatible ways in the future, and should not
-        be considered stable.
-
-        In 1.78.x and 1.80.x, this setting will default to the value of
-        .spec.metrics.enable, and requests to the "metrics" port matching the
-        mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
-        this setting will default to false, and no requests will be proxied.
-        """
-        return pulumi.get(self, "enable")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerEnv(dict):
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 value: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str name: Name of the environment variable. Must be a C_IDENTIFIER.
-        :param _builtins.str value: Variable references $(VAR_NAME) are expanded using the previously defined
-                environment variables in the container and any service environment
-               variables. If a variable cannot be resolved, the reference in the input
-               string will be unchanged. Double $$ are reduced to a single $, which
-               allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-               produce the string literal "$(VAR_NAME)". Escaped references will never
-               be expanded, regardless of whether the variable exists or not. Defaults
-               to "".
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the environment variable. Must be a C_IDENTIFIER.
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> Optional[_builtins.str]:
-        """
-        Variable references $(VAR_NAME) are expanded using the previously defined
-         environment variables in the container and any service environment
-        variables. If a variable cannot be resolved, the reference in the input
-        string will be unchanged. Double $$ are reduced to a single $, which
-        allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-        produce the string literal "$(VAR_NAME)". Escaped references will never
-        be expanded, regardless of whether the variable exists or not. Defaults
-        to "".
-        """
-        return pulumi.get(self, "value")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatch(dict):
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 value: Optional[_builtins.str] = None):
-        """
-        :param _builtins.str name: Name of the environment variable. Must be a C_IDENTIFIER.
-        :param _builtins.str value: Variable references $(VAR_NAME) are expanded using the previously defined
-                environment variables in the container and any service environment
-               variables. If a variable cannot be resolved, the reference in the input
-               string will be unchanged. Double $$ are reduced to a single $, which
-               allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-               produce the string literal "$(VAR_NAME)". Escaped references will never
-               be expanded, regardless of whether the variable exists or not. Defaults
-               to "".
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name of the environment variable. Must be a C_IDENTIFIER.
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> Optional[_builtins.str]:
-        """
-        Variable references $(VAR_NAME) are expanded using the previously defined
-         environment variables in the container and any service environment
-        variables. If a variable cannot be resolved, the reference in the input
-        string will be unchanged. Double $$ are reduced to a single $, which
-        allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
-        produce the string literal "$(VAR_NAME)". Escaped references will never
-        be expanded, regardless of whether the variable exists or not. Defaults
-        to "".
-        """
-        return pulumi.get(self, "value")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerPatch(dict):
-    """
-    Configuration for the proxy init container that enables forwarding.
-    Not valid to apply to ProxyGroups of type "kube-apiserver".
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "imagePullPolicy":
-            suggest = "image_pull_policy"
-        elif key == "securityContext":
-            suggest = "security_context"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleInitContainerPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainerPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainerPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 debug: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatch'] = None,
-                 env: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatch']] = None,
-                 image: Optional[_builtins.str] = None,
-                 image_pull_policy: Optional[_builtins.str] = None,
-                 resources: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatch'] = None,
-                 security_context: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatch'] = None):
-        """
-        Configuration for the proxy init container that enables forwarding.
-        Not valid to apply to ProxyGroups of type "kube-apiserver".
-
-        :param Sequence['ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatchArgs'] env: List of environment variables to set in the container.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-               Note that environment variables provided here will take precedence
-               over Tailscale-specific environment variables set by the operator,
-               however running proxies with custom values for Tailscale environment
-               variables (i.e TS_USERSPACE) is not recommended and might break in
-               the future.
-        :param _builtins.str image: Container image name. By default images are pulled from docker.io/tailscale,
-               but the official images are also available at ghcr.io/tailscale.
-
-               For all uses except on ProxyGroups of type "kube-apiserver", this image must
-               be either tailscale/tailscale, or an equivalent mirror of that image.
-               To apply to ProxyGroups of type "kube-apiserver", this image must be
-               tailscale/k8s-proxy or a mirror of that image.
-
-               For "tailscale/tailscale"-based proxies, specifying image name here will
-               override any proxy image values specified via the Kubernetes operator's
-               Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-               For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-               configure your own default, and this field is the only way to use a
-               custom image.
-
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        :param _builtins.str image_pull_policy: Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        if debug is not None:
-            pulumi.set(__self__, "debug", debug)
-        if env is not None:
-            pulumi.set(__self__, "env", env)
-        if image is not None:
-            pulumi.set(__self__, "image", image)
-        if image_pull_policy is not None:
-            pulumi.set(__self__, "image_pull_policy", image_pull_policy)
-        if resources is not None:
-            pulumi.set(__self__, "resources", resources)
-        if security_context is not None:
-            pulumi.set(__self__, "security_context", security_context)
-
-    @_builtins.property
-    @pulumi.getter
-    def debug(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatch']:
-        return pulumi.get(self, "debug")
-
-    @_builtins.property
-    @pulumi.getter
-    def env(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatch']]:
-        """
-        List of environment variables to set in the container.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
-        Note that environment variables provided here will take precedence
-        over Tailscale-specific environment variables set by the operator,
-        however running proxies with custom values for Tailscale environment
-        variables (i.e TS_USERSPACE) is not recommended and might break in
-        the future.
-        """
-        return pulumi.get(self, "env")
-
-    @_builtins.property
-    @pulumi.getter
-    def image(self) -> Optional[_builtins.str]:
-        """
-        Container image name. By default images are pulled from docker.io/tailscale,
-        but the official images are also available at ghcr.io/tailscale.
-
-        For all uses except on ProxyGroups of type "kube-apiserver", this image must
-        be either tailscale/tailscale, or an equivalent mirror of that image.
-        To apply to ProxyGroups of type "kube-apiserver", this image must be
-        tailscale/k8s-proxy or a mirror of that image.
-
-        For "tailscale/tailscale"-based proxies, specifying image name here will
-        override any proxy image values specified via the Kubernetes operator's
-        Helm chart values or PROXY_IMAGE env var in the operator Deployment.
-        For "tailscale/k8s-proxy"-based proxies, there is currently no way to
-        configure your own default, and this field is the only way to use a
-        custom image.
-
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        return pulumi.get(self, "image")
-
-    @_builtins.property
-    @pulumi.getter(name="imagePullPolicy")
-    def image_pull_policy(self) -> Optional[_builtins.str]:
-        """
-        Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
-        """
-        return pulumi.get(self, "image_pull_policy")
-
-    @_builtins.property
-    @pulumi.getter
-    def resources(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatch']:
-        return pulumi.get(self, "resources")
-
-    @_builtins.property
-    @pulumi.getter(name="securityContext")
-    def security_context(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatch']:
-        return pulumi.get(self, "security_context")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerResources(dict):
-    """
-    Container resource requirements.
-    By default Tailscale Kubernetes operator does not apply any resource
-    requirements. The amount of resources required wil depend on the
-    amount of resources the operator needs to parse, usage patterns and
-    cluster size.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#resources
-    """
-    def __init__(__self__, *,
-                 claims: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaims']] = None,
-                 limits: Optional[Mapping[str, Any]] = None,
-                 requests: Optional[Mapping[str, Any]] = None):
-        """
-        Container resource requirements.
-        By default Tailscale Kubernetes operator does not apply any resource
-        requirements. The amount of resources required wil depend on the
-        amount of resources the operator needs to parse, usage patterns and
-        cluster size.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#resources
-
-        :param Sequence['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsArgs'] claims: Claims lists the names of resources, defined in spec.resourceClaims,
-               that are used by this container.
-
-               This field depends on the
-               DynamicResourceAllocation feature gate.
-
-               This field is immutable. It can only be set for containers.
-        :param Mapping[str, Union[_builtins.int, _builtins.str]] limits: Limits describes the maximum amount of compute resources allowed.
-               More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        :param Mapping[str, Union[_builtins.int, _builtins.str]] requests: Requests describes the minimum amount of compute resources required.
-               If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-               otherwise to an implementation-defined value. Requests cannot exceed Limits.
-               More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        if claims is not None:
-            pulumi.set(__self__, "claims", claims)
-        if limits is not None:
-            pulumi.set(__self__, "limits", limits)
-        if requests is not None:
-            pulumi.set(__self__, "requests", requests)
-
-    @_builtins.property
-    @pulumi.getter
-    def claims(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaims']]:
-        """
-        Claims lists the names of resources, defined in spec.resourceClaims,
-        that are used by this container.
-
-        This field depends on the
-        DynamicResourceAllocation feature gate.
-
-        This field is immutable. It can only be set for containers.
-        """
-        return pulumi.get(self, "claims")
-
-    @_builtins.property
-    @pulumi.getter
-    def limits(self) -> Optional[Mapping[str, Any]]:
-        """
-        Limits describes the maximum amount of compute resources allowed.
-        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        return pulumi.get(self, "limits")
-
-    @_builtins.property
-    @pulumi.getter
-    def requests(self) -> Optional[Mapping[str, Any]]:
-        """
-        Requests describes the minimum amount of compute resources required.
-        If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-        otherwise to an implementation-defined value. Requests cannot exceed Limits.
-        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        return pulumi.get(self, "requests")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaims(dict):
-    """
-    ResourceClaim references one entry in PodSpec.ResourceClaims.
-    """
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 request: Optional[_builtins.str] = None):
-        """
-        ResourceClaim references one entry in PodSpec.ResourceClaims.
-
-        :param _builtins.str name: Name must match the name of one entry in pod.spec.resourceClaims of
-               the Pod where this field is used. It makes that resource available
-               inside a container.
-        :param _builtins.str request: Request is the name chosen for a request in the referenced claim.
-               If empty, everything from the claim is made available, otherwise
-               only the result of this request.
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if request is not None:
-            pulumi.set(__self__, "request", request)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name must match the name of one entry in pod.spec.resourceClaims of
-        the Pod where this field is used. It makes that resource available
-        inside a container.
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def request(self) -> Optional[_builtins.str]:
-        """
-        Request is the name chosen for a request in the referenced claim.
-        If empty, everything from the claim is made available, otherwise
-        only the result of this request.
-        """
-        return pulumi.get(self, "request")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatch(dict):
-    """
-    ResourceClaim references one entry in PodSpec.ResourceClaims.
-    """
-    def __init__(__self__, *,
-                 name: Optional[_builtins.str] = None,
-                 request: Optional[_builtins.str] = None):
-        """
-        ResourceClaim references one entry in PodSpec.ResourceClaims.
-
-        :param _builtins.str name: Name must match the name of one entry in pod.spec.resourceClaims of
-               the Pod where this field is used. It makes that resource available
-               inside a container.
-        :param _builtins.str request: Request is the name chosen for a request in the referenced claim.
-               If empty, everything from the claim is made available, otherwise
-               only the result of this request.
-        """
-        if name is not None:
-            pulumi.set(__self__, "name", name)
-        if request is not None:
-            pulumi.set(__self__, "request", request)
-
-    @_builtins.property
-    @pulumi.getter
-    def name(self) -> Optional[_builtins.str]:
-        """
-        Name must match the name of one entry in pod.spec.resourceClaims of
-        the Pod where this field is used. It makes that resource available
-        inside a container.
-        """
-        return pulumi.get(self, "name")
-
-    @_builtins.property
-    @pulumi.getter
-    def request(self) -> Optional[_builtins.str]:
-        """
-        Request is the name chosen for a request in the referenced claim.
-        If empty, everything from the claim is made available, otherwise
-        only the result of this request.
-        """
-        return pulumi.get(self, "request")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatch(dict):
-    """
-    Container resource requirements.
-    By default Tailscale Kubernetes operator does not apply any resource
-    requirements. The amount of resources required wil depend on the
-    amount of resources the operator needs to parse, usage patterns and
-    cluster size.
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#resources
-    """
-    def __init__(__self__, *,
-                 claims: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatch']] = None,
-                 limits: Optional[Mapping[str, Any]] = None,
-                 requests: Optional[Mapping[str, Any]] = None):
-        """
-        Container resource requirements.
-        By default Tailscale Kubernetes operator does not apply any resource
-        requirements. The amount of resources required wil depend on the
-        amount of resources the operator needs to parse, usage patterns and
-        cluster size.
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#resources
-
-        :param Sequence['ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatchArgs'] claims: Claims lists the names of resources, defined in spec.resourceClaims,
-               that are used by this container.
-
-               This field depends on the
-               DynamicResourceAllocation feature gate.
-
-               This field is immutable. It can only be set for containers.
-        :param Mapping[str, Union[_builtins.int, _builtins.str]] limits: Limits describes the maximum amount of compute resources allowed.
-               More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        :param Mapping[str, Union[_builtins.int, _builtins.str]] requests: Requests describes the minimum amount of compute resources required.
-               If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-               otherwise to an implementation-defined value. Requests cannot exceed Limits.
-               More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        if claims is not None:
-            pulumi.set(__self__, "claims", claims)
-        if limits is not None:
-            pulumi.set(__self__, "limits", limits)
-        if requests is not None:
-            pulumi.set(__self__, "requests", requests)
-
-    @_builtins.property
-    @pulumi.getter
-    def claims(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatch']]:
-        """
-        Claims lists the names of resources, defined in spec.resourceClaims,
-        that are used by this container.
-
-        This field depends on the
-        DynamicResourceAllocation feature gate.
-
-        This field is immutable. It can only be set for containers.
-        """
-        return pulumi.get(self, "claims")
-
-    @_builtins.property
-    @pulumi.getter
-    def limits(self) -> Optional[Mapping[str, Any]]:
-        """
-        Limits describes the maximum amount of compute resources allowed.
-        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        return pulumi.get(self, "limits")
-
-    @_builtins.property
-    @pulumi.getter
-    def requests(self) -> Optional[Mapping[str, Any]]:
-        """
-        Requests describes the minimum amount of compute resources required.
-        If Requests is omitted for a container, it defaults to Limits if that is explicitly specified,
-        otherwise to an implementation-defined value. Requests cannot exceed Limits.
-        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
-        """
-        return pulumi.get(self, "requests")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContext(dict):
-    """
-    Container security context.
-    Security context specified here will override the security context set by the operator.
-    By default the operator sets the Tailscale container and the Tailscale init container to privileged
-    for proxies created for Tailscale ingress and egress Service, Connector and ProxyGroup.
-    You can reduce the permissions of the Tailscale container to cap NET_ADMIN by
-    installing device plugin in your cluster and configuring the proxies tun device to be created
-    by the device plugin, see  https://github.com/tailscale/tailscale/issues/10814#issuecomment-2479977752
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "allowPrivilegeEscalation":
-            suggest = "allow_privilege_escalation"
-        elif key == "appArmorProfile":
-            suggest = "app_armor_profile"
-        elif key == "procMount":
-            suggest = "proc_mount"
-        elif key == "readOnlyRootFilesystem":
-            suggest = "read_only_root_filesystem"
-        elif key == "runAsGroup":
-            suggest = "run_as_group"
-        elif key == "runAsNonRoot":
-            suggest = "run_as_non_root"
-        elif key == "runAsUser":
-            suggest = "run_as_user"
-        elif key == "seLinuxOptions":
-            suggest = "se_linux_options"
-        elif key == "seccompProfile":
-            suggest = "seccomp_profile"
-        elif key == "windowsOptions":
-            suggest = "windows_options"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContext. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContext.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContext.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 allow_privilege_escalation: Optional[_builtins.bool] = None,
-                 app_armor_profile: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfile'] = None,
-                 capabilities: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilities'] = None,
-                 privileged: Optional[_builtins.bool] = None,
-                 proc_mount: Optional[_builtins.str] = None,
-                 read_only_root_filesystem: Optional[_builtins.bool] = None,
-                 run_as_group: Optional[_builtins.int] = None,
-                 run_as_non_root: Optional[_builtins.bool] = None,
-                 run_as_user: Optional[_builtins.int] = None,
-                 se_linux_options: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptions'] = None,
-                 seccomp_profile: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfile'] = None,
-                 windows_options: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptions'] = None):
-        """
-        Container security context.
-        Security context specified here will override the security context set by the operator.
-        By default the operator sets the Tailscale container and the Tailscale init container to privileged
-        for proxies created for Tailscale ingress and egress Service, Connector and ProxyGroup.
-        You can reduce the permissions of the Tailscale container to cap NET_ADMIN by
-        installing device plugin in your cluster and configuring the proxies tun device to be created
-        by the device plugin, see  https://github.com/tailscale/tailscale/issues/10814#issuecomment-2479977752
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context
-
-        :param _builtins.bool allow_privilege_escalation: AllowPrivilegeEscalation controls whether a process can gain more
-               privileges than its parent process. This bool directly controls if
-               the no_new_privs flag will be set on the container process.
-               AllowPrivilegeEscalation is true always when the container is:
-               1) run as Privileged
-               2) has CAP_SYS_ADMIN
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.bool privileged: Run container in privileged mode.
-               Processes in privileged containers are essentially equivalent to root on the host.
-               Defaults to false.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.str proc_mount: procMount denotes the type of proc mount to use for the containers.
-               The default value is Default which uses the container runtime defaults for
-               readonly paths and masked paths.
-               This requires the ProcMountType feature flag to be enabled.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.bool read_only_root_filesystem: Whether this container has a read-only root filesystem.
-               Default is false.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.int run_as_group: The GID to run the entrypoint of the container process.
-               Uses runtime default if unset.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.bool run_as_non_root: Indicates that the container must run as a non-root user.
-               If true, the Kubelet will validate the image at runtime to ensure that it
-               does not run as UID 0 (root) and fail to start the container if it does.
-               If unset or false, no such validation will be performed.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        :param _builtins.int run_as_user: The UID to run the entrypoint of the container process.
-               Defaults to user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-               Note that this field cannot be set when spec.os.name is windows.
-        """
-        if allow_privilege_escalation is not None:
-            pulumi.set(__self__, "allow_privilege_escalation", allow_privilege_escalation)
-        if app_armor_profile is not None:
-            pulumi.set(__self__, "app_armor_profile", app_armor_profile)
-        if capabilities is not None:
-            pulumi.set(__self__, "capabilities", capabilities)
-        if privileged is not None:
-            pulumi.set(__self__, "privileged", privileged)
-        if proc_mount is not None:
-            pulumi.set(__self__, "proc_mount", proc_mount)
-        if read_only_root_filesystem is not None:
-            pulumi.set(__self__, "read_only_root_filesystem", read_only_root_filesystem)
-        if run_as_group is not None:
-            pulumi.set(__self__, "run_as_group", run_as_group)
-        if run_as_non_root is not None:
-            pulumi.set(__self__, "run_as_non_root", run_as_non_root)
-        if run_as_user is not None:
-            pulumi.set(__self__, "run_as_user", run_as_user)
-        if se_linux_options is not None:
-            pulumi.set(__self__, "se_linux_options", se_linux_options)
-        if seccomp_profile is not None:
-            pulumi.set(__self__, "seccomp_profile", seccomp_profile)
-        if windows_options is not None:
-            pulumi.set(__self__, "windows_options", windows_options)
-
-    @_builtins.property
-    @pulumi.getter(name="allowPrivilegeEscalation")
-    def allow_privilege_escalation(self) -> Optional[_builtins.bool]:
-        """
-        AllowPrivilegeEscalation controls whether a process can gain more
-        privileges than its parent process. This bool directly controls if
-        the no_new_privs flag will be set on the container process.
-        AllowPrivilegeEscalation is true always when the container is:
-        1) run as Privileged
-        2) has CAP_SYS_ADMIN
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "allow_privilege_escalation")
-
-    @_builtins.property
-    @pulumi.getter(name="appArmorProfile")
-    def app_armor_profile(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfile']:
-        return pulumi.get(self, "app_armor_profile")
-
-    @_builtins.property
-    @pulumi.getter
-    def capabilities(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilities']:
-        return pulumi.get(self, "capabilities")
-
-    @_builtins.property
-    @pulumi.getter
-    def privileged(self) -> Optional[_builtins.bool]:
-        """
-        Run container in privileged mode.
-        Processes in privileged containers are essentially equivalent to root on the host.
-        Defaults to false.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "privileged")
-
-    @_builtins.property
-    @pulumi.getter(name="procMount")
-    def proc_mount(self) -> Optional[_builtins.str]:
-        """
-        procMount denotes the type of proc mount to use for the containers.
-        The default value is Default which uses the container runtime defaults for
-        readonly paths and masked paths.
-        This requires the ProcMountType feature flag to be enabled.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "proc_mount")
-
-    @_builtins.property
-    @pulumi.getter(name="readOnlyRootFilesystem")
-    def read_only_root_filesystem(self) -> Optional[_builtins.bool]:
-        """
-        Whether this container has a read-only root filesystem.
-        Default is false.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "read_only_root_filesystem")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsGroup")
-    def run_as_group(self) -> Optional[_builtins.int]:
-        """
-        The GID to run the entrypoint of the container process.
-        Uses runtime default if unset.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_group")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsNonRoot")
-    def run_as_non_root(self) -> Optional[_builtins.bool]:
-        """
-        Indicates that the container must run as a non-root user.
-        If true, the Kubelet will validate the image at runtime to ensure that it
-        does not run as UID 0 (root) and fail to start the container if it does.
-        If unset or false, no such validation will be performed.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_non_root")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUser")
-    def run_as_user(self) -> Optional[_builtins.int]:
-        """
-        The UID to run the entrypoint of the container process.
-        Defaults to user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_user")
-
-    @_builtins.property
-    @pulumi.getter(name="seLinuxOptions")
-    def se_linux_options(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptions']:
-        return pulumi.get(self, "se_linux_options")
-
-    @_builtins.property
-    @pulumi.getter(name="seccompProfile")
-    def seccomp_profile(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfile']:
-        return pulumi.get(self, "seccomp_profile")
-
-    @_builtins.property
-    @pulumi.getter(name="windowsOptions")
-    def windows_options(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptions']:
-        return pulumi.get(self, "windows_options")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfile(dict):
-    """
-    appArmorProfile is the AppArmor options to use by this container. If set, this profile
-    overrides the pod's appArmorProfile.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "localhostProfile":
-            suggest = "localhost_profile"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfile. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfile.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfile.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 localhost_profile: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        appArmorProfile is the AppArmor options to use by this container. If set, this profile
-        overrides the pod's appArmorProfile.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param _builtins.str localhost_profile: localhostProfile indicates a profile loaded on the node that should be used.
-               The profile must be preconfigured on the node to work.
-               Must match the loaded name of the profile.
-               Must be set if and only if type is "Localhost".
-        :param _builtins.str type: type indicates which kind of AppArmor profile will be applied.
-               Valid options are:
-                 Localhost - a profile pre-loaded on the node.
-                 RuntimeDefault - the container runtime's default profile.
-                 Unconfined - no AppArmor enforcement.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> Optional[_builtins.str]:
-        """
-        localhostProfile indicates a profile loaded on the node that should be used.
-        The profile must be preconfigured on the node to work.
-        Must match the loaded name of the profile.
-        Must be set if and only if type is "Localhost".
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type indicates which kind of AppArmor profile will be applied.
-        Valid options are:
-          Localhost - a profile pre-loaded on the node.
-          RuntimeDefault - the container runtime's default profile.
-          Unconfined - no AppArmor enforcement.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatch(dict):
-    """
-    appArmorProfile is the AppArmor options to use by this container. If set, this profile
-    overrides the pod's appArmorProfile.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "localhostProfile":
-            suggest = "localhost_profile"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 localhost_profile: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        appArmorProfile is the AppArmor options to use by this container. If set, this profile
-        overrides the pod's appArmorProfile.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param _builtins.str localhost_profile: localhostProfile indicates a profile loaded on the node that should be used.
-               The profile must be preconfigured on the node to work.
-               Must match the loaded name of the profile.
-               Must be set if and only if type is "Localhost".
-        :param _builtins.str type: type indicates which kind of AppArmor profile will be applied.
-               Valid options are:
-                 Localhost - a profile pre-loaded on the node.
-                 RuntimeDefault - the container runtime's default profile.
-                 Unconfined - no AppArmor enforcement.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> Optional[_builtins.str]:
-        """
-        localhostProfile indicates a profile loaded on the node that should be used.
-        The profile must be preconfigured on the node to work.
-        Must match the loaded name of the profile.
-        Must be set if and only if type is "Localhost".
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type indicates which kind of AppArmor profile will be applied.
-        Valid options are:
-          Localhost - a profile pre-loaded on the node.
-          RuntimeDefault - the container runtime's default profile.
-          Unconfined - no AppArmor enforcement.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilities(dict):
-    """
-    The capabilities to add/drop when running containers.
-    Defaults to the default set of capabilities granted by the container runtime.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    def __init__(__self__, *,
-                 add: Optional[Sequence[_builtins.str]] = None,
-                 drop: Optional[Sequence[_builtins.str]] = None):
-        """
-        The capabilities to add/drop when running containers.
-        Defaults to the default set of capabilities granted by the container runtime.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param Sequence[_builtins.str] add: Added capabilities
-        :param Sequence[_builtins.str] drop: Removed capabilities
-        """
-        if add is not None:
-            pulumi.set(__self__, "add", add)
-        if drop is not None:
-            pulumi.set(__self__, "drop", drop)
-
-    @_builtins.property
-    @pulumi.getter
-    def add(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Added capabilities
-        """
-        return pulumi.get(self, "add")
-
-    @_builtins.property
-    @pulumi.getter
-    def drop(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Removed capabilities
-        """
-        return pulumi.get(self, "drop")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatch(dict):
-    """
-    The capabilities to add/drop when running containers.
-    Defaults to the default set of capabilities granted by the container runtime.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    def __init__(__self__, *,
-                 add: Optional[Sequence[_builtins.str]] = None,
-                 drop: Optional[Sequence[_builtins.str]] = None):
-        """
-        The capabilities to add/drop when running containers.
-        Defaults to the default set of capabilities granted by the container runtime.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param Sequence[_builtins.str] add: Added capabilities
-        :param Sequence[_builtins.str] drop: Removed capabilities
-        """
-        if add is not None:
-            pulumi.set(__self__, "add", add)
-        if drop is not None:
-            pulumi.set(__self__, "drop", drop)
-
-    @_builtins.property
-    @pulumi.getter
-    def add(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Added capabilities
-        """
-        return pulumi.get(self, "add")
-
-    @_builtins.property
-    @pulumi.getter
-    def drop(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        Removed capabilities
-        """
-        return pulumi.get(self, "drop")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatch(dict):
-    """
-    Container security context.
-    Security context specified here will override the security context set by the operator.
-    By default the operator sets the Tailscale container and the Tailscale init container to privileged
-    for proxies created for Tailscale ingress and egress Service, Connector and ProxyGroup.
-    You can reduce the permissions of the Tailscale container to cap NET_ADMIN by
-    installing device plugin in your cluster and configuring the proxies tun device to be created
-    by the device plugin, see  https://github.com/tailscale/tailscale/issues/10814#issuecomment-2479977752
-    https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "allowPrivilegeEscalation":
-            suggest = "allow_privilege_escalation"
-        elif key == "appArmorProfile":
-            suggest = "app_armor_profile"
-        elif key == "procMount":
-            suggest = "proc_mount"
-        elif key == "readOnlyRootFilesystem":
-            suggest = "read_only_root_filesystem"
-        elif key == "runAsGroup":
-            suggest = "run_as_group"
-        elif key == "runAsNonRoot":
-            suggest = "run_as_non_root"
-        elif key == "runAsUser":
-            suggest = "run_as_user"
-        elif key == "seLinuxOptions":
-            suggest = "se_linux_options"
-        elif key == "seccompProfile":
-            suggest = "seccomp_profile"
-        elif key == "windowsOptions":
-            suggest = "windows_options"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 allow_privilege_escalation: Optional[_builtins.bool] = None,
-                 app_armor_profile: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatch'] = None,
-                 capabilities: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatch'] = None,
-                 privileged: Optional[_builtins.bool] = None,
-                 proc_mount: Optional[_builtins.str] = None,
-                 read_only_root_filesystem: Optional[_builtins.bool] = None,
-                 run_as_group: Optional[_builtins.int] = None,
-                 run_as_non_root: Optional[_builtins.bool] = None,
-                 run_as_user: Optional[_builtins.int] = None,
-                 se_linux_options: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatch'] = None,
-                 seccomp_profile: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatch'] = None,
-                 windows_options: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatch'] = None):
-        """
-        Container security context.
-        Security context specified here will override the security context set by the operator.
-        By default the operator sets the Tailscale container and the Tailscale init container to privileged
-        for proxies created for Tailscale ingress and egress Service, Connector and ProxyGroup.
-        You can reduce the permissions of the Tailscale container to cap NET_ADMIN by
-        installing device plugin in your cluster and configuring the proxies tun device to be created
-        by the device plugin, see  https://github.com/tailscale/tailscale/issues/10814#issuecomment-2479977752
-        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#security-context
-
-        :param _builtins.bool allow_privilege_escalation: AllowPrivilegeEscalation controls whether a process can gain more
-               privileges than its parent process. This bool directly controls if
-               the no_new_privs flag will be set on the container process.
-               AllowPrivilegeEscalation is true always when the container is:
-               1) run as Privileged
-               2) has CAP_SYS_ADMIN
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.bool privileged: Run container in privileged mode.
-               Processes in privileged containers are essentially equivalent to root on the host.
-               Defaults to false.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.str proc_mount: procMount denotes the type of proc mount to use for the containers.
-               The default value is Default which uses the container runtime defaults for
-               readonly paths and masked paths.
-               This requires the ProcMountType feature flag to be enabled.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.bool read_only_root_filesystem: Whether this container has a read-only root filesystem.
-               Default is false.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.int run_as_group: The GID to run the entrypoint of the container process.
-               Uses runtime default if unset.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-               Note that this field cannot be set when spec.os.name is windows.
-        :param _builtins.bool run_as_non_root: Indicates that the container must run as a non-root user.
-               If true, the Kubelet will validate the image at runtime to ensure that it
-               does not run as UID 0 (root) and fail to start the container if it does.
-               If unset or false, no such validation will be performed.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        :param _builtins.int run_as_user: The UID to run the entrypoint of the container process.
-               Defaults to user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext.  If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-               Note that this field cannot be set when spec.os.name is windows.
-        """
-        if allow_privilege_escalation is not None:
-            pulumi.set(__self__, "allow_privilege_escalation", allow_privilege_escalation)
-        if app_armor_profile is not None:
-            pulumi.set(__self__, "app_armor_profile", app_armor_profile)
-        if capabilities is not None:
-            pulumi.set(__self__, "capabilities", capabilities)
-        if privileged is not None:
-            pulumi.set(__self__, "privileged", privileged)
-        if proc_mount is not None:
-            pulumi.set(__self__, "proc_mount", proc_mount)
-        if read_only_root_filesystem is not None:
-            pulumi.set(__self__, "read_only_root_filesystem", read_only_root_filesystem)
-        if run_as_group is not None:
-            pulumi.set(__self__, "run_as_group", run_as_group)
-        if run_as_non_root is not None:
-            pulumi.set(__self__, "run_as_non_root", run_as_non_root)
-        if run_as_user is not None:
-            pulumi.set(__self__, "run_as_user", run_as_user)
-        if se_linux_options is not None:
-            pulumi.set(__self__, "se_linux_options", se_linux_options)
-        if seccomp_profile is not None:
-            pulumi.set(__self__, "seccomp_profile", seccomp_profile)
-        if windows_options is not None:
-            pulumi.set(__self__, "windows_options", windows_options)
-
-    @_builtins.property
-    @pulumi.getter(name="allowPrivilegeEscalation")
-    def allow_privilege_escalation(self) -> Optional[_builtins.bool]:
-        """
-        AllowPrivilegeEscalation controls whether a process can gain more
-        privileges than its parent process. This bool directly controls if
-        the no_new_privs flag will be set on the container process.
-        AllowPrivilegeEscalation is true always when the container is:
-        1) run as Privileged
-        2) has CAP_SYS_ADMIN
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "allow_privilege_escalation")
-
-    @_builtins.property
-    @pulumi.getter(name="appArmorProfile")
-    def app_armor_profile(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatch']:
-        return pulumi.get(self, "app_armor_profile")
-
-    @_builtins.property
-    @pulumi.getter
-    def capabilities(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatch']:
-        return pulumi.get(self, "capabilities")
-
-    @_builtins.property
-    @pulumi.getter
-    def privileged(self) -> Optional[_builtins.bool]:
-        """
-        Run container in privileged mode.
-        Processes in privileged containers are essentially equivalent to root on the host.
-        Defaults to false.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "privileged")
-
-    @_builtins.property
-    @pulumi.getter(name="procMount")
-    def proc_mount(self) -> Optional[_builtins.str]:
-        """
-        procMount denotes the type of proc mount to use for the containers.
-        The default value is Default which uses the container runtime defaults for
-        readonly paths and masked paths.
-        This requires the ProcMountType feature flag to be enabled.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "proc_mount")
-
-    @_builtins.property
-    @pulumi.getter(name="readOnlyRootFilesystem")
-    def read_only_root_filesystem(self) -> Optional[_builtins.bool]:
-        """
-        Whether this container has a read-only root filesystem.
-        Default is false.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "read_only_root_filesystem")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsGroup")
-    def run_as_group(self) -> Optional[_builtins.int]:
-        """
-        The GID to run the entrypoint of the container process.
-        Uses runtime default if unset.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_group")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsNonRoot")
-    def run_as_non_root(self) -> Optional[_builtins.bool]:
-        """
-        Indicates that the container must run as a non-root user.
-        If true, the Kubelet will validate the image at runtime to ensure that it
-        does not run as UID 0 (root) and fail to start the container if it does.
-        If unset or false, no such validation will be performed.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_non_root")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUser")
-    def run_as_user(self) -> Optional[_builtins.int]:
-        """
-        The UID to run the entrypoint of the container process.
-        Defaults to user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-        """
-        return pulumi.get(self, "run_as_user")
-
-    @_builtins.property
-    @pulumi.getter(name="seLinuxOptions")
-    def se_linux_options(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatch']:
-        return pulumi.get(self, "se_linux_options")
-
-    @_builtins.property
-    @pulumi.getter(name="seccompProfile")
-    def seccomp_profile(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatch']:
-        return pulumi.get(self, "seccomp_profile")
-
-    @_builtins.property
-    @pulumi.getter(name="windowsOptions")
-    def windows_options(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatch']:
-        return pulumi.get(self, "windows_options")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptions(dict):
-    """
-    The SELinux context to be applied to the container.
-    If unspecified, the container runtime will allocate a random SELinux context for each
-    container.  May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    def __init__(__self__, *,
-                 level: Optional[_builtins.str] = None,
-                 role: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None,
-                 user: Optional[_builtins.str] = None):
-        """
-        The SELinux context to be applied to the container.
-        If unspecified, the container runtime will allocate a random SELinux context for each
-        container.  May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param _builtins.str level: Level is SELinux level label that applies to the container.
-        :param _builtins.str role: Role is a SELinux role label that applies to the container.
-        :param _builtins.str type: Type is a SELinux type label that applies to the container.
-        :param _builtins.str user: User is a SELinux user label that applies to the container.
-        """
-        if level is not None:
-            pulumi.set(__self__, "level", level)
-        if role is not None:
-            pulumi.set(__self__, "role", role)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-        if user is not None:
-            pulumi.set(__self__, "user", user)
-
-    @_builtins.property
-    @pulumi.getter
-    def level(self) -> Optional[_builtins.str]:
-        """
-        Level is SELinux level label that applies to the container.
-        """
-        return pulumi.get(self, "level")
-
-    @_builtins.property
-    @pulumi.getter
-    def role(self) -> Optional[_builtins.str]:
-        """
-        Role is a SELinux role label that applies to the container.
-        """
-        return pulumi.get(self, "role")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        Type is a SELinux type label that applies to the container.
-        """
-        return pulumi.get(self, "type")
-
-    @_builtins.property
-    @pulumi.getter
-    def user(self) -> Optional[_builtins.str]:
-        """
-        User is a SELinux user label that applies to the container.
-        """
-        return pulumi.get(self, "user")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatch(dict):
-    """
-    The SELinux context to be applied to the container.
-    If unspecified, the container runtime will allocate a random SELinux context for each
-    container.  May also be set in PodSecurityContext.  If set in both SecurityContext and
-    PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    def __init__(__self__, *,
-                 level: Optional[_builtins.str] = None,
-                 role: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None,
-                 user: Optional[_builtins.str] = None):
-        """
-        The SELinux context to be applied to the container.
-        If unspecified, the container runtime will allocate a random SELinux context for each
-        container.  May also be set in PodSecurityContext.  If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param _builtins.str level: Level is SELinux level label that applies to the container.
-        :param _builtins.str role: Role is a SELinux role label that applies to the container.
-        :param _builtins.str type: Type is a SELinux type label that applies to the container.
-        :param _builtins.str user: User is a SELinux user label that applies to the container.
-        """
-        if level is not None:
-            pulumi.set(__self__, "level", level)
-        if role is not None:
-            pulumi.set(__self__, "role", role)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-        if user is not None:
-            pulumi.set(__self__, "user", user)
-
-    @_builtins.property
-    @pulumi.getter
-    def level(self) -> Optional[_builtins.str]:
-        """
-        Level is SELinux level label that applies to the container.
-        """
-        return pulumi.get(self, "level")
-
-    @_builtins.property
-    @pulumi.getter
-    def role(self) -> Optional[_builtins.str]:
-        """
-        Role is a SELinux role label that applies to the container.
-        """
-        return pulumi.get(self, "role")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        Type is a SELinux type label that applies to the container.
-        """
-        return pulumi.get(self, "type")
-
-    @_builtins.property
-    @pulumi.getter
-    def user(self) -> Optional[_builtins.str]:
-        """
-        User is a SELinux user label that applies to the container.
-        """
-        return pulumi.get(self, "user")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfile(dict):
-    """
-    The seccomp options to use by this container. If seccomp options are
-    provided at both the pod & container level, the container options
-    override the pod options.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "localhostProfile":
-            suggest = "localhost_profile"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfile. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfile.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfile.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 localhost_profile: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        The seccomp options to use by this container. If seccomp options are
-        provided at both the pod & container level, the container options
-        override the pod options.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param _builtins.str localhost_profile: localhostProfile indicates a profile defined in a file on the node should be used.
-               The profile must be preconfigured on the node to work.
-               Must be a descending path, relative to the kubelet's configured seccomp profile location.
-               Must be set if type is "Localhost". Must NOT be set for any other type.
-        :param _builtins.str type: type indicates which kind of seccomp profile will be applied.
-               Valid options are:
-
-               Localhost - a profile defined in a file on the node should be used.
-               RuntimeDefault - the container runtime default profile should be used.
-               Unconfined - no profile should be applied.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> Optional[_builtins.str]:
-        """
-        localhostProfile indicates a profile defined in a file on the node should be used.
-        The profile must be preconfigured on the node to work.
-        Must be a descending path, relative to the kubelet's configured seccomp profile location.
-        Must be set if type is "Localhost". Must NOT be set for any other type.
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type indicates which kind of seccomp profile will be applied.
-        Valid options are:
-
-        Localhost - a profile defined in a file on the node should be used.
-        RuntimeDefault - the container runtime default profile should be used.
-        Unconfined - no profile should be applied.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatch(dict):
-    """
-    The seccomp options to use by this container. If seccomp options are
-    provided at both the pod & container level, the container options
-    override the pod options.
-    Note that this field cannot be set when spec.os.name is windows.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "localhostProfile":
-            suggest = "localhost_profile"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 localhost_profile: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        The seccomp options to use by this container. If seccomp options are
-        provided at both the pod & container level, the container options
-        override the pod options.
-        Note that this field cannot be set when spec.os.name is windows.
-
-        :param _builtins.str localhost_profile: localhostProfile indicates a profile defined in a file on the node should be used.
-               The profile must be preconfigured on the node to work.
-               Must be a descending path, relative to the kubelet's configured seccomp profile location.
-               Must be set if type is "Localhost". Must NOT be set for any other type.
-        :param _builtins.str type: type indicates which kind of seccomp profile will be applied.
-               Valid options are:
-
-               Localhost - a profile defined in a file on the node should be used.
-               RuntimeDefault - the container runtime default profile should be used.
-               Unconfined - no profile should be applied.
-        """
-        if localhost_profile is not None:
-            pulumi.set(__self__, "localhost_profile", localhost_profile)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="localhostProfile")
-    def localhost_profile(self) -> Optional[_builtins.str]:
-        """
-        localhostProfile indicates a profile defined in a file on the node should be used.
-        The profile must be preconfigured on the node to work.
-        Must be a descending path, relative to the kubelet's configured seccomp profile location.
-        Must be set if type is "Localhost". Must NOT be set for any other type.
-        """
-        return pulumi.get(self, "localhost_profile")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type indicates which kind of seccomp profile will be applied.
-        Valid options are:
-
-        Localhost - a profile defined in a file on the node should be used.
-        RuntimeDefault - the container runtime default profile should be used.
-        Unconfined - no profile should be applied.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptions(dict):
-    """
-    The Windows specific settings applied to all containers.
-    If unspecified, the options from the PodSecurityContext will be used.
-    If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is linux.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "gmsaCredentialSpec":
-            suggest = "gmsa_credential_spec"
-        elif key == "gmsaCredentialSpecName":
-            suggest = "gmsa_credential_spec_name"
-        elif key == "hostProcess":
-            suggest = "host_process"
-        elif key == "runAsUserName":
-            suggest = "run_as_user_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptions. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptions.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptions.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 gmsa_credential_spec: Optional[_builtins.str] = None,
-                 gmsa_credential_spec_name: Optional[_builtins.str] = None,
-                 host_process: Optional[_builtins.bool] = None,
-                 run_as_user_name: Optional[_builtins.str] = None):
-        """
-        The Windows specific settings applied to all containers.
-        If unspecified, the options from the PodSecurityContext will be used.
-        If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is linux.
-
-        :param _builtins.str gmsa_credential_spec: GMSACredentialSpec is where the GMSA admission webhook
-               (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-               GMSA credential spec named by the GMSACredentialSpecName field.
-        :param _builtins.str gmsa_credential_spec_name: GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        :param _builtins.bool host_process: HostProcess determines if a container should be run as a 'Host Process' container.
-               All of a Pod's containers must have the same effective HostProcess value
-               (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-               In addition, if HostProcess is true then HostNetwork must also be set to true.
-        :param _builtins.str run_as_user_name: The UserName in Windows to run the entrypoint of the container process.
-               Defaults to the user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext. If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        if gmsa_credential_spec is not None:
-            pulumi.set(__self__, "gmsa_credential_spec", gmsa_credential_spec)
-        if gmsa_credential_spec_name is not None:
-            pulumi.set(__self__, "gmsa_credential_spec_name", gmsa_credential_spec_name)
-        if host_process is not None:
-            pulumi.set(__self__, "host_process", host_process)
-        if run_as_user_name is not None:
-            pulumi.set(__self__, "run_as_user_name", run_as_user_name)
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpec")
-    def gmsa_credential_spec(self) -> Optional[_builtins.str]:
-        """
-        GMSACredentialSpec is where the GMSA admission webhook
-        (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-        GMSA credential spec named by the GMSACredentialSpecName field.
-        """
-        return pulumi.get(self, "gmsa_credential_spec")
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpecName")
-    def gmsa_credential_spec_name(self) -> Optional[_builtins.str]:
-        """
-        GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        """
-        return pulumi.get(self, "gmsa_credential_spec_name")
-
-    @_builtins.property
-    @pulumi.getter(name="hostProcess")
-    def host_process(self) -> Optional[_builtins.bool]:
-        """
-        HostProcess determines if a container should be run as a 'Host Process' container.
-        All of a Pod's containers must have the same effective HostProcess value
-        (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-        In addition, if HostProcess is true then HostNetwork must also be set to true.
-        """
-        return pulumi.get(self, "host_process")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUserName")
-    def run_as_user_name(self) -> Optional[_builtins.str]:
-        """
-        The UserName in Windows to run the entrypoint of the container process.
-        Defaults to the user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext. If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_user_name")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatch(dict):
-    """
-    The Windows specific settings applied to all containers.
-    If unspecified, the options from the PodSecurityContext will be used.
-    If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-    Note that this field cannot be set when spec.os.name is linux.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "gmsaCredentialSpec":
-            suggest = "gmsa_credential_spec"
-        elif key == "gmsaCredentialSpecName":
-            suggest = "gmsa_credential_spec_name"
-        elif key == "hostProcess":
-            suggest = "host_process"
-        elif key == "runAsUserName":
-            suggest = "run_as_user_name"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 gmsa_credential_spec: Optional[_builtins.str] = None,
-                 gmsa_credential_spec_name: Optional[_builtins.str] = None,
-                 host_process: Optional[_builtins.bool] = None,
-                 run_as_user_name: Optional[_builtins.str] = None):
-        """
-        The Windows specific settings applied to all containers.
-        If unspecified, the options from the PodSecurityContext will be used.
-        If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
-        Note that this field cannot be set when spec.os.name is linux.
-
-        :param _builtins.str gmsa_credential_spec: GMSACredentialSpec is where the GMSA admission webhook
-               (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-               GMSA credential spec named by the GMSACredentialSpecName field.
-        :param _builtins.str gmsa_credential_spec_name: GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        :param _builtins.bool host_process: HostProcess determines if a container should be run as a 'Host Process' container.
-               All of a Pod's containers must have the same effective HostProcess value
-               (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-               In addition, if HostProcess is true then HostNetwork must also be set to true.
-        :param _builtins.str run_as_user_name: The UserName in Windows to run the entrypoint of the container process.
-               Defaults to the user specified in image metadata if unspecified.
-               May also be set in PodSecurityContext. If set in both SecurityContext and
-               PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        if gmsa_credential_spec is not None:
-            pulumi.set(__self__, "gmsa_credential_spec", gmsa_credential_spec)
-        if gmsa_credential_spec_name is not None:
-            pulumi.set(__self__, "gmsa_credential_spec_name", gmsa_credential_spec_name)
-        if host_process is not None:
-            pulumi.set(__self__, "host_process", host_process)
-        if run_as_user_name is not None:
-            pulumi.set(__self__, "run_as_user_name", run_as_user_name)
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpec")
-    def gmsa_credential_spec(self) -> Optional[_builtins.str]:
-        """
-        GMSACredentialSpec is where the GMSA admission webhook
-        (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the
-        GMSA credential spec named by the GMSACredentialSpecName field.
-        """
-        return pulumi.get(self, "gmsa_credential_spec")
-
-    @_builtins.property
-    @pulumi.getter(name="gmsaCredentialSpecName")
-    def gmsa_credential_spec_name(self) -> Optional[_builtins.str]:
-        """
-        GMSACredentialSpecName is the name of the GMSA credential spec to use.
-        """
-        return pulumi.get(self, "gmsa_credential_spec_name")
-
-    @_builtins.property
-    @pulumi.getter(name="hostProcess")
-    def host_process(self) -> Optional[_builtins.bool]:
-        """
-        HostProcess determines if a container should be run as a 'Host Process' container.
-        All of a Pod's containers must have the same effective HostProcess value
-        (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).
-        In addition, if HostProcess is true then HostNetwork must also be set to true.
-        """
-        return pulumi.get(self, "host_process")
-
-    @_builtins.property
-    @pulumi.getter(name="runAsUserName")
-    def run_as_user_name(self) -> Optional[_builtins.str]:
-        """
-        The UserName in Windows to run the entrypoint of the container process.
-        Defaults to the user specified in image metadata if unspecified.
-        May also be set in PodSecurityContext. If set in both SecurityContext and
-        PodSecurityContext, the value specified in SecurityContext takes precedence.
-        """
-        return pulumi.get(self, "run_as_user_name")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTolerations(dict):
-    """
-    The pod this Toleration is attached to tolerates any taint that matches
-    the triple <key,value,effect> using the matching operator <operator>.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "tolerationSeconds":
-            suggest = "toleration_seconds"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTolerations. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTolerations.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTolerations.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 effect: Optional[_builtins.str] = None,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 toleration_seconds: Optional[_builtins.int] = None,
-                 value: Optional[_builtins.str] = None):
-        """
-        The pod this Toleration is attached to tolerates any taint that matches
-        the triple <key,value,effect> using the matching operator <operator>.
-
-        :param _builtins.str effect: Effect indicates the taint effect to match. Empty means match all taint effects.
-               When specified, allowed values are NoSchedule, PreferNoSchedule and NoExecute.
-        :param _builtins.str key: Key is the taint key that the toleration applies to. Empty means match all taint keys.
-               If the key is empty, operator must be Exists; this combination means to match all values and all keys.
-        :param _builtins.str operator: Operator represents a key's relationship to the value.
-               Valid operators are Exists and Equal. Defaults to Equal.
-               Exists is equivalent to wildcard for value, so that a pod can
-               tolerate all taints of a particular category.
-        :param _builtins.int toleration_seconds: TolerationSeconds represents the period of time the toleration (which must be
-               of effect NoExecute, otherwise this field is ignored) tolerates the taint. By default,
-               it is not set, which means tolerate the taint forever (do not evict). Zero and
-               negative values will be treated as 0 (evict immediately) by the system.
-        :param _builtins.str value: Value is the taint value the toleration matches to.
-               If the operator is Exists, the value should be empty, otherwise just a regular string.
-        """
-        if effect is not None:
-            pulumi.set(__self__, "effect", effect)
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if toleration_seconds is not None:
-            pulumi.set(__self__, "toleration_seconds", toleration_seconds)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def effect(self) -> Optional[_builtins.str]:
-        """
-        Effect indicates the taint effect to match. Empty means match all taint effects.
-        When specified, allowed values are NoSchedule, PreferNoSchedule and NoExecute.
-        """
-        return pulumi.get(self, "effect")
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        Key is the taint key that the toleration applies to. Empty means match all taint keys.
-        If the key is empty, operator must be Exists; this combination means to match all values and all keys.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        Operator represents a key's relationship to the value.
-        Valid operators are Exists and Equal. Defaults to Equal.
-        Exists is equivalent to wildcard for value, so that a pod can
-        tolerate all taints of a particular category.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter(name="tolerationSeconds")
-    def toleration_seconds(self) -> Optional[_builtins.int]:
-        """
-        TolerationSeconds represents the period of time the toleration (which must be
-        of effect NoExecute, otherwise this field is ignored) tolerates the taint. By default,
-        it is not set, which means tolerate the taint forever (do not evict). Zero and
-        negative values will be treated as 0 (evict immediately) by the system.
-        """
-        return pulumi.get(self, "toleration_seconds")
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> Optional[_builtins.str]:
-        """
-        Value is the taint value the toleration matches to.
-        If the operator is Exists, the value should be empty, otherwise just a regular string.
-        """
-        return pulumi.get(self, "value")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTolerationsPatch(dict):
-    """
-    The pod this Toleration is attached to tolerates any taint that matches
-    the triple <key,value,effect> using the matching operator <operator>.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "tolerationSeconds":
-            suggest = "toleration_seconds"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTolerationsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTolerationsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTolerationsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 effect: Optional[_builtins.str] = None,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 toleration_seconds: Optional[_builtins.int] = None,
-                 value: Optional[_builtins.str] = None):
-        """
-        The pod this Toleration is attached to tolerates any taint that matches
-        the triple <key,value,effect> using the matching operator <operator>.
-
-        :param _builtins.str effect: Effect indicates the taint effect to match. Empty means match all taint effects.
-               When specified, allowed values are NoSchedule, PreferNoSchedule and NoExecute.
-        :param _builtins.str key: Key is the taint key that the toleration applies to. Empty means match all taint keys.
-               If the key is empty, operator must be Exists; this combination means to match all values and all keys.
-        :param _builtins.str operator: Operator represents a key's relationship to the value.
-               Valid operators are Exists and Equal. Defaults to Equal.
-               Exists is equivalent to wildcard for value, so that a pod can
-               tolerate all taints of a particular category.
-        :param _builtins.int toleration_seconds: TolerationSeconds represents the period of time the toleration (which must be
-               of effect NoExecute, otherwise this field is ignored) tolerates the taint. By default,
-               it is not set, which means tolerate the taint forever (do not evict). Zero and
-               negative values will be treated as 0 (evict immediately) by the system.
-        :param _builtins.str value: Value is the taint value the toleration matches to.
-               If the operator is Exists, the value should be empty, otherwise just a regular string.
-        """
-        if effect is not None:
-            pulumi.set(__self__, "effect", effect)
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if toleration_seconds is not None:
-            pulumi.set(__self__, "toleration_seconds", toleration_seconds)
-        if value is not None:
-            pulumi.set(__self__, "value", value)
-
-    @_builtins.property
-    @pulumi.getter
-    def effect(self) -> Optional[_builtins.str]:
-        """
-        Effect indicates the taint effect to match. Empty means match all taint effects.
-        When specified, allowed values are NoSchedule, PreferNoSchedule and NoExecute.
-        """
-        return pulumi.get(self, "effect")
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        Key is the taint key that the toleration applies to. Empty means match all taint keys.
-        If the key is empty, operator must be Exists; this combination means to match all values and all keys.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        Operator represents a key's relationship to the value.
-        Valid operators are Exists and Equal. Defaults to Equal.
-        Exists is equivalent to wildcard for value, so that a pod can
-        tolerate all taints of a particular category.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter(name="tolerationSeconds")
-    def toleration_seconds(self) -> Optional[_builtins.int]:
-        """
-        TolerationSeconds represents the period of time the toleration (which must be
-        of effect NoExecute, otherwise this field is ignored) tolerates the taint. By default,
-        it is not set, which means tolerate the taint forever (do not evict). Zero and
-        negative values will be treated as 0 (evict immediately) by the system.
-        """
-        return pulumi.get(self, "toleration_seconds")
-
-    @_builtins.property
-    @pulumi.getter
-    def value(self) -> Optional[_builtins.str]:
-        """
-        Value is the taint value the toleration matches to.
-        If the operator is Exists, the value should be empty, otherwise just a regular string.
-        """
-        return pulumi.get(self, "value")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTopologySpreadConstraints(dict):
-    """
-    TopologySpreadConstraint specifies how to spread matching pods among the given topology.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "labelSelector":
-            suggest = "label_selector"
-        elif key == "matchLabelKeys":
-            suggest = "match_label_keys"
-        elif key == "maxSkew":
-            suggest = "max_skew"
-        elif key == "minDomains":
-            suggest = "min_domains"
-        elif key == "nodeAffinityPolicy":
-            suggest = "node_affinity_policy"
-        elif key == "nodeTaintsPolicy":
-            suggest = "node_taints_policy"
-        elif key == "topologyKey":
-            suggest = "topology_key"
-        elif key == "whenUnsatisfiable":
-            suggest = "when_unsatisfiable"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTopologySpreadConstraints. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTopologySpreadConstraints.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTopologySpreadConstraints.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 label_selector: Optional['outputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelector'] = None,
-                 match_label_keys: Optional[Sequence[_builtins.str]] = None,
-                 max_skew: Optional[_builtins.int] = None,
-                 min_domains: Optional[_builtins.int] = None,
-                 node_affinity_policy: Optional[_builtins.str] = None,
-                 node_taints_policy: Optional[_builtins.str] = None,
-                 topology_key: Optional[_builtins.str] = None,
-                 when_unsatisfiable: Optional[_builtins.str] = None):
-        """
-        TopologySpreadConstraint specifies how to spread matching pods among the given topology.
-
-        :param Sequence[_builtins.str] match_label_keys: MatchLabelKeys is a set of pod label keys to select the pods over which
-               spreading will be calculated. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are ANDed with labelSelector
-               to select the group of existing pods over which spreading will be calculated
-               for the incoming pod. The same key is forbidden to exist in both MatchLabelKeys and LabelSelector.
-               MatchLabelKeys cannot be set when LabelSelector isn't set.
-               Keys that don't exist in the incoming pod labels will
-               be ignored. A null or empty list means only match against labelSelector.
-
-               This is a beta field and requires the MatchLabelKeysInPodTopologySpread feature gate to be enabled (enabled by default).
-        :param _builtins.int max_skew: MaxSkew describes the degree to which pods may be unevenly distributed.
-               When `whenUnsatisfiable=DoNotSchedule`, it is the maximum permitted difference
-               between the number of matching pods in the target topology and the global minimum.
-               The global minimum is the minimum number of matching pods in an eligible domain
-               or zero if the number of eligible domains is less than MinDomains.
-               For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-               labelSelector spread as 2/2/1:
-               In this case, the global minimum is 1.
-               | zone1 | zone2 | zone3 |
-               |  P P  |  P P  |   P   |
-               - if MaxSkew is 1, incoming pod can only be scheduled to zone3 to become 2/2/2;
-               scheduling it onto zone1(zone2) would make the ActualSkew(3-1) on zone1(zone2)
-               violate MaxSkew(1).
-               - if MaxSkew is 2, incoming pod can be scheduled onto any zone.
-               When `whenUnsatisfiable=ScheduleAnyway`, it is used to give higher precedence
-               to topologies that satisfy it.
-               It's a required field. Default value is 1 and 0 is not allowed.
-        :param _builtins.int min_domains: MinDomains indicates a minimum number of eligible domains.
-               When the number of eligible domains with matching topology keys is less than minDomains,
-               Pod Topology Spread treats "global minimum" as 0, and then the calculation of Skew is performed.
-               And when the number of eligible domains with matching topology keys equals or greater than minDomains,
-               this value has no effect on scheduling.
-               As a result, when the number of eligible domains is less than minDomains,
-               scheduler won't schedule more than maxSkew Pods to those domains.
-               If value is nil, the constraint behaves as if MinDomains is equal to 1.
-               Valid values are integers greater than 0.
-               When value is not nil, WhenUnsatisfiable must be DoNotSchedule.
-
-               For example, in a 3-zone cluster, MaxSkew is set to 2, MinDomains is set to 5 and pods with the same
-               labelSelector spread as 2/2/2:
-               | zone1 | zone2 | zone3 |
-               |  P P  |  P P  |  P P  |
-               The number of domains is less than 5(MinDomains), so "global minimum" is treated as 0.
-               In this situation, new pod with the same labelSelector cannot be scheduled,
-               because computed skew will be 3(3 - 0) if new Pod is scheduled to any of the three zones,
-               it will violate MaxSkew.
-        :param _builtins.str node_affinity_policy: NodeAffinityPolicy indicates how we will treat Pod's nodeAffinity/nodeSelector
-               when calculating pod topology spread skew. Options are:
-               - Honor: only nodes matching nodeAffinity/nodeSelector are included in the calculations.
-               - Ignore: nodeAffinity/nodeSelector are ignored. All nodes are included in the calculations.
-
-               If this value is nil, the behavior is equivalent to the Honor policy.
-        :param _builtins.str node_taints_policy: NodeTaintsPolicy indicates how we will treat node taints when calculating
-               pod topology spread skew. Options are:
-               - Honor: nodes without taints, along with tainted nodes for which the incoming pod
-               has a toleration, are included.
-               - Ignore: node taints are ignored. All nodes are included.
-
-               If this value is nil, the behavior is equivalent to the Ignore policy.
-        :param _builtins.str topology_key: TopologyKey is the key of node labels. Nodes that have a label with this key
-               and identical values are considered to be in the same topology.
-               We consider each <key, value> as a "bucket", and try to put balanced number
-               of pods into each bucket.
-               We define a domain as a particular instance of a topology.
-               Also, we define an eligible domain as a domain whose nodes meet the requirements of
-               nodeAffinityPolicy and nodeTaintsPolicy.
-               e.g. If TopologyKey is "kubernetes.io/hostname", each Node is a domain of that topology.
-               And, if TopologyKey is "topology.kubernetes.io/zone", each zone is a domain of that topology.
-               It's a required field.
-        :param _builtins.str when_unsatisfiable: WhenUnsatisfiable indicates how to deal with a pod if it doesn't satisfy
-               the spread constraint.
-               - DoNotSchedule (default) tells the scheduler not to schedule it.
-               - ScheduleAnyway tells the scheduler to schedule the pod in any location,
-                 but giving higher precedence to topologies that would help reduce the
-                 skew.
-               A constraint is considered "Unsatisfiable" for an incoming pod
-               if and only if every possible node assignment for that pod would violate
-               "MaxSkew" on some topology.
-               For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-               labelSelector spread as 3/1/1:
-               | zone1 | zone2 | zone3 |
-               | P P P |   P   |   P   |
-               If WhenUnsatisfiable is set to DoNotSchedule, incoming pod can only be scheduled
-               to zone2(zone3) to become 3/2/1(3/1/2) as ActualSkew(2-1) on zone2(zone3) satisfies
-               MaxSkew(1). In other words, the cluster can still be imbalanced, but scheduler
-               won't make it *more* imbalanced.
-               It's a required field.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if max_skew is not None:
-            pulumi.set(__self__, "max_skew", max_skew)
-        if min_domains is not None:
-            pulumi.set(__self__, "min_domains", min_domains)
-        if node_affinity_policy is not None:
-            pulumi.set(__self__, "node_affinity_policy", node_affinity_policy)
-        if node_taints_policy is not None:
-            pulumi.set(__self__, "node_taints_policy", node_taints_policy)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-        if when_unsatisfiable is not None:
-            pulumi.set(__self__, "when_unsatisfiable", when_unsatisfiable)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelector']:
-        return pulumi.get(self, "label_selector")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select the pods over which
-        spreading will be calculated. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are ANDed with labelSelector
-        to select the group of existing pods over which spreading will be calculated
-        for the incoming pod. The same key is forbidden to exist in both MatchLabelKeys and LabelSelector.
-        MatchLabelKeys cannot be set when LabelSelector isn't set.
-        Keys that don't exist in the incoming pod labels will
-        be ignored. A null or empty list means only match against labelSelector.
-
-        This is a beta field and requires the MatchLabelKeysInPodTopologySpread feature gate to be enabled (enabled by default).
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @_builtins.property
-    @pulumi.getter(name="maxSkew")
-    def max_skew(self) -> Optional[_builtins.int]:
-        """
-        MaxSkew describes the degree to which pods may be unevenly distributed.
-        When `whenUnsatisfiable=DoNotSchedule`, it is the maximum permitted difference
-        between the number of matching pods in the target topology and the global minimum.
-        The global minimum is the minimum number of matching pods in an eligible domain
-        or zero if the number of eligible domains is less than MinDomains.
-        For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-        labelSelector spread as 2/2/1:
-        In this case, the global minimum is 1.
-        | zone1 | zone2 | zone3 |
-        |  P P  |  P P  |   P   |
-        - if MaxSkew is 1, incoming pod can only be scheduled to zone3 to become 2/2/2;
-        scheduling it onto zone1(zone2) would make the ActualSkew(3-1) on zone1(zone2)
-        violate MaxSkew(1).
-        - if MaxSkew is 2, incoming pod can be scheduled onto any zone.
-        When `whenUnsatisfiable=ScheduleAnyway`, it is used to give higher precedence
-        to topologies that satisfy it.
-        It's a required field. Default value is 1 and 0 is not allowed.
-        """
-        return pulumi.get(self, "max_skew")
-
-    @_builtins.property
-    @pulumi.getter(name="minDomains")
-    def min_domains(self) -> Optional[_builtins.int]:
-        """
-        MinDomains indicates a minimum number of eligible domains.
-        When the number of eligible domains with matching topology keys is less than minDomains,
-        Pod Topology Spread treats "global minimum" as 0, and then the calculation of Skew is performed.
-        And when the number of eligible domains with matching topology keys equals or greater than minDomains,
-        this value has no effect on scheduling.
-        As a result, when the number of eligible domains is less than minDomains,
-        scheduler won't schedule more than maxSkew Pods to those domains.
-        If value is nil, the constraint behaves as if MinDomains is equal to 1.
-        Valid values are integers greater than 0.
-        When value is not nil, WhenUnsatisfiable must be DoNotSchedule.
-
-        For example, in a 3-zone cluster, MaxSkew is set to 2, MinDomains is set to 5 and pods with the same
-        labelSelector spread as 2/2/2:
-        | zone1 | zone2 | zone3 |
-        |  P P  |  P P  |  P P  |
-        The number of domains is less than 5(MinDomains), so "global minimum" is treated as 0.
-        In this situation, new pod with the same labelSelector cannot be scheduled,
-        because computed skew will be 3(3 - 0) if new Pod is scheduled to any of the three zones,
-        it will violate MaxSkew.
-        """
-        return pulumi.get(self, "min_domains")
-
-    @_builtins.property
-    @pulumi.getter(name="nodeAffinityPolicy")
-    def node_affinity_policy(self) -> Optional[_builtins.str]:
-        """
-        NodeAffinityPolicy indicates how we will treat Pod's nodeAffinity/nodeSelector
-        when calculating pod topology spread skew. Options are:
-        - Honor: only nodes matching nodeAffinity/nodeSelector are included in the calculations.
-        - Ignore: nodeAffinity/nodeSelector are ignored. All nodes are included in the calculations.
-
-        If this value is nil, the behavior is equivalent to the Honor policy.
-        """
-        return pulumi.get(self, "node_affinity_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="nodeTaintsPolicy")
-    def node_taints_policy(self) -> Optional[_builtins.str]:
-        """
-        NodeTaintsPolicy indicates how we will treat node taints when calculating
-        pod topology spread skew. Options are:
-        - Honor: nodes without taints, along with tainted nodes for which the incoming pod
-        has a toleration, are included.
-        - Ignore: node taints are ignored. All nodes are included.
-
-        If this value is nil, the behavior is equivalent to the Ignore policy.
-        """
-        return pulumi.get(self, "node_taints_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> Optional[_builtins.str]:
-        """
-        TopologyKey is the key of node labels. Nodes that have a label with this key
-        and identical values are considered to be in the same topology.
-        We consider each <key, value> as a "bucket", and try to put balanced number
-        of pods into each bucket.
-        We define a domain as a particular instance of a topology.
-        Also, we define an eligible domain as a domain whose nodes meet the requirements of
-        nodeAffinityPolicy and nodeTaintsPolicy.
-        e.g. If TopologyKey is "kubernetes.io/hostname", each Node is a domain of that topology.
-        And, if TopologyKey is "topology.kubernetes.io/zone", each zone is a domain of that topology.
-        It's a required field.
-        """
-        return pulumi.get(self, "topology_key")
-
-    @_builtins.property
-    @pulumi.getter(name="whenUnsatisfiable")
-    def when_unsatisfiable(self) -> Optional[_builtins.str]:
-        """
-        WhenUnsatisfiable indicates how to deal with a pod if it doesn't satisfy
-        the spread constraint.
-        - DoNotSchedule (default) tells the scheduler not to schedule it.
-        - ScheduleAnyway tells the scheduler to schedule the pod in any location,
-          but giving higher precedence to topologies that would help reduce the
-          skew.
-        A constraint is considered "Unsatisfiable" for an incoming pod
-        if and only if every possible node assignment for that pod would violate
-        "MaxSkew" on some topology.
-        For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-        labelSelector spread as 3/1/1:
-        | zone1 | zone2 | zone3 |
-        | P P P |   P   |   P   |
-        If WhenUnsatisfiable is set to DoNotSchedule, incoming pod can only be scheduled
-        to zone2(zone3) to become 3/2/1(3/1/2) as ActualSkew(2-1) on zone2(zone3) satisfies
-        MaxSkew(1). In other words, the cluster can still be imbalanced, but scheduler
-        won't make it *more* imbalanced.
-        It's a required field.
-        """
-        return pulumi.get(self, "when_unsatisfiable")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelector(dict):
-    """
-    LabelSelector is used to find matching pods.
-    Pods that match this label selector are counted to determine the number of pods
-    in their corresponding topology domain.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelector. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelector.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelector.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressions']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        LabelSelector is used to find matching pods.
-        Pods that match this label selector are counted to determine the number of pods
-        in their corresponding topology domain.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressions']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressions(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatch(dict):
-    """
-    A label selector requirement is a selector that contains values, a key, and an operator that
-    relates the key and values.
-    """
-    def __init__(__self__, *,
-                 key: Optional[_builtins.str] = None,
-                 operator: Optional[_builtins.str] = None,
-                 values: Optional[Sequence[_builtins.str]] = None):
-        """
-        A label selector requirement is a selector that contains values, a key, and an operator that
-        relates the key and values.
-
-        :param _builtins.str key: key is the label key that the selector applies to.
-        :param _builtins.str operator: operator represents a key's relationship to a set of values.
-               Valid operators are In, NotIn, Exists and DoesNotExist.
-        :param Sequence[_builtins.str] values: values is an array of string values. If the operator is In or NotIn,
-               the values array must be non-empty. If the operator is Exists or DoesNotExist,
-               the values array must be empty. This array is replaced during a strategic
-               merge patch.
-        """
-        if key is not None:
-            pulumi.set(__self__, "key", key)
-        if operator is not None:
-            pulumi.set(__self__, "operator", operator)
-        if values is not None:
-            pulumi.set(__self__, "values", values)
-
-    @_builtins.property
-    @pulumi.getter
-    def key(self) -> Optional[_builtins.str]:
-        """
-        key is the label key that the selector applies to.
-        """
-        return pulumi.get(self, "key")
-
-    @_builtins.property
-    @pulumi.getter
-    def operator(self) -> Optional[_builtins.str]:
-        """
-        operator represents a key's relationship to a set of values.
-        Valid operators are In, NotIn, Exists and DoesNotExist.
-        """
-        return pulumi.get(self, "operator")
-
-    @_builtins.property
-    @pulumi.getter
-    def values(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        values is an array of string values. If the operator is In or NotIn,
-        the values array must be non-empty. If the operator is Exists or DoesNotExist,
-        the values array must be empty. This array is replaced during a strategic
-        merge patch.
-        """
-        return pulumi.get(self, "values")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatch(dict):
-    """
-    LabelSelector is used to find matching pods.
-    Pods that match this label selector are counted to determine the number of pods
-    in their corresponding topology domain.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "matchExpressions":
-            suggest = "match_expressions"
-        elif key == "matchLabels":
-            suggest = "match_labels"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 match_expressions: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatch']] = None,
-                 match_labels: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        LabelSelector is used to find matching pods.
-        Pods that match this label selector are counted to determine the number of pods
-        in their corresponding topology domain.
-
-        :param Sequence['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatchArgs'] match_expressions: matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        :param Mapping[str, _builtins.str] match_labels: matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-               map is equivalent to an element of matchExpressions, whose key field is "key", the
-               operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        if match_expressions is not None:
-            pulumi.set(__self__, "match_expressions", match_expressions)
-        if match_labels is not None:
-            pulumi.set(__self__, "match_labels", match_labels)
-
-    @_builtins.property
-    @pulumi.getter(name="matchExpressions")
-    def match_expressions(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatch']]:
-        """
-        matchExpressions is a list of label selector requirements. The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_expressions")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabels")
-    def match_labels(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        matchLabels is a map of {key,value} pairs. A single {key,value} in the matchLabels
-        map is equivalent to an element of matchExpressions, whose key field is "key", the
-        operator is "In", and the values array contains only "value". The requirements are ANDed.
-        """
-        return pulumi.get(self, "match_labels")
-
-
-@pulumi.output_type
-class ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatch(dict):
-    """
-    TopologySpreadConstraint specifies how to spread matching pods among the given topology.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "labelSelector":
-            suggest = "label_selector"
-        elif key == "matchLabelKeys":
-            suggest = "match_label_keys"
-        elif key == "maxSkew":
-            suggest = "max_skew"
-        elif key == "minDomains":
-            suggest = "min_domains"
-        elif key == "nodeAffinityPolicy":
-            suggest = "node_affinity_policy"
-        elif key == "nodeTaintsPolicy":
-            suggest = "node_taints_policy"
-        elif key == "topologyKey":
-            suggest = "topology_key"
-        elif key == "whenUnsatisfiable":
-            suggest = "when_unsatisfiable"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 label_selector: Optional['outputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatch'] = None,
-                 match_label_keys: Optional[Sequence[_builtins.str]] = None,
-                 max_skew: Optional[_builtins.int] = None,
-                 min_domains: Optional[_builtins.int] = None,
-                 node_affinity_policy: Optional[_builtins.str] = None,
-                 node_taints_policy: Optional[_builtins.str] = None,
-                 topology_key: Optional[_builtins.str] = None,
-                 when_unsatisfiable: Optional[_builtins.str] = None):
-        """
-        TopologySpreadConstraint specifies how to spread matching pods among the given topology.
-
-        :param Sequence[_builtins.str] match_label_keys: MatchLabelKeys is a set of pod label keys to select the pods over which
-               spreading will be calculated. The keys are used to lookup values from the
-               incoming pod labels, those key-value labels are ANDed with labelSelector
-               to select the group of existing pods over which spreading will be calculated
-               for the incoming pod. The same key is forbidden to exist in both MatchLabelKeys and LabelSelector.
-               MatchLabelKeys cannot be set when LabelSelector isn't set.
-               Keys that don't exist in the incoming pod labels will
-               be ignored. A null or empty list means only match against labelSelector.
-
-               This is a beta field and requires the MatchLabelKeysInPodTopologySpread feature gate to be enabled (enabled by default).
-        :param _builtins.int max_skew: MaxSkew describes the degree to which pods may be unevenly distributed.
-               When `whenUnsatisfiable=DoNotSchedule`, it is the maximum permitted difference
-               between the number of matching pods in the target topology and the global minimum.
-               The global minimum is the minimum number of matching pods in an eligible domain
-               or zero if the number of eligible domains is less than MinDomains.
-               For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-               labelSelector spread as 2/2/1:
-               In this case, the global minimum is 1.
-               | zone1 | zone2 | zone3 |
-               |  P P  |  P P  |   P   |
-               - if MaxSkew is 1, incoming pod can only be scheduled to zone3 to become 2/2/2;
-               scheduling it onto zone1(zone2) would make the ActualSkew(3-1) on zone1(zone2)
-               violate MaxSkew(1).
-               - if MaxSkew is 2, incoming pod can be scheduled onto any zone.
-               When `whenUnsatisfiable=ScheduleAnyway`, it is used to give higher precedence
-               to topologies that satisfy it.
-               It's a required field. Default value is 1 and 0 is not allowed.
-        :param _builtins.int min_domains: MinDomains indicates a minimum number of eligible domains.
-               When the number of eligible domains with matching topology keys is less than minDomains,
-               Pod Topology Spread treats "global minimum" as 0, and then the calculation of Skew is performed.
-               And when the number of eligible domains with matching topology keys equals or greater than minDomains,
-               this value has no effect on scheduling.
-               As a result, when the number of eligible domains is less than minDomains,
-               scheduler won't schedule more than maxSkew Pods to those domains.
-               If value is nil, the constraint behaves as if MinDomains is equal to 1.
-               Valid values are integers greater than 0.
-               When value is not nil, WhenUnsatisfiable must be DoNotSchedule.
-
-               For example, in a 3-zone cluster, MaxSkew is set to 2, MinDomains is set to 5 and pods with the same
-               labelSelector spread as 2/2/2:
-               | zone1 | zone2 | zone3 |
-               |  P P  |  P P  |  P P  |
-               The number of domains is less than 5(MinDomains), so "global minimum" is treated as 0.
-               In this situation, new pod with the same labelSelector cannot be scheduled,
-               because computed skew will be 3(3 - 0) if new Pod is scheduled to any of the three zones,
-               it will violate MaxSkew.
-        :param _builtins.str node_affinity_policy: NodeAffinityPolicy indicates how we will treat Pod's nodeAffinity/nodeSelector
-               when calculating pod topology spread skew. Options are:
-               - Honor: only nodes matching nodeAffinity/nodeSelector are included in the calculations.
-               - Ignore: nodeAffinity/nodeSelector are ignored. All nodes are included in the calculations.
-
-               If this value is nil, the behavior is equivalent to the Honor policy.
-        :param _builtins.str node_taints_policy: NodeTaintsPolicy indicates how we will treat node taints when calculating
-               pod topology spread skew. Options are:
-               - Honor: nodes without taints, along with tainted nodes for which the incoming pod
-               has a toleration, are included.
-               - Ignore: node taints are ignored. All nodes are included.
-
-               If this value is nil, the behavior is equivalent to the Ignore policy.
-        :param _builtins.str topology_key: TopologyKey is the key of node labels. Nodes that have a label with this key
-               and identical values are considered to be in the same topology.
-               We consider each <key, value> as a "bucket", and try to put balanced number
-               of pods into each bucket.
-               We define a domain as a particular instance of a topology.
-               Also, we define an eligible domain as a domain whose nodes meet the requirements of
-               nodeAffinityPolicy and nodeTaintsPolicy.
-               e.g. If TopologyKey is "kubernetes.io/hostname", each Node is a domain of that topology.
-               And, if TopologyKey is "topology.kubernetes.io/zone", each zone is a domain of that topology.
-               It's a required field.
-        :param _builtins.str when_unsatisfiable: WhenUnsatisfiable indicates how to deal with a pod if it doesn't satisfy
-               the spread constraint.
-               - DoNotSchedule (default) tells the scheduler not to schedule it.
-               - ScheduleAnyway tells the scheduler to schedule the pod in any location,
-                 but giving higher precedence to topologies that would help reduce the
-                 skew.
-               A constraint is considered "Unsatisfiable" for an incoming pod
-               if and only if every possible node assignment for that pod would violate
-               "MaxSkew" on some topology.
-               For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-               labelSelector spread as 3/1/1:
-               | zone1 | zone2 | zone3 |
-               | P P P |   P   |   P   |
-               If WhenUnsatisfiable is set to DoNotSchedule, incoming pod can only be scheduled
-               to zone2(zone3) to become 3/2/1(3/1/2) as ActualSkew(2-1) on zone2(zone3) satisfies
-               MaxSkew(1). In other words, the cluster can still be imbalanced, but scheduler
-               won't make it *more* imbalanced.
-               It's a required field.
-        """
-        if label_selector is not None:
-            pulumi.set(__self__, "label_selector", label_selector)
-        if match_label_keys is not None:
-            pulumi.set(__self__, "match_label_keys", match_label_keys)
-        if max_skew is not None:
-            pulumi.set(__self__, "max_skew", max_skew)
-        if min_domains is not None:
-            pulumi.set(__self__, "min_domains", min_domains)
-        if node_affinity_policy is not None:
-            pulumi.set(__self__, "node_affinity_policy", node_affinity_policy)
-        if node_taints_policy is not None:
-            pulumi.set(__self__, "node_taints_policy", node_taints_policy)
-        if topology_key is not None:
-            pulumi.set(__self__, "topology_key", topology_key)
-        if when_unsatisfiable is not None:
-            pulumi.set(__self__, "when_unsatisfiable", when_unsatisfiable)
-
-    @_builtins.property
-    @pulumi.getter(name="labelSelector")
-    def label_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatch']:
-        return pulumi.get(self, "label_selector")
-
-    @_builtins.property
-    @pulumi.getter(name="matchLabelKeys")
-    def match_label_keys(self) -> Optional[Sequence[_builtins.str]]:
-        """
-        MatchLabelKeys is a set of pod label keys to select the pods over which
-        spreading will be calculated. The keys are used to lookup values from the
-        incoming pod labels, those key-value labels are ANDed with labelSelector
-        to select the group of existing pods over which spreading will be calculated
-        for the incoming pod. The same key is forbidden to exist in both MatchLabelKeys and LabelSelector.
-        MatchLabelKeys cannot be set when LabelSelector isn't set.
-        Keys that don't exist in the incoming pod labels will
-        be ignored. A null or empty list means only match against labelSelector.
-
-        This is a beta field and requires the MatchLabelKeysInPodTopologySpread feature gate to be enabled (enabled by default).
-        """
-        return pulumi.get(self, "match_label_keys")
-
-    @_builtins.property
-    @pulumi.getter(name="maxSkew")
-    def max_skew(self) -> Optional[_builtins.int]:
-        """
-        MaxSkew describes the degree to which pods may be unevenly distributed.
-        When `whenUnsatisfiable=DoNotSchedule`, it is the maximum permitted difference
-        between the number of matching pods in the target topology and the global minimum.
-        The global minimum is the minimum number of matching pods in an eligible domain
-        or zero if the number of eligible domains is less than MinDomains.
-        For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-        labelSelector spread as 2/2/1:
-        In this case, the global minimum is 1.
-        | zone1 | zone2 | zone3 |
-        |  P P  |  P P  |   P   |
-        - if MaxSkew is 1, incoming pod can only be scheduled to zone3 to become 2/2/2;
-        scheduling it onto zone1(zone2) would make the ActualSkew(3-1) on zone1(zone2)
-        violate MaxSkew(1).
-        - if MaxSkew is 2, incoming pod can be scheduled onto any zone.
-        When `whenUnsatisfiable=ScheduleAnyway`, it is used to give higher precedence
-        to topologies that satisfy it.
-        It's a required field. Default value is 1 and 0 is not allowed.
-        """
-        return pulumi.get(self, "max_skew")
-
-    @_builtins.property
-    @pulumi.getter(name="minDomains")
-    def min_domains(self) -> Optional[_builtins.int]:
-        """
-        MinDomains indicates a minimum number of eligible domains.
-        When the number of eligible domains with matching topology keys is less than minDomains,
-        Pod Topology Spread treats "global minimum" as 0, and then the calculation of Skew is performed.
-        And when the number of eligible domains with matching topology keys equals or greater than minDomains,
-        this value has no effect on scheduling.
-        As a result, when the number of eligible domains is less than minDomains,
-        scheduler won't schedule more than maxSkew Pods to those domains.
-        If value is nil, the constraint behaves as if MinDomains is equal to 1.
-        Valid values are integers greater than 0.
-        When value is not nil, WhenUnsatisfiable must be DoNotSchedule.
-
-        For example, in a 3-zone cluster, MaxSkew is set to 2, MinDomains is set to 5 and pods with the same
-        labelSelector spread as 2/2/2:
-        | zone1 | zone2 | zone3 |
-        |  P P  |  P P  |  P P  |
-        The number of domains is less than 5(MinDomains), so "global minimum" is treated as 0.
-        In this situation, new pod with the same labelSelector cannot be scheduled,
-        because computed skew will be 3(3 - 0) if new Pod is scheduled to any of the three zones,
-        it will violate MaxSkew.
-        """
-        return pulumi.get(self, "min_domains")
-
-    @_builtins.property
-    @pulumi.getter(name="nodeAffinityPolicy")
-    def node_affinity_policy(self) -> Optional[_builtins.str]:
-        """
-        NodeAffinityPolicy indicates how we will treat Pod's nodeAffinity/nodeSelector
-        when calculating pod topology spread skew. Options are:
-        - Honor: only nodes matching nodeAffinity/nodeSelector are included in the calculations.
-        - Ignore: nodeAffinity/nodeSelector are ignored. All nodes are included in the calculations.
-
-        If this value is nil, the behavior is equivalent to the Honor policy.
-        """
-        return pulumi.get(self, "node_affinity_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="nodeTaintsPolicy")
-    def node_taints_policy(self) -> Optional[_builtins.str]:
-        """
-        NodeTaintsPolicy indicates how we will treat node taints when calculating
-        pod topology spread skew. Options are:
-        - Honor: nodes without taints, along with tainted nodes for which the incoming pod
-        has a toleration, are included.
-        - Ignore: node taints are ignored. All nodes are included.
-
-        If this value is nil, the behavior is equivalent to the Ignore policy.
-        """
-        return pulumi.get(self, "node_taints_policy")
-
-    @_builtins.property
-    @pulumi.getter(name="topologyKey")
-    def topology_key(self) -> Optional[_builtins.str]:
-        """
-        TopologyKey is the key of node labels. Nodes that have a label with this key
-        and identical values are considered to be in the same topology.
-        We consider each <key, value> as a "bucket", and try to put balanced number
-        of pods into each bucket.
-        We define a domain as a particular instance of a topology.
-        Also, we define an eligible domain as a domain whose nodes meet the requirements of
-        nodeAffinityPolicy and nodeTaintsPolicy.
-        e.g. If TopologyKey is "kubernetes.io/hostname", each Node is a domain of that topology.
-        And, if TopologyKey is "topology.kubernetes.io/zone", each zone is a domain of that topology.
-        It's a required field.
-        """
-        return pulumi.get(self, "topology_key")
-
-    @_builtins.property
-    @pulumi.getter(name="whenUnsatisfiable")
-    def when_unsatisfiable(self) -> Optional[_builtins.str]:
-        """
-        WhenUnsatisfiable indicates how to deal with a pod if it doesn't satisfy
-        the spread constraint.
-        - DoNotSchedule (default) tells the scheduler not to schedule it.
-        - ScheduleAnyway tells the scheduler to schedule the pod in any location,
-          but giving higher precedence to topologies that would help reduce the
-          skew.
-        A constraint is considered "Unsatisfiable" for an incoming pod
-        if and only if every possible node assignment for that pod would violate
-        "MaxSkew" on some topology.
-        For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
-        labelSelector spread as 3/1/1:
-        | zone1 | zone2 | zone3 |
-        | P P P |   P   |   P   |
-        If WhenUnsatisfiable is set to DoNotSchedule, incoming pod can only be scheduled
-        to zone2(zone3) to become 3/2/1(3/1/2) as ActualSkew(2-1) on zone2(zone3) satisfies
-        MaxSkew(1). In other words, the cluster can still be imbalanced, but scheduler
-        won't make it *more* imbalanced.
-        It's a required field.
-        """
-        return pulumi.get(self, "when_unsatisfiable")
-
-
-@pulumi.output_type
-class ProxyClassSpecStaticEndpoints(dict):
-    """
-    Configuration for 'static endpoints' on proxies in order to facilitate
-    direct connections from other devices on the tailnet.
-    See https://tailscale.com/kb/1445/kubernetes-operator-customization#static-endpoints.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "nodePort":
-            suggest = "node_port"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStaticEndpoints. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStaticEndpoints.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStaticEndpoints.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 node_port: Optional['outputs.ProxyClassSpecStaticEndpointsNodePort'] = None):
-        """
-        Configuration for 'static endpoints' on proxies in order to facilitate
-        direct connections from other devices on the tailnet.
-        See https://tailscale.com/kb/1445/kubernetes-operator-customization#static-endpoints.
-        """
-        if node_port is not None:
-            pulumi.set(__self__, "node_port", node_port)
-
-    @_builtins.property
-    @pulumi.getter(name="nodePort")
-    def node_port(self) -> Optional['outputs.ProxyClassSpecStaticEndpointsNodePort']:
-        return pulumi.get(self, "node_port")
-
-
-@pulumi.output_type
-class ProxyClassSpecStaticEndpointsNodePort(dict):
-    """
-    The configuration for static endpoints using NodePort Services.
-    """
-    def __init__(__self__, *,
-                 ports: Optional[Sequence['outputs.ProxyClassSpecStaticEndpointsNodePortPorts']] = None,
-                 selector: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        The configuration for static endpoints using NodePort Services.
-
-        :param Sequence['ProxyClassSpecStaticEndpointsNodePortPortsArgs'] ports: The port ranges from which the operator will select NodePorts for the Services.
-               You must ensure that firewall rules allow UDP ingress traffic for these ports
-               to the node's external IPs.
-               The ports must be in the range of service node ports for the cluster (default `30000-32767`).
-               See https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport.
-        :param Mapping[str, _builtins.str] selector: A selector which will be used to select the node's that will have their `ExternalIP`'s advertised
-               by the ProxyGroup as Static Endpoints.
-        """
-        if ports is not None:
-            pulumi.set(__self__, "ports", ports)
-        if selector is not None:
-            pulumi.set(__self__, "selector", selector)
-
-    @_builtins.property
-    @pulumi.getter
-    def ports(self) -> Optional[Sequence['outputs.ProxyClassSpecStaticEndpointsNodePortPorts']]:
-        """
-        The port ranges from which the operator will select NodePorts for the Services.
-        You must ensure that firewall rules allow UDP ingress traffic for these ports
-        to the node's external IPs.
-        The ports must be in the range of service node ports for the cluster (default `30000-32767`).
-        See https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport.
-        """
-        return pulumi.get(self, "ports")
-
-    @_builtins.property
-    @pulumi.getter
-    def selector(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        A selector which will be used to select the node's that will have their `ExternalIP`'s advertised
-        by the ProxyGroup as Static Endpoints.
-        """
-        return pulumi.get(self, "selector")
-
-
-@pulumi.output_type
-class ProxyClassSpecStaticEndpointsNodePortPatch(dict):
-    """
-    The configuration for static endpoints using NodePort Services.
-    """
-    def __init__(__self__, *,
-                 ports: Optional[Sequence['outputs.ProxyClassSpecStaticEndpointsNodePortPortsPatch']] = None,
-                 selector: Optional[Mapping[str, _builtins.str]] = None):
-        """
-        The configuration for static endpoints using NodePort Services.
-
-        :param Sequence['ProxyClassSpecStaticEndpointsNodePortPortsPatchArgs'] ports: The port ranges from which the operator will select NodePorts for the Services.
-               You must ensure that firewall rules allow UDP ingress traffic for these ports
-               to the node's external IPs.
-               The ports must be in the range of service node ports for the cluster (default `30000-32767`).
-               See https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport.
-        :param Mapping[str, _builtins.str] selector: A selector which will be used to select the node's that will have their `ExternalIP`'s advertised
-               by the ProxyGroup as Static Endpoints.
-        """
-        if ports is not None:
-            pulumi.set(__self__, "ports", ports)
-        if selector is not None:
-            pulumi.set(__self__, "selector", selector)
-
-    @_builtins.property
-    @pulumi.getter
-    def ports(self) -> Optional[Sequence['outputs.ProxyClassSpecStaticEndpointsNodePortPortsPatch']]:
-        """
-        The port ranges from which the operator will select NodePorts for the Services.
-        You must ensure that firewall rules allow UDP ingress traffic for these ports
-        to the node's external IPs.
-        The ports must be in the range of service node ports for the cluster (default `30000-32767`).
-        See https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport.
-        """
-        return pulumi.get(self, "ports")
-
-    @_builtins.property
-    @pulumi.getter
-    def selector(self) -> Optional[Mapping[str, _builtins.str]]:
-        """
-        A selector which will be used to select the node's that will have their `ExternalIP`'s advertised
-        by the ProxyGroup as Static Endpoints.
-        """
-        return pulumi.get(self, "selector")
-
-
-@pulumi.output_type
-class ProxyClassSpecStaticEndpointsNodePortPorts(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "endPort":
-            suggest = "end_port"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStaticEndpointsNodePortPorts. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStaticEndpointsNodePortPorts.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStaticEndpointsNodePortPorts.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 end_port: Optional[_builtins.int] = None,
-                 port: Optional[_builtins.int] = None):
-        """
-        :param _builtins.int end_port: endPort indicates that the range of ports from port to endPort if set, inclusive,
-               should be used. This field cannot be defined if the port field is not defined.
-               The endPort must be either unset, or equal or greater than port.
-        :param _builtins.int port: port represents a port selected to be used. This is a required field.
-        """
-        if end_port is not None:
-            pulumi.set(__self__, "end_port", end_port)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-
-    @_builtins.property
-    @pulumi.getter(name="endPort")
-    def end_port(self) -> Optional[_builtins.int]:
-        """
-        endPort indicates that the range of ports from port to endPort if set, inclusive,
-        should be used. This field cannot be defined if the port field is not defined.
-        The endPort must be either unset, or equal or greater than port.
-        """
-        return pulumi.get(self, "end_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> Optional[_builtins.int]:
-        """
-        port represents a port selected to be used. This is a required field.
-        """
-        return pulumi.get(self, "port")
-
-
-@pulumi.output_type
-class ProxyClassSpecStaticEndpointsNodePortPortsPatch(dict):
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "endPort":
-            suggest = "end_port"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStaticEndpointsNodePortPortsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStaticEndpointsNodePortPortsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStaticEndpointsNodePortPortsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 end_port: Optional[_builtins.int] = None,
-                 port: Optional[_builtins.int] = None):
-        """
-        :param _builtins.int end_port: endPort indicates that the range of ports from port to endPort if set, inclusive,
-               should be used. This field cannot be defined if the port field is not defined.
-               The endPort must be either unset, or equal or greater than port.
-        :param _builtins.int port: port represents a port selected to be used. This is a required field.
-        """
-        if end_port is not None:
-            pulumi.set(__self__, "end_port", end_port)
-        if port is not None:
-            pulumi.set(__self__, "port", port)
-
-    @_builtins.property
-    @pulumi.getter(name="endPort")
-    def end_port(self) -> Optional[_builtins.int]:
-        """
-        endPort indicates that the range of ports from port to endPort if set, inclusive,
-        should be used. This field cannot be defined if the port field is not defined.
-        The endPort must be either unset, or equal or greater than port.
-        """
-        return pulumi.get(self, "end_port")
-
-    @_builtins.property
-    @pulumi.getter
-    def port(self) -> Optional[_builtins.int]:
-        """
-        port represents a port selected to be used. This is a required field.
-        """
-        return pulumi.get(self, "port")
-
-
-@pulumi.output_type
-class ProxyClassSpecStaticEndpointsPatch(dict):
-    """
-    Configuration for 'static endpoints' on proxies in order to facilitate
-    direct connections from other devices on the tailnet.
-    See https://tailscale.com/kb/1445/kubernetes-operator-customization#static-endpoints.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "nodePort":
-            suggest = "node_port"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStaticEndpointsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecStaticEndpointsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecStaticEndpointsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 node_port: Optional['outputs.ProxyClassSpecStaticEndpointsNodePortPatch'] = None):
-        """
-        Configuration for 'static endpoints' on proxies in order to facilitate
-        direct connections from other devices on the tailnet.
-        See https://tailscale.com/kb/1445/kubernetes-operator-customization#static-endpoints.
-        """
-        if node_port is not None:
-            pulumi.set(__self__, "node_port", node_port)
-
-    @_builtins.property
-    @pulumi.getter(name="nodePort")
-    def node_port(self) -> Optional['outputs.ProxyClassSpecStaticEndpointsNodePortPatch']:
-        return pulumi.get(self, "node_port")
-
-
-@pulumi.output_type
-class ProxyClassSpecTailscale(dict):
-    """
-    TailscaleConfig contains options to configure the tailscale-specific
-    parameters of proxies.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "acceptRoutes":
-            suggest = "accept_routes"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecTailscale. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecTailscale.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecTailscale.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 accept_routes: Optional[_builtins.bool] = None):
-        """
-        TailscaleConfig contains options to configure the tailscale-specific
-        parameters of proxies.
-
-        :param _builtins.bool accept_routes: AcceptRoutes can be set to true to make the proxy instance accept
-               routes advertized by other nodes on the tailnet, such as subnet
-               routes.
-               This is equivalent of passing --accept-routes flag to a tailscale Linux client.
-               https://tailscale.com/kb/1019/subnets#use-your-subnet-routes-from-other-devices
-               Defaults to false.
-        """
-        if accept_routes is not None:
-            pulumi.set(__self__, "accept_routes", accept_routes)
-
-    @_builtins.property
-    @pulumi.getter(name="acceptRoutes")
-    def accept_routes(self) -> Optional[_builtins.bool]:
-        """
-        AcceptRoutes can be set to true to make the proxy instance accept
-        routes advertized by other nodes on the tailnet, such as subnet
-        routes.
-        This is equivalent of passing --accept-routes flag to a tailscale Linux client.
-        https://tailscale.com/kb/1019/subnets#use-your-subnet-routes-from-other-devices
-        Defaults to false.
-        """
-        return pulumi.get(self, "accept_routes")
-
-
-@pulumi.output_type
-class ProxyClassSpecTailscalePatch(dict):
-    """
-    TailscaleConfig contains options to configure the tailscale-specific
-    parameters of proxies.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "acceptRoutes":
-            suggest = "accept_routes"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecTailscalePatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassSpecTailscalePatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassSpecTailscalePatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 accept_routes: Optional[_builtins.bool] = None):
-        """
-        TailscaleConfig contains options to configure the tailscale-specific
-        parameters of proxies.
-
-        :param _builtins.bool accept_routes: AcceptRoutes can be set to true to make the proxy instance accept
-               routes advertized by other nodes on the tailnet, such as subnet
-               routes.
-               This is equivalent of passing --accept-routes flag to a tailscale Linux client.
-               https://tailscale.com/kb/1019/subnets#use-your-subnet-routes-from-other-devices
-               Defaults to false.
-        """
-        if accept_routes is not None:
-            pulumi.set(__self__, "accept_routes", accept_routes)
-
-    @_builtins.property
-    @pulumi.getter(name="acceptRoutes")
-    def accept_routes(self) -> Optional[_builtins.bool]:
-        """
-        AcceptRoutes can be set to true to make the proxy instance accept
-        routes advertized by other nodes on the tailnet, such as subnet
-        routes.
-        This is equivalent of passing --accept-routes flag to a tailscale Linux client.
-        https://tailscale.com/kb/1019/subnets#use-your-subnet-routes-from-other-devices
-        Defaults to false.
-        """
-        return pulumi.get(self, "accept_routes")
-
-
-@pulumi.output_type
-class ProxyClassStatus(dict):
-    """
-    Status of the ProxyClass. This is set and managed automatically.
-    https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    def __init__(__self__, *,
-                 conditions: Optional[Sequence['outputs.ProxyClassStatusConditions']] = None):
-        """
-        Status of the ProxyClass. This is set and managed automatically.
-        https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param Sequence['ProxyClassStatusConditionsArgs'] conditions: List of status conditions to indicate the status of the ProxyClass.
-               Known condition types are `ProxyClassReady`.
-        """
-        if conditions is not None:
-            pulumi.set(__self__, "conditions", conditions)
-
-    @_builtins.property
-    @pulumi.getter
-    def conditions(self) -> Optional[Sequence['outputs.ProxyClassStatusConditions']]:
-        """
-        List of status conditions to indicate the status of the ProxyClass.
-        Known condition types are `ProxyClassReady`.
-        """
-        return pulumi.get(self, "conditions")
-
-
-@pulumi.output_type
-class ProxyClassStatusConditions(dict):
-    """
-    Condition contains details for one aspect of the current state of this API Resource.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "lastTransitionTime":
-            suggest = "last_transition_time"
-        elif key == "observedGeneration":
-            suggest = "observed_generation"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassStatusConditions. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassStatusConditions.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassStatusConditions.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 last_transition_time: Optional[_builtins.str] = None,
-                 message: Optional[_builtins.str] = None,
-                 observed_generation: Optional[_builtins.int] = None,
-                 reason: Optional[_builtins.str] = None,
-                 status: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        Condition contains details for one aspect of the current state of this API Resource.
-
-        :param _builtins.str last_transition_time: lastTransitionTime is the last time the condition transitioned from one status to another.
-               This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        :param _builtins.str message: message is a human readable message indicating details about the transition.
-               This may be an empty string.
-        :param _builtins.int observed_generation: observedGeneration represents the .metadata.generation that the condition was set based upon.
-               For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-               with respect to the current state of the instance.
-        :param _builtins.str reason: reason contains a programmatic identifier indicating the reason for the condition's last transition.
-               Producers of specific condition types may define expected values and meanings for this field,
-               and whether the values are considered a guaranteed API.
-               The value should be a CamelCase string.
-               This field may not be empty.
-        :param _builtins.str status: status of the condition, one of True, False, Unknown.
-        :param _builtins.str type: type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        if last_transition_time is not None:
-            pulumi.set(__self__, "last_transition_time", last_transition_time)
-        if message is not None:
-            pulumi.set(__self__, "message", message)
-        if observed_generation is not None:
-            pulumi.set(__self__, "observed_generation", observed_generation)
-        if reason is not None:
-            pulumi.set(__self__, "reason", reason)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="lastTransitionTime")
-    def last_transition_time(self) -> Optional[_builtins.str]:
-        """
-        lastTransitionTime is the last time the condition transitioned from one status to another.
-        This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        """
-        return pulumi.get(self, "last_transition_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def message(self) -> Optional[_builtins.str]:
-        """
-        message is a human readable message indicating details about the transition.
-        This may be an empty string.
-        """
-        return pulumi.get(self, "message")
-
-    @_builtins.property
-    @pulumi.getter(name="observedGeneration")
-    def observed_generation(self) -> Optional[_builtins.int]:
-        """
-        observedGeneration represents the .metadata.generation that the condition was set based upon.
-        For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-        with respect to the current state of the instance.
-        """
-        return pulumi.get(self, "observed_generation")
-
-    @_builtins.property
-    @pulumi.getter
-    def reason(self) -> Optional[_builtins.str]:
-        """
-        reason contains a programmatic identifier indicating the reason for the condition's last transition.
-        Producers of specific condition types may define expected values and meanings for this field,
-        and whether the values are considered a guaranteed API.
-        The value should be a CamelCase string.
-        This field may not be empty.
-        """
-        return pulumi.get(self, "reason")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional[_builtins.str]:
-        """
-        status of the condition, one of True, False, Unknown.
-        """
-        return pulumi.get(self, "status")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ProxyClassStatusConditionsPatch(dict):
-    """
-    Condition contains details for one aspect of the current state of this API Resource.
-    """
-    @staticmethod
-    def __key_warning(key: str):
-        suggest = None
-        if key == "lastTransitionTime":
-            suggest = "last_transition_time"
-        elif key == "observedGeneration":
-            suggest = "observed_generation"
-
-        if suggest:
-            pulumi.log.warn(f"Key '{key}' not found in ProxyClassStatusConditionsPatch. Access the value via the '{suggest}' property getter instead.")
-
-    def __getitem__(self, key: str) -> Any:
-        ProxyClassStatusConditionsPatch.__key_warning(key)
-        return super().__getitem__(key)
-
-    def get(self, key: str, default = None) -> Any:
-        ProxyClassStatusConditionsPatch.__key_warning(key)
-        return super().get(key, default)
-
-    def __init__(__self__, *,
-                 last_transition_time: Optional[_builtins.str] = None,
-                 message: Optional[_builtins.str] = None,
-                 observed_generation: Optional[_builtins.int] = None,
-                 reason: Optional[_builtins.str] = None,
-                 status: Optional[_builtins.str] = None,
-                 type: Optional[_builtins.str] = None):
-        """
-        Condition contains details for one aspect of the current state of this API Resource.
-
-        :param _builtins.str last_transition_time: lastTransitionTime is the last time the condition transitioned from one status to another.
-               This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        :param _builtins.str message: message is a human readable message indicating details about the transition.
-               This may be an empty string.
-        :param _builtins.int observed_generation: observedGeneration represents the .metadata.generation that the condition was set based upon.
-               For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-               with respect to the current state of the instance.
-        :param _builtins.str reason: reason contains a programmatic identifier indicating the reason for the condition's last transition.
-               Producers of specific condition types may define expected values and meanings for this field,
-               and whether the values are considered a guaranteed API.
-               The value should be a CamelCase string.
-               This field may not be empty.
-        :param _builtins.str status: status of the condition, one of True, False, Unknown.
-        :param _builtins.str type: type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        if last_transition_time is not None:
-            pulumi.set(__self__, "last_transition_time", last_transition_time)
-        if message is not None:
-            pulumi.set(__self__, "message", message)
-        if observed_generation is not None:
-            pulumi.set(__self__, "observed_generation", observed_generation)
-        if reason is not None:
-            pulumi.set(__self__, "reason", reason)
-        if status is not None:
-            pulumi.set(__self__, "status", status)
-        if type is not None:
-            pulumi.set(__self__, "type", type)
-
-    @_builtins.property
-    @pulumi.getter(name="lastTransitionTime")
-    def last_transition_time(self) -> Optional[_builtins.str]:
-        """
-        lastTransitionTime is the last time the condition transitioned from one status to another.
-        This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
-        """
-        return pulumi.get(self, "last_transition_time")
-
-    @_builtins.property
-    @pulumi.getter
-    def message(self) -> Optional[_builtins.str]:
-        """
-        message is a human readable message indicating details about the transition.
-        This may be an empty string.
-        """
-        return pulumi.get(self, "message")
-
-    @_builtins.property
-    @pulumi.getter(name="observedGeneration")
-    def observed_generation(self) -> Optional[_builtins.int]:
-        """
-        observedGeneration represents the .metadata.generation that the condition was set based upon.
-        For instance, if .metadata.generation is currently 12, but the .status.conditions[x].observedGeneration is 9, the condition is out of date
-        with respect to the current state of the instance.
-        """
-        return pulumi.get(self, "observed_generation")
-
-    @_builtins.property
-    @pulumi.getter
-    def reason(self) -> Optional[_builtins.str]:
-        """
-        reason contains a programmatic identifier indicating the reason for the condition's last transition.
-        Producers of specific condition types may define expected values and meanings for this field,
-        and whether the values are considered a guaranteed API.
-        The value should be a CamelCase string.
-        This field may not be empty.
-        """
-        return pulumi.get(self, "reason")
-
-    @_builtins.property
-    @pulumi.getter
-    def status(self) -> Optional[_builtins.str]:
-        """
-        status of the condition, one of True, False, Unknown.
-        """
-        return pulumi.get(self, "status")
-
-    @_builtins.property
-    @pulumi.getter
-    def type(self) -> Optional[_builtins.str]:
-        """
-        type of condition in CamelCase or in foo.example.com/CamelCase.
-        """
-        return pulumi.get(self, "type")
-
-
-@pulumi.output_type
-class ProxyClassStatusPatch(dict):
-    """
-    Status of the ProxyClass. This is set and managed automatically.
-    https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-    """
-    def __init__(__self__, *,
-                 conditions: Optional[Sequence['outputs.ProxyClassStatusConditionsPatch']] = None):
-        """
-        Status of the ProxyClass. This is set and managed automatically.
-        https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
-
-        :param Sequence['ProxyClassStatusConditionsPatchArgs'] conditions: List of status conditions to indicate the status of the ProxyClass.
-               Known condition types are `ProxyClassReady`.
-        """
-        if conditions is not None:
-            pulumi.set(__self__, "conditions", conditions)
-
-    @_builtins.property
-    @pulumi.getter
-    def conditions(self) -> Optional[Sequence['outputs.ProxyClassStatusConditionsPatch']]:
-        """
-        List of status conditions to indicate the status of the ProxyClass.
-        Known condition types are `ProxyClassReady`.
-        """
-        return pulumi.get(self, "conditions")
@@ -0,0 +1,95 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ProxyClassSpecMetrics']
+
+@pulumi.output_type
+class ProxyClassSpecMetrics(dict):
+    """
+    Configuration for proxy metrics. Metrics are currently not supported
+    for egress proxies and for Ingress proxies that have been configured
+    with tailscale.com/experimental-forward-cluster-traffic-via-ingress
+    annotation. Note that the metrics are currently considered unstable
+    and will likely change in breaking ways in the future - we only
+    recommend that you use those for debugging purposes.
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "serviceMonitor":
+            suggest = "service_monitor"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecMetrics. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ProxyClassSpecMetrics.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ProxyClassSpecMetrics.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 enable: Optional[_builtins.bool] = None,
+                 service_monitor: Optional['outputs.ProxyClassSpecMetricsServiceMonitor'] = None):
+        """
+        Configuration for proxy metrics. Metrics are currently not supported
+        for egress proxies and for Ingress proxies that have been configured
+        with tailscale.com/experimental-forward-cluster-traffic-via-ingress
+        annotation. Note that the metrics are currently considered unstable
+        and will likely change in breaking ways in the future - we only
+        recommend that you use those for debugging purposes.
+
+        :param _builtins.bool enable: Setting enable to true will make the proxy serve Tailscale metrics
+               at <pod-ip>:9002/metrics.
+               A metrics Service named <proxy-statefulset>-metrics will also be created in the operator's namespace and will
+               serve the metrics at <service-ip>:9002/metrics.
+
+               In 1.78.x and 1.80.x, this field also serves as the default value for
+               .spec.statefulSet.pod.tailscaleContainer.debug.enable. From 1.82.0, both
+               fields will independently default to false.
+
+               Defaults to false.
+        """
+        if enable is not None:
+            pulumi.set(__self__, "enable", enable)
+        if service_monitor is not None:
+            pulumi.set(__self__, "service_monitor", service_monitor)
+
+    @_builtins.property
+    @pulumi.getter
+    def enable(self) -> Optional[_builtins.bool]:
+        """
+        Setting enable to true will make the proxy serve Tailscale metrics
+        at <pod-ip>:9002/metrics.
+        A metrics Service named <proxy-statefulset>-metrics will also be created in the operator's namespace and will
+        serve the metrics at <service-ip>:9002/metrics.
+
+        In 1.78.x and 1.80.x, this field also serves as the default value for
+        .spec.statefulSet.pod.tailscaleContainer.debug.enable. From 1.82.0, both
+        fields will independently default to false.
+
+        Defaults to false.
+        """
+        return pulumi.get(self, "enable")
+
+    @_builtins.property
+    @pulumi.getter(name="serviceMonitor")
+    def service_monitor(self) -> Optional['outputs.ProxyClassSpecMetricsServiceMonitor']:
+        return pulumi.get(self, "service_monitor")
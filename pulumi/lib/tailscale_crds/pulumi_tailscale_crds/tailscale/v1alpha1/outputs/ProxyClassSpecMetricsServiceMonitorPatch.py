@@ -0,0 +1,70 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ProxyClassSpecMetricsServiceMonitorPatch']
+
+@pulumi.output_type
+class ProxyClassSpecMetricsServiceMonitorPatch(dict):
+    """
+    Enable to create a Prometheus ServiceMonitor for scraping the proxy's Tailscale metrics.
+    The ServiceMonitor will select the metrics Service that gets created when metrics are enabled.
+    The ingested metrics for each Service monitor will have labels to identify the proxy:
+    ts_proxy_type: ingress_service|ingress_resource|connector|proxygroup
+    ts_proxy_parent_name: name of the parent resource (i.e name of the Connector, Tailscale Ingress, Tailscale Service or ProxyGroup)
+    ts_proxy_parent_namespace: namespace of the parent resource (if the parent resource is not cluster scoped)
+    job: ts_<proxy type>_[<parent namespace>]_<parent_name>
+    """
+    def __init__(__self__, *,
+                 enable: Optional[_builtins.bool] = None,
+                 labels: Optional[Mapping[str, _builtins.str]] = None):
+        """
+        Enable to create a Prometheus ServiceMonitor for scraping the proxy's Tailscale metrics.
+        The ServiceMonitor will select the metrics Service that gets created when metrics are enabled.
+        The ingested metrics for each Service monitor will have labels to identify the proxy:
+        ts_proxy_type: ingress_service|ingress_resource|connector|proxygroup
+        ts_proxy_parent_name: name of the parent resource (i.e name of the Connector, Tailscale Ingress, Tailscale Service or ProxyGroup)
+        ts_proxy_parent_namespace: namespace of the parent resource (if the parent resource is not cluster scoped)
+        job: ts_<proxy type>_[<parent namespace>]_<parent_name>
+
+        :param _builtins.bool enable: If Enable is set to true, a Prometheus ServiceMonitor will be created. Enable can only be set to true if metrics are enabled.
+        :param Mapping[str, _builtins.str] labels: Labels to add to the ServiceMonitor.
+               Labels must be valid Kubernetes labels.
+               https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
+        """
+        if enable is not None:
+            pulumi.set(__self__, "enable", enable)
+        if labels is not None:
+            pulumi.set(__self__, "labels", labels)
+
+    @_builtins.property
+    @pulumi.getter
+    def enable(self) -> Optional[_builtins.bool]:
+        """
+        If Enable is set to true, a Prometheus ServiceMonitor will be created. Enable can only be set to true if metrics are enabled.
+        """
+        return pulumi.get(self, "enable")
+
+    @_builtins.property
+    @pulumi.getter
+    def labels(self) -> Optional[Mapping[str, _builtins.str]]:
+        """
+        Labels to add to the ServiceMonitor.
+        Labels must be valid Kubernetes labels.
+        https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
+        """
+        return pulumi.get(self, "labels")
@@ -0,0 +1,121 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ProxyClassSpecPatch']
+
+@pulumi.output_type
+class ProxyClassSpecPatch(dict):
+    """
+    Specification of the desired state of the ProxyClass resource.
+    https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "statefulSet":
+            suggest = "stateful_set"
+        elif key == "staticEndpoints":
+            suggest = "static_endpoints"
+        elif key == "useLetsEncryptStagingEnvironment":
+            suggest = "use_lets_encrypt_staging_environment"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ProxyClassSpecPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ProxyClassSpecPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 metrics: Optional['outputs.ProxyClassSpecMetricsPatch'] = None,
+                 stateful_set: Optional['outputs.ProxyClassSpecStatefulSetPatch'] = None,
+                 static_endpoints: Optional['outputs.ProxyClassSpecStaticEndpointsPatch'] = None,
+                 tailscale: Optional['outputs.ProxyClassSpecTailscalePatch'] = None,
+                 use_lets_encrypt_staging_environment: Optional[_builtins.bool] = None):
+        """
+        Specification of the desired state of the ProxyClass resource.
+        https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
+
+        :param _builtins.bool use_lets_encrypt_staging_environment: Set UseLetsEncryptStagingEnvironment to true to issue TLS
+               certificates for any HTTPS endpoints exposed to the tailnet from
+               LetsEncrypt's staging environment.
+               https://letsencrypt.org/docs/staging-environment/
+               This setting only affects Tailscale Ingress resources.
+               By default Ingress TLS certificates are issued from LetsEncrypt's
+               production environment.
+               Changing this setting true -> false, will result in any
+               existing certs being re-issued from the production environment.
+               Changing this setting false (default) -> true, when certs have already
+               been provisioned from production environment will NOT result in certs
+               being re-issued from the staging environment before they need to be
+               renewed.
+        """
+        if metrics is not None:
+            pulumi.set(__self__, "metrics", metrics)
+        if stateful_set is not None:
+            pulumi.set(__self__, "stateful_set", stateful_set)
+        if static_endpoints is not None:
+            pulumi.set(__self__, "static_endpoints", static_endpoints)
+        if tailscale is not None:
+            pulumi.set(__self__, "tailscale", tailscale)
+        if use_lets_encrypt_staging_environment is not None:
+            pulumi.set(__self__, "use_lets_encrypt_staging_environment", use_lets_encrypt_staging_environment)
+
+    @_builtins.property
+    @pulumi.getter
+    def metrics(self) -> Optional['outputs.ProxyClassSpecMetricsPatch']:
+        return pulumi.get(self, "metrics")
+
+    @_builtins.property
+    @pulumi.getter(name="statefulSet")
+    def stateful_set(self) -> Optional['outputs.ProxyClassSpecStatefulSetPatch']:
+        return pulumi.get(self, "stateful_set")
+
+    @_builtins.property
+    @pulumi.getter(name="staticEndpoints")
+    def static_endpoints(self) -> Optional['outputs.ProxyClassSpecStaticEndpointsPatch']:
+        return pulumi.get(self, "static_endpoints")
+
+    @_builtins.property
+    @pulumi.getter
+    def tailscale(self) -> Optional['outputs.ProxyClassSpecTailscalePatch']:
+        return pulumi.get(self, "tailscale")
+
+    @_builtins.property
+    @pulumi.getter(name="useLetsEncryptStagingEnvironment")
+    def use_lets_encrypt_staging_environment(self) -> Optional[_builtins.bool]:
+        """
+        Set UseLetsEncryptStagingEnvironment to true to issue TLS
+        certificates for any HTTPS endpoints exposed to the tailnet from
+        LetsEncrypt's staging environment.
+        https://letsencrypt.org/docs/staging-environment/
+        This setting only affects Tailscale Ingress resources.
+        By default Ingress TLS certificates are issued from LetsEncrypt's
+        production environment.
+        Changing this setting true -> false, will result in any
+        existing certs being re-issued from the production environment.
+        Changing this setting false (default) -> true, when certs have already
+        been provisioned from production environment will NOT result in certs
+        being re-issued from the staging environment before they need to be
+        renewed.
+        """
+        return pulumi.get(self, "use_lets_encrypt_staging_environment")
@@ -0,0 +1,90 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ProxyClassSpecStatefulSet']
+
+@pulumi.output_type
+class ProxyClassSpecStatefulSet(dict):
+    """
+    Configuration parameters for the proxy's StatefulSet. Tailscale
+    Kubernetes operator deploys a StatefulSet for each of the user
+    configured proxies (Tailscale Ingress, Tailscale Service, Connector).
+    """
+    def __init__(__self__, *,
+                 annotations: Optional[Mapping[str, _builtins.str]] = None,
+                 labels: Optional[Mapping[str, _builtins.str]] = None,
+                 pod: Optional['outputs.ProxyClassSpecStatefulSetPod'] = None):
+        """
+        Configuration parameters for the proxy's StatefulSet. Tailscale
+        Kubernetes operator deploys a StatefulSet for each of the user
+        configured proxies (Tailscale Ingress, Tailscale Service, Connector).
+
+        :param Mapping[str, _builtins.str] annotations: Annotations that will be added to the StatefulSet created for the proxy.
+               Any Annotations specified here will be merged with the default annotations
+               applied to the StatefulSet by the Tailscale Kubernetes operator as
+               well as any other annotations that might have been applied by other
+               actors.
+               Annotations must be valid Kubernetes annotations.
+               https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
+        :param Mapping[str, _builtins.str] labels: Labels that will be added to the StatefulSet created for the proxy.
+               Any labels specified here will be merged with the default labels
+               applied to the StatefulSet by the Tailscale Kubernetes operator as
+               well as any other labels that might have been applied by other
+               actors.
+               Label keys and values must be valid Kubernetes label keys and values.
+               https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
+        """
+        if annotations is not None:
+            pulumi.set(__self__, "annotations", annotations)
+        if labels is not None:
+            pulumi.set(__self__, "labels", labels)
+        if pod is not None:
+            pulumi.set(__self__, "pod", pod)
+
+    @_builtins.property
+    @pulumi.getter
+    def annotations(self) -> Optional[Mapping[str, _builtins.str]]:
+        """
+        Annotations that will be added to the StatefulSet created for the proxy.
+        Any Annotations specified here will be merged with the default annotations
+        applied to the StatefulSet by the Tailscale Kubernetes operator as
+        well as any other annotations that might have been applied by other
+        actors.
+        Annotations must be valid Kubernetes annotations.
+        https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
+        """
+        return pulumi.get(self, "annotations")
+
+    @_builtins.property
+    @pulumi.getter
+    def labels(self) -> Optional[Mapping[str, _builtins.str]]:
+        """
+        Labels that will be added to the StatefulSet created for the proxy.
+        Any labels specified here will be merged with the default labels
+        applied to the StatefulSet by the Tailscale Kubernetes operator as
+        well as any other labels that might have been applied by other
+        actors.
+        Label keys and values must be valid Kubernetes label keys and values.
+        https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
+        """
+        return pulumi.get(self, "labels")
+
+    @_builtins.property
+    @pulumi.getter
+    def pod(self) -> Optional['outputs.ProxyClassSpecStatefulSetPod']:
+        return pulumi.get(self, "pod")
@@ -0,0 +1,84 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ProxyClassSpecStatefulSetPodDnsConfigPatch']
+
+@pulumi.output_type
+class ProxyClassSpecStatefulSetPodDnsConfigPatch(dict):
+    """
+    DNSConfig defines DNS parameters for the proxy Pod in addition to those generated from DNSPolicy.
+    When DNSPolicy is set to "None", DNSConfig must be specified.
+    https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-dns-config
+    """
+    def __init__(__self__, *,
+                 nameservers: Optional[Sequence[_builtins.str]] = None,
+                 options: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodDnsConfigOptionsPatch']] = None,
+                 searches: Optional[Sequence[_builtins.str]] = None):
+        """
+        DNSConfig defines DNS parameters for the proxy Pod in addition to those generated from DNSPolicy.
+        When DNSPolicy is set to "None", DNSConfig must be specified.
+        https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-dns-config
+
+        :param Sequence[_builtins.str] nameservers: A list of DNS name server IP addresses.
+               This will be appended to the base nameservers generated from DNSPolicy.
+               Duplicated nameservers will be removed.
+        :param Sequence['ProxyClassSpecStatefulSetPodDnsConfigOptionsPatchArgs'] options: A list of DNS resolver options.
+               This will be merged with the base options generated from DNSPolicy.
+               Duplicated entries will be removed. Resolution options given in Options
+               will override those that appear in the base DNSPolicy.
+        :param Sequence[_builtins.str] searches: A list of DNS search domains for host-name lookup.
+               This will be appended to the base search paths generated from DNSPolicy.
+               Duplicated search paths will be removed.
+        """
+        if nameservers is not None:
+            pulumi.set(__self__, "nameservers", nameservers)
+        if options is not None:
+            pulumi.set(__self__, "options", options)
+        if searches is not None:
+            pulumi.set(__self__, "searches", searches)
+
+    @_builtins.property
+    @pulumi.getter
+    def nameservers(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        A list of DNS name server IP addresses.
+        This will be appended to the base nameservers generated from DNSPolicy.
+        Duplicated nameservers will be removed.
+        """
+        return pulumi.get(self, "nameservers")
+
+    @_builtins.property
+    @pulumi.getter
+    def options(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodDnsConfigOptionsPatch']]:
+        """
+        A list of DNS resolver options.
+        This will be merged with the base options generated from DNSPolicy.
+        Duplicated entries will be removed. Resolution options given in Options
+        will override those that appear in the base DNSPolicy.
+        """
+        return pulumi.get(self, "options")
+
+    @_builtins.property
+    @pulumi.getter
+    def searches(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        A list of DNS search domains for host-name lookup.
+        This will be appended to the base search paths generated from DNSPolicy.
+        Duplicated search paths will be removed.
+        """
+        return pulumi.get(self, "searches")
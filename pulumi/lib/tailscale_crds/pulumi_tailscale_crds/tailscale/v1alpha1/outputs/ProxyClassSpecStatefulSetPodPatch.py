@@ -0,0 +1,257 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ProxyClassSpecStatefulSetPodPatch']
+
+@pulumi.output_type
+class ProxyClassSpecStatefulSetPodPatch(dict):
+    """
+    Configuration for the proxy Pod.
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "dnsConfig":
+            suggest = "dns_config"
+        elif key == "dnsPolicy":
+            suggest = "dns_policy"
+        elif key == "imagePullSecrets":
+            suggest = "image_pull_secrets"
+        elif key == "nodeName":
+            suggest = "node_name"
+        elif key == "nodeSelector":
+            suggest = "node_selector"
+        elif key == "priorityClassName":
+            suggest = "priority_class_name"
+        elif key == "securityContext":
+            suggest = "security_context"
+        elif key == "tailscaleContainer":
+            suggest = "tailscale_container"
+        elif key == "tailscaleInitContainer":
+            suggest = "tailscale_init_container"
+        elif key == "topologySpreadConstraints":
+            suggest = "topology_spread_constraints"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodPatch. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ProxyClassSpecStatefulSetPodPatch.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ProxyClassSpecStatefulSetPodPatch.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 affinity: Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPatch'] = None,
+                 annotations: Optional[Mapping[str, _builtins.str]] = None,
+                 dns_config: Optional['outputs.ProxyClassSpecStatefulSetPodDnsConfigPatch'] = None,
+                 dns_policy: Optional[_builtins.str] = None,
+                 image_pull_secrets: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodImagePullSecretsPatch']] = None,
+                 labels: Optional[Mapping[str, _builtins.str]] = None,
+                 node_name: Optional[_builtins.str] = None,
+                 node_selector: Optional[Mapping[str, _builtins.str]] = None,
+                 priority_class_name: Optional[_builtins.str] = None,
+                 security_context: Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextPatch'] = None,
+                 tailscale_container: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerPatch'] = None,
+                 tailscale_init_container: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerPatch'] = None,
+                 tolerations: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTolerationsPatch']] = None,
+                 topology_spread_constraints: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatch']] = None):
+        """
+        Configuration for the proxy Pod.
+
+        :param Mapping[str, _builtins.str] annotations: Annotations that will be added to the proxy Pod.
+               Any annotations specified here will be merged with the default
+               annotations applied to the Pod by the Tailscale Kubernetes operator.
+               Annotations must be valid Kubernetes annotations.
+               https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
+        :param _builtins.str dns_policy: DNSPolicy defines how DNS will be configured for the proxy Pod.
+               By default the Tailscale Kubernetes Operator does not set a DNS policy (uses cluster default).
+               https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-s-dns-policy
+        :param Sequence['ProxyClassSpecStatefulSetPodImagePullSecretsPatchArgs'] image_pull_secrets: Proxy Pod's image pull Secrets.
+               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#PodSpec
+        :param Mapping[str, _builtins.str] labels: Labels that will be added to the proxy Pod.
+               Any labels specified here will be merged with the default labels
+               applied to the Pod by the Tailscale Kubernetes operator.
+               Label keys and values must be valid Kubernetes label keys and values.
+               https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
+        :param _builtins.str node_name: Proxy Pod's node name.
+               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+        :param Mapping[str, _builtins.str] node_selector: Proxy Pod's node selector.
+               By default Tailscale Kubernetes operator does not apply any node
+               selector.
+               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+        :param _builtins.str priority_class_name: PriorityClassName for the proxy Pod.
+               By default Tailscale Kubernetes operator does not apply any priority class.
+               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+        :param Sequence['ProxyClassSpecStatefulSetPodTolerationsPatchArgs'] tolerations: Proxy Pod's tolerations.
+               By default Tailscale Kubernetes operator does not apply any
+               tolerations.
+               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+        :param Sequence['ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatchArgs'] topology_spread_constraints: Proxy Pod's topology spread constraints.
+               By default Tailscale Kubernetes operator does not apply any topology spread constraints.
+               https://kubernetes.io/docs/concepts/scheduling-eviction/topology-spread-constraints/
+        """
+        if affinity is not None:
+            pulumi.set(__self__, "affinity", affinity)
+        if annotations is not None:
+            pulumi.set(__self__, "annotations", annotations)
+        if dns_config is not None:
+            pulumi.set(__self__, "dns_config", dns_config)
+        if dns_policy is not None:
+            pulumi.set(__self__, "dns_policy", dns_policy)
+        if image_pull_secrets is not None:
+            pulumi.set(__self__, "image_pull_secrets", image_pull_secrets)
+        if labels is not None:
+            pulumi.set(__self__, "labels", labels)
+        if node_name is not None:
+            pulumi.set(__self__, "node_name", node_name)
+        if node_selector is not None:
+            pulumi.set(__self__, "node_selector", node_selector)
+        if priority_class_name is not None:
+            pulumi.set(__self__, "priority_class_name", priority_class_name)
+        if security_context is not None:
+            pulumi.set(__self__, "security_context", security_context)
+        if tailscale_container is not None:
+            pulumi.set(__self__, "tailscale_container", tailscale_container)
+        if tailscale_init_container is not None:
+            pulumi.set(__self__, "tailscale_init_container", tailscale_init_container)
+        if tolerations is not None:
+            pulumi.set(__self__, "tolerations", tolerations)
+        if topology_spread_constraints is not None:
+            pulumi.set(__self__, "topology_spread_constraints", topology_spread_constraints)
+
+    @_builtins.property
+    @pulumi.getter
+    def affinity(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodAffinityPatch']:
+        return pulumi.get(self, "affinity")
+
+    @_builtins.property
+    @pulumi.getter
+    def annotations(self) -> Optional[Mapping[str, _builtins.str]]:
+        """
+        Annotations that will be added to the proxy Pod.
+        Any annotations specified here will be merged with the default
+        annotations applied to the Pod by the Tailscale Kubernetes operator.
+        Annotations must be valid Kubernetes annotations.
+        https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations/#syntax-and-character-set
+        """
+        return pulumi.get(self, "annotations")
+
+    @_builtins.property
+    @pulumi.getter(name="dnsConfig")
+    def dns_config(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodDnsConfigPatch']:
+        return pulumi.get(self, "dns_config")
+
+    @_builtins.property
+    @pulumi.getter(name="dnsPolicy")
+    def dns_policy(self) -> Optional[_builtins.str]:
+        """
+        DNSPolicy defines how DNS will be configured for the proxy Pod.
+        By default the Tailscale Kubernetes Operator does not set a DNS policy (uses cluster default).
+        https://kubernetes.io/docs/concepts/services-networking/dns-pod-service/#pod-s-dns-policy
+        """
+        return pulumi.get(self, "dns_policy")
+
+    @_builtins.property
+    @pulumi.getter(name="imagePullSecrets")
+    def image_pull_secrets(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodImagePullSecretsPatch']]:
+        """
+        Proxy Pod's image pull Secrets.
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#PodSpec
+        """
+        return pulumi.get(self, "image_pull_secrets")
+
+    @_builtins.property
+    @pulumi.getter
+    def labels(self) -> Optional[Mapping[str, _builtins.str]]:
+        """
+        Labels that will be added to the proxy Pod.
+        Any labels specified here will be merged with the default labels
+        applied to the Pod by the Tailscale Kubernetes operator.
+        Label keys and values must be valid Kubernetes label keys and values.
+        https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#syntax-and-character-set
+        """
+        return pulumi.get(self, "labels")
+
+    @_builtins.property
+    @pulumi.getter(name="nodeName")
+    def node_name(self) -> Optional[_builtins.str]:
+        """
+        Proxy Pod's node name.
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+        """
+        return pulumi.get(self, "node_name")
+
+    @_builtins.property
+    @pulumi.getter(name="nodeSelector")
+    def node_selector(self) -> Optional[Mapping[str, _builtins.str]]:
+        """
+        Proxy Pod's node selector.
+        By default Tailscale Kubernetes operator does not apply any node
+        selector.
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+        """
+        return pulumi.get(self, "node_selector")
+
+    @_builtins.property
+    @pulumi.getter(name="priorityClassName")
+    def priority_class_name(self) -> Optional[_builtins.str]:
+        """
+        PriorityClassName for the proxy Pod.
+        By default Tailscale Kubernetes operator does not apply any priority class.
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+        """
+        return pulumi.get(self, "priority_class_name")
+
+    @_builtins.property
+    @pulumi.getter(name="securityContext")
+    def security_context(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodSecurityContextPatch']:
+        return pulumi.get(self, "security_context")
+
+    @_builtins.property
+    @pulumi.getter(name="tailscaleContainer")
+    def tailscale_container(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerPatch']:
+        return pulumi.get(self, "tailscale_container")
+
+    @_builtins.property
+    @pulumi.getter(name="tailscaleInitContainer")
+    def tailscale_init_container(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleInitContainerPatch']:
+        return pulumi.get(self, "tailscale_init_container")
+
+    @_builtins.property
+    @pulumi.getter
+    def tolerations(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTolerationsPatch']]:
+        """
+        Proxy Pod's tolerations.
+        By default Tailscale Kubernetes operator does not apply any
+        tolerations.
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#scheduling
+        """
+        return pulumi.get(self, "tolerations")
+
+    @_builtins.property
+    @pulumi.getter(name="topologySpreadConstraints")
+    def topology_spread_constraints(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatch']]:
+        """
+        Proxy Pod's topology spread constraints.
+        By default Tailscale Kubernetes operator does not apply any topology spread constraints.
+        https://kubernetes.io/docs/concepts/scheduling-eviction/topology-spread-constraints/
+        """
+        return pulumi.get(self, "topology_spread_constraints")
@@ -0,0 +1,153 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ProxyClassSpecStatefulSetPodTailscaleContainer']
+
+@pulumi.output_type
+class ProxyClassSpecStatefulSetPodTailscaleContainer(dict):
+    """
+    Configuration for the proxy container running tailscale.
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "imagePullPolicy":
+            suggest = "image_pull_policy"
+        elif key == "securityContext":
+            suggest = "security_context"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTailscaleContainer. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ProxyClassSpecStatefulSetPodTailscaleContainer.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ProxyClassSpecStatefulSetPodTailscaleContainer.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 debug: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerDebug'] = None,
+                 env: Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerEnv']] = None,
+                 image: Optional[_builtins.str] = None,
+                 image_pull_policy: Optional[_builtins.str] = None,
+                 resources: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerResources'] = None,
+                 security_context: Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContext'] = None):
+        """
+        Configuration for the proxy container running tailscale.
+
+        :param Sequence['ProxyClassSpecStatefulSetPodTailscaleContainerEnvArgs'] env: List of environment variables to set in the container.
+               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
+               Note that environment variables provided here will take precedence
+               over Tailscale-specific environment variables set by the operator,
+               however running proxies with custom values for Tailscale environment
+               variables (i.e TS_USERSPACE) is not recommended and might break in
+               the future.
+        :param _builtins.str image: Container image name. By default images are pulled from docker.io/tailscale,
+               but the official images are also available at ghcr.io/tailscale.
+
+               For all uses except on ProxyGroups of type "kube-apiserver", this image must
+               be either tailscale/tailscale, or an equivalent mirror of that image.
+               To apply to ProxyGroups of type "kube-apiserver", this image must be
+               tailscale/k8s-proxy or a mirror of that image.
+
+               For "tailscale/tailscale"-based proxies, specifying image name here will
+               override any proxy image values specified via the Kubernetes operator's
+               Helm chart values or PROXY_IMAGE env var in the operator Deployment.
+               For "tailscale/k8s-proxy"-based proxies, there is currently no way to
+               configure your own default, and this field is the only way to use a
+               custom image.
+
+               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
+        :param _builtins.str image_pull_policy: Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
+               https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
+        """
+        if debug is not None:
+            pulumi.set(__self__, "debug", debug)
+        if env is not None:
+            pulumi.set(__self__, "env", env)
+        if image is not None:
+            pulumi.set(__self__, "image", image)
+        if image_pull_policy is not None:
+            pulumi.set(__self__, "image_pull_policy", image_pull_policy)
+        if resources is not None:
+            pulumi.set(__self__, "resources", resources)
+        if security_context is not None:
+            pulumi.set(__self__, "security_context", security_context)
+
+    @_builtins.property
+    @pulumi.getter
+    def debug(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerDebug']:
+        return pulumi.get(self, "debug")
+
+    @_builtins.property
+    @pulumi.getter
+    def env(self) -> Optional[Sequence['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerEnv']]:
+        """
+        List of environment variables to set in the container.
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#environment-variables
+        Note that environment variables provided here will take precedence
+        over Tailscale-specific environment variables set by the operator,
+        however running proxies with custom values for Tailscale environment
+        variables (i.e TS_USERSPACE) is not recommended and might break in
+        the future.
+        """
+        return pulumi.get(self, "env")
+
+    @_builtins.property
+    @pulumi.getter
+    def image(self) -> Optional[_builtins.str]:
+        """
+        Container image name. By default images are pulled from docker.io/tailscale,
+        but the official images are also available at ghcr.io/tailscale.
+
+        For all uses except on ProxyGroups of type "kube-apiserver", this image must
+        be either tailscale/tailscale, or an equivalent mirror of that image.
+        To apply to ProxyGroups of type "kube-apiserver", this image must be
+        tailscale/k8s-proxy or a mirror of that image.
+
+        For "tailscale/tailscale"-based proxies, specifying image name here will
+        override any proxy image values specified via the Kubernetes operator's
+        Helm chart values or PROXY_IMAGE env var in the operator Deployment.
+        For "tailscale/k8s-proxy"-based proxies, there is currently no way to
+        configure your own default, and this field is the only way to use a
+        custom image.
+
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
+        """
+        return pulumi.get(self, "image")
+
+    @_builtins.property
+    @pulumi.getter(name="imagePullPolicy")
+    def image_pull_policy(self) -> Optional[_builtins.str]:
+        """
+        Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always.
+        https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/pod-v1/#image
+        """
+        return pulumi.get(self, "image_pull_policy")
+
+    @_builtins.property
+    @pulumi.getter
+    def resources(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerResources']:
+        return pulumi.get(self, "resources")
+
+    @_builtins.property
+    @pulumi.getter(name="securityContext")
+    def security_context(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContext']:
+        return pulumi.get(self, "security_context")
@@ -0,0 +1,62 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ProxyClassSpecStatefulSetPodTailscaleContainerDebug']
+
+@pulumi.output_type
+class ProxyClassSpecStatefulSetPodTailscaleContainerDebug(dict):
+    """
+    Configuration for enabling extra debug information in the container.
+    Not recommended for production use.
+    """
+    def __init__(__self__, *,
+                 enable: Optional[_builtins.bool] = None):
+        """
+        Configuration for enabling extra debug information in the container.
+        Not recommended for production use.
+
+        :param _builtins.bool enable: Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
+               and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
+               9001 is a container port named "debug". The endpoints and their responses
+               may change in backwards incompatible ways in the future, and should not
+               be considered stable.
+
+               In 1.78.x and 1.80.x, this setting will default to the value of
+               .spec.metrics.enable, and requests to the "metrics" port matching the
+               mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
+               this setting will default to false, and no requests will be proxied.
+        """
+        if enable is not None:
+            pulumi.set(__self__, "enable", enable)
+
+    @_builtins.property
+    @pulumi.getter
+    def enable(self) -> Optional[_builtins.bool]:
+        """
+        Enable tailscaled's HTTP pprof endpoints at <pod-ip>:9001/debug/pprof/
+        and internal debug metrics endpoint at <pod-ip>:9001/debug/metrics, where
+        9001 is a container port named "debug". The endpoints and their responses
+        may change in backwards incompatible ways in the future, and should not
+        be considered stable.
+
+        In 1.78.x and 1.80.x, this setting will default to the value of
+        .spec.metrics.enable, and requests to the "metrics" port matching the
+        mux pattern /debug/ will be forwarded to the "debug" port. In 1.82.x,
+        this setting will default to false, and no requests will be proxied.
+        """
+        return pulumi.get(self, "enable")
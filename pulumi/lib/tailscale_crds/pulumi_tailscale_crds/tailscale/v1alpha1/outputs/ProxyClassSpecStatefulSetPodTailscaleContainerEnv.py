@@ -0,0 +1,63 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ProxyClassSpecStatefulSetPodTailscaleContainerEnv']
+
+@pulumi.output_type
+class ProxyClassSpecStatefulSetPodTailscaleContainerEnv(dict):
+    def __init__(__self__, *,
+                 name: Optional[_builtins.str] = None,
+                 value: Optional[_builtins.str] = None):
+        """
+        :param _builtins.str name: Name of the environment variable. Must be a C_IDENTIFIER.
+        :param _builtins.str value: Variable references $(VAR_NAME) are expanded using the previously defined
+                environment variables in the container and any service environment
+               variables. If a variable cannot be resolved, the reference in the input
+               string will be unchanged. Double $$ are reduced to a single $, which
+               allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
+               produce the string literal "$(VAR_NAME)". Escaped references will never
+               be expanded, regardless of whether the variable exists or not. Defaults
+               to "".
+        """
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if value is not None:
+            pulumi.set(__self__, "value", value)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> Optional[_builtins.str]:
+        """
+        Name of the environment variable. Must be a C_IDENTIFIER.
+        """
+        return pulumi.get(self, "name")
+
+    @_builtins.property
+    @pulumi.getter
+    def value(self) -> Optional[_builtins.str]:
+        """
+        Variable references $(VAR_NAME) are expanded using the previously defined
+         environment variables in the container and any service environment
+        variables. If a variable cannot be resolved, the reference in the input
+        string will be unchanged. Double $$ are reduced to a single $, which
+        allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will
+        produce the string literal "$(VAR_NAME)". Escaped references will never
+        be expanded, regardless of whether the variable exists or not. Defaults
+        to "".
+        """
+        return pulumi.get(self, "value")
@@ -0,0 +1,62 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaims']
+
+@pulumi.output_type
+class ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaims(dict):
+    """
+    ResourceClaim references one entry in PodSpec.ResourceClaims.
+    """
+    def __init__(__self__, *,
+                 name: Optional[_builtins.str] = None,
+                 request: Optional[_builtins.str] = None):
+        """
+        ResourceClaim references one entry in PodSpec.ResourceClaims.
+
+        :param _builtins.str name: Name must match the name of one entry in pod.spec.resourceClaims of
+               the Pod where this field is used. It makes that resource available
+               inside a container.
+        :param _builtins.str request: Request is the name chosen for a request in the referenced claim.
+               If empty, everything from the claim is made available, otherwise
+               only the result of this request.
+        """
+        if name is not None:
+            pulumi.set(__self__, "name", name)
+        if request is not None:
+            pulumi.set(__self__, "request", request)
+
+    @_builtins.property
+    @pulumi.getter
+    def name(self) -> Optional[_builtins.str]:
+        """
+        Name must match the name of one entry in pod.spec.resourceClaims of
+        the Pod where this field is used. It makes that resource available
+        inside a container.
+        """
+        return pulumi.get(self, "name")
+
+    @_builtins.property
+    @pulumi.getter
+    def request(self) -> Optional[_builtins.str]:
+        """
+        Request is the name chosen for a request in the referenced claim.
+        If empty, everything from the claim is made available, otherwise
+        only the result of this request.
+        """
+        return pulumi.get(self, "request")
@@ -0,0 +1,313 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ProxyClassSpecStatefulSetPodTopologySpreadConstraints']
+
+@pulumi.output_type
+class ProxyClassSpecStatefulSetPodTopologySpreadConstraints(dict):
+    """
+    TopologySpreadConstraint specifies how to spread matching pods among the given topology.
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "labelSelector":
+            suggest = "label_selector"
+        elif key == "matchLabelKeys":
+            suggest = "match_label_keys"
+        elif key == "maxSkew":
+            suggest = "max_skew"
+        elif key == "minDomains":
+            suggest = "min_domains"
+        elif key == "nodeAffinityPolicy":
+            suggest = "node_affinity_policy"
+        elif key == "nodeTaintsPolicy":
+            suggest = "node_taints_policy"
+        elif key == "topologyKey":
+            suggest = "topology_key"
+        elif key == "whenUnsatisfiable":
+            suggest = "when_unsatisfiable"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStatefulSetPodTopologySpreadConstraints. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ProxyClassSpecStatefulSetPodTopologySpreadConstraints.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ProxyClassSpecStatefulSetPodTopologySpreadConstraints.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 label_selector: Optional['outputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelector'] = None,
+                 match_label_keys: Optional[Sequence[_builtins.str]] = None,
+                 max_skew: Optional[_builtins.int] = None,
+                 min_domains: Optional[_builtins.int] = None,
+                 node_affinity_policy: Optional[_builtins.str] = None,
+                 node_taints_policy: Optional[_builtins.str] = None,
+                 topology_key: Optional[_builtins.str] = None,
+                 when_unsatisfiable: Optional[_builtins.str] = None):
+        """
+        TopologySpreadConstraint specifies how to spread matching pods among the given topology.
+
+        :param Sequence[_builtins.str] match_label_keys: MatchLabelKeys is a set of pod label keys to select the pods over which
+               spreading will be calculated. The keys are used to lookup values from the
+               incoming pod labels, those key-value labels are ANDed with labelSelector
+               to select the group of existing pods over which spreading will be calculated
+               for the incoming pod. The same key is forbidden to exist in both MatchLabelKeys and LabelSelector.
+               MatchLabelKeys cannot be set when LabelSelector isn't set.
+               Keys that don't exist in the incoming pod labels will
+               be ignored. A null or empty list means only match against labelSelector.
+
+               This is a beta field and requires the MatchLabelKeysInPodTopologySpread feature gate to be enabled (enabled by default).
+        :param _builtins.int max_skew: MaxSkew describes the degree to which pods may be unevenly distributed.
+               When `whenUnsatisfiable=DoNotSchedule`, it is the maximum permitted difference
+               between the number of matching pods in the target topology and the global minimum.
+               The global minimum is the minimum number of matching pods in an eligible domain
+               or zero if the number of eligible domains is less than MinDomains.
+               For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
+               labelSelector spread as 2/2/1:
+               In this case, the global minimum is 1.
+               | zone1 | zone2 | zone3 |
+               |  P P  |  P P  |   P   |
+               - if MaxSkew is 1, incoming pod can only be scheduled to zone3 to become 2/2/2;
+               scheduling it onto zone1(zone2) would make the ActualSkew(3-1) on zone1(zone2)
+               violate MaxSkew(1).
+               - if MaxSkew is 2, incoming pod can be scheduled onto any zone.
+               When `whenUnsatisfiable=ScheduleAnyway`, it is used to give higher precedence
+               to topologies that satisfy it.
+               It's a required field. Default value is 1 and 0 is not allowed.
+        :param _builtins.int min_domains: MinDomains indicates a minimum number of eligible domains.
+               When the number of eligible domains with matching topology keys is less than minDomains,
+               Pod Topology Spread treats "global minimum" as 0, and then the calculation of Skew is performed.
+               And when the number of eligible domains with matching topology keys equals or greater than minDomains,
+               this value has no effect on scheduling.
+               As a result, when the number of eligible domains is less than minDomains,
+               scheduler won't schedule more than maxSkew Pods to those domains.
+               If value is nil, the constraint behaves as if MinDomains is equal to 1.
+               Valid values are integers greater than 0.
+               When value is not nil, WhenUnsatisfiable must be DoNotSchedule.
+
+               For example, in a 3-zone cluster, MaxSkew is set to 2, MinDomains is set to 5 and pods with the same
+               labelSelector spread as 2/2/2:
+               | zone1 | zone2 | zone3 |
+               |  P P  |  P P  |  P P  |
+               The number of domains is less than 5(MinDomains), so "global minimum" is treated as 0.
+               In this situation, new pod with the same labelSelector cannot be scheduled,
+               because computed skew will be 3(3 - 0) if new Pod is scheduled to any of the three zones,
+               it will violate MaxSkew.
+        :param _builtins.str node_affinity_policy: NodeAffinityPolicy indicates how we will treat Pod's nodeAffinity/nodeSelector
+               when calculating pod topology spread skew. Options are:
+               - Honor: only nodes matching nodeAffinity/nodeSelector are included in the calculations.
+               - Ignore: nodeAffinity/nodeSelector are ignored. All nodes are included in the calculations.
+
+               If this value is nil, the behavior is equivalent to the Honor policy.
+        :param _builtins.str node_taints_policy: NodeTaintsPolicy indicates how we will treat node taints when calculating
+               pod topology spread skew. Options are:
+               - Honor: nodes without taints, along with tainted nodes for which the incoming pod
+               has a toleration, are included.
+               - Ignore: node taints are ignored. All nodes are included.
+
+               If this value is nil, the behavior is equivalent to the Ignore policy.
+        :param _builtins.str topology_key: TopologyKey is the key of node labels. Nodes that have a label with this key
+               and identical values are considered to be in the same topology.
+               We consider each <key, value> as a "bucket", and try to put balanced number
+               of pods into each bucket.
+               We define a domain as a particular instance of a topology.
+               Also, we define an eligible domain as a domain whose nodes meet the requirements of
+               nodeAffinityPolicy and nodeTaintsPolicy.
+               e.g. If TopologyKey is "kubernetes.io/hostname", each Node is a domain of that topology.
+               And, if TopologyKey is "topology.kubernetes.io/zone", each zone is a domain of that topology.
+               It's a required field.
+        :param _builtins.str when_unsatisfiable: WhenUnsatisfiable indicates how to deal with a pod if it doesn't satisfy
+               the spread constraint.
+               - DoNotSchedule (default) tells the scheduler not to schedule it.
+               - ScheduleAnyway tells the scheduler to schedule the pod in any location,
+                 but giving higher precedence to topologies that would help reduce the
+                 skew.
+               A constraint is considered "Unsatisfiable" for an incoming pod
+               if and only if every possible node assignment for that pod would violate
+               "MaxSkew" on some topology.
+               For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
+               labelSelector spread as 3/1/1:
+               | zone1 | zone2 | zone3 |
+               | P P P |   P   |   P   |
+               If WhenUnsatisfiable is set to DoNotSchedule, incoming pod can only be scheduled
+               to zone2(zone3) to become 3/2/1(3/1/2) as ActualSkew(2-1) on zone2(zone3) satisfies
+               MaxSkew(1). In other words, the cluster can still be imbalanced, but scheduler
+               won't make it *more* imbalanced.
+               It's a required field.
+        """
+        if label_selector is not None:
+            pulumi.set(__self__, "label_selector", label_selector)
+        if match_label_keys is not None:
+            pulumi.set(__self__, "match_label_keys", match_label_keys)
+        if max_skew is not None:
+            pulumi.set(__self__, "max_skew", max_skew)
+        if min_domains is not None:
+            pulumi.set(__self__, "min_domains", min_domains)
+        if node_affinity_policy is not None:
+            pulumi.set(__self__, "node_affinity_policy", node_affinity_policy)
+        if node_taints_policy is not None:
+            pulumi.set(__self__, "node_taints_policy", node_taints_policy)
+        if topology_key is not None:
+            pulumi.set(__self__, "topology_key", topology_key)
+        if when_unsatisfiable is not None:
+            pulumi.set(__self__, "when_unsatisfiable", when_unsatisfiable)
+
+    @_builtins.property
+    @pulumi.getter(name="labelSelector")
+    def label_selector(self) -> Optional['outputs.ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelector']:
+        return pulumi.get(self, "label_selector")
+
+    @_builtins.property
+    @pulumi.getter(name="matchLabelKeys")
+    def match_label_keys(self) -> Optional[Sequence[_builtins.str]]:
+        """
+        MatchLabelKeys is a set of pod label keys to select the pods over which
+        spreading will be calculated. The keys are used to lookup values from the
+        incoming pod labels, those key-value labels are ANDed with labelSelector
+        to select the group of existing pods over which spreading will be calculated
+        for the incoming pod. The same key is forbidden to exist in both MatchLabelKeys and LabelSelector.
+        MatchLabelKeys cannot be set when LabelSelector isn't set.
+        Keys that don't exist in the incoming pod labels will
+        be ignored. A null or empty list means only match against labelSelector.
+
+        This is a beta field and requires the MatchLabelKeysInPodTopologySpread feature gate to be enabled (enabled by default).
+        """
+        return pulumi.get(self, "match_label_keys")
+
+    @_builtins.property
+    @pulumi.getter(name="maxSkew")
+    def max_skew(self) -> Optional[_builtins.int]:
+        """
+        MaxSkew describes the degree to which pods may be unevenly distributed.
+        When `whenUnsatisfiable=DoNotSchedule`, it is the maximum permitted difference
+        between the number of matching pods in the target topology and the global minimum.
+        The global minimum is the minimum number of matching pods in an eligible domain
+        or zero if the number of eligible domains is less than MinDomains.
+        For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
+        labelSelector spread as 2/2/1:
+        In this case, the global minimum is 1.
+        | zone1 | zone2 | zone3 |
+        |  P P  |  P P  |   P   |
+        - if MaxSkew is 1, incoming pod can only be scheduled to zone3 to become 2/2/2;
+        scheduling it onto zone1(zone2) would make the ActualSkew(3-1) on zone1(zone2)
+        violate MaxSkew(1).
+        - if MaxSkew is 2, incoming pod can be scheduled onto any zone.
+        When `whenUnsatisfiable=ScheduleAnyway`, it is used to give higher precedence
+        to topologies that satisfy it.
+        It's a required field. Default value is 1 and 0 is not allowed.
+        """
+        return pulumi.get(self, "max_skew")
+
+    @_builtins.property
+    @pulumi.getter(name="minDomains")
+    def min_domains(self) -> Optional[_builtins.int]:
+        """
+        MinDomains indicates a minimum number of eligible domains.
+        When the number of eligible domains with matching topology keys is less than minDomains,
+        Pod Topology Spread treats "global minimum" as 0, and then the calculation of Skew is performed.
+        And when the number of eligible domains with matching topology keys equals or greater than minDomains,
+        this value has no effect on scheduling.
+        As a result, when the number of eligible domains is less than minDomains,
+        scheduler won't schedule more than maxSkew Pods to those domains.
+        If value is nil, the constraint behaves as if MinDomains is equal to 1.
+        Valid values are integers greater than 0.
+        When value is not nil, WhenUnsatisfiable must be DoNotSchedule.
+
+        For example, in a 3-zone cluster, MaxSkew is set to 2, MinDomains is set to 5 and pods with the same
+        labelSelector spread as 2/2/2:
+        | zone1 | zone2 | zone3 |
+        |  P P  |  P P  |  P P  |
+        The number of domains is less than 5(MinDomains), so "global minimum" is treated as 0.
+        In this situation, new pod with the same labelSelector cannot be scheduled,
+        because computed skew will be 3(3 - 0) if new Pod is scheduled to any of the three zones,
+        it will violate MaxSkew.
+        """
+        return pulumi.get(self, "min_domains")
+
+    @_builtins.property
+    @pulumi.getter(name="nodeAffinityPolicy")
+    def node_affinity_policy(self) -> Optional[_builtins.str]:
+        """
+        NodeAffinityPolicy indicates how we will treat Pod's nodeAffinity/nodeSelector
+        when calculating pod topology spread skew. Options are:
+        - Honor: only nodes matching nodeAffinity/nodeSelector are included in the calculations.
+        - Ignore: nodeAffinity/nodeSelector are ignored. All nodes are included in the calculations.
+
+        If this value is nil, the behavior is equivalent to the Honor policy.
+        """
+        return pulumi.get(self, "node_affinity_policy")
+
+    @_builtins.property
+    @pulumi.getter(name="nodeTaintsPolicy")
+    def node_taints_policy(self) -> Optional[_builtins.str]:
+        """
+        NodeTaintsPolicy indicates how we will treat node taints when calculating
+        pod topology spread skew. Options are:
+        - Honor: nodes without taints, along with tainted nodes for which the incoming pod
+        has a toleration, are included.
+        - Ignore: node taints are ignored. All nodes are included.
+
+        If this value is nil, the behavior is equivalent to the Ignore policy.
+        """
+        return pulumi.get(self, "node_taints_policy")
+
+    @_builtins.property
+    @pulumi.getter(name="topologyKey")
+    def topology_key(self) -> Optional[_builtins.str]:
+        """
+        TopologyKey is the key of node labels. Nodes that have a label with this key
+        and identical values are considered to be in the same topology.
+        We consider each <key, value> as a "bucket", and try to put balanced number
+        of pods into each bucket.
+        We define a domain as a particular instance of a topology.
+        Also, we define an eligible domain as a domain whose nodes meet the requirements of
+        nodeAffinityPolicy and nodeTaintsPolicy.
+        e.g. If TopologyKey is "kubernetes.io/hostname", each Node is a domain of that topology.
+        And, if TopologyKey is "topology.kubernetes.io/zone", each zone is a domain of that topology.
+        It's a required field.
+        """
+        return pulumi.get(self, "topology_key")
+
+    @_builtins.property
+    @pulumi.getter(name="whenUnsatisfiable")
+    def when_unsatisfiable(self) -> Optional[_builtins.str]:
+        """
+        WhenUnsatisfiable indicates how to deal with a pod if it doesn't satisfy
+        the spread constraint.
+        - DoNotSchedule (default) tells the scheduler not to schedule it.
+        - ScheduleAnyway tells the scheduler to schedule the pod in any location,
+          but giving higher precedence to topologies that would help reduce the
+          skew.
+        A constraint is considered "Unsatisfiable" for an incoming pod
+        if and only if every possible node assignment for that pod would violate
+        "MaxSkew" on some topology.
+        For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same
+        labelSelector spread as 3/1/1:
+        | zone1 | zone2 | zone3 |
+        | P P P |   P   |   P   |
+        If WhenUnsatisfiable is set to DoNotSchedule, incoming pod can only be scheduled
+        to zone2(zone3) to become 3/2/1(3/1/2) as ActualSkew(2-1) on zone2(zone3) satisfies
+        MaxSkew(1). In other words, the cluster can still be imbalanced, but scheduler
+        won't make it *more* imbalanced.
+        It's a required field.
+        """
+        return pulumi.get(self, "when_unsatisfiable")
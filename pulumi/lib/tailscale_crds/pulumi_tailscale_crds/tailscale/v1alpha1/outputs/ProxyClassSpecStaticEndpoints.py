@@ -0,0 +1,58 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ProxyClassSpecStaticEndpoints']
+
+@pulumi.output_type
+class ProxyClassSpecStaticEndpoints(dict):
+    """
+    Configuration for 'static endpoints' on proxies in order to facilitate
+    direct connections from other devices on the tailnet.
+    See https://tailscale.com/kb/1445/kubernetes-operator-customization#static-endpoints.
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "nodePort":
+            suggest = "node_port"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStaticEndpoints. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ProxyClassSpecStaticEndpoints.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ProxyClassSpecStaticEndpoints.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 node_port: Optional['outputs.ProxyClassSpecStaticEndpointsNodePort'] = None):
+        """
+        Configuration for 'static endpoints' on proxies in order to facilitate
+        direct connections from other devices on the tailnet.
+        See https://tailscale.com/kb/1445/kubernetes-operator-customization#static-endpoints.
+        """
+        if node_port is not None:
+            pulumi.set(__self__, "node_port", node_port)
+
+    @_builtins.property
+    @pulumi.getter(name="nodePort")
+    def node_port(self) -> Optional['outputs.ProxyClassSpecStaticEndpointsNodePort']:
+        return pulumi.get(self, "node_port")
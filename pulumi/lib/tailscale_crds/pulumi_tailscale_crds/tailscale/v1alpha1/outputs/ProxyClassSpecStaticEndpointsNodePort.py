@@ -0,0 +1,64 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ProxyClassSpecStaticEndpointsNodePort']
+
+@pulumi.output_type
+class ProxyClassSpecStaticEndpointsNodePort(dict):
+    """
+    The configuration for static endpoints using NodePort Services.
+    """
+    def __init__(__self__, *,
+                 ports: Optional[Sequence['outputs.ProxyClassSpecStaticEndpointsNodePortPorts']] = None,
+                 selector: Optional[Mapping[str, _builtins.str]] = None):
+        """
+        The configuration for static endpoints using NodePort Services.
+
+        :param Sequence['ProxyClassSpecStaticEndpointsNodePortPortsArgs'] ports: The port ranges from which the operator will select NodePorts for the Services.
+               You must ensure that firewall rules allow UDP ingress traffic for these ports
+               to the node's external IPs.
+               The ports must be in the range of service node ports for the cluster (default `30000-32767`).
+               See https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport.
+        :param Mapping[str, _builtins.str] selector: A selector which will be used to select the node's that will have their `ExternalIP`'s advertised
+               by the ProxyGroup as Static Endpoints.
+        """
+        if ports is not None:
+            pulumi.set(__self__, "ports", ports)
+        if selector is not None:
+            pulumi.set(__self__, "selector", selector)
+
+    @_builtins.property
+    @pulumi.getter
+    def ports(self) -> Optional[Sequence['outputs.ProxyClassSpecStaticEndpointsNodePortPorts']]:
+        """
+        The port ranges from which the operator will select NodePorts for the Services.
+        You must ensure that firewall rules allow UDP ingress traffic for these ports
+        to the node's external IPs.
+        The ports must be in the range of service node ports for the cluster (default `30000-32767`).
+        See https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport.
+        """
+        return pulumi.get(self, "ports")
+
+    @_builtins.property
+    @pulumi.getter
+    def selector(self) -> Optional[Mapping[str, _builtins.str]]:
+        """
+        A selector which will be used to select the node's that will have their `ExternalIP`'s advertised
+        by the ProxyGroup as Static Endpoints.
+        """
+        return pulumi.get(self, "selector")
@@ -0,0 +1,70 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ProxyClassSpecStaticEndpointsNodePortPorts']
+
+@pulumi.output_type
+class ProxyClassSpecStaticEndpointsNodePortPorts(dict):
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "endPort":
+            suggest = "end_port"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecStaticEndpointsNodePortPorts. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ProxyClassSpecStaticEndpointsNodePortPorts.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ProxyClassSpecStaticEndpointsNodePortPorts.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 end_port: Optional[_builtins.int] = None,
+                 port: Optional[_builtins.int] = None):
+        """
+        :param _builtins.int end_port: endPort indicates that the range of ports from port to endPort if set, inclusive,
+               should be used. This field cannot be defined if the port field is not defined.
+               The endPort must be either unset, or equal or greater than port.
+        :param _builtins.int port: port represents a port selected to be used. This is a required field.
+        """
+        if end_port is not None:
+            pulumi.set(__self__, "end_port", end_port)
+        if port is not None:
+            pulumi.set(__self__, "port", port)
+
+    @_builtins.property
+    @pulumi.getter(name="endPort")
+    def end_port(self) -> Optional[_builtins.int]:
+        """
+        endPort indicates that the range of ports from port to endPort if set, inclusive,
+        should be used. This field cannot be defined if the port field is not defined.
+        The endPort must be either unset, or equal or greater than port.
+        """
+        return pulumi.get(self, "end_port")
+
+    @_builtins.property
+    @pulumi.getter
+    def port(self) -> Optional[_builtins.int]:
+        """
+        port represents a port selected to be used. This is a required field.
+        """
+        return pulumi.get(self, "port")
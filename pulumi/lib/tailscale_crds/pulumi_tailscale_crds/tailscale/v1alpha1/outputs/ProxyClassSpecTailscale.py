@@ -0,0 +1,71 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ProxyClassSpecTailscale']
+
+@pulumi.output_type
+class ProxyClassSpecTailscale(dict):
+    """
+    TailscaleConfig contains options to configure the tailscale-specific
+    parameters of proxies.
+    """
+    @staticmethod
+    def __key_warning(key: str):
+        suggest = None
+        if key == "acceptRoutes":
+            suggest = "accept_routes"
+
+        if suggest:
+            pulumi.log.warn(f"Key '{key}' not found in ProxyClassSpecTailscale. Access the value via the '{suggest}' property getter instead.")
+
+    def __getitem__(self, key: str) -> Any:
+        ProxyClassSpecTailscale.__key_warning(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default = None) -> Any:
+        ProxyClassSpecTailscale.__key_warning(key)
+        return super().get(key, default)
+
+    def __init__(__self__, *,
+                 accept_routes: Optional[_builtins.bool] = None):
+        """
+        TailscaleConfig contains options to configure the tailscale-specific
+        parameters of proxies.
+
+        :param _builtins.bool accept_routes: AcceptRoutes can be set to true to make the proxy instance accept
+               routes advertized by other nodes on the tailnet, such as subnet
+               routes.
+               This is equivalent of passing --accept-routes flag to a tailscale Linux client.
+               https://tailscale.com/kb/1019/subnets#use-your-subnet-routes-from-other-devices
+               Defaults to false.
+        """
+        if accept_routes is not None:
+            pulumi.set(__self__, "accept_routes", accept_routes)
+
+    @_builtins.property
+    @pulumi.getter(name="acceptRoutes")
+    def accept_routes(self) -> Optional[_builtins.bool]:
+        """
+        AcceptRoutes can be set to true to make the proxy instance accept
+        routes advertized by other nodes on the tailnet, such as subnet
+        routes.
+        This is equivalent of passing --accept-routes flag to a tailscale Linux client.
+        https://tailscale.com/kb/1019/subnets#use-your-subnet-routes-from-other-devices
+        Defaults to false.
+        """
+        return pulumi.get(self, "accept_routes")
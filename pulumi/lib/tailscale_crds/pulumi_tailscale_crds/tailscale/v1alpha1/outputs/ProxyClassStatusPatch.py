@@ -0,0 +1,46 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import builtins as _builtins
+import warnings
+import sys
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict, TypeAlias
+else:
+    from typing_extensions import NotRequired, TypedDict, TypeAlias
+from .... import _utilities
+from .. import outputs
+from .... import meta as _meta
+
+__all__ = ['ProxyClassStatusPatch']
+
+@pulumi.output_type
+class ProxyClassStatusPatch(dict):
+    """
+    Status of the ProxyClass. This is set and managed automatically.
+    https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
+    """
+    def __init__(__self__, *,
+                 conditions: Optional[Sequence['outputs.ProxyClassStatusConditionsPatch']] = None):
+        """
+        Status of the ProxyClass. This is set and managed automatically.
+        https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
+
+        :param Sequence['ProxyClassStatusConditionsPatchArgs'] conditions: List of status conditions to indicate the status of the ProxyClass.
+               Known condition types are `ProxyClassReady`.
+        """
+        if conditions is not None:
+            pulumi.set(__self__, "conditions", conditions)
+
+    @_builtins.property
+    @pulumi.getter
+    def conditions(self) -> Optional[Sequence['outputs.ProxyClassStatusConditionsPatch']]:
+        """
+        List of status conditions to indicate the status of the ProxyClass.
+        Known condition types are `ProxyClassReady`.
+        """
+        return pulumi.get(self, "conditions")
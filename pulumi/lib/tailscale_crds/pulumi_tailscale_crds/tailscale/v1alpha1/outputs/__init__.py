@@ -0,0 +1,510 @@
+# coding=utf-8
+# *** WARNING: this file was generated by crd2pulumi. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import importlib
+import typing
+
+__all__ = [
+    'ProxyClass',
+    'ProxyClassSpec',
+    'ProxyClassSpecMetrics',
+    'ProxyClassSpecMetricsPatch',
+    'ProxyClassSpecMetricsServiceMonitor',
+    'ProxyClassSpecMetricsServiceMonitorPatch',
+    'ProxyClassSpecPatch',
+    'ProxyClassSpecStatefulSet',
+    'ProxyClassSpecStatefulSetPatch',
+    'ProxyClassSpecStatefulSetPod',
+    'ProxyClassSpecStatefulSetPodAffinity',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinity',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatch',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecution',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFields',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFields',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinity',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinity',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
+    'ProxyClassSpecStatefulSetPodDnsConfig',
+    'ProxyClassSpecStatefulSetPodDnsConfigOptions',
+    'ProxyClassSpecStatefulSetPodDnsConfigOptionsPatch',
+    'ProxyClassSpecStatefulSetPodDnsConfigPatch',
+    'ProxyClassSpecStatefulSetPodImagePullSecrets',
+    'ProxyClassSpecStatefulSetPodImagePullSecretsPatch',
+    'ProxyClassSpecStatefulSetPodPatch',
+    'ProxyClassSpecStatefulSetPodSecurityContext',
+    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfile',
+    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatch',
+    'ProxyClassSpecStatefulSetPodSecurityContextPatch',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptions',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatch',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfile',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatch',
+    'ProxyClassSpecStatefulSetPodSecurityContextSysctls',
+    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatch',
+    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptions',
+    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainer',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerDebug',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerEnv',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResources',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaims',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContext',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfile',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilities',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptions',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfile',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptions',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainer',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebug',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnv',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResources',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaims',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContext',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfile',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilities',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptions',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfile',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptions',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatch',
+    'ProxyClassSpecStatefulSetPodTolerations',
+    'ProxyClassSpecStatefulSetPodTolerationsPatch',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraints',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelector',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressions',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatch',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatch',
+    'ProxyClassSpecStaticEndpoints',
+    'ProxyClassSpecStaticEndpointsNodePort',
+    'ProxyClassSpecStaticEndpointsNodePortPatch',
+    'ProxyClassSpecStaticEndpointsNodePortPorts',
+    'ProxyClassSpecStaticEndpointsNodePortPortsPatch',
+    'ProxyClassSpecStaticEndpointsPatch',
+    'ProxyClassSpecTailscale',
+    'ProxyClassSpecTailscalePatch',
+    'ProxyClassStatus',
+    'ProxyClassStatusConditions',
+    'ProxyClassStatusConditionsPatch',
+    'ProxyClassStatusPatch',
+]
+
+_TYPE_MODULES = {
+    'ProxyClass': 'ProxyClass',
+    'ProxyClassSpec': 'ProxyClassSpec',
+    'ProxyClassSpecMetrics': 'ProxyClassSpecMetrics',
+    'ProxyClassSpecMetricsPatch': 'ProxyClassSpecMetricsPatch',
+    'ProxyClassSpecMetricsServiceMonitor': 'ProxyClassSpecMetricsServiceMonitor',
+    'ProxyClassSpecMetricsServiceMonitorPatch': 'ProxyClassSpecMetricsServiceMonitorPatch',
+    'ProxyClassSpecPatch': 'ProxyClassSpecPatch',
+    'ProxyClassSpecStatefulSet': 'ProxyClassSpecStatefulSet',
+    'ProxyClassSpecStatefulSetPatch': 'ProxyClassSpecStatefulSetPatch',
+    'ProxyClassSpecStatefulSetPod': 'ProxyClassSpecStatefulSetPod',
+    'ProxyClassSpecStatefulSetPodAffinity': 'ProxyClassSpecStatefulSetPodAffinity',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinity': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinity',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatch': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatch',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecution': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecution',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressions': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatch': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFields': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFields',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatch': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressions': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatch': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFields': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFields',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatch': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch': 'ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPatch': 'ProxyClassSpecStatefulSetPodAffinityPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinity': 'ProxyClassSpecStatefulSetPodAffinityPodAffinity',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinity': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinity',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch',
+    'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch': 'ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch',
+    'ProxyClassSpecStatefulSetPodDnsConfig': 'ProxyClassSpecStatefulSetPodDnsConfig',
+    'ProxyClassSpecStatefulSetPodDnsConfigOptions': 'ProxyClassSpecStatefulSetPodDnsConfigOptions',
+    'ProxyClassSpecStatefulSetPodDnsConfigOptionsPatch': 'ProxyClassSpecStatefulSetPodDnsConfigOptionsPatch',
+    'ProxyClassSpecStatefulSetPodDnsConfigPatch': 'ProxyClassSpecStatefulSetPodDnsConfigPatch',
+    'ProxyClassSpecStatefulSetPodImagePullSecrets': 'ProxyClassSpecStatefulSetPodImagePullSecrets',
+    'ProxyClassSpecStatefulSetPodImagePullSecretsPatch': 'ProxyClassSpecStatefulSetPodImagePullSecretsPatch',
+    'ProxyClassSpecStatefulSetPodPatch': 'ProxyClassSpecStatefulSetPodPatch',
+    'ProxyClassSpecStatefulSetPodSecurityContext': 'ProxyClassSpecStatefulSetPodSecurityContext',
+    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfile': 'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfile',
+    'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatch': 'ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatch',
+    'ProxyClassSpecStatefulSetPodSecurityContextPatch': 'ProxyClassSpecStatefulSetPodSecurityContextPatch',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptions': 'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptions',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatch': 'ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatch',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfile': 'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfile',
+    'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatch': 'ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatch',
+    'ProxyClassSpecStatefulSetPodSecurityContextSysctls': 'ProxyClassSpecStatefulSetPodSecurityContextSysctls',
+    'ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatch': 'ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatch',
+    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptions': 'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptions',
+    'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatch': 'ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainer': 'ProxyClassSpecStatefulSetPodTailscaleContainer',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerDebug': 'ProxyClassSpecStatefulSetPodTailscaleContainerDebug',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatch': 'ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerEnv': 'ProxyClassSpecStatefulSetPodTailscaleContainerEnv',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatch': 'ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerPatch': 'ProxyClassSpecStatefulSetPodTailscaleContainerPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResources': 'ProxyClassSpecStatefulSetPodTailscaleContainerResources',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaims': 'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaims',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatch': 'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatch': 'ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContext': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContext',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfile': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfile',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatch': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilities': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilities',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatch': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatch': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptions': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptions',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatch': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfile': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfile',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatch': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatch',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptions': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptions',
+    'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatch': 'ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainer': 'ProxyClassSpecStatefulSetPodTailscaleInitContainer',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebug': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebug',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatch': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnv': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnv',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatch': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerPatch': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResources': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerResources',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaims': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaims',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatch': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatch': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContext': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContext',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfile': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfile',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatch': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilities': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilities',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatch': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatch': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptions': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptions',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatch': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfile': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfile',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatch': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatch',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptions': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptions',
+    'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatch': 'ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatch',
+    'ProxyClassSpecStatefulSetPodTolerations': 'ProxyClassSpecStatefulSetPodTolerations',
+    'ProxyClassSpecStatefulSetPodTolerationsPatch': 'ProxyClassSpecStatefulSetPodTolerationsPatch',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraints': 'ProxyClassSpecStatefulSetPodTopologySpreadConstraints',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelector': 'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelector',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressions': 'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressions',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatch': 'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatch',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatch': 'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatch',
+    'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatch': 'ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatch',
+    'ProxyClassSpecStaticEndpoints': 'ProxyClassSpecStaticEndpoints',
+    'ProxyClassSpecStaticEndpointsNodePort': 'ProxyClassSpecStaticEndpointsNodePort',
+    'ProxyClassSpecStaticEndpointsNodePortPatch': 'ProxyClassSpecStaticEndpointsNodePortPatch',
+    'ProxyClassSpecStaticEndpointsNodePortPorts': 'ProxyClassSpecStaticEndpointsNodePortPorts',
+    'ProxyClassSpecStaticEndpointsNodePortPortsPatch': 'ProxyClassSpecStaticEndpointsNodePortPortsPatch',
+    'ProxyClassSpecStaticEndpointsPatch': 'ProxyClassSpecStaticEndpointsPatch',
+    'ProxyClassSpecTailscale': 'ProxyClassSpecTailscale',
+    'ProxyClassSpecTailscalePatch': 'ProxyClassSpecTailscalePatch',
+    'ProxyClassStatus': 'ProxyClassStatus',
+    'ProxyClassStatusConditions': 'ProxyClassStatusConditions',
+    'ProxyClassStatusConditionsPatch': 'ProxyClassStatusConditionsPatch',
+    'ProxyClassStatusPatch': 'ProxyClassStatusPatch',
+}
+
+if typing.TYPE_CHECKING:
+    from .ProxyClass import *
+    from .ProxyClassSpec import *
+    from .ProxyClassSpecMetrics import *
+    from .ProxyClassSpecMetricsPatch import *
+    from .ProxyClassSpecMetricsServiceMonitor import *
+    from .ProxyClassSpecMetricsServiceMonitorPatch import *
+    from .ProxyClassSpecPatch import *
+    from .ProxyClassSpecStatefulSet import *
+    from .ProxyClassSpecStatefulSetPatch import *
+    from .ProxyClassSpecStatefulSetPod import *
+    from .ProxyClassSpecStatefulSetPodAffinity import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinity import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecution import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreference import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressions import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchExpressionsPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFields import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferenceMatchFieldsPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityPreferredDuringSchedulingIgnoredDuringExecutionPreferencePatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecution import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTerms import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressions import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchExpressionsPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFields import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsMatchFieldsPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionNodeSelectorTermsPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityNodeAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinity import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecution import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecution import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinity import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecution import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTerm import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelector import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressions import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorMatchExpressionsPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermLabelSelectorPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelector import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressions import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorMatchExpressionsPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermNamespaceSelectorPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityPreferredDuringSchedulingIgnoredDuringExecutionPodAffinityTermPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecution import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelector import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressions import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorMatchExpressionsPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionLabelSelectorPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelector import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressions import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorMatchExpressionsPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionNamespaceSelectorPatch import *
+    from .ProxyClassSpecStatefulSetPodAffinityPodAntiAffinityRequiredDuringSchedulingIgnoredDuringExecutionPatch import *
+    from .ProxyClassSpecStatefulSetPodDnsConfig import *
+    from .ProxyClassSpecStatefulSetPodDnsConfigOptions import *
+    from .ProxyClassSpecStatefulSetPodDnsConfigOptionsPatch import *
+    from .ProxyClassSpecStatefulSetPodDnsConfigPatch import *
+    from .ProxyClassSpecStatefulSetPodImagePullSecrets import *
+    from .ProxyClassSpecStatefulSetPodImagePullSecretsPatch import *
+    from .ProxyClassSpecStatefulSetPodPatch import *
+    from .ProxyClassSpecStatefulSetPodSecurityContext import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfile import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextAppArmorProfilePatch import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextPatch import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptions import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextSeLinuxOptionsPatch import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextSeccompProfile import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextSeccompProfilePatch import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextSysctls import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextSysctlsPatch import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextWindowsOptions import *
+    from .ProxyClassSpecStatefulSetPodSecurityContextWindowsOptionsPatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainer import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerDebug import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerDebugPatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerEnv import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerEnvPatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerPatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerResources import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaims import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerResourcesClaimsPatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerResourcesPatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContext import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfile import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextAppArmorProfilePatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilities import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextCapabilitiesPatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextPatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptions import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeLinuxOptionsPatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfile import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextSeccompProfilePatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptions import *
+    from .ProxyClassSpecStatefulSetPodTailscaleContainerSecurityContextWindowsOptionsPatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainer import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerDebug import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerDebugPatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerEnv import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerEnvPatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerPatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerResources import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaims import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesClaimsPatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerResourcesPatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContext import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfile import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextAppArmorProfilePatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilities import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextCapabilitiesPatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextPatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptions import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeLinuxOptionsPatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfile import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextSeccompProfilePatch import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptions import *
+    from .ProxyClassSpecStatefulSetPodTailscaleInitContainerSecurityContextWindowsOptionsPatch import *
+    from .ProxyClassSpecStatefulSetPodTolerations import *
+    from .ProxyClassSpecStatefulSetPodTolerationsPatch import *
+    from .ProxyClassSpecStatefulSetPodTopologySpreadConstraints import *
+    from .ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelector import *
+    from .ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressions import *
+    from .ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorMatchExpressionsPatch import *
+    from .ProxyClassSpecStatefulSetPodTopologySpreadConstraintsLabelSelectorPatch import *
+    from .ProxyClassSpecStatefulSetPodTopologySpreadConstraintsPatch import *
+    from .ProxyClassSpecStaticEndpoints import *
+    from .ProxyClassSpecStaticEndpointsNodePort import *
+    from .ProxyClassSpecStaticEndpointsNodePortPatch import *
+    from .ProxyClassSpecStaticEndpointsNodePortPorts import *
+    from .ProxyClassSpecStaticEndpointsNodePortPortsPatch import *
+    from .ProxyClassSpecStaticEndpointsPatch import *
+    from .ProxyClassSpecTailscale import *
+    from .ProxyClassSpecTailscalePatch import *
+    from .ProxyClassStatus import *
+    from .ProxyClassStatusConditions import *
+    from .ProxyClassStatusConditionsPatch import *
+    from .ProxyClassStatusPatch import *
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _TYPE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,4 +1,5 @@
 import pulumi_kubernetes as k8s
+from infra_helpers.helm import cached_chart
 
 import pulumi
 
@@ -8,6 +9,17 @@ grafana_admin_password = config.require_secret("grafanaAdminPassword")
 MONITORING_NAMESPACE = "monitoring"
 GRAFANA_RESOURCE_NAME = "kube-prometheus-stack-grafana"
 PROMETHEUS_REPO = "https://prometheus-community.github.io/helm-charts"
+PROMETHEUS_CRDS_VERSION = "29.0.0"
+PROMETHEUS_STACK_VERSION = "85.1.0"
+METRICS_SERVER_VERSION = "3.13.0"
+DASHBOARD_VERSION = "7.14.0"
+PROMETHEUS_ADAPTER_VERSION = "4.14.1"
+# Recording rules named hpa_<metric> with a namespace label are served on the
+# external metrics API, so service stacks can autoscale on their own signals.
+HPA_METRIC_PATTERN = "^hpa_.+"
+# Datasource plugins for datasources that service stacks provision through the
+# Grafana sidecar, such as ClickHouse.
+GRAFANA_PLUGINS = ["grafana-clickhouse-datasource"]
 
 
 def skip_await_for_grafana_pvc(obj, _opts):
@@ -64,12 +76,11 @@ def deploy_prometheus_stack_crds():
     return k8s.helm.v3.Chart(
         "prometheus-operator-crds",
         k8s.helm.v3.ChartOpts(
-            chart="prometheus-operator-crds",
-            namespace=MONITORING_NAMESPACE,
-            fetch_opts=k8s.helm.v3.FetchOpts(
-                repo=PROMETHEUS_REPO,
+            chart=cached_chart(
+                "prometheus-operator-crds", PROMETHEUS_CRDS_VERSION, PROMETHEUS_REPO
             ),
-            version="29.0.0",
+            namespace=MONITORING_NAMESPACE,
+            version=PROMETHEUS_CRDS_VERSION,
         ),
     )
 
@@ -110,6 +121,7 @@ def deploy_prometheus_stack(crds_chart):
         },
         "grafana": {
             "adminPassword": grafana_admin_password,
+            "plugins": GRAFANA_PLUGINS,
             "resources": {
                 "requests": {
                     "cpu": "50m",
@@ -161,12 +173,11 @@ def deploy_prometheus_stack(crds_chart):
     return k8s.helm.v3.Chart(
         "kube-prometheus-stack",
         k8s.helm.v3.ChartOpts(
-            chart="kube-prometheus-stack",
-            namespace=MONITORING_NAMESPACE,
-            fetch_opts=k8s.helm.v3.FetchOpts(
-                repo=PROMETHEUS_REPO,
+            chart=cached_chart(
+                "kube-prometheus-stack", PROMETHEUS_STACK_VERSION, PROMETHEUS_REPO
             ),
-            version="85.1.0",
+            namespace=MONITORING_NAMESPACE,
+            version=PROMETHEUS_STACK_VERSION,
             values=values,
             transformations=[
                 skip_await_for_grafana_pvc,
@@ -178,6 +189,53 @@ def deploy_prometheus_stack(crds_chart):
     )
 
 
+def deploy_prometheus_adapter(prometheus_stack):
+    """Deploy Prometheus Adapter for external HPA metrics"""
+    values = {
+        "prometheus": {
+            "url": f"http://kube-prometheus-stack-prometheus.{MONITORING_NAMESPACE}.svc",
+            "port": 9090,
+        },
+        "rules": {
+            "default": False,
+            "external": [
+                {
+                    "seriesQuery": f'{{__name__=~"{HPA_METRIC_PATTERN}",namespace!=""}}',
+                    "resources": {
+                        "overrides": {
+                            "namespace": {"resource": "namespace"},
+                        },
+                    },
+                    "metricsQuery": "max(<<.Series>>{<<.LabelMatchers>>})",
+                },
+            ],
+        },
+        "resources": {
+            "requests": {
+                "cpu": "50m",
+                "memory": "128Mi",
+            },
+            "limits": {
+                "cpu": "500m",
+                "memory": "256Mi",
+            },
+        },
+    }
+
+    return k8s.helm.v3.Chart(
+        "prometheus-adapter",
+        k8s.helm.v3.ChartOpts(
+            chart=cached_chart(
+                "prometheus-adapter", PROMETHEUS_ADAPTER_VERSION, PROMETHEUS_REPO
+            ),
+            namespace=MONITORING_NAMESPACE,
+            version=PROMETHEUS_ADAPTER_VERSION,
+            values=values,
+        ),
+        opts=pulumi.ResourceOptions(depends_on=[prometheus_stack]),
+    )
+
+
 def deploy_kubernetes_monitoring():
     """Deploy Kubernetes monitoring components (currently disabled)"""
     # Components are commented out in the original Go code
@@ -188,12 +246,13 @@ def new_kubernetes_metrics_server():
     return k8s.helm.v3.Chart(
         "metrics-server",
         k8s.helm.v3.ChartOpts(
-            chart="metrics-server",
-            namespace="kube-system",
-            fetch_opts=k8s.helm.v3.FetchOpts(
-                repo="https://kubernetes-sigs.github.io/metrics-server/",
+            chart=cached_chart(
+                "metrics-server",
+                METRICS_SERVER_VERSION,
+                "https://kubernetes-sigs.github.io/metrics-server/",
             ),
-            version="3.13.0",
+            namespace="kube-system",
+            version=METRICS_SERVER_VERSION,
         ),
     )
 
@@ -203,12 +262,13 @@ def new_kubernetes_dashboard():
     return k8s.helm.v3.Chart(
         "kubernetes-dashboard",
         k8s.helm.v3.ChartOpts(
-            chart="kubernetes-dashboard",
-            namespace=MONITORING_NAMESPACE,
-            fetch_opts=k8s.helm.v3.FetchOpts(
-                repo="https://kubernetes-retired.github.io/dashboard",
+            chart=cached_chart(
+                "kubernetes-dashboard",
+                DASHBOARD_VERSION,
+                "https://kubernetes-retired.github.io/dashboard",
             ),
-            version="7.14.0",
+            namespace=MONITORING_NAMESPACE,
+            version=DASHBOARD_VERSION,
             values={
                 "rbac": {
                     "clusterReadOnlyRole": True,
@@ -228,3 +288,4 @@ def new_kubernetes_dashboard():
 # Main execution
 crds_chart = deploy_prometheus_stack_crds()
 prometheus_stack = deploy_prometheus_stack(crds_chart)
+prometheus_adapter = deploy_prometheus_adapter(prometheus_stack)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Measure how long each generated CRD package takes to import.
+
+For every package under `pulumi/lib`, a fresh interpreter imports `pulumi` and
+`pulumi_kubernetes` first, then times importing each registered resource class
+(List and Patch variants excluded), which is what a stack program does. The
+cold column disables bytecode caches; the warm column reuses them.
+
+The packages must be importable by the running interpreter, for example:
+
+    just crd-import-times
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+LIB_ROOT = REPO_ROOT / "pulumi" / "lib"
+
+PROBE = """
+import importlib, json, sys, time
+import pulumi, pulumi_kubernetes
+targets = json.loads(sys.argv[1])
+started = time.perf_counter()
+for fqn, names in targets:
+    module = importlib.import_module(fqn)
+    for name in names:
+        getattr(module, name)
+elapsed = time.perf_counter() - started
+print(json.dumps({"seconds": elapsed, "modules": len(sys.modules)}))
+"""
+
+
+def resource_targets(package: str) -> list[tuple[str, list[str]]]:
+    """Return `(module, classes)` pairs from the package's resource registry."""
+    spec = importlib.util.find_spec(package)
+    if spec is None or spec.origin is None:
+        raise SystemExit(f"{package} is not importable from {sys.executable}")
+    tree = ast.parse(Path(spec.origin).read_text(encoding="utf-8"))
+
+    targets: list[tuple[str, list[str]]] = []
+    for node in ast.walk(tree):
+        if not (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "register"
+        ):
+            continue
+        for keyword in node.keywords:
+            if keyword.arg != "resource_modules":
+                continue
+            for module in json.loads(ast.literal_eval(keyword.value)):
+                names = [
+                    name
+                    for name in module["classes"].values()
+                    if not name.endswith(("List", "Patch"))
+                ]
+                targets.append((module["fqn"], names))
+    return targets
+
+
+def measure(
+    targets: list[tuple[str, list[str]]], *, cold: bool, repeat: int
+) -> tuple[float, int]:
+    samples: list[float] = []
+    modules = 0
+    for _ in range(repeat):
+        env = dict(os.environ)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            if cold:
+                env["PYTHONPYCACHEPREFIX"] = cache_dir
+                env["PYTHONDONTWRITEBYTECODE"] = "1"
+            proc = subprocess.run(
+                [sys.executable, "-c", PROBE, json.dumps(targets)],
+                capture_output=True,
+                text=True,
+                env=env,
+                check=True,
+            )
+        result = json.loads(proc.stdout)
+        samples.append(result["seconds"])
+        modules = result["modules"]
+    return statistics.median(samples), modules
+
+
+def package_names(lib_root: Path) -> list[str]:
+    return sorted(
+        path.name
+        for path in lib_root.glob("*_crds/pulumi_*")
+        if (path / "__init__.py").is_file()
+    )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("packages", nargs="*", help="import names to measure")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", type=Path, help="also write results to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    packages = args.packages or package_names(LIB_ROOT)
+
+    # Warm the bytecode cache once so the warm column measures a steady state.
+    for package in packages:
+        measure(resource_targets(package), cold=False, repeat=1)
+
+    rows = []
+    for package in packages:
+        targets = resource_targets(package)
+        cold, _ = measure(targets, cold=True, repeat=args.repeat)
+        warm, modules = measure(targets, cold=False, repeat=args.repeat)
+        rows.append(
+            {
+                "package": package,
+                "classes": [
+                    f"{fqn}.{name}" for fqn, names in targets for name in names
+                ],
+                "cold_ms": round(cold * 1000, 1),
+                "warm_ms": round(warm * 1000, 1),
+                "modules": modules,
+            }
+        )
+
+    width = max(len(row["package"]) for row in rows)
+    print(f"{'PACKAGE'.ljust(width)}  {'COLD ms':>9}  {'WARM ms':>9}")
+    for row in rows:
+        print(
+            f"{row['package'].ljust(width)}  {row['cold_ms']:>9}  {row['warm_ms']:>9}"
+        )
+
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Download every Helm chart referenced under pulumi/ into the local chart cache.
+
+Programs pass their charts through ``infra_helpers.helm.cached_chart(chart,
+version, repo)``. This script finds those calls statically, resolves their
+arguments from literals, module constants, config defaults, and local
+``Pulumi.<stack>.yaml`` values the same way ``preview_all.py`` resolves stack
+names, and fetches any chart that is not cached yet. After a successful run,
+previews read chart archives from disk and need no Helm repository access.
+
+    PYTHONPATH=pulumi/infra_helpers python scripts/prefetch_charts.py
+    PYTHONPATH=pulumi/infra_helpers python scripts/prefetch_charts.py --check
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import itertools
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from infra_helpers import helm
+from preview_all import (
+    RefResolver,
+    call_name,
+    discover_projects,
+    read_project_name,
+    read_stack_config,
+)
+
+ChartRef = tuple[str, str, str | None]
+
+
+def find_chart_refs(project_dir: Path, stack: str) -> tuple[set[ChartRef], list[str]]:
+    main = project_dir / "__main__.py"
+    if not main.is_file():
+        return set(), []
+    source = main.read_text(encoding="utf-8")
+    tree = ast.parse(source, filename=str(main))
+    resolver = RefResolver(
+        tree, read_project_name(project_dir), read_stack_config(project_dir, stack)
+    )
+
+    refs: set[ChartRef] = set()
+    unresolved: list[str] = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and call_name(node) == "cached_chart"):
+            continue
+        args = node.args[:3]
+        values = [sorted(resolver.resolve(arg)) for arg in args]
+        if len(args) < 2 or not all(values):
+            unresolved.append(
+                f"{main}:{node.lineno}: {ast.get_source_segment(source, node)}"
+            )
+            continue
+        repos = values[2] if len(values) == 3 else [None]
+        refs.update(itertools.product(values[0], values[1], repos))
+    return refs, unresolved
+
+
+def prefetch(ref: ChartRef, check: bool) -> str:
+    chart, version, repo = ref
+    if helm.lookup(chart, version, repo) is not None:
+        return "cached"
+    if check:
+        return "missing"
+    try:
+        helm.fetch(chart, version, repo)
+    except Exception as exc:  # noqa: BLE001 - report every chart that failed
+        return f"failed: {type(exc).__name__}: {exc}"
+    return "fetched"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("projects", nargs="*", help="limit to these project paths")
+    parser.add_argument("--stack", default="mx")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=min(8, os.cpu_count() or 1),
+        help="maximum concurrent downloads",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="download nothing; fail if any referenced chart is not cached",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    projects = [Path(item).resolve() for item in args.projects] or discover_projects()
+
+    refs: set[ChartRef] = set()
+    unresolved: list[str] = []
+    for project_dir in projects:
+        project_refs, project_unresolved = find_chart_refs(project_dir, args.stack)
+        refs |= project_refs
+        unresolved.extend(project_unresolved)
+
+    ordered = sorted(refs, key=lambda ref: (ref[2] or "", ref[0], ref[1]))
+    with ThreadPoolExecutor(max_workers=max(args.jobs, 1)) as pool:
+        statuses = list(pool.map(lambda ref: prefetch(ref, args.check), ordered))
+
+    for (chart, version, repo), status in zip(ordered, statuses, strict=True):
+        source = f"{repo.rstrip('/')}/{chart}" if repo else chart
+        print(f"{status.split(':')[0]:<8} {source} {version}")
+        if status.startswith("failed"):
+            print(f"         {status.partition(': ')[2]}")
+    for line in unresolved:
+        print(f"unresolved {line}")
+
+    print(f"\n{len(ordered)} charts in {helm.cache_dir()}")
+    failed = any(status not in ("cached", "fetched") for status in statuses)
+    return 1 if failed or unresolved else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
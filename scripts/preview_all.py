@@ -0,0 +1,689 @@
+#!/usr/bin/env python3
+"""Preview every Pulumi project for one stack, respecting StackReference order.
+
+The runner statically reads each project's ``__main__.py`` for
+``pulumi.StackReference(...)`` calls and ``infra_helpers.stacks`` wrappers such
+as ``PostgresStack(...)``, resolves their stack names from literals, config
+defaults, and local ``Pulumi.<stack>.yaml`` values, and previews independent
+projects concurrently. A project starts only after every project it references
+has finished.
+
+Successful previews are cached by a fingerprint of everything the program
+reads: its project files, the `infra_helpers` modules and `pulumi_*_crds`
+packages it imports, the outputs of the stacks it references, and the stack's
+last update. A project whose fingerprint matches its last clean preview is
+reported as cached instead of previewed; `--force` previews it anyway.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import functools
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PULUMI_ROOT = REPO_ROOT / "pulumi"
+
+LIB_ROOT = PULUMI_ROOT / "lib"
+HELPERS_ROOT = PULUMI_ROOT / "infra_helpers"
+CACHE_DIR = REPO_ROOT / ".cache" / "preview-all"
+
+# Constructors that take a stack name: the Pulumi class and the infra_helpers
+# typed wrappers around it.
+STACK_REFERENCE_CALLS = frozenset(
+    {
+        "StackReference",
+        "StackOutputs",
+        "PostgresStack",
+        "RustfsStack",
+        "ClickHouseStack",
+        "TrinoStack",
+    }
+)
+CONFIG_GETTERS = frozenset({"get", "require", "get_secret", "require_secret"})
+
+PREVIEW_FLAGS = {
+    "normal": [
+        "--non-interactive",
+        "--suppress-outputs",
+        "--suppress-permalink",
+        "--suppress-progress",
+        "--color",
+        "never",
+    ],
+    "refresh": [
+        "--refresh",
+        "--run-program",
+        "--non-interactive",
+        "--suppress-outputs",
+        "--suppress-permalink",
+        "--suppress-progress",
+        "--color",
+        "never",
+    ],
+}
+
+# Directories whose contents never reach `pulumi preview`.
+FINGERPRINT_SKIP_DIRS = frozenset(
+    {
+        ".venv",
+        "__pycache__",
+        ".pulumi-mocks",
+        ".pytest_cache",
+        ".ruff_cache",
+        "snapshots",
+    }
+)
+
+SUMMARY_PATTERN = re.compile(
+    r"^(Diagnostics:|error:|Resources:|Duration:|Previewing|  pulumi:|  kubernetes:)"
+)
+
+
+@dataclass
+class Project:
+    path: Path
+    name: str
+    stack_refs: set[str] = field(default_factory=set)
+    upstream: set[str] = field(default_factory=set)
+
+    @property
+    def rel(self) -> str:
+        return self.path.relative_to(REPO_ROOT).as_posix()
+
+
+@dataclass
+class PreviewResult:
+    project: Project
+    status: str
+    seconds: float
+    returncode: int | None = None
+    output: str = ""
+    fingerprint: str | None = None
+
+
+def discover_projects() -> list[Path]:
+    return sorted(
+        path.parent
+        for path in PULUMI_ROOT.rglob("Pulumi.yaml")
+        if ".venv" not in path.parts
+    )
+
+
+def read_project_name(project_dir: Path) -> str:
+    for line in (project_dir / "Pulumi.yaml").read_text(encoding="utf-8").splitlines():
+        if line.startswith("name:"):
+            return line.partition(":")[2].strip().strip("'\"")
+    return project_dir.name
+
+
+def read_stack_config(project_dir: Path, stack: str) -> dict[str, str]:
+    """Read the scalar `config:` entries from a local stack file, if present.
+
+    Only flat `project:key: value` lines are understood; secrets and objects are
+    ignored because stack names are always plain strings.
+    """
+    stack_file = project_dir / f"Pulumi.{stack}.yaml"
+    if not stack_file.is_file():
+        return {}
+
+    values: dict[str, str] = {}
+    in_config = False
+    for line in stack_file.read_text(encoding="utf-8").splitlines():
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if not line.startswith(" "):
+            in_config = line.rstrip() == "config:"
+            continue
+        if not in_config or line.startswith("   "):
+            continue
+        key, sep, value = line.strip().partition(": ")
+        value = value.strip()
+        if sep and value and not value.startswith(("{", "[", "|", ">")):
+            values[key.strip("'\"")] = value.strip("'\"")
+    return values
+
+
+def call_name(node: ast.Call) -> str | None:
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    return None
+
+
+class RefResolver:
+    def __init__(self, tree: ast.Module, project_name: str, config: dict[str, str]):
+        self.project_name = project_name
+        self.config = config
+        self.assignments: dict[str, list[ast.expr]] = {}
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        self.assignments.setdefault(target.id, []).append(node.value)
+            elif (
+                isinstance(node, ast.AnnAssign)
+                and node.value is not None
+                and isinstance(node.target, ast.Name)
+            ):
+                self.assignments.setdefault(node.target.id, []).append(node.value)
+
+    def resolve(self, node: ast.expr, seen: frozenset[str] = frozenset()) -> set[str]:
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return {node.value}
+        if isinstance(node, ast.Name):
+            if node.id in seen:
+                return set()
+            values: set[str] = set()
+            for value in self.assignments.get(node.id, []):
+                values |= self.resolve(value, seen | {node.id})
+            return values
+        if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.Or):
+            for value in node.values:
+                resolved = self.resolve(value, seen)
+                if resolved:
+                    return resolved
+            return set()
+        if isinstance(node, ast.IfExp):
+            return self.resolve(node.body, seen) | self.resolve(node.orelse, seen)
+        if isinstance(node, ast.Call) and call_name(node) in CONFIG_GETTERS:
+            return self._resolve_config(node, seen)
+        return set()
+
+    def _resolve_config(self, node: ast.Call, seen: frozenset[str]) -> set[str]:
+        if not node.args or not isinstance(node.args[0], ast.Constant):
+            return set()
+        key = str(node.args[0].value)
+        configured = self.config.get(f"{self.project_name}:{key}")
+        if configured:
+            return {configured}
+        defaults = list(node.args[1:2]) + [
+            keyword.value for keyword in node.keywords if keyword.arg == "default"
+        ]
+        values: set[str] = set()
+        for default in defaults:
+            values |= self.resolve(default, seen)
+        return values
+
+
+def find_stack_refs(project_dir: Path, project_name: str, stack: str) -> set[str]:
+    main = project_dir / "__main__.py"
+    if not main.is_file():
+        return set()
+    tree = ast.parse(main.read_text(encoding="utf-8"), filename=str(main))
+    resolver = RefResolver(tree, project_name, read_stack_config(project_dir, stack))
+
+    refs: set[str] = set()
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and call_name(node) in STACK_REFERENCE_CALLS
+            and node.args
+        ):
+            refs |= resolver.resolve(node.args[0])
+    return refs
+
+
+def load_projects(stack: str, selected: Iterable[str] = ()) -> list[Project]:
+    projects = [
+        Project(path=path, name=read_project_name(path)) for path in discover_projects()
+    ]
+    by_name = {project.name: project for project in projects}
+
+    for project in projects:
+        project.stack_refs = find_stack_refs(project.path, project.name, stack)
+        for ref in project.stack_refs:
+            parts = ref.split("/")
+            if len(parts) != 3 or parts[2] != stack:
+                continue
+            upstream = by_name.get(parts[1])
+            if upstream is not None and upstream is not project:
+                project.upstream.add(upstream.rel)
+
+    if selected:
+        wanted = {Path(item).as_posix().rstrip("/") for item in selected}
+        unknown = wanted - {project.rel for project in projects}
+        if unknown:
+            raise SystemExit(f"unknown projects: {', '.join(sorted(unknown))}")
+        projects = [project for project in projects if project.rel in wanted]
+        for project in projects:
+            project.upstream &= wanted
+
+    return projects
+
+
+def topological_waves(projects: list[Project]) -> Iterator[list[Project]]:
+    remaining = {project.rel: project for project in projects}
+    done: set[str] = set()
+    while remaining:
+        ready = [project for project in remaining.values() if project.upstream <= done]
+        if not ready:
+            cycle = ", ".join(sorted(remaining))
+            raise SystemExit(f"StackReference cycle between: {cycle}")
+        yield ready
+        for project in ready:
+            done.add(project.rel)
+            del remaining[project.rel]
+
+
+def stack_summary(project: Project, stack: str) -> dict | None:
+    proc = subprocess.run(
+        ["pulumi", "stack", "ls", "--json"],
+        cwd=project.path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        return None
+    try:
+        stacks = json.loads(proc.stdout or "[]")
+    except json.JSONDecodeError:
+        return None
+    return next((entry for entry in stacks if entry.get("name") == stack), None)
+
+
+def _module_imports(path: Path) -> set[str]:
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+    except (SyntaxError, UnicodeDecodeError):
+        return set()
+    modules: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            modules.add(node.module)
+            modules.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return modules
+
+
+def _file_digest(digest: hashlib._Hash, path: Path, root: Path) -> None:
+    digest.update(path.relative_to(root).as_posix().encode())
+    digest.update(b"\0")
+    digest.update(path.read_bytes())
+    digest.update(b"\0")
+
+
+def _tree_files(root: Path) -> list[Path]:
+    return sorted(
+        path
+        for path in root.rglob("*")
+        if path.is_file() and not FINGERPRINT_SKIP_DIRS.intersection(path.parts)
+    )
+
+
+def project_files(project: Project, stack: str) -> list[Path]:
+    """Return the project's files, leaving out other stacks' config files."""
+    own_config = f"Pulumi.{stack}.yaml"
+    return [
+        path
+        for path in _tree_files(project.path)
+        if not (
+            path.parent == project.path
+            and path.name.startswith("Pulumi.")
+            and path.name not in {"Pulumi.yaml", own_config}
+        )
+    ]
+
+
+def helper_files(modules: set[str]) -> list[Path]:
+    """Return the `infra_helpers` modules reachable from `modules`."""
+    package = HELPERS_ROOT / "infra_helpers"
+    found: set[Path] = set()
+    queue = [name for name in modules if name.split(".")[0] == "infra_helpers"]
+    while queue:
+        parts = queue.pop().split(".")
+        candidates = [package / "__init__.py"]
+        if len(parts) > 1:
+            candidates.append(package / f"{parts[1]}.py")
+        for path in candidates:
+            if path.is_file() and path not in found:
+                found.add(path)
+                queue.extend(
+                    name
+                    for name in _module_imports(path)
+                    if name.split(".")[0] == "infra_helpers"
+                )
+    if found:
+        found.add(HELPERS_ROOT / "pyproject.toml")
+    return sorted(found)
+
+
+@functools.cache
+def crd_package_dirs() -> dict[str, Path]:
+    return {
+        path.name: path.parent
+        for path in LIB_ROOT.glob("*_crds/pulumi_*")
+        if (path / "__init__.py").is_file()
+    }
+
+
+@functools.cache
+def tree_digest(root: Path) -> str:
+    digest = hashlib.sha256()
+    for path in _tree_files(root):
+        _file_digest(digest, path, root)
+    return digest.hexdigest()
+
+
+class OutputDigests:
+    """Hash referenced stack outputs once per run.
+
+    Secrets are decrypted so that a rotated password invalidates consumers, but
+    only the SHA-256 of the output document is kept.
+    """
+
+    def __init__(self) -> None:
+        self._digests: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, ref: str, cwd: Path) -> str:
+        with self._lock:
+            if ref in self._digests:
+                return self._digests[ref]
+        proc = subprocess.run(
+            ["pulumi", "stack", "output", "--stack", ref, "--json", "--show-secrets"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if proc.returncode != 0:
+            value = f"unavailable:{time.time_ns()}"
+        else:
+            value = hashlib.sha256(proc.stdout.encode()).hexdigest()
+        with self._lock:
+            return self._digests.setdefault(ref, value)
+
+
+def fingerprint(
+    project: Project, stack: str, summary: dict, outputs: OutputDigests
+) -> str:
+    files = project_files(project, stack)
+    imports: set[str] = set()
+    for path in files:
+        if path.suffix == ".py":
+            imports |= _module_imports(path)
+
+    digest = hashlib.sha256()
+    for path in files:
+        _file_digest(digest, path, project.path)
+    for path in helper_files(imports):
+        _file_digest(digest, path, HELPERS_ROOT)
+
+    packages = crd_package_dirs()
+    for name in sorted({module.split(".")[0] for module in imports} & set(packages)):
+        digest.update(f"crd:{name}:{tree_digest(packages[name])}\n".encode())
+    for ref in sorted(project.stack_refs):
+        digest.update(f"ref:{ref}:{outputs.get(ref, project.path)}\n".encode())
+    digest.update(
+        f"state:{summary.get('lastUpdate')}:{summary.get('resourceCount')}\n".encode()
+    )
+    return digest.hexdigest()
+
+
+def cache_path(stack: str) -> Path:
+    return CACHE_DIR / f"{stack}.json"
+
+
+def load_cache(stack: str) -> dict[str, dict]:
+    try:
+        return json.loads(cache_path(stack).read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(
+    stack: str, cache: dict[str, dict], results: list[PreviewResult]
+) -> None:
+    for result in results:
+        if result.status == "ok" and result.fingerprint:
+            cache[result.project.rel] = {
+                "fingerprint": result.fingerprint,
+                "seconds": round(result.seconds, 3),
+                "previewed": datetime.now().isoformat(timespec="seconds"),
+            }
+        elif result.status == "failed":
+            cache.pop(result.project.rel, None)
+    path = cache_path(stack)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(cache, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+
+
+def log_path(logdir: Path, project: Project, stack: str) -> Path:
+    return logdir / (f"{project.rel}__{stack}".replace("/", "_") + ".log")
+
+
+def preview_project(
+    project: Project,
+    stack: str,
+    mode: str,
+    logdir: Path,
+    cache: dict[str, dict],
+    outputs: OutputDigests | None,
+) -> PreviewResult:
+    started = time.monotonic()
+    summary = stack_summary(project, stack)
+    if summary is None:
+        return PreviewResult(project, "skipped", time.monotonic() - started)
+
+    digest = None
+    if outputs is not None:
+        digest = fingerprint(project, stack, summary, outputs)
+        if cache.get(project.rel, {}).get("fingerprint") == digest:
+            return PreviewResult(
+                project, "cached", time.monotonic() - started, 0, fingerprint=digest
+            )
+
+    logfile = log_path(logdir, project, stack)
+    with logfile.open("w", encoding="utf-8") as log:
+        proc = subprocess.run(
+            ["pulumi", "preview", "--stack", stack, *PREVIEW_FLAGS[mode]],
+            cwd=project.path,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            check=False,
+        )
+    seconds = time.monotonic() - started
+    lines = logfile.read_text(encoding="utf-8", errors="replace").splitlines()
+
+    if proc.returncode == 0:
+        block = _summary_block(lines)
+        return PreviewResult(
+            project, "ok", seconds, 0, "\n".join(block[-25:]), fingerprint=digest
+        )
+
+    diagnostics = [line for line in lines if SUMMARY_PATTERN.match(line)]
+    output = "\n".join([f"FAILED exit={proc.returncode}", *diagnostics[-80:]])
+    return PreviewResult(project, "failed", seconds, proc.returncode, output)
+
+
+def _summary_block(lines: list[str]) -> list[str]:
+    block: list[str] = []
+    inside = False
+    for line in lines:
+        if "Resources:" in line:
+            inside = True
+        if inside:
+            block.append(line)
+        if inside and "Duration:" in line:
+            inside = False
+    return block
+
+
+def run_previews(
+    projects: list[Project],
+    stack: str,
+    mode: str,
+    jobs: int,
+    logdir: Path,
+    cache: dict[str, dict],
+    use_cache: bool,
+) -> list[PreviewResult]:
+    by_rel = {project.rel: project for project in projects}
+    pending = dict(by_rel)
+    finished: set[str] = set()
+    results: list[PreviewResult] = []
+    print_lock = threading.Lock()
+    outputs = OutputDigests() if use_cache else None
+
+    def report(result: PreviewResult) -> None:
+        if result.status == "skipped":
+            return
+        with print_lock:
+            if result.status == "cached":
+                print(f"\n== {result.project.rel} [{stack}] cached, unchanged ==")
+                sys.stdout.flush()
+                return
+            print(f"\n== {result.project.rel} [{stack}] ({result.seconds:.1f}s) ==")
+            if result.output:
+                print(result.output)
+            sys.stdout.flush()
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        running: dict[Future[PreviewResult], str] = {}
+        while pending or running:
+            for rel, project in list(pending.items()):
+                if len(running) >= jobs:
+                    break
+                if project.upstream - finished:
+                    continue
+                del pending[rel]
+                future = pool.submit(
+                    preview_project, project, stack, mode, logdir, cache, outputs
+                )
+                running[future] = rel
+
+            if not running:
+                cycle = ", ".join(sorted(pending))
+                raise SystemExit(f"StackReference cycle between: {cycle}")
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                rel = running.pop(future)
+                result = future.result()
+                finished.add(rel)
+                results.append(result)
+                report(result)
+
+    return results
+
+
+def print_timings(results: list[PreviewResult]) -> None:
+    rows = sorted(
+        (result for result in results if result.status not in ("skipped", "cached")),
+        key=lambda result: result.seconds,
+        reverse=True,
+    )
+    cached = sum(result.status == "cached" for result in results)
+    if not rows:
+        if cached:
+            print(f"\n{cached} project(s) unchanged since their last clean preview")
+        return
+    width = max(len(result.project.rel) for result in rows)
+    print(f"\n{'PROJECT'.ljust(width)}  {'STATUS':<8}  {'SECONDS':>8}")
+    for result in rows:
+        print(
+            f"{result.project.rel.ljust(width)}  {result.status:<8}  "
+            f"{result.seconds:>8.1f}"
+        )
+    if cached:
+        print(f"{cached} project(s) unchanged since their last clean preview")
+
+
+def write_timings(results: list[PreviewResult], logdir: Path) -> None:
+    payload = [
+        {
+            "project": result.project.rel,
+            "status": result.status,
+            "seconds": round(result.seconds, 3),
+            "returncode": result.returncode,
+            "upstream": sorted(result.project.upstream),
+        }
+        for result in results
+    ]
+    (logdir / "timings.json").write_text(
+        json.dumps(payload, indent=2) + "\n", encoding="utf-8"
+    )
+
+
+def print_graph(projects: list[Project]) -> None:
+    for index, wave in enumerate(topological_waves(projects)):
+        print(f"wave {index}:")
+        for project in sorted(wave, key=lambda project: project.rel):
+            upstream = ", ".join(sorted(project.upstream)) or "-"
+            print(f"  {project.rel}  <- {upstream}")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("projects", nargs="*", help="limit to these project paths")
+    parser.add_argument("--stack", default="mx")
+    parser.add_argument("--mode", choices=sorted(PREVIEW_FLAGS), default="normal")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="maximum concurrent previews",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="preview every project even if its fingerprint is unchanged",
+    )
+    parser.add_argument(
+        "--graph",
+        action="store_true",
+        help="print the StackReference dependency waves and exit",
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    projects = load_projects(args.stack, args.projects)
+
+    if args.graph:
+        print_graph(projects)
+        return 0
+
+    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+    logdir = Path(f"/tmp/pulumi-{args.stack}-previews-{timestamp}")
+    logdir.mkdir(parents=True, exist_ok=True)
+
+    # Refresh previews exist to find live drift, which no local input captures.
+    use_cache = args.mode == "normal"
+    cache = load_cache(args.stack) if use_cache and not args.force else {}
+    results = run_previews(
+        projects, args.stack, args.mode, args.jobs, logdir, cache, use_cache
+    )
+    print_timings(results)
+    write_timings(results, logdir)
+    if use_cache:
+        save_cache(args.stack, load_cache(args.stack), results)
+    print(f"\nLOGDIR {logdir}")
+    return 1 if any(result.status == "failed" for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())